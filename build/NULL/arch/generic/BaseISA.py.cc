@@ -0,0 +1,48 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,80,189,78,2,65,16,158,189,59,126,69,193,96,
+    162,137,137,26,10,19,44,160,17,11,98,76,52,38,138,5,
+    22,208,120,205,102,185,221,0,230,14,113,247,72,128,234,10,
+    11,223,192,55,48,49,190,12,229,101,91,43,59,12,86,86,
+    222,194,65,32,186,51,249,102,54,243,243,205,204,7,44,189,
+    72,104,39,39,1,188,0,5,138,108,168,43,171,217,200,209,
+    76,13,129,6,87,64,245,39,160,6,211,94,117,128,119,125,
+    94,108,234,52,82,131,124,244,83,125,242,72,162,163,0,18,
+    181,182,115,219,184,103,150,107,45,19,161,57,209,222,148,136,
+    129,137,40,152,26,85,77,144,105,80,205,140,80,221,140,82,
+    35,104,24,145,177,11,34,88,165,118,94,31,102,9,183,90,
+    197,38,235,48,222,182,138,109,65,10,173,214,112,189,201,156,
+    82,185,28,38,85,243,49,25,199,184,67,28,134,177,76,98,
+    236,60,208,158,173,252,20,198,143,61,98,135,17,195,29,116,
+    153,140,147,134,112,57,177,92,153,180,250,125,220,98,132,50,
+    46,19,202,183,108,34,196,27,76,212,156,63,187,130,91,197,
+    21,242,144,174,208,29,240,104,144,49,5,181,141,200,5,224,
+    45,196,95,219,242,46,253,116,214,187,246,55,15,189,27,63,
+    179,239,85,148,240,244,188,168,154,55,100,194,41,21,186,132,
+    19,71,200,84,224,46,142,198,141,121,22,223,80,48,45,202,
+    168,129,226,167,179,189,206,120,54,188,167,184,11,96,172,35,
+    132,198,199,128,118,70,176,61,83,31,114,163,85,29,71,13,
+    116,48,134,191,240,220,254,82,230,251,159,208,148,250,23,163,
+    16,139,101,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/arch/generic/BaseISA.py",
+    "m5.objects.BaseISA",
+    embedded_module_data,
+    371,
+    557);
+
+} // anonymous namespace
+} // namespace gem5
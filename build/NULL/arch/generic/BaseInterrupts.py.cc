@@ -0,0 +1,48 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,80,189,78,2,65,16,158,189,59,16,144,0,6,
+    19,141,38,22,20,26,76,132,70,44,136,177,48,38,138,5,
+    22,208,112,205,102,185,221,0,230,14,113,247,72,128,234,10,
+    31,192,206,55,48,49,190,12,229,101,91,43,59,12,86,86,
+    222,30,63,129,232,206,228,155,217,204,207,55,51,31,176,242,
+    34,115,59,61,11,224,5,40,80,100,67,93,89,205,70,142,
+    102,106,8,52,184,6,170,63,1,53,152,246,170,3,188,235,
+    139,98,83,167,145,26,228,163,159,234,147,71,18,29,7,16,
+    175,117,156,187,230,61,179,92,107,149,8,45,136,14,66,34,
+    6,38,162,96,106,84,53,65,166,65,53,51,66,117,51,74,
+    141,160,97,68,166,46,137,96,149,174,203,56,239,247,92,81,
+    31,237,17,110,181,139,45,214,101,188,99,21,59,203,72,161,
+    221,30,109,183,152,83,42,151,215,75,170,249,13,25,195,184,
+    75,28,134,177,76,96,236,60,208,190,173,252,36,198,143,125,
+    98,207,35,134,59,236,49,25,35,77,225,114,98,185,50,97,
+    13,6,184,205,8,101,92,198,149,111,217,68,136,55,152,170,
+    225,127,114,130,91,197,181,81,214,89,11,189,33,143,6,137,
+    33,168,77,69,46,0,111,41,254,230,190,119,229,167,179,222,
+    141,191,117,226,221,250,153,67,175,162,132,167,23,69,213,188,
+    33,227,78,169,208,35,156,56,66,38,3,119,121,80,110,44,
+    178,120,74,65,88,148,81,115,197,206,103,235,93,240,236,252,
+    214,162,17,192,68,71,8,77,78,1,237,142,97,103,166,62,
+    228,198,235,58,137,26,232,104,2,127,225,185,241,165,204,247,
+    63,161,144,250,23,30,0,153,32,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/arch/generic/BaseInterrupts.py",
+    "m5.objects.BaseInterrupts",
+    embedded_module_data,
+    377,
+    585);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,77 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,84,189,111,219,70,20,191,19,73,125,80,150,237,
+    200,1,82,184,67,174,53,224,66,110,35,47,201,98,52,1,
+    252,1,180,46,28,55,128,93,20,96,7,226,196,59,139,108,
+    249,161,220,81,77,162,73,131,7,163,67,59,182,99,39,3,
+    69,254,137,254,9,14,144,65,224,100,160,83,55,5,238,148,
+    169,239,72,74,166,236,24,65,78,212,187,167,123,239,222,239,
+    247,123,119,226,63,168,48,140,124,190,216,2,243,59,98,136,
+    97,31,5,216,194,88,249,37,191,116,168,102,205,215,2,221,
+    210,49,42,161,175,16,211,143,17,51,184,126,170,33,244,82,
+    155,20,178,12,86,62,64,173,202,191,234,71,11,39,149,45,
+    42,249,225,222,22,184,120,13,76,237,192,11,190,237,252,200,
+    157,216,41,226,79,246,95,252,154,226,115,100,97,134,172,18,
+    124,53,134,45,157,149,160,174,102,149,121,229,207,42,122,199,
+    96,250,41,6,22,120,202,162,118,99,166,113,37,211,228,117,
+    86,62,70,167,224,191,156,102,89,115,172,114,140,172,6,171,
+    130,150,90,38,226,241,227,239,14,7,75,84,56,238,122,151,
+    135,92,120,206,122,16,244,219,174,59,104,116,121,240,96,99,
+    35,79,26,44,236,134,50,22,125,39,246,162,144,128,244,65,
+    117,135,198,84,121,14,46,48,193,185,236,139,114,42,185,139,
+    0,10,239,255,165,154,166,57,190,148,42,78,222,126,44,133,
+    179,62,3,154,195,180,123,47,146,250,51,234,255,196,197,147,
+    72,196,114,176,52,9,20,22,239,67,13,89,3,51,68,227,
+    121,180,216,60,169,93,40,104,71,187,153,7,195,192,163,68,
+    255,134,101,147,228,99,59,10,67,56,49,18,187,156,120,5,
+    113,52,100,132,41,109,49,237,248,156,100,192,114,186,45,142,
+    210,29,61,197,132,244,168,148,156,17,42,9,21,221,126,192,
+    195,88,182,167,153,155,33,217,61,216,36,178,199,29,239,200,
+    115,8,200,32,210,141,250,62,35,209,207,92,8,143,241,203,
+    170,174,39,73,192,99,55,98,95,144,103,174,231,184,4,22,
+    88,228,133,93,18,70,16,133,25,144,101,191,167,128,85,221,
+    75,70,16,39,94,208,243,185,194,87,137,179,212,205,105,226,
+    70,143,10,26,16,79,149,216,32,170,151,170,102,135,19,39,
+    107,5,40,201,213,21,250,49,221,61,59,138,8,105,51,174,
+    162,176,247,163,168,46,127,112,249,125,161,142,190,165,37,186,
+    228,254,81,98,164,106,18,35,133,147,234,200,33,71,212,97,
+    78,154,57,224,247,133,251,180,60,185,79,215,99,15,11,215,
+    106,25,213,26,39,186,104,192,175,253,214,124,82,181,237,144,
+    6,220,182,19,211,182,131,136,245,125,229,207,217,246,211,62,
+    245,243,136,30,191,232,241,164,74,59,208,57,234,196,137,233,
+    60,127,110,187,156,50,46,146,154,242,29,31,46,75,98,60,
+    81,221,17,138,104,162,121,113,39,209,24,152,122,26,204,206,
+    95,204,65,76,52,149,81,108,82,18,169,32,81,153,152,207,
+    21,85,153,82,157,124,70,245,219,195,157,209,194,210,240,235,
+    209,173,213,225,55,163,197,187,195,221,115,115,225,183,123,191,
+    220,59,251,168,245,202,92,123,109,174,13,183,71,217,202,31,
+    230,43,115,229,181,185,50,220,62,55,22,199,165,178,209,28,
+    35,48,111,52,84,190,117,252,67,182,176,216,48,26,99,116,
+    221,100,124,42,105,103,202,73,51,120,208,142,210,55,159,108,
+    231,47,197,76,91,13,2,233,69,144,201,28,184,211,23,164,
+    48,166,74,102,213,189,173,126,153,117,246,145,248,36,255,3,
+    75,31,204,88,195,24,143,247,48,194,159,157,161,213,226,51,
+    66,119,206,38,207,8,125,122,54,251,140,203,119,49,48,190,
+    110,78,188,55,106,250,239,29,161,148,205,255,95,107,156,83,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/arch/generic/BaseMMU.py",
+    "m5.objects.BaseMMU",
+    embedded_module_data,
+    848,
+    1603);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,94 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,85,73,111,219,70,20,30,146,90,104,201,146,35,
+    175,65,156,101,16,20,174,85,180,50,144,34,23,197,78,139,
+    196,75,227,186,142,225,165,7,161,0,61,226,140,45,6,92,
+    148,33,101,91,58,241,144,131,143,69,47,233,33,7,159,12,
+    20,190,244,167,200,128,15,2,79,5,122,242,77,70,124,202,
+    41,111,40,201,214,98,146,126,67,205,124,239,241,123,111,190,
+    55,254,31,117,93,209,246,248,121,19,204,71,68,17,149,76,
+    180,45,70,217,148,44,185,32,75,72,70,43,136,42,31,16,
+    141,48,229,84,65,232,76,233,56,23,34,225,90,20,214,98,
+    76,238,91,139,210,248,22,202,170,151,226,71,86,10,164,239,
+    192,12,109,25,214,219,226,59,166,123,122,55,137,72,135,196,
+    227,144,4,67,5,137,162,130,76,165,130,66,101,170,208,8,
+    141,126,82,10,17,26,131,128,241,32,190,93,45,179,237,181,
+    87,228,92,66,40,129,225,50,108,215,227,21,221,51,28,59,
+    143,97,5,235,142,237,17,152,237,94,193,204,246,184,193,92,
+    236,216,102,53,116,163,196,35,125,120,49,53,8,172,216,198,
+    158,193,104,31,182,232,120,165,158,15,16,155,246,4,72,132,
+    206,219,37,6,19,21,11,31,16,179,2,81,75,228,128,225,
+    34,99,54,118,153,9,149,96,20,130,96,135,83,198,177,231,
+    224,50,227,123,14,183,112,209,240,14,13,151,133,33,28,152,
+    36,226,19,130,19,246,74,204,202,225,101,135,99,118,68,172,
+    178,201,48,233,48,28,36,216,95,159,1,146,216,117,192,131,
+    50,236,241,170,97,239,11,10,196,117,153,11,181,219,19,159,
+    106,229,0,97,13,128,122,14,23,152,89,150,219,207,101,123,
+    195,232,196,198,212,1,15,226,225,67,195,43,229,91,217,23,
+    29,199,132,148,93,45,4,47,96,207,44,254,240,210,131,13,
+    156,205,226,25,220,222,201,124,94,172,190,8,29,46,97,83,
+    209,165,44,140,208,82,86,9,146,93,244,131,136,64,6,241,
+    118,190,235,217,104,160,106,154,77,44,166,105,65,66,211,44,
+    135,86,76,241,62,172,105,239,43,196,108,175,196,53,141,58,
+    58,188,40,22,41,255,131,62,11,177,125,153,118,185,62,71,
+    184,94,154,219,103,54,227,134,62,247,138,184,130,78,174,92,
+    229,49,64,132,230,123,248,115,179,96,252,155,187,41,39,163,
+    106,19,9,243,0,77,63,62,113,255,117,235,137,23,240,248,
+    175,197,205,199,58,190,119,139,188,222,43,114,4,34,151,64,
+    220,50,116,140,82,136,201,136,197,105,228,20,170,112,38,221,
+    244,146,10,179,67,76,165,209,83,40,204,153,124,51,159,128,
+    249,36,141,245,161,135,67,244,48,141,247,161,83,44,125,50,
+    130,238,184,168,218,23,225,30,32,51,119,33,217,40,29,234,
+    139,58,70,19,208,150,201,32,222,174,222,118,109,172,167,168,
+    176,227,185,82,169,150,218,103,214,243,124,190,13,170,61,220,
+    112,184,7,170,49,29,183,165,123,144,26,126,189,177,131,93,
+    131,178,218,204,174,107,66,155,236,10,209,217,206,33,136,203,
+    52,65,221,187,122,185,162,9,128,86,22,222,187,181,7,34,
+    74,87,16,139,89,14,175,118,98,88,196,245,24,31,8,2,
+    160,219,32,187,181,111,222,220,202,107,110,17,212,53,183,211,
+    213,76,109,121,215,18,54,59,242,176,201,14,152,185,158,29,
+    231,41,177,197,105,97,68,65,131,136,80,116,160,146,34,68,
+    34,186,23,36,244,163,35,173,196,8,244,116,48,36,222,117,
+    19,154,42,24,253,29,250,221,225,155,204,45,67,47,51,65,
+    62,72,247,230,20,140,44,178,50,103,58,129,115,97,131,112,
+    98,5,209,176,20,65,114,147,189,135,227,195,11,157,82,61,
+    57,4,177,86,166,65,52,244,8,165,23,36,4,243,170,38,
+    136,241,201,144,227,250,206,218,90,16,230,161,133,121,240,81,
+    193,63,20,235,184,48,147,29,179,32,36,255,169,71,242,141,
+    228,184,191,216,24,25,243,127,105,100,102,252,213,198,189,39,
+    254,155,102,12,77,206,214,39,190,173,207,46,159,79,172,92,
+    76,172,248,235,141,225,233,227,183,13,117,178,126,255,231,43,
+    69,78,197,174,17,24,127,9,144,19,248,207,95,235,120,254,
+    124,124,225,98,124,193,255,173,145,122,120,172,53,212,137,250,
+    212,79,0,76,11,96,58,230,47,55,85,52,58,245,241,209,
+    95,143,234,79,150,206,51,203,23,153,101,127,245,191,204,164,
+    152,249,219,59,249,227,60,243,236,34,243,204,95,21,119,139,
+    184,160,187,158,141,5,67,214,243,92,89,36,239,6,195,240,
+    122,243,111,134,71,194,90,108,233,112,132,210,37,56,133,91,
+    141,29,166,218,155,254,23,117,190,117,120,188,228,162,219,69,
+    47,184,31,192,52,21,73,146,154,27,18,146,238,215,209,84,
+    235,105,160,167,245,222,167,25,75,75,243,77,52,104,142,223,
+    93,137,225,250,118,246,233,168,244,99,19,13,154,99,227,74,
+    12,215,119,44,133,44,191,2,227,248,44,114,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/arch/generic/BaseTLB.py",
+    "m5.objects.BaseTLB",
+    embedded_module_data,
+    1116,
+    1975);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,53 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,81,191,111,19,49,20,126,246,93,174,201,165,82,
+    41,69,74,37,164,18,193,116,149,154,44,148,161,4,36,160,
+    18,164,170,2,82,202,192,45,39,215,118,123,65,119,185,96,
+    95,165,52,211,13,76,44,176,193,200,84,9,241,207,4,137,
+    225,228,9,137,137,45,168,76,76,216,151,38,74,69,253,227,
+    123,207,246,243,251,62,251,253,132,133,86,186,176,231,247,52,
+    124,4,6,12,69,112,96,44,142,80,140,125,140,0,195,83,
+    96,214,91,96,54,199,103,22,192,87,107,118,217,183,88,169,
+    11,158,243,203,44,60,164,208,166,134,74,183,23,63,63,124,
+    205,105,74,23,137,236,25,209,94,65,196,193,71,12,124,204,
+    76,18,228,219,12,251,37,102,249,14,95,250,92,134,43,26,
+    175,48,251,12,107,114,60,39,119,167,228,170,218,238,203,116,
+    151,211,132,113,113,48,170,17,65,195,230,49,239,115,209,163,
+    77,54,221,110,132,225,104,245,152,199,219,59,59,11,193,163,
+    155,237,238,163,122,82,104,173,31,37,162,158,134,61,89,167,
+    73,63,229,195,180,227,85,85,57,8,250,36,230,65,160,220,
+    32,136,19,118,18,25,127,57,8,222,156,144,232,226,196,78,
+    79,7,92,149,201,161,76,5,161,169,114,233,112,24,132,156,
+    232,252,170,98,124,26,17,41,85,233,5,17,36,86,75,143,
+    137,228,154,85,217,157,151,251,251,202,234,73,242,5,206,205,
+    115,254,222,146,130,54,47,137,95,144,218,24,156,10,71,71,
+    21,176,161,167,52,245,202,230,61,175,174,103,187,249,202,90,
+    246,44,95,221,204,246,242,107,119,178,246,15,119,229,253,214,
+    187,173,79,246,120,227,254,55,183,245,221,109,101,79,76,23,
+    107,179,68,29,207,86,149,120,187,49,48,218,164,90,214,238,
+    188,120,194,158,69,137,235,6,138,75,55,140,208,114,107,250,
+    21,15,69,77,47,145,17,243,74,195,196,66,8,77,238,2,
+    90,31,67,109,58,114,184,61,190,60,38,142,131,30,76,224,
+    127,248,224,253,54,230,207,21,71,5,245,63,30,98,179,210,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/arch/generic/InstDecoder.py",
+    "m5.objects.InstDecoder",
+    embedded_module_data,
+    464,
+    693);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,45 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,79,59,79,195,48,16,190,139,211,170,47,1,67,
+    197,99,69,101,72,135,118,130,9,33,129,128,194,82,144,202,
+    148,197,114,227,168,20,197,109,113,18,36,182,14,252,0,54,
+    118,6,36,196,159,233,88,121,101,98,11,42,19,19,118,250,
+    80,17,248,238,190,187,211,61,190,243,59,44,189,204,204,79,
+    246,52,60,1,7,142,1,92,25,111,5,40,44,215,66,176,
+    160,1,156,60,0,183,125,242,66,0,222,200,124,216,181,121,
+    166,5,78,246,195,36,14,42,172,106,200,183,186,226,162,125,
+    227,123,145,183,76,100,205,137,214,83,34,31,92,228,224,90,
+    29,77,248,140,46,225,150,94,68,84,241,92,176,142,127,218,
+    151,130,69,58,181,15,227,168,175,178,71,221,72,176,129,34,
+    151,189,78,211,177,85,142,210,30,19,62,165,170,64,169,232,
+    243,56,48,113,137,210,219,152,5,179,138,125,199,130,240,21,
+    38,134,242,187,28,74,175,222,102,161,95,111,72,54,184,238,
+    122,97,109,112,47,179,186,148,66,85,91,184,165,97,184,144,
+    113,177,50,74,117,120,108,68,174,206,123,155,78,70,229,197,
+    110,109,192,36,19,161,42,233,112,241,95,105,235,6,101,159,
+    244,98,49,93,190,98,32,29,93,51,103,228,246,167,199,30,
+    200,178,78,209,176,186,26,18,130,136,201,25,2,110,142,96,
+    99,170,99,216,30,253,214,164,128,184,147,192,95,120,172,124,
+    26,247,245,79,41,229,254,1,112,51,118,18,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/base/Graphics.py",
+    "m5.objects.Graphics",
+    embedded_module_data,
+    332,
+    495);
+
+} // anonymous namespace
+} // namespace gem5
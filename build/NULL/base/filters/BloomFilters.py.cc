@@ -0,0 +1,133 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,87,75,111,219,70,16,94,138,18,69,138,180,245,
+    112,226,56,142,19,179,73,156,214,138,99,37,77,221,188,156,
+    6,53,138,54,126,212,13,224,52,5,124,81,41,113,109,49,
+    161,36,151,164,219,88,151,234,80,244,208,75,131,160,128,125,
+    244,169,104,209,28,114,236,175,40,164,64,64,4,158,2,20,
+    40,224,155,140,248,148,83,103,72,201,166,40,218,125,88,226,
+    236,106,190,225,144,59,243,237,204,250,79,226,249,139,180,199,
+    215,127,129,216,36,42,81,25,157,220,119,71,198,25,67,122,
+    168,200,46,179,12,9,145,79,136,202,126,71,212,48,101,127,
+    102,9,249,141,237,56,89,14,59,88,4,48,142,134,125,88,
+    196,193,162,128,241,61,24,231,96,2,96,49,202,249,176,168,
+    131,137,128,73,61,24,239,96,125,128,245,247,248,20,28,44,
+    14,88,162,7,139,169,201,37,50,158,218,193,31,227,140,205,
+    164,65,8,75,90,241,179,220,67,154,183,242,222,192,132,59,
+    129,249,195,9,12,37,203,140,74,150,67,112,177,42,179,28,
+    86,67,203,17,149,93,230,104,116,155,39,1,127,106,88,141,
+    252,28,130,135,135,14,94,12,108,99,129,182,156,26,245,217,
+    138,135,250,229,85,193,103,43,29,97,27,243,217,246,169,34,
+    4,64,178,227,51,122,185,92,252,88,211,45,106,204,40,38,
+    189,95,57,150,131,33,179,226,104,204,12,254,152,44,20,42,
+    67,171,180,56,117,243,102,14,173,179,46,120,243,38,222,176,
+    67,18,132,84,70,23,215,139,57,106,200,229,21,153,150,44,
+    67,163,166,172,149,100,171,64,101,215,118,135,131,135,86,198,
+    14,172,114,154,229,152,40,114,94,201,131,153,174,149,40,232,
+    87,76,106,237,48,104,43,7,217,186,206,156,71,108,84,38,
+    30,40,250,58,149,21,75,254,166,160,229,11,178,82,114,1,
+    89,51,229,124,185,100,106,42,53,168,42,43,166,12,78,23,
+    199,251,109,62,155,45,41,69,154,205,218,177,108,182,88,86,
+    215,117,156,75,217,236,87,235,138,222,70,194,214,198,26,181,
+    121,37,103,90,134,146,183,236,88,254,241,227,108,129,42,224,
+    203,22,112,158,215,21,211,180,35,247,20,67,41,218,236,108,
+    201,178,195,166,86,129,91,62,135,39,174,150,168,106,139,238,
+    50,178,248,218,54,95,90,47,186,51,193,42,24,212,44,148,
+    117,245,87,242,26,115,240,70,54,141,124,166,43,218,158,100,
+    152,147,107,27,6,70,205,17,50,92,230,215,32,170,251,159,
+    166,56,82,253,168,25,31,168,222,109,38,223,174,206,53,19,
+    233,234,236,43,49,241,227,141,31,110,60,185,95,59,53,93,
+    23,111,55,196,219,213,143,90,28,25,24,218,156,124,58,185,
+    157,172,157,159,175,167,22,26,169,133,234,60,104,19,199,127,
+    220,248,97,99,43,89,27,249,160,30,191,211,136,223,1,79,
+    137,227,155,194,83,97,235,173,218,233,249,122,98,161,145,88,
+    168,206,226,199,56,217,121,145,174,173,177,95,51,126,57,116,
+    107,80,110,59,26,68,73,202,63,20,246,233,201,122,127,85,
+    192,235,106,72,13,251,8,27,251,55,158,188,115,240,225,223,
+    120,162,202,1,233,163,118,194,75,122,189,156,127,84,57,25,
+    72,111,7,58,219,189,31,80,151,245,218,193,238,216,9,57,
+    140,189,87,54,53,75,43,151,144,179,72,253,133,165,25,103,
+    67,0,193,229,162,98,62,170,140,45,1,83,38,144,202,165,
+    46,114,79,116,153,45,142,75,6,150,7,67,68,33,161,232,
+    67,145,64,17,7,97,139,15,160,72,149,13,135,131,198,49,
+    212,132,151,168,190,98,28,199,105,12,125,152,89,221,204,153,
+    182,232,206,145,160,166,49,132,247,59,137,28,70,49,210,17,
+    151,145,91,107,62,110,157,6,110,37,46,86,103,155,201,169,
+    234,220,171,228,200,203,228,216,139,228,88,83,232,107,8,39,
+    183,174,108,89,141,209,76,253,84,166,198,95,110,242,233,221,
+    8,155,226,246,8,136,234,92,139,39,3,103,94,166,46,188,
+    72,93,104,27,191,215,56,117,177,198,79,52,249,12,216,13,
+    160,221,0,87,157,199,143,251,50,35,126,86,237,23,220,103,
+    255,153,85,42,219,195,27,158,10,15,247,139,226,225,44,82,
+    35,42,215,83,122,185,109,41,208,54,170,242,61,229,84,0,
+    102,197,236,65,15,179,62,93,215,45,109,70,179,32,53,149,
+    209,32,126,121,13,210,93,44,43,34,130,101,35,107,82,189,
+    135,109,24,160,74,226,160,62,22,20,179,0,249,61,141,234,
+    161,207,156,226,35,175,24,229,162,236,144,181,205,181,143,43,
+    231,190,40,80,160,165,225,216,107,165,85,172,147,106,25,202,
+    46,240,113,13,168,164,235,84,135,50,121,52,247,140,36,138,
+    148,67,52,44,109,237,103,143,162,246,4,106,5,243,145,182,
+    230,86,188,240,76,185,172,219,162,102,102,59,238,253,28,60,
+    215,17,119,144,131,95,250,56,120,14,57,120,5,57,120,27,
+    57,56,184,121,242,41,112,175,118,230,114,61,121,165,145,188,
+    130,53,239,216,79,113,192,15,170,214,181,122,226,122,35,113,
+    29,116,169,19,155,233,167,233,173,207,107,231,103,235,169,185,
+    70,106,206,203,185,115,126,206,49,29,206,13,31,202,57,149,
+    133,12,135,187,27,230,186,254,232,144,206,136,200,91,221,149,
+    3,84,254,84,46,254,202,253,67,184,125,1,75,119,196,28,
+    6,236,52,233,109,8,216,6,154,201,247,170,115,248,113,239,
+    76,255,255,213,246,121,86,123,247,106,101,48,104,173,160,31,
+    237,90,105,225,106,207,58,141,139,1,139,185,212,17,247,130,
+    22,51,140,139,121,7,23,243,174,119,49,151,252,139,233,108,
+    238,215,223,31,177,152,195,207,103,33,66,5,60,163,169,220,
+    106,232,153,239,244,229,96,112,206,82,99,189,24,180,23,209,
+    223,162,84,9,90,76,31,4,174,191,171,197,56,251,60,184,
+    197,184,208,217,160,205,223,29,65,3,251,154,129,165,203,192,
+    101,236,32,87,198,67,198,0,42,100,16,26,150,205,29,220,
+    151,59,24,229,202,240,210,122,238,82,219,163,108,149,229,28,
+    133,51,81,49,7,167,44,213,41,20,255,216,100,92,215,103,
+    72,187,239,59,101,218,142,182,61,58,91,221,159,206,76,71,
+    60,192,116,86,200,17,13,5,186,132,212,231,28,77,226,195,
+    47,251,199,95,244,143,191,146,70,106,210,200,246,249,231,31,
+    62,55,158,95,171,73,183,234,210,173,134,116,171,217,81,207,
+    252,30,122,126,189,38,77,215,165,233,134,52,221,138,176,66,
+    12,156,8,99,187,34,23,135,158,2,162,250,73,43,69,146,
+    41,239,129,37,115,40,241,47,28,201,21,184,162,112,241,106,
+    24,114,25,177,83,158,92,222,163,198,10,52,223,202,169,160,
+    108,118,192,243,93,249,92,115,181,129,25,93,28,23,254,77,
+    26,6,73,187,188,250,99,62,213,17,58,198,252,178,47,230,
+    163,24,243,75,24,243,107,16,115,206,141,57,79,18,73,60,
+    233,37,189,145,154,114,222,69,180,133,226,212,36,22,235,34,
+    156,92,113,106,148,31,111,216,18,204,246,255,55,50,194,93,
+    148,112,75,120,122,127,59,103,246,223,170,251,77,223,240,211,
+    238,137,251,3,227,70,59,17,166,9,178,197,50,12,211,122,
+    159,48,67,53,114,194,253,54,201,96,173,243,109,146,179,181,
+    238,111,139,235,99,62,101,90,36,88,62,209,118,157,113,207,
+    139,200,18,195,181,72,175,120,242,237,46,14,123,7,218,51,
+    60,51,15,119,5,203,173,236,174,51,238,121,145,65,150,153,
+    106,145,94,81,27,156,216,197,113,239,64,45,177,204,85,156,
+    249,69,237,88,26,77,175,238,29,168,165,1,38,213,34,189,
+    2,223,24,134,189,3,237,132,136,179,94,177,53,186,139,195,
+    94,0,228,36,229,111,136,214,199,183,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/base/filters/BloomFilters.py",
+    "m5.objects.BloomFilters",
+    embedded_module_data,
+    1738,
+    4092);
+
+} // anonymous namespace
+} // namespace gem5
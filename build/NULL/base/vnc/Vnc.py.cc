@@ -0,0 +1,70 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,205,83,205,79,219,48,20,183,155,164,180,77,187,81,
+    40,160,141,3,129,195,182,110,90,171,29,0,9,77,147,54,
+    161,126,73,148,73,157,38,209,75,148,38,238,199,150,47,156,
+    4,65,79,61,236,48,237,50,180,11,28,57,33,77,251,103,
+    90,84,137,202,215,157,118,235,4,39,78,179,19,90,21,212,
+    63,96,177,253,243,243,123,47,207,63,251,61,255,6,19,159,
+    112,59,95,85,41,156,0,13,104,80,7,31,130,25,250,115,
+    72,15,25,92,149,131,32,4,242,64,227,190,0,141,71,220,
+    57,7,192,47,110,20,164,202,251,54,129,218,194,136,191,103,
+    19,180,153,10,72,71,254,176,69,26,18,248,156,66,180,210,
+    50,118,107,159,144,234,170,147,100,248,17,25,236,147,65,160,
+    10,53,80,13,209,193,105,176,202,107,161,170,128,194,103,51,
+    96,202,167,113,26,127,30,162,27,135,198,27,71,168,111,116,
+    170,175,160,133,239,249,198,2,146,36,242,209,84,139,166,237,
+    185,237,84,77,113,80,246,192,84,217,104,49,85,166,217,108,
+    63,104,32,99,125,107,107,228,149,107,175,168,138,237,122,24,
+    73,106,83,49,27,72,147,234,88,49,144,35,185,150,84,111,
+    233,200,33,252,91,207,181,218,82,206,194,134,226,74,86,93,
+    114,155,72,210,60,195,166,190,57,230,91,243,234,117,132,203,
+    105,145,68,100,217,164,10,89,38,49,89,54,44,205,211,153,
+    28,151,229,125,79,209,111,45,188,123,100,35,18,83,15,15,
+    229,38,82,52,132,73,148,201,170,174,56,14,17,222,43,52,
+    34,225,223,89,150,78,18,62,19,249,150,31,17,139,134,210,
+    64,1,13,18,107,25,13,185,238,203,63,193,21,187,129,155,
+    121,7,171,217,241,153,233,1,51,246,17,14,83,139,15,105,
+    58,156,60,133,206,184,13,196,133,206,246,32,249,180,83,26,
+    204,74,157,226,32,245,232,164,244,163,116,234,117,159,228,123,
+    169,66,63,85,232,236,12,146,139,151,201,181,139,228,218,217,
+    70,247,197,78,47,89,238,39,203,157,18,107,56,53,138,252,
+    159,21,64,148,158,188,130,240,1,194,237,133,201,10,112,124,
+    29,43,129,135,227,18,8,252,90,241,37,0,218,115,122,203,
+    113,145,41,217,22,118,179,142,165,126,70,46,102,209,219,73,
+    250,179,164,234,45,100,186,146,233,25,53,63,213,56,194,142,
+    207,184,225,24,3,145,65,156,65,130,193,3,10,36,86,176,
+    28,183,226,71,34,60,11,75,184,162,233,146,112,16,4,207,
+    51,71,255,22,23,24,44,141,224,213,180,76,45,178,76,61,
+    99,153,90,165,153,18,103,47,197,229,11,113,249,116,187,187,
+    182,209,19,55,251,226,38,181,39,230,190,239,125,219,59,222,
+    239,62,126,217,75,100,250,137,76,39,199,90,176,7,139,92,
+    78,135,201,188,177,158,177,252,135,235,100,242,88,177,155,45,
+    213,33,81,170,180,89,229,57,36,78,197,241,219,198,252,40,
+    201,1,189,187,148,111,34,175,131,26,127,131,87,232,18,50,
+    222,167,20,134,28,132,112,88,128,0,174,117,193,106,208,7,
+    96,169,59,234,3,64,245,119,250,48,44,192,93,56,4,211,
+    241,235,209,95,127,190,158,180,204,10,48,203,196,251,112,28,
+    97,206,217,235,41,38,159,249,63,253,48,75,83,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/base/vnc/Vnc.py",
+    "m5.objects.Vnc",
+    embedded_module_data,
+    733,
+    1340);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1 @@
+#define HAVE_DEPRECATED_NAMESPACE 1
@@ -0,0 +1 @@
+#define HAVE_HDF5 1
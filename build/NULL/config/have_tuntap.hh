@@ -0,0 +1 @@
+#define HAVE_TUNTAP 1
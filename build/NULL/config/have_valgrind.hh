@@ -0,0 +1 @@
+#define HAVE_VALGRIND 0
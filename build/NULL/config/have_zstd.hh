@@ -0,0 +1 @@
+#define HAVE_ZSTD 0
@@ -0,0 +1,472 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,59,91,108,27,87,118,51,28,146,26,146,67,138,
+    164,222,79,83,15,63,36,217,180,36,63,146,248,173,135,101,
+    217,150,101,215,143,205,174,146,44,151,226,140,37,218,124,237,
+    204,208,182,184,116,43,44,220,86,14,220,198,27,100,17,213,
+    155,32,68,145,166,78,55,11,248,35,45,130,254,116,81,180,
+    253,234,199,12,59,11,17,3,4,117,209,166,104,128,45,32,
+    35,89,160,200,207,246,220,59,15,14,71,148,227,45,80,234,
+    234,114,238,57,231,158,123,238,185,119,206,57,247,193,127,39,
+    44,31,151,254,253,213,63,65,246,46,193,18,44,153,34,22,
+    208,183,35,69,166,29,11,14,18,61,83,41,234,42,250,118,
+    166,156,105,215,130,11,195,92,41,119,186,97,161,1,63,187,
+    83,116,218,179,224,193,207,13,41,111,218,183,224,195,207,116,
+    138,73,251,23,252,248,217,147,10,164,27,23,26,241,179,55,
+    21,76,135,22,66,58,239,240,85,237,187,73,255,110,214,191,
+    91,174,18,14,130,107,248,8,36,251,185,41,240,66,171,131,
+    56,67,176,190,123,4,203,112,174,143,40,192,81,38,174,141,
+    37,175,16,67,254,47,81,97,126,136,84,233,197,124,50,197,
+    158,206,220,130,103,114,24,50,255,84,42,155,184,201,177,23,
+    23,111,112,9,17,0,158,211,119,184,171,124,60,193,241,80,
+    240,158,205,8,162,89,162,47,165,226,226,245,44,159,134,231,
+    208,101,78,224,68,200,114,217,140,192,93,202,242,184,238,149,
+    252,226,149,21,65,228,16,133,123,110,252,187,147,113,62,97,
+    85,174,207,84,46,168,249,143,65,189,28,177,64,178,196,130,
+    3,254,41,150,92,112,178,142,5,23,75,45,184,81,55,89,
+    231,71,36,116,134,52,42,99,152,171,14,204,93,7,214,80,
+    7,70,215,129,121,234,192,188,117,96,190,58,48,166,22,182,
+    228,89,160,57,15,235,191,71,216,6,200,11,208,192,22,168,
+    15,160,141,91,160,12,27,188,71,44,248,185,64,169,145,168,
+    243,225,130,55,66,198,51,27,250,200,1,117,29,102,221,48,
+    212,106,170,87,139,13,179,77,54,218,102,160,109,169,75,219,
+    204,182,216,104,91,183,165,109,101,219,108,180,109,64,219,94,
+    151,182,157,237,176,209,118,0,109,103,93,218,78,182,203,70,
+    219,245,28,218,110,27,109,55,208,246,108,211,183,30,27,109,
+    47,208,238,168,71,203,69,216,94,27,109,223,182,125,219,193,
+    70,108,180,253,219,202,75,178,125,54,218,129,231,208,246,219,
+    104,7,185,157,165,93,245,104,151,8,118,192,70,187,27,248,
+    238,217,166,111,131,54,218,33,224,59,188,13,223,157,54,218,
+    17,160,221,187,13,237,46,27,237,62,160,141,110,67,187,219,
+    70,187,31,228,29,173,71,11,227,182,199,70,59,246,28,218,
+    33,27,237,56,200,80,151,22,100,24,182,209,30,0,190,7,
+    235,242,29,97,247,218,104,15,61,103,78,238,179,209,30,6,
+    139,241,18,27,173,181,24,11,47,3,135,87,234,113,224,142,
+    176,251,109,28,142,2,135,99,236,168,141,195,113,12,29,179,
+    65,79,176,227,236,129,37,199,194,201,37,98,225,20,252,79,
+    176,7,193,170,76,178,135,32,159,98,15,67,62,205,190,4,
+    249,105,246,101,200,103,216,9,246,200,61,114,225,140,135,96,
+    39,217,163,240,52,203,30,3,248,89,246,56,228,231,216,19,
+    144,159,103,79,66,62,183,70,92,39,217,83,247,232,133,11,
+    107,196,29,114,97,30,156,203,148,218,48,25,23,184,169,75,
+    215,174,22,124,137,92,126,255,34,148,162,203,203,5,255,18,
+    151,62,116,228,136,142,84,61,194,237,164,152,88,190,152,23,
+    85,70,140,223,228,46,222,226,248,25,62,155,86,125,26,2,
+    124,16,160,60,215,83,121,97,249,234,220,164,160,122,197,172,
+    24,79,33,15,36,168,65,1,17,228,83,28,42,94,17,179,
+    57,181,105,137,19,167,242,60,207,101,68,4,155,202,230,51,
+    162,218,97,144,93,73,166,115,217,100,70,20,76,250,14,59,
+    135,137,204,202,213,101,158,139,179,9,210,162,120,244,140,220,
+    231,87,110,2,187,127,228,62,29,133,61,175,46,39,19,203,
+    145,52,151,206,242,43,145,116,150,133,55,40,203,9,17,113,
+    57,41,68,160,115,17,158,251,97,62,201,115,39,213,134,100,
+    230,86,60,149,100,63,38,62,38,85,42,145,18,4,196,49,
+    242,77,88,224,19,251,145,118,116,117,68,115,43,170,79,227,
+    23,67,252,10,77,6,194,2,156,135,170,130,7,178,85,98,
+    211,77,4,59,214,86,190,66,50,190,128,192,127,56,173,137,
+    199,97,233,16,175,148,33,99,36,17,7,77,8,39,189,222,
+    136,254,185,146,77,91,232,132,72,58,185,180,44,70,210,48,
+    70,145,184,32,228,211,57,49,9,78,30,184,197,69,147,9,
+    176,78,71,196,172,201,99,57,126,203,224,28,53,129,51,124,
+    7,8,197,163,119,68,83,3,223,13,185,26,208,153,196,52,
+    250,66,171,209,245,90,248,21,75,239,3,68,176,101,45,207,
+    247,190,88,239,247,214,233,189,144,207,229,32,74,193,16,235,
+    244,59,185,141,144,33,189,66,12,17,199,178,64,93,232,48,
+    228,220,130,122,189,118,160,76,81,29,22,81,41,67,212,105,
+    44,106,145,184,97,162,74,214,46,153,159,34,89,165,168,125,
+    191,81,152,120,5,38,216,252,144,67,245,196,18,9,45,120,
+    227,81,196,0,16,167,192,165,174,171,13,217,20,27,131,9,
+    39,32,25,34,90,167,48,69,161,217,232,134,85,13,113,212,
+    131,62,220,131,10,205,60,8,108,208,3,101,122,160,116,70,
+    25,60,36,211,135,21,250,176,100,36,220,179,130,95,192,113,
+    94,36,139,155,254,242,183,240,41,4,144,110,147,44,188,145,
+    201,235,73,142,231,81,203,133,206,75,203,43,66,50,17,79,
+    193,52,131,64,83,180,16,124,137,58,84,232,206,228,211,139,
+    28,31,201,94,143,204,190,10,131,134,94,201,72,34,155,17,
+    185,59,162,144,220,11,52,133,169,185,184,200,101,18,43,48,
+    225,34,80,25,136,115,217,219,144,47,197,197,100,102,41,34,
+    136,128,142,220,94,230,50,145,120,42,101,214,141,196,97,158,
+    10,121,33,199,101,88,142,157,41,228,166,0,193,103,83,136,
+    18,230,6,143,39,72,34,11,68,75,120,186,100,49,224,226,
+    204,140,206,93,99,27,191,142,218,67,124,117,209,16,87,54,
+    41,196,23,83,28,27,129,104,56,146,187,205,199,52,73,98,
+    41,93,206,196,74,34,5,19,187,229,116,6,145,69,174,231,
+    51,9,244,14,69,68,20,74,23,186,175,38,19,55,81,123,
+    208,2,204,72,27,214,7,115,31,20,197,163,153,154,12,238,
+    70,42,156,194,236,80,141,219,241,164,24,1,75,151,68,175,
+    179,200,175,20,118,114,90,19,184,18,54,121,145,156,192,229,
+    217,108,36,9,118,142,207,99,206,130,73,134,250,148,20,196,
+    100,66,168,75,22,204,241,217,4,39,8,90,99,124,62,3,
+    109,163,55,72,183,123,241,76,28,108,58,140,0,136,144,20,
+    11,205,103,209,88,240,249,28,188,85,154,106,83,240,150,48,
+    103,175,76,96,174,241,12,244,38,56,205,37,224,253,227,171,
+    144,151,160,78,58,153,169,25,50,77,181,130,102,69,224,17,
+    153,106,205,184,162,106,48,72,208,229,194,152,189,98,102,197,
+    24,19,173,138,176,165,202,30,172,97,52,71,44,221,212,112,
+    2,154,112,130,225,38,84,106,116,182,80,24,185,142,44,144,
+    49,211,114,60,210,102,54,47,226,121,1,154,89,226,65,53,
+    160,12,65,0,53,20,126,111,142,67,210,26,86,198,112,98,
+    184,130,54,105,112,227,249,92,100,79,94,0,56,150,89,163,
+    66,2,45,114,226,109,14,32,85,187,59,84,232,56,195,101,
+    56,62,153,128,254,192,226,10,79,46,157,125,33,124,214,210,
+    1,60,81,248,66,208,10,67,75,176,130,103,58,46,198,241,
+    163,234,75,98,43,26,203,225,2,91,45,212,216,79,167,97,
+    148,46,19,218,130,12,59,120,242,30,45,90,168,238,19,55,
+    204,82,173,33,154,182,45,95,238,19,49,211,228,33,19,53,
+    228,152,223,210,28,90,161,124,245,50,100,63,37,223,133,8,
+    172,72,188,209,122,151,188,239,40,213,51,129,54,246,63,113,
+    60,104,187,66,96,123,13,11,204,192,4,159,88,54,167,160,
+    240,49,165,58,162,163,42,153,228,81,124,44,80,216,236,173,
+    98,187,247,141,247,88,10,102,125,34,155,206,157,40,28,50,
+    204,95,2,102,141,200,153,12,170,83,56,122,12,214,196,241,
+    148,112,34,90,173,246,24,241,28,135,236,127,192,196,19,142,
+    46,111,53,171,236,218,189,54,189,193,236,40,51,59,100,166,
+    79,97,250,54,169,26,60,54,152,67,148,234,226,227,153,37,
+    78,245,130,189,211,2,15,8,113,146,85,241,73,77,110,164,
+    174,31,104,46,168,99,91,9,11,125,223,218,137,191,68,204,
+    142,234,2,59,106,4,194,217,231,35,163,79,154,63,221,33,
+    143,76,40,35,19,88,226,103,8,252,53,202,214,156,15,26,
+    215,224,111,171,19,115,27,243,229,20,97,119,98,211,196,27,
+    45,119,29,34,85,37,102,201,162,227,103,4,235,120,159,178,
+    187,175,7,173,120,118,80,243,223,184,144,179,138,126,227,139,
+    28,135,87,20,207,79,1,92,152,95,11,1,88,13,160,58,
+    185,59,92,98,136,194,10,82,105,131,78,37,115,250,40,235,
+    46,59,12,150,63,3,222,104,10,215,69,111,129,80,232,52,
+    21,181,5,247,137,161,33,112,121,161,22,37,52,176,73,144,
+    158,33,156,173,77,124,206,4,165,208,238,245,16,100,90,146,
+    153,61,10,179,71,194,105,147,50,8,53,13,89,250,92,213,
+    80,161,190,134,40,155,134,168,237,52,4,53,29,223,90,147,
+    218,86,183,206,121,254,8,148,11,12,104,22,76,146,166,50,
+    254,168,54,21,251,99,224,115,52,13,155,51,48,198,235,155,
+    57,58,233,113,164,210,190,250,132,96,36,5,157,229,144,19,
+    15,11,127,2,145,123,170,45,157,68,218,117,106,195,163,143,
+    79,179,62,6,215,116,150,218,8,117,219,70,168,6,251,4,
+    113,185,81,29,163,151,145,214,135,113,166,143,209,30,52,70,
+    123,180,36,51,67,10,51,36,225,132,201,95,250,63,15,169,
+    211,50,164,166,145,124,93,31,210,18,81,239,83,36,237,67,
+    81,220,46,178,115,20,169,218,213,157,22,209,241,131,104,120,
+    28,252,41,164,208,211,232,89,83,174,234,49,199,64,245,89,
+    6,68,101,204,2,40,222,166,237,70,93,159,19,169,148,166,
+    232,54,155,162,13,196,223,16,186,105,195,161,223,6,189,163,
+    76,239,40,121,100,122,88,161,135,37,122,24,195,250,202,116,
+    95,105,228,113,81,166,143,41,244,49,201,72,91,13,132,139,
+    176,56,148,231,233,170,234,82,108,207,38,183,218,173,76,171,
+    134,40,254,28,234,97,0,194,219,152,0,241,164,110,15,2,
+    16,167,88,202,160,72,172,60,106,49,47,88,163,96,213,171,
+    43,96,50,47,20,194,54,165,0,236,111,145,62,14,86,245,
+    209,93,166,187,43,76,163,194,244,150,40,37,50,254,100,74,
+    57,56,243,140,114,120,144,173,244,32,99,106,205,176,70,230,
+    19,198,46,114,141,74,254,153,196,42,33,139,68,204,58,21,
+    136,88,221,238,3,156,170,82,213,192,205,201,201,146,172,99,
+    9,113,48,219,43,82,252,108,209,201,207,20,41,128,186,77,
+    168,19,74,13,85,14,55,104,227,185,228,169,59,60,148,165,
+    61,167,101,72,108,147,182,72,220,33,111,152,109,179,20,235,
+    92,114,20,252,104,74,84,37,202,236,174,165,130,214,189,102,
+    235,198,134,112,205,167,214,233,219,249,65,125,198,120,22,45,
+    219,47,55,177,182,248,3,54,153,92,247,126,231,22,237,81,
+    141,93,2,52,17,177,141,117,207,23,26,181,48,43,106,76,
+    189,66,35,107,3,116,36,197,197,216,237,120,10,66,250,152,
+    29,197,110,135,170,31,53,161,205,71,61,102,106,184,75,178,
+    48,93,144,147,129,168,136,6,97,200,2,173,175,28,162,90,
+    132,228,224,199,224,75,117,226,151,193,186,10,60,128,250,116,
+    192,152,248,113,150,189,196,39,111,65,20,113,37,151,74,138,
+    115,99,83,218,42,190,78,16,244,47,80,81,64,187,132,56,
+    6,26,8,84,179,202,174,225,135,222,245,171,114,16,5,63,
+    86,132,22,252,4,84,183,166,39,213,173,169,71,165,141,119,
+    151,31,65,34,161,237,68,254,24,18,55,104,87,151,26,180,
+    107,73,165,210,233,188,233,237,95,197,24,108,201,212,6,20,
+    18,94,184,112,77,245,221,182,66,117,189,168,206,249,107,115,
+    115,67,46,205,44,56,146,9,213,193,38,84,42,121,27,50,
+    246,118,66,112,17,154,253,212,205,68,219,54,154,41,236,248,
+    22,213,253,29,82,83,128,196,6,164,181,29,130,41,159,241,
+    213,213,243,222,209,53,167,66,183,91,158,122,247,75,99,147,
+    82,207,20,42,117,86,124,160,54,143,231,248,195,3,248,171,
+    50,8,161,37,68,148,230,55,19,124,48,187,193,236,46,51,
+    187,31,83,159,48,79,18,159,166,100,102,74,97,166,36,102,
+    10,112,18,211,11,86,170,18,28,129,180,233,162,6,2,207,
+    8,202,31,208,160,144,111,122,9,127,72,43,149,6,63,220,
+    187,209,127,164,220,127,68,238,63,166,244,31,147,153,99,26,
+    98,147,38,160,141,99,239,31,44,251,118,72,190,29,38,83,
+    203,80,71,199,63,73,109,68,103,202,209,25,57,58,171,68,
+    103,241,136,63,67,168,175,9,237,201,210,38,106,150,34,152,
+    8,240,210,156,69,131,101,98,155,177,210,175,137,231,59,11,
+    176,146,206,162,235,35,120,17,126,110,218,62,176,62,110,222,
+    81,116,103,252,214,184,168,246,205,45,90,214,35,192,221,26,
+    167,89,104,170,246,237,134,201,125,139,43,167,106,172,44,81,
+    181,48,55,220,22,168,201,169,106,109,89,114,9,89,124,211,
+    226,234,235,162,66,48,53,94,251,206,15,121,248,69,192,243,
+    200,66,169,13,98,118,110,28,156,145,22,11,204,97,144,94,
+    129,191,134,64,23,8,253,141,25,106,208,2,176,239,163,12,
+    57,22,149,2,66,254,7,168,136,118,117,84,231,157,197,56,
+    47,32,121,244,109,57,125,117,1,179,247,234,237,236,28,119,
+    139,75,225,121,59,155,228,248,56,188,63,43,213,213,197,182,
+    36,27,192,65,224,9,125,195,203,227,223,160,7,203,244,96,
+    233,242,227,240,227,43,79,6,204,29,163,202,142,1,169,109,
+    236,161,248,80,252,69,235,199,237,159,160,151,128,169,198,24,
+    206,15,25,37,114,212,12,41,42,109,157,24,191,107,248,195,
+    148,178,235,40,122,86,232,129,74,239,168,212,51,134,95,14,
+    9,167,173,155,128,102,124,246,31,164,182,136,125,177,197,43,
+    75,222,196,195,197,239,194,139,94,7,44,122,93,53,245,168,
+    250,245,234,44,122,77,92,230,149,23,107,91,244,212,80,109,
+    211,146,238,210,26,69,139,211,98,109,1,255,143,73,91,139,
+    230,116,220,210,219,122,220,156,91,184,89,206,29,177,94,92,
+    247,104,107,63,236,189,175,173,127,223,18,116,220,183,132,25,
+    98,184,202,85,151,163,203,138,47,121,137,58,159,218,150,72,
+    171,227,197,155,139,255,127,123,11,216,145,156,189,50,193,163,
+    115,163,154,189,4,205,123,14,213,174,191,245,245,124,61,159,
+    249,5,161,111,172,194,58,92,106,59,163,165,199,99,235,206,
+    15,152,71,204,159,5,222,11,152,64,109,99,117,124,222,220,
+    14,181,110,164,9,248,192,33,179,27,237,203,139,137,229,234,
+    62,41,218,230,218,165,111,178,9,17,97,57,155,79,177,145,
+    76,86,140,44,114,17,180,137,148,207,161,125,187,124,60,149,
+    90,169,81,151,203,80,215,49,171,186,218,183,87,87,145,252,
+    196,54,216,160,178,14,20,120,128,190,168,164,16,135,47,31,
+    82,155,46,12,68,233,40,254,224,211,40,219,178,37,243,187,
+    170,241,191,9,61,244,64,106,236,62,175,165,207,14,172,95,
+    221,232,217,87,238,217,247,100,64,234,217,39,247,28,86,122,
+    14,155,88,45,244,240,129,57,228,50,154,20,40,168,231,15,
+    17,200,68,194,106,86,101,46,163,157,212,52,119,154,231,179,
+    188,218,192,106,114,171,78,212,40,222,210,231,223,64,180,254,
+    26,225,248,151,136,154,93,26,94,68,29,105,169,219,145,127,
+    67,164,191,214,132,254,141,155,96,26,215,196,7,119,238,31,
+    127,112,124,125,162,236,235,145,124,61,21,99,236,33,253,181,
+    235,9,251,105,86,30,157,81,70,103,160,40,183,157,81,218,
+    206,172,77,63,152,93,155,253,162,49,252,240,224,59,47,223,
+    191,251,224,238,95,80,165,233,15,47,202,145,131,74,228,96,
+    185,241,160,212,120,240,243,214,254,74,243,44,44,72,218,194,
+    224,127,219,194,224,164,67,97,163,181,162,236,235,86,124,221,
+    37,178,236,235,147,124,125,159,135,123,165,29,103,228,240,172,
+    18,158,149,152,217,207,219,186,76,109,65,250,229,224,63,236,
+    129,47,185,251,188,2,121,219,156,210,54,135,13,178,175,177,
+    38,32,120,48,183,193,236,42,51,187,172,203,103,188,130,182,
+    186,249,231,29,210,24,235,56,237,224,197,212,167,238,151,252,
+    224,116,166,180,128,109,42,151,175,106,182,6,252,12,85,66,
+    46,13,175,209,214,156,91,23,162,166,83,216,165,53,74,90,
+    119,98,138,132,117,201,121,157,42,128,100,154,87,102,160,169,
+    125,59,89,45,161,227,21,1,159,90,196,146,172,234,70,33,
+    107,146,53,150,149,110,125,211,218,186,178,12,106,195,127,105,
+    57,158,97,83,220,121,110,165,208,94,59,49,170,152,175,81,
+    15,58,9,227,200,168,183,212,252,97,239,147,230,79,187,62,
+    187,46,69,78,203,141,167,37,250,244,214,78,33,175,49,128,
+    58,245,247,208,189,243,160,216,90,95,87,220,214,223,240,14,
+    116,52,102,245,111,172,163,150,226,174,163,232,216,38,64,34,
+    75,206,122,240,231,249,1,8,152,182,225,86,235,203,96,193,
+    72,214,46,42,237,124,68,191,165,174,197,55,89,23,177,181,
+    117,236,222,250,33,249,198,95,221,165,108,117,61,245,169,89,
+    87,129,218,210,142,183,62,45,90,123,21,41,148,223,117,214,
+    104,214,93,116,178,13,63,115,190,111,215,176,171,232,218,70,
+    39,109,150,218,52,235,121,190,70,128,11,67,212,249,176,222,
+    165,173,59,80,219,181,104,29,5,31,140,176,191,30,85,209,
+    22,29,124,139,92,196,141,128,81,170,127,123,169,104,171,83,
+    10,214,149,173,191,250,92,75,255,58,180,125,215,125,183,161,
+    216,192,183,21,221,165,112,189,218,69,87,145,180,111,83,100,
+    26,197,221,85,10,251,189,45,210,62,222,205,191,91,47,110,
+    152,119,163,88,103,135,73,117,163,181,126,31,238,210,47,52,
+    38,254,34,253,109,218,46,181,17,117,62,69,91,124,120,215,
+    3,237,213,189,181,84,244,188,232,59,91,116,217,41,31,146,
+    15,62,41,58,190,67,188,75,98,73,58,234,214,178,205,198,
+    211,96,132,127,68,65,29,199,31,57,73,237,168,62,16,255,
+    45,160,241,169,23,58,214,3,3,11,161,11,11,193,14,58,
+    250,66,103,122,230,161,107,134,53,142,107,181,109,106,22,157,
+    161,229,208,241,41,4,74,128,49,239,28,0,143,125,233,120,
+    14,243,137,70,230,179,34,167,93,92,208,142,6,211,185,20,
+    62,192,140,227,51,51,124,135,3,197,74,198,229,128,68,42,
+    47,136,16,71,153,220,128,185,1,179,50,59,115,250,194,161,
+    72,82,171,139,194,19,96,135,78,87,111,39,197,101,44,102,
+    246,250,245,100,34,25,79,69,110,199,87,160,96,178,211,142,
+    186,145,232,232,220,89,136,196,33,172,227,174,39,51,28,11,
+    129,30,174,57,205,221,74,38,184,200,85,158,67,87,76,18,
+    121,83,216,104,228,85,88,250,113,246,190,130,67,138,100,56,
+    142,213,14,108,241,177,33,60,140,86,21,168,139,31,89,92,
+    137,8,57,46,145,4,193,48,191,189,184,19,38,43,238,14,
+    32,69,237,210,132,206,22,248,64,12,185,148,202,46,162,224,
+    17,29,249,254,48,207,225,145,72,102,192,155,97,201,82,209,
+    200,85,80,172,201,102,73,31,74,22,235,63,18,103,145,204,
+    26,87,172,51,77,31,208,51,164,3,17,29,132,10,209,121,
+    213,137,238,41,20,124,3,66,178,192,237,75,112,169,148,128,
+    195,251,47,145,129,47,32,228,41,149,188,163,250,88,172,155,
+    152,184,146,227,84,10,160,5,6,221,48,218,27,231,211,251,
+    160,164,82,60,183,84,184,106,220,81,197,99,115,29,194,99,
+    237,144,94,171,27,17,145,94,117,33,65,9,71,35,198,53,
+    6,62,146,206,167,196,36,76,15,116,220,42,64,204,188,162,
+    205,12,116,134,91,104,76,160,91,178,251,204,227,225,161,78,
+    213,185,152,205,166,84,198,56,246,69,27,240,106,195,12,43,
+    206,67,191,85,119,60,135,110,29,168,65,224,53,133,250,115,
+    137,207,230,56,94,92,81,131,64,98,20,94,205,242,16,79,
+    226,160,52,71,232,145,41,127,7,101,43,4,58,206,178,144,
+    94,17,209,172,17,212,160,198,120,202,156,115,42,10,88,38,
+    88,150,199,205,168,110,173,63,106,67,62,147,227,179,119,86,
+    84,26,102,23,27,139,103,86,120,164,76,181,37,158,129,94,
+    193,0,65,12,165,77,53,44,175,243,118,156,207,168,222,68,
+    234,102,140,205,166,227,201,140,234,194,61,86,61,102,151,249,
+    31,17,56,56,195,237,235,97,140,26,226,185,68,158,23,56,
+    141,21,154,180,67,94,45,58,114,225,219,19,170,7,141,108,
+    12,205,5,30,157,48,240,63,70,56,39,42,171,116,78,31,
+    41,213,133,135,73,117,162,182,84,95,78,227,29,187,201,173,
+    8,200,243,70,204,143,126,202,103,204,177,106,163,213,83,190,
+    173,184,111,160,142,112,22,166,211,127,193,31,132,225,65,130,
+    9,62,116,42,193,62,217,215,175,248,250,209,145,79,83,133,
+    9,175,205,124,209,220,181,62,243,147,139,239,92,92,243,84,
+    232,208,6,221,94,166,219,215,91,54,58,246,151,59,246,203,
+    29,99,74,199,152,76,143,43,244,184,68,143,63,53,240,191,
+    234,24,122,188,239,179,190,207,154,228,142,227,74,199,113,153,
+    62,161,208,39,36,250,4,132,223,225,182,159,10,235,7,223,
+    59,41,183,141,40,109,35,114,104,175,18,218,187,73,180,120,
+    6,158,161,108,109,226,243,166,214,135,226,59,191,47,55,237,
+    82,154,118,61,238,147,155,70,126,33,60,57,248,233,81,121,
+    255,73,101,255,73,57,124,242,151,125,114,120,106,109,234,243,
+    166,206,245,19,165,129,245,19,232,79,110,26,86,154,134,215,
+    166,33,10,127,235,252,155,231,127,213,62,252,248,248,103,59,
+    229,246,83,74,251,41,153,153,80,152,9,137,153,0,228,6,
+    211,87,102,250,74,39,164,254,113,153,57,160,48,7,36,230,
+    128,89,103,207,227,150,39,174,141,209,201,242,232,228,47,15,
+    200,163,103,148,209,51,114,251,172,210,62,43,51,103,21,230,
+    172,196,156,173,244,246,191,119,115,163,119,172,220,59,246,100,
+    80,238,125,73,233,125,105,163,247,84,185,247,212,63,182,203,
+    189,231,148,222,115,247,47,174,205,62,228,42,141,205,155,132,
+    219,31,174,4,219,55,130,209,114,48,250,88,124,114,77,14,
+    30,85,130,71,37,156,190,8,54,111,58,200,150,99,207,40,
+    42,4,139,19,200,54,81,246,27,47,209,220,6,157,255,131,
+    141,182,104,185,13,106,201,109,7,21,148,142,124,54,166,180,
+    29,135,101,143,220,52,171,52,205,90,250,185,71,26,58,242,
+    217,180,220,62,161,180,79,200,204,164,194,76,74,204,36,196,
+    205,93,59,54,58,247,151,59,247,63,33,229,206,113,165,115,
+    124,237,60,238,125,111,153,233,93,255,145,204,140,40,204,136,
+    196,140,84,152,150,13,166,187,204,116,175,95,149,153,126,133,
+    233,151,152,126,120,120,26,104,91,195,231,220,155,32,80,251,
+    70,211,80,185,105,232,241,78,185,105,84,105,26,149,232,109,
+    211,214,5,14,10,254,144,243,254,106,129,212,214,210,142,154,
+    176,188,54,80,174,134,232,44,157,4,39,249,33,249,167,224,
+    68,151,192,33,254,57,89,179,131,88,61,253,177,236,75,90,
+    119,30,75,230,86,139,245,99,59,187,32,108,39,70,14,224,
+    96,238,77,86,67,232,91,4,31,180,134,197,44,181,68,234,
+    117,171,48,231,11,214,117,213,169,235,222,182,110,216,26,98,
+    179,13,102,221,42,204,216,246,241,204,15,81,170,227,226,188,
+    234,153,154,59,31,59,51,113,245,244,180,74,93,156,153,81,
+    169,92,50,91,8,85,47,83,188,54,250,70,20,64,170,31,
+    64,250,185,54,88,160,66,87,45,69,13,210,160,197,71,219,
+    217,109,104,117,164,182,75,228,3,35,151,7,235,172,210,177,
+    88,50,147,20,99,49,48,94,232,230,88,76,179,125,141,185,
+    172,32,32,27,173,149,5,188,91,203,47,160,236,53,148,237,
+    39,208,42,82,63,46,159,68,144,41,2,31,110,106,203,203,
+    155,96,147,193,226,123,98,177,68,42,46,8,177,88,237,254,
+    9,26,230,66,208,176,123,134,4,67,48,185,132,127,37,240,
+    142,67,133,110,255,19,215,253,134,7,13,10,221,46,209,253,
+    144,214,15,107,223,144,42,35,167,37,156,240,33,132,66,239,
+    121,218,211,167,244,236,127,50,248,233,222,141,241,115,229,241,
+    115,242,248,156,50,62,39,247,204,225,173,87,116,44,16,122,
+    56,173,52,239,86,154,163,146,15,165,167,193,102,37,248,146,
+    116,116,94,58,114,81,14,94,132,229,191,63,4,150,6,94,
+    74,166,107,157,85,122,199,148,222,151,37,31,74,26,101,5,
+    94,170,240,216,51,138,12,141,155,180,116,125,218,195,91,105,
+    199,37,156,208,38,195,43,64,166,237,237,56,230,97,66,204,
+    67,118,17,141,65,38,158,230,96,12,188,49,116,119,54,159,
+    66,207,76,44,246,195,124,60,165,99,156,56,114,160,227,139,
+    2,186,64,37,130,191,187,115,39,182,12,225,37,140,161,7,
+    61,99,69,171,204,165,149,73,112,154,23,56,113,57,203,170,
+    62,132,128,232,8,159,36,249,48,69,26,99,120,244,19,3,
+    62,130,50,180,96,193,119,43,85,215,165,56,31,79,171,110,
+    237,87,48,170,27,138,16,38,169,20,114,192,15,16,1,117,
+    54,35,106,238,157,190,150,17,146,75,16,250,105,46,31,111,
+    75,185,181,155,126,106,120,235,157,66,213,57,137,2,142,102,
+    109,134,233,184,108,6,2,53,240,195,1,227,14,97,12,95,
+    13,83,157,232,134,161,218,92,11,141,225,88,134,71,43,61,
+    188,177,133,183,184,212,38,136,24,18,16,224,93,70,215,9,
+    245,123,150,106,19,155,141,85,111,20,198,146,248,14,54,2,
+    86,239,15,234,64,223,119,32,108,204,242,90,183,27,46,105,
+    215,7,85,250,118,150,191,153,202,198,89,237,110,248,133,11,
+    215,248,239,162,198,2,168,84,189,178,197,31,70,64,76,130,
+    246,90,209,30,157,234,67,151,218,244,45,68,158,199,120,124,
+    183,27,198,168,37,29,191,163,53,27,3,129,99,250,254,139,
+    218,108,1,103,86,116,176,218,108,220,237,211,186,173,139,235,
+    153,49,226,25,53,100,220,232,211,110,182,220,138,167,248,123,
+    72,43,30,44,5,190,146,23,195,1,53,223,128,69,135,64,
+    61,14,33,162,166,75,94,117,235,223,190,203,154,85,64,71,
+    141,182,179,204,234,75,205,163,61,233,234,181,14,124,125,129,
+    191,136,50,124,226,179,76,232,251,136,252,45,148,161,72,139,
+    127,223,120,201,85,191,110,1,80,96,140,222,112,30,89,119,
+    188,99,118,74,51,5,126,35,67,141,10,151,157,248,237,55,
+    254,42,190,230,213,233,74,99,211,234,108,37,212,187,122,174,
+    18,220,177,122,22,29,217,180,172,49,15,95,147,233,62,133,
+    238,171,208,205,80,248,190,76,15,42,244,160,86,120,67,166,
+    7,208,225,11,46,212,144,189,46,211,253,10,216,15,84,144,
+    90,118,203,244,30,48,30,122,105,88,166,71,20,122,68,47,
+    141,202,244,152,66,143,213,150,54,155,188,77,238,213,243,155,
+    237,132,59,180,233,112,184,58,54,9,200,158,81,80,188,247,
+    154,6,160,49,202,237,106,129,224,194,213,98,162,16,32,168,
+    215,106,65,181,90,44,181,90,54,105,210,133,110,251,24,153,
+    155,8,52,189,245,250,155,175,175,239,122,111,184,148,149,253,
+    135,21,255,225,213,153,138,63,252,214,247,222,252,222,67,94,
+    234,26,145,253,123,21,255,94,128,5,91,222,13,188,29,88,
+    255,161,212,127,66,14,158,84,130,39,87,207,86,66,173,239,
+    246,190,221,91,34,165,129,9,57,52,169,132,38,65,115,29,
+    189,31,116,63,234,174,208,190,10,125,225,153,139,234,116,67,
+    68,211,233,150,156,173,16,62,116,247,125,112,228,209,145,10,
+    237,7,97,60,131,207,92,174,110,192,66,38,57,219,55,3,
+    68,107,215,187,11,111,47,148,92,210,238,19,114,203,73,165,
+    229,228,234,124,165,43,130,106,148,226,210,208,25,185,107,86,
+    233,154,5,210,167,32,115,250,205,244,250,116,105,159,28,24,
+    85,2,163,171,103,158,118,238,248,96,239,163,189,165,188,20,
+    61,39,119,158,87,58,207,75,206,54,4,28,126,132,110,230,
+    72,129,67,207,40,71,151,27,93,219,131,198,218,80,72,20,
+    217,14,71,19,193,174,141,198,254,114,99,127,105,92,218,253,
+    138,220,120,68,105,60,178,58,251,212,219,248,214,190,55,247,
+    173,59,165,222,35,178,247,168,226,61,186,58,85,9,117,111,
+    132,70,202,161,145,199,147,210,232,140,28,58,163,132,206,128,
+    10,188,45,27,222,158,178,183,103,125,177,20,149,189,99,138,
+    119,12,72,3,29,27,129,157,229,192,206,210,162,52,124,76,
+    14,28,87,2,199,65,110,208,200,133,71,23,42,180,71,242,
+    77,131,24,61,72,140,30,16,163,3,68,4,220,241,71,199,
+    49,238,4,224,144,174,28,154,174,0,183,123,163,43,90,238,
+    138,86,104,175,196,28,182,99,97,12,26,31,53,130,158,165,
+    70,136,42,29,29,8,215,1,56,24,127,162,185,227,221,35,
+    111,107,99,64,122,122,159,185,156,205,128,133,108,117,110,147,
+    33,154,6,165,240,128,52,8,129,245,41,37,124,106,245,252,
+    83,127,120,195,223,83,246,247,172,103,164,232,164,236,159,82,
+    252,83,171,51,79,195,61,15,71,164,222,81,57,60,166,132,
+    199,86,207,87,80,121,253,166,28,30,86,194,195,80,108,233,
+    47,93,144,154,199,87,47,60,29,26,145,156,187,42,123,134,
+    37,231,206,77,39,229,242,66,96,107,100,94,135,107,8,205,
+    79,61,163,157,232,201,204,24,135,235,56,66,232,25,109,171,
+    219,234,10,108,18,181,217,56,113,232,149,77,138,118,141,111,
+    18,181,89,115,0,49,53,179,8,233,242,163,201,175,103,110,
+    202,53,67,34,174,102,206,236,115,141,109,18,102,246,125,178,
+    5,53,241,98,25,118,184,216,200,12,181,171,20,248,12,213,
+    155,62,20,213,54,47,4,30,69,38,106,43,0,180,159,3,
+    8,81,252,171,210,105,109,41,217,110,135,27,191,54,229,81,
+    36,11,86,221,130,190,116,77,251,181,169,192,187,237,184,234,
+    79,81,53,131,220,100,193,25,139,126,109,145,219,108,193,224,
+    159,169,98,219,236,177,163,204,31,171,242,40,210,84,27,45,
+    40,244,195,85,237,28,222,3,208,28,114,110,224,212,208,35,
+    94,84,51,240,116,37,153,214,122,161,134,160,148,23,147,169,
+    232,117,86,92,230,82,16,17,242,138,105,150,241,17,7,214,
+    29,190,136,76,31,211,98,147,19,252,127,18,218,193,136,176,
+    11,242,77,138,36,201,205,203,36,65,250,86,189,232,239,41,
+    177,67,170,77,21,98,80,50,82,133,24,151,106,83,133,24,
+    145,106,83,133,216,43,213,166,10,177,71,170,77,245,248,12,
+    75,181,169,66,244,75,181,169,66,180,73,70,170,16,173,146,
+    145,42,68,167,100,164,138,69,242,167,161,206,135,29,63,233,
+    122,167,107,53,176,233,158,116,146,48,161,234,231,107,233,103,
+    248,251,235,109,240,88,143,255,11,76,23,27,25,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/BaseCPU.py",
+    "m5.objects.BaseCPU",
+    embedded_module_data,
+    7165,
+    15789);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,61 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,83,193,142,210,64,24,158,161,45,180,5,101,145,
+    176,108,72,52,6,101,99,55,43,123,90,15,196,120,81,163,
+    235,1,77,22,47,189,52,221,206,68,48,45,139,211,98,88,
+    78,28,124,0,110,190,129,201,198,135,240,21,56,54,115,245,
+    228,141,205,114,218,147,243,23,10,101,193,139,157,233,55,255,
+    252,223,116,250,125,127,167,191,81,226,82,22,227,245,80,192,
+    119,68,16,193,46,242,176,137,49,196,41,55,213,130,81,114,
+    37,79,54,101,140,82,232,13,34,242,55,68,20,138,127,72,
+    8,253,148,226,141,76,37,226,210,130,203,108,112,233,136,83,
+    5,167,81,229,22,151,33,250,41,50,178,127,96,98,96,174,
+    159,116,253,160,197,108,135,50,49,195,7,2,180,211,142,247,
+    254,236,51,117,2,39,41,29,199,210,43,145,116,138,76,76,
+    144,153,18,183,68,176,41,147,148,169,16,73,108,45,115,237,
+    245,128,206,183,28,238,126,162,222,113,163,17,192,172,209,88,
+    229,243,78,175,127,68,7,52,34,234,237,118,243,50,205,85,
+    203,234,218,30,181,44,174,91,150,119,78,250,46,196,57,203,
+    250,210,183,221,5,35,7,23,61,202,53,103,48,176,28,215,
+    246,125,174,67,216,166,54,161,236,18,93,131,190,155,146,207,
+    156,35,216,255,229,135,143,243,215,249,245,222,5,203,8,46,
+    130,135,226,246,239,11,24,45,91,152,221,29,189,10,119,158,
+    140,78,194,66,117,244,14,26,219,137,215,255,103,21,68,101,
+    3,234,70,2,134,229,181,50,36,136,2,232,236,192,124,89,
+    9,166,194,139,243,0,145,132,2,64,49,134,253,109,226,203,
+    32,222,0,241,143,147,226,139,255,20,255,96,93,60,22,226,
+    81,44,222,76,19,89,24,80,120,182,105,7,157,175,243,47,
+    214,26,238,173,89,72,80,195,123,224,161,27,37,150,38,140,
+    12,211,64,130,14,144,21,192,85,251,204,7,58,96,57,200,
+    221,1,184,187,197,105,41,134,67,112,90,93,119,154,47,142,
+    222,134,217,61,176,123,0,118,107,73,187,240,80,211,80,121,
+    201,59,174,159,71,231,215,175,175,78,55,131,95,128,107,130,
+    235,217,204,246,124,158,19,225,242,164,51,37,254,218,243,82,
+    151,54,149,221,168,207,231,135,242,5,171,44,106,233,255,18,
+    48,149,48,198,211,103,8,63,157,160,195,100,15,81,121,18,
+    247,16,85,39,235,125,154,150,240,163,41,218,132,177,126,5,
+    195,108,149,205,73,184,6,209,109,24,87,96,101,109,182,202,
+    230,100,188,63,69,155,48,54,174,96,152,109,161,34,131,127,
+    1,204,1,24,120,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/CPUTracers.py",
+    "m5.objects.CPUTracers",
+    embedded_module_data,
+    581,
+    1188);
+
+} // anonymous namespace
+} // namespace gem5
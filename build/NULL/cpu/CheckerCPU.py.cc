@@ -0,0 +1,72 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,83,75,79,27,49,16,182,119,55,201,38,4,37,
+    13,69,17,69,173,44,212,22,37,69,225,196,163,168,234,129,
+    71,91,104,121,72,192,37,151,213,178,54,100,97,31,169,119,
+    83,32,226,144,3,63,160,226,66,213,75,123,66,84,189,244,
+    167,4,137,195,202,167,74,61,245,22,4,189,112,170,189,144,
+    16,30,173,215,251,121,236,153,177,103,190,177,127,129,182,22,
+    185,28,79,199,57,236,3,12,48,180,128,13,139,16,10,89,
+    178,164,37,49,202,150,108,43,69,5,2,9,188,6,88,217,
+    5,56,66,224,129,12,192,119,185,185,81,49,130,163,139,32,
+    23,251,45,38,57,200,98,227,186,71,38,22,150,185,8,243,
+    28,226,139,166,61,191,178,78,12,223,104,63,95,105,158,127,
+    24,158,79,64,17,98,80,148,248,47,99,88,84,176,196,247,
+    149,139,81,18,251,170,130,59,26,86,112,228,64,226,113,72,
+    173,56,226,255,177,141,222,176,77,252,211,22,226,216,13,219,
+    14,172,238,130,98,18,199,121,150,9,150,152,40,17,99,131,
+    80,158,225,82,53,99,148,43,131,198,197,194,32,151,11,165,
+    82,53,189,70,236,161,177,177,43,179,87,213,244,212,150,233,
+    35,215,65,186,131,8,165,46,173,142,46,151,177,238,19,228,
+    151,8,186,244,71,155,166,95,10,23,108,221,116,16,119,236,
+    247,144,231,11,171,118,207,137,233,85,164,35,203,213,49,162,
+    196,171,88,62,50,61,100,58,134,75,41,167,120,128,219,90,
+    219,168,76,77,199,231,102,155,58,117,76,103,141,123,99,132,
+    93,228,184,62,34,60,20,67,106,203,88,20,66,20,243,116,
+    32,44,132,15,175,84,235,45,121,7,236,192,235,180,112,50,
+    224,92,78,162,226,30,177,204,26,113,8,229,161,78,146,15,
+    166,65,150,40,33,57,137,41,30,177,86,89,36,204,193,19,
+    142,8,157,119,123,212,16,76,13,94,241,83,40,111,211,56,
+    215,86,31,182,173,221,222,112,144,155,120,89,14,53,240,71,
+    5,233,158,227,212,179,195,201,31,79,142,82,163,199,169,209,
+    186,58,122,42,162,154,203,117,50,85,211,28,221,38,154,198,
+    18,154,102,187,184,98,9,57,169,105,239,43,186,117,169,81,
+    252,237,50,97,170,190,226,249,84,55,124,150,48,182,182,180,
+    18,209,49,161,44,46,100,195,210,61,143,69,22,116,170,219,
+    76,25,119,93,139,117,8,234,230,157,41,81,6,214,89,9,
+    11,216,156,118,9,166,231,57,245,243,206,59,94,154,112,49,
+    76,234,27,160,157,124,160,73,1,177,38,32,145,75,45,204,
+    165,249,5,29,217,218,100,144,234,170,189,9,238,61,169,205,
+    4,233,190,218,244,207,76,118,63,191,151,255,180,92,127,60,
+    124,148,25,57,206,140,212,222,6,247,123,246,103,246,102,2,
+    181,179,158,154,62,145,165,238,232,25,224,80,155,109,68,65,
+    47,250,146,255,156,15,212,100,160,206,158,68,228,94,174,226,
+    80,87,178,141,132,18,121,222,0,183,225,34,184,88,200,92,
+    148,101,236,161,130,27,62,85,175,112,249,138,169,184,26,44,
+    206,21,101,65,133,199,146,92,108,189,232,176,250,23,105,61,
+    16,208,74,245,92,125,113,193,252,75,250,136,79,197,61,242,
+    54,56,52,100,8,97,99,24,192,254,58,120,218,222,3,144,
+    173,55,123,0,250,234,215,123,35,218,5,121,192,183,225,99,
+    246,68,12,103,119,168,194,96,254,2,101,54,65,126,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/CheckerCPU.py",
+    "m5.objects.CheckerCPU",
+    embedded_module_data,
+    766,
+    1267);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,133 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,197,87,205,111,19,71,20,159,217,93,59,107,199,177,
+    227,36,38,4,241,177,73,11,197,4,146,52,124,168,164,40,
+    18,36,85,9,37,17,34,80,33,171,104,217,236,44,137,131,
+    63,194,236,154,18,43,128,43,33,145,84,145,10,82,42,56,
+    230,132,138,168,122,230,208,255,161,118,100,41,209,74,72,72,
+    61,113,51,130,74,136,83,223,204,218,235,117,8,136,67,165,
+    110,214,111,230,205,188,153,121,239,247,62,102,243,55,242,60,
+    190,106,251,250,24,144,135,136,32,130,83,40,141,19,24,179,
+    190,144,18,46,32,1,125,139,136,120,23,17,201,192,143,69,
+    132,158,138,181,197,9,145,248,38,81,220,255,146,49,113,108,
+    7,38,115,83,147,243,166,101,164,129,193,7,116,239,65,82,
+    237,160,63,248,65,6,74,96,130,18,2,97,155,224,132,68,
+    132,132,143,136,9,63,252,154,12,121,53,128,182,120,136,244,
+    24,195,241,216,61,62,8,146,205,91,74,250,54,73,134,136,
+    255,46,74,180,144,38,160,97,34,147,0,9,26,145,171,18,
+    105,190,43,37,90,73,7,9,67,27,37,49,18,133,182,141,
+    68,140,246,171,2,105,131,126,7,105,7,3,183,217,193,145,
+    185,220,72,42,7,166,209,124,88,159,203,245,235,14,211,55,
+    51,147,111,157,54,210,71,135,134,234,18,84,128,35,243,225,
+    239,179,41,75,155,54,20,146,77,107,201,76,62,52,146,202,
+    234,215,170,156,142,61,218,138,213,223,235,3,28,26,203,51,
+    183,128,102,93,174,209,164,73,244,4,79,196,5,91,74,194,
+    137,182,4,58,153,79,176,45,153,70,234,170,201,132,148,119,
+    49,147,234,253,76,215,186,102,125,115,243,182,172,170,108,137,
+    170,230,219,61,19,181,193,195,176,212,108,5,82,64,207,35,
+    237,247,71,87,198,150,238,44,223,41,202,187,95,179,67,255,
+    11,181,169,12,13,40,46,166,140,12,13,66,159,50,23,58,
+    58,211,22,160,118,147,170,194,28,40,216,214,160,32,31,59,
+    230,213,175,237,254,145,149,227,75,183,151,111,23,229,93,52,
+    194,150,202,96,175,106,205,207,25,118,211,41,205,52,70,206,
+    93,180,229,76,46,173,50,120,116,177,174,32,15,71,174,252,
+    62,56,248,30,186,135,31,162,69,188,136,192,237,248,174,220,
+    96,138,208,104,192,40,122,12,244,169,59,191,132,84,92,239,
+    207,122,228,46,127,125,75,92,16,87,5,180,197,211,184,7,
+    70,32,39,126,138,156,37,215,231,102,107,185,11,171,85,127,
+    173,191,124,194,43,115,19,207,54,213,45,201,3,188,186,160,
+    186,35,155,36,221,253,72,77,178,62,34,66,26,72,249,191,
+    130,74,245,25,203,152,150,150,177,146,154,101,152,138,53,99,
+    40,12,97,229,199,164,53,147,204,56,188,227,55,101,142,102,
+    111,36,137,65,220,149,48,153,180,20,230,35,69,203,16,206,
+    82,5,124,52,5,78,14,186,82,67,115,26,213,210,74,205,
+    157,67,202,5,231,12,216,87,51,205,205,98,53,23,59,98,
+    206,102,74,246,234,135,148,114,151,55,196,51,131,176,29,126,
+    175,39,128,252,42,60,68,211,16,199,151,187,111,97,1,45,
+    9,150,71,176,238,228,5,156,7,186,36,206,186,78,254,29,
+    61,134,254,83,151,127,32,44,247,0,116,24,2,222,207,140,
+    73,18,59,168,167,174,169,78,25,136,139,148,157,106,7,212,
+    137,139,227,42,68,235,36,237,2,62,46,217,66,223,128,45,
+    38,201,77,202,52,162,33,32,38,11,89,69,41,20,120,146,
+    188,11,158,72,37,77,75,207,166,231,134,243,7,61,121,50,
+    109,100,12,10,94,225,120,244,157,128,154,163,165,204,225,190,
+    186,244,73,182,215,119,64,222,22,80,5,249,98,65,15,145,
+    81,180,163,210,132,90,98,139,167,159,119,118,151,59,123,127,
+    211,75,157,95,62,35,127,102,43,162,208,18,126,133,128,188,
+    97,164,34,54,44,228,201,247,146,193,50,17,151,109,31,213,
+    50,211,6,207,109,187,69,167,6,104,115,97,6,26,98,218,
+    93,14,59,150,97,101,50,55,103,141,100,51,22,205,166,82,
+    192,113,32,90,28,32,206,94,156,188,240,205,249,73,59,96,
+    66,201,52,44,64,141,238,224,184,112,36,28,76,98,76,94,
+    100,86,50,96,174,92,81,170,213,163,165,1,129,252,246,15,
+    97,115,156,225,192,46,163,183,12,136,214,70,32,92,242,143,
+    140,182,239,122,116,233,193,157,149,59,149,0,240,175,216,224,
+    27,70,22,165,229,64,37,140,58,182,175,28,175,32,49,112,
+    148,147,197,145,141,80,100,61,180,107,45,180,171,20,218,83,
+    14,237,41,134,246,240,145,248,90,40,94,10,245,150,67,189,
+    197,80,239,243,157,251,202,59,143,44,142,44,143,47,142,195,
+    1,129,246,162,188,179,44,239,92,149,75,242,126,167,251,92,
+    110,43,202,74,89,86,86,79,150,228,189,78,183,200,95,167,
+    206,249,211,70,122,42,103,218,65,231,186,189,116,74,163,186,
+    183,208,184,229,109,20,177,218,12,245,216,157,130,194,212,121,
+    75,88,16,86,189,177,239,62,11,184,177,220,97,180,188,157,
+    96,136,96,33,255,147,155,54,224,181,140,161,91,166,98,220,
+    48,232,60,79,203,45,50,159,13,177,1,119,89,173,20,40,
+    160,249,123,153,238,24,228,36,176,201,141,82,116,154,53,205,
+    41,173,158,174,112,223,57,81,21,212,29,13,78,229,76,72,
+    33,30,19,251,24,249,156,249,84,228,121,82,187,75,170,146,
+    13,119,73,117,236,60,147,62,130,216,93,226,58,18,7,62,
+    227,132,59,242,151,137,159,39,30,29,43,133,122,202,161,158,
+    34,127,43,98,77,160,234,7,106,88,57,154,177,131,227,70,
+    58,75,231,199,179,196,104,168,41,174,31,18,232,99,119,36,
+    193,93,238,120,35,254,159,114,125,192,167,128,48,193,63,58,
+    226,162,45,177,114,233,160,212,156,230,74,169,105,208,106,243,
+    37,75,7,128,228,183,121,64,241,8,255,192,100,123,144,231,
+    35,224,145,182,114,182,20,233,46,71,186,215,35,135,214,34,
+    135,74,145,254,114,164,191,40,247,115,24,254,15,147,105,31,
+    183,151,246,51,99,184,185,97,106,92,207,37,41,100,183,166,
+    207,24,230,123,22,15,50,139,187,60,22,55,202,171,31,53,
+    122,96,45,50,80,138,12,150,35,131,69,121,144,27,205,130,
+    145,7,221,23,76,17,129,246,178,254,65,214,143,177,111,172,
+    140,150,54,84,213,14,170,12,209,92,138,245,67,170,122,61,
+    167,165,156,25,174,56,4,242,205,155,234,12,148,70,248,134,
+    11,176,62,191,222,120,177,163,76,23,219,119,142,101,135,221,
+    82,253,152,28,229,215,134,29,190,225,176,213,107,196,110,230,
+    223,150,206,36,191,65,104,152,145,54,182,131,152,132,18,187,
+    151,177,7,106,126,183,165,169,108,54,197,1,121,130,184,49,
+    14,66,254,26,217,207,176,88,231,88,212,254,54,154,59,11,
+    163,27,209,238,194,153,141,214,158,194,216,139,214,104,97,108,
+    163,35,86,24,127,17,219,177,30,219,191,22,219,95,140,31,
+    47,197,134,202,177,161,194,196,70,116,219,122,180,103,45,218,
+    179,58,92,138,14,150,163,131,133,51,21,9,251,246,64,230,
+    212,136,31,251,118,179,94,149,248,59,125,251,86,147,21,4,
+    205,179,195,188,217,76,6,101,31,100,94,35,233,192,190,1,
+    182,222,75,96,227,195,171,18,235,31,254,32,113,108,246,115,
+    47,74,118,71,250,104,95,118,106,150,85,180,62,247,63,24,
+    202,98,216,14,192,20,175,79,166,3,206,48,35,46,96,239,
+    228,19,142,115,135,41,187,85,89,172,153,44,234,161,74,96,
+    92,57,141,17,238,45,162,3,222,119,3,117,22,107,111,197,
+    255,21,6,117,222,39,247,187,94,177,230,205,22,83,252,236,
+    127,1,157,55,32,93,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/CpuCluster.py",
+    "m5.objects.CpuCluster",
+    embedded_module_data,
+    1734,
+    3521);
+
+} // anonymous namespace
+} // namespace gem5
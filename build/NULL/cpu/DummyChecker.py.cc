@@ -0,0 +1,47 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,80,189,78,195,48,16,62,39,105,213,150,255,10,
+    84,129,196,6,130,34,72,167,50,84,136,165,149,248,25,42,
+    36,96,201,98,5,219,34,130,132,6,167,145,218,78,25,120,
+    0,54,222,0,9,241,50,29,163,172,76,108,65,101,98,194,
+    78,19,136,4,246,249,187,59,159,125,223,221,189,65,110,21,
+    82,61,217,23,240,4,20,40,178,193,65,6,66,210,86,108,
+    229,2,20,56,2,170,62,0,213,24,122,86,1,94,213,236,
+    179,161,210,194,57,212,139,239,210,169,163,168,210,182,24,185,
+    101,188,125,118,41,60,180,67,242,76,40,99,90,75,152,24,
+    24,136,130,161,80,153,5,25,26,85,140,2,85,69,54,45,
+    154,237,248,142,51,76,115,141,150,137,235,55,168,188,193,100,
+    122,165,91,214,168,122,205,156,102,171,149,127,217,173,23,163,
+    18,198,119,166,195,48,142,42,24,59,61,234,219,210,158,197,
+    248,222,55,237,52,162,245,135,46,139,42,100,48,192,22,51,
+    41,227,81,89,218,196,54,61,239,5,38,178,198,175,154,199,
+    73,67,18,231,9,116,119,200,139,34,154,192,182,56,222,186,
+    128,224,103,135,51,171,65,39,92,218,10,78,195,197,141,224,
+    68,110,62,159,189,239,138,198,86,156,166,222,187,186,97,164,
+    239,233,191,163,226,114,158,81,89,196,92,147,155,142,55,229,
+    152,147,144,252,94,144,5,149,14,166,221,28,242,106,58,75,
+    207,16,16,171,8,161,248,24,1,218,27,195,110,94,66,168,
+    141,51,137,139,42,218,140,225,47,60,182,62,164,250,252,39,
+    148,112,127,3,190,157,140,162,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/DummyChecker.py",
+    "m5.objects.DummyChecker",
+    embedded_module_data,
+    360,
+    555);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,109 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,165,86,205,111,19,71,20,223,93,219,235,143,172,211,
+    132,20,72,37,4,171,244,80,185,149,2,165,2,36,84,129,
+    210,36,6,87,137,131,48,129,98,81,185,155,221,113,188,237,
+    126,49,187,78,147,72,149,124,232,1,209,3,82,47,244,208,
+    3,234,1,169,226,175,232,127,144,84,145,106,205,9,169,39,
+    110,70,228,196,169,239,205,120,215,31,184,189,212,107,191,121,
+    159,51,111,222,251,249,217,127,75,67,175,76,127,125,227,1,
+    121,42,89,146,37,59,210,29,92,21,71,118,149,186,34,75,
+    138,116,67,178,82,63,74,86,154,164,158,167,36,233,69,42,
+    14,174,167,185,45,3,54,149,40,99,182,12,183,101,193,150,
+    123,199,166,90,249,154,84,42,188,66,161,36,51,249,99,32,
+    249,154,237,110,108,125,75,204,200,28,78,80,137,19,60,197,
+    19,36,82,93,182,164,186,178,13,137,254,38,215,83,150,2,
+    27,165,88,118,35,88,118,140,48,44,173,179,66,213,111,244,
+    37,166,86,188,104,201,105,179,44,172,235,109,39,226,138,21,
+    123,135,229,202,142,111,68,75,150,213,231,150,221,32,230,118,
+    34,150,231,28,15,208,18,118,201,52,251,46,184,65,223,197,
+    14,205,62,91,123,72,35,150,133,59,88,184,107,161,207,96,
+    144,80,98,22,200,224,73,130,129,131,114,200,240,77,4,135,
+    39,78,197,28,198,78,115,97,144,0,22,201,170,181,236,38,
+    100,150,176,201,33,252,102,92,141,201,112,135,228,158,67,18,
+    164,50,144,48,159,33,105,103,56,14,247,43,38,18,207,115,
+    72,196,100,103,70,68,76,100,110,160,25,40,7,81,60,51,
+    46,222,38,86,219,36,152,218,176,8,185,13,137,152,220,137,
+    36,118,16,49,174,75,138,186,68,194,126,237,73,184,110,239,
+    198,69,50,62,189,105,132,45,177,115,44,93,20,197,5,241,
+    226,165,203,220,252,222,168,124,49,241,175,217,219,174,49,38,
+    126,38,26,117,139,18,222,91,21,110,75,225,192,188,88,215,
+    125,232,132,96,55,110,177,236,58,113,111,19,3,192,6,204,
+    61,106,71,36,198,85,95,95,140,37,97,204,87,2,10,101,
+    35,128,96,173,226,133,17,28,210,36,145,217,98,239,223,133,
+    175,135,79,55,61,59,170,193,222,22,89,243,33,250,228,184,
+    182,6,18,97,243,227,234,117,35,252,142,7,124,48,201,34,
+    130,102,133,73,168,45,238,125,98,68,53,226,86,241,44,178,
+    59,234,214,87,9,183,133,241,131,202,6,32,98,195,115,246,
+    202,54,13,35,30,119,90,248,220,107,249,14,185,77,182,237,
+    48,34,148,27,230,39,24,196,182,201,81,17,217,38,116,9,
+    106,214,98,51,66,39,16,206,53,39,134,52,203,190,183,67,
+    0,121,115,35,145,2,60,241,101,134,240,196,10,66,197,33,
+    127,106,36,102,117,55,34,94,104,251,30,211,132,30,182,110,
+    218,219,213,82,154,229,26,13,207,112,73,163,193,10,141,134,
+    235,91,109,7,121,173,209,120,216,54,156,190,37,189,99,56,
+    225,239,210,27,28,105,111,231,66,106,158,55,131,246,249,114,
+    219,51,177,72,139,193,30,85,193,194,201,39,240,9,23,128,
+    116,146,167,167,84,101,77,237,73,3,218,89,193,135,222,143,
+    131,70,102,103,58,158,157,191,142,204,78,248,164,44,185,158,
+    182,148,122,134,168,207,178,210,132,151,149,122,46,195,200,150,
+    147,145,157,3,207,252,68,207,180,149,121,14,83,250,133,146,
+    248,22,192,119,106,162,175,106,101,199,124,53,43,7,19,60,
+    207,212,141,96,133,132,230,219,25,172,71,19,234,209,104,99,
+    65,90,173,125,109,155,184,151,174,94,21,246,253,217,104,47,
+    32,186,223,212,253,128,80,35,130,70,188,194,36,247,117,115,
+    207,116,72,168,183,189,200,118,116,74,66,0,154,110,135,186,
+    177,99,216,142,177,229,144,59,251,36,36,145,30,249,122,68,
+    219,68,255,190,69,60,61,106,17,29,207,194,109,12,71,199,
+    19,245,166,79,163,22,4,250,1,134,55,219,142,179,167,7,
+    118,64,28,219,35,214,162,94,134,254,17,221,37,134,23,234,
+    158,31,13,76,186,17,233,134,227,44,86,75,69,122,7,219,
+    177,137,228,46,16,150,198,156,89,193,220,221,109,180,224,235,
+    78,40,203,35,111,242,223,168,204,45,131,26,46,111,30,203,
+    250,241,15,215,50,191,13,203,248,193,154,17,177,244,23,190,
+    239,176,124,114,22,253,10,247,230,77,175,35,121,16,147,31,
+    16,51,141,17,204,116,167,230,58,43,221,217,15,59,95,118,
+    103,206,118,42,47,167,231,158,184,143,221,131,51,231,15,167,
+    47,28,77,95,232,220,232,106,179,79,214,30,175,253,50,123,
+    112,230,218,161,118,253,72,187,222,89,237,206,156,124,90,248,
+    185,208,205,105,61,69,206,223,148,95,103,210,179,234,177,4,
+    164,83,193,71,156,253,96,28,112,241,47,124,255,223,196,255,
+    4,92,254,89,97,50,224,198,60,167,172,12,64,72,101,106,
+    121,19,33,66,191,70,60,244,81,35,84,251,103,189,182,187,
+    69,40,226,6,122,14,13,44,111,126,52,132,141,253,133,4,
+    77,58,239,10,0,9,112,160,115,32,148,55,117,236,95,181,
+    164,141,245,149,98,161,233,55,72,12,36,91,216,194,20,204,
+    9,150,49,125,192,33,155,18,19,66,52,24,139,197,84,232,
+    39,12,178,241,254,217,49,249,9,251,183,252,159,253,131,110,
+    85,30,87,14,78,93,62,212,174,28,105,87,160,87,197,249,
+    191,138,231,254,44,158,59,208,87,14,139,171,71,197,213,78,
+    25,31,177,63,238,90,45,101,89,222,189,180,24,96,34,240,
+    155,2,108,242,103,139,166,57,66,87,161,64,98,244,60,72,
+    18,26,77,242,109,238,115,49,211,174,209,135,32,98,249,195,
+    63,128,244,82,178,44,247,170,178,36,207,31,72,167,197,187,
+    43,45,28,140,190,123,234,134,44,195,204,154,76,31,89,175,
+    249,122,60,108,177,148,41,228,223,37,143,238,191,198,229,120,
+    160,61,163,202,101,185,39,77,166,232,142,235,241,191,216,249,
+    21,255,1,90,193,93,210,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/FuncUnit.py",
+    "m5.objects.FuncUnit",
+    embedded_module_data,
+    1351,
+    2837);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,54 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,81,191,111,19,49,20,126,190,95,205,165,25,82,
+    160,180,75,165,136,5,37,130,100,42,67,212,118,168,42,161,
+    48,148,74,233,116,139,117,61,155,230,224,46,57,124,119,82,
+    219,233,6,254,0,196,210,149,169,18,226,159,9,18,195,201,
+    43,19,91,80,152,152,240,51,189,112,136,218,207,223,123,207,
+    207,250,252,217,239,27,212,134,125,235,151,135,10,174,129,1,
+    35,17,196,196,35,4,99,35,50,78,209,155,145,25,91,158,
+    69,192,128,231,192,172,119,192,108,78,110,76,128,207,102,69,
+    228,217,204,25,67,119,237,59,38,93,34,155,163,105,154,157,
+    10,63,224,66,101,164,167,192,29,135,241,203,179,215,60,200,
+    130,186,132,138,98,121,164,37,112,240,8,3,207,80,203,100,
+    196,179,152,225,217,220,249,184,6,119,12,102,222,16,37,130,
+    172,68,52,152,165,68,216,114,29,111,63,57,212,247,95,109,
+    159,243,120,119,56,204,48,25,14,235,149,7,65,146,15,66,
+    181,65,147,51,170,235,253,201,228,106,7,143,136,60,200,194,
+    217,180,163,119,59,179,60,75,242,172,243,42,140,248,113,215,
+    149,13,74,167,126,204,41,149,77,74,227,25,203,35,140,91,
+    148,190,205,253,232,182,98,101,151,9,151,110,112,113,65,131,
+    200,79,83,217,196,112,194,125,198,133,180,79,124,225,199,210,
+    25,103,34,156,158,75,23,137,53,229,39,88,226,67,126,61,
+    76,69,48,64,117,53,185,253,228,82,224,55,104,232,168,149,
+    14,20,20,171,89,174,111,23,71,101,187,87,140,202,141,199,
+    197,139,178,189,121,221,250,208,154,239,236,125,105,239,127,109,
+    239,23,35,156,226,94,197,112,220,117,228,102,188,219,159,233,
+    150,164,253,191,13,19,216,18,233,170,90,130,50,83,217,82,
+    225,170,121,194,174,24,196,6,130,38,188,143,162,27,123,127,
+    254,226,64,108,169,20,187,146,190,81,176,48,9,33,139,103,
+    64,158,206,225,73,221,74,216,154,87,86,194,163,249,191,182,
+    112,44,114,176,128,255,225,125,239,7,186,159,119,148,180,152,
+    223,179,163,193,159,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/InstPBTrace.py",
+    "m5.objects.InstPBTrace",
+    embedded_module_data,
+    469,
+    737);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,63 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,83,73,107,20,65,20,174,154,37,155,19,147,40,
+    146,32,226,65,68,152,8,25,15,70,16,68,200,106,26,146,
+    33,58,137,194,92,154,178,170,102,82,80,189,88,85,29,141,
+    167,57,248,3,188,121,247,32,136,127,38,199,80,87,79,222,
+    70,226,41,39,223,235,78,39,227,50,61,243,234,125,111,249,
+    222,82,61,223,201,200,167,126,126,158,46,130,248,68,4,17,
+    84,147,61,82,33,207,136,168,124,32,162,42,233,151,42,33,
+    223,170,101,66,183,34,106,29,210,172,255,64,208,164,158,46,
+    242,81,190,74,201,119,39,231,147,164,75,5,230,144,110,85,
+    208,110,77,84,186,245,62,176,126,166,221,177,130,199,207,116,
+    28,115,138,7,177,117,155,154,245,237,158,175,231,103,243,158,
+    175,7,182,157,164,126,50,176,65,236,100,95,26,63,21,216,
+    77,157,64,124,220,247,19,129,125,41,185,75,140,111,148,218,
+    134,150,17,218,119,152,51,234,157,31,11,236,118,194,132,31,
+    15,108,7,188,18,93,43,46,137,20,247,215,206,77,107,73,
+    44,148,83,73,204,180,191,138,117,172,219,53,178,39,29,63,
+    64,188,206,28,187,192,208,7,132,59,147,104,63,3,46,101,
+    160,102,105,152,195,92,241,135,105,58,15,23,35,41,251,49,
+    31,49,64,119,107,76,107,108,234,133,116,153,137,49,163,35,
+    141,98,90,189,199,1,231,46,161,92,149,61,28,96,118,196,
+    180,210,115,176,17,104,242,149,81,78,174,50,99,20,224,105,
+    100,99,162,132,179,184,194,184,147,74,158,105,88,219,161,196,
+    41,158,103,74,90,46,49,119,63,62,4,190,158,98,175,117,
+    190,158,93,43,51,145,96,80,231,200,114,108,111,18,215,201,
+    77,82,92,196,142,42,84,92,128,212,236,72,194,56,81,164,
+    28,214,221,102,214,149,126,160,222,84,230,18,227,104,111,50,
+    102,15,138,174,225,30,183,92,4,55,111,28,178,230,58,68,
+    93,201,213,53,22,115,169,219,205,113,63,17,134,49,139,100,
+    24,250,169,48,140,18,145,105,212,27,97,8,84,250,220,211,
+    120,107,88,154,74,147,71,250,185,18,41,27,90,103,50,14,
+    252,50,206,162,194,91,59,100,218,126,37,167,248,134,158,221,
+    180,134,183,120,154,181,254,122,1,151,210,35,131,127,139,92,
+    60,130,159,109,129,24,92,60,39,215,239,14,182,79,22,110,
+    29,215,110,156,204,206,15,130,97,237,126,99,108,72,74,49,
+    88,199,199,44,151,12,237,102,213,79,70,203,75,41,51,44,
+    178,190,182,1,221,20,252,15,81,228,113,88,229,108,226,73,
+    49,225,83,243,24,32,197,194,91,32,134,85,74,233,176,77,
+    9,93,56,38,243,197,119,120,251,1,133,106,255,138,143,226,
+    39,30,191,254,227,202,43,253,6,101,142,78,97,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/StaticInstFlags.py",
+    "m5.objects.StaticInstFlags",
+    embedded_module_data,
+    621,
+    1020);
+
+} // anonymous namespace
+} // namespace gem5
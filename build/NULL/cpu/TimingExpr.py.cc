@@ -0,0 +1,157 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,189,88,75,111,27,201,17,238,33,135,175,153,225,67,
+    18,69,81,15,91,19,217,134,69,239,138,182,101,173,14,198,
+    198,65,108,9,43,10,90,41,17,37,39,16,130,48,20,103,
+    40,49,33,135,218,158,161,33,19,62,240,144,195,98,17,96,
+    125,139,115,202,98,15,11,56,123,202,61,63,130,20,24,136,
+    152,147,128,156,114,147,96,157,124,74,87,147,243,224,12,25,
+    237,26,246,242,81,253,168,234,238,234,234,175,171,106,230,63,
+    200,246,241,245,202,55,139,12,66,127,69,18,146,152,50,218,
+    129,210,83,102,42,158,61,15,131,60,232,51,36,121,255,140,
+    36,86,246,124,231,69,232,123,175,49,120,207,75,121,62,194,
+    243,203,94,7,143,165,188,0,225,5,101,214,193,243,81,94,
+    136,240,56,215,56,63,229,241,132,39,184,120,1,202,11,19,
+    94,196,197,11,82,94,148,240,98,114,200,193,227,40,111,132,
+    240,70,93,227,120,202,27,35,188,184,139,39,80,222,56,225,
+    37,92,188,176,52,145,69,169,228,127,161,145,98,116,230,14,
+    33,161,108,169,178,181,255,71,185,160,21,236,70,102,12,35,
+    95,71,96,100,25,237,49,18,218,243,144,191,87,98,246,88,
+    201,179,231,147,188,123,126,137,37,19,250,116,110,167,84,41,
+    41,7,171,199,71,248,237,104,225,168,118,87,163,237,156,76,
+    58,210,135,135,245,216,129,92,249,228,225,67,75,106,103,51,
+    21,208,131,185,156,146,175,200,185,156,206,229,114,149,170,84,
+    43,67,93,200,229,190,168,229,203,61,14,171,61,63,146,117,
+    174,112,124,156,59,148,243,146,140,245,16,212,11,229,188,170,
+    234,193,252,190,170,225,124,65,123,141,222,128,178,111,199,85,
+    92,184,11,235,91,43,165,143,158,99,63,225,81,114,151,252,
+    213,57,66,26,230,183,195,79,52,86,58,35,183,26,235,157,
+    216,92,35,211,137,142,53,214,224,139,99,198,160,62,187,24,
+    198,124,179,217,111,23,134,216,5,89,118,145,3,223,4,209,
+    128,143,196,126,71,44,251,189,97,93,180,23,2,40,238,113,
+    146,159,216,49,160,143,88,122,111,148,52,25,231,203,245,107,
+    189,138,184,188,36,238,151,52,177,166,168,165,3,69,150,196,
+    103,249,114,77,198,1,50,73,125,194,105,94,99,112,184,220,
+    27,76,133,11,30,155,38,158,222,102,222,196,233,70,94,48,
+    47,80,206,100,190,64,89,244,154,217,36,240,240,209,145,41,
+    143,206,170,114,185,136,19,96,64,24,42,138,120,132,20,58,
+    167,202,90,238,40,143,243,21,181,62,227,82,32,109,113,127,
+    1,107,69,168,233,59,227,83,95,178,127,225,136,169,191,228,
+    169,153,55,83,60,6,115,225,16,16,14,230,13,228,114,82,
+    181,144,203,97,30,186,4,32,97,232,247,253,10,102,211,253,
+    187,25,69,91,94,162,250,224,36,144,40,16,122,102,160,23,
+    30,51,200,50,104,156,233,63,114,246,118,147,189,125,198,95,
+    55,15,62,213,200,156,9,35,95,111,124,181,241,106,182,37,
+    164,218,66,170,177,122,206,122,124,241,115,228,38,221,85,198,
+    156,200,48,111,76,194,141,12,15,65,134,151,156,48,171,243,
+    150,141,238,213,133,39,85,229,153,172,148,100,69,19,239,97,
+    15,181,132,207,97,9,60,5,36,49,96,139,215,13,178,2,
+    91,156,116,108,49,209,100,19,103,66,184,177,10,223,238,168,
+    235,63,45,152,99,214,86,179,184,176,45,31,212,63,222,38,
+    87,88,204,139,106,181,134,11,178,136,229,131,146,74,112,34,
+    22,113,181,34,106,135,178,88,168,97,12,198,40,41,228,94,
+    83,104,39,156,208,238,77,245,81,73,145,228,99,34,168,85,
+    169,180,72,110,62,76,168,138,213,34,157,138,212,69,194,195,
+    100,197,31,135,123,60,78,42,175,9,242,233,10,175,61,120,
+    2,108,119,195,1,124,10,186,250,180,83,47,27,224,179,32,
+    53,105,28,217,230,107,39,196,187,7,219,15,111,60,13,24,
+    15,238,246,238,56,93,117,32,188,69,131,172,131,94,235,142,
+    179,95,110,178,203,103,252,53,19,222,243,93,120,111,126,181,
+    217,156,94,107,9,153,182,144,185,18,223,226,80,176,28,191,
+    39,176,200,220,16,73,159,67,146,151,252,4,86,130,20,32,
+    176,10,234,97,155,151,145,181,250,248,227,114,181,240,39,56,
+    117,73,38,81,1,231,181,82,85,81,187,224,25,115,249,69,
+    50,32,9,65,73,86,85,16,19,139,85,76,188,170,34,17,
+    190,90,143,238,87,165,231,162,197,46,120,109,90,153,184,153,
+    27,132,27,15,105,153,10,155,40,34,110,211,39,201,69,69,
+    213,89,152,53,229,237,98,233,14,144,143,224,224,188,20,80,
+    118,68,37,251,148,181,193,105,31,228,199,145,221,127,198,147,
+    164,8,217,221,104,248,7,96,76,231,159,146,96,95,197,212,
+    145,118,67,227,29,3,122,84,171,129,128,155,55,200,111,65,
+    143,63,56,0,55,219,100,103,207,248,41,19,112,183,0,112,
+    19,167,194,220,137,48,215,188,241,243,150,240,168,45,60,106,
+    172,118,248,216,41,63,125,194,79,55,103,22,90,124,186,205,
+    167,27,43,231,172,23,112,231,38,221,197,231,135,194,240,131,
+    248,44,27,184,182,229,98,125,246,41,68,63,0,87,94,220,
+    175,214,20,73,84,107,251,11,22,66,134,192,12,134,198,44,
+    41,145,122,146,119,240,66,24,176,134,111,162,65,174,39,217,
+    183,156,13,40,95,160,62,191,131,111,13,56,205,180,65,14,
+    209,0,247,145,106,178,41,215,105,246,220,199,66,75,72,183,
+    133,244,149,238,35,237,60,55,99,247,142,240,120,64,178,247,
+    111,105,136,36,246,247,234,130,181,171,173,163,84,92,15,107,
+    102,251,151,146,100,111,102,107,251,122,196,106,238,126,94,43,
+    247,181,87,74,207,236,237,172,131,159,5,254,168,77,254,137,
+    92,42,67,95,212,234,91,133,60,212,46,180,89,213,186,125,
+    99,182,129,27,228,144,119,14,243,138,158,176,117,126,70,226,
+    14,137,108,180,223,38,156,29,36,156,181,11,199,172,254,12,
+    201,13,176,102,223,51,89,191,207,34,138,164,11,86,115,11,
+    235,113,219,172,165,186,156,81,30,151,52,85,159,178,247,30,
+    40,171,199,154,172,72,15,22,119,170,203,75,125,211,237,171,
+    155,41,214,153,136,177,36,1,84,157,248,185,111,144,103,128,
+    159,217,62,252,156,123,198,5,255,57,50,72,99,5,190,221,
+    177,247,135,94,230,247,22,83,2,223,112,3,37,255,127,76,
+    177,193,110,87,169,71,118,149,60,126,46,86,143,72,10,75,
+    28,101,247,146,143,58,47,249,174,162,7,13,17,157,123,191,
+    81,195,83,61,210,189,121,124,96,68,140,13,32,159,163,129,
+    17,99,194,174,146,205,15,252,13,89,1,99,52,78,34,69,
+    160,51,150,32,69,240,199,6,140,110,100,184,111,234,225,55,
+    148,25,24,40,214,12,242,53,172,255,123,212,239,90,146,77,
+    54,121,198,79,154,174,229,38,113,45,161,200,105,104,250,36,
+    52,253,106,189,21,186,221,14,221,110,60,238,112,209,83,110,
+    234,132,155,122,245,105,139,155,111,115,243,141,39,87,132,137,
+    181,161,200,250,246,39,71,214,80,73,191,67,82,128,87,13,
+    228,161,60,72,48,24,178,135,158,199,37,165,30,37,196,141,
+    66,87,168,33,82,24,158,110,234,145,141,181,172,45,119,169,
+    71,182,251,218,5,214,166,137,137,202,123,232,74,84,122,73,
+    203,140,92,22,70,189,20,11,58,91,150,139,154,238,195,165,
+    131,67,141,248,14,11,172,191,6,178,77,136,10,11,139,67,
+    147,28,162,191,13,179,255,128,1,51,200,142,217,94,146,227,
+    126,100,140,188,43,116,77,213,6,226,119,203,32,127,7,93,
+    84,212,143,223,201,38,59,233,12,141,3,240,107,229,57,31,
+    183,248,133,54,191,64,6,8,35,167,194,204,137,48,211,188,
+    102,139,161,44,160,216,77,186,250,128,22,31,28,212,63,44,
+    5,231,134,74,58,65,205,83,80,11,61,80,219,28,107,166,
+    88,31,207,20,23,200,179,153,178,32,151,85,249,42,255,74,
+    228,227,133,42,73,205,33,161,183,35,59,170,97,146,147,217,
+    58,98,197,60,204,247,1,193,174,179,160,137,30,132,149,65,
+    55,61,68,151,132,170,129,250,167,64,126,3,132,102,200,3,
+    80,63,97,223,155,13,244,255,66,22,232,123,104,79,138,164,
+    8,119,38,231,72,17,121,55,127,237,119,43,53,16,239,59,
+    6,249,39,168,161,161,65,137,125,191,191,182,192,189,216,226,
+    31,180,249,7,132,27,141,159,70,103,79,162,179,77,241,126,
+    43,186,216,142,46,54,214,58,177,241,211,152,120,18,19,155,
+    63,123,208,138,45,181,99,75,141,204,21,128,223,161,123,140,
+    232,161,202,39,233,174,109,116,129,84,205,55,148,152,53,119,
+    70,223,239,208,55,32,34,50,30,79,32,231,212,217,85,165,
+    86,233,94,121,26,138,182,204,77,246,111,252,109,240,211,238,
+    43,199,71,248,119,168,251,246,70,253,55,161,231,94,134,97,
+    206,215,24,196,36,155,104,162,251,235,160,185,102,255,239,60,
+    206,50,160,185,139,188,156,188,128,226,210,234,141,240,80,115,
+    147,87,220,5,20,151,86,239,140,151,137,144,152,230,34,205,
+    209,27,23,80,94,90,221,194,144,73,95,214,93,147,134,161,
+    230,38,47,215,47,160,184,180,122,197,97,115,174,187,230,76,
+    48,36,185,115,147,151,75,23,80,92,90,189,139,195,86,127,
+    232,90,61,10,53,55,129,213,163,32,105,246,222,28,38,249,
+    208,41,105,18,122,236,255,3,12,36,90,151,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/TimingExpr.py",
+    "m5.objects.TimingExpr",
+    embedded_module_data,
+    2124,
+    6213);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,100 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,85,75,111,219,70,16,94,74,162,94,150,77,201,
+    145,173,186,110,11,86,65,218,170,15,187,45,16,167,21,138,
+    180,137,227,71,30,178,141,216,9,90,245,192,210,228,202,146,
+    77,106,149,93,202,177,24,160,208,193,7,35,151,20,190,56,
+    199,156,12,4,249,51,10,224,131,176,167,0,61,245,38,195,
+    57,229,212,89,74,114,232,71,211,136,171,225,112,230,219,157,
+    111,103,63,137,127,35,223,71,238,221,143,238,130,217,67,38,
+    50,37,11,217,82,81,146,132,31,176,2,118,176,24,244,252,
+    160,21,90,233,222,229,222,61,188,130,2,104,14,153,161,109,
+    100,202,88,218,15,34,244,34,216,95,184,24,49,195,203,40,
+    23,249,71,60,228,36,30,185,174,51,60,189,116,15,92,249,
+    246,166,125,191,0,142,244,165,225,231,18,234,115,249,83,18,
+    92,48,42,74,38,42,6,224,27,52,165,98,200,12,20,101,
+    51,88,12,227,136,168,184,15,192,23,199,83,139,81,28,51,
+    229,51,209,56,68,195,103,162,3,16,141,156,137,38,240,224,
+    179,33,116,206,199,12,154,209,253,0,96,3,199,88,229,63,
+    177,49,51,126,10,155,124,7,118,224,20,54,245,14,108,226,
+    20,118,24,176,23,206,197,14,154,67,167,176,105,192,142,156,
+    139,85,204,228,41,236,168,153,130,115,27,230,113,113,96,112,
+    82,112,102,174,98,212,234,147,27,155,246,228,42,196,38,202,
+    101,55,185,134,237,203,249,252,91,200,138,33,249,150,21,190,
+    80,194,81,24,121,170,146,96,197,128,59,121,163,110,215,84,
+    167,140,213,74,213,193,180,170,91,42,115,116,7,171,164,164,
+    222,190,95,80,29,34,158,171,166,78,77,149,212,157,137,133,
+    231,66,56,33,134,173,18,19,43,170,111,198,24,53,38,251,
+    92,222,22,159,168,53,120,200,132,197,93,197,23,20,129,239,
+    96,26,139,129,105,162,78,24,197,6,119,66,71,130,223,255,
+    147,93,224,41,221,33,118,197,208,170,164,106,232,70,185,82,
+    93,163,98,161,231,18,15,26,22,235,18,162,3,96,249,128,
+    141,109,66,27,154,77,76,236,142,250,24,248,226,83,130,72,
+    212,35,242,74,201,182,148,44,29,124,63,30,179,94,85,154,
+    20,243,125,53,135,40,126,80,175,80,172,9,110,152,185,99,
+    190,178,39,83,121,49,51,210,171,156,222,169,191,111,225,149,
+    243,11,167,88,189,86,35,212,209,28,125,3,107,100,19,83,
+    247,35,95,237,51,217,171,254,242,23,118,28,175,188,251,199,
+    61,134,213,26,166,37,181,68,168,186,166,131,40,40,116,216,
+    211,67,133,57,21,131,169,37,74,108,79,44,107,117,204,28,
+    21,116,161,214,40,217,172,152,39,112,223,80,108,129,132,76,
+    181,84,175,26,78,133,128,168,42,78,5,179,89,247,83,81,
+    194,32,186,133,153,1,249,66,225,230,162,250,197,204,175,75,
+    51,119,111,22,102,22,86,174,221,201,185,147,199,44,240,38,
+    174,58,170,224,91,178,200,67,152,86,23,10,101,167,39,228,
+    174,89,15,245,6,83,89,163,106,0,55,138,117,19,176,0,
+    221,114,152,74,170,42,44,66,27,147,120,171,226,240,208,247,
+    115,243,174,155,158,39,192,221,176,136,177,1,27,130,115,193,
+    85,163,177,214,109,123,231,103,119,120,186,97,88,88,101,6,
+    176,84,75,186,225,16,186,144,203,240,168,166,85,117,27,107,
+    26,143,107,66,61,117,75,248,9,77,123,80,215,173,94,38,
+    228,52,106,152,199,141,173,45,173,12,52,48,229,49,225,27,
+    150,206,24,143,234,171,204,161,176,158,23,44,96,167,76,76,
+    154,240,180,234,1,236,110,100,88,28,112,90,152,81,145,147,
+    151,116,170,219,60,116,157,16,139,71,234,12,47,65,59,120,
+    18,156,233,126,27,69,23,185,210,75,45,246,218,197,19,186,
+    215,150,101,232,202,202,52,151,167,197,118,121,180,12,91,159,
+    133,61,115,121,214,34,186,195,227,94,192,219,100,87,90,66,
+    9,158,168,104,164,111,190,18,106,249,68,18,106,233,95,237,
+    129,76,243,70,59,149,109,222,106,39,179,205,155,109,229,66,
+    115,254,149,60,212,9,4,228,193,14,2,115,24,68,97,101,
+    251,183,110,32,138,194,169,78,64,146,47,118,16,24,145,74,
+    109,255,222,13,132,123,169,17,145,26,241,165,70,142,83,105,
+    145,74,251,82,105,72,41,233,39,235,143,215,219,209,4,4,
+    98,95,31,202,33,37,252,26,129,105,206,117,226,232,131,143,
+    247,220,93,247,217,165,86,238,206,203,76,225,32,83,104,133,
+    210,237,209,241,189,245,93,152,49,216,82,126,57,12,6,50,
+    128,7,211,92,132,197,210,99,123,249,221,188,151,202,67,42,
+    45,82,233,112,243,14,16,79,142,60,121,244,248,209,211,169,
+    214,197,31,95,42,249,3,37,223,156,111,167,70,247,198,119,
+    199,159,46,183,178,83,47,83,87,14,82,87,154,183,196,213,
+    109,157,104,216,66,46,202,135,237,203,19,100,117,29,27,14,
+    155,232,189,101,169,248,61,243,164,47,225,189,115,169,120,197,
+    242,24,132,107,226,168,65,40,194,165,100,171,193,19,224,45,
+    87,236,69,15,222,61,144,147,135,244,38,250,83,87,138,87,
+    233,183,189,63,13,182,45,100,28,148,36,169,51,47,33,233,
+    243,22,250,204,63,218,40,219,58,57,218,40,211,234,143,54,
+    26,109,245,71,27,125,216,234,143,78,248,146,244,67,7,157,
+    53,127,101,14,197,237,245,57,41,143,229,191,75,108,58,101,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/kvm/BaseKvmCPU.py",
+    "m5.objects.BaseKvmCPU",
+    embedded_module_data,
+    1216,
+    2264);
+
+} // anonymous namespace
+} // namespace gem5
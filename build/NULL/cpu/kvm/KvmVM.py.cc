@@ -0,0 +1,59 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,82,189,111,211,64,20,191,243,23,118,62,42,62,
+    210,22,132,16,22,67,37,119,72,166,46,21,170,212,130,128,
+    128,210,86,4,101,136,42,89,174,239,72,90,124,113,56,59,
+    81,28,49,120,96,64,44,140,48,48,116,170,132,248,103,2,
+    66,194,186,9,137,137,45,85,59,49,113,103,215,81,65,225,
+    238,221,239,189,211,123,119,191,223,59,221,79,112,97,168,231,
+    254,116,131,195,123,128,0,130,30,120,150,121,152,122,201,147,
+    136,220,150,33,144,192,67,128,228,215,0,41,88,62,150,1,
+    248,44,231,151,180,21,164,54,129,165,253,18,27,11,50,184,
+    202,193,104,30,144,157,253,67,236,134,238,69,66,37,39,124,
+    149,18,98,208,134,8,180,37,190,100,4,249,69,82,91,197,
+    218,209,37,48,103,116,56,253,177,196,137,165,25,177,142,141,
+    163,194,188,90,92,60,44,229,49,82,254,57,85,206,228,50,
+    245,201,144,180,26,227,178,219,31,212,94,12,73,109,72,170,
+    221,238,184,216,193,100,109,125,61,203,153,4,19,159,70,38,
+    117,122,29,28,152,207,125,106,186,190,227,225,192,197,200,108,
+    52,234,59,227,27,65,20,132,152,152,97,247,32,48,91,13,
+    115,31,123,126,175,19,152,161,191,109,45,48,221,182,123,14,
+    193,182,205,10,182,77,124,52,240,68,92,178,237,151,3,199,
+    59,207,40,97,212,199,172,224,142,70,118,23,59,8,83,102,
+    136,216,245,156,32,96,197,22,127,65,159,238,58,212,33,204,
+    216,68,136,62,21,82,88,121,38,67,168,96,106,86,160,53,
+    83,49,76,227,91,220,11,153,236,244,34,166,101,10,63,129,
+    83,209,253,239,74,64,221,90,222,114,218,101,181,31,81,141,
+    167,82,176,248,10,118,57,196,179,153,20,175,198,247,147,43,
+    102,252,56,185,124,43,174,255,168,220,254,94,177,190,86,172,
+    68,47,76,74,213,19,89,90,212,206,0,135,184,49,213,193,
+    194,181,119,123,111,247,62,172,124,92,157,172,108,126,41,111,
+    125,43,111,197,15,196,164,75,57,197,182,165,50,131,172,85,
+    251,66,115,192,116,17,82,127,20,177,18,143,102,223,134,42,
+    121,61,93,20,144,30,95,22,29,232,119,179,151,220,160,55,
+    249,22,10,193,125,14,83,25,66,56,125,4,1,188,62,1,
+    203,153,37,96,105,146,91,2,238,76,254,182,169,102,192,123,
+    112,10,230,227,155,250,73,234,207,254,147,79,21,253,1,255,
+    33,215,64,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/kvm/KvmVM.py",
+    "m5.objects.KvmVM",
+    embedded_module_data,
+    547,
+    846);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,810 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,213,125,11,116,27,87,118,216,128,4,65,252,73,16,
+    0,9,128,32,9,82,148,72,200,18,245,181,45,82,18,37,
+    145,20,127,34,33,217,162,214,187,236,118,185,32,103,68,194,
+    6,1,122,0,90,38,154,100,145,100,147,163,85,210,88,85,
+    63,98,213,180,102,221,173,215,238,110,79,79,154,230,108,218,
+    244,147,166,159,211,246,244,36,3,23,141,153,233,79,109,250,
+    9,219,164,33,107,54,77,153,166,238,189,239,205,96,6,243,
+    129,40,119,189,57,17,161,59,131,119,239,188,121,159,251,238,
+    187,247,190,251,30,126,157,81,253,107,144,174,159,188,111,101,
+    152,199,12,203,176,150,52,179,106,153,183,88,240,190,46,93,
+    55,71,175,245,210,213,58,199,212,49,19,12,91,255,117,134,
+    181,114,13,239,215,51,204,183,235,229,204,230,109,4,215,0,
+    56,155,14,215,72,112,141,128,179,115,118,13,206,65,112,14,
+    192,57,57,139,6,231,36,56,23,224,220,156,83,131,115,17,
+    156,7,112,94,93,158,110,130,107,2,92,51,231,214,224,60,
+    4,231,3,92,139,238,57,47,193,249,1,23,224,188,26,92,
+    19,193,5,1,215,170,195,53,19,92,27,224,66,58,156,143,
+    224,194,128,139,232,222,215,66,112,237,128,139,234,158,243,19,
+    92,7,224,58,185,22,13,46,64,112,93,128,139,233,242,12,
+    18,92,55,224,122,116,207,181,18,220,17,192,245,114,173,26,
+    92,27,193,29,5,220,49,29,46,68,112,125,128,235,231,252,
+    26,92,152,224,226,128,59,206,5,53,184,8,193,189,0,184,
+    19,186,114,182,19,220,73,192,13,112,97,13,46,74,112,167,
+    0,119,154,139,104,112,29,4,119,6,112,103,117,184,78,130,
+    59,7,184,243,92,187,6,215,69,112,47,2,238,37,29,46,
+    70,112,47,3,238,2,23,213,224,186,9,110,16,112,67,58,
+    92,15,193,93,4,220,37,93,255,29,33,184,203,128,27,230,
+    142,104,112,189,4,119,5,112,87,117,184,163,4,119,13,112,
+    35,186,254,59,70,112,163,128,27,211,181,117,31,193,93,7,
+    220,184,174,126,253,4,55,1,184,73,221,251,226,4,55,5,
+    184,105,174,95,131,59,78,112,55,0,55,195,197,53,184,23,
+    8,110,22,112,9,238,152,6,119,130,224,110,2,238,22,215,
+    167,193,157,36,184,87,0,247,170,238,125,3,4,119,27,112,
+    115,186,247,157,98,239,220,102,226,95,216,193,47,113,139,232,
+    25,77,103,151,222,224,216,155,139,175,115,75,121,72,176,28,
+    95,98,84,255,234,164,235,39,173,12,10,55,142,153,183,176,
+    204,124,221,50,8,185,247,44,243,245,108,29,100,86,47,58,
+    71,248,100,102,105,101,110,99,141,139,219,69,123,34,75,191,
+    139,182,87,185,252,58,159,17,157,163,201,116,122,44,197,195,
+    43,68,55,222,79,101,88,250,205,73,83,71,179,25,86,116,
+    211,251,59,153,37,242,77,166,33,56,175,252,141,98,19,31,
+    90,69,251,194,66,38,185,202,45,44,136,206,133,133,213,44,
+    187,158,198,123,247,194,194,155,235,201,180,132,177,190,149,76,
+    231,62,100,62,193,42,28,116,229,248,165,83,75,107,235,167,
+    214,120,142,61,69,139,120,11,110,83,75,249,44,63,176,182,
+    193,219,128,138,128,1,248,159,235,2,80,172,252,237,214,57,
+    220,182,93,70,6,197,49,252,227,131,242,19,159,161,209,188,
+    115,73,126,153,203,223,226,179,111,165,88,142,143,91,177,225,
+    104,154,88,63,50,55,34,214,191,122,237,182,104,151,43,158,
+    224,155,240,101,1,4,228,181,152,57,31,146,193,69,163,34,
+    55,96,105,101,160,46,114,72,91,100,171,92,228,31,168,42,
+    50,252,175,103,45,243,86,182,110,190,129,179,109,53,50,6,
+    255,56,251,235,14,249,158,173,127,31,42,255,109,185,1,96,
+    90,50,123,138,181,178,13,26,90,39,107,131,134,105,20,155,
+    40,215,92,99,89,254,118,62,185,244,70,161,127,153,91,125,
+    113,104,104,145,244,216,194,26,237,178,84,54,51,52,164,165,
+    108,170,116,47,159,204,13,172,172,28,248,18,235,171,139,28,
+    31,203,222,141,229,87,120,46,201,230,118,154,225,93,133,160,
+    146,14,173,28,227,50,121,62,197,229,18,113,23,143,104,222,
+    135,160,5,128,104,205,3,83,139,142,165,183,223,94,88,74,
+    39,115,57,209,137,183,43,144,19,199,139,13,183,146,124,114,
+    85,180,223,201,228,82,203,25,142,21,109,144,0,121,137,206,
+    204,250,234,28,125,31,185,191,78,243,215,246,94,167,12,198,
+    176,247,38,171,122,111,219,21,45,142,109,55,15,21,167,182,
+    125,61,197,233,167,190,214,199,157,143,58,183,108,229,216,25,
+    225,220,120,201,55,81,246,77,20,167,183,165,228,58,161,247,
+    98,201,119,169,236,187,84,156,198,63,250,146,78,211,110,158,
+    51,237,102,182,126,222,198,53,110,217,13,187,218,241,186,83,
+    233,64,93,247,53,64,247,217,196,22,73,24,16,78,30,89,
+    191,123,151,227,11,47,152,246,160,1,177,210,137,139,249,69,
+    232,196,57,30,249,58,241,161,182,111,248,110,4,61,8,142,
+    96,87,217,147,139,185,60,159,92,202,243,189,152,118,20,193,
+    49,4,125,140,126,224,28,151,193,44,54,253,160,166,233,187,
+    176,233,47,75,77,191,221,228,47,78,154,180,191,210,214,199,
+    77,219,250,3,211,182,54,29,28,245,186,214,181,155,210,54,
+    176,182,195,14,58,206,249,186,171,242,92,163,230,41,23,107,
+    135,254,115,136,142,219,169,213,181,52,7,18,168,208,99,218,
+    109,10,77,107,165,183,114,36,109,129,118,218,14,211,92,61,
+    204,128,86,30,102,124,12,222,87,232,184,157,42,112,116,96,
+    114,4,155,79,46,231,78,196,82,153,216,98,42,159,59,232,
+    83,30,197,239,177,124,54,150,91,73,221,205,3,1,244,242,
+    58,41,71,46,182,184,145,136,187,107,243,133,138,27,250,145,
+    77,26,225,61,35,144,35,225,13,209,141,217,221,198,140,175,
+    173,230,181,76,50,32,131,47,32,147,36,53,76,210,138,76,
+    114,30,153,36,174,140,79,171,112,236,114,201,55,92,246,13,
+    3,227,120,253,239,100,30,100,54,95,21,186,175,150,188,215,
+    202,222,107,197,137,109,127,232,241,240,163,225,109,187,183,108,
+    111,23,58,198,247,234,235,2,182,125,6,64,113,6,255,232,
+    219,7,76,153,233,115,28,184,62,121,170,169,76,138,133,227,
+    166,12,160,167,13,84,24,33,37,225,148,177,203,191,192,232,
+    135,224,121,25,44,50,6,67,176,19,91,247,18,182,110,223,
+    97,135,224,121,211,86,123,223,242,185,14,193,122,221,92,134,
+    67,208,105,72,107,211,15,60,83,90,59,235,208,208,186,77,
+    105,157,172,75,67,235,49,165,117,179,30,13,173,183,70,121,
+    189,26,218,38,83,218,38,182,89,67,219,92,163,110,62,13,
+    173,143,109,1,62,244,139,109,84,184,232,57,236,244,51,196,
+    145,254,137,118,173,112,82,179,102,33,60,153,204,173,196,104,
+    118,177,53,249,161,216,196,228,171,18,106,45,153,95,137,173,
+    164,114,144,186,1,226,9,231,168,220,14,3,188,84,232,30,
+    77,46,129,216,202,65,66,236,46,60,35,231,171,100,179,131,
+    21,43,180,191,150,220,48,163,160,98,176,83,46,181,244,130,
+    216,18,201,25,132,20,145,123,59,168,186,23,206,64,149,222,
+    74,101,215,115,74,54,82,113,80,46,174,231,56,242,10,117,
+    113,11,159,130,86,148,194,214,73,166,99,139,100,98,141,229,
+    214,146,75,28,17,164,64,1,133,95,227,150,214,211,201,124,
+    234,45,174,234,209,129,216,20,17,202,64,2,218,76,108,85,
+    75,75,27,140,195,178,196,238,166,83,203,43,121,34,194,229,
+    118,90,74,102,50,217,124,108,145,139,65,57,179,111,65,54,
+    236,64,236,54,135,68,41,82,220,100,38,150,92,91,227,179,
+    107,124,42,153,231,98,160,162,175,35,45,190,130,228,143,153,
+    141,222,186,179,150,90,227,210,169,12,23,99,185,53,40,28,
+    212,47,9,239,88,94,145,30,224,6,150,7,98,103,95,124,
+    9,115,92,77,190,193,197,82,249,88,223,122,38,157,90,77,
+    229,57,182,111,96,199,67,218,191,210,186,208,171,177,76,213,
+    148,194,159,6,138,68,188,229,16,211,135,104,29,201,102,211,
+    98,147,220,250,200,29,144,161,232,87,39,80,37,38,71,166,
+    26,156,87,40,6,106,158,83,190,33,59,40,217,204,37,151,
+    113,18,20,91,228,132,91,208,13,51,92,102,57,191,34,6,
+    85,77,174,74,174,60,11,175,39,179,216,89,70,47,89,95,
+    146,193,27,240,63,247,159,152,106,201,218,139,146,117,4,37,
+    235,0,204,91,173,237,143,95,127,244,250,86,64,232,27,41,
+    181,142,150,91,71,139,55,183,35,93,239,30,127,114,124,107,
+    78,120,97,188,20,153,40,71,38,4,107,155,52,113,109,29,
+    17,250,166,75,254,27,101,255,141,226,140,156,214,45,28,29,
+    41,249,71,203,254,81,72,131,12,51,143,50,91,175,10,241,
+    169,82,235,116,185,117,26,50,12,119,190,219,249,164,115,219,
+    238,16,92,195,48,227,69,112,198,139,216,4,107,235,174,141,
+    233,232,121,55,241,36,177,109,119,237,214,213,59,166,45,123,
+    13,182,14,64,3,16,172,225,93,47,211,22,149,179,27,47,
+    181,78,148,91,39,32,59,229,181,137,146,255,102,217,127,83,
+    61,119,98,189,141,103,129,175,154,206,2,159,125,238,52,123,
+    202,64,45,115,1,173,219,144,182,145,181,235,100,119,227,150,
+    215,136,182,142,225,154,222,135,235,183,149,167,181,115,68,51,
+    60,235,51,121,214,167,121,214,169,121,182,5,158,245,155,60,
+    27,208,60,171,157,111,130,172,27,228,183,71,108,210,152,214,
+    53,212,200,17,36,186,147,73,229,85,106,228,34,194,133,117,
+    72,172,232,15,252,5,4,56,92,199,147,175,67,39,190,202,
+    189,185,14,131,32,167,168,142,89,16,13,121,34,4,121,98,
+    18,230,64,202,176,138,176,148,69,214,64,108,28,229,72,38,
+    201,190,5,9,28,27,187,203,103,51,249,147,28,208,82,129,
+    7,18,42,147,141,101,241,75,236,94,18,132,254,10,74,43,
+    242,14,124,1,188,231,141,76,246,30,38,83,161,39,77,30,
+    220,219,32,252,136,64,196,196,187,41,62,7,114,62,13,210,
+    22,94,184,206,99,110,40,69,79,208,242,222,186,19,203,112,
+    28,155,83,229,86,201,8,173,205,138,68,195,244,37,152,39,
+    176,6,104,165,102,215,56,62,73,244,222,129,216,28,10,211,
+    84,230,110,22,139,156,205,164,55,98,201,183,146,169,116,114,
+    49,205,97,165,86,229,166,25,136,205,100,239,145,10,130,72,
+    205,145,201,7,164,50,155,202,44,199,86,137,232,6,57,13,
+    243,7,139,47,77,177,160,160,167,238,110,168,154,171,16,25,
+    145,10,70,39,39,105,38,233,135,156,227,133,51,212,252,142,
+    37,193,254,230,114,57,152,86,192,6,63,129,147,34,230,150,
+    184,51,51,131,87,54,149,35,165,130,26,12,20,198,167,170,
+    187,68,153,13,77,159,211,78,156,88,255,68,188,245,25,82,
+    251,4,83,165,249,43,118,32,145,151,232,45,17,189,188,196,
+    70,80,153,201,84,158,154,132,168,121,139,245,96,195,16,227,
+    89,172,231,147,57,170,168,162,88,81,4,181,194,226,90,217,
+    123,93,6,63,10,255,115,255,146,49,176,233,101,155,161,150,
+    86,107,36,227,182,131,145,199,243,143,230,183,237,158,221,186,
+    6,199,36,136,74,123,43,136,74,0,197,196,110,128,113,53,
+    127,236,236,249,200,217,179,53,184,53,248,23,47,126,243,162,
+    112,122,166,228,156,45,59,103,139,163,219,206,166,143,157,93,
+    31,57,187,182,237,109,247,155,74,246,112,217,30,22,218,19,
+    32,138,93,40,138,93,182,226,40,72,226,72,215,199,225,211,
+    31,133,79,111,219,187,4,123,87,201,222,93,182,119,239,214,
+    89,28,93,123,13,86,20,217,86,34,178,233,135,214,24,235,
+    105,44,107,121,230,251,109,244,178,141,32,125,236,98,227,76,
+    118,41,153,30,185,85,136,153,74,29,153,66,145,57,103,65,
+    31,88,72,99,50,49,93,65,162,31,180,201,230,41,73,86,
+    105,109,40,139,14,154,113,238,141,193,120,132,1,186,158,201,
+    115,124,34,238,60,172,25,42,182,144,44,43,242,145,168,0,
+    110,146,54,154,231,201,164,174,225,169,27,50,216,66,158,26,
+    215,240,84,0,121,234,172,108,135,210,169,246,3,171,48,48,
+    81,10,79,150,195,147,208,89,42,102,122,185,228,191,80,246,
+    95,80,79,152,55,76,59,49,241,249,154,77,207,225,185,128,
+    124,181,102,147,211,148,86,111,54,185,158,163,12,238,26,249,
+    106,167,75,79,141,124,181,211,163,87,154,30,221,115,89,16,
+    154,201,85,144,181,192,131,71,77,185,180,138,76,97,213,124,
+    37,25,88,149,159,129,156,121,116,97,209,41,50,193,160,206,
+    155,171,226,92,197,126,1,105,186,195,196,128,123,67,50,111,
+    47,167,179,139,106,230,86,48,75,43,217,20,24,11,10,166,
+    141,112,188,130,145,248,30,68,113,211,161,253,47,55,17,220,
+    2,32,6,73,217,38,105,209,230,176,100,100,20,248,105,129,
+    170,135,134,135,38,74,99,67,244,211,2,104,104,104,162,201,
+    248,121,85,6,31,194,255,220,95,101,170,199,79,24,199,207,
+    203,207,59,126,182,163,221,168,183,126,112,94,56,147,40,69,
+    111,150,163,55,65,95,69,205,121,224,201,192,7,1,225,212,
+    84,41,50,93,142,76,163,230,28,8,63,78,60,74,108,157,
+    17,142,93,40,5,6,203,129,193,226,236,179,8,175,148,2,
+    87,203,129,171,197,89,252,163,53,193,242,27,15,211,127,198,
+    252,161,28,166,13,58,173,215,197,58,96,136,56,69,251,72,
+    106,54,203,114,192,247,221,230,170,163,76,226,87,52,199,20,
+    174,3,113,56,46,110,99,139,161,175,76,25,23,252,29,4,
+    232,201,123,30,151,225,23,17,124,9,193,60,130,63,194,232,
+    173,173,63,42,131,239,194,255,92,150,169,230,174,32,114,215,
+    57,228,174,99,192,93,159,35,127,96,9,140,249,163,80,255,
+    253,89,211,129,167,106,89,74,135,231,47,115,113,173,183,148,
+    204,197,181,195,64,92,123,141,105,151,193,154,121,207,194,186,
+    117,158,46,239,86,179,9,189,7,232,181,158,49,159,105,89,
+    244,158,177,22,83,90,31,219,162,161,245,215,200,215,175,161,
+    13,152,210,6,216,160,214,98,51,165,109,101,219,52,180,173,
+    166,180,33,54,172,161,109,51,165,141,176,237,26,218,16,208,
+    26,182,49,27,101,59,52,180,97,211,124,59,217,46,13,109,
+    164,70,25,98,26,218,118,232,231,168,17,45,244,115,183,134,
+    182,3,242,53,164,101,123,216,35,26,218,78,182,23,228,217,
+    81,209,62,119,109,226,250,72,50,199,213,144,103,21,146,160,
+    50,213,39,151,185,133,69,72,67,137,70,236,96,52,129,119,
+    176,86,133,144,178,60,82,53,193,231,118,48,30,169,16,157,
+    77,101,82,171,235,171,21,164,172,19,224,107,118,126,132,146,
+    36,223,54,37,137,219,121,172,198,14,74,1,30,165,202,14,
+    142,108,158,197,59,92,66,226,57,188,67,111,70,161,125,46,
+    185,76,159,5,243,23,159,37,190,75,90,24,200,102,72,206,
+    161,54,40,132,102,178,203,103,229,215,211,199,73,174,57,34,
+    193,11,83,128,70,255,29,82,40,205,38,175,40,17,203,63,
+    25,203,173,36,1,21,91,217,200,129,102,194,229,192,50,94,
+    148,188,2,196,26,78,193,236,144,76,243,184,210,80,136,169,
+    22,134,229,226,202,58,13,241,14,22,34,70,20,235,4,151,
+    98,64,141,42,92,185,22,75,163,85,44,187,21,193,102,197,
+    229,199,55,98,201,116,90,54,111,105,219,66,9,251,207,206,
+    74,139,192,49,150,187,155,92,79,231,227,212,255,235,187,165,
+    118,50,99,141,119,112,70,42,12,99,133,193,192,72,101,209,
+    143,161,118,93,202,238,87,120,31,84,18,140,102,210,98,96,
+    196,223,93,79,87,212,178,29,139,166,150,119,110,95,95,184,
+    54,51,183,112,51,177,144,184,86,33,75,161,103,167,16,158,
+    202,164,242,41,80,4,169,107,21,107,60,74,9,118,112,18,
+    41,244,170,151,234,12,51,234,207,197,11,103,128,161,84,229,
+    36,165,146,251,7,154,36,187,148,135,190,129,62,91,77,229,
+    164,30,44,116,124,129,35,46,119,32,231,50,216,192,172,170,
+    251,115,115,7,189,119,114,213,190,231,245,53,22,125,198,216,
+    165,149,166,77,196,187,14,61,157,87,251,1,68,111,70,173,
+    130,230,196,198,213,20,73,129,155,228,219,228,198,69,75,72,
+    23,250,125,192,8,132,18,88,254,181,20,155,95,201,137,245,
+    83,153,188,216,156,206,66,250,114,69,143,205,137,17,72,121,
+    21,125,53,68,77,1,77,23,88,82,234,127,209,47,231,34,
+    181,49,209,106,61,114,226,29,242,213,139,181,163,235,225,212,
+    60,68,7,61,22,136,96,155,32,247,59,175,98,223,223,34,
+    12,34,122,160,217,161,169,174,165,243,55,51,137,164,24,72,
+    209,254,156,147,222,240,5,236,86,209,187,94,161,32,185,184,
+    160,142,192,31,215,176,107,168,71,196,150,201,222,126,35,181,
+    86,229,123,198,151,222,33,173,174,213,123,22,100,240,75,240,
+    63,247,219,22,51,189,167,223,60,122,161,198,98,232,174,157,
+    105,109,127,252,149,71,95,217,186,38,244,93,43,5,71,202,
+    193,145,98,66,94,82,125,69,136,13,151,188,87,202,222,43,
+    197,9,57,237,182,208,83,89,102,125,26,58,242,113,232,196,
+    71,161,19,219,246,163,2,253,244,141,65,246,97,204,62,108,
+    19,172,193,93,27,19,58,242,248,107,143,190,182,109,239,22,
+    232,231,200,101,160,8,33,69,8,40,2,64,209,211,247,173,
+    206,247,208,111,141,110,144,200,94,131,181,7,221,32,61,128,
+    237,220,117,51,237,49,162,163,249,132,19,137,82,228,102,57,
+    114,179,90,71,27,41,5,70,203,129,209,226,236,211,96,4,
+    43,178,109,111,218,182,79,237,53,212,163,211,166,158,56,109,
+    156,12,144,163,101,209,35,28,27,44,249,135,202,254,161,138,
+    7,125,219,238,20,220,51,80,162,54,44,81,155,173,120,19,
+    10,4,57,73,185,79,150,2,83,229,192,20,168,138,80,140,
+    193,39,131,91,175,9,3,83,165,246,233,114,59,168,138,161,
+    109,250,74,108,187,217,82,48,81,14,38,138,137,167,45,109,
+    143,7,30,13,84,188,240,126,204,215,111,43,222,128,98,120,
+    195,31,123,58,62,242,116,108,46,10,61,215,74,158,145,178,
+    103,164,56,254,20,76,156,233,39,211,219,118,183,224,61,15,
+    15,160,95,190,142,248,229,233,135,242,2,114,128,177,222,137,
+    186,246,243,233,157,117,12,215,168,241,50,107,181,79,59,107,
+    133,57,181,65,180,162,160,40,116,212,156,79,11,205,85,115,
+    41,6,4,185,96,156,130,40,35,225,110,137,184,227,48,130,
+    3,43,40,90,49,3,237,8,248,154,12,14,112,4,160,135,
+    80,61,2,124,56,2,78,225,8,56,2,35,192,213,252,206,
+    240,131,225,205,254,205,254,63,123,252,167,143,111,173,150,92,
+    231,203,174,243,234,160,172,175,105,27,82,174,244,39,3,213,
+    13,73,98,200,160,33,235,231,27,64,65,177,190,103,153,183,
+    193,181,1,174,141,172,13,26,136,58,194,156,51,216,4,11,
+    8,248,187,152,63,200,122,38,85,132,76,227,30,50,185,243,
+    95,149,193,14,46,97,240,95,175,76,200,56,205,147,25,158,
+    62,72,0,206,227,59,184,36,177,131,113,104,144,197,143,85,
+    40,21,114,13,96,13,64,101,198,223,193,117,6,131,46,192,
+    53,43,62,141,96,21,1,218,83,252,155,8,238,49,122,219,
+    235,71,101,80,7,226,39,55,84,221,3,193,54,20,24,77,
+    40,33,124,0,66,227,2,253,88,131,219,109,83,2,253,88,
+    3,219,173,161,226,77,252,163,217,254,168,182,23,42,236,252,
+    35,117,127,40,205,236,231,241,134,233,131,8,204,205,43,167,
+    206,92,50,247,134,217,13,3,14,154,12,105,189,108,147,65,
+    16,129,25,173,214,172,242,213,160,213,6,28,180,212,160,61,
+    188,9,230,103,3,135,54,193,130,108,171,129,9,102,92,134,
+    54,54,164,53,193,216,48,140,236,136,232,153,201,102,215,148,
+    229,181,99,53,28,221,106,186,72,69,24,166,33,125,161,226,
+    218,67,235,2,199,126,161,19,85,206,156,74,213,67,58,149,
+    231,251,171,72,20,85,235,130,175,77,205,77,206,220,188,121,
+    75,86,3,11,221,138,194,137,114,118,81,246,146,147,156,80,
+    25,220,160,234,124,191,66,183,148,205,220,197,149,167,37,99,
+    114,20,51,234,108,229,192,8,13,29,170,186,18,69,42,47,
+    45,147,85,211,21,98,88,189,234,42,197,146,185,92,118,41,
+    133,138,78,42,191,49,94,104,170,210,55,179,153,130,11,19,
+    86,146,185,149,84,102,185,208,130,95,232,250,15,230,142,171,
+    111,133,30,80,195,64,173,91,162,203,129,68,205,165,239,198,
+    48,101,18,127,145,227,87,176,10,33,89,199,86,138,71,117,
+    229,157,79,17,237,147,209,216,108,68,13,159,43,244,17,21,
+    79,105,200,236,26,141,231,72,111,160,69,144,203,174,130,197,
+    2,214,33,40,192,109,135,94,123,64,213,17,123,80,102,13,
+    209,125,47,149,95,193,111,68,39,108,198,246,33,122,232,181,
+    101,142,164,180,85,82,70,43,29,165,33,157,163,1,117,162,
+    175,146,50,37,171,181,144,180,60,83,201,18,27,91,90,123,
+    3,93,244,182,210,206,162,19,190,79,210,102,22,155,224,126,
+    76,110,101,200,69,108,225,165,54,190,86,105,94,140,131,32,
+    237,133,153,227,219,68,175,42,1,202,46,54,203,173,5,95,
+    72,59,106,167,142,111,200,192,133,83,199,23,53,234,107,4,
+    39,239,11,56,121,159,164,65,18,24,132,240,138,208,63,89,
+    106,157,42,183,78,85,5,33,140,150,252,99,101,255,24,104,
+    110,109,209,199,63,244,232,135,182,146,66,124,166,212,54,91,
+    110,155,197,249,165,243,200,187,153,39,25,162,118,189,8,90,
+    84,23,106,81,93,160,69,181,163,10,218,65,30,88,20,142,
+    207,150,218,18,229,182,4,62,16,234,120,215,251,196,187,197,
+    11,47,204,150,66,137,114,40,129,51,150,148,248,166,112,124,
+    166,20,154,45,135,102,81,135,13,160,142,60,255,104,126,171,
+    65,232,187,80,10,14,150,131,131,160,85,218,24,208,244,34,
+    143,34,155,215,183,46,151,124,103,202,190,51,197,105,72,132,
+    194,97,164,71,80,232,191,84,106,189,92,110,189,12,26,165,
+    157,137,116,189,27,121,18,217,182,123,132,166,115,213,161,25,
+    118,57,246,2,170,173,196,134,72,138,229,168,16,191,84,10,
+    94,46,7,47,195,28,11,116,133,71,5,162,39,190,92,165,
+    66,211,15,109,116,108,106,227,137,245,245,154,113,25,172,117,
+    25,21,155,6,80,108,108,184,202,55,239,100,237,232,41,158,
+    119,179,206,121,15,235,130,169,164,201,196,131,228,198,184,191,
+    111,91,42,2,212,103,74,233,209,80,182,152,82,122,53,148,
+    126,83,74,189,207,47,96,74,235,211,228,26,52,165,108,209,
+    80,182,2,101,155,33,101,189,206,55,24,98,3,48,129,4,
+    69,47,209,12,111,143,46,204,16,245,176,208,87,83,139,86,
+    8,15,52,190,169,220,210,66,154,4,105,16,117,50,6,96,
+    167,157,145,125,238,196,87,132,58,44,143,129,179,227,133,136,
+    122,118,225,146,36,166,64,114,171,20,70,198,147,68,28,163,
+    93,191,148,76,83,177,144,89,38,50,53,159,205,131,88,84,
+    252,10,185,149,44,159,39,193,194,85,46,134,194,181,231,200,
+    35,157,69,132,54,11,58,11,182,170,39,56,229,101,133,224,
+    237,170,153,81,202,160,16,25,39,209,30,212,61,132,178,84,
+    133,59,61,199,175,103,150,208,97,129,207,84,71,19,102,99,
+    40,210,201,228,183,188,142,94,43,108,154,68,60,124,152,184,
+    6,162,19,191,141,224,45,4,127,140,145,181,227,13,4,5,
+    4,63,200,232,196,190,218,67,33,250,73,205,32,41,135,6,
+    17,109,58,92,152,206,44,107,210,60,21,66,121,157,154,146,
+    144,111,62,18,234,50,67,147,72,230,84,188,55,231,165,138,
+    223,146,220,22,90,225,251,68,6,47,163,240,253,175,76,181,
+    240,109,71,225,59,40,249,14,104,148,68,56,178,89,143,98,
+    48,208,10,22,175,63,8,178,182,197,95,188,65,116,247,237,
+    246,110,98,241,182,130,137,27,237,198,168,49,183,36,185,132,
+    163,215,74,173,35,229,214,145,226,77,105,229,101,219,142,22,
+    117,59,10,168,118,16,80,109,84,0,146,216,180,27,90,233,
+    167,216,218,195,165,192,149,114,224,10,88,242,84,232,11,61,
+    21,99,253,41,149,203,66,223,104,41,52,86,14,141,65,25,
+    159,170,196,225,85,83,113,136,149,55,182,246,112,77,183,150,
+    56,84,11,67,16,141,78,176,253,236,96,251,81,145,232,0,
+    145,232,156,247,130,88,108,2,81,217,44,173,57,251,171,199,
+    241,194,75,231,111,140,20,78,28,114,212,19,234,131,136,126,
+    232,19,4,6,76,32,159,237,224,54,168,212,207,187,160,106,
+    168,239,16,123,49,126,148,74,6,2,86,42,119,166,105,43,
+    223,19,80,247,236,187,67,148,138,136,47,194,181,104,254,38,
+    226,190,103,12,76,141,217,154,103,100,179,21,119,84,241,127,
+    1,193,187,8,182,16,188,135,224,47,49,122,123,246,125,25,
+    96,172,98,238,13,205,184,136,225,184,24,150,149,18,52,111,
+    159,82,243,182,165,56,241,52,16,4,254,12,69,30,230,209,
+    117,213,124,204,107,219,101,100,80,28,223,189,101,97,218,194,
+    24,218,25,69,39,85,184,29,88,252,41,14,35,120,2,88,
+    150,126,104,57,222,55,101,204,91,207,193,152,170,89,218,1,
+    76,90,97,74,96,86,55,48,107,51,235,153,247,177,94,96,
+    206,38,177,69,195,110,23,128,55,205,55,12,233,137,15,194,
+    6,172,121,129,114,38,217,97,69,28,31,191,81,207,72,30,
+    15,226,124,240,201,61,75,60,21,227,241,46,67,158,208,220,
+    125,223,248,83,115,119,129,57,76,160,178,134,3,141,88,238,
+    205,10,223,125,179,194,154,121,3,54,252,142,12,254,178,197,
+    96,73,91,217,29,117,66,207,134,173,109,200,101,237,21,46,
+    219,150,184,140,240,37,229,54,16,144,200,163,214,24,178,167,
+    12,128,71,199,44,12,8,113,213,146,246,119,180,172,168,168,
+    140,166,172,88,199,112,182,106,23,226,124,35,103,223,114,48,
+    6,255,128,214,241,12,119,163,83,114,55,54,16,111,90,161,
+    211,220,214,38,120,159,98,99,203,30,71,239,76,149,201,169,
+    223,99,168,237,71,226,211,250,97,4,100,254,70,189,89,244,
+    86,155,236,218,254,250,25,25,252,58,246,215,152,166,191,90,
+    176,191,78,99,127,245,162,35,50,120,127,232,27,151,126,242,
+    82,113,236,105,48,242,113,176,255,163,96,255,7,29,31,116,
+    124,216,245,157,46,97,104,186,20,188,81,14,222,40,38,240,
+    143,190,224,103,180,157,32,235,158,159,140,155,118,2,145,7,
+    245,32,15,172,232,175,5,121,208,128,187,59,65,30,216,64,
+    30,216,64,26,52,130,52,176,195,20,213,0,146,128,198,124,
+    180,41,3,187,218,109,97,190,235,195,228,9,254,207,49,210,
+    160,39,66,124,124,78,241,118,62,91,140,255,113,4,63,133,
+    224,29,4,15,17,60,66,240,39,17,252,41,4,127,26,193,
+    159,65,240,24,193,166,193,248,249,57,25,252,22,246,199,151,
+    53,253,161,4,224,227,210,72,91,136,24,137,93,96,16,110,
+    183,133,137,253,135,131,4,12,45,176,172,124,65,80,128,90,
+    35,24,66,223,129,131,137,140,46,212,116,182,201,24,82,43,
+    20,63,103,58,88,190,105,26,255,81,43,238,157,181,106,44,
+    13,135,121,172,187,134,210,201,185,76,34,221,109,26,74,143,
+    105,158,141,26,74,175,105,244,188,93,67,217,100,154,167,67,
+    67,217,108,90,78,167,206,114,52,203,211,165,179,28,205,202,
+    169,181,70,253,166,121,122,116,145,37,1,211,146,54,45,91,
+    116,118,102,208,52,103,173,157,217,106,90,90,173,157,217,102,
+    154,167,95,67,25,50,165,212,71,160,132,77,105,245,17,40,
+    17,83,90,125,4,74,187,41,109,19,27,209,208,70,107,148,
+    87,27,173,210,81,131,54,170,141,254,48,109,219,14,182,83,
+    67,219,197,118,129,20,140,137,129,219,121,176,90,115,249,20,
+    6,3,211,208,127,16,129,39,205,55,190,25,145,119,43,187,
+    222,20,244,194,146,140,39,123,223,94,80,60,170,234,24,10,
+    186,117,65,29,56,138,166,53,238,197,149,99,69,23,147,75,
+    111,220,75,242,172,28,225,48,113,125,114,38,150,38,155,147,
+    114,133,35,19,135,32,26,80,133,114,212,202,84,54,236,39,
+    244,209,9,96,77,223,227,112,251,66,78,254,122,152,140,122,
+    177,26,250,26,110,40,197,131,12,11,177,241,90,20,234,10,
+    72,237,103,154,163,252,222,177,195,84,224,89,185,80,47,50,
+    110,168,142,77,205,206,76,85,149,153,58,46,194,36,221,176,
+    196,93,213,37,86,50,144,139,120,249,48,69,212,231,47,63,
+    222,166,246,237,140,164,146,57,41,130,131,199,128,219,194,9,
+    53,86,138,224,192,211,24,114,43,217,52,91,9,69,145,31,
+    249,42,62,162,221,253,45,199,240,44,173,100,179,57,37,234,
+    62,71,84,248,194,41,19,106,179,119,21,206,152,60,176,118,
+    199,172,116,132,121,140,30,225,222,206,243,73,185,165,10,189,
+    170,1,25,171,140,56,165,142,247,48,106,132,232,35,133,62,
+    185,201,77,95,74,59,35,17,143,61,215,94,23,177,67,57,
+    112,98,156,186,103,42,161,214,24,126,98,93,188,151,89,228,
+    51,72,190,198,144,205,46,247,86,197,198,116,118,121,4,210,
+    69,223,226,189,215,72,93,176,116,52,110,164,62,13,233,117,
+    233,85,209,134,206,124,184,111,78,235,72,82,72,146,162,36,
+    83,72,146,210,146,144,55,0,103,136,14,105,5,226,206,154,
+    216,44,117,39,174,44,144,120,26,49,64,187,108,78,110,10,
+    154,26,148,154,72,147,236,35,109,79,95,148,163,73,77,185,
+    37,41,230,69,74,104,151,150,5,52,25,144,50,105,181,182,
+    239,202,224,83,212,218,126,95,179,34,208,141,90,219,21,212,
+    218,206,75,78,169,93,59,115,244,248,183,18,239,37,182,237,
+    232,216,63,138,126,158,163,54,193,218,13,8,183,15,151,251,
+    133,200,104,201,53,86,118,141,193,179,206,224,59,167,30,156,
+    18,34,87,74,206,171,101,231,213,226,168,20,183,34,116,204,
+    150,188,137,178,55,129,75,212,29,239,58,158,56,182,237,175,
+    84,135,170,216,25,87,243,59,3,15,6,132,176,242,176,35,
+    240,78,215,131,46,33,124,177,228,184,84,118,92,42,142,108,
+    123,90,222,249,202,131,175,8,209,153,146,103,182,236,153,45,
+    142,163,95,126,227,209,198,182,61,81,29,215,34,103,183,233,
+    19,162,231,74,206,243,101,231,249,74,134,155,221,155,126,161,
+    115,176,228,24,42,59,134,84,153,94,46,121,134,203,158,97,
+    85,166,19,218,76,155,2,180,58,47,149,188,47,151,189,47,
+    131,45,216,28,124,236,125,228,37,43,31,131,64,237,67,106,
+    159,173,56,5,196,116,225,131,160,206,107,51,138,118,191,59,
+    252,100,152,196,191,96,68,78,20,113,81,192,133,0,39,239,
+    22,149,98,88,148,144,20,192,133,59,209,21,71,112,103,180,
+    13,168,44,101,36,74,173,55,203,173,55,139,55,159,246,244,
+    125,43,254,94,188,82,134,35,72,127,4,232,187,232,135,114,
+    6,242,67,149,90,45,159,165,244,9,158,215,242,189,80,171,
+    165,227,23,28,21,115,166,198,134,201,10,13,49,114,230,14,
+    130,106,121,83,209,0,158,189,25,73,17,25,88,63,49,104,
+    168,40,104,199,199,47,203,96,170,206,224,192,6,229,56,140,
+    138,211,54,218,253,113,244,165,143,162,47,9,47,43,91,36,
+    212,161,67,191,172,109,219,138,105,217,194,232,35,94,200,169,
+    73,81,197,232,67,239,163,198,242,195,149,134,196,135,86,109,
+    229,127,130,209,155,104,31,201,224,85,168,204,39,254,234,202,
+    160,153,165,132,132,124,244,252,197,108,87,138,121,65,87,74,
+    108,185,4,255,47,12,10,245,171,50,248,2,174,155,148,43,
+    200,95,213,150,64,217,251,241,189,9,74,113,24,159,210,64,
+    195,138,62,167,248,252,122,93,96,138,167,70,57,156,80,14,
+    221,150,170,26,229,208,199,242,155,209,234,173,173,102,179,114,
+    64,190,77,203,117,134,65,39,135,141,229,55,143,251,247,232,
+    214,235,252,166,229,240,145,114,28,62,240,164,241,115,138,253,
+    215,211,182,177,161,121,176,199,230,195,32,4,35,208,111,145,
+    247,44,243,237,172,111,62,202,182,207,119,64,90,39,164,69,
+    33,173,11,210,98,144,214,13,180,61,112,61,194,118,192,200,
+    233,20,143,104,6,184,161,133,115,233,16,62,33,211,167,249,
+    111,65,57,201,32,60,192,48,20,208,178,240,32,10,12,200,
+    144,141,8,189,209,18,175,223,9,227,83,49,4,56,18,15,
+    122,191,112,136,199,40,233,217,106,237,187,230,251,36,141,250,
+    224,40,150,44,199,97,20,73,13,99,37,94,79,75,68,162,
+    237,80,215,62,232,190,93,243,25,40,211,193,169,234,226,152,
+    191,68,182,60,200,142,87,98,60,229,87,82,124,173,242,16,
+    175,219,1,110,78,55,39,195,102,65,191,220,129,198,140,50,
+    205,91,54,50,162,170,38,209,153,64,133,216,109,21,198,208,
+    8,58,102,88,111,157,45,68,90,244,224,132,177,125,108,208,
+    88,248,200,203,216,254,104,132,1,159,224,33,83,59,228,92,
+    62,18,239,248,85,0,31,214,43,61,68,165,127,188,247,208,
+    17,59,245,107,85,234,122,221,26,213,178,111,129,150,93,159,
+    67,181,59,71,19,110,99,66,30,19,242,52,97,14,238,173,
+    169,85,76,78,173,82,21,127,10,191,117,42,246,1,109,51,
+    141,129,160,178,31,72,71,86,163,249,159,199,162,252,35,4,
+    127,19,193,223,66,240,11,8,254,54,130,191,131,224,239,34,
+    248,123,8,126,17,193,63,64,240,15,25,253,116,183,45,131,
+    121,84,40,254,134,70,225,62,141,10,69,66,94,237,114,54,
+    201,42,235,120,201,57,81,118,78,40,42,107,59,254,9,199,
+    102,74,142,217,178,99,182,162,180,18,197,238,10,40,118,94,
+    84,236,200,10,131,90,243,29,45,57,199,202,206,49,93,54,
+    83,37,199,116,217,49,93,157,205,37,211,108,70,74,206,209,
+    178,115,84,173,64,191,178,217,42,116,143,150,28,99,101,199,
+    152,42,27,80,103,181,217,80,43,97,179,91,232,184,88,114,
+    93,42,187,46,85,236,132,205,179,155,111,110,246,9,71,174,
+    151,156,227,101,231,120,197,90,192,200,247,201,146,119,170,236,
+    157,2,5,27,204,143,175,188,71,179,30,130,172,143,97,214,
+    199,64,131,237,217,181,85,76,19,9,87,101,157,28,237,135,
+    43,89,180,121,234,114,227,59,91,239,159,184,127,2,95,210,
+    140,86,72,24,23,105,156,46,172,147,255,126,228,126,4,43,
+    209,132,170,63,186,170,159,122,188,242,173,218,253,140,221,104,
+    172,162,136,204,231,169,162,96,220,44,76,133,70,135,106,29,
+    54,30,150,6,18,217,231,189,48,61,53,193,181,153,117,177,
+    238,229,186,121,31,220,183,64,154,31,174,1,250,158,249,32,
+    220,183,194,255,54,248,31,98,61,48,101,121,197,158,106,101,
+    207,112,198,186,120,136,25,203,236,97,30,119,44,83,41,220,
+    169,246,196,25,204,55,21,9,115,16,153,48,167,66,153,116,
+    208,95,45,14,205,231,162,157,171,140,60,243,161,136,123,118,
+    140,138,74,118,45,87,203,174,101,42,153,38,32,85,35,70,
+    136,4,33,178,68,17,35,68,130,16,89,242,139,76,45,49,
+    242,59,50,248,41,20,35,56,187,171,197,200,41,20,35,179,
+    242,106,165,34,70,46,149,156,151,203,206,203,186,129,123,185,
+    228,24,46,59,134,43,3,119,243,154,208,53,85,242,76,151,
+    61,211,197,241,167,189,199,170,71,14,89,248,116,121,238,191,
+    121,191,15,114,82,141,28,50,74,156,174,251,175,220,111,133,
+    172,106,141,28,44,185,241,130,187,249,6,10,163,85,78,72,
+    179,107,210,28,144,230,212,164,185,216,122,224,90,171,58,8,
+    140,132,131,28,38,8,12,9,137,250,244,236,45,212,36,146,
+    129,172,98,18,75,235,103,25,89,222,11,6,61,248,169,12,
+    112,84,230,166,53,61,168,132,3,225,68,224,234,20,92,157,
+    37,87,172,76,194,33,130,103,132,224,153,82,240,92,57,120,
+    174,152,216,142,94,17,162,87,74,209,107,229,232,53,141,169,
+    249,233,31,76,35,123,170,70,119,141,80,237,42,58,50,224,
+    159,221,196,223,169,52,241,175,86,154,248,119,204,154,216,98,
+    145,192,119,141,154,88,9,119,197,65,226,234,16,92,29,37,
+    87,87,153,44,245,7,79,11,193,211,165,224,217,114,240,44,
+    54,241,176,16,29,46,69,175,150,163,87,53,77,140,153,27,
+    207,0,67,13,223,247,5,72,51,74,163,227,23,205,104,141,
+    142,95,52,163,53,58,126,209,140,214,232,248,69,51,90,253,
+    110,8,243,229,205,102,221,14,135,102,83,218,22,157,177,105,
+    190,196,233,214,25,154,45,166,180,250,29,14,230,203,156,250,
+    29,14,1,83,218,176,110,217,14,23,57,91,13,105,219,13,
+    150,46,141,41,163,6,75,151,198,148,29,26,74,92,184,140,
+    24,82,234,183,162,155,47,70,198,116,219,203,205,23,35,99,
+    108,207,161,23,35,143,176,189,6,139,145,198,180,71,217,99,
+    218,197,72,160,141,25,210,246,177,253,26,218,110,83,218,122,
+    54,174,161,237,169,193,97,199,53,180,71,76,105,95,96,79,
+    104,104,123,77,105,79,178,3,26,218,163,166,180,167,52,61,
+    124,172,70,43,156,214,228,218,87,163,102,103,52,180,253,53,
+    242,61,171,161,141,179,231,96,26,57,47,70,102,215,211,249,
+    212,26,199,203,135,100,222,226,248,37,110,45,207,103,51,133,
+    115,166,115,74,141,135,250,42,75,196,171,26,162,133,181,10,
+    21,89,40,86,29,52,112,55,149,198,85,41,217,30,239,74,
+    168,226,169,213,86,187,108,72,163,205,91,232,165,7,87,202,
+    231,58,87,130,191,213,196,27,59,56,129,20,110,169,180,81,
+    68,211,7,82,120,0,95,223,34,254,78,65,223,69,122,136,
+    104,138,158,252,71,22,211,200,86,35,220,140,67,23,211,112,
+    175,78,37,131,212,239,124,250,233,167,133,0,57,222,153,238,
+    25,167,91,76,98,183,70,233,114,234,241,202,130,16,65,179,
+    220,82,138,28,141,151,206,222,59,69,206,26,85,54,39,237,
+    252,30,230,117,133,44,110,42,77,20,203,174,231,215,214,165,
+    179,77,87,215,161,94,144,150,76,167,79,98,209,79,22,56,
+    62,91,221,54,196,67,93,24,126,174,92,178,25,174,58,147,
+    157,79,177,40,227,135,203,100,53,155,203,159,172,81,162,194,
+    245,207,146,143,174,76,252,95,193,138,93,199,29,82,244,193,
+    100,102,67,94,55,206,99,252,27,199,67,11,175,146,128,124,
+    178,206,75,114,197,134,62,169,222,0,70,152,152,199,19,75,
+    213,91,196,100,62,80,78,14,160,59,172,164,51,12,14,176,
+    57,70,38,179,247,104,113,85,39,133,83,158,184,203,37,215,
+    243,235,60,221,200,21,91,228,238,226,137,182,95,188,249,42,
+    22,134,68,236,223,26,165,71,62,76,189,182,146,34,251,18,
+    72,1,129,47,214,129,49,86,146,244,76,218,20,61,195,119,
+    9,48,152,15,199,210,103,149,181,123,226,73,146,87,152,167,
+    63,107,86,89,60,47,178,58,175,137,207,152,23,88,143,208,
+    170,27,177,181,108,142,236,68,91,254,242,59,191,244,63,251,
+    191,252,43,87,10,39,199,215,217,101,120,25,221,49,129,231,
+    77,18,41,144,222,136,45,110,232,89,129,110,217,83,237,193,
+    195,95,59,80,54,215,173,38,151,161,161,215,89,174,112,102,
+    4,143,219,144,79,159,132,86,85,29,78,44,15,61,201,206,
+    148,217,134,44,133,15,188,182,194,145,35,55,241,208,206,21,
+    232,199,236,221,60,151,33,135,64,114,75,201,13,224,19,224,
+    11,22,178,165,203,236,59,104,24,22,6,105,171,84,156,112,
+    228,176,98,186,124,44,181,1,149,87,92,37,24,4,106,179,
+    148,93,229,114,227,133,19,228,120,103,194,155,201,55,184,204,
+    41,60,176,152,220,73,241,15,228,241,164,196,23,133,203,120,
+    30,50,191,206,157,160,7,109,146,110,169,230,197,28,21,130,
+    6,188,12,114,242,21,149,43,145,4,11,240,144,1,75,163,
+    42,248,36,48,41,180,74,18,218,52,179,156,150,67,46,12,
+    7,135,242,58,122,98,74,199,53,54,185,38,159,152,156,7,
+    114,46,201,147,204,64,148,115,44,241,62,22,60,114,144,1,
+    33,41,180,77,38,121,246,30,54,212,34,50,64,94,150,202,
+    60,198,211,22,34,50,241,4,122,251,36,111,1,109,145,66,
+    219,212,114,6,135,77,101,35,11,182,122,114,153,75,196,143,
+    31,122,169,145,248,0,90,64,200,47,208,158,89,224,228,19,
+    49,48,141,136,147,133,74,119,138,1,117,194,198,2,45,141,
+    232,36,19,193,2,70,147,136,141,107,75,100,160,139,142,74,
+    232,132,216,176,8,210,236,52,189,156,17,93,120,65,201,149,
+    222,56,173,254,114,70,108,200,44,114,185,188,104,207,175,103,
+    56,108,1,209,182,66,243,178,221,153,202,228,95,58,47,58,
+    83,171,233,212,194,106,50,247,198,25,213,253,121,177,73,26,
+    85,48,168,72,138,216,48,158,206,38,243,98,195,93,108,81,
+    209,149,89,192,209,177,64,242,108,88,91,130,171,216,64,184,
+    88,116,225,121,216,60,75,158,162,219,100,156,56,40,22,8,
+    227,209,146,32,127,137,110,194,37,11,148,75,196,6,210,155,
+    162,71,18,102,11,164,35,161,25,72,255,145,183,180,168,78,
+    235,88,160,3,160,114,2,200,2,153,7,229,198,107,78,145,
+    78,92,192,14,36,77,168,53,18,235,45,18,248,251,104,36,
+    254,143,186,106,35,177,15,141,196,235,104,36,14,85,182,229,
+    116,190,27,126,18,22,142,92,46,133,135,203,225,97,12,81,
+    141,116,189,27,127,18,23,122,175,151,34,227,229,200,56,6,
+    130,211,19,42,136,43,242,172,118,65,191,165,237,113,248,81,
+    24,112,120,196,70,104,175,193,218,130,71,108,180,216,138,211,
+    187,78,12,41,72,61,72,109,214,11,29,231,74,222,243,101,
+    239,249,226,196,118,115,240,177,227,145,3,125,166,83,165,230,
+    233,114,243,52,20,200,237,123,103,234,193,20,121,193,44,188,
+    192,131,47,240,216,138,215,119,109,140,167,133,162,28,130,235,
+    134,6,229,15,61,142,63,138,75,175,110,129,87,227,137,24,
+    86,233,68,12,25,233,48,66,202,153,146,39,125,128,196,108,
+    173,36,91,39,211,28,124,103,227,193,198,102,139,208,49,81,
+    106,154,44,55,77,22,39,209,149,244,165,7,95,130,7,112,
+    3,82,67,61,250,128,235,37,31,48,52,64,244,81,148,190,
+    165,190,30,107,95,79,106,95,11,211,22,125,156,126,148,70,
+    140,31,48,120,64,72,61,57,32,196,142,37,187,241,224,198,
+    102,131,208,149,40,185,111,150,221,55,139,215,183,33,31,168,
+    10,250,177,70,74,45,163,229,150,209,226,13,169,197,30,38,
+    133,240,76,201,61,91,118,207,2,157,146,54,85,114,79,151,
+    221,211,149,103,183,237,46,193,51,89,117,102,136,188,201,148,
+    236,28,197,48,13,44,95,29,41,159,13,155,160,240,128,238,
+    128,194,254,104,70,84,179,173,56,9,168,64,248,241,224,163,
+    65,169,93,123,161,233,240,196,23,43,57,241,69,110,87,44,
+    193,133,146,123,176,236,30,132,18,192,3,83,143,166,54,23,
+    183,78,149,2,103,203,129,179,197,89,252,209,27,224,25,161,
+    253,124,201,247,98,217,247,34,48,35,240,161,188,139,245,69,
+    237,62,174,104,55,57,31,229,21,161,127,172,212,126,189,220,
+    126,29,119,139,209,61,90,91,71,133,248,72,169,109,180,220,
+    54,170,113,202,213,107,157,25,149,53,127,60,56,232,121,119,
+    193,144,8,247,14,115,125,28,125,67,47,125,6,61,158,108,
+    149,57,140,42,47,239,135,97,236,22,102,7,79,17,163,49,
+    241,232,46,78,225,175,15,253,38,70,181,96,176,187,149,73,
+    124,248,204,211,17,81,74,56,16,216,17,180,34,104,67,16,
+    178,232,253,78,113,139,4,218,224,21,185,203,76,181,72,57,
+    142,34,101,18,69,202,48,158,18,20,131,174,148,118,40,69,
+    80,150,248,2,248,19,71,109,24,3,223,173,142,200,136,127,
+    239,123,167,211,188,149,137,123,244,229,207,208,61,116,155,221,
+    161,250,71,222,74,199,216,237,76,234,255,66,117,82,169,113,
+    236,155,102,55,147,174,151,170,88,7,147,169,5,67,71,78,
+    26,180,243,41,139,4,122,141,218,249,5,108,231,41,108,231,
+    43,216,206,221,216,206,29,164,157,59,73,59,135,176,157,219,
+    117,237,124,202,212,165,247,67,207,213,206,242,22,69,184,58,
+    224,234,230,60,198,167,219,155,196,121,52,177,238,249,102,200,
+    207,199,122,230,91,88,239,188,159,109,130,62,107,22,237,179,
+    183,110,209,29,204,230,231,234,201,36,7,135,235,7,105,215,
+    14,255,227,88,253,159,150,7,74,138,185,138,173,1,119,241,
+    102,213,217,57,154,115,236,52,231,224,220,173,6,228,32,60,
+    114,104,206,143,87,1,200,241,199,12,158,230,204,50,211,208,
+    45,85,74,67,192,215,85,101,76,86,158,33,47,179,66,103,
+    238,224,49,130,59,228,215,120,240,204,162,29,60,52,116,7,
+    119,24,237,252,19,172,38,142,236,212,7,8,88,200,33,181,
+    10,172,148,250,53,43,198,29,207,129,118,194,86,140,118,245,
+    58,62,255,231,1,140,39,226,129,195,108,79,35,251,149,201,
+    17,236,235,8,52,39,252,144,149,34,178,112,228,71,109,136,
+    149,14,103,155,145,222,166,108,113,38,123,159,201,22,103,205,
+    40,56,107,145,192,25,28,5,155,154,81,160,156,73,118,69,
+    218,184,70,183,18,251,3,228,112,117,60,45,168,165,56,177,
+    91,231,11,219,118,25,25,96,252,96,175,47,132,95,36,128,
+    81,138,189,76,251,177,143,35,3,31,69,6,182,237,9,129,
+    124,182,237,93,48,181,227,222,226,122,186,183,216,73,183,92,
+    182,71,113,194,9,180,193,196,69,182,39,171,125,230,103,77,
+    5,217,116,237,1,38,111,174,106,80,109,174,106,156,119,131,
+    64,243,64,58,93,201,116,192,160,113,194,160,113,193,96,113,
+    139,62,28,9,213,91,171,204,127,222,73,71,203,159,131,146,
+    205,141,211,109,85,95,149,199,5,229,174,15,101,182,124,246,
+    30,69,178,129,138,108,165,34,155,170,200,70,43,178,229,138,
+    108,165,34,155,170,200,150,43,178,169,138,108,180,34,177,123,
+    239,24,116,245,69,139,4,94,175,55,248,113,46,229,231,163,
+    176,171,201,14,42,178,151,138,244,178,180,217,138,108,188,34,
+    155,169,200,182,42,186,237,138,236,171,82,239,182,34,123,178,
+    212,170,193,69,83,161,248,172,131,44,230,27,151,25,213,134,
+    56,43,244,89,3,244,153,21,250,204,6,125,214,40,173,62,
+    59,230,125,84,16,130,176,179,129,176,107,152,15,112,65,19,
+    191,180,75,23,232,214,198,133,182,194,70,180,38,135,214,70,
+    76,243,182,233,214,30,218,107,148,67,27,20,23,173,81,14,
+    31,148,67,27,24,215,97,154,183,254,132,165,78,54,8,60,
+    221,42,134,144,79,13,215,219,207,212,100,109,195,85,118,194,
+    225,148,173,109,22,137,163,119,8,215,18,65,138,171,234,252,
+    127,70,64,198,192,255,2,16,183,146,41,98,135,240,227,95,
+    99,100,249,254,187,8,254,55,130,95,3,240,161,85,19,163,
+    69,115,250,87,140,44,188,255,53,131,35,231,89,103,88,18,
+    51,218,40,226,70,89,22,199,115,192,249,127,138,224,159,35,
+    248,199,8,140,226,113,42,235,243,252,239,49,178,212,69,219,
+    156,255,63,8,126,31,193,127,65,240,27,8,240,151,98,181,
+    67,239,178,69,2,63,136,67,175,65,19,183,115,20,135,222,
+    168,52,244,104,160,188,141,113,123,48,204,196,141,33,38,184,
+    98,78,198,26,36,123,73,88,73,152,108,13,198,181,243,237,
+    104,39,30,163,222,211,43,88,187,182,155,125,197,41,195,48,
+    20,66,111,190,146,47,132,227,210,231,133,137,146,99,178,236,
+    152,84,22,243,71,132,216,116,201,115,163,236,185,81,28,175,
+    17,83,180,109,111,189,239,189,239,21,66,24,100,238,68,107,
+    194,105,43,142,96,129,253,198,161,69,248,71,91,232,178,86,
+    60,84,2,198,177,147,14,169,51,217,84,251,101,27,37,241,
+    32,5,167,112,190,173,22,195,97,162,221,221,232,7,202,128,
+    33,165,118,119,99,16,40,77,134,181,118,41,77,58,80,162,
+    134,182,76,244,177,207,162,45,147,147,10,233,32,196,17,182,
+    67,88,82,25,142,100,39,124,17,193,95,71,240,43,12,142,
+    154,208,97,70,13,209,55,20,43,197,94,49,95,136,189,226,
+    65,112,12,65,31,130,118,11,163,58,247,145,46,175,147,163,
+    162,200,242,58,217,34,98,180,188,62,98,145,0,110,182,205,
+    225,52,103,170,126,83,207,9,234,28,79,201,148,228,107,65,
+    3,150,216,59,116,223,60,153,118,154,91,128,156,170,14,109,
+    237,56,37,225,121,39,242,41,146,39,75,174,254,178,171,31,
+    23,231,165,45,220,66,124,176,20,28,42,7,135,112,137,254,
+    25,97,247,35,166,19,216,131,154,19,152,249,66,189,193,239,
+    31,58,183,92,70,180,32,252,109,32,252,181,139,240,230,11,
+    235,250,69,120,243,133,117,253,34,188,183,70,57,220,80,14,
+    237,66,188,249,226,186,221,32,74,220,124,143,169,62,66,252,
+    240,180,45,172,15,38,125,250,91,136,29,102,179,21,141,217,
+    169,225,51,168,245,220,193,153,67,219,66,178,97,74,79,7,
+    37,51,223,191,65,112,21,249,253,223,50,242,28,246,239,24,
+    121,94,123,202,96,20,44,127,197,82,53,37,254,123,4,255,
+    1,65,12,193,175,35,192,160,217,103,155,13,36,68,76,153,
+    177,240,168,32,213,140,245,223,16,252,38,130,223,66,240,223,
+    17,252,54,2,252,201,111,126,31,1,9,52,211,254,72,147,
+    69,2,191,128,163,117,151,49,115,74,140,129,238,72,98,189,
+    148,153,66,23,54,218,137,127,120,224,155,65,244,233,115,132,
+    141,70,241,79,232,51,140,62,189,168,201,230,216,11,255,31,
+    97,159,244,35,253,126,147,86,18,84,162,162,240,215,46,204,
+    37,129,254,156,222,121,187,254,48,141,121,39,164,185,52,105,
+    110,233,64,141,158,218,19,1,97,111,243,160,201,103,63,204,
+    143,99,31,159,70,127,73,220,115,24,135,22,49,29,137,184,
+    39,150,197,207,86,248,196,72,220,79,90,36,176,141,12,52,
+    163,97,32,37,228,112,76,242,182,60,117,249,239,95,248,198,
+    208,79,14,161,200,62,38,4,143,149,130,253,229,96,63,10,
+    235,65,33,58,88,138,94,44,71,47,106,196,244,164,105,231,
+    188,84,179,115,164,51,129,27,165,51,129,237,84,228,86,126,
+    32,203,45,123,68,72,68,154,249,239,15,169,201,14,78,31,
+    94,96,80,79,35,209,158,227,46,205,65,195,138,143,66,229,
+    49,81,28,26,67,50,128,7,239,86,40,21,242,165,234,180,
+    175,87,114,252,80,190,147,223,152,170,224,201,185,197,120,64,
+    30,143,191,195,189,67,142,166,123,9,61,33,127,2,191,162,
+    72,74,45,19,38,121,214,150,57,226,191,80,124,21,131,6,
+    62,184,105,139,4,254,99,189,193,239,185,43,191,51,52,42,
+    123,31,66,195,2,253,160,225,57,40,208,15,204,245,145,113,
+    129,126,172,109,244,67,95,50,109,234,45,232,169,201,17,84,
+    181,36,187,12,131,58,203,158,176,193,192,225,61,1,36,64,
+    241,134,108,32,145,150,78,196,237,207,104,60,98,212,27,109,
+    195,123,197,34,129,223,198,38,235,215,52,89,15,54,217,85,
+    185,201,168,129,94,189,55,239,21,211,65,50,116,136,38,33,
+    33,221,118,208,176,169,55,184,30,127,4,29,79,172,34,30,
+    225,168,233,28,138,45,246,226,243,79,189,149,134,35,60,123,
+    161,194,162,131,21,222,62,96,14,35,174,200,148,168,49,236,
+    136,213,70,108,53,163,249,238,182,69,2,191,139,173,60,161,
+    105,229,56,182,242,132,220,202,116,190,67,171,171,18,189,140,
+    113,203,79,21,64,98,160,213,211,200,237,63,184,105,164,187,
+    246,76,128,61,53,244,25,103,145,74,119,29,63,252,36,50,
+    93,153,68,94,169,76,34,183,205,38,145,59,22,9,56,173,
+    6,147,200,0,246,202,140,220,43,184,52,242,212,213,118,255,
+    210,55,134,127,114,24,39,145,227,66,240,120,41,120,162,28,
+    60,129,147,200,5,33,122,161,20,29,42,71,135,52,147,200,
+    29,82,246,211,98,104,245,197,1,122,234,125,110,96,20,151,
+    208,57,246,38,249,202,163,121,42,58,0,189,134,191,113,145,
+    19,237,120,203,103,223,222,16,221,112,119,59,181,74,233,68,
+    235,245,204,250,42,143,167,252,241,33,242,72,5,69,126,42,
+    83,249,249,76,229,247,50,233,143,97,146,95,47,36,63,193,
+    70,126,41,139,152,85,228,228,124,114,208,21,177,173,200,113,
+    144,36,98,156,196,52,147,227,172,200,25,74,196,222,34,251,
+    142,73,20,57,137,115,38,81,228,36,206,153,132,141,91,228,
+    53,107,186,212,116,170,50,151,95,148,189,20,212,56,187,46,
+    79,217,180,147,94,145,135,4,237,134,234,174,57,176,95,90,
+    205,178,235,105,110,152,255,178,133,138,217,220,79,52,50,204,
+    110,189,197,98,193,179,244,44,231,4,230,172,250,179,205,180,
+    9,242,103,155,105,21,228,207,54,19,17,228,207,174,205,105,
+    177,237,50,122,240,48,176,135,151,125,37,53,98,195,59,61,
+    120,56,183,135,151,125,37,181,197,102,185,140,119,90,240,48,
+    133,148,151,247,149,84,160,156,180,224,173,17,220,236,216,35,
+    215,125,53,166,197,129,111,209,3,161,185,103,15,175,251,74,
+    114,168,102,230,14,163,204,131,150,91,112,111,12,133,206,83,
+    123,228,102,95,141,58,29,193,215,233,1,214,53,130,197,169,
+    164,14,217,44,131,248,30,45,184,159,197,146,12,238,43,169,
+    45,46,203,53,200,223,24,62,188,178,71,174,251,106,76,212,
+    78,238,141,225,253,175,237,145,235,190,26,211,122,14,203,165,
+    7,247,55,246,240,178,175,164,174,89,26,44,47,238,50,122,
+    112,31,74,2,151,125,37,181,217,102,9,99,21,180,224,97,
+    8,171,24,222,87,82,91,226,152,189,30,60,156,218,195,203,
+    190,146,250,69,203,49,188,213,131,135,95,220,195,203,190,146,
+    250,170,101,196,98,105,223,101,140,225,230,192,30,185,238,171,
+    49,211,117,47,91,90,119,25,61,216,236,220,195,203,190,146,
+    250,3,150,70,203,12,52,159,49,188,63,182,71,174,251,106,
+    76,160,201,210,177,203,232,193,230,234,30,94,246,149,212,222,
+    139,88,9,61,216,28,220,195,203,190,146,58,87,103,35,220,
+    103,12,31,54,236,145,235,190,26,211,98,177,132,118,25,61,
+    16,142,12,237,225,117,95,73,182,155,145,246,12,234,72,207,
+    96,103,234,129,112,124,120,15,175,251,74,242,138,37,132,183,
+    122,32,196,47,239,225,117,95,73,30,106,132,94,196,246,51,
+    130,15,191,180,71,174,251,106,76,168,145,176,181,49,68,134,
+    106,36,204,175,194,4,110,91,44,99,240,197,252,178,213,181,
+    71,111,246,171,177,233,58,167,165,7,229,161,22,8,189,195,
+    40,48,123,246,149,228,136,25,233,209,43,58,210,151,240,78,
+    15,238,191,189,135,151,125,37,149,183,52,91,34,187,140,30,
+    108,122,246,240,178,175,164,30,235,69,158,209,3,161,235,220,
+    30,94,247,149,228,132,37,64,216,197,24,146,2,7,8,87,
+    169,80,3,17,75,63,74,54,45,16,122,47,161,232,235,223,
+    87,146,135,28,150,75,40,147,181,64,136,79,160,208,190,180,
+    175,36,135,236,150,9,34,163,140,224,195,11,123,228,186,175,
+    198,180,218,144,35,245,64,136,158,196,177,16,218,87,146,91,
+    154,44,125,56,222,180,64,56,114,17,7,100,223,190,146,220,
+    235,176,92,196,18,105,129,208,63,142,69,190,184,111,128,35,
+    147,245,255,3,166,161,133,48,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/pred/BranchPredictor.py",
+    "m5.objects.BranchPredictor",
+    embedded_module_data,
+    12568,
+    37769);
+
+} // anonymous namespace
+} // namespace gem5
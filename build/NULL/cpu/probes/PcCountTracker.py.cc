@@ -0,0 +1,91 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,85,205,111,27,69,20,159,245,250,99,109,47,142,
+    163,198,148,180,21,154,150,54,34,52,118,64,162,72,84,20,
+    137,24,169,184,208,96,169,41,135,21,210,106,188,59,177,151,
+    238,23,179,99,72,114,242,129,67,197,5,110,112,224,144,11,
+    149,16,87,254,16,167,138,84,107,79,72,156,184,185,74,79,
+    57,241,102,118,237,216,193,84,236,174,223,188,121,239,205,251,
+    218,247,91,255,133,102,174,92,186,158,236,2,249,9,217,200,
+    86,92,228,41,134,162,8,62,227,102,60,213,80,37,175,186,
+    217,157,100,205,237,160,12,186,139,236,236,119,200,206,81,229,
+    137,138,208,239,234,196,161,145,151,186,60,232,10,84,61,167,
+    43,216,218,3,180,94,252,91,108,214,149,184,248,192,241,62,
+    239,124,69,45,14,155,11,109,22,116,232,103,78,196,169,79,
+    217,84,172,188,101,205,230,155,157,228,203,101,190,20,25,138,
+    141,140,140,173,24,42,172,89,59,99,228,108,85,228,64,11,
+    118,246,137,2,209,149,201,81,41,203,205,203,186,25,67,163,
+    197,195,18,90,112,217,249,121,91,163,108,23,32,123,45,174,
+    181,173,102,208,247,249,14,35,214,35,202,238,19,159,116,41,
+    35,89,176,220,233,57,17,182,92,18,69,216,147,226,8,119,
+    221,160,67,92,220,110,214,45,113,8,135,196,97,152,139,163,
+    142,223,109,148,48,92,45,142,31,81,26,70,152,247,232,196,
+    94,26,83,22,225,221,128,97,226,186,152,19,214,165,124,222,
+    79,132,137,111,99,70,156,8,2,209,61,135,75,119,244,27,
+    234,243,8,127,219,163,62,38,112,0,52,212,234,115,106,195,
+    46,245,226,247,189,14,101,56,216,197,220,241,104,52,77,3,
+    116,144,63,132,3,99,112,195,246,165,94,120,153,43,25,83,
+    127,154,31,57,203,44,113,115,176,102,133,253,205,80,188,205,
+    104,51,180,76,105,105,242,228,164,153,180,133,53,122,189,131,
+    203,93,234,221,186,125,123,97,55,227,18,184,76,53,113,13,
+    248,102,159,49,40,43,21,181,161,248,211,85,209,174,105,112,
+    220,60,107,203,246,186,30,107,166,233,19,143,154,102,92,50,
+    77,47,176,251,174,224,117,211,252,186,79,220,84,83,48,77,
+    59,176,128,201,242,253,144,198,37,107,111,207,236,81,98,67,
+    252,162,224,229,155,140,245,246,254,150,227,219,247,41,239,5,
+    118,92,22,10,186,23,6,140,71,113,249,11,152,210,128,181,
+    9,35,94,92,158,73,46,46,36,137,69,191,161,19,49,60,
+    167,56,98,214,230,76,99,230,171,110,132,251,172,0,102,146,
+    92,133,95,36,166,126,48,189,199,153,108,78,27,35,65,116,
+    164,191,49,248,120,180,252,254,224,222,168,90,31,180,198,121,
+    84,172,61,214,127,252,242,72,187,118,172,93,27,105,43,143,
+    245,97,109,227,72,171,31,107,245,113,78,189,144,31,124,58,
+    46,161,165,75,207,42,55,158,86,110,12,215,62,58,170,108,
+    29,87,182,6,119,197,205,94,155,68,157,131,217,4,178,39,
+    191,188,20,102,180,112,168,45,132,206,57,232,25,69,90,58,
+    44,47,180,60,7,72,67,7,203,87,254,23,28,43,41,28,
+    43,243,173,60,248,85,130,80,182,25,187,233,231,36,1,92,
+    2,176,115,179,15,3,28,18,198,29,171,239,18,134,67,11,
+    247,72,132,59,148,250,9,150,82,232,52,4,58,124,74,109,
+    240,17,128,26,240,233,251,240,238,1,39,176,39,41,218,153,
+    216,200,80,51,80,150,126,28,31,112,236,17,238,4,126,138,
+    146,215,95,130,18,129,142,149,69,232,96,226,75,117,176,44,
+    156,159,37,0,142,14,46,9,209,57,144,166,57,109,175,47,
+    49,209,123,166,11,34,122,203,42,130,44,9,82,21,100,89,
+    144,21,65,106,130,188,10,36,206,37,51,93,216,34,17,109,
+    182,31,198,89,43,96,84,14,74,92,12,121,234,154,93,20,
+    246,114,132,86,5,185,60,33,239,46,26,97,85,140,176,32,
+    37,164,95,17,35,252,142,24,225,181,65,235,207,202,234,191,
+    134,115,84,174,254,112,231,251,59,195,213,141,163,114,253,184,
+    92,7,251,106,237,89,245,230,211,234,205,225,198,39,71,213,
+    214,113,181,53,144,119,18,95,68,221,134,105,40,121,183,26,
+    129,252,243,136,152,152,226,184,122,38,104,200,191,24,150,149,
+    69,128,56,20,37,70,113,5,216,62,119,92,0,97,7,112,
+    158,0,81,150,50,95,222,169,246,65,242,29,249,144,93,135,
+    173,152,196,232,15,32,99,85,81,148,241,123,72,185,58,68,
+    120,246,25,161,183,135,243,207,8,93,28,78,158,17,186,50,
+    156,60,227,124,85,105,42,99,180,152,254,220,122,46,215,23,
+    179,154,53,93,185,7,252,98,58,172,189,249,92,50,47,254,
+    195,64,86,245,15,215,67,47,24,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/probes/PcCountTracker.py",
+    "m5.objects.PcCountTracker",
+    embedded_module_data,
+    1065,
+    2058);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,103 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,173,86,207,111,19,71,20,158,245,218,235,31,137,29,
+    39,33,63,234,132,102,105,5,198,160,58,40,148,86,164,105,
+    73,40,133,6,170,20,145,180,7,11,180,218,236,14,196,224,
+    245,154,217,77,193,62,84,62,112,226,130,196,133,8,85,144,
+    19,82,213,127,102,93,89,170,53,167,74,61,229,150,136,156,
+    56,245,189,93,175,19,54,107,181,149,234,93,127,51,187,223,
+    155,121,51,243,190,55,179,127,145,67,191,88,183,124,251,10,
+    224,5,209,137,46,84,136,33,148,4,1,235,145,74,100,205,
+    43,69,183,20,43,81,35,86,138,9,36,66,174,17,61,250,
+    132,232,49,26,123,35,18,242,155,232,119,88,146,92,78,2,
+    46,78,165,0,23,119,185,4,112,201,35,92,194,229,82,192,
+    13,80,33,192,37,245,193,85,82,72,239,224,67,65,224,233,
+    175,43,166,246,128,234,223,175,223,167,154,13,47,132,51,0,
+    201,213,178,225,189,209,14,207,48,234,207,240,103,119,134,148,
+    148,4,157,148,34,240,23,117,161,20,213,35,165,152,46,150,
+    36,26,223,78,144,144,159,30,125,35,192,88,132,131,177,128,
+    101,42,204,146,14,220,31,236,181,138,189,137,64,171,72,175,
+    85,90,151,96,6,113,62,124,165,204,96,132,84,191,70,171,
+    148,169,182,201,214,26,159,104,181,205,89,155,90,54,101,214,
+    172,222,229,241,121,246,136,113,113,99,163,49,113,143,26,23,
+    230,231,143,112,141,129,234,166,33,155,119,101,232,206,106,140,
+    174,214,161,67,67,126,68,229,117,90,49,171,247,100,219,92,
+    41,100,120,66,81,170,170,65,21,133,167,20,197,48,245,205,
+    10,214,7,21,229,225,166,90,233,50,81,187,94,163,60,161,
+    174,91,54,83,53,155,167,180,199,143,149,13,170,234,148,241,
+    36,214,181,138,106,89,60,118,83,101,170,193,197,229,170,205,
+    19,224,91,65,199,92,242,28,115,9,88,10,140,168,86,235,
+    92,178,220,151,191,146,183,184,26,239,230,44,166,205,246,157,
+    245,173,205,245,186,63,187,53,215,160,88,171,179,56,52,116,
+    225,4,252,173,101,128,102,239,234,12,124,216,188,210,25,26,
+    109,126,219,25,94,108,94,239,100,11,205,229,63,135,142,61,
+    171,63,173,111,29,111,13,229,219,67,121,160,210,35,207,110,
+    63,189,189,117,234,151,51,206,169,47,90,233,133,118,122,161,
+    121,21,47,54,225,247,29,174,156,87,125,149,67,165,237,120,
+    168,106,68,208,205,251,10,72,128,109,50,212,54,166,75,1,
+    219,20,216,14,132,218,198,245,68,192,118,80,79,130,178,82,
+    124,124,149,178,50,181,110,209,135,155,176,102,7,170,152,235,
+    187,206,225,13,80,98,211,158,196,194,13,118,22,49,132,227,
+    170,174,51,106,89,114,185,170,49,106,64,164,101,171,220,160,
+    59,152,40,141,89,80,195,58,101,40,70,189,124,247,46,69,
+    33,200,126,3,16,21,85,13,11,244,40,223,243,250,164,59,
+    115,216,234,68,141,50,13,45,161,153,170,105,104,107,111,168,
+    208,144,81,249,17,43,195,152,87,10,105,134,89,202,112,33,
+    25,102,33,195,101,98,105,132,12,194,16,66,22,128,143,162,
+    63,165,55,58,5,71,199,165,31,64,172,231,231,120,10,229,
+    106,185,211,227,241,155,158,91,158,233,250,87,60,103,108,28,
+    251,114,165,49,137,144,243,225,44,10,80,13,8,240,99,16,
+    224,240,55,168,189,34,104,47,55,243,186,240,178,176,125,217,
+    57,189,216,202,45,181,115,75,78,116,162,51,60,254,98,250,
+    249,116,39,145,116,6,22,246,196,200,136,180,79,0,154,215,
+    119,37,50,62,245,226,206,243,59,219,115,78,254,122,107,236,
+    70,123,236,70,115,5,47,207,123,174,175,48,175,254,47,194,
+    212,99,32,32,137,143,46,87,127,82,43,101,29,226,113,160,
+    158,254,89,26,98,141,210,249,192,147,78,8,203,166,112,50,
+    211,0,43,133,228,191,13,35,155,65,8,68,226,164,15,159,
+    99,36,62,13,68,66,198,72,92,198,72,156,237,19,9,239,
+    246,58,60,25,92,92,255,212,121,251,164,239,226,70,8,149,
+    116,49,112,46,196,105,162,79,126,7,79,144,20,88,134,103,
+    119,44,96,57,216,61,53,70,142,110,137,141,226,127,217,63,
+    33,48,147,94,96,66,122,74,219,27,20,15,13,185,102,50,
+    219,106,140,104,27,84,123,224,230,167,102,26,181,10,181,105,
+    99,12,77,152,183,17,248,89,107,178,127,76,71,62,252,35,
+    56,50,89,119,11,185,9,253,243,56,120,194,202,161,84,61,
+    214,237,217,82,108,83,241,125,186,251,49,79,246,156,5,69,
+    144,247,225,18,138,96,45,32,130,25,20,193,18,138,224,12,
+    136,32,51,227,100,102,182,135,90,153,115,237,204,185,230,181,
+    206,148,252,250,226,203,139,206,201,139,173,169,249,246,212,188,
+    19,157,236,100,199,254,200,230,127,207,230,157,211,151,90,217,
+    197,118,118,177,185,140,151,231,48,239,138,54,197,39,141,11,
+    69,211,253,196,176,138,239,125,131,48,209,29,44,208,53,60,
+    19,45,158,192,42,51,31,215,249,32,212,122,95,38,12,191,
+    183,188,163,44,215,83,114,254,168,196,223,37,22,188,179,249,
+    43,118,14,30,81,17,214,48,224,174,40,8,194,238,103,68,
+    56,239,144,185,195,119,135,76,56,254,221,33,227,142,127,119,
+    200,71,206,251,247,174,20,23,190,220,37,71,97,43,185,135,
+    197,254,193,219,99,73,225,59,97,151,132,163,115,188,184,231,
+    86,246,15,83,147,49,225,50,212,195,209,201,157,221,115,43,
+    251,135,169,108,92,88,18,208,97,24,110,29,223,115,203,253,
+    62,188,187,100,127,3,53,244,187,12,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/testers/directedtest/RubyDirectedTester.py",
+    "m5.objects.RubyDirectedTester",
+    embedded_module_data,
+    1258,
+    2770);
+
+} // anonymous namespace
+} // namespace gem5
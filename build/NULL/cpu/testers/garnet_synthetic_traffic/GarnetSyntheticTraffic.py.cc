@@ -0,0 +1,109 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,165,86,203,111,19,71,24,159,181,227,197,207,24,199,
+    137,157,16,42,13,170,132,100,90,18,2,132,87,66,120,133,
+    71,10,36,105,131,170,54,74,181,218,236,140,147,133,125,152,
+    221,53,141,151,203,30,122,168,184,32,249,98,83,245,192,9,
+    169,226,210,107,255,11,91,242,193,218,19,82,47,205,205,8,
+    78,189,180,223,236,218,38,113,237,208,170,227,245,204,206,124,
+    191,249,190,223,124,143,177,127,71,123,90,168,61,190,91,128,
+    174,130,8,34,156,130,84,110,157,227,216,123,64,9,60,240,
+    199,224,3,20,64,183,17,9,254,128,200,16,229,94,5,17,
+    122,29,236,40,89,31,34,161,53,148,227,119,217,36,199,185,
+    137,27,138,46,61,162,100,101,243,33,149,44,88,224,78,72,
+    123,141,14,117,140,62,9,48,163,20,173,115,4,173,7,224,
+    27,36,28,40,11,172,135,40,255,242,16,234,211,72,144,12,
+    189,130,93,175,3,93,227,225,129,216,16,225,123,176,145,129,
+    216,67,36,220,131,141,14,196,70,72,180,7,27,27,136,141,
+    145,120,15,54,126,0,54,209,131,77,28,128,29,238,193,14,
+    3,54,217,23,155,36,135,123,176,135,1,155,234,139,77,145,
+    145,30,236,200,1,28,210,61,216,244,64,236,40,25,235,193,
+    142,2,118,172,47,54,67,178,61,216,76,0,209,44,25,127,
+    197,193,42,215,93,29,7,13,19,253,52,208,35,15,39,187,
+    218,38,122,116,29,37,71,32,89,39,221,204,109,209,208,168,
+    181,86,210,172,109,106,201,210,3,67,204,231,101,201,94,144,
+    10,197,105,139,154,22,53,204,233,45,15,35,152,29,144,96,
+    249,168,233,254,155,167,182,183,237,163,91,84,157,189,116,169,
+    63,96,151,7,10,246,232,38,43,16,172,231,243,38,181,176,
+    172,225,77,217,50,119,217,193,236,204,114,81,221,164,6,200,
+    240,34,112,144,53,209,146,117,205,148,17,226,144,29,83,169,
+    170,27,37,108,202,54,149,255,128,250,179,39,63,192,77,89,
+    45,42,30,26,75,37,73,161,230,238,95,208,236,252,125,113,
+    7,107,93,84,65,132,202,180,76,108,233,216,164,26,153,194,
+    131,218,34,205,139,69,5,216,121,216,71,148,22,188,13,178,
+    182,133,45,89,81,246,154,131,101,211,254,102,13,6,172,107,
+    74,9,231,13,93,197,214,54,236,212,116,66,7,155,216,211,
+    174,151,48,105,27,164,79,40,28,145,237,244,12,238,211,12,
+    76,60,189,4,92,243,47,244,118,206,64,104,129,105,2,29,
+    184,29,63,193,42,21,168,59,92,212,228,188,110,168,130,33,
+    106,68,87,237,120,59,74,152,73,183,126,122,193,218,111,87,
+    236,177,85,207,105,16,40,118,159,177,19,27,162,69,237,23,
+    95,67,128,25,37,127,29,134,143,81,58,133,193,14,158,193,
+    162,65,241,204,201,188,34,91,159,227,211,204,195,179,222,228,
+    227,39,218,31,148,174,93,44,66,64,172,109,131,82,252,4,
+    56,153,187,236,106,182,87,62,228,6,145,183,32,195,188,248,
+    27,84,146,77,118,134,131,155,152,135,252,7,199,73,178,42,
+    42,184,160,203,154,37,95,189,123,15,217,223,222,240,146,11,
+    111,82,240,28,197,116,71,182,88,78,252,151,70,138,148,209,
+    87,68,175,6,128,146,190,101,80,211,180,143,173,234,134,229,
+    199,152,226,78,170,151,160,16,85,111,17,98,110,167,215,252,
+    249,247,20,8,40,58,75,70,125,57,247,137,27,22,4,77,
+    84,169,32,184,81,65,80,117,82,84,216,123,92,16,30,23,
+    69,165,45,25,242,98,30,149,118,118,132,109,42,18,106,184,
+    17,246,46,41,162,105,186,161,85,209,16,85,55,184,164,89,
+    110,220,43,79,193,47,79,55,12,197,35,176,132,115,219,229,
+    39,176,242,115,163,80,0,130,95,104,110,146,65,218,149,37,
+    168,226,142,155,48,193,39,64,129,37,48,216,137,181,167,158,
+    22,126,205,50,96,234,198,247,165,98,232,150,162,139,96,12,
+    98,42,176,236,242,223,88,52,221,72,55,102,46,239,59,223,
+    29,6,127,21,224,90,160,130,34,171,50,48,251,138,62,46,
+    130,114,230,64,56,167,111,198,243,148,203,195,193,40,28,42,
+    40,106,37,151,247,221,249,11,122,199,174,194,63,175,155,134,
+    52,253,127,174,187,66,201,96,23,154,215,97,248,154,6,92,
+    98,78,247,211,140,125,234,44,190,9,223,105,5,81,40,217,
+    226,81,106,218,89,122,147,30,175,92,44,95,172,126,89,195,
+    231,234,233,243,141,244,121,231,94,51,57,250,188,244,172,84,
+    77,213,142,158,173,39,103,27,201,89,231,78,115,36,91,201,
+    149,115,213,155,47,47,215,71,102,26,35,51,206,221,102,42,
+    83,153,40,79,84,207,214,142,45,212,83,87,26,169,43,206,
+    23,205,204,100,69,46,203,205,112,180,21,224,34,75,220,219,
+    208,80,150,127,143,160,115,86,90,81,52,118,164,178,84,94,
+    106,75,175,50,233,24,147,142,241,206,125,144,2,21,48,209,
+    150,94,103,210,52,147,166,121,231,46,72,71,39,42,243,229,
+    249,26,62,245,235,84,61,125,173,145,190,230,19,125,250,236,
+    105,245,76,13,159,175,39,47,52,146,23,128,168,79,222,211,
+    18,240,24,132,14,131,22,232,156,59,173,56,2,206,145,114,
+    164,25,142,48,27,103,192,68,138,153,72,241,206,18,152,0,
+    242,27,229,141,102,56,201,132,55,25,129,12,147,102,120,103,
+    25,164,241,236,143,115,181,236,165,122,108,174,17,155,115,22,
+    155,137,145,231,27,207,54,170,199,127,62,81,59,62,87,79,
+    204,55,18,243,206,45,246,49,78,116,130,176,156,11,185,227,
+    234,236,148,238,253,245,50,167,246,253,19,51,216,181,224,70,
+    64,92,96,201,110,186,97,246,106,232,59,237,40,230,88,231,
+    169,250,140,101,71,120,222,47,164,5,99,26,177,159,31,8,
+    47,133,174,21,228,56,174,117,14,113,103,106,232,244,222,167,
+    137,178,181,206,211,68,153,90,231,105,241,39,185,203,45,244,
+    207,174,250,221,91,54,188,239,35,242,104,252,13,145,26,205,
+    16,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/testers/garnet_synthetic_traffic/GarnetSyntheticTraffic.py",
+    "m5.objects.GarnetSyntheticTraffic",
+    embedded_module_data,
+    1345,
+    2730);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,106 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,150,203,79,219,72,28,199,199,73,48,129,96,18,
+    2,73,8,229,97,170,93,104,104,161,130,170,210,22,86,8,
+    104,75,91,94,139,150,174,180,66,84,150,241,12,224,214,142,
+    93,219,217,18,171,135,28,246,80,245,82,137,11,8,173,84,
+    180,135,106,87,253,103,28,41,135,104,174,123,226,70,213,158,
+    246,180,191,201,107,83,55,73,156,241,248,55,159,249,206,239,
+    49,19,249,31,212,244,233,168,221,63,47,66,115,138,48,194,
+    156,134,116,110,151,227,88,63,160,5,158,86,239,193,167,40,
+    128,30,33,28,252,29,225,16,225,62,4,17,250,24,172,139,
+    236,134,112,199,14,202,240,151,236,33,195,81,225,190,102,40,
+    47,8,254,105,255,57,81,28,48,112,83,74,243,162,161,250,
+    162,127,6,216,162,4,237,114,24,237,6,224,23,196,28,136,
+    5,118,59,8,127,209,137,90,124,112,16,135,62,192,172,143,
+    129,198,226,97,96,187,90,178,29,152,247,177,221,192,70,90,
+    178,157,56,236,99,123,218,178,93,184,219,199,10,109,217,8,
+    238,241,177,189,192,70,91,178,2,238,245,177,49,96,251,90,
+    178,81,28,243,177,241,182,108,31,142,251,216,254,182,108,63,
+    30,240,177,3,109,89,1,39,124,108,162,109,108,73,156,242,
+    177,201,182,53,30,196,105,31,155,10,32,50,136,135,62,112,
+    96,229,26,214,52,40,12,181,82,32,215,158,15,55,212,174,
+    249,180,70,96,214,104,203,117,135,241,136,143,29,195,163,176,
+    177,199,104,231,38,209,159,18,219,113,71,21,51,119,219,129,
+    30,177,236,219,58,209,89,183,126,159,57,58,114,133,67,162,
+    223,157,159,175,225,151,204,87,87,124,146,5,252,55,89,19,
+    247,137,243,138,144,172,104,145,151,57,24,22,77,25,142,137,
+    99,171,8,113,200,253,110,71,117,137,104,28,136,32,103,88,
+    121,128,14,85,35,43,58,134,152,179,137,120,99,63,15,107,
+    100,0,141,33,119,124,199,145,45,135,177,206,17,17,15,84,
+    11,180,152,7,106,246,176,54,13,184,37,228,94,255,138,179,
+    137,98,100,241,183,96,1,185,147,95,129,185,172,34,43,71,
+    68,222,215,136,143,182,88,106,220,204,86,78,223,39,22,195,
+    53,67,198,54,243,145,28,19,37,231,16,8,241,192,176,8,
+    60,170,108,218,229,50,227,99,219,196,82,72,214,145,15,9,
+    232,192,132,203,57,102,30,109,50,31,192,154,14,44,0,73,
+    146,21,133,216,54,177,47,187,25,148,108,130,154,252,114,227,
+    77,118,217,49,116,85,177,213,165,149,40,114,39,182,45,227,
+    208,2,5,88,202,52,32,40,181,158,253,27,106,182,33,158,
+    81,151,214,55,144,59,125,63,175,104,196,246,121,45,226,28,
+    97,49,105,80,30,22,164,89,83,116,211,219,76,16,70,88,
+    150,106,101,178,243,176,25,116,119,100,167,114,135,17,213,22,
+    171,27,68,132,158,89,77,235,170,59,189,147,51,205,138,91,
+    166,156,85,21,241,213,17,236,131,22,81,139,7,178,170,205,
+    108,101,68,26,150,164,172,172,19,73,162,221,146,164,27,56,
+    167,177,126,143,36,189,204,201,90,109,36,228,228,77,66,187,
+    149,227,99,9,242,130,137,69,187,88,95,209,100,219,166,29,
+    219,178,37,235,148,175,198,72,195,245,68,208,240,47,89,91,
+    61,204,18,76,67,54,236,57,26,90,198,216,162,145,125,217,
+    38,146,12,93,105,182,249,97,142,38,154,18,47,53,6,104,
+    231,125,35,199,36,105,151,46,31,75,149,157,64,59,107,101,
+    161,130,89,237,72,149,130,211,120,253,241,255,144,105,127,221,
+    214,36,79,123,235,198,106,81,105,95,61,249,82,195,253,222,
+    134,9,38,41,47,104,228,231,234,113,98,197,161,33,86,115,
+    202,87,171,65,121,72,1,243,38,40,103,243,148,175,150,138,
+    134,86,12,67,163,3,118,173,32,21,151,36,98,89,134,101,
+    255,141,62,179,115,255,239,117,219,82,110,183,58,234,181,131,
+    61,99,230,45,30,192,74,115,11,126,182,201,177,131,84,255,
+    150,35,3,133,7,229,190,217,194,90,57,54,86,120,114,21,
+    70,177,196,187,215,111,95,159,45,123,99,203,197,232,74,41,
+    186,82,120,92,142,196,222,45,190,93,60,251,222,27,127,84,
+    140,60,46,69,30,195,156,120,234,116,234,100,234,236,87,111,
+    114,173,24,95,47,197,215,11,235,77,182,245,98,124,163,20,
+    223,0,219,240,248,251,181,243,181,114,56,230,197,23,62,5,
+    3,35,252,23,4,141,23,74,95,241,168,47,121,42,156,8,
+    103,178,55,190,81,140,109,150,98,155,21,15,18,67,167,155,
+    39,155,23,215,189,137,31,138,3,247,74,3,247,10,155,229,
+    244,232,251,145,243,145,11,203,187,185,94,76,111,148,210,27,
+    94,40,89,30,26,123,63,125,62,253,87,192,187,245,160,56,
+    244,176,52,244,208,11,165,202,48,251,217,201,179,139,89,111,
+    98,190,152,88,40,37,22,10,91,160,9,243,133,115,161,28,
+    142,122,125,247,192,139,52,243,34,13,94,36,192,139,228,181,
+    211,189,147,189,202,216,18,140,37,217,88,146,175,76,235,73,
+    189,89,240,82,115,197,200,157,82,228,14,4,45,196,223,237,
+    189,221,59,155,248,99,202,155,120,88,20,86,75,194,106,97,
+    21,56,8,114,254,124,190,28,22,188,232,34,72,12,51,137,
+    97,144,31,172,94,214,173,122,9,182,50,29,116,80,191,59,
+    99,84,222,56,236,153,175,94,64,44,246,162,2,155,244,238,
+    140,201,14,4,156,4,214,181,140,227,90,13,111,178,166,34,
+    53,205,106,31,254,177,122,216,22,173,89,196,254,152,161,184,
+    7,208,92,5,57,142,187,218,226,16,119,199,67,115,205,87,
+    25,165,188,250,85,70,73,175,126,93,241,147,28,127,133,190,
+    109,222,232,159,216,237,75,139,161,138,31,255,1,75,89,150,
+    169,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/testers/memtest/MemTest.py",
+    "m5.objects.MemTest",
+    embedded_module_data,
+    1297,
+    2466);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,81 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,84,205,111,19,71,20,159,245,218,139,227,196,216,
+    217,4,187,174,74,153,66,18,26,31,98,9,100,132,242,193,
+    161,68,144,20,4,17,164,61,88,72,171,245,206,36,14,217,
+    15,179,179,86,178,62,249,192,137,11,21,151,160,170,82,115,
+    138,84,241,103,244,31,88,75,62,172,230,84,169,167,220,140,
+    224,196,137,55,235,143,26,55,17,251,241,230,205,239,253,222,
+    188,143,157,157,127,209,200,149,232,143,31,238,128,56,66,4,
+    17,201,68,150,84,145,36,161,199,204,216,118,111,148,183,81,
+    12,221,71,68,126,137,72,156,74,39,50,66,239,228,193,34,
+    149,56,73,60,69,139,202,169,152,44,74,60,125,215,116,140,
+    125,74,30,87,159,83,195,3,64,42,26,163,65,227,131,160,
+    166,36,130,82,84,145,8,170,196,224,149,137,4,139,197,42,
+    9,170,28,95,64,103,92,68,62,1,159,119,210,48,116,50,
+    134,232,4,137,143,161,169,8,77,140,161,147,17,170,140,161,
+    83,231,198,186,64,146,39,49,224,198,134,220,244,185,220,9,
+    146,26,227,94,60,151,59,73,166,198,184,25,224,102,207,228,
+    166,201,197,49,238,52,112,213,179,184,116,230,249,236,208,47,
+    51,230,117,137,100,225,19,77,243,212,147,70,213,223,166,204,
+    163,110,243,170,81,111,148,188,72,103,37,23,112,161,151,254,
+    35,44,213,106,205,236,46,181,202,203,203,35,94,223,218,13,
+    171,74,93,236,236,96,240,103,184,132,133,113,203,113,61,214,
+    156,7,4,27,142,85,117,112,93,0,216,115,240,158,205,60,
+    188,128,137,238,233,216,208,141,26,101,205,203,130,54,36,56,
+    182,233,247,88,231,155,71,188,79,9,212,211,84,65,53,246,
+    35,2,196,171,155,212,163,123,91,127,131,225,74,205,57,128,
+    220,60,106,71,54,193,194,59,142,139,9,213,137,216,150,167,
+    41,225,142,71,138,240,13,147,50,92,165,222,1,5,167,3,
+    125,159,54,234,236,94,115,182,231,27,5,197,59,102,131,213,
+    246,236,221,230,204,83,31,186,96,225,3,10,30,166,99,239,
+    66,148,71,139,57,158,212,52,91,183,168,166,241,148,166,89,
+    14,105,152,66,159,210,180,23,13,221,236,91,226,158,95,167,
+    60,101,28,30,106,53,200,134,186,124,66,232,134,169,51,198,
+    19,91,186,171,91,92,222,180,61,158,132,236,52,209,92,62,
+    253,43,252,65,142,251,132,190,104,64,247,69,147,121,6,12,
+    155,208,173,117,104,73,4,76,246,129,225,100,104,233,55,73,
+    243,28,109,208,36,174,14,26,161,121,53,151,178,154,99,18,
+    158,237,21,173,237,184,34,142,109,248,60,254,147,227,152,176,
+    152,240,215,162,226,185,210,171,156,43,144,40,133,36,101,221,
+    246,185,194,34,240,47,244,65,236,178,79,11,204,53,74,95,
+    219,85,117,223,85,128,28,137,31,224,101,109,16,173,225,29,
+    78,230,91,235,225,116,185,245,115,152,189,218,218,252,39,51,
+    251,218,127,229,7,133,114,59,115,171,147,185,213,218,8,115,
+    215,131,220,245,48,89,122,47,199,242,202,71,4,162,245,184,
+    171,160,153,185,64,189,22,204,221,109,171,235,29,117,189,245,
+    32,132,217,151,64,225,251,63,11,191,23,142,111,6,63,174,
+    182,11,107,157,194,90,16,207,13,192,114,80,124,208,46,60,
+    236,20,30,10,48,255,221,145,255,198,63,86,131,249,251,237,
+    252,70,39,191,17,196,103,67,53,127,84,124,83,124,251,75,
+    48,183,220,86,87,58,234,10,44,153,86,95,63,123,245,236,
+    237,194,31,197,96,97,165,157,94,237,164,87,91,247,196,237,
+    226,65,141,143,22,19,252,27,171,188,228,68,199,33,91,250,
+    226,116,116,197,41,202,39,192,92,23,223,159,241,164,80,93,
+    231,176,223,164,43,66,68,75,137,86,125,74,174,246,246,214,
+    29,119,30,166,226,16,99,20,68,87,150,36,169,123,27,73,
+    55,3,116,99,244,9,81,62,24,60,33,202,5,131,167,171,
+    100,164,181,46,250,191,248,237,242,123,49,124,60,195,20,165,
+    241,25,234,246,184,216,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/testers/rubytest/RubyTester.py",
+    "m5.objects.RubyTester",
+    embedded_module_data,
+    902,
+    1598);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,163 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,87,221,111,27,199,17,191,47,158,40,29,73,81,
+    95,212,135,105,233,228,56,74,41,219,98,98,59,53,28,231,
+    163,177,100,89,82,82,69,141,148,22,97,227,18,167,219,149,
+    116,54,121,71,239,30,109,137,80,0,62,184,128,16,24,136,
+    97,20,176,145,182,168,144,7,3,129,81,32,127,66,31,251,
+    72,10,4,76,28,16,32,64,159,252,70,195,126,202,75,59,
+    123,199,163,72,138,106,114,60,206,237,205,204,206,238,252,102,
+    103,118,239,63,92,211,21,168,63,95,166,128,60,226,16,135,
+    248,12,151,229,83,60,207,218,66,70,88,243,158,226,26,39,
+    112,215,57,36,222,227,144,132,165,39,34,199,61,21,125,35,
+    169,128,43,11,128,76,198,124,155,76,70,93,171,92,34,248,
+    156,189,36,120,39,60,155,177,244,91,24,125,178,126,19,235,
+    54,48,248,105,189,121,66,130,63,161,152,59,33,204,165,120,
+    196,165,132,77,152,216,183,124,74,68,2,24,19,157,240,170,
+    77,176,150,189,142,205,181,157,28,6,134,100,90,38,118,2,
+    27,198,54,70,142,76,52,19,89,217,229,132,228,4,211,105,
+    83,203,226,116,218,233,73,167,179,22,202,103,88,59,148,78,
+    223,206,107,153,186,68,186,163,101,232,119,220,75,54,236,79,
+    231,40,209,147,122,46,159,180,49,181,49,161,73,155,104,27,
+    27,134,158,222,196,102,242,170,70,241,154,247,14,67,207,228,
+    118,136,12,125,92,50,3,127,58,10,164,216,248,85,149,169,
+    146,123,23,231,216,143,244,250,186,45,14,75,190,195,11,66,
+    179,195,240,23,17,159,146,144,144,10,32,49,37,11,28,238,
+    66,210,19,30,176,229,27,216,6,113,247,126,15,215,225,194,
+    202,205,144,223,70,129,39,96,249,169,208,232,21,134,94,145,
+    78,189,16,196,170,77,183,23,116,163,29,117,131,168,187,77,
+    183,15,116,251,59,234,246,32,165,77,119,0,116,7,59,234,
+    134,80,184,77,119,8,199,246,135,59,233,194,162,136,180,233,
+    142,252,31,221,222,54,221,209,99,125,139,162,190,54,221,49,
+    208,237,104,23,112,232,111,211,61,113,172,238,0,26,108,211,
+    141,227,147,104,232,30,247,4,218,79,27,122,169,113,224,198,
+    142,112,39,208,240,61,46,165,162,17,160,147,104,20,232,41,
+    52,6,244,53,116,2,232,105,52,142,78,222,227,83,175,163,
+    56,164,200,132,19,105,93,172,107,133,169,227,86,117,83,123,
+    102,107,171,48,184,137,179,111,191,243,78,107,247,66,114,109,
+    203,160,106,206,34,182,74,177,137,168,74,240,237,60,24,163,
+    42,228,26,188,232,216,184,131,25,151,230,44,147,98,90,80,
+    87,119,96,168,172,106,179,126,96,26,19,205,182,136,202,140,
+    104,96,196,218,152,47,76,175,102,172,187,42,178,238,154,135,
+    214,12,83,213,97,100,144,171,235,154,126,43,7,6,105,158,
+    96,194,32,43,76,253,86,219,54,178,249,172,106,230,179,235,
+    152,48,37,43,111,83,27,166,96,152,155,13,35,142,248,86,
+    150,22,206,172,25,89,172,174,227,13,139,96,21,111,27,54,
+    83,65,121,172,218,150,154,1,211,172,119,142,88,155,108,4,
+    210,197,204,191,119,189,49,77,232,164,106,200,181,234,149,26,
+    230,102,18,152,171,249,117,234,49,22,231,222,160,204,150,63,
+    106,33,234,105,46,206,185,236,60,197,133,129,134,246,33,243,
+    249,127,225,42,68,102,87,62,83,13,132,77,219,216,48,48,
+    41,140,173,108,237,80,67,215,50,234,42,43,143,118,147,236,
+    57,203,247,66,252,208,229,133,63,0,168,96,20,169,186,101,
+    218,120,219,166,122,163,36,192,197,218,172,252,190,100,165,6,
+    74,58,15,203,65,88,118,100,219,200,130,59,132,101,254,119,
+    188,35,234,25,74,153,170,74,88,14,56,74,22,103,45,178,
+    195,106,36,46,140,181,21,186,38,217,22,40,83,134,86,145,
+    251,177,119,120,111,219,173,106,191,96,252,121,119,96,50,194,
+    186,55,13,27,97,232,25,4,167,117,77,223,130,85,115,178,
+    109,228,86,113,166,121,240,193,189,252,207,15,206,173,130,179,
+    203,190,211,18,197,153,141,230,225,195,58,224,104,227,53,23,
+    78,90,136,183,141,222,34,205,49,179,222,224,213,96,104,79,
+    250,69,131,147,113,230,181,235,250,68,155,235,163,158,245,69,
+    8,33,33,249,156,61,11,193,36,86,38,3,171,225,87,29,
+    231,209,65,147,50,195,167,24,113,39,35,52,77,70,246,39,
+    243,173,59,25,187,105,162,187,16,148,214,58,68,46,217,98,
+    179,252,102,67,210,186,227,32,225,150,187,95,145,137,102,157,
+    57,238,198,208,151,130,221,117,104,1,137,187,194,95,225,164,
+    240,119,177,181,63,207,221,143,49,88,118,249,93,46,45,53,
+    180,129,147,8,44,59,97,47,204,40,205,202,12,245,82,62,
+    192,66,54,83,80,212,247,160,52,120,130,68,192,233,218,210,
+    168,102,219,196,17,51,216,36,83,12,78,9,111,99,221,145,
+    152,70,66,36,42,99,5,253,30,14,159,163,204,63,85,173,
+    99,223,15,153,99,194,249,99,214,29,111,133,233,20,38,219,
+    65,63,162,114,135,69,208,114,87,192,15,74,255,131,139,143,
+    39,202,74,162,162,36,106,156,212,61,249,79,250,253,197,202,
+    133,107,229,228,124,37,57,255,239,190,131,228,82,41,185,84,
+    29,26,173,12,189,81,227,248,240,57,151,60,224,127,136,14,
+    150,134,206,60,254,29,16,239,46,71,207,86,162,103,75,238,
+    93,19,125,197,154,204,141,78,238,205,221,95,220,131,159,23,
+    92,233,16,94,55,176,110,112,223,116,131,187,203,237,115,157,
+    174,93,190,29,254,198,154,76,240,228,28,123,72,30,84,221,
+    117,228,13,211,81,242,230,225,75,168,241,194,10,173,228,97,
+    88,7,177,183,142,208,135,153,140,135,224,120,103,4,125,249,
+    151,12,190,56,87,79,160,103,193,137,131,224,196,126,119,57,
+    56,93,9,78,151,252,251,232,66,14,248,190,126,250,51,190,
+    222,228,143,105,31,46,230,150,163,105,51,26,34,57,207,92,
+    138,192,30,153,166,80,123,235,235,38,2,149,175,233,61,33,
+    120,104,137,235,121,74,5,23,12,15,138,158,186,171,87,243,
+    180,48,218,25,5,16,21,25,0,23,15,1,136,31,4,227,
+    213,80,111,37,52,190,47,86,212,243,223,207,86,46,206,191,
+    16,133,238,158,87,28,144,90,43,113,129,89,214,253,3,59,
+    187,4,31,153,37,15,25,1,146,234,16,15,161,9,3,46,
+    221,192,0,241,155,44,249,26,40,108,114,71,82,81,88,46,
+    244,34,55,236,51,190,255,144,115,178,199,114,130,62,70,100,
+    26,58,120,201,215,155,110,172,147,122,138,122,64,9,134,238,
+    8,72,119,68,227,46,16,116,87,167,129,250,18,170,3,55,
+    12,155,236,10,49,238,64,121,91,205,101,12,251,227,183,102,
+    189,141,96,170,13,197,99,244,254,204,32,61,227,65,26,27,
+    217,147,238,43,213,193,216,95,62,130,70,119,117,60,89,58,
+    249,230,158,84,9,142,85,39,38,217,51,94,114,111,23,73,
+    112,114,57,49,69,216,233,153,40,140,176,243,178,35,217,240,
+    57,225,4,53,182,107,107,186,13,113,221,222,78,111,65,245,
+    199,4,82,4,218,122,70,163,212,81,62,245,246,124,182,172,
+    93,20,156,192,138,70,180,172,35,123,135,30,71,134,87,216,
+    191,29,81,51,119,28,153,122,76,233,170,101,101,28,5,131,
+    9,27,142,91,176,181,57,34,212,116,103,48,171,109,167,155,
+    206,49,76,66,157,174,143,193,87,83,223,113,34,254,33,37,
+    13,14,235,183,220,47,8,167,199,59,86,176,51,155,163,252,
+    30,150,151,69,188,25,4,63,51,169,177,105,194,87,144,4,
+    49,162,78,128,186,15,153,5,205,64,78,55,117,143,23,172,
+    217,3,39,138,250,214,230,40,174,95,89,108,111,89,136,140,
+    49,56,88,158,146,73,70,78,51,194,106,133,155,34,228,18,
+    35,191,225,252,93,205,253,168,97,161,36,253,62,185,204,98,
+    242,47,190,245,83,232,68,113,174,218,59,80,92,168,246,93,
+    46,46,85,163,83,197,69,40,113,161,225,189,43,165,225,133,
+    178,178,88,81,22,139,115,192,137,12,124,253,197,87,95,60,
+    158,250,219,116,105,106,161,28,94,172,132,23,139,243,181,30,
+    110,96,228,209,244,195,233,106,48,92,234,189,2,41,50,32,
+    67,138,12,200,197,143,106,33,46,62,249,143,203,223,92,174,
+    6,187,75,202,5,16,197,153,40,46,151,164,145,90,132,139,
+    157,120,116,227,225,13,183,219,187,32,139,49,89,76,46,46,
+    131,197,254,225,103,125,167,15,250,78,87,131,145,82,244,19,
+    16,246,51,97,191,92,92,2,97,104,248,153,50,113,160,76,
+    236,11,165,211,191,46,43,151,42,202,37,152,63,112,67,234,
+    65,72,221,239,47,189,254,78,57,116,165,18,186,82,188,86,
+    11,178,73,127,254,213,231,15,72,233,196,153,114,248,108,37,
+    124,182,56,95,141,14,61,138,60,140,60,190,93,58,245,126,
+    57,250,65,37,250,65,113,177,218,23,123,52,254,112,124,159,
+    47,189,246,97,185,239,106,165,239,106,113,233,199,64,180,38,
+    240,129,17,40,250,129,145,23,34,39,247,221,251,163,199,144,
+    161,205,90,67,76,52,212,36,26,170,201,124,32,204,184,117,
+    210,254,26,8,76,214,184,6,137,240,129,51,76,80,39,178,
+    24,128,122,210,32,61,82,224,20,108,95,157,137,23,92,22,
+    210,229,68,151,51,146,125,123,198,114,191,218,233,76,203,71,
+    60,97,181,196,233,6,113,142,45,65,234,4,89,147,88,219,
+    59,78,207,170,110,229,48,186,6,75,205,251,84,238,63,186,
+    112,126,10,190,235,125,152,191,79,254,196,121,135,40,250,13,
+    16,216,12,121,190,182,192,115,252,133,18,119,190,249,174,114,
+    195,37,255,174,114,177,146,127,215,162,60,207,54,219,35,228,
+    193,210,11,246,120,117,200,141,173,240,60,56,217,153,62,184,
+    241,194,125,190,58,70,238,206,253,127,233,37,71,208,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/testers/traffic_gen/BaseTrafficGen.py",
+    "m5.objects.BaseTrafficGen",
+    embedded_module_data,
+    2222,
+    4423);
+
+} // anonymous namespace
+} // namespace gem5
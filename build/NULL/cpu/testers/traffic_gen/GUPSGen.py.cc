@@ -0,0 +1,95 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,85,205,111,27,69,20,159,245,218,142,63,243,253,
+    209,228,64,134,15,5,18,69,182,40,42,162,161,42,42,137,
+    154,38,38,37,106,130,144,172,74,171,241,206,56,222,102,119,
+    103,217,153,133,216,39,31,56,84,92,144,114,9,2,36,224,
+    18,9,245,159,113,81,37,172,61,69,226,196,205,81,123,226,
+    196,155,221,56,56,33,233,122,253,246,237,188,231,223,251,189,
+    223,188,93,255,133,6,142,212,217,245,229,93,48,71,136,34,
+    170,217,200,209,170,154,166,252,132,157,216,141,175,250,46,74,
+    160,117,68,245,111,17,77,50,237,88,71,232,153,222,7,169,
+    38,105,106,7,45,166,255,86,55,139,90,88,92,181,185,185,
+    207,232,231,181,39,204,148,176,160,45,153,131,69,147,253,162,
+    107,154,42,202,80,85,163,168,154,160,90,85,167,10,44,81,
+    77,81,189,154,102,67,191,102,208,21,7,203,62,201,245,125,
+    154,60,78,0,149,196,57,149,124,2,177,2,77,29,3,242,
+    51,237,124,181,8,88,195,87,97,209,52,29,186,132,48,2,
+    185,163,87,230,102,46,161,142,65,230,248,53,168,217,75,168,
+    19,215,230,230,104,254,82,238,36,228,78,93,153,91,160,197,
+    75,185,211,116,24,164,31,9,135,214,191,216,222,89,103,110,
+    235,167,28,134,99,183,97,9,124,97,27,176,229,120,54,115,
+    152,43,5,150,13,134,31,17,151,114,231,158,105,50,33,112,
+    141,185,102,195,33,254,62,22,30,51,173,186,197,40,174,53,
+    241,131,237,213,213,8,238,60,46,176,229,226,134,148,158,88,
+    41,151,45,211,46,5,114,191,196,104,80,246,124,174,170,136,
+    186,101,51,81,110,120,166,89,30,172,80,138,96,90,111,155,
+    94,80,150,76,72,230,139,178,244,73,189,110,153,198,30,115,
+    203,123,129,39,148,83,106,52,90,197,61,230,220,90,89,233,
+    55,244,214,78,19,242,29,32,13,45,65,10,243,137,228,62,
+    134,27,130,61,226,75,204,235,173,247,183,57,56,178,65,36,
+    22,13,30,216,192,158,97,147,187,46,80,130,86,36,199,28,
+    122,246,97,201,241,184,171,52,240,149,132,173,173,29,169,16,
+    8,165,190,146,161,14,184,196,6,213,136,180,220,61,28,120,
+    148,72,134,37,169,217,108,121,0,152,96,39,176,165,5,114,
+    66,109,92,83,42,27,194,106,177,214,111,59,96,95,143,82,
+    35,2,8,113,23,251,175,213,95,253,150,187,203,113,211,255,
+    85,102,95,5,196,86,237,52,136,93,87,197,37,151,176,32,
+    98,133,28,230,112,191,137,151,137,45,248,5,186,30,255,6,
+    154,135,244,155,173,59,187,176,247,110,224,212,226,133,152,156,
+    80,144,150,16,1,131,124,160,207,162,9,17,22,180,25,241,
+    80,98,243,175,153,111,169,71,183,85,222,34,7,16,114,6,
+    96,96,31,160,99,102,99,30,72,33,161,51,213,184,15,108,
+    97,171,197,253,86,229,203,6,139,244,7,101,92,46,163,106,
+    174,37,45,98,43,189,84,173,152,250,50,182,36,166,28,248,
+    168,44,86,175,171,185,85,97,143,249,64,203,33,174,201,30,
+    46,206,132,25,195,112,137,195,12,35,204,25,134,195,105,96,
+    43,191,96,24,74,158,179,200,144,97,80,110,130,147,148,77,
+    143,133,57,243,224,192,104,48,66,153,31,102,149,111,218,68,
+    136,48,181,13,204,157,48,29,207,88,152,134,91,152,142,80,
+    39,110,51,76,199,178,134,249,71,113,35,106,198,194,164,23,
+    217,123,48,49,97,78,168,233,49,72,228,111,69,29,168,1,
+    8,51,208,77,52,16,161,190,1,96,133,88,100,195,182,28,
+    75,134,227,103,178,0,87,22,176,56,45,249,41,231,118,152,
+    87,154,24,177,18,191,163,151,234,241,254,103,65,248,102,249,
+    186,135,230,236,9,41,121,77,63,13,201,145,121,19,190,34,
+    4,211,62,255,244,18,122,42,211,67,202,228,80,97,170,189,
+    214,29,251,176,189,217,29,157,111,111,156,20,199,191,127,252,
+    221,227,31,22,126,94,234,44,108,62,47,86,94,20,43,237,
+    251,39,249,233,167,31,119,102,54,159,231,43,47,242,149,246,
+    218,201,216,244,209,220,225,92,55,147,237,37,180,108,233,52,
+    149,28,79,191,66,96,218,155,189,2,26,157,250,115,100,254,
+    143,145,121,40,147,125,239,84,79,141,66,12,76,251,65,111,
+    24,77,206,30,221,62,188,13,63,236,228,55,78,245,196,36,
+    132,192,180,63,235,101,208,220,252,47,179,63,206,118,51,133,
+    206,240,39,16,154,83,161,185,116,39,57,13,177,137,27,71,
+    75,135,75,221,76,177,95,111,66,213,155,72,183,43,234,227,
+    207,247,155,125,184,152,10,111,56,183,74,60,122,195,137,210,
+    133,23,158,175,254,159,194,44,132,213,116,58,2,182,5,92,
+    159,31,156,169,245,134,50,17,20,86,74,103,238,196,131,116,
+    215,127,7,110,213,75,94,48,48,61,93,211,180,222,71,72,
+    251,160,131,110,14,158,93,52,211,233,159,93,52,221,233,159,
+    189,244,187,90,186,135,254,111,158,58,167,234,242,234,138,80,
+    68,227,95,141,13,44,251,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/testers/traffic_gen/GUPSGen.py",
+    "m5.objects.GUPSGen",
+    embedded_module_data,
+    1127,
+    1944);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,95 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,84,205,111,27,69,20,159,253,114,214,159,36,217,
+    32,146,138,192,180,77,64,78,85,71,165,234,165,66,145,72,
+    26,154,242,145,68,137,65,212,32,86,235,157,113,188,176,222,
+    117,103,199,105,108,229,96,161,28,122,66,185,209,99,79,145,
+    80,122,224,127,224,31,136,43,75,181,246,132,132,144,224,182,
+    81,202,165,39,102,118,109,215,110,151,245,250,237,155,223,188,
+    121,239,205,123,191,153,63,193,200,163,244,191,23,43,76,252,
+    2,16,64,130,13,106,66,73,16,184,46,218,98,49,250,74,
+    69,32,130,187,0,73,71,0,201,88,62,145,0,56,149,6,
+    78,74,10,82,118,65,62,241,15,31,228,5,95,45,55,44,
+    27,173,59,251,76,23,150,204,209,120,233,65,188,25,129,199,
+    195,160,36,32,80,18,217,95,66,66,73,70,98,73,193,9,
+    30,229,132,25,157,14,151,149,38,68,128,85,36,159,176,85,
+    167,194,0,13,49,37,6,75,196,96,19,49,152,26,131,37,
+    99,176,84,12,150,142,193,50,227,216,94,178,148,100,120,2,
+    101,159,230,198,103,208,52,154,60,18,94,219,99,10,77,177,
+    42,106,126,102,187,89,36,70,165,98,153,119,177,211,130,102,
+    189,177,76,177,71,49,241,150,105,132,235,123,216,89,174,55,
+    153,44,84,171,173,233,61,92,187,117,251,246,232,42,83,28,
+    169,57,143,202,123,117,145,136,122,44,176,40,98,235,247,20,
+    236,63,187,212,32,20,50,103,152,24,212,114,246,96,63,10,
+    108,120,225,168,138,97,157,184,251,22,194,8,214,48,53,174,
+    247,77,93,82,128,197,42,30,250,25,159,131,150,7,13,7,
+    90,44,111,163,108,99,184,221,164,85,215,129,110,249,7,108,
+    82,230,212,160,16,97,207,36,86,25,51,195,161,19,219,242,
+    40,116,43,195,28,70,252,57,30,53,28,19,123,133,161,241,
+    230,175,108,39,190,236,97,187,226,231,120,120,125,104,238,241,
+    10,64,248,242,154,71,204,229,255,43,225,104,201,10,245,166,
+    175,120,188,20,173,233,49,60,196,10,204,155,151,100,162,13,
+    130,28,72,102,31,201,23,188,180,126,202,36,216,160,248,30,
+    178,241,64,95,63,176,168,159,137,244,47,44,7,27,100,48,
+    218,49,28,228,214,6,118,119,136,81,243,179,175,244,29,119,
+    184,108,163,89,38,22,242,147,209,104,115,127,104,183,75,9,
+    111,67,145,31,50,119,31,19,62,34,124,167,166,60,210,112,
+    101,208,240,159,195,134,211,145,41,36,204,13,117,178,116,8,
+    158,8,32,230,25,39,230,19,49,206,230,80,56,20,15,165,
+    167,226,248,85,176,11,232,196,72,52,105,156,246,63,9,121,
+    121,211,207,110,124,242,245,186,190,189,179,85,220,90,253,234,
+    83,182,149,180,129,16,209,221,74,197,195,180,181,202,74,111,
+    50,198,217,70,179,108,152,63,66,130,31,52,44,194,56,18,
+    82,134,83,29,62,52,60,200,175,24,10,31,90,180,202,201,
+    73,221,114,163,2,189,70,189,238,178,94,229,101,194,19,242,
+    211,123,152,174,173,109,133,140,243,211,81,5,67,239,190,182,
+    233,210,123,181,186,141,107,216,161,24,173,19,226,18,182,138,
+    55,216,87,81,131,159,3,215,241,83,148,27,235,21,203,198,
+    228,18,39,128,28,114,10,66,194,175,49,242,46,19,173,217,
+    49,174,140,196,88,227,11,190,9,25,243,87,90,59,222,234,
+    166,23,2,160,38,115,61,237,157,231,218,213,103,218,213,142,
+    182,216,213,22,159,107,55,158,105,55,122,147,179,143,151,126,
+    187,22,72,96,230,163,115,32,206,228,94,112,17,0,49,155,
+    251,87,5,218,7,129,40,76,221,60,151,36,141,77,48,17,
+    0,41,155,35,89,230,124,51,47,132,253,207,167,125,85,215,
+    29,163,134,117,221,79,233,122,205,69,13,155,235,25,93,127,
+    208,48,236,254,140,76,155,117,78,212,131,3,189,138,13,198,
+    29,198,49,166,155,182,225,121,161,250,37,102,167,20,145,12,
+    47,4,187,135,86,45,7,69,16,171,31,51,196,7,188,192,
+    94,184,117,162,114,193,147,136,202,145,24,136,60,223,249,223,
+    225,206,7,191,94,122,174,125,167,55,117,179,253,89,111,114,
+    161,125,239,15,37,23,136,9,37,27,0,38,206,37,144,120,
+    235,232,126,4,76,131,228,219,143,50,199,223,117,212,43,93,
+    245,74,79,157,121,125,240,125,71,93,232,170,11,49,131,49,
+    51,189,163,46,118,213,197,24,179,111,59,234,229,174,122,121,
+    204,44,208,82,90,162,253,121,48,203,50,105,223,127,44,159,
+    41,243,29,101,190,171,204,7,98,146,165,10,6,130,167,250,
+    222,155,112,84,132,68,216,142,132,159,170,221,42,32,92,97,
+    39,223,139,104,56,199,128,232,218,243,10,171,134,135,95,241,
+    197,207,176,169,93,171,214,167,104,110,124,54,170,232,120,149,
+    95,170,31,71,173,93,33,215,251,87,187,87,97,34,144,4,
+    65,8,54,4,32,192,51,240,254,232,219,3,31,158,13,222,
+    30,184,116,54,120,131,196,130,192,210,127,83,28,175,156,243,
+    207,139,152,169,48,143,255,0,223,158,32,252,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/testers/traffic_gen/PyTrafficGen.py",
+    "m5.objects.PyTrafficGen",
+    embedded_module_data,
+    1132,
+    2112);
+
+} // anonymous namespace
+} // namespace gem5
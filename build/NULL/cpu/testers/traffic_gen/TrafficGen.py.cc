@@ -0,0 +1,53 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,81,59,111,19,65,16,158,189,179,141,237,32,112,
+    130,32,208,128,69,1,28,68,54,32,165,32,66,20,16,41,
+    188,98,33,197,213,21,172,214,183,99,223,161,123,152,221,59,
+    148,164,186,130,31,128,104,210,82,69,66,252,25,35,81,88,
+    219,82,209,29,50,21,21,183,119,113,98,164,100,31,223,204,
+    238,236,204,55,179,243,19,22,70,245,72,206,30,230,112,0,
+    28,56,241,161,95,74,210,7,3,182,128,27,31,129,155,104,
+    28,154,0,223,204,185,163,109,242,202,14,88,213,95,250,96,
+    17,69,238,58,139,113,231,239,102,155,69,92,4,155,112,176,
+    13,174,253,136,93,225,134,93,197,218,151,115,112,202,224,230,
+    33,201,153,200,49,83,189,100,82,205,190,96,195,161,231,108,
+    97,184,127,203,25,39,221,24,101,140,66,118,227,242,158,142,
+    48,92,212,59,174,187,223,26,97,176,190,177,177,224,121,239,
+    89,20,14,189,81,34,88,236,69,97,123,232,249,216,230,40,
+    29,225,13,188,112,212,142,93,108,15,208,101,31,188,40,17,
+    61,171,161,234,148,134,44,64,74,85,147,210,32,226,137,175,
+    245,243,148,190,79,152,127,100,169,196,123,99,84,77,103,119,
+    151,186,200,56,10,213,208,186,227,51,41,85,245,13,19,44,
+    80,181,157,88,228,4,106,201,41,248,169,38,254,10,51,93,
+    225,95,75,10,167,123,86,69,39,185,119,198,123,66,55,172,
+    128,251,249,150,15,114,72,143,231,116,105,53,221,156,46,63,
+    74,95,78,91,55,211,23,89,13,46,93,61,88,251,188,54,
+    185,241,250,251,202,246,143,149,237,244,149,158,162,53,143,209,
+    179,42,234,90,176,222,137,6,239,208,137,101,231,41,147,120,
+    66,167,26,185,105,172,147,151,234,194,255,166,50,141,139,26,
+    138,96,203,186,138,250,227,242,123,158,136,203,249,81,247,79,
+    190,205,33,51,9,33,217,115,2,228,206,4,110,151,107,10,
+    171,147,249,202,174,212,72,143,100,112,58,126,186,254,187,144,
+    127,206,176,23,252,255,0,124,188,194,71,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/testers/traffic_gen/TrafficGen.py",
+    "m5.objects.TrafficGen",
+    embedded_module_data,
+    459,
+    723);
+
+} // anonymous namespace
+} // namespace gem5
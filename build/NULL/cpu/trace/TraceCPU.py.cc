@@ -0,0 +1,108 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,86,205,111,19,71,20,159,245,199,198,223,73,28,
+    199,14,4,208,84,42,21,73,85,83,136,224,128,218,180,53,
+    16,154,18,28,68,194,197,32,172,205,206,216,222,176,31,102,
+    118,13,241,74,149,124,224,128,184,180,138,42,5,85,149,154,
+    83,36,196,63,99,75,62,88,115,66,226,196,205,17,156,56,
+    245,205,218,78,28,147,160,174,87,111,223,199,111,222,155,121,
+    31,35,191,67,67,79,176,255,253,176,8,100,7,17,68,36,
+    29,25,82,65,146,4,239,211,125,235,189,175,127,29,249,208,
+    45,68,252,207,17,9,80,105,207,143,208,27,255,192,73,33,
+    64,130,107,104,78,126,47,132,57,137,199,175,235,150,250,152,
+    146,213,141,77,170,58,160,144,230,213,225,160,129,65,208,152,
+    79,4,165,168,32,17,84,240,17,169,224,39,194,153,175,16,
+    36,254,130,76,199,72,224,57,218,3,224,155,131,165,133,16,
+    104,131,159,105,195,52,178,27,69,199,60,52,182,25,31,240,
+    68,222,131,120,111,124,7,171,18,62,68,199,201,216,158,4,
+    90,233,64,59,225,105,67,35,218,73,136,144,60,46,2,9,
+    147,200,136,223,169,47,96,163,35,216,20,96,167,143,197,198,
+    72,124,4,155,254,2,54,49,130,205,156,136,29,39,19,35,
+    216,25,192,158,58,22,59,73,146,35,216,211,128,157,61,22,
+    59,69,82,35,216,51,39,238,97,154,164,71,176,103,73,6,
+    90,104,134,135,214,153,162,210,235,119,239,187,127,121,28,6,
+    22,27,22,161,58,126,86,209,212,10,102,180,170,43,117,27,
+    59,194,106,227,50,53,41,83,28,74,176,102,98,5,87,153,
+    102,49,108,107,70,77,87,28,205,50,35,24,158,154,173,153,
+    101,124,131,50,237,233,234,130,240,7,16,205,177,49,17,26,
+    88,169,234,138,109,83,59,139,151,29,240,226,80,86,242,92,
+    63,211,156,10,94,185,132,85,69,173,128,213,115,229,166,213,
+    106,237,162,23,187,71,139,32,103,43,21,55,81,166,198,149,
+    107,215,6,187,87,165,161,227,10,94,12,203,7,25,121,67,
+    38,193,73,125,121,46,59,154,1,27,123,141,94,75,220,175,
+    234,182,45,112,248,211,41,155,169,23,15,163,12,60,102,171,
+    117,30,53,168,97,177,122,81,228,195,77,29,88,134,180,151,
+    193,133,61,6,164,129,222,142,103,94,108,125,16,241,255,199,
+    102,214,89,24,68,22,17,203,189,109,176,24,80,158,96,244,
+    73,77,99,112,74,47,7,110,230,32,230,81,195,213,225,176,
+    83,47,28,150,0,222,141,219,117,219,161,6,182,188,123,192,
+    157,88,54,109,135,213,84,81,23,124,215,98,142,27,190,161,
+    56,138,199,114,228,166,135,205,222,217,113,73,211,169,123,218,
+    3,17,90,165,38,161,166,90,31,178,189,159,16,97,206,231,
+    107,198,6,101,216,42,97,106,58,76,131,210,65,47,56,21,
+    138,109,199,98,20,111,212,74,37,202,220,175,79,132,233,150,
+    66,250,168,247,23,132,199,11,39,66,25,253,206,98,208,55,
+    125,120,185,151,211,238,79,238,194,157,154,238,104,85,93,3,
+    155,173,42,58,245,224,135,45,92,18,9,243,182,95,171,138,
+    254,35,214,51,115,201,189,120,115,75,115,160,177,41,244,174,
+    89,199,150,57,188,68,181,140,170,78,29,8,78,183,168,90,
+    19,121,97,98,96,220,235,203,162,73,159,42,186,216,32,160,
+    12,205,233,13,192,65,254,108,172,56,253,121,113,44,49,20,
+    166,227,13,135,85,102,212,182,177,97,151,243,115,231,120,168,
+    88,52,21,131,22,139,60,82,20,221,83,211,5,31,43,22,
+    159,212,20,189,111,25,43,22,137,165,2,19,112,234,85,202,
+    35,234,214,86,177,66,21,72,1,15,11,222,155,29,30,245,
+    62,6,117,42,22,97,226,194,101,162,50,60,120,87,97,138,
+    193,229,53,175,15,184,12,34,228,147,251,225,172,92,238,53,
+    7,143,222,19,137,177,29,175,11,162,154,215,79,197,170,39,
+    144,33,65,94,131,58,152,101,30,23,167,244,114,180,4,13,
+    192,227,4,154,227,80,12,221,55,109,173,108,82,194,199,109,
+    205,165,107,162,254,57,175,82,60,33,20,43,80,233,190,60,
+    38,228,123,171,57,30,92,130,250,59,60,33,42,116,88,68,
+    30,200,89,150,206,199,169,169,108,232,244,166,194,244,186,168,
+    21,159,26,36,241,142,93,30,148,161,55,59,162,229,189,169,
+    97,242,128,204,137,177,88,151,196,88,12,126,93,159,47,24,
+    234,34,65,66,40,150,110,220,232,76,206,53,126,235,76,224,
+    198,242,219,224,68,215,39,5,103,186,8,200,190,31,201,147,
+    207,31,244,20,50,240,130,75,9,83,106,200,148,2,83,98,
+    234,143,135,47,31,190,250,230,159,249,93,171,21,191,218,142,
+    95,109,44,189,77,158,253,243,219,230,185,239,91,201,75,237,
+    228,165,198,237,142,144,95,61,110,37,231,219,201,121,16,83,
+    167,118,86,182,87,118,147,205,243,63,182,82,139,237,212,98,
+    227,206,144,238,151,86,42,215,78,229,64,151,158,221,49,183,
+    205,78,40,210,140,45,236,251,125,25,249,35,2,210,88,133,
+    176,96,122,180,253,104,55,215,188,144,111,77,175,182,167,87,
+    27,249,14,108,197,124,105,190,186,215,252,234,118,43,177,210,
+    78,172,52,110,117,99,2,249,96,251,65,39,20,109,198,115,
+    224,36,45,156,164,229,70,30,76,153,51,59,155,219,155,157,
+    80,188,57,254,243,17,255,9,52,139,255,205,254,157,237,132,
+    194,144,177,240,204,126,48,56,11,70,32,205,64,166,247,246,
+    18,46,210,156,159,11,242,25,227,74,182,119,207,216,217,35,
+    127,63,152,184,236,120,24,204,85,209,140,54,15,9,150,89,
+    91,245,94,157,142,214,238,83,232,135,222,32,44,178,133,254,
+    101,105,151,196,132,251,37,73,234,254,42,33,105,161,137,46,
+    15,191,29,148,105,14,222,14,74,55,7,111,87,94,144,228,
+    46,250,156,188,248,125,95,124,62,30,99,242,246,241,31,175,
+    112,143,209,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/cpu/trace/TraceCPU.py",
+    "m5.objects.TraceCPU",
+    embedded_module_data,
+    1331,
+    2464);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_AddrRanges_HH__
+#define __DEBUG_AddrRanges_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union AddrRanges
+{
+    ~AddrRanges() {}
+    SimpleFlag AddrRanges = {
+        "AddrRanges", "", false
+    };
+} AddrRanges;
+} // namespace unions
+
+inline constexpr const auto& AddrRanges =
+    ::gem5::debug::unions::AddrRanges.AddrRanges;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_AddrRanges_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_BaseXBar_HH__
+#define __DEBUG_BaseXBar_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union BaseXBar
+{
+    ~BaseXBar() {}
+    SimpleFlag BaseXBar = {
+        "BaseXBar", "", false
+    };
+} BaseXBar;
+} // namespace unions
+
+inline constexpr const auto& BaseXBar =
+    ::gem5::debug::unions::BaseXBar.BaseXBar;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_BaseXBar_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_Bridge_HH__
+#define __DEBUG_Bridge_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union Bridge
+{
+    ~Bridge() {}
+    SimpleFlag Bridge = {
+        "Bridge", "", false
+    };
+} Bridge;
+} // namespace unions
+
+inline constexpr const auto& Bridge =
+    ::gem5::debug::unions::Bridge.Bridge;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_Bridge_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_CCRegs_HH__
+#define __DEBUG_CCRegs_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union CCRegs
+{
+    ~CCRegs() {}
+    SimpleFlag CCRegs = {
+        "CCRegs", "", false
+    };
+} CCRegs;
+} // namespace unions
+
+inline constexpr const auto& CCRegs =
+    ::gem5::debug::unions::CCRegs.CCRegs;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_CCRegs_HH__
@@ -0,0 +1,7 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflagcc.py:50
+ */
+
+#include "debug/CFI.hh"
@@ -0,0 +1,50 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_CacheAll_HH__
+#define __DEBUG_CacheAll_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+#include "debug/Cache.hh"
+#include "debug/CacheComp.hh"
+#include "debug/CachePort.hh"
+#include "debug/CacheRepl.hh"
+#include "debug/CacheVerbose.hh"
+#include "debug/HWPrefetch.hh"
+#include "debug/MSHR.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union CacheAll
+{
+    ~CacheAll() {}
+    CompoundFlag CacheAll = {
+        "CacheAll", "", {
+            (Flag *)&::gem5::debug::Cache,
+            (Flag *)&::gem5::debug::CacheComp,
+            (Flag *)&::gem5::debug::CachePort,
+            (Flag *)&::gem5::debug::CacheRepl,
+            (Flag *)&::gem5::debug::CacheVerbose,
+            (Flag *)&::gem5::debug::HWPrefetch,
+            (Flag *)&::gem5::debug::MSHR
+        }
+    };
+} CacheAll;
+} // namespace unions
+
+inline constexpr const auto& CacheAll =
+    ::gem5::debug::unions::CacheAll.CacheAll;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_CacheAll_HH__
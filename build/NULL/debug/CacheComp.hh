@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_CacheComp_HH__
+#define __DEBUG_CacheComp_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union CacheComp
+{
+    ~CacheComp() {}
+    SimpleFlag CacheComp = {
+        "CacheComp", "", false
+    };
+} CacheComp;
+} // namespace unions
+
+inline constexpr const auto& CacheComp =
+    ::gem5::debug::unions::CacheComp.CacheComp;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_CacheComp_HH__
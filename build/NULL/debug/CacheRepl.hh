@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_CacheRepl_HH__
+#define __DEBUG_CacheRepl_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union CacheRepl
+{
+    ~CacheRepl() {}
+    SimpleFlag CacheRepl = {
+        "CacheRepl", "", false
+    };
+} CacheRepl;
+} // namespace unions
+
+inline constexpr const auto& CacheRepl =
+    ::gem5::debug::unions::CacheRepl.CacheRepl;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_CacheRepl_HH__
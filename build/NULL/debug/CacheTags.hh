@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_CacheTags_HH__
+#define __DEBUG_CacheTags_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union CacheTags
+{
+    ~CacheTags() {}
+    SimpleFlag CacheTags = {
+        "CacheTags", "", false
+    };
+} CacheTags;
+} // namespace unions
+
+inline constexpr const auto& CacheTags =
+    ::gem5::debug::unions::CacheTags.CacheTags;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_CacheTags_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_CacheVerbose_HH__
+#define __DEBUG_CacheVerbose_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union CacheVerbose
+{
+    ~CacheVerbose() {}
+    SimpleFlag CacheVerbose = {
+        "CacheVerbose", "", false
+    };
+} CacheVerbose;
+} // namespace unions
+
+inline constexpr const auto& CacheVerbose =
+    ::gem5::debug::unions::CacheVerbose.CacheVerbose;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_CacheVerbose_HH__
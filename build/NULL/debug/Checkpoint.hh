@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_Checkpoint_HH__
+#define __DEBUG_Checkpoint_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union Checkpoint
+{
+    ~Checkpoint() {}
+    SimpleFlag Checkpoint = {
+        "Checkpoint", "", false
+    };
+} Checkpoint;
+} // namespace unions
+
+inline constexpr const auto& Checkpoint =
+    ::gem5::debug::unions::Checkpoint.Checkpoint;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_Checkpoint_HH__
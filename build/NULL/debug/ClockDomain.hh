@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_ClockDomain_HH__
+#define __DEBUG_ClockDomain_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union ClockDomain
+{
+    ~ClockDomain() {}
+    SimpleFlag ClockDomain = {
+        "ClockDomain", "", false
+    };
+} ClockDomain;
+} // namespace unions
+
+inline constexpr const auto& ClockDomain =
+    ::gem5::debug::unions::ClockDomain.ClockDomain;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_ClockDomain_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_CoherentXBar_HH__
+#define __DEBUG_CoherentXBar_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union CoherentXBar
+{
+    ~CoherentXBar() {}
+    SimpleFlag CoherentXBar = {
+        "CoherentXBar", "", false
+    };
+} CoherentXBar;
+} // namespace unions
+
+inline constexpr const auto& CoherentXBar =
+    ::gem5::debug::unions::CoherentXBar.CoherentXBar;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_CoherentXBar_HH__
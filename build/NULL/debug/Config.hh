@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_Config_HH__
+#define __DEBUG_Config_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union Config
+{
+    ~Config() {}
+    SimpleFlag Config = {
+        "Config", "", false
+    };
+} Config;
+} // namespace unions
+
+inline constexpr const auto& Config =
+    ::gem5::debug::unions::Config.Config;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_Config_HH__
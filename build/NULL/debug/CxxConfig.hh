@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_CxxConfig_HH__
+#define __DEBUG_CxxConfig_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union CxxConfig
+{
+    ~CxxConfig() {}
+    SimpleFlag CxxConfig = {
+        "CxxConfig", "", false
+    };
+} CxxConfig;
+} // namespace unions
+
+inline constexpr const auto& CxxConfig =
+    ::gem5::debug::unions::CxxConfig.CxxConfig;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_CxxConfig_HH__
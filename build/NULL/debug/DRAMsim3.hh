@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_DRAMsim3_HH__
+#define __DEBUG_DRAMsim3_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union DRAMsim3
+{
+    ~DRAMsim3() {}
+    SimpleFlag DRAMsim3 = {
+        "DRAMsim3", "", false
+    };
+} DRAMsim3;
+} // namespace unions
+
+inline constexpr const auto& DRAMsim3 =
+    ::gem5::debug::unions::DRAMsim3.DRAMsim3;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_DRAMsim3_HH__
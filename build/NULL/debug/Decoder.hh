@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_Decoder_HH__
+#define __DEBUG_Decoder_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union Decoder
+{
+    ~Decoder() {}
+    SimpleFlag Decoder = {
+        "Decoder", "Decoder debug output", false
+    };
+} Decoder;
+} // namespace unions
+
+inline constexpr const auto& Decoder =
+    ::gem5::debug::unions::Decoder.Decoder;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_Decoder_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_DiskImageRead_HH__
+#define __DEBUG_DiskImageRead_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union DiskImageRead
+{
+    ~DiskImageRead() {}
+    SimpleFlag DiskImageRead = {
+        "DiskImageRead", "", false
+    };
+} DiskImageRead;
+} // namespace unions
+
+inline constexpr const auto& DiskImageRead =
+    ::gem5::debug::unions::DiskImageRead.DiskImageRead;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_DiskImageRead_HH__
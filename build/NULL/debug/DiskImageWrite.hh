@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_DiskImageWrite_HH__
+#define __DEBUG_DiskImageWrite_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union DiskImageWrite
+{
+    ~DiskImageWrite() {}
+    SimpleFlag DiskImageWrite = {
+        "DiskImageWrite", "", false
+    };
+} DiskImageWrite;
+} // namespace unions
+
+inline constexpr const auto& DiskImageWrite =
+    ::gem5::debug::unions::DiskImageWrite.DiskImageWrite;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_DiskImageWrite_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_DistEthernet_HH__
+#define __DEBUG_DistEthernet_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union DistEthernet
+{
+    ~DistEthernet() {}
+    SimpleFlag DistEthernet = {
+        "DistEthernet", "", false
+    };
+} DistEthernet;
+} // namespace unions
+
+inline constexpr const auto& DistEthernet =
+    ::gem5::debug::unions::DistEthernet.DistEthernet;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_DistEthernet_HH__
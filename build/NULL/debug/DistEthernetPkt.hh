@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_DistEthernetPkt_HH__
+#define __DEBUG_DistEthernetPkt_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union DistEthernetPkt
+{
+    ~DistEthernetPkt() {}
+    SimpleFlag DistEthernetPkt = {
+        "DistEthernetPkt", "", false
+    };
+} DistEthernetPkt;
+} // namespace unions
+
+inline constexpr const auto& DistEthernetPkt =
+    ::gem5::debug::unions::DistEthernetPkt.DistEthernetPkt;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_DistEthernetPkt_HH__
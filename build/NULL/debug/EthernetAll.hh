@@ -0,0 +1,54 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_EthernetAll_HH__
+#define __DEBUG_EthernetAll_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+#include "debug/Ethernet.hh"
+#include "debug/EthernetPIO.hh"
+#include "debug/EthernetDMA.hh"
+#include "debug/EthernetData.hh"
+#include "debug/EthernetDesc.hh"
+#include "debug/EthernetIntr.hh"
+#include "debug/EthernetSM.hh"
+#include "debug/EthernetCksum.hh"
+#include "debug/EthernetEEPROM.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union EthernetAll
+{
+    ~EthernetAll() {}
+    CompoundFlag EthernetAll = {
+        "EthernetAll", "", {
+            (Flag *)&::gem5::debug::Ethernet,
+            (Flag *)&::gem5::debug::EthernetPIO,
+            (Flag *)&::gem5::debug::EthernetDMA,
+            (Flag *)&::gem5::debug::EthernetData,
+            (Flag *)&::gem5::debug::EthernetDesc,
+            (Flag *)&::gem5::debug::EthernetIntr,
+            (Flag *)&::gem5::debug::EthernetSM,
+            (Flag *)&::gem5::debug::EthernetCksum,
+            (Flag *)&::gem5::debug::EthernetEEPROM
+        }
+    };
+} EthernetAll;
+} // namespace unions
+
+inline constexpr const auto& EthernetAll =
+    ::gem5::debug::unions::EthernetAll.EthernetAll;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_EthernetAll_HH__
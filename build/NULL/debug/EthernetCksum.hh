@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_EthernetCksum_HH__
+#define __DEBUG_EthernetCksum_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union EthernetCksum
+{
+    ~EthernetCksum() {}
+    SimpleFlag EthernetCksum = {
+        "EthernetCksum", "", false
+    };
+} EthernetCksum;
+} // namespace unions
+
+inline constexpr const auto& EthernetCksum =
+    ::gem5::debug::unions::EthernetCksum.EthernetCksum;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_EthernetCksum_HH__
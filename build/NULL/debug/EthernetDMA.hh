@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_EthernetDMA_HH__
+#define __DEBUG_EthernetDMA_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union EthernetDMA
+{
+    ~EthernetDMA() {}
+    SimpleFlag EthernetDMA = {
+        "EthernetDMA", "", false
+    };
+} EthernetDMA;
+} // namespace unions
+
+inline constexpr const auto& EthernetDMA =
+    ::gem5::debug::unions::EthernetDMA.EthernetDMA;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_EthernetDMA_HH__
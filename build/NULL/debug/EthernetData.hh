@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_EthernetData_HH__
+#define __DEBUG_EthernetData_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union EthernetData
+{
+    ~EthernetData() {}
+    SimpleFlag EthernetData = {
+        "EthernetData", "", false
+    };
+} EthernetData;
+} // namespace unions
+
+inline constexpr const auto& EthernetData =
+    ::gem5::debug::unions::EthernetData.EthernetData;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_EthernetData_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_EthernetEEPROM_HH__
+#define __DEBUG_EthernetEEPROM_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union EthernetEEPROM
+{
+    ~EthernetEEPROM() {}
+    SimpleFlag EthernetEEPROM = {
+        "EthernetEEPROM", "", false
+    };
+} EthernetEEPROM;
+} // namespace unions
+
+inline constexpr const auto& EthernetEEPROM =
+    ::gem5::debug::unions::EthernetEEPROM.EthernetEEPROM;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_EthernetEEPROM_HH__
@@ -0,0 +1,48 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_EthernetNoData_HH__
+#define __DEBUG_EthernetNoData_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+#include "debug/Ethernet.hh"
+#include "debug/EthernetPIO.hh"
+#include "debug/EthernetDesc.hh"
+#include "debug/EthernetIntr.hh"
+#include "debug/EthernetSM.hh"
+#include "debug/EthernetCksum.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union EthernetNoData
+{
+    ~EthernetNoData() {}
+    CompoundFlag EthernetNoData = {
+        "EthernetNoData", "", {
+            (Flag *)&::gem5::debug::Ethernet,
+            (Flag *)&::gem5::debug::EthernetPIO,
+            (Flag *)&::gem5::debug::EthernetDesc,
+            (Flag *)&::gem5::debug::EthernetIntr,
+            (Flag *)&::gem5::debug::EthernetSM,
+            (Flag *)&::gem5::debug::EthernetCksum
+        }
+    };
+} EthernetNoData;
+} // namespace unions
+
+inline constexpr const auto& EthernetNoData =
+    ::gem5::debug::unions::EthernetNoData.EthernetNoData;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_EthernetNoData_HH__
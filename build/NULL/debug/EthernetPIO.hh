@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_EthernetPIO_HH__
+#define __DEBUG_EthernetPIO_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union EthernetPIO
+{
+    ~EthernetPIO() {}
+    SimpleFlag EthernetPIO = {
+        "EthernetPIO", "", false
+    };
+} EthernetPIO;
+} // namespace unions
+
+inline constexpr const auto& EthernetPIO =
+    ::gem5::debug::unions::EthernetPIO.EthernetPIO;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_EthernetPIO_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_Event_HH__
+#define __DEBUG_Event_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union Event
+{
+    ~Event() {}
+    SimpleFlag Event = {
+        "Event", "", false
+    };
+} Event;
+} // namespace unions
+
+inline constexpr const auto& Event =
+    ::gem5::debug::unions::Event.Event;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_Event_HH__
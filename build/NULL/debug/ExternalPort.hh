@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_ExternalPort_HH__
+#define __DEBUG_ExternalPort_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union ExternalPort
+{
+    ~ExternalPort() {}
+    SimpleFlag ExternalPort = {
+        "ExternalPort", "", false
+    };
+} ExternalPort;
+} // namespace unions
+
+inline constexpr const auto& ExternalPort =
+    ::gem5::debug::unions::ExternalPort.ExternalPort;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_ExternalPort_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_Faults_HH__
+#define __DEBUG_Faults_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union Faults
+{
+    ~Faults() {}
+    SimpleFlag Faults = {
+        "Faults", "Information about faults, exceptions, interrupts, etc", false
+    };
+} Faults;
+} // namespace unions
+
+inline constexpr const auto& Faults =
+    ::gem5::debug::unions::Faults.Faults;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_Faults_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_FloatRegs_HH__
+#define __DEBUG_FloatRegs_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union FloatRegs
+{
+    ~FloatRegs() {}
+    SimpleFlag FloatRegs = {
+        "FloatRegs", "", false
+    };
+} FloatRegs;
+} // namespace unions
+
+inline constexpr const auto& FloatRegs =
+    ::gem5::debug::unions::FloatRegs.FloatRegs;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_FloatRegs_HH__
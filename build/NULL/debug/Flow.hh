@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_Flow_HH__
+#define __DEBUG_Flow_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union Flow
+{
+    ~Flow() {}
+    SimpleFlag Flow = {
+        "Flow", "", false
+    };
+} Flow;
+} // namespace unions
+
+inline constexpr const auto& Flow =
+    ::gem5::debug::unions::Flow.Flow;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_Flow_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_HWPrefetch_HH__
+#define __DEBUG_HWPrefetch_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union HWPrefetch
+{
+    ~HWPrefetch() {}
+    SimpleFlag HWPrefetch = {
+        "HWPrefetch", "", false
+    };
+} HWPrefetch;
+} // namespace unions
+
+inline constexpr const auto& HWPrefetch =
+    ::gem5::debug::unions::HWPrefetch.HWPrefetch;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_HWPrefetch_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_HelloExample_HH__
+#define __DEBUG_HelloExample_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union HelloExample
+{
+    ~HelloExample() {}
+    SimpleFlag HelloExample = {
+        "HelloExample", "For Learning gem5 Part 2. Simple example debug flag", false
+    };
+} HelloExample;
+} // namespace unions
+
+inline constexpr const auto& HelloExample =
+    ::gem5::debug::unions::HelloExample.HelloExample;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_HelloExample_HH__
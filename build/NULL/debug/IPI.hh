@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_IPI_HH__
+#define __DEBUG_IPI_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union IPI
+{
+    ~IPI() {}
+    SimpleFlag IPI = {
+        "IPI", "", false
+    };
+} IPI;
+} // namespace unions
+
+inline constexpr const auto& IPI =
+    ::gem5::debug::unions::IPI.IPI;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_IPI_HH__
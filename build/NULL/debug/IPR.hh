@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_IPR_HH__
+#define __DEBUG_IPR_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union IPR
+{
+    ~IPR() {}
+    SimpleFlag IPR = {
+        "IPR", "", false
+    };
+} IPR;
+} // namespace unions
+
+inline constexpr const auto& IPR =
+    ::gem5::debug::unions::IPR.IPR;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_IPR_HH__
@@ -0,0 +1,40 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_IdeAll_HH__
+#define __DEBUG_IdeAll_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+#include "debug/IdeCtrl.hh"
+#include "debug/IdeDisk.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union IdeAll
+{
+    ~IdeAll() {}
+    CompoundFlag IdeAll = {
+        "IdeAll", "", {
+            (Flag *)&::gem5::debug::IdeCtrl,
+            (Flag *)&::gem5::debug::IdeDisk
+        }
+    };
+} IdeAll;
+} // namespace unions
+
+inline constexpr const auto& IdeAll =
+    ::gem5::debug::unions::IdeAll.IdeAll;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_IdeAll_HH__
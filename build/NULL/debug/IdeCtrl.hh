@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_IdeCtrl_HH__
+#define __DEBUG_IdeCtrl_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union IdeCtrl
+{
+    ~IdeCtrl() {}
+    SimpleFlag IdeCtrl = {
+        "IdeCtrl", "", false
+    };
+} IdeCtrl;
+} // namespace unions
+
+inline constexpr const auto& IdeCtrl =
+    ::gem5::debug::unions::IdeCtrl.IdeCtrl;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_IdeCtrl_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_IdeDisk_HH__
+#define __DEBUG_IdeDisk_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union IdeDisk
+{
+    ~IdeDisk() {}
+    SimpleFlag IdeDisk = {
+        "IdeDisk", "", false
+    };
+} IdeDisk;
+} // namespace unions
+
+inline constexpr const auto& IdeDisk =
+    ::gem5::debug::unions::IdeDisk.IdeDisk;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_IdeDisk_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_IntRegs_HH__
+#define __DEBUG_IntRegs_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union IntRegs
+{
+    ~IntRegs() {}
+    SimpleFlag IntRegs = {
+        "IntRegs", "", false
+    };
+} IntRegs;
+} // namespace unions
+
+inline constexpr const auto& IntRegs =
+    ::gem5::debug::unions::IntRegs.IntRegs;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_IntRegs_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_Interrupt_HH__
+#define __DEBUG_Interrupt_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union Interrupt
+{
+    ~Interrupt() {}
+    SimpleFlag Interrupt = {
+        "Interrupt", "", false
+    };
+} Interrupt;
+} // namespace unions
+
+inline constexpr const auto& Interrupt =
+    ::gem5::debug::unions::Interrupt.Interrupt;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_Interrupt_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_InvalidReg_HH__
+#define __DEBUG_InvalidReg_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union InvalidReg
+{
+    ~InvalidReg() {}
+    SimpleFlag InvalidReg = {
+        "InvalidReg", "", false
+    };
+} InvalidReg;
+} // namespace unions
+
+inline constexpr const auto& InvalidReg =
+    ::gem5::debug::unions::InvalidReg.InvalidReg;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_InvalidReg_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_LLSC_HH__
+#define __DEBUG_LLSC_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union LLSC
+{
+    ~LLSC() {}
+    SimpleFlag LLSC = {
+        "LLSC", "", false
+    };
+} LLSC;
+} // namespace unions
+
+inline constexpr const auto& LLSC =
+    ::gem5::debug::unions::LLSC.LLSC;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_LLSC_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_LupioIPI_HH__
+#define __DEBUG_LupioIPI_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union LupioIPI
+{
+    ~LupioIPI() {}
+    SimpleFlag LupioIPI = {
+        "LupioIPI", "", false
+    };
+} LupioIPI;
+} // namespace unions
+
+inline constexpr const auto& LupioIPI =
+    ::gem5::debug::unions::LupioIPI.LupioIPI;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_LupioIPI_HH__
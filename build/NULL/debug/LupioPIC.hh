@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_LupioPIC_HH__
+#define __DEBUG_LupioPIC_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union LupioPIC
+{
+    ~LupioPIC() {}
+    SimpleFlag LupioPIC = {
+        "LupioPIC", "", false
+    };
+} LupioPIC;
+} // namespace unions
+
+inline constexpr const auto& LupioPIC =
+    ::gem5::debug::unions::LupioPIC.LupioPIC;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_LupioPIC_HH__
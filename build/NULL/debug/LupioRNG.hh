@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_LupioRNG_HH__
+#define __DEBUG_LupioRNG_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union LupioRNG
+{
+    ~LupioRNG() {}
+    SimpleFlag LupioRNG = {
+        "LupioRNG", "", false
+    };
+} LupioRNG;
+} // namespace unions
+
+inline constexpr const auto& LupioRNG =
+    ::gem5::debug::unions::LupioRNG.LupioRNG;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_LupioRNG_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_LupioTMR_HH__
+#define __DEBUG_LupioTMR_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union LupioTMR
+{
+    ~LupioTMR() {}
+    SimpleFlag LupioTMR = {
+        "LupioTMR", "", false
+    };
+} LupioTMR;
+} // namespace unions
+
+inline constexpr const auto& LupioTMR =
+    ::gem5::debug::unions::LupioTMR.LupioTMR;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_LupioTMR_HH__
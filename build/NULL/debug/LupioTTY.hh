@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_LupioTTY_HH__
+#define __DEBUG_LupioTTY_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union LupioTTY
+{
+    ~LupioTTY() {}
+    SimpleFlag LupioTTY = {
+        "LupioTTY", "", false
+    };
+} LupioTTY;
+} // namespace unions
+
+inline constexpr const auto& LupioTTY =
+    ::gem5::debug::unions::LupioTTY.LupioTTY;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_LupioTTY_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_MC146818_HH__
+#define __DEBUG_MC146818_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union MC146818
+{
+    ~MC146818() {}
+    SimpleFlag MC146818 = {
+        "MC146818", "", false
+    };
+} MC146818;
+} // namespace unions
+
+inline constexpr const auto& MC146818 =
+    ::gem5::debug::unions::MC146818.MC146818;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_MC146818_HH__
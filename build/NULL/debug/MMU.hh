@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_MMU_HH__
+#define __DEBUG_MMU_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union MMU
+{
+    ~MMU() {}
+    SimpleFlag MMU = {
+        "MMU", "", false
+    };
+} MMU;
+} // namespace unions
+
+inline constexpr const auto& MMU =
+    ::gem5::debug::unions::MMU.MMU;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_MMU_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_MSHR_HH__
+#define __DEBUG_MSHR_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union MSHR
+{
+    ~MSHR() {}
+    SimpleFlag MSHR = {
+        "MSHR", "", false
+    };
+} MSHR;
+} // namespace unions
+
+inline constexpr const auto& MSHR =
+    ::gem5::debug::unions::MSHR.MSHR;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_MSHR_HH__
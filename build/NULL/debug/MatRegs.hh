@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_MatRegs_HH__
+#define __DEBUG_MatRegs_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union MatRegs
+{
+    ~MatRegs() {}
+    SimpleFlag MatRegs = {
+        "MatRegs", "", false
+    };
+} MatRegs;
+} // namespace unions
+
+inline constexpr const auto& MatRegs =
+    ::gem5::debug::unions::MatRegs.MatRegs;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_MatRegs_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_MemChecker_HH__
+#define __DEBUG_MemChecker_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union MemChecker
+{
+    ~MemChecker() {}
+    SimpleFlag MemChecker = {
+        "MemChecker", "", false
+    };
+} MemChecker;
+} // namespace unions
+
+inline constexpr const auto& MemChecker =
+    ::gem5::debug::unions::MemChecker.MemChecker;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_MemChecker_HH__
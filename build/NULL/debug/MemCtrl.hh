@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_MemCtrl_HH__
+#define __DEBUG_MemCtrl_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union MemCtrl
+{
+    ~MemCtrl() {}
+    SimpleFlag MemCtrl = {
+        "MemCtrl", "", false
+    };
+} MemCtrl;
+} // namespace unions
+
+inline constexpr const auto& MemCtrl =
+    ::gem5::debug::unions::MemCtrl.MemCtrl;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_MemCtrl_HH__
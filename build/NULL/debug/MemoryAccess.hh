@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_MemoryAccess_HH__
+#define __DEBUG_MemoryAccess_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union MemoryAccess
+{
+    ~MemoryAccess() {}
+    SimpleFlag MemoryAccess = {
+        "MemoryAccess", "", false
+    };
+} MemoryAccess;
+} // namespace unions
+
+inline constexpr const auto& MemoryAccess =
+    ::gem5::debug::unions::MemoryAccess.MemoryAccess;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_MemoryAccess_HH__
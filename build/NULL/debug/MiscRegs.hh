@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_MiscRegs_HH__
+#define __DEBUG_MiscRegs_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union MiscRegs
+{
+    ~MiscRegs() {}
+    SimpleFlag MiscRegs = {
+        "MiscRegs", "", false
+    };
+} MiscRegs;
+} // namespace unions
+
+inline constexpr const auto& MiscRegs =
+    ::gem5::debug::unions::MiscRegs.MiscRegs;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_MiscRegs_HH__
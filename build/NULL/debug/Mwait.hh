@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_Mwait_HH__
+#define __DEBUG_Mwait_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union Mwait
+{
+    ~Mwait() {}
+    SimpleFlag Mwait = {
+        "Mwait", "", false
+    };
+} Mwait;
+} // namespace unions
+
+inline constexpr const auto& Mwait =
+    ::gem5::debug::unions::Mwait.Mwait;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_Mwait_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_NoncoherentXBar_HH__
+#define __DEBUG_NoncoherentXBar_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union NoncoherentXBar
+{
+    ~NoncoherentXBar() {}
+    SimpleFlag NoncoherentXBar = {
+        "NoncoherentXBar", "", false
+    };
+} NoncoherentXBar;
+} // namespace unions
+
+inline constexpr const auto& NoncoherentXBar =
+    ::gem5::debug::unions::NoncoherentXBar.NoncoherentXBar;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_NoncoherentXBar_HH__
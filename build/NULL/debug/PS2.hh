@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_PS2_HH__
+#define __DEBUG_PS2_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union PS2
+{
+    ~PS2() {}
+    SimpleFlag PS2 = {
+        "PS2", "", false
+    };
+} PS2;
+} // namespace unions
+
+inline constexpr const auto& PS2 =
+    ::gem5::debug::unions::PS2.PS2;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_PS2_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_PacketQueue_HH__
+#define __DEBUG_PacketQueue_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union PacketQueue
+{
+    ~PacketQueue() {}
+    SimpleFlag PacketQueue = {
+        "PacketQueue", "", false
+    };
+} PacketQueue;
+} // namespace unions
+
+inline constexpr const auto& PacketQueue =
+    ::gem5::debug::unions::PacketQueue.PacketQueue;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_PacketQueue_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_PortTrace_HH__
+#define __DEBUG_PortTrace_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union PortTrace
+{
+    ~PortTrace() {}
+    SimpleFlag PortTrace = {
+        "PortTrace", "", false
+    };
+} PortTrace;
+} // namespace unions
+
+inline constexpr const auto& PortTrace =
+    ::gem5::debug::unions::PortTrace.PortTrace;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_PortTrace_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_PowerDomain_HH__
+#define __DEBUG_PowerDomain_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union PowerDomain
+{
+    ~PowerDomain() {}
+    SimpleFlag PowerDomain = {
+        "PowerDomain", "", false
+    };
+} PowerDomain;
+} // namespace unions
+
+inline constexpr const auto& PowerDomain =
+    ::gem5::debug::unions::PowerDomain.PowerDomain;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_PowerDomain_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_ProbeVerbose_HH__
+#define __DEBUG_ProbeVerbose_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union ProbeVerbose
+{
+    ~ProbeVerbose() {}
+    SimpleFlag ProbeVerbose = {
+        "ProbeVerbose", "", false
+    };
+} ProbeVerbose;
+} // namespace unions
+
+inline constexpr const auto& ProbeVerbose =
+    ::gem5::debug::unions::ProbeVerbose.ProbeVerbose;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_ProbeVerbose_HH__
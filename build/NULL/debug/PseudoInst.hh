@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_PseudoInst_HH__
+#define __DEBUG_PseudoInst_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union PseudoInst
+{
+    ~PseudoInst() {}
+    SimpleFlag PseudoInst = {
+        "PseudoInst", "", false
+    };
+} PseudoInst;
+} // namespace unions
+
+inline constexpr const auto& PseudoInst =
+    ::gem5::debug::unions::PseudoInst.PseudoInst;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_PseudoInst_HH__
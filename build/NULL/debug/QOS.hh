@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_QOS_HH__
+#define __DEBUG_QOS_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union QOS
+{
+    ~QOS() {}
+    SimpleFlag QOS = {
+        "QOS", "", false
+    };
+} QOS;
+} // namespace unions
+
+inline constexpr const auto& QOS =
+    ::gem5::debug::unions::QOS.QOS;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_QOS_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_Quiesce_HH__
+#define __DEBUG_Quiesce_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union Quiesce
+{
+    ~Quiesce() {}
+    SimpleFlag Quiesce = {
+        "Quiesce", "", false
+    };
+} Quiesce;
+} // namespace unions
+
+inline constexpr const auto& Quiesce =
+    ::gem5::debug::unions::Quiesce.Quiesce;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_Quiesce_HH__
@@ -0,0 +1,50 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_Registers_HH__
+#define __DEBUG_Registers_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+#include "debug/IntRegs.hh"
+#include "debug/FloatRegs.hh"
+#include "debug/VecRegs.hh"
+#include "debug/VecPredRegs.hh"
+#include "debug/MatRegs.hh"
+#include "debug/CCRegs.hh"
+#include "debug/MiscRegs.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union Registers
+{
+    ~Registers() {}
+    CompoundFlag Registers = {
+        "Registers", "", {
+            (Flag *)&::gem5::debug::IntRegs,
+            (Flag *)&::gem5::debug::FloatRegs,
+            (Flag *)&::gem5::debug::VecRegs,
+            (Flag *)&::gem5::debug::VecPredRegs,
+            (Flag *)&::gem5::debug::MatRegs,
+            (Flag *)&::gem5::debug::CCRegs,
+            (Flag *)&::gem5::debug::MiscRegs
+        }
+    };
+} Registers;
+} // namespace unions
+
+inline constexpr const auto& Registers =
+    ::gem5::debug::unions::Registers.Registers;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_Registers_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_ResponsePort_HH__
+#define __DEBUG_ResponsePort_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union ResponsePort
+{
+    ~ResponsePort() {}
+    SimpleFlag ResponsePort = {
+        "ResponsePort", "", false
+    };
+} ResponsePort;
+} // namespace unions
+
+inline constexpr const auto& ResponsePort =
+    ::gem5::debug::unions::ResponsePort.ResponsePort;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_ResponsePort_HH__
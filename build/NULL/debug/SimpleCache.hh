@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_SimpleCache_HH__
+#define __DEBUG_SimpleCache_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union SimpleCache
+{
+    ~SimpleCache() {}
+    SimpleFlag SimpleCache = {
+        "SimpleCache", "For Learning gem5 Part 2.", false
+    };
+} SimpleCache;
+} // namespace unions
+
+inline constexpr const auto& SimpleCache =
+    ::gem5::debug::unions::SimpleCache.SimpleCache;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_SimpleCache_HH__
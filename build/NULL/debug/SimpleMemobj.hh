@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_SimpleMemobj_HH__
+#define __DEBUG_SimpleMemobj_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union SimpleMemobj
+{
+    ~SimpleMemobj() {}
+    SimpleFlag SimpleMemobj = {
+        "SimpleMemobj", "For Learning gem5 Part 2.", false
+    };
+} SimpleMemobj;
+} // namespace unions
+
+inline constexpr const auto& SimpleMemobj =
+    ::gem5::debug::unions::SimpleMemobj.SimpleMemobj;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_SimpleMemobj_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_SnoopFilter_HH__
+#define __DEBUG_SnoopFilter_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union SnoopFilter
+{
+    ~SnoopFilter() {}
+    SimpleFlag SnoopFilter = {
+        "SnoopFilter", "", false
+    };
+} SnoopFilter;
+} // namespace unions
+
+inline constexpr const auto& SnoopFilter =
+    ::gem5::debug::unions::SnoopFilter.SnoopFilter;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_SnoopFilter_HH__
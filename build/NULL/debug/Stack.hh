@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_Stack_HH__
+#define __DEBUG_Stack_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union Stack
+{
+    ~Stack() {}
+    SimpleFlag Stack = {
+        "Stack", "", false
+    };
+} Stack;
+} // namespace unions
+
+inline constexpr const auto& Stack =
+    ::gem5::debug::unions::Stack.Stack;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_Stack_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_Stats_HH__
+#define __DEBUG_Stats_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union Stats
+{
+    ~Stats() {}
+    SimpleFlag Stats = {
+        "Stats", "Statistics management", false
+    };
+} Stats;
+} // namespace unions
+
+inline constexpr const auto& Stats =
+    ::gem5::debug::unions::Stats.Stats;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_Stats_HH__
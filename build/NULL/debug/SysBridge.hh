@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_SysBridge_HH__
+#define __DEBUG_SysBridge_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union SysBridge
+{
+    ~SysBridge() {}
+    SimpleFlag SysBridge = {
+        "SysBridge", "", false
+    };
+} SysBridge;
+} // namespace unions
+
+inline constexpr const auto& SysBridge =
+    ::gem5::debug::unions::SysBridge.SysBridge;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_SysBridge_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_SyscallBase_HH__
+#define __DEBUG_SyscallBase_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union SyscallBase
+{
+    ~SyscallBase() {}
+    SimpleFlag SyscallBase = {
+        "SyscallBase", "", false
+    };
+} SyscallBase;
+} // namespace unions
+
+inline constexpr const auto& SyscallBase =
+    ::gem5::debug::unions::SyscallBase.SyscallBase;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_SyscallBase_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_SyscallVerbose_HH__
+#define __DEBUG_SyscallVerbose_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union SyscallVerbose
+{
+    ~SyscallVerbose() {}
+    SimpleFlag SyscallVerbose = {
+        "SyscallVerbose", "", false
+    };
+} SyscallVerbose;
+} // namespace unions
+
+inline constexpr const auto& SyscallVerbose =
+    ::gem5::debug::unions::SyscallVerbose.SyscallVerbose;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_SyscallVerbose_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_TLBVerbose_HH__
+#define __DEBUG_TLBVerbose_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union TLBVerbose
+{
+    ~TLBVerbose() {}
+    SimpleFlag TLBVerbose = {
+        "TLBVerbose", "", false
+    };
+} TLBVerbose;
+} // namespace unions
+
+inline constexpr const auto& TLBVerbose =
+    ::gem5::debug::unions::TLBVerbose.TLBVerbose;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_TLBVerbose_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_Terminal_HH__
+#define __DEBUG_Terminal_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union Terminal
+{
+    ~Terminal() {}
+    SimpleFlag Terminal = {
+        "Terminal", "", false
+    };
+} Terminal;
+} // namespace unions
+
+inline constexpr const auto& Terminal =
+    ::gem5::debug::unions::Terminal.Terminal;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_Terminal_HH__
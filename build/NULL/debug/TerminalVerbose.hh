@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_TerminalVerbose_HH__
+#define __DEBUG_TerminalVerbose_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union TerminalVerbose
+{
+    ~TerminalVerbose() {}
+    SimpleFlag TerminalVerbose = {
+        "TerminalVerbose", "", false
+    };
+} TerminalVerbose;
+} // namespace unions
+
+inline constexpr const auto& TerminalVerbose =
+    ::gem5::debug::unions::TerminalVerbose.TerminalVerbose;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_TerminalVerbose_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_ThermalDomain_HH__
+#define __DEBUG_ThermalDomain_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union ThermalDomain
+{
+    ~ThermalDomain() {}
+    SimpleFlag ThermalDomain = {
+        "ThermalDomain", "", false
+    };
+} ThermalDomain;
+} // namespace unions
+
+inline constexpr const auto& ThermalDomain =
+    ::gem5::debug::unions::ThermalDomain.ThermalDomain;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_ThermalDomain_HH__
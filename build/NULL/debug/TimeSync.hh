@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_TimeSync_HH__
+#define __DEBUG_TimeSync_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union TimeSync
+{
+    ~TimeSync() {}
+    SimpleFlag TimeSync = {
+        "TimeSync", "", false
+    };
+} TimeSync;
+} // namespace unions
+
+inline constexpr const auto& TimeSync =
+    ::gem5::debug::unions::TimeSync.TimeSync;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_TimeSync_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_TlmBridge_HH__
+#define __DEBUG_TlmBridge_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union TlmBridge
+{
+    ~TlmBridge() {}
+    SimpleFlag TlmBridge = {
+        "TlmBridge", "", false
+    };
+} TlmBridge;
+} // namespace unions
+
+inline constexpr const auto& TlmBridge =
+    ::gem5::debug::unions::TlmBridge.TlmBridge;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_TlmBridge_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_Uart_HH__
+#define __DEBUG_Uart_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union Uart
+{
+    ~Uart() {}
+    SimpleFlag Uart = {
+        "Uart", "", false
+    };
+} Uart;
+} // namespace unions
+
+inline constexpr const auto& Uart =
+    ::gem5::debug::unions::Uart.Uart;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_Uart_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_VIO_HH__
+#define __DEBUG_VIO_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union VIO
+{
+    ~VIO() {}
+    SimpleFlag VIO = {
+        "VIO", "VirtIO base functionality", false
+    };
+} VIO;
+} // namespace unions
+
+inline constexpr const auto& VIO =
+    ::gem5::debug::unions::VIO.VIO;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_VIO_HH__
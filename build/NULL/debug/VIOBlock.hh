@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_VIOBlock_HH__
+#define __DEBUG_VIOBlock_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union VIOBlock
+{
+    ~VIOBlock() {}
+    SimpleFlag VIOBlock = {
+        "VIOBlock", "VirtIO block device", false
+    };
+} VIOBlock;
+} // namespace unions
+
+inline constexpr const auto& VIOBlock =
+    ::gem5::debug::unions::VIOBlock.VIOBlock;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_VIOBlock_HH__
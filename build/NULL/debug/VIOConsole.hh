@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_VIOConsole_HH__
+#define __DEBUG_VIOConsole_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union VIOConsole
+{
+    ~VIOConsole() {}
+    SimpleFlag VIOConsole = {
+        "VIOConsole", "VirtIO console device", false
+    };
+} VIOConsole;
+} // namespace unions
+
+inline constexpr const auto& VIOConsole =
+    ::gem5::debug::unions::VIOConsole.VIOConsole;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_VIOConsole_HH__
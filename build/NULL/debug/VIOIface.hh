@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_VIOIface_HH__
+#define __DEBUG_VIOIface_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union VIOIface
+{
+    ~VIOIface() {}
+    SimpleFlag VIOIface = {
+        "VIOIface", "VirtIO transport", false
+    };
+} VIOIface;
+} // namespace unions
+
+inline constexpr const auto& VIOIface =
+    ::gem5::debug::unions::VIOIface.VIOIface;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_VIOIface_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_VecPredRegs_HH__
+#define __DEBUG_VecPredRegs_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union VecPredRegs
+{
+    ~VecPredRegs() {}
+    SimpleFlag VecPredRegs = {
+        "VecPredRegs", "", false
+    };
+} VecPredRegs;
+} // namespace unions
+
+inline constexpr const auto& VecPredRegs =
+    ::gem5::debug::unions::VecPredRegs.VecPredRegs;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_VecPredRegs_HH__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_VecRegs_HH__
+#define __DEBUG_VecRegs_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union VecRegs
+{
+    ~VecRegs() {}
+    SimpleFlag VecRegs = {
+        "VecRegs", "", false
+    };
+} VecRegs;
+} // namespace unions
+
+inline constexpr const auto& VecRegs =
+    ::gem5::debug::unions::VecRegs.VecRegs;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_VecRegs_HH__
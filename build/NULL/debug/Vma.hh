@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_Vma_HH__
+#define __DEBUG_Vma_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union Vma
+{
+    ~Vma() {}
+    SimpleFlag Vma = {
+        "Vma", "", false
+    };
+} Vma;
+} // namespace unions
+
+inline constexpr const auto& Vma =
+    ::gem5::debug::unions::Vma.Vma;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_Vma_HH__
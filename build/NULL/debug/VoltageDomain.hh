@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_VoltageDomain_HH__
+#define __DEBUG_VoltageDomain_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union VoltageDomain
+{
+    ~VoltageDomain() {}
+    SimpleFlag VoltageDomain = {
+        "VoltageDomain", "", false
+    };
+} VoltageDomain;
+} // namespace unions
+
+inline constexpr const auto& VoltageDomain =
+    ::gem5::debug::unions::VoltageDomain.VoltageDomain;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_VoltageDomain_HH__
@@ -0,0 +1,44 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/debugflaghh.py:139
+ */
+
+#ifndef __DEBUG_XBar_HH__
+#define __DEBUG_XBar_HH__
+
+#include "base/compiler.hh" // For namespace deprecation
+#include "base/debug.hh"
+#include "debug/BaseXBar.hh"
+#include "debug/CoherentXBar.hh"
+#include "debug/NoncoherentXBar.hh"
+#include "debug/SnoopFilter.hh"
+namespace gem5
+{
+
+namespace debug
+{
+
+namespace unions
+{
+inline union XBar
+{
+    ~XBar() {}
+    CompoundFlag XBar = {
+        "XBar", "", {
+            (Flag *)&::gem5::debug::BaseXBar,
+            (Flag *)&::gem5::debug::CoherentXBar,
+            (Flag *)&::gem5::debug::NoncoherentXBar,
+            (Flag *)&::gem5::debug::SnoopFilter
+        }
+    };
+} XBar;
+} // namespace unions
+
+inline constexpr const auto& XBar =
+    ::gem5::debug::unions::XBar.XBar;
+
+} // namespace debug
+} // namespace gem5
+
+#endif // __DEBUG_XBar_HH__
@@ -0,0 +1,52 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,144,191,111,26,49,20,199,159,239,87,129,166,105,
+    46,74,169,20,69,237,117,164,74,97,10,3,160,14,8,169,
+    42,3,66,74,151,222,98,57,103,39,80,221,113,212,71,34,
+    96,186,33,127,64,148,133,181,19,82,212,127,134,72,25,144,
+    167,74,157,186,81,209,41,83,237,187,64,145,26,219,247,125,
+    239,249,221,243,231,217,63,97,99,152,15,118,89,150,50,1,
+    10,20,249,16,32,23,33,229,107,190,246,9,52,248,0,84,
+    191,4,106,48,52,213,1,190,235,171,98,87,167,230,49,20,
+    172,95,42,40,32,177,93,39,81,215,107,119,195,6,187,232,
+    122,76,238,160,183,222,38,109,85,185,108,36,52,6,46,162,
+    224,106,84,157,132,92,131,106,174,201,172,111,79,224,145,65,
+    245,41,146,108,180,102,103,168,33,217,166,200,214,9,77,121,
+    227,103,148,93,148,78,8,149,166,216,233,140,159,159,177,224,
+    168,82,249,151,223,111,145,128,57,225,169,67,147,216,25,132,
+    14,227,60,228,78,216,107,21,178,34,131,113,79,254,128,177,
+    200,97,28,132,244,220,87,254,22,198,95,207,137,255,144,49,
+    6,163,62,19,57,111,56,196,29,70,40,227,34,171,124,207,
+    39,81,36,204,54,225,36,16,214,241,128,119,123,103,34,151,
+    98,84,229,13,44,85,211,247,123,17,247,74,170,203,117,83,
+    197,254,136,91,50,149,200,107,249,69,37,41,241,122,206,159,
+    230,227,198,220,118,226,230,124,231,77,252,241,135,157,159,28,
+    92,31,204,94,85,110,237,234,157,93,141,155,106,114,123,117,
+    66,171,96,8,59,56,42,134,39,95,152,55,136,138,41,132,
+    171,135,23,89,185,223,87,29,70,41,113,71,73,82,185,171,
+    122,203,212,210,59,191,231,47,100,168,30,58,250,44,101,161,
+    35,132,22,101,64,239,102,112,184,185,230,240,114,182,90,11,
+    203,68,181,5,252,47,87,219,191,149,249,243,72,42,65,255,
+    5,94,112,165,120,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/BadDevice.py",
+    "m5.objects.BadDevice",
+    embedded_module_data,
+    437,
+    653);
+
+} // anonymous namespace
+} // namespace gem5
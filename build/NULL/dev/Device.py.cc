@@ -0,0 +1,212 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,24,89,108,27,215,241,45,151,247,33,94,186,236,
+    56,246,70,118,148,82,150,105,217,114,28,199,118,229,216,82,
+    84,221,50,34,185,77,149,4,196,138,251,68,81,230,149,221,
+    165,109,17,50,204,182,1,170,8,1,172,10,105,37,52,105,
+    171,2,173,145,34,253,40,250,211,124,244,163,159,253,36,3,
+    2,33,22,117,97,160,95,254,163,96,21,40,252,227,206,236,
+    242,230,90,53,2,116,143,217,183,51,243,222,206,241,222,204,
+    188,253,23,169,59,76,229,231,147,175,1,108,19,129,8,76,
+    140,196,153,5,134,193,182,33,102,152,215,158,108,249,105,156,
+    39,6,242,61,34,176,31,17,193,72,153,7,44,33,95,178,
+    149,193,22,76,42,205,4,52,51,53,53,209,204,42,205,2,
+    52,107,11,205,162,210,108,64,179,83,75,19,205,170,210,28,
+    64,115,82,115,19,205,166,210,92,64,107,163,182,38,154,93,
+    112,207,145,128,231,49,190,4,24,197,53,28,75,134,111,82,
+    97,118,113,133,134,101,64,48,125,225,122,67,24,43,134,144,
+    85,67,80,178,192,8,100,193,0,55,43,48,11,70,193,176,
+    96,18,88,84,130,90,4,227,3,6,62,197,212,68,164,182,
+    93,59,209,57,168,99,197,89,105,11,166,7,6,232,101,168,
+    246,114,217,192,20,96,16,102,161,77,48,131,168,54,197,118,
+    61,154,28,161,183,162,97,250,212,35,208,91,167,163,201,144,
+    160,190,6,151,151,51,238,8,141,191,126,241,98,149,101,62,
+    227,191,46,38,35,34,31,143,83,129,27,63,61,203,165,146,
+    162,156,121,121,110,85,146,105,156,147,151,163,18,167,245,230,
+    160,149,226,69,153,75,46,205,132,205,117,226,217,224,70,131,
+    61,249,7,232,242,83,203,54,145,153,26,113,205,240,25,76,
+    6,153,173,195,176,141,122,11,134,207,140,191,106,194,221,53,
+    175,153,119,13,68,231,144,45,181,182,192,174,49,187,70,61,
+    174,230,111,0,159,73,151,175,201,7,25,184,27,237,219,72,
+    103,200,154,73,204,200,174,58,25,140,31,1,110,132,60,128,
+    246,151,68,191,151,104,18,76,107,134,12,216,236,199,204,26,
+    89,169,106,176,107,213,149,169,169,247,138,173,210,218,176,188,
+    144,85,204,114,71,237,109,221,178,196,192,236,176,182,202,24,
+    105,214,244,96,189,113,110,89,103,158,50,111,41,204,29,133,
+    21,105,36,92,231,101,117,222,251,225,126,114,130,224,188,143,
+    128,22,31,184,238,50,107,204,74,77,46,114,83,125,254,204,
+    240,73,27,140,197,60,230,136,186,164,216,68,58,30,48,40,
+    134,224,128,194,68,37,20,128,227,158,122,37,49,124,26,39,
+    175,54,75,131,169,213,167,246,203,177,168,36,135,147,241,212,
+    80,230,66,117,254,6,35,52,65,69,94,166,215,120,41,26,
+    174,162,103,146,2,13,94,134,181,202,199,164,161,96,173,231,
+    85,24,94,58,10,32,75,114,254,65,237,218,61,179,121,245,
+    211,183,119,174,109,77,84,81,79,80,208,204,153,241,132,76,
+    69,49,157,146,57,144,113,145,138,156,20,231,99,49,120,202,
+    203,124,130,27,60,203,113,209,4,87,253,38,247,170,164,216,
+    163,149,46,82,131,125,76,21,251,92,4,240,115,166,108,161,
+    46,180,208,174,158,67,201,199,134,70,15,128,213,186,231,200,
+    31,208,96,254,138,202,163,130,12,107,55,69,69,121,53,192,
+    138,110,224,18,61,0,20,54,18,13,75,172,106,200,172,232,
+    69,180,15,213,249,214,70,155,66,163,189,6,224,63,96,181,
+    238,49,237,250,138,217,241,126,115,40,248,245,161,224,23,82,
+    254,208,96,225,208,96,149,36,162,166,1,135,98,1,1,113,
+    76,133,5,171,40,102,62,149,162,9,65,241,212,137,253,131,
+    164,40,72,138,141,23,4,113,152,198,98,208,148,162,25,170,
+    53,89,62,177,170,88,66,16,114,40,244,182,164,19,41,49,
+    121,103,85,236,86,53,148,96,206,88,21,163,68,99,75,138,
+    73,146,65,21,197,152,224,227,84,177,166,32,220,225,120,64,
+    132,161,196,118,100,55,38,64,10,181,167,100,85,205,162,30,
+    111,169,182,81,14,63,223,24,153,19,47,98,178,243,56,174,
+    135,81,205,243,111,51,241,116,237,156,200,117,157,133,235,247,
+    254,221,119,127,251,242,239,94,214,222,224,202,187,7,11,238,
+    193,117,99,209,234,188,239,216,112,60,116,30,41,122,58,54,
+    211,219,247,182,238,237,222,201,119,13,20,186,6,254,244,250,
+    95,174,252,249,202,223,206,229,7,199,10,131,99,249,174,177,
+    61,214,224,106,219,39,0,246,88,163,205,190,79,0,148,84,
+    224,36,206,206,18,105,179,181,61,116,251,180,105,251,133,29,
+    64,222,63,88,0,232,62,87,112,159,3,70,151,239,81,199,
+    116,177,243,240,30,203,116,188,84,98,89,175,175,100,39,254,
+    174,79,251,191,241,245,126,237,235,221,149,243,190,254,2,94,
+    3,235,195,143,156,158,251,147,27,147,15,61,92,177,157,123,
+    216,222,85,245,40,250,123,1,64,190,123,172,208,61,246,247,
+    158,124,251,116,161,125,122,207,4,163,237,19,0,123,172,9,
+    133,4,80,82,65,27,241,180,175,59,180,121,192,204,4,220,
+    138,53,20,66,247,132,66,138,61,20,138,39,133,116,12,219,
+    206,80,232,195,52,31,43,83,140,242,106,138,42,246,240,157,
+    59,161,101,202,131,195,20,27,182,195,49,94,146,20,43,191,
+    40,201,34,31,150,21,231,59,84,74,37,19,18,189,14,137,
+    74,97,193,223,138,233,58,15,9,76,49,107,73,75,49,95,
+    87,231,140,120,12,221,107,150,84,164,24,192,117,208,137,0,
+    165,210,150,133,185,2,78,161,11,35,106,88,168,156,69,71,
+    103,118,164,232,61,158,157,40,122,94,201,142,23,221,254,236,
+    216,35,123,231,122,127,174,171,63,111,63,85,176,159,202,14,
+    23,93,190,251,239,111,188,191,211,251,121,95,174,247,237,188,
+    107,180,224,26,205,142,150,204,228,141,75,37,246,176,169,189,
+    68,158,3,52,25,240,203,223,166,122,160,22,253,204,209,82,
+    81,216,128,83,183,162,16,76,130,185,169,142,112,8,22,140,
+    240,74,91,227,4,23,49,179,100,218,181,170,161,145,52,159,
+    105,43,7,190,171,176,222,40,56,201,116,102,96,32,33,101,
+    58,234,43,138,89,46,6,171,38,17,94,157,9,56,197,62,
+    84,251,36,130,126,4,104,118,49,136,224,52,130,1,4,131,
+    234,130,197,17,197,94,108,90,166,180,238,138,3,87,118,121,
+    172,102,71,94,168,128,57,116,228,88,147,35,95,170,58,178,
+    183,226,72,119,251,253,204,70,38,119,184,47,239,62,89,112,
+    159,204,142,21,125,93,219,167,182,78,237,90,114,129,183,242,
+    190,171,5,223,213,236,36,158,218,71,46,60,215,83,191,56,
+    208,83,250,117,158,96,2,207,216,119,29,186,158,49,11,150,
+    38,207,56,15,224,181,54,87,131,88,254,66,37,104,2,95,
+    218,21,219,72,156,215,92,148,241,98,50,21,226,124,107,41,
+    88,229,153,207,88,71,166,175,170,245,223,140,136,67,102,222,
+    157,147,69,202,199,185,168,0,203,41,186,20,133,204,151,150,
+    192,169,139,171,28,228,191,241,217,233,233,27,156,156,228,4,
+    72,20,209,68,36,29,149,150,57,62,158,76,68,36,153,147,
+    232,45,8,151,177,114,237,40,113,188,44,243,225,101,232,11,
+    252,81,57,243,222,92,26,215,243,255,101,240,112,93,177,73,
+    112,161,168,197,233,231,170,163,160,252,170,146,126,52,178,102,
+    216,173,79,210,213,67,174,43,22,5,3,164,104,86,143,171,
+    126,172,166,114,147,172,84,203,210,136,225,224,194,74,96,230,
+    212,59,192,242,61,128,182,151,147,19,55,143,149,119,156,202,
+    203,73,80,139,191,137,90,38,56,72,157,115,152,236,160,45,
+    112,60,87,206,175,28,175,86,230,16,69,161,246,144,250,145,
+    88,29,38,42,99,221,174,165,94,48,35,116,234,137,38,227,
+    241,180,196,125,151,187,60,212,195,165,202,153,24,43,153,48,
+    47,81,40,109,40,87,157,18,181,97,26,141,92,113,80,80,
+    87,92,104,37,40,248,69,226,197,85,110,41,41,114,124,90,
+    78,150,243,167,38,195,98,84,147,102,145,202,183,41,77,84,
+    71,225,57,152,162,149,253,6,234,136,210,168,242,214,190,52,
+    163,152,53,13,2,38,197,28,82,155,226,75,96,74,241,8,
+    193,112,145,130,210,76,136,65,205,33,69,5,168,138,142,35,
+    5,139,82,241,59,0,202,85,17,167,101,126,15,212,9,227,
+    216,191,82,142,100,14,87,53,15,54,211,68,236,254,30,193,
+    200,82,242,16,167,231,147,75,57,71,79,177,46,97,30,217,
+    73,255,230,238,47,239,126,49,255,199,247,242,199,222,44,28,
+    123,243,171,115,127,189,144,59,58,2,9,28,179,164,1,179,
+    164,17,179,164,17,179,100,35,96,137,243,56,12,167,37,76,
+    247,11,132,73,197,241,14,253,48,77,37,89,75,130,96,53,
+    17,75,91,45,122,90,111,36,164,104,36,65,161,168,194,87,
+    163,4,166,16,71,72,107,254,27,170,128,15,80,185,159,16,
+    157,252,119,162,49,255,117,172,159,220,92,201,219,95,41,216,
+    95,201,14,63,114,121,179,163,143,236,238,251,193,141,96,209,
+    106,43,25,24,91,96,207,100,116,152,65,71,135,57,59,12,
+    133,134,211,123,127,104,99,168,142,232,68,162,211,156,29,41,
+    57,93,38,208,190,21,104,242,161,84,13,17,183,178,100,158,
+    28,37,7,69,92,193,8,75,201,164,184,192,145,223,143,138,
+    114,57,250,117,86,162,223,45,192,213,133,64,127,53,4,214,
+    152,231,103,2,150,23,73,84,77,182,156,168,128,31,163,45,
+    123,154,108,121,24,109,25,64,91,190,90,182,37,158,90,247,
+    137,102,85,171,201,5,99,133,190,170,212,188,107,33,58,135,
+    192,66,186,105,76,9,86,224,181,233,242,182,22,1,118,224,
+    213,79,53,150,22,94,39,240,186,116,121,173,45,188,109,192,
+    235,214,229,181,181,240,122,128,215,171,203,107,23,28,77,188,
+    190,3,120,157,77,188,126,224,109,215,229,117,9,109,77,188,
+    29,7,140,235,110,226,237,20,60,48,229,188,138,101,92,226,
+    71,33,80,103,220,234,79,23,137,15,45,193,27,206,50,151,
+    54,203,202,244,199,152,146,50,29,115,176,59,225,146,75,28,
+    175,213,78,156,200,39,34,244,241,51,164,117,142,208,37,62,
+    29,147,57,129,151,121,12,183,34,149,211,98,34,250,12,168,
+    49,140,96,207,238,61,187,199,146,152,169,220,196,211,77,70,
+    159,190,246,142,202,199,165,110,66,138,132,52,1,65,126,145,
+    23,170,95,72,38,56,62,140,97,57,211,119,35,37,96,22,
+    193,232,170,125,99,153,87,243,132,246,33,136,241,192,123,91,
+    140,202,84,82,72,230,53,168,2,48,88,131,32,41,104,200,
+    220,237,101,154,168,251,41,164,13,74,133,204,228,184,212,240,
+    195,8,170,117,236,23,139,222,132,54,36,135,120,82,92,45,
+    71,117,16,45,206,175,114,17,42,3,37,140,121,5,216,18,
+    148,195,61,155,0,98,124,56,19,232,250,31,139,16,67,157,
+    136,219,105,109,207,135,61,21,211,13,216,178,95,80,108,160,
+    71,8,21,187,160,152,17,115,230,188,98,175,160,160,173,226,
+    6,207,214,112,208,86,113,231,207,213,112,208,54,94,75,38,
+    99,138,19,49,96,71,109,87,233,72,171,166,83,89,96,195,
+    161,90,70,113,220,230,197,68,72,179,131,98,69,183,135,64,
+    219,230,8,49,85,1,31,195,45,253,147,52,70,136,118,140,
+    16,61,24,33,142,101,199,203,245,233,206,241,220,177,243,121,
+    247,27,5,247,27,80,161,122,58,182,29,91,142,157,145,92,
+    207,197,188,231,82,193,115,9,34,137,183,115,251,200,214,145,
+    157,165,92,239,80,222,123,165,224,189,2,3,148,113,43,185,
+    190,107,121,239,112,193,59,92,197,229,142,14,228,206,78,228,
+    189,147,5,239,36,32,253,221,219,23,183,46,238,208,220,171,
+    51,121,255,108,193,63,155,157,194,50,184,111,171,175,104,117,
+    229,220,151,32,115,249,33,92,3,200,78,194,166,6,216,251,
+    183,250,119,196,220,241,169,188,111,186,224,155,206,78,22,53,
+    57,129,189,104,189,1,219,65,15,176,3,168,143,110,168,176,
+    126,116,195,16,95,23,221,152,5,150,26,245,127,211,9,6,
+    129,109,90,117,149,64,111,185,198,11,234,102,1,73,243,226,
+    44,64,157,248,221,91,157,48,11,8,48,141,55,123,135,175,
+    128,95,147,242,223,142,58,239,184,61,96,255,178,185,132,220,
+    137,233,188,127,166,224,159,201,78,225,169,141,193,171,31,118,
+    40,221,241,215,131,73,245,231,176,20,108,248,87,44,226,194,
+    85,108,64,86,75,53,152,39,216,196,95,26,138,23,90,105,
+    57,26,11,46,9,176,34,99,80,110,104,59,83,117,87,163,
+    230,232,137,234,252,225,91,69,127,106,189,172,237,168,135,196,
+    37,162,37,74,233,93,128,37,150,97,152,210,12,67,152,193,
+    28,57,91,127,21,73,87,174,114,21,73,103,174,114,21,201,
+    177,92,229,42,153,143,51,176,89,109,5,155,174,61,124,236,
+    215,176,83,140,133,185,198,148,136,62,220,252,225,158,250,220,
+    175,167,180,247,48,144,237,91,193,166,109,15,31,251,53,236,
+    4,99,196,239,180,130,205,241,61,124,236,215,176,109,62,198,
+    92,34,173,96,61,177,135,143,253,26,182,207,192,204,130,40,
+    250,112,61,178,167,62,247,159,67,87,45,255,95,109,58,244,
+    251,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/Device.py",
+    "m5.objects.Device",
+    embedded_module_data,
+    2993,
+    6399);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,75 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,197,84,205,107,19,65,20,159,217,221,52,155,77,210,
+    239,66,108,73,13,182,214,134,210,20,252,0,45,98,171,82,
+    164,40,105,105,106,15,11,50,132,221,45,68,243,229,108,34,
+    26,60,228,80,176,130,135,94,164,189,8,158,74,67,61,120,
+    244,207,72,165,160,44,120,242,228,45,146,30,164,39,231,237,
+    102,55,97,211,86,165,66,55,155,223,206,204,123,243,62,126,
+    239,205,124,71,45,143,167,241,173,127,100,176,137,84,164,226,
+    52,202,96,25,103,56,153,195,72,229,100,94,229,101,129,67,
+    26,126,108,235,34,141,215,132,109,14,161,93,206,94,193,136,
+    67,247,144,42,172,33,213,163,113,219,60,147,241,182,76,238,
+    48,101,29,76,230,109,147,121,77,153,200,100,62,13,187,100,
+    162,41,147,152,204,223,182,207,167,6,18,40,26,252,1,147,
+    40,103,8,139,57,90,48,164,21,77,41,228,40,140,75,157,
+    243,217,66,36,145,43,82,69,139,44,166,178,165,128,57,79,
+    101,159,192,76,105,165,192,78,162,62,204,224,21,35,65,67,
+    50,86,145,204,173,163,85,172,226,53,81,230,215,209,115,44,
+    11,9,240,4,118,44,179,96,135,107,177,3,244,64,128,117,
+    153,193,91,188,137,10,184,41,220,102,255,93,103,246,190,69,
+    210,124,10,66,115,252,146,121,254,224,74,154,149,3,37,80,
+    133,143,47,71,177,225,75,233,68,55,227,168,240,134,71,47,
+    230,53,106,136,132,164,178,169,2,33,70,215,124,124,153,36,
+    22,30,46,221,157,35,75,11,15,230,152,142,160,107,233,85,
+    67,80,53,93,49,124,132,40,233,164,174,19,162,131,245,72,
+    164,124,216,163,83,101,74,213,158,77,177,252,88,102,177,252,
+    11,26,96,162,210,64,107,190,49,219,193,37,200,115,156,193,
+    175,50,250,38,6,95,123,223,120,191,136,161,207,98,232,221,
+    249,157,209,79,163,85,49,180,39,206,236,139,51,85,251,173,
+    67,2,21,15,132,152,77,102,52,22,162,68,72,38,167,22,
+    211,48,14,16,242,180,152,76,91,18,211,175,17,108,132,168,
+    104,233,52,33,21,76,123,216,170,14,188,205,210,94,134,180,
+    195,134,49,136,229,182,21,139,253,171,113,216,51,139,107,232,
+    223,144,246,219,54,79,209,32,189,86,19,158,117,155,80,17,
+    114,145,0,58,129,185,70,157,45,238,204,202,14,181,7,234,
+    212,247,10,104,245,1,152,148,12,0,12,186,10,16,182,225,
+    50,12,134,28,229,240,233,248,147,32,32,118,78,221,188,9,
+    54,111,43,255,133,55,247,253,101,30,45,28,175,240,212,111,
+    51,100,4,205,83,52,31,191,111,158,161,227,120,236,107,6,
+    236,240,55,13,129,142,160,35,206,71,120,71,216,19,39,247,
+    197,201,170,253,158,64,113,196,134,27,96,239,58,106,235,241,
+    24,52,238,223,128,229,36,114,186,210,116,55,59,230,108,10,
+    68,47,64,22,192,235,113,197,56,231,14,209,41,201,29,208,
+    185,136,78,108,233,113,27,224,58,161,99,142,50,44,197,163,
+    146,225,203,92,139,229,147,52,153,209,41,184,166,16,48,13,
+    2,140,66,191,116,40,185,76,62,89,176,174,166,176,83,64,
+    216,93,105,88,2,55,135,226,77,235,230,187,69,39,205,212,
+    88,16,93,12,107,60,198,184,118,149,199,92,13,253,25,36,
+    212,55,82,238,250,218,61,92,14,126,69,254,178,176,230,95,
+    95,216,122,180,135,38,246,209,68,21,77,212,36,14,195,189,
+    118,52,110,76,255,52,191,7,173,146,208,73,59,182,6,143,
+    216,209,201,225,24,12,221,176,209,15,202,177,131,230,106,247,
+    113,154,37,183,166,3,38,97,191,1,216,19,164,172,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/IntPin.py",
+    "m5.objects.IntPin",
+    embedded_module_data,
+    814,
+    2221);
+
+} // anonymous namespace
+} // namespace gem5
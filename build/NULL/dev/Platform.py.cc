@@ -0,0 +1,58 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,82,191,107,219,64,20,126,167,147,100,217,177,226,
+    182,33,109,167,96,50,20,156,33,158,210,33,148,44,13,253,
+    69,113,3,206,36,2,226,162,187,212,9,146,173,234,228,96,
+    121,210,144,33,116,233,216,14,29,50,5,74,255,25,23,58,
+    136,155,10,157,186,185,184,83,166,222,201,150,113,136,79,119,
+    223,123,143,247,120,223,247,238,244,27,22,150,49,179,147,61,
+    9,159,129,2,69,62,28,78,45,202,173,230,107,1,118,48,
+    2,13,94,2,197,23,64,117,134,175,49,192,119,92,52,113,
+    116,106,180,161,97,254,81,65,3,9,180,37,161,220,62,13,
+    222,29,159,49,47,246,22,9,245,130,208,201,9,25,56,136,
+    130,163,201,131,41,146,141,52,199,160,216,49,89,233,202,130,
+    37,139,149,207,42,133,79,245,107,77,202,208,230,50,86,168,
+    113,1,78,149,154,82,76,73,88,7,62,137,79,122,81,112,
+    56,172,81,118,222,12,103,225,118,167,51,92,125,207,130,157,
+    221,221,162,66,152,60,225,49,11,60,188,64,133,228,81,241,
+    196,156,93,141,236,138,90,223,160,129,133,206,153,127,34,176,
+    23,246,133,193,99,18,51,174,10,235,245,250,205,26,143,188,
+    166,98,43,90,111,135,137,88,39,221,110,79,149,61,15,251,
+    251,236,252,212,99,173,30,101,195,141,121,205,210,124,67,182,
+    228,37,9,41,100,86,245,82,159,40,81,173,134,45,44,215,
+    237,146,128,185,174,168,184,110,208,163,125,95,249,85,215,253,
+    208,39,254,44,163,199,73,200,132,69,142,121,28,17,47,22,
+    21,111,48,112,59,140,80,22,137,178,242,61,159,112,46,140,
+    3,18,17,57,126,59,31,95,152,50,100,221,88,96,210,77,
+    34,69,29,173,42,40,43,168,41,176,21,152,5,212,149,194,
+    183,185,194,226,203,86,214,211,253,172,182,150,190,202,238,111,
+    166,111,178,123,245,244,245,47,251,193,167,163,143,71,95,158,
+    124,221,186,234,252,176,155,63,237,102,250,98,108,34,195,30,
+    195,93,152,18,153,249,172,134,40,7,59,219,161,210,200,133,
+    165,220,168,55,72,68,85,122,243,191,43,210,231,154,110,235,
+    188,177,158,77,47,103,47,218,152,61,39,103,18,198,24,33,
+    52,126,10,232,241,8,30,77,119,6,15,71,197,206,96,115,
+    116,123,143,205,10,146,218,238,194,101,242,87,153,127,75,82,
+    185,140,255,132,223,217,153,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/Platform.py",
+    "m5.objects.Platform",
+    embedded_module_data,
+    535,
+    874);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,76 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,205,84,75,79,19,81,20,190,119,102,218,78,159,17,
+    138,8,24,160,62,74,108,228,177,232,152,24,53,70,49,141,
+    27,83,176,173,44,102,51,105,102,46,9,164,165,229,206,212,
+    40,113,193,130,68,76,92,184,49,176,116,69,104,112,225,210,
+    159,81,12,70,50,137,43,87,238,106,202,194,184,242,158,153,
+    206,180,182,128,18,76,180,157,126,115,231,126,167,231,241,157,
+    51,247,11,106,251,120,154,247,198,59,6,27,72,67,26,46,
+    160,34,150,113,145,147,57,140,52,78,230,53,94,22,56,68,
+    240,162,99,139,8,79,132,45,14,161,29,206,217,193,136,67,
+    247,145,38,172,33,205,67,240,22,207,56,222,225,100,175,197,
+    121,25,231,235,226,124,22,39,50,206,79,184,14,78,180,184,
+    0,227,130,93,156,95,11,101,81,34,252,21,30,18,156,41,
+    204,150,168,97,6,230,136,106,148,40,172,87,194,25,162,19,
+    35,150,33,203,21,162,27,43,17,231,81,47,151,150,116,162,
+    182,107,224,84,209,24,97,240,156,169,64,144,140,53,36,115,
+    235,104,30,107,120,77,148,249,117,244,4,203,66,22,66,157,
+    177,60,53,253,66,40,149,107,243,5,26,65,150,13,153,193,
+    107,188,129,12,220,34,183,216,111,199,125,122,211,198,180,62,
+    134,208,90,63,99,209,223,118,84,206,122,130,178,168,202,167,
+    115,9,108,250,23,116,69,47,85,168,74,170,188,233,209,43,
+    101,66,77,81,81,22,150,22,12,69,49,123,51,169,108,42,
+    167,100,82,15,31,165,178,236,62,243,32,197,204,4,157,20,
+    230,77,65,35,186,106,250,21,69,45,228,117,93,81,116,8,
+    16,139,173,254,232,211,169,58,165,145,199,83,86,153,80,223,
+    100,249,41,13,49,118,101,176,179,242,73,39,212,24,84,156,
+    96,240,125,21,125,22,195,47,124,47,125,159,196,129,15,226,
+    192,199,193,171,219,185,247,185,154,56,176,43,78,239,137,211,
+    53,231,106,64,45,85,15,100,187,148,47,18,150,109,64,81,
+    138,37,173,82,128,117,72,81,150,43,249,130,205,88,193,205,
+    112,51,85,149,20,10,138,82,197,180,135,237,234,32,225,29,
+    218,203,144,122,29,136,67,50,119,237,100,156,111,157,195,158,
+    123,184,142,78,134,180,207,241,121,138,121,233,105,170,102,15,
+    94,215,192,8,206,192,204,253,149,129,233,124,45,173,97,193,
+    233,42,79,131,80,139,37,101,212,153,139,236,236,76,58,155,
+    178,6,131,70,64,206,230,16,216,130,90,61,31,234,202,222,
+    109,250,4,100,125,249,208,166,143,111,107,187,98,114,79,76,
+    214,156,203,150,242,44,192,80,71,227,134,29,24,7,135,215,
+    187,27,39,65,55,254,4,236,32,195,167,235,87,191,125,136,
+    252,15,111,57,21,161,158,0,192,17,237,25,61,60,89,183,
+    71,18,88,70,1,142,214,63,238,64,18,22,231,93,227,248,
+    233,116,60,247,75,106,255,110,250,233,40,20,19,59,70,196,
+    216,17,153,186,42,222,4,211,139,199,171,120,197,129,27,176,
+    184,228,26,195,86,58,17,48,253,197,107,147,229,60,205,23,
+    117,10,25,80,200,155,134,1,46,48,48,189,106,169,88,206,
+    27,246,41,54,236,182,5,254,93,109,122,130,48,63,196,91,
+    246,33,121,155,78,88,21,178,36,162,12,235,60,198,184,46,
+    241,152,171,163,223,67,0,245,199,107,168,119,191,127,172,134,
+    162,251,40,184,42,172,5,107,161,145,90,44,185,139,164,61,
+    36,213,144,84,23,57,12,199,224,225,248,202,248,102,221,15,
+    218,153,8,135,37,88,118,194,166,0,198,210,65,107,55,114,
+    156,239,77,249,36,190,23,59,125,187,96,137,246,19,230,143,
+    193,198,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/ResetPort.py",
+    "m5.objects.ResetPort",
+    embedded_module_data,
+    818,
+    2284);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,65 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,82,77,79,19,65,24,158,217,239,45,181,229,43,
+    24,227,71,138,120,169,209,18,171,36,90,141,137,72,164,120,
+    64,18,209,195,30,216,44,59,35,212,116,41,206,180,4,202,
+    101,15,30,140,23,61,233,149,19,209,248,103,138,33,113,51,
+    87,79,222,74,224,196,201,119,118,217,202,151,59,179,207,124,
+    188,179,239,62,243,60,239,111,116,236,209,143,198,253,5,128,
+    175,136,32,130,235,40,192,14,198,114,174,212,149,121,57,170,
+    117,53,208,28,13,35,5,77,35,162,189,71,68,167,218,182,
+    138,208,15,53,77,228,232,113,204,128,152,73,241,169,152,65,
+    172,151,168,104,255,145,139,34,22,185,73,143,215,252,185,90,
+    99,138,174,213,124,10,59,248,38,128,253,178,22,188,88,124,
+    75,253,166,127,156,98,154,102,191,26,83,164,200,193,4,57,
+    10,188,42,193,142,70,20,71,39,170,99,80,115,203,66,231,
+    60,68,219,198,64,6,247,200,216,68,7,50,134,176,103,202,
+    79,19,2,237,1,66,215,198,107,101,127,156,196,235,210,242,
+    114,59,191,68,131,137,74,165,119,102,190,125,229,9,33,140,
+    114,94,104,188,41,36,231,10,141,149,2,124,85,88,108,241,
+    217,98,70,88,174,187,226,5,212,117,69,198,117,131,6,105,
+    213,229,60,235,186,239,90,94,253,40,162,53,55,86,169,200,
+    248,235,235,238,50,245,8,101,194,150,115,191,238,113,46,44,
+    111,145,55,153,231,55,133,62,231,49,47,16,250,171,153,149,
+    230,125,97,193,79,92,15,254,254,29,237,203,43,28,14,114,
+    22,115,141,57,3,197,210,234,6,51,33,16,67,17,94,126,
+    15,32,236,181,168,111,36,156,138,6,110,132,207,163,254,209,
+    112,38,202,15,133,213,40,63,252,105,243,227,102,231,242,131,
+    157,124,101,55,95,9,171,178,177,161,52,205,9,15,180,212,
+    131,103,255,245,128,26,91,230,121,250,47,65,249,108,43,224,
+    128,210,115,192,34,26,56,160,11,3,168,79,182,120,59,151,
+    94,5,132,148,218,103,123,218,67,84,152,137,1,32,177,205,
+    164,195,204,150,144,145,208,39,33,43,225,2,128,232,123,13,
+    181,211,96,177,118,241,29,132,153,24,197,217,160,60,20,223,
+    109,88,194,72,10,119,164,88,229,83,98,13,73,177,70,165,
+    88,215,64,172,220,165,95,185,177,159,185,177,173,201,111,246,
+    78,174,188,155,43,135,211,178,37,233,100,146,217,162,41,6,
+    130,137,82,35,46,94,94,74,8,51,89,184,194,134,253,85,
+    73,136,139,44,76,123,37,206,244,84,232,132,204,73,130,135,
+    214,163,164,128,30,179,171,176,148,197,203,191,0,116,85,140,
+    113,183,138,17,190,221,65,183,142,247,8,93,236,164,61,66,
+    215,59,39,123,215,208,241,195,46,58,11,159,237,61,57,28,
+    252,219,237,215,240,221,46,58,11,31,22,246,228,112,112,78,
+    40,230,253,23,98,137,9,49,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/i2c/I2C.py",
+    "m5.objects.I2C",
+    embedded_module_data,
+    648,
+    1111);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,399 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,197,91,107,108,27,217,117,30,74,148,196,167,248,20,
+    73,81,146,61,150,228,7,29,63,36,217,114,44,173,157,93,
+    203,122,91,146,13,203,107,52,196,166,44,197,25,89,19,243,
+    213,153,161,109,49,187,5,27,108,55,170,27,212,138,210,196,
+    194,2,233,42,109,177,176,145,69,155,127,139,2,45,208,34,
+    191,250,111,104,12,106,97,128,22,6,10,20,240,63,25,22,
+    138,194,127,218,115,238,112,248,152,25,106,189,201,22,21,165,
+    51,51,247,124,188,115,31,231,158,215,189,250,15,170,238,167,
+    173,114,125,253,251,45,20,245,152,98,40,198,146,166,50,150,
+    184,197,130,247,45,233,150,76,107,188,53,99,141,91,51,109,
+    241,54,82,214,154,110,191,165,94,59,200,213,154,182,101,236,
+    113,59,240,218,226,14,214,185,227,162,76,126,88,7,235,248,
+    28,222,240,171,22,173,196,66,181,80,51,20,211,254,49,197,
+    116,176,206,207,91,129,215,170,241,226,110,194,179,1,207,206,
+    118,234,120,30,194,115,0,207,201,218,117,60,47,225,185,128,
+    231,54,240,124,132,215,9,60,143,129,231,39,60,47,240,124,
+    6,94,128,240,252,192,11,24,120,65,214,194,4,187,171,189,
+    228,59,9,182,11,176,33,54,168,195,118,17,94,24,120,17,
+    3,47,68,120,221,192,139,26,222,17,38,188,30,224,245,178,
+    173,58,94,132,240,250,128,119,136,141,232,120,221,132,119,24,
+    120,52,219,173,227,69,9,239,8,240,250,13,188,30,194,27,
+    0,222,160,161,206,94,194,59,10,188,99,108,175,142,215,71,
+    120,199,129,119,194,192,59,196,196,150,169,216,201,151,248,16,
+    179,40,182,149,2,151,102,166,178,247,98,173,138,253,70,138,
+    155,100,239,113,41,86,177,193,237,92,110,34,201,147,194,69,
+    54,3,183,128,182,156,4,98,95,230,50,215,87,190,207,166,
+    68,197,54,117,107,118,234,230,210,212,173,84,189,132,105,130,
+    245,250,16,144,31,129,40,179,84,220,194,80,241,150,13,106,
+    213,194,88,62,182,197,91,55,168,7,150,184,21,26,210,2,
+    117,136,107,44,63,151,21,83,45,117,117,88,225,15,27,253,
+    250,54,144,159,89,30,83,162,165,198,252,28,254,126,85,125,
+    218,169,227,212,126,68,107,237,254,67,139,94,224,25,106,153,
+    122,106,89,122,218,170,180,9,133,60,203,43,182,68,130,203,
+    114,98,34,161,184,181,62,37,110,94,95,152,2,132,85,96,
+    211,171,138,149,97,133,148,98,79,36,82,233,164,32,36,18,
+    2,182,142,166,75,111,194,2,159,58,203,176,247,206,102,89,
+    241,44,233,11,220,156,201,175,243,94,0,20,125,90,239,206,
+    104,47,184,128,189,26,0,242,223,37,234,223,108,238,63,237,
+    248,113,199,115,91,228,153,45,242,139,190,39,214,178,237,180,
+    108,59,45,105,191,175,177,181,79,219,176,117,217,100,134,133,
+    214,57,18,137,76,142,41,164,241,222,149,72,252,97,33,153,
+    86,57,228,117,138,187,210,190,20,155,78,39,18,79,45,124,
+    23,148,10,56,64,239,241,33,160,188,83,35,163,216,140,139,
+    106,51,180,207,94,139,165,237,204,30,245,118,132,143,104,85,
+    253,14,147,223,121,27,196,40,199,255,127,137,0,239,198,62,
+    116,34,241,227,64,85,230,84,29,42,50,127,225,198,6,86,
+    103,241,29,68,132,145,144,97,64,197,195,31,210,141,245,17,
+    141,140,227,205,225,42,248,136,126,204,180,118,190,254,47,138,
+    170,27,49,248,107,101,96,164,152,150,120,91,11,197,182,51,
+    173,159,67,237,191,170,246,53,222,65,74,173,186,82,27,107,
+    223,113,152,141,7,211,198,180,55,142,66,220,217,20,219,193,
+    216,116,88,23,96,221,166,88,59,163,179,40,241,78,192,122,
+    204,176,172,151,113,234,176,62,198,5,178,224,86,236,100,144,
+    23,184,236,221,98,80,91,79,44,22,165,161,232,204,218,90,
+    209,115,135,205,140,142,143,87,97,111,156,92,86,100,249,213,
+    100,138,165,135,138,117,15,195,74,235,80,65,120,211,149,79,
+    166,238,178,34,45,242,201,172,144,225,68,154,97,211,201,117,
+    224,101,133,55,71,76,121,244,189,36,207,37,87,184,52,39,
+    174,43,109,195,51,43,121,225,141,3,95,79,11,121,150,101,
+    222,56,153,66,38,79,231,136,242,91,138,249,249,40,78,103,
+    15,146,94,32,138,85,92,207,179,138,35,245,224,65,98,141,
+    77,50,160,86,236,120,79,86,36,89,41,138,21,26,57,68,
+    232,176,210,118,35,201,39,51,74,199,66,82,100,179,41,120,
+    159,218,60,59,185,36,160,37,138,119,137,21,239,231,248,187,
+    19,201,44,115,159,99,196,53,208,86,216,142,202,80,77,66,
+    99,20,235,210,251,11,11,160,157,224,254,105,69,190,136,240,
+    13,106,228,93,248,19,254,12,72,109,157,239,58,67,165,201,
+    93,223,241,210,252,174,247,72,105,238,133,51,176,113,113,115,
+    177,236,236,151,157,253,192,208,61,186,124,143,22,31,46,110,
+    31,149,142,92,44,187,198,100,215,88,105,106,215,219,245,216,
+    189,229,222,102,165,163,179,101,239,156,236,157,43,205,1,238,
+    185,171,255,153,171,127,231,219,79,22,170,64,167,247,209,187,
+    15,223,221,62,191,211,87,118,158,149,157,103,75,147,248,81,
+    219,137,173,51,95,7,233,150,175,183,14,88,219,142,221,84,
+    50,173,76,155,78,218,28,77,177,237,76,135,97,117,216,204,
+    125,40,198,198,216,117,88,55,96,59,205,176,172,199,176,58,
+    188,128,245,153,214,235,100,92,58,172,191,41,214,205,116,234,
+    176,129,166,125,243,48,94,29,54,216,20,235,99,252,58,108,
+    23,96,67,166,216,0,19,212,97,195,77,219,219,197,132,116,
+    216,8,96,187,77,177,97,38,162,195,70,15,192,118,235,176,
+    61,77,219,16,101,122,116,216,94,166,23,180,79,159,226,158,
+    228,4,177,166,129,186,53,13,196,64,113,162,65,13,5,84,
+    53,212,128,231,143,66,93,252,49,36,199,145,156,64,18,67,
+    114,18,201,183,144,156,2,162,88,134,138,131,55,147,160,80,
+    114,171,180,184,198,9,52,86,70,231,249,92,138,21,4,250,
+    4,190,141,230,11,217,152,98,25,46,14,44,21,50,43,44,
+    143,208,122,20,219,128,235,28,29,25,170,253,136,197,240,42,
+    199,3,143,0,132,245,108,138,94,73,242,60,7,170,200,58,
+    12,58,177,24,49,48,104,158,205,179,73,81,177,167,115,169,
+    100,122,45,39,136,197,192,34,188,38,121,135,165,5,150,191,
+    7,8,244,48,20,235,8,188,200,192,202,231,120,113,186,216,
+    47,242,5,150,230,42,93,74,210,68,101,114,89,154,140,155,
+    112,159,19,83,107,197,238,101,49,201,87,94,13,37,107,116,
+    94,96,11,76,46,145,203,43,150,145,98,164,214,87,129,203,
+    20,210,160,19,233,108,14,124,174,165,88,159,78,205,242,167,
+    145,156,65,114,150,210,92,154,33,36,35,72,206,33,57,143,
+    4,93,28,30,221,45,254,219,72,208,217,225,199,144,160,61,
+    86,218,223,7,123,126,110,4,244,45,206,48,152,129,187,149,
+    91,129,43,130,18,199,118,38,4,108,178,226,36,247,149,97,
+    106,95,22,121,46,123,7,10,201,0,16,191,172,250,128,163,
+    161,88,39,114,185,180,98,231,132,132,218,115,37,164,86,139,
+    149,228,178,137,90,183,237,217,66,38,65,58,201,19,119,162,
+    166,188,47,107,100,1,254,132,17,75,163,242,142,162,242,62,
+    133,202,251,168,81,121,127,195,218,26,191,235,218,114,109,47,
+    75,253,181,239,214,202,102,202,222,89,217,59,11,101,190,208,
+    227,190,173,62,233,240,89,105,120,190,236,187,38,251,174,65,
+    3,253,225,199,167,183,78,239,180,75,39,38,202,254,171,178,
+    255,106,233,26,150,157,218,58,181,253,3,233,212,149,178,127,
+    66,246,79,212,202,238,73,199,47,149,253,151,101,255,101,40,
+    131,151,56,182,28,219,163,82,255,116,217,59,35,123,103,224,
+    37,125,253,159,197,63,141,63,105,147,206,206,151,251,174,201,
+    125,215,36,107,180,174,53,151,202,222,203,178,247,114,105,14,
+    63,234,112,226,32,154,219,152,191,164,154,217,24,182,125,167,
+    195,84,123,180,130,175,213,168,61,108,128,53,213,162,172,195,
+    96,121,156,128,53,183,38,70,203,227,102,108,160,149,236,149,
+    224,104,2,22,110,160,193,37,90,41,8,168,138,58,235,60,
+    34,0,221,42,198,4,54,203,208,21,223,102,5,46,180,152,
+    131,69,137,203,53,203,128,216,210,85,39,73,85,71,29,195,
+    67,67,139,224,229,20,123,161,70,213,201,193,117,187,194,137,
+    2,13,97,17,124,45,149,203,50,75,177,206,175,88,131,100,
+    229,45,98,141,182,116,46,151,199,55,235,214,91,221,66,212,
+    9,251,77,141,36,81,216,227,84,163,176,119,161,176,31,67,
+    97,167,65,216,61,193,71,197,135,197,237,65,137,190,86,246,
+    44,200,158,133,210,172,153,208,86,133,123,76,58,3,210,189,
+    40,187,22,75,83,248,81,95,123,179,169,80,92,180,124,93,
+    161,96,109,224,142,52,78,158,29,176,230,78,181,209,29,113,
+    130,67,227,2,183,188,209,161,113,67,13,166,206,132,137,91,
+    238,1,172,215,20,107,116,203,125,77,177,102,142,71,51,172,
+    137,227,193,120,64,92,189,138,147,72,226,178,170,240,67,13,
+    18,171,234,66,20,90,95,157,208,170,80,85,22,219,135,135,
+    208,225,46,30,83,161,244,106,114,133,231,82,77,133,242,141,
+    95,11,182,233,57,77,168,193,200,45,114,19,197,30,84,225,
+    104,74,114,5,49,95,16,137,145,162,87,10,171,171,208,12,
+    51,35,141,182,49,35,128,21,227,50,44,46,152,52,119,143,
+    124,125,241,202,85,58,201,48,60,154,230,76,50,15,235,103,
+    41,22,124,155,149,96,34,250,138,75,237,79,130,244,135,196,
+    128,96,35,170,13,119,44,178,153,28,191,190,140,182,199,175,
+    54,59,161,182,152,216,35,157,85,83,92,216,212,132,152,75,
+    96,83,245,11,234,182,70,238,194,159,240,37,213,184,160,34,
+    184,160,98,184,160,6,208,122,24,23,79,32,242,60,16,123,
+    22,136,237,218,188,146,127,252,85,107,75,176,125,159,2,82,
+    90,216,107,167,124,135,55,59,165,195,231,202,222,243,178,247,
+    60,104,228,238,67,207,187,99,207,186,1,220,41,121,79,3,
+    56,138,224,104,187,100,13,1,218,237,127,59,99,20,136,60,
+    190,188,117,121,39,36,197,22,203,129,37,57,176,84,90,192,
+    143,218,39,236,137,249,106,253,49,213,108,181,50,173,241,118,
+    182,99,199,102,42,191,198,85,104,7,172,233,138,101,157,134,
+    144,217,5,43,214,13,10,187,113,197,118,86,20,182,139,8,
+    229,173,100,126,34,41,176,183,222,52,106,109,49,153,199,5,
+    224,175,91,0,21,36,231,5,137,44,122,0,80,145,83,154,
+    204,58,174,139,98,53,169,84,83,222,40,164,176,6,178,16,
+    134,226,45,214,119,92,160,179,106,180,184,20,243,152,201,168,
+    98,75,174,8,16,238,166,68,157,180,42,173,176,126,148,54,
+    120,175,80,212,75,46,9,90,91,161,89,122,25,75,106,228,
+    35,148,177,239,234,100,172,27,196,200,19,0,221,172,106,238,
+    65,16,52,240,75,230,30,206,109,178,82,223,153,178,235,172,
+    236,58,107,238,110,56,252,27,39,164,192,100,217,49,37,59,
+    166,74,87,241,163,190,21,223,165,56,103,175,220,158,74,220,
+    122,127,233,214,149,27,230,34,193,55,21,137,175,105,213,205,
+    177,198,12,138,157,233,128,137,183,85,44,53,76,39,191,130,
+    147,214,217,56,199,69,87,53,69,40,22,178,197,35,55,146,
+    224,0,87,76,51,20,208,169,116,46,203,210,12,73,190,18,
+    191,183,104,195,10,78,195,200,23,61,240,253,42,11,188,205,
+    165,152,227,109,116,208,60,14,152,23,42,79,144,202,19,106,
+    13,10,202,88,229,158,248,174,250,137,229,52,242,16,39,118,
+    177,113,98,61,221,27,214,221,174,147,27,142,221,224,224,134,
+    253,69,15,253,217,165,79,47,237,186,162,82,239,187,176,244,
+    123,29,176,244,123,29,146,45,2,75,31,120,167,62,61,181,
+    83,148,206,77,150,163,83,114,116,106,195,131,31,245,77,88,
+    191,249,252,77,127,35,243,199,180,193,156,180,215,22,227,178,
+    88,88,81,231,69,183,246,144,193,125,225,6,70,236,6,24,
+    137,179,66,142,120,78,107,108,154,24,154,181,92,33,205,208,
+    117,62,149,0,147,182,20,179,191,197,248,43,142,89,8,165,
+    150,73,125,138,21,45,144,126,164,51,26,249,25,142,244,57,
+    202,184,132,106,171,199,233,125,238,236,121,230,236,217,158,148,
+    250,193,215,95,146,157,75,245,153,148,76,211,241,204,255,22,
+    227,105,200,39,54,241,113,205,178,43,76,59,140,124,7,81,
+    35,186,44,30,102,168,244,89,60,204,96,21,237,36,169,182,
+    202,165,217,151,127,128,95,235,207,36,31,16,147,205,229,178,
+    104,133,43,222,44,147,20,147,184,100,16,189,20,115,190,245,
+    18,176,98,205,60,131,183,237,80,115,154,205,234,39,226,162,
+    70,126,129,19,49,161,155,8,93,170,204,251,232,210,195,75,
+    219,206,178,115,80,118,14,2,11,76,220,119,31,126,119,147,
+    151,122,222,45,187,223,147,221,239,149,166,241,163,86,127,81,
+    63,47,218,62,204,235,243,77,231,5,77,23,152,152,14,99,
+    94,183,34,213,170,147,165,110,212,220,122,211,232,101,169,11,
+    91,239,101,169,88,254,247,160,150,102,194,155,106,28,62,18,
+    83,127,64,25,157,245,130,70,48,1,47,140,80,70,223,66,
+    213,251,85,7,195,27,217,180,73,221,167,203,222,51,178,247,
+    76,125,100,86,104,42,179,63,111,154,253,251,191,114,194,15,
+    192,26,204,63,96,205,179,224,70,215,188,243,107,96,61,140,
+    61,238,101,28,113,31,92,253,140,19,92,106,103,60,200,184,
+    226,93,112,13,129,60,132,25,247,23,157,58,137,136,0,175,
+    155,241,196,163,140,55,222,195,248,226,189,240,190,62,211,247,
+    249,153,128,238,125,135,14,192,234,115,122,135,15,192,118,233,
+    176,244,1,88,125,254,239,72,83,172,49,255,215,127,0,86,
+    159,255,27,0,236,160,41,54,170,27,193,163,77,145,61,58,
+    228,177,74,158,208,58,55,179,50,85,83,109,220,197,145,209,
+    243,15,102,38,200,154,115,168,107,14,17,111,186,171,94,219,
+    108,146,103,238,39,121,150,190,162,134,18,74,251,185,139,231,
+    175,65,152,18,88,174,132,41,232,5,240,15,232,233,185,233,
+    235,141,133,162,90,248,242,61,104,65,241,116,45,69,198,162,
+    35,200,177,2,134,69,149,47,227,246,36,207,229,197,28,79,
+    167,146,169,53,150,251,164,68,81,156,13,34,56,30,7,230,
+    37,18,8,177,70,46,194,155,159,90,20,43,250,151,47,255,
+    7,57,184,109,245,18,59,138,97,80,22,194,32,117,43,100,
+    133,93,205,241,44,169,151,190,207,115,34,75,210,9,185,84,
+    170,192,11,197,67,70,204,42,139,65,91,133,223,167,242,147,
+    171,208,78,19,118,212,192,190,191,82,225,145,168,172,24,174,
+    7,192,40,48,153,36,205,179,73,166,145,193,215,49,142,222,
+    88,91,167,111,204,77,194,120,36,69,112,142,121,24,234,60,
+    132,137,2,177,25,170,247,52,55,89,60,134,176,169,175,196,
+    45,197,142,191,141,141,119,105,147,140,83,139,219,53,15,196,
+    198,146,181,202,220,39,42,97,36,255,61,242,53,254,65,98,
+    149,91,205,169,169,70,151,88,247,164,26,42,63,0,112,88,
+    18,100,42,85,152,95,52,150,217,110,131,107,146,227,231,38,
+    21,231,114,97,69,88,23,68,54,3,15,190,234,67,149,223,
+    190,44,38,197,130,160,184,128,117,21,247,163,174,130,147,169,
+    216,107,183,237,55,248,220,157,185,105,190,157,8,194,196,149,
+    155,67,74,231,98,242,1,151,41,100,180,13,42,215,34,151,
+    197,231,25,62,9,1,131,155,68,221,124,33,47,46,112,89,
+    232,69,245,241,6,151,37,225,170,98,187,191,146,80,247,180,
+    156,100,246,43,15,94,245,33,149,203,228,43,37,110,0,214,
+    63,66,79,113,78,43,143,157,48,24,68,0,43,207,36,113,
+    59,124,65,233,200,175,173,39,242,28,163,216,240,134,133,59,
+    189,177,122,160,145,191,131,63,225,147,134,52,234,11,167,175,
+    106,216,123,193,78,133,123,159,135,99,207,194,16,200,70,164,
+    232,40,120,179,17,12,100,35,16,200,6,193,155,13,118,63,
+    15,12,60,11,12,236,204,74,103,174,150,3,147,114,96,178,
+    180,64,34,101,99,105,247,161,207,186,63,237,222,181,57,36,
+    215,59,250,128,56,122,184,57,207,27,2,195,233,143,148,174,
+    237,70,14,73,214,174,93,119,160,52,189,27,8,67,141,222,
+    32,196,200,110,31,60,58,131,27,99,219,39,36,231,64,217,
+    57,32,59,7,160,7,93,221,165,37,21,21,140,148,22,213,
+    59,79,240,209,71,15,63,218,190,45,29,157,43,123,230,101,
+    207,60,86,92,77,197,206,150,253,115,178,127,14,222,19,238,
+    125,252,209,214,71,59,183,165,211,11,229,240,162,28,94,132,
+    206,238,6,187,31,47,110,45,238,28,147,78,78,151,131,51,
+    114,112,6,106,173,148,29,149,98,19,229,224,85,57,120,21,
+    202,186,162,143,191,183,245,189,157,81,233,228,213,114,215,164,
+    220,53,9,237,232,12,60,74,63,76,75,61,19,229,206,171,
+    114,231,213,210,12,54,229,195,135,31,74,189,147,101,207,148,
+    236,153,42,205,226,71,157,34,156,152,6,7,64,83,182,175,
+    113,229,213,57,0,22,112,0,90,192,1,104,5,231,8,143,
+    13,180,41,14,84,177,9,118,120,104,104,136,43,128,138,227,
+    158,128,122,227,74,224,93,45,61,109,215,239,202,218,84,247,
+    103,110,146,199,148,47,255,25,101,244,106,126,169,145,127,197,
+    215,227,78,125,221,161,136,202,204,116,6,177,59,93,245,61,
+    248,229,111,223,3,27,233,1,119,103,133,251,23,108,255,21,
+    248,38,247,79,46,104,63,255,87,38,237,251,92,35,255,142,
+    55,127,83,101,126,174,111,64,213,135,250,164,169,15,117,80,
+    106,132,181,27,98,41,7,96,157,102,88,147,88,216,117,0,
+    214,144,225,62,0,107,244,163,154,99,245,251,176,158,166,88,
+    135,225,228,129,247,0,172,62,29,234,3,172,223,20,107,182,
+    15,219,28,235,49,236,195,118,236,116,153,98,45,134,61,219,
+    80,211,246,26,247,108,195,77,235,53,238,217,70,14,192,234,
+    253,187,238,3,176,122,255,46,202,132,65,216,35,21,51,9,
+    203,144,36,197,248,123,148,46,16,175,112,248,117,96,144,252,
+    108,177,123,149,123,192,50,149,67,25,224,99,84,237,188,80,
+    140,100,10,105,145,203,167,113,235,178,145,19,53,251,18,177,
+    28,66,177,219,228,91,42,75,105,29,46,8,69,247,77,54,
+    197,98,218,119,18,191,93,236,188,165,157,11,153,84,109,206,
+    232,240,8,113,217,48,54,213,178,203,224,126,160,221,110,44,
+    20,43,133,93,83,217,228,74,154,165,181,122,167,185,52,218,
+    199,43,216,187,158,170,173,196,61,221,124,242,78,146,196,186,
+    164,225,211,197,65,134,101,184,20,216,92,134,190,139,174,68,
+    26,92,21,236,32,105,183,118,94,165,41,74,32,48,94,125,
+    107,49,168,189,126,153,99,128,164,146,105,146,196,238,121,155,
+    24,144,132,208,31,35,249,19,36,159,32,33,118,189,19,6,
+    175,222,64,123,170,207,171,73,60,44,165,22,212,155,108,111,
+    173,160,2,177,17,15,7,121,54,177,114,71,124,35,254,71,
+    72,54,144,144,237,36,59,113,149,112,232,20,7,151,21,249,
+    202,151,176,88,237,175,98,23,171,183,173,188,96,216,74,125,
+    162,145,255,132,63,97,214,98,204,178,212,5,172,131,95,225,
+    8,216,168,80,143,102,245,166,202,93,211,114,215,52,88,61,
+    40,203,108,101,118,166,164,111,77,149,67,211,114,104,186,116,
+    189,174,108,166,28,154,149,67,179,80,86,49,183,239,75,167,
+    102,202,225,89,57,60,11,85,190,168,216,234,247,119,174,151,
+    61,231,101,207,121,104,139,86,36,13,158,47,123,70,101,207,
+    40,148,153,187,26,166,165,47,42,59,167,231,49,235,238,29,
+    147,189,99,213,237,89,220,97,157,44,251,166,100,223,20,118,
+    183,186,195,218,176,181,107,40,115,120,30,157,124,120,114,243,
+    125,169,119,164,236,56,39,59,206,213,231,101,113,104,191,238,
+    97,182,111,36,21,219,106,146,197,111,134,53,110,176,58,24,
+    91,220,9,161,182,11,66,110,55,132,209,157,16,106,123,224,
+    234,133,80,219,103,12,181,161,212,207,120,244,165,171,45,16,
+    166,123,33,76,247,65,152,238,143,135,152,64,60,204,4,65,
+    229,117,41,237,75,203,51,220,157,169,162,95,11,20,179,66,
+    226,14,119,135,132,137,46,85,245,169,136,233,98,96,114,241,
+    10,106,142,73,76,112,113,176,126,121,150,45,70,181,194,106,
+    88,39,104,188,91,69,122,89,77,76,222,103,233,100,26,143,
+    109,136,172,26,244,209,160,69,112,37,112,78,112,42,94,246,
+    67,19,95,110,182,84,34,64,254,67,92,79,214,145,209,11,
+    19,252,31,145,91,12,66,95,98,34,234,229,175,145,255,199,
+    72,126,72,97,142,40,242,214,219,189,110,92,217,152,154,75,
+    96,211,42,143,24,165,144,71,162,8,178,185,132,214,74,30,
+    207,161,241,127,141,228,207,145,60,66,178,137,228,39,72,240,
+    4,124,45,0,17,248,159,226,243,95,32,193,20,41,255,115,
+    202,232,25,125,169,17,11,204,138,128,126,126,253,242,14,160,
+    139,127,20,69,253,16,172,108,240,98,231,183,230,183,11,210,
+    177,119,202,193,75,114,240,146,234,217,86,202,106,158,45,172,
+    221,239,111,125,127,39,40,29,159,43,135,230,229,208,124,233,
+    250,11,116,252,136,247,103,234,150,187,130,27,179,219,199,36,
+    215,145,178,235,136,236,58,178,51,182,51,246,235,99,210,192,
+    88,121,96,76,30,24,147,156,227,230,142,122,109,143,11,123,
+    240,77,37,195,126,215,13,141,166,201,48,99,210,202,217,180,
+    94,227,222,179,171,41,214,184,247,236,62,160,94,183,73,146,
+    173,89,189,122,199,204,211,180,111,198,3,114,222,166,88,163,
+    179,229,107,138,53,58,91,184,175,30,48,197,26,15,200,5,
+    15,192,134,13,135,244,154,99,245,201,180,16,211,13,154,42,
+    26,143,48,61,241,110,166,23,28,181,190,120,15,92,123,65,
+    207,245,49,135,190,56,172,75,126,29,98,232,248,97,230,72,
+    156,102,250,227,71,24,79,188,159,25,0,45,55,168,180,45,
+    115,89,46,165,157,136,19,240,97,124,92,13,183,138,94,77,
+    243,145,98,208,123,74,219,240,232,240,249,137,162,19,252,38,
+    244,152,82,185,60,30,178,189,128,126,149,83,172,149,189,196,
+    145,44,246,226,35,32,181,125,23,220,143,225,52,183,137,47,
+    34,36,84,113,192,232,53,238,206,26,113,127,132,181,92,154,
+    225,113,75,178,216,165,49,211,185,251,53,94,49,36,154,126,
+    167,216,37,154,193,137,58,44,250,110,115,188,88,0,215,169,
+    8,206,214,242,220,210,220,85,254,7,88,78,79,172,131,255,
+    168,238,197,230,215,241,248,219,10,219,240,245,151,24,16,22,
+    7,174,103,211,235,116,145,229,43,184,228,74,14,28,50,114,
+    82,174,138,156,46,250,226,85,128,230,188,117,17,223,19,222,
+    73,74,171,158,159,191,210,28,237,104,2,120,116,220,79,32,
+    220,224,126,10,132,255,123,170,65,223,183,93,64,45,79,20,
+    62,255,15,72,254,145,170,168,250,165,216,128,169,150,39,10,
+    158,168,122,162,229,73,194,10,166,44,1,243,145,32,83,6,
+    115,85,125,224,167,234,217,232,160,41,62,45,185,85,237,156,
+    226,213,138,96,116,0,200,223,85,124,90,206,11,167,65,87,
+    84,251,158,251,158,218,83,120,85,33,43,42,157,56,134,228,
+    181,106,246,43,80,123,174,205,152,234,53,86,57,138,67,61,
+    78,77,238,93,90,125,56,114,95,97,139,208,12,241,255,140,
+    228,45,172,208,111,52,18,70,43,244,3,157,147,233,199,99,
+    116,71,209,9,27,40,205,191,240,135,159,251,251,159,249,241,
+    224,221,98,217,63,46,251,199,201,1,56,211,66,114,42,142,
+    151,6,106,39,229,34,125,207,35,39,158,69,78,60,137,72,
+    231,174,149,35,11,114,100,1,115,69,232,180,30,127,22,62,
+    254,196,38,141,204,149,195,243,114,120,30,115,57,77,208,245,
+    197,243,229,200,53,57,114,13,139,193,22,46,108,45,236,248,
+    164,193,111,151,131,23,229,224,69,53,203,243,193,214,7,59,
+    253,210,177,217,114,215,156,220,53,7,70,44,122,24,183,118,
+    119,109,78,201,61,2,254,113,15,250,199,61,224,31,135,241,
+    124,72,72,243,31,71,203,222,11,178,247,130,234,123,70,183,
+    162,219,83,210,192,120,217,247,142,236,123,7,12,114,32,242,
+    120,124,107,28,79,129,140,149,3,227,114,96,28,252,214,131,
+    109,44,73,125,29,151,156,253,213,163,142,7,90,212,223,16,
+    17,63,172,56,50,163,103,24,118,149,203,178,2,143,187,111,
+    74,16,10,212,19,252,194,153,234,63,60,241,104,111,235,252,
+    15,59,128,242,120,60,95,80,108,120,203,231,30,128,248,192,
+    93,245,127,159,120,76,160,240,120,202,88,177,226,214,177,210,
+    142,25,204,164,168,30,153,112,168,255,54,130,12,245,223,64,
+    200,113,124,114,172,147,28,119,35,71,116,200,25,10,178,223,
+    78,182,130,201,54,36,217,95,35,121,75,146,147,34,137,31,
+    18,194,124,89,149,179,70,217,123,99,187,164,254,67,208,119,
+    120,76,14,161,206,22,254,22,58,186,215,106,177,88,246,150,
+    44,148,133,150,168,195,245,191,123,45,86,75,203,30,245,117,
+    136,131,178,68,36,42,172,254,238,82,33,73,251,221,165,250,
+    165,198,223,23,222,104,201,189,75,89,127,228,252,161,115,99,
+    113,251,114,153,138,201,84,76,162,98,123,237,45,150,51,123,
+    148,145,108,136,175,240,178,95,43,117,52,65,110,198,13,72,
+    135,101,104,143,50,146,77,251,43,188,236,215,74,163,126,203,
+    119,246,40,35,217,156,123,133,151,253,90,233,201,14,203,146,
+    101,143,50,167,27,235,175,200,117,191,158,19,244,88,174,195,
+    189,57,221,140,189,34,215,253,122,206,160,205,50,13,247,230,
+    116,115,236,21,185,238,215,115,66,148,213,181,177,40,183,70,
+    177,59,240,108,181,181,17,158,41,221,188,244,138,92,247,235,
+    57,161,54,242,126,115,138,223,104,35,173,172,227,120,219,45,
+    87,224,222,156,226,16,227,117,191,158,227,111,183,156,197,91,
+    61,193,65,128,203,126,173,212,63,72,250,102,78,55,222,121,
+    69,174,251,245,156,37,75,155,37,132,45,211,147,205,32,182,
+    61,180,95,43,245,54,65,162,168,233,144,17,203,249,61,202,
+    72,54,161,5,112,217,175,149,94,8,88,34,123,148,145,108,
+    124,240,10,47,251,181,210,83,135,241,206,72,54,22,94,225,
+    101,223,132,69,214,243,255,2,104,156,40,58,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/net/Ethernet.py",
+    "m5.objects.Ethernet",
+    embedded_module_data,
+    5996,
+    15374);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,92 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,84,205,111,27,69,20,159,93,175,215,159,113,236,
+    216,113,190,154,116,83,33,144,1,37,37,105,81,27,33,164,
+    196,166,33,77,98,162,4,42,180,82,101,109,118,38,241,82,
+    239,174,59,187,174,98,159,246,128,16,66,66,32,46,173,184,
+    128,56,68,66,229,143,113,81,36,86,115,170,196,41,18,7,
+    71,237,137,11,188,217,141,157,52,68,116,119,230,55,239,205,
+    251,154,153,247,102,254,68,231,190,232,233,248,162,10,240,24,
+    97,132,133,6,50,5,85,48,69,85,20,56,47,54,34,159,
+    134,163,20,140,145,70,212,148,85,89,64,34,90,69,88,250,
+    18,225,40,17,14,35,8,61,141,244,157,170,49,44,239,160,
+    82,236,152,51,37,145,37,182,116,163,66,30,25,58,9,200,
+    77,98,174,104,180,36,48,225,109,128,196,142,97,126,178,251,
+    5,209,93,253,252,194,164,254,194,222,21,248,194,8,82,5,
+    140,84,17,122,4,11,170,132,69,53,42,34,34,227,200,33,
+    200,159,10,231,66,75,106,28,71,213,4,150,213,36,142,169,
+    41,232,105,232,67,56,174,102,112,66,29,6,58,11,61,135,
+    147,234,8,78,169,121,156,86,11,224,105,20,15,253,150,185,
+    224,171,72,198,126,30,71,151,124,120,24,103,15,69,208,21,
+    7,186,19,160,59,121,169,110,14,143,92,208,157,2,221,43,
+    151,234,230,113,225,130,238,244,255,232,142,94,208,157,193,69,
+    56,246,49,150,44,219,205,246,71,214,190,97,145,78,17,147,
+    71,243,77,221,152,215,97,174,70,130,201,185,122,189,147,221,
+    39,230,205,165,165,115,154,5,78,43,161,134,82,217,92,86,
+    154,54,117,141,175,60,132,140,91,176,179,227,95,32,4,229,
+    193,142,227,28,60,14,255,112,80,56,240,83,99,210,123,235,
+    198,10,228,84,114,140,14,57,230,41,236,188,83,109,153,187,
+    132,42,246,94,224,83,175,107,150,69,26,142,226,214,53,87,
+    33,7,134,227,42,182,165,224,176,58,164,27,96,223,89,56,
+    51,217,53,92,135,143,46,213,44,103,15,230,184,227,208,86,
+    163,68,113,90,77,190,72,130,153,180,112,221,114,58,75,27,
+    154,75,44,189,173,104,123,46,40,107,97,72,219,52,53,11,
+    43,134,163,56,132,88,202,46,217,179,193,214,112,223,114,148,
+    38,181,117,157,56,14,193,157,202,107,108,129,108,54,136,75,
+    94,177,167,36,140,175,104,224,188,165,215,171,165,171,44,94,
+    171,89,154,73,106,53,150,172,213,76,27,183,26,156,78,215,
+    106,15,91,90,227,84,34,185,237,38,97,73,253,224,160,86,
+    39,26,38,148,37,56,173,55,52,199,97,185,123,112,25,108,
+    186,77,30,182,136,227,110,65,0,22,193,166,198,226,247,136,
+    133,109,186,86,97,241,240,54,113,106,27,40,199,176,45,150,
+    218,105,237,58,109,199,37,38,76,231,6,204,192,70,222,113,
+    53,183,229,176,52,136,202,60,78,217,198,112,31,207,72,121,
+    139,218,251,107,119,88,102,83,59,48,204,150,121,122,30,44,
+    189,105,88,156,95,133,28,184,108,104,205,130,227,161,173,166,
+    187,1,117,194,210,3,118,203,176,168,20,20,193,202,242,246,
+    117,22,221,210,168,102,178,232,103,160,112,139,197,202,144,247,
+    50,152,39,225,242,219,180,189,3,105,100,177,207,33,163,101,
+    173,201,98,253,80,153,134,230,174,4,199,187,66,160,12,217,
+    8,240,203,60,29,229,240,240,97,159,191,162,23,188,214,255,
+    158,112,168,62,223,175,237,179,42,158,107,182,41,47,207,0,
+    222,128,238,252,5,224,13,126,63,53,230,85,252,92,201,187,
+    235,103,175,121,107,126,114,170,11,237,202,194,179,228,226,81,
+    114,209,43,251,195,163,222,199,167,144,7,24,201,123,235,254,
+    248,68,87,26,245,135,242,222,29,63,63,230,109,248,217,2,
+    88,14,229,128,29,157,240,170,225,92,97,220,219,12,168,231,
+    169,194,215,183,159,188,217,77,205,62,75,205,30,165,102,189,
+    202,243,76,254,187,7,223,60,120,50,219,157,190,251,44,179,
+    126,148,89,247,86,253,76,254,143,204,204,239,153,25,63,158,
+    233,102,43,39,17,113,88,126,137,0,188,213,94,28,21,167,
+    30,223,255,225,126,32,218,0,81,145,139,138,178,87,237,201,
+    104,242,234,79,211,63,78,131,168,39,10,9,229,36,42,77,
+    130,16,160,43,21,195,70,23,251,219,175,150,226,172,96,222,
+    156,179,131,215,213,153,27,188,194,148,191,212,97,178,18,32,
+    111,242,76,57,44,206,73,106,31,64,198,129,26,188,202,84,
+    238,251,163,11,28,2,247,55,120,10,226,31,132,213,253,33,
+    189,13,44,127,0,156,111,1,122,17,65,16,122,239,71,4,
+    177,135,94,15,113,36,140,119,209,88,216,124,84,236,246,155,
+    143,174,117,95,109,61,121,86,144,123,232,191,240,253,196,9,
+    31,94,94,34,10,150,251,47,204,214,243,115,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/pci/CopyEngine.py",
+    "m5.objects.CopyEngine",
+    embedded_module_data,
+    1084,
+    1778);
+
+} // anonymous namespace
+} // namespace gem5
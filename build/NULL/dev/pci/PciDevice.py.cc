@@ -0,0 +1,234 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,197,90,75,83,219,88,22,150,193,24,191,159,50,152,
+    87,90,33,132,247,211,60,242,224,21,48,73,112,192,198,29,
+    232,30,134,164,135,18,150,32,238,248,65,203,38,29,156,94,
+    120,49,139,41,54,73,121,131,135,234,170,120,149,154,158,254,
+    51,82,151,170,134,210,170,171,102,53,59,82,157,85,47,166,
+    230,92,73,126,112,177,213,195,44,122,98,115,117,239,57,223,
+    185,247,156,239,30,29,69,146,255,73,84,253,107,82,143,191,
+    252,27,154,83,130,33,24,93,156,72,232,118,116,58,212,111,
+    136,55,36,26,119,26,229,126,99,92,191,165,28,155,228,163,
+    62,110,72,52,239,52,235,136,6,226,49,193,52,253,153,96,
+    12,108,243,135,70,130,248,177,177,52,249,142,81,214,53,131,
+    206,200,26,49,157,73,214,153,64,103,190,162,51,203,58,11,
+    232,172,172,25,211,89,100,157,13,116,246,43,118,86,89,231,
+    0,157,243,138,206,38,235,92,160,115,179,58,76,103,103,60,
+    155,196,0,249,47,52,24,208,73,166,149,4,189,194,190,138,
+    69,89,24,52,71,162,177,213,84,58,3,93,221,32,82,110,
+    198,18,27,123,95,179,209,76,180,154,72,93,137,200,27,50,
+    145,44,177,163,99,136,157,6,248,107,100,116,59,122,166,97,
+    167,137,105,220,49,48,122,88,168,73,50,192,164,203,52,151,
+    181,30,176,137,233,251,247,149,209,175,46,134,125,53,118,24,
+    141,141,49,242,226,163,47,94,108,133,7,154,37,227,238,110,
+    146,78,176,187,187,146,121,119,55,145,98,142,226,168,111,221,
+    221,253,230,136,142,171,26,125,230,248,144,149,76,209,215,175,
+    119,163,113,58,157,150,204,168,251,130,165,25,150,147,140,244,
+    94,58,195,209,209,204,15,196,47,200,199,95,125,105,46,58,
+    86,90,12,22,87,130,29,61,60,230,140,160,150,155,81,248,
+    75,119,67,147,43,127,206,45,158,220,202,185,243,70,46,120,
+    238,234,201,61,57,119,120,114,171,232,195,185,75,70,181,25,
+    105,215,96,4,216,208,75,102,37,254,112,42,201,102,157,213,
+    140,32,9,103,2,243,240,15,6,206,140,86,177,160,198,138,
+    26,27,106,236,168,113,160,198,133,26,217,17,15,106,188,165,
+    102,26,197,209,133,197,209,138,226,232,86,227,64,31,197,210,
+    139,135,80,202,144,95,86,234,134,192,26,138,205,68,141,127,
+    76,227,7,32,224,199,18,9,112,46,168,91,111,132,208,130,
+    41,180,249,246,114,168,242,88,14,52,107,15,110,80,28,123,
+    16,75,37,169,116,44,203,134,7,76,218,129,75,77,17,154,
+    163,19,146,53,196,38,82,220,241,38,216,76,250,37,61,178,
+    197,57,241,149,154,89,196,201,4,198,137,23,113,66,169,156,
+    252,108,113,254,195,210,245,147,165,139,191,49,42,88,198,68,
+    203,88,110,5,125,148,217,124,191,7,79,118,224,101,157,61,
+    160,163,199,10,91,100,153,173,42,169,194,153,75,145,80,64,
+    29,205,48,28,155,78,255,38,109,92,27,226,206,240,69,48,
+    153,65,116,33,51,156,174,174,82,19,64,116,141,97,116,117,
+    32,186,122,43,116,189,157,59,153,227,125,67,130,101,88,180,
+    12,87,147,213,245,123,144,101,2,90,32,1,16,79,142,50,
+    79,138,64,161,200,173,164,199,181,82,75,225,200,92,73,44,
+    174,131,184,122,166,221,44,53,27,181,178,170,5,209,116,179,
+    58,171,58,126,178,116,240,157,227,130,101,66,180,76,84,19,
+    117,19,39,234,191,47,32,118,37,218,47,14,15,89,238,114,
+    174,84,73,149,66,194,181,212,136,161,167,212,252,129,168,81,
+    45,46,109,117,165,90,244,224,254,234,75,254,254,221,162,117,
+    9,96,155,139,198,90,155,203,154,190,54,151,55,90,255,161,
+    1,54,186,161,188,209,22,176,178,214,76,137,38,44,37,108,
+    117,145,6,12,105,175,139,108,198,144,14,64,58,107,34,141,
+    140,9,243,212,85,23,107,102,44,24,214,13,88,79,77,172,
+    21,243,128,172,139,180,97,72,111,93,164,157,113,96,235,183,
+    104,96,157,24,182,21,176,190,58,88,23,134,109,211,192,186,
+    49,108,187,6,214,131,97,59,52,176,36,134,237,212,192,122,
+    49,108,151,6,182,5,195,222,208,192,182,98,216,207,52,176,
+    62,12,75,1,246,102,45,108,3,193,118,127,128,227,143,21,
+    235,54,204,246,214,53,108,219,49,219,158,107,216,118,96,182,
+    183,175,97,219,137,217,246,94,195,182,11,179,237,187,134,237,
+    13,204,182,31,108,7,106,217,194,158,124,134,97,7,53,206,
+    15,10,195,14,105,96,111,98,216,97,13,31,186,49,236,136,
+    70,14,221,194,176,163,26,216,30,12,59,166,129,189,141,97,
+    199,53,176,189,24,118,66,3,219,135,97,253,26,216,126,12,
+    59,169,129,29,192,176,83,26,216,65,12,59,173,177,111,67,
+    24,118,70,3,59,140,97,239,104,248,48,130,97,239,94,35,
+    182,123,26,216,81,12,123,95,195,223,49,12,59,171,145,147,
+    227,24,118,78,3,59,129,97,231,53,124,240,99,216,5,141,
+    121,39,49,236,162,6,118,10,195,62,208,224,108,26,195,46,
+    93,99,47,150,53,176,51,24,54,160,193,195,29,12,187,162,
+    17,219,93,12,251,80,3,123,15,195,62,210,240,247,62,134,
+    125,124,13,30,86,53,176,179,24,54,168,193,195,28,134,125,
+    162,17,219,60,134,93,211,152,119,1,195,174,107,96,23,49,
+    108,72,195,135,7,24,54,172,49,239,18,134,221,208,192,46,
+    99,216,136,134,15,1,12,251,185,6,118,5,195,62,101,30,
+    194,253,195,35,249,246,73,121,6,82,117,251,164,8,228,187,
+    134,173,172,49,18,8,82,47,82,233,76,182,25,245,246,142,
+    210,89,23,234,40,79,106,168,228,81,98,143,229,20,209,254,
+    81,50,154,65,55,89,209,20,195,74,250,201,241,100,58,235,
+    141,112,169,3,184,77,79,176,12,186,75,141,211,25,54,25,
+    61,150,244,126,164,236,12,164,146,251,177,3,184,55,163,25,
+    42,197,81,223,114,177,12,91,194,100,77,95,178,73,6,164,
+    193,149,172,73,113,9,186,28,138,65,106,14,164,18,9,58,
+    201,72,134,205,12,157,57,74,75,6,53,136,242,114,177,228,
+    1,5,183,184,44,183,79,131,216,190,121,180,55,18,64,143,
+    135,168,0,248,150,53,87,245,189,155,199,233,12,155,160,2,
+    116,244,5,27,143,37,89,10,221,241,41,17,173,43,174,80,
+    91,177,4,4,233,64,162,85,249,201,18,181,117,124,200,102,
+    221,203,71,177,120,6,214,161,54,217,248,62,181,197,2,75,
+    173,203,116,154,45,221,141,203,119,157,48,59,71,141,215,83,
+    76,212,83,248,235,41,38,235,41,166,234,41,166,179,221,1,
+    154,99,96,239,40,116,4,135,247,83,92,130,150,247,106,51,
+    195,29,69,51,71,28,155,181,2,73,105,133,11,160,220,83,
+    25,85,246,161,253,225,235,67,58,153,70,118,79,55,66,148,
+    188,218,146,178,90,246,70,128,62,164,247,98,241,88,230,152,
+    90,135,117,169,72,42,134,54,128,74,237,239,167,217,76,214,
+    46,111,7,119,116,152,1,117,146,205,218,42,227,72,44,153,
+    117,132,232,215,177,196,81,162,196,121,214,22,138,37,101,193,
+    99,142,78,102,178,253,242,98,202,92,112,160,34,161,192,82,
+    132,138,37,41,180,41,106,30,165,15,209,102,151,23,206,164,
+    168,36,251,58,67,69,43,142,237,197,83,209,151,217,137,205,
+    67,54,26,219,143,177,105,42,243,34,150,166,98,232,200,130,
+    221,183,96,21,162,147,52,156,10,108,178,218,48,59,136,150,
+    185,2,40,135,140,166,122,170,210,157,237,171,141,77,37,51,
+    92,42,78,65,218,82,74,214,102,7,176,152,66,155,193,122,
+    65,245,212,118,25,44,42,78,28,103,61,104,28,130,221,128,
+    69,75,11,94,22,150,118,171,173,90,40,63,40,40,171,156,
+    213,170,21,58,67,103,91,145,164,178,93,33,58,253,146,90,
+    142,101,84,104,4,210,3,157,110,178,100,240,106,72,219,191,
+    21,83,180,20,148,26,209,200,118,117,76,94,69,130,71,165,
+    2,183,232,189,56,75,109,40,235,33,106,21,193,114,240,105,
+    182,83,65,68,150,151,170,245,104,136,180,87,242,169,174,155,
+    183,235,100,75,32,200,86,251,233,186,44,0,120,214,39,139,
+    212,218,117,73,227,185,164,81,67,114,87,11,213,20,105,145,
+    101,112,194,188,188,60,129,171,74,174,154,59,43,34,213,184,
+    189,222,250,80,92,188,53,60,160,252,225,129,205,223,120,52,
+    134,158,112,200,207,199,56,244,212,71,50,68,104,14,178,91,
+    106,164,147,80,213,209,117,66,106,132,76,145,154,15,163,177,
+    93,40,56,74,7,46,22,146,17,117,208,37,66,106,86,79,
+    113,201,114,24,75,237,150,46,9,246,168,76,122,121,44,63,
+    162,156,152,145,140,74,249,9,174,72,70,197,91,184,8,160,
+    203,28,55,136,214,111,66,168,187,146,241,41,168,80,93,2,
+    135,224,10,16,124,36,161,106,38,87,121,84,228,37,83,165,
+    107,147,11,61,42,65,168,206,75,86,213,25,185,196,75,102,
+    165,188,163,234,46,233,151,131,155,91,202,123,1,244,124,28,
+    198,75,79,199,229,118,66,110,253,114,59,41,183,83,114,59,
+    205,161,119,32,146,89,45,182,129,224,166,100,41,151,81,8,
+    192,85,30,148,99,178,150,43,42,20,84,228,91,41,159,34,
+    25,78,170,148,72,228,174,100,45,15,161,96,74,118,181,96,
+    150,200,180,170,245,82,46,151,146,67,174,143,40,199,149,220,
+    151,60,178,32,12,245,176,178,134,100,150,133,32,8,50,146,
+    171,212,47,103,137,58,73,32,195,197,213,203,172,83,169,80,
+    85,211,146,138,4,155,215,162,72,149,137,109,202,32,148,62,
+    64,51,85,13,81,193,145,220,229,161,92,133,100,89,5,130,
+    202,15,68,170,12,161,236,160,26,35,185,148,177,90,119,202,
+    162,237,203,158,121,85,17,230,154,85,21,43,190,33,71,183,
+    75,158,57,208,64,174,31,234,20,200,143,237,200,30,173,14,
+    29,145,109,156,211,26,11,152,35,219,85,156,110,227,156,146,
+    178,8,50,249,146,212,90,150,34,71,236,165,145,74,187,162,
+    69,103,54,24,73,182,202,72,246,186,60,188,132,86,86,240,
+    171,104,117,102,63,254,252,183,183,212,124,5,127,233,247,77,
+    26,207,176,229,183,94,232,121,255,252,201,124,161,229,251,246,
+    226,142,96,25,23,45,227,128,177,123,222,198,78,98,5,147,
+    96,239,22,237,221,185,199,170,0,189,21,176,15,139,246,97,
+    144,56,200,183,199,39,199,124,219,176,224,24,17,29,35,48,
+    147,187,245,116,36,63,82,52,240,253,139,130,251,129,232,126,
+    144,91,59,247,182,159,126,149,255,170,56,195,15,5,5,239,
+    19,209,251,36,23,254,25,44,191,59,249,174,176,38,56,250,
+    69,71,127,110,245,252,138,0,86,139,159,196,11,19,133,152,
+    96,239,23,237,253,176,156,205,253,246,249,201,243,194,205,194,
+    182,96,235,21,109,189,185,71,200,236,205,201,27,64,189,16,
+    28,125,162,163,15,12,1,245,236,228,89,193,197,119,78,10,
+    182,41,209,54,5,48,143,239,116,54,63,91,248,134,239,246,
+    11,158,73,209,51,153,91,63,119,122,79,45,121,75,97,169,
+    240,157,224,28,22,157,195,192,8,217,118,186,150,95,43,234,
+    248,91,247,5,114,86,36,103,115,161,42,211,105,193,51,35,
+    122,102,192,212,213,114,218,145,239,40,124,206,83,19,130,203,
+    47,186,252,64,36,112,56,123,50,251,238,27,190,189,252,138,
+    73,125,143,82,48,23,204,127,181,126,111,229,123,23,5,203,
+    3,209,242,0,200,253,191,107,126,134,24,58,243,157,5,134,
+    239,89,21,92,65,209,21,132,24,96,247,134,243,195,133,76,
+    241,79,130,123,74,116,79,193,230,249,186,222,91,207,172,197,
+    45,126,232,129,224,91,18,125,75,188,222,139,56,153,203,207,
+    21,245,124,239,178,224,9,136,158,0,112,162,114,7,178,71,
+    2,249,88,36,31,3,119,21,217,140,64,222,17,201,59,21,
+    62,51,197,93,193,51,45,122,166,193,20,18,228,89,254,89,
+    145,228,251,238,10,222,123,162,247,94,46,92,3,118,97,36,
+    90,59,79,95,230,95,158,27,173,188,253,238,199,198,134,86,
+    195,39,2,154,220,198,133,129,232,160,222,15,157,13,21,25,
+    126,56,44,180,111,136,237,27,188,190,85,221,39,25,191,4,
+    120,55,194,187,13,185,39,128,111,187,129,226,58,55,218,121,
+    231,28,168,218,144,170,205,0,193,129,14,150,137,231,227,178,
+    238,222,165,101,204,132,175,235,244,77,254,141,60,35,82,249,
+    144,202,7,102,36,152,117,222,124,63,123,54,43,235,198,65,
+    215,137,116,157,160,243,129,14,194,25,202,15,33,182,159,8,
+    238,53,209,189,6,212,2,59,235,249,245,98,11,63,176,32,
+    144,139,34,185,168,48,134,100,237,252,200,178,64,6,68,50,
+    0,50,112,181,243,172,179,248,53,239,15,9,109,97,177,45,
+    204,235,91,170,140,103,5,114,78,36,231,0,8,60,62,207,
+    63,47,14,242,163,143,5,239,170,232,93,5,30,213,253,219,
+    225,39,2,130,111,69,244,173,40,33,194,156,150,51,139,236,
+    235,125,60,252,174,238,247,107,103,107,229,56,186,144,174,11,
+    116,109,160,131,101,229,109,225,111,175,9,158,117,209,179,14,
+    219,167,102,205,43,190,111,65,112,47,138,238,69,136,173,165,
+    67,161,208,205,147,51,216,78,129,151,106,136,107,2,185,46,
+    146,235,185,144,194,249,255,176,181,133,45,254,214,19,193,181,
+    38,186,214,32,125,213,88,191,228,71,170,114,21,172,231,206,
+    230,254,102,230,167,194,66,199,134,216,1,214,190,82,2,67,
+    153,154,23,60,11,162,103,65,201,66,196,94,47,63,184,32,
+    120,23,69,239,162,146,133,8,103,230,135,87,4,207,67,209,
+    243,80,73,116,149,249,57,129,156,23,201,121,96,94,9,23,
+    149,184,121,161,101,65,108,89,200,109,84,217,174,10,158,160,
+    232,9,86,108,33,246,21,129,124,40,146,15,115,33,244,81,
+    106,55,170,216,225,1,135,228,74,76,143,166,228,159,100,164,
+    71,213,187,118,244,146,85,114,87,201,213,95,113,40,255,93,
+    51,129,226,16,189,54,79,75,70,212,229,82,175,225,146,8,
+    189,242,111,59,56,3,161,254,166,65,249,41,129,252,238,92,
+    126,35,44,191,239,236,41,95,53,46,95,73,126,53,206,41,
+    63,208,88,224,94,17,202,27,204,244,25,180,23,141,58,157,
+    238,34,172,35,116,253,60,209,87,253,61,39,122,249,203,223,
+    115,162,149,47,125,207,137,22,190,244,61,39,186,249,203,223,
+    11,131,94,71,94,16,87,155,191,252,241,35,58,124,170,72,
+    237,141,186,219,23,196,213,230,93,203,71,116,248,84,145,90,
+    155,116,227,23,196,213,230,47,175,62,162,195,167,138,212,217,
+    164,27,65,61,188,121,183,141,144,35,159,42,82,95,147,206,
+    143,122,120,243,206,128,144,254,79,21,169,179,158,159,95,94,
+    241,243,64,167,123,164,187,32,234,31,222,153,62,42,157,79,
+    26,32,121,239,254,3,7,160,185,168,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/pci/PciDevice.py",
+    "m5.objects.PciDevice",
+    embedded_module_data,
+    3354,
+    9491);
+
+} // anonymous namespace
+} // namespace gem5
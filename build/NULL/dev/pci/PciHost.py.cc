@@ -0,0 +1,129 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,86,205,111,219,70,22,31,138,20,69,74,164,72,
+    125,90,174,243,193,122,141,110,237,54,14,80,108,155,173,219,
+    46,54,181,177,81,226,174,99,52,41,22,208,69,160,57,148,
+    205,84,95,59,164,186,177,194,36,62,244,32,231,210,56,151,
+    240,208,131,79,1,138,254,15,251,55,80,134,15,4,79,1,
+    22,187,128,111,18,146,83,46,217,25,138,84,36,215,9,74,
+    14,223,252,102,222,155,55,95,191,121,156,255,128,137,39,30,
+    230,47,16,22,79,1,4,144,170,131,6,85,161,40,130,99,
+    245,88,131,174,208,1,166,235,204,237,81,30,15,114,166,206,
+    54,18,149,4,5,98,224,26,128,241,31,1,100,117,234,25,
+    13,192,175,116,228,188,194,5,186,4,214,113,58,119,74,199,
+    67,254,22,88,76,158,144,194,34,229,243,155,70,107,77,255,
+    193,208,116,92,224,54,235,170,85,107,161,6,198,212,18,209,
+    222,50,26,55,183,238,232,154,165,77,142,158,138,70,127,33,
+    24,189,14,42,20,4,149,24,254,104,72,85,24,24,171,196,
+    33,93,97,33,131,123,138,251,137,77,205,40,183,76,171,43,
+    110,235,141,79,87,86,194,226,43,9,234,63,92,110,107,198,
+    229,29,92,90,222,217,185,189,177,152,240,185,106,181,169,54,
+    244,106,213,79,86,171,141,22,236,212,9,22,170,213,127,118,
+    212,122,168,97,172,221,182,238,243,218,221,187,85,173,174,154,
+    166,159,36,112,71,87,161,142,124,78,221,50,45,164,106,214,
+    47,224,5,25,227,171,162,137,180,203,81,87,97,223,203,237,
+    93,196,97,101,32,62,194,159,57,143,197,222,248,245,82,249,
+    189,53,79,190,184,119,221,203,204,239,221,240,164,220,94,153,
+    188,40,27,53,154,90,15,38,90,143,38,245,182,245,208,217,
+    195,4,56,227,209,185,59,124,132,33,253,44,134,247,42,54,
+    222,171,36,110,149,58,171,21,100,158,225,158,126,165,198,150,
+    194,239,182,20,177,101,250,76,203,56,100,79,245,47,189,213,
+    107,2,114,167,108,229,119,216,242,167,108,51,239,176,77,158,
+    178,205,242,224,244,11,69,152,250,145,170,228,160,128,249,149,
+    246,211,215,244,166,142,12,45,162,89,126,68,179,233,90,68,
+    86,185,123,33,34,184,98,181,148,142,169,43,24,43,70,211,
+    210,17,234,180,45,179,59,187,218,106,214,140,109,197,108,171,
+    154,174,108,169,216,66,133,16,233,166,121,66,54,189,251,197,
+    70,167,177,165,35,165,85,83,182,12,203,36,46,32,113,165,
+    154,138,218,196,181,53,83,183,20,85,129,193,129,50,163,182,
+    35,119,136,204,169,171,124,61,225,52,232,126,115,245,186,114,
+    253,166,162,106,184,133,169,155,221,133,51,45,26,122,163,133,
+    118,223,101,181,246,247,171,167,173,180,228,196,218,210,225,247,
+    226,155,128,164,54,5,169,46,70,247,147,118,12,198,2,148,
+    178,105,72,7,72,176,153,80,43,218,113,200,4,40,109,179,
+    48,30,32,201,78,132,72,182,185,16,101,236,164,77,125,31,
+    132,25,115,201,78,217,177,16,47,216,130,77,135,248,130,45,
+    218,76,136,75,118,218,142,135,56,107,75,54,27,98,193,150,
+    237,68,136,89,59,99,115,35,140,36,139,122,51,21,76,212,
+    41,82,83,0,123,22,96,162,139,109,187,248,152,217,41,200,
+    141,113,18,242,99,156,134,201,49,150,96,106,140,101,40,140,
+    113,6,175,70,136,239,103,109,30,138,193,252,114,24,165,187,
+    152,68,97,57,111,103,237,188,157,219,166,49,5,165,141,147,
+    215,120,20,39,23,137,32,167,252,132,140,249,132,12,175,251,
+    217,205,166,78,232,98,237,96,178,25,122,29,142,54,139,20,
+    201,182,70,27,104,152,74,171,99,5,188,106,117,154,208,68,
+    69,226,129,156,145,19,153,136,18,17,231,137,32,33,183,78,
+    252,191,126,248,250,33,13,78,20,16,196,241,120,77,181,212,
+    250,98,193,103,76,189,94,243,233,173,142,233,179,35,30,250,
+    92,173,211,212,44,163,213,244,57,164,111,27,38,166,187,31,
+    15,56,233,39,212,186,129,137,4,125,161,141,244,154,110,105,
+    59,234,86,93,247,83,72,175,183,52,236,145,20,24,50,72,
+    159,193,30,107,126,98,228,178,230,243,145,79,12,35,167,53,
+    159,13,188,214,112,16,30,185,173,249,226,164,223,154,47,76,
+    56,198,222,194,233,251,92,189,245,175,106,208,13,191,99,108,
+    239,4,208,44,224,153,41,103,61,40,135,53,126,18,199,243,
+    191,65,235,42,54,237,206,78,31,246,229,55,170,85,66,164,
+    53,138,4,247,65,9,200,185,199,183,247,187,61,198,203,150,
+    156,63,29,92,234,37,188,252,57,199,60,216,232,241,4,88,
+    7,55,49,200,20,157,220,193,92,143,245,114,239,57,183,14,
+    190,234,113,94,105,225,208,236,151,150,122,162,55,51,127,120,
+    171,63,243,97,79,24,176,64,204,60,94,125,180,222,91,247,
+    164,162,243,193,145,164,184,146,226,73,37,167,124,36,45,184,
+    210,194,20,44,56,133,71,15,123,15,61,105,198,185,114,36,
+    205,187,210,188,39,157,59,20,142,164,143,93,233,99,79,154,
+    115,238,29,73,75,174,180,244,95,33,227,102,111,244,133,245,
+    99,97,221,21,214,73,39,69,226,232,234,254,131,33,77,137,
+    23,159,227,174,230,247,239,15,227,49,241,2,86,202,249,199,
+    104,191,59,76,208,226,220,128,3,114,209,201,238,219,67,158,
+    17,207,15,146,64,46,57,159,224,86,169,184,120,113,32,0,
+    249,252,97,172,47,205,15,69,86,92,24,164,129,124,206,65,
+    125,233,253,161,148,16,255,48,160,1,47,15,138,32,95,114,
+    150,250,185,5,60,221,194,172,243,237,65,229,112,165,159,191,
+    212,227,159,203,51,206,236,97,217,149,46,185,220,165,224,247,
+    183,177,200,7,161,236,247,138,197,60,34,97,8,17,50,35,
+    129,8,145,136,116,112,170,201,70,198,55,85,164,54,16,249,
+    137,250,44,198,122,211,242,105,181,185,235,115,237,48,90,251,
+    204,213,128,27,26,166,91,149,68,229,16,154,70,87,247,227,
+    223,93,111,90,127,246,229,160,102,68,207,42,9,206,152,210,
+    154,81,109,27,173,81,139,160,132,227,227,68,9,54,212,160,
+    132,62,39,99,201,16,17,252,223,9,189,80,33,18,159,16,
+    6,253,15,76,95,15,230,200,245,224,131,240,122,240,92,202,
+    255,244,224,209,3,167,246,243,29,119,233,70,95,90,63,150,
+    214,247,202,207,229,194,211,228,147,164,59,247,89,95,190,114,
+    44,95,193,198,191,173,153,57,247,244,222,147,123,30,199,187,
+    169,242,144,142,149,216,151,0,11,151,201,227,13,205,207,62,
+    93,121,178,226,168,238,251,171,253,220,218,113,110,109,239,27,
+    47,87,138,234,174,245,115,229,227,92,249,236,58,220,90,76,
+    123,146,236,101,178,36,165,37,79,206,120,133,162,151,47,120,
+    98,122,80,184,28,95,30,128,183,136,209,18,20,130,141,78,
+    250,153,198,167,203,173,224,2,104,46,143,174,137,136,196,30,
+    63,55,81,31,253,83,71,59,200,99,77,155,108,40,62,213,
+    4,162,214,221,93,95,192,104,124,149,68,44,8,47,81,163,
+    69,158,94,248,87,220,151,163,107,223,95,208,58,24,93,53,
+    205,127,99,49,160,41,138,26,148,41,64,125,232,130,63,78,
+    38,15,224,154,169,228,129,25,55,74,30,40,186,81,242,192,
+    188,59,157,6,44,67,229,7,224,183,162,103,12,73,246,242,
+    77,109,250,175,20,133,151,232,108,249,248,31,195,32,127,249,
+    22,125,48,191,255,3,86,175,25,107,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/pci/PciHost.py",
+    "m5.objects.PciHost",
+    embedded_module_data,
+    1674,
+    3074);
+
+} // anonymous namespace
+} // namespace gem5
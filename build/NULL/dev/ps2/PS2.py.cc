@@ -0,0 +1,72 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,197,84,191,79,219,64,20,190,139,127,196,118,34,8,
+    73,155,162,136,86,17,20,212,116,8,21,21,82,21,85,44,
+    32,145,144,54,69,2,117,200,98,25,223,137,4,226,36,61,
+    59,17,201,228,161,67,213,165,168,75,59,116,232,132,132,250,
+    207,4,137,33,242,84,169,83,183,32,80,7,166,222,217,113,
+    8,73,202,90,159,253,189,187,247,221,157,239,125,239,217,191,
+    192,208,37,244,237,229,103,10,95,0,2,8,86,192,174,103,
+    161,107,3,149,128,193,21,57,8,2,96,19,32,238,61,64,
+    60,230,78,56,0,126,112,254,38,69,222,229,4,202,137,152,
+    31,225,4,151,11,82,78,26,227,68,151,147,41,167,140,113,
+    65,20,218,1,169,240,111,54,72,65,7,62,165,32,239,148,
+    141,55,123,7,88,183,244,225,32,160,31,196,35,55,8,12,
+    138,16,129,98,128,62,28,130,69,30,5,138,2,226,138,34,
+    226,233,134,130,35,111,239,172,108,224,102,89,199,237,25,132,
+    155,203,117,115,101,25,185,227,116,169,212,158,217,199,198,106,
+    38,67,157,153,140,55,107,183,144,10,58,146,170,86,53,3,
+    171,170,163,168,170,81,67,141,10,235,135,85,245,93,67,171,
+    244,25,222,106,213,177,163,232,71,71,106,9,107,8,19,71,
+    102,125,189,162,153,166,35,105,123,166,69,52,221,58,5,151,
+    236,172,215,81,147,232,203,254,251,233,145,210,245,22,17,41,
+    225,66,138,62,230,60,5,123,208,186,161,184,189,209,157,121,
+    108,111,117,35,11,118,174,59,29,179,179,172,145,105,127,209,
+    45,77,120,95,147,237,127,106,130,197,239,65,48,225,194,210,
+    129,236,247,17,119,18,160,105,9,12,210,162,244,85,12,209,
+    35,231,113,107,175,166,17,212,142,249,113,28,246,61,76,201,
+    248,144,146,195,147,23,222,22,214,147,38,38,77,76,146,117,
+    82,107,150,81,185,186,159,244,87,38,203,213,122,195,42,156,
+    134,8,59,27,145,24,176,211,16,133,65,136,65,152,130,35,
+    108,107,68,51,28,233,109,85,207,177,21,142,72,29,184,106,
+    57,156,86,109,57,92,179,170,147,41,54,217,85,39,194,32,
+    234,195,51,38,238,243,17,113,103,153,184,75,76,220,39,118,
+    238,167,50,253,41,253,49,253,53,254,45,209,89,220,58,83,
+    242,231,74,222,94,103,205,219,47,58,170,246,160,2,19,119,
+    84,32,213,141,119,36,42,197,235,90,195,196,237,136,47,154,
+    193,134,76,177,216,109,197,220,105,133,148,120,183,18,163,97,
+    38,124,120,193,194,124,56,18,230,125,22,230,2,11,115,209,
+    206,177,230,173,76,252,143,242,217,173,53,244,82,190,108,221,
+    148,143,197,60,135,101,107,84,140,193,204,228,196,218,113,5,
+    236,23,14,137,77,208,100,206,135,181,187,83,191,56,146,250,
+    205,51,37,123,174,100,135,83,207,118,41,164,36,71,54,86,
+    211,117,86,130,244,211,102,93,82,59,106,57,97,218,27,252,
+    162,8,211,208,251,164,163,131,196,204,141,159,238,90,122,233,
+    253,80,214,72,178,95,74,230,31,10,61,14,66,216,203,66,
+    0,103,59,224,129,119,119,65,188,227,223,93,48,223,185,125,
+    247,68,30,222,235,129,113,56,150,47,152,185,186,241,78,9,
+    240,21,236,129,201,120,156,186,112,237,213,48,19,225,224,82,
+    15,140,195,135,214,5,51,87,55,222,176,0,115,238,170,73,
+    232,237,157,115,247,158,196,187,186,252,5,119,229,128,206,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/ps2/PS2.py",
+    "m5.objects.PS2",
+    embedded_module_data,
+    767,
+    1699);
+
+} // anonymous namespace
+} // namespace gem5
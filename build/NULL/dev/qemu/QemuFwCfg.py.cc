@@ -0,0 +1,117 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,189,150,207,115,218,70,20,199,37,16,2,33,240,79,
+    98,156,196,137,213,73,220,152,216,198,113,38,153,166,30,55,
+    73,109,199,49,180,56,105,237,244,192,164,213,40,104,193,234,
+    0,34,43,57,182,57,113,232,41,151,100,114,137,143,57,101,
+    166,211,127,6,50,204,132,209,41,51,61,181,39,60,225,228,
+    83,247,45,8,176,192,249,49,211,9,130,183,210,190,167,135,
+    246,243,125,218,221,191,153,174,143,167,213,190,255,151,152,151,
+    140,202,168,108,150,201,177,73,150,133,115,87,214,149,115,39,
+    221,244,220,157,229,182,24,23,115,151,81,185,63,24,213,131,
+    220,175,221,12,243,151,219,78,148,244,80,31,79,124,94,228,
+    113,248,120,234,243,17,159,208,227,243,82,159,159,248,196,30,
+    159,143,250,2,196,23,68,172,195,39,80,223,0,241,13,34,
+    193,225,243,83,223,16,241,13,247,248,68,117,100,147,137,140,
+    254,3,23,17,214,18,238,107,250,42,122,162,165,16,92,108,
+    106,185,123,143,126,71,41,147,92,176,151,83,221,164,56,155,
+    212,43,74,10,49,73,86,101,146,46,242,115,171,108,146,83,
+    93,73,143,234,78,242,200,251,202,199,244,249,168,156,234,121,
+    237,34,79,226,234,140,128,196,250,251,198,242,170,215,17,43,
+    146,216,64,223,88,223,107,150,68,178,237,200,160,42,144,241,
+    249,173,224,79,40,183,179,182,187,146,206,196,76,148,43,74,
+    25,148,187,190,184,248,152,116,46,46,182,187,215,148,148,169,
+    227,253,101,197,64,71,35,42,122,50,15,254,249,244,174,156,
+    74,103,162,219,219,91,107,197,139,90,90,50,183,53,67,210,
+    72,184,68,90,5,167,182,53,66,104,7,35,201,40,160,148,
+    150,214,82,24,30,180,56,185,166,237,33,85,210,242,42,218,
+    155,149,116,44,93,145,210,196,42,59,166,158,83,76,45,85,
+    156,187,175,152,219,146,169,183,114,229,73,98,36,165,53,156,
+    219,85,72,178,148,158,79,107,25,73,213,48,162,15,181,17,
+    25,176,124,178,156,87,114,72,150,45,191,44,231,116,117,39,
+    11,231,1,89,126,188,163,100,91,30,206,220,47,32,75,72,
+    237,237,201,169,172,98,24,150,31,78,183,145,162,34,108,249,
+    148,71,134,137,201,40,45,207,125,5,43,57,139,91,214,245,
+    172,21,132,81,200,246,227,91,190,7,121,67,203,228,145,106,
+    121,232,211,91,252,166,137,181,124,198,226,10,228,137,255,100,
+    222,3,217,163,211,6,78,205,183,33,181,241,70,11,251,216,
+    75,252,212,76,146,159,241,27,49,165,246,81,19,207,148,86,
+    107,67,87,75,177,218,240,84,41,94,27,28,45,173,215,121,
+    230,212,153,151,241,23,241,131,157,242,215,63,86,66,137,106,
+    40,81,74,212,2,195,207,54,158,110,28,44,148,207,223,170,
+    4,110,87,3,183,75,119,106,226,208,179,165,167,75,229,241,
+    187,21,113,189,42,174,151,86,225,192,227,246,31,30,171,81,
+    187,202,223,199,79,168,209,12,251,177,42,117,84,147,160,122,
+    72,53,241,214,240,177,106,90,211,178,168,248,205,135,42,106,
+    169,191,147,220,119,243,104,128,202,36,65,199,22,145,14,195,
+    147,20,199,236,218,72,147,24,104,209,94,65,199,230,70,196,
+    143,5,24,43,188,40,88,4,3,175,1,14,18,99,141,130,
+    208,36,75,33,171,152,72,46,128,190,6,30,0,247,16,152,
+    83,16,195,65,62,28,134,107,202,236,52,152,179,182,153,1,
+    185,22,29,114,157,7,185,98,68,174,179,51,229,51,179,101,
+    46,76,117,35,146,17,121,168,20,87,42,226,66,85,92,232,
+    150,226,236,151,147,98,244,152,20,205,66,45,126,251,249,98,
+    52,239,188,137,39,224,249,169,6,67,205,174,79,163,143,207,
+    129,113,208,230,13,154,193,201,91,178,205,245,126,188,37,224,
+    253,67,31,222,3,163,207,30,62,125,72,250,42,193,185,106,
+    112,174,180,6,71,51,173,244,229,120,143,28,227,189,188,111,
+    34,163,120,227,243,113,211,27,187,105,15,210,158,207,133,109,
+    137,191,208,233,177,57,155,121,30,196,242,230,13,139,83,21,
+    83,113,66,191,96,155,91,253,160,79,2,244,184,19,250,59,
+    113,236,173,56,241,70,156,40,159,139,86,196,249,170,56,223,
+    93,228,23,156,208,219,107,226,73,208,63,140,60,3,208,29,
+    107,98,11,186,208,134,94,28,238,193,73,249,109,21,103,1,
+    171,209,162,71,22,158,71,251,253,23,20,186,186,127,144,46,
+    173,226,65,48,23,153,214,188,74,86,2,200,238,132,58,109,
+    155,117,128,250,157,3,234,24,64,189,208,61,209,191,11,132,
+    223,6,166,222,4,166,106,62,127,57,176,120,232,118,5,249,
+    6,67,76,233,14,28,205,204,211,39,22,243,234,137,92,17,
+    255,202,219,183,140,221,142,50,246,169,28,33,234,177,196,78,
+    25,235,197,209,222,18,213,155,85,249,85,236,158,4,60,233,
+    210,13,56,13,148,165,5,39,97,148,209,12,19,225,141,136,
+    240,17,146,48,31,88,220,247,170,138,173,160,125,187,172,144,
+    75,39,205,25,219,108,2,205,5,7,205,113,160,57,213,162,
+    89,247,181,86,204,242,228,114,37,180,82,13,173,148,18,112,
+    52,179,205,156,72,48,255,63,16,36,145,66,223,72,231,148,
+    225,111,85,111,103,239,149,200,105,122,241,84,15,109,232,110,
+    242,158,78,160,28,153,51,36,192,131,200,170,120,34,246,226,
+    101,71,36,86,242,25,212,142,135,25,160,75,34,241,19,36,
+    194,179,96,230,64,44,1,196,250,25,18,90,131,144,137,170,
+    37,211,127,112,106,54,111,155,95,65,179,24,211,103,171,115,
+    201,214,140,111,107,22,171,132,226,213,80,188,148,32,125,225,
+    137,151,250,11,189,230,187,70,222,134,48,188,13,97,190,116,
+    15,142,230,191,64,238,141,72,192,26,206,93,143,234,116,51,
+    110,68,155,59,116,12,170,90,161,174,254,246,126,29,115,116,
+    24,196,213,218,6,208,29,25,93,231,37,198,158,12,167,219,
+    53,71,7,113,124,96,71,190,165,230,6,243,38,134,85,10,
+    68,53,118,137,173,187,89,150,173,95,99,216,233,50,115,169,
+    251,91,99,46,151,143,127,107,76,184,108,127,235,188,192,198,
+    216,58,211,223,62,143,29,210,182,209,237,25,247,178,87,235,
+    76,175,57,8,30,66,211,232,244,134,188,108,20,206,156,230,
+    96,14,34,163,141,78,111,136,103,175,212,153,94,115,112,238,
+    16,154,70,167,119,196,199,242,117,166,215,60,23,14,161,105,
+    116,122,199,188,236,42,11,233,251,217,231,145,67,218,54,186,
+    61,33,17,238,237,53,128,65,132,220,189,46,42,204,127,45,
+    160,104,131,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/qemu/QemuFwCfg.py",
+    "m5.objects.QemuFwCfg",
+    embedded_module_data,
+    1475,
+    3755);
+
+} // anonymous namespace
+} // namespace gem5
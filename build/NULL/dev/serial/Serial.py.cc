@@ -0,0 +1,54 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,146,191,79,220,48,20,199,159,227,92,46,119,92,
+    225,40,21,165,149,232,128,90,65,58,220,77,12,160,170,19,
+    82,161,195,85,234,49,101,177,66,108,245,174,74,218,171,115,
+    135,0,49,100,224,15,96,235,127,80,9,241,207,48,70,94,
+    59,177,5,193,116,83,253,242,3,194,15,53,182,63,207,241,
+    179,253,222,247,37,127,161,242,212,10,123,253,85,227,55,112,
+    224,36,128,93,180,70,64,66,195,53,8,24,240,9,56,61,
+    1,110,10,227,15,5,56,167,229,97,151,102,190,154,246,89,
+    130,62,240,153,188,222,7,199,190,196,23,135,40,242,94,163,
+    209,31,134,95,246,190,11,127,236,87,147,32,101,18,111,178,
+    36,4,184,132,131,107,232,65,57,209,23,25,110,141,83,215,
+    226,166,190,176,166,90,125,33,135,94,176,37,246,135,190,216,
+    157,190,224,98,191,27,101,75,133,233,12,6,71,207,191,137,
+    112,125,115,179,186,181,231,212,149,205,216,15,47,20,140,169,
+    38,99,225,79,62,9,112,222,98,236,215,196,11,10,143,57,
+    62,28,9,101,123,123,209,88,122,254,88,53,253,131,3,54,
+    16,30,23,82,53,112,238,7,94,20,157,193,53,166,60,93,
+    138,164,223,173,164,144,71,236,140,14,165,165,221,25,214,244,
+    136,86,52,226,219,150,204,188,138,183,146,185,133,120,59,153,
+    95,141,63,39,237,183,241,14,54,217,46,15,61,93,160,215,
+    255,41,144,46,142,169,218,121,252,222,36,40,84,203,186,62,
+    114,180,88,45,199,157,179,231,88,210,198,136,13,68,19,49,
+    131,120,134,152,69,204,33,178,164,230,17,11,37,186,168,105,
+    249,129,166,101,173,41,151,179,86,149,131,251,123,250,195,53,
+    194,245,206,200,147,94,24,169,150,158,222,254,11,210,44,69,
+    231,247,223,143,57,181,63,228,31,234,163,92,44,74,17,157,
+    104,164,148,16,146,110,19,32,75,23,240,50,239,9,172,92,
+    220,239,169,101,146,119,41,60,198,233,198,21,154,155,187,213,
+    89,74,156,20,30,227,244,248,10,205,205,19,174,44,203,127,
+    253,109,199,179,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/serial/Serial.py",
+    "m5.objects.Serial",
+    embedded_module_data,
+    468,
+    848);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,71 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,84,189,79,219,64,20,191,139,157,196,249,36,208,
+    150,170,176,88,116,10,80,162,74,165,72,168,234,148,150,210,
+    33,173,20,22,188,88,38,119,16,183,254,8,103,135,66,212,
+    193,67,135,170,75,217,218,169,170,24,144,42,254,153,128,144,
+    176,110,237,212,45,8,38,166,190,115,112,155,4,124,119,191,
+    123,231,247,243,221,123,239,222,243,111,52,240,36,175,231,139,
+    77,128,111,136,32,130,45,100,99,13,99,33,39,172,196,90,
+    127,150,162,89,178,100,59,169,37,49,74,160,21,68,228,79,
+    136,36,105,234,80,66,232,72,138,55,212,210,145,46,5,186,
+    52,197,35,58,133,40,117,84,206,252,17,139,50,230,249,58,
+    101,166,97,85,233,142,217,160,176,198,179,0,153,186,105,191,
+    217,120,71,27,126,99,208,208,68,108,232,100,100,40,69,26,
+    38,72,75,108,129,193,7,88,147,72,2,54,150,120,126,141,
+    50,219,116,96,207,182,221,42,203,92,118,92,135,242,140,231,
+    19,183,237,183,218,62,87,64,164,140,185,140,203,155,166,69,
+    107,192,81,116,221,49,108,170,235,60,171,235,182,75,218,150,
+    144,243,186,190,221,54,172,107,141,188,99,88,222,47,116,33,
+    44,184,154,242,88,163,66,232,78,197,139,204,175,196,103,46,
+    180,246,88,26,8,17,60,130,225,61,0,8,254,181,48,247,
+    164,27,245,160,42,26,27,143,185,67,142,202,177,163,63,134,
+    28,133,33,17,172,201,36,161,65,204,127,166,209,45,15,145,
+    136,124,8,129,58,138,131,5,17,7,110,230,86,110,146,164,
+    70,184,89,224,230,110,229,166,137,50,194,205,147,12,4,60,
+    203,149,216,249,206,228,64,68,252,56,34,205,102,167,184,69,
+    237,197,229,229,152,103,6,5,132,58,19,150,233,249,212,81,
+    91,46,243,43,158,219,120,79,125,38,54,239,140,197,159,170,
+    78,219,222,128,155,18,6,117,150,234,212,130,132,240,84,115,
+    83,53,28,162,126,104,82,70,85,191,9,35,166,155,158,74,
+    224,206,77,103,75,53,129,216,191,238,90,185,192,242,34,202,
+    5,1,69,0,46,251,123,45,202,179,141,221,93,189,73,13,
+    200,5,158,17,114,195,50,60,143,39,223,26,204,176,121,246,
+    149,235,249,245,200,42,46,11,19,185,180,234,248,60,117,109,
+    146,136,61,79,195,9,34,131,88,73,108,29,93,229,132,128,
+    187,49,60,22,9,176,49,146,0,247,130,106,56,94,14,94,
+    135,37,53,88,13,115,165,179,220,244,73,110,250,123,181,59,
+    243,244,56,183,116,154,91,2,125,97,226,235,250,151,245,253,
+    237,238,212,220,113,97,254,180,48,31,188,12,139,119,206,138,
+    234,73,81,13,149,98,183,180,122,46,37,198,82,151,8,32,
+    88,17,173,127,188,56,180,86,206,240,113,123,113,193,141,10,
+    200,91,232,23,24,19,21,200,51,240,190,37,252,243,184,34,
+    68,230,238,238,241,60,72,255,10,142,137,191,1,207,214,27,
+    110,139,146,23,224,109,63,157,35,151,134,221,188,82,158,245,
+    43,229,57,123,8,75,44,124,61,0,232,73,24,227,94,13,
+    35,60,215,69,179,131,61,68,247,187,113,15,209,100,55,238,
+    33,154,233,14,247,94,10,227,197,30,186,9,251,203,231,98,
+    186,252,255,86,81,112,170,135,110,194,231,143,231,98,186,188,
+    69,21,249,240,23,1,195,65,98,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/serial/Terminal.py",
+    "m5.objects.Terminal",
+    embedded_module_data,
+    745,
+    1283);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,128 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,173,86,205,111,219,70,22,31,74,20,53,162,36,203,
+    178,21,39,48,214,107,246,195,104,148,221,40,109,55,74,210,
+    180,77,55,137,227,77,237,68,9,26,183,11,8,139,10,180,
+    102,108,211,75,145,234,144,242,198,130,83,248,208,131,17,44,
+    208,160,88,192,57,4,133,15,69,144,34,61,20,61,5,123,
+    105,255,128,61,72,129,22,81,231,218,75,115,147,81,159,114,
+    234,27,50,146,172,143,162,61,148,31,111,134,239,189,121,243,
+    230,189,223,60,206,15,232,192,21,122,222,254,244,13,144,29,
+    68,16,145,76,84,146,242,146,36,250,1,51,80,10,230,131,
+    94,63,104,202,165,80,62,228,245,101,83,89,244,219,240,243,
+    22,47,162,0,250,27,34,161,79,16,81,104,240,126,16,161,
+    135,193,246,36,249,136,39,11,131,12,211,72,159,76,245,100,
+    17,144,169,3,178,168,39,139,130,44,70,163,125,178,24,137,
+    223,64,233,145,167,226,35,45,113,188,84,49,76,114,201,90,
+    135,254,200,5,221,49,138,215,13,123,150,174,27,69,10,156,
+    216,13,202,12,221,236,124,75,199,138,7,163,32,183,163,112,
+    219,139,2,69,121,137,160,124,0,222,32,145,242,50,9,228,
+    67,36,152,87,104,120,23,163,33,23,141,172,169,237,62,145,
+    239,7,192,207,64,119,13,48,42,246,171,163,66,125,163,226,
+    68,129,213,133,185,252,190,206,220,197,234,24,161,235,39,28,
+    111,13,39,42,192,201,172,174,86,213,21,90,202,158,61,43,
+    20,170,218,117,83,119,151,109,86,210,220,85,195,209,136,183,
+    78,13,122,101,144,106,246,114,166,26,91,92,165,154,75,89,
+    201,176,116,51,151,30,225,184,80,176,244,18,45,20,184,90,
+    40,148,108,82,49,69,63,86,40,124,84,209,205,231,18,217,
+    221,40,83,142,245,37,199,101,122,209,229,106,241,230,205,194,
+    42,213,9,101,60,34,250,69,83,119,28,30,186,174,51,189,
+    196,113,219,9,174,0,131,90,46,15,234,214,6,199,229,231,
+    108,38,192,198,21,223,185,47,209,79,98,161,207,38,28,86,
+    60,113,96,117,98,57,153,242,6,19,129,246,200,9,120,157,
+    107,64,182,58,119,51,154,220,154,109,38,198,183,46,55,147,
+    51,91,243,205,209,63,108,189,219,76,164,62,253,248,246,199,
+    119,151,239,173,213,142,93,169,39,174,54,18,87,65,30,31,
+    123,18,159,126,28,159,222,85,190,80,31,228,234,241,55,27,
+    241,55,183,230,196,205,14,183,103,24,14,133,207,127,17,10,
+    84,217,13,15,75,40,9,14,36,31,131,110,100,168,110,136,
+    40,125,186,42,232,70,135,234,134,9,238,211,141,145,8,192,
+    67,229,234,13,163,84,54,169,135,129,212,129,40,58,30,91,
+    160,100,212,71,73,87,143,43,166,225,186,38,173,38,253,221,
+    160,45,109,184,84,179,25,228,244,169,88,252,179,67,55,140,
+    42,48,150,53,157,16,70,29,71,99,186,181,66,231,170,217,
+    75,22,1,120,81,13,140,87,32,165,134,109,105,255,90,165,
+    150,166,107,151,174,45,10,176,49,90,164,198,58,37,26,72,
+    132,226,251,231,223,91,204,165,227,76,68,128,9,172,51,177,
+    62,38,118,3,27,17,36,33,200,168,64,69,228,2,120,113,
+    77,56,193,85,225,80,193,115,136,203,231,193,7,64,144,97,
+    23,28,240,138,203,23,108,219,228,42,181,72,193,182,10,212,
+    118,217,132,48,225,165,242,136,32,147,109,114,70,192,230,195,
+    62,216,28,6,216,36,95,17,136,121,17,16,147,156,216,153,
+    254,108,122,247,72,237,79,231,234,201,119,26,201,119,64,0,
+    40,170,222,174,222,125,169,54,125,170,158,56,221,72,156,22,
+    24,155,216,153,252,108,178,137,227,181,196,220,94,48,48,166,
+    236,35,32,91,243,226,246,167,158,252,69,20,205,253,46,40,
+    34,33,200,182,194,177,200,223,153,215,179,175,86,39,250,234,
+    129,96,138,108,143,116,107,130,96,61,245,118,209,20,144,92,
+    58,242,27,210,192,52,65,94,16,164,47,174,51,109,114,81,
+    196,245,181,190,184,30,18,113,77,139,184,106,254,78,236,143,
+    161,184,125,107,51,253,161,146,218,161,74,245,134,74,250,68,
+    4,43,0,11,15,242,248,123,134,83,92,111,175,170,24,56,
+    48,92,172,240,37,49,252,127,96,104,1,172,237,160,77,180,
+    59,44,176,104,83,34,210,38,90,147,58,223,104,173,99,233,
+    62,100,236,97,59,107,232,86,0,100,157,95,205,174,140,134,
+    92,155,232,62,88,122,216,177,118,43,184,25,92,11,117,190,
+    228,205,192,174,50,108,156,155,232,246,73,0,198,116,126,41,
+    43,82,111,222,123,237,75,232,55,89,4,244,252,46,118,66,
+    155,210,240,202,181,41,247,218,251,213,185,212,126,11,158,125,
+    133,132,87,2,131,218,31,160,29,239,232,1,105,199,57,46,
+    11,108,115,213,176,224,199,197,42,101,215,169,38,138,166,93,
+    252,231,241,101,70,63,170,80,171,184,97,160,191,158,65,213,
+    209,142,198,241,178,255,231,81,44,71,64,133,99,203,121,237,
+    84,54,251,170,158,142,242,201,21,106,81,166,187,180,247,120,
+    144,179,9,245,75,140,40,120,62,250,5,22,121,184,98,149,
+    153,125,115,131,203,101,211,40,114,69,47,151,161,240,240,209,
+    57,226,94,103,118,153,50,119,227,239,80,166,28,30,21,110,
+    22,192,135,130,65,120,184,188,170,91,196,164,124,212,215,191,
+    104,151,202,80,44,151,76,154,14,113,217,161,230,50,15,57,
+    46,120,193,101,11,102,246,166,98,98,67,57,2,60,154,184,
+    188,45,199,199,218,238,250,110,46,50,74,171,90,207,70,200,
+    12,106,44,8,67,223,3,249,17,110,216,154,137,241,39,137,
+    204,227,68,166,25,75,222,57,117,247,228,189,183,31,188,252,
+    213,113,40,98,163,42,20,177,81,117,91,110,41,40,117,228,
+    63,111,63,25,63,250,120,252,232,131,84,125,60,211,24,207,
+    108,227,102,226,240,191,111,109,203,77,28,251,52,122,59,250,
+    255,212,203,187,255,248,250,114,227,228,229,218,95,222,173,167,
+    230,27,169,249,58,94,104,224,133,26,94,232,170,212,102,78,
+    61,58,242,72,173,167,46,54,82,23,235,120,182,129,103,107,
+    120,246,160,252,244,163,67,223,78,253,119,234,59,183,254,198,
+    149,198,27,87,234,169,171,141,212,213,58,206,53,112,174,134,
+    115,160,249,4,79,61,198,83,119,111,62,152,172,253,241,100,
+    29,103,27,56,91,195,217,230,200,216,182,218,190,189,50,146,
+    75,203,253,229,236,44,26,172,90,71,219,100,94,132,69,148,
+    137,110,213,106,5,212,208,120,11,13,18,127,252,81,111,150,
+    56,87,75,217,12,161,203,134,69,29,38,42,2,79,2,195,
+    94,90,163,69,215,201,248,113,103,114,63,223,63,109,250,231,
+    157,8,240,203,226,124,228,112,44,186,30,162,132,114,197,53,
+    204,204,50,129,31,165,9,88,242,15,60,222,239,107,166,227,
+    122,239,114,158,225,183,252,115,218,57,118,30,249,133,211,73,
+    1,109,5,37,73,106,229,36,36,105,53,52,125,240,105,162,
+    63,215,122,159,38,58,86,235,125,154,232,112,173,253,52,209,
+    68,173,253,52,15,216,105,41,138,244,86,11,13,146,237,115,
+    123,162,217,239,114,199,176,164,180,208,32,185,147,218,19,205,
+    126,151,59,33,75,103,90,104,144,108,187,123,162,217,239,114,
+    71,162,18,164,102,144,220,185,188,39,154,253,33,34,47,106,
+    63,3,27,197,249,166,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/serial/Uart.py",
+    "m5.objects.Uart",
+    embedded_module_data,
+    1654,
+    3306);
+
+} // anonymous namespace
+} // namespace gem5
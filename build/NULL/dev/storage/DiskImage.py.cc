@@ -0,0 +1,74 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,84,189,111,211,64,20,191,179,29,39,78,13,169,
+    251,69,139,2,164,21,72,4,65,91,137,182,148,10,49,240,
+    217,162,170,69,180,98,200,98,185,185,163,53,56,73,57,187,
+    208,102,242,192,196,2,234,210,142,157,42,33,64,98,228,207,
+    72,164,12,209,173,76,108,65,237,212,137,123,118,19,242,5,
+    248,236,223,217,247,123,119,239,189,123,191,243,15,212,116,69,
+    78,251,163,188,128,61,68,16,193,14,90,133,94,114,112,78,
+    202,72,24,73,232,49,34,242,59,68,20,42,29,202,8,125,
+    150,235,147,51,114,192,69,4,167,82,185,141,83,2,46,42,
+    184,88,7,23,33,218,10,74,199,127,194,71,26,115,124,77,
+    128,182,98,231,150,215,94,210,172,151,109,14,80,169,7,232,
+    5,1,82,148,193,4,101,36,241,200,4,103,20,34,137,197,
+    228,140,74,163,7,49,212,229,34,202,33,22,174,113,195,181,
+    38,44,227,93,45,35,68,61,148,132,173,212,176,237,33,81,
+    17,102,140,107,15,108,247,213,66,206,90,167,171,39,35,132,
+    190,153,112,189,2,19,95,19,68,140,155,54,16,227,27,27,
+    197,196,58,205,77,207,205,53,140,139,9,224,83,1,159,122,
+    97,59,244,81,49,193,168,69,82,133,188,179,19,14,47,165,
+    117,30,51,205,188,149,163,166,201,227,166,153,43,144,45,7,
+    222,117,211,124,189,101,57,167,140,226,237,108,82,30,179,214,
+    92,143,89,89,143,199,179,219,219,230,134,88,139,50,174,193,
+    123,214,177,92,151,71,158,90,204,202,113,117,197,99,118,126,
+    157,199,3,31,38,184,230,202,189,66,193,225,26,248,55,193,
+    255,39,116,4,57,158,36,93,150,157,104,206,169,17,254,248,
+    230,14,83,133,73,0,151,196,227,206,11,240,27,173,218,51,
+    228,63,168,38,250,253,249,170,113,221,127,82,237,29,245,23,
+    170,198,208,94,114,55,89,186,56,81,54,38,43,198,36,12,
+    15,238,197,119,227,251,211,165,177,155,229,222,169,74,239,148,
+    191,0,141,13,214,151,110,41,119,189,80,71,231,255,81,110,
+    81,20,133,235,207,172,183,141,88,89,84,152,23,251,194,2,
+    52,19,75,105,149,129,48,152,6,0,133,103,61,0,103,0,
+    206,2,12,0,4,193,12,1,12,215,225,42,100,124,161,45,
+    227,17,145,113,152,236,229,230,52,134,219,211,104,28,171,247,
+    127,77,131,170,7,209,110,58,148,16,141,17,249,75,155,110,
+    73,164,77,155,154,152,223,93,199,42,137,118,232,56,150,209,
+    195,35,199,245,251,133,191,108,91,51,177,154,198,172,31,184,
+    158,236,134,237,144,80,172,54,148,167,216,103,231,109,207,182,
+    156,148,103,173,57,52,229,218,69,202,209,82,250,204,127,182,
+    57,81,47,119,176,89,60,18,172,203,229,133,188,16,115,176,
+    146,9,43,49,163,75,73,206,215,97,28,74,242,252,95,37,
+    169,234,198,135,229,247,203,251,139,251,139,223,166,74,201,217,
+    114,114,182,146,156,253,126,163,172,207,87,244,121,255,33,232,
+    115,100,119,4,212,56,83,54,110,85,140,91,98,162,209,239,
+    63,129,22,186,4,71,66,53,92,203,77,143,111,194,113,114,
+    185,46,94,27,127,39,166,180,100,18,70,215,26,241,73,236,
+    78,120,142,239,178,209,83,77,187,95,5,212,100,140,113,109,
+    6,225,225,18,58,23,222,85,52,86,106,189,107,170,138,167,
+    107,168,19,62,106,191,160,59,254,51,218,39,227,43,53,212,
+    9,31,111,255,130,238,248,207,168,174,226,1,152,211,14,96,
+    41,186,227,46,84,144,206,111,253,172,103,77,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/storage/DiskImage.py",
+    "m5.objects.DiskImage",
+    embedded_module_data,
+    796,
+    1580);
+
+} // anonymous namespace
+} // namespace gem5
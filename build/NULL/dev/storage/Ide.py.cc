@@ -0,0 +1,102 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,85,203,111,19,71,24,159,93,219,235,181,119,29,
+    199,143,224,20,90,188,208,162,202,8,229,193,75,8,81,80,
+    19,135,196,109,72,34,82,56,236,197,90,118,134,100,27,175,
+    55,204,174,17,177,80,181,135,182,66,185,128,122,33,135,30,
+    114,66,170,232,31,99,87,70,181,230,132,84,169,18,55,71,
+    112,226,212,111,214,216,36,118,210,170,251,248,205,204,247,253,
+    246,155,253,30,51,243,23,218,119,69,62,180,111,127,0,120,
+    142,48,194,66,5,217,130,46,216,162,46,10,124,44,86,66,
+    223,241,54,84,9,219,17,61,34,32,17,205,35,28,254,17,
+    225,8,145,94,132,16,122,25,234,25,211,163,129,78,2,93,
+    148,68,6,116,114,160,147,65,23,35,194,128,46,134,227,171,
+    168,160,188,225,131,130,200,98,43,166,85,36,15,45,147,48,
+    25,186,37,103,198,160,5,129,9,103,1,98,171,150,189,124,
+    239,123,98,122,230,126,63,196,158,31,199,2,63,8,210,5,
+    140,116,17,11,88,92,19,245,16,14,129,253,48,139,148,48,
+    41,21,89,20,7,198,167,122,157,233,37,208,201,229,114,213,
+    176,73,185,204,226,229,178,237,224,90,133,247,213,114,249,65,
+    205,168,124,208,132,31,26,21,247,55,244,150,207,244,254,152,
+    75,205,73,48,48,233,122,14,53,214,200,36,24,159,216,220,
+    162,50,40,3,248,28,94,119,28,192,239,223,109,117,236,217,
+    86,67,57,229,23,249,77,71,123,212,3,190,132,123,190,252,
+    122,208,23,4,126,8,122,24,139,58,68,126,55,138,14,185,
+    112,8,135,95,64,44,94,246,226,1,113,7,110,236,80,110,
+    4,75,3,220,56,112,149,67,185,209,23,2,48,133,62,83,
+    197,50,68,52,198,162,224,116,209,114,55,234,185,253,145,176,
+    48,41,99,144,78,172,175,215,19,107,196,190,116,245,234,7,
+    30,11,77,215,220,186,118,211,122,68,176,198,41,26,38,21,
+    99,75,179,170,154,109,153,212,113,137,233,84,177,75,249,31,
+    215,229,34,181,30,18,173,84,172,199,249,183,154,101,131,241,
+    165,66,130,242,127,164,42,135,4,0,11,123,91,155,132,197,
+    205,71,143,202,235,196,192,132,178,24,239,155,21,195,117,89,
+    100,197,160,134,205,162,139,134,71,170,230,22,139,4,19,6,
+    81,135,252,243,9,160,34,98,220,126,137,155,103,145,96,22,
+    154,228,214,131,252,164,56,100,122,240,37,79,234,157,131,73,
+    85,178,126,177,157,58,235,127,211,30,205,251,165,182,154,122,
+    122,107,251,214,206,153,198,169,217,166,90,108,169,69,127,174,
+    61,146,121,186,177,189,177,83,216,213,155,35,83,173,145,41,
+    127,158,211,150,183,151,119,22,155,106,161,165,22,252,57,126,
+    119,103,204,28,89,17,215,132,255,95,17,3,153,147,113,24,
+    214,91,68,143,99,73,87,112,20,50,41,233,9,44,235,35,
+    240,38,113,76,31,197,113,61,5,253,180,136,72,6,43,191,
+    171,3,223,103,3,121,98,72,62,118,4,255,216,17,252,92,
+    32,31,25,146,143,147,79,118,143,31,234,137,132,147,3,245,
+    122,226,95,184,163,3,220,79,113,10,42,54,205,18,80,137,
+    179,78,213,163,78,165,66,232,112,221,154,30,173,240,186,205,
+    244,235,118,31,251,76,169,56,23,148,173,171,25,158,103,152,
+    235,80,197,158,163,121,235,150,171,153,125,154,245,179,143,144,
+    149,122,0,169,228,243,91,62,224,27,238,225,155,159,56,228,
+    1,152,120,101,6,118,179,176,107,213,9,19,47,206,192,186,
+    184,60,83,79,148,150,181,77,135,122,154,187,110,221,247,234,
+    185,222,108,61,219,154,115,255,190,75,188,165,194,103,3,75,
+    128,142,113,224,123,31,205,113,235,202,93,216,32,29,26,148,
+    126,80,78,80,246,252,175,153,124,151,84,177,67,161,228,229,
+    238,14,203,183,195,89,199,182,141,42,102,210,170,103,120,53,
+    32,221,6,149,107,57,85,22,155,229,107,104,214,193,132,169,
+    171,181,123,31,71,210,10,117,214,74,55,33,154,85,143,80,
+    90,219,244,22,173,42,144,250,195,21,171,74,121,217,178,240,
+    204,215,183,167,2,156,14,240,124,128,23,2,188,72,249,246,
+    200,164,59,240,217,133,243,76,182,156,114,224,57,83,120,22,
+    202,93,111,7,151,98,190,7,83,240,186,127,163,131,75,241,
+    120,127,41,158,225,75,49,247,167,154,255,67,205,55,180,249,
+    166,186,208,82,23,252,185,215,201,49,127,161,29,192,72,10,
+    150,97,34,237,223,108,39,211,48,28,205,194,23,153,156,191,
+    216,78,164,64,150,29,247,111,5,195,142,132,212,236,147,43,
+    59,217,134,114,178,169,156,108,41,39,97,14,37,51,32,121,
+    61,36,57,138,51,214,80,242,77,37,223,82,242,32,73,102,
+    159,62,222,126,188,51,187,155,111,38,167,91,201,105,248,143,
+    116,238,249,185,95,206,237,184,141,47,190,106,166,175,183,210,
+    215,253,111,249,221,13,1,119,124,169,16,103,89,251,210,132,
+    19,156,131,238,68,255,184,164,252,72,237,134,61,6,250,77,
+    158,126,151,169,208,237,159,154,84,10,146,50,87,173,217,221,
+    147,42,211,143,233,193,56,191,151,175,117,79,193,235,244,6,
+    12,121,249,186,175,0,58,33,65,16,58,151,67,130,216,65,
+    255,13,50,18,198,27,40,215,125,218,232,116,227,224,211,145,
+    4,225,116,7,13,195,147,226,30,111,222,125,148,202,146,112,
+    182,131,134,225,137,181,199,155,119,31,165,233,19,194,141,14,
+    26,134,103,165,61,222,188,59,68,21,184,253,15,85,178,64,
+    170,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/storage/Ide.py",
+    "m5.objects.Ide",
+    embedded_module_data,
+    1233,
+    2329);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,56 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,82,189,111,211,64,20,191,243,217,38,177,19,20,
+    16,180,80,9,41,234,80,53,149,72,166,182,168,170,218,37,
+    2,149,161,84,10,147,85,233,100,124,167,38,197,78,194,157,
+    139,226,76,30,152,186,148,141,14,12,76,145,16,255,76,42,
+    117,176,110,101,98,11,42,19,19,119,118,109,130,200,125,252,
+    222,187,123,31,191,247,206,254,14,230,134,113,43,111,246,36,
+    124,2,4,16,232,131,215,153,132,169,212,124,45,64,14,130,
+    64,3,47,0,65,31,0,209,41,154,32,0,190,161,60,137,
+    163,19,163,3,26,230,15,117,104,64,1,55,36,148,59,189,
+    224,213,155,83,234,133,222,60,161,158,19,142,83,66,10,28,
+    72,128,163,201,141,8,148,137,52,199,160,230,151,59,96,193,
+    32,104,2,37,45,44,104,75,210,179,188,200,147,90,167,118,
+    17,165,79,52,25,165,21,81,149,172,88,97,201,2,135,62,
+    109,247,248,219,241,10,161,239,91,60,28,48,247,132,182,120,
+    122,143,137,52,52,187,221,113,237,132,6,155,59,59,115,222,
+    150,194,250,65,32,157,199,119,59,17,15,105,80,63,26,244,
+    250,33,101,135,141,170,40,97,220,119,3,138,177,176,48,14,
+    6,228,204,87,122,5,227,119,103,174,127,107,209,195,104,72,
+    133,229,141,70,184,75,93,66,153,40,43,221,243,93,206,133,
+    113,228,50,55,16,101,69,147,178,8,93,21,35,204,140,75,
+    152,210,78,251,161,64,110,63,18,38,79,47,191,130,27,213,
+    221,239,39,156,121,173,249,110,254,214,221,28,70,204,148,62,
+    41,212,229,230,109,9,113,49,19,123,57,110,39,247,158,198,
+    47,147,218,106,124,144,216,181,139,253,243,253,203,221,43,123,
+    253,218,94,151,166,234,253,139,227,243,227,203,181,207,27,211,
+    181,173,171,234,246,117,117,59,126,174,38,123,152,167,61,108,
+    24,162,28,108,54,135,170,3,46,74,74,101,131,81,36,42,
+    82,43,254,8,166,231,254,236,129,130,52,124,73,149,95,218,
+    205,30,108,143,173,200,163,250,212,156,74,152,33,8,225,108,
+    11,192,71,83,176,156,173,4,44,77,243,149,128,213,233,191,
+    107,102,26,240,217,12,252,15,31,31,255,84,226,215,2,83,
+    90,198,31,246,10,204,168,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/storage/SimpleDisk.py",
+    "m5.objects.SimpleDisk",
+    embedded_module_data,
+    503,
+    798);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,91 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,84,189,111,219,70,20,191,35,41,138,164,164,72,
+    140,191,132,162,118,100,163,105,45,23,176,131,214,73,141,32,
+    72,90,217,112,163,32,176,141,56,205,64,4,32,104,221,161,
+    166,33,138,46,73,27,150,38,162,232,80,116,105,224,197,30,
+    58,120,50,80,56,67,255,20,169,16,80,225,38,3,157,188,
+    201,136,39,47,233,29,169,47,179,106,67,30,223,123,119,239,
+    29,239,222,239,125,252,13,6,158,88,135,191,59,164,228,8,
+    32,128,96,25,88,80,131,144,201,92,153,179,120,141,183,4,
+    77,8,230,124,57,246,50,228,98,192,133,114,220,146,52,9,
+    2,14,124,11,80,236,39,128,68,44,157,242,0,156,241,221,
+    3,52,57,208,197,169,78,194,114,68,167,4,58,153,234,20,
+    204,71,116,9,148,216,4,249,228,5,155,228,33,145,55,76,
+    123,5,239,155,37,156,231,232,164,100,134,19,34,81,177,104,
+    23,12,135,218,192,57,102,184,105,90,235,91,59,184,228,149,
+    6,29,21,186,142,190,13,28,197,64,131,8,104,28,253,120,
+    4,53,1,113,90,12,241,154,136,227,39,18,24,242,32,1,
+    197,78,57,122,65,174,239,24,181,85,134,217,226,196,78,178,
+    183,79,140,236,74,209,93,183,134,158,16,71,82,196,54,141,
+    100,10,129,66,50,175,76,199,43,174,135,30,23,12,23,95,
+    223,70,120,127,97,159,174,154,246,194,22,93,152,223,222,174,
+    141,127,143,173,251,15,31,70,109,95,58,236,135,181,145,112,
+    61,231,238,109,185,85,215,195,86,174,184,82,75,117,68,59,
+    192,139,136,101,211,243,202,184,166,134,187,115,91,85,15,231,
+    108,7,97,103,45,159,33,146,174,87,12,11,235,58,81,116,
+    221,178,209,94,153,201,73,93,255,97,207,40,119,52,130,87,
+    221,197,68,41,29,28,232,219,216,160,27,137,204,228,82,217,
+    112,93,34,25,91,174,231,24,244,160,216,134,225,24,22,137,
+    125,87,172,120,75,68,238,221,137,136,155,29,78,13,112,197,
+    35,188,81,169,18,177,163,148,11,244,62,235,236,58,68,97,
+    87,211,131,171,253,14,222,49,176,174,179,174,83,90,24,128,
+    37,244,119,126,183,234,200,84,29,144,123,244,115,117,74,252,
+    222,219,74,76,250,43,45,245,174,255,172,149,153,245,139,173,
+    244,136,255,244,60,51,118,148,56,76,28,175,212,103,190,106,
+    100,150,154,153,37,191,120,158,186,253,235,235,95,94,31,127,
+    250,219,220,137,221,72,61,104,166,30,248,171,45,117,252,232,
+    206,225,157,147,108,253,243,199,13,245,73,83,125,226,63,99,
+    175,51,217,61,241,70,10,194,110,10,126,244,63,41,72,3,
+    46,16,181,19,196,61,203,170,134,177,112,88,166,213,38,110,
+    132,184,175,93,203,139,14,75,57,39,197,8,75,47,39,205,
+    72,134,17,149,145,143,25,9,174,53,197,72,174,75,30,49,
+    72,38,35,144,76,245,32,201,251,69,246,134,59,115,81,135,
+    122,53,245,227,127,58,132,197,147,248,176,108,231,0,109,20,
+    148,159,245,243,159,143,214,23,18,52,5,43,180,17,196,180,
+    36,18,181,20,221,115,11,197,223,74,167,20,200,51,216,179,
+    163,85,162,101,144,66,129,75,4,141,33,68,167,166,14,228,
+    194,110,201,100,21,146,14,225,235,219,164,58,69,129,2,20,
+    205,43,26,24,19,80,208,46,222,211,31,19,110,177,64,251,
+    137,224,154,53,124,193,142,91,203,171,31,64,121,164,27,247,
+    0,43,194,239,155,54,145,94,225,10,178,157,226,10,81,55,
+    187,121,222,91,146,194,248,81,73,94,102,53,178,108,211,140,
+    102,61,153,8,133,111,94,220,35,73,90,32,216,113,246,118,
+    189,13,179,18,13,226,76,151,20,88,16,119,34,65,28,103,
+    65,252,132,5,113,154,166,175,146,254,75,201,253,169,228,234,
+    211,95,208,209,152,94,108,78,47,254,97,55,148,213,166,178,
+    234,47,159,167,199,252,167,173,108,174,46,140,181,152,120,158,
+    25,245,139,109,17,36,71,127,94,58,30,173,39,166,26,137,
+    169,38,75,139,243,145,9,255,57,123,195,107,204,4,168,36,
+    137,106,221,159,15,123,136,59,223,201,87,214,200,201,232,192,
+    122,175,101,59,44,109,66,39,101,170,223,101,173,128,54,7,
+    38,58,246,65,149,36,169,212,235,225,78,252,6,164,161,207,
+    55,113,184,150,30,133,221,232,177,243,101,167,202,92,22,191,
+    54,15,33,108,63,135,0,206,214,193,103,131,163,205,241,144,
+    107,131,15,19,9,192,108,29,76,132,163,5,198,235,221,209,
+    2,51,245,155,163,45,202,240,107,216,6,195,233,155,234,101,
+    192,175,6,53,89,30,206,177,115,162,164,158,157,189,100,252,
+    170,191,156,204,192,108,27,252,155,188,145,47,25,187,26,162,
+    10,0,250,7,43,170,239,175,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/virtio/VirtIO.py",
+    "m5.objects.VirtIO",
+    embedded_module_data,
+    1064,
+    2028);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,90 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,85,207,79,27,71,20,158,181,215,235,31,139,141,
+    249,17,146,16,74,183,77,147,198,5,25,168,106,35,34,154,
+    168,129,38,56,74,29,75,64,15,86,42,107,227,153,218,110,
+    109,175,51,187,182,192,189,236,161,39,46,32,46,160,158,114,
+    66,170,242,207,216,146,15,214,156,34,85,61,228,102,20,78,
+    156,58,111,151,181,97,129,170,151,238,236,126,179,59,223,155,
+    153,247,222,247,60,254,11,157,187,124,103,253,199,125,14,7,
+    8,35,44,148,81,69,200,10,2,188,123,202,158,13,187,247,
+    110,32,15,122,134,176,247,119,132,69,34,28,121,17,122,231,
+    117,22,201,138,22,231,227,156,68,68,23,231,179,56,63,231,
+    2,196,231,226,36,139,11,114,46,116,137,243,99,121,29,197,
+    134,62,192,71,76,96,209,31,75,212,72,189,92,37,141,82,
+    158,60,81,117,194,199,132,175,242,231,99,17,157,88,26,86,
+    44,4,101,5,140,178,30,254,120,177,144,21,177,39,235,195,
+    222,172,68,252,111,3,232,138,11,139,216,119,228,225,62,120,
+    250,62,4,185,109,232,74,91,9,251,93,182,50,14,112,127,
+    131,108,200,118,116,41,3,78,110,156,142,98,210,152,107,240,
+    161,146,54,247,179,190,84,139,23,139,205,209,2,169,36,30,
+    62,60,111,248,65,225,107,52,111,191,172,27,181,186,161,188,
+    169,147,58,81,244,82,147,40,15,106,106,129,232,49,38,194,
+    156,102,240,7,173,94,53,20,67,45,164,99,67,44,144,203,
+    85,213,10,201,229,88,40,151,171,104,184,94,134,247,161,92,
+    238,77,93,45,159,49,162,177,93,35,44,160,190,214,13,170,
+    230,13,22,202,111,109,229,138,68,197,132,178,32,188,231,203,
+    170,174,51,95,70,165,106,133,5,54,171,122,169,80,37,152,
+    5,45,31,214,185,11,76,90,55,104,169,90,96,94,190,237,
+    159,232,35,68,123,58,169,211,252,220,185,208,156,88,226,181,
+    109,42,113,3,11,102,248,163,167,56,152,253,214,149,111,155,
+    171,221,225,49,115,173,59,114,207,124,222,141,126,97,166,222,
+    71,111,28,68,246,35,135,180,117,247,81,59,250,184,19,125,
+    108,166,186,161,225,221,217,157,217,189,198,225,111,237,208,76,
+    39,52,99,174,64,163,55,157,181,47,40,47,56,202,79,255,
+    171,242,88,228,10,249,88,216,113,54,67,181,173,237,13,234,
+    135,212,143,93,212,196,162,210,49,63,5,249,169,12,48,4,
+    16,6,136,0,12,3,68,1,38,0,44,199,110,1,76,58,
+    144,128,240,63,119,133,63,121,49,252,123,102,10,154,61,125,
+    210,29,87,191,162,255,184,54,46,34,189,245,95,89,161,94,
+    44,186,42,52,112,173,173,239,136,103,240,157,208,183,12,94,
+    107,41,185,44,67,216,207,115,26,24,84,253,106,73,195,118,
+    70,93,85,14,4,19,49,199,166,146,81,141,162,98,104,10,
+    124,205,42,90,141,87,80,85,45,151,183,149,82,85,201,124,
+    183,177,214,188,227,88,144,173,154,70,121,193,23,169,86,47,
+    20,173,9,205,27,155,213,186,78,176,162,107,249,95,137,225,
+    172,147,142,201,87,138,53,208,105,4,96,28,224,19,14,76,
+    164,154,198,127,15,246,42,176,159,91,200,41,7,150,65,200,
+    77,116,185,142,7,37,44,71,119,151,119,150,15,165,150,242,
+    164,45,175,116,228,21,206,218,99,173,91,137,182,156,236,200,
+    73,176,159,56,152,218,159,106,77,39,218,35,201,206,72,210,
+    124,14,205,222,113,234,90,237,233,255,172,61,215,212,117,234,
+    157,105,26,113,164,91,183,82,100,171,58,126,81,85,155,106,
+    6,23,190,94,140,207,243,182,208,156,94,202,40,58,161,13,
+    66,21,21,99,74,116,93,209,168,82,212,116,67,129,35,137,
+    121,19,201,111,154,145,129,17,232,155,142,133,254,171,118,76,
+    178,231,49,17,38,186,37,251,204,129,167,32,217,247,46,201,
+    238,244,37,187,207,37,11,143,238,190,218,121,117,56,211,250,
+    242,89,59,188,214,9,175,153,79,207,36,59,244,181,62,157,
+    107,203,243,29,121,222,92,133,102,239,0,235,166,121,94,70,
+    42,137,184,246,250,23,146,55,244,184,157,7,10,127,91,44,
+    200,199,107,112,140,234,44,0,175,112,132,216,135,225,100,191,
+    156,44,7,47,58,125,26,88,182,207,238,71,244,1,178,207,
+    50,253,111,14,61,175,32,8,189,23,2,18,230,90,40,126,
+    254,238,162,155,45,231,238,162,137,150,115,247,36,191,48,219,
+    67,151,161,53,118,247,24,250,147,193,240,184,40,220,239,161,
+    203,176,247,226,24,186,147,193,104,196,47,44,194,28,55,236,
+    125,11,107,46,158,12,70,199,37,97,161,135,46,195,222,79,
+    199,208,157,92,65,89,105,248,7,226,77,244,89,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/virtio/VirtIO9P.py",
+    "m5.objects.VirtIO9P",
+    embedded_module_data,
+    1053,
+    2194);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,57 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,82,191,107,219,64,20,190,147,44,89,178,77,176,
+    155,166,109,134,130,105,75,169,82,144,167,44,161,36,193,184,
+    20,151,16,23,146,118,208,34,20,221,97,43,145,108,69,103,
+    25,71,147,134,76,93,10,93,146,177,147,161,244,159,113,32,
+    131,184,169,208,41,155,75,58,117,234,157,108,25,65,125,247,
+    238,123,63,238,241,190,247,78,250,5,114,75,90,232,251,93,
+    6,87,0,1,4,93,224,65,3,66,110,11,174,112,60,215,
+    226,49,16,192,59,128,196,75,128,10,24,78,68,0,126,136,
+    89,17,163,128,164,35,160,201,119,220,209,32,173,126,114,130,
+    97,187,211,194,35,199,198,77,139,96,22,131,91,118,158,183,
+    144,241,250,41,47,6,6,68,192,16,216,17,17,100,245,4,
+    67,194,242,183,34,88,177,144,136,10,19,129,241,11,75,126,
+    133,229,170,43,115,165,9,100,153,112,153,89,66,50,235,180,
+    72,203,243,22,155,238,192,62,139,214,17,30,53,70,44,224,
+    12,26,39,60,162,247,122,81,173,139,189,237,157,157,92,222,
+    93,204,42,68,155,157,112,232,135,195,250,121,136,67,92,39,
+    78,132,235,175,124,171,139,137,22,149,90,14,57,171,59,30,
+    243,14,181,50,85,76,179,111,121,216,52,105,201,52,189,1,
+    10,93,110,87,76,243,60,180,220,197,77,97,120,225,99,90,
+    178,199,99,179,135,45,132,3,170,114,219,118,45,66,168,244,
+    193,10,44,143,42,31,251,196,233,246,49,162,106,74,122,196,
+    56,169,202,185,218,156,138,74,41,227,119,112,207,39,252,251,
+    148,4,118,35,55,80,110,0,221,191,8,100,150,147,194,107,
+    118,72,147,65,188,220,73,249,73,220,74,106,47,227,247,73,
+    245,121,220,254,89,221,184,90,251,186,118,77,166,47,246,110,
+    170,251,183,213,125,22,171,212,190,116,62,119,174,15,110,42,
+    218,109,69,139,223,242,29,60,204,138,30,106,18,173,121,219,
+    250,224,228,20,219,67,162,207,201,3,254,167,80,149,197,125,
+    62,16,161,10,55,131,193,120,209,206,58,135,180,198,6,159,
+    64,121,51,127,172,221,96,147,185,252,219,145,46,131,153,8,
+    33,156,29,64,0,27,83,160,231,37,1,143,167,153,36,224,
+    209,52,147,153,92,132,91,51,240,63,76,31,60,251,205,245,
+    159,21,119,105,35,255,0,84,43,207,141,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/virtio/VirtIOBlock.py",
+    "m5.objects.VirtIOBlock",
+    embedded_module_data,
+    523,
+    804);
+
+} // anonymous namespace
+} // namespace gem5
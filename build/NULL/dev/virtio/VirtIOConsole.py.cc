@@ -0,0 +1,63 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,82,207,111,211,48,20,182,147,254,72,187,117,106,
+    97,45,18,72,107,16,155,180,14,212,157,118,153,16,7,24,
+    93,59,161,129,216,64,34,151,40,196,214,26,148,52,173,157,
+    86,91,79,145,224,47,216,165,28,56,236,52,9,241,207,164,
+    104,18,145,79,147,56,237,86,52,78,156,176,147,118,234,80,
+    135,253,252,252,222,203,39,251,123,95,252,19,76,141,228,120,
+    191,220,225,110,0,16,64,208,6,14,212,32,20,177,100,75,
+    142,172,201,81,44,219,137,253,120,79,238,3,9,108,3,148,
+    248,4,80,18,203,167,50,0,223,228,201,129,90,10,165,246,
+    64,37,125,33,146,10,100,243,123,152,88,134,189,133,123,150,
+    137,121,158,127,107,17,175,241,50,206,159,26,84,212,224,154,
+    57,205,41,49,225,244,37,226,132,129,6,17,208,36,190,100,
+    4,181,4,146,180,36,78,157,164,193,140,129,100,148,56,149,
+    56,31,233,138,143,242,31,108,242,31,108,134,99,179,51,177,
+    169,83,200,145,240,10,57,135,210,188,75,133,229,226,118,158,
+    185,45,234,218,184,95,68,184,183,222,227,37,203,93,55,227,
+    90,181,217,236,223,62,192,206,198,230,230,53,236,69,158,159,
+    211,87,95,99,19,91,61,172,118,186,184,139,85,106,245,177,
+    186,138,48,53,137,213,246,92,66,43,253,251,251,196,104,81,
+    199,242,110,134,172,196,26,171,40,18,85,53,60,207,48,155,
+    24,169,158,171,122,77,139,142,235,187,149,121,166,232,122,203,
+    112,176,174,179,172,174,59,46,234,218,34,158,215,245,78,215,
+    176,199,95,18,222,81,27,179,172,121,120,168,55,177,129,48,
+    97,25,17,155,182,65,41,75,190,50,136,225,48,229,77,139,
+    90,7,45,140,88,166,195,59,232,237,113,82,44,219,137,168,
+    138,152,136,247,192,82,241,197,95,193,165,208,236,79,153,18,
+    115,125,74,160,107,114,84,219,71,68,252,166,200,61,226,139,
+    190,227,206,191,154,225,220,93,127,43,44,172,250,59,97,126,
+    197,111,156,231,139,131,133,227,133,207,36,120,240,124,152,175,
+    157,229,107,126,35,44,148,6,75,199,75,39,82,176,188,61,
+    44,212,207,10,117,127,231,60,119,235,71,174,252,61,87,14,
+    212,237,97,174,126,150,171,251,53,49,73,113,114,215,110,37,
+    205,10,206,70,213,125,255,1,155,30,173,198,90,198,13,76,
+    215,99,182,68,60,78,150,225,245,182,16,130,50,69,132,196,
+    61,28,179,95,20,46,58,187,36,90,86,30,199,34,63,33,
+    247,120,42,158,15,253,200,221,72,134,16,142,94,64,0,31,
+    6,96,109,218,66,80,13,174,91,8,238,4,19,11,65,41,
+    152,216,40,165,192,6,28,129,217,62,88,92,254,21,5,191,
+    111,0,68,36,255,2,174,55,17,141,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/virtio/VirtIOConsole.py",
+    "m5.objects.VirtIOConsole",
+    embedded_module_data,
+    618,
+    1035);
+
+} // anonymous namespace
+} // namespace gem5
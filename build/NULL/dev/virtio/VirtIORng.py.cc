@@ -0,0 +1,53 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,81,191,111,211,64,20,126,231,31,193,105,35,17,
+    23,169,29,24,8,82,151,32,228,8,104,150,10,117,64,5,
+    84,6,131,218,194,224,229,100,124,39,199,200,118,146,187,36,
+    74,51,121,96,98,97,164,99,167,74,136,127,198,72,12,214,
+    77,72,76,221,130,202,196,196,93,28,71,145,232,221,187,239,
+    189,119,119,254,190,79,231,95,176,54,204,101,190,62,144,240,
+    5,8,16,20,67,130,60,132,84,173,197,218,105,153,245,83,
+    208,224,37,16,253,35,16,131,162,75,29,224,155,94,145,120,
+    6,49,79,160,93,187,82,77,27,137,230,187,136,141,142,94,
+    31,210,73,20,208,103,62,167,114,15,61,8,214,117,141,74,
+    247,197,66,151,130,135,8,120,154,92,58,65,146,79,243,76,
+    90,187,184,5,55,12,162,19,227,82,147,250,218,74,223,42,
+    245,69,189,20,62,78,195,153,77,232,164,51,145,109,212,239,
+    176,52,116,122,189,217,237,144,38,221,253,253,213,157,171,166,
+    252,118,182,117,76,135,99,202,71,45,137,99,218,226,209,140,
+    186,237,186,176,48,78,253,132,98,44,54,48,78,250,100,28,
+    171,186,129,241,112,236,199,203,19,99,116,54,160,98,35,152,
+    78,113,143,250,132,50,81,87,117,16,251,156,11,243,141,207,
+    252,68,88,111,83,30,133,41,37,194,28,158,72,238,175,112,
+    173,44,255,189,203,89,208,89,243,184,114,229,12,206,88,77,
+    222,88,192,67,185,248,35,9,217,106,22,155,219,217,97,97,
+    239,102,175,138,230,253,236,232,103,195,254,236,126,114,207,31,
+    231,247,158,124,111,236,253,104,236,101,207,213,100,91,21,135,
+    219,54,133,157,116,157,254,251,15,52,24,113,167,84,98,234,
+    239,137,186,220,31,40,159,92,88,170,100,253,233,82,221,86,
+    176,224,184,163,236,90,79,203,55,56,96,59,178,69,202,86,
+    40,97,174,35,132,230,46,2,212,201,193,89,143,2,118,242,
+    42,10,216,206,171,152,215,76,212,157,195,255,144,55,91,191,
+    85,254,115,195,217,194,200,63,120,5,179,18,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/dev/virtio/VirtIORng.py",
+    "m5.objects.VirtIORng",
+    embedded_module_data,
+    460,
+    696);
+
+} // anonymous namespace
+} // namespace gem5
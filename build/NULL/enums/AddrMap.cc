@@ -0,0 +1,49 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_cc.py:167
+ */
+
+#include "base/compiler.hh"
+#include "enums/AddrMap.hh"
+
+namespace gem5
+{
+
+namespace enums
+{
+    const char *AddrMapStrings[Num_AddrMap] =
+    {
+        "RoRaBaChCo",
+        "RoRaBaCoCh",
+        "RoCoRaBaCh",
+    };
+} // namespace enums
+} // namespace gem5
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <sim/init.hh>
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+    py::module_ m = m_internal.def_submodule("enum_AddrMap");
+
+py::enum_<enums::AddrMap>(m, "enum_AddrMap")
+        .value("RoRaBaChCo", enums::RoRaBaChCo)
+        .value("RoRaBaCoCh", enums::RoRaBaCoCh)
+        .value("RoCoRaBaCh", enums::RoCoRaBaCh)
+        .value("Num_AddrMap", enums::Num_AddrMap)
+        .export_values()
+        ;
+    }
+static EmbeddedPyBind embed_enum("enum_AddrMap", module_init);
+
+} // namespace gem5
+    
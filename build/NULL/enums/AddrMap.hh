@@ -0,0 +1,25 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_hh.py:123
+ */
+
+#ifndef __ENUM__enums__AddrMap__
+#define __ENUM__enums__AddrMap__
+
+namespace gem5
+{
+namespace enums {
+enum AddrMap
+{
+        RoRaBaChCo = 0,
+        RoRaBaCoCh = 1,
+        RoCoRaBaCh = 2,
+        Num_AddrMap = 3
+    };
+    extern const char *AddrMapStrings[Num_AddrMap];
+}; // enums
+
+} // namespace gem5
+
+#endif // __ENUM__enums__AddrMap__
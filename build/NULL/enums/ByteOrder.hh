@@ -0,0 +1,22 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_hh.py:123
+ */
+
+#ifndef __ENUM__None__ByteOrder__
+#define __ENUM__None__ByteOrder__
+
+namespace gem5
+{
+enum class ByteOrder
+{
+    big = 0,
+    little = 1,
+    Num_ByteOrder = 2
+};
+extern const char *ByteOrderStrings[static_cast<int>(ByteOrder::Num_ByteOrder)];
+
+} // namespace gem5
+
+#endif // __ENUM__None__ByteOrder__
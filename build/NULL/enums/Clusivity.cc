@@ -0,0 +1,47 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_cc.py:167
+ */
+
+#include "base/compiler.hh"
+#include "enums/Clusivity.hh"
+
+namespace gem5
+{
+
+namespace enums
+{
+    const char *ClusivityStrings[Num_Clusivity] =
+    {
+        "mostly_incl",
+        "mostly_excl",
+    };
+} // namespace enums
+} // namespace gem5
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <sim/init.hh>
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+    py::module_ m = m_internal.def_submodule("enum_Clusivity");
+
+py::enum_<enums::Clusivity>(m, "enum_Clusivity")
+        .value("mostly_incl", enums::mostly_incl)
+        .value("mostly_excl", enums::mostly_excl)
+        .value("Num_Clusivity", enums::Num_Clusivity)
+        .export_values()
+        ;
+    }
+static EmbeddedPyBind embed_enum("enum_Clusivity", module_init);
+
+} // namespace gem5
+    
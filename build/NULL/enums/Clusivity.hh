@@ -0,0 +1,24 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_hh.py:123
+ */
+
+#ifndef __ENUM__enums__Clusivity__
+#define __ENUM__enums__Clusivity__
+
+namespace gem5
+{
+namespace enums {
+enum Clusivity
+{
+        mostly_incl = 0,
+        mostly_excl = 1,
+        Num_Clusivity = 2
+    };
+    extern const char *ClusivityStrings[Num_Clusivity];
+}; // enums
+
+} // namespace gem5
+
+#endif // __ENUM__enums__Clusivity__
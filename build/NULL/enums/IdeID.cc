@@ -0,0 +1,47 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_cc.py:167
+ */
+
+#include "base/compiler.hh"
+#include "enums/IdeID.hh"
+
+namespace gem5
+{
+
+namespace enums
+{
+    const char *IdeIDStrings[Num_IdeID] =
+    {
+        "device0",
+        "device1",
+    };
+} // namespace enums
+} // namespace gem5
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <sim/init.hh>
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+    py::module_ m = m_internal.def_submodule("enum_IdeID");
+
+py::enum_<enums::IdeID>(m, "enum_IdeID")
+        .value("device0", enums::device0)
+        .value("device1", enums::device1)
+        .value("Num_IdeID", enums::Num_IdeID)
+        .export_values()
+        ;
+    }
+static EmbeddedPyBind embed_enum("enum_IdeID", module_init);
+
+} // namespace gem5
+    
@@ -0,0 +1,24 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_hh.py:123
+ */
+
+#ifndef __ENUM__enums__IdeID__
+#define __ENUM__enums__IdeID__
+
+namespace gem5
+{
+namespace enums {
+enum IdeID
+{
+        device0 = 0,
+        device1 = 1,
+        Num_IdeID = 2
+    };
+    extern const char *IdeIDStrings[Num_IdeID];
+}; // enums
+
+} // namespace gem5
+
+#endif // __ENUM__enums__IdeID__
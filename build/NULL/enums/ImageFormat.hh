@@ -0,0 +1,25 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_hh.py:123
+ */
+
+#ifndef __ENUM__enums__ImageFormat__
+#define __ENUM__enums__ImageFormat__
+
+namespace gem5
+{
+namespace enums {
+enum ImageFormat
+{
+        Auto = 0,
+        Bitmap = 1,
+        Png = 2,
+        Num_ImageFormat = 3
+    };
+    extern const char *ImageFormatStrings[Num_ImageFormat];
+}; // enums
+
+} // namespace gem5
+
+#endif // __ENUM__enums__ImageFormat__
@@ -0,0 +1,47 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_cc.py:167
+ */
+
+#include "base/compiler.hh"
+#include "enums/KernelPanicOopsBehaviour.hh"
+
+namespace gem5
+{
+
+const char *KernelPanicOopsBehaviourStrings[static_cast<int>(KernelPanicOopsBehaviour::Num_KernelPanicOopsBehaviour)] =
+{
+    "Continue",
+    "DumpDmesgAndContinue",
+    "DumpDmesgAndExit",
+    "DumpDmesgAndPanic",
+};
+} // namespace gem5
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <sim/init.hh>
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+    py::module_ m = m_internal.def_submodule("enum_KernelPanicOopsBehaviour");
+
+py::enum_<KernelPanicOopsBehaviour>(m, "enum_KernelPanicOopsBehaviour")
+        .value("Continue", KernelPanicOopsBehaviour::Continue)
+        .value("DumpDmesgAndContinue", KernelPanicOopsBehaviour::DumpDmesgAndContinue)
+        .value("DumpDmesgAndExit", KernelPanicOopsBehaviour::DumpDmesgAndExit)
+        .value("DumpDmesgAndPanic", KernelPanicOopsBehaviour::DumpDmesgAndPanic)
+        .value("Num_KernelPanicOopsBehaviour", KernelPanicOopsBehaviour::Num_KernelPanicOopsBehaviour)
+        ;
+    }
+static EmbeddedPyBind embed_enum("enum_KernelPanicOopsBehaviour", module_init);
+
+} // namespace gem5
+    
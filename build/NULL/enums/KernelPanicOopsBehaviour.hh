@@ -0,0 +1,24 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_hh.py:123
+ */
+
+#ifndef __ENUM__None__KernelPanicOopsBehaviour__
+#define __ENUM__None__KernelPanicOopsBehaviour__
+
+namespace gem5
+{
+enum class KernelPanicOopsBehaviour
+{
+    Continue = 0,
+    DumpDmesgAndContinue = 1,
+    DumpDmesgAndExit = 2,
+    DumpDmesgAndPanic = 3,
+    Num_KernelPanicOopsBehaviour = 4
+};
+extern const char *KernelPanicOopsBehaviourStrings[static_cast<int>(KernelPanicOopsBehaviour::Num_KernelPanicOopsBehaviour)];
+
+} // namespace gem5
+
+#endif // __ENUM__None__KernelPanicOopsBehaviour__
@@ -0,0 +1,24 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_hh.py:123
+ */
+
+#ifndef __ENUM__enums__MemSched__
+#define __ENUM__enums__MemSched__
+
+namespace gem5
+{
+namespace enums {
+enum MemSched
+{
+        fcfs = 0,
+        frfcfs = 1,
+        Num_MemSched = 2
+    };
+    extern const char *MemSchedStrings[Num_MemSched];
+}; // enums
+
+} // namespace gem5
+
+#endif // __ENUM__enums__MemSched__
@@ -0,0 +1,26 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_hh.py:123
+ */
+
+#ifndef __ENUM__enums__MemoryMode__
+#define __ENUM__enums__MemoryMode__
+
+namespace gem5
+{
+namespace enums {
+enum MemoryMode
+{
+        invalid = 0,
+        atomic = 1,
+        timing = 2,
+        atomic_noncaching = 3,
+        Num_MemoryMode = 4
+    };
+    extern const char *MemoryModeStrings[Num_MemoryMode];
+}; // enums
+
+} // namespace gem5
+
+#endif // __ENUM__enums__MemoryMode__
@@ -0,0 +1,99 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_hh.py:123
+ */
+
+#ifndef __ENUM__enums__OpClass__
+#define __ENUM__enums__OpClass__
+
+namespace gem5
+{
+namespace enums {
+enum OpClass
+{
+        No_OpClass = 0,
+        IntAlu = 1,
+        IntMult = 2,
+        IntDiv = 3,
+        FloatAdd = 4,
+        FloatCmp = 5,
+        FloatCvt = 6,
+        FloatMult = 7,
+        FloatMultAcc = 8,
+        FloatDiv = 9,
+        FloatMisc = 10,
+        FloatSqrt = 11,
+        SimdAdd = 12,
+        SimdAddAcc = 13,
+        SimdAlu = 14,
+        SimdCmp = 15,
+        SimdCvt = 16,
+        SimdMisc = 17,
+        SimdMult = 18,
+        SimdMultAcc = 19,
+        SimdMatMultAcc = 20,
+        SimdShift = 21,
+        SimdShiftAcc = 22,
+        SimdDiv = 23,
+        SimdSqrt = 24,
+        SimdFloatAdd = 25,
+        SimdFloatAlu = 26,
+        SimdFloatCmp = 27,
+        SimdFloatCvt = 28,
+        SimdFloatDiv = 29,
+        SimdFloatMisc = 30,
+        SimdFloatMult = 31,
+        SimdFloatMultAcc = 32,
+        SimdFloatMatMultAcc = 33,
+        SimdFloatSqrt = 34,
+        SimdReduceAdd = 35,
+        SimdReduceAlu = 36,
+        SimdReduceCmp = 37,
+        SimdFloatReduceAdd = 38,
+        SimdFloatReduceCmp = 39,
+        SimdAes = 40,
+        SimdAesMix = 41,
+        SimdSha1Hash = 42,
+        SimdSha1Hash2 = 43,
+        SimdSha256Hash = 44,
+        SimdSha256Hash2 = 45,
+        SimdShaSigma2 = 46,
+        SimdShaSigma3 = 47,
+        SimdPredAlu = 48,
+        Matrix = 49,
+        MatrixMov = 50,
+        MatrixOP = 51,
+        MemRead = 52,
+        MemWrite = 53,
+        FloatMemRead = 54,
+        FloatMemWrite = 55,
+        IprAccess = 56,
+        InstPrefetch = 57,
+        VectorUnitStrideLoad = 58,
+        VectorUnitStrideStore = 59,
+        VectorUnitStrideMaskLoad = 60,
+        VectorUnitStrideMaskStore = 61,
+        VectorStridedLoad = 62,
+        VectorStridedStore = 63,
+        VectorIndexedLoad = 64,
+        VectorIndexedStore = 65,
+        VectorUnitStrideFaultOnlyFirstLoad = 66,
+        VectorWholeRegisterLoad = 67,
+        VectorWholeRegisterStore = 68,
+        VectorIntegerArith = 69,
+        VectorFloatArith = 70,
+        VectorFloatConvert = 71,
+        VectorIntegerReduce = 72,
+        VectorFloatReduce = 73,
+        VectorMisc = 74,
+        VectorIntegerExtension = 75,
+        VectorConfig = 76,
+        Num_OpClass = 77
+    };
+    extern const char *OpClassStrings[Num_OpClass];
+}; // enums
+
+} // namespace gem5
+
+#endif // __ENUM__enums__OpClass__
@@ -0,0 +1,49 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_cc.py:167
+ */
+
+#include "base/compiler.hh"
+#include "enums/PMType.hh"
+
+namespace gem5
+{
+
+namespace enums
+{
+    const char *PMTypeStrings[Num_PMType] =
+    {
+        "All",
+        "Static",
+        "Dynamic",
+    };
+} // namespace enums
+} // namespace gem5
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <sim/init.hh>
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+    py::module_ m = m_internal.def_submodule("enum_PMType");
+
+py::enum_<enums::PMType>(m, "enum_PMType")
+        .value("All", enums::All)
+        .value("Static", enums::Static)
+        .value("Dynamic", enums::Dynamic)
+        .value("Num_PMType", enums::Num_PMType)
+        .export_values()
+        ;
+    }
+static EmbeddedPyBind embed_enum("enum_PMType", module_init);
+
+} // namespace gem5
+    
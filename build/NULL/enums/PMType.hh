@@ -0,0 +1,25 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_hh.py:123
+ */
+
+#ifndef __ENUM__enums__PMType__
+#define __ENUM__enums__PMType__
+
+namespace gem5
+{
+namespace enums {
+enum PMType
+{
+        All = 0,
+        Static = 1,
+        Dynamic = 2,
+        Num_PMType = 3
+    };
+    extern const char *PMTypeStrings[Num_PMType];
+}; // enums
+
+} // namespace gem5
+
+#endif // __ENUM__enums__PMType__
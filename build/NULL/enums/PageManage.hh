@@ -0,0 +1,26 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_hh.py:123
+ */
+
+#ifndef __ENUM__enums__PageManage__
+#define __ENUM__enums__PageManage__
+
+namespace gem5
+{
+namespace enums {
+enum PageManage
+{
+        open = 0,
+        open_adaptive = 1,
+        close = 2,
+        close_adaptive = 3,
+        Num_PageManage = 4
+    };
+    extern const char *PageManageStrings[Num_PageManage];
+}; // enums
+
+} // namespace gem5
+
+#endif // __ENUM__enums__PageManage__
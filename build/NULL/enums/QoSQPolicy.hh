@@ -0,0 +1,25 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_hh.py:123
+ */
+
+#ifndef __ENUM__enums__QoSQPolicy__
+#define __ENUM__enums__QoSQPolicy__
+
+namespace gem5
+{
+namespace enums {
+enum QoSQPolicy
+{
+        fifo = 0,
+        lifo = 1,
+        lrg = 2,
+        Num_QoSQPolicy = 3
+    };
+    extern const char *QoSQPolicyStrings[Num_QoSQPolicy];
+}; // enums
+
+} // namespace gem5
+
+#endif // __ENUM__enums__QoSQPolicy__
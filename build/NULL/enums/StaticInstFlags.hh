@@ -0,0 +1,60 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_hh.py:123
+ */
+
+#ifndef __ENUM__StaticInstFlags__Flags__
+#define __ENUM__StaticInstFlags__Flags__
+
+namespace gem5
+{
+struct StaticInstFlags {
+enum Flags
+{
+        IsNop = 0,
+        IsInteger = 1,
+        IsFloating = 2,
+        IsVector = 3,
+        IsVectorElem = 4,
+        IsMatrix = 5,
+        IsLoad = 6,
+        IsStore = 7,
+        IsAtomic = 8,
+        IsStoreConditional = 9,
+        IsInstPrefetch = 10,
+        IsDataPrefetch = 11,
+        IsControl = 12,
+        IsDirectControl = 13,
+        IsIndirectControl = 14,
+        IsCondControl = 15,
+        IsUncondControl = 16,
+        IsCall = 17,
+        IsReturn = 18,
+        IsSerializing = 19,
+        IsSerializeBefore = 20,
+        IsSerializeAfter = 21,
+        IsWriteBarrier = 22,
+        IsReadBarrier = 23,
+        IsNonSpeculative = 24,
+        IsQuiesce = 25,
+        IsUnverifiable = 26,
+        IsPseudo = 27,
+        IsSyscall = 28,
+        IsMacroop = 29,
+        IsMicroop = 30,
+        IsDelayedCommit = 31,
+        IsLastMicroop = 32,
+        IsFirstMicroop = 33,
+        IsSquashAfter = 34,
+        IsHtmStart = 35,
+        IsHtmStop = 36,
+        IsHtmCancel = 37,
+        Num_Flags = 38
+    };
+    static const char *FlagsStrings[Num_Flags];
+}; // StaticInstFlags
+
+} // namespace gem5
+
+#endif // __ENUM__StaticInstFlags__Flags__
@@ -0,0 +1,24 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_hh.py:123
+ */
+
+#ifndef __ENUM__None__TerminalDump__
+#define __ENUM__None__TerminalDump__
+
+namespace gem5
+{
+enum class TerminalDump
+{
+    none = 0,
+    stdoutput = 1,
+    stderror = 2,
+    file = 3,
+    Num_TerminalDump = 4
+};
+extern const char *TerminalDumpStrings[static_cast<int>(TerminalDump::Num_TerminalDump)];
+
+} // namespace gem5
+
+#endif // __ENUM__None__TerminalDump__
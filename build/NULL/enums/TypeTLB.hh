@@ -0,0 +1,23 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/enum_hh.py:123
+ */
+
+#ifndef __ENUM__None__TypeTLB__
+#define __ENUM__None__TypeTLB__
+
+namespace gem5
+{
+enum class TypeTLB
+{
+    data = 2,
+    instruction = 1,
+    unified = 3,
+    Num_TypeTLB = 3
+};
+extern const char *TypeTLBStrings[static_cast<int>(TypeTLB::Num_TypeTLB)];
+
+} // namespace gem5
+
+#endif // __ENUM__None__TypeTLB__
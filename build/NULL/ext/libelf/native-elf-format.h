@@ -0,0 +1,4 @@
+/* Generated by native-elf-format on Sun Oct 18 05:19:37 UTC 2026 */
+#define	ELFTC_CLASS	ELFCLASS64
+#define	ELFTC_ARCH	EM_X86_64
+#define	ELFTC_BYTEORDER	ELFDATA2LSB
@@ -0,0 +1,9 @@
+
+
+#include "H5Cpp.h"
+
+int
+main() {
+  H5::H5File("", 0);
+return 0;
+}
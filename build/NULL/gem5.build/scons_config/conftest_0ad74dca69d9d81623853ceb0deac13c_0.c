@@ -0,0 +1,9 @@
+
+
+#include "hdf5.h"
+
+int
+main() {
+  H5Fcreate("", 0, 0, 0);
+return 0;
+}
@@ -0,0 +1,9 @@
+
+
+#include "zlib.h"
+
+int
+main() {
+  zlibVersion();
+return 0;
+}
@@ -0,0 +1,3 @@
+
+#include <capstone/capstone.h>
+
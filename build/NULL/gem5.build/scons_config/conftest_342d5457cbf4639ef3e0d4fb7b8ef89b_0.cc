@@ -0,0 +1 @@
+// CheckCxxFlag DO NOTHING
\ No newline at end of file
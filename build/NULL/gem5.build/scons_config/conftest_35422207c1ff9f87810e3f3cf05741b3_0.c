@@ -0,0 +1,9 @@
+
+int main(void)
+{
+#ifndef __i386__
+    (void) __i386__;
+#endif
+    ;
+    return 0;
+}
@@ -0,0 +1,3 @@
+
+#include <linux/kvm.h>
+
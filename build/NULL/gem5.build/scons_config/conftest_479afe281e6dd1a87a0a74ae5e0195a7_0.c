@@ -0,0 +1,3 @@
+
+#include <linux/if_tun.h>
+
@@ -0,0 +1,5 @@
+
+            int main() {return 0;}
+            namespace [[gnu::deprecated("Test namespace deprecation")]]
+            test_deprecated_namespace {}
+        
\ No newline at end of file
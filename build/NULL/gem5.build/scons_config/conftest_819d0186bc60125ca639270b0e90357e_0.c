@@ -0,0 +1,9 @@
+
+
+#include "time.h"
+
+int
+main() {
+  clock_nanosleep(0,0,NULL,NULL);
+return 0;
+}
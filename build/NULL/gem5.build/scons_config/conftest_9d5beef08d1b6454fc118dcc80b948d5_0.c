@@ -0,0 +1,9 @@
+
+
+#include "zstd.h"
+
+int
+main() {
+  ZSTD_versionNumber();
+return 0;
+}
@@ -0,0 +1,9 @@
+
+
+#include "sys/socket.h"
+
+int
+main() {
+  accept(0,0,0);
+return 0;
+}
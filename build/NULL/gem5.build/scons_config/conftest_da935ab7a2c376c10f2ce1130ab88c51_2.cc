@@ -0,0 +1 @@
+int main(int, char *[]) { return 0; }
\ No newline at end of file
@@ -0,0 +1,3 @@
+
+#include "valgrind/valgrind.h"
+
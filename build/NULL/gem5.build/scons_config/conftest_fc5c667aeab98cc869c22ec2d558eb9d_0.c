@@ -0,0 +1,9 @@
+
+int main(void)
+{
+#ifndef __x86_64__
+    (void) __x86_64__;
+#endif
+    ;
+    return 0;
+}
@@ -0,0 +1,76 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,84,203,110,211,64,20,29,219,137,235,60,218,180,
+    181,146,84,165,18,166,21,136,80,212,7,2,132,74,203,163,
+    66,130,66,27,16,133,77,22,140,156,120,210,24,236,56,140,
+    29,74,178,138,4,31,128,216,84,98,197,170,18,226,103,66,
+    133,212,104,86,72,172,216,165,106,87,93,49,55,174,67,26,
+    194,6,143,125,230,113,207,204,189,115,231,140,127,162,158,39,
+    124,82,31,62,229,176,131,12,100,8,22,122,6,181,104,9,
+    182,152,19,5,36,162,251,200,144,222,35,35,68,196,93,9,
+    161,175,82,48,57,39,117,108,97,110,147,255,178,133,140,161,
+    77,148,81,126,65,39,35,48,225,18,135,200,166,105,63,206,
+    191,36,5,175,208,27,68,40,8,226,83,39,8,130,114,130,
+    129,114,34,255,36,67,224,11,137,185,48,145,63,15,161,1,
+    143,33,237,10,220,173,208,117,171,112,102,100,32,51,100,132,
+    119,69,206,21,187,220,40,231,198,6,114,229,190,85,227,254,
+    102,88,236,1,177,44,199,223,66,125,198,34,58,45,155,229,
+    45,188,69,236,107,243,21,157,122,87,230,75,64,192,78,135,
+    49,87,42,213,199,192,182,180,212,59,111,234,153,105,19,45,
+    79,138,14,37,90,209,164,124,5,205,43,17,141,188,33,101,
+    239,23,56,173,47,100,171,118,158,80,205,41,106,30,39,187,
+    154,231,0,147,252,225,5,243,183,28,199,200,215,72,125,244,
+    110,208,212,124,231,217,204,48,83,48,46,235,54,193,152,69,
+    49,182,29,163,106,65,59,142,241,235,170,110,157,88,66,94,
+    173,66,88,180,240,246,45,46,17,221,32,148,69,160,93,176,
+    116,215,101,225,39,58,213,109,54,180,174,123,164,92,168,177,
+    56,68,131,61,7,111,235,166,199,164,181,178,199,18,229,78,
+    168,216,41,98,136,208,101,195,247,253,56,252,221,178,145,147,
+    176,78,114,242,5,29,66,70,143,47,184,180,48,63,40,129,
+    61,153,154,171,212,168,204,201,29,56,203,63,247,5,135,70,
+    183,180,98,19,141,123,173,177,235,141,135,173,209,153,198,218,
+    15,117,98,103,229,227,74,243,220,237,111,234,157,239,234,157,
+    198,122,43,117,102,199,252,104,182,148,72,51,182,114,32,137,
+    105,249,8,113,104,60,110,43,40,117,102,63,121,113,47,121,
+    177,153,185,249,45,185,252,61,185,220,200,66,161,169,192,225,
+    96,137,210,255,144,168,17,234,19,222,191,69,26,230,210,235,
+    19,169,47,61,170,130,46,206,15,202,216,233,4,131,232,84,
+    95,116,167,15,66,90,124,181,90,159,217,52,235,4,100,149,
+    175,22,139,92,96,29,93,89,150,182,109,122,165,174,150,134,
+    22,23,22,54,86,231,221,250,212,170,94,54,182,77,131,219,
+    2,34,8,208,159,155,205,196,168,2,201,130,157,208,40,0,
+    92,38,26,7,24,6,24,225,192,162,27,196,118,104,13,252,
+    178,152,63,19,187,208,73,248,134,174,11,150,216,166,166,71,
+    112,62,24,160,73,88,164,115,30,105,0,53,128,203,32,133,
+    231,125,82,152,4,41,220,0,41,156,231,82,24,79,239,143,
+    79,239,141,79,183,148,225,102,226,42,63,122,21,142,94,149,
+    27,143,218,50,74,79,237,167,102,247,82,179,45,101,172,169,
+    46,246,234,2,138,239,17,252,100,51,97,22,177,175,205,85,
+    224,18,184,44,206,155,221,31,24,13,5,58,241,227,58,29,
+    235,177,178,236,95,183,91,84,227,93,184,211,238,59,14,109,
+    73,16,132,246,117,36,76,52,81,218,127,91,104,186,121,250,
+    109,203,81,97,165,141,254,134,15,153,3,168,142,254,140,78,
+    70,5,25,90,253,240,97,13,152,242,209,0,83,39,200,223,
+    174,101,134,134,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/learning_gem5/part2/HelloObject.py",
+    "m5.objects.HelloObject",
+    embedded_module_data,
+    820,
+    1540);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,72 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,83,205,79,19,65,20,159,233,199,210,118,233,7,
+    16,149,136,146,21,12,73,137,150,128,129,3,98,15,150,111,
+    162,18,138,30,26,146,205,186,51,210,194,126,148,157,45,161,
+    245,178,7,15,134,11,222,228,224,193,19,137,241,159,217,154,
+    38,54,115,34,241,196,173,6,79,158,156,217,165,181,146,186,
+    59,251,230,205,111,126,111,222,252,222,236,252,0,93,79,248,
+    170,191,204,50,243,17,32,128,160,6,116,88,128,144,251,1,
+    45,176,237,247,193,109,16,0,43,0,5,223,1,20,194,240,
+    44,8,192,215,96,123,145,66,8,133,243,32,45,92,240,65,
+    26,210,120,78,51,213,125,140,94,188,222,195,170,205,0,56,
+    169,118,39,13,181,147,54,188,164,24,20,32,2,133,0,251,
+    130,8,178,197,2,133,112,0,96,1,5,207,32,75,3,59,
+    105,250,24,26,65,161,107,104,20,199,62,139,160,199,131,194,
+    72,56,11,48,110,160,195,237,103,220,120,79,110,31,138,92,
+    227,38,24,55,217,139,139,83,123,3,157,184,232,181,168,65,
+    20,99,165,16,169,152,47,233,101,13,231,20,181,136,107,227,
+    26,86,44,163,100,236,202,187,88,159,157,42,43,150,61,51,
+    69,60,130,172,114,70,166,88,172,13,240,185,249,249,238,56,
+    41,183,249,82,34,37,132,165,178,105,217,15,36,11,171,184,
+    116,136,9,115,14,42,152,216,164,38,61,195,186,105,85,187,
+    73,4,27,232,47,227,130,23,170,54,153,171,170,26,139,179,
+    149,125,108,72,166,33,41,82,177,100,75,166,37,217,38,163,
+    18,83,59,196,12,211,75,132,208,208,244,220,254,211,218,141,
+    237,34,102,171,214,176,100,190,145,108,230,171,254,142,60,184,
+    74,108,172,51,180,68,124,88,98,14,23,197,184,207,211,67,
+    52,34,203,134,162,99,89,166,49,89,214,77,84,209,184,223,
+    47,203,7,21,69,187,154,9,217,213,50,166,49,245,232,72,
+    46,98,5,97,139,70,185,175,106,10,219,194,224,43,246,223,
+    152,214,22,38,101,211,32,120,147,233,162,17,181,92,145,185,
+    76,42,110,249,218,124,88,199,186,15,135,55,21,75,209,169,
+    224,75,165,125,154,98,99,67,173,210,152,95,162,60,211,66,
+    67,92,17,21,242,158,0,42,176,8,108,216,52,168,24,85,
+    42,248,170,190,128,75,126,142,191,39,136,165,78,245,58,182,
+    174,243,201,148,171,150,192,200,158,145,216,71,28,102,156,206,
+    219,20,135,157,197,230,192,156,179,222,76,141,59,107,173,8,
+    72,141,185,201,123,238,216,98,61,185,212,72,46,57,171,205,
+    228,237,247,111,221,145,39,245,100,182,145,204,58,171,231,137,
+    161,19,237,88,59,157,118,71,215,235,137,141,70,98,195,89,
+    57,23,83,223,197,145,111,226,200,233,178,123,255,113,93,92,
+    104,136,11,206,226,121,124,240,100,231,120,231,116,226,211,164,
+    59,177,90,143,175,53,226,107,206,50,127,173,187,237,45,61,
+    79,135,233,176,62,155,49,189,123,72,50,255,92,75,139,95,
+    95,26,101,211,101,94,55,194,42,201,92,203,60,186,210,116,
+    135,27,111,169,81,94,143,200,130,127,144,89,107,140,13,249,
+    79,69,76,102,90,65,8,97,107,14,192,71,46,152,233,110,
+    77,112,203,109,183,38,184,233,182,91,75,72,192,117,216,2,
+    189,237,135,135,63,189,254,215,127,230,189,13,253,1,38,239,
+    79,247,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/learning_gem5/part2/SimpleCache.py",
+    "m5.objects.SimpleCache",
+    embedded_module_data,
+    754,
+    1217);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,56 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,82,65,107,19,65,20,158,217,221,164,217,36,144,
+    88,133,106,85,92,164,32,17,73,64,104,197,98,211,130,130,
+    86,104,45,173,30,92,10,195,118,231,209,108,217,221,108,103,
+    54,210,196,203,30,122,240,216,91,255,65,65,252,51,41,244,
+    176,236,73,240,228,45,18,79,158,156,217,109,98,90,179,51,
+    251,189,55,243,190,55,223,123,179,251,3,77,60,185,75,59,
+    92,18,112,138,40,162,216,69,239,165,85,92,236,41,166,130,
+    145,130,94,35,170,30,35,170,129,114,166,34,244,77,29,37,
+    155,42,205,237,160,90,254,167,92,212,112,130,31,11,208,119,
+    28,239,221,222,1,216,161,61,41,52,74,26,238,166,66,128,
+    76,76,145,169,80,121,8,54,53,170,152,57,5,65,158,170,
+    103,88,72,224,177,196,204,212,221,130,216,213,169,118,109,183,
+    152,149,147,148,69,9,129,11,27,224,181,247,14,122,11,46,
+    88,204,119,252,125,178,15,222,98,35,176,88,248,180,193,83,
+    6,241,82,74,189,213,234,205,202,224,242,242,149,76,227,229,
+    214,7,131,59,20,140,160,205,194,39,6,3,27,156,79,192,
+    133,115,216,1,30,242,158,33,153,172,59,73,226,224,211,127,
+    140,205,90,41,41,16,226,91,30,16,146,20,9,241,218,180,
+    227,74,191,76,200,97,199,114,47,35,90,216,13,32,41,218,
+    71,71,164,5,22,5,150,232,210,183,93,139,243,164,188,13,
+    60,104,251,28,182,132,66,162,59,62,15,73,144,186,212,10,
+    173,204,45,109,103,138,41,165,32,250,34,178,166,175,104,40,
+    111,230,207,35,206,236,198,180,123,152,236,183,30,116,89,94,
+    176,83,120,32,94,190,33,32,26,143,184,116,39,122,21,223,
+    120,22,189,141,171,11,209,250,247,234,189,147,114,255,254,234,
+    121,117,237,162,186,22,173,199,215,215,149,249,47,159,251,119,
+    87,206,43,205,139,74,51,122,35,7,187,57,58,127,179,166,
+    37,186,183,88,23,101,88,158,104,81,184,227,31,135,105,35,
+    22,155,149,144,38,221,146,125,20,94,100,247,215,100,115,98,
+    41,191,60,255,40,96,160,98,140,7,75,8,223,238,163,185,
+    108,198,232,97,255,234,28,228,103,240,234,0,253,15,39,207,
+    127,73,243,123,74,40,149,254,11,13,84,226,93,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/learning_gem5/part2/SimpleMemobj.py",
+    "m5.objects.SimpleMemobj",
+    embedded_module_data,
+    509,
+    817);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,47 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,80,191,79,194,64,20,126,215,150,6,16,127,177,
+    248,35,49,38,6,99,112,128,196,4,140,196,56,153,24,29,
+    112,192,197,46,151,218,187,0,166,133,114,133,4,152,58,248,
+    7,184,249,31,152,24,255,25,198,230,86,39,183,26,156,156,
+    188,43,148,212,72,239,250,189,119,121,223,251,190,119,247,1,
+    137,47,53,143,211,170,128,23,32,64,144,13,119,50,42,54,
+    114,20,67,65,160,192,21,16,245,9,136,70,149,87,21,224,
+    93,141,155,13,149,164,26,80,212,63,229,161,136,56,58,22,
+    144,105,180,157,219,135,71,106,245,173,164,17,138,141,118,35,
+    35,10,6,34,96,40,68,138,32,67,35,138,145,34,170,16,
+    211,120,78,8,184,54,157,105,140,11,54,53,89,167,221,105,
+    226,38,117,42,101,215,100,253,147,178,23,49,112,55,162,148,
+    90,173,113,94,22,107,181,100,103,189,168,243,52,198,29,211,
+    161,24,243,44,198,78,151,12,108,153,231,48,238,13,76,123,
+    94,209,250,35,151,242,172,53,28,226,22,53,9,101,60,35,
+    115,203,54,61,239,13,166,114,230,159,35,143,89,229,101,131,
+    36,13,75,238,136,233,130,29,193,190,248,189,61,1,254,98,
+    5,43,59,254,101,176,121,234,223,4,27,5,255,90,46,182,
+    22,243,235,226,226,25,167,82,18,178,166,227,241,156,72,23,
+    239,200,180,152,197,86,37,68,77,235,114,174,244,249,236,82,
+    23,44,63,127,98,239,94,64,168,34,132,194,42,160,237,9,
+    108,205,118,0,7,147,191,59,212,85,116,24,194,127,120,62,
+    251,146,225,123,73,41,178,254,5,85,130,148,249,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/learning_gem5/part2/SimpleObject.py",
+    "m5.objects.SimpleObject",
+    embedded_module_data,
+    365,
+    576);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,80 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,84,205,79,27,71,20,159,245,199,226,111,140,137,
+    74,26,64,157,42,202,135,157,202,81,210,166,170,220,42,148,
+    20,154,96,11,168,0,245,96,169,90,13,158,193,94,178,187,
+    227,206,142,67,188,167,61,244,196,133,136,11,168,151,230,20,
+    169,234,31,210,235,90,242,193,154,107,79,189,57,74,78,61,
+    117,102,141,35,176,8,251,241,118,102,222,239,189,223,123,191,
+    89,205,63,224,220,21,63,251,190,251,90,154,19,128,1,214,
+    44,96,107,117,77,83,227,136,21,217,1,17,240,20,224,232,
+    111,0,199,136,246,38,10,192,95,209,113,112,61,138,227,219,
+    160,168,255,171,38,69,77,100,127,176,104,227,57,193,155,187,
+    251,164,193,229,130,86,106,156,39,139,141,201,182,52,69,70,
+    64,93,195,160,30,193,42,145,86,143,225,72,61,142,163,117,
+    157,76,189,78,128,75,46,28,195,241,55,17,89,64,228,67,
+    1,73,137,77,93,138,213,241,212,4,54,253,81,172,134,19,
+    19,216,204,21,216,228,4,54,123,5,54,53,129,205,73,236,
+    244,165,216,52,206,76,96,243,87,228,205,78,96,103,112,78,
+    110,196,180,200,45,239,186,156,161,6,95,39,54,101,221,29,
+    111,214,38,246,125,116,182,104,200,73,185,213,242,22,154,196,
+    126,84,169,216,33,166,82,185,24,35,244,7,15,191,89,55,
+    159,120,119,150,49,102,196,117,33,67,78,147,192,187,109,202,
+    137,195,77,100,89,93,104,58,156,48,139,160,23,4,23,127,
+    244,110,173,80,232,80,14,93,78,25,129,24,113,244,5,68,
+    214,1,234,202,88,194,59,204,129,30,97,212,187,53,34,128,
+    109,196,56,164,123,144,183,8,108,90,116,23,89,16,157,81,
+    217,168,237,221,221,110,209,142,133,97,237,231,117,53,151,48,
+    83,58,70,161,123,148,141,194,58,196,229,222,226,22,105,83,
+    153,139,83,216,160,206,158,217,236,48,196,77,234,64,142,118,
+    45,34,128,247,96,205,70,178,116,233,183,40,194,170,106,58,
+    206,132,92,104,114,249,58,166,106,73,197,171,238,92,111,126,
+    217,178,232,1,60,96,38,39,174,138,60,71,191,81,44,136,
+    132,97,56,200,38,134,33,82,134,97,83,220,177,212,56,99,
+    24,191,118,144,117,230,137,241,110,155,136,196,88,118,145,106,
+    188,124,105,180,8,194,132,137,164,26,55,44,228,186,34,254,
+    19,98,200,22,73,165,243,150,210,88,196,67,169,69,236,9,
+    165,150,136,57,29,203,18,105,211,49,148,58,134,148,66,76,
+    61,127,97,135,131,89,213,175,17,182,105,176,80,4,130,133,
+    190,205,153,233,52,69,202,84,93,27,123,166,212,32,25,54,
+    162,112,127,130,119,234,87,249,239,83,151,53,238,171,191,226,
+    226,182,151,219,93,166,75,127,104,238,201,215,253,91,26,255,
+    195,61,72,207,251,43,131,233,89,255,217,96,230,182,95,29,
+    228,203,254,218,48,1,178,133,163,205,195,205,65,34,31,20,
+    190,125,27,141,100,245,247,64,26,127,117,168,131,204,204,81,
+    229,176,242,138,4,139,43,189,244,106,63,189,234,175,12,83,
+    96,246,250,73,233,184,116,186,19,220,172,246,10,181,126,161,
+    230,215,134,25,48,125,237,104,255,112,255,244,90,240,217,90,
+    47,87,237,231,170,254,83,137,157,135,127,148,126,47,189,222,
+    9,238,85,123,55,106,253,27,181,32,54,39,57,11,115,39,
+    11,199,11,131,68,42,200,44,73,206,130,226,44,232,126,85,
+    186,102,62,57,73,29,167,78,191,10,62,127,220,203,47,245,
+    243,75,254,154,186,217,194,184,179,141,98,76,92,183,31,149,
+    105,120,68,185,229,11,39,22,83,39,155,72,74,119,91,237,
+    140,59,18,100,94,153,48,193,162,210,47,241,221,104,215,31,
+    51,40,167,154,82,10,75,51,140,106,154,54,220,208,128,246,
+    101,0,30,158,127,6,96,46,24,63,67,253,166,246,189,54,
+    4,151,219,87,191,188,13,191,239,63,226,15,171,248,31,39,
+    226,134,90,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/AbstractMemory.py",
+    "m5.objects.AbstractMemory",
+    embedded_module_data,
+    883,
+    1471);
+
+} // anonymous namespace
+} // namespace gem5
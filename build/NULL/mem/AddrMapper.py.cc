@@ -0,0 +1,76 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,84,57,111,212,64,20,30,219,187,142,247,134,160,
+    205,2,2,201,68,10,176,32,37,8,68,1,66,65,72,220,
+    71,2,73,68,177,141,119,226,25,178,139,124,49,227,5,178,
+    149,139,20,148,233,104,169,34,33,254,76,68,195,106,90,42,
+    186,141,146,42,21,111,236,120,175,36,62,190,153,121,223,155,
+    247,62,207,188,241,95,52,114,101,143,218,253,21,128,239,136,
+    32,162,56,104,77,182,170,163,184,106,67,85,144,138,158,33,
+    162,109,33,146,161,234,142,134,208,47,45,157,220,208,98,46,
+    11,156,78,181,9,46,67,166,86,81,221,248,39,7,117,69,
+    40,55,0,114,171,109,119,121,253,35,181,67,123,84,68,38,
+    21,209,141,69,80,212,80,8,106,168,240,106,68,129,64,106,
+    35,75,180,134,174,34,58,69,50,59,10,164,81,6,105,12,
+    176,230,168,65,178,59,42,216,213,129,61,15,246,2,209,39,
+    188,139,177,119,145,76,77,120,151,136,1,98,115,34,255,136,
+    16,246,6,7,1,101,135,211,46,117,23,48,140,45,55,54,
+    204,183,90,221,51,27,212,189,123,255,254,208,107,173,187,176,
+    214,106,115,51,240,89,104,114,234,17,110,50,250,169,67,121,
+    200,77,236,17,24,216,180,253,153,74,43,15,124,143,83,222,
+    189,218,116,49,15,41,107,154,48,207,243,191,152,54,118,28,
+    74,204,38,228,179,120,155,80,75,6,107,142,6,30,137,50,
+    18,59,77,151,6,158,107,114,7,127,166,199,226,218,65,103,
+    36,238,82,189,44,12,203,242,176,75,45,75,228,45,203,245,
+    73,199,145,253,162,101,125,234,96,231,136,201,132,155,1,21,
+    121,251,235,87,171,69,49,161,76,228,100,223,118,48,231,194,
+    192,235,60,100,216,14,69,97,37,145,244,22,98,139,210,216,
+    39,136,202,99,26,128,116,28,82,242,22,51,236,10,61,249,
+    114,81,92,57,18,157,204,26,19,40,178,241,87,252,68,251,
+    114,103,14,171,156,217,11,114,39,134,107,62,31,108,50,29,
+    184,24,230,225,229,17,64,52,184,123,133,90,244,184,119,118,
+    46,122,217,59,51,27,189,232,85,206,69,207,251,58,170,154,
+    219,175,122,198,189,61,77,173,234,7,8,32,122,3,214,242,
+    229,111,86,207,168,238,214,30,2,81,150,68,89,143,158,74,
+    247,43,219,175,143,187,151,46,125,91,142,221,23,129,40,73,
+    162,164,71,79,228,205,106,169,164,177,218,78,15,196,190,119,
+    106,109,83,253,199,20,58,225,34,218,100,173,159,234,57,121,
+    42,114,36,11,245,172,139,202,10,246,54,232,112,233,152,156,
+    222,173,38,85,60,193,117,175,199,6,110,250,31,76,88,112,
+    159,109,154,97,11,67,85,183,252,142,67,192,4,165,22,159,
+    4,210,173,159,236,137,25,53,215,105,219,219,48,19,63,51,
+    244,151,234,121,102,200,133,201,73,200,75,40,72,40,74,40,
+    1,136,194,123,248,29,248,44,41,144,156,148,19,7,23,21,
+    159,181,55,218,30,118,44,22,39,19,149,52,253,145,129,205,
+    200,24,241,170,159,151,112,49,133,167,178,36,222,77,148,196,
+    165,65,73,92,139,94,244,203,168,54,251,103,230,230,239,153,
+    155,61,227,54,236,100,77,238,100,77,143,150,97,139,135,204,
+    157,81,70,222,73,54,153,99,169,158,21,57,247,238,124,32,
+    101,115,81,132,238,224,223,198,50,105,37,36,154,198,117,30,
+    26,15,146,19,183,200,174,192,80,238,25,223,2,232,107,138,
+    162,244,159,43,72,57,191,139,106,201,211,67,179,187,227,79,
+    127,122,90,209,251,232,56,108,95,216,147,205,193,208,122,171,
+    34,123,199,97,251,227,158,108,14,78,160,98,149,255,1,107,
+    229,157,131,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/AddrMapper.py",
+    "m5.objects.AddrMapper",
+    embedded_module_data,
+    819,
+    1568);
+
+} // anonymous namespace
+} // namespace gem5
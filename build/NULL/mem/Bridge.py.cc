@@ -0,0 +1,79 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,84,207,111,19,71,20,158,89,219,155,117,236,117,
+    28,192,4,161,254,216,164,74,85,183,82,82,81,129,84,212,
+    6,218,38,164,180,36,160,52,237,193,82,181,94,239,188,216,
+    166,251,195,236,172,41,246,1,237,129,67,196,5,212,11,57,
+    114,138,84,241,207,56,85,164,174,230,84,137,19,55,35,56,
+    245,212,55,94,59,56,78,212,221,245,219,55,239,125,239,123,
+    51,223,142,231,37,25,187,50,195,247,155,43,104,158,17,70,
+    24,117,136,75,43,148,74,95,113,148,109,162,144,117,194,82,
+    143,8,75,3,221,79,17,242,34,53,42,174,164,88,230,39,
+    82,86,95,201,65,153,10,253,59,199,183,127,3,118,187,118,
+    23,236,16,3,244,83,123,188,89,122,212,236,19,42,155,1,
+    169,80,70,42,10,147,68,180,146,102,74,37,163,16,80,89,
+    106,31,243,47,232,81,155,41,140,106,48,197,210,251,10,198,
+    149,163,120,22,227,211,44,51,129,206,13,208,57,166,78,160,
+    243,160,63,47,144,83,46,54,197,180,9,236,204,255,96,179,
+    19,216,34,98,103,79,197,78,179,220,4,246,12,156,125,126,
+    238,52,44,148,234,148,229,39,208,231,153,142,242,22,132,250,
+    109,208,100,117,232,234,46,184,203,181,129,191,212,104,116,243,
+    117,112,47,95,189,58,76,46,111,55,154,220,104,249,65,104,
+    112,240,24,55,2,184,215,6,30,114,195,242,24,14,108,104,
+    222,7,25,229,45,223,227,192,187,31,87,93,139,135,16,84,
+    13,172,243,252,223,13,219,114,28,96,70,21,187,152,188,201,
+    192,148,100,213,113,226,49,150,49,238,81,187,17,241,98,149,
+    59,214,125,56,193,107,183,218,99,188,175,138,184,196,174,177,
+    221,0,195,107,187,53,8,12,127,231,29,111,232,27,181,246,
+    206,14,4,221,249,73,196,176,205,59,136,72,125,238,241,238,
+    69,137,115,172,16,60,187,35,129,161,156,117,34,86,183,252,
+    13,99,88,136,147,180,188,122,82,218,178,112,24,54,2,191,
+    93,111,224,27,134,208,205,242,156,208,76,211,179,92,48,77,
+    49,109,154,174,207,218,142,244,243,166,121,175,109,57,195,76,
+    58,236,180,64,76,219,15,30,152,13,176,24,78,34,43,125,
+    219,65,90,145,219,74,150,113,7,215,41,244,99,114,138,153,
+    85,104,161,140,56,79,118,199,10,44,87,168,201,87,16,249,
+    173,225,202,146,170,99,98,137,204,64,81,145,73,74,180,159,
+    61,222,172,123,192,132,134,130,33,172,11,34,43,133,73,220,
+    169,91,137,10,34,195,192,177,58,34,247,11,254,27,253,32,
+    169,205,74,41,182,164,12,232,58,206,6,184,126,208,17,106,
+    34,204,159,228,141,220,120,255,206,242,192,94,150,155,45,217,
+    91,75,173,78,160,98,124,96,62,195,31,63,68,19,29,221,
+    113,238,108,180,26,207,26,209,15,113,241,131,232,230,63,231,
+    62,124,250,99,172,125,249,58,165,148,212,183,4,77,180,209,
+    87,73,225,253,93,51,214,74,189,185,107,152,40,200,68,65,
+    141,110,96,162,52,255,244,214,73,184,254,222,238,237,1,124,
+    5,19,186,76,232,106,180,214,215,72,177,244,228,225,227,135,
+    123,181,222,194,234,193,204,218,225,204,90,244,125,92,44,61,
+    43,252,81,216,11,122,31,221,56,40,174,31,22,215,163,155,
+    113,126,246,201,198,227,141,189,197,222,252,215,7,249,149,195,
+    252,74,180,22,235,23,254,214,23,254,210,23,226,236,153,221,
+    92,175,116,125,124,38,242,14,230,71,203,220,44,167,197,5,
+    247,242,146,63,56,203,248,210,177,163,45,144,71,160,200,98,
+    186,37,69,229,137,58,134,52,3,130,5,41,162,246,85,178,
+    119,86,130,69,28,202,243,137,87,208,244,83,148,210,254,38,
+    37,244,139,30,185,52,254,196,100,174,55,122,250,234,28,85,
+    251,228,164,217,253,245,181,124,189,61,37,53,232,253,31,91,
+    164,161,244,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/Bridge.py",
+    "m5.objects.Bridge",
+    embedded_module_data,
+    867,
+    1502);
+
+} // anonymous namespace
+} // namespace gem5
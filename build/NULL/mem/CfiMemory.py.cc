@@ -0,0 +1,80 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,148,203,111,219,54,24,192,73,201,15,249,17,91,
+    118,188,6,195,122,144,135,118,173,135,214,89,31,233,134,32,
+    29,80,55,77,230,110,53,178,182,195,0,95,4,89,164,23,
+    45,122,184,148,146,214,66,15,58,236,48,20,3,58,228,18,
+    31,115,10,48,244,175,216,127,96,15,6,102,240,20,96,167,
+    222,92,180,167,157,70,42,150,151,25,78,39,137,31,63,241,
+    251,241,195,247,32,248,23,56,245,196,39,243,219,13,38,14,
+    0,2,8,154,192,130,77,8,185,46,152,194,99,62,139,166,
+    104,197,154,49,43,222,140,67,32,128,77,128,98,63,1,20,
+    199,240,72,4,224,149,24,57,107,38,80,226,17,168,36,95,
+    243,159,10,164,185,59,45,215,35,154,238,61,192,150,67,186,
+    108,5,126,90,17,104,114,3,121,13,7,97,42,51,101,139,
+    56,29,76,188,238,247,14,65,174,126,58,180,88,20,26,130,
+    60,52,12,154,16,129,166,192,134,136,96,51,134,132,102,92,
+    0,56,129,196,35,102,127,5,167,65,36,177,116,152,2,115,
+    30,20,67,241,35,129,177,194,148,77,159,201,38,80,114,134,
+    205,48,54,59,151,149,80,106,134,93,96,108,110,46,155,70,
+    153,25,54,255,30,54,59,195,202,140,45,204,101,23,80,110,
+    134,45,158,233,55,143,228,25,118,17,21,88,227,138,52,117,
+    183,109,156,52,203,207,89,216,90,214,219,134,202,230,234,246,
+    182,191,244,3,182,86,86,87,173,208,186,186,250,47,184,240,
+    16,187,29,199,118,177,210,113,136,71,99,55,62,179,93,255,
+    163,135,248,201,46,118,61,197,115,20,18,217,77,205,195,182,
+    222,165,34,39,46,188,135,80,246,52,98,104,182,142,125,233,
+    218,245,234,23,155,181,101,215,47,223,117,172,150,97,99,196,
+    104,13,41,154,141,148,167,196,240,176,210,98,234,83,3,121,
+    219,132,231,227,167,246,176,141,28,162,212,215,253,20,194,123,
+    134,142,153,106,0,0,129,191,88,51,29,125,71,113,13,31,
+    43,134,173,180,186,30,118,95,243,99,230,151,67,7,211,69,
+    197,105,43,109,83,115,249,138,135,73,91,211,113,163,82,162,
+    146,170,218,154,133,85,149,166,85,213,114,208,174,201,245,172,
+    170,62,217,213,204,137,37,230,117,59,152,166,245,103,207,212,
+    109,22,39,38,52,197,117,157,121,115,105,54,42,213,86,88,
+    169,176,94,241,45,141,104,22,77,126,51,41,78,50,170,82,
+    102,162,168,172,24,52,127,82,236,90,148,43,77,77,211,166,
+    137,239,234,182,119,237,22,157,100,174,26,136,78,50,231,106,
+    104,189,113,157,74,45,115,71,229,169,211,52,219,186,163,134,
+    123,127,3,111,121,255,255,46,185,68,95,230,13,159,182,181,
+    218,233,18,137,153,66,177,204,134,251,59,19,193,244,29,101,
+    206,5,235,163,66,57,184,63,146,43,65,253,56,179,244,243,
+    90,47,63,200,92,30,102,46,7,235,199,185,197,151,214,11,
+    171,183,209,191,112,103,144,171,13,115,181,96,115,84,92,58,
+    184,186,127,245,48,222,191,244,96,80,108,12,139,141,224,235,
+    113,2,20,206,253,41,95,252,67,190,56,146,138,253,210,231,
+    111,68,161,144,120,7,152,8,234,99,137,25,15,178,251,217,
+    222,183,135,153,129,124,101,40,95,9,234,35,249,131,217,165,
+    227,124,233,229,243,23,207,123,245,254,165,181,65,254,246,48,
+    127,59,248,234,152,237,60,191,127,190,167,245,203,235,131,194,
+    189,97,225,94,112,159,191,164,28,229,212,168,36,233,135,214,
+    74,213,105,253,136,117,207,173,254,247,174,34,252,82,163,41,
+    102,239,240,246,184,180,192,212,93,207,48,171,109,86,54,108,
+    178,59,139,240,187,147,36,34,127,68,225,34,116,255,49,47,
+    169,180,118,114,66,190,36,159,0,126,250,88,5,127,97,98,
+    44,66,8,199,13,8,224,74,31,220,60,253,141,192,82,63,
+    250,198,130,8,133,49,248,127,145,45,193,13,56,6,243,229,
+    175,185,55,225,252,238,12,123,24,237,63,187,166,146,197,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/CfiMemory.py",
+    "m5.objects.CfiMemory",
+    embedded_module_data,
+    895,
+    1551);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,120 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,150,223,79,219,86,20,199,237,252,34,132,36,252,
+    76,72,66,146,154,223,13,90,41,221,198,180,85,19,83,91,
+    202,143,132,66,85,216,75,84,213,152,220,91,48,141,237,212,
+    118,90,200,3,202,195,30,170,106,82,43,94,168,208,164,162,
+    62,180,155,246,207,56,82,30,34,63,77,218,211,222,168,218,
+    167,61,237,92,27,7,99,210,44,177,175,175,207,249,156,175,
+    143,175,207,189,246,223,148,237,231,61,59,126,202,66,115,68,
+    33,10,209,69,74,160,243,52,77,250,174,162,107,195,60,186,
+    141,163,187,232,17,188,121,47,77,185,168,69,10,121,126,161,
+    144,23,123,223,187,41,234,79,183,37,152,247,33,223,58,149,
+    233,248,135,156,100,104,221,183,190,175,168,88,128,30,61,5,
+    77,231,58,47,172,109,237,226,130,90,176,167,225,177,210,120,
+    227,38,105,96,42,79,35,42,239,130,221,141,232,188,7,185,
+    242,94,236,59,233,160,90,252,176,127,183,211,234,35,247,123,
+    23,36,227,106,38,19,112,81,184,11,121,222,211,96,165,155,
+    214,32,88,67,56,136,188,14,58,12,246,110,228,115,208,61,
+    6,221,131,58,28,116,47,100,212,215,42,35,228,71,157,14,
+    182,31,216,129,150,108,0,117,57,216,8,176,209,150,108,16,
+    133,28,236,96,27,221,176,131,141,181,209,237,118,176,241,54,
+    186,61,14,54,209,70,183,215,193,14,181,209,237,115,176,73,
+    96,83,45,217,126,52,224,96,211,109,114,136,56,216,43,109,
+    114,136,58,88,166,141,238,160,131,29,110,163,27,115,176,35,
+    109,116,227,14,118,20,216,177,86,44,30,71,9,7,59,209,
+    134,29,114,176,147,95,204,33,137,82,14,246,42,74,195,164,
+    190,162,119,221,145,4,225,158,36,242,170,36,87,250,5,44,
+    92,47,128,129,21,76,203,244,206,78,165,119,27,11,179,55,
+    111,218,185,81,115,9,96,212,29,78,133,6,51,103,56,179,
+    133,139,146,184,173,48,170,52,93,185,190,177,195,43,76,73,
+    146,85,70,193,34,82,24,25,63,45,99,69,85,24,78,68,
+    112,82,192,252,51,76,172,74,73,18,21,172,84,38,54,5,
+    14,100,229,77,6,226,68,233,57,83,224,138,69,140,152,77,
+    200,138,85,120,132,89,34,182,105,23,182,169,216,180,173,203,
+    89,194,227,155,74,145,123,134,47,233,22,74,101,155,174,238,
+    190,33,40,149,228,58,39,148,138,152,41,97,153,151,16,243,
+    24,110,10,174,166,74,219,50,39,40,186,235,235,153,202,240,
+    40,179,197,139,10,195,139,204,86,89,86,84,166,136,197,109,
+    117,199,134,45,84,174,204,243,10,183,5,50,95,32,42,105,
+    155,8,164,252,156,71,23,253,201,166,64,75,239,121,116,145,
+    83,177,88,216,183,123,19,86,108,11,223,208,121,228,242,198,
+    6,131,192,35,243,91,101,149,135,145,210,189,55,102,102,68,
+    80,191,199,237,17,138,145,30,95,134,42,113,75,253,178,43,
+    115,46,46,149,85,69,133,212,121,113,251,252,217,216,242,152,
+    180,84,254,15,156,56,215,84,101,78,84,184,2,185,22,83,
+    144,202,162,106,231,198,44,193,182,84,234,22,66,80,23,10,
+    3,149,246,196,120,184,50,230,16,195,153,214,74,250,146,251,
+    185,204,171,216,242,111,84,82,214,85,206,44,23,7,96,53,
+    147,209,253,44,43,114,2,102,89,61,192,194,44,66,229,34,
+    233,7,89,246,105,153,43,158,121,60,234,126,9,235,129,194,
+    222,30,187,3,151,199,178,222,73,250,133,34,167,192,67,184,
+    207,65,170,50,121,253,234,62,232,99,81,213,221,156,184,175,
+    251,20,99,210,233,93,15,204,97,186,15,69,171,135,46,204,
+    13,189,123,30,151,96,78,192,115,71,134,140,238,51,167,148,
+    30,124,112,54,27,204,168,11,149,175,123,141,233,161,123,239,
+    20,165,194,19,61,164,24,51,128,53,103,128,238,255,89,84,
+    248,109,17,35,189,215,40,102,214,44,102,150,60,21,221,115,
+    91,146,138,122,2,153,163,194,94,0,200,176,43,122,184,89,
+    192,102,196,96,147,109,218,77,48,120,86,173,38,22,177,48,
+    203,106,66,126,94,85,77,160,99,197,116,232,93,196,36,112,
+    123,196,172,247,90,97,196,136,140,144,30,91,133,153,161,113,
+    11,178,123,76,253,30,91,245,56,96,187,199,132,61,164,90,
+    244,14,152,45,70,39,76,74,137,37,133,193,146,242,209,187,
+    141,218,177,25,250,44,41,195,100,100,247,7,245,137,172,198,
+    255,70,21,185,112,157,44,190,182,85,118,186,180,47,147,239,
+    35,163,249,10,118,101,28,150,239,106,243,223,232,138,85,231,
+    27,189,19,213,108,163,103,180,186,252,87,168,239,213,195,151,
+    15,223,76,252,54,165,77,228,106,161,149,122,104,165,186,112,
+    234,163,34,204,235,92,195,255,195,71,183,43,226,251,76,65,
+    83,189,7,214,112,234,5,219,240,71,180,193,159,192,17,38,
+    142,176,207,196,135,95,175,92,198,67,201,23,107,6,62,7,
+    142,16,113,132,124,213,187,167,1,42,146,56,202,29,230,78,
+    188,218,228,221,218,192,66,125,96,1,240,48,21,79,191,13,
+    31,135,27,254,160,22,190,1,1,113,18,16,247,105,158,8,
+    72,141,76,126,72,188,75,52,252,33,173,123,6,124,35,196,
+    55,2,190,52,168,69,135,142,30,29,62,58,153,215,166,178,
+    181,72,174,30,201,85,87,27,233,209,183,187,199,187,191,71,
+    180,153,213,90,122,173,158,94,211,60,67,32,51,16,63,154,
+    59,156,59,25,211,174,46,212,250,23,235,253,139,213,149,70,
+    114,248,109,246,56,123,82,214,166,179,181,100,174,158,204,105,
+    158,248,105,144,234,137,188,58,120,121,240,6,105,99,183,106,
+    221,183,235,221,183,171,75,141,190,193,163,107,135,215,78,58,
+    180,204,98,173,111,169,222,183,84,205,53,98,169,183,129,227,
+    192,201,172,54,117,183,22,91,168,199,22,72,194,126,42,150,
+    58,58,56,60,48,110,134,12,75,140,36,28,131,132,7,32,
+    139,225,137,15,129,119,1,227,102,190,7,223,48,241,13,131,
+    47,5,55,99,139,251,174,77,220,236,197,184,32,25,132,252,
+    97,158,164,182,84,139,44,215,35,203,48,8,96,219,61,220,
+    61,25,36,3,19,205,213,163,185,234,90,3,6,57,113,156,
+    32,131,181,92,139,103,235,241,172,230,137,154,155,252,173,85,
+    55,171,153,14,189,87,152,157,150,140,47,116,101,218,124,113,
+    155,171,75,39,216,75,156,241,94,243,147,174,44,237,237,235,
+    65,232,53,191,232,101,175,165,35,127,67,26,67,118,150,20,
+    172,255,71,115,109,155,147,111,194,41,249,180,86,126,133,230,
+    212,77,211,244,233,18,77,209,227,26,53,102,223,26,212,160,
+    102,109,13,42,170,89,91,131,26,209,46,110,167,129,101,154,
+    206,209,167,212,151,15,175,51,31,205,206,231,54,144,145,237,
+    127,92,64,157,164,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/CommMonitor.py",
+    "m5.objects.CommMonitor",
+    embedded_module_data,
+    1525,
+    3355);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,510 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,205,92,121,112,27,215,121,223,37,14,130,184,136,155,
+    55,5,81,39,101,17,2,22,7,65,217,58,120,232,22,105,
+    133,146,37,25,141,131,64,92,72,162,76,130,204,2,180,36,
+    196,73,152,214,185,92,119,172,120,50,99,197,227,198,154,182,
+    227,214,117,167,157,30,147,63,50,110,103,250,143,211,99,58,
+    5,82,76,203,110,155,12,103,218,78,170,30,83,178,102,218,
+    137,250,79,191,239,189,189,176,88,64,84,156,102,42,137,223,
+    238,190,239,123,111,119,223,251,126,223,239,123,239,45,245,15,
+    140,230,143,69,58,126,244,157,54,134,121,147,225,25,158,93,
+    96,22,217,12,203,226,121,219,66,219,37,166,141,57,197,240,
+    166,87,24,222,156,55,189,107,98,152,247,77,114,229,140,153,
+    232,44,160,179,230,45,58,157,149,232,218,65,103,203,91,117,
+    186,118,162,235,0,157,61,223,174,211,217,136,206,1,58,103,
+    131,174,131,232,92,160,115,55,180,105,39,186,78,208,121,242,
+    118,157,206,65,116,94,208,249,26,116,78,162,243,131,46,208,
+    208,166,139,232,130,160,11,53,232,220,68,215,5,186,238,6,
+    93,39,209,245,128,174,183,65,231,33,186,62,208,245,55,232,
+    188,68,55,0,186,193,188,87,167,243,17,221,14,208,133,27,
+    234,249,137,110,39,232,134,26,116,1,162,219,5,186,221,249,
+    128,78,23,36,186,61,160,219,219,160,11,17,221,62,208,237,
+    111,104,179,139,232,134,65,119,32,223,165,211,117,19,221,83,
+    160,59,216,160,235,33,186,17,208,69,26,116,189,68,119,8,
+    116,209,124,175,78,215,71,116,49,208,113,13,186,126,62,126,
+    145,25,78,60,196,139,97,86,108,159,206,47,78,150,132,5,
+    56,101,15,204,49,154,63,109,210,241,163,16,131,174,158,103,
+    50,44,207,100,218,110,128,203,255,10,155,49,241,109,208,140,
+    73,180,95,200,221,200,79,231,10,32,135,205,162,121,105,57,
+    95,16,93,40,179,57,62,183,92,154,127,41,47,90,230,22,
+    150,138,121,209,77,14,74,241,12,152,219,178,217,66,110,49,
+    159,205,138,246,108,118,113,137,95,89,192,115,103,54,251,153,
+    149,220,130,164,49,191,148,91,40,190,199,124,132,143,242,168,
+    187,40,204,29,90,204,47,30,154,154,29,159,62,83,40,229,
+    133,235,185,185,124,100,249,174,96,5,53,17,135,224,167,216,
+    3,98,85,249,187,230,56,86,33,255,86,167,240,175,224,145,
+    109,235,222,215,44,191,111,191,93,251,190,240,99,226,217,140,
+    153,111,203,88,242,214,7,237,140,193,31,222,196,155,223,133,
+    254,122,95,238,51,128,37,216,118,24,218,90,120,171,206,214,
+    222,212,182,157,183,233,108,29,96,235,52,180,237,224,237,58,
+    91,87,83,91,7,239,212,217,66,128,120,208,105,104,235,122,
+    151,5,75,86,177,244,52,179,204,123,111,121,148,90,110,93,
+    251,190,166,237,119,234,218,247,183,104,223,175,212,242,232,218,
+    15,52,109,223,171,107,63,216,212,210,167,179,12,53,181,244,
+    235,44,187,154,90,6,116,150,221,45,222,174,71,169,21,212,
+    189,93,239,182,106,133,116,181,250,154,62,85,23,223,173,179,
+    237,111,113,135,126,165,94,143,174,214,64,211,59,244,234,222,
+    123,176,169,101,159,206,114,71,139,39,9,43,181,250,117,79,
+    178,179,197,187,14,232,108,135,90,220,97,151,82,111,80,87,
+    107,119,11,228,237,208,217,238,105,250,52,97,221,219,238,109,
+    241,220,59,117,173,238,107,106,59,164,107,117,127,211,136,178,
+    75,103,57,220,226,254,187,117,247,63,208,194,118,143,206,246,
+    169,22,182,123,117,182,7,91,216,238,211,217,142,52,125,179,
+    253,252,176,206,54,210,98,196,14,232,108,15,129,109,212,208,
+    246,41,254,160,206,54,214,194,118,68,103,203,181,176,141,232,
+    108,227,45,108,15,233,108,19,45,108,163,58,219,100,11,219,
+    152,206,54,213,194,150,211,217,142,182,176,141,235,108,211,45,
+    108,19,58,219,177,22,182,73,157,237,225,22,182,41,157,237,
+    211,45,108,71,117,182,207,180,176,77,235,108,143,180,176,29,
+    211,217,30,109,97,123,88,103,123,172,133,237,211,58,219,227,
+    45,108,159,209,217,142,183,176,61,162,179,157,104,97,123,84,
+    103,59,217,194,246,152,206,118,170,133,237,113,157,237,137,22,
+    182,227,58,219,147,96,123,202,208,118,130,159,212,217,158,110,
+    97,59,165,179,61,195,159,120,133,201,156,229,79,66,214,123,
+    74,116,213,229,159,229,32,166,164,188,144,91,204,206,43,57,
+    233,205,155,229,190,27,249,197,228,225,195,160,92,18,238,30,
+    62,92,87,71,176,65,171,229,16,102,207,225,69,146,62,47,
+    230,11,165,240,242,210,194,252,220,221,135,152,71,149,119,77,
+    231,238,132,115,115,115,249,98,49,95,12,47,231,133,176,176,
+    116,59,124,45,127,125,73,200,135,49,153,158,47,220,16,240,
+    9,203,131,51,43,139,215,64,191,116,61,124,45,87,120,49,
+    124,67,88,90,89,150,170,192,245,201,114,215,137,66,238,218,
+    66,30,154,191,157,23,248,165,219,133,112,177,148,43,229,139,
+    151,202,126,124,170,240,205,92,49,60,117,254,124,120,73,8,
+    23,150,74,229,224,236,248,197,112,105,41,60,155,207,241,225,
+    73,56,231,243,11,185,187,229,144,84,124,69,152,47,229,53,
+    229,30,197,110,1,26,45,204,221,45,123,85,19,185,200,55,
+    11,15,191,44,228,231,110,230,4,120,231,210,252,98,190,236,
+    25,159,188,132,13,94,152,61,33,53,229,167,21,193,108,233,
+    165,188,112,151,154,121,73,251,96,167,84,47,251,39,151,22,
+    86,22,11,82,247,72,149,251,167,231,11,243,139,243,139,244,
+    18,122,170,116,59,159,47,132,175,173,8,197,82,81,52,69,
+    11,197,114,248,34,204,42,52,157,68,30,17,90,86,95,102,
+    183,222,130,62,145,242,218,212,202,55,155,191,46,228,139,55,
+    195,115,119,231,22,164,183,233,86,202,150,22,97,72,249,48,
+    113,6,152,190,148,211,74,27,2,188,201,193,112,17,111,129,
+    35,19,46,222,158,47,205,221,132,129,36,77,72,26,245,230,
+    101,15,118,77,93,15,29,4,175,152,95,92,209,191,100,233,
+    246,210,8,125,22,236,83,233,9,138,229,221,151,110,47,209,
+    103,44,194,189,63,179,50,47,228,73,79,22,243,240,124,185,
+    57,152,136,193,240,40,227,128,7,122,151,134,126,106,176,240,
+    95,149,235,207,47,21,194,183,231,11,224,86,229,157,232,178,
+    5,197,25,229,27,20,161,43,100,19,247,5,244,193,17,104,
+    114,138,180,51,88,127,13,102,165,155,225,133,165,185,23,225,
+    65,193,37,203,61,23,243,11,215,71,4,169,107,243,119,230,
+    75,138,75,13,52,85,97,205,135,4,26,129,169,92,41,7,
+    189,148,43,81,60,204,97,211,229,157,23,239,22,230,110,10,
+    75,133,249,50,125,126,185,195,148,78,2,119,89,28,47,119,
+    143,227,27,228,53,126,59,183,34,8,0,212,242,64,51,77,
+    248,242,212,20,87,238,190,160,148,95,80,49,183,0,239,63,
+    208,76,211,162,226,245,92,177,100,92,17,53,180,98,143,170,
+    190,88,130,87,185,118,87,121,214,193,166,42,90,53,40,189,
+    139,238,73,123,13,139,155,85,33,207,216,88,69,125,192,144,
+    164,211,63,93,159,113,57,173,228,156,61,49,62,165,152,122,
+    181,87,212,192,117,101,246,204,165,19,138,133,175,238,146,154,
+    116,42,184,148,140,2,186,2,106,22,168,243,166,73,201,182,
+    199,168,148,84,16,219,162,151,203,190,233,28,184,246,229,165,
+    133,18,6,242,217,92,1,98,147,151,3,108,213,21,205,177,
+    26,114,65,183,196,229,152,143,144,210,222,100,74,26,221,187,
+    240,243,190,114,245,57,246,101,230,101,54,171,232,95,102,129,
+    123,216,71,57,123,88,250,115,166,0,81,188,80,154,207,97,
+    108,185,9,60,66,136,6,124,185,80,18,150,22,22,192,219,
+    49,10,93,155,199,80,84,2,244,42,21,209,88,126,119,149,
+    177,20,245,123,109,2,62,160,104,70,74,123,175,77,52,23,
+    161,15,68,187,218,110,17,223,33,28,22,188,112,16,118,32,
+    204,186,235,23,100,84,83,31,60,126,177,151,193,229,152,31,
+    217,153,208,192,215,159,255,198,243,95,181,175,245,14,126,213,
+    254,90,231,90,103,79,197,214,67,214,99,102,134,207,9,14,
+    108,14,19,118,193,69,110,95,186,187,156,135,219,222,185,147,
+    189,9,97,51,47,136,29,120,62,183,144,43,22,69,203,133,
+    28,60,28,89,197,17,29,203,208,211,89,74,157,162,237,185,
+    66,113,254,70,1,16,28,88,204,221,201,202,252,153,5,240,
+    103,129,63,197,0,6,181,44,101,72,90,8,215,162,121,98,
+    105,105,65,12,230,9,77,102,9,149,43,92,41,154,248,133,
+    5,177,253,60,13,45,240,88,179,147,83,162,25,253,66,108,
+    199,243,236,149,89,209,84,154,60,15,154,201,43,231,225,116,
+    246,2,26,141,95,132,83,80,193,233,165,11,162,181,52,241,
+    220,236,197,75,162,157,30,179,211,227,87,213,243,51,51,160,
+    159,132,150,206,139,29,244,152,165,21,79,78,138,150,210,236,
+    137,147,103,224,226,202,165,89,176,2,153,197,59,93,184,48,
+    133,55,61,7,167,227,227,83,162,15,226,127,150,196,249,172,
+    28,116,177,254,236,20,84,1,73,170,92,29,191,34,122,212,
+    152,157,93,0,174,44,65,35,87,241,233,174,94,128,144,137,
+    23,23,241,226,34,94,116,146,168,73,250,136,68,77,177,147,
+    135,88,74,207,179,69,8,160,98,187,132,7,209,124,102,106,
+    42,42,90,80,114,162,21,14,220,133,168,216,78,143,114,65,
+    76,42,136,113,196,144,155,161,229,51,84,31,151,42,196,229,
+    10,113,169,66,92,174,16,167,21,226,51,244,50,49,75,46,
+    19,179,210,229,21,122,121,133,35,15,147,36,133,73,122,145,
+    34,23,41,78,108,151,80,41,154,0,192,162,25,81,76,220,
+    87,192,217,39,93,22,36,46,237,151,69,28,126,138,7,44,
+    245,139,137,189,171,83,107,222,253,171,103,215,60,35,171,103,
+    54,172,140,191,251,111,124,67,223,243,13,61,56,86,73,156,
+    175,250,166,107,190,233,213,115,80,222,191,243,157,163,111,29,
+    93,179,217,43,206,216,166,169,173,223,186,197,128,168,152,187,
+    55,220,146,238,55,118,86,70,166,171,125,51,181,190,25,44,
+    182,49,3,67,239,156,125,235,236,131,149,74,228,84,181,255,
+    116,173,255,116,197,220,3,45,57,60,175,31,120,245,192,189,
+    75,149,190,104,213,30,171,217,99,171,147,27,221,140,211,251,
+    250,145,87,143,84,122,162,85,71,172,230,136,173,78,65,3,
+    157,129,215,23,95,93,188,63,245,246,153,202,190,99,85,247,
+    241,154,251,248,234,41,218,194,200,171,35,149,238,3,85,251,
+    83,53,251,83,80,223,42,213,191,31,120,187,187,178,43,85,
+    117,140,214,28,163,208,134,106,123,176,106,31,169,217,71,52,
+    182,149,158,167,170,142,131,53,199,193,58,187,145,170,61,82,
+    179,71,234,236,14,86,29,35,53,199,8,216,217,25,95,215,
+    155,3,111,12,220,47,189,253,217,202,193,241,170,119,162,230,
+    157,88,61,11,207,170,45,63,91,245,158,171,121,207,65,185,
+    147,113,251,95,127,225,213,23,238,39,43,67,83,85,215,137,
+    154,235,196,234,73,40,245,134,222,116,189,225,90,179,57,95,
+    115,84,130,79,67,127,122,177,63,189,86,24,2,187,114,219,
+    145,170,35,82,115,68,72,87,184,124,175,79,191,58,93,233,
+    77,84,157,201,154,51,185,122,2,30,143,54,141,141,116,172,
+    217,38,54,45,38,55,52,2,130,220,65,234,143,96,37,204,
+    85,29,241,154,35,78,222,146,150,98,21,91,197,119,28,238,
+    235,196,251,58,173,228,30,189,59,222,233,125,171,119,205,230,
+    170,116,38,65,213,139,170,94,24,226,144,230,153,180,93,102,
+    244,106,54,197,50,82,117,28,170,57,14,129,123,117,245,191,
+    249,249,55,62,95,217,123,166,218,117,182,214,117,182,98,14,
+    128,25,237,239,251,150,202,142,67,85,123,180,102,143,146,30,
+    87,155,156,168,186,38,107,174,73,104,210,170,177,61,92,181,
+    63,93,179,63,173,179,29,175,186,38,106,174,9,114,123,184,
+    89,225,141,194,131,79,84,246,31,173,134,142,213,66,199,86,
+    159,93,15,245,189,121,235,141,91,15,130,149,253,231,170,161,
+    243,181,208,249,213,103,55,134,52,61,116,184,234,120,186,230,
+    120,154,188,20,237,232,251,123,42,59,143,87,157,227,53,231,
+    184,166,171,241,94,207,84,93,71,106,174,35,228,185,36,255,
+    60,81,217,53,81,117,79,214,220,147,196,59,159,196,86,189,
+    219,51,85,231,145,154,243,136,238,110,218,94,80,75,199,170,
+    174,195,53,215,97,93,187,90,132,60,137,173,250,12,99,85,
+    231,225,154,243,176,238,25,142,85,93,199,107,174,227,164,5,
+    217,246,193,96,213,25,173,57,163,58,211,100,213,149,170,185,
+    82,245,166,59,170,206,88,205,25,211,153,166,170,174,209,154,
+    107,148,152,170,35,17,171,58,184,154,131,211,141,196,104,213,
+    153,174,57,211,164,5,213,86,139,114,227,126,148,252,198,92,
+    25,228,170,246,120,205,30,175,139,20,149,29,42,50,204,237,
+    150,222,13,166,81,208,48,138,193,179,110,119,69,206,98,62,
+    122,139,169,219,93,33,59,73,116,119,133,55,101,172,112,108,
+    231,205,25,27,28,59,120,75,198,206,91,51,14,190,61,227,
+    132,31,23,252,184,121,91,166,147,239,200,120,120,123,198,203,
+    59,50,62,222,153,241,243,174,76,128,119,103,130,240,19,226,
+    59,51,93,240,211,205,123,50,61,96,215,203,123,51,125,188,
+    47,211,207,251,51,3,124,32,51,200,7,51,59,248,80,38,
+    204,119,101,118,194,245,16,148,239,226,187,51,187,249,158,204,
+    30,190,23,242,171,62,152,219,79,205,198,179,177,84,52,154,
+    77,223,73,139,214,100,140,155,158,159,120,104,35,41,73,236,
+    220,252,132,128,27,98,143,172,177,8,151,44,192,180,18,68,
+    185,61,22,143,140,226,149,57,78,202,82,228,20,38,156,15,
+    113,87,73,180,112,169,40,150,196,64,249,200,50,26,33,7,
+    46,34,93,165,87,32,157,225,70,137,69,50,185,56,14,53,
+    57,34,211,32,45,49,46,73,14,201,81,60,112,113,98,192,
+    193,228,228,145,57,22,73,94,158,25,222,171,207,155,28,124,
+    254,165,249,185,124,182,56,95,206,139,30,233,226,218,74,49,
+    123,123,158,47,221,20,157,100,62,156,93,200,23,110,192,85,
+    80,210,67,106,116,109,229,250,117,224,122,109,53,77,134,228,
+    69,41,101,3,55,115,133,66,126,65,116,95,83,138,80,41,
+    28,195,71,72,162,56,136,2,119,226,132,24,10,14,197,4,
+    138,41,20,39,80,28,70,129,252,42,60,131,34,65,51,190,
+    217,75,87,48,173,185,40,60,141,133,39,81,156,70,49,141,
+    226,34,138,231,81,188,128,226,231,80,100,81,92,65,241,9,
+    20,57,20,188,1,165,223,144,197,14,76,72,255,145,209,82,
+    250,186,175,151,16,118,119,15,6,90,43,19,8,174,158,135,
+    195,192,46,202,190,114,113,79,111,197,28,132,99,168,107,117,
+    6,161,226,151,98,42,5,100,16,194,182,29,138,168,112,120,
+    225,210,225,65,129,103,93,221,208,196,154,195,183,58,181,110,
+    247,80,72,249,41,187,212,29,192,0,117,174,128,132,69,114,
+    37,21,58,161,242,26,136,19,146,240,203,2,91,93,115,193,
+    83,80,65,238,135,55,193,191,180,3,110,52,5,99,201,24,
+    140,38,0,163,25,192,104,1,48,90,1,140,237,0,70,27,
+    128,177,3,192,104,7,48,58,0,140,78,0,163,75,2,163,
+    27,192,216,9,96,244,0,24,189,0,70,27,128,209,7,96,
+    244,3,24,3,0,198,54,0,99,27,128,49,248,10,3,112,
+    12,1,204,186,68,215,233,233,201,44,151,4,148,197,238,196,
+    33,79,75,35,200,194,248,184,243,196,21,184,100,106,226,33,
+    62,168,176,140,2,49,87,182,68,35,105,64,155,37,30,225,
+    224,96,141,69,201,209,50,22,25,195,195,104,100,20,75,185,
+    88,4,224,71,22,198,0,79,99,8,199,52,2,45,129,86,
+    143,160,238,216,74,81,176,163,214,62,187,52,185,52,155,155,
+    200,77,222,172,155,161,225,71,30,100,134,150,102,244,51,52,
+    158,229,219,248,182,223,210,125,216,97,56,83,51,11,189,202,
+    219,152,18,133,226,176,73,12,46,206,23,178,183,113,45,136,
+    162,134,174,254,136,33,92,140,155,159,203,94,203,205,189,152,
+    47,240,89,105,17,67,236,146,202,175,11,48,157,210,40,132,
+    62,108,120,0,115,211,198,137,88,93,183,106,38,98,223,69,
+    191,143,50,202,68,108,109,104,215,218,174,253,107,187,135,55,
+    218,205,33,251,38,3,98,11,197,87,237,144,187,244,237,104,
+    152,158,245,235,194,140,240,5,20,171,40,190,136,226,231,81,
+    252,2,138,87,80,124,9,197,54,2,130,46,22,96,24,16,
+    190,130,130,4,128,221,216,121,206,28,207,11,217,197,220,242,
+    242,124,225,134,232,37,253,151,173,11,86,184,170,166,45,49,
+    76,234,191,38,139,47,96,79,124,88,23,1,48,139,239,161,
+    49,160,119,27,49,192,174,196,0,138,77,119,144,198,128,0,
+    66,207,139,49,0,133,195,79,210,95,130,109,155,210,2,193,
+    177,189,19,245,62,162,208,130,222,206,248,119,145,199,8,132,
+    225,246,118,166,167,15,110,183,214,69,170,154,29,200,176,141,
+    130,190,226,215,154,98,252,114,115,140,35,225,154,36,194,181,
+    0,198,173,128,241,118,192,184,13,48,222,1,24,183,3,198,
+    29,128,113,39,96,188,3,48,238,2,140,187,1,227,157,128,
+    113,15,184,184,87,34,75,46,22,143,35,89,150,219,163,145,
+    177,56,66,180,29,249,144,147,152,49,58,70,232,48,14,168,
+    92,144,176,141,5,163,81,194,114,200,107,230,68,98,113,92,
+    248,44,42,45,177,177,24,97,186,36,81,39,226,160,248,28,
+    190,225,231,137,27,6,245,110,184,93,210,249,216,12,242,182,
+    44,254,22,253,167,80,231,63,235,118,137,12,186,30,79,6,
+    31,47,150,191,221,116,156,191,211,124,156,181,177,92,78,172,
+    154,141,179,19,198,217,9,227,236,130,113,182,75,137,85,39,
+    196,242,54,136,229,30,136,229,94,136,229,14,136,229,62,136,
+    228,254,38,137,85,55,36,86,61,144,88,245,66,98,213,13,
+    137,85,95,102,47,223,159,217,199,15,100,246,243,131,153,97,
+    126,71,230,0,31,206,60,197,239,204,28,228,135,50,35,252,
+    46,240,165,221,162,27,124,41,145,229,18,24,187,82,119,18,
+    144,46,157,130,100,107,89,9,162,102,200,196,38,132,0,35,
+    177,193,67,140,61,15,143,99,208,3,183,75,163,123,161,219,
+    197,227,156,228,103,224,123,137,72,140,166,98,88,118,15,203,
+    108,224,143,113,14,92,84,180,196,147,144,114,9,2,182,87,
+    164,230,145,84,10,169,99,5,139,10,196,25,227,9,180,249,
+    53,18,195,227,196,93,209,81,239,82,71,141,198,73,102,22,
+    3,71,21,126,21,235,220,145,188,155,24,74,41,26,119,185,
+    108,230,72,162,22,121,178,8,186,79,9,163,223,68,241,86,
+    189,179,167,91,122,252,164,226,246,205,114,45,225,203,245,145,
+    86,151,106,205,212,163,37,179,77,200,228,13,112,243,174,44,
+    30,33,110,250,216,250,204,171,187,101,230,213,171,141,186,54,
+    166,127,0,151,73,32,250,118,67,244,181,49,61,253,106,116,
+    132,88,28,0,8,58,41,4,157,45,210,50,169,84,19,182,
+    67,114,134,182,94,151,161,121,235,50,52,90,133,220,164,62,
+    67,179,215,103,104,94,5,213,40,92,62,128,241,227,241,77,
+    206,212,111,211,222,109,10,242,148,49,200,89,41,152,155,1,
+    228,22,0,185,21,64,222,14,32,183,1,200,59,0,228,118,
+    0,152,131,4,107,9,96,16,172,9,168,132,91,40,238,81,
+    191,141,33,84,18,48,235,160,14,15,83,15,234,224,56,231,
+    16,30,48,24,126,93,122,31,94,173,247,92,213,241,166,21,
+    231,81,253,230,138,129,123,124,91,22,183,32,151,41,158,99,
+    234,220,131,140,138,1,13,227,200,173,55,6,83,165,159,177,
+    119,241,47,189,207,183,155,118,231,172,113,119,62,73,254,235,
+    134,152,217,9,49,211,3,49,211,11,49,211,7,93,237,215,
+    198,178,196,157,88,138,68,45,232,225,115,114,64,251,37,70,
+    138,98,100,20,202,150,100,4,195,151,37,21,129,68,81,88,
+    34,198,105,228,63,19,134,155,223,33,215,9,58,1,228,200,
+    172,144,75,144,161,225,210,148,36,129,49,103,134,3,143,25,
+    27,93,84,209,5,10,35,216,27,33,94,55,124,31,200,226,
+    203,56,124,119,116,195,215,99,60,124,13,120,166,217,148,4,
+    181,198,193,173,199,148,1,156,212,177,254,160,233,88,127,184,
+    189,177,70,232,152,53,252,104,131,177,182,193,88,119,192,88,
+    219,164,133,7,59,140,181,3,198,218,9,252,104,7,126,116,
+    1,63,218,129,31,221,192,143,110,224,199,78,224,71,15,240,
+    163,23,248,209,7,252,232,7,126,12,0,63,6,129,31,67,
+    192,143,65,224,199,46,237,194,3,240,99,31,240,99,63,240,
+    227,0,240,227,32,240,227,14,224,199,48,240,227,78,224,199,
+    161,76,132,223,149,57,196,239,206,68,249,61,224,95,123,69,
+    255,249,11,224,97,92,246,98,34,27,139,166,82,36,217,63,
+    41,220,196,30,248,69,217,171,40,182,209,211,144,218,210,163,
+    41,137,237,192,95,144,14,139,20,227,184,74,33,124,157,158,
+    35,217,149,173,116,41,227,17,78,175,232,154,4,90,44,147,
+    138,49,140,4,239,224,169,137,131,179,223,39,190,11,236,134,
+    78,136,52,136,217,27,178,225,111,147,246,56,142,122,39,85,
+    96,62,87,182,0,33,162,91,167,241,60,26,73,1,71,226,
+    164,14,139,98,88,20,71,53,210,102,250,178,240,7,36,226,
+    196,244,94,125,128,121,44,117,170,147,15,35,134,84,39,26,
+    132,73,9,57,234,56,144,208,164,202,144,186,165,11,29,84,
+    46,41,120,81,105,242,83,10,114,62,169,192,231,211,10,134,
+    174,50,50,117,98,0,162,252,121,141,105,69,162,31,202,226,
+    247,16,102,187,234,73,20,103,19,56,131,233,107,156,193,216,
+    30,187,138,17,80,184,11,175,188,116,201,1,14,235,10,57,
+    17,86,68,74,149,232,210,143,144,244,83,2,244,213,45,81,
+    72,84,25,160,109,209,148,88,186,34,64,150,195,185,38,100,
+    123,165,104,173,198,109,137,56,3,120,230,149,207,200,195,80,
+    19,188,4,118,63,37,157,5,225,140,228,214,68,107,64,166,
+    31,54,141,8,133,143,31,17,236,16,17,28,186,165,72,187,
+    180,20,233,214,44,69,122,49,99,38,204,224,185,50,207,231,
+    207,60,155,229,200,20,61,198,165,79,138,237,177,40,151,152,
+    6,106,120,15,159,151,34,45,129,84,65,88,130,78,153,98,
+    144,178,10,223,197,107,10,97,14,161,105,225,98,10,122,205,
+    228,244,207,208,226,207,25,137,92,102,134,251,126,118,232,105,
+    141,25,157,63,175,201,34,100,2,127,70,130,51,240,231,126,
+    234,207,125,79,228,207,30,53,23,35,206,160,120,132,228,203,
+    94,50,233,118,7,20,95,86,211,57,9,4,245,88,104,240,
+    95,250,143,190,203,90,83,223,250,9,217,70,158,141,161,111,
+    57,192,183,108,154,217,152,27,124,203,33,205,198,28,210,108,
+    76,241,45,105,54,22,0,182,9,2,219,132,128,109,186,128,
+    109,186,129,109,122,128,109,186,31,51,27,11,105,216,38,12,
+    108,51,4,108,179,11,216,102,55,248,236,30,209,67,216,70,
+    90,20,55,164,26,145,145,147,154,23,81,252,157,236,168,212,
+    101,139,178,31,11,127,130,2,253,85,248,83,20,184,254,168,
+    241,89,146,26,253,21,241,230,20,210,72,141,186,58,176,132,
+    240,23,168,66,63,17,254,146,33,220,18,39,220,130,217,144,
+    240,61,6,105,40,22,73,16,26,138,81,154,145,24,6,9,
+    235,175,177,218,79,151,77,116,80,136,25,224,225,255,49,155,
+    172,203,226,147,166,39,98,19,125,38,103,51,90,19,151,83,
+    183,122,18,209,44,114,123,233,60,205,191,77,54,169,91,26,
+    55,100,19,111,221,4,128,114,136,183,254,172,53,155,4,234,
+    217,196,215,130,77,214,155,34,126,155,108,210,108,46,225,148,
+    214,95,92,128,120,183,118,157,13,16,239,5,196,59,1,241,
+    62,64,188,29,16,111,7,196,251,1,153,1,177,243,20,0,
+    51,153,133,121,70,52,203,225,58,186,21,24,5,169,68,133,
+    230,107,140,196,6,20,159,4,99,100,58,98,194,249,158,137,
+    67,17,39,187,83,120,106,198,181,17,186,248,97,230,226,202,
+    58,122,42,41,45,170,24,80,202,118,151,49,126,218,139,23,
+    58,167,254,161,44,254,24,157,26,51,80,131,29,158,237,172,
+    238,90,165,121,137,149,174,51,72,156,226,161,30,75,29,183,
+    206,199,21,47,33,155,254,228,160,218,72,11,191,245,64,144,
+    230,54,234,65,245,175,31,54,245,175,151,30,239,95,70,83,
+    127,100,148,14,240,47,187,196,40,78,253,58,46,248,151,3,
+    252,203,11,254,229,0,255,242,73,123,53,126,96,148,0,48,
+    74,16,252,44,36,122,79,79,76,195,76,3,167,179,167,105,
+    218,162,38,43,194,63,163,248,67,197,195,136,215,161,219,8,
+    255,194,200,52,240,203,40,190,193,144,89,70,74,206,89,40,
+    77,16,114,248,1,138,32,10,156,252,10,175,75,150,224,139,
+    51,195,3,134,243,218,47,42,174,103,20,174,247,41,14,23,
+    171,247,53,78,113,66,53,82,171,113,188,117,164,86,35,186,
+    206,245,54,101,17,50,131,235,125,80,231,122,224,56,186,12,
+    6,35,235,122,255,144,241,148,152,4,82,183,226,129,196,245,
+    108,196,207,116,171,69,152,196,248,27,146,24,217,212,39,47,
+    54,219,100,55,115,212,251,158,54,128,106,54,26,213,133,230,
+    205,166,142,120,248,241,142,104,28,232,58,120,39,56,147,75,
+    244,212,59,83,42,33,252,166,236,75,162,149,75,166,48,126,
+    145,185,43,89,235,253,12,67,119,208,49,46,17,135,250,186,
+    226,48,255,193,52,95,147,210,249,199,151,148,33,63,173,12,
+    175,74,211,186,241,252,145,44,150,113,60,159,111,24,207,222,
+    134,241,84,18,83,155,188,56,169,225,45,66,169,10,201,169,
+    83,44,181,179,127,212,180,179,191,181,125,212,183,181,88,213,
+    151,89,165,19,80,239,1,212,123,1,245,54,64,189,15,80,
+    239,7,212,7,0,245,78,64,125,59,160,62,40,173,234,59,
+    164,60,178,77,183,170,207,66,30,201,202,171,22,48,160,253,
+    116,64,57,195,1,21,254,11,133,178,18,65,135,20,127,249,
+    24,248,6,215,186,254,21,175,255,13,69,65,142,8,162,105,
+    20,20,255,46,7,16,178,142,32,71,140,5,37,142,152,198,
+    160,44,72,27,194,149,13,26,50,56,114,142,187,187,151,102,
+    134,247,125,252,192,161,50,85,68,9,33,209,109,198,145,35,
+    74,48,57,94,31,81,116,4,167,134,21,220,238,164,11,253,
+    100,201,127,220,192,53,127,44,139,111,161,107,254,83,157,107,
+    42,235,109,77,3,205,58,202,224,122,16,130,204,90,95,191,
+    26,98,8,135,173,227,98,53,37,42,50,191,166,161,198,163,
+    70,146,198,120,179,174,177,65,65,150,187,29,117,244,70,154,
+    87,148,45,66,207,186,111,8,30,151,188,194,26,34,44,184,
+    222,3,65,48,68,255,209,30,248,113,83,152,252,209,227,97,
+    34,111,126,201,228,216,108,243,203,37,77,229,221,210,84,222,
+    33,37,95,22,128,73,39,192,196,243,152,175,138,66,0,19,
+    207,147,46,238,145,13,48,23,205,229,232,162,113,154,78,177,
+    230,21,208,188,166,64,138,0,137,36,120,8,51,220,253,74,
+    36,19,116,247,43,165,238,126,217,98,137,72,50,129,95,39,
+    225,158,87,42,142,160,122,95,65,159,133,27,35,31,46,69,
+    35,99,209,180,180,230,92,110,231,34,137,49,252,136,194,198,
+    73,53,160,110,42,18,35,117,9,79,19,16,146,143,39,44,
+    49,142,124,165,148,198,197,59,243,24,71,214,248,164,165,190,
+    4,185,74,140,142,225,33,73,102,106,22,110,148,172,95,199,
+    162,160,43,155,99,145,216,229,153,225,67,255,135,59,98,81,
+    5,195,77,51,203,175,40,240,61,170,192,247,203,10,114,213,
+    108,83,55,157,35,40,37,179,182,103,81,144,89,219,115,40,
+    140,214,204,155,110,39,179,172,36,62,50,27,108,139,245,18,
+    74,81,182,197,66,141,75,31,20,202,242,34,250,26,66,122,
+    157,192,166,126,67,76,217,147,150,193,139,155,93,246,0,98,
+    50,40,157,233,119,197,252,186,93,49,200,121,29,234,12,110,
+    221,17,144,51,217,227,44,221,95,115,117,33,234,131,218,233,
+    154,188,65,230,163,233,139,12,111,32,79,210,134,178,206,183,
+    78,103,102,126,237,178,62,221,133,83,182,226,84,150,196,222,
+    50,134,255,209,230,240,151,183,197,76,6,31,21,218,228,220,
+    88,217,30,75,102,83,18,252,16,26,241,24,249,132,1,81,
+    145,34,88,72,68,226,163,50,162,70,147,49,9,106,36,25,
+    193,53,246,209,88,74,2,15,81,18,240,112,120,54,51,220,
+    185,157,239,22,84,159,213,185,171,206,43,117,174,228,98,37,
+    241,5,11,184,210,115,245,156,160,249,50,65,29,114,245,172,
+    113,220,113,245,171,97,100,213,9,138,171,233,32,180,200,11,
+    31,59,8,48,0,118,105,0,210,154,1,224,232,199,36,49,
+    8,82,9,105,0,184,180,60,0,105,252,174,68,233,251,56,
+    94,145,190,79,211,51,232,123,82,54,51,236,254,9,250,126,
+    27,221,222,201,74,226,3,236,246,153,109,116,251,154,65,183,
+    63,174,191,59,155,246,247,187,205,251,91,159,135,35,231,153,
+    12,56,207,222,100,66,232,213,164,134,126,224,188,0,126,188,
+    135,159,238,1,231,117,1,231,117,0,231,249,128,243,124,210,
+    18,163,156,26,218,128,243,122,53,75,140,125,200,121,48,182,
+    131,98,55,89,66,76,102,147,244,211,180,88,42,59,113,42,
+    59,113,62,206,209,84,17,41,133,210,28,225,181,95,71,161,
+    206,40,151,165,49,78,36,113,25,2,115,68,50,208,92,58,
+    42,45,138,227,119,25,112,250,63,196,142,139,145,47,108,203,
+    86,224,63,244,4,107,58,50,26,199,13,45,46,50,22,35,
+    238,20,139,164,208,252,251,140,196,104,101,107,138,124,204,75,
+    19,81,2,233,191,103,36,242,189,4,158,132,246,81,244,164,
+    97,189,39,189,165,16,194,42,195,108,63,183,108,186,176,174,
+    178,140,186,196,62,138,2,55,254,41,197,233,86,220,213,44,
+    147,208,217,81,131,232,65,200,238,44,10,146,81,30,71,113,
+    206,192,161,189,172,36,254,27,29,218,195,26,230,150,210,7,
+    106,116,14,100,167,212,164,124,61,103,188,160,226,33,115,34,
+    53,225,172,223,114,10,42,243,33,221,218,187,77,201,14,3,
+    234,218,159,147,113,135,72,156,2,138,60,139,135,62,114,144,
+    63,188,210,172,38,162,57,33,26,252,213,142,160,209,150,148,
+    215,48,41,181,49,93,221,171,207,194,171,245,14,66,226,73,
+    208,184,30,234,93,125,22,255,74,157,213,20,146,67,198,144,
+    108,211,126,107,7,112,176,52,131,131,244,165,128,224,103,241,
+    11,243,100,36,13,252,51,243,158,77,239,117,95,108,230,27,
+    186,1,13,178,146,88,177,194,128,142,212,69,40,120,79,105,
+    236,176,67,215,188,61,171,103,215,81,72,5,234,142,122,176,
+    233,219,78,180,14,64,230,22,95,22,118,200,251,103,132,121,
+    27,123,35,61,65,131,131,40,195,144,46,40,133,240,133,8,
+    72,127,64,80,159,144,183,166,201,76,112,230,61,143,190,167,
+    212,185,255,62,131,62,123,70,1,139,138,147,180,130,157,35,
+    6,61,218,195,74,226,85,236,209,79,213,245,168,52,213,114,
+    147,53,28,197,219,149,222,93,147,122,183,126,151,169,110,54,
+    228,38,95,6,249,36,161,14,65,79,211,33,104,242,61,144,
+    126,121,128,149,182,153,204,48,4,22,24,2,43,116,123,187,
+    210,237,36,229,169,139,201,184,137,131,129,148,70,69,146,249,
+    151,228,94,55,88,112,33,49,237,80,51,167,212,5,167,227,
+    6,221,58,192,74,226,119,177,91,103,235,187,213,238,83,163,
+    128,178,11,237,163,157,233,235,166,30,27,160,48,15,212,237,
+    21,208,15,111,177,135,85,58,29,248,233,97,87,215,109,50,
+    118,73,71,145,165,114,161,139,109,124,85,252,253,3,34,190,
+    223,18,147,65,244,154,110,196,100,136,190,97,221,87,46,59,
+    126,118,152,84,223,178,9,38,9,93,42,152,20,122,89,137,
+    176,41,36,133,62,131,62,216,201,74,226,63,183,141,34,68,
+    6,118,197,154,212,31,63,1,138,240,134,51,195,3,162,111,
+    49,25,89,186,118,43,63,87,42,70,164,255,253,142,254,190,
+    115,87,189,66,249,117,102,209,124,162,176,34,253,174,177,83,
+    171,160,191,40,74,126,181,132,124,93,78,62,17,38,223,59,
+    146,175,218,200,183,81,228,203,13,178,221,189,142,130,236,82,
+    144,245,98,178,200,72,150,115,88,57,127,167,41,165,87,142,
+    218,52,218,12,200,14,67,187,173,190,43,31,217,158,161,255,
+    111,222,81,97,47,75,221,160,248,77,152,80,110,152,88,150,
+    221,152,101,25,118,95,133,217,171,253,183,198,236,169,200,255,
+    54,236,44,123,156,221,96,140,229,189,192,38,57,110,105,53,
+    182,235,38,182,119,131,49,150,247,206,111,146,227,150,86,115,
+    181,253,20,203,122,55,24,99,121,111,122,147,28,183,180,154,
+    227,166,139,44,214,55,150,88,5,143,91,90,77,169,173,7,
+    171,55,10,180,238,193,246,149,210,9,246,38,203,250,54,24,
+    99,121,239,133,77,114,220,210,106,62,109,10,176,129,13,166,
+    81,220,155,217,196,195,150,90,154,222,139,103,141,226,222,167,
+    54,241,176,165,150,94,101,179,228,14,198,242,254,200,38,57,
+    110,105,53,167,77,71,217,158,13,166,81,220,251,220,38,30,
+    182,212,210,243,109,173,90,71,251,134,214,207,154,206,147,49,
+    48,150,247,22,55,201,113,75,171,185,213,118,129,212,55,150,
+    247,93,155,228,184,165,213,148,218,246,97,245,70,81,233,218,
+    191,137,199,45,181,248,147,236,89,150,29,220,96,140,37,190,
+    4,30,183,180,154,91,109,167,219,176,186,177,68,111,192,227,
+    150,86,115,213,156,98,67,27,76,163,64,107,56,108,169,165,
+    101,150,195,211,70,129,166,28,154,42,165,47,177,47,177,108,
+    223,6,99,44,239,195,179,227,113,75,171,121,217,228,194,218,
+    141,162,178,99,116,19,143,91,106,241,129,65,214,191,193,52,
+    10,98,10,199,45,181,120,134,221,141,189,223,40,136,237,110,
+    28,31,165,248,42,235,194,106,141,66,122,4,255,150,90,252,
+    4,143,160,8,18,186,254,23,204,237,203,169,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/DRAMInterface.py",
+    "m5.objects.DRAMInterface",
+    embedded_module_data,
+    7772,
+    22355);
+
+} // anonymous namespace
+} // namespace gem5
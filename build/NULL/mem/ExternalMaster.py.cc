@@ -0,0 +1,69 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,83,205,79,19,65,20,159,217,237,46,221,182,84,
+    8,90,65,19,179,49,66,44,7,26,15,92,208,144,152,32,
+    138,17,36,212,139,13,201,102,186,51,180,75,246,163,204,108,
+    181,109,52,233,193,131,122,145,120,193,131,7,79,36,198,255,
+    193,191,161,36,28,154,57,145,120,242,86,2,39,79,206,108,
+    63,160,4,221,157,125,239,205,251,253,222,215,76,246,23,56,
+    247,104,61,125,178,40,196,30,192,0,67,23,188,232,106,24,
+    105,197,85,60,181,160,66,160,128,199,0,171,239,0,142,17,
+    117,95,5,224,135,218,79,82,136,97,45,15,178,250,111,185,
+    201,66,14,103,133,48,242,142,247,188,184,77,236,208,62,95,
+    48,214,47,248,51,42,72,64,1,98,80,80,196,167,98,40,
+    18,41,5,77,1,68,199,234,62,20,37,224,160,196,8,137,
+    127,51,192,37,15,22,197,247,21,193,85,6,220,196,127,184,
+    250,5,110,82,112,83,151,113,201,232,118,122,16,55,114,33,
+    234,10,142,139,129,13,158,126,84,11,9,245,145,187,138,152,
+    48,26,25,143,120,57,210,243,89,94,228,156,43,151,27,87,
+    75,196,155,95,88,184,192,78,118,181,89,9,104,200,99,44,
+    172,22,27,203,27,164,228,72,39,193,102,63,79,132,155,101,
+    228,99,87,144,195,192,172,32,198,204,176,236,176,46,34,60,
+    142,47,22,11,145,31,58,40,116,2,191,241,225,161,201,66,
+    234,248,165,51,126,32,66,200,112,174,187,34,14,153,91,1,
+    245,80,104,178,10,177,157,45,199,238,51,123,164,172,220,99,
+    194,108,234,20,133,51,120,125,150,134,149,131,170,139,77,225,
+    46,6,85,31,231,138,142,143,81,209,37,57,236,48,59,120,
+    69,168,220,52,238,228,235,98,32,175,219,240,240,76,69,226,
+    6,126,73,246,182,150,29,227,113,203,242,145,71,44,139,39,
+    44,203,11,112,213,149,118,202,178,118,170,200,237,33,177,176,
+    94,33,60,97,215,106,86,153,32,76,40,55,164,109,187,98,
+    68,158,220,32,59,85,194,194,245,232,60,163,83,213,214,17,
+    69,30,215,243,209,97,112,67,58,173,40,71,215,196,40,68,
+    2,141,58,228,186,32,19,63,228,42,242,235,92,103,145,243,
+    59,56,145,55,254,103,138,81,59,39,111,119,248,14,231,42,
+    117,170,11,60,18,89,241,177,55,66,52,7,111,59,121,179,
+    185,212,30,207,54,159,182,199,102,154,43,71,201,204,251,251,
+    187,111,15,146,211,135,201,233,230,210,209,216,181,189,212,231,
+    84,59,158,238,40,208,184,119,172,197,198,245,83,32,68,115,
+    165,147,0,227,153,1,168,24,11,199,154,38,65,45,2,211,
+    32,61,241,105,243,227,230,151,153,175,179,173,153,103,7,163,
+    171,135,163,171,205,101,249,210,169,126,59,107,89,141,27,222,
+    252,92,69,30,1,227,113,105,210,160,86,231,41,97,13,254,
+    78,26,235,243,233,164,20,81,248,13,57,114,252,65,247,18,
+    22,233,45,177,149,191,34,171,8,209,81,33,132,157,39,16,
+    192,201,22,184,222,93,109,144,105,245,87,27,220,110,13,175,
+    142,62,1,215,96,7,92,46,119,95,30,71,250,244,31,120,
+    212,209,95,232,140,76,248,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/ExternalMaster.py",
+    "m5.objects.ExternalMaster",
+    embedded_module_data,
+    711,
+    1205);
+
+} // anonymous namespace
+} // namespace gem5
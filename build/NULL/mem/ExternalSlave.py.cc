@@ -0,0 +1,68 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,83,205,107,19,65,20,159,217,236,110,179,73,170,
+    182,181,182,138,194,82,144,54,30,18,60,84,176,20,161,80,
+    63,170,80,75,35,30,130,176,76,118,94,147,149,253,136,51,
+    155,218,230,20,193,131,222,138,151,94,123,42,136,87,255,144,
+    42,130,97,78,5,79,222,18,218,147,39,103,54,77,218,212,
+    226,206,236,155,55,243,251,189,247,155,207,95,232,204,103,156,
+    180,71,247,164,217,69,20,81,236,163,23,170,213,124,28,104,
+    101,13,35,13,61,70,52,245,30,81,29,180,253,20,66,95,
+    82,253,224,114,138,26,37,148,55,127,171,78,30,11,124,71,
+    26,171,228,5,207,43,175,193,141,221,179,66,122,95,232,107,
+    34,4,168,140,41,42,107,84,37,193,101,157,106,101,67,67,
+    96,210,212,62,150,18,120,32,49,2,233,61,11,93,240,85,
+    229,132,246,53,201,213,6,220,12,100,247,114,23,113,169,65,
+    205,115,220,209,255,112,71,206,113,47,209,180,92,166,37,70,
+    31,110,197,192,66,226,151,124,178,9,205,201,0,130,34,156,
+    12,57,92,141,21,106,181,230,68,21,130,249,133,133,97,110,
+    38,105,236,122,196,226,102,97,137,82,6,156,3,183,57,176,
+    77,160,118,101,219,142,107,30,79,224,89,110,247,115,218,164,
+    10,97,44,116,30,55,42,205,71,235,80,245,184,4,36,127,
+    64,80,1,118,141,132,212,7,102,199,145,93,39,156,159,166,
+    82,35,94,40,43,143,73,24,123,36,246,162,176,249,113,201,
+    230,49,243,194,234,41,63,146,33,48,156,107,78,198,17,123,
+    35,98,1,137,109,94,7,215,219,240,220,62,243,132,148,87,
+    125,10,220,101,94,69,14,70,111,79,211,240,90,212,240,229,
+    186,192,174,68,141,144,22,43,94,72,73,197,135,34,245,184,
+    27,109,2,83,157,213,252,101,145,118,156,144,4,224,56,34,
+    227,56,65,68,27,190,242,115,142,243,166,65,252,19,68,143,
+    183,235,32,50,238,214,150,83,3,66,129,9,75,249,174,47,
+    39,47,175,155,218,216,53,41,42,116,37,45,178,47,229,213,
+    139,216,26,97,36,16,150,218,234,117,18,86,65,100,137,116,
+    29,166,124,46,140,30,108,150,146,157,16,150,138,116,18,153,
+    158,75,73,76,62,163,35,117,250,127,166,57,115,139,234,168,
+    135,78,180,80,223,102,166,132,19,51,39,127,254,78,154,214,
+    160,180,179,55,90,203,237,177,185,214,211,246,149,219,173,149,
+    195,236,213,15,247,119,94,125,203,206,252,200,206,180,150,15,
+    199,111,253,28,159,253,62,62,219,78,103,14,114,139,221,148,
+    54,97,30,35,105,90,207,58,105,52,118,109,55,247,41,215,
+    78,95,234,104,216,186,219,53,244,49,9,74,211,90,233,100,
+    206,130,154,181,208,53,12,5,26,10,84,133,77,247,231,180,
+    154,215,133,21,204,23,234,106,165,92,228,164,59,120,153,76,
+    239,179,216,148,50,73,208,117,181,216,244,98,239,16,30,176,
+    155,178,171,158,33,47,75,211,73,97,140,59,79,48,194,211,
+    7,104,170,87,219,104,230,96,184,118,204,73,108,118,208,191,
+    102,103,165,171,154,227,11,160,68,251,47,19,243,66,127,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/ExternalSlave.py",
+    "m5.objects.ExternalSlave",
+    embedded_module_data,
+    703,
+    1171);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,55 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,81,77,111,211,64,16,157,245,71,226,164,117,41,
+    105,2,84,66,224,246,130,194,33,149,144,138,168,133,16,208,
+    10,40,34,21,130,158,114,89,185,222,165,78,101,39,97,237,
+    170,73,79,62,112,224,31,112,229,84,9,241,103,12,66,194,
+    218,43,167,222,140,194,137,19,187,177,93,69,162,235,153,55,
+    59,51,187,111,102,188,191,96,110,233,133,157,218,2,62,1,
+    1,130,124,216,207,45,42,172,178,15,10,60,7,162,124,0,
+    162,82,245,76,5,248,170,150,4,61,141,104,111,161,173,159,
+    75,167,141,56,186,235,206,243,151,231,166,175,102,252,20,122,
+    136,64,79,17,170,18,36,238,42,61,157,86,62,87,225,146,
+    69,212,51,36,42,161,139,74,6,209,122,53,161,117,162,139,
+    138,21,94,125,241,180,187,29,49,255,244,74,64,131,13,239,
+    32,192,174,240,58,158,119,218,58,164,193,166,109,139,240,144,
+    77,108,187,60,215,218,121,243,164,107,229,81,171,63,136,40,
+    123,231,184,244,252,177,32,223,107,47,112,3,227,129,19,80,
+    140,121,29,227,96,72,142,125,185,95,196,248,253,177,227,23,
+    25,45,154,140,40,175,187,227,49,246,168,67,40,227,53,185,
+    119,125,39,12,185,254,218,97,78,192,77,89,102,183,164,231,
+    21,34,130,248,30,111,6,253,1,102,226,82,136,71,148,225,
+    240,164,31,185,30,111,201,232,9,235,71,116,62,252,5,166,
+    114,228,191,141,144,185,27,114,186,98,132,206,104,194,228,147,
+    205,96,93,104,184,45,32,190,248,210,133,102,188,147,94,93,
+    143,95,166,203,119,226,221,108,17,150,86,126,154,214,119,211,
+    74,214,30,124,51,183,126,152,91,241,179,204,128,155,183,18,
+    237,70,42,113,53,23,182,82,178,238,181,117,222,8,54,59,
+    195,131,35,234,70,97,167,75,3,89,153,215,68,108,36,231,
+    11,185,33,183,108,56,158,240,106,145,205,155,106,72,152,17,
+    53,101,243,198,195,252,39,62,98,171,194,149,239,24,98,1,
+    153,138,16,202,238,3,90,75,192,202,37,133,235,73,41,41,
+    92,75,74,201,234,75,232,118,6,255,195,199,195,223,210,252,
+    185,36,53,107,224,31,109,39,195,151,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/HBMCtrl.py",
+    "m5.objects.HBMCtrl",
+    embedded_module_data,
+    490,
+    740);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,47 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,123,204,128,4,88,161,244,103,35,32,49,157,33,133,
+    33,133,49,135,33,4,66,51,134,48,48,49,184,51,164,48,
+    181,48,164,48,167,50,45,99,102,96,88,205,12,211,24,197,
+    156,194,18,204,160,201,250,18,196,209,100,188,197,168,149,140,
+    108,46,35,204,92,41,176,185,169,12,81,140,41,12,81,76,
+    41,32,125,140,81,44,41,76,81,172,41,204,64,253,44,183,
+    120,61,124,157,157,243,243,74,138,242,115,114,82,139,170,68,
+    115,83,115,245,51,114,147,227,147,225,98,122,25,25,85,194,
+    233,169,185,166,86,86,40,106,253,52,217,110,113,196,199,231,
+    37,230,166,198,199,223,226,138,143,207,205,79,41,205,1,177,
+    121,226,227,11,75,19,115,160,50,44,37,149,5,169,183,184,
+    146,43,42,226,51,82,19,83,82,139,110,113,130,216,201,57,
+    137,197,197,43,25,62,131,156,249,75,162,184,40,89,31,100,
+    53,138,13,122,5,149,69,160,16,2,19,110,64,92,44,11,
+    36,26,224,240,6,183,84,131,203,13,65,141,6,175,27,2,
+    170,13,158,32,88,196,11,83,239,7,244,28,127,174,169,94,
+    126,82,86,106,114,73,177,94,132,83,34,208,102,160,64,65,
+    98,81,98,110,241,45,126,191,252,188,228,252,140,212,162,212,
+    188,18,144,28,196,38,30,16,1,54,131,15,228,46,14,27,
+    136,167,236,138,132,160,161,90,28,2,36,62,48,51,50,50,
+    126,240,99,100,96,148,187,192,32,11,65,55,24,196,47,192,
+    208,7,27,102,70,181,15,12,152,196,4,255,143,32,234,11,
+    22,41,176,173,0,90,59,138,253,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/HMCController.py",
+    "m5.objects.HMCController",
+    embedded_module_data,
+    361,
+    541);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,52 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,81,207,79,219,48,20,126,78,218,145,134,78,43,
+    28,10,2,38,133,99,39,173,32,77,92,2,218,5,36,96,
+    18,213,180,161,29,122,241,178,216,91,65,113,211,57,41,106,
+    57,229,176,63,128,27,87,78,72,136,127,166,155,38,17,249,
+    202,137,91,166,238,180,211,236,252,168,168,168,253,252,189,231,
+    247,226,239,125,177,239,225,209,40,231,126,108,75,184,4,2,
+    4,121,112,156,121,148,123,237,24,52,216,7,162,253,0,162,
+    83,253,90,7,184,213,11,130,118,137,148,62,66,163,252,160,
+    54,13,36,208,43,247,49,127,241,221,120,47,229,167,208,70,
+    4,218,154,92,58,65,242,172,214,46,211,103,87,115,48,99,
+    16,253,26,201,78,104,210,201,200,58,137,231,7,52,164,220,
+    63,162,108,55,228,222,121,157,81,182,209,73,83,88,134,216,
+    149,201,102,167,115,190,250,141,178,45,219,150,41,159,15,109,
+    123,250,208,106,235,211,145,149,149,172,147,174,172,124,117,92,
+    106,133,190,213,15,104,171,81,17,6,198,93,135,81,140,133,
+    137,49,243,73,223,83,113,21,227,239,125,199,203,43,165,112,
+    216,163,194,116,7,3,220,161,14,161,92,84,84,236,122,78,
+    16,136,242,123,135,59,76,84,101,159,195,130,95,232,221,51,
+    118,3,99,245,55,255,150,3,238,110,40,233,83,194,154,189,
+    33,87,111,146,194,166,92,193,27,9,209,100,198,243,43,209,
+    94,188,208,136,222,197,181,215,209,97,98,194,124,237,206,92,
+    251,101,174,141,94,218,63,205,237,223,230,118,180,171,38,175,
+    21,44,45,121,101,139,108,171,233,127,57,165,110,24,52,243,
+    78,162,34,115,61,37,50,16,134,10,185,63,24,138,185,188,
+    154,137,120,161,32,37,90,80,146,141,157,236,38,222,242,186,
+    220,170,135,9,62,75,72,116,132,80,242,1,1,90,31,129,
+    149,89,12,75,163,194,98,168,143,10,75,76,3,237,36,240,
+    20,46,246,255,40,247,119,70,41,85,240,31,208,65,182,102,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/HeteroMemCtrl.py",
+    "m5.objects.HeteroMemCtrl",
+    embedded_module_data,
+    448,
+    694);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,78 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,84,203,111,211,72,24,31,63,226,56,206,163,113,
+    81,91,168,150,149,91,4,82,144,182,61,245,0,66,173,180,
+    203,163,97,183,128,160,18,82,46,142,241,140,72,88,63,210,
+    25,167,143,156,124,224,192,177,226,2,226,180,151,173,132,248,
+    87,246,16,86,72,27,205,117,79,123,75,69,79,156,246,27,
+    59,110,147,180,120,102,126,51,254,190,111,190,231,204,252,139,
+    198,190,220,104,254,218,0,120,135,48,194,146,135,182,211,89,
+    74,102,217,147,125,165,161,72,72,70,15,16,86,94,35,172,
+    18,229,72,65,232,147,146,41,105,168,9,47,7,60,237,28,
+    47,135,243,207,80,77,255,79,252,212,36,46,221,4,40,60,
+    107,251,143,95,188,34,110,228,142,59,35,101,206,44,38,206,
+    16,212,144,48,106,200,48,20,44,53,84,44,131,50,5,148,
+    169,220,216,34,254,47,45,226,254,78,104,111,214,39,254,42,
+    12,219,77,9,43,173,86,175,250,146,248,107,183,111,159,73,
+    61,170,105,92,183,237,192,241,137,109,115,195,182,253,16,119,
+    61,177,46,217,246,78,215,241,70,28,53,58,232,16,110,184,
+    251,251,118,139,56,152,80,94,16,107,215,115,24,251,136,190,
+    10,239,190,205,49,234,10,131,171,103,234,87,58,7,84,3,
+    94,2,53,24,236,42,64,124,218,6,197,133,248,238,192,188,
+    30,63,28,84,151,227,186,104,180,146,201,79,228,64,205,114,
+    240,215,119,115,32,35,162,97,229,8,178,245,41,203,24,106,
+    228,129,170,147,60,86,143,100,160,203,167,244,2,208,13,156,
+    155,146,46,38,210,69,172,77,73,151,72,249,143,10,186,224,
+    195,121,172,79,201,206,128,108,245,66,217,194,148,53,19,27,
+    80,181,34,55,207,18,182,21,6,237,40,164,189,197,169,226,
+    65,93,18,134,40,226,194,116,17,179,77,171,219,173,54,179,
+    58,33,141,44,70,2,204,44,74,118,186,132,69,204,114,2,
+    12,63,46,105,239,18,65,101,157,48,96,132,245,110,52,125,
+    135,69,132,54,45,216,23,132,123,150,235,120,30,193,86,83,
+    88,102,109,76,108,161,172,57,174,120,76,203,152,238,204,92,
+    166,248,122,147,121,206,46,57,167,215,237,116,199,244,222,239,
+    45,62,119,104,96,57,47,194,110,100,237,182,67,207,137,218,
+    160,192,10,3,239,160,119,173,30,176,200,9,92,98,177,150,
+    67,97,247,94,59,106,89,97,212,34,212,26,101,131,61,170,
+    205,210,188,56,47,186,128,130,0,67,64,81,64,9,128,23,
+    159,166,126,62,1,131,188,60,17,23,159,185,75,58,16,143,
+    19,17,252,196,161,142,207,181,52,29,188,244,116,20,73,186,
+    107,194,107,158,75,66,227,185,116,139,250,115,24,122,188,176,
+    7,113,216,194,237,228,228,114,3,12,141,42,71,203,194,151,
+    228,80,207,8,48,51,88,21,215,225,207,169,235,240,163,184,
+    14,63,137,235,80,139,235,67,13,205,89,135,191,14,244,91,
+    199,138,60,167,157,32,128,120,11,168,149,171,111,236,129,62,
+    215,95,216,0,70,69,48,42,90,124,95,136,47,29,254,118,
+    94,188,252,195,155,199,137,248,58,48,202,130,81,214,226,123,
+    192,48,231,223,25,111,141,247,107,253,229,245,207,213,141,47,
+    213,141,184,62,48,231,255,49,151,254,54,151,250,203,15,62,
+    155,155,95,204,205,248,161,104,105,4,194,111,241,100,20,252,
+    181,149,142,136,159,113,93,44,105,184,127,192,75,176,58,125,
+    192,168,154,93,227,52,226,201,44,124,211,239,164,15,205,58,
+    181,70,15,28,251,0,48,84,36,73,26,110,74,72,186,220,
+    71,11,105,31,160,249,126,214,7,104,185,63,217,135,154,34,
+    93,27,162,243,112,120,229,88,76,39,103,212,210,37,169,46,
+    13,209,197,248,190,112,156,204,39,223,225,39,190,255,15,68,
+    137,159,127,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/MemChecker.py",
+    "m5.objects.MemChecker",
+    embedded_module_data,
+    851,
+    1571);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,126 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,86,203,111,19,71,24,223,181,55,142,99,155,188,
+    200,11,136,211,41,148,86,180,137,243,32,65,96,1,37,77,
+    66,73,130,221,128,67,43,69,138,86,155,157,113,188,176,15,
+    51,179,110,176,163,160,28,122,224,88,113,65,202,37,57,33,
+    42,254,140,158,122,219,84,145,106,237,169,82,165,74,220,140,
+    224,196,169,223,236,218,73,108,28,164,174,119,191,217,253,126,
+    191,249,94,59,243,121,255,17,142,29,45,213,241,93,9,196,
+    11,1,11,88,212,5,67,92,17,69,126,31,208,3,203,254,
+    24,172,142,210,178,16,16,190,23,112,240,23,1,75,164,229,
+    101,80,16,94,7,107,198,86,66,30,214,2,88,136,180,54,
+    96,225,128,64,68,18,198,173,47,3,160,15,212,244,224,39,
+    156,17,46,181,189,225,15,151,68,55,166,96,44,171,154,173,
+    216,154,101,194,179,248,181,122,60,222,218,188,119,125,94,188,
+    68,88,17,177,176,18,192,34,14,172,7,86,130,56,8,182,
+    36,55,156,34,70,70,205,17,236,74,89,53,203,220,80,150,
+    242,49,205,33,89,54,21,131,200,178,27,145,101,195,194,5,
+    157,223,199,100,249,113,65,209,171,136,244,179,162,179,223,132,
+    119,220,209,135,110,70,213,81,131,24,163,96,115,198,166,122,
+    34,95,164,33,0,60,49,14,23,27,0,177,125,248,43,199,
+    186,127,189,227,68,227,219,179,252,71,219,107,212,186,52,164,
+    90,26,255,138,117,105,8,144,130,184,34,225,192,74,11,148,
+    43,132,131,47,1,127,45,30,22,177,149,132,247,218,132,38,
+    7,150,26,152,17,96,70,155,50,91,112,168,254,21,172,196,
+    78,228,182,226,112,3,247,20,112,219,155,114,219,112,164,129,
+    219,241,9,110,180,129,219,9,220,174,166,220,24,62,213,192,
+    237,6,238,233,166,220,118,220,209,192,237,249,4,183,179,129,
+    219,251,63,184,125,192,237,111,202,237,194,221,13,220,1,124,
+    26,150,101,143,219,90,93,66,165,14,190,158,224,146,85,190,
+    160,114,185,82,239,58,49,166,146,73,80,89,180,152,76,214,
+    120,23,151,115,26,67,121,139,218,136,18,150,183,76,204,144,
+    109,33,159,6,170,199,5,194,108,86,186,156,242,21,154,105,
+    19,154,85,84,50,140,84,197,68,107,4,41,104,246,254,116,
+    202,162,8,30,211,63,166,142,24,232,205,3,136,172,116,102,
+    57,7,134,115,150,142,185,221,172,69,1,217,160,154,77,216,
+    155,137,143,113,102,43,16,73,21,239,228,120,34,165,153,154,
+    81,48,124,37,90,43,80,136,7,28,131,37,130,216,134,102,
+    171,57,205,92,231,115,41,81,48,59,226,243,199,79,209,125,
+    39,52,204,157,12,84,211,99,124,71,23,116,206,200,91,186,
+    166,22,93,105,124,204,100,165,254,12,239,22,42,202,82,11,
+    210,51,49,210,21,24,212,98,169,175,10,172,41,234,163,99,
+    250,219,165,161,89,141,41,107,58,57,42,45,186,135,152,86,
+    34,8,92,168,143,210,151,206,80,190,203,104,132,11,190,51,
+    92,201,46,230,137,27,81,159,60,145,115,16,58,161,110,27,
+    191,87,117,133,49,55,118,223,123,57,140,44,129,57,87,226,
+    70,221,150,37,133,42,134,27,131,216,231,107,69,119,37,204,
+    117,173,75,4,234,108,218,110,159,151,165,156,211,214,115,178,
+    237,21,90,206,3,228,246,250,122,221,218,168,83,135,31,152,
+    76,91,55,161,171,245,26,154,41,251,37,226,144,236,151,206,
+    237,225,106,175,208,199,180,94,243,113,59,249,106,243,10,40,
+    87,107,215,122,215,175,134,219,207,188,42,201,181,242,201,213,
+    50,185,125,85,160,90,190,67,125,187,106,25,134,2,138,13,
+    205,196,214,134,43,125,103,89,186,219,131,253,154,202,76,49,
+    53,187,40,123,149,164,167,120,5,189,30,216,193,69,87,77,
+    92,131,139,197,197,186,198,25,237,217,158,45,119,157,223,94,
+    40,119,126,181,61,95,9,11,177,129,103,215,157,129,111,247,
+    163,183,14,162,183,182,103,43,33,33,214,245,87,52,254,103,
+    52,94,14,223,120,27,12,196,66,239,5,16,128,116,11,67,
+    23,118,87,119,86,95,77,56,163,11,251,241,197,131,248,162,
+    35,157,5,19,241,243,187,169,157,212,171,243,78,98,126,127,
+    112,225,96,112,193,145,206,128,29,80,167,119,210,229,112,196,
+    137,93,7,67,113,110,40,30,226,88,68,24,252,124,247,230,
+    206,205,67,108,144,99,131,128,13,0,54,16,127,241,244,249,
+    211,189,156,51,182,176,223,191,120,208,15,94,122,42,49,225,
+    179,47,118,141,29,227,213,109,103,50,181,63,148,62,24,74,
+    59,210,185,50,248,224,17,93,113,46,47,238,199,239,30,196,
+    239,66,68,127,247,158,125,177,250,124,117,239,138,243,205,204,
+    126,239,236,65,239,236,118,186,124,14,237,38,119,146,123,196,
+    25,73,237,159,75,31,156,131,217,3,254,233,87,142,215,75,
+    249,3,218,201,45,205,204,83,75,37,4,195,30,96,155,119,
+    20,147,49,203,76,78,140,141,79,38,249,202,26,81,225,13,
+    82,75,215,9,29,142,32,164,20,236,28,108,125,255,184,129,
+    54,167,77,12,139,131,161,234,60,232,9,56,130,62,58,210,
+    36,167,160,233,117,133,110,40,250,9,148,105,133,229,8,44,
+    75,180,8,190,180,19,72,203,57,203,0,103,183,19,232,39,
+    98,106,176,244,78,50,102,106,180,128,49,56,77,39,208,3,
+    172,229,181,45,30,188,173,217,176,63,143,130,207,64,219,128,
+    5,200,55,255,38,239,105,91,232,40,89,198,59,23,202,22,
+    236,2,111,35,69,102,19,3,41,20,122,137,77,84,79,71,
+    158,228,117,139,122,159,20,158,241,53,203,122,116,232,0,140,
+    243,10,162,205,249,185,185,185,45,228,237,86,211,227,66,1,
+    50,69,35,111,49,13,58,22,20,12,246,45,56,130,165,15,
+    93,114,26,208,34,131,238,108,101,129,196,93,178,38,201,65,
+    202,40,99,101,237,13,133,66,83,222,156,207,44,77,103,50,
+    91,136,251,27,70,41,190,223,40,41,14,163,153,233,97,244,
+    32,3,34,197,195,70,19,151,71,38,166,134,61,150,23,110,
+    94,89,39,236,88,45,0,24,25,153,24,31,243,193,194,154,
+    174,193,251,160,85,176,154,198,140,101,228,11,96,30,220,171,
+    26,177,139,30,183,72,20,138,234,13,249,30,10,84,71,199,
+    129,156,109,231,89,114,116,20,91,90,194,162,235,163,227,99,
+    137,241,241,177,107,163,126,2,9,62,47,113,229,234,228,228,
+    228,85,127,62,240,234,230,127,138,31,217,138,164,47,181,185,
+    49,99,42,81,251,206,99,148,127,39,66,91,155,74,88,107,
+    15,225,165,177,196,61,43,83,253,23,116,219,64,157,231,221,
+    148,185,97,126,75,173,39,208,250,231,204,130,225,247,182,200,
+    17,215,111,48,245,77,231,67,248,186,255,157,119,147,242,207,
+    53,254,137,196,126,7,81,9,138,162,88,185,47,10,226,151,
+    142,112,241,248,89,22,46,56,181,179,44,244,59,181,179,44,
+    244,57,181,179,18,17,197,161,138,240,177,120,102,191,229,195,
+    251,35,109,103,66,252,65,172,8,205,229,179,135,111,189,241,
+    253,113,100,13,130,58,181,29,43,75,209,74,160,163,69,122,
+    219,210,45,6,222,11,32,42,245,194,75,242,63,232,46,41,
+    41,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/MemCtrl.py",
+    "m5.objects.MemCtrl",
+    embedded_module_data,
+    1617,
+    3024);
+
+} // anonymous namespace
+} // namespace gem5
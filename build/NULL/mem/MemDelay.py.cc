@@ -0,0 +1,79 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,84,191,111,211,64,20,190,179,19,199,78,226,252,
+    160,13,69,64,133,17,5,17,134,22,129,16,80,10,12,20,
+    40,80,10,106,43,129,178,56,198,119,162,1,59,49,62,23,
+    104,164,34,15,12,21,11,21,75,59,50,85,66,252,39,76,
+    169,212,193,186,9,137,137,45,21,157,58,113,103,199,37,73,
+    75,253,227,243,221,251,222,189,123,231,251,222,253,2,93,87,
+    178,243,253,51,203,96,13,32,128,160,5,108,88,129,144,183,
+    5,75,152,7,2,184,15,144,248,17,160,4,134,27,34,0,
+    223,197,120,112,69,12,185,36,227,36,44,246,113,9,148,154,
+    3,101,249,55,239,148,33,85,239,88,13,243,53,70,79,94,
+    188,194,166,199,12,240,130,217,157,72,34,78,164,25,38,130,
+    65,5,34,80,17,216,43,34,200,130,9,149,36,18,43,146,
+    0,112,10,37,54,32,155,10,238,77,37,51,171,130,101,148,
+    220,16,152,93,216,179,167,153,61,131,164,62,239,108,232,157,
+    69,169,62,111,21,201,44,97,133,202,143,177,61,137,45,99,
+    105,183,96,99,123,140,189,58,226,221,209,133,133,102,238,37,
+    182,175,140,143,199,30,243,205,177,249,133,26,209,156,134,235,
+    105,4,215,17,209,92,252,102,17,19,143,104,70,29,177,142,
+    137,107,111,49,183,18,167,81,39,152,52,207,85,109,131,120,
+    216,173,106,108,92,189,241,78,51,13,203,194,72,171,242,121,
+    72,13,97,157,7,171,118,7,238,138,210,21,59,158,46,14,
+    124,182,74,44,227,45,222,23,215,116,22,187,226,206,148,115,
+    84,214,245,186,97,99,93,167,105,93,183,27,104,209,226,237,
+    172,174,191,89,52,172,14,147,240,150,28,76,211,230,251,247,
+    250,2,54,16,118,169,194,219,166,101,16,66,101,227,5,241,
+    92,195,244,104,102,54,74,233,41,139,77,213,158,37,208,252,
+    36,118,88,234,134,135,209,83,195,53,108,42,69,43,167,217,
+    217,78,210,209,168,158,4,105,50,92,197,55,240,135,239,201,
+    238,0,113,77,190,3,99,241,31,31,117,150,92,137,49,33,
+    156,103,47,249,192,192,223,187,131,76,201,159,12,138,103,252,
+    135,65,65,243,31,4,249,1,127,234,231,224,169,213,71,129,
+    124,125,91,20,74,210,14,96,224,63,110,75,32,55,188,162,
+    7,114,169,53,116,155,17,57,78,228,36,255,30,35,74,167,
+    87,167,247,187,171,39,87,158,132,238,183,24,161,114,66,149,
+    252,187,252,118,135,226,132,14,86,244,143,255,42,26,75,95,
+    83,224,128,11,137,76,227,189,234,148,15,241,237,215,189,114,
+    136,175,212,95,35,135,248,246,87,72,166,83,33,185,185,154,
+    237,88,56,222,19,151,143,111,14,70,165,209,75,81,225,162,
+    215,60,50,203,20,20,139,87,11,107,169,57,208,177,69,66,
+    136,141,207,220,154,135,251,60,7,99,99,183,235,76,57,235,
+    202,252,175,43,28,210,28,50,28,178,28,84,6,52,25,105,
+    46,53,205,244,87,55,151,168,236,178,9,117,22,154,42,157,
+    22,113,168,242,142,199,14,173,233,184,73,28,247,40,143,18,
+    110,234,49,14,199,99,152,224,122,179,251,244,118,98,79,111,
+    231,252,7,63,243,131,159,151,63,45,175,207,183,206,92,221,
+    204,95,219,202,95,243,167,130,66,105,77,253,162,174,163,214,
+    200,245,205,194,248,86,97,156,249,29,96,11,138,71,215,134,
+    191,12,175,123,173,179,55,54,139,19,91,197,9,255,33,191,
+    163,76,248,252,51,229,36,61,102,95,25,109,132,103,40,25,
+    237,57,82,93,126,244,82,133,209,14,95,57,137,202,36,204,
+    189,119,61,187,242,68,84,244,183,220,17,214,229,7,35,249,
+    200,160,45,66,8,219,83,16,192,203,45,112,169,251,9,192,
+    80,43,126,218,82,17,74,109,176,31,86,150,183,249,103,231,
+    159,245,188,2,111,182,193,126,88,125,190,205,63,59,7,80,
+    97,150,127,1,210,203,189,138,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/MemDelay.py",
+    "m5.objects.MemDelay",
+    embedded_module_data,
+    872,
+    1697);
+
+} // anonymous namespace
+} // namespace gem5
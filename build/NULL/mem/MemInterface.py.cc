@@ -0,0 +1,107 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,150,205,111,211,72,20,192,199,73,154,166,73,72,
+    219,164,105,146,210,174,188,236,138,18,182,80,132,40,139,10,
+    109,151,166,133,150,150,10,165,69,72,145,192,114,236,105,227,
+    197,31,97,236,80,226,3,242,97,15,43,46,160,94,186,226,
+    178,213,30,144,86,252,51,14,138,68,52,167,149,246,196,45,
+    8,78,156,118,198,78,210,196,109,214,31,207,51,243,126,243,
+    230,205,123,51,182,255,5,93,199,64,235,249,165,64,196,33,
+    16,129,200,200,64,97,10,12,67,203,62,217,183,227,62,253,
+    59,192,7,238,2,209,255,27,16,3,48,240,206,15,192,123,
+    127,219,72,97,192,209,13,16,93,16,50,30,93,80,28,220,
+    6,217,208,39,90,201,50,56,118,187,168,27,136,23,140,251,
+    80,209,80,149,180,48,23,133,110,143,124,109,143,198,29,143,
+    32,40,48,34,40,248,246,136,103,127,49,5,191,232,35,214,
+    252,120,240,182,40,162,251,124,153,20,195,121,45,207,47,243,
+    185,82,78,235,148,181,92,137,150,115,45,205,86,54,128,67,
+    28,167,242,10,228,56,28,230,56,69,19,43,50,45,71,57,
+    238,89,133,151,91,154,192,115,94,214,255,6,95,232,248,223,
+    82,58,18,102,21,168,204,18,79,215,85,3,162,93,94,128,
+    151,203,85,20,36,90,71,92,35,183,158,33,194,234,156,141,
+    200,156,237,92,214,10,61,209,112,155,237,153,99,160,61,199,
+    183,190,238,57,146,219,47,50,133,128,232,43,12,136,254,66,
+    16,14,30,133,192,41,135,24,16,7,222,145,158,239,219,177,
+    2,133,161,190,44,137,191,135,13,19,54,114,42,27,18,135,
+    60,108,148,176,103,78,101,195,239,24,66,50,29,50,214,215,
+    131,136,135,28,238,75,70,61,228,72,223,209,207,120,200,209,
+    190,54,99,30,50,222,151,28,246,144,137,190,228,136,135,28,
+    35,100,242,84,114,212,67,142,247,37,227,30,50,213,151,76,
+    120,200,116,95,114,204,67,102,250,146,73,15,57,33,142,147,
+    125,150,194,209,238,197,191,99,142,209,253,64,110,78,234,108,
+    136,82,201,156,216,131,202,220,252,188,226,236,232,249,249,238,
+    46,159,126,33,214,204,169,173,138,82,132,136,213,118,217,125,
+    36,25,144,125,86,129,21,200,66,213,64,18,212,63,177,148,
+    153,60,102,16,228,197,94,4,209,60,152,227,116,211,67,93,
+    103,21,190,92,150,212,61,182,172,201,146,80,53,147,219,146,
+    9,105,71,215,3,86,132,207,37,1,154,87,69,222,224,217,
+    98,69,103,247,37,209,40,177,146,202,22,37,67,103,119,53,
+    196,66,94,40,245,226,179,66,73,42,155,19,203,21,164,27,
+    172,12,213,189,146,193,94,88,222,204,58,221,32,111,232,230,
+    249,7,252,30,100,47,32,109,159,24,221,221,133,40,203,234,
+    116,224,50,241,186,219,6,123,60,19,183,89,119,218,117,7,
+    68,188,250,212,60,219,53,87,82,119,53,66,137,87,85,40,
+    155,233,99,101,177,163,116,186,69,115,178,38,60,165,117,73,
+    19,205,171,174,171,98,5,241,134,164,169,236,5,163,90,150,
+    4,94,150,171,196,189,246,36,200,180,103,217,171,172,80,21,
+    100,168,103,205,233,71,78,248,13,205,137,241,12,171,147,247,
+    158,99,155,213,247,37,131,120,73,130,106,72,10,52,167,243,
+    52,7,132,115,242,245,63,224,217,60,109,164,6,79,42,183,
+    178,103,81,152,36,14,209,183,13,138,18,129,3,196,73,136,
+    67,124,235,35,128,195,194,139,23,92,137,140,5,17,30,162,
+    101,65,230,117,29,15,60,224,17,175,224,208,67,85,151,246,
+    84,40,226,81,199,15,206,141,59,71,195,142,71,232,20,186,
+    91,156,247,44,142,242,100,145,112,173,21,130,195,238,103,134,
+    46,16,28,113,179,209,234,221,170,144,229,193,57,203,3,71,
+    157,168,113,110,212,112,178,165,39,217,238,25,180,149,81,142,
+    36,129,163,83,198,163,78,6,157,122,43,131,56,86,236,52,
+    57,200,224,38,111,64,85,168,98,191,145,219,192,65,99,249,
+    97,126,123,135,132,226,209,78,158,200,252,206,35,170,216,70,
+    49,26,37,231,131,49,66,69,188,45,110,144,91,231,152,222,
+    207,76,198,90,105,12,39,172,181,198,232,180,117,175,49,50,
+    99,173,55,163,32,243,221,159,177,183,177,35,100,255,116,175,
+    150,222,168,167,55,236,64,178,145,154,60,124,121,240,242,168,
+    104,95,92,171,165,214,235,169,117,59,48,214,12,130,177,204,
+    225,194,193,194,209,164,61,123,183,150,88,171,39,214,172,77,
+    210,154,72,127,140,159,251,16,63,103,255,48,95,139,223,172,
+    199,111,90,27,255,184,6,26,161,91,159,253,190,116,240,43,
+    32,162,99,98,241,96,209,62,183,88,75,44,213,19,75,214,
+    102,99,242,251,143,147,51,31,38,103,26,161,43,4,158,162,
+    240,20,129,51,4,78,79,81,43,246,249,99,39,26,233,41,
+    234,174,61,189,82,75,175,214,211,171,212,217,228,196,225,147,
+    131,39,246,143,139,181,228,82,61,185,100,109,53,195,32,50,
+    242,250,210,171,75,127,196,106,225,233,122,120,218,202,53,227,
+    32,150,120,253,248,213,99,215,165,24,29,37,22,180,238,16,
+    52,58,250,122,225,213,130,157,89,174,69,114,245,72,206,90,
+    33,3,159,108,139,182,76,218,233,185,90,248,122,61,124,221,
+    202,209,211,141,61,141,248,86,118,16,103,148,185,203,90,241,
+    87,40,24,250,229,222,127,22,68,127,110,240,16,209,151,233,
+    42,213,113,136,22,145,246,162,138,3,171,106,69,113,127,16,
+    156,244,245,166,244,91,232,150,251,227,177,136,174,144,42,125,
+    219,234,111,136,104,250,25,134,105,230,25,192,204,217,224,90,
+    247,213,0,41,187,125,53,192,184,221,190,154,113,134,185,222,
+    4,39,197,239,226,103,250,248,122,220,26,186,193,252,220,4,
+    39,197,155,197,207,244,241,245,20,149,227,241,127,249,124,154,
+    101,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/MemInterface.py",
+    "m5.objects.MemInterface",
+    embedded_module_data,
+    1313,
+    2599);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,112 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,86,205,111,19,71,20,159,245,231,218,89,59,113,
+    98,199,31,208,224,66,129,166,2,227,196,36,173,34,74,201,
+    23,33,129,68,85,98,138,88,137,174,54,59,147,196,173,119,
+    29,102,55,36,177,168,180,7,14,8,85,42,173,42,129,184,
+    192,9,181,226,92,245,223,216,72,57,172,246,20,169,167,220,
+    140,66,47,156,250,102,109,199,118,8,93,207,188,121,243,222,
+    111,102,222,204,252,230,37,255,160,182,207,223,104,15,40,136,
+    103,8,35,204,149,145,202,137,28,199,116,79,217,163,122,69,
+    175,171,123,203,62,213,47,250,93,221,87,14,20,235,109,176,
+    136,60,104,6,97,255,35,132,3,196,255,218,139,208,27,111,
+    115,114,145,119,125,65,240,241,132,63,226,11,225,208,18,26,
+    12,239,179,206,32,231,4,199,49,166,243,242,58,83,231,137,
+    58,105,208,50,168,2,168,179,154,65,232,138,172,16,232,115,
+    95,40,237,209,251,154,209,127,206,177,232,9,18,57,140,68,
+    15,84,47,230,68,31,246,136,126,18,120,21,68,199,124,216,
+    139,125,175,61,16,145,167,21,237,255,96,253,71,176,33,192,
+    134,143,197,6,112,240,8,182,235,163,88,30,135,142,96,133,
+    143,98,195,184,235,8,54,2,216,232,177,88,1,71,142,96,
+    187,113,244,17,18,123,112,55,156,121,143,35,44,124,55,127,
+    120,172,213,184,74,212,75,218,3,85,42,53,77,185,181,181,
+    106,102,149,168,35,99,99,224,171,208,237,177,177,246,17,14,
+    55,84,205,204,203,91,217,117,162,225,146,182,154,221,164,37,
+    131,100,149,138,170,202,26,214,171,233,118,31,37,50,62,116,
+    57,254,161,124,94,211,171,169,241,7,132,202,171,36,11,211,
+    214,17,101,217,32,154,178,237,248,135,93,64,186,29,80,159,
+    190,137,240,13,141,0,32,58,174,40,68,215,155,214,235,213,
+    66,113,179,146,85,182,149,50,209,97,198,251,27,37,74,112,
+    214,168,100,117,136,163,190,4,4,112,36,82,133,107,59,53,
+    118,88,140,158,7,121,196,200,100,180,249,94,67,125,115,216,
+    251,137,123,136,30,114,210,161,255,33,7,135,202,85,229,112,
+    182,241,205,106,186,33,107,70,9,66,203,26,107,36,91,63,
+    67,88,85,51,104,165,92,38,212,13,101,185,4,162,100,64,
+    140,135,3,25,88,217,160,148,104,70,182,117,25,135,238,65,
+    15,101,140,119,124,152,202,234,160,199,241,233,164,188,226,132,
+    91,243,234,108,15,217,236,251,164,78,149,75,236,86,219,111,
+    45,183,190,77,123,192,95,77,118,88,91,163,103,192,169,103,
+    64,152,232,223,48,234,255,228,215,187,191,223,125,28,182,51,
+    3,143,195,63,119,219,221,105,139,79,31,176,253,46,12,198,
+    28,94,146,52,89,37,146,228,132,37,73,173,224,141,50,211,
+    5,73,186,191,33,151,27,30,159,177,189,78,32,188,173,45,
+    105,13,206,159,80,39,196,116,165,44,235,64,132,111,101,216,
+    132,195,223,214,244,210,170,70,176,211,171,202,91,82,131,52,
+    146,123,77,186,19,107,183,177,59,212,157,224,173,38,81,140,
+    197,233,241,41,39,96,220,89,156,45,78,67,119,105,122,97,
+    202,241,77,84,42,101,39,106,108,86,36,151,11,18,197,155,
+    212,221,246,159,136,246,66,67,99,76,240,77,145,99,123,254,
+    219,221,115,243,103,119,165,205,41,59,118,222,156,179,123,46,
+    152,179,53,30,101,78,189,28,120,49,240,135,215,186,56,187,
+    147,158,219,77,207,89,190,126,48,167,7,94,70,95,68,95,
+    233,214,133,153,157,212,141,221,212,13,203,151,168,9,40,210,
+    251,203,252,147,249,231,231,173,51,95,239,8,87,119,133,171,
+    230,180,13,182,123,79,238,61,255,210,250,236,155,157,200,181,
+    221,200,53,243,186,45,196,92,220,57,235,244,240,142,80,216,
+    21,10,230,244,94,34,243,76,252,77,180,249,136,213,61,245,
+    214,235,233,15,188,67,32,204,133,26,31,244,103,106,232,67,
+    81,223,19,219,73,71,98,108,114,243,224,123,212,145,24,57,
+    72,140,30,72,140,156,232,135,54,128,189,98,16,251,68,30,
+    244,16,246,139,97,168,93,56,32,10,56,40,70,48,47,70,
+    113,8,18,71,24,210,70,151,24,195,130,216,139,35,98,31,
+    142,138,113,168,9,168,253,141,116,18,1,66,73,195,151,243,
+    121,105,104,107,244,242,190,9,107,238,95,115,137,58,60,50,
+    58,225,4,70,134,134,103,74,19,251,44,168,125,118,21,251,
+    44,222,98,53,152,207,125,85,40,104,44,41,140,228,89,51,
+    226,62,253,224,208,229,220,208,40,83,10,185,66,97,216,181,
+    228,70,71,193,178,48,152,164,125,108,191,113,38,18,108,133,
+    152,203,20,105,121,99,101,133,80,73,47,85,137,211,195,136,
+    210,110,161,39,24,252,36,131,39,48,121,80,82,128,21,149,
+    205,246,33,93,13,115,125,124,163,179,188,161,75,155,37,108,
+    172,53,45,58,80,145,74,84,214,126,116,98,76,214,251,202,
+    154,172,105,4,56,183,124,104,114,33,194,242,6,213,13,169,
+    76,180,85,99,141,158,102,171,123,141,201,155,116,128,5,115,
+    138,137,44,179,5,140,137,219,139,75,69,120,44,119,138,139,
+    32,23,139,119,24,110,137,158,97,144,22,99,207,54,197,18,
+    99,172,217,201,216,212,9,160,158,157,76,91,190,248,94,250,
+    36,176,211,78,101,192,178,119,242,180,229,75,215,2,168,239,
+    132,121,115,207,117,219,201,20,147,169,52,27,144,72,154,11,
+    123,125,113,243,214,94,34,13,28,11,160,174,184,57,185,39,
+    244,49,194,198,25,67,19,76,235,55,175,3,217,65,159,178,
+    193,63,101,135,251,204,73,246,171,7,119,214,77,8,97,39,
+    165,142,228,42,203,63,16,197,208,115,83,139,227,173,4,67,
+    89,78,133,215,221,114,55,254,188,215,115,89,178,211,209,26,
+    198,254,51,113,66,224,93,103,137,66,119,120,166,210,202,214,
+    118,253,241,186,231,209,121,70,239,249,43,245,76,116,149,78,
+    52,222,128,254,23,136,154,151,227,184,218,13,14,113,23,45,
+    116,161,189,216,232,156,213,89,108,148,183,58,139,141,146,86,
+    179,216,168,223,106,150,154,144,229,224,13,126,40,158,94,121,
+    203,154,119,45,235,28,247,41,23,175,161,15,197,211,91,111,
+    89,243,238,24,151,187,173,255,0,244,230,140,182,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/NVMInterface.py",
+    "m5.objects.NVMInterface",
+    embedded_module_data,
+    1405,
+    2475);
+
+} // anonymous namespace
+} // namespace gem5
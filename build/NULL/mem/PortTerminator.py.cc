@@ -0,0 +1,55 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,82,207,107,212,64,20,126,147,100,99,18,139,108,
+    98,169,138,151,173,138,144,30,182,23,91,74,17,241,32,202,
+    246,80,197,22,161,185,12,49,51,118,87,242,171,147,44,180,
+    123,202,193,63,192,155,255,65,65,252,103,246,24,230,36,120,
+    242,150,178,61,121,114,38,217,44,221,213,204,228,155,55,223,
+    123,111,190,55,143,249,5,55,190,206,124,157,237,10,248,6,
+    4,8,10,225,88,174,74,136,34,197,83,16,40,240,6,136,
+    250,5,136,70,149,75,21,224,135,218,38,123,42,233,28,129,
+    171,255,150,27,23,113,180,37,192,60,26,69,111,63,126,166,
+    65,30,220,20,106,147,102,175,107,33,10,30,34,224,41,68,
+    30,130,60,141,40,94,71,1,170,19,245,18,9,9,180,144,
+    184,37,88,131,104,43,172,217,8,243,59,239,18,150,31,83,
+    22,141,98,63,79,216,100,35,162,209,118,42,56,156,47,200,
+    254,112,56,89,63,165,209,206,254,254,74,244,238,7,81,101,
+    194,122,50,161,247,73,24,65,18,199,130,26,197,167,189,54,
+    95,218,140,102,105,18,103,180,14,204,250,147,173,213,188,229,
+    224,179,49,205,242,121,236,161,107,113,3,227,216,143,40,198,
+    220,194,56,74,200,56,148,246,26,198,103,99,63,156,123,180,
+    252,34,165,220,10,206,207,241,144,250,132,50,110,74,59,8,
+    253,44,227,118,163,247,190,57,89,94,130,155,66,6,215,18,
+    220,105,189,77,145,181,219,146,37,55,254,239,48,147,45,251,
+    243,32,99,193,182,108,207,114,19,250,233,5,211,133,191,134,
+    158,248,179,129,128,98,49,202,219,15,139,87,165,237,22,7,
+    101,247,105,49,248,217,221,156,118,55,75,227,229,149,170,216,
+    250,53,8,40,6,149,14,206,147,169,253,184,52,158,9,218,
+    145,180,163,23,7,114,48,167,61,251,208,213,184,25,237,244,
+    83,159,249,81,198,215,132,185,120,41,76,107,163,152,45,161,
+    78,186,43,171,54,158,55,13,123,193,54,196,86,62,128,236,
+    68,64,165,34,132,170,61,64,247,167,112,175,153,37,60,154,
+    46,207,74,183,144,94,193,191,240,245,228,74,46,215,255,113,
+    213,210,127,1,59,19,222,170,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/PortTerminator.py",
+    "m5.objects.PortTerminator",
+    embedded_module_data,
+    488,
+    802);
+
+} // anonymous namespace
+} // namespace gem5
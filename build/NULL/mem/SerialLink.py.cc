@@ -0,0 +1,88 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,85,189,111,219,70,20,63,234,131,166,62,45,169,
+    81,228,22,14,66,187,117,80,117,144,138,182,9,208,160,72,
+    145,218,138,171,196,118,12,219,233,160,133,162,120,103,73,53,
+    63,20,146,74,34,13,1,135,14,70,150,24,89,236,49,147,
+    129,34,255,140,92,24,40,113,83,129,78,222,100,36,83,166,
+    190,35,45,155,146,157,146,212,227,221,189,223,251,189,187,247,
+    187,19,255,69,129,43,122,246,126,127,7,204,62,194,8,115,
+    42,210,184,26,199,177,118,72,13,109,161,16,90,70,56,252,
+    7,194,17,194,29,134,17,122,23,30,5,215,194,56,186,137,
+    138,252,9,235,20,57,154,90,84,13,101,135,224,199,141,223,
+    137,98,195,0,247,141,18,76,22,25,37,115,56,150,140,160,
+    26,135,81,45,132,25,17,87,139,224,80,45,26,66,132,199,
+    225,67,240,191,227,206,211,76,193,168,64,166,112,228,48,4,
+    227,161,243,241,24,140,199,113,116,2,157,240,208,9,204,79,
+    160,147,36,245,54,141,174,184,240,20,22,38,176,211,255,131,
+    141,77,96,51,128,205,94,137,141,227,196,4,54,71,62,123,
+    123,237,42,44,201,55,57,156,156,64,95,255,228,44,82,56,
+    61,129,45,0,118,230,19,216,233,9,236,231,56,3,178,101,
+    105,124,147,152,109,89,93,105,235,59,253,156,70,180,178,229,
+    245,37,21,6,74,173,86,63,211,36,218,237,187,119,3,168,
+    242,86,171,109,137,29,195,180,69,139,232,216,18,77,242,180,
+    75,44,219,18,101,29,67,71,33,237,103,132,141,90,29,67,
+    183,136,213,191,85,215,100,203,38,102,93,132,56,221,120,46,
+    42,178,170,18,44,214,33,157,100,181,49,145,24,89,61,72,
+    28,96,9,112,143,210,141,136,23,234,150,42,63,35,151,120,
+    149,78,55,192,123,146,129,245,246,197,173,22,17,245,174,214,
+    32,166,104,108,95,240,218,134,216,232,110,111,19,179,63,55,
+    137,56,75,115,1,161,225,111,117,171,127,147,225,84,217,38,
+    186,210,99,64,155,205,58,80,181,126,233,62,198,16,13,51,
+    149,245,166,31,223,145,161,107,183,76,163,219,108,193,155,4,
+    241,39,108,219,246,239,175,157,103,238,200,38,91,136,10,73,
+    116,8,111,235,108,45,129,40,79,26,241,107,121,71,46,121,
+    16,241,121,27,219,173,98,191,186,220,40,91,226,102,135,64,
+    13,128,134,200,74,107,156,43,64,229,51,137,151,168,44,22,
+    93,92,43,126,65,5,73,210,101,141,72,18,141,75,146,102,
+    224,174,202,218,73,73,122,218,149,213,51,79,196,238,117,8,
+    141,43,47,94,72,45,34,99,168,80,140,181,21,21,150,75,
+    19,27,126,141,215,65,4,154,26,211,154,78,47,145,14,104,
+    12,69,196,235,48,67,141,242,254,22,161,201,141,179,178,251,
+    81,99,74,210,168,39,55,141,250,33,194,19,88,77,83,39,
+    152,10,160,38,192,250,132,198,152,106,126,115,106,197,151,136,
+    70,49,81,229,30,77,252,6,255,71,134,233,199,198,152,68,
+    27,76,30,104,170,234,42,209,12,179,71,121,95,48,26,131,
+    93,32,121,197,167,252,147,170,110,223,249,129,198,89,165,36,
+    175,58,127,162,247,236,4,125,204,91,166,82,102,39,230,226,
+    108,148,58,61,147,7,159,103,202,240,179,146,32,174,115,126,
+    187,137,130,179,228,102,23,156,135,110,102,222,169,254,115,237,
+    230,222,35,87,248,241,52,28,202,243,31,16,24,103,117,200,
+    163,244,141,93,201,21,242,131,194,207,224,72,51,71,154,119,
+    30,128,35,63,183,183,114,25,158,154,221,125,236,193,239,129,
+    35,197,28,41,222,169,128,35,147,127,253,242,213,203,131,198,
+    96,126,233,104,186,114,60,93,113,126,117,51,249,253,244,155,
+    244,129,57,248,242,193,81,102,249,56,179,236,84,221,100,246,
+    245,234,171,213,131,133,193,220,47,71,201,197,227,228,162,83,
+    113,83,51,127,167,230,255,74,205,187,177,220,110,98,144,175,
+    140,205,36,142,178,215,25,141,43,196,92,225,209,105,52,156,
+    5,23,24,167,58,20,80,174,176,63,251,102,22,92,195,16,
+    23,43,158,70,35,57,112,130,113,30,178,219,92,24,149,103,
+    173,24,161,51,218,237,146,225,125,40,172,210,216,119,195,100,
+    223,23,26,3,55,219,192,154,229,87,245,43,102,60,130,91,
+    76,0,225,39,127,91,222,51,139,208,101,167,200,170,129,25,
+    134,57,142,27,174,115,136,251,126,128,190,11,62,46,42,12,
+    70,207,48,57,199,241,67,116,217,236,221,56,101,175,15,87,
+    184,188,220,255,1,191,248,3,111,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/SerialLink.py",
+    "m5.objects.SerialLink",
+    embedded_module_data,
+    1017,
+    1851);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,61 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,82,205,107,212,64,20,159,201,215,102,63,90,212,
+    213,195,82,164,131,224,97,65,82,16,122,89,212,147,180,168,
+    88,11,171,151,32,132,52,51,54,187,102,146,117,38,209,77,
+    79,57,120,240,208,131,7,65,255,130,5,241,159,233,49,228,
+    36,120,242,182,165,61,121,114,38,217,44,91,186,153,153,55,
+    239,189,95,222,155,223,123,51,127,192,202,167,47,246,139,61,
+    33,190,3,12,48,12,0,133,54,132,82,87,2,133,170,182,
+    90,234,106,160,81,221,214,33,80,192,62,192,218,103,128,117,
+    162,207,84,0,126,169,117,50,219,192,198,16,244,27,127,165,
+    209,135,133,126,232,50,151,10,197,16,10,9,99,161,53,135,
+    35,250,234,104,76,188,216,91,165,161,213,52,222,149,52,8,
+    176,33,6,182,34,150,138,161,173,97,197,214,21,64,140,113,
+    163,14,32,230,184,89,235,88,157,41,130,134,178,164,209,42,
+    255,109,47,113,109,6,5,14,151,120,7,235,130,166,81,220,
+    26,250,130,23,126,73,104,196,210,33,97,31,9,59,217,162,
+    132,238,240,210,239,208,18,112,120,137,88,190,127,130,142,9,
+    221,29,12,42,255,96,176,38,252,241,107,159,32,158,242,152,
+    80,244,201,39,140,160,88,56,98,151,29,147,24,85,105,81,
+    21,142,70,28,185,94,156,184,65,144,34,30,71,2,177,170,
+    240,36,28,77,17,143,188,247,34,100,226,198,254,74,162,138,
+    138,72,20,37,1,70,71,4,177,36,12,71,225,49,74,38,
+    81,104,29,244,55,10,211,113,66,151,18,199,41,90,142,67,
+    35,156,4,82,239,56,206,7,113,210,2,209,226,116,66,138,
+    150,55,157,58,62,113,49,97,69,83,234,94,224,114,206,228,
+    109,22,198,176,44,129,201,123,41,84,55,76,11,163,42,74,
+    32,49,19,7,22,237,138,138,35,9,254,4,23,178,175,255,
+    238,114,230,237,200,254,93,111,140,53,73,153,188,188,82,24,
+    98,241,67,33,178,229,200,219,219,217,211,252,166,149,61,207,
+    111,60,204,158,253,222,232,125,121,115,250,54,55,55,79,91,
+    185,185,127,174,171,155,198,37,16,34,219,155,155,160,187,253,
+    245,254,183,7,210,175,42,93,225,23,34,123,33,7,187,93,
+    31,113,208,111,20,77,186,107,77,228,11,92,20,101,74,155,
+    69,211,180,42,171,35,204,229,107,100,122,29,201,186,82,148,
+    137,238,200,162,204,71,85,23,159,176,158,48,229,35,226,145,
+    16,115,21,66,152,131,173,179,171,115,157,231,222,217,213,57,
+    55,218,208,152,131,235,226,71,239,92,110,151,107,160,146,208,
+    127,182,245,1,250,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/SharedMemoryServer.py",
+    "m5.objects.SharedMemoryServer",
+    embedded_module_data,
+    581,
+    954);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,69 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,82,205,79,19,65,20,159,221,238,246,107,75,105,
+    65,173,232,193,53,129,32,42,173,98,72,176,33,36,84,35,
+    1,165,33,208,83,47,155,237,206,104,215,236,71,217,89,62,
+    218,120,232,129,68,226,69,227,5,143,156,72,140,255,129,127,
+    69,49,36,54,115,34,241,228,173,4,78,156,156,217,109,107,
+    11,232,236,230,55,111,230,253,230,189,121,191,55,191,64,207,
+    16,219,243,233,20,133,61,0,1,228,12,80,240,103,174,0,
+    120,176,0,32,191,3,96,0,241,7,1,0,190,5,58,7,
+    139,1,40,172,129,9,241,55,91,76,112,132,187,175,245,198,
+    21,58,113,191,123,113,17,40,114,16,20,121,200,206,113,69,
+    1,242,69,145,7,40,8,3,7,28,141,202,117,163,134,80,
+    120,63,2,174,24,80,128,226,1,79,185,124,151,27,253,39,
+    55,8,67,23,184,18,229,198,174,228,134,97,228,2,119,0,
+    70,119,64,49,14,37,90,95,140,196,214,116,179,98,160,101,
+    100,218,78,181,150,52,145,153,193,222,142,66,205,116,185,92,
+    187,245,6,153,211,217,172,233,17,178,217,62,122,166,80,214,
+    177,92,177,29,87,198,200,130,88,118,16,174,216,22,70,88,
+    86,45,72,87,26,210,55,17,219,94,223,64,216,197,68,120,
+    242,200,194,181,219,171,254,90,118,237,238,9,217,80,93,100,
+    105,85,18,96,140,209,255,48,228,77,213,209,85,75,67,181,
+    200,227,169,244,204,130,158,203,224,218,221,103,182,89,210,45,
+    196,146,170,208,203,190,229,232,46,146,75,212,220,210,161,91,
+    214,184,30,89,152,205,122,125,26,244,250,247,14,80,45,184,
+    252,87,214,105,1,35,227,53,102,4,249,60,133,29,45,195,
+    36,233,173,58,93,169,146,168,102,91,174,99,27,6,114,106,
+    169,62,231,95,199,83,26,2,135,40,212,193,241,224,240,174,
+    116,202,18,231,39,6,73,88,81,44,213,68,138,66,162,138,
+    98,218,112,195,96,118,76,81,214,55,84,163,237,17,220,106,
+    5,209,52,219,219,74,153,22,132,28,18,97,182,102,168,24,
+    147,216,106,91,146,21,170,60,17,152,254,68,92,81,29,213,
+    36,161,87,109,25,67,29,61,165,182,161,80,217,200,160,127,
+    203,92,71,20,18,233,234,227,176,247,227,176,7,231,12,48,
+    144,24,136,29,120,192,138,121,239,21,211,249,154,210,72,253,
+    121,51,57,90,95,106,38,30,214,23,143,165,212,238,108,227,
+    230,226,161,180,116,36,45,81,79,124,248,163,249,193,252,242,
+    162,49,58,127,24,207,29,197,115,245,133,230,80,106,111,242,
+    243,228,190,216,24,95,62,28,202,31,13,229,235,47,91,65,
+    144,188,241,51,49,246,35,49,214,12,15,55,174,207,156,4,
+    248,100,240,12,80,168,47,182,194,188,120,173,5,46,131,127,
+    71,209,83,84,32,35,230,116,218,46,189,69,154,139,211,243,
+    37,236,58,170,230,250,149,146,8,117,85,152,52,152,196,251,
+    93,126,113,253,5,159,135,103,253,134,204,57,119,218,207,4,
+    23,40,180,2,28,199,181,242,28,224,238,53,192,184,255,55,
+    65,170,209,249,91,193,4,71,47,118,25,62,205,157,176,233,
+    236,10,151,151,245,15,173,114,63,190,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/SimpleMemory.py",
+    "m5.objects.SimpleMemory",
+    embedded_module_data,
+    714,
+    1198);
+
+} // anonymous namespace
+} // namespace gem5
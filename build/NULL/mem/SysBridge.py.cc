@@ -0,0 +1,65 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,82,205,107,19,65,20,159,217,36,219,36,77,236,
+    151,216,130,168,163,244,146,42,201,197,10,22,17,20,63,80,
+    161,150,166,30,92,10,203,118,231,37,89,217,143,116,102,67,
+    155,156,114,240,212,139,189,233,73,60,21,196,127,166,130,135,
+    48,167,130,39,111,41,237,201,147,51,59,73,172,177,157,221,
+    252,230,205,251,152,223,239,189,236,79,116,102,101,6,251,201,
+    61,9,31,17,69,20,251,104,67,237,134,143,3,195,50,48,
+    50,208,115,68,83,239,17,77,131,113,144,66,232,91,106,88,
+    108,165,104,166,138,74,230,47,117,40,97,129,151,36,228,170,
+    94,240,122,235,29,184,177,123,150,104,88,116,242,57,33,2,
+    100,97,138,44,131,98,121,9,178,210,212,176,50,52,101,153,
+    48,241,37,139,206,89,52,125,128,37,53,30,81,231,46,204,
+    204,140,101,230,13,4,147,212,28,243,22,164,183,72,39,198,
+    188,151,104,86,54,148,147,77,180,249,99,230,209,58,116,246,
+    222,112,32,113,195,227,100,43,113,144,56,34,110,20,134,178,
+    65,233,6,18,64,16,177,54,225,109,30,67,32,147,192,143,
+    194,186,23,214,85,94,188,19,17,234,213,106,192,32,140,243,
+    68,174,234,32,109,52,36,94,38,85,128,228,166,6,56,20,
+    24,169,121,62,144,90,196,136,188,23,136,23,74,51,112,98,
+    47,10,203,157,25,73,86,145,76,182,150,82,110,52,58,83,
+    117,8,150,87,86,254,234,45,86,163,22,115,97,192,212,41,
+    110,56,172,14,241,240,88,121,68,154,17,139,201,78,195,115,
+    27,132,67,72,57,97,176,221,2,30,115,165,216,33,177,206,
+    215,253,148,47,40,224,205,40,228,48,168,224,154,80,87,172,
+    150,166,68,214,182,67,39,0,219,22,121,219,14,34,218,242,
+    149,93,176,237,237,150,227,15,34,19,182,77,35,87,26,233,
+    184,221,4,145,119,119,119,109,61,0,145,83,182,235,59,156,
+    139,204,154,195,156,64,152,90,189,48,53,149,48,181,72,49,
+    185,174,165,175,73,133,98,82,59,109,37,87,20,214,7,26,
+    117,72,215,37,161,175,232,68,253,213,191,47,115,230,86,212,
+    60,71,163,43,55,219,204,148,161,4,174,203,31,223,145,208,
+    29,61,125,3,103,158,226,62,74,208,68,133,249,238,147,222,
+    204,98,247,101,111,250,102,247,197,81,113,246,195,230,222,230,
+    167,202,247,226,210,143,226,82,247,89,111,220,113,52,123,109,
+    255,118,47,123,255,56,101,204,153,167,72,66,247,149,188,102,
+    238,198,254,157,49,175,122,216,252,80,201,106,41,45,114,193,
+    114,185,169,70,193,69,65,154,163,175,135,165,135,89,236,138,
+    130,164,104,65,181,151,125,160,7,255,144,93,149,71,245,133,
+    243,183,18,250,41,140,113,255,46,194,11,135,104,94,191,61,
+    116,235,240,223,183,111,78,99,179,143,254,135,253,220,177,218,
+    78,207,9,37,212,127,0,143,231,53,58,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/SysBridge.py",
+    "m5.objects.SysBridge",
+    embedded_module_data,
+    651,
+    1115);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,78 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,84,77,111,27,55,16,229,174,62,44,43,142,221,
+    184,65,29,248,16,16,65,129,70,181,33,59,64,82,32,70,
+    220,2,65,2,215,57,36,105,98,160,136,46,11,122,57,146,
+    24,236,146,107,146,235,72,238,69,135,30,114,204,45,253,5,
+    1,138,254,153,4,200,193,216,83,129,158,122,83,225,158,122,
+    234,112,87,146,37,203,187,171,225,144,51,243,230,205,144,226,
+    95,100,234,169,140,198,179,239,80,188,39,156,112,47,34,7,
+    110,244,35,47,246,91,190,71,124,178,71,120,233,87,194,203,
+    224,127,40,17,242,71,105,28,220,42,241,202,75,210,168,254,
+    237,38,13,47,243,190,69,177,248,82,196,207,14,95,67,104,
+    195,233,68,227,160,179,39,121,34,32,45,143,147,150,207,61,
+    4,33,173,50,247,91,21,94,106,85,125,2,11,188,252,193,
+    195,52,222,36,77,13,87,23,121,229,194,106,157,87,49,249,
+    66,182,116,208,213,192,248,67,45,120,7,88,136,137,10,149,
+    182,149,166,19,50,134,182,181,138,41,23,237,54,104,144,150,
+    218,60,202,208,219,143,143,113,250,83,10,41,152,70,189,78,
+    241,249,185,11,146,218,55,106,58,90,167,82,10,217,161,170,
+    176,24,72,152,102,22,46,135,217,164,76,230,72,44,12,193,
+    140,82,43,9,212,8,142,33,10,163,128,42,20,186,88,9,
+    85,26,113,10,204,136,168,79,67,150,26,160,224,224,168,9,
+    187,192,211,8,120,142,230,114,99,224,27,173,144,72,225,112,
+    228,18,54,11,218,211,125,160,194,80,132,225,46,89,44,58,
+    35,170,64,207,89,78,104,32,173,220,243,176,127,9,138,53,
+    16,181,233,33,96,47,145,61,72,238,122,96,53,147,134,89,
+    225,248,204,213,130,43,236,88,137,130,177,179,9,99,144,34,
+    226,2,213,16,130,56,30,123,34,69,232,37,216,221,130,166,
+    171,218,249,27,22,207,242,236,50,59,1,155,175,17,9,141,
+    234,223,67,104,153,187,163,64,27,126,74,98,67,243,234,220,
+    97,48,34,78,163,130,183,73,0,23,221,246,68,128,205,65,
+    144,205,194,25,147,20,59,103,85,44,66,220,71,12,77,101,
+    232,130,88,52,222,79,230,154,145,38,137,210,200,125,148,253,
+    113,143,197,73,4,59,197,204,244,77,83,72,97,17,70,211,
+    93,186,143,170,112,250,237,124,219,142,2,33,57,244,118,183,
+    27,19,103,203,116,7,44,186,30,228,202,172,223,157,115,191,
+    195,162,244,221,153,78,204,121,207,113,104,170,212,6,142,47,
+    70,158,195,160,57,95,188,128,126,209,185,224,54,227,124,114,
+    61,134,120,171,56,252,193,40,170,219,61,89,237,64,124,111,
+    103,103,154,219,201,213,125,25,98,47,241,220,184,232,147,171,
+    207,82,219,81,227,233,211,198,149,172,22,4,18,247,60,8,
+    178,122,16,196,202,157,119,212,151,130,224,40,101,209,200,178,
+    16,4,92,133,168,148,109,63,129,172,30,246,122,65,23,115,
+    128,206,22,157,30,70,204,152,108,233,5,152,68,73,3,207,
+    17,58,91,24,17,206,174,188,0,252,159,24,155,175,214,198,
+    197,253,78,206,220,61,242,223,154,209,225,150,171,102,154,117,
+    51,233,235,42,90,115,113,19,127,102,15,197,96,242,14,253,
+    175,42,181,33,113,98,155,44,173,15,30,157,94,251,102,240,
+    228,244,139,175,7,251,127,46,175,191,141,126,251,225,211,242,
+    198,231,229,141,193,222,233,202,250,219,95,112,186,178,241,121,
+    101,99,240,163,123,245,151,99,228,167,141,114,182,24,223,107,
+    186,203,36,70,254,168,78,238,28,93,30,123,233,85,39,242,
+    160,235,142,113,237,65,209,165,239,245,26,78,221,141,104,94,
+    161,24,150,60,207,27,222,37,222,141,143,100,173,248,78,201,
+    173,143,179,223,176,122,211,219,28,146,121,241,238,254,63,110,
+    248,247,18,83,158,250,127,109,5,235,104,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/ThreadBridge.py",
+    "m5.objects.ThreadBridge",
+    embedded_module_data,
+    859,
+    1591);
+
+} // anonymous namespace
+} // namespace gem5
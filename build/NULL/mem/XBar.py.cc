@@ -0,0 +1,164 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,88,205,111,219,86,18,39,245,65,125,75,182,101,
+    203,31,177,29,54,113,157,200,77,156,108,82,39,69,54,49,
+    186,118,170,38,133,45,7,117,90,108,5,3,12,45,62,199,
+    74,40,82,37,233,141,45,116,1,29,246,96,244,18,35,151,
+    20,65,129,248,20,180,104,255,129,253,15,246,72,21,2,42,
+    240,20,96,79,190,201,136,79,57,44,118,230,81,148,37,74,
+    206,166,107,81,243,168,153,223,251,250,205,188,25,210,255,102,
+    218,254,252,205,246,205,127,64,60,103,36,70,98,101,166,200,
+    230,88,22,239,61,178,167,232,205,121,233,189,87,246,221,183,
+    91,63,109,125,50,87,12,228,2,44,227,97,62,103,36,255,
+    63,24,137,35,236,43,47,195,252,226,117,6,207,5,169,45,
+    0,182,32,9,186,108,33,106,11,129,45,220,101,11,83,91,
+    4,108,81,18,112,217,34,212,22,3,91,156,132,93,182,40,
+    181,37,192,214,215,101,139,81,91,63,216,6,72,200,101,139,
+    75,201,85,38,61,120,128,63,210,172,21,91,148,213,252,99,
+    34,173,172,63,34,121,3,20,220,234,142,110,144,34,220,177,
+    51,32,66,171,133,162,109,203,183,115,233,115,184,220,99,145,
+    75,194,228,88,137,201,121,224,235,149,216,156,79,242,228,252,
+    146,55,199,121,24,18,144,124,175,0,243,11,219,206,20,9,
+    145,160,228,127,229,1,189,167,157,9,18,145,56,23,58,74,
+    209,81,41,224,66,199,72,124,63,193,244,248,147,130,174,17,
+    250,78,68,134,92,200,254,19,145,97,23,114,224,68,100,68,
+    138,186,86,154,4,236,96,79,108,204,53,234,16,236,53,37,
+    197,93,218,97,232,63,210,179,127,66,234,115,205,53,42,245,
+    131,119,7,172,224,130,168,147,191,46,136,218,253,114,164,72,
+    138,151,182,215,69,109,118,115,179,28,127,72,138,115,55,110,
+    56,214,114,250,107,240,172,170,241,37,85,51,248,13,184,201,
+    171,138,2,170,130,242,144,135,126,188,94,144,8,53,234,229,
+    233,7,186,44,254,141,60,224,11,58,175,168,79,248,188,40,
+    203,68,226,31,228,75,91,2,194,4,10,123,240,206,33,1,
+    219,62,228,185,7,69,17,130,77,235,26,19,166,238,24,179,
+    47,163,169,138,65,20,137,151,69,104,242,59,229,68,70,213,
+    158,136,218,177,162,239,75,162,151,84,69,39,142,230,0,25,
+    44,199,239,16,81,34,90,11,118,250,182,104,136,37,209,216,
+    228,159,20,36,144,37,210,92,233,249,245,29,131,232,233,242,
+    159,238,245,88,183,168,240,106,201,40,168,138,40,243,18,217,
+    16,183,100,131,215,232,124,48,118,166,124,225,30,209,160,71,
+    145,23,37,9,212,58,95,20,75,37,236,135,195,24,155,164,
+    213,7,103,202,166,199,172,160,32,40,98,145,8,130,21,22,
+    132,162,42,109,201,120,31,21,132,111,183,68,185,105,241,25,
+    59,37,98,5,197,117,221,208,196,188,97,133,243,219,219,194,
+    38,221,141,21,194,251,188,44,234,186,53,96,211,237,236,30,
+    87,111,197,59,125,98,37,110,147,146,70,242,64,129,116,79,
+    212,196,162,229,167,174,180,250,157,190,223,110,17,221,176,187,
+    118,82,111,113,182,135,44,191,221,145,91,220,201,203,68,183,
+    250,54,154,14,17,154,196,90,137,13,219,33,45,69,159,214,
+    92,82,75,19,183,87,223,250,29,252,74,209,11,15,21,34,
+    89,126,234,12,43,210,190,146,64,147,52,203,183,160,170,178,
+    213,191,5,35,53,85,130,38,42,15,201,207,204,27,140,249,
+    183,9,93,203,95,194,32,199,136,158,45,237,104,65,208,82,
+    49,11,95,125,16,226,160,210,250,212,35,67,149,219,245,68,
+    178,114,167,222,63,89,249,162,222,199,87,238,190,30,58,103,
+    14,157,171,7,175,30,122,61,41,238,136,1,81,201,54,56,
+    38,54,190,187,82,15,166,204,145,79,193,16,67,67,140,171,
+    124,6,134,20,224,167,187,241,241,137,93,129,226,255,2,134,
+    56,26,226,92,37,211,56,195,140,76,60,255,238,217,119,230,
+    212,181,234,240,245,218,240,117,211,55,88,79,157,122,46,63,
+    147,205,179,31,87,83,115,181,212,92,101,165,62,60,238,6,
+    53,194,12,192,214,158,173,237,127,96,126,56,87,29,186,86,
+    27,186,102,47,108,224,105,246,251,172,121,234,102,53,122,171,
+    22,189,5,107,10,50,137,177,221,199,230,216,114,53,158,173,
+    197,179,149,207,27,113,102,116,242,101,248,69,184,30,140,153,
+    137,91,176,160,81,92,208,40,103,250,134,236,75,251,208,161,
+    169,35,179,59,121,231,205,24,115,114,102,135,28,227,179,18,
+    89,85,201,171,155,68,35,138,65,147,201,48,58,65,57,86,
+    10,78,214,25,178,179,142,11,159,77,115,90,24,215,16,65,
+    17,69,17,67,129,121,85,235,67,49,133,130,46,115,26,197,
+    121,71,108,162,95,39,152,78,191,142,131,95,251,103,208,165,
+    231,42,119,241,99,247,60,239,222,96,171,116,125,125,98,233,
+    34,220,126,160,103,194,245,186,75,25,32,67,189,144,36,12,
+    101,175,51,53,71,0,27,237,57,170,31,138,158,187,184,157,
+    140,117,23,194,56,96,79,40,132,80,224,58,177,125,239,192,
+    134,93,216,126,192,14,244,220,91,242,81,171,156,73,17,87,
+    175,33,41,10,193,17,179,162,139,237,145,49,136,145,209,21,
+    22,3,118,88,116,32,83,171,138,170,150,120,205,149,204,203,
+    67,171,68,134,100,5,197,65,167,128,141,130,12,105,169,0,
+    79,100,76,249,244,178,184,61,203,171,91,134,110,136,138,132,
+    121,151,98,116,30,170,137,250,132,72,229,97,10,208,0,129,
+    70,67,92,151,9,148,161,50,201,148,47,46,194,44,5,44,
+    16,198,38,212,160,188,166,234,58,172,142,38,237,146,90,80,
+    12,94,221,224,155,11,135,85,92,122,31,248,150,82,216,40,
+    64,178,133,114,241,118,202,126,154,2,128,104,80,84,171,203,
+    58,145,85,229,161,206,27,234,108,54,157,250,31,7,1,203,
+    191,54,10,194,74,209,173,9,93,185,53,66,121,203,80,86,
+    44,95,246,171,165,37,43,106,67,109,166,44,239,93,197,176,
+    82,69,113,91,104,35,74,176,137,178,245,77,126,4,202,143,
+    128,252,104,103,112,202,1,186,51,65,221,16,90,68,88,131,
+    45,93,219,110,53,60,90,22,7,149,2,188,105,121,69,101,
+    199,226,116,186,127,247,73,158,113,132,2,95,253,95,76,231,
+    73,30,197,147,124,14,79,242,84,229,46,164,182,201,179,47,
+    215,94,172,153,51,11,213,137,197,218,196,162,233,27,131,28,
+    56,56,250,123,114,234,183,228,212,254,125,243,163,133,106,114,
+    177,150,92,172,44,129,30,192,223,188,248,102,95,55,47,44,
+    87,39,178,181,137,172,13,63,86,127,86,157,200,212,38,50,
+    168,14,51,99,167,95,142,189,24,163,57,114,30,114,228,24,
+    230,200,49,200,145,41,176,141,127,240,242,198,139,27,212,134,
+    5,96,28,109,227,96,27,129,37,197,147,79,215,190,95,251,
+    97,250,199,25,115,122,169,26,91,174,197,150,43,25,252,216,
+    155,196,173,245,78,58,63,49,127,60,233,116,165,146,119,164,
+    157,71,145,86,63,247,243,117,20,122,197,122,206,192,117,39,
+    21,41,8,199,56,164,93,132,31,229,36,158,222,246,96,194,
+    195,219,111,31,222,182,176,211,112,73,229,248,146,170,62,222,
+    42,57,7,87,251,8,99,194,247,201,114,97,161,204,195,49,
+    44,20,183,138,240,152,87,18,243,5,99,7,79,75,251,113,
+    206,166,19,239,125,16,226,50,157,199,57,0,52,246,180,57,
+    20,215,80,92,71,76,120,153,20,85,109,103,21,66,217,138,
+    98,136,59,19,187,227,241,162,35,158,98,60,138,174,120,28,
+    193,120,156,198,120,60,75,227,177,71,81,126,13,37,185,59,
+    32,154,97,122,246,183,228,217,253,140,121,33,91,77,174,212,
+    146,43,149,37,252,216,179,95,116,7,138,243,162,246,102,190,
+    51,80,88,8,20,15,4,138,23,202,175,39,199,193,55,0,
+    47,11,65,201,251,171,251,245,42,36,249,115,97,137,3,247,
+    5,44,110,233,10,102,213,3,30,231,66,247,104,232,226,159,
+    89,237,6,52,247,179,233,136,155,238,211,40,176,242,107,167,
+    80,140,163,184,208,98,232,18,138,143,153,238,202,60,239,136,
+    125,228,239,139,14,254,94,71,227,244,1,101,100,148,62,247,
+    12,227,163,206,8,222,78,76,218,103,112,240,244,222,159,127,
+    18,205,228,229,106,242,114,45,121,25,78,49,156,61,30,206,
+    153,125,217,211,204,159,72,212,194,201,68,249,128,40,111,147,
+    40,255,175,238,55,203,144,20,0,162,2,185,136,29,235,86,
+    216,206,213,148,48,12,182,3,156,226,0,227,234,192,211,226,
+    239,83,155,184,232,255,65,220,213,147,216,91,112,196,63,145,
+    189,47,255,8,123,92,79,246,198,38,49,131,197,187,89,92,
+    112,179,216,122,218,155,124,119,184,249,128,33,191,197,221,93,
+    65,118,180,69,28,43,227,112,146,77,7,222,135,13,215,166,
+    239,56,226,119,220,244,249,30,155,14,119,109,218,190,236,65,
+    238,208,153,19,214,72,113,110,86,165,255,160,208,103,59,254,
+    151,161,161,251,172,254,54,179,237,95,187,74,133,64,95,194,
+    87,26,221,10,226,173,166,110,239,64,142,152,155,109,253,191,
+    67,227,152,230,243,177,253,224,57,211,242,230,124,203,105,119,
+    186,55,246,54,120,211,126,161,155,215,178,77,130,245,31,64,
+    54,188,44,203,54,178,44,195,94,53,153,43,237,87,157,153,
+    50,59,175,58,51,108,58,87,157,73,153,206,85,103,206,152,
+    157,87,131,187,206,114,13,166,91,236,254,253,16,155,163,99,
+    173,193,122,217,243,13,166,91,236,109,30,98,115,116,172,141,
+    78,178,89,182,193,244,150,123,159,28,210,246,168,221,178,192,
+    70,217,123,240,163,183,220,75,31,210,246,168,221,114,38,201,
+    242,13,166,91,236,174,29,98,115,116,172,189,50,130,119,221,
+    98,111,252,16,155,163,99,237,205,16,59,218,96,186,197,174,
+    112,136,205,81,15,19,245,220,127,1,140,146,231,255,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/XBar.py",
+    "m5.objects.XBar",
+    embedded_module_data,
+    2238,
+    5160);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,201 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,88,205,115,211,72,22,151,252,253,237,216,78,28,
+    242,137,6,8,144,16,194,48,132,48,203,48,124,37,97,200,
+    7,78,42,129,165,38,59,51,42,69,106,98,49,178,228,145,
+    100,18,123,231,224,195,30,88,106,171,134,202,37,89,106,170,
+    38,39,106,118,185,236,159,34,83,174,194,165,19,181,123,226,
+    230,212,112,154,211,190,110,89,182,35,108,38,86,186,165,247,
+    126,175,245,222,235,215,253,94,235,127,84,219,159,183,209,255,
+    246,95,104,246,40,129,18,104,137,202,209,27,52,141,239,93,
+    146,43,231,222,112,147,123,183,228,201,121,55,188,228,222,35,
+    249,238,91,189,191,209,7,26,125,144,244,94,41,148,11,111,
+    132,105,202,69,125,69,9,190,191,81,130,31,69,94,186,41,
+    234,149,219,126,241,70,148,240,2,192,11,162,176,131,23,35,
+    188,16,240,194,136,118,240,226,132,23,1,94,20,197,29,188,
+    30,194,139,1,47,254,1,47,33,244,172,83,227,137,119,248,
+    97,156,54,163,179,146,194,127,143,132,149,205,199,136,215,129,
+    144,186,205,105,104,150,227,179,104,86,201,229,85,164,105,138,
+    10,228,24,38,175,170,232,17,210,129,133,41,244,4,52,193,
+    117,49,103,137,242,237,238,116,217,238,76,19,119,34,106,131,
+    22,168,13,151,64,11,174,45,215,134,91,112,131,10,30,51,
+    56,43,21,52,241,137,168,23,205,112,78,209,116,169,200,138,
+    50,47,53,31,208,14,47,101,0,23,96,89,153,203,33,150,
+    53,67,44,155,83,132,130,132,239,35,44,251,67,129,147,26,
+    28,207,19,78,210,254,69,253,134,223,250,123,90,83,249,11,
+    57,148,187,192,99,59,46,16,107,166,242,69,53,8,76,210,
+    92,130,127,237,24,52,229,230,175,22,25,216,255,210,8,143,
+    151,231,240,79,77,216,208,35,118,121,108,187,170,71,237,162,
+    192,38,122,195,35,184,54,188,200,119,224,167,58,252,9,110,
+    193,243,18,252,242,202,246,13,181,17,232,138,245,10,62,7,
+    54,216,21,235,23,2,14,108,8,176,225,78,88,20,121,28,
+    109,202,5,29,82,49,33,4,179,18,54,99,15,85,81,71,
+    183,36,136,11,78,87,212,223,147,45,71,146,118,42,155,45,
+    245,110,161,220,229,171,87,143,34,223,225,177,74,159,207,42,
+    178,134,248,130,46,62,65,140,36,202,72,99,182,1,166,35,
+    153,217,68,143,20,21,49,2,146,184,162,40,111,49,240,196,
+    240,10,39,33,141,135,199,119,17,44,62,253,135,226,218,247,
+    98,62,143,197,57,235,197,162,34,191,11,96,209,191,100,10,
+    185,77,164,50,202,35,235,21,12,132,135,172,115,140,152,203,
+    43,26,18,24,69,102,56,153,185,183,126,119,141,217,22,245,
+    44,25,23,49,42,250,161,128,52,93,99,116,133,140,184,77,
+    212,178,120,45,229,74,169,77,188,78,24,77,44,33,70,4,
+    93,138,58,210,50,227,113,21,43,173,98,167,170,49,104,76,
+    143,94,204,35,51,196,239,236,176,89,196,9,72,53,131,248,
+    158,151,56,77,51,189,171,156,202,229,204,192,3,89,19,183,
+    100,36,152,177,198,11,16,43,137,57,81,55,19,178,194,54,
+    172,178,73,113,98,10,171,103,97,37,102,21,73,48,221,11,
+    178,110,250,96,36,4,125,156,204,8,139,253,196,98,213,204,
+    16,81,147,220,171,61,88,43,18,199,73,220,244,218,205,21,
+    248,215,158,81,71,130,63,60,84,158,171,37,198,202,139,181,
+    158,211,229,133,122,136,74,15,237,125,183,251,93,45,16,52,
+    194,243,135,110,87,218,247,158,130,166,156,169,251,168,129,209,
+    95,98,47,98,181,64,200,136,220,6,214,0,102,13,248,12,
+    79,95,61,64,245,15,239,201,187,50,136,213,93,174,224,208,
+    161,215,219,15,92,104,202,43,245,24,149,236,223,27,216,29,
+    216,159,169,14,93,52,46,221,173,36,22,170,137,133,242,34,
+    254,89,106,98,229,58,47,183,167,158,110,203,77,112,111,248,
+    144,255,32,208,113,105,120,94,210,16,226,116,219,34,242,31,
+    132,58,34,189,14,100,24,144,145,142,72,159,3,25,237,138,
+    244,59,144,177,174,200,128,3,25,7,100,79,71,100,80,8,
+    57,150,109,2,176,201,46,216,176,3,155,234,106,127,196,161,
+    65,111,87,100,84,136,57,70,237,235,138,141,59,70,77,119,
+    69,246,8,9,199,168,253,128,61,214,17,155,20,82,14,236,
+    0,96,7,59,97,209,144,208,235,192,14,3,118,164,19,214,
+    69,161,209,151,208,191,106,189,169,207,33,123,28,100,153,46,
+    178,159,56,100,211,14,217,19,32,123,178,139,142,253,14,236,
+    169,174,182,211,194,49,7,118,236,35,216,1,7,246,244,71,
+    124,58,232,192,158,1,155,206,10,67,142,25,28,7,234,132,
+    48,236,160,158,67,147,7,231,59,218,54,181,69,11,35,142,
+    145,47,128,22,159,118,68,95,124,252,89,83,163,81,135,212,
+    165,143,232,126,220,129,157,6,236,229,142,88,70,248,196,129,
+    157,1,236,149,142,218,12,9,39,28,216,207,133,147,144,34,
+    79,153,193,102,141,116,191,148,104,165,199,77,160,226,236,24,
+    183,178,99,19,100,6,102,185,60,199,227,58,39,122,11,234,
+    41,94,132,172,133,203,158,82,242,62,183,197,72,138,242,125,
+    33,207,72,176,233,203,124,177,148,154,227,32,105,113,60,15,
+    165,87,147,56,182,108,221,144,228,164,103,113,218,210,11,170,
+    204,228,57,72,100,56,177,49,57,81,211,84,146,129,47,175,
+    34,149,135,236,192,109,33,156,11,161,39,201,109,19,65,91,
+    0,117,4,252,180,205,169,57,6,222,138,199,34,218,151,166,
+    90,233,19,143,133,136,80,150,147,5,9,217,169,151,135,228,
+    132,51,47,218,17,245,210,68,11,143,115,170,198,156,205,113,
+    59,140,82,208,53,29,132,48,204,78,173,227,239,112,168,148,
+    26,48,72,100,72,125,2,90,96,83,4,148,3,112,195,218,
+    210,241,123,48,130,220,28,214,162,130,34,121,120,198,194,42,
+    14,128,82,127,235,197,86,154,222,44,60,122,132,84,237,78,
+    233,228,2,40,157,21,53,203,34,120,19,135,179,190,84,100,
+    206,66,32,78,65,222,214,244,241,210,112,171,138,101,56,93,
+    231,108,143,88,94,8,226,25,209,160,154,65,165,228,26,202,
+    75,28,143,114,224,75,38,175,72,34,204,67,130,76,40,20,
+    6,118,105,60,85,122,112,43,159,135,87,168,31,128,241,160,
+    2,226,69,1,49,219,89,145,207,50,36,55,107,12,228,241,
+    130,36,224,249,64,79,68,94,111,84,38,140,128,167,29,237,
+    228,57,168,14,20,185,116,230,190,74,70,224,149,243,118,73,
+    96,15,160,103,57,29,232,178,174,114,188,94,154,124,152,69,
+    58,54,6,23,48,86,212,144,41,199,126,37,99,106,120,26,
+    100,93,132,97,138,165,243,15,242,154,14,142,201,129,146,42,
+    140,34,65,105,68,68,113,32,204,174,62,192,98,23,200,196,
+    128,110,168,196,204,41,219,114,103,1,136,123,69,45,150,174,
+    220,18,4,236,10,70,229,100,8,56,59,62,97,168,243,26,
+    54,157,72,157,109,22,87,48,150,136,171,183,241,82,106,189,
+    168,233,40,199,108,227,240,146,20,136,23,93,41,245,145,146,
+    114,147,131,82,139,151,16,148,107,164,4,84,113,210,40,141,
+    52,143,11,86,253,86,176,45,177,102,46,78,68,237,170,80,
+    81,51,227,127,114,84,103,234,0,52,102,128,219,212,136,231,
+    84,156,50,212,33,220,12,99,70,232,30,177,104,29,215,81,
+    30,82,65,225,60,97,122,57,188,100,77,223,108,17,52,210,
+    204,48,56,151,109,44,75,51,130,29,220,124,234,1,63,228,
+    113,249,218,164,248,27,75,209,76,224,245,86,200,179,249,230,
+    210,52,253,179,74,65,214,161,66,140,193,186,97,241,146,99,
+    121,76,49,189,57,45,171,106,102,202,90,27,44,126,98,27,
+    139,198,140,234,91,186,134,71,33,100,51,74,22,0,219,88,
+    0,166,231,182,162,72,102,68,212,88,28,250,44,14,125,21,
+    159,108,77,79,230,193,242,178,25,202,55,35,223,12,224,221,
+    9,98,93,51,35,248,110,29,233,100,103,130,2,22,211,250,
+    48,173,45,252,87,73,64,155,222,229,181,7,107,171,102,178,
+    45,214,89,43,214,85,15,241,96,107,93,52,65,108,51,164,
+    53,51,145,83,158,32,214,142,92,139,212,138,78,214,138,94,
+    51,178,214,112,227,42,132,142,25,224,243,5,22,71,146,25,
+    94,179,246,19,139,12,225,215,32,255,25,78,159,138,106,213,
+    214,65,28,141,107,56,18,225,86,146,172,25,53,195,28,80,
+    89,18,160,154,233,179,226,78,61,129,53,118,115,114,209,244,
+    105,132,98,198,183,237,224,99,73,240,145,243,31,20,240,118,
+    216,145,2,181,129,98,155,113,230,172,179,79,219,205,42,252,
+    107,178,235,104,157,157,134,58,59,158,42,223,173,37,78,225,
+    98,251,147,242,194,219,112,207,155,240,208,235,240,208,254,98,
+    37,124,166,26,62,3,136,72,226,167,204,179,204,254,141,74,
+    228,92,53,114,174,60,255,22,74,231,201,221,73,227,248,165,
+    74,114,186,154,156,46,47,213,82,199,246,174,237,94,51,152,
+    203,149,212,76,53,53,83,94,174,65,237,253,227,238,143,198,
+    169,165,74,255,114,181,127,217,240,244,190,61,54,242,75,244,
+    69,148,84,241,31,148,234,80,225,127,187,251,45,225,125,113,
+    164,194,15,80,209,36,126,189,49,244,85,37,114,183,26,185,
+    91,158,175,13,30,255,101,234,197,212,175,9,99,50,83,25,
+    92,169,14,174,24,158,254,90,239,192,94,102,55,99,156,156,
+    171,244,206,87,123,231,203,247,26,148,131,139,198,233,27,149,
+    222,155,213,222,155,229,123,111,65,209,171,187,87,247,145,49,
+    182,88,73,45,85,83,75,229,229,183,137,244,155,196,216,235,
+    196,216,129,96,76,46,86,18,75,213,196,82,121,17,28,241,
+    211,245,103,215,247,39,247,39,255,57,245,243,212,175,231,42,
+    225,153,106,120,6,220,49,48,250,102,96,250,245,192,116,45,
+    16,125,234,253,187,255,31,126,35,49,6,42,15,98,149,7,
+    193,156,52,232,156,236,127,147,152,120,157,152,248,117,218,184,
+    56,87,73,204,87,19,243,224,96,56,171,12,190,24,172,5,
+    34,117,23,29,156,163,15,189,30,44,228,177,132,122,240,81,
+    38,244,34,4,108,35,118,197,233,31,155,23,53,226,95,58,
+    121,61,195,79,127,52,134,151,42,241,229,106,124,25,38,51,
+    62,248,244,175,198,208,151,149,248,245,106,252,122,249,238,219,
+    228,200,155,228,153,215,201,51,181,96,242,105,216,232,203,128,
+    124,10,203,167,124,229,37,16,143,165,126,250,230,217,55,251,
+    167,127,158,48,78,127,81,137,94,171,70,175,149,239,212,211,
+    248,244,244,120,247,241,65,159,113,246,70,37,125,179,154,190,
+    9,199,166,52,149,72,239,197,119,227,7,81,227,66,166,210,
+    179,82,237,89,129,3,90,4,176,111,210,19,175,211,196,222,
+    219,149,244,108,53,61,91,94,193,63,43,20,113,0,30,57,
+    75,217,213,218,111,120,215,235,118,150,34,159,101,188,36,199,
+    169,125,120,207,13,91,165,12,161,100,198,125,157,54,212,182,
+    109,212,177,18,30,218,205,191,241,74,192,155,105,251,74,72,
+    54,79,156,35,229,5,252,179,36,31,118,85,124,244,35,138,
+    111,248,4,15,40,239,53,123,50,138,204,43,160,62,236,41,
+    68,235,210,104,171,64,147,91,60,182,249,45,35,109,153,232,
+    148,187,147,25,247,255,129,185,235,29,108,254,218,110,254,131,
+    109,62,229,176,121,4,219,124,17,219,124,22,38,17,31,151,
+    219,231,12,139,101,198,147,230,177,220,229,41,133,124,84,211,
+    166,142,124,158,83,241,103,60,51,221,206,110,110,184,154,181,
+    5,247,181,49,91,133,142,149,5,70,219,120,206,205,93,132,
+    157,49,222,198,39,169,33,8,132,60,222,87,53,216,111,225,
+    86,85,118,32,231,193,93,243,171,159,234,39,233,101,30,138,
+    54,235,235,90,111,115,11,124,216,116,199,81,23,253,30,184,
+    102,125,195,187,174,242,141,233,213,10,208,214,221,52,77,215,
+    51,52,69,95,50,168,207,218,175,26,53,99,28,189,106,212,
+    167,198,209,171,70,77,26,246,85,163,70,12,251,170,81,253,
+    134,125,213,168,180,97,95,53,234,132,113,244,170,135,104,122,
+    162,78,125,216,60,247,28,226,238,125,139,26,72,211,139,116,
+    157,234,220,62,255,250,144,244,239,219,57,159,61,164,233,57,
+    120,232,222,61,143,30,90,55,239,143,114,117,151,155,30,173,
+    83,31,54,79,23,14,113,247,190,69,141,248,233,225,58,245,
+    97,243,188,120,136,187,247,29,88,100,90,254,15,170,196,248,
+    160,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/cache/Cache.py",
+    "m5.objects.Cache",
+    embedded_module_data,
+    2817,
+    5898);
+
+} // anonymous namespace
+} // namespace gem5
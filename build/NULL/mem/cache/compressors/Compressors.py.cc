@@ -0,0 +1,252 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,205,90,77,108,27,215,17,94,254,47,73,81,162,72,
+    253,80,18,73,173,100,91,53,253,67,91,63,81,108,53,17,
+    98,91,80,44,219,82,148,216,73,1,34,41,187,226,62,73,
+    180,249,163,236,46,29,139,39,29,138,214,1,114,72,133,22,
+    54,124,177,208,6,110,3,7,168,143,189,245,222,75,41,131,
+    128,137,61,25,232,165,186,73,176,208,67,46,237,204,91,46,
+    127,118,151,146,154,58,168,45,114,246,241,125,243,254,102,230,
+    205,155,55,235,127,48,13,255,28,213,231,43,143,149,97,30,
+    48,2,35,88,50,204,45,245,105,169,62,173,213,167,173,250,
+    180,223,98,172,204,251,140,96,253,37,35,216,136,227,137,141,
+    97,158,218,180,14,19,78,138,217,1,115,16,167,14,115,81,
+    204,9,152,139,184,116,24,75,49,22,48,183,1,115,83,204,
+    3,152,215,128,121,40,214,6,152,207,128,121,41,214,14,88,
+    135,1,107,163,152,31,176,78,3,230,163,88,0,176,160,1,
+    107,167,88,23,96,221,6,172,131,98,61,128,245,26,48,63,
+    197,66,128,245,25,228,210,73,177,126,192,6,12,88,128,98,
+    97,192,34,6,44,72,177,40,96,131,134,241,186,40,198,1,
+    54,100,192,186,41,54,12,216,49,18,208,97,61,194,241,155,
+    76,236,196,14,254,136,89,20,203,169,84,163,189,216,53,123,
+    249,212,130,246,66,152,132,69,96,18,86,248,218,4,75,194,
+    46,88,19,14,193,150,112,18,215,22,203,152,252,35,238,219,
+    30,173,44,216,159,128,205,61,181,214,181,5,173,218,204,90,
+    9,14,193,169,227,5,93,111,181,155,242,186,4,86,199,219,
+    209,178,95,183,224,209,241,250,129,183,179,5,175,87,199,27,
+    56,160,223,54,29,111,240,128,126,125,58,222,46,161,29,52,
+    208,161,4,47,243,18,185,194,167,86,201,149,124,118,77,36,
+    146,148,23,111,21,123,87,72,246,173,169,169,84,181,42,157,
+    207,77,77,33,99,49,146,37,217,115,41,100,63,151,170,241,
+    75,231,150,0,139,175,174,22,131,151,51,249,212,29,78,74,
+    23,9,151,206,113,75,235,50,145,118,56,24,175,56,114,19,
+    235,242,203,28,207,173,241,162,148,206,173,112,2,47,243,92,
+    106,181,144,187,195,157,68,230,180,44,197,118,198,144,121,101,
+    62,157,75,103,11,89,110,141,136,41,146,147,249,21,218,84,
+    94,37,220,82,109,128,51,208,149,54,7,34,84,129,108,65,
+    146,57,152,94,154,220,37,156,156,231,150,8,39,201,121,17,
+    112,24,161,129,123,57,47,102,121,121,199,130,163,77,47,20,
+    178,75,68,196,17,232,108,36,24,136,151,185,20,159,195,230,
+    13,141,160,11,152,59,159,201,144,12,206,140,75,173,167,50,
+    36,94,252,180,222,158,220,147,69,94,173,151,56,145,124,94,
+    72,227,208,48,143,101,88,144,180,202,53,8,148,59,73,226,
+    43,241,51,156,80,160,19,149,86,211,203,50,74,133,207,9,
+    48,74,234,14,191,2,191,98,241,226,123,7,206,78,32,135,
+    207,239,231,71,159,95,189,187,163,207,112,33,214,173,176,201,
+    100,142,207,146,100,82,241,36,147,217,188,80,200,96,185,45,
+    153,252,188,192,103,170,136,93,94,95,35,10,203,47,73,48,
+    135,148,172,184,83,247,238,37,83,25,94,146,20,15,22,87,
+    9,47,16,81,113,44,194,18,178,138,109,46,39,43,78,40,
+    131,250,149,14,106,113,201,76,58,71,146,168,122,197,67,181,
+    173,150,217,143,115,82,122,37,71,4,96,67,1,209,218,36,
+    90,147,226,90,84,237,71,233,163,117,242,42,172,108,53,159,
+    17,146,117,187,82,186,113,197,73,85,180,88,159,164,210,81,
+    156,87,168,144,148,0,133,169,220,146,25,94,38,185,212,186,
+    210,171,138,201,216,168,171,10,52,177,127,203,188,194,29,247,
+    253,73,73,76,157,51,223,62,245,173,39,197,215,214,69,60,
+    47,41,25,134,175,244,79,32,27,181,191,138,151,219,152,169,
+    116,4,55,174,86,252,177,141,185,74,231,249,141,107,47,59,
+    123,30,244,109,246,61,156,44,15,140,150,198,175,110,119,206,
+    149,59,231,54,174,85,122,6,30,228,54,115,21,214,83,106,
+    155,216,179,89,123,157,251,12,144,141,15,118,157,204,208,200,
+    31,125,191,247,1,180,107,181,184,39,246,28,246,33,0,129,
+    148,236,145,221,54,38,50,252,120,225,209,66,133,117,151,188,
+    215,161,97,4,27,70,0,235,131,150,253,131,143,195,143,194,
+    128,97,203,247,45,208,180,31,155,246,3,220,179,235,97,6,
+    143,63,206,61,202,209,166,243,208,116,16,155,14,2,54,0,
+    77,195,67,143,223,121,244,78,181,233,28,54,13,99,211,48,
+    192,33,245,35,14,106,75,55,63,16,110,49,175,255,64,16,
+    28,224,8,157,74,8,253,219,76,58,37,131,229,243,226,122,
+    163,55,60,221,194,27,154,113,23,227,230,42,22,106,188,201,
+    122,53,186,204,112,125,119,214,121,56,48,78,49,77,164,133,
+    88,155,232,70,145,224,252,69,47,18,60,12,68,31,18,60,
+    154,196,14,36,126,36,232,249,197,0,146,32,16,165,163,97,
+    68,180,126,49,138,16,149,47,58,100,113,88,35,51,104,100,
+    211,58,35,59,81,51,178,119,209,200,46,129,145,129,53,165,
+    55,211,21,182,189,204,70,75,220,116,163,65,225,159,218,245,
+    176,94,117,154,160,95,229,14,84,157,96,39,174,219,53,229,
+    21,193,2,224,183,179,246,219,139,241,153,224,72,120,142,192,
+    7,10,77,180,9,78,80,170,75,105,67,53,77,78,204,144,
+    140,204,95,40,14,182,208,163,198,240,253,177,214,167,91,82,
+    64,22,80,216,206,123,48,208,14,78,65,196,181,45,124,235,
+    51,213,80,93,57,61,168,13,251,77,146,89,22,187,240,119,
+    31,146,1,36,97,36,17,36,58,221,156,208,200,7,40,185,
+    79,117,186,233,3,221,248,71,81,45,147,168,150,16,221,208,
+    145,232,150,253,155,142,237,240,185,103,199,203,99,179,219,225,
+    89,216,173,149,190,126,216,148,149,232,224,214,241,111,206,109,
+    71,71,159,205,148,39,174,110,71,175,194,110,172,12,132,117,
+    155,238,196,155,165,57,95,131,98,70,39,139,220,193,170,27,
+    157,20,71,112,17,63,65,114,178,166,27,49,102,34,220,179,
+    26,249,204,76,184,253,40,220,177,215,45,220,179,111,174,112,
+    199,199,14,19,238,248,216,209,133,123,94,35,119,176,16,175,
+    129,231,223,44,1,80,191,48,62,118,136,95,208,24,212,229,
+    59,143,176,252,49,141,172,99,225,116,13,28,123,179,150,239,
+    107,88,221,1,155,171,198,113,116,1,76,104,228,215,205,250,
+    159,120,179,4,64,245,63,58,121,136,254,53,6,186,252,29,
+    255,17,150,63,169,145,223,53,235,127,82,191,124,139,182,252,
+    83,135,44,63,225,130,39,11,83,119,87,167,238,184,178,8,
+    177,119,49,100,50,103,21,137,154,31,98,41,12,217,241,252,
+    194,217,239,208,16,19,229,181,16,243,28,114,126,29,225,188,
+    186,168,145,63,192,87,122,155,105,118,169,1,116,169,167,208,
+    165,142,130,75,13,71,192,121,190,212,156,167,169,183,188,168,
+    151,86,45,254,75,28,46,45,7,72,203,14,210,178,39,60,
+    196,219,226,234,236,20,92,250,171,190,192,130,116,221,138,109,
+    118,241,74,177,199,68,182,88,31,54,151,236,242,90,10,228,
+    170,154,6,138,116,7,167,187,131,201,142,226,201,122,112,135,
+    23,18,237,18,11,209,88,158,19,11,244,206,11,87,47,146,
+    17,22,98,237,63,64,13,199,152,198,224,79,241,97,191,73,
+    232,151,222,126,244,74,122,87,35,127,70,37,45,234,148,228,
+    71,37,157,68,37,157,211,148,84,49,40,9,142,194,94,56,
+    17,95,118,245,61,152,219,156,123,200,151,134,174,111,119,221,
+    40,119,221,216,152,199,63,117,176,119,91,218,122,252,191,176,
+    117,216,210,46,208,8,171,216,65,242,51,166,9,9,10,180,
+    72,72,128,78,4,84,202,180,166,20,186,105,197,41,106,241,
+    222,31,42,106,157,68,47,107,228,175,40,209,119,116,18,237,
+    68,137,106,87,52,184,25,69,162,166,50,125,217,211,219,24,
+    64,95,214,75,207,165,73,239,95,63,40,25,38,216,5,135,
+    206,214,221,45,121,141,251,194,115,0,175,62,5,230,109,201,
+    107,76,129,181,1,175,207,148,215,107,72,107,181,3,111,135,
+    41,175,79,104,63,114,106,173,67,240,155,164,214,130,102,188,
+    86,134,116,9,157,164,251,182,95,171,129,114,64,43,127,167,
+    75,102,10,65,93,191,61,208,111,111,139,126,67,79,224,249,
+    180,62,171,46,93,219,62,161,51,209,15,223,1,248,134,133,
+    238,68,68,232,129,93,208,171,132,102,49,91,3,183,194,79,
+    248,76,129,72,13,247,205,33,179,157,209,196,92,60,217,98,
+    143,84,185,146,119,41,27,110,23,60,49,211,126,8,244,138,
+    31,55,36,141,50,252,26,166,151,228,116,234,142,196,21,114,
+    114,58,67,189,152,196,103,215,48,143,196,139,132,227,115,124,
+    102,189,8,76,152,28,2,48,45,114,169,188,80,5,87,72,
+    142,136,188,76,132,248,14,74,177,120,66,231,21,49,87,85,
+    157,76,106,29,218,193,16,68,140,23,175,205,243,247,104,22,
+    48,215,204,158,206,209,204,159,64,190,200,139,66,156,155,91,
+    230,206,159,225,100,126,41,131,57,71,184,245,86,71,205,229,
+    101,184,70,35,159,16,79,111,253,202,194,20,111,212,199,213,
+    230,78,115,105,52,105,184,68,160,143,59,4,179,106,203,121,
+    145,52,165,234,210,18,71,150,151,9,220,167,239,146,204,58,
+    87,0,105,196,103,139,151,126,182,74,96,169,34,21,70,117,
+    214,18,39,173,230,11,25,1,187,203,242,185,244,90,1,179,
+    64,106,246,17,34,10,117,104,185,0,210,128,126,227,34,30,
+    149,197,190,75,160,143,84,26,170,238,166,229,117,237,140,248,
+    100,246,86,92,177,143,158,31,155,40,70,26,116,161,230,5,
+    26,153,168,123,139,217,20,15,98,234,93,95,113,240,216,165,
+    98,199,31,197,129,185,156,64,238,97,230,110,45,159,73,167,
+    154,70,40,70,63,34,107,25,62,69,178,208,218,4,87,99,
+    157,88,244,8,119,92,245,32,234,6,130,57,53,129,36,171,
+    106,135,133,38,169,233,40,109,85,33,169,201,185,142,44,127,
+    47,73,25,51,36,183,34,175,42,94,208,115,178,170,24,197,
+    126,57,159,207,40,126,176,89,204,243,213,68,166,30,116,238,
+    187,203,114,82,93,162,103,158,100,243,226,58,102,151,21,47,
+    86,87,37,164,4,48,130,211,86,190,72,23,166,180,223,36,
+    114,93,216,132,102,75,148,32,182,74,87,25,147,170,8,148,
+    110,108,221,32,154,106,7,142,27,179,31,127,180,168,244,96,
+    19,177,142,86,91,29,37,84,154,209,200,223,225,43,125,104,
+    49,166,93,252,227,120,102,252,180,122,251,172,132,135,212,92,
+    156,15,147,102,11,152,52,195,116,156,93,77,199,249,25,56,
+    138,167,55,167,183,134,75,35,243,219,193,133,114,112,97,227,
+    70,61,239,135,77,46,66,11,76,212,216,105,230,207,195,4,
+    67,15,226,155,241,10,219,142,224,5,0,131,8,6,157,27,
+    215,1,12,69,30,20,55,139,48,88,133,189,190,231,176,133,
+    0,2,82,178,119,1,214,217,243,192,189,233,126,56,92,138,
+    94,220,246,79,149,253,83,48,205,64,239,139,192,240,243,192,
+    240,214,100,233,244,181,237,192,245,114,224,250,198,245,74,255,
+    224,139,254,177,231,253,99,21,182,231,126,123,165,55,180,229,
+    44,115,231,159,221,45,191,61,183,107,179,186,61,123,12,144,
+    125,36,16,79,184,71,246,220,142,1,24,7,72,201,222,187,
+    219,198,68,143,189,136,92,120,30,185,0,179,184,239,248,210,
+    245,149,171,212,57,186,103,179,70,49,217,20,5,158,254,93,
+    182,213,89,218,24,68,162,140,155,14,210,218,91,72,116,193,
+    230,7,41,113,110,185,24,147,127,224,184,217,102,199,13,53,
+    238,230,154,21,171,96,51,28,158,173,2,80,227,161,236,131,
+    144,167,29,190,29,130,43,225,135,111,103,53,32,237,152,47,
+    100,228,116,131,191,55,11,252,41,79,171,192,63,139,32,102,
+    26,187,46,137,34,79,119,119,3,60,91,204,130,3,149,136,
+    172,190,93,65,255,42,231,193,93,225,11,18,238,139,213,116,
+    106,149,147,10,75,103,235,45,26,95,136,72,249,44,81,95,
+    227,208,51,64,16,212,151,9,216,73,42,47,2,211,90,30,
+    28,50,56,30,153,95,161,174,107,93,117,40,213,155,71,224,
+    96,175,162,120,63,1,151,155,23,233,11,1,53,41,78,47,
+    26,151,41,214,176,6,213,243,44,96,181,159,122,124,220,200,
+    105,240,58,252,138,164,238,201,112,109,99,154,237,201,132,70,
+    254,141,123,242,75,166,121,79,134,27,175,47,96,123,193,232,
+    139,192,232,243,192,104,197,221,126,191,251,203,222,175,122,191,
+    62,254,245,241,223,140,252,118,164,196,246,149,6,208,84,113,
+    71,89,233,142,114,214,119,212,174,213,234,238,222,115,56,112,
+    79,57,212,61,229,175,218,49,181,96,76,173,15,96,14,157,
+    101,48,250,110,178,229,132,222,150,181,224,227,213,195,150,182,
+    124,112,80,248,4,28,207,83,45,48,167,119,104,226,185,237,
+    213,126,211,251,179,71,119,127,134,187,51,88,233,225,124,85,
+    43,166,193,123,231,34,17,241,220,108,176,223,126,19,251,173,
+    114,21,57,115,11,94,83,97,12,80,48,7,85,28,210,2,
+    131,198,51,154,158,15,28,159,201,228,191,32,66,195,61,61,
+    230,63,242,217,69,207,150,110,245,88,170,117,156,164,29,139,
+    120,79,63,114,254,54,169,145,48,136,88,202,235,12,42,138,
+    6,117,6,13,106,188,234,228,95,130,147,159,123,52,87,26,
+    153,219,14,95,43,135,175,169,111,90,254,231,172,99,82,111,
+    54,255,223,164,75,8,206,83,130,209,208,135,24,184,29,22,
+    195,54,51,183,138,97,197,42,87,242,115,202,166,153,200,97,
+    121,154,37,141,156,65,5,233,115,192,198,83,248,117,104,99,
+    233,205,210,70,123,130,136,249,6,29,152,221,176,145,165,213,
+    13,27,115,13,71,21,183,160,145,41,51,113,15,52,94,148,
+    95,155,184,5,189,184,181,87,128,175,254,214,36,110,56,201,
+    65,220,223,89,155,61,34,212,218,77,107,29,166,181,78,211,
+    90,151,105,45,107,90,235,54,173,245,24,107,87,88,80,163,
+    13,212,104,71,111,76,95,93,218,46,207,204,237,224,90,99,
+    22,49,164,105,226,150,73,74,73,208,236,80,125,195,68,223,
+    132,208,140,61,205,91,211,220,45,205,96,162,134,84,199,246,
+    153,137,54,151,53,114,21,181,249,164,73,155,47,49,228,123,
+    22,40,177,19,219,236,68,153,157,168,176,92,137,229,254,50,
+    86,98,167,183,217,233,50,59,93,97,187,238,183,253,73,44,
+    177,99,219,236,88,153,133,24,177,251,190,239,153,181,196,142,
+    111,179,227,101,118,220,248,251,48,254,102,124,183,211,77,79,
+    222,126,245,20,173,244,194,153,218,165,126,212,37,224,196,23,
+    224,70,61,144,125,43,158,95,186,13,231,138,20,111,186,38,
+    224,229,33,218,0,234,111,1,136,187,1,199,255,106,145,149,
+    20,22,139,98,254,222,186,210,6,165,155,233,236,7,180,157,
+    226,174,21,213,208,101,248,112,177,211,232,134,166,233,104,102,
+    137,94,21,104,108,146,172,233,77,168,41,160,89,41,223,179,
+    239,168,255,237,98,90,68,111,130,214,34,157,135,40,97,215,
+    102,177,88,118,39,25,203,169,18,19,83,63,21,230,76,73,
+    251,84,152,222,146,246,169,48,61,37,237,83,97,250,75,218,
+    103,215,57,104,113,238,50,70,242,48,182,135,143,253,122,237,
+    140,133,197,162,145,148,6,199,246,240,185,95,175,238,241,90,
+    34,187,140,145,148,130,167,247,240,185,95,175,14,183,98,237,
+    58,243,99,176,254,56,19,48,233,213,141,37,35,41,181,29,
+    223,195,231,126,189,58,228,179,204,91,118,25,115,90,242,12,
+    239,209,194,126,35,196,249,44,33,44,234,73,201,123,12,185,
+    67,251,245,106,238,44,142,99,36,84,107,103,113,34,181,234,
+    95,88,250,177,104,36,165,30,176,134,126,228,173,85,79,249,
+    176,100,36,165,208,105,156,65,100,191,94,205,181,146,218,224,
+    219,71,22,112,247,89,3,107,135,37,188,203,24,201,253,115,
+    123,248,216,55,129,232,142,250,15,65,106,255,187,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/cache/compressors/Compressors.py",
+    "m5.objects.Compressors",
+    embedded_module_data,
+    3645,
+    10941);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,702 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,221,125,107,108,28,217,149,94,53,201,38,155,100,179,
+    217,108,54,223,175,18,197,87,83,124,75,162,52,26,137,18,
+    31,122,241,37,173,168,241,122,100,123,26,77,86,145,108,169,
+    217,77,87,55,103,164,242,120,194,93,24,107,89,152,221,25,
+    8,222,149,32,36,17,35,236,122,198,240,4,112,54,47,255,
+    8,18,39,72,126,100,243,167,154,104,152,141,10,156,12,224,
+    36,107,1,249,65,98,8,195,209,194,112,206,185,183,170,186,
+    250,86,21,201,113,198,107,35,84,235,118,117,157,115,111,221,
+    123,235,214,57,223,57,247,220,91,63,227,76,127,110,237,251,
+    179,127,83,192,113,79,56,129,19,92,49,110,205,117,199,229,
+    194,227,130,88,193,109,250,93,168,125,23,105,223,110,237,187,
+    248,54,87,192,93,229,132,194,111,113,66,209,247,160,140,31,
+    20,232,69,223,41,33,20,55,80,138,69,215,247,10,129,86,
+    104,208,60,132,86,2,52,143,232,97,104,165,132,86,10,180,
+    50,11,173,140,208,202,129,230,21,203,25,154,151,208,42,128,
+    230,19,203,24,90,5,161,85,2,205,111,161,249,8,173,10,
+    104,1,11,173,146,208,170,129,22,180,208,252,132,86,3,180,
+    90,209,207,208,170,8,173,14,104,245,150,182,7,8,173,1,
+    104,141,150,50,171,9,173,9,104,205,98,144,161,213,16,90,
+    11,208,90,45,249,106,9,173,13,104,188,133,86,71,104,199,
+    128,214,46,6,24,90,61,161,29,7,90,135,88,195,208,26,
+    8,173,19,104,93,150,50,27,9,173,27,104,61,22,90,19,
+    161,133,128,214,107,161,53,19,218,9,160,245,89,104,45,132,
+    214,15,180,1,177,132,161,181,18,218,32,208,134,44,249,218,
+    132,225,5,46,52,242,18,127,132,92,106,197,100,44,177,116,
+    79,20,110,44,222,21,151,82,112,194,213,187,196,153,254,92,
+    218,247,103,141,28,14,121,145,187,227,18,184,59,5,130,235,
+    91,220,157,66,161,0,210,34,161,16,10,44,82,43,174,253,
+    225,205,155,82,98,81,188,252,182,24,79,45,21,154,10,193,
+    81,94,130,133,12,145,66,222,45,120,151,11,27,196,119,93,
+    240,203,101,252,42,132,95,198,83,33,112,11,220,247,93,243,
+    161,66,181,48,177,120,87,45,91,151,196,101,49,181,180,42,
+    74,170,59,30,89,19,147,112,221,162,164,24,91,150,202,128,
+    91,42,133,68,45,143,69,147,169,27,203,243,72,78,22,193,
+    25,30,254,94,117,36,165,165,193,53,113,109,112,41,2,217,
+    7,245,130,6,111,26,37,14,172,63,80,61,225,112,52,30,
+    77,133,195,114,109,94,107,6,244,243,216,128,100,19,36,155,
+    92,182,186,246,97,209,251,158,108,99,7,124,85,102,107,120,
+    248,42,123,8,255,62,195,154,47,25,45,226,168,220,192,254,
+    248,236,95,208,246,115,119,13,146,52,15,191,12,222,41,238,
+    107,215,190,9,253,113,215,232,129,45,115,63,26,127,223,131,
+    255,63,48,126,109,21,217,241,152,175,114,148,82,222,117,229,
+    75,36,23,247,254,85,236,127,252,47,121,224,68,200,77,58,
+    88,42,199,164,140,116,245,138,152,154,156,164,67,71,173,136,
+    8,2,233,44,210,109,223,47,144,188,200,82,68,110,83,1,
+    185,13,146,15,207,120,36,113,5,238,144,40,177,125,172,159,
+    63,141,125,156,160,125,92,94,249,254,217,93,174,168,52,144,
+    173,111,254,135,101,187,92,97,69,128,36,31,22,101,253,193,
+    239,86,238,248,79,108,251,79,164,253,253,25,127,255,142,255,
+    245,109,255,235,217,96,253,119,175,237,4,123,182,131,61,233,
+    96,111,38,216,251,241,212,94,97,65,85,96,159,131,100,55,
+    151,184,161,76,82,240,110,129,94,166,228,135,107,206,135,220,
+    56,10,176,214,225,176,90,22,14,175,37,132,141,24,30,123,
+    195,225,175,111,68,98,148,34,85,98,39,212,66,242,125,142,
+    228,35,109,147,138,245,100,16,219,48,66,218,160,255,131,11,
+    185,143,193,133,244,164,204,237,134,235,90,19,90,28,22,146,
+    247,32,234,247,248,51,28,27,223,54,63,138,248,32,186,224,
+    49,44,184,227,22,10,239,20,23,112,98,9,104,23,24,83,
+    63,48,198,21,57,231,206,63,183,82,112,199,35,150,110,149,
+    217,141,12,177,252,174,87,63,22,138,25,77,85,1,185,124,
+    14,185,42,141,92,37,76,46,63,228,170,178,203,37,120,132,
+    82,134,55,224,200,235,18,202,24,222,234,3,120,203,25,222,
+    224,1,188,94,134,183,230,0,222,10,134,183,246,128,182,249,
+    24,222,186,3,120,43,25,222,250,3,120,253,12,111,3,240,
+    54,218,242,86,9,1,134,183,233,33,183,236,2,61,237,185,
+    211,44,4,65,132,183,160,94,190,211,42,212,126,11,245,3,
+    232,225,59,252,67,238,190,235,206,49,16,236,245,170,111,34,
+    146,20,115,114,242,182,28,92,17,215,78,159,59,167,203,208,
+    115,231,144,65,110,180,145,174,139,64,24,88,93,149,170,225,
+    170,106,49,8,136,185,185,55,228,99,11,15,224,49,95,227,
+    83,171,209,36,159,147,232,252,162,24,75,196,87,146,124,42,
+    33,87,79,160,86,226,147,81,89,228,163,113,126,241,65,74,
+    76,94,145,249,27,241,216,3,62,158,72,69,151,31,152,51,
+    38,226,252,90,52,153,20,147,114,227,188,29,81,18,35,66,
+    82,110,178,165,189,35,69,161,108,185,221,150,40,68,82,17,
+    62,178,180,36,146,194,67,182,60,209,120,50,37,109,44,165,
+    162,112,108,176,94,210,88,83,171,34,191,26,145,132,119,34,
+    146,200,228,19,223,22,165,7,90,14,190,7,26,197,223,221,
+    72,166,180,134,132,228,215,14,47,97,53,154,194,47,227,164,
+    192,199,162,113,184,120,231,27,73,145,127,59,42,165,64,90,
+    241,208,231,18,169,19,191,156,144,12,222,104,124,69,45,58,
+    53,19,157,144,143,47,96,31,39,150,249,245,200,138,198,100,
+    201,106,209,101,168,1,62,251,18,36,127,238,122,2,178,37,
+    101,162,231,235,148,156,102,19,92,81,208,48,127,233,250,51,
+    192,202,43,156,89,199,147,95,134,126,66,109,19,42,152,151,
+    112,40,131,114,119,39,55,214,69,137,72,91,181,36,44,162,
+    158,72,170,238,240,218,218,70,50,84,72,53,76,241,61,232,
+    155,149,164,90,26,14,47,197,34,201,100,56,156,196,210,120,
+    126,147,202,100,204,43,215,229,143,97,67,159,127,149,211,228,
+    244,47,65,217,120,234,255,212,253,157,146,247,75,50,158,122,
+    197,211,14,159,167,163,244,27,62,217,186,6,208,239,222,108,
+    77,157,174,230,137,156,94,50,154,193,81,21,79,212,252,57,
+    142,85,243,91,230,46,52,254,64,229,230,137,100,151,73,217,
+    22,72,199,232,67,179,190,46,198,133,144,166,78,75,227,226,
+    59,84,223,230,235,84,93,247,90,26,170,19,34,216,208,86,
+    142,40,85,143,247,125,239,142,167,105,219,211,244,244,122,218,
+    211,149,241,116,41,250,135,54,202,22,187,4,93,108,163,0,
+    173,188,142,104,197,190,113,12,70,41,176,227,121,215,117,148,
+    188,108,39,189,127,30,106,97,140,24,168,69,237,55,11,222,
+    45,176,71,65,249,37,65,222,186,35,214,215,125,56,143,249,
+    118,21,75,237,240,37,5,48,105,193,4,239,30,1,8,106,
+    21,0,27,2,115,102,17,222,196,69,201,24,186,133,48,142,
+    85,55,29,213,116,204,210,251,41,245,66,34,243,204,173,180,
+    20,179,12,92,201,135,28,5,163,117,223,61,183,203,185,74,
+    95,35,201,195,201,172,215,191,227,109,222,246,54,167,189,173,
+    25,111,235,142,183,115,219,219,185,181,244,81,226,69,34,221,
+    117,38,211,117,38,237,61,155,241,158,85,200,39,91,211,240,
+    221,175,98,198,22,146,60,188,156,245,86,125,48,255,104,62,
+    237,109,206,120,155,21,242,129,81,179,227,169,223,246,212,167,
+    61,141,25,79,227,142,167,111,219,211,151,246,12,100,60,3,
+    138,254,177,62,18,8,99,8,242,207,112,56,122,204,146,226,
+    93,87,202,196,153,175,161,146,149,41,83,255,11,204,99,242,
+    199,174,84,137,169,156,130,124,170,80,112,143,28,75,249,101,
+    20,178,101,188,235,128,155,83,229,166,178,161,150,43,48,182,
+    94,184,110,113,127,102,25,135,68,86,21,205,191,106,7,249,
+    179,177,6,55,145,95,67,17,190,72,228,233,66,116,141,62,
+    168,124,234,1,136,48,108,154,28,90,199,251,71,44,19,202,
+    186,26,121,91,228,35,41,62,38,70,146,40,204,69,94,140,
+    137,88,82,168,88,45,139,38,81,183,68,226,75,162,90,106,
+    148,166,150,222,134,226,46,75,82,66,82,11,99,98,92,234,
+    225,52,180,104,200,195,36,225,69,99,73,191,88,222,224,82,
+    43,99,100,0,93,145,18,107,100,60,201,173,204,64,99,232,
+    107,120,67,226,100,152,253,180,178,225,105,215,95,133,210,149,
+    125,153,202,62,28,43,19,174,159,6,154,148,230,75,233,192,
+    120,38,48,174,120,199,127,90,238,123,40,127,231,226,251,23,
+    159,70,182,203,219,148,242,54,66,191,154,14,92,203,4,174,
+    41,222,107,48,140,62,168,120,84,241,231,107,91,83,31,119,
+    41,181,99,63,60,7,9,253,164,61,23,51,158,139,138,254,
+    177,14,38,188,93,68,20,253,241,23,58,152,204,194,196,193,
+    148,178,149,211,160,166,228,99,150,91,31,97,238,60,88,77,
+    104,12,72,104,57,74,195,152,16,65,209,5,137,102,35,73,
+    39,177,146,102,113,94,174,155,66,8,151,26,173,98,64,167,
+    165,48,227,37,251,59,51,78,239,204,197,116,224,82,38,112,
+    73,241,94,66,177,95,182,227,105,216,246,0,103,218,115,44,
+    227,57,166,232,31,210,215,161,118,169,14,171,83,143,73,3,
+    214,163,8,27,0,202,101,17,32,78,4,199,222,210,253,251,
+    84,201,170,101,120,184,10,192,10,76,113,239,205,7,19,209,
+    184,48,39,166,86,19,130,90,142,20,241,254,122,66,66,85,
+    125,51,34,69,214,212,98,10,249,212,98,248,9,157,165,22,
+    70,226,15,212,194,228,131,164,90,120,29,126,86,18,216,24,
+    70,248,18,70,204,167,150,45,34,254,163,199,69,19,137,68,
+    76,45,73,196,195,136,141,200,1,2,58,213,3,7,4,189,
+    145,83,8,213,200,1,62,51,106,64,7,58,97,56,67,49,
+    86,254,185,245,229,48,192,39,181,102,35,41,134,53,188,19,
+    54,240,142,90,54,39,174,37,164,7,11,164,42,8,140,194,
+    4,129,82,163,143,60,112,40,160,137,161,42,157,197,142,170,
+    208,176,199,146,24,139,133,195,33,151,212,129,119,6,199,203,
+    37,42,208,155,245,228,2,18,112,36,253,50,103,25,102,203,
+    155,54,167,178,149,213,155,215,178,254,174,205,235,217,170,254,
+    205,233,108,117,219,135,231,183,42,211,213,67,153,234,161,31,
+    246,253,176,239,71,247,211,35,215,50,35,215,148,192,245,205,
+    153,108,89,229,7,125,143,250,62,124,251,187,178,114,252,74,
+    186,236,106,166,236,234,230,228,110,49,23,168,123,210,240,184,
+    225,233,104,166,105,88,57,121,45,93,117,61,83,117,125,115,
+    250,83,95,245,7,119,31,221,125,90,163,240,19,105,223,100,
+    198,55,185,121,53,171,157,11,42,109,175,167,125,231,51,190,
+    243,112,174,50,248,129,252,72,126,218,161,240,23,210,149,99,
+    153,202,49,168,82,142,111,50,237,155,202,248,166,242,242,78,
+    167,125,51,25,223,12,156,107,104,125,222,248,172,49,235,169,
+    200,122,166,247,220,133,141,197,251,28,36,74,81,237,174,135,
+    107,108,51,104,147,44,173,165,253,249,244,179,105,160,41,149,
+    163,96,170,183,0,13,18,165,168,129,52,103,167,234,216,118,
+    213,177,172,199,167,248,79,3,53,128,212,64,241,230,244,174,
+    167,208,93,143,134,180,37,41,115,185,187,225,1,208,19,48,
+    179,7,209,174,214,18,159,219,125,201,133,135,70,234,43,116,
+    183,99,78,231,132,90,228,120,247,236,45,242,43,28,231,96,
+    143,139,197,91,37,156,205,223,10,234,163,124,155,204,35,20,
+    129,72,113,171,149,115,27,177,84,52,247,188,203,53,172,181,
+    69,24,228,38,27,115,107,13,41,96,111,201,193,113,73,138,
+    60,32,176,222,40,40,57,31,42,101,30,112,233,53,76,94,
+    199,228,60,145,59,95,2,169,149,144,200,51,75,218,171,150,
+    155,242,19,76,110,114,118,220,214,19,25,199,244,73,206,236,
+    236,200,150,55,195,144,246,119,227,104,30,128,1,24,104,217,
+    9,244,109,7,250,62,190,165,12,107,202,96,115,6,255,209,
+    242,110,59,246,237,123,46,167,190,69,95,135,88,178,229,177,
+    235,95,161,72,112,51,253,91,234,200,91,108,241,85,148,29,
+    192,235,97,120,203,129,215,107,203,235,178,248,53,42,14,224,
+    101,253,26,62,71,222,114,139,175,162,242,128,114,89,95,133,
+    31,120,237,125,10,62,139,255,33,32,248,97,76,86,169,254,
+    63,216,16,55,68,193,236,3,168,101,71,37,101,145,155,109,
+    134,229,215,9,9,198,229,75,148,136,50,63,27,1,120,177,
+    244,128,24,155,43,136,100,225,183,144,27,169,201,151,60,178,
+    29,159,139,220,143,174,109,172,241,241,141,181,69,180,120,151,
+    121,90,144,137,83,158,60,2,19,216,208,17,29,106,17,251,
+    26,172,95,30,20,90,60,25,139,160,217,46,119,47,124,125,
+    35,146,92,101,115,18,15,128,184,22,137,11,154,153,46,243,
+    83,137,120,119,138,242,241,146,40,108,196,133,8,168,254,220,
+    165,174,200,189,11,241,68,98,157,39,61,192,167,18,128,231,
+    162,107,209,56,52,208,196,47,137,80,66,50,37,135,110,71,
+    86,114,87,123,39,154,90,229,111,78,98,19,180,78,193,122,
+    210,43,83,248,24,185,41,74,75,104,203,173,16,132,169,21,
+    147,228,245,63,210,206,165,72,28,97,72,106,85,74,164,82,
+    49,104,142,32,162,1,137,101,65,123,208,157,0,69,110,128,
+    58,39,226,1,127,231,30,241,129,249,80,181,173,136,64,131,
+    54,39,39,164,139,152,76,113,104,147,199,232,189,84,203,72,
+    167,80,141,61,176,22,185,31,54,180,173,94,205,48,54,48,
+    172,213,37,108,234,127,233,42,150,228,213,10,32,183,66,255,
+    181,28,141,1,210,1,72,65,240,65,18,187,86,245,66,251,
+    141,210,213,18,173,79,212,38,189,197,225,165,68,60,37,37,
+    98,112,41,189,183,88,201,245,101,61,65,32,153,252,25,151,
+    47,185,90,12,101,220,131,226,107,16,148,49,232,187,232,163,
+    232,83,151,210,116,33,237,27,203,248,198,64,223,85,213,18,
+    85,59,162,180,77,165,171,46,103,170,46,3,223,233,115,255,
+    250,205,191,126,51,235,41,203,122,230,64,207,141,162,158,27,
+    5,93,54,2,122,46,216,240,228,220,227,115,79,5,165,99,
+    46,93,61,159,169,158,223,156,205,86,215,235,231,174,164,171,
+    175,102,170,175,194,57,80,225,189,143,123,137,62,124,29,52,
+    94,53,106,188,234,226,205,25,163,8,0,114,138,239,53,32,
+    5,145,20,44,222,156,221,109,228,142,247,124,212,255,162,63,
+    235,41,221,45,112,149,206,186,246,220,69,199,129,10,137,82,
+    212,70,63,180,253,216,234,35,77,240,228,73,90,50,193,211,
+    177,144,146,162,130,9,138,94,131,59,37,10,11,98,106,60,
+    153,76,44,69,225,102,190,45,202,167,88,193,112,148,92,175,
+    236,196,70,146,100,4,177,49,15,214,245,129,138,139,189,191,
+    162,158,124,132,247,183,133,185,191,195,168,153,174,104,183,22,
+    255,209,156,34,219,51,186,230,254,236,127,253,174,116,80,185,
+    45,175,213,95,238,5,222,10,91,222,50,139,15,28,245,74,
+    165,45,111,177,69,175,248,15,224,101,245,74,21,240,6,108,
+    121,173,122,165,26,120,131,118,188,5,156,88,35,248,197,218,
+    187,134,134,130,227,106,253,248,147,170,252,185,76,139,95,187,
+    14,202,173,119,40,183,33,223,119,35,84,51,121,27,133,32,
+    140,242,26,213,207,142,87,171,170,163,28,18,186,95,174,188,
+    196,218,188,234,153,55,212,207,98,20,36,178,38,89,65,18,
+    45,3,39,88,240,112,184,17,7,81,246,18,129,141,220,190,
+    144,138,72,68,188,155,56,32,79,92,124,135,7,137,37,69,
+    65,7,162,83,82,238,209,171,97,168,4,144,225,166,60,32,
+    243,196,228,106,34,38,220,150,91,209,235,171,201,90,208,171,
+    81,129,71,231,187,192,175,70,241,247,131,87,124,174,138,102,
+    213,152,48,52,176,220,146,123,32,163,41,67,59,128,70,74,
+    69,22,99,162,90,48,122,74,62,150,43,68,171,39,203,38,
+    189,9,245,254,126,161,90,134,244,7,84,31,184,35,88,176,
+    90,132,63,228,182,235,113,65,188,143,109,95,79,196,162,75,
+    150,235,200,237,183,196,245,88,100,137,184,65,28,120,230,67,
+    77,135,8,132,89,78,83,83,170,231,141,120,50,186,18,23,
+    5,181,46,215,113,97,237,118,132,241,110,169,1,244,5,71,
+    193,2,204,49,72,139,152,55,104,202,97,116,53,85,87,126,
+    180,28,141,238,14,71,5,170,15,139,5,113,69,18,69,181,
+    156,212,51,76,26,46,221,68,74,5,61,163,117,155,26,64,
+    171,94,239,138,155,164,149,84,108,141,35,115,13,101,142,106,
+    244,48,237,6,181,6,51,153,186,135,230,83,61,183,0,163,
+    36,214,110,221,84,235,105,62,41,199,162,101,101,37,228,170,
+    158,252,83,248,159,28,112,89,53,160,161,252,192,12,171,12,
+    110,94,253,180,245,248,243,248,179,56,104,24,165,28,45,177,
+    54,84,62,109,160,94,154,128,1,236,187,214,103,173,132,54,
+    8,52,180,239,10,168,125,87,204,53,31,123,126,225,217,5,
+    208,137,138,23,237,187,102,164,53,3,173,30,20,90,125,203,
+    19,249,177,188,213,161,244,92,75,215,93,207,212,93,87,138,
+    130,159,86,4,62,120,243,209,155,31,126,93,105,60,159,174,
+    184,144,169,184,176,121,229,83,80,138,161,199,161,167,227,74,
+    219,88,58,112,49,19,184,8,54,112,176,97,39,216,177,29,
+    236,216,186,173,156,152,79,7,111,100,130,55,54,231,178,205,
+    199,118,154,79,109,55,159,202,122,250,20,79,95,182,174,126,
+    171,56,195,143,252,168,54,243,218,220,110,97,65,105,217,30,
+    7,201,62,38,80,183,210,222,189,82,55,90,156,110,106,113,
+    122,57,190,115,167,237,220,118,27,40,89,255,67,207,119,202,
+    222,47,83,130,103,161,214,60,214,154,7,158,102,250,161,93,
+    137,29,248,69,153,132,66,161,37,36,200,35,184,65,36,21,
+    171,126,192,137,43,102,248,109,21,73,148,195,22,125,167,8,
+    9,209,55,150,44,161,55,239,80,75,48,135,240,164,251,156,
+    85,191,254,145,158,40,56,122,208,169,229,56,122,236,238,38,
+    254,163,165,253,17,219,129,134,206,237,45,252,34,58,16,120,
+    75,109,121,221,150,89,237,50,224,181,213,183,160,59,188,66,
+    137,88,113,215,152,41,135,99,67,139,127,194,196,92,89,116,
+    179,15,202,181,213,161,80,174,159,209,73,172,13,88,117,64,
+    253,89,189,30,112,228,245,90,116,117,181,99,31,90,117,117,
+    208,177,92,191,80,101,153,51,63,172,15,107,244,51,112,108,
+    32,0,75,31,178,122,189,246,115,244,33,171,215,235,196,250,
+    173,6,187,188,43,156,16,124,225,18,106,88,28,112,64,123,
+    107,217,121,116,71,222,58,161,158,225,109,62,160,220,6,134,
+    183,229,0,222,70,134,183,85,104,2,33,209,172,214,131,50,
+    137,74,226,82,138,250,46,77,194,162,149,21,22,249,156,114,
+    167,141,208,136,106,44,225,53,194,3,210,67,45,24,30,149,
+    187,157,245,191,14,84,110,163,6,122,137,79,183,124,220,30,
+    80,228,113,18,188,32,97,180,207,171,14,7,100,176,30,73,
+    129,170,142,83,213,255,170,219,25,30,228,49,202,13,186,107,
+    192,176,176,133,40,157,78,145,162,88,187,46,123,204,166,183,
+    92,71,108,170,235,148,60,226,216,108,189,43,249,155,218,181,
+    167,196,20,241,161,73,247,240,26,3,182,61,224,152,73,30,
+    114,232,2,231,28,39,157,187,195,49,83,168,72,66,195,151,
+    116,3,169,231,203,95,253,250,215,191,150,235,23,86,163,203,
+    41,254,237,72,108,131,34,67,17,15,17,25,214,231,218,79,
+    227,19,208,125,130,81,131,164,28,249,228,36,237,170,28,28,
+    197,220,73,196,184,249,93,106,10,63,144,135,109,51,137,113,
+    188,119,36,23,152,127,98,100,205,228,157,144,199,15,131,176,
+    252,59,171,98,156,223,160,14,30,187,34,230,67,109,71,81,
+    124,4,176,249,215,83,225,60,204,38,37,241,180,207,56,77,
+    193,221,55,200,201,124,115,150,130,184,122,131,147,193,113,210,
+    55,145,236,158,189,245,6,64,182,38,131,203,138,218,212,154,
+    60,79,138,62,126,213,134,248,198,90,216,120,68,243,176,108,
+    85,116,93,200,175,182,90,153,59,69,129,120,67,238,4,139,
+    48,155,115,36,27,16,249,6,167,251,125,188,73,28,43,97,
+    58,86,84,31,78,157,132,35,232,115,14,199,196,184,105,170,
+    197,184,185,106,61,189,25,70,109,115,148,0,165,96,45,140,
+    39,148,1,28,223,210,147,44,135,243,42,5,249,128,163,19,
+    1,199,16,2,142,179,155,211,217,186,230,157,186,238,237,186,
+    110,226,38,57,3,216,173,30,177,91,61,96,183,32,32,190,
+    218,166,39,111,61,126,107,107,66,233,153,75,215,204,103,106,
+    230,55,231,179,109,29,59,109,103,182,219,206,100,61,181,15,
+    125,128,24,179,129,250,76,160,59,91,85,151,169,234,217,45,
+    41,66,204,88,132,152,17,146,221,50,174,116,112,175,162,4,
+    241,96,9,193,131,187,126,238,120,207,78,251,133,237,118,192,
+    184,21,15,73,0,137,82,117,14,174,139,14,152,2,226,128,
+    129,235,182,180,63,159,127,54,255,241,136,50,56,157,110,158,
+    201,52,207,0,220,204,242,157,31,249,94,248,8,108,62,9,
+    25,142,97,134,99,144,161,5,50,52,180,238,212,247,108,215,
+    247,100,61,229,74,197,56,80,27,144,218,0,212,26,160,214,
+    53,63,137,63,166,96,28,157,68,117,72,171,43,222,188,1,
+    164,99,93,59,252,217,109,254,108,94,107,122,72,107,66,54,
+    173,121,29,90,131,23,46,161,23,246,115,29,161,157,227,99,
+    219,199,199,76,173,185,2,151,232,192,75,116,0,15,15,215,
+    8,182,61,185,248,248,226,214,5,252,167,140,204,166,171,231,
+    50,213,115,155,179,217,154,70,210,187,227,74,247,120,186,102,
+    34,83,51,1,189,219,208,106,216,6,151,88,219,128,239,124,
+    254,222,179,247,8,109,44,15,101,231,219,20,243,121,249,232,
+    135,142,14,28,19,246,0,242,85,193,239,11,128,20,74,44,
+    147,6,94,224,181,119,216,148,218,76,4,28,0,126,132,114,
+    177,234,174,17,140,9,199,198,52,192,39,94,6,84,177,32,
+    16,1,99,53,103,243,7,229,6,25,80,197,6,49,214,28,
+    208,135,44,128,172,117,236,23,43,128,172,115,236,151,114,11,
+    40,172,119,228,173,22,130,150,224,200,195,250,208,112,27,193,
+    113,157,126,108,233,67,59,176,120,212,62,180,3,143,205,182,
+    245,183,130,199,22,71,222,6,71,64,88,183,16,93,137,71,
+    82,27,146,8,250,127,213,132,7,91,44,254,44,51,163,220,
+    97,231,138,213,57,194,128,177,86,49,162,147,64,168,179,12,
+    132,66,173,79,48,4,209,195,75,145,216,210,70,76,155,198,
+    32,190,45,163,152,151,56,76,229,86,61,246,144,232,106,157,
+    214,71,34,62,81,151,21,13,15,141,156,146,123,28,193,151,
+    145,69,115,61,17,48,210,97,11,185,88,86,3,117,202,93,
+    14,144,139,201,33,135,156,129,150,133,213,30,89,38,145,39,
+    162,185,253,136,18,132,38,158,26,122,109,212,12,69,153,38,
+    230,67,218,118,219,182,229,241,104,184,51,87,32,245,162,39,
+    121,116,83,137,2,246,173,8,247,214,200,68,220,116,210,183,
+    177,59,48,146,236,111,233,32,250,244,162,220,53,23,141,19,
+    248,108,118,55,38,120,128,127,27,166,41,163,164,150,225,231,
+    23,229,115,246,25,112,54,38,26,135,60,226,253,245,88,66,
+    194,214,199,18,137,123,17,140,29,209,91,123,52,88,166,186,
+    223,184,30,79,157,85,43,115,163,145,140,54,181,24,207,15,
+    143,170,190,28,1,251,157,194,184,186,220,73,27,52,87,195,
+    82,115,160,78,250,83,78,119,199,181,177,92,118,128,78,250,
+    0,89,219,89,86,27,84,231,71,248,150,135,218,106,180,219,
+    193,32,183,234,252,211,26,122,211,238,40,206,111,133,117,6,
+    114,27,213,150,124,126,22,220,241,249,100,155,154,185,175,196,
+    18,145,20,148,163,227,55,59,7,168,218,106,220,64,91,58,
+    11,222,254,145,158,84,184,0,188,253,146,241,53,118,32,120,
+    27,68,240,118,102,115,250,83,128,103,247,30,223,35,74,255,
+    50,131,107,128,244,213,199,95,221,106,87,186,174,164,107,174,
+    102,106,174,2,182,104,61,190,211,58,176,221,58,64,226,67,
+    206,177,94,73,138,185,72,97,195,108,100,73,119,223,78,215,
+    216,118,215,88,30,74,26,32,40,105,208,6,37,13,3,74,
+    234,70,148,212,13,249,143,3,74,234,29,220,9,77,109,135,
+    166,76,40,233,60,92,163,23,175,209,11,60,93,212,187,249,
+    141,199,223,32,215,31,101,113,104,75,251,78,115,223,118,115,
+    31,169,249,89,182,118,77,252,243,129,103,3,134,63,181,9,
+    105,77,64,171,35,248,206,0,141,175,179,160,177,179,119,167,
+    227,252,118,199,249,188,86,245,145,86,245,59,32,217,78,108,
+    85,39,228,63,6,173,234,233,223,233,158,216,238,158,96,144,
+    108,15,94,163,7,120,58,160,85,157,189,31,205,188,152,33,
+    176,20,253,192,152,191,128,230,47,230,186,78,124,244,149,23,
+    95,33,200,123,26,104,93,72,235,2,90,59,253,208,65,129,
+    67,193,30,179,253,130,59,104,162,77,40,186,83,34,184,49,
+    80,230,78,169,80,124,167,76,40,185,83,14,255,189,98,133,
+    253,114,20,155,137,178,74,224,245,219,241,130,190,174,18,138,
+    196,64,110,1,139,249,248,19,102,17,157,197,249,86,13,229,
+    58,78,104,49,56,128,157,100,171,21,42,64,95,251,212,6,
+    7,125,253,165,17,185,237,64,141,13,12,221,135,234,236,240,
+    219,35,232,196,41,28,57,61,74,148,159,90,120,122,120,132,
+    40,11,77,130,43,23,85,215,89,185,207,86,19,173,196,18,
+    139,145,152,62,149,196,235,17,136,84,129,14,56,40,80,135,
+    76,242,176,179,34,117,200,50,31,170,59,68,61,224,60,175,
+    244,49,38,159,96,130,147,26,18,118,185,244,215,152,252,115,
+    46,207,176,111,163,151,9,107,151,9,235,151,49,52,3,35,
+    253,187,157,248,157,181,64,175,83,150,195,103,102,254,165,158,
+    92,67,105,249,159,185,124,105,217,133,210,114,24,165,229,57,
+    144,150,173,199,65,208,101,155,91,208,150,108,62,134,105,99,
+    19,8,9,120,240,65,200,100,59,122,224,161,204,118,134,224,
+    193,251,180,235,196,78,215,232,118,215,40,121,108,81,108,160,
+    48,43,160,194,172,152,27,60,181,51,112,101,123,224,74,158,
+    216,56,75,196,198,25,27,177,241,26,136,141,65,20,27,131,
+    144,255,4,136,141,145,51,59,195,179,219,195,179,38,177,129,
+    171,238,70,240,26,35,192,51,64,63,180,149,216,54,251,199,
+    159,255,220,62,127,209,115,215,48,207,44,17,117,165,142,70,
+    138,117,102,190,204,145,215,58,51,95,14,188,246,209,86,86,
+    129,83,225,200,107,55,51,239,84,7,171,7,191,18,120,157,
+    5,153,15,250,37,39,200,60,57,3,241,147,74,70,144,177,
+    171,200,62,143,81,104,231,253,175,181,173,127,192,198,43,239,
+    196,27,180,24,89,245,142,188,181,66,157,141,161,231,84,7,
+    214,168,106,116,228,181,26,85,77,142,188,77,66,179,141,167,
+    191,197,150,183,69,104,101,141,53,224,109,179,229,109,19,120,
+    134,151,23,112,61,94,187,90,63,78,98,194,230,34,235,154,
+    99,119,46,162,249,84,123,88,61,225,196,249,106,216,70,97,
+    208,80,179,240,90,100,221,128,149,107,26,63,198,148,158,153,
+    68,118,140,209,166,235,242,54,48,186,96,241,1,19,66,102,
+    120,95,163,160,57,72,20,60,141,93,187,48,27,93,139,166,
+    116,175,44,177,72,128,29,125,200,252,198,58,218,9,253,95,
+    30,252,50,152,126,203,252,80,31,58,234,13,55,48,198,207,
+    165,168,85,51,122,157,206,211,243,116,146,157,239,177,6,255,
+    153,252,194,70,100,161,90,52,50,19,157,120,213,76,167,59,
+    192,32,121,91,148,104,213,35,252,106,34,197,203,9,96,252,
+    87,120,129,144,85,251,69,141,152,57,92,167,7,125,67,205,
+    172,151,56,1,40,119,218,218,99,44,175,201,216,236,118,208,
+    149,108,22,185,215,89,73,90,138,255,17,150,60,54,158,155,
+    231,32,45,196,32,193,229,8,186,251,193,8,93,89,33,142,
+    246,72,156,222,24,248,0,112,79,98,16,11,137,16,89,89,
+    93,161,99,236,199,23,15,44,40,185,22,137,197,14,40,41,
+    150,120,71,250,39,108,109,140,112,195,163,215,230,192,252,71,
+    168,132,214,154,255,125,81,62,61,174,133,98,226,98,73,18,
+    63,115,148,235,75,47,176,17,54,121,143,112,237,40,247,243,
+    66,78,110,152,124,176,20,163,195,7,56,197,245,4,154,220,
+    162,20,77,192,104,60,57,20,79,202,231,181,209,168,197,79,
+    210,167,137,152,203,107,235,27,41,58,244,49,188,36,138,197,
+    210,73,56,126,49,18,23,222,137,10,169,213,249,208,177,163,
+    76,99,160,133,75,32,140,132,225,8,170,151,60,74,97,250,
+    248,169,94,50,63,19,166,143,146,22,162,2,79,67,24,159,
+    6,26,182,83,111,18,8,249,118,105,173,133,194,152,205,42,
+    111,225,112,6,75,199,45,188,54,40,233,159,33,103,29,222,
+    156,176,62,42,77,22,105,45,116,188,221,121,154,65,31,65,
+    108,6,155,243,245,244,10,36,220,20,110,187,185,40,114,9,
+    27,66,49,189,213,170,151,220,229,240,18,253,85,162,5,57,
+    171,181,137,229,101,144,161,235,218,76,106,88,187,225,44,236,
+    251,183,122,34,34,236,251,149,203,102,134,227,28,194,190,41,
+    128,125,85,181,79,90,31,183,130,229,152,241,52,100,61,227,
+    123,238,66,92,22,81,72,150,69,148,97,144,232,216,227,49,
+    98,31,78,231,5,137,22,155,73,147,12,169,166,81,11,166,
+    249,146,210,63,147,14,206,102,130,179,155,115,100,102,100,112,
+    187,109,144,68,163,158,99,61,244,173,199,159,191,245,236,45,
+    82,220,8,208,90,145,214,10,180,70,160,161,37,121,113,187,
+    251,98,30,164,28,36,144,114,200,6,82,142,0,164,68,43,
+    179,132,90,153,126,238,196,208,78,239,229,237,222,203,38,72,
+    121,1,174,113,2,175,113,2,120,186,225,26,109,29,207,239,
+    61,187,71,172,205,121,214,246,135,186,125,229,217,87,72,189,
+    111,176,117,211,243,1,20,158,115,202,167,149,153,151,143,239,
+    124,254,141,103,223,32,101,94,97,251,194,84,151,203,108,153,
+    208,237,231,31,159,223,42,86,122,38,211,213,83,153,234,169,
+    205,217,108,75,251,243,175,61,251,26,177,254,243,175,67,63,
+    116,100,224,120,176,143,47,194,197,215,159,15,42,227,22,16,
+    12,128,115,90,130,226,27,159,187,57,103,114,24,91,214,251,
+    35,93,250,119,144,229,85,59,69,24,60,64,12,99,154,89,
+    7,25,154,254,63,98,176,17,182,85,45,138,172,173,175,177,
+    143,198,79,244,228,57,62,26,40,207,216,165,83,116,213,20,
+    60,26,217,114,255,78,121,104,187,60,148,245,240,138,135,79,
+    123,218,51,158,118,165,227,26,244,176,23,123,216,91,188,57,
+    133,255,104,233,63,97,187,215,176,68,30,57,70,252,126,206,
+    201,35,123,94,235,228,145,179,173,98,157,60,114,158,104,178,
+    78,30,121,29,203,181,174,34,65,91,197,214,145,2,67,167,
+    82,168,16,253,119,141,233,22,56,206,77,52,249,24,155,130,
+    157,0,194,40,38,219,200,96,40,183,154,25,146,172,61,18,
+    20,170,96,72,6,84,126,74,140,165,34,147,9,73,18,233,
+    140,2,12,79,33,74,118,93,32,97,36,73,121,136,29,164,
+    135,229,120,245,154,13,6,22,48,19,104,18,35,23,206,190,
+    107,217,168,114,74,98,36,29,250,122,228,19,57,180,72,178,
+    89,124,236,132,95,243,176,255,99,204,225,155,192,233,0,192,
+    1,52,131,244,31,240,100,207,108,226,29,220,253,66,155,64,
+    89,139,36,239,105,243,39,0,5,34,196,97,78,139,87,11,
+    135,71,206,202,173,142,24,149,2,211,77,44,179,209,22,152,
+    178,104,180,217,1,141,82,8,218,230,12,65,181,32,220,154,
+    163,130,16,213,79,91,64,92,214,212,85,93,70,123,154,120,
+    191,43,233,49,182,60,231,184,151,112,85,153,244,0,147,124,
+    127,140,244,46,38,6,124,144,254,1,103,13,80,84,245,228,
+    99,20,25,251,92,190,200,232,71,145,49,129,34,99,150,196,
+    11,60,121,239,241,123,36,62,245,53,214,75,27,168,67,77,
+    187,85,160,116,156,74,87,157,206,84,157,6,254,218,38,99,
+    234,253,52,227,162,54,148,232,27,74,223,108,58,56,151,9,
+    206,129,18,133,66,6,30,15,108,85,43,93,19,233,192,100,
+    38,48,185,57,99,138,82,165,234,241,192,32,213,110,231,32,
+    85,67,57,142,56,6,169,98,55,252,46,148,200,212,228,205,
+    219,7,41,17,164,75,255,21,178,188,234,37,143,42,111,122,
+    86,249,220,195,74,195,196,146,159,79,153,96,155,213,34,97,
+    105,61,197,142,140,159,233,201,143,15,86,38,179,154,50,25,
+    222,46,31,206,122,122,20,79,79,218,211,155,241,244,102,61,
+    167,0,111,161,50,41,204,87,38,63,99,187,217,80,38,163,
+    95,84,40,235,111,75,153,216,243,90,149,137,179,227,235,55,
+    81,38,134,10,51,43,150,223,174,50,113,108,171,117,139,36,
+    231,8,135,82,139,51,171,246,128,126,97,35,17,234,14,237,
+    23,195,205,4,199,185,72,4,182,95,236,156,100,71,237,23,
+    54,18,161,225,11,170,19,235,140,107,252,28,117,98,157,115,
+    77,66,3,136,145,70,181,237,58,8,133,149,141,88,68,90,
+    32,81,98,19,27,203,203,96,174,230,228,74,167,37,186,213,
+    46,131,220,111,23,228,170,115,134,181,216,180,69,194,139,225,
+    13,36,62,18,119,186,121,137,11,228,228,33,171,167,41,183,
+    177,18,218,248,124,74,92,91,79,72,145,152,22,115,72,28,
+    86,36,214,94,250,111,28,174,248,177,87,200,82,36,26,71,
+    113,183,17,143,166,164,159,114,249,81,169,76,40,64,62,115,
+    78,139,59,133,205,230,241,203,7,132,205,230,23,252,39,88,
+    230,168,53,210,18,23,150,10,81,1,172,87,51,206,137,240,
+    11,55,251,199,231,38,41,202,145,219,236,35,126,23,6,23,
+    110,242,192,149,148,143,59,7,16,231,152,46,58,45,17,90,
+    125,144,140,46,69,98,253,169,68,255,2,217,116,107,3,123,
+    124,156,222,9,98,131,16,31,165,60,113,192,18,162,163,150,
+    225,84,137,92,38,44,66,47,206,84,64,226,240,74,28,90,
+    134,86,137,249,80,243,145,253,60,248,44,169,101,75,171,27,
+    113,186,111,6,89,184,161,86,235,55,55,140,55,215,188,30,
+    169,38,159,226,48,247,213,146,207,229,236,196,225,243,25,109,
+    98,11,76,65,5,198,72,50,1,194,58,237,129,34,110,32,
+    234,103,209,226,29,172,4,221,15,213,177,158,12,91,169,108,
+    216,67,183,45,151,77,13,59,146,235,71,41,206,150,235,240,
+    137,189,191,213,147,191,65,228,209,197,196,176,246,33,242,56,
+    131,200,227,210,230,244,167,58,38,213,48,166,13,38,37,222,
+    139,139,121,59,98,20,115,190,234,15,222,122,244,22,174,146,
+    26,79,87,76,100,42,38,54,175,100,27,219,104,40,1,176,
+    15,179,161,4,185,32,132,10,165,242,12,27,132,240,247,20,
+    76,48,255,98,158,128,239,41,54,152,160,173,131,46,56,131,
+    154,15,176,46,21,12,114,29,218,230,135,72,205,79,177,97,
+    16,125,195,59,39,38,183,79,76,230,213,124,136,212,124,216,
+    166,230,211,46,168,122,31,86,189,15,10,232,129,170,227,132,
+    232,245,237,129,235,70,213,179,158,89,128,125,56,233,89,72,
+    39,61,61,127,15,23,161,31,58,132,112,224,216,175,219,70,
+    221,108,222,152,23,183,229,53,54,229,109,94,136,69,215,156,
+    102,129,168,150,67,77,53,31,114,179,130,230,63,97,242,31,
+    57,171,109,245,11,61,41,135,33,156,196,12,166,113,92,29,
+    196,85,237,144,224,63,154,233,23,142,53,103,183,20,214,107,
+    126,199,173,217,16,29,88,251,195,236,120,50,117,35,253,28,
+    117,117,41,105,138,101,177,120,206,146,252,239,54,237,249,165,
+    158,248,177,61,124,126,123,130,13,104,192,213,128,197,70,230,
+    212,233,135,102,254,37,219,46,195,174,122,204,253,6,118,149,
+    231,16,187,10,65,189,237,94,173,144,183,156,201,203,26,15,
+    94,109,33,97,128,140,134,124,231,94,189,37,182,68,227,145,
+    219,236,130,74,128,24,70,39,29,130,164,29,236,134,255,65,
+    250,188,226,168,46,62,58,124,48,140,159,26,233,164,247,255,
+    167,205,109,249,59,61,169,197,219,178,146,127,91,202,219,80,
+    92,246,162,184,28,1,113,153,243,250,117,40,158,14,109,75,
+    195,158,89,179,215,15,164,130,183,74,55,231,112,101,40,221,
+    186,206,209,156,251,59,199,187,187,253,251,238,27,252,60,230,
+    220,81,125,131,206,126,196,10,75,112,184,163,233,39,84,90,
+    76,178,202,3,120,217,248,2,191,99,29,172,241,5,142,102,
+    162,77,124,65,181,80,11,79,71,157,90,49,113,227,166,233,
+    193,168,182,236,114,123,227,166,220,96,183,201,109,98,29,125,
+    130,56,141,47,119,128,161,48,192,39,151,18,18,9,126,221,
+    88,71,152,67,48,223,162,136,59,252,45,47,39,197,212,75,
+    33,199,42,37,54,226,194,1,172,248,200,203,237,11,164,192,
+    8,6,86,71,209,177,8,76,215,254,240,38,78,62,106,83,
+    229,194,203,75,200,104,191,62,159,56,35,111,221,194,249,195,
+    123,212,17,217,72,28,145,250,156,35,129,243,154,99,111,229,
+    229,0,50,116,58,122,25,105,189,146,60,110,18,120,91,254,
+    177,54,37,143,1,1,44,149,143,196,146,9,186,173,77,92,
+    92,33,11,163,244,197,101,236,95,79,116,64,28,200,185,22,
+    33,83,44,70,119,236,89,141,196,150,117,216,172,215,132,20,
+    185,158,72,70,73,145,236,159,94,5,220,183,135,84,41,133,
+    97,9,164,156,252,186,36,226,184,209,110,237,229,220,146,51,
+    1,84,204,3,186,189,207,75,178,109,108,135,99,55,152,89,
+    81,194,201,127,160,205,248,66,127,82,90,132,238,45,172,103,
+    136,137,203,41,188,9,180,129,203,82,98,205,84,14,251,71,
+    202,157,15,5,143,236,96,45,37,67,14,240,232,125,181,148,
+    12,41,122,184,24,17,194,132,162,150,72,18,157,213,245,224,
+    246,57,196,237,234,167,61,21,198,123,69,77,6,178,179,65,
+    157,222,65,97,173,39,195,116,81,158,26,32,117,13,211,157,
+    121,180,115,126,243,57,82,70,26,203,200,99,165,51,162,172,
+    124,255,149,158,116,160,124,47,103,38,60,27,81,190,119,162,
+    124,239,219,156,206,250,107,158,248,30,251,158,74,202,241,235,
+    105,255,116,198,63,13,4,237,92,82,233,152,78,251,103,50,
+    254,153,220,57,224,187,154,246,95,203,248,175,193,57,192,196,
+    241,71,241,167,183,148,99,83,105,223,229,140,239,50,221,230,
+    238,189,71,239,61,93,84,218,199,210,149,23,51,149,23,55,
+    175,153,221,192,39,89,200,13,72,244,238,179,187,89,143,119,
+    183,160,160,244,146,107,207,237,70,48,234,166,96,212,171,237,
+    110,183,53,165,244,78,164,27,38,51,13,147,74,81,173,185,
+    188,17,182,60,200,208,252,172,25,104,184,89,79,221,158,187,
+    8,23,55,21,89,22,55,97,239,216,235,160,191,225,126,207,
+    117,208,145,231,167,132,114,144,189,94,181,114,97,226,198,141,
+    203,7,237,122,71,24,108,119,189,75,46,38,18,100,151,241,
+    59,80,162,220,114,57,255,65,213,3,44,168,111,71,250,63,
+    200,99,218,11,37,137,91,120,196,73,84,145,105,171,187,40,
+    118,181,220,104,94,159,162,153,124,90,57,47,241,113,148,35,
+    115,209,248,64,254,2,86,186,62,34,98,60,201,122,161,3,
+    252,237,85,77,252,161,216,38,65,83,121,187,121,37,65,94,
+    45,38,238,27,114,6,85,66,82,60,34,178,34,107,50,171,
+    181,166,106,110,44,250,184,215,230,26,24,54,53,80,173,212,
+    174,103,24,254,139,164,8,42,70,140,22,133,215,151,44,30,
+    116,191,75,75,198,241,193,69,108,237,184,237,31,26,159,161,
+    103,33,92,109,121,53,221,120,45,211,120,13,163,83,91,218,
+    159,191,249,236,205,173,175,43,189,179,233,150,185,76,203,156,
+    82,212,136,179,42,209,199,209,173,34,156,36,169,157,204,212,
+    78,110,222,192,220,253,207,250,181,199,228,58,238,105,133,214,
+    107,17,177,94,233,135,86,11,43,99,239,122,127,81,240,59,
+    120,78,108,81,186,205,115,226,232,78,7,68,95,33,148,138,
+    62,147,139,220,151,139,115,61,52,24,253,192,216,208,67,130,
+    209,3,159,3,231,85,59,182,213,138,243,130,135,182,213,8,
+    159,135,227,220,142,79,108,91,237,98,78,143,218,86,187,93,
+    37,236,235,111,93,64,136,110,123,219,157,165,132,26,91,119,
+    186,125,185,214,133,125,141,154,155,187,114,225,182,56,183,112,
+    160,252,67,6,121,212,78,254,173,99,108,90,88,247,64,235,
+    129,70,198,170,106,20,141,63,134,139,73,255,30,19,220,200,
+    89,30,58,32,208,145,96,35,211,118,83,116,214,216,133,110,
+    240,62,135,120,71,251,44,57,23,181,211,18,1,135,156,7,
+    45,17,112,200,162,186,135,71,79,158,61,37,15,58,54,76,
+    95,240,70,229,225,146,134,52,163,220,37,156,201,63,112,93,
+    93,126,14,185,255,144,109,42,24,246,161,195,247,171,96,171,
+    4,131,87,30,118,116,148,223,18,87,176,217,115,160,105,248,
+    27,146,0,60,116,138,227,182,220,50,46,8,188,176,177,14,
+    215,64,83,194,164,73,110,205,221,152,32,46,18,179,234,147,
+    68,140,92,52,94,94,97,172,197,59,108,111,173,220,74,138,
+    106,50,244,96,200,73,164,78,84,227,180,209,91,20,206,221,
+    34,187,133,119,45,78,92,182,11,240,186,157,184,15,88,130,
+    225,148,197,198,241,219,170,199,59,235,119,130,137,119,108,118,
+    160,83,7,117,151,3,149,117,28,135,28,248,108,42,196,107,
+    29,138,187,109,132,19,120,147,117,165,174,119,226,85,218,137,
+    130,16,54,110,184,78,11,167,18,97,105,45,177,168,214,230,
+    223,97,35,47,163,208,235,92,90,114,3,21,250,127,113,57,
+    41,116,220,72,186,177,109,167,177,119,187,177,151,4,174,13,
+    176,254,100,92,84,71,87,153,120,21,223,37,118,149,137,201,
+    215,123,142,245,245,218,174,64,25,253,2,87,160,236,122,184,
+    174,19,59,157,167,183,59,79,103,61,149,74,213,68,222,242,
+    52,168,65,71,232,163,177,23,99,196,159,124,158,221,238,96,
+    224,228,78,255,229,237,254,203,121,181,59,77,106,55,106,83,
+    187,179,80,187,1,172,221,0,228,239,133,218,13,143,238,12,
+    205,108,15,205,152,106,135,241,151,195,120,141,97,224,233,135,
+    218,245,244,127,244,222,139,247,72,191,78,230,123,201,73,207,
+    77,191,152,38,189,218,207,246,156,30,132,89,174,84,12,58,
+    6,18,214,177,8,201,240,193,162,218,181,190,214,13,116,82,
+    161,218,144,247,122,174,91,98,10,99,145,175,195,120,178,190,
+    16,230,255,195,151,155,145,87,121,144,201,167,220,75,205,204,
+    125,32,97,207,153,119,237,39,47,251,144,219,29,59,205,216,
+    184,255,219,5,191,225,251,205,174,110,251,175,254,191,191,223,
+    172,136,21,239,88,111,86,38,116,185,180,228,79,176,178,199,
+    57,179,76,216,45,56,240,205,101,93,142,104,156,115,68,227,
+    128,214,138,217,55,116,172,184,238,148,136,30,135,237,55,236,
+    86,112,57,241,218,173,224,114,46,215,186,85,135,19,175,213,
+    154,173,112,228,181,122,84,125,192,107,191,183,170,21,105,251,
+    29,203,181,34,237,42,224,117,12,186,16,170,196,160,105,111,
+    213,224,93,3,59,127,194,188,235,210,226,81,173,129,114,109,
+    87,64,65,185,117,12,210,102,209,115,61,121,191,88,131,238,
+    103,189,121,253,202,65,126,86,32,219,250,89,215,163,203,8,
+    101,123,112,104,226,204,149,124,50,47,74,97,73,36,155,92,
+    231,197,101,144,229,70,20,163,104,42,149,198,92,158,50,57,
+    0,54,22,53,19,249,176,172,114,43,227,90,64,196,61,64,
+    195,52,113,101,202,75,28,232,114,128,97,90,24,159,160,49,
+    21,172,99,66,95,229,170,57,38,8,46,119,14,238,36,96,
+    130,162,112,251,224,78,202,112,120,112,39,225,59,40,184,147,
+    48,228,189,119,5,219,69,36,252,95,112,95,236,123,87,236,
+    37,119,202,52,212,241,5,60,66,65,254,208,180,125,23,75,
+    225,188,132,142,107,213,103,22,185,55,39,173,111,95,33,175,
+    239,32,226,237,12,199,188,118,165,157,121,241,141,169,40,13,
+    66,37,229,161,188,193,203,190,42,199,38,7,246,71,18,223,
+    111,112,148,183,231,104,111,199,249,169,183,115,75,248,248,138,
+    114,106,42,237,189,156,241,226,130,2,61,28,52,63,209,68,
+    122,227,33,136,29,95,58,34,141,113,121,30,227,122,124,100,
+    194,12,128,39,126,225,250,228,198,146,61,165,202,24,235,6,
+    52,110,209,66,167,244,136,136,124,152,170,86,235,43,160,77,
+    62,41,109,177,17,25,103,6,99,57,253,105,139,254,107,40,
+    205,25,235,215,83,6,155,24,12,220,217,150,213,109,189,46,
+    45,249,0,111,205,149,3,61,207,248,22,22,133,127,61,93,
+    125,62,83,125,94,9,92,216,156,249,180,173,195,216,179,234,
+    18,187,10,196,180,159,213,56,75,107,104,125,238,123,230,67,
+    183,215,116,186,126,38,83,63,163,20,213,100,1,117,2,38,
+    254,225,176,50,58,157,238,152,201,116,204,224,146,109,26,178,
+    241,113,64,233,159,77,55,206,101,26,231,0,93,127,106,222,
+    237,54,183,64,71,139,45,14,40,157,227,233,192,68,38,48,
+    241,219,143,45,222,245,184,221,101,168,239,217,132,118,49,118,
+    236,124,136,87,235,215,78,15,208,152,221,228,64,222,59,134,
+    37,124,144,213,38,19,57,111,27,100,28,12,173,38,34,187,
+    221,49,210,75,129,190,142,47,41,73,170,30,60,148,18,247,
+    31,168,94,56,50,94,189,68,223,196,74,222,186,67,94,83,
+    242,101,99,68,145,77,150,201,246,199,100,23,91,178,179,28,
+    217,161,132,44,188,39,83,212,63,49,36,6,153,162,38,33,
+    195,36,122,135,204,93,147,25,107,50,59,77,166,48,252,186,
+    245,68,133,74,175,117,192,189,242,156,167,47,145,29,147,198,
+    92,20,122,39,39,1,213,238,22,186,92,174,221,121,23,231,
+    58,169,112,35,230,79,150,11,41,250,39,203,245,41,250,39,
+    203,213,41,250,39,203,213,42,250,39,203,53,42,250,103,183,
+    184,220,5,112,204,154,236,97,178,159,59,215,124,206,213,190,
+    203,89,147,15,191,182,135,95,251,185,179,178,203,237,186,142,
+    175,203,177,77,63,140,239,145,239,125,51,197,223,238,42,222,
+    229,172,201,135,239,237,225,215,126,238,236,180,171,208,53,4,
+    248,212,146,124,60,182,135,95,251,185,179,94,30,51,89,19,
+    165,174,123,15,191,247,115,167,175,64,149,199,176,46,108,66,
+    120,225,123,63,119,218,63,130,185,172,137,210,54,184,135,223,
+    251,185,211,119,93,103,241,208,154,40,173,3,123,248,189,159,
+    59,253,182,171,17,15,173,137,194,159,217,195,239,253,220,233,
+    115,103,240,200,154,60,253,230,30,126,237,231,206,166,92,197,
+    120,104,77,148,154,206,61,252,222,207,157,14,212,224,145,53,
+    217,122,176,135,95,251,185,179,67,37,120,100,77,72,161,37,
+    200,106,156,14,142,225,145,53,81,186,70,247,240,123,63,119,
+    122,162,160,192,85,3,122,202,146,40,199,95,223,195,239,253,
+    220,233,178,66,87,3,222,101,54,1,97,135,195,160,97,63,
+    119,218,91,142,23,176,38,74,67,8,199,120,241,126,238,116,
+    179,211,45,8,118,88,110,129,83,169,181,93,150,82,79,225,
+    145,53,33,172,167,144,213,56,29,135,219,21,192,187,193,38,
+    91,21,120,183,2,251,185,179,129,99,46,144,163,214,132,212,
+    21,190,247,109,104,68,200,252,95,165,220,248,211,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/cache/prefetch/Prefetcher.py",
+    "m5.objects.Prefetcher",
+    embedded_module_data,
+    10845,
+    32931);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,178 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,165,88,91,111,19,73,22,238,246,45,237,75,28,59,
+    119,114,129,38,64,24,103,33,220,134,64,178,129,204,132,16,
+    18,4,153,108,2,51,218,104,87,86,219,93,196,61,235,219,
+    118,119,128,248,97,101,105,103,37,196,203,32,94,200,204,160,
+    29,246,133,21,66,218,31,49,191,192,140,144,214,234,39,164,
+    125,226,205,17,126,226,105,207,169,118,251,210,23,27,24,219,
+    57,213,169,239,235,238,115,78,157,58,117,170,254,199,52,125,
+    188,181,246,221,140,139,97,158,48,34,35,178,105,230,150,222,
+    178,180,117,165,93,25,247,150,155,101,92,204,53,70,116,127,
+    199,136,30,226,126,238,102,152,151,110,227,33,91,30,138,121,
+    1,243,17,143,9,243,82,172,11,48,206,130,249,40,230,7,
+    44,64,124,38,172,139,98,65,192,66,150,251,56,138,117,3,
+    22,182,96,126,138,245,0,22,33,126,19,22,160,88,20,176,
+    94,18,48,97,65,138,245,1,214,111,121,102,136,98,3,128,
+    13,90,176,110,138,13,1,54,108,193,194,20,59,0,216,8,
+    9,155,176,30,138,141,2,54,70,188,38,44,66,177,113,192,
+    14,90,238,139,82,236,16,96,188,5,235,165,216,97,192,38,
+    72,175,9,235,163,216,17,192,142,90,176,126,138,29,3,108,
+    210,98,195,0,197,142,3,246,153,197,159,131,98,108,147,137,
+    77,189,197,127,98,172,198,78,129,240,111,74,153,175,18,223,
+    146,164,154,100,154,62,108,173,125,119,144,193,64,35,204,22,
+    43,50,91,46,248,115,139,236,150,71,116,109,121,69,247,150,
+    79,244,192,3,189,218,192,162,160,144,13,146,79,11,73,146,
+    33,89,117,61,151,150,146,187,183,10,7,183,73,230,252,220,
+    156,220,64,226,121,10,205,205,225,29,133,201,12,201,156,74,
+    10,201,20,57,101,225,72,68,57,149,0,210,116,42,181,22,
+    235,210,184,120,60,43,100,72,60,174,5,226,241,76,78,220,
+    73,227,117,40,30,255,235,142,144,174,33,30,117,55,79,52,
+    78,72,40,170,44,36,85,205,159,188,127,63,158,76,11,138,
+    162,5,240,50,69,4,145,200,47,152,119,104,217,251,89,69,
+    78,158,234,160,128,217,38,232,155,206,239,202,62,184,159,10,
+    30,254,148,9,16,197,250,183,28,156,40,46,149,123,250,138,
+    43,229,200,233,226,106,57,58,91,188,142,95,185,199,184,169,
+    197,209,198,232,188,251,197,209,209,196,247,172,139,177,249,136,
+    238,231,48,76,47,141,161,130,121,230,200,244,152,152,126,96,
+    6,108,153,94,19,51,232,200,244,153,152,33,177,11,130,129,
+    211,252,75,59,36,45,101,183,55,214,11,135,157,199,191,70,
+    42,156,232,48,2,162,206,139,203,121,8,132,194,212,173,20,
+    225,21,169,64,248,220,29,94,224,101,178,45,229,178,124,50,
+    151,85,5,41,11,52,62,151,5,92,200,228,211,164,48,187,
+    182,147,73,16,25,153,240,68,25,30,198,75,89,184,137,194,
+    200,85,136,202,171,41,65,229,19,36,157,131,255,213,28,160,
+    42,17,50,133,225,205,157,196,201,38,117,120,93,107,254,75,
+    71,100,113,45,214,45,163,239,101,14,133,31,5,186,77,14,
+    161,232,6,161,121,215,5,89,200,104,220,237,172,34,109,103,
+    137,168,69,65,111,69,149,212,29,146,77,238,198,209,42,205,
+    143,175,167,151,52,82,180,126,171,235,226,130,109,111,66,14,
+    227,155,104,144,69,80,244,26,226,56,198,232,119,166,24,29,
+    132,24,141,156,195,240,92,40,94,127,51,60,254,115,248,199,
+    112,153,251,124,223,237,58,224,171,50,32,74,158,129,138,143,
+    137,14,62,9,63,6,224,10,0,81,4,162,190,226,42,244,
+    143,29,254,239,232,204,175,163,51,101,110,2,144,49,68,198,
+    224,150,225,54,144,254,211,21,236,53,207,130,122,186,25,113,
+    156,5,162,27,162,203,163,249,150,87,151,191,130,208,106,147,
+    90,144,81,136,117,136,171,59,210,157,156,30,84,107,47,124,
+    237,71,206,236,217,17,67,204,161,103,199,77,158,237,67,207,
+    210,137,63,223,60,241,71,62,221,228,240,38,129,72,17,175,
+    164,132,108,146,128,233,147,206,166,55,51,11,103,59,184,64,
+    161,228,120,146,178,107,190,144,71,109,12,30,55,196,23,118,
+    6,143,162,193,23,209,224,171,205,6,143,127,186,193,222,27,
+    203,183,193,206,113,103,59,129,80,248,172,131,121,233,59,59,
+    237,140,58,100,136,101,212,201,108,84,47,26,117,10,141,250,
+    125,179,81,135,126,139,81,27,157,140,218,248,0,163,228,182,
+    70,77,24,226,6,94,240,117,112,194,172,183,199,208,123,217,
+    81,111,231,101,7,150,19,40,63,95,186,140,158,45,78,244,
+    130,141,62,205,187,184,186,222,222,70,32,116,180,49,33,229,
+    117,27,223,226,226,88,152,90,39,114,18,8,194,54,205,250,
+    137,116,46,249,23,5,147,117,130,64,66,87,136,172,18,145,
+    23,20,254,230,198,237,181,152,191,195,84,238,3,161,117,213,
+    158,168,185,19,106,222,236,194,163,134,216,192,96,63,211,46,
+    46,202,129,158,239,79,62,60,185,199,150,70,175,189,10,172,
+    188,14,172,20,175,224,87,127,218,81,199,88,233,109,245,57,
+    11,62,119,129,255,220,16,35,232,63,25,29,187,246,194,99,
+    54,229,184,205,128,199,12,241,71,212,182,175,85,219,64,176,
+    89,159,216,111,136,221,155,157,98,247,230,7,196,110,166,125,
+    236,158,48,196,159,91,99,247,196,167,235,205,109,8,89,49,
+    151,1,213,121,103,213,117,78,225,119,29,180,151,41,173,157,
+    1,211,134,64,109,45,105,114,0,35,231,44,70,206,229,230,
+    140,50,109,182,174,62,51,255,233,104,221,199,204,76,224,250,
+    109,185,94,40,224,90,185,176,169,123,22,180,229,118,137,156,
+    137,27,18,253,224,225,128,214,181,184,177,65,231,252,161,54,
+    115,30,41,133,169,78,179,94,150,235,243,30,223,83,24,106,
+    212,111,9,73,85,248,60,92,111,108,172,127,189,92,152,93,
+    151,165,156,44,169,88,7,146,187,82,82,197,106,206,200,11,
+    88,208,165,132,187,88,155,165,4,72,12,124,74,82,161,80,
+    196,249,158,222,149,143,225,147,207,126,72,70,185,39,169,41,
+    158,214,133,248,210,142,229,157,158,89,220,171,144,85,184,236,
+    78,38,142,42,107,158,197,92,46,173,133,64,131,120,94,87,
+    121,87,158,100,28,166,242,105,67,72,24,62,196,20,62,253,
+    24,62,103,48,124,46,65,226,233,233,255,126,247,225,238,94,
+    180,52,118,254,85,207,204,235,158,25,216,109,244,13,63,153,
+    123,60,87,230,186,75,61,215,161,242,234,199,202,171,223,87,
+    188,1,53,89,48,130,121,170,204,249,75,193,5,128,130,8,
+    5,125,205,201,225,180,57,12,59,39,43,159,62,242,111,69,
+    32,172,201,83,54,22,93,48,196,93,198,38,57,117,55,191,
+    255,130,249,253,70,168,189,155,105,121,191,139,33,238,231,208,
+    243,178,78,196,211,12,216,145,183,246,249,68,22,116,116,105,
+    93,75,186,146,176,131,52,15,31,117,247,80,93,205,97,27,
+    253,231,12,81,64,253,167,90,244,175,132,153,177,35,123,23,
+    126,152,125,58,11,101,109,121,244,240,222,204,15,23,159,94,
+    52,21,186,115,142,110,29,180,113,43,204,238,90,190,93,195,
+    124,43,95,4,206,91,188,99,45,230,181,93,12,206,217,40,
+    61,111,136,127,160,210,195,86,167,151,123,34,197,21,252,234,
+    55,205,155,85,172,39,160,191,49,237,182,254,164,235,25,199,
+    216,124,68,15,236,33,91,147,133,31,184,14,123,72,177,203,
+    196,13,194,59,66,34,183,213,93,75,48,190,205,21,9,6,
+    176,237,89,2,82,222,119,42,248,149,148,145,94,36,172,99,
+    11,131,141,244,178,185,114,229,150,177,71,148,47,225,120,159,
+    111,202,16,144,79,238,165,164,100,138,23,178,148,180,203,99,
+    197,188,77,183,147,152,43,112,7,170,107,162,47,220,177,176,
+    109,166,192,204,106,74,23,114,63,8,205,175,164,146,170,190,
+    231,195,220,160,245,213,31,27,87,83,50,81,82,185,180,40,
+    159,175,143,185,105,184,23,12,241,16,135,251,79,173,195,77,
+    55,35,77,71,17,176,35,121,19,25,192,45,221,222,78,105,
+    242,242,171,200,194,235,200,66,113,245,205,200,161,159,79,254,
+    168,231,135,69,200,15,163,152,31,70,97,211,54,84,225,152,
+    254,225,226,141,55,173,149,196,130,99,84,119,92,145,253,56,
+    86,55,73,166,253,225,64,141,36,127,129,254,180,93,107,151,
+    12,241,19,99,179,214,54,118,183,45,123,176,165,79,215,155,
+    67,149,214,175,180,175,36,116,78,27,173,151,13,241,47,59,
+    173,27,21,66,139,214,203,102,173,235,19,116,221,81,107,167,
+    10,129,112,223,214,171,1,209,109,94,255,107,167,121,129,91,
+    50,33,235,250,118,101,194,217,90,131,85,152,238,48,243,84,
+    32,198,243,245,157,75,97,188,49,243,210,4,86,106,122,46,
+    67,224,126,30,153,107,177,224,7,172,180,242,89,156,42,190,
+    117,65,198,58,222,43,40,74,46,169,5,112,225,213,31,105,
+    246,252,138,33,254,141,158,63,103,242,252,16,122,254,115,244,
+    252,151,176,184,70,7,159,28,120,124,96,111,230,233,124,41,
+    182,242,42,186,250,58,186,218,60,30,43,159,30,69,221,223,
+    16,105,59,5,213,133,238,220,99,206,206,109,34,22,206,116,
+    240,239,189,26,55,222,97,115,120,211,16,255,177,139,190,17,
+    244,193,5,244,193,82,179,181,200,95,139,13,105,254,204,249,
+    233,60,30,96,41,26,135,151,114,238,254,174,22,130,171,250,
+    249,177,140,113,169,31,141,210,179,39,122,76,66,143,14,232,
+    86,155,110,77,233,230,138,238,89,104,181,79,43,102,186,16,
+    211,53,152,174,183,116,253,162,89,109,169,62,101,86,234,234,
+    183,154,244,158,155,215,143,130,47,203,127,168,13,132,242,119,
+    216,52,86,220,44,203,86,102,24,118,184,196,12,233,191,50,
+    51,88,50,126,101,102,162,212,250,171,248,60,236,92,133,177,
+    138,189,213,125,108,170,141,222,112,132,245,85,24,171,40,69,
+    142,237,99,91,109,116,79,186,217,75,21,198,42,74,221,19,
+    251,216,86,27,221,33,55,187,204,226,165,157,124,244,245,62,
+    109,171,205,8,220,49,143,151,102,81,10,29,70,246,124,181,
+    209,253,49,84,15,187,202,162,161,118,242,193,213,125,218,86,
+    155,145,48,203,134,42,140,85,32,25,154,106,163,151,251,40,
+    141,23,240,202,44,74,61,71,145,186,80,109,116,135,2,232,
+    110,171,40,133,143,236,99,91,109,116,143,176,108,24,85,49,
+    139,7,223,160,170,225,106,163,151,227,216,163,21,198,42,30,
+    72,251,216,84,27,189,131,46,54,90,97,172,226,193,181,125,
+    108,170,141,222,64,24,29,97,21,248,246,48,58,170,222,59,
+    225,16,55,143,124,54,97,99,203,124,112,215,194,244,176,215,
+    233,144,217,201,82,116,114,159,94,84,155,161,176,155,189,74,
+    163,205,78,62,186,186,79,219,170,3,78,39,233,255,1,203,
+    170,146,13,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/cache/replacement_policies/ReplacementPolicies.py",
+    "m5.objects.ReplacementPolicies",
+    embedded_module_data,
+    2451,
+    7356);
+
+} // anonymous namespace
+} // namespace gem5
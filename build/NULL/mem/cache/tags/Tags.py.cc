@@ -0,0 +1,140 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,173,87,221,111,219,70,18,39,245,65,83,148,100,91,
+    178,45,91,150,157,50,105,234,84,73,108,167,177,227,246,218,
+    52,109,19,95,46,74,28,39,168,29,20,16,10,16,20,185,
+    142,152,146,162,186,164,26,75,192,1,122,56,28,130,226,128,
+    6,197,1,9,130,2,205,83,112,135,190,223,223,33,7,2,
+    34,240,233,128,123,202,155,141,250,41,79,55,67,74,148,173,
+    143,34,5,106,81,179,203,157,253,205,238,206,252,60,59,250,
+    31,115,228,47,220,110,127,253,15,136,39,140,202,168,172,206,
+    24,108,158,101,177,31,208,3,219,94,27,108,183,161,109,38,
+    192,252,133,81,131,127,99,212,16,97,95,4,25,230,151,96,
+    199,88,62,236,234,194,160,227,72,184,71,199,185,186,17,208,
+    241,125,186,17,87,23,1,157,64,70,122,116,188,171,139,130,
+    46,214,135,139,168,241,45,38,59,250,26,95,178,172,19,191,
+    166,155,202,55,68,189,83,120,64,20,27,6,216,179,202,209,
+    195,134,58,135,109,178,120,88,194,228,89,149,201,7,224,27,
+    84,217,124,72,13,228,195,106,48,207,145,145,231,60,51,224,
+    143,68,30,8,157,190,26,122,17,128,173,4,252,173,68,1,
+    21,27,130,138,251,168,112,15,42,14,168,209,33,168,49,31,
+    197,245,160,198,1,149,24,130,74,250,168,145,30,84,18,80,
+    19,67,80,147,62,138,239,65,77,2,106,106,8,42,229,163,
+    34,61,168,20,160,166,7,161,2,12,153,121,1,237,47,254,
+    136,42,244,96,211,111,229,147,104,15,106,86,141,1,21,226,
+    14,127,85,182,200,182,124,223,218,174,165,12,98,44,43,178,
+    82,36,203,54,12,44,23,64,179,84,44,214,70,239,19,227,
+    210,199,31,119,38,214,38,182,170,150,77,12,241,33,17,11,
+    68,55,75,247,69,219,172,37,20,185,44,43,154,93,21,181,
+    146,88,168,218,4,230,21,144,94,162,165,213,72,119,240,189,
+    237,34,17,193,188,168,155,230,55,149,178,168,203,54,41,41,
+    85,113,199,164,162,93,212,44,209,221,64,237,210,93,66,21,
+    82,130,137,68,52,119,16,96,193,42,176,30,200,10,76,80,
+    241,237,161,76,13,17,108,216,96,210,131,157,255,170,72,224,
+    141,162,86,86,20,98,89,30,84,46,169,162,42,219,178,104,
+    145,111,43,96,86,147,117,189,90,27,203,149,84,178,171,193,
+    1,202,166,174,41,213,218,156,63,0,115,104,245,248,214,55,
+    179,25,135,151,164,146,108,16,73,114,4,73,50,76,181,162,
+    99,63,38,73,223,86,100,189,173,9,217,213,50,113,120,185,
+    96,217,84,86,108,71,80,118,119,165,34,145,85,66,157,8,
+    246,21,93,182,44,39,124,87,166,178,225,112,158,51,29,14,
+    94,97,81,39,40,151,170,14,103,121,131,194,109,98,152,180,
+    186,5,219,112,66,184,25,39,152,131,57,99,238,97,37,93,
+    43,17,201,29,21,92,79,123,125,238,90,85,209,137,229,68,
+    225,224,82,219,187,206,72,219,157,78,2,125,86,41,75,101,
+    223,189,78,232,170,105,234,78,162,235,25,201,243,156,147,196,
+    136,119,60,114,215,245,144,51,186,69,236,47,44,203,84,52,
+    217,214,190,35,206,152,214,214,75,158,11,29,193,245,156,187,
+    149,127,51,191,34,213,222,204,90,84,89,238,225,22,18,105,
+    169,92,165,28,76,112,197,89,248,90,49,200,51,117,255,211,
+    138,78,213,215,91,99,19,245,27,173,68,182,126,179,53,46,
+    214,115,251,28,51,58,241,195,215,223,127,253,116,225,167,179,
+    141,133,79,246,226,151,155,241,203,245,235,48,30,75,188,138,
+    102,94,70,51,79,175,255,116,171,145,189,188,23,253,180,25,
+    253,180,190,14,154,228,244,147,244,143,233,167,107,205,204,7,
+    141,149,27,123,137,92,51,145,171,223,4,197,196,204,147,243,
+    63,158,111,241,163,77,126,182,49,119,237,32,24,152,224,14,
+    25,16,245,91,251,2,147,62,241,115,252,89,220,213,138,45,
+    254,179,131,112,48,13,90,16,141,208,148,167,22,158,9,29,
+    245,218,113,117,140,153,158,123,149,90,122,153,90,106,241,169,
+    71,163,123,252,76,147,159,105,204,158,131,37,166,113,137,105,
+    174,126,7,108,120,59,115,109,156,104,136,87,64,155,68,109,
+    146,171,223,196,15,125,183,227,158,193,121,249,239,204,176,188,
+    76,184,231,35,3,115,2,255,32,226,231,132,96,79,78,136,
+    0,74,24,130,138,250,168,190,76,174,134,33,147,112,78,12,
+    233,210,161,71,77,28,144,76,36,139,216,146,140,106,76,43,
+    201,110,90,233,160,156,184,236,115,11,82,201,155,228,151,164,
+    172,203,10,49,128,84,237,255,209,205,108,140,226,201,40,94,
+    57,20,207,66,113,203,20,239,18,138,23,7,197,92,72,49,
+    5,211,113,16,78,216,53,233,76,225,58,71,204,181,249,156,
+    164,221,161,54,133,233,41,196,186,158,63,141,98,161,35,182,
+    145,162,95,49,199,41,154,6,138,38,86,144,157,167,93,118,
+    198,147,63,228,190,207,61,222,249,167,254,252,206,94,108,181,
+    25,91,173,255,25,134,103,223,121,149,94,125,153,94,117,67,
+    125,178,241,238,135,16,234,89,12,245,44,208,37,229,61,222,
+    154,11,67,163,221,248,227,163,61,16,165,134,250,238,93,225,
+    40,3,72,172,123,175,215,194,238,173,204,13,185,129,248,223,
+    184,149,199,212,17,224,13,239,8,91,80,124,152,212,189,90,
+    230,123,88,99,185,42,9,251,72,153,113,143,50,93,0,61,
+    3,150,94,179,184,17,113,179,98,20,32,243,195,109,97,85,
+    10,139,30,210,18,33,209,137,94,159,190,15,211,54,179,227,
+    191,139,62,52,11,194,153,42,85,12,201,205,177,22,102,78,
+    169,109,16,239,115,39,180,69,244,29,122,18,231,98,14,163,
+    231,80,244,80,104,177,35,10,240,181,234,204,113,10,77,35,
+    133,46,32,133,78,253,22,133,230,79,253,156,123,150,123,46,
+    55,178,183,246,230,54,154,115,27,141,80,26,147,219,76,51,
+    113,230,95,167,155,103,215,247,18,235,110,86,123,123,174,225,
+    150,6,115,141,50,191,151,107,106,176,47,51,240,80,129,248,
+    149,33,112,40,250,192,175,248,142,106,92,14,197,218,89,100,
+    244,154,105,148,41,92,63,68,117,25,113,178,135,17,138,175,
+    246,89,49,233,177,226,56,240,53,110,163,118,254,182,188,171,
+    25,21,67,44,249,228,232,26,16,189,136,186,20,1,91,75,
+    155,217,248,219,114,195,153,50,100,184,200,219,166,52,179,36,
+    81,200,89,38,189,128,19,150,125,242,76,14,224,194,197,142,
+    248,14,185,112,175,135,11,25,228,194,42,114,97,193,229,130,
+    23,244,22,31,105,68,255,4,97,156,199,48,206,115,24,121,
+    129,153,63,217,156,91,195,46,207,196,146,255,248,228,233,100,
+    51,189,178,23,93,169,175,227,199,91,241,226,208,0,223,252,
+    131,2,156,23,218,129,11,95,255,98,227,203,123,181,153,158,
+    120,237,200,146,78,43,24,166,168,23,38,119,154,195,125,112,
+    241,163,91,218,213,218,133,219,90,201,13,144,11,241,10,46,
+    44,5,31,22,53,165,136,21,38,214,80,80,67,218,224,94,
+    203,214,20,168,194,162,111,19,36,44,220,157,148,161,149,36,
+    215,0,176,197,171,153,220,18,41,180,121,111,99,131,138,3,
+    130,179,214,17,143,48,56,159,247,4,39,137,193,57,135,193,
+    153,175,231,254,59,127,234,213,252,226,203,249,197,22,63,222,
+    72,174,67,112,78,96,112,78,64,112,102,33,56,211,153,250,
+    29,252,120,198,209,228,102,86,112,102,140,75,75,166,251,107,
+    203,90,58,246,227,139,226,143,52,39,115,68,125,172,240,210,
+    160,160,139,128,178,140,53,163,229,240,216,165,230,110,187,126,
+    114,111,168,69,159,92,107,253,7,123,195,95,246,170,213,43,
+    244,10,188,98,194,180,50,32,247,131,44,203,238,223,96,25,
+    118,165,193,92,60,250,180,152,108,163,243,180,152,233,70,231,
+    105,49,169,70,231,217,231,206,176,220,62,211,47,30,253,245,
+    0,155,195,238,232,54,27,197,110,191,120,252,209,1,54,135,
+    221,209,185,4,246,250,197,227,153,3,108,14,187,163,239,143,
+    177,171,251,76,191,120,156,63,192,230,176,59,122,90,96,51,
+    251,76,191,120,116,227,0,155,195,1,42,215,121,255,7,172,
+    136,198,64,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/cache/tags/Tags.py",
+    "m5.objects.Tags",
+    embedded_module_data,
+    1843,
+    4092);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,74 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,84,207,79,19,65,20,158,237,110,183,191,145,130,
+    210,66,131,86,15,106,137,105,77,132,198,32,152,168,21,44,
+    70,32,41,167,94,54,219,221,145,46,238,182,117,118,193,110,
+    79,123,240,228,69,99,76,224,224,129,19,9,241,159,240,31,
+    48,41,134,196,102,174,158,188,149,200,137,147,51,219,110,41,
+    109,129,196,157,217,111,94,223,55,223,238,123,111,223,244,55,
+    232,186,220,237,245,239,22,129,109,32,3,153,81,193,90,107,
+    101,236,213,165,186,52,54,207,50,192,5,22,129,204,190,7,
+    50,7,217,61,22,128,111,172,243,144,60,103,115,110,194,241,
+    144,235,225,220,54,231,33,156,183,143,227,101,95,14,36,252,
+    127,232,143,4,131,153,41,2,190,156,162,173,20,54,160,100,
+    72,221,129,114,78,160,223,237,64,33,200,51,50,200,187,200,
+    205,202,76,158,147,93,121,183,204,230,121,232,217,245,130,1,
+    23,244,109,248,29,91,230,246,92,36,12,87,39,12,63,81,
+    5,206,81,5,59,42,119,143,42,120,129,42,212,81,241,61,
+    170,144,236,33,41,123,241,200,83,81,135,217,146,12,171,74,
+    105,125,181,172,42,146,185,86,139,174,67,109,102,118,182,159,
+    170,221,213,160,150,146,68,169,8,83,134,184,174,167,148,54,
+    45,84,40,175,64,61,85,32,162,100,177,88,11,75,98,69,
+    148,20,195,140,43,165,120,193,52,160,94,27,133,37,3,153,
+    113,93,169,193,142,19,135,68,93,47,75,138,104,40,91,100,
+    243,114,98,8,123,5,161,36,106,80,16,176,95,16,180,178,
+    188,169,82,59,40,8,111,55,69,181,205,112,134,89,129,216,
+    43,22,116,3,137,146,129,125,82,181,42,72,42,121,22,246,
+    83,179,8,69,25,34,236,94,21,145,168,97,255,43,168,149,
+    145,153,35,47,198,60,113,145,56,48,71,195,192,108,150,152,
+    126,59,46,193,118,184,237,112,246,193,95,90,165,147,135,58,
+    146,82,151,166,124,166,70,196,145,172,152,136,39,114,27,226,
+    228,214,85,2,86,103,52,2,55,172,76,227,202,168,245,162,
+    49,60,101,101,27,225,71,214,82,147,7,193,240,175,64,236,
+    103,32,182,179,240,245,101,61,49,119,16,152,63,12,204,91,
+    25,194,140,68,182,199,63,143,239,164,15,99,247,234,201,103,
+    7,225,204,97,56,99,75,66,35,31,179,31,178,159,94,127,
+    81,119,87,14,130,211,135,193,105,235,57,29,40,226,188,254,
+    76,243,50,78,243,78,92,208,188,164,45,56,60,148,131,198,
+    147,206,135,129,181,171,173,142,232,241,62,184,180,52,58,52,
+    132,211,15,76,27,99,121,159,71,244,104,32,31,5,122,24,
+    16,237,94,68,91,21,13,81,24,163,96,39,16,165,48,225,
+    192,125,90,201,201,158,74,198,72,37,135,111,211,34,46,88,
+    75,116,180,148,19,255,159,122,56,247,6,190,131,114,119,158,
+    145,118,246,125,68,250,242,2,216,154,222,26,160,216,128,68,
+    39,29,72,15,74,244,58,77,52,65,19,205,118,39,74,183,
+    45,39,60,216,167,205,36,43,180,217,117,236,165,38,42,87,
+    77,28,36,86,231,111,12,113,78,79,180,74,58,217,31,194,
+    137,119,174,117,222,30,163,155,237,154,233,63,8,52,89,134,
+    97,154,105,192,68,235,32,210,154,13,48,86,119,102,3,220,
+    170,159,157,77,62,196,204,52,65,63,236,140,31,209,229,248,
+    212,27,103,153,69,166,9,6,99,253,218,157,35,219,56,238,
+    166,130,44,179,100,219,131,176,30,157,58,178,141,227,115,54,
+    216,233,254,3,214,52,161,38,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/cache/tags/indexing_policies/IndexingPolicies.py",
+    "m5.objects.IndexingPolicies",
+    embedded_module_data,
+    792,
+    1661);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,60 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,82,205,107,19,65,20,159,217,205,110,54,31,38,
+    38,74,211,98,40,193,42,184,34,201,197,30,44,210,131,8,
+    109,35,214,96,170,135,189,44,155,157,33,73,221,143,116,118,
+    3,73,78,123,240,232,65,188,212,99,79,5,241,159,137,34,
+    184,204,73,240,228,45,165,61,121,114,102,242,65,148,56,31,
+    191,247,123,204,155,247,126,243,152,159,96,105,40,51,123,185,
+    203,224,20,32,128,160,3,142,166,22,10,43,57,146,43,27,
+    50,4,18,216,3,72,126,11,80,2,203,231,50,0,159,229,
+    121,18,35,129,148,38,208,213,95,220,209,33,133,247,25,164,
+    154,93,247,69,235,24,219,161,189,92,48,49,47,24,137,130,
+    24,24,16,1,67,98,91,70,144,37,146,12,5,201,134,138,
+    147,103,26,88,49,112,234,56,61,231,40,113,46,49,25,210,
+    66,70,6,103,207,174,173,186,133,20,164,254,19,155,67,73,
+    38,89,163,217,39,86,128,159,99,183,65,252,22,62,26,21,
+    93,236,214,122,156,7,181,22,59,169,118,58,163,98,27,187,
+    219,59,59,203,129,163,77,97,42,174,229,89,109,76,238,5,
+    122,37,244,43,93,47,8,73,223,197,94,72,211,141,55,225,
+    75,124,210,199,65,56,186,197,110,249,100,88,33,83,191,34,
+    210,243,248,126,128,15,245,60,213,76,211,179,92,108,154,52,
+    109,154,174,143,250,14,231,89,211,60,233,91,206,236,36,17,
+    14,123,152,106,86,139,85,176,108,150,223,30,12,204,14,182,
+    16,38,52,197,185,237,88,65,64,51,175,89,191,125,210,176,
+    136,229,18,222,106,170,50,206,5,201,150,55,164,201,153,94,
+    170,136,8,170,54,67,210,245,218,52,45,36,9,21,159,192,
+    37,239,207,239,205,128,216,181,165,102,44,191,190,218,27,18,
+    149,5,9,208,217,14,94,49,136,22,51,206,108,68,79,227,
+    252,141,104,63,46,220,141,234,241,245,59,209,193,143,220,198,
+    247,220,214,215,220,86,172,229,222,165,199,55,31,94,200,82,
+    94,189,2,12,162,189,137,10,138,165,211,242,135,242,71,103,
+    252,224,224,75,161,254,173,80,143,196,36,165,121,157,67,93,
+    161,41,119,187,218,227,202,3,170,113,74,252,193,144,102,25,
+    91,252,53,241,232,169,184,53,14,226,250,58,127,144,246,120,
+    218,218,93,82,102,46,228,170,123,12,38,50,132,112,178,15,
+    1,92,31,131,210,116,197,96,109,60,95,49,184,61,254,123,
+    77,212,20,124,6,39,96,53,190,127,116,33,236,213,127,206,
+    133,162,63,7,185,235,20,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/probes/BaseMemProbe.py",
+    "m5.objects.BaseMemProbe",
+    embedded_module_data,
+    567,
+    899);
+
+} // anonymous namespace
+} // namespace gem5
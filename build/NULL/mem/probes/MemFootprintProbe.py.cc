@@ -0,0 +1,60 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,82,207,107,19,65,20,126,179,155,108,55,105,26,
+    18,169,9,40,200,162,120,72,161,137,30,122,41,210,131,74,
+    37,17,67,160,245,18,10,203,118,231,53,73,217,95,238,110,
+    37,9,30,246,224,73,4,193,75,123,244,84,16,255,153,8,
+    30,150,57,9,158,188,165,180,39,79,206,108,178,33,216,58,
+    63,190,249,222,188,153,247,190,55,204,47,88,106,217,249,122,
+    185,195,225,20,40,80,98,129,77,186,132,8,46,89,210,254,
+    108,149,247,65,130,23,64,229,247,64,51,72,206,101,128,111,
+    114,26,164,155,161,217,61,168,41,191,133,81,35,172,240,212,
+    8,240,21,218,29,223,61,68,110,147,13,115,57,103,38,205,
+    249,46,201,137,208,37,20,186,18,159,50,37,60,150,212,205,
+    162,242,101,5,110,104,168,30,231,82,78,229,115,137,171,144,
+    22,42,242,252,214,234,77,183,40,215,247,207,217,2,85,184,
+    226,21,86,230,50,119,93,55,244,252,129,19,38,122,199,119,
+    109,180,27,158,160,65,131,83,253,40,117,215,251,253,113,181,
+    135,246,214,246,246,245,91,155,123,163,32,68,91,243,92,190,
+    133,190,22,186,90,15,67,205,52,204,62,106,214,192,65,205,
+    112,168,198,227,105,193,96,140,3,40,1,140,239,119,140,30,
+    38,182,118,228,250,154,199,173,77,11,223,162,165,45,114,182,
+    107,107,76,213,117,199,176,81,215,89,94,215,109,151,158,88,
+    130,23,116,253,205,137,97,205,61,153,112,228,33,203,155,195,
+    161,222,71,131,162,207,114,130,155,150,17,4,44,219,49,124,
+    195,102,202,76,34,83,184,137,78,200,100,195,25,49,37,152,
+    109,170,175,157,96,208,115,144,178,156,208,161,11,85,95,225,
+    82,60,214,159,7,129,111,54,150,94,229,90,245,117,111,228,
+    43,252,100,2,27,124,6,109,14,209,162,199,171,247,162,231,
+    113,185,30,181,226,82,45,106,254,92,187,245,233,224,195,65,
+    172,22,63,230,39,235,207,46,100,169,168,92,1,135,104,119,
+    170,64,185,114,90,252,92,60,11,39,15,155,223,75,173,31,
+    165,86,212,20,221,191,157,38,104,215,178,172,106,111,213,221,
+    195,99,52,195,160,190,252,219,124,241,41,89,142,123,61,81,
+    115,192,84,65,125,119,56,23,184,46,32,137,84,17,149,169,
+    79,102,239,185,227,223,225,38,17,202,61,14,83,153,16,50,
+    109,17,32,143,39,240,104,121,196,80,157,164,35,134,202,36,
+    29,83,69,37,47,201,20,110,198,179,194,69,178,94,253,199,
+    159,40,250,11,148,250,244,254,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/probes/MemFootprintProbe.py",
+    "m5.objects.MemFootprintProbe",
+    embedded_module_data,
+    568,
+    920);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,66 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,83,187,79,219,64,24,191,179,29,147,4,18,160,
+    20,66,1,181,86,165,34,133,33,180,3,11,226,81,222,5,
+    181,40,18,153,44,36,203,241,29,36,169,95,245,57,130,100,
+    242,208,137,133,138,5,134,14,76,72,85,255,25,71,202,16,
+    221,218,169,91,42,58,117,234,157,73,80,64,225,30,191,251,
+    238,251,126,247,189,44,255,2,61,35,214,57,111,87,24,92,
+    2,4,16,52,129,5,85,8,185,44,152,66,225,238,20,11,
+    64,0,59,0,137,95,1,146,48,188,17,1,248,41,118,157,
+    168,18,138,29,128,172,252,155,95,178,144,14,173,235,4,127,
+    194,86,222,115,138,152,221,225,156,209,27,83,234,198,108,70,
+    49,49,80,33,2,170,192,182,136,32,243,37,168,49,44,95,
+    15,128,62,3,137,72,186,17,88,108,225,62,118,252,73,110,
+    12,201,143,184,9,198,77,246,229,14,160,248,35,238,32,227,
+    14,245,227,226,84,37,125,255,46,241,232,213,48,74,178,78,
+    12,210,20,43,191,224,233,6,142,122,80,207,88,216,154,119,
+    185,72,230,153,168,249,220,148,43,149,234,99,199,216,90,88,
+    92,124,192,46,212,39,183,108,189,104,98,37,162,41,134,99,
+    185,30,38,164,236,216,219,245,153,93,219,48,171,8,43,249,
+    13,165,108,31,57,12,20,191,212,161,82,80,159,204,235,198,
+    103,236,119,158,58,85,223,173,250,202,81,217,196,245,233,131,
+    26,241,177,21,177,163,84,148,34,54,29,251,152,40,190,179,
+    159,29,161,113,77,179,117,11,107,26,77,106,154,229,160,170,
+    201,229,33,77,251,82,213,205,142,69,242,107,46,166,73,227,
+    244,84,43,97,29,97,143,38,184,108,152,58,33,52,150,215,
+    61,221,162,210,186,227,152,52,29,37,160,117,115,167,3,39,
+    101,191,164,185,6,149,15,124,175,108,31,211,228,29,129,167,
+    198,116,81,106,84,102,30,176,237,83,81,183,107,84,38,145,
+    242,7,184,229,157,253,247,138,120,198,124,79,27,31,180,44,
+    231,214,60,153,177,34,200,178,77,78,24,4,247,179,53,56,
+    21,108,182,70,231,130,189,214,200,155,96,183,45,131,137,233,
+    75,245,66,189,150,194,217,247,141,241,181,230,248,90,176,207,
+    180,195,207,207,43,103,149,171,241,80,89,105,164,87,155,233,
+    213,96,135,105,159,101,46,103,46,102,174,138,225,235,165,198,
+    232,114,115,116,57,216,99,218,244,216,249,225,217,225,213,236,
+    247,185,112,118,163,145,218,108,166,54,131,109,62,189,23,221,
+    76,246,179,49,154,177,22,114,78,177,130,13,159,228,122,255,
+    11,143,255,62,52,193,172,46,111,27,161,113,46,122,206,105,
+    167,146,73,14,145,167,41,94,126,124,233,238,147,172,120,47,
+    217,21,242,18,93,6,109,17,66,216,254,0,1,124,23,130,
+    183,189,171,5,50,97,119,181,192,68,216,93,109,121,24,110,
+    193,54,232,143,223,62,254,137,206,191,79,216,163,140,254,3,
+    120,123,29,158,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/probes/MemTraceProbe.py",
+    "m5.objects.MemTraceProbe",
+    embedded_module_data,
+    660,
+    1090);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,80 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,84,205,111,211,72,20,159,177,29,227,164,141,219,
+    64,160,129,170,93,75,72,11,225,35,229,171,123,168,86,172,
+    212,69,208,180,80,33,149,221,67,84,201,114,60,67,98,240,
+    71,152,113,160,201,1,229,176,39,180,18,171,94,42,113,33,
+    39,164,213,254,43,123,112,165,28,172,57,173,180,167,189,165,
+    130,19,39,102,226,38,164,217,22,123,252,230,141,127,239,247,
+    222,252,158,71,254,23,140,93,169,195,249,227,93,110,246,0,
+    2,8,186,192,131,21,8,133,47,185,210,147,100,150,159,0,
+    9,60,0,72,254,13,32,5,195,15,50,0,127,201,195,36,
+    21,5,165,182,64,81,253,79,44,138,144,77,175,90,20,63,
+    194,222,99,18,84,49,95,195,43,246,120,77,101,88,179,10,
+    69,77,12,42,16,129,138,196,31,25,65,158,75,170,164,176,
+    218,61,5,142,185,176,246,44,61,244,145,252,65,226,187,144,
+    70,187,200,112,214,212,9,172,233,17,75,153,96,101,57,75,
+    63,142,133,82,72,157,136,157,57,169,2,58,133,180,137,216,
+    217,111,228,77,79,196,230,78,204,155,65,83,19,177,167,191,
+    145,119,122,34,246,12,202,242,239,162,51,125,43,180,236,231,
+    247,28,26,14,62,73,187,224,97,111,169,33,92,186,68,5,
+    100,34,142,149,234,245,118,190,134,189,229,149,149,137,248,229,
+    173,22,13,177,103,132,129,209,164,216,120,85,199,190,129,112,
+    136,137,231,248,142,95,51,104,2,219,150,93,199,134,235,248,
+    216,160,78,27,183,31,254,124,244,133,225,248,70,181,21,98,
+    106,92,246,154,52,52,170,28,179,72,13,19,35,32,6,126,
+    209,180,92,81,33,228,148,36,225,37,250,149,91,188,223,46,
+    253,138,137,243,180,197,105,117,235,165,211,228,156,87,78,88,
+    55,8,126,138,9,246,109,158,222,107,184,216,195,126,104,133,
+    78,224,51,233,230,15,237,243,171,142,79,69,93,145,200,34,
+    70,157,107,10,106,196,242,104,251,60,215,103,85,93,252,127,
+    136,73,183,111,181,23,71,204,160,102,17,94,200,115,236,113,
+    250,226,136,126,44,190,89,204,51,205,52,125,203,195,166,201,
+    50,166,233,5,168,233,10,127,218,52,133,212,67,68,9,91,
+    13,204,50,246,206,142,89,199,22,194,132,165,133,111,187,22,
+    165,44,245,216,226,185,152,154,180,159,169,124,201,213,49,217,
+    242,91,76,77,122,196,180,95,124,234,212,124,140,216,204,160,
+    255,166,144,99,138,150,177,244,87,87,89,13,2,151,169,47,
+    7,29,100,179,137,100,83,108,215,172,114,157,44,143,18,53,
+    230,24,66,89,150,107,27,11,202,141,130,14,95,211,63,193,
+    71,113,208,62,27,148,216,75,99,135,234,232,249,41,53,90,
+    68,229,97,3,83,228,15,253,155,155,206,232,142,167,230,59,
+    247,226,220,213,206,122,60,251,125,167,252,79,246,244,219,237,
+    55,219,177,166,255,158,137,242,27,7,178,164,171,159,0,55,
+    157,251,125,13,228,206,237,233,187,58,7,123,218,98,95,130,
+    233,171,7,41,37,199,113,110,58,229,190,14,244,51,111,43,
+    111,42,177,150,141,102,126,58,66,205,128,194,194,222,235,221,
+    215,93,20,93,123,176,63,183,214,155,91,139,148,124,60,111,
+    188,95,121,183,210,197,209,245,181,253,249,114,111,190,28,41,
+    133,190,10,206,94,216,219,220,221,236,222,137,138,229,253,252,
+    122,47,191,222,121,20,23,22,222,103,222,101,186,203,209,149,
+    245,253,194,70,175,176,17,41,103,147,65,22,135,242,54,139,
+    41,54,231,45,151,130,234,51,108,135,180,52,254,43,36,226,
+    143,201,210,28,109,88,131,115,166,9,151,4,59,135,237,89,
+    16,102,144,233,59,209,84,237,199,228,204,220,37,23,249,18,
+    138,190,53,184,233,203,16,194,254,26,4,240,102,4,110,140,
+    143,24,204,69,195,17,131,115,209,112,244,213,11,240,33,236,
+    131,227,237,31,219,7,131,249,211,9,248,96,71,95,0,190,
+    68,173,199,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/probes/StackDistProbe.py",
+    "m5.objects.StackDistProbe",
+    embedded_module_data,
+    883,
+    1589);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,101 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,85,205,111,19,71,20,159,245,174,55,107,59,78,
+    66,156,79,72,148,37,160,160,64,155,208,146,168,200,170,42,
+    209,64,10,20,28,104,66,15,22,98,217,236,12,206,166,235,
+    93,103,102,67,177,79,62,244,64,123,41,226,66,133,144,136,
+    122,64,173,248,103,12,66,98,53,167,74,61,113,115,4,39,
+    78,125,179,235,197,142,113,217,143,55,31,191,223,204,123,243,
+    222,155,153,127,81,199,147,108,149,111,55,65,60,66,24,97,
+    201,65,101,169,40,73,162,158,112,18,27,81,41,183,74,101,
+    3,37,208,119,8,203,191,32,172,144,228,51,25,161,231,114,
+    60,89,81,13,177,36,96,42,145,186,176,62,220,183,142,230,
+    181,55,162,49,47,241,236,138,227,89,63,17,188,182,185,77,
+    44,31,58,164,147,86,167,97,137,216,176,177,208,48,130,138,
+    18,70,197,68,9,12,252,83,42,202,56,1,147,201,60,125,
+    221,91,191,126,205,115,108,171,10,45,229,142,125,199,227,138,
+    35,164,236,208,82,97,94,225,154,97,184,102,153,24,6,79,
+    27,70,217,195,187,142,168,247,27,198,206,174,233,180,16,229,
+    174,233,176,191,209,91,161,239,253,36,163,214,98,153,148,23,
+    119,60,182,8,211,95,37,229,21,159,58,11,149,42,85,1,
+    15,197,41,248,217,36,136,250,135,55,200,204,54,194,175,126,
+    94,188,116,48,230,30,88,149,18,175,234,47,169,115,85,240,
+    203,88,42,42,56,81,76,98,185,168,146,190,61,13,245,120,
+    72,106,59,29,215,177,242,12,124,244,60,246,19,42,102,96,
+    84,127,175,81,56,137,213,46,110,22,184,3,61,53,12,226,
+    190,46,238,16,112,15,253,15,87,235,226,14,3,55,215,211,
+    134,20,78,119,113,71,128,59,218,147,155,193,253,93,220,177,
+    79,112,179,93,220,113,50,177,55,217,147,59,80,146,240,96,
+    13,82,30,15,117,141,57,156,64,228,8,57,140,15,117,245,
+    79,225,97,200,179,92,152,103,173,68,168,229,226,228,128,210,
+    176,68,106,108,109,213,14,151,72,121,57,159,135,46,143,86,
+    243,121,128,243,249,214,128,141,218,220,122,149,249,164,172,251,
+    91,166,15,130,232,150,231,250,212,115,28,66,245,77,226,120,
+    110,137,233,190,183,240,6,114,2,213,6,64,149,94,161,182,
+    71,109,223,38,172,246,197,213,112,78,125,165,61,230,7,178,
+    179,75,152,207,116,65,53,233,166,237,83,211,183,61,87,175,
+    132,59,161,118,124,157,56,176,169,34,28,83,251,46,113,117,
+    127,151,186,38,245,118,93,220,98,209,62,161,109,233,19,179,
+    51,216,29,159,139,41,88,56,93,91,193,106,109,246,130,107,
+    110,58,36,210,192,170,174,69,61,215,174,17,172,51,107,139,
+    192,30,179,221,82,109,166,147,211,90,80,85,39,204,50,157,
+    208,90,142,222,12,9,19,86,90,10,61,170,23,64,163,112,
+    5,120,69,47,155,149,10,76,8,13,70,232,93,219,34,122,
+    197,164,128,251,132,50,221,118,35,205,145,54,66,107,167,110,
+    131,203,141,178,9,126,166,183,117,155,233,174,247,179,14,154,
+    28,152,34,132,104,172,132,221,46,204,79,83,177,141,104,70,
+    8,177,101,184,226,87,43,132,167,173,123,247,140,45,98,98,
+    66,121,74,212,45,199,100,140,107,230,38,3,15,91,62,79,
+    94,19,38,112,53,138,39,87,161,73,92,159,203,166,91,229,
+    42,139,58,181,27,46,179,75,46,193,124,64,232,109,71,146,
+    167,192,228,232,172,226,74,225,198,149,43,60,29,18,162,158,
+    28,128,27,31,98,212,162,141,10,66,59,114,45,110,120,172,
+    240,126,129,237,196,195,149,111,61,207,225,35,162,47,10,135,
+    241,193,55,124,188,195,142,170,209,17,128,204,143,16,86,143,
+    198,139,242,41,132,45,178,186,237,45,62,120,158,84,40,177,
+    76,159,224,136,152,105,123,154,81,113,136,68,103,157,136,37,
+    29,142,197,34,252,108,66,58,120,66,142,215,207,7,135,230,
+    234,151,131,161,207,234,151,130,193,92,253,226,63,217,225,223,
+    111,254,118,243,143,185,39,39,27,115,133,23,217,181,87,217,
+    181,250,106,51,141,198,142,60,186,245,240,214,222,185,198,137,
+    175,94,140,158,125,53,122,182,94,104,170,104,120,252,209,204,
+    195,153,64,235,111,12,156,219,151,19,195,234,59,4,162,126,
+    185,217,143,166,103,95,79,45,191,156,90,14,193,37,0,167,
+    5,56,173,54,148,73,64,71,38,95,231,142,189,204,29,11,
+    180,129,198,208,42,160,35,2,29,81,235,87,0,156,58,250,
+    52,255,56,31,104,217,198,224,25,128,166,4,52,5,3,39,
+    192,142,153,227,79,183,31,111,135,216,105,192,102,4,54,3,
+    216,17,97,227,209,215,163,39,94,142,158,8,82,153,251,202,
+    125,250,107,42,208,174,238,39,229,49,224,128,0,131,53,148,
+    155,125,176,24,104,99,141,137,11,48,56,39,6,231,212,250,
+    247,226,141,156,38,92,85,152,215,248,68,121,121,193,11,111,
+    66,182,112,224,98,164,226,2,61,0,31,200,19,158,2,36,
+    220,23,144,166,162,74,189,123,144,12,23,220,221,114,116,91,
+    133,1,57,24,164,247,218,215,209,61,248,13,93,130,166,56,
+    116,216,19,16,77,89,146,164,230,69,9,73,103,26,232,203,
+    206,47,64,115,141,248,11,208,120,35,254,2,52,214,136,191,
+    166,38,73,199,154,232,99,241,96,100,95,20,239,218,189,218,
+    105,73,109,162,143,197,131,233,125,81,188,235,1,133,214,255,
+    7,169,212,89,116,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/qos/QoSMemCtrl.py",
+    "m5.objects.QoSMemCtrl",
+    embedded_module_data,
+    1221,
+    2233);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,77 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,84,205,79,19,65,20,159,253,104,217,182,88,10,
+    8,109,197,194,38,126,196,5,4,63,47,141,49,198,15,160,
+    32,245,3,245,208,203,102,219,25,160,218,221,45,51,219,40,
+    77,52,61,120,240,104,184,144,120,177,39,162,225,239,240,190,
+    53,77,108,230,100,226,137,91,9,156,60,57,219,237,22,168,
+    213,221,217,247,102,222,251,189,183,239,253,102,118,127,129,99,
+    151,175,173,15,146,76,108,3,8,32,87,0,207,92,205,181,
+    53,255,12,240,96,30,64,254,61,128,2,18,118,4,0,118,
+    5,47,65,70,132,226,10,80,124,123,206,66,225,40,55,153,
+    59,158,95,244,242,47,112,78,126,4,50,28,4,25,158,61,
+    2,228,88,44,159,241,241,0,249,161,176,195,252,187,92,39,
+    107,31,146,170,1,208,227,98,232,192,14,211,187,29,11,20,
+    119,120,182,230,59,177,65,22,27,234,21,11,125,208,223,133,
+    237,255,39,182,15,74,93,216,83,12,27,238,137,13,192,96,
+    23,118,128,97,35,61,177,33,216,223,133,29,252,15,246,84,
+    23,118,8,134,25,219,3,52,252,196,92,89,70,250,74,222,
+    120,117,207,194,133,242,176,142,244,217,13,147,204,50,173,18,
+    102,157,89,95,47,143,175,33,253,102,50,201,76,38,222,76,
+    38,153,59,153,60,30,20,126,138,72,209,52,8,146,139,38,
+    182,72,121,56,101,88,8,175,106,57,36,91,166,236,134,237,
+    221,97,175,45,39,210,37,61,139,176,108,174,202,175,113,222,
+    66,242,70,9,149,144,140,12,11,231,17,217,147,29,204,217,
+    35,12,70,26,60,9,161,194,245,107,119,203,67,203,173,156,
+    114,81,203,189,66,150,76,242,101,68,197,107,87,12,82,158,
+    104,123,10,154,133,140,220,166,156,69,214,107,132,12,150,137,
+    165,33,172,182,104,27,128,189,146,219,200,180,50,76,37,85,
+    53,52,29,169,42,13,170,170,110,194,82,193,153,247,171,234,
+    70,73,43,180,61,162,181,89,68,52,152,123,243,70,93,103,
+    213,33,76,3,206,60,87,208,8,161,253,30,17,143,25,15,
+    84,116,216,160,190,199,26,214,116,58,124,68,116,135,29,26,
+    200,119,166,210,115,131,228,215,12,4,233,96,139,25,53,91,
+    90,93,69,88,109,245,22,113,136,56,97,9,186,109,172,56,
+    243,33,151,97,213,101,195,245,247,61,116,219,162,3,237,206,
+    213,118,159,78,46,183,70,207,242,21,28,56,71,226,119,130,
+    224,220,172,183,253,39,143,197,76,113,19,59,95,120,75,76,
+    177,135,124,99,162,210,185,27,161,177,202,253,198,224,197,202,
+    98,35,114,165,146,106,132,162,31,110,217,177,75,181,144,82,
+    15,41,149,251,63,35,35,63,34,202,247,136,210,144,198,108,
+    105,172,38,37,234,82,194,158,184,177,47,240,131,254,67,192,
+    68,37,213,140,128,248,248,231,240,167,112,21,219,83,139,181,
+    216,82,61,182,100,139,35,141,232,217,237,119,91,239,170,89,
+    123,114,161,22,77,213,163,41,91,60,221,244,131,51,19,63,
+    226,202,247,184,242,229,130,125,245,65,45,62,87,143,207,217,
+    226,40,115,48,188,190,165,87,231,236,233,229,218,104,186,62,
+    154,174,60,98,214,88,98,251,237,214,219,234,11,251,242,92,
+    45,58,95,143,206,179,44,238,192,227,94,95,105,197,71,71,
+    244,155,51,102,246,37,202,89,100,198,165,192,105,159,142,255,
+    101,238,218,71,230,47,58,219,76,104,240,40,204,165,44,225,
+    136,214,75,38,28,150,165,91,238,193,186,141,207,179,165,243,
+    163,34,47,153,104,10,28,199,53,31,114,128,59,111,131,115,
+    238,104,128,105,219,27,13,16,181,189,209,244,199,184,5,174,
+    9,122,203,143,153,253,150,62,252,135,191,85,203,31,170,148,
+    144,52,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/qos/QoSMemSinkCtrl.py",
+    "m5.objects.QoSMemSinkCtrl",
+    embedded_module_data,
+    834,
+    1468);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,58 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,82,77,107,19,65,24,158,217,205,182,233,54,84,
+    37,68,136,248,49,88,171,4,100,35,98,46,139,8,162,160,
+    17,44,72,110,123,25,54,59,211,38,186,31,237,204,4,154,
+    16,33,135,30,250,15,244,23,20,164,127,166,66,15,203,94,
+    61,121,91,137,94,122,114,102,147,221,68,155,217,157,231,157,
+    225,121,231,125,158,119,152,31,96,105,24,243,56,181,36,124,
+    1,4,16,232,131,0,58,16,2,13,188,1,68,59,6,68,
+    167,240,84,7,224,76,207,15,57,26,41,117,64,195,248,169,
+    54,13,152,108,189,236,114,193,92,79,188,167,65,196,134,222,
+    178,0,204,5,80,38,64,129,3,137,42,0,28,157,64,167,
+    68,52,199,32,250,49,112,214,102,37,147,234,135,168,35,203,
+    116,250,225,167,118,40,40,219,115,61,58,170,6,52,104,30,
+    70,188,41,35,230,146,178,122,189,209,246,62,13,90,182,29,
+    100,154,182,45,105,219,254,255,164,7,151,172,104,114,170,30,
+    166,79,50,43,98,137,59,149,243,172,216,125,134,99,48,134,
+    184,224,199,80,90,131,35,215,68,243,209,14,185,112,67,209,
+    119,5,69,162,71,209,204,3,242,162,80,176,200,247,41,67,
+    110,72,80,183,47,161,47,144,136,138,131,42,217,27,48,70,
+    67,129,250,185,73,171,160,27,90,178,181,232,255,149,96,126,
+    178,81,164,73,178,196,169,191,151,152,11,29,174,122,66,232,
+    242,62,103,94,51,191,164,21,55,104,29,12,153,41,83,71,
+    119,87,145,139,122,143,101,14,191,35,97,2,254,152,224,230,
+    131,239,181,157,139,218,206,137,25,223,219,62,49,47,202,183,
+    227,107,245,243,114,125,170,46,101,183,177,158,148,49,14,221,
+    128,98,156,152,24,7,17,25,248,106,93,193,248,112,224,250,
+    115,166,36,134,7,84,122,62,58,194,61,234,18,202,146,13,
+    181,246,124,151,243,204,211,55,192,42,50,176,77,5,70,14,
+    143,148,147,167,153,147,252,139,55,209,228,117,124,227,225,228,
+    93,124,189,53,105,167,165,117,227,86,10,174,194,172,156,145,
+    121,212,147,122,208,178,162,238,71,234,9,110,253,251,78,153,
+    94,40,86,21,20,46,46,203,207,103,205,188,96,181,249,19,
+    230,187,18,82,29,66,152,190,133,0,182,206,193,179,229,63,
+    93,171,64,41,126,21,190,90,191,84,248,189,130,202,244,254,
+    2,35,74,232,222,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/qos/QoSMemSinkInterface.py",
+    "m5.objects.QoSMemSinkInterface",
+    embedded_module_data,
+    533,
+    909);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,143 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,237,88,221,111,219,214,21,191,252,144,116,37,211,118,
+    20,203,174,156,79,58,254,136,101,123,182,155,46,115,234,185,
+    27,22,59,159,110,61,103,78,31,166,162,16,88,241,218,102,
+    160,175,92,210,141,45,184,131,49,244,33,27,10,204,232,75,
+    253,144,7,119,72,179,4,217,128,20,232,128,254,25,146,33,
+    192,2,129,0,25,6,12,232,155,140,120,47,125,218,61,164,
+    41,147,18,29,164,3,138,189,76,36,127,228,189,231,222,171,
+    115,207,57,60,191,35,253,19,185,62,129,131,251,203,59,12,
+    190,64,42,82,185,12,186,109,223,185,219,136,71,215,144,202,
+    127,138,84,129,240,143,4,132,158,10,206,196,164,96,201,68,
+    38,11,16,161,65,38,90,178,32,147,133,154,100,1,21,47,
+    160,68,248,59,104,36,56,147,27,74,187,245,225,28,125,206,
+    88,250,16,148,228,84,148,228,217,37,168,92,82,84,121,54,
+    95,72,6,85,145,173,17,48,195,183,242,11,243,249,140,150,
+    94,187,93,140,102,73,118,236,110,94,31,43,88,29,163,203,
+    203,197,238,37,146,189,56,57,201,4,121,186,54,57,201,132,
+    147,147,246,240,185,68,200,196,169,84,78,201,146,84,202,140,
+    164,82,217,188,186,146,129,103,41,149,186,187,162,100,14,36,
+    162,177,86,32,38,86,62,210,13,170,164,13,51,146,94,93,
+    77,45,19,69,37,212,12,195,115,58,163,232,250,19,244,18,
+    116,254,62,174,211,244,152,163,70,93,181,209,194,26,5,51,
+    91,144,96,151,126,142,193,70,253,168,182,116,109,204,84,219,
+    59,54,174,87,163,125,27,55,171,199,134,55,110,192,65,219,
+    156,73,30,11,137,142,133,238,31,105,33,30,145,160,42,60,
+    98,182,124,234,216,19,89,125,162,183,111,137,79,134,212,64,
+    18,131,167,146,97,53,196,48,162,98,134,45,68,218,110,69,
+    62,31,53,172,70,30,241,108,13,190,238,207,54,53,192,124,
+    209,98,118,177,13,95,213,86,137,58,79,181,60,213,140,53,
+    123,247,197,83,94,191,164,22,97,76,170,192,6,129,139,6,
+    124,92,228,179,138,25,213,114,154,241,27,114,119,133,232,70,
+    158,206,49,239,152,199,60,93,191,254,232,206,92,90,112,169,
+    10,118,130,246,203,164,101,167,117,116,167,46,210,67,75,172,
+    157,170,183,221,178,109,14,249,124,214,185,117,126,137,247,90,
+    143,99,111,201,2,122,194,205,37,120,179,51,69,29,69,172,
+    173,49,205,53,162,155,65,165,80,32,57,245,137,96,138,58,
+    201,44,154,210,193,168,84,33,79,13,19,31,140,92,211,65,
+    79,89,150,105,59,187,155,49,157,28,110,203,49,67,113,216,
+    223,188,163,126,131,167,96,143,19,86,144,177,184,170,180,39,
+    106,136,11,143,84,19,195,247,103,42,210,192,11,44,85,240,
+    185,93,156,216,193,137,199,83,223,198,75,67,151,203,120,186,
+    130,167,75,206,105,69,158,191,49,231,45,99,26,46,35,169,
+    92,163,89,214,95,97,68,111,240,216,38,76,240,115,197,79,
+    111,229,117,207,246,96,99,239,41,186,65,234,187,146,53,93,
+    86,73,129,146,180,98,16,85,214,114,242,162,242,113,158,202,
+    249,69,217,207,8,163,242,2,33,242,81,111,164,188,200,102,
+    178,152,35,108,29,246,152,85,12,45,159,99,142,20,239,41,
+    52,71,79,49,221,104,28,172,232,241,76,180,73,167,226,224,
+    209,110,241,142,188,124,232,147,231,88,170,241,124,235,137,61,
+    65,12,71,246,17,131,154,5,17,20,110,221,197,61,59,184,
+    103,123,228,25,46,227,183,43,248,237,146,115,218,62,113,219,
+    53,228,248,228,115,174,41,192,101,195,229,189,102,15,25,1,
+    151,212,55,172,221,171,205,160,15,191,248,132,91,231,84,161,
+    187,222,247,9,207,218,188,171,45,24,33,151,167,121,3,31,
+    182,188,62,167,63,99,241,225,250,126,215,56,118,61,173,183,
+    182,131,126,99,216,202,237,174,86,67,146,107,140,174,207,62,
+    124,205,239,194,126,99,214,249,215,153,203,116,104,252,214,45,
+    43,170,197,185,226,59,87,40,205,211,145,21,157,248,134,168,
+    108,228,101,72,98,114,61,121,176,44,89,207,30,145,239,96,
+    95,20,22,78,132,105,23,187,153,1,38,205,25,166,72,86,
+    53,198,69,154,174,229,116,67,201,165,137,41,48,126,50,91,
+    150,136,49,61,205,18,33,73,27,244,56,140,23,216,104,218,
+    1,11,136,20,124,101,138,214,242,39,96,221,147,12,116,120,
+    175,229,122,124,139,160,76,241,228,17,33,13,194,155,48,233,
+    95,200,157,89,162,225,174,231,82,180,198,115,209,89,110,79,
+    16,90,219,246,17,131,26,192,191,49,106,141,110,70,255,112,
+    237,179,107,247,173,227,69,252,84,37,126,161,134,34,173,93,
+    22,108,138,213,179,189,219,191,122,112,111,83,170,158,60,187,
+    205,61,152,216,196,207,59,78,111,101,254,54,93,238,24,175,
+    116,140,215,80,40,218,85,141,197,119,99,125,59,177,190,114,
+    108,160,18,27,216,141,93,218,137,93,170,198,251,190,74,63,
+    30,252,50,251,48,187,39,240,157,93,251,136,65,237,16,48,
+    234,236,246,206,154,216,137,77,176,89,187,241,241,157,248,120,
+    57,126,129,105,242,236,186,239,220,168,163,159,77,193,224,129,
+    226,208,12,89,84,86,50,134,236,36,109,43,131,228,242,185,
+    159,100,52,29,242,81,221,187,122,162,157,66,236,82,120,33,
+    40,68,22,13,3,180,0,72,96,103,105,126,237,178,150,83,
+    223,35,198,114,94,53,91,160,142,32,171,64,9,186,229,102,
+    59,253,156,5,72,88,94,159,87,168,146,53,3,239,223,200,
+    25,151,204,147,44,149,185,72,52,165,218,122,217,180,3,164,
+    109,43,13,14,165,81,7,198,193,111,91,200,91,118,244,178,
+    178,35,58,6,21,199,165,141,27,181,32,10,119,222,151,74,
+    157,131,101,156,168,224,68,21,199,160,117,190,140,7,43,120,
+    176,22,16,58,130,27,179,44,69,157,238,41,137,221,53,81,
+    12,204,112,44,107,29,162,20,12,76,214,80,29,142,29,15,
+    48,19,214,97,8,245,14,254,101,248,207,195,85,28,46,181,
+    76,48,163,247,6,153,209,123,131,37,241,172,125,218,74,131,
+    170,254,197,206,239,209,143,81,236,144,150,109,201,239,13,87,
+    177,26,110,40,115,90,173,50,39,98,70,129,69,104,190,112,
+    85,209,232,65,133,19,107,168,112,10,139,80,217,244,248,21,
+    159,158,137,214,59,106,189,158,255,147,202,133,118,178,71,70,
+    121,81,87,237,162,167,25,37,234,244,13,144,8,86,202,176,
+    146,133,25,176,5,30,54,108,103,41,237,6,203,9,154,146,
+    89,0,105,177,167,201,52,163,13,67,10,200,91,152,244,67,
+    97,50,88,237,63,15,133,201,57,171,48,57,179,139,251,119,
+    112,255,246,250,179,247,75,3,63,47,227,169,10,158,42,57,
+    231,43,72,240,175,63,62,9,62,252,63,9,30,53,247,7,
+    233,243,149,67,143,23,109,122,148,15,248,209,29,41,126,212,
+    104,199,96,132,246,160,67,90,188,0,207,240,123,138,246,2,
+    244,1,244,3,12,0,88,36,24,88,204,228,21,15,13,210,
+    65,116,16,216,244,45,212,200,130,86,206,45,118,53,199,50,
+    168,243,49,12,255,7,114,7,112,155,197,127,165,227,55,203,
+    210,108,69,154,45,73,179,207,165,99,77,164,55,234,79,122,
+    241,83,91,183,30,132,54,3,63,128,244,200,227,43,95,102,
+    30,102,254,123,210,251,251,149,111,251,191,126,247,155,119,95,
+    131,250,150,108,159,189,248,101,177,125,158,85,217,150,99,238,
+    17,109,105,217,72,180,189,154,227,232,16,192,48,128,229,162,
+    159,58,150,165,35,150,79,174,130,79,204,160,189,88,35,109,
+    141,59,160,130,185,127,135,188,180,117,6,104,235,60,208,214,
+    91,175,79,91,221,167,75,98,39,208,214,59,192,87,7,32,
+    181,3,63,213,225,28,106,235,248,211,7,127,252,96,171,163,
+    116,102,172,220,58,94,105,29,223,184,10,135,173,26,40,52,
+    151,8,154,225,236,197,209,2,48,178,110,74,236,113,65,203,
+    218,37,151,25,174,63,218,191,247,163,245,189,120,247,247,61,
+    158,178,255,110,248,5,157,66,246,95,30,250,19,6,53,129,
+    227,184,218,117,14,113,241,18,122,195,62,171,232,68,201,57,
+    107,88,228,70,152,230,77,176,25,222,131,219,254,97,111,219,
+    155,92,176,134,154,97,235,183,123,112,219,63,236,93,230,122,
+    185,55,107,168,25,182,216,162,236,182,239,35,178,182,242,31,
+    2,67,27,244,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/qos/QoSPolicy.py",
+    "m5.objects.QoSPolicy",
+    embedded_module_data,
+    1892,
+    4679);
+
+} // anonymous namespace
+} // namespace gem5
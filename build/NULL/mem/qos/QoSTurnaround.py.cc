@@ -0,0 +1,54 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,146,61,111,218,64,24,199,159,179,13,24,146,38,
+    69,116,168,170,244,69,68,149,226,5,75,149,88,156,170,83,
+    165,134,12,180,21,153,188,156,28,223,169,80,217,152,156,141,
+    20,51,121,200,119,72,62,65,165,170,95,134,17,121,237,212,
+    205,81,50,101,234,61,6,83,66,104,85,159,253,187,59,63,
+    175,247,183,127,194,202,85,90,204,55,199,18,151,192,128,17,
+    15,124,98,19,2,10,124,0,166,92,0,83,57,249,166,2,
+    252,80,139,32,91,201,109,154,180,149,184,178,102,83,89,185,
+    7,70,229,23,110,12,146,86,123,3,255,227,233,87,238,70,
+    238,106,93,82,212,125,145,215,229,96,19,38,243,50,140,39,
+    182,198,20,187,196,84,187,204,52,153,171,148,54,62,7,189,
+    147,177,24,58,34,24,15,217,167,192,27,184,241,100,207,231,
+    190,121,22,132,102,180,180,208,81,110,106,245,251,147,253,47,
+    220,111,91,150,244,9,68,108,89,210,207,178,214,83,156,116,
+    141,74,170,83,58,116,124,78,105,90,163,212,15,216,216,195,
+    245,54,165,103,99,199,91,88,180,40,30,241,180,230,158,159,
+    211,62,119,24,23,105,21,215,174,231,132,97,170,59,167,97,
+    36,28,55,250,14,55,120,164,187,189,80,184,102,209,220,189,
+    206,91,163,88,160,226,57,14,228,19,54,37,146,229,152,109,
+    189,74,222,207,234,102,114,60,123,220,78,58,179,221,70,114,
+    132,67,236,20,65,155,69,124,246,15,17,165,128,90,250,116,
+    131,128,29,198,29,111,210,252,171,138,116,128,14,168,229,193,
+    127,104,153,103,235,26,101,81,198,86,43,8,29,81,69,212,
+    16,91,136,71,136,252,52,187,136,122,1,19,197,120,190,38,
+    198,107,20,163,141,98,88,73,7,199,60,18,253,187,242,80,
+    219,126,187,181,252,187,132,90,72,52,79,122,191,208,157,254,
+    118,254,105,223,137,198,66,184,48,150,200,84,66,72,118,68,
+    128,236,79,161,185,122,103,186,70,158,100,240,16,87,198,53,
+    78,183,127,222,238,168,228,48,131,135,152,190,124,115,141,243,
+    237,6,91,222,218,111,110,61,228,39,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/qos/QoSTurnaround.py",
+    "m5.objects.QoSTurnaround",
+    embedded_module_data,
+    474,
+    906);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,96 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,85,205,79,227,70,20,31,231,251,219,124,21,2,
+    130,98,22,169,5,132,150,118,5,203,22,173,42,117,129,82,
+    118,89,82,45,213,74,155,170,178,156,204,144,184,235,216,217,
+    177,83,72,46,245,161,39,46,139,184,192,145,19,82,213,115,
+    255,137,158,146,85,164,70,62,173,212,19,183,108,217,19,167,
+    190,177,19,23,146,64,123,104,99,251,121,252,126,191,121,243,
+    241,126,243,242,7,186,242,243,183,222,23,42,152,99,132,17,
+    230,20,244,13,123,123,20,174,224,73,123,56,228,65,27,8,
+    123,127,66,216,71,60,103,94,132,126,241,182,59,167,189,54,
+    230,7,44,64,188,29,152,207,198,130,128,133,186,48,63,14,
+    239,160,217,200,57,251,152,229,44,110,14,76,120,71,46,164,
+    50,223,147,172,145,189,58,65,95,123,130,127,218,19,36,40,
+    205,97,148,246,192,227,197,92,218,135,61,105,63,9,156,6,
+    81,143,31,246,158,113,48,44,231,14,27,2,102,184,39,211,
+    135,253,103,30,224,122,92,110,228,198,168,129,142,168,209,27,
+    153,62,28,236,136,26,35,241,222,220,28,108,83,7,55,225,
+    108,146,21,126,36,233,114,118,75,86,95,94,78,20,72,97,
+    129,150,50,229,5,149,24,123,26,125,185,224,98,119,243,249,
+    202,7,57,82,88,90,89,97,132,149,21,23,169,76,108,174,
+    9,178,42,80,162,72,134,172,169,130,161,9,154,145,39,84,
+    80,0,213,207,217,74,172,32,96,68,205,150,43,115,57,162,
+    18,42,103,133,140,164,226,61,25,27,121,97,87,202,26,26,
+    157,23,74,122,73,82,148,50,139,149,41,27,68,175,220,43,
+    233,4,179,112,148,232,6,244,49,4,170,149,12,89,205,49,
+    138,158,215,40,144,12,161,40,65,12,73,149,148,178,46,235,
+    149,201,231,48,117,93,208,75,197,34,195,177,176,70,118,165,
+    146,98,172,124,161,40,51,223,126,55,187,61,203,91,33,81,
+    84,165,2,17,69,43,34,138,5,13,151,20,214,142,137,226,
+    43,152,64,11,241,25,229,34,177,34,217,253,125,49,79,36,
+    76,168,21,102,237,172,34,233,186,229,255,90,162,82,193,242,
+    110,170,6,172,12,86,41,202,216,10,172,150,179,10,209,41,
+    83,128,213,231,46,79,116,150,103,5,246,136,156,203,27,86,
+    244,57,97,223,78,4,222,157,167,248,3,155,247,207,232,130,
+    229,230,114,74,167,217,133,91,146,81,44,211,0,240,108,51,
+    9,143,254,35,24,211,189,26,209,97,115,173,209,255,137,249,
+    184,209,247,177,185,249,54,49,248,90,62,144,171,201,229,90,
+    226,65,61,241,192,220,104,128,71,57,80,78,62,61,145,107,
+    137,153,122,98,198,220,104,246,161,228,196,113,249,168,92,157,
+    122,90,27,217,174,143,108,87,125,67,141,248,192,235,23,7,
+    47,14,95,85,199,182,107,241,84,61,158,50,191,108,12,79,
+    29,107,71,218,105,166,58,247,164,54,188,85,31,222,50,83,
+    236,162,163,237,25,93,59,96,237,83,121,65,209,255,121,192,
+    58,152,17,236,79,71,113,0,4,30,180,98,246,190,173,239,
+    27,108,235,40,27,169,146,236,82,114,11,174,196,161,65,40,
+    168,73,80,53,76,42,131,160,109,109,23,244,118,197,121,222,
+    7,33,182,103,99,52,194,22,28,101,38,198,76,156,153,4,
+    51,60,51,140,101,37,158,193,16,171,154,106,80,77,81,64,
+    68,33,178,111,136,44,136,21,181,135,125,6,130,102,110,24,
+    192,118,211,33,214,53,201,140,189,157,99,204,140,183,205,61,
+    150,234,173,142,84,143,186,169,158,131,84,243,67,191,243,211,
+    111,248,233,211,84,141,95,172,243,139,230,87,13,230,18,222,
+    240,66,117,234,126,141,95,174,243,203,224,27,25,133,236,58,
+    183,51,208,120,103,222,220,194,248,219,127,147,183,27,74,88,
+    7,51,12,204,72,79,166,31,10,227,245,2,22,189,133,219,
+    85,24,113,40,29,111,21,60,71,15,112,118,111,211,67,11,
+    174,244,59,25,18,160,174,193,153,20,136,138,175,186,48,212,
+    31,112,89,168,50,153,42,25,236,36,11,88,166,112,192,89,
+    29,148,12,187,11,181,217,149,15,55,213,110,156,245,119,112,
+    58,129,152,168,18,255,66,84,84,0,99,133,32,182,163,164,
+    16,68,113,90,129,29,40,147,106,206,138,50,76,115,38,100,
+    69,24,44,219,131,247,84,215,116,219,60,132,71,47,163,127,
+    82,151,35,165,197,26,191,84,231,151,174,201,203,245,53,3,
+    104,48,121,60,127,52,127,66,171,211,107,181,129,245,250,192,
+    186,249,164,209,63,124,60,126,52,126,146,169,222,121,84,235,
+    95,173,247,175,154,143,129,153,28,235,144,226,180,189,19,1,
+    43,92,88,186,91,100,101,82,183,98,208,116,255,191,41,147,
+    166,83,255,198,221,5,92,95,212,101,232,161,83,215,63,167,
+    243,240,201,244,165,255,10,166,233,229,56,174,121,31,113,201,
+    42,26,113,238,6,186,83,189,126,55,3,125,220,83,174,137,
+    122,219,195,240,59,251,253,254,42,242,81,144,27,107,162,110,
+    115,248,217,59,246,122,255,183,119,40,206,90,221,134,49,227,
+    140,217,13,217,203,250,11,61,224,70,166,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/ruby/network/BasicLink.py",
+    "m5.objects.BasicLink",
+    embedded_module_data,
+    1147,
+    2390);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,57 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,82,189,111,211,64,20,191,179,29,39,78,160,164,
+    162,85,35,134,214,18,147,145,72,68,171,118,8,81,139,104,
+    81,21,134,130,128,201,139,229,248,174,196,212,31,225,206,22,
+    117,38,15,76,44,32,150,50,50,69,66,252,51,169,212,33,
+    186,9,137,169,155,81,153,152,184,115,62,148,74,129,251,120,
+    247,241,126,239,253,222,123,122,63,193,220,40,76,206,171,29,
+    46,206,0,2,8,122,192,135,38,132,226,46,121,210,43,32,
+    129,67,128,228,247,0,41,24,14,100,0,190,203,83,99,83,
+    70,133,151,192,80,47,197,195,128,236,230,190,23,58,39,24,
+    61,235,188,193,78,196,63,224,61,103,158,76,153,146,245,114,
+    50,12,76,136,128,41,33,225,8,154,10,146,204,2,86,191,
+    22,193,130,129,228,1,228,212,112,70,93,226,72,109,33,82,
+    65,133,129,196,177,210,12,91,70,42,15,179,200,42,143,109,
+    234,58,47,194,56,194,164,191,225,99,191,65,226,78,210,8,
+    112,244,46,36,39,141,57,109,189,219,237,175,189,198,254,118,
+    179,41,32,205,230,53,203,246,129,238,6,58,193,158,29,185,
+    97,160,71,161,30,70,93,76,116,146,235,233,165,136,178,191,
+    30,196,126,135,127,134,199,186,147,56,30,166,220,134,186,8,
+    79,80,71,70,133,149,44,43,176,125,108,89,172,108,89,126,
+    136,98,79,220,111,88,214,219,216,246,38,26,37,74,122,152,
+    149,157,211,83,171,139,109,132,9,211,196,221,241,108,74,89,
+    225,185,77,108,159,201,237,32,98,218,216,175,229,34,166,238,
+    231,132,172,200,3,196,129,147,124,3,87,162,14,127,238,82,
+    226,52,254,155,118,47,33,42,71,230,98,131,111,250,132,139,
+    116,54,71,149,90,122,48,90,222,76,159,142,170,70,218,254,
+    81,93,61,211,62,107,195,59,15,207,171,173,139,106,43,109,
+    103,42,184,181,242,209,251,224,125,121,48,92,223,61,95,218,
+    187,88,218,75,15,197,36,43,83,191,71,134,194,106,254,118,
+    61,204,187,132,214,175,53,13,17,205,197,52,174,238,137,212,
+    232,56,156,219,66,228,14,86,69,30,165,214,184,88,187,164,
+    198,159,162,218,84,244,89,38,67,8,179,29,0,183,134,96,
+    115,126,141,192,218,112,186,50,181,4,31,193,12,44,150,159,
+    238,255,202,207,223,255,208,231,65,252,5,57,31,218,247,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/ruby/network/BasicRouter.py",
+    "m5.objects.BasicRouter",
+    embedded_module_data,
+    527,
+    833);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,107 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,86,205,111,19,71,20,159,245,183,29,127,145,111,
+    28,16,211,74,64,93,36,135,86,112,137,80,75,105,66,10,
+    17,1,17,170,86,190,108,54,158,177,189,116,63,204,204,46,
+    137,93,9,249,208,67,212,75,17,151,68,189,180,234,1,181,
+    226,210,63,197,169,34,213,154,83,165,158,122,115,4,39,78,
+    125,179,187,78,98,39,165,201,236,236,155,217,121,111,222,252,
+    222,155,247,102,246,111,116,168,68,131,246,117,25,200,22,34,
+    136,40,6,122,228,183,138,215,134,140,144,25,46,135,21,20,
+    66,139,136,132,191,67,36,66,35,47,195,8,189,10,247,149,
+    148,163,30,47,10,188,24,13,15,241,98,36,190,130,138,137,
+    127,228,71,81,17,202,135,64,146,43,186,121,127,237,49,173,
+    56,149,195,96,66,125,48,147,30,24,138,202,10,65,229,80,
+    13,192,252,162,148,195,36,4,138,194,98,252,30,229,92,171,
+    209,135,154,69,108,83,111,105,142,110,91,48,158,32,58,215,
+    214,12,74,68,156,90,126,103,132,185,107,77,149,55,185,67,
+    205,229,98,68,36,84,213,210,76,170,170,34,165,170,166,77,
+    92,67,246,211,170,250,196,213,140,128,19,121,170,25,252,55,
+    244,90,2,121,123,145,179,202,172,73,205,89,169,104,214,162,
+    206,186,205,190,153,13,0,220,114,171,85,202,74,141,38,139,
+    129,172,71,174,194,203,207,2,105,239,63,221,145,143,58,94,
+    109,207,203,135,229,250,178,3,166,71,250,166,63,83,14,155,
+    14,111,152,40,229,8,9,149,163,52,246,115,28,29,83,72,
+    152,68,94,130,235,94,245,221,135,202,9,144,77,30,43,27,
+    37,177,33,217,20,200,142,28,43,27,39,137,33,217,244,59,
+    48,36,135,100,51,33,68,179,36,245,18,236,121,165,236,143,
+    230,96,52,79,115,100,100,72,250,12,140,143,146,244,144,244,
+    152,39,61,70,50,67,210,227,239,176,47,59,36,59,1,178,
+    147,255,33,155,27,146,157,34,121,8,177,51,34,51,176,195,
+    173,179,53,106,94,159,155,147,49,48,55,55,200,122,239,127,
+    130,163,94,191,221,58,255,85,157,58,117,202,48,16,188,230,
+    141,99,157,99,155,17,202,40,97,114,249,22,185,167,109,232,
+    166,107,98,203,53,215,128,111,87,49,181,28,166,83,142,29,
+    187,63,233,68,229,131,171,88,51,12,123,157,99,221,170,234,
+    150,238,208,190,166,34,147,62,107,77,13,36,14,110,104,12,
+    2,223,161,76,91,1,199,127,230,79,53,125,35,252,197,165,
+    130,39,46,117,41,57,25,130,160,172,235,78,29,183,40,179,
+    177,161,57,212,170,52,75,248,81,29,236,134,234,114,90,117,
+    141,83,105,171,218,224,52,11,96,90,96,29,6,123,106,53,
+    240,136,7,139,99,48,232,84,202,120,221,118,13,130,45,219,
+    145,214,1,26,130,245,42,108,15,64,51,121,173,116,42,93,
+    193,222,84,108,203,130,243,140,99,162,203,111,112,57,182,189,
+    19,142,183,46,61,164,128,147,59,184,97,51,71,122,116,32,
+    68,48,163,21,170,63,149,177,180,106,106,112,82,177,85,233,
+    34,203,94,199,21,48,21,160,173,218,174,163,202,185,171,173,
+    203,15,41,111,216,22,167,190,174,42,179,205,33,109,156,90,
+    16,86,173,11,171,220,208,158,210,35,170,116,43,208,244,251,
+    209,128,59,216,244,186,230,192,12,235,52,94,160,152,208,32,
+    72,26,210,29,205,138,65,79,52,243,32,94,3,5,186,85,
+    147,35,224,23,141,52,247,65,21,91,191,6,22,54,152,110,
+    51,221,105,226,245,58,181,14,64,107,236,100,235,201,157,226,
+    174,9,56,215,154,94,70,6,137,91,194,43,166,116,18,195,
+    112,1,184,39,212,101,82,205,226,184,174,215,234,135,128,45,
+    23,167,89,10,50,141,201,99,149,165,129,136,136,211,108,80,
+    145,172,108,108,168,21,67,227,92,164,100,183,14,22,82,38,
+    162,15,100,10,138,200,45,219,54,68,60,56,22,68,226,75,
+    139,235,53,75,222,98,126,136,169,92,135,108,146,55,135,200,
+    176,195,41,44,70,61,7,170,50,215,212,32,215,196,72,16,
+    116,15,96,183,69,162,31,65,34,55,79,27,16,112,32,68,
+    252,85,99,126,204,137,116,63,178,188,9,241,32,78,68,212,
+    11,35,145,55,181,13,53,216,31,149,193,108,17,190,99,57,
+    34,207,64,49,236,151,218,55,157,101,165,201,222,21,151,151,
+    100,180,79,174,193,203,211,202,224,197,88,104,207,119,243,87,
+    218,119,186,103,174,181,239,254,149,29,251,225,241,247,143,183,
+    39,58,248,211,157,236,205,221,236,205,246,98,119,116,106,171,
+    244,162,212,77,36,123,33,37,121,75,217,139,70,198,98,111,
+    16,144,246,82,47,133,38,10,127,142,151,254,24,7,254,68,
+    103,234,234,94,56,52,1,76,32,237,123,189,24,42,92,248,
+    169,240,99,161,155,200,244,66,145,228,125,152,26,47,0,23,
+    72,39,50,217,27,69,249,153,205,111,59,51,159,239,228,230,
+    119,115,243,237,47,186,153,115,155,234,246,215,157,203,119,119,
+    50,75,187,153,165,246,237,110,182,176,105,116,102,230,119,178,
+    11,187,217,5,192,146,158,217,188,191,189,216,185,120,123,39,
+    189,184,155,94,108,47,116,167,206,109,61,123,241,204,67,23,
+    74,46,195,18,209,105,88,2,72,39,50,222,75,163,233,243,
+    91,205,23,205,128,125,99,128,235,87,223,81,210,61,203,197,
+    184,72,154,215,75,222,97,204,69,66,118,153,189,209,20,105,
+    232,237,255,44,49,249,151,32,82,43,21,187,65,201,2,36,
+    174,255,227,225,57,121,208,241,111,19,55,252,223,155,79,216,
+    21,248,148,55,42,127,14,164,23,86,20,165,183,172,32,101,
+    186,131,166,252,218,69,147,157,126,237,162,247,59,131,181,151,
+    85,148,143,123,232,40,217,158,219,147,205,155,131,209,196,37,
+    37,214,67,71,201,243,59,123,178,121,115,12,203,67,252,47,
+    143,255,189,227,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/ruby/network/MessageBuffer.py",
+    "m5.objects.MessageBuffer",
+    embedded_module_data,
+    1316,
+    2705);
+
+} // anonymous namespace
+} // namespace gem5
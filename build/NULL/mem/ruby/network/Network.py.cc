@@ -0,0 +1,108 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,86,205,111,19,71,20,223,245,231,58,241,87,156,
+    128,19,2,201,36,85,190,40,56,109,34,90,148,162,30,8,
+    37,9,180,33,34,161,170,124,217,172,119,199,246,194,126,152,
+    157,53,196,22,7,31,122,64,189,180,226,2,199,168,7,170,
+    138,127,102,29,89,202,106,78,145,122,226,84,71,112,234,169,
+    111,214,107,19,140,217,29,207,206,188,247,123,111,222,188,223,
+    124,248,31,238,204,19,246,191,239,238,64,245,146,83,56,133,
+    215,56,157,207,243,60,107,7,180,128,30,204,7,189,118,80,
+    11,237,117,190,225,61,46,192,109,112,74,232,87,78,9,227,
+    224,235,32,199,189,9,118,29,230,35,74,100,151,91,138,190,
+    101,157,37,158,198,110,74,68,149,127,84,141,71,208,73,172,
+    107,166,252,8,43,247,10,15,177,108,131,128,191,44,159,141,
+    38,212,141,38,20,96,209,96,46,207,43,92,62,0,191,160,
+    194,231,67,74,32,31,86,130,249,8,142,30,10,220,128,71,
+    9,41,225,215,96,249,38,208,139,38,6,216,161,129,216,200,
+    107,30,144,124,15,57,12,200,248,64,100,84,17,250,188,38,
+    0,155,28,136,21,250,188,166,112,250,112,100,32,50,214,135,
+    204,0,114,116,32,114,168,15,57,6,200,115,3,145,195,125,
+    200,243,128,204,14,68,198,251,144,227,1,14,79,40,137,62,
+    233,5,144,78,226,11,74,178,111,254,23,65,126,73,73,245,
+    161,167,60,244,148,146,238,67,79,127,46,179,24,61,156,233,
+    69,52,210,103,53,171,100,96,29,141,210,225,251,213,66,109,
+    27,219,79,77,235,81,125,180,132,245,107,107,107,22,136,214,
+    214,186,194,73,29,235,203,76,180,108,116,36,203,190,38,87,
+    46,239,213,19,219,166,141,118,43,88,86,139,42,86,234,139,
+    118,25,35,67,210,49,50,139,136,181,85,189,98,90,54,86,
+    144,109,86,76,205,44,213,144,110,42,85,13,215,255,221,174,
+    234,5,108,49,220,19,213,178,171,146,134,124,255,4,85,9,
+    24,20,106,158,3,217,44,99,11,27,50,70,21,203,180,77,
+    217,212,144,106,48,68,14,161,61,208,155,198,85,185,172,86,
+    186,198,72,34,164,170,99,226,217,246,44,12,111,44,130,158,
+    0,138,32,98,75,150,173,26,37,84,180,76,29,125,213,113,
+    100,225,162,105,225,43,158,157,241,249,208,72,217,172,106,16,
+    28,27,24,195,92,44,12,22,146,225,153,149,213,82,25,19,
+    219,55,135,41,176,225,186,209,190,101,123,138,114,245,148,159,
+    61,100,153,85,27,98,170,103,186,130,45,3,250,69,73,198,
+    164,158,101,59,26,230,96,34,124,0,66,131,69,96,42,160,
+    184,216,81,20,192,4,99,3,124,127,164,77,174,239,60,0,
+    89,165,106,35,150,245,250,244,62,209,164,39,120,31,169,4,
+    16,79,145,44,105,26,132,181,175,26,34,211,239,215,83,204,
+    0,226,232,89,204,236,235,18,1,159,159,152,0,200,183,217,
+    218,85,235,30,189,138,100,75,8,82,77,164,18,38,57,116,
+    11,23,165,170,102,123,81,123,201,151,128,54,27,177,245,181,
+    91,3,159,58,248,146,65,174,169,144,56,2,62,114,219,75,
+    95,80,65,20,217,114,17,69,58,36,138,157,165,1,237,184,
+    40,62,134,180,251,154,144,93,171,96,26,147,15,14,68,89,
+    3,126,233,16,107,150,177,164,96,139,10,82,129,216,150,36,
+    219,52,188,35,89,146,78,35,187,182,5,228,82,161,187,226,
+    168,240,192,32,106,201,192,10,189,208,161,70,52,139,162,207,
+    172,216,101,150,6,33,255,52,45,155,134,109,153,154,168,147,
+    146,200,130,164,67,31,38,64,135,217,54,16,137,223,249,25,
+    14,89,211,234,12,58,236,157,195,247,61,74,105,212,167,214,
+    98,7,46,141,192,8,106,145,208,184,7,249,225,192,102,20,
+    210,24,16,43,106,140,76,95,1,163,119,20,192,169,175,200,
+    116,70,184,143,73,197,52,8,222,129,244,211,168,207,29,77,
+    221,194,21,11,203,18,236,173,78,8,97,143,107,58,210,53,
+    122,92,133,181,232,217,8,93,242,104,164,195,46,141,236,120,
+    228,208,116,129,221,24,222,68,197,66,205,198,132,38,24,171,
+    189,217,255,205,189,99,167,197,127,211,196,146,151,63,123,14,
+    84,106,86,20,80,94,197,78,28,178,10,167,86,163,247,186,
+    195,227,141,91,110,122,174,177,229,142,228,26,119,220,212,104,
+    99,243,36,53,246,251,179,223,158,185,66,214,153,88,63,13,
+    6,210,145,247,28,84,141,205,182,192,205,46,252,53,245,231,
+    84,59,16,138,45,158,6,35,179,160,129,202,9,77,181,147,
+    220,248,165,151,181,23,181,195,145,195,155,205,236,66,43,187,
+    224,132,198,220,76,246,56,51,123,148,153,61,92,105,102,230,
+    91,153,249,198,221,147,228,196,113,114,238,40,57,231,204,127,
+    219,76,94,111,37,175,55,54,220,196,248,113,98,254,40,49,
+    239,44,124,215,76,220,104,37,110,52,110,187,233,201,227,244,
+    226,81,122,209,89,186,217,76,175,183,210,235,16,226,7,217,
+    70,51,189,217,74,111,54,182,78,146,200,129,50,243,117,51,
+    185,210,74,174,128,179,248,228,243,123,175,54,156,185,219,205,
+    248,70,43,190,209,248,193,77,33,7,202,204,74,51,181,218,
+    74,173,54,54,221,196,197,231,226,171,95,156,133,59,205,196,
+    221,86,226,110,227,246,201,216,196,203,173,23,91,174,144,108,
+    9,211,237,0,31,155,63,13,135,206,193,236,160,106,252,196,
+    94,235,106,55,139,219,75,81,58,166,95,203,153,222,77,78,
+    114,189,91,222,98,255,4,232,248,25,213,71,119,126,103,197,
+    197,64,93,97,107,130,80,129,53,45,243,192,103,232,10,171,
+    188,81,114,140,86,225,70,103,199,125,111,173,66,151,93,53,
+    228,41,84,237,32,207,243,237,111,56,254,75,135,187,124,182,
+    184,220,138,243,113,113,185,172,211,45,46,119,222,233,150,118,
+    100,150,143,180,185,79,171,63,174,158,178,207,251,1,42,47,
+    176,255,1,68,250,166,151,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/ruby/network/Network.py",
+    "m5.objects.Network",
+    embedded_module_data,
+    1335,
+    2367);
+
+} // anonymous namespace
+} // namespace gem5
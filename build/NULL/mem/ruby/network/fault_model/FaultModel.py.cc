@@ -0,0 +1,837 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,124,9,92,78,91,247,127,105,86,161,200,76,68,
+    50,70,101,12,237,50,148,70,81,145,148,52,30,165,241,52,
+    143,42,205,105,50,84,26,168,20,37,37,13,164,76,201,156,
+    33,20,9,137,226,241,16,146,153,240,95,123,159,115,186,222,
+    247,189,239,239,243,222,255,189,247,115,238,121,206,217,123,173,
+    181,215,90,123,239,239,119,239,125,234,20,248,227,31,17,246,
+    255,31,230,195,37,93,192,94,192,94,208,69,192,20,255,127,
+    128,139,160,235,0,139,1,130,2,3,4,116,4,236,133,34,
+    5,236,133,29,6,28,20,18,16,40,17,226,42,91,8,217,
+    139,152,8,76,19,229,227,31,211,4,219,4,167,195,69,194,
+    196,201,117,181,173,179,131,157,183,221,159,138,132,57,69,129,
+    68,145,131,128,133,160,189,128,197,0,123,44,68,208,66,216,
+    126,128,133,136,131,104,174,152,192,223,252,67,129,250,124,65,
+    123,225,131,3,64,249,128,126,229,226,80,94,226,191,148,23,
+    249,155,242,3,237,69,193,88,177,182,129,218,54,62,46,222,
+    134,238,246,14,46,129,195,41,7,215,121,234,234,180,143,109,
+    128,186,250,31,207,167,187,58,184,206,198,79,103,187,57,120,
+    251,185,211,91,103,59,226,151,214,174,248,237,236,191,10,42,
+    111,217,50,213,6,140,224,99,63,242,167,98,229,118,131,34,
+    146,214,85,87,33,170,221,51,62,169,171,183,14,241,150,249,
+    233,102,203,173,217,133,168,156,240,212,244,121,199,206,33,202,
+    35,109,231,243,201,187,203,16,101,48,127,188,203,177,135,149,
+    136,103,208,113,239,241,146,150,60,68,137,91,132,79,44,217,
+    88,141,120,171,158,6,14,43,211,57,134,168,170,43,190,103,
+    246,143,62,139,104,236,28,190,18,92,120,161,157,91,111,205,
+    148,40,71,148,215,125,217,94,173,91,199,17,239,178,78,130,
+    90,244,162,84,68,141,189,217,231,60,104,200,41,68,37,47,
+    248,54,75,125,195,97,68,169,94,189,178,161,245,46,40,123,
+    119,181,97,89,169,211,62,68,109,120,252,106,17,63,164,18,
+    81,129,151,167,169,239,108,60,138,168,105,141,67,46,215,214,
+    156,102,117,76,193,237,144,188,179,99,229,221,7,197,136,250,
+    97,233,122,241,87,5,148,214,215,240,29,49,117,90,10,162,
+    204,215,101,238,142,112,59,193,169,63,136,120,223,91,198,78,
+    200,56,112,8,81,77,77,168,254,98,124,38,162,164,59,102,
+    165,228,126,5,243,15,102,108,207,61,96,86,138,168,253,55,
+    14,223,106,89,119,138,213,161,136,219,81,252,64,168,244,92,
+    74,33,162,166,218,28,124,99,189,1,74,111,84,82,190,60,
+    99,72,34,162,116,44,166,187,235,44,172,70,212,115,233,57,
+    31,198,245,21,32,94,198,227,93,49,81,22,7,16,239,108,
+    243,173,172,120,211,12,196,19,126,230,243,51,226,49,184,225,
+    254,150,69,77,203,93,75,16,69,27,159,55,120,120,182,150,
+    213,49,25,183,195,248,137,234,161,70,219,124,68,249,92,185,
+    225,33,164,1,141,109,178,219,77,109,26,148,192,73,172,228,
+    140,205,67,188,15,87,228,165,150,124,1,23,49,150,237,65,
+    212,151,203,65,45,215,34,161,86,209,218,74,49,139,112,240,
+    199,244,181,54,46,19,175,156,100,117,76,194,237,168,127,230,
+    241,98,189,87,46,226,49,222,63,130,168,213,21,45,207,119,
+    135,197,66,168,173,197,110,142,90,83,129,40,129,206,81,115,
+    63,174,134,50,235,111,233,190,27,99,157,133,120,227,31,229,
+    84,63,84,222,141,40,176,207,246,131,39,184,168,125,226,69,
+    129,184,41,69,136,26,103,102,56,196,71,190,134,213,161,128,
+    117,108,105,60,57,108,253,158,28,196,75,188,173,126,56,115,
+    2,4,182,46,248,117,67,224,129,104,68,75,226,118,50,205,
+    219,143,168,88,59,171,71,218,66,25,136,26,222,254,92,225,
+    204,80,200,187,7,55,191,152,116,22,130,123,22,221,187,232,
+    58,55,12,194,116,123,125,138,227,204,204,227,172,252,137,88,
+    126,11,118,234,200,44,68,253,106,246,231,79,81,1,35,228,
+    243,111,143,187,112,51,18,209,210,36,86,42,19,95,236,60,
+    12,250,203,90,173,125,87,143,79,67,84,66,199,182,25,15,
+    142,65,206,137,221,157,19,188,194,0,92,179,163,247,122,163,
+    205,23,136,103,97,219,161,78,21,161,106,86,254,4,108,95,
+    195,221,25,14,163,158,129,89,111,90,197,47,188,254,14,133,
+    196,111,148,5,205,144,221,142,216,166,149,114,134,102,33,122,
+    28,214,200,132,23,242,237,248,189,17,18,174,139,192,108,199,
+    182,95,123,246,76,41,68,244,8,120,207,200,150,199,178,231,
+    222,119,42,40,236,77,227,154,124,0,178,255,201,195,143,20,
+    138,128,132,186,89,88,115,184,27,218,126,121,127,145,139,185,
+    201,94,68,173,93,249,126,250,214,172,157,136,98,122,17,200,
+    119,111,61,62,181,82,235,32,162,182,157,127,80,234,160,90,
+    128,168,155,79,34,151,9,143,173,96,237,31,143,173,153,211,
+    42,253,112,184,67,26,162,71,99,141,191,151,37,143,92,122,
+    34,12,81,122,119,230,237,114,63,94,204,185,13,218,55,100,
+    194,242,203,131,166,167,34,222,227,27,38,227,104,181,29,136,
+    194,241,240,151,4,177,11,46,248,223,40,81,63,128,104,185,
+    126,251,113,75,41,165,54,179,85,223,116,33,219,158,93,63,
+    250,66,160,62,27,81,157,35,54,233,246,90,110,67,20,120,
+    88,38,246,62,120,235,169,86,229,235,246,120,200,150,133,5,
+    107,194,119,185,166,32,222,245,219,157,95,230,255,140,67,212,
+    238,246,5,103,62,95,135,20,127,183,115,225,140,252,41,112,
+    179,248,114,88,247,167,183,71,89,251,199,98,251,179,31,189,
+    51,30,246,114,23,226,25,221,78,181,252,181,28,186,168,228,
+    230,107,231,4,103,133,32,122,40,182,129,233,12,144,45,126,
+    202,59,62,230,251,38,115,253,12,114,56,230,233,36,91,189,
+    201,48,56,69,60,187,156,81,151,150,139,232,41,253,246,143,
+    193,117,27,247,187,75,166,189,218,137,232,97,248,151,248,226,
+    139,135,181,50,130,16,61,16,235,77,93,153,233,47,230,15,
+    238,94,179,90,62,28,245,129,59,170,61,54,68,221,16,136,
+    65,244,72,92,122,254,149,201,147,40,27,200,219,137,55,204,
+    231,230,228,28,97,109,38,94,102,250,101,42,231,5,112,208,
+    111,9,229,117,205,155,3,217,40,92,44,123,243,38,173,11,
+    34,104,39,61,226,228,161,146,4,68,157,188,144,42,166,144,
+    16,137,168,241,115,235,222,150,174,2,79,218,237,13,141,243,
+    127,157,141,232,9,253,54,143,194,117,117,26,195,199,59,63,
+    4,55,50,185,186,7,241,174,220,137,81,46,114,15,64,52,
+    201,169,223,71,213,233,2,53,144,109,210,244,70,49,241,118,
+    60,116,202,242,146,171,38,235,182,35,154,140,43,187,157,230,
+    158,28,41,4,185,58,164,95,46,110,15,143,233,231,32,151,
+    137,202,78,206,143,254,136,198,113,160,222,76,91,164,244,185,
+    41,9,252,209,126,249,246,216,13,16,62,73,233,11,21,123,
+    151,71,32,90,29,191,255,46,222,247,148,119,54,157,137,10,
+    35,23,103,59,143,25,136,146,17,53,34,107,221,192,112,75,
+    112,104,146,239,163,158,58,190,47,162,110,8,55,156,140,30,
+    149,201,13,45,224,6,179,53,167,174,181,29,140,229,70,182,
+    112,68,49,35,27,168,189,119,216,106,232,157,209,16,103,212,
+    121,62,60,101,102,46,235,239,225,88,183,211,133,235,26,201,
+    107,160,144,169,252,170,246,69,187,193,241,213,35,110,251,26,
+    60,246,65,84,189,122,146,252,244,68,72,239,139,139,94,189,
+    172,25,13,102,87,166,13,184,243,75,12,116,100,102,40,95,
+    120,149,28,134,120,76,247,5,245,95,191,91,164,143,206,131,
+    20,98,124,151,201,234,192,89,79,221,126,57,200,150,26,8,
+    35,252,153,179,90,65,159,222,131,131,243,30,234,143,62,224,
+    227,13,51,149,103,201,4,209,90,232,198,39,231,241,143,175,
+    80,6,209,231,94,246,190,240,40,141,70,60,190,125,241,167,
+    208,3,33,136,87,113,191,14,181,151,192,160,167,137,221,51,
+    189,223,71,36,243,172,230,218,47,209,83,132,20,211,221,247,
+    250,135,71,10,200,30,213,165,124,126,216,115,26,90,84,26,
+    181,97,11,111,55,162,87,96,103,62,194,26,77,163,16,5,
+    227,86,220,228,64,136,185,54,126,204,12,109,209,136,58,109,
+    234,114,253,117,236,46,214,110,210,63,142,53,100,124,252,178,
+    22,108,146,92,89,187,223,36,37,153,107,165,59,162,180,131,
+    78,165,12,26,156,202,77,72,224,9,102,104,12,231,6,75,
+    95,196,118,191,237,136,138,11,172,63,180,40,32,28,209,51,
+    250,109,151,197,242,153,198,131,238,23,141,146,229,201,70,224,
+    160,14,199,247,182,54,177,46,136,122,149,30,123,226,230,89,
+    120,210,46,160,246,164,126,117,48,55,79,133,114,55,110,136,
+    214,195,246,51,35,78,48,151,211,81,172,253,50,248,221,94,
+    91,12,76,160,201,179,38,111,246,14,240,138,229,108,115,68,
+    212,9,137,47,215,78,153,65,135,212,39,157,121,159,240,124,
+    94,71,0,162,20,158,20,54,43,118,110,65,60,166,219,135,
+    49,239,217,89,115,59,43,27,103,63,37,181,83,163,52,31,
+    193,76,97,128,127,193,196,217,82,186,207,14,81,7,188,249,
+    214,59,175,65,103,12,63,250,242,222,214,64,15,86,65,194,
+    97,107,126,176,191,35,226,49,163,93,48,215,85,104,196,99,
+    70,154,112,86,246,96,50,154,236,122,214,57,180,2,28,39,
+    3,8,37,81,20,134,220,232,178,21,185,223,197,108,16,79,
+    68,206,236,236,157,111,96,215,106,92,48,203,87,229,134,247,
+    81,47,68,61,202,253,188,113,241,26,91,14,140,4,130,254,
+    96,9,185,177,155,60,16,79,40,248,68,64,103,65,24,43,
+    127,16,174,182,221,109,182,211,142,123,208,67,174,188,90,7,
+    221,39,8,81,23,154,94,117,73,93,180,66,60,12,160,156,
+    79,111,67,60,70,144,51,55,18,122,2,22,42,95,152,253,
+    173,197,146,109,17,211,80,123,196,78,162,65,172,124,60,111,
+    82,1,75,51,134,201,239,7,179,193,67,115,63,116,129,53,
+    87,23,106,87,232,20,109,64,188,91,206,225,75,167,172,133,
+    39,131,67,252,102,232,123,131,71,158,103,204,124,139,84,93,
+    33,111,175,142,207,115,92,101,134,232,13,164,239,239,206,30,
+    26,180,197,154,235,133,254,172,124,41,44,255,253,62,161,70,
+    25,85,144,223,173,70,133,92,83,9,224,226,186,142,181,237,
+    87,152,152,232,16,13,123,78,173,19,226,217,79,84,23,78,
+    18,214,227,134,115,112,203,97,169,78,183,33,165,160,109,113,
+    127,78,18,76,49,46,121,84,209,142,109,224,128,43,111,210,
+    87,175,147,242,67,60,61,43,213,164,212,238,53,136,199,52,
+    25,58,237,151,151,210,95,82,55,218,33,94,228,170,232,177,
+    27,111,109,70,212,78,255,0,245,245,187,151,113,241,133,4,
+    222,59,196,75,183,197,215,4,81,76,47,240,98,237,199,243,
+    3,109,132,21,37,95,104,188,123,50,223,155,27,223,245,56,
+    33,208,113,219,77,11,206,183,46,219,204,245,41,45,196,227,
+    16,61,219,167,64,53,19,95,99,68,111,238,183,31,51,3,
+    234,214,195,214,238,85,159,66,16,21,178,228,227,227,210,153,
+    158,136,246,252,203,157,208,113,51,143,109,81,95,60,10,162,
+    72,227,122,52,73,78,162,197,134,235,89,70,136,54,237,151,
+    41,142,43,51,131,92,16,171,139,84,36,119,78,253,63,201,
+    133,194,101,25,92,170,143,40,198,193,14,108,187,241,133,186,
+    244,117,78,208,3,223,64,86,62,169,99,250,87,163,76,254,
+    176,137,92,216,28,212,227,134,66,43,86,150,40,150,245,92,
+    169,69,99,92,50,116,217,66,185,39,198,95,93,172,216,202,
+    110,248,157,230,183,58,191,230,12,227,255,144,215,144,107,112,
+    224,234,197,85,92,47,177,96,228,145,11,213,56,171,52,250,
+    194,82,95,46,149,180,153,202,60,102,248,49,64,116,196,191,
+    182,149,188,60,37,110,178,91,191,83,135,155,141,88,121,124,
+    204,251,72,255,252,183,242,255,245,194,198,121,13,91,95,136,
+    115,230,255,90,159,132,152,169,59,160,255,231,63,211,173,194,
+    234,22,252,39,106,255,186,68,226,11,206,21,234,138,98,210,
+    146,33,27,128,11,82,131,171,6,44,95,87,135,40,89,89,
+    167,49,219,242,97,242,190,18,172,153,171,230,116,22,56,212,
+    135,196,151,251,124,0,252,74,184,21,184,164,86,1,27,81,
+    136,253,224,49,224,46,192,45,232,87,187,220,244,161,250,246,
+    56,20,175,238,5,36,68,213,43,188,209,238,6,112,40,162,
+    131,244,255,135,177,74,117,123,111,195,187,221,209,163,163,38,
+    87,30,135,217,211,99,194,100,201,12,152,252,228,117,117,7,
+    47,47,1,173,29,251,120,171,199,180,0,72,101,102,79,224,
+    130,71,74,113,100,129,232,20,141,251,149,121,100,13,104,53,
+    252,54,196,52,113,19,216,49,220,233,217,184,14,221,58,86,
+    7,25,131,169,236,232,162,243,251,161,126,162,244,227,238,193,
+    187,161,116,129,27,101,29,144,2,72,193,253,193,196,95,54,
+    250,192,5,227,229,237,222,90,44,3,16,237,107,114,109,171,
+    162,55,160,245,66,231,58,137,51,78,0,52,179,15,169,119,
+    57,214,0,187,171,13,31,240,174,235,46,128,241,158,250,173,
+    233,243,199,214,178,58,240,252,68,93,216,83,233,167,189,17,
+    128,174,230,217,119,79,78,45,132,210,215,123,246,187,229,158,
+    3,56,17,154,226,80,127,65,30,184,160,251,201,239,199,116,
+    67,1,72,3,18,7,220,8,56,127,104,203,70,161,141,138,
+    0,75,60,47,103,245,13,207,1,46,104,54,114,163,56,109,
+    12,244,232,242,16,129,177,65,159,107,88,29,4,223,84,121,
+    101,138,180,141,3,124,12,76,230,205,148,175,101,136,183,89,
+    161,93,253,183,47,160,153,105,214,77,203,6,104,67,203,70,
+    232,77,57,228,27,13,222,63,81,115,137,170,216,6,46,210,
+    31,191,186,113,176,37,128,207,97,215,51,34,230,221,4,239,
+    69,168,63,191,157,88,14,20,233,156,191,168,244,207,161,156,
+    14,130,43,55,217,165,23,181,143,206,5,120,240,75,244,77,
+    203,101,104,172,87,237,204,41,243,229,99,192,162,108,170,91,
+    127,62,112,193,70,3,167,159,179,4,161,76,106,83,154,215,
+    180,50,112,81,173,202,82,155,56,49,64,247,59,182,235,67,
+    49,96,144,103,182,239,95,24,22,10,110,220,62,34,68,196,
+    233,210,113,86,7,230,34,212,212,59,63,179,35,250,0,220,
+    134,213,148,172,79,189,13,129,185,119,68,237,204,108,229,40,
+    142,125,128,247,202,175,142,254,52,36,17,204,31,179,111,19,
+    208,251,116,240,76,123,146,135,69,15,228,222,78,156,86,93,
+    224,162,181,239,183,233,152,22,65,204,70,222,184,246,121,162,
+    123,53,171,3,243,65,202,48,252,250,205,124,63,48,173,241,
+    163,254,133,141,60,48,100,147,99,235,212,215,11,96,38,238,
+    94,253,204,75,169,21,82,46,0,24,143,248,17,176,227,182,
+    230,204,172,69,147,193,69,73,47,174,92,155,189,29,128,99,
+    129,201,122,141,198,15,224,34,183,152,232,139,69,91,33,174,
+    178,15,196,54,12,55,168,98,117,96,254,79,13,99,168,2,
+    32,168,55,161,114,29,117,80,232,107,223,156,101,254,85,48,
+    27,123,62,239,206,185,189,14,210,113,94,80,174,220,200,10,
+    0,183,247,31,47,105,153,184,0,128,171,83,241,169,113,79,
+    171,32,191,125,71,238,250,181,105,32,88,166,116,74,248,144,
+    70,10,228,197,246,173,111,95,110,59,89,193,234,32,235,49,
+    101,117,1,135,151,187,1,168,212,241,81,79,249,212,156,143,
+    104,93,252,56,120,31,114,53,61,4,209,9,59,161,137,231,
+    65,200,109,109,141,163,254,175,192,244,216,214,205,79,39,223,
+    0,128,39,69,22,74,192,170,142,211,7,46,69,102,64,186,
+    25,70,74,175,62,186,251,24,43,127,26,22,228,252,192,194,
+    122,114,21,52,253,73,95,116,156,232,52,8,234,214,233,9,
+    231,149,227,67,17,197,91,107,105,246,217,10,162,147,161,34,
+    178,53,219,16,66,176,116,200,134,130,56,63,48,253,185,212,
+    197,113,238,189,144,219,50,13,131,236,238,60,1,209,95,11,
+    67,97,170,131,220,164,59,90,104,106,74,57,171,99,38,214,
+    97,251,48,255,186,232,94,200,142,49,250,230,99,236,148,192,
+    225,120,141,169,224,64,48,162,214,91,142,221,147,85,4,54,
+    134,46,120,92,177,188,15,220,19,174,73,221,57,248,10,186,
+    230,240,239,155,71,141,169,197,72,189,231,83,181,242,60,16,
+    157,82,31,111,82,26,149,7,68,193,42,198,89,175,162,140,
+    213,161,140,117,152,104,8,155,29,88,15,245,141,36,55,125,
+    148,43,0,162,220,230,227,190,210,54,2,224,9,131,106,192,
+    198,79,251,231,161,95,119,32,131,34,120,237,13,138,151,1,
+    145,70,78,199,241,1,84,124,75,249,201,247,242,118,104,189,
+    150,110,184,200,28,7,184,129,225,205,196,39,249,8,171,67,
+    21,235,240,109,56,190,114,175,52,212,63,59,40,91,45,191,
+    10,28,98,209,147,127,116,194,13,127,160,207,53,63,123,175,
+    198,67,183,187,101,48,39,123,107,6,132,193,52,121,110,77,
+    233,44,0,243,87,148,236,121,174,46,128,140,151,156,57,189,
+    181,41,125,31,226,121,219,14,126,99,39,2,156,209,178,83,
+    237,1,90,93,194,234,152,139,117,48,235,102,80,63,57,254,
+    247,226,252,101,16,24,32,0,119,190,70,249,33,10,99,250,
+    229,243,193,180,146,163,101,3,155,109,33,12,17,238,153,26,
+    139,59,128,219,173,49,170,42,73,233,133,220,222,131,161,129,
+    124,22,162,102,126,154,41,254,60,4,92,221,21,253,196,240,
+    68,119,17,171,99,30,190,44,194,138,126,26,78,93,113,110,
+    34,4,165,232,247,145,111,239,211,129,135,29,128,32,217,119,
+    65,21,198,62,200,32,134,82,66,8,204,47,191,95,94,40,
+    3,242,245,106,82,116,60,38,129,85,227,118,90,76,221,155,
+    13,253,107,112,111,224,156,105,26,7,89,249,11,177,232,15,
+    73,38,222,147,211,161,254,170,248,43,229,241,11,192,97,69,
+    94,43,167,77,52,247,65,180,22,126,127,168,44,56,141,87,
+    15,238,255,242,252,186,111,148,6,184,63,86,122,184,209,157,
+    62,32,28,42,90,210,79,206,215,66,243,231,13,212,117,252,
+    52,8,92,220,178,97,86,249,229,21,249,172,252,37,100,60,
+    199,196,34,59,9,209,73,196,99,197,145,74,31,191,3,112,
+    22,7,160,184,123,203,94,110,228,6,183,76,217,225,232,240,
+    35,5,134,46,241,178,94,225,243,70,208,47,153,181,26,80,
+    45,115,228,112,250,19,39,48,109,246,79,253,181,123,109,247,
+    177,242,17,150,56,209,247,96,83,64,34,20,90,114,110,215,
+    112,229,18,112,244,207,250,115,94,239,158,2,194,95,114,118,
+    170,214,182,60,48,75,79,251,230,249,125,190,96,186,226,46,
+    147,197,13,205,16,222,198,251,14,95,87,47,8,227,86,40,
+    64,189,228,182,232,5,91,123,32,149,145,219,217,224,10,219,
+    12,86,199,50,172,227,254,143,68,224,191,208,131,54,222,89,
+    51,200,113,104,10,183,30,5,224,92,241,134,252,221,182,185,
+    208,229,35,200,122,43,152,255,118,79,64,73,217,114,24,30,
+    215,191,21,113,140,82,0,68,200,44,185,192,147,230,236,83,
+    87,132,251,64,89,91,241,201,71,155,139,118,177,58,86,98,
+    29,125,243,241,130,13,188,235,142,43,147,68,11,33,32,10,
+    158,201,133,131,173,60,96,236,81,93,168,183,41,7,186,11,
+    179,46,4,20,245,42,255,245,183,204,231,17,16,217,82,103,
+    93,157,69,0,210,83,49,164,96,150,46,64,209,212,229,102,
+    6,133,251,83,88,249,171,176,252,48,135,66,221,105,47,161,
+    233,193,171,190,182,63,201,77,68,60,6,60,1,211,176,138,
+    109,145,183,25,9,173,18,58,190,93,230,135,112,24,183,128,
+    8,238,201,157,219,60,117,242,94,224,228,43,190,142,208,178,
+    155,2,65,143,10,114,104,63,252,26,202,116,154,110,181,25,
+    222,22,199,234,48,36,216,176,71,87,73,214,0,244,155,15,
+    152,118,108,107,80,2,226,49,235,47,20,88,52,173,92,224,
+    160,20,166,203,103,100,87,197,89,1,166,53,198,53,132,222,
+    6,252,170,90,3,36,228,103,174,242,218,169,146,219,32,205,
+    52,204,162,68,109,3,184,245,181,237,172,252,181,184,244,91,
+    9,217,135,143,133,128,228,157,88,222,96,219,92,29,205,209,
+    69,32,2,96,147,177,161,46,52,47,36,208,165,49,172,18,
+    224,125,231,188,163,175,142,12,135,238,158,59,234,130,152,111,
+    31,216,208,229,96,56,179,71,14,2,178,111,89,89,115,229,
+    4,111,68,155,245,99,168,245,216,127,75,100,103,175,230,197,
+    71,32,58,3,107,27,85,114,227,119,73,146,37,204,88,126,
+    219,183,148,110,129,14,37,70,8,22,128,249,144,82,253,196,
+    166,91,160,132,30,254,185,170,193,26,248,39,179,64,6,102,
+    111,27,174,159,26,172,8,81,147,221,191,184,254,215,235,96,
+    214,254,141,88,162,128,123,184,240,197,100,200,236,250,146,231,
+    55,13,230,4,115,254,89,143,168,151,195,107,101,195,95,65,
+    251,203,108,162,47,13,213,2,34,195,56,26,4,169,37,78,
+    25,97,183,217,10,81,249,153,59,143,52,220,134,96,140,126,
+    250,70,75,252,10,197,241,172,0,86,199,38,172,99,133,106,
+    87,107,96,52,196,103,234,204,247,97,21,211,96,40,242,40,
+    95,160,50,89,9,24,17,193,47,230,96,81,26,46,237,142,
+    75,135,118,76,95,61,161,219,20,64,129,129,97,196,130,2,
+    79,142,22,130,182,67,154,142,212,237,197,62,172,108,91,92,
+    154,33,51,96,228,174,6,165,156,85,115,192,146,37,179,144,
+    199,30,37,99,196,59,233,94,109,100,153,4,218,62,69,172,
+    246,234,85,0,143,212,230,239,30,114,228,48,24,217,153,240,
+    217,127,226,56,35,152,145,48,59,77,129,96,219,189,207,58,
+    175,39,98,6,244,183,28,175,116,208,172,14,71,130,99,111,
+    105,151,101,173,13,69,188,93,37,230,125,7,203,225,93,56,
+    126,124,48,92,190,165,252,137,23,55,68,2,71,99,130,8,
+    100,179,69,252,167,193,105,55,32,107,129,237,137,34,81,90,
+    192,58,167,168,55,206,92,118,108,37,55,207,122,178,242,157,
+    177,160,107,197,57,54,206,250,144,4,18,70,33,19,2,120,
+    224,95,134,103,66,253,164,128,113,158,87,68,129,7,102,42,
+    156,227,91,157,2,14,124,172,224,81,72,82,242,58,68,197,
+    221,213,61,94,155,173,10,48,164,236,93,131,214,50,123,142,
+    103,46,71,44,83,113,97,117,120,224,11,73,237,170,93,245,
+    107,122,95,65,32,197,143,90,181,121,152,171,67,175,32,75,
+    246,160,209,115,231,139,100,39,87,11,142,236,171,51,156,135,
+    93,145,133,132,235,43,126,127,199,208,86,147,91,91,113,96,
+    101,251,16,204,151,55,56,237,88,94,16,224,107,187,73,67,
+    142,190,166,16,29,43,208,191,146,226,132,232,189,255,66,16,
+    40,102,65,208,28,241,94,77,234,137,217,255,91,3,209,233,
+    253,57,239,143,11,168,242,223,21,246,228,66,226,62,113,241,
+    178,11,60,111,203,146,183,3,248,93,210,145,62,213,145,147,
+    214,254,201,231,112,48,120,55,27,36,12,14,249,44,230,146,
+    125,51,107,95,16,174,227,228,22,85,62,90,31,186,221,254,
+    37,51,155,51,95,112,252,144,104,245,254,27,6,147,143,5,
+    50,12,124,45,43,103,27,150,179,112,200,78,17,131,14,152,
+    233,94,8,187,210,95,11,88,146,74,41,118,63,212,93,241,
+    21,58,76,250,243,215,170,125,135,244,255,11,215,92,136,104,
+    191,254,118,18,158,169,149,211,251,82,219,220,27,241,172,14,
+    165,166,93,123,168,197,202,147,50,167,229,18,158,172,128,188,
+    253,112,80,65,238,146,246,191,203,35,246,49,36,52,146,187,
+    176,83,173,211,127,148,253,191,121,34,169,31,141,235,11,198,
+    214,5,202,141,50,252,223,235,199,246,215,143,233,255,249,207,
+    120,230,68,214,183,113,255,160,234,31,23,108,54,195,51,253,
+    179,243,39,157,236,3,242,82,104,216,178,180,226,100,45,204,
+    156,211,15,135,22,126,0,24,32,153,110,214,42,229,113,26,
+    241,124,141,227,94,143,92,15,196,34,88,91,97,110,68,98,
+    37,226,37,190,157,0,243,52,160,193,23,87,231,137,168,46,
+    174,68,244,97,44,172,124,220,142,86,165,48,224,102,68,62,
+    225,152,181,122,126,247,31,164,0,224,255,189,123,250,154,207,
+    105,192,49,133,23,225,45,59,152,16,91,237,19,3,99,181,
+    129,99,94,186,240,162,179,205,24,192,174,234,139,50,197,174,
+    237,192,146,182,164,190,9,70,243,128,129,124,182,146,233,115,
+    87,4,243,170,248,226,29,142,239,129,120,8,137,85,121,139,
+    60,172,97,117,16,142,217,224,24,38,89,225,0,245,157,200,
+    230,23,148,182,117,220,127,121,234,45,152,158,162,44,139,41,
+    173,169,192,49,165,139,243,253,247,84,3,216,237,109,242,59,
+    81,177,2,144,255,154,24,57,183,111,171,0,69,225,221,194,
+    89,254,192,123,152,69,53,208,177,67,110,94,70,244,211,19,
+    172,14,194,49,245,119,173,109,122,163,8,245,205,199,45,186,
+    51,106,36,148,94,90,43,51,92,206,19,102,248,234,75,185,
+    67,151,137,1,199,252,102,127,209,195,71,0,184,68,197,32,
+    157,245,252,183,128,154,145,249,165,104,183,207,0,89,218,143,
+    212,255,56,108,9,28,211,49,58,177,34,84,13,108,117,156,
+    163,61,121,224,44,78,7,225,152,71,46,201,222,187,212,154,
+    135,232,29,248,151,230,67,231,123,163,158,0,2,57,217,33,
+    245,43,84,5,90,181,227,147,180,129,219,48,0,186,249,138,
+    201,135,158,139,129,123,222,216,102,242,55,41,237,1,236,214,
+    84,61,59,119,4,120,110,163,194,136,236,250,39,208,188,220,
+    95,149,47,46,91,31,103,229,19,126,201,236,3,0,246,189,
+    59,91,198,61,103,27,48,152,140,243,219,29,239,159,134,25,
+    94,190,237,242,192,208,49,192,47,7,244,172,46,150,117,216,
+    207,205,128,128,232,204,98,30,73,45,232,0,184,242,56,120,
+    82,45,101,5,181,212,10,226,159,153,221,3,238,247,242,193,
+    145,239,150,174,213,172,14,194,47,95,182,106,41,150,217,1,
+    144,21,219,52,203,207,49,2,26,154,251,108,97,143,243,73,
+    152,110,31,108,146,12,116,151,2,207,189,186,70,5,140,127,
+    148,195,236,134,48,91,23,250,47,149,227,42,21,192,245,91,
+    165,212,39,122,55,129,159,173,151,137,196,140,88,81,197,202,
+    38,188,242,146,234,79,217,247,247,192,36,50,241,228,64,35,
+    115,166,63,81,147,205,131,25,248,17,94,173,203,129,52,195,
+    235,23,231,74,1,132,143,157,50,186,160,99,26,96,236,157,
+    221,50,206,209,166,144,207,90,205,33,2,107,179,128,87,118,
+    181,25,171,220,124,2,113,186,54,223,67,236,213,238,74,86,
+    7,230,149,116,50,86,36,185,188,235,227,167,96,48,34,67,
+    213,67,83,127,61,204,190,47,52,7,87,187,142,4,78,153,
+    170,164,123,223,224,204,94,110,155,16,64,236,77,15,33,13,
+    180,3,224,214,124,139,65,31,141,31,130,91,66,44,199,76,
+    191,244,13,72,15,228,151,94,224,200,10,86,62,225,148,74,
+    185,113,229,79,249,0,226,253,165,146,127,206,76,3,108,77,
+    86,49,179,221,240,98,8,248,86,253,86,107,186,203,18,128,
+    171,100,133,217,161,107,102,183,83,76,50,162,201,58,127,139,
+    95,232,154,136,95,144,86,195,99,247,237,214,149,62,198,202,
+    197,92,146,198,135,48,40,102,213,121,63,162,3,240,175,200,
+    187,17,192,255,113,183,130,249,80,198,25,64,109,184,104,150,
+    122,114,124,50,226,117,235,227,211,3,128,128,45,182,240,230,
+    74,86,129,169,70,218,123,108,30,73,131,236,181,193,193,203,
+    124,219,203,88,217,152,67,210,179,177,52,211,171,2,198,23,
+    19,193,177,231,191,53,31,211,227,195,12,243,14,143,1,1,
+    224,165,49,179,196,2,139,92,33,67,186,84,221,156,115,191,
+    237,64,116,60,174,225,88,127,65,126,101,14,164,43,179,215,
+    6,228,73,172,98,159,69,136,79,41,43,155,112,199,129,185,
+    35,55,168,94,6,55,26,173,156,190,99,150,48,56,182,40,
+    97,216,181,243,247,1,122,200,158,63,144,56,233,30,54,201,
+    246,254,103,95,125,40,243,56,211,27,242,27,163,206,176,76,
+    139,227,247,160,111,68,158,142,155,184,104,47,136,102,246,220,
+    224,166,53,107,228,206,93,113,37,172,14,194,29,117,237,229,
+    237,55,204,129,12,56,187,10,115,16,232,142,165,133,97,85,
+    191,5,97,54,90,97,60,47,112,158,38,216,40,109,122,233,
+    236,173,26,128,216,26,184,218,78,92,173,116,78,200,209,137,
+    11,161,151,29,235,251,118,124,115,49,220,204,172,145,239,57,
+    39,112,152,149,141,57,35,139,88,33,250,99,78,186,233,5,
+    148,66,190,69,203,103,175,30,87,2,96,82,236,93,9,157,
+    215,11,93,201,135,116,74,24,241,214,222,111,251,97,42,23,
+    143,232,117,100,174,18,113,17,155,244,121,47,119,240,2,250,
+    140,250,146,200,247,119,107,14,177,242,49,95,164,188,62,217,
+    237,234,139,133,186,102,245,69,5,70,154,224,228,216,153,119,
+    46,44,62,231,197,109,18,67,53,102,89,23,56,211,210,150,
+    137,11,26,164,99,185,109,93,32,20,207,211,235,71,166,78,
+    5,171,110,46,200,15,186,55,15,70,187,201,131,30,104,214,
+    182,22,176,58,8,103,124,177,222,43,108,115,18,112,165,230,
+    154,5,103,109,242,193,81,41,178,117,199,79,108,4,176,54,
+    7,191,183,81,59,39,242,160,2,220,110,72,216,37,184,93,
+    116,208,22,254,192,227,208,239,110,29,120,246,59,169,8,154,
+    239,33,153,246,106,192,38,200,177,67,187,239,235,189,84,206,
+    99,229,19,206,120,111,180,222,155,149,85,96,159,62,175,161,
+    82,120,20,200,207,111,170,120,43,47,9,124,107,153,152,213,
+    249,188,19,25,136,90,46,224,209,253,192,11,232,238,161,235,
+    55,192,212,104,68,91,225,250,51,200,224,80,250,101,204,155,
+    26,168,134,59,187,140,75,54,43,155,240,197,7,74,97,182,
+    246,87,33,229,150,226,95,218,239,76,207,45,189,229,206,49,
+    138,52,196,187,185,182,34,59,242,14,152,156,158,92,80,16,
+    147,23,133,104,107,129,254,35,5,224,41,215,159,31,247,207,
+    67,73,136,55,83,42,245,238,253,15,123,88,217,132,39,62,
+    26,36,157,176,230,126,60,226,49,199,95,146,184,145,11,32,
+    47,9,237,81,232,198,184,101,227,76,64,254,88,210,2,24,
+    230,46,248,217,222,75,200,11,102,119,180,152,57,37,158,195,
+    255,41,172,124,194,17,245,209,211,238,123,170,208,230,143,143,
+    150,173,87,48,6,14,39,59,180,185,103,214,145,173,0,71,
+    79,188,82,55,53,217,137,104,29,156,100,213,49,167,141,207,
+    249,194,48,116,70,46,78,194,249,171,47,162,171,113,125,230,
+    164,73,20,119,136,37,129,149,77,248,225,126,193,79,142,205,
+    193,208,220,50,252,43,127,208,140,71,189,169,0,115,249,211,
+    31,91,81,203,161,37,130,195,38,233,191,48,15,229,154,4,
+    0,122,87,202,170,135,95,135,2,9,96,92,26,204,237,125,
+    133,113,135,63,98,88,249,132,27,166,123,188,156,53,190,125,
+    59,199,89,226,184,221,73,27,68,81,181,247,117,67,54,64,
+    147,43,131,122,203,141,183,6,34,122,1,174,86,133,171,61,
+    15,179,50,220,87,17,200,65,113,104,137,69,63,30,33,156,
+    144,161,9,144,185,59,173,156,70,21,127,137,68,100,5,159,
+    170,94,147,51,200,126,41,52,245,176,210,135,228,51,186,64,
+    28,96,150,155,237,168,15,93,152,76,147,35,128,152,92,16,
+    149,84,114,250,5,80,149,193,185,52,51,12,50,178,49,31,
+    164,198,102,60,154,90,113,15,218,179,195,112,70,148,166,50,
+    164,111,107,115,128,105,223,147,53,80,133,112,5,80,43,181,
+    171,56,98,141,46,68,248,72,226,177,161,155,34,64,145,69,
+    196,142,176,129,58,192,80,152,179,36,126,28,239,119,70,116,
+    86,191,124,194,7,123,247,104,234,117,183,133,178,123,97,219,
+    241,163,139,66,215,14,90,62,197,139,6,50,79,173,133,19,
+    1,99,230,225,119,164,77,94,246,184,119,2,155,9,197,143,
+    114,251,101,17,222,39,217,173,146,122,199,5,226,19,227,154,
+    160,58,198,30,88,140,250,4,137,31,190,178,90,224,186,184,
+    235,150,29,189,254,136,199,112,22,59,206,50,224,14,91,112,
+    182,48,41,231,12,131,35,217,86,51,70,204,154,205,25,55,
+    54,126,132,251,253,40,19,255,117,98,103,8,179,1,202,160,
+    98,87,252,252,184,204,106,95,181,3,214,156,19,109,217,125,
+    175,52,203,139,207,22,68,57,32,30,67,35,129,139,221,153,
+    255,107,133,67,131,51,43,147,112,61,105,87,129,249,19,150,
+    65,226,120,107,239,254,44,106,189,133,197,228,204,36,13,157,
+    125,215,40,247,25,167,231,111,68,116,38,135,122,169,178,65,
+    120,29,218,134,133,206,105,253,62,192,220,142,182,193,151,90,
+    14,180,82,61,125,249,194,63,163,220,16,197,112,2,115,238,
+    56,136,14,187,199,52,113,2,198,12,235,255,216,193,98,100,
+    17,14,183,128,76,4,100,111,127,51,107,215,143,180,69,86,
+    195,135,66,103,203,197,199,123,54,152,162,63,128,120,20,119,
+    199,110,230,109,98,219,73,56,219,27,71,109,52,218,40,0,
+    241,152,68,176,96,229,49,98,236,17,237,242,175,96,59,164,
+    255,142,234,183,137,112,53,62,62,206,144,3,9,181,153,44,
+    101,152,177,150,159,198,106,25,222,254,247,156,130,229,242,102,
+    172,77,152,167,49,27,182,23,147,85,252,102,77,92,141,254,
+    216,71,100,186,167,238,223,203,233,158,51,229,231,233,97,26,
+    172,28,194,211,118,124,53,186,30,168,2,179,215,234,151,159,
+    148,222,159,92,206,182,141,89,174,55,96,216,251,127,231,52,
+    68,14,225,103,39,164,22,234,95,165,33,109,69,242,149,28,
+    214,46,95,204,202,241,38,123,28,64,158,133,150,189,126,218,
+    184,66,235,223,237,98,155,38,135,232,226,126,121,132,232,120,
+    253,55,189,255,55,199,33,252,108,177,215,96,137,39,63,22,
+    255,239,252,236,175,250,49,255,88,237,95,117,255,63,185,25,
+    81,73,184,89,234,52,249,136,195,183,1,248,15,29,116,250,
+    98,67,16,112,179,210,135,248,128,2,204,132,125,231,103,64,
+    50,3,119,138,252,80,108,183,231,14,0,199,182,241,167,159,
+    106,208,128,101,75,112,253,35,184,62,179,78,12,160,218,84,
+    240,203,146,109,109,128,165,137,108,194,203,100,198,187,142,61,
+    54,28,0,243,227,160,154,174,26,19,224,101,81,149,27,27,
+    237,23,194,212,112,128,135,23,175,64,27,179,255,11,128,57,
+    222,47,76,105,150,37,176,11,38,97,0,9,173,220,55,217,
+    74,237,27,240,133,87,120,229,178,2,64,102,95,178,65,140,
+    209,173,74,86,7,225,101,207,132,22,255,146,20,134,119,113,
+    111,222,10,214,206,174,228,86,11,1,119,226,51,138,97,205,
+    160,245,180,23,89,220,68,84,231,220,21,114,191,164,0,211,
+    143,24,98,49,216,122,10,32,149,143,107,180,45,5,70,3,
+    95,152,46,168,34,49,162,23,236,16,221,23,52,56,125,44,
+    167,131,240,50,41,31,243,167,105,201,128,229,15,215,85,72,
+    138,222,7,134,181,70,223,107,70,100,11,76,237,157,99,125,
+    188,45,19,171,16,149,86,33,229,121,36,1,64,174,150,178,
+    103,87,248,21,64,148,235,55,245,162,111,117,0,4,187,134,
+    120,122,77,31,5,181,78,187,201,140,124,61,6,116,244,110,
+    170,86,125,154,94,193,234,32,188,44,96,35,191,250,129,57,
+    64,154,82,252,203,121,245,213,69,199,98,162,193,7,117,3,
+    167,161,98,240,193,186,153,161,38,230,197,128,61,103,214,109,
+    246,184,49,46,7,81,111,43,172,253,106,63,0,236,114,185,
+    61,160,170,212,17,120,195,189,117,221,179,235,148,160,121,64,
+    92,78,28,123,112,140,149,143,121,25,157,136,197,174,147,113,
+    83,61,44,5,129,116,59,32,120,74,68,54,18,81,211,252,
+    246,119,30,184,8,237,63,33,142,153,31,120,93,220,171,46,
+    253,71,23,160,37,243,68,69,152,159,0,12,142,184,151,232,
+    167,115,9,66,236,86,120,223,209,78,17,200,199,23,245,226,
+    217,250,139,57,249,132,147,229,52,167,23,230,100,2,116,159,
+    36,27,149,230,243,27,26,105,31,176,126,233,230,241,48,221,
+    53,15,126,165,16,85,1,237,255,22,49,92,118,78,109,54,
+    119,80,18,144,205,42,215,103,93,161,49,128,186,73,235,227,
+    32,140,151,63,140,50,118,215,134,88,237,254,166,243,164,192,
+    169,156,213,65,184,25,222,58,120,255,54,131,91,84,133,134,
+    198,3,48,175,49,131,217,86,236,173,102,78,239,75,200,158,
+    162,249,11,101,126,182,65,100,247,143,21,137,141,24,5,230,
+    63,210,113,51,172,157,149,202,29,213,0,203,46,185,15,156,
+    33,103,10,241,108,213,193,91,21,71,89,29,100,207,207,91,
+    169,117,91,78,22,96,204,41,99,3,19,98,190,64,33,99,
+    188,155,184,13,166,87,149,99,223,106,230,155,30,129,84,147,
+    42,241,159,244,1,236,184,214,49,53,192,39,9,68,51,39,
+    108,1,162,42,124,175,254,116,119,27,184,200,127,58,222,213,
+    134,124,88,53,82,116,230,201,248,82,86,7,225,103,19,106,
+    174,13,21,95,140,247,228,140,20,206,159,21,135,92,25,152,
+    183,93,249,105,83,16,162,240,124,151,121,13,124,253,233,100,
+    91,252,79,7,200,30,113,51,231,207,154,51,64,180,173,126,
+    242,193,64,85,64,233,18,107,167,249,206,29,84,200,237,113,
+    0,189,27,211,223,167,201,158,223,250,55,153,41,247,70,66,
+    102,44,125,159,61,107,66,213,62,196,59,239,234,250,52,160,
+    24,96,203,54,53,21,171,216,22,240,220,206,73,248,184,55,
+    216,80,248,80,22,200,63,116,73,171,162,190,173,1,207,1,
+    82,5,118,216,149,63,51,197,167,84,147,74,82,173,156,128,
+    184,76,235,206,127,25,158,92,204,182,129,240,181,4,172,200,
+    124,195,195,97,201,9,224,108,163,41,110,114,23,52,97,150,
+    153,178,78,123,210,254,245,224,53,15,188,115,85,11,145,173,
+    160,110,57,56,203,2,176,15,120,30,248,208,32,10,250,140,
+    236,15,97,227,29,51,65,108,116,202,135,95,200,40,151,91,
+    119,47,98,229,19,206,118,69,115,159,213,153,79,224,90,57,
+    115,1,19,209,65,25,136,151,147,53,31,250,47,96,199,243,
+    107,122,95,141,21,2,175,57,231,223,210,25,229,9,101,240,
+    137,177,154,117,208,229,47,154,126,151,160,78,64,191,177,169,
+    255,25,38,38,10,162,61,175,122,30,242,46,135,188,110,221,
+    183,65,54,247,224,65,86,7,225,108,161,197,251,23,200,21,
+    131,107,141,50,69,87,126,16,128,160,127,5,14,240,212,15,
+    0,217,209,12,153,246,241,145,80,63,38,54,203,228,170,0,
+    148,105,47,75,63,40,238,1,188,202,4,87,53,116,60,85,
+    250,177,13,82,249,168,82,173,114,95,7,220,24,53,223,121,
+    52,208,166,144,149,79,246,250,152,243,235,16,49,181,226,60,
+    233,115,162,16,144,192,190,246,131,232,7,192,148,7,1,99,
+    178,198,97,186,167,101,159,58,165,93,16,220,127,119,196,178,
+    155,63,126,227,189,50,199,125,150,38,19,240,81,188,59,237,
+    29,146,187,128,187,109,180,158,92,245,220,18,220,156,243,62,
+    196,179,88,239,0,171,131,112,183,226,97,139,71,199,124,79,
+    68,180,26,254,53,140,236,136,121,0,103,154,83,93,56,168,
+    55,19,241,54,81,203,127,237,213,2,247,63,95,246,220,186,
+    113,70,12,119,198,35,2,209,228,12,210,207,188,189,74,247,
+    135,101,112,64,46,151,149,77,56,91,59,62,73,119,23,234,
+    134,238,56,185,85,226,27,56,225,105,232,57,33,33,113,224,
+    62,163,93,205,100,31,136,129,109,228,228,200,9,200,154,111,
+    142,89,99,238,14,5,215,195,88,4,118,2,240,253,12,115,
+    251,208,238,100,230,184,52,229,154,228,149,229,113,52,155,149,
+    79,56,219,154,207,105,244,153,86,8,219,199,2,3,231,45,
+    66,41,220,137,39,23,152,141,6,79,205,162,163,210,17,125,
+    140,76,174,241,94,205,183,61,1,153,171,91,180,236,76,162,
+    161,191,71,5,55,85,110,248,4,140,32,9,35,104,19,240,
+    49,179,155,144,206,202,39,188,205,224,151,210,182,47,73,96,
+    155,235,53,185,246,231,10,64,192,24,84,229,4,84,30,25,
+    101,204,201,132,244,239,24,114,184,185,59,28,204,110,14,211,
+    186,115,200,12,134,68,51,215,5,245,11,12,183,65,212,218,
+    215,5,186,206,7,150,152,130,133,53,14,197,167,1,82,89,
+    249,132,187,233,16,116,13,33,179,191,110,165,127,69,12,200,
+    167,8,89,35,3,158,160,145,94,172,219,19,13,17,127,97,
+    245,41,44,224,10,30,105,247,244,68,110,218,6,195,225,156,
+    44,129,134,94,30,244,245,22,159,162,131,147,241,182,216,84,
+    105,188,27,26,197,30,26,37,242,9,119,91,85,111,114,101,
+    79,32,216,102,52,125,244,214,109,20,62,106,178,168,210,42,
+    111,176,35,48,162,107,179,183,171,40,64,234,27,155,229,133,
+    155,207,135,108,177,105,239,52,24,122,124,27,123,172,238,25,
+    239,172,216,81,171,64,102,187,138,186,84,95,104,119,83,45,
+    154,181,157,112,55,57,79,245,171,235,210,161,30,120,79,126,
+    85,123,28,226,49,243,238,38,208,214,99,120,151,18,131,176,
+    95,197,95,118,204,134,145,175,74,125,209,114,207,203,96,178,
+    143,198,18,253,20,25,200,175,233,248,148,176,134,47,226,85,
+    45,13,108,8,233,2,138,36,169,147,162,119,236,64,56,171,
+    131,240,183,23,254,24,152,65,147,159,74,156,254,53,89,35,
+    6,177,167,176,214,35,42,241,150,253,239,37,120,21,161,49,
+    122,222,158,149,54,48,114,216,73,108,181,235,142,132,27,223,
+    239,90,86,5,198,208,198,240,55,155,47,104,8,122,115,107,
+    15,174,220,25,164,32,86,7,225,114,131,107,35,151,187,191,
+    7,39,14,218,239,173,80,111,186,29,241,146,52,79,149,89,
+    151,235,35,170,192,108,22,127,170,24,52,49,251,194,132,114,
+    122,11,244,186,48,114,194,7,186,183,222,241,218,108,217,33,
+    118,136,58,27,138,183,166,1,66,30,193,92,251,185,3,24,
+    180,234,244,33,186,205,139,213,65,56,221,64,188,133,232,13,
+    25,97,168,124,233,156,122,18,248,184,8,63,142,41,196,27,
+    76,240,152,156,14,185,177,149,155,142,192,61,86,113,154,159,
+    6,43,108,128,233,168,216,97,107,72,42,60,217,23,242,92,
+    43,48,222,18,209,190,253,49,198,124,142,94,46,208,79,178,
+    125,184,13,154,5,136,58,53,65,97,222,27,91,136,31,222,
+    84,161,47,224,11,217,211,18,137,55,191,80,222,176,5,81,
+    244,249,200,219,71,92,86,179,27,115,68,30,225,116,204,249,
+    101,136,217,164,45,215,39,191,18,129,174,170,18,244,192,183,
+    109,180,10,76,123,249,252,110,123,15,240,103,220,20,227,11,
+    10,209,86,144,51,170,102,115,166,23,131,27,152,51,151,0,
+    153,67,175,108,44,11,117,177,69,212,200,129,173,131,180,187,
+    1,154,231,244,203,39,156,142,71,111,207,27,52,3,248,151,
+    159,172,204,175,149,77,96,201,153,232,142,154,29,89,211,17,
+    53,121,224,172,215,191,142,121,48,251,73,148,39,94,177,28,
+    178,137,221,107,90,187,74,181,196,175,166,127,139,112,30,226,
+    117,212,218,106,251,7,109,102,253,76,184,157,144,4,62,165,
+    5,196,221,93,47,160,52,242,45,187,175,68,125,28,62,248,
+    221,162,114,24,20,126,191,184,24,119,212,23,56,212,101,92,
+    133,128,247,83,28,164,101,143,140,109,98,229,145,125,59,99,
+    207,177,254,213,143,2,16,125,177,191,20,195,223,193,234,183,
+    175,204,236,189,53,215,34,42,100,98,215,169,223,201,28,7,
+    169,104,14,60,123,59,73,255,15,118,195,200,243,32,195,208,
+    188,244,49,82,62,48,139,78,191,152,116,41,47,148,101,129,
+    212,6,3,23,141,50,105,7,102,251,136,215,246,226,210,199,
+    72,69,101,244,199,46,14,185,11,238,151,133,249,29,189,21,
+    215,236,196,171,214,106,220,97,74,66,209,207,97,25,140,243,
+    63,104,252,177,157,68,115,41,192,200,32,220,174,5,47,44,
+    200,64,218,76,28,48,40,79,239,134,17,107,143,80,229,178,
+    212,183,60,83,104,227,198,210,161,233,157,43,17,43,79,232,
+    63,200,73,93,191,60,178,15,167,168,208,151,144,171,2,221,
+    35,93,104,105,243,113,155,21,172,188,183,75,45,233,71,211,
+    12,1,111,208,237,191,47,75,44,71,20,42,185,190,251,222,
+    147,103,26,255,46,239,90,191,60,194,243,182,229,87,216,24,
+    58,120,114,59,249,75,88,121,17,139,141,15,45,169,5,90,
+    86,128,75,54,254,171,8,186,63,180,68,14,225,121,3,114,
+    227,199,156,200,112,231,150,226,85,88,57,239,183,116,198,86,
+    127,157,139,232,194,255,20,65,89,141,228,175,124,19,42,2,
+    88,211,160,126,52,117,87,134,205,11,178,23,183,96,254,226,
+    181,33,188,245,255,144,171,145,250,132,235,25,18,32,63,227,
+    255,167,62,190,80,249,83,190,7,239,150,225,253,135,251,254,
+    135,250,255,159,124,143,84,35,124,239,240,241,172,142,172,131,
+    64,147,194,111,22,24,182,44,5,6,230,63,240,228,218,91,
+    17,48,249,30,72,254,22,166,73,193,147,157,105,215,30,202,
+    24,1,77,88,248,101,125,242,143,117,255,194,247,152,69,205,
+    34,238,115,189,50,196,200,38,124,239,174,234,218,119,197,217,
+    0,194,235,112,215,30,2,204,107,29,57,10,8,83,73,205,
+    213,34,213,29,117,39,17,5,72,92,242,102,7,0,80,67,
+    61,173,19,233,115,161,176,71,211,166,144,37,31,115,184,5,
+    101,224,58,19,72,231,4,29,47,85,174,169,205,142,41,101,
+    117,16,190,39,152,247,169,199,33,31,222,125,24,155,250,110,
+    237,43,40,253,100,12,94,21,5,40,176,121,146,238,144,178,
+    48,208,42,240,243,204,182,15,207,0,132,54,103,224,213,43,
+    64,227,34,195,207,237,14,23,2,4,229,213,178,68,167,171,
+    14,184,200,168,117,239,181,95,164,130,29,130,228,208,220,17,
+    86,7,225,123,139,50,12,195,108,240,222,202,177,239,147,164,
+    132,210,202,185,79,188,0,60,201,224,213,176,161,192,247,84,
+    5,76,61,59,135,67,153,91,134,89,158,163,243,1,141,186,
+    219,143,255,182,61,28,159,104,226,107,222,51,41,1,218,43,
+    183,126,79,200,122,97,208,209,55,90,55,194,67,132,211,65,
+    248,222,202,158,179,123,186,91,1,96,50,251,64,165,220,1,
+    9,0,57,183,247,136,155,254,158,128,253,128,143,172,106,0,
+    36,43,199,53,222,13,80,196,205,64,212,193,59,171,23,214,
+    85,3,15,49,78,168,111,168,114,135,230,221,22,146,223,46,
+    119,232,48,43,159,236,195,49,11,89,0,48,93,142,61,164,
+    246,236,5,70,177,39,20,127,62,6,179,241,171,42,183,237,
+    109,238,192,249,92,38,94,209,146,80,3,207,175,24,182,107,
+    193,185,235,96,186,37,62,121,25,1,164,105,205,236,175,115,
+    149,102,67,45,12,81,60,188,129,108,72,227,181,22,89,78,
+    7,230,124,204,97,47,116,233,81,117,100,112,17,151,71,48,
+    19,223,58,119,165,49,211,188,156,59,151,200,126,47,71,53,
+    135,110,85,210,91,6,140,64,160,216,48,251,209,59,168,49,
+    233,225,183,80,231,83,16,39,197,9,83,158,46,27,95,204,
+    202,38,92,47,68,252,176,246,81,81,192,165,190,143,55,166,
+    102,228,30,228,214,5,66,193,245,66,123,222,191,83,131,204,
+    17,191,190,252,96,176,56,68,21,48,137,241,83,113,16,253,
+    91,177,216,64,69,12,96,81,112,203,181,72,235,87,224,250,
+    197,13,205,105,234,87,32,78,227,20,220,140,20,133,138,88,
+    29,132,235,29,73,142,57,83,183,7,64,160,22,76,214,163,
+    232,2,68,219,17,213,100,70,192,103,47,223,75,141,254,174,
+    148,129,104,252,85,43,181,227,254,169,195,149,22,208,79,6,
+    103,90,125,89,55,25,44,162,191,22,12,149,56,8,161,103,
+    64,208,65,86,54,225,120,35,155,36,253,148,119,64,180,116,
+    82,171,163,215,6,1,177,175,199,143,111,88,118,244,154,171,
+    29,230,214,166,129,114,116,157,105,81,247,92,4,4,192,186,
+    226,253,230,132,199,112,243,51,214,250,88,116,66,1,243,129,
+    26,37,189,227,212,145,56,17,78,54,225,119,29,17,46,27,
+    206,40,239,66,244,36,210,163,201,225,125,152,5,164,215,246,
+    12,163,11,193,174,209,243,175,125,191,113,1,116,251,31,215,
+    113,175,73,222,193,29,122,7,36,156,101,222,49,163,246,19,
+    152,108,191,231,142,218,233,11,120,83,107,227,213,164,68,205,
+    2,86,62,57,207,41,243,36,110,195,236,104,112,103,164,227,
+    253,211,114,113,128,242,131,117,18,37,84,210,1,58,88,37,
+    12,207,117,157,7,238,196,231,163,70,96,151,223,198,71,132,
+    167,3,54,93,142,207,214,236,134,62,130,217,233,167,58,16,
+    125,194,102,152,112,178,251,126,68,153,248,55,117,215,158,200,
+    103,117,16,126,199,124,170,2,145,170,124,83,53,79,97,36,
+    224,246,108,252,88,52,119,77,237,199,217,224,173,163,248,87,
+    151,97,104,130,81,26,152,173,53,205,226,228,136,12,232,27,
+    161,241,157,231,74,158,239,227,182,1,129,119,109,221,92,34,
+    156,208,144,199,202,38,188,46,193,243,215,148,97,10,16,169,
+    199,175,11,206,204,124,3,142,200,203,185,59,179,233,45,62,
+    24,117,254,225,246,33,41,96,146,80,224,211,155,81,169,224,
+    237,234,216,169,83,220,195,96,248,56,241,94,105,250,152,123,
+    128,212,229,70,141,75,137,12,129,180,197,31,182,82,194,71,
+    211,22,171,213,231,178,242,49,175,163,43,241,115,133,177,149,
+    221,186,155,241,150,117,197,242,190,134,52,55,68,97,59,246,
+    90,231,32,186,1,191,199,171,53,249,175,192,29,74,159,28,
+    156,14,189,128,126,199,180,13,188,201,176,241,12,238,187,230,
+    28,86,54,225,115,204,246,19,14,217,213,4,131,115,71,193,
+    65,24,70,141,119,5,248,67,14,43,150,67,253,187,78,143,
+    69,171,159,128,91,150,30,119,56,183,65,15,8,2,243,21,
+    35,232,184,114,183,87,104,125,192,78,68,87,96,97,87,69,
+    168,158,47,9,123,89,249,132,211,49,135,101,19,16,115,72,
+    52,175,117,96,102,154,57,240,161,211,9,95,58,63,55,194,
+    8,112,122,238,202,176,187,117,177,136,94,67,50,193,68,33,
+    110,147,54,112,185,95,210,109,37,201,49,224,174,27,71,240,
+    182,102,42,183,46,158,206,202,198,124,142,158,133,171,48,123,
+    61,137,204,135,35,84,221,222,219,201,209,38,144,230,132,106,
+    207,1,83,39,44,179,92,20,68,129,155,61,23,126,40,89,
+    164,9,227,197,204,25,120,46,0,79,221,27,16,100,80,48,
+    23,82,137,217,160,217,201,202,198,92,142,86,193,210,152,211,
+    78,59,184,169,2,96,170,252,217,19,252,91,161,16,225,252,
+    230,77,43,30,170,68,113,32,5,80,255,224,154,50,32,241,
+    48,94,28,120,25,158,92,31,15,79,102,23,42,143,186,188,
+    42,154,219,87,136,103,229,99,46,71,190,187,35,252,139,178,
+    11,91,49,116,170,173,13,116,17,145,179,210,42,155,118,113,
+    83,101,4,179,143,68,253,184,58,82,222,113,54,144,33,178,
+    206,248,48,136,251,126,44,140,27,44,163,88,185,132,195,165,
+    45,149,112,185,89,15,202,215,133,148,29,183,221,134,55,31,
+    125,163,139,103,249,108,70,212,251,58,126,218,184,103,64,93,
+    123,111,63,219,97,99,4,245,191,229,221,137,221,27,18,138,
+    232,243,184,106,77,99,232,99,254,77,96,34,199,177,52,203,
+    254,121,28,243,55,242,65,29,213,84,131,191,165,136,69,188,
+    61,43,62,107,165,137,152,32,202,182,46,40,236,109,35,104,
+    121,215,117,215,110,163,40,224,244,199,48,58,55,85,6,176,
+    31,242,16,246,177,11,95,178,250,229,97,174,70,239,193,242,
+    138,58,122,34,98,155,35,17,65,161,84,85,215,251,170,190,
+    115,224,210,237,209,191,36,148,215,121,35,122,55,126,156,241,
+    245,64,145,218,23,176,31,127,149,119,63,207,153,251,238,207,
+    18,102,38,105,204,137,124,216,246,19,126,38,151,106,35,231,
+    110,31,202,124,1,72,133,237,247,124,170,185,106,62,64,140,
+    13,167,27,222,52,65,147,71,55,100,231,26,14,2,108,103,
+    87,57,169,197,47,212,147,5,235,53,2,253,91,7,70,220,
+    194,233,22,86,46,225,100,143,62,244,57,29,80,15,65,180,
+    57,7,114,168,15,235,175,88,142,50,5,118,120,18,63,34,
+    23,188,197,66,249,62,163,79,13,184,109,135,216,115,94,83,
+    17,237,208,223,246,141,127,245,185,96,230,107,54,6,48,93,
+    194,151,171,36,220,215,55,236,167,13,28,89,204,217,184,165,
+    235,67,252,161,77,92,155,199,34,6,215,19,89,132,127,125,
+    6,116,34,94,12,70,236,235,183,139,156,115,127,0,77,180,
+    220,144,95,121,93,1,128,249,181,130,232,249,2,99,54,255,
+    11,127,48,67,244,77,92,229,70,191,60,194,183,152,84,5,
+    78,116,146,254,124,115,75,9,199,137,18,167,190,145,62,51,
+    7,58,174,213,247,244,2,213,139,6,220,113,5,142,147,124,
+    16,62,111,116,204,153,251,172,42,172,95,38,225,89,100,218,
+    202,132,148,56,211,223,94,146,28,248,111,95,208,7,251,159,
+    133,245,223,157,237,175,79,120,85,163,108,142,195,240,60,224,
+    65,71,138,234,231,74,201,175,97,181,156,192,239,212,156,207,
+    232,105,248,234,32,106,181,223,62,255,155,195,53,89,123,180,
+    239,184,125,84,145,159,131,254,224,29,68,30,225,85,71,241,
+    202,90,160,31,162,175,244,107,188,216,95,236,102,255,179,191,
+    46,158,253,245,9,151,34,155,138,157,197,58,163,31,221,227,
+    14,227,145,86,16,126,113,253,111,234,255,133,137,9,143,170,
+    239,210,134,73,154,70,127,176,181,253,127,229,216,82,142,12,
+    15,253,123,192,79,228,16,254,148,189,53,35,239,253,10,152,
+    101,154,222,166,216,134,173,80,99,219,62,28,127,244,54,14,
+    216,207,33,92,242,239,248,206,95,114,48,111,162,237,113,173,
+    138,112,239,99,78,133,172,199,216,29,174,25,236,246,225,255,
+    221,38,194,153,210,166,20,230,62,212,135,206,217,114,221,98,
+    224,170,31,242,232,47,134,198,210,187,185,255,7,127,33,114,
+    8,87,98,22,82,53,255,33,215,33,245,163,255,73,141,127,
+    171,251,7,79,250,242,15,121,82,92,255,229,31,235,230,255,
+    134,127,218,4,166,185,243,117,56,33,252,85,156,57,124,93,
+    174,81,124,61,206,61,124,125,206,225,124,131,254,59,67,46,
+    144,124,35,46,53,248,171,185,100,227,27,115,105,207,199,51,
+    44,233,80,124,60,82,146,174,201,55,233,191,35,61,18,15,
+    1,124,114,226,28,15,46,124,124,164,135,12,127,124,124,33,
+    3,44,159,140,127,88,37,159,140,94,216,92,62,57,239,128,
+    167,31,62,89,99,194,19,40,159,204,31,24,2,240,201,161,
+    23,12,100,248,88,40,129,76,124,124,96,133,128,63,254,102,
+    124,135,97,38,159,108,141,99,160,204,199,102,16,90,193,199,
+    0,153,144,36,62,78,82,66,251,248,120,52,229,227,79,221,
+    249,196,112,140,2,248,120,229,132,143,207,116,241,241,113,1,
+    62,209,129,63,65,229,99,144,195,39,141,38,182,224,101,16,
+    62,62,86,195,199,27,218,124,204,40,248,184,59,243,241,7,
+    239,124,178,191,222,140,239,240,201,115,186,21,223,145,157,246,
+    71,248,142,244,214,78,124,71,2,136,255,204,15,159,108,225,
+    190,197,119,228,224,240,55,124,71,198,8,81,65,184,195,179,
+    31,31,143,114,124,188,84,195,199,71,116,249,36,40,120,55,
+    131,143,79,114,240,201,220,56,16,23,198,120,148,79,130,135,
+    151,35,248,120,156,231,99,84,197,199,123,237,124,50,116,222,
+    130,139,209,52,201,54,113,107,107,55,27,87,7,107,235,182,
+    129,214,248,143,240,248,184,224,123,41,107,107,79,31,27,23,
+    246,141,176,119,128,135,67,155,132,157,191,191,181,157,139,141,
+    151,87,219,64,124,187,197,193,198,222,129,110,147,92,231,96,
+    231,237,78,27,219,208,54,174,109,34,218,46,238,54,222,109,
+    227,109,109,188,28,92,156,220,28,172,153,63,238,227,75,138,
+    88,219,219,120,219,224,55,109,66,186,110,222,109,99,189,29,
+    92,61,28,104,27,111,31,218,193,218,207,193,137,218,226,237,
+    213,95,164,88,224,3,24,40,240,93,217,139,182,155,253,191,
+    254,201,32,143,0,90,148,56,12,46,248,239,104,120,225,57,
+    52,172,255,223,86,201,17,97,43,90,135,76,13,211,109,149,
+    89,26,166,215,161,56,231,190,226,252,59,138,243,123,6,216,
+    42,74,12,236,17,248,227,170,173,47,40,32,33,249,94,87,
+    95,208,65,113,138,232,71,1,124,109,18,86,232,49,130,231,
+    147,103,31,66,249,168,103,128,135,32,46,254,199,213,86,8,
+    215,113,16,242,18,156,12,85,240,181,73,120,2,243,31,61,
+    89,144,181,203,104,154,112,155,132,235,60,101,15,236,47,175,
+    54,41,184,237,255,179,78,180,48,103,61,61,9,151,39,149,
+    20,225,242,93,124,9,19,26,13,122,42,252,196,95,207,122,
+    225,36,238,17,18,20,20,236,89,33,40,32,56,178,73,96,
+    4,243,95,171,128,66,211,191,254,215,35,106,173,36,40,218,
+    35,240,247,215,148,81,239,201,255,63,254,151,247,196,138,255,
+    7,17,250,130,244,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/ruby/network/fault_model/FaultModel.py",
+    "m5.objects.FaultModel",
+    embedded_module_data,
+    12997,
+    19162);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,174 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,88,203,111,27,199,25,223,37,87,20,201,93,174,
+    196,183,172,87,214,142,237,154,177,37,250,129,196,182,170,72,
+    174,40,89,150,44,211,65,99,231,160,36,93,80,220,177,68,
+    153,228,42,179,148,109,241,68,20,5,90,248,98,69,8,32,
+    33,200,65,1,140,192,133,47,190,245,95,232,145,20,8,136,
+    216,147,129,158,114,163,96,29,10,157,250,205,44,159,203,135,
+    235,20,229,99,102,246,123,204,243,155,223,111,118,254,197,52,
+    124,122,42,249,59,29,146,93,70,97,20,54,201,164,216,101,
+    54,101,89,182,176,228,217,146,180,166,184,101,142,150,173,201,
+    158,7,70,110,123,192,88,152,121,70,225,254,194,40,61,168,
+    247,23,43,195,188,182,86,43,93,182,83,157,13,116,189,136,
+    51,233,28,84,103,7,157,3,57,76,58,39,213,57,65,199,
+    35,167,73,199,83,157,0,58,23,178,152,116,2,213,137,160,
+    235,67,172,73,231,82,250,191,100,66,238,95,201,67,200,162,
+    11,51,49,45,17,159,123,150,89,74,164,31,87,158,22,210,
+    244,41,196,234,174,72,82,141,63,70,202,253,149,117,20,207,
+    128,128,253,36,222,56,93,150,234,116,5,232,116,33,102,153,
+    85,152,101,139,194,42,150,85,203,178,85,177,66,83,156,222,
+    27,153,141,60,216,218,64,58,191,180,16,189,43,223,159,89,
+    156,139,60,208,121,35,151,137,44,10,86,118,89,78,199,82,
+    72,150,117,167,44,167,84,101,51,73,202,130,44,127,183,25,
+    75,86,52,220,147,88,82,251,59,243,142,180,121,18,210,112,
+    60,156,66,169,48,222,92,217,10,167,81,230,169,138,31,135,
+    87,99,24,138,225,121,154,145,97,140,111,108,97,59,216,211,
+    228,28,252,181,1,72,114,181,111,73,56,181,247,121,158,15,
+    229,102,201,23,247,87,77,155,6,202,85,7,250,39,182,105,
+    160,12,12,146,93,230,20,203,114,15,178,237,247,50,109,62,
+    200,190,238,168,150,21,235,47,48,101,175,171,211,6,171,15,
+    94,206,14,94,124,205,139,51,121,9,93,218,114,213,188,122,
+    76,94,174,46,94,98,205,203,102,242,234,67,253,29,189,220,
+    53,175,94,147,151,27,218,242,116,240,242,214,188,236,38,47,
+    175,226,128,128,113,234,124,212,88,76,178,124,217,243,157,150,
+    184,193,104,124,109,45,251,209,42,74,125,58,49,65,44,39,
+    38,12,147,137,137,198,138,122,147,144,74,9,37,43,208,66,
+    50,150,65,233,248,86,246,236,147,4,206,64,136,73,241,181,
+    88,58,141,146,154,180,129,176,84,21,86,218,204,14,166,55,
+    83,43,32,87,31,153,85,90,182,239,43,40,106,146,182,185,
+    177,161,226,12,82,178,254,149,68,102,236,105,66,201,172,17,
+    251,204,26,146,72,139,209,144,15,147,53,197,2,73,200,58,
+    233,92,134,108,11,103,252,217,51,121,13,197,20,132,117,7,
+    41,199,147,49,77,211,123,190,136,225,88,74,183,194,118,212,
+    109,80,70,144,211,49,200,9,69,183,69,182,226,73,164,129,
+    192,24,134,78,7,37,215,158,158,196,53,25,198,33,63,129,
+    174,233,149,206,203,234,35,185,210,121,185,218,121,221,65,36,
+    228,81,211,249,175,96,147,171,216,104,182,175,54,28,90,135,
+    166,219,30,66,71,174,93,213,123,232,192,112,31,25,4,221,
+    44,36,10,176,183,154,132,224,175,253,131,105,218,97,252,64,
+    110,182,228,190,153,91,44,245,95,201,45,188,21,189,47,18,
+    207,19,123,182,159,196,87,142,130,120,181,40,94,205,205,151,
+    188,3,187,147,59,147,251,182,151,226,27,177,224,157,46,122,
+    167,115,75,68,120,115,231,102,201,46,22,237,67,249,145,200,
+    145,213,226,179,29,51,144,228,150,202,54,198,29,216,117,236,
+    56,168,54,148,191,56,15,90,55,209,186,109,185,5,208,6,
+    207,236,170,59,42,213,142,230,165,43,160,13,18,109,208,150,
+    187,15,90,151,231,197,210,243,165,189,192,79,195,249,223,77,
+    21,132,233,162,48,157,155,35,95,99,76,100,36,77,0,192,
+    86,242,119,131,76,39,0,168,160,157,51,130,145,146,160,208,
+    147,61,215,41,118,235,54,36,116,71,219,133,110,221,36,26,
+    178,153,2,7,251,72,226,39,9,65,94,243,98,156,175,38,
+    147,100,49,70,76,139,17,36,139,113,131,44,198,229,220,2,
+    249,26,158,231,205,67,174,97,222,63,59,14,185,19,162,0,
+    206,193,132,189,174,78,26,48,32,88,58,218,90,114,45,56,
+    229,4,91,190,173,173,173,5,103,132,46,182,102,116,113,85,
+    208,197,85,1,133,25,156,80,86,81,246,194,123,240,197,48,
+    35,203,116,186,11,194,84,42,11,254,65,211,212,120,2,118,
+    161,34,85,52,18,89,66,76,6,159,29,155,77,96,216,98,
+    9,53,77,112,1,88,81,34,228,55,54,101,48,161,164,98,
+    201,40,141,77,17,249,175,100,250,178,129,37,99,75,19,143,
+    47,17,158,69,154,244,48,157,200,100,189,13,114,82,19,17,
+    70,67,226,123,2,37,200,84,130,91,231,8,94,80,162,211,
+    123,158,16,24,194,67,164,44,106,8,43,72,171,1,9,31,
+    87,226,213,7,115,152,93,168,38,51,240,215,50,76,115,152,
+    13,146,48,251,61,9,179,107,176,231,249,254,67,126,248,128,
+    31,206,143,124,86,224,175,23,249,235,160,21,220,47,238,61,
+    191,87,178,251,243,193,219,176,61,93,100,123,186,108,185,57,
+    216,158,129,161,221,111,118,190,217,63,157,63,247,121,193,63,
+    85,244,79,229,162,37,79,112,247,210,206,165,189,239,242,103,
+    174,23,60,55,138,158,27,185,187,228,107,116,136,116,163,125,
+    244,94,176,124,104,244,90,24,56,193,65,254,186,30,77,102,
+    222,238,24,207,224,235,48,249,154,217,187,115,124,247,180,176,
+    111,231,248,110,181,117,117,177,53,239,27,241,3,108,251,192,
+    182,191,157,45,114,183,236,49,79,23,91,135,153,237,187,216,
+    58,77,182,190,46,182,188,201,214,15,182,129,182,182,193,245,
+    129,218,56,5,147,215,41,197,5,232,32,234,46,227,228,88,
+    57,3,159,116,68,240,134,3,102,39,104,104,170,41,43,60,
+    82,241,211,24,86,232,89,32,59,184,18,139,63,166,143,143,
+    146,234,211,177,184,154,206,96,53,73,117,183,79,134,231,210,
+    177,149,36,146,232,233,91,154,85,83,177,68,90,138,96,85,
+    211,18,233,213,147,209,138,22,208,32,17,75,38,178,8,143,
+    1,42,212,30,178,3,85,224,49,48,73,138,101,36,77,221,
+    196,113,148,13,180,106,96,175,103,178,65,131,107,90,29,252,
+    45,10,98,127,114,26,206,55,146,113,190,169,157,18,164,149,
+    45,122,210,193,234,102,6,225,104,104,240,191,70,34,161,50,
+    179,50,69,36,66,67,128,58,180,93,42,209,185,25,85,77,
+    234,189,112,218,151,1,140,244,94,69,203,208,130,147,72,12,
+    184,210,157,68,104,148,41,20,232,92,244,225,210,18,160,25,
+    152,64,245,242,10,29,128,46,18,179,134,231,62,90,41,180,
+    85,19,208,202,235,2,252,49,233,230,41,163,155,9,249,81,
+    18,58,165,145,89,62,203,180,210,110,184,154,124,1,127,77,
+    98,219,224,225,141,10,30,150,237,140,239,212,161,247,236,129,
+    247,236,254,215,251,95,255,252,237,203,111,223,68,11,222,72,
+    209,27,129,99,143,39,120,232,57,115,224,57,179,63,177,63,
+    241,243,228,203,201,252,149,123,5,79,180,232,137,230,238,150,
+    251,153,62,223,139,245,231,235,123,254,188,52,85,16,167,139,
+    226,52,156,158,224,72,101,150,149,69,6,16,115,112,103,112,
+    111,46,255,113,164,224,158,45,186,103,161,117,56,52,153,101,
+    101,39,224,237,161,255,194,129,255,194,43,95,62,188,80,240,
+    47,22,253,139,128,184,254,193,186,116,190,224,191,83,244,223,
+    1,41,216,6,66,7,129,208,171,179,249,203,11,133,192,98,
+    49,176,152,187,223,36,157,47,4,238,20,3,119,114,247,223,
+    2,196,195,49,171,122,128,187,213,136,242,245,195,22,153,178,
+    246,216,253,239,142,216,189,202,44,219,186,224,183,189,25,131,
+    155,79,35,44,243,63,120,58,246,237,237,60,145,173,133,35,
+    156,208,71,30,241,29,91,18,222,211,210,111,247,116,236,11,
+    109,251,200,183,112,145,11,137,251,125,237,108,219,240,75,255,
+    7,216,186,187,216,154,249,197,243,1,182,94,24,155,175,157,
+    237,106,235,219,164,191,139,173,153,139,2,93,108,205,92,20,
+    236,98,107,230,162,1,24,219,169,118,182,104,112,125,168,54,
+    78,51,23,13,55,115,81,229,118,6,95,6,93,55,166,169,
+    216,101,93,141,76,163,101,135,58,83,141,118,27,95,129,74,
+    241,85,82,243,104,43,59,160,103,128,229,105,120,215,69,105,
+    37,59,210,66,6,77,234,54,238,137,116,87,247,70,53,190,
+    6,93,136,134,70,186,179,134,206,201,233,36,188,138,198,54,
+    54,136,15,125,233,60,77,228,174,70,14,209,192,44,158,212,
+    12,42,17,26,168,68,51,88,231,51,34,239,133,206,27,124,
+    2,221,48,248,132,72,170,124,66,132,141,124,34,18,101,35,
+    115,80,247,6,230,16,137,71,163,1,173,182,29,147,224,91,
+    36,105,71,32,51,213,100,11,254,218,143,93,9,68,96,4,
+    49,55,251,150,179,255,245,238,159,239,110,243,219,252,247,174,
+    31,92,5,110,180,200,141,230,185,209,78,242,146,239,163,67,
+    223,197,3,223,197,87,179,111,194,5,223,76,209,55,147,187,
+    247,150,119,213,107,114,110,59,191,23,126,16,10,220,72,145,
+    27,201,115,35,157,228,37,239,232,161,55,116,224,165,128,127,
+    175,224,141,22,189,81,120,43,255,63,209,211,233,67,255,248,
+    129,127,188,100,119,230,133,75,192,34,1,194,34,1,91,46,
+    74,95,244,15,3,225,131,64,152,42,47,154,222,243,127,171,
+    167,189,114,67,240,30,234,154,161,81,43,234,190,212,167,227,
+    42,189,36,213,198,233,29,42,221,176,228,214,21,19,50,211,
+    7,26,244,77,119,170,152,220,56,235,14,80,111,144,107,23,
+    77,183,147,34,86,159,109,233,220,92,122,51,101,92,93,210,
+    64,167,111,245,244,157,43,92,11,150,230,0,58,177,79,26,
+    23,167,83,248,33,99,220,89,104,107,144,150,173,44,203,150,
+    111,88,89,75,153,121,127,98,103,216,107,121,230,106,227,175,
+    196,4,243,213,95,137,9,228,171,191,178,141,101,63,41,51,
+    173,201,223,148,35,146,29,215,165,246,126,246,22,91,102,218,
+    167,219,99,71,52,63,110,212,156,183,178,87,72,143,204,201,
+    246,208,17,201,142,235,82,193,201,222,44,51,173,201,246,226,
+    17,201,142,235,210,225,115,172,173,204,180,38,219,75,71,36,
+    59,174,75,255,200,78,144,98,107,66,76,39,136,105,171,138,
+    174,196,127,0,187,161,171,99,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/ruby/network/garnet/GarnetLink.py",
+    "m5.objects.GarnetLink",
+    embedded_module_data,
+    2392,
+    6224);
+
+} // anonymous namespace
+} // namespace gem5
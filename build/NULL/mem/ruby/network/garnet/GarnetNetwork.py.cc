@@ -0,0 +1,162 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,165,88,203,111,219,200,25,167,158,150,100,201,142,229,
+    196,177,221,100,119,156,56,217,56,209,195,150,243,178,54,205,
+    174,252,72,226,103,140,200,65,27,1,5,65,145,35,139,49,
+    31,218,33,25,71,54,12,232,208,83,46,89,236,37,139,92,
+    98,236,33,69,177,183,158,123,235,63,32,23,6,42,240,210,
+    5,10,20,200,205,193,250,148,83,191,33,37,217,146,41,99,
+    131,74,228,199,225,247,152,249,230,227,111,190,111,200,255,48,
+    199,126,190,250,245,215,191,1,121,195,8,140,224,146,24,217,
+    149,115,185,104,219,45,185,101,79,206,99,181,61,146,87,246,
+    229,124,86,219,43,249,229,174,92,151,213,246,73,129,53,251,
+    26,92,99,220,204,67,70,240,255,153,17,186,112,215,123,15,
+    195,252,236,105,12,148,11,89,178,0,200,130,216,215,38,235,
+    182,100,33,144,117,99,79,155,44,236,102,176,11,135,132,240,
+    123,55,240,221,13,62,140,29,201,50,99,61,31,232,205,152,
+    203,12,115,130,192,242,162,206,233,162,170,192,125,247,52,167,
+    137,252,19,213,208,49,129,219,200,140,164,242,27,88,120,156,
+    127,142,121,157,202,159,24,249,242,10,214,55,85,178,1,183,
+    174,235,252,241,176,120,27,97,121,239,162,97,193,76,206,37,
+    48,57,55,156,30,193,149,243,10,238,156,15,251,119,187,24,
+    135,159,224,17,188,173,174,230,2,160,27,116,212,245,9,254,
+    54,221,80,71,221,46,33,208,166,219,125,138,110,176,77,55,
+    220,81,55,36,116,183,233,70,78,153,91,219,99,200,245,128,
+    110,175,163,110,68,232,105,211,61,3,186,125,78,186,56,42,
+    244,182,233,246,119,244,247,140,208,215,166,123,86,136,2,20,
+    250,205,200,67,142,40,88,175,63,213,173,107,50,150,147,4,
+    30,115,82,177,57,201,117,75,158,108,81,75,20,139,91,35,
+    235,88,190,149,78,83,221,116,218,86,74,167,91,180,8,29,
+    109,43,174,24,114,30,19,164,22,16,81,55,53,36,22,80,
+    106,22,193,56,90,49,169,171,196,208,146,137,196,24,210,213,
+    146,42,169,235,229,15,103,168,205,104,125,112,36,42,0,197,
+    2,199,99,84,144,68,29,105,226,22,6,30,202,151,117,172,
+    125,160,128,251,52,250,66,36,186,193,73,136,47,114,138,130,
+    37,13,149,96,176,6,179,222,207,22,202,27,133,2,38,182,
+    80,224,116,14,181,153,125,112,209,113,91,212,120,157,72,237,
+    106,91,95,141,167,209,31,176,184,94,212,227,121,78,195,2,
+    90,227,242,18,142,161,137,52,250,227,179,24,74,165,209,140,
+    161,233,170,252,96,107,24,43,84,212,112,1,21,56,67,210,
+    145,172,10,208,75,191,3,83,92,253,7,76,167,161,30,151,
+    240,11,44,33,1,115,2,93,132,72,47,18,8,152,42,9,
+    43,99,231,204,0,203,42,156,140,89,214,12,177,44,24,27,
+    18,109,135,89,246,59,112,181,46,241,234,229,18,54,67,252,
+    203,151,108,17,58,193,196,12,210,54,47,113,154,102,250,86,
+    57,194,201,166,103,94,209,205,0,60,31,150,62,25,211,255,
+    20,238,39,83,102,88,17,89,26,110,150,134,219,12,191,224,
+    53,22,226,193,190,0,215,204,254,122,132,44,14,13,36,251,
+    130,111,101,210,176,81,102,31,129,60,34,42,235,44,39,173,
+    171,68,212,139,178,233,157,86,85,201,140,218,129,97,173,185,
+    179,214,220,205,208,3,122,179,108,181,189,43,79,151,150,204,
+    238,227,226,33,27,95,108,35,28,108,51,28,127,101,126,165,
+    112,254,20,211,8,159,252,109,216,45,149,9,93,36,22,249,
+    10,78,237,223,64,42,205,127,173,123,184,50,91,235,251,186,
+    178,80,59,51,89,153,255,165,247,236,235,242,171,242,143,125,
+    213,11,139,123,189,75,251,189,75,149,71,181,254,193,55,247,
+    126,184,183,235,174,142,46,236,245,47,238,247,47,86,150,26,
+    60,87,245,242,252,94,255,194,126,255,2,240,134,191,124,23,
+    123,27,219,253,174,122,125,105,111,120,121,127,120,185,234,61,
+    239,204,28,188,248,46,248,54,184,59,82,189,178,178,55,248,
+    120,127,240,113,213,123,174,54,244,197,187,225,183,195,187,115,
+    213,27,15,247,134,30,237,15,61,170,122,7,106,209,243,255,
+    138,94,250,103,244,210,238,205,234,216,253,189,232,55,251,209,
+    111,42,139,53,116,229,47,225,159,194,181,64,164,218,59,241,
+    209,227,30,241,31,50,64,170,222,139,246,65,174,52,102,236,
+    156,178,255,203,124,126,202,166,105,254,103,87,51,161,4,58,
+    105,226,224,243,80,211,170,61,205,135,78,177,234,110,90,249,
+    28,18,115,39,171,72,211,170,189,76,68,132,46,72,121,1,
+    115,160,5,15,243,141,20,179,53,234,148,209,78,104,221,232,
+    132,178,118,77,154,36,175,207,207,210,124,69,176,100,213,88,
+    72,115,72,213,139,144,92,78,36,56,141,132,193,199,79,195,
+    71,217,178,45,135,105,164,7,20,86,198,122,8,45,29,132,
+    230,73,66,11,3,137,82,114,150,146,126,74,206,81,50,8,
+    196,116,139,130,233,135,149,142,21,157,12,83,70,189,115,86,
+    45,176,245,206,217,70,231,102,144,114,232,173,70,46,211,30,
+    70,41,177,80,115,149,146,107,13,50,5,167,246,138,105,93,
+    49,151,97,197,156,185,93,153,175,245,221,175,44,252,18,236,
+    121,125,225,213,133,234,192,244,94,112,102,63,56,83,153,174,
+    175,141,90,160,103,63,240,187,234,197,25,0,232,89,10,208,
+    179,254,202,210,129,159,233,27,120,19,254,33,108,73,199,0,
+    234,32,237,163,210,62,127,101,30,164,35,87,109,100,131,244,
+    26,44,153,142,224,166,206,57,131,251,239,204,231,130,27,7,
+    158,55,235,40,0,189,21,70,193,83,172,58,3,189,251,20,
+    171,112,211,170,29,232,17,193,15,144,237,50,195,54,100,237,
+    173,217,214,176,19,80,235,178,145,78,240,180,229,0,74,11,
+    104,100,12,200,214,72,30,138,234,166,40,232,69,164,25,165,
+    146,74,116,168,104,249,50,84,27,140,136,165,255,25,120,35,
+    55,40,161,64,35,49,74,226,148,12,1,49,125,214,16,237,
+    144,74,54,200,2,156,154,193,180,66,106,136,66,42,70,33,
+    117,19,50,241,255,3,160,72,244,245,210,171,165,134,237,183,
+    32,141,80,105,196,95,153,163,127,219,35,234,7,247,12,118,
+    246,223,138,74,137,168,60,198,2,212,46,109,123,186,8,149,
+    82,216,228,158,167,83,227,169,241,244,134,168,227,88,8,33,
+    206,208,139,42,65,246,239,247,104,59,75,196,13,78,209,81,
+    83,29,113,138,16,66,39,126,11,34,150,161,95,244,12,146,
+    130,179,198,52,216,23,84,34,160,229,4,154,198,252,134,12,
+    251,142,14,170,107,134,6,195,161,69,34,106,69,133,219,161,
+    126,233,162,14,91,142,35,191,22,193,223,52,218,206,236,160,
+    7,156,44,74,101,154,87,30,97,120,174,234,58,86,176,106,
+    104,200,74,87,37,85,131,156,179,102,239,193,68,172,161,57,
+    171,68,11,144,131,56,135,129,51,60,111,16,78,199,182,49,
+    175,194,206,136,215,145,85,189,97,114,150,35,121,85,221,104,
+    58,3,142,220,186,3,24,219,206,204,44,39,231,231,230,230,
+    118,208,44,214,196,117,5,101,12,216,43,217,169,113,70,85,
+    96,15,129,21,30,118,83,219,179,153,153,29,68,35,30,67,
+    89,78,65,15,8,167,240,162,198,171,49,7,111,102,50,49,
+    244,52,11,100,193,128,9,166,198,227,169,155,49,203,214,114,
+    164,196,173,195,124,142,34,50,17,143,223,182,5,70,94,130,
+    192,97,82,23,108,91,142,89,162,50,230,8,58,102,211,236,
+    204,128,29,225,113,65,81,215,75,90,58,153,20,84,49,161,
+    146,245,228,196,120,98,98,98,124,42,9,238,79,220,29,191,
+    147,74,80,203,196,84,106,226,238,173,201,41,171,7,208,108,
+    233,225,116,139,208,78,168,13,143,25,88,205,155,156,4,104,
+    28,159,170,47,125,39,60,174,136,27,88,71,117,229,223,4,
+    159,14,74,75,226,118,124,39,91,20,13,120,10,171,184,216,
+    65,107,69,36,0,249,197,4,90,40,58,227,112,251,97,230,
+    201,202,220,90,122,199,194,162,128,117,78,164,240,82,149,56,
+    95,20,75,205,106,104,237,246,160,38,106,162,128,17,135,10,
+    134,36,197,181,178,166,99,217,97,80,77,148,13,40,171,42,
+    113,4,156,253,56,109,132,42,22,194,32,16,217,178,12,80,
+    23,13,25,70,134,233,16,88,104,176,190,224,237,34,3,210,
+    178,38,106,116,125,100,173,1,53,135,17,97,242,40,171,22,
+    244,77,168,169,0,210,249,236,106,38,155,165,56,29,159,138,
+    161,76,137,136,18,74,221,142,167,238,198,234,172,105,21,94,
+    5,148,24,90,134,61,55,199,23,13,13,235,186,230,4,97,
+    11,190,171,71,143,217,17,185,147,147,241,248,205,212,41,216,
+    133,37,36,151,104,210,6,39,121,17,235,229,14,96,30,159,
+    250,44,48,219,211,76,80,187,196,205,169,137,169,219,147,183,
+    79,133,178,147,62,0,121,101,44,98,134,229,91,137,198,247,
+    6,141,208,239,21,230,0,176,84,235,3,131,150,56,246,249,
+    129,208,234,109,14,30,19,182,124,140,32,244,27,140,25,61,
+    38,110,188,115,250,169,32,8,130,18,125,197,209,204,0,109,
+    18,245,101,125,211,127,173,89,121,90,171,209,167,192,61,251,
+    69,234,62,185,195,208,47,37,80,146,34,64,15,60,46,151,
+    235,224,62,227,186,90,101,174,28,63,106,76,162,218,122,212,
+    152,84,181,245,168,49,215,171,173,71,141,57,95,109,28,53,
+    102,160,218,56,14,252,189,46,255,1,115,146,124,191,248,145,
+    94,14,143,184,163,61,180,117,146,252,248,167,143,244,114,120,
+    196,189,20,166,173,147,228,251,175,63,210,203,225,17,247,11,
+    198,21,169,132,107,222,190,3,247,151,62,239,71,223,37,151,
+    251,144,1,114,208,74,172,112,253,15,66,211,226,29,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/ruby/network/garnet/GarnetNetwork.py",
+    "m5.objects.GarnetNetwork",
+    embedded_module_data,
+    2206,
+    4875);
+
+} // anonymous namespace
+} // namespace gem5
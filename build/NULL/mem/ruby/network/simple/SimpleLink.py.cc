@@ -0,0 +1,106 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,173,86,205,111,19,71,20,159,217,245,247,174,29,155,
+    56,14,196,84,88,168,16,25,168,93,8,36,40,130,32,146,
+    84,20,26,82,36,104,15,150,170,213,198,59,73,156,236,174,
+    205,236,154,196,86,144,34,196,33,106,35,53,7,170,230,130,
+    196,9,181,162,7,254,129,222,123,180,163,149,106,173,154,83,
+    79,220,76,9,23,78,125,179,254,136,23,2,229,208,221,217,
+    223,204,155,247,252,230,189,55,111,222,248,111,212,243,120,219,
+    253,171,7,0,63,35,5,41,88,69,26,206,97,141,203,113,
+    152,209,156,202,107,158,156,199,25,243,170,247,78,171,247,57,
+    189,71,245,107,129,92,192,225,121,213,160,22,202,133,48,226,
+    208,53,164,248,30,34,197,79,240,83,30,161,103,124,103,177,
+    156,224,240,2,192,11,18,238,45,158,168,132,110,163,180,240,
+    130,17,105,206,22,39,101,163,144,255,98,213,156,41,232,203,
+    109,234,186,238,80,105,108,135,111,18,195,144,23,200,100,121,
+    126,158,80,152,192,167,0,130,183,11,218,215,115,75,36,111,
+    2,225,157,151,77,89,205,247,58,139,59,206,14,57,206,18,
+    148,195,10,202,113,240,241,10,206,121,20,46,231,85,120,48,
+    194,99,135,65,83,73,37,237,229,223,156,208,136,150,165,229,
+    185,74,86,39,230,74,145,46,103,13,135,159,109,137,49,153,
+    204,226,98,245,200,2,209,46,140,143,51,193,241,113,151,134,
+    217,180,207,14,72,146,46,107,68,146,236,144,36,105,69,165,
+    172,178,177,40,73,119,203,178,218,230,120,204,74,137,216,161,
+    252,234,170,180,72,100,133,80,59,200,198,121,85,54,140,95,
+    209,43,102,252,155,180,65,243,217,143,48,168,84,161,33,144,
+    119,224,28,124,198,39,0,235,221,183,33,12,173,79,55,98,
+    23,215,111,52,162,167,215,175,179,151,246,119,228,93,97,243,
+    116,194,54,243,222,176,17,223,19,63,58,224,89,128,92,121,
+    202,193,62,115,221,125,14,40,158,135,40,23,84,188,16,104,
+    95,39,208,237,157,165,2,72,28,20,198,54,191,58,208,218,
+    112,35,53,95,164,169,130,110,74,42,204,26,121,174,103,73,
+    31,124,44,171,94,141,115,204,90,19,239,179,214,208,82,151,
+    122,10,163,103,93,74,193,203,142,151,180,207,244,238,203,43,
+    156,91,10,131,63,247,57,179,199,83,51,216,163,29,47,117,
+    127,235,254,157,155,154,70,223,157,184,207,175,113,79,124,7,
+    69,204,236,235,89,159,255,205,243,33,77,24,109,158,116,249,
+    135,151,2,239,245,207,57,105,244,135,143,147,255,56,191,150,
+    157,184,27,220,13,244,0,255,15,81,185,12,81,233,177,104,
+    141,63,178,175,5,45,117,117,42,222,42,96,21,180,174,113,
+    189,50,82,232,32,191,92,90,220,242,66,103,180,57,1,28,
+    36,237,71,11,177,220,156,165,204,189,234,173,111,12,66,83,
+    198,98,177,172,42,41,189,104,166,52,89,135,3,171,86,82,
+    6,49,83,78,254,13,167,14,120,10,186,52,215,78,86,200,
+    213,98,217,236,144,119,160,56,249,139,20,14,55,81,94,176,
+    53,211,162,205,171,68,183,253,109,1,202,140,183,189,84,214,
+    23,136,205,67,150,219,67,122,89,155,35,84,42,206,75,247,
+    10,212,132,229,165,246,185,55,108,159,92,42,17,93,161,44,
+    202,246,96,105,177,2,133,18,248,247,64,192,144,242,139,178,
+    174,19,213,176,253,170,108,18,61,95,177,133,214,34,146,81,
+    168,18,59,170,201,171,146,66,238,150,73,153,72,20,36,160,
+    244,121,12,162,206,219,254,182,126,154,100,106,113,193,96,199,
+    131,185,69,227,108,34,12,190,151,75,29,143,170,73,215,41,
+    205,184,152,83,44,69,70,48,43,61,187,66,100,195,220,92,
+    171,11,71,45,225,232,246,221,29,33,85,19,82,187,98,172,
+    201,225,88,230,37,207,135,35,123,8,160,233,64,4,245,15,
+    108,248,119,99,137,159,140,237,49,43,121,185,62,56,97,13,
+    78,212,99,87,172,216,149,38,194,193,139,14,108,92,109,136,
+    253,63,206,126,63,251,248,242,243,120,45,57,90,79,142,90,
+    128,226,152,37,142,213,156,246,58,129,196,190,141,21,171,47,
+    83,23,178,150,144,125,126,118,71,56,95,19,206,239,246,39,
+    182,86,172,193,209,122,255,152,213,63,246,251,72,35,58,104,
+    69,207,189,228,185,75,96,5,192,63,136,139,131,41,46,120,
+    237,67,137,228,227,145,237,21,235,216,213,122,114,210,74,78,
+    214,7,166,172,129,169,38,242,133,15,57,176,133,27,233,207,
+    173,244,151,127,196,172,244,87,141,248,225,71,51,79,206,214,
+    227,159,130,218,83,135,182,252,219,248,81,200,138,158,108,250,
+    80,118,212,202,220,108,196,7,246,120,46,219,101,156,174,69,
+    79,55,3,232,240,177,13,207,166,184,1,175,83,144,103,211,
+    33,42,66,79,195,12,34,12,88,141,160,81,6,49,182,27,
+    194,183,112,229,21,233,45,153,202,154,147,7,206,174,209,97,
+    6,135,24,56,117,157,109,28,77,116,224,34,219,150,27,232,
+    3,55,66,83,68,125,67,127,70,134,119,34,195,191,112,181,
+    51,83,245,200,180,21,153,94,191,214,244,28,247,30,107,162,
+    119,161,181,76,194,49,57,108,199,181,11,153,162,115,25,27,
+    25,231,246,118,10,60,171,66,148,229,146,125,184,135,239,186,
+    205,91,153,28,4,118,137,57,100,216,1,54,164,197,213,138,
+    45,194,168,123,199,83,86,113,108,63,76,149,205,130,234,28,
+    154,214,133,151,120,215,239,55,129,75,173,27,119,130,102,81,
+    235,143,128,241,23,64,147,199,24,55,103,49,143,57,200,186,
+    255,132,0,194,35,53,116,174,183,53,208,96,173,211,26,40,
+    81,235,180,6,58,94,115,183,6,58,82,115,183,166,143,199,
+    103,152,230,183,97,107,230,37,235,246,246,103,197,207,48,4,
+    249,93,96,146,208,237,29,192,114,188,255,23,208,147,78,166,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/ruby/network/simple/SimpleLink.py",
+    "m5.objects.SimpleLink",
+    embedded_module_data,
+    1312,
+    2541);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,194 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,213,88,93,108,219,214,21,190,148,68,89,63,180,37,
+    75,138,101,199,169,205,52,191,178,83,185,72,155,181,72,187,
+    34,73,83,187,110,59,39,107,210,109,240,214,177,180,120,109,
+    201,161,68,151,164,146,88,176,81,97,43,48,15,232,67,80,
+    116,200,16,96,136,247,18,116,104,31,250,190,151,61,14,216,
+    11,101,8,136,64,160,131,129,189,108,111,10,226,2,69,159,
+    118,206,165,68,139,180,157,166,47,3,38,211,135,212,61,231,
+    220,159,239,124,188,247,28,253,139,244,124,248,206,253,241,63,
+    65,220,37,10,81,56,149,148,185,121,142,195,231,128,26,40,
+    7,231,131,236,57,168,134,202,252,60,207,158,67,106,248,186,
+    115,239,99,119,94,141,148,163,243,81,166,11,171,177,114,124,
+    62,206,145,0,153,33,74,223,199,68,137,80,254,65,144,144,
+    47,130,221,65,231,5,166,139,130,46,70,163,62,93,63,211,
+    197,65,39,208,126,159,110,128,233,250,65,55,64,131,62,93,
+    130,233,18,160,75,82,206,167,75,42,131,215,72,46,245,31,
+    252,146,227,236,248,37,217,40,21,222,213,170,38,213,225,107,
+    255,79,168,97,200,75,244,82,117,113,145,53,196,223,173,46,
+    172,206,81,243,150,166,223,128,175,220,4,136,232,181,82,249,
+    202,194,50,45,152,240,133,95,148,77,89,45,244,2,25,234,
+    2,105,49,32,41,153,231,20,50,31,128,255,160,194,205,135,
+    148,192,60,79,195,155,125,100,159,143,18,84,66,15,2,48,
+    225,128,59,225,200,129,182,188,18,246,217,70,105,108,127,219,
+    37,128,223,103,27,127,130,109,196,103,43,96,128,230,251,149,
+    24,64,23,183,251,97,253,43,42,237,160,82,59,93,166,229,
+    41,29,96,154,170,56,45,83,6,211,79,121,204,242,197,98,
+    109,100,137,150,207,157,63,143,182,231,207,123,180,58,142,85,
+    251,80,161,139,114,85,53,197,82,5,194,81,145,85,113,129,
+    197,65,52,74,53,42,46,106,186,168,150,42,55,12,81,174,
+    40,226,247,124,116,22,81,227,21,241,121,232,76,41,21,100,
+    147,26,240,180,88,170,148,76,218,233,182,84,89,42,253,27,
+    152,81,27,93,128,30,111,149,20,179,40,202,202,114,213,48,
+    203,180,98,138,139,114,193,212,244,26,189,70,77,209,212,68,
+    90,174,170,208,139,8,55,179,4,51,23,11,69,185,82,161,
+    170,193,38,70,229,66,81,188,9,0,228,103,23,197,138,102,
+    138,6,53,207,136,178,170,178,70,67,52,138,178,78,69,179,
+    72,69,67,46,83,113,165,184,10,180,131,5,118,58,201,215,
+    254,122,209,48,74,75,21,81,22,149,18,78,14,103,128,171,
+    21,119,231,230,76,200,59,156,59,139,252,149,138,186,42,222,
+    148,213,146,34,222,42,210,138,59,132,196,38,32,185,179,45,
+    25,56,183,188,120,189,8,79,218,77,170,235,37,5,176,129,
+    169,185,35,73,157,145,86,100,29,38,107,98,0,96,36,28,
+    23,23,192,0,189,89,82,170,48,125,22,143,124,129,243,177,
+    31,95,183,199,191,97,236,95,35,203,174,234,50,121,63,187,
+    206,173,113,155,189,246,238,103,141,60,128,246,47,92,29,71,
+    62,25,6,239,128,199,59,176,22,120,122,111,133,0,95,185,
+    185,92,208,142,2,163,36,54,89,187,31,214,82,93,145,28,
+    10,24,118,95,135,41,96,20,50,168,186,104,135,208,204,14,
+    119,154,113,37,64,167,239,206,24,122,97,234,233,136,190,178,
+    170,247,35,155,71,189,205,158,97,103,193,192,248,21,136,58,
+    217,206,12,127,54,215,38,92,244,4,19,27,151,91,66,242,
+    161,48,182,37,140,253,209,108,8,199,155,194,113,139,93,173,
+    161,195,159,169,104,114,138,137,141,233,150,144,122,40,136,91,
+    130,184,153,105,8,39,155,194,73,139,93,237,96,215,228,49,
+    226,48,151,27,176,35,146,84,129,64,74,146,29,147,164,178,
+    166,84,85,124,22,36,233,67,136,97,71,19,50,87,87,168,
+    29,43,220,190,45,21,169,172,80,221,142,226,115,65,149,13,
+    195,230,175,34,19,236,224,108,197,180,227,206,18,36,124,39,
+    237,20,173,40,43,26,130,235,146,199,142,255,140,34,123,28,
+    151,236,1,52,180,135,125,10,215,159,129,247,23,162,167,225,
+    166,167,80,196,186,226,121,68,237,207,12,181,238,95,43,126,
+    184,126,185,53,248,74,253,173,86,114,178,62,187,157,202,222,
+    205,125,154,107,69,162,237,0,23,157,229,30,241,161,116,120,
+    135,128,168,191,221,142,145,195,227,247,71,238,141,108,190,104,
+    229,166,27,35,51,205,145,25,43,52,180,61,150,187,175,221,
+    211,90,145,24,186,92,68,151,113,116,25,15,91,161,209,182,
+    64,196,201,251,31,221,251,136,169,3,209,203,160,230,69,80,
+    131,176,66,71,218,3,60,15,88,239,21,206,236,113,206,158,
+    147,161,203,206,199,99,228,160,147,65,9,206,135,149,16,240,
+    150,183,19,112,54,81,60,154,96,163,122,15,246,173,235,181,
+    179,7,49,80,119,172,166,124,30,184,233,142,246,110,186,62,
+    253,92,174,79,207,224,76,15,161,24,66,145,5,97,71,228,
+    5,195,212,97,19,208,135,177,109,4,197,81,20,187,65,57,
+    214,21,63,197,160,60,235,11,202,17,8,74,34,93,127,179,
+    53,248,6,70,230,185,250,44,254,57,238,199,252,168,184,231,
+    229,244,129,168,252,144,243,82,225,1,189,176,29,255,57,45,
+    45,21,77,92,177,82,203,127,31,112,61,198,8,90,182,23,
+    180,30,221,116,45,75,43,242,2,236,254,178,34,175,152,165,
+    155,84,236,244,48,151,139,238,7,101,15,128,135,17,217,208,
+    37,77,83,237,100,215,91,234,120,251,209,61,217,21,191,64,
+    116,95,244,161,59,140,148,191,136,192,230,128,242,217,35,119,
+    107,159,214,54,79,88,185,75,141,236,235,205,236,235,86,40,
+    227,92,78,135,39,15,100,225,97,47,222,28,224,29,232,178,
+    16,48,12,217,201,107,183,74,102,161,120,85,211,77,39,35,
+    170,253,216,147,32,137,184,105,136,85,0,198,61,178,225,16,
+    90,88,101,231,132,227,43,174,128,115,231,192,53,174,207,229,
+    194,62,148,236,62,73,82,180,2,236,64,125,154,14,219,14,
+    85,236,20,244,162,221,146,106,84,215,36,60,114,43,133,85,
+    63,62,19,93,241,1,226,115,212,139,79,8,94,235,153,237,
+    129,84,125,166,53,242,12,188,225,206,229,120,79,248,193,112,
+    179,222,60,247,67,201,71,35,203,209,93,34,250,104,24,3,
+    175,248,190,94,194,114,191,235,229,39,239,192,83,121,241,62,
+    175,4,77,110,14,238,231,5,169,156,63,69,76,193,8,233,
+    253,108,3,132,102,148,190,47,35,222,99,84,137,250,252,15,
+    41,49,72,5,135,148,56,16,68,176,195,78,144,107,71,15,
+    60,26,153,30,95,169,148,39,249,115,220,14,87,170,229,5,
+    160,145,182,40,222,44,233,38,102,20,29,127,163,118,180,179,
+    79,137,29,10,96,14,230,230,133,236,40,223,215,132,222,246,
+    152,8,87,123,232,55,157,227,244,211,4,143,230,174,35,238,
+    114,38,93,98,158,11,14,147,11,129,30,80,48,190,44,153,
+    9,67,235,239,184,187,100,131,91,228,20,238,227,200,122,192,
+    236,73,67,32,77,113,191,249,240,11,220,96,219,155,158,48,
+    249,93,123,96,139,47,89,89,34,235,193,223,115,203,110,157,
+    2,201,206,251,235,161,181,208,114,119,115,132,49,110,176,153,
+    233,87,205,30,134,152,253,187,207,224,239,242,212,219,191,247,
+    27,244,157,95,231,215,130,155,145,253,120,96,246,176,35,64,
+    214,2,107,188,215,251,203,208,147,250,134,180,107,234,147,95,
+    195,76,98,123,86,226,206,250,255,105,37,107,193,53,34,237,
+    70,19,19,74,126,206,147,239,98,200,112,160,199,42,136,63,
+    0,69,122,137,1,11,57,136,24,92,7,132,62,176,113,41,
+    119,141,244,126,235,245,94,35,35,110,175,53,30,45,115,1,
+    185,31,212,177,222,178,103,6,107,13,86,101,96,197,4,175,
+    21,62,151,157,45,187,251,22,136,144,209,105,133,18,240,94,
+    65,218,203,172,142,240,244,2,37,204,147,171,7,241,22,21,
+    177,78,234,22,67,171,254,49,61,221,237,142,43,122,82,98,
+    81,209,160,240,192,98,9,50,141,42,59,58,10,58,101,149,
+    154,91,100,193,60,60,125,185,19,89,129,109,131,213,91,30,
+    53,171,35,33,149,15,170,180,162,143,35,188,71,176,33,96,
+    135,208,214,238,235,238,46,104,38,214,217,89,98,39,81,37,
+    245,100,181,181,124,103,215,242,164,236,249,87,85,13,0,49,
+    94,203,251,237,127,11,189,24,175,129,248,182,78,190,25,32,
+    201,244,157,151,154,233,179,141,196,11,205,196,11,95,125,184,
+    149,120,217,74,188,220,202,142,53,179,19,86,114,162,29,38,
+    135,142,52,51,167,62,63,213,156,152,253,251,241,230,196,149,
+    70,230,74,59,24,24,76,57,7,20,43,132,207,190,103,96,
+    209,85,212,170,170,194,0,42,203,21,7,32,4,191,83,154,
+    156,98,71,107,119,122,176,181,177,165,10,250,89,92,148,208,
+    171,211,241,245,208,5,108,143,40,134,41,85,52,133,218,188,
+    46,87,150,168,29,132,61,213,238,236,195,146,182,40,117,246,
+    97,169,139,148,29,150,87,86,32,203,103,39,167,29,133,237,
+    181,83,71,69,48,235,199,158,224,72,79,96,255,152,165,232,
+    231,208,106,192,153,161,59,124,18,27,185,146,17,70,212,63,
+    96,113,98,167,56,43,147,50,251,129,141,181,163,49,199,49,
+    72,219,1,33,154,106,147,189,226,155,35,68,72,108,152,205,
+    132,216,136,31,109,198,143,110,94,220,138,159,176,226,39,190,
+    22,6,173,212,116,67,152,105,10,51,150,48,179,61,50,186,
+    49,208,129,29,106,44,62,58,196,196,6,102,168,159,172,111,
+    134,182,18,199,173,196,241,175,71,198,254,100,108,190,212,60,
+    246,70,99,124,186,57,222,169,15,218,36,56,56,196,196,157,
+    139,173,204,179,15,51,185,173,76,238,235,225,211,214,185,55,
+    224,250,155,220,56,247,102,243,220,155,214,240,108,99,120,182,
+    57,60,251,40,24,56,52,180,67,64,180,93,241,45,212,29,
+    157,161,195,56,116,24,135,222,254,31,13,29,33,207,76,110,
+    132,154,145,17,139,93,140,98,115,185,236,83,100,170,250,40,
+    6,45,12,85,28,173,152,250,121,22,124,228,6,18,3,72,
+    241,250,106,65,165,134,142,155,159,221,215,57,126,237,52,82,
+    162,147,209,74,110,35,82,198,215,168,99,253,163,227,209,166,
+    255,136,116,139,137,147,140,183,93,203,42,148,39,140,32,254,
+    212,111,170,43,150,144,35,255,32,222,212,56,141,169,241,139,
+    152,26,31,135,212,56,121,232,110,244,211,104,43,50,208,140,
+    228,172,201,25,192,104,16,106,55,16,245,89,128,102,84,188,
+    127,230,222,153,86,36,221,140,140,90,207,92,0,237,40,106,
+    71,161,178,203,2,95,158,168,78,145,204,248,195,244,153,173,
+    244,153,207,223,253,106,172,145,190,208,76,95,168,191,179,157,
+    30,126,152,62,189,149,62,13,94,27,241,205,247,172,200,100,
+    35,50,217,140,76,90,207,189,5,254,25,244,207,132,235,239,
+    180,35,39,248,201,54,217,43,156,117,78,177,40,13,218,67,
+    229,115,121,141,253,208,104,228,123,126,167,116,80,31,238,81,
+    122,146,114,134,171,157,234,81,119,127,100,227,89,20,65,193,
+    126,216,129,87,24,31,117,237,246,170,45,192,147,251,171,166,
+    222,199,162,10,77,16,10,213,217,60,98,158,48,57,249,247,
+    212,222,232,124,23,121,213,249,125,225,53,125,142,56,149,134,
+    81,2,217,14,114,28,215,134,23,154,155,178,72,190,247,106,
+    145,179,150,247,106,145,9,203,123,181,72,214,234,94,45,50,
+    100,117,175,22,121,214,242,94,45,50,98,121,175,118,120,140,
+    131,154,124,175,184,243,246,35,188,237,236,182,94,226,66,92,
+    190,77,246,138,59,165,71,120,219,217,109,29,224,185,203,28,
+    108,35,251,202,59,83,143,216,125,167,87,147,12,113,99,232,
+    235,23,119,214,177,239,177,157,221,214,129,11,28,7,108,216,
+    95,110,252,242,17,187,239,28,160,103,161,248,47,248,136,240,
+    83,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/ruby/network/simple/SimpleNetwork.py",
+    "m5.objects.SimpleNetwork",
+    embedded_module_data,
+    2705,
+    6103);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,46 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   /root/package/src/mem/slicc/symbols/Type.py:643
+ */
+
+#ifndef __DMARequestType_HH__
+#define __DMARequestType_HH__
+
+#include <iostream>
+#include <string>
+
+namespace gem5
+{
+
+namespace ruby
+{
+
+
+// Class definition
+/** \enum DMARequestType
+ *  \brief ...
+ */
+enum DMARequestType {
+    DMARequestType_FIRST,
+    DMARequestType_READ = DMARequestType_FIRST, /**< Memory Read */
+    DMARequestType_WRITE, /**< Memory Write */
+    DMARequestType_NULL, /**< Invalid */
+    DMARequestType_NUM
+};
+
+// Code to convert from a string to the enumeration
+DMARequestType string_to_DMARequestType(const ::std::string& str);
+
+// Code to convert state to a string
+::std::string DMARequestType_to_string(const DMARequestType& obj);
+
+// Code to increment an enumeration type
+DMARequestType &operator++(DMARequestType &e);
+
+::std::ostream&
+operator<<(::std::ostream& out, const DMARequestType& obj);
+
+} // namespace ruby
+} // namespace gem5
+#endif // __DMARequestType_HH__
@@ -0,0 +1,46 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   /root/package/src/mem/slicc/symbols/Type.py:643
+ */
+
+#ifndef __DMAResponseType_HH__
+#define __DMAResponseType_HH__
+
+#include <iostream>
+#include <string>
+
+namespace gem5
+{
+
+namespace ruby
+{
+
+
+// Class definition
+/** \enum DMAResponseType
+ *  \brief ...
+ */
+enum DMAResponseType {
+    DMAResponseType_FIRST,
+    DMAResponseType_DATA = DMAResponseType_FIRST, /**< DATA read */
+    DMAResponseType_ACK, /**< ACK write */
+    DMAResponseType_NULL, /**< Invalid */
+    DMAResponseType_NUM
+};
+
+// Code to convert from a string to the enumeration
+DMAResponseType string_to_DMAResponseType(const ::std::string& str);
+
+// Code to convert state to a string
+::std::string DMAResponseType_to_string(const DMAResponseType& obj);
+
+// Code to increment an enumeration type
+DMAResponseType &operator++(DMAResponseType &e);
+
+::std::ostream&
+operator<<(::std::ostream& out, const DMAResponseType& obj);
+
+} // namespace ruby
+} // namespace gem5
+#endif // __DMAResponseType_HH__
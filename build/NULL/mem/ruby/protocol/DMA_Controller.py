@@ -0,0 +1,19 @@
+#
+# DO NOT EDIT THIS FILE!
+# File automatically generated by
+#   /root/package/src/mem/slicc/symbols/StateMachine.py:305
+#
+
+from m5.params import *
+from m5.SimObject import SimObject
+from m5.objects.Controller import RubyController
+
+class DMA_Controller(RubyController):
+    type = 'DMA_Controller'
+    cxx_header = 'mem/ruby/protocol/DMA_Controller.hh'
+    cxx_class = 'gem5::ruby::DMA_Controller'
+    dma_sequencer = Param.DMASequencer("")
+    request_latency = Param.Cycles((6), "")
+    responseFromDir = Param.MessageBuffer("")
+    requestToDir = Param.MessageBuffer("")
+    mandatoryQueue = Param.MessageBuffer("")
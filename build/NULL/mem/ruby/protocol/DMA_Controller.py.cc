@@ -0,0 +1,64 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,83,187,79,27,49,24,183,239,17,18,8,161,109,
+    146,43,143,161,18,149,16,9,144,116,161,67,84,85,226,161,
+    86,173,32,180,5,150,27,122,58,206,230,209,218,185,96,223,
+    73,4,117,184,161,127,64,213,133,149,9,81,245,159,33,81,
+    164,156,110,237,196,82,165,162,83,167,218,129,4,162,34,21,
+    219,247,249,123,252,252,221,207,159,237,31,224,70,211,175,230,
+    139,69,33,142,0,2,8,18,176,33,103,133,64,170,152,10,
+    148,186,74,84,170,153,26,4,10,120,9,144,246,25,32,29,
+    107,39,42,0,223,213,110,34,83,71,177,117,144,27,56,151,
+    70,14,70,48,47,68,98,125,143,174,109,125,192,142,39,140,
+    212,59,127,171,182,228,86,60,230,18,130,153,115,147,134,214,
+    165,241,179,67,3,3,19,34,96,42,226,83,17,52,53,164,
+    152,58,142,29,15,128,91,26,82,79,160,32,2,123,68,226,
+    2,153,184,21,169,9,172,34,176,74,15,59,40,176,67,119,
+    202,154,188,51,114,248,206,200,20,210,69,201,98,81,106,121,
+    117,193,186,174,204,225,99,138,105,145,137,106,21,171,204,245,
+    92,199,37,197,126,68,97,119,247,112,124,7,211,249,82,73,
+    194,74,165,254,112,4,206,99,34,127,57,55,18,197,45,171,
+    98,83,108,89,209,160,101,81,23,249,68,234,73,203,218,247,
+    109,114,21,209,188,90,21,71,131,206,193,129,181,139,109,36,
+    214,39,164,238,16,155,243,72,127,99,51,155,70,73,241,135,
+    117,188,239,227,138,35,226,195,136,218,22,239,153,177,165,154,
+    67,48,143,70,152,116,113,207,34,182,39,34,181,104,120,21,
+    115,110,239,224,69,127,123,91,224,68,156,87,221,10,199,47,
+    152,75,151,247,88,148,188,90,176,225,74,43,69,237,10,178,
+    61,151,213,222,250,216,199,223,192,133,172,210,159,194,150,191,
+    71,80,177,188,185,178,82,252,111,97,170,53,38,111,73,71,
+    200,67,224,159,132,8,122,61,28,154,8,150,195,251,79,131,
+    215,225,189,217,224,85,152,25,107,101,166,26,153,169,99,86,
+    207,228,155,153,124,176,26,26,19,71,228,43,57,94,56,85,
+    234,198,76,211,152,9,214,132,171,101,228,26,70,238,116,178,
+    110,204,53,141,57,225,74,143,182,210,83,141,180,92,152,206,
+    55,211,249,96,37,204,142,183,178,211,141,236,244,233,131,122,
+    118,182,153,157,13,202,178,179,241,46,157,178,56,233,4,157,
+    47,84,101,65,121,148,20,106,239,121,48,249,0,162,172,112,
+    185,29,155,23,174,247,196,244,110,6,54,38,69,39,225,132,
+    172,76,252,217,229,137,62,103,143,132,41,239,21,255,40,68,
+    91,133,16,182,83,0,142,158,129,135,151,35,4,147,103,253,
+    35,4,79,206,250,71,91,139,195,185,54,248,87,124,121,255,
+    75,78,191,111,9,117,200,252,5,27,233,29,94,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/build/NULL/mem/ruby/protocol/DMA_Controller.py",
+    "m5.objects.DMA_Controller",
+    embedded_module_data,
+    637,
+    1105);
+
+} // anonymous namespace
+} // namespace gem5
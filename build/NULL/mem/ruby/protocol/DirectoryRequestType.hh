@@ -0,0 +1,44 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   /root/package/src/mem/slicc/symbols/Type.py:643
+ */
+
+#ifndef __DirectoryRequestType_HH__
+#define __DirectoryRequestType_HH__
+
+#include <iostream>
+#include <string>
+
+namespace gem5
+{
+
+namespace ruby
+{
+
+
+// Class definition
+/** \enum DirectoryRequestType
+ *  \brief ...
+ */
+enum DirectoryRequestType {
+    DirectoryRequestType_FIRST,
+    DirectoryRequestType_Default = DirectoryRequestType_FIRST, /**< Replace this with access_types passed to the Directory Ruby object */
+    DirectoryRequestType_NUM
+};
+
+// Code to convert from a string to the enumeration
+DirectoryRequestType string_to_DirectoryRequestType(const ::std::string& str);
+
+// Code to convert state to a string
+::std::string DirectoryRequestType_to_string(const DirectoryRequestType& obj);
+
+// Code to increment an enumeration type
+DirectoryRequestType &operator++(DirectoryRequestType &e);
+
+::std::ostream&
+operator<<(::std::ostream& out, const DirectoryRequestType& obj);
+
+} // namespace ruby
+} // namespace gem5
+#endif // __DirectoryRequestType_HH__
@@ -0,0 +1,24 @@
+#
+# DO NOT EDIT THIS FILE!
+# File automatically generated by
+#   /root/package/src/mem/slicc/symbols/StateMachine.py:305
+#
+
+from m5.params import *
+from m5.SimObject import SimObject
+from m5.objects.Controller import RubyController
+
+class Directory_Controller(RubyController):
+    type = 'Directory_Controller'
+    cxx_header = 'mem/ruby/protocol/Directory_Controller.hh'
+    cxx_class = 'gem5::ruby::Directory_Controller'
+    directory = Param.RubyDirectoryMemory("")
+    directory_latency = Param.Cycles((12), "")
+    to_memory_controller_latency = Param.Cycles((1), "")
+    forwardFromDir = Param.MessageBuffer("")
+    responseFromDir = Param.MessageBuffer("")
+    dmaResponseFromDir = Param.MessageBuffer("")
+    requestToDir = Param.MessageBuffer("")
+    dmaRequestToDir = Param.MessageBuffer("")
+    requestToMemory = Param.MessageBuffer("")
+    responseFromMemory = Param.MessageBuffer("")
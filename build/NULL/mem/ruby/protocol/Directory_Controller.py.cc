@@ -0,0 +1,71 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,148,77,79,26,65,24,199,103,151,5,69,17,121,
+    113,41,244,213,151,212,184,134,23,107,106,98,8,241,160,166,
+    77,27,197,6,237,133,203,102,217,29,95,218,93,22,103,33,
+    21,79,28,250,29,218,244,82,211,131,165,241,226,103,232,39,
+    0,66,194,102,110,77,79,222,104,236,169,167,206,128,172,88,
+    105,178,187,179,207,204,60,243,155,103,254,240,60,187,63,65,
+    223,229,188,234,47,87,137,249,0,20,160,48,42,216,161,61,
+    171,50,26,155,101,25,58,118,168,14,141,203,114,12,96,193,
+    115,160,112,239,129,226,132,220,169,3,128,51,71,47,80,214,
+    169,184,182,129,48,116,65,39,2,131,153,121,98,220,219,7,
+    218,86,238,13,148,139,100,226,205,148,114,229,53,61,95,68,
+    186,170,66,36,247,203,224,122,50,190,51,84,6,4,89,70,
+    1,89,150,60,14,133,201,114,10,155,117,66,215,201,16,24,
+    112,41,142,83,178,231,140,177,132,12,19,210,61,144,228,8,
+    203,18,150,181,216,145,255,178,206,91,236,40,97,61,182,20,
+    140,217,38,189,182,201,113,219,164,207,54,233,183,77,6,108,
+    147,193,110,25,224,137,245,3,68,242,174,163,178,120,157,243,
+    99,65,131,90,2,145,58,72,20,144,94,212,101,93,77,12,
+    226,226,251,251,199,147,123,80,91,74,38,41,156,76,14,130,
+    48,184,160,146,46,232,217,105,97,2,15,139,98,94,210,160,
+    40,226,17,81,212,116,165,164,210,177,71,20,15,75,146,122,
+    181,194,21,203,5,136,71,228,163,35,113,31,74,10,9,226,
+    166,99,89,149,12,3,59,95,73,72,210,112,144,214,169,117,
+    224,38,212,136,197,110,165,231,192,174,181,178,172,66,3,251,
+    45,151,168,74,69,152,151,203,248,126,81,23,181,206,6,81,
+    182,116,90,171,99,155,208,48,164,61,184,90,218,221,37,39,
+    123,119,117,244,78,66,202,51,164,107,228,56,60,142,160,81,
+    208,243,6,236,57,2,138,38,101,254,241,121,16,60,44,65,
+    163,184,163,119,182,116,136,126,135,181,124,165,59,208,31,180,
+    235,251,6,46,105,166,254,60,205,149,14,84,37,145,126,189,
+    177,145,176,153,150,66,25,209,119,176,99,70,201,99,252,32,
+    166,98,221,230,232,84,101,221,244,167,42,47,77,223,98,229,
+    133,233,227,91,62,161,225,19,170,211,117,95,172,233,139,17,
+    87,248,193,103,207,39,207,73,174,186,88,15,199,155,225,120,
+    141,227,205,153,185,175,169,47,169,115,255,121,166,62,179,220,
+    156,89,174,113,147,38,127,183,197,207,53,248,185,106,160,206,
+    71,155,124,180,146,54,67,247,90,33,161,17,162,209,66,177,
+    102,40,86,217,50,35,15,91,145,104,35,18,173,102,234,145,
+    133,102,100,161,198,133,204,96,184,21,156,109,4,103,79,80,
+    61,56,223,12,206,87,54,6,237,180,23,172,219,208,100,239,
+    55,167,5,23,118,107,75,241,2,45,20,3,123,200,208,250,
+    194,33,250,13,195,60,113,233,157,185,17,191,254,227,144,179,
+    23,1,61,162,166,19,112,138,38,97,56,213,173,212,21,244,
+    152,76,105,41,27,111,137,105,59,24,134,105,123,1,19,174,
+    129,59,221,102,130,233,218,205,102,130,133,218,205,214,230,198,
+    152,39,109,112,219,124,92,249,69,187,223,3,150,58,98,254,
+    2,38,196,141,82,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/build/NULL/mem/ruby/protocol/Directory_Controller.py",
+    "m5.objects.Directory_Controller",
+    embedded_module_data,
+    741,
+    1556);
+
+} // anonymous namespace
+} // namespace gem5
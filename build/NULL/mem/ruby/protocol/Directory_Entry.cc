@@ -0,0 +1,30 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   /root/package/src/mem/slicc/symbols/Type.py:501
+ */
+
+#include <iostream>
+#include <memory>
+
+#include "mem/ruby/protocol/Directory_Entry.hh"
+#include "mem/ruby/system/RubySystem.hh"
+
+namespace gem5
+{
+
+namespace ruby
+{
+
+/** \brief Print the state of this object */
+void
+Directory_Entry::print(std::ostream& out) const
+{
+    out << "[Directory_Entry: ";
+    out << "DirectoryState = " << m_DirectoryState << " ";
+    out << "Sharers = " << m_Sharers << " ";
+    out << "Owner = " << m_Owner << " ";
+    out << "]";
+}
+} // namespace ruby
+} // namespace gem5
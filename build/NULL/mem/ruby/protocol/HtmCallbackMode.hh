@@ -0,0 +1,46 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   /root/package/src/mem/slicc/symbols/Type.py:643
+ */
+
+#ifndef __HtmCallbackMode_HH__
+#define __HtmCallbackMode_HH__
+
+#include <iostream>
+#include <string>
+
+namespace gem5
+{
+
+namespace ruby
+{
+
+
+// Class definition
+/** \enum HtmCallbackMode
+ *  \brief ...
+ */
+enum HtmCallbackMode {
+    HtmCallbackMode_FIRST,
+    HtmCallbackMode_HTM_CMD = HtmCallbackMode_FIRST, /**< htm command */
+    HtmCallbackMode_LD_FAIL, /**< htm transaction failed - inform via read */
+    HtmCallbackMode_ST_FAIL, /**< htm transaction failed - inform via write */
+    HtmCallbackMode_NUM
+};
+
+// Code to convert from a string to the enumeration
+HtmCallbackMode string_to_HtmCallbackMode(const ::std::string& str);
+
+// Code to convert state to a string
+::std::string HtmCallbackMode_to_string(const HtmCallbackMode& obj);
+
+// Code to increment an enumeration type
+HtmCallbackMode &operator++(HtmCallbackMode &e);
+
+::std::ostream&
+operator<<(::std::ostream& out, const HtmCallbackMode& obj);
+
+} // namespace ruby
+} // namespace gem5
+#endif // __HtmCallbackMode_HH__
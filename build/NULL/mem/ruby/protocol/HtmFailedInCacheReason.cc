@@ -0,0 +1,74 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   /root/package/src/mem/slicc/symbols/Type.py:935
+ */
+
+#include <cassert>
+#include <iostream>
+#include <string>
+
+#include "base/logging.hh"
+#include "mem/ruby/protocol/HtmFailedInCacheReason.hh"
+
+namespace gem5
+{
+
+namespace ruby
+{
+
+// Code for output operator
+::std::ostream&
+operator<<(::std::ostream& out, const HtmFailedInCacheReason& obj)
+{
+    out << HtmFailedInCacheReason_to_string(obj);
+    out << ::std::flush;
+    return out;
+}
+
+// Code to convert state to a string
+std::string
+HtmFailedInCacheReason_to_string(const HtmFailedInCacheReason& obj)
+{
+    switch(obj) {
+      case HtmFailedInCacheReason_NO_FAIL:
+        return "NO_FAIL";
+      case HtmFailedInCacheReason_FAIL_SELF:
+        return "FAIL_SELF";
+      case HtmFailedInCacheReason_FAIL_REMOTE:
+        return "FAIL_REMOTE";
+      case HtmFailedInCacheReason_FAIL_OTHER:
+        return "FAIL_OTHER";
+      default:
+        panic("Invalid range for type HtmFailedInCacheReason");
+    }
+    // Appease the compiler since this function has a return value
+    return "";
+}
+
+// Code to convert from a string to the enumeration
+HtmFailedInCacheReason
+string_to_HtmFailedInCacheReason(const std::string& str)
+{
+    if (str == "NO_FAIL") {
+        return HtmFailedInCacheReason_NO_FAIL;
+    } else if (str == "FAIL_SELF") {
+        return HtmFailedInCacheReason_FAIL_SELF;
+    } else if (str == "FAIL_REMOTE") {
+        return HtmFailedInCacheReason_FAIL_REMOTE;
+    } else if (str == "FAIL_OTHER") {
+        return HtmFailedInCacheReason_FAIL_OTHER;
+    } else {
+        panic("Invalid string conversion for %s, type HtmFailedInCacheReason", str);
+    }
+}
+
+// Code to increment an enumeration type
+HtmFailedInCacheReason&
+operator++(HtmFailedInCacheReason& e)
+{
+    assert(e < HtmFailedInCacheReason_NUM);
+    return e = HtmFailedInCacheReason(e+1);
+}
+} // namespace ruby
+} // namespace gem5
@@ -0,0 +1,24 @@
+#
+# DO NOT EDIT THIS FILE!
+# File automatically generated by
+#   /root/package/src/mem/slicc/symbols/StateMachine.py:305
+#
+
+from m5.params import *
+from m5.SimObject import SimObject
+from m5.objects.Controller import RubyController
+
+class L1Cache_Controller(RubyController):
+    type = 'L1Cache_Controller'
+    cxx_header = 'mem/ruby/protocol/L1Cache_Controller.hh'
+    cxx_class = 'gem5::ruby::L1Cache_Controller'
+    sequencer = Param.RubySequencer("")
+    cacheMemory = Param.RubyCache("")
+    cache_response_latency = Param.Cycles((12), "")
+    issue_latency = Param.Cycles((2), "")
+    send_evictions = Param.Bool("")
+    requestFromCache = Param.MessageBuffer("")
+    responseFromCache = Param.MessageBuffer("")
+    forwardToCache = Param.MessageBuffer("")
+    responseToCache = Param.MessageBuffer("")
+    mandatoryQueue = Param.MessageBuffer("")
@@ -0,0 +1,74 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,148,79,111,18,65,20,192,103,151,165,255,161,20,
+    89,192,106,53,165,105,40,253,195,214,54,189,16,227,129,26,
+    141,74,169,218,122,217,52,221,108,119,167,45,186,203,210,89,
+    86,75,79,28,252,2,54,38,24,47,114,106,48,189,248,25,
+    252,4,64,72,216,204,213,83,111,152,122,242,228,12,148,210,
+    166,152,176,51,251,230,189,183,191,121,243,118,230,237,254,2,
+    87,46,231,197,120,30,39,162,0,84,160,50,26,216,164,35,
+    171,49,58,43,178,12,213,29,154,67,231,68,142,1,44,120,
+    10,84,238,35,80,157,144,59,113,0,112,234,104,7,18,157,
+    106,223,6,136,244,159,81,35,194,96,102,150,136,193,141,148,
+    190,190,243,22,42,89,98,184,95,91,59,185,85,35,157,69,
+    134,166,65,164,92,77,131,107,167,241,147,161,105,64,32,50,
+    42,16,89,114,59,84,70,228,84,86,116,194,190,98,63,232,
+    114,169,142,19,50,231,148,185,76,100,128,144,131,61,145,67,
+    132,28,238,74,114,132,101,9,203,94,178,35,255,101,157,55,
+    88,23,97,221,61,101,48,74,72,79,79,228,88,207,164,183,
+    103,242,86,207,164,175,103,146,111,149,1,246,38,30,172,202,
+    202,62,148,58,39,126,20,214,161,46,32,82,5,66,6,25,
+    89,67,49,52,225,38,21,221,223,63,186,183,7,245,149,88,
+    140,162,177,216,77,4,131,179,17,178,214,25,221,241,100,196,
+    143,7,36,41,45,235,80,146,240,144,36,233,134,106,105,84,
+    31,145,164,3,75,214,46,158,112,217,92,6,226,33,229,240,
+    80,218,135,178,74,130,12,82,93,209,100,211,196,206,151,50,
+    146,117,236,162,21,186,1,15,44,152,86,40,96,118,212,102,
+    237,210,52,240,176,66,135,53,168,27,40,135,251,86,115,138,
+    6,77,236,111,58,37,4,205,140,145,54,161,164,201,89,50,
+    49,135,93,41,211,180,58,38,23,55,12,13,187,77,152,86,
+    37,248,62,165,100,83,132,198,174,53,104,154,242,30,140,91,
+    187,187,100,45,15,162,203,154,217,39,200,208,91,75,142,181,
+    227,118,92,238,93,3,125,144,145,186,105,180,236,209,54,210,
+    118,184,117,57,173,202,89,146,228,43,11,90,240,59,56,167,
+    199,243,119,105,199,74,105,170,144,124,147,72,8,61,157,70,
+    38,135,232,103,215,20,180,254,77,155,136,252,101,179,135,239,
+    231,31,219,99,177,252,115,219,179,152,127,102,123,248,186,103,
+    170,234,153,42,198,43,158,112,205,19,38,46,111,160,32,28,
+    11,197,80,197,59,93,243,78,231,95,216,19,161,111,91,95,
+    183,74,75,63,216,202,196,114,109,98,185,204,141,219,190,219,
+    133,196,113,162,56,89,220,169,248,34,53,95,36,191,102,243,
+    227,5,241,88,44,178,159,182,63,111,231,147,118,224,110,61,
+    48,91,13,204,150,150,42,129,104,45,16,45,115,62,59,56,
+    81,15,206,85,131,115,165,120,37,40,212,130,66,153,227,201,
+    180,58,63,83,229,103,74,222,10,63,95,227,231,201,84,255,
+    157,186,63,82,245,71,74,161,138,127,161,230,95,200,175,119,
+    161,104,67,161,246,171,38,35,125,120,80,95,137,102,104,97,
+    152,120,132,168,151,255,50,68,255,86,152,39,46,163,105,155,
+    209,206,126,33,103,59,2,154,164,162,25,112,138,238,252,192,
+    195,86,101,62,66,97,98,210,15,198,124,71,68,195,193,48,
+    76,195,13,152,96,25,4,90,221,6,161,242,245,110,131,197,
+    242,245,222,224,92,204,66,3,220,20,95,238,253,166,195,159,
+    46,143,154,201,252,3,234,242,130,58,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/build/NULL/mem/ruby/protocol/L1Cache_Controller.py",
+    "m5.objects.L1Cache_Controller",
+    embedded_module_data,
+    794,
+    1534);
+
+} // anonymous namespace
+} // namespace gem5
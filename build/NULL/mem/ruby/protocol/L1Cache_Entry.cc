@@ -0,0 +1,30 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   /root/package/src/mem/slicc/symbols/Type.py:501
+ */
+
+#include <iostream>
+#include <memory>
+
+#include "mem/ruby/protocol/L1Cache_Entry.hh"
+#include "mem/ruby/system/RubySystem.hh"
+
+namespace gem5
+{
+
+namespace ruby
+{
+
+/** \brief Print the state of this object */
+void
+L1Cache_Entry::print(std::ostream& out) const
+{
+    out << "[L1Cache_Entry: ";
+    out << "CacheState = " << m_CacheState << " ";
+    out << "Dirty = " << m_Dirty << " ";
+    out << "DataBlk = " << m_DataBlk << " ";
+    out << "]";
+}
+} // namespace ruby
+} // namespace gem5
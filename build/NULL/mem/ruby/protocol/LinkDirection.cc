@@ -0,0 +1,66 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   /root/package/src/mem/slicc/symbols/Type.py:935
+ */
+
+#include <cassert>
+#include <iostream>
+#include <string>
+
+#include "base/logging.hh"
+#include "mem/ruby/protocol/LinkDirection.hh"
+
+namespace gem5
+{
+
+namespace ruby
+{
+
+// Code for output operator
+::std::ostream&
+operator<<(::std::ostream& out, const LinkDirection& obj)
+{
+    out << LinkDirection_to_string(obj);
+    out << ::std::flush;
+    return out;
+}
+
+// Code to convert state to a string
+std::string
+LinkDirection_to_string(const LinkDirection& obj)
+{
+    switch(obj) {
+      case LinkDirection_In:
+        return "In";
+      case LinkDirection_Out:
+        return "Out";
+      default:
+        panic("Invalid range for type LinkDirection");
+    }
+    // Appease the compiler since this function has a return value
+    return "";
+}
+
+// Code to convert from a string to the enumeration
+LinkDirection
+string_to_LinkDirection(const std::string& str)
+{
+    if (str == "In") {
+        return LinkDirection_In;
+    } else if (str == "Out") {
+        return LinkDirection_Out;
+    } else {
+        panic("Invalid string conversion for %s, type LinkDirection", str);
+    }
+}
+
+// Code to increment an enumeration type
+LinkDirection&
+operator++(LinkDirection& e)
+{
+    assert(e < LinkDirection_NUM);
+    return e = LinkDirection(e+1);
+}
+} // namespace ruby
+} // namespace gem5
@@ -0,0 +1,66 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   /root/package/src/mem/slicc/symbols/Type.py:935
+ */
+
+#include <cassert>
+#include <iostream>
+#include <string>
+
+#include "base/logging.hh"
+#include "mem/ruby/protocol/LockStatus.hh"
+
+namespace gem5
+{
+
+namespace ruby
+{
+
+// Code for output operator
+::std::ostream&
+operator<<(::std::ostream& out, const LockStatus& obj)
+{
+    out << LockStatus_to_string(obj);
+    out << ::std::flush;
+    return out;
+}
+
+// Code to convert state to a string
+std::string
+LockStatus_to_string(const LockStatus& obj)
+{
+    switch(obj) {
+      case LockStatus_Unlocked:
+        return "Unlocked";
+      case LockStatus_Locked:
+        return "Locked";
+      default:
+        panic("Invalid range for type LockStatus");
+    }
+    // Appease the compiler since this function has a return value
+    return "";
+}
+
+// Code to convert from a string to the enumeration
+LockStatus
+string_to_LockStatus(const std::string& str)
+{
+    if (str == "Unlocked") {
+        return LockStatus_Unlocked;
+    } else if (str == "Locked") {
+        return LockStatus_Locked;
+    } else {
+        panic("Invalid string conversion for %s, type LockStatus", str);
+    }
+}
+
+// Code to increment an enumeration type
+LockStatus&
+operator++(LockStatus& e)
+{
+    assert(e < LockStatus_NUM);
+    return e = LockStatus(e+1);
+}
+} // namespace ruby
+} // namespace gem5
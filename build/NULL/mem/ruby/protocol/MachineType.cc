@@ -0,0 +1,528 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   /root/package/src/mem/slicc/symbols/Type.py:935
+ */
+
+#include <cassert>
+#include <iostream>
+#include <string>
+
+#include "base/logging.hh"
+#include "mem/ruby/protocol/MachineType.hh"
+
+#include "mem/ruby/protocol/L1Cache_Controller.hh"
+#include "mem/ruby/protocol/Directory_Controller.hh"
+#include "mem/ruby/protocol/DMA_Controller.hh"
+#include "mem/ruby/common/MachineID.hh"
+namespace gem5
+{
+
+namespace ruby
+{
+
+// Code for output operator
+::std::ostream&
+operator<<(::std::ostream& out, const MachineType& obj)
+{
+    out << MachineType_to_string(obj);
+    out << ::std::flush;
+    return out;
+}
+
+// Code to convert state to a string
+std::string
+MachineType_to_string(const MachineType& obj)
+{
+    switch(obj) {
+      case MachineType_L0Cache:
+        return "L0Cache";
+      case MachineType_L1Cache:
+        return "L1Cache";
+      case MachineType_L2Cache:
+        return "L2Cache";
+      case MachineType_L3Cache:
+        return "L3Cache";
+      case MachineType_Directory:
+        return "Directory";
+      case MachineType_DMA:
+        return "DMA";
+      case MachineType_Collector:
+        return "Collector";
+      case MachineType_L1Cache_wCC:
+        return "L1Cache_wCC";
+      case MachineType_L2Cache_wCC:
+        return "L2Cache_wCC";
+      case MachineType_CorePair:
+        return "CorePair";
+      case MachineType_TCP:
+        return "TCP";
+      case MachineType_TCC:
+        return "TCC";
+      case MachineType_TCCdir:
+        return "TCCdir";
+      case MachineType_SQC:
+        return "SQC";
+      case MachineType_RegionDir:
+        return "RegionDir";
+      case MachineType_RegionBuffer:
+        return "RegionBuffer";
+      case MachineType_Cache:
+        return "Cache";
+      case MachineType_Memory:
+        return "Memory";
+      case MachineType_MiscNode:
+        return "MiscNode";
+      case MachineType_NULL:
+        return "NULL";
+      default:
+        panic("Invalid range for type MachineType");
+    }
+    // Appease the compiler since this function has a return value
+    return "";
+}
+
+// Code to convert from a string to the enumeration
+MachineType
+string_to_MachineType(const std::string& str)
+{
+    if (str == "L0Cache") {
+        return MachineType_L0Cache;
+    } else if (str == "L1Cache") {
+        return MachineType_L1Cache;
+    } else if (str == "L2Cache") {
+        return MachineType_L2Cache;
+    } else if (str == "L3Cache") {
+        return MachineType_L3Cache;
+    } else if (str == "Directory") {
+        return MachineType_Directory;
+    } else if (str == "DMA") {
+        return MachineType_DMA;
+    } else if (str == "Collector") {
+        return MachineType_Collector;
+    } else if (str == "L1Cache_wCC") {
+        return MachineType_L1Cache_wCC;
+    } else if (str == "L2Cache_wCC") {
+        return MachineType_L2Cache_wCC;
+    } else if (str == "CorePair") {
+        return MachineType_CorePair;
+    } else if (str == "TCP") {
+        return MachineType_TCP;
+    } else if (str == "TCC") {
+        return MachineType_TCC;
+    } else if (str == "TCCdir") {
+        return MachineType_TCCdir;
+    } else if (str == "SQC") {
+        return MachineType_SQC;
+    } else if (str == "RegionDir") {
+        return MachineType_RegionDir;
+    } else if (str == "RegionBuffer") {
+        return MachineType_RegionBuffer;
+    } else if (str == "Cache") {
+        return MachineType_Cache;
+    } else if (str == "Memory") {
+        return MachineType_Memory;
+    } else if (str == "MiscNode") {
+        return MachineType_MiscNode;
+    } else if (str == "NULL") {
+        return MachineType_NULL;
+    } else {
+        panic("Invalid string conversion for %s, type MachineType", str);
+    }
+}
+
+// Code to increment an enumeration type
+MachineType&
+operator++(MachineType& e)
+{
+    assert(e < MachineType_NUM);
+    return e = MachineType(e+1);
+}
+/** \brief returns the base vector index for each machine type to be
+  * used by NetDest
+  *
+  * \return the base vector index for each machine type to be used by NetDest
+  * \see NetDest.hh
+  */
+int
+MachineType_base_level(const MachineType& obj)
+{
+    switch(obj) {
+      case MachineType_L0Cache:
+        return 0;
+      case MachineType_L1Cache:
+        return 1;
+      case MachineType_L2Cache:
+        return 2;
+      case MachineType_L3Cache:
+        return 3;
+      case MachineType_Directory:
+        return 4;
+      case MachineType_DMA:
+        return 5;
+      case MachineType_Collector:
+        return 6;
+      case MachineType_L1Cache_wCC:
+        return 7;
+      case MachineType_L2Cache_wCC:
+        return 8;
+      case MachineType_CorePair:
+        return 9;
+      case MachineType_TCP:
+        return 10;
+      case MachineType_TCC:
+        return 11;
+      case MachineType_TCCdir:
+        return 12;
+      case MachineType_SQC:
+        return 13;
+      case MachineType_RegionDir:
+        return 14;
+      case MachineType_RegionBuffer:
+        return 15;
+      case MachineType_Cache:
+        return 16;
+      case MachineType_Memory:
+        return 17;
+      case MachineType_MiscNode:
+        return 18;
+      case MachineType_NULL:
+        return 19;
+      case MachineType_NUM:
+        return 20;
+
+      default:
+        panic("Invalid range for type MachineType");
+    }
+    // Appease the compiler since this function has a return value
+    return -1;
+}
+
+/** \brief returns the machine type for each base vector index used by NetDest
+ *
+ * \return the MachineType
+ */
+MachineType
+MachineType_from_base_level(int type)
+{
+    switch(type) {
+      case 0:
+        return MachineType_L0Cache;
+      case 1:
+        return MachineType_L1Cache;
+      case 2:
+        return MachineType_L2Cache;
+      case 3:
+        return MachineType_L3Cache;
+      case 4:
+        return MachineType_Directory;
+      case 5:
+        return MachineType_DMA;
+      case 6:
+        return MachineType_Collector;
+      case 7:
+        return MachineType_L1Cache_wCC;
+      case 8:
+        return MachineType_L2Cache_wCC;
+      case 9:
+        return MachineType_CorePair;
+      case 10:
+        return MachineType_TCP;
+      case 11:
+        return MachineType_TCC;
+      case 12:
+        return MachineType_TCCdir;
+      case 13:
+        return MachineType_SQC;
+      case 14:
+        return MachineType_RegionDir;
+      case 15:
+        return MachineType_RegionBuffer;
+      case 16:
+        return MachineType_Cache;
+      case 17:
+        return MachineType_Memory;
+      case 18:
+        return MachineType_MiscNode;
+      case 19:
+        return MachineType_NULL;
+      default:
+        panic("Invalid range for type MachineType");
+    }
+}
+
+/** \brief The return value indicates the number of components created
+ * before a particular machine's components
+ *
+ * \return the base number of components for each machine
+ */
+int
+MachineType_base_number(const MachineType& obj)
+{
+    int base = 0;
+    switch(obj) {
+      case MachineType_NUM:
+        base += 0;
+        [[fallthrough]];
+      case MachineType_NULL:
+        base += 0;
+        [[fallthrough]];
+      case MachineType_MiscNode:
+        base += 0;
+        [[fallthrough]];
+      case MachineType_Memory:
+        base += 0;
+        [[fallthrough]];
+      case MachineType_Cache:
+        base += 0;
+        [[fallthrough]];
+      case MachineType_RegionBuffer:
+        base += 0;
+        [[fallthrough]];
+      case MachineType_RegionDir:
+        base += 0;
+        [[fallthrough]];
+      case MachineType_SQC:
+        base += 0;
+        [[fallthrough]];
+      case MachineType_TCCdir:
+        base += 0;
+        [[fallthrough]];
+      case MachineType_TCC:
+        base += 0;
+        [[fallthrough]];
+      case MachineType_TCP:
+        base += 0;
+        [[fallthrough]];
+      case MachineType_CorePair:
+        base += 0;
+        [[fallthrough]];
+      case MachineType_L2Cache_wCC:
+        base += 0;
+        [[fallthrough]];
+      case MachineType_L1Cache_wCC:
+        base += 0;
+        [[fallthrough]];
+      case MachineType_Collector:
+        base += DMA_Controller::getNumControllers();
+        [[fallthrough]];
+      case MachineType_DMA:
+        base += Directory_Controller::getNumControllers();
+        [[fallthrough]];
+      case MachineType_Directory:
+        base += 0;
+        [[fallthrough]];
+      case MachineType_L3Cache:
+        base += 0;
+        [[fallthrough]];
+      case MachineType_L2Cache:
+        base += L1Cache_Controller::getNumControllers();
+        [[fallthrough]];
+      case MachineType_L1Cache:
+        base += 0;
+        [[fallthrough]];
+      case MachineType_L0Cache:
+        break;
+      default:
+        panic("Invalid range for type MachineType");
+    }
+
+    return base;
+}
+
+/** \brief returns the total number of components for each machine
+ * \return the total number of components for each machine
+ */
+int
+MachineType_base_count(const MachineType& obj)
+{
+    switch(obj) {
+case MachineType_L0Cache:
+return 0;
+case MachineType_L1Cache:
+return L1Cache_Controller::getNumControllers();
+case MachineType_L2Cache:
+return 0;
+case MachineType_L3Cache:
+return 0;
+case MachineType_Directory:
+return Directory_Controller::getNumControllers();
+case MachineType_DMA:
+return DMA_Controller::getNumControllers();
+case MachineType_Collector:
+return 0;
+case MachineType_L1Cache_wCC:
+return 0;
+case MachineType_L2Cache_wCC:
+return 0;
+case MachineType_CorePair:
+return 0;
+case MachineType_TCP:
+return 0;
+case MachineType_TCC:
+return 0;
+case MachineType_TCCdir:
+return 0;
+case MachineType_SQC:
+return 0;
+case MachineType_RegionDir:
+return 0;
+case MachineType_RegionBuffer:
+return 0;
+case MachineType_Cache:
+return 0;
+case MachineType_Memory:
+return 0;
+case MachineType_MiscNode:
+return 0;
+case MachineType_NULL:
+return 0;
+      case MachineType_NUM:
+      default:
+        panic("Invalid range for type MachineType");
+    }
+    // Appease the compiler since this function has a return value
+    return -1;
+}
+
+MachineID
+getL0CacheMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_L0Cache, RubyNode};
+      return mach;
+}
+
+MachineID
+getL1CacheMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_L1Cache, RubyNode};
+      return mach;
+}
+
+MachineID
+getL2CacheMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_L2Cache, RubyNode};
+      return mach;
+}
+
+MachineID
+getL3CacheMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_L3Cache, RubyNode};
+      return mach;
+}
+
+MachineID
+getDirectoryMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_Directory, RubyNode};
+      return mach;
+}
+
+MachineID
+getDMAMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_DMA, RubyNode};
+      return mach;
+}
+
+MachineID
+getCollectorMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_Collector, RubyNode};
+      return mach;
+}
+
+MachineID
+getL1Cache_wCCMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_L1Cache_wCC, RubyNode};
+      return mach;
+}
+
+MachineID
+getL2Cache_wCCMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_L2Cache_wCC, RubyNode};
+      return mach;
+}
+
+MachineID
+getCorePairMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_CorePair, RubyNode};
+      return mach;
+}
+
+MachineID
+getTCPMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_TCP, RubyNode};
+      return mach;
+}
+
+MachineID
+getTCCMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_TCC, RubyNode};
+      return mach;
+}
+
+MachineID
+getTCCdirMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_TCCdir, RubyNode};
+      return mach;
+}
+
+MachineID
+getSQCMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_SQC, RubyNode};
+      return mach;
+}
+
+MachineID
+getRegionDirMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_RegionDir, RubyNode};
+      return mach;
+}
+
+MachineID
+getRegionBufferMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_RegionBuffer, RubyNode};
+      return mach;
+}
+
+MachineID
+getCacheMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_Cache, RubyNode};
+      return mach;
+}
+
+MachineID
+getMemoryMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_Memory, RubyNode};
+      return mach;
+}
+
+MachineID
+getMiscNodeMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_MiscNode, RubyNode};
+      return mach;
+}
+
+MachineID
+getNULLMachineID(NodeID RubyNode)
+{
+      MachineID mach = {MachineType_NULL, RubyNode};
+      return mach;
+}
+} // namespace ruby
+} // namespace gem5
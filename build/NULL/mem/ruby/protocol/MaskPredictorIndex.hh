@@ -0,0 +1,46 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   /root/package/src/mem/slicc/symbols/Type.py:643
+ */
+
+#ifndef __MaskPredictorIndex_HH__
+#define __MaskPredictorIndex_HH__
+
+#include <iostream>
+#include <string>
+
+namespace gem5
+{
+
+namespace ruby
+{
+
+
+// Class definition
+/** \enum MaskPredictorIndex
+ *  \brief ...
+ */
+enum MaskPredictorIndex {
+    MaskPredictorIndex_FIRST,
+    MaskPredictorIndex_Undefined = MaskPredictorIndex_FIRST, /**< Undefined */
+    MaskPredictorIndex_DataBlock, /**< Data Block */
+    MaskPredictorIndex_PC, /**< Program Counter */
+    MaskPredictorIndex_NUM
+};
+
+// Code to convert from a string to the enumeration
+MaskPredictorIndex string_to_MaskPredictorIndex(const ::std::string& str);
+
+// Code to convert state to a string
+::std::string MaskPredictorIndex_to_string(const MaskPredictorIndex& obj);
+
+// Code to increment an enumeration type
+MaskPredictorIndex &operator++(MaskPredictorIndex &e);
+
+::std::ostream&
+operator<<(::std::ostream& out, const MaskPredictorIndex& obj);
+
+} // namespace ruby
+} // namespace gem5
+#endif // __MaskPredictorIndex_HH__
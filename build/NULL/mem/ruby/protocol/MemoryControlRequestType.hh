@@ -0,0 +1,44 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   /root/package/src/mem/slicc/symbols/Type.py:643
+ */
+
+#ifndef __MemoryControlRequestType_HH__
+#define __MemoryControlRequestType_HH__
+
+#include <iostream>
+#include <string>
+
+namespace gem5
+{
+
+namespace ruby
+{
+
+
+// Class definition
+/** \enum MemoryControlRequestType
+ *  \brief ...
+ */
+enum MemoryControlRequestType {
+    MemoryControlRequestType_FIRST,
+    MemoryControlRequestType_Default = MemoryControlRequestType_FIRST, /**< Replace this with access_types passed to the DMA Ruby object */
+    MemoryControlRequestType_NUM
+};
+
+// Code to convert from a string to the enumeration
+MemoryControlRequestType string_to_MemoryControlRequestType(const ::std::string& str);
+
+// Code to convert state to a string
+::std::string MemoryControlRequestType_to_string(const MemoryControlRequestType& obj);
+
+// Code to increment an enumeration type
+MemoryControlRequestType &operator++(MemoryControlRequestType &e);
+
+::std::ostream&
+operator<<(::std::ostream& out, const MemoryControlRequestType& obj);
+
+} // namespace ruby
+} // namespace gem5
+#endif // __MemoryControlRequestType_HH__
@@ -0,0 +1,74 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   /root/package/src/mem/slicc/symbols/Type.py:935
+ */
+
+#include <cassert>
+#include <iostream>
+#include <string>
+
+#include "base/logging.hh"
+#include "mem/ruby/protocol/MemoryRequestType.hh"
+
+namespace gem5
+{
+
+namespace ruby
+{
+
+// Code for output operator
+::std::ostream&
+operator<<(::std::ostream& out, const MemoryRequestType& obj)
+{
+    out << MemoryRequestType_to_string(obj);
+    out << ::std::flush;
+    return out;
+}
+
+// Code to convert state to a string
+std::string
+MemoryRequestType_to_string(const MemoryRequestType& obj)
+{
+    switch(obj) {
+      case MemoryRequestType_MEMORY_READ:
+        return "MEMORY_READ";
+      case MemoryRequestType_MEMORY_WB:
+        return "MEMORY_WB";
+      case MemoryRequestType_MEMORY_DATA:
+        return "MEMORY_DATA";
+      case MemoryRequestType_MEMORY_ACK:
+        return "MEMORY_ACK";
+      default:
+        panic("Invalid range for type MemoryRequestType");
+    }
+    // Appease the compiler since this function has a return value
+    return "";
+}
+
+// Code to convert from a string to the enumeration
+MemoryRequestType
+string_to_MemoryRequestType(const std::string& str)
+{
+    if (str == "MEMORY_READ") {
+        return MemoryRequestType_MEMORY_READ;
+    } else if (str == "MEMORY_WB") {
+        return MemoryRequestType_MEMORY_WB;
+    } else if (str == "MEMORY_DATA") {
+        return MemoryRequestType_MEMORY_DATA;
+    } else if (str == "MEMORY_ACK") {
+        return MemoryRequestType_MEMORY_ACK;
+    } else {
+        panic("Invalid string conversion for %s, type MemoryRequestType", str);
+    }
+}
+
+// Code to increment an enumeration type
+MemoryRequestType&
+operator++(MemoryRequestType& e)
+{
+    assert(e < MemoryRequestType_NUM);
+    return e = MemoryRequestType(e+1);
+}
+} // namespace ruby
+} // namespace gem5
@@ -0,0 +1,47 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   /root/package/src/mem/slicc/symbols/Type.py:643
+ */
+
+#ifndef __MemoryRequestType_HH__
+#define __MemoryRequestType_HH__
+
+#include <iostream>
+#include <string>
+
+namespace gem5
+{
+
+namespace ruby
+{
+
+
+// Class definition
+/** \enum MemoryRequestType
+ *  \brief ...
+ */
+enum MemoryRequestType {
+    MemoryRequestType_FIRST,
+    MemoryRequestType_MEMORY_READ = MemoryRequestType_FIRST, /**< Read request to memory */
+    MemoryRequestType_MEMORY_WB, /**< Write back data to memory */
+    MemoryRequestType_MEMORY_DATA, /**< Data read from memory */
+    MemoryRequestType_MEMORY_ACK, /**< Write to memory acknowledgement */
+    MemoryRequestType_NUM
+};
+
+// Code to convert from a string to the enumeration
+MemoryRequestType string_to_MemoryRequestType(const ::std::string& str);
+
+// Code to convert state to a string
+::std::string MemoryRequestType_to_string(const MemoryRequestType& obj);
+
+// Code to increment an enumeration type
+MemoryRequestType &operator++(MemoryRequestType &e);
+
+::std::ostream&
+operator<<(::std::ostream& out, const MemoryRequestType& obj);
+
+} // namespace ruby
+} // namespace gem5
+#endif // __MemoryRequestType_HH__
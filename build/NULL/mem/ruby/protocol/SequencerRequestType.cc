@@ -0,0 +1,86 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   /root/package/src/mem/slicc/symbols/Type.py:935
+ */
+
+#include <cassert>
+#include <iostream>
+#include <string>
+
+#include "base/logging.hh"
+#include "mem/ruby/protocol/SequencerRequestType.hh"
+
+namespace gem5
+{
+
+namespace ruby
+{
+
+// Code for output operator
+::std::ostream&
+operator<<(::std::ostream& out, const SequencerRequestType& obj)
+{
+    out << SequencerRequestType_to_string(obj);
+    out << ::std::flush;
+    return out;
+}
+
+// Code to convert state to a string
+std::string
+SequencerRequestType_to_string(const SequencerRequestType& obj)
+{
+    switch(obj) {
+      case SequencerRequestType_Default:
+        return "Default";
+      case SequencerRequestType_LD:
+        return "LD";
+      case SequencerRequestType_ST:
+        return "ST";
+      case SequencerRequestType_ATOMIC:
+        return "ATOMIC";
+      case SequencerRequestType_REPLACEMENT:
+        return "REPLACEMENT";
+      case SequencerRequestType_FLUSH:
+        return "FLUSH";
+      case SequencerRequestType_NULL:
+        return "NULL";
+      default:
+        panic("Invalid range for type SequencerRequestType");
+    }
+    // Appease the compiler since this function has a return value
+    return "";
+}
+
+// Code to convert from a string to the enumeration
+SequencerRequestType
+string_to_SequencerRequestType(const std::string& str)
+{
+    if (str == "Default") {
+        return SequencerRequestType_Default;
+    } else if (str == "LD") {
+        return SequencerRequestType_LD;
+    } else if (str == "ST") {
+        return SequencerRequestType_ST;
+    } else if (str == "ATOMIC") {
+        return SequencerRequestType_ATOMIC;
+    } else if (str == "REPLACEMENT") {
+        return SequencerRequestType_REPLACEMENT;
+    } else if (str == "FLUSH") {
+        return SequencerRequestType_FLUSH;
+    } else if (str == "NULL") {
+        return SequencerRequestType_NULL;
+    } else {
+        panic("Invalid string conversion for %s, type SequencerRequestType", str);
+    }
+}
+
+// Code to increment an enumeration type
+SequencerRequestType&
+operator++(SequencerRequestType& e)
+{
+    assert(e < SequencerRequestType_NUM);
+    return e = SequencerRequestType(e+1);
+}
+} // namespace ruby
+} // namespace gem5
@@ -0,0 +1,66 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   /root/package/src/mem/slicc/symbols/Type.py:935
+ */
+
+#include <cassert>
+#include <iostream>
+#include <string>
+
+#include "base/logging.hh"
+#include "mem/ruby/protocol/SeriesRequestGeneratorStatus.hh"
+
+namespace gem5
+{
+
+namespace ruby
+{
+
+// Code for output operator
+::std::ostream&
+operator<<(::std::ostream& out, const SeriesRequestGeneratorStatus& obj)
+{
+    out << SeriesRequestGeneratorStatus_to_string(obj);
+    out << ::std::flush;
+    return out;
+}
+
+// Code to convert state to a string
+std::string
+SeriesRequestGeneratorStatus_to_string(const SeriesRequestGeneratorStatus& obj)
+{
+    switch(obj) {
+      case SeriesRequestGeneratorStatus_Thinking:
+        return "Thinking";
+      case SeriesRequestGeneratorStatus_Request_Pending:
+        return "Request_Pending";
+      default:
+        panic("Invalid range for type SeriesRequestGeneratorStatus");
+    }
+    // Appease the compiler since this function has a return value
+    return "";
+}
+
+// Code to convert from a string to the enumeration
+SeriesRequestGeneratorStatus
+string_to_SeriesRequestGeneratorStatus(const std::string& str)
+{
+    if (str == "Thinking") {
+        return SeriesRequestGeneratorStatus_Thinking;
+    } else if (str == "Request_Pending") {
+        return SeriesRequestGeneratorStatus_Request_Pending;
+    } else {
+        panic("Invalid string conversion for %s, type SeriesRequestGeneratorStatus", str);
+    }
+}
+
+// Code to increment an enumeration type
+SeriesRequestGeneratorStatus&
+operator++(SeriesRequestGeneratorStatus& e)
+{
+    assert(e < SeriesRequestGeneratorStatus_NUM);
+    return e = SeriesRequestGeneratorStatus(e+1);
+}
+} // namespace ruby
+} // namespace gem5
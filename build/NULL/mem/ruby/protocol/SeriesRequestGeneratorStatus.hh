@@ -0,0 +1,45 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   /root/package/src/mem/slicc/symbols/Type.py:643
+ */
+
+#ifndef __SeriesRequestGeneratorStatus_HH__
+#define __SeriesRequestGeneratorStatus_HH__
+
+#include <iostream>
+#include <string>
+
+namespace gem5
+{
+
+namespace ruby
+{
+
+
+// Class definition
+/** \enum SeriesRequestGeneratorStatus
+ *  \brief ...
+ */
+enum SeriesRequestGeneratorStatus {
+    SeriesRequestGeneratorStatus_FIRST,
+    SeriesRequestGeneratorStatus_Thinking = SeriesRequestGeneratorStatus_FIRST, /**< Doing work before next action */
+    SeriesRequestGeneratorStatus_Request_Pending, /**< Request pending */
+    SeriesRequestGeneratorStatus_NUM
+};
+
+// Code to convert from a string to the enumeration
+SeriesRequestGeneratorStatus string_to_SeriesRequestGeneratorStatus(const ::std::string& str);
+
+// Code to convert state to a string
+::std::string SeriesRequestGeneratorStatus_to_string(const SeriesRequestGeneratorStatus& obj);
+
+// Code to increment an enumeration type
+SeriesRequestGeneratorStatus &operator++(SeriesRequestGeneratorStatus &e);
+
+::std::ostream&
+operator<<(::std::ostream& out, const SeriesRequestGeneratorStatus& obj);
+
+} // namespace ruby
+} // namespace gem5
+#endif // __SeriesRequestGeneratorStatus_HH__
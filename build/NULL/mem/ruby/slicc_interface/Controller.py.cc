@@ -0,0 +1,107 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,86,203,111,19,71,28,158,245,99,177,227,196,33,
+    27,108,3,121,45,105,149,52,17,77,104,40,20,69,21,47,
+    39,165,33,109,136,66,168,132,69,181,108,118,198,201,194,62,
+    204,206,26,98,159,124,232,129,162,74,69,185,36,66,149,200,
+    9,169,226,159,177,35,75,177,230,132,212,83,110,65,112,234,
+    169,191,217,181,141,49,14,82,237,245,236,236,252,190,249,190,
+    223,107,71,254,7,181,124,194,245,251,187,203,48,108,35,140,
+    176,96,32,83,200,8,2,159,7,140,192,170,127,15,174,162,
+    0,186,129,112,240,55,132,67,68,120,21,68,232,117,176,65,
+    146,9,225,240,109,52,33,30,240,135,9,129,245,164,13,91,
+    123,72,240,173,181,7,68,115,97,65,152,212,90,69,67,13,
+    81,28,224,162,4,101,4,140,50,1,248,5,177,0,100,129,
+    76,24,7,51,34,57,182,27,65,29,62,56,244,74,0,121,
+    161,41,31,37,93,187,177,78,72,210,189,46,224,240,43,80,
+    121,29,104,162,123,128,55,222,145,87,196,199,218,176,189,71,
+    250,16,193,209,54,236,241,207,240,118,181,97,251,0,43,117,
+    196,198,32,186,143,177,253,71,250,208,253,9,246,4,96,19,
+    29,177,237,57,75,30,233,65,15,142,183,177,166,2,136,156,
+    196,189,109,12,167,96,245,52,57,133,143,183,161,7,128,121,
+    176,19,51,25,122,48,220,84,233,107,219,53,2,53,148,59,
+    237,90,71,88,106,195,158,249,12,182,191,13,59,138,79,64,
+    107,38,88,124,37,191,86,72,219,150,235,216,134,65,156,226,
+    240,58,49,47,204,206,58,176,58,59,123,109,141,186,142,170,
+    185,45,246,41,147,152,211,220,58,77,13,93,211,20,221,114,
+    137,147,85,53,50,253,41,120,106,99,99,149,161,226,196,53,
+    140,29,66,169,236,168,214,58,145,221,13,157,202,90,19,36,
+    131,41,103,91,152,202,174,237,112,255,138,35,11,88,182,179,
+    237,184,113,120,48,242,20,212,14,120,140,197,111,44,123,138,
+    195,228,219,63,45,164,211,50,117,85,151,200,166,170,109,232,
+    22,104,128,20,213,93,221,182,168,156,3,13,173,160,25,164,
+    8,230,77,121,45,159,205,194,10,213,139,68,62,39,155,4,
+    128,178,110,101,117,75,119,201,65,23,48,31,32,168,229,1,
+    175,103,113,101,142,100,213,188,225,202,6,144,91,90,65,206,
+    218,220,223,71,121,66,93,42,171,24,19,12,94,131,167,92,
+    217,194,42,68,80,144,193,154,39,178,109,129,37,247,181,65,
+    30,19,163,37,10,90,28,91,182,29,215,35,82,93,215,115,
+    119,93,86,193,15,147,239,253,0,44,102,86,129,181,174,37,
+    231,26,123,120,181,26,96,59,239,230,242,238,7,7,116,171,
+    97,129,196,89,246,19,89,83,129,9,203,247,253,85,5,240,
+    10,39,186,95,76,209,2,36,210,148,109,239,32,146,115,170,
+    163,154,4,50,91,252,110,217,166,84,95,51,136,140,65,86,
+    183,84,63,133,31,133,77,137,197,69,159,168,14,175,25,40,
+    167,151,239,20,47,254,223,141,190,79,75,19,95,176,136,162,
+    88,32,175,40,172,75,81,76,27,231,13,62,239,86,148,71,
+    121,213,168,91,66,110,33,71,88,84,219,220,84,52,67,165,
+    148,117,241,233,6,81,49,113,88,68,173,119,30,11,47,243,
+    72,88,112,193,114,217,177,199,144,109,112,130,197,126,129,24,
+    109,199,55,69,121,47,174,240,62,132,169,97,252,236,121,193,
+    98,80,74,71,241,218,147,50,241,14,108,63,63,3,18,126,
+    187,41,58,102,137,150,134,82,160,161,20,175,161,88,204,111,
+    38,133,55,19,19,211,124,141,178,94,135,120,86,165,222,52,
+    44,110,229,205,53,64,217,89,101,245,250,60,248,206,139,120,
+    219,171,0,139,241,87,73,241,203,193,82,205,38,82,188,38,
+    106,50,196,86,252,28,242,214,97,189,109,229,100,189,115,36,
+    7,154,128,197,126,144,162,143,96,98,93,68,132,101,200,61,
+    11,170,22,44,250,98,142,8,13,206,18,249,28,164,142,168,
+    166,210,90,54,150,194,246,19,171,131,225,111,244,142,31,30,
+    255,78,82,71,155,62,242,32,104,57,0,114,5,79,199,27,
+    206,194,143,154,240,94,149,154,223,90,108,160,52,87,59,126,
+    174,180,80,235,187,86,186,89,235,237,47,253,248,38,222,255,
+    167,254,76,223,9,252,110,254,97,150,110,212,164,161,125,105,
+    124,79,26,175,69,165,167,177,114,226,234,219,96,160,95,124,
+    143,96,40,45,30,138,72,74,109,15,110,13,238,168,229,51,
+    215,43,125,233,106,95,186,116,243,205,224,153,151,11,47,22,
+    106,145,174,114,247,21,128,15,113,248,144,88,14,157,2,124,
+    255,201,237,179,91,103,119,30,149,71,231,42,210,124,85,154,
+    47,45,190,73,14,108,27,91,198,238,204,174,83,73,78,86,
+    147,147,165,91,181,196,233,237,187,91,119,119,232,238,245,74,
+    98,188,154,24,47,45,213,164,212,190,52,186,39,141,238,206,
+    84,164,177,170,52,6,242,221,104,228,203,151,198,11,163,22,
+    137,30,6,132,232,249,183,225,208,8,136,193,80,14,13,128,
+    53,53,250,252,97,121,244,102,37,185,88,77,46,2,107,207,
+    224,83,165,22,73,113,236,162,0,224,56,7,199,197,210,15,
+    128,133,176,239,61,187,183,51,246,215,100,121,236,74,165,231,
+    106,181,231,42,172,71,208,208,87,251,131,23,247,6,47,122,
+    225,204,183,135,51,50,185,63,124,105,111,248,146,103,157,3,
+    43,215,15,120,250,254,229,76,55,242,191,52,17,102,39,205,
+    11,83,254,75,79,167,62,250,51,226,240,63,45,44,10,102,
+    239,48,160,44,194,167,142,189,89,47,224,20,31,60,170,115,
+    188,1,34,223,251,47,234,101,231,91,120,228,103,37,205,194,
+    112,24,20,4,225,112,73,64,194,249,50,154,105,189,106,40,
+    85,110,92,53,148,44,55,174,67,113,90,16,15,209,167,195,
+    243,95,223,242,219,251,14,38,207,143,255,0,117,48,179,188,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/ruby/slicc_interface/Controller.py",
+    "m5.objects.Controller",
+    embedded_module_data,
+    1328,
+    2478);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,55 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,82,207,107,212,64,20,126,147,100,211,100,183,136,
+    221,5,43,254,128,224,193,186,69,187,167,30,92,165,32,20,
+    69,197,181,180,226,33,151,144,102,166,221,45,201,102,157,73,
+    96,211,83,14,254,15,122,244,84,16,255,153,69,4,195,156,
+    4,79,222,182,180,39,79,190,201,54,75,173,61,56,63,190,
+    247,102,190,55,239,125,51,201,79,56,215,106,103,246,100,3,
+    225,3,80,160,36,132,55,51,75,74,171,133,90,164,187,58,
+    1,13,158,1,213,223,3,53,152,126,164,3,124,209,171,36,
+    174,65,107,59,208,54,127,169,69,155,72,178,138,96,239,12,
+    162,215,187,7,44,72,130,243,5,141,170,224,86,89,144,129,
+    75,40,184,26,78,157,18,76,164,185,53,102,126,90,128,75,
+    26,179,14,236,202,167,250,145,134,18,180,185,4,155,26,40,
+    161,38,91,219,233,110,182,57,224,88,55,230,217,43,22,33,
+    30,222,220,103,209,122,183,203,145,234,118,47,146,119,35,22,
+    117,20,213,17,9,79,131,36,229,76,116,46,4,173,245,251,
+    135,247,158,80,138,148,112,184,63,220,103,78,210,31,8,135,
+    86,97,14,50,163,120,72,133,147,196,189,118,93,90,158,55,
+    244,35,230,121,178,238,121,81,76,211,80,249,139,158,247,46,
+    245,195,51,198,72,178,17,147,118,48,30,123,65,232,11,33,
+    235,202,237,51,159,50,46,27,111,203,196,91,62,247,35,105,
+    171,210,219,170,172,52,113,135,13,19,217,240,113,203,43,165,
+    136,207,112,162,222,224,247,170,224,65,231,127,110,51,202,184,
+    137,7,74,184,143,83,60,66,200,231,189,104,56,249,102,113,
+    245,65,254,188,88,122,152,191,248,209,188,253,189,185,242,181,
+    185,82,88,87,190,89,55,38,183,158,30,235,90,203,60,5,
+    132,252,165,234,188,89,101,235,225,39,176,163,245,181,145,210,
+    45,164,165,92,30,143,51,185,136,222,252,143,224,70,21,207,
+    151,20,148,199,91,234,10,214,227,217,99,109,240,101,92,18,
+    165,109,15,97,170,19,66,166,61,2,228,250,4,150,103,163,
+    128,107,147,106,20,112,103,242,247,152,154,11,196,156,194,191,
+    240,177,125,172,204,233,37,84,169,227,15,192,86,215,86,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/ruby/structures/DirectoryMemory.py",
+    "m5.objects.DirectoryMemory",
+    embedded_module_data,
+    495,
+    799);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,102 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,149,205,111,19,71,20,192,119,237,181,137,63,146,
+    216,198,31,49,129,116,227,34,209,80,72,210,148,4,41,106,
+    81,9,224,96,26,135,52,129,3,22,210,106,188,59,33,11,
+    251,97,102,215,82,214,226,224,67,47,173,42,21,249,226,168,
+    151,250,80,161,86,92,64,234,31,208,63,97,29,89,202,106,
+    78,149,122,202,45,8,78,61,117,102,29,27,179,117,240,238,
+    206,215,251,189,247,102,223,123,227,253,135,25,248,5,142,251,
+    183,121,210,52,25,137,145,88,133,185,215,237,217,227,222,231,
+    246,62,197,175,114,37,142,101,124,204,42,35,249,191,103,36,
+    14,114,47,252,12,243,210,223,51,86,10,72,129,45,102,38,
+    120,72,39,51,44,102,47,146,38,180,37,171,119,203,143,161,
+    104,138,131,142,185,158,227,61,31,117,12,153,18,43,49,37,
+    31,121,252,18,91,226,36,95,41,0,131,173,83,204,144,159,
+    228,127,193,18,183,108,223,237,8,33,67,67,73,206,67,134,
+    9,25,25,70,250,24,24,125,65,250,151,131,186,100,103,47,
+    125,125,221,209,19,189,4,164,160,135,29,35,236,248,80,246,
+    148,52,226,97,99,39,190,103,72,10,123,216,56,97,19,67,
+    217,136,20,245,176,167,79,220,239,168,52,230,97,147,39,178,
+    227,82,204,195,166,62,194,198,61,108,250,196,253,142,75,9,
+    15,155,249,8,123,218,195,78,124,36,190,73,15,155,37,236,
+    153,97,44,156,124,124,182,175,231,205,246,57,41,69,74,57,
+    141,67,155,213,178,117,3,136,59,176,150,121,4,213,197,229,
+    101,68,22,150,151,221,165,34,84,117,100,213,114,42,84,231,
+    232,242,156,97,162,170,104,86,17,52,230,6,128,217,157,157,
+    90,92,4,21,32,202,166,197,203,26,95,182,76,104,96,230,
+    48,72,60,213,46,200,154,4,119,121,195,4,200,188,196,75,
+    112,27,84,21,147,95,226,183,117,196,47,93,185,76,89,94,
+    145,53,152,175,101,101,131,104,119,125,200,186,198,235,154,98,
+    241,34,245,131,125,243,43,181,133,178,162,139,79,120,67,174,
+    193,190,147,89,126,158,87,33,208,140,190,97,250,62,43,20,
+    220,34,28,162,47,92,203,221,176,68,5,26,174,71,160,241,
+    192,212,85,89,228,175,175,221,231,245,10,68,128,250,58,252,
+    134,130,169,245,170,90,134,136,215,183,7,32,227,144,117,141,
+    188,151,149,129,246,164,107,205,220,129,188,4,76,192,3,132,
+    128,85,155,62,137,49,193,163,99,100,74,28,216,203,128,46,
+    15,68,17,26,70,237,220,7,242,190,94,79,124,158,132,81,
+    81,120,121,155,154,69,36,14,6,161,72,58,244,42,18,33,
+    191,13,100,133,36,103,125,102,10,143,8,130,6,84,40,8,
+    56,44,8,170,46,85,21,58,142,10,194,211,42,80,142,37,
+    156,105,85,32,14,137,187,187,130,168,0,195,192,97,58,220,
+    129,64,130,8,7,54,0,2,42,14,119,83,76,131,137,57,
+    26,122,236,47,104,38,14,16,92,23,113,106,5,24,112,19,
+    86,20,32,66,21,106,230,134,174,200,162,133,195,247,16,132,
+    27,107,155,247,55,55,112,2,189,23,11,149,174,124,220,45,
+    6,193,45,12,161,44,155,152,91,209,117,5,135,100,67,144,
+    187,249,14,187,185,22,92,135,193,110,250,240,104,55,39,107,
+    192,132,26,117,210,157,210,12,225,49,26,200,235,52,80,43,
+    52,238,120,148,4,110,96,26,119,197,110,4,123,218,49,74,
+    124,176,50,214,11,227,22,13,49,9,6,173,164,45,203,48,
+    161,138,131,36,24,100,255,216,15,52,11,71,232,81,16,12,
+    87,242,7,243,150,30,167,127,207,27,72,156,27,118,76,250,
+    199,107,182,98,33,122,30,220,102,154,60,70,158,212,85,189,
+    127,57,145,116,253,166,19,155,169,23,156,248,98,253,206,223,
+    145,216,65,100,114,63,50,105,159,157,107,71,230,59,145,121,
+    34,141,198,127,46,252,88,120,94,254,161,248,83,177,126,203,
+    201,78,29,100,175,236,103,175,188,42,189,42,189,126,248,231,
+    195,191,22,218,217,124,39,155,183,185,180,147,158,108,202,13,
+    185,197,218,159,174,181,211,197,78,186,88,191,235,196,82,205,
+    112,35,188,183,104,231,190,110,199,174,117,98,215,168,175,244,
+    65,124,122,63,62,237,140,68,237,177,149,55,126,95,34,248,
+    142,33,77,253,206,81,148,73,157,105,174,53,214,90,113,251,
+    252,237,118,178,208,73,22,234,69,162,208,204,54,178,123,11,
+    246,39,75,237,248,213,78,252,42,217,43,225,30,52,30,236,
+    61,181,115,249,118,106,181,147,90,173,175,59,201,108,179,208,
+    40,236,1,123,250,102,59,121,171,147,188,69,116,39,206,253,
+    26,253,37,218,250,206,254,236,118,123,162,208,153,40,216,92,
+    202,201,156,109,62,107,60,107,93,183,47,228,219,153,213,78,
+    102,213,230,146,14,177,88,106,148,90,1,251,66,177,157,90,
+    239,164,214,137,197,68,230,32,145,219,79,228,90,75,191,45,
+    255,142,218,137,133,78,98,161,254,45,189,208,231,189,192,174,
+    207,4,241,148,186,56,171,187,95,100,99,214,91,155,50,169,
+    163,16,145,87,104,113,27,120,132,14,145,190,107,225,40,25,
+    245,191,228,136,235,217,67,23,105,227,154,191,68,243,60,242,
+    85,247,44,93,67,95,144,41,253,99,48,158,146,230,200,207,
+    178,236,209,18,195,94,182,153,75,221,219,97,50,118,239,118,
+    152,180,221,187,29,38,103,127,120,31,5,39,216,47,143,152,
+    255,55,207,67,111,104,247,110,136,200,221,210,127,160,67,92,
+    235,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/ruby/structures/RubyCache.py",
+    "m5.objects.RubyCache",
+    embedded_module_data,
+    1233,
+    2282);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,84 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,84,75,111,219,70,16,222,165,72,138,162,100,57,
+    150,29,5,117,210,148,13,154,160,74,29,27,77,17,32,117,
+    141,2,109,236,22,73,11,217,136,221,67,213,0,4,197,93,
+    89,108,249,80,118,169,194,242,137,135,254,128,64,23,245,40,
+    244,16,160,232,95,232,143,144,1,31,136,61,5,232,73,55,
+    25,246,41,167,236,234,97,61,108,7,37,151,223,44,119,190,
+    157,157,25,14,231,63,48,113,41,67,121,90,225,208,2,8,
+    32,232,2,15,150,32,20,115,201,149,246,6,50,209,151,9,
+    87,246,148,146,2,129,4,190,7,72,254,3,32,5,43,175,
+    19,0,252,147,24,25,44,169,125,157,202,117,73,172,206,232,
+    146,72,219,5,133,84,87,188,20,32,83,119,27,52,196,30,
+    159,193,251,28,82,187,142,183,93,254,21,219,161,61,233,162,
+    60,114,177,8,133,139,24,148,32,2,37,137,63,9,4,75,
+    50,146,74,10,86,219,73,112,201,133,18,72,126,45,113,23,
+    164,115,23,180,43,185,10,82,103,184,169,247,112,147,51,92,
+    253,61,62,104,51,220,244,149,220,212,5,110,134,115,231,46,
+    229,234,40,61,195,205,94,105,55,131,230,102,184,243,40,203,
+    63,197,60,203,62,175,151,27,59,4,87,112,104,87,49,57,
+    92,222,199,222,163,245,117,194,87,215,215,103,116,119,61,236,
+    173,9,205,26,13,73,221,14,235,4,211,181,105,206,106,181,
+    218,21,31,236,240,126,177,238,149,49,49,130,138,81,27,106,
+    13,190,11,91,30,53,194,192,40,99,195,114,221,192,182,66,
+    140,186,218,204,6,236,135,196,193,212,112,124,35,172,98,163,
+    238,59,161,81,113,220,144,107,45,66,172,198,225,234,149,92,
+    63,240,31,92,224,51,208,229,165,3,190,59,252,101,143,212,
+    177,225,140,93,194,200,176,16,226,97,80,195,182,124,225,85,
+    224,27,150,110,76,92,53,107,31,27,200,169,84,48,225,103,
+    25,21,18,120,253,147,130,50,197,228,247,177,129,110,70,68,
+    241,217,216,179,178,19,246,67,245,44,250,155,144,251,56,52,
+    172,129,57,191,79,42,22,174,49,205,52,125,203,195,166,201,
+    116,211,244,2,84,119,197,60,99,154,47,235,150,59,212,200,
+    97,163,134,89,202,62,56,48,109,215,162,148,233,98,90,197,
+    22,194,132,41,59,22,177,60,166,254,244,212,15,191,120,200,
+    210,220,180,57,204,51,75,139,76,152,131,76,176,44,79,205,
+    228,123,38,36,150,227,155,158,67,41,166,108,126,176,207,34,
+    97,189,102,214,42,148,201,223,6,129,203,79,34,1,165,166,
+    112,154,233,2,77,90,117,42,225,223,224,84,20,209,219,2,
+    37,246,218,255,40,138,90,131,136,186,236,195,3,254,208,127,
+    57,68,231,119,156,190,25,109,198,215,86,162,167,241,194,227,
+    232,217,155,220,141,214,74,115,229,207,151,157,59,197,163,220,
+    246,113,110,59,250,33,190,108,237,250,114,235,69,243,69,172,
+    165,58,233,175,78,18,82,94,61,3,28,162,98,79,5,75,
+    31,180,54,154,27,109,216,126,120,180,120,239,120,241,94,244,
+    99,156,191,217,114,155,110,251,243,118,249,40,95,56,206,23,
+    162,237,120,33,223,90,110,46,199,218,92,79,130,169,199,39,
+    138,156,227,38,56,68,207,122,58,224,39,222,106,222,138,53,
+    189,147,249,146,91,23,42,73,168,196,77,110,143,194,153,106,
+    85,112,40,79,115,96,170,85,65,222,170,36,254,187,37,152,
+    62,206,10,211,55,183,118,158,111,61,249,102,111,107,179,88,
+    144,137,248,203,73,86,192,60,7,150,52,77,20,216,166,73,
+    62,20,75,253,243,62,18,240,241,8,158,136,68,94,159,78,
+    164,188,212,145,151,222,200,90,180,57,216,33,120,197,130,198,
+    22,188,71,171,65,191,181,210,213,65,211,37,162,43,179,20,
+    95,175,137,2,162,76,19,83,18,28,52,88,134,207,206,91,
+    49,81,70,145,14,78,158,246,230,173,182,49,40,218,175,201,
+    167,195,248,233,95,28,122,9,8,97,143,55,108,120,183,3,
+    62,153,28,49,184,209,25,141,24,228,59,163,17,131,59,157,
+    233,209,83,23,161,218,3,23,225,213,207,39,66,156,141,87,
+    87,18,48,213,3,23,225,213,237,19,33,206,46,81,245,99,
+    120,7,199,188,202,235,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/ruby/structures/RubyPrefetcher.py",
+    "m5.objects.RubyPrefetcher",
+    embedded_module_data,
+    950,
+    1803);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,53 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,81,207,107,212,64,20,126,147,73,226,254,40,162,
+    105,109,21,79,46,8,174,135,46,212,182,135,32,61,136,80,
+    84,168,197,21,196,92,134,52,51,237,182,100,182,235,76,2,
+    155,158,114,240,15,240,230,181,7,41,74,255,153,85,4,195,
+    156,4,79,222,86,234,201,147,51,217,102,93,177,224,204,155,
+    239,125,243,222,228,189,111,38,223,96,102,56,231,254,108,67,
+    195,91,160,64,81,12,207,39,30,149,222,138,45,142,3,140,
+    192,130,77,160,248,53,80,155,225,19,12,112,138,171,34,129,
+    77,157,46,180,221,239,102,211,70,10,221,213,80,239,238,243,
+    167,59,7,44,74,162,217,134,118,213,112,187,108,200,32,64,
+    20,2,75,47,76,145,46,100,5,14,115,143,47,193,5,131,
+    213,14,234,21,167,248,196,210,18,172,169,132,6,181,181,4,
+    71,93,126,150,238,100,47,246,5,123,144,238,238,50,113,180,
+    184,199,248,154,239,11,29,245,253,153,248,45,206,120,199,68,
+    59,50,17,105,148,164,130,201,206,159,252,114,175,167,96,171,
+    221,84,53,66,250,33,103,132,168,6,33,252,144,166,177,225,
+    115,132,188,74,195,248,60,99,39,217,128,169,122,52,28,146,
+    40,14,165,84,13,67,123,44,164,76,40,103,59,20,33,87,
+    13,163,171,155,201,132,113,229,234,16,235,39,10,135,253,76,
+    53,141,8,34,203,204,7,56,51,151,249,117,91,138,168,243,
+    31,129,131,76,184,250,108,9,45,189,228,170,134,124,58,139,
+    230,205,252,97,113,229,78,254,168,184,186,154,63,254,234,45,
+    125,241,90,159,188,214,241,250,59,255,189,248,232,173,124,246,
+    86,242,39,102,138,133,170,204,150,126,191,58,95,91,30,24,
+    197,82,213,12,21,135,195,76,205,105,54,253,157,194,174,206,
+    139,121,3,229,231,215,140,236,218,253,201,3,109,136,27,122,
+    139,140,40,166,97,140,17,66,99,31,208,245,17,44,77,172,
+    128,197,81,101,5,180,70,127,219,216,117,208,189,49,252,11,
+    111,94,254,48,238,231,5,169,82,198,111,175,68,193,82,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/ruby/structures/WireBuffer.py",
+    "m5.objects.WireBuffer",
+    embedded_module_data,
+    463,
+    731);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,94 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,85,205,79,27,71,20,159,93,175,55,182,177,131,
+    161,128,157,52,164,227,52,68,129,16,136,66,225,96,170,168,
+    106,42,90,80,66,171,2,23,43,210,106,189,59,198,27,246,
+    195,236,236,6,108,229,224,67,79,189,180,226,66,26,69,138,
+    213,3,77,149,75,255,147,154,8,169,171,57,69,234,41,55,
+    163,228,212,83,223,248,43,224,186,168,93,207,190,249,120,191,
+    153,223,155,223,188,241,254,137,78,60,225,118,253,118,9,204,
+    62,210,145,46,152,200,18,114,130,192,219,162,41,174,183,234,
+    80,187,150,214,145,136,190,68,122,232,59,164,75,68,56,8,
+    33,244,50,212,89,44,23,214,195,107,104,82,126,195,59,147,
+    2,75,220,53,29,109,139,232,95,231,31,18,205,131,1,97,
+    74,59,73,46,117,200,3,129,147,19,148,19,116,148,19,225,
+    13,233,66,78,210,197,92,152,200,181,115,168,207,163,135,116,
+    233,64,4,114,177,75,30,1,108,180,47,54,172,203,61,216,
+    216,25,216,115,61,216,1,192,198,251,97,73,66,143,244,96,
+    207,3,118,176,47,54,249,112,168,203,17,237,153,53,124,198,
+    46,99,61,216,15,206,192,246,70,51,242,63,176,163,128,29,
+    235,139,141,28,192,233,188,20,186,200,20,32,211,255,9,121,
+    65,31,128,116,136,179,216,183,126,190,188,86,166,30,177,42,
+    227,22,177,102,93,232,207,210,230,192,236,123,223,76,177,88,
+    25,219,36,214,124,54,203,1,217,236,123,215,82,229,119,195,
+    166,196,245,176,171,218,186,99,97,157,152,106,153,98,199,198,
+    22,161,84,221,36,152,216,219,62,241,9,246,12,24,193,215,
+    141,2,94,119,125,50,141,85,211,236,98,186,79,222,47,20,
+    136,75,177,234,242,137,5,199,213,136,142,61,7,23,213,71,
+    164,77,97,84,84,207,112,236,69,236,120,69,226,238,24,148,
+    175,245,111,43,97,74,60,108,120,16,208,142,141,11,166,186,
+    201,23,35,182,154,55,201,172,110,80,94,159,94,118,242,205,
+    103,160,80,229,150,78,10,170,111,122,88,83,181,34,193,121,
+    126,95,48,53,42,100,17,91,62,245,112,158,0,103,201,217,
+    1,6,167,128,189,29,167,114,211,246,173,124,171,155,231,132,
+    94,81,245,154,113,89,142,91,198,170,174,187,16,33,118,201,
+    182,111,64,139,161,74,162,165,51,118,154,151,176,178,178,65,
+    9,46,21,203,84,129,41,88,229,11,16,92,240,109,141,71,
+    165,154,221,125,81,207,1,109,32,100,208,216,44,99,31,102,
+    241,67,193,160,21,151,216,176,55,103,86,39,47,178,136,162,
+    216,170,69,20,133,197,20,197,114,116,223,228,237,184,162,108,
+    251,170,217,246,72,94,185,68,88,76,219,221,85,138,68,213,
+    137,203,162,188,173,153,42,165,44,252,141,234,170,22,147,62,
+    119,28,147,37,78,105,196,228,141,101,219,155,187,205,146,77,
+    93,20,174,139,146,47,123,176,173,100,107,191,237,33,208,129,
+    197,215,12,171,100,146,251,205,113,38,173,110,220,187,199,34,
+    157,125,50,185,149,70,76,6,54,98,123,44,164,218,101,38,
+    183,148,97,35,170,166,129,104,74,94,213,182,96,95,74,115,
+    235,44,90,116,60,197,52,108,206,6,57,164,64,254,121,174,
+    223,148,137,178,16,4,198,134,224,40,20,167,160,80,16,155,
+    216,26,228,19,139,108,216,212,216,180,137,206,46,182,206,137,
+    251,31,25,174,7,106,40,54,129,3,116,183,232,175,232,45,
+    191,30,127,101,168,171,205,158,113,29,74,101,87,6,92,211,
+    100,224,165,50,92,173,106,247,23,12,164,170,95,4,67,183,
+    170,43,65,242,122,117,249,245,200,133,253,149,189,149,32,146,
+    104,136,98,244,174,112,28,14,143,202,239,16,152,234,253,70,
+    28,165,199,247,31,239,61,14,34,177,122,252,206,113,72,76,
+    131,11,76,93,26,105,200,39,125,139,167,125,17,148,28,253,
+    99,48,243,106,48,83,187,250,66,60,28,188,113,52,120,163,
+    250,85,144,24,254,225,193,247,15,158,92,123,54,85,115,14,
+    19,11,71,137,133,234,210,235,15,241,243,236,211,108,147,95,
+    136,222,60,14,75,151,96,29,48,117,41,221,56,143,134,198,
+    246,99,123,177,39,243,181,43,135,201,137,163,228,68,117,57,
+    72,93,218,175,236,85,106,19,47,134,15,83,211,71,169,105,
+    32,12,210,227,207,163,79,163,181,43,63,37,158,37,234,210,
+    104,144,185,246,203,229,159,47,255,38,30,102,230,142,50,115,
+    117,233,114,171,184,87,59,194,172,78,202,44,109,205,207,180,
+    210,155,206,156,250,228,184,252,211,196,82,39,220,167,178,36,
+    10,142,18,79,63,56,56,222,116,157,221,182,228,31,115,211,
+    228,152,224,39,21,249,180,149,218,119,220,41,232,242,63,56,
+    186,13,166,17,18,4,161,177,128,132,185,58,186,125,178,4,
+    104,162,222,41,1,74,213,59,37,64,99,245,78,105,200,31,
+    9,159,52,208,63,205,143,227,199,188,122,215,199,213,12,233,
+    111,73,91,24,20,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/ruby/system/RubySystem.py",
+    "m5.objects.RubySystem",
+    embedded_module_data,
+    1109,
+    1984);
+
+} // anonymous namespace
+} // namespace gem5
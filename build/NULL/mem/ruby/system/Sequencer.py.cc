@@ -0,0 +1,190 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,88,91,111,219,216,17,38,117,179,36,235,158,216,
+    146,239,116,238,118,98,25,113,46,187,245,38,105,179,118,29,
+    43,173,47,72,188,5,214,221,130,166,69,218,146,75,137,90,
+    146,74,44,53,1,132,162,40,130,160,192,26,219,135,117,131,
+    0,113,129,34,72,177,64,31,251,11,250,3,164,133,128,21,
+    248,100,160,232,67,222,100,196,79,251,80,116,230,80,164,36,
+    74,78,186,50,61,162,231,118,230,204,153,115,230,59,254,55,
+    213,242,113,54,190,223,253,3,200,55,20,79,241,180,72,101,
+    232,117,154,198,119,155,104,91,211,191,237,107,148,141,186,71,
+    241,246,63,80,188,67,160,95,219,41,234,91,187,225,100,221,
+    65,100,78,144,185,4,135,69,230,36,178,30,144,185,59,100,
+    46,34,243,128,204,43,184,44,178,30,34,235,5,153,175,195,
+    206,205,251,31,82,19,129,183,248,199,4,173,249,231,68,41,
+    249,91,129,95,217,220,17,146,42,48,232,201,100,235,36,29,
+    198,36,119,109,56,73,129,90,167,121,106,221,6,191,118,158,
+    94,119,240,182,117,39,111,95,119,9,61,7,110,170,203,135,
+    119,240,206,215,96,249,173,205,12,192,99,163,4,47,239,122,
+    77,3,151,54,185,189,192,245,9,189,124,143,69,219,15,252,
+    0,239,182,104,7,137,118,144,247,88,180,67,192,15,243,94,
+    139,118,132,104,71,248,94,139,246,41,162,237,179,104,159,38,
+    218,167,121,191,69,187,15,248,253,124,192,162,29,37,218,81,
+    62,104,209,142,65,70,6,186,102,36,212,145,145,193,31,161,
+    59,4,186,195,221,116,133,145,157,81,211,206,106,53,6,86,
+    204,7,173,194,22,171,241,19,227,162,249,136,69,247,204,123,
+    116,79,89,116,207,190,71,247,180,69,247,28,223,7,229,218,
+    175,185,31,228,55,11,171,146,172,174,21,135,50,66,102,90,
+    134,63,167,149,130,162,194,187,33,138,167,82,197,211,219,66,
+    230,198,236,44,138,103,103,13,129,140,254,52,170,248,175,185,
+    213,207,24,37,205,11,140,180,197,168,169,180,194,24,26,211,
+    15,133,47,243,66,54,41,200,113,102,45,37,48,168,40,35,
+    75,81,153,28,200,21,70,73,73,121,145,103,54,5,38,41,
+    101,179,176,87,4,158,81,37,226,37,206,36,182,24,142,216,
+    164,56,133,201,228,69,53,157,19,133,134,225,37,33,190,29,
+    191,194,36,166,231,117,198,4,195,137,162,30,128,161,178,37,
+    201,96,175,164,179,219,162,62,116,146,203,26,195,224,32,82,
+    86,48,35,141,23,153,13,69,228,30,9,27,12,196,159,149,
+    30,131,178,40,66,48,27,233,44,75,220,109,20,31,160,34,
+    26,182,248,216,253,248,38,147,206,170,130,44,231,115,42,10,
+    84,89,2,59,25,101,138,144,229,73,56,45,211,134,168,100,
+    41,195,72,121,21,19,22,47,94,222,200,112,144,109,185,203,
+    176,13,167,44,232,146,8,54,138,125,24,45,147,75,75,109,
+    73,44,206,108,0,139,213,253,232,154,86,103,40,111,152,180,
+    185,130,37,183,186,2,214,123,93,161,188,221,85,127,75,84,
+    74,78,202,42,66,107,88,36,169,239,139,74,55,209,53,22,
+    138,126,189,248,24,137,28,156,197,17,158,83,57,48,72,66,
+    22,205,12,42,249,28,106,11,124,113,36,157,133,200,79,20,
+    71,218,106,10,252,228,242,203,19,231,53,55,203,102,185,140,
+    192,178,154,151,101,51,18,159,23,241,221,199,178,95,230,57,
+    177,33,113,168,133,156,160,185,185,77,69,149,185,164,170,121,
+    147,187,187,108,74,224,120,65,214,60,248,158,20,57,69,209,
+    156,171,156,204,101,52,123,34,171,106,61,143,4,89,73,75,
+    89,45,242,43,24,83,146,31,52,166,134,85,163,185,141,50,
+    210,130,243,66,78,22,146,28,68,165,27,59,73,138,180,176,
+    97,69,166,65,140,34,157,69,160,185,244,197,209,122,91,21,
+    67,214,5,214,130,150,146,208,66,214,133,211,130,150,165,214,
+    124,109,17,135,59,150,71,11,180,47,168,230,248,84,146,68,
+    45,156,199,45,198,226,217,192,170,2,9,46,156,69,83,85,
+    46,176,82,150,85,84,88,111,205,139,85,242,144,44,174,230,
+    130,137,11,144,49,59,151,45,104,189,196,80,105,72,12,141,
+    198,223,225,198,98,178,88,7,24,190,210,100,225,218,235,172,
+    80,90,97,97,109,89,197,56,109,254,78,189,195,99,238,7,
+    70,145,147,211,214,115,173,121,38,229,10,178,11,212,8,153,
+    130,95,5,187,80,201,252,169,245,246,149,230,107,193,83,165,
+    197,90,56,94,186,95,11,93,40,37,14,3,167,190,74,63,
+    79,239,211,251,51,149,192,104,53,48,90,186,119,24,28,47,
+    7,199,235,54,187,103,230,200,238,12,185,142,41,32,165,197,
+    186,143,242,15,63,91,217,95,44,95,88,172,248,18,85,95,
+    162,244,243,195,129,201,242,192,100,221,70,123,110,29,217,237,
+    131,160,10,164,236,232,175,187,169,192,200,51,182,230,30,44,
+    15,39,142,236,182,0,72,128,148,22,64,16,59,187,247,187,
+    242,217,217,74,244,147,106,244,147,178,227,116,173,255,252,158,
+    84,115,199,202,131,203,160,25,69,205,168,171,180,242,163,52,
+    7,206,239,251,202,231,111,87,98,119,170,177,59,101,71,95,
+    173,239,220,30,140,62,80,30,90,1,205,126,212,236,119,149,
+    150,81,115,244,149,247,133,247,224,198,155,51,149,216,84,53,
+    54,133,202,177,145,78,94,36,250,125,228,204,119,145,51,7,
+    55,255,54,251,70,174,68,102,170,145,153,210,47,106,254,200,
+    87,95,60,255,98,255,194,203,201,3,169,226,191,89,245,223,
+    44,45,24,246,215,203,19,139,149,88,162,26,75,180,56,109,
+    103,70,135,191,41,126,93,60,56,87,190,116,171,18,189,93,
+    141,222,134,89,233,143,28,55,22,174,13,87,25,8,226,221,
+    32,117,50,174,130,206,231,208,252,198,201,191,42,75,187,133,
+    34,115,82,247,35,98,108,129,3,221,90,32,145,46,79,184,
+    100,132,105,178,7,137,23,73,47,18,63,146,0,18,44,46,
+    61,226,105,36,87,13,242,27,44,186,17,170,189,232,6,161,
+    232,194,215,176,222,46,151,18,248,163,91,94,181,206,213,196,
+    144,56,235,238,115,21,92,7,61,93,17,129,221,130,183,220,
+    160,233,233,170,217,137,52,1,24,31,244,118,213,117,117,224,
+    76,31,232,250,187,234,186,33,134,118,221,192,137,49,120,0,
+    123,182,235,6,17,134,175,135,120,31,208,176,14,189,245,21,
+    53,55,119,177,175,117,189,154,236,225,147,143,131,84,74,198,
+    108,189,13,1,41,94,206,112,187,205,158,114,41,157,77,138,
+    113,6,14,238,45,65,133,110,3,112,3,91,184,202,101,121,
+    56,251,210,204,95,123,168,226,2,90,180,112,153,100,33,41,
+    10,6,12,49,218,236,166,0,127,11,12,15,173,4,175,8,
+    211,98,250,145,128,47,192,129,150,34,11,252,194,91,92,229,
+    98,104,14,212,86,185,180,12,160,2,244,211,124,210,214,146,
+    18,188,36,225,229,227,221,215,20,185,36,209,112,33,162,158,
+    218,84,123,83,229,9,253,196,182,99,218,236,152,146,246,76,
+    42,182,251,212,239,233,39,244,129,131,234,242,121,66,237,56,
+    79,120,119,153,254,218,46,66,112,73,179,193,106,216,139,255,
+    245,50,141,207,162,32,230,0,16,97,26,26,253,24,147,131,
+    104,13,206,108,220,119,146,92,48,211,3,249,203,229,13,112,
+    216,0,130,166,39,29,20,92,84,24,163,153,198,77,209,26,
+    194,78,232,200,249,12,100,156,64,64,89,122,4,8,139,39,
+    131,232,134,136,63,0,1,98,223,224,96,193,17,44,126,202,
+    41,2,160,179,56,179,44,101,167,64,211,50,148,137,79,243,
+    138,9,80,19,89,189,233,130,43,222,224,205,67,119,34,40,
+    210,180,39,216,120,121,162,71,243,102,110,196,27,206,52,111,
+    90,49,6,215,122,12,102,79,35,6,45,216,112,118,87,20,
+    209,151,34,159,2,23,114,20,200,132,93,115,40,130,184,165,
+    217,33,68,205,150,185,161,96,190,113,20,60,78,76,195,185,
+    92,158,24,22,71,218,118,66,220,34,126,140,203,254,107,10,
+    15,157,122,128,242,12,150,225,220,39,207,127,130,3,251,103,
+    247,229,151,197,234,216,213,74,112,166,26,156,41,187,27,207,
+    161,187,247,123,247,208,119,238,161,154,47,244,167,165,253,235,
+    47,111,191,57,87,157,188,11,205,194,227,133,102,225,241,214,
+    219,9,57,178,218,42,214,102,84,236,50,169,216,39,244,78,
+    75,149,177,230,73,100,225,219,90,248,246,22,190,89,173,60,
+    13,213,102,227,208,193,7,10,142,92,76,204,10,74,172,152,
+    37,135,235,216,134,92,177,240,76,103,109,181,180,153,55,92,
+    196,153,207,20,64,139,98,1,182,118,90,106,242,177,198,160,
+    88,8,224,124,156,150,133,124,14,134,50,157,37,165,12,12,
+    3,208,7,75,24,44,183,242,176,11,26,136,87,73,195,13,
+    135,83,1,64,194,197,39,11,154,16,244,244,74,94,221,150,
+    48,250,102,188,205,237,192,75,0,167,85,102,27,119,137,148,
+    223,78,145,88,31,254,50,49,55,135,17,171,82,82,2,231,
+    18,225,234,33,102,242,228,0,106,187,106,181,77,212,4,80,
+    12,15,177,39,85,177,208,172,232,229,9,167,22,32,40,11,
+    82,161,111,63,25,187,172,140,247,102,45,128,96,178,69,50,
+    134,101,107,147,111,161,204,149,35,195,43,54,82,180,122,205,
+    6,140,221,180,162,151,236,112,215,146,109,72,255,136,21,123,
+    89,175,216,16,53,126,177,202,220,120,230,168,186,71,106,204,
+    5,243,21,184,227,55,241,117,180,76,30,82,129,203,19,145,
+    174,157,153,52,101,210,158,131,24,140,7,7,159,195,91,132,
+    230,226,201,109,66,198,30,160,197,224,68,103,91,78,116,3,
+    63,43,154,107,142,156,237,90,196,56,199,89,53,5,53,148,
+    146,68,94,30,71,211,240,54,39,103,5,149,37,166,156,8,
+    139,174,185,240,32,79,243,242,79,113,220,121,170,19,22,92,
+    51,8,54,0,229,159,84,39,44,8,93,44,37,106,225,233,
+    210,253,67,0,86,236,115,118,255,65,197,207,84,253,76,105,
+    225,112,236,220,171,194,139,66,205,237,45,251,126,2,219,146,
+    65,12,199,0,182,28,174,187,168,193,177,87,195,47,134,107,
+    238,0,34,207,43,71,78,7,34,79,135,142,60,189,221,32,
+    30,216,0,206,253,252,249,231,123,114,121,104,170,226,143,87,
+    253,113,0,163,14,191,19,182,183,73,70,189,206,143,234,84,
+    39,209,167,100,76,196,252,252,255,216,44,132,235,177,184,182,
+    212,236,218,177,214,102,222,38,25,179,246,243,86,41,180,244,
+    147,192,89,179,4,44,171,176,100,144,63,83,93,192,217,8,
+    174,194,36,174,194,76,233,62,254,232,150,75,214,201,154,224,
+    108,225,196,201,158,12,206,120,135,5,238,184,121,39,36,198,
+    165,249,230,151,238,190,103,234,173,82,132,172,109,89,107,21,
+    190,253,25,120,45,198,172,128,197,40,239,229,9,207,7,0,
+    45,110,27,178,71,228,123,93,82,184,98,144,191,96,10,175,
+    91,82,56,128,248,118,6,241,45,228,177,81,183,111,34,229,
+    169,123,149,177,197,234,216,34,148,172,254,232,14,87,200,54,
+    246,192,94,52,251,104,188,237,159,171,178,157,108,97,16,231,
+    240,58,173,104,110,124,69,92,174,95,238,174,154,91,107,201,
+    140,173,61,222,31,220,183,244,255,2,220,145,215,26,117,170,
+    12,2,173,219,105,154,174,175,210,20,125,173,76,205,180,62,
+    53,42,90,54,158,26,213,95,54,158,186,107,138,190,83,167,
+    58,201,179,167,71,248,117,220,228,110,208,118,250,74,157,234,
+    36,123,139,71,248,117,220,228,250,166,232,143,208,200,74,80,
+    19,190,142,155,92,116,122,13,141,172,100,239,41,58,189,118,
+    220,228,250,156,116,130,174,83,221,233,222,199,71,228,251,248,
+    4,57,201,221,255,0,170,39,83,120,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/mem/ruby/system/Sequencer.py",
+    "m5.objects.Sequencer",
+    embedded_module_data,
+    2650,
+    6070);
+
+} // anonymous namespace
+} // namespace gem5
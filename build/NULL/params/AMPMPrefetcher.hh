@@ -0,0 +1,31 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__AMPMPrefetcher__
+#define __PARAMS__AMPMPrefetcher__
+
+namespace gem5 {
+namespace prefetch {
+class AMPM;
+} // namespace prefetch
+} // namespace gem5
+#include <cstddef>
+#include "params/AccessMapPatternMatching.hh"
+
+#include "params/QueuedPrefetcher.hh"
+
+namespace gem5
+{
+struct AMPMPrefetcherParams
+    : public QueuedPrefetcherParams
+{
+    gem5::prefetch::AMPM * create() const;
+    gem5::prefetch::AccessMapPatternMatching * ampm;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__AMPMPrefetcher__
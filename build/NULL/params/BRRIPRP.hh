@@ -0,0 +1,36 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__BRRIPRP__
+#define __PARAMS__BRRIPRP__
+
+namespace gem5 {
+namespace replacement_policy {
+class BRRIP;
+} // namespace replacement_policy
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/BaseReplacementPolicy.hh"
+
+namespace gem5
+{
+struct BRRIPRPParams
+    : public BaseReplacementPolicyParams
+{
+    gem5::replacement_policy::BRRIP * create() const;
+    int btp;
+    bool hit_priority;
+    int num_bits;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__BRRIPRP__
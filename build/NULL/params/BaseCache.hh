@@ -0,0 +1,97 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__BaseCache__
+#define __PARAMS__BaseCache__
+
+namespace gem5 {
+class BaseCache;
+} // namespace gem5
+#include <vector>
+#include "base/types.hh"
+#include "base/addr_range.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "enums/Clusivity.hh"
+#include <cstddef>
+#include "params/BaseCacheCompressor.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "params/BasePrefetcher.hh"
+#include <cstddef>
+#include <cstddef>
+#include "params/BaseReplacementPolicy.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "params/System.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "params/BaseTags.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "params/WriteAllocator.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+
+#include "params/ClockedObject.hh"
+
+#include "enums/Clusivity.hh"
+
+namespace gem5
+{
+struct BaseCacheParams
+    : public ClockedObjectParams
+{
+    std::vector< AddrRange > addr_ranges;
+    unsigned assoc;
+    enums::Clusivity clusivity;
+    gem5::compression::Base * compressor;
+    Cycles data_latency;
+    unsigned demand_mshr_reserve;
+    bool is_read_only;
+    Counter max_miss_count;
+    bool move_contractions;
+    unsigned mshrs;
+    gem5::prefetch::Base * prefetcher;
+    bool replace_expansions;
+    gem5::replacement_policy::Base * replacement_policy;
+    Cycles response_latency;
+    bool sequential_access;
+    uint64_t size;
+    gem5::System * system;
+    Cycles tag_latency;
+    gem5::BaseTags * tags;
+    unsigned tgts_per_mshr;
+    int warmup_percentage;
+    gem5::WriteAllocator * write_allocator;
+    unsigned write_buffers;
+    bool writeback_clean;
+    unsigned int port_cpu_side_connection_count;
+    unsigned int port_mem_side_connection_count;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__BaseCache__
@@ -0,0 +1,48 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__BaseCacheCompressor__
+#define __PARAMS__BaseCacheCompressor__
+
+namespace gem5 {
+namespace compression {
+class Base;
+} // namespace compression
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct BaseCacheCompressorParams
+    : public SimObjectParams
+{
+    int block_size;
+    unsigned chunk_size_bits;
+    unsigned comp_chunks_per_cycle;
+    Cycles comp_extra_latency;
+    unsigned decomp_chunks_per_cycle;
+    Cycles decomp_extra_latency;
+    int size_threshold_percentage;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__BaseCacheCompressor__
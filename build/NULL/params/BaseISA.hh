@@ -0,0 +1,25 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__BaseISA__
+#define __PARAMS__BaseISA__
+
+namespace gem5 {
+class BaseISA;
+} // namespace gem5
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct BaseISAParams
+    : public SimObjectParams
+{
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__BaseISA__
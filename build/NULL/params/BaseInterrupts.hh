@@ -0,0 +1,25 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__BaseInterrupts__
+#define __PARAMS__BaseInterrupts__
+
+namespace gem5 {
+class BaseInterrupts;
+} // namespace gem5
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct BaseInterruptsParams
+    : public SimObjectParams
+{
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__BaseInterrupts__
@@ -0,0 +1,31 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__BaseMMU__
+#define __PARAMS__BaseMMU__
+
+namespace gem5 {
+class BaseMMU;
+} // namespace gem5
+#include <cstddef>
+#include "params/BaseTLB.hh"
+#include <cstddef>
+#include "params/BaseTLB.hh"
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct BaseMMUParams
+    : public SimObjectParams
+{
+    gem5::BaseTLB * dtb;
+    gem5::BaseTLB * itb;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__BaseMMU__
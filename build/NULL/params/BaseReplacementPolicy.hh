@@ -0,0 +1,27 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__BaseReplacementPolicy__
+#define __PARAMS__BaseReplacementPolicy__
+
+namespace gem5 {
+namespace replacement_policy {
+class Base;
+} // namespace replacement_policy
+} // namespace gem5
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct BaseReplacementPolicyParams
+    : public SimObjectParams
+{
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__BaseReplacementPolicy__
@@ -0,0 +1,45 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__BaseXBar__
+#define __PARAMS__BaseXBar__
+
+namespace gem5 {
+class BaseXBar;
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/ClockedObject.hh"
+
+namespace gem5
+{
+struct BaseXBarParams
+    : public ClockedObjectParams
+{
+    Cycles forward_latency;
+    Cycles frontend_latency;
+    Cycles header_latency;
+    Cycles response_latency;
+    bool use_default_range;
+    unsigned width;
+    unsigned int port_cpu_side_ports_connection_count;
+    unsigned int port_mem_side_ports_connection_count;
+    unsigned int port_default_connection_count;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__BaseXBar__
@@ -0,0 +1,31 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__BasicPioDevice__
+#define __PARAMS__BasicPioDevice__
+
+namespace gem5 {
+class BasicPioDevice;
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/PioDevice.hh"
+
+namespace gem5
+{
+struct BasicPioDeviceParams
+    : public PioDeviceParams
+{
+    Addr pio_addr;
+    Tick pio_latency;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__BasicPioDevice__
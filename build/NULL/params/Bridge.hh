@@ -0,0 +1,41 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__Bridge__
+#define __PARAMS__Bridge__
+
+namespace gem5 {
+class Bridge;
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+#include <vector>
+#include "base/types.hh"
+#include "base/addr_range.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/ClockedObject.hh"
+
+namespace gem5
+{
+struct BridgeParams
+    : public ClockedObjectParams
+{
+    gem5::Bridge * create() const;
+    Tick delay;
+    std::vector< AddrRange > ranges;
+    unsigned req_size;
+    unsigned resp_size;
+    unsigned int port_mem_side_port_connection_count;
+    unsigned int port_cpu_side_port_connection_count;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__Bridge__
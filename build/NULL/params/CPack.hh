@@ -0,0 +1,28 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__CPack__
+#define __PARAMS__CPack__
+
+namespace gem5 {
+namespace compression {
+class CPack;
+} // namespace compression
+} // namespace gem5
+
+#include "params/BaseDictionaryCompressor.hh"
+
+namespace gem5
+{
+struct CPackParams
+    : public BaseDictionaryCompressorParams
+{
+    gem5::compression::CPack * create() const;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__CPack__
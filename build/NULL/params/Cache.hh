@@ -0,0 +1,26 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__Cache__
+#define __PARAMS__Cache__
+
+namespace gem5 {
+class Cache;
+} // namespace gem5
+
+#include "params/BaseCache.hh"
+
+namespace gem5
+{
+struct CacheParams
+    : public BaseCacheParams
+{
+    gem5::Cache * create() const;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__Cache__
@@ -0,0 +1,32 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__CowDiskImage__
+#define __PARAMS__CowDiskImage__
+
+namespace gem5 {
+class CowDiskImage;
+} // namespace gem5
+#include <cstddef>
+#include "params/DiskImage.hh"
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/DiskImage.hh"
+
+namespace gem5
+{
+struct CowDiskImageParams
+    : public DiskImageParams
+{
+    gem5::CowDiskImage * create() const;
+    gem5::DiskImage * child;
+    int table_size;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__CowDiskImage__
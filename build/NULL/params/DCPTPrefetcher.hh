@@ -0,0 +1,31 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__DCPTPrefetcher__
+#define __PARAMS__DCPTPrefetcher__
+
+namespace gem5 {
+namespace prefetch {
+class DCPT;
+} // namespace prefetch
+} // namespace gem5
+#include <cstddef>
+#include "params/DeltaCorrelatingPredictionTables.hh"
+
+#include "params/QueuedPrefetcher.hh"
+
+namespace gem5
+{
+struct DCPTPrefetcherParams
+    : public QueuedPrefetcherParams
+{
+    gem5::prefetch::DCPT * create() const;
+    gem5::prefetch::DeltaCorrelatingPredictionTables * dcpt;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__DCPTPrefetcher__
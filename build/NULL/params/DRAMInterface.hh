@@ -0,0 +1,173 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__DRAMInterface__
+#define __PARAMS__DRAMInterface__
+
+namespace gem5 {
+namespace memory {
+class DRAMInterface;
+} // namespace memory
+} // namespace gem5
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "enums/PageManage.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+
+#include "params/MemInterface.hh"
+
+#include "enums/PageManage.hh"
+
+namespace gem5
+{
+struct DRAMInterfaceParams
+    : public MemInterfaceParams
+{
+    gem5::memory::DRAMInterface * create() const;
+    double IDD0;
+    double IDD02;
+    double IDD2N;
+    double IDD2N2;
+    double IDD2P0;
+    double IDD2P02;
+    double IDD2P1;
+    double IDD2P12;
+    double IDD3N;
+    double IDD3N2;
+    double IDD3P0;
+    double IDD3P02;
+    double IDD3P1;
+    double IDD3P12;
+    double IDD4R;
+    double IDD4R2;
+    double IDD4W;
+    double IDD4W2;
+    double IDD5;
+    double IDD52;
+    double IDD6;
+    double IDD62;
+    double VDD;
+    double VDD2;
+    unsigned activation_limit;
+    unsigned bank_groups_per_rank;
+    unsigned beats_per_clock;
+    bool data_clock_sync;
+    bool dll;
+    bool enable_dram_powerdown;
+    unsigned max_accesses_per_row;
+    enums::PageManage page_policy;
+    Tick tAAD;
+    Tick tBURST_MAX;
+    Tick tBURST_MIN;
+    Tick tCCD_L;
+    Tick tCCD_L_WR;
+    Tick tCL;
+    Tick tCWL;
+    Tick tPPD;
+    Tick tRAS;
+    Tick tRCD;
+    Tick tRCD_WR;
+    Tick tREFI;
+    Tick tRFC;
+    Tick tRP;
+    Tick tRRD;
+    Tick tRRD_L;
+    Tick tRTP;
+    Tick tWR;
+    Tick tWTR_L;
+    Tick tXAW;
+    Tick tXP;
+    Tick tXPDLL;
+    Tick tXS;
+    Tick tXSDLL;
+    bool two_cycle_activate;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__DRAMInterface__
@@ -0,0 +1,37 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__DVFSHandler__
+#define __PARAMS__DVFSHandler__
+
+namespace gem5 {
+class DVFSHandler;
+} // namespace gem5
+#include <vector>
+#include "params/SrcClockDomain.hh"
+#include <cstddef>
+#include <cstddef>
+#include "params/SrcClockDomain.hh"
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct DVFSHandlerParams
+    : public SimObjectParams
+{
+    gem5::DVFSHandler * create() const;
+    std::vector< gem5::SrcClockDomain * > domains;
+    bool enable;
+    gem5::SrcClockDomain * sys_clk_domain;
+    Tick transition_latency;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__DVFSHandler__
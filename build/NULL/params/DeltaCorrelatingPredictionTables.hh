@@ -0,0 +1,49 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__DeltaCorrelatingPredictionTables__
+#define __PARAMS__DeltaCorrelatingPredictionTables__
+
+namespace gem5 {
+namespace prefetch {
+class DeltaCorrelatingPredictionTables;
+} // namespace prefetch
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "params/BaseIndexingPolicy.hh"
+#include <cstddef>
+#include "params/BaseReplacementPolicy.hh"
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct DeltaCorrelatingPredictionTablesParams
+    : public SimObjectParams
+{
+    gem5::prefetch::DeltaCorrelatingPredictionTables * create() const;
+    unsigned delta_bits;
+    unsigned delta_mask_bits;
+    unsigned deltas_per_entry;
+    unsigned table_assoc;
+    uint64_t table_entries;
+    gem5::BaseIndexingPolicy * table_indexing_policy;
+    gem5::replacement_policy::Base * table_replacement_policy;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__DeltaCorrelatingPredictionTables__
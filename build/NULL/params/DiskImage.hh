@@ -0,0 +1,30 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__DiskImage__
+#define __PARAMS__DiskImage__
+
+namespace gem5 {
+class DiskImage;
+} // namespace gem5
+#include <cstddef>
+#include <string>
+#include <cstddef>
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct DiskImageParams
+    : public SimObjectParams
+{
+    std::string image_file;
+    bool read_only;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__DiskImage__
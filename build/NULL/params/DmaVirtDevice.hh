@@ -0,0 +1,25 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__DmaVirtDevice__
+#define __PARAMS__DmaVirtDevice__
+
+namespace gem5 {
+class DmaVirtDevice;
+} // namespace gem5
+
+#include "params/DmaDevice.hh"
+
+namespace gem5
+{
+struct DmaVirtDeviceParams
+    : public DmaDeviceParams
+{
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__DmaVirtDevice__
@@ -0,0 +1,28 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__EmulatedDriver__
+#define __PARAMS__EmulatedDriver__
+
+namespace gem5 {
+class EmulatedDriver;
+} // namespace gem5
+#include <cstddef>
+#include <string>
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct EmulatedDriverParams
+    : public SimObjectParams
+{
+    std::string filename;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__EmulatedDriver__
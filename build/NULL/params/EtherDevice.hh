@@ -0,0 +1,26 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__EtherDevice__
+#define __PARAMS__EtherDevice__
+
+namespace gem5 {
+class EtherDevice;
+} // namespace gem5
+
+#include "params/PciDevice.hh"
+
+namespace gem5
+{
+struct EtherDeviceParams
+    : public PciDeviceParams
+{
+    unsigned int port_interface_connection_count;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__EtherDevice__
@@ -0,0 +1,32 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__EtherTapBase__
+#define __PARAMS__EtherTapBase__
+
+namespace gem5 {
+class EtherTapBase;
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "params/EtherDump.hh"
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct EtherTapBaseParams
+    : public SimObjectParams
+{
+    int bufsz;
+    gem5::EtherDump * dump;
+    unsigned int port_tap_connection_count;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__EtherTapBase__
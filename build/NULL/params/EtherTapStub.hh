@@ -0,0 +1,29 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__EtherTapStub__
+#define __PARAMS__EtherTapStub__
+
+namespace gem5 {
+class EtherTapStub;
+} // namespace gem5
+#include <cstddef>
+#include "base/socket.hh"
+
+#include "params/EtherTapBase.hh"
+
+namespace gem5
+{
+struct EtherTapStubParams
+    : public EtherTapBaseParams
+{
+    gem5::EtherTapStub * create() const;
+    ListenSocketConfig port;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__EtherTapStub__
@@ -0,0 +1,37 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__ExternalSlave__
+#define __PARAMS__ExternalSlave__
+
+namespace gem5 {
+class ExternalSlave;
+} // namespace gem5
+#include <vector>
+#include "base/types.hh"
+#include "base/addr_range.hh"
+#include <cstddef>
+#include <string>
+#include <cstddef>
+#include <string>
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct ExternalSlaveParams
+    : public SimObjectParams
+{
+    gem5::ExternalSlave * create() const;
+    std::vector< AddrRange > addr_ranges;
+    std::string port_data;
+    std::string port_type;
+    unsigned int port_port_connection_count;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__ExternalSlave__
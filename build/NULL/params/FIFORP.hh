@@ -0,0 +1,28 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__FIFORP__
+#define __PARAMS__FIFORP__
+
+namespace gem5 {
+namespace replacement_policy {
+class FIFO;
+} // namespace replacement_policy
+} // namespace gem5
+
+#include "params/BaseReplacementPolicy.hh"
+
+namespace gem5
+{
+struct FIFORPParams
+    : public BaseReplacementPolicyParams
+{
+    gem5::replacement_policy::FIFO * create() const;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__FIFORP__
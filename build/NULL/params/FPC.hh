@@ -0,0 +1,31 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__FPC__
+#define __PARAMS__FPC__
+
+namespace gem5 {
+namespace compression {
+class FPC;
+} // namespace compression
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/BaseDictionaryCompressor.hh"
+
+namespace gem5
+{
+struct FPCParams
+    : public BaseDictionaryCompressorParams
+{
+    gem5::compression::FPC * create() const;
+    int zero_run_bits;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__FPC__
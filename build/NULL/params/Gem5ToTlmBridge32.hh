@@ -0,0 +1,28 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__Gem5ToTlmBridge32__
+#define __PARAMS__Gem5ToTlmBridge32__
+
+namespace sc_gem5 {
+template <unsigned int BITWIDTH>
+class Gem5ToTlmBridge;
+} // namespace sc_gem5
+
+#include "params/Gem5ToTlmBridgeBase.hh"
+
+namespace gem5
+{
+struct Gem5ToTlmBridge32Params
+    : public Gem5ToTlmBridgeBaseParams
+{
+    sc_gem5::Gem5ToTlmBridge<32> * create() const;
+    unsigned int port_tlm_connection_count;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__Gem5ToTlmBridge32__
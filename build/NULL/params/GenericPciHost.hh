@@ -0,0 +1,47 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__GenericPciHost__
+#define __PARAMS__GenericPciHost__
+
+namespace gem5 {
+class GenericPciHost;
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "params/Platform.hh"
+
+#include "params/PciHost.hh"
+
+namespace gem5
+{
+struct GenericPciHostParams
+    : public PciHostParams
+{
+    gem5::GenericPciHost * create() const;
+    Addr conf_base;
+    uint8_t conf_device_bits;
+    Addr conf_size;
+    Addr pci_dma_base;
+    Addr pci_mem_base;
+    Addr pci_pio_base;
+    gem5::Platform * platform;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__GenericPciHost__
@@ -0,0 +1,26 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__HMCController__
+#define __PARAMS__HMCController__
+
+namespace gem5 {
+class HMCController;
+} // namespace gem5
+
+#include "params/NoncoherentXBar.hh"
+
+namespace gem5
+{
+struct HMCControllerParams
+    : public NoncoherentXBarParams
+{
+    gem5::HMCController * create() const;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__HMCController__
@@ -0,0 +1,31 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__HeteroMemCtrl__
+#define __PARAMS__HeteroMemCtrl__
+
+namespace gem5 {
+namespace memory {
+class HeteroMemCtrl;
+} // namespace memory
+} // namespace gem5
+#include <cstddef>
+#include "params/NVMInterface.hh"
+
+#include "params/MemCtrl.hh"
+
+namespace gem5
+{
+struct HeteroMemCtrlParams
+    : public MemCtrlParams
+{
+    gem5::memory::HeteroMemCtrl * create() const;
+    gem5::memory::NVMInterface * nvm;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__HeteroMemCtrl__
@@ -0,0 +1,29 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__I2CBus__
+#define __PARAMS__I2CBus__
+
+namespace gem5 {
+class I2CBus;
+} // namespace gem5
+#include <vector>
+#include "params/I2CDevice.hh"
+
+#include "params/BasicPioDevice.hh"
+
+namespace gem5
+{
+struct I2CBusParams
+    : public BasicPioDeviceParams
+{
+    gem5::I2CBus * create() const;
+    std::vector< gem5::I2CDevice * > devices;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__I2CBus__
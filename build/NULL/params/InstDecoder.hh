@@ -0,0 +1,28 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__InstDecoder__
+#define __PARAMS__InstDecoder__
+
+namespace gem5 {
+class InstDecoder;
+} // namespace gem5
+#include <cstddef>
+#include "params/BaseISA.hh"
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct InstDecoderParams
+    : public SimObjectParams
+{
+    gem5::BaseISA * isa;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__InstDecoder__
@@ -0,0 +1,30 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__InstTracer__
+#define __PARAMS__InstTracer__
+
+namespace gem5 {
+namespace trace {
+class InstTracer;
+} // namespace trace
+} // namespace gem5
+#include <cstddef>
+#include "params/InstDisassembler.hh"
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct InstTracerParams
+    : public SimObjectParams
+{
+    gem5::trace::InstDisassembler * disassembler;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__InstTracer__
@@ -0,0 +1,32 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__MathExprPowerModel__
+#define __PARAMS__MathExprPowerModel__
+
+namespace gem5 {
+class MathExprPowerModel;
+} // namespace gem5
+#include <cstddef>
+#include <string>
+#include <cstddef>
+#include <string>
+
+#include "params/PowerModelState.hh"
+
+namespace gem5
+{
+struct MathExprPowerModelParams
+    : public PowerModelStateParams
+{
+    gem5::MathExprPowerModel * create() const;
+    std::string dyn;
+    std::string st;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__MathExprPowerModel__
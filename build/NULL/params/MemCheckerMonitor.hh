@@ -0,0 +1,33 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__MemCheckerMonitor__
+#define __PARAMS__MemCheckerMonitor__
+
+namespace gem5 {
+class MemCheckerMonitor;
+} // namespace gem5
+#include <cstddef>
+#include "params/MemChecker.hh"
+#include <cstddef>
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct MemCheckerMonitorParams
+    : public SimObjectParams
+{
+    gem5::MemCheckerMonitor * create() const;
+    gem5::MemChecker * memchecker;
+    bool warn_only;
+    unsigned int port_mem_side_port_connection_count;
+    unsigned int port_cpu_side_port_connection_count;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__MemCheckerMonitor__
@@ -0,0 +1,33 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__MultiCompressor__
+#define __PARAMS__MultiCompressor__
+
+namespace gem5 {
+namespace compression {
+class Multi;
+} // namespace compression
+} // namespace gem5
+#include <vector>
+#include "params/BaseCacheCompressor.hh"
+#include <cstddef>
+
+#include "params/BaseCacheCompressor.hh"
+
+namespace gem5
+{
+struct MultiCompressorParams
+    : public BaseCacheCompressorParams
+{
+    gem5::compression::Multi * create() const;
+    std::vector< gem5::compression::Base * > compressors;
+    bool encoding_in_tags;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__MultiCompressor__
@@ -0,0 +1,31 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__MultiPrefetcher__
+#define __PARAMS__MultiPrefetcher__
+
+namespace gem5 {
+namespace prefetch {
+class Multi;
+} // namespace prefetch
+} // namespace gem5
+#include <vector>
+#include "params/BasePrefetcher.hh"
+
+#include "params/BasePrefetcher.hh"
+
+namespace gem5
+{
+struct MultiPrefetcherParams
+    : public BasePrefetcherParams
+{
+    gem5::prefetch::Multi * create() const;
+    std::vector< gem5::prefetch::Base * > prefetchers;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__MultiPrefetcher__
@@ -0,0 +1,26 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__NoncoherentCache__
+#define __PARAMS__NoncoherentCache__
+
+namespace gem5 {
+class NoncoherentCache;
+} // namespace gem5
+
+#include "params/BaseCache.hh"
+
+namespace gem5
+{
+struct NoncoherentCacheParams
+    : public BaseCacheParams
+{
+    gem5::NoncoherentCache * create() const;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__NoncoherentCache__
@@ -0,0 +1,26 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__NoncoherentXBar__
+#define __PARAMS__NoncoherentXBar__
+
+namespace gem5 {
+class NoncoherentXBar;
+} // namespace gem5
+
+#include "params/BaseXBar.hh"
+
+namespace gem5
+{
+struct NoncoherentXBarParams
+    : public BaseXBarParams
+{
+    gem5::NoncoherentXBar * create() const;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__NoncoherentXBar__
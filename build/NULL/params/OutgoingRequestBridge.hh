@@ -0,0 +1,31 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__OutgoingRequestBridge__
+#define __PARAMS__OutgoingRequestBridge__
+
+namespace gem5 {
+class OutgoingRequestBridge;
+} // namespace gem5
+#include <vector>
+#include "base/types.hh"
+#include "base/addr_range.hh"
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct OutgoingRequestBridgeParams
+    : public SimObjectParams
+{
+    gem5::OutgoingRequestBridge * create() const;
+    std::vector< AddrRange > physical_address_ranges;
+    unsigned int port_port_connection_count;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__OutgoingRequestBridge__
@@ -0,0 +1,27 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__PS2Device__
+#define __PARAMS__PS2Device__
+
+namespace gem5 {
+namespace ps2 {
+class Device;
+} // namespace ps2
+} // namespace gem5
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct PS2DeviceParams
+    : public SimObjectParams
+{
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__PS2Device__
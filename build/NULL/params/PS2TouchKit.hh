@@ -0,0 +1,31 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__PS2TouchKit__
+#define __PARAMS__PS2TouchKit__
+
+namespace gem5 {
+namespace ps2 {
+class TouchKit;
+} // namespace ps2
+} // namespace gem5
+#include <cstddef>
+#include "params/VncInput.hh"
+
+#include "params/PS2Device.hh"
+
+namespace gem5
+{
+struct PS2TouchKitParams
+    : public PS2DeviceParams
+{
+    gem5::ps2::TouchKit * create() const;
+    gem5::VncInput * vnc;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__PS2TouchKit__
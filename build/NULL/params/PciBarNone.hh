@@ -0,0 +1,26 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__PciBarNone__
+#define __PARAMS__PciBarNone__
+
+namespace gem5 {
+class PciBarNone;
+} // namespace gem5
+
+#include "params/PciBar.hh"
+
+namespace gem5
+{
+struct PciBarNoneParams
+    : public PciBarParams
+{
+    gem5::PciBarNone * create() const;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__PciBarNone__
@@ -0,0 +1,25 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__PciHost__
+#define __PARAMS__PciHost__
+
+namespace gem5 {
+class PciHost;
+} // namespace gem5
+
+#include "params/PioDevice.hh"
+
+namespace gem5
+{
+struct PciHostParams
+    : public PioDeviceParams
+{
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__PciHost__
@@ -0,0 +1,29 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__PciIoBar__
+#define __PARAMS__PciIoBar__
+
+namespace gem5 {
+class PciIoBar;
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/PciBar.hh"
+
+namespace gem5
+{
+struct PciIoBarParams
+    : public PciBarParams
+{
+    gem5::PciIoBar * create() const;
+    uint32_t size;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__PciIoBar__
@@ -0,0 +1,31 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__PerfectCompressor__
+#define __PARAMS__PerfectCompressor__
+
+namespace gem5 {
+namespace compression {
+class Perfect;
+} // namespace compression
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/BaseCacheCompressor.hh"
+
+namespace gem5
+{
+struct PerfectCompressorParams
+    : public BaseCacheCompressorParams
+{
+    gem5::compression::Perfect * create() const;
+    int max_compression_ratio;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__PerfectCompressor__
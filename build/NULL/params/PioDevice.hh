@@ -0,0 +1,29 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__PioDevice__
+#define __PARAMS__PioDevice__
+
+namespace gem5 {
+class PioDevice;
+} // namespace gem5
+#include <cstddef>
+#include "params/System.hh"
+
+#include "params/ClockedObject.hh"
+
+namespace gem5
+{
+struct PioDeviceParams
+    : public ClockedObjectParams
+{
+    gem5::System * system;
+    unsigned int port_pio_connection_count;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__PioDevice__
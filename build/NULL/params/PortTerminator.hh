@@ -0,0 +1,28 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__PortTerminator__
+#define __PARAMS__PortTerminator__
+
+namespace gem5 {
+class PortTerminator;
+} // namespace gem5
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct PortTerminatorParams
+    : public SimObjectParams
+{
+    gem5::PortTerminator * create() const;
+    unsigned int port_req_ports_connection_count;
+    unsigned int port_resp_ports_connection_count;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__PortTerminator__
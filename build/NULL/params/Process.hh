@@ -0,0 +1,87 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__Process__
+#define __PARAMS__Process__
+
+namespace gem5 {
+class Process;
+} // namespace gem5
+#include <vector>
+#include <string>
+#include <cstddef>
+#include <string>
+#include <vector>
+#include "params/EmulatedDriver.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <vector>
+#include <string>
+#include <cstddef>
+#include <string>
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include <string>
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include <string>
+#include <cstddef>
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include <string>
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include <string>
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "params/System.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct ProcessParams
+    : public SimObjectParams
+{
+    gem5::Process * create() const;
+    std::vector< std::string > cmd;
+    std::string cwd;
+    std::vector< gem5::EmulatedDriver * > drivers;
+    int egid;
+    std::vector< std::string > env;
+    std::string errout;
+    int euid;
+    std::string executable;
+    int gid;
+    std::string input;
+    bool kvmInSE;
+    uint64_t maxStackSize;
+    std::string output;
+    int pgid;
+    int pid;
+    int ppid;
+    std::string release;
+    uint64_t simpoint;
+    gem5::System * system;
+    int uid;
+    bool useArchPT;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__Process__
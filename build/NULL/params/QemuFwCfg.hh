@@ -0,0 +1,30 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__QemuFwCfg__
+#define __PARAMS__QemuFwCfg__
+
+namespace gem5 {
+namespace qemu {
+class FwCfg;
+} // namespace qemu
+} // namespace gem5
+#include <vector>
+#include "params/QemuFwCfgItem.hh"
+
+#include "params/PioDevice.hh"
+
+namespace gem5
+{
+struct QemuFwCfgParams
+    : public PioDeviceParams
+{
+    std::vector< gem5::qemu::FwCfgItemFactoryBase * > items;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__QemuFwCfg__
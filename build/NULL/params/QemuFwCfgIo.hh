@@ -0,0 +1,31 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__QemuFwCfgIo__
+#define __PARAMS__QemuFwCfgIo__
+
+namespace gem5 {
+namespace qemu {
+class FwCfgIo;
+} // namespace qemu
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/QemuFwCfg.hh"
+
+namespace gem5
+{
+struct QemuFwCfgIoParams
+    : public QemuFwCfgParams
+{
+    gem5::qemu::FwCfgIo * create() const;
+    Addr selector_addr;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__QemuFwCfgIo__
@@ -0,0 +1,37 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__QemuFwCfgItemBytes__
+#define __PARAMS__QemuFwCfgItemBytes__
+
+namespace gem5 {
+namespace qemu {
+class FwCfgItemBytes;
+} // namespace qemu
+} // namespace gem5
+namespace gem5 {
+namespace qemu {
+template <class ItemType>
+class FwCfgItemFactory;
+} // namespace qemu
+} // namespace gem5
+#include <vector>
+#include "base/types.hh"
+
+#include "params/QemuFwCfgItem.hh"
+
+namespace gem5
+{
+struct QemuFwCfgItemBytesParams
+    : public QemuFwCfgItemParams
+{
+    gem5::qemu::FwCfgItemFactory<gem5::qemu::FwCfgItemBytes> * create() const;
+    std::vector< uint8_t > data;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__QemuFwCfgItemBytes__
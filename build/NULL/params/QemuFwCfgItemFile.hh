@@ -0,0 +1,37 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__QemuFwCfgItemFile__
+#define __PARAMS__QemuFwCfgItemFile__
+
+namespace gem5 {
+namespace qemu {
+class FwCfgItemFile;
+} // namespace qemu
+} // namespace gem5
+namespace gem5 {
+namespace qemu {
+template <class ItemType>
+class FwCfgItemFactory;
+} // namespace qemu
+} // namespace gem5
+#include <cstddef>
+#include <string>
+
+#include "params/QemuFwCfgItem.hh"
+
+namespace gem5
+{
+struct QemuFwCfgItemFileParams
+    : public QemuFwCfgItemParams
+{
+    gem5::qemu::FwCfgItemFactory<gem5::qemu::FwCfgItemFile> * create() const;
+    std::string file;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__QemuFwCfgItemFile__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__QemuFwCfgMmio__
+#define __PARAMS__QemuFwCfgMmio__
+
+namespace gem5 {
+namespace qemu {
+class FwCfgMmio;
+} // namespace qemu
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+#include "base/addr_range.hh"
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/QemuFwCfg.hh"
+
+namespace gem5
+{
+struct QemuFwCfgMmioParams
+    : public QemuFwCfgParams
+{
+    gem5::qemu::FwCfgMmio * create() const;
+    AddrRange data_addr_range;
+    Addr selector_addr;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__QemuFwCfgMmio__
@@ -0,0 +1,29 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__QoSPolicy__
+#define __PARAMS__QoSPolicy__
+
+namespace gem5 {
+namespace memory {
+namespace qos {
+class Policy;
+} // namespace qos
+} // namespace memory
+} // namespace gem5
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct QoSPolicyParams
+    : public SimObjectParams
+{
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__QoSPolicy__
@@ -0,0 +1,29 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__QoSTurnaroundPolicy__
+#define __PARAMS__QoSTurnaroundPolicy__
+
+namespace gem5 {
+namespace memory {
+namespace qos {
+class TurnaroundPolicy;
+} // namespace qos
+} // namespace memory
+} // namespace gem5
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct QoSTurnaroundPolicyParams
+    : public SimObjectParams
+{
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__QoSTurnaroundPolicy__
@@ -0,0 +1,47 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__QueuedPrefetcher__
+#define __PARAMS__QueuedPrefetcher__
+
+namespace gem5 {
+namespace prefetch {
+class Queued;
+} // namespace prefetch
+} // namespace gem5
+#include <cstddef>
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include <cstddef>
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/BasePrefetcher.hh"
+
+namespace gem5
+{
+struct QueuedPrefetcherParams
+    : public BasePrefetcherParams
+{
+    bool cache_snoop;
+    int latency;
+    int max_prefetch_requests_with_pending_translation;
+    bool queue_filter;
+    int queue_size;
+    bool queue_squash;
+    bool tag_prefetch;
+    int throttle_control_percentage;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__QueuedPrefetcher__
@@ -0,0 +1,34 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__RangeAddrMapper__
+#define __PARAMS__RangeAddrMapper__
+
+namespace gem5 {
+class RangeAddrMapper;
+} // namespace gem5
+#include <vector>
+#include "base/types.hh"
+#include "base/addr_range.hh"
+#include <vector>
+#include "base/types.hh"
+#include "base/addr_range.hh"
+
+#include "params/AddrMapper.hh"
+
+namespace gem5
+{
+struct RangeAddrMapperParams
+    : public AddrMapperParams
+{
+    gem5::RangeAddrMapper * create() const;
+    std::vector< AddrRange > original_ranges;
+    std::vector< AddrRange > remapped_ranges;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__RangeAddrMapper__
@@ -0,0 +1,28 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__RepeatedQwordsCompressor__
+#define __PARAMS__RepeatedQwordsCompressor__
+
+namespace gem5 {
+namespace compression {
+class RepeatedQwords;
+} // namespace compression
+} // namespace gem5
+
+#include "params/BaseDictionaryCompressor.hh"
+
+namespace gem5
+{
+struct RepeatedQwordsCompressorParams
+    : public BaseDictionaryCompressorParams
+{
+    gem5::compression::RepeatedQwords * create() const;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__RepeatedQwordsCompressor__
@@ -0,0 +1,25 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__SEWorkload__
+#define __PARAMS__SEWorkload__
+
+namespace gem5 {
+class SEWorkload;
+} // namespace gem5
+
+#include "params/Workload.hh"
+
+namespace gem5
+{
+struct SEWorkloadParams
+    : public WorkloadParams
+{
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__SEWorkload__
@@ -0,0 +1,33 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__SHiPRP__
+#define __PARAMS__SHiPRP__
+
+namespace gem5 {
+namespace replacement_policy {
+class SHiP;
+} // namespace replacement_policy
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/BRRIPRP.hh"
+
+namespace gem5
+{
+struct SHiPRPParams
+    : public BRRIPRPParams
+{
+    int insertion_threshold;
+    unsigned shct_size;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__SHiPRP__
@@ -0,0 +1,28 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__SecondChanceRP__
+#define __PARAMS__SecondChanceRP__
+
+namespace gem5 {
+namespace replacement_policy {
+class SecondChance;
+} // namespace replacement_policy
+} // namespace gem5
+
+#include "params/FIFORP.hh"
+
+namespace gem5
+{
+struct SecondChanceRPParams
+    : public FIFORPParams
+{
+    gem5::replacement_policy::SecondChance * create() const;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__SecondChanceRP__
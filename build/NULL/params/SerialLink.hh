@@ -0,0 +1,47 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__SerialLink__
+#define __PARAMS__SerialLink__
+
+namespace gem5 {
+class SerialLink;
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <vector>
+#include "base/types.hh"
+#include "base/addr_range.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/ClockedObject.hh"
+
+namespace gem5
+{
+struct SerialLinkParams
+    : public ClockedObjectParams
+{
+    gem5::SerialLink * create() const;
+    Tick delay;
+    uint64_t link_speed;
+    unsigned num_lanes;
+    std::vector< AddrRange > ranges;
+    unsigned req_size;
+    unsigned resp_size;
+    unsigned int port_mem_side_port_connection_count;
+    unsigned int port_cpu_side_port_connection_count;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__SerialLink__
@@ -0,0 +1,26 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__SerialNullDevice__
+#define __PARAMS__SerialNullDevice__
+
+namespace gem5 {
+class SerialNullDevice;
+} // namespace gem5
+
+#include "params/SerialDevice.hh"
+
+namespace gem5
+{
+struct SerialNullDeviceParams
+    : public SerialDeviceParams
+{
+    gem5::SerialNullDevice * create() const;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__SerialNullDevice__
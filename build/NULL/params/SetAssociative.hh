@@ -0,0 +1,26 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__SetAssociative__
+#define __PARAMS__SetAssociative__
+
+namespace gem5 {
+class SetAssociative;
+} // namespace gem5
+
+#include "params/BaseIndexingPolicy.hh"
+
+namespace gem5
+{
+struct SetAssociativeParams
+    : public BaseIndexingPolicyParams
+{
+    gem5::SetAssociative * create() const;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__SetAssociative__
@@ -0,0 +1,34 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__SharedMemoryServer__
+#define __PARAMS__SharedMemoryServer__
+
+namespace gem5 {
+namespace memory {
+class SharedMemoryServer;
+} // namespace memory
+} // namespace gem5
+#include <cstddef>
+#include <string>
+#include <cstddef>
+#include "params/System.hh"
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct SharedMemoryServerParams
+    : public SimObjectParams
+{
+    gem5::memory::SharedMemoryServer * create() const;
+    std::string server_path;
+    gem5::System * system;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__SharedMemoryServer__
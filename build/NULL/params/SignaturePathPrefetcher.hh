@@ -0,0 +1,68 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__SignaturePathPrefetcher__
+#define __PARAMS__SignaturePathPrefetcher__
+
+namespace gem5 {
+namespace prefetch {
+class SignaturePath;
+} // namespace prefetch
+} // namespace gem5
+#include <cstddef>
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "params/BaseIndexingPolicy.hh"
+#include <cstddef>
+#include "params/BaseReplacementPolicy.hh"
+#include <cstddef>
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "params/BaseIndexingPolicy.hh"
+#include <cstddef>
+#include "params/BaseReplacementPolicy.hh"
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/QueuedPrefetcher.hh"
+
+namespace gem5
+{
+struct SignaturePathPrefetcherParams
+    : public QueuedPrefetcherParams
+{
+    gem5::prefetch::SignaturePath * create() const;
+    double lookahead_confidence_threshold;
+    uint8_t num_counter_bits;
+    unsigned pattern_table_assoc;
+    uint64_t pattern_table_entries;
+    gem5::BaseIndexingPolicy * pattern_table_indexing_policy;
+    gem5::replacement_policy::Base * pattern_table_replacement_policy;
+    double prefetch_confidence_threshold;
+    uint16_t signature_bits;
+    uint8_t signature_shift;
+    unsigned signature_table_assoc;
+    uint64_t signature_table_entries;
+    gem5::BaseIndexingPolicy * signature_table_indexing_policy;
+    gem5::replacement_policy::Base * signature_table_replacement_policy;
+    unsigned strides_per_pattern_entry;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__SignaturePathPrefetcher__
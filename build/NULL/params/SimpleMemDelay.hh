@@ -0,0 +1,38 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__SimpleMemDelay__
+#define __PARAMS__SimpleMemDelay__
+
+namespace gem5 {
+class SimpleMemDelay;
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/MemDelay.hh"
+
+namespace gem5
+{
+struct SimpleMemDelayParams
+    : public MemDelayParams
+{
+    gem5::SimpleMemDelay * create() const;
+    Tick read_req;
+    Tick read_resp;
+    Tick write_req;
+    Tick write_resp;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__SimpleMemDelay__
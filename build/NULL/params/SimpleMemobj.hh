@@ -0,0 +1,29 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__SimpleMemobj__
+#define __PARAMS__SimpleMemobj__
+
+namespace gem5 {
+class SimpleMemobj;
+} // namespace gem5
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct SimpleMemobjParams
+    : public SimObjectParams
+{
+    gem5::SimpleMemobj * create() const;
+    unsigned int port_inst_port_connection_count;
+    unsigned int port_data_port_connection_count;
+    unsigned int port_mem_side_connection_count;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__SimpleMemobj__
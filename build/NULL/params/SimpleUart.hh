@@ -0,0 +1,36 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__SimpleUart__
+#define __PARAMS__SimpleUart__
+
+namespace gem5 {
+class SimpleUart;
+} // namespace gem5
+#include <cstddef>
+#include "enums/ByteOrder.hh"
+#include <cstddef>
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/Uart.hh"
+
+#include "enums/ByteOrder.hh"
+
+namespace gem5
+{
+struct SimpleUartParams
+    : public UartParams
+{
+    gem5::SimpleUart * create() const;
+    ByteOrder byte_order;
+    bool end_on_eot;
+    Addr pio_size;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__SimpleUart__
@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__SnoopFilter__
+#define __PARAMS__SnoopFilter__
+
+namespace gem5 {
+class SnoopFilter;
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "params/System.hh"
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct SnoopFilterParams
+    : public SimObjectParams
+{
+    gem5::SnoopFilter * create() const;
+    Cycles lookup_latency;
+    uint64_t max_capacity;
+    gem5::System * system;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__SnoopFilter__
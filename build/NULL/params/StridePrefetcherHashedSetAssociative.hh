@@ -0,0 +1,28 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__StridePrefetcherHashedSetAssociative__
+#define __PARAMS__StridePrefetcherHashedSetAssociative__
+
+namespace gem5 {
+namespace prefetch {
+class StridePrefetcherHashedSetAssociative;
+} // namespace prefetch
+} // namespace gem5
+
+#include "params/SetAssociative.hh"
+
+namespace gem5
+{
+struct StridePrefetcherHashedSetAssociativeParams
+    : public SetAssociativeParams
+{
+    gem5::prefetch::StridePrefetcherHashedSetAssociative * create() const;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__StridePrefetcherHashedSetAssociative__
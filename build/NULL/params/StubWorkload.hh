@@ -0,0 +1,34 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__StubWorkload__
+#define __PARAMS__StubWorkload__
+
+namespace gem5 {
+class StubWorkload;
+} // namespace gem5
+#include <cstddef>
+#include "enums/ByteOrder.hh"
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/Workload.hh"
+
+#include "enums/ByteOrder.hh"
+
+namespace gem5
+{
+struct StubWorkloadParams
+    : public WorkloadParams
+{
+    gem5::StubWorkload * create() const;
+    ByteOrder byte_order;
+    Addr entry;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__StubWorkload__
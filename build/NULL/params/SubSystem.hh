@@ -0,0 +1,29 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__SubSystem__
+#define __PARAMS__SubSystem__
+
+namespace gem5 {
+class SubSystem;
+} // namespace gem5
+#include <cstddef>
+#include "params/ThermalDomain.hh"
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct SubSystemParams
+    : public SimObjectParams
+{
+    gem5::SubSystem * create() const;
+    gem5::ThermalDomain * thermal_domain;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__SubSystem__
@@ -0,0 +1,34 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__SysBridge__
+#define __PARAMS__SysBridge__
+
+namespace gem5 {
+class SysBridge;
+} // namespace gem5
+#include <cstddef>
+#include "params/System.hh"
+#include <cstddef>
+#include "params/System.hh"
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct SysBridgeParams
+    : public SimObjectParams
+{
+    gem5::SysBridge * create() const;
+    gem5::System * source;
+    gem5::System * target;
+    unsigned int port_target_port_connection_count;
+    unsigned int port_source_port_connection_count;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__SysBridge__
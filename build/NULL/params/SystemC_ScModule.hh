@@ -0,0 +1,25 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__SystemC_ScModule__
+#define __PARAMS__SystemC_ScModule__
+
+namespace sc_core {
+class sc_module;
+} // namespace sc_core
+
+#include "params/SystemC_ScObject.hh"
+
+namespace gem5
+{
+struct SystemC_ScModuleParams
+    : public SystemC_ScObjectParams
+{
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__SystemC_ScModule__
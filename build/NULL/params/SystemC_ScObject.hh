@@ -0,0 +1,25 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__SystemC_ScObject__
+#define __PARAMS__SystemC_ScObject__
+
+namespace sc_core {
+class sc_object;
+} // namespace sc_core
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct SystemC_ScObjectParams
+    : public SimObjectParams
+{
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__SystemC_ScObject__
@@ -0,0 +1,37 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__Terminal__
+#define __PARAMS__Terminal__
+
+namespace gem5 {
+class Terminal;
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "enums/TerminalDump.hh"
+#include <cstddef>
+#include "base/socket.hh"
+
+#include "params/SerialDevice.hh"
+
+#include "enums/TerminalDump.hh"
+
+namespace gem5
+{
+struct TerminalParams
+    : public SerialDeviceParams
+{
+    gem5::Terminal * create() const;
+    int number;
+    TerminalDump outfile;
+    ListenSocketConfig port;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__Terminal__
@@ -0,0 +1,29 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__ThermalDomain__
+#define __PARAMS__ThermalDomain__
+
+namespace gem5 {
+class ThermalDomain;
+} // namespace gem5
+#include <cstddef>
+#include "base/temperature.hh"
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct ThermalDomainParams
+    : public SimObjectParams
+{
+    gem5::ThermalDomain * create() const;
+    Temperature initial_temperature;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__ThermalDomain__
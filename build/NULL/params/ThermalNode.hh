@@ -0,0 +1,26 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__ThermalNode__
+#define __PARAMS__ThermalNode__
+
+namespace gem5 {
+class ThermalNode;
+} // namespace gem5
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct ThermalNodeParams
+    : public SimObjectParams
+{
+    gem5::ThermalNode * create() const;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__ThermalNode__
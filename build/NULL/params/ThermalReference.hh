@@ -0,0 +1,29 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__ThermalReference__
+#define __PARAMS__ThermalReference__
+
+namespace gem5 {
+class ThermalReference;
+} // namespace gem5
+#include <cstddef>
+#include "base/temperature.hh"
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct ThermalReferenceParams
+    : public SimObjectParams
+{
+    gem5::ThermalReference * create() const;
+    Temperature temperature;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__ThermalReference__
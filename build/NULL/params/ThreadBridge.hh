@@ -0,0 +1,28 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__ThreadBridge__
+#define __PARAMS__ThreadBridge__
+
+namespace gem5 {
+class ThreadBridge;
+} // namespace gem5
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct ThreadBridgeParams
+    : public SimObjectParams
+{
+    gem5::ThreadBridge * create() const;
+    unsigned int port_in_port_connection_count;
+    unsigned int port_out_port_connection_count;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__ThreadBridge__
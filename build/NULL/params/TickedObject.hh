@@ -0,0 +1,25 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__TickedObject__
+#define __PARAMS__TickedObject__
+
+namespace gem5 {
+class TickedObject;
+} // namespace gem5
+
+#include "params/ClockedObject.hh"
+
+namespace gem5
+{
+struct TickedObjectParams
+    : public ClockedObjectParams
+{
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__TickedObject__
@@ -0,0 +1,28 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__TlmToGem5Bridge256__
+#define __PARAMS__TlmToGem5Bridge256__
+
+namespace sc_gem5 {
+template <unsigned int BITWIDTH>
+class TlmToGem5Bridge;
+} // namespace sc_gem5
+
+#include "params/TlmToGem5BridgeBase.hh"
+
+namespace gem5
+{
+struct TlmToGem5Bridge256Params
+    : public TlmToGem5BridgeBaseParams
+{
+    sc_gem5::TlmToGem5Bridge<256> * create() const;
+    unsigned int port_tlm_connection_count;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__TlmToGem5Bridge256__
@@ -0,0 +1,29 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__TlmToGem5BridgeBase__
+#define __PARAMS__TlmToGem5BridgeBase__
+
+namespace sc_gem5 {
+class TlmToGem5BridgeBase;
+} // namespace sc_gem5
+#include <cstddef>
+#include "params/System.hh"
+
+#include "params/SystemC_ScModule.hh"
+
+namespace gem5
+{
+struct TlmToGem5BridgeBaseParams
+    : public SystemC_ScModuleParams
+{
+    gem5::System * system;
+    unsigned int port_gem5_connection_count;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__TlmToGem5BridgeBase__
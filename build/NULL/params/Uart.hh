@@ -0,0 +1,31 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__Uart__
+#define __PARAMS__Uart__
+
+namespace gem5 {
+class Uart;
+} // namespace gem5
+#include <cstddef>
+#include "params/SerialDevice.hh"
+#include <cstddef>
+#include "params/Platform.hh"
+
+#include "params/BasicPioDevice.hh"
+
+namespace gem5
+{
+struct UartParams
+    : public BasicPioDeviceParams
+{
+    gem5::SerialDevice * device;
+    gem5::Platform * platform;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__Uart__
@@ -0,0 +1,29 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__Uart8250__
+#define __PARAMS__Uart8250__
+
+namespace gem5 {
+class Uart8250;
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/Uart.hh"
+
+namespace gem5
+{
+struct Uart8250Params
+    : public UartParams
+{
+    gem5::Uart8250 * create() const;
+    Addr pio_size;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__Uart8250__
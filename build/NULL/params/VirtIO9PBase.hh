@@ -0,0 +1,31 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__VirtIO9PBase__
+#define __PARAMS__VirtIO9PBase__
+
+namespace gem5 {
+class VirtIO9PBase;
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include <string>
+
+#include "params/VirtIODeviceBase.hh"
+
+namespace gem5
+{
+struct VirtIO9PBaseParams
+    : public VirtIODeviceBaseParams
+{
+    unsigned queueSize;
+    std::string tag;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__VirtIO9PBase__
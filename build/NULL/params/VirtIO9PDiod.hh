@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__VirtIO9PDiod__
+#define __PARAMS__VirtIO9PDiod__
+
+namespace gem5 {
+class VirtIO9PDiod;
+} // namespace gem5
+#include <cstddef>
+#include <string>
+#include <cstddef>
+#include <string>
+#include <cstddef>
+#include <string>
+
+#include "params/VirtIO9PProxy.hh"
+
+namespace gem5
+{
+struct VirtIO9PDiodParams
+    : public VirtIO9PProxyParams
+{
+    gem5::VirtIO9PDiod * create() const;
+    std::string diod;
+    std::string root;
+    std::string socketPath;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__VirtIO9PDiod__
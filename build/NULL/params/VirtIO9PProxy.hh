@@ -0,0 +1,25 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__VirtIO9PProxy__
+#define __PARAMS__VirtIO9PProxy__
+
+namespace gem5 {
+class VirtIO9PProxy;
+} // namespace gem5
+
+#include "params/VirtIO9PBase.hh"
+
+namespace gem5
+{
+struct VirtIO9PProxyParams
+    : public VirtIO9PBaseParams
+{
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__VirtIO9PProxy__
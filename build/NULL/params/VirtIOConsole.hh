@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__VirtIOConsole__
+#define __PARAMS__VirtIOConsole__
+
+namespace gem5 {
+class VirtIOConsole;
+} // namespace gem5
+#include <cstddef>
+#include "params/SerialDevice.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/VirtIODeviceBase.hh"
+
+namespace gem5
+{
+struct VirtIOConsoleParams
+    : public VirtIODeviceBaseParams
+{
+    gem5::VirtIOConsole * create() const;
+    gem5::SerialDevice * device;
+    unsigned qRecvSize;
+    unsigned qTransSize;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__VirtIOConsole__
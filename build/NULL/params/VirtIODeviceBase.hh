@@ -0,0 +1,36 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__VirtIODeviceBase__
+#define __PARAMS__VirtIODeviceBase__
+
+namespace gem5 {
+class VirtIODeviceBase;
+} // namespace gem5
+#include <cstddef>
+#include "enums/ByteOrder.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "params/System.hh"
+
+#include "params/SimObject.hh"
+
+#include "enums/ByteOrder.hh"
+
+namespace gem5
+{
+struct VirtIODeviceBaseParams
+    : public SimObjectParams
+{
+    ByteOrder byte_order;
+    uint8_t subsystem;
+    gem5::System * system;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__VirtIODeviceBase__
@@ -0,0 +1,26 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__VirtIODummyDevice__
+#define __PARAMS__VirtIODummyDevice__
+
+namespace gem5 {
+class VirtIODummyDevice;
+} // namespace gem5
+
+#include "params/VirtIODeviceBase.hh"
+
+namespace gem5
+{
+struct VirtIODummyDeviceParams
+    : public VirtIODeviceBaseParams
+{
+    gem5::VirtIODummyDevice * create() const;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__VirtIODummyDevice__
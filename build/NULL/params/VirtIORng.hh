@@ -0,0 +1,29 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__VirtIORng__
+#define __PARAMS__VirtIORng__
+
+namespace gem5 {
+class VirtIORng;
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/VirtIODeviceBase.hh"
+
+namespace gem5
+{
+struct VirtIORngParams
+    : public VirtIODeviceBaseParams
+{
+    gem5::VirtIORng * create() const;
+    unsigned qSize;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__VirtIORng__
@@ -0,0 +1,28 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__VoltageDomain__
+#define __PARAMS__VoltageDomain__
+
+namespace gem5 {
+class VoltageDomain;
+} // namespace gem5
+#include <vector>
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct VoltageDomainParams
+    : public SimObjectParams
+{
+    gem5::VoltageDomain * create() const;
+    std::vector< double > voltage;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__VoltageDomain__
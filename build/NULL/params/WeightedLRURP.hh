@@ -0,0 +1,28 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__WeightedLRURP__
+#define __PARAMS__WeightedLRURP__
+
+namespace gem5 {
+namespace replacement_policy {
+class WeightedLRU;
+} // namespace replacement_policy
+} // namespace gem5
+
+#include "params/LRURP.hh"
+
+namespace gem5
+{
+struct WeightedLRURPParams
+    : public LRURPParams
+{
+    gem5::replacement_policy::WeightedLRU * create() const;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__WeightedLRURP__
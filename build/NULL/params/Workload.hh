@@ -0,0 +1,30 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__Workload__
+#define __PARAMS__Workload__
+
+namespace gem5 {
+class Workload;
+} // namespace gem5
+#include <cstddef>
+#include "base/socket.hh"
+#include <cstddef>
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct WorkloadParams
+    : public SimObjectParams
+{
+    ListenSocketConfig remote_gdb_port;
+    bool wait_for_remote_gdb;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__Workload__
@@ -0,0 +1,38 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_hh.py:234
+ */
+
+#ifndef __PARAMS__WriteAllocator__
+#define __PARAMS__WriteAllocator__
+
+namespace gem5 {
+class WriteAllocator;
+} // namespace gem5
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+#include <cstddef>
+#include "base/types.hh"
+
+#include "params/SimObject.hh"
+
+namespace gem5
+{
+struct WriteAllocatorParams
+    : public SimObjectParams
+{
+    gem5::WriteAllocator * create() const;
+    int block_size;
+    unsigned coalesce_limit;
+    unsigned delay_threshold;
+    unsigned no_allocate_limit;
+};
+
+} // namespace gem5
+
+#endif // __PARAMS__WriteAllocator__
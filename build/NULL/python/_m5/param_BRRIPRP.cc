@@ -0,0 +1,117 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/BRRIPRP.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/cache/replacement_policies/brrip_rp.hh"
+
+#include "base/types.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_BRRIPRP");
+    py::class_<BRRIPRPParams, BaseReplacementPolicyParams, std::unique_ptr<BRRIPRPParams, py::nodelete>>(m, "BRRIPRPParams")
+        .def(py::init<>())
+        .def("create", &BRRIPRPParams::create)
+        .def_readwrite("btp", &BRRIPRPParams::btp)
+        .def_readwrite("hit_priority", &BRRIPRPParams::hit_priority)
+        .def_readwrite("num_bits", &BRRIPRPParams::num_bits)
+        ;
+
+    py::class_<gem5::replacement_policy::BRRIP, gem5::replacement_policy::Base, std::unique_ptr<gem5::replacement_policy::BRRIP, py::nodelete>>(m, "gem5_COLONS_replacement_policy_COLONS_BRRIP")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("BRRIPRP", module_init, "BaseReplacementPolicy");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyBRRIPRPParamsClass
+{
+  public:
+    gem5::replacement_policy::BRRIP *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyBRRIPRPShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyBRRIPRPShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const BRRIPRPParams &>>>
+{
+  public:
+    using Params = BRRIPRPParams;
+    static gem5::replacement_policy::BRRIP *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyBRRIPRPShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const BRRIPRPParams &>>>
+{
+  public:
+    using Params = DummyBRRIPRPParamsClass;
+    static gem5::replacement_policy::BRRIP *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::replacement_policy::BRRIP *
+DummyBRRIPRPShunt<gem5::replacement_policy::BRRIP>::Params::create() const
+{
+    return DummyBRRIPRPShunt<gem5::replacement_policy::BRRIP>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,114 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/BadDevice.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/baddev.hh"
+
+#include <string>
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_BadDevice");
+    py::class_<BadDeviceParams, BasicPioDeviceParams, std::unique_ptr<BadDeviceParams, py::nodelete>>(m, "BadDeviceParams")
+        .def(py::init<>())
+        .def("create", &BadDeviceParams::create)
+        .def_readwrite("devicename", &BadDeviceParams::devicename)
+        ;
+
+    py::class_<gem5::BadDevice, gem5::BasicPioDevice, std::unique_ptr<gem5::BadDevice, py::nodelete>>(m, "gem5_COLONS_BadDevice")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("BadDevice", module_init, "BasicPioDevice");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyBadDeviceParamsClass
+{
+  public:
+    gem5::BadDevice *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyBadDeviceShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyBadDeviceShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const BadDeviceParams &>>>
+{
+  public:
+    using Params = BadDeviceParams;
+    static gem5::BadDevice *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyBadDeviceShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const BadDeviceParams &>>>
+{
+  public:
+    using Params = DummyBadDeviceParamsClass;
+    static gem5::BadDevice *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::BadDevice *
+DummyBadDeviceShunt<gem5::BadDevice>::Params::create() const
+{
+    return DummyBadDeviceShunt<gem5::BadDevice>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,38 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/BaseInterrupts.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "arch/generic/interrupts.hh"
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_BaseInterrupts");
+    py::class_<BaseInterruptsParams, SimObjectParams, std::unique_ptr<BaseInterruptsParams, py::nodelete>>(m, "BaseInterruptsParams")
+        ;
+
+    py::class_<gem5::BaseInterrupts, gem5::SimObject, std::unique_ptr<gem5::BaseInterrupts, py::nodelete>>(m, "gem5_COLONS_BaseInterrupts")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("BaseInterrupts", module_init, "SimObject");
+
+} // namespace gem5
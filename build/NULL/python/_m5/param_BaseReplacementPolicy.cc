@@ -0,0 +1,38 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/BaseReplacementPolicy.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/cache/replacement_policies/base.hh"
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_BaseReplacementPolicy");
+    py::class_<BaseReplacementPolicyParams, SimObjectParams, std::unique_ptr<BaseReplacementPolicyParams, py::nodelete>>(m, "BaseReplacementPolicyParams")
+        ;
+
+    py::class_<gem5::replacement_policy::Base, gem5::SimObject, std::unique_ptr<gem5::replacement_policy::Base, py::nodelete>>(m, "gem5_COLONS_replacement_policy_COLONS_Base")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("BaseReplacementPolicy", module_init, "SimObject");
+
+} // namespace gem5
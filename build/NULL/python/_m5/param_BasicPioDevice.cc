@@ -0,0 +1,42 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/BasicPioDevice.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/io_device.hh"
+
+#include "base/types.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_BasicPioDevice");
+    py::class_<BasicPioDeviceParams, PioDeviceParams, std::unique_ptr<BasicPioDeviceParams, py::nodelete>>(m, "BasicPioDeviceParams")
+        .def_readwrite("pio_addr", &BasicPioDeviceParams::pio_addr)
+        .def_readwrite("pio_latency", &BasicPioDeviceParams::pio_latency)
+        ;
+
+    py::class_<gem5::BasicPioDevice, gem5::PioDevice, std::unique_ptr<gem5::BasicPioDevice, py::nodelete>>(m, "gem5_COLONS_BasicPioDevice")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("BasicPioDevice", module_init, "PioDevice");
+
+} // namespace gem5
@@ -0,0 +1,45 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/ClockedObject.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "sim/clocked_object.hh"
+
+#include "sim/clock_domain.hh"
+#include <vector>
+#include "sim/power/power_model.hh"
+#include "sim/power_state.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_ClockedObject");
+    py::class_<ClockedObjectParams, SimObjectParams, std::unique_ptr<ClockedObjectParams, py::nodelete>>(m, "ClockedObjectParams")
+        .def_readwrite("clk_domain", &ClockedObjectParams::clk_domain)
+        .def_readwrite("power_model", &ClockedObjectParams::power_model)
+        .def_readwrite("power_state", &ClockedObjectParams::power_state)
+        ;
+
+    py::class_<gem5::ClockedObject, gem5::SimObject, std::unique_ptr<gem5::ClockedObject, py::nodelete>>(m, "gem5_COLONS_ClockedObject")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("ClockedObject", module_init, "SimObject");
+
+} // namespace gem5
@@ -0,0 +1,121 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/CopyEngine.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/pci/copy_engine.hh"
+
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_CopyEngine");
+    py::class_<CopyEngineParams, PciDeviceParams, std::unique_ptr<CopyEngineParams, py::nodelete>>(m, "CopyEngineParams")
+        .def(py::init<>())
+        .def("create", &CopyEngineParams::create)
+        .def_readwrite("ChanCnt", &CopyEngineParams::ChanCnt)
+        .def_readwrite("XferCap", &CopyEngineParams::XferCap)
+        .def_readwrite("latAfterCompletion", &CopyEngineParams::latAfterCompletion)
+        .def_readwrite("latBeforeBegin", &CopyEngineParams::latBeforeBegin)
+        .def_readwrite("port_dma_connection_count", &CopyEngineParams::port_dma_connection_count)
+        ;
+
+    py::class_<gem5::CopyEngine, gem5::PciDevice, std::unique_ptr<gem5::CopyEngine, py::nodelete>>(m, "gem5_COLONS_CopyEngine")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("CopyEngine", module_init, "PciDevice");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyCopyEngineParamsClass
+{
+  public:
+    gem5::CopyEngine *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyCopyEngineShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyCopyEngineShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const CopyEngineParams &>>>
+{
+  public:
+    using Params = CopyEngineParams;
+    static gem5::CopyEngine *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyCopyEngineShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const CopyEngineParams &>>>
+{
+  public:
+    using Params = DummyCopyEngineParamsClass;
+    static gem5::CopyEngine *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::CopyEngine *
+DummyCopyEngineShunt<gem5::CopyEngine>::Params::create() const
+{
+    return DummyCopyEngineShunt<gem5::CopyEngine>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,116 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/CowDiskImage.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/storage/disk_image.hh"
+
+#include "dev/storage/disk_image.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_CowDiskImage");
+    py::class_<CowDiskImageParams, DiskImageParams, std::unique_ptr<CowDiskImageParams, py::nodelete>>(m, "CowDiskImageParams")
+        .def(py::init<>())
+        .def("create", &CowDiskImageParams::create)
+        .def_readwrite("child", &CowDiskImageParams::child)
+        .def_readwrite("table_size", &CowDiskImageParams::table_size)
+        ;
+
+    py::class_<gem5::CowDiskImage, gem5::DiskImage, std::unique_ptr<gem5::CowDiskImage, py::nodelete>>(m, "gem5_COLONS_CowDiskImage")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("CowDiskImage", module_init, "DiskImage");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyCowDiskImageParamsClass
+{
+  public:
+    gem5::CowDiskImage *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyCowDiskImageShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyCowDiskImageShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const CowDiskImageParams &>>>
+{
+  public:
+    using Params = CowDiskImageParams;
+    static gem5::CowDiskImage *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyCowDiskImageShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const CowDiskImageParams &>>>
+{
+  public:
+    using Params = DummyCowDiskImageParamsClass;
+    static gem5::CowDiskImage *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::CowDiskImage *
+DummyCowDiskImageShunt<gem5::CowDiskImage>::Params::create() const
+{
+    return DummyCowDiskImageShunt<gem5::CowDiskImage>::create(*this);
+}
+
+} // namespace gem5
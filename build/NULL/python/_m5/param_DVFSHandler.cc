@@ -0,0 +1,120 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/DVFSHandler.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "sim/dvfs_handler.hh"
+
+#include <vector>
+#include "sim/clock_domain.hh"
+#include "sim/clock_domain.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_DVFSHandler");
+    py::class_<DVFSHandlerParams, SimObjectParams, std::unique_ptr<DVFSHandlerParams, py::nodelete>>(m, "DVFSHandlerParams")
+        .def(py::init<>())
+        .def("create", &DVFSHandlerParams::create)
+        .def_readwrite("domains", &DVFSHandlerParams::domains)
+        .def_readwrite("enable", &DVFSHandlerParams::enable)
+        .def_readwrite("sys_clk_domain", &DVFSHandlerParams::sys_clk_domain)
+        .def_readwrite("transition_latency", &DVFSHandlerParams::transition_latency)
+        ;
+
+    py::class_<gem5::DVFSHandler, gem5::SimObject, std::unique_ptr<gem5::DVFSHandler, py::nodelete>>(m, "gem5_COLONS_DVFSHandler")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("DVFSHandler", module_init, "SimObject");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyDVFSHandlerParamsClass
+{
+  public:
+    gem5::DVFSHandler *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyDVFSHandlerShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyDVFSHandlerShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const DVFSHandlerParams &>>>
+{
+  public:
+    using Params = DVFSHandlerParams;
+    static gem5::DVFSHandler *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyDVFSHandlerShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const DVFSHandlerParams &>>>
+{
+  public:
+    using Params = DummyDVFSHandlerParamsClass;
+    static gem5::DVFSHandler *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::DVFSHandler *
+DummyDVFSHandlerShunt<gem5::DVFSHandler>::Params::create() const
+{
+    return DummyDVFSHandlerShunt<gem5::DVFSHandler>::create(*this);
+}
+
+} // namespace gem5
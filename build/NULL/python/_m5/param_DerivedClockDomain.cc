@@ -0,0 +1,116 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/DerivedClockDomain.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "sim/clock_domain.hh"
+
+#include "base/types.hh"
+#include "sim/clock_domain.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_DerivedClockDomain");
+    py::class_<DerivedClockDomainParams, ClockDomainParams, std::unique_ptr<DerivedClockDomainParams, py::nodelete>>(m, "DerivedClockDomainParams")
+        .def(py::init<>())
+        .def("create", &DerivedClockDomainParams::create)
+        .def_readwrite("clk_divider", &DerivedClockDomainParams::clk_divider)
+        .def_readwrite("clk_domain", &DerivedClockDomainParams::clk_domain)
+        ;
+
+    py::class_<gem5::DerivedClockDomain, gem5::ClockDomain, std::unique_ptr<gem5::DerivedClockDomain, py::nodelete>>(m, "gem5_COLONS_DerivedClockDomain")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("DerivedClockDomain", module_init, "ClockDomain");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyDerivedClockDomainParamsClass
+{
+  public:
+    gem5::DerivedClockDomain *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyDerivedClockDomainShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyDerivedClockDomainShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const DerivedClockDomainParams &>>>
+{
+  public:
+    using Params = DerivedClockDomainParams;
+    static gem5::DerivedClockDomain *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyDerivedClockDomainShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const DerivedClockDomainParams &>>>
+{
+  public:
+    using Params = DummyDerivedClockDomainParamsClass;
+    static gem5::DerivedClockDomain *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::DerivedClockDomain *
+DummyDerivedClockDomainShunt<gem5::DerivedClockDomain>::Params::create() const
+{
+    return DummyDerivedClockDomainShunt<gem5::DerivedClockDomain>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,41 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/DiskImage.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/storage/disk_image.hh"
+
+#include <string>
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_DiskImage");
+    py::class_<DiskImageParams, SimObjectParams, std::unique_ptr<DiskImageParams, py::nodelete>>(m, "DiskImageParams")
+        .def_readwrite("image_file", &DiskImageParams::image_file)
+        .def_readwrite("read_only", &DiskImageParams::read_only)
+        ;
+
+    py::class_<gem5::DiskImage, gem5::SimObject, std::unique_ptr<gem5::DiskImage, py::nodelete>>(m, "gem5_COLONS_DiskImage")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("DiskImage", module_init, "SimObject");
+
+} // namespace gem5
@@ -0,0 +1,120 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/DuelingRP.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/cache/replacement_policies/dueling_rp.hh"
+
+#include "base/types.hh"
+#include "mem/cache/replacement_policies/base.hh"
+#include "mem/cache/replacement_policies/base.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_DuelingRP");
+    py::class_<DuelingRPParams, BaseReplacementPolicyParams, std::unique_ptr<DuelingRPParams, py::nodelete>>(m, "DuelingRPParams")
+        .def(py::init<>())
+        .def("create", &DuelingRPParams::create)
+        .def_readwrite("constituency_size", &DuelingRPParams::constituency_size)
+        .def_readwrite("replacement_policy_a", &DuelingRPParams::replacement_policy_a)
+        .def_readwrite("replacement_policy_b", &DuelingRPParams::replacement_policy_b)
+        .def_readwrite("team_size", &DuelingRPParams::team_size)
+        ;
+
+    py::class_<gem5::replacement_policy::Dueling, gem5::replacement_policy::Base, std::unique_ptr<gem5::replacement_policy::Dueling, py::nodelete>>(m, "gem5_COLONS_replacement_policy_COLONS_Dueling")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("DuelingRP", module_init, "BaseReplacementPolicy");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyDuelingRPParamsClass
+{
+  public:
+    gem5::replacement_policy::Dueling *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyDuelingRPShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyDuelingRPShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const DuelingRPParams &>>>
+{
+  public:
+    using Params = DuelingRPParams;
+    static gem5::replacement_policy::Dueling *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyDuelingRPShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const DuelingRPParams &>>>
+{
+  public:
+    using Params = DummyDuelingRPParamsClass;
+    static gem5::replacement_policy::Dueling *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::replacement_policy::Dueling *
+DummyDuelingRPShunt<gem5::replacement_policy::Dueling>::Params::create() const
+{
+    return DummyDuelingRPShunt<gem5::replacement_policy::Dueling>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,40 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/EmulatedDriver.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "sim/emul_driver.hh"
+
+#include <string>
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_EmulatedDriver");
+    py::class_<EmulatedDriverParams, SimObjectParams, std::unique_ptr<EmulatedDriverParams, py::nodelete>>(m, "EmulatedDriverParams")
+        .def_readwrite("filename", &EmulatedDriverParams::filename)
+        ;
+
+    py::class_<gem5::EmulatedDriver, gem5::SimObject, std::unique_ptr<gem5::EmulatedDriver, py::nodelete>>(m, "gem5_COLONS_EmulatedDriver")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("EmulatedDriver", module_init, "SimObject");
+
+} // namespace gem5
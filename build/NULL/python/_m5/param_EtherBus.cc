@@ -0,0 +1,116 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/EtherBus.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/net/etherbus.hh"
+
+#include "dev/net/etherdump.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_EtherBus");
+    py::class_<EtherBusParams, SimObjectParams, std::unique_ptr<EtherBusParams, py::nodelete>>(m, "EtherBusParams")
+        .def(py::init<>())
+        .def("create", &EtherBusParams::create)
+        .def_readwrite("dump", &EtherBusParams::dump)
+        .def_readwrite("loopback", &EtherBusParams::loopback)
+        .def_readwrite("speed", &EtherBusParams::speed)
+        ;
+
+    py::class_<gem5::EtherBus, gem5::SimObject, std::unique_ptr<gem5::EtherBus, py::nodelete>>(m, "gem5_COLONS_EtherBus")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("EtherBus", module_init, "SimObject");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyEtherBusParamsClass
+{
+  public:
+    gem5::EtherBus *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyEtherBusShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyEtherBusShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const EtherBusParams &>>>
+{
+  public:
+    using Params = EtherBusParams;
+    static gem5::EtherBus *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyEtherBusShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const EtherBusParams &>>>
+{
+  public:
+    using Params = DummyEtherBusParamsClass;
+    static gem5::EtherBus *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::EtherBus *
+DummyEtherBusShunt<gem5::EtherBus>::Params::create() const
+{
+    return DummyEtherBusShunt<gem5::EtherBus>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,62 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/EtherDevBase.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/net/etherdevice.hh"
+
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/inet.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_EtherDevBase");
+    py::class_<EtherDevBaseParams, EtherDeviceParams, std::unique_ptr<EtherDevBaseParams, py::nodelete>>(m, "EtherDevBaseParams")
+        .def_readwrite("dma_read_delay", &EtherDevBaseParams::dma_read_delay)
+        .def_readwrite("dma_read_factor", &EtherDevBaseParams::dma_read_factor)
+        .def_readwrite("dma_write_delay", &EtherDevBaseParams::dma_write_delay)
+        .def_readwrite("dma_write_factor", &EtherDevBaseParams::dma_write_factor)
+        .def_readwrite("hardware_address", &EtherDevBaseParams::hardware_address)
+        .def_readwrite("intr_delay", &EtherDevBaseParams::intr_delay)
+        .def_readwrite("rss", &EtherDevBaseParams::rss)
+        .def_readwrite("rx_delay", &EtherDevBaseParams::rx_delay)
+        .def_readwrite("rx_fifo_size", &EtherDevBaseParams::rx_fifo_size)
+        .def_readwrite("rx_filter", &EtherDevBaseParams::rx_filter)
+        .def_readwrite("rx_thread", &EtherDevBaseParams::rx_thread)
+        .def_readwrite("tx_delay", &EtherDevBaseParams::tx_delay)
+        .def_readwrite("tx_fifo_size", &EtherDevBaseParams::tx_fifo_size)
+        .def_readwrite("tx_thread", &EtherDevBaseParams::tx_thread)
+        ;
+
+    py::class_<gem5::EtherDevBase, gem5::EtherDevice, std::unique_ptr<gem5::EtherDevBase, py::nodelete>>(m, "gem5_COLONS_EtherDevBase")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("EtherDevBase", module_init, "EtherDevice");
+
+} // namespace gem5
@@ -0,0 +1,39 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/EtherDevice.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/net/etherdevice.hh"
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_EtherDevice");
+    py::class_<EtherDeviceParams, PciDeviceParams, std::unique_ptr<EtherDeviceParams, py::nodelete>>(m, "EtherDeviceParams")
+        .def_readwrite("port_interface_connection_count", &EtherDeviceParams::port_interface_connection_count)
+        ;
+
+    py::class_<gem5::EtherDevice, gem5::PciDevice, std::unique_ptr<gem5::EtherDevice, py::nodelete>>(m, "gem5_COLONS_EtherDevice")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("EtherDevice", module_init, "PciDevice");
+
+} // namespace gem5
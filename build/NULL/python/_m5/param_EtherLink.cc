@@ -0,0 +1,121 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/EtherLink.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/net/etherlink.hh"
+
+#include "base/types.hh"
+#include "base/types.hh"
+#include "dev/net/etherdump.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_EtherLink");
+    py::class_<EtherLinkParams, SimObjectParams, std::unique_ptr<EtherLinkParams, py::nodelete>>(m, "EtherLinkParams")
+        .def(py::init<>())
+        .def("create", &EtherLinkParams::create)
+        .def_readwrite("delay", &EtherLinkParams::delay)
+        .def_readwrite("delay_var", &EtherLinkParams::delay_var)
+        .def_readwrite("dump", &EtherLinkParams::dump)
+        .def_readwrite("speed", &EtherLinkParams::speed)
+        .def_readwrite("port_int0_connection_count", &EtherLinkParams::port_int0_connection_count)
+        .def_readwrite("port_int1_connection_count", &EtherLinkParams::port_int1_connection_count)
+        ;
+
+    py::class_<gem5::EtherLink, gem5::SimObject, std::unique_ptr<gem5::EtherLink, py::nodelete>>(m, "gem5_COLONS_EtherLink")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("EtherLink", module_init, "SimObject");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyEtherLinkParamsClass
+{
+  public:
+    gem5::EtherLink *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyEtherLinkShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyEtherLinkShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const EtherLinkParams &>>>
+{
+  public:
+    using Params = EtherLinkParams;
+    static gem5::EtherLink *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyEtherLinkShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const EtherLinkParams &>>>
+{
+  public:
+    using Params = DummyEtherLinkParamsClass;
+    static gem5::EtherLink *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::EtherLink *
+DummyEtherLinkShunt<gem5::EtherLink>::Params::create() const
+{
+    return DummyEtherLinkShunt<gem5::EtherLink>::create(*this);
+}
+
+} // namespace gem5
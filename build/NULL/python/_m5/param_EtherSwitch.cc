@@ -0,0 +1,124 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/EtherSwitch.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/net/etherswitch.hh"
+
+#include "base/types.hh"
+#include "base/types.hh"
+#include "dev/net/etherdump.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_EtherSwitch");
+    py::class_<EtherSwitchParams, SimObjectParams, std::unique_ptr<EtherSwitchParams, py::nodelete>>(m, "EtherSwitchParams")
+        .def(py::init<>())
+        .def("create", &EtherSwitchParams::create)
+        .def_readwrite("delay", &EtherSwitchParams::delay)
+        .def_readwrite("delay_var", &EtherSwitchParams::delay_var)
+        .def_readwrite("dump", &EtherSwitchParams::dump)
+        .def_readwrite("fabric_speed", &EtherSwitchParams::fabric_speed)
+        .def_readwrite("output_buffer_size", &EtherSwitchParams::output_buffer_size)
+        .def_readwrite("time_to_live", &EtherSwitchParams::time_to_live)
+        .def_readwrite("port_interface_connection_count", &EtherSwitchParams::port_interface_connection_count)
+        ;
+
+    py::class_<gem5::EtherSwitch, gem5::SimObject, std::unique_ptr<gem5::EtherSwitch, py::nodelete>>(m, "gem5_COLONS_EtherSwitch")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("EtherSwitch", module_init, "SimObject");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyEtherSwitchParamsClass
+{
+  public:
+    gem5::EtherSwitch *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyEtherSwitchShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyEtherSwitchShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const EtherSwitchParams &>>>
+{
+  public:
+    using Params = EtherSwitchParams;
+    static gem5::EtherSwitch *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyEtherSwitchShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const EtherSwitchParams &>>>
+{
+  public:
+    using Params = DummyEtherSwitchParamsClass;
+    static gem5::EtherSwitch *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::EtherSwitch *
+DummyEtherSwitchShunt<gem5::EtherSwitch>::Params::create() const
+{
+    return DummyEtherSwitchShunt<gem5::EtherSwitch>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,43 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/EtherTapBase.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/net/ethertap.hh"
+
+#include "base/types.hh"
+#include "dev/net/etherdump.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_EtherTapBase");
+    py::class_<EtherTapBaseParams, SimObjectParams, std::unique_ptr<EtherTapBaseParams, py::nodelete>>(m, "EtherTapBaseParams")
+        .def_readwrite("bufsz", &EtherTapBaseParams::bufsz)
+        .def_readwrite("dump", &EtherTapBaseParams::dump)
+        .def_readwrite("port_tap_connection_count", &EtherTapBaseParams::port_tap_connection_count)
+        ;
+
+    py::class_<gem5::EtherTapBase, gem5::SimObject, std::unique_ptr<gem5::EtherTapBase, py::nodelete>>(m, "gem5_COLONS_EtherTapBase")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("EtherTapBase", module_init, "SimObject");
+
+} // namespace gem5
@@ -0,0 +1,114 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/EtherTapStub.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/net/ethertap.hh"
+
+#include "base/socket.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_EtherTapStub");
+    py::class_<EtherTapStubParams, EtherTapBaseParams, std::unique_ptr<EtherTapStubParams, py::nodelete>>(m, "EtherTapStubParams")
+        .def(py::init<>())
+        .def("create", &EtherTapStubParams::create)
+        .def_readwrite("port", &EtherTapStubParams::port)
+        ;
+
+    py::class_<gem5::EtherTapStub, gem5::EtherTapBase, std::unique_ptr<gem5::EtherTapStub, py::nodelete>>(m, "gem5_COLONS_EtherTapStub")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("EtherTapStub", module_init, "EtherTapBase");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyEtherTapStubParamsClass
+{
+  public:
+    gem5::EtherTapStub *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyEtherTapStubShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyEtherTapStubShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const EtherTapStubParams &>>>
+{
+  public:
+    using Params = EtherTapStubParams;
+    static gem5::EtherTapStub *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyEtherTapStubShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const EtherTapStubParams &>>>
+{
+  public:
+    using Params = DummyEtherTapStubParamsClass;
+    static gem5::EtherTapStub *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::EtherTapStub *
+DummyEtherTapStubShunt<gem5::EtherTapStub>::Params::create() const
+{
+    return DummyEtherTapStubShunt<gem5::EtherTapStub>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,121 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/ExternalSlave.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/external_slave.hh"
+
+#include <vector>
+#include "base/types.hh"
+#include "base/addr_range.hh"
+#include <string>
+#include <string>
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_ExternalSlave");
+    py::class_<ExternalSlaveParams, SimObjectParams, std::unique_ptr<ExternalSlaveParams, py::nodelete>>(m, "ExternalSlaveParams")
+        .def(py::init<>())
+        .def("create", &ExternalSlaveParams::create)
+        .def_readwrite("addr_ranges", &ExternalSlaveParams::addr_ranges)
+        .def_readwrite("port_data", &ExternalSlaveParams::port_data)
+        .def_readwrite("port_type", &ExternalSlaveParams::port_type)
+        .def_readwrite("port_port_connection_count", &ExternalSlaveParams::port_port_connection_count)
+        ;
+
+    py::class_<gem5::ExternalSlave, gem5::SimObject, std::unique_ptr<gem5::ExternalSlave, py::nodelete>>(m, "gem5_COLONS_ExternalSlave")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("ExternalSlave", module_init, "SimObject");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyExternalSlaveParamsClass
+{
+  public:
+    gem5::ExternalSlave *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyExternalSlaveShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyExternalSlaveShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const ExternalSlaveParams &>>>
+{
+  public:
+    using Params = ExternalSlaveParams;
+    static gem5::ExternalSlave *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyExternalSlaveShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const ExternalSlaveParams &>>>
+{
+  public:
+    using Params = DummyExternalSlaveParamsClass;
+    static gem5::ExternalSlave *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::ExternalSlave *
+DummyExternalSlaveShunt<gem5::ExternalSlave>::Params::create() const
+{
+    return DummyExternalSlaveShunt<gem5::ExternalSlave>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,114 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/FPC.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/cache/compressors/fpc.hh"
+
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_FPC");
+    py::class_<FPCParams, BaseDictionaryCompressorParams, std::unique_ptr<FPCParams, py::nodelete>>(m, "FPCParams")
+        .def(py::init<>())
+        .def("create", &FPCParams::create)
+        .def_readwrite("zero_run_bits", &FPCParams::zero_run_bits)
+        ;
+
+    py::class_<gem5::compression::FPC, gem5::compression::BaseDictionaryCompressor, std::unique_ptr<gem5::compression::FPC, py::nodelete>>(m, "gem5_COLONS_compression_COLONS_FPC")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("FPC", module_init, "BaseDictionaryCompressor");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyFPCParamsClass
+{
+  public:
+    gem5::compression::FPC *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyFPCShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyFPCShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const FPCParams &>>>
+{
+  public:
+    using Params = FPCParams;
+    static gem5::compression::FPC *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyFPCShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const FPCParams &>>>
+{
+  public:
+    using Params = DummyFPCParamsClass;
+    static gem5::compression::FPC *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::compression::FPC *
+DummyFPCShunt<gem5::compression::FPC>::Params::create() const
+{
+    return DummyFPCShunt<gem5::compression::FPC>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,129 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/FrequentValuesCompressor.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/cache/compressors/frequent_values.hh"
+
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "mem/cache/tags/indexing_policies/base.hh"
+#include "mem/cache/replacement_policies/base.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_FrequentValuesCompressor");
+    py::class_<FrequentValuesCompressorParams, BaseCacheCompressorParams, std::unique_ptr<FrequentValuesCompressorParams, py::nodelete>>(m, "FrequentValuesCompressorParams")
+        .def(py::init<>())
+        .def("create", &FrequentValuesCompressorParams::create)
+        .def_readwrite("check_saturation", &FrequentValuesCompressorParams::check_saturation)
+        .def_readwrite("code_generation_ticks", &FrequentValuesCompressorParams::code_generation_ticks)
+        .def_readwrite("counter_bits", &FrequentValuesCompressorParams::counter_bits)
+        .def_readwrite("max_code_length", &FrequentValuesCompressorParams::max_code_length)
+        .def_readwrite("num_samples", &FrequentValuesCompressorParams::num_samples)
+        .def_readwrite("vft_assoc", &FrequentValuesCompressorParams::vft_assoc)
+        .def_readwrite("vft_entries", &FrequentValuesCompressorParams::vft_entries)
+        .def_readwrite("vft_indexing_policy", &FrequentValuesCompressorParams::vft_indexing_policy)
+        .def_readwrite("vft_replacement_policy", &FrequentValuesCompressorParams::vft_replacement_policy)
+        ;
+
+    py::class_<gem5::compression::FrequentValues, gem5::compression::Base, std::unique_ptr<gem5::compression::FrequentValues, py::nodelete>>(m, "gem5_COLONS_compression_COLONS_FrequentValues")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("FrequentValuesCompressor", module_init, "BaseCacheCompressor");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyFrequentValuesCompressorParamsClass
+{
+  public:
+    gem5::compression::FrequentValues *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyFrequentValuesCompressorShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyFrequentValuesCompressorShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const FrequentValuesCompressorParams &>>>
+{
+  public:
+    using Params = FrequentValuesCompressorParams;
+    static gem5::compression::FrequentValues *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyFrequentValuesCompressorShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const FrequentValuesCompressorParams &>>>
+{
+  public:
+    using Params = DummyFrequentValuesCompressorParamsClass;
+    static gem5::compression::FrequentValues *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::compression::FrequentValues *
+DummyFrequentValuesCompressorShunt<gem5::compression::FrequentValues>::Params::create() const
+{
+    return DummyFrequentValuesCompressorShunt<gem5::compression::FrequentValues>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,115 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/GoodbyeObject.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "learning_gem5/part2/goodbye_object.hh"
+
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_GoodbyeObject");
+    py::class_<GoodbyeObjectParams, SimObjectParams, std::unique_ptr<GoodbyeObjectParams, py::nodelete>>(m, "GoodbyeObjectParams")
+        .def(py::init<>())
+        .def("create", &GoodbyeObjectParams::create)
+        .def_readwrite("buffer_size", &GoodbyeObjectParams::buffer_size)
+        .def_readwrite("write_bandwidth", &GoodbyeObjectParams::write_bandwidth)
+        ;
+
+    py::class_<gem5::GoodbyeObject, gem5::SimObject, std::unique_ptr<gem5::GoodbyeObject, py::nodelete>>(m, "gem5_COLONS_GoodbyeObject")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("GoodbyeObject", module_init, "SimObject");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyGoodbyeObjectParamsClass
+{
+  public:
+    gem5::GoodbyeObject *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyGoodbyeObjectShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyGoodbyeObjectShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const GoodbyeObjectParams &>>>
+{
+  public:
+    using Params = GoodbyeObjectParams;
+    static gem5::GoodbyeObject *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyGoodbyeObjectShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const GoodbyeObjectParams &>>>
+{
+  public:
+    using Params = DummyGoodbyeObjectParamsClass;
+    static gem5::GoodbyeObject *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::GoodbyeObject *
+DummyGoodbyeObjectShunt<gem5::GoodbyeObject>::Params::create() const
+{
+    return DummyGoodbyeObjectShunt<gem5::GoodbyeObject>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,114 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/HBMCtrl.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/hbm_ctrl.hh"
+
+#include "mem/dram_interface.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_HBMCtrl");
+    py::class_<HBMCtrlParams, MemCtrlParams, std::unique_ptr<HBMCtrlParams, py::nodelete>>(m, "HBMCtrlParams")
+        .def(py::init<>())
+        .def("create", &HBMCtrlParams::create)
+        .def_readwrite("dram_2", &HBMCtrlParams::dram_2)
+        ;
+
+    py::class_<gem5::memory::HBMCtrl, gem5::memory::MemCtrl, std::unique_ptr<gem5::memory::HBMCtrl, py::nodelete>>(m, "gem5_COLONS_memory_COLONS_HBMCtrl")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("HBMCtrl", module_init, "MemCtrl");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyHBMCtrlParamsClass
+{
+  public:
+    gem5::memory::HBMCtrl *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyHBMCtrlShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyHBMCtrlShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const HBMCtrlParams &>>>
+{
+  public:
+    using Params = HBMCtrlParams;
+    static gem5::memory::HBMCtrl *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyHBMCtrlShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const HBMCtrlParams &>>>
+{
+  public:
+    using Params = DummyHBMCtrlParamsClass;
+    static gem5::memory::HBMCtrl *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::memory::HBMCtrl *
+DummyHBMCtrlShunt<gem5::memory::HBMCtrl>::Params::create() const
+{
+    return DummyHBMCtrlShunt<gem5::memory::HBMCtrl>::create(*this);
+}
+
+} // namespace gem5
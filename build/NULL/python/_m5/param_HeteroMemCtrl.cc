@@ -0,0 +1,114 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/HeteroMemCtrl.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/hetero_mem_ctrl.hh"
+
+#include "mem/nvm_interface.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_HeteroMemCtrl");
+    py::class_<HeteroMemCtrlParams, MemCtrlParams, std::unique_ptr<HeteroMemCtrlParams, py::nodelete>>(m, "HeteroMemCtrlParams")
+        .def(py::init<>())
+        .def("create", &HeteroMemCtrlParams::create)
+        .def_readwrite("nvm", &HeteroMemCtrlParams::nvm)
+        ;
+
+    py::class_<gem5::memory::HeteroMemCtrl, gem5::memory::MemCtrl, std::unique_ptr<gem5::memory::HeteroMemCtrl, py::nodelete>>(m, "gem5_COLONS_memory_COLONS_HeteroMemCtrl")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("HeteroMemCtrl", module_init, "MemCtrl");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyHeteroMemCtrlParamsClass
+{
+  public:
+    gem5::memory::HeteroMemCtrl *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyHeteroMemCtrlShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyHeteroMemCtrlShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const HeteroMemCtrlParams &>>>
+{
+  public:
+    using Params = HeteroMemCtrlParams;
+    static gem5::memory::HeteroMemCtrl *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyHeteroMemCtrlShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const HeteroMemCtrlParams &>>>
+{
+  public:
+    using Params = DummyHeteroMemCtrlParamsClass;
+    static gem5::memory::HeteroMemCtrl *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::memory::HeteroMemCtrl *
+DummyHeteroMemCtrlShunt<gem5::memory::HeteroMemCtrl>::Params::create() const
+{
+    return DummyHeteroMemCtrlShunt<gem5::memory::HeteroMemCtrl>::create(*this);
+}
+
+} // namespace gem5
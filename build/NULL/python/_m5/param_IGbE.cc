@@ -0,0 +1,138 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/IGbE.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/net/i8254xGBe.hh"
+
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/inet.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_IGbE");
+    py::class_<IGbEParams, EtherDeviceParams, std::unique_ptr<IGbEParams, py::nodelete>>(m, "IGbEParams")
+        .def(py::init<>())
+        .def("create", &IGbEParams::create)
+        .def_readwrite("fetch_comp_delay", &IGbEParams::fetch_comp_delay)
+        .def_readwrite("fetch_delay", &IGbEParams::fetch_delay)
+        .def_readwrite("hardware_address", &IGbEParams::hardware_address)
+        .def_readwrite("phy_epid", &IGbEParams::phy_epid)
+        .def_readwrite("phy_pid", &IGbEParams::phy_pid)
+        .def_readwrite("rx_desc_cache_size", &IGbEParams::rx_desc_cache_size)
+        .def_readwrite("rx_fifo_size", &IGbEParams::rx_fifo_size)
+        .def_readwrite("rx_write_delay", &IGbEParams::rx_write_delay)
+        .def_readwrite("tx_desc_cache_size", &IGbEParams::tx_desc_cache_size)
+        .def_readwrite("tx_fifo_size", &IGbEParams::tx_fifo_size)
+        .def_readwrite("tx_read_delay", &IGbEParams::tx_read_delay)
+        .def_readwrite("wb_comp_delay", &IGbEParams::wb_comp_delay)
+        .def_readwrite("wb_delay", &IGbEParams::wb_delay)
+        ;
+
+    py::class_<gem5::IGbE, gem5::EtherDevice, std::unique_ptr<gem5::IGbE, py::nodelete>>(m, "gem5_COLONS_IGbE")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("IGbE", module_init, "EtherDevice");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyIGbEParamsClass
+{
+  public:
+    gem5::IGbE *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyIGbEShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyIGbEShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const IGbEParams &>>>
+{
+  public:
+    using Params = IGbEParams;
+    static gem5::IGbE *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyIGbEShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const IGbEParams &>>>
+{
+  public:
+    using Params = DummyIGbEParamsClass;
+    static gem5::IGbE *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::IGbE *
+DummyIGbEShunt<gem5::IGbE>::Params::create() const
+{
+    return DummyIGbEShunt<gem5::IGbE>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,119 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/IdeController.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/storage/ide_ctrl.hh"
+
+#include "base/types.hh"
+#include <vector>
+#include "dev/storage/ide_disk.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_IdeController");
+    py::class_<IdeControllerParams, PciDeviceParams, std::unique_ptr<IdeControllerParams, py::nodelete>>(m, "IdeControllerParams")
+        .def(py::init<>())
+        .def("create", &IdeControllerParams::create)
+        .def_readwrite("ctrl_offset", &IdeControllerParams::ctrl_offset)
+        .def_readwrite("disks", &IdeControllerParams::disks)
+        .def_readwrite("io_shift", &IdeControllerParams::io_shift)
+        ;
+
+    py::class_<gem5::IdeController, gem5::PciDevice, std::unique_ptr<gem5::IdeController, py::nodelete>>(m, "gem5_COLONS_IdeController")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("IdeController", module_init, "PciDevice");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyIdeControllerParamsClass
+{
+  public:
+    gem5::IdeController *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyIdeControllerShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyIdeControllerShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const IdeControllerParams &>>>
+{
+  public:
+    using Params = IdeControllerParams;
+    static gem5::IdeController *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyIdeControllerShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const IdeControllerParams &>>>
+{
+  public:
+    using Params = DummyIdeControllerParamsClass;
+    static gem5::IdeController *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::IdeController *
+DummyIdeControllerShunt<gem5::IdeController>::Params::create() const
+{
+    return DummyIdeControllerShunt<gem5::IdeController>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,118 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/IdeDisk.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/storage/ide_disk.hh"
+
+#include "base/types.hh"
+#include "enums/IdeID.hh"
+#include "dev/storage/disk_image.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_IdeDisk");
+    py::class_<IdeDiskParams, SimObjectParams, std::unique_ptr<IdeDiskParams, py::nodelete>>(m, "IdeDiskParams")
+        .def(py::init<>())
+        .def("create", &IdeDiskParams::create)
+        .def_readwrite("delay", &IdeDiskParams::delay)
+        .def_readwrite("driveID", &IdeDiskParams::driveID)
+        .def_readwrite("image", &IdeDiskParams::image)
+        ;
+
+    py::class_<gem5::IdeDisk, gem5::SimObject, std::unique_ptr<gem5::IdeDisk, py::nodelete>>(m, "gem5_COLONS_IdeDisk")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("IdeDisk", module_init, "SimObject");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyIdeDiskParamsClass
+{
+  public:
+    gem5::IdeDisk *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyIdeDiskShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyIdeDiskShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const IdeDiskParams &>>>
+{
+  public:
+    using Params = IdeDiskParams;
+    static gem5::IdeDisk *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyIdeDiskShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const IdeDiskParams &>>>
+{
+  public:
+    using Params = DummyIdeDiskParamsClass;
+    static gem5::IdeDisk *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::IdeDisk *
+DummyIdeDiskShunt<gem5::IdeDisk>::Params::create() const
+{
+    return DummyIdeDiskShunt<gem5::IdeDisk>::create(*this);
+}
+
+} // namespace gem5
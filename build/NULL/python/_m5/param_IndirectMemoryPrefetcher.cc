@@ -0,0 +1,143 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/IndirectMemoryPrefetcher.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/cache/prefetch/indirect_memory.hh"
+
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "mem/cache/tags/indexing_policies/base.hh"
+#include "mem/cache/replacement_policies/base.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "mem/cache/tags/indexing_policies/base.hh"
+#include "mem/cache/replacement_policies/base.hh"
+#include <vector>
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_IndirectMemoryPrefetcher");
+    py::class_<IndirectMemoryPrefetcherParams, QueuedPrefetcherParams, std::unique_ptr<IndirectMemoryPrefetcherParams, py::nodelete>>(m, "IndirectMemoryPrefetcherParams")
+        .def(py::init<>())
+        .def("create", &IndirectMemoryPrefetcherParams::create)
+        .def_readwrite("addr_array_len", &IndirectMemoryPrefetcherParams::addr_array_len)
+        .def_readwrite("ipd_table_assoc", &IndirectMemoryPrefetcherParams::ipd_table_assoc)
+        .def_readwrite("ipd_table_entries", &IndirectMemoryPrefetcherParams::ipd_table_entries)
+        .def_readwrite("ipd_table_indexing_policy", &IndirectMemoryPrefetcherParams::ipd_table_indexing_policy)
+        .def_readwrite("ipd_table_replacement_policy", &IndirectMemoryPrefetcherParams::ipd_table_replacement_policy)
+        .def_readwrite("max_prefetch_distance", &IndirectMemoryPrefetcherParams::max_prefetch_distance)
+        .def_readwrite("num_indirect_counter_bits", &IndirectMemoryPrefetcherParams::num_indirect_counter_bits)
+        .def_readwrite("prefetch_threshold", &IndirectMemoryPrefetcherParams::prefetch_threshold)
+        .def_readwrite("pt_table_assoc", &IndirectMemoryPrefetcherParams::pt_table_assoc)
+        .def_readwrite("pt_table_entries", &IndirectMemoryPrefetcherParams::pt_table_entries)
+        .def_readwrite("pt_table_indexing_policy", &IndirectMemoryPrefetcherParams::pt_table_indexing_policy)
+        .def_readwrite("pt_table_replacement_policy", &IndirectMemoryPrefetcherParams::pt_table_replacement_policy)
+        .def_readwrite("shift_values", &IndirectMemoryPrefetcherParams::shift_values)
+        .def_readwrite("stream_counter_threshold", &IndirectMemoryPrefetcherParams::stream_counter_threshold)
+        .def_readwrite("streaming_distance", &IndirectMemoryPrefetcherParams::streaming_distance)
+        ;
+
+    py::class_<gem5::prefetch::IndirectMemory, gem5::prefetch::Queued, std::unique_ptr<gem5::prefetch::IndirectMemory, py::nodelete>>(m, "gem5_COLONS_prefetch_COLONS_IndirectMemory")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("IndirectMemoryPrefetcher", module_init, "QueuedPrefetcher");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyIndirectMemoryPrefetcherParamsClass
+{
+  public:
+    gem5::prefetch::IndirectMemory *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyIndirectMemoryPrefetcherShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyIndirectMemoryPrefetcherShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const IndirectMemoryPrefetcherParams &>>>
+{
+  public:
+    using Params = IndirectMemoryPrefetcherParams;
+    static gem5::prefetch::IndirectMemory *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyIndirectMemoryPrefetcherShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const IndirectMemoryPrefetcherParams &>>>
+{
+  public:
+    using Params = DummyIndirectMemoryPrefetcherParamsClass;
+    static gem5::prefetch::IndirectMemory *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::prefetch::IndirectMemory *
+DummyIndirectMemoryPrefetcherShunt<gem5::prefetch::IndirectMemory>::Params::create() const
+{
+    return DummyIndirectMemoryPrefetcherShunt<gem5::prefetch::IndirectMemory>::create(*this);
+}
+
+} // namespace gem5
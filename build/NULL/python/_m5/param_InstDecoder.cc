@@ -0,0 +1,40 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/InstDecoder.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "arch/generic/decoder.hh"
+
+#include "arch/generic/isa.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_InstDecoder");
+    py::class_<InstDecoderParams, SimObjectParams, std::unique_ptr<InstDecoderParams, py::nodelete>>(m, "InstDecoderParams")
+        .def_readwrite("isa", &InstDecoderParams::isa)
+        ;
+
+    py::class_<gem5::InstDecoder, gem5::SimObject, std::unique_ptr<gem5::InstDecoder, py::nodelete>>(m, "gem5_COLONS_InstDecoder")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("InstDecoder", module_init, "SimObject");
+
+} // namespace gem5
@@ -0,0 +1,112 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/InstDisassembler.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "sim/insttracer.hh"
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_InstDisassembler");
+    py::class_<InstDisassemblerParams, SimObjectParams, std::unique_ptr<InstDisassemblerParams, py::nodelete>>(m, "InstDisassemblerParams")
+        .def(py::init<>())
+        .def("create", &InstDisassemblerParams::create)
+        ;
+
+    py::class_<gem5::trace::InstDisassembler, gem5::SimObject, std::unique_ptr<gem5::trace::InstDisassembler, py::nodelete>>(m, "gem5_COLONS_trace_COLONS_InstDisassembler")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("InstDisassembler", module_init, "SimObject");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyInstDisassemblerParamsClass
+{
+  public:
+    gem5::trace::InstDisassembler *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyInstDisassemblerShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyInstDisassemblerShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const InstDisassemblerParams &>>>
+{
+  public:
+    using Params = InstDisassemblerParams;
+    static gem5::trace::InstDisassembler *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyInstDisassemblerShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const InstDisassemblerParams &>>>
+{
+  public:
+    using Params = DummyInstDisassemblerParamsClass;
+    static gem5::trace::InstDisassembler *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::trace::InstDisassembler *
+DummyInstDisassemblerShunt<gem5::trace::InstDisassembler>::Params::create() const
+{
+    return DummyInstDisassemblerShunt<gem5::trace::InstDisassembler>::create(*this);
+}
+
+} // namespace gem5
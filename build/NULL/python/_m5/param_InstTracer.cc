@@ -0,0 +1,40 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/InstTracer.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "sim/insttracer.hh"
+
+#include "sim/insttracer.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_InstTracer");
+    py::class_<InstTracerParams, SimObjectParams, std::unique_ptr<InstTracerParams, py::nodelete>>(m, "InstTracerParams")
+        .def_readwrite("disassembler", &InstTracerParams::disassembler)
+        ;
+
+    py::class_<gem5::trace::InstTracer, gem5::SimObject, std::unique_ptr<gem5::trace::InstTracer, py::nodelete>>(m, "gem5_COLONS_trace_COLONS_InstTracer")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("InstTracer", module_init, "SimObject");
+
+} // namespace gem5
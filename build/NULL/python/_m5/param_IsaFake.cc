@@ -0,0 +1,127 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/IsaFake.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/isa_fake.hh"
+
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include <string>
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_IsaFake");
+    py::class_<IsaFakeParams, BasicPioDeviceParams, std::unique_ptr<IsaFakeParams, py::nodelete>>(m, "IsaFakeParams")
+        .def(py::init<>())
+        .def("create", &IsaFakeParams::create)
+        .def_readwrite("fake_mem", &IsaFakeParams::fake_mem)
+        .def_readwrite("pio_size", &IsaFakeParams::pio_size)
+        .def_readwrite("ret_bad_addr", &IsaFakeParams::ret_bad_addr)
+        .def_readwrite("ret_data16", &IsaFakeParams::ret_data16)
+        .def_readwrite("ret_data32", &IsaFakeParams::ret_data32)
+        .def_readwrite("ret_data64", &IsaFakeParams::ret_data64)
+        .def_readwrite("ret_data8", &IsaFakeParams::ret_data8)
+        .def_readwrite("update_data", &IsaFakeParams::update_data)
+        .def_readwrite("warn_access", &IsaFakeParams::warn_access)
+        ;
+
+    py::class_<gem5::IsaFake, gem5::BasicPioDevice, std::unique_ptr<gem5::IsaFake, py::nodelete>>(m, "gem5_COLONS_IsaFake")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("IsaFake", module_init, "BasicPioDevice");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyIsaFakeParamsClass
+{
+  public:
+    gem5::IsaFake *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyIsaFakeShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyIsaFakeShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const IsaFakeParams &>>>
+{
+  public:
+    using Params = IsaFakeParams;
+    static gem5::IsaFake *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyIsaFakeShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const IsaFakeParams &>>>
+{
+  public:
+    using Params = DummyIsaFakeParamsClass;
+    static gem5::IsaFake *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::IsaFake *
+DummyIsaFakeShunt<gem5::IsaFake>::Params::create() const
+{
+    return DummyIsaFakeShunt<gem5::IsaFake>::create(*this);
+}
+
+} // namespace gem5
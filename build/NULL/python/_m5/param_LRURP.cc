@@ -0,0 +1,112 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/LRURP.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/cache/replacement_policies/lru_rp.hh"
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_LRURP");
+    py::class_<LRURPParams, BaseReplacementPolicyParams, std::unique_ptr<LRURPParams, py::nodelete>>(m, "LRURPParams")
+        .def(py::init<>())
+        .def("create", &LRURPParams::create)
+        ;
+
+    py::class_<gem5::replacement_policy::LRU, gem5::replacement_policy::Base, std::unique_ptr<gem5::replacement_policy::LRU, py::nodelete>>(m, "gem5_COLONS_replacement_policy_COLONS_LRU")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("LRURP", module_init, "BaseReplacementPolicy");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyLRURPParamsClass
+{
+  public:
+    gem5::replacement_policy::LRU *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyLRURPShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyLRURPShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const LRURPParams &>>>
+{
+  public:
+    using Params = LRURPParams;
+    static gem5::replacement_policy::LRU *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyLRURPShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const LRURPParams &>>>
+{
+  public:
+    using Params = DummyLRURPParamsClass;
+    static gem5::replacement_policy::LRU *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::replacement_policy::LRU *
+DummyLRURPShunt<gem5::replacement_policy::LRU>::Params::create() const
+{
+    return DummyLRURPShunt<gem5::replacement_policy::LRU>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,132 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/MemCtrl.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/mem_ctrl.hh"
+
+#include "base/types.hh"
+#include "mem/mem_interface.hh"
+#include "enums/MemSched.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_MemCtrl");
+    py::class_<MemCtrlParams, QoSMemCtrlParams, std::unique_ptr<MemCtrlParams, py::nodelete>>(m, "MemCtrlParams")
+        .def(py::init<>())
+        .def("create", &MemCtrlParams::create)
+        .def_readwrite("command_window", &MemCtrlParams::command_window)
+        .def_readwrite("disable_sanity_check", &MemCtrlParams::disable_sanity_check)
+        .def_readwrite("dram", &MemCtrlParams::dram)
+        .def_readwrite("mem_sched_policy", &MemCtrlParams::mem_sched_policy)
+        .def_readwrite("min_reads_per_switch", &MemCtrlParams::min_reads_per_switch)
+        .def_readwrite("min_writes_per_switch", &MemCtrlParams::min_writes_per_switch)
+        .def_readwrite("static_backend_latency", &MemCtrlParams::static_backend_latency)
+        .def_readwrite("static_frontend_latency", &MemCtrlParams::static_frontend_latency)
+        .def_readwrite("write_high_thresh_perc", &MemCtrlParams::write_high_thresh_perc)
+        .def_readwrite("write_low_thresh_perc", &MemCtrlParams::write_low_thresh_perc)
+        .def_readwrite("port_port_connection_count", &MemCtrlParams::port_port_connection_count)
+        ;
+
+    py::class_<gem5::memory::MemCtrl, gem5::memory::qos::MemCtrl, std::unique_ptr<gem5::memory::MemCtrl, py::nodelete>>(m, "gem5_COLONS_memory_COLONS_MemCtrl")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("MemCtrl", module_init, "QoSMemCtrl");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyMemCtrlParamsClass
+{
+  public:
+    gem5::memory::MemCtrl *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyMemCtrlShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyMemCtrlShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const MemCtrlParams &>>>
+{
+  public:
+    using Params = MemCtrlParams;
+    static gem5::memory::MemCtrl *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyMemCtrlShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const MemCtrlParams &>>>
+{
+  public:
+    using Params = DummyMemCtrlParamsClass;
+    static gem5::memory::MemCtrl *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::memory::MemCtrl *
+DummyMemCtrlShunt<gem5::memory::MemCtrl>::Params::create() const
+{
+    return DummyMemCtrlShunt<gem5::memory::MemCtrl>::create(*this);
+}
+
+} // namespace gem5
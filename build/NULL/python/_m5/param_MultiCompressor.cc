@@ -0,0 +1,116 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/MultiCompressor.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/cache/compressors/multi.hh"
+
+#include <vector>
+#include "mem/cache/compressors/base.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_MultiCompressor");
+    py::class_<MultiCompressorParams, BaseCacheCompressorParams, std::unique_ptr<MultiCompressorParams, py::nodelete>>(m, "MultiCompressorParams")
+        .def(py::init<>())
+        .def("create", &MultiCompressorParams::create)
+        .def_readwrite("compressors", &MultiCompressorParams::compressors)
+        .def_readwrite("encoding_in_tags", &MultiCompressorParams::encoding_in_tags)
+        ;
+
+    py::class_<gem5::compression::Multi, gem5::compression::Base, std::unique_ptr<gem5::compression::Multi, py::nodelete>>(m, "gem5_COLONS_compression_COLONS_Multi")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("MultiCompressor", module_init, "BaseCacheCompressor");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyMultiCompressorParamsClass
+{
+  public:
+    gem5::compression::Multi *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyMultiCompressorShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyMultiCompressorShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const MultiCompressorParams &>>>
+{
+  public:
+    using Params = MultiCompressorParams;
+    static gem5::compression::Multi *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyMultiCompressorShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const MultiCompressorParams &>>>
+{
+  public:
+    using Params = DummyMultiCompressorParamsClass;
+    static gem5::compression::Multi *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::compression::Multi *
+DummyMultiCompressorShunt<gem5::compression::Multi>::Params::create() const
+{
+    return DummyMultiCompressorShunt<gem5::compression::Multi>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,115 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/NSGigE.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/net/ns_gige.hh"
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_NSGigE");
+    py::class_<NSGigEParams, EtherDevBaseParams, std::unique_ptr<NSGigEParams, py::nodelete>>(m, "NSGigEParams")
+        .def(py::init<>())
+        .def("create", &NSGigEParams::create)
+        .def_readwrite("dma_data_free", &NSGigEParams::dma_data_free)
+        .def_readwrite("dma_desc_free", &NSGigEParams::dma_desc_free)
+        .def_readwrite("dma_no_allocate", &NSGigEParams::dma_no_allocate)
+        ;
+
+    py::class_<gem5::NSGigE, gem5::EtherDevBase, std::unique_ptr<gem5::NSGigE, py::nodelete>>(m, "gem5_COLONS_NSGigE")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("NSGigE", module_init, "EtherDevBase");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyNSGigEParamsClass
+{
+  public:
+    gem5::NSGigE *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyNSGigEShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyNSGigEShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const NSGigEParams &>>>
+{
+  public:
+    using Params = NSGigEParams;
+    static gem5::NSGigE *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyNSGigEShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const NSGigEParams &>>>
+{
+  public:
+    using Params = DummyNSGigEParamsClass;
+    static gem5::NSGigE *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::NSGigE *
+DummyNSGigEShunt<gem5::NSGigE>::Params::create() const
+{
+    return DummyNSGigEShunt<gem5::NSGigE>::create(*this);
+}
+
+} // namespace gem5
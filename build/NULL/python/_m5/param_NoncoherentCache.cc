@@ -0,0 +1,112 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/NoncoherentCache.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/cache/noncoherent_cache.hh"
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_NoncoherentCache");
+    py::class_<NoncoherentCacheParams, BaseCacheParams, std::unique_ptr<NoncoherentCacheParams, py::nodelete>>(m, "NoncoherentCacheParams")
+        .def(py::init<>())
+        .def("create", &NoncoherentCacheParams::create)
+        ;
+
+    py::class_<gem5::NoncoherentCache, gem5::BaseCache, std::unique_ptr<gem5::NoncoherentCache, py::nodelete>>(m, "gem5_COLONS_NoncoherentCache")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("NoncoherentCache", module_init, "BaseCache");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyNoncoherentCacheParamsClass
+{
+  public:
+    gem5::NoncoherentCache *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyNoncoherentCacheShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyNoncoherentCacheShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const NoncoherentCacheParams &>>>
+{
+  public:
+    using Params = NoncoherentCacheParams;
+    static gem5::NoncoherentCache *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyNoncoherentCacheShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const NoncoherentCacheParams &>>>
+{
+  public:
+    using Params = DummyNoncoherentCacheParamsClass;
+    static gem5::NoncoherentCache *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::NoncoherentCache *
+DummyNoncoherentCacheShunt<gem5::NoncoherentCache>::Params::create() const
+{
+    return DummyNoncoherentCacheShunt<gem5::NoncoherentCache>::create(*this);
+}
+
+} // namespace gem5
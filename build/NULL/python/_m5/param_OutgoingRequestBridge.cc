@@ -0,0 +1,117 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/OutgoingRequestBridge.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "sst/outgoing_request_bridge.hh"
+
+#include <vector>
+#include "base/types.hh"
+#include "base/addr_range.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_OutgoingRequestBridge");
+    py::class_<OutgoingRequestBridgeParams, SimObjectParams, std::unique_ptr<OutgoingRequestBridgeParams, py::nodelete>>(m, "OutgoingRequestBridgeParams")
+        .def(py::init<>())
+        .def("create", &OutgoingRequestBridgeParams::create)
+        .def_readwrite("physical_address_ranges", &OutgoingRequestBridgeParams::physical_address_ranges)
+        .def_readwrite("port_port_connection_count", &OutgoingRequestBridgeParams::port_port_connection_count)
+        ;
+
+    py::class_<gem5::OutgoingRequestBridge, gem5::SimObject, std::unique_ptr<gem5::OutgoingRequestBridge, py::nodelete>>(m, "gem5_COLONS_OutgoingRequestBridge")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("OutgoingRequestBridge", module_init, "SimObject");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyOutgoingRequestBridgeParamsClass
+{
+  public:
+    gem5::OutgoingRequestBridge *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyOutgoingRequestBridgeShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyOutgoingRequestBridgeShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const OutgoingRequestBridgeParams &>>>
+{
+  public:
+    using Params = OutgoingRequestBridgeParams;
+    static gem5::OutgoingRequestBridge *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyOutgoingRequestBridgeShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const OutgoingRequestBridgeParams &>>>
+{
+  public:
+    using Params = DummyOutgoingRequestBridgeParamsClass;
+    static gem5::OutgoingRequestBridge *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::OutgoingRequestBridge *
+DummyOutgoingRequestBridgeShunt<gem5::OutgoingRequestBridge>::Params::create() const
+{
+    return DummyOutgoingRequestBridgeShunt<gem5::OutgoingRequestBridge>::create(*this);
+}
+
+} // namespace gem5
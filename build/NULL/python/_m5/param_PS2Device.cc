@@ -0,0 +1,38 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/PS2Device.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/ps2/device.hh"
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_PS2Device");
+    py::class_<PS2DeviceParams, SimObjectParams, std::unique_ptr<PS2DeviceParams, py::nodelete>>(m, "PS2DeviceParams")
+        ;
+
+    py::class_<gem5::ps2::Device, gem5::SimObject, std::unique_ptr<gem5::ps2::Device, py::nodelete>>(m, "gem5_COLONS_ps2_COLONS_Device")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("PS2Device", module_init, "SimObject");
+
+} // namespace gem5
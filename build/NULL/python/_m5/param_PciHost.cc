@@ -0,0 +1,38 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/PciHost.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/pci/host.hh"
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_PciHost");
+    py::class_<PciHostParams, PioDeviceParams, std::unique_ptr<PciHostParams, py::nodelete>>(m, "PciHostParams")
+        ;
+
+    py::class_<gem5::PciHost, gem5::PioDevice, std::unique_ptr<gem5::PciHost, py::nodelete>>(m, "gem5_COLONS_PciHost")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("PciHost", module_init, "PioDevice");
+
+} // namespace gem5
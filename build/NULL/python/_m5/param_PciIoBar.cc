@@ -0,0 +1,114 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/PciIoBar.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/pci/device.hh"
+
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_PciIoBar");
+    py::class_<PciIoBarParams, PciBarParams, std::unique_ptr<PciIoBarParams, py::nodelete>>(m, "PciIoBarParams")
+        .def(py::init<>())
+        .def("create", &PciIoBarParams::create)
+        .def_readwrite("size", &PciIoBarParams::size)
+        ;
+
+    py::class_<gem5::PciIoBar, gem5::PciBar, std::unique_ptr<gem5::PciIoBar, py::nodelete>>(m, "gem5_COLONS_PciIoBar")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("PciIoBar", module_init, "PciBar");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyPciIoBarParamsClass
+{
+  public:
+    gem5::PciIoBar *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyPciIoBarShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyPciIoBarShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const PciIoBarParams &>>>
+{
+  public:
+    using Params = PciIoBarParams;
+    static gem5::PciIoBar *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyPciIoBarShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const PciIoBarParams &>>>
+{
+  public:
+    using Params = DummyPciIoBarParamsClass;
+    static gem5::PciIoBar *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::PciIoBar *
+DummyPciIoBarShunt<gem5::PciIoBar>::Params::create() const
+{
+    return DummyPciIoBarShunt<gem5::PciIoBar>::create(*this);
+}
+
+} // namespace gem5
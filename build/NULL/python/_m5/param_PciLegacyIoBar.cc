@@ -0,0 +1,114 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/PciLegacyIoBar.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/pci/device.hh"
+
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_PciLegacyIoBar");
+    py::class_<PciLegacyIoBarParams, PciIoBarParams, std::unique_ptr<PciLegacyIoBarParams, py::nodelete>>(m, "PciLegacyIoBarParams")
+        .def(py::init<>())
+        .def("create", &PciLegacyIoBarParams::create)
+        .def_readwrite("addr", &PciLegacyIoBarParams::addr)
+        ;
+
+    py::class_<gem5::PciLegacyIoBar, gem5::PciIoBar, std::unique_ptr<gem5::PciLegacyIoBar, py::nodelete>>(m, "gem5_COLONS_PciLegacyIoBar")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("PciLegacyIoBar", module_init, "PciIoBar");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyPciLegacyIoBarParamsClass
+{
+  public:
+    gem5::PciLegacyIoBar *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyPciLegacyIoBarShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyPciLegacyIoBarShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const PciLegacyIoBarParams &>>>
+{
+  public:
+    using Params = PciLegacyIoBarParams;
+    static gem5::PciLegacyIoBar *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyPciLegacyIoBarShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const PciLegacyIoBarParams &>>>
+{
+  public:
+    using Params = DummyPciLegacyIoBarParamsClass;
+    static gem5::PciLegacyIoBar *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::PciLegacyIoBar *
+DummyPciLegacyIoBarShunt<gem5::PciLegacyIoBar>::Params::create() const
+{
+    return DummyPciLegacyIoBarShunt<gem5::PciLegacyIoBar>::create(*this);
+}
+
+} // namespace gem5
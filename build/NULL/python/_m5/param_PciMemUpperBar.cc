@@ -0,0 +1,112 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/PciMemUpperBar.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/pci/device.hh"
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_PciMemUpperBar");
+    py::class_<PciMemUpperBarParams, PciBarParams, std::unique_ptr<PciMemUpperBarParams, py::nodelete>>(m, "PciMemUpperBarParams")
+        .def(py::init<>())
+        .def("create", &PciMemUpperBarParams::create)
+        ;
+
+    py::class_<gem5::PciMemUpperBar, gem5::PciBar, std::unique_ptr<gem5::PciMemUpperBar, py::nodelete>>(m, "gem5_COLONS_PciMemUpperBar")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("PciMemUpperBar", module_init, "PciBar");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyPciMemUpperBarParamsClass
+{
+  public:
+    gem5::PciMemUpperBar *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyPciMemUpperBarShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyPciMemUpperBarShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const PciMemUpperBarParams &>>>
+{
+  public:
+    using Params = PciMemUpperBarParams;
+    static gem5::PciMemUpperBar *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyPciMemUpperBarShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const PciMemUpperBarParams &>>>
+{
+  public:
+    using Params = DummyPciMemUpperBarParamsClass;
+    static gem5::PciMemUpperBar *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::PciMemUpperBar *
+DummyPciMemUpperBarShunt<gem5::PciMemUpperBar>::Params::create() const
+{
+    return DummyPciMemUpperBarShunt<gem5::PciMemUpperBar>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,40 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/Platform.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/platform.hh"
+
+#include "sim/system.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_Platform");
+    py::class_<PlatformParams, SimObjectParams, std::unique_ptr<PlatformParams, py::nodelete>>(m, "PlatformParams")
+        .def_readwrite("system", &PlatformParams::system)
+        ;
+
+    py::class_<gem5::Platform, gem5::SimObject, std::unique_ptr<gem5::Platform, py::nodelete>>(m, "gem5_COLONS_Platform")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("Platform", module_init, "SimObject");
+
+} // namespace gem5
@@ -0,0 +1,126 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/PowerState.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "sim/power_state.hh"
+
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "enums/PwrState.hh"
+#include <vector>
+#include "sim/power_state.hh"
+#include <vector>
+#include "enums/PwrState.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_PowerState");
+    py::class_<PowerStateParams, SimObjectParams, std::unique_ptr<PowerStateParams, py::nodelete>>(m, "PowerStateParams")
+        .def(py::init<>())
+        .def("create", &PowerStateParams::create)
+        .def_readwrite("clk_gate_bins", &PowerStateParams::clk_gate_bins)
+        .def_readwrite("clk_gate_max", &PowerStateParams::clk_gate_max)
+        .def_readwrite("clk_gate_min", &PowerStateParams::clk_gate_min)
+        .def_readwrite("default_state", &PowerStateParams::default_state)
+        .def_readwrite("leaders", &PowerStateParams::leaders)
+        .def_readwrite("possible_states", &PowerStateParams::possible_states)
+        ;
+
+    py::class_<gem5::PowerState, gem5::SimObject, std::unique_ptr<gem5::PowerState, py::nodelete>>(m, "gem5_COLONS_PowerState")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("PowerState", module_init, "SimObject");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyPowerStateParamsClass
+{
+  public:
+    gem5::PowerState *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyPowerStateShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyPowerStateShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const PowerStateParams &>>>
+{
+  public:
+    using Params = PowerStateParams;
+    static gem5::PowerState *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyPowerStateShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const PowerStateParams &>>>
+{
+  public:
+    using Params = DummyPowerStateParamsClass;
+    static gem5::PowerState *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::PowerState *
+DummyPowerStateShunt<gem5::PowerState>::Params::create() const
+{
+    return DummyPowerStateShunt<gem5::PowerState>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,114 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/QemuFwCfgIo.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/qemu/fw_cfg.hh"
+
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_QemuFwCfgIo");
+    py::class_<QemuFwCfgIoParams, QemuFwCfgParams, std::unique_ptr<QemuFwCfgIoParams, py::nodelete>>(m, "QemuFwCfgIoParams")
+        .def(py::init<>())
+        .def("create", &QemuFwCfgIoParams::create)
+        .def_readwrite("selector_addr", &QemuFwCfgIoParams::selector_addr)
+        ;
+
+    py::class_<gem5::qemu::FwCfgIo, gem5::qemu::FwCfg, std::unique_ptr<gem5::qemu::FwCfgIo, py::nodelete>>(m, "gem5_COLONS_qemu_COLONS_FwCfgIo")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("QemuFwCfgIo", module_init, "QemuFwCfg");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyQemuFwCfgIoParamsClass
+{
+  public:
+    gem5::qemu::FwCfgIo *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyQemuFwCfgIoShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyQemuFwCfgIoShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const QemuFwCfgIoParams &>>>
+{
+  public:
+    using Params = QemuFwCfgIoParams;
+    static gem5::qemu::FwCfgIo *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyQemuFwCfgIoShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const QemuFwCfgIoParams &>>>
+{
+  public:
+    using Params = DummyQemuFwCfgIoParamsClass;
+    static gem5::qemu::FwCfgIo *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::qemu::FwCfgIo *
+DummyQemuFwCfgIoShunt<gem5::qemu::FwCfgIo>::Params::create() const
+{
+    return DummyQemuFwCfgIoShunt<gem5::qemu::FwCfgIo>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,43 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/QemuFwCfgItem.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/qemu/fw_cfg.hh"
+
+#include "base/types.hh"
+#include <string>
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_QemuFwCfgItem");
+    py::class_<QemuFwCfgItemParams, SimObjectParams, std::unique_ptr<QemuFwCfgItemParams, py::nodelete>>(m, "QemuFwCfgItemParams")
+        .def_readwrite("arch_specific", &QemuFwCfgItemParams::arch_specific)
+        .def_readwrite("index", &QemuFwCfgItemParams::index)
+        .def_readwrite("path", &QemuFwCfgItemParams::path)
+        ;
+
+    py::class_<gem5::qemu::FwCfgItemFactoryBase, gem5::SimObject, std::unique_ptr<gem5::qemu::FwCfgItemFactoryBase, py::nodelete>>(m, "gem5_COLONS_qemu_COLONS_FwCfgItemFactoryBase")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("QemuFwCfgItem", module_init, "SimObject");
+
+} // namespace gem5
@@ -0,0 +1,114 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/QemuFwCfgItemFile.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/qemu/fw_cfg.hh"
+
+#include <string>
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_QemuFwCfgItemFile");
+    py::class_<QemuFwCfgItemFileParams, QemuFwCfgItemParams, std::unique_ptr<QemuFwCfgItemFileParams, py::nodelete>>(m, "QemuFwCfgItemFileParams")
+        .def(py::init<>())
+        .def("create", &QemuFwCfgItemFileParams::create)
+        .def_readwrite("file", &QemuFwCfgItemFileParams::file)
+        ;
+
+    py::class_<gem5::qemu::FwCfgItemFactory<gem5::qemu::FwCfgItemFile>, gem5::qemu::FwCfgItemFactoryBase, std::unique_ptr<gem5::qemu::FwCfgItemFactory<gem5::qemu::FwCfgItemFile>, py::nodelete>>(m, "gem5_COLONS_qemu_COLONS_FwCfgItemFactory<gem5_COLONS_qemu_COLONS_FwCfgItemFile>")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("QemuFwCfgItemFile", module_init, "QemuFwCfgItem");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyQemuFwCfgItemFileParamsClass
+{
+  public:
+    gem5::qemu::FwCfgItemFactory<gem5::qemu::FwCfgItemFile> *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyQemuFwCfgItemFileShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyQemuFwCfgItemFileShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const QemuFwCfgItemFileParams &>>>
+{
+  public:
+    using Params = QemuFwCfgItemFileParams;
+    static gem5::qemu::FwCfgItemFactory<gem5::qemu::FwCfgItemFile> *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyQemuFwCfgItemFileShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const QemuFwCfgItemFileParams &>>>
+{
+  public:
+    using Params = DummyQemuFwCfgItemFileParamsClass;
+    static gem5::qemu::FwCfgItemFactory<gem5::qemu::FwCfgItemFile> *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::qemu::FwCfgItemFactory<gem5::qemu::FwCfgItemFile> *
+DummyQemuFwCfgItemFileShunt<gem5::qemu::FwCfgItemFactory<gem5::qemu::FwCfgItemFile>>::Params::create() const
+{
+    return DummyQemuFwCfgItemFileShunt<gem5::qemu::FwCfgItemFactory<gem5::qemu::FwCfgItemFile>>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,114 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/QemuFwCfgItemString.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/qemu/fw_cfg.hh"
+
+#include <string>
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_QemuFwCfgItemString");
+    py::class_<QemuFwCfgItemStringParams, QemuFwCfgItemParams, std::unique_ptr<QemuFwCfgItemStringParams, py::nodelete>>(m, "QemuFwCfgItemStringParams")
+        .def(py::init<>())
+        .def("create", &QemuFwCfgItemStringParams::create)
+        .def_readwrite("string", &QemuFwCfgItemStringParams::string)
+        ;
+
+    py::class_<gem5::qemu::FwCfgItemFactory<gem5::qemu::FwCfgItemString>, gem5::qemu::FwCfgItemFactoryBase, std::unique_ptr<gem5::qemu::FwCfgItemFactory<gem5::qemu::FwCfgItemString>, py::nodelete>>(m, "gem5_COLONS_qemu_COLONS_FwCfgItemFactory<gem5_COLONS_qemu_COLONS_FwCfgItemString>")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("QemuFwCfgItemString", module_init, "QemuFwCfgItem");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyQemuFwCfgItemStringParamsClass
+{
+  public:
+    gem5::qemu::FwCfgItemFactory<gem5::qemu::FwCfgItemString> *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyQemuFwCfgItemStringShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyQemuFwCfgItemStringShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const QemuFwCfgItemStringParams &>>>
+{
+  public:
+    using Params = QemuFwCfgItemStringParams;
+    static gem5::qemu::FwCfgItemFactory<gem5::qemu::FwCfgItemString> *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyQemuFwCfgItemStringShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const QemuFwCfgItemStringParams &>>>
+{
+  public:
+    using Params = DummyQemuFwCfgItemStringParamsClass;
+    static gem5::qemu::FwCfgItemFactory<gem5::qemu::FwCfgItemString> *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::qemu::FwCfgItemFactory<gem5::qemu::FwCfgItemString> *
+DummyQemuFwCfgItemStringShunt<gem5::qemu::FwCfgItemFactory<gem5::qemu::FwCfgItemString>>::Params::create() const
+{
+    return DummyQemuFwCfgItemStringShunt<gem5::qemu::FwCfgItemFactory<gem5::qemu::FwCfgItemString>>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,117 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/QemuFwCfgMmio.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/qemu/fw_cfg.hh"
+
+#include "base/types.hh"
+#include "base/addr_range.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_QemuFwCfgMmio");
+    py::class_<QemuFwCfgMmioParams, QemuFwCfgParams, std::unique_ptr<QemuFwCfgMmioParams, py::nodelete>>(m, "QemuFwCfgMmioParams")
+        .def(py::init<>())
+        .def("create", &QemuFwCfgMmioParams::create)
+        .def_readwrite("data_addr_range", &QemuFwCfgMmioParams::data_addr_range)
+        .def_readwrite("selector_addr", &QemuFwCfgMmioParams::selector_addr)
+        ;
+
+    py::class_<gem5::qemu::FwCfgMmio, gem5::qemu::FwCfg, std::unique_ptr<gem5::qemu::FwCfgMmio, py::nodelete>>(m, "gem5_COLONS_qemu_COLONS_FwCfgMmio")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("QemuFwCfgMmio", module_init, "QemuFwCfg");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyQemuFwCfgMmioParamsClass
+{
+  public:
+    gem5::qemu::FwCfgMmio *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyQemuFwCfgMmioShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyQemuFwCfgMmioShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const QemuFwCfgMmioParams &>>>
+{
+  public:
+    using Params = QemuFwCfgMmioParams;
+    static gem5::qemu::FwCfgMmio *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyQemuFwCfgMmioShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const QemuFwCfgMmioParams &>>>
+{
+  public:
+    using Params = DummyQemuFwCfgMmioParamsClass;
+    static gem5::qemu::FwCfgMmio *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::qemu::FwCfgMmio *
+DummyQemuFwCfgMmioShunt<gem5::qemu::FwCfgMmio>::Params::create() const
+{
+    return DummyQemuFwCfgMmioShunt<gem5::qemu::FwCfgMmio>::create(*this);
+}
+
+} // namespace gem5
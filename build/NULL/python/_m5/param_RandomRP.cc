@@ -0,0 +1,112 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/RandomRP.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/cache/replacement_policies/random_rp.hh"
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_RandomRP");
+    py::class_<RandomRPParams, BaseReplacementPolicyParams, std::unique_ptr<RandomRPParams, py::nodelete>>(m, "RandomRPParams")
+        .def(py::init<>())
+        .def("create", &RandomRPParams::create)
+        ;
+
+    py::class_<gem5::replacement_policy::Random, gem5::replacement_policy::Base, std::unique_ptr<gem5::replacement_policy::Random, py::nodelete>>(m, "gem5_COLONS_replacement_policy_COLONS_Random")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("RandomRP", module_init, "BaseReplacementPolicy");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyRandomRPParamsClass
+{
+  public:
+    gem5::replacement_policy::Random *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyRandomRPShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyRandomRPShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const RandomRPParams &>>>
+{
+  public:
+    using Params = RandomRPParams;
+    static gem5::replacement_policy::Random *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyRandomRPShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const RandomRPParams &>>>
+{
+  public:
+    using Params = DummyRandomRPParamsClass;
+    static gem5::replacement_policy::Random *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::replacement_policy::Random *
+DummyRandomRPShunt<gem5::replacement_policy::Random>::Params::create() const
+{
+    return DummyRandomRPShunt<gem5::replacement_policy::Random>::create(*this);
+}
+
+} // namespace gem5
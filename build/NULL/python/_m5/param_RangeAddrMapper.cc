@@ -0,0 +1,120 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/RangeAddrMapper.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/addr_mapper.hh"
+
+#include <vector>
+#include "base/types.hh"
+#include "base/addr_range.hh"
+#include <vector>
+#include "base/types.hh"
+#include "base/addr_range.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_RangeAddrMapper");
+    py::class_<RangeAddrMapperParams, AddrMapperParams, std::unique_ptr<RangeAddrMapperParams, py::nodelete>>(m, "RangeAddrMapperParams")
+        .def(py::init<>())
+        .def("create", &RangeAddrMapperParams::create)
+        .def_readwrite("original_ranges", &RangeAddrMapperParams::original_ranges)
+        .def_readwrite("remapped_ranges", &RangeAddrMapperParams::remapped_ranges)
+        ;
+
+    py::class_<gem5::RangeAddrMapper, gem5::AddrMapper, std::unique_ptr<gem5::RangeAddrMapper, py::nodelete>>(m, "gem5_COLONS_RangeAddrMapper")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("RangeAddrMapper", module_init, "AddrMapper");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyRangeAddrMapperParamsClass
+{
+  public:
+    gem5::RangeAddrMapper *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyRangeAddrMapperShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyRangeAddrMapperShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const RangeAddrMapperParams &>>>
+{
+  public:
+    using Params = RangeAddrMapperParams;
+    static gem5::RangeAddrMapper *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyRangeAddrMapperShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const RangeAddrMapperParams &>>>
+{
+  public:
+    using Params = DummyRangeAddrMapperParamsClass;
+    static gem5::RangeAddrMapper *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::RangeAddrMapper *
+DummyRangeAddrMapperShunt<gem5::RangeAddrMapper>::Params::create() const
+{
+    return DummyRangeAddrMapperShunt<gem5::RangeAddrMapper>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,117 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/RedirectPath.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "sim/redirect_path.hh"
+
+#include <string>
+#include <vector>
+#include <string>
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_RedirectPath");
+    py::class_<RedirectPathParams, SimObjectParams, std::unique_ptr<RedirectPathParams, py::nodelete>>(m, "RedirectPathParams")
+        .def(py::init<>())
+        .def("create", &RedirectPathParams::create)
+        .def_readwrite("app_path", &RedirectPathParams::app_path)
+        .def_readwrite("host_paths", &RedirectPathParams::host_paths)
+        ;
+
+    py::class_<gem5::RedirectPath, gem5::SimObject, std::unique_ptr<gem5::RedirectPath, py::nodelete>>(m, "gem5_COLONS_RedirectPath")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("RedirectPath", module_init, "SimObject");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyRedirectPathParamsClass
+{
+  public:
+    gem5::RedirectPath *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyRedirectPathShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyRedirectPathShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const RedirectPathParams &>>>
+{
+  public:
+    using Params = RedirectPathParams;
+    static gem5::RedirectPath *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyRedirectPathShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const RedirectPathParams &>>>
+{
+  public:
+    using Params = DummyRedirectPathParamsClass;
+    static gem5::RedirectPath *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::RedirectPath *
+DummyRedirectPathShunt<gem5::RedirectPath>::Params::create() const
+{
+    return DummyRedirectPathShunt<gem5::RedirectPath>::create(*this);
+}
+
+} // namespace gem5
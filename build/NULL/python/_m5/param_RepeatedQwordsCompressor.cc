@@ -0,0 +1,112 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/RepeatedQwordsCompressor.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/cache/compressors/repeated_qwords.hh"
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_RepeatedQwordsCompressor");
+    py::class_<RepeatedQwordsCompressorParams, BaseDictionaryCompressorParams, std::unique_ptr<RepeatedQwordsCompressorParams, py::nodelete>>(m, "RepeatedQwordsCompressorParams")
+        .def(py::init<>())
+        .def("create", &RepeatedQwordsCompressorParams::create)
+        ;
+
+    py::class_<gem5::compression::RepeatedQwords, gem5::compression::BaseDictionaryCompressor, std::unique_ptr<gem5::compression::RepeatedQwords, py::nodelete>>(m, "gem5_COLONS_compression_COLONS_RepeatedQwords")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("RepeatedQwordsCompressor", module_init, "BaseDictionaryCompressor");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyRepeatedQwordsCompressorParamsClass
+{
+  public:
+    gem5::compression::RepeatedQwords *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyRepeatedQwordsCompressorShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyRepeatedQwordsCompressorShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const RepeatedQwordsCompressorParams &>>>
+{
+  public:
+    using Params = RepeatedQwordsCompressorParams;
+    static gem5::compression::RepeatedQwords *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyRepeatedQwordsCompressorShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const RepeatedQwordsCompressorParams &>>>
+{
+  public:
+    using Params = DummyRepeatedQwordsCompressorParamsClass;
+    static gem5::compression::RepeatedQwords *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::compression::RepeatedQwords *
+DummyRepeatedQwordsCompressorShunt<gem5::compression::RepeatedQwords>::Params::create() const
+{
+    return DummyRepeatedQwordsCompressorShunt<gem5::compression::RepeatedQwords>::create(*this);
+}
+
+} // namespace gem5
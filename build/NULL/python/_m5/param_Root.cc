@@ -0,0 +1,120 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/Root.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "sim/root.hh"
+
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_Root");
+    py::class_<RootParams, SimObjectParams, std::unique_ptr<RootParams, py::nodelete>>(m, "RootParams")
+        .def(py::init<>())
+        .def("create", &RootParams::create)
+        .def_readwrite("full_system", &RootParams::full_system)
+        .def_readwrite("sim_quantum", &RootParams::sim_quantum)
+        .def_readwrite("time_sync_enable", &RootParams::time_sync_enable)
+        .def_readwrite("time_sync_period", &RootParams::time_sync_period)
+        .def_readwrite("time_sync_spin_threshold", &RootParams::time_sync_spin_threshold)
+        ;
+
+    py::class_<gem5::Root, gem5::SimObject, std::unique_ptr<gem5::Root, py::nodelete>>(m, "gem5_COLONS_Root")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("Root", module_init, "SimObject");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyRootParamsClass
+{
+  public:
+    gem5::Root *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyRootShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyRootShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const RootParams &>>>
+{
+  public:
+    using Params = RootParams;
+    static gem5::Root *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyRootShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const RootParams &>>>
+{
+  public:
+    using Params = DummyRootParamsClass;
+    static gem5::Root *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::Root *
+DummyRootShunt<gem5::Root>::Params::create() const
+{
+    return DummyRootShunt<gem5::Root>::create(*this);
+}
+
+} // namespace gem5
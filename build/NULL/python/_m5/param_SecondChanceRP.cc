@@ -0,0 +1,112 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/SecondChanceRP.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/cache/replacement_policies/second_chance_rp.hh"
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_SecondChanceRP");
+    py::class_<SecondChanceRPParams, FIFORPParams, std::unique_ptr<SecondChanceRPParams, py::nodelete>>(m, "SecondChanceRPParams")
+        .def(py::init<>())
+        .def("create", &SecondChanceRPParams::create)
+        ;
+
+    py::class_<gem5::replacement_policy::SecondChance, gem5::replacement_policy::FIFO, std::unique_ptr<gem5::replacement_policy::SecondChance, py::nodelete>>(m, "gem5_COLONS_replacement_policy_COLONS_SecondChance")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("SecondChanceRP", module_init, "FIFORP");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummySecondChanceRPParamsClass
+{
+  public:
+    gem5::replacement_policy::SecondChance *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummySecondChanceRPShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummySecondChanceRPShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const SecondChanceRPParams &>>>
+{
+  public:
+    using Params = SecondChanceRPParams;
+    static gem5::replacement_policy::SecondChance *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummySecondChanceRPShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const SecondChanceRPParams &>>>
+{
+  public:
+    using Params = DummySecondChanceRPParamsClass;
+    static gem5::replacement_policy::SecondChance *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::replacement_policy::SecondChance *
+DummySecondChanceRPShunt<gem5::replacement_policy::SecondChance>::Params::create() const
+{
+    return DummySecondChanceRPShunt<gem5::replacement_policy::SecondChance>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,128 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/SerialLink.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/serial_link.hh"
+
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include <vector>
+#include "base/types.hh"
+#include "base/addr_range.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_SerialLink");
+    py::class_<SerialLinkParams, ClockedObjectParams, std::unique_ptr<SerialLinkParams, py::nodelete>>(m, "SerialLinkParams")
+        .def(py::init<>())
+        .def("create", &SerialLinkParams::create)
+        .def_readwrite("delay", &SerialLinkParams::delay)
+        .def_readwrite("link_speed", &SerialLinkParams::link_speed)
+        .def_readwrite("num_lanes", &SerialLinkParams::num_lanes)
+        .def_readwrite("ranges", &SerialLinkParams::ranges)
+        .def_readwrite("req_size", &SerialLinkParams::req_size)
+        .def_readwrite("resp_size", &SerialLinkParams::resp_size)
+        .def_readwrite("port_mem_side_port_connection_count", &SerialLinkParams::port_mem_side_port_connection_count)
+        .def_readwrite("port_cpu_side_port_connection_count", &SerialLinkParams::port_cpu_side_port_connection_count)
+        ;
+
+    py::class_<gem5::SerialLink, gem5::ClockedObject, std::unique_ptr<gem5::SerialLink, py::nodelete>>(m, "gem5_COLONS_SerialLink")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("SerialLink", module_init, "ClockedObject");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummySerialLinkParamsClass
+{
+  public:
+    gem5::SerialLink *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummySerialLinkShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummySerialLinkShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const SerialLinkParams &>>>
+{
+  public:
+    using Params = SerialLinkParams;
+    static gem5::SerialLink *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummySerialLinkShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const SerialLinkParams &>>>
+{
+  public:
+    using Params = DummySerialLinkParamsClass;
+    static gem5::SerialLink *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::SerialLink *
+DummySerialLinkShunt<gem5::SerialLink>::Params::create() const
+{
+    return DummySerialLinkShunt<gem5::SerialLink>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,138 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/SignaturePathPrefetcher.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/cache/prefetch/signature_path.hh"
+
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "mem/cache/tags/indexing_policies/base.hh"
+#include "mem/cache/replacement_policies/base.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "mem/cache/tags/indexing_policies/base.hh"
+#include "mem/cache/replacement_policies/base.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_SignaturePathPrefetcher");
+    py::class_<SignaturePathPrefetcherParams, QueuedPrefetcherParams, std::unique_ptr<SignaturePathPrefetcherParams, py::nodelete>>(m, "SignaturePathPrefetcherParams")
+        .def(py::init<>())
+        .def("create", &SignaturePathPrefetcherParams::create)
+        .def_readwrite("lookahead_confidence_threshold", &SignaturePathPrefetcherParams::lookahead_confidence_threshold)
+        .def_readwrite("num_counter_bits", &SignaturePathPrefetcherParams::num_counter_bits)
+        .def_readwrite("pattern_table_assoc", &SignaturePathPrefetcherParams::pattern_table_assoc)
+        .def_readwrite("pattern_table_entries", &SignaturePathPrefetcherParams::pattern_table_entries)
+        .def_readwrite("pattern_table_indexing_policy", &SignaturePathPrefetcherParams::pattern_table_indexing_policy)
+        .def_readwrite("pattern_table_replacement_policy", &SignaturePathPrefetcherParams::pattern_table_replacement_policy)
+        .def_readwrite("prefetch_confidence_threshold", &SignaturePathPrefetcherParams::prefetch_confidence_threshold)
+        .def_readwrite("signature_bits", &SignaturePathPrefetcherParams::signature_bits)
+        .def_readwrite("signature_shift", &SignaturePathPrefetcherParams::signature_shift)
+        .def_readwrite("signature_table_assoc", &SignaturePathPrefetcherParams::signature_table_assoc)
+        .def_readwrite("signature_table_entries", &SignaturePathPrefetcherParams::signature_table_entries)
+        .def_readwrite("signature_table_indexing_policy", &SignaturePathPrefetcherParams::signature_table_indexing_policy)
+        .def_readwrite("signature_table_replacement_policy", &SignaturePathPrefetcherParams::signature_table_replacement_policy)
+        .def_readwrite("strides_per_pattern_entry", &SignaturePathPrefetcherParams::strides_per_pattern_entry)
+        ;
+
+    py::class_<gem5::prefetch::SignaturePath, gem5::prefetch::Queued, std::unique_ptr<gem5::prefetch::SignaturePath, py::nodelete>>(m, "gem5_COLONS_prefetch_COLONS_SignaturePath")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("SignaturePathPrefetcher", module_init, "QueuedPrefetcher");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummySignaturePathPrefetcherParamsClass
+{
+  public:
+    gem5::prefetch::SignaturePath *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummySignaturePathPrefetcherShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummySignaturePathPrefetcherShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const SignaturePathPrefetcherParams &>>>
+{
+  public:
+    using Params = SignaturePathPrefetcherParams;
+    static gem5::prefetch::SignaturePath *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummySignaturePathPrefetcherShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const SignaturePathPrefetcherParams &>>>
+{
+  public:
+    using Params = DummySignaturePathPrefetcherParamsClass;
+    static gem5::prefetch::SignaturePath *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::prefetch::SignaturePath *
+DummySignaturePathPrefetcherShunt<gem5::prefetch::SignaturePath>::Params::create() const
+{
+    return DummySignaturePathPrefetcherShunt<gem5::prefetch::SignaturePath>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,118 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/SignaturePathPrefetcherV2.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/cache/prefetch/signature_path_v2.hh"
+
+#include "base/types.hh"
+#include "mem/cache/tags/indexing_policies/base.hh"
+#include "mem/cache/replacement_policies/base.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_SignaturePathPrefetcherV2");
+    py::class_<SignaturePathPrefetcherV2Params, SignaturePathPrefetcherParams, std::unique_ptr<SignaturePathPrefetcherV2Params, py::nodelete>>(m, "SignaturePathPrefetcherV2Params")
+        .def(py::init<>())
+        .def("create", &SignaturePathPrefetcherV2Params::create)
+        .def_readwrite("global_history_register_entries", &SignaturePathPrefetcherV2Params::global_history_register_entries)
+        .def_readwrite("global_history_register_indexing_policy", &SignaturePathPrefetcherV2Params::global_history_register_indexing_policy)
+        .def_readwrite("global_history_register_replacement_policy", &SignaturePathPrefetcherV2Params::global_history_register_replacement_policy)
+        ;
+
+    py::class_<gem5::prefetch::SignaturePathV2, gem5::prefetch::SignaturePath, std::unique_ptr<gem5::prefetch::SignaturePathV2, py::nodelete>>(m, "gem5_COLONS_prefetch_COLONS_SignaturePathV2")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("SignaturePathPrefetcherV2", module_init, "SignaturePathPrefetcher");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummySignaturePathPrefetcherV2ParamsClass
+{
+  public:
+    gem5::prefetch::SignaturePathV2 *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummySignaturePathPrefetcherV2Shunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummySignaturePathPrefetcherV2Shunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const SignaturePathPrefetcherV2Params &>>>
+{
+  public:
+    using Params = SignaturePathPrefetcherV2Params;
+    static gem5::prefetch::SignaturePathV2 *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummySignaturePathPrefetcherV2Shunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const SignaturePathPrefetcherV2Params &>>>
+{
+  public:
+    using Params = DummySignaturePathPrefetcherV2ParamsClass;
+    static gem5::prefetch::SignaturePathV2 *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::prefetch::SignaturePathV2 *
+DummySignaturePathPrefetcherV2Shunt<gem5::prefetch::SignaturePathV2>::Params::create() const
+{
+    return DummySignaturePathPrefetcherV2Shunt<gem5::prefetch::SignaturePathV2>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,120 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/SimpleMemDelay.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/mem_delay.hh"
+
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_SimpleMemDelay");
+    py::class_<SimpleMemDelayParams, MemDelayParams, std::unique_ptr<SimpleMemDelayParams, py::nodelete>>(m, "SimpleMemDelayParams")
+        .def(py::init<>())
+        .def("create", &SimpleMemDelayParams::create)
+        .def_readwrite("read_req", &SimpleMemDelayParams::read_req)
+        .def_readwrite("read_resp", &SimpleMemDelayParams::read_resp)
+        .def_readwrite("write_req", &SimpleMemDelayParams::write_req)
+        .def_readwrite("write_resp", &SimpleMemDelayParams::write_resp)
+        ;
+
+    py::class_<gem5::SimpleMemDelay, gem5::MemDelay, std::unique_ptr<gem5::SimpleMemDelay, py::nodelete>>(m, "gem5_COLONS_SimpleMemDelay")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("SimpleMemDelay", module_init, "MemDelay");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummySimpleMemDelayParamsClass
+{
+  public:
+    gem5::SimpleMemDelay *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummySimpleMemDelayShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummySimpleMemDelayShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const SimpleMemDelayParams &>>>
+{
+  public:
+    using Params = SimpleMemDelayParams;
+    static gem5::SimpleMemDelay *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummySimpleMemDelayShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const SimpleMemDelayParams &>>>
+{
+  public:
+    using Params = DummySimpleMemDelayParamsClass;
+    static gem5::SimpleMemDelay *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::SimpleMemDelay *
+DummySimpleMemDelayShunt<gem5::SimpleMemDelay>::Params::create() const
+{
+    return DummySimpleMemDelayShunt<gem5::SimpleMemDelay>::create(*this);
+}
+
+} // namespace gem5
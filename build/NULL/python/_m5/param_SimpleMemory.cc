@@ -0,0 +1,118 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/SimpleMemory.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/simple_mem.hh"
+
+#include "base/types.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_SimpleMemory");
+    py::class_<SimpleMemoryParams, AbstractMemoryParams, std::unique_ptr<SimpleMemoryParams, py::nodelete>>(m, "SimpleMemoryParams")
+        .def(py::init<>())
+        .def("create", &SimpleMemoryParams::create)
+        .def_readwrite("bandwidth", &SimpleMemoryParams::bandwidth)
+        .def_readwrite("latency", &SimpleMemoryParams::latency)
+        .def_readwrite("latency_var", &SimpleMemoryParams::latency_var)
+        .def_readwrite("port_port_connection_count", &SimpleMemoryParams::port_port_connection_count)
+        ;
+
+    py::class_<gem5::memory::SimpleMemory, gem5::memory::AbstractMemory, std::unique_ptr<gem5::memory::SimpleMemory, py::nodelete>>(m, "gem5_COLONS_memory_COLONS_SimpleMemory")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("SimpleMemory", module_init, "AbstractMemory");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummySimpleMemoryParamsClass
+{
+  public:
+    gem5::memory::SimpleMemory *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummySimpleMemoryShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummySimpleMemoryShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const SimpleMemoryParams &>>>
+{
+  public:
+    using Params = SimpleMemoryParams;
+    static gem5::memory::SimpleMemory *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummySimpleMemoryShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const SimpleMemoryParams &>>>
+{
+  public:
+    using Params = DummySimpleMemoryParamsClass;
+    static gem5::memory::SimpleMemory *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::memory::SimpleMemory *
+DummySimpleMemoryShunt<gem5::memory::SimpleMemory>::Params::create() const
+{
+    return DummySimpleMemoryShunt<gem5::memory::SimpleMemory>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,135 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/Sinic.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/net/sinic.hh"
+
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_Sinic");
+    py::class_<SinicParams, EtherDevBaseParams, std::unique_ptr<SinicParams, py::nodelete>>(m, "SinicParams")
+        .def(py::init<>())
+        .def("create", &SinicParams::create)
+        .def_readwrite("delay_copy", &SinicParams::delay_copy)
+        .def_readwrite("rx_fifo_low_mark", &SinicParams::rx_fifo_low_mark)
+        .def_readwrite("rx_fifo_threshold", &SinicParams::rx_fifo_threshold)
+        .def_readwrite("rx_max_copy", &SinicParams::rx_max_copy)
+        .def_readwrite("rx_max_intr", &SinicParams::rx_max_intr)
+        .def_readwrite("tx_fifo_high_mark", &SinicParams::tx_fifo_high_mark)
+        .def_readwrite("tx_fifo_threshold", &SinicParams::tx_fifo_threshold)
+        .def_readwrite("tx_max_copy", &SinicParams::tx_max_copy)
+        .def_readwrite("virtual_addr", &SinicParams::virtual_addr)
+        .def_readwrite("virtual_count", &SinicParams::virtual_count)
+        .def_readwrite("zero_copy", &SinicParams::zero_copy)
+        .def_readwrite("zero_copy_size", &SinicParams::zero_copy_size)
+        .def_readwrite("zero_copy_threshold", &SinicParams::zero_copy_threshold)
+        ;
+
+    py::class_<gem5::sinic::Device, gem5::EtherDevBase, std::unique_ptr<gem5::sinic::Device, py::nodelete>>(m, "gem5_COLONS_sinic_COLONS_Device")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("Sinic", module_init, "EtherDevBase");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummySinicParamsClass
+{
+  public:
+    gem5::sinic::Device *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummySinicShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummySinicShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const SinicParams &>>>
+{
+  public:
+    using Params = SinicParams;
+    static gem5::sinic::Device *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummySinicShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const SinicParams &>>>
+{
+  public:
+    using Params = DummySinicParamsClass;
+    static gem5::sinic::Device *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::sinic::Device *
+DummySinicShunt<gem5::sinic::Device>::Params::create() const
+{
+    return DummySinicShunt<gem5::sinic::Device>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,118 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/SnoopFilter.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/snoop_filter.hh"
+
+#include "base/types.hh"
+#include "base/types.hh"
+#include "sim/system.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_SnoopFilter");
+    py::class_<SnoopFilterParams, SimObjectParams, std::unique_ptr<SnoopFilterParams, py::nodelete>>(m, "SnoopFilterParams")
+        .def(py::init<>())
+        .def("create", &SnoopFilterParams::create)
+        .def_readwrite("lookup_latency", &SnoopFilterParams::lookup_latency)
+        .def_readwrite("max_capacity", &SnoopFilterParams::max_capacity)
+        .def_readwrite("system", &SnoopFilterParams::system)
+        ;
+
+    py::class_<gem5::SnoopFilter, gem5::SimObject, std::unique_ptr<gem5::SnoopFilter, py::nodelete>>(m, "gem5_COLONS_SnoopFilter")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("SnoopFilter", module_init, "SimObject");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummySnoopFilterParamsClass
+{
+  public:
+    gem5::SnoopFilter *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummySnoopFilterShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummySnoopFilterShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const SnoopFilterParams &>>>
+{
+  public:
+    using Params = SnoopFilterParams;
+    static gem5::SnoopFilter *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummySnoopFilterShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const SnoopFilterParams &>>>
+{
+  public:
+    using Params = DummySnoopFilterParamsClass;
+    static gem5::SnoopFilter *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::SnoopFilter *
+DummySnoopFilterShunt<gem5::SnoopFilter>::Params::create() const
+{
+    return DummySnoopFilterShunt<gem5::SnoopFilter>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,116 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/StubWorkload.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "sim/workload.hh"
+
+#include "enums/ByteOrder.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_StubWorkload");
+    py::class_<StubWorkloadParams, WorkloadParams, std::unique_ptr<StubWorkloadParams, py::nodelete>>(m, "StubWorkloadParams")
+        .def(py::init<>())
+        .def("create", &StubWorkloadParams::create)
+        .def_readwrite("byte_order", &StubWorkloadParams::byte_order)
+        .def_readwrite("entry", &StubWorkloadParams::entry)
+        ;
+
+    py::class_<gem5::StubWorkload, gem5::Workload, std::unique_ptr<gem5::StubWorkload, py::nodelete>>(m, "gem5_COLONS_StubWorkload")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("StubWorkload", module_init, "Workload");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyStubWorkloadParamsClass
+{
+  public:
+    gem5::StubWorkload *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyStubWorkloadShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyStubWorkloadShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const StubWorkloadParams &>>>
+{
+  public:
+    using Params = StubWorkloadParams;
+    static gem5::StubWorkload *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyStubWorkloadShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const StubWorkloadParams &>>>
+{
+  public:
+    using Params = DummyStubWorkloadParamsClass;
+    static gem5::StubWorkload *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::StubWorkload *
+DummyStubWorkloadShunt<gem5::StubWorkload>::Params::create() const
+{
+    return DummyStubWorkloadShunt<gem5::StubWorkload>::create(*this);
+}
+
+} // namespace gem5
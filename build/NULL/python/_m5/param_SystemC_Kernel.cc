@@ -0,0 +1,112 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/SystemC_Kernel.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "systemc/core/kernel.hh"
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_SystemC_Kernel");
+    py::class_<SystemC_KernelParams, SimObjectParams, std::unique_ptr<SystemC_KernelParams, py::nodelete>>(m, "SystemC_KernelParams")
+        .def(py::init<>())
+        .def("create", &SystemC_KernelParams::create)
+        ;
+
+    py::class_<sc_gem5::Kernel, gem5::SimObject, std::unique_ptr<sc_gem5::Kernel, py::nodelete>>(m, "sc_gem5_COLONS_Kernel")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("SystemC_Kernel", module_init, "SimObject");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummySystemC_KernelParamsClass
+{
+  public:
+    sc_gem5::Kernel *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummySystemC_KernelShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummySystemC_KernelShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const SystemC_KernelParams &>>>
+{
+  public:
+    using Params = SystemC_KernelParams;
+    static sc_gem5::Kernel *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummySystemC_KernelShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const SystemC_KernelParams &>>>
+{
+  public:
+    using Params = DummySystemC_KernelParamsClass;
+    static sc_gem5::Kernel *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] sc_gem5::Kernel *
+DummySystemC_KernelShunt<sc_gem5::Kernel>::Params::create() const
+{
+    return DummySystemC_KernelShunt<sc_gem5::Kernel>::create(*this);
+}
+
+} // namespace gem5
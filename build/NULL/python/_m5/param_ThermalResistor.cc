@@ -0,0 +1,114 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/ThermalResistor.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "sim/power/thermal_model.hh"
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_ThermalResistor");
+    py::class_<ThermalResistorParams, SimObjectParams, std::unique_ptr<ThermalResistorParams, py::nodelete>>(m, "ThermalResistorParams")
+        .def(py::init<>())
+        .def("create", &ThermalResistorParams::create)
+        .def_readwrite("resistance", &ThermalResistorParams::resistance)
+        ;
+
+    py::class_<gem5::ThermalResistor, gem5::SimObject, std::unique_ptr<gem5::ThermalResistor, py::nodelete>>(m, "gem5_COLONS_ThermalResistor")
+        .def("setNodes", &gem5::ThermalResistor::setNodes)
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("ThermalResistor", module_init, "SimObject");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyThermalResistorParamsClass
+{
+  public:
+    gem5::ThermalResistor *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyThermalResistorShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyThermalResistorShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const ThermalResistorParams &>>>
+{
+  public:
+    using Params = ThermalResistorParams;
+    static gem5::ThermalResistor *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyThermalResistorShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const ThermalResistorParams &>>>
+{
+  public:
+    using Params = DummyThermalResistorParamsClass;
+    static gem5::ThermalResistor *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::ThermalResistor *
+DummyThermalResistorShunt<gem5::ThermalResistor>::Params::create() const
+{
+    return DummyThermalResistorShunt<gem5::ThermalResistor>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,114 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/ThreadBridge.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/thread_bridge.hh"
+
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_ThreadBridge");
+    py::class_<ThreadBridgeParams, SimObjectParams, std::unique_ptr<ThreadBridgeParams, py::nodelete>>(m, "ThreadBridgeParams")
+        .def(py::init<>())
+        .def("create", &ThreadBridgeParams::create)
+        .def_readwrite("port_in_port_connection_count", &ThreadBridgeParams::port_in_port_connection_count)
+        .def_readwrite("port_out_port_connection_count", &ThreadBridgeParams::port_out_port_connection_count)
+        ;
+
+    py::class_<gem5::ThreadBridge, gem5::SimObject, std::unique_ptr<gem5::ThreadBridge, py::nodelete>>(m, "gem5_COLONS_ThreadBridge")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("ThreadBridge", module_init, "SimObject");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyThreadBridgeParamsClass
+{
+  public:
+    gem5::ThreadBridge *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyThreadBridgeShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyThreadBridgeShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const ThreadBridgeParams &>>>
+{
+  public:
+    using Params = ThreadBridgeParams;
+    static gem5::ThreadBridge *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyThreadBridgeShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const ThreadBridgeParams &>>>
+{
+  public:
+    using Params = DummyThreadBridgeParamsClass;
+    static gem5::ThreadBridge *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::ThreadBridge *
+DummyThreadBridgeShunt<gem5::ThreadBridge>::Params::create() const
+{
+    return DummyThreadBridgeShunt<gem5::ThreadBridge>::create(*this);
+}
+
+} // namespace gem5
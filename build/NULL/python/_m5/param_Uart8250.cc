@@ -0,0 +1,114 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/Uart8250.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/serial/uart8250.hh"
+
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_Uart8250");
+    py::class_<Uart8250Params, UartParams, std::unique_ptr<Uart8250Params, py::nodelete>>(m, "Uart8250Params")
+        .def(py::init<>())
+        .def("create", &Uart8250Params::create)
+        .def_readwrite("pio_size", &Uart8250Params::pio_size)
+        ;
+
+    py::class_<gem5::Uart8250, gem5::Uart, std::unique_ptr<gem5::Uart8250, py::nodelete>>(m, "gem5_COLONS_Uart8250")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("Uart8250", module_init, "Uart");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyUart8250ParamsClass
+{
+  public:
+    gem5::Uart8250 *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyUart8250Shunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyUart8250Shunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const Uart8250Params &>>>
+{
+  public:
+    using Params = Uart8250Params;
+    static gem5::Uart8250 *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyUart8250Shunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const Uart8250Params &>>>
+{
+  public:
+    using Params = DummyUart8250ParamsClass;
+    static gem5::Uart8250 *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::Uart8250 *
+DummyUart8250Shunt<gem5::Uart8250>::Params::create() const
+{
+    return DummyUart8250Shunt<gem5::Uart8250>::create(*this);
+}
+
+} // namespace gem5
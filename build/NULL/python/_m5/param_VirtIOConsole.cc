@@ -0,0 +1,118 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/VirtIOConsole.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "dev/virtio/console.hh"
+
+#include "dev/serial/serial.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_VirtIOConsole");
+    py::class_<VirtIOConsoleParams, VirtIODeviceBaseParams, std::unique_ptr<VirtIOConsoleParams, py::nodelete>>(m, "VirtIOConsoleParams")
+        .def(py::init<>())
+        .def("create", &VirtIOConsoleParams::create)
+        .def_readwrite("device", &VirtIOConsoleParams::device)
+        .def_readwrite("qRecvSize", &VirtIOConsoleParams::qRecvSize)
+        .def_readwrite("qTransSize", &VirtIOConsoleParams::qTransSize)
+        ;
+
+    py::class_<gem5::VirtIOConsole, gem5::VirtIODeviceBase, std::unique_ptr<gem5::VirtIOConsole, py::nodelete>>(m, "gem5_COLONS_VirtIOConsole")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("VirtIOConsole", module_init, "VirtIODeviceBase");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyVirtIOConsoleParamsClass
+{
+  public:
+    gem5::VirtIOConsole *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyVirtIOConsoleShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyVirtIOConsoleShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const VirtIOConsoleParams &>>>
+{
+  public:
+    using Params = VirtIOConsoleParams;
+    static gem5::VirtIOConsole *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyVirtIOConsoleShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const VirtIOConsoleParams &>>>
+{
+  public:
+    using Params = DummyVirtIOConsoleParamsClass;
+    static gem5::VirtIOConsole *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::VirtIOConsole *
+DummyVirtIOConsoleShunt<gem5::VirtIOConsole>::Params::create() const
+{
+    return DummyVirtIOConsoleShunt<gem5::VirtIOConsole>::create(*this);
+}
+
+} // namespace gem5
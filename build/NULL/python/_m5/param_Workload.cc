@@ -0,0 +1,42 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/Workload.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "sim/workload.hh"
+
+#include "base/socket.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_Workload");
+    py::class_<WorkloadParams, SimObjectParams, std::unique_ptr<WorkloadParams, py::nodelete>>(m, "WorkloadParams")
+        .def_readwrite("remote_gdb_port", &WorkloadParams::remote_gdb_port)
+        .def_readwrite("wait_for_remote_gdb", &WorkloadParams::wait_for_remote_gdb)
+        ;
+
+    py::class_<gem5::Workload, gem5::SimObject, std::unique_ptr<gem5::Workload, py::nodelete>>(m, "gem5_COLONS_Workload")
+        .def("sendToGdb", &gem5::Workload::sendToGdb, py::arg("message"))
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("Workload", module_init, "SimObject");
+
+} // namespace gem5
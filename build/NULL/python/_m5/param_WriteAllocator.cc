@@ -0,0 +1,120 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/sim_object_param_struct_cc.py:295
+ */
+
+#include "pybind11/pybind11.h"
+#include "pybind11/stl.h"
+
+#include <type_traits>
+
+#include "base/compiler.hh"
+#include "params/WriteAllocator.hh"
+#include "sim/init.hh"
+#include "sim/sim_object.hh"
+
+#include "mem/cache/cache.hh"
+
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+#include "base/types.hh"
+namespace py = pybind11;
+
+namespace gem5
+{
+
+static void
+module_init(py::module_ &m_internal)
+{
+py::module_ m = m_internal.def_submodule("param_WriteAllocator");
+    py::class_<WriteAllocatorParams, SimObjectParams, std::unique_ptr<WriteAllocatorParams, py::nodelete>>(m, "WriteAllocatorParams")
+        .def(py::init<>())
+        .def("create", &WriteAllocatorParams::create)
+        .def_readwrite("block_size", &WriteAllocatorParams::block_size)
+        .def_readwrite("coalesce_limit", &WriteAllocatorParams::coalesce_limit)
+        .def_readwrite("delay_threshold", &WriteAllocatorParams::delay_threshold)
+        .def_readwrite("no_allocate_limit", &WriteAllocatorParams::no_allocate_limit)
+        ;
+
+    py::class_<gem5::WriteAllocator, gem5::SimObject, std::unique_ptr<gem5::WriteAllocator, py::nodelete>>(m, "gem5_COLONS_WriteAllocator")
+        ;
+
+}
+
+static EmbeddedPyBind embed_obj("WriteAllocator", module_init, "SimObject");
+
+} // namespace gem5
+namespace gem5
+{
+
+namespace
+{
+
+/*
+ * If we can't define a default create() method for this params
+ * struct because the SimObject doesn't have the right
+ * constructor, use template magic to make it so we're actually
+ * defining a create method for this class instead.
+ */
+class DummyWriteAllocatorParamsClass
+{
+  public:
+    gem5::WriteAllocator *create() const;
+};
+
+template <class CxxClass, class Enable=void>
+class DummyWriteAllocatorShunt;
+
+/*
+ * This version directs to the real Params struct and the
+ * default behavior of create if there's an appropriate
+ * constructor.
+ */
+template <class CxxClass>
+class DummyWriteAllocatorShunt<CxxClass, std::enable_if_t<
+    std::is_constructible_v<CxxClass, const WriteAllocatorParams &>>>
+{
+  public:
+    using Params = WriteAllocatorParams;
+    static gem5::WriteAllocator *
+    create(const Params &p)
+    {
+        return new CxxClass(p);
+    }
+};
+
+/*
+ * This version diverts to the DummyParamsClass and a dummy
+ * implementation of create if the appropriate constructor does
+ * not exist.
+ */
+template <class CxxClass>
+class DummyWriteAllocatorShunt<CxxClass, std::enable_if_t<
+    !std::is_constructible_v<CxxClass, const WriteAllocatorParams &>>>
+{
+  public:
+    using Params = DummyWriteAllocatorParamsClass;
+    static gem5::WriteAllocator *
+    create(const Params &p)
+    {
+        return nullptr;
+    }
+};
+
+} // anonymous namespace
+
+/*
+ * An implementation of either the real Params struct's create
+ * method, or the Dummy one. Either an implementation is
+ * mandantory since this was shunted off to the dummy class, or
+ * one is optional which will override this weak version.
+ */
+[[maybe_unused]] gem5::WriteAllocator *
+DummyWriteAllocatorShunt<gem5::WriteAllocator>::Params::create() const
+{
+    return DummyWriteAllocatorShunt<gem5::WriteAllocator>::create(*this);
+}
+
+} // namespace gem5
@@ -0,0 +1,59 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,146,207,143,210,64,20,199,103,218,1,74,97,87,
+    88,151,31,186,38,162,209,24,46,146,152,232,193,24,147,10,
+    19,232,74,91,82,112,87,231,50,217,116,170,108,2,20,11,
+    28,214,83,15,254,15,250,23,152,24,255,25,142,77,175,158,
+    184,97,214,147,39,103,160,93,137,218,105,63,243,227,245,189,
+    247,157,121,243,29,236,60,169,184,191,124,196,241,9,48,64,
+    0,131,76,26,193,177,68,36,8,36,208,6,76,254,8,24,
+    114,165,47,50,0,223,228,196,145,200,44,213,7,245,244,135,
+    7,106,127,234,58,231,111,207,221,89,109,62,116,107,142,55,
+    116,125,119,226,184,181,169,239,205,61,199,27,213,220,201,98,
+    172,174,132,87,29,70,8,243,153,179,171,1,38,26,158,110,
+    52,184,128,64,174,67,98,144,231,144,8,98,50,73,49,68,
+    210,44,69,50,44,77,20,150,33,89,166,16,149,101,73,142,
+    169,36,207,114,100,143,229,185,150,189,168,216,76,146,247,226,
+    220,43,17,124,37,9,8,233,43,36,32,54,189,74,11,100,
+    4,20,129,172,128,42,144,227,48,235,251,145,66,233,228,108,
+    236,82,26,169,148,142,61,182,24,137,113,158,210,247,139,179,
+    81,108,41,24,184,175,211,65,199,198,152,118,241,9,238,70,
+    135,127,175,208,206,192,136,10,154,109,80,195,18,166,142,102,
+    24,216,142,138,109,205,54,241,128,246,7,154,217,210,186,150,
+    137,163,253,173,235,169,21,135,186,190,117,104,26,61,218,210,
+    109,220,28,88,246,155,232,218,159,197,129,245,18,155,220,107,
+    179,160,25,45,250,66,235,227,72,53,116,138,95,107,70,175,
+    139,163,108,187,247,138,158,232,61,158,79,110,118,244,175,224,
+    82,156,243,175,251,51,223,105,76,47,230,67,111,210,120,231,
+    142,31,55,174,106,70,147,154,61,156,94,248,226,152,54,184,
+    203,191,217,49,71,112,213,194,74,117,137,14,195,163,91,75,
+    84,141,199,213,27,75,84,10,75,229,192,12,111,30,45,81,
+    37,44,87,2,107,59,47,30,4,199,97,225,32,208,67,53,
+    31,52,69,243,107,73,112,179,142,162,12,165,204,115,248,121,
+    34,113,85,124,57,177,249,183,5,54,191,222,17,194,149,103,
+    219,58,60,247,239,197,247,102,118,202,177,150,33,132,235,39,
+    18,68,107,32,160,0,88,94,130,210,238,187,78,231,224,222,
+    26,252,139,207,232,135,232,126,254,199,180,73,252,27,48,118,
+    210,208,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/coherence_protocol.py",
+    "gem5.coherence_protocol",
+    embedded_module_data,
+    546,
+    814);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,415 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,197,59,91,108,27,87,118,195,151,52,162,40,82,146,
+    101,91,162,100,121,100,201,146,40,203,148,37,39,169,171,36,
+    78,20,59,78,156,250,17,68,222,102,203,221,46,57,226,92,
+    73,19,147,28,102,102,40,89,170,182,155,205,6,168,187,8,
+    186,251,183,233,99,1,125,116,83,167,217,143,109,191,182,63,
+    253,234,79,255,72,129,168,4,2,1,2,244,103,211,47,6,
+    73,128,96,191,122,206,189,51,119,30,164,44,217,216,162,18,
+    113,57,115,31,231,158,123,238,121,223,203,255,22,92,127,97,
+    235,251,171,159,67,241,11,65,17,148,64,65,200,224,119,176,
+    16,40,6,51,193,98,40,19,10,224,123,168,16,46,70,50,
+    145,98,71,166,163,216,153,233,44,138,25,145,214,135,11,93,
+    197,104,38,90,236,206,116,23,99,153,88,177,39,211,83,140,
+    103,226,197,68,38,81,236,205,244,66,159,136,210,81,232,43,
+    246,103,250,225,185,83,17,11,39,138,3,153,129,226,201,204,
+    201,128,16,20,94,19,148,174,15,4,37,250,113,80,16,62,
+    13,218,104,101,78,41,129,101,33,213,253,5,190,220,73,5,
+    27,157,75,175,92,187,77,76,185,17,151,87,12,83,151,243,
+    102,145,152,235,154,146,10,55,194,183,84,195,108,136,119,203,
+    166,170,149,228,66,67,92,38,239,86,72,41,79,26,145,123,
+    149,114,129,164,58,27,93,75,138,162,191,37,151,214,72,163,
+    251,90,65,203,223,191,174,21,101,181,212,232,184,121,247,187,
+    175,200,122,35,252,166,166,155,141,248,178,158,247,180,46,111,
+    25,38,41,54,122,254,84,43,152,242,26,97,213,95,132,0,
+    165,84,160,209,251,182,166,223,47,104,178,242,22,49,180,138,
+    158,39,95,4,176,1,80,189,77,138,183,53,133,52,250,139,
+    164,152,45,194,83,214,212,178,128,180,90,90,203,187,105,31,
+    181,105,255,63,1,164,61,17,50,1,69,200,4,149,64,38,
+    68,194,153,136,18,36,29,74,72,9,35,253,148,78,2,148,
+    27,226,67,149,46,37,186,26,85,186,63,8,103,68,101,90,
+    137,193,119,151,146,82,226,240,29,85,186,72,55,137,145,30,
+    18,95,13,58,35,156,167,213,160,146,128,126,9,232,231,129,
+    9,245,189,80,223,11,245,125,240,220,7,207,253,74,63,137,
+    211,185,194,202,9,120,63,161,12,144,1,235,253,36,188,159,
+    132,190,167,160,239,41,120,62,173,156,38,131,86,219,32,188,
+    15,65,219,32,180,13,193,115,82,73,146,97,171,109,24,222,
+    71,200,25,101,70,25,249,32,252,49,204,251,41,199,32,51,
+    10,245,108,212,153,150,182,179,180,77,34,113,15,198,163,45,
+    253,198,56,140,179,45,109,231,104,219,56,180,73,45,109,19,
+    124,220,88,75,219,121,104,59,247,129,224,171,157,164,171,24,
+    111,233,61,5,181,19,176,202,105,229,252,7,66,38,165,76,
+    66,57,163,76,65,121,65,137,2,87,95,104,244,44,89,76,
+    252,138,38,235,138,252,59,224,251,123,235,68,178,89,91,90,
+    193,106,73,45,153,68,95,149,243,36,29,141,74,240,71,59,
+    27,146,172,19,169,98,16,69,146,13,201,132,81,218,202,59,
+    4,198,108,174,171,249,117,41,47,151,164,188,86,42,97,141,
+    169,173,129,140,16,93,146,11,5,73,195,39,10,38,175,21,
+    203,90,137,148,76,35,45,221,91,87,13,103,218,124,65,54,
+    12,73,33,171,106,137,48,216,228,1,160,0,66,229,224,2,
+    213,178,233,130,182,194,144,42,86,12,83,42,235,218,134,170,
+    144,180,141,41,34,179,66,36,163,76,242,170,92,80,183,1,
+    231,85,77,151,20,117,117,149,232,128,128,116,115,121,201,144,
+    160,198,160,130,70,225,41,196,80,215,74,134,52,77,210,107,
+    233,89,64,22,86,155,215,42,128,45,188,200,121,192,201,220,
+    42,19,120,1,225,210,244,45,41,191,46,195,106,11,80,113,
+    115,238,46,140,222,80,243,216,74,204,124,202,34,219,205,146,
+    36,43,138,138,218,1,72,98,33,9,178,72,23,88,46,240,
+    53,49,36,92,228,161,148,182,136,73,148,89,10,12,199,176,
+    221,145,11,134,6,244,41,107,6,208,10,22,234,80,8,215,
+    136,253,40,186,128,11,204,8,56,25,154,62,11,253,20,11,
+    113,6,77,99,195,128,248,22,178,247,142,1,31,70,25,196,
+    148,42,101,247,146,173,253,47,17,2,132,135,30,43,132,194,
+    243,211,158,0,78,72,118,196,100,14,222,97,253,38,212,23,
+    221,44,6,83,193,238,170,64,128,85,93,43,74,76,11,82,
+    212,113,67,113,231,201,42,110,203,138,195,135,178,221,107,89,
+    45,222,165,252,72,193,109,174,147,146,164,131,58,86,117,162,
+    164,105,85,67,204,23,238,103,87,161,178,209,197,9,211,232,
+    179,5,226,77,94,213,193,232,212,24,176,155,110,211,119,75,
+    39,39,40,113,179,235,42,16,79,207,175,111,53,78,217,221,
+    174,97,195,235,188,190,67,39,102,69,47,221,201,71,92,154,
+    23,173,30,170,241,175,116,170,121,205,128,211,180,35,152,65,
+    231,205,107,149,140,132,233,130,162,4,62,134,113,159,242,177,
+    239,7,204,78,215,72,143,78,216,17,178,97,254,28,216,17,
+    222,225,111,89,14,209,236,57,124,180,171,63,159,99,39,8,
+    80,69,254,22,130,183,46,254,22,134,183,168,243,246,227,78,
+    90,211,205,113,199,177,49,207,27,159,125,71,216,141,11,109,
+    254,188,56,5,176,95,226,56,253,20,196,172,215,153,11,52,
+    96,88,254,57,144,141,242,3,254,45,150,101,93,6,201,179,
+    24,99,145,74,65,30,45,177,132,239,104,204,183,44,169,2,
+    117,69,197,35,237,31,204,121,137,141,230,175,71,141,99,92,
+    198,6,89,42,229,136,17,62,206,99,67,41,215,73,156,237,
+    14,133,113,216,31,40,41,67,43,18,91,157,50,213,97,43,
+    80,205,114,109,210,210,205,85,232,54,123,36,52,170,207,152,
+    26,161,138,89,219,32,186,14,154,89,202,229,178,150,66,203,
+    2,118,165,53,35,151,115,112,219,190,184,36,173,145,226,179,
+    146,97,42,5,117,197,13,192,210,8,110,133,144,190,115,35,
+    213,215,136,170,134,90,50,76,25,220,45,29,185,166,209,245,
+    234,131,60,161,248,234,200,81,141,40,238,170,194,28,170,8,
+    221,83,29,185,166,17,223,96,78,149,213,166,15,66,165,158,
+    196,150,222,172,143,194,250,8,86,119,100,85,35,187,106,52,
+    186,179,208,152,191,95,214,64,33,54,6,178,160,9,43,229,
+    44,219,185,172,142,46,158,209,136,89,181,116,1,141,83,190,
+    37,3,248,66,129,40,169,72,35,108,144,194,170,126,26,103,
+    230,211,211,201,12,20,74,74,147,223,95,54,244,252,92,121,
+    11,124,205,210,28,18,103,206,177,15,115,108,179,230,108,251,
+    201,230,75,151,183,26,98,54,171,150,84,51,155,221,62,229,
+    177,244,105,187,254,54,78,242,239,80,188,39,124,35,9,189,
+    201,143,38,126,213,81,75,76,213,19,83,77,33,208,117,59,
+    240,89,255,112,117,228,79,106,253,183,234,253,183,170,177,91,
+    223,116,8,195,169,90,114,166,158,156,121,24,254,48,113,32,
+    77,227,87,93,60,243,89,234,185,79,206,254,250,44,123,155,
+    108,118,8,201,113,120,142,31,156,26,129,175,238,3,105,238,
+    97,24,122,29,116,39,171,221,147,7,227,11,15,175,215,99,
+    82,51,38,156,30,198,230,102,84,24,145,176,195,32,12,236,
+    234,217,23,199,246,196,177,154,56,94,23,199,171,226,184,85,
+    55,180,39,14,213,196,225,186,56,92,21,135,155,162,48,53,
+    139,35,176,3,124,190,66,137,206,187,180,167,128,207,84,179,
+    162,192,255,2,53,23,111,2,185,15,108,223,123,13,44,151,
+    233,17,80,110,97,209,108,113,251,106,25,36,42,119,76,133,
+    27,62,201,118,24,55,21,160,251,247,73,64,191,128,116,69,
+    28,36,125,22,153,166,7,60,160,44,31,177,61,236,221,13,
+    79,227,143,113,104,140,110,9,16,166,119,224,195,191,172,138,
+    103,244,52,229,85,175,9,122,162,5,127,207,94,176,165,92,
+    166,223,90,186,157,122,210,53,91,99,153,135,226,89,55,101,
+    217,75,190,85,71,113,97,108,204,246,96,235,146,89,203,67,
+    255,122,255,162,42,38,233,122,61,235,11,218,235,187,99,173,
+    111,183,157,206,247,41,253,221,192,209,125,40,117,254,197,71,
+    157,50,196,97,134,229,245,40,18,58,108,92,135,58,180,73,
+    167,165,146,102,146,197,197,168,71,17,82,230,160,227,141,117,
+    173,82,80,80,115,50,42,2,40,163,2,126,15,85,139,56,
+    27,248,131,58,108,186,196,244,5,250,121,30,72,42,120,140,
+    70,158,148,168,151,168,233,10,113,243,90,80,127,134,115,22,
+    6,120,116,74,255,22,232,207,65,209,142,221,248,136,159,225,
+    0,137,145,191,23,200,255,179,31,253,244,71,181,132,84,79,
+    72,251,137,244,94,34,93,75,92,170,39,46,85,197,75,173,
+    91,114,20,203,229,108,162,50,127,153,235,209,39,229,58,223,
+    112,15,223,157,111,199,119,39,112,133,62,229,189,61,214,74,
+    4,95,151,191,69,48,61,14,39,214,19,19,85,113,226,201,
+    215,253,125,123,221,6,184,187,146,182,234,162,65,1,34,154,
+    67,215,217,190,59,173,118,175,217,246,57,177,49,139,141,143,
+    91,63,239,116,248,250,121,151,221,150,245,163,110,101,170,39,
+    140,204,146,119,121,164,142,64,14,48,42,128,55,153,229,141,
+    10,165,196,29,64,182,155,41,11,202,108,192,179,168,24,245,
+    23,112,34,28,47,217,8,219,150,209,213,217,143,112,155,46,
+    255,132,112,122,41,194,7,195,103,169,5,169,210,15,195,89,
+    180,243,30,30,188,67,54,222,151,132,22,159,59,240,107,159,
+    47,13,107,226,207,212,99,12,109,63,224,91,177,236,213,25,
+    56,147,189,125,45,12,205,157,60,138,144,71,155,210,113,78,
+    60,167,90,97,19,141,173,76,205,195,237,47,11,52,11,165,
+    35,201,233,139,77,209,151,253,20,141,25,150,144,35,244,237,
+    164,151,148,238,182,127,198,145,73,74,195,111,98,194,208,133,
+    223,188,94,29,124,177,54,248,98,125,240,69,176,205,61,15,
+    225,255,201,37,224,26,151,124,234,60,51,215,234,112,249,246,
+    116,114,45,247,92,59,225,238,165,156,139,67,44,151,109,123,
+    180,13,103,187,218,255,85,240,25,152,31,85,197,81,198,33,
+    17,234,202,61,1,91,99,50,48,40,223,119,7,13,192,5,
+    24,244,178,12,135,99,38,156,125,212,43,24,52,75,55,150,
+    49,195,176,252,42,221,111,43,227,1,31,216,11,14,106,67,
+    149,41,213,54,173,140,158,52,237,121,163,49,244,170,10,106,
+    83,33,16,131,23,105,118,196,51,243,166,90,40,112,104,158,
+    169,25,115,234,104,176,82,206,228,240,70,227,249,146,194,116,
+    177,197,117,104,119,56,24,144,187,85,117,173,162,203,52,113,
+    97,228,117,181,108,74,68,95,211,102,37,213,156,50,192,15,
+    82,55,100,147,180,50,59,165,237,34,149,18,7,201,22,46,
+    111,69,209,38,17,135,7,106,68,159,116,49,251,171,126,102,
+    79,160,159,157,93,173,20,10,76,57,108,159,241,121,187,222,
+    230,127,195,241,9,198,16,253,194,105,234,162,62,132,255,86,
+    62,231,186,226,122,11,159,43,129,251,148,109,244,132,25,114,
+    6,40,65,127,44,238,147,141,144,124,198,205,60,111,49,57,
+    128,120,232,158,94,33,185,156,164,174,30,77,164,180,116,23,
+    169,185,169,26,46,189,193,65,250,7,45,19,107,208,82,9,
+    28,26,43,38,162,156,130,157,204,117,93,219,44,177,105,97,
+    228,186,76,153,194,197,67,164,132,44,225,218,93,202,59,171,
+    149,82,158,194,129,103,154,123,89,217,162,168,44,171,197,74,
+    65,54,97,23,97,206,74,193,206,17,85,202,150,61,164,173,
+    48,206,197,93,186,14,90,189,224,178,234,119,182,255,238,158,
+    155,237,189,33,44,229,217,45,170,26,45,118,77,75,111,31,
+    206,94,228,1,201,87,208,211,240,75,32,118,225,98,68,241,
+    103,137,171,41,20,0,123,238,41,207,66,129,160,105,224,65,
+    100,69,125,172,157,106,234,65,150,119,184,208,231,118,121,26,
+    255,3,135,46,216,60,24,235,253,240,249,143,38,246,186,71,
+    171,221,163,16,114,53,131,161,190,241,47,67,145,19,241,175,
+    5,40,154,66,164,39,14,209,146,219,55,110,136,54,142,30,
+    237,37,218,12,251,59,154,80,234,242,165,148,118,2,199,241,
+    136,189,201,166,31,6,75,151,199,5,51,236,244,158,16,244,
+    201,128,224,78,50,41,129,227,65,254,123,16,144,95,134,252,
+    34,178,41,60,8,253,153,176,25,48,187,156,113,239,240,116,
+    212,142,79,164,126,24,130,185,58,142,158,107,183,243,232,62,
+    215,133,63,127,245,135,225,157,240,78,232,29,241,73,198,109,
+    4,244,105,207,250,67,59,97,88,91,248,216,84,136,252,50,
+    226,167,194,135,55,130,176,86,165,83,21,142,183,190,127,12,
+    252,77,32,32,40,29,160,84,68,121,218,103,145,188,102,196,
+    39,65,32,25,200,202,135,137,52,85,13,166,124,159,72,135,
+    88,31,204,192,162,114,161,6,158,201,47,7,229,204,105,131,
+    179,18,232,185,28,42,225,251,4,162,160,66,86,81,141,251,
+    89,187,107,46,151,130,57,205,245,182,240,168,41,65,49,53,
+    90,236,139,61,158,57,17,124,98,183,243,212,54,245,181,253,
+    189,123,14,45,20,141,48,51,104,84,202,232,82,90,118,148,
+    3,219,42,219,182,218,215,31,204,162,9,206,5,69,26,252,
+    82,136,226,100,240,229,114,219,209,28,95,250,246,133,183,253,
+    196,195,177,165,139,228,129,10,58,160,100,58,171,131,129,189,
+    57,186,79,156,110,185,237,96,78,186,243,137,144,234,106,116,
+    130,75,35,155,166,206,124,31,187,7,30,229,53,226,75,80,
+    175,174,128,138,123,85,215,129,118,168,151,26,157,106,9,39,
+    52,27,93,120,134,33,131,137,33,141,56,77,50,112,106,54,
+    194,247,201,150,209,136,58,53,169,8,179,174,111,32,132,48,
+    78,210,136,99,153,117,96,176,222,217,18,140,112,50,83,46,
+    127,211,38,91,59,127,211,110,251,47,232,109,252,113,128,42,
+    190,83,157,93,241,207,78,36,63,122,102,119,112,127,108,113,
+    111,108,177,54,246,66,125,236,133,218,137,23,235,39,94,124,
+    120,253,225,245,111,63,75,156,1,237,215,21,119,10,170,30,
+    131,125,47,124,62,48,178,63,112,113,111,224,98,109,96,174,
+    62,48,215,140,64,93,83,176,139,47,67,97,84,158,97,84,
+    158,97,80,158,33,24,249,237,183,223,126,19,23,146,99,245,
+    161,153,71,207,212,134,46,213,135,46,61,140,31,36,207,237,
+    39,231,247,146,243,181,228,229,122,242,242,126,242,202,94,242,
+    74,45,185,88,79,46,54,133,142,174,126,90,60,124,227,32,
+    49,180,59,90,31,91,220,31,123,105,111,236,165,218,216,82,
+    125,108,169,154,192,207,103,167,206,2,62,39,175,28,12,158,
+    107,134,224,27,166,63,121,229,243,65,105,127,112,126,111,112,
+    190,54,120,185,62,120,25,144,179,26,104,1,200,157,238,7,
+    228,78,3,244,112,95,127,51,36,244,190,18,104,198,133,174,
+    158,135,225,170,152,130,207,195,7,251,137,201,189,196,100,45,
+    49,93,79,76,179,58,254,49,80,77,190,127,238,188,240,171,
+    75,75,39,67,143,243,203,77,87,211,251,129,84,64,46,184,
+    213,68,139,33,103,249,72,201,98,106,207,22,34,187,195,107,
+    37,111,226,233,209,10,59,119,129,94,28,24,139,101,90,206,
+    152,90,35,127,207,161,150,90,2,121,7,177,147,209,66,131,
+    247,203,193,249,243,195,211,169,92,14,230,173,152,146,188,106,
+    90,150,30,250,180,73,186,98,79,190,170,244,33,139,117,18,
+    51,86,70,90,1,55,7,92,0,43,235,141,78,11,21,88,
+    55,194,179,110,143,24,49,3,64,224,252,148,212,119,43,132,
+    169,26,59,215,237,204,250,73,160,113,226,142,102,222,44,150,
+    11,164,8,64,136,194,164,212,159,165,73,65,225,23,26,119,
+    238,248,27,220,83,60,70,129,32,173,95,72,156,171,138,99,
+    71,6,101,254,205,223,254,171,235,182,187,211,198,31,71,199,
+    239,250,237,37,43,113,197,2,133,182,1,91,123,79,213,51,
+    124,150,29,203,82,255,52,151,187,33,23,12,226,78,239,235,
+    25,161,157,239,4,32,178,74,81,102,89,41,191,239,228,105,
+    12,5,28,106,196,158,150,26,95,219,33,42,93,0,196,49,
+    215,85,52,60,18,75,173,74,75,121,100,99,182,30,31,23,
+    241,99,106,118,243,131,29,76,0,43,169,206,46,83,123,102,
+    201,145,81,89,161,231,217,160,251,25,201,182,56,56,219,230,
+    32,229,172,115,80,244,16,237,19,96,199,93,110,187,19,75,
+    18,94,56,177,51,14,143,67,255,40,210,163,105,56,148,244,
+    158,198,110,24,166,127,31,129,252,225,217,79,46,73,55,239,
+    130,140,63,37,251,241,225,79,197,126,81,228,48,85,203,194,
+    120,127,170,218,105,57,133,171,207,62,205,234,229,255,132,14,
+    126,142,3,116,95,169,24,126,63,236,255,151,189,208,149,194,
+    211,124,220,6,68,134,250,43,121,109,157,221,147,192,218,105,
+    107,98,58,171,154,183,142,8,83,16,148,178,250,107,111,126,
+    199,193,64,85,8,166,9,36,57,143,129,167,65,207,224,137,
+    1,15,69,34,3,60,116,120,92,119,7,56,12,251,156,193,
+    26,206,225,65,255,77,166,161,97,74,226,64,179,210,200,246,
+    21,4,203,229,196,42,122,91,65,175,148,77,183,246,54,117,
+    13,44,157,110,96,98,159,94,68,192,219,29,169,67,243,83,
+    136,33,221,168,35,88,8,37,165,61,11,57,45,163,48,192,
+    176,116,215,200,211,234,174,191,126,156,40,177,155,23,124,203,
+    0,249,227,203,81,235,216,89,71,132,28,177,58,138,18,9,
+    20,25,27,10,44,220,159,143,241,53,167,159,94,172,98,46,
+    177,98,76,115,17,153,198,179,4,170,5,159,70,202,128,52,
+    185,156,15,87,164,152,147,174,241,67,181,200,11,98,51,131,
+    147,206,72,211,24,42,200,40,55,41,235,114,15,247,60,60,
+    135,32,142,231,3,226,195,150,64,69,23,5,196,186,80,229,
+    94,209,52,136,116,74,162,57,60,163,66,148,163,246,227,140,
+    125,226,131,128,221,171,97,137,246,11,237,143,135,218,118,126,
+    238,169,13,128,220,17,106,19,163,90,146,110,29,128,249,2,
+    85,231,150,18,63,114,244,210,187,197,105,245,184,169,101,93,
+    69,120,154,227,41,82,176,176,133,0,248,80,87,19,175,34,
+    72,55,249,78,129,134,209,183,60,106,219,194,8,224,242,252,
+    145,199,21,166,199,56,136,58,85,207,109,215,169,121,213,156,
+    115,177,137,53,56,233,55,223,49,2,59,37,66,22,197,187,
+    16,54,171,90,153,89,204,67,183,193,147,78,105,107,72,196,
+    141,67,3,207,193,234,211,66,232,41,195,25,183,194,18,1,
+    6,68,125,246,85,63,134,151,116,163,226,74,55,91,171,240,
+    98,197,82,210,82,65,189,79,10,91,84,189,208,235,37,148,
+    208,82,145,221,169,131,1,106,30,35,128,244,49,142,86,97,
+    199,103,80,86,103,168,8,177,189,231,251,204,20,190,29,82,
+    32,81,220,167,105,30,72,78,72,50,141,89,247,54,76,144,
+    194,197,122,227,23,140,223,21,82,38,64,173,74,217,149,196,
+    196,191,251,37,109,211,190,204,215,150,148,71,217,15,125,26,
+    138,237,115,109,131,0,79,132,179,228,50,33,211,135,153,16,
+    158,185,126,43,224,207,92,251,50,214,45,183,199,118,132,93,
+    119,74,145,255,249,210,107,161,118,125,118,4,47,52,122,59,
+    43,220,174,167,23,154,62,117,188,126,187,145,118,125,218,206,
+    250,212,41,194,86,104,244,94,26,111,87,66,244,230,88,5,
+    136,116,141,241,140,65,111,182,50,253,195,227,219,67,142,182,
+    81,132,233,81,62,227,77,247,113,145,92,216,148,183,12,23,
+    203,207,167,165,107,246,29,90,206,86,14,27,45,120,155,15,
+    61,38,191,236,237,231,186,184,194,187,92,39,27,164,160,149,
+    209,39,42,202,16,7,87,212,2,227,113,134,34,120,122,149,
+    162,117,112,128,87,41,243,58,1,249,2,110,119,221,225,61,
+    82,120,103,124,23,226,80,127,187,227,127,39,178,247,103,13,
+    20,22,97,163,29,93,243,128,196,105,192,251,7,11,181,40,
+    173,155,102,217,88,156,163,151,163,210,178,73,189,83,185,148,
+    46,17,115,110,69,215,54,13,50,247,218,171,183,159,189,56,
+    63,63,15,244,248,78,201,84,11,116,109,30,120,0,31,209,
+    90,85,31,16,101,150,45,157,238,21,213,86,150,135,128,71,
+    138,152,249,35,190,219,116,51,224,188,210,43,188,237,179,42,
+    45,26,198,186,254,5,214,200,81,104,238,195,64,252,163,182,
+    203,118,53,236,202,237,63,66,58,182,40,44,103,82,26,13,
+    21,96,139,148,45,118,128,195,102,74,223,187,147,18,245,25,
+    193,62,189,160,215,71,250,93,91,96,169,25,253,10,54,244,
+    185,27,232,134,232,243,88,127,210,93,207,55,179,213,5,244,
+    161,215,114,36,231,109,126,27,117,26,30,69,191,39,52,167,
+    133,88,111,189,123,178,41,132,104,182,239,160,247,230,151,161,
+    32,102,243,130,152,205,11,246,196,155,81,161,171,231,103,137,
+    159,38,106,226,80,93,28,218,23,103,247,196,217,71,247,106,
+    226,66,93,92,168,138,11,205,14,128,176,223,61,190,215,61,
+    94,235,62,95,239,62,143,119,217,94,58,128,186,216,196,94,
+    108,162,22,155,172,199,38,247,99,87,246,98,87,126,59,80,
+    139,93,173,199,174,86,99,87,173,123,102,201,61,49,89,19,
+    71,234,226,200,190,184,176,39,46,252,230,153,154,120,165,46,
+    94,169,138,87,62,159,156,113,221,57,123,204,21,165,254,192,
+    31,246,138,18,213,103,199,208,201,250,228,49,117,247,113,231,
+    108,171,227,159,6,22,59,56,223,94,188,198,132,193,185,57,
+    46,151,182,152,51,128,190,1,87,2,185,28,200,48,187,207,
+    105,170,192,104,192,254,119,82,97,198,128,125,224,135,26,224,
+    143,58,173,148,97,41,59,183,216,212,119,161,216,62,235,99,
+    61,255,248,29,100,62,116,87,223,19,62,23,99,94,22,72,
+    239,137,233,154,120,169,46,226,21,168,131,238,132,159,173,158,
+    111,203,86,181,216,98,61,182,88,141,45,30,136,49,55,163,
+    94,216,19,47,212,196,139,117,241,98,213,254,60,134,141,176,
+    229,184,108,196,73,92,185,167,185,92,35,181,88,36,10,174,
+    177,176,101,103,109,219,208,150,59,211,155,168,74,31,231,25,
+    99,39,126,164,186,178,133,191,209,144,43,5,51,141,71,244,
+    90,155,13,104,244,130,142,32,110,98,251,111,107,248,219,127,
+    130,155,49,34,88,183,53,80,34,71,246,196,145,154,56,90,
+    23,71,171,246,231,49,254,206,130,224,247,119,140,35,252,29,
+    118,175,71,190,16,118,133,39,175,3,29,164,77,32,35,94,
+    241,101,145,27,255,53,11,37,5,85,178,46,229,106,57,252,
+    96,104,224,137,131,225,119,144,49,150,84,77,251,120,221,101,
+    43,151,85,52,26,27,11,11,233,249,182,244,118,43,117,239,
+    169,124,81,219,192,223,82,224,69,232,199,166,235,45,71,196,
+    189,171,46,146,83,55,217,157,49,151,190,99,160,23,176,185,
+    174,193,148,27,214,47,43,112,2,215,141,108,87,46,133,187,
+    59,211,106,154,164,103,237,12,58,139,89,61,183,181,61,8,
+    166,236,0,201,69,8,223,205,1,43,254,2,114,169,64,161,
+    146,70,127,97,179,70,79,227,52,131,80,4,21,141,30,197,
+    85,12,242,120,80,56,23,174,23,44,162,99,142,253,82,32,
+    41,42,187,137,64,45,189,179,68,116,237,114,185,195,153,214,
+    166,160,59,218,108,35,54,30,128,96,140,241,166,61,243,3,
+    209,179,217,208,84,186,105,171,21,3,160,89,174,7,99,62,
+    206,104,110,103,137,67,179,227,76,135,211,172,27,29,228,65,
+    185,0,94,10,139,215,192,161,177,21,44,204,6,243,108,16,
+    221,148,52,32,47,187,207,227,96,7,205,174,131,96,115,93,
+    202,81,222,108,201,116,180,63,55,114,232,196,238,230,91,55,
+    247,208,91,36,215,174,177,31,228,180,132,223,75,250,33,253,
+    240,247,91,236,88,24,54,216,158,208,224,63,34,112,129,224,
+    191,246,105,3,227,109,66,127,190,128,140,162,88,167,52,168,
+    229,48,186,243,108,42,7,199,143,120,57,251,106,58,255,177,
+    129,67,248,179,120,150,230,129,48,101,28,41,194,20,174,219,
+    39,227,170,151,133,200,81,203,213,197,110,122,165,84,66,203,
+    40,91,17,130,86,49,105,98,200,138,105,169,60,46,3,7,
+    42,216,120,75,93,209,241,0,154,243,126,148,241,62,253,169,
+    134,105,205,193,124,107,131,216,252,197,126,213,161,19,67,43,
+    108,48,125,142,88,193,156,209,92,238,5,207,210,174,182,232,
+    105,122,206,230,226,121,175,56,97,107,58,138,87,21,29,127,
+    211,111,26,78,182,56,196,200,239,219,227,143,117,20,89,167,
+    159,162,145,184,196,140,196,12,189,169,58,211,20,68,235,112,
+    56,210,23,254,50,212,137,14,99,39,58,140,157,120,252,43,
+    226,233,49,20,212,112,0,86,163,136,208,144,235,121,193,121,
+    190,147,154,197,31,78,224,41,119,54,219,136,102,179,140,146,
+    240,28,203,102,223,173,200,5,171,165,51,155,85,180,124,54,
+    171,163,117,105,244,64,63,98,202,52,43,14,141,33,88,131,
+    142,33,168,126,17,139,121,238,161,96,200,169,227,101,19,29,
+    143,113,117,188,151,72,47,105,51,175,59,4,177,133,254,60,
+    190,190,132,197,9,44,94,193,2,227,125,29,111,161,53,194,
+    43,154,86,208,95,195,247,155,88,244,97,241,93,44,48,126,
+    166,71,137,250,15,176,192,80,89,151,177,192,95,251,234,248,
+    155,43,157,96,177,134,133,42,88,41,7,102,183,209,81,210,
+    13,44,42,88,220,18,172,12,31,115,163,78,217,5,34,105,
+    72,33,36,188,253,223,12,246,70,196,166,128,197,132,112,114,
+    228,189,219,205,240,66,100,246,243,254,147,205,8,124,131,87,
+    61,48,213,236,196,39,81,232,155,106,118,225,83,84,72,158,
+    171,158,91,172,15,61,223,236,198,247,152,16,141,55,123,240,
+    73,240,22,235,129,72,100,180,41,120,139,120,36,50,140,79,
+    238,34,46,70,230,63,122,240,40,242,72,253,237,192,35,173,
+    62,125,181,126,246,37,216,240,200,188,191,24,136,68,206,239,
+    126,183,154,190,81,63,255,26,14,61,239,47,0,250,196,238,
+    50,62,79,248,139,120,32,34,61,10,131,215,23,145,126,51,
+    64,191,252,69,71,71,228,234,238,219,77,1,190,176,7,124,
+    249,139,222,72,228,236,238,5,132,119,214,95,196,187,34,35,
+    187,247,154,2,124,61,82,232,151,191,56,213,27,25,254,200,
+    68,90,15,251,139,137,51,145,153,234,249,103,155,2,124,255,
+    118,130,126,249,139,171,66,199,64,51,40,70,206,33,37,88,
+    241,101,8,234,62,248,1,171,77,210,246,72,228,28,78,17,
+    193,30,118,193,187,97,69,220,6,243,145,185,123,253,31,182,
+    29,96,173,16,7,56,196,235,71,67,236,129,110,55,154,66,
+    15,246,176,11,222,13,43,70,109,104,187,3,199,194,239,48,
+    124,78,96,147,93,240,118,172,152,25,143,192,214,120,139,55,
+    128,5,211,56,139,85,196,125,155,118,38,18,71,242,250,11,
+    38,60,40,50,169,211,250,155,84,180,229,149,60,85,21,84,
+    78,27,29,230,86,25,20,26,147,210,14,143,102,104,68,65,
+    153,178,95,83,27,76,75,68,185,0,83,125,129,119,244,233,
+    175,220,216,79,216,250,117,235,151,255,70,218,126,98,90,225,
+    101,174,67,6,184,20,123,37,251,247,226,11,76,187,93,213,
+    223,23,88,10,223,184,1,101,51,20,8,4,154,207,9,129,
+    196,123,113,252,111,6,67,129,32,68,228,71,22,98,4,159,
+    158,174,136,139,248,244,127,81,12,8,129,203,85,97,193,253,
+    57,246,138,98,90,36,0,123,218,190,252,146,150,95,31,210,
+    74,233,252,191,49,176,211,63,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/boards/abstract_board.py",
+    "gem5.components.boards.abstract_board",
+    embedded_module_data,
+    6248,
+    17127);
+
+} // anonymous namespace
+} // namespace gem5
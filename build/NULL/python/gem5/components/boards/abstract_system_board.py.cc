@@ -0,0 +1,94 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,84,223,107,28,69,28,159,217,95,55,187,73,46,
+    198,230,82,83,147,116,20,218,243,16,47,32,84,65,164,152,
+    230,161,190,36,10,17,180,251,50,183,217,157,235,109,187,63,
+    210,153,61,245,66,30,242,16,48,66,95,165,69,16,250,20,
+    144,248,230,63,114,41,1,143,133,130,224,83,222,54,180,130,
+    244,169,51,187,217,235,157,166,234,222,222,103,191,243,157,239,
+    124,231,251,227,51,243,7,24,121,140,179,239,211,175,4,60,
+    0,30,240,96,0,66,104,67,40,101,37,80,66,213,86,67,
+    205,214,196,88,245,180,64,15,13,219,16,178,238,25,65,37,
+    68,54,130,64,1,55,129,87,217,3,30,162,26,69,7,26,
+    0,135,90,233,222,54,61,115,3,52,172,19,57,104,192,180,
+    178,114,99,117,141,38,78,67,73,205,13,63,252,108,243,14,
+    117,147,212,216,232,241,132,134,39,106,97,100,198,95,83,198,
+    124,143,242,19,88,104,166,86,54,121,194,28,55,185,17,59,
+    204,115,71,19,64,101,2,45,1,223,137,20,40,176,161,7,
+    108,197,131,182,74,53,91,247,20,106,200,208,101,200,94,197,
+    67,109,228,153,123,154,93,81,0,69,212,60,16,59,28,194,
+    210,217,62,104,67,207,218,67,7,66,62,28,110,97,91,251,
+    224,91,104,79,136,68,38,210,11,101,40,69,204,121,64,219,
+    235,22,22,207,74,132,157,179,73,188,41,245,184,29,51,236,
+    58,156,114,252,77,135,50,90,104,57,230,157,184,27,120,216,
+    143,132,210,79,112,155,197,33,46,220,53,115,71,41,114,131,
+    187,164,205,232,189,212,220,98,177,75,57,143,89,58,83,238,
+    252,249,80,101,132,52,140,89,47,157,45,167,214,242,113,225,
+    43,157,118,29,183,67,73,199,167,204,97,110,167,151,206,149,
+    102,171,114,226,211,82,239,234,35,245,172,136,191,90,214,243,
+    1,72,224,203,169,59,67,121,7,140,215,13,130,68,63,223,
+    110,7,238,40,59,234,142,246,11,60,16,22,135,250,203,21,
+    30,16,245,84,214,27,26,155,20,99,54,37,97,90,194,140,
+    236,185,202,164,105,138,8,241,35,63,33,132,153,82,171,167,
+    26,167,65,251,188,21,92,218,203,226,225,231,31,113,230,46,
+    111,245,146,78,28,45,223,166,225,181,101,55,14,183,226,136,
+    70,9,95,46,58,176,92,246,137,240,188,84,36,87,55,183,
+    122,108,86,120,217,94,56,167,199,205,50,146,166,220,236,166,
+    128,93,240,103,21,152,211,247,167,31,106,71,104,241,24,45,
+    246,209,226,19,84,59,70,75,131,201,215,6,181,197,193,220,
+    229,193,133,249,193,194,187,217,132,97,90,167,64,192,51,9,
+    217,56,60,149,229,112,71,202,44,14,212,89,11,246,5,252,
+    0,199,155,48,78,205,71,163,235,94,97,3,255,109,189,242,
+    127,214,123,80,182,106,251,215,47,41,46,143,38,78,58,62,
+    199,237,110,228,38,126,44,120,207,177,32,178,208,184,78,16,
+    80,73,109,220,106,133,215,154,126,196,19,39,74,124,39,161,
+    173,86,19,127,33,22,229,12,151,79,72,157,72,28,12,42,
+    214,68,98,1,167,44,193,14,22,196,116,239,226,36,198,52,
+    226,93,38,247,161,194,21,113,227,40,18,87,5,17,219,70,
+    183,121,171,53,220,122,232,174,35,98,216,164,52,194,172,27,
+    53,135,218,245,134,154,234,188,187,69,89,90,251,155,19,146,
+    111,149,86,93,70,69,120,171,171,197,101,212,80,88,77,50,
+    207,36,196,13,28,206,9,225,178,70,120,151,205,73,170,189,
+    41,249,241,246,121,252,24,119,115,93,178,228,67,1,127,9,
+    154,76,2,179,250,125,229,126,229,55,116,229,49,186,114,132,
+    234,199,168,222,71,245,39,104,170,208,46,61,70,75,71,8,
+    31,35,220,47,95,118,81,242,125,82,30,128,200,9,41,33,
+    169,69,72,24,123,221,64,202,147,132,220,235,58,193,217,76,
+    133,16,47,118,197,25,145,164,73,167,132,157,184,97,207,130,
+    79,85,17,105,206,106,38,79,54,211,202,36,164,93,110,227,
+    210,32,32,164,1,217,130,12,89,50,229,147,34,213,137,18,
+    174,202,137,31,139,92,202,95,166,41,58,202,128,4,4,106,
+    11,187,107,153,86,213,173,223,95,175,101,186,248,102,6,152,
+    173,103,21,41,33,48,83,207,76,41,89,224,210,251,217,132,
+    148,192,56,96,96,76,239,222,218,239,29,233,243,199,250,124,
+    166,24,250,91,226,100,140,194,169,10,140,75,175,152,203,33,
+    47,87,30,236,122,195,74,85,103,211,45,138,97,9,14,198,
+    121,67,120,145,122,126,171,84,187,137,31,240,102,201,229,188,
+    50,105,117,120,39,228,151,65,126,225,228,30,127,6,133,119,
+    89,148,231,232,227,162,9,215,89,35,63,26,162,50,63,9,
+    200,84,8,97,246,1,128,111,244,193,197,209,55,211,84,168,
+    100,224,191,193,2,240,157,62,168,143,190,3,208,232,143,191,
+    153,113,25,138,132,255,9,15,175,62,122,239,84,10,207,206,
+    153,204,195,127,1,30,102,247,252,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/boards/abstract_system_board.py",
+    "gem5.components.boards.abstract_system_board",
+    embedded_module_data,
+    1113,
+    2038);
+
+} // anonymous namespace
+} // namespace gem5
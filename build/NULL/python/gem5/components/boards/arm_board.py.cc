@@ -0,0 +1,425 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,221,59,107,111,28,215,117,119,223,179,239,37,185,164,
+    200,229,107,72,145,34,151,143,165,232,72,142,158,177,41,209,
+    114,100,155,148,106,17,138,179,65,186,90,238,12,169,145,246,
+    193,204,12,37,145,161,16,33,117,17,38,81,16,37,117,96,
+    37,149,17,182,112,29,58,86,80,23,65,81,163,200,183,254,
+    129,93,98,0,46,6,16,96,160,200,7,127,91,213,22,80,
+    228,83,207,185,179,243,218,93,201,114,209,79,93,141,47,239,
+    220,123,206,185,231,158,123,238,121,220,59,254,79,98,249,249,
+    234,127,63,63,228,32,228,93,194,17,206,145,39,105,252,235,
+    204,59,10,206,180,211,129,117,87,222,85,112,167,221,5,79,
+    218,83,240,166,189,14,13,206,151,246,193,95,119,158,41,248,
+    211,254,66,32,29,40,4,211,193,66,40,29,42,132,211,225,
+    66,36,29,41,68,211,209,66,44,29,43,180,165,219,10,237,
+    233,246,66,71,186,163,16,79,199,11,157,233,206,66,87,186,
+    171,112,32,125,160,208,157,238,46,244,164,123,10,137,116,162,
+    208,155,238,45,244,165,251,128,190,135,243,230,251,11,3,233,
+    1,90,247,229,7,11,108,154,165,117,38,63,84,24,78,15,
+    211,186,63,127,176,48,146,30,129,122,128,11,230,71,11,135,
+    210,135,104,61,148,31,43,140,167,199,105,61,156,79,22,38,
+    210,19,180,30,201,79,22,166,210,83,80,143,114,177,252,116,
+    33,149,78,209,122,91,126,166,112,56,125,216,65,156,228,85,
+    194,181,191,77,184,14,62,204,167,248,195,31,120,8,249,200,
+    163,11,43,61,203,57,46,145,100,252,51,124,89,76,58,84,
+    223,220,153,179,11,188,156,77,186,84,247,27,130,36,171,204,
+    37,254,123,235,124,49,199,171,158,165,245,181,60,159,140,171,
+    254,57,142,19,223,204,22,87,121,181,109,78,44,204,243,43,
+    217,245,188,252,38,159,231,179,18,175,6,160,233,156,244,134,
+    80,92,191,69,235,122,187,31,234,151,54,36,153,47,168,190,
+    51,89,14,105,168,222,51,162,192,1,153,208,217,210,205,121,
+    65,186,126,190,144,133,55,239,249,11,111,157,201,138,170,255,
+    98,78,184,44,136,242,249,11,170,251,98,73,148,213,208,155,
+    89,11,152,255,146,80,184,176,124,141,207,201,106,228,146,152,
+    59,155,47,229,174,207,151,10,89,161,168,50,75,188,88,16,
+    138,217,188,218,126,249,149,91,107,34,47,73,153,87,95,89,
+    56,154,57,131,156,116,219,219,206,149,214,139,92,86,22,74,
+    69,53,168,13,119,6,73,169,254,203,197,220,37,94,188,193,
+    139,106,248,114,41,47,195,152,26,249,207,92,32,44,144,149,
+    235,252,165,57,248,19,155,91,150,100,49,155,3,9,72,165,
+    117,49,199,67,155,191,4,104,48,55,94,130,23,70,4,17,
+    10,48,224,103,78,13,177,75,199,56,155,205,93,229,191,41,
+    240,98,86,204,93,221,64,241,47,150,104,27,84,227,58,208,
+    2,95,40,137,27,154,232,160,189,77,111,191,40,150,114,48,
+    137,146,248,153,67,35,27,214,123,206,148,178,34,7,13,237,
+    175,243,98,145,207,163,200,190,85,18,175,231,75,89,46,103,
+    221,42,81,125,171,172,192,140,126,4,155,133,39,105,7,71,
+    210,78,206,145,118,241,238,180,199,73,120,239,7,0,240,145,
+    129,2,45,62,123,203,138,147,115,242,12,231,226,253,156,155,
+    15,112,30,62,200,121,249,16,231,227,195,28,195,249,87,34,
+    219,100,197,193,5,222,14,167,35,128,27,229,99,31,0,183,
+    31,57,116,108,142,229,130,111,187,237,20,211,109,208,26,122,
+    219,157,110,111,137,193,240,29,124,156,239,228,187,86,156,61,
+    6,142,89,3,126,194,77,20,15,60,133,82,55,64,71,154,
+    160,123,158,2,157,0,232,104,19,116,239,51,104,199,154,160,
+    251,158,2,13,179,225,218,154,160,251,159,65,187,189,9,122,
+    224,41,208,131,124,151,77,62,29,77,152,108,75,204,56,223,
+    69,215,208,205,117,54,97,12,181,194,160,107,221,245,54,211,
+    0,59,12,60,48,48,238,1,88,211,131,92,55,63,82,167,
+    218,3,239,163,148,206,161,134,145,19,111,147,6,26,99,45,
+    225,122,249,113,160,219,215,196,93,242,41,186,214,223,4,57,
+    209,146,46,202,140,177,201,108,160,9,115,146,98,78,181,144,
+    192,96,147,4,166,183,201,45,71,58,5,166,118,72,101,192,
+    16,210,29,154,69,180,0,11,191,57,118,25,27,216,92,118,
+    45,187,156,231,217,210,10,187,178,158,207,179,18,221,244,172,
+    36,20,214,243,212,66,177,43,37,145,157,123,115,129,21,138,
+    176,213,215,115,216,38,165,216,243,50,43,72,236,50,24,55,
+    78,163,247,230,194,141,99,169,0,173,47,93,229,235,212,117,
+    16,22,232,0,15,236,66,73,190,202,139,90,95,221,34,178,
+    235,115,75,111,177,227,151,95,88,152,190,56,155,156,66,48,
+    74,228,108,73,228,151,4,224,76,135,155,155,61,122,235,5,
+    4,188,56,125,22,234,73,54,91,212,233,222,56,54,61,199,
+    158,187,124,145,53,13,43,187,6,236,3,235,26,177,27,179,
+    179,169,99,83,44,199,175,241,69,78,40,174,34,30,112,162,
+    79,19,24,212,193,83,200,189,84,231,95,98,179,34,207,174,
+    101,69,89,66,1,193,28,199,36,74,239,50,47,74,48,76,
+    158,31,95,90,72,26,28,174,100,11,66,126,3,33,53,236,
+    186,56,38,38,222,16,10,130,76,217,146,38,38,180,54,86,
+    66,235,254,2,123,51,155,191,206,139,236,90,9,199,192,209,
+    132,213,34,204,156,75,81,48,149,201,229,175,103,86,192,154,
+    171,254,53,221,248,170,222,2,181,207,106,52,135,134,59,115,
+    85,183,230,42,163,207,66,245,137,117,31,232,21,121,121,93,
+    44,46,230,124,196,252,97,29,61,202,231,224,221,201,175,28,
+    239,146,45,207,22,201,24,221,91,14,120,51,244,75,246,152,
+    136,118,29,219,113,145,22,63,59,140,131,200,126,179,239,154,
+    129,177,133,163,56,183,92,91,238,135,14,123,128,0,24,65,
+    19,67,14,89,176,141,57,60,116,218,247,128,131,108,121,129,
+    103,198,160,238,220,177,140,250,52,222,56,215,117,116,143,68,
+    4,63,2,216,1,163,157,92,130,192,168,177,37,233,93,76,
+    186,197,9,132,159,196,98,10,139,105,66,253,96,72,144,178,
+    153,186,207,229,196,81,104,60,183,148,12,170,254,140,177,32,
+    254,140,177,146,30,105,125,13,60,60,147,201,8,69,65,206,
+    100,196,67,72,105,16,139,62,40,84,23,232,153,56,131,181,
+    240,42,47,103,138,235,133,76,14,84,66,82,3,160,172,178,
+    144,65,69,72,50,170,91,226,243,43,173,248,17,83,88,80,
+    2,254,12,12,155,133,176,35,35,161,108,88,237,119,231,47,
+    41,73,204,205,172,109,200,87,75,197,153,85,190,112,116,38,
+    87,42,172,149,138,124,81,150,102,52,221,157,201,138,133,12,
+    173,166,214,54,196,23,1,121,179,77,183,34,41,157,243,111,
+    65,179,244,91,40,254,251,14,169,197,73,98,120,219,125,55,
+    82,237,25,194,63,127,102,194,63,246,221,245,237,51,221,123,
+    76,119,133,73,40,76,162,204,36,30,49,157,10,51,80,13,
+    197,170,157,253,213,174,193,106,71,79,181,111,178,22,244,250,
+    3,143,9,20,95,96,81,195,226,73,59,241,183,189,151,123,
+    176,90,102,14,85,152,67,10,115,8,42,53,134,116,15,2,
+    241,80,205,75,66,157,251,193,225,189,224,112,37,56,162,4,
+    71,118,29,123,193,100,57,152,172,14,28,220,158,191,123,97,
+    27,254,125,58,48,172,87,63,199,53,204,25,218,66,44,59,
+    128,115,97,200,46,91,250,236,58,98,221,9,28,238,11,167,
+    241,230,132,55,67,159,173,90,206,185,30,186,237,250,9,144,
+    134,126,203,97,19,114,203,162,211,80,55,96,30,122,62,128,
+    113,62,114,90,240,13,221,150,59,158,193,171,161,177,242,129,
+    103,64,25,123,74,238,125,6,84,196,128,26,124,58,212,53,
+    3,42,19,107,213,122,205,104,189,214,214,18,171,93,175,113,
+    56,102,135,9,179,19,39,45,126,141,214,5,224,58,191,28,
+    238,182,99,203,177,211,245,28,112,206,85,228,194,144,29,231,
+    184,237,2,110,187,141,57,24,14,122,158,124,55,123,219,45,
+    31,53,41,129,53,115,239,88,228,249,180,49,236,43,123,27,
+    236,204,53,99,188,157,190,86,248,242,73,203,40,238,107,3,
+    70,221,243,208,107,167,214,100,21,157,91,158,205,3,56,175,
+    45,39,231,171,91,59,55,231,188,237,114,144,162,227,238,242,
+    150,75,236,5,201,88,214,215,50,146,133,175,70,186,197,168,
+    60,103,66,114,140,189,255,135,14,42,197,33,163,31,173,167,
+    127,241,220,210,166,123,54,117,248,50,38,29,55,180,236,38,
+    233,84,61,57,154,250,68,234,45,25,142,38,60,216,1,30,
+    18,50,48,183,36,108,242,34,114,190,57,173,229,37,44,182,
+    176,114,169,196,46,11,171,52,60,209,173,172,22,205,8,121,
+    65,22,32,13,26,22,113,79,170,204,205,122,34,162,6,50,
+    87,179,55,248,204,154,148,19,212,216,85,97,21,28,189,156,
+    225,243,25,65,202,188,120,68,76,160,108,112,86,34,42,158,
+    120,4,113,3,104,180,53,142,196,78,74,76,174,167,121,34,
+    106,130,234,191,81,204,73,52,97,19,49,179,81,61,66,105,
+    121,93,18,113,127,169,109,203,89,46,11,41,39,248,5,9,
+    108,43,7,38,223,181,38,148,84,31,167,101,175,192,14,87,
+    200,102,168,231,87,219,50,18,248,233,181,140,80,202,112,252,
+    13,33,135,214,30,141,127,221,211,51,88,199,105,131,15,224,
+    11,25,17,51,97,9,179,188,108,254,134,192,223,84,67,25,
+    218,204,175,98,136,161,186,128,67,241,44,242,224,205,174,97,
+    196,35,162,145,17,207,96,75,76,50,168,106,100,212,192,229,
+    108,126,157,127,69,20,33,178,8,101,214,114,130,206,65,210,
+    43,158,32,117,199,162,50,56,0,229,192,39,173,231,48,16,
+    81,253,6,43,106,24,123,192,41,212,57,243,18,221,215,136,
+    167,16,57,84,159,29,245,39,155,157,166,31,177,54,3,160,
+    244,59,208,161,59,228,9,67,122,14,254,58,244,32,4,166,
+    62,92,11,144,94,22,42,81,48,254,67,163,219,110,133,233,
+    127,18,33,131,83,31,159,43,15,156,172,12,156,84,6,78,
+    98,99,239,163,196,120,181,189,235,157,212,199,113,101,118,190,
+    230,114,246,130,71,129,226,11,44,16,253,73,128,244,12,253,
+    58,240,0,95,194,143,122,134,127,221,251,160,23,253,212,19,
+    47,233,234,251,197,91,239,188,5,47,129,71,99,169,127,216,
+    120,127,3,171,10,51,82,237,31,122,144,86,250,143,43,253,
+    167,181,150,4,248,157,222,65,202,76,136,248,195,251,204,192,
+    30,51,80,97,88,133,97,203,12,11,156,182,119,189,59,248,
+    203,193,74,219,176,210,54,188,237,5,239,246,238,75,191,124,
+    169,210,49,162,116,140,108,51,48,129,222,126,68,174,182,31,
+    216,246,85,123,250,31,244,43,61,95,171,17,191,191,139,22,
+    219,231,31,245,13,238,48,187,201,127,78,253,62,85,153,56,
+    161,76,156,168,244,157,84,250,78,110,47,128,195,188,123,97,
+    63,52,188,23,26,126,20,235,217,241,191,31,253,184,80,142,
+    205,87,98,243,74,108,254,177,203,25,142,192,60,195,145,26,
+    45,24,18,238,188,31,174,132,70,183,191,89,141,30,184,63,
+    251,147,219,219,183,171,137,129,123,190,106,172,243,158,167,230,
+    33,177,126,128,9,117,212,136,203,191,232,168,134,218,247,67,
+    7,247,66,7,119,230,223,191,80,9,29,81,66,71,202,244,
+    249,115,123,95,185,255,141,74,251,130,210,190,80,14,45,0,
+    74,255,32,74,186,167,76,31,241,52,105,240,169,184,234,212,
+    167,254,23,245,169,96,63,44,182,164,117,60,9,48,70,187,
+    25,27,114,14,187,85,19,187,90,195,93,115,91,232,123,204,
+    250,142,151,180,248,53,196,174,190,47,135,17,127,102,29,119,
+    135,105,133,1,16,126,179,190,19,104,5,211,232,51,119,130,
+    95,14,181,19,250,114,24,136,130,65,22,31,25,242,112,216,
+    228,185,19,38,45,126,95,157,223,135,46,251,106,56,192,222,
+    95,34,114,191,9,207,185,33,94,105,140,119,162,102,221,28,
+    241,154,53,70,48,32,50,214,200,192,136,7,118,44,113,206,
+    211,120,179,81,49,226,5,121,146,88,33,12,138,242,148,133,
+    142,109,78,156,119,157,136,75,246,57,89,253,223,67,95,83,
+    60,214,109,214,45,60,155,9,252,179,120,54,112,109,51,55,
+    165,148,104,9,27,183,180,126,185,86,26,60,93,235,181,180,
+    26,210,106,92,211,175,166,57,141,241,0,106,68,210,159,117,
+    232,167,11,218,41,0,100,255,5,30,114,12,142,93,17,68,
+    73,102,193,218,67,186,191,70,51,111,51,223,198,179,133,117,
+    137,151,216,43,87,116,127,118,229,138,217,111,208,91,40,1,
+    9,200,173,17,187,84,156,206,93,21,214,180,35,128,149,21,
+    237,165,238,182,104,22,77,29,11,187,188,65,161,117,178,6,
+    41,115,240,11,197,156,217,143,199,21,20,113,138,189,201,179,
+    185,82,177,200,231,100,74,225,252,204,5,131,188,92,194,38,
+    131,22,118,129,207,55,249,132,156,125,109,61,131,158,31,130,
+    24,191,233,226,169,187,164,213,15,29,98,22,196,166,186,143,
+    30,46,226,105,173,135,227,243,217,141,165,164,83,228,177,217,
+    171,57,209,197,100,159,248,53,120,23,47,97,163,239,106,86,
+    202,202,50,196,16,171,66,78,188,130,77,33,168,101,244,177,
+    212,14,12,17,26,15,4,124,16,218,136,235,203,27,106,4,
+    112,161,239,66,241,44,72,234,252,5,241,53,162,167,151,6,
+    131,226,69,163,205,224,84,101,52,60,192,64,157,80,25,136,
+    111,180,243,243,8,14,44,9,28,95,7,12,107,241,65,253,
+    157,230,161,106,155,78,203,104,87,195,54,52,53,32,72,120,
+    172,148,133,85,16,135,113,174,111,34,30,10,173,62,12,37,
+    97,199,137,216,40,74,244,52,4,22,0,132,138,209,138,132,
+    90,169,133,29,226,5,40,54,19,141,209,134,25,98,253,7,
+    194,255,137,134,28,181,110,2,254,56,130,177,193,19,244,141,
+    247,142,188,115,26,156,246,206,181,74,112,86,9,206,214,136,
+    195,127,178,202,142,188,31,86,216,89,133,61,177,61,175,132,
+    250,33,6,8,197,246,131,7,247,130,7,43,193,81,37,56,
+    186,31,156,222,11,78,87,130,51,74,112,166,6,251,97,230,
+    83,112,219,11,251,161,241,189,208,120,53,22,127,39,0,94,
+    120,63,49,181,151,152,170,36,82,74,34,5,175,191,157,249,
+    205,76,37,49,169,36,38,247,19,199,247,18,199,43,137,147,
+    74,226,100,205,71,194,201,199,196,141,110,221,141,110,29,139,
+    0,9,183,33,53,12,2,118,142,188,127,226,147,248,254,241,
+    215,247,142,191,94,57,190,160,28,7,15,61,92,9,45,42,
+    161,197,178,254,60,233,34,253,7,119,187,202,125,135,43,125,
+    135,149,190,195,144,12,47,84,39,82,15,39,148,137,179,88,
+    87,66,99,159,198,226,74,108,100,63,246,226,94,236,197,74,
+    236,152,18,59,86,115,209,81,160,15,196,16,75,220,31,1,
+    54,255,213,87,137,30,83,162,199,62,153,47,71,95,134,7,
+    122,134,199,119,87,62,89,250,83,166,60,180,80,25,90,80,
+    134,22,238,185,223,137,124,26,239,86,226,227,251,241,19,123,
+    241,19,149,248,41,37,126,10,168,181,117,190,19,81,98,83,
+    16,56,29,62,242,112,83,153,249,38,66,98,67,168,62,157,
+    186,112,128,15,37,54,185,187,244,240,187,141,225,140,183,97,
+    222,149,80,74,9,165,202,250,211,28,135,184,234,255,125,254,
+    27,210,24,135,88,162,8,139,45,111,217,111,120,213,21,231,
+    42,228,253,59,70,172,97,253,53,248,108,207,151,195,96,152,
+    139,217,232,37,242,161,99,17,34,108,109,115,47,151,74,50,
+    168,177,234,209,194,105,55,221,67,184,31,197,34,20,96,24,
+    78,208,125,145,205,231,53,165,151,144,251,122,116,77,65,54,
+    187,12,53,183,109,96,15,76,72,58,79,168,138,123,73,164,
+    253,238,119,149,240,176,18,30,223,29,121,56,173,76,188,164,
+    76,204,151,67,175,64,180,220,25,0,93,253,249,133,159,64,
+    4,216,15,170,189,31,154,220,11,77,86,66,211,74,104,250,
+    177,199,217,153,218,246,67,252,23,131,184,175,187,89,222,14,
+    93,222,94,42,111,188,222,251,208,185,184,244,33,17,105,76,
+    111,110,72,53,0,70,12,247,31,108,215,205,14,131,97,179,
+    49,12,176,159,251,40,183,159,70,59,182,229,103,140,21,35,
+    141,107,123,137,136,91,40,44,7,53,110,205,99,163,92,154,
+    198,54,27,219,80,82,1,125,236,187,155,45,67,92,183,62,
+    252,55,72,227,177,145,213,129,202,22,101,105,8,101,157,40,
+    30,206,9,238,210,5,9,113,210,37,174,19,253,216,110,184,
+    21,219,81,148,78,174,116,149,23,249,34,178,186,217,109,147,
+    155,165,167,19,39,48,74,39,240,36,70,66,93,247,56,165,
+    107,226,15,175,86,130,71,148,224,17,52,96,61,213,142,238,
+    123,71,65,13,98,241,103,138,54,209,36,90,115,102,186,144,
+    157,154,144,111,181,98,185,223,102,246,45,28,82,149,220,60,
+    212,164,169,45,225,14,226,116,194,230,122,40,209,241,50,51,
+    254,92,218,39,254,16,217,250,155,86,188,133,81,104,134,203,
+    179,236,26,91,251,24,96,136,127,139,248,77,195,57,245,225,
+    254,186,73,74,59,86,56,115,253,137,45,165,136,108,89,76,
+    207,29,31,61,40,177,154,34,163,174,75,218,165,41,199,117,
+    44,22,91,76,73,44,144,166,237,111,76,100,18,133,120,132,
+    10,17,252,71,40,166,4,7,247,131,99,123,193,177,74,48,
+    169,4,147,96,96,253,163,85,144,238,15,202,209,67,213,225,
+    17,176,205,81,170,31,208,192,12,208,201,139,63,64,9,24,
+    92,89,37,16,215,36,224,176,94,29,112,230,54,84,131,218,
+    93,18,229,164,110,194,40,53,171,241,82,59,234,97,86,198,
+    2,188,217,103,204,166,69,239,215,113,78,49,77,49,122,105,
+    70,218,93,166,79,243,98,121,116,86,47,214,239,57,158,126,
+    206,251,60,139,231,176,45,144,245,244,247,249,252,131,245,132,
+    55,227,181,180,26,185,232,211,162,249,231,166,111,70,232,77,
+    153,97,235,92,239,249,40,55,197,251,198,50,7,69,60,2,
+    85,99,153,53,17,15,128,48,150,147,133,172,204,139,223,198,
+    230,160,229,56,73,109,203,80,221,148,151,51,43,66,158,47,
+    102,11,188,56,143,64,33,91,19,117,136,81,26,170,157,1,
+    175,248,70,41,139,39,103,193,12,186,200,124,253,101,149,47,
+    66,132,43,243,243,242,242,135,117,197,194,35,82,77,177,238,
+    104,219,226,239,160,216,236,49,131,191,6,254,78,162,22,221,
+    39,244,234,194,184,170,96,247,24,182,194,12,43,204,112,153,
+    25,134,141,208,199,42,189,83,84,195,224,229,208,196,254,232,
+    201,189,209,147,149,209,211,202,40,30,8,133,1,14,118,149,
+    63,124,55,188,207,140,238,49,163,213,80,236,222,200,126,251,
+    248,94,251,120,165,125,66,105,159,216,157,87,166,78,65,60,
+    131,23,27,78,188,216,192,66,59,57,194,91,145,251,241,253,
+    158,153,189,158,153,74,207,172,210,51,91,97,94,80,152,23,
+    202,250,243,12,231,115,133,80,231,99,233,178,228,110,214,173,
+    106,252,100,203,137,136,121,106,98,106,99,227,137,11,184,39,
+    231,102,245,77,122,117,40,209,12,232,202,21,88,37,200,203,
+    112,157,216,124,41,71,111,51,235,23,156,248,75,165,216,98,
+    73,230,79,156,48,155,204,36,48,187,193,46,243,117,50,25,
+    254,214,26,236,104,158,203,52,82,99,111,94,229,139,172,190,
+    182,28,100,134,54,82,20,22,73,193,56,44,127,75,128,108,
+    48,139,217,25,12,96,167,64,155,86,214,139,244,170,26,115,
+    186,28,196,77,250,141,42,254,54,3,154,74,166,96,74,73,
+    175,234,44,73,16,113,101,229,171,170,251,90,73,40,170,206,
+    194,81,213,87,90,163,215,181,170,183,180,46,115,130,216,100,
+    117,127,69,236,185,69,163,106,163,197,145,240,92,29,188,113,
+    59,137,181,223,189,249,243,173,159,108,189,119,230,193,107,74,
+    223,244,238,86,37,122,74,137,158,42,51,167,232,50,171,1,
+    115,159,216,108,173,113,164,246,143,228,249,188,205,150,163,233,
+    10,192,98,178,90,95,216,162,5,183,30,165,61,79,24,251,
+    208,209,104,96,180,152,102,243,147,57,154,48,242,154,214,92,
+    60,123,158,157,167,211,170,167,205,218,205,56,44,109,62,111,
+    36,212,55,5,120,1,253,128,52,150,231,0,206,88,167,43,
+    87,240,138,51,101,202,6,52,38,11,249,61,11,123,121,218,
+    220,203,184,202,212,94,88,212,241,196,90,86,204,22,88,19,
+    245,4,253,42,193,206,15,12,104,42,133,136,223,41,97,68,
+    142,134,75,188,76,244,196,59,170,101,192,23,115,130,134,168,
+    5,62,232,116,117,159,134,107,99,243,105,81,204,200,45,39,
+    233,150,152,173,161,231,59,168,37,223,161,90,66,237,130,194,
+    244,104,86,104,39,81,97,166,20,102,170,204,76,65,224,109,
+    53,49,93,247,221,15,2,187,220,126,234,229,189,212,203,149,
+    212,25,37,117,6,210,44,255,161,199,196,110,102,140,226,185,
+    66,166,164,115,113,147,153,1,166,102,110,112,217,214,161,83,
+    148,170,184,32,93,111,158,85,67,143,128,179,210,195,248,158,
+    237,205,186,142,83,8,1,63,164,179,233,184,113,21,251,41,
+    105,140,169,101,139,190,114,120,133,215,210,184,53,29,138,218,
+    143,246,240,50,182,241,240,238,75,29,183,237,19,4,251,133,
+    173,129,219,120,232,249,208,107,127,111,229,52,147,190,197,37,
+    60,22,18,249,44,151,41,21,243,27,106,128,74,132,218,141,
+    115,244,58,236,170,144,231,196,223,19,26,66,121,104,39,126,
+    248,119,67,40,37,125,34,94,155,138,120,178,167,70,80,230,
+    104,247,32,35,68,211,229,213,36,43,254,19,66,96,116,36,
+    226,193,161,174,162,187,164,65,69,219,169,34,210,21,145,75,
+    245,11,152,94,187,150,218,58,11,184,164,232,113,192,91,118,
+    13,63,106,31,168,38,6,118,79,236,79,206,239,77,206,87,
+    38,207,41,147,231,32,137,236,136,128,18,118,96,238,222,129,
+    105,251,129,190,154,223,115,32,240,152,64,241,5,22,224,51,
+    131,181,8,117,127,125,123,76,223,123,223,254,195,201,79,150,
+    254,244,157,242,228,249,202,228,121,101,242,124,185,255,181,74,
+    255,107,10,148,204,235,10,243,122,89,127,158,83,131,55,127,
+    106,57,123,228,89,125,54,99,120,10,73,239,13,115,217,34,
+    139,50,71,99,163,29,16,102,87,32,82,105,62,255,75,177,
+    223,162,16,6,61,234,82,0,94,40,234,94,204,114,115,133,
+    126,172,238,109,76,115,178,216,122,19,197,235,136,214,27,56,
+    105,179,191,241,140,202,214,125,11,101,239,39,134,145,216,118,
+    55,11,196,175,11,100,185,46,16,206,201,185,56,55,126,2,
+    204,249,64,201,91,233,248,255,34,2,254,123,242,158,115,213,
+    7,194,102,22,55,163,16,155,75,165,60,127,90,150,55,230,
+    22,230,14,111,134,242,107,215,78,207,30,63,126,236,216,145,
+    99,135,213,64,177,4,236,67,38,178,38,109,182,137,16,188,
+    157,254,62,150,153,27,120,219,120,123,179,199,98,47,78,127,
+    223,242,114,91,117,138,55,55,221,32,129,211,160,189,244,12,
+    228,175,90,73,242,0,53,58,218,85,106,230,58,253,234,52,
+    147,21,87,165,77,214,110,150,154,33,238,160,60,231,52,121,
+    50,36,60,80,13,37,170,161,238,106,104,176,26,26,195,47,
+    83,66,179,247,142,152,247,118,251,29,211,123,29,211,149,142,
+    25,165,99,166,28,154,133,167,22,101,98,96,90,153,86,166,
+    213,72,142,182,201,255,77,198,241,12,252,231,48,134,14,125,
+    107,252,17,20,90,255,64,184,33,64,2,143,42,200,102,152,
+    132,58,126,229,74,225,104,202,18,44,95,185,146,162,145,156,
+    161,221,5,62,11,113,33,30,146,195,150,2,64,94,132,96,
+    140,5,183,159,187,142,142,149,47,74,235,162,17,240,233,57,
+    28,12,91,92,149,44,187,197,32,7,201,55,236,73,8,221,
+    196,117,235,22,130,220,151,38,23,157,13,36,50,116,32,53,
+    146,131,141,43,243,103,207,106,159,100,139,120,220,103,75,1,
+    254,29,138,205,3,102,46,105,3,255,25,106,193,215,9,77,
+    0,158,192,182,138,104,41,0,58,217,10,51,166,48,99,101,
+    102,236,145,158,24,216,238,121,181,135,174,61,104,232,97,130,
+    97,195,12,126,206,133,113,95,38,163,6,50,153,66,137,91,
+    207,99,61,148,201,124,111,61,155,175,247,248,50,25,174,148,
+    203,100,68,84,17,53,12,112,60,196,22,218,7,90,34,94,
+    54,137,152,255,169,46,73,22,197,17,124,61,136,5,126,71,
+    33,226,199,43,34,102,112,244,91,44,17,191,1,209,190,27,
+    195,115,8,122,210,45,98,216,38,162,65,212,174,251,241,106,
+    137,158,13,170,110,200,157,242,226,219,248,142,247,63,226,143,
+    176,248,49,22,63,197,226,103,88,160,23,164,81,141,248,11,
+    82,207,158,104,140,171,249,18,234,85,198,176,248,29,22,120,
+    79,38,254,11,22,127,196,226,223,176,232,208,37,142,243,162,
+    115,202,241,249,124,38,147,116,104,185,25,234,241,203,218,186,
+    36,245,226,85,236,112,187,233,26,232,255,106,206,160,135,169,
+    17,44,18,164,179,239,206,66,45,70,198,95,118,148,199,94,
+    170,140,205,41,99,115,213,129,153,242,192,76,101,96,86,25,
+    128,157,56,228,57,88,35,80,124,218,222,89,243,224,139,151,
+    196,71,107,62,172,49,164,109,180,230,199,90,128,36,14,215,
+    130,88,11,145,142,209,90,24,107,17,210,222,167,161,199,72,
+    32,82,107,211,9,181,44,206,57,136,55,122,231,219,219,183,
+    43,158,126,197,211,95,115,158,115,120,6,107,196,44,31,187,
+    136,119,192,236,185,232,124,217,225,153,169,145,166,114,222,217,
+    64,200,227,233,185,127,107,215,179,43,124,18,223,45,41,227,
+    223,80,6,95,170,17,104,52,11,147,52,182,68,26,240,29,
+    158,248,253,249,26,129,63,102,97,98,96,139,183,9,35,113,
+    255,28,194,37,204,194,138,145,104,194,8,122,226,59,113,92,
+    17,75,97,98,96,75,162,105,140,228,174,140,148,147,102,97,
+    29,35,217,130,171,248,125,249,43,205,195,239,25,188,47,239,
+    204,63,216,172,17,63,46,131,94,152,88,216,210,213,52,14,
+    187,235,70,234,236,199,116,16,214,44,172,195,177,77,195,181,
+    123,190,86,35,182,194,132,199,150,113,191,231,244,14,126,204,
+    225,57,221,88,116,133,60,129,93,16,2,252,249,196,77,255,
+    52,22,125,116,176,114,116,168,226,25,86,60,195,218,50,232,
+    11,115,208,104,241,54,130,49,158,55,28,229,105,24,6,43,
+    214,210,196,163,109,241,38,173,11,163,110,105,133,85,193,194,
+    117,5,179,140,17,0,230,227,187,185,135,160,141,1,228,87,
+    47,204,33,176,165,91,27,97,163,226,233,81,64,77,157,94,
+    207,80,141,216,10,132,79,60,165,143,22,218,113,35,154,133,
+    228,11,226,3,106,7,179,203,57,205,84,122,229,141,53,176,
+    252,154,149,50,237,28,126,122,170,6,192,87,149,168,73,151,
+    52,195,135,54,148,126,250,165,217,75,140,228,233,23,89,244,
+    10,83,11,161,163,134,101,163,86,178,221,48,96,244,211,175,
+    78,195,224,82,155,140,129,52,253,220,139,126,34,166,186,5,
+    41,43,105,95,234,182,139,245,255,255,70,74,233,53,106,27,
+    213,200,186,44,228,165,148,238,113,169,185,214,27,245,255,53,
+    135,126,241,171,38,233,149,173,126,99,43,0,165,108,253,127,
+    169,105,188,204,165,126,64,29,106,130,167,182,86,200,165,138,
+    37,13,131,222,35,168,253,90,8,105,82,171,135,148,218,65,
+    42,117,44,106,191,241,73,185,101,84,163,141,122,32,53,98,
+    116,208,88,151,250,28,53,94,143,166,104,216,166,127,94,167,
+    249,7,106,219,105,232,75,151,19,237,253,95,152,83,154,63,
+    252,134,88,38,90,236,46,29,1,63,93,115,57,28,142,218,
+    139,196,17,184,227,199,127,85,114,160,108,127,106,78,183,195,
+    89,35,95,165,8,25,228,106,206,78,108,252,255,89,164,136,
+    163,187,65,88,85,242,66,217,254,84,201,88,217,254,84,201,
+    161,178,253,169,146,197,178,253,169,146,175,151,237,79,149,188,
+    92,182,63,85,114,186,108,127,170,36,89,182,63,85,114,164,
+    108,127,106,222,5,143,3,54,123,235,114,123,227,254,116,57,
+    121,242,49,125,249,226,41,64,84,171,254,7,41,142,34,109,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/boards/arm_board.py",
+    "gem5.components.boards.arm_board",
+    embedded_module_data,
+    6416,
+    14717);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,32 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,123,204,128,4,24,161,244,103,54,32,49,157,33,133,
+    33,152,65,147,209,111,37,67,17,19,72,16,36,243,203,170,
+    184,40,89,191,160,178,36,35,63,79,63,61,53,215,84,63,
+    57,63,183,32,63,47,53,175,164,88,63,41,63,177,40,165,
+    88,63,181,162,32,181,40,51,23,40,148,152,163,31,31,159,
+    153,151,89,18,31,175,87,80,249,139,195,38,55,63,165,52,
+    39,213,174,136,21,106,89,49,63,144,248,192,204,200,200,248,
+    129,1,70,20,49,3,197,0,163,50,37,189,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/boards/experimental/__init__.py",
+    "gem5.components.boards.experimental",
+    embedded_module_data,
+    124,
+    151);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,612 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,237,125,109,108,27,87,182,216,240,83,151,228,136,18,
+    69,82,34,37,81,34,245,105,202,150,100,197,177,108,203,150,
+    109,89,31,182,18,91,246,198,222,221,132,221,44,67,113,70,
+    54,109,82,84,102,70,142,197,165,30,130,34,197,83,182,6,
+    54,73,253,16,237,174,211,71,44,188,187,218,174,91,8,232,
+    251,161,62,180,15,1,218,254,159,33,110,158,136,1,12,184,
+    40,130,34,64,209,210,216,4,120,221,22,109,239,189,67,14,
+    135,95,250,200,122,139,45,222,83,38,135,119,206,61,247,220,
+    115,207,61,231,220,59,119,230,94,255,103,74,243,103,46,252,
+    254,206,175,163,168,79,41,134,98,116,113,42,132,127,245,113,
+    93,66,31,210,235,20,156,33,100,64,191,134,184,49,97,10,
+    153,18,230,144,57,209,16,106,72,128,16,72,88,66,150,132,
+    53,100,77,216,66,182,4,29,162,19,141,161,198,132,61,100,
+    79,52,133,154,18,205,161,230,132,35,228,72,180,132,90,18,
+    206,144,51,225,10,185,18,238,144,59,209,26,106,77,180,133,
+    218,18,158,144,39,225,13,121,19,237,161,118,82,143,49,222,
+    145,232,12,117,38,124,33,95,162,43,212,149,232,14,117,39,
+    252,33,127,34,16,10,160,124,19,99,142,247,36,122,67,189,
+    36,221,16,239,75,244,135,250,73,26,196,7,18,131,161,65,
+    148,182,48,214,248,145,68,48,20,36,105,91,124,40,113,52,
+    116,148,164,233,248,177,196,112,104,24,165,27,25,123,124,36,
+    49,26,26,37,233,166,248,241,196,88,104,76,71,233,169,203,
+    20,211,252,1,197,56,216,81,118,236,87,70,138,250,173,177,
+    168,166,208,43,140,238,38,21,108,249,10,223,44,4,117,178,
+    241,106,140,23,130,173,178,101,138,97,184,55,34,203,183,89,
+    217,124,137,139,49,232,215,52,29,143,45,11,50,61,157,124,
+    111,38,198,223,155,79,68,16,210,50,199,177,239,174,178,203,
+    209,53,217,60,127,253,205,75,17,78,6,87,87,87,98,201,
+    75,87,95,47,164,230,111,204,23,82,55,230,167,11,169,55,
+    22,46,23,83,183,138,184,155,111,221,44,164,110,93,123,163,
+    152,186,245,22,18,105,117,229,123,178,241,70,60,22,149,173,
+    55,174,77,77,223,97,163,247,88,14,97,146,28,18,231,141,
+    136,70,28,235,27,49,62,122,255,106,108,121,245,129,12,72,
+    154,240,191,197,114,137,216,114,36,30,52,203,134,57,70,144,
+    27,16,88,72,50,172,108,67,137,27,92,114,133,229,132,53,
+    185,69,115,115,83,224,98,203,183,121,185,89,131,251,126,146,
+    99,120,25,32,204,77,33,34,176,95,97,45,34,149,25,230,
+    111,78,161,159,230,169,69,94,224,34,81,225,13,150,79,174,
+    114,81,22,225,44,201,251,44,135,180,199,242,95,25,20,226,
+    214,34,213,116,36,122,135,189,18,99,185,8,23,189,179,134,
+    114,92,197,156,107,108,34,201,173,221,92,227,5,54,129,240,
+    142,34,30,137,17,101,121,62,201,125,165,87,120,57,139,57,
+    10,237,165,100,132,99,16,186,229,117,150,91,102,227,88,41,
+    72,226,123,241,100,132,137,106,93,195,170,186,6,226,243,231,
+    200,57,88,42,164,99,168,144,158,209,33,103,208,179,70,198,
+    192,154,24,35,107,102,76,108,3,99,102,26,150,172,27,212,
+    146,142,1,31,208,33,160,167,88,11,107,253,21,114,170,223,
+    234,138,12,25,47,99,249,192,248,43,148,250,173,90,73,200,
+    134,176,214,15,140,33,26,253,218,208,111,99,205,146,102,214,
+    190,164,103,232,170,210,77,117,168,155,89,135,87,165,66,37,
+    27,171,74,182,236,81,143,189,138,218,89,135,218,133,168,155,
+    170,168,221,5,62,205,168,61,173,40,237,64,105,7,74,183,
+    213,228,210,242,1,85,81,222,195,56,145,118,177,70,141,140,
+    11,149,243,146,114,237,85,181,27,17,95,119,85,237,29,117,
+    168,155,89,99,153,78,90,171,74,118,214,44,217,198,250,10,
+    178,120,170,74,116,109,80,15,116,161,110,20,26,218,101,11,
+    242,191,251,196,184,82,255,221,234,71,127,83,254,69,124,231,
+    143,70,86,34,139,113,214,159,92,242,47,173,198,227,126,158,
+    152,161,159,143,37,86,227,17,33,150,92,246,47,37,57,255,
+    27,243,55,167,135,191,55,66,74,222,186,19,227,11,133,87,
+    121,150,247,71,252,60,43,224,242,168,138,249,235,126,150,89,
+    141,146,130,195,75,92,140,93,102,226,107,126,134,189,31,67,
+    86,95,85,60,194,243,171,9,196,65,184,19,17,252,107,201,
+    85,255,123,49,36,193,34,139,178,147,2,242,92,63,137,1,
+    35,86,82,110,104,232,106,44,17,19,8,107,126,104,72,193,
+    249,175,47,35,254,239,33,15,225,81,97,225,142,63,26,71,
+    76,99,81,212,44,228,153,60,33,146,65,52,126,47,188,132,
+    66,156,108,89,41,186,159,108,78,16,15,149,155,8,101,248,
+    78,209,137,101,51,199,10,171,220,242,66,212,68,149,254,240,
+    72,132,157,255,119,35,72,245,127,161,251,148,74,27,51,84,
+    173,191,242,46,224,154,4,67,41,143,209,149,119,222,63,214,
+    165,245,25,253,254,92,4,115,41,231,174,26,245,239,17,206,
+    220,144,96,211,212,160,63,24,199,187,42,199,159,163,113,243,
+    51,67,165,92,66,83,189,146,25,80,139,123,26,181,36,109,
+    72,27,203,199,37,60,106,34,227,51,46,164,6,72,20,39,
+    230,231,71,189,191,156,20,252,209,100,98,5,245,37,54,61,
+    210,113,111,172,46,174,165,110,220,186,195,250,85,75,245,227,
+    81,41,198,17,19,83,59,14,217,28,182,12,1,17,98,163,
+    252,158,31,5,238,17,255,244,42,199,177,203,130,134,12,161,
+    39,252,131,41,253,224,72,208,34,55,196,248,48,135,42,144,
+    27,174,223,156,229,56,212,253,13,183,89,33,28,227,35,92,
+    0,9,42,155,8,43,217,50,251,32,202,174,96,3,147,141,
+    203,145,4,26,45,249,85,52,104,200,32,28,142,45,199,132,
+    112,24,13,61,70,158,141,47,113,195,88,245,35,24,140,98,
+    112,28,51,177,132,195,196,250,194,97,30,171,23,155,158,255,
+    253,223,159,227,185,232,232,202,154,112,39,185,60,122,155,77,
+    156,28,197,13,79,46,35,97,249,81,226,5,252,40,251,0,
+    85,18,75,32,84,36,62,26,71,173,15,147,140,145,149,53,
+    110,2,49,74,181,168,26,25,41,10,114,11,225,249,12,2,
+    127,247,62,149,183,83,116,199,174,173,39,107,235,145,108,125,
+    208,214,151,167,116,150,25,221,179,22,175,216,126,73,106,153,
+    134,45,211,34,61,253,220,230,218,181,117,102,109,157,146,173,
+    11,218,186,126,217,251,36,152,181,29,21,109,71,159,181,116,
+    228,245,122,199,248,115,111,207,174,119,40,235,29,146,188,199,
+    32,190,198,242,38,132,206,83,69,240,194,96,116,218,191,166,
+    16,200,83,198,70,251,55,52,101,177,127,216,240,176,97,23,
+    120,178,192,179,233,201,156,217,90,218,78,74,96,14,130,57,
+    177,120,253,14,27,66,84,167,177,149,6,170,224,74,119,204,
+    120,82,39,104,242,202,77,45,77,133,75,113,78,199,232,25,
+    3,99,196,211,44,166,225,177,25,229,169,102,206,0,148,139,
+    166,86,143,13,8,171,186,155,96,41,241,101,108,79,233,114,
+    19,71,148,170,123,11,141,26,202,198,26,148,13,42,165,67,
+    67,105,79,83,119,75,50,52,149,162,55,194,171,117,103,172,
+    84,141,191,242,118,62,109,254,21,146,250,183,170,228,168,70,
+    213,165,133,18,91,52,245,43,171,177,229,165,214,168,234,64,
+    240,149,74,33,190,141,154,180,74,207,56,75,117,63,117,253,
+    10,201,244,91,125,137,46,172,6,15,33,160,145,222,141,56,
+    52,149,168,52,220,90,53,220,218,170,36,83,117,46,244,107,
+    184,121,234,114,243,238,201,205,169,114,11,106,184,181,215,232,
+    117,183,74,57,172,161,236,168,65,217,166,82,142,105,40,59,
+    203,122,203,247,82,123,75,101,38,156,212,212,216,85,87,39,
+    206,61,117,210,161,114,59,83,79,6,68,229,43,165,107,115,
+    174,215,167,245,122,231,182,97,29,205,71,81,174,234,95,225,
+    46,149,174,28,223,173,74,56,85,146,48,93,49,156,50,186,
+    20,85,110,179,37,126,135,213,121,25,151,128,6,123,88,46,
+    106,115,255,32,46,106,172,42,113,17,102,75,244,194,229,82,
+    154,233,46,215,202,83,127,149,189,246,105,56,171,233,187,253,
+    26,108,169,62,21,43,92,171,47,95,120,176,86,89,109,15,
+    162,180,77,147,214,70,21,85,67,183,77,136,211,17,77,142,
+    67,147,238,208,164,219,52,105,167,38,173,122,44,225,164,250,
+    55,153,132,4,22,190,194,42,224,112,123,191,194,34,126,133,
+    101,251,10,119,196,87,88,50,52,178,219,231,23,110,133,111,
+    94,159,67,224,187,55,102,223,144,155,213,123,244,184,122,101,
+    126,97,86,110,194,152,91,243,215,102,223,40,144,56,74,136,
+    34,77,35,70,205,190,89,100,210,84,188,45,228,115,56,36,
+    112,184,149,65,131,108,192,79,198,6,252,144,109,64,207,210,
+    49,132,212,163,71,63,128,30,153,195,17,244,228,142,17,116,
+    140,106,166,252,220,44,41,192,45,160,31,25,160,7,248,176,
+    176,182,130,30,124,151,87,19,97,225,14,199,70,24,62,70,
+    249,17,221,60,230,254,58,38,214,203,134,21,244,172,109,91,
+    141,112,104,162,131,74,196,24,204,207,207,93,213,178,90,65,
+    115,124,52,191,79,200,230,34,201,113,68,130,187,58,70,93,
+    164,252,49,234,6,6,239,32,220,101,130,91,161,252,178,121,
+    236,248,241,107,87,82,248,201,120,169,184,110,16,28,226,218,
+    8,195,247,10,15,171,178,45,204,226,201,84,56,138,159,208,
+    65,65,2,158,195,51,35,217,20,197,139,16,28,238,59,238,
+    59,24,224,30,32,211,41,185,17,207,203,112,179,162,73,52,
+    241,147,45,113,188,128,16,142,173,196,56,26,103,23,238,81,
+    203,184,22,124,111,196,211,37,206,170,201,90,140,223,227,26,
+    53,247,220,242,109,206,174,189,23,162,92,147,230,30,61,239,
+    112,205,154,123,33,193,113,14,237,189,176,198,121,73,211,132,
+    194,250,131,108,90,14,163,73,157,108,93,70,66,46,11,236,
+    3,129,151,13,137,200,3,238,6,110,133,7,3,60,73,150,
+    13,168,42,52,243,68,13,95,137,45,115,22,210,240,88,114,
+    113,149,151,155,195,73,84,246,78,108,37,92,120,50,146,29,
+    225,228,210,82,25,42,168,231,206,42,93,20,139,226,234,120,
+    30,91,142,223,207,77,98,44,29,70,207,92,171,43,202,68,
+    49,213,170,153,32,106,240,183,17,37,111,64,177,247,125,234,
+    75,79,207,79,233,199,244,134,241,97,99,222,74,117,251,115,
+    254,64,14,193,64,79,206,215,149,235,14,228,27,27,58,173,
+    121,10,129,13,35,4,158,124,51,21,232,217,10,108,79,137,
+    158,113,116,225,82,223,152,169,214,142,204,188,232,30,145,220,
+    35,208,61,130,112,86,132,115,121,50,94,209,121,84,114,30,
+    133,206,163,8,7,16,174,189,39,231,238,206,185,189,208,221,
+    47,14,140,67,247,169,156,167,243,177,125,215,243,106,214,243,
+    170,228,25,135,158,241,124,131,177,221,250,130,66,224,107,12,
+    80,57,251,55,118,109,185,76,18,186,199,15,88,204,237,221,
+    188,245,248,135,59,174,127,235,251,124,21,158,185,38,186,22,
+    36,215,2,116,45,160,108,139,70,154,71,111,229,156,109,143,
+    38,51,110,232,28,220,187,254,131,80,110,77,136,222,113,201,
+    59,14,189,227,4,103,174,198,125,233,13,104,244,112,10,186,
+    79,31,82,15,251,201,97,165,188,129,159,90,31,91,73,167,
+    154,169,70,199,195,107,155,253,144,246,231,232,230,170,20,42,
+    239,178,110,128,124,43,213,222,129,187,233,161,61,215,213,141,
+    19,16,116,60,235,238,201,156,254,233,250,227,245,173,119,165,
+    238,227,152,53,4,157,185,254,224,147,31,238,246,79,101,251,
+    167,164,254,105,216,63,173,224,123,158,215,193,231,2,253,79,
+    186,118,3,147,217,192,164,20,184,0,3,23,176,129,64,208,
+    245,13,160,92,157,191,140,109,3,105,224,12,28,56,35,58,
+    39,36,231,4,116,78,224,186,115,190,192,227,55,161,111,88,
+    33,109,199,38,214,249,241,155,143,222,196,247,74,131,94,195,
+    45,184,130,193,66,9,228,109,230,0,177,83,31,178,83,68,
+    180,80,145,95,36,234,33,68,93,34,185,184,243,84,197,115,
+    136,161,240,255,239,254,134,44,46,163,241,67,205,154,161,222,
+    118,174,235,16,70,165,47,205,228,210,186,210,51,198,67,87,
+    25,141,250,224,91,54,130,154,53,88,117,60,68,53,12,227,
+    26,106,63,78,87,60,114,91,246,167,41,147,106,68,112,151,
+    232,24,221,83,125,213,12,64,59,22,215,150,95,165,8,211,
+    37,236,75,147,86,203,95,157,11,48,134,15,42,122,97,143,
+    82,118,181,148,17,141,238,166,212,224,116,114,121,153,141,10,
+    100,97,96,126,244,122,113,205,201,47,36,85,20,10,189,35,
+    178,113,236,248,50,143,198,46,19,195,198,35,107,101,22,129,
+    123,10,143,73,191,155,161,176,69,220,70,53,190,237,91,215,
+    105,159,80,211,186,146,190,80,90,181,138,167,84,249,83,208,
+    199,250,135,93,55,169,223,232,240,98,60,31,75,177,191,49,
+    112,88,187,197,81,23,143,59,24,171,151,245,35,199,101,3,
+    146,85,27,221,127,111,61,23,143,241,2,94,40,56,159,26,
+    173,138,237,168,112,113,65,237,92,60,25,141,196,249,243,35,
+    165,2,255,5,49,224,241,60,254,125,42,79,25,186,172,37,
+    240,188,217,249,141,129,106,108,253,40,250,40,190,229,124,218,
+    41,210,227,18,61,14,233,241,188,161,140,142,184,202,66,176,
+    137,75,96,137,239,97,137,237,9,54,129,36,102,216,240,74,
+    146,195,195,29,106,129,108,143,174,172,106,144,92,24,83,26,
+    152,68,132,139,227,148,19,143,228,149,139,107,14,140,44,99,
+    198,97,79,145,205,139,202,235,137,198,178,60,185,177,172,10,
+    217,204,225,119,25,234,208,104,46,168,65,59,48,58,170,148,
+    148,234,216,67,131,50,214,86,142,104,235,121,107,59,108,61,
+    134,215,78,78,16,176,49,151,243,250,30,183,67,239,43,27,
+    115,15,95,219,120,13,71,171,16,244,141,43,1,175,157,144,
+    31,197,148,87,116,10,36,5,118,189,99,89,239,152,228,61,
+    1,189,39,118,189,179,89,239,172,228,189,12,189,151,21,30,
+    207,90,59,51,227,98,235,144,212,58,4,91,135,16,39,91,
+    174,239,200,147,215,96,223,36,78,67,16,120,78,55,239,210,
+    125,89,186,79,162,7,32,61,176,75,159,206,210,167,37,122,
+    2,210,19,121,3,101,105,36,68,121,179,218,165,109,29,176,
+    109,56,111,66,201,23,248,254,107,12,20,86,237,34,185,170,
+    227,30,182,67,18,247,114,196,202,25,93,185,215,105,35,66,
+    170,134,23,146,168,117,128,37,198,140,97,127,26,20,5,131,
+    235,122,237,74,77,186,58,90,233,51,218,133,216,58,156,74,
+    81,246,225,16,99,192,139,142,169,192,77,86,137,6,55,174,
+    77,169,209,32,185,236,103,145,73,250,241,236,114,228,143,235,
+    252,156,128,146,220,125,12,30,32,160,181,82,238,71,8,164,
+    142,84,217,229,74,34,82,203,165,255,27,165,117,105,159,181,
+    4,246,114,105,45,29,177,2,20,139,108,171,203,196,35,241,
+    138,255,66,176,129,56,42,113,115,101,222,93,90,29,183,16,
+    231,197,83,112,206,133,179,201,114,105,34,177,42,219,144,140,
+    104,158,74,94,222,161,167,8,226,135,14,13,215,48,113,81,
+    217,128,28,151,55,144,22,23,28,211,90,106,99,202,85,171,
+    229,255,21,183,242,3,165,149,70,181,129,216,192,143,109,9,
+    112,116,86,106,155,69,134,238,195,134,238,195,134,238,179,138,
+    192,139,38,179,46,207,174,179,63,235,236,151,156,131,104,162,
+    180,235,28,203,58,199,36,231,9,232,68,110,108,176,216,9,
+    216,152,126,118,228,149,92,231,112,222,160,15,218,95,160,167,
+    44,251,215,24,108,76,255,228,245,31,191,254,225,181,135,215,
+    32,221,47,210,253,72,107,133,2,213,110,131,211,196,109,204,
+    148,226,54,200,200,244,11,115,191,65,65,158,104,129,199,4,
+    133,182,54,222,137,240,97,20,8,149,192,152,106,43,53,183,
+    44,227,239,112,177,6,210,226,231,77,174,141,213,61,230,40,
+    126,170,114,173,180,250,101,2,18,39,245,122,249,2,58,147,
+    100,149,213,246,59,145,251,172,127,6,57,2,126,221,202,143,
+    248,191,203,179,254,119,202,132,57,18,124,7,143,149,164,107,
+    145,219,196,248,17,252,114,114,33,41,204,39,86,226,44,94,
+    156,102,25,178,116,206,61,170,108,45,182,141,154,173,45,203,
+    248,95,184,152,151,180,246,75,123,32,175,215,53,158,120,97,
+    48,52,225,174,108,194,157,109,177,30,72,233,191,209,47,220,
+    226,254,25,182,219,74,57,172,184,61,248,9,112,149,215,90,
+    88,9,107,208,105,244,237,220,16,246,168,175,153,170,156,19,
+    226,209,124,33,168,35,227,97,117,213,228,109,66,85,213,37,
+    108,3,174,218,90,172,250,97,10,153,238,129,90,203,253,12,
+    87,87,179,185,77,184,97,209,228,29,22,191,248,64,213,164,
+    188,229,109,214,100,217,74,13,207,237,211,240,246,170,134,151,
+    98,30,18,231,51,10,47,45,40,74,72,215,146,202,87,54,
+    192,107,100,32,70,144,26,44,87,78,93,66,59,150,184,177,
+    40,241,195,20,108,58,34,130,35,123,12,102,59,5,185,51,
+    84,173,191,170,33,76,151,209,29,128,78,47,104,134,30,70,
+    151,214,163,193,169,44,210,223,214,105,95,57,32,174,70,170,
+    198,159,118,1,180,220,105,11,111,200,12,11,241,34,129,30,
+    175,220,152,120,33,130,102,70,171,232,62,104,82,140,171,240,
+    182,18,224,52,158,58,146,233,164,108,197,10,84,38,69,114,
+    51,175,146,41,168,66,120,38,111,168,100,160,168,58,197,150,
+    71,101,87,33,254,106,203,241,169,174,170,248,92,150,239,192,
+    157,115,147,34,198,236,112,127,218,253,73,183,228,232,129,142,
+    158,13,115,206,233,253,244,194,39,23,36,103,31,116,246,109,
+    128,103,29,125,91,19,59,87,196,142,89,169,99,22,118,204,
+    138,237,115,104,114,210,148,3,246,93,208,157,5,221,25,227,
+    147,38,9,28,135,224,184,88,188,72,23,203,230,228,170,192,
+    196,184,168,118,158,129,231,254,164,171,93,189,213,177,16,191,
+    31,122,106,40,95,217,70,221,167,125,249,106,44,87,253,186,
+    33,109,168,61,143,65,51,142,3,204,93,42,59,114,15,110,
+    53,141,98,95,110,53,103,61,140,233,182,174,138,86,243,58,
+    23,205,168,254,253,186,177,172,221,102,237,203,220,180,241,174,
+    250,12,87,177,122,222,240,115,227,103,21,115,175,117,83,218,
+    84,187,85,130,179,148,102,0,99,65,82,149,57,70,149,140,
+    245,248,104,159,84,173,72,87,182,90,84,245,165,70,37,232,
+    218,37,50,141,181,240,123,105,29,207,118,247,105,69,189,62,
+    54,85,82,62,252,15,101,125,96,171,208,171,185,204,122,245,
+    12,253,180,177,188,230,245,134,180,185,78,93,13,223,202,58,
+    235,115,251,54,214,89,135,91,89,111,218,153,166,253,172,162,
+    252,93,99,70,99,167,245,36,201,52,31,86,218,25,234,35,
+    253,219,198,31,32,25,214,193,186,165,172,87,154,211,224,231,
+    212,183,182,121,199,75,178,120,71,45,170,52,40,231,247,45,
+    235,210,74,220,194,56,95,2,23,23,227,126,9,92,90,153,
+    182,125,184,80,119,91,138,119,165,119,60,12,93,122,123,120,
+    215,85,76,173,91,81,157,181,163,165,167,70,180,212,103,220,
+    53,105,137,53,48,222,202,143,97,214,109,101,54,83,241,253,
+    213,58,93,238,201,79,59,42,242,27,15,95,95,154,174,227,
+    171,141,153,214,90,248,125,124,181,14,55,97,180,126,171,106,
+    240,168,173,223,206,3,215,166,181,122,95,218,246,109,199,139,
+    52,125,224,200,86,21,147,63,210,63,52,215,141,224,230,170,
+    216,164,237,245,174,138,62,178,87,206,62,170,226,119,83,218,
+    94,167,166,166,111,21,191,235,115,251,54,241,187,14,183,50,
+    155,232,222,199,38,236,117,108,194,95,115,134,226,41,222,173,
+    55,167,155,51,222,90,37,211,77,76,32,221,124,183,93,189,
+    111,46,189,245,45,255,176,108,221,145,118,28,40,86,245,236,
+    51,254,212,253,222,97,189,229,255,205,216,244,246,70,113,100,
+    58,116,156,112,166,91,234,216,132,179,74,255,245,40,169,187,
+    106,43,153,222,82,167,28,184,252,183,171,169,175,126,77,15,
+    63,172,219,179,218,8,210,159,110,217,39,126,56,234,88,231,
+    64,13,235,172,231,91,142,61,99,194,96,69,127,184,234,245,
+    96,218,85,65,233,78,187,14,20,37,221,251,70,201,131,240,
+    57,178,255,60,236,64,124,130,12,125,0,62,181,181,62,84,
+    67,235,245,34,177,171,70,244,80,191,227,89,111,77,183,214,
+    141,30,71,211,173,154,232,209,90,55,122,180,149,69,111,26,
+    141,218,199,42,162,119,99,186,237,0,26,25,222,191,135,254,
+    4,34,204,205,63,153,8,51,178,135,223,223,58,144,198,247,
+    247,251,182,58,22,56,122,8,191,111,171,97,129,234,23,104,
+    235,158,180,167,174,5,30,79,123,52,22,232,169,107,129,222,
+    180,247,165,140,95,251,205,61,235,212,242,45,103,146,141,117,
+    226,155,167,202,110,234,181,174,60,190,57,247,141,39,7,225,
+    51,198,208,255,224,131,7,246,193,87,246,244,193,131,232,123,
+    127,31,172,199,229,48,79,28,222,58,126,124,226,16,126,236,
+    173,225,199,254,226,221,122,123,186,189,174,31,191,154,110,215,
+    248,113,123,93,63,238,248,7,219,210,216,214,201,61,109,171,
+    227,165,216,86,61,46,135,177,173,142,58,182,53,126,8,219,
+    234,168,97,91,129,226,221,122,103,186,179,174,109,157,74,119,
+    106,108,171,179,174,109,249,246,141,238,190,151,26,221,235,205,
+    94,59,171,172,166,78,189,135,141,238,255,224,59,26,223,57,
+    189,167,239,28,68,227,251,251,78,61,46,135,241,29,95,29,
+    223,57,115,8,223,241,213,240,157,158,226,221,122,87,186,171,
+    174,239,76,164,187,52,190,211,85,215,119,186,211,221,117,228,
+    60,91,67,206,238,3,105,183,158,127,104,252,190,242,59,187,
+    82,171,238,246,22,83,183,245,251,244,82,61,173,117,215,208,
+    154,250,245,254,186,63,237,175,171,181,115,105,191,70,107,254,
+    186,90,11,164,3,117,180,54,89,67,107,129,63,154,214,74,
+    123,18,254,112,173,5,106,104,77,221,211,176,222,147,238,169,
+    171,181,243,233,30,141,214,122,234,106,173,55,221,91,71,107,
+    23,14,190,250,172,149,170,34,210,244,33,254,7,137,183,125,
+    251,206,166,235,233,168,119,207,117,142,139,21,242,244,167,251,
+    235,180,119,170,70,123,251,15,32,251,165,3,200,126,16,62,
+    211,7,88,161,56,8,159,25,70,255,173,117,217,191,167,46,
+    103,43,116,57,144,30,168,163,203,185,26,186,28,120,73,186,
+    60,8,159,105,230,242,75,225,243,135,232,114,160,134,239,14,
+    20,239,214,7,211,131,117,125,247,74,122,80,227,187,131,117,
+    125,247,72,250,72,29,253,207,31,98,60,59,82,67,78,117,
+    71,212,122,48,29,172,43,231,107,233,160,70,206,96,93,57,
+    135,210,67,117,228,124,189,134,156,67,127,180,200,172,182,234,
+    37,68,230,161,3,175,8,218,171,124,234,59,165,220,138,153,
+    227,209,244,209,76,144,170,241,151,54,84,213,119,52,51,84,
+    139,82,248,94,41,125,247,88,49,149,25,174,69,155,214,49,
+    87,247,105,255,209,204,200,75,168,229,218,222,181,48,11,55,
+    169,224,245,212,191,158,230,216,136,64,78,84,96,253,239,188,
+    195,8,139,239,188,227,143,44,51,36,205,163,244,82,44,142,
+    207,97,176,250,11,127,42,253,123,73,37,207,31,91,38,133,
+    149,15,112,38,112,65,242,233,236,72,25,175,34,10,177,212,
+    48,155,88,137,112,145,132,90,116,38,198,177,81,33,201,173,
+    225,239,10,17,114,101,85,249,30,183,32,67,177,20,217,12,
+    199,93,164,200,142,56,43,222,247,22,142,178,241,56,47,91,
+    241,231,74,133,180,5,127,8,78,146,191,215,141,166,108,241,
+    213,149,120,100,241,24,222,252,149,106,80,190,77,186,40,235,
+    30,200,54,69,50,178,59,78,249,238,201,192,177,183,101,35,
+    254,26,149,236,188,11,234,185,127,137,171,251,87,20,222,87,
+    47,196,18,236,98,132,103,135,213,125,108,49,234,63,125,99,
+    74,97,250,139,220,71,152,6,36,18,171,195,152,93,202,202,
+    225,51,12,142,241,247,95,61,45,155,121,33,34,172,242,178,
+    49,121,47,178,150,178,40,57,49,62,34,91,185,251,227,175,
+    198,18,145,37,38,42,155,8,58,101,29,193,91,192,112,1,
+    54,229,66,73,150,227,86,87,132,97,188,117,140,75,198,227,
+    44,23,212,201,77,42,94,105,100,202,174,176,68,114,12,163,
+    172,168,220,176,114,7,169,62,206,202,6,62,25,229,254,9,
+    150,12,169,7,127,153,57,188,136,154,22,194,77,109,96,144,
+    4,139,136,225,28,110,225,21,76,227,84,249,242,195,236,3,
+    129,93,102,88,38,69,23,120,227,61,120,199,83,0,43,113,
+    56,26,191,151,106,138,198,147,209,123,37,93,164,232,94,5,
+    163,136,100,91,138,61,96,153,97,130,74,41,155,227,134,133,
+    4,87,212,232,191,193,34,152,73,46,79,54,11,22,104,142,
+    33,26,217,184,18,143,69,139,26,68,66,220,231,94,195,20,
+    54,5,129,51,143,23,89,226,173,126,179,154,226,232,190,152,
+    133,119,253,205,107,178,208,125,49,107,49,94,148,233,88,41,
+    57,204,45,223,46,98,75,201,97,126,141,71,29,184,198,163,
+    30,144,193,74,242,61,150,75,46,45,165,154,20,204,112,17,
+    129,207,1,185,157,136,172,200,102,116,195,179,130,108,186,31,
+    137,175,178,24,141,79,39,73,53,22,232,149,91,206,95,146,
+    107,152,19,162,106,181,106,114,88,16,214,84,149,160,164,181,
+    228,68,191,47,165,23,23,130,163,28,94,107,230,58,136,62,
+    35,43,43,168,211,100,7,118,139,105,220,13,234,57,71,14,
+    236,29,229,168,102,133,122,90,61,89,131,251,53,113,1,188,
+    215,242,9,230,137,31,55,57,252,46,69,182,168,12,101,139,
+    202,136,124,112,40,91,216,229,213,4,203,33,115,229,254,41,
+    166,127,136,145,244,244,141,239,78,169,69,172,248,64,21,38,
+    153,136,196,150,241,94,78,212,229,28,142,102,220,95,99,210,
+    86,213,230,202,164,227,58,49,5,49,212,246,219,236,50,169,
+    224,82,132,143,69,111,196,146,51,164,249,248,44,39,178,65,
+    134,123,143,34,91,59,99,188,192,189,137,239,241,201,71,202,
+    70,209,31,96,240,54,6,120,183,9,135,143,193,224,222,193,
+    96,17,131,8,6,12,6,237,68,104,212,200,48,135,122,103,
+    25,239,65,165,223,227,98,2,59,35,240,115,40,254,200,250,
+    36,242,94,164,166,59,178,241,110,18,53,163,152,187,136,115,
+    131,199,148,47,39,241,184,66,62,198,20,88,217,136,25,201,
+    22,245,131,75,217,72,184,226,192,196,135,73,210,74,146,10,
+    181,46,134,130,78,146,67,84,228,220,25,27,217,5,90,112,
+    97,178,127,87,41,172,70,6,25,32,191,46,32,113,138,32,
+    21,109,89,137,163,42,121,52,78,21,29,89,81,55,57,220,
+    134,100,218,112,170,80,9,81,153,108,87,183,180,18,10,238,
+    111,72,255,98,119,83,238,127,160,33,66,126,166,32,223,214,
+    32,87,138,148,97,13,114,177,80,33,81,124,17,137,252,75,
+    65,46,106,144,200,69,10,162,225,84,177,253,141,69,23,43,
+    228,41,30,164,148,142,104,89,10,133,202,25,109,91,132,53,
+    165,152,97,9,121,14,30,55,253,135,248,83,62,122,117,135,
+    139,6,24,46,142,23,28,203,166,186,53,95,189,214,34,240,
+    160,241,150,127,183,25,127,246,250,141,157,114,120,51,83,219,
+    129,157,119,197,230,41,169,121,10,54,79,109,152,158,53,181,
+    126,196,127,152,126,152,222,48,230,0,253,19,219,143,109,31,
+    205,238,186,142,102,93,71,37,215,48,116,13,75,96,4,130,
+    17,17,140,236,155,187,11,124,89,224,219,92,223,76,170,216,
+    231,94,223,227,238,60,101,181,116,17,176,49,255,204,217,46,
+    118,76,254,242,230,150,247,105,183,212,127,6,246,159,65,183,
+    202,37,57,207,67,231,249,141,153,28,221,140,55,56,124,225,
+    25,218,154,220,57,189,51,36,121,102,161,103,86,162,231,32,
+    61,39,210,115,133,236,103,205,254,156,203,139,174,79,175,127,
+    114,61,51,255,228,186,228,122,21,186,94,205,181,118,124,154,
+    252,36,153,137,253,122,249,23,203,210,192,56,28,24,151,90,
+    79,193,214,83,47,12,58,247,233,23,38,163,163,229,107,10,
+    129,23,6,115,163,253,107,10,129,60,1,118,170,209,129,217,
+    110,26,37,218,7,105,159,72,174,111,204,148,187,115,115,238,
+    227,235,143,174,111,88,158,185,125,91,142,237,119,69,247,25,
+    201,125,6,186,207,108,88,115,192,81,56,70,166,125,215,123,
+    50,235,61,41,121,79,65,239,41,9,156,134,224,180,8,78,
+    239,151,159,55,83,150,22,133,226,11,111,80,28,58,255,185,
+    247,115,155,228,189,10,189,87,37,112,13,130,107,34,184,246,
+    172,205,159,113,237,6,78,100,3,39,164,192,73,24,56,185,
+    27,184,144,13,92,144,2,83,48,48,37,181,93,130,109,151,
+    242,148,211,210,251,2,131,15,47,111,76,109,8,72,199,155,
+    19,153,192,230,196,230,132,228,28,128,206,129,10,157,246,75,
+    158,139,208,115,81,162,167,32,61,37,210,83,106,230,145,45,
+    247,182,105,247,248,165,236,241,75,159,143,73,199,103,225,241,
+    89,201,51,7,61,115,18,125,25,210,151,69,250,178,134,207,
+    196,118,90,242,204,64,207,140,68,207,66,122,86,164,103,53,
+    153,167,183,191,39,121,206,65,207,57,137,158,132,244,164,72,
+    79,106,50,207,238,208,21,125,250,220,217,246,232,2,116,30,
+    217,114,64,188,39,251,36,17,120,151,14,100,233,64,230,84,
+    38,40,209,199,32,125,76,164,143,229,218,187,255,114,248,103,
+    195,226,145,115,91,239,34,160,92,82,251,36,108,159,220,120,
+    253,89,91,151,216,125,82,106,27,135,109,227,27,87,158,121,
+    252,219,14,209,115,66,242,156,128,158,19,27,243,123,22,205,
+    209,174,159,92,255,241,245,205,249,221,206,115,217,206,115,82,
+    231,121,216,121,94,162,47,64,250,130,72,95,40,228,126,246,
+    186,120,228,188,212,121,1,118,94,144,232,139,144,190,40,210,
+    23,81,214,46,221,159,165,241,158,113,137,62,5,233,83,34,
+    125,170,64,255,69,231,177,173,183,118,58,118,26,165,206,57,
+    216,89,165,195,77,32,209,1,72,7,68,58,144,163,221,187,
+    116,103,150,238,220,188,37,209,61,144,238,17,233,30,148,40,
+    58,220,188,4,186,148,45,193,95,162,158,61,249,241,249,71,
+    231,55,192,51,87,231,150,110,59,34,186,78,75,174,211,208,
+    117,122,195,146,3,205,63,105,250,113,211,166,101,215,115,34,
+    139,27,126,18,122,78,74,96,28,130,113,17,140,31,40,247,
+    51,91,230,138,228,25,134,30,173,95,55,239,130,64,22,4,
+    50,231,50,35,18,24,131,96,76,4,99,200,114,29,238,71,
+    214,13,83,206,221,190,235,62,153,117,159,68,109,248,232,189,
+    140,233,137,125,219,244,87,246,23,6,125,171,245,107,10,129,
+    13,107,30,80,22,231,46,240,102,129,247,139,246,99,91,111,
+    110,175,73,237,83,176,125,74,2,151,32,184,36,130,75,95,
+    182,117,124,124,255,209,253,13,250,64,166,110,178,92,214,41,
+    80,49,118,236,240,137,79,18,98,223,233,173,49,4,148,75,
+    106,61,3,91,207,108,32,85,123,118,233,238,44,221,157,105,
+    144,232,35,144,62,34,210,71,74,56,35,244,31,23,199,166,
+    161,95,107,194,251,23,152,129,254,146,229,226,128,4,90,148,
+    230,61,163,59,69,223,43,219,87,21,199,66,58,176,96,29,
+    88,172,121,2,204,68,13,189,89,208,155,249,161,216,247,170,
+    4,78,66,112,82,4,39,139,29,99,149,64,47,4,189,34,
+    232,197,39,20,116,168,190,11,10,45,68,61,211,58,12,91,
+    135,55,108,133,18,216,95,189,219,255,104,251,154,228,185,4,
+    61,151,36,48,13,193,180,8,166,75,217,98,112,98,231,173,
+    157,215,37,207,21,232,185,34,129,121,8,230,69,48,175,41,
+    222,181,19,216,113,74,158,73,232,153,148,192,121,8,206,139,
+    224,124,169,195,39,51,163,18,120,5,130,87,68,240,74,209,
+    22,17,27,31,4,62,17,248,80,131,220,222,71,11,200,238,
+    240,17,92,147,89,239,36,54,129,31,101,230,97,223,248,142,
+    5,158,126,13,41,0,111,252,71,96,3,31,53,128,162,167,
+    110,103,76,116,77,74,174,73,232,154,196,246,218,170,140,24,
+    95,116,141,108,61,216,57,186,227,147,186,46,195,174,203,18,
+    184,2,193,21,17,92,121,118,40,195,48,88,102,117,10,124,
+    73,134,113,9,250,167,37,122,6,210,51,34,185,84,121,247,
+    237,231,182,93,48,152,5,131,91,29,91,141,85,254,103,151,
+    192,32,4,131,34,24,68,148,205,174,135,15,208,176,235,242,
+    236,186,78,100,93,39,176,2,239,111,10,143,215,183,152,167,
+    9,196,215,141,249,186,173,27,22,236,67,234,64,113,116,235,
+    202,118,76,242,94,132,222,139,18,152,130,96,74,4,83,95,
+    162,104,240,29,209,53,42,185,70,161,107,20,235,182,56,242,
+    120,119,189,103,178,222,51,146,247,44,244,158,149,192,57,8,
+    206,137,224,220,243,150,142,221,150,222,108,75,111,102,70,106,
+    9,194,150,224,70,131,90,4,13,69,91,193,237,219,219,111,
+    73,222,11,208,123,65,2,23,33,184,40,130,139,101,4,199,
+    118,116,146,119,2,122,39,36,112,22,130,179,34,56,123,56,
+    55,254,163,247,214,115,141,180,226,208,133,207,59,37,239,2,
+    244,46,72,224,58,4,215,69,112,93,109,205,103,29,98,255,
+    89,201,123,14,122,207,73,96,18,130,73,17,76,146,204,158,
+    44,232,201,92,203,32,5,156,128,224,132,8,78,60,47,134,
+    80,9,244,64,208,35,130,158,195,250,128,167,243,80,42,154,
+    209,41,240,37,169,104,10,250,47,73,244,52,164,241,201,122,
+    232,58,148,65,99,186,207,238,137,67,23,165,174,41,216,85,
+    138,222,132,201,193,172,253,176,225,162,220,160,11,178,110,198,
+    118,187,206,103,187,206,75,93,23,97,87,201,1,114,45,109,
+    159,14,127,50,156,177,72,45,67,176,101,8,155,179,38,186,
+    172,237,156,218,9,74,93,51,176,107,70,2,179,16,204,138,
+    96,246,176,209,101,90,167,192,151,210,25,219,221,208,63,37,
+    209,151,32,125,73,36,215,159,110,95,212,15,104,37,137,115,
+    205,253,57,71,235,167,190,79,124,40,122,253,153,228,24,129,
+    142,145,109,227,95,217,209,4,82,108,158,123,97,50,224,185,
+    54,2,47,12,38,220,28,19,110,14,6,52,101,113,252,125,
+    144,205,179,101,85,163,72,113,56,159,121,178,32,181,158,128,
+    173,39,240,128,94,102,171,103,119,134,165,174,43,176,171,106,
+    200,214,136,242,165,167,59,99,149,60,71,161,231,232,70,99,
+    14,184,119,193,64,22,12,136,71,206,136,131,165,144,76,240,
+    157,89,208,249,133,111,120,235,14,153,138,250,230,160,111,78,
+    2,151,33,184,44,130,203,21,4,206,29,147,228,59,15,125,
+    231,37,112,1,130,11,34,184,80,70,112,123,71,183,205,75,
+    190,179,208,87,26,72,138,146,33,221,15,64,36,0,24,248,
+    178,213,183,121,71,106,29,132,173,131,184,101,104,206,211,151,
+    5,125,153,164,216,63,46,129,83,16,156,18,193,41,130,110,
+    207,130,246,47,58,240,104,246,163,237,132,212,49,3,59,74,
+    206,89,65,192,111,179,82,199,57,216,161,141,208,26,130,203,
+    219,145,237,155,82,199,25,216,113,70,2,19,16,76,136,96,
+    162,40,152,77,2,125,16,244,137,160,239,37,89,214,255,79,
+    206,244,188,106,214,246,204,238,248,144,125,200,110,24,114,192,
+    86,152,33,184,212,199,11,21,247,89,203,227,182,191,236,252,
+    89,103,102,105,43,94,49,115,56,8,141,114,29,244,52,130,
+    20,24,101,216,251,163,113,38,82,103,203,56,217,144,31,227,
+    239,21,150,53,180,91,198,43,178,218,244,154,189,242,222,141,
+    84,181,8,250,162,8,86,74,57,48,131,209,253,66,17,35,
+    104,76,53,69,147,203,124,50,206,78,10,194,218,213,249,235,
+    199,83,14,188,124,54,249,35,12,195,100,33,117,61,229,213,
+    84,55,249,35,205,205,186,172,231,222,171,221,130,54,34,38,
+    187,20,89,141,11,225,123,228,136,244,112,132,187,205,167,2,
+    21,45,169,38,233,192,45,106,165,148,243,37,76,205,184,171,
+    75,160,112,248,128,108,37,98,196,240,49,244,101,155,143,77,
+    197,198,254,181,174,114,243,113,249,9,207,149,199,151,48,134,
+    167,198,138,143,203,245,105,221,65,14,80,73,235,75,187,198,
+    195,165,163,153,244,245,14,151,202,168,135,75,213,231,169,59,
+    224,33,78,248,223,45,208,30,83,25,86,143,169,68,229,107,
+    110,209,21,60,165,116,233,120,199,187,234,49,77,85,175,240,
+    186,52,244,234,167,91,181,55,67,238,199,155,49,87,30,65,
+    171,145,92,221,70,72,118,218,55,44,220,194,231,22,226,19,
+    19,195,201,229,248,218,28,222,109,31,189,19,139,51,156,14,
+    73,87,216,134,255,121,147,158,226,254,35,74,4,157,28,214,
+    42,135,205,70,182,99,195,34,167,179,132,241,194,49,167,215,
+    97,131,33,182,18,198,239,180,148,69,82,19,65,112,127,142,
+    139,125,140,193,247,49,22,48,194,34,57,211,145,251,31,248,
+    86,159,56,41,55,36,201,73,211,60,89,101,230,254,22,131,
+    93,12,240,177,60,50,141,233,49,83,124,12,117,113,35,255,
+    255,193,192,132,87,33,203,246,240,183,96,198,138,239,10,201,
+    194,137,128,157,154,181,204,170,220,62,236,9,255,142,34,11,
+    153,52,229,240,61,107,233,218,114,137,45,35,82,203,8,108,
+    25,217,233,207,27,244,14,235,11,10,129,175,49,216,48,161,
+    88,219,115,108,55,48,145,13,76,72,129,115,48,112,110,195,
+    132,143,24,234,202,117,247,21,142,139,123,142,215,44,187,178,
+    160,75,2,126,8,252,34,240,227,199,92,20,66,37,224,133,
+    192,139,79,106,193,60,240,81,117,168,92,222,74,89,26,149,
+    199,130,95,190,242,100,2,246,150,158,225,159,245,15,62,249,
+    254,175,127,240,139,31,60,163,237,15,95,131,180,111,51,141,
+    162,254,0,150,100,192,170,20,199,143,11,232,82,206,180,209,
+    115,248,204,221,133,160,31,31,210,141,149,21,14,203,214,112,
+    56,145,100,86,227,56,77,135,195,239,174,70,226,133,156,134,
+    112,152,73,70,81,194,192,11,28,135,223,102,115,248,131,2,
+    14,127,123,67,206,218,230,240,123,109,14,191,64,230,146,24,
+    168,221,40,27,23,147,201,56,247,23,248,30,107,159,195,47,
+    207,185,77,12,126,142,1,54,56,238,159,99,144,193,224,23,
+    24,252,11,12,112,127,115,248,61,51,247,63,49,248,223,24,
+    224,207,194,56,43,54,159,198,194,153,225,248,21,91,56,28,
+    212,113,231,168,66,192,187,168,156,20,116,172,8,240,11,51,
+    254,111,245,228,196,239,226,127,121,125,131,9,228,41,12,90,
+    28,166,203,186,231,45,238,188,9,39,144,178,93,253,249,6,
+    146,4,148,163,63,111,33,73,43,213,126,60,111,35,73,154,
+    178,218,243,141,36,73,237,9,7,40,115,211,251,111,137,77,
+    61,146,169,23,154,122,243,250,21,157,9,69,204,18,124,97,
+    160,204,125,165,28,198,208,140,115,202,65,159,213,100,207,83,
+    229,192,83,201,88,103,114,111,10,121,10,253,148,64,137,57,
+    198,152,43,139,24,77,214,77,33,51,243,56,149,167,140,184,
+    174,34,40,21,195,24,186,186,38,215,230,12,230,239,42,1,
+    109,77,174,234,154,116,166,246,205,57,76,216,94,2,218,34,
+    237,121,51,42,151,113,85,112,85,0,202,10,110,145,166,5,
+    43,65,141,38,141,225,38,140,105,155,48,150,167,215,13,166,
+    201,173,233,60,133,127,183,103,148,223,26,240,207,26,10,252,
+    2,146,169,7,154,122,136,104,25,103,13,193,123,139,185,170,
+    8,106,17,179,201,186,229,218,138,62,245,230,41,51,86,104,
+    17,148,138,97,76,115,101,177,54,147,85,28,70,130,160,223,
+    207,251,200,79,9,148,138,150,161,75,128,120,51,49,244,224,
+    9,18,12,101,179,176,182,18,91,190,173,120,91,3,137,181,
+    137,147,35,201,197,187,108,84,224,149,211,244,240,56,72,78,
+    148,85,162,52,80,29,17,15,87,202,161,178,248,116,8,114,
+    30,44,57,4,150,156,252,74,142,123,37,103,188,146,51,100,
+    149,99,104,93,170,79,227,88,79,14,179,85,142,114,37,103,
+    191,58,80,205,171,66,44,62,178,196,8,119,216,248,10,203,
+    145,55,140,228,37,173,242,98,83,125,181,74,222,222,202,198,
+    24,31,225,149,127,91,160,133,43,252,83,50,252,72,49,69,
+    2,128,108,199,28,249,145,226,191,46,67,66,143,28,36,39,
+    105,21,15,204,139,161,66,145,194,191,15,83,121,150,30,9,
+    90,178,79,249,250,161,68,85,56,169,69,249,103,60,72,116,
+    147,125,234,185,94,26,110,42,142,132,65,217,173,102,40,37,
+    149,145,130,68,66,217,85,152,69,145,65,164,120,192,175,18,
+    211,72,120,34,51,53,210,127,228,244,66,112,78,137,190,231,
+    57,159,78,153,169,242,23,80,220,202,27,116,58,93,126,156,
+    210,89,223,183,224,255,114,84,155,88,126,61,167,44,74,22,
+    178,18,157,30,153,197,223,27,112,188,1,167,94,30,104,161,
+    116,94,145,242,104,175,28,117,66,44,191,114,212,17,177,252,
+    202,81,215,197,242,43,71,77,137,229,87,142,58,47,150,95,
+    57,234,148,88,126,229,168,147,98,249,149,55,35,23,70,158,
+    94,27,138,205,189,98,255,169,23,36,253,117,29,26,98,96,
+    255,23,174,216,68,157,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/boards/experimental/lupv_board.py",
+    "gem5.components.boards.experimental.lupv_board",
+    embedded_module_data,
+    9398,
+    27678);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,252 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,26,93,111,219,214,149,164,190,168,15,91,178,108,
+    199,249,112,28,198,86,26,43,150,229,97,77,210,214,89,210,
+    124,117,105,179,52,29,218,20,29,84,116,50,77,94,219,74,
+    40,81,189,164,154,218,115,129,110,200,67,86,20,107,31,6,
+    44,24,10,204,47,43,82,180,123,217,203,186,183,254,4,201,
+    208,96,131,64,176,0,123,234,27,131,118,47,5,6,236,156,
+    75,145,162,44,42,75,70,11,151,151,247,158,123,206,185,231,
+    251,222,228,95,156,239,9,119,222,223,125,8,205,31,56,149,
+    83,121,141,43,225,91,208,248,170,80,18,120,236,135,180,80,
+    53,92,10,179,126,88,139,84,163,165,104,53,86,138,85,197,
+    146,200,59,107,226,165,184,26,81,163,90,162,154,44,37,171,
+    169,82,170,58,84,26,170,14,151,134,97,62,166,138,90,186,
+    154,41,101,120,78,224,174,112,106,252,14,167,38,62,23,56,
+    238,75,193,101,163,52,162,242,111,112,249,228,183,248,113,61,
+    207,91,195,242,178,97,82,89,49,171,196,92,211,85,24,9,
+    255,92,54,215,242,33,43,124,173,98,152,150,248,90,221,172,
+    232,53,89,179,34,111,214,160,243,109,8,22,230,195,86,246,
+    162,174,155,154,46,171,132,190,78,12,189,65,21,98,101,47,
+    173,17,229,86,93,175,212,76,111,108,228,114,197,184,245,74,
+    85,94,37,222,208,240,207,8,173,17,205,253,254,150,71,140,
+    188,53,116,161,195,201,69,93,166,170,226,23,222,62,87,120,
+    63,229,81,120,132,43,241,42,87,18,84,190,20,34,97,85,
+    32,17,18,61,224,1,175,8,106,232,78,248,115,232,125,233,
+    141,149,98,12,46,10,115,225,190,57,17,230,34,36,174,10,
+    106,116,37,172,198,250,230,19,206,44,73,246,80,9,171,226,
+    157,112,41,213,153,195,149,113,248,30,138,115,254,63,117,76,
+    77,146,97,6,147,130,245,233,238,122,117,168,23,159,58,188,
+    231,59,189,231,59,3,223,61,251,244,205,141,144,140,154,133,
+    249,17,146,37,163,43,66,32,12,238,110,76,29,189,19,41,
+    141,169,81,48,129,113,43,235,232,1,21,244,150,78,111,161,
+    50,229,11,160,222,132,4,207,141,53,34,213,27,180,174,27,
+    68,210,87,36,115,173,98,72,174,169,72,138,38,27,134,4,
+    35,166,46,145,154,188,172,17,73,150,86,26,154,54,111,172,
+    27,38,169,74,203,96,28,12,141,162,215,12,48,163,74,109,
+    21,177,192,79,150,110,49,170,210,237,181,138,178,38,221,174,
+    104,26,32,39,53,9,201,195,172,10,220,72,21,180,151,98,
+    130,97,248,169,78,29,234,64,107,165,81,83,208,26,1,45,
+    165,68,49,181,245,2,46,150,250,55,210,97,209,88,211,27,
+    154,42,45,19,134,74,86,85,2,52,96,35,146,209,168,19,
+    234,192,0,94,25,24,6,155,147,228,154,202,240,121,27,117,
+    156,2,182,90,173,107,164,74,106,38,81,139,12,213,75,197,
+    213,226,162,195,96,177,8,236,168,100,126,89,211,149,91,139,
+    139,82,125,29,214,212,156,57,38,2,70,229,23,207,159,102,
+    118,61,219,99,229,133,0,214,243,139,222,82,7,125,177,231,
+    251,188,254,30,161,180,162,18,99,54,96,109,15,168,74,86,
+    164,85,98,150,225,45,55,52,179,236,72,190,44,211,85,99,
+    214,32,218,74,94,154,63,39,161,151,191,13,44,189,211,75,
+    22,31,74,204,6,173,73,111,247,77,224,51,77,100,170,173,
+    215,41,56,251,173,179,166,185,254,198,143,166,11,193,128,104,
+    3,186,70,30,15,164,213,111,158,125,238,5,120,126,252,236,
+    32,16,10,70,117,246,87,216,150,223,147,181,6,249,32,0,
+    240,157,62,217,121,74,170,233,38,89,92,236,234,229,4,216,
+    56,26,181,97,52,170,196,144,244,154,182,14,13,233,88,32,
+    216,14,49,139,131,128,209,72,174,85,106,141,247,93,107,134,
+    185,134,225,26,135,21,117,36,167,240,190,24,134,125,140,157,
+    223,101,56,140,97,166,111,234,55,124,158,151,87,249,142,231,
+    225,243,58,91,143,134,218,209,157,164,129,154,152,255,208,213,
+    6,26,162,33,173,48,199,32,210,109,215,228,29,86,138,210,
+    91,164,195,167,135,14,193,86,116,77,211,111,163,35,130,178,
+    225,101,72,85,121,29,60,131,241,141,78,81,215,100,133,172,
+    233,26,68,116,163,128,94,1,115,148,176,81,21,188,149,212,
+    60,116,75,75,32,27,215,154,80,92,101,151,135,165,37,148,
+    4,121,159,40,13,112,149,30,97,47,249,53,183,36,45,162,
+    124,145,202,210,82,128,137,186,160,179,249,165,165,98,23,203,
+    162,35,87,99,81,186,240,127,8,198,67,243,5,111,141,94,
+    215,205,87,186,78,253,18,165,58,133,225,48,186,133,129,170,
+    146,126,120,193,160,202,130,227,204,11,171,164,122,106,65,209,
+    171,117,48,16,32,177,192,194,133,177,16,36,130,98,125,221,
+    154,24,224,117,27,39,250,93,182,56,0,246,85,96,194,72,
+    64,243,33,247,239,125,92,122,186,41,30,253,14,141,229,105,
+    140,106,227,3,111,207,111,128,180,187,214,196,108,92,37,239,
+    85,20,82,144,42,16,79,101,131,25,2,149,84,29,204,27,
+    92,69,50,234,68,169,172,172,187,33,217,1,14,212,5,166,
+    138,30,24,23,132,142,2,31,116,28,55,194,68,74,39,160,
+    181,210,108,195,40,50,7,126,99,122,144,80,186,48,37,159,
+    48,134,29,97,80,204,109,86,130,1,177,124,113,93,17,158,
+    92,50,114,218,239,110,32,28,199,167,33,84,173,84,86,27,
+    84,102,89,166,70,8,38,12,76,16,170,147,24,186,217,9,
+    71,113,132,89,130,79,44,1,129,6,31,22,61,88,178,3,
+    175,114,253,67,146,77,134,131,64,218,97,57,150,244,172,121,
+    172,155,185,169,208,175,145,186,76,229,170,212,149,136,79,53,
+    30,207,108,39,14,235,78,174,222,163,174,47,4,138,213,22,
+    157,68,137,163,64,165,142,218,178,101,88,234,176,97,234,101,
+    182,237,141,99,1,154,235,7,83,124,202,219,239,83,94,143,
+    190,4,87,95,39,152,190,54,249,45,46,232,233,45,205,160,
+    140,225,55,254,228,109,224,181,101,83,174,212,28,77,98,4,
+    145,64,32,102,133,169,146,85,30,62,73,44,175,131,217,163,
+    137,179,210,132,45,232,148,163,199,13,15,31,100,127,40,137,
+    76,249,241,86,207,16,30,55,246,80,236,138,21,74,219,44,
+    154,51,139,105,222,124,94,176,66,138,102,244,203,121,194,51,
+    253,222,5,131,99,71,63,236,187,136,116,31,147,184,157,229,
+    50,7,119,210,133,237,116,161,149,46,182,211,197,166,88,236,
+    151,126,216,149,126,201,145,62,247,36,210,7,40,62,8,106,
+    147,255,28,198,191,244,230,234,188,202,111,56,218,18,228,191,
+    249,253,238,10,113,28,192,13,75,157,100,202,36,201,18,69,
+    39,13,213,33,159,17,207,110,221,60,199,124,170,210,85,151,
+    74,76,66,171,149,26,64,130,122,17,210,193,225,43,222,48,
+    214,225,68,39,233,116,3,12,38,26,15,145,235,91,5,175,
+    32,244,89,142,39,228,130,164,51,123,3,172,43,84,175,250,
+    178,227,0,173,48,26,79,231,173,176,119,167,104,221,227,178,
+    131,236,177,35,71,103,223,110,30,92,90,66,62,32,102,184,
+    41,50,72,170,1,37,215,222,180,105,129,254,232,33,12,14,
+    51,216,76,237,181,220,67,143,73,228,27,197,39,203,124,46,
+    252,38,34,127,214,177,224,73,46,51,182,147,158,217,78,207,
+    180,210,199,218,233,99,187,169,204,78,106,118,59,53,123,255,
+    96,43,117,178,157,58,217,76,45,126,45,60,10,9,153,132,
+    205,9,241,4,51,239,27,86,212,65,105,37,150,189,147,170,
+    149,244,169,220,18,41,145,213,149,138,6,135,84,183,87,134,
+    4,96,98,134,183,146,190,84,108,101,201,251,21,179,172,215,
+    88,0,46,87,64,5,134,149,80,188,195,174,146,240,89,127,
+    196,117,165,201,48,75,60,62,23,217,228,76,159,211,245,30,
+    204,13,225,42,36,166,205,240,38,87,22,186,240,91,161,32,
+    7,83,247,56,24,143,225,50,28,4,185,215,97,111,70,220,
+    126,57,234,97,19,182,98,65,107,55,99,245,81,224,64,252,
+    223,120,123,185,217,138,7,98,227,182,18,129,227,194,87,161,
+    222,245,192,165,39,1,26,243,127,213,144,159,228,255,230,231,
+    171,112,175,108,123,246,157,114,123,171,48,94,30,242,96,66,
+    191,46,0,156,247,189,53,28,200,109,232,73,228,220,167,157,
+    8,21,55,35,64,45,237,237,228,244,102,148,158,52,165,46,
+    134,155,35,30,229,64,109,152,57,31,236,168,215,27,115,123,
+    106,116,239,158,187,212,128,214,57,115,206,183,11,238,166,55,
+    167,198,122,215,125,144,216,76,108,237,227,2,158,205,104,223,
+    190,18,91,19,65,144,189,210,224,81,247,251,3,49,246,233,
+    30,96,69,224,220,187,182,216,140,211,155,61,30,20,55,79,
+    250,232,244,112,78,227,155,113,88,123,200,219,89,228,13,110,
+    207,218,231,7,174,157,53,79,249,33,159,94,203,125,148,207,
+    116,215,169,98,47,236,111,120,132,200,199,229,191,70,124,201,
+    144,165,51,239,134,67,198,211,154,83,202,64,21,232,94,160,
+    244,222,178,208,70,13,106,74,115,13,134,157,232,234,225,194,
+    188,21,112,151,226,203,59,78,120,115,210,70,39,237,98,86,
+    128,80,89,124,186,20,85,213,27,181,254,53,221,152,235,172,
+    81,26,148,98,230,241,114,177,236,150,101,184,195,11,175,191,
+    218,185,129,161,228,221,70,5,74,177,192,27,128,206,99,174,
+    81,210,173,215,216,5,142,94,39,80,179,19,105,126,190,179,
+    153,130,143,203,224,235,132,174,164,10,236,254,199,229,183,111,
+    43,110,110,128,67,39,48,220,185,13,149,216,28,22,28,112,
+    156,150,189,34,18,225,188,163,179,140,117,200,96,218,80,163,
+    44,45,85,79,121,248,241,164,59,128,180,151,150,158,132,7,
+    23,22,132,251,184,141,123,194,36,30,25,198,126,81,122,101,
+    133,157,205,153,101,65,237,224,177,247,88,57,250,208,249,24,
+    144,186,203,189,211,15,222,95,221,166,21,211,244,221,40,12,
+    126,246,112,225,73,2,216,145,116,160,70,111,87,12,188,125,
+    172,145,219,140,253,39,66,233,48,162,0,82,172,9,25,137,
+    110,185,248,68,98,11,228,168,79,127,190,26,98,144,230,176,
+    72,115,29,188,123,133,193,76,232,177,108,4,151,196,23,215,
+    189,26,208,185,94,121,44,142,192,171,23,118,59,152,15,216,
+    76,127,13,180,40,189,181,70,80,7,78,152,170,84,27,154,
+    227,214,157,107,87,92,33,193,39,174,120,2,153,74,12,105,
+    17,216,186,65,27,96,111,232,33,29,230,250,152,233,22,95,
+    157,248,226,125,131,227,227,213,176,78,215,139,210,155,29,17,
+    65,172,128,1,50,160,206,245,30,223,14,152,92,225,120,222,
+    197,219,101,225,198,15,60,28,234,216,201,13,78,113,137,238,
+    181,22,205,195,208,117,138,39,216,13,225,246,220,198,185,238,
+    191,135,24,82,181,97,152,190,170,155,221,66,227,191,180,72,
+    96,0,114,77,234,255,167,147,98,126,202,74,84,12,56,166,
+    154,114,77,33,20,11,18,43,229,63,180,88,233,50,222,16,
+    96,74,112,50,130,53,140,10,213,116,69,214,224,216,97,174,
+    89,162,123,99,96,37,245,229,155,32,150,50,171,119,195,55,
+    129,16,197,156,108,69,193,0,171,178,73,159,193,44,120,136,
+    145,80,244,106,21,194,98,89,131,179,141,149,44,251,202,231,
+    168,92,175,147,154,202,118,104,9,186,97,133,25,21,161,122,
+    202,138,57,182,109,88,81,189,97,130,10,172,48,196,228,154,
+    21,65,79,39,86,68,209,116,131,208,35,72,100,30,27,204,
+    175,128,187,43,94,138,213,161,21,127,233,125,133,48,68,249,
+    164,115,15,113,156,235,92,70,208,89,108,80,194,140,60,197,
+    122,134,22,60,132,69,92,30,198,221,25,88,33,250,180,234,
+    28,78,246,15,186,75,217,152,11,56,153,12,2,254,29,160,
+    50,198,5,118,149,241,115,30,78,214,247,114,127,30,242,206,
+    213,206,207,142,114,135,103,239,134,219,226,1,91,228,226,67,
+    59,226,228,182,56,121,239,70,75,156,110,139,211,77,113,26,
+    230,143,205,237,228,94,216,206,189,208,202,157,105,231,206,220,
+    13,127,60,212,22,143,2,244,80,230,147,151,63,122,249,211,
+    183,155,227,23,183,46,239,228,206,111,231,206,183,114,23,219,
+    185,139,173,212,165,118,234,210,63,19,153,143,158,217,157,56,
+    180,51,241,220,246,196,115,223,44,54,39,158,107,77,92,111,
+    79,92,7,148,99,251,219,163,57,59,36,140,20,62,13,183,
+    51,71,155,153,163,15,199,15,236,140,231,183,199,243,173,241,
+    185,246,248,156,157,228,146,35,143,184,88,50,241,61,54,118,
+    4,120,67,186,211,246,20,55,57,133,252,238,223,77,142,55,
+    147,71,225,120,213,78,77,238,164,102,182,83,51,91,87,119,
+    114,103,183,115,103,91,185,23,219,185,23,91,169,243,237,212,
+    249,102,234,60,208,75,141,217,92,40,254,50,191,59,153,187,
+    123,249,227,87,239,190,186,59,52,101,115,60,140,60,152,156,
+    250,236,202,159,174,253,241,218,95,178,95,29,108,231,23,191,
+    190,218,154,188,210,158,188,130,96,184,240,48,46,60,240,96,
+    116,226,94,248,179,161,45,179,53,90,104,143,22,238,94,6,
+    178,159,92,253,232,106,115,98,182,149,202,183,83,249,102,42,
+    223,25,250,237,181,143,175,221,189,246,80,76,237,136,71,182,
+    197,35,247,23,155,226,145,150,120,186,45,158,110,138,167,1,
+    227,204,41,228,254,8,200,47,181,207,230,18,241,236,131,244,
+    129,123,39,254,172,182,210,115,237,244,156,13,251,204,238,206,
+    204,163,88,164,38,251,61,24,57,116,239,234,63,102,23,91,
+    35,103,218,35,103,108,46,54,148,125,48,115,252,126,98,103,
+    246,194,246,236,133,214,236,165,246,236,165,214,204,229,246,204,
+    101,223,162,127,71,185,9,201,22,248,241,19,143,66,161,137,
+    236,247,28,52,176,147,145,172,157,6,146,140,46,59,120,230,
+    99,215,241,185,113,61,63,110,137,229,114,13,226,124,185,108,
+    37,202,229,170,174,54,52,236,167,202,229,119,27,178,214,153,
+    137,149,203,170,174,148,203,20,143,122,20,207,41,86,200,48,
+    41,243,78,231,180,141,246,236,184,14,158,217,156,195,55,115,
+    215,20,171,122,153,225,131,147,106,52,230,122,22,115,38,250,
+    50,52,95,112,140,41,230,3,52,227,54,11,104,198,127,231,
+    209,140,221,63,91,56,20,17,109,14,155,69,46,58,102,11,
+    137,200,244,253,177,251,202,87,7,96,107,145,233,110,243,40,
+    4,211,119,126,201,0,236,253,12,52,26,153,222,26,181,185,
+    40,66,184,141,7,134,3,25,6,150,140,76,55,231,207,217,
+    28,188,191,57,201,94,221,198,3,199,129,131,241,200,194,238,
+    129,19,118,8,222,15,227,35,159,206,124,124,216,142,64,31,
+    84,217,211,236,203,68,18,187,7,231,236,16,188,31,198,83,
+    118,4,222,54,215,219,20,184,147,207,239,30,203,239,78,63,
+    179,59,183,128,191,153,227,187,231,47,219,227,132,143,128,210,
+    176,125,152,153,178,35,236,51,202,141,63,99,199,88,87,228,
+    198,15,55,15,47,180,199,126,100,199,217,64,130,219,55,117,
+    79,249,253,59,118,146,125,166,184,209,67,247,158,253,253,188,
+    61,196,62,135,185,201,220,214,165,207,206,218,105,246,153,65,
+    96,117,235,217,207,42,237,241,89,123,132,141,101,185,195,71,
+    237,81,214,29,3,228,247,222,220,58,217,204,159,105,206,156,
+    105,31,254,73,123,236,108,135,163,125,92,98,216,158,232,50,
+    55,168,117,180,138,186,204,103,233,89,102,52,242,178,194,108,
+    200,138,97,80,214,42,203,78,144,141,154,235,117,40,46,152,
+    101,57,6,196,204,228,69,156,203,122,69,116,209,237,49,123,
+    114,236,39,233,218,88,247,63,9,56,23,186,44,21,57,214,
+    244,26,54,158,133,253,32,254,196,177,242,115,244,77,206,185,
+    131,55,254,3,141,29,226,121,222,62,205,241,137,15,227,248,
+    183,203,77,53,123,127,187,220,254,102,239,207,22,194,188,96,
+    115,79,211,164,60,2,118,56,130,131,255,95,3,104,78,52,
+    185,188,255,103,71,47,135,120,16,125,112,251,136,181,223,15,
+    152,101,226,249,47,166,193,173,1,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/boards/kernel_disk_workload.py",
+    "gem5.components.boards.kernel_disk_workload",
+    embedded_module_data,
+    3641,
+    8716);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,66 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,83,49,111,211,64,20,190,179,29,199,137,218,164,
+    41,42,165,69,72,110,59,160,72,144,76,128,84,161,74,109,
+    85,74,134,164,18,169,132,148,129,75,234,187,52,134,156,47,
+    156,29,65,171,14,29,58,116,70,173,88,153,16,136,63,19,
+    85,12,145,87,196,208,205,168,76,157,184,59,39,105,68,132,
+    112,236,239,197,247,190,247,238,187,247,158,127,128,177,43,49,
+    176,87,27,2,62,2,12,106,0,67,172,181,33,213,106,26,
+    4,26,216,6,88,63,1,216,32,218,103,29,128,111,250,48,
+    176,166,227,4,209,177,73,140,166,129,147,39,70,45,129,173,
+    42,200,167,14,239,86,59,196,113,155,46,241,237,160,69,236,
+    50,161,101,134,137,77,188,46,77,95,202,200,60,12,141,45,
+    241,230,140,235,128,67,29,139,74,7,1,53,40,180,104,24,
+    138,125,180,154,129,117,145,223,16,249,19,97,114,144,241,82,
+    134,92,106,18,164,168,74,222,12,45,132,188,6,37,8,133,
+    105,132,40,195,221,182,252,63,133,208,219,110,163,61,240,152,
+    187,165,114,169,178,29,154,235,187,59,229,210,102,152,139,45,
+    170,236,84,54,215,55,159,11,215,87,112,37,149,92,63,244,
+    185,83,236,28,4,45,230,21,247,9,125,84,116,24,237,48,
+    143,120,129,95,220,99,13,142,253,34,37,84,238,67,10,157,
+    3,46,43,169,96,73,60,190,45,224,120,244,235,79,103,142,
+    159,197,112,103,161,103,204,197,55,159,25,134,132,214,48,83,
+    104,114,18,116,185,231,192,177,226,200,67,202,51,94,29,169,
+    226,28,129,96,204,249,122,196,124,35,121,128,139,162,85,255,
+    230,104,19,28,109,130,163,79,112,244,42,8,172,27,134,40,
+    191,113,248,33,109,139,235,133,18,25,119,216,15,184,235,237,
+    219,77,198,169,205,154,106,169,94,31,158,167,94,127,96,203,
+    186,53,2,119,175,77,236,119,110,208,82,12,89,80,149,201,
+    119,105,183,221,8,24,47,164,213,251,106,124,126,127,213,222,
+    253,127,238,130,10,9,205,192,165,130,22,154,34,15,117,157,
+    48,23,91,228,49,207,105,56,45,225,202,39,226,254,76,73,
+    152,150,144,145,101,191,85,97,65,137,118,218,132,138,174,18,
+    188,197,57,227,121,200,103,101,7,101,89,109,158,147,180,217,
+    225,142,40,96,40,150,196,23,132,227,190,228,109,168,78,71,
+    25,96,205,156,63,57,91,187,72,46,245,146,75,253,236,252,
+    233,251,126,42,119,254,242,236,213,69,106,165,151,90,185,89,
+    249,62,87,184,72,21,122,169,66,63,187,220,203,46,255,20,
+    104,45,171,89,144,51,156,68,8,51,71,12,170,33,191,24,
+    174,143,70,68,23,27,171,93,121,86,130,154,29,169,238,218,
+    122,26,143,250,26,191,55,248,144,252,3,1,145,14,33,140,
+    30,67,104,68,64,130,9,224,237,30,152,27,191,35,83,135,
+    139,17,152,132,83,252,75,154,223,55,171,83,25,184,242,105,
+    62,2,194,124,169,42,243,79,80,210,254,0,195,126,19,107,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/boards/mem_mode.py",
+    "gem5.components.boards.mem_mode",
+    embedded_module_data,
+    672,
+    1125);
+
+} // anonymous namespace
+} // namespace gem5
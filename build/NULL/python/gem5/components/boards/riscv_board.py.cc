@@ -0,0 +1,663 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,213,125,107,108,27,73,154,88,243,169,38,217,148,248,
+    146,68,74,148,68,234,101,81,214,211,178,30,150,37,219,122,
+    90,242,123,199,179,123,187,186,157,227,208,236,182,68,155,15,
+    77,179,101,143,184,212,102,112,152,224,184,27,39,235,25,248,
+    50,218,91,15,150,217,120,247,52,89,31,34,224,22,129,15,
+    72,0,3,89,36,135,252,234,38,106,35,166,1,35,62,36,
+    78,50,72,126,208,216,25,228,176,191,82,85,77,54,155,47,
+    75,246,122,131,132,211,83,170,174,250,234,171,170,175,190,87,
+    85,87,149,255,11,161,248,233,243,127,127,75,169,8,226,51,
+    130,38,104,85,152,88,67,127,213,97,85,68,189,166,86,73,
+    105,154,53,13,252,171,9,107,35,186,53,93,68,191,166,143,
+    212,173,213,69,200,53,50,98,88,51,68,140,107,198,136,105,
+    205,20,161,214,168,136,121,205,28,169,95,171,143,52,172,53,
+    68,44,107,150,136,117,205,26,177,173,217,34,246,53,123,196,
+    177,230,136,52,174,53,98,156,218,112,83,164,121,173,57,226,
+    92,115,70,92,107,174,72,203,90,75,164,117,173,53,226,94,
+    115,195,124,29,173,15,183,69,218,215,218,113,188,46,220,17,
+    241,172,121,112,156,12,123,35,157,107,157,48,110,160,141,225,
+    174,72,247,90,55,142,155,194,61,145,222,181,94,28,167,194,
+    199,34,125,107,125,48,110,166,235,195,190,72,255,90,63,142,
+    55,132,143,71,6,214,6,84,132,154,56,79,208,150,143,9,
+    218,202,244,51,3,191,208,18,196,47,181,5,146,172,13,210,
+    170,235,132,207,246,37,122,185,226,83,137,218,75,161,56,231,
+    179,138,134,57,154,102,223,9,68,215,25,177,110,62,64,163,
+    55,81,63,207,134,104,152,64,45,196,238,46,134,226,183,87,
+    35,1,248,102,88,102,153,15,182,152,104,112,91,180,159,103,
+    162,12,27,10,190,19,138,7,239,92,11,134,86,98,113,78,
+    212,175,132,150,67,119,24,209,184,122,254,198,146,159,25,29,
+    25,25,17,245,171,87,191,61,31,96,69,227,181,203,115,11,
+    27,76,240,54,195,138,218,107,49,150,19,169,119,2,10,220,
+    109,24,211,124,44,198,133,99,1,154,97,47,50,108,148,9,
+    255,81,140,189,141,222,197,6,156,125,57,18,138,125,43,196,
+    114,171,87,69,18,39,188,243,238,130,104,146,82,230,195,177,
+    224,109,209,32,189,188,19,93,247,233,69,205,50,205,137,117,
+    48,184,18,163,25,209,4,35,215,216,216,38,195,114,219,162,
+    77,241,114,157,99,67,209,245,184,104,81,164,193,138,233,184,
+    72,194,148,235,92,128,99,190,212,64,162,65,154,105,86,175,
+    207,193,63,150,185,27,113,142,13,4,185,119,152,120,108,139,
+    13,50,48,205,16,187,195,176,144,106,76,252,75,181,4,220,
+    84,128,90,8,4,55,152,149,16,195,6,216,224,198,54,204,
+    113,20,114,46,51,145,24,187,125,125,59,206,49,17,152,110,
+    45,164,195,102,4,153,120,60,198,126,169,146,112,217,11,57,
+    18,236,124,44,192,210,48,217,38,145,9,145,177,64,170,160,
+    82,14,140,5,57,248,83,216,166,63,131,146,192,16,107,42,
+    154,88,83,211,42,200,249,106,70,75,107,24,29,173,101,244,
+    180,142,169,163,245,116,221,77,99,138,184,169,162,201,143,169,
+    53,82,77,48,6,198,248,11,216,130,95,170,10,8,233,22,
+    218,240,177,246,23,48,246,75,185,146,53,19,76,53,126,172,
+    93,163,224,95,19,252,107,174,90,82,207,212,223,84,211,84,
+    69,233,134,26,208,22,198,234,146,161,96,73,115,69,73,219,
+    43,234,169,175,128,182,215,128,118,64,232,134,10,232,198,87,
+    224,182,84,64,55,213,128,182,66,104,107,5,116,115,85,104,
+    219,199,68,25,156,147,182,195,17,66,163,162,165,29,144,174,
+    46,92,174,165,172,92,99,69,185,214,170,248,155,42,224,220,
+    85,241,53,51,109,176,213,206,138,86,183,87,133,70,227,164,
+    45,25,39,87,69,201,142,20,241,161,106,205,3,181,79,171,
+    104,204,203,57,228,223,0,1,209,24,61,240,55,231,185,129,
+    18,60,193,192,102,224,70,152,241,196,110,122,110,110,133,195,
+    158,56,102,118,79,60,20,217,10,7,184,80,44,234,185,25,
+    99,61,239,172,94,95,24,252,214,144,81,42,202,121,2,158,
+    141,208,250,198,96,152,185,195,132,7,60,220,70,40,238,129,
+    207,141,64,156,161,61,176,8,183,193,120,36,197,228,249,102,
+    52,18,224,160,44,210,249,250,110,178,177,136,231,58,206,203,
+    163,123,23,149,150,50,3,241,248,86,132,137,195,242,1,206,
+    179,29,219,242,220,13,193,38,221,96,96,118,140,131,10,195,
+    115,41,20,221,250,48,95,174,191,255,82,40,18,226,112,35,
+    227,253,253,82,154,231,106,52,188,237,185,11,5,51,14,11,
+    115,27,158,96,24,34,13,5,97,63,97,35,226,24,72,36,
+    131,225,219,254,155,80,177,138,134,205,130,212,139,250,8,86,
+    12,98,3,134,244,111,20,116,135,168,103,25,110,139,141,94,
+    9,234,136,226,15,89,59,164,160,126,251,63,96,240,231,170,
+    207,8,78,85,204,44,29,139,180,34,167,248,75,170,146,234,
+    164,38,169,45,181,24,42,34,169,78,171,171,193,151,226,228,
+    244,197,156,91,114,233,219,168,69,4,219,207,153,138,185,180,
+    234,104,24,111,201,24,127,2,45,246,231,154,82,158,251,83,
+    168,193,32,47,105,174,36,174,189,11,199,22,177,195,183,48,
+    67,121,144,121,10,177,112,204,2,30,153,150,158,173,56,26,
+    44,200,5,24,208,3,53,248,144,103,97,139,101,153,40,167,
+    128,130,201,211,158,99,9,245,177,33,95,157,168,139,111,65,
+    43,32,146,126,127,40,26,226,252,126,177,110,157,225,252,161,
+    120,128,117,195,250,69,29,198,36,26,150,62,12,50,155,104,
+    196,69,109,52,16,97,160,197,209,198,153,240,77,182,15,117,
+    220,135,123,143,130,227,168,140,193,239,199,163,239,247,199,81,
+    231,208,208,123,62,250,221,72,156,13,14,111,110,115,27,177,
+    232,240,58,19,25,31,14,198,34,155,177,40,108,90,124,24,
+    115,97,124,152,69,242,226,199,47,67,155,219,236,48,44,156,
+    176,23,133,104,168,208,198,119,96,70,60,9,131,191,255,136,
+    248,186,158,48,212,255,160,238,94,221,1,233,204,144,206,93,
+    103,250,212,222,205,253,152,64,46,3,114,153,39,151,159,155,
+    28,7,38,119,198,228,22,76,237,192,212,254,243,174,71,190,
+    140,233,56,111,58,254,204,214,154,83,171,173,163,207,29,109,
+    7,142,158,140,163,71,112,28,3,232,25,200,233,96,114,142,
+    40,4,47,53,90,123,253,87,4,12,114,132,214,92,159,211,
+    16,212,0,44,255,91,52,62,65,37,143,201,188,121,65,131,
+    60,177,218,156,153,36,252,114,30,167,123,5,148,166,24,47,
+    114,91,90,41,15,53,202,210,170,132,14,151,146,49,20,249,
+    204,95,167,192,42,231,167,201,195,177,170,94,187,29,37,45,
+    48,200,45,40,216,106,130,107,46,150,228,138,170,21,74,66,
+    169,28,60,46,147,11,37,94,191,185,106,109,114,234,173,250,
+    67,90,35,231,115,29,181,251,225,183,200,80,93,181,161,110,
+    201,80,126,91,181,212,91,114,234,45,123,213,82,14,185,150,
+    227,197,90,184,193,90,53,210,90,228,103,63,174,43,213,102,
+    176,181,50,93,75,240,140,190,18,15,89,5,143,171,24,175,
+    70,187,234,28,182,174,134,37,91,170,194,180,42,82,155,21,
+    113,185,158,117,13,44,235,150,219,133,180,159,225,10,139,6,
+    70,212,67,47,251,242,74,2,57,160,55,11,222,249,151,136,
+    109,67,132,5,5,31,17,22,159,86,212,220,9,197,68,42,
+    20,229,160,139,186,181,9,85,25,45,146,155,161,152,63,30,
+    74,48,82,44,0,221,254,16,177,9,161,219,88,68,121,145,
+    188,155,119,40,89,35,126,221,132,22,24,90,223,8,86,108,
+    162,25,41,196,232,86,196,31,140,65,125,43,106,55,195,161,
+    160,104,140,194,87,88,199,135,92,92,52,6,56,14,218,174,
+    107,40,93,23,12,195,170,69,19,130,231,54,88,38,64,199,
+    89,52,230,44,106,167,168,97,185,160,88,7,1,252,155,161,
+    40,75,161,36,93,40,118,99,43,206,34,89,18,173,55,2,
+    52,106,156,31,214,3,85,35,156,26,136,26,216,96,177,142,
+    102,110,6,182,194,28,107,69,152,16,227,136,90,26,250,193,
+    172,67,66,26,93,23,45,254,24,108,209,70,104,211,79,51,
+    119,66,65,212,206,173,0,156,121,88,253,177,155,55,75,50,
+    190,80,177,39,97,177,56,146,37,15,59,129,48,80,254,56,
+    52,181,155,146,230,77,52,43,53,174,34,227,6,42,117,29,
+    22,251,136,120,225,28,23,156,147,192,57,153,210,222,51,127,
+    173,39,92,29,63,38,31,146,232,229,121,223,192,227,250,131,
+    190,197,76,223,162,208,183,12,250,150,255,214,42,244,93,64,
+    57,128,108,1,100,79,150,164,238,153,15,72,79,134,244,8,
+    100,39,32,59,121,178,51,219,63,244,120,232,160,127,57,211,
+    191,44,244,175,128,254,21,9,188,21,144,199,190,38,137,182,
+    158,191,218,126,226,20,134,231,193,240,60,239,94,16,220,11,
+    192,189,32,65,184,178,189,253,143,34,160,119,18,244,158,149,
+    203,116,193,246,52,185,63,249,246,131,111,195,36,227,179,99,
+    67,255,108,251,209,54,138,2,178,59,219,230,125,184,6,218,
+    78,129,182,89,41,165,5,2,55,118,63,179,180,126,98,126,
+    96,206,186,220,217,70,87,182,177,35,103,208,53,26,95,18,
+    48,248,10,5,16,212,240,181,133,112,116,61,179,184,62,49,
+    61,48,41,225,28,8,206,129,224,28,8,142,204,217,136,206,
+    222,71,109,192,123,114,159,254,85,4,76,172,240,158,213,148,
+    22,144,109,89,152,60,8,58,81,114,232,169,227,215,78,222,
+    123,1,165,183,243,248,97,39,137,50,99,130,148,52,54,38,
+    125,90,100,76,160,136,200,89,183,148,106,80,118,49,20,10,
+    81,22,224,82,135,4,255,167,166,213,80,153,66,118,251,165,
+    174,136,197,175,47,198,171,97,76,214,50,31,213,219,84,132,
+    213,86,133,37,171,194,42,148,74,90,54,16,202,95,153,123,
+    103,58,28,134,237,129,53,80,138,218,100,163,144,128,255,47,
+    18,239,217,119,84,53,122,161,42,182,253,158,131,174,191,78,
+    40,49,29,189,164,178,78,88,106,16,149,58,82,239,234,15,
+    135,41,169,105,72,105,188,104,237,99,93,185,193,44,26,176,
+    154,99,81,52,67,214,98,234,91,107,109,85,227,72,235,63,
+    46,163,236,43,74,85,53,153,69,67,154,150,141,167,242,167,
+    52,128,116,29,52,114,134,95,64,14,255,165,204,229,165,116,
+    82,189,57,110,35,109,250,131,225,166,104,243,97,184,17,143,
+    250,26,18,199,22,98,209,40,19,228,240,92,112,117,248,170,
+    39,175,246,61,92,76,78,130,6,103,136,69,136,88,228,202,
+    248,116,98,221,102,48,228,135,169,82,4,150,128,54,16,70,
+    110,110,69,131,162,121,181,96,74,225,36,144,17,41,249,245,
+    90,8,78,6,70,71,162,113,104,144,117,52,19,14,108,87,
+    120,195,168,139,191,93,36,144,2,91,135,157,127,175,109,71,
+    165,244,138,147,42,165,216,20,21,207,99,162,180,171,159,168,
+    239,181,95,39,190,80,125,161,130,179,14,104,198,191,208,176,
+    136,241,217,179,40,56,3,131,47,212,162,122,104,68,212,192,
+    150,199,81,41,143,100,216,126,103,156,9,135,226,28,154,104,
+    156,73,140,84,154,53,232,11,228,169,51,52,19,142,5,3,
+    225,248,153,161,98,137,47,32,134,248,41,2,217,187,28,161,
+    233,172,47,6,207,29,205,95,107,8,107,203,110,215,195,129,
+    189,235,143,191,203,91,166,5,203,52,176,76,231,52,37,112,
+    88,171,163,69,200,97,72,168,137,203,243,172,63,255,62,34,
+    234,78,140,195,4,20,63,39,234,198,71,79,92,158,191,226,
+    107,98,47,192,119,177,30,78,136,161,183,66,51,254,205,24,
+    203,197,217,57,2,251,36,112,60,54,98,113,142,189,132,58,
+    109,194,105,12,28,80,54,202,112,162,22,229,136,245,193,205,
+    45,69,65,72,142,72,64,180,35,239,165,124,106,93,23,138,
+    251,217,173,27,219,44,154,73,177,215,16,50,43,130,43,169,
+    153,69,35,40,234,111,72,203,163,230,146,60,209,92,82,23,
+    156,171,163,69,213,184,168,15,108,110,50,81,26,15,143,79,
+    141,29,13,81,159,167,177,98,96,160,91,82,62,2,9,247,
+    171,198,231,30,26,139,191,199,190,71,78,79,64,171,191,6,
+    122,206,72,38,191,29,58,17,200,5,233,202,58,26,119,63,
+    216,27,125,50,247,183,115,57,141,218,5,13,51,12,190,66,
+    1,2,204,145,68,123,231,195,247,64,219,88,222,25,201,186,
+    61,15,47,0,247,120,193,149,40,125,125,110,106,56,48,117,
+    101,76,93,130,169,7,152,122,14,76,131,25,211,160,96,26,
+    6,166,225,28,209,108,184,168,202,182,180,131,150,145,253,147,
+    96,108,69,104,89,201,17,42,243,36,14,238,235,243,78,198,
+    196,125,253,3,227,125,99,78,83,200,129,45,104,237,128,101,
+    106,195,98,156,195,40,235,146,74,10,49,196,65,219,120,166,
+    109,92,104,155,4,109,147,7,109,171,153,182,85,161,237,34,
+    104,187,40,21,122,209,226,73,223,225,91,134,132,150,33,208,
+    50,148,90,188,119,49,11,125,48,35,232,155,67,113,64,245,
+    60,183,56,14,44,125,25,75,159,96,233,7,150,254,3,203,
+    76,198,50,35,88,206,0,203,25,56,151,53,91,49,80,78,
+    47,51,55,108,100,235,104,78,7,163,47,209,251,87,40,144,
+    80,181,231,168,60,124,251,1,213,147,161,122,126,30,218,55,
+    62,109,226,123,87,132,222,21,0,67,106,21,80,171,60,181,
+    154,165,44,229,80,205,124,239,170,208,187,10,96,72,93,0,
+    212,5,158,186,112,52,40,233,169,116,144,228,217,246,190,244,
+    221,67,245,113,137,97,75,42,76,178,100,236,75,13,11,52,
+    196,170,234,235,51,92,93,49,14,221,37,205,99,237,33,74,
+    253,40,120,208,44,237,109,224,65,6,236,48,60,68,90,75,
+    84,249,149,153,236,35,204,222,161,195,226,219,81,115,230,98,
+    126,82,5,205,80,169,99,161,78,215,17,85,126,165,152,252,
+    178,155,113,175,159,54,66,67,101,74,120,175,51,146,145,186,
+    118,121,78,54,82,177,168,135,129,186,202,131,166,90,67,127,
+    88,115,194,254,9,140,178,1,20,224,153,141,66,61,177,12,
+    12,18,190,74,133,180,25,9,84,179,20,255,138,80,90,138,
+    54,99,49,120,110,177,67,75,97,110,186,31,124,16,222,179,
+    63,118,243,212,132,64,77,0,106,2,90,10,37,28,102,111,
+    246,38,10,214,81,128,12,5,187,129,130,16,10,16,91,179,
+    183,9,252,121,196,4,141,50,82,231,104,245,248,138,207,128,
+    181,183,164,199,183,81,128,134,94,154,178,22,151,88,13,216,
+    6,160,217,43,139,198,82,90,226,139,68,182,68,19,236,16,
+    156,28,226,79,85,62,141,164,174,173,10,252,126,172,214,69,
+    13,84,246,113,13,166,79,94,127,27,139,4,73,52,86,165,
+    211,95,35,154,124,41,209,68,47,147,163,185,21,52,15,236,
+    113,96,120,73,104,94,130,58,166,13,106,105,24,124,133,2,
+    158,116,65,253,98,104,145,102,135,63,119,237,77,63,89,230,
+    189,11,130,119,1,192,144,92,4,228,34,79,46,102,73,151,
+    2,224,60,239,93,20,188,139,0,134,228,18,32,151,120,114,
+    233,80,0,104,64,28,206,3,123,79,198,222,35,216,143,1,
+    251,177,3,251,104,198,62,42,216,199,128,125,12,54,211,80,
+    143,131,212,194,179,190,19,89,247,32,180,37,62,168,9,97,
+    240,21,10,82,11,63,186,248,195,139,63,184,124,239,50,212,
+    154,60,84,156,154,66,129,74,21,133,226,88,69,233,9,73,
+    69,65,198,87,95,89,254,130,96,175,19,165,51,112,243,70,
+    32,238,135,230,90,178,220,9,167,130,164,37,57,255,14,149,
+    171,195,84,125,222,224,72,109,85,214,169,41,212,233,33,202,
+    23,33,105,85,249,226,50,108,77,98,69,177,168,76,199,160,
+    12,70,99,156,103,35,112,135,241,44,66,193,68,159,47,227,
+    67,158,111,198,25,207,251,37,45,233,243,189,143,92,74,204,
+    60,248,67,196,16,250,116,119,37,198,173,70,54,195,76,132,
+    129,94,34,189,196,178,49,182,178,175,136,251,170,247,181,36,
+    231,63,160,114,46,220,215,23,245,222,156,90,101,30,123,169,
+    209,52,32,102,105,64,236,100,48,30,137,226,95,168,175,188,
+    203,254,25,18,141,242,134,24,81,135,160,143,1,29,223,18,
+    38,46,38,11,8,85,129,220,246,20,247,138,10,45,68,249,
+    52,29,121,172,87,124,42,236,212,85,214,141,87,217,43,235,
+    46,38,255,6,149,48,22,234,190,151,128,226,113,164,254,178,
+    255,24,213,87,181,195,13,168,103,193,24,116,26,225,240,192,
+    106,18,45,101,189,86,228,253,39,132,224,71,40,168,93,105,
+    75,69,159,139,10,24,54,228,19,2,59,129,184,255,225,106,
+    237,105,43,241,57,21,149,99,6,72,244,149,209,165,38,228,
+    51,132,215,92,36,21,104,232,227,201,190,202,134,107,11,13,
+    127,146,111,120,154,168,246,171,226,40,84,253,148,84,6,167,
+    86,46,229,163,207,63,143,213,165,118,103,93,85,178,164,175,
+    170,110,166,149,203,165,21,115,60,233,99,208,255,42,0,168,
+    33,125,69,93,156,11,64,111,253,125,2,79,229,140,121,74,
+    161,79,106,36,138,163,9,147,100,21,140,136,128,121,71,221,
+    18,151,193,164,164,188,250,199,159,113,68,82,34,117,130,41,
+    213,250,142,188,122,87,150,139,39,58,42,245,127,9,192,223,
+    17,104,221,144,192,163,99,109,252,172,227,211,14,193,218,9,
+    172,157,41,125,214,238,250,236,236,167,103,5,123,55,176,119,
+    167,200,103,173,221,80,99,175,240,173,75,66,235,18,104,93,
+    226,91,150,161,55,222,144,37,235,15,200,142,12,217,145,214,
+    62,106,16,200,17,64,142,240,133,7,143,177,168,143,109,113,
+    116,136,13,42,221,39,52,67,194,99,61,225,173,212,131,104,
+    29,236,177,230,23,48,255,151,50,173,225,248,105,20,48,218,
+    82,218,239,104,146,154,234,238,25,116,128,52,213,210,75,185,
+    163,194,73,171,141,237,8,206,91,21,108,85,221,57,90,183,
+    174,170,178,6,33,175,185,65,7,239,223,238,104,75,250,173,
+    231,26,20,173,209,22,215,135,202,62,134,215,253,68,251,121,
+    217,71,154,29,93,82,87,195,133,181,23,227,52,73,27,96,
+    171,94,237,194,214,194,211,168,192,99,132,180,170,186,6,88,
+    187,213,176,4,85,189,68,218,92,45,253,85,84,71,147,138,
+    67,122,81,107,140,117,229,144,247,126,93,50,6,166,10,186,
+    42,62,98,221,146,199,103,71,127,36,122,83,73,253,27,211,
+    91,137,199,76,215,31,138,231,200,61,46,233,111,67,89,127,
+    235,74,164,85,77,91,30,91,75,235,221,33,147,117,53,106,
+    34,223,72,26,107,99,123,19,105,172,129,173,132,123,109,180,
+    253,48,106,114,94,69,75,136,180,149,168,242,43,155,212,217,
+    14,135,41,173,101,145,184,175,121,79,243,93,216,134,29,195,
+    142,177,100,84,28,73,195,79,136,55,150,241,198,183,36,225,
+    246,106,80,201,178,73,232,91,224,238,38,186,249,16,44,198,
+    91,242,58,237,45,185,149,180,165,248,213,250,86,147,28,147,
+    63,109,178,227,71,234,169,19,142,175,179,26,84,217,216,253,
+    190,45,148,163,175,221,66,215,91,105,225,81,70,162,133,110,
+    125,11,88,220,135,83,35,221,66,84,249,189,86,127,20,31,
+    180,111,21,63,90,43,41,222,86,136,237,152,142,68,231,182,
+    164,233,208,222,87,183,245,237,85,108,189,58,221,94,21,22,
+    203,54,221,81,190,221,104,135,130,216,59,106,151,40,215,6,
+    101,122,220,83,134,205,92,170,199,31,123,203,242,235,147,245,
+    175,221,62,115,13,77,93,159,246,84,75,63,68,83,215,192,
+    198,45,212,238,85,21,28,213,199,163,243,200,181,41,199,191,
+    43,73,189,169,181,78,154,143,108,215,42,236,241,125,205,61,
+    93,77,235,93,247,202,81,239,46,27,163,134,114,95,187,194,
+    122,91,146,13,53,106,178,188,145,245,174,141,237,77,172,119,
+    13,108,37,60,209,115,8,79,52,212,224,137,222,170,254,120,
+    103,225,237,150,188,181,104,199,154,180,166,187,171,247,138,62,
+    150,180,222,234,145,223,173,183,122,229,118,148,108,223,217,177,
+    113,87,139,229,202,102,171,246,255,59,222,197,123,108,193,183,
+    128,163,241,122,178,238,72,218,107,140,171,163,130,134,53,32,
+    233,190,163,66,190,6,78,95,133,247,30,79,218,142,32,217,
+    253,73,251,33,114,109,171,193,53,199,171,112,77,45,158,183,
+    189,146,191,250,10,177,157,198,100,99,77,254,26,72,54,42,
+    248,171,177,38,127,53,149,72,186,5,106,248,193,50,73,175,
+    79,54,213,212,215,111,34,233,181,177,121,222,0,91,13,235,
+    147,108,172,224,196,26,245,150,105,110,199,161,154,251,40,120,
+    134,32,197,125,242,155,58,97,68,43,71,135,204,20,254,95,
+    146,243,215,245,57,222,134,156,15,255,1,228,124,164,138,156,
+    31,101,252,14,151,243,90,88,94,199,235,104,170,161,43,70,
+    95,67,87,52,85,240,145,82,158,251,242,187,197,78,148,73,
+    125,115,137,245,31,43,27,77,103,201,250,145,82,247,244,203,
+    49,121,103,75,217,154,210,201,219,184,157,108,83,210,89,163,
+    119,227,229,45,142,94,250,61,234,155,56,180,190,201,138,250,
+    28,220,119,138,249,183,228,141,185,244,84,5,213,157,71,154,
+    39,143,29,170,51,106,224,73,54,191,145,6,173,141,237,77,
+    124,165,218,216,60,111,15,91,217,154,128,165,198,170,95,245,
+    177,31,170,94,27,196,82,125,37,176,58,150,225,234,88,14,
+    95,3,92,39,118,92,73,87,117,172,233,145,106,45,192,235,
+    93,167,74,177,38,204,132,132,231,245,250,46,111,247,46,107,
+    117,1,91,115,117,26,208,211,53,224,95,167,23,170,183,214,
+    139,19,111,216,139,211,85,225,143,194,99,61,73,215,33,50,
+    121,84,207,161,165,70,159,198,100,136,86,200,33,110,46,164,
+    104,201,225,250,108,188,122,187,42,108,242,165,29,67,210,253,
+    58,163,150,52,192,81,155,41,237,123,73,123,202,214,221,160,
+    119,130,82,91,74,96,90,203,36,205,128,96,214,53,40,196,
+    99,224,190,119,249,72,163,48,155,116,31,226,245,188,49,165,
+    118,218,146,240,63,201,183,74,192,84,182,129,251,99,69,205,
+    103,94,233,67,31,70,195,60,222,74,74,210,150,117,21,162,
+    194,78,251,145,250,127,54,217,126,232,234,83,181,62,79,20,
+    98,108,103,205,122,148,158,198,185,67,231,178,213,117,188,243,
+    149,237,153,44,196,118,58,146,29,53,103,26,115,201,14,197,
+    76,163,163,230,76,195,147,244,28,129,98,243,37,45,152,42,
+    196,14,181,176,71,193,221,70,47,188,21,60,139,181,230,193,
+    229,186,227,208,186,170,123,44,75,244,242,122,197,42,93,205,
+    49,244,84,25,195,83,133,183,29,111,210,91,115,228,206,39,
+    189,138,145,243,214,28,185,206,100,231,145,70,206,123,107,186,
+    240,118,40,157,143,130,241,109,209,185,179,6,157,87,94,195,
+    207,174,92,9,36,110,157,46,188,237,116,37,187,94,65,229,
+    46,5,149,187,106,82,185,59,217,125,36,42,119,189,6,149,
+    143,130,241,109,81,185,251,45,80,185,187,2,178,214,122,102,
+    67,133,37,217,46,230,150,205,159,123,146,61,233,217,170,88,
+    52,21,245,245,164,207,84,131,228,190,95,140,223,58,87,136,
+    165,231,170,98,85,209,171,135,208,170,39,61,255,22,106,185,
+    112,200,105,130,139,215,9,223,165,196,95,47,176,76,128,195,
+    39,195,25,207,251,239,211,220,141,247,223,247,4,162,52,142,
+    199,97,252,102,40,204,196,243,7,195,209,79,134,191,27,147,
+    242,60,33,233,88,186,180,69,99,26,21,196,123,61,135,74,
+    112,21,146,32,74,5,178,233,205,0,27,136,200,69,23,67,
+    44,19,228,98,236,54,218,120,6,19,55,183,164,13,164,249,
+    54,20,74,225,195,130,210,201,6,141,104,196,231,233,130,76,
+    56,28,23,141,104,71,75,62,110,64,251,215,113,244,119,170,
+    225,4,133,79,30,15,222,9,177,92,40,150,168,147,182,175,
+    156,19,85,31,138,38,169,105,126,110,123,147,145,246,198,104,
+    88,102,93,212,7,55,98,113,38,42,146,232,128,124,128,93,
+    143,39,76,113,142,134,109,26,220,12,112,27,137,250,97,116,
+    248,238,28,186,21,4,253,68,45,218,64,137,79,92,248,212,
+    236,207,80,243,254,57,12,18,54,46,20,97,208,225,253,65,
+    249,60,99,136,248,187,175,117,9,4,127,142,253,24,193,144,
+    145,200,214,32,170,61,97,196,141,28,136,223,57,57,149,104,
+    148,226,193,27,177,200,224,13,116,27,200,32,234,155,34,57,
+    161,72,22,245,113,46,192,109,197,69,109,236,118,96,59,97,
+    144,128,66,241,64,162,33,136,129,228,218,69,29,206,75,24,
+    135,208,25,69,84,138,73,56,228,163,148,131,232,196,35,27,
+    11,135,25,214,167,18,27,138,71,44,49,29,19,245,249,202,
+    55,183,6,97,86,80,172,219,220,128,163,27,102,68,77,60,
+    22,100,63,68,157,129,35,128,118,7,14,162,19,143,203,136,
+    12,232,235,217,151,104,131,93,194,46,163,139,15,50,31,114,
+    76,148,102,232,252,184,12,224,51,149,35,236,130,130,126,255,
+    18,163,147,178,33,232,157,47,209,140,226,75,116,132,44,97,
+    146,82,209,49,205,17,159,182,72,110,246,81,161,160,168,217,
+    12,134,88,164,129,19,14,24,27,68,167,39,6,131,129,200,
+    224,186,116,211,203,151,104,66,145,104,148,179,24,69,94,98,
+    252,74,204,131,118,253,6,184,208,141,80,56,196,109,123,226,
+    248,82,21,124,95,3,98,199,56,195,65,128,232,205,252,217,
+    5,255,221,16,205,109,224,125,90,155,129,32,35,106,165,227,
+    167,80,198,240,182,94,216,33,228,19,178,104,75,90,194,92,
+    164,117,36,176,153,232,187,182,176,234,145,147,32,210,173,40,
+    231,137,111,196,182,194,52,186,156,97,51,118,151,97,209,5,
+    18,39,18,182,146,130,240,255,248,237,4,69,71,2,131,133,
+    173,114,236,55,80,191,141,69,34,135,136,115,83,68,194,82,
+    44,7,101,13,194,137,250,104,124,234,196,248,136,72,70,227,
+    163,19,227,227,35,1,209,36,137,133,63,18,129,178,145,127,
+    25,192,47,198,162,220,254,174,24,191,113,197,183,192,162,79,
+    171,44,250,30,142,119,37,139,86,212,233,5,196,38,242,181,
+    52,86,196,154,165,73,22,233,244,200,66,158,186,144,207,30,
+    226,209,130,141,100,127,140,112,161,15,208,44,250,184,42,26,
+    100,132,162,65,70,132,247,192,177,72,247,137,20,28,162,8,
+    100,63,127,24,29,90,50,48,209,173,8,195,66,118,102,255,
+    1,2,249,8,131,44,92,251,230,156,140,69,139,246,71,195,
+    170,226,1,209,194,68,241,230,231,181,16,146,47,255,205,184,
+    168,187,19,8,111,49,202,179,52,8,173,116,164,184,4,58,
+    129,160,235,243,55,40,248,37,198,16,141,232,218,11,58,22,
+    9,132,162,232,124,48,148,56,22,89,97,118,31,181,194,44,
+    245,249,90,94,86,154,228,1,41,33,13,139,62,215,227,147,
+    64,88,110,196,22,204,141,176,63,243,129,120,40,120,45,20,
+    91,196,212,71,151,255,20,79,69,137,90,180,67,29,139,141,
+    168,139,250,227,108,144,141,160,184,69,201,157,55,66,92,92,
+    84,71,198,69,221,205,0,23,8,67,197,136,50,145,82,202,
+    71,113,39,141,80,22,150,105,14,95,152,68,161,163,72,232,
+    28,53,6,194,111,104,187,32,126,35,145,222,192,49,157,180,
+    117,220,128,18,48,227,138,102,188,181,183,148,33,77,72,79,
+    250,17,76,136,102,175,160,134,35,91,203,162,229,108,182,17,
+    15,18,28,103,63,11,149,108,20,221,107,68,221,101,67,28,
+    179,200,197,151,161,202,23,213,49,116,26,27,234,91,81,123,
+    43,6,105,91,200,189,129,114,125,189,210,126,198,52,238,61,
+    86,101,162,22,33,18,13,242,54,72,81,139,176,178,255,2,
+    51,20,82,209,126,92,139,17,71,165,34,170,16,251,239,49,
+    41,241,181,37,38,124,116,59,63,84,184,175,184,128,65,214,
+    150,34,9,117,93,62,17,197,112,162,52,100,70,172,197,164,
+    60,116,60,221,95,208,114,152,15,164,81,50,32,165,149,47,
+    142,232,154,199,137,162,184,165,31,98,154,97,32,169,17,44,
+    218,250,202,254,13,10,254,51,202,67,103,203,145,240,75,212,
+    53,96,234,226,146,87,240,59,58,52,46,189,35,10,139,36,
+    27,93,151,106,211,220,132,50,140,156,75,207,145,126,249,237,
+    160,5,38,44,240,18,199,50,76,201,118,208,106,0,232,226,
+    150,248,123,13,104,59,232,215,22,194,234,74,207,237,123,159,
+    124,192,91,230,4,203,28,176,204,165,116,207,26,154,238,199,
+    127,144,188,151,76,105,179,36,245,35,211,15,77,247,151,14,
+    28,199,51,142,227,130,99,16,56,6,5,114,8,144,67,60,
+    57,116,104,238,1,217,150,33,219,118,191,207,183,15,9,228,
+    48,32,135,121,114,248,185,171,237,97,71,142,48,26,218,113,
+    144,90,125,102,111,225,91,103,127,126,125,207,245,184,67,232,
+    57,5,122,78,193,87,233,17,236,103,128,253,76,106,49,75,
+    89,208,166,255,223,56,251,247,102,159,76,61,233,23,156,75,
+    192,185,36,80,203,128,90,230,169,229,124,246,51,139,39,235,
+    112,193,231,179,171,159,94,77,175,62,186,42,56,78,2,199,
+    201,108,83,235,103,177,79,99,233,208,95,70,127,22,21,122,
+    39,64,239,132,208,52,9,154,38,95,106,84,141,83,47,117,
+    90,171,237,43,2,6,47,53,122,115,253,87,4,12,114,56,
+    168,39,204,86,132,118,87,43,80,109,128,106,227,241,243,2,
+    18,103,91,104,240,130,6,47,36,143,189,249,193,44,176,15,
+    166,200,60,41,126,227,232,77,39,246,87,246,167,5,199,25,
+    224,56,35,144,103,1,121,150,39,207,42,178,119,248,201,243,
+    252,196,138,224,88,5,142,85,129,188,0,200,11,60,121,161,
+    64,202,69,129,116,1,210,197,147,46,116,48,222,189,187,252,
+    201,213,7,87,83,134,103,141,109,123,214,253,15,248,198,83,
+    66,227,41,208,120,42,101,204,146,214,252,133,43,45,7,174,
+    241,140,107,92,112,77,2,215,164,64,78,1,114,138,39,167,
+    14,203,207,233,9,131,77,130,248,141,203,199,247,159,121,234,
+    122,106,18,92,151,128,235,146,64,94,6,228,101,158,188,252,
+    162,217,147,118,28,120,199,50,222,49,193,59,14,188,227,7,
+    222,179,25,239,89,193,59,7,188,115,66,243,60,104,158,207,
+    17,199,12,93,47,81,240,131,243,169,185,20,7,7,115,119,
+    58,237,221,157,222,157,22,236,189,192,222,91,54,120,61,130,
+    243,28,112,158,19,168,57,64,205,241,212,156,156,217,183,215,
+    184,175,59,24,153,207,140,204,63,29,21,70,150,192,200,146,
+    224,92,6,206,101,129,58,15,168,243,60,117,94,129,103,122,
+    63,41,56,23,129,115,81,160,150,0,181,196,83,75,217,6,
+    251,189,237,123,59,187,223,0,13,29,160,97,4,52,76,228,
+    8,157,217,150,181,56,62,51,125,106,122,230,232,206,58,135,
+    247,29,7,163,171,153,209,85,97,244,34,24,189,248,82,163,
+    110,108,250,138,128,193,75,77,129,5,114,56,48,18,22,199,
+    91,68,38,113,17,106,246,212,254,183,4,231,12,112,206,8,
+    212,44,160,102,121,106,86,230,220,206,172,163,35,237,120,228,
+    122,212,182,247,1,240,142,30,120,207,101,188,231,4,239,60,
+    240,206,67,220,8,163,26,113,168,22,113,40,186,3,7,7,
+    20,225,112,62,56,11,236,125,123,86,96,63,14,236,227,10,
+    98,247,241,190,233,39,139,130,115,14,56,231,4,106,30,80,
+    243,60,53,15,115,15,40,111,134,242,166,39,211,62,129,26,
+    0,212,0,79,13,100,91,58,126,58,248,23,131,124,223,204,
+    222,7,48,144,30,161,101,22,180,204,166,46,226,34,237,25,
+    170,125,55,145,14,236,38,118,19,2,213,15,168,126,158,234,
+    127,209,220,206,119,140,11,205,19,160,121,34,181,242,204,233,
+    217,183,242,206,49,193,57,6,156,99,169,213,108,75,215,65,
+    203,241,76,203,113,126,224,220,254,40,12,164,71,104,153,3,
+    45,115,8,173,227,71,87,127,120,117,119,245,192,61,147,113,
+    207,8,238,51,192,125,70,160,206,2,234,44,79,157,205,231,
+    126,126,145,239,59,35,184,207,2,247,89,129,58,7,168,115,
+    60,117,14,102,73,199,21,121,40,198,212,36,160,38,121,106,
+    50,15,255,27,247,192,222,119,158,180,62,49,11,238,101,224,
+    46,114,206,115,137,40,187,164,64,121,1,229,229,41,111,150,
+    106,60,160,220,25,202,189,251,174,64,117,2,170,147,167,58,
+    97,228,121,94,10,161,92,182,75,87,67,188,128,252,60,254,
+    201,153,7,103,82,228,51,135,123,79,181,31,224,29,83,130,
+    99,10,56,166,82,134,44,105,249,81,195,15,27,118,13,7,
+    206,177,12,234,250,56,112,142,11,228,4,32,39,120,114,226,
+    72,185,159,155,210,43,130,115,16,56,149,122,211,114,64,122,
+    51,164,55,61,147,134,106,115,20,144,163,60,57,10,229,213,
+    218,248,192,12,44,93,41,93,182,177,229,160,113,60,211,56,
+    14,187,113,255,110,90,247,168,126,95,247,171,122,200,39,77,
+    232,184,109,147,49,101,132,202,195,233,254,228,206,131,59,41,
+    234,217,81,132,88,103,232,193,129,36,196,217,166,142,131,166,
+    99,153,166,99,101,44,209,52,11,154,102,83,80,16,157,7,
+    84,71,134,234,72,215,9,84,31,160,250,120,170,175,152,166,
+    17,168,110,64,117,243,84,247,81,225,16,40,9,117,145,43,
+    67,186,158,81,110,190,237,196,254,37,73,65,192,46,25,80,
+    151,12,198,28,14,160,206,178,31,144,93,25,178,43,253,39,
+    124,247,73,129,28,7,228,56,79,142,23,72,109,20,200,46,
+    64,118,241,100,23,4,133,66,188,35,105,105,135,243,192,49,
+    150,113,140,33,114,221,217,229,30,238,236,209,143,35,72,100,
+    17,238,70,99,202,240,53,73,64,5,171,122,50,202,59,102,
+    5,199,44,112,204,162,193,45,40,80,215,129,235,100,198,117,
+    82,112,77,0,215,132,64,78,2,114,146,39,39,75,242,79,
+    101,92,167,4,215,105,224,58,45,144,51,128,156,225,201,153,
+    231,182,214,3,91,87,198,214,149,94,20,108,62,96,243,165,
+    234,228,34,80,227,238,249,246,215,247,191,35,184,206,2,215,
+    89,129,60,7,200,115,60,121,174,4,96,224,137,227,95,183,
+    60,13,252,77,59,63,181,34,184,86,129,171,104,45,94,52,
+    183,254,30,131,219,250,89,228,211,8,223,61,181,55,10,3,
+    233,17,154,78,129,166,83,127,144,161,125,174,232,19,223,127,
+    246,169,91,112,93,1,174,43,2,121,21,144,87,121,242,170,
+    220,231,207,91,249,158,211,130,107,6,184,102,4,114,22,144,
+    179,60,57,139,51,59,51,100,103,250,114,26,146,105,12,144,
+    99,60,57,246,188,32,89,242,13,54,200,88,182,101,155,157,
+    233,111,236,123,159,126,35,135,134,246,37,161,24,95,61,225,
+    104,45,200,241,11,83,125,138,67,172,209,3,21,187,96,154,
+    4,166,201,39,163,25,211,12,111,154,81,40,151,162,142,134,
+    207,51,179,229,190,227,65,27,176,30,3,214,41,193,124,10,
+    152,79,61,121,39,99,62,203,155,207,42,138,204,10,212,25,
+    64,157,225,241,243,130,170,191,183,194,55,66,70,190,12,168,
+    203,60,117,57,223,104,201,12,142,63,57,38,56,231,129,115,
+    94,32,23,0,185,192,147,11,136,183,173,191,175,54,65,185,
+    83,25,231,148,224,156,6,206,105,129,60,13,200,211,60,121,
+    58,95,53,148,173,172,165,49,107,113,29,88,186,50,22,200,
+    151,143,46,131,238,105,208,189,40,88,150,128,101,41,139,24,
+    182,39,99,235,73,211,232,78,159,25,208,187,44,216,206,3,
+    219,121,232,39,89,87,84,208,81,202,27,31,232,40,33,169,
+    212,35,169,68,65,11,97,115,164,244,207,201,250,251,221,15,
+    6,129,173,239,192,54,150,177,141,61,241,62,245,242,182,49,
+    193,182,8,108,208,171,89,76,233,179,16,194,87,86,197,170,
+    96,187,0,108,23,32,103,151,230,175,11,182,33,96,131,234,
+    111,40,165,71,164,105,120,139,184,111,9,182,81,96,27,133,
+    170,21,165,231,71,165,111,207,185,63,81,70,55,88,113,179,
+    71,210,132,123,90,161,105,16,52,13,166,76,121,159,207,7,
+    236,39,82,228,243,198,230,148,241,133,181,233,207,227,187,39,
+    31,206,130,214,81,208,122,90,104,158,1,205,51,130,117,22,
+    88,103,209,41,73,41,72,65,87,167,105,183,251,225,32,104,
+    25,57,104,57,157,105,57,13,217,117,247,131,156,134,104,157,
+    129,172,218,138,14,183,182,214,191,176,58,238,127,227,147,166,
+    7,77,187,222,79,90,118,255,248,175,186,246,54,190,24,124,
+    60,248,196,43,244,159,230,45,51,47,117,234,214,89,8,109,
+    158,77,93,72,93,200,145,121,150,65,173,239,144,189,226,194,
+    197,123,47,28,205,187,218,135,102,224,28,2,144,35,28,167,
+    128,227,20,212,106,38,199,174,33,61,247,99,179,96,234,205,
+    17,42,195,153,103,148,149,183,21,153,253,185,173,73,65,231,
+    172,221,189,251,193,39,179,105,212,76,251,73,88,177,29,73,
+    148,221,248,220,108,73,45,193,198,216,109,169,58,153,113,177,
+    207,49,251,228,174,224,60,15,156,231,5,114,5,144,43,60,
+    185,242,220,212,112,111,22,152,188,248,226,6,149,225,148,108,
+    219,247,234,5,247,36,112,79,10,212,20,160,166,120,106,170,
+    32,214,164,64,122,1,233,229,73,239,235,105,113,133,75,11,
+    89,125,247,187,123,139,143,47,131,129,37,254,120,222,19,168,
+    98,77,148,30,240,233,39,27,79,214,4,215,10,112,173,8,
+    228,42,32,87,121,114,85,86,78,216,46,13,239,187,14,70,
+    231,51,163,243,79,79,10,163,43,96,52,127,223,66,117,188,
+    88,107,173,236,221,226,187,78,9,228,52,32,167,121,114,58,
+    91,161,184,164,30,110,151,117,111,7,241,240,254,187,191,122,
+    175,70,247,242,230,1,156,186,192,79,93,44,115,218,127,223,
+    38,43,21,109,213,246,66,79,123,35,165,201,218,155,164,99,
+    219,82,123,131,143,194,251,11,191,186,4,241,162,187,184,96,
+    144,34,149,140,177,231,126,162,1,83,43,252,228,170,224,188,
+    0,156,80,38,47,2,242,34,79,94,204,202,170,233,117,218,
+    106,205,59,72,179,233,97,129,60,1,200,19,60,121,34,91,
+    193,61,5,111,14,14,103,27,32,219,120,178,237,69,189,245,
+    7,204,61,6,182,158,52,229,141,183,67,118,245,228,180,207,
+    109,15,155,127,234,254,11,119,250,230,94,184,204,168,31,5,
+    70,122,142,122,24,61,65,14,195,185,249,240,29,58,80,227,
+    200,48,62,146,141,150,13,164,41,124,201,145,225,178,188,255,
+    174,82,28,78,119,165,18,175,56,156,174,87,149,31,202,84,
+    222,215,81,182,201,64,117,27,127,232,98,103,104,149,242,122,
+    178,146,219,49,21,208,197,195,23,37,208,242,199,50,90,93,
+    146,46,127,120,162,53,37,233,242,33,201,168,179,172,222,67,
+    75,36,137,163,220,137,145,63,206,171,189,130,63,12,132,165,
+    222,156,35,212,4,187,11,35,62,82,212,132,153,168,104,242,
+    223,144,47,10,151,150,54,27,138,9,248,42,67,209,174,72,
+    64,223,66,208,5,173,162,233,54,190,46,91,130,48,161,5,
+    183,109,255,102,12,221,77,216,128,110,46,68,87,68,249,185,
+    13,116,25,120,197,152,91,252,155,44,227,15,69,227,92,32,
+    202,133,208,55,128,86,229,17,223,178,204,255,137,70,253,46,
+    129,143,233,35,215,6,78,90,5,147,7,152,60,105,232,213,
+    116,243,166,238,236,192,112,106,17,93,151,224,203,142,156,4,
+    35,231,158,90,193,200,130,148,50,152,237,59,33,197,122,138,
+    49,158,234,121,222,119,188,34,25,175,231,184,51,164,91,150,
+    24,197,213,121,162,17,243,97,8,221,175,94,114,12,24,141,
+    21,230,184,95,87,112,92,201,54,70,213,227,178,143,230,149,
+    247,190,236,168,107,221,208,82,118,101,153,186,218,85,124,73,
+    196,117,50,231,84,191,78,239,168,119,176,166,13,71,129,163,
+    209,177,81,249,242,54,191,188,229,10,150,175,186,97,138,83,
+    28,135,170,118,220,180,226,163,169,71,1,47,111,43,174,190,
+    121,248,48,220,180,190,148,214,37,45,151,55,76,98,121,169,
+    187,242,46,186,1,20,93,173,233,143,69,195,219,203,232,211,
+    74,112,35,20,166,217,122,149,44,71,79,27,160,28,253,27,
+    24,241,57,88,68,97,22,85,37,173,204,227,251,91,252,104,
+    221,152,109,80,225,143,34,136,107,176,228,72,75,208,51,4,
+    190,151,19,165,178,223,67,9,255,144,40,124,86,32,105,238,
+    6,22,41,22,233,83,246,63,162,180,186,24,190,24,57,142,
+    151,154,217,255,138,130,23,40,248,111,40,147,66,5,10,66,
+    89,56,99,143,254,165,6,214,134,228,166,228,120,189,13,97,
+    150,20,42,23,203,95,198,217,166,148,188,138,236,255,141,112,
+    160,94,66,217,179,184,159,217,218,247,28,60,244,90,177,239,
+    250,164,7,206,67,172,104,30,98,69,230,203,106,76,233,160,
+    237,234,28,56,240,78,103,188,211,130,119,6,120,103,82,186,
+    123,38,40,75,217,246,46,116,199,37,190,64,51,103,36,12,
+    230,3,178,61,67,182,11,164,7,144,30,158,244,160,213,65,
+    104,219,228,181,65,140,39,127,251,214,115,36,150,200,26,254,
+    188,243,81,63,232,28,19,200,147,128,60,201,147,39,159,245,
+    28,123,244,71,127,249,221,159,125,247,25,156,138,92,0,84,
+    219,110,18,154,210,94,212,150,94,163,84,24,89,116,248,84,
+    218,9,196,7,88,106,17,19,160,203,126,104,213,207,36,123,
+    229,211,38,204,80,125,197,99,97,102,150,227,182,175,143,36,
+    172,104,81,127,246,123,40,244,227,207,52,59,9,151,194,40,
+    205,126,79,241,178,35,170,217,187,213,13,93,51,54,102,210,
+    61,171,254,130,238,68,31,118,59,203,13,94,37,140,25,182,
+    55,222,132,135,33,167,213,89,160,163,160,8,242,215,148,248,
+    212,236,0,129,254,53,10,47,186,107,27,113,131,223,47,26,
+    253,254,72,140,222,10,163,56,229,247,127,176,21,8,231,115,
+    234,252,126,58,22,132,17,77,156,99,89,180,169,137,245,162,
+    0,201,28,190,24,155,69,219,46,88,180,111,132,125,23,5,
+    50,163,138,90,104,14,194,108,10,189,35,26,178,72,220,216,
+    127,132,130,127,130,153,15,5,159,162,224,1,10,254,41,10,
+    126,138,2,204,209,104,179,9,171,70,49,19,10,208,233,69,
+    182,9,197,92,72,84,204,249,155,189,209,7,95,191,223,167,
+    98,199,11,84,60,39,93,156,116,172,16,160,79,30,113,135,
+    6,95,209,93,248,47,167,54,232,200,28,129,130,166,122,93,
+    253,115,91,99,78,7,255,162,251,120,122,114,117,40,70,18,
+    214,158,156,1,197,140,68,203,72,206,132,98,20,97,172,207,
+    153,81,140,168,21,120,8,125,195,71,223,225,27,58,5,93,
+    23,208,117,229,212,199,116,23,85,57,162,24,190,212,16,250,
+    238,98,206,59,170,30,156,85,17,94,81,89,17,206,210,160,
+    183,28,187,74,215,184,203,193,201,132,174,177,24,20,107,64,
+    41,250,242,34,90,157,113,151,75,47,62,76,228,8,24,45,
+    6,197,98,40,133,170,172,201,177,187,136,240,59,138,129,178,
+    38,71,101,77,42,93,203,238,50,2,108,41,6,202,34,45,
+    213,138,56,210,142,215,173,197,183,135,73,224,43,6,202,34,
+    190,106,36,24,69,93,30,85,118,121,52,71,237,104,116,179,
+    123,99,57,2,253,221,63,41,253,173,18,126,191,46,143,207,
+    43,232,58,129,174,83,234,74,161,115,93,114,74,69,181,6,
+    93,7,98,185,142,98,181,40,165,169,28,155,93,103,228,7,
+    97,101,118,52,48,133,160,136,26,165,244,151,151,209,235,140,
+    123,142,189,224,99,87,142,208,163,18,133,160,88,172,36,185,
+    24,72,183,125,33,49,241,13,97,131,33,234,185,237,77,232,
+    139,73,2,139,173,138,49,50,62,20,187,113,11,186,105,113,
+    233,178,75,228,59,224,43,25,37,123,134,92,5,22,249,1,
+    248,206,106,124,33,164,36,218,102,89,230,145,201,195,23,92,
+    75,247,70,227,107,168,145,45,149,174,141,182,194,10,182,184,
+    80,120,232,38,205,109,48,225,77,232,94,54,18,133,143,246,
+    248,115,179,252,181,29,127,205,23,181,161,120,32,46,253,171,
+    0,54,54,255,143,193,196,135,10,49,172,42,196,122,132,49,
+    62,84,248,247,97,176,146,18,125,248,147,121,225,246,201,16,
+    44,20,200,255,11,47,229,23,83,98,245,38,182,73,251,111,
+    138,80,249,235,100,164,127,34,3,235,65,177,77,190,221,76,
+    129,77,78,195,10,83,108,148,51,164,146,146,205,196,58,83,
+    116,228,213,55,54,14,242,245,223,61,178,14,195,54,2,15,
+    19,190,72,148,156,145,244,244,25,118,64,37,77,165,176,210,
+    207,105,84,42,85,110,138,80,25,63,50,160,255,178,68,51,
+    95,250,60,39,12,82,86,78,109,83,169,115,196,255,175,65,
+    111,29,138,189,189,192,70,168,156,101,164,202,18,39,248,210,
+    39,75,28,227,75,159,44,113,133,47,125,178,196,57,190,244,
+    201,18,179,124,233,147,37,38,248,210,39,75,156,228,75,159,
+    156,254,74,157,10,138,103,245,144,183,118,243,189,83,47,113,
+    252,171,26,48,152,93,254,15,3,59,65,90,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/boards/riscv_board.py",
+    "gem5.components.boards.riscv_board",
+    embedded_module_data,
+    10220,
+    27547);
+
+} // anonymous namespace
+} // namespace gem5
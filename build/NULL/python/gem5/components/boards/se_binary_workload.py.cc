@@ -0,0 +1,285 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,213,90,79,108,219,86,154,39,245,151,18,101,75,150,
+    109,89,78,172,152,177,59,169,165,56,114,50,249,227,58,233,
+    166,117,98,167,77,38,77,179,117,179,197,10,187,171,48,34,
+    109,179,149,68,237,35,21,215,129,7,216,25,244,144,67,15,
+    89,160,192,26,139,89,192,151,22,41,218,67,175,123,218,57,
+    14,22,123,144,4,14,36,16,8,16,96,209,67,111,42,218,
+    2,139,57,237,247,61,82,20,101,201,142,59,219,193,204,210,
+    204,19,31,223,247,239,189,247,189,223,247,189,199,252,55,227,
+    186,124,246,239,119,95,66,241,47,140,196,72,108,145,41,177,
+    57,150,197,103,79,209,83,242,230,188,37,95,206,87,242,231,
+    252,244,157,183,24,40,5,115,193,18,151,227,104,221,87,12,
+    149,194,185,48,125,246,23,249,82,36,23,161,207,129,226,80,
+    105,56,55,12,207,65,137,43,70,75,177,92,172,52,146,27,
+    41,197,115,241,210,104,110,180,52,150,27,43,141,231,198,161,
+    61,36,133,139,137,210,68,110,2,158,121,41,82,76,150,38,
+    115,147,44,227,97,222,96,164,161,143,24,105,248,51,15,195,
+    124,225,233,152,156,59,38,69,215,152,116,236,27,172,164,89,
+    211,119,87,212,55,211,94,211,119,91,209,116,147,123,187,162,
+    43,106,89,44,154,254,123,101,120,72,123,204,224,93,162,22,
+    100,77,51,195,107,171,239,169,228,131,162,42,74,200,183,37,
+    146,50,252,134,86,111,223,80,228,155,229,117,21,43,183,85,
+    181,82,81,149,178,254,141,23,197,7,204,216,242,3,77,39,
+    98,65,127,71,214,212,42,41,200,230,240,53,165,44,146,109,
+    167,30,191,190,41,23,62,160,76,206,187,200,13,165,40,59,
+    181,201,53,165,68,219,87,20,34,23,116,213,197,28,235,52,
+    117,222,124,227,177,186,53,186,182,165,232,133,77,241,65,81,
+    182,237,87,201,55,172,213,54,212,177,233,154,42,18,169,224,
+    158,208,177,206,132,254,23,139,19,42,51,57,86,98,114,30,
+    137,205,121,37,143,228,181,254,54,96,26,215,131,146,79,246,
+    73,126,217,47,5,228,128,28,156,116,68,72,65,168,115,174,
+    58,183,175,30,130,122,72,14,119,223,184,218,194,189,45,18,
+    15,180,188,204,201,145,117,207,64,250,8,88,18,135,105,246,
+    231,134,208,42,168,121,169,93,251,229,12,203,195,71,146,21,
+    150,162,32,43,42,69,228,225,117,143,20,251,200,151,139,185,
+    228,142,72,35,114,252,64,27,71,14,144,27,167,237,163,114,
+    248,16,189,17,105,20,244,142,209,145,245,72,99,160,105,92,
+    30,255,209,154,172,30,36,64,82,2,122,16,7,73,19,208,
+    131,9,201,11,14,159,4,95,89,181,92,175,227,197,34,11,
+    206,18,22,224,122,119,83,209,132,66,81,212,52,1,30,170,
+    154,44,9,186,42,200,101,116,31,65,3,23,131,159,181,109,
+    173,32,22,139,103,86,63,148,11,85,92,36,194,220,218,106,
+    90,40,169,146,44,200,157,119,84,154,186,46,136,194,3,170,
+    42,27,166,111,110,168,68,208,81,7,72,93,175,150,11,148,
+    189,160,18,116,231,226,54,52,201,194,253,253,214,221,183,13,
+    210,54,213,106,81,18,30,200,130,40,73,178,68,229,137,26,
+    104,208,170,21,153,88,52,32,22,52,162,55,11,115,74,86,
+    206,206,11,154,90,146,65,99,121,3,132,139,186,160,148,55,
+    101,162,232,154,176,78,212,18,21,113,191,103,17,220,79,219,
+    150,102,179,66,89,213,229,203,151,173,42,94,203,186,80,33,
+    178,38,151,117,171,15,116,56,74,80,21,105,55,224,77,81,
+    41,41,186,44,101,133,101,24,172,242,70,81,118,120,43,214,
+    218,67,34,106,61,181,180,88,196,190,203,26,118,3,187,190,
+    101,247,56,11,243,32,19,121,29,218,230,5,73,214,42,32,
+    20,169,213,45,16,234,136,132,102,161,84,45,234,202,25,20,
+    34,104,178,94,173,104,243,246,43,208,183,65,196,146,35,18,
+    116,0,13,244,168,211,5,24,109,24,183,138,74,208,94,107,
+    238,239,152,1,107,178,204,184,252,161,162,231,213,114,30,217,
+    243,160,189,4,168,167,233,146,82,206,175,3,32,153,60,60,
+    171,85,189,91,145,9,177,42,156,92,126,152,47,34,130,134,
+    68,178,81,197,209,1,214,130,131,108,102,128,128,157,164,92,
+    8,49,221,11,163,7,194,228,119,166,23,193,70,103,187,77,
+    59,140,238,233,214,122,17,92,243,220,98,126,205,238,48,123,
+    46,138,238,37,177,159,129,156,47,28,89,44,179,195,238,121,
+    7,81,126,6,255,190,112,106,191,12,233,46,219,222,247,59,
+    150,132,122,229,237,48,249,64,231,89,143,30,40,45,188,19,
+    218,9,231,185,174,148,13,118,39,248,8,159,194,121,71,207,
+    142,247,87,147,59,222,163,88,7,92,97,231,217,7,92,190,
+    61,254,72,92,17,231,217,15,92,254,35,114,13,57,207,129,
+    95,5,119,2,240,102,184,243,166,119,150,246,92,35,112,144,
+    60,93,112,181,244,204,36,121,237,104,18,246,70,94,76,179,
+    194,252,253,196,47,249,29,126,47,62,136,118,39,188,223,43,
+    62,78,150,175,30,81,251,232,159,66,251,142,7,60,105,204,
+    161,224,200,251,61,35,203,233,25,151,174,222,81,11,237,112,
+    192,155,232,212,37,207,26,179,143,55,123,32,239,156,126,218,
+    77,121,20,223,235,243,255,94,205,231,186,124,146,183,151,246,
+    215,44,82,164,125,98,1,212,172,201,186,80,173,80,192,211,
+    182,53,192,22,196,66,82,45,35,146,87,228,130,178,174,20,
+    122,131,6,94,153,204,109,196,86,138,180,90,38,211,125,47,
+    172,108,151,197,146,130,17,105,27,240,183,252,1,96,171,21,
+    133,48,102,89,176,87,17,137,174,80,2,7,242,132,173,77,
+    185,76,109,216,84,53,221,17,39,8,55,215,150,5,177,44,
+    89,230,41,0,166,34,82,211,183,32,137,190,21,75,178,203,
+    178,203,32,29,128,214,178,248,50,34,183,64,236,28,12,2,
+    103,65,172,104,40,195,10,64,178,77,134,61,134,56,6,157,
+    206,238,151,211,143,188,151,133,247,54,33,132,201,196,109,19,
+    6,28,59,32,34,135,0,85,228,112,117,228,192,139,10,205,
+    10,247,239,191,75,170,242,253,251,194,131,109,136,49,235,34,
+    132,141,62,99,186,144,111,117,76,41,87,170,186,128,117,26,
+    125,186,29,26,192,216,137,15,22,39,212,142,206,218,137,38,
+    22,43,212,128,225,232,2,58,17,200,230,46,63,84,136,90,
+    198,64,36,60,20,137,98,121,5,116,88,41,195,188,30,46,
+    201,137,96,238,222,59,47,95,192,220,141,121,22,119,183,46,
+    72,157,244,61,43,220,179,83,44,112,25,93,181,28,236,176,
+    57,116,205,62,48,209,140,166,43,183,59,125,55,238,60,90,
+    220,167,179,84,213,116,244,185,59,106,25,146,10,220,235,204,
+    11,96,255,254,93,73,54,61,105,134,21,72,94,52,93,44,
+    23,100,130,75,220,140,230,33,185,200,175,87,139,69,107,193,
+    154,195,27,80,47,170,176,232,242,21,144,68,56,74,165,148,
+    193,117,11,106,9,94,41,15,48,23,232,36,31,36,136,237,
+    225,238,178,52,189,133,146,100,250,233,128,154,156,168,229,43,
+    170,166,124,104,6,172,73,54,3,56,229,240,235,133,201,51,
+    135,80,87,165,179,117,33,99,84,84,30,86,115,158,230,78,
+    102,4,109,235,104,50,67,72,77,27,200,49,132,57,132,53,
+    147,207,119,7,130,96,72,131,205,218,135,5,153,238,240,210,
+    17,211,167,201,197,117,130,233,179,197,115,28,139,41,44,82,
+    88,156,192,98,26,11,129,10,179,166,155,118,220,12,218,134,
+    153,62,170,19,131,172,123,186,254,176,168,145,194,66,101,91,
+    223,84,203,11,27,114,233,226,2,14,15,204,0,184,207,2,
+    77,83,181,5,77,206,219,18,157,244,175,178,109,38,176,87,
+    253,77,143,94,222,159,29,103,7,19,190,1,150,104,255,3,
+    0,252,79,204,15,87,153,216,177,221,151,62,29,170,71,179,
+    70,52,91,227,236,187,205,49,161,161,38,55,213,224,166,118,
+    239,213,185,89,131,155,173,113,179,207,19,83,205,196,233,70,
+    226,116,61,113,198,72,156,121,204,63,75,206,24,201,159,127,
+    117,165,158,124,205,72,190,246,216,247,241,208,215,241,201,127,
+    78,127,146,126,28,108,165,230,30,7,13,238,88,107,98,230,
+    73,105,79,169,39,22,30,7,63,230,91,252,120,141,63,217,
+    154,58,213,156,186,216,152,186,88,159,90,52,166,22,31,191,
+    241,241,91,45,62,81,227,103,128,169,153,58,215,72,157,171,
+    167,206,27,169,243,208,112,231,144,134,209,26,63,221,58,54,
+    3,149,95,124,205,143,63,145,154,137,185,70,98,174,158,200,
+    24,137,204,239,231,95,171,243,175,27,252,235,109,38,22,58,
+    221,78,50,147,169,102,50,211,72,102,234,201,121,35,57,223,
+    76,46,54,146,139,245,228,146,145,92,106,51,236,208,105,90,
+    60,241,181,98,99,205,216,201,70,236,228,222,203,245,88,198,
+    136,101,106,244,110,123,145,36,208,39,228,82,35,121,169,158,
+    124,197,72,190,114,20,33,1,102,246,226,99,159,193,77,195,
+    232,70,18,109,38,20,138,63,139,78,238,102,62,149,234,209,
+    211,70,20,216,185,161,120,107,246,204,19,159,17,19,106,244,
+    126,54,114,124,247,214,239,231,94,169,143,44,25,35,96,105,
+    96,40,254,108,246,229,167,225,230,220,114,99,110,185,62,119,
+    221,152,187,94,159,93,49,102,87,92,76,95,39,166,219,30,
+    118,124,238,91,175,119,34,254,61,3,69,155,241,142,196,219,
+    67,160,144,106,253,14,227,174,201,105,246,177,64,193,201,99,
+    225,194,103,154,111,175,211,205,253,142,23,98,121,55,23,96,
+    246,92,57,196,65,185,192,224,156,187,151,70,98,63,160,231,
+    66,36,170,7,93,185,129,167,47,47,63,154,70,223,139,105,
+    36,111,119,19,188,231,31,64,14,186,222,239,82,4,6,81,
+    236,147,232,251,210,223,155,57,81,123,131,131,56,119,88,200,
+    229,124,95,6,62,131,177,253,194,219,165,151,130,144,251,112,
+    226,204,225,185,207,154,82,186,75,145,218,129,129,163,100,63,
+    111,151,187,89,141,102,111,58,65,60,145,69,220,100,138,149,
+    74,17,82,35,202,150,253,11,202,153,96,115,141,167,102,96,
+    173,123,127,141,87,103,20,52,200,104,64,55,142,133,38,108,
+    41,250,38,212,101,186,91,254,147,101,94,63,42,218,247,167,
+    74,246,66,179,152,247,159,198,217,161,90,45,235,34,132,86,
+    42,7,83,20,65,93,63,56,218,119,135,2,98,49,161,253,
+    192,176,76,170,244,212,4,118,250,71,146,178,37,43,27,155,
+    58,80,119,38,168,43,22,10,153,60,20,139,125,125,249,115,
+    166,46,100,28,214,204,163,153,23,251,1,193,21,121,35,237,
+    49,121,28,149,60,29,35,205,28,161,81,53,143,169,8,120,
+    175,242,72,150,62,247,90,161,221,137,224,119,210,156,25,207,
+    119,230,43,223,113,25,178,0,109,86,182,81,174,150,236,28,
+    2,119,232,228,231,180,129,230,64,29,46,51,185,225,170,89,
+    202,243,104,135,70,46,3,117,218,79,46,34,103,87,241,171,
+    29,237,26,194,146,213,211,37,148,155,180,227,183,35,203,9,
+    245,233,131,66,125,31,233,191,161,220,255,96,48,216,183,47,
+    49,179,167,105,0,122,206,71,155,124,170,193,167,234,252,180,
+    193,79,55,249,51,13,254,76,157,95,48,248,133,175,78,54,
+    248,243,53,254,252,179,72,172,54,114,177,30,185,100,68,46,
+    213,34,151,90,92,164,201,29,107,112,199,234,220,148,193,77,
+    53,185,83,13,238,84,157,155,51,184,185,167,35,6,119,186,
+    201,45,53,184,165,86,114,202,72,46,52,147,111,54,146,111,
+    214,147,183,140,228,173,214,137,217,182,159,9,93,254,150,241,
+    134,194,223,99,209,166,69,132,230,23,179,13,110,182,53,58,
+    217,74,76,183,38,78,182,131,76,232,165,111,25,31,210,249,
+    144,174,167,32,87,160,15,5,119,44,112,34,213,93,166,255,
+    100,72,130,93,101,47,214,146,32,224,187,67,3,123,82,87,
+    12,232,223,147,166,125,143,62,114,252,238,29,122,44,165,117,
+    150,136,179,122,113,241,170,15,222,7,167,199,19,182,172,112,
+    115,93,40,171,253,235,219,34,113,164,109,138,26,192,12,160,
+    37,240,192,202,3,116,181,211,77,60,0,4,120,86,183,92,
+    248,67,150,209,43,31,205,209,195,87,235,240,82,82,1,134,
+    241,180,110,83,124,40,227,198,216,214,71,109,72,123,205,32,
+    184,159,168,235,132,178,146,11,80,124,206,82,151,211,176,127,
+    182,107,69,220,62,250,40,213,231,78,238,230,223,33,239,57,
+    234,66,63,132,153,200,232,147,11,181,201,51,79,245,58,127,
+    193,224,47,64,206,19,58,221,26,157,48,70,51,181,72,230,
+    217,240,68,45,121,173,62,124,221,24,190,94,227,174,211,73,
+    51,67,197,206,7,15,51,68,228,13,232,105,94,145,10,238,
+    0,235,76,165,143,237,155,74,207,11,15,249,240,144,196,121,
+    183,227,39,199,97,162,157,250,224,195,139,29,255,151,253,71,
+    128,110,174,129,9,197,206,1,137,195,97,71,33,52,37,24,
+    152,76,64,74,224,133,148,192,211,151,18,120,233,113,200,191,
+    123,14,77,9,240,35,210,31,145,19,252,185,163,251,79,28,
+    151,29,207,178,68,117,7,197,94,150,238,208,74,207,212,117,
+    26,189,33,94,151,68,231,83,196,224,107,67,164,231,42,248,
+    45,128,114,117,101,227,57,131,70,187,237,154,134,183,196,178,
+    184,33,147,67,4,82,91,182,20,48,130,136,138,38,91,103,
+    51,242,67,39,129,112,68,105,63,113,250,225,172,185,203,136,
+    80,128,18,243,150,25,52,122,162,231,56,253,179,112,196,162,
+    63,164,39,244,163,140,6,123,85,137,78,148,29,177,111,174,
+    116,53,167,89,242,11,112,102,242,58,131,49,53,72,102,177,
+    130,199,202,230,72,222,153,179,188,53,73,230,24,198,46,136,
+    146,136,57,142,173,102,148,126,180,112,237,238,49,6,91,17,
+    52,224,138,160,183,24,119,252,166,90,53,92,110,54,124,82,
+    176,155,180,131,99,87,179,19,72,51,7,5,210,126,218,58,
+    138,254,87,134,194,96,22,183,205,233,79,255,182,30,93,48,
+    162,11,53,206,190,91,39,51,24,95,79,180,248,49,196,197,
+    183,216,86,36,102,68,102,154,145,197,70,100,241,183,233,90,
+    100,177,30,185,109,68,110,215,34,183,33,160,2,97,147,203,
+    54,184,236,83,189,185,176,220,88,88,174,47,92,55,22,174,
+    215,185,21,131,91,169,113,43,176,97,252,99,130,164,233,151,
+    139,235,138,108,134,233,79,30,189,125,240,14,239,63,153,255,
+    51,216,190,24,104,143,180,55,27,0,153,131,119,104,22,100,
+    178,125,144,137,39,200,94,209,96,15,133,76,250,17,254,255,
+    37,92,210,153,60,42,90,90,221,60,228,20,217,113,11,75,
+    162,243,127,19,14,3,205,195,178,119,23,158,58,80,68,133,
+    254,84,56,102,195,72,192,130,17,252,198,5,73,122,183,27,
+    54,142,144,183,177,181,139,18,118,158,253,215,88,188,195,184,
+    81,98,127,158,61,110,175,121,75,164,131,13,167,14,194,134,
+    94,186,31,80,226,22,67,113,225,20,226,66,230,83,165,30,
+    61,107,68,207,214,56,251,110,205,204,91,121,55,46,250,233,
+    38,183,208,224,22,190,242,53,207,94,107,156,189,86,63,187,
+    98,156,93,169,115,171,6,183,90,227,86,123,22,125,242,47,
+    51,51,222,26,152,25,247,5,95,87,78,220,215,230,78,130,
+    29,105,47,76,134,223,66,63,120,148,62,36,25,118,96,219,
+    206,134,9,30,118,82,62,154,9,147,55,153,222,60,120,200,
+    58,173,182,153,30,157,24,152,8,59,237,99,108,127,38,60,
+    255,84,170,243,231,13,254,60,34,126,134,102,194,0,244,105,
+    154,9,95,175,15,175,24,195,136,229,116,146,210,73,147,203,
+    231,1,81,228,124,222,12,231,243,37,85,170,22,241,57,146,
+    207,255,99,85,44,218,45,193,124,94,82,11,249,60,193,239,
+    169,166,239,129,170,22,9,78,9,137,49,246,169,53,65,76,
+    53,189,176,225,39,24,235,72,180,227,244,4,63,45,146,85,
+    44,110,98,129,7,218,86,220,245,226,249,246,221,206,250,33,
+    247,176,120,15,138,207,25,106,26,29,13,146,236,20,139,56,
+    76,21,15,118,180,243,215,246,12,249,185,54,131,197,75,204,
+    75,115,173,51,231,90,167,50,120,207,205,183,166,79,182,94,
+    95,105,143,190,203,250,227,109,6,203,231,177,19,109,63,173,
+    6,152,20,248,47,125,228,152,241,212,238,223,25,99,153,118,
+    136,214,195,76,226,196,174,244,201,63,180,121,90,141,116,170,
+    67,180,58,204,140,30,223,189,176,231,253,205,146,17,255,89,
+    59,74,223,197,152,177,228,174,247,147,165,246,8,173,198,81,
+    224,189,189,11,181,244,149,218,236,21,35,245,170,49,246,87,
+    182,21,99,76,120,184,61,222,53,168,167,36,30,70,152,105,
+    253,44,141,70,243,105,63,44,35,40,168,201,88,9,116,148,
+    4,177,198,49,163,179,237,16,62,133,7,105,163,236,17,84,
+    54,212,17,228,42,254,134,13,250,87,216,218,137,108,155,193,
+    135,1,229,49,180,228,234,181,214,194,249,246,208,12,178,205,
+    160,37,66,219,63,99,89,146,106,7,103,168,21,182,77,161,
+    153,30,75,150,106,179,75,70,234,178,49,118,165,205,207,80,
+    75,198,166,118,87,247,102,247,180,189,185,223,188,109,140,206,
+    91,82,135,209,192,104,71,190,171,184,203,90,250,219,124,10,
+    95,65,241,60,58,221,246,167,168,242,241,19,237,96,170,71,
+    121,234,64,229,41,103,24,58,130,92,197,213,160,127,149,221,
+    221,198,46,175,178,135,151,150,51,38,41,222,31,55,131,248,
+    33,165,168,60,176,62,213,4,244,237,10,196,58,234,252,214,
+    130,64,231,55,195,165,139,89,11,85,52,250,49,201,250,226,
+    20,132,183,85,93,41,210,99,26,115,12,63,176,100,59,177,
+    83,203,82,4,183,34,73,114,95,147,179,216,173,117,19,239,
+    182,56,167,65,116,85,13,59,11,143,46,203,145,206,234,51,
+    167,157,148,85,203,106,206,127,176,219,255,153,106,88,180,191,
+    174,229,41,144,209,143,105,214,250,195,227,246,238,154,252,3,
+    247,170,5,19,87,137,66,115,29,88,152,155,80,182,189,44,
+    203,182,47,49,236,100,141,73,186,239,182,199,199,122,32,48,
+    252,136,34,226,197,167,23,23,92,191,182,231,76,166,214,123,
+    183,152,108,173,247,110,251,130,40,225,167,43,98,12,123,141,
+    173,49,203,238,187,197,164,107,189,119,59,32,121,89,244,171,
+    131,127,190,181,126,190,63,132,132,206,196,255,2,21,97,237,
+    109,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/boards/se_binary_workload.py",
+    "gem5.components.boards.se_binary_workload",
+    embedded_module_data,
+    4161,
+    10960);
+
+} // anonymous namespace
+} // namespace gem5
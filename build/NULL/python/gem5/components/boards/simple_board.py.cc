@@ -0,0 +1,140 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,173,87,205,111,27,199,21,159,93,46,201,37,197,15,
+    81,34,21,201,182,160,137,19,37,166,18,80,74,139,200,57,
+    164,69,236,218,174,133,218,114,16,181,249,224,33,171,229,238,
+    72,220,120,63,152,153,165,29,18,42,96,20,6,170,2,62,
+    21,40,156,67,15,66,17,184,53,156,67,255,20,42,16,16,
+    98,79,6,138,30,124,91,195,9,80,164,151,206,204,114,201,
+    165,72,218,17,154,229,224,199,217,121,239,205,155,249,205,123,
+    51,179,255,2,145,39,209,251,127,118,143,194,125,160,3,93,
+    48,129,37,84,5,129,213,69,83,180,98,213,152,37,85,37,
+    43,94,141,211,182,152,46,153,9,43,89,77,210,122,92,79,
+    152,178,149,170,166,120,61,105,166,173,169,234,20,175,203,102,
+    198,202,86,179,180,158,210,211,102,206,202,87,243,188,62,101,
+    78,91,133,106,65,0,34,248,53,208,51,119,129,158,69,121,
+    84,120,32,1,240,72,10,135,84,157,209,115,91,160,156,127,
+    194,94,202,130,39,93,51,136,91,142,121,169,11,186,142,63,
+    80,237,93,228,37,54,110,124,124,81,197,158,244,190,131,221,
+    39,177,64,47,229,220,66,24,27,58,34,79,196,160,101,238,
+    66,141,184,88,213,220,95,169,90,29,93,53,16,86,177,86,
+    111,81,73,49,148,92,71,150,131,91,91,45,226,34,139,182,
+    23,194,246,247,177,163,33,66,28,252,68,8,250,154,13,37,
+    129,238,69,71,197,58,109,158,222,186,124,209,176,85,220,250,
+    200,193,55,77,71,213,181,40,187,233,144,221,175,105,47,127,
+    164,252,34,80,21,116,80,21,117,161,26,211,69,36,233,49,
+    20,215,37,148,208,227,40,169,39,244,228,78,122,31,236,8,
+    186,124,55,83,149,69,128,82,40,253,128,90,62,18,194,14,
+    245,130,158,186,43,61,160,181,71,125,39,213,169,177,154,9,
+    148,217,17,245,244,136,118,118,130,118,142,106,79,141,104,231,
+    159,211,119,102,68,123,122,130,118,1,205,44,244,181,168,101,
+    118,196,114,246,57,126,114,35,218,197,9,218,51,84,59,63,
+    162,93,154,192,228,244,136,230,220,62,248,66,168,190,68,163,
+    111,198,155,218,50,172,134,137,248,66,171,34,181,75,67,250,
+    252,182,110,16,72,139,106,67,195,214,48,210,141,154,217,130,
+    132,171,66,194,67,163,2,55,92,168,57,182,171,26,54,129,
+    182,3,55,86,111,188,73,13,116,120,219,48,77,120,155,6,
+    10,116,108,179,197,251,187,109,184,117,168,66,205,84,9,49,
+    52,168,177,64,133,245,48,82,33,65,110,179,81,73,115,213,
+    149,149,107,134,101,184,170,107,56,54,89,89,9,218,224,13,
+    155,249,111,54,26,52,19,8,220,186,12,45,71,71,129,193,
+    39,78,147,118,104,67,220,180,169,139,26,15,83,136,190,64,
+    90,211,85,107,116,184,183,12,21,186,212,221,246,54,117,163,
+    16,164,4,42,202,237,94,40,111,111,195,157,166,173,49,127,
+    21,222,161,39,107,230,77,101,7,163,207,189,84,35,76,16,
+    47,97,241,28,242,242,124,240,74,127,240,94,2,211,209,99,
+    123,83,139,131,193,195,54,28,150,176,207,62,160,240,23,225,
+    62,112,133,129,112,120,57,14,34,146,193,179,39,236,137,123,
+    177,61,233,107,97,120,219,96,27,22,93,56,113,179,44,225,
+    25,250,142,103,25,20,25,148,40,148,69,47,78,105,66,216,
+    147,21,197,176,13,87,81,202,9,79,34,200,220,25,167,238,
+    165,20,133,47,138,162,16,54,100,54,125,120,231,135,183,8,
+    214,86,27,45,183,238,216,171,187,200,122,123,85,115,172,134,
+    99,35,219,37,171,53,22,41,100,53,136,5,133,191,85,26,
+    45,204,2,191,93,140,4,83,37,244,191,78,37,228,93,10,
+    255,185,3,190,207,129,84,238,79,201,123,201,111,229,249,111,
+    228,249,110,105,177,59,183,212,157,93,232,158,121,195,79,129,
+    212,194,83,16,79,165,191,99,224,15,195,51,54,119,45,202,
+    148,16,50,204,198,125,159,179,242,80,216,124,72,1,159,98,
+    30,153,28,226,51,108,146,25,133,7,88,48,216,246,252,208,
+    32,35,146,75,204,44,73,225,14,120,44,103,246,37,188,248,
+    34,159,2,245,41,110,94,193,144,241,249,242,49,175,233,186,
+    74,20,195,81,106,77,210,158,139,250,28,180,95,101,125,245,
+    60,230,139,251,205,81,143,177,208,35,228,30,163,81,164,11,
+    195,169,254,7,129,70,69,251,74,196,19,212,29,196,82,211,
+    133,117,245,22,98,201,188,113,3,94,108,146,10,252,29,161,
+    249,48,24,199,185,242,54,116,29,72,227,90,187,73,115,197,
+    32,149,135,244,40,216,116,220,13,214,151,69,215,29,233,151,
+    49,118,240,232,36,119,105,78,141,155,228,160,253,26,51,89,
+    224,147,252,119,238,101,95,20,178,107,79,99,177,60,93,102,
+    10,62,136,165,210,63,138,104,252,42,35,121,44,211,89,54,
+    19,221,82,21,190,59,180,23,142,147,221,23,109,49,235,215,
+    24,252,255,68,111,76,38,250,210,245,11,144,29,217,81,162,
+    251,99,24,229,26,159,27,59,41,198,224,132,73,13,137,62,
+    26,225,247,231,63,49,191,121,54,1,205,169,35,76,35,129,
+    174,106,251,244,113,134,35,194,79,127,66,142,175,63,47,152,
+    91,236,196,129,141,99,60,71,70,242,227,120,94,100,100,210,
+    189,93,33,244,78,21,53,231,236,182,203,199,121,159,168,90,
+    27,89,135,83,47,92,7,41,100,228,159,156,145,61,112,0,
+    198,61,195,7,198,239,5,55,54,144,237,9,7,226,139,109,
+    134,217,221,21,246,128,210,239,131,246,32,129,49,207,30,248,
+    172,175,51,108,31,28,66,120,137,86,203,241,96,15,8,78,
+    71,204,58,242,100,214,64,140,54,242,210,140,45,204,46,179,
+    196,155,38,125,181,160,169,44,242,157,154,159,70,132,205,1,
+    246,150,164,216,219,149,163,202,164,13,199,236,219,67,26,6,
+    235,231,55,124,1,30,23,74,247,151,254,188,116,88,56,123,
+    84,56,187,159,248,94,6,103,150,15,62,252,187,242,55,229,
+    112,121,253,104,121,253,240,244,249,163,211,231,59,167,222,217,
+    151,238,229,187,114,238,91,121,233,27,121,233,64,250,42,127,
+    40,175,29,201,107,157,176,240,37,163,3,157,163,127,155,229,
+    121,118,170,218,170,133,20,197,75,43,10,189,131,52,77,86,
+    207,40,202,231,77,213,236,73,146,138,162,59,26,173,196,232,
+    85,26,103,216,20,167,24,176,107,50,63,39,177,204,32,199,
+    224,44,155,175,84,115,28,19,47,179,119,118,135,192,43,12,
+    222,100,192,248,199,44,71,113,133,193,26,131,159,49,120,135,
+    217,101,123,135,183,134,76,147,158,243,2,62,13,122,177,253,
+    30,39,18,23,66,120,131,9,226,34,63,131,195,159,47,202,
+    113,217,7,12,138,153,120,250,241,76,201,143,211,127,63,1,
+    138,203,126,146,213,100,80,88,246,83,172,150,6,167,214,252,
+    41,86,203,128,116,206,207,178,26,152,4,103,64,34,127,231,
+    147,78,254,236,97,252,149,163,248,43,52,19,226,89,31,132,
+    240,52,6,18,175,246,155,19,163,186,165,47,47,49,197,210,
+    0,162,38,165,81,19,41,158,254,242,138,15,36,230,63,132,
+    129,137,196,7,61,198,139,123,114,47,238,193,165,191,182,79,
+    236,233,160,120,98,79,255,112,79,230,37,17,127,203,7,33,
+    12,116,135,154,7,192,131,154,199,197,102,121,214,75,184,173,
+    134,97,239,242,88,163,9,251,118,197,169,125,134,52,151,240,
+    92,14,2,146,69,160,151,107,186,134,73,42,225,231,39,15,
+    98,175,204,111,195,225,101,216,64,164,162,246,62,32,149,99,
+    247,100,30,254,222,98,144,177,3,173,94,6,7,223,20,60,
+    79,188,197,254,165,59,210,91,191,141,39,148,87,234,11,2,
+    203,224,6,199,115,202,155,25,189,227,227,124,63,29,32,232,
+    29,77,60,69,126,144,223,13,178,248,151,248,42,8,206,69,
+    242,95,10,126,76,16,4,127,29,8,243,29,240,82,180,248,
+    146,36,136,116,73,78,0,25,32,156,235,128,215,163,165,11,
+    54,59,195,165,11,222,235,12,151,46,248,69,103,184,116,193,
+    122,103,184,116,193,90,103,184,248,137,203,130,64,151,121,60,
+    118,102,150,59,175,159,127,202,235,223,77,208,225,228,252,15,
+    103,139,43,197,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/boards/simple_board.py",
+    "gem5.components.boards.simple_board",
+    embedded_module_data,
+    1844,
+    4414);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,174 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,173,24,93,111,20,215,245,206,236,215,236,122,246,195,
+    94,219,139,1,227,177,141,133,55,80,27,218,96,76,155,160,
+    64,41,132,164,49,33,64,85,86,170,198,235,153,107,123,195,
+    236,204,230,206,108,136,45,71,65,21,82,93,41,170,34,164,
+    202,60,244,193,170,42,90,68,43,241,152,159,177,187,90,201,
+    171,145,42,33,69,121,224,109,17,32,85,233,75,239,185,179,
+    51,251,105,48,13,227,241,217,59,231,158,175,123,238,57,231,
+    158,153,239,80,203,21,104,252,62,251,19,5,91,72,69,42,
+    167,161,60,151,225,242,124,134,231,224,153,215,124,121,127,198,
+    159,15,100,2,249,96,38,72,113,62,213,175,133,242,66,70,
+    160,227,128,26,212,194,249,72,38,194,198,33,173,47,47,102,
+    68,54,22,180,104,62,150,137,209,113,88,141,104,241,124,34,
+    147,96,227,62,173,63,63,144,25,224,16,143,46,34,85,188,
+    131,212,40,30,184,239,67,232,161,207,53,42,147,84,99,87,
+    81,58,254,4,30,210,188,237,255,117,206,180,108,225,114,193,
+    202,25,122,86,75,251,236,240,89,85,37,159,100,245,21,108,
+    7,47,93,254,237,185,44,177,253,31,27,196,122,2,50,210,
+    156,29,54,62,199,132,228,84,108,62,225,29,204,240,217,37,
+    211,34,89,197,250,101,86,89,197,239,231,48,201,18,101,117,
+    141,206,12,186,51,31,225,188,65,214,174,174,153,22,206,83,
+    124,191,139,191,136,117,74,109,25,228,9,231,200,138,186,51,
+    231,140,44,81,41,34,233,34,28,102,134,86,90,221,28,118,
+    221,60,76,205,249,3,117,52,70,25,78,69,25,94,229,50,
+    62,149,199,126,213,135,3,170,31,7,213,0,14,97,97,196,
+    99,92,22,54,209,50,167,6,239,136,153,48,143,112,4,247,
+    221,167,70,60,228,220,121,53,169,134,239,248,239,211,209,67,
+    143,39,35,246,164,12,225,232,50,175,70,186,168,99,187,80,
+    199,41,117,95,23,117,98,23,234,126,60,208,98,53,79,55,
+    182,147,51,185,71,206,232,158,57,97,61,177,46,234,193,158,
+    212,241,59,168,131,110,104,23,127,38,186,36,14,191,68,127,
+    127,23,117,138,81,239,235,148,203,246,113,224,142,216,65,61,
+    178,137,190,224,50,251,105,184,15,218,225,107,216,116,98,42,
+    251,47,202,121,109,53,103,74,244,206,74,128,207,233,43,18,
+    155,147,138,38,86,37,203,144,72,81,151,104,212,45,47,231,
+    20,105,197,141,81,83,50,116,202,97,230,242,5,13,71,36,
+    122,65,156,231,44,172,88,69,130,103,34,12,117,205,144,110,
+    25,228,166,148,5,225,93,34,164,37,80,115,76,42,100,77,
+    152,111,226,25,121,129,24,10,54,77,131,184,178,192,74,198,
+    33,169,6,54,37,221,176,36,130,63,43,230,8,166,212,10,
+    100,155,180,234,166,155,52,157,179,40,78,151,150,176,180,184,
+    168,27,58,94,92,76,75,57,93,186,181,154,83,86,153,60,
+    37,107,98,201,162,76,158,34,105,218,51,33,45,221,202,105,
+    26,112,171,84,190,98,105,107,146,98,232,58,29,57,46,1,
+    190,60,75,227,153,134,113,88,82,52,67,185,41,45,131,77,
+    88,87,214,192,163,134,78,25,153,27,115,203,192,67,77,101,
+    126,238,180,150,234,190,181,138,117,38,170,104,194,14,128,130,
+    139,215,63,190,218,226,112,71,147,45,40,218,77,25,180,216,
+    97,111,206,14,58,198,216,113,38,89,246,36,43,1,212,188,
+    130,244,31,234,214,179,13,10,254,204,109,33,139,107,78,182,
+    135,203,118,203,76,243,218,224,54,248,13,223,134,255,159,220,
+    125,63,165,246,187,120,14,109,160,109,190,23,135,202,183,135,
+    39,84,122,26,130,190,133,180,159,36,233,179,29,246,188,79,
+    134,232,51,25,166,224,2,45,188,1,179,88,192,196,22,100,
+    57,167,231,44,89,182,227,178,137,45,121,185,168,105,166,83,
+    56,131,182,223,196,218,50,19,67,6,1,120,2,236,176,44,
+    43,26,141,42,89,54,97,209,224,55,233,246,15,179,38,81,
+    102,11,107,214,170,161,207,174,224,252,201,89,197,200,23,104,
+    104,232,150,57,203,2,203,156,181,104,2,200,108,60,83,88,
+    35,251,41,239,250,128,151,44,51,174,49,191,160,120,115,129,
+    130,255,220,70,47,98,40,28,251,99,232,235,208,142,176,175,
+    34,236,171,13,141,214,134,199,106,201,145,218,193,163,245,48,
+    10,143,60,69,129,112,228,57,128,58,3,34,10,71,119,132,
+    131,21,225,224,189,235,101,97,178,42,76,150,220,251,25,120,
+    200,14,18,76,51,72,95,80,90,183,128,115,183,14,150,179,
+    197,156,248,128,91,120,64,1,57,8,198,192,188,68,14,1,
+    191,8,142,42,22,156,85,172,15,183,88,223,130,255,0,152,
+    66,20,220,70,143,5,113,211,79,198,232,248,165,26,57,170,
+    145,95,184,64,38,193,201,135,59,116,70,86,179,166,156,51,
+    228,165,162,185,62,216,212,216,196,130,179,158,53,244,197,7,
+    55,139,221,250,124,174,62,137,233,107,13,77,149,107,15,162,
+    223,115,105,126,97,253,125,200,57,79,87,179,38,172,102,63,
+    167,5,65,151,46,93,150,206,21,205,25,233,58,77,243,197,
+    166,37,211,233,69,72,96,154,37,52,89,45,90,83,102,30,
+    208,115,117,193,176,46,65,33,203,211,96,192,234,175,8,161,
+    241,216,181,200,21,26,128,221,139,108,98,63,1,134,17,182,
+    200,239,99,227,117,158,139,30,127,234,243,197,233,238,83,80,
+    71,190,112,100,79,110,38,71,192,197,61,253,28,5,101,106,
+    62,43,23,104,15,98,174,167,218,173,240,38,110,0,111,26,
+    192,143,119,243,135,47,115,243,249,143,206,74,208,14,181,186,
+    217,179,162,219,211,228,104,143,69,145,89,200,178,221,150,242,
+    187,46,159,254,236,13,251,52,14,70,43,6,20,103,29,118,
+    114,125,164,61,128,91,166,212,55,233,215,171,236,228,236,29,
+    188,107,210,165,217,203,82,161,233,217,14,67,246,226,87,123,
+    20,28,73,207,5,217,164,253,105,43,55,243,236,250,145,118,
+    143,239,74,184,218,181,3,251,95,185,3,126,215,27,143,152,
+    55,232,233,128,122,93,237,103,206,151,156,229,107,206,109,112,
+    189,79,148,118,158,118,207,174,112,27,72,246,100,80,9,126,
+    212,227,218,64,159,122,52,189,78,39,50,65,135,233,128,147,
+    239,206,185,74,224,24,181,5,64,152,185,117,108,71,192,91,
+    4,94,11,76,59,97,122,100,14,42,205,179,154,204,142,35,
+    19,214,32,53,54,100,176,81,129,91,137,205,245,67,93,21,
+    186,109,222,0,41,31,50,247,63,238,31,218,26,187,59,86,
+    238,159,168,246,79,108,6,95,8,232,224,212,246,111,254,46,
+    255,85,46,79,205,85,167,230,202,7,78,85,15,156,42,237,
+    159,223,244,127,29,175,9,177,29,97,172,34,140,109,251,255,
+    22,47,11,199,171,194,241,146,123,255,232,50,212,150,231,173,
+    185,219,54,241,5,218,53,93,188,0,153,227,255,191,86,164,
+    157,102,247,6,164,157,206,252,206,10,181,6,66,239,0,233,
+    208,31,120,53,77,71,15,206,221,100,182,152,252,7,52,217,
+    59,52,6,247,160,49,244,106,154,151,105,124,115,235,82,249,
+    230,27,211,182,208,139,254,205,173,168,85,151,202,53,199,189,
+    82,180,209,68,146,24,197,16,246,226,29,38,192,65,187,196,
+    70,155,46,211,194,168,175,152,118,18,114,182,163,41,182,125,
+    26,214,157,179,212,235,62,161,153,166,132,6,193,38,153,67,
+    238,81,11,105,206,66,217,142,185,114,85,38,204,205,241,81,
+    228,230,248,109,231,48,59,67,65,235,9,210,97,15,116,222,
+    230,127,17,235,28,191,23,162,78,223,8,89,90,22,198,171,
+    194,120,73,24,127,28,79,238,196,143,84,226,71,202,241,116,
+    53,158,174,163,80,56,246,34,136,6,83,223,88,59,169,116,
+    37,149,46,167,142,86,83,71,119,82,39,43,169,147,229,212,
+    169,106,234,84,57,57,95,77,206,127,123,182,146,124,183,228,
+    222,255,78,14,127,99,109,125,117,247,171,114,106,186,154,154,
+    222,73,205,85,82,115,229,212,124,53,53,95,78,158,174,38,
+    79,127,123,165,146,60,83,114,239,154,152,216,17,15,85,196,
+    67,101,81,170,138,210,142,248,86,69,124,171,44,30,171,138,
+    199,254,113,165,42,206,238,136,103,42,226,153,90,98,112,43,
+    126,55,94,78,140,87,19,227,59,137,217,74,98,182,156,56,
+    81,77,156,120,68,17,111,63,186,82,77,156,122,234,227,163,
+    177,231,136,130,122,7,232,163,11,97,171,97,213,128,58,80,
+    162,63,11,233,3,208,227,235,217,60,166,61,126,68,150,243,
+    134,90,212,96,44,202,242,103,197,172,214,152,9,201,178,106,
+    40,116,224,51,45,66,162,224,105,17,0,196,57,233,3,0,
+    189,58,129,207,31,36,1,96,10,246,208,191,100,24,26,153,
+    134,103,8,82,242,19,0,80,118,8,196,35,107,60,200,79,
+    1,188,13,224,231,0,222,1,16,119,119,210,142,54,94,36,
+    20,172,105,178,156,230,156,13,135,104,124,207,217,239,1,23,
+    204,192,68,150,103,59,235,254,213,253,225,128,80,71,0,134,
+    163,129,195,143,7,134,234,1,250,91,167,219,57,85,15,193,
+    72,64,253,83,245,48,140,34,104,255,68,105,98,190,58,114,
+    186,222,7,207,104,55,112,8,5,227,183,111,148,226,19,229,
+    192,100,53,48,73,15,228,64,180,142,92,240,212,135,130,135,
+    61,116,176,155,118,232,222,121,32,28,106,130,86,150,161,110,
+    22,127,32,114,239,66,29,209,159,38,104,178,0,70,236,165,
+    197,218,62,255,151,245,215,215,212,96,123,77,109,219,131,175,
+    173,105,47,146,131,129,19,117,228,130,38,45,96,18,61,215,
+    188,7,43,54,191,44,7,70,171,129,209,58,31,9,208,124,
+    232,6,192,116,232,101,4,44,127,88,204,45,164,7,237,160,
+    181,86,160,149,197,9,107,72,7,218,156,156,156,49,150,62,
+    165,69,199,100,125,139,19,251,16,241,118,172,104,229,52,115,
+    198,253,104,201,242,197,78,179,138,230,86,199,28,54,103,178,
+    141,175,140,157,133,147,101,154,61,218,248,240,225,81,53,250,
+    21,231,189,156,229,165,61,234,21,214,22,105,222,231,10,150,
+    192,118,204,155,96,175,164,44,235,236,33,15,233,136,107,204,
+    37,188,92,99,13,9,243,0,228,223,15,194,59,78,197,56,
+    67,174,33,167,141,49,69,10,235,62,142,227,234,115,62,142,
+    167,29,234,43,65,196,15,163,215,1,34,226,166,75,232,72,
+    235,93,67,11,165,246,187,134,222,43,181,223,53,244,110,169,
+    253,174,161,116,169,253,174,161,185,82,251,93,15,222,224,56,
+    186,247,189,97,41,49,249,148,13,158,239,66,192,188,245,63,
+    208,107,107,246,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/boards/test_board.py",
+    "gem5.components.boards.test_board",
+    embedded_module_data,
+    2388,
+    6029);
+
+} // anonymous namespace
+} // namespace gem5
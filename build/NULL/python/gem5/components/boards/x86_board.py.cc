@@ -0,0 +1,377 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,213,58,91,108,27,215,149,51,195,215,144,28,62,68,
+    81,18,69,61,72,235,97,137,178,77,189,108,199,118,100,55,
+    150,237,216,106,108,217,141,13,52,75,96,119,64,113,198,18,
+    101,14,201,220,25,186,22,43,109,140,69,128,208,129,139,38,
+    69,186,81,219,4,213,62,16,56,137,186,205,2,251,17,20,
+    93,160,192,254,244,103,177,164,48,128,136,89,24,48,176,240,
+    135,129,126,208,136,3,20,197,98,177,247,92,146,67,14,69,
+    57,46,218,253,88,122,124,116,31,231,156,123,231,220,115,207,
+    61,231,220,249,47,170,233,103,173,253,253,170,130,193,135,148,
+    64,9,116,138,146,232,24,45,49,49,134,134,58,147,50,73,
+    230,152,89,178,196,44,146,53,102,149,108,49,155,196,198,88,
+    201,30,179,75,142,152,67,114,198,156,18,23,227,36,87,204,
+    37,185,99,110,201,19,243,72,222,152,87,234,136,117,72,190,
+    152,79,234,140,117,74,254,152,95,234,138,117,17,126,166,84,
+    183,212,19,235,193,101,179,96,73,5,164,222,88,47,41,91,
+    83,65,169,47,214,71,202,182,84,191,52,16,27,192,101,86,
+    176,167,6,165,80,44,68,202,142,84,88,58,16,59,64,202,
+    206,212,144,52,28,27,198,101,78,112,165,70,164,209,216,40,
+    41,187,83,7,165,177,216,24,77,49,212,69,74,240,188,77,
+    9,94,113,84,28,251,196,76,81,159,155,235,175,29,27,23,
+    58,174,83,17,223,19,168,68,24,205,124,57,41,43,26,123,
+    93,124,51,39,166,19,98,196,167,153,207,10,2,210,236,0,
+    95,143,167,151,69,141,157,143,203,226,27,243,113,164,89,231,
+    81,82,192,45,220,185,204,247,206,39,229,91,11,82,28,215,
+    108,11,130,8,53,205,186,112,149,160,49,215,18,154,249,90,
+    6,41,26,247,122,188,9,145,123,227,196,241,11,39,102,166,
+    46,164,21,180,166,57,112,237,85,249,114,50,157,187,163,185,
+    112,121,33,173,136,169,43,215,230,115,178,214,109,168,94,74,
+    138,40,142,18,43,107,154,183,209,190,112,245,236,181,133,115,
+    90,111,115,11,46,156,149,229,228,114,90,18,211,138,214,217,
+    232,186,134,50,9,81,150,51,72,11,224,198,235,87,230,147,
+    25,25,254,47,164,111,102,144,20,87,146,153,116,132,214,56,
+    37,115,69,148,50,104,237,122,50,47,62,49,129,124,104,205,
+    180,112,253,44,254,227,61,187,36,43,40,158,80,94,23,229,
+    76,14,97,65,209,154,61,115,91,68,88,32,162,252,132,169,
+    34,119,215,177,206,197,19,43,162,62,111,220,227,175,247,212,
+    70,88,147,21,81,194,237,29,245,118,125,138,79,232,42,175,
+    206,122,79,21,119,62,19,71,2,110,246,189,38,162,180,152,
+    2,161,126,55,131,110,165,50,113,33,209,172,214,142,186,90,
+    191,130,231,244,14,86,108,145,138,209,2,21,99,4,58,102,
+    18,24,209,44,152,68,139,96,22,173,130,69,180,9,86,193,
+    118,211,81,160,110,210,2,251,54,23,99,25,74,180,139,142,
+    79,240,12,62,167,235,12,133,110,193,254,182,249,19,92,250,
+    92,31,36,230,20,28,111,83,49,174,45,190,85,116,221,100,
+    4,231,30,26,247,62,216,30,140,205,237,193,246,62,135,183,
+    107,15,118,199,62,216,62,177,179,87,199,194,148,238,61,148,
+    254,231,140,227,217,131,221,181,15,118,39,198,246,238,193,238,
+    110,139,221,241,54,213,130,215,67,240,2,45,120,190,61,120,
+    189,109,241,58,197,32,30,221,191,103,244,190,182,216,86,177,
+    95,52,27,100,210,181,135,114,160,64,221,161,99,131,216,76,
+    244,104,44,222,48,68,247,242,191,114,132,241,239,108,120,9,
+    106,225,68,60,27,95,74,137,225,204,205,240,205,92,42,21,
+    150,137,150,134,229,164,148,75,145,13,21,198,91,43,140,137,
+    163,14,66,55,49,113,57,41,37,21,210,37,79,76,84,219,
+    194,231,114,8,225,189,154,90,59,28,86,86,146,114,149,247,
+    152,28,150,200,46,9,227,150,21,220,144,200,8,162,16,86,
+    50,225,217,139,243,209,26,229,149,92,98,5,6,87,86,196,
+    240,194,228,213,176,156,91,170,77,161,70,20,38,84,85,116,
+    141,77,164,110,241,55,145,248,166,102,207,234,182,192,90,29,
+    69,243,36,96,183,242,43,186,153,177,34,81,201,161,244,98,
+    194,66,53,126,112,94,128,77,248,202,141,133,249,99,250,67,
+    74,161,27,157,70,1,110,53,245,52,126,235,244,58,179,110,
+    90,55,111,211,70,139,76,83,235,212,22,211,142,162,133,171,
+    233,155,113,20,182,209,179,170,207,254,22,161,68,19,138,171,
+    209,43,48,235,204,139,112,92,181,213,75,63,195,39,216,199,
+    38,163,58,253,13,54,45,88,77,204,139,17,51,26,133,49,
+    14,2,24,3,48,142,65,254,202,13,188,60,117,13,10,99,
+    249,231,146,72,148,195,241,176,190,10,225,156,156,76,47,147,
+    101,196,120,97,108,109,163,117,173,104,66,194,205,167,194,99,
+    121,102,44,26,97,53,139,156,203,138,72,99,121,62,153,78,
+    42,60,175,185,150,69,133,111,172,171,13,170,73,57,142,64,
+    205,53,19,102,171,217,47,220,73,136,89,208,61,205,156,142,
+    75,98,196,170,153,101,49,117,179,221,164,53,59,207,39,82,
+    113,89,230,121,25,22,29,20,40,124,247,15,81,25,37,38,
+    179,107,202,74,38,61,185,44,74,199,38,19,25,41,155,73,
+    227,121,202,147,68,109,229,201,59,39,142,243,164,24,205,174,
+    161,195,240,254,29,245,119,143,214,39,251,109,220,44,127,140,
+    193,239,239,82,95,187,41,187,251,158,237,190,109,151,13,236,
+    176,129,114,215,64,185,59,84,238,236,45,247,31,170,216,41,
+    123,239,83,202,98,119,60,3,80,33,192,77,113,222,93,231,
+    192,142,115,160,228,12,169,206,208,174,115,108,199,57,86,114,
+    70,84,103,228,23,215,183,191,187,227,60,90,116,30,125,232,
+    235,171,48,116,199,21,186,60,117,114,119,234,236,206,212,217,
+    210,212,57,21,158,75,21,19,180,87,168,6,124,106,50,117,
+    186,159,81,24,84,40,147,203,93,49,81,220,49,204,227,43,
+    88,220,68,179,26,131,130,18,245,255,39,10,220,165,253,149,
+    127,157,226,245,62,197,242,28,44,93,249,20,251,115,176,44,
+    141,242,150,149,106,243,51,82,96,71,136,198,84,186,210,18,
+    245,100,22,127,87,29,236,127,222,50,81,17,22,113,176,202,
+    76,54,129,188,80,96,191,87,59,71,145,19,170,150,100,102,
+    9,187,32,29,188,140,141,64,150,79,102,120,65,188,157,196,
+    170,165,57,164,99,153,172,204,47,97,111,232,83,26,205,192,
+    66,194,155,134,209,81,160,227,106,4,68,1,242,93,141,133,
+    111,106,254,43,160,57,143,193,93,234,177,207,255,254,200,7,
+    35,5,243,125,219,227,192,208,79,184,143,56,92,116,125,109,
+    165,186,251,223,127,227,131,55,112,197,81,177,82,118,215,46,
+    59,184,195,14,150,216,176,202,134,139,108,248,81,16,72,60,
+    5,252,15,29,107,93,35,123,125,141,28,184,244,142,251,29,
+    15,118,107,233,13,90,96,54,24,193,180,97,18,204,27,102,
+    44,197,118,66,124,33,3,102,196,65,231,215,169,85,221,108,
+    181,55,37,120,52,115,187,246,214,85,110,240,105,24,173,85,
+    125,181,27,38,104,153,254,4,99,126,174,99,211,212,123,116,
+    250,71,74,71,131,179,96,217,182,26,77,20,214,6,123,163,
+    252,34,243,89,117,52,240,87,117,90,222,217,196,165,29,147,
+    86,25,114,223,140,99,224,175,27,231,214,53,83,6,26,244,
+    130,77,96,141,50,104,238,197,71,140,73,176,231,241,252,159,
+    131,195,40,131,141,218,170,87,159,153,129,98,217,100,152,155,
+    46,225,111,148,181,175,81,126,33,89,119,54,240,87,117,218,
+    134,44,94,80,214,254,111,198,49,240,215,215,210,32,25,19,
+    254,71,109,117,189,192,120,221,47,48,158,57,143,117,57,143,
+    75,237,86,100,153,54,204,71,151,234,159,107,79,25,215,133,
+    166,148,201,253,48,201,76,2,245,218,170,238,26,242,65,29,
+    131,122,215,189,76,109,88,148,151,12,179,248,51,201,201,56,
+    211,243,212,95,70,55,172,202,201,166,145,172,130,67,112,98,
+    200,221,34,146,217,118,25,221,167,13,219,61,247,86,211,42,
+    54,81,218,90,165,112,127,82,57,253,127,241,14,130,91,112,
+    10,158,109,175,113,102,239,122,238,121,86,67,141,209,218,90,
+    185,112,189,196,31,168,151,246,123,159,123,158,61,171,122,161,
+    209,43,112,66,199,182,207,168,101,27,236,190,178,97,159,203,
+    203,46,116,238,225,101,223,151,151,125,15,175,139,6,94,78,
+    129,219,246,127,130,181,249,115,93,163,55,28,235,150,125,184,
+    57,246,112,91,104,226,214,133,227,209,30,252,174,129,102,217,
+    10,129,237,222,79,240,41,241,185,126,82,108,56,247,157,173,
+    179,149,127,193,93,128,24,52,248,54,187,129,35,218,117,14,
+    115,239,107,61,103,72,187,93,176,183,182,55,239,9,161,95,
+    24,48,246,99,109,118,111,88,129,118,221,186,110,109,165,189,
+    239,185,231,54,236,189,209,122,137,63,168,207,214,178,15,198,
+    88,189,164,124,167,105,6,156,48,40,216,183,67,70,89,27,
+    48,194,194,1,161,239,185,24,67,120,196,72,131,99,35,86,
+    220,154,160,218,252,90,118,194,16,216,58,97,248,103,102,97,
+    228,99,102,239,92,150,77,27,174,117,87,251,149,49,204,130,
+    21,70,247,206,179,117,229,214,93,6,233,28,170,151,248,195,
+    58,159,131,216,255,27,203,255,250,186,168,200,225,92,150,196,
+    25,119,32,206,184,26,174,185,117,181,248,20,126,209,104,56,
+    157,81,196,83,167,26,77,240,187,1,145,41,126,164,140,140,
+    35,85,28,87,102,215,142,100,227,56,214,12,223,68,25,9,
+    71,41,201,106,164,27,126,245,122,152,56,123,114,52,124,61,
+    35,145,216,56,169,24,88,73,241,53,24,34,188,36,134,133,
+    76,34,7,121,42,28,217,198,211,2,76,12,137,164,31,247,
+    45,229,150,229,168,78,152,106,14,67,89,202,80,229,140,85,
+    7,149,164,240,137,174,153,143,77,165,229,8,173,89,4,49,
+    21,95,251,93,93,128,38,10,129,190,162,48,6,79,224,204,
+    188,129,72,230,202,172,185,82,153,68,60,197,199,179,201,4,
+    159,20,52,95,83,245,182,136,100,8,156,172,98,26,34,126,
+    205,190,148,201,40,144,154,202,62,129,99,43,85,101,126,119,
+    195,4,124,24,76,108,171,81,160,87,113,187,102,139,11,2,
+    142,249,228,188,245,218,185,5,252,54,17,70,179,98,7,27,
+    70,97,225,175,178,150,21,243,86,28,224,65,159,9,93,6,
+    26,31,142,230,73,238,43,121,91,196,238,55,68,242,154,35,
+    27,135,160,144,7,231,220,180,176,120,67,243,156,203,144,244,
+    221,181,76,42,142,146,202,154,230,174,53,220,64,201,229,101,
+    17,61,1,215,230,83,155,230,78,98,33,35,148,203,42,100,
+    44,141,205,214,9,108,74,21,83,115,85,115,122,124,109,94,
+    238,230,42,122,83,243,8,162,172,64,36,160,139,199,216,144,
+    86,146,233,68,115,4,15,142,19,56,54,95,253,22,131,31,
+    51,198,112,73,192,206,157,128,29,187,117,234,158,101,181,145,
+    152,1,103,202,104,194,152,123,230,246,121,129,117,102,143,137,
+    108,230,111,107,199,127,157,222,195,223,180,47,127,83,43,127,
+    18,70,177,139,154,245,194,29,101,33,173,32,216,169,232,245,
+    186,42,17,37,66,55,0,92,3,117,50,33,208,45,4,102,
+    91,179,198,179,89,49,45,224,128,219,4,162,180,129,196,174,
+    37,211,90,103,156,100,106,249,19,51,199,78,242,74,85,146,
+    154,187,214,88,175,115,16,107,241,120,213,81,18,199,95,182,
+    154,192,245,168,252,238,221,90,232,85,37,195,58,132,231,150,
+    159,106,13,189,26,33,92,116,142,232,181,124,38,218,76,241,
+    31,152,135,252,3,138,132,228,15,135,94,46,135,198,202,189,
+    19,229,192,120,121,48,84,14,13,149,195,99,255,232,40,15,
+    143,84,60,236,176,251,41,133,193,51,0,69,46,84,241,81,
+    174,222,93,46,180,195,133,138,225,217,18,119,84,229,142,22,
+    185,163,143,7,142,151,67,35,109,88,76,96,22,131,192,98,
+    16,88,12,186,11,139,77,28,182,220,37,110,82,229,38,139,
+    245,135,132,119,168,31,0,88,184,39,30,120,83,203,241,217,
+    147,183,230,35,38,205,12,187,74,51,203,201,60,222,25,8,
+    210,244,68,185,147,212,127,219,49,214,236,137,99,183,230,159,
+    80,216,20,104,180,160,209,243,154,249,248,209,91,243,139,145,
+    35,90,39,228,70,90,243,93,182,164,204,163,220,210,26,58,
+    1,99,176,113,69,193,8,11,87,53,7,73,164,100,200,150,
+    227,240,158,80,86,248,165,234,5,128,41,137,119,164,73,144,
+    226,136,37,139,92,107,118,39,178,57,94,198,125,124,54,131,
+    20,89,115,73,162,212,168,107,29,192,207,216,228,50,80,32,
+    88,89,4,6,77,51,73,241,59,154,149,188,25,142,188,97,
+    217,235,99,24,24,200,85,166,70,46,71,128,1,73,10,165,
+    115,18,159,200,96,243,131,192,139,67,39,137,182,200,210,82,
+    50,131,13,15,177,102,14,108,201,114,9,37,135,113,52,11,
+    25,14,129,83,136,32,84,71,157,117,53,70,2,69,76,89,
+    117,255,35,176,123,8,188,119,162,232,85,11,147,226,165,108,
+    149,39,130,132,188,230,20,239,40,117,213,69,100,241,28,48,
+    243,234,27,161,36,105,16,79,204,76,213,230,97,171,161,70,
+    188,36,179,160,117,45,92,229,107,150,147,151,179,113,176,70,
+    120,47,104,3,217,68,18,191,81,250,102,114,185,109,183,110,
+    235,228,118,221,30,184,51,169,78,129,7,213,65,239,192,80,
+    116,82,99,150,178,154,13,88,195,82,99,117,136,147,130,27,
+    15,148,22,19,196,230,202,88,62,46,192,192,91,233,40,152,
+    60,108,141,65,0,239,2,72,212,69,36,123,107,91,179,241,
+    123,229,21,178,73,209,203,24,228,131,251,239,205,20,144,255,
+    27,118,158,127,143,183,97,197,79,29,152,45,178,3,229,241,
+    83,69,118,180,6,131,7,10,158,138,149,228,192,134,119,156,
+    195,37,231,168,234,28,221,117,30,217,113,30,41,57,39,85,
+    231,100,133,26,177,79,149,57,239,253,139,187,92,255,14,215,
+    191,121,227,231,252,79,249,210,64,84,29,136,126,225,255,151,
+    30,117,250,130,58,189,160,78,95,41,78,45,150,184,171,42,
+    119,181,200,93,197,133,199,193,240,214,237,98,48,90,10,70,
+    213,96,180,112,254,254,107,229,241,195,191,244,124,230,41,141,
+    159,84,225,185,4,109,42,55,250,200,235,223,245,142,239,120,
+    199,75,222,9,213,59,177,235,157,219,241,206,149,188,103,84,
+    239,153,138,137,114,117,16,164,138,131,26,125,169,200,29,40,
+    31,62,83,228,34,53,56,56,90,184,250,181,149,234,8,110,
+    78,108,173,150,188,211,170,119,250,161,183,183,236,143,20,15,
+    93,250,237,116,233,208,229,167,38,166,195,247,140,194,128,160,
+    21,131,47,253,171,255,215,129,146,119,94,245,206,87,156,214,
+    33,119,117,10,131,95,123,169,208,232,131,227,197,193,153,210,
+    224,140,58,56,131,155,175,150,15,79,253,242,234,103,87,75,
+    135,79,171,240,92,134,54,149,139,124,227,108,1,233,107,22,
+    143,86,246,79,195,211,29,220,237,30,223,233,30,47,117,79,
+    168,221,19,187,221,39,118,186,79,148,186,79,169,221,167,190,
+    228,75,221,120,138,116,215,21,250,81,119,207,83,11,211,21,
+    120,106,177,192,132,49,168,152,108,7,221,213,49,135,42,94,
+    96,220,70,254,186,117,195,175,55,243,109,186,52,253,154,58,
+    253,90,113,234,50,100,189,84,118,72,101,143,224,165,13,4,
+    11,92,185,59,80,112,62,236,232,126,79,217,237,137,236,244,
+    68,74,61,135,212,158,67,187,61,39,119,122,78,150,122,94,
+    86,123,94,46,117,204,169,29,115,21,202,102,31,33,160,112,
+    246,97,199,8,88,218,225,177,114,79,95,185,175,127,139,254,
+    233,241,138,221,226,195,182,22,131,103,0,10,243,21,174,97,
+    107,153,18,55,172,114,195,69,242,60,246,13,149,61,157,187,
+    158,3,59,158,3,37,207,176,234,25,222,245,76,239,120,166,
+    75,158,89,213,51,91,246,7,202,157,61,101,255,32,102,216,
+    233,192,12,59,33,35,219,233,40,216,42,110,106,234,165,237,
+    60,100,240,84,182,95,101,71,84,246,112,153,245,239,178,125,
+    59,108,223,230,197,18,52,140,20,217,145,135,190,208,214,155,
+    95,156,40,250,230,74,190,57,213,55,87,176,253,9,88,189,
+    147,229,78,255,3,255,151,7,42,38,38,136,167,131,193,51,
+    0,5,55,100,11,49,65,112,135,13,110,158,41,177,19,42,
+    59,81,100,39,30,7,166,203,125,225,114,215,193,178,127,164,
+    28,196,194,25,43,247,15,127,244,237,114,232,0,62,140,122,
+    49,3,12,158,1,40,184,240,158,179,119,213,70,188,162,51,
+    168,152,187,236,83,21,106,63,16,197,52,5,238,189,239,108,
+    210,37,54,168,178,193,34,27,196,243,110,105,121,140,87,243,
+    205,205,161,247,251,63,232,175,80,180,61,68,64,225,108,153,
+    11,20,46,111,118,108,158,45,113,131,88,179,139,228,121,116,
+    244,149,170,74,224,55,158,46,207,158,209,43,83,88,83,93,
+    189,155,241,173,229,47,15,20,185,185,18,55,167,114,115,15,
+    185,192,230,242,131,139,191,161,139,220,124,137,155,87,185,249,
+    199,28,201,163,7,250,63,242,60,160,213,192,196,110,96,114,
+    39,48,89,10,76,171,129,233,47,46,149,2,115,197,174,179,
+    250,131,117,165,98,51,187,176,158,96,240,12,64,197,233,32,
+    107,27,164,236,222,31,186,223,117,195,0,171,15,110,255,6,
+    15,121,190,196,157,87,185,243,120,163,66,82,158,129,164,60,
+    0,150,58,60,91,157,100,88,101,199,139,228,217,155,154,133,
+    50,73,205,194,9,7,105,217,235,212,167,204,226,141,79,41,
+    4,9,137,230,60,178,99,37,46,215,14,221,124,167,110,46,
+    27,141,12,198,253,10,156,184,187,212,35,79,103,65,121,206,
+    88,94,50,22,14,145,244,46,60,42,189,24,161,209,41,176,
+    200,45,35,35,25,44,116,99,200,198,225,111,197,72,178,163,
+    62,228,253,124,145,237,125,161,55,68,127,11,108,63,108,51,
+    150,230,130,23,194,254,67,245,16,207,119,27,94,84,111,119,
+    96,10,244,19,160,223,51,156,126,31,241,234,158,151,108,56,
+    189,77,25,23,61,134,196,152,122,134,166,145,135,89,102,240,
+    116,127,134,11,17,43,241,130,144,2,32,7,224,54,0,34,
+    176,183,218,190,9,200,169,221,155,24,218,225,210,80,30,168,
+    138,208,235,255,192,166,122,71,84,239,184,234,61,252,64,216,
+    94,85,163,23,139,158,75,69,246,210,159,42,85,15,72,47,
+    145,129,80,50,13,139,151,15,24,228,218,212,227,219,95,178,
+    250,144,193,231,72,182,46,45,230,57,146,25,48,184,123,77,
+    131,19,145,228,15,26,36,181,47,94,55,72,206,69,233,202,
+    167,122,218,239,48,75,125,218,71,233,234,180,183,168,118,63,
+    99,186,98,131,94,167,95,228,178,163,249,34,75,160,141,209,
+    209,45,162,78,200,163,216,154,112,152,214,123,210,230,75,174,
+    23,27,211,200,97,131,193,84,150,118,84,235,204,50,189,39,
+    49,194,52,143,7,209,224,182,165,37,1,205,172,83,188,126,
+    197,66,226,59,235,162,102,154,189,56,159,191,166,95,216,38,
+    234,215,243,225,76,26,3,57,151,37,202,92,191,158,7,23,
+    178,154,85,33,87,243,225,37,49,17,207,201,98,243,181,252,
+    74,38,37,70,209,60,8,8,28,60,108,122,192,243,141,216,
+    170,177,69,237,2,158,133,50,241,71,123,0,113,10,0,76,
+    77,243,202,58,82,213,107,69,5,138,196,151,224,34,147,27,
+    91,205,33,196,149,120,205,171,134,229,199,30,103,85,251,252,
+    53,15,179,153,92,206,15,180,58,160,134,238,32,232,26,108,
+    47,172,107,29,93,31,134,126,20,42,117,12,169,29,67,5,
+    235,35,103,199,15,191,245,238,183,74,206,126,213,217,255,241,
+    250,131,11,165,208,140,26,154,217,113,206,20,157,51,181,27,
+    215,153,150,203,84,124,96,117,135,54,111,255,252,173,159,190,
+    85,10,77,169,161,169,82,215,180,218,53,93,112,148,89,247,
+    46,27,218,97,67,91,193,45,174,196,30,193,206,79,17,251,
+    63,248,124,235,121,200,117,189,183,186,117,167,200,77,149,184,
+    41,149,155,170,88,76,125,142,253,111,252,218,152,135,8,179,
+    152,103,39,177,83,61,185,34,196,247,49,19,196,52,37,229,
+    91,53,223,187,201,76,180,244,28,6,129,212,15,155,222,66,
+    158,204,0,203,28,48,146,240,77,151,33,237,161,111,193,223,
+    81,207,191,35,222,96,4,122,157,105,127,79,108,220,70,219,
+    45,169,136,189,138,140,249,232,246,124,191,45,210,114,51,195,
+    52,157,0,250,22,104,220,25,195,134,194,86,79,255,148,162,
+    113,15,214,184,25,108,220,32,213,183,142,173,42,177,169,27,
+    240,101,24,18,227,2,15,123,230,213,8,163,89,18,43,201,
+    148,128,190,192,200,17,14,1,11,140,140,146,183,197,133,243,
+    8,88,35,55,69,238,157,201,55,114,110,88,129,106,246,45,
+    27,87,86,208,63,67,159,131,244,241,55,147,56,184,52,158,
+    78,154,5,214,66,174,111,137,95,64,19,11,102,148,52,27,
+    54,132,15,34,194,234,226,42,153,218,53,117,95,99,59,236,
+    233,156,130,181,79,83,228,178,186,51,248,254,201,15,78,22,
+    216,114,223,72,129,85,217,192,195,222,209,135,190,193,7,254,
+    162,47,90,242,69,85,95,244,203,209,86,135,148,189,15,46,
+    233,161,99,187,19,231,118,38,206,149,38,46,168,19,23,160,
+    145,248,202,99,208,53,251,32,168,59,207,216,119,58,88,36,
+    207,115,142,122,16,221,135,212,50,86,243,191,175,42,122,196,
+    146,239,16,227,40,181,150,69,56,34,189,117,90,81,214,174,
+    79,229,93,56,108,149,177,221,169,85,157,169,236,234,233,151,
+    78,226,223,204,108,190,3,101,50,202,233,239,3,228,111,199,
+    83,57,113,35,223,219,164,239,167,191,223,84,217,104,191,123,
+    122,200,30,17,111,198,115,41,133,191,69,190,198,227,227,104,
+    89,206,135,141,187,104,47,198,28,72,180,155,72,180,98,182,
+    122,177,3,217,4,236,14,242,230,248,68,133,228,251,98,36,
+    4,31,184,192,183,42,60,175,57,120,94,202,8,185,20,148,
+    57,158,127,51,23,79,213,122,108,60,47,100,18,184,96,146,
+    21,132,224,66,4,193,237,46,2,87,131,124,130,130,250,0,
+    192,221,18,58,67,213,194,112,205,188,148,201,164,208,38,212,
+    65,235,137,231,135,224,163,20,4,27,3,193,105,139,126,14,
+    224,239,0,252,3,128,207,0,12,1,216,6,0,190,1,250,
+    18,0,172,12,250,21,112,117,213,190,155,73,136,169,20,207,
+    99,83,63,91,151,92,45,5,48,82,7,103,161,227,51,134,
+    100,220,234,255,42,140,213,194,98,57,96,224,245,89,220,143,
+    124,93,21,11,254,139,21,197,63,90,177,65,9,71,170,163,
+    21,59,148,28,84,112,170,226,132,18,71,57,220,21,23,148,
+    168,253,192,56,101,245,220,253,139,162,103,168,100,25,86,45,
+    195,21,198,105,25,173,80,117,240,212,68,89,71,244,230,224,
+    13,198,50,91,161,154,96,202,220,74,78,91,252,155,231,113,
+    8,99,241,55,64,131,11,180,88,247,146,4,55,47,1,98,
+    176,1,154,73,130,237,72,252,155,202,31,59,202,2,189,121,
+    231,129,249,163,191,6,236,5,186,25,54,147,226,182,118,195,
+    109,249,255,216,225,34,15,200,12,35,13,208,76,18,217,75,
+    226,177,96,77,199,160,129,6,45,67,53,180,3,37,203,144,
+    106,25,170,10,164,46,162,97,189,197,218,138,102,183,28,45,
+    30,57,93,161,240,223,6,104,208,64,75,119,43,141,205,226,
+    120,224,127,144,216,238,173,80,54,152,76,29,52,200,12,205,
+    13,80,77,199,142,144,173,25,209,172,202,90,54,153,94,174,
+    42,191,153,152,104,233,88,52,179,180,42,38,20,153,36,48,
+    171,169,76,178,187,224,32,169,26,122,48,96,228,43,35,242,
+    9,82,117,159,129,241,39,249,65,242,53,82,83,106,145,36,
+    31,73,34,157,36,36,193,110,104,30,60,74,78,73,166,162,
+    216,196,221,22,145,66,28,38,205,156,148,227,114,245,107,55,
+    31,170,125,159,44,71,235,37,178,87,53,55,144,201,209,250,
+    39,203,196,44,104,17,146,9,174,39,130,147,152,40,94,251,
+    232,184,53,71,76,12,138,54,80,245,150,26,88,53,239,169,
+    250,229,37,177,60,218,128,254,33,94,19,55,189,141,152,40,
+    173,75,239,168,82,86,15,28,98,165,52,127,205,96,18,67,
+    172,127,154,53,164,219,15,98,147,201,98,128,77,249,3,59,
+    87,181,140,103,208,191,83,85,127,72,254,79,12,43,38,154,
+    166,43,39,76,52,131,93,177,111,4,142,78,40,253,255,7,
+    227,20,29,41,82,227,205,207,35,170,167,104,124,202,212,76,
+    209,248,148,169,177,162,241,41,83,139,69,227,83,166,94,41,
+    26,159,50,117,186,104,124,202,212,241,162,241,41,83,71,139,
+    198,167,98,61,103,166,241,150,106,15,177,173,40,142,28,127,
+    74,202,207,246,193,33,139,255,191,129,246,61,157,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/boards/x86_board.py",
+    "gem5.components.boards.x86_board",
+    embedded_module_data,
+    5645,
+    12747);
+
+} // anonymous namespace
+} // namespace gem5
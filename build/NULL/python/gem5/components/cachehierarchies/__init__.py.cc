@@ -0,0 +1,32 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,123,204,128,4,24,161,244,103,54,32,49,157,33,133,
+    33,152,65,147,209,111,37,67,17,19,72,16,36,243,203,188,
+    184,40,89,191,160,178,36,35,63,79,63,61,53,215,84,63,
+    57,63,183,32,63,47,53,175,164,88,63,57,49,57,35,53,
+    35,51,181,40,177,40,25,72,21,235,199,199,103,230,101,150,
+    196,199,235,21,84,254,226,176,201,205,79,41,205,73,181,43,
+    98,133,218,84,204,15,36,62,48,51,50,50,126,96,128,17,
+    69,204,64,49,0,19,7,36,125,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/__init__.py",
+    "gem5.components.cachehierarchies",
+    embedded_module_data,
+    121,
+    148);
+
+} // anonymous namespace
+} // namespace gem5
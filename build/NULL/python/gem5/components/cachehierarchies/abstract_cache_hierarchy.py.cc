@@ -0,0 +1,93 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,85,221,107,28,85,20,191,119,118,190,178,205,54,
+    137,198,18,19,177,183,1,37,251,146,32,82,31,130,136,105,
+    168,109,149,70,48,125,113,30,156,157,157,185,219,189,50,95,
+    189,119,134,184,1,33,72,160,17,124,149,246,177,79,129,208,
+    127,64,255,139,40,130,50,32,20,124,234,219,148,40,72,159,
+    122,238,221,157,205,196,36,102,118,57,243,113,126,247,220,223,
+    249,157,51,103,254,66,181,195,24,157,143,62,5,243,8,5,
+    40,192,33,138,176,131,35,205,209,176,188,215,194,70,164,59,
+    58,92,55,2,61,52,34,211,49,49,210,208,45,20,24,187,
+    40,48,169,190,223,64,232,105,163,10,232,88,129,181,137,218,
+    246,115,121,211,214,10,107,237,198,250,93,154,121,197,101,175,
+    43,50,238,249,89,68,179,126,18,180,113,49,177,153,119,55,
+    7,34,163,209,115,77,130,113,209,90,27,97,110,36,30,15,
+    252,51,137,246,192,60,4,170,20,57,56,64,142,70,27,142,
+    190,135,122,56,192,187,182,99,76,32,106,6,26,181,36,217,
+    158,14,20,245,125,192,63,29,135,113,108,240,55,232,68,79,
+    11,204,83,190,102,96,237,34,231,210,30,250,6,59,147,50,
+    137,226,74,69,104,221,243,251,244,54,163,220,227,126,127,224,
+    227,26,51,201,93,166,127,116,27,204,143,248,17,202,106,222,
+    147,59,60,169,175,59,7,35,69,135,189,241,6,136,103,136,
+    60,165,188,176,93,151,197,44,115,93,120,164,11,26,246,138,
+    9,215,245,67,79,8,215,21,114,123,178,243,242,150,224,254,
+    74,58,0,105,227,149,251,52,186,190,226,39,81,154,196,52,
+    206,196,138,47,201,247,71,228,25,21,43,85,41,92,229,113,
+    43,215,96,57,29,240,73,136,183,125,245,236,188,151,43,34,
+    75,0,18,87,193,252,187,131,254,180,91,223,91,63,88,191,
+    219,115,191,218,115,191,216,243,191,217,243,135,213,255,72,102,
+    84,24,93,89,206,194,228,52,203,121,188,225,107,181,228,113,
+    165,222,180,106,192,172,230,250,14,183,177,55,5,128,38,25,
+    29,119,98,63,225,105,194,189,140,10,146,245,41,81,252,5,
+    97,113,150,16,143,168,109,150,155,99,248,77,240,18,145,82,
+    159,245,152,79,198,89,146,152,210,0,214,39,132,69,105,72,
+    35,208,8,130,49,65,122,121,236,103,44,137,137,23,7,100,
+    139,133,33,233,210,113,176,60,102,15,114,74,122,9,39,84,
+    197,133,100,210,218,102,171,169,199,189,104,200,97,149,220,3,
+    114,234,18,184,145,173,62,131,5,99,190,164,79,217,136,9,
+    83,52,106,187,156,60,216,113,190,144,87,245,244,0,23,175,
+    111,36,217,157,138,60,13,110,114,158,240,182,198,91,160,26,
+    159,145,181,81,93,65,248,148,148,127,166,22,102,88,241,237,
+    165,115,234,123,10,249,190,12,214,4,179,131,254,153,67,83,
+    139,135,246,53,46,43,117,226,13,184,160,134,219,63,143,169,
+    111,14,139,1,37,219,234,195,24,160,124,40,252,72,150,113,
+    129,224,81,46,88,124,95,105,246,69,222,29,144,136,70,9,
+    31,16,161,198,197,56,28,212,34,78,178,122,17,134,45,38,
+    86,73,167,115,143,231,180,211,33,172,87,87,190,190,5,135,
+    192,203,228,115,73,99,139,9,10,75,62,241,66,1,107,142,
+    165,230,179,144,195,1,86,194,10,153,230,72,82,139,9,87,
+    46,223,126,251,60,33,135,254,181,154,124,211,23,202,103,42,
+    249,2,12,175,191,182,189,186,238,133,33,13,100,127,64,171,
+    145,60,133,174,132,215,91,170,34,251,23,60,94,47,3,1,
+    59,157,232,58,212,77,100,94,156,49,168,27,208,223,56,64,
+    124,238,63,140,103,220,52,17,153,91,3,158,219,4,167,144,
+    159,201,88,150,202,226,153,61,185,167,171,20,218,45,57,151,
+    98,47,162,174,91,52,93,55,74,130,60,148,215,147,174,251,
+    32,247,194,161,135,203,196,138,22,184,225,27,48,26,89,106,
+    196,112,93,26,25,148,95,145,16,189,155,36,33,127,83,222,
+    191,53,90,162,224,62,13,67,24,124,152,95,174,18,250,88,
+    37,196,39,42,243,142,116,236,15,103,81,245,251,99,118,97,
+    231,110,169,99,99,161,68,103,24,211,52,236,114,26,153,179,
+    165,118,201,88,124,242,109,137,224,244,211,172,58,29,155,23,
+    13,64,236,126,165,48,229,188,66,91,198,226,99,128,89,18,
+    81,153,49,76,62,120,77,51,90,37,250,63,163,196,83,196,
+    55,224,3,211,240,186,190,210,72,233,81,52,161,150,73,247,
+    107,234,103,130,203,47,94,241,134,26,34,98,121,60,177,213,
+    253,80,55,165,192,130,52,42,164,84,229,165,253,225,176,14,
+    31,241,119,71,157,37,30,130,41,27,24,227,242,131,6,214,
+    74,116,177,105,34,124,237,16,145,250,255,25,122,239,240,228,
+    191,52,151,48,100,116,218,60,254,242,133,60,253,125,134,75,
+    17,125,5,216,26,43,106,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/abstract_cache_hierarchy.py",
+    "gem5.components.cachehierarchies.abstract_cache_hierarchy",
+    embedded_module_data,
+    1095,
+    2176);
+
+} // anonymous namespace
+} // namespace gem5
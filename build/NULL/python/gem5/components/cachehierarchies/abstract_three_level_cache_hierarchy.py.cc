@@ -0,0 +1,66 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,84,207,79,212,64,20,158,254,218,182,11,8,130,
+    2,18,19,70,60,109,130,108,96,99,52,198,24,137,7,61,
+    108,184,224,105,47,147,210,153,101,155,116,91,156,22,204,226,
+    30,56,112,224,224,221,255,192,196,248,15,145,61,153,248,15,
+    212,224,137,147,239,205,238,12,107,212,216,38,239,189,239,155,
+    55,211,239,189,121,233,119,50,245,184,19,127,69,193,124,34,
+    54,121,77,56,57,39,220,250,108,19,242,213,214,105,29,194,
+    237,125,210,112,226,233,189,11,122,239,51,181,87,144,142,197,
+    73,199,230,86,199,225,182,112,185,35,60,238,130,247,192,215,
+    192,251,224,3,240,161,240,186,11,188,126,238,118,106,124,6,
+    78,157,29,209,221,131,162,148,81,92,190,237,73,33,218,226,
+    68,164,175,162,184,39,222,36,66,70,50,238,13,78,63,212,
+    41,60,187,25,141,38,153,180,196,212,71,41,230,210,158,206,
+    163,239,147,178,71,227,60,235,38,135,199,50,58,72,5,45,
+    146,83,65,163,140,211,168,40,242,56,137,202,228,36,41,7,
+    234,184,110,46,169,128,239,208,188,75,219,219,155,180,189,179,
+    169,50,219,45,26,227,231,139,45,149,54,10,210,237,132,225,
+    57,163,16,35,117,16,146,220,144,124,66,250,233,206,152,11,
+    32,208,84,75,83,173,49,21,135,83,77,196,22,59,216,196,
+    19,213,196,161,53,36,204,44,14,109,64,150,65,14,32,115,
+    37,67,23,144,99,144,7,200,53,168,6,200,51,200,7,84,
+    51,40,0,228,107,196,9,92,128,181,215,8,70,33,51,85,
+    214,217,77,153,72,243,27,90,23,26,48,93,105,200,76,169,
+    64,182,12,57,41,182,17,142,220,66,164,93,137,226,36,106,
+    146,40,69,162,2,25,160,193,110,200,58,154,25,48,5,66,
+    170,159,235,253,66,198,205,163,65,217,203,179,230,161,232,63,
+    110,198,121,255,40,207,68,86,22,77,117,71,250,234,19,81,
+    52,245,108,48,53,27,76,205,6,83,89,204,76,200,214,209,
+    0,116,178,36,75,74,198,78,27,255,27,188,45,157,186,129,
+    218,94,130,57,35,213,50,89,219,184,112,63,222,186,92,123,
+    8,110,254,242,222,131,105,180,186,14,110,78,147,191,161,11,
+    120,175,176,237,123,13,31,85,100,81,95,48,6,141,101,253,
+    156,31,167,24,207,50,246,238,56,74,39,43,62,99,60,143,
+    33,112,64,230,200,73,178,82,174,192,246,47,68,174,98,195,
+    150,209,56,218,220,71,137,103,74,162,126,43,219,241,130,138,
+    160,169,47,122,27,223,22,239,86,30,248,170,70,238,172,84,
+    62,70,1,89,90,174,66,140,234,200,205,96,52,75,32,111,
+    14,163,91,184,58,143,209,2,114,183,49,90,68,110,9,35,
+    242,15,51,22,231,168,58,173,177,190,117,52,70,243,117,240,
+    124,92,240,11,137,255,29,156,240,226,9,152,202,177,44,171,
+    122,186,106,193,57,127,154,31,104,126,254,101,65,29,252,11,
+    207,48,64,184,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/abstract_three_level_cache_hierarchy.py",
+    "gem5.components.cachehierarchies.abstract_three_level_cache_hierarchy",
+    embedded_module_data,
+    660,
+    1239);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,68 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,83,205,107,19,65,20,159,253,74,54,49,109,161,
+    173,95,173,232,52,30,52,80,19,187,82,149,34,66,85,80,
+    161,20,196,158,114,25,166,59,147,100,113,179,27,119,55,45,
+    41,57,120,232,161,7,239,254,7,130,248,15,149,156,4,255,
+    129,149,122,234,201,247,38,217,109,192,70,220,133,223,251,156,
+    55,239,107,126,146,169,207,156,208,51,10,240,133,232,228,53,
+    17,228,152,8,237,171,78,200,119,61,115,107,18,161,191,39,
+    53,195,157,62,91,201,206,58,234,172,36,77,77,144,166,46,
+    180,166,33,116,105,10,67,90,194,4,106,1,45,0,45,74,
+    171,85,17,246,177,217,44,136,18,68,43,143,110,111,239,199,
+    73,196,221,100,239,48,220,145,7,210,127,201,221,142,124,227,
+    201,136,71,110,103,112,228,150,41,124,219,1,229,19,63,154,
+    28,134,15,124,244,164,157,204,139,30,122,73,135,114,234,134,
+    65,203,107,247,35,190,239,75,186,179,65,121,32,232,142,67,
+    99,239,72,34,175,66,241,56,14,93,143,39,222,129,151,12,
+    234,74,53,178,253,13,143,161,215,168,132,156,114,65,165,200,
+    149,98,162,44,250,206,88,103,3,163,84,110,113,170,31,216,
+    45,3,251,209,84,253,24,106,67,194,114,227,80,7,73,203,
+    37,3,164,188,187,67,19,36,35,151,44,144,204,92,42,128,
+    100,101,146,208,160,111,58,127,8,129,84,242,248,109,245,120,
+    196,187,52,171,98,139,238,117,228,184,234,176,69,147,142,234,
+    197,219,0,250,215,119,19,47,12,168,139,61,166,247,101,189,
+    93,167,213,71,206,135,23,213,90,189,124,89,52,85,225,214,
+    37,38,49,251,162,87,60,225,255,123,131,152,121,131,51,235,
+    2,103,58,246,58,173,58,155,143,103,68,119,178,224,153,97,
+    183,86,24,149,88,62,235,50,187,24,54,170,197,133,58,27,
+    183,205,178,121,151,88,22,175,86,28,153,177,244,91,17,14,
+    40,194,185,68,5,4,220,131,200,70,40,1,196,40,78,238,
+    61,127,23,71,110,163,55,72,58,97,208,104,203,238,102,195,
+    13,187,189,48,144,65,18,55,84,53,217,38,123,50,110,100,
+    139,206,96,209,153,90,116,166,124,88,190,238,245,222,0,50,
+    99,94,224,37,140,29,221,251,247,11,170,103,142,85,204,10,
+    223,233,39,146,174,147,149,234,137,249,121,254,116,229,46,144,
+    133,211,155,107,211,210,141,59,64,230,38,202,19,248,207,112,
+    241,118,161,112,184,53,224,93,201,24,116,137,117,67,209,247,
+    145,175,48,246,177,207,253,137,165,200,152,8,93,96,12,72,
+    107,100,120,65,18,45,193,241,111,36,90,198,230,44,34,24,
+    25,220,194,164,124,149,84,246,167,186,97,217,41,65,40,175,
+    90,213,31,139,87,83,11,104,90,32,203,215,211,34,114,54,
+    89,186,150,150,144,43,163,238,10,114,21,2,126,115,200,205,
+    163,117,1,57,50,3,198,137,24,170,38,109,156,203,42,66,
+    158,223,185,253,108,92,220,243,8,19,196,55,27,63,1,72,
+    13,77,211,210,167,107,26,196,249,27,126,33,252,190,196,160,
+    2,255,1,239,91,107,246,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/abstract_two_level_cache_hierarchy.py",
+    "gem5.components.cachehierarchies.abstract_two_level_cache_hierarchy",
+    embedded_module_data,
+    695,
+    1396);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,33 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,123,204,128,4,24,161,244,103,54,32,49,157,33,133,
+    33,152,65,147,209,111,37,67,17,19,72,16,36,243,203,177,
+    184,40,89,191,160,178,36,35,63,79,63,61,53,215,84,63,
+    57,63,183,32,63,47,53,175,164,88,63,57,49,57,35,53,
+    35,51,181,40,177,40,25,72,1,5,50,50,245,243,242,83,
+    128,172,248,248,204,188,204,146,248,120,189,130,202,95,28,54,
+    185,249,41,165,57,169,118,69,172,80,59,139,249,129,196,7,
+    102,70,70,198,15,12,48,162,136,25,40,6,0,228,227,40,
+    50,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/chi/nodes/__init__.py",
+    "gem5.components.cachehierarchies.chi.nodes",
+    embedded_module_data,
+    129,
+    158);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,163 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,23,75,108,27,215,241,237,114,73,174,248,17,245,
+    177,37,91,150,172,149,237,164,161,235,72,150,16,219,41,26,
+    187,182,213,198,54,138,40,31,171,64,203,28,22,171,221,39,
+    113,229,229,46,253,118,105,155,132,138,10,133,129,42,128,15,
+    13,224,32,10,96,32,62,25,40,124,233,49,64,238,61,147,
+    6,1,11,11,8,48,80,228,224,27,13,187,64,145,83,103,
+    222,146,75,82,31,139,21,87,243,230,205,204,251,205,204,155,
+    153,247,111,210,241,23,109,182,175,159,0,248,150,24,196,16,
+    44,146,195,86,180,132,130,152,19,5,196,35,86,164,32,229,
+    164,66,52,23,45,196,114,49,78,147,172,120,65,206,201,28,
+    143,90,125,133,68,46,193,241,152,149,44,164,114,41,129,136,
+    228,26,49,226,247,137,33,211,232,147,8,33,79,35,173,69,
+    115,105,206,235,3,94,130,166,119,240,250,57,47,9,188,20,
+    149,118,240,50,134,112,147,100,211,47,177,179,144,21,252,126,
+    109,201,245,152,166,123,5,234,229,29,35,27,241,7,230,53,
+    61,79,213,121,199,246,152,99,89,148,249,233,79,168,235,106,
+    43,244,106,105,121,25,186,201,47,74,75,229,5,234,221,117,
+    216,45,152,33,117,165,57,195,188,195,40,244,229,249,207,254,
+    176,88,46,82,23,240,200,141,155,87,244,78,101,9,45,101,
+    141,113,101,81,146,19,12,146,19,13,33,23,49,196,156,100,
+    68,114,81,67,130,13,70,253,67,139,204,92,89,161,172,107,
+    237,202,191,18,10,252,117,209,148,101,135,41,94,32,108,218,
+    43,138,105,123,148,217,154,165,232,225,9,20,122,135,218,158,
+    59,205,7,47,230,169,75,149,37,62,214,85,220,188,83,178,
+    12,197,118,60,101,137,42,26,16,117,143,26,202,82,89,241,
+    242,84,193,147,42,30,117,97,70,133,105,182,225,20,204,138,
+    230,153,142,205,103,2,130,162,89,150,115,87,41,58,69,92,
+    186,16,236,203,85,168,125,187,68,75,48,143,105,243,121,92,
+    173,64,21,189,172,91,52,216,131,47,27,166,171,45,89,212,
+    88,92,200,198,124,89,85,109,144,80,85,63,161,170,5,199,
+    40,89,136,167,84,245,118,73,179,154,156,184,170,26,142,14,
+    72,186,107,35,254,16,223,129,90,161,204,81,45,205,163,182,
+    94,254,7,121,141,58,254,249,99,151,233,51,197,50,216,213,
+    158,89,161,133,115,51,186,83,40,58,54,170,98,70,71,35,
+    231,77,202,52,166,67,3,132,188,57,99,59,6,96,45,143,
+    80,177,59,93,44,179,36,76,198,65,22,254,221,95,0,88,
+    15,127,13,81,138,202,13,130,32,69,14,79,174,127,178,117,
+    116,162,42,141,4,31,59,212,26,185,183,19,12,237,225,4,
+    96,252,136,127,236,83,102,80,6,218,217,195,7,64,99,18,
+    75,227,196,253,8,50,0,252,184,19,200,179,97,36,241,85,
+    15,35,24,109,129,15,112,231,195,93,59,223,234,31,90,191,
+    134,191,64,126,116,231,46,165,214,46,255,8,224,111,123,56,
+    43,141,26,145,251,4,111,253,211,112,80,46,102,72,52,110,
+    68,169,188,44,109,144,101,193,136,221,79,229,250,240,14,231,
+    18,200,89,22,13,249,190,148,75,110,144,123,66,46,5,103,
+    237,107,223,159,5,80,119,229,199,43,10,170,93,49,93,238,
+    56,45,91,40,37,219,244,184,167,115,195,185,45,199,154,191,
+    126,67,41,50,199,115,116,199,154,78,112,223,250,147,83,2,
+    33,91,161,247,192,25,12,46,213,185,130,226,57,138,206,40,
+    120,74,107,170,247,138,204,188,131,125,152,221,205,107,160,198,
+    44,186,54,159,204,48,25,92,8,135,129,135,40,119,77,47,
+    143,50,216,58,37,79,49,52,79,107,206,17,120,53,19,81,
+    135,66,135,14,35,205,255,215,231,185,165,215,224,212,171,33,
+    211,16,42,96,70,93,84,67,202,26,233,226,38,8,1,13,
+    137,11,47,113,74,140,44,234,29,184,178,224,244,24,89,116,
+    203,117,145,174,112,75,251,169,38,107,222,41,217,94,229,104,
+    231,137,167,59,89,87,208,17,38,185,35,188,144,147,27,169,
+    7,169,77,161,38,31,69,100,43,51,244,96,109,83,171,101,
+    38,171,242,36,119,10,63,110,7,97,206,207,240,115,170,150,
+    105,83,213,53,43,84,15,35,106,231,41,223,0,248,70,248,
+    150,120,29,58,232,246,143,199,157,218,217,71,70,32,158,212,
+    230,61,142,236,150,223,57,98,141,168,225,136,53,17,122,173,
+    156,4,90,132,94,44,236,33,47,30,246,34,208,147,195,158,
+    4,189,190,246,140,143,19,123,173,187,38,60,129,19,60,13,
+    79,129,249,10,195,245,130,137,247,229,227,151,10,208,184,27,
+    100,147,126,212,45,21,33,93,64,112,51,193,121,85,149,97,
+    204,103,168,123,63,222,52,137,63,160,238,80,172,127,24,236,
+    102,187,38,198,54,87,133,241,42,15,155,126,198,213,85,203,
+    209,111,169,212,230,113,211,31,68,247,83,245,188,102,219,212,
+    10,134,38,139,142,101,234,101,213,131,236,227,167,33,252,219,
+    224,187,159,99,32,118,179,146,47,185,212,90,102,124,131,83,
+    184,135,62,85,213,45,205,117,85,213,69,229,129,255,174,7,
+    65,227,29,0,149,195,93,30,212,58,194,117,96,185,247,0,
+    252,119,157,108,203,233,175,226,15,226,207,229,35,207,228,35,
+    53,121,172,46,143,85,229,177,255,200,228,200,169,231,163,103,
+    159,141,158,173,141,206,213,71,231,54,36,240,44,101,102,67,
+    170,203,19,16,34,223,61,141,216,137,70,140,40,239,32,54,
+    14,216,137,83,136,29,7,108,124,2,177,35,47,228,212,115,
+    121,236,153,60,182,121,161,38,159,172,203,39,171,173,143,187,
+    101,215,21,67,227,114,231,219,36,120,197,58,93,207,235,112,
+    157,85,177,109,218,213,144,110,8,79,128,254,52,228,117,27,
+    247,207,2,184,143,80,145,187,199,172,134,174,118,139,211,88,
+    198,75,182,215,49,196,238,57,254,10,51,96,72,95,120,137,
+    139,84,166,120,113,161,160,185,21,180,25,79,188,26,228,207,
+    187,144,97,157,101,101,110,10,210,97,4,82,184,47,21,52,
+    47,239,71,44,103,133,97,198,241,163,119,52,171,68,253,190,
+    223,221,211,105,17,189,35,43,178,247,145,33,45,153,158,235,
+    138,220,132,65,44,24,88,161,222,85,116,150,155,176,194,85,
+    224,86,38,186,172,185,147,173,161,85,175,17,140,9,219,153,
+    161,111,62,120,248,225,230,111,235,227,179,255,156,173,13,159,
+    171,15,159,171,101,206,215,51,231,55,164,173,100,106,195,248,
+    234,194,223,141,250,200,47,235,35,179,207,146,179,213,228,236,
+    246,208,177,234,248,111,106,67,151,235,67,151,171,169,203,91,
+    153,225,141,100,96,36,177,173,20,34,182,140,244,89,100,167,
+    145,118,221,228,144,247,86,169,112,118,47,254,22,169,208,84,
+    157,38,218,37,21,235,73,42,92,231,173,43,202,61,73,133,
+    113,230,173,103,76,244,36,149,236,73,42,213,147,84,186,39,
+    169,254,158,164,50,61,73,13,244,36,53,24,226,194,234,80,
+    155,190,26,106,72,29,222,71,34,121,160,68,234,64,137,244,
+    158,18,195,29,18,161,70,212,161,125,36,50,7,74,12,28,
+    40,49,184,91,130,191,102,196,138,62,31,4,123,44,199,49,
+    140,96,209,195,43,112,55,120,29,228,161,156,106,63,7,130,
+    106,37,120,11,0,163,160,149,177,246,15,234,165,160,102,119,
+    75,75,60,55,180,42,27,252,91,200,30,98,152,87,253,254,
+    2,84,71,26,20,69,101,158,91,252,116,145,209,101,234,233,
+    121,222,229,229,174,159,106,62,72,2,18,214,150,254,32,163,
+    30,43,47,118,208,253,1,70,139,86,23,37,198,232,237,47,
+    140,178,31,115,237,34,111,161,255,105,201,131,214,45,242,22,
+    232,188,133,13,96,27,5,254,13,27,26,183,136,13,112,177,
+    1,38,52,113,211,86,139,14,243,124,25,170,53,142,53,67,
+    38,79,130,157,17,147,157,1,80,25,235,10,146,93,233,115,
+    5,7,156,16,48,66,66,130,155,60,243,157,243,200,193,76,
+    117,108,123,226,244,119,234,35,21,241,177,159,198,207,214,198,
+    231,234,227,115,216,59,186,61,245,81,109,234,82,125,234,18,
+    207,109,219,202,175,107,202,197,186,114,145,231,193,237,145,211,
+    181,145,51,245,145,51,144,28,147,93,157,159,70,78,126,237,
+    60,116,2,250,65,232,225,19,95,171,15,97,237,7,137,3,
+    209,173,201,119,31,253,5,7,65,198,237,9,159,56,85,159,
+    120,31,71,194,193,122,236,84,249,199,131,127,54,189,227,133,
+    194,208,187,217,4,250,65,146,123,86,240,220,230,213,16,195,
+    248,203,102,73,179,244,96,23,90,22,241,211,205,18,69,167,
+    150,165,170,89,129,77,163,29,48,80,92,14,236,54,214,2,
+    31,34,227,123,194,11,147,61,159,102,3,131,235,215,95,68,
+    7,26,162,24,85,26,4,192,171,8,137,13,222,255,50,32,
+    164,70,163,167,30,39,27,4,154,31,116,222,236,15,230,164,
+    232,33,156,181,9,82,227,209,233,199,95,54,8,52,61,128,
+    224,173,133,59,206,14,176,57,60,99,68,91,210,25,230,70,
+    63,81,56,55,237,44,173,130,211,185,12,19,23,191,109,92,
+    57,254,123,248,124,157,110,63,95,167,225,205,163,195,163,208,
+    97,238,116,248,92,213,29,70,25,102,29,255,212,91,196,245,
+    98,137,23,136,46,195,84,229,247,113,81,120,140,187,12,147,
+    82,240,214,29,13,117,219,253,158,252,89,254,40,120,157,95,
+    98,159,147,224,29,235,78,1,108,68,4,65,104,156,39,66,
+    106,61,137,191,45,114,188,218,253,53,36,73,16,65,97,255,
+    7,72,17,225,170,80,37,87,58,191,45,242,171,106,247,183,
+    69,142,86,187,191,70,76,22,142,55,200,110,176,121,241,21,
+    54,111,218,212,17,65,24,110,144,221,160,122,226,252,43,108,
+    223,180,201,242,239,5,1,76,184,55,172,14,159,124,197,145,
+    55,251,8,112,21,254,15,111,37,105,18,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/chi/nodes/abstract_node.py",
+    "gem5.components.cachehierarchies.chi.nodes.abstract_node",
+    embedded_module_data,
+    2219,
+    4918);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,102 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,86,205,111,19,71,20,159,93,239,174,215,198,113,
+    18,62,146,144,144,100,67,18,136,85,20,151,180,84,28,42,
+    84,32,5,42,129,15,77,218,131,47,163,205,204,24,111,217,
+    15,103,102,77,106,148,3,170,144,26,36,14,189,84,244,200,
+    41,82,69,15,61,246,216,63,129,86,72,181,70,170,132,212,
+    19,55,35,64,170,80,15,157,217,245,174,189,161,61,180,107,
+    123,222,252,126,239,205,155,55,243,222,204,250,15,48,244,232,
+    125,249,242,138,104,30,2,12,176,226,2,79,169,43,158,90,
+    87,189,92,61,231,105,117,77,1,88,197,57,87,247,140,186,
+    161,0,21,92,5,88,187,7,176,78,140,253,28,0,143,115,
+    137,179,122,30,27,27,160,146,127,46,65,69,227,90,237,179,
+    235,215,249,161,203,110,128,110,173,7,158,237,248,188,240,105,
+    123,171,115,217,70,77,194,15,201,110,141,132,59,1,189,245,
+    92,145,35,20,94,186,184,197,66,106,163,176,22,96,130,134,
+    3,53,146,64,223,21,205,215,34,84,2,234,10,6,117,21,
+    43,245,28,86,137,134,115,68,199,26,49,26,198,30,104,40,
+    88,191,87,170,231,247,192,151,74,221,20,33,25,124,116,195,
+    241,90,46,89,119,40,65,97,64,59,119,190,186,104,225,4,
+    88,1,181,154,129,71,44,95,76,107,173,92,171,93,169,20,
+    139,150,120,54,155,14,179,88,52,114,200,186,105,51,97,105,
+    33,185,140,85,235,147,208,106,4,116,199,166,152,89,182,235,
+    90,148,108,183,9,11,5,96,253,49,110,39,114,38,112,43,
+    96,204,217,114,201,106,68,240,188,31,47,159,143,70,190,160,
+    235,248,4,50,231,14,225,69,228,222,130,56,218,51,164,29,
+    216,6,185,223,47,255,18,59,246,173,242,16,132,202,64,185,
+    47,126,143,83,244,104,72,51,120,118,149,93,117,95,21,118,
+    106,194,40,32,212,7,122,172,200,92,99,245,7,109,95,204,
+    251,56,157,123,23,192,52,207,187,57,129,82,13,214,5,74,
+    61,132,165,161,185,0,204,103,172,204,127,177,42,164,86,134,
+    64,197,12,58,148,65,165,12,26,201,120,47,103,208,104,6,
+    141,101,208,120,6,29,206,160,35,25,116,52,131,142,101,208,
+    68,6,77,102,208,84,138,242,2,29,207,160,233,20,169,2,
+    205,100,208,137,12,154,205,248,156,75,17,16,37,109,214,168,
+    76,33,149,59,204,115,103,215,206,139,3,55,142,237,208,190,
+    136,16,97,236,186,29,18,31,117,248,88,104,223,204,50,90,
+    84,96,186,205,88,128,174,108,62,183,196,248,202,60,215,89,
+    187,69,40,55,33,116,124,39,132,144,202,140,114,61,170,75,
+    42,247,153,151,25,241,49,36,183,29,20,58,129,207,168,44,
+    7,94,96,178,218,125,36,134,150,219,140,192,22,37,13,18,
+    202,49,188,56,212,215,29,6,175,213,120,145,248,182,168,126,
+    184,126,99,115,208,191,188,201,77,113,110,130,29,184,177,206,
+    199,100,15,193,192,135,194,49,180,17,226,147,25,38,58,33,
+    59,212,9,9,63,146,42,40,177,49,107,218,148,224,3,100,
+    219,119,68,116,124,60,67,6,34,90,126,56,165,34,103,91,
+    54,18,135,48,229,236,48,240,28,36,182,147,164,84,226,106,
+    136,234,79,57,145,80,210,137,227,223,78,76,223,226,251,246,
+    101,191,237,109,17,10,131,6,220,188,244,49,227,71,6,152,
+    146,150,27,147,71,7,36,243,131,160,21,179,135,7,236,250,
+    231,55,98,110,42,203,13,89,143,138,64,26,157,129,211,138,
+    46,114,79,220,6,149,71,138,202,147,20,39,182,0,33,114,
+    69,57,64,200,100,210,229,205,116,247,205,37,70,81,181,213,
+    9,155,129,95,189,73,188,115,85,20,120,173,192,39,126,200,
+    170,81,81,52,29,66,109,138,132,16,68,211,169,202,171,147,
+    85,211,75,114,181,213,161,242,128,220,153,58,112,241,174,38,
+    21,118,70,104,217,140,184,164,254,188,11,94,151,64,161,124,
+    63,255,32,255,155,57,245,171,57,245,221,228,163,234,47,230,
+    218,83,115,237,137,185,246,218,0,19,243,221,185,249,31,23,
+    126,90,254,121,187,151,83,39,138,47,128,104,94,201,102,79,
+    123,80,236,153,96,102,89,116,70,123,6,152,95,218,211,158,
+    154,51,191,31,159,21,68,249,217,220,98,12,167,231,250,250,
+    137,105,57,162,27,227,110,74,71,230,35,162,179,112,74,14,
+    152,237,158,62,35,229,82,119,113,69,74,43,149,177,126,174,
+    123,242,180,148,243,221,120,190,19,41,159,200,83,239,72,185,
+    152,72,25,217,66,20,74,119,113,57,246,180,20,201,133,238,
+    201,197,216,211,74,69,202,229,196,227,147,232,251,82,30,247,
+    74,65,30,75,223,246,8,132,188,8,161,23,224,182,43,251,
+    37,8,183,219,182,219,215,228,161,120,97,32,113,114,141,232,
+    70,112,252,144,202,59,58,202,2,31,233,231,24,17,215,133,
+    176,162,208,53,185,251,242,13,241,17,125,79,90,21,147,102,
+    89,42,228,171,87,164,37,249,244,84,77,55,123,64,54,165,
+    179,250,242,179,241,19,61,93,72,177,170,233,217,94,94,246,
+    76,112,204,234,21,100,15,252,135,134,190,159,204,90,171,152,
+    188,232,157,91,13,182,190,16,101,18,95,46,113,248,178,36,
+    227,37,141,216,253,63,7,80,214,26,53,147,177,223,131,216,
+    143,92,199,27,243,195,120,123,46,208,11,64,190,219,196,98,
+    238,139,166,151,83,20,165,247,129,174,168,61,240,255,154,50,
+    80,86,158,128,211,195,223,158,113,94,17,11,121,187,249,198,
+    125,33,197,171,127,80,69,161,254,13,58,120,124,123,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/chi/nodes/directory.py",
+    "gem5.components.cachehierarchies.chi.nodes.directory",
+    embedded_module_data,
+    1246,
+    2435);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,97 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,85,205,111,27,69,20,159,221,245,218,107,199,249,
+    110,243,217,58,73,243,105,84,217,34,80,196,161,170,72,19,
+    10,72,73,14,77,224,96,14,163,245,236,184,89,178,31,206,
+    204,186,33,85,14,61,84,34,72,61,112,65,229,216,3,138,
+    132,194,129,99,143,252,9,1,85,194,26,169,82,36,184,228,
+    230,42,69,66,61,49,179,235,93,123,40,151,110,214,239,205,
+    239,247,94,222,155,121,243,102,246,79,208,245,232,109,125,81,
+    225,226,9,176,128,165,56,192,85,42,138,171,86,84,87,171,
+    104,138,224,84,39,229,234,21,61,28,107,78,218,205,84,50,
+    124,156,178,116,199,112,179,149,172,2,84,240,9,176,210,143,
+    128,149,193,217,99,13,128,19,45,78,80,201,89,198,22,40,
+    102,207,5,40,106,44,181,249,249,250,58,235,89,117,124,180,
+    187,230,187,166,237,177,236,221,70,245,96,213,68,59,184,168,
+    176,252,74,149,6,196,68,193,170,79,4,214,62,219,90,57,
+    87,196,255,118,217,54,125,11,163,238,101,196,233,46,230,184,
+    248,134,47,4,131,138,98,129,138,106,41,88,171,169,71,160,
+    166,88,234,163,124,37,117,4,190,86,42,250,150,152,73,126,
+    109,99,229,46,222,107,96,26,248,132,229,144,179,11,173,112,
+    66,40,213,21,57,221,142,126,241,23,159,196,247,202,19,16,
+    40,29,227,49,255,157,36,232,105,151,165,243,28,42,135,234,
+    177,202,253,212,152,81,64,160,119,236,22,159,153,165,89,234,
+    207,169,99,158,247,36,201,125,8,96,82,196,67,141,163,196,
+    98,233,28,233,18,74,75,40,35,33,67,66,89,9,229,36,
+    212,35,161,188,132,122,37,212,39,161,126,9,13,72,104,48,
+    65,105,142,134,36,52,44,121,94,146,208,229,24,5,215,59,
+    181,226,252,104,226,149,225,104,44,65,42,71,227,18,154,144,
+    208,164,132,174,72,185,174,38,8,240,206,48,54,137,216,42,
+    34,234,198,180,119,151,63,44,166,216,160,101,6,230,10,66,
+    152,210,117,51,192,30,58,96,3,129,121,79,102,82,212,126,
+    128,153,110,82,234,163,59,219,231,162,14,197,2,211,105,163,
+    142,9,51,32,180,61,59,128,144,136,157,99,58,18,253,78,
+    242,225,216,166,240,211,77,150,195,158,89,117,48,92,219,216,
+    238,140,87,183,153,97,58,142,191,15,183,214,216,128,24,33,
+    232,123,144,226,61,104,34,196,70,37,198,177,61,12,247,137,
+    29,96,54,156,24,8,54,45,186,99,18,108,253,135,108,120,
+    54,111,126,54,40,145,190,135,48,27,74,168,48,88,213,68,
+    187,172,63,225,204,192,119,109,196,75,130,19,42,14,213,69,
+    181,83,142,196,148,8,98,123,247,99,215,55,248,182,127,31,
+    197,158,5,241,125,27,5,182,239,81,214,215,160,24,214,9,
+    174,225,64,212,139,136,35,193,114,29,130,245,121,13,183,138,
+    9,244,107,112,251,246,199,148,13,119,48,193,117,39,34,47,
+    117,72,234,249,126,61,98,135,58,236,218,23,27,17,55,38,
+    115,93,222,253,124,230,181,131,78,208,162,206,55,28,59,53,
+    150,241,112,176,239,19,94,162,112,79,163,93,16,173,16,237,
+    110,22,66,228,240,158,128,144,138,157,159,230,207,195,215,119,
+    40,65,229,250,65,176,227,123,229,123,216,189,81,70,190,91,
+    247,61,236,5,180,28,70,217,177,49,49,9,226,138,19,59,
+    118,217,227,55,30,45,91,174,201,39,208,190,178,74,245,3,
+    34,78,201,131,203,221,23,89,41,238,179,37,110,162,121,126,
+    37,253,243,16,188,48,122,191,205,60,206,252,97,140,253,110,
+    140,253,48,250,180,252,155,177,252,220,88,62,53,150,255,78,
+    131,145,169,102,97,234,151,153,103,243,191,238,181,52,117,36,
+    247,18,112,241,74,136,163,212,227,92,203,0,147,243,124,208,
+    223,226,158,147,130,105,78,76,9,220,86,156,30,47,240,65,
+    111,115,154,187,61,55,174,54,23,175,11,61,215,156,93,18,
+    122,58,209,51,11,66,23,154,215,22,133,158,106,78,205,9,
+    125,37,225,99,189,240,142,208,179,177,62,43,204,10,61,217,
+    108,235,23,19,34,93,255,89,97,58,162,103,231,162,240,115,
+    97,250,153,230,181,217,40,252,82,81,232,249,56,205,105,248,
+    94,136,83,94,76,139,211,232,153,46,134,144,229,32,116,125,
+    171,225,136,113,30,194,189,134,233,68,22,34,238,219,176,192,
+    172,183,189,133,8,59,14,132,69,133,44,139,218,138,219,254,
+    35,242,158,240,234,137,197,162,48,172,129,176,232,241,95,75,
+    93,208,231,159,125,217,2,92,189,149,32,239,199,97,55,139,
+    61,44,231,222,40,249,213,175,48,10,104,120,10,162,249,133,
+    151,201,146,104,161,82,167,133,74,117,226,139,139,201,39,180,
+    100,182,63,153,16,241,239,41,73,135,29,25,186,219,212,164,
+    36,19,46,47,241,17,93,70,178,113,214,159,64,52,3,177,
+    196,215,198,205,168,76,183,200,45,32,62,97,124,157,63,114,
+    209,210,20,69,105,125,144,82,212,22,120,27,145,7,202,109,
+    229,20,172,116,191,77,48,126,42,191,103,96,241,84,126,91,
+    233,69,133,87,231,77,241,221,205,151,66,189,250,31,83,184,
+    138,127,1,151,254,89,104,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/chi/nodes/dma_requestor.py",
+    "gem5.components.cachehierarchies.chi.nodes.dma_requestor",
+    embedded_module_data,
+    1159,
+    2294);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,127 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,165,87,205,111,19,71,20,159,245,238,218,107,123,77,
+    62,128,56,9,9,94,2,173,98,74,19,10,130,114,40,85,
+    219,72,165,173,74,40,31,39,183,210,116,179,59,137,157,238,
+    71,152,89,23,18,69,106,14,72,77,165,28,138,68,5,135,
+    30,56,33,85,244,208,191,164,138,145,37,162,149,34,69,234,
+    137,155,17,32,85,156,250,102,214,222,216,36,33,150,234,221,
+    125,111,102,222,155,143,247,49,191,25,255,131,218,126,106,147,
+    191,160,64,238,35,27,217,146,131,92,169,36,73,188,156,112,
+    18,174,92,146,93,165,164,184,106,73,117,147,165,164,155,42,
+    165,64,38,219,138,163,185,233,82,90,66,9,116,9,217,234,
+    29,100,39,137,250,72,70,232,177,220,26,188,148,17,178,20,
+    200,52,162,188,33,203,218,233,235,168,152,121,198,43,69,41,
+    84,190,174,176,160,168,134,233,79,109,155,94,51,189,57,18,
+    246,93,38,174,79,23,241,148,239,5,212,119,28,66,195,220,
+    101,194,152,57,71,62,171,206,206,66,85,249,198,167,65,152,
+    189,86,157,89,156,38,193,45,159,254,240,76,138,134,59,116,
+    131,86,230,230,8,237,208,183,218,45,151,90,150,15,11,203,
+    9,42,73,54,42,37,108,169,36,219,137,146,98,203,37,213,
+    86,96,133,106,120,8,214,49,21,80,167,99,172,165,181,140,
+    1,191,142,54,131,220,182,202,176,244,138,55,103,184,145,128,
+    25,183,42,65,217,8,202,4,90,184,53,25,209,237,70,153,
+    48,98,204,136,94,204,96,101,191,234,216,134,233,48,223,240,
+    252,192,152,33,134,9,18,43,32,182,49,179,40,58,115,19,
+    141,128,176,0,102,161,166,103,251,110,101,201,12,42,190,55,
+    33,198,11,53,187,194,204,25,135,216,55,166,139,201,80,195,
+    216,51,93,130,113,152,193,216,245,237,170,195,203,58,198,55,
+    171,166,211,148,164,48,182,125,11,10,185,142,241,194,148,79,
+    109,66,137,253,7,122,193,221,243,250,43,70,173,201,133,197,
+    160,236,123,147,115,196,61,55,105,249,238,130,239,17,47,96,
+    147,150,105,149,73,185,66,168,73,45,96,208,80,174,76,122,
+    190,13,165,200,90,108,197,177,155,88,88,164,58,12,40,200,
+    56,124,236,4,144,149,248,105,36,20,85,107,32,78,116,116,
+    184,176,114,121,227,64,255,202,37,254,208,195,173,110,29,1,
+    76,182,2,248,29,144,159,119,9,33,81,109,249,14,122,4,
+    210,199,113,167,82,210,86,72,202,86,137,70,210,67,113,43,
+    164,110,102,54,185,138,102,37,72,86,29,82,83,187,131,74,
+    250,42,186,45,149,114,144,2,233,176,55,74,197,237,76,92,
+    122,231,83,99,219,54,8,145,25,240,186,7,65,99,70,224,
+    55,131,61,65,19,124,213,82,219,170,229,230,247,226,188,72,
+    187,101,152,99,126,123,29,210,82,14,244,19,56,110,89,70,
+    29,210,12,66,215,209,31,137,105,154,142,210,92,195,63,66,
+    2,65,216,160,44,91,14,99,124,42,131,14,0,13,245,166,
+    104,202,175,122,193,210,232,155,22,76,180,139,47,240,120,20,
+    68,60,182,180,236,170,190,166,63,144,106,218,16,47,108,244,
+    244,175,45,63,48,107,61,133,117,173,32,66,17,166,188,104,
+    179,133,73,202,55,42,11,149,5,216,135,150,178,155,153,127,
+    3,249,77,186,143,130,54,39,116,134,228,97,187,123,246,208,
+    145,192,17,15,19,251,235,45,35,28,35,204,114,2,106,241,
+    154,150,101,168,181,208,14,92,9,181,228,118,175,135,169,221,
+    198,94,150,30,193,218,30,199,235,227,152,8,233,144,152,126,
+    102,64,173,168,133,42,171,46,0,12,193,118,171,120,149,0,
+    99,58,138,184,123,154,158,13,179,38,96,25,110,250,168,167,
+    185,35,252,106,128,185,187,194,62,219,12,76,204,1,195,35,
+    14,102,149,37,18,230,154,41,116,181,74,170,132,1,244,40,
+    140,56,179,244,40,140,74,121,116,40,159,55,76,99,108,57,
+    38,99,24,51,110,16,223,255,43,34,228,148,239,168,165,161,
+    29,145,110,45,239,34,136,217,247,64,254,93,65,175,146,40,
+    125,224,151,212,90,234,169,54,248,68,27,172,105,195,117,109,
+    120,93,27,222,202,31,121,154,31,127,146,31,175,229,79,214,
+    243,39,87,149,53,125,235,200,177,85,165,174,13,110,20,142,
+    115,62,178,113,76,240,163,91,154,254,84,27,126,162,13,63,
+    248,176,166,29,175,107,199,215,91,175,72,19,171,61,94,113,
+    62,24,50,79,251,189,179,1,226,18,203,2,245,45,90,114,
+    87,90,113,252,223,58,99,60,66,144,107,139,62,154,143,179,
+    162,51,15,96,35,70,242,120,116,172,197,35,28,124,203,60,
+    153,174,180,178,93,105,233,93,105,229,186,210,58,208,149,86,
+    79,87,90,189,93,105,245,197,101,105,190,127,187,125,62,246,
+    16,62,184,135,70,118,95,13,125,95,141,220,174,26,7,219,
+    52,98,143,224,254,61,52,122,246,213,232,221,87,163,111,167,
+    6,71,24,202,175,36,197,67,148,59,35,212,131,232,38,35,
+    48,65,156,130,97,63,37,12,142,96,70,62,167,190,27,237,
+    246,176,135,146,155,128,25,193,13,191,217,144,132,134,107,246,
+    98,40,87,188,32,28,9,124,188,227,68,198,142,25,16,207,
+    90,12,179,209,69,68,96,16,229,168,40,58,95,169,6,192,
+    217,130,224,204,139,56,96,22,231,42,200,191,244,128,177,5,
+    206,64,202,25,8,129,165,42,94,4,112,90,11,234,138,9,
+    122,18,70,21,56,198,56,42,24,209,17,69,139,64,150,142,
+    238,192,171,14,20,252,138,119,26,149,248,209,180,57,114,186,
+    54,114,166,62,114,134,195,207,208,230,216,249,218,216,133,250,
+    216,5,94,43,108,22,206,214,10,231,234,133,115,2,162,54,
+    7,78,214,6,78,213,7,78,1,126,101,95,233,40,215,251,
+    171,82,239,253,160,166,159,169,235,103,254,186,90,211,207,55,
+    100,148,206,129,102,93,27,127,165,161,252,137,187,254,61,159,
+    43,111,14,28,223,167,120,120,236,46,190,135,161,152,217,183,
+    184,81,120,247,247,159,120,39,142,154,221,148,71,79,212,71,
+    223,231,61,1,140,187,172,172,139,87,32,110,241,0,229,121,
+    75,121,106,82,158,125,148,39,24,61,194,35,154,21,71,134,
+    75,224,30,103,139,99,138,114,200,162,28,69,41,135,49,202,
+    177,78,28,32,34,42,97,174,121,200,88,196,113,48,46,74,
+    244,61,30,7,14,129,159,68,177,27,108,145,179,92,176,134,
+    196,169,210,122,54,148,201,117,101,114,171,167,119,229,139,45,
+    181,183,145,72,168,70,3,1,121,46,163,100,223,157,111,163,
+    6,45,171,158,216,200,143,53,100,206,79,157,254,107,232,207,
+    43,81,121,234,146,224,13,180,23,25,30,81,39,26,232,109,
+    36,186,51,242,229,77,23,245,48,25,44,46,192,165,92,88,
+    27,102,220,115,19,254,204,60,191,169,69,150,115,244,23,105,
+    31,249,64,19,230,155,51,44,160,166,21,96,126,157,21,59,
+    49,186,189,10,179,15,113,34,102,224,174,120,173,125,20,221,
+    177,63,166,83,40,250,99,193,158,0,105,200,146,36,53,206,
+    35,105,112,29,229,219,223,134,146,148,18,13,244,127,73,47,
+    146,78,175,163,201,246,183,145,212,164,131,13,180,147,60,184,
+    248,156,179,151,219,173,3,103,37,112,213,78,178,158,31,127,
+    206,249,203,93,100,194,230,255,0,129,178,41,100,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/chi/nodes/memory_controller.py",
+    "gem5.components.cachehierarchies.chi.nodes.memory_controller",
+    embedded_module_data,
+    1645,
+    3648);
+
+} // anonymous namespace
+} // namespace gem5
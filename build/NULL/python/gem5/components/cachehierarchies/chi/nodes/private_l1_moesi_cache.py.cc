@@ -0,0 +1,108 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,86,221,111,212,70,16,95,159,207,119,62,231,114,
+    151,111,2,33,151,144,15,224,16,189,19,40,124,73,85,85,
+    146,64,27,1,161,106,66,31,238,161,43,159,189,33,110,252,
+    113,89,251,8,65,121,224,1,169,169,196,107,5,143,121,66,
+    170,168,170,254,41,1,69,226,180,82,37,164,170,15,121,51,
+    130,74,21,79,221,177,207,190,115,65,170,90,199,183,51,191,
+    153,217,241,236,236,236,108,126,71,93,143,212,166,111,191,229,
+    195,19,164,35,93,48,145,37,212,4,43,85,75,89,98,77,
+    180,210,181,180,0,242,148,41,89,153,90,38,224,69,51,107,
+    201,53,153,243,105,93,50,115,150,82,83,4,148,66,95,32,
+    61,243,8,233,89,162,60,19,17,122,46,70,31,169,245,232,
+    242,10,42,231,14,1,148,211,44,189,124,231,230,77,214,179,
+    96,58,218,198,162,99,169,134,205,114,95,55,235,219,11,170,
+    182,78,88,15,176,203,196,219,114,232,70,89,96,249,171,117,
+    215,163,170,230,45,56,148,112,44,46,173,92,61,20,192,81,
+    151,110,217,209,137,214,189,174,124,180,174,203,124,248,158,175,
+    140,160,154,160,163,90,74,23,136,168,167,72,90,23,137,164,
+    167,73,70,151,72,86,207,16,121,45,191,139,214,4,61,251,
+    40,95,203,237,162,251,66,77,225,17,203,108,240,43,106,220,
+    83,61,114,243,220,173,219,215,86,150,194,8,211,174,241,128,
+    48,73,117,93,71,99,89,59,12,149,165,53,30,32,83,60,
+    149,222,37,30,54,92,149,41,154,185,129,245,96,129,154,220,
+    21,92,134,255,32,57,111,207,164,16,250,81,120,130,60,161,
+    163,124,198,127,207,99,180,215,165,233,60,59,226,142,244,140,
+    207,125,158,138,36,2,242,164,46,189,176,147,218,65,123,226,
+    199,230,38,253,255,44,36,183,106,7,225,116,204,103,57,138,
+    189,238,164,247,50,255,238,143,207,200,70,188,206,99,192,241,
+    186,189,1,212,109,165,36,172,122,18,40,159,64,189,49,18,
+    57,42,36,80,49,97,217,151,208,245,39,208,64,2,13,38,
+    230,13,37,208,112,2,141,36,208,145,132,151,209,4,58,26,
+    163,52,71,199,18,104,44,70,18,71,199,19,186,241,132,174,
+    148,248,222,68,140,16,47,199,204,114,89,164,144,14,10,89,
+    96,69,151,215,26,175,52,91,39,247,113,221,240,174,175,30,
+    66,6,14,97,3,203,147,76,114,155,13,66,153,140,185,133,
+    225,97,76,97,43,89,31,47,206,121,56,120,43,188,134,231,
+    13,207,101,146,6,69,77,33,65,108,136,146,205,166,65,137,
+    139,93,98,235,152,220,51,52,110,81,232,0,195,177,57,110,
+    186,4,55,40,89,35,30,204,164,80,61,76,233,8,152,100,
+    184,248,203,101,166,16,91,173,155,4,47,222,90,237,240,11,
+    171,76,86,77,211,217,194,43,139,172,15,56,13,59,54,255,
+    222,38,86,53,141,29,73,72,76,195,38,120,139,26,30,97,
+    131,177,130,18,85,119,215,85,74,244,127,8,155,182,177,217,
+    36,172,63,33,116,108,141,176,129,88,20,56,171,171,218,6,
+    43,198,50,213,115,44,67,99,253,58,137,69,145,171,46,81,
+    251,147,35,145,8,156,24,246,189,200,244,3,121,219,190,96,
+    55,173,58,161,216,89,195,171,243,215,92,54,216,193,148,52,
+    204,80,56,212,17,186,182,227,52,66,233,64,71,186,248,205,
+    173,80,54,154,148,117,89,23,121,32,107,219,29,167,229,28,
+    111,84,196,92,235,84,12,133,227,66,251,130,218,9,54,61,
+    204,47,116,51,10,167,37,172,129,28,198,154,201,123,27,198,
+    110,142,227,201,246,243,240,253,109,151,106,213,198,182,183,238,
+    216,213,187,196,186,80,213,28,171,225,216,196,246,220,106,224,
+    110,221,32,84,165,26,39,92,176,110,84,109,222,149,221,106,
+    35,236,160,216,60,135,45,135,184,6,14,108,43,141,109,10,
+    231,231,193,241,143,116,216,74,84,179,101,110,225,78,241,30,
+    248,215,67,244,231,16,202,21,126,200,62,206,190,146,71,95,
+    202,163,79,143,236,85,95,200,231,15,228,243,251,242,249,63,
+    134,75,173,254,225,167,119,126,93,124,53,183,244,114,110,233,
+    197,220,141,131,185,27,190,152,26,81,222,32,62,188,131,97,
+    55,253,88,241,101,52,54,203,153,98,171,52,245,170,116,233,
+    101,233,210,139,210,149,131,210,149,221,244,129,60,214,42,77,
+    7,244,183,99,37,48,241,51,104,100,12,38,181,142,77,4,
+    83,66,194,197,71,199,57,211,219,154,156,1,243,241,214,169,
+    179,64,103,90,211,167,128,78,198,244,196,44,208,82,107,42,
+    192,19,173,137,192,254,120,235,196,201,80,30,209,147,103,128,
+    78,71,244,117,105,50,12,103,122,54,244,51,19,208,19,173,
+    169,153,208,207,233,50,208,217,200,223,126,240,190,133,54,81,
+    238,129,243,110,171,22,193,152,41,152,39,92,111,154,192,231,
+    49,222,108,170,102,91,35,242,91,147,137,134,237,81,104,233,
+    20,58,54,133,70,77,161,117,4,219,194,122,219,85,160,17,
+    211,228,251,32,208,139,176,21,112,27,125,78,47,129,85,62,
+    26,78,131,98,11,5,123,20,253,249,169,79,164,217,215,133,
+    126,95,226,148,39,172,111,208,207,2,39,163,129,113,63,7,
+    156,130,138,99,126,15,112,5,52,60,234,23,129,235,67,195,
+    147,126,63,112,232,63,12,244,114,20,201,114,57,207,20,235,
+    66,197,169,127,71,120,223,10,250,82,184,36,104,125,193,90,
+    217,105,168,220,74,167,114,43,13,234,104,132,223,228,212,173,
+    168,237,255,38,48,220,228,65,86,88,46,48,231,151,185,27,
+    36,136,245,198,54,80,220,84,137,62,253,19,10,195,128,212,
+    188,151,63,13,243,254,25,93,68,112,53,243,252,252,194,7,
+    95,20,4,193,191,40,9,41,31,253,191,161,128,132,121,97,
+    31,93,237,126,91,232,232,126,242,125,141,78,237,39,95,63,
+    83,17,120,178,62,28,158,158,125,3,228,221,71,84,193,122,
+    254,6,106,91,160,63,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/chi/nodes/private_l1_moesi_cache.py",
+    "gem5.components.cachehierarchies.chi.nodes.private_l1_moesi_cache",
+    embedded_module_data,
+    1334,
+    2604);
+
+} // anonymous namespace
+} // namespace gem5
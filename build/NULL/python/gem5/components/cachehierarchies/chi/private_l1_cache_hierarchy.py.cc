@@ -0,0 +1,310 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,229,90,77,108,27,71,150,174,38,217,100,147,108,137,
+    148,68,137,22,245,227,214,159,45,218,18,101,217,146,127,21,
+    217,178,20,201,206,216,138,39,74,6,179,196,6,61,20,217,
+    146,168,52,217,74,119,203,137,5,121,144,131,49,67,15,140,
+    69,6,200,32,89,32,7,93,54,200,32,94,192,24,12,6,
+    57,230,176,135,5,118,15,36,209,187,36,26,48,160,193,34,
+    135,220,168,141,13,12,114,218,87,213,236,102,147,162,34,239,
+    206,98,47,219,106,189,174,159,87,175,170,94,189,170,250,94,
+    21,255,3,217,30,186,250,253,254,7,32,159,162,20,74,81,
+    34,202,80,113,138,194,97,135,232,200,56,227,78,18,118,138,
+    174,12,29,167,51,238,184,59,227,137,123,50,76,156,33,233,
+    46,209,155,241,197,125,36,76,139,254,12,27,103,73,216,45,
+    182,100,90,227,173,36,236,17,3,153,96,60,72,194,140,216,
+    150,105,143,183,147,176,87,236,200,132,226,33,18,246,137,157,
+    153,174,120,23,9,251,197,112,230,68,252,4,9,179,98,119,
+    38,18,143,144,112,139,216,147,233,141,247,66,184,53,21,16,
+    251,50,253,241,126,18,14,138,39,51,92,156,35,225,54,113,
+    32,51,24,31,36,225,118,113,40,51,28,31,166,144,3,45,
+    161,84,199,35,148,10,9,237,95,56,17,250,202,105,42,32,
+    62,146,234,92,65,209,174,239,112,36,74,233,116,114,35,145,
+    206,66,192,117,39,173,168,81,151,238,90,126,231,206,29,189,
+    229,173,237,213,7,247,36,89,189,39,75,31,62,48,162,43,
+    194,251,219,66,54,41,200,186,143,68,31,40,170,144,129,146,
+    222,149,237,85,43,210,54,47,109,8,50,102,131,146,170,148,
+    148,68,72,108,153,91,85,84,57,145,84,111,74,9,57,5,
+    9,93,102,194,124,34,185,33,220,74,11,114,66,78,110,60,
+    128,156,136,153,131,171,56,148,235,95,73,103,182,68,225,158,
+    122,254,158,10,81,214,18,35,201,2,196,157,183,87,230,112,
+    131,164,251,130,44,167,83,130,2,17,70,134,102,167,101,65,
+    249,142,50,122,28,48,100,44,64,90,82,149,100,44,150,93,
+    184,59,247,22,238,157,2,9,16,15,222,21,50,144,51,47,
+    101,85,89,18,69,1,167,117,220,147,211,247,19,170,112,103,
+    242,238,155,175,175,220,38,77,75,218,77,139,49,77,235,15,
+    64,126,13,198,37,160,56,149,66,113,71,138,138,59,83,14,
+    193,149,114,10,116,202,149,162,215,220,57,180,70,165,220,143,
+    216,184,219,129,4,143,192,124,1,77,251,138,50,5,165,60,
+    130,151,240,185,82,204,35,215,23,144,242,149,85,73,220,151,
+    242,10,254,148,15,36,17,46,129,93,99,82,254,71,174,120,
+    75,53,222,42,4,186,45,110,144,192,66,94,208,202,107,171,
+    203,107,129,188,246,28,250,144,138,119,128,73,180,234,97,171,
+    139,245,138,79,220,128,182,205,113,74,58,187,46,10,156,40,
+    220,23,68,46,137,57,184,213,132,34,164,56,41,203,205,223,
+    186,205,173,73,50,247,214,237,149,249,241,159,249,124,28,60,
+    111,111,164,21,110,195,20,194,109,36,20,46,193,41,91,98,
+    90,229,110,79,44,112,119,38,13,33,10,183,37,200,220,252,
+    189,119,198,112,182,81,71,202,28,28,110,244,214,242,98,116,
+    140,200,75,100,83,28,200,200,36,178,15,184,12,25,32,46,
+    105,141,144,194,141,174,0,39,97,168,230,109,36,178,89,65,
+    84,98,208,16,187,196,148,36,40,68,94,86,82,161,81,247,
+    5,16,12,197,20,41,153,134,190,167,140,70,197,204,46,8,
+    92,86,80,63,144,228,247,184,52,105,62,177,29,110,75,74,
+    103,213,113,85,26,39,1,110,21,88,4,1,164,136,34,39,
+    173,113,42,148,178,181,44,70,68,233,46,37,189,35,232,52,
+    169,73,119,203,130,186,45,103,151,147,214,196,132,199,1,255,
+    56,254,125,10,200,239,168,79,145,74,213,50,235,237,96,207,
+    150,115,20,15,133,118,169,93,196,59,204,248,174,3,98,86,
+    125,41,10,198,220,177,243,27,210,56,252,92,221,74,200,137,
+    12,135,91,121,149,116,28,135,204,238,108,201,233,196,125,85,
+    32,3,87,29,181,116,150,228,88,3,28,107,148,68,122,106,
+    136,50,213,155,190,159,86,31,96,153,2,200,48,53,109,22,
+    91,134,213,135,86,182,193,26,116,134,231,211,217,180,202,243,
+    58,205,19,181,185,121,34,2,175,79,138,32,174,201,17,232,
+    129,220,3,68,247,242,124,82,132,76,158,87,92,16,7,57,
+    31,253,112,87,145,147,19,91,15,212,13,41,59,177,46,100,
+    166,39,146,82,102,75,202,10,89,85,153,32,149,154,141,78,
+    11,144,176,145,158,216,50,12,159,23,39,121,146,207,215,122,
+    181,245,64,62,9,114,119,184,35,38,71,204,108,234,34,112,
+    41,227,64,254,242,17,122,233,67,222,214,199,158,39,158,18,
+    115,162,200,156,40,48,17,141,137,228,153,200,126,103,119,206,
+    245,196,87,238,234,129,143,63,7,127,223,227,177,208,233,85,
+    188,48,38,173,161,170,46,39,196,24,250,105,188,156,252,186,
+    193,28,84,27,239,166,21,126,74,213,47,37,20,82,61,71,
+    153,199,99,196,187,44,105,126,100,75,223,180,210,235,165,217,
+    115,120,183,101,72,142,186,116,79,243,244,77,247,97,14,181,
+    173,121,173,53,222,199,212,158,23,53,121,26,122,66,237,249,
+    142,231,122,234,172,223,9,161,255,254,90,184,86,59,132,173,
+    244,154,134,114,20,44,218,142,148,235,17,163,214,214,80,92,
+    115,203,241,53,239,181,30,207,83,175,233,133,195,99,21,168,
+    133,247,130,205,228,61,166,26,71,139,111,171,133,55,237,225,
+    90,255,218,109,61,233,56,190,149,242,79,161,246,208,43,214,
+    222,105,134,213,113,27,31,218,180,122,210,176,237,209,59,244,
+    33,222,206,230,188,59,168,193,26,195,102,40,59,240,223,169,
+    173,185,140,230,182,184,119,162,89,191,213,11,182,240,116,45,
+    188,217,99,213,228,126,84,215,142,198,177,173,111,215,161,25,
+    103,141,91,181,207,214,216,173,83,36,229,213,198,205,99,215,
+    101,150,90,39,210,26,215,138,35,250,221,123,188,124,88,103,
+    174,29,149,87,167,227,126,43,149,218,59,217,76,110,93,27,
+    44,238,77,206,146,221,208,230,20,130,109,204,179,12,0,173,
+    39,105,34,79,126,171,10,61,249,42,246,75,125,135,101,70,
+    29,122,192,88,221,197,116,86,48,246,21,95,82,124,143,79,
+    73,25,192,192,73,251,150,138,215,40,172,215,239,23,128,252,
+    206,241,41,90,71,187,232,221,222,191,133,149,246,33,245,208,
+    241,216,181,215,172,241,120,139,165,30,55,172,51,191,117,60,
+    233,91,65,191,199,208,51,196,39,101,1,239,51,73,192,171,
+    176,109,109,3,104,150,163,180,238,136,157,211,169,180,238,194,
+    201,242,41,40,35,15,2,81,176,179,130,247,179,143,228,97,
+    8,253,224,155,17,1,162,227,173,108,118,231,181,163,118,35,
+    232,135,36,111,73,50,169,133,236,175,51,162,148,76,136,202,
+    108,172,86,124,29,75,191,142,200,86,85,65,206,126,95,141,
+    252,57,24,254,152,250,120,170,226,68,45,109,37,118,164,200,
+    142,236,165,190,156,251,114,187,192,78,107,236,116,197,89,199,
+    44,143,128,140,239,240,238,83,167,60,151,169,188,51,8,59,
+    89,68,117,193,135,212,46,181,89,83,20,181,105,149,88,115,
+    128,138,218,86,144,60,110,12,146,59,69,26,174,187,211,228,
+    27,117,200,19,144,161,123,170,250,82,28,68,45,68,39,242,
+    121,32,127,165,50,118,177,50,38,129,16,93,116,118,213,200,
+    126,239,16,232,33,50,240,121,255,151,225,167,253,249,19,151,
+    161,251,246,124,210,253,232,128,140,23,81,25,239,64,186,19,
+    112,176,140,119,110,221,47,131,255,194,43,196,45,146,91,73,
+    251,171,64,82,143,100,183,51,171,130,204,75,107,252,253,180,
+    172,110,39,68,190,154,165,200,120,109,213,59,214,5,149,111,
+    180,212,32,73,132,230,155,246,170,123,45,76,171,123,5,144,
+    41,224,126,234,45,152,15,38,64,82,0,192,36,235,94,82,
+    12,236,74,209,91,236,86,167,232,17,211,24,13,188,204,219,
+    16,171,222,222,36,45,156,146,62,200,130,187,37,36,50,60,
+    184,86,106,58,11,120,78,202,130,92,64,246,124,42,147,224,
+    65,211,42,240,153,114,113,146,93,64,160,49,193,41,10,89,
+    189,13,90,142,85,161,152,222,37,212,14,76,89,1,123,117,
+    53,94,23,30,47,25,79,42,189,101,77,150,50,124,26,58,
+    145,88,21,161,195,10,64,233,45,126,117,123,109,13,24,101,
+    188,110,233,173,160,120,210,28,172,9,240,95,59,170,18,171,
+    3,66,178,116,38,157,53,154,12,22,134,231,27,153,121,196,
+    186,126,241,11,98,93,122,219,33,3,218,137,190,178,173,221,
+    195,210,126,5,226,254,2,179,236,91,38,248,111,227,179,218,
+    248,205,60,51,95,96,230,53,102,30,2,223,246,140,252,253,
+    204,231,51,57,151,198,156,120,233,70,195,19,95,170,218,196,
+    245,194,208,13,109,232,6,73,212,24,174,194,160,75,151,171,
+    145,11,229,217,235,102,186,198,92,131,34,145,104,153,13,106,
+    108,175,198,14,151,123,7,74,189,211,197,222,233,66,239,37,
+    173,247,82,57,220,91,10,143,23,195,227,133,240,132,22,158,
+    168,120,92,17,223,1,2,242,2,19,64,159,173,21,31,58,
+    117,70,27,153,198,97,141,25,172,184,235,166,118,141,124,219,
+    51,188,247,78,105,228,114,113,228,114,97,228,170,54,114,181,
+    52,178,80,28,89,40,140,44,106,35,139,133,158,37,173,103,
+    169,66,3,223,1,102,126,129,9,110,99,164,194,162,161,211,
+    165,193,185,226,224,220,55,35,133,193,91,218,224,45,156,126,
+    178,60,57,173,77,222,50,42,141,85,220,136,109,43,249,251,
+    139,254,254,130,159,211,252,92,5,185,189,119,169,50,148,28,
+    186,94,28,186,254,13,93,24,90,212,134,22,115,11,26,203,
+    61,159,156,42,7,67,90,112,240,192,233,56,223,250,2,1,
+    217,15,182,29,208,142,243,237,223,134,194,159,185,180,19,99,
+    133,208,184,22,26,199,73,49,92,4,244,18,203,179,177,151,
+    12,58,63,253,236,109,109,122,169,48,121,11,42,255,231,201,
+    194,228,29,51,127,159,97,13,141,150,152,11,69,230,194,115,
+    54,248,60,216,169,5,135,42,14,107,25,56,125,86,59,125,
+    5,250,216,217,117,128,227,47,48,57,112,210,109,237,47,16,
+    144,3,167,167,5,90,3,164,18,68,129,14,173,117,228,160,
+    141,105,57,85,105,71,193,208,147,95,230,91,251,15,58,188,
+    45,39,43,33,52,58,94,58,125,181,120,250,106,225,244,140,
+    118,122,38,31,88,200,169,90,96,40,31,24,250,102,240,160,
+    211,215,178,72,29,56,89,47,104,16,72,133,144,94,228,109,
+    49,219,22,43,50,177,2,115,78,99,206,229,153,115,208,161,
+    179,151,127,63,241,116,162,106,13,167,203,76,75,137,25,40,
+    50,3,123,195,218,224,121,109,112,78,27,124,163,192,252,68,
+    99,126,146,55,95,178,88,201,120,157,211,25,178,16,192,188,
+    75,90,91,45,60,120,1,35,14,199,63,209,120,213,62,218,
+    247,124,232,82,109,94,235,174,205,253,128,176,211,22,174,109,
+    228,180,149,74,237,58,247,220,168,201,83,95,7,112,121,142,
+    231,218,99,142,231,1,73,175,224,66,128,227,4,245,125,101,
+    213,185,235,226,45,151,226,255,69,111,45,88,105,119,111,118,
+    29,106,196,22,115,213,192,231,166,229,210,60,117,212,195,29,
+    59,87,205,105,169,151,10,60,150,118,55,131,182,146,181,212,
+    31,147,111,113,213,228,67,191,109,206,100,237,105,128,193,147,
+    117,117,88,165,247,218,81,147,7,100,190,2,180,110,4,164,
+    118,75,168,107,107,45,181,158,163,137,179,185,75,53,119,178,
+    234,70,192,106,253,81,78,18,62,255,217,235,58,66,78,19,
+    45,252,168,156,48,106,242,28,39,231,216,246,194,92,250,202,
+    154,79,212,255,226,60,80,207,213,114,54,45,219,123,143,212,
+    37,95,57,162,221,150,173,63,164,143,235,217,67,55,232,196,
+    114,241,236,207,46,189,235,110,236,87,54,116,20,247,161,19,
+    59,180,105,185,91,235,84,157,253,244,89,53,52,242,248,155,
+    240,184,192,45,114,238,124,184,148,190,47,100,171,7,146,178,
+    64,142,80,173,136,1,67,33,158,86,184,181,237,108,18,163,
+    57,206,192,110,248,168,179,10,20,173,227,57,124,188,107,149,
+    253,32,173,110,212,157,230,54,156,229,69,61,181,35,58,249,
+    42,170,238,60,50,118,8,116,159,154,144,49,42,77,43,9,
+    249,44,36,68,157,186,231,62,64,55,168,94,198,30,180,145,
+    216,47,227,133,76,198,118,39,115,152,12,96,114,197,146,55,
+    131,201,13,44,207,99,10,123,13,39,17,9,23,49,193,166,
+    36,211,166,64,221,107,33,76,157,54,28,12,31,6,174,105,
+    9,160,163,162,183,86,17,226,237,55,239,17,20,235,35,66,
+    235,243,120,195,33,145,127,138,197,89,137,85,111,37,100,198,
+    63,72,136,239,1,186,39,200,82,198,139,155,238,252,249,229,
+    139,122,123,58,11,218,148,183,183,84,94,218,86,13,4,218,
+    102,9,54,243,228,89,220,222,215,177,2,60,6,40,37,122,
+    91,65,85,120,42,95,194,2,89,224,199,190,173,33,165,197,
+    136,41,91,70,157,184,219,213,81,48,124,164,24,144,157,177,
+    35,143,47,155,184,164,127,7,37,148,7,14,236,18,189,100,
+    81,71,239,111,207,126,114,54,231,121,222,61,86,110,235,252,
+    36,82,110,239,250,228,108,57,116,66,11,13,107,33,156,212,
+    12,122,158,41,134,207,20,194,99,90,120,172,20,158,42,134,
+    167,10,225,139,90,248,98,35,42,13,48,24,149,50,24,149,
+    2,201,121,158,180,190,108,71,145,241,255,131,106,66,104,120,
+    178,28,234,253,135,183,159,173,255,49,171,93,124,179,226,116,
+    12,3,15,144,23,152,96,30,192,93,24,149,99,182,114,71,
+    228,147,89,173,227,116,57,220,255,201,47,181,240,57,128,211,
+    152,219,133,185,93,22,55,64,94,140,102,123,138,254,158,130,
+    191,79,243,247,85,16,229,189,69,149,217,142,39,203,128,208,
+    75,236,133,34,123,225,217,235,165,169,133,226,212,66,97,106,
+    81,155,90,44,176,75,26,187,148,103,151,246,71,162,24,139,
+    19,65,131,101,123,4,0,106,137,233,41,50,61,159,45,125,
+    190,172,245,78,105,189,175,21,152,89,141,153,205,51,179,229,
+    31,201,35,229,48,38,52,235,215,216,113,91,240,128,118,98,
+    176,233,196,96,19,19,182,1,137,151,252,163,69,255,104,193,
+    127,70,243,159,249,199,228,211,245,162,127,58,239,159,46,247,
+    12,126,62,171,245,92,208,122,22,115,119,202,189,67,102,173,
+    185,187,224,136,148,216,193,34,59,184,55,243,172,175,192,94,
+    215,216,235,121,242,238,155,25,5,92,239,112,158,29,222,63,
+    127,241,143,177,252,228,156,209,193,88,185,62,186,31,232,202,
+    181,18,180,90,119,30,142,97,20,129,167,127,66,198,161,194,
+    67,7,44,170,205,214,212,134,69,117,1,189,59,71,206,109,
+    156,71,3,87,27,144,115,238,186,234,1,7,108,6,118,208,
+    71,219,47,84,246,236,0,186,38,153,110,220,64,159,220,220,
+    117,192,130,76,45,71,105,195,65,207,84,157,80,69,238,170,
+    91,214,116,119,98,107,75,200,166,162,238,154,75,42,47,144,
+    69,68,206,174,235,46,50,225,29,153,164,226,182,102,185,49,
+    201,231,241,36,63,127,220,36,63,236,214,255,43,158,234,248,
+    60,232,35,4,206,88,63,151,103,34,229,238,254,82,247,88,
+    177,123,172,208,29,211,186,99,216,60,206,16,242,248,118,110,
+    254,227,208,243,54,211,203,184,250,245,252,55,161,66,219,162,
+    214,182,152,187,89,238,27,208,250,198,115,55,159,44,151,217,
+    254,234,201,209,106,129,141,106,108,52,79,222,114,96,32,207,
+    12,28,30,88,143,57,176,173,14,115,96,237,190,7,12,242,
+    43,220,117,53,30,159,191,187,111,13,57,93,43,99,71,236,
+    155,118,180,101,227,57,170,6,224,122,5,36,223,104,58,106,
+    160,198,9,18,94,1,185,188,10,126,175,239,237,174,19,31,
+    230,62,116,171,157,53,254,93,247,174,11,80,126,29,14,1,
+    211,173,161,124,219,97,246,46,109,67,16,214,117,70,157,119,
+    67,243,206,230,233,182,146,118,14,11,189,3,62,161,109,40,
+    221,209,252,234,162,201,132,249,51,153,48,142,229,168,67,254,
+    25,194,23,15,64,162,109,50,62,180,52,102,144,117,224,36,
+    227,110,55,2,3,2,5,110,163,42,68,144,231,144,137,7,
+    126,142,76,80,64,128,130,181,221,202,120,14,152,123,46,153,
+    117,183,48,193,48,82,78,227,74,93,73,85,22,73,91,14,
+    239,176,75,64,118,38,142,155,124,13,199,95,255,142,69,253,
+    39,170,206,188,158,190,92,224,121,152,219,235,44,13,76,21,
+    7,166,10,3,23,181,129,139,133,240,37,45,124,169,130,2,
+    222,40,33,143,151,114,115,57,245,121,199,73,114,14,194,105,
+    193,209,114,176,179,20,140,22,131,209,66,240,172,22,60,75,
+    162,167,138,193,83,133,224,40,228,30,120,92,161,86,216,161,
+    66,173,185,133,151,62,20,142,124,54,82,138,140,23,35,227,
+    133,200,132,22,153,40,69,174,20,35,87,10,145,107,90,228,
+    90,161,107,70,235,154,249,250,253,66,215,141,220,210,243,190,
+    51,207,46,125,243,118,190,239,141,66,223,27,90,223,27,185,
+    133,39,203,207,135,71,241,71,99,7,246,79,14,105,39,39,
+    200,249,73,57,58,174,69,175,24,233,167,246,199,206,61,93,
+    206,159,189,134,115,70,247,217,158,234,118,48,85,96,71,33,
+    33,79,222,253,64,127,158,233,55,14,78,67,248,154,55,155,
+    200,8,60,175,251,120,62,35,165,182,69,28,102,121,254,253,
+    237,132,88,205,241,240,124,74,74,66,192,169,168,178,238,4,
+    172,67,238,99,101,236,238,201,44,38,216,4,229,183,48,193,
+    134,102,192,70,140,121,100,60,195,141,245,21,175,142,134,157,
+    44,17,3,170,222,25,39,5,81,228,249,40,37,15,225,177,
+    192,230,119,195,24,208,110,147,96,99,82,70,40,114,82,110,
+    254,85,28,30,154,169,32,76,218,25,186,247,179,149,10,130,
+    207,151,29,228,243,44,68,62,71,147,16,114,7,62,250,155,
+    124,96,164,64,159,210,232,83,21,199,53,250,14,181,247,176,
+    130,240,247,235,144,241,181,211,3,39,114,159,182,56,43,59,
+    212,12,29,46,135,184,138,19,127,199,38,140,239,229,215,201,
+    119,223,219,94,161,225,91,65,245,100,151,98,232,193,114,231,
+    96,197,9,223,125,111,75,190,181,95,243,158,172,208,16,195,
+    173,178,147,80,39,125,146,112,194,23,56,115,162,230,237,169,
+    208,16,169,160,99,137,113,198,132,245,182,28,61,165,123,241,
+    17,173,42,73,162,98,156,219,186,213,7,91,233,236,58,25,
+    22,221,151,153,142,73,171,155,0,126,21,99,58,186,173,41,
+    74,206,207,67,181,252,152,245,251,34,50,182,122,24,95,233,
+    199,14,223,246,24,71,240,35,213,92,243,194,63,70,174,214,
+    149,88,162,250,83,33,158,196,137,209,232,87,26,121,27,127,
+    28,80,43,213,240,179,0,98,121,250,252,177,229,241,45,64,
+    77,8,185,19,104,148,132,87,92,253,181,87,147,164,74,91,
+    146,40,173,227,184,241,75,20,126,75,61,15,94,3,185,96,
+    24,109,148,97,221,2,216,251,129,175,152,240,60,193,55,3,
+    192,14,126,83,213,75,233,32,241,109,53,45,42,49,243,7,
+    84,100,150,213,229,152,191,166,34,151,30,122,32,43,165,160,
+    45,214,69,68,245,254,162,154,10,235,157,108,254,170,138,204,
+    62,61,108,228,28,130,33,100,150,234,189,70,174,237,199,24,
+    25,73,80,210,134,198,12,79,144,76,76,124,79,100,152,26,
+    185,23,99,102,140,165,99,86,254,21,217,59,96,198,254,11,
+    208,138,147,162,168,202,69,68,245,230,81,143,253,45,163,112,
+    190,254,173,184,104,202,81,65,255,51,194,34,234,108,30,157,
+    177,191,251,104,58,95,255,150,209,245,124,253,91,113,56,176,
+    132,163,136,251,175,201,69,212,77,42,143,230,236,111,25,117,
+    231,235,223,50,138,230,235,223,50,26,205,215,191,251,104,44,
+    95,255,150,209,120,190,254,45,55,233,236,107,249,250,183,226,
+    150,28,20,172,17,205,105,190,255,242,1,9,188,56,130,129,
+    12,246,127,1,238,34,90,205,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/chi/private_l1_cache_hierarchy.py",
+    "gem5.components.cachehierarchies.chi.private_l1_cache_hierarchy",
+    embedded_module_data,
+    4568,
+    10696);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,84 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,85,207,111,27,69,20,158,217,223,54,137,211,130,
+    83,66,3,237,182,208,180,70,194,22,18,225,128,0,81,33,
+    160,92,34,68,145,16,123,96,180,222,25,215,91,237,122,205,
+    204,110,133,115,138,144,37,130,196,21,149,99,79,145,162,252,
+    25,252,3,46,170,4,90,9,41,18,226,144,155,171,112,168,
+    122,226,205,120,215,177,113,136,128,205,232,219,217,249,222,123,
+    243,189,55,111,156,223,209,204,99,22,239,227,79,1,238,35,
+    138,40,142,80,140,61,140,229,92,139,180,88,247,116,152,235,
+    212,136,140,216,244,76,152,155,212,138,172,216,246,108,140,52,
+    244,17,162,246,16,81,135,217,123,58,66,7,122,25,216,115,
+    104,229,54,106,84,143,228,71,3,231,53,191,45,82,238,7,
+    105,204,210,110,66,97,197,248,36,225,233,145,49,161,43,201,
+    61,198,121,72,153,56,210,38,43,23,110,22,14,239,251,65,
+    151,221,10,25,247,121,208,29,4,179,234,203,221,142,119,1,
+    190,5,253,12,121,152,34,79,163,216,211,119,81,7,83,109,
+    232,120,134,134,152,201,172,61,12,250,112,233,74,117,102,119,
+    52,106,12,141,61,248,58,152,134,244,28,86,1,174,10,156,
+    185,192,61,51,229,172,5,110,105,23,125,141,189,101,200,217,
+    206,95,154,106,143,124,33,194,96,62,133,237,131,170,11,207,
+    205,40,114,131,9,239,6,210,192,237,22,22,33,19,110,216,
+    235,50,30,166,110,135,39,177,155,118,67,49,177,109,186,159,
+    77,231,42,74,159,39,247,100,217,192,134,185,162,235,115,70,
+    193,183,195,125,16,144,5,105,198,25,48,126,234,250,51,187,
+    197,44,78,248,192,21,3,145,178,88,69,9,227,126,196,98,
+    214,75,253,52,76,122,194,237,49,70,155,138,9,166,21,131,
+    71,43,106,126,124,11,224,7,124,31,165,51,236,124,61,30,
+    204,250,253,131,141,236,177,219,104,31,111,53,180,220,20,89,
+    159,241,220,33,36,236,133,41,33,176,100,8,22,117,242,10,
+    33,74,55,33,66,110,239,238,60,253,92,240,160,213,31,64,
+    27,245,90,119,88,188,217,10,146,184,159,244,64,189,104,169,
+    66,206,212,177,85,228,220,42,219,143,20,11,68,89,146,210,
+    116,208,236,15,120,13,226,111,111,156,121,118,205,82,223,171,
+    96,43,46,3,60,217,65,191,57,203,223,217,223,219,191,56,
+    107,63,59,107,15,157,139,143,156,139,163,114,28,203,68,115,
+    139,51,56,138,222,92,49,113,89,76,107,114,245,48,180,142,
+    182,245,225,62,20,132,175,200,232,210,192,229,231,165,191,29,
+    10,194,179,246,96,251,218,217,234,10,179,215,164,187,13,176,
+    131,14,87,234,187,25,127,22,230,167,111,126,78,109,158,206,
+    80,223,96,190,4,175,125,156,63,183,149,164,31,151,157,193,
+    232,7,156,39,156,95,248,155,180,243,119,88,74,160,163,136,
+    128,54,36,125,184,211,219,173,179,69,46,56,188,46,133,56,
+    74,238,31,181,43,35,231,202,255,209,203,95,144,112,170,186,
+    160,159,253,55,117,115,14,155,50,238,139,18,164,170,70,77,
+    246,104,207,143,25,33,121,149,144,56,161,89,36,231,75,132,
+    124,149,249,81,193,216,132,208,36,32,68,245,20,151,39,204,
+    101,130,185,209,78,146,136,63,47,191,101,58,92,254,252,241,
+    117,9,151,36,189,92,52,123,192,162,8,238,0,230,231,202,
+    124,222,83,249,240,106,9,47,75,226,167,73,255,149,127,99,
+    205,48,157,49,146,176,132,205,245,49,58,5,44,100,173,236,
+    124,49,90,185,246,208,220,120,100,110,140,53,108,174,254,88,
+    151,220,234,9,60,214,145,117,189,100,165,75,93,206,174,62,
+    120,67,178,87,79,64,218,213,135,95,42,242,223,154,161,69,
+    80,133,85,89,109,53,42,185,238,183,3,85,156,188,26,111,
+    54,147,246,93,22,164,66,21,42,175,101,105,24,137,102,249,
+    191,66,213,53,95,59,185,218,243,87,90,85,124,82,177,213,
+    242,248,84,21,159,58,111,79,142,237,93,222,40,122,75,12,
+    1,198,58,198,120,252,38,194,151,71,232,210,236,56,68,235,
+    163,249,113,136,110,140,230,199,175,232,157,209,252,24,91,117,
+    12,9,46,194,232,149,183,30,203,247,159,167,112,74,229,95,
+    197,48,238,108,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/classic/abstract_classic_cache_hierarchy.py",
+    "gem5.components.cachehierarchies.classic.abstract_classic_cache_hierarchy",
+    embedded_module_data,
+    948,
+    1955);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,33 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,123,204,128,4,24,161,244,103,54,32,49,157,33,133,
+    33,152,65,147,209,111,37,67,17,19,72,16,36,243,203,173,
+    184,40,89,191,160,178,36,35,63,79,63,61,53,215,84,63,
+    57,63,183,32,63,47,53,175,164,88,63,57,49,57,35,53,
+    35,51,181,40,177,40,25,72,1,5,114,18,139,139,51,147,
+    33,18,197,250,241,241,153,121,153,37,241,241,122,5,149,191,
+    56,108,114,243,83,74,115,82,237,138,88,161,22,23,243,3,
+    137,15,204,140,140,140,31,24,96,68,17,51,80,12,0,230,
+    60,42,51,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/classic/caches/__init__.py",
+    "gem5.components.cachehierarchies.classic.caches",
+    embedded_module_data,
+    131,
+    163);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,90 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,84,205,111,27,69,20,159,177,119,237,245,103,156,
+    79,59,78,156,108,145,40,56,20,155,28,202,9,85,64,81,
+    17,168,138,144,154,147,47,235,205,206,56,94,216,245,154,153,
+    117,82,71,57,244,80,9,35,149,35,106,145,56,32,33,85,
+    66,253,51,248,7,2,138,96,181,39,36,78,185,45,74,145,
+    80,79,188,103,199,27,67,169,84,118,119,126,239,253,230,205,
+    60,191,143,25,255,78,102,30,245,66,158,127,12,240,144,48,
+    194,168,67,92,218,162,20,245,132,147,112,147,173,164,171,180,
+    20,87,109,169,48,151,100,138,147,218,37,9,242,33,97,234,
+    125,194,82,92,121,156,36,228,73,114,234,176,149,102,233,59,
+    164,174,157,33,169,211,80,217,29,246,121,61,25,22,223,55,
+    37,255,68,240,14,247,173,46,23,161,122,211,4,25,150,238,
+    248,194,102,51,134,51,117,178,143,110,89,179,113,46,77,227,
+    236,0,124,1,145,114,210,162,140,180,18,140,182,146,44,1,
+    113,225,171,48,21,35,234,104,44,205,85,166,241,20,203,192,
+    200,194,200,193,200,195,40,192,40,242,52,155,227,26,207,172,
+    198,238,59,11,35,210,161,172,116,191,208,202,142,200,93,218,
+    202,65,14,243,161,118,123,251,131,113,156,71,223,103,117,120,
+    222,211,165,237,246,29,174,223,222,214,153,233,155,186,133,70,
+    253,208,246,187,58,227,29,115,224,248,250,129,233,12,184,108,
+    100,199,27,62,234,232,62,44,152,44,235,154,82,55,117,215,
+    147,190,51,212,249,93,203,25,72,251,128,235,204,59,236,73,
+    95,112,211,157,172,187,166,183,219,135,194,246,249,158,105,125,
+    102,88,14,55,123,237,246,216,155,236,122,3,135,233,123,92,
+    151,220,215,125,15,22,238,138,1,111,183,27,99,243,153,6,
+    153,156,81,132,18,2,214,236,86,168,72,251,136,135,170,41,
+    165,103,133,57,223,220,55,28,211,231,61,107,24,230,49,133,
+    152,149,4,151,125,175,39,121,60,163,186,178,43,100,88,240,
+    247,125,105,244,185,48,144,135,115,255,138,45,44,92,54,239,
+    166,35,173,236,76,215,18,48,240,100,156,255,2,240,53,125,
+    72,124,122,105,124,12,227,73,204,190,155,177,188,104,13,37,
+    199,244,152,24,137,41,63,78,0,139,79,222,113,18,152,18,
+    51,5,152,26,51,21,88,42,102,41,96,233,152,165,129,105,
+    49,211,128,101,46,19,56,206,252,51,6,176,198,25,50,2,
+    167,132,238,212,115,161,42,7,80,160,80,51,12,187,103,251,
+    134,33,230,192,44,176,11,98,30,97,1,97,17,1,155,34,
+    150,17,86,0,194,108,63,46,30,184,81,36,119,58,47,187,
+    87,148,209,65,198,128,54,64,115,13,67,230,128,235,241,115,
+    239,217,45,41,172,102,127,232,119,189,94,115,159,187,215,155,
+    150,231,66,135,121,207,151,205,241,73,235,218,92,152,194,2,
+    1,19,232,196,182,38,6,217,116,182,217,88,107,244,135,162,
+    10,126,143,230,167,87,161,49,205,177,1,211,210,6,248,235,
+    30,249,179,66,50,197,47,211,15,210,191,106,149,159,181,202,
+    79,90,245,84,171,158,104,213,96,169,50,82,30,100,130,229,
+    42,136,108,176,118,117,164,156,106,149,96,253,117,148,171,129,
+    254,22,202,218,212,92,219,66,90,13,54,27,40,215,131,234,
+    107,143,222,252,166,249,109,19,140,115,35,120,207,177,232,245,
+    60,150,185,103,186,220,48,194,172,97,184,30,27,56,168,231,
+    13,227,243,129,233,92,88,210,134,193,60,11,58,129,93,15,
+    147,112,193,194,164,221,243,67,101,207,243,28,129,135,70,224,
+    89,25,39,23,22,46,138,104,113,199,49,140,58,21,53,204,
+    13,79,228,187,98,3,87,101,167,112,21,13,63,78,146,158,
+    190,81,66,85,181,136,32,44,145,149,114,176,182,30,172,215,
+    2,253,74,176,92,14,106,155,129,254,106,208,184,17,45,47,
+    171,91,17,1,248,173,56,31,169,72,82,164,180,24,165,81,
+    211,200,202,106,148,65,45,75,202,213,40,135,90,158,172,109,
+    68,5,212,138,184,110,14,181,18,169,172,69,243,168,45,144,
+    234,70,180,136,218,18,169,172,63,218,57,45,191,113,249,11,
+    47,11,98,115,154,213,78,93,11,83,254,176,111,247,246,199,
+    165,9,179,238,245,134,183,247,41,183,124,57,41,19,222,164,
+    73,41,139,3,223,118,100,195,59,224,2,255,185,199,251,127,
+    32,19,95,88,171,103,218,59,147,150,220,16,215,198,119,22,
+    10,246,21,64,148,164,148,70,111,19,90,57,33,229,217,47,
+    82,20,154,136,200,255,129,60,161,175,156,144,43,147,47,74,
+    213,40,36,244,60,140,6,127,160,120,250,31,166,113,184,127,
+    3,49,34,185,22,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/classic/caches/l1dcache.py",
+    "gem5.components.cachehierarchies.classic.caches.l1dcache",
+    embedded_module_data,
+    1045,
+    1801);
+
+} // anonymous namespace
+} // namespace gem5
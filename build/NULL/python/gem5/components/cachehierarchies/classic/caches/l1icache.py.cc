@@ -0,0 +1,91 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,84,205,111,27,69,20,159,177,119,237,181,99,59,
+    206,167,29,39,78,182,8,21,28,138,77,14,229,132,42,160,
+    82,81,81,21,33,53,39,95,214,155,221,113,188,176,235,53,
+    51,227,4,71,57,244,80,9,35,149,35,106,145,56,112,170,
+    132,250,103,240,15,4,20,193,178,39,36,78,185,45,106,145,
+    80,79,188,183,142,55,166,128,84,118,61,191,121,191,121,111,
+    222,190,143,25,255,70,102,30,245,98,126,250,33,192,67,98,
+    19,155,186,196,163,109,74,81,78,185,41,47,221,78,123,74,
+    91,241,212,182,10,107,105,91,113,51,123,36,69,62,32,182,
+    122,159,216,25,166,60,78,19,242,36,61,117,216,206,218,217,
+    187,164,161,157,35,105,208,80,217,27,13,88,35,29,150,222,
+    55,5,251,136,179,46,147,86,143,241,80,189,105,194,28,150,
+    239,74,238,216,51,138,115,117,178,143,110,91,179,113,46,79,
+    227,236,2,124,14,145,50,210,166,54,105,167,108,218,78,219,
+    41,136,11,95,197,86,49,162,174,102,103,153,106,107,44,99,
+    231,96,228,97,204,193,40,192,40,194,40,177,172,61,207,52,
+    150,91,75,220,119,23,199,164,75,237,242,253,98,59,63,38,
+    159,209,246,28,228,176,16,106,119,118,110,199,113,30,255,146,
+    215,225,121,79,23,142,55,112,153,126,103,71,119,250,66,242,
+    161,37,29,191,175,91,104,163,31,57,178,167,219,172,107,14,
+    93,169,31,154,238,144,137,102,62,222,119,187,171,75,48,152,
+    152,217,62,19,122,223,151,122,207,60,100,186,9,252,8,93,
+    49,211,187,48,240,121,108,253,226,122,236,201,17,186,231,11,
+    233,142,224,251,150,59,20,14,186,16,250,80,12,77,247,154,
+    222,233,28,113,71,178,125,211,250,196,176,92,102,246,59,29,
+    93,244,252,161,107,235,251,76,23,76,234,210,7,163,91,166,
+    43,88,167,211,140,61,158,107,144,255,57,69,40,35,96,165,
+    247,66,69,56,199,44,84,77,33,124,43,156,147,230,129,225,
+    154,146,245,173,81,88,176,77,105,38,172,204,153,24,248,125,
+    193,146,21,213,19,61,46,194,162,60,144,194,24,48,110,32,
+    15,231,95,8,44,44,94,182,252,166,43,172,252,76,175,83,
+    48,240,60,61,253,9,224,43,250,144,72,122,169,124,12,227,
+    73,194,190,157,209,252,151,13,37,39,244,132,24,169,41,63,
+    73,1,75,206,235,73,26,152,146,48,5,152,154,48,21,88,
+    38,97,25,96,217,132,101,129,105,9,211,128,229,46,19,56,
+    201,253,61,6,208,38,25,218,4,206,22,221,109,204,133,170,
+    24,66,129,66,205,48,156,190,35,13,131,207,131,154,99,23,
+    248,2,194,34,194,18,2,54,133,175,32,172,2,132,249,65,
+    82,60,112,163,8,230,118,95,118,47,175,160,131,156,1,109,
+    128,230,26,134,152,3,174,39,207,189,231,183,4,183,90,131,
+    145,236,249,253,214,1,243,174,183,44,223,131,14,179,190,20,
+    173,248,28,246,28,198,77,110,193,4,11,232,196,177,38,10,
+    209,114,119,156,88,106,14,70,188,6,126,143,23,166,23,168,
+    57,205,177,9,203,194,1,248,243,30,249,163,74,114,165,47,
+    178,15,178,63,107,213,31,181,234,15,90,237,76,171,157,106,
+    181,96,185,58,86,30,228,130,149,26,76,249,96,253,234,88,
+    57,211,170,193,198,235,56,175,5,250,91,56,215,167,234,250,
+    54,210,90,176,213,196,121,35,168,189,246,232,205,175,91,223,
+    180,64,57,63,134,247,41,22,189,81,192,50,247,77,143,25,
+    70,152,55,12,207,183,135,46,202,5,195,248,20,238,206,133,
+    38,107,24,182,111,65,39,176,235,97,26,174,95,152,118,250,
+    50,84,246,125,223,229,120,104,56,158,149,56,185,176,120,81,
+    68,139,185,174,97,52,40,175,99,110,120,34,223,229,155,104,
+    149,159,194,85,84,124,63,73,122,250,70,41,85,213,34,130,
+    176,76,86,43,193,250,70,176,81,15,244,43,193,74,37,168,
+    111,5,250,171,65,243,70,180,178,162,110,71,4,224,215,210,
+    66,164,34,201,144,242,82,148,69,73,35,171,107,81,14,165,
+    60,169,212,162,57,148,10,100,125,51,42,162,84,66,187,121,
+    148,202,164,186,30,45,160,180,72,106,155,209,18,74,203,164,
+    186,241,104,247,172,242,198,229,23,94,22,248,214,52,171,221,
+    134,22,102,228,104,224,244,15,226,210,132,121,239,122,211,223,
+    255,152,89,82,76,202,132,55,105,82,202,210,80,58,174,104,
+    250,135,140,227,255,125,188,255,59,50,241,133,181,122,174,189,
+    51,105,201,13,126,45,190,179,80,176,47,1,162,52,165,52,
+    122,155,208,234,41,169,204,254,34,69,161,169,136,252,31,40,
+    16,250,202,41,185,50,249,69,153,58,133,132,254,9,227,225,
+    239,56,61,251,23,85,28,238,95,249,169,205,141,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/classic/caches/l1icache.py",
+    "gem5.components.cachehierarchies.classic.caches.l1icache",
+    embedded_module_data,
+    1069,
+    1855);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,89 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,84,205,111,227,68,20,159,73,236,216,206,87,211,
+    54,109,210,244,43,45,130,37,101,73,170,74,203,9,173,128,
+    10,184,172,42,164,221,83,46,150,235,153,180,6,59,9,51,
+    78,151,84,61,236,97,37,130,180,87,212,69,226,192,105,37,
+    180,255,76,65,149,176,230,132,4,151,222,140,22,36,180,39,
+    222,75,26,55,8,144,0,219,243,123,239,55,111,244,252,190,
+    236,159,200,204,165,95,203,23,7,0,231,132,17,70,125,18,
+    208,54,165,168,167,252,84,144,110,167,3,173,173,5,122,91,
+    15,50,237,12,236,167,153,230,27,15,72,138,124,72,152,254,
+    152,176,12,215,158,165,9,121,158,158,58,109,155,204,184,79,
+    26,230,21,146,6,85,218,131,97,159,55,52,85,124,207,145,
+    252,35,193,59,60,116,143,185,80,250,190,3,82,89,251,254,
+    64,122,39,94,56,84,165,251,161,240,216,204,153,43,125,226,
+    130,238,184,179,97,47,79,195,246,1,62,135,192,57,105,83,
+    70,218,41,70,219,105,150,130,16,33,72,166,179,12,51,152,
+    201,181,142,197,44,174,179,44,207,176,28,172,60,172,2,172,
+    34,172,57,88,37,110,176,121,110,178,5,110,241,236,74,242,
+    146,78,121,68,58,148,45,62,46,180,115,35,242,25,109,231,
+    33,169,178,50,238,237,141,227,62,221,205,214,225,122,183,46,
+    189,160,239,243,250,189,189,250,120,191,254,208,11,143,235,140,
+    119,156,129,31,214,79,28,127,192,101,115,124,244,170,4,94,
+    175,178,8,20,161,140,144,7,248,64,229,130,158,12,253,161,
+    237,117,93,95,105,210,59,229,74,119,164,236,185,42,23,58,
+    71,182,239,132,188,235,14,85,158,57,161,147,176,146,224,178,
+    223,235,74,158,236,232,129,60,22,82,21,194,163,80,218,125,
+    46,108,228,106,238,161,240,66,126,232,184,159,216,174,207,157,
+    174,178,220,164,226,133,155,90,239,251,210,205,205,20,57,5,
+    11,123,250,226,103,128,47,233,57,9,233,141,241,25,172,231,
+    9,251,102,198,242,79,103,40,57,163,103,196,78,77,249,89,
+    10,88,50,51,103,105,96,90,194,52,96,122,194,116,96,153,
+    132,101,128,25,9,51,128,153,9,51,129,89,9,179,128,101,
+    111,210,57,203,254,57,34,176,38,249,50,2,205,165,7,141,
+    188,210,229,0,42,167,76,27,154,225,133,182,45,22,192,44,
+    22,17,176,97,98,9,1,7,80,84,16,170,8,56,52,162,
+    6,160,178,253,164,158,224,75,147,220,239,252,39,7,98,21,
+    189,88,54,116,10,250,111,219,18,231,163,126,115,61,122,249,
+    190,20,110,171,63,12,143,123,221,214,17,15,238,180,220,94,
+    0,83,192,187,161,108,185,56,128,199,30,23,142,112,65,192,
+    6,122,241,220,137,65,182,252,189,177,210,236,15,197,6,248,
+    61,45,93,207,114,115,154,236,109,216,149,125,128,223,31,145,
+    223,106,196,42,126,97,60,49,126,48,171,223,155,213,239,204,
+    218,165,89,187,48,107,81,185,58,210,158,88,209,82,13,68,
+    54,90,125,109,164,93,154,213,104,237,117,148,43,81,125,23,
+    229,250,212,188,190,131,180,22,109,54,81,174,69,43,219,176,
+    93,140,106,183,158,190,249,85,235,235,22,144,185,17,220,47,
+    176,9,141,2,150,189,235,4,220,182,85,214,182,131,30,27,
+    248,168,231,109,251,211,129,227,95,91,12,219,102,61,23,58,
+    131,83,160,210,50,20,42,237,117,67,165,29,246,122,190,192,
+    65,17,56,87,2,199,105,156,167,42,92,215,211,229,190,111,
+    219,13,42,182,48,79,28,218,119,196,54,158,202,77,225,22,
+    26,46,38,5,152,222,113,42,165,155,49,65,40,146,229,106,
+    180,186,30,173,109,68,245,173,104,169,18,173,111,70,245,87,
+    163,205,219,81,243,110,92,169,232,59,49,1,248,177,56,31,
+    235,72,50,164,180,24,27,168,153,100,121,37,182,80,203,146,
+    74,45,206,161,150,39,171,27,113,1,181,34,158,155,67,173,
+    68,170,171,241,60,106,11,164,182,17,47,162,86,38,229,245,
+    120,9,181,101,82,93,123,122,112,89,121,227,230,93,255,22,
+    196,43,211,20,15,26,150,202,132,195,190,215,61,26,215,73,
+    101,131,59,205,222,225,199,220,13,229,164,102,248,229,77,234,
+    56,174,112,113,16,122,190,108,246,78,184,192,191,243,216,201,
+    183,100,226,16,171,247,210,124,123,210,169,187,98,119,252,161,
+    67,9,207,1,226,52,165,52,126,139,208,234,5,169,204,62,
+    177,166,211,84,76,254,31,20,9,221,190,32,91,147,39,206,
+    172,81,200,239,175,48,226,191,160,248,245,111,76,227,192,255,
+    0,169,60,174,173,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/classic/caches/l2cache.py",
+    "gem5.components.cachehierarchies.classic.caches.l2cache",
+    embedded_module_data,
+    1029,
+    1798);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,87 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,84,205,111,27,69,20,159,217,15,123,237,216,142,
+    211,124,185,118,210,78,171,10,197,85,101,115,41,39,84,241,
+    33,81,113,72,133,212,244,226,3,227,205,206,56,94,216,143,
+    48,51,78,112,148,67,15,149,8,82,175,168,87,78,149,80,
+    79,220,248,51,2,170,196,106,79,72,28,80,110,139,2,18,
+    234,137,55,235,216,53,5,164,118,215,243,123,239,55,239,237,
+    219,247,222,190,241,175,104,238,178,47,228,249,29,128,39,136,
+    33,134,3,20,226,30,14,141,158,17,154,61,19,35,102,48,
+    51,176,118,144,129,238,34,102,61,66,204,230,198,83,19,161,
+    103,230,52,72,207,102,133,251,168,93,60,211,164,109,166,181,
+    15,92,201,63,17,124,192,149,55,228,34,181,63,116,65,166,
+    245,251,74,248,108,206,112,166,223,222,198,41,190,233,205,231,
+    180,52,205,105,7,224,43,200,138,163,30,102,168,103,48,220,
+    51,75,104,254,102,117,86,228,22,115,184,205,74,176,202,176,
+    22,96,85,96,85,97,213,120,97,80,63,65,3,204,22,31,
+    85,123,197,19,244,37,238,57,144,233,82,234,108,111,63,200,
+    179,58,250,173,76,224,122,159,72,63,220,15,56,217,230,97,
+    44,198,100,219,141,220,61,30,242,72,145,7,145,175,200,22,
+    248,183,137,167,159,32,135,190,26,18,198,7,238,40,80,228,
+    192,13,70,92,118,202,121,148,143,7,68,129,195,196,141,197,
+    92,146,40,86,100,232,30,112,226,2,63,140,164,18,220,13,
+    47,28,98,145,123,191,186,159,71,242,37,9,99,169,130,49,
+    241,35,47,24,73,95,135,144,100,36,71,110,112,139,244,251,
+    135,194,87,124,215,245,62,167,94,192,221,168,223,39,114,24,
+    143,2,70,118,57,145,92,17,21,131,211,71,110,32,121,191,
+    223,201,35,158,89,208,205,51,172,97,69,67,5,96,39,181,
+    164,127,196,83,219,149,50,246,210,5,229,238,209,192,85,60,
+    242,198,105,133,185,202,157,177,186,224,114,63,142,36,159,237,
+    216,161,28,10,153,86,213,158,146,116,159,11,170,121,186,248,
+    74,98,94,105,238,195,26,176,244,208,156,255,0,240,13,126,
+    130,20,126,105,124,10,235,217,140,125,59,103,249,63,31,140,
+    142,241,49,162,198,148,31,27,192,102,67,121,108,2,179,102,
+    204,2,102,207,152,13,172,48,99,5,96,197,25,43,2,115,
+    102,204,1,54,171,129,33,24,30,124,175,93,78,109,57,130,
+    154,83,135,82,31,198,131,82,81,3,179,88,212,80,215,160,
+    103,88,92,210,176,172,65,119,92,172,2,192,163,150,228,193,
+    224,117,253,211,18,133,70,194,231,161,84,150,129,147,233,245,
+    240,197,93,41,188,238,254,88,13,227,168,11,163,122,187,235,
+    197,33,124,34,24,89,217,205,7,105,232,115,225,10,15,4,
+    108,232,24,190,55,49,200,110,24,142,104,174,118,246,199,162,
+    1,113,143,150,166,7,162,51,45,233,22,108,203,79,1,254,
+    122,136,254,92,67,165,218,215,197,199,197,159,157,198,79,78,
+    227,71,167,249,220,105,158,58,205,100,165,113,98,61,46,37,
+    171,77,16,229,164,245,214,137,245,220,105,36,27,91,90,94,
+    78,200,219,90,110,78,205,155,55,53,109,38,87,59,90,110,
+    156,230,191,115,221,216,118,81,232,234,196,194,63,65,207,168,
+    168,2,236,180,75,186,215,145,27,114,74,211,50,165,97,204,
+    70,129,214,43,148,126,1,103,226,194,82,164,148,197,30,40,
+    38,156,168,212,244,35,149,90,187,113,28,228,53,166,213,139,
+    94,122,60,8,40,109,99,209,212,37,234,73,123,79,180,244,
+    171,74,83,184,161,13,223,79,106,159,222,153,97,219,78,134,
+    52,172,160,181,245,164,181,145,108,108,38,228,90,178,186,158,
+    108,94,77,200,141,108,121,217,238,102,8,224,151,218,82,102,
+    107,82,64,245,229,172,168,53,7,173,93,206,74,90,43,163,
+    245,102,182,160,181,10,106,93,201,170,90,171,105,191,69,173,
+    213,81,163,149,45,105,237,18,106,94,121,25,242,117,65,108,
+    76,107,184,215,46,164,229,240,118,39,222,253,140,123,74,10,
+    125,50,132,62,16,66,159,131,180,54,82,126,32,59,241,1,
+    23,250,95,57,127,228,59,52,121,92,55,227,133,243,238,164,
+    201,119,196,86,126,216,160,35,99,128,204,196,24,103,239,88,
+    216,200,208,155,64,5,225,235,167,232,218,228,151,21,90,24,
+    242,253,55,156,140,126,215,226,143,255,48,229,169,253,13,40,
+    105,169,195,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/classic/caches/mmu_cache.py",
+    "gem5.components.cachehierarchies.classic.caches.mmu_cache",
+    embedded_module_data,
+    995,
+    1725);
+
+} // anonymous namespace
+} // namespace gem5
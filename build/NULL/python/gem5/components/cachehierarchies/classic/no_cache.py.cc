@@ -0,0 +1,195 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,165,88,221,111,219,214,21,39,245,45,75,178,228,68,
+    241,71,154,52,180,19,203,145,19,203,113,106,59,181,219,172,
+    181,157,164,11,220,121,197,210,22,157,208,130,163,200,43,155,
+    54,37,170,151,84,82,187,54,80,96,1,230,2,126,232,67,
+    135,189,236,65,3,130,162,65,250,208,135,13,216,227,254,129,
+    1,146,64,64,2,129,1,233,134,161,200,158,84,180,3,134,
+    62,237,220,75,145,18,109,185,9,90,138,62,228,189,231,220,
+    115,207,61,247,252,206,61,244,191,152,174,203,223,126,126,123,
+    23,200,31,24,137,145,88,133,41,176,89,182,224,201,122,10,
+    222,172,183,224,203,250,10,254,172,159,101,36,143,228,85,2,
+    133,96,54,72,223,125,74,232,77,70,242,75,1,37,92,232,
+    203,246,65,95,80,10,41,145,66,52,27,133,247,176,212,167,
+    196,10,253,217,126,150,241,48,175,49,82,228,62,35,69,81,
+    255,103,94,134,121,228,181,39,207,198,165,216,29,38,221,255,
+    132,52,210,126,51,184,44,72,75,146,132,205,208,178,160,161,
+    119,150,5,108,6,150,177,44,173,35,211,247,134,138,117,179,
+    239,206,182,166,163,2,225,60,241,145,49,172,233,189,125,103,
+    9,30,236,228,19,175,213,17,91,202,105,58,22,68,125,89,
+    21,176,244,196,99,245,14,218,189,43,130,184,129,126,46,35,
+    44,96,113,99,251,9,107,177,207,58,108,69,208,52,89,116,
+    75,137,61,61,6,75,99,126,7,62,67,76,150,149,152,172,
+    71,98,179,94,228,147,60,200,159,7,79,221,247,125,6,66,
+    143,156,97,217,0,10,84,130,76,143,203,45,151,103,37,31,
+    10,129,127,253,121,223,62,105,5,238,199,178,97,15,131,250,
+    80,228,51,152,241,17,107,75,194,76,81,152,41,120,100,166,
+    216,15,72,135,142,72,247,83,233,248,33,233,48,74,88,54,
+    72,125,71,70,12,116,113,35,247,125,217,19,251,204,7,108,
+    246,36,236,100,212,12,174,169,212,119,194,215,224,248,62,14,
+    174,53,149,19,73,15,183,97,187,51,195,189,9,205,149,55,
+    222,210,56,1,35,78,84,139,69,36,234,72,226,200,22,200,
+    235,27,58,167,171,156,14,34,5,84,80,241,54,151,43,107,
+    153,62,170,107,121,155,147,80,94,40,43,58,39,112,157,88,
+    224,212,60,119,79,150,244,13,110,126,54,39,235,156,172,113,
+    101,13,73,151,65,137,90,94,223,128,7,244,136,66,145,203,
+    33,170,6,102,204,203,235,101,12,83,222,149,5,58,21,116,
+    193,236,101,81,87,113,123,174,76,134,43,170,58,90,92,180,
+    154,228,90,210,185,18,70,26,42,234,150,74,73,69,26,17,
+    226,238,169,120,11,44,0,3,110,221,177,86,151,87,21,69,
+    189,39,23,215,57,132,177,138,193,36,71,11,70,34,146,239,
+    34,169,75,49,204,37,170,18,154,202,41,170,184,5,51,114,
+    93,87,38,147,113,181,115,101,89,145,166,223,121,113,126,26,
+    220,51,173,21,85,181,196,231,101,69,71,56,35,138,139,87,
+    175,93,91,228,74,66,81,22,219,15,178,50,73,214,101,181,
+    232,210,114,81,203,243,50,184,47,131,209,251,101,164,17,239,
+    167,192,178,247,249,130,160,109,165,51,69,181,136,46,166,57,
+    85,20,203,24,220,180,200,221,185,197,221,21,148,50,114,41,
+    185,242,19,175,35,107,43,200,0,62,240,25,217,17,21,203,
+    235,114,81,80,184,182,133,46,193,95,88,145,241,150,38,172,
+    163,69,238,133,185,185,217,217,107,87,185,213,229,109,29,105,
+    46,193,55,176,186,142,133,2,39,228,32,127,192,34,5,216,
+    58,89,220,226,102,230,231,95,156,5,19,22,22,102,230,103,
+    93,35,166,166,166,184,229,155,175,221,94,227,94,191,189,188,
+    194,45,47,173,172,190,249,171,165,149,155,132,113,100,99,104,
+    135,25,192,72,47,227,162,43,77,120,219,127,223,238,210,196,
+    170,179,29,150,196,126,225,113,195,109,143,209,189,29,190,27,
+    110,187,12,239,233,188,111,58,239,155,222,46,9,159,163,219,
+    11,45,127,135,3,160,244,237,124,213,137,96,192,20,128,66,
+    162,248,32,48,83,115,186,32,23,169,195,109,100,117,80,71,
+    112,53,63,203,81,72,21,219,8,203,171,216,209,70,70,181,
+    241,206,185,51,102,166,19,219,139,150,115,180,69,138,139,30,
+    147,128,198,103,213,164,111,151,96,187,59,192,119,88,79,94,
+    101,104,30,247,83,35,101,38,4,173,0,38,233,22,19,55,
+    153,3,57,65,18,224,100,225,1,190,37,0,4,194,166,183,
+    36,171,102,176,109,143,57,88,16,62,224,177,90,214,33,252,
+    120,93,200,41,136,215,228,29,4,42,3,96,42,152,169,145,
+    205,226,190,127,69,195,226,116,105,27,124,88,156,94,71,133,
+    185,105,81,45,128,66,72,9,218,52,77,115,118,150,147,17,
+    116,88,135,201,116,81,229,41,47,83,218,54,79,242,235,72,
+    231,219,211,242,150,238,157,231,218,107,207,244,96,174,192,188,
+    218,203,64,62,98,254,155,100,78,156,169,140,85,7,198,107,
+    3,227,198,192,248,126,224,31,231,39,255,180,240,96,97,63,
+    96,132,184,230,200,57,99,100,198,24,153,219,15,28,244,183,
+    2,76,122,138,116,143,55,227,167,246,99,223,146,104,192,207,
+    1,89,19,157,8,130,203,99,71,233,219,64,126,207,186,227,
+    212,29,135,149,46,206,113,50,44,179,203,118,199,171,196,66,
+    252,121,118,190,238,108,97,73,32,104,180,86,102,69,196,145,
+    72,128,196,170,65,200,148,72,34,133,119,58,2,65,122,235,
+    206,161,135,46,181,68,18,28,228,10,161,40,65,156,42,138,
+    19,103,186,42,216,33,108,197,111,143,224,57,116,201,86,78,
+    215,74,72,148,243,50,146,186,35,144,4,160,99,189,93,164,
+    56,236,181,180,215,244,107,229,18,68,87,136,231,229,162,172,
+    243,60,117,58,244,251,52,164,228,105,195,12,243,60,141,12,
+    158,215,136,239,57,238,35,124,134,108,207,40,144,157,132,19,
+    10,109,5,111,145,253,79,1,249,31,13,128,112,255,199,193,
+    131,96,35,52,92,15,13,215,66,167,141,208,233,106,232,116,
+    115,240,204,190,239,32,178,15,63,252,60,136,138,221,123,197,
+    218,123,124,154,33,153,8,114,136,195,218,116,228,238,48,15,
+    217,181,180,199,50,176,31,86,8,225,47,33,190,4,89,83,
+    123,200,226,49,98,4,69,0,53,213,28,32,113,234,146,218,
+    25,177,13,63,194,202,145,201,99,52,130,31,199,79,30,124,
+    104,196,211,213,80,250,71,27,138,199,137,71,109,83,197,82,
+    185,203,84,60,209,203,80,151,140,219,80,23,43,79,118,33,
+    77,8,177,205,244,231,72,5,233,194,139,223,54,113,208,75,
+    77,100,43,189,64,113,8,21,248,212,238,49,232,217,101,221,
+    231,0,193,79,197,211,75,242,16,22,189,79,151,185,193,188,
+    247,213,158,103,215,83,241,245,146,5,231,58,167,196,102,192,
+    209,112,216,26,79,239,146,245,153,71,135,158,125,244,49,58,
+    193,27,143,28,143,60,179,127,194,79,151,209,147,29,206,102,
+    196,126,219,162,218,241,180,203,154,168,253,182,231,237,109,229,
+    158,15,214,26,235,53,231,174,119,215,119,120,13,7,127,63,
+    78,250,112,54,61,248,39,172,183,191,167,222,103,219,1,182,
+    18,127,250,60,149,196,211,101,32,154,6,222,133,53,236,249,
+    247,2,187,129,238,217,121,199,59,7,39,36,7,158,3,102,
+    124,67,208,120,81,221,64,24,14,71,30,206,218,17,158,166,
+    245,238,62,62,103,125,221,197,8,20,75,88,21,145,166,169,
+    216,12,83,100,170,112,86,3,190,173,175,3,94,166,39,40,
+    5,61,190,196,80,228,183,57,18,229,152,73,187,125,79,80,
+    182,16,182,242,129,25,36,170,100,77,192,36,34,76,47,148,
+    205,152,228,82,115,192,209,91,132,163,5,151,75,186,121,210,
+    238,210,232,17,65,21,152,125,237,108,6,71,148,101,101,161,
+    205,209,210,65,154,21,241,20,81,231,35,214,154,81,80,198,
+    147,34,154,14,141,89,45,173,100,53,89,222,244,209,129,4,
+    81,237,3,163,157,163,228,34,12,7,158,160,35,171,80,232,
+    228,168,35,44,146,19,181,18,75,147,105,36,209,136,112,245,
+    8,87,139,140,25,145,177,22,195,134,175,54,163,137,70,116,
+    178,30,157,252,124,174,22,157,49,162,51,213,232,204,227,228,
+    72,35,57,81,79,78,212,146,105,35,153,110,36,95,168,39,
+    95,168,37,231,140,228,92,139,137,134,211,148,236,223,160,67,
+    207,213,163,231,42,190,7,17,131,91,172,69,95,50,162,47,
+    85,163,47,253,48,99,188,30,29,111,38,146,159,70,140,196,
+    228,231,55,190,88,53,46,223,250,198,235,137,245,127,199,0,
+    105,81,18,98,18,167,26,241,177,122,124,172,22,191,96,196,
+    47,52,226,151,235,241,203,181,120,198,136,103,254,114,254,207,
+    19,245,248,66,53,190,208,60,119,254,143,31,26,231,22,62,
+    137,54,185,11,116,162,79,98,160,184,145,72,213,19,169,202,
+    238,151,239,213,18,43,70,98,165,74,239,199,54,163,150,184,
+    104,36,46,86,233,13,69,79,184,191,17,26,173,135,70,43,
+    23,30,92,50,198,94,174,133,174,27,161,235,213,208,245,199,
+    67,103,26,67,19,245,161,137,218,80,218,24,74,55,134,174,
+    213,135,174,213,134,22,140,161,5,226,183,12,37,31,191,182,
+    191,180,175,55,161,112,186,113,176,106,68,83,213,104,170,229,
+    181,153,214,121,213,157,124,72,98,165,135,193,3,230,104,137,
+    191,203,118,206,44,40,247,93,41,224,80,73,239,36,243,77,
+    95,87,175,35,209,85,206,179,21,7,234,199,67,213,53,214,
+    73,223,146,151,126,10,76,172,96,4,177,4,159,207,22,244,
+    184,60,86,11,220,237,233,95,114,57,1,62,139,224,139,192,
+    170,110,76,223,204,149,162,150,246,152,126,9,41,194,54,124,
+    226,8,197,117,164,173,165,67,152,152,99,246,17,28,88,125,
+    102,72,86,45,101,93,232,140,185,42,0,243,172,171,40,232,
+    206,0,22,84,92,199,48,156,237,14,178,52,15,69,139,85,
+    32,93,1,178,51,234,20,72,199,165,147,223,146,113,55,24,
+    2,145,127,15,63,95,121,251,203,155,198,236,141,234,240,205,
+    218,240,77,99,248,38,20,74,177,102,106,242,193,150,145,122,
+    149,188,27,161,243,205,212,165,70,234,118,61,117,187,150,90,
+    53,82,171,237,222,42,189,233,182,167,147,164,160,43,66,29,
+    202,243,102,31,207,23,84,169,172,144,247,40,207,191,95,22,
+    148,54,39,200,243,146,42,146,110,77,23,224,51,211,250,214,
+    178,62,67,206,18,175,128,146,124,185,8,18,152,236,52,45,
+    248,204,176,122,23,18,16,172,93,195,36,15,99,178,195,248,
+    34,33,151,9,33,217,31,147,20,139,151,108,23,152,177,118,
+    1,41,34,69,225,249,52,139,207,51,237,170,231,85,203,81,
+    39,108,50,73,24,191,97,105,241,104,255,90,158,65,127,168,
+    197,16,114,133,9,156,104,121,226,254,193,202,233,22,3,143,
+    14,249,198,11,172,251,239,82,102,235,2,51,54,215,24,189,
+    94,31,189,94,27,125,197,24,125,165,229,141,248,207,182,24,
+    32,205,193,231,105,227,113,56,214,242,219,157,61,201,105,38,
+    16,255,232,215,85,128,189,127,202,240,79,181,60,172,127,178,
+    50,11,200,242,79,118,8,153,53,99,115,1,205,63,122,200,
+    120,205,159,50,252,41,178,212,76,101,143,44,54,243,215,36,
+    125,116,8,25,57,97,11,181,174,248,252,175,179,159,131,40,
+    121,254,45,105,61,159,157,210,48,161,46,95,75,39,0,29,
+    115,25,53,183,9,135,137,70,191,63,173,237,246,59,219,75,
+    34,194,244,193,177,164,89,231,82,63,124,119,42,90,198,142,
+    4,243,20,173,60,181,140,208,254,175,36,79,219,52,12,204,
+    97,167,147,158,7,188,243,111,53,26,42,38,215,97,91,95,
+    159,71,196,18,182,165,15,173,58,151,134,204,247,161,151,173,
+    160,254,25,206,50,86,41,174,253,7,8,228,63,150,109,205,
+    7,88,79,139,249,169,36,193,176,35,85,102,184,251,110,50,
+    92,213,190,155,204,213,170,251,110,50,215,171,238,187,201,172,
+    86,221,119,43,240,30,203,146,93,56,254,81,237,191,244,141,
+    245,246,221,15,72,81,95,252,31,101,43,123,179,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/classic/no_cache.py",
+    "gem5.components.cachehierarchies.classic.no_cache",
+    embedded_module_data,
+    2733,
+    5916);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,223 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,197,25,93,111,27,199,113,239,200,163,142,228,137,31,
+    250,150,37,91,43,217,178,68,127,80,150,29,219,145,226,143,
+    72,86,146,186,73,220,4,118,139,148,136,113,57,243,78,22,
+    109,126,101,239,20,215,138,84,24,133,129,202,128,31,220,135,
+    34,70,145,7,22,8,140,24,246,131,31,90,32,63,131,36,
+    14,32,113,64,1,1,65,30,244,70,195,14,80,4,40,208,
+    217,61,30,121,148,40,219,72,12,228,116,154,155,221,157,157,
+    157,153,157,221,157,29,126,143,92,143,80,255,62,251,7,128,
+    175,144,138,84,46,141,50,92,130,203,240,9,62,227,73,120,
+    50,222,132,55,35,36,4,14,169,188,234,73,251,50,29,137,
+    14,134,123,211,226,37,164,10,170,47,237,207,4,18,1,168,
+    235,80,197,116,48,35,37,36,192,253,106,32,221,153,9,37,
+    66,12,15,166,195,153,72,34,194,112,41,29,205,116,37,186,
+    24,222,153,238,206,244,36,122,56,196,163,247,144,26,186,141,
+    212,176,22,122,224,65,232,145,199,17,48,209,171,70,46,162,
+    88,116,147,22,98,130,213,49,175,168,115,170,74,44,113,94,
+    209,181,79,230,21,98,9,231,148,228,146,102,121,63,202,17,
+    195,10,92,188,169,27,90,134,54,108,122,105,23,206,242,156,
+    191,56,7,31,238,192,166,199,174,232,156,187,162,27,68,73,
+    26,243,57,133,168,155,188,93,219,231,212,50,118,191,73,105,
+    68,33,201,165,155,155,156,221,188,187,209,156,86,116,61,149,
+    108,165,2,2,241,131,233,5,86,105,227,231,25,254,16,240,
+    15,63,252,61,195,147,110,195,251,29,195,131,181,192,240,26,
+    74,112,42,74,240,42,151,240,104,94,149,215,132,69,48,247,
+    109,239,3,32,121,212,232,148,240,105,190,66,7,106,243,180,
+    210,45,114,170,87,19,85,1,254,125,154,31,38,171,99,81,
+    84,197,219,66,34,192,35,45,168,73,15,96,204,71,156,67,
+    13,163,117,194,104,254,109,163,133,94,64,29,216,70,29,102,
+    212,145,45,212,65,45,202,198,247,170,210,182,30,93,174,214,
+    206,219,222,68,183,218,1,83,29,178,250,63,34,169,47,20,
+    67,251,96,186,213,200,43,151,2,24,158,57,156,164,213,88,
+    215,140,229,60,190,177,164,17,13,107,80,131,147,57,192,150,
+    20,29,43,56,111,115,192,31,76,99,85,49,20,172,100,85,
+    156,202,194,4,46,39,141,84,46,139,25,227,56,99,103,249,
+    8,48,34,217,150,233,241,212,255,159,101,217,186,48,184,102,
+    147,202,61,230,91,149,92,67,134,167,217,222,170,228,42,146,
+    249,38,126,173,129,95,243,184,40,188,77,28,12,224,89,249,
+    158,9,102,235,154,209,140,165,156,138,151,117,77,197,70,14,
+    231,174,24,74,42,139,13,208,95,213,22,149,229,180,1,20,
+    153,28,185,137,175,44,235,56,183,136,79,188,129,175,164,12,
+    80,22,223,72,169,198,18,94,204,145,6,55,218,107,7,219,
+    198,3,13,170,89,219,30,250,44,190,212,126,20,96,217,202,
+    202,65,142,54,120,52,159,173,195,56,245,155,111,35,182,174,
+    4,38,102,76,32,212,175,9,181,138,21,189,162,168,10,172,
+    113,153,104,122,62,151,85,53,98,121,242,169,156,213,81,151,
+    5,122,249,64,28,16,69,167,115,128,127,250,88,39,201,169,
+    252,77,48,84,118,234,170,150,57,62,149,204,101,160,163,150,
+    53,244,41,230,43,75,245,241,83,26,84,216,235,119,170,238,
+    34,114,122,90,102,52,242,82,67,200,252,77,171,91,190,170,
+    25,114,125,64,217,30,109,229,224,78,198,107,67,124,20,36,
+    99,224,22,250,177,11,117,13,23,198,138,209,241,82,116,220,
+    140,142,175,251,254,179,247,192,63,103,190,153,89,247,153,34,
+    174,14,142,152,131,211,230,224,241,117,223,221,80,53,220,187,
+    222,249,140,186,130,37,166,167,85,89,79,173,104,20,75,49,
+    140,236,129,134,11,201,134,187,184,29,53,177,205,81,175,53,
+    240,85,244,152,107,117,89,14,173,122,90,92,147,131,82,211,
+    37,121,183,83,170,60,117,74,101,1,58,55,125,36,175,16,
+    37,131,29,17,109,87,161,24,117,65,234,27,176,240,22,232,
+    194,99,134,194,147,90,252,106,252,16,30,59,118,244,250,252,
+    88,204,237,107,54,31,236,104,216,150,209,249,173,11,247,165,
+    252,236,41,176,153,53,29,55,14,229,148,142,25,137,102,104,
+    4,67,33,151,167,108,149,180,171,22,246,138,54,126,204,158,
+    27,169,116,186,177,34,96,53,42,206,114,179,215,90,243,236,
+    161,172,179,57,3,235,121,45,153,90,76,105,106,211,241,225,
+    72,240,234,90,122,241,2,248,124,132,77,180,44,167,178,41,
+    67,150,217,244,90,126,185,49,241,20,181,237,18,243,146,253,
+    116,125,140,81,176,151,2,74,171,211,57,162,60,201,8,173,
+    154,0,176,178,227,2,119,70,161,235,78,159,182,29,115,15,
+    242,239,55,197,248,147,133,162,56,83,18,103,76,113,6,144,
+    106,223,240,186,247,110,176,58,56,10,159,80,253,179,14,127,
+    100,20,122,37,93,30,134,56,199,251,118,49,239,131,13,174,
+    141,247,93,68,15,185,11,49,222,214,46,4,211,1,26,169,
+    154,156,135,227,90,39,227,84,26,182,138,153,14,86,148,174,
+    164,22,154,149,216,78,26,109,35,189,68,69,233,100,170,109,
+    132,187,239,126,105,134,99,69,49,246,179,197,38,7,225,211,
+    16,60,153,95,126,169,224,45,52,47,22,188,133,244,19,58,
+    125,113,10,168,172,150,112,133,6,38,73,190,41,49,242,57,
+    34,47,2,246,87,42,52,87,64,237,158,59,46,21,154,199,
+    205,182,213,207,21,60,91,123,50,58,228,62,188,10,222,151,
+    211,44,160,203,209,79,97,156,53,126,205,179,234,113,143,46,
+    59,193,37,186,219,181,78,99,18,238,182,104,116,54,249,128,
+    12,175,16,203,20,196,151,211,180,106,183,176,165,245,14,146,
+    157,104,11,49,57,248,95,77,142,128,131,67,108,135,126,37,
+    25,130,13,25,188,191,154,12,146,107,76,151,4,59,241,35,
+    189,119,80,33,212,142,110,117,219,185,102,140,184,91,95,73,
+    163,200,203,105,182,106,116,143,187,156,101,94,239,93,19,86,
+    133,66,180,29,7,88,11,13,191,91,245,14,54,234,175,117,
+    181,231,10,171,82,40,116,239,192,169,225,57,175,198,169,253,
+    46,176,147,68,114,143,139,162,125,191,182,227,191,66,191,224,
+    207,236,39,189,184,31,88,170,23,181,121,118,26,177,105,169,
+    157,120,187,108,9,114,60,106,200,194,189,170,23,245,189,156,
+    198,136,55,91,174,13,56,216,117,54,22,57,210,98,139,198,
+    222,185,230,107,111,163,181,14,176,65,83,124,215,179,234,91,
+    237,216,170,195,61,238,110,98,39,250,86,25,25,109,94,165,
+    23,17,225,66,203,169,73,69,162,238,249,108,22,192,223,185,
+    175,208,85,56,57,47,247,175,113,238,160,243,14,223,20,246,
+    241,22,183,252,27,127,119,128,6,3,44,2,162,65,13,79,
+    168,209,73,12,192,67,143,197,199,143,88,92,138,197,57,58,
+    61,156,48,190,197,142,214,159,2,167,210,41,221,160,49,253,
+    153,149,211,59,157,169,169,44,92,255,224,44,165,33,61,139,
+    231,227,167,210,185,164,146,214,207,196,155,221,85,42,254,9,
+    0,255,189,133,106,200,179,43,208,4,27,145,232,143,30,212,
+    217,123,127,223,215,241,162,20,43,73,49,83,138,213,60,45,
+    52,219,35,137,215,100,19,114,28,177,72,131,238,35,100,146,
+    130,55,183,90,129,188,5,224,23,170,159,162,124,78,161,122,
+    152,209,94,17,234,162,117,53,186,90,213,80,183,221,34,64,
+    248,110,152,80,222,242,190,249,126,106,158,80,195,18,202,228,
+    33,79,102,224,99,113,178,206,51,21,94,155,6,244,58,254,
+    236,24,162,17,30,204,200,112,160,9,26,243,183,191,40,141,
+    150,164,81,83,26,133,217,115,83,188,86,165,201,89,71,89,
+    50,71,167,234,53,235,169,83,62,231,156,153,138,237,178,186,
+    147,185,108,86,75,26,178,206,238,24,44,106,100,129,41,57,
+    66,45,29,168,199,194,112,211,177,58,157,184,216,14,84,15,
+    209,118,129,40,217,171,154,221,148,39,185,164,166,235,57,98,
+    23,179,203,25,153,102,78,116,203,15,183,13,38,17,67,213,
+    58,26,76,229,141,27,178,83,80,93,133,240,146,162,67,87,
+    154,128,201,26,50,92,208,195,50,203,201,0,106,147,88,126,
+    13,184,107,84,85,203,207,130,94,54,78,200,209,197,30,205,
+    18,157,88,184,217,162,214,91,156,240,222,234,113,90,110,40,
+    233,235,26,177,117,179,58,40,211,148,174,16,122,172,89,158,
+    79,222,60,97,69,27,204,179,112,153,35,203,121,35,38,218,
+    119,39,122,25,39,243,148,208,203,172,55,203,250,192,216,150,
+    4,180,50,209,62,103,92,173,78,187,164,231,237,65,104,188,
+    243,89,253,238,86,15,245,183,77,225,206,161,254,54,210,79,
+    169,183,252,143,183,183,32,31,242,135,42,226,104,89,28,45,
+    236,251,230,160,57,118,170,36,158,54,197,211,69,241,244,70,
+    255,112,165,127,162,220,63,81,234,143,153,253,177,74,255,201,
+    114,255,201,82,255,140,217,63,83,67,156,63,206,192,157,247,
+    214,231,214,141,106,236,240,250,194,221,247,77,9,60,127,127,
+    205,219,178,99,49,240,67,239,174,251,199,43,67,241,242,80,
+    188,52,116,196,28,58,82,25,58,83,30,58,83,26,122,219,
+    28,122,187,212,59,103,246,206,213,4,160,123,74,137,159,83,
+    64,111,124,181,192,107,228,84,95,130,175,214,127,152,246,31,
+    166,253,135,161,191,41,14,188,6,6,72,138,86,130,184,28,
+    196,165,224,152,25,28,163,230,155,172,74,145,138,132,203,18,
+    46,244,150,164,9,83,154,40,74,19,63,244,141,20,132,10,
+    62,86,198,199,74,248,184,137,143,87,240,217,50,62,91,194,
+    115,38,158,43,245,205,155,125,243,53,212,237,159,124,74,193,
+    157,119,193,254,122,85,10,87,164,61,101,105,207,125,227,235,
+    63,127,171,152,35,71,204,145,153,146,52,107,74,179,69,105,
+    246,197,173,27,177,195,143,135,204,216,57,152,192,11,247,167,
+    77,105,55,204,98,181,77,221,198,193,169,199,111,153,7,223,
+    89,95,48,165,225,251,31,155,210,136,41,77,86,219,85,110,
+    208,241,246,149,165,125,213,72,143,25,193,133,168,25,217,107,
+    70,14,125,171,154,241,51,223,125,110,198,231,204,248,111,159,
+    122,248,206,208,115,4,160,198,128,136,34,189,149,240,88,57,
+    60,86,10,239,51,195,251,42,225,67,229,240,161,82,56,110,
+    134,227,255,222,251,175,137,114,120,166,24,158,169,142,236,253,
+    250,75,16,254,158,84,197,251,190,9,154,120,246,94,103,53,
+    210,93,137,140,151,35,227,133,244,147,15,75,145,121,51,50,
+    95,140,204,3,178,225,52,148,34,19,102,100,162,24,153,0,
+    164,54,1,70,99,230,179,247,98,247,5,151,6,152,236,130,
+    251,4,109,207,184,170,60,251,243,168,94,85,88,229,92,167,
+    169,239,1,44,207,71,141,43,201,150,108,107,227,138,123,205,
+    149,97,109,134,80,205,11,42,132,120,62,212,230,217,154,203,
+    117,245,109,132,132,44,105,45,174,28,60,71,52,154,113,86,
+    234,217,105,154,36,117,246,70,124,126,234,119,184,190,47,165,
+    114,89,125,147,10,188,73,247,163,205,30,182,9,77,95,159,
+    223,164,81,105,76,180,4,5,182,230,164,21,52,148,171,114,
+    26,24,102,147,55,45,137,230,176,27,165,136,157,22,213,181,
+    70,141,144,209,151,136,78,78,82,94,157,198,85,67,151,243,
+    176,69,210,74,43,104,39,82,233,238,175,95,128,157,80,96,
+    167,5,221,86,237,58,171,35,149,99,2,55,15,19,242,7,
+    74,179,187,37,187,226,218,229,237,163,135,166,90,32,96,105,
+    108,172,45,7,224,71,0,86,38,118,76,68,181,30,18,247,
+    104,239,207,16,61,210,127,232,31,174,118,117,87,7,118,85,
+    7,135,170,187,71,170,93,61,213,104,95,117,215,112,117,96,
+    183,57,48,89,139,250,7,96,97,3,120,78,1,236,44,82,
+    173,7,141,142,51,87,164,37,83,220,93,197,227,21,124,174,
+    140,207,149,240,59,38,126,167,94,91,100,175,125,148,246,208,
+    124,91,86,201,104,178,108,5,100,57,147,83,151,211,20,151,
+    100,249,243,101,37,93,111,233,144,101,53,151,164,213,186,161,
+    24,169,164,157,133,183,115,212,24,217,73,187,197,229,44,165,
+    240,232,6,33,212,191,88,254,205,242,231,190,128,99,7,108,
+    166,179,236,30,161,126,69,14,83,64,115,110,132,222,98,9,
+    157,106,34,59,150,122,104,31,242,182,233,250,28,112,152,153,
+    133,163,102,113,254,106,60,47,136,176,98,1,136,200,215,85,
+    227,131,66,95,97,87,13,193,167,9,158,122,160,233,246,167,
+    172,177,54,134,134,167,42,67,39,203,67,39,75,67,51,230,
+    208,76,205,223,37,192,222,7,96,163,171,183,38,208,130,15,
+    117,247,213,58,40,38,162,232,160,77,16,64,129,80,45,232,
+    144,186,192,36,242,133,111,253,177,8,123,131,112,216,20,14,
+    215,120,78,56,80,120,3,54,83,225,64,19,80,9,226,78,
+    43,240,255,217,93,198,75,194,126,83,216,95,227,167,133,201,
+    194,90,13,193,231,187,30,246,105,2,218,115,194,33,170,45,
+    114,157,194,187,92,225,114,13,209,239,19,195,254,190,24,218,
+    198,167,38,191,16,235,131,165,113,60,158,187,114,13,22,170,
+    206,126,140,176,103,86,104,204,36,245,0,203,11,33,135,110,
+    199,28,161,101,35,149,214,227,206,164,91,189,44,117,167,199,
+    149,250,175,133,50,43,179,25,183,6,26,149,91,126,112,96,
+    94,97,225,102,179,253,19,197,54,50,150,46,14,219,209,87,
+    220,137,208,216,165,193,85,107,7,85,236,102,101,69,234,181,
+    153,204,178,205,140,244,52,156,236,79,8,185,28,239,39,241,
+    148,189,20,206,144,191,32,59,67,170,99,128,53,15,199,113,
+    181,19,62,142,175,161,95,10,34,136,27,44,162,1,247,91,
+    69,184,232,188,85,116,180,216,250,86,209,233,98,235,91,69,
+    239,23,91,223,42,26,47,182,190,237,106,246,23,91,223,154,
+    47,207,113,212,3,118,254,20,247,188,245,212,198,158,191,128,
+    138,89,240,255,62,135,31,202,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/classic/private_l1_cache_hierarchy.py",
+    "gem5.components.cachehierarchies.classic.private_l1_cache_hierarchy",
+    embedded_module_data,
+    3176,
+    8019);
+
+} // anonymous namespace
+} // namespace gem5
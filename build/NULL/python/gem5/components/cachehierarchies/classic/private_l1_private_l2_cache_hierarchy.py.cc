@@ -0,0 +1,253 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,197,26,75,108,19,73,182,218,118,219,109,187,29,219,
+    249,57,137,19,210,4,39,193,124,28,18,126,147,44,191,4,
+    134,207,0,97,70,176,210,172,53,108,79,199,221,33,6,255,
+    168,238,192,146,9,43,86,66,59,65,155,149,216,195,106,56,
+    112,240,74,35,52,136,28,56,236,74,220,119,181,103,219,106,
+    201,86,75,35,33,173,230,144,203,202,8,70,90,205,105,171,
+    170,221,110,119,226,144,204,8,68,167,253,250,85,213,171,87,
+    175,94,189,122,245,170,42,255,1,13,143,179,246,125,253,2,
+    129,111,128,8,68,42,5,210,84,156,74,219,226,182,180,61,
+    110,79,59,226,142,52,29,167,211,206,184,147,2,162,77,180,
+    167,92,105,38,206,16,220,145,114,95,1,34,45,58,83,158,
+    180,55,238,69,121,46,145,73,177,105,95,220,71,112,119,170,
+    37,237,143,251,17,238,17,189,169,64,58,24,15,18,156,77,
+    181,166,219,226,109,4,247,165,218,211,29,241,14,130,183,164,
+    58,211,161,120,136,224,254,84,87,186,59,222,77,1,27,56,
+    3,196,192,125,32,6,165,160,228,127,226,0,224,153,195,16,
+    63,222,35,182,94,6,209,182,85,156,136,58,53,215,148,32,
+    78,138,34,212,152,41,65,150,62,159,18,160,70,159,20,18,
+    115,146,230,188,48,70,146,142,79,179,80,209,60,151,239,200,
+    138,148,198,57,171,152,89,148,210,236,231,46,79,162,15,181,
+    107,213,174,103,248,38,103,100,5,10,9,101,42,43,64,113,
+    213,166,231,118,26,185,132,237,217,164,4,5,152,152,187,131,
+    74,182,25,37,87,110,103,47,72,183,164,148,149,98,149,210,
+    25,244,213,25,164,4,89,78,38,214,241,97,46,140,158,34,
+    153,58,126,206,192,93,23,198,8,250,20,101,95,188,248,107,
+    130,39,26,199,210,107,140,101,128,194,99,41,129,56,37,130,
+    184,77,164,226,118,201,33,218,36,122,22,141,222,125,199,19,
+    68,242,172,94,41,238,148,156,121,23,104,242,88,233,102,41,
+    209,33,49,34,141,126,78,244,115,73,110,52,254,204,172,71,
+    116,223,167,227,30,27,144,188,18,251,4,181,251,140,50,106,
+    160,22,125,168,69,207,186,22,91,222,66,237,93,71,237,39,
+    212,129,53,212,172,20,36,237,59,68,223,186,26,173,13,165,
+    45,247,29,241,54,145,65,54,226,215,184,79,97,242,150,160,
+    72,23,70,13,100,204,170,252,133,156,135,67,207,36,151,192,
+    217,156,44,41,243,57,238,246,156,4,37,78,66,57,92,34,
+    139,176,57,65,230,4,46,167,115,224,46,140,114,167,4,69,
+    224,132,140,200,157,203,160,129,157,79,40,201,108,134,35,140,
+    247,16,118,184,168,161,194,152,206,61,70,202,52,39,68,141,
+    192,140,101,28,237,181,223,235,12,153,147,10,101,22,137,212,
+    138,205,170,137,187,64,177,111,52,102,139,128,183,153,248,245,
+    58,126,221,222,64,225,48,113,164,37,251,194,127,137,96,186,
+    30,210,146,50,151,21,185,121,89,18,57,37,203,101,103,20,
+    33,153,225,20,164,27,81,154,21,230,83,10,162,72,103,225,
+    29,110,102,94,230,178,179,220,161,3,220,76,82,225,16,205,
+    237,164,168,204,113,179,89,88,231,134,107,173,31,0,206,58,
+    2,49,79,157,126,66,215,140,60,193,93,105,222,30,98,190,
+    1,211,58,15,243,217,176,153,213,19,128,76,75,154,72,28,
+    165,33,131,210,16,43,72,11,206,8,162,128,156,9,15,37,
+    57,151,205,136,18,212,236,185,100,86,115,213,132,65,181,156,
+    72,30,36,139,140,135,131,251,233,11,25,38,70,114,119,144,
+    206,50,35,215,164,244,193,145,68,54,141,42,74,25,69,30,
+    33,131,62,87,19,32,41,161,12,125,250,143,212,12,131,79,
+    141,242,117,116,140,39,228,252,92,93,224,220,29,173,141,191,
+    38,41,124,173,109,94,111,120,225,192,102,54,29,107,82,235,
+    35,36,173,60,134,192,61,240,99,59,104,237,205,15,20,130,
+    131,197,224,160,26,28,92,114,126,191,99,215,223,198,191,29,
+    95,114,170,12,87,233,238,87,187,71,213,238,131,75,206,229,
+    150,138,191,99,201,247,26,91,138,198,164,70,69,94,78,46,
+    72,24,75,234,152,11,73,141,17,184,29,81,76,39,232,6,
+    131,118,27,6,173,172,51,232,235,117,124,17,172,80,86,211,
+    166,128,66,55,167,92,180,137,182,69,10,253,236,162,125,197,
+    241,4,185,175,103,46,179,214,162,3,153,117,221,196,69,26,
+    153,181,83,248,26,85,55,109,43,39,64,33,205,25,189,208,
+    77,12,99,216,136,177,77,25,211,154,232,146,219,41,197,174,
+    197,246,112,3,251,199,110,76,13,68,27,109,84,231,195,25,
+    74,104,202,104,157,91,216,148,95,77,147,77,184,141,173,225,
+    48,118,240,80,115,22,250,64,235,28,204,57,19,67,233,164,
+    204,17,18,73,145,32,135,18,217,28,150,76,72,53,228,34,
+    143,213,100,10,145,231,118,50,149,170,79,70,228,18,4,99,
+    206,235,19,222,92,86,49,235,76,86,225,228,156,148,72,206,
+    38,37,49,86,103,137,22,48,135,44,165,102,87,201,84,195,
+    198,17,117,194,33,108,87,110,172,72,52,45,178,9,56,88,
+    75,139,181,244,176,110,119,99,122,114,58,234,128,173,36,135,
+    231,147,153,164,194,243,48,128,153,97,219,67,115,120,23,198,
+    49,7,194,150,212,37,69,50,182,39,34,3,28,192,121,35,
+    8,44,68,55,159,66,181,54,206,96,22,87,244,121,19,1,
+    238,33,149,137,61,63,85,96,198,139,204,184,202,140,35,228,
+    123,6,229,141,84,216,64,165,163,175,210,25,170,193,246,112,
+    165,163,179,234,103,220,158,87,0,129,55,24,84,9,104,7,
+    161,190,37,199,178,119,9,253,193,8,98,156,104,152,26,128,
+    50,166,77,15,153,54,200,131,55,153,12,151,193,83,106,58,
+    106,35,221,211,90,208,80,35,211,17,37,62,135,162,28,25,
+    70,177,192,196,55,145,254,106,65,236,11,44,52,11,99,155,
+    246,126,93,157,89,44,147,143,168,225,165,191,109,249,43,213,
+    31,45,48,209,95,44,63,28,197,131,102,244,32,145,155,223,
+    180,7,22,154,45,246,192,82,7,11,2,15,96,128,133,214,
+    232,25,28,225,37,108,166,232,36,46,38,178,111,67,70,250,
+    53,150,158,202,131,102,207,131,134,190,152,43,236,90,71,134,
+    106,219,215,214,36,116,160,113,189,206,59,54,167,57,5,174,
+    6,191,64,237,220,181,221,181,47,218,27,91,231,235,206,114,
+    185,117,9,199,107,212,125,70,241,153,124,144,12,91,136,243,
+    242,204,230,52,214,222,157,90,83,250,0,240,110,3,39,114,
+    216,62,152,28,30,3,71,113,47,248,64,50,24,81,185,174,
+    11,199,7,211,5,107,224,34,253,193,116,81,111,85,116,126,
+    48,25,90,26,218,244,111,206,15,118,60,0,249,64,51,186,
+    197,245,225,202,142,198,210,45,245,168,117,115,154,181,61,122,
+    72,93,253,23,241,0,142,187,244,34,157,111,107,198,1,249,
+    133,250,28,92,116,116,215,243,175,183,55,231,138,60,20,157,
+    239,216,128,83,125,22,109,141,19,170,225,109,90,163,238,29,
+    55,146,142,239,108,160,216,156,71,83,185,126,38,15,95,51,
+    138,159,201,163,165,25,133,133,7,219,140,194,212,224,70,173,
+    152,30,125,67,30,141,173,152,43,129,185,235,163,243,33,208,
+    228,217,168,231,22,153,154,246,171,97,220,81,43,207,234,45,
+    81,91,181,248,174,205,105,148,49,179,228,122,143,129,221,32,
+    109,193,125,150,21,183,174,161,187,206,230,43,241,93,23,210,
+    65,184,89,155,139,206,69,215,218,62,60,164,150,159,111,68,
+    111,149,145,208,254,91,196,123,102,215,180,37,236,193,34,225,
+    73,249,122,2,129,191,82,223,128,107,40,244,185,26,186,75,
+    53,238,123,30,216,76,97,87,214,76,161,191,216,150,187,112,
+    88,71,226,100,20,253,163,216,8,43,93,115,243,198,62,227,
+    169,93,179,197,246,105,84,146,68,186,50,14,45,56,238,30,
+    137,144,126,242,28,73,37,101,5,239,60,143,45,156,222,52,
+    52,74,102,18,89,136,66,34,188,237,212,207,37,142,164,178,
+    9,33,37,31,139,153,124,110,225,222,28,66,224,127,247,64,
+    21,216,123,60,38,120,25,8,254,104,7,190,142,71,145,199,
+    177,2,27,45,178,81,149,141,86,237,22,154,245,145,225,59,
+    82,17,252,21,32,145,99,155,161,29,125,59,7,143,175,85,
+    10,156,66,224,93,105,99,1,51,60,9,106,193,163,165,95,
+    14,163,95,120,88,106,189,10,88,123,101,181,34,212,143,32,
+    26,106,16,165,160,83,239,203,9,204,120,18,119,192,70,58,
+    240,238,229,255,61,102,142,227,106,60,152,182,46,143,9,42,
+    221,61,127,62,253,224,236,242,217,170,221,146,255,222,7,16,
+    175,60,104,43,103,156,32,188,223,241,251,3,230,110,90,115,
+    183,199,4,53,107,110,127,212,254,184,175,192,14,23,217,97,
+    149,29,70,214,220,72,243,22,101,196,204,81,111,181,170,66,
+    92,119,184,129,20,208,134,70,222,166,57,62,58,159,156,130,
+    71,112,47,177,51,127,170,155,128,70,241,239,205,0,254,136,
+    101,221,95,51,0,123,175,199,4,245,217,60,84,96,183,23,
+    217,237,42,187,29,245,190,145,226,157,246,30,158,55,122,13,
+    47,190,79,139,255,19,102,120,9,212,102,108,180,87,107,75,
+    100,51,25,41,161,240,50,57,175,32,123,66,178,255,132,216,
+    46,52,79,109,203,155,133,119,52,159,177,253,213,247,163,120,
+    101,210,104,40,100,174,73,122,81,14,102,19,146,44,103,161,
+    158,204,204,167,121,124,76,44,147,179,12,34,17,65,197,26,
+    234,74,141,205,204,203,8,97,82,99,181,44,111,50,167,220,
+    230,141,132,216,144,240,207,9,50,226,134,15,160,51,10,159,
+    204,106,126,158,156,73,35,84,39,209,220,18,106,80,194,189,
+    215,220,100,151,75,154,110,49,186,167,11,160,49,198,230,215,
+    44,17,107,37,198,198,94,107,55,74,110,11,169,27,18,212,
+    187,171,185,48,211,164,44,64,28,107,105,246,207,63,58,164,
+    5,235,204,51,138,4,225,124,78,137,50,250,129,11,62,86,
+    132,211,152,208,65,20,58,73,234,160,182,53,22,209,242,80,
+    186,73,184,106,62,61,37,231,244,70,112,80,255,101,237,104,
+    168,182,201,95,55,170,91,216,228,175,171,131,79,207,229,127,
+    218,245,121,238,4,238,150,50,179,189,196,108,207,71,190,221,
+    173,14,28,41,50,71,85,230,104,129,57,250,50,212,91,14,
+    13,151,66,195,197,80,84,13,69,203,161,195,165,208,225,98,
+    104,92,13,141,87,1,229,142,17,240,224,204,210,228,146,82,
+    137,238,93,58,181,124,94,101,209,244,24,170,58,44,139,28,
+    1,63,116,244,60,58,88,14,199,74,225,88,49,188,79,13,
+    239,43,135,143,149,194,199,138,225,19,106,248,68,177,99,82,
+    237,152,172,210,136,238,21,38,126,131,193,146,99,185,165,202,
+    188,59,78,134,203,254,126,219,142,252,199,229,200,225,82,228,
+    112,49,50,174,70,198,203,145,51,165,200,153,98,228,156,26,
+    57,87,220,246,137,186,237,19,226,228,95,97,226,55,24,160,
+    250,108,213,105,113,117,4,108,77,146,110,44,73,55,150,164,
+    27,115,242,85,61,134,199,216,90,253,94,92,191,23,215,239,
+    69,245,85,166,235,29,48,0,108,176,236,229,74,94,174,232,
+    29,80,189,3,120,32,119,86,216,64,153,229,74,44,151,239,
+    208,189,59,114,243,63,116,246,231,233,50,183,191,196,237,47,
+    114,7,85,238,96,153,59,94,226,142,23,185,73,149,155,44,
+    118,78,169,157,83,85,208,233,222,249,10,131,7,167,145,37,
+    200,21,214,95,102,183,149,216,109,143,148,199,191,255,78,80,
+    251,247,169,253,227,69,118,66,101,39,10,236,196,219,75,95,
+    70,247,174,244,62,23,86,250,213,232,25,100,78,211,143,70,
+    85,182,15,217,84,101,163,252,221,35,43,71,94,80,43,199,
+    213,221,231,150,78,169,108,239,163,207,84,182,95,101,119,110,
+    88,240,114,239,232,202,213,23,163,234,222,163,234,222,211,136,
+    213,133,71,193,229,75,42,187,11,183,220,247,252,166,26,29,
+    87,163,83,53,75,126,137,101,141,148,216,72,37,208,174,6,
+    184,124,80,13,236,80,3,123,190,19,213,216,177,23,55,213,
+    216,164,26,251,228,149,221,230,107,65,70,226,107,169,18,192,
+    128,64,71,217,63,80,242,15,20,253,17,213,31,41,251,247,
+    148,252,123,138,254,152,234,143,253,99,199,223,135,75,254,241,
+    130,127,188,210,191,227,241,87,168,227,15,217,10,23,249,214,
+    171,114,19,15,125,149,64,91,57,48,88,10,12,230,83,207,
+    47,22,3,83,106,96,170,16,152,66,200,75,163,160,24,24,
+    86,3,195,133,192,48,66,170,123,145,194,137,234,245,101,167,
+    241,128,14,59,36,114,64,247,28,172,191,36,19,109,228,207,
+    46,58,68,122,145,106,136,66,156,79,144,183,121,86,63,70,
+    88,115,65,86,63,162,187,222,112,41,102,110,37,204,237,24,
+    218,234,24,23,231,150,103,237,245,91,67,221,250,214,72,116,
+    161,45,3,179,176,251,36,148,240,125,160,80,187,108,196,183,
+    89,134,171,231,206,141,92,226,106,110,54,153,205,200,112,55,
+    170,183,138,151,158,85,178,17,176,143,222,152,90,197,251,193,
+    40,163,209,228,60,92,243,42,194,53,62,133,24,102,18,119,
+    52,86,20,20,161,158,10,232,215,87,178,84,207,161,211,242,
+    28,148,225,81,204,203,167,92,83,100,62,135,60,62,206,212,
+    188,250,133,23,94,223,228,105,228,216,105,178,30,226,85,66,
+    207,211,92,201,44,17,216,92,46,161,136,105,250,44,199,196,
+    13,139,150,190,184,206,0,18,232,213,215,9,203,90,255,91,
+    4,22,246,109,126,12,111,93,252,176,162,229,47,1,14,99,
+    126,8,245,86,90,219,42,93,61,149,238,112,165,175,191,210,
+    218,94,9,118,86,122,122,43,93,125,106,215,206,106,208,141,
+    29,157,27,59,58,119,205,209,181,131,237,131,196,38,113,74,
+    101,250,42,220,96,153,59,89,226,78,22,185,143,85,238,227,
+    90,110,129,188,122,212,208,142,239,26,50,66,90,226,121,205,
+    195,243,233,172,56,159,194,56,203,243,55,231,133,84,173,196,
+    197,243,98,54,129,179,101,69,80,146,9,253,6,85,191,84,
+    196,167,67,152,201,236,124,6,83,216,101,5,66,108,104,228,
+    26,66,115,103,111,161,229,20,41,79,38,55,27,16,27,12,
+    196,81,26,60,140,1,62,170,130,120,207,14,211,134,202,32,
+    190,143,32,194,233,106,236,54,192,62,172,25,108,245,247,234,
+    127,200,179,211,12,114,167,8,120,128,179,181,106,99,233,206,
+    124,79,21,160,143,9,94,217,81,209,253,47,72,97,117,8,
+    244,142,148,195,135,75,225,195,197,240,184,26,30,175,122,251,
+    232,190,42,64,224,101,107,71,149,198,9,39,104,235,172,186,
+    48,198,0,148,231,198,152,7,4,187,117,82,22,120,90,170,
+    62,163,82,3,56,6,156,254,123,191,41,32,143,65,239,85,
+    233,189,85,27,69,239,202,31,64,238,153,222,101,2,44,75,
+    204,40,69,45,253,226,42,131,69,122,72,165,135,170,182,9,
+    122,103,254,110,21,160,207,139,118,242,49,1,174,57,108,16,
+    85,127,71,249,232,211,84,254,106,21,224,239,115,69,255,190,
+    29,234,195,128,149,63,29,13,163,9,115,48,150,157,185,142,
+    166,175,76,174,146,245,97,198,115,137,108,243,244,177,197,54,
+    161,57,80,112,37,235,209,85,203,188,146,76,201,49,195,12,
+    180,14,114,43,33,199,132,218,255,139,240,36,77,108,64,235,
+    170,103,174,185,40,38,118,162,13,212,139,149,219,89,62,133,
+    255,25,101,29,33,62,211,212,56,147,143,126,29,189,142,140,
+    220,178,249,245,128,52,102,196,177,250,142,219,204,213,227,76,
+    253,148,162,197,200,213,227,91,125,111,23,168,101,166,211,243,
+    122,11,48,84,183,88,171,21,255,196,28,209,167,214,49,248,
+    16,232,119,72,242,103,8,86,237,20,69,85,15,185,40,91,
+    21,188,59,208,10,168,238,2,232,106,124,43,128,43,24,111,
+    5,140,21,172,111,5,28,45,88,223,10,184,84,176,190,21,
+    112,190,96,125,43,96,176,96,125,155,229,236,40,88,223,10,
+    24,42,88,223,170,243,172,141,194,38,183,241,167,226,216,94,
+    216,49,249,202,78,18,111,222,66,72,84,254,127,86,162,168,
+    87,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/classic/private_l1_private_l2_cache_hierarchy.py",
+    "gem5.components.cachehierarchies.classic.private_l1_private_l2_cache_hierarchy",
+    embedded_module_data,
+    3649,
+    9740);
+
+} // anonymous namespace
+} // namespace gem5
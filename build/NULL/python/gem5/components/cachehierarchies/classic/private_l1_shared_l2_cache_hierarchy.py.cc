@@ -0,0 +1,263 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,197,58,93,111,27,71,146,61,28,126,12,169,161,248,
+    161,15,74,162,100,141,101,201,18,109,135,178,228,56,182,180,
+    182,215,146,21,199,94,203,222,93,56,11,228,184,201,206,142,
+    57,35,107,228,225,71,102,70,22,228,200,139,0,103,220,201,
+    7,3,151,93,228,176,126,200,3,15,48,140,53,108,28,252,
+    176,7,228,225,126,4,73,12,32,98,128,28,12,28,242,160,
+    55,26,177,129,69,158,174,186,135,51,28,74,180,37,100,179,
+    8,53,44,214,116,87,85,87,87,87,87,87,119,235,255,144,
+    235,227,111,252,126,247,53,128,63,35,17,137,148,130,114,84,
+    134,202,121,50,158,28,157,161,115,222,140,55,231,203,248,114,
+    254,140,159,66,162,71,164,149,64,142,201,48,4,247,42,193,
+    15,145,232,19,253,74,40,215,145,233,128,178,128,200,40,108,
+    46,156,9,19,60,168,116,230,34,153,8,224,33,177,67,137,
+    230,98,153,24,193,89,37,158,235,202,116,17,60,172,116,231,
+    122,50,61,4,239,84,122,115,137,76,130,224,17,165,47,215,
+    159,233,167,144,7,125,128,196,232,61,36,198,164,152,20,121,
+    236,69,232,169,215,86,63,51,32,198,175,163,84,215,54,126,
+    73,249,205,192,188,32,206,137,162,106,50,243,130,38,125,52,
+    47,168,166,239,130,144,93,150,76,255,226,52,121,245,254,170,
+    160,234,102,232,250,186,166,75,57,92,178,141,133,165,40,147,
+    190,124,125,14,126,168,35,219,180,85,16,158,187,161,233,170,
+    144,213,231,11,130,42,110,123,172,210,94,187,148,136,189,36,
+    75,170,160,102,151,215,161,230,128,93,243,225,90,97,81,186,
+    45,41,173,20,219,148,37,96,200,17,160,8,154,38,103,119,
+    201,97,22,167,22,72,161,133,95,182,241,192,226,52,65,159,
+    64,241,213,171,191,33,120,214,61,150,49,123,44,71,40,60,
+    150,18,202,80,34,202,120,68,42,67,75,94,209,35,249,150,
+    96,244,238,121,31,3,201,83,135,41,227,23,189,240,231,147,
+    252,165,0,106,243,105,165,94,242,138,126,137,17,3,240,101,
+    224,27,148,130,98,8,190,29,240,101,165,16,120,68,120,41,
+    42,118,222,243,101,58,60,72,98,165,240,99,208,228,41,101,
+    115,131,14,157,160,67,100,151,14,145,183,80,71,119,81,71,
+    9,117,108,7,117,76,138,147,246,189,98,124,23,71,151,171,
+    182,235,158,55,211,45,134,193,107,186,205,225,95,169,242,109,
+    65,151,22,167,174,47,11,170,36,54,44,236,140,198,157,255,
+    13,113,240,153,227,178,184,152,211,36,125,181,200,173,45,75,
+    170,196,73,80,194,101,11,128,45,11,26,39,112,69,75,18,
+    183,56,197,45,8,186,192,9,121,145,187,156,135,145,94,205,
+    234,114,33,207,17,193,199,136,56,92,37,112,139,211,13,169,
+    178,198,105,164,117,110,77,214,151,57,65,81,136,92,45,205,
+    125,136,219,180,170,220,212,185,130,166,43,235,68,148,156,207,
+    42,171,154,124,91,178,120,129,171,40,101,117,78,47,112,58,
+    230,45,42,178,206,93,158,92,192,90,225,86,193,109,44,49,
+    90,154,176,155,126,21,186,164,230,91,220,136,110,124,191,203,
+    147,144,160,83,205,42,145,122,230,105,53,251,93,164,211,111,
+    114,150,13,196,123,154,248,138,131,175,208,46,10,111,19,135,
+    33,161,133,0,136,38,186,89,134,207,73,250,114,65,228,86,
+    53,176,1,244,170,112,67,23,228,60,233,156,40,45,9,171,
+    138,14,20,185,130,186,206,221,88,213,184,194,18,247,222,187,
+    220,13,232,51,208,172,201,34,88,100,169,160,58,210,48,215,
+    174,1,231,90,71,60,29,114,200,103,45,219,104,179,100,28,
+    218,52,7,178,219,203,116,68,52,63,111,105,69,95,47,74,
+    179,92,51,32,57,85,219,231,17,137,24,62,210,149,148,79,
+    101,224,93,197,198,51,99,55,4,81,128,56,199,227,17,47,
+    228,69,73,53,233,162,92,48,3,13,53,129,203,15,154,130,
+    150,26,30,42,238,251,223,106,106,118,178,184,14,198,204,79,
+    222,148,114,39,39,179,133,28,48,74,121,93,155,36,30,177,
+    220,208,77,150,160,192,138,76,147,13,159,230,149,41,222,114,
+    67,94,153,230,9,53,191,236,116,165,184,110,118,241,55,37,
+    157,111,52,205,91,237,222,57,177,199,220,74,183,97,154,1,
+    93,181,105,0,159,163,215,189,40,62,88,26,41,199,198,42,
+    177,49,35,54,182,233,255,230,208,145,255,156,121,52,179,233,
+    55,24,174,214,63,108,244,79,25,253,39,55,253,15,58,107,
+    145,158,205,240,119,216,135,182,177,133,182,163,216,66,140,50,
+    37,242,154,124,71,194,152,108,97,1,80,159,32,65,92,9,
+    125,44,100,49,42,55,80,6,170,9,166,30,4,9,215,178,
+    140,107,82,4,237,73,161,239,154,20,43,14,190,129,158,81,
+    173,211,131,66,186,175,61,229,134,103,195,183,65,109,120,55,
+    232,13,63,76,42,136,189,79,3,77,174,141,0,76,13,103,
+    154,136,52,76,13,175,112,197,227,154,26,179,69,65,21,114,
+    156,221,75,203,73,49,134,103,1,246,74,59,16,17,171,115,
+    19,82,250,102,250,24,55,114,98,250,214,252,72,42,189,83,
+    12,103,219,168,173,156,93,113,108,47,113,13,59,183,17,54,
+    189,67,192,244,201,247,218,75,176,7,200,146,65,80,89,208,
+    229,219,178,190,222,182,135,109,36,200,251,145,176,171,111,237,
+    58,179,167,156,233,55,240,90,110,109,113,54,35,7,142,236,
+    16,199,9,137,164,75,42,14,234,133,34,86,65,80,92,165,
+    16,177,219,68,18,242,89,147,97,149,176,67,18,196,69,193,
+    14,124,86,212,107,6,19,44,58,95,208,57,188,46,200,75,
+    178,36,54,85,132,60,194,171,73,202,82,202,175,78,224,192,
+    114,20,131,113,12,142,96,144,194,224,24,158,8,41,175,26,
+    39,83,138,231,229,188,172,243,188,138,103,24,153,36,41,70,
+    157,116,216,38,28,182,35,142,188,99,54,165,134,103,147,221,
+    180,58,130,139,143,3,184,51,177,103,152,104,52,122,25,11,
+    249,208,138,13,71,80,240,176,193,164,159,47,148,153,153,10,
+    51,99,48,51,128,124,195,64,217,100,141,141,214,122,134,106,
+    189,195,13,216,157,4,164,30,97,130,161,151,8,192,43,12,
+    234,4,116,163,196,208,166,247,65,199,38,252,169,163,32,56,
+    235,154,212,136,178,39,252,0,153,240,176,126,181,153,198,215,
+    209,19,234,90,202,67,58,104,118,194,0,131,219,139,18,95,
+    132,20,83,83,211,88,97,18,125,73,119,205,24,142,119,45,
+    52,119,166,246,234,252,46,150,91,88,165,48,177,194,139,72,
+    215,131,207,140,72,170,204,164,126,176,250,42,14,182,78,7,
+    178,197,213,61,59,208,66,179,191,14,180,176,20,240,200,159,
+    196,0,235,108,250,110,224,228,58,235,105,106,78,182,36,68,
+    245,81,8,136,255,138,149,167,74,168,221,231,190,171,43,205,
+    236,98,103,0,6,110,122,39,39,161,67,238,92,165,228,221,
+    155,102,1,125,18,251,24,218,185,235,185,75,111,208,238,214,
+    121,39,200,63,136,111,162,37,74,164,238,49,122,184,41,7,
+    116,216,71,114,93,98,246,166,105,237,221,194,142,218,251,136,
+    15,218,56,209,195,243,147,233,17,178,113,61,241,38,25,64,
+    197,58,84,73,228,42,95,233,116,225,17,27,127,70,63,6,
+    235,63,245,184,248,163,54,46,122,239,161,159,168,167,246,182,
+    11,54,194,63,153,14,113,87,155,93,123,203,83,123,238,163,
+    82,119,59,186,141,221,9,204,81,119,237,190,122,212,187,55,
+    205,206,30,125,65,125,146,39,115,203,123,215,183,225,43,37,
+    218,73,0,95,112,188,123,195,219,239,148,175,244,181,151,10,
+    115,223,87,106,146,181,74,114,252,115,127,146,128,195,241,213,
+    21,151,7,182,215,136,31,112,81,180,231,107,219,254,62,248,
+    98,63,144,47,254,118,62,176,148,107,6,54,63,111,106,177,
+    105,169,55,201,118,217,178,101,214,82,251,245,162,193,189,105,
+    244,217,102,205,202,1,27,187,69,218,82,143,183,172,15,78,
+    132,190,235,111,191,110,220,13,128,13,134,219,181,185,225,223,
+    8,236,236,195,23,212,131,204,155,232,91,117,36,180,69,104,
+    211,137,85,45,182,115,70,171,185,134,180,208,186,71,182,185,
+    222,56,154,136,120,215,236,191,214,178,246,99,227,226,32,240,
+    221,37,0,255,65,253,25,221,132,245,255,147,3,119,41,247,
+    174,229,190,167,41,14,112,151,64,216,195,192,130,249,212,89,
+    52,255,232,121,48,12,141,120,46,166,104,72,24,241,246,201,
+    103,237,151,34,107,170,172,75,55,132,236,45,62,171,72,66,
+    62,69,171,56,166,152,65,222,217,113,133,120,39,13,127,66,
+    155,158,244,113,147,146,73,198,168,97,241,28,247,57,201,44,
+    190,15,157,81,100,77,199,91,210,115,119,222,223,43,165,144,
+    243,217,130,10,169,4,222,153,146,205,104,250,140,82,200,10,
+    138,118,46,221,20,243,25,110,227,3,0,127,251,28,213,81,
+    96,32,228,2,44,138,197,95,119,160,112,79,173,167,255,203,
+    223,213,122,7,190,44,212,184,177,122,192,27,238,124,137,0,
+    188,194,160,78,183,48,237,206,176,252,182,149,47,186,173,60,
+    180,63,43,63,219,49,41,192,198,7,192,198,212,19,143,122,
+    6,94,213,179,0,192,156,93,182,57,197,166,57,27,251,34,
+    117,110,167,21,213,5,0,63,146,249,254,25,11,159,181,205,
+    71,99,35,216,224,69,52,246,154,6,227,61,28,253,42,253,
+    220,251,215,72,153,61,95,97,207,27,236,249,58,221,66,71,
+    44,166,94,124,163,217,112,246,223,48,90,87,171,209,68,235,
+    156,105,167,129,186,33,219,6,15,60,125,69,158,191,152,106,
+    216,233,28,6,120,185,1,195,205,99,99,81,188,230,33,54,
+    249,209,77,242,111,88,105,156,184,18,139,12,134,154,192,177,
+    200,225,231,99,101,246,116,133,61,109,176,167,193,26,110,154,
+    183,248,207,15,49,132,250,11,187,227,234,34,30,170,127,80,
+    159,255,29,203,187,134,26,201,122,138,51,187,178,133,124,94,
+    202,234,188,70,118,152,36,163,39,155,7,245,20,182,126,168,
+    177,95,129,125,174,25,182,247,46,214,102,226,4,174,247,169,
+    66,254,166,100,85,21,213,66,86,2,79,86,173,215,252,106,
+    142,39,199,158,228,68,198,58,164,36,231,52,22,170,250,9,
+    191,50,13,219,103,181,7,145,221,168,115,154,195,219,91,116,
+    124,194,67,232,205,14,185,168,175,241,13,49,29,162,235,37,
+    178,44,104,208,18,62,196,205,235,188,92,48,35,60,57,215,
+    5,212,34,49,131,18,40,35,97,203,152,65,178,127,33,106,
+    117,218,93,183,148,51,25,123,91,211,172,17,27,53,246,142,
+    205,236,182,107,214,4,229,150,164,90,166,48,3,88,168,172,
+    9,42,206,1,76,250,163,211,239,153,49,71,120,30,118,254,
+    234,106,81,183,119,214,248,72,76,189,138,9,189,196,216,23,
+    8,15,180,109,178,64,203,171,210,167,68,170,25,182,222,180,
+    162,213,8,78,42,127,239,222,109,155,177,93,35,190,247,238,
+    109,23,139,134,157,237,28,109,197,5,63,10,118,110,49,7,
+    171,204,193,210,232,163,163,198,200,153,10,115,214,96,206,150,
+    153,179,47,18,131,91,137,241,106,98,188,146,72,25,137,212,
+    86,226,84,53,113,170,146,152,49,18,51,117,68,5,211,4,
+    220,255,96,115,110,83,175,165,222,217,92,120,112,197,96,15,
+    151,217,195,117,111,107,164,198,224,53,139,122,147,15,79,110,
+    37,211,213,100,186,146,60,110,36,143,111,37,207,85,147,231,
+    42,201,243,70,242,124,165,103,206,232,153,171,135,129,242,37,
+    38,127,133,1,108,235,59,235,209,150,112,68,192,183,61,3,
+    123,74,242,209,88,18,141,37,209,150,164,215,12,234,29,252,
+    227,71,95,126,4,47,161,111,18,7,74,11,143,174,126,221,
+    253,63,7,202,137,75,149,196,37,35,113,9,202,217,186,215,
+    158,234,251,107,100,16,55,50,136,27,25,132,70,12,166,175,
+    30,250,187,5,32,54,182,213,193,85,59,184,74,199,136,209,
+    49,130,173,60,81,99,163,91,44,87,101,185,82,79,133,29,
+    55,216,241,50,59,254,109,239,112,201,183,197,157,168,114,39,
+    42,220,73,131,59,185,197,253,188,202,253,188,194,205,25,220,
+    92,165,119,222,232,157,175,163,120,112,226,37,6,247,47,194,
+    48,105,53,54,178,197,30,168,178,7,30,234,95,253,225,47,
+    130,49,124,220,24,158,169,176,179,6,59,91,102,103,223,94,
+    251,34,245,206,179,1,35,53,15,227,124,237,225,148,193,14,
+    193,96,215,218,149,29,157,124,54,107,28,93,216,92,48,216,
+    193,135,191,54,216,97,131,157,104,91,248,2,183,55,90,101,
+    71,107,209,110,35,202,149,98,70,244,144,17,61,246,23,209,
+    72,159,251,250,83,35,61,103,164,127,241,146,246,224,165,28,
+    64,157,0,6,69,123,182,34,35,213,200,72,37,50,106,68,
+    70,183,34,199,170,145,99,149,72,218,136,164,255,251,208,95,
+    199,171,145,153,114,100,166,54,124,232,171,207,64,249,47,216,
+    26,55,250,168,195,224,102,191,8,215,162,93,91,209,177,106,
+    116,172,164,60,191,90,137,206,27,209,249,114,116,30,144,23,
+    118,69,37,58,110,68,199,203,209,113,64,94,140,78,60,90,
+    52,70,103,176,179,24,204,193,218,88,234,209,199,198,216,44,
+    62,105,50,152,145,50,121,172,213,192,125,232,129,67,1,57,
+    244,120,142,118,95,186,136,30,242,71,227,123,186,13,170,153,
+    81,60,243,63,134,121,254,212,217,64,238,184,112,113,50,184,
+    21,215,37,75,51,7,105,38,156,144,144,219,247,192,45,159,
+    157,215,57,46,94,39,129,23,3,144,183,48,119,142,94,80,
+    37,124,253,37,52,174,169,240,221,136,29,100,185,203,147,191,
+    228,26,1,78,46,228,53,117,12,248,182,241,201,211,54,201,
+    23,233,169,91,243,219,56,15,134,152,135,19,31,179,67,23,
+    110,242,10,136,203,103,215,77,86,20,116,193,121,139,90,23,
+    30,154,228,148,248,114,218,178,170,145,116,192,12,235,55,117,
+    141,47,66,164,197,133,102,135,117,69,130,215,28,237,26,8,
+    247,145,53,10,71,103,171,204,12,200,5,162,110,115,9,83,
+    37,76,51,212,114,238,230,90,44,172,5,15,95,151,65,6,
+    226,196,231,150,229,151,7,112,103,114,207,83,205,214,53,231,
+    191,176,148,223,35,156,92,124,155,24,172,197,187,106,125,3,
+    181,254,100,109,104,184,22,239,174,197,122,107,3,131,181,190,
+    33,163,111,162,30,11,246,193,196,7,240,10,3,18,121,186,
+    209,193,49,226,170,248,205,96,134,32,153,221,226,46,84,185,
+    11,21,238,125,131,123,191,81,90,38,143,181,144,247,224,179,
+    220,188,144,147,120,30,114,74,62,87,16,87,21,140,179,60,
+    255,233,170,160,52,106,2,60,47,22,178,184,88,211,5,93,
+    206,90,119,113,214,45,212,33,100,29,8,47,173,230,49,5,
+    173,233,170,73,195,18,164,98,87,35,39,187,102,176,112,27,
+    150,50,48,160,70,142,143,85,236,50,234,187,24,156,198,0,
+    31,235,168,248,180,68,205,219,102,123,98,229,25,150,29,251,
+    109,128,133,105,127,162,176,109,236,191,186,223,235,99,234,8,
+    3,22,249,227,117,79,216,215,91,26,168,35,248,105,130,151,
+    52,84,221,251,152,84,214,39,208,64,178,214,63,128,205,154,
+    76,111,37,79,85,147,167,42,201,25,35,57,83,143,113,190,
+    161,58,2,240,34,222,83,247,225,23,63,234,234,173,7,48,
+    198,32,40,11,98,44,132,186,19,245,14,140,177,24,11,99,
+    172,19,211,69,48,22,69,177,126,75,80,28,133,58,235,93,
+    182,72,23,88,160,144,63,242,249,63,149,33,228,248,222,49,
+    124,239,212,61,148,239,72,233,93,136,209,190,35,77,128,117,
+    78,219,181,160,200,15,102,25,171,248,14,27,190,195,117,207,
+    105,223,207,74,119,235,8,126,190,238,38,63,77,128,57,199,
+    109,162,186,78,133,125,23,169,210,39,216,118,23,169,231,186,
+    245,251,118,104,13,23,30,164,107,169,36,204,172,147,233,194,
+    141,21,152,229,26,185,165,180,124,1,79,58,146,189,89,14,
+    128,189,199,244,66,246,163,89,233,79,231,170,46,43,90,218,
+    246,21,179,135,28,8,107,105,161,241,95,18,60,121,39,142,
+    98,246,57,133,59,46,33,137,51,153,35,78,181,190,86,224,
+    21,252,47,24,187,8,201,221,32,215,148,99,221,116,238,34,
+    35,247,29,145,198,85,185,157,132,90,219,177,102,169,149,8,
+    90,123,222,78,187,212,202,63,173,20,53,218,40,204,229,86,
+    173,22,212,132,227,217,255,130,144,203,219,191,103,206,88,147,
+    240,156,250,39,100,157,222,107,191,6,88,167,41,138,170,191,
+    23,160,60,144,11,253,104,32,142,168,254,50,234,115,63,53,
+    196,149,237,167,134,166,203,173,79,13,157,45,183,62,53,244,
+    203,114,235,83,67,87,202,173,79,13,141,149,91,159,118,37,
+    135,202,173,79,13,29,46,183,62,117,255,21,15,133,93,238,
+    205,63,53,239,193,242,161,185,151,52,121,121,245,22,66,98,
+    242,255,7,180,129,169,16,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/classic/private_l1_shared_l2_cache_hierarchy.py",
+    "gem5.components.cachehierarchies.classic.private_l1_shared_l2_cache_hierarchy",
+    embedded_module_data,
+    3815,
+    9474);
+
+} // anonymous namespace
+} // namespace gem5
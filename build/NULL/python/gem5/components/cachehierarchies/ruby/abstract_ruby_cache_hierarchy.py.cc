@@ -0,0 +1,70 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,84,203,107,212,64,28,158,201,187,219,199,162,22,
+    41,237,193,168,180,118,15,238,158,84,16,21,139,7,123,42,
+    62,122,49,151,49,155,153,117,3,217,100,157,73,138,219,211,
+    30,10,86,240,38,82,143,158,10,210,127,102,43,5,37,32,
+    8,158,122,75,89,15,210,147,51,179,73,201,214,214,236,240,
+    101,38,191,71,190,239,155,201,254,2,165,75,207,239,195,187,
+    28,118,0,6,24,6,160,3,29,8,1,86,176,26,40,29,
+    213,81,33,80,192,99,128,181,45,128,117,162,238,170,0,236,
+    169,69,3,71,195,198,115,80,51,15,53,190,168,193,116,34,
+    218,32,148,250,152,176,67,101,244,228,242,74,147,197,212,245,
+    226,71,174,215,38,171,62,161,46,245,218,61,175,76,163,104,
+    55,124,194,225,45,39,66,128,3,49,112,20,12,29,117,27,
+    180,32,86,182,44,71,83,0,209,137,177,11,57,1,88,148,
+    98,149,152,45,133,147,211,118,249,106,239,164,165,99,109,131,
+    55,208,153,224,228,244,116,190,224,240,44,105,246,198,121,108,
+    126,168,216,252,90,9,2,91,4,111,54,93,70,176,237,137,
+    28,187,157,39,249,132,217,126,216,38,212,143,237,22,141,58,
+    118,220,246,153,237,5,46,99,117,123,253,100,46,27,117,105,
+    180,33,228,243,28,98,179,182,75,121,55,63,108,81,151,19,
+    72,188,56,161,132,71,220,216,118,243,23,138,130,56,242,162,
+    128,217,33,33,184,46,155,120,176,100,142,146,27,52,92,229,
+    240,17,238,128,184,20,29,23,253,185,92,119,78,14,223,89,
+    192,77,129,107,53,37,213,89,210,37,52,181,16,242,67,63,
+    70,136,63,210,24,9,90,233,4,66,82,18,66,76,188,222,
+    238,31,63,101,212,107,116,123,113,59,10,27,175,72,231,86,
+    195,139,58,221,40,36,97,204,26,210,173,146,89,13,202,133,
+    53,220,220,115,36,86,72,230,160,34,169,87,239,246,104,133,
+    119,222,188,126,254,214,212,11,90,139,60,145,93,225,240,167,
+    15,126,88,211,239,204,247,230,55,107,238,171,53,183,111,205,
+    31,88,243,131,98,12,133,190,212,160,132,219,28,142,121,8,
+    11,15,141,209,57,135,220,1,101,109,253,11,247,129,78,138,
+    238,34,193,166,211,162,222,244,153,164,188,121,237,63,212,242,
+    156,101,81,107,114,232,131,159,213,75,219,49,157,17,135,190,
+    34,28,13,221,14,65,40,173,32,212,137,112,18,136,249,20,
+    66,175,19,55,200,35,38,66,56,242,16,146,62,80,193,142,
+    138,207,49,213,154,81,20,208,139,98,58,157,111,131,71,130,
+    128,239,14,164,83,5,215,135,146,43,53,11,16,238,176,100,
+    100,81,241,203,20,85,183,50,32,160,2,245,133,12,156,1,
+    6,48,170,253,23,131,234,226,190,190,116,160,47,101,10,212,
+    103,63,205,138,88,9,142,84,96,220,40,162,167,98,18,164,
+    108,201,99,141,127,109,51,73,236,7,172,94,252,19,72,105,
+    233,220,201,113,56,117,18,164,232,145,144,11,2,100,43,33,
+    238,216,186,55,114,238,1,93,200,183,144,189,228,144,169,16,
+    194,236,54,128,181,1,88,46,143,239,224,254,96,124,100,198,
+    36,228,12,255,133,193,213,59,71,226,254,251,140,152,100,240,
+    23,251,116,77,206,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/abstract_ruby_cache_hierarchy.py",
+    "gem5.components.cachehierarchies.ruby.abstract_ruby_cache_hierarchy",
+    embedded_module_data,
+    725,
+    1318);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,33 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,123,204,128,4,24,161,244,103,54,32,49,157,33,133,
+    33,152,65,147,209,111,37,67,17,19,72,16,36,243,203,185,
+    184,40,89,191,160,178,36,35,63,79,63,61,53,215,84,63,
+    57,63,183,32,63,47,53,175,164,88,63,57,49,57,35,53,
+    35,51,181,40,177,40,25,72,21,235,23,149,38,85,66,68,
+    139,245,227,227,51,243,50,75,226,227,245,10,42,127,113,216,
+    228,230,167,148,230,164,218,21,177,66,109,45,230,7,18,31,
+    152,25,25,25,63,48,192,136,34,102,160,24,0,79,12,41,
+    16,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/__init__.py",
+    "gem5.components.cachehierarchies.ruby.caches",
+    embedded_module_data,
+    129,
+    160);
+
+} // anonymous namespace
+} // namespace gem5
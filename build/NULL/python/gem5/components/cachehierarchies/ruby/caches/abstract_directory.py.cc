@@ -0,0 +1,81 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,84,207,107,27,71,20,158,217,31,210,216,150,34,
+    59,113,43,87,37,209,214,206,193,74,139,116,74,10,165,148,
+    4,55,164,61,84,16,122,219,66,167,235,221,113,173,100,127,
+    200,51,171,180,22,58,152,98,168,10,190,150,248,232,147,161,
+    248,214,191,68,50,6,155,61,25,74,15,185,41,184,133,226,
+    83,223,236,106,149,117,228,210,213,238,155,153,247,222,104,190,
+    247,125,111,247,15,148,185,244,241,120,241,9,152,151,200,65,
+    14,118,145,135,77,140,229,92,113,21,79,53,85,140,20,244,
+    4,57,234,46,114,52,166,30,170,8,29,169,233,31,152,154,
+    163,127,141,106,185,87,114,81,195,209,13,107,93,132,220,178,
+    67,143,133,155,129,3,158,197,207,91,156,217,97,192,183,233,
+    90,224,135,60,112,93,198,237,44,8,37,5,209,4,243,51,
+    192,96,200,196,14,50,21,7,155,42,211,28,101,23,29,66,
+    228,104,178,193,212,251,104,3,3,32,98,230,88,222,209,166,
+    226,164,143,126,196,230,12,0,211,163,133,71,99,68,19,28,
+    92,30,104,227,12,2,117,252,92,60,136,105,232,193,238,103,
+    147,160,131,187,69,200,87,232,196,211,67,87,162,179,8,193,
+    73,74,243,21,78,56,32,244,5,227,162,21,248,48,87,109,
+    87,8,233,55,46,191,18,220,110,180,183,129,22,191,241,61,
+    243,238,55,236,192,107,7,62,243,67,209,176,45,123,147,109,
+    182,24,183,184,13,131,104,240,206,250,118,226,21,141,148,82,
+    234,164,21,212,219,219,81,97,124,200,90,208,241,195,238,157,
+    169,42,235,217,248,10,32,16,85,48,59,232,156,204,245,11,
+    123,133,125,60,36,239,201,201,89,233,230,94,111,223,26,150,
+    170,3,82,189,144,37,217,19,117,179,212,252,14,230,87,252,
+    18,133,25,226,174,210,126,144,165,244,63,114,48,144,119,160,
+    252,127,94,15,209,9,138,158,2,43,237,77,228,64,71,215,
+    92,61,124,8,231,31,77,48,64,7,99,41,203,37,54,154,
+    181,92,164,139,78,155,113,208,134,182,252,86,72,41,47,64,
+    78,148,31,147,20,205,211,152,108,234,182,124,70,69,171,203,
+    162,162,29,248,62,80,249,180,195,58,76,212,180,72,19,204,
+    221,136,242,62,11,127,8,248,243,168,244,246,134,25,74,109,
+    215,18,130,82,33,193,26,134,177,195,231,96,194,23,192,116,
+    43,211,2,165,80,86,165,56,178,247,255,217,65,127,146,226,
+    47,249,189,252,41,89,58,38,75,67,82,57,33,149,1,169,
+    156,149,223,63,45,175,30,151,87,135,229,123,39,229,123,125,
+    13,100,51,26,125,237,132,220,62,35,133,83,82,57,38,149,
+    253,143,135,100,229,132,172,12,210,155,23,165,150,89,174,113,
+    170,229,60,146,109,30,102,66,63,225,26,238,214,215,146,146,
+    13,203,117,141,96,195,8,55,153,177,21,151,111,108,4,28,
+    150,45,97,216,147,119,184,14,237,125,171,25,132,95,122,109,
+    151,121,208,198,204,121,204,121,192,107,10,127,71,150,253,174,
+    44,75,137,153,72,120,88,148,60,84,167,121,184,66,116,67,
+    238,130,55,10,58,245,239,28,42,45,15,200,7,113,33,181,
+    89,169,157,111,121,140,210,104,150,82,47,112,58,174,156,23,
+    40,221,234,88,110,18,225,51,82,213,185,88,135,228,11,20,
+    235,28,75,192,213,20,68,84,28,75,101,51,215,165,180,134,
+    249,146,60,85,210,243,48,129,154,75,141,33,3,91,137,54,
+    233,239,172,52,191,243,197,185,62,63,82,20,221,24,33,48,
+    175,85,148,91,216,253,38,113,16,93,191,59,66,215,152,27,
+    40,183,40,83,150,229,158,101,185,103,113,247,219,55,142,183,
+    76,92,117,140,161,9,95,49,213,90,183,227,2,162,89,239,
+    126,61,88,127,6,132,9,174,165,41,191,161,36,93,130,191,
+    36,159,38,228,124,198,87,198,162,139,239,192,140,84,140,241,
+    232,1,194,213,1,186,147,189,207,209,135,131,171,247,40,119,
+    19,3,138,105,51,88,250,232,181,28,255,186,38,22,35,248,
+    23,189,203,127,96,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/abstract_directory.py",
+    "gem5.components.cachehierarchies.ruby.caches.abstract_directory",
+    embedded_module_data,
+    901,
+    1630);
+
+} // anonymous namespace
+} // namespace gem5
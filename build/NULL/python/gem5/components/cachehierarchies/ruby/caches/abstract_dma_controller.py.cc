@@ -0,0 +1,80 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,84,205,107,27,71,20,159,217,15,105,108,75,145,
+    211,56,40,85,72,188,145,91,176,114,144,78,73,32,148,210,
+    224,150,54,135,8,218,222,54,144,97,189,59,174,149,238,135,
+    60,179,106,107,161,131,41,134,170,224,107,137,143,62,25,138,
+    111,253,75,36,99,176,89,8,24,114,202,77,193,45,148,156,
+    242,102,87,43,175,99,133,172,70,111,62,222,155,125,191,247,
+    251,205,206,43,148,121,244,113,127,246,16,204,11,228,32,7,
+    187,200,195,38,198,114,172,184,138,167,154,42,70,10,250,22,
+    57,234,54,114,52,166,238,171,8,29,168,233,11,76,205,209,
+    127,68,181,220,107,57,169,225,232,138,181,42,66,110,217,161,
+    199,194,245,192,145,43,95,63,121,68,87,2,63,228,129,235,
+    50,110,103,211,43,105,250,38,152,63,0,0,67,38,118,144,
+    169,56,216,84,153,230,40,219,104,31,60,7,147,13,166,222,
+    71,107,24,160,16,51,199,242,142,118,201,79,250,232,55,108,
+    206,0,36,61,186,254,104,140,5,16,156,3,224,50,169,141,
+    51,40,212,241,255,236,126,76,66,15,222,240,124,226,116,112,
+    183,8,241,10,157,172,244,208,5,239,44,66,144,77,105,190,
+    198,9,3,132,254,194,184,104,5,62,140,85,219,21,66,174,
+    27,111,127,16,220,110,180,55,129,20,191,241,19,243,238,53,
+    236,192,107,7,62,243,67,209,176,45,123,157,173,183,24,183,
+    184,13,157,104,240,206,234,102,178,42,26,41,161,212,241,44,
+    106,79,202,168,183,55,163,194,56,211,74,208,241,195,110,117,
+    106,185,245,108,204,18,64,17,139,96,182,208,41,153,235,23,
+    118,10,187,120,72,62,149,131,147,210,39,59,189,93,107,88,
+    90,28,144,197,51,89,155,61,17,57,203,209,63,96,254,194,
+    47,80,152,97,240,162,6,123,89,110,63,16,131,129,197,61,
+    229,227,113,61,68,39,40,122,10,204,180,115,207,158,142,166,
+    60,61,188,15,249,15,38,24,228,65,6,125,112,179,150,139,
+    116,209,105,51,14,10,209,150,223,10,41,229,5,8,136,242,
+    99,134,162,121,26,83,78,221,150,207,168,104,117,89,84,4,
+    190,125,102,135,223,119,88,135,137,154,22,105,130,185,107,81,
+    222,103,225,175,1,255,57,42,189,191,97,134,82,219,181,132,
+    160,84,72,164,134,97,108,241,57,24,240,121,48,221,219,211,
+    21,74,225,44,75,117,228,151,240,255,22,122,73,138,127,230,
+    119,242,199,228,198,33,185,49,36,149,35,82,25,144,202,73,
+    249,230,113,121,249,176,188,60,44,223,61,42,223,237,107,160,
+    155,209,232,107,71,228,214,9,41,28,147,202,33,169,236,62,
+    24,146,165,35,178,52,72,27,47,74,49,179,100,227,84,76,
+    137,10,164,204,184,126,199,53,220,173,175,36,101,27,150,235,
+    26,193,154,17,174,51,99,35,166,192,88,11,56,76,91,194,
+    200,156,68,56,232,215,154,65,248,216,107,187,204,131,3,205,
+    156,111,56,15,120,77,225,11,178,244,235,178,44,37,102,35,
+    225,226,154,228,98,105,58,23,23,8,175,203,157,240,125,193,
+    113,253,47,135,74,213,1,185,19,23,83,155,149,26,250,150,
+    199,40,141,102,41,245,2,167,227,202,113,129,210,141,142,229,
+    38,30,62,35,213,157,139,245,72,110,163,88,239,88,10,174,
+    166,64,162,226,88,50,155,185,46,165,53,204,203,50,171,164,
+    232,171,4,110,46,53,134,116,108,36,250,164,191,147,210,252,
+    214,119,167,250,252,72,81,116,99,132,192,188,81,81,238,234,
+    246,211,100,129,104,250,103,35,52,197,20,80,110,65,134,84,
+    229,158,170,220,179,176,253,236,124,225,61,19,87,29,99,104,
+    194,189,166,90,171,118,92,64,52,235,221,171,7,171,207,129,
+    48,193,181,52,228,111,148,132,75,240,111,201,23,9,57,95,
+    242,234,88,120,33,111,178,145,138,49,30,221,71,120,113,128,
+    110,103,219,41,250,124,112,177,141,114,87,49,160,184,108,118,
+    155,111,100,247,239,20,87,12,224,29,74,120,129,254,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/abstract_dma_controller.py",
+    "gem5.components.cachehierarchies.ruby.caches.abstract_dma_controller",
+    embedded_module_data,
+    894,
+    1641);
+
+} // anonymous namespace
+} // namespace gem5
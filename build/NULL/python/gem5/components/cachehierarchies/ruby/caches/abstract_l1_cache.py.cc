@@ -0,0 +1,104 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,85,205,107,27,71,20,159,217,93,73,99,73,142,
+    20,217,216,142,157,52,235,164,45,86,74,45,84,98,167,135,
+    126,56,113,67,18,8,166,37,233,101,11,93,214,187,227,88,
+    206,126,40,51,171,36,22,42,152,96,168,2,57,244,208,16,
+    223,154,147,161,248,82,250,151,172,140,192,98,33,96,40,61,
+    248,166,144,22,138,79,157,217,149,54,43,197,165,218,209,219,
+    153,247,102,246,189,247,251,189,183,251,7,136,253,18,189,251,
+    155,53,38,94,0,3,24,208,4,10,191,11,38,180,4,69,
+    128,124,46,154,162,37,41,18,155,75,70,194,76,88,73,37,
+    201,230,73,35,101,166,44,164,160,96,142,204,17,43,173,164,
+    33,16,192,13,96,140,108,3,35,141,165,93,17,128,61,177,
+    239,76,201,24,240,14,40,102,142,248,98,165,8,253,83,218,
+    42,117,137,166,187,22,118,215,29,131,105,10,183,203,203,154,
+    190,142,213,101,199,118,137,99,154,152,28,241,24,153,73,188,
+    117,231,234,145,20,206,179,87,123,7,151,29,130,217,26,45,
+    127,253,237,221,205,42,166,122,60,57,161,159,220,93,38,126,
+    100,233,97,160,64,3,40,130,1,21,17,75,134,176,13,118,
+    153,101,47,58,160,36,154,96,13,26,226,54,82,146,134,180,
+    13,148,20,70,70,226,157,93,35,77,240,24,42,105,150,74,
+    210,207,245,35,233,5,78,184,83,29,198,162,16,123,255,55,
+    139,1,196,13,118,118,35,50,26,176,62,202,246,11,106,164,
+    105,128,1,107,26,0,230,71,88,57,130,97,230,72,125,136,
+    9,173,56,54,71,68,55,41,229,122,249,248,54,37,122,169,
+    186,201,80,180,75,247,176,181,80,210,29,171,234,216,216,118,
+    105,73,231,113,173,87,48,209,136,206,110,180,68,106,171,155,
+    161,150,150,250,12,168,102,89,13,84,243,213,77,63,219,243,
+    177,236,212,108,183,126,118,40,197,249,184,117,142,185,167,231,
+    153,216,2,135,40,211,204,62,203,238,192,22,58,195,39,157,
+    92,225,89,99,71,107,229,206,123,232,252,27,158,143,30,149,
+    66,28,151,223,153,120,14,95,0,55,134,218,32,226,47,227,
+    120,254,199,30,200,144,123,41,252,255,190,6,80,163,40,26,
+    2,91,73,111,45,47,19,224,132,95,3,238,50,255,123,81,
+    12,172,220,121,25,11,199,80,94,97,21,144,160,181,42,38,
+    140,24,181,98,87,92,85,37,167,217,30,63,213,3,201,207,
+    135,176,170,102,197,198,42,173,212,177,63,170,59,182,141,117,
+    247,155,26,174,97,90,148,124,137,98,115,205,79,217,216,125,
+    228,144,251,126,110,248,192,136,170,234,166,70,169,170,82,30,
+    172,44,203,91,36,207,38,100,130,137,250,212,48,61,253,64,
+    74,156,154,21,38,254,217,2,127,162,209,167,169,103,169,3,
+    52,181,143,166,90,104,186,141,166,61,52,125,56,57,115,48,
+    57,183,63,57,215,154,188,212,158,188,212,148,24,105,114,169,
+    41,181,209,185,14,202,30,160,233,125,52,189,115,165,133,46,
+    182,209,69,175,63,72,1,12,85,120,178,207,228,14,224,21,
+    30,231,209,141,49,190,17,177,195,106,60,210,27,112,151,233,
+    247,34,219,32,214,63,64,3,54,96,29,13,158,217,136,56,
+    187,31,232,72,206,205,188,245,99,8,131,207,120,194,158,192,
+    248,18,87,142,184,147,250,108,128,146,204,225,149,57,188,178,
+    237,184,178,38,87,157,71,152,200,206,154,252,201,44,35,85,
+    172,216,174,47,89,154,187,238,139,166,115,143,76,113,78,19,
+    15,53,179,198,232,184,254,88,199,85,151,247,160,64,166,185,
+    65,90,173,184,148,10,1,55,1,51,126,254,30,118,175,153,
+    142,126,255,14,243,112,141,89,235,242,48,77,195,59,174,112,
+    186,110,0,222,73,175,114,133,231,151,127,254,116,231,171,246,
+    217,242,111,229,214,216,66,123,108,161,149,91,108,231,22,155,
+    82,39,147,109,26,79,175,252,100,180,39,62,106,79,148,247,
+    51,101,47,83,126,85,152,241,206,126,217,42,44,181,11,75,
+    94,118,169,147,27,107,102,66,158,226,29,1,251,60,229,67,
+    158,98,166,39,176,8,235,243,203,97,97,202,154,105,114,36,
+    92,6,211,131,160,72,229,53,135,176,101,133,202,122,244,94,
+    158,103,111,160,177,21,199,189,101,85,77,108,177,55,13,54,
+    174,19,226,144,30,40,100,134,231,19,195,132,156,225,232,159,
+    27,134,97,160,25,62,231,103,210,1,6,127,39,65,238,130,
+    135,102,131,52,138,25,222,95,182,102,97,85,245,211,170,106,
+    57,70,205,228,243,172,170,62,168,105,102,104,33,167,56,244,
+    153,160,87,194,47,74,208,139,65,155,144,15,185,16,251,113,
+    248,163,189,158,210,177,105,170,106,17,146,115,220,53,71,104,
+    41,140,54,211,23,31,112,195,22,8,218,168,127,117,114,249,
+    173,155,135,137,124,87,16,18,114,23,48,241,90,4,201,211,
+    219,223,133,138,108,50,241,126,23,156,32,242,82,98,188,11,
+    34,145,5,201,113,126,226,2,127,196,5,254,136,241,237,239,
+    223,42,134,68,128,68,16,82,49,75,102,121,18,162,182,170,
+    7,57,249,105,107,97,222,89,221,96,64,82,34,5,37,89,
+    161,26,37,188,51,253,169,42,113,116,76,169,67,232,124,244,
+    186,215,217,135,147,32,110,30,143,153,245,106,77,117,249,119,
+    148,140,244,125,253,10,66,191,28,148,99,244,89,136,252,23,
+    228,114,175,158,232,47,76,116,69,8,97,119,17,192,236,86,
+    134,95,29,240,158,55,56,14,65,209,27,28,135,224,140,55,
+    56,58,96,193,27,28,29,240,177,55,56,186,201,25,200,208,
+    120,87,120,19,115,175,249,253,175,19,108,65,2,255,2,187,
+    115,32,25,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/abstract_l1_cache.py",
+    "gem5.components.cachehierarchies.ruby.caches.abstract_l1_cache",
+    embedded_module_data,
+    1267,
+    2295);
+
+} // anonymous namespace
+} // namespace gem5
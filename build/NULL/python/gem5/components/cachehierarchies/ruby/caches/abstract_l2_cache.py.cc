@@ -0,0 +1,80 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,84,207,107,27,71,20,158,217,31,210,216,150,34,
+    215,113,34,87,109,226,173,221,131,55,7,9,2,73,160,148,
+    210,98,74,91,8,130,210,219,22,50,89,239,142,107,165,251,
+    67,158,89,181,181,208,193,20,67,84,240,181,196,71,159,12,
+    197,183,254,37,146,49,216,44,20,12,61,229,166,224,22,74,
+    78,125,179,171,85,214,138,75,87,187,111,102,222,123,163,247,
+    189,239,155,221,63,81,238,210,199,227,229,71,96,94,32,23,
+    185,216,67,62,182,48,150,115,197,83,124,213,82,49,82,208,
+    23,200,85,247,144,171,49,245,72,69,232,88,205,254,192,210,
+    92,253,27,100,22,94,202,133,137,227,27,246,134,136,184,237,
+    68,62,139,182,66,23,60,11,143,239,175,219,206,22,163,235,
+    97,16,241,208,243,24,119,242,16,148,12,66,19,204,115,0,
+    193,144,133,93,100,41,46,182,84,166,185,202,30,58,130,200,
+    241,100,131,165,247,209,38,6,56,196,42,176,162,171,189,21,
+    39,125,244,19,182,102,0,150,30,87,62,27,227,25,163,224,
+    178,156,131,115,245,213,241,115,249,48,161,160,7,123,159,77,
+    130,46,238,150,33,95,161,19,79,15,93,137,206,34,4,117,
+    148,230,75,156,246,79,232,15,140,139,86,24,192,92,117,60,
+    33,164,223,120,253,88,112,167,209,222,1,74,130,198,119,204,
+    127,208,112,66,191,29,6,44,136,68,195,145,184,182,90,140,
+    219,220,129,65,52,120,103,99,39,245,138,70,70,39,245,238,
+    211,196,85,111,239,196,165,113,141,245,176,19,68,221,247,167,
+    90,172,231,163,171,80,94,44,131,217,69,23,100,174,95,218,
+    47,29,224,33,121,87,78,206,43,11,251,189,3,123,88,89,
+    30,144,229,75,217,143,51,145,53,207,203,239,96,126,197,47,
+    80,148,99,237,42,227,135,121,62,255,35,7,3,115,135,202,
+    255,231,245,16,157,160,232,41,176,210,222,68,14,117,116,205,
+    213,195,71,80,255,120,130,65,30,93,208,4,55,205,66,172,
+    139,78,155,113,80,133,182,130,86,68,41,47,65,66,92,28,
+    51,20,207,167,156,82,175,21,48,42,90,93,22,151,157,48,
+    8,152,19,125,221,97,29,38,76,45,214,4,243,54,227,98,
+    192,162,31,67,254,125,92,153,222,48,67,169,227,217,66,80,
+    42,36,82,195,48,118,249,28,76,248,60,152,238,210,180,54,
+    25,144,53,169,139,60,241,255,236,162,63,72,249,151,226,126,
+    241,140,44,157,144,165,33,169,157,146,218,128,212,46,170,239,
+    157,85,215,78,170,107,195,234,189,211,234,189,190,6,138,25,
+    141,190,118,74,238,156,147,210,25,169,157,144,218,193,163,33,
+    89,61,37,171,131,236,230,101,41,99,158,102,156,201,40,241,
+    128,136,185,208,207,216,196,221,250,122,218,176,97,123,158,17,
+    110,26,209,22,51,182,147,230,141,205,144,195,178,37,12,103,
+    242,230,214,225,88,223,108,134,209,87,126,219,99,62,28,95,
+    230,126,206,121,200,77,133,47,202,166,111,201,182,148,132,135,
+    148,133,155,146,133,59,211,44,92,33,185,33,247,192,123,4,
+    71,244,239,2,170,172,12,200,7,73,27,230,172,212,45,176,
+    125,70,105,60,75,169,31,186,29,79,206,75,148,110,119,108,
+    47,141,240,25,169,232,92,162,65,250,205,73,52,78,232,231,
+    106,6,33,46,143,101,114,152,231,81,106,98,94,149,85,37,
+    57,159,166,64,11,153,49,100,96,59,85,38,251,157,87,230,
+    119,191,188,208,231,71,138,162,27,35,4,230,149,138,10,239,
+    236,125,155,58,136,174,127,56,66,215,152,27,168,176,40,83,
+    86,228,158,21,185,103,113,239,201,27,199,148,73,186,78,48,
+    52,225,203,165,218,27,78,210,64,60,235,63,168,135,27,207,
+    128,48,193,181,44,229,55,148,166,75,240,175,201,199,41,57,
+    159,240,149,177,228,226,41,152,145,138,49,30,61,68,120,121,
+    128,238,230,239,11,100,14,174,222,163,194,2,6,20,111,155,
+    193,237,181,87,114,252,235,154,88,130,224,95,73,162,118,75,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/abstract_l2_cache.py",
+    "gem5.components.cachehierarchies.ruby.caches.abstract_l2_cache",
+    embedded_module_data,
+    896,
+    1616);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,86 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,84,205,107,27,71,20,159,217,47,173,92,219,74,
+    156,131,173,226,226,143,90,80,217,70,11,162,238,165,165,180,
+    161,164,80,72,66,155,246,208,189,12,235,221,177,189,238,126,
+    40,51,171,180,54,130,248,96,168,11,57,244,82,18,131,15,
+    41,20,67,112,255,24,185,8,42,22,4,133,210,131,111,10,
+    238,161,228,212,55,187,218,149,212,230,107,118,249,205,155,247,
+    102,126,111,222,188,55,243,39,26,105,234,160,191,252,12,224,
+    33,114,144,131,61,228,99,19,251,146,41,97,228,72,142,236,
+    201,190,98,42,32,43,142,234,169,190,102,106,24,73,232,83,
+    228,104,135,200,41,80,237,84,70,232,76,206,8,205,130,163,
+    223,65,213,226,133,24,84,165,120,234,38,229,220,218,166,215,
+    155,91,91,148,197,215,190,104,110,238,125,226,50,106,71,33,
+    219,187,73,125,192,11,77,76,197,113,49,188,71,25,115,29,
+    202,47,164,84,115,245,227,77,30,49,203,142,242,21,246,232,
+    230,51,167,151,55,0,190,135,237,83,100,98,7,153,210,17,
+    218,194,14,62,212,77,89,66,84,161,234,41,134,45,226,108,
+    153,35,29,162,83,232,207,114,34,83,59,66,223,97,179,0,
+    27,151,227,226,208,153,58,226,76,25,56,188,252,17,224,39,
+    252,16,69,120,104,28,167,123,60,98,25,182,22,110,73,167,
+    16,216,153,148,105,48,106,201,219,184,133,72,174,137,10,47,
+    226,132,89,74,46,43,48,202,247,230,160,59,232,9,190,85,
+    213,98,149,55,27,112,198,58,33,110,224,70,132,196,111,88,
+    142,195,8,179,130,109,202,153,88,30,23,157,44,184,184,228,
+    39,167,79,194,102,68,26,33,139,128,64,225,212,219,138,11,
+    1,141,190,13,217,55,113,201,182,236,29,74,60,55,160,132,
+    187,251,52,46,194,146,148,46,86,196,146,184,72,136,237,89,
+    156,19,194,69,18,23,69,59,120,246,21,103,182,209,216,139,
+    118,194,192,216,166,254,134,97,135,126,35,12,104,16,113,35,
+    161,220,113,41,179,152,13,29,55,24,20,68,170,229,134,79,
+    185,75,162,29,70,193,41,189,71,61,35,223,109,173,177,199,
+    166,193,195,254,76,158,157,90,22,102,5,244,252,58,192,63,
+    7,168,167,79,253,80,120,80,248,93,159,251,77,159,123,52,
+    251,216,56,215,235,29,189,222,214,235,221,249,202,163,247,143,
+    148,142,62,215,43,175,159,151,107,157,114,237,72,121,48,253,
+    199,194,219,66,57,223,78,254,75,113,160,118,158,14,104,82,
+    150,246,85,44,46,200,139,147,14,41,201,109,45,188,43,13,
+    245,187,185,158,228,215,228,165,60,195,68,143,243,228,250,215,
+    228,201,75,4,120,228,161,126,55,215,143,20,222,203,120,180,
+    215,154,149,151,174,40,72,54,9,66,85,103,194,109,60,201,
+    232,221,38,229,209,151,33,36,47,214,179,130,139,11,110,144,
+    10,83,140,114,40,16,78,211,25,165,108,120,131,133,254,64,
+    49,32,72,95,140,120,102,116,70,170,171,74,108,6,156,177,
+    107,0,92,196,181,184,200,230,132,247,41,59,12,2,40,153,
+    207,155,20,56,246,103,135,5,52,102,88,23,235,124,128,3,
+    244,215,124,245,248,246,201,109,81,23,229,238,202,90,103,229,
+    221,68,236,232,75,189,183,86,143,201,9,17,195,55,187,149,
+    245,78,101,35,17,59,250,114,111,97,253,248,254,201,253,164,
+    150,186,239,24,191,150,18,169,163,87,70,13,189,101,227,103,
+    227,23,67,200,11,237,228,103,229,228,156,196,157,13,44,159,
+    194,157,157,32,196,15,157,166,39,228,73,66,238,54,45,47,
+    181,36,245,207,68,46,152,46,96,57,9,110,112,1,109,234,
+    121,132,84,49,155,21,97,136,52,125,148,68,207,38,50,88,
+    17,6,130,146,91,146,125,125,73,85,87,250,232,57,48,141,
+    180,210,193,215,237,210,226,185,186,212,81,151,250,146,174,214,
+    251,8,224,169,140,180,229,49,205,127,32,137,40,241,120,11,
+    226,154,240,55,106,225,230,46,156,50,79,106,33,125,133,166,
+    155,145,235,241,90,246,222,39,65,197,51,214,224,177,39,249,
+    173,79,3,21,92,79,80,202,43,98,122,166,127,144,158,208,
+    135,108,13,137,87,20,2,59,2,232,203,24,227,254,123,50,
+    150,250,232,213,48,129,240,90,27,173,142,254,93,84,111,143,
+    255,125,237,42,134,176,254,15,237,43,75,79,69,255,247,115,
+    108,201,78,255,5,65,91,184,92,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/mesi_three_level/directory.py",
+    "gem5.components.cachehierarchies.ruby.caches.mesi_three_level.directory",
+    embedded_module_data,
+    985,
+    1894);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,90 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,85,205,107,27,71,20,159,217,93,73,43,217,178,
+    220,84,73,101,59,84,162,137,43,182,14,210,33,118,10,166,
+    132,126,132,182,151,40,132,250,180,57,12,155,221,177,45,117,
+    63,148,153,221,180,50,58,248,96,168,11,62,244,82,226,64,
+    14,57,20,67,113,14,165,127,65,255,4,201,8,44,22,12,
+    129,158,124,147,113,14,37,167,206,236,74,171,85,226,166,210,
+    234,237,219,247,230,205,251,248,253,102,245,55,136,125,18,195,
+    251,249,109,38,158,0,3,24,208,4,22,84,161,37,168,2,
+    4,134,96,136,166,104,73,170,4,129,0,190,1,134,180,3,
+    140,4,134,7,34,0,135,226,104,19,53,97,36,191,3,74,
+    234,148,63,40,130,63,115,231,238,23,232,43,199,118,137,99,
+    154,152,248,217,187,152,82,109,3,127,233,173,175,99,114,154,
+    228,171,160,159,118,30,99,66,234,6,166,122,188,34,33,94,
+    209,79,172,38,12,84,104,0,85,48,160,42,98,201,16,118,
+    192,1,243,28,130,113,246,93,176,14,13,113,71,86,147,188,
+    62,53,181,11,126,132,170,204,42,74,248,89,86,202,184,18,
+    194,55,215,97,44,155,56,252,157,223,10,250,111,179,200,70,
+    228,52,224,86,150,173,23,80,100,105,131,9,111,6,0,150,
+    69,168,157,194,176,37,25,177,150,104,221,177,153,46,234,38,
+    165,220,94,122,173,82,162,87,155,45,119,211,177,171,27,216,
+    90,169,234,142,213,116,108,108,187,180,170,107,250,38,222,172,
+    99,162,17,157,221,104,149,120,15,91,161,149,86,45,76,235,
+    200,221,36,24,35,19,63,198,102,213,176,52,164,71,237,84,
+    154,45,127,26,109,96,119,148,118,107,126,162,221,74,220,247,
+    49,43,133,22,153,216,6,47,229,169,221,233,189,233,125,216,
+    149,231,184,210,207,93,218,107,239,107,221,92,177,35,23,207,
+    121,111,122,132,237,144,35,193,140,254,100,226,87,248,4,184,
+    177,9,78,98,241,60,62,219,216,212,158,11,23,217,39,99,
+    219,176,45,188,120,131,89,144,199,138,23,197,50,36,164,145,
+    222,24,177,24,28,176,252,135,81,13,140,191,33,62,138,232,
+    167,134,99,240,179,124,134,20,63,242,176,173,51,110,78,241,
+    121,35,218,162,46,182,148,164,159,160,94,147,89,101,132,234,
+    118,221,69,136,204,176,125,252,44,155,185,141,117,247,190,135,
+    61,76,201,251,220,150,178,177,251,131,67,190,87,36,95,162,
+    216,92,39,151,152,53,116,165,17,210,77,141,82,132,40,175,
+    177,84,42,109,147,44,247,94,102,98,235,202,27,24,13,51,
+    45,113,124,30,48,241,207,54,56,145,179,63,167,246,82,199,
+    114,225,72,46,244,243,133,227,252,226,81,126,177,155,47,247,
+    242,229,254,124,185,95,184,54,72,129,244,220,25,144,210,153,
+    87,92,12,2,145,1,233,236,177,60,127,36,207,239,47,247,
+    22,150,122,11,55,187,242,114,79,94,238,140,46,146,227,216,
+    198,177,136,248,255,23,224,252,255,111,100,219,0,69,190,248,
+    42,3,190,16,38,167,206,86,70,25,218,176,33,142,237,141,
+    200,142,34,236,222,153,49,194,149,237,35,141,237,99,188,81,
+    180,123,128,180,88,91,99,39,47,229,16,3,19,108,40,73,
+    194,131,252,25,75,179,13,205,117,72,43,192,207,207,17,76,
+    217,241,163,248,107,226,88,119,234,12,109,199,115,81,211,33,
+    174,159,170,219,161,50,77,56,67,168,187,230,176,5,138,64,
+    10,28,190,15,56,68,66,128,104,136,231,21,142,231,194,36,
+    158,19,84,185,201,35,106,128,31,186,147,15,151,158,58,207,
+    156,93,169,39,47,156,20,111,252,177,214,41,174,118,139,171,
+    189,226,42,55,93,237,151,43,189,242,167,129,218,147,175,159,
+    92,85,158,222,123,118,143,63,206,245,23,111,252,134,2,173,
+    39,127,212,9,174,0,71,37,205,105,106,107,22,70,200,207,
+    32,100,57,134,103,114,125,26,161,71,158,102,134,30,50,197,
+    71,48,21,240,209,194,236,21,100,4,148,14,168,24,212,239,
+    103,135,108,213,177,105,34,164,64,50,199,139,230,176,124,30,
+    118,41,143,196,53,238,192,32,160,232,232,219,207,205,110,127,
+    251,50,49,59,16,132,68,105,0,152,56,19,65,242,189,157,
+    7,161,65,78,38,86,6,224,2,49,155,224,218,187,68,208,
+    100,144,183,198,14,102,198,90,169,56,15,27,108,178,148,112,
+    208,135,208,122,110,221,164,149,209,63,9,73,142,66,126,7,
+    97,56,111,224,181,252,89,56,155,219,68,1,252,173,192,186,
+    240,152,24,136,16,194,193,45,17,10,3,240,255,34,3,224,
+    82,7,124,18,191,6,201,203,144,213,250,182,248,165,118,198,
+    111,175,46,112,5,101,253,11,123,78,178,141,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/mesi_three_level/dma_controller.py",
+    "gem5.components.cachehierarchies.ruby.caches.mesi_three_level.dma_controller",
+    embedded_module_data,
+    1052,
+    1923);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,138 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,173,22,77,111,27,199,117,246,139,92,146,75,82,166,
+    36,75,38,25,137,182,149,198,100,17,209,10,42,43,41,138,
+    34,145,82,183,1,84,199,177,221,11,131,98,176,218,29,89,
+    107,239,7,51,187,180,45,129,5,132,66,64,21,192,199,24,
+    145,1,31,124,18,26,40,7,255,144,30,72,129,128,136,1,
+    4,24,232,73,55,26,142,129,34,167,206,204,138,43,50,182,
+    12,23,168,184,122,51,239,205,155,55,243,190,231,223,96,224,
+    79,57,30,95,222,161,224,123,96,2,83,176,65,141,141,162,
+    45,56,98,77,116,164,154,228,200,53,217,81,106,138,19,171,
+    197,156,120,45,46,0,83,50,101,91,117,18,181,4,159,43,
+    118,242,22,48,99,102,220,78,57,90,77,19,128,8,254,8,
+    76,117,11,152,9,36,239,74,0,236,73,253,3,107,105,83,
+    184,9,202,201,35,134,92,43,199,136,178,124,227,47,55,174,
+    147,212,146,237,25,119,63,247,28,221,114,73,110,249,242,146,
+    110,172,33,184,228,185,1,246,108,27,97,146,254,51,242,125,
+    253,54,90,108,172,174,82,52,113,163,177,178,206,153,72,134,
+    77,175,99,180,138,2,138,226,163,24,149,92,22,136,244,197,
+    205,207,232,32,84,142,148,144,160,125,182,226,7,88,55,130,
+    37,15,35,99,208,10,177,190,21,110,80,240,15,106,7,4,
+    106,130,9,106,162,41,212,36,36,155,226,22,216,165,43,123,
+    209,134,154,98,74,40,102,202,40,110,42,72,93,141,109,131,
+    85,193,140,109,105,181,132,25,223,2,181,36,211,189,150,218,
+    6,15,132,154,70,181,77,144,248,242,28,191,44,22,233,110,
+    67,24,56,91,58,254,127,121,133,123,160,73,247,220,137,22,
+    77,97,35,77,249,69,24,81,154,96,104,53,9,0,149,47,
+    94,59,18,66,29,85,120,15,97,223,242,92,102,0,195,246,
+    125,70,47,253,124,203,199,70,181,190,30,172,121,110,245,54,
+    114,230,171,134,231,212,61,23,185,129,95,53,216,189,214,44,
+    132,117,108,208,193,175,98,106,206,144,234,87,29,228,91,48,
+    88,195,8,65,27,221,67,118,213,158,131,124,105,182,190,78,
+    180,227,179,150,188,134,27,108,140,29,171,56,59,72,189,76,
+    143,247,167,41,216,4,207,213,212,182,246,80,219,17,218,234,
+    57,54,233,102,115,15,155,59,122,59,59,221,82,167,95,50,
+    125,136,108,80,207,144,100,160,227,219,40,128,150,175,147,164,
+    97,223,133,38,143,10,35,57,96,53,181,111,181,11,212,160,
+    143,132,239,65,48,96,211,97,95,61,29,180,246,41,60,2,
+    8,148,147,181,166,208,20,155,224,169,244,250,46,186,22,223,
+    165,242,246,34,153,166,16,36,78,147,250,163,184,75,165,238,
+    69,146,155,0,70,243,161,243,164,166,252,206,231,73,255,211,
+    121,177,104,158,160,88,60,58,253,204,105,50,40,87,36,191,
+    25,123,58,104,243,211,119,164,162,219,81,61,160,118,114,87,
+    138,165,35,76,161,88,102,8,203,158,200,120,58,242,78,39,
+    157,25,216,145,123,211,142,166,50,108,47,90,159,88,134,196,
+    174,221,42,43,68,246,173,13,68,20,221,247,61,131,100,125,
+    26,103,52,202,92,19,61,128,43,86,64,18,150,15,45,30,
+    220,36,135,81,221,214,13,228,208,12,129,117,207,182,140,245,
+    171,71,37,42,238,136,229,111,121,148,40,126,163,78,171,144,
+    10,233,126,43,128,16,51,211,146,17,26,182,139,172,142,221,
+    164,231,44,90,129,143,153,79,73,236,139,80,106,236,115,62,
+    226,115,148,136,89,4,147,100,61,42,91,100,12,163,111,26,
+    22,70,62,244,145,107,66,116,207,50,2,159,100,78,16,154,
+    83,62,25,167,21,204,245,45,142,64,122,5,104,172,27,54,
+    34,89,228,234,43,54,130,125,121,36,203,164,33,63,128,182,
+    30,32,215,88,39,35,84,50,77,121,31,245,41,120,156,221,
+    32,126,156,173,36,109,120,174,139,140,224,171,6,162,251,202,
+    41,106,44,100,175,18,213,158,179,32,55,91,130,205,66,211,
+    81,162,25,17,205,99,98,220,69,193,125,15,223,197,19,76,
+    110,150,171,10,109,203,69,156,19,79,50,165,153,230,36,1,
+    161,97,211,61,16,250,44,112,74,209,223,38,30,99,76,23,
+    41,216,24,233,87,147,190,133,231,41,213,151,169,95,255,179,
+    9,94,77,130,68,230,219,248,195,248,129,58,185,175,78,182,
+    213,124,71,205,183,212,252,171,24,152,40,117,207,156,235,230,
+    10,221,98,233,160,56,183,95,156,123,86,109,23,23,59,197,
+    197,238,217,252,225,244,204,227,251,79,238,247,82,177,137,228,
+    11,64,193,79,12,108,203,15,83,175,50,111,219,88,56,125,
+    99,47,3,10,239,211,73,246,48,127,169,157,175,116,242,21,
+    134,116,167,46,28,76,45,236,79,45,180,167,62,233,76,125,
+    178,45,119,212,66,247,253,15,216,120,161,59,61,195,198,98,
+    119,186,20,142,165,243,108,124,239,249,68,225,96,226,210,254,
+    196,165,246,68,165,51,193,196,104,93,85,59,80,243,251,106,
+    126,103,161,173,94,236,168,23,91,253,15,159,5,172,45,12,
+    196,61,75,116,94,16,191,3,172,141,12,150,195,96,160,176,
+    220,137,246,52,5,83,216,165,216,94,68,25,78,156,191,209,
+    230,215,20,55,104,152,14,202,106,10,195,92,119,185,108,156,
+    13,226,39,60,166,56,204,243,119,42,135,166,160,116,13,159,
+    103,158,157,225,126,45,177,200,40,177,200,40,89,126,201,245,
+    130,146,94,170,123,247,17,46,121,171,165,143,206,151,101,34,
+    89,110,64,100,71,15,214,136,100,123,183,73,226,15,15,12,
+    84,103,129,95,150,48,235,43,152,117,76,34,211,212,245,125,
+    41,12,164,48,128,102,216,49,147,253,0,250,101,78,254,149,
+    5,210,85,192,90,210,97,54,247,232,55,223,125,188,243,229,
+    63,191,106,143,86,59,163,213,118,246,114,39,123,121,91,238,
+    166,180,109,243,219,133,71,198,78,181,125,182,210,57,91,217,
+    79,85,90,169,202,97,174,208,42,46,182,115,75,157,220,82,
+    75,91,234,102,71,183,83,175,187,34,234,232,255,122,205,21,
+    175,213,179,104,237,173,92,226,59,113,73,111,226,50,133,31,
+    127,225,14,202,41,191,51,103,212,75,120,21,149,104,21,21,
+    72,220,195,38,194,200,44,199,48,139,58,146,238,23,29,94,
+    58,72,198,209,93,83,15,60,188,30,226,105,143,59,77,183,
+    67,52,185,194,31,112,183,188,229,57,162,133,243,171,216,115,
+    150,231,202,98,232,85,158,232,34,247,103,232,206,42,115,231,
+    120,223,157,67,101,138,189,226,252,155,161,47,223,171,60,134,
+    79,32,203,165,252,225,212,175,31,123,79,60,158,119,131,244,
+    87,26,40,92,122,38,183,242,243,237,252,124,39,63,207,19,
+    183,88,126,54,211,42,46,180,139,11,157,226,2,99,59,215,
+    226,31,119,108,57,205,106,188,171,59,8,66,146,132,208,241,
+    204,134,205,230,26,132,223,52,116,59,92,193,172,21,145,20,
+    175,106,14,162,175,44,147,23,87,204,122,31,102,45,20,51,
+    139,243,194,198,131,147,171,68,210,199,117,208,64,182,13,97,
+    89,192,11,76,27,102,253,79,67,197,179,125,240,33,91,216,
+    1,188,246,245,127,221,236,200,230,159,158,43,35,61,81,84,
+    74,61,64,193,11,9,196,206,108,125,29,18,212,95,41,51,
+    180,56,101,11,189,44,155,229,192,248,100,111,148,205,198,192,
+    120,169,55,206,102,224,52,112,93,144,149,177,30,136,128,150,
+    84,62,238,129,183,1,110,43,126,213,114,6,255,150,41,151,
+    116,230,103,189,149,59,212,83,97,19,12,45,192,194,137,7,
+    13,239,151,97,15,148,233,59,207,231,86,34,153,70,96,217,
+    254,172,71,123,18,182,76,68,38,235,216,51,232,179,223,195,
+    254,172,126,252,120,135,236,141,24,90,150,157,247,3,8,207,
+    102,6,251,89,253,93,232,159,223,227,47,1,107,253,212,106,
+    109,10,122,146,32,8,189,43,64,208,54,83,236,215,147,227,
+    130,216,3,255,63,144,3,66,161,5,242,131,95,23,92,104,
+    245,191,46,184,210,26,254,122,201,79,5,129,154,238,205,176,
+    149,41,189,224,147,159,78,97,224,42,255,23,97,37,44,43,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/mesi_three_level/l1_cache.py",
+    "gem5.components.cachehierarchies.ruby.caches.mesi_three_level.l1_cache",
+    embedded_module_data,
+    1824,
+    3528);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,143 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,165,87,77,108,27,199,21,158,253,35,151,63,18,101,
+    234,215,148,98,209,178,164,136,138,43,218,142,237,244,80,212,
+    142,212,186,63,112,229,56,246,137,57,12,86,187,35,107,229,
+    229,174,50,187,76,44,129,5,132,66,64,21,192,199,24,145,
+    1,31,124,112,132,20,238,161,199,162,199,94,122,37,5,22,
+    38,6,16,96,160,39,221,104,56,6,130,156,242,102,72,46,
+    201,216,22,12,148,92,190,125,239,205,155,55,243,222,124,243,
+    102,248,63,212,245,209,90,239,151,171,64,190,65,22,178,36,
+    7,21,248,91,118,164,162,92,144,139,74,65,41,170,5,181,
+    168,21,180,98,164,16,145,144,165,88,170,19,45,234,5,93,
+    240,154,19,187,141,172,136,21,117,226,197,68,33,33,33,25,
+    253,14,89,250,14,178,98,68,217,87,16,122,170,180,7,43,
+    36,45,233,22,202,197,143,184,176,156,211,88,98,201,241,204,
+    187,191,241,138,134,237,178,244,245,243,75,134,185,70,240,146,
+    231,6,212,115,28,66,89,223,159,136,239,27,119,200,98,105,
+    117,21,196,216,167,165,149,77,97,196,250,57,251,9,37,171,
+    36,0,145,30,69,192,101,78,98,202,31,110,125,12,47,105,
+    254,72,107,42,146,31,175,248,1,53,204,96,201,163,196,236,
+    14,61,210,14,253,83,32,127,133,224,9,42,72,22,42,200,
+    150,84,80,136,106,201,59,104,31,90,158,134,29,10,154,165,
+    144,136,165,146,168,165,17,125,53,178,139,86,37,43,178,147,
+    44,196,172,232,14,42,196,121,208,133,196,46,186,39,21,146,
+    16,102,140,69,175,95,16,147,165,50,244,54,165,174,177,149,
+    214,239,229,101,145,246,50,244,89,15,27,45,105,171,15,236,
+    101,28,106,202,168,167,53,142,16,248,151,151,143,164,102,140,
+    58,254,130,80,223,246,92,158,0,211,241,125,174,207,254,120,
+    219,167,102,126,99,51,88,243,220,252,29,82,188,148,55,189,
+    226,134,231,18,55,240,243,38,159,215,154,77,168,65,77,120,
+    249,121,10,233,108,106,253,124,145,248,54,14,214,40,33,216,
+    33,95,16,39,239,92,192,162,105,97,99,147,37,91,99,45,
+    121,37,55,216,26,106,133,184,208,173,205,195,240,254,36,144,
+    109,244,92,79,236,38,239,39,247,164,170,126,146,51,245,84,
+    250,126,121,207,168,166,38,43,250,228,75,30,15,83,77,88,
+    25,22,15,12,122,135,4,216,246,13,22,55,157,187,216,18,
+    168,48,227,93,89,139,182,179,246,111,8,240,129,244,13,10,
+    186,114,218,187,86,143,187,179,253,22,27,9,5,90,167,173,
+    44,149,229,50,122,172,188,222,11,218,34,251,224,239,105,232,
+    211,146,254,46,239,171,160,81,59,43,132,67,62,72,116,122,
+    6,125,29,126,61,26,90,3,146,246,1,20,79,229,112,102,
+    61,254,193,155,30,242,81,144,98,161,20,3,41,204,73,48,
+    250,182,216,192,42,25,206,86,5,41,156,135,165,128,212,223,
+    35,165,66,73,3,105,160,227,227,241,9,244,134,207,107,35,
+    165,187,122,12,190,169,71,89,233,141,15,10,7,71,112,100,
+    249,90,78,101,170,111,111,17,166,25,190,239,153,44,229,3,
+    14,0,5,174,69,238,225,21,59,96,49,219,199,182,0,223,
+    17,79,214,81,22,8,229,83,204,13,49,205,47,109,64,85,
+    208,49,216,219,1,198,148,111,105,54,0,48,90,228,117,229,
+    22,248,93,180,3,159,105,162,63,83,108,55,96,106,209,8,
+    214,152,226,120,119,88,26,96,237,19,135,152,1,118,75,69,
+    62,154,207,161,87,242,3,66,177,109,209,49,62,20,95,51,
+    22,223,8,11,13,27,134,106,226,250,118,0,96,247,49,12,
+    143,205,77,211,33,224,236,60,166,228,243,18,241,3,236,24,
+    1,113,205,77,54,40,116,62,236,57,159,132,202,190,192,195,
+    48,112,75,164,67,220,127,180,181,123,88,159,233,185,46,76,
+    232,102,137,128,167,92,2,146,67,156,85,22,229,51,229,89,
+    210,129,105,38,42,234,146,224,75,143,222,165,35,220,65,146,
+    7,224,124,40,182,162,207,82,34,94,236,216,46,17,221,232,
+    28,143,132,99,69,196,196,98,24,155,14,184,193,216,231,80,
+    205,134,159,109,202,151,143,158,6,178,53,208,222,217,237,236,
+    94,4,173,255,95,32,63,108,163,87,99,40,214,255,85,244,
+    126,244,153,62,118,160,143,85,245,76,77,207,84,244,204,171,
+    8,26,153,172,159,24,171,167,51,245,137,236,179,137,243,7,
+    19,231,255,145,175,78,44,214,38,22,235,35,227,141,152,54,
+    18,127,129,128,124,207,201,174,122,63,254,106,0,157,153,253,
+    214,122,178,246,93,249,159,55,171,179,87,106,179,87,170,83,
+    87,107,83,87,119,213,154,62,89,207,76,131,81,170,245,58,
+    204,204,85,51,243,181,204,188,208,205,188,207,77,166,26,113,
+    116,102,186,105,220,124,103,235,239,157,226,239,204,243,209,241,
+    103,163,115,7,163,115,213,209,249,218,40,239,148,172,235,201,
+    103,122,230,64,207,236,125,84,213,207,212,244,51,149,246,67,
+    135,17,175,185,93,160,229,96,18,213,230,107,196,107,116,119,
+    173,9,186,170,196,122,216,167,44,89,210,113,187,250,207,112,
+    178,148,229,45,216,217,221,190,202,82,175,213,93,225,155,166,
+    130,104,199,198,146,123,109,254,2,126,96,255,40,203,244,20,
+    95,170,105,177,80,89,190,222,89,190,222,89,219,207,186,94,
+    144,53,178,27,222,151,132,102,189,213,236,133,211,57,149,78,
+    115,199,51,156,204,10,24,252,246,158,73,54,56,144,115,10,
+    61,199,213,151,184,90,229,27,193,87,154,192,104,2,98,138,
+    143,50,214,6,196,207,247,215,103,28,24,215,16,47,247,135,
+    169,244,131,139,95,255,114,239,198,119,55,171,131,249,218,96,
+    190,154,58,87,75,157,219,85,235,137,228,174,245,213,71,15,
+    204,189,124,117,100,190,54,50,127,144,152,175,36,230,15,211,
+    227,149,137,197,106,122,169,150,94,170,36,151,234,169,193,221,
+    196,235,43,33,183,87,226,95,210,207,87,226,181,90,20,182,
+    29,107,37,191,147,85,184,202,101,105,189,171,210,175,135,122,
+    28,158,31,199,250,137,132,188,180,174,117,244,235,161,190,235,
+    236,56,206,79,231,252,232,157,79,168,127,199,249,116,206,150,
+    222,249,132,250,119,156,79,231,84,234,245,19,234,59,126,68,
+    189,151,150,115,113,202,13,89,127,209,112,45,35,240,232,166,
+    168,116,172,207,19,56,52,156,150,216,170,164,215,168,87,188,
+    126,129,233,94,41,192,27,30,13,88,212,118,155,76,162,101,
+    113,219,131,246,254,118,145,109,217,39,219,178,104,77,148,220,
+    21,14,87,46,228,228,38,208,63,4,226,115,16,180,17,206,
+    175,44,91,195,109,132,247,84,97,131,219,126,139,4,188,79,
+    125,240,208,123,228,241,234,50,126,248,222,252,67,252,8,139,
+    74,243,42,137,160,165,45,213,103,206,214,102,46,9,22,234,
+    211,225,248,220,195,43,143,174,112,113,172,62,253,193,147,27,
+    130,171,233,167,161,86,78,158,13,221,213,103,127,81,155,189,
+    44,88,40,75,135,19,185,135,55,30,9,211,147,224,238,137,
+    112,124,18,188,65,39,104,122,163,191,138,120,196,238,201,245,
+    241,67,209,53,138,4,99,22,199,184,232,89,37,135,243,73,
+    140,63,47,25,78,179,133,242,211,157,37,196,81,80,36,112,
+    77,180,196,105,68,249,197,129,242,53,164,28,232,226,52,16,
+    21,64,36,137,245,181,14,15,147,56,14,198,57,137,242,43,
+    172,184,113,94,109,166,178,191,77,206,242,134,61,36,14,140,
+    246,183,158,26,216,254,253,115,109,160,33,203,90,182,129,128,
+    188,80,80,228,196,206,103,77,133,62,163,77,67,65,79,141,
+    55,18,156,75,163,225,177,198,32,231,134,208,112,182,49,204,
+    57,244,54,178,44,169,218,80,3,133,36,57,172,93,108,160,
+    227,136,200,149,152,106,174,79,212,69,22,47,94,90,240,86,
+    214,97,237,253,102,240,28,192,2,178,226,110,209,188,13,168,
+    112,71,245,69,130,88,127,41,176,29,127,193,131,243,155,218,
+    22,97,99,27,212,51,225,47,139,71,253,5,163,245,199,3,
+    243,251,109,51,169,124,168,191,161,230,176,60,87,63,234,191,
+    106,46,205,175,233,50,226,215,34,72,216,127,128,52,20,73,
+    146,26,151,145,148,220,78,240,111,67,141,72,114,3,253,191,
+    100,0,73,227,21,148,233,126,234,104,170,210,126,234,232,114,
+    165,247,105,196,255,40,73,144,171,55,211,74,127,246,133,96,
+    190,127,139,129,8,244,39,227,68,61,58,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/mesi_three_level/l2_cache.py",
+    "gem5.components.cachehierarchies.ruby.caches.mesi_three_level.l2_cache",
+    embedded_module_data,
+    1899,
+    3695);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,120 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,86,223,79,20,71,28,159,253,113,220,112,28,30,
+    30,32,120,197,114,8,34,71,149,3,81,180,166,85,163,166,
+    173,209,98,180,62,93,155,76,142,221,1,14,247,118,113,118,
+    79,133,92,19,30,72,122,77,120,212,200,163,180,132,216,192,
+    67,159,154,254,25,28,217,132,203,38,36,38,125,226,237,140,
+    154,52,62,117,102,150,93,246,144,82,122,63,190,51,223,239,
+    204,247,179,223,95,243,157,253,11,4,62,161,157,241,237,21,
+    74,94,0,21,168,130,6,50,108,20,53,33,47,102,196,188,
+    148,145,242,114,70,22,128,8,190,6,170,52,15,84,25,139,
+    43,18,0,171,146,7,146,9,169,194,119,32,21,218,102,204,
+    104,74,114,226,119,206,221,200,42,147,24,221,48,116,139,24,
+    154,134,137,211,248,45,54,205,236,4,190,94,24,31,167,108,
+    253,253,194,216,12,223,164,4,237,17,61,123,110,82,242,19,
+    181,8,131,140,160,130,140,168,10,25,9,203,170,56,15,86,
+    232,202,42,216,125,118,9,140,11,212,46,152,169,83,229,121,
+    144,9,171,33,74,97,9,60,21,50,245,212,170,58,39,124,
+    103,152,63,136,48,112,69,8,60,77,218,249,191,29,225,222,
+    23,169,206,148,191,168,10,179,141,116,191,136,124,73,17,212,
+    172,70,0,160,248,226,232,54,131,76,9,14,68,143,49,49,
+    115,134,78,231,146,162,153,38,147,39,63,60,48,137,146,158,
+    158,177,38,13,61,61,129,243,23,210,138,145,159,54,116,172,
+    91,102,90,97,118,77,230,48,201,18,133,14,102,154,208,168,
+    184,82,51,157,199,102,14,89,147,4,99,164,225,199,88,75,
+    107,195,136,47,13,76,207,56,209,157,103,221,48,10,186,53,
+    219,178,227,226,64,80,154,162,143,55,59,41,153,3,175,97,
+    67,41,186,16,93,20,202,240,56,155,84,98,241,133,226,98,
+    182,28,235,92,135,157,111,153,63,74,56,16,23,232,197,229,
+    26,117,225,185,240,2,88,129,168,213,198,255,101,48,158,255,
+    178,71,0,86,104,119,173,40,20,197,34,120,41,125,172,69,
+    215,228,98,104,133,166,105,213,171,3,176,38,212,214,90,17,
+    32,217,207,1,197,65,62,114,177,142,114,117,254,154,68,185,
+    112,13,7,125,78,166,92,253,46,226,203,200,127,251,64,53,
+    26,2,26,209,125,173,151,86,104,52,86,253,136,8,244,28,
+    177,115,193,142,132,108,230,102,177,19,202,154,166,161,56,49,
+    211,202,18,11,229,116,21,63,69,99,57,107,155,185,180,205,
+    124,38,204,172,84,163,19,50,11,211,244,148,64,68,55,229,
+    44,132,8,115,211,105,152,192,214,45,166,116,61,103,209,178,
+    62,199,171,193,105,181,72,86,55,115,22,205,187,137,168,22,
+    82,102,20,13,59,17,69,43,152,22,101,115,170,19,215,206,
+    33,130,31,21,176,105,33,45,107,97,93,153,113,154,185,204,
+    164,165,104,98,95,216,104,25,72,27,242,88,210,200,158,26,
+    222,41,42,167,81,49,116,29,43,214,189,2,166,72,41,72,
+    157,194,218,184,19,166,117,201,189,131,116,226,58,24,214,177,
+    245,196,32,15,157,168,94,200,35,205,45,78,211,137,113,131,
+    145,150,211,49,215,32,9,134,95,143,144,162,81,61,132,76,
+    150,162,164,251,153,35,44,198,228,24,37,179,77,94,121,123,
+    225,24,160,82,243,23,74,254,158,3,239,227,160,254,200,207,
+    225,133,240,38,108,223,128,237,101,152,176,97,98,29,38,222,
+    215,129,246,174,202,209,246,74,60,81,233,72,110,118,156,217,
+    232,56,243,234,135,63,175,150,59,110,219,29,183,171,97,185,
+    61,242,6,80,242,142,145,146,188,16,173,70,65,239,233,146,
+    108,195,147,149,68,15,21,196,42,39,187,25,219,89,233,238,
+    97,99,178,114,226,83,54,38,94,183,125,178,217,214,183,209,
+    214,87,110,235,183,219,250,153,110,5,70,55,97,98,3,38,
+    22,47,150,97,183,13,187,215,189,31,57,66,205,84,130,213,
+    206,106,148,159,174,103,128,117,157,224,217,178,2,251,166,252,
+    51,80,20,84,161,246,84,212,214,217,143,210,33,48,196,131,
+    49,138,210,44,67,146,139,50,239,105,164,133,213,161,228,72,
+    57,221,114,228,124,214,154,116,36,205,152,72,133,72,146,101,
+    165,135,145,83,188,56,104,206,105,5,155,142,204,168,25,242,
+    18,232,102,175,141,101,175,217,203,94,160,122,111,177,4,178,
+    59,103,14,108,197,91,159,171,207,38,23,139,175,238,149,143,
+    165,237,99,233,114,124,208,142,15,150,194,91,177,248,243,243,
+    207,46,45,222,165,11,205,105,187,57,93,142,13,218,177,193,
+    223,47,150,99,151,75,114,37,214,92,106,112,131,235,187,4,
+    220,11,132,7,247,15,97,111,112,63,58,208,187,206,11,129,
+    64,129,41,95,142,252,80,30,136,227,55,164,61,56,190,252,
+    144,56,187,173,172,22,199,151,31,18,199,111,130,20,39,208,
+    56,167,124,57,242,209,15,196,241,219,231,30,28,95,126,72,
+    28,191,241,238,193,241,229,187,56,188,97,10,163,169,122,194,
+    130,231,180,222,204,145,251,110,223,250,138,24,249,157,215,10,
+    39,156,211,209,180,65,44,7,26,5,203,157,181,220,25,218,
+    103,99,179,215,224,130,194,166,130,62,166,25,202,195,7,134,
+    39,137,251,202,187,178,163,158,170,47,74,137,110,241,119,83,
+    98,50,139,189,42,103,119,236,108,171,87,229,53,77,114,148,
+    237,253,21,176,58,167,253,168,119,120,9,45,35,183,197,12,
+    92,88,51,248,204,134,159,109,245,12,45,221,93,190,203,216,
+    174,202,217,243,107,124,75,151,13,251,183,186,7,151,174,46,
+    95,117,187,207,153,225,53,190,37,105,195,212,86,242,236,82,
+    108,57,198,216,19,149,190,180,221,119,137,79,109,120,106,235,
+    100,122,41,189,156,118,27,87,255,144,221,127,153,79,109,120,
+    122,171,107,96,169,115,185,147,177,159,86,82,131,118,234,115,
+    62,181,97,239,58,255,241,195,148,138,176,75,71,207,230,49,
+    66,78,4,161,188,161,22,52,54,143,34,244,168,144,213,220,
+    21,194,110,76,167,129,183,237,60,166,175,54,42,191,42,120,
+    183,230,135,158,199,196,105,220,233,236,10,214,52,132,82,2,
+    233,101,225,96,165,114,205,141,92,216,35,124,193,2,188,161,
+    123,223,74,172,105,238,155,215,161,166,170,40,134,146,85,64,
+    201,27,9,212,29,157,255,222,21,192,227,161,158,42,216,135,
+    140,72,161,150,42,240,73,228,72,232,114,21,28,68,184,227,
+    220,140,84,29,97,111,77,78,36,127,97,192,24,155,162,105,
+    52,9,171,88,94,141,252,14,230,219,126,3,174,10,243,225,
+    3,252,194,141,209,21,242,37,96,119,62,117,228,9,37,85,
+    73,16,132,234,8,16,162,115,13,236,91,149,101,65,172,130,
+    255,67,226,35,2,53,240,99,178,126,36,249,134,141,239,246,
+    89,227,134,253,3,123,172,150,53,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/mesi_three_level/l3_cache.py",
+    "gem5.components.cachehierarchies.ruby.caches.mesi_three_level.l3_cache",
+    embedded_module_data,
+    1529,
+    3043);
+
+} // anonymous namespace
+} // namespace gem5
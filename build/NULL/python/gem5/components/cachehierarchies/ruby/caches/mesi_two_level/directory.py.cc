@@ -0,0 +1,86 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,84,205,107,27,71,20,159,217,47,173,92,219,106,
+    156,131,173,226,226,143,90,80,217,70,11,162,238,165,165,180,
+    161,164,80,72,66,235,94,186,151,97,189,59,182,215,221,15,
+    101,102,149,214,70,16,31,12,117,33,135,94,74,98,240,33,
+    133,98,8,238,31,35,23,65,197,130,160,80,122,240,77,193,
+    61,132,156,250,102,87,187,146,218,36,205,236,242,155,55,239,
+    205,252,222,188,121,111,230,79,52,210,212,65,127,245,57,192,
+    67,228,32,7,123,200,199,38,246,37,83,194,200,145,28,217,
+    147,125,197,84,64,86,28,213,83,125,205,212,48,146,208,103,
+    200,209,142,144,83,160,218,153,140,208,185,156,17,154,5,71,
+    223,68,213,226,165,24,84,165,120,234,22,229,220,218,161,55,
+    154,219,219,148,197,215,191,108,110,237,127,234,50,106,71,33,
+    219,191,69,125,192,75,77,76,197,113,49,188,71,25,115,29,
+    202,47,165,84,115,237,147,45,30,49,203,142,242,21,246,232,
+    230,51,167,87,55,1,190,135,237,83,100,98,7,153,210,49,
+    218,198,14,62,210,77,89,66,84,161,234,25,134,45,226,108,
+    153,35,29,161,51,232,207,115,34,83,59,70,223,97,179,0,
+    27,151,227,226,208,153,58,226,76,25,56,188,250,17,224,39,
+    252,16,69,120,104,28,167,123,60,98,25,182,22,110,73,103,
+    16,216,185,148,105,48,106,201,59,184,133,72,174,137,10,47,
+    227,132,89,74,46,43,48,202,247,230,160,77,244,4,223,174,
+    106,177,202,155,13,56,99,157,16,55,112,35,66,226,55,44,
+    199,97,132,89,193,14,229,76,44,143,139,78,22,92,92,242,
+    147,211,39,97,51,34,141,144,69,64,160,112,234,109,199,133,
+    128,70,223,134,236,155,184,100,91,246,46,37,158,27,80,194,
+    221,3,26,23,97,73,74,23,43,98,73,92,36,196,246,44,
+    206,9,225,34,137,139,162,29,62,223,228,204,54,26,251,209,
+    110,24,24,59,212,223,48,236,208,111,132,1,13,34,110,36,
+    148,187,46,101,22,179,161,227,6,131,130,72,181,220,240,41,
+    119,9,248,38,30,189,71,61,35,223,107,173,177,207,166,129,
+    255,96,38,207,77,45,11,178,2,122,126,3,224,217,33,234,
+    233,83,63,20,30,20,126,215,231,126,211,231,30,205,62,54,
+    46,244,122,71,175,183,245,122,119,190,242,232,131,99,165,163,
+    207,245,202,235,23,229,90,167,92,59,86,30,76,255,177,240,
+    142,80,206,183,147,255,74,28,167,157,39,3,154,148,37,125,
+    21,139,235,241,242,148,67,66,114,91,11,239,73,67,253,94,
+    174,39,249,37,121,37,207,48,205,227,60,185,254,53,121,242,
+    2,1,30,121,168,223,203,245,35,101,247,42,30,237,181,102,
+    229,133,43,202,145,77,130,80,213,153,112,27,79,50,122,183,
+    73,121,244,85,8,201,139,245,172,220,226,130,27,164,194,20,
+    163,28,202,131,211,116,70,41,27,222,100,161,63,80,12,8,
+    210,247,34,158,25,157,145,234,170,18,155,1,103,236,58,0,
+    23,113,45,46,178,57,225,125,202,14,131,0,74,230,139,38,
+    5,142,131,217,97,1,141,25,214,197,58,31,224,16,253,53,
+    95,61,185,115,122,71,212,69,185,187,178,214,89,121,47,17,
+    59,250,82,239,237,213,19,114,74,196,240,173,110,101,189,83,
+    217,72,196,142,190,220,91,88,63,185,127,122,63,169,165,238,
+    187,198,175,165,68,234,232,149,81,67,111,217,248,217,248,197,
+    16,242,66,59,249,89,57,57,39,113,99,3,203,167,112,99,
+    39,8,241,67,167,233,9,121,146,144,187,77,203,75,45,73,
+    253,51,145,11,166,11,88,78,130,27,92,63,155,122,30,33,
+    85,204,102,69,24,34,77,31,39,209,179,137,12,86,132,129,
+    160,228,150,100,95,95,82,213,149,62,122,1,76,35,173,116,
+    248,117,187,180,120,161,46,117,212,165,190,164,171,245,62,2,
+    120,42,35,109,121,76,243,47,72,34,74,60,222,134,184,38,
+    252,141,90,184,181,7,167,204,147,90,72,223,160,233,102,228,
+    122,188,150,189,246,73,80,241,140,53,120,234,73,126,235,211,
+    64,5,215,19,148,242,138,152,158,235,31,166,39,244,17,91,
+    67,226,13,133,192,142,1,250,50,198,184,255,190,140,165,62,
+    250,127,152,64,120,173,141,86,71,255,46,170,183,199,255,190,
+    118,13,67,88,255,133,246,155,75,79,69,255,247,11,108,201,
+    78,255,1,118,46,183,156,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/mesi_two_level/directory.py",
+    "gem5.components.cachehierarchies.ruby.caches.mesi_two_level.directory",
+    embedded_module_data,
+    983,
+    1892);
+
+} // anonymous namespace
+} // namespace gem5
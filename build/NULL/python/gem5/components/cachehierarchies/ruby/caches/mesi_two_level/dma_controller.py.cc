@@ -0,0 +1,79 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,84,205,107,220,70,20,127,163,111,27,111,220,150,
+    182,73,155,80,59,169,183,65,109,216,133,20,183,224,148,210,
+    124,144,92,26,135,16,31,90,93,6,89,51,142,181,149,52,
+    155,25,41,173,141,15,62,24,226,66,175,37,13,228,144,67,
+    48,4,231,144,63,161,127,194,58,44,212,8,12,129,144,131,
+    111,27,220,67,201,169,51,218,213,122,213,184,210,240,155,167,
+    247,70,191,247,41,189,132,145,203,28,236,7,87,37,220,7,
+    2,4,69,16,35,15,33,32,26,209,35,45,214,61,93,202,
+    6,49,35,35,54,61,19,129,6,215,128,88,27,64,108,106,
+    110,233,0,219,122,73,230,89,196,185,5,238,216,190,122,112,
+    81,94,187,78,133,240,111,211,75,217,210,18,229,251,86,95,
+    59,198,238,82,206,67,66,197,190,214,215,124,112,113,81,164,
+    220,15,210,43,215,47,94,102,73,202,89,20,81,30,140,198,
+    169,143,198,121,79,70,74,193,67,4,60,109,19,150,16,65,
+    27,142,167,107,64,13,25,17,146,17,161,242,53,162,109,192,
+    150,220,183,135,68,158,181,9,191,32,207,150,113,234,121,173,
+    234,80,31,113,104,12,156,30,124,47,225,119,116,31,82,116,
+    104,172,82,62,26,177,28,94,107,104,77,219,146,9,110,107,
+    165,70,150,17,164,91,52,239,106,185,41,178,54,229,185,131,
+    113,152,132,41,198,174,145,27,130,70,75,185,157,208,244,103,
+    198,127,202,39,3,63,88,166,56,10,19,138,69,184,74,243,
+    49,140,131,200,23,2,99,161,130,155,158,158,94,127,243,131,
+    224,65,179,189,146,46,179,164,121,155,198,179,205,128,197,109,
+    150,208,36,21,205,226,253,229,144,114,159,7,114,19,77,158,
+    45,174,244,181,162,25,83,17,98,233,8,71,244,46,141,154,
+    36,246,113,48,44,68,163,189,194,39,164,139,213,15,43,245,
+    105,148,193,158,145,54,241,169,132,127,214,97,207,169,253,106,
+    255,102,255,229,156,120,238,156,248,227,248,163,230,142,115,190,
+    235,156,239,148,235,64,101,30,104,35,133,209,203,202,254,89,
+    140,220,255,215,117,13,240,208,54,122,138,160,167,90,181,205,
+    242,228,208,195,26,106,233,135,250,214,80,143,141,163,184,222,
+    242,104,14,101,212,50,14,245,173,161,30,15,217,139,110,234,
+    243,11,114,130,109,198,9,229,148,184,22,87,230,252,88,236,
+    39,196,79,25,95,185,153,209,140,230,147,156,10,217,23,65,
+    175,114,22,95,9,101,227,89,150,226,54,227,105,110,135,73,
+    95,152,224,244,78,70,69,186,192,228,1,87,227,53,73,196,
+    143,169,82,107,69,187,249,187,138,185,38,219,148,208,32,45,
+    120,197,234,201,106,135,42,198,186,122,119,94,194,58,188,250,
+    228,139,7,236,33,219,52,186,206,201,189,169,115,207,22,58,
+    83,115,59,83,115,221,169,57,165,58,181,123,182,209,61,251,
+    117,33,118,157,153,189,83,238,131,27,15,111,168,199,143,118,
+    235,231,30,227,66,234,58,103,58,197,226,239,73,74,215,81,
+    179,155,248,49,197,56,31,199,56,102,36,139,148,60,129,241,
+    157,204,143,250,150,98,138,184,42,29,183,21,124,92,100,48,
+    152,227,128,70,145,28,124,196,223,81,113,170,158,124,87,164,
+    200,199,74,56,173,12,24,138,57,43,239,158,134,204,47,123,
+    112,4,88,96,77,174,255,216,153,156,217,49,235,93,179,222,
+    211,76,115,182,7,18,94,235,96,125,86,209,252,7,138,140,
+    10,143,243,174,157,143,199,179,13,182,216,146,101,20,131,102,
+    102,105,24,137,70,249,219,42,242,201,143,251,131,127,22,174,
+    126,59,253,68,21,215,19,232,243,170,156,222,56,223,244,43,
+    244,45,87,223,141,74,86,112,9,61,29,33,212,251,10,80,
+    189,3,51,163,235,5,124,222,169,174,93,184,208,169,174,158,
+    53,142,100,2,111,67,231,125,247,181,218,255,62,194,86,196,
+    244,47,23,76,110,17,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/mesi_two_level/dma_controller.py",
+    "gem5.components.cachehierarchies.ruby.caches.mesi_two_level.dma_controller",
+    embedded_module_data,
+    870,
+    1539);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,125 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,86,221,111,19,71,16,223,243,221,217,103,199,177,
+    147,148,64,72,66,114,13,144,198,129,198,36,8,40,21,42,
+    31,65,180,72,41,45,144,151,250,101,117,185,219,36,23,238,
+    35,236,158,41,65,145,26,85,72,77,37,94,43,138,132,84,
+    144,210,168,21,252,1,85,159,249,3,18,100,9,107,171,60,
+    85,60,228,205,8,144,42,158,58,123,142,207,54,37,40,234,
+    221,105,118,118,118,246,183,51,179,59,115,251,55,106,120,212,
+    173,246,165,7,228,46,178,144,37,57,168,32,218,152,35,185,
+    177,66,204,149,11,178,171,20,20,87,45,168,18,178,100,75,
+    113,226,110,162,144,8,121,213,209,38,145,21,183,18,78,210,
+    77,21,82,32,211,172,164,211,226,166,11,105,9,197,208,231,
+    200,74,221,70,86,11,73,175,202,8,61,146,107,139,22,90,
+    45,233,42,202,165,55,69,231,82,78,225,45,227,142,111,94,
+    59,239,187,134,237,241,214,47,9,99,198,12,57,87,156,158,
+    38,148,39,175,20,167,22,198,13,115,150,240,140,96,191,166,
+    100,154,4,208,165,155,113,152,158,147,184,124,241,234,89,104,
+    164,225,77,181,42,72,159,157,98,1,53,204,96,220,167,100,
+    51,86,21,102,107,194,137,209,16,205,108,12,67,188,22,134,
+    73,32,63,64,32,8,42,72,22,42,196,44,137,200,86,140,
+    40,150,76,212,233,248,50,154,150,44,229,118,186,16,143,33,
+    146,32,218,170,4,110,73,53,16,75,189,141,86,161,125,20,
+    193,22,146,203,232,166,84,72,129,179,113,158,216,90,152,43,
+    38,152,197,83,129,65,103,72,128,109,102,240,148,233,92,195,
+    86,232,190,217,242,150,89,34,106,47,159,192,34,63,73,119,
+    81,32,213,7,155,151,122,208,48,82,127,22,213,69,109,21,
+    2,240,40,86,147,72,40,80,27,198,165,197,216,34,122,32,
+    191,107,110,51,190,37,61,142,173,42,32,81,162,185,8,71,
+    124,19,166,188,168,236,16,83,126,7,102,132,20,180,214,231,
+    5,217,58,63,167,69,218,9,75,105,246,174,121,67,0,45,
+    25,241,41,232,165,34,188,61,219,217,4,90,233,136,143,63,
+    104,176,225,61,51,50,145,71,42,244,34,91,45,25,122,109,
+    81,47,14,199,32,113,171,48,78,137,17,216,222,140,62,49,
+    170,155,226,64,232,166,239,5,212,119,28,66,71,244,113,223,
+    99,54,11,116,127,90,159,242,131,89,221,246,224,212,22,205,
+    192,246,189,148,190,245,24,158,165,91,70,96,84,167,143,68,
+    242,73,72,37,133,217,183,8,87,13,198,124,147,103,25,28,
+    50,56,98,158,69,110,226,41,59,224,73,155,97,59,156,117,
+    129,10,55,55,69,228,47,229,218,185,202,138,243,144,108,26,
+    6,101,59,192,152,138,109,224,109,112,64,207,137,212,188,10,
+    160,231,236,128,113,109,98,244,98,56,95,112,231,171,156,108,
+    123,1,87,92,35,152,229,178,227,207,240,14,103,12,51,226,
+    16,51,192,94,209,21,235,50,218,1,112,84,28,103,158,154,
+    143,18,152,239,162,228,122,209,166,132,129,190,103,97,114,195,
+    54,97,141,76,189,3,94,51,222,9,105,11,65,9,59,24,
+    172,196,230,130,233,16,158,37,158,49,229,16,92,195,203,165,
+    193,121,226,76,115,205,25,181,113,24,134,164,224,170,161,0,
+    161,21,9,173,45,97,194,35,193,183,62,189,70,197,38,241,
+    180,176,214,25,11,147,148,241,108,232,28,118,108,143,132,243,
+    104,187,112,65,248,193,147,24,155,14,32,96,204,68,16,245,
+    250,179,244,230,10,163,102,126,126,33,152,245,189,252,12,113,
+    143,229,77,223,157,247,61,226,5,44,31,34,206,218,132,26,
+    212,132,134,229,41,212,179,170,148,229,93,194,108,12,214,96,
+    135,220,32,78,222,25,197,213,221,157,95,160,221,176,200,173,
+    182,173,242,49,82,219,162,67,32,101,127,1,249,103,9,189,
+    214,81,50,243,99,226,78,226,153,214,245,84,235,250,121,207,
+    131,252,186,54,86,210,198,214,180,177,215,113,180,119,160,220,
+    190,183,220,209,83,238,213,159,245,142,62,237,29,93,239,61,
+    90,234,61,90,222,221,93,73,170,123,83,47,16,144,87,130,
+    44,43,119,90,95,167,183,215,239,121,183,254,254,193,95,173,
+    149,217,223,22,255,184,188,62,120,186,52,120,122,125,224,76,
+    105,224,204,178,82,210,250,203,221,7,64,41,187,209,61,180,
+    222,61,92,234,30,22,157,114,223,192,179,190,19,79,251,78,
+    172,247,157,44,245,157,20,122,61,229,131,131,162,29,40,247,
+    31,16,109,239,90,248,189,20,137,99,70,233,13,143,224,195,
+    146,248,167,36,126,88,219,23,68,72,189,104,236,189,90,17,
+    250,162,52,39,215,229,115,145,188,161,204,189,15,39,42,92,
+    111,225,68,242,29,226,196,35,190,25,39,146,239,16,39,177,
+    35,173,122,49,149,230,26,202,112,189,200,226,200,134,247,226,
+    212,11,109,51,78,36,175,227,88,8,10,161,116,41,151,162,
+    66,145,103,92,168,103,70,224,211,133,203,69,82,36,188,67,
+    20,5,194,130,11,212,119,107,191,204,132,237,225,121,159,6,
+    92,243,139,65,149,251,0,202,6,36,22,35,141,122,29,69,
+    111,74,212,171,70,89,171,63,47,74,135,225,84,225,219,182,
+    224,39,253,154,66,123,13,41,18,229,98,244,35,48,141,30,
+    6,194,196,57,208,117,122,68,216,218,10,165,218,131,194,22,
+    66,177,91,157,181,156,108,18,95,22,179,126,1,178,132,158,
+    247,29,186,231,223,247,195,19,190,49,144,127,152,95,201,87,
+    179,226,208,216,227,211,33,87,210,134,54,246,31,121,120,122,
+    37,236,234,229,195,71,31,127,21,114,37,45,183,237,140,231,
+    251,134,239,225,251,88,116,187,159,235,31,63,204,174,100,5,
+    191,175,60,148,47,13,125,18,178,37,237,224,198,135,35,15,
+    251,87,250,69,183,175,156,59,82,202,133,153,214,87,210,6,
+    215,194,143,142,130,141,185,22,81,244,61,195,37,24,243,20,
+    198,174,111,21,29,193,167,49,190,94,52,156,234,8,21,183,
+    18,42,206,4,21,219,24,86,36,158,244,111,16,74,109,139,
+    48,42,126,147,244,84,24,161,173,218,104,18,199,193,56,39,
+    209,188,136,134,56,57,103,194,16,210,108,141,12,139,129,239,
+    81,88,191,106,111,37,118,64,61,88,201,160,108,79,37,43,
+    184,93,168,179,171,210,41,184,221,168,83,175,236,17,28,218,
+    142,76,72,40,158,93,250,102,249,187,117,181,191,164,246,87,
+    98,25,245,211,10,2,242,66,70,113,189,73,242,22,9,35,
+    17,26,149,203,208,126,225,70,202,61,54,226,79,205,193,158,
+    178,170,199,226,168,134,63,197,234,95,76,129,107,27,11,3,
+    194,51,197,192,118,216,72,45,24,188,107,158,250,38,92,97,
+    125,202,70,140,173,59,39,22,87,190,48,136,188,61,146,213,
+    74,124,53,122,98,245,223,81,213,18,17,168,55,218,169,234,
+    94,124,70,191,64,226,222,6,209,122,2,164,34,75,146,84,
+    57,142,164,244,82,139,120,43,138,42,197,42,232,255,145,12,
+    146,122,214,80,119,227,87,70,3,107,181,175,140,142,175,53,
+    127,101,148,95,107,254,42,241,227,18,68,241,191,100,217,127,
+    33,154,87,239,24,10,189,252,23,150,185,242,171,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/mesi_two_level/l1_cache.py",
+    "gem5.components.cachehierarchies.ruby.caches.mesi_two_level.l1_cache",
+    embedded_module_data,
+    1613,
+    3208);
+
+} // anonymous namespace
+} // namespace gem5
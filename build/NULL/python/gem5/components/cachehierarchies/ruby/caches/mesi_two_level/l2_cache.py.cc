@@ -0,0 +1,107 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,86,223,111,211,70,28,191,179,157,216,41,133,208,
+    148,66,181,133,53,133,65,113,7,117,219,81,4,213,52,126,
+    106,211,36,86,4,227,101,209,180,83,106,95,91,23,199,46,
+    103,135,209,42,211,250,80,105,153,196,35,8,158,38,34,85,
+    136,169,213,180,167,105,127,70,131,44,17,89,202,211,180,135,
+    190,5,149,73,19,79,187,59,199,110,210,21,86,199,250,222,
+    221,247,238,251,185,251,126,191,159,239,57,127,130,182,39,209,
+    106,183,166,168,120,12,12,96,64,11,228,89,43,88,176,40,
+    228,133,162,152,23,33,48,68,67,178,164,219,192,72,24,73,
+    43,81,76,230,147,16,8,224,115,96,200,43,192,80,112,242,
+    153,8,192,154,24,129,230,101,3,126,5,212,212,38,27,76,
+    169,66,176,255,75,236,186,133,89,124,165,52,51,131,73,144,
+    186,85,154,94,188,90,208,231,240,102,146,174,80,97,0,135,
+    55,133,176,151,190,60,237,122,164,160,123,215,199,249,10,189,
+    253,180,209,14,91,215,169,248,145,158,23,131,60,52,64,94,
+    168,128,25,104,192,21,37,47,26,194,10,200,75,2,192,9,
+    122,42,72,79,5,35,99,67,92,1,207,104,187,22,195,229,
+    229,10,184,15,243,10,61,171,20,200,209,134,201,182,13,229,
+    214,166,91,191,82,241,8,62,6,30,220,158,236,4,123,218,
+    54,179,253,148,197,114,226,25,117,109,77,136,52,16,120,137,
+    182,121,88,22,202,224,169,184,171,173,212,233,192,58,236,12,
+    115,25,32,41,118,142,162,160,24,215,0,212,37,113,74,21,
+    3,201,53,151,112,144,40,184,174,163,7,105,215,43,16,15,
+    153,182,129,239,163,105,211,219,100,230,106,50,72,184,165,5,
+    154,22,5,209,41,211,67,136,48,125,176,111,22,123,95,176,
+    165,87,76,143,69,71,103,209,9,250,104,114,108,215,244,76,
+    199,118,17,181,66,250,162,110,97,85,166,59,97,107,38,144,
+    173,113,196,183,84,104,39,220,85,182,177,247,157,67,238,4,
+    221,118,169,136,172,48,202,110,144,230,120,200,50,109,28,90,
+    164,16,210,45,106,130,144,203,194,158,227,207,242,155,91,46,
+    209,181,133,69,111,206,177,181,89,92,156,208,116,167,184,224,
+    216,216,246,92,141,67,204,153,152,20,136,78,27,87,35,148,
+    88,161,214,213,138,216,53,17,221,25,89,248,30,182,52,122,
+    30,62,49,178,176,72,122,40,254,210,193,86,194,71,34,183,
+    135,168,214,253,150,138,127,150,193,223,73,144,58,240,147,252,
+    64,126,169,244,191,80,250,159,28,121,170,213,148,113,95,25,
+    223,80,198,233,92,255,96,189,167,191,158,121,175,158,205,189,
+    204,158,126,145,61,253,252,155,90,118,210,207,78,54,101,169,
+    191,235,21,160,226,53,19,21,233,65,119,179,27,156,28,170,
+    72,190,114,108,131,191,91,44,67,122,204,7,250,36,35,150,
+    253,12,88,17,182,115,204,107,99,198,124,108,83,166,100,239,
+    100,85,39,83,190,23,246,128,1,230,99,253,187,209,202,194,
+    18,195,20,203,34,101,149,48,69,88,118,104,193,136,166,237,
+    5,82,177,224,205,5,162,229,204,6,7,209,142,140,170,18,
+    233,99,68,106,229,61,76,11,103,8,229,158,27,72,76,186,
+    82,43,213,36,75,59,36,195,18,211,27,37,166,141,128,19,
+    44,55,151,169,88,6,141,76,223,35,227,225,220,147,242,243,
+    155,181,195,154,127,88,171,101,70,253,204,104,69,110,164,51,
+    143,206,62,60,255,228,154,159,29,251,109,172,214,59,225,247,
+    78,212,210,231,252,244,185,63,142,212,210,151,42,82,61,221,
+    91,217,71,142,238,12,191,16,133,255,119,184,51,252,157,37,
+    78,75,108,59,40,176,35,148,177,30,197,65,125,39,78,92,
+    184,59,112,98,253,30,113,226,146,223,129,19,235,247,136,19,
+    95,122,20,167,237,130,153,143,245,40,70,127,39,142,252,22,
+    156,88,191,71,28,229,45,56,177,126,27,135,95,118,112,74,
+    77,17,182,48,232,187,102,146,91,248,110,9,187,222,103,196,
+    41,182,184,20,200,166,141,22,28,226,5,138,83,242,194,222,
+    161,235,99,187,44,236,37,216,165,247,139,139,219,149,7,75,
+    246,180,229,232,119,110,59,145,38,19,27,111,235,122,34,211,
+    88,165,10,188,4,72,63,21,46,59,113,139,232,193,126,221,
+    177,109,172,123,55,75,152,98,44,245,69,148,239,80,79,50,
+    171,42,96,164,255,235,196,120,21,173,34,126,141,212,71,38,
+    214,29,222,243,149,143,26,31,142,85,111,172,222,96,195,193,
+    250,153,179,235,124,201,160,175,12,55,142,143,86,47,174,94,
+    100,195,92,253,244,199,235,124,73,206,87,212,70,238,76,53,
+    189,154,102,195,163,245,83,154,127,234,60,239,250,202,137,198,
+    49,173,170,173,106,108,56,80,31,30,243,135,39,121,215,87,
+    134,26,131,35,213,129,213,1,54,252,160,174,142,250,234,5,
+    222,245,149,147,27,252,229,69,165,166,216,39,196,46,20,49,
+    66,65,23,66,69,199,40,89,172,223,141,208,221,82,193,10,
+    103,248,229,203,11,61,72,57,247,48,33,166,129,93,194,242,
+    74,52,30,153,214,103,64,199,150,133,144,10,201,251,44,10,
+    140,43,151,194,59,162,43,18,39,217,68,17,240,251,58,250,
+    53,133,238,196,80,19,236,34,178,98,226,80,19,196,162,11,
+    36,211,203,95,87,126,168,37,6,252,196,0,51,155,100,235,
+    38,95,137,32,153,235,208,236,16,220,85,190,191,170,144,28,
+    59,113,87,113,98,196,153,158,167,105,115,57,5,195,207,231,
+    129,146,103,90,238,72,228,98,208,83,104,253,177,65,209,151,
+    40,116,154,33,253,2,66,84,230,223,27,229,147,48,112,159,
+    146,11,128,253,93,160,78,62,160,162,41,66,8,155,231,0,
+    236,94,222,199,126,77,73,132,2,245,229,127,69,23,128,199,
+    55,192,177,240,173,3,109,163,243,109,38,7,33,245,236,191,
+    162,226,188,98,205,235,93,166,248,105,255,5,119,77,74,145,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/mesi_two_level/l2_cache.py",
+    "gem5.components.cachehierarchies.ruby.caches.mesi_two_level.l2_cache",
+    embedded_module_data,
+    1328,
+    2632);
+
+} // anonymous namespace
+} // namespace gem5
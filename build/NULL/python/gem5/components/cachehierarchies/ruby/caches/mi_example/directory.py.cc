@@ -0,0 +1,96 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,85,77,107,27,71,24,158,217,15,105,165,198,86,
+    227,66,109,55,162,146,85,133,68,181,209,22,209,212,224,214,
+    253,8,109,74,11,118,105,234,75,117,25,214,59,99,123,221,
+    93,173,50,179,106,98,99,136,15,134,186,144,67,47,37,9,
+    228,144,66,48,20,251,144,67,15,253,5,61,75,101,161,102,
+    65,80,40,57,248,166,224,30,74,78,157,217,149,86,82,236,
+    224,172,150,119,103,159,153,121,244,188,31,243,238,63,96,224,
+    82,187,207,227,47,185,185,11,48,192,208,6,14,172,66,71,
+    170,74,16,96,9,203,182,236,40,85,133,143,21,172,218,170,
+    147,168,38,32,144,192,231,0,39,118,0,78,146,196,158,12,
+    192,190,220,35,172,38,177,246,13,40,165,142,196,75,73,10,
+    70,22,8,99,198,42,185,218,88,89,33,52,120,237,122,99,
+    121,227,83,139,18,211,115,233,198,2,113,184,61,74,136,165,
+    48,72,185,223,19,74,45,76,216,145,20,33,231,63,89,102,
+    30,53,76,47,222,97,14,138,151,7,197,255,192,229,19,80,
+    133,24,84,37,12,171,242,46,88,129,88,218,209,170,138,4,
+    136,202,101,66,46,19,246,182,98,121,7,236,241,231,126,76,
+    86,77,238,130,91,176,42,196,43,65,42,254,195,205,107,233,
+    60,191,150,214,72,30,247,176,188,233,214,60,234,218,54,161,
+    249,21,151,230,61,62,185,240,5,250,236,150,225,212,109,146,
+    55,13,147,3,107,22,161,6,53,215,54,202,33,129,169,14,
+    8,87,186,226,143,127,226,230,103,120,23,120,176,63,57,44,
+    235,225,192,76,255,218,130,91,210,30,15,210,190,212,67,32,
+    216,146,87,225,22,64,49,226,37,95,196,201,87,41,241,88,
+    225,111,177,54,12,184,251,112,177,148,8,84,214,168,243,124,
+    105,8,89,53,203,67,40,120,197,192,152,34,106,212,86,9,
+    163,98,123,144,138,3,18,100,156,48,147,200,109,120,168,238,
+    82,143,19,40,140,216,43,65,178,70,188,155,46,253,46,200,
+    132,81,65,182,85,35,136,89,155,36,72,241,45,17,93,160,
+    136,45,65,10,33,211,54,24,67,136,137,130,16,65,203,111,
+    63,251,138,81,83,175,111,120,107,110,77,95,37,206,21,221,
+    116,157,186,91,35,53,143,233,33,101,47,206,22,97,58,229,
+    197,21,161,76,119,44,68,162,132,232,177,206,114,125,131,142,
+    112,238,205,177,56,191,229,158,131,37,142,179,171,220,252,183,
+    13,218,218,200,143,201,59,201,191,180,137,63,181,137,123,227,
+    15,245,150,86,241,181,74,83,171,28,102,47,222,123,127,87,
+    241,181,137,246,228,76,107,178,236,79,150,119,149,59,163,127,
+    231,222,18,96,182,25,222,199,34,148,102,156,136,110,178,195,
+    132,255,1,197,49,27,76,55,134,7,210,112,109,242,132,244,
+    199,112,93,234,227,235,49,142,226,3,119,38,87,63,213,195,
+    92,49,126,58,215,137,146,137,139,132,243,200,125,124,61,198,
+    7,74,239,44,77,137,23,112,197,248,233,92,39,52,197,37,
+    254,28,79,140,191,36,143,246,82,171,82,177,79,226,152,200,
+    139,75,188,69,37,93,138,9,37,184,148,166,66,64,112,142,
+    146,27,13,194,188,37,151,151,88,160,245,14,68,144,180,106,
+    209,32,131,29,227,250,224,154,12,37,140,87,52,35,215,168,
+    235,8,96,44,92,49,140,141,242,62,115,211,160,184,247,158,
+    137,255,38,234,161,193,216,32,75,132,149,36,122,158,75,162,
+    99,220,48,17,135,124,158,142,11,141,35,188,127,213,120,249,
+    127,221,32,156,99,115,188,127,24,134,38,222,17,251,126,227,
+    102,27,60,201,150,30,23,155,217,217,86,118,214,207,206,138,
+    82,159,60,44,78,251,197,119,195,161,175,77,181,115,51,143,
+    151,154,185,185,86,110,206,207,205,133,103,225,240,82,217,191,
+    20,174,205,250,90,241,73,110,230,254,237,7,183,163,153,203,
+    250,65,166,59,113,177,93,208,127,87,154,133,249,86,97,222,
+    47,204,11,52,119,56,93,57,248,40,28,249,218,229,246,155,
+    211,247,221,7,174,120,189,192,41,31,133,20,23,56,99,123,
+    128,145,147,252,162,63,210,195,61,205,240,166,19,92,120,41,
+    37,26,88,205,112,8,111,96,105,132,28,23,55,108,49,62,
+    135,208,141,134,97,119,103,146,8,97,215,68,40,236,13,84,
+    212,32,21,5,65,139,97,176,186,109,201,36,182,205,187,4,
+    164,175,139,176,136,50,249,56,140,38,77,247,140,88,206,44,
+    16,118,144,222,175,35,73,170,214,1,194,104,170,90,236,128,
+    83,204,40,72,100,182,191,109,102,242,45,117,202,87,167,58,
+    210,136,90,233,0,110,158,202,32,81,24,66,158,51,161,147,
+    225,127,47,150,180,32,237,92,41,187,203,235,60,127,44,172,
+    197,168,75,143,54,60,203,102,229,222,183,53,116,47,24,51,
+    186,31,86,20,247,198,200,101,193,245,43,136,120,133,119,207,
+    180,15,162,160,125,72,203,64,124,101,184,139,187,220,116,100,
+    8,97,231,61,25,74,29,112,182,73,3,56,221,4,111,15,
+    222,135,160,210,28,190,59,137,55,32,119,235,164,105,190,58,
+    245,84,60,255,61,101,46,84,250,63,246,217,16,78,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/mi_example/directory.py",
+    "gem5.components.cachehierarchies.ruby.caches.mi_example.directory",
+    embedded_module_data,
+    1150,
+    2258);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,87 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,85,77,111,27,69,24,158,217,15,123,29,156,154,
+    143,150,130,26,53,75,155,52,114,41,246,169,73,21,16,34,
+    80,26,33,72,42,212,8,196,94,70,155,157,113,179,102,119,
+    199,157,217,133,38,202,33,135,72,4,137,43,42,149,122,232,
+    1,69,66,225,192,79,224,39,56,200,18,209,74,145,144,16,
+    135,220,28,165,7,148,19,51,227,172,237,13,161,98,61,126,
+    102,246,121,119,94,63,239,199,172,255,4,67,151,121,50,31,
+    221,17,240,8,96,128,97,0,66,232,64,8,176,134,245,64,
+    11,117,71,23,107,3,155,129,17,154,142,9,129,6,230,1,
+    46,108,2,92,36,230,182,14,192,142,158,57,115,10,216,186,
+    7,170,165,3,121,83,133,233,232,2,225,220,189,79,222,79,
+    26,13,194,14,10,61,182,68,191,34,140,249,152,240,3,173,
+    199,92,152,91,230,49,115,189,248,246,194,220,7,52,138,25,
+    13,2,194,188,51,117,126,166,116,18,224,64,12,28,13,67,
+    71,87,122,52,161,7,16,227,148,30,83,3,164,32,88,40,
+    88,152,177,88,223,4,219,98,222,233,59,119,138,216,16,186,
+    205,116,52,39,96,237,227,17,91,92,115,182,96,237,1,109,
+    55,40,179,19,78,108,63,178,227,21,98,47,124,132,62,124,
+    232,134,173,128,216,158,235,9,98,197,39,204,101,222,202,170,
+    205,73,156,180,106,202,75,46,26,45,139,230,178,128,111,134,
+    226,217,2,13,136,225,166,229,232,91,224,33,116,164,42,237,
+    248,82,78,85,45,159,36,125,200,173,33,190,242,254,232,19,
+    1,223,195,71,32,134,3,99,62,228,167,67,150,193,181,14,
+    215,181,109,33,110,39,19,8,68,233,129,16,1,23,171,90,
+    106,242,164,69,88,106,33,228,71,126,140,80,213,72,13,78,
+    130,70,90,140,72,252,53,101,95,166,21,149,0,20,248,17,
+    65,220,95,35,105,9,33,47,112,57,71,136,75,113,34,15,
+    27,199,75,156,121,245,214,106,188,66,163,250,125,18,222,172,
+    123,52,108,209,136,68,49,175,171,253,89,254,124,194,235,44,
+    89,94,237,177,188,30,250,136,244,18,93,199,161,139,188,65,
+    74,90,171,236,156,112,191,54,241,156,76,213,50,217,83,226,
+    73,126,85,192,223,27,96,191,252,210,183,243,223,205,255,94,
+    30,251,173,60,246,195,231,79,233,110,121,186,83,158,110,103,
+    227,72,117,178,41,99,142,220,144,32,148,142,32,20,82,156,
+    4,114,93,70,232,65,226,6,61,139,82,144,142,158,4,236,
+    145,32,16,25,130,236,101,249,107,50,217,239,177,87,4,178,
+    146,132,23,4,92,147,134,91,61,25,217,167,171,193,210,76,
+    23,252,63,96,231,197,102,79,27,42,159,158,213,255,87,117,
+    72,254,187,250,235,0,245,109,207,125,170,239,125,29,54,245,
+    1,223,236,243,200,56,203,15,134,63,107,249,67,39,124,153,
+    253,53,108,26,3,190,217,231,81,255,23,84,207,233,139,75,
+    226,221,80,164,12,19,70,112,181,192,164,57,61,23,186,17,
+    118,99,202,86,63,77,72,66,210,50,35,15,18,194,227,37,
+    122,219,103,105,209,143,80,139,178,56,181,104,18,247,86,21,
+    70,184,104,47,78,238,48,26,138,103,170,26,171,200,26,188,
+    40,243,47,227,176,109,85,153,116,84,52,84,68,188,88,249,
+    229,107,167,78,93,206,120,93,238,93,20,176,1,254,186,252,
+    230,99,250,132,110,25,29,235,210,254,88,245,241,221,39,119,
+    229,250,245,189,201,27,63,34,181,234,88,87,246,199,111,252,
+    178,212,30,159,221,29,159,237,140,207,74,118,108,111,170,214,
+    153,154,81,203,142,53,209,86,67,85,116,177,106,177,11,82,
+    224,171,18,46,74,101,69,132,48,245,68,139,21,65,214,65,
+    50,105,204,22,240,19,80,187,134,154,75,194,27,82,96,75,
+    9,28,244,150,102,90,93,32,193,210,204,25,185,58,13,237,
+    215,222,58,148,243,179,1,109,129,66,101,227,139,118,101,98,
+    215,156,236,152,147,93,205,52,111,117,129,128,67,29,20,174,
+    229,24,5,61,49,37,21,71,49,29,9,111,214,232,114,83,
+    228,141,159,84,47,137,253,128,215,178,127,0,21,70,122,209,
+    61,121,253,163,252,177,30,10,247,138,132,126,156,199,214,59,
+    189,51,248,46,147,167,72,54,25,103,2,186,58,132,176,59,
+    13,224,100,27,76,12,143,63,192,245,118,126,236,129,183,219,
+    249,209,45,84,160,136,225,223,208,62,95,61,148,243,179,51,
+    108,74,211,63,199,183,188,16,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/mi_example/dma_controller.py",
+    "gem5.components.cachehierarchies.ruby.caches.mi_example.dma_controller",
+    embedded_module_data,
+    1000,
+    1873);
+
+} // anonymous namespace
+} // namespace gem5
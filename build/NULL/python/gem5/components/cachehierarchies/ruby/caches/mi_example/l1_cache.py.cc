@@ -0,0 +1,108 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,85,205,111,19,71,20,159,221,245,122,215,31,216,
+    113,33,34,106,192,118,90,154,212,80,236,130,194,87,18,85,
+    5,162,86,136,18,169,133,30,106,33,141,54,59,99,216,176,
+    31,102,102,13,4,89,106,14,72,77,37,110,85,11,149,122,
+    200,41,82,69,14,185,244,255,176,209,74,88,43,165,170,84,
+    113,200,109,17,84,170,56,117,102,109,175,109,10,66,216,163,
+    55,111,222,155,125,111,230,247,126,51,243,55,24,250,201,189,
+    254,121,141,137,7,0,1,36,152,192,18,170,130,37,86,69,
+    75,170,74,2,64,34,146,204,152,37,87,229,80,143,153,113,
+    75,169,42,76,151,81,220,84,173,68,53,193,116,5,169,102,
+    210,74,85,83,2,16,193,151,0,37,238,1,148,196,169,77,
+    9,128,71,82,63,89,53,141,82,151,65,41,189,203,7,37,
+    201,79,157,55,29,253,198,162,99,105,134,237,239,185,132,41,
+    213,174,225,115,141,90,13,19,63,241,77,99,121,245,188,166,
+    95,199,187,113,62,91,240,165,11,151,207,178,46,225,220,194,
+    132,24,8,211,93,185,235,72,159,93,166,46,209,116,247,188,
+    67,240,174,216,53,102,251,198,175,142,133,81,244,225,93,39,
+    251,187,190,202,196,15,108,223,24,84,5,4,170,34,18,176,
+    132,68,28,67,18,150,81,12,199,145,140,149,90,114,29,212,
+    4,20,191,151,174,170,34,192,9,156,220,20,216,174,132,126,
+    48,164,220,3,155,172,127,20,133,175,166,214,193,29,161,154,
+    102,123,85,125,165,183,0,63,70,141,187,216,151,53,74,29,
+    221,143,233,108,173,126,210,213,200,53,236,66,131,106,126,82,
+    55,111,64,20,98,161,171,67,107,229,187,231,8,62,255,147,
+    137,159,133,7,192,21,6,206,209,188,27,67,158,193,175,41,
+    53,229,77,134,202,35,177,111,17,128,43,15,249,133,166,216,
+    4,27,210,235,190,29,141,191,37,140,214,179,9,96,44,210,
+    21,54,138,162,54,99,27,241,183,199,99,95,40,125,29,1,
+    134,150,184,84,146,72,150,141,200,24,19,126,150,50,124,24,
+    58,54,194,119,224,178,225,50,52,101,218,168,51,118,168,144,
+    89,13,23,66,194,83,250,99,12,196,115,156,75,151,25,196,
+    231,12,151,250,41,157,99,126,9,91,14,89,37,123,249,156,
+    125,4,223,108,24,4,83,72,177,141,32,190,101,232,108,94,
+    102,48,48,28,155,150,18,172,76,216,172,13,45,66,177,177,
+    123,219,33,55,72,46,92,82,24,23,154,134,141,33,175,39,
+    121,143,79,12,19,36,32,212,77,86,93,8,105,130,141,139,
+    189,223,218,203,37,74,244,74,125,213,189,238,216,149,107,216,
+    58,81,209,29,171,238,216,216,118,105,37,12,119,221,192,68,
+    35,58,235,104,133,48,218,119,173,180,98,25,16,223,209,172,
+    186,137,43,230,49,24,26,203,245,85,178,159,69,191,59,214,
+    163,85,185,143,196,199,204,74,77,38,254,93,3,255,236,3,
+    137,204,143,202,125,229,137,58,241,88,157,120,184,127,163,210,
+    86,143,123,234,241,150,122,252,233,228,161,78,110,252,225,183,
+    219,139,79,102,47,60,158,189,208,158,189,232,205,94,12,36,
+    241,64,242,25,96,226,5,23,235,49,79,157,8,84,48,249,
+    209,122,236,126,182,147,255,224,73,254,212,227,252,169,118,254,
+    140,151,63,195,157,147,173,176,61,231,165,211,35,98,129,46,
+    85,67,186,94,21,248,133,242,102,178,178,226,71,190,225,89,
+    72,216,18,71,15,24,155,25,101,104,10,43,67,244,91,137,
+    236,3,34,190,53,214,128,164,163,177,34,251,59,196,138,72,
+    206,98,13,142,2,88,137,236,48,202,240,214,88,209,81,120,
+    37,86,100,31,196,10,15,139,180,116,133,221,115,138,67,16,
+    38,24,149,84,194,63,242,51,150,102,35,205,101,180,255,186,
+    129,27,216,31,227,180,199,212,253,130,56,86,247,30,82,12,
+    27,214,29,226,250,170,211,112,187,90,142,29,11,198,72,138,
+    7,179,50,53,135,220,214,8,186,226,116,199,217,254,148,158,
+    161,36,146,3,44,31,57,200,4,229,101,40,22,73,145,47,
+    96,143,238,216,54,214,221,48,61,189,59,222,231,233,136,121,
+    158,127,245,11,19,107,224,105,254,200,175,206,111,78,72,170,
+    157,226,209,109,212,42,206,183,139,243,94,113,158,155,14,118,
+    74,159,110,21,66,205,83,167,119,166,202,219,110,107,106,161,
+    61,181,224,77,45,112,107,190,115,248,216,86,37,212,60,117,
+    102,39,127,100,123,177,149,63,51,196,211,206,244,81,111,250,
+    100,168,122,234,135,59,133,79,182,175,180,10,115,237,194,156,
+    87,152,227,214,3,157,153,178,55,115,42,84,61,245,80,43,
+    108,100,138,45,173,180,135,95,51,182,102,97,8,253,36,132,
+    150,131,26,38,215,211,16,222,108,104,102,207,35,177,103,198,
+    151,12,219,37,252,85,33,188,90,132,23,42,60,166,132,223,
+    228,36,205,197,145,16,156,222,29,161,99,211,132,176,36,144,
+    2,7,130,179,224,243,16,61,146,233,139,25,238,248,9,132,
+    199,185,255,15,196,156,60,247,87,38,23,200,172,15,226,96,
+    108,111,160,112,45,9,178,147,65,138,107,25,48,62,17,100,
+    185,54,6,198,139,65,142,107,224,77,98,26,196,179,107,223,
+    173,127,223,150,11,158,92,8,196,132,124,58,0,76,60,147,
+    64,188,56,98,121,69,132,240,132,171,92,98,32,37,173,19,
+    101,103,121,133,213,150,118,55,206,121,216,189,151,99,236,97,
+    163,33,36,126,166,225,26,38,45,247,31,239,16,24,127,162,
+    78,28,157,61,251,14,161,101,173,247,94,67,254,50,134,88,
+    250,185,200,214,191,254,186,80,242,204,191,131,238,42,56,106,
+    47,213,133,110,113,62,35,167,1,127,222,24,116,127,48,17,
+    72,130,32,4,39,99,130,24,128,119,17,105,32,76,182,192,
+    251,195,173,3,14,183,70,91,7,156,108,141,182,14,168,180,
+    70,91,16,207,11,12,178,255,139,117,231,25,239,94,188,198,
+    21,110,235,63,198,206,68,93,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/mi_example/l1_cache.py",
+    "gem5.components.cachehierarchies.ruby.caches.mi_example.l1_cache",
+    embedded_module_data,
+    1336,
+    2468);
+
+} // anonymous namespace
+} // namespace gem5
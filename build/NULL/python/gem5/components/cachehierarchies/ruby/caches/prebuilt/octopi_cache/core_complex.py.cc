@@ -0,0 +1,277 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,189,58,77,111,27,71,150,213,205,175,38,217,20,41,
+    137,18,245,101,137,250,160,36,202,142,62,44,137,113,98,39,
+    99,143,61,113,146,209,200,193,56,192,14,56,227,233,165,216,
+    237,136,50,63,148,106,42,182,181,50,54,7,3,171,0,62,
+    100,0,15,162,195,28,132,197,34,200,192,57,228,48,11,204,
+    97,177,167,253,1,36,209,128,136,6,2,104,177,24,44,114,
+    163,17,15,176,200,105,223,171,38,187,155,95,177,54,217,93,
+    186,253,234,213,235,87,85,175,62,222,71,189,214,127,16,219,
+    207,93,47,191,253,39,0,159,17,153,200,92,150,228,184,36,
+    151,227,147,60,135,117,62,235,200,57,147,206,156,43,233,98,
+    117,71,214,157,243,36,61,12,119,102,133,156,55,233,101,184,
+    43,235,203,249,147,126,134,187,179,98,46,144,12,48,220,147,
+    237,201,5,147,65,134,11,217,80,174,55,217,11,184,87,246,
+    101,251,114,253,201,254,92,56,25,206,13,36,7,114,131,201,
+    65,142,240,228,38,145,253,143,137,44,42,46,101,224,115,39,
+    33,207,156,13,81,147,17,57,112,155,196,123,190,193,74,156,
+    215,157,27,25,181,168,187,222,223,219,205,42,80,13,252,114,
+    111,235,225,109,229,195,61,37,159,86,168,238,189,189,183,117,
+    251,161,90,84,114,113,78,15,92,219,82,139,52,149,46,254,
+    180,144,162,50,16,60,27,43,215,83,233,109,133,161,23,45,
+    116,181,129,138,141,22,215,11,20,235,142,119,110,95,251,134,
+    195,129,157,186,31,71,250,217,131,226,70,38,127,207,168,188,
+    147,55,42,97,172,108,42,197,251,5,122,239,122,33,183,91,
+    200,43,249,162,238,67,234,47,11,123,69,133,166,237,107,31,
+    110,172,253,23,108,237,21,146,228,100,146,228,101,46,233,128,
+    255,78,197,37,243,143,201,231,240,238,153,217,36,233,6,170,
+    163,141,234,145,157,138,32,187,20,175,226,27,54,169,178,91,
+    241,203,30,69,148,5,40,189,80,250,160,244,67,41,66,25,
+    80,196,187,97,185,231,177,51,25,144,131,143,73,178,71,14,
+    1,12,202,189,138,239,46,47,247,1,61,36,247,3,165,87,
+    14,3,236,147,7,0,246,203,131,176,254,17,221,143,107,130,
+    211,203,42,15,40,15,35,165,57,219,172,28,245,255,223,38,
+    216,172,14,200,3,110,199,146,137,219,15,0,63,47,153,148,
+    3,210,244,214,71,200,109,242,71,126,147,6,112,173,57,93,
+    144,210,48,152,148,145,255,8,123,144,206,170,42,14,21,253,
+    238,142,74,211,75,187,15,139,219,133,252,210,7,74,110,125,
+    41,221,88,109,117,41,141,91,184,157,81,104,138,166,161,80,
+    151,40,44,191,65,85,151,118,169,178,181,151,201,22,151,10,
+    233,98,97,55,35,49,242,18,27,35,109,204,104,113,247,161,
+    46,74,31,40,197,198,200,251,67,182,249,46,218,223,188,9,
+    178,168,19,0,62,38,167,130,255,80,124,34,30,113,101,97,
+    24,145,106,176,239,201,193,81,170,28,156,40,9,19,223,146,
+    255,131,69,162,3,198,10,133,36,187,244,32,21,141,160,88,
+    108,157,40,158,6,61,108,201,108,113,237,71,59,207,202,226,
+    184,142,221,204,52,102,87,18,198,52,97,236,24,230,55,105,
+    160,48,67,45,56,125,12,83,156,43,9,115,116,20,71,114,
+    109,161,126,233,46,236,73,213,133,236,74,70,82,51,251,138,
+    238,69,44,165,170,133,52,18,101,147,40,215,137,158,236,69,
+    131,38,0,210,32,173,54,72,171,6,41,45,118,90,192,18,
+    135,11,88,180,45,238,142,137,31,144,47,185,207,161,246,204,
+    164,112,164,232,58,43,231,129,243,128,72,14,147,195,5,53,
+    211,22,29,184,161,102,246,116,224,129,154,219,172,9,80,243,
+    152,53,47,212,4,179,230,131,154,215,172,249,161,230,51,107,
+    28,212,252,102,141,135,154,57,227,3,7,212,2,230,17,192,
+    119,61,141,218,7,32,189,20,180,102,114,28,34,29,126,205,
+    22,3,90,244,54,240,98,140,216,232,59,230,40,205,235,1,
+    45,250,109,99,132,73,135,31,180,54,121,218,86,147,28,15,
+    188,92,46,244,18,96,99,28,155,160,238,78,85,201,222,253,
+    230,42,80,227,131,20,87,23,140,129,148,201,103,138,146,68,
+    113,138,186,87,50,15,152,79,178,78,24,146,101,139,220,56,
+    99,130,212,56,100,94,201,60,101,64,92,53,137,245,115,166,
+    187,37,227,24,187,37,227,28,139,18,90,16,73,101,222,4,
+    245,13,109,134,148,205,228,21,163,233,160,36,103,168,2,246,
+    132,62,132,22,249,34,45,100,179,10,85,233,56,8,73,207,
+    33,192,181,214,253,185,84,38,47,81,230,7,116,191,148,146,
+    229,70,37,44,165,169,146,42,42,77,26,24,23,233,121,108,
+    139,246,133,70,89,7,54,49,232,36,146,167,16,76,35,64,
+    61,165,184,145,116,22,193,28,130,121,0,42,30,161,168,237,
+    199,76,2,125,5,192,126,184,201,2,212,151,246,109,108,244,
+    159,4,181,254,175,99,196,219,167,9,35,199,206,146,16,43,
+    11,49,77,136,1,242,53,106,127,236,139,181,146,176,92,22,
+    150,53,97,25,144,211,225,201,67,231,147,158,234,200,52,20,
+    193,106,115,109,104,2,138,64,131,216,84,59,29,28,133,194,
+    95,173,23,99,115,135,78,77,24,174,70,167,176,60,119,58,
+    59,143,229,244,105,116,230,36,250,90,37,250,90,57,122,89,
+    139,94,102,239,190,30,141,85,197,144,38,158,123,238,224,199,
+    124,47,8,0,164,15,213,220,196,27,56,17,134,42,194,208,
+    81,88,27,142,151,133,5,77,88,40,9,11,85,65,60,17,
+    38,43,194,100,89,152,134,62,75,141,135,25,174,38,219,140,
+    56,51,45,120,200,62,107,178,189,112,52,185,205,56,71,47,
+    227,26,46,144,102,51,27,68,27,106,219,227,253,81,251,250,
+    182,188,220,197,198,126,182,204,213,96,191,198,220,68,187,40,
+    124,67,148,175,0,252,3,8,115,72,238,114,50,247,88,248,
+    196,38,212,141,22,29,250,132,72,156,133,31,243,103,209,58,
+    224,115,156,145,207,121,22,62,166,197,252,102,211,100,208,92,
+    162,121,248,246,117,0,191,231,62,99,134,235,78,228,17,247,
+    9,127,220,169,79,48,136,205,70,228,119,252,147,33,8,14,
+    208,233,181,104,76,118,15,116,130,198,29,58,191,184,172,59,
+    145,198,116,71,197,57,69,163,31,179,253,249,206,119,37,11,
+    1,35,106,215,155,251,107,77,71,191,131,246,45,94,201,22,
+    210,169,172,250,230,162,213,106,15,187,92,3,240,95,31,147,
+    26,225,199,125,22,168,46,175,29,222,56,17,99,21,49,118,
+    44,151,197,243,154,120,190,230,104,226,96,155,27,119,209,87,
+    161,208,3,118,177,85,107,54,234,118,138,42,178,97,96,192,
+    172,212,169,202,3,224,202,167,178,104,114,238,169,22,61,147,
+    183,211,173,243,248,183,134,142,191,1,160,197,203,119,152,168,
+    138,173,242,245,73,57,155,68,54,102,118,233,202,191,248,217,
+    92,158,99,245,5,2,212,180,145,154,192,52,173,73,165,78,
+    81,201,166,43,194,180,105,45,218,41,198,195,150,131,190,69,
+    48,206,177,109,57,90,43,118,224,255,209,213,234,214,155,143,
+    216,35,112,129,199,246,211,213,141,207,97,119,248,160,203,14,
+    27,238,180,225,46,27,238,182,225,166,35,223,177,156,56,56,
+    234,29,175,141,199,116,225,59,166,251,62,182,7,43,93,100,
+    179,183,60,14,188,156,31,66,20,24,245,153,53,50,111,5,
+    1,197,9,171,21,4,11,252,142,249,102,39,100,241,219,168,
+    166,251,255,146,255,28,214,228,153,163,19,151,212,215,81,86,
+    211,201,119,151,149,38,154,70,51,251,233,26,56,88,189,159,
+    33,76,104,15,46,172,125,106,146,127,208,164,114,199,145,142,
+    35,119,148,114,103,168,235,72,220,177,117,195,250,113,253,140,
+    252,144,126,94,58,14,104,211,51,83,163,184,230,149,29,237,
+    52,98,243,202,158,229,220,22,47,89,111,118,206,53,176,123,
+    108,84,186,14,51,27,239,212,71,23,201,39,94,242,190,235,
+    204,242,225,110,35,181,58,163,226,53,155,20,100,103,210,134,
+    79,217,240,142,154,46,59,90,116,125,218,134,255,127,233,189,
+    179,77,239,103,58,201,13,43,104,210,109,39,223,190,174,177,
+    142,188,179,29,121,231,58,242,206,91,84,112,241,174,205,184,
+    183,83,40,170,123,242,70,22,132,153,120,61,216,26,50,251,
+    138,41,138,17,81,70,77,233,190,116,246,158,36,23,48,56,
+    2,15,238,249,8,60,98,166,144,215,221,50,107,68,223,195,
+    62,89,54,192,107,11,112,127,65,234,238,67,23,243,123,57,
+    136,221,89,226,70,165,155,72,242,213,61,43,94,134,111,33,
+    35,246,17,143,179,75,4,69,181,163,184,195,116,17,193,18,
+    130,101,4,43,8,46,153,157,191,134,0,175,231,186,119,151,
+    22,210,10,92,13,168,238,105,8,29,98,23,102,136,17,26,
+    162,227,197,214,112,220,20,93,137,238,190,97,137,175,123,85,
+    51,47,229,219,78,169,82,166,32,109,237,169,122,15,220,22,
+    242,112,113,120,231,214,123,5,90,84,117,31,235,157,189,163,
+    152,91,48,25,164,140,17,18,8,16,63,238,50,86,243,141,
+    177,74,122,184,81,191,159,202,222,131,153,27,92,1,236,208,
+    148,158,226,217,212,29,191,186,148,208,123,205,142,49,134,160,
+    123,187,69,189,207,68,37,136,80,89,7,20,143,28,189,136,
+    96,149,212,239,50,236,138,110,140,233,219,218,187,123,87,161,
+    239,23,54,86,116,209,192,223,162,133,220,198,114,83,109,197,
+    198,183,28,119,26,151,26,182,115,158,250,54,1,98,228,83,
+    84,116,200,214,37,229,6,249,254,0,198,104,253,247,192,165,
+    22,121,140,164,191,238,27,253,221,249,167,231,15,61,213,190,
+    193,147,190,233,74,223,116,185,47,166,245,197,14,61,127,25,
+    157,170,14,12,63,253,109,117,112,228,105,193,134,133,135,180,
+    112,76,11,191,82,237,29,168,142,69,181,177,149,106,100,244,
+    233,223,105,145,11,39,145,181,74,100,173,28,73,104,145,4,
+    163,157,68,86,43,145,213,114,100,93,139,172,215,250,125,99,
+    16,14,249,240,226,1,224,208,3,23,143,191,14,146,217,213,
+    106,120,180,218,63,162,245,79,107,253,11,213,200,184,22,153,
+    211,34,23,107,30,231,44,112,3,120,129,128,113,107,194,84,
+    77,36,98,232,201,229,19,255,100,197,63,89,246,79,107,254,
+    233,26,225,188,239,113,85,177,95,19,199,52,113,246,68,92,
+    175,136,235,95,201,127,186,119,146,216,168,36,54,202,137,77,
+    45,177,89,22,111,105,226,173,146,120,171,58,119,94,155,187,
+    84,239,110,134,221,111,70,43,194,232,209,77,109,236,130,54,
+    150,208,198,126,82,22,174,106,194,213,146,112,245,229,47,49,
+    140,51,7,214,196,37,59,254,220,229,240,130,236,0,106,12,
+    8,117,193,103,42,254,153,178,127,86,243,207,158,248,23,43,
+    254,197,178,127,89,243,47,255,243,245,63,221,172,248,47,151,
+    252,151,225,130,118,34,78,85,196,169,106,40,162,133,162,90,
+    104,65,11,189,97,195,87,161,227,64,15,116,28,232,169,89,
+    192,71,2,189,70,179,178,56,163,137,51,37,113,6,119,47,
+    60,244,244,23,198,198,217,247,108,120,196,220,54,216,180,31,
+    188,121,181,65,50,127,193,182,152,112,139,140,47,107,243,151,
+    180,249,235,117,82,172,58,251,138,54,155,208,102,27,132,233,
+    211,224,224,97,79,251,149,13,45,11,139,96,143,72,107,4,
+    123,208,148,112,218,225,109,184,25,125,89,49,169,204,117,139,
+    74,33,98,3,252,153,45,74,181,165,155,154,35,92,147,110,
+    165,160,234,9,22,195,164,186,173,76,129,97,245,110,35,64,
+    35,74,223,55,76,46,122,42,138,151,30,186,222,193,62,214,
+    45,194,106,221,242,161,209,106,189,23,211,119,186,170,177,253,
+    186,243,103,108,133,198,26,212,120,104,162,211,118,55,239,117,
+    45,224,25,134,109,4,240,2,1,38,21,106,33,18,139,107,
+    51,235,136,107,152,166,196,167,125,135,92,141,29,250,87,254,
+    251,118,168,45,253,101,219,175,206,151,101,251,158,118,136,80,
+    205,157,189,65,238,108,63,226,206,56,46,103,75,51,118,27,
+    151,179,206,73,91,186,243,172,163,216,78,83,215,81,76,158,
+    214,81,158,100,138,65,27,167,61,130,178,173,137,204,181,221,
+    53,236,201,80,114,236,35,29,126,246,248,235,37,171,250,17,
+    172,170,93,14,206,138,203,236,107,244,165,163,57,150,132,217,
+    91,137,214,110,82,112,59,38,79,219,26,55,143,25,176,225,
+    150,206,182,143,105,70,90,223,51,166,201,211,182,226,247,153,
+    30,59,55,233,5,168,67,220,36,40,15,138,82,190,32,179,
+    32,161,142,133,182,82,121,249,126,70,46,110,75,119,83,152,
+    159,140,243,44,241,68,63,196,54,65,150,150,100,26,173,123,
+    65,133,141,196,20,189,130,196,183,13,226,74,35,67,233,5,
+    167,95,127,143,34,81,76,24,232,61,102,35,150,129,208,3,
+    44,167,137,114,96,149,254,202,224,89,177,243,208,187,6,241,
+    162,157,8,82,177,160,224,30,0,21,87,168,17,0,188,11,
+    96,127,170,147,229,104,78,137,252,27,54,204,112,44,103,233,
+    38,35,51,199,55,192,10,148,135,19,218,112,130,229,28,209,
+    193,25,25,193,63,140,151,133,121,77,152,47,9,243,167,104,
+    70,226,53,226,244,46,51,112,120,243,235,232,194,23,107,218,
+    249,43,229,232,27,90,244,141,195,155,154,120,142,185,176,177,
+    138,56,118,244,55,218,185,197,178,184,4,238,176,36,46,157,
+    157,19,30,16,105,98,1,109,217,29,195,160,157,155,128,136,
+    96,2,35,130,9,140,8,38,88,58,101,20,252,30,166,83,
+    70,42,194,200,209,154,54,186,88,22,150,52,97,169,36,44,
+    85,235,114,10,222,87,25,0,57,99,203,213,225,168,54,28,
+    255,234,166,182,246,179,154,131,159,237,121,78,0,188,64,128,
+    194,76,129,255,66,39,58,94,17,199,143,238,107,19,235,101,
+    49,161,137,137,146,152,248,17,77,225,169,245,54,132,248,30,
+    171,186,201,183,102,77,65,51,127,3,154,105,179,42,54,223,
+    199,217,252,21,103,105,115,179,182,252,134,199,140,207,35,199,
+    1,223,100,15,29,45,118,203,244,118,77,90,196,119,248,20,
+    209,153,211,209,166,101,119,254,7,243,176,103,147,76,251,215,
+    97,30,206,71,174,3,39,72,110,89,62,23,212,172,207,64,
+    221,164,115,158,121,30,174,246,121,116,145,218,118,115,181,75,
+    221,110,169,153,228,238,71,30,246,225,203,178,150,30,251,103,
+    169,174,242,184,207,44,185,167,149,179,17,173,48,43,199,81,
+    138,69,15,51,79,20,173,174,62,82,55,8,91,25,227,27,
+    12,220,28,205,132,104,17,185,48,105,171,7,192,10,21,11,
+    248,217,199,48,84,128,96,117,197,110,183,208,106,50,19,133,
+    201,125,61,104,176,176,140,61,99,10,50,212,234,132,170,6,
+    219,106,55,182,85,195,182,9,150,109,99,87,68,214,3,187,
+    68,49,9,116,159,53,144,238,179,198,0,250,106,7,250,170,
+    138,123,212,252,45,231,231,164,155,149,108,78,16,255,59,240,
+    169,27,204,74,54,108,159,199,107,0,176,41,147,23,180,201,
+    155,44,56,159,60,126,85,155,94,123,238,224,167,208,44,76,
+    245,148,197,241,195,183,63,221,6,195,16,123,5,77,196,100,
+    117,230,130,81,162,201,99,134,226,65,89,156,215,196,249,146,
+    56,223,137,6,143,53,224,121,6,152,17,211,98,63,175,15,
+    184,166,77,175,62,119,52,236,80,89,156,58,124,247,200,7,
+    3,206,173,224,64,211,213,217,101,163,52,59,223,47,139,11,
+    154,184,80,18,23,58,209,224,249,139,49,31,184,168,108,30,
+    221,128,59,207,159,41,24,187,41,204,97,79,97,14,123,202,
+    87,22,198,15,125,159,190,11,131,68,23,208,0,143,85,39,
+    226,70,137,222,130,153,225,215,203,194,172,38,204,150,132,217,
+    78,52,227,97,134,112,51,30,198,111,147,249,84,78,145,36,
+    221,39,73,185,130,188,151,69,92,148,164,15,247,82,89,227,
+    13,197,156,140,17,50,251,211,217,148,170,230,148,226,118,65,
+    54,50,18,236,99,33,42,5,69,157,163,168,150,186,67,45,
+    82,221,1,187,200,190,215,209,171,164,158,213,103,55,99,22,
+    87,51,23,201,78,0,197,207,245,70,86,157,157,138,254,6,
+    192,175,45,106,130,109,123,227,95,53,24,250,248,237,106,100,
+    168,228,12,159,186,66,53,158,119,69,107,4,192,115,7,113,
+    247,62,254,181,65,16,0,71,108,30,95,205,219,94,205,215,
+    132,89,215,204,105,112,172,230,130,18,22,48,20,254,116,67,
+    11,78,214,60,88,245,145,254,193,154,31,49,145,132,35,181,
+    0,98,61,72,11,34,22,66,90,47,98,125,164,111,160,214,
+    143,88,24,223,14,32,54,136,180,8,98,67,72,27,70,140,
+    52,131,247,56,14,133,53,129,219,231,154,173,17,19,12,189,
+    234,138,124,49,86,35,80,180,2,202,121,93,137,26,49,193,
+    208,168,11,124,153,9,94,31,113,205,213,72,59,48,150,180,
+    159,237,242,144,238,46,62,220,205,228,63,48,246,8,13,62,
+    232,230,250,98,97,107,7,76,143,202,18,63,198,151,234,24,
+    254,81,202,162,245,71,41,139,236,139,178,186,152,170,255,85,
+    145,241,133,153,237,183,254,86,43,111,235,31,176,44,226,119,
+    95,131,170,46,230,20,53,35,21,183,169,162,72,89,229,35,
+    37,187,104,166,157,132,255,141,206,234,185,29,150,249,249,209,
+    157,53,174,133,232,219,244,249,214,206,204,188,148,109,89,216,
+    167,59,118,246,189,140,61,163,166,84,35,109,21,97,31,191,
+    235,89,69,201,234,198,136,71,209,23,176,63,10,48,98,218,
+    254,118,133,248,78,184,98,104,229,155,244,136,24,31,121,213,
+    109,128,53,7,199,113,181,132,131,227,107,228,229,192,119,86,
+    62,194,93,229,74,228,39,246,7,116,7,95,119,3,238,31,
+    243,150,112,63,133,225,174,217,159,42,25,46,53,63,53,167,
+    11,27,252,48,16,186,230,224,64,35,58,195,79,227,165,115,
+    43,207,25,250,162,11,11,219,137,255,6,224,248,182,239,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/prebuilt/octopi_cache/core_complex.py",
+    "gem5.components.cachehierarchies.ruby.caches.mesi_three_level.core_complex",
+    embedded_module_data,
+    4047,
+    10363);
+
+} // anonymous namespace
+} // namespace gem5
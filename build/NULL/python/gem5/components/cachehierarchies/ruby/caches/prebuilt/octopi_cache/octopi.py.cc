@@ -0,0 +1,329 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,189,90,219,111,27,199,122,159,229,146,212,146,92,82,
+    164,68,234,106,73,212,205,18,37,153,146,44,249,146,88,242,
+    77,190,91,150,211,56,237,105,217,147,108,100,114,109,83,225,
+    69,89,174,82,219,160,211,60,248,52,242,65,30,212,135,32,
+    46,144,131,170,64,17,216,136,31,212,62,249,169,200,67,255,
+    0,82,24,64,196,22,2,124,80,248,33,15,5,40,68,6,
+    14,210,151,206,55,203,189,73,43,41,73,211,82,171,111,191,
+    153,249,230,246,205,55,51,191,111,118,254,19,153,126,238,218,
+    251,135,151,132,124,133,82,40,197,100,80,150,73,48,89,71,
+    194,145,101,19,44,131,82,142,20,155,113,102,93,9,23,229,
+    157,25,119,182,46,81,71,121,87,134,203,122,18,30,202,187,
+    51,222,172,47,225,163,124,93,134,207,250,19,126,194,115,41,
+    79,38,144,173,79,212,19,222,155,242,101,130,217,80,34,68,
+    120,62,229,207,52,100,27,19,141,148,15,100,194,217,72,34,
+    66,249,250,76,83,182,57,209,156,109,73,180,100,91,19,173,
+    12,114,160,203,40,21,124,140,82,33,49,36,214,127,227,68,
+    232,91,167,214,252,68,91,170,225,22,138,53,126,15,129,24,
+    171,240,23,110,156,187,37,126,188,36,230,146,162,164,248,223,
+    93,186,253,224,157,188,36,191,35,229,239,63,80,188,16,188,
+    245,160,32,139,217,239,161,223,49,70,9,205,228,239,137,18,
+    72,19,17,57,159,204,103,72,164,255,220,237,130,44,205,39,
+    229,243,249,121,41,69,34,60,23,210,146,152,148,243,210,3,
+    72,37,85,204,228,115,178,148,207,100,68,137,68,112,18,169,
+    144,8,20,190,119,170,133,70,181,252,239,221,147,68,113,86,
+    252,68,204,204,204,39,239,137,87,210,162,52,47,37,239,61,
+    248,158,85,5,219,52,65,104,216,14,17,70,21,241,205,228,
+    37,113,38,159,93,204,136,247,161,242,155,164,25,139,233,57,
+    81,254,155,188,244,17,233,176,15,178,94,188,47,207,166,115,
+    31,169,129,171,57,53,64,123,251,110,126,73,22,165,164,121,
+    196,195,218,136,39,232,136,139,40,193,164,80,194,145,98,68,
+    54,229,16,157,41,150,188,157,228,237,34,111,55,121,215,145,
+    55,71,222,30,242,239,21,93,119,194,41,223,99,103,194,157,
+    226,197,186,148,63,21,184,227,76,213,147,48,7,35,148,240,
+    164,66,132,122,83,1,50,38,13,138,79,109,44,237,152,194,
+    101,198,211,66,33,253,80,84,60,192,205,23,10,249,36,68,
+    166,244,200,84,45,178,46,115,84,141,227,8,163,69,77,104,
+    81,19,181,168,134,220,82,86,72,18,229,16,66,181,35,22,
+    20,127,186,32,220,89,202,100,10,116,140,147,62,83,175,129,
+    7,173,255,240,111,180,215,50,99,36,45,232,124,17,189,96,
+    190,33,161,111,245,24,6,201,46,123,201,34,83,116,20,217,
+    162,179,232,42,186,139,117,69,238,133,227,27,15,201,233,49,
+    114,222,37,82,2,171,133,105,200,105,9,185,44,33,183,94,
+    182,135,132,234,244,144,151,132,56,45,148,66,68,179,236,28,
+    177,4,103,65,204,220,137,121,164,94,18,43,181,0,105,5,
+    210,6,164,29,200,33,32,29,64,58,129,116,129,61,121,164,
+    122,242,82,56,65,72,231,210,178,32,72,126,8,54,9,41,
+    205,190,137,50,53,203,46,40,65,33,149,157,183,196,212,11,
+    233,252,142,136,29,67,208,40,216,140,75,64,176,12,76,204,
+    247,179,90,45,69,129,116,19,82,128,81,140,26,191,31,127,
+    83,144,146,163,139,15,228,123,249,220,232,93,49,123,108,20,
+    234,204,231,196,156,92,24,77,130,217,221,171,205,167,180,88,
+    24,149,200,124,80,99,11,163,139,146,120,123,41,157,145,71,
+    243,212,68,5,26,93,11,196,23,31,72,125,164,162,135,97,
+    147,253,198,53,149,77,67,59,126,71,200,103,232,77,27,242,
+    244,98,110,120,45,92,226,142,151,185,227,152,59,78,152,77,
+    110,16,115,227,149,80,164,18,233,168,52,117,213,104,184,29,
+    24,74,171,141,94,143,119,11,17,178,13,164,74,73,11,26,
+    136,45,59,49,215,91,137,246,192,187,163,210,213,13,239,67,
+    250,187,247,24,188,163,149,206,97,120,183,151,232,243,3,24,
+    133,226,186,13,11,149,226,150,68,121,73,202,205,37,29,38,
+    195,119,106,134,255,14,225,62,71,159,51,159,179,159,59,173,
+    19,64,54,201,47,232,252,238,169,240,132,89,101,145,205,239,
+    27,242,255,173,30,122,228,144,61,123,165,61,49,25,125,202,
+    241,4,45,232,33,195,252,229,122,100,146,55,36,172,173,177,
+    228,213,167,7,105,161,169,238,189,90,177,234,61,88,230,247,
+    172,220,108,106,7,187,171,118,94,227,31,18,141,253,222,185,
+    204,46,51,203,206,101,68,150,67,246,49,39,183,91,250,160,
+    203,90,75,185,176,91,59,1,187,254,45,232,253,91,53,233,
+    198,82,131,158,111,215,152,161,213,160,109,158,221,163,139,86,
+    67,246,146,150,81,32,189,253,214,97,228,218,79,75,150,52,
+    180,208,96,223,198,135,187,37,27,247,150,180,140,123,216,148,
+    199,70,91,11,145,253,211,133,166,3,242,55,239,159,46,180,
+    28,144,191,245,128,252,109,251,167,175,154,172,200,248,89,109,
+    134,140,192,91,123,165,89,116,213,161,199,50,171,157,118,229,
+    90,218,160,75,47,116,233,101,239,176,23,186,21,57,97,43,
+    106,79,106,32,74,88,172,161,40,161,134,137,82,18,88,102,
+    210,180,216,32,48,97,24,224,31,190,35,228,75,178,20,193,
+    238,247,126,226,17,99,94,146,158,176,79,28,69,230,137,243,
+    33,105,82,145,224,19,58,244,52,244,59,71,171,33,229,50,
+    118,100,194,59,76,60,107,226,157,38,222,101,226,221,38,190,
+    206,196,115,38,94,95,78,200,114,72,118,159,111,117,76,241,
+    247,142,47,254,154,40,192,33,193,244,34,59,218,17,4,11,
+    49,108,124,5,197,7,91,141,160,110,118,63,121,111,246,74,
+    48,253,164,9,40,199,35,232,104,201,43,24,112,9,162,83,
+    70,180,6,152,56,65,67,76,30,65,135,76,36,114,66,143,
+    172,129,166,152,91,113,196,199,148,160,121,123,22,210,169,251,
+    138,103,62,147,161,155,118,65,237,71,155,182,137,23,132,69,
+    81,178,108,231,116,235,46,128,234,162,209,207,200,79,26,38,
+    236,143,222,169,76,186,32,131,200,233,135,227,230,109,51,157,
+    35,153,23,243,210,188,44,170,155,108,124,42,147,79,206,103,
+    10,167,227,70,150,28,20,249,37,33,127,250,12,85,81,99,
+    151,215,68,250,80,168,251,77,47,242,183,84,154,218,233,70,
+    218,87,105,26,219,98,153,200,120,101,242,194,119,31,151,39,
+    175,168,225,201,241,42,235,136,140,111,179,206,230,134,170,23,
+    117,116,227,67,35,149,214,142,175,59,43,109,157,95,143,154,
+    184,150,67,95,251,213,160,206,85,187,130,254,192,22,34,100,
+    27,72,149,181,52,65,26,129,225,137,74,48,244,18,216,137,
+    18,188,113,241,214,85,225,189,43,239,94,188,40,204,94,252,
+    139,139,179,74,227,93,81,86,251,39,100,210,57,145,42,94,
+    114,233,227,9,250,188,77,20,153,191,35,124,146,150,228,165,
+    249,140,144,83,33,124,65,130,101,81,169,171,5,21,63,20,
+    68,102,81,82,36,3,38,41,30,90,46,53,42,54,35,230,
+    164,24,181,50,105,62,119,87,84,2,59,80,86,208,162,235,
+    100,170,160,116,8,73,73,132,144,61,190,107,214,147,173,48,
+    79,58,12,13,31,128,170,66,96,8,164,213,5,205,167,42,
+    16,203,75,231,100,232,229,71,5,197,99,176,94,65,188,175,
+    71,27,44,39,72,212,5,41,40,117,26,227,47,16,152,178,
+    40,220,94,186,115,7,42,131,217,169,4,200,100,17,72,211,
+    105,223,137,171,214,72,154,147,35,77,174,77,34,154,164,112,
+    233,28,101,10,49,151,10,32,169,173,214,239,84,251,105,72,
+    58,3,38,5,3,240,225,135,209,179,103,169,145,42,161,93,
+    198,248,176,99,95,91,253,0,10,113,144,101,229,79,228,247,
+    25,218,228,130,155,131,111,225,193,107,196,210,0,193,57,0,
+    193,57,0,193,1,225,80,123,116,163,109,98,189,109,162,220,
+    118,12,183,29,91,174,127,221,222,255,15,83,95,79,1,92,
+    107,121,117,252,4,125,99,110,98,179,119,108,45,140,199,207,
+    149,123,207,227,222,243,181,216,104,213,141,34,109,27,225,129,
+    245,240,64,57,28,195,225,216,70,120,98,61,60,81,14,31,
+    195,225,99,203,158,205,254,193,103,173,255,244,193,63,127,176,
+    38,227,19,55,203,253,55,75,92,79,213,105,157,42,54,228,
+    77,31,234,31,122,214,135,135,206,151,251,102,112,223,76,181,
+    159,68,110,65,202,54,16,138,36,171,67,200,227,87,27,177,
+    193,141,175,115,227,107,125,248,232,197,50,119,9,115,151,74,
+    220,165,87,28,191,193,13,173,115,67,207,142,149,185,113,2,
+    109,75,4,221,66,92,223,58,215,183,250,231,207,46,224,145,
+    169,50,55,141,185,233,18,55,253,198,141,252,193,21,207,147,
+    185,47,230,54,3,161,149,62,220,48,80,14,12,226,192,32,
+    153,161,254,216,107,53,234,112,57,48,128,3,3,91,46,135,
+    127,176,202,106,149,15,85,131,200,31,194,252,33,204,247,97,
+    126,212,72,136,66,26,183,79,154,27,141,140,225,225,83,120,
+    120,6,15,207,106,250,196,220,32,105,165,214,173,248,58,23,
+    47,115,99,152,27,43,113,99,111,56,52,124,242,249,232,139,
+    209,154,236,64,133,243,111,112,221,235,92,247,106,31,238,57,
+    138,123,206,225,158,107,101,238,58,230,174,151,180,135,46,2,
+    22,96,13,75,32,5,214,63,58,84,96,253,21,34,16,16,
+    221,33,158,244,99,142,108,178,200,238,103,221,160,109,0,160,
+    25,98,154,128,226,251,129,71,0,151,245,250,139,14,65,231,
+    191,168,39,181,50,41,7,129,157,250,46,70,32,149,9,8,
+    155,203,178,110,227,7,2,82,151,169,12,151,33,247,126,247,
+    35,214,220,30,99,47,93,53,181,193,248,21,217,157,240,225,
+    139,30,2,148,145,108,130,156,230,86,238,13,57,109,218,232,
+    49,229,242,24,114,164,141,206,61,218,104,235,0,20,157,187,
+    219,120,23,61,114,237,232,249,167,143,44,174,129,1,238,139,
+    123,104,100,193,111,223,147,223,18,238,145,251,81,93,209,181,
+    170,195,119,75,123,220,197,186,187,142,221,48,221,182,71,182,
+    142,65,209,253,191,202,93,183,75,31,127,91,36,218,16,116,
+    135,162,6,1,45,240,14,192,19,133,119,18,33,95,58,106,
+    240,110,130,118,150,33,190,161,25,228,57,141,1,55,129,55,
+    246,167,120,153,112,252,98,61,10,36,128,108,242,22,122,78,
+    26,36,129,17,208,141,87,186,0,228,60,33,100,203,152,34,
+    47,197,59,159,74,73,130,186,129,114,217,218,206,66,55,18,
+    21,216,192,72,71,1,217,208,45,67,58,75,200,195,105,203,
+    57,192,126,91,170,29,184,249,71,40,246,55,168,6,110,184,
+    195,94,131,108,5,80,168,127,197,251,244,202,27,63,242,55,
+    85,130,97,28,140,226,224,96,37,24,217,8,198,214,131,177,
+    114,112,24,7,135,43,193,182,74,176,101,203,227,2,120,226,
+    2,120,98,41,68,93,153,204,67,224,210,134,0,58,254,37,
+    83,27,130,246,29,8,219,97,167,124,235,136,19,149,30,186,
+    133,164,223,18,246,57,43,69,44,90,141,177,170,66,25,65,
+    85,28,75,21,247,235,169,13,134,186,112,66,83,27,123,196,
+    107,144,87,193,208,27,22,249,155,87,100,220,60,128,155,71,
+    203,252,24,230,199,170,172,69,104,183,90,220,154,90,142,35,
+    56,2,164,74,105,178,179,75,176,173,23,59,38,43,81,69,
+    51,177,46,230,185,67,225,0,221,228,242,41,17,0,137,202,
+    61,103,164,70,147,78,56,210,75,33,41,75,25,197,11,92,
+    13,248,168,26,138,254,106,26,250,87,208,16,56,127,160,32,
+    215,168,215,32,127,12,246,173,112,79,135,64,73,45,171,45,
+    107,215,74,252,153,50,127,6,243,103,170,172,69,78,69,182,
+    33,21,116,106,147,161,160,68,108,155,160,14,253,21,32,151,
+    161,147,135,236,164,180,190,82,19,81,124,2,153,109,181,40,
+    133,125,152,94,84,58,109,51,25,112,209,79,115,104,97,9,
+    28,124,165,173,166,152,219,105,53,115,58,159,35,248,89,149,
+    15,38,165,124,161,0,104,87,171,198,77,50,139,185,84,173,
+    36,13,159,238,81,177,14,95,99,156,9,81,58,233,208,185,
+    107,5,114,90,107,148,46,219,177,49,193,97,175,198,10,227,
+    38,254,104,1,214,68,130,67,233,79,29,254,235,48,252,177,
+    159,60,252,127,128,161,222,96,0,136,146,193,118,90,230,191,
+    137,4,80,44,190,49,120,106,125,240,84,121,112,26,15,78,
+    87,235,97,145,129,164,109,32,0,119,122,170,13,40,210,138,
+    195,241,42,98,60,99,148,44,95,168,116,245,226,174,209,229,
+    11,4,96,149,248,67,85,167,101,34,81,242,58,210,246,135,
+    137,167,50,238,122,171,220,254,54,110,127,187,28,57,133,35,
+    167,170,46,146,180,5,233,219,64,160,252,24,65,106,205,237,
+    184,233,4,20,253,22,37,203,151,42,124,80,197,110,27,252,
+    216,58,63,182,214,84,230,79,98,254,100,137,62,85,167,102,
+    142,175,7,135,233,26,56,4,152,242,198,22,235,136,145,5,
+    143,144,170,139,36,110,129,196,54,16,168,102,184,202,163,214,
+    14,220,114,10,106,152,166,100,249,138,169,154,163,235,252,209,
+    181,147,101,126,10,243,83,37,250,84,134,70,74,4,233,53,
+    181,209,182,185,61,103,40,89,190,180,217,63,134,251,175,87,
+    130,77,79,157,184,101,16,183,140,225,150,115,164,234,195,80,
+    245,225,64,153,239,89,190,246,212,75,32,166,127,164,86,234,
+    181,239,188,165,137,235,101,126,22,243,179,37,126,118,103,165,
+    111,151,249,211,152,63,93,226,79,239,157,2,137,241,27,180,
+    31,37,250,168,139,149,121,219,131,53,156,162,75,236,2,116,
+    249,21,236,220,122,226,10,35,173,200,38,233,20,99,222,215,
+    95,56,172,75,215,19,211,87,136,34,179,234,68,54,191,93,
+    7,71,122,14,3,1,202,126,100,43,97,169,155,221,89,183,
+    145,102,124,211,120,98,62,228,178,61,176,181,224,20,61,223,
+    174,111,51,145,61,114,248,236,115,16,77,240,251,203,175,154,
+    250,104,41,123,143,35,92,210,134,14,139,156,241,165,134,105,
+    53,199,235,249,95,56,119,141,78,189,73,206,174,77,246,7,
+    184,104,65,207,183,171,77,189,134,156,113,236,106,110,133,125,
+    77,166,131,215,157,109,12,239,159,115,213,52,18,150,54,234,
+    249,204,250,216,23,149,254,156,50,93,123,151,121,23,90,173,
+    31,240,18,187,55,97,118,227,103,181,123,50,175,198,168,47,
+    229,38,190,212,184,33,69,114,183,238,206,187,51,247,65,190,
+    148,105,38,180,217,197,46,152,98,141,150,211,246,212,17,143,
+    18,45,232,113,54,62,80,187,193,47,180,27,114,187,252,180,
+    3,44,221,214,79,227,30,91,14,153,205,45,49,215,118,160,
+    159,214,97,202,213,97,200,237,242,211,14,176,124,59,63,141,
+    106,201,67,181,100,234,189,181,5,84,198,187,191,140,250,137,
+    65,208,15,200,137,108,167,33,251,126,239,158,45,181,181,85,
+    187,150,130,207,68,253,38,223,156,4,5,197,28,74,221,39,
+    100,139,39,168,134,34,44,2,48,253,112,30,167,159,184,169,
+    184,43,5,4,212,97,239,108,221,65,38,164,127,196,14,212,
+    154,247,11,237,68,157,192,92,102,199,76,103,247,222,71,8,
+    4,142,195,215,103,245,196,219,33,61,130,38,129,99,35,125,
+    138,40,246,5,175,90,130,106,104,147,137,31,166,58,8,105,
+    197,73,157,44,234,38,192,238,19,181,250,9,39,108,97,144,
+    245,72,210,14,255,190,134,242,254,18,213,60,4,247,88,192,
+    32,91,94,20,57,180,114,110,69,126,227,65,161,206,205,158,
+    248,218,199,47,199,255,101,233,59,185,212,51,91,238,153,197,
+    61,179,149,104,31,142,142,17,0,19,106,32,0,38,212,176,
+    13,164,202,90,74,249,255,241,172,164,15,145,225,57,4,172,
+    253,222,203,181,250,165,42,251,47,100,113,170,162,1,131,188,
+    10,247,16,127,33,212,254,116,18,183,15,227,246,137,114,112,
+    18,7,39,137,83,101,22,250,63,113,170,232,245,20,233,174,
+    161,5,233,49,168,194,11,253,217,211,117,250,165,26,128,15,
+    230,134,211,212,19,48,200,31,195,241,149,185,213,107,160,132,
+    67,171,31,188,92,40,5,175,150,131,87,113,240,42,113,154,
+    204,114,251,232,96,206,108,21,221,86,171,40,50,246,118,97,
+    224,168,93,186,233,209,124,111,39,117,132,76,39,26,112,182,
+    242,188,166,172,191,67,218,217,197,175,103,39,255,13,197,205,
+    104,118,98,233,62,193,247,145,174,55,117,68,73,149,112,231,
+    170,147,76,34,28,61,137,163,87,9,102,134,89,228,128,89,
+    244,107,232,235,32,109,21,153,61,245,37,45,3,121,242,235,
+    170,132,44,222,102,149,132,2,38,98,82,73,11,14,247,225,
+    240,8,14,79,191,124,104,81,137,57,131,234,119,119,73,67,
+    200,188,96,42,124,58,111,44,251,74,135,230,148,23,210,41,
+    248,204,67,63,177,202,112,1,135,174,166,116,225,133,21,87,
+    241,91,238,228,168,223,109,220,243,139,139,196,11,86,207,108,
+    168,47,30,182,72,213,38,150,148,133,116,24,11,165,201,154,
+    174,187,224,139,32,65,205,239,99,205,242,148,102,171,172,238,
+    0,75,50,136,28,166,141,186,55,95,160,106,85,143,20,60,
+    98,110,41,43,194,151,21,245,176,193,72,169,223,121,199,200,
+    103,154,247,82,142,150,5,49,166,51,2,8,26,158,187,233,
+    91,144,58,67,96,66,40,78,154,72,63,0,25,94,247,44,
+    24,64,239,79,48,128,127,7,219,17,89,58,216,175,124,245,
+    216,215,185,133,218,61,129,205,232,72,165,165,117,85,198,3,
+    39,170,172,163,59,176,133,8,217,6,2,190,115,7,241,18,
+    135,70,55,98,179,235,177,217,114,108,14,199,230,104,44,230,
+    15,111,30,121,187,210,217,131,59,71,95,190,135,167,111,144,
+    172,113,200,26,135,172,113,154,149,120,137,240,25,3,62,113,
+    68,55,248,129,117,126,224,153,19,15,158,196,131,151,202,252,
+    101,204,95,46,241,151,55,7,143,174,77,226,137,25,76,124,
+    207,193,89,60,56,11,249,250,119,122,214,97,60,126,173,204,
+    95,199,252,245,18,127,125,115,232,88,133,56,201,173,71,158,
+    205,227,214,49,202,30,37,59,222,48,169,156,144,109,32,80,
+    200,128,233,227,74,205,85,37,21,205,149,249,155,152,191,89,
+    226,111,190,14,182,227,224,113,106,218,71,204,6,190,229,50,
+    246,77,90,192,32,113,202,173,5,81,119,126,228,217,159,225,
+    224,40,153,12,112,126,73,72,149,18,247,79,23,229,80,119,
+    175,122,39,202,23,220,240,117,174,251,58,203,190,40,246,69,
+    183,80,47,241,253,29,150,61,155,146,55,94,20,141,61,139,
+    108,196,166,214,99,83,229,216,105,28,59,93,238,58,131,187,
+    206,84,125,0,14,64,100,27,72,77,245,35,213,0,234,143,
+    225,190,73,220,119,1,162,186,171,14,203,174,167,238,143,135,
+    135,240,97,56,241,136,130,250,162,160,190,168,90,0,105,95,
+    87,47,238,132,19,21,255,57,70,165,43,94,253,52,119,35,
+    56,185,30,156,92,75,148,131,103,113,240,108,137,62,85,135,
+    182,58,190,62,122,140,234,52,246,108,18,15,159,34,61,159,
+    128,21,99,162,161,234,34,137,91,32,177,13,4,42,234,172,
+    157,121,12,65,21,211,148,172,56,77,213,28,95,15,30,95,
+    147,203,193,41,28,156,42,209,199,168,198,178,126,247,14,224,
+    158,163,85,143,165,130,170,215,186,164,213,214,53,77,52,4,
+    162,33,16,37,156,207,171,53,168,233,231,54,232,50,3,67,
+    70,199,237,2,163,101,82,151,67,31,92,75,204,205,103,69,
+    65,80,188,130,144,205,167,150,50,192,243,130,240,241,210,124,
+    166,150,194,22,100,73,97,201,236,87,156,183,243,249,12,189,
+    168,39,1,12,150,254,10,213,206,213,232,52,87,55,2,40,
+    88,157,250,205,26,121,27,166,246,127,32,0,0,218,95,213,
+    221,229,26,121,213,16,169,186,200,155,24,102,184,185,90,7,
+    28,135,26,155,170,30,224,188,16,231,3,142,71,68,206,15,
+    92,0,82,235,129,11,66,92,8,184,6,136,107,4,46,140,
+    58,162,213,8,112,77,168,229,80,181,25,56,100,37,231,153,
+    105,215,44,179,250,168,138,224,253,50,172,190,109,232,167,76,
+    191,107,142,4,76,116,142,153,97,92,68,123,246,84,237,55,
+    244,118,46,214,174,120,179,199,226,249,219,11,98,82,46,168,
+    155,13,96,112,122,57,65,105,216,125,115,71,189,225,16,53,
+    46,82,198,233,229,194,66,124,190,118,87,89,160,97,170,115,
+    229,188,73,108,231,125,203,56,92,130,81,99,11,241,172,88,
+    72,11,50,92,135,22,50,112,31,58,174,31,115,210,143,53,
+    202,229,95,94,144,21,48,211,29,49,176,36,167,51,36,95,
+    237,94,54,189,185,161,244,233,29,48,101,175,221,217,208,106,
+    123,160,94,136,237,208,69,233,69,158,157,50,244,14,45,111,
+    185,20,19,162,213,214,46,147,214,238,114,168,55,59,154,105,
+    17,181,40,193,232,38,221,117,213,141,53,162,27,168,213,104,
+    127,228,166,212,89,112,90,2,15,21,224,80,225,62,161,85,
+    150,97,152,234,113,39,227,168,162,159,67,120,196,156,40,161,
+    227,230,167,130,206,150,172,79,213,225,0,249,189,136,123,255,
+    84,196,12,149,80,204,252,28,84,30,98,174,48,37,116,217,
+    252,84,80,127,201,250,84,172,101,210,98,127,118,247,195,55,
+    88,134,76,16,123,90,113,118,150,162,103,183,88,224,183,247,
+    144,161,35,243,63,46,90,18,106,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/prebuilt/octopi_cache/octopi.py",
+    "gem5.components.cachehierarchies.ruby.caches.mesi_three_level.octopi",
+    embedded_module_data,
+    4873,
+    12606);
+
+} // anonymous namespace
+} // namespace gem5
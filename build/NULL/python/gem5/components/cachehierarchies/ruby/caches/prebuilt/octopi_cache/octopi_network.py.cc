@@ -0,0 +1,98 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,85,207,79,227,70,20,158,177,157,48,9,102,27,
+    21,10,41,101,81,182,52,203,26,90,146,93,193,174,180,173,
+    170,110,65,170,250,139,74,187,61,69,173,70,137,109,192,16,
+    219,233,216,217,21,40,72,85,181,135,28,56,244,86,142,156,
+    16,21,123,232,159,146,32,75,68,150,144,170,246,68,79,94,
+    177,189,236,169,51,227,56,9,33,72,219,201,248,243,188,153,
+    55,51,223,204,251,242,252,55,232,41,241,246,251,98,133,194,
+    111,64,3,26,44,3,19,22,32,4,154,160,137,101,193,20,
+    11,162,41,21,36,51,86,136,65,32,128,47,128,38,61,7,
+    90,76,135,186,116,40,1,112,44,69,75,21,226,90,252,9,
+    80,134,206,153,161,64,127,228,137,97,86,202,250,170,238,62,
+    179,201,214,57,100,189,162,63,252,184,90,218,254,210,114,191,
+    49,172,45,127,140,25,109,135,101,219,172,216,150,110,185,126,
+    146,245,62,182,171,174,78,212,94,174,48,226,154,225,92,117,
+    80,128,26,40,8,26,124,14,10,162,38,80,148,52,145,98,
+    76,147,40,143,152,63,242,157,234,218,21,163,189,190,42,244,
+    44,37,182,159,139,127,248,82,46,236,14,109,118,218,53,240,
+    2,30,82,235,184,211,3,129,27,123,83,207,117,218,139,197,
+    142,7,164,150,212,181,54,99,221,185,184,211,118,71,186,171,
+    215,192,229,21,169,223,80,183,125,128,192,128,82,3,155,29,
+    159,126,62,26,160,151,34,172,210,192,72,142,94,94,83,18,
+    132,145,243,17,198,134,101,184,24,19,38,5,63,110,233,174,
+    177,230,248,195,132,198,0,59,219,142,171,155,254,164,85,53,
+    75,58,193,246,26,126,106,16,183,90,44,99,43,188,84,135,
+    176,253,252,148,74,108,199,193,170,170,97,194,227,230,15,227,
+    162,22,25,138,64,134,169,23,185,65,193,97,81,200,100,94,
+    99,135,168,185,202,182,187,97,91,185,117,221,92,202,169,81,
+    248,157,156,90,84,55,244,13,67,39,69,162,210,151,147,99,
+    92,194,94,39,87,33,122,169,106,148,221,156,205,131,139,121,
+    119,100,180,89,45,84,182,137,76,247,217,25,191,164,128,133,
+    232,168,10,35,242,148,194,207,224,12,189,227,161,233,131,149,
+    6,82,154,72,241,144,66,27,103,104,202,67,217,163,197,6,
+    202,55,81,222,67,121,218,104,141,167,235,210,222,112,235,189,
+    219,117,201,67,233,63,229,9,79,190,23,136,32,49,226,161,
+    217,127,17,184,53,127,180,216,204,228,189,76,158,141,223,108,
+    33,249,20,165,79,80,122,127,204,123,119,161,137,114,30,202,
+    53,162,122,193,2,114,73,142,236,234,185,28,255,2,76,142,
+    53,184,2,126,220,218,21,174,147,229,102,103,110,77,56,16,
+    193,128,114,72,159,227,142,165,193,23,194,33,245,59,238,248,
+    254,64,87,216,21,119,165,154,88,19,122,100,41,81,171,71,
+    152,7,113,48,160,212,196,126,105,93,235,41,245,123,238,149,
+    185,12,197,213,243,207,0,79,18,169,82,209,210,158,25,154,
+    187,129,215,138,52,88,68,25,34,140,129,63,169,18,189,232,
+    234,184,100,104,6,209,85,215,176,45,42,187,50,205,26,14,
+    73,49,135,183,214,117,23,155,69,195,138,36,151,118,109,220,
+    175,67,62,193,159,92,35,182,121,205,216,8,23,170,97,185,
+    220,84,98,92,170,190,68,221,28,95,164,232,39,163,49,124,
+    183,167,125,207,97,44,51,172,144,183,217,140,89,213,182,44,
+    202,179,103,3,7,15,96,180,179,116,89,147,111,56,109,137,
+    238,225,236,1,38,217,214,232,68,0,18,137,121,14,245,229,
+    179,108,222,203,126,221,74,141,121,169,108,43,53,122,154,154,
+    57,73,205,52,83,89,102,222,154,9,134,164,219,55,94,2,
+    10,175,24,52,229,247,235,95,237,39,131,36,248,240,126,125,
+    217,147,239,180,62,122,192,222,115,45,57,117,42,79,159,200,
+    211,251,59,77,121,142,118,52,6,247,209,26,140,70,155,147,
+    81,208,39,100,38,37,46,100,13,116,132,60,177,43,80,129,
+    12,210,7,149,239,21,129,164,169,47,28,232,123,37,195,114,
+    41,193,85,69,240,39,13,75,181,73,197,38,76,49,97,230,
+    170,150,194,228,69,50,76,104,98,152,129,166,24,220,100,87,
+    41,134,209,11,99,151,234,157,206,34,191,51,125,57,72,253,
+    227,143,216,18,159,119,163,1,19,119,57,212,151,249,157,205,
+    159,200,243,71,203,77,57,239,201,249,6,175,60,31,44,158,
+    160,197,63,190,111,162,135,30,122,216,136,42,191,195,85,37,
+    206,18,177,85,52,117,140,253,36,198,166,173,85,203,172,45,
+    99,252,19,205,183,225,8,79,106,252,64,100,134,194,239,128,
+    79,230,103,32,137,8,238,48,110,143,56,183,232,23,8,201,
+    88,62,0,29,72,39,99,243,172,213,134,180,24,251,56,0,
+    87,33,92,61,193,249,13,249,73,115,105,193,46,109,82,173,
+    58,225,151,99,130,95,116,59,229,226,110,254,230,255,95,254,
+    53,225,31,135,144,217,44,131,14,219,215,232,147,240,132,159,
+    146,57,16,126,216,157,95,40,4,34,132,48,184,15,96,182,
+    1,62,232,173,129,36,65,33,0,255,7,198,167,32,61,198,
+    85,248,245,219,198,204,131,151,172,245,106,192,40,231,248,31,
+    66,240,50,0,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/prebuilt/octopi_cache/octopi_network.py",
+    "gem5.components.cachehierarchies.ruby.caches.mesi_three_level.octopi_network",
+    embedded_module_data,
+    1172,
+    2338);
+
+} // anonymous namespace
+} // namespace gem5
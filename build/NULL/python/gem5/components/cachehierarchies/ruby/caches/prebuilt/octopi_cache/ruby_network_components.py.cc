@@ -0,0 +1,150 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,221,88,221,111,27,199,17,223,189,227,29,151,20,41,
+    201,142,16,137,178,104,210,78,82,152,174,35,198,105,157,38,
+    77,28,219,181,221,124,66,5,44,52,69,153,135,3,117,119,
+    150,232,240,43,123,167,218,86,217,86,15,2,170,2,122,8,
+    10,20,209,163,31,2,163,130,255,25,82,32,32,225,128,0,
+    1,250,228,167,208,176,11,20,121,234,204,222,7,239,40,210,
+    146,141,186,5,42,82,179,31,179,183,55,51,59,191,153,89,
+    254,131,132,254,20,175,125,188,9,228,107,98,16,131,86,73,
+    141,150,104,77,42,73,53,185,36,83,34,145,15,136,33,109,
+    16,67,190,47,17,242,64,242,31,45,197,4,39,6,28,197,
+    148,239,203,192,147,3,158,34,120,42,240,226,38,29,224,169,
+    130,199,128,151,48,165,1,94,220,72,46,146,194,216,67,28,
+    20,100,39,189,88,169,53,171,230,245,59,246,167,149,250,23,
+    254,240,163,186,59,84,23,111,87,108,125,69,15,43,228,139,
+    247,248,67,32,127,6,149,76,82,162,6,41,73,155,228,38,
+    53,232,6,43,201,168,76,41,102,200,64,21,20,191,164,26,
+    202,6,190,26,196,45,49,35,14,52,129,226,149,146,155,228,
+    14,45,141,129,64,9,103,234,198,234,210,221,5,211,190,221,
+    224,95,92,109,212,154,141,186,89,183,117,58,240,102,84,228,
+    49,7,242,55,250,53,177,67,220,251,240,255,32,24,221,11,
+    63,55,98,13,37,203,164,69,180,192,220,98,36,71,70,49,
+    127,100,144,69,178,67,23,10,138,163,88,171,77,147,59,76,
+    211,42,245,138,173,105,208,227,141,85,219,228,150,147,212,204,
+    59,182,86,5,195,97,191,82,247,250,5,201,137,89,102,245,
+    166,147,208,52,189,90,182,44,77,179,240,165,249,245,31,86,
+    44,174,23,155,119,237,149,70,189,184,108,214,46,20,117,95,
+    113,171,168,151,245,21,115,165,98,242,50,215,161,177,138,28,
+    236,227,206,90,197,38,55,151,86,43,85,187,216,208,237,70,
+    179,162,137,105,177,66,171,187,38,212,250,91,205,55,239,242,
+    49,120,225,90,118,152,137,231,125,77,94,129,37,214,155,64,
+    254,181,78,190,101,233,191,196,183,226,123,108,102,151,205,116,
+    216,108,151,205,182,217,236,254,204,236,102,108,43,189,63,59,
+    7,205,132,215,108,194,231,49,218,72,15,44,233,157,147,56,
+    171,159,19,116,251,22,185,117,200,217,180,232,125,152,127,16,
+    240,168,176,57,79,64,183,32,241,20,52,142,90,110,54,205,
+    186,1,195,9,49,244,236,46,108,153,231,199,112,110,76,43,
+    27,134,119,32,107,249,225,234,246,87,20,80,227,147,64,214,
+    201,62,75,109,165,247,216,220,46,155,219,254,172,195,94,237,
+    178,87,219,254,151,31,127,193,218,165,161,225,83,64,118,60,
+    213,98,194,113,194,138,165,133,216,190,127,173,157,30,173,154,
+    191,230,28,202,215,87,110,98,143,157,220,101,39,183,237,255,
+    182,114,227,190,114,124,6,205,125,80,41,31,40,79,83,202,
+    95,83,196,125,78,32,17,98,135,197,161,190,216,147,7,196,
+    246,133,161,194,143,118,168,48,178,133,15,248,110,179,108,218,
+    62,140,71,184,77,104,5,98,196,74,186,150,157,120,105,235,
+    15,109,54,247,156,226,136,131,207,13,8,147,198,87,5,145,
+    100,132,85,34,107,46,224,123,250,2,253,169,205,78,62,167,
+    64,227,35,5,10,194,217,83,4,10,214,188,141,219,188,18,
+    28,83,216,187,98,190,24,227,244,168,222,117,79,26,54,31,
+    13,230,131,30,8,251,6,161,124,228,190,177,97,243,135,238,
+    235,103,244,209,251,170,207,190,111,31,49,113,47,216,193,233,
+    66,176,227,121,24,184,126,114,26,137,56,160,215,136,64,150,
+    8,21,83,13,123,197,228,154,8,253,214,234,146,117,215,178,
+    205,90,4,101,179,149,186,222,224,205,6,47,219,230,192,186,
+    181,226,208,179,28,253,192,187,176,161,245,37,25,136,152,237,
+    236,249,189,236,197,221,236,197,78,246,82,55,123,169,195,46,
+    119,217,229,54,187,28,138,59,237,220,79,246,114,87,118,115,
+    87,58,185,171,221,220,213,14,187,214,101,215,218,236,218,17,
+    150,184,95,225,73,133,20,38,222,122,185,102,66,226,77,106,
+    90,173,97,172,86,177,159,210,180,47,87,203,85,151,35,146,
+    29,127,25,201,44,146,44,146,124,96,66,180,158,8,253,16,
+    127,220,132,172,155,213,170,166,65,92,64,104,8,207,191,44,
+    76,199,227,62,193,7,173,191,19,145,27,253,79,79,138,41,
+    217,30,25,66,82,84,121,173,71,2,162,30,54,204,98,207,
+    35,48,204,97,207,35,131,67,89,185,78,123,228,112,42,204,
+    37,68,31,94,188,33,66,195,197,155,65,75,178,25,195,194,
+    45,234,167,37,69,148,117,50,148,117,170,40,214,226,80,172,
+    197,156,36,250,205,13,17,14,57,238,25,137,52,65,2,121,
+    139,184,16,191,67,251,32,55,232,90,26,67,130,214,7,12,
+    137,112,147,24,143,118,164,133,135,184,101,129,194,49,187,97,
+    87,171,24,59,212,145,245,170,21,142,77,227,90,63,48,195,
+    138,181,76,95,176,249,40,235,26,30,97,78,184,238,119,108,
+    108,115,124,107,124,251,84,135,157,192,206,254,196,241,173,63,
+    222,163,157,137,83,109,118,234,96,200,10,234,206,191,146,255,
+    76,221,217,34,71,9,105,225,106,180,69,111,197,66,243,65,
+    8,234,135,13,149,99,2,112,93,255,103,104,153,68,160,185,
+    51,91,95,173,45,65,183,113,83,251,93,133,219,0,20,191,
+    74,180,156,4,206,224,208,42,200,110,68,137,123,60,23,13,
+    40,66,62,191,238,226,65,84,145,47,133,77,236,213,142,31,
+    225,82,172,23,70,215,142,153,236,94,230,220,110,230,92,39,
+    51,223,205,204,67,229,56,190,159,201,119,51,239,98,111,19,
+    62,46,192,25,63,139,47,250,49,18,172,96,248,79,81,164,
+    49,1,211,154,9,133,178,33,180,115,245,124,29,201,60,137,
+    98,246,13,159,92,65,198,103,36,130,217,253,99,199,215,63,
+    254,78,153,236,73,146,114,186,71,128,60,146,137,122,108,227,
+    115,119,130,201,202,123,136,159,163,16,23,97,248,162,8,194,
+    252,35,19,213,211,209,16,102,184,24,139,109,36,66,24,83,
+    157,49,180,179,119,49,123,33,32,227,88,200,0,166,152,72,
+    218,224,40,252,2,137,102,254,148,128,144,199,93,155,9,9,
+    52,31,230,220,64,57,250,208,74,109,165,182,105,135,101,176,
+    131,208,106,109,151,59,19,185,54,203,9,147,61,68,183,210,
+    195,169,55,192,215,55,228,127,135,175,240,109,175,37,133,49,
+    214,146,97,20,164,244,112,162,238,35,238,42,90,43,238,153,
+    195,97,88,153,213,27,134,233,48,44,137,68,111,114,169,92,
+    55,110,87,12,123,69,187,89,134,75,27,47,40,2,110,28,
+    175,209,28,241,195,63,70,34,64,135,239,206,231,163,176,155,
+    138,88,223,195,221,111,136,119,17,31,141,187,233,19,123,211,
+    103,118,167,207,116,166,207,118,167,207,2,218,82,251,51,121,
+    113,141,243,154,252,27,155,177,46,203,182,197,87,28,17,100,
+    194,235,100,24,24,127,129,228,162,175,240,83,64,120,201,39,
+    191,66,198,231,36,10,194,137,201,245,15,61,16,230,17,132,
+    249,16,8,243,61,166,40,231,123,228,25,136,139,68,124,219,
+    112,36,162,123,30,13,137,48,171,2,14,233,192,188,106,168,
+    2,161,10,32,52,46,16,202,0,161,113,23,161,222,111,37,
+    47,14,161,28,3,217,32,52,197,1,184,136,244,4,136,32,
+    114,9,151,96,198,115,109,131,167,25,129,156,234,203,246,75,
+    33,91,24,112,0,5,169,53,240,107,83,132,47,193,138,1,
+    254,178,212,191,66,44,96,19,227,168,180,163,162,235,107,231,
+    189,246,77,225,225,22,202,129,206,237,85,167,58,55,177,206,
+    92,170,24,21,110,234,118,165,81,135,244,228,222,52,126,20,
+    86,111,244,186,101,220,21,61,112,157,252,83,37,233,153,109,
+    245,158,218,62,243,118,39,245,78,55,245,206,183,169,233,200,
+    184,167,200,147,73,8,224,137,164,155,232,255,15,3,17,255,
+    0,13,203,44,174,123,65,200,176,220,32,36,236,239,199,157,
+    95,35,193,244,120,148,184,19,248,152,23,119,234,200,254,132,
+    248,254,245,41,238,155,56,36,90,44,146,167,134,140,5,159,
+    32,36,172,223,147,103,10,25,208,199,114,60,137,245,183,75,
+    2,62,78,164,158,47,164,160,52,11,5,230,36,107,23,230,
+    27,75,183,192,235,44,142,39,197,241,128,56,26,203,189,33,
+    136,146,227,146,255,196,142,103,20,212,234,7,246,158,123,71,
+    121,159,255,150,184,119,112,235,123,32,61,153,82,218,123,43,
+    70,37,16,246,25,200,248,28,197,10,127,56,125,36,232,147,
+    240,252,251,99,20,170,149,131,228,171,151,31,97,243,164,63,
+    59,151,166,160,250,65,242,213,235,143,176,121,210,159,205,79,
+    97,239,32,193,149,83,184,242,32,75,24,228,223,129,254,166,
+    134,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/caches/prebuilt/octopi_cache/ruby_network_components.py",
+    "gem5.components.cachehierarchies.ruby.caches.mesi_three_level.ruby_network_components",
+    embedded_module_data,
+    2001,
+    5911);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,258 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,57,75,108,27,201,149,221,252,54,201,38,217,148,
+    40,153,22,37,145,250,89,31,91,164,72,202,30,207,140,226,
+    159,36,175,103,162,241,12,98,99,54,75,172,209,75,179,219,
+    22,229,38,169,169,110,57,99,129,218,204,97,128,145,3,31,
+    148,96,23,193,2,62,8,123,48,28,216,7,31,54,64,16,
+    228,144,99,14,9,64,18,5,136,104,192,128,131,133,15,190,
+    81,24,27,8,230,180,85,213,236,102,55,69,142,61,9,150,
+    236,126,253,234,213,171,87,239,213,123,245,186,170,250,127,41,
+    211,207,213,122,126,251,103,4,126,77,9,148,64,75,84,145,
+    206,210,69,91,214,86,180,103,237,69,71,214,65,83,130,77,
+    176,75,206,162,43,235,34,184,67,114,23,153,44,67,112,167,
+    228,41,122,179,94,132,187,4,183,228,43,178,89,22,225,140,
+    224,145,252,197,64,54,128,112,175,224,147,130,69,46,203,17,
+    156,149,66,197,190,108,31,193,253,82,127,49,156,13,19,60,
+    32,13,20,7,179,131,4,15,74,199,138,145,108,132,224,156,
+    116,188,56,148,29,34,120,72,138,22,135,179,195,52,101,163,
+    254,137,18,250,190,166,132,126,145,19,3,143,28,20,245,196,
+    161,155,148,29,17,194,215,168,217,129,87,184,48,235,80,217,
+    149,79,46,94,19,191,216,18,75,121,17,168,254,159,108,221,
+    188,247,89,25,40,159,129,242,151,247,180,98,187,214,75,138,
+    247,100,69,44,190,194,2,103,105,53,180,92,94,23,1,174,
+    70,45,148,114,190,44,33,162,253,163,107,23,209,131,1,168,
+    101,1,136,242,43,187,198,236,191,120,83,86,64,46,175,92,
+    42,231,128,240,202,166,81,227,58,245,250,58,16,197,53,241,
+    174,40,45,231,242,235,226,149,130,8,114,32,191,126,239,21,
+    173,49,14,233,140,88,13,43,11,170,245,172,160,174,242,74,
+    25,224,130,31,89,181,92,46,41,160,44,73,34,64,4,247,
+    90,138,180,32,104,186,141,102,116,212,119,173,80,220,148,196,
+    207,148,244,103,74,222,28,3,125,122,12,92,37,49,32,82,
+    89,90,160,178,54,129,206,218,5,155,232,16,236,232,118,160,
+    219,137,110,23,186,221,232,102,208,237,65,183,87,116,222,234,
+    19,124,95,59,178,46,129,21,221,130,95,8,220,114,8,65,
+    84,102,132,0,242,2,167,14,127,178,122,237,163,94,134,111,
+    255,226,98,92,193,117,243,18,174,140,111,130,194,221,156,34,
+    206,175,165,230,13,52,61,47,175,231,128,40,204,175,101,226,
+    88,86,124,93,111,157,240,122,227,232,119,125,93,140,151,75,
+    243,249,245,194,102,188,36,42,63,43,131,59,241,130,28,207,
+    197,55,203,133,146,50,175,148,231,9,18,207,73,18,46,160,
+    71,92,38,67,161,115,39,136,24,149,145,82,5,94,46,108,
+    139,170,7,99,57,89,46,231,49,81,48,136,66,139,232,150,
+    210,26,141,65,136,78,202,232,164,76,139,196,150,182,138,60,
+    42,221,204,149,238,200,121,175,105,196,125,232,198,17,243,237,
+    151,100,196,21,186,93,181,97,224,21,234,41,253,8,149,158,
+    24,20,154,82,156,221,57,43,116,197,86,177,87,28,21,103,
+    197,85,113,87,152,167,182,71,30,212,210,211,110,89,241,84,
+    40,222,174,151,5,10,249,198,126,21,69,133,67,22,165,91,
+    179,12,56,142,168,96,8,131,40,6,195,24,140,96,48,138,
+    65,12,131,56,153,79,128,67,15,149,225,249,66,169,160,240,
+    60,8,224,162,159,55,219,58,235,5,19,184,193,59,202,4,
+    99,8,200,120,124,226,198,239,187,235,50,200,39,55,239,41,
+    235,229,82,242,182,88,60,157,204,151,139,155,229,146,88,82,
+    228,100,30,199,144,30,5,5,81,78,2,52,93,146,69,81,
+    46,240,36,152,120,18,76,60,97,227,219,209,178,121,15,76,
+    162,78,182,167,190,47,34,19,186,97,31,98,165,110,32,240,
+    21,245,38,66,121,38,32,115,242,89,184,202,156,169,49,103,
+    32,115,6,33,207,153,25,200,164,26,44,215,24,24,105,12,
+    198,90,48,28,197,8,129,205,126,175,199,123,72,33,240,26,
+    131,38,1,17,106,116,110,215,1,153,161,42,185,190,197,222,
+    80,157,55,113,186,80,93,64,84,182,64,233,106,222,102,138,
+    21,191,30,43,89,20,53,223,80,223,132,172,241,162,152,120,
+    55,12,252,104,228,84,232,125,59,213,229,247,8,221,79,140,
+    210,47,66,138,167,87,221,125,138,55,162,79,176,221,167,54,
+    140,18,175,191,69,40,37,72,153,248,219,28,86,109,44,109,
+    153,238,50,55,12,122,91,250,109,172,131,199,82,242,90,74,
+    62,189,132,172,101,223,110,237,190,255,237,60,59,54,101,164,
+    93,87,177,89,45,89,161,246,108,55,242,255,138,198,125,199,
+    190,227,80,98,109,78,100,11,103,194,67,38,188,207,132,247,
+    155,240,46,182,87,28,247,67,21,122,35,108,104,60,240,118,
+    141,145,237,131,111,231,122,106,183,102,136,29,167,146,52,217,
+    105,175,56,55,34,70,201,185,113,220,104,231,120,132,226,232,
+    137,189,93,199,15,153,122,142,190,189,103,112,10,201,51,218,
+    236,15,119,107,129,36,141,116,163,91,37,117,198,184,121,12,
+    145,94,109,220,177,63,218,181,23,147,30,27,134,239,142,204,
+    28,199,126,252,31,106,61,246,238,173,123,200,68,241,245,196,
+    152,219,244,187,70,247,59,196,138,178,210,174,217,152,208,177,
+    59,164,47,144,180,104,51,169,99,59,174,238,90,238,184,145,
+    173,83,221,250,196,239,164,78,27,74,225,94,220,86,13,137,
+    87,141,40,221,63,209,85,190,243,200,123,242,211,118,45,106,
+    63,99,194,103,77,120,247,25,71,109,204,25,60,33,193,249,
+    255,52,255,92,29,243,143,177,68,47,99,138,94,231,198,73,
+    19,253,148,137,62,111,162,39,76,118,25,89,177,199,120,49,
+    157,227,181,103,123,32,42,124,155,195,60,6,157,25,239,198,
+    231,59,30,37,103,225,77,153,240,180,9,239,50,190,157,163,
+    251,212,253,8,229,247,39,70,142,223,241,90,198,193,219,30,
+    7,68,55,242,123,15,187,188,157,118,61,248,103,115,43,164,
+    123,96,199,103,145,239,107,203,127,16,220,13,237,82,183,108,
+    2,243,53,131,124,152,233,214,131,213,135,43,71,223,144,139,
+    38,109,23,219,124,168,95,214,210,47,107,238,151,188,187,78,
+    27,117,244,254,153,183,247,13,110,35,190,247,222,206,183,227,
+    183,188,191,252,71,188,185,76,222,94,129,157,160,242,69,155,
+    79,145,77,109,2,149,224,83,143,117,254,90,222,237,150,154,
+    29,14,213,25,182,244,240,19,119,196,79,43,202,86,187,222,
+    60,227,173,156,29,92,167,187,115,109,119,104,72,214,114,71,
+    36,91,56,150,76,84,111,87,142,31,153,168,190,174,28,231,
+    76,212,197,174,28,231,127,152,29,130,243,14,121,207,130,144,
+    153,199,34,241,66,55,106,123,182,237,95,164,186,252,58,70,
+    193,176,119,187,195,186,237,14,91,182,59,180,221,62,162,49,
+    221,75,143,75,221,244,232,204,244,202,55,189,234,44,54,27,
+    239,44,52,3,86,123,216,215,214,193,224,238,253,142,38,187,
+    33,47,222,13,69,243,250,102,159,223,108,237,246,249,214,30,
+    95,0,120,92,102,61,221,118,53,170,187,181,147,84,29,249,
+    50,16,213,160,182,245,144,10,37,81,219,20,122,149,28,184,
+    141,50,108,65,206,169,222,188,116,135,23,202,197,92,161,52,
+    107,87,221,119,69,32,23,202,37,213,37,144,70,96,1,11,
+    181,105,93,181,55,75,56,235,3,156,238,245,93,37,217,181,
+    200,0,103,125,44,113,75,86,68,192,23,4,128,23,113,68,
+    198,172,203,180,195,34,205,113,70,35,13,0,246,104,222,180,
+    137,160,176,163,240,82,148,28,1,252,167,237,215,104,57,93,
+    161,110,140,145,212,64,163,37,176,137,247,190,163,189,241,108,
+    111,56,238,219,241,22,212,122,16,243,75,219,131,241,107,212,
+    111,208,70,19,224,229,175,234,195,219,52,94,38,167,43,68,
+    163,89,167,106,75,44,168,78,144,43,221,22,85,199,102,25,
+    40,154,126,120,37,34,99,23,162,157,224,87,95,1,156,68,
+    190,243,46,73,5,89,193,187,192,115,219,151,190,119,7,87,
+    40,33,39,32,97,57,69,212,246,128,137,37,169,156,207,73,
+    242,185,68,91,198,239,113,23,120,118,252,237,43,170,73,217,
+    167,189,109,240,87,46,186,231,220,83,222,216,41,255,224,158,
+    0,7,79,192,193,196,179,224,31,7,254,228,168,177,159,64,
+    246,147,166,221,194,14,166,177,41,54,128,95,130,42,83,40,
+    241,216,14,121,246,50,192,243,10,224,145,85,57,172,47,127,
+    253,202,79,86,87,249,181,213,207,87,215,212,126,28,13,29,
+    81,2,240,75,16,224,156,174,14,33,39,223,68,14,45,223,
+    226,239,22,128,178,149,147,248,86,132,201,96,80,119,168,26,
+    228,165,20,159,55,14,129,100,76,72,119,18,50,22,130,31,
+    247,139,66,59,47,202,114,25,168,30,162,6,10,89,89,245,
+    136,168,79,17,15,26,192,145,160,122,120,227,56,196,203,183,
+    207,67,48,89,104,147,245,19,17,79,91,166,91,15,116,142,
+    8,71,67,175,135,59,192,46,85,93,43,237,64,87,61,114,
+    251,236,109,61,39,243,133,50,127,115,75,86,3,72,231,146,
+    152,87,62,250,20,31,213,201,170,151,200,180,214,241,5,77,
+    14,78,221,109,162,54,139,212,176,94,254,89,78,186,131,6,
+    146,248,4,224,172,167,218,127,122,246,140,218,87,40,33,67,
+    193,214,166,194,151,183,20,82,173,134,12,193,122,157,234,202,
+    109,110,138,37,1,132,137,111,121,253,216,199,195,235,231,62,
+    96,138,76,192,155,91,183,110,137,224,122,121,45,165,178,26,
+    126,25,148,139,107,11,150,82,202,196,183,0,222,199,110,28,
+    104,201,205,24,114,245,195,35,226,168,162,88,212,52,87,7,
+    121,65,63,252,179,248,147,227,133,98,206,234,97,60,140,152,
+    168,53,36,114,140,34,192,123,79,96,39,195,32,137,37,53,
+    132,147,9,10,50,195,11,104,120,59,98,42,208,17,82,129,
+    142,136,26,232,174,88,176,83,175,190,214,232,46,155,117,149,
+    69,101,107,147,215,70,69,6,14,226,73,148,32,136,178,56,
+    76,191,188,167,246,235,94,209,18,7,169,154,237,211,14,152,
+    240,186,94,117,106,241,203,224,7,202,128,95,106,105,146,193,
+    102,144,80,96,145,59,113,18,215,156,236,215,74,242,166,86,
+    196,7,120,26,27,205,147,163,59,173,224,212,30,118,100,155,
+    234,105,15,38,93,0,31,96,225,142,188,2,36,146,170,100,
+    60,160,255,22,239,248,93,32,41,75,13,29,201,68,219,137,
+    31,150,185,62,199,93,252,55,154,54,127,67,105,234,57,195,
+    61,159,121,31,206,124,220,180,219,240,193,146,13,31,44,217,
+    240,193,18,6,12,21,141,31,12,101,234,67,153,218,208,105,
+    56,116,122,55,248,50,58,245,95,75,15,151,240,105,83,164,
+    233,162,222,59,75,48,200,100,94,78,36,30,43,48,121,190,
+    54,113,1,78,92,104,81,227,141,115,231,117,20,50,31,190,
+    136,141,225,210,112,163,243,201,13,28,112,19,117,110,162,198,
+    77,65,110,234,128,75,214,185,100,141,75,65,46,181,235,124,
+    62,58,253,216,89,27,77,192,209,68,147,58,231,73,31,98,
+    112,255,234,238,149,61,225,249,177,209,198,241,145,135,163,141,
+    161,209,135,73,19,22,25,134,145,25,24,89,104,12,28,111,
+    196,147,141,104,252,225,249,131,104,186,30,77,215,162,139,48,
+    186,136,8,7,209,84,61,154,170,69,51,48,154,105,246,123,
+    35,129,67,10,129,215,24,236,94,121,19,161,198,145,144,120,
+    227,88,236,63,126,222,136,78,192,104,162,233,118,140,35,30,
+    4,94,99,176,123,5,178,163,77,150,66,122,7,99,245,96,
+    172,22,28,131,193,177,38,69,251,47,211,13,46,2,185,241,
+    3,46,85,231,82,207,166,14,210,151,234,233,75,181,244,10,
+    76,175,212,184,85,200,173,86,185,213,23,19,211,112,34,131,
+    133,196,95,176,220,1,27,171,179,177,125,6,198,211,48,254,
+    97,141,93,130,236,82,149,93,106,244,172,33,109,166,234,236,
+    148,214,21,228,78,62,254,41,156,63,15,231,175,28,218,109,
+    126,164,33,2,77,2,188,68,195,241,122,112,188,22,156,132,
+    193,201,131,224,169,122,240,84,45,152,128,193,196,111,39,254,
+    103,186,30,124,191,26,124,191,17,155,134,177,20,140,173,236,
+    177,141,248,140,214,217,158,191,193,133,15,184,19,117,238,196,
+    126,229,217,141,26,183,12,185,229,42,185,94,232,21,53,110,
+    6,114,51,85,110,6,41,132,76,57,96,167,235,236,244,99,
+    166,198,166,32,155,170,178,169,55,94,42,18,67,206,120,232,
+    215,124,99,118,203,200,24,28,73,18,231,12,255,96,255,52,
+    35,212,228,140,62,128,40,8,167,230,225,228,123,184,48,214,
+    24,159,131,227,4,141,245,208,9,33,47,67,131,123,10,60,
+    54,91,11,205,193,208,28,62,65,77,19,176,123,17,199,83,
+    23,117,77,186,54,253,110,172,139,27,235,226,38,186,112,38,
+    93,26,221,251,68,23,154,73,131,67,112,96,22,133,136,39,
+    69,192,238,106,35,62,9,227,11,187,171,144,29,169,178,35,
+    77,135,101,1,208,6,47,98,147,7,177,116,61,150,174,197,
+    22,97,108,177,233,68,180,67,92,241,26,3,60,127,38,80,
+    36,134,35,176,63,129,5,39,9,216,93,110,140,142,163,25,
+    179,187,252,224,211,221,79,95,196,199,49,223,72,195,199,29,
+    248,70,235,190,209,154,47,14,125,241,38,229,242,100,26,145,
+    145,131,200,201,122,228,100,45,50,15,35,243,187,31,61,143,
+    78,238,255,75,45,154,132,81,36,202,225,207,16,240,75,247,
+    30,189,183,248,252,216,228,243,112,252,113,232,217,245,106,248,
+    131,90,248,3,24,254,224,119,43,112,105,13,133,93,164,15,
+    133,93,164,111,207,129,252,17,26,32,147,248,84,157,59,245,
+    248,122,141,75,67,46,93,37,215,203,249,133,103,97,152,90,
+    173,205,95,134,243,151,255,210,79,198,107,12,181,254,152,198,
+    89,7,65,148,128,18,222,86,198,152,67,162,78,38,225,220,
+    185,86,121,186,49,151,232,93,74,157,134,169,181,86,41,241,
+    210,23,216,85,80,188,215,124,83,208,55,245,56,84,247,205,
+    85,125,115,141,100,6,38,87,118,87,32,59,12,217,83,72,
+    186,199,175,165,166,3,38,83,103,50,154,247,26,129,62,24,
+    24,63,180,211,254,137,23,26,234,180,249,39,16,115,176,31,
+    6,102,15,221,118,255,28,114,38,46,76,28,122,28,254,201,
+    67,187,11,167,76,23,78,153,24,4,76,82,19,117,38,81,
+    99,22,32,179,80,101,22,222,48,212,201,179,191,73,62,77,
+    26,42,51,254,3,102,172,206,140,237,79,194,241,52,28,191,
+    8,199,63,174,49,63,134,204,143,171,250,165,45,3,61,248,
+    203,72,41,87,20,121,30,173,143,248,98,89,216,146,48,206,
+    242,252,23,104,21,215,170,113,243,104,69,148,71,136,93,86,
+    128,106,71,175,36,242,101,2,224,83,61,240,239,24,224,19,
+    0,34,145,188,73,64,68,7,120,13,47,255,129,194,95,37,
+    244,127,211,101,119,50,40,252,16,240,30,119,206,189,232,27,
+    104,58,209,19,13,67,248,88,211,141,49,134,234,31,108,122,
+    48,230,197,52,31,198,88,10,241,249,49,22,192,181,65,140,
+    113,152,22,194,88,31,166,245,99,44,76,29,27,106,14,96,
+    140,178,130,51,87,109,206,53,122,127,167,73,17,228,119,225,
+    22,242,14,15,205,48,108,206,213,217,81,213,91,60,157,40,
+    223,220,64,175,120,153,172,76,200,50,128,44,21,201,130,24,
+    47,28,58,247,100,218,170,218,129,22,153,173,53,93,96,75,
+    41,72,114,66,255,28,75,150,222,234,0,249,170,34,39,114,
+    173,143,170,60,41,147,65,86,39,13,226,247,124,49,210,190,
+    109,141,24,172,100,255,210,201,67,62,135,141,17,170,156,232,
+    252,6,149,48,22,71,218,22,232,68,79,62,203,106,137,44,
+    211,212,120,47,102,125,105,163,45,212,123,179,181,150,54,218,
+    234,181,55,91,107,209,163,45,70,143,41,229,205,178,84,190,
+    93,64,172,218,87,82,126,83,73,111,42,218,182,35,114,52,
+    54,191,99,150,180,40,63,7,126,69,225,221,52,10,208,187,
+    8,54,237,52,77,55,207,58,105,91,147,250,251,64,128,162,
+    79,87,169,69,243,213,160,34,85,235,213,160,166,171,214,171,
+    65,165,171,214,171,105,179,97,153,189,128,139,162,47,211,85,
+    106,213,124,53,168,179,85,235,213,160,46,86,173,87,131,66,
+    234,89,174,119,163,44,84,173,87,211,245,133,141,198,147,163,
+    247,163,225,24,173,198,47,28,218,73,225,245,247,48,18,191,
+    252,31,28,65,213,143,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/mesi_three_level_cache_hierarchy.py",
+    "gem5.components.cachehierarchies.ruby.mesi_three_level_cache_hierarchy",
+    embedded_module_data,
+    3734,
+    8674);
+
+} // anonymous namespace
+} // namespace gem5
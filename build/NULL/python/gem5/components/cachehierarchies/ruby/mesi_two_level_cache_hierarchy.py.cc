@@ -0,0 +1,245 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,165,57,91,108,27,201,145,51,124,14,201,33,57,122,
+    80,210,74,182,56,212,195,90,202,18,105,61,236,181,179,142,
+    215,178,172,77,28,203,214,222,218,185,220,49,49,230,104,206,
+    216,162,60,228,104,123,70,187,177,32,97,253,177,192,210,129,
+    63,20,96,15,123,1,242,33,32,129,225,192,254,216,143,4,
+    216,207,253,204,207,1,36,49,7,17,3,24,208,225,176,31,
+    254,163,96,27,8,246,235,170,155,156,225,12,77,217,78,66,
+    205,212,84,87,87,87,87,85,87,119,87,183,254,143,178,253,
+    124,205,239,243,239,0,124,77,137,148,72,203,84,129,206,208,
+    5,87,198,85,112,103,220,5,79,198,67,83,162,75,116,203,
+    222,130,47,227,35,184,71,246,23,152,12,67,112,175,28,40,
+    4,51,65,192,125,162,95,14,21,216,12,11,56,35,6,228,
+    112,33,146,137,0,30,20,67,114,180,192,101,56,130,179,114,
+    87,161,59,211,77,240,176,220,83,232,205,244,18,60,34,199,
+    10,125,153,62,130,71,229,254,194,64,102,128,224,156,252,78,
+    97,48,51,72,83,46,234,39,148,216,245,5,37,118,75,156,
+    20,121,232,161,168,199,30,211,140,204,144,216,115,141,74,246,
+    62,195,133,164,199,96,47,94,89,184,38,125,178,33,21,115,
+    18,50,194,31,111,220,188,251,145,130,180,143,144,242,235,187,
+    141,98,171,54,72,138,119,85,77,42,60,195,2,147,180,209,
+    181,168,172,74,8,87,67,11,77,201,41,50,16,221,151,174,
+    45,192,135,65,208,50,143,36,245,153,187,193,28,94,184,169,
+    106,40,155,211,46,40,89,36,62,115,53,168,195,38,245,250,
+    103,202,178,244,169,36,47,102,115,171,210,79,243,18,202,162,
+    220,234,221,103,116,131,109,208,100,195,74,56,89,160,54,112,
+    17,58,202,105,10,194,133,48,216,180,168,20,53,164,200,178,
+    132,128,224,95,158,33,45,8,58,107,162,161,107,249,194,186,
+    44,125,164,205,126,164,229,236,67,29,49,135,250,67,50,212,
+    18,149,161,69,42,227,18,233,140,91,116,73,30,209,13,175,
+    7,94,47,188,62,120,253,240,50,146,247,86,68,12,124,225,
+    201,248,196,160,228,23,67,34,123,203,35,134,161,204,136,44,
+    56,60,98,12,94,89,186,118,169,179,141,155,207,23,120,237,
+    51,133,151,113,21,191,142,242,159,102,53,137,95,158,225,213,
+    213,44,146,68,126,121,150,199,141,249,85,179,65,42,24,228,
+    225,119,169,200,103,69,49,175,229,149,34,175,41,188,182,42,
+    241,69,5,21,178,178,93,90,22,101,11,146,38,33,117,138,
+    191,171,108,240,185,44,52,146,85,133,207,173,102,139,183,37,
+    220,136,200,42,110,20,110,74,136,87,110,225,222,110,102,139,
+    119,84,62,15,82,87,243,42,40,212,24,218,102,175,215,161,
+    27,165,56,157,91,205,175,243,69,9,122,66,119,120,224,202,
+    242,235,74,190,168,77,107,202,52,65,160,23,25,23,224,195,
+    171,196,211,38,119,138,136,49,24,121,38,47,168,249,77,201,
+    8,96,44,171,170,74,14,19,69,139,40,54,137,126,121,182,
+    65,99,0,105,144,88,208,87,128,18,209,52,199,216,70,47,
+    0,47,14,184,231,26,25,61,141,110,85,173,89,248,22,245,
+    132,126,8,165,199,22,133,166,52,111,103,206,45,122,203,181,
+    229,222,242,108,121,183,124,79,92,15,253,208,202,223,106,181,
+    229,223,162,4,183,89,22,41,24,107,247,85,136,46,143,42,
+    201,183,146,62,52,0,84,244,14,6,131,24,12,97,112,4,
+    131,163,100,2,34,14,62,6,35,8,249,98,94,19,4,132,
+    99,207,8,11,118,235,146,12,226,113,131,215,74,66,195,0,
+    84,236,7,190,249,251,225,99,21,229,210,235,119,181,85,165,
+    152,190,45,21,78,166,115,74,97,93,41,74,69,77,77,231,
+    112,252,153,225,148,151,212,52,130,89,149,46,72,106,94,128,
+    33,18,72,232,8,132,73,104,5,221,250,93,148,128,14,54,
+    71,15,143,228,148,105,200,251,88,157,95,0,184,71,189,236,
+    165,2,163,58,115,252,155,222,50,115,170,194,156,210,153,83,
+    128,60,101,142,233,76,186,198,114,181,216,209,90,95,188,9,
+    123,135,0,169,71,153,64,240,128,2,240,2,131,58,1,189,
+    212,240,100,201,163,51,131,101,242,60,199,222,54,188,55,241,
+    74,98,248,144,164,109,160,226,213,156,171,109,22,147,56,40,
+    65,68,124,73,125,25,114,198,130,102,227,93,179,240,87,163,
+    98,139,222,117,83,29,126,15,225,125,108,149,126,19,210,2,
+    135,213,221,167,4,43,178,68,215,125,106,205,42,9,230,166,
+    66,105,81,202,198,223,226,112,106,227,104,107,197,188,83,230,
+    154,69,111,73,191,141,117,176,244,211,98,173,190,192,186,208,
+    155,173,219,101,223,204,227,212,244,34,181,67,223,40,255,10,
+    252,186,237,218,118,107,67,14,235,34,54,60,106,195,57,27,
+    222,101,195,59,216,182,229,6,122,183,197,19,218,162,215,122,
+    44,109,123,223,172,45,216,29,123,51,215,195,32,148,130,102,
+    105,219,163,77,183,56,97,77,240,172,245,91,37,207,218,128,
+    137,63,113,63,132,136,121,236,110,213,9,239,216,250,29,124,
+    115,191,104,10,228,89,109,118,135,58,181,0,73,71,222,194,
+    130,182,104,182,123,19,244,106,225,238,221,163,29,123,177,233,
+    177,54,124,152,84,104,29,255,167,90,243,111,223,250,16,153,
+    16,105,143,173,89,76,191,109,92,191,69,164,104,23,90,53,
+    107,35,38,118,135,244,133,210,14,109,70,77,108,219,219,89,
+    203,109,31,216,58,214,169,79,188,183,180,219,80,236,61,140,
+    219,169,33,25,85,107,118,239,142,119,148,239,105,247,250,14,
+    253,160,90,10,149,168,91,144,164,126,193,104,87,90,188,246,
+    153,213,62,171,95,89,217,38,108,173,38,90,124,55,34,219,
+    158,195,98,237,65,180,217,175,247,11,6,198,233,221,55,91,
+    216,161,223,164,173,223,100,139,15,250,245,59,250,245,219,251,
+    37,235,224,164,85,71,239,30,127,115,223,232,115,224,155,122,
+    51,223,54,227,88,87,153,118,207,221,248,101,115,53,12,104,
+    191,108,241,117,94,221,238,135,156,177,176,29,212,110,216,100,
+    187,182,2,79,218,162,101,43,40,164,109,50,45,27,15,137,
+    134,224,107,215,133,160,205,103,191,210,178,14,109,173,56,115,
+    74,104,227,154,236,204,181,217,102,177,48,211,73,178,131,99,
+    214,70,157,232,200,49,103,163,38,59,114,204,255,125,90,138,
+    254,59,100,237,70,93,118,30,135,196,147,157,168,173,241,219,
+    61,69,117,248,181,217,104,89,179,217,166,251,102,155,118,155,
+    175,104,72,31,214,239,123,157,250,109,95,45,180,79,14,171,
+    115,216,120,198,196,32,254,127,116,136,61,45,29,44,238,195,
+    215,121,146,27,51,56,55,30,202,153,167,70,193,60,91,8,
+    205,195,162,136,240,186,157,116,27,254,79,225,200,2,7,27,
+    195,39,146,60,212,8,230,228,59,130,168,20,178,249,98,206,
+    150,199,145,124,31,239,253,207,87,1,252,167,235,107,200,118,
+    182,168,27,169,109,218,158,237,221,119,183,50,122,192,93,54,
+    220,218,167,215,60,54,170,101,217,125,215,67,192,31,91,229,
+    223,186,30,164,175,81,127,162,32,181,199,187,7,164,238,230,
+    225,36,32,88,167,147,16,78,167,5,149,28,149,13,127,243,
+    216,131,240,238,1,71,110,87,234,132,65,11,70,180,145,94,
+    203,249,162,68,218,147,36,95,197,58,240,252,189,123,8,111,
+    38,63,4,207,202,121,85,195,121,251,185,205,243,175,201,186,
+    193,37,10,90,87,16,28,27,27,89,123,234,172,172,228,224,
+    152,119,46,213,146,80,194,242,255,5,192,223,238,81,117,42,
+    192,7,109,128,163,186,186,95,70,169,112,111,141,235,253,42,
+    140,65,4,128,206,241,58,247,46,65,70,106,92,252,32,228,
+    11,71,94,80,0,234,110,71,115,132,119,41,199,160,48,230,
+    160,92,181,15,74,130,44,129,244,182,203,49,52,158,214,208,
+    216,7,6,31,187,156,119,23,224,250,145,107,20,154,38,1,
+    130,112,134,136,78,96,128,87,145,164,23,225,165,194,240,34,
+    124,170,53,60,224,12,13,225,137,223,112,171,151,184,213,244,
+    43,194,243,247,159,119,232,215,88,242,130,233,80,247,68,176,
+    5,254,151,27,218,241,238,104,47,221,84,184,111,71,212,251,
+    142,233,125,169,111,162,223,197,254,234,169,176,87,116,246,74,
+    221,237,96,39,14,76,186,80,146,68,84,190,40,96,245,85,
+    68,110,72,222,71,56,3,69,216,163,70,4,171,44,92,255,
+    197,138,176,188,244,175,75,203,70,207,109,73,19,218,227,200,
+    103,58,198,24,108,28,234,5,229,150,240,105,30,105,27,89,
+    89,104,198,162,138,98,166,231,140,168,32,207,8,57,235,190,
+    68,53,2,18,180,147,176,237,70,24,119,0,115,52,39,65,
+    92,35,35,64,250,83,144,164,34,60,186,56,228,205,51,124,
+    80,104,29,226,49,89,108,145,155,199,120,18,255,70,160,37,
+    205,143,165,229,213,172,193,17,177,224,96,115,130,35,47,113,
+    196,242,204,69,98,28,58,78,90,170,173,155,168,213,172,42,
+    228,21,225,230,134,106,68,64,245,162,148,211,46,173,224,139,
+    43,213,8,18,169,206,58,33,223,144,115,134,56,209,36,54,
+    23,150,94,179,252,89,86,190,3,222,106,248,30,47,43,134,
+    251,223,78,159,50,186,243,69,77,66,104,99,93,19,148,13,
+    141,84,27,93,150,96,179,206,240,101,215,215,165,162,136,222,
+    107,250,116,214,225,83,226,200,130,84,104,72,55,250,4,209,
+    188,176,114,176,113,130,88,200,58,27,98,83,49,177,209,144,
+    200,177,138,8,39,106,8,175,96,70,24,19,91,30,114,203,
+    82,209,232,194,215,8,48,248,22,25,60,210,54,214,145,54,
+    61,99,157,245,138,182,171,213,221,116,192,162,93,85,21,142,
+    225,235,224,248,91,183,160,136,60,196,217,176,8,18,93,113,
+    20,253,250,174,209,99,58,174,177,56,146,170,36,219,184,224,
+    192,185,138,65,231,13,15,142,48,195,219,24,29,22,60,140,
+    55,135,134,223,195,141,146,186,222,40,186,65,91,35,208,114,
+    199,105,44,193,147,211,144,76,230,190,138,207,173,255,193,91,
+    191,243,100,246,27,93,175,204,238,205,169,191,103,45,248,24,
+    139,254,3,152,247,55,152,248,79,25,238,127,166,207,233,211,
+    87,202,204,213,10,115,85,103,174,2,178,63,24,223,27,156,
+    171,14,206,85,6,79,234,131,39,75,209,239,135,198,127,119,
+    246,247,103,241,5,198,64,221,71,189,119,154,96,58,51,247,
+    253,104,234,145,166,167,63,168,140,158,215,71,207,55,169,124,
+    237,220,7,38,170,51,239,239,199,19,184,116,228,105,63,191,
+    27,219,75,204,87,19,243,149,196,41,61,113,106,47,113,190,
+    154,56,95,73,92,208,19,23,42,253,139,122,255,98,157,58,
+    22,72,31,96,112,255,39,165,133,146,246,180,119,200,92,204,
+    191,138,58,48,107,109,183,150,247,26,23,251,42,186,199,77,
+    84,185,137,10,151,212,185,36,16,246,184,99,85,238,88,133,
+    123,23,120,15,98,161,24,44,255,0,74,75,47,7,169,248,
+    84,109,224,157,221,241,63,166,190,253,185,254,99,88,208,92,
+    241,200,1,5,224,5,6,165,165,7,43,117,134,2,1,209,
+    120,53,26,175,68,19,122,52,81,167,232,240,34,221,236,38,
+    85,229,82,143,54,246,210,31,84,193,248,244,130,158,94,168,
+    112,23,116,238,66,153,187,176,207,143,233,252,137,210,146,206,
+    30,221,103,185,61,54,94,101,227,187,222,63,70,117,254,116,
+    133,61,163,179,103,202,236,153,218,97,21,164,197,120,149,29,
+    39,253,128,218,143,198,159,164,245,201,11,7,110,23,222,188,
+    0,212,9,8,18,229,70,170,209,145,74,116,76,143,142,237,
+    69,167,170,209,169,74,52,165,71,83,127,25,253,243,68,53,
+    122,166,28,61,83,139,143,253,254,115,61,190,176,195,214,248,
+    113,210,209,14,222,29,27,110,217,221,250,230,70,133,91,212,
+    185,197,50,121,246,205,138,134,191,202,220,187,160,140,206,242,
+    123,236,68,149,157,120,228,173,176,41,157,77,149,217,20,32,
+    117,143,115,3,182,192,75,142,234,27,250,175,121,125,104,186,
+    18,75,233,177,84,189,11,136,7,184,230,5,6,36,16,234,
+    3,84,223,160,30,75,130,67,3,51,4,148,150,106,45,167,
+    149,217,163,117,143,99,127,105,129,253,248,216,94,124,182,26,
+    159,173,196,231,245,248,124,221,11,180,3,92,241,2,3,44,
+    125,180,206,82,189,3,122,79,10,11,78,19,80,90,172,13,
+    143,232,195,169,210,226,131,149,210,202,62,63,130,249,142,214,
+    66,220,94,104,184,26,26,174,132,120,61,196,215,41,95,96,
+    190,54,112,116,111,224,120,117,224,120,101,96,90,31,152,46,
+    93,122,58,52,182,251,239,149,161,180,62,4,162,60,225,121,
+    2,126,235,223,161,119,230,159,246,143,237,94,215,199,79,234,
+    227,63,254,246,243,74,255,138,222,191,178,227,121,58,62,243,
+    109,226,59,177,60,126,185,50,126,89,31,191,188,227,33,193,
+    9,33,58,190,199,77,85,185,169,71,215,43,220,172,206,205,
+    150,185,217,218,232,132,62,58,135,57,248,50,199,127,63,125,
+    226,155,94,125,102,169,50,253,161,62,253,225,127,247,212,176,
+    239,19,48,236,63,163,193,56,12,33,60,83,193,230,188,154,
+    132,89,120,28,226,226,92,179,60,81,155,76,217,75,51,39,
+    245,153,229,102,41,245,125,40,82,210,32,70,42,161,113,61,
+    52,254,168,171,26,154,44,135,38,107,233,57,61,125,177,116,
+    81,103,143,232,236,20,200,11,132,27,83,118,143,153,171,50,
+    115,164,127,190,22,233,214,35,35,7,110,58,60,186,143,209,
+    228,129,215,21,198,157,71,123,244,200,232,129,223,29,30,59,
+    112,123,241,77,167,23,223,116,98,192,218,4,165,170,76,170,
+    194,156,208,153,19,101,230,196,75,134,58,126,250,79,233,39,
+    105,75,75,38,188,199,36,170,76,98,119,76,31,153,213,71,
+    22,244,145,159,85,152,203,58,115,185,108,62,141,204,34,128,
+    111,152,139,217,130,36,8,176,35,11,5,69,220,144,49,206,
+    10,194,39,144,21,52,107,252,2,108,191,57,64,220,170,6,
+    59,8,44,181,228,190,23,225,85,20,21,48,192,169,23,145,
+    216,72,163,250,77,128,179,13,245,17,133,111,123,205,191,186,
+    207,231,101,32,38,0,112,49,239,228,126,119,172,238,133,47,
+    88,222,219,95,247,99,140,161,122,250,234,1,140,5,49,45,
+    132,49,150,2,190,48,198,34,184,54,138,49,142,234,31,172,
+    119,97,140,114,130,84,129,246,46,211,187,219,117,138,32,223,
+    246,54,145,183,248,52,140,192,170,95,77,30,49,130,133,147,
+    41,229,230,26,108,75,42,217,76,201,214,69,114,16,146,76,
+    225,205,174,253,188,210,200,199,60,144,189,52,83,133,200,134,
+    150,151,213,148,249,63,47,146,180,25,49,114,63,173,166,178,
+    205,255,93,9,164,76,28,106,140,88,196,67,111,220,27,255,
+    13,56,106,49,146,83,69,59,15,249,7,66,156,80,213,148,
+    243,6,63,101,109,230,36,91,54,198,14,225,114,236,237,36,
+    167,48,134,59,179,226,236,129,100,82,61,175,99,154,109,50,
+    145,3,82,191,166,172,43,178,114,59,15,140,141,255,3,9,
+    235,218,236,186,214,200,64,251,95,13,171,31,152,179,141,0,
+    61,135,238,81,248,224,8,177,245,115,128,117,55,77,211,245,
+    211,94,218,5,243,228,31,2,17,138,62,89,166,230,237,79,
+    141,26,40,59,159,26,53,81,118,62,53,106,182,236,124,106,
+    212,74,217,249,212,168,165,178,243,169,81,167,202,206,167,70,
+    125,80,118,62,53,106,174,236,124,58,81,78,148,157,79,221,
+    183,226,162,113,40,31,254,169,121,134,203,252,185,3,55,41,
+    188,120,13,35,113,251,255,3,64,239,55,186,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/mesi_two_level_cache_hierarchy.py",
+    "gem5.components.cachehierarchies.ruby.mesi_two_level_cache_hierarchy",
+    embedded_module_data,
+    3532,
+    7913);
+
+} // anonymous namespace
+} // namespace gem5
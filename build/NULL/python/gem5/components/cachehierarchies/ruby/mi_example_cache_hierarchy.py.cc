@@ -0,0 +1,219 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,173,24,75,108,27,199,117,150,223,37,185,18,87,178,
+    100,209,162,108,45,245,177,36,75,34,37,203,118,253,73,99,
+    75,178,225,42,254,196,141,83,52,33,234,44,104,238,202,166,
+    76,114,153,217,85,98,169,82,226,67,128,50,128,15,42,144,
+    34,45,16,20,68,91,24,10,236,67,14,45,144,83,209,75,
+    239,36,177,5,137,5,12,8,40,124,112,209,3,133,196,64,
+    145,83,223,12,201,21,151,38,43,183,41,57,152,125,243,230,
+    205,251,205,155,153,55,243,119,212,240,115,214,190,223,252,25,
+    170,207,145,132,36,38,137,82,76,148,73,217,162,182,148,61,
+    106,79,57,162,14,6,73,54,201,158,116,166,92,81,23,133,
+    29,73,119,138,141,178,20,118,38,61,41,111,212,75,97,87,
+    210,151,226,162,28,192,110,137,77,118,164,58,163,157,0,123,
+    36,111,210,159,226,163,60,192,62,137,75,118,165,186,163,221,
+    20,238,72,30,72,245,68,123,40,220,153,236,77,29,140,30,
+    164,176,63,217,151,10,68,3,20,230,147,135,82,253,209,126,
+    6,217,208,101,36,117,125,130,164,110,185,251,145,29,161,199,
+    246,186,17,209,160,116,224,38,154,232,121,78,26,19,14,131,
+    187,120,109,254,166,252,254,170,156,142,203,216,232,120,107,245,
+    246,218,13,5,107,55,176,114,127,173,218,220,235,245,210,230,
+    154,170,201,169,231,14,50,156,49,186,22,149,187,50,38,221,
+    48,66,83,226,74,18,144,246,165,155,243,240,241,40,31,200,
+    24,39,36,89,133,6,139,129,77,2,203,234,115,123,117,100,
+    199,252,109,85,195,177,184,182,160,196,176,244,220,86,197,30,
+    172,99,23,99,241,187,242,143,18,50,142,225,248,221,181,231,
+    76,181,187,191,222,77,52,177,146,16,129,23,65,64,92,83,
+    48,105,116,128,97,139,74,90,195,74,50,41,99,64,184,175,
+    206,210,17,0,250,110,38,82,153,164,124,67,59,126,67,139,
+    183,156,226,247,160,250,5,76,178,140,162,140,132,162,54,137,
+    137,218,37,155,236,144,236,178,99,217,145,69,203,140,228,248,
+    132,139,58,109,72,118,201,238,71,160,222,99,166,206,68,114,
+    202,172,228,146,220,203,14,137,253,196,241,8,48,143,77,1,
+    81,79,22,221,103,162,94,152,2,143,209,119,109,233,210,253,
+    24,209,196,106,202,186,230,21,224,247,246,93,89,184,182,36,
+    214,72,132,56,161,17,238,214,137,132,56,150,99,154,172,10,
+    49,129,56,163,214,189,172,96,65,6,72,136,43,146,44,36,
+    210,66,140,178,82,169,189,66,70,73,164,181,105,77,153,166,
+    128,160,41,25,37,169,220,89,11,83,26,195,161,38,214,101,
+    195,25,83,85,37,30,183,55,120,133,204,13,105,127,35,65,
+    245,43,230,115,164,49,123,157,86,251,114,13,61,237,104,24,
+    180,193,108,32,209,86,111,111,216,160,101,202,147,24,240,141,
+    109,253,35,170,19,249,157,205,196,112,44,37,16,229,206,82,
+    159,16,72,80,150,107,118,82,179,193,80,141,56,71,78,84,
+    157,19,110,30,77,141,170,14,167,96,34,166,37,62,72,104,
+    107,86,62,123,195,174,195,210,112,170,171,25,136,122,86,20,
+    19,233,132,38,138,134,83,164,30,114,137,148,5,80,56,84,
+    57,185,140,3,160,53,62,4,149,225,17,197,120,18,58,69,
+    81,37,235,3,248,60,248,238,186,138,227,145,204,154,118,87,
+    73,71,238,200,169,147,145,184,146,202,40,105,57,173,169,17,
+    42,180,62,163,9,89,141,96,152,201,72,42,33,202,213,57,
+    23,41,129,104,206,121,56,179,134,7,128,241,186,208,38,114,
+    194,117,93,79,2,149,58,13,213,191,30,160,23,94,228,233,
+    252,212,253,208,93,98,3,69,54,80,96,251,117,182,63,207,
+    246,239,244,30,202,58,30,122,203,7,131,240,241,101,225,255,
+    13,153,0,195,121,155,172,72,195,133,101,109,21,167,175,199,
+    205,137,130,159,175,30,10,191,245,144,61,176,49,16,180,6,
+    186,21,19,126,194,88,23,7,131,52,119,187,192,128,48,112,
+    152,220,124,168,1,191,98,226,173,220,26,123,68,151,25,66,
+    54,11,222,221,26,191,226,122,153,226,14,209,129,53,117,56,
+    208,160,3,147,243,162,22,191,166,240,247,237,79,99,181,224,
+    34,218,98,110,253,227,103,224,175,77,219,166,93,59,212,32,
+    17,173,116,52,192,157,13,112,11,27,54,236,160,161,127,127,
+    233,175,104,7,255,74,156,186,246,167,122,98,127,4,222,125,
+    108,122,120,211,161,141,238,209,194,210,119,172,152,94,6,184,
+    199,28,231,176,158,91,27,14,177,183,65,242,193,253,37,227,
+    41,224,103,142,201,245,181,26,1,156,2,251,115,106,142,224,
+    198,25,0,189,246,96,123,174,97,254,26,164,52,232,177,210,
+    223,150,171,61,23,252,94,163,7,94,125,116,27,158,16,133,
+    143,205,149,203,252,31,99,69,59,187,215,179,114,164,14,221,
+    163,178,112,196,162,205,96,29,218,116,182,214,114,211,5,182,
+    10,173,100,110,56,55,92,205,54,164,123,218,81,191,116,40,
+    181,155,85,180,98,238,8,185,80,75,185,142,230,217,216,98,
+    30,254,147,238,37,67,38,13,147,27,222,95,139,139,232,214,
+    187,116,47,112,111,178,218,82,131,132,214,107,254,213,86,188,
+    123,131,125,4,163,31,155,28,54,61,22,91,61,22,91,77,
+    141,219,216,234,105,182,245,97,148,90,106,174,106,208,234,232,
+    254,90,225,223,1,221,216,254,116,155,94,203,46,236,109,222,
+    61,111,125,84,219,59,89,237,199,13,116,223,195,95,214,8,
+    218,244,105,55,27,248,218,54,216,39,78,43,197,134,79,60,
+    214,74,46,224,29,173,241,43,38,189,133,194,244,96,27,207,
+    251,94,242,252,199,218,79,27,250,27,226,212,74,217,68,53,
+    218,154,106,189,73,79,113,170,21,103,11,197,116,3,118,168,
+    37,69,248,191,211,65,114,221,163,59,62,238,106,164,177,112,
+    140,180,194,238,205,113,110,6,181,248,53,89,96,234,186,222,
+    164,205,250,75,26,49,237,228,204,182,146,211,188,167,104,114,
+    187,62,139,77,115,38,150,201,157,104,163,255,158,14,38,117,
+    251,211,64,66,144,68,187,175,195,85,39,24,175,95,208,196,
+    76,237,134,38,214,174,98,210,115,114,221,153,112,55,36,176,
+    238,180,172,125,168,224,123,134,35,174,96,217,240,87,243,207,
+    100,34,45,87,83,95,175,22,195,119,100,77,76,168,49,195,
+    27,79,222,19,37,37,21,75,164,39,236,134,27,238,122,106,
+    66,73,27,46,137,14,194,36,122,38,108,152,132,136,193,38,
+    210,98,6,110,149,42,166,215,188,147,152,164,73,152,204,136,
+    225,37,55,156,119,230,175,221,184,122,9,19,231,26,62,146,
+    3,139,42,189,101,98,178,253,227,113,130,238,79,175,166,110,
+    203,88,84,150,197,15,18,88,91,141,37,197,154,174,170,193,
+    137,113,243,162,167,26,30,25,72,33,31,214,100,163,131,232,
+    10,102,199,101,72,216,177,225,33,77,98,152,138,73,158,129,
+    15,147,138,156,70,198,1,218,211,100,172,187,110,41,79,123,
+    147,74,188,110,47,118,82,77,233,128,107,114,10,46,156,212,
+    92,195,163,238,221,149,239,198,84,49,161,136,183,87,85,163,
+    19,212,75,195,197,116,233,77,114,181,86,13,47,101,108,237,
+    19,19,85,183,145,240,222,67,86,125,105,244,212,219,31,198,
+    146,247,192,9,85,95,122,8,169,253,157,211,167,140,110,184,
+    205,193,85,123,53,163,137,202,170,70,187,141,46,147,113,189,
+    207,112,197,50,25,57,45,25,7,69,169,126,81,182,120,142,
+    186,43,37,167,106,252,187,9,127,94,148,82,49,43,21,177,
+    140,32,41,85,117,144,217,196,100,179,198,100,13,27,29,4,
+    185,231,16,123,82,78,27,93,48,53,100,10,77,180,10,94,
+    108,224,221,219,90,49,127,179,14,221,53,227,22,27,245,82,
+    225,190,146,1,167,46,47,67,19,59,168,35,33,142,168,98,
+    36,10,238,175,25,7,234,78,169,198,23,237,154,224,48,201,
+    57,48,57,158,13,38,129,39,200,215,89,117,60,7,206,35,
+    203,165,234,210,142,106,75,205,84,155,78,28,75,223,145,13,
+    7,109,216,65,115,195,179,231,22,71,92,195,73,149,67,244,
+    22,104,254,48,217,217,141,174,68,26,162,16,232,32,70,171,
+    81,183,62,209,238,66,247,18,233,121,224,160,106,96,221,3,
+    244,140,229,255,54,253,186,62,189,148,103,223,40,176,111,232,
+    236,27,0,60,11,142,254,230,181,47,94,203,58,116,54,240,
+    194,133,70,34,219,154,30,57,95,24,190,160,15,95,160,72,
+    157,21,42,46,244,131,211,181,198,92,249,245,243,117,188,206,
+    158,171,116,162,195,131,164,125,232,105,159,144,235,45,133,78,
+    20,67,39,10,161,83,122,232,84,41,116,161,24,186,80,8,
+    45,232,161,133,66,223,162,222,183,88,65,71,61,83,187,164,
+    250,244,114,118,62,171,61,237,9,150,123,15,125,22,45,31,
+    236,255,236,94,57,48,160,7,198,245,192,12,160,202,194,104,
+    73,56,83,20,206,20,132,115,186,112,174,28,20,74,193,112,
+    49,24,46,4,103,244,224,76,41,120,186,24,60,93,8,158,
+    213,131,103,105,215,108,49,56,91,8,206,233,193,185,138,159,
+    237,237,220,69,80,125,75,170,236,165,23,61,104,112,170,28,
+    56,84,238,27,208,251,198,129,90,15,78,86,220,142,65,32,
+    130,234,91,82,101,47,61,124,179,194,33,190,183,228,31,44,
+    250,7,11,254,144,238,15,85,16,211,177,200,148,249,222,207,
+    252,37,62,92,228,195,219,171,165,200,249,34,120,38,50,175,
+    71,230,11,252,130,206,47,228,249,133,29,97,68,23,102,178,
+    151,116,238,240,14,199,151,184,193,34,55,152,115,254,193,175,
+    11,167,11,220,25,157,59,147,231,206,148,219,117,208,17,163,
+    69,110,148,202,209,249,241,237,209,39,17,253,216,194,174,221,
+    214,1,186,65,85,161,149,151,42,55,84,244,15,21,252,35,
+    186,127,164,228,159,42,250,167,10,254,176,238,15,255,105,248,
+    143,99,69,255,153,188,255,76,121,112,228,139,143,245,193,249,
+    45,14,220,71,5,109,117,148,249,158,18,127,180,200,31,205,
+    109,124,117,171,192,47,234,252,98,158,150,157,122,71,129,31,
+    7,193,121,126,188,193,18,80,24,234,18,55,82,228,70,114,
+    63,41,112,147,58,55,153,231,38,1,128,72,24,155,32,211,
+    61,220,52,39,21,196,122,78,208,234,211,43,217,75,91,39,
+    158,118,7,65,182,206,11,192,28,172,43,241,19,69,126,162,
+    192,79,234,252,36,52,161,107,215,227,60,0,54,66,149,93,
+    4,239,15,14,235,71,194,217,197,135,111,82,217,99,37,46,
+    92,228,194,219,106,129,155,211,185,185,60,45,32,59,52,76,
+    100,31,46,251,248,146,239,72,209,119,164,224,19,116,159,80,
+    65,62,207,92,57,112,184,20,152,44,6,38,11,129,105,61,
+    48,157,93,122,26,28,201,189,91,8,70,244,96,164,130,60,
+    29,115,180,250,165,123,139,1,229,250,70,202,61,1,189,103,
+    68,239,153,218,150,75,225,203,197,240,229,66,120,73,15,47,
+    129,231,3,221,224,249,64,247,150,3,86,195,209,227,95,135,
+    254,34,229,71,175,20,70,175,232,163,87,182,28,58,63,180,
+    51,60,166,15,207,17,80,40,207,158,212,103,231,41,86,231,
+    195,59,196,222,209,18,63,85,228,167,182,223,46,240,199,117,
+    254,120,158,150,103,211,51,95,245,232,179,11,133,233,69,125,
+    122,241,175,113,106,99,8,100,93,102,188,32,12,234,93,100,
+    11,123,107,203,234,24,204,247,248,148,62,86,95,113,35,84,
+    204,213,90,43,252,204,215,153,213,32,8,10,190,81,221,55,
+    186,221,85,244,29,203,251,142,149,35,115,122,228,98,246,162,
+    206,13,232,220,212,14,203,85,87,104,137,157,43,194,146,165,
+    243,89,238,236,214,59,39,118,237,76,199,177,29,2,14,239,
+    58,109,29,35,187,118,135,7,148,128,170,66,43,47,184,169,
+    62,54,92,100,195,5,118,70,103,103,242,236,204,11,22,77,
+    158,254,50,242,36,82,83,100,172,204,118,148,216,80,145,13,
+    229,70,244,161,227,250,208,188,62,4,219,202,21,157,189,146,
+    175,23,76,50,167,9,31,121,19,75,199,82,178,40,26,94,
+    81,76,41,210,106,146,192,156,40,190,15,7,115,173,199,45,
+    194,105,25,7,192,174,106,152,62,91,97,114,155,196,36,5,
+    199,228,101,3,191,71,143,137,218,155,89,92,78,38,69,113,
+    130,193,2,217,224,72,46,115,129,238,150,184,175,94,145,163,
+    81,253,61,162,111,90,245,127,197,102,119,178,21,68,42,47,
+    235,28,248,245,77,8,89,231,192,246,1,250,105,95,245,32,
+    151,255,193,187,121,255,104,193,121,84,119,30,173,216,86,24,
+    231,85,38,183,89,65,20,248,186,167,6,88,63,187,118,228,
+    26,219,35,111,73,83,251,80,71,81,173,175,79,12,24,222,
+    212,201,176,114,123,5,14,30,149,158,141,244,112,162,73,68,
+    53,231,233,126,57,73,171,102,71,14,72,63,106,7,125,231,
+    170,150,72,170,225,250,155,58,245,101,29,89,127,91,167,121,
+    149,209,75,223,239,212,112,172,246,86,46,210,54,117,185,17,
+    48,145,77,79,139,116,90,140,195,102,55,205,194,154,105,200,
+    123,15,100,148,4,171,134,247,158,41,195,230,169,93,205,25,
+    132,22,20,150,3,156,102,9,70,255,203,100,201,217,170,76,
+    154,159,25,125,181,7,234,4,16,85,95,176,197,140,118,60,
+    163,85,211,66,226,220,47,81,213,209,36,80,190,99,95,171,
+    70,226,235,24,211,36,24,162,229,45,168,43,118,134,97,42,
+    167,156,140,173,130,254,183,170,19,49,39,243,232,68,99,41,
+    163,64,222,90,202,104,60,111,45,101,52,150,183,150,50,58,
+    158,183,150,50,250,97,222,90,202,232,82,222,90,90,141,58,
+    151,183,150,50,138,228,173,165,140,102,242,214,82,113,253,156,
+    97,72,132,182,255,228,143,156,222,173,66,223,254,7,42,234,
+    243,127,3,15,161,52,166,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/mi_example_cache_hierarchy.py",
+    "gem5.components.cachehierarchies.ruby.mi_example_cache_hierarchy",
+    embedded_module_data,
+    3111,
+    6939);
+
+} // anonymous namespace
+} // namespace gem5
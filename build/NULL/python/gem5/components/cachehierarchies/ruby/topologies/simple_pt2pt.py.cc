@@ -0,0 +1,110 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,85,77,108,19,71,20,158,217,93,219,107,231,7,
+    99,76,98,44,84,45,77,91,234,6,108,74,154,22,21,136,
+    90,218,10,21,72,64,74,123,177,138,182,203,238,198,113,88,
+    239,154,217,177,32,169,45,229,128,84,71,202,33,84,84,112,
+    169,148,19,162,130,67,47,149,56,80,169,199,30,109,100,9,
+    107,37,14,168,234,129,219,162,80,169,226,212,55,227,255,0,
+    173,196,254,188,157,247,51,111,222,251,230,205,219,63,81,223,
+    21,104,127,183,62,6,114,3,25,200,192,22,42,224,44,46,
+    8,89,161,32,102,197,130,148,149,48,18,208,73,100,8,87,
+    145,33,154,226,45,17,161,59,98,199,65,54,96,72,243,40,
+    21,120,194,152,148,228,141,204,231,11,69,203,252,226,10,61,
+    147,183,47,118,216,47,237,1,118,206,164,151,29,114,209,11,
+    206,95,206,83,125,81,239,143,72,232,68,244,46,144,239,33,
+    38,19,101,177,129,178,130,129,179,98,21,45,96,136,67,206,
+    74,134,120,21,214,174,162,43,56,27,156,103,11,15,181,92,
+    159,163,135,207,209,149,227,159,42,46,103,149,162,147,183,233,
+    65,234,28,228,3,197,110,173,156,86,190,90,204,187,138,225,
+    152,174,189,31,164,14,85,74,174,169,228,52,2,6,105,93,
+    216,22,15,203,118,203,0,242,35,190,129,40,238,41,111,193,
+    123,167,203,109,246,105,94,101,131,81,14,149,145,218,93,161,
+    140,129,235,162,105,32,200,5,207,65,58,1,183,84,52,137,
+    39,171,106,222,206,83,85,245,130,16,89,126,193,245,134,72,
+    233,194,178,234,46,187,212,44,164,68,79,114,77,107,129,140,
+    192,92,47,172,170,186,165,185,174,170,186,204,161,162,172,62,
+    63,237,18,61,83,92,166,139,142,157,201,153,133,233,140,238,
+    20,138,142,109,218,212,205,232,154,190,104,46,230,77,162,17,
+    29,62,110,134,57,206,80,167,232,88,78,142,241,45,4,213,
+    34,61,92,164,233,226,50,25,2,167,43,241,62,152,211,157,
+    224,222,1,141,123,8,200,63,171,232,145,60,178,22,90,15,
+    61,148,19,15,228,68,93,78,54,228,100,77,78,54,199,18,
+    85,105,125,200,151,209,222,253,85,169,33,39,106,252,217,98,
+    73,15,192,29,238,192,61,131,91,219,111,224,171,3,144,83,
+    177,55,46,227,91,160,185,211,213,14,114,159,111,131,126,173,
+    15,246,78,33,209,208,171,189,189,100,190,212,221,40,177,34,
+    228,80,69,92,67,75,66,207,254,252,241,138,180,77,50,85,
+    9,148,165,114,224,34,151,17,188,30,46,11,134,180,2,251,
+    85,17,202,226,102,0,189,228,162,35,125,49,9,108,246,221,
+    192,224,161,27,140,19,163,245,15,214,103,202,16,139,218,205,
+    198,96,135,34,180,114,249,51,199,182,77,157,42,154,101,41,
+    206,130,66,23,77,69,119,108,74,28,203,50,137,171,80,71,
+    33,78,137,178,161,102,27,76,5,214,220,170,45,142,40,237,
+    139,58,57,19,228,68,201,219,138,246,170,83,213,181,214,251,
+    79,2,75,114,23,188,91,105,196,122,12,171,255,243,177,10,
+    238,223,212,50,190,187,45,169,107,194,250,46,118,22,82,216,
+    11,183,98,81,243,70,10,147,32,232,82,130,39,164,15,121,
+    56,239,50,84,21,133,68,225,243,60,114,204,202,187,148,21,
+    248,204,202,225,254,42,109,101,69,63,235,229,157,62,102,57,
+    186,102,185,51,233,222,156,41,240,225,78,0,89,69,181,241,
+    217,214,243,11,254,41,120,123,103,45,49,89,79,76,54,18,
+    147,93,57,217,9,118,3,57,202,157,28,207,161,86,151,224,
+    89,190,249,13,4,88,193,21,97,48,215,178,176,38,46,225,
+    30,191,167,171,3,20,6,54,26,80,152,224,40,136,94,200,
+    130,6,10,24,120,178,121,133,170,182,99,152,158,12,216,243,
+    81,74,32,108,138,23,106,239,90,74,34,187,89,185,141,49,
+    33,214,201,40,203,77,226,88,41,171,28,45,50,14,228,117,
+    96,250,136,185,58,129,248,81,247,145,152,140,244,200,227,104,
+    124,3,111,188,255,183,136,70,146,155,251,110,107,247,222,186,
+    127,224,247,75,247,51,181,225,83,245,225,83,141,225,83,190,
+    56,96,207,81,36,108,11,159,48,48,82,34,97,64,120,50,
+    244,172,118,126,134,219,202,111,46,37,123,1,162,217,57,211,
+    19,45,211,38,123,153,93,216,180,75,5,232,94,212,132,33,
+    64,194,240,113,189,160,86,44,154,182,65,36,110,194,0,226,
+    242,84,144,131,224,13,245,85,191,23,225,144,234,78,9,68,
+    172,133,121,2,201,195,187,228,178,34,251,150,23,50,7,203,
+    139,189,136,205,202,27,255,131,29,195,233,113,27,167,8,74,
+    204,97,168,155,95,191,254,109,234,222,119,245,163,167,27,71,
+    79,215,167,207,52,166,207,128,176,62,62,219,24,159,133,238,
+    56,236,203,3,248,112,242,87,98,223,38,148,95,186,145,72,
+    251,1,224,159,50,225,51,70,96,198,168,63,138,198,198,171,
+    145,102,124,172,26,110,198,198,174,31,240,81,40,28,227,164,
+    122,162,57,150,188,110,249,40,56,18,227,100,67,104,238,218,
+    125,51,246,195,145,141,35,205,248,222,102,52,121,83,187,182,
+    99,35,210,140,238,121,24,85,30,68,149,71,241,125,183,223,
+    187,71,254,56,81,139,159,173,199,207,54,226,103,159,138,194,
+    206,216,51,4,196,239,145,48,243,55,138,146,19,108,253,42,
+    220,124,27,83,33,246,171,178,181,130,9,191,170,136,170,22,
+    28,163,100,177,241,176,170,94,42,105,86,91,19,82,85,195,
+    209,85,149,255,75,200,36,195,118,164,253,215,210,77,203,82,
+    85,56,225,59,24,114,172,32,62,105,85,170,220,33,236,112,
+    186,179,45,72,59,119,83,58,89,147,78,250,82,48,176,31,
+    146,124,145,68,147,129,9,31,253,23,105,85,33,243,63,151,
+    10,122,145,194,116,218,185,176,4,123,233,242,35,197,235,136,
+    176,14,198,59,15,183,251,25,181,230,240,174,35,31,107,165,
+    58,67,166,120,43,134,16,75,64,124,17,99,236,127,24,192,
+    130,143,94,143,68,223,198,16,224,139,100,227,224,83,246,121,
+    246,18,21,15,235,95,16,19,100,249,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/cachehierarchies/ruby/topologies/simple_pt2pt.py",
+    "gem5.components.cachehierarchies.ruby.topologies.simple_pt2pt",
+    embedded_module_data,
+    1370,
+    2527);
+
+} // anonymous namespace
+} // namespace gem5
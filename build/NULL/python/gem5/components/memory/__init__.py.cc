@@ -0,0 +1,56 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,146,189,142,211,64,16,128,119,253,23,59,63,206,
+    239,69,8,40,144,168,82,112,190,36,190,40,5,32,1,46,
+    64,34,8,93,170,219,102,21,18,235,18,225,177,35,59,17,
+    184,203,91,240,10,240,6,60,6,181,91,42,58,75,215,68,
+    87,177,99,172,195,119,161,66,96,89,159,119,63,207,204,142,
+    215,251,157,20,46,37,127,94,238,4,62,145,5,89,80,143,
+    0,101,148,226,88,242,36,144,153,12,10,83,64,101,42,104,
+    76,203,188,236,149,64,103,58,24,204,128,50,43,67,133,85,
+    160,202,170,80,99,53,48,153,9,117,86,167,196,192,72,197,
+    107,64,147,53,161,197,90,208,102,109,232,176,14,28,177,35,
+    81,69,157,146,135,132,146,243,108,244,81,62,39,31,104,79,
+    251,65,69,27,61,154,24,47,159,79,6,211,205,108,254,190,
+    167,36,29,103,59,243,94,44,103,190,239,122,142,115,54,228,
+    253,209,201,201,161,29,244,135,195,219,214,230,3,91,196,118,
+    11,246,245,219,235,26,61,61,49,157,87,147,9,23,230,148,
+    219,24,89,152,143,110,205,199,89,165,233,202,191,240,220,131,
+    110,254,224,179,126,14,124,222,81,227,134,23,95,155,220,185,
+    97,138,93,170,73,195,57,123,54,153,198,209,239,245,10,198,
+    230,253,241,104,148,84,114,131,59,151,180,242,73,86,198,230,
+    195,129,72,41,231,110,226,194,155,94,55,145,151,239,32,148,
+    197,118,39,53,216,122,155,21,159,255,90,57,196,35,17,170,
+    8,13,81,194,16,51,202,154,187,142,209,241,141,129,40,35,
+    42,136,42,162,134,48,17,117,204,43,45,194,25,68,113,20,
+    54,80,53,17,45,68,27,209,17,248,66,46,241,248,93,61,
+    138,194,185,181,142,55,203,192,183,46,92,56,181,230,1,172,
+    3,223,245,55,145,5,46,4,97,108,113,190,242,87,27,206,
+    143,215,241,149,254,24,130,197,214,115,159,134,247,69,54,30,
+    154,232,129,96,42,83,74,211,17,161,247,190,145,187,197,59,
+    149,84,42,165,228,239,80,53,112,244,127,209,173,82,35,149,
+    52,85,75,201,63,195,62,53,21,81,85,39,170,177,115,118,
+    206,126,191,143,240,191,125,54,199,228,171,244,68,254,9,231,
+    217,5,190,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/memory/__init__.py",
+    "gem5.components.memory",
+    embedded_module_data,
+    499,
+    1032);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,113 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,86,221,143,19,85,20,159,59,31,237,180,219,238,
+    242,177,172,8,42,227,10,98,21,187,145,184,70,68,17,216,
+    16,196,184,27,195,18,77,230,193,217,233,204,237,238,144,249,
+    40,247,222,10,219,23,55,102,19,49,241,213,192,35,15,134,
+    44,193,63,128,63,3,13,137,102,18,19,19,158,120,43,1,
+    19,195,147,231,220,118,186,221,182,176,66,219,156,249,56,231,
+    158,123,126,191,243,113,123,95,233,251,24,221,235,163,139,32,
+    174,41,190,226,147,80,137,136,77,34,213,86,9,62,171,161,
+    22,233,182,30,25,182,17,229,236,156,124,167,133,249,200,180,
+    205,168,96,23,162,162,93,140,198,236,49,120,175,251,70,88,
+    138,202,118,153,40,170,114,86,241,115,235,138,159,167,99,55,
+    53,69,185,173,101,27,218,227,190,185,168,84,10,15,240,161,
+    162,166,249,83,167,231,230,169,112,211,113,183,198,5,115,61,
+    17,81,177,146,248,21,45,213,191,8,184,72,205,69,122,169,
+    73,99,143,166,198,133,102,35,164,21,61,45,156,242,125,118,
+    222,141,151,105,154,159,167,209,156,96,97,170,127,153,48,145,
+    22,22,155,181,197,85,46,104,244,64,69,255,36,45,159,234,
+    186,61,157,184,204,247,250,177,231,50,236,143,65,252,0,232,
+    169,98,19,95,177,85,170,217,186,95,186,170,212,137,175,173,
+    151,108,131,230,124,157,230,125,226,171,117,192,184,174,223,4,
+    251,219,61,55,182,9,122,66,11,180,72,199,104,169,174,190,
+    220,211,108,222,213,85,96,99,112,93,89,174,27,167,19,91,
+    236,242,67,118,59,164,221,78,208,153,67,186,93,160,43,128,
+    143,177,77,31,221,56,139,67,182,187,253,146,63,182,174,219,
+    147,87,149,43,196,222,3,89,40,167,147,25,61,192,99,194,
+    86,59,220,165,57,70,69,147,197,11,30,233,163,11,9,197,
+    52,62,250,12,196,207,228,154,34,250,180,91,183,186,209,191,
+    238,41,54,88,72,16,2,89,128,34,48,120,179,65,89,106,
+    58,78,16,7,194,113,224,149,206,105,88,79,11,142,227,133,
+    46,231,142,195,113,123,107,237,201,113,206,188,153,198,42,148,
+    72,60,179,76,163,217,25,47,137,26,73,76,99,193,103,34,
+    137,97,38,43,36,167,243,236,112,9,170,218,88,101,187,193,
+    71,235,213,81,144,171,217,214,71,193,132,31,0,241,239,154,
+    242,151,89,254,49,255,83,254,15,115,239,239,230,222,223,204,
+    125,247,204,125,119,179,223,35,196,144,26,53,89,85,106,31,
+    74,146,209,180,67,193,142,18,125,170,239,73,133,180,106,23,
+    86,2,110,213,155,177,39,130,36,182,48,252,144,10,202,45,
+    55,12,173,164,110,137,21,106,197,212,163,156,187,108,213,130,
+    216,26,220,18,137,229,250,62,168,2,94,180,186,159,14,56,
+    171,3,14,45,112,161,12,167,122,139,164,187,23,18,113,14,
+    61,71,192,12,245,207,48,150,176,138,202,38,33,10,182,23,
+    33,74,58,45,54,133,40,118,5,177,151,176,70,194,92,65,
+    187,164,181,14,143,100,105,216,112,22,157,21,65,172,41,255,
+    152,202,196,244,93,243,117,246,18,60,110,41,157,237,56,57,
+    118,150,10,25,63,184,22,18,174,151,196,64,130,144,144,71,
+    67,245,92,111,133,86,217,62,240,113,139,72,96,28,183,233,
+    66,42,47,83,153,127,71,122,108,77,143,68,179,197,230,56,
+    198,215,5,146,123,81,32,31,34,144,190,68,118,35,7,52,
+    130,37,97,72,25,183,130,120,4,168,14,14,246,218,0,138,
+    169,110,132,88,197,125,62,90,239,60,11,206,128,241,73,116,
+    108,161,120,110,52,71,206,203,49,192,37,20,145,8,55,180,
+    120,208,162,3,224,158,137,192,196,160,112,209,83,218,46,83,
+    159,217,18,37,12,32,156,238,252,121,26,203,157,2,131,197,
+    110,29,117,130,149,78,172,122,194,70,49,94,236,117,210,188,
+    187,106,53,96,200,88,81,51,20,1,244,140,21,39,241,187,
+    201,183,148,133,110,163,17,196,203,29,71,188,106,93,24,201,
+    67,71,219,115,199,87,146,102,232,91,145,43,188,21,169,31,
+    230,172,111,243,115,245,81,53,30,96,157,224,104,112,69,80,
+    131,128,46,7,98,165,111,175,35,150,27,91,244,138,71,27,
+    56,67,122,190,46,7,80,121,53,52,10,56,245,171,189,247,
+    50,53,89,247,31,26,236,254,29,124,179,110,164,251,214,161,
+    145,169,26,52,251,188,175,243,39,183,109,152,156,76,154,79,
+    96,228,171,173,143,230,160,71,168,143,173,12,94,173,102,3,
+    240,192,72,71,170,99,74,125,208,184,117,65,153,181,180,20,
+    205,194,204,225,194,141,69,0,51,103,105,169,186,112,107,184,
+    200,118,66,7,115,225,244,25,182,222,28,61,228,7,237,190,
+    66,79,121,137,225,111,179,116,85,151,0,128,41,44,177,133,
+    202,20,158,72,177,27,81,199,73,139,142,19,37,126,51,196,
+    251,146,227,92,106,186,97,71,195,52,57,111,64,13,255,98,
+    186,135,149,60,104,152,142,162,140,226,21,20,200,0,195,189,
+    152,137,2,153,99,120,208,48,252,15,198,10,40,166,209,149,
+    22,64,239,30,196,199,195,40,222,238,186,151,174,61,26,134,
+    112,60,18,182,39,163,224,164,164,128,77,100,98,6,21,159,
+    16,121,126,101,223,63,39,247,175,205,183,117,98,236,111,43,
+    79,19,57,37,55,217,86,53,99,122,163,220,86,224,114,231,
+    160,188,108,138,135,26,88,172,127,35,109,218,69,105,173,26,
+    211,215,175,108,24,27,193,157,201,141,228,222,91,39,238,29,
+    248,180,173,168,104,159,137,222,34,124,97,102,139,54,244,141,
+    175,127,45,255,47,211,235,111,108,111,86,48,166,111,136,141,
+    115,191,124,215,86,224,246,206,251,242,178,41,122,43,240,197,
+    148,106,200,141,183,17,178,14,36,159,11,149,137,84,115,107,
+    158,76,179,76,105,154,19,171,56,21,58,121,235,101,53,45,
+    66,173,38,181,139,112,106,241,78,134,11,189,52,143,161,126,
+    143,60,156,121,181,247,247,68,62,119,10,68,166,175,146,141,
+    63,153,210,39,230,199,157,130,59,193,102,187,141,196,239,131,
+    104,107,132,144,246,7,26,81,33,45,219,10,83,199,187,231,
+    17,37,3,239,94,76,140,43,228,232,93,229,189,254,95,59,
+    87,33,192,233,176,184,126,236,33,94,30,143,80,73,18,254,
+    3,42,38,41,64,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/memory/abstract_memory_system.py",
+    "gem5.components.memory.abstract_memory_system",
+    embedded_module_data,
+    1413,
+    3239);
+
+} // anonymous namespace
+} // namespace gem5
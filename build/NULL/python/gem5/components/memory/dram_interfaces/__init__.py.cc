@@ -0,0 +1,32 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,123,204,128,4,24,161,244,103,54,32,49,157,33,133,
+    33,152,65,147,209,111,37,67,17,19,72,16,36,243,203,182,
+    184,40,89,191,160,178,36,35,63,79,63,61,53,215,84,63,
+    57,63,183,32,63,47,53,175,164,88,63,55,53,55,191,168,
+    82,63,165,40,49,55,62,51,175,36,181,40,45,49,57,181,
+    88,63,30,200,201,44,137,143,215,43,168,252,197,97,147,155,
+    159,82,154,147,106,87,196,10,181,175,152,31,72,124,96,102,
+    100,100,252,192,0,35,138,152,129,98,0,54,160,38,247,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/memory/dram_interfaces/__init__.py",
+    "gem5.components.memory.dram_interfaces",
+    embedded_module_data,
+    127,
+    154);
+
+} // anonymous namespace
+} // namespace gem5
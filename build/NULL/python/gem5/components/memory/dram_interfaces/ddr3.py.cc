@@ -0,0 +1,114 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,165,150,201,115,27,69,20,135,103,164,209,146,145,108,
+    203,251,150,64,147,221,96,100,45,150,23,8,1,197,114,82,
+    33,177,73,201,38,14,125,25,143,212,109,107,136,52,35,166,
+    71,113,236,147,14,20,23,46,220,184,113,164,138,226,194,159,
+    226,163,107,78,84,113,202,77,84,56,229,196,123,61,227,141,
+    36,5,85,72,238,239,117,247,123,221,211,234,215,253,27,255,
+    161,156,249,196,66,251,114,29,240,163,194,20,170,48,149,69,
+    154,106,43,66,35,170,18,81,238,41,44,250,173,194,52,30,
+    249,57,170,40,191,70,143,7,210,168,244,197,192,23,231,209,
+    127,248,52,150,216,80,102,146,102,74,85,148,251,182,199,221,
+    29,179,206,5,217,113,92,82,169,84,139,164,197,91,142,107,
+    113,161,235,155,13,46,120,208,222,39,151,173,147,216,203,164,
+    238,216,158,105,217,196,107,112,226,89,45,203,222,157,37,220,
+    230,238,238,62,88,175,158,37,109,211,53,91,28,6,4,19,
+    115,179,222,208,195,137,188,253,54,39,166,205,136,233,114,210,
+    17,29,179,217,220,39,53,83,112,70,28,155,48,211,51,69,
+    131,115,47,24,136,15,8,199,49,254,204,130,135,103,117,253,
+    43,167,67,234,166,13,131,57,6,0,79,215,70,194,85,173,
+    241,214,138,231,54,137,83,251,154,215,61,98,10,217,187,189,
+    205,96,93,219,219,225,162,245,147,113,89,253,5,110,206,140,
+    234,247,85,170,229,181,147,125,169,159,205,135,122,156,143,159,
+    100,62,184,66,85,200,73,132,169,52,202,34,176,175,81,26,
+    131,18,103,26,77,128,77,178,24,189,0,86,103,113,154,98,
+    9,154,102,73,218,7,165,31,202,0,187,64,51,76,167,131,
+    44,69,135,88,154,14,179,62,58,194,250,233,40,27,160,99,
+    80,198,89,134,78,64,153,100,131,116,10,226,166,217,16,189,
+    200,134,233,37,54,66,223,97,163,244,93,54,70,9,27,167,
+    239,177,9,122,25,218,87,160,255,42,155,164,215,216,20,189,
+    206,166,33,191,23,225,135,64,54,141,252,66,46,103,44,61,
+    95,58,248,77,39,240,41,19,1,191,187,201,101,170,63,68,
+    39,121,190,48,79,234,13,211,182,121,147,220,116,108,14,201,
+    109,181,100,126,176,48,230,114,33,72,173,35,102,102,201,158,
+    229,53,228,52,193,246,137,211,180,153,103,38,156,39,247,106,
+    150,119,154,73,114,115,205,170,187,16,180,182,57,159,255,188,
+    148,47,172,45,205,64,154,228,68,144,69,88,28,158,167,29,
+    107,183,227,154,158,229,216,144,97,116,249,113,12,181,238,188,
+    72,194,110,251,90,254,1,84,35,80,61,136,231,179,133,146,
+    45,252,40,224,32,145,47,102,23,177,165,21,101,223,130,172,
+    230,108,241,66,195,97,177,194,66,14,123,242,24,27,91,204,
+    74,83,200,134,173,165,142,128,136,69,25,81,42,181,202,48,
+    178,32,185,4,140,229,11,37,105,74,139,104,10,69,25,80,
+    200,181,202,175,180,124,182,244,120,125,230,134,159,52,12,27,
+    206,185,97,248,186,97,180,28,214,105,98,61,109,24,223,192,
+    177,14,61,9,195,96,78,29,42,169,224,4,27,194,58,224,
+    126,38,108,192,198,26,123,22,243,26,126,186,214,113,133,103,
+    52,185,189,11,173,209,208,239,58,123,181,206,206,14,119,207,
+    13,19,70,27,122,92,211,126,234,15,34,131,118,152,69,191,
+    191,118,210,37,67,162,222,202,3,63,238,221,249,178,186,177,
+    233,107,94,117,165,130,93,15,1,213,71,216,46,111,32,171,
+    21,224,147,242,150,159,49,235,158,245,76,166,194,104,66,162,
+    61,244,222,93,129,240,173,42,84,183,54,145,213,77,57,116,
+    115,11,167,218,240,99,94,117,245,238,125,168,63,121,132,128,
+    9,239,87,42,57,63,6,44,172,75,83,12,204,252,86,96,
+    170,50,162,228,199,209,245,40,47,109,1,44,246,46,248,209,
+    199,149,202,47,202,75,188,108,175,150,133,91,159,107,239,123,
+    13,199,158,219,229,173,210,28,156,207,54,156,83,219,19,115,
+    129,52,204,225,165,54,78,53,96,14,14,109,49,219,222,119,
+    81,64,37,74,80,68,15,208,61,249,246,34,177,88,178,167,
+    32,50,202,240,116,247,65,47,174,76,76,30,106,35,96,71,
+    70,187,15,193,92,186,114,168,77,158,233,158,156,58,212,70,
+    193,142,141,119,215,193,164,134,187,43,96,250,135,187,119,193,
+    164,71,187,149,35,29,186,2,164,6,161,153,202,32,176,54,
+    62,1,83,28,165,134,186,149,223,245,140,28,150,30,238,86,
+    94,51,16,128,190,190,145,238,42,182,130,200,176,51,13,131,
+    143,0,171,33,134,143,129,179,30,245,193,42,2,200,231,225,
+    67,240,235,222,57,222,130,55,43,25,125,187,146,105,161,146,
+    105,161,146,197,65,201,18,160,100,73,80,178,11,160,100,58,
+    40,89,10,148,44,13,74,214,7,74,166,131,146,245,131,146,
+    13,128,146,101,64,201,6,65,133,134,66,21,42,228,139,69,
+    84,33,51,10,79,126,131,16,161,255,156,16,185,124,199,178,
+    33,0,132,69,240,38,40,56,200,140,232,212,4,168,137,179,
+    131,82,46,39,113,218,120,72,79,223,20,48,87,32,65,231,
+    244,100,246,84,166,48,72,192,181,60,85,43,57,207,127,81,
+    172,44,89,115,132,119,246,197,134,239,175,167,188,237,201,41,
+    224,137,194,18,30,156,74,98,194,80,17,188,111,188,61,231,
+    252,90,224,245,133,209,7,137,92,118,185,184,132,250,133,242,
+    85,8,133,44,183,44,213,171,104,11,87,151,162,39,117,78,
+    91,204,73,81,66,25,210,230,231,91,101,119,76,74,91,126,
+    57,47,133,169,36,221,243,69,112,76,96,182,39,1,235,51,
+    99,238,20,54,166,17,23,17,151,16,215,16,215,17,55,16,
+    55,17,51,136,247,17,31,32,102,17,139,136,37,196,50,226,
+    35,196,199,136,91,136,79,16,183,17,159,34,62,67,148,17,
+    242,180,173,32,86,143,241,29,94,189,131,183,95,189,212,72,
+    112,139,198,255,253,22,253,191,75,176,42,183,37,38,247,193,
+    215,91,165,108,240,175,129,112,163,199,87,36,88,244,249,31,
+    242,42,121,43,208,245,219,238,23,225,197,17,223,3,122,81,
+    85,85,123,85,53,161,106,61,5,49,164,168,215,14,149,171,
+    103,255,122,241,117,85,29,236,41,111,230,15,107,127,74,251,
+    215,89,79,45,66,176,254,58,48,154,96,240,235,46,185,216,
+    191,1,6,21,221,251,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/memory/dram_interfaces/ddr3.py",
+    "gem5.components.memory.dram_interfaces.ddr3",
+    embedded_module_data,
+    1430,
+    2617);
+
+} // anonymous namespace
+} // namespace gem5
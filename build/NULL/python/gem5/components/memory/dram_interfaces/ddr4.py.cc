@@ -0,0 +1,134 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,205,87,75,115,19,71,16,222,149,86,15,175,108,227,
+    135,228,7,207,193,60,69,64,210,174,86,66,164,146,84,108,
+    9,59,20,216,161,132,131,201,84,37,203,90,179,182,151,72,
+    43,103,119,5,216,39,29,248,1,220,242,15,82,149,228,158,
+    99,254,64,46,28,93,123,162,42,39,110,162,224,196,41,221,
+    179,146,44,176,73,224,134,228,253,122,166,167,123,118,52,253,
+    77,247,248,31,97,224,19,233,202,87,15,0,126,17,152,64,
+    5,38,178,80,93,108,132,104,72,20,66,194,146,192,194,79,
+    4,38,153,161,95,195,130,240,71,184,231,72,195,124,44,2,
+    99,81,51,252,206,152,196,199,98,48,22,63,48,22,97,67,
+    119,132,180,108,200,162,32,220,176,61,211,217,48,106,166,75,
+    54,154,14,169,84,170,26,105,152,141,166,99,153,174,44,175,
+    110,153,174,25,244,119,200,156,213,183,157,35,181,166,237,25,
+    150,77,188,45,147,120,86,195,178,55,47,19,211,54,157,205,
+    29,144,94,141,108,27,142,209,48,193,62,152,215,52,106,91,
+    114,119,30,111,103,219,36,134,205,136,225,152,164,229,182,140,
+    122,125,135,172,27,174,201,72,211,38,204,240,12,119,203,52,
+    189,192,17,231,239,250,49,243,161,5,239,206,200,242,247,205,
+    22,169,25,54,56,155,104,0,184,191,52,210,93,212,178,217,
+    40,123,78,157,52,215,31,152,53,143,24,46,215,222,191,207,
+    96,93,247,239,119,215,44,247,253,50,242,11,220,155,180,232,
+    143,84,170,243,203,253,109,169,13,134,74,236,133,234,47,30,
+    42,83,160,34,132,43,196,68,26,102,33,42,177,48,108,173,
+    68,163,44,66,99,44,74,227,44,70,135,64,39,67,59,193,
+    226,116,152,13,209,17,38,211,81,150,160,71,216,48,29,99,
+    35,116,28,158,9,120,38,217,40,77,130,62,197,142,208,41,
+    54,70,167,193,111,134,141,211,89,54,65,143,130,237,49,54,
+    73,143,179,36,61,1,207,73,150,162,167,216,20,37,108,154,
+    158,102,51,116,142,205,210,51,236,40,61,203,142,209,115,208,
+    62,207,142,211,11,236,4,189,200,78,210,52,59,69,47,49,
+    66,63,99,167,233,101,54,71,175,176,51,52,195,206,66,248,
+    207,249,163,24,108,93,213,114,57,93,41,62,214,140,89,248,
+    121,50,129,207,60,113,97,111,234,38,103,195,21,52,32,143,
+    139,26,169,109,25,182,109,214,201,197,166,109,66,252,27,13,
+    30,67,124,24,115,76,215,37,235,45,55,125,153,60,178,188,
+    45,62,77,176,197,238,126,104,141,129,9,75,100,105,221,242,
+    246,163,77,46,46,91,53,7,140,150,87,181,220,188,186,164,
+    165,249,28,16,76,136,51,46,15,25,183,97,109,182,28,195,
+    179,154,54,144,0,135,87,155,158,81,239,47,172,102,108,27,
+    53,203,219,33,150,75,242,234,146,181,208,181,82,138,61,238,
+    100,29,195,254,137,92,34,42,193,134,155,237,121,94,34,10,
+    152,103,3,43,242,101,224,221,27,229,115,248,18,90,188,144,
+    32,240,47,226,0,190,84,80,212,133,23,99,216,15,33,180,
+    17,190,6,216,141,229,50,165,124,222,118,119,99,249,76,62,
+    175,218,174,31,46,96,79,209,50,74,17,122,18,234,222,68,
+    180,204,53,208,198,21,48,82,75,160,142,228,11,57,28,85,
+    208,56,114,53,19,248,100,138,197,98,208,47,181,96,162,34,
+    55,212,184,161,150,111,204,251,97,4,41,175,113,44,1,70,
+    148,92,158,11,37,135,66,45,228,248,144,138,168,22,120,27,
+    52,187,146,146,81,239,238,74,106,166,112,119,37,157,245,227,
+    186,110,195,121,213,117,95,214,245,70,147,181,234,216,30,214,
+    245,159,225,120,118,71,98,186,206,154,53,104,36,130,125,210,
+    93,107,215,244,199,186,29,8,190,254,200,98,222,150,63,188,
+    222,114,92,79,175,155,246,38,244,82,221,113,167,249,104,189,
+    181,177,97,58,111,185,185,250,54,104,48,24,254,56,15,9,
+    239,119,55,222,79,174,131,74,223,116,154,173,237,1,195,209,
+    245,190,97,224,248,200,177,60,92,192,192,236,142,105,176,183,
+    52,97,175,124,211,143,122,11,223,85,239,172,130,44,151,43,
+    250,45,95,242,170,229,10,14,221,2,168,222,198,254,252,29,
+    196,106,5,108,0,185,205,189,249,53,127,204,168,121,214,67,
+    78,61,189,14,188,246,208,106,177,12,110,107,85,104,174,173,
+    34,86,87,249,20,171,107,56,229,29,63,226,85,175,47,222,
+    128,246,189,219,8,48,241,141,74,37,231,71,16,85,46,212,
+    21,46,242,43,126,148,139,64,171,173,5,162,202,29,10,193,
+    216,109,133,75,21,36,106,139,126,248,110,165,226,75,0,234,
+    111,194,43,76,74,111,174,185,78,45,187,189,227,109,53,237,
+    236,166,217,40,100,225,140,110,195,89,181,61,55,27,164,208,
+    44,38,63,125,63,87,102,225,224,106,153,237,29,7,107,16,
+    135,2,60,238,5,72,4,237,254,183,19,138,71,226,29,1,
+    97,74,152,156,109,223,236,68,133,153,217,103,82,18,100,50,
+    213,190,5,226,196,153,103,210,44,170,143,6,234,89,144,169,
+    78,92,56,126,226,153,52,211,145,133,169,153,246,10,116,103,
+    143,131,122,111,186,235,155,72,182,203,157,97,97,116,186,189,
+    136,98,18,68,84,24,78,181,43,123,242,100,187,28,64,98,
+    188,93,233,106,65,140,166,2,155,41,176,153,158,129,89,158,
+    39,38,218,149,231,242,24,76,4,234,174,237,228,160,11,127,
+    73,84,24,73,182,175,99,15,45,101,1,188,184,3,56,239,
+    129,215,245,61,104,117,97,100,162,189,184,7,83,92,15,0,
+    231,223,27,129,165,5,128,203,217,195,215,241,22,126,157,111,
+    123,59,119,120,161,248,252,253,133,34,4,133,66,130,66,17,
+    129,66,17,133,66,17,131,66,17,135,66,49,4,133,66,134,
+    66,145,128,36,61,12,213,168,159,164,75,143,75,198,244,167,
+    147,163,149,165,210,96,142,134,213,125,100,138,86,138,251,41,
+    186,244,177,25,154,59,191,149,161,157,32,45,43,55,173,5,
+    103,140,55,85,133,167,73,200,138,78,10,21,17,69,13,82,
+    99,62,200,131,87,27,243,43,233,81,231,20,134,144,32,156,
+    70,152,67,56,139,112,30,225,2,2,30,11,167,136,48,143,
+    80,65,88,68,88,66,184,129,176,130,192,217,112,27,161,218,
+    131,223,241,68,173,9,239,61,81,189,163,212,63,67,221,62,
+    146,253,121,143,255,156,169,19,61,86,114,64,66,226,55,120,
+    103,245,189,12,188,251,225,87,149,56,48,112,8,24,40,3,
+    3,19,192,192,97,184,170,140,192,85,101,20,174,42,71,224,
+    170,50,6,87,149,113,184,170,76,192,85,101,18,216,153,28,
+    188,66,104,143,149,226,167,116,133,128,242,188,172,20,7,25,
+    138,43,252,72,138,106,251,12,213,222,101,168,242,63,12,213,
+    14,16,84,14,88,137,4,141,225,109,1,99,228,36,16,144,
+    186,187,145,66,6,111,13,145,98,70,227,183,4,94,228,75,
+    88,190,195,80,222,157,105,238,173,93,229,85,93,229,165,94,
+    229,87,128,136,202,141,36,77,65,62,167,62,132,207,23,17,
+    210,8,151,16,180,67,56,190,128,80,62,132,237,223,188,143,
+    242,180,7,127,35,229,159,252,7,229,143,30,78,249,3,101,
+    99,26,202,70,63,163,31,60,16,111,167,238,67,178,246,254,
+    249,192,101,173,164,163,124,51,124,185,81,200,4,255,22,184,
+    78,184,151,191,131,19,75,15,254,174,55,241,47,130,11,209,
+    87,206,70,247,96,185,127,2,116,194,162,40,118,170,98,76,
+    148,58,2,194,132,32,158,123,38,156,29,252,235,68,29,81,
+    156,232,8,135,227,211,31,94,114,249,122,112,228,65,248,164,
+    152,236,8,7,225,233,202,75,20,175,247,181,11,98,14,155,
+    7,225,233,143,47,81,188,62,100,136,255,174,127,1,54,27,
+    249,60,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/memory/dram_interfaces/ddr4.py",
+    "gem5.components.memory.dram_interfaces.ddr4",
+    embedded_module_data,
+    1746,
+    3712);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,106 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,165,85,75,115,211,86,20,150,44,249,17,219,49,78,
+    98,231,5,129,240,106,107,40,178,37,191,41,195,16,172,208,
+    50,36,30,215,1,194,220,141,198,241,85,130,169,95,149,100,
+    104,178,242,162,63,160,187,254,131,206,116,186,238,182,191,33,
+    75,143,86,158,233,42,59,83,88,177,234,57,87,114,98,106,
+    152,50,109,28,125,231,125,31,231,94,125,250,147,155,248,243,
+    186,242,205,11,128,159,57,202,17,142,242,212,211,228,91,30,
+    226,225,57,15,247,53,71,133,31,57,42,234,158,95,4,142,
+    251,77,24,23,18,129,197,188,16,243,233,194,63,98,34,139,
+    249,33,22,152,138,121,233,204,14,151,8,30,173,61,108,91,
+    186,177,95,171,235,230,250,126,199,88,87,213,106,118,189,165,
+    183,58,70,67,55,131,39,152,155,224,237,89,181,186,177,125,
+    154,89,159,92,58,63,94,250,31,108,233,58,71,120,88,190,
+    135,242,68,160,30,34,82,1,166,18,137,143,122,137,159,250,
+    72,0,124,51,212,79,130,52,64,66,240,132,233,12,153,165,
+    65,18,161,33,114,142,134,73,20,158,57,58,75,230,65,46,
+    208,8,137,65,44,14,177,69,176,151,96,140,101,122,142,172,
+    208,40,89,165,115,228,60,157,39,23,232,2,89,163,49,114,
+    145,198,201,37,186,72,214,233,18,185,12,242,10,228,92,165,
+    203,228,26,93,33,215,233,42,249,140,158,39,159,211,11,228,
+    11,186,70,18,244,34,185,65,47,145,155,116,157,124,73,47,
+    147,91,244,10,145,232,85,104,199,53,216,40,236,95,203,100,
+    82,41,45,243,67,193,246,101,101,101,187,113,255,36,0,123,
+    59,137,2,216,162,146,205,221,63,17,209,198,157,159,172,35,
+    220,3,56,242,167,164,76,54,211,54,143,252,105,41,151,86,
+    218,166,45,100,193,10,200,25,41,155,113,52,12,228,33,32,
+    58,97,25,192,171,20,49,6,197,197,84,129,133,82,104,42,
+    82,166,152,199,26,197,173,129,234,156,36,51,205,155,151,176,
+    196,155,150,138,61,211,142,212,155,29,83,215,106,180,214,181,
+    26,47,117,219,43,43,74,107,195,22,11,5,196,34,234,94,
+    57,147,114,4,179,50,249,34,138,108,154,57,149,124,158,197,
+    82,16,59,18,101,73,126,90,78,36,237,128,166,181,107,45,
+    93,211,236,160,166,181,58,180,215,68,61,172,105,223,247,106,
+    77,55,18,162,250,203,70,93,215,204,198,145,110,71,93,99,
+    175,103,106,175,26,212,122,110,135,247,122,134,105,105,77,189,
+    125,0,86,220,141,27,157,87,123,189,253,125,221,120,175,204,
+    212,186,224,49,106,237,239,236,57,68,199,174,63,175,181,219,
+    122,211,142,237,129,75,59,48,58,189,238,68,98,100,239,52,
+    209,41,124,101,52,44,92,192,196,232,134,94,163,239,121,4,
+    171,244,200,246,89,247,159,84,119,30,131,44,149,84,109,203,
+    22,173,106,73,197,16,170,165,221,45,80,171,21,244,110,236,
+    32,86,85,200,4,100,153,207,54,118,237,104,173,14,173,174,
+    89,141,78,91,107,54,90,13,11,107,89,234,131,18,96,165,
+    130,131,237,86,209,241,120,23,106,119,31,87,89,45,72,230,
+    171,216,94,171,186,249,224,33,100,61,171,32,236,216,161,110,
+    237,64,215,186,157,102,163,126,104,139,15,85,53,101,251,0,
+    149,74,202,246,162,44,51,51,237,154,233,50,19,153,93,71,
+    84,89,69,150,97,206,22,158,170,234,175,220,27,124,39,223,
+    21,77,163,158,236,30,90,207,59,237,228,129,222,202,38,235,
+    157,86,183,211,214,219,150,153,100,47,249,97,146,26,181,150,
+    214,56,37,129,36,165,70,86,234,30,26,72,73,12,18,240,
+    152,231,225,178,247,79,127,195,249,213,254,163,81,128,91,94,
+    57,22,99,35,31,23,91,236,111,129,185,118,245,88,92,1,
+    147,185,135,136,113,240,94,88,59,22,151,7,241,165,126,121,
+    184,188,10,174,193,146,91,21,138,245,75,32,34,75,253,7,
+    40,22,152,8,47,246,213,65,16,34,195,80,220,213,6,161,
+    185,190,138,161,56,19,147,137,75,203,56,84,152,11,69,217,
+    80,225,133,190,58,132,97,161,14,29,247,120,86,51,152,133,
+    25,6,33,167,26,83,64,204,198,250,155,184,132,121,72,11,
+    48,49,156,191,2,123,138,58,99,204,194,28,131,240,124,127,
+    115,8,137,160,45,244,55,207,96,8,233,170,3,56,13,254,
+    140,237,113,183,62,204,141,119,63,206,141,2,112,163,8,220,
+    40,184,220,232,5,110,244,1,55,250,129,27,3,192,141,51,
+    192,141,65,224,166,144,203,77,57,151,155,144,50,210,178,50,
+    38,139,156,75,53,233,252,152,106,242,89,224,23,35,194,72,
+    75,102,164,34,75,121,57,231,146,10,139,50,82,81,80,43,
+    39,206,25,107,184,135,139,8,151,16,110,32,220,68,184,133,
+    32,33,36,17,82,8,10,66,26,33,131,112,27,225,43,132,
+    59,8,91,8,172,39,101,132,202,24,126,199,187,244,132,123,
+    239,46,5,23,78,175,193,217,153,159,105,211,7,15,141,159,
+    62,90,252,57,51,86,62,122,10,183,255,199,41,224,199,210,
+    61,129,194,196,9,40,233,130,211,217,98,42,227,158,128,82,
+    24,159,64,33,85,132,19,248,150,125,28,100,41,141,22,235,
+    125,193,209,160,247,204,87,78,68,254,67,239,63,161,237,59,
+    99,248,11,219,94,254,132,182,15,62,208,246,127,235,55,78,
+    80,78,248,108,191,166,209,78,29,191,24,173,172,212,217,123,
+    161,215,45,211,16,198,239,133,115,7,118,166,87,249,46,112,
+    199,249,190,220,53,158,186,135,101,226,53,25,9,60,207,143,
+    114,60,47,142,56,4,31,199,95,63,230,174,77,254,143,22,
+    191,241,240,115,35,238,195,248,211,246,107,38,223,78,70,158,
+    137,57,126,113,196,77,3,102,131,120,123,230,61,226,21,84,
+    167,1,83,21,76,157,14,177,109,253,13,75,52,153,220,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/memory/dram_interfaces/ddr5.py",
+    "gem5.components.memory.dram_interfaces.ddr5",
+    embedded_module_data,
+    1311,
+    2522);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,85 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,84,77,111,27,69,24,158,245,110,28,119,227,36,
+    118,62,74,146,182,210,168,128,68,164,98,199,78,28,138,132,
+    144,18,91,73,80,62,68,157,160,192,92,54,227,157,177,189,
+    176,31,102,118,182,137,123,242,129,31,128,184,240,15,144,16,
+    255,128,95,145,99,181,167,74,156,114,51,42,167,158,120,103,
+    215,142,93,9,118,61,207,59,239,167,103,158,121,103,255,66,
+    83,207,204,72,190,173,2,252,138,24,34,136,105,44,227,106,
+    94,134,100,52,148,65,135,136,233,63,33,102,240,204,111,58,
+    66,127,232,227,68,162,179,153,115,180,153,165,5,13,161,175,
+    124,201,69,155,218,60,196,237,64,224,195,70,163,137,61,238,
+    5,162,143,25,127,233,128,221,52,47,186,60,228,99,235,83,
+    231,62,227,41,182,3,95,82,199,199,178,203,177,116,60,199,
+    239,60,195,220,231,162,211,7,41,109,220,163,130,122,28,226,
+    211,234,156,218,93,115,84,71,246,123,28,83,159,97,42,56,
+    142,194,136,186,110,31,183,104,200,25,14,124,204,168,164,97,
+    151,115,153,38,170,250,239,175,170,100,154,223,5,17,182,169,
+    15,201,92,5,0,78,150,134,71,139,58,229,94,93,10,23,
+    7,173,239,185,45,49,13,19,235,213,21,131,117,93,93,141,
+    214,108,222,231,149,204,59,197,208,166,22,207,55,154,123,167,
+    247,228,216,211,196,107,99,226,69,66,60,71,68,3,242,51,
+    76,3,98,51,196,96,58,153,97,6,201,178,25,50,203,178,
+    36,199,102,201,3,150,35,38,123,64,230,152,73,242,108,142,
+    204,179,60,89,96,243,100,17,70,1,70,145,45,144,37,182,
+    72,150,97,172,176,2,89,101,69,242,144,45,145,15,192,183,
+    198,150,201,58,228,108,192,120,196,86,224,224,86,227,69,117,
+    76,53,107,103,107,107,203,170,222,108,87,95,253,98,98,120,
+    246,112,8,187,113,121,114,138,53,124,179,187,51,97,228,25,
+    190,118,100,23,216,107,211,200,149,163,141,135,19,194,105,154,
+    244,169,170,153,20,171,224,195,150,35,213,9,74,252,201,249,
+    49,62,234,251,206,13,62,170,29,190,168,28,85,119,246,14,
+    154,155,138,99,138,213,255,171,62,104,59,157,72,80,233,4,
+    126,41,201,143,179,149,234,243,83,103,255,14,3,75,119,57,
+    128,216,168,214,118,247,239,50,74,87,28,222,25,10,10,202,
+    163,87,252,48,214,171,10,182,1,140,138,154,26,213,231,202,
+    176,155,76,193,44,50,73,145,221,154,178,2,156,109,62,142,
+    115,150,229,67,135,89,86,108,90,150,23,176,200,85,243,188,
+    101,253,8,13,53,242,204,90,22,11,108,152,204,165,189,99,
+    133,206,43,30,23,70,74,43,10,173,107,135,201,110,156,111,
+    69,34,148,150,203,253,14,104,171,35,191,8,174,91,81,187,
+    205,197,123,105,161,213,3,139,160,254,15,113,81,97,170,219,
+    93,234,251,220,141,87,90,96,178,58,34,136,122,83,129,11,
+    173,251,192,68,215,101,253,56,206,202,253,111,154,231,23,32,
+    235,245,134,117,18,27,178,89,111,40,215,9,64,243,107,165,
+    239,157,43,108,54,32,6,48,137,249,118,239,50,46,80,91,
+    58,47,19,198,45,23,142,83,170,168,131,58,164,93,54,97,
+    122,121,161,176,121,145,148,184,184,252,29,189,85,61,251,238,
+    243,80,216,229,94,95,118,3,191,220,225,94,173,108,7,94,
+    47,240,185,47,195,114,122,195,202,234,110,88,147,171,84,238,
+    48,38,74,189,190,80,31,156,4,106,48,194,63,1,6,247,
+    239,48,163,207,228,134,72,65,30,45,63,26,28,15,179,104,
+    109,227,214,88,1,185,178,58,56,1,241,228,195,91,99,93,
+    153,215,83,243,58,184,87,65,62,126,114,107,172,129,124,184,
+    54,56,3,49,87,24,212,135,5,180,176,60,56,128,82,74,
+    188,153,43,14,26,202,83,28,212,223,152,224,126,157,24,76,
+    148,79,197,36,38,151,22,79,148,215,42,18,178,242,105,242,
+    148,80,175,216,25,111,230,108,211,16,27,170,177,76,175,86,
+    74,63,19,161,208,199,94,177,173,32,9,86,187,126,151,251,
+    34,109,178,47,197,103,163,47,65,216,2,24,234,154,166,13,
+    155,218,172,102,12,145,130,37,164,125,124,139,62,154,254,13,
+    179,47,52,173,56,68,255,141,63,123,127,39,242,159,255,241,
+    39,107,248,23,134,245,200,243,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/memory/dram_interfaces/gddr.py",
+    "gem5.components.memory.dram_interfaces.gddr",
+    embedded_module_data,
+    968,
+    1536);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,159 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,173,87,205,79,28,201,21,239,249,100,60,12,48,195,
+    55,6,123,107,241,199,50,14,6,102,248,48,235,108,172,197,
+    131,191,98,195,90,64,132,211,74,212,244,116,21,76,239,246,
+    116,207,86,213,152,29,75,145,56,228,15,200,37,74,78,57,
+    70,90,69,249,35,114,201,53,28,173,62,141,20,229,192,109,
+    172,245,201,167,188,87,221,51,12,24,175,87,74,128,254,117,
+    85,189,170,215,85,239,189,250,189,199,191,181,174,159,68,248,
+    254,225,107,128,63,105,84,211,53,26,161,81,39,82,141,234,
+    209,136,22,213,30,105,52,246,123,141,198,89,244,175,49,77,
+    251,91,172,189,80,143,41,89,2,100,73,22,59,39,139,43,
+    89,15,200,82,239,173,75,208,75,219,90,62,109,14,68,52,
+    237,137,43,25,223,55,45,38,200,190,199,201,227,251,27,164,
+    202,170,30,111,16,202,94,218,48,156,78,239,84,152,96,237,
+    209,105,187,179,96,154,88,158,43,77,219,37,178,194,136,180,
+    171,182,123,48,75,152,203,248,65,3,222,210,34,53,147,155,
+    85,6,243,3,229,204,180,42,233,80,143,108,212,24,49,93,
+    74,76,206,72,93,212,77,199,105,144,178,41,24,37,158,75,
+    168,41,77,81,97,76,6,11,81,255,217,93,205,165,211,191,
+    246,234,196,50,93,88,204,112,2,224,233,214,72,184,169,13,
+    86,45,73,238,16,175,252,53,179,36,49,133,26,221,219,163,
+    176,175,189,189,112,207,233,206,186,185,244,9,26,40,31,241,
+    251,214,183,214,54,58,182,177,186,253,21,105,251,235,149,242,
+    23,211,244,8,248,44,74,35,122,140,70,245,56,141,129,125,
+    227,122,146,38,244,30,154,212,83,240,92,162,61,122,154,166,
+    244,94,122,73,207,208,180,222,7,79,63,60,3,180,87,207,
+    210,140,158,163,125,250,32,237,215,135,232,128,62,76,179,250,
+    8,205,233,163,48,62,70,7,245,113,120,79,208,33,253,50,
+    232,157,164,195,250,20,29,209,175,208,81,240,223,152,159,3,
+    111,25,133,133,133,5,99,233,177,81,248,174,80,92,53,255,
+    30,213,180,52,129,159,53,34,224,104,14,83,30,69,209,169,
+    117,200,140,231,50,240,93,181,170,236,143,15,165,156,9,65,
+    202,117,145,159,37,135,182,172,40,29,148,237,155,117,71,134,
+    102,18,103,221,67,106,245,178,99,91,202,111,156,57,12,101,
+    106,213,204,52,124,242,46,154,30,253,181,237,57,117,105,195,
+    26,21,93,246,65,133,60,135,93,120,28,190,13,59,121,206,
+    61,240,150,240,184,152,158,85,206,242,220,89,82,92,40,44,
+    229,103,149,174,39,235,235,224,120,83,212,57,171,50,87,146,
+    151,166,83,103,98,86,109,186,220,32,236,59,201,205,154,231,
+    152,18,246,23,236,106,159,123,85,226,129,151,57,177,28,83,
+    8,21,42,202,32,220,170,216,18,162,0,116,133,122,78,15,
+    164,206,2,1,71,149,185,68,141,89,237,85,100,233,49,17,
+    210,180,190,33,182,64,131,216,46,163,176,197,71,101,82,131,
+    79,80,155,169,131,153,68,122,210,132,56,219,39,133,71,246,
+    125,124,7,241,26,170,185,117,235,201,198,243,175,182,118,214,
+    54,119,110,221,82,35,248,157,3,230,22,136,168,215,106,30,
+    135,64,175,215,64,9,89,37,224,171,219,101,91,146,90,165,
+    33,208,190,196,170,152,174,203,28,161,214,129,133,246,237,131,
+    58,55,149,81,131,13,9,248,126,232,237,112,110,224,68,21,
+    236,150,89,51,45,91,54,212,106,193,36,126,100,102,191,238,
+    56,70,112,46,163,61,129,204,147,213,252,169,73,240,136,112,
+    188,182,249,118,60,117,209,192,221,176,197,246,142,102,149,194,
+    189,189,118,31,174,84,231,202,7,135,177,221,224,187,13,33,
+    89,21,249,226,116,243,115,74,114,114,4,183,232,36,14,224,
+    39,225,228,27,246,125,63,94,124,106,223,63,193,107,118,146,
+    2,224,81,20,198,138,174,240,227,133,101,196,197,69,192,216,
+    18,64,162,176,178,224,138,119,137,197,185,207,235,40,94,117,
+    197,171,196,157,57,53,171,176,128,179,22,212,2,213,92,13,
+    22,192,107,51,127,213,79,25,134,11,59,53,12,63,109,24,
+    85,143,214,29,108,103,12,227,91,224,162,80,210,99,24,212,
+    179,160,145,13,104,199,128,11,98,28,218,84,86,252,76,185,
+    206,133,52,28,230,30,64,175,55,148,11,251,21,243,71,194,
+    14,247,14,203,245,253,125,198,131,225,80,135,48,32,112,12,
+    110,186,223,248,57,196,160,31,90,208,239,47,119,134,212,148,
+    97,236,27,7,220,171,215,186,70,99,178,244,20,96,235,185,
+    31,151,91,165,117,236,63,195,230,218,182,159,148,247,127,181,
+    181,189,131,189,135,37,63,33,183,30,60,124,2,242,221,45,
+    28,217,193,5,187,59,65,123,23,151,109,99,115,107,29,240,
+    197,218,174,159,53,45,105,191,84,222,49,28,184,244,18,166,
+    188,120,142,176,253,189,246,3,146,222,187,85,193,173,249,90,
+    67,86,60,119,254,128,85,151,231,129,71,106,192,39,174,20,
+    243,65,200,207,35,185,26,167,92,60,95,41,87,231,106,13,
+    142,121,78,193,50,60,226,159,0,71,157,223,86,52,151,72,
+    181,52,132,25,109,124,242,56,62,220,74,106,195,35,71,207,
+    90,41,109,104,242,232,105,115,106,250,56,62,1,99,227,19,
+    129,108,226,242,113,124,4,132,163,99,71,155,173,126,109,234,
+    202,113,124,28,134,123,179,71,37,24,237,205,29,149,94,3,
+    172,191,78,103,195,22,140,246,15,29,61,132,57,153,33,232,
+    37,181,190,225,163,7,157,169,131,48,53,156,149,201,41,177,
+    210,148,108,247,50,56,97,108,60,248,118,40,130,69,37,252,
+    229,119,218,7,187,56,77,220,251,105,105,162,7,210,68,10,
+    210,196,37,72,19,105,72,19,189,144,38,50,208,239,3,170,
+    239,247,179,103,169,126,101,201,60,185,152,233,87,150,254,159,
+    68,223,97,41,92,252,163,172,255,1,162,92,253,48,81,46,
+    157,35,74,212,178,233,73,118,151,236,84,58,42,144,218,106,
+    130,213,169,119,59,188,34,1,179,153,164,238,218,223,214,153,
+    42,65,184,231,56,140,43,5,182,11,123,112,165,109,74,56,
+    0,126,248,236,226,144,204,182,165,217,32,166,36,2,174,57,
+    121,242,21,1,66,2,99,21,30,149,107,34,143,188,85,133,
+    162,38,40,108,148,65,240,164,234,82,136,138,93,59,181,90,
+    199,56,42,209,144,153,110,23,97,198,205,147,67,72,67,140,
+    212,60,33,236,178,195,62,152,11,30,134,133,23,40,43,6,
+    199,59,119,100,160,39,54,219,97,79,70,138,47,58,20,60,
+    247,83,178,66,160,238,127,76,14,133,149,174,236,176,218,201,
+    14,231,146,67,97,229,220,215,62,154,36,96,197,199,179,196,
+    151,120,199,122,84,150,40,46,175,168,44,81,192,44,145,197,
+    161,68,17,179,0,190,128,219,121,6,167,230,16,134,80,24,
+    95,89,70,194,239,231,227,56,52,129,112,25,97,18,97,10,
+    225,10,194,85,132,79,16,166,17,110,33,32,81,241,5,132,
+    159,33,44,33,172,32,168,27,191,138,112,183,13,127,68,82,
+    179,206,145,90,22,73,13,225,166,54,126,249,61,82,131,215,
+    149,107,72,107,64,99,227,64,99,169,54,53,33,179,52,211,
+    3,64,76,48,240,0,7,114,1,227,228,186,25,231,238,7,
+    25,231,47,31,103,156,68,88,152,70,129,97,122,128,113,82,
+    192,56,151,194,194,180,23,10,211,12,20,166,125,80,152,246,
+    67,97,58,0,133,105,22,10,211,28,20,166,41,40,76,7,
+    161,48,29,130,194,116,24,10,211,12,20,166,61,80,152,142,
+    64,97,58,4,133,105,175,126,149,142,234,159,128,94,66,199,
+    244,79,233,184,62,77,39,244,107,176,135,235,240,220,160,151,
+    245,155,116,18,24,109,42,96,180,98,23,163,241,159,183,125,
+    204,191,64,248,5,66,26,225,158,42,0,10,42,169,99,214,
+    143,45,170,38,86,4,177,21,240,248,160,146,223,193,193,98,
+    59,2,32,26,138,16,20,42,16,252,24,132,0,31,80,173,
+    207,161,53,172,226,162,128,75,71,131,169,216,246,251,45,199,
+    19,204,48,169,89,131,44,200,118,54,243,159,157,15,154,139,
+    226,133,32,124,218,137,156,107,8,215,17,110,168,112,149,165,
+    210,186,241,140,223,196,78,15,102,107,99,119,139,127,166,118,
+    32,75,187,207,248,12,78,205,119,98,78,69,218,44,194,109,
+    132,185,64,7,228,108,208,49,31,172,90,91,91,15,162,178,
+    16,8,33,127,131,176,136,35,139,157,56,197,216,245,123,107,
+    230,1,51,160,64,182,173,134,159,229,204,164,70,119,69,146,
+    59,228,80,17,159,25,26,148,135,158,97,53,44,40,134,194,
+    90,128,157,15,249,82,27,254,133,33,255,159,51,33,223,28,
+    155,248,72,238,110,34,142,52,71,32,111,191,158,156,58,205,
+    218,77,204,212,205,190,193,163,135,77,149,184,33,89,63,10,
+    179,119,246,52,57,191,159,194,155,93,115,16,80,67,48,59,
+    217,157,202,155,29,225,143,100,243,230,224,52,108,87,29,225,
+    53,222,215,145,230,4,212,21,163,193,95,96,1,60,247,102,
+    62,169,216,195,79,87,151,231,130,255,44,5,143,181,139,128,
+    128,18,74,239,115,197,187,212,23,65,153,121,143,255,38,188,
+    173,226,31,0,173,88,36,18,105,109,69,122,34,241,150,134,
+    48,168,69,110,28,107,215,187,255,90,201,223,70,34,131,45,
+    237,98,252,115,223,27,245,126,219,45,249,50,182,24,201,181,
+    180,247,225,120,108,230,13,190,223,158,14,203,200,47,35,145,
+    171,45,237,98,252,195,239,222,168,247,219,15,200,213,17,255,
+    11,18,65,204,45,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/memory/dram_interfaces/hbm.py",
+    "gem5.components.memory.dram_interfaces.hbm",
+    embedded_module_data,
+    2149,
+    4307);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,135 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,22,75,111,27,199,121,151,15,73,94,189,172,183,
+    104,215,233,192,46,10,17,136,40,137,146,108,217,104,3,72,
+    164,237,24,142,140,128,82,210,100,131,96,61,220,25,145,27,
+    239,131,217,153,149,76,193,5,120,200,33,135,30,122,235,169,
+    215,2,69,251,31,250,23,220,155,176,215,156,116,99,224,244,
+    146,83,191,111,102,73,81,110,74,65,223,236,126,175,249,222,
+    223,254,96,140,252,138,217,249,238,183,0,254,98,48,195,54,
+    114,198,83,131,153,223,25,44,199,205,191,229,13,227,31,249,
+    1,179,157,99,249,35,163,92,160,95,154,134,241,44,148,60,
+    62,161,46,23,228,36,138,201,199,135,53,18,240,32,138,187,
+    132,241,83,15,208,150,117,220,230,130,15,176,119,189,161,192,
+    93,226,70,161,164,94,72,100,155,19,233,5,94,216,250,144,
+    240,144,199,173,46,156,210,37,29,26,211,128,3,191,86,206,
+    169,219,182,50,61,178,219,225,132,134,140,208,152,147,68,36,
+    212,247,187,164,73,5,103,36,10,9,163,146,138,54,231,82,
+    11,162,254,235,86,85,44,235,203,40,33,46,13,65,152,35,
+    3,192,43,211,72,102,212,33,15,106,50,246,73,212,252,134,
+    187,146,80,161,176,47,95,50,176,235,229,203,204,102,107,40,
+    7,90,95,68,18,213,81,169,66,225,9,244,241,196,107,37,
+    49,24,198,188,147,19,30,243,80,130,169,192,18,18,17,5,
+    156,68,160,50,38,245,198,254,225,136,1,21,203,29,205,143,
+    57,200,207,107,149,31,110,216,38,195,60,152,118,158,229,236,
+    2,203,219,69,86,176,199,88,209,30,103,99,246,4,27,183,
+    111,176,9,219,98,55,236,73,102,217,83,108,210,158,102,83,
+    246,12,155,182,103,217,140,125,19,112,115,108,214,158,103,55,
+    237,5,54,103,47,178,121,123,9,120,151,217,130,189,194,22,
+    237,85,182,100,151,64,231,45,248,191,205,150,191,51,236,95,
+    177,21,200,248,106,58,13,78,57,213,221,205,77,103,235,245,
+    118,149,254,171,96,24,22,129,223,62,17,16,8,159,163,211,
+    235,72,39,64,38,65,196,184,63,76,202,35,197,249,213,214,
+    215,202,215,163,14,119,31,17,74,218,94,171,189,238,243,83,
+    96,84,33,104,210,240,149,22,244,65,35,145,81,228,43,57,
+    134,44,81,7,52,65,104,49,9,159,133,222,41,20,134,39,
+    187,36,58,33,207,169,39,224,205,167,9,68,48,172,144,227,
+    54,132,30,117,19,173,123,168,7,178,45,72,163,70,214,98,
+    46,60,33,105,232,242,117,151,118,168,235,169,231,178,170,169,
+    218,231,100,109,4,185,126,26,249,146,182,128,168,12,131,34,
+    136,148,46,46,160,0,168,202,55,31,177,222,7,84,232,118,
+    149,166,78,116,6,201,13,147,160,9,214,85,116,4,170,95,
+    147,143,209,178,14,228,58,138,3,188,129,236,127,241,108,125,
+    167,178,153,5,75,213,1,20,78,136,69,167,42,255,53,168,
+    20,94,19,34,44,2,26,203,172,154,149,62,55,105,130,75,
+    107,143,43,100,255,156,198,175,192,241,54,52,79,133,80,191,
+    172,47,220,23,34,9,64,235,160,19,84,143,170,212,64,140,
+    40,217,222,36,97,64,36,119,219,97,228,71,173,46,9,129,
+    166,37,143,177,111,84,46,64,28,197,192,38,140,154,192,144,
+    239,144,167,77,79,130,183,93,236,207,179,182,231,182,9,92,
+    68,146,14,196,135,84,159,122,7,200,53,98,232,218,78,198,
+    156,217,245,24,218,89,99,72,27,58,107,235,62,57,165,137,
+    15,202,49,112,216,235,250,253,218,165,85,21,98,129,177,211,
+    162,90,213,179,144,68,49,3,28,220,220,132,185,128,129,130,
+    199,172,181,137,128,41,162,134,77,28,129,43,49,226,117,56,
+    170,117,157,183,22,78,29,42,61,184,73,233,203,70,217,135,
+    74,250,4,132,162,51,172,70,26,82,21,33,136,27,139,66,
+    254,200,82,204,53,104,229,16,162,185,86,175,55,202,228,247,
+    31,145,207,149,217,107,160,160,108,13,138,23,134,142,35,188,
+    115,126,197,165,222,192,37,58,232,29,29,10,152,60,84,59,
+    174,101,227,161,191,238,251,247,232,178,66,29,58,174,90,224,
+    42,64,40,122,197,253,94,224,70,45,251,37,246,81,138,182,
+    108,141,108,13,2,3,25,28,22,200,123,67,90,23,66,24,
+    129,35,157,68,170,18,59,165,158,175,82,130,179,218,11,97,
+    220,121,18,19,16,71,129,110,157,122,99,91,151,114,54,43,
+    85,38,134,87,140,12,81,69,0,21,174,159,48,174,135,177,
+    238,54,15,247,207,80,31,166,20,210,175,200,81,203,115,51,
+    143,81,29,4,43,235,1,93,57,105,97,239,208,59,184,36,
+    48,87,47,39,0,164,133,234,238,253,131,75,28,184,151,5,
+    4,57,0,231,197,205,202,94,40,206,139,219,149,42,28,99,
+    91,155,234,44,62,172,60,196,227,65,229,1,98,171,91,149,
+    251,161,184,52,148,150,93,160,164,121,37,180,163,185,182,43,
+    15,19,145,206,184,126,36,184,67,25,237,72,24,96,169,213,
+    136,106,81,131,30,208,90,219,53,71,38,62,110,100,220,184,
+    239,246,212,196,151,35,52,102,178,28,203,253,51,127,125,43,
+    255,209,124,99,188,49,157,33,223,27,19,119,244,57,85,94,
+    234,30,193,113,39,189,193,192,202,22,226,72,91,96,223,53,
+    61,0,208,214,217,136,195,31,50,187,73,140,139,139,140,172,
+    186,1,57,30,67,135,243,59,161,40,231,211,37,88,136,206,
+    25,230,87,56,80,57,142,56,243,164,219,78,151,225,106,233,
+    185,78,147,186,175,120,200,156,108,68,166,43,25,30,82,7,
+    138,175,8,229,92,58,158,237,222,180,128,203,22,16,5,193,
+    253,147,212,186,178,87,96,106,8,249,121,79,196,238,70,167,
+    43,219,81,184,209,226,193,238,134,27,5,29,104,207,80,138,
+    13,237,228,6,170,112,174,182,235,70,59,112,43,157,110,188,
+    138,185,93,189,182,211,42,87,250,255,10,84,177,9,160,103,
+    252,199,50,150,239,92,220,189,119,113,111,237,226,55,229,254,
+    120,97,217,250,209,0,240,19,130,239,173,190,101,220,254,245,
+    247,214,159,102,47,102,75,111,39,74,239,48,254,47,202,119,
+    210,9,199,9,161,55,28,39,181,28,7,6,105,226,227,243,
+    148,227,124,11,223,43,25,101,220,113,88,228,194,195,228,200,
+    148,72,111,102,47,205,68,56,103,30,147,237,116,170,153,196,
+    66,58,62,15,91,240,182,148,209,227,232,172,153,224,87,197,
+    53,49,29,123,236,231,116,78,205,15,245,158,205,143,116,166,
+    57,68,41,150,188,172,61,79,199,228,193,103,141,163,227,180,
+    32,27,181,58,162,62,1,208,248,20,223,247,143,16,54,234,
+    233,77,234,66,205,170,30,116,124,248,244,145,136,127,82,3,
+    198,63,52,240,241,248,83,20,60,74,139,178,241,248,201,179,
+    116,178,3,59,211,233,68,190,7,153,158,162,140,197,78,64,
+    59,29,24,118,233,156,42,17,231,154,233,49,167,108,20,163,
+    178,243,119,35,190,5,71,92,66,144,31,128,93,204,204,191,
+    85,102,6,127,253,220,7,197,137,190,129,160,110,26,11,165,
+    222,243,254,152,177,122,235,109,97,17,206,197,165,222,39,112,
+    220,185,247,182,80,66,116,73,163,75,64,94,130,220,45,175,
+    244,94,192,235,228,124,175,6,199,204,82,239,9,28,83,139,
+    189,250,133,53,215,171,105,48,185,208,171,3,235,20,30,19,
+    67,13,83,243,200,52,139,244,121,69,200,116,76,47,246,30,
+    3,247,194,61,101,198,34,129,235,45,163,116,27,174,187,88,
+    81,162,133,201,226,173,190,241,191,64,123,155,87,245,147,143,
+    63,192,206,154,198,241,232,108,221,135,2,221,123,189,167,131,
+    240,0,193,48,48,63,79,252,78,23,215,71,241,195,236,99,
+    81,188,0,208,207,155,166,217,111,152,55,204,66,223,64,176,
+    42,76,19,238,249,101,248,231,195,31,213,249,211,255,161,171,
+    251,254,11,33,141,188,6,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/memory/dram_interfaces/hmc.py",
+    "gem5.components.memory.dram_interfaces.hmc",
+    embedded_module_data,
+    1767,
+    3126);
+
+} // anonymous namespace
+} // namespace gem5
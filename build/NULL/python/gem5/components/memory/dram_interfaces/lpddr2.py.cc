@@ -0,0 +1,102 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,85,75,115,218,86,20,150,64,96,130,177,131,13,
+    196,118,158,55,206,147,214,17,72,128,237,76,59,157,113,77,
+    156,201,196,118,93,112,227,244,110,100,193,185,54,106,65,80,
+    73,36,181,87,44,250,31,218,95,208,153,78,215,253,19,93,
+    101,153,209,170,51,93,121,71,39,93,117,213,115,36,97,39,
+    51,173,241,253,206,249,206,139,51,231,62,248,83,122,239,47,
+    17,201,119,58,194,143,18,72,92,2,25,98,93,185,23,227,
+    49,89,138,73,79,37,136,255,32,129,34,98,63,199,37,233,
+    215,248,36,145,199,33,209,148,138,73,51,43,75,210,51,219,
+    19,206,145,217,22,46,59,234,59,108,123,175,94,111,232,172,
+    39,122,125,231,132,129,120,101,161,39,157,222,239,8,87,76,
+    172,203,214,121,206,50,107,247,109,207,180,108,230,117,4,243,
+    172,158,101,31,175,8,91,56,199,39,43,194,107,179,129,233,
+    152,61,129,209,97,117,97,182,59,233,168,138,119,50,16,204,
+    180,129,153,142,96,67,119,104,118,187,39,172,101,186,2,88,
+    223,102,96,122,166,219,17,194,11,19,169,250,135,61,169,233,
+    244,215,253,33,107,155,54,38,11,10,64,188,104,140,69,45,
+    237,136,222,166,231,116,89,191,245,141,104,123,204,116,3,235,
+    225,33,96,95,135,135,81,199,233,243,60,53,125,70,19,42,
+    202,254,76,189,177,177,115,62,156,246,251,131,151,39,131,255,
+    61,24,188,144,184,140,195,143,129,140,131,141,113,5,226,60,
+    1,10,79,66,130,79,65,146,167,96,138,95,194,149,70,62,
+    13,41,158,129,75,124,6,215,44,174,203,144,230,89,148,115,
+    48,205,231,113,229,32,195,243,48,195,11,168,95,129,89,190,
+    128,114,17,46,243,37,92,87,33,203,175,193,28,191,14,243,
+    252,6,228,248,77,200,243,91,80,224,12,174,240,219,176,192,
+    151,81,222,129,69,126,23,150,248,61,184,202,239,195,53,254,
+    0,174,243,135,112,131,23,225,38,255,8,110,241,143,129,241,
+    21,184,205,31,193,50,87,225,14,47,193,93,94,134,123,92,
+    131,251,120,32,30,248,185,112,251,141,102,213,208,202,171,171,
+    134,246,125,69,63,253,45,205,240,111,131,185,56,169,174,136,
+    78,200,163,102,149,161,243,98,226,236,97,223,22,120,26,122,
+    61,220,211,146,9,224,8,215,101,173,161,91,92,97,175,45,
+    175,19,20,1,113,100,14,187,94,52,118,247,98,187,205,73,
+    89,250,90,86,101,79,91,150,71,135,199,99,15,119,172,182,
+    131,17,59,251,85,125,91,211,215,119,42,122,93,43,6,213,
+    44,202,163,22,233,16,30,89,199,67,199,244,172,190,173,6,
+    206,45,63,89,211,244,29,235,243,51,134,187,116,150,66,240,
+    21,237,57,114,218,190,211,41,77,93,95,91,181,93,180,213,
+    8,171,186,237,158,38,214,84,34,9,173,82,38,86,81,31,
+    15,137,85,137,37,43,234,90,141,164,86,86,203,148,81,67,
+    60,83,194,178,181,222,134,175,172,149,17,227,58,169,21,84,
+    79,19,186,26,216,53,178,39,180,199,129,187,66,186,174,147,
+    174,84,67,71,45,8,214,84,202,140,175,147,94,86,87,67,
+    177,78,38,141,244,10,185,79,21,236,250,5,161,254,98,183,
+    168,251,41,195,176,241,122,25,134,159,54,140,94,31,134,93,
+    210,51,134,241,29,222,166,200,51,101,24,208,111,163,18,135,
+    110,215,159,14,111,143,225,90,167,194,207,70,4,55,201,120,
+    109,129,215,241,51,173,161,227,122,70,87,216,199,200,10,145,
+    223,233,191,110,13,143,142,132,243,65,154,107,12,208,226,152,
+    246,183,254,28,97,200,219,29,211,182,69,215,159,109,157,155,
+    130,144,184,183,249,220,87,188,198,102,157,212,109,132,198,30,
+    241,141,38,170,7,13,82,247,247,252,164,247,249,87,141,230,
+    62,177,173,77,63,225,53,158,108,61,67,255,203,61,130,38,
+    154,15,246,195,208,3,170,66,134,70,163,142,248,114,227,192,
+    207,154,109,207,122,21,156,0,163,139,231,203,243,149,103,245,
+    122,217,79,16,234,129,208,119,253,100,32,66,90,9,105,37,
+    162,213,131,128,86,15,34,218,8,105,67,15,10,213,2,99,
+    77,15,83,246,52,127,42,148,161,65,143,12,58,25,40,124,
+    53,8,95,213,253,248,139,58,118,136,160,255,34,189,163,87,
+    227,159,79,92,167,93,26,156,120,157,190,93,58,22,189,90,
+    9,47,205,0,47,143,237,185,165,240,141,43,209,235,100,92,
+    60,102,165,238,0,239,147,174,14,78,28,122,244,3,168,225,
+    114,75,120,150,71,231,159,113,76,73,164,198,18,193,172,52,
+    157,29,109,142,147,82,238,218,232,57,138,197,171,111,148,60,
+    202,124,97,180,61,78,73,55,238,188,81,150,200,188,20,154,
+    151,208,93,64,121,101,97,180,139,98,58,31,228,102,230,71,
+    117,98,115,1,35,241,7,66,253,109,58,75,26,57,51,210,
+    108,97,180,69,161,57,180,35,60,161,192,249,48,62,20,228,
+    33,145,15,107,229,66,99,200,232,11,222,46,44,134,61,4,
+    4,225,201,219,204,28,194,76,110,180,21,84,140,52,114,204,
+    228,73,155,155,104,65,51,97,8,209,217,220,232,105,164,21,
+    80,195,1,68,94,234,55,8,166,143,179,55,153,224,110,81,
+    113,232,109,240,211,189,154,26,254,62,184,78,124,226,117,190,
+    32,8,130,191,164,93,75,125,26,94,176,207,156,102,244,19,
+    224,182,16,198,113,89,150,199,13,121,74,86,198,18,193,188,
+    36,223,123,35,221,125,255,127,156,20,178,60,63,150,254,27,
+    127,122,244,87,32,255,254,31,127,208,195,191,10,51,95,86,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/memory/dram_interfaces/lpddr2.py",
+    "gem5.components.memory.dram_interfaces.lpddr2",
+    embedded_module_data,
+    1248,
+    2041);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,102 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,85,75,111,26,87,20,158,129,1,147,1,59,24,
+    227,216,206,243,198,121,52,180,14,48,3,184,142,90,85,34,
+    96,91,81,98,215,197,110,156,222,205,120,224,92,155,105,153,
+    129,206,12,73,109,169,18,139,254,128,238,250,15,42,85,221,
+    244,119,116,149,165,53,171,74,93,121,71,149,174,186,234,185,
+    119,6,59,150,90,134,249,206,57,223,121,112,116,238,131,63,
+    165,247,62,137,72,190,211,17,126,146,64,162,18,200,16,235,
+    201,118,140,198,100,41,38,109,74,16,255,65,2,133,197,126,
+    142,75,210,175,241,73,34,141,67,98,87,42,36,205,172,44,
+    73,207,28,159,185,135,102,135,121,228,176,239,146,23,59,205,
+    102,171,66,108,102,247,221,99,2,236,181,133,30,85,221,235,
+    50,143,77,216,101,235,60,103,153,116,250,142,111,90,14,241,
+    187,140,248,150,109,57,71,43,204,97,238,209,241,10,243,59,
+    100,96,186,166,205,48,58,172,206,204,78,87,141,170,248,199,
+    3,70,76,7,136,233,50,50,244,134,102,175,119,76,218,166,
+    199,128,244,29,2,166,111,122,93,198,252,48,145,87,191,220,
+    83,81,85,191,234,15,73,199,116,48,153,241,0,196,139,198,
+    72,212,210,22,179,27,190,219,35,253,246,215,172,227,19,211,
+    19,236,193,1,96,95,7,7,81,199,234,121,94,81,61,227,
+    19,42,200,193,116,179,85,223,58,31,78,231,253,193,203,147,
+    193,255,46,6,207,36,42,227,240,99,32,227,96,99,84,129,
+    56,77,128,66,147,144,160,83,144,164,41,152,162,87,240,85,
+    209,78,67,138,102,224,10,157,6,149,206,64,154,94,69,153,
+    133,12,157,69,46,7,211,116,14,102,104,30,174,210,121,228,
+    174,65,150,46,160,92,132,89,186,132,239,117,200,209,27,48,
+    71,111,66,158,222,130,121,122,27,174,209,59,176,64,9,44,
+    210,187,176,68,151,225,58,189,135,242,62,220,160,15,80,62,
+    132,155,244,3,184,69,31,193,109,90,128,59,244,67,32,244,
+    35,140,95,129,187,244,49,44,211,34,202,18,220,163,101,184,
+    79,53,120,128,27,226,97,144,13,151,223,208,86,203,101,67,
+    251,174,162,159,252,166,18,252,212,137,135,99,234,177,201,246,
+    64,207,197,172,201,163,190,195,112,31,216,54,174,102,201,4,
+    112,153,231,145,246,208,43,172,144,55,150,223,197,21,59,52,
+    135,61,95,84,10,7,238,93,44,180,25,213,124,204,127,147,
+    84,201,102,219,242,249,182,241,201,163,45,171,227,98,196,122,
+    115,99,77,171,232,117,109,171,81,224,203,106,18,222,153,168,
+    134,155,239,208,58,26,186,166,111,245,157,162,160,54,130,100,
+    77,211,183,172,167,103,4,87,231,44,133,16,40,213,231,104,
+    243,101,59,73,106,69,189,230,120,129,162,173,9,20,122,85,
+    119,188,147,196,199,69,110,196,57,36,180,74,153,83,149,226,
+    147,33,183,170,194,210,121,0,86,40,23,203,60,171,134,120,
+    166,240,250,241,53,187,30,40,171,101,187,126,146,40,23,133,
+    161,175,34,198,117,174,86,170,136,9,237,73,153,11,189,82,
+    22,238,53,193,213,68,138,86,228,17,138,166,133,198,90,88,
+    166,134,66,65,235,37,71,253,229,118,65,15,82,134,225,224,
+    113,50,140,64,53,12,187,15,195,30,215,51,134,241,45,158,
+    158,200,51,101,24,208,239,160,18,135,94,47,72,135,167,197,
+    240,172,19,22,100,35,3,151,198,120,99,129,223,13,50,237,
+    161,235,249,70,143,57,71,104,205,71,126,183,255,166,61,60,
+    60,100,238,165,52,207,24,32,227,154,206,55,193,44,199,208,
+    238,116,77,199,97,189,96,166,125,78,137,144,184,223,120,30,
+    40,126,171,209,228,234,11,174,214,119,81,221,111,113,117,111,
+    7,213,214,78,144,244,159,126,217,218,221,227,212,70,35,72,
+    248,173,245,141,103,232,121,197,221,175,118,145,222,223,11,227,
+    247,121,21,78,180,90,77,196,87,245,253,32,107,118,124,235,
+    181,88,121,163,135,187,202,15,148,103,205,102,57,72,112,212,
+    133,208,183,131,164,16,161,89,9,205,74,100,86,247,133,89,
+    221,143,204,86,104,182,116,81,168,38,200,154,30,166,236,104,
+    193,84,40,67,66,143,8,157,19,60,124,85,132,175,234,65,
+    252,101,19,59,68,208,127,145,222,241,91,226,159,79,60,183,
+    83,26,28,251,221,190,83,58,98,118,173,132,71,101,128,71,
+    198,241,189,82,120,167,149,248,109,100,92,92,94,165,222,0,
+    79,81,165,56,56,118,249,37,47,160,134,175,87,194,61,60,
+    58,127,198,49,37,145,26,75,28,102,164,116,118,212,24,39,
+    165,185,27,163,231,40,22,175,191,85,242,40,243,243,163,23,
+    40,110,221,123,171,44,113,122,137,211,41,105,9,221,243,104,
+    95,91,24,109,163,72,207,141,26,127,164,103,71,77,174,207,
+    70,250,169,26,86,204,204,157,243,227,140,52,51,55,218,136,
+    200,83,132,117,238,201,137,184,72,68,225,147,172,136,204,135,
+    100,14,179,22,22,195,214,50,252,55,144,89,23,117,78,167,
+    177,240,41,114,151,180,252,37,77,116,21,6,115,115,38,63,
+    218,140,180,121,212,210,185,137,151,55,46,130,249,227,238,76,
+    38,184,93,80,92,126,39,4,170,93,43,134,255,7,158,27,
+    159,120,221,207,57,136,224,47,248,170,165,62,13,15,216,103,
+    238,110,116,229,123,109,132,113,92,150,229,113,75,158,146,149,
+    177,196,33,39,201,15,222,74,247,223,255,142,147,76,150,115,
+    99,233,191,241,199,239,255,18,242,239,255,241,139,30,254,5,
+    109,124,92,21,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/memory/dram_interfaces/lpddr3.py",
+    "gem5.components.memory.dram_interfaces.lpddr3",
+    embedded_module_data,
+    1236,
+    2025);
+
+} // anonymous namespace
+} // namespace gem5
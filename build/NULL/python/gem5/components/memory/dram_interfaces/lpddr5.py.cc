@@ -0,0 +1,150 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,221,88,93,83,219,216,25,150,252,141,49,96,12,54,
+    6,242,161,205,199,54,116,88,129,13,6,146,108,59,11,118,
+    32,33,132,16,195,38,169,46,86,145,117,14,88,187,182,228,
+    149,228,80,51,211,25,95,244,63,180,191,160,51,105,127,193,
+    222,244,55,208,59,70,87,153,233,21,119,222,73,174,50,189,
+    232,251,30,201,31,1,211,221,201,238,108,51,139,209,115,116,
+    222,143,35,249,156,231,188,207,129,127,115,61,63,65,175,125,
+    243,79,128,191,112,132,147,56,194,19,95,133,175,250,36,31,
+    207,249,184,13,142,248,255,204,145,0,245,253,205,207,113,255,
+    240,183,19,37,63,243,5,193,23,162,254,51,190,0,243,133,
+    193,23,57,231,11,50,223,0,248,162,231,124,33,230,27,4,
+    95,140,134,206,248,194,204,55,4,190,225,115,190,8,25,217,
+    229,102,226,74,156,231,184,7,186,77,205,125,69,165,150,176,
+    111,152,194,214,78,161,80,204,9,85,90,53,204,134,64,232,
+    75,13,60,209,232,94,153,90,180,109,189,166,117,114,174,9,
+    170,161,219,138,166,11,118,153,10,182,86,213,244,131,89,170,
+    83,243,160,49,75,109,85,168,41,166,82,165,16,237,142,78,
+    21,181,28,245,70,177,27,53,42,40,58,17,20,147,10,117,
+    171,174,84,42,13,161,164,88,148,8,134,46,16,197,86,172,
+    50,165,182,155,136,163,191,255,78,98,52,250,7,163,46,168,
+    138,14,201,20,3,0,187,47,38,120,175,244,136,86,243,182,
+    89,17,140,210,215,84,181,5,197,98,214,23,47,8,188,215,
+    139,23,222,27,71,59,121,98,244,20,103,104,134,119,134,10,
+    197,213,71,157,201,81,123,73,192,183,73,240,119,70,2,202,
+    73,60,16,193,71,120,201,79,124,82,128,248,165,32,9,72,
+    33,18,148,194,36,4,147,29,150,6,72,68,138,194,53,8,
+    246,24,25,144,134,72,84,26,38,131,210,8,137,73,113,104,
+    71,201,144,148,32,195,210,24,25,145,198,73,92,74,146,81,
+    41,69,18,210,4,25,147,210,100,92,154,132,107,138,36,165,
+    105,146,146,46,145,9,233,50,73,75,87,96,140,171,224,23,
+    224,250,132,76,74,215,224,186,78,166,164,27,48,254,77,50,
+    45,125,74,46,73,191,33,151,165,91,208,206,144,43,176,224,
+    87,157,180,187,188,114,46,55,63,47,103,254,152,89,146,215,
+    54,228,181,173,133,172,242,0,190,84,84,128,159,85,193,130,
+    25,169,208,54,19,32,168,59,173,194,45,67,167,176,228,213,
+    42,44,220,156,66,136,73,45,75,40,213,173,25,150,139,43,
+    165,180,243,49,81,45,43,186,78,43,194,161,102,151,97,225,
+    246,149,122,197,246,230,220,234,172,53,75,213,116,205,214,148,
+    138,176,121,175,112,47,47,88,53,170,106,251,154,170,216,154,
+    161,195,74,99,196,174,173,152,54,36,186,131,229,196,220,70,
+    169,102,49,158,8,166,98,195,138,35,151,86,54,74,154,45,
+    16,141,122,73,121,67,223,215,14,234,38,230,225,219,101,150,
+    62,43,41,250,55,66,213,32,212,29,8,187,159,29,152,70,
+    189,6,68,84,203,154,13,52,169,155,148,101,151,234,166,101,
+    11,198,190,176,144,157,21,14,203,154,90,6,18,42,186,229,
+    58,44,70,190,146,199,186,10,85,94,82,34,178,188,211,47,
+    128,24,206,176,90,49,44,42,43,68,169,217,218,75,122,26,
+    7,227,169,128,158,64,102,67,91,115,2,217,135,218,218,41,
+    146,233,52,0,112,20,206,136,139,185,156,110,129,123,69,183,
+    142,34,217,5,49,187,50,143,253,197,44,226,194,34,160,127,
+    25,92,225,108,102,89,132,200,163,208,162,152,187,141,237,138,
+    184,188,160,91,239,66,89,241,118,6,3,50,25,113,9,195,
+    131,217,12,140,112,20,92,16,111,215,33,108,73,204,186,15,
+    192,1,253,236,54,11,254,211,8,60,127,239,40,194,178,160,
+    191,61,243,91,39,34,203,58,108,93,89,118,162,178,12,211,
+    85,175,224,125,76,150,191,133,157,234,121,194,178,76,12,21,
+    110,226,38,85,136,92,170,239,239,83,83,182,180,35,234,12,
+    214,148,3,42,215,140,138,166,54,156,184,187,103,33,192,146,
+    15,53,98,151,157,24,155,65,185,66,245,3,232,13,122,126,
+    150,153,244,58,166,113,216,59,160,55,134,37,215,192,98,194,
+    162,57,163,136,110,223,227,153,51,92,234,152,88,200,56,246,
+    101,182,186,61,86,191,157,127,232,4,236,98,190,128,183,91,
+    0,197,29,236,175,238,194,237,179,34,192,243,29,132,93,52,
+    238,237,56,33,123,237,203,226,238,158,19,117,91,249,209,131,
+    237,238,253,234,115,240,231,243,5,121,11,163,215,243,78,208,
+    46,222,91,127,0,157,103,123,69,112,1,186,174,189,103,248,
+    52,28,115,103,167,128,134,98,1,220,128,204,253,124,245,153,
+    19,87,84,32,10,227,188,92,129,77,98,59,35,37,170,216,
+    222,87,172,24,234,55,78,194,62,52,100,181,161,194,98,120,
+    193,20,146,87,87,11,206,8,238,4,55,74,182,26,186,250,
+    138,123,131,53,234,221,93,203,84,231,106,13,187,108,232,115,
+    7,180,154,155,131,221,91,131,93,172,219,214,156,91,81,231,
+    176,22,202,221,210,57,87,169,193,198,206,137,181,134,137,114,
+    199,32,7,151,117,9,184,218,236,124,90,190,129,96,164,197,
+    33,164,185,244,212,113,96,188,21,226,198,174,55,31,66,227,
+    118,163,220,120,170,185,133,214,73,102,189,124,253,56,48,137,
+    222,73,55,120,18,162,146,173,56,151,74,55,183,79,166,47,
+    29,7,210,96,28,28,111,230,161,137,37,154,5,236,37,89,
+    111,112,244,61,35,246,34,220,96,220,245,121,9,227,224,139,
+    113,195,169,230,58,244,18,83,205,77,108,166,89,51,60,193,
+    140,177,177,102,225,4,224,158,23,254,122,104,12,236,49,46,
+    150,116,135,29,235,14,4,205,40,4,15,37,220,68,120,238,
+    201,68,26,223,58,194,77,164,155,143,225,171,77,93,57,14,
+    164,78,224,253,10,175,83,83,205,199,248,49,243,237,233,234,
+    47,23,159,94,44,23,126,144,139,0,200,69,0,228,34,8,
+    165,58,116,81,169,206,44,41,83,31,111,169,254,128,66,253,
+    211,202,244,108,183,70,103,150,216,80,38,214,50,51,129,212,
+    15,229,196,21,40,116,219,175,6,204,52,26,39,17,166,16,
+    166,17,174,34,204,33,204,35,100,16,178,8,107,8,108,45,
+    11,8,235,109,248,14,55,193,50,247,254,38,8,225,38,64,
+    72,181,217,142,20,60,25,157,108,110,190,70,240,12,248,113,
+    199,92,191,144,31,235,63,124,156,8,34,63,224,56,17,130,
+    227,68,24,142,19,145,158,227,68,20,142,19,81,60,78,0,
+    127,98,125,248,179,178,230,74,61,255,241,242,231,231,148,250,
+    149,46,133,102,123,149,220,149,104,16,85,80,95,115,2,87,
+    196,135,176,129,48,238,170,179,43,186,128,230,16,26,252,40,
+    137,175,70,251,146,232,19,132,27,8,55,251,208,9,203,166,
+    121,7,225,115,132,223,117,40,118,23,97,169,15,217,54,219,
+    240,47,36,219,215,103,200,22,65,178,69,24,217,220,98,58,
+    204,165,38,122,138,103,135,122,39,30,245,188,138,217,211,120,
+    117,12,98,161,248,177,2,199,160,203,207,205,11,249,121,231,
+    199,29,119,67,192,79,31,240,51,8,252,12,2,63,67,192,
+    207,48,112,50,210,225,36,28,50,206,28,63,239,126,244,156,
+    92,18,23,63,222,3,231,81,40,195,78,118,120,50,116,111,
+    130,236,128,248,46,152,197,198,220,130,149,219,158,25,238,203,
+    96,84,37,243,214,69,181,16,203,157,185,130,112,27,225,139,
+    62,148,125,210,134,255,32,101,191,226,46,60,36,120,2,203,
+    4,27,148,58,233,42,181,75,212,68,218,45,149,227,174,34,
+    187,26,60,152,112,21,25,116,27,132,23,217,139,31,247,209,
+    79,126,94,153,61,67,73,144,217,248,255,143,146,109,58,178,
+    33,122,41,249,139,50,242,61,109,21,123,196,181,136,144,68,
+    74,153,247,251,240,97,175,13,34,223,71,47,59,37,108,170,
+    163,151,73,44,90,105,212,203,148,75,130,177,222,122,180,247,
+    203,234,101,151,8,158,94,30,189,249,85,22,166,255,45,143,
+    230,67,156,250,174,58,38,219,234,200,74,137,249,8,1,181,
+    209,220,102,52,120,220,135,6,79,219,112,159,255,16,37,67,
+    117,66,62,156,120,164,248,0,37,123,202,170,222,0,43,115,
+    78,180,154,19,221,127,2,89,38,254,39,204,253,219,102,189,
+    163,185,79,58,212,125,122,254,203,188,139,124,238,254,9,252,
+    123,243,185,199,64,235,14,96,203,207,243,124,171,200,135,249,
+    64,139,67,72,112,252,205,99,238,70,239,111,43,180,234,227,
+    167,91,92,127,252,235,159,190,103,237,219,94,207,253,64,146,
+    79,181,184,243,112,124,117,249,123,108,223,118,205,243,183,248,
+    177,22,119,30,88,40,180,111,187,230,167,252,28,159,104,113,
+    231,129,197,66,251,182,107,38,252,4,166,157,7,22,59,129,
+    227,118,204,139,63,254,21,58,192,230,246,191,255,118,201,240,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/memory/dram_interfaces/lpddr5.py",
+    "gem5.components.memory.dram_interfaces.lpddr5",
+    embedded_module_data,
+    2016,
+    5467);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,84 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,84,205,111,27,69,20,159,245,174,29,119,237,164,
+    78,226,52,73,91,164,81,41,18,150,130,191,136,165,32,16,
+    82,234,52,85,148,38,173,156,32,195,92,54,227,157,113,188,
+    176,31,102,103,220,224,72,72,62,112,227,194,141,255,0,9,
+    241,39,240,79,228,88,237,9,137,83,110,70,229,212,19,111,
+    118,215,78,42,209,245,190,223,251,126,158,121,111,102,255,70,
+    183,158,108,202,223,52,1,126,69,12,17,196,52,150,113,53,
+    47,67,50,26,202,160,103,136,233,63,33,102,240,204,111,58,
+    66,127,232,179,68,162,179,236,9,170,228,104,73,67,232,192,
+    151,60,236,83,155,11,220,15,66,220,117,24,63,120,129,61,
+    238,5,225,24,51,254,202,1,143,105,158,14,184,224,51,235,
+    35,103,158,243,8,219,129,47,169,227,99,57,224,88,58,158,
+    227,159,111,113,159,135,231,227,45,46,109,60,164,33,245,56,
+    68,39,213,57,181,7,102,90,69,142,135,28,83,159,97,26,
+    114,60,18,35,234,186,99,220,163,130,51,28,248,152,81,73,
+    197,128,115,153,36,170,234,239,174,169,106,154,223,4,35,108,
+    83,31,146,185,10,0,188,89,24,78,151,116,196,189,182,12,
+    93,28,244,190,229,182,196,84,196,214,179,51,6,235,58,59,
+    75,87,108,206,243,170,230,181,234,80,69,139,22,247,58,187,
+    71,243,230,216,183,27,175,205,26,31,198,141,231,136,104,208,
+    252,12,211,160,177,25,98,48,157,100,153,65,114,44,75,22,
+    88,142,228,217,2,185,3,100,130,94,96,121,82,100,119,200,
+    34,208,18,208,93,102,146,18,43,144,101,86,36,43,64,171,
+    108,145,148,217,18,89,3,219,61,118,151,172,3,109,176,18,
+    217,100,203,228,62,91,33,15,216,42,12,174,28,149,146,49,
+    89,205,122,221,106,252,208,104,238,92,254,108,98,120,118,177,
+    128,237,184,124,54,70,229,186,105,10,254,56,240,57,12,204,
+    243,226,182,43,98,44,228,66,224,222,72,84,182,240,133,35,
+    7,113,25,198,251,116,228,202,180,59,226,102,42,208,108,46,
+    192,74,37,232,221,131,23,159,192,2,240,14,126,214,115,164,
+    26,181,172,198,233,251,209,66,163,222,220,62,114,158,92,79,
+    160,67,215,6,64,100,108,31,130,174,90,23,233,45,95,68,
+    70,99,71,225,118,51,150,99,75,179,14,152,109,54,128,93,
+    102,63,173,126,54,82,30,165,228,26,245,170,242,25,45,192,
+    235,12,212,56,174,60,140,242,150,229,195,225,178,172,200,180,
+    44,47,96,35,87,201,69,203,250,30,206,82,234,89,176,44,
+    22,216,32,232,204,117,163,66,114,118,44,225,92,242,168,148,
+    42,176,119,235,194,97,114,16,21,123,163,80,72,203,229,254,
+    57,104,107,169,63,12,46,122,163,126,159,135,239,164,9,107,
+    8,150,144,250,223,69,203,10,19,221,30,80,223,231,110,180,
+    212,155,155,226,16,93,182,15,35,67,118,218,123,74,124,14,
+    208,121,169,244,221,19,16,187,29,37,158,190,140,114,242,201,
+    87,157,147,83,165,237,183,163,172,236,60,221,63,0,165,123,
+    154,4,116,85,238,137,18,59,123,128,95,239,118,163,18,181,
+    165,243,138,74,39,240,45,23,134,37,127,71,111,212,201,124,
+    251,185,8,237,218,112,44,7,129,95,59,231,94,171,6,83,
+    31,194,244,125,41,106,201,61,170,169,27,96,221,92,152,26,
+    244,128,59,65,117,56,14,213,135,37,134,22,144,248,19,96,
+    50,255,77,51,122,54,63,69,10,138,168,80,154,180,167,57,
+    180,250,112,114,8,108,227,193,149,81,6,94,94,155,60,159,
+    230,209,7,31,94,25,155,202,188,153,152,55,239,95,25,107,
+    192,239,173,79,142,129,165,185,197,149,201,222,107,19,228,4,
+    10,203,169,250,151,146,160,202,82,121,178,175,194,86,65,203,
+    161,197,242,228,105,154,116,195,32,50,174,84,158,27,95,175,
+    111,192,127,38,111,216,152,237,230,184,98,132,235,234,252,153,
+    94,171,154,124,15,68,168,207,188,97,93,65,28,172,190,167,
+    111,243,95,36,71,234,203,112,59,189,242,162,7,48,213,53,
+    77,155,118,180,5,205,152,34,5,43,72,251,232,10,61,190,
+    253,78,115,109,77,219,156,162,255,199,95,126,252,39,230,255,
+    190,199,31,175,225,63,244,111,196,210,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/memory/dram_interfaces/wideio.py",
+    "gem5.components.memory.dram_interfaces.wideio",
+    embedded_module_data,
+    954,
+    1513);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,258 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,89,255,111,27,71,118,223,93,46,201,229,119,137,
+    18,101,125,179,181,119,150,45,179,189,211,119,185,138,124,185,
+    196,118,46,142,109,249,75,35,31,146,99,47,166,41,238,72,
+    162,195,37,149,217,165,109,177,114,35,4,198,197,53,140,198,
+    56,164,136,26,184,56,182,112,13,5,185,2,42,144,2,70,
+    209,31,238,79,32,3,2,39,44,96,32,64,113,63,228,55,
+    26,142,129,34,63,245,189,217,37,185,75,81,78,125,151,163,
+    200,55,187,51,111,222,188,121,243,230,243,222,140,254,135,179,
+    125,36,171,124,122,137,231,184,79,56,133,83,248,44,151,48,
+    75,62,193,67,41,100,5,213,149,112,169,98,66,84,221,9,
+    183,234,73,120,120,179,221,155,240,66,233,202,74,170,47,225,
+    83,253,9,191,26,72,4,212,96,34,200,218,197,108,72,13,
+    39,194,240,236,86,60,217,136,218,145,232,128,103,175,34,101,
+    59,213,104,34,10,207,62,197,159,237,82,187,19,221,240,28,
+    32,49,37,72,122,148,16,241,144,24,137,45,9,125,13,21,
+    151,60,74,248,150,152,216,39,112,167,56,37,114,139,83,58,
+    136,255,161,139,227,62,119,213,57,18,189,172,173,19,218,162,
+    164,187,165,173,207,199,41,131,74,55,17,73,172,41,19,198,
+    233,91,18,149,216,45,119,162,95,217,191,71,235,62,104,29,
+    80,14,236,209,218,7,173,131,202,208,30,173,3,208,186,95,
+    225,23,184,184,252,53,86,159,143,139,134,56,159,209,116,67,
+    186,176,170,103,242,185,84,214,144,22,200,123,5,146,75,19,
+    195,125,169,176,154,37,192,226,59,174,40,244,205,84,110,153,
+    24,210,107,111,30,63,167,101,212,41,195,123,142,168,39,117,
+    154,53,196,139,121,170,199,121,35,168,231,161,42,79,215,22,
+    50,69,242,53,78,21,42,125,249,107,132,210,140,66,180,175,
+    5,179,38,116,124,81,211,105,42,173,159,200,167,168,242,53,
+    111,214,118,215,107,45,17,107,154,78,84,67,82,137,154,212,
+    215,86,137,225,203,21,212,100,122,37,151,213,12,15,37,122,
+    129,230,210,130,205,97,124,240,195,17,159,70,69,116,24,157,
+    111,54,93,109,60,63,132,223,231,141,250,155,130,46,218,184,
+    26,75,83,178,213,54,63,123,240,186,95,128,215,211,150,55,
+    220,124,126,8,154,126,206,183,127,115,200,148,254,152,90,133,
+    87,4,197,245,208,11,82,189,245,186,155,174,23,177,193,186,
+    75,17,31,130,213,63,111,88,254,166,248,66,253,197,117,216,
+    118,69,156,155,83,138,123,15,41,190,246,90,56,45,163,69,
+    244,88,179,85,241,56,91,63,224,95,72,182,248,92,217,222,
+    255,167,236,64,91,217,238,22,217,49,135,108,105,157,89,70,
+    241,49,251,180,140,163,248,215,57,214,26,64,170,247,217,164,
+    242,78,94,198,197,36,221,244,232,3,54,62,143,18,108,177,
+    186,119,93,40,217,188,111,111,77,121,14,56,35,237,56,149,
+    144,18,126,158,54,78,208,99,114,58,218,142,232,221,53,162,
+    183,212,217,142,211,185,135,129,207,163,15,55,91,175,118,53,
+    158,186,235,79,75,2,192,93,36,245,33,8,247,203,240,185,
+    180,146,209,228,165,66,46,141,120,39,167,41,73,233,68,147,
+    83,114,58,159,91,202,44,203,75,153,44,145,245,149,148,46,
+    95,207,100,179,242,34,145,11,26,81,100,61,111,177,2,167,
+    202,32,138,9,131,78,58,205,103,179,132,202,249,37,25,145,
+    74,70,128,92,0,128,28,149,79,235,178,166,231,41,72,215,
+    87,136,67,126,38,39,95,185,50,166,171,171,99,87,174,200,
+    74,134,146,52,240,173,141,250,153,204,185,213,20,77,169,114,
+    29,250,230,64,99,34,231,82,42,145,151,242,148,137,98,227,
+    224,120,240,108,42,131,250,45,214,199,40,80,162,56,101,53,
+    192,211,18,86,80,23,77,141,211,43,169,92,142,100,53,54,
+    191,122,231,198,56,214,68,77,73,38,234,130,132,227,178,142,
+    113,129,205,61,149,201,101,114,203,140,57,95,208,87,11,186,
+    57,191,84,78,177,215,217,102,136,162,12,23,185,1,17,71,
+    1,205,48,146,80,132,40,195,107,14,175,21,197,81,144,89,
+    220,64,61,175,0,223,88,61,224,216,12,37,167,65,235,188,
+    142,51,94,202,23,114,48,217,139,89,146,210,208,74,215,50,
+    203,184,72,48,29,236,124,133,105,66,11,185,57,255,114,70,
+    151,211,217,124,142,200,240,244,42,252,86,10,139,163,233,188,
+    58,87,80,149,31,195,68,181,53,173,49,212,40,52,23,103,
+    118,105,48,102,169,248,60,77,138,189,151,86,154,235,144,98,
+    62,198,76,50,82,236,26,169,115,219,216,221,204,11,12,143,
+    21,219,248,235,134,71,179,98,95,125,109,226,49,35,104,10,
+    132,197,212,8,53,130,39,217,219,69,243,77,200,107,134,184,
+    154,210,87,12,241,106,62,147,51,188,160,28,122,139,225,77,
+    45,106,172,94,74,38,81,133,100,210,240,128,4,104,54,220,
+    25,13,11,223,207,110,164,9,139,251,134,39,163,33,143,225,
+    130,40,108,136,249,85,146,51,68,240,119,5,42,136,110,184,
+    175,211,140,14,9,1,24,80,35,134,160,206,24,222,60,235,
+    7,209,24,214,24,100,197,37,26,133,101,164,184,1,13,143,
+    169,174,17,178,150,56,57,149,196,225,98,205,87,116,110,203,
+    154,134,63,147,3,39,97,42,26,1,211,99,204,23,127,142,
+    92,175,115,161,143,200,214,231,219,81,141,166,199,86,215,244,
+    149,124,110,108,153,168,51,176,48,234,42,44,109,78,215,198,
+    76,159,29,107,12,53,186,186,102,248,77,33,73,69,155,162,
+    47,129,160,94,248,105,255,5,128,176,193,61,235,225,194,253,
+    213,208,225,74,232,72,53,116,100,227,245,103,18,23,219,247,
+    241,169,79,230,127,61,255,88,242,223,245,126,20,185,19,249,
+    103,225,190,247,55,145,79,35,255,46,85,122,39,170,189,19,
+    21,105,178,42,77,98,179,175,73,118,164,208,142,20,133,239,
+    147,136,20,243,124,195,1,217,56,247,172,155,219,63,116,255,
+    212,111,230,63,157,223,218,255,200,87,25,60,81,29,60,81,
+    22,251,254,208,217,245,241,190,79,6,127,61,88,62,48,181,
+    253,246,239,60,149,153,215,43,157,167,170,157,167,54,206,128,
+    2,193,240,221,191,250,232,229,59,47,111,238,175,4,70,170,
+    129,145,26,23,114,251,31,135,247,213,4,33,244,202,19,151,
+    24,241,127,195,1,169,113,162,207,255,204,207,133,59,238,190,
+    245,209,59,119,222,41,15,140,87,66,19,213,208,68,141,243,
+    50,254,157,224,201,39,46,1,185,5,228,22,128,219,99,114,
+    95,190,115,121,243,76,37,52,82,13,129,112,151,197,124,120,
+    171,191,18,156,42,31,61,91,9,158,109,233,87,147,184,174,
+    254,205,55,42,209,225,210,141,74,116,236,63,15,110,103,254,
+    99,244,139,209,74,244,213,223,29,173,68,79,111,156,125,220,
+    25,187,247,110,105,170,210,57,82,237,28,217,56,179,35,250,
+    63,60,251,193,217,123,254,138,56,80,21,7,202,226,0,214,
+    156,249,224,204,237,27,155,253,255,182,176,213,247,47,151,31,
+    92,174,136,211,85,113,186,44,78,99,219,252,7,243,247,250,
+    43,226,96,85,28,44,139,131,59,98,248,247,98,247,151,98,
+    119,69,236,169,138,61,101,177,103,39,208,3,203,224,175,246,
+    198,203,129,120,89,140,63,69,104,79,219,35,67,61,189,122,
+    58,14,228,67,72,2,9,135,39,133,132,160,240,9,151,34,
+    16,81,113,17,183,34,42,238,37,207,109,110,137,87,60,183,
+    130,9,120,186,193,39,188,16,32,188,70,164,14,220,86,94,
+    91,252,144,129,213,241,6,160,203,102,106,42,159,108,96,190,
+    5,178,108,199,103,83,154,38,195,126,188,134,193,4,227,9,
+    116,185,176,120,21,96,66,206,155,197,117,154,90,93,37,244,
+    71,114,65,207,100,51,90,177,14,156,117,249,245,128,98,33,
+    7,108,46,11,46,89,22,140,91,154,237,46,138,145,237,124,
+    218,101,155,58,102,33,44,251,189,3,228,31,121,103,254,235,
+    140,152,37,91,203,222,81,85,183,229,181,235,252,186,224,204,
+    28,126,41,96,230,120,83,92,119,173,115,201,134,30,152,221,
+    37,27,249,16,59,100,8,223,254,202,95,223,180,182,168,134,
+    83,177,69,53,43,144,177,160,134,47,123,70,180,22,81,223,
+    25,212,154,61,206,199,221,134,91,43,128,245,17,12,33,190,
+    232,201,36,67,130,58,52,188,142,120,35,33,234,92,4,196,
+    140,123,12,81,35,217,37,250,114,3,210,36,232,148,68,52,
+    165,19,248,234,75,38,217,138,39,147,154,167,142,76,27,116,
+    22,217,143,3,41,246,182,56,211,104,125,212,183,16,122,144,
+    229,127,1,123,252,156,47,252,247,222,187,222,223,75,189,95,
+    74,189,21,169,191,42,245,151,165,254,199,3,135,74,43,219,
+    190,202,192,92,117,96,174,34,245,222,150,238,29,222,233,255,
+    225,109,241,110,100,167,247,0,20,161,219,240,71,231,64,74,
+    92,194,9,161,25,1,221,253,201,164,154,87,10,12,233,131,
+    201,228,123,133,84,214,106,241,38,147,74,62,13,115,142,163,
+    242,174,12,56,48,234,96,132,172,105,164,73,54,155,76,126,
+    198,211,215,81,61,116,145,87,205,201,252,164,78,46,96,195,
+    47,77,189,235,127,53,193,237,150,106,28,146,176,228,30,42,
+    117,213,56,40,182,205,226,81,55,43,94,136,176,41,177,225,
+    28,59,187,238,140,79,19,252,222,59,155,136,182,179,185,200,
+    118,184,136,59,92,224,136,151,72,206,244,82,113,19,159,226,
+    81,188,112,34,150,110,137,78,231,79,248,219,246,240,144,0,
+    9,146,80,115,12,18,118,220,6,8,138,111,151,164,200,30,
+    146,58,72,167,163,167,127,87,207,232,30,61,187,128,59,176,
+    139,187,187,45,119,16,198,177,233,107,205,55,180,171,119,140,
+    97,96,15,108,215,176,17,90,0,80,202,146,147,230,6,42,
+    198,45,4,52,107,101,171,186,142,131,102,158,98,110,50,22,
+    252,97,211,192,201,191,61,50,253,55,247,231,64,38,133,119,
+    34,147,29,143,116,219,9,15,16,204,97,28,224,115,55,219,
+    224,148,23,106,242,42,194,174,211,151,11,140,35,210,87,224,
+    133,226,241,165,56,211,8,9,22,86,217,142,1,148,188,87,
+    200,80,118,162,64,107,200,12,171,136,14,193,226,124,220,75,
+    95,229,44,132,96,94,110,34,123,26,240,129,226,145,209,112,
+    39,177,139,209,117,62,175,159,86,33,197,86,33,163,33,202,
+    207,40,205,83,24,255,53,236,198,146,172,139,72,216,86,69,
+    251,182,64,79,143,99,13,27,192,179,140,236,139,220,243,129,
+    167,119,100,75,218,254,65,165,119,186,218,59,141,56,243,56,
+    246,131,210,112,37,54,82,141,141,192,171,127,39,2,123,219,
+    229,11,63,142,30,218,233,56,5,57,66,87,24,114,132,174,
+    48,228,8,161,112,205,5,45,172,153,109,99,195,189,136,247,
+    59,86,180,178,223,213,240,117,159,64,228,196,203,189,5,238,
+    51,254,252,103,16,46,204,41,254,28,53,21,216,196,216,180,
+    140,104,38,151,206,211,213,60,4,69,146,52,45,94,148,157,
+    179,220,205,161,163,20,188,232,216,224,190,146,130,183,69,166,
+    84,218,238,99,66,93,143,105,166,199,58,119,181,209,116,213,
+    230,41,182,218,198,44,150,132,101,136,111,20,193,60,238,162,
+    111,178,233,82,118,63,38,130,18,58,0,41,206,132,1,169,
+    53,135,208,50,209,89,214,139,237,90,113,192,169,190,163,241,
+    6,118,237,55,53,239,140,125,188,191,218,57,92,82,30,168,
+    213,195,179,229,142,151,202,145,185,178,52,183,123,50,13,163,
+    70,119,77,166,169,42,207,84,165,239,180,232,214,99,13,15,
+    86,75,54,61,89,43,14,183,85,178,133,107,29,133,5,77,
+    109,59,186,63,14,221,126,191,44,29,120,142,126,29,187,244,
+    107,106,183,208,78,59,9,199,197,125,209,234,217,245,250,13,
+    236,224,55,53,136,116,221,45,150,165,62,211,3,61,108,73,
+    52,135,243,53,0,233,83,174,245,162,16,225,228,93,6,31,
+    45,23,53,61,208,98,195,122,135,115,52,100,155,61,105,68,
+    111,92,174,1,148,184,90,161,196,41,9,250,55,18,166,38,
+    32,225,134,136,139,231,25,212,80,148,95,76,89,0,108,37,
+    54,245,140,241,187,208,135,245,97,54,144,175,175,100,210,43,
+    178,154,210,211,43,214,117,132,217,119,68,99,40,53,10,25,
+    143,43,75,114,38,178,176,101,24,65,194,220,229,111,112,113,
+    172,189,137,113,217,177,55,59,180,166,87,176,161,138,7,156,
+    171,212,218,126,11,37,252,156,173,214,31,2,225,219,215,54,
+    59,239,252,109,37,48,80,13,12,224,121,38,188,121,173,148,
+    186,191,118,255,239,182,187,191,232,255,114,232,88,121,232,216,
+    227,232,64,77,224,59,95,122,226,114,33,220,184,16,110,92,
+    0,55,18,55,116,168,244,215,247,51,136,83,85,105,160,204,
+    190,102,82,180,143,158,66,101,223,64,114,26,201,25,36,152,
+    251,80,180,183,9,192,8,249,180,147,173,25,146,95,32,65,
+    68,162,184,16,20,87,145,162,83,209,203,72,112,113,41,6,
+    20,122,5,201,89,36,8,166,116,9,201,60,146,115,156,51,
+    117,186,80,39,200,167,221,228,91,82,39,1,83,39,36,82,
+    192,29,198,212,9,138,173,55,182,23,126,123,142,61,238,77,
+    250,57,79,100,227,23,229,200,193,138,123,184,234,30,6,219,
+    184,67,91,161,26,7,197,163,97,86,52,201,19,23,231,57,
+    84,103,170,121,118,247,60,182,89,40,189,189,149,169,30,154,
+    125,52,92,62,244,211,234,208,43,216,239,88,147,216,37,28,
+    107,39,97,104,75,220,122,235,183,108,184,161,38,177,119,27,
+    106,215,173,127,243,32,50,246,55,137,189,75,255,238,46,30,
+    247,145,146,190,117,250,193,251,53,14,30,31,77,179,162,73,
+    154,189,29,213,77,98,230,150,23,24,46,76,142,79,207,158,
+    59,193,156,221,1,82,13,112,248,33,215,10,14,10,191,222,
+    114,107,141,231,155,98,222,202,144,180,150,13,250,218,155,83,
+    201,137,163,227,227,206,107,56,220,106,230,97,133,165,6,206,
+    27,60,43,157,146,95,35,75,169,66,86,151,175,165,178,5,
+    198,99,106,107,157,5,59,152,232,217,83,139,201,27,179,108,
+    4,136,53,56,41,40,46,114,45,176,238,216,136,13,149,104,
+    22,26,255,1,121,99,108,23,62,235,224,130,125,229,190,191,
+    220,186,84,9,76,86,3,147,101,113,210,130,207,137,241,201,
+    233,115,39,254,140,22,154,156,254,126,44,100,42,106,179,208,
+    116,114,218,180,16,142,64,49,212,208,119,191,203,58,211,38,
+    243,42,52,254,147,205,58,193,61,172,227,158,156,57,250,39,
+    27,103,181,189,113,230,47,126,191,14,132,154,90,214,233,178,
+    100,51,15,154,154,52,61,162,173,129,122,29,6,178,169,68,
+    49,181,250,215,93,38,26,221,22,43,129,153,106,96,166,44,
+    206,152,38,18,143,254,233,238,179,220,222,66,111,156,56,247,
+    125,88,230,104,211,109,66,32,114,194,116,155,137,201,217,246,
+    38,233,112,152,4,58,80,204,213,240,120,162,117,55,77,177,
+    57,180,53,92,9,140,85,3,99,101,113,204,12,72,60,93,
+    54,11,213,44,222,51,139,2,22,7,232,126,28,107,136,109,
+    57,125,109,21,134,48,195,13,11,85,44,24,177,176,52,134,
+    12,126,117,102,212,188,78,210,204,16,133,247,162,102,96,194,
+    96,101,68,160,29,175,151,70,33,39,184,70,168,110,158,43,
+    194,88,165,141,214,255,21,203,66,159,17,99,249,185,54,154,
+    178,254,241,154,52,243,245,8,219,28,141,74,43,116,155,22,
+    52,195,37,139,163,44,2,226,13,138,121,69,192,130,29,2,
+    11,219,63,204,67,152,109,232,219,72,24,244,162,5,191,149,
+    126,98,222,80,252,148,190,207,153,73,161,246,35,88,240,154,
+    139,231,249,29,174,171,92,255,238,112,190,13,246,87,19,220,
+    188,80,227,254,56,18,230,120,255,247,32,38,200,241,241,50,
+    119,196,254,253,138,27,41,59,191,59,220,68,217,249,221,225,
+    102,203,206,111,205,51,205,255,197,38,196,122,40,182,204,98,
+    59,182,173,61,58,185,125,227,139,33,246,218,74,114,124,7,
+    15,45,187,201,189,149,39,88,124,211,172,61,28,231,33,210,
+    237,38,229,238,35,79,176,252,166,89,157,224,185,129,131,53,
+    151,196,79,213,56,32,59,254,232,189,169,187,63,102,21,95,
+    185,163,53,119,189,193,70,122,60,248,4,164,212,187,117,240,
+    193,126,246,248,72,101,69,43,137,122,248,163,248,116,180,52,
+    187,117,242,193,203,236,241,209,77,86,180,18,96,29,199,167,
+    241,205,217,210,201,251,140,117,124,155,73,29,223,147,48,111,
+    250,63,34,228,227,148,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/memory/dramsim_3.py",
+    "gem5.components.memory.dramsim_3",
+    embedded_module_data,
+    3734,
+    8750);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,254 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,89,235,111,20,89,118,191,85,213,213,207,106,219,
+    221,118,251,1,54,46,227,221,129,198,208,102,192,192,64,120,
+    12,216,243,96,54,152,29,32,171,108,103,119,203,229,174,107,
+    187,161,31,222,91,101,24,91,141,22,69,72,219,172,156,104,
+    35,177,90,79,68,164,142,148,32,35,38,18,95,34,173,242,
+    105,63,228,15,112,163,138,232,148,132,132,20,77,36,190,149,
+    53,32,69,251,41,247,220,234,71,85,187,129,209,206,110,209,
+    28,223,190,143,115,207,235,254,206,185,213,255,131,92,143,88,
+    255,251,205,127,80,242,91,164,161,52,210,56,141,207,113,121,
+    62,205,115,208,22,114,66,222,151,246,229,197,180,152,247,167,
+    253,249,64,58,144,15,166,131,108,204,151,11,229,195,233,112,
+    62,146,142,228,165,180,148,143,166,163,180,95,212,252,185,174,
+    124,119,186,155,182,3,90,48,215,147,143,165,99,172,29,202,
+    197,243,189,233,94,214,14,231,250,242,137,116,34,223,159,238,
+    231,16,143,62,65,90,228,46,210,36,156,120,40,32,244,88,
+    104,8,152,30,8,33,45,174,117,97,31,30,28,106,138,173,
+    117,227,216,130,79,235,185,43,166,135,180,216,85,148,236,93,
+    219,43,127,122,225,210,17,57,143,243,69,178,42,235,171,186,
+    129,243,242,138,158,45,44,194,192,180,65,114,225,151,176,52,
+    201,89,66,174,184,152,20,173,224,229,101,35,91,44,168,57,
+    43,120,21,255,124,5,23,50,216,18,175,173,44,231,176,229,
+    187,182,186,76,191,252,85,129,142,39,125,86,232,188,166,145,
+    43,106,97,17,91,209,153,43,231,47,93,44,24,152,44,168,
+    116,126,160,206,219,242,253,176,72,140,151,130,179,65,168,120,
+    19,19,146,213,176,254,146,115,122,250,206,207,235,6,81,51,
+    198,37,38,223,85,38,30,237,239,161,235,149,35,135,15,31,
+    86,166,62,85,222,255,226,248,84,146,183,186,167,151,212,66,
+    1,231,176,230,76,182,36,197,32,171,74,166,88,160,92,141,
+    140,219,125,209,134,251,100,186,207,47,169,3,49,74,115,212,
+    137,188,198,165,133,16,162,166,139,106,2,53,157,232,50,157,
+    15,251,113,0,7,23,120,87,159,216,161,207,143,67,56,232,
+    250,30,104,251,30,212,248,5,169,140,22,56,45,116,55,154,
+    14,243,8,71,176,244,144,202,241,152,107,206,9,223,69,15,
+    233,223,199,205,85,233,104,199,121,145,29,243,186,58,206,11,
+    226,110,220,131,99,56,238,150,180,213,90,224,53,233,174,175,
+    141,83,111,25,125,193,165,251,104,144,116,89,189,159,102,23,
+    151,46,168,5,237,86,86,51,150,28,243,170,28,229,31,150,
+    233,115,109,41,171,203,153,156,170,235,50,254,194,192,5,77,
+    151,219,92,33,211,165,114,70,45,200,243,152,198,22,214,100,
+    163,40,103,8,86,13,12,65,38,207,171,180,143,177,242,134,
+    225,173,37,76,176,172,202,16,141,57,44,47,47,173,234,217,
+    140,154,147,51,14,119,153,186,214,80,179,5,93,54,110,21,
+    229,101,29,175,104,197,198,152,158,106,137,70,63,250,202,242,
+    114,177,190,113,67,134,91,89,99,73,54,150,112,35,206,153,
+    144,192,73,35,106,94,222,15,199,34,41,103,27,33,171,51,
+    126,203,152,52,118,112,54,152,181,250,96,186,210,156,167,48,
+    67,88,82,97,37,175,52,100,177,98,108,56,135,213,155,84,
+    19,69,207,174,209,163,194,168,164,210,19,162,228,213,229,101,
+    58,96,249,9,54,86,72,33,227,119,133,106,128,254,135,227,
+    241,77,137,146,223,112,191,69,6,215,26,244,186,172,226,26,
+    105,61,37,174,196,151,132,146,175,36,62,164,168,245,184,129,
+    92,136,67,134,232,154,197,27,174,93,31,242,116,38,223,248,
+    118,219,175,113,52,12,120,181,44,212,61,14,207,169,101,21,
+    236,212,73,251,83,212,238,88,134,19,223,178,159,108,80,104,
+    112,249,29,172,223,228,245,214,199,0,31,214,3,3,60,78,
+    138,185,28,38,169,118,65,220,6,119,4,160,61,243,212,95,
+    197,133,102,80,80,94,170,33,23,48,166,33,202,34,225,237,
+    18,232,217,252,74,142,10,171,237,216,12,156,119,74,110,0,
+    97,142,70,236,50,206,100,23,86,89,60,193,32,236,106,52,
+    140,208,146,122,159,222,121,71,8,3,76,207,143,190,76,77,
+    149,146,47,172,202,26,94,80,87,114,198,65,57,107,200,186,
+    161,18,67,151,169,232,135,89,144,178,35,166,26,157,89,117,
+    148,64,195,55,179,212,7,142,148,217,14,10,185,227,240,148,
+    60,131,23,178,5,172,179,245,13,209,234,131,178,158,89,194,
+    121,236,58,72,169,183,27,241,226,130,60,55,55,91,44,224,
+    185,57,166,12,117,102,93,55,231,56,206,205,185,247,158,155,
+    123,59,183,5,82,204,211,37,157,162,110,110,110,135,86,59,
+    142,157,87,53,247,176,199,102,212,237,70,246,208,183,8,207,
+    6,18,121,112,107,135,255,178,111,240,186,231,161,169,52,123,
+    83,205,225,130,1,86,97,150,55,138,78,164,81,38,41,156,
+    58,40,31,159,106,105,56,75,243,171,72,97,13,19,43,168,
+    80,83,100,13,69,33,189,244,180,90,2,85,43,25,164,0,
+    131,115,11,164,159,246,144,1,32,131,64,0,243,201,46,152,
+    21,85,60,8,21,82,28,35,42,138,30,164,195,245,77,238,
+    252,97,191,78,50,147,203,171,198,82,177,48,185,136,243,199,
+    38,51,197,252,50,117,102,193,208,39,29,165,39,151,230,243,
+    169,229,85,178,135,46,91,27,238,144,40,82,13,241,206,209,
+    25,250,71,148,252,223,29,244,58,133,66,93,247,2,235,129,
+    103,193,193,167,193,193,154,36,215,36,74,71,106,82,15,109,
+    108,71,252,161,240,43,68,137,13,228,117,15,26,250,126,229,
+    39,255,126,180,58,120,194,28,60,81,142,194,191,111,0,154,
+    50,110,200,243,53,160,242,127,145,147,213,89,150,229,238,6,
+    221,144,121,15,93,111,126,243,102,201,153,54,56,189,135,148,
+    38,4,50,78,252,119,224,212,44,204,24,39,225,59,112,242,
+    53,218,26,162,160,236,155,245,152,0,16,29,130,224,155,143,
+    145,147,45,22,81,9,253,116,228,54,119,143,175,160,78,207,
+    61,190,181,245,87,109,155,255,3,191,190,231,42,122,196,37,
+    57,22,50,143,120,43,162,176,131,231,164,184,168,226,62,184,
+    143,4,139,79,29,182,56,133,200,116,174,14,250,210,248,33,
+    227,244,239,31,194,167,115,89,221,128,200,57,187,118,177,99,
+    132,56,73,65,161,17,213,58,213,186,226,66,251,211,185,34,
+    205,252,250,217,84,139,213,60,236,115,6,177,112,178,145,208,
+    31,110,145,23,61,49,91,64,209,216,51,105,248,169,52,188,
+    249,61,243,192,233,45,105,184,42,157,49,165,51,182,224,153,
+    74,190,135,218,194,232,207,96,67,178,143,54,201,126,32,19,
+    237,214,33,41,74,254,132,102,89,240,154,101,48,220,34,239,
+    48,139,123,234,78,179,4,26,102,153,115,155,229,192,109,206,
+    19,201,46,83,148,184,33,119,63,223,169,95,67,95,113,222,
+    139,11,53,216,4,20,27,215,146,130,229,131,104,179,252,44,
+    230,142,208,66,43,171,171,243,57,172,232,42,133,19,90,216,
+    47,225,204,141,164,64,34,116,149,37,178,200,180,2,78,128,
+    30,161,221,7,161,155,203,238,12,199,63,181,193,111,192,6,
+    151,27,6,15,12,133,93,68,66,177,248,235,8,138,246,213,
+    18,67,247,211,21,238,254,79,107,3,187,239,151,42,231,239,
+    255,162,246,253,164,29,240,69,187,182,17,37,175,128,216,130,
+    103,49,115,1,189,111,137,4,110,80,100,12,68,159,2,114,
+    12,52,11,130,140,25,90,182,210,211,201,84,4,187,207,49,
+    5,173,177,119,234,177,118,236,143,82,31,92,175,111,214,85,
+    245,121,206,17,35,95,39,118,109,76,153,187,15,85,19,41,
+    51,145,178,69,218,181,13,253,175,128,148,125,235,97,59,232,
+    137,50,70,118,44,26,132,69,131,176,104,16,22,73,118,216,
+    107,84,32,175,37,212,191,219,189,44,74,59,183,97,228,21,
+    16,186,140,37,137,157,97,12,217,141,37,9,73,128,155,123,
+    9,93,111,5,35,119,131,5,41,153,42,185,0,185,21,184,
+    215,155,65,234,25,247,237,28,95,163,24,66,15,70,164,181,
+    109,137,166,143,182,170,154,47,164,60,187,11,55,17,233,247,
+    172,65,215,155,53,121,135,213,221,70,119,107,174,230,243,226,
+    206,223,114,109,156,130,111,228,36,44,162,219,62,163,183,53,
+    219,72,184,86,10,94,190,237,233,137,2,128,88,242,85,92,
+    123,185,100,18,61,156,196,18,191,182,131,195,154,208,222,195,
+    161,245,9,202,81,234,200,209,175,5,188,210,211,91,204,110,
+    143,158,93,111,148,244,239,126,194,195,93,230,118,192,24,245,
+    172,232,105,180,175,199,58,245,86,226,157,36,241,166,101,122,
+    187,242,107,34,232,162,249,215,40,80,126,21,124,72,163,226,
+    113,51,50,74,129,235,77,251,42,161,70,235,207,42,135,248,
+    6,57,250,118,202,177,254,247,172,148,8,205,90,225,43,197,
+    43,234,5,117,122,105,186,248,18,76,156,228,155,93,197,233,
+    37,104,79,215,39,172,93,186,92,200,177,235,142,190,227,138,
+    64,239,38,244,218,206,174,220,132,22,249,167,228,22,215,131,
+    114,139,29,180,27,236,8,132,50,129,45,95,126,72,201,35,
+    168,109,225,210,195,10,86,75,204,171,250,13,221,10,83,76,
+    202,221,188,164,26,153,165,100,130,28,128,21,73,24,78,56,
+    183,27,133,20,111,205,175,44,44,96,226,220,176,69,90,77,
+    175,96,171,199,25,213,21,90,42,43,20,74,111,16,56,166,
+    180,148,97,220,156,169,225,31,193,212,143,8,41,18,7,103,
+    79,0,1,247,88,126,170,19,189,111,89,254,108,65,199,196,
+    176,66,152,214,205,152,80,152,36,31,192,36,176,162,21,102,
+    144,233,224,244,121,212,168,179,223,7,114,4,204,24,100,16,
+    109,117,181,73,24,117,68,200,21,111,41,243,89,163,174,31,
+    52,105,61,14,42,43,144,99,44,62,59,79,142,195,114,31,
+    192,189,187,60,151,29,184,79,40,205,139,12,86,234,190,192,
+    250,90,178,35,196,119,154,106,80,46,250,63,211,179,114,7,
+    189,136,116,155,145,145,202,240,211,200,161,173,200,161,23,61,
+    125,102,143,108,246,28,55,123,78,215,226,253,102,124,175,25,
+    63,106,198,79,110,11,92,236,20,148,18,187,95,7,209,136,
+    92,233,122,194,85,135,143,152,195,71,202,151,202,151,106,209,
+    152,25,29,221,26,63,183,21,133,207,243,225,209,138,207,148,
+    15,63,25,171,14,79,153,195,83,48,229,235,248,176,205,115,
+    177,99,219,130,208,75,115,31,37,52,19,68,187,94,135,81,
+    255,208,70,159,57,52,177,249,121,53,49,105,38,38,203,225,
+    90,95,127,57,244,117,124,224,159,132,141,207,190,236,126,208,
+    93,141,239,55,227,251,109,196,133,254,130,145,242,133,154,148,
+    112,10,154,141,207,255,117,188,50,191,121,166,250,222,7,213,
+    189,39,205,189,39,171,35,39,171,210,41,83,58,181,197,62,
+    182,31,133,226,206,125,99,35,182,241,113,53,56,110,6,199,
+    183,130,227,207,7,228,74,223,191,140,84,7,38,205,129,73,
+    27,73,161,46,70,238,125,82,62,95,54,158,239,217,87,235,
+    223,117,191,104,246,79,64,14,87,158,37,146,79,19,201,106,
+    98,194,76,76,212,250,71,107,195,35,149,216,151,31,87,212,
+    47,79,219,33,113,148,102,115,74,94,1,41,207,172,95,92,
+    191,76,243,212,216,129,111,207,96,12,24,140,1,131,49,96,
+    240,3,83,26,217,146,70,236,238,134,76,59,243,25,32,47,
+    203,103,136,158,158,95,138,222,247,67,238,60,165,113,109,184,
+    207,81,220,231,221,239,128,140,128,107,37,247,14,220,63,115,
+    91,40,241,21,31,234,240,104,188,135,147,208,38,81,115,199,
+    118,137,190,101,118,56,187,136,126,37,122,228,142,182,218,148,
+    127,115,239,119,104,112,241,182,239,158,216,89,3,35,214,106,
+    83,142,77,164,188,30,238,212,219,57,251,181,33,51,95,242,
+    125,37,120,209,120,135,102,159,149,69,122,57,244,209,203,97,
+    171,66,126,139,70,237,151,67,138,225,226,44,57,77,91,14,
+    156,126,136,58,92,144,89,9,15,101,100,179,132,239,99,121,
+    145,187,205,223,19,220,165,121,137,111,213,38,11,60,45,203,
+    19,244,46,8,239,228,125,0,235,73,31,43,176,25,48,145,
+    43,8,0,149,221,6,25,6,234,58,236,36,123,11,238,142,
+    21,231,34,54,24,116,2,75,189,83,113,13,218,233,80,240,
+    178,226,154,239,9,183,200,127,31,60,186,121,126,211,40,255,
+    205,70,108,253,103,27,215,30,252,120,75,218,103,11,158,41,
+    78,9,29,101,136,223,6,236,228,34,144,79,64,114,33,135,
+    11,45,48,39,127,9,164,133,226,63,0,22,126,6,224,4,
+    170,124,242,67,32,159,55,149,255,107,144,208,143,234,160,252,
+    161,3,201,81,143,98,107,99,239,212,253,31,129,203,32,199,
+    244,252,58,49,248,173,65,240,99,206,161,59,96,240,223,142,
+    110,26,230,228,185,223,199,170,19,211,230,196,116,245,189,233,
+    234,222,25,115,239,76,117,100,166,42,125,100,74,31,109,177,
+    79,173,127,176,28,121,30,235,255,141,190,49,245,224,76,117,
+    32,105,14,36,171,177,3,102,236,128,141,130,0,58,148,148,
+    207,215,164,129,103,210,158,167,210,158,231,61,67,181,93,123,
+    30,76,154,187,38,107,67,35,15,70,159,13,29,122,58,116,
+    168,58,52,105,14,77,214,118,141,215,70,101,10,98,177,56,
+    5,177,88,252,21,144,109,33,0,183,27,74,236,22,233,241,
+    56,137,145,231,39,62,252,125,223,127,142,84,79,92,54,79,
+    92,102,94,220,134,238,87,245,9,161,186,43,249,217,217,100,
+    2,94,120,21,212,60,86,20,154,120,149,124,81,91,201,65,
+    91,82,148,159,175,168,185,250,72,64,81,180,98,70,81,8,
+    28,30,2,231,150,4,27,190,183,4,221,32,4,98,148,189,
+    181,34,80,51,18,40,175,200,73,32,87,129,0,190,16,127,
+    51,40,160,28,37,105,230,218,250,155,178,12,206,229,20,133,
+    222,190,246,162,250,237,203,241,61,73,52,8,196,154,126,210,
+    241,105,227,159,205,139,98,208,70,64,6,209,232,120,237,189,
+    3,118,116,84,252,192,70,148,188,216,179,183,114,198,220,243,
+    190,45,66,143,31,13,12,111,76,87,122,55,62,189,95,180,
+    3,208,19,68,195,99,149,222,74,166,50,248,224,156,29,130,
+    158,48,234,30,248,181,190,158,183,35,240,77,66,3,163,27,
+    250,253,188,195,177,11,133,187,236,238,6,239,142,228,2,135,
+    252,221,119,126,92,254,69,85,28,53,197,81,155,143,137,212,
+    216,148,108,11,200,47,55,123,222,107,155,53,46,82,63,82,
+    210,154,5,61,159,181,51,139,139,225,141,47,54,197,205,236,
+    239,250,54,139,230,254,179,230,232,57,27,197,97,135,6,105,
+    49,240,116,183,8,115,58,179,165,229,155,250,36,123,193,57,
+    145,187,219,113,13,220,196,114,32,20,91,222,12,104,240,173,
+    54,252,66,91,66,237,40,204,94,162,189,132,216,120,121,135,
+    146,71,28,219,36,201,59,126,132,68,64,112,195,195,245,130,
+    43,4,191,13,93,53,212,204,13,2,111,91,158,192,240,48,
+    130,242,233,181,31,73,163,255,53,58,249,36,246,100,250,119,
+    218,86,100,186,26,153,54,35,211,91,190,105,166,202,44,13,
+    23,21,184,239,34,63,99,74,229,85,99,201,169,71,253,198,
+    42,212,206,78,84,182,130,47,208,8,92,43,156,63,150,42,
+    206,95,199,25,67,119,66,146,197,116,164,17,156,86,215,138,
+    145,205,233,169,198,79,168,44,168,173,126,181,254,251,169,226,
+    188,172,85,156,55,212,4,110,21,86,175,247,45,186,158,90,
+    154,207,51,133,45,191,51,219,57,19,189,205,160,86,128,128,
+    198,228,71,64,152,115,216,11,190,224,105,231,20,158,37,5,
+    4,153,140,218,227,54,165,182,192,113,156,125,156,227,124,20,
+    164,40,241,35,46,177,133,250,220,31,155,247,115,188,141,190,
+    43,233,17,161,245,199,145,46,196,237,223,66,251,220,159,26,
+    250,96,203,251,169,161,247,183,188,31,155,23,128,195,187,137,
+    116,147,227,104,56,119,166,27,147,219,236,239,43,247,136,33,
+    160,221,99,182,32,112,51,28,176,152,225,106,225,248,175,143,
+    174,31,114,186,94,136,67,182,216,26,123,19,101,238,249,127,
+    130,55,138,148,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/memory/hbm.py",
+    "gem5.components.memory.hbm",
+    embedded_module_data,
+    3668,
+    8373);
+
+} // anonymous namespace
+} // namespace gem5
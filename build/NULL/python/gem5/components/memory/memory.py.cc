@@ -0,0 +1,307 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,58,91,108,27,87,118,119,94,228,136,226,67,239,
+    247,99,244,112,108,218,50,101,59,138,179,149,45,57,126,100,
+    29,39,182,156,198,105,218,16,27,140,104,206,72,162,195,135,
+    118,102,228,7,161,236,186,69,138,210,128,23,240,2,14,42,
+    116,189,40,219,186,169,210,228,195,40,118,11,163,216,2,253,
+    92,244,139,20,6,48,49,128,0,1,69,62,242,71,35,9,
+    16,236,87,207,185,195,199,12,73,185,217,118,59,30,157,185,
+    143,115,207,189,247,220,243,186,135,254,47,226,120,132,202,247,
+    235,79,1,252,53,81,72,148,40,140,194,38,153,20,27,101,
+    25,44,115,73,46,197,71,249,148,16,21,82,158,168,39,229,
+    141,122,83,98,84,76,181,69,219,104,63,159,244,165,218,163,
+    237,41,127,212,159,10,68,3,169,96,52,72,219,133,100,40,
+    213,17,237,128,178,71,241,38,59,83,93,209,46,40,139,74,
+    91,178,59,213,19,237,129,178,79,105,79,246,166,250,162,125,
+    80,246,127,76,162,253,74,0,224,0,75,46,18,37,248,49,
+    81,66,106,223,167,28,33,159,115,213,197,70,7,149,142,107,
+    36,220,153,157,145,206,175,197,210,105,53,169,42,210,228,170,
+    154,86,181,68,124,82,186,112,225,29,41,165,166,50,218,29,
+    41,158,73,27,90,38,153,84,53,221,247,21,14,13,51,22,
+    151,204,172,134,61,22,127,57,161,27,150,120,117,221,72,100,
+    210,177,164,37,94,83,127,188,161,166,227,170,37,188,187,177,
+    158,84,45,254,221,59,235,80,249,147,52,244,135,121,171,237,
+    172,162,104,239,196,210,171,170,21,184,240,206,217,43,151,210,
+    134,170,173,196,0,223,123,69,77,157,55,180,164,197,191,157,
+    209,12,152,193,111,100,174,208,249,175,37,178,234,87,156,61,
+    109,91,230,166,170,105,9,69,213,191,98,237,150,192,217,235,
+    186,161,197,226,198,185,76,76,83,190,98,236,214,158,106,107,
+    133,196,29,221,80,83,113,214,113,86,94,248,67,162,95,47,
+    209,179,106,35,44,217,100,54,201,167,64,224,115,166,138,116,
+    141,76,17,134,24,76,125,152,2,56,191,32,10,187,201,252,
+    130,252,146,119,99,255,5,115,155,123,159,220,98,194,220,82,
+    182,235,124,102,35,169,72,233,140,129,236,131,69,27,82,150,
+    151,140,140,132,155,120,253,118,92,165,28,11,179,22,119,19,
+    216,198,197,147,186,142,171,147,164,223,29,209,181,248,236,250,
+    29,99,45,147,158,93,85,83,175,204,198,51,169,245,76,90,
+    77,27,250,172,125,32,149,79,100,253,142,229,151,13,237,142,
+    92,153,65,27,2,10,175,192,159,126,26,192,93,82,102,57,
+    97,161,20,234,202,233,15,94,190,119,251,254,237,92,232,187,
+    50,203,8,11,187,193,254,194,192,169,237,107,0,224,125,18,
+    183,191,197,224,105,51,120,186,32,158,254,238,187,239,116,17,
+    183,227,11,144,159,245,79,115,113,199,246,137,167,202,182,247,
+    40,219,156,172,49,184,122,121,19,24,245,41,108,232,243,26,
+    203,221,172,250,136,1,70,50,89,17,49,63,164,227,52,86,
+    97,175,17,133,3,145,228,151,180,78,104,249,225,187,200,158,
+    4,200,30,61,124,40,167,55,82,150,23,4,79,134,66,133,
+    93,218,32,124,44,175,156,208,223,206,220,58,161,141,67,13,
+    55,175,31,163,28,216,13,118,126,50,245,32,190,117,252,231,
+    71,30,30,41,6,199,204,224,216,221,139,37,175,152,59,248,
+    231,217,7,215,118,188,3,5,239,64,41,212,147,219,216,11,
+    117,231,140,175,113,29,113,167,66,7,170,10,253,91,88,249,
+    95,193,126,85,18,101,64,173,89,133,137,114,109,32,52,74,
+    175,194,169,188,42,12,214,5,132,87,61,170,87,21,87,88,
+    71,155,208,162,205,163,182,169,162,163,238,109,168,139,10,187,
+    226,207,145,21,70,105,251,56,16,245,41,62,80,231,118,160,
+    238,85,218,85,65,17,85,239,138,7,20,157,143,250,169,162,
+    7,88,162,6,213,144,155,203,74,80,237,160,116,120,37,244,
+    49,143,70,233,243,26,253,104,103,203,17,162,218,165,118,171,
+    61,106,175,115,173,245,210,10,171,116,52,81,234,219,135,82,
+    191,58,224,26,217,217,52,114,112,159,145,94,192,238,106,194,
+    30,106,137,221,13,243,244,52,240,141,87,122,154,70,15,231,
+    200,109,38,58,2,242,213,103,133,106,22,207,182,15,217,127,
+    56,43,197,147,49,93,71,13,77,164,192,112,165,64,223,164,
+    212,70,210,72,28,141,219,184,85,107,168,83,91,226,243,73,
+    240,188,187,150,208,43,3,227,177,180,100,196,62,84,165,152,
+    132,134,77,170,89,54,41,166,67,219,122,76,139,165,84,104,
+    194,25,82,25,5,232,197,108,250,148,80,117,14,180,186,116,
+    184,107,178,8,197,89,178,122,20,32,34,39,170,148,101,58,
+    179,229,7,109,144,43,4,116,171,147,118,39,213,216,205,68,
+    122,85,214,193,118,90,60,133,254,24,152,94,57,21,91,95,
+    135,14,203,163,169,198,134,150,142,123,72,253,225,73,69,183,
+    231,64,183,62,97,220,218,189,201,26,14,243,233,214,237,143,
+    88,23,38,247,2,76,110,147,215,122,93,216,188,193,239,139,
+    205,111,10,13,216,194,11,176,5,195,235,232,115,157,126,222,
+    49,106,63,28,134,58,0,185,234,196,97,199,80,171,241,199,
+    8,57,119,232,150,65,61,100,116,214,123,193,242,53,184,133,
+    77,14,40,181,213,247,160,137,155,2,180,248,170,45,233,190,
+    77,114,163,54,239,141,246,90,201,95,27,227,192,166,28,28,
+    118,172,166,193,13,1,110,176,70,89,218,36,121,199,202,29,
+    163,88,231,156,110,78,58,41,192,248,142,86,227,27,121,135,
+    214,59,204,197,114,32,64,84,90,241,153,167,82,47,181,146,
+    218,121,208,29,213,22,245,90,143,100,64,172,128,250,17,215,
+    212,152,161,74,183,18,198,90,141,214,11,31,3,245,176,41,
+    90,137,52,46,196,169,40,246,2,160,229,58,232,100,102,165,
+    170,129,96,1,214,98,134,148,86,85,133,26,131,235,234,139,
+    87,160,39,64,137,97,177,74,211,100,168,116,243,82,53,50,
+    74,130,46,175,171,241,196,202,29,152,64,165,157,56,171,81,
+    101,66,125,213,7,245,214,51,162,250,170,96,104,244,117,96,
+    85,68,58,119,71,82,212,149,24,88,144,25,41,97,72,186,
+    17,211,12,48,52,134,116,76,138,165,21,73,77,43,88,107,
+    77,170,229,10,20,245,102,2,206,192,94,101,162,197,134,156,
+    246,99,94,186,160,174,36,210,170,78,199,87,151,86,233,148,
+    244,248,26,24,80,155,125,210,134,238,164,213,242,185,180,34,
+    45,47,47,65,140,179,188,76,55,3,135,89,217,27,132,164,
+    64,101,121,217,57,247,242,178,180,162,101,82,47,38,185,188,
+    220,74,234,150,151,155,118,213,100,46,221,91,115,118,187,120,
+    102,251,134,239,33,158,45,221,71,211,249,37,246,57,117,215,
+    3,177,117,2,194,69,116,77,192,21,202,121,35,99,75,26,
+    16,137,168,145,25,233,228,92,125,135,217,89,219,187,181,216,
+    132,190,70,195,211,235,232,174,214,51,183,108,21,56,177,20,
+    238,164,49,164,54,2,192,226,32,130,182,4,125,99,93,213,
+    44,81,6,86,38,12,89,182,218,101,202,88,219,245,4,100,
+    167,74,209,232,203,242,189,23,75,110,168,175,107,90,70,3,
+    100,152,58,121,211,118,67,1,217,121,138,218,65,68,22,110,
+    34,178,22,164,101,27,45,40,175,170,134,61,9,173,79,200,
+    182,57,144,129,129,245,243,212,229,186,198,132,189,224,226,212,
+    228,138,54,133,107,159,70,112,0,193,75,8,232,52,109,178,
+    189,96,89,214,209,69,216,236,185,75,99,71,109,6,64,118,
+    160,33,32,136,84,247,251,22,244,234,221,96,91,191,187,75,
+    190,141,144,129,233,252,229,95,79,21,251,79,154,253,39,115,
+    254,221,145,67,133,240,252,191,159,47,142,188,102,142,188,86,
+    16,7,247,218,67,101,194,180,29,217,237,30,207,243,255,24,
+    47,118,31,54,187,15,231,46,236,181,247,99,243,169,221,225,
+    131,219,254,95,199,139,195,243,230,240,124,238,242,151,98,224,
+    158,247,190,247,153,56,176,35,14,20,197,33,83,28,42,136,
+    67,165,225,217,28,111,138,3,165,209,48,126,135,190,12,245,
+    21,250,15,21,67,97,51,20,70,42,111,51,187,93,35,133,
+    209,165,98,215,85,179,235,106,193,127,181,52,60,67,7,208,
+    89,184,182,215,153,210,196,209,220,5,211,63,86,240,143,237,
+    77,28,48,39,142,155,19,139,230,196,5,218,70,87,200,181,
+    93,97,118,7,15,228,149,226,224,17,115,240,72,238,194,253,
+    55,115,111,238,13,142,62,27,156,217,25,156,217,254,209,211,
+    57,243,212,91,197,193,203,230,224,101,236,219,19,253,207,196,
+    200,142,24,41,138,199,76,241,88,161,250,106,18,48,199,117,
+    59,168,69,16,143,136,29,47,211,248,149,249,88,116,250,240,
+    123,228,70,173,230,246,92,23,26,188,202,61,34,215,124,18,
+    165,196,254,31,40,213,110,39,10,65,79,181,228,90,56,58,
+    194,110,92,248,15,137,29,250,172,130,227,251,96,244,35,230,
+    30,155,39,173,158,123,108,125,234,47,26,38,255,57,123,127,
+    12,166,96,194,12,149,190,48,171,29,133,143,118,28,203,156,
+    197,70,142,89,140,172,157,132,154,142,107,170,10,226,239,124,
+    167,147,112,153,198,219,222,98,246,245,38,121,252,159,148,32,
+    114,58,153,137,199,146,250,98,164,78,230,46,206,177,64,168,
+    240,194,169,247,249,234,96,175,163,179,204,145,64,231,51,255,
+    200,142,127,100,123,218,60,124,186,224,31,41,250,23,76,255,
+    66,153,115,161,54,31,179,103,63,110,185,14,199,193,161,77,
+    166,30,160,239,207,45,139,71,173,7,118,97,216,3,230,128,
+    214,56,109,30,107,76,162,153,99,26,222,244,254,64,172,250,
+    75,36,254,106,149,85,236,160,175,14,74,51,71,127,118,113,
+    171,231,209,80,254,236,163,209,130,255,96,209,127,208,244,31,
+    44,115,46,36,202,164,48,111,9,26,38,55,180,8,46,239,
+    12,46,92,196,101,196,13,45,249,25,99,239,0,55,190,108,
+    175,31,239,234,217,227,191,247,250,127,138,100,126,92,89,43,
+    235,58,43,10,190,236,29,218,154,51,135,143,22,123,35,102,
+    111,164,44,64,211,115,108,255,6,65,142,191,239,43,251,92,
+    107,167,96,247,248,201,39,134,249,234,165,226,241,55,205,227,
+    111,210,221,61,199,246,111,16,192,160,64,14,254,209,93,106,
+    139,40,15,142,203,62,85,121,170,246,239,18,76,10,64,24,
+    205,222,168,117,58,164,128,189,193,54,183,102,5,218,195,181,
+    238,193,191,107,228,51,102,9,120,219,110,135,40,212,45,104,
+    39,144,185,29,118,139,46,131,143,146,129,243,31,90,157,8,
+    237,122,197,45,129,4,33,223,109,191,176,88,151,33,59,117,
+    160,205,225,68,99,77,103,224,242,65,247,112,20,34,222,37,
+    165,208,112,201,223,97,250,71,76,255,100,41,216,101,6,167,
+    204,96,248,57,199,4,14,239,97,109,218,12,30,126,46,176,
+    129,35,207,57,190,3,24,203,183,181,80,159,182,42,187,254,
+    147,161,236,34,117,102,41,204,135,148,69,218,220,166,131,17,
+    14,182,213,216,228,234,231,155,251,145,113,160,144,181,187,4,
+    42,161,194,54,222,219,210,17,215,236,220,77,162,245,185,198,
+    144,27,181,27,80,139,209,33,231,173,72,105,74,135,53,80,
+    18,247,165,196,25,221,46,204,218,93,167,209,170,127,240,214,
+    143,88,188,23,194,93,175,223,53,162,118,83,186,17,104,213,
+    154,15,146,22,143,219,71,192,141,136,203,226,234,132,172,15,
+    243,51,112,107,227,191,240,126,10,251,255,188,198,131,77,225,
+    70,109,199,114,237,94,116,255,50,245,41,226,146,229,123,39,
+    243,78,236,92,236,252,218,249,12,205,97,133,217,90,83,230,
+    252,26,150,207,87,16,178,87,174,166,147,244,50,160,55,5,
+    208,16,185,107,16,163,109,172,175,103,52,8,129,231,165,58,
+    213,25,169,78,14,203,85,114,26,50,80,163,57,81,15,4,
+    109,120,27,160,241,143,229,167,17,216,27,137,213,181,115,9,
+    195,242,221,206,104,213,114,27,237,129,146,110,249,104,241,74,
+    204,136,175,65,8,136,142,138,186,44,171,183,162,113,90,230,
+    214,245,141,149,21,80,170,154,238,105,23,17,160,184,105,152,
+    107,211,102,17,160,217,179,218,84,8,10,85,13,76,152,118,
+    14,27,241,48,45,31,53,103,182,113,188,66,170,193,25,170,
+    163,118,150,46,154,42,169,21,116,207,100,5,236,248,49,153,
+    185,37,95,199,229,219,85,40,234,218,107,136,207,163,101,213,
+    241,120,236,152,206,78,7,246,202,181,136,87,149,43,188,85,
+    245,236,129,38,45,111,133,246,128,160,137,96,168,178,183,135,
+    204,246,209,252,200,78,251,209,66,251,209,189,142,30,179,67,
+    50,59,78,154,29,167,75,93,125,102,215,164,217,245,178,217,
+    245,71,160,253,157,243,232,76,135,191,21,201,168,148,15,62,
+    97,138,35,39,204,145,19,185,43,185,43,165,64,167,25,24,
+    47,76,157,41,4,240,221,29,129,192,208,148,142,61,153,40,
+    142,204,153,35,115,136,242,101,215,72,153,101,58,95,121,206,
+    113,221,65,176,209,221,65,176,226,129,224,183,62,210,55,184,
+    213,3,241,217,246,31,23,123,103,205,222,217,156,111,183,95,
+    202,247,60,30,45,246,207,154,253,179,101,34,182,5,41,184,
+    119,49,119,54,103,236,142,29,44,245,13,61,204,152,125,71,
+    74,189,131,15,229,103,189,225,157,222,112,177,247,136,217,123,
+    164,52,122,120,59,90,28,125,245,233,68,113,244,84,105,120,
+    164,52,52,13,176,28,240,142,7,159,19,0,223,32,128,88,
+    239,210,253,171,185,171,101,174,74,152,218,46,75,184,142,169,
+    117,87,246,188,150,6,254,23,210,104,194,92,105,96,38,239,
+    28,181,143,226,185,149,252,67,10,181,25,103,50,7,147,197,
+    223,135,18,205,204,59,214,210,42,71,95,9,255,178,241,125,
+    47,71,152,202,195,196,61,220,142,244,84,12,61,46,38,5,
+    210,18,101,195,65,76,245,193,253,86,74,194,29,145,226,71,
+    124,231,90,119,204,75,217,105,223,140,157,36,180,111,127,128,
+    211,52,221,188,20,230,109,21,162,183,174,110,244,60,148,144,
+    140,132,108,133,67,229,130,184,136,250,177,40,202,167,51,249,
+    221,149,72,199,51,26,152,138,74,208,128,249,204,201,70,81,
+    111,198,249,103,164,147,38,40,231,123,40,231,195,191,140,231,
+    15,60,155,60,181,51,121,170,56,185,96,78,46,20,199,22,
+    205,177,197,157,246,197,66,251,226,46,202,40,215,57,179,215,
+    61,240,172,123,102,167,123,166,216,29,49,187,49,182,232,156,
+    1,105,5,224,33,67,99,230,96,184,236,173,182,60,231,4,
+    20,103,1,197,89,8,4,65,65,252,103,128,82,179,59,100,
+    171,178,52,77,101,9,174,11,46,121,106,12,229,225,244,216,
+    165,166,91,7,13,71,231,40,1,26,140,246,126,4,34,211,
+    50,8,97,234,222,116,133,133,224,179,15,194,11,16,136,186,
+    45,178,120,52,187,159,177,52,240,212,254,172,129,221,118,208,
+    217,20,180,225,169,161,133,195,161,122,171,0,243,95,145,206,
+    20,101,119,33,116,209,126,159,244,60,232,121,56,248,112,60,
+    63,253,56,92,232,152,169,181,83,30,65,188,72,205,231,121,
+    82,9,26,43,199,29,112,77,149,29,125,225,74,126,133,131,
+    7,236,67,166,164,159,246,252,102,20,62,197,208,69,19,234,
+    226,197,255,135,227,224,170,199,209,85,63,14,30,143,3,152,
+    45,92,35,218,50,238,138,130,235,45,121,59,191,207,142,50,
+    246,47,93,213,159,34,91,49,249,223,234,219,45,132,102,237,
+    119,171,231,1,95,171,216,1,108,188,21,95,251,90,79,147,
+    125,233,251,45,231,169,147,211,56,21,26,106,248,20,67,179,
+    38,212,197,217,102,78,51,85,78,119,144,70,35,10,108,122,
+    157,224,47,153,218,203,173,214,42,226,26,208,50,52,39,46,
+    170,61,191,193,33,190,202,122,186,239,103,11,226,160,109,205,
+    61,212,9,235,173,205,249,36,211,248,171,222,102,67,54,27,
+    34,84,106,224,245,41,140,39,235,215,186,188,115,103,181,167,
+    33,194,114,68,178,149,95,253,94,117,153,121,206,16,29,181,
+    223,147,58,24,127,222,57,67,43,227,239,94,179,43,219,79,
+    242,206,223,66,246,153,131,129,232,16,36,222,147,253,96,73,
+    181,115,147,16,55,84,35,53,105,37,163,129,227,72,31,69,
+    177,72,172,110,100,54,116,172,74,248,155,117,178,146,26,181,
+    153,15,94,160,150,165,195,52,222,202,134,177,161,169,245,204,
+    93,61,154,203,38,174,96,162,177,49,139,88,23,60,73,195,
+    172,32,132,46,82,12,220,73,122,53,169,218,115,72,183,214,
+    18,241,53,136,40,33,166,171,228,50,107,62,200,246,90,152,
+    255,182,81,43,206,170,215,231,118,85,118,243,82,216,107,113,
+    73,53,109,71,108,84,28,251,72,197,84,106,120,225,211,222,
+    39,117,239,132,34,236,242,78,29,122,93,93,232,108,89,169,
+    81,100,27,49,254,3,105,124,66,80,116,33,8,242,135,114,
+    55,239,157,186,127,106,107,98,167,125,184,208,62,188,117,51,
+    31,123,116,231,111,127,242,55,63,41,142,207,154,227,179,79,
+    230,126,53,191,51,190,80,24,95,216,237,26,70,39,53,247,
+    229,212,161,237,206,199,63,248,167,133,191,95,248,187,51,143,
+    207,160,147,154,67,151,52,7,78,234,208,204,227,44,250,40,
+    187,161,209,71,249,201,240,68,190,243,81,24,238,187,161,18,
+    102,189,38,119,196,201,162,56,109,138,211,133,234,107,223,244,
+    217,165,165,240,40,166,69,211,177,148,42,203,16,223,202,169,
+    140,178,145,196,178,95,150,127,188,17,75,86,122,188,178,172,
+    100,226,178,172,161,104,107,120,35,210,240,2,72,189,189,118,
+    24,1,202,32,77,67,210,132,0,189,145,82,158,106,104,23,
+    180,30,4,104,74,181,15,16,160,144,106,168,51,52,174,214,
+    240,182,163,41,8,208,11,210,204,137,182,138,32,129,32,133,
+    39,16,168,36,63,227,106,50,41,203,96,82,48,205,65,173,
+    201,107,182,213,157,172,130,11,216,49,204,210,196,66,245,95,
+    153,229,5,17,46,178,0,250,200,248,84,233,165,195,229,192,
+    9,225,120,153,0,216,27,155,204,47,152,99,199,203,2,182,
+    120,72,255,200,214,249,124,247,214,27,15,51,101,47,182,136,
+    100,100,34,223,157,143,231,7,30,157,41,183,97,139,143,132,
+    250,31,232,247,83,229,118,172,249,73,255,248,150,254,48,101,
+    83,12,18,95,176,28,170,210,110,9,214,24,81,128,91,117,
+    13,244,8,130,111,251,101,56,59,193,247,36,69,63,191,229,
+    232,167,17,4,7,4,56,226,26,152,35,158,208,221,247,11,
+    161,169,162,48,109,10,211,101,214,43,4,183,3,101,2,159,
+    167,211,244,83,7,207,57,226,57,80,69,42,119,53,142,100,
+    132,55,152,173,219,219,194,118,226,105,207,118,198,60,180,104,
+    142,159,41,19,108,117,194,58,17,218,230,105,166,114,108,155,
+    223,254,211,47,2,136,126,172,14,156,227,142,181,26,54,180,
+    53,133,136,67,117,224,28,50,212,60,196,47,28,200,27,219,
+    151,30,255,180,76,160,248,116,142,126,234,160,62,218,213,92,
+    7,182,7,69,105,89,10,15,105,152,133,178,120,48,50,107,
+    244,42,104,121,140,59,52,185,207,215,228,186,46,175,98,85,
+    244,45,95,234,149,72,230,250,13,53,14,215,56,95,77,43,
+    252,85,121,182,66,208,191,97,36,146,145,234,127,108,161,191,
+    15,4,177,73,143,84,255,7,16,213,14,171,151,6,229,122,
+    36,86,249,255,62,50,173,83,125,177,250,106,141,21,235,98,
+    255,246,98,107,20,253,157,99,188,38,254,203,8,232,214,104,
+    46,86,60,109,107,243,162,150,37,182,163,214,223,3,88,230,
+    24,134,41,159,100,24,30,88,13,192,67,152,222,2,233,113,
+    190,32,38,12,11,130,243,7,3,93,2,150,254,119,192,79,
+    152,112,129,28,114,190,123,228,96,193,253,150,200,241,130,251,
+    45,145,31,20,220,111,217,195,51,11,96,5,170,32,40,48,
+    61,56,69,5,116,92,98,25,16,143,214,176,208,119,248,57,
+    45,124,179,15,2,229,251,127,3,13,79,57,33,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/memory/memory.py",
+    "gem5.components.memory.memory",
+    embedded_module_data,
+    4525,
+    10057);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,74 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,197,84,205,79,19,65,20,159,217,221,110,63,182,64,
+    129,170,33,37,113,141,49,177,49,210,79,9,177,88,68,136,
+    193,68,80,225,182,151,77,233,44,208,100,103,219,204,110,19,
+    74,60,120,240,232,193,155,39,175,6,162,7,142,254,25,75,
+    130,73,179,7,67,226,169,183,38,196,11,39,103,102,91,104,
+    249,146,139,178,153,190,157,121,191,157,247,222,239,247,102,250,
+    11,244,60,129,206,251,240,39,53,159,0,2,8,154,0,67,
+    13,66,128,4,36,154,2,22,53,145,207,37,83,194,1,45,
+    128,101,77,230,235,128,25,196,33,45,196,231,178,25,198,17,
+    45,194,231,65,83,193,81,45,202,231,33,115,0,15,106,131,
+    16,132,1,138,161,136,1,141,161,177,227,212,72,49,196,53,
+    9,69,223,7,180,216,37,248,0,197,135,47,193,7,41,62,
+    114,9,62,68,241,81,20,94,1,201,225,22,115,39,161,23,
+    122,85,115,42,85,171,100,182,160,239,136,207,174,218,14,41,
+    149,157,69,3,87,73,99,165,97,59,6,78,10,222,192,252,
+    252,114,78,207,76,166,211,250,212,230,84,103,153,205,228,114,
+    108,73,247,49,71,94,207,230,125,156,58,98,11,207,22,245,
+    76,154,174,243,11,122,102,115,50,207,124,47,95,159,132,201,
+    108,230,178,212,55,52,183,81,178,44,195,52,144,159,113,201,
+    147,236,202,150,225,201,196,112,234,196,42,195,158,22,201,244,
+    39,178,22,101,121,139,156,30,204,17,78,230,8,34,225,45,
+    248,38,126,145,0,248,42,117,189,148,182,180,245,60,162,210,
+    103,86,69,245,146,169,150,253,204,42,230,137,85,155,115,85,
+    235,118,197,90,87,251,232,170,171,37,219,64,234,252,139,197,
+    197,9,30,160,197,178,181,158,82,179,3,73,148,41,39,16,
+    133,190,8,171,144,12,83,99,179,218,212,163,172,77,202,169,
+    90,195,217,168,90,169,117,3,63,74,149,171,184,86,181,12,
+    203,177,83,126,218,20,174,155,78,69,239,212,50,81,107,120,
+    241,121,90,92,71,149,227,50,200,40,141,119,159,113,79,80,
+    243,14,252,142,130,104,226,243,147,237,59,219,203,187,200,85,
+    10,123,74,97,95,41,184,82,225,144,113,189,86,213,186,167,
+    226,140,106,100,136,169,19,235,74,212,213,44,216,175,25,25,
+    161,246,172,8,44,42,185,69,161,12,251,60,206,204,141,235,
+    101,122,114,220,175,202,52,116,5,166,126,84,194,46,239,227,
+    127,200,116,233,130,18,35,231,149,120,179,167,196,158,43,76,
+    216,81,156,99,223,142,3,126,38,101,122,38,127,36,30,108,
+    191,217,21,190,199,93,165,184,167,20,247,149,162,43,21,57,
+    129,36,92,74,198,61,217,105,212,168,128,68,228,129,75,157,
+    127,27,221,215,88,247,53,38,1,46,12,34,37,172,87,44,
+    199,32,107,165,178,97,79,32,68,114,254,13,11,94,132,231,
+    185,198,222,232,105,104,99,21,147,48,207,120,26,49,107,60,
+    44,227,237,201,126,21,92,9,79,164,149,241,91,199,79,29,
+    111,8,39,188,227,183,131,43,115,20,154,198,85,84,55,141,
+    34,185,71,151,76,50,187,74,109,91,132,16,182,39,1,28,
+    119,65,162,119,28,128,41,183,127,180,5,17,10,109,240,119,
+    19,2,48,237,130,84,239,104,130,140,219,63,154,32,239,246,
+    143,38,184,235,246,15,26,41,113,187,45,202,112,186,13,168,
+    105,70,70,62,230,62,60,228,142,131,192,88,59,208,5,122,
+    76,252,191,237,16,225,12,163,59,115,188,131,206,249,142,46,
+    112,158,225,13,249,3,228,110,193,126,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/memory/multi_channel.py",
+    "gem5.components.memory.multi_channel",
+    embedded_module_data,
+    794,
+    1997);
+
+} // anonymous namespace
+} // namespace gem5
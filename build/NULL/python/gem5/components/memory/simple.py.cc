@@ -0,0 +1,144 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,87,205,111,27,199,21,159,253,34,151,223,250,78,
+    76,69,213,214,82,42,51,21,200,26,149,237,90,249,104,93,
+    167,8,140,214,66,91,165,45,178,151,237,138,59,20,215,217,
+    15,101,118,105,91,132,154,26,129,129,42,133,143,41,98,20,
+    65,171,67,96,200,112,14,61,228,224,99,255,4,218,32,80,
+    99,129,2,1,138,28,124,163,97,7,40,130,28,250,102,150,
+    203,93,138,98,218,148,92,190,153,157,121,239,205,155,247,126,
+    239,205,240,95,40,241,145,250,237,211,247,128,124,136,12,164,
+    34,131,51,120,139,179,121,149,183,5,85,176,69,85,228,232,
+    152,96,73,118,74,77,217,105,53,109,203,170,108,103,212,12,
+    27,23,173,172,157,83,115,208,151,140,148,149,183,11,106,1,
+    250,105,67,182,138,118,73,45,65,63,99,100,173,9,123,82,
+    157,228,16,143,222,64,70,238,38,50,242,120,242,142,128,208,
+    61,33,50,68,157,50,10,155,168,82,108,151,55,77,123,199,
+    194,138,141,109,151,236,42,117,215,241,137,107,89,152,120,217,
+    199,148,177,34,4,226,207,76,207,15,228,77,252,78,11,59,
+    117,28,72,111,182,64,162,34,6,153,11,134,65,126,169,59,
+    219,56,72,95,198,246,69,159,88,129,248,115,151,248,65,62,
+    212,122,153,41,173,112,65,222,119,195,254,166,217,198,143,169,
+    21,48,152,113,175,98,66,76,3,123,143,249,112,164,112,97,
+    203,243,137,94,247,127,236,234,196,120,204,133,163,51,209,104,
+    95,197,174,231,99,187,158,116,171,28,185,245,215,32,242,7,
+    112,44,70,42,7,206,229,13,78,21,12,30,139,134,0,63,
+    17,126,18,22,27,242,62,106,112,70,234,102,94,149,120,132,
+    83,56,125,7,164,238,113,145,50,35,141,101,67,54,50,13,
+    209,200,222,20,239,192,200,189,193,66,106,230,88,9,25,103,
+    113,14,231,113,161,193,159,24,240,198,189,6,15,65,56,170,
+    169,56,70,83,9,79,12,73,230,71,36,39,199,72,78,1,
+    119,97,132,123,250,88,238,34,172,147,143,215,233,239,183,52,
+    34,61,179,143,174,115,234,44,64,101,34,56,177,105,58,219,
+    22,190,216,212,29,7,91,201,8,235,18,104,190,160,212,45,
+    221,243,20,223,85,216,148,141,29,95,241,152,136,82,15,101,
+    34,148,121,44,132,74,139,206,42,73,69,217,172,2,159,55,
+    155,166,23,41,211,223,198,158,98,233,62,32,111,119,53,234,
+    40,87,117,98,234,190,233,58,171,138,238,24,202,22,144,107,
+    166,225,55,217,27,96,184,97,110,183,8,246,152,54,61,90,
+    245,154,9,12,126,211,245,48,200,91,45,236,85,149,75,62,
+    112,183,44,208,128,193,26,108,40,13,151,40,158,223,50,76,
+    88,213,111,234,190,98,184,138,227,250,96,7,217,198,62,211,
+    23,237,161,181,213,223,6,0,216,220,118,170,108,50,72,247,
+    77,12,114,253,142,6,182,6,153,129,133,129,232,65,10,212,
+    37,20,127,104,159,166,196,211,191,0,249,19,247,33,242,185,
+    120,114,56,30,7,137,153,113,60,28,242,19,218,247,184,61,
+    126,79,248,132,27,78,255,61,164,13,250,126,38,193,45,14,
+    227,4,248,6,186,12,30,80,32,180,191,98,251,164,159,245,
+    29,157,232,118,20,147,117,8,27,86,116,72,105,125,27,43,
+    110,67,33,180,94,120,62,197,3,132,98,199,117,192,239,125,
+    222,234,24,29,212,87,161,30,22,96,40,54,223,84,209,192,
+    207,235,202,69,215,222,50,29,136,41,193,186,193,128,113,141,
+    152,62,142,89,70,132,105,100,214,21,90,162,232,178,126,51,
+    170,138,49,99,69,32,211,224,10,50,67,201,44,144,141,74,
+    42,144,188,214,14,38,129,172,105,166,99,250,154,70,168,67,
+    131,148,237,26,45,168,163,89,250,34,105,84,55,240,138,30,
+    182,26,71,116,144,57,202,146,209,52,6,121,77,243,82,240,
+    206,150,187,241,229,119,61,82,175,237,236,2,106,157,218,54,
+    182,207,212,234,174,13,30,128,212,242,106,161,113,53,143,229,
+    79,117,103,151,208,124,110,159,28,155,165,213,200,192,243,192,
+    231,93,6,242,239,27,232,139,41,148,41,190,159,190,149,254,
+    135,252,252,67,249,249,7,114,185,43,151,59,114,249,243,185,
+    147,143,102,230,15,231,255,158,233,9,252,115,217,39,8,200,
+    51,74,246,197,91,185,47,82,104,238,228,193,242,131,217,149,
+    238,236,10,12,100,247,225,251,20,177,157,110,209,210,29,164,
+    8,246,91,196,217,168,243,9,156,114,17,208,233,6,233,233,
+    183,137,238,114,27,119,81,133,39,47,80,63,40,212,46,158,
+    109,158,124,139,42,155,50,157,186,75,118,92,2,209,214,194,
+    237,182,87,199,239,111,148,251,18,213,152,6,114,3,125,38,
+    231,247,69,178,8,253,122,50,137,248,200,166,53,102,211,30,
+    186,50,152,186,146,72,131,196,232,96,71,13,126,155,219,68,
+    100,9,209,83,146,148,217,238,9,59,13,69,48,194,191,203,
+    177,93,121,84,75,127,63,5,168,33,212,50,141,206,123,237,
+    149,241,91,25,98,164,161,242,202,225,46,38,103,63,152,239,
+    78,158,60,120,253,227,159,118,151,215,58,19,103,58,165,179,
+    29,249,236,232,198,6,206,158,26,217,88,108,54,199,204,38,
+    149,35,118,206,245,151,7,75,180,196,141,160,253,189,255,106,
+    240,17,137,95,80,197,249,208,242,137,153,15,114,251,191,235,
+    200,47,124,141,173,19,35,182,198,150,206,31,103,169,76,215,
+    165,185,245,117,184,143,120,126,69,133,179,161,53,165,233,91,
+    237,142,124,130,217,2,104,165,97,243,134,192,42,68,54,125,
+    202,108,74,214,228,61,238,200,105,202,189,205,170,169,183,180,
+    7,151,185,248,84,253,95,170,245,94,2,80,161,22,82,242,
+    211,49,183,33,12,175,245,30,55,188,6,200,139,81,63,81,
+    171,193,111,21,113,131,148,168,62,170,191,253,219,254,61,239,
+    248,3,57,14,25,171,182,38,212,89,56,55,251,188,204,57,
+    202,181,166,89,111,42,182,238,215,155,236,108,140,138,227,138,
+    199,234,102,21,138,155,96,97,135,21,51,22,171,32,243,147,
+    235,117,188,67,79,233,16,101,43,52,142,253,84,175,161,35,
+    169,62,225,197,0,98,11,182,95,26,31,208,163,188,111,81,
+    109,42,11,236,231,185,226,254,213,247,95,190,245,242,237,111,
+    63,204,205,119,114,243,183,175,30,232,31,237,254,245,221,63,
+    191,251,96,177,214,93,172,253,109,237,211,245,135,139,175,118,
+    22,95,253,231,212,124,143,231,38,207,63,17,132,233,226,51,
+    4,164,135,132,66,177,39,163,133,165,131,211,31,93,162,149,
+    174,43,159,232,176,135,1,165,50,71,171,188,163,219,88,211,
+    130,172,166,133,37,30,250,121,77,123,167,165,91,253,153,180,
+    166,25,110,29,58,2,220,91,89,85,38,52,7,8,69,55,
+    41,82,242,34,37,52,110,132,134,140,208,122,72,232,37,150,
+    188,68,9,133,1,161,24,32,171,212,53,130,9,193,169,210,
+    215,239,211,215,66,255,160,168,99,203,210,52,72,140,5,212,
+    207,137,31,49,87,146,169,136,156,166,19,127,228,88,157,143,
+    190,61,94,146,228,30,162,164,88,148,78,61,122,174,220,19,
+    104,91,89,13,219,243,175,132,237,235,111,176,182,135,198,17,
+    5,165,74,55,222,234,148,150,30,72,203,93,105,25,60,41,
+    21,14,11,61,4,205,253,101,214,196,228,137,128,82,47,70,
+    76,189,212,168,228,185,219,215,15,165,67,243,254,204,161,219,
+    61,245,90,119,241,135,84,236,92,76,146,10,206,29,167,96,
+    225,80,60,252,205,39,108,181,133,152,36,197,22,142,19,43,
+    223,94,162,140,229,152,36,69,202,163,34,41,233,59,7,254,
+    225,165,143,127,223,67,208,189,191,198,154,152,196,210,67,195,
+    49,97,48,98,193,217,168,76,147,115,52,158,41,127,119,7,
+    144,30,70,125,128,137,32,107,159,169,186,91,87,112,221,247,
+    66,124,164,7,32,97,247,139,18,204,183,124,211,170,66,238,
+    194,165,203,15,47,26,69,58,228,85,163,127,86,12,119,193,
+    44,59,147,189,170,222,255,31,165,177,119,134,196,96,110,48,
+    216,79,168,240,82,27,98,149,33,105,153,18,102,54,69,215,
+    151,242,43,33,234,95,35,23,80,88,185,189,175,128,244,4,
+    142,227,122,103,57,78,4,55,2,73,137,28,223,67,223,132,
+    228,37,218,251,255,72,30,113,149,14,58,149,124,62,67,43,
+    157,225,231,17,58,221,25,126,30,161,31,116,134,159,94,170,
+    198,65,164,70,73,71,89,123,66,219,103,199,204,49,239,252,
+    7,235,215,236,61,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/memory/simple.py",
+    "gem5.components.memory.simple",
+    embedded_module_data,
+    1909,
+    4072);
+
+} // anonymous namespace
+} // namespace gem5
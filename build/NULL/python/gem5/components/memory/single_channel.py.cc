@@ -0,0 +1,91 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,205,86,207,107,27,71,20,158,217,95,150,181,178,36,
+    203,178,108,71,46,221,182,161,84,180,177,172,159,152,58,149,
+    146,212,7,23,42,53,141,161,135,189,44,178,118,29,9,118,
+    87,98,118,77,45,147,66,15,61,244,208,67,111,61,245,90,
+    108,218,131,143,249,51,214,224,128,89,40,4,122,242,109,33,
+    244,146,83,103,102,37,121,55,145,229,20,154,164,98,252,52,
+    243,62,189,153,247,125,243,102,198,127,129,192,135,31,126,63,
+    67,16,128,95,128,10,84,168,3,3,202,16,2,149,81,89,
+    157,49,88,153,165,125,78,231,12,94,230,13,65,22,232,152,
+    215,103,140,136,28,161,125,65,159,53,162,114,212,16,101,209,
+    136,201,49,234,155,209,231,140,184,28,167,253,136,158,48,146,
+    114,146,246,103,245,121,35,37,167,32,152,5,234,162,42,106,
+    80,91,88,25,167,163,198,52,118,143,83,231,126,224,229,244,
+    20,60,142,241,197,41,120,2,227,153,41,120,18,227,75,83,
+    240,121,140,47,79,193,83,24,95,153,130,47,96,252,198,20,
+    60,141,241,172,26,221,1,185,204,5,113,231,160,27,249,170,
+    111,119,123,102,75,191,128,190,35,125,119,215,178,81,171,109,
+    55,52,163,135,6,59,3,203,214,140,28,227,206,109,109,61,
+    40,41,133,234,250,186,178,113,176,49,28,22,11,165,18,25,
+    226,56,226,40,43,197,178,143,231,88,234,168,40,101,226,40,
+    15,3,42,74,53,60,220,24,14,113,252,252,246,189,134,82,
+    88,39,227,109,165,112,80,40,18,103,242,203,251,151,203,22,
+    14,74,69,236,75,124,222,105,153,166,166,107,170,159,97,211,
+    229,172,238,161,230,10,72,179,247,145,217,134,129,50,19,240,
+    31,75,202,172,8,72,153,217,1,204,102,46,251,42,84,153,
+    71,224,15,246,55,14,128,223,185,145,23,203,196,29,110,71,
+    37,252,185,43,89,93,243,161,174,73,109,127,109,201,160,75,
+    75,22,85,71,218,39,168,20,18,72,218,109,89,154,42,109,
+    125,209,104,172,209,41,16,153,247,226,14,54,199,16,37,136,
+    214,12,138,227,47,68,114,68,11,216,88,36,59,233,121,201,
+    66,237,124,127,96,119,122,102,254,161,102,84,242,237,158,209,
+    239,153,154,105,91,121,127,217,188,159,140,50,76,102,173,63,
+    112,51,59,212,53,148,102,156,9,90,196,83,222,34,2,100,
+    177,249,30,252,29,3,177,236,175,159,29,189,119,244,224,68,
+    117,196,205,83,113,243,76,220,116,184,205,103,132,240,91,150,
+    110,84,76,147,165,67,169,145,78,35,225,102,194,194,161,52,
+    182,147,132,32,243,34,114,22,170,36,32,67,204,210,219,102,
+    123,121,82,94,149,109,228,149,216,250,243,34,178,219,245,215,
+    200,182,121,69,146,115,147,146,92,14,37,25,56,209,232,29,
+    12,111,147,95,175,2,90,157,2,174,206,39,217,143,143,190,
+    62,97,30,167,29,177,118,42,214,206,196,154,195,213,166,80,
+    248,148,82,120,4,44,70,133,223,93,77,5,63,42,152,10,
+    247,18,21,190,233,10,197,74,181,209,189,119,5,165,216,36,
+    74,201,16,37,124,115,33,9,187,155,228,87,57,74,197,195,
+    84,146,30,128,252,242,121,98,233,71,238,79,241,198,147,236,
+    39,71,173,147,212,227,155,142,88,63,21,235,103,98,221,225,
+    234,255,249,214,28,115,135,133,112,33,146,194,146,122,123,164,
+    232,42,82,167,101,73,246,183,189,81,117,90,126,197,93,48,
+    19,153,207,78,98,30,39,243,41,227,171,29,221,196,206,111,
+    192,235,170,52,244,126,32,159,232,53,249,144,183,5,125,136,
+    157,202,155,201,71,188,38,31,242,184,161,143,176,179,19,202,
+    39,7,155,185,85,87,176,7,125,188,65,136,36,227,102,90,
+    195,55,87,241,175,11,197,191,46,16,249,47,201,77,171,168,
+    101,40,93,211,214,208,94,171,173,89,107,170,138,74,254,171,
+    49,115,21,94,166,215,197,68,168,226,239,107,116,196,192,93,
+    120,241,71,157,93,131,86,189,155,121,17,209,251,116,109,114,
+    202,93,193,79,149,74,225,178,56,125,250,214,208,123,150,94,
+    63,244,112,211,99,65,107,132,110,12,85,227,216,151,129,202,
+    245,60,114,219,232,169,251,186,86,67,37,60,36,58,90,8,
+    239,131,199,66,8,189,42,128,171,14,200,6,219,83,176,225,
+    132,155,199,176,144,241,192,245,38,2,224,186,3,242,193,230,
+    49,28,65,255,141,137,2,88,114,64,49,216,206,65,217,9,
+    183,115,240,129,19,110,120,245,236,187,30,43,192,219,30,192,
+    230,60,154,250,185,244,211,45,234,120,202,175,120,252,8,8,
+    152,244,27,139,96,97,157,72,84,31,71,224,62,141,24,1,
+    1,19,167,17,60,188,3,61,64,236,56,134,12,104,208,37,
+    22,178,169,255,165,0,99,67,107,242,31,23,80,159,87,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/memory/single_channel.py",
+    "gem5.components.memory.single_channel",
+    embedded_module_data,
+    1071,
+    3235);
+
+} // anonymous namespace
+} // namespace gem5
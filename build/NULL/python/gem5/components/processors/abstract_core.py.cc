@@ -0,0 +1,197 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,221,89,77,108,27,199,21,222,229,63,169,95,235,199,
+    146,37,255,140,85,55,41,91,71,138,237,218,169,213,164,141,
+    44,199,169,80,139,86,66,37,40,120,200,106,185,59,20,183,
+    218,31,102,102,215,178,120,50,10,3,117,129,30,122,41,82,
+    160,62,248,100,196,48,10,244,214,75,14,57,21,69,79,118,
+    97,160,6,129,2,6,138,30,114,99,224,4,40,114,234,123,
+    179,63,92,138,148,44,215,135,2,101,228,183,179,243,222,188,
+    121,243,205,123,111,222,108,254,41,197,126,233,224,249,140,1,
+    249,68,210,37,93,54,37,75,174,200,86,162,146,144,241,61,
+    97,38,173,84,37,101,165,43,105,241,158,52,51,86,182,146,
+    181,114,149,156,149,175,228,173,66,165,32,250,83,230,128,53,
+    88,25,132,118,90,207,152,67,214,112,101,88,150,18,210,187,
+    146,158,189,37,233,57,90,184,151,148,164,7,201,112,226,202,
+    136,158,47,75,197,194,23,248,82,76,180,178,75,151,150,87,
+    169,171,182,134,213,42,119,153,170,185,22,117,235,142,14,172,
+    212,85,131,187,173,220,181,134,107,56,182,106,22,83,173,236,
+    37,149,211,213,213,15,90,147,107,218,178,227,217,238,58,12,
+    216,162,108,85,181,213,77,202,90,169,53,135,185,173,124,217,
+    171,150,119,184,75,173,162,220,26,8,36,215,84,131,125,129,
+    86,64,95,114,165,188,164,197,209,200,133,104,124,37,75,210,
+    47,1,15,42,85,100,93,170,36,104,178,146,186,45,213,100,
+    93,190,149,171,164,105,70,79,208,108,45,161,39,111,165,238,
+    129,248,131,72,65,37,39,120,121,224,165,122,120,133,136,151,
+    238,225,13,0,47,67,7,245,132,158,173,165,244,92,15,127,
+    168,139,159,239,225,15,3,191,0,252,129,64,38,163,15,246,
+    200,140,128,204,113,125,164,167,127,20,250,71,105,62,208,125,
+    168,135,127,136,102,242,82,94,210,79,232,99,116,140,14,30,
+    137,56,250,248,174,119,127,230,137,91,233,93,26,198,197,202,
+    39,96,229,147,61,218,39,129,119,152,30,166,83,49,61,83,
+    129,53,25,125,186,71,126,26,228,143,208,169,152,204,76,143,
+    204,17,144,153,5,157,51,49,157,71,233,108,32,127,172,71,
+    254,232,109,233,134,92,57,6,254,72,90,131,75,129,255,45,
+    59,140,106,178,212,249,37,224,31,122,206,179,159,0,249,173,
+    252,137,228,198,184,221,26,239,198,199,237,33,131,81,83,150,
+    238,203,37,112,241,52,247,26,224,183,57,69,49,108,195,85,
+    20,244,122,78,205,90,43,175,40,154,169,114,174,40,28,167,
+    39,55,191,185,192,153,182,208,216,129,216,176,23,54,169,117,
+    126,65,115,172,134,99,83,219,229,11,13,230,104,148,115,135,
+    241,133,48,138,20,13,150,49,223,216,97,227,48,188,57,25,
+    95,220,124,56,219,89,96,241,19,64,254,125,83,250,71,110,
+    232,87,217,95,103,255,158,155,254,91,110,250,81,110,230,113,
+    110,230,97,248,247,12,205,110,101,24,117,61,102,119,65,35,
+    135,208,140,74,152,70,220,24,235,23,50,59,4,143,251,114,
+    107,188,228,184,43,86,195,164,22,24,75,245,119,24,115,216,
+    125,153,77,224,236,168,128,176,195,168,63,187,73,93,197,224,
+    106,115,162,203,216,160,247,60,206,130,113,122,83,250,215,240,
+    201,135,185,147,108,10,94,250,27,147,17,198,232,50,236,107,
+    66,125,15,186,215,153,71,137,81,35,110,157,146,229,181,15,
+    136,229,232,212,36,14,35,144,8,8,163,31,123,6,163,156,
+    112,106,235,134,189,73,232,117,67,195,148,195,73,141,57,22,
+    209,84,173,78,121,129,4,63,215,9,213,204,147,178,70,109,
+    149,25,14,39,219,42,99,170,237,146,154,195,160,185,75,77,
+    103,200,98,164,230,204,60,89,135,190,107,231,2,99,44,143,
+    187,100,139,210,134,16,189,90,126,143,104,78,157,50,64,140,
+    108,27,110,93,244,250,150,204,71,58,206,250,58,110,252,224,
+    2,177,182,85,195,37,134,13,192,121,98,86,98,112,82,245,
+    12,211,37,208,118,157,6,113,106,161,70,141,118,84,156,243,
+    85,152,142,166,154,132,222,208,76,143,27,215,41,216,4,14,
+    2,248,24,54,89,122,127,149,112,145,77,99,51,95,185,47,
+    177,163,187,246,111,34,4,82,65,32,21,177,124,222,60,217,
+    181,153,253,68,46,162,158,188,216,217,246,168,52,58,121,219,
+    219,103,107,251,249,89,81,110,254,41,178,236,167,31,174,18,
+    116,125,78,108,74,117,216,83,215,107,16,221,168,213,4,150,
+    230,14,0,169,218,196,1,56,153,47,55,79,174,160,85,62,
+    211,112,95,237,236,180,199,105,205,51,113,247,182,108,103,155,
+    108,215,169,24,165,138,113,136,175,26,205,134,190,100,59,46,
+    130,9,253,53,207,246,247,160,78,205,70,71,95,176,143,70,
+    12,71,54,3,43,232,65,114,192,224,202,214,117,75,132,112,
+    115,186,11,192,24,103,25,71,21,4,110,95,15,75,35,115,
+    97,76,180,82,13,56,5,75,90,226,5,240,123,20,89,212,
+    189,0,94,119,60,83,135,37,218,54,213,92,225,132,0,25,
+    164,29,78,9,206,226,71,8,118,199,92,47,210,37,252,53,
+    244,126,102,108,214,93,17,108,20,60,93,12,70,207,68,183,
+    198,133,21,162,81,139,13,149,169,150,144,88,20,206,185,215,
+    140,145,250,200,60,103,23,178,247,19,34,203,176,83,8,149,
+    200,163,1,194,195,193,16,197,87,210,156,237,2,185,155,121,
+    21,113,11,112,30,141,225,252,66,0,255,245,165,1,214,85,
+    87,141,16,237,100,163,255,17,178,236,149,61,33,213,247,131,
+    212,103,126,136,26,190,131,68,56,108,26,167,63,227,63,206,
+    106,201,131,195,170,142,129,64,100,216,242,254,32,110,108,24,
+    110,117,99,131,168,182,14,109,93,180,125,223,52,152,144,135,
+    177,152,251,2,32,35,181,168,129,99,38,220,31,209,51,123,
+    66,26,78,188,173,154,80,171,238,5,107,76,213,217,125,84,
+    233,7,80,37,118,168,152,244,125,255,123,72,78,227,110,37,
+    197,110,133,217,58,220,17,95,149,34,86,185,43,91,247,19,
+    217,136,101,157,177,120,214,201,6,69,72,43,187,230,55,14,
+    30,31,162,80,240,141,14,2,118,97,183,119,13,66,34,87,
+    182,29,182,101,58,170,222,60,210,101,102,156,181,133,163,143,
+    119,60,235,186,106,122,244,101,44,57,183,219,146,81,156,142,
+    67,46,7,63,214,21,199,115,155,199,122,172,137,179,157,110,
+    139,198,13,168,129,24,243,26,174,18,56,154,195,90,99,241,
+    78,220,116,141,190,72,24,52,255,28,119,125,255,116,10,21,
+    70,213,71,212,131,46,227,50,199,52,41,43,236,145,149,160,
+    237,113,79,53,225,68,132,186,192,132,115,52,202,13,126,106,
+    168,27,148,169,76,171,239,16,110,128,177,200,137,84,57,193,
+    125,45,8,28,13,142,219,42,76,223,41,0,137,202,3,53,
+    66,98,15,191,189,128,228,141,30,191,61,20,37,231,112,61,
+    205,227,253,147,119,132,64,204,99,15,199,243,247,139,20,24,
+    141,247,69,241,43,32,128,11,40,214,121,226,40,223,157,16,
+    4,142,2,62,88,103,144,51,170,14,84,132,184,13,126,49,
+    226,23,83,175,97,190,49,106,134,38,212,1,199,133,154,241,
+    185,149,129,168,145,45,203,235,83,35,67,239,205,216,74,7,
+    227,177,57,128,167,179,194,93,21,224,110,29,18,246,136,43,
+    128,161,154,70,147,234,93,190,150,12,145,32,62,18,49,148,
+    116,249,30,188,61,136,122,0,153,132,250,25,4,71,25,157,
+    221,51,41,120,3,220,73,0,121,40,37,161,28,165,215,241,
+    118,18,96,213,147,59,187,160,2,116,152,106,64,174,219,216,
+    40,175,172,174,93,91,41,173,43,151,222,121,119,165,4,201,
+    46,174,43,128,20,47,64,4,214,99,235,176,148,72,163,105,
+    84,193,43,119,230,35,213,129,243,186,117,230,120,155,126,13,
+    189,177,17,79,23,160,61,116,122,46,14,6,255,60,142,52,
+    66,77,135,206,27,232,209,161,116,213,160,76,156,39,151,189,
+    134,9,167,164,219,85,247,192,2,189,152,141,144,246,59,168,
+    111,108,196,172,228,88,211,155,102,168,157,7,232,233,189,7,
+    75,76,195,34,89,242,135,66,33,95,54,172,53,132,153,19,
+    193,195,219,70,204,14,222,115,168,244,236,248,34,88,135,151,
+    34,88,127,112,45,242,157,180,14,161,169,154,140,170,250,14,
+    88,70,59,165,220,222,191,152,214,211,126,93,189,237,239,227,
+    21,213,228,48,65,176,27,194,16,10,33,9,251,114,0,173,
+    16,194,112,132,192,102,98,178,232,44,87,133,212,214,83,210,
+    31,64,157,78,27,112,225,192,203,148,168,140,226,37,120,179,
+    184,30,198,49,113,119,26,80,104,57,120,121,128,173,129,187,
+    185,56,121,67,167,230,93,249,233,77,36,111,245,228,167,33,
+    69,28,0,193,144,230,76,247,197,59,206,187,141,99,199,253,
+    104,157,195,104,157,91,125,52,92,122,60,92,122,152,43,5,
+    133,60,110,234,75,5,231,118,60,56,33,17,119,66,9,175,
+    51,54,116,225,133,8,247,219,247,218,16,8,232,193,171,102,
+    87,94,223,132,226,200,38,182,103,85,97,19,193,9,187,60,
+    110,191,144,131,5,123,166,10,231,92,164,10,174,188,190,65,
+    97,192,237,21,104,207,207,22,171,75,63,83,86,74,229,245,
+    114,87,162,232,155,39,162,252,208,55,204,22,225,58,215,127,
+    113,255,103,209,180,235,182,6,240,56,13,68,86,196,213,65,
+    98,41,118,153,126,169,184,138,182,174,43,174,222,238,31,87,
+    71,68,236,4,249,208,105,40,224,185,138,239,185,205,87,122,
+    99,172,159,220,239,99,241,70,250,198,219,0,36,83,60,74,
+    27,170,193,90,89,203,255,168,124,240,66,44,86,60,6,107,
+    193,43,58,187,220,179,150,9,85,215,149,134,166,184,254,215,
+    107,5,42,231,42,221,85,123,247,19,249,67,236,124,207,197,
+    206,247,98,74,20,204,236,117,36,211,64,74,197,68,169,84,
+    60,142,223,21,109,240,19,69,105,21,20,197,15,58,104,15,
+    42,202,199,80,220,249,28,150,244,179,150,2,238,164,6,159,
+    28,197,55,67,150,66,50,132,228,152,72,70,85,199,49,217,
+    73,124,255,22,18,252,98,195,94,69,242,93,36,243,72,240,
+    131,34,195,47,117,12,63,193,49,252,178,195,178,72,126,136,
+    4,255,159,67,43,9,153,143,253,24,95,47,33,25,64,130,
+    159,245,216,149,192,14,97,131,70,77,83,81,138,50,155,148,
+    130,2,232,109,1,29,27,9,137,184,33,252,37,33,190,93,
+    134,255,61,153,152,189,185,218,78,201,233,217,182,212,135,100,
+    164,204,68,59,33,167,231,126,55,142,29,115,29,242,101,18,
+    88,183,62,18,204,64,44,155,158,188,171,183,37,120,116,72,
+    36,134,29,99,66,44,3,218,214,219,82,6,21,133,36,18,
+    195,142,209,64,219,220,221,239,163,142,185,79,47,139,71,135,
+    196,148,206,5,74,95,76,58,7,98,167,218,18,60,254,232,
+    138,199,231,41,241,232,144,104,16,118,76,132,40,236,187,124,
+    104,225,242,225,241,169,251,92,176,50,210,194,185,39,175,157,
+    105,103,11,40,2,228,233,177,111,223,213,239,124,212,78,23,
+    132,8,188,173,223,41,249,236,156,84,24,110,231,67,65,65,
+    34,133,216,49,45,166,79,3,172,83,109,41,141,18,33,137,
+    196,176,99,88,136,141,166,175,201,79,102,79,220,77,222,185,
+    216,78,138,151,139,111,249,141,167,249,161,118,26,27,109,169,
+    67,35,13,162,235,148,80,49,130,163,38,166,218,73,209,56,
+    253,186,223,16,195,71,196,192,14,141,134,139,174,57,49,60,
+    153,158,67,3,6,30,207,158,110,39,241,229,141,171,226,41,
+    20,36,209,242,144,68,163,187,122,59,68,68,178,112,237,82,
+    113,180,149,84,171,154,8,77,17,134,173,12,100,80,168,242,
+    68,8,137,216,106,21,172,243,243,78,245,231,112,76,114,63,
+    196,114,81,80,98,134,104,229,129,47,78,9,46,98,12,106,
+    9,174,114,63,156,69,12,97,1,225,79,137,113,245,77,238,
+    77,63,61,252,136,149,131,52,199,191,6,210,78,202,178,220,
+    190,144,148,19,96,227,115,73,238,128,114,133,52,182,254,59,
+    50,40,201,115,15,165,147,241,191,167,210,212,195,238,191,118,
+    230,82,66,6,88,251,211,223,92,252,82,60,191,218,131,47,
+    96,249,15,127,120,150,196,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/abstract_core.py",
+    "gem5.components.processors.abstract_core",
+    embedded_module_data,
+    2759,
+    7470);
+
+} // anonymous namespace
+} // namespace gem5
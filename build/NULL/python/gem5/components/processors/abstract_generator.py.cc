@@ -0,0 +1,153 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,87,95,108,219,198,25,63,146,162,68,201,146,28,
+    197,177,227,121,77,66,39,117,26,37,131,188,22,72,151,181,
+    94,246,39,46,50,103,141,177,161,233,195,52,172,52,77,158,
+    44,46,252,163,30,169,58,22,188,194,40,12,52,46,250,224,
+    14,24,18,12,43,224,151,102,9,210,135,62,236,33,123,219,
+    235,222,164,64,64,13,2,3,2,12,125,200,27,179,52,192,
+    144,167,125,119,20,41,209,82,54,249,248,241,120,247,221,119,
+    223,223,223,157,255,133,6,126,217,222,251,233,159,128,220,66,
+    58,210,57,19,89,92,149,227,104,159,55,121,75,168,10,208,
+    23,244,148,153,178,196,170,8,125,81,79,155,105,43,83,205,
+    176,126,198,148,172,108,53,11,125,73,207,154,57,107,172,58,
+    198,250,57,51,111,21,170,5,232,143,225,162,158,135,167,0,
+    79,17,11,120,252,59,241,246,53,73,31,223,78,85,15,241,
+    232,50,210,15,109,35,189,132,11,119,4,132,238,11,17,71,
+    181,164,31,126,7,149,39,30,211,143,50,231,23,213,85,215,
+    35,170,230,89,216,171,59,58,140,164,222,54,92,239,177,16,
+    78,103,157,15,48,33,134,142,221,199,124,56,82,248,105,111,
+    193,207,28,149,80,254,204,85,108,93,117,116,252,152,11,25,
+    38,35,134,203,216,198,68,245,28,114,201,33,24,38,74,209,
+    196,47,137,163,97,215,117,136,47,89,134,173,168,186,78,123,
+    234,141,176,87,180,155,150,210,80,137,103,120,134,99,187,126,
+    154,96,175,73,108,77,232,123,25,165,224,161,223,79,211,176,
+    233,199,232,99,225,22,242,184,254,244,14,242,248,254,215,29,
+    232,223,143,191,201,217,65,206,77,238,127,112,78,38,56,249,
+    23,115,186,252,21,244,17,183,201,237,160,86,142,114,182,210,
+    8,2,127,157,239,207,121,3,218,15,240,141,129,36,216,227,
+    126,188,207,39,194,77,225,38,170,241,58,191,45,121,226,224,
+    238,73,190,69,116,7,232,253,120,30,66,42,44,19,186,161,
+    54,160,51,202,192,51,65,253,244,58,144,63,242,183,208,26,
+    218,68,191,157,252,61,183,35,236,240,155,92,11,118,104,81,
+    127,177,47,157,245,163,177,26,255,25,255,233,20,200,229,8,
+    232,138,238,161,114,202,231,43,223,247,57,195,207,105,245,166,
+    125,93,113,141,22,38,5,106,34,13,135,44,111,109,61,127,
+    211,37,218,124,99,3,50,201,158,95,195,214,249,121,205,177,
+    26,142,141,109,207,157,111,68,81,119,231,163,156,83,214,162,
+    20,169,52,54,158,231,22,76,200,60,186,226,98,235,84,156,
+    0,10,81,237,53,92,89,48,29,77,53,221,139,149,62,211,
+    60,221,250,45,32,255,217,66,1,18,242,233,62,121,148,47,
+    4,2,202,29,222,189,178,87,250,108,185,147,61,185,247,243,
+    187,173,7,191,250,123,233,111,239,118,230,47,117,94,190,212,
+    150,22,3,33,177,228,41,245,87,89,240,115,134,107,216,174,
+    167,218,26,246,5,195,246,124,145,41,80,78,49,83,73,145,
+    146,113,74,166,34,203,87,100,249,39,228,40,116,252,241,3,
+    90,147,99,48,58,71,249,254,74,213,4,61,159,73,40,59,
+    177,123,225,243,119,58,210,108,87,154,13,132,148,152,254,38,
+    63,181,123,227,139,137,78,126,174,155,159,11,68,24,121,150,
+    70,133,163,187,31,126,225,118,242,231,186,249,115,65,6,198,
+    2,20,147,28,42,78,221,150,58,5,121,111,185,147,127,237,
+    171,247,31,142,93,104,71,237,159,165,35,187,245,189,233,206,
+    84,249,238,123,157,201,55,59,165,133,110,105,97,235,74,192,
+    39,140,237,147,111,74,83,187,31,118,74,167,187,165,211,129,
+    8,223,79,232,224,183,189,105,49,77,40,182,104,3,25,133,
+    162,164,124,250,9,162,165,119,11,97,84,133,212,169,242,58,
+    87,21,116,30,167,176,216,199,35,138,115,181,20,36,52,167,
+    139,219,249,106,154,71,56,131,165,100,42,235,105,156,13,249,
+    244,204,118,42,153,214,213,28,30,211,115,186,52,52,158,135,
+    209,44,32,93,225,38,186,193,85,139,144,166,99,125,124,137,
+    129,167,165,92,171,99,57,202,54,57,206,182,156,12,191,37,
+    79,214,113,205,176,177,43,123,192,133,111,120,152,216,170,41,
+    67,204,49,169,169,26,150,157,154,140,1,254,54,250,11,229,
+    56,159,43,76,134,47,106,128,109,46,57,4,58,45,107,3,
+    248,192,208,137,33,212,219,180,242,184,36,62,37,141,217,27,
+    172,216,248,183,201,125,201,37,29,5,208,207,211,58,87,255,
+    0,27,177,237,233,239,18,193,170,7,70,202,180,46,168,202,
+    35,225,87,62,179,94,55,180,186,108,184,178,106,199,44,12,
+    152,191,23,139,242,28,185,161,186,46,125,83,143,104,128,190,
+    30,105,106,212,110,144,75,135,134,16,188,34,47,54,113,111,
+    65,44,71,55,106,53,76,192,73,50,212,188,231,120,27,13,
+    240,113,13,164,140,144,218,231,237,59,153,45,136,165,25,118,
+    163,233,129,218,96,132,237,120,88,151,85,87,62,171,146,53,
+    183,34,95,171,131,61,235,234,6,19,28,135,121,101,37,60,
+    203,100,69,99,190,81,88,140,86,86,98,137,154,211,52,117,
+    121,21,116,81,77,19,4,174,27,192,222,244,134,61,39,215,
+    213,15,12,123,141,218,119,221,118,214,229,245,186,234,37,44,
+    141,237,123,145,121,116,200,176,235,152,0,42,128,32,205,164,
+    254,53,64,117,200,62,128,51,39,150,100,26,150,225,133,153,
+    184,178,114,64,113,185,214,180,53,138,42,84,17,199,54,55,
+    228,166,75,165,53,28,151,129,13,36,45,248,163,105,81,152,
+    173,228,98,145,191,192,27,235,14,209,229,51,78,227,32,87,
+    153,185,211,245,12,19,6,77,211,89,87,87,77,170,232,8,
+    19,250,217,49,194,20,236,86,226,121,56,40,100,90,6,101,
+    222,23,221,102,3,195,153,174,40,134,109,120,138,2,176,154,
+    114,177,89,99,12,126,86,81,216,98,69,113,133,240,224,96,
+    232,73,78,209,211,103,102,40,8,149,72,202,27,20,72,79,
+    135,120,255,108,6,101,139,59,153,79,51,95,75,211,15,165,
+    233,219,205,182,52,221,145,230,186,210,92,59,106,12,186,124,
+    113,149,94,83,70,151,230,34,162,119,180,77,110,111,84,253,
+    37,174,16,191,139,251,67,37,9,71,239,61,110,25,44,204,
+    187,216,83,44,108,41,22,92,134,8,189,8,250,233,107,75,
+    87,151,150,47,151,121,242,50,53,144,234,238,242,204,228,240,
+    188,152,52,108,8,113,195,33,52,216,241,249,216,122,101,216,
+    7,35,25,151,168,188,227,64,182,208,35,169,240,181,52,243,
+    80,154,249,252,7,127,190,216,145,206,118,165,179,237,168,133,
+    24,62,8,50,92,228,129,67,204,3,222,192,212,71,92,153,
+    107,253,37,14,234,34,110,96,91,167,241,134,236,139,210,63,
+    132,72,154,80,131,192,72,194,34,24,78,17,200,247,129,36,
+    130,138,237,149,167,141,177,206,192,6,42,209,176,26,38,166,
+    169,9,229,8,105,168,99,79,53,76,153,138,131,9,24,199,
+    189,194,167,248,52,152,114,254,196,178,227,45,245,23,191,69,
+    136,67,238,113,204,223,46,53,179,231,233,2,156,232,196,83,
+    192,171,181,154,161,181,78,12,123,56,193,112,149,46,207,49,
+    207,62,203,163,241,147,109,105,118,216,139,124,228,197,74,152,
+    71,104,116,30,37,193,62,204,24,114,6,209,187,50,161,87,
+    24,82,57,160,107,73,129,194,246,148,240,22,226,25,16,242,
+    214,169,17,85,113,144,233,93,42,102,134,233,188,47,229,195,
+    108,232,72,47,117,165,151,218,81,99,54,64,54,178,227,170,
+    60,78,11,212,86,45,172,40,126,78,161,105,219,52,105,63,
+    175,40,239,55,85,179,55,147,81,20,221,209,20,133,208,171,
+    14,25,67,189,66,37,105,74,242,148,72,148,156,163,132,122,
+    35,180,233,85,230,244,94,161,107,216,52,1,4,56,50,23,
+    89,26,222,151,200,137,136,156,167,19,255,64,172,180,163,191,
+    128,231,69,41,64,148,72,5,241,244,109,189,125,234,66,247,
+    248,15,3,4,31,15,116,246,122,49,57,142,210,227,91,191,
+    110,143,203,29,113,182,43,206,6,60,39,158,187,251,163,0,
+    193,235,193,53,246,234,147,39,2,74,159,140,152,130,52,74,
+    31,9,120,81,60,25,160,136,80,134,35,219,239,133,163,69,
+    78,60,70,151,253,31,194,92,205,108,91,46,31,246,5,117,
+    85,99,222,241,211,112,90,64,109,48,111,250,197,38,32,176,
+    91,137,254,199,98,62,245,39,25,98,185,149,248,146,204,190,
+    153,151,253,241,222,92,18,102,142,14,223,167,217,209,193,162,
+    229,31,142,103,99,224,8,227,246,93,58,43,122,77,40,30,
+    118,81,13,195,65,255,93,8,149,167,33,122,46,45,132,121,
+    113,145,252,184,7,28,238,191,129,4,2,199,113,193,235,136,
+    59,209,70,199,7,219,62,58,218,78,182,71,232,149,118,178,
+    237,163,87,219,201,182,143,230,218,201,182,143,222,104,39,219,
+    240,170,32,93,224,210,251,197,82,32,208,247,49,57,124,191,
+    118,158,189,31,137,217,155,115,219,191,9,68,232,67,78,36,
+    136,60,203,65,148,134,73,123,186,252,132,190,191,29,49,199,
+    124,242,95,241,137,30,188,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/abstract_generator.py",
+    "gem5.components.processors.abstract_generator",
+    embedded_module_data,
+    2055,
+    4076);
+
+} // anonymous namespace
+} // namespace gem5
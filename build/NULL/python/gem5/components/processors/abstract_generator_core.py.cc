@@ -0,0 +1,150 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,189,88,205,111,27,215,17,127,75,114,151,75,138,162,
+    100,137,78,25,55,118,94,100,39,18,83,149,130,155,182,40,
+    210,34,141,225,164,70,82,131,9,96,231,16,30,178,90,237,
+    62,138,107,239,7,243,118,105,153,132,14,70,33,160,106,225,
+    107,97,31,2,212,39,35,134,47,249,19,146,99,111,114,97,
+    160,6,129,0,1,138,30,124,99,154,6,40,114,202,204,219,
+    79,126,200,185,133,92,205,190,143,153,121,243,230,55,111,222,
+    80,255,38,153,143,28,189,191,113,129,220,33,38,49,37,155,
+    56,82,91,146,176,157,179,115,78,190,157,23,237,188,93,112,
+    228,182,236,40,109,5,250,5,83,182,139,142,218,86,69,91,
+    177,75,78,185,93,134,118,209,84,237,5,167,210,174,72,36,
+    71,46,17,179,116,64,204,50,171,220,207,19,242,48,31,47,
+    218,94,52,23,174,144,70,229,41,118,26,210,168,170,239,248,
+    1,215,141,192,97,65,215,51,97,68,125,175,23,88,158,171,
+    219,141,220,168,240,190,199,131,81,21,233,85,198,29,203,213,
+    3,143,63,205,135,162,249,119,174,92,128,87,201,187,193,56,
+    183,76,230,63,149,194,137,202,133,72,231,69,143,51,35,187,
+    101,53,222,242,16,88,255,12,155,102,164,45,153,164,157,51,
+    165,118,254,144,116,36,51,119,160,182,11,57,194,100,166,220,
+    7,158,135,82,44,106,230,89,177,147,51,11,7,133,251,208,
+    123,152,168,108,171,199,112,151,128,91,158,225,46,207,229,86,
+    216,130,153,55,139,157,130,169,206,72,84,230,74,148,64,162,
+    28,73,41,230,194,140,212,226,92,169,85,179,58,195,89,157,
+    199,89,130,175,89,51,151,216,18,91,120,62,225,53,151,167,
+    250,225,234,39,14,228,41,157,203,236,132,185,114,64,166,70,
+    87,14,201,77,169,189,10,240,159,28,157,140,49,186,196,92,
+    198,17,86,4,75,119,192,130,171,93,70,227,168,160,187,241,
+    52,53,96,190,92,166,240,185,52,49,230,83,157,179,168,21,
+    116,245,128,26,186,75,57,235,217,186,193,96,128,209,30,247,
+    12,230,251,150,187,27,115,121,84,183,109,111,79,40,235,128,
+    154,128,249,65,56,237,244,250,1,227,212,31,248,1,115,124,
+    106,185,96,128,243,171,38,157,176,201,176,117,223,23,194,115,
+    55,65,77,214,177,92,97,13,163,236,38,232,131,96,6,85,
+    208,232,132,54,129,145,12,130,118,144,238,78,104,67,235,168,
+    211,247,3,106,57,61,155,57,204,13,154,244,34,227,129,46,
+    236,152,220,180,99,237,118,3,234,50,102,226,126,112,25,23,
+    90,93,43,52,44,179,154,71,59,86,128,182,88,28,220,242,
+    113,223,226,66,179,223,12,215,76,32,135,79,14,254,240,112,
+    137,140,240,55,233,14,9,50,179,147,96,222,203,202,29,195,
+    35,145,64,62,110,110,159,104,73,78,48,37,8,137,220,208,
+    22,6,225,231,34,68,66,0,14,119,105,246,36,55,233,5,
+    219,247,54,169,207,130,126,143,234,212,236,59,78,198,133,212,
+    219,185,198,0,29,216,176,225,185,46,52,19,125,48,100,25,
+    186,209,101,205,100,168,213,40,140,100,191,223,99,124,164,106,
+    154,229,90,129,166,113,5,140,25,169,61,200,54,26,120,19,
+    243,143,207,236,206,168,164,105,2,114,77,243,209,67,244,214,
+    119,111,250,220,216,234,13,32,99,185,91,24,32,91,24,57,
+    158,139,110,221,138,194,205,227,254,86,28,49,90,98,164,134,
+    224,53,123,3,190,12,138,134,103,230,198,79,51,182,231,53,
+    224,241,55,129,252,255,22,249,182,76,74,213,191,20,111,23,
+    255,165,214,255,169,214,31,169,167,30,171,167,142,212,83,95,
+    214,95,121,84,223,120,92,223,56,44,220,94,60,132,239,55,
+    232,209,145,194,193,73,220,157,64,87,138,209,197,109,222,137,
+    188,222,250,195,3,242,64,226,43,184,20,50,80,94,67,249,
+    5,203,215,174,223,112,132,185,195,151,230,155,153,97,249,45,
+    138,23,129,220,34,95,45,213,14,251,252,36,180,231,47,126,
+    74,44,30,100,166,174,37,124,96,144,212,106,228,56,166,233,
+    81,161,245,193,229,203,252,249,41,195,138,187,44,208,44,95,
+    31,158,158,111,84,52,253,123,20,43,9,131,254,179,180,114,
+    251,230,225,146,48,105,84,64,112,91,70,46,179,124,18,244,
+    103,132,101,251,210,62,185,150,76,106,105,238,12,131,244,243,
+    36,130,166,179,144,231,218,3,218,213,111,48,104,49,113,210,
+    32,171,80,92,143,238,117,45,163,75,247,24,221,179,108,59,
+    142,78,136,202,52,64,33,83,152,122,160,83,17,165,212,245,
+    196,129,165,219,219,97,216,110,111,55,233,187,152,23,18,209,
+    137,73,140,111,24,73,180,77,94,151,180,203,120,54,240,31,
+    228,248,9,116,69,9,76,212,208,60,31,60,142,248,115,116,
+    64,24,225,145,179,171,209,122,90,184,210,240,220,124,159,79,
+    114,93,68,45,53,225,250,113,149,156,93,199,192,124,172,190,
+    120,36,158,16,5,25,151,61,31,190,126,97,228,83,44,82,
+    48,126,253,76,48,246,115,207,4,233,239,201,110,175,88,46,
+    228,192,233,220,137,23,6,250,184,239,67,246,132,220,218,233,
+    3,44,97,206,167,142,103,178,77,152,141,83,107,162,42,227,
+    123,7,61,190,167,219,215,225,170,16,30,108,206,204,62,27,
+    3,78,193,216,70,62,116,251,89,36,231,208,107,121,225,251,
+    200,249,181,216,173,225,66,33,84,195,87,159,13,65,150,247,
+    50,170,60,19,2,81,33,103,55,34,32,158,172,205,131,164,
+    24,165,173,81,241,253,176,49,113,70,230,166,142,225,127,143,
+    61,11,166,39,252,43,92,168,187,3,186,231,241,235,182,167,
+    67,7,238,225,93,55,188,179,208,85,155,48,130,141,65,162,
+    42,194,138,69,55,150,183,231,2,50,46,116,2,203,72,245,
+    108,164,99,224,141,78,199,50,26,209,17,233,197,119,51,126,
+    66,183,39,221,215,123,58,215,157,184,32,120,93,220,234,81,
+    39,188,68,153,1,215,63,92,44,28,171,1,223,114,250,182,
+    142,181,104,22,185,58,34,23,29,152,245,233,3,83,129,187,
+    73,139,141,28,174,205,199,42,203,243,65,154,167,198,43,164,
+    180,120,88,8,225,88,21,23,56,239,247,2,45,202,36,30,
+    31,173,100,7,125,184,111,12,54,113,120,230,163,244,215,31,
+    255,48,36,64,204,196,125,61,19,247,63,67,178,57,19,247,
+    39,146,116,18,239,118,184,254,3,121,39,102,220,206,120,179,
+    150,122,115,254,69,180,76,166,47,162,63,73,13,105,248,69,
+    98,237,219,115,74,55,143,250,129,206,147,178,20,195,4,115,
+    49,26,7,121,191,67,117,211,4,159,250,204,207,68,221,91,
+    172,7,213,4,178,122,46,92,5,80,252,93,177,156,247,194,
+    98,197,242,233,30,215,123,61,240,238,206,64,148,111,52,41,
+    37,194,110,248,187,40,81,150,41,251,118,88,90,39,50,51,
+    245,50,252,2,90,109,121,193,59,233,220,219,156,123,124,230,
+    42,93,20,91,209,162,243,51,60,123,76,180,102,153,108,84,
+    81,22,14,254,118,153,44,173,29,169,47,9,15,55,10,226,
+    44,240,13,36,207,1,129,91,188,213,106,212,176,182,114,117,
+    135,105,218,168,172,105,16,77,125,27,219,21,77,251,184,175,
+    219,209,76,81,211,76,207,128,242,11,17,225,8,31,95,64,
+    251,10,59,158,103,115,172,23,68,65,192,79,35,193,130,146,
+    175,33,121,5,201,171,72,10,72,154,72,16,88,126,94,108,
+    46,170,217,12,102,219,154,214,144,248,106,188,251,55,197,238,
+    249,98,76,26,56,241,133,36,170,172,248,59,206,21,101,117,
+    76,144,172,40,114,99,76,230,144,101,162,44,221,250,240,112,
+    255,145,252,194,99,249,133,113,78,146,79,222,189,58,38,240,
+    74,201,215,121,162,156,142,103,199,202,140,68,253,238,42,242,
+    213,83,146,149,168,207,72,40,242,250,189,95,226,242,235,159,
+    190,37,94,41,73,5,113,100,218,56,69,222,248,244,28,242,
+    109,124,22,136,215,231,5,241,74,73,86,126,99,70,94,149,
+    23,199,36,38,41,43,142,212,38,89,21,178,245,218,147,159,
+    159,31,23,75,200,13,228,171,211,47,223,51,63,249,104,44,
+    227,128,66,160,119,245,147,86,56,173,146,114,117,92,138,25,
+    5,73,117,227,200,115,68,169,33,22,107,136,197,26,206,213,
+    14,62,74,7,166,136,8,69,129,105,171,81,29,229,245,29,
+    67,4,196,72,9,6,61,56,126,34,78,70,101,248,57,23,
+    254,82,240,195,96,18,69,127,1,106,70,63,172,59,171,253,
+    192,178,253,102,252,95,5,17,144,163,197,164,148,199,164,41,
+    226,51,140,32,76,104,225,186,24,85,223,169,191,11,131,252,
+    13,254,70,148,107,252,127,0,25,231,37,73,26,255,134,72,
+    47,30,145,51,217,231,9,249,233,209,228,51,46,228,165,220,
+    152,252,48,41,19,169,126,68,126,146,125,158,144,245,163,201,
+    103,118,100,172,252,81,146,192,95,243,233,221,203,95,139,247,
+    255,142,153,23,91,253,30,226,191,188,37,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/abstract_generator_core.py",
+    "gem5.components.processors.abstract_generator_core",
+    embedded_module_data,
+    2011,
+    4678);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,128 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,86,221,143,19,85,20,191,119,62,218,105,183,31,
+    187,116,101,187,11,194,128,2,22,180,171,17,140,34,34,8,
+    70,33,88,76,86,99,50,81,135,217,206,93,40,206,71,189,
+    115,107,220,102,21,66,54,113,73,246,129,24,12,213,152,200,
+    19,145,240,226,163,255,129,175,133,108,194,102,18,147,77,12,
+    137,188,213,160,137,225,201,115,111,59,253,216,45,194,244,246,
+    204,157,115,207,61,247,156,223,249,152,249,3,245,93,106,231,
+    254,224,107,32,215,144,141,108,236,32,23,27,216,149,12,9,
+    243,103,201,145,93,197,80,92,213,80,197,179,236,196,220,184,
+    17,135,185,98,171,142,230,38,140,132,152,199,156,164,59,98,
+    140,192,60,110,107,78,202,77,27,105,152,39,236,164,147,113,
+    179,70,22,35,9,189,131,236,145,69,100,167,72,252,134,140,
+    208,45,57,50,194,24,181,211,51,168,144,185,207,31,10,82,
+    24,63,250,214,177,247,8,179,194,140,53,27,48,106,149,153,
+    75,216,57,223,134,37,229,84,37,96,161,118,186,202,42,190,
+    103,57,5,28,38,102,106,179,51,243,1,35,238,125,174,16,
+    56,242,137,153,163,112,211,40,249,188,86,161,36,184,47,181,
+    249,233,163,29,109,111,249,22,181,239,227,54,55,21,113,143,
+    249,148,148,251,177,137,71,216,252,2,228,27,64,135,32,3,
+    219,200,144,136,108,40,54,38,234,249,88,36,58,39,217,18,
+    137,19,141,36,38,187,219,123,51,91,38,42,32,132,231,98,
+    75,104,14,219,234,98,218,72,218,10,25,129,93,177,69,197,
+    72,193,124,96,39,240,227,192,79,3,95,133,185,6,243,12,
+    201,218,9,50,42,180,40,118,114,81,185,1,114,183,186,59,
+    140,49,59,5,216,42,198,166,37,244,37,54,114,128,102,58,
+    28,139,60,123,159,250,101,18,4,62,45,133,106,25,188,12,
+    66,185,18,88,97,140,18,86,163,94,185,27,7,184,20,248,
+    243,231,7,127,2,249,14,95,67,12,247,22,7,207,188,222,
+    183,242,40,25,140,22,48,125,135,169,189,117,27,47,2,239,
+    248,58,185,27,160,235,86,87,159,45,125,198,67,134,2,233,
+    36,186,132,23,240,2,50,187,54,46,96,91,238,33,117,93,
+    121,188,13,176,187,123,190,173,204,160,5,105,61,167,160,214,
+    127,155,33,76,103,231,136,46,240,209,125,79,60,84,35,224,
+    146,73,189,115,29,19,235,22,37,186,223,201,65,125,206,167,
+    122,224,187,125,226,58,155,175,146,160,168,159,152,211,173,62,
+    174,237,195,86,207,103,93,101,193,192,161,231,8,37,207,235,
+    21,166,187,181,128,233,254,23,132,210,138,77,244,51,103,206,
+    18,102,122,53,215,20,98,103,206,232,150,103,119,184,29,78,
+    177,171,177,220,31,20,14,78,14,254,15,94,65,188,184,207,
+    1,20,159,108,254,10,0,189,62,12,181,117,176,125,43,45,
+    79,204,160,155,188,68,226,252,40,200,24,168,63,169,248,98,
+    168,136,83,121,132,116,253,225,235,1,45,79,87,231,161,60,
+    189,233,179,196,61,48,93,246,221,170,239,17,143,5,211,93,
+    207,131,233,168,144,205,46,175,88,157,127,152,56,4,8,240,
+    13,135,235,47,108,72,214,162,105,86,188,10,51,205,226,33,
+    199,47,91,78,112,184,216,21,63,204,179,67,7,114,17,53,
+    39,94,107,143,159,247,55,148,159,82,63,164,190,207,252,152,
+    233,50,31,112,87,104,154,19,110,112,169,16,11,213,160,86,
+    37,52,212,34,245,161,236,16,143,142,113,145,9,32,161,34,
+    92,85,66,37,32,206,92,155,191,137,243,19,166,89,118,172,
+    32,48,205,64,17,190,235,23,233,20,95,221,6,164,62,245,
+    104,251,167,185,177,117,32,255,94,68,255,140,163,68,230,114,
+    124,57,126,87,203,223,209,242,183,181,169,21,109,170,169,77,
+    173,141,140,182,80,60,177,245,159,24,26,159,104,155,254,203,
+    1,32,183,39,94,91,1,154,59,184,146,59,248,171,117,39,
+    247,102,51,26,171,147,219,150,142,47,159,92,205,63,221,176,
+    126,212,238,230,159,187,147,127,238,118,126,239,74,126,47,176,
+    79,44,193,111,45,191,37,154,210,173,112,252,134,220,16,133,
+    94,18,185,209,95,230,11,80,164,55,0,173,91,82,196,105,
+    23,34,147,251,101,206,119,87,7,139,23,114,70,42,9,216,
+    10,178,200,28,139,49,74,183,115,160,56,243,38,166,59,184,
+    70,46,175,11,252,194,244,64,126,215,183,111,68,114,64,224,
+    56,223,190,91,196,254,247,236,230,43,172,241,209,237,236,174,
+    149,236,174,166,214,25,191,103,55,93,217,127,245,224,229,11,
+    203,23,154,218,182,255,113,125,255,19,187,14,238,246,57,72,
+    159,229,222,73,116,87,228,20,221,189,206,165,68,183,56,235,
+    91,134,187,35,22,223,237,165,241,112,87,86,179,185,229,122,
+    83,155,220,232,4,142,156,24,21,78,128,129,168,103,224,77,
+    92,42,96,170,15,177,76,164,120,125,114,184,77,144,247,167,
+    184,120,82,88,196,207,158,111,106,121,113,118,168,206,242,151,
+    102,89,122,180,9,172,111,233,18,166,251,144,120,189,230,74,
+    62,59,225,86,29,226,66,75,32,246,219,148,250,20,160,227,
+    57,64,159,23,248,114,219,58,176,61,85,241,0,151,170,79,
+    45,70,122,157,162,190,103,163,185,67,5,79,115,125,154,48,
+    254,94,102,71,83,219,241,63,176,197,132,205,54,134,238,47,
+    213,15,30,179,28,135,216,58,243,69,75,174,85,161,197,66,
+    75,171,120,103,117,143,16,27,86,172,57,70,40,52,93,247,
+    0,28,29,48,203,99,21,56,26,58,111,137,110,30,150,0,
+    99,102,213,15,0,209,158,108,253,153,33,29,98,189,208,12,
+    87,19,23,30,172,105,169,37,69,56,0,112,241,46,94,42,
+    140,243,166,229,89,46,129,166,149,52,77,215,183,107,14,159,
+    167,76,243,243,154,229,180,87,168,44,106,10,150,161,244,58,
+    13,139,38,56,79,41,125,120,234,20,229,142,83,254,250,163,
+    25,212,105,94,240,57,224,49,186,135,63,22,162,28,161,188,
+    74,104,138,19,222,191,232,75,29,173,66,99,153,56,142,105,
+    66,138,237,140,220,62,210,206,174,209,136,136,208,194,71,31,
+    239,121,209,111,117,124,203,197,247,90,26,154,126,121,53,183,
+    249,234,171,173,120,78,221,218,66,64,214,178,19,13,165,241,
+    49,180,174,149,236,190,150,202,217,49,148,25,107,11,104,40,
+    153,105,37,34,209,161,100,175,164,110,111,4,45,4,183,245,
+    68,147,212,169,198,254,235,169,149,45,47,112,198,212,122,162,
+    97,117,178,145,107,33,184,173,39,49,20,27,111,73,88,221,
+    249,243,27,156,177,243,215,15,196,173,71,254,146,65,98,241,
+    83,33,211,138,73,106,154,171,124,12,17,1,21,8,149,10,
+    99,161,108,205,150,69,188,4,218,97,12,62,27,32,231,218,
+    209,225,113,10,147,144,111,254,236,121,82,102,1,141,139,24,
+    66,141,6,237,112,102,106,172,226,4,197,232,43,151,38,69,
+    5,137,50,13,138,221,247,173,120,22,113,12,211,93,38,111,
+    62,237,240,139,128,137,12,22,134,241,32,62,212,14,181,51,
+    235,48,61,210,169,152,224,30,144,150,140,49,110,189,34,99,
+    169,133,30,79,180,39,148,75,34,188,163,137,244,254,177,134,
+    38,154,131,99,21,237,110,14,142,85,244,82,115,112,172,162,
+    61,205,193,209,138,21,48,160,190,145,52,18,127,241,219,223,
+    67,150,4,12,255,1,56,170,31,98,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/abstract_processor.py",
+    "gem5.components.processors.abstract_processor",
+    embedded_module_data,
+    1658,
+    3362);
+
+} // anonymous namespace
+} // namespace gem5
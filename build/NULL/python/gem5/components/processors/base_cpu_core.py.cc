@@ -0,0 +1,223 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,173,25,91,111,20,215,249,204,206,236,238,236,238,216,
+    107,179,38,190,224,181,215,142,193,89,240,13,131,129,36,132,
+    214,5,66,92,194,165,53,41,97,213,102,180,222,25,96,97,
+    103,119,115,102,140,193,114,36,20,161,198,137,172,150,135,84,
+    225,129,168,150,154,32,40,121,224,133,42,143,77,127,193,172,
+    181,18,171,145,34,89,170,82,41,111,19,165,145,80,158,122,
+    190,51,215,189,16,104,139,125,252,157,219,247,125,231,155,239,
+    118,46,254,39,242,253,4,237,250,251,63,16,240,9,146,144,
+    196,20,144,194,100,24,37,144,9,48,208,15,20,88,133,203,
+    112,74,48,19,84,66,153,144,18,206,132,21,62,195,43,145,
+    76,132,206,179,133,168,18,203,196,72,155,147,130,5,65,105,
+    203,180,209,118,168,208,174,196,51,113,218,14,23,58,148,206,
+    76,39,105,243,82,164,176,69,73,100,18,12,10,160,99,72,
+    138,222,64,82,76,78,220,97,17,186,207,58,66,101,186,36,
+    97,30,165,219,190,133,78,58,96,112,111,230,85,205,224,79,
+    149,181,124,169,152,45,164,67,70,248,23,89,85,62,124,250,
+    45,171,113,226,196,91,70,251,233,220,225,210,98,81,59,131,
+    179,185,203,50,54,182,214,247,79,100,139,217,11,100,152,59,
+    93,194,154,17,62,141,75,57,89,85,211,140,17,179,241,78,
+    103,243,248,91,144,128,140,177,115,243,179,164,138,148,174,200,
+    24,231,37,25,240,120,44,191,187,152,199,178,250,45,99,33,
+    9,179,11,170,70,152,107,135,75,88,206,249,117,202,59,58,
+    53,2,8,125,64,180,42,163,12,35,161,76,64,98,50,172,
+    20,144,57,137,149,131,231,185,85,116,158,145,184,27,66,38,
+    36,5,101,238,124,64,10,221,224,50,225,0,146,121,57,114,
+    135,44,114,159,113,24,146,249,40,153,15,223,224,238,144,222,
+    125,119,161,76,236,39,176,249,38,108,129,204,4,201,76,132,
+    172,211,214,146,50,42,183,75,65,41,118,158,147,132,38,234,
+    248,83,40,218,154,40,58,90,82,180,19,138,184,77,21,146,
+    58,154,168,58,91,82,117,202,91,236,117,182,52,81,36,90,
+    82,36,228,168,77,209,213,68,209,213,138,34,66,126,165,33,
+    105,171,188,85,110,239,117,113,165,23,26,250,150,220,221,55,
+    130,13,60,95,120,130,45,186,137,198,123,154,36,232,105,137,
+    221,43,247,202,125,190,181,250,236,111,8,73,219,154,56,108,
+    107,201,161,95,238,243,81,37,155,168,250,91,82,13,144,117,
+    147,190,117,7,229,1,155,67,170,137,195,224,42,186,202,100,
+    82,36,62,135,141,152,29,134,16,2,203,167,162,41,242,51,
+    91,76,169,154,84,200,47,164,252,241,145,82,23,23,114,133,
+    172,170,166,150,46,230,115,23,83,75,56,91,86,83,217,148,
+    77,159,154,207,43,167,22,46,201,57,45,165,93,43,203,19,
+    148,147,193,229,8,165,193,230,213,108,206,77,13,228,135,181,
+    255,190,255,27,1,127,98,62,65,26,227,77,214,11,187,238,
+    155,121,18,14,131,180,160,55,183,18,248,130,169,87,14,67,
+    198,86,144,232,74,176,194,144,30,231,246,208,37,183,189,238,
+    227,243,228,213,36,68,84,23,56,9,25,132,124,153,104,167,
+    21,137,36,181,160,186,88,38,41,138,23,197,124,49,175,137,
+    34,142,19,2,131,19,9,26,238,130,102,91,14,203,89,77,
+    62,115,145,84,146,154,230,12,78,149,11,231,233,28,222,10,
+    8,17,81,164,90,22,69,21,164,34,74,188,254,227,62,21,
+    231,38,203,215,180,139,165,226,228,5,89,153,153,204,149,148,
+    114,169,40,23,53,117,178,108,165,193,18,86,39,23,136,37,
+    196,92,121,81,4,165,79,148,175,97,112,135,229,46,159,129,
+    39,28,185,102,200,140,122,134,128,199,215,209,215,124,219,135,
+    225,181,240,35,190,103,131,239,169,240,125,85,190,79,231,251,
+    126,232,66,145,206,91,57,157,31,174,240,195,85,126,152,52,
+    106,93,221,171,220,90,100,179,171,7,170,26,47,172,69,30,
+    241,131,27,252,96,133,31,170,242,67,186,83,190,7,45,25,
+    33,44,107,139,184,152,243,219,143,113,236,222,129,96,171,34,
+    154,119,167,230,209,61,134,104,148,106,226,30,131,251,65,64,
+    64,79,225,1,170,183,11,178,38,170,121,165,68,93,108,185,
+    215,255,81,117,83,175,3,251,40,1,215,81,45,158,88,187,
+    166,243,61,120,144,116,235,228,224,28,57,54,108,57,214,91,
+    153,189,193,238,90,192,155,185,20,104,57,234,122,216,249,192,
+    21,132,201,102,49,15,9,41,64,54,88,178,249,190,199,16,
+    63,109,243,176,201,170,225,167,175,186,194,220,33,43,220,119,
+    87,153,71,47,34,173,195,195,30,65,152,99,208,57,178,69,
+    207,163,37,116,149,61,135,150,152,116,240,228,25,12,20,176,
+    3,130,166,78,237,33,186,122,61,29,49,194,160,43,112,70,
+    144,195,96,103,127,125,194,96,223,62,176,207,136,42,51,19,
+    150,254,84,60,10,83,209,188,154,47,170,90,182,152,147,241,
+    8,12,196,230,136,203,97,237,40,198,37,156,14,80,251,80,
+    76,21,214,73,217,86,234,114,118,88,81,149,139,146,40,95,
+    201,19,134,203,41,191,177,90,97,204,1,159,21,106,179,205,
+    88,252,143,7,63,58,248,225,161,181,67,159,230,110,95,248,
+    92,253,108,73,79,78,234,49,40,166,128,186,122,110,238,53,
+    5,62,210,91,19,198,244,250,242,77,34,121,75,122,52,48,
+    181,49,48,85,25,152,174,14,76,63,152,171,36,14,85,19,
+    135,116,225,208,227,175,227,125,38,226,34,189,62,192,163,174,
+    222,155,51,55,103,204,8,233,61,126,252,88,237,36,2,60,
+    24,157,237,65,95,245,68,103,119,176,95,109,103,8,108,237,
+    54,191,165,110,67,76,203,144,179,21,57,107,81,211,250,83,
+    144,207,21,90,26,144,247,112,93,3,178,62,3,114,39,29,
+    251,69,65,121,199,175,40,212,128,65,188,11,244,62,5,96,
+    12,0,205,27,227,128,105,155,100,170,209,36,177,188,42,94,
+    190,162,208,156,176,220,237,183,132,111,34,11,84,167,168,1,
+    76,142,106,119,92,175,47,84,187,183,243,119,251,42,137,189,
+    213,196,94,93,216,251,76,58,21,8,207,247,251,146,232,211,
+    232,46,246,175,204,46,246,217,179,1,30,166,223,143,251,224,
+    171,94,68,117,217,0,191,68,192,114,162,49,7,16,191,86,
+    96,118,59,0,136,121,131,3,151,61,153,243,133,40,10,56,
+    139,14,88,139,50,254,101,69,111,63,117,69,8,88,137,59,
+    150,207,101,115,23,101,17,56,222,179,149,189,167,81,217,237,
+    185,82,177,72,130,72,180,144,151,251,252,34,214,207,149,65,
+    134,45,150,207,167,70,32,161,86,249,164,78,139,149,175,158,
+    139,208,146,39,52,222,247,68,105,165,159,144,214,154,211,224,
+    115,15,184,122,13,2,195,221,86,53,93,183,179,187,33,242,
+    47,244,255,102,214,203,180,133,39,232,215,186,107,120,123,245,
+    37,55,224,196,144,211,130,125,190,37,110,184,25,23,180,213,
+    26,123,221,23,158,222,15,145,35,80,31,202,140,79,227,17,
+    234,148,52,175,226,52,178,67,211,96,21,101,145,228,82,109,
+    65,92,202,22,200,29,134,186,140,17,149,220,1,99,139,173,
+    232,179,180,11,87,27,53,205,90,238,117,16,192,107,4,168,
+    32,99,202,77,178,142,105,44,14,212,184,13,73,182,21,198,
+    85,96,244,59,212,152,100,231,111,159,221,136,141,232,177,17,
+    179,29,141,79,175,30,89,155,91,59,81,21,70,170,66,186,
+    54,182,219,223,213,105,217,20,58,96,232,145,48,182,33,140,
+    221,125,235,193,209,138,240,74,85,120,69,119,138,229,31,97,
+    251,84,242,92,156,152,95,42,225,203,133,82,86,114,114,220,
+    17,212,224,200,130,74,162,223,193,90,238,241,107,194,63,243,
+    123,160,179,67,46,105,135,28,28,117,72,177,221,250,74,182,
+    176,40,63,23,161,5,117,41,175,145,192,145,196,210,162,230,
+    8,254,70,163,224,29,32,158,31,115,185,191,81,120,255,236,
+    71,190,15,24,218,97,125,192,128,78,139,245,1,137,124,81,
+    35,78,182,88,214,232,161,84,86,181,18,241,48,255,160,74,
+    206,141,57,185,245,97,252,21,166,49,13,63,219,225,155,4,
+    121,224,233,120,94,160,249,119,63,47,136,189,121,59,240,231,
+    87,200,141,251,50,29,181,147,128,71,229,5,49,227,221,121,
+    68,55,200,159,9,219,149,98,37,224,174,179,141,38,144,167,
+    81,70,220,81,98,118,231,143,92,8,172,61,59,106,121,64,
+    175,117,210,159,115,148,127,184,84,212,112,169,80,32,61,154,
+    41,192,25,172,116,177,19,209,3,151,131,168,26,108,57,95,
+    50,218,200,128,109,48,137,228,9,187,107,27,213,73,17,111,
+    2,56,129,26,83,68,167,187,215,56,76,151,147,45,183,34,
+    103,26,158,142,212,143,17,61,0,116,160,72,27,156,236,119,
+    109,240,187,42,252,120,149,31,215,249,113,95,202,168,198,6,
+    63,223,243,217,254,207,94,219,136,77,233,177,169,90,124,120,
+    93,218,136,239,212,227,59,107,19,179,55,185,143,35,213,142,
+    145,245,95,85,59,70,171,29,187,106,7,142,215,143,204,212,
+    226,67,235,103,54,226,105,61,158,174,29,248,101,195,164,78,
+    139,25,67,194,110,194,153,28,39,58,8,219,116,243,249,221,
+    61,57,192,233,160,222,101,47,185,120,245,17,137,127,134,154,
+    15,18,214,121,152,228,232,230,195,4,25,252,51,32,11,84,
+    41,155,112,149,88,123,79,231,251,173,64,139,193,225,88,36,
+    231,99,146,88,141,206,133,82,22,75,244,102,149,207,22,242,
+    203,178,84,23,95,97,71,216,127,88,194,6,240,190,167,199,
+    152,255,52,169,249,174,9,43,13,87,219,159,234,89,219,211,
+    255,198,169,46,205,185,27,163,151,230,130,182,147,171,144,155,
+    22,11,50,185,253,151,75,196,157,212,57,162,152,121,173,84,
+    54,66,228,78,170,201,146,193,146,44,102,116,169,246,188,165,
+    51,17,212,231,238,115,103,1,188,141,26,157,184,77,84,173,
+    139,29,37,172,191,242,213,77,253,5,72,207,81,59,17,151,
+    17,146,38,98,35,175,51,53,216,169,30,9,147,27,194,228,
+    195,208,67,245,203,87,43,251,143,85,247,31,171,76,189,81,
+    157,122,163,34,204,85,133,57,221,41,223,140,239,121,120,248,
+    203,88,101,239,145,234,222,35,149,241,163,213,241,163,176,245,
+    85,133,157,58,45,246,105,18,164,110,157,58,51,142,105,251,
+    159,110,218,70,197,91,102,106,216,89,220,132,234,169,156,109,
+    80,185,163,233,217,226,53,235,57,193,232,82,178,87,45,213,
+    138,217,226,53,81,163,163,142,150,197,214,90,238,165,170,180,
+    221,185,84,246,17,46,111,111,210,120,43,180,47,128,229,129,
+    122,237,79,251,148,255,128,171,8,51,85,97,70,119,202,230,
+    248,238,22,202,141,17,191,128,184,43,103,243,216,8,43,214,
+    91,111,157,178,221,173,184,72,149,253,228,39,163,247,88,162,
+    76,86,244,251,178,171,78,50,238,181,3,164,231,221,211,88,
+    63,94,107,159,135,240,49,194,150,164,170,101,142,72,89,179,
+    133,53,218,200,169,103,65,134,135,110,185,40,227,52,103,233,
+    93,2,32,3,170,0,223,38,106,214,107,182,243,186,227,28,
+    234,178,146,36,150,115,206,172,72,89,213,31,234,90,97,60,
+    4,229,191,76,149,255,3,143,122,118,84,186,71,171,221,163,
+    171,66,109,112,231,170,80,229,251,107,253,169,219,115,208,234,
+    173,13,189,4,245,64,109,120,194,58,56,12,234,180,80,237,
+    147,189,235,100,122,8,158,173,138,89,69,22,69,35,42,138,
+    74,9,156,140,180,5,81,124,119,49,91,176,103,194,162,40,
+    149,114,162,136,33,173,88,251,23,236,140,244,145,0,183,3,
+    128,123,180,193,45,148,74,5,60,1,253,221,200,190,177,97,
+    216,55,241,126,0,175,2,56,12,0,158,106,240,49,0,199,
+    1,128,86,48,60,76,97,216,122,241,111,0,128,137,12,150,
+    4,58,126,7,186,240,80,143,99,0,96,7,199,151,17,205,
+    21,214,171,89,78,46,20,68,145,92,27,147,200,78,244,63,
+    183,110,140,9,7,208,11,242,251,44,125,249,114,126,205,64,
+    32,200,155,8,0,31,15,14,223,58,107,34,82,221,221,67,
+    171,39,131,97,38,216,123,107,201,68,164,106,4,33,20,138,
+    95,63,183,186,82,9,246,87,131,253,102,96,107,176,119,93,
+    50,209,86,152,119,192,119,44,10,37,157,89,115,162,129,34,
+    66,120,159,49,81,4,144,29,224,81,192,200,11,176,124,226,
+    153,150,103,130,219,215,247,194,212,246,187,71,104,229,1,143,
+    39,140,60,55,194,88,240,213,187,35,38,34,213,3,141,86,
+    127,231,104,229,1,143,30,70,250,90,44,124,140,174,243,128,
+    251,47,37,30,5,77,147,234,174,70,43,15,248,9,71,27,
+    9,67,104,114,79,109,124,183,25,110,15,30,103,76,4,112,
+    51,185,125,93,186,253,142,25,164,67,33,68,186,103,110,159,
+    180,49,120,20,109,55,35,30,178,5,189,37,232,88,170,73,
+    184,228,173,110,144,37,233,1,191,84,201,166,207,9,5,201,
+    78,182,109,112,157,189,253,178,201,210,206,203,175,89,141,205,
+    72,155,25,132,134,137,60,232,49,163,99,29,77,220,166,107,
+    93,221,64,63,93,27,155,162,181,205,102,26,232,45,224,231,
+    49,221,196,34,28,156,4,121,98,213,109,99,38,11,157,253,
+    111,210,154,242,33,181,137,28,224,241,169,27,246,0,77,61,
+    52,40,79,166,183,26,33,237,90,57,95,188,64,163,221,74,
+    3,244,173,43,232,230,130,176,27,242,17,39,113,24,17,101,
+    102,162,156,197,89,69,165,25,129,108,209,106,86,181,30,55,
+    219,23,181,124,65,157,112,254,1,72,115,147,51,232,60,66,
+    90,207,243,109,89,251,223,28,244,45,140,230,47,42,213,61,
+    235,181,131,38,144,31,249,131,86,66,60,132,151,145,117,0,
+    85,187,9,52,89,134,97,204,125,44,19,32,251,222,83,65,
+    52,12,173,231,7,58,16,51,172,163,33,127,217,68,221,122,
+    125,169,161,81,189,190,212,208,14,189,190,52,227,152,161,19,
+    1,134,216,169,53,188,57,246,29,173,255,253,132,121,170,184,
+    255,0,210,231,189,109,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/base_cpu_core.py",
+    "gem5.components.processors.base_cpu_core",
+    embedded_module_data,
+    3174,
+    7846);
+
+} // anonymous namespace
+} // namespace gem5
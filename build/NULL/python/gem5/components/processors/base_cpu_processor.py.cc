@@ -0,0 +1,170 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,189,24,251,111,20,199,121,118,239,125,190,243,157,95,
+    181,137,19,123,236,224,199,81,56,243,20,33,128,169,49,52,
+    1,98,147,6,39,85,79,137,86,235,221,57,188,100,31,199,
+    236,218,230,44,83,161,10,169,174,228,72,110,171,10,42,81,
+    201,63,36,40,148,86,85,127,203,159,113,103,93,100,107,37,
+    36,164,42,82,249,237,40,84,170,248,169,223,204,222,211,152,
+    198,109,212,236,141,191,155,157,249,230,123,206,247,56,255,13,
+    53,60,129,202,247,179,223,0,184,131,84,164,10,58,50,132,
+    140,32,176,185,168,139,134,47,227,51,252,25,191,17,200,4,
+    140,96,38,104,132,50,33,190,231,211,195,70,36,19,129,185,
+    95,13,232,81,163,37,211,2,243,160,26,210,99,70,60,19,
+    231,243,176,222,106,36,50,9,152,71,212,168,158,52,218,50,
+    109,124,222,162,183,27,29,153,14,1,137,232,29,164,198,110,
+    35,53,78,218,238,251,16,122,232,171,10,150,233,84,91,175,
+    160,84,226,9,123,73,9,174,255,61,205,118,82,1,183,227,
+    172,108,147,9,199,50,52,229,138,102,228,116,50,249,254,135,
+    110,140,45,78,105,166,69,217,91,55,123,155,182,204,73,89,
+    153,211,204,171,117,180,8,219,184,124,132,77,57,153,25,205,
+    104,220,103,92,22,101,106,62,241,121,44,35,214,2,161,84,
+    83,137,253,68,244,86,226,19,179,182,67,101,197,57,107,201,
+    84,133,133,208,20,49,166,44,149,60,17,60,132,182,42,194,
+    251,212,82,136,109,91,20,22,91,24,47,160,63,105,81,162,
+    236,104,252,44,128,95,130,249,9,202,8,42,202,136,170,144,
+    241,169,34,241,147,192,158,26,114,86,92,65,89,65,245,221,
+    142,101,130,34,34,33,18,190,15,76,31,10,213,125,213,79,
+    34,106,64,13,102,253,106,232,182,255,62,172,60,172,157,205,
+    68,87,208,13,33,211,2,6,13,187,201,138,56,53,17,229,
+    40,168,23,197,240,76,224,92,117,17,43,150,9,170,204,43,
+    14,81,113,150,90,6,150,49,115,1,182,178,184,65,31,59,
+    29,229,39,103,230,52,27,95,213,22,8,64,98,28,195,182,
+    163,234,218,44,158,183,9,181,225,228,162,156,199,142,133,21,
+    74,100,135,212,153,216,140,139,35,107,38,184,161,74,149,147,
+    3,159,92,158,189,70,20,199,78,227,159,206,105,58,193,158,
+    151,106,50,99,213,2,86,14,227,58,155,63,0,4,111,228,
+    241,168,51,71,56,71,108,51,228,60,167,100,231,136,162,101,
+    53,142,76,48,248,82,3,161,49,240,153,201,231,8,150,77,
+    21,95,184,50,193,191,217,190,98,81,240,145,211,36,139,6,
+    118,144,77,71,147,29,205,50,49,48,84,230,44,155,152,169,
+    253,30,251,186,72,178,174,91,139,76,91,3,12,131,169,188,
+    136,115,178,109,131,106,156,76,221,110,216,170,168,230,153,238,
+    156,102,43,186,172,25,132,242,215,3,181,135,191,78,205,235,
+    142,6,154,51,209,8,179,151,145,163,26,35,202,8,170,90,
+    54,75,40,49,107,2,99,7,180,178,241,156,108,99,211,114,
+    240,44,33,38,118,136,13,62,228,196,152,154,154,183,101,101,
+    179,154,162,129,200,121,108,207,231,114,22,5,156,52,71,114,
+    3,156,149,34,110,187,169,44,42,158,21,0,252,78,184,131,
+    28,161,190,217,124,215,214,27,118,234,207,178,240,39,161,249,
+    190,10,200,9,212,247,85,241,54,90,70,235,190,157,206,54,
+    211,63,183,237,189,153,42,237,86,125,170,95,135,116,117,83,
+    100,233,101,89,108,198,94,70,82,176,198,19,93,225,127,169,
+    192,116,74,160,157,176,162,52,202,206,100,57,194,116,30,7,
+    112,9,228,189,3,167,63,233,185,41,44,11,235,59,137,185,
+    77,174,143,208,29,72,162,171,123,24,135,7,194,244,3,200,
+    3,154,45,125,186,96,72,204,188,15,68,87,76,31,116,253,
+    220,212,204,210,24,191,56,105,83,101,44,151,119,230,44,115,
+    140,5,209,24,115,182,101,130,123,237,177,122,200,140,205,130,
+    171,37,37,55,47,213,214,210,185,252,139,200,169,171,196,36,
+    55,114,116,124,105,255,246,0,79,75,18,132,152,35,73,233,
+    83,186,165,200,186,61,158,174,97,79,48,13,211,0,254,14,
+    159,91,168,208,122,6,198,186,186,226,108,38,250,55,18,253,
+    197,196,64,41,49,224,173,54,142,103,220,216,149,180,24,184,
+    180,96,124,52,149,10,185,1,184,74,132,186,225,42,63,215,
+    39,155,121,55,114,149,56,92,105,219,141,26,199,210,149,219,
+    79,7,224,176,27,100,6,89,48,82,126,215,111,19,61,203,
+    189,224,237,68,36,9,194,194,182,37,201,246,115,251,224,91,
+    244,13,182,251,38,128,165,61,175,212,145,121,203,118,0,252,
+    235,22,122,20,142,255,42,180,26,218,12,247,108,132,123,238,
+    206,23,194,61,197,240,80,41,60,84,8,15,125,211,210,234,
+    105,242,165,250,23,243,143,102,49,61,94,74,143,195,107,177,
+    245,76,9,96,203,153,82,203,153,50,242,69,6,183,98,163,
+    133,230,241,248,181,254,187,67,191,31,185,55,178,114,110,245,
+    210,10,124,202,33,192,227,200,20,51,209,3,179,172,60,184,
+    65,74,156,121,106,78,55,69,82,176,114,179,158,157,243,179,
+    130,219,24,71,170,192,99,96,199,248,249,175,98,224,183,203,
+    232,90,141,231,178,32,213,230,78,168,78,17,112,252,59,159,
+    63,135,62,249,201,199,112,230,166,120,211,183,236,91,111,136,
+    210,87,201,179,30,252,118,28,160,26,185,233,87,197,101,191,
+    84,147,98,53,186,44,170,190,37,38,205,174,248,52,156,252,
+    0,162,48,188,211,9,167,189,62,191,22,173,209,217,150,123,
+    88,84,58,221,117,204,70,107,168,98,189,234,238,70,42,167,
+    167,129,251,107,13,243,215,235,243,172,239,62,88,244,97,205,
+    19,116,96,87,242,39,190,23,249,113,195,206,255,34,229,247,
+    99,229,193,87,74,185,8,82,182,163,29,158,109,183,180,227,
+    219,113,232,65,39,85,223,83,253,219,53,250,238,246,216,21,
+    133,174,255,68,193,217,95,199,252,133,0,213,235,255,85,182,
+    40,115,29,101,183,155,178,107,93,169,83,94,22,238,3,176,
+    116,226,165,44,172,153,144,232,161,155,128,54,175,161,62,189,
+    92,118,222,101,52,250,25,192,168,82,72,40,187,236,75,215,
+    63,228,205,141,108,98,153,55,249,188,239,193,139,154,51,135,
+    63,152,159,205,195,76,215,49,148,18,104,139,160,51,195,35,
+    30,150,100,90,166,226,181,251,35,216,32,208,128,229,161,11,
+    83,73,218,107,76,249,33,251,83,45,135,43,72,188,143,210,
+    137,67,244,124,58,213,77,247,50,246,67,12,140,32,86,122,
+    136,57,15,237,24,232,192,235,145,27,103,5,12,122,74,175,
+    114,185,45,208,69,42,196,84,161,41,180,221,24,89,128,2,
+    125,29,138,143,74,110,184,49,27,48,129,191,196,152,211,86,
+    118,184,109,98,230,242,212,133,73,105,250,242,244,228,196,228,
+    187,23,166,223,113,163,172,129,99,77,165,66,40,187,11,148,
+    165,53,202,98,192,13,206,92,152,2,20,202,18,42,101,177,
+    226,118,240,234,9,98,19,105,78,3,161,168,50,151,119,67,
+    208,74,80,48,7,141,240,67,30,11,183,99,218,114,46,48,
+    189,12,16,137,168,231,41,133,223,31,1,58,202,104,237,99,
+    136,130,70,89,78,114,125,160,137,29,224,222,196,21,135,186,
+    93,59,186,110,105,120,119,46,254,49,187,31,255,128,123,120,
+    11,237,174,178,190,17,25,222,234,237,191,119,114,229,252,234,
+    123,255,12,162,215,135,214,103,62,207,20,123,15,150,122,15,
+    66,37,141,191,205,193,175,67,107,194,218,81,192,219,236,61,
+    176,209,123,160,216,59,86,234,29,219,236,61,185,209,123,178,
+    216,123,186,212,123,186,140,132,182,20,7,107,147,91,35,163,
+    107,147,165,206,189,133,206,189,91,71,143,125,37,252,245,252,
+    154,127,51,57,184,145,28,44,38,247,150,216,56,84,72,30,
+    218,138,181,109,198,250,54,98,125,127,88,44,245,191,85,140,
+    157,40,197,78,20,170,227,81,188,123,43,150,92,189,184,118,
+    125,117,106,51,54,178,17,27,41,198,82,165,88,234,81,28,
+    127,145,250,243,199,133,216,219,79,3,190,214,232,115,4,160,
+    140,58,35,195,229,48,138,183,87,233,221,251,121,49,150,46,
+    197,210,133,234,120,21,185,175,127,120,246,169,79,100,116,68,
+    70,39,1,116,130,13,116,118,148,235,174,255,94,116,253,208,
+    189,248,102,207,145,141,158,35,197,158,99,165,158,99,95,31,
+    191,88,140,95,42,197,47,149,81,11,152,51,209,185,153,24,
+    221,72,140,22,19,251,74,137,125,155,137,195,27,137,195,197,
+    196,209,82,226,104,25,133,227,71,30,37,59,203,162,216,53,
+    248,212,231,111,107,127,142,0,148,57,136,162,182,31,120,118,
+    250,226,120,233,205,83,197,228,233,82,242,116,161,58,30,39,
+    187,170,155,159,143,23,147,135,75,201,195,133,234,248,166,125,
+    168,16,27,226,17,156,138,177,174,207,148,13,2,93,95,84,
+    98,247,127,94,103,243,152,36,93,159,151,245,202,78,72,146,
+    84,75,145,36,202,178,20,109,67,149,118,142,182,48,144,100,
+    32,206,192,41,30,117,149,6,80,33,186,46,73,208,161,179,
+    196,108,179,84,247,35,47,5,117,84,1,107,95,237,207,16,
+    111,249,170,159,178,24,15,132,203,136,129,190,96,96,240,174,
+    186,126,178,212,55,86,70,48,127,53,72,162,96,226,214,207,
+    10,9,92,12,12,148,2,3,101,177,47,48,252,37,92,50,
+    248,250,106,134,127,213,193,83,31,10,14,86,145,182,237,113,
+    224,101,54,38,223,116,170,203,13,194,47,51,72,60,158,226,
+    195,213,232,230,65,239,5,59,207,1,44,27,184,33,104,146,
+    231,29,77,247,130,187,149,77,237,116,245,127,17,220,84,110,
+    23,239,48,237,180,92,249,119,131,196,223,185,241,220,68,101,
+    175,57,13,181,215,80,107,49,203,13,238,198,107,191,39,88,
+    166,245,124,194,132,126,80,73,205,204,212,47,194,167,60,135,
+    142,211,139,188,12,177,98,0,176,236,19,4,161,252,22,18,
+    122,10,168,187,113,148,253,65,65,4,155,126,71,208,138,132,
+    61,5,212,211,56,30,163,145,66,243,216,66,135,10,205,99,
+    11,13,21,154,199,78,56,195,133,230,81,14,30,23,192,115,
+    47,131,66,247,232,83,246,253,124,135,61,110,163,127,3,253,
+    174,122,174,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/base_cpu_processor.py",
+    "gem5.components.processors.base_cpu_processor",
+    embedded_module_data,
+    2323,
+    4946);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,176 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,237,88,77,108,219,200,21,30,146,250,161,20,217,146,
+    29,199,150,157,31,211,155,173,18,109,83,217,78,179,65,98,
+    100,131,56,63,235,166,40,146,0,89,20,168,208,45,67,139,
+    35,155,187,20,169,29,82,113,108,200,64,14,6,234,109,3,
+    180,5,182,200,30,122,240,161,8,178,200,30,182,64,23,216,
+    67,207,61,203,129,139,8,4,22,8,80,160,128,111,10,178,
+    5,218,160,135,190,25,254,136,178,164,108,218,67,15,69,40,
+    234,113,200,153,121,239,241,189,111,190,225,204,95,81,232,136,
+    122,215,231,63,3,113,31,169,72,229,116,84,225,138,92,133,
+    47,242,21,161,40,112,72,229,85,65,143,84,162,197,40,148,
+    35,106,84,143,85,226,197,120,69,44,138,236,62,166,39,42,
+    201,98,146,67,60,90,64,106,124,3,169,34,142,63,16,16,
+    122,36,248,70,138,251,212,196,77,148,79,238,210,155,188,224,
+    8,243,198,170,35,94,181,49,81,108,147,56,145,31,105,150,
+    189,75,91,231,57,39,97,222,198,132,104,42,182,118,57,250,
+    132,119,134,230,23,45,155,40,37,123,1,27,94,143,116,85,
+    33,182,102,107,166,33,19,197,88,194,159,113,206,200,37,179,
+    82,213,241,157,160,209,37,147,224,82,248,85,135,252,87,253,
+    23,136,159,195,203,98,84,228,84,84,228,213,113,149,199,130,
+    42,168,145,114,100,19,149,57,53,186,49,80,140,184,207,112,
+    20,199,198,3,21,101,120,221,141,72,49,158,64,225,159,58,
+    161,14,96,81,29,132,127,26,250,100,224,63,4,255,97,248,
+    239,247,244,102,212,145,141,104,49,241,95,244,59,0,253,146,
+    234,40,222,135,83,109,63,92,95,213,49,240,101,128,71,120,
+    16,167,31,64,176,30,113,65,253,65,53,187,17,121,0,165,
+    71,65,159,98,102,19,221,225,138,67,144,136,67,78,102,111,
+    180,136,8,77,156,132,81,171,200,37,8,156,229,196,8,182,
+    107,196,184,86,226,247,160,133,230,233,185,13,226,183,220,125,
+    100,115,237,202,78,115,91,161,154,246,81,71,91,124,207,231,
+    220,231,92,231,43,124,206,119,222,3,214,16,184,46,92,203,
+    115,36,237,66,37,202,60,5,60,69,173,90,21,19,71,148,
+    101,205,208,108,89,118,6,228,18,193,138,141,101,191,69,196,
+    194,122,153,245,115,18,178,92,210,21,203,146,101,139,190,138,
+    36,221,125,49,103,145,210,116,117,213,94,54,141,233,37,92,
+    121,123,186,4,209,49,13,108,216,214,116,149,152,37,108,89,
+    38,177,216,83,136,153,188,228,7,173,80,93,37,35,160,99,
+    109,124,111,56,11,190,43,111,65,181,117,22,196,63,238,162,
+    175,197,129,143,227,247,226,79,196,236,99,49,251,169,253,100,
+    114,246,241,228,236,87,87,27,147,179,219,147,239,238,76,190,
+    219,16,179,219,226,194,142,184,208,16,23,90,124,44,145,106,
+    33,16,207,233,219,119,100,33,226,103,225,20,98,99,150,219,
+    232,200,67,125,79,36,47,239,201,12,68,145,95,59,147,148,
+    188,227,18,139,148,164,72,58,140,66,201,44,75,189,6,82,
+    33,104,94,10,231,149,122,178,159,122,242,22,243,100,9,242,
+    251,126,102,157,235,143,138,223,240,247,0,128,159,33,178,15,
+    177,177,205,23,102,28,78,182,120,150,8,146,133,203,139,228,
+    57,234,8,141,245,249,181,147,221,113,13,39,182,112,78,55,
+    75,138,110,157,47,180,251,156,161,1,159,4,113,23,53,210,
+    243,238,249,112,246,47,153,55,183,51,185,157,76,46,120,70,
+    198,61,16,49,2,201,243,100,20,238,25,66,194,222,144,3,
+    52,189,71,94,238,6,77,131,53,197,76,182,68,148,185,200,
+    129,250,47,163,95,104,219,51,23,118,102,46,192,205,118,122,
+    126,7,140,138,174,81,71,152,173,88,47,226,179,51,51,11,
+    23,167,173,221,11,212,12,53,185,11,253,209,174,74,91,136,
+    106,13,236,0,189,57,17,184,98,39,185,8,47,250,161,108,
+    105,107,216,17,43,154,33,43,170,10,120,175,40,119,220,82,
+    156,168,50,140,128,146,147,84,21,91,145,117,173,162,217,37,
+    49,148,168,164,15,153,191,177,68,117,192,37,82,143,218,66,
+    232,30,125,16,128,173,19,72,157,164,190,46,218,241,87,233,
+    117,25,189,127,230,167,80,183,158,88,79,214,147,91,17,212,
+    227,168,115,117,190,46,212,197,122,34,196,113,92,187,188,167,
+    134,15,213,196,234,241,7,224,199,163,192,23,14,221,59,171,
+    10,0,242,136,242,79,112,54,0,238,123,203,154,37,149,107,
+    70,137,198,85,90,209,116,93,130,216,49,220,27,88,33,18,
+    76,49,229,178,86,146,108,83,82,160,206,94,198,18,203,174,
+    164,25,244,38,208,19,140,126,208,97,47,179,118,48,27,41,
+    21,75,178,170,184,164,149,53,172,22,146,65,235,57,86,39,
+    249,249,156,3,55,176,4,44,187,136,9,29,107,182,86,250,
+    16,188,2,101,84,79,91,53,181,76,61,241,158,180,173,119,
+    29,158,219,133,189,22,105,47,215,26,97,195,219,150,86,150,
+    181,146,235,175,181,106,192,5,108,75,20,46,18,196,5,208,
+    172,78,175,16,205,182,177,209,165,170,13,190,189,238,47,174,
+    218,16,32,240,115,17,119,168,112,67,131,149,210,114,127,199,
+    97,132,225,143,106,216,178,187,236,249,0,119,173,233,230,10,
+    24,91,52,107,134,202,34,6,143,104,37,112,178,196,134,110,
+    103,228,250,219,99,25,15,156,196,82,153,152,149,105,219,236,
+    182,238,13,42,215,122,173,90,253,159,90,247,6,178,107,156,
+    150,96,18,82,192,12,216,166,189,253,152,89,146,82,49,141,
+    165,0,169,62,78,212,190,30,248,29,11,76,179,235,68,72,
+    255,138,89,211,85,154,70,104,166,128,78,179,175,162,91,183,
+    128,185,164,239,249,158,222,186,213,245,14,109,14,114,95,3,
+    92,173,25,108,106,113,225,102,180,113,19,138,200,226,106,199,
+    48,235,113,180,135,199,34,46,211,1,98,217,102,181,170,65,
+    24,188,26,24,96,109,103,24,167,178,207,154,107,249,40,73,
+    50,226,213,177,65,134,105,41,129,1,196,216,229,86,200,167,
+    236,114,64,126,159,59,11,228,168,56,70,197,113,42,242,84,
+    208,25,142,124,151,138,19,84,65,140,101,223,114,56,205,137,
+    48,154,160,19,90,56,220,108,246,152,1,177,118,176,107,246,
+    104,91,156,131,6,214,6,162,83,199,223,231,208,240,212,86,
+    246,225,153,47,111,126,53,242,167,137,63,200,127,148,183,135,
+    174,236,12,93,217,140,125,61,38,109,141,252,126,98,123,236,
+    196,206,216,137,22,74,36,6,153,248,120,97,115,126,211,110,
+    166,50,191,186,254,139,235,205,76,182,153,25,105,102,38,154,
+    153,209,95,127,244,73,226,211,169,79,82,29,197,49,168,123,
+    150,22,7,6,191,65,32,90,109,33,248,250,216,236,212,123,
+    218,184,129,232,180,1,36,31,84,1,173,31,94,23,235,98,
+    159,239,60,151,208,97,106,233,73,208,71,84,142,126,133,188,
+    34,65,67,168,85,179,242,154,160,95,19,244,107,130,254,63,
+    34,232,107,240,209,205,200,152,49,176,59,200,243,137,87,101,
+    96,242,125,74,157,137,48,235,186,156,251,118,127,206,117,109,
+    208,77,1,235,58,227,220,214,28,58,48,254,201,15,219,148,
+    186,121,185,155,78,179,236,124,69,250,116,18,65,16,122,175,
+    217,46,247,98,210,177,117,190,206,247,99,210,189,235,224,123,
+    89,151,61,215,158,6,161,188,137,1,112,20,102,62,71,86,
+    21,24,229,196,144,84,92,134,121,70,165,185,107,39,71,33,
+    75,48,249,25,118,55,11,6,109,230,164,121,201,93,16,135,
+    250,153,139,31,224,146,13,118,128,171,220,245,143,229,27,124,
+    9,42,60,87,168,127,196,172,45,45,75,176,98,211,25,182,
+    42,24,12,168,22,197,221,141,213,247,92,69,11,184,23,66,
+    166,44,108,203,158,41,153,142,76,217,117,174,189,20,207,11,
+    46,112,78,7,208,112,23,247,30,40,232,170,176,199,106,242,
+    91,213,254,146,106,58,237,98,101,216,195,10,151,56,207,4,
+    195,202,147,212,201,199,169,147,95,156,221,78,189,179,147,122,
+    167,193,206,150,224,55,113,103,212,112,94,5,31,7,23,123,
+    225,96,116,157,171,115,189,113,208,185,142,6,20,140,121,40,
+    120,252,178,9,212,178,21,98,119,32,67,241,110,205,170,79,
+    151,126,13,93,66,23,164,171,118,160,207,157,130,117,203,148,
+    170,208,154,54,45,107,196,178,37,172,99,10,31,9,42,24,
+    22,58,103,198,144,93,37,80,101,224,149,192,14,190,141,201,
+    170,173,85,40,53,131,195,112,82,68,208,73,185,43,239,3,
+    76,143,159,34,127,145,206,210,27,94,164,211,175,168,30,139,
+    244,142,206,247,105,167,83,110,38,7,131,76,78,49,225,101,
+    242,200,227,212,145,237,148,180,147,146,26,236,164,121,116,27,
+    120,155,5,236,107,50,31,39,116,173,79,222,160,226,40,242,
+    22,239,228,77,42,190,227,223,130,171,25,68,191,60,135,233,
+    174,148,161,84,176,44,59,73,89,174,152,106,77,167,229,148,
+    44,83,30,247,106,4,205,176,217,78,18,161,59,108,36,133,
+    188,157,7,71,176,108,194,190,34,25,173,17,202,34,68,240,
+    1,77,232,39,21,73,248,17,112,6,188,157,173,18,214,117,
+    89,6,119,199,232,59,83,52,93,112,227,52,232,11,202,167,
+    86,131,99,187,82,254,175,197,139,209,20,80,90,52,181,117,
+    148,93,30,170,236,210,95,140,68,162,23,185,45,171,133,232,
+    245,161,221,56,245,131,157,233,171,238,93,15,153,65,227,71,
+    154,35,135,155,19,135,154,217,241,102,246,112,115,108,162,57,
+    113,176,53,116,44,10,244,9,226,233,240,129,86,148,222,196,
+    80,122,184,21,167,37,17,29,200,182,18,180,148,68,251,71,
+    91,251,104,41,69,75,3,180,52,136,160,71,154,150,50,180,
+    29,83,52,140,146,131,173,253,190,202,144,248,49,215,199,124,
+    142,182,200,121,230,115,129,249,92,96,62,23,152,207,5,230,
+    115,129,249,92,96,62,23,152,247,85,134,196,13,46,25,61,
+    223,28,159,218,58,250,187,195,45,1,202,79,19,3,173,40,
+    92,91,168,83,100,81,44,125,247,39,141,180,180,29,157,218,
+    137,78,181,248,56,8,228,139,103,2,138,189,209,253,184,45,
+    24,80,89,138,175,229,83,78,204,94,165,179,175,139,152,136,
+    15,47,103,176,102,107,186,85,240,55,218,25,140,156,97,197,
+    219,101,111,147,159,11,45,182,114,26,237,218,251,100,91,95,
+    46,82,25,172,14,81,193,172,179,93,60,241,156,11,245,243,
+    228,10,163,43,192,219,159,65,192,144,226,184,214,233,8,199,
+    3,42,254,3,145,66,220,241,6,58,22,62,91,188,64,107,
+    191,93,136,136,59,219,64,103,194,103,43,118,155,227,32,98,
+    189,101,99,236,248,51,86,248,166,79,3,246,158,255,6,6,
+    128,114,171,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/complex_generator.py",
+    "gem5.components.processors.complex_generator",
+    embedded_module_data,
+    2419,
+    6471);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,296 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,237,91,221,111,27,87,118,191,67,114,200,33,69,145,
+    250,160,100,73,150,172,145,19,219,162,227,72,118,28,187,187,
+    222,196,187,206,135,211,236,110,132,180,49,182,93,22,232,104,
+    196,25,74,227,12,103,152,153,161,29,9,20,234,135,0,85,
+    1,63,228,33,219,108,139,46,224,135,172,225,192,45,234,63,
+    161,40,246,125,41,129,168,133,1,2,24,88,44,208,188,209,
+    176,3,20,251,212,115,238,157,79,138,178,213,69,118,177,5,
+    68,13,15,239,247,61,247,227,252,206,57,247,142,126,67,34,
+    31,222,251,125,242,43,32,159,19,133,40,156,78,234,92,133,
+    227,48,156,208,19,245,100,37,89,79,85,82,52,158,212,249,
+    122,186,146,174,103,42,25,26,79,233,66,61,91,201,210,48,
+    175,231,234,3,149,129,122,190,146,135,120,90,201,232,131,245,
+    66,165,0,97,65,201,234,197,250,80,101,136,134,115,250,112,
+    125,164,50,194,145,4,121,135,40,3,159,16,37,175,114,119,
+    147,132,220,79,250,76,85,70,105,222,32,228,21,238,38,32,
+    39,17,228,148,104,78,17,114,134,212,145,158,90,99,202,240,
+    7,164,60,242,53,70,202,156,155,122,219,104,214,203,9,55,
+    121,197,88,119,133,119,29,213,146,29,211,130,132,212,251,166,
+    229,184,249,247,215,175,89,114,173,166,85,223,81,13,40,62,
+    80,179,204,250,7,106,213,52,20,27,10,101,29,243,199,178,
+    163,26,213,117,119,216,49,223,83,235,166,181,254,134,108,40,
+    55,53,197,89,251,58,201,186,200,154,55,84,203,210,20,213,
+    254,154,99,41,249,43,43,182,99,201,85,231,77,211,82,33,
+    62,230,199,161,19,198,0,102,84,163,75,192,249,75,48,69,
+    151,64,37,21,78,33,149,132,194,85,146,74,162,146,82,146,
+    21,94,73,193,192,120,55,239,49,252,158,9,61,110,212,174,
+    173,169,162,195,82,196,58,36,137,85,93,182,237,92,78,132,
+    207,181,53,205,102,113,17,2,178,33,170,48,25,162,99,138,
+    54,176,208,83,77,51,68,25,66,144,92,87,101,67,51,86,
+    107,77,93,188,41,175,47,208,150,44,156,124,107,16,200,82,
+    57,237,10,146,100,200,117,85,146,220,156,36,65,237,166,142,
+    225,188,36,125,212,148,117,47,39,35,73,138,89,133,64,90,
+    215,12,85,182,220,180,5,19,103,214,191,36,79,112,156,191,
+    251,190,109,85,23,27,235,206,154,105,44,174,170,245,11,139,
+    85,179,222,48,13,213,112,236,197,134,101,86,85,219,54,45,
+    155,166,234,234,199,210,170,63,115,82,21,120,92,104,172,91,
+    195,200,17,146,179,240,181,95,4,114,43,248,235,38,146,188,
+    208,37,72,114,164,80,188,117,117,119,176,112,235,42,254,89,
+    147,126,181,216,244,15,249,211,127,177,103,250,85,152,126,21,
+    166,31,190,41,149,87,120,248,166,225,155,129,175,160,242,181,
+    33,37,251,73,170,146,86,114,176,52,3,110,233,77,198,173,
+    183,66,239,203,150,92,183,221,20,206,175,43,40,77,224,95,
+    51,13,55,5,191,170,155,91,209,205,234,135,146,173,109,64,
+    94,93,51,36,89,81,44,8,201,31,179,80,198,82,164,134,
+    106,85,221,156,34,59,178,164,107,117,205,169,102,35,44,227,
+    138,224,14,124,114,131,178,220,226,90,68,10,50,91,9,136,
+    113,65,44,9,177,64,124,90,41,136,5,2,211,226,33,150,
+    10,98,105,136,241,65,44,3,177,116,16,19,32,150,241,99,
+    10,7,67,78,200,32,218,4,183,160,183,78,193,158,106,208,
+    177,71,55,99,159,13,9,181,12,71,134,237,97,137,53,211,
+    98,117,84,16,81,27,247,104,213,82,97,158,68,85,115,214,
+    32,95,22,217,54,18,77,43,104,141,109,40,191,203,5,49,
+    202,71,176,95,68,220,47,108,195,219,180,21,219,17,205,154,
+    95,46,104,171,135,111,100,7,42,152,122,19,151,76,148,107,
+    192,149,184,188,92,191,176,160,25,182,35,27,142,6,188,45,
+    47,227,40,170,178,174,171,202,66,208,210,82,89,112,121,137,
+    174,121,86,10,22,157,151,232,170,15,72,145,101,207,74,193,
+    186,67,208,95,120,65,242,87,126,64,10,151,190,156,117,83,
+    182,170,215,172,25,220,191,199,144,204,34,17,145,204,33,57,
+    142,228,5,36,40,11,54,110,21,49,152,41,68,21,20,91,
+    205,208,28,73,218,152,233,183,81,23,252,236,239,97,253,183,
+    168,64,117,143,147,241,169,173,212,237,220,238,228,28,252,20,
+    118,199,38,105,236,232,137,173,84,71,152,240,83,189,159,137,
+    89,248,25,244,51,219,244,161,2,183,84,206,88,35,200,218,
+    40,146,146,47,130,110,18,96,209,77,106,134,99,45,98,218,
+    4,18,42,160,200,175,53,237,147,75,200,208,141,30,9,159,
+    224,79,62,42,76,117,121,248,237,166,201,232,120,55,131,33,
+    129,20,71,186,89,12,229,200,216,68,119,0,67,121,204,29,
+    196,80,1,67,69,12,13,145,145,177,238,48,134,70,176,220,
+    40,134,200,62,132,177,52,189,47,102,92,6,25,248,251,8,
+    106,108,145,26,167,112,159,8,149,100,130,168,128,26,119,33,
+    255,126,32,140,128,39,105,37,169,164,106,41,133,255,36,117,
+    23,82,238,7,77,86,50,128,46,2,160,139,0,232,146,85,
+    178,240,205,193,119,0,190,121,248,98,173,33,208,136,169,74,
+    238,0,229,10,80,110,128,114,144,239,225,96,12,116,103,111,
+    207,131,144,58,4,53,10,202,176,90,84,135,38,131,28,143,
+    215,17,200,27,62,64,175,163,80,110,228,0,229,74,80,110,
+    116,139,124,204,85,74,0,36,227,1,118,198,85,100,192,51,
+    137,0,222,207,129,252,140,251,156,56,145,220,248,104,238,68,
+    235,237,83,134,35,14,191,95,94,20,32,87,73,20,32,105,
+    44,168,167,112,81,128,84,18,48,146,164,124,187,7,18,123,
+    160,8,118,187,106,213,228,170,186,208,23,23,21,181,6,64,
+    7,8,184,22,41,74,241,72,238,109,201,89,147,29,241,166,
+    166,235,30,86,6,205,201,162,173,90,26,52,2,64,167,104,
+    181,154,106,129,90,21,157,245,6,75,138,0,38,118,139,77,
+    53,109,200,90,142,26,67,203,128,193,65,131,30,22,3,222,
+    2,79,215,213,170,67,217,179,215,13,248,113,0,53,227,45,
+    70,217,108,234,138,184,66,219,87,66,172,13,192,157,218,27,
+    61,170,195,102,227,2,213,96,123,88,237,33,63,246,206,32,
+    127,15,106,131,241,18,142,179,177,38,195,104,66,64,190,10,
+    232,227,242,118,19,48,149,193,12,234,48,55,27,112,233,22,
+    37,175,29,137,161,63,0,165,151,0,54,141,159,101,171,78,
+    57,97,45,208,170,146,68,215,74,146,108,220,147,226,45,6,
+    87,216,118,128,172,177,109,28,32,235,95,65,17,251,77,32,
+    255,115,139,124,51,66,178,133,127,200,220,206,60,20,38,118,
+    132,137,109,97,170,35,76,181,133,169,175,38,79,252,211,177,
+    127,57,70,1,117,118,14,145,116,122,119,98,138,2,235,52,
+    141,78,182,233,67,81,201,77,53,208,140,77,91,170,211,180,
+    140,165,106,160,228,163,242,130,218,130,25,8,215,131,204,208,
+    56,80,8,236,90,110,9,6,135,182,143,133,224,239,13,148,
+    134,217,16,61,13,82,128,85,49,96,249,37,165,42,87,215,
+    212,141,23,250,142,54,94,168,134,141,32,248,223,34,143,142,
+    29,199,97,117,132,163,109,250,48,96,125,190,50,171,10,145,
+    97,229,252,97,57,116,88,81,16,112,34,195,191,30,218,59,
+    28,88,67,73,176,122,120,176,110,50,119,161,173,251,65,123,
+    155,96,211,92,15,109,33,97,149,219,232,17,127,42,226,129,
+    248,123,34,254,239,144,16,23,222,90,211,168,82,83,129,202,
+    35,40,114,42,33,17,107,34,48,96,252,61,11,82,128,69,
+    60,131,100,63,67,4,118,182,211,43,83,48,197,104,235,216,
+    65,251,180,79,144,50,29,100,42,98,30,161,253,114,67,5,
+    249,91,167,61,45,47,131,229,98,57,254,142,6,235,5,77,
+    151,61,40,32,63,31,7,156,136,207,177,2,194,166,136,166,
+    193,16,161,161,86,181,154,6,9,30,103,43,170,110,222,140,
+    0,221,37,154,46,250,102,209,37,106,179,129,83,178,2,230,
+    21,34,147,86,253,144,77,23,182,214,11,119,166,159,18,34,
+    221,158,143,143,68,189,61,98,45,214,155,69,145,12,128,115,
+    77,171,174,245,224,24,218,91,104,211,193,48,149,197,155,150,
+    230,128,239,183,167,169,208,130,235,101,127,101,221,81,169,237,
+    10,107,17,109,2,22,200,89,19,85,144,134,253,25,199,245,
+    250,168,169,218,206,158,254,124,35,145,245,6,243,9,157,173,
+    152,77,64,67,156,49,72,194,76,112,151,16,28,87,213,248,
+    204,237,223,31,221,51,1,147,160,97,192,241,93,116,204,189,
+    189,123,118,41,235,189,217,104,252,81,123,247,76,97,214,57,
+    134,0,224,101,232,6,250,198,218,254,156,193,174,173,155,198,
+    170,8,251,57,202,65,68,231,236,51,217,54,243,26,24,19,
+    145,246,111,250,138,75,69,151,54,42,2,189,159,229,229,115,
+    103,207,138,47,251,156,46,47,239,25,67,104,196,179,97,0,
+    171,77,131,42,54,182,221,140,112,223,68,102,132,9,237,179,
+    246,75,40,30,43,106,205,115,114,26,13,240,220,253,28,16,
+    176,152,22,228,153,69,77,29,231,113,36,127,134,228,187,64,
+    190,204,50,192,127,62,20,187,60,147,236,62,238,69,14,118,
+    130,196,64,110,99,182,175,98,8,11,160,34,122,242,62,85,
+    10,223,92,38,195,39,190,202,79,116,242,179,187,249,210,110,
+    126,104,55,63,78,3,240,140,66,248,241,112,118,56,247,148,
+    0,217,226,187,37,34,190,216,153,61,255,160,249,96,117,123,
+    246,117,166,28,247,106,197,63,57,125,241,111,191,143,190,136,
+    187,183,127,194,250,34,170,46,14,181,69,79,83,135,218,226,
+    80,91,132,159,255,167,218,226,72,76,91,88,63,32,253,15,
+    152,168,6,96,176,245,12,13,192,10,252,35,54,132,174,16,
+    67,236,168,195,206,251,136,221,166,136,29,117,91,236,82,235,
+    128,206,125,43,130,232,214,171,81,212,190,147,34,125,62,209,
+    242,119,248,126,37,20,46,126,140,18,143,113,68,73,126,64,
+    156,193,72,249,68,191,18,229,148,252,105,98,95,109,80,211,
+    44,128,119,240,154,16,217,52,42,50,176,84,50,126,141,117,
+    216,114,134,130,43,22,243,148,35,248,253,81,83,67,127,26,
+    97,23,26,59,131,13,216,166,168,197,14,9,152,158,233,109,
+    200,199,229,160,177,229,229,184,79,12,232,79,53,15,58,225,
+    176,136,182,136,237,212,125,165,228,195,59,22,57,131,41,6,
+    246,74,213,135,29,52,233,239,51,236,55,82,71,102,135,9,
+    176,27,125,140,136,182,182,32,190,11,157,234,48,140,134,217,
+    176,99,155,156,205,149,170,171,117,244,250,53,35,84,143,182,
+    201,206,16,212,27,170,5,130,161,213,85,166,20,131,105,14,
+    142,109,69,57,104,206,80,111,134,231,9,118,8,10,103,40,
+    20,139,236,220,183,74,193,68,166,181,217,224,35,205,6,77,
+    217,107,20,16,214,100,192,63,195,151,183,61,173,32,187,126,
+    59,244,104,217,214,234,77,84,201,243,101,192,5,241,138,174,
+    135,74,158,30,6,177,170,244,8,7,235,217,123,24,232,233,
+    152,158,90,71,86,52,126,122,77,123,9,55,15,110,254,141,
+    163,75,166,119,124,34,234,106,205,137,42,209,57,60,195,69,
+    233,119,243,120,22,226,91,5,214,119,80,190,240,228,192,229,
+    233,122,187,73,88,40,176,18,45,205,112,202,28,53,43,109,
+    20,1,15,34,6,99,54,197,198,241,190,40,17,43,243,159,
+    216,130,78,232,105,244,20,25,42,117,138,98,151,112,89,17,
+    44,197,135,249,153,157,252,204,118,126,22,108,199,54,152,143,
+    3,197,219,175,119,73,50,123,14,242,110,47,61,204,139,59,
+    121,241,78,233,139,153,135,115,175,236,204,189,242,224,220,246,
+    220,133,206,220,133,237,252,197,78,254,98,219,127,126,155,31,
+    110,143,44,110,231,207,118,242,103,219,254,179,23,148,16,238,
+    40,40,253,7,215,11,74,214,175,163,177,254,240,212,11,30,
+    155,92,139,11,1,103,51,1,177,0,160,54,147,16,11,64,
+    106,51,5,177,0,144,54,121,136,5,39,142,155,105,136,5,
+    87,50,155,25,136,69,77,85,238,122,112,97,180,153,109,37,
+    156,82,200,207,245,1,63,244,33,229,194,122,9,128,53,223,
+    143,243,208,20,110,9,173,236,93,232,237,126,216,99,14,70,
+    30,64,94,43,23,152,195,97,90,188,215,66,159,94,139,127,
+    128,94,35,235,241,224,215,10,94,134,249,167,245,30,8,111,
+    252,242,89,246,56,108,225,192,22,183,34,54,184,151,22,32,
+    97,8,169,90,204,142,6,195,214,209,110,68,48,206,71,205,
+    40,188,121,216,137,214,234,41,59,14,122,113,177,188,182,84,
+    30,102,218,247,93,36,39,145,156,66,50,143,164,140,228,52,
+    157,76,36,103,144,188,76,162,126,158,59,46,49,70,61,231,
+    43,46,187,71,98,37,152,114,14,74,160,192,151,7,152,115,
+    120,5,201,1,175,159,220,140,175,90,112,159,69,204,16,118,
+    84,250,14,144,141,185,254,71,165,17,112,249,47,130,71,135,
+    28,21,253,28,41,142,118,10,199,187,100,46,123,105,183,52,
+    209,41,205,63,44,157,217,41,157,185,247,23,219,165,197,78,
+    105,113,235,237,221,209,137,207,190,183,245,214,238,145,233,207,
+    254,110,235,207,253,216,228,177,206,228,233,173,31,250,169,222,
+    207,248,209,207,140,173,119,252,204,71,197,209,159,181,58,71,
+    78,239,20,79,183,139,167,119,167,142,61,156,186,176,51,117,
+    97,183,52,13,61,237,150,142,209,0,60,71,33,252,184,40,
+    28,29,121,74,128,124,154,233,142,144,185,19,95,12,62,56,
+    242,32,187,45,126,247,211,212,103,131,223,94,75,221,55,185,
+    200,136,187,87,57,50,179,247,244,119,136,93,160,135,183,227,
+    177,3,224,192,142,186,77,190,29,59,234,78,178,95,141,4,
+    59,90,14,0,235,57,86,18,187,55,254,231,168,13,116,213,
+    23,62,124,53,65,117,98,82,66,229,79,70,87,211,242,238,
+    70,192,93,164,163,14,77,218,133,136,44,71,29,65,79,29,
+    154,134,190,46,202,182,221,4,59,192,52,80,147,54,154,32,
+    191,214,106,147,90,14,243,13,211,214,176,123,89,47,135,198,
+    133,231,85,202,85,7,77,250,152,139,107,174,176,43,16,179,
+    143,135,235,185,199,240,64,171,182,182,162,135,246,138,119,147,
+    237,172,89,102,115,117,13,70,132,150,80,244,82,135,250,125,
+    107,178,165,84,77,197,119,138,217,117,56,51,110,66,230,252,
+    249,10,204,128,24,127,80,105,205,4,176,65,91,127,157,94,
+    175,104,58,235,171,6,226,22,227,169,119,38,241,202,201,140,
+    49,229,13,150,242,70,39,18,102,48,168,254,140,153,244,198,
+    183,188,76,153,53,77,221,94,128,1,129,229,161,163,217,209,
+    235,245,4,253,93,18,175,236,101,202,159,112,122,47,68,167,
+    60,192,203,103,184,60,13,25,188,105,203,176,131,25,15,102,
+    43,152,160,90,108,226,162,119,248,60,243,116,16,168,40,76,
+    186,105,106,83,41,212,212,241,239,71,240,0,43,118,63,50,
+    23,1,47,9,119,174,212,43,160,27,23,251,91,60,207,171,
+    135,47,8,217,63,34,20,10,143,61,219,10,18,242,183,7,
+    31,10,211,59,194,116,123,230,101,120,238,41,255,106,108,207,
+    188,222,153,121,125,91,184,220,17,46,183,253,167,255,89,25,
+    98,248,147,28,116,247,35,232,179,231,188,44,34,255,173,103,
+    122,67,155,92,244,114,181,213,227,9,109,38,162,173,130,170,
+    79,108,12,236,105,65,104,9,96,180,8,84,217,63,207,119,
+    227,168,177,144,108,101,91,185,189,103,118,63,33,159,115,20,
+    199,194,86,14,228,223,177,122,222,9,222,27,251,159,224,173,
+    107,170,14,155,105,222,219,153,229,189,87,61,177,83,47,42,
+    51,161,0,178,87,47,16,184,140,192,83,163,45,250,13,150,
+    233,139,91,31,67,158,223,220,124,44,166,133,30,22,222,178,
+    226,254,102,249,120,86,197,60,10,224,178,124,120,172,118,120,
+    172,246,123,246,126,120,172,182,255,231,255,118,172,70,205,249,
+    165,114,218,66,112,178,208,57,179,16,114,153,255,156,103,242,
+    254,99,246,186,100,142,197,222,6,81,254,114,224,192,183,51,
+    105,24,190,102,42,110,14,247,107,16,134,221,195,194,253,173,
+    241,247,128,108,188,212,223,26,239,235,56,140,2,70,62,65,
+    67,241,191,225,239,22,249,230,53,82,154,253,197,250,189,137,
+    237,217,87,58,179,175,108,143,158,239,140,158,223,18,190,42,
+    130,243,189,93,60,217,41,158,220,74,125,53,60,253,243,202,
+    189,23,183,103,22,182,135,23,59,195,139,91,233,221,177,163,
+    91,57,70,10,35,183,141,135,133,242,78,161,236,95,252,148,
+    232,37,16,123,188,75,160,34,94,2,21,115,93,146,205,70,
+    73,9,172,100,172,125,106,167,112,234,30,183,93,56,221,41,
+    156,110,11,177,231,80,207,197,62,223,162,158,235,185,162,58,
+    212,115,135,122,174,239,231,80,207,29,234,57,210,163,231,254,
+    146,98,135,245,19,76,167,239,197,245,213,77,75,228,185,186,
+    41,126,100,245,6,224,154,245,55,196,187,87,2,79,237,53,
+    202,202,88,239,251,199,244,77,64,60,240,180,240,76,210,194,
+    35,85,235,50,18,252,119,2,235,28,146,55,144,188,141,4,
+    143,40,45,244,190,152,67,136,176,106,33,66,91,31,16,79,
+    127,82,70,221,65,239,205,192,170,170,235,146,84,230,44,250,
+    230,50,34,237,15,216,112,206,251,4,135,109,171,9,250,38,
+    96,248,78,243,32,127,188,75,250,144,99,36,93,188,245,211,
+    173,214,54,63,221,225,167,187,9,142,127,225,206,171,224,255,
+    241,47,220,123,139,254,132,228,113,146,164,103,252,66,221,244,
+    105,254,248,163,145,177,46,15,191,221,52,190,27,157,193,144,
+    128,239,60,103,49,148,195,55,162,7,48,196,222,146,198,80,
+    1,223,141,46,98,104,8,203,13,99,104,132,228,10,221,81,
+    12,145,56,249,107,238,143,208,5,29,126,187,248,226,54,127,
+    162,195,159,232,38,134,249,115,93,226,19,28,241,201,32,249,
+    228,60,63,215,37,113,114,141,27,230,191,191,43,206,223,27,
+    253,98,176,155,132,240,163,236,96,151,135,95,172,31,37,39,
+    95,230,95,162,99,129,95,111,44,24,98,99,193,16,27,11,
+    134,216,88,48,196,198,130,33,54,22,12,177,177,96,136,196,
+    201,223,114,127,240,46,250,16,246,162,229,121,42,9,227,110,
+    10,255,13,200,66,43,193,77,59,235,40,196,108,51,227,182,
+    6,107,241,194,2,59,111,177,153,80,208,183,101,5,72,165,
+    250,146,74,180,91,132,104,211,209,116,124,213,243,134,106,57,
+    161,136,187,5,76,183,23,252,255,137,162,34,230,14,202,222,
+    63,64,209,255,222,161,18,231,30,9,210,226,255,219,195,132,
+    141,30,94,79,7,34,19,255,207,128,223,9,175,177,255,58,
+    186,108,173,18,246,191,83,182,1,180,155,228,56,174,123,145,
+    112,227,109,50,22,125,186,137,36,151,232,146,231,147,220,1,
+    203,9,132,155,107,19,49,250,28,188,15,194,205,183,201,169,
+    232,179,27,143,210,148,75,237,248,211,77,103,184,98,151,236,
+    37,159,190,250,24,127,158,134,169,165,73,238,100,151,236,37,
+    143,145,60,13,211,190,243,211,20,7,27,164,63,109,31,61,
+    251,152,6,158,238,83,128,174,199,255,2,144,121,174,191,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/complex_generator_core.py",
+    "gem5.components.processors.complex_generator_core",
+    embedded_module_data,
+    4351,
+    14408);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,122 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,86,221,107,20,87,20,191,243,185,179,31,49,177,
+    49,113,91,83,185,141,74,92,171,155,182,81,17,141,66,76,
+    83,13,146,164,24,173,176,96,55,227,204,77,50,102,103,102,
+    189,51,107,62,72,32,20,41,105,9,180,148,74,3,70,200,
+    67,43,45,82,232,95,82,214,146,135,101,64,40,148,62,248,
+    54,86,251,226,83,207,189,147,157,236,106,44,184,51,123,238,
+    215,185,231,156,123,238,249,157,51,127,161,134,159,178,213,62,
+    251,18,200,15,200,68,166,80,66,5,214,138,37,193,22,11,
+    162,192,250,82,73,178,229,130,12,125,217,84,74,138,173,22,
+    84,1,137,232,2,50,213,59,200,76,16,241,129,132,208,67,
+    169,46,180,144,48,53,34,19,237,237,88,205,164,104,38,239,
+    200,133,164,153,34,26,172,37,38,101,51,13,227,20,140,25,
+    175,10,227,12,140,211,166,48,142,114,45,79,216,150,209,156,
+    16,200,67,78,197,134,86,26,39,254,19,17,38,161,159,24,
+    33,246,136,107,18,163,241,24,66,253,24,221,252,24,4,21,
+    4,19,21,68,83,40,72,166,88,144,77,169,160,152,114,65,
+    53,21,48,77,5,21,137,64,27,252,244,234,149,249,50,241,
+    2,85,247,93,219,50,2,105,230,182,29,136,110,95,160,250,
+    150,109,57,83,129,2,212,165,163,57,45,208,138,69,71,183,
+    73,177,24,164,138,69,219,53,43,37,214,207,20,139,183,42,
+    122,105,107,69,29,184,50,54,50,60,24,72,151,62,27,9,
+    196,49,16,115,101,120,100,120,244,66,160,0,29,187,252,11,
+    122,198,12,124,241,145,71,141,222,242,188,63,237,58,189,83,
+    196,62,209,107,184,118,217,117,136,227,123,189,101,234,26,196,
+    243,92,234,245,26,229,74,209,103,230,229,203,243,84,131,141,
+    156,176,211,121,61,64,150,227,167,214,210,177,252,73,45,213,
+    186,60,88,75,182,44,159,143,134,153,246,229,33,246,208,189,
+    245,157,129,74,137,95,161,78,147,215,152,71,217,165,61,59,
+    24,93,190,112,7,249,13,203,31,163,7,64,31,198,99,240,
+    155,184,112,42,133,225,119,153,11,243,176,142,61,226,99,119,
+    18,235,165,18,246,167,9,6,175,98,110,55,214,61,236,249,
+    20,252,232,229,249,22,67,104,16,205,180,182,51,205,93,92,
+    243,52,90,68,215,147,75,194,162,112,51,102,249,78,92,77,
+    141,35,218,25,221,186,114,91,47,85,72,78,12,196,252,7,
+    129,22,123,135,157,0,99,154,101,158,77,246,131,45,204,155,
+    231,22,14,79,17,191,24,51,21,193,142,34,172,229,251,75,
+    174,161,151,188,115,249,152,51,207,28,250,14,119,104,53,125,
+    60,122,215,230,86,46,174,142,198,67,238,195,156,16,93,2,
+    179,38,114,42,83,25,116,236,168,135,98,88,59,194,36,103,
+    185,228,80,67,153,19,32,233,215,83,64,30,165,143,111,130,
+    92,57,146,27,40,150,83,174,248,77,190,81,235,183,242,59,
+    247,77,243,141,92,63,0,94,66,27,141,252,241,175,249,182,
+    192,151,98,189,63,195,123,84,94,20,12,0,244,56,90,61,
+    104,10,75,162,159,120,221,94,208,211,177,36,45,138,190,182,
+    205,113,179,158,42,208,61,180,40,221,67,247,197,133,22,132,
+    150,196,213,78,191,101,155,203,20,23,97,221,132,189,192,33,
+    63,0,59,31,198,182,126,33,228,100,253,30,12,121,60,92,
+    179,32,100,162,160,228,145,99,184,148,18,195,199,4,32,143,
+    167,172,219,36,154,230,254,217,138,164,60,190,50,109,121,24,
+    94,91,247,141,105,98,98,215,225,178,24,35,219,215,227,97,
+    30,39,121,60,148,159,202,31,197,221,0,233,110,60,219,160,
+    105,120,124,32,15,0,101,146,168,59,11,81,234,96,50,103,
+    144,178,111,185,14,182,38,99,105,141,106,153,66,203,1,193,
+    150,153,79,113,142,137,137,29,47,254,112,110,98,2,27,32,
+    242,6,193,21,15,204,243,93,108,18,159,80,72,36,132,139,
+    229,66,182,113,193,133,213,207,52,233,82,92,214,169,199,52,
+    250,100,206,143,108,240,96,159,14,150,148,137,97,77,206,115,
+    124,177,180,133,125,157,130,13,117,25,167,97,163,110,71,59,
+    78,131,68,210,192,232,110,157,253,40,131,164,30,187,114,80,
+    247,200,49,203,241,136,227,89,62,184,59,66,105,128,22,82,
+    117,12,227,158,133,51,61,216,116,1,204,142,235,71,23,228,
+    65,174,226,231,210,241,140,227,206,58,49,224,243,248,82,60,
+    230,121,245,116,46,17,101,30,165,228,206,18,74,25,210,57,
+    50,32,199,122,65,162,4,46,241,72,57,72,14,213,221,159,
+    147,233,123,140,103,63,227,201,114,79,53,184,184,100,121,62,
+    243,115,144,169,207,177,145,39,243,4,176,149,2,154,241,88,
+    156,164,174,205,152,40,195,226,135,12,143,27,28,143,255,102,
+    81,199,187,33,18,149,46,78,86,180,90,186,237,155,51,95,
+    159,249,234,236,234,217,181,139,235,163,127,164,143,84,211,71,
+    106,237,251,86,198,216,19,74,40,243,126,168,34,220,93,149,
+    187,30,103,143,61,202,246,110,102,123,67,36,40,231,133,136,
+    174,100,106,26,254,137,254,184,80,61,56,240,91,63,16,120,
+    31,105,3,85,13,195,251,119,170,61,20,133,228,201,111,175,
+    2,115,242,36,39,181,125,125,161,84,31,60,149,164,180,250,
+    28,1,9,145,164,168,60,47,52,37,132,84,61,33,252,243,
+    74,66,184,25,243,249,242,142,179,141,188,210,27,240,202,111,
+    192,171,236,200,171,238,200,155,216,145,55,158,181,20,86,4,
+    22,209,246,151,3,20,29,97,225,86,83,209,105,204,22,54,
+    177,93,58,143,161,38,243,72,7,224,177,130,196,160,164,111,
+    37,145,173,58,255,127,64,169,227,4,82,138,49,19,225,32,
+    167,69,9,127,15,35,236,40,148,149,43,218,193,200,91,64,
+    130,221,81,185,47,142,142,141,14,14,12,94,132,66,79,119,
+    195,124,78,228,65,28,180,177,40,4,227,216,215,2,41,218,
+    122,185,177,84,5,25,22,167,245,85,202,138,208,37,248,123,
+    23,16,15,207,54,148,220,189,218,122,127,239,250,254,199,90,
+    219,106,250,238,181,239,63,103,157,93,247,19,235,187,88,39,
+    115,119,106,179,179,151,245,56,83,152,86,179,106,85,222,19,
+    182,161,76,215,218,208,102,26,226,180,59,170,90,25,122,136,
+    169,147,89,110,164,236,250,225,219,102,190,12,240,167,204,251,
+    65,235,13,87,167,166,151,143,45,225,7,229,160,149,24,110,
+    48,27,50,240,112,19,95,42,126,47,180,254,232,75,232,28,
+    237,67,209,23,152,247,24,8,4,182,32,132,39,145,144,90,
+    78,178,167,134,58,170,205,111,13,117,86,155,223,63,209,161,
+    106,243,27,170,138,176,39,68,175,146,21,255,41,107,158,111,
+    207,182,201,194,137,53,111,163,111,125,46,68,208,125,153,236,
+    218,43,168,27,237,33,130,230,231,44,111,94,38,199,91,133,
+    3,107,90,136,160,217,184,198,155,215,18,126,252,255,0,227,
+    52,185,126,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/cpu_types.py",
+    "gem5.components.processors.cpu_types",
+    embedded_module_data,
+    1555,
+    2881);
+
+} // anonymous namespace
+} // namespace gem5
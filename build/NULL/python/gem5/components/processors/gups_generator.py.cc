@@ -0,0 +1,108 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,86,203,111,220,68,24,31,175,215,187,107,231,81,
+    218,148,62,41,76,42,181,116,37,186,17,69,21,168,66,136,
+    170,64,123,10,17,41,7,246,128,227,181,199,137,155,241,163,
+    51,227,150,68,57,228,80,137,34,245,8,148,3,7,78,145,
+    80,251,199,4,132,68,228,19,18,226,208,155,163,22,9,245,
+    196,247,217,235,221,117,95,179,222,207,51,243,205,252,230,123,
+    143,255,38,19,205,24,190,31,127,13,228,62,241,136,167,113,
+    18,106,125,77,195,126,131,55,66,189,175,67,95,247,154,188,
+    25,26,125,3,250,134,215,226,173,176,221,111,23,253,54,239,
+    132,102,223,212,72,131,92,37,94,231,14,241,76,214,222,209,
+    9,121,160,87,135,244,45,207,90,38,221,169,71,56,232,106,
+    89,231,243,68,5,113,228,112,232,55,47,123,158,120,164,151,
+    12,51,190,197,132,8,60,38,31,105,229,204,193,203,3,169,
+    132,227,170,171,44,98,194,81,177,192,201,171,95,46,45,143,
+    38,174,196,130,185,147,58,89,149,78,55,128,124,11,90,49,
+    210,215,60,210,111,152,196,4,233,60,157,129,54,172,233,25,
+    12,52,97,45,214,60,62,218,234,119,238,18,95,243,218,119,
+    102,250,237,6,97,29,102,238,128,32,15,180,138,143,250,237,
+    192,251,193,104,71,223,186,75,190,209,250,83,160,159,149,205,
+    212,4,19,13,224,47,102,150,84,142,80,182,3,122,102,157,
+    144,133,182,12,54,89,54,157,38,158,163,152,205,131,48,80,
+    89,199,229,235,182,47,216,77,215,32,227,214,129,63,90,230,
+    113,2,228,7,237,62,81,218,152,89,23,227,151,9,206,184,
+    169,9,180,45,109,171,177,165,111,53,31,106,59,77,216,217,
+    172,230,87,181,135,141,186,146,232,110,80,167,233,8,56,252,
+    250,26,163,53,173,168,203,29,41,45,139,14,219,245,181,64,
+    150,115,212,99,126,16,49,73,21,236,9,34,197,132,239,184,
+    140,250,176,199,161,50,136,86,57,163,46,56,171,142,247,14,
+    44,15,228,8,110,117,124,78,156,114,143,14,24,77,37,243,
+    0,143,38,28,225,98,31,208,18,17,187,76,202,88,244,232,
+    103,176,52,76,185,10,10,104,136,31,9,161,53,198,131,229,
+    136,63,129,203,227,120,157,58,106,66,138,88,124,186,68,207,
+    193,31,60,21,121,178,144,152,133,3,71,8,208,10,229,222,
+    24,193,37,142,112,56,103,188,75,97,101,93,145,165,203,95,
+    208,115,72,38,80,70,203,123,20,13,169,110,199,35,164,91,
+    142,8,156,72,73,234,128,216,50,97,110,224,7,160,231,96,
+    163,48,223,181,165,43,87,64,247,200,93,11,29,177,222,27,
+    155,251,18,66,134,116,28,83,151,10,228,98,76,113,12,102,
+    41,77,206,121,236,58,10,196,47,0,203,112,163,202,25,112,
+    214,123,22,173,138,202,33,22,244,208,110,48,27,11,16,39,
+    174,176,74,95,190,28,237,185,182,188,86,249,16,92,22,223,
+    102,2,97,47,60,119,252,100,42,148,34,68,105,56,40,87,
+    151,60,137,82,120,49,32,249,232,101,8,173,48,136,10,229,
+    94,126,56,54,25,64,104,56,88,108,122,116,9,67,116,147,
+    137,24,177,68,26,21,138,140,76,12,147,175,134,114,227,48,
+    225,12,161,232,57,20,209,9,227,52,82,69,124,5,33,196,
+    187,2,107,172,151,130,14,79,101,175,6,244,88,194,48,78,
+    0,48,80,221,177,81,186,77,49,13,89,40,102,144,204,34,
+    57,80,214,66,3,35,92,46,118,245,204,144,105,194,160,154,
+    216,118,16,5,202,182,133,137,43,90,89,83,50,238,191,104,
+    119,102,218,118,145,163,182,45,91,48,46,14,218,126,250,190,
+    20,238,66,178,161,214,226,104,97,149,133,23,23,80,201,56,
+    98,16,150,11,163,20,147,11,171,105,34,237,81,2,245,146,
+    13,49,7,24,155,71,106,225,223,171,132,57,11,60,185,12,
+    228,191,109,242,111,143,152,179,223,181,239,181,255,236,28,251,
+    189,115,236,159,215,230,247,222,234,238,157,58,179,55,127,30,
+    104,110,26,7,15,237,19,32,79,144,228,122,123,110,54,215,
+    137,121,124,159,152,166,245,4,73,94,39,143,177,62,185,147,
+    181,78,171,106,36,170,5,23,152,6,149,171,177,121,111,100,
+    205,229,32,114,159,169,56,120,97,64,48,129,175,162,88,209,
+    136,65,214,57,212,133,24,71,223,173,172,148,169,5,151,142,
+    239,7,238,202,202,100,96,148,89,54,180,68,17,84,69,245,
+    243,211,200,45,2,3,250,55,82,169,32,237,165,28,59,116,
+    241,87,240,158,56,140,102,65,105,169,56,130,30,153,169,157,
+    179,121,178,110,204,26,243,26,110,69,23,111,147,124,154,152,
+    51,119,155,226,40,58,188,81,222,48,221,105,140,132,200,9,
+    153,109,103,150,109,135,177,151,114,236,79,219,246,205,212,225,
+    37,71,96,197,207,116,184,77,51,29,138,51,214,118,82,248,
+    81,160,229,4,222,53,226,68,33,216,48,84,92,198,185,109,
+    131,228,175,87,146,127,92,72,46,166,42,114,6,25,63,151,
+    158,174,126,185,69,78,189,185,119,250,108,62,69,13,240,25,
+    144,191,14,31,203,13,28,180,200,220,145,188,141,189,14,57,
+    122,34,55,177,103,145,185,147,63,189,247,253,249,241,242,23,
+    146,79,52,210,58,176,253,213,238,1,250,155,49,255,135,49,
+    159,55,12,99,38,39,64,246,117,210,58,93,155,121,134,20,
+    166,42,196,93,236,78,101,45,181,145,64,213,40,180,207,172,
+    240,98,47,30,220,96,174,146,165,117,102,83,21,112,217,171,
+    190,66,10,203,100,135,156,225,39,200,56,5,10,107,101,115,
+    245,188,176,49,61,139,76,44,45,132,95,21,229,225,104,181,
+    167,157,15,75,191,124,36,206,14,195,86,254,8,36,215,53,
+    77,203,63,32,218,27,187,228,228,228,243,87,125,88,204,188,
+    189,91,127,246,200,187,187,245,103,143,92,216,173,63,121,171,
+    171,129,37,158,39,187,135,207,236,227,251,201,11,120,133,220,
+    255,3,114,245,176,237,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/gups_generator.py",
+    "gem5.components.processors.gups_generator",
+    embedded_module_data,
+    1334,
+    2601);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,95 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,165,84,205,107,28,55,20,151,230,107,103,102,63,156,
+    196,110,236,172,29,119,219,80,154,33,205,186,208,26,74,49,
+    37,193,6,247,80,220,128,73,161,115,17,147,145,108,175,51,
+    31,27,205,108,168,221,13,241,193,208,45,248,216,146,30,125,
+    50,9,118,255,135,254,1,61,108,138,161,102,32,16,232,201,
+    183,49,118,161,228,84,73,187,179,31,113,125,234,172,246,167,
+    39,189,167,167,167,223,123,210,95,96,224,83,187,253,105,192,
+    224,25,192,0,67,15,248,208,134,144,203,146,39,249,178,45,
+    251,138,173,248,170,173,250,154,173,249,57,59,199,116,50,86,
+    60,221,55,108,131,201,42,214,60,211,207,219,121,33,231,188,
+    130,95,180,139,16,72,96,17,96,125,27,96,131,20,247,100,
+    0,246,229,108,83,187,132,205,101,96,229,143,249,192,130,137,
+    254,117,61,174,133,129,227,89,106,162,220,197,152,38,185,197,
+    251,247,150,23,73,144,40,247,66,26,39,165,101,234,206,123,
+    161,251,112,33,244,157,90,144,20,191,9,189,216,89,37,157,
+    225,177,220,113,99,132,143,9,165,53,76,162,99,216,153,41,
+    220,125,16,197,212,113,227,249,144,18,54,126,39,27,51,215,
+    132,58,113,72,185,194,29,36,196,24,36,228,7,70,9,1,
+    54,196,192,150,48,36,50,150,136,130,101,162,98,133,104,68,
+    185,214,91,180,162,183,192,10,196,234,118,193,206,73,128,232,
+    196,216,99,17,236,195,76,143,53,98,226,28,214,87,20,108,
+    108,43,123,108,102,191,183,214,206,183,192,119,208,46,48,66,
+    204,228,114,247,220,253,224,18,51,138,29,26,35,135,211,162,
+    251,196,71,81,109,147,36,133,70,29,59,49,65,94,205,175,
+    197,137,238,122,15,209,10,37,143,92,21,244,63,46,115,106,
+    78,219,12,126,134,207,64,12,251,202,225,32,118,7,52,23,
+    217,64,16,15,120,111,194,166,212,148,15,224,112,102,155,0,
+    245,101,133,222,138,141,129,21,74,156,191,200,247,129,180,39,
+    177,177,148,141,159,168,77,181,9,214,123,190,144,214,163,82,
+    94,22,127,75,217,156,55,43,221,111,158,18,70,70,197,169,
+    156,163,175,226,68,149,120,141,84,120,157,84,86,51,77,181,
+    183,210,146,233,37,230,149,94,230,112,133,129,37,37,170,203,
+    75,45,41,61,238,20,25,194,162,202,150,172,92,162,70,141,
+    58,97,105,64,168,22,212,98,132,40,39,36,49,122,126,105,
+    142,187,209,249,164,201,83,210,89,201,22,42,17,241,86,222,
+    218,137,142,114,187,130,216,172,107,153,24,8,185,158,19,69,
+    8,69,220,85,39,198,173,55,115,17,117,103,234,27,241,90,
+    24,204,172,18,127,118,198,13,253,122,24,144,32,142,102,234,
+    52,116,73,20,133,52,154,89,109,212,35,212,11,6,185,236,
+    252,213,250,6,157,96,158,54,203,231,168,169,102,167,248,136,
+    233,163,239,25,252,179,5,254,30,3,70,233,199,220,78,238,
+    79,125,226,15,125,226,165,94,62,212,203,109,189,252,234,90,
+    229,104,252,189,231,95,254,54,151,202,82,217,60,1,12,206,
+    56,180,148,157,82,170,129,194,88,10,20,99,246,213,164,117,
+    116,117,250,215,39,47,158,30,60,101,134,83,37,102,56,85,
+    58,227,208,250,138,153,89,179,173,133,157,165,195,194,7,109,
+    209,82,131,173,17,11,79,121,110,19,165,206,111,187,70,73,
+    220,160,193,146,219,43,7,246,113,89,20,243,52,224,15,21,
+    43,63,176,222,83,162,254,77,3,172,52,224,146,37,81,126,
+    59,105,69,100,148,78,102,114,36,9,86,41,119,146,148,220,
+    48,8,136,27,35,236,58,238,26,217,60,95,61,213,97,139,
+    59,220,3,79,221,22,120,61,253,62,63,249,161,62,217,22,
+    141,190,203,119,42,242,210,8,28,159,32,148,152,8,249,33,
+    110,120,92,46,32,244,168,225,120,29,13,85,248,230,50,123,
+    136,18,185,22,196,148,159,74,228,136,154,28,10,28,120,185,
+    211,27,220,174,216,173,8,151,120,30,66,22,164,215,121,16,
+    252,188,119,196,41,232,72,6,183,184,98,183,147,198,236,151,
+    74,87,212,217,215,99,19,169,202,122,198,255,232,213,52,199,
+    37,29,140,151,83,131,75,38,24,157,252,229,147,159,110,167,
+    121,62,2,23,193,77,160,141,108,125,219,106,190,84,167,14,
+    213,169,84,130,234,141,221,79,83,192,186,231,11,162,235,195,
+    137,12,180,235,153,209,91,58,1,130,43,17,242,146,53,146,
+    104,241,70,189,22,172,10,26,18,211,159,173,134,15,214,25,
+    229,145,160,73,92,176,14,27,253,171,85,106,196,53,47,170,
+    102,175,189,160,45,41,58,221,167,93,148,189,96,49,25,239,
+    205,13,95,10,90,204,2,120,1,58,193,112,38,223,232,115,
+    157,132,125,65,63,6,252,185,99,116,254,206,32,149,33,132,
+    233,103,0,78,181,193,228,96,75,21,13,74,41,248,191,112,
+    9,192,155,109,240,225,96,59,26,30,138,153,207,219,195,45,
+    213,198,33,227,243,60,180,39,110,159,240,254,236,63,116,226,
+    180,255,2,140,84,238,75,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/gups_generator_core.py",
+    "gem5.components.processors.gups_generator_core",
+    embedded_module_data,
+    1127,
+    2049);
+
+} // anonymous namespace
+} // namespace gem5
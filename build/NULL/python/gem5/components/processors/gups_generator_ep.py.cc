@@ -0,0 +1,140 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,87,221,107,27,217,21,191,51,163,145,52,35,201,
+    222,216,88,177,227,100,59,201,198,155,213,210,200,27,151,148,
+    54,132,144,77,90,146,22,154,13,120,219,82,65,25,143,102,
+    174,236,73,230,67,123,239,104,183,22,94,72,33,96,121,201,
+    203,194,46,201,99,158,76,66,242,176,244,47,177,151,192,138,
+    129,66,160,79,233,147,76,28,40,251,212,115,238,232,107,28,
+    59,163,209,209,153,251,113,238,57,231,254,206,239,142,254,67,
+    198,46,181,255,251,250,14,136,135,196,33,142,228,17,95,170,
+    73,18,234,178,39,251,74,77,17,186,226,101,124,181,166,130,
+    158,113,84,47,235,231,106,57,208,179,78,206,203,251,90,77,
+    19,122,222,211,253,66,173,32,17,153,220,32,142,118,159,56,
+    58,213,182,21,66,158,41,131,5,107,69,167,176,76,42,197,
+    87,248,80,145,226,252,103,205,200,13,3,203,3,61,243,169,
+    227,48,248,45,70,225,159,168,31,178,245,101,183,77,95,41,
+    201,64,45,252,146,50,230,58,148,191,146,146,150,99,159,214,
+    121,196,44,59,186,65,3,202,172,40,100,79,161,241,198,159,
+    111,47,15,27,174,135,140,218,227,241,22,7,241,126,3,98,
+    19,34,166,164,38,57,164,38,107,68,35,78,193,81,168,226,
+    100,40,68,72,85,39,11,122,142,102,169,58,55,156,222,208,
+    59,164,33,57,249,251,165,90,238,144,177,106,67,135,168,51,
+    181,188,76,168,70,245,109,112,244,153,52,152,235,232,247,201,
+    54,252,62,27,90,171,21,58,228,31,82,173,136,249,136,39,
+    83,142,255,254,54,147,97,196,173,88,11,90,190,105,67,24,
+    60,214,121,100,177,200,180,32,73,113,222,167,190,201,33,61,
+    113,177,213,116,172,136,154,158,235,187,81,156,183,189,187,102,
+    131,209,47,236,236,88,212,26,124,49,141,175,55,64,124,47,
+    61,36,145,52,234,76,251,244,120,172,103,116,109,144,199,242,
+    161,237,210,134,188,161,108,100,54,212,231,210,54,96,233,217,
+    0,79,228,185,156,142,30,240,161,64,156,25,107,1,28,249,
+    124,141,26,7,194,53,108,207,226,92,215,141,254,245,249,154,
+    203,147,54,195,161,13,55,160,220,136,96,150,27,68,148,53,
+    44,155,26,141,144,25,126,203,139,92,3,179,147,54,247,75,
+    24,235,242,161,173,213,65,59,12,109,121,142,81,167,70,139,
+    83,7,140,25,77,15,109,133,13,195,50,154,44,180,41,231,
+    33,171,26,127,8,12,88,198,231,208,49,52,82,167,129,189,
+    230,91,236,174,27,172,10,243,99,102,93,191,233,81,159,6,
+    81,226,36,245,235,22,99,224,186,187,234,173,27,77,139,89,
+    158,71,189,161,165,47,45,230,90,65,132,171,70,253,68,140,
+    172,27,22,55,120,147,218,110,195,5,15,235,235,198,205,219,
+    215,175,27,95,209,58,119,35,90,29,229,231,18,154,245,141,
+    17,36,46,25,152,85,241,108,224,51,132,34,114,4,107,135,
+    182,21,37,94,67,224,2,45,70,100,213,61,48,119,192,218,
+    0,84,125,91,160,161,147,190,168,69,35,10,7,182,146,228,
+    31,109,237,173,107,121,109,144,119,72,115,248,21,101,104,118,
+    233,173,229,199,145,156,184,0,224,175,39,163,147,62,142,94,
+    56,33,88,106,224,166,227,38,185,129,8,238,232,197,241,226,
+    46,64,197,66,162,169,26,183,17,83,109,202,66,180,197,90,
+    129,8,100,148,255,40,124,183,41,59,196,205,70,83,198,71,
+    232,162,229,135,173,254,102,186,62,0,52,130,108,220,77,28,
+    237,175,74,223,109,208,161,77,26,56,128,181,0,38,87,70,
+    73,169,168,108,2,10,135,77,162,120,15,197,49,20,83,9,
+    249,169,130,19,110,85,148,88,229,173,38,5,70,48,77,55,
+    112,35,211,140,75,166,205,40,38,82,12,169,228,226,12,167,
+    94,227,72,99,177,102,154,162,208,76,147,231,224,57,89,253,
+    222,207,151,56,179,23,155,235,209,90,24,44,174,82,255,226,
+    34,70,30,6,136,242,197,97,173,240,197,213,86,147,155,195,
+    82,48,105,179,218,92,103,101,176,211,158,61,80,226,213,129,
+    135,231,160,151,255,21,196,255,238,145,55,85,162,77,108,229,
+    30,228,126,202,207,254,152,159,237,78,149,127,154,58,251,227,
+    212,217,238,137,15,186,243,11,221,185,211,221,83,21,144,189,
+    2,153,94,216,35,217,233,137,125,20,61,133,104,115,123,36,
+    175,233,251,40,122,105,241,26,9,39,69,128,234,128,0,127,
+    64,218,151,55,51,155,234,102,110,51,159,38,194,13,37,77,
+    89,95,103,35,101,172,55,187,33,181,11,64,151,169,49,223,
+    228,34,117,52,102,43,119,128,242,165,54,142,201,119,114,29,
+    181,35,119,242,157,76,67,117,228,251,249,40,55,78,161,233,
+    57,191,59,64,200,64,154,74,123,105,136,138,155,212,131,221,
+    54,26,173,192,22,24,4,152,37,187,45,104,144,143,224,19,
+    75,215,236,113,46,207,195,119,26,83,112,13,196,247,234,67,
+    178,10,172,254,247,249,175,165,241,20,108,101,54,164,45,185,
+    13,33,161,227,91,234,86,118,75,121,78,182,51,224,80,102,
+    48,230,91,249,193,73,112,74,170,100,14,67,19,211,17,159,
+    185,88,174,126,18,75,110,172,219,107,173,224,174,32,149,164,
+    27,167,196,186,32,140,164,21,103,246,113,119,15,47,118,2,
+    244,159,245,203,158,203,35,68,220,149,246,133,183,112,52,142,
+    239,234,101,228,36,143,95,169,142,166,252,5,109,126,150,0,
+    12,16,241,158,62,38,38,200,177,169,55,37,82,122,31,224,
+    245,68,122,242,199,167,19,187,243,191,238,206,125,208,199,153,
+    166,150,38,246,8,136,125,20,61,37,53,153,205,99,112,25,
+    134,91,30,43,112,22,197,10,188,129,196,42,179,130,85,90,
+    209,216,44,70,120,100,157,21,7,244,10,101,16,177,211,216,
+    126,6,29,213,68,240,43,198,202,138,113,245,170,8,159,29,
+    7,209,62,245,206,184,111,226,212,127,98,140,120,65,33,149,
+    201,236,217,199,55,119,143,159,127,113,252,124,167,248,239,153,
+    217,71,39,159,104,187,115,23,118,103,150,94,204,44,117,116,
+    108,57,241,173,249,157,249,152,239,206,124,220,209,123,114,58,
+    49,71,137,55,19,164,60,255,232,183,187,51,11,47,102,22,
+    122,147,208,178,135,205,251,253,1,90,146,149,20,214,80,23,
+    229,134,53,8,111,149,18,224,69,110,63,24,98,115,217,13,
+    236,3,71,54,190,169,1,179,3,113,6,97,100,4,20,14,
+    63,203,128,125,245,16,225,43,43,201,57,7,111,123,141,134,
+    107,67,162,198,88,58,57,242,250,12,36,24,94,188,59,12,
+    43,4,244,59,45,30,193,57,204,199,202,227,214,83,128,176,
+    216,48,142,222,26,34,239,113,41,181,206,219,59,144,118,99,
+    176,121,0,178,34,209,74,157,76,130,15,57,121,117,171,148,
+    144,147,3,203,167,192,201,186,105,250,161,211,242,80,47,154,
+    230,23,45,203,75,122,216,89,220,111,44,46,182,128,2,211,
+    38,232,83,96,128,97,97,48,92,131,125,44,252,235,83,181,
+    77,61,207,52,33,128,185,65,0,125,224,148,6,226,67,236,
+    248,111,82,2,131,15,120,121,234,253,238,153,15,123,165,95,
+    168,176,117,32,94,78,151,123,42,62,100,201,204,92,47,135,
+    90,158,64,155,134,154,78,142,159,232,21,80,43,146,233,249,
+    71,191,250,238,252,104,226,161,226,154,84,238,155,44,15,77,
+    150,135,38,203,67,147,229,196,100,185,87,66,141,164,197,39,
+    36,59,121,239,111,59,147,198,174,122,250,133,122,186,39,171,
+    106,169,71,64,236,41,36,123,38,213,114,64,136,236,139,224,
+    49,247,217,104,189,9,239,5,34,161,177,238,95,172,134,245,
+    59,212,142,184,200,117,60,9,13,173,200,245,170,118,24,192,
+    255,138,40,41,233,9,108,226,213,193,63,13,145,253,120,202,
+    234,255,205,24,157,114,98,71,226,233,3,71,31,150,37,43,
+    12,119,161,130,66,184,36,24,45,127,57,1,192,21,118,177,
+    95,33,252,95,32,122,138,36,73,189,223,16,233,228,14,153,
+    31,191,95,166,31,225,238,146,143,118,210,247,75,114,110,39,
+    125,119,201,133,157,244,221,37,75,59,233,187,151,189,42,73,
+    144,178,195,229,78,249,220,158,80,246,143,24,32,98,250,63,
+    75,184,155,217,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/gups_generator_ep.py",
+    "gem5.components.processors.gups_generator_ep",
+    embedded_module_data,
+    1844,
+    3653);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,131 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,86,221,111,211,86,20,191,182,227,36,206,71,27,
+    218,241,81,10,204,48,10,141,180,165,27,12,105,99,21,26,
+    48,137,177,137,174,27,76,211,50,77,174,99,223,180,6,127,
+    132,123,29,88,171,78,226,161,82,219,137,151,73,155,224,145,
+    167,106,168,252,5,251,43,10,66,162,242,19,210,158,186,167,
+    84,45,210,196,211,206,177,227,36,46,45,183,238,201,241,253,
+    248,249,156,223,57,247,220,251,15,233,105,114,251,119,235,14,
+    136,7,196,36,166,96,19,71,168,10,2,234,162,45,58,82,
+    85,2,93,50,83,118,202,145,171,50,232,178,153,182,211,78,
+    166,154,9,245,140,157,117,148,170,2,122,214,84,236,156,147,
+    175,230,67,61,103,23,156,98,181,40,16,145,92,33,102,126,
+    129,152,5,154,95,145,8,89,149,226,143,87,251,204,226,117,
+    82,238,219,192,151,178,16,100,191,105,248,150,231,234,54,232,
+    169,139,166,201,54,164,104,64,241,238,80,198,44,147,242,13,
+    49,234,41,94,172,113,159,233,134,127,201,211,153,9,29,153,
+    107,212,185,230,153,116,67,136,38,236,139,39,92,161,46,101,
+    186,239,177,199,208,121,229,251,201,235,157,142,203,30,163,70,
+    47,25,133,152,140,223,64,44,2,29,148,84,5,147,84,69,
+    133,40,224,130,41,81,160,129,166,76,153,2,5,160,103,104,
+    154,202,67,157,229,245,220,18,169,11,102,118,161,88,205,236,
+    50,87,174,231,76,101,33,85,205,138,132,42,52,183,2,134,
+    174,10,241,90,51,183,64,86,224,119,181,131,86,205,47,145,
+    95,132,106,1,8,42,4,165,132,225,147,23,191,99,200,195,
+    68,160,184,77,71,51,192,15,30,228,184,175,51,95,211,129,
+    182,32,235,80,71,227,214,28,13,10,205,134,169,251,84,179,
+    45,199,242,131,172,97,223,210,234,140,222,54,210,61,110,43,
+    240,143,68,111,205,131,248,83,120,64,124,161,59,152,52,234,
+    81,207,72,183,205,147,71,226,174,253,194,188,56,47,205,167,
+    230,229,39,194,10,100,218,106,156,109,228,137,152,116,31,51,
+    12,28,77,233,199,192,144,27,51,84,221,233,175,106,216,58,
+    231,185,156,218,110,55,102,44,30,245,169,38,173,91,46,229,
+    170,15,203,44,215,167,172,174,27,84,173,123,76,117,154,182,
+    111,169,72,79,18,239,125,152,107,241,14,214,116,220,15,83,
+    155,182,169,214,168,218,228,212,4,48,181,97,35,150,87,87,
+    117,181,193,60,131,114,238,177,138,122,213,85,225,51,14,135,
+    129,14,72,141,186,198,140,163,179,91,150,59,29,194,247,192,
+    90,78,195,166,14,117,253,200,200,134,206,116,219,166,182,58,
+    122,22,82,183,131,112,71,103,150,238,250,248,53,191,205,64,
+    23,85,213,185,202,27,212,176,234,22,88,86,155,85,191,156,
+    188,124,89,189,75,107,220,242,105,165,203,203,121,4,119,212,
+    110,46,156,87,145,206,240,93,197,119,112,33,228,6,44,240,
+    12,221,143,172,5,135,195,52,81,125,189,102,3,220,14,180,
+    56,155,218,88,160,161,145,208,235,177,89,213,247,98,172,136,
+    244,189,209,222,104,215,103,98,190,129,94,239,46,101,8,123,
+    230,141,207,247,166,112,100,2,100,125,45,154,29,141,113,180,
+    194,244,0,169,142,193,198,224,88,110,232,220,222,31,199,198,
+    45,72,17,29,107,78,69,157,196,92,154,163,204,67,44,214,
+    116,67,71,186,252,251,222,219,161,12,15,131,140,80,234,40,
+    154,168,59,94,179,29,76,203,129,196,244,129,141,91,145,161,
+    237,175,210,183,3,154,180,65,93,19,114,204,133,197,229,46,
+    41,101,153,149,96,199,176,125,40,6,80,12,162,120,39,42,
+    123,114,88,12,38,202,82,32,243,102,131,66,41,208,52,203,
+    181,124,77,11,138,154,193,40,18,25,78,41,103,130,20,167,
+    118,125,79,176,64,209,180,112,131,105,26,207,192,123,244,245,
+    123,175,63,227,204,24,107,204,250,51,158,59,54,77,157,115,
+    99,232,185,231,98,118,143,117,246,8,31,155,110,54,184,214,
+    217,2,26,68,178,210,152,101,135,0,104,110,104,231,230,174,
+    196,54,142,194,48,255,1,196,127,247,200,171,10,81,250,150,
+    51,247,51,47,178,135,158,101,15,173,15,28,120,49,112,242,
+    217,192,201,245,195,239,173,15,143,172,15,29,95,63,90,6,
+    217,202,147,193,145,77,146,30,236,219,70,209,146,136,50,180,
+    73,178,74,110,27,69,43,41,182,176,214,36,106,159,28,215,
+    190,175,176,228,11,139,226,162,180,152,90,148,31,144,37,121,
+    73,90,18,150,196,165,84,93,54,133,133,108,111,77,92,22,
+    146,213,235,139,29,85,18,42,153,56,97,244,150,202,44,252,
+    35,179,91,227,88,98,1,126,26,138,230,207,135,126,21,18,
+    176,242,178,180,156,94,78,205,229,65,23,159,144,149,20,128,
+    166,226,209,223,197,251,67,0,44,148,83,187,69,139,225,217,
+    5,49,21,43,31,6,130,22,117,133,51,186,225,197,185,237,
+    72,222,195,198,142,128,254,58,55,110,91,220,199,24,94,152,
+    59,243,102,96,122,83,166,50,142,219,220,230,23,42,221,53,
+    223,34,232,215,81,196,128,226,82,174,71,244,145,125,3,175,
+    138,164,120,172,19,175,191,174,62,61,122,14,131,166,200,197,
+    190,77,2,98,27,69,75,74,44,100,71,219,185,204,116,119,
+    154,150,211,236,112,210,145,164,231,28,195,169,78,97,11,61,
+    98,120,32,207,29,123,187,43,87,113,225,36,154,141,13,76,
+    47,37,77,223,75,188,234,35,7,134,31,126,250,116,255,200,
+    243,253,35,173,126,232,217,196,238,237,246,4,37,178,61,17,
+    122,33,206,48,180,19,110,88,2,102,199,220,253,206,126,190,
+    110,185,198,142,243,9,47,38,80,206,160,90,184,158,175,186,
+    20,42,190,174,2,243,54,86,143,169,169,168,184,195,229,166,
+    94,183,140,169,169,222,210,20,213,249,246,182,11,203,90,120,
+    80,214,155,174,17,150,38,208,111,54,185,15,71,16,231,221,
+    146,50,241,24,232,14,89,230,104,173,26,242,24,20,19,223,
+    217,133,209,196,248,79,184,26,111,18,64,102,129,40,197,165,
+    84,20,70,49,186,169,148,139,88,137,92,221,161,80,137,114,
+    154,230,120,102,211,70,189,160,105,183,155,186,221,30,145,224,
+    0,103,152,242,129,4,183,55,134,188,133,53,35,12,42,67,
+    6,89,30,197,169,208,192,118,129,50,168,109,107,26,120,48,
+    28,123,240,121,148,9,253,177,56,141,3,255,70,89,26,255,
+    129,149,71,143,173,159,56,213,42,190,43,67,236,64,188,28,
+    60,208,146,241,37,77,246,15,181,50,168,101,9,244,41,168,
+    229,200,193,195,173,60,106,5,50,56,252,240,236,31,31,116,
+    23,238,42,46,9,165,54,100,169,3,89,234,64,150,58,144,
+    165,8,242,64,171,136,26,73,138,147,36,221,127,239,199,181,
+    126,245,169,124,252,185,124,188,37,202,114,177,69,64,108,74,
+    36,125,34,209,179,67,132,236,135,206,79,148,251,131,180,63,
+    219,128,211,48,36,52,200,57,231,42,94,237,38,53,124,30,
+    113,221,215,244,45,155,87,226,75,118,200,115,176,191,134,55,
+    107,94,209,219,247,104,45,124,103,88,201,130,254,246,24,94,
+    12,32,146,148,97,224,131,129,206,212,78,221,15,163,21,12,
+    238,56,12,112,11,178,98,39,66,35,40,66,115,195,138,148,
+    29,143,146,227,2,251,184,189,125,248,223,32,90,146,32,8,
+    173,79,136,112,100,141,12,247,62,47,147,175,97,207,233,181,
+    228,179,78,62,90,75,62,235,100,100,45,249,236,54,231,204,
+    90,242,105,165,207,11,192,239,155,98,237,224,232,38,254,110,
+    239,50,22,250,246,63,88,170,112,103,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/gups_generator_par.py",
+    "gem5.components.processors.gups_generator_par",
+    embedded_module_data,
+    1706,
+    3446);
+
+} // anonymous namespace
+} // namespace gem5
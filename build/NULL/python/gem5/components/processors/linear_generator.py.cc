@@ -0,0 +1,123 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,86,223,107,219,86,20,190,87,178,101,73,241,143,
+    216,137,19,39,109,90,165,109,214,153,149,164,25,172,91,161,
+    180,93,87,40,140,18,6,29,131,26,138,226,90,114,170,77,
+    150,189,43,121,107,131,11,97,4,226,140,238,97,176,210,61,
+    244,33,79,97,165,123,216,227,254,140,180,4,106,244,84,216,
+    83,222,20,146,194,232,211,206,185,178,18,59,205,218,202,210,
+    167,239,254,214,57,231,187,231,250,31,210,115,197,187,239,157,
+    111,0,30,17,131,24,212,38,53,90,162,148,24,130,33,218,
+    66,77,44,137,192,99,70,220,142,213,226,165,120,77,42,73,
+    188,44,217,137,154,92,146,41,17,200,53,98,36,150,137,33,
+    155,241,117,145,144,167,98,52,121,73,49,148,27,164,168,110,
+    97,161,72,253,216,117,203,245,182,196,176,160,212,127,48,25,
+    179,12,211,221,162,88,35,248,217,207,111,187,30,43,87,188,
+    107,166,99,178,178,87,103,126,166,81,102,158,229,89,117,71,
+    103,101,103,193,124,66,253,161,235,150,99,150,217,94,159,47,
+    234,204,172,244,154,52,20,153,244,55,192,10,24,101,146,18,
+    53,72,73,80,72,255,207,200,195,39,139,134,98,198,12,21,
+    158,1,224,73,120,82,240,164,225,201,192,51,104,100,171,185,
+    54,169,82,35,183,156,42,197,223,221,223,148,204,196,216,222,
+    167,84,115,198,208,114,172,36,11,196,84,76,117,29,236,124,
+    74,163,54,99,196,24,94,142,173,3,123,186,215,191,52,208,
+    38,119,105,41,9,78,27,245,51,7,12,101,18,244,240,197,
+    217,154,251,58,49,123,246,236,181,43,51,238,214,101,168,98,
+    2,192,22,89,2,48,176,135,226,52,107,122,5,188,226,250,
+    178,209,132,161,224,61,63,6,111,211,87,111,219,245,202,119,
+    186,107,45,154,190,92,179,28,189,108,24,12,88,249,110,200,
+    18,204,208,27,38,171,248,170,81,246,202,186,109,213,44,207,
+    151,152,233,53,153,51,87,81,122,156,156,132,7,3,185,243,
+    19,192,67,250,136,120,116,191,177,223,168,181,158,150,253,171,
+    69,214,132,67,235,105,75,104,137,173,88,43,222,146,90,137,
+    150,252,39,93,151,97,54,57,106,255,83,232,119,35,104,145,
+    128,187,196,185,162,204,114,232,13,12,63,27,70,200,35,140,
+    32,140,34,20,16,198,66,241,197,185,127,138,162,31,119,155,
+    96,176,47,235,186,229,88,158,174,251,41,189,194,76,240,85,
+    232,193,162,234,199,92,211,174,190,239,212,190,162,235,21,187,
+    236,186,186,238,170,80,214,162,107,233,245,121,151,85,102,26,
+    247,188,59,117,103,102,193,172,125,50,83,169,215,26,117,199,
+    116,60,119,166,193,234,21,211,117,235,204,157,177,121,208,245,
+    133,40,234,211,141,123,236,24,204,180,88,56,32,135,233,232,
+    147,63,128,86,119,30,224,223,37,242,106,132,40,233,213,196,
+    131,196,11,185,240,92,46,116,114,35,47,114,167,158,231,78,
+    117,198,79,118,198,38,59,249,177,206,145,41,36,112,23,142,
+    3,15,178,100,104,106,155,40,67,233,93,132,64,36,202,216,
+    54,25,80,212,93,132,128,67,97,88,73,6,4,96,7,253,
+    221,167,2,41,82,65,3,96,69,88,17,87,98,43,137,21,
+    121,69,233,215,3,143,37,237,207,13,63,43,237,88,91,110,
+    11,109,165,45,182,19,85,201,160,203,178,39,246,140,161,253,
+    113,190,122,64,85,16,115,97,241,23,53,242,239,215,119,76,
+    237,142,105,67,44,181,106,211,169,160,230,53,175,174,133,177,
+    212,60,104,229,241,212,170,117,198,75,123,254,61,163,89,158,
+    246,163,101,219,90,211,53,247,166,195,46,110,185,102,106,150,
+    211,104,122,174,86,118,187,115,56,144,161,154,21,24,183,183,
+    204,244,222,160,74,175,208,7,72,152,137,118,108,128,135,210,
+    35,178,0,146,191,117,246,62,237,117,204,106,108,85,90,21,
+    86,227,45,186,159,51,12,178,207,15,180,244,240,213,196,170,
+    8,91,33,1,46,73,68,117,191,10,15,102,113,43,240,132,
+    192,179,69,49,241,30,154,101,24,209,162,236,11,211,103,125,
+    106,133,221,198,34,185,195,238,199,188,235,134,83,224,24,87,
+    230,186,94,226,23,59,1,133,215,234,5,27,18,59,234,249,
+    226,226,236,27,50,237,221,79,211,23,32,1,149,109,247,226,
+    244,254,16,19,39,213,67,253,130,226,6,213,30,24,38,217,
+    220,171,33,146,210,122,212,123,124,141,62,30,91,155,125,124,
+    180,151,134,106,206,200,169,244,54,1,216,69,8,196,190,201,
+    216,73,180,83,96,248,253,126,156,155,85,84,153,134,118,189,
+    231,238,102,31,226,167,134,251,122,126,126,30,225,50,247,0,
+    59,14,176,56,241,86,211,111,224,88,11,205,228,23,236,85,
+    141,228,38,215,10,127,124,246,215,205,103,217,75,155,217,75,
+    109,41,136,245,155,255,86,120,53,76,70,142,252,126,254,89,
+    126,106,51,63,21,228,161,102,27,171,119,187,29,148,208,224,
+    62,81,138,221,103,231,10,193,211,190,69,190,221,107,186,74,
+    110,141,220,167,45,122,120,182,238,223,123,148,60,24,229,89,
+    151,206,129,63,143,162,63,83,174,7,39,181,14,199,119,181,
+    106,85,160,22,253,234,199,184,229,2,119,88,232,168,51,135,
+    58,170,111,48,67,71,125,12,176,68,94,14,23,126,251,50,
+    32,84,153,228,208,190,218,73,14,190,72,30,123,158,60,246,
+    44,169,109,38,181,13,126,7,98,212,33,12,177,204,181,207,
+    82,8,105,132,12,233,158,146,108,16,33,27,21,225,51,199,
+    225,53,87,76,225,1,224,192,126,135,3,64,213,245,90,221,
+    104,218,200,147,186,254,125,179,108,119,91,68,203,241,124,17,
+    18,0,79,200,12,29,201,212,40,250,12,255,73,177,68,100,
+    35,156,35,225,65,80,49,109,91,215,139,148,77,162,89,232,
+    220,174,100,146,17,76,97,195,13,202,245,31,253,2,137,140,
+    31,233,20,38,58,195,19,157,113,80,247,24,242,209,241,206,
+    248,145,96,232,163,56,164,99,128,151,67,35,65,28,11,18,
+    1,150,64,38,147,76,46,80,144,169,36,95,8,6,144,37,
+    177,53,133,44,141,44,131,108,144,228,242,65,22,89,14,251,
+    241,41,135,137,154,14,242,209,228,135,66,137,78,196,85,190,
+    44,188,187,203,34,11,151,69,22,46,139,44,92,22,89,184,
+    44,178,112,89,100,225,178,200,112,217,141,244,228,166,114,34,
+    200,99,153,244,195,69,34,101,150,110,110,100,180,103,241,201,
+    205,248,100,32,8,0,36,130,109,145,72,39,222,172,222,7,
+    46,8,238,229,57,56,202,37,239,94,195,114,22,120,228,252,
+    116,211,179,108,119,58,250,23,202,227,231,231,202,221,191,160,
+    251,7,112,24,83,158,52,242,7,15,103,190,179,67,13,224,
+    26,79,72,184,30,79,138,242,133,80,70,23,217,121,190,101,
+    32,200,184,139,64,172,148,6,231,8,45,108,144,209,222,251,
+    37,57,189,209,127,7,130,72,133,128,188,27,100,66,63,221,
+    32,231,122,239,64,250,138,82,240,193,225,184,49,114,122,155,
+    147,221,255,233,192,237,248,15,143,220,204,148,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/linear_generator.py",
+    "gem5.components.processors.linear_generator",
+    embedded_module_data,
+    1580,
+    3113);
+
+} // anonymous namespace
+} // namespace gem5
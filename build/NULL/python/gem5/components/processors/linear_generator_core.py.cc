@@ -0,0 +1,146 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,87,221,139,220,200,17,111,125,205,72,51,154,175,
+    253,176,103,191,181,246,173,215,99,239,205,134,227,28,108,19,
+    142,220,37,199,37,228,188,152,216,36,100,142,67,200,82,143,
+    87,123,26,105,210,210,158,189,203,30,152,96,200,6,246,53,
+    56,129,11,236,67,48,54,206,67,94,3,249,35,102,150,129,
+    93,4,7,134,188,196,111,50,190,131,112,15,33,213,173,145,
+    102,230,118,150,36,163,86,117,85,119,117,117,119,85,233,215,
+    61,255,64,67,63,169,95,191,249,13,144,39,200,66,22,231,
+    160,22,215,224,56,202,243,14,223,18,26,66,75,108,136,45,
+    169,33,177,54,193,201,180,178,141,44,227,69,71,110,41,13,
+    165,149,107,228,64,150,172,140,147,111,169,13,21,248,172,37,
+    59,133,86,177,81,100,188,226,148,90,229,70,153,67,60,250,
+    8,89,185,199,200,202,227,242,83,1,161,23,66,178,144,70,
+    197,82,239,160,90,225,21,21,106,92,40,255,52,192,196,8,
+    60,82,19,194,226,7,134,143,239,18,163,217,180,205,143,176,
+    27,138,183,61,18,132,234,237,157,65,27,140,200,55,137,215,
+    186,131,77,207,181,252,26,31,42,129,247,177,17,96,215,220,
+    9,43,129,119,11,183,60,178,243,129,225,90,15,108,43,216,
+    124,37,196,179,40,222,231,152,16,219,194,254,43,46,110,81,
+    223,191,231,7,196,48,131,31,121,4,131,60,157,200,48,73,
+    188,32,218,97,14,251,176,156,248,240,239,64,126,11,94,196,
+    168,193,89,168,193,91,28,22,44,30,94,1,139,150,8,175,
+    4,111,6,222,44,188,178,165,52,203,251,168,201,129,63,212,
+    134,196,35,156,193,217,167,176,138,23,92,98,24,188,36,51,
+    61,209,82,31,139,79,161,229,69,58,105,67,177,202,86,225,
+    177,216,200,89,50,206,99,117,38,237,105,242,86,17,218,11,
+    204,98,241,59,22,203,86,233,148,165,210,62,122,200,53,202,
+    224,253,74,56,249,177,237,98,131,140,108,54,148,173,109,16,
+    108,15,60,15,53,14,115,247,28,207,252,76,247,237,93,232,
+    107,217,174,110,88,22,1,206,120,24,115,89,98,233,109,76,
+    204,48,103,25,129,161,59,118,203,14,194,12,193,193,54,113,
+    55,76,121,200,117,60,188,52,20,111,142,128,252,158,123,130,
+    2,110,208,57,186,204,195,161,158,179,116,56,164,160,64,58,
+    171,119,15,233,105,186,237,113,32,137,169,196,131,148,142,219,
+    19,64,202,164,146,8,82,54,149,36,144,210,29,236,101,64,
+    82,82,41,11,82,46,117,53,186,131,158,115,27,181,124,40,
+    249,219,224,141,80,214,117,219,181,3,93,39,212,118,168,220,
+    79,124,28,42,122,234,96,73,103,30,206,235,67,46,86,244,
+    212,199,192,38,78,150,245,196,203,121,125,224,230,154,18,138,
+    62,118,154,164,2,115,144,9,74,38,41,153,162,100,154,146,
+    115,148,156,103,43,208,117,211,49,124,95,215,125,186,7,173,
+    255,123,244,237,123,62,49,215,219,59,193,166,231,174,223,199,
+    173,107,235,166,215,106,123,46,118,3,127,189,77,60,19,251,
+    190,71,252,117,135,165,138,158,238,67,55,33,89,234,237,29,
+    50,15,214,118,231,199,100,82,61,113,65,29,52,252,38,144,
+    127,61,66,223,76,33,165,248,187,236,65,246,88,174,30,201,
+    213,174,60,219,147,103,59,242,108,196,79,41,234,55,87,208,
+    236,165,63,46,126,185,184,47,30,20,79,102,150,89,53,61,
+    3,85,238,100,110,101,95,236,201,213,164,181,95,85,151,160,
+    42,36,157,29,86,222,208,128,132,98,27,96,195,228,135,178,
+    39,77,191,69,68,209,143,38,197,86,218,169,15,190,26,8,
+    37,153,5,166,198,147,5,234,190,90,204,175,36,188,207,51,
+    255,145,85,58,77,17,16,200,197,102,160,91,166,97,110,226,
+    221,11,227,28,49,170,243,75,106,131,6,235,17,122,185,120,
+    129,110,163,39,207,117,88,33,151,161,217,28,206,253,116,209,
+    215,227,69,163,67,52,238,119,42,247,7,219,225,224,83,231,
+    119,111,229,146,136,223,221,180,125,173,77,236,207,33,245,180,
+    230,182,107,210,84,212,30,216,142,163,249,56,208,130,77,172,
+    5,49,210,106,129,167,221,195,90,63,228,216,170,167,54,54,
+    0,114,75,186,73,48,52,235,125,109,200,209,62,247,156,99,
+    206,242,233,26,250,110,82,117,176,157,244,239,106,99,179,101,
+    72,227,19,58,124,142,185,40,146,209,204,194,113,117,237,168,
+    186,214,173,214,123,213,58,13,248,62,60,167,125,69,191,198,
+    139,212,87,13,104,253,25,224,195,40,194,4,194,128,135,208,
+    167,169,49,10,154,163,210,23,92,144,29,25,37,158,161,199,
+    15,207,4,122,3,124,225,119,243,167,180,133,61,225,11,17,
+    94,192,151,173,20,123,14,135,102,26,178,69,211,116,128,65,
+    104,75,25,226,7,179,136,20,171,182,114,67,125,249,116,165,
+    48,250,69,106,225,23,232,9,28,247,35,243,170,227,230,181,
+    184,209,53,199,227,44,30,178,73,216,125,153,102,194,251,90,
+    12,29,90,10,12,144,65,70,160,237,216,216,177,124,237,114,
+    156,35,126,77,51,180,24,65,210,228,122,96,7,155,52,219,
+    82,83,126,27,155,118,211,198,150,214,54,136,209,242,53,219,
+    101,217,56,176,76,33,71,131,83,157,54,187,99,166,112,83,
+    91,248,161,29,36,51,213,115,105,243,77,18,236,180,241,77,
+    45,185,110,124,50,122,215,248,52,85,36,52,59,54,106,5,
+    66,99,66,168,243,8,69,13,66,157,79,150,40,209,40,161,
+    248,16,170,241,2,226,156,38,203,180,253,2,37,52,21,201,
+    91,84,35,23,107,124,8,139,170,101,98,32,73,17,59,204,
+    0,172,219,158,21,230,40,238,167,60,0,127,204,251,52,78,
+    253,69,209,79,137,188,13,100,247,226,216,47,104,244,131,52,
+    64,209,255,27,144,127,194,3,200,91,70,83,75,127,218,121,
+    54,245,151,197,238,210,245,222,210,245,238,228,141,222,228,141,
+    125,249,171,146,118,56,245,231,217,110,105,173,87,90,219,23,
+    191,170,204,255,225,110,111,225,237,191,138,221,133,119,187,149,
+    107,189,202,181,253,204,201,244,220,126,46,38,197,137,3,247,
+    184,88,59,42,214,78,212,169,19,181,124,176,145,144,158,58,
+    127,162,158,99,165,124,112,43,110,120,93,81,74,185,175,17,
+    144,8,41,202,48,153,66,165,73,106,105,245,168,184,250,140,
+    235,22,175,244,138,87,58,242,72,57,253,137,11,253,247,141,
+    131,254,119,56,100,233,158,90,57,228,199,141,0,141,20,30,
+    70,19,159,27,58,17,68,242,189,52,236,146,31,24,36,32,
+    244,112,35,235,104,20,238,10,172,47,197,187,229,113,209,26,
+    85,161,6,222,65,236,76,144,213,99,121,230,72,158,233,202,
+    115,241,193,112,34,171,7,197,99,121,254,72,134,200,124,249,
+    105,87,190,218,147,175,118,146,194,156,4,231,83,149,101,108,
+    133,222,60,92,163,133,117,61,204,233,122,203,179,182,29,202,
+    171,186,254,235,109,195,233,247,8,112,203,13,5,219,13,216,
+    233,77,40,84,144,2,37,20,80,200,85,74,216,70,169,75,
+    136,152,100,29,41,82,114,131,109,176,127,155,48,177,227,232,
+    122,141,35,151,18,15,252,48,206,210,114,66,232,64,127,133,
+    99,135,127,242,68,252,170,116,233,229,196,116,36,65,29,101,
+    80,105,34,202,82,78,70,211,213,72,161,92,14,77,158,139,
+    242,148,83,41,87,160,92,17,193,136,18,229,202,84,175,66,
+    185,9,148,43,70,147,148,67,103,145,159,115,40,83,122,244,
+    171,253,189,174,52,223,147,230,35,158,147,46,30,190,27,33,
+    168,158,253,152,85,3,242,90,64,153,133,68,41,202,136,210,
+    122,132,70,137,122,94,186,122,88,125,86,239,45,223,136,16,
+    240,223,37,239,176,201,58,165,183,186,210,74,79,90,137,120,
+    94,90,139,80,66,168,253,75,167,155,7,132,5,147,249,109,
+    163,54,17,102,0,173,108,247,62,11,3,96,194,181,186,119,
+    111,11,238,17,126,28,18,22,43,118,187,148,161,43,176,205,
+    207,124,6,87,97,9,196,237,192,118,232,189,3,254,241,4,
+    49,126,81,232,10,139,180,221,175,39,127,132,88,228,195,130,
+    209,255,215,195,238,116,44,17,194,243,105,219,232,141,47,206,
+    1,186,192,231,40,94,44,13,247,183,242,15,226,76,123,143,
+    252,132,125,50,16,243,127,3,137,4,142,227,162,239,35,110,
+    190,131,230,134,75,36,138,28,15,30,253,63,72,14,113,203,
+    29,164,13,151,136,23,104,239,127,39,48,246,114,7,173,14,
+    151,147,81,145,181,220,236,140,150,40,115,155,227,32,48,227,
+    105,103,118,253,53,99,190,62,67,129,249,231,63,57,65,159,
+    95,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/linear_generator_core.py",
+    "gem5.components.processors.linear_generator_core",
+    embedded_module_data,
+    1937,
+    3969);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,124 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,86,221,107,27,199,22,159,217,213,106,63,172,15,
+    91,178,100,217,110,114,215,105,76,17,109,237,4,218,210,130,
+    9,109,110,32,112,185,205,45,105,95,42,26,54,138,102,229,
+    108,187,187,114,103,87,109,19,84,48,197,96,25,210,135,66,
+    75,238,99,159,12,37,121,234,83,255,12,37,4,34,246,169,
+    208,39,191,173,137,3,37,79,61,103,86,43,75,169,219,102,
+    53,251,211,153,153,51,51,123,206,249,157,179,251,27,153,184,
+    148,209,255,147,79,1,238,18,70,24,117,137,71,27,148,18,
+    38,49,217,149,60,185,33,131,156,97,138,155,241,148,134,34,
+    228,172,155,245,212,134,10,178,202,52,87,243,244,134,46,100,
+    221,53,188,153,198,12,37,18,185,76,152,177,67,216,140,173,
+    239,203,132,220,147,211,3,27,57,150,251,144,212,243,7,216,
+    169,211,40,243,95,39,8,15,228,164,163,119,190,176,57,119,
+    152,29,28,72,201,72,254,189,27,65,200,155,173,240,98,167,
+    201,25,12,168,239,219,222,251,29,102,31,208,68,97,46,85,
+    184,108,251,54,111,134,29,254,19,141,202,87,155,62,235,120,
+    227,161,127,119,184,221,154,52,187,156,154,253,11,192,46,24,
+    110,147,6,101,164,33,233,100,250,199,42,76,179,101,166,219,
+    25,102,192,61,3,114,14,238,60,220,5,184,139,112,207,178,
+    185,118,169,79,218,148,149,118,242,13,229,159,245,237,172,173,
+    46,142,31,165,93,98,229,157,76,67,147,136,173,219,198,62,
+    152,117,143,166,115,172,202,230,119,50,251,32,221,27,235,55,
+    102,250,228,43,218,64,39,46,68,197,231,12,229,58,104,68,
+    242,121,47,120,166,158,63,119,238,242,197,245,224,224,93,24,
+    226,232,206,3,178,13,192,80,67,247,187,158,213,2,175,4,
+    145,198,186,176,212,233,248,81,6,254,237,200,184,225,118,90,
+    159,89,129,115,219,142,52,207,241,173,38,99,28,164,230,87,
+    137,164,114,102,109,217,188,21,25,172,25,54,45,215,241,156,
+    48,202,114,59,236,114,255,74,75,159,112,114,14,110,12,236,
+    147,111,0,126,160,119,73,72,143,39,167,141,250,113,98,230,
+    248,234,145,31,165,19,199,105,79,234,201,189,76,79,233,101,
+    123,106,79,187,79,247,53,216,77,75,231,239,75,211,110,4,
+    110,18,112,151,124,165,174,241,121,244,70,5,161,138,176,128,
+    80,67,192,136,240,37,132,229,132,89,138,240,79,93,142,148,
+    160,11,6,71,154,101,57,190,19,90,86,148,183,90,220,6,
+    95,37,30,172,27,81,38,176,221,246,139,110,29,233,150,213,
+    114,155,65,96,89,129,1,125,51,189,182,159,189,19,240,214,
+    250,214,173,240,102,199,95,223,180,189,55,215,91,29,111,171,
+    227,219,126,24,172,111,241,78,203,14,130,14,15,214,185,8,
+    186,181,153,70,125,109,235,22,55,97,167,219,181,231,232,176,
+    150,62,242,42,204,6,215,1,126,223,38,79,171,68,47,236,
+    169,119,212,199,90,237,161,86,27,150,170,143,75,103,31,150,
+    206,14,151,94,30,46,174,12,43,139,195,229,85,20,160,213,
+    254,5,114,60,71,202,171,135,68,47,23,142,16,98,153,232,
+    139,135,100,70,55,142,16,98,1,181,121,61,23,19,128,39,
+    232,239,41,22,168,41,11,174,2,236,74,187,242,110,102,87,
+    217,205,238,170,187,218,93,210,207,244,181,190,212,207,246,149,
+    190,220,87,219,42,163,59,218,36,75,122,116,58,146,151,158,
+    227,13,68,85,186,253,173,145,122,240,163,155,182,121,211,118,
+    33,90,102,187,235,183,144,213,102,216,49,147,104,153,33,204,
+    138,136,153,237,14,23,189,177,7,95,51,157,208,252,210,113,
+    93,179,27,216,227,237,80,37,104,122,182,233,248,91,221,48,
+    48,155,193,104,15,31,74,78,183,5,235,198,199,172,141,23,
+    181,38,169,60,67,146,90,243,100,3,224,7,245,46,217,4,
+    82,95,171,125,77,39,141,220,203,236,169,123,210,94,118,79,
+    217,211,246,228,251,100,31,92,118,79,77,103,191,147,238,44,
+    130,153,180,174,190,0,183,56,30,88,215,35,105,237,92,68,
+    173,68,109,121,76,203,197,241,170,106,186,42,208,5,3,183,
+    147,139,159,133,222,51,99,195,133,154,140,212,187,112,251,252,
+    159,24,53,73,253,181,13,168,21,77,55,184,176,118,188,164,
+    137,187,254,47,161,26,144,99,214,152,128,121,50,87,122,90,
+    38,121,243,100,162,21,181,124,225,144,0,28,33,196,242,212,
+    98,190,58,74,75,96,255,166,93,215,249,25,180,225,5,115,
+    110,100,230,245,228,18,102,242,21,204,152,83,127,107,31,82,
+    54,248,4,109,73,46,176,232,244,180,69,255,12,79,231,73,
+    117,249,255,239,60,168,172,62,170,172,198,21,24,57,196,225,
+    163,145,130,158,24,54,197,26,57,77,153,139,4,95,202,61,
+    242,233,120,234,18,185,86,253,154,246,232,201,5,115,58,57,
+    40,185,179,192,168,72,145,171,19,41,226,4,199,201,33,40,
+    31,132,77,30,10,102,67,81,114,54,125,155,153,240,70,109,
+    183,157,22,38,79,136,11,142,75,205,120,163,43,117,137,159,
+    134,83,162,188,88,111,141,150,192,40,6,38,202,8,7,74,
+    194,237,137,191,95,63,209,223,83,139,125,244,247,27,0,224,
+    104,131,84,22,191,255,79,76,168,190,34,160,127,105,152,155,
+    125,156,59,253,48,119,250,65,206,124,148,51,7,162,197,114,
+    170,144,16,68,19,175,64,94,68,152,69,152,35,163,215,31,
+    47,33,148,211,46,60,232,75,240,119,165,158,199,202,238,67,
+    154,67,101,55,44,203,235,176,174,139,114,206,178,62,239,54,
+    221,209,140,236,248,97,36,67,222,139,74,203,49,60,60,151,
+    210,136,227,103,20,55,82,43,225,5,145,84,248,150,237,186,
+    150,85,167,252,101,52,12,67,246,110,226,139,66,10,216,11,
+    62,164,34,91,210,95,156,37,75,203,195,218,169,225,252,169,
+    225,210,75,195,218,34,202,11,75,195,165,229,184,252,170,2,
+    117,22,224,215,114,53,86,176,147,37,32,169,40,105,164,88,
+    138,117,148,192,117,181,120,6,165,28,206,230,81,42,160,84,
+    68,105,150,148,42,241,28,74,37,212,19,91,206,19,163,16,
+    87,210,205,79,132,6,93,82,12,113,44,252,143,142,69,41,
+    57,22,165,228,88,148,146,99,81,74,142,69,41,57,22,165,
+    228,88,148,240,216,65,97,229,145,126,38,174,96,159,76,195,
+    219,36,91,220,254,120,80,52,31,40,43,143,148,149,88,82,
+    0,72,10,135,50,201,158,249,243,240,49,8,66,8,47,99,
+    144,179,225,173,45,199,223,20,145,139,10,221,208,113,131,181,
+    244,115,83,196,47,170,220,192,111,204,96,173,57,250,162,180,
+    68,159,99,37,142,138,163,57,207,246,144,33,54,199,143,141,
+    168,52,86,29,39,136,96,65,84,121,254,21,45,234,73,66,
+    24,124,160,159,72,242,112,162,222,106,27,9,231,46,240,13,
+    145,181,192,136,159,1,128,217,148,198,111,17,90,27,144,133,
+    201,246,43,121,101,48,221,134,228,252,96,186,13,201,234,96,
+    186,157,164,243,214,96,186,197,217,15,40,5,231,157,140,131,
+    234,43,135,66,56,250,11,5,97,211,31,249,46,246,195,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/random_generator.py",
+    "gem5.components.processors.random_generator",
+    embedded_module_data,
+    1599,
+    3167);
+
+} // anonymous namespace
+} // namespace gem5
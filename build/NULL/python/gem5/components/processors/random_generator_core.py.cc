@@ -0,0 +1,145 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,87,221,107,220,216,21,191,250,154,145,52,154,47,
+    127,36,227,111,57,89,199,153,196,59,46,203,166,36,161,44,
+    221,109,151,109,105,99,194,38,180,116,150,69,40,146,38,150,
+    87,31,211,43,121,19,27,47,132,18,168,11,126,45,105,97,
+    11,126,40,33,33,125,232,107,161,127,196,140,25,176,17,44,
+    4,250,210,188,41,100,23,202,62,148,158,123,53,210,204,172,
+    199,180,29,93,157,123,206,253,56,247,234,119,142,126,186,243,
+    15,52,244,19,250,245,155,223,128,120,130,76,100,50,14,114,
+    153,38,195,16,157,117,88,151,107,114,46,223,228,93,161,41,
+    208,54,206,201,185,249,102,158,234,188,35,186,82,83,114,229,
+    166,12,182,96,230,156,130,171,52,21,208,243,166,232,20,221,
+    82,179,68,117,201,41,187,149,102,133,65,44,250,8,153,242,
+    99,100,22,172,202,83,14,161,23,92,186,145,102,213,84,238,
+    160,122,241,21,49,234,76,36,254,52,180,176,30,250,184,206,
+    69,165,15,244,192,186,139,245,86,203,54,62,178,188,136,191,
+    237,227,48,82,110,239,12,218,96,70,161,133,125,247,142,101,
+    248,158,25,212,217,72,10,253,159,235,161,229,25,59,81,53,
+    244,111,89,174,143,119,62,208,61,243,129,109,134,155,175,184,
+    100,21,201,255,220,194,216,54,173,224,21,147,180,40,239,223,
+    11,66,172,27,225,143,124,108,129,61,157,218,176,72,178,33,
+    210,97,12,99,88,73,49,252,59,136,223,2,138,22,106,50,
+    38,106,178,38,99,113,38,11,55,103,241,38,15,183,0,119,
+    14,238,60,220,162,41,181,42,251,168,197,0,30,74,83,96,
+    145,149,179,242,79,97,23,47,152,212,49,160,36,210,113,188,
+    169,60,230,159,66,203,139,108,209,166,100,86,204,226,99,190,
+    41,155,162,85,176,148,153,172,167,197,154,37,104,47,82,143,
+    165,239,120,172,152,229,83,158,202,251,232,33,211,172,0,250,
+    213,104,242,99,128,200,119,71,30,54,18,205,109,48,108,31,
+    144,135,218,138,228,123,142,111,124,166,5,246,46,244,185,182,
+    167,233,166,137,65,211,31,38,90,30,155,90,219,194,70,36,
+    155,122,168,107,142,237,218,97,148,195,86,184,141,189,13,67,
+    28,130,142,133,155,132,226,205,17,136,223,51,79,80,200,12,
+    58,71,183,121,56,212,115,214,24,6,73,40,20,206,234,221,
+    67,90,150,110,123,12,88,124,102,177,96,101,243,246,56,176,
+    114,153,197,131,149,207,44,1,172,236,9,246,114,96,73,153,
+    149,7,75,206,160,70,119,208,115,102,163,94,136,132,96,27,
+    208,136,68,77,179,61,59,212,52,76,124,71,210,253,20,227,
+    72,210,50,128,5,141,34,92,208,134,32,150,180,12,99,80,
+    83,144,69,45,69,185,160,13,96,174,75,17,31,88,78,11,
+    87,97,13,60,65,196,36,17,83,68,76,19,113,142,136,243,
+    116,7,154,102,56,122,16,104,90,64,158,65,237,255,30,125,
+    251,94,128,141,245,246,78,184,233,123,235,247,45,247,218,186,
+    225,187,109,223,179,188,48,88,111,99,223,176,130,192,199,193,
+    58,166,169,162,101,207,161,25,144,44,141,246,14,158,7,111,
+    187,243,99,50,169,145,66,208,128,17,65,11,196,191,30,161,
+    111,166,144,84,250,93,254,32,127,44,214,142,196,90,87,156,
+    237,137,179,29,113,54,102,167,36,229,155,43,104,246,210,31,
+    23,191,92,220,231,15,74,39,51,203,180,154,158,129,74,62,
+    153,91,217,231,123,98,45,109,237,87,181,37,168,138,105,103,
+    135,150,55,36,32,17,223,6,218,48,216,161,236,201,210,111,
+    17,17,246,35,73,177,149,117,106,131,183,6,66,137,103,65,
+    169,179,120,129,192,87,79,244,149,84,15,88,138,31,94,37,
+    203,148,128,129,60,203,8,53,211,208,141,77,107,247,194,56,
+    32,70,199,252,146,248,32,193,122,132,94,46,94,32,143,209,
+    19,231,58,180,224,203,208,108,12,231,126,182,233,235,201,166,
+    209,33,26,247,59,149,251,131,199,97,224,85,103,119,111,201,
+    105,196,239,110,218,129,218,198,246,231,144,122,106,107,219,51,
+    72,42,170,15,108,199,81,3,43,84,195,77,75,13,19,166,
+    85,67,95,189,103,169,253,144,91,102,35,243,177,1,148,91,
+    214,12,108,65,179,214,31,13,57,218,215,158,51,20,172,128,
+    236,161,15,147,162,129,239,180,127,87,29,155,45,67,35,62,
+    33,211,231,40,68,177,136,102,22,142,107,107,71,181,181,110,
+    173,209,171,53,72,192,247,225,58,141,21,121,27,47,18,172,
+    154,208,250,51,224,135,81,134,9,185,129,14,161,207,82,99,
+    148,52,71,173,47,152,48,63,50,139,63,99,28,59,188,18,
+    140,27,240,11,187,91,56,53,154,219,227,190,224,225,6,126,
+    217,202,184,231,112,104,165,33,95,36,77,7,28,132,182,164,
+    33,125,176,10,79,184,106,75,30,234,43,100,59,133,217,47,
+    50,15,191,64,79,224,115,63,178,174,50,110,93,147,25,221,
+    115,50,207,100,33,155,184,221,151,89,38,188,175,38,212,161,
+    102,196,0,25,164,135,234,142,109,57,102,160,94,78,114,36,
+    168,171,186,154,48,72,150,92,15,236,112,147,100,91,230,42,
+    104,91,134,221,178,45,83,109,235,88,119,3,213,246,104,54,
+    14,60,19,202,81,193,11,105,246,198,44,225,101,190,172,135,
+    118,152,174,212,144,179,230,155,56,220,105,91,55,213,244,184,
+    241,201,232,89,227,211,108,32,38,217,177,81,47,98,18,19,
+    76,192,195,132,53,48,1,31,47,17,161,18,65,248,33,82,
+    146,13,36,57,141,151,73,251,5,34,72,42,226,183,200,8,
+    57,25,241,33,108,170,158,75,136,36,99,236,40,7,180,110,
+    251,102,36,19,222,207,116,32,254,68,15,72,156,250,155,34,
+    175,18,126,27,196,238,197,177,111,208,232,11,169,195,192,224,
+    111,32,254,9,23,48,111,5,77,45,253,105,231,217,212,95,
+    22,187,75,215,123,75,215,187,147,55,122,147,55,246,197,175,
+    202,234,225,212,159,103,187,229,181,94,121,109,159,255,170,58,
+    255,135,187,189,133,183,255,202,119,23,222,237,86,175,245,170,
+    215,246,115,39,211,115,251,114,34,74,19,7,222,113,169,126,
+    84,170,159,40,83,39,74,229,96,35,21,61,101,254,68,57,
+    71,75,229,224,86,210,240,186,42,149,229,175,17,136,24,73,
+    210,176,152,66,229,73,226,105,245,168,180,250,140,233,150,174,
+    244,74,87,58,226,72,57,253,138,115,253,251,141,131,254,119,
+    58,164,233,158,121,57,100,199,205,128,17,25,61,140,38,62,
+    51,244,69,224,241,247,178,176,11,65,168,227,16,147,143,27,
+    94,71,163,116,87,164,125,25,223,45,143,139,214,232,16,226,
+    224,29,68,191,9,162,114,44,206,28,137,51,93,113,46,249,
+    48,156,136,202,65,233,88,156,63,18,33,50,95,126,218,21,
+    175,246,196,171,157,180,80,144,224,251,84,163,25,91,37,39,
+    15,79,119,45,77,139,100,77,115,125,115,219,33,186,162,105,
+    191,222,214,157,126,15,7,167,220,136,179,189,144,126,189,49,
+    161,10,92,36,130,16,10,190,74,4,125,80,2,9,230,211,
+    172,195,37,34,110,208,7,236,159,38,12,203,113,52,173,206,
+    224,75,41,2,63,76,178,180,146,10,50,49,88,97,232,199,
+    63,189,98,118,85,184,244,114,98,58,22,160,142,115,168,60,
+    17,231,137,38,162,233,90,44,17,77,70,147,231,226,2,209,
+    20,162,21,137,86,66,48,163,76,180,10,25,87,37,218,4,
+    146,75,241,36,209,208,89,226,99,6,229,202,143,126,181,191,
+    215,21,230,123,194,124,204,50,194,197,195,119,99,4,213,179,
+    31,211,106,32,94,115,40,183,144,14,138,115,188,176,30,163,
+    81,161,156,23,174,30,214,158,53,122,203,55,98,4,250,119,
+    197,59,116,177,78,249,173,174,176,210,19,86,98,150,21,214,
+    98,148,10,226,255,210,233,230,129,160,193,164,184,109,212,39,
+    162,28,176,149,237,221,167,97,0,78,184,214,240,239,109,193,
+    57,34,72,66,66,99,69,79,151,34,116,133,182,241,89,64,
+    233,42,42,131,185,29,218,14,57,119,192,63,158,48,225,47,
+    66,93,81,137,180,7,141,244,143,16,141,124,84,212,251,255,
+    122,232,153,142,38,66,116,62,107,27,61,241,37,57,64,54,
+    248,28,37,155,37,225,254,86,252,65,146,105,239,225,159,208,
+    87,6,98,254,111,16,49,199,48,76,252,125,196,204,119,208,
+    220,112,137,121,158,97,1,209,255,67,200,136,89,238,32,117,
+    184,196,44,71,122,255,187,128,185,151,59,104,117,184,156,140,
+    154,180,229,102,103,180,196,185,219,12,3,129,25,47,59,179,
+    235,175,169,242,245,25,3,40,62,255,1,8,235,159,149,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/random_generator_core.py",
+    "gem5.components.processors.random_generator_core",
+    embedded_module_data,
+    1935,
+    3969);
+
+} // anonymous namespace
+} // namespace gem5
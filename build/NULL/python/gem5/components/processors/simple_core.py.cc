@@ -0,0 +1,182 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,221,24,75,108,20,217,241,245,111,166,231,231,105,127,
+    192,63,188,52,6,214,158,37,12,97,1,103,119,179,138,48,
+    14,11,6,252,145,13,108,50,81,212,140,167,123,112,147,153,
+    238,217,215,109,27,91,227,44,90,33,101,162,248,192,33,171,
+    181,20,144,124,66,94,193,1,69,57,112,200,97,47,123,31,
+    44,75,88,45,89,66,202,137,91,91,176,18,218,83,234,189,
+    158,158,153,182,189,138,146,99,122,218,245,94,215,171,87,175,
+    94,85,189,170,122,254,23,106,122,132,90,251,198,0,240,13,
+    82,145,202,20,80,198,107,153,12,3,45,91,96,139,92,134,
+    99,144,202,169,124,129,47,10,25,129,246,133,66,168,24,206,
+    132,161,31,82,195,5,177,24,201,68,104,95,44,68,139,177,
+    76,140,65,44,186,132,212,200,125,164,70,181,200,99,14,161,
+    39,156,191,104,38,174,50,211,40,21,123,77,62,198,83,140,
+    35,78,148,108,221,52,178,133,215,132,6,16,220,232,244,48,
+    193,99,237,139,57,29,107,214,107,198,195,199,46,100,45,109,
+    100,242,198,136,137,53,50,14,221,235,139,37,205,202,53,239,
+    41,226,239,169,2,224,79,176,43,13,145,157,100,88,149,201,
+    112,42,171,241,42,167,9,42,175,133,242,161,10,202,51,170,
+    112,63,158,9,171,33,141,207,179,106,248,62,159,17,181,8,
+    165,2,10,192,70,243,176,167,251,252,99,224,245,164,190,68,
+    38,214,68,67,184,133,180,120,94,132,221,238,166,75,84,208,
+    93,38,211,2,187,141,58,209,105,189,88,42,104,68,246,165,
+    149,168,12,207,176,124,171,129,187,37,235,134,101,103,13,91,
+    207,218,154,37,103,229,28,32,229,25,216,176,42,155,134,108,
+    207,106,114,109,187,178,102,204,21,229,82,214,178,210,242,245,
+    89,141,178,10,48,202,97,173,198,195,210,141,219,5,141,142,
+    78,204,220,209,114,246,45,217,204,3,175,172,45,219,192,41,
+    77,231,58,98,174,52,167,144,111,39,76,22,85,116,213,225,
+    116,43,155,227,155,180,26,134,63,98,157,55,127,7,240,53,
+    243,13,178,153,198,96,153,123,202,60,134,239,39,117,28,131,
+    108,174,49,30,212,202,26,139,246,121,236,80,163,191,198,239,
+    71,81,230,202,76,153,125,202,6,189,9,214,230,30,3,199,
+    39,117,174,12,2,58,164,248,190,13,222,12,250,231,199,191,
+    101,156,56,236,74,169,57,149,154,226,112,11,140,226,56,1,
+    9,0,41,214,225,201,254,41,58,21,194,68,32,71,176,230,
+    74,26,118,68,69,209,13,221,86,20,28,35,216,3,68,99,
+    150,94,52,169,82,149,124,54,103,155,120,209,137,40,190,38,
+    83,130,195,91,90,33,223,224,78,185,2,133,146,43,128,229,
+    20,197,34,242,17,245,223,251,241,172,133,115,167,74,139,246,
+    172,105,156,186,173,21,207,157,202,153,197,146,105,104,134,109,
+    157,42,97,51,167,89,150,137,173,83,22,53,177,66,68,76,
+    151,22,113,7,204,95,106,111,216,61,237,139,120,2,6,172,
+    60,128,119,247,208,182,40,173,230,170,98,255,11,177,127,83,
+    236,135,206,182,152,248,115,120,37,252,82,236,218,16,187,182,
+    91,123,95,182,158,222,104,61,189,213,209,185,54,248,236,146,
+    203,161,182,15,119,16,219,214,242,150,0,55,132,90,59,220,
+    8,138,116,239,32,33,18,125,75,128,75,65,11,234,233,175,
+    240,43,45,21,248,189,33,58,118,66,88,179,231,176,145,107,
+    242,10,196,248,62,35,33,18,93,202,232,78,125,8,44,194,
+    192,209,199,7,137,170,25,220,73,68,38,228,50,238,38,220,
+    196,219,154,77,245,24,216,160,143,28,34,212,81,0,247,208,
+    86,178,125,229,143,85,177,15,247,192,103,174,201,229,80,220,
+    95,252,26,71,23,103,239,177,87,208,87,76,192,109,137,51,
+    237,118,219,38,231,188,83,239,171,92,0,95,95,71,229,3,
+    248,186,219,170,66,0,223,112,197,80,0,95,119,121,53,28,
+    192,135,235,120,81,15,45,115,182,212,52,22,169,143,69,2,
+    248,104,29,31,13,224,99,117,124,44,128,143,215,241,241,0,
+    62,81,199,39,116,97,153,47,179,101,110,158,193,93,118,95,
+    131,70,109,41,179,119,146,254,215,223,144,154,124,196,5,245,
+    248,21,3,71,144,223,51,79,42,51,129,121,173,251,205,219,
+    95,202,63,80,253,96,78,109,91,22,140,184,218,14,193,128,
+    237,70,77,188,58,30,113,203,66,179,92,234,129,218,156,225,
+    255,192,243,180,125,164,105,180,213,239,5,131,150,122,176,177,
+    154,218,89,155,217,177,71,138,174,50,95,102,154,49,32,85,
+    200,104,219,77,183,135,138,93,14,69,144,125,188,33,135,61,
+    208,36,83,135,223,43,11,65,125,149,67,193,208,183,28,54,
+    210,71,145,253,65,99,238,49,132,143,128,87,159,108,96,212,
+    238,93,86,232,217,101,205,222,71,194,110,171,44,160,187,220,
+    111,209,2,83,14,195,193,61,148,101,96,136,166,14,47,139,
+    213,194,159,60,71,114,149,109,202,94,40,160,41,171,158,120,
+    104,190,145,229,219,250,188,230,141,64,164,164,184,159,213,25,
+    101,13,85,134,196,47,219,89,12,39,61,45,15,27,178,118,
+    55,167,209,218,64,94,208,11,5,121,70,131,169,216,92,48,
+    100,157,100,49,13,18,164,14,105,206,168,179,208,13,18,58,
+    179,182,62,163,23,116,123,49,29,173,143,124,82,202,226,108,
+    81,246,227,243,39,36,115,214,86,34,121,181,41,29,54,81,
+    67,186,8,16,130,116,13,154,113,76,156,202,225,126,243,209,
+    144,195,13,227,162,35,76,233,86,110,222,17,166,97,114,206,
+    17,38,205,5,72,28,252,152,94,178,156,228,176,109,22,245,
+    92,45,150,77,222,112,132,137,51,164,73,94,215,139,144,162,
+    27,248,208,213,249,34,105,197,49,221,48,49,244,150,4,162,
+    146,129,165,137,1,89,53,33,167,27,166,45,207,102,231,53,
+    216,53,228,7,80,186,110,200,183,134,103,44,27,131,17,104,
+    148,220,55,53,165,21,146,250,128,10,86,83,138,217,210,173,
+    165,136,95,77,12,44,221,220,203,91,254,239,152,251,106,181,
+    2,75,68,139,231,210,30,165,181,20,107,244,211,14,71,182,
+    200,13,79,141,97,226,185,142,48,116,118,70,183,29,246,230,
+    71,75,7,71,178,6,17,35,175,131,51,248,118,1,17,195,
+    3,114,222,196,208,25,25,160,86,144,39,11,26,148,70,32,
+    166,53,7,94,176,104,206,121,146,19,243,235,5,226,134,196,
+    197,76,140,137,235,205,107,216,34,62,4,165,15,73,175,233,
+    84,39,205,237,152,132,101,124,152,128,19,84,140,169,209,233,
+    145,155,96,191,201,225,169,17,176,223,196,231,23,167,192,126,
+    163,147,211,152,4,93,39,52,124,125,98,108,116,196,97,39,
+    206,56,161,235,163,99,163,227,151,28,238,234,205,49,71,128,
+    238,196,148,211,62,110,218,163,196,144,69,80,158,166,94,196,
+    216,4,251,27,217,162,230,136,165,66,214,134,13,20,157,56,
+    248,198,172,110,131,88,32,183,19,6,175,202,218,54,118,34,
+    224,1,38,182,11,250,140,147,240,186,74,209,84,231,10,154,
+    19,27,165,159,30,183,200,69,255,64,164,68,135,203,21,44,
+    175,190,160,165,69,114,151,137,157,3,251,154,197,137,122,140,
+    9,202,73,16,10,175,32,161,159,182,169,120,135,23,144,150,
+    37,34,175,66,33,143,151,151,91,27,244,53,219,47,29,106,
+    74,208,123,70,63,134,73,86,138,37,153,218,61,136,164,246,
+    202,151,228,183,167,40,249,33,132,18,210,202,165,7,55,182,
+    227,73,191,25,125,176,176,183,185,252,32,239,38,194,189,209,
+    74,242,135,14,148,56,176,50,81,237,75,111,199,59,86,174,
+    174,118,146,198,255,188,182,58,72,154,241,213,43,110,44,116,
+    36,10,245,129,43,161,120,242,129,89,141,29,135,119,187,237,
+    184,203,50,173,147,204,42,247,80,116,17,233,53,195,29,142,
+    107,135,2,8,128,139,184,68,139,27,69,241,142,106,239,207,
+    171,49,242,210,185,108,235,24,179,122,249,225,152,139,72,175,
+    25,238,112,60,153,203,147,185,60,204,141,195,220,175,239,254,
+    181,188,17,59,90,141,29,133,130,170,103,160,114,165,114,229,
+    85,247,249,181,47,159,89,155,3,191,172,118,159,247,222,202,
+    21,168,170,64,11,151,87,133,141,120,95,53,222,183,37,117,
+    61,186,252,240,218,134,52,88,149,6,183,165,174,77,233,248,
+    11,105,96,83,26,88,103,54,165,15,214,111,111,72,231,170,
+    210,57,96,217,113,116,237,204,102,251,0,17,254,28,5,91,
+    237,131,235,93,155,237,31,186,156,143,129,194,46,209,83,25,
+    3,113,106,196,85,105,188,122,242,194,119,31,109,158,188,70,
+    186,210,56,165,112,197,72,164,101,251,208,209,109,169,155,172,
+    19,125,33,157,217,148,206,60,251,253,14,199,246,145,146,176,
+    175,165,50,86,25,123,7,230,146,122,73,33,216,210,0,219,
+    109,189,68,47,93,235,93,79,251,136,42,186,40,120,110,253,
+    243,110,227,139,130,221,26,226,96,242,187,119,239,96,243,82,
+    95,85,60,100,17,135,254,190,189,255,226,16,250,126,232,196,
+    103,71,184,192,45,132,156,88,90,212,253,26,145,162,142,133,
+    154,114,13,237,247,208,155,2,19,76,142,112,83,216,85,238,
+    65,50,227,178,23,254,135,100,70,239,102,94,56,251,127,74,
+    105,62,71,239,18,232,209,233,170,119,101,212,188,77,131,70,
+    64,100,79,41,154,218,152,154,98,27,161,8,174,230,33,34,
+    149,174,66,105,255,25,65,240,248,60,242,175,90,244,210,69,
+    170,76,139,175,197,23,26,91,240,1,0,75,242,174,104,178,
+    39,215,252,133,76,60,139,104,68,57,132,164,97,166,98,189,
+    76,30,219,72,30,91,159,125,62,82,77,30,123,145,60,191,
+    153,60,191,213,222,227,114,172,20,133,187,140,4,247,22,0,
+    224,123,145,40,189,37,164,146,228,54,71,194,178,162,56,81,
+    165,22,103,161,31,87,148,47,230,178,133,218,72,88,81,84,
+    51,7,23,62,26,251,57,29,242,33,205,23,164,22,195,164,
+    168,117,98,52,212,21,53,184,183,169,14,79,180,77,55,139,
+    69,127,55,78,162,118,219,203,105,133,130,162,128,50,186,80,
+    237,158,115,222,219,115,204,7,164,242,179,222,34,122,103,243,
+    127,46,203,9,16,158,8,136,70,132,254,53,56,63,208,60,
+    27,161,205,243,28,109,126,26,28,100,132,247,86,7,225,244,
+    11,239,237,6,33,20,106,117,217,9,70,232,91,7,158,164,
+    125,206,121,237,119,188,215,54,195,29,14,200,239,255,206,155,
+    224,206,176,116,114,82,136,110,117,30,118,57,210,190,159,242,
+    218,179,191,160,237,171,72,135,43,64,235,34,31,212,57,4,
+    176,13,64,205,66,213,144,74,224,79,73,255,99,154,111,65,
+    165,144,180,48,57,240,14,15,142,107,81,11,56,45,115,182,
+    94,176,210,254,63,135,188,123,122,130,252,167,132,38,60,122,
+    133,39,54,112,34,245,252,71,141,72,87,248,22,121,171,17,
+    245,255,40,126,234,25,255,87,248,115,228,93,87,173,127,0,
+    128,184,201,48,238,16,4,206,42,146,188,119,11,37,239,209,
+    223,22,234,173,6,223,87,168,179,26,124,183,208,251,213,224,
+    187,31,230,112,53,248,186,161,121,134,1,133,236,15,31,244,
+    238,208,246,237,79,140,211,93,253,27,237,131,230,77,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/simple_core.py",
+    "gem5.components.processors.simple_core",
+    embedded_module_data,
+    2526,
+    5084);
+
+} // anonymous namespace
+} // namespace gem5
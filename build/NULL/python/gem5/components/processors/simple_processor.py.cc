@@ -0,0 +1,89 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,84,61,104,28,71,20,158,217,185,189,219,61,253,
+    248,28,217,206,41,206,207,86,134,3,115,231,34,2,199,8,
+    17,197,129,36,141,98,144,211,44,132,241,106,119,78,90,179,
+    63,151,153,61,18,9,5,84,8,36,129,155,20,70,41,85,
+    137,24,185,112,153,50,144,38,229,57,24,34,182,18,132,20,
+    234,78,72,6,163,202,111,102,111,239,71,73,48,158,155,125,
+    243,222,188,119,111,222,247,205,219,253,27,13,13,189,183,158,
+    62,4,177,139,60,228,225,0,133,216,198,88,234,90,160,133,
+    196,38,160,19,175,16,20,66,221,214,65,215,189,98,80,12,
+    75,118,9,244,146,103,4,70,104,218,166,210,205,160,28,142,
+    217,99,24,105,232,11,228,149,55,145,55,198,204,125,130,208,
+    1,201,15,180,199,189,241,69,84,155,56,150,70,13,167,198,
+    215,173,196,143,35,39,0,189,240,189,195,163,99,146,57,200,
+    87,139,243,199,26,232,79,112,90,94,244,195,86,192,238,198,
+    156,29,227,204,93,249,204,17,236,238,189,111,238,241,216,101,
+    66,196,92,230,2,251,254,106,139,9,119,24,162,145,67,252,
+    24,196,22,128,100,200,198,30,178,53,15,219,196,211,88,193,
+    35,76,247,10,172,40,129,53,141,109,212,196,94,105,115,220,
+    46,109,163,31,176,109,64,177,70,122,41,43,160,127,216,26,
+    43,91,48,230,173,11,251,150,27,71,137,227,71,194,114,172,
+    168,29,46,49,110,197,77,216,228,76,72,101,0,195,138,151,
+    30,50,55,81,187,201,74,150,77,56,33,179,122,16,234,106,
+    39,53,220,86,155,38,96,167,38,164,163,42,81,74,124,225,
+    164,69,206,146,54,143,22,220,194,16,212,34,60,146,190,211,
+    77,16,143,241,22,222,34,187,40,193,131,128,125,120,14,250,
+    214,222,144,103,48,182,241,54,105,2,57,155,70,162,15,118,
+    215,181,125,136,62,232,255,227,243,11,185,158,94,240,203,158,
+    1,234,10,107,191,43,36,114,220,105,57,220,9,173,28,210,
+    29,235,254,138,194,107,73,203,106,2,123,204,113,87,50,203,
+    143,36,45,86,43,39,182,94,190,152,166,207,71,150,103,192,
+    182,204,152,49,254,230,36,192,100,246,119,104,182,222,85,12,
+    135,231,209,238,48,81,37,120,166,242,126,122,172,237,162,101,
+    180,142,190,189,242,35,30,38,122,71,91,199,59,228,41,26,
+    109,254,159,180,71,87,129,20,92,35,252,18,152,105,73,214,
+    73,125,143,95,6,139,203,70,173,21,82,173,126,43,197,190,
+    10,80,251,66,222,176,101,109,108,156,127,34,184,219,104,173,
+    38,43,113,212,88,102,225,76,195,141,195,86,28,177,40,17,
+    141,126,213,162,33,84,151,209,1,142,214,234,121,121,54,240,
+    69,34,227,231,214,110,94,104,218,58,165,126,228,39,148,214,
+    103,131,216,117,2,49,87,31,68,207,200,10,110,131,120,181,
+    129,186,136,76,77,14,196,209,149,171,47,9,186,124,125,239,
+    203,103,206,175,139,157,202,252,243,202,252,139,202,124,151,140,
+    68,157,162,236,133,213,213,157,44,212,72,170,139,118,139,241,
+    212,200,143,77,117,238,68,203,172,166,167,5,193,130,102,134,
+    188,146,195,79,77,74,221,192,17,130,82,33,251,209,122,96,
+    61,216,224,85,233,254,0,196,90,245,255,208,220,148,149,51,
+    89,249,43,168,253,101,5,153,147,59,165,71,165,191,140,234,
+    159,70,181,171,141,20,57,16,255,76,127,248,243,234,243,233,
+    218,139,233,90,87,7,251,68,110,158,41,55,65,230,244,9,
+    210,205,242,153,20,221,81,193,223,147,48,77,137,42,130,247,
+    24,80,149,41,13,99,175,29,72,125,156,210,239,218,78,208,
+    243,148,40,245,98,151,82,62,46,241,17,63,74,120,49,199,
+    147,78,244,224,186,44,8,40,173,97,110,73,28,178,181,62,
+    205,80,79,230,226,134,116,184,217,213,228,63,192,165,27,0,
+    4,68,121,66,47,239,85,187,8,150,103,174,90,126,35,106,
+    249,163,160,150,183,18,10,158,58,117,161,54,145,22,225,29,
+    245,163,101,78,84,19,135,51,245,118,226,7,92,246,105,90,
+    128,87,74,40,56,233,181,65,79,214,123,61,41,123,128,155,
+    210,249,206,18,124,191,169,252,22,244,163,248,152,186,238,252,
+    251,32,20,61,234,204,39,40,59,95,226,63,55,102,51,90,
+    231,120,93,125,103,128,132,95,64,116,9,198,184,123,27,225,
+    247,59,232,250,240,60,66,213,206,232,60,66,239,118,70,231,
+    33,106,116,70,231,33,186,213,25,157,135,232,163,206,232,236,
+    22,167,48,208,243,111,209,185,118,227,68,174,103,255,225,83,
+    72,94,3,48,169,236,233,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/simple_processor.py",
+    "gem5.components.processors.simple_processor",
+    embedded_module_data,
+    1031,
+    1924);
+
+} // anonymous namespace
+} // namespace gem5
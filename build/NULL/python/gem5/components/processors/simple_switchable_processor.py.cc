@@ -0,0 +1,170 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,173,24,93,111,212,216,245,218,30,207,120,38,158,201,
+    36,36,108,2,108,226,4,166,217,1,118,2,44,73,203,46,
+    141,154,194,106,55,162,76,182,36,251,208,81,43,227,216,78,
+    98,176,199,179,215,30,216,160,172,132,42,36,66,133,42,85,
+    218,21,60,244,129,135,45,90,4,63,128,135,62,240,19,60,
+    209,84,68,150,42,69,170,120,224,205,8,144,86,60,245,220,
+    235,249,240,204,38,208,86,117,238,28,223,143,115,207,61,247,
+    124,59,255,66,145,135,111,188,95,254,25,192,29,164,33,141,
+    49,145,197,148,24,134,244,89,147,181,184,18,7,125,78,139,
+    153,49,139,47,241,180,207,155,241,69,164,197,181,132,153,176,
+    132,146,192,144,190,96,38,173,84,41,69,251,73,179,199,18,
+    75,162,149,46,165,233,56,101,102,172,222,82,47,244,123,52,
+    209,204,90,125,165,62,6,177,232,51,164,165,111,32,45,163,
+    247,221,231,16,122,200,53,153,42,245,107,189,11,40,159,125,
+    78,6,121,198,23,230,43,174,97,151,21,19,250,177,171,10,
+    46,63,231,194,5,110,110,97,22,94,204,225,231,108,56,145,
+    158,93,114,92,172,168,238,175,109,5,107,48,145,56,175,91,
+    231,109,77,207,179,190,112,230,139,47,23,215,42,186,227,139,
+    43,186,43,91,186,37,91,176,242,128,241,83,11,134,85,49,
+    245,51,54,214,159,51,33,161,61,11,87,13,87,93,85,150,
+    76,253,11,108,171,186,227,216,88,141,10,174,167,41,184,175,
+    1,220,4,209,233,168,196,104,168,196,106,76,137,75,34,77,
+    212,56,61,166,197,224,199,235,188,22,215,65,88,26,187,156,
+    218,64,203,140,38,220,72,151,18,44,210,5,61,121,31,206,
+    123,200,52,137,106,73,61,69,241,98,20,47,117,67,188,15,
+    179,15,91,135,150,122,180,158,27,168,36,110,160,175,153,82,
+    26,68,148,246,135,67,222,119,96,87,137,3,221,148,4,207,
+    172,68,145,140,101,67,215,36,138,110,233,101,87,33,50,149,
+    236,101,105,135,189,210,213,85,29,235,146,75,161,225,72,118,
+    89,167,148,42,45,4,197,37,171,146,227,42,216,37,68,232,
+    192,176,170,148,234,81,73,41,107,240,179,9,1,88,2,100,
+    85,41,75,75,128,66,207,210,53,74,205,181,165,43,134,66,
+    183,142,135,11,227,210,114,181,172,82,198,76,197,133,189,70,
+    185,69,217,164,164,11,210,226,42,48,4,109,197,182,53,105,
+    217,198,148,212,178,226,184,147,154,238,42,134,9,119,4,77,
+    75,142,238,86,43,78,129,174,22,253,126,202,168,81,94,145,
+    85,208,178,236,130,29,248,217,240,204,200,76,178,92,181,232,
+    208,241,57,195,81,252,56,6,34,184,172,242,17,197,39,224,
+    71,204,239,229,18,136,247,59,230,38,115,147,189,25,187,131,
+    214,57,141,185,76,21,137,123,93,166,141,174,177,157,42,254,
+    35,163,113,235,72,110,171,60,6,35,182,53,226,97,212,242,
+    3,55,217,166,115,139,233,164,3,120,124,187,127,169,53,191,
+    17,219,96,150,89,45,126,67,112,211,237,221,235,92,231,238,
+    179,168,211,176,128,2,27,161,192,2,133,196,127,71,193,96,
+    191,225,221,222,54,126,231,234,61,1,237,240,172,243,81,206,
+    31,9,247,129,135,135,45,62,32,90,36,193,196,83,202,82,
+    211,142,201,243,113,69,193,138,37,253,84,157,31,131,97,232,
+    84,243,100,68,12,67,210,21,117,53,28,53,204,168,101,190,
+    45,114,111,121,192,58,67,235,6,43,89,149,62,48,10,122,
+    225,40,241,139,110,139,148,86,21,231,63,161,119,169,234,184,
+    33,69,93,203,23,126,114,161,46,91,116,118,187,15,193,56,
+    74,152,235,246,166,144,231,66,170,155,50,24,114,72,11,130,
+    101,211,83,91,130,104,243,129,137,224,175,29,41,86,173,37,
+    240,59,192,163,126,32,89,132,107,56,74,145,42,182,99,184,
+    198,21,34,76,87,95,209,241,152,207,211,219,248,241,144,141,
+    69,53,98,246,212,77,246,192,239,229,73,0,223,177,119,208,
+    10,24,217,31,6,190,97,162,206,113,139,91,103,110,177,143,
+    80,103,248,255,11,123,123,112,1,61,96,242,156,47,168,149,
+    106,232,154,9,42,25,67,195,123,1,3,19,195,204,199,124,
+    182,112,204,103,140,112,138,28,230,196,0,72,210,245,235,111,
+    206,58,88,157,172,172,185,171,118,121,114,69,183,166,38,85,
+    219,170,64,20,43,187,206,100,235,242,206,164,67,163,161,236,
+    180,34,160,220,150,76,101,237,77,234,180,105,56,46,217,58,
+    115,109,122,215,64,91,144,101,163,108,184,178,92,56,109,218,
+    170,98,58,51,133,246,190,34,97,235,20,128,31,175,163,0,
+    113,35,153,54,216,30,24,124,205,161,190,253,222,161,233,39,
+    204,19,199,203,158,171,101,207,213,179,231,2,174,3,237,37,
+    145,201,255,87,182,248,64,91,136,120,148,244,37,2,168,28,
+    7,162,114,196,99,100,106,156,88,198,255,120,255,11,157,247,
+    31,205,180,65,251,254,39,31,43,79,22,188,236,92,45,59,
+    87,207,206,193,253,163,104,248,32,225,147,109,134,107,170,165,
+    48,70,103,58,162,128,83,204,39,253,204,172,227,232,152,184,
+    229,167,24,219,216,79,201,20,71,190,172,175,249,61,13,61,
+    211,65,159,172,86,49,6,123,144,13,39,196,193,34,156,227,
+    39,91,133,129,207,99,165,188,2,47,167,90,209,177,47,52,
+    111,153,79,248,49,71,55,151,169,197,81,113,225,193,150,244,
+    114,33,13,89,53,21,199,145,101,135,168,74,186,120,81,186,
+    40,53,100,89,32,178,28,127,183,44,63,34,114,251,145,200,
+    13,30,16,221,56,18,7,239,50,127,154,217,152,249,103,191,
+    228,141,21,107,253,243,245,254,121,79,156,223,222,55,182,17,
+    187,221,187,181,255,224,70,172,46,12,109,141,229,200,123,228,
+    217,112,206,251,217,47,106,195,167,234,195,167,96,61,19,196,
+    81,186,239,246,124,151,9,182,193,179,225,145,187,107,181,225,
+    124,125,56,31,240,48,126,65,38,95,209,101,1,118,214,197,
+    3,93,218,107,131,206,173,163,100,235,40,217,10,203,61,201,
+    3,41,79,24,122,189,23,37,51,183,18,183,19,79,133,161,
+    77,224,241,253,15,31,107,127,183,3,14,37,135,95,32,54,
+    153,122,69,64,208,9,168,218,125,126,137,20,114,106,43,41,
+    160,48,249,210,4,60,77,19,240,29,20,181,250,174,180,19,
+    245,154,214,179,206,60,234,74,166,12,204,221,99,119,194,237,
+    162,199,189,27,7,79,65,82,139,53,71,110,170,141,119,41,
+    222,236,93,166,103,65,101,20,73,152,221,133,2,211,185,183,
+    149,64,33,241,183,168,3,215,145,18,161,253,68,57,232,166,
+    170,33,72,170,92,49,207,224,227,48,190,246,213,151,14,56,
+    16,212,106,80,209,217,150,161,210,176,31,166,188,11,213,165,
+    53,232,153,166,4,206,85,53,93,146,69,39,66,44,185,108,
+    151,85,200,70,176,117,66,2,135,177,241,154,68,124,166,81,
+    157,209,77,206,101,163,34,53,144,36,18,11,76,221,213,205,
+    181,66,62,133,63,132,147,253,65,163,12,103,85,160,80,117,
+    35,97,215,223,67,138,115,178,77,151,87,13,29,43,88,93,
+    93,243,19,224,164,24,216,193,71,136,220,136,92,252,248,236,
+    226,252,249,185,51,152,92,212,239,11,7,114,113,190,120,102,
+    246,204,231,115,197,207,124,209,137,20,249,121,14,79,146,157,
+    228,202,248,24,0,135,104,82,106,58,37,113,182,107,147,187,
+    59,229,142,156,254,158,144,33,159,77,224,158,207,132,116,104,
+    222,185,77,33,247,195,167,158,144,171,9,39,234,194,9,79,
+    56,65,28,175,255,169,152,219,20,115,53,113,162,46,78,60,
+    21,39,55,197,201,154,120,188,46,30,15,184,100,242,231,219,
+    217,129,111,51,127,155,248,190,176,153,61,230,101,143,61,19,
+    179,1,203,246,141,188,224,98,105,112,35,0,1,1,175,83,
+    104,36,87,127,127,122,227,236,237,226,150,144,126,42,236,219,
+    20,246,221,61,249,215,153,154,112,184,46,28,246,154,141,250,
+    77,71,186,104,57,204,93,68,190,241,192,56,218,198,186,127,
+    125,55,39,137,84,132,221,38,84,222,247,150,93,220,110,187,
+    162,231,138,196,140,91,35,141,1,147,100,175,229,66,209,67,
+    209,1,213,77,228,163,0,10,122,187,234,142,135,5,73,161,
+    8,41,235,48,209,249,158,70,52,119,237,182,78,112,158,92,
+    234,3,68,190,225,168,198,29,194,128,20,106,121,31,209,178,
+    180,187,150,67,122,38,217,245,91,0,215,209,118,79,111,189,
+    103,12,98,92,114,122,75,204,62,21,15,109,138,135,238,45,
+    214,115,83,53,113,186,46,78,123,180,109,183,87,190,151,107,
+    226,84,93,156,242,196,169,237,92,190,158,251,196,27,251,132,
+    6,99,143,182,48,145,49,197,124,134,36,147,178,98,233,178,
+    12,9,138,24,104,213,36,125,81,150,191,170,42,102,99,37,
+    33,203,154,173,202,50,38,159,154,240,61,82,118,49,9,32,
+    52,131,248,73,251,138,142,177,161,233,14,206,146,201,100,211,
+    140,233,45,253,116,35,3,169,186,105,66,198,98,66,155,39,
+    178,248,85,40,139,254,38,32,14,229,252,35,180,226,230,95,
+    192,242,188,16,32,2,134,208,192,80,208,51,193,67,76,6,
+    176,125,224,80,192,147,65,28,237,63,24,36,72,79,64,3,
+    239,5,73,210,75,161,76,95,136,42,162,84,38,72,55,55,
+    237,8,46,48,40,222,123,253,119,94,239,120,141,63,88,231,
+    15,6,108,154,63,242,195,47,3,4,175,199,139,244,181,19,
+    120,193,161,248,161,38,122,48,146,224,79,7,232,109,128,138,
+    156,222,179,152,223,227,199,161,146,132,96,132,137,137,250,9,
+    107,170,80,117,13,51,12,32,49,168,146,29,42,95,63,67,
+    102,157,66,83,192,254,32,77,65,78,65,105,252,107,65,166,
+    99,42,113,191,183,177,214,140,51,97,104,26,104,87,152,133,
+    102,1,235,80,53,134,53,198,222,200,122,163,2,37,182,141,
+    51,116,243,78,197,104,168,100,114,143,7,40,188,19,209,226,
+    27,225,116,104,59,51,248,55,212,197,64,149,111,0,4,28,
+    195,48,193,52,98,14,120,104,127,180,109,163,33,175,179,109,
+    163,247,188,206,182,133,70,189,102,219,66,199,189,206,182,133,
+    114,94,103,11,88,142,97,193,71,222,9,4,196,28,243,208,
+    100,180,109,161,41,175,179,5,241,207,25,6,116,183,51,244,
+    164,143,94,208,206,171,93,16,168,108,254,13,92,186,185,66,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/simple_switchable_processor.py",
+    "gem5.components.processors.simple_switchable_processor",
+    embedded_module_data,
+    2336,
+    4833);
+
+} // anonymous namespace
+} // namespace gem5
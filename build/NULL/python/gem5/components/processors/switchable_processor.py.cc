@@ -0,0 +1,231 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,25,107,111,27,199,113,239,200,227,91,34,109,201,
+    182,100,189,142,178,158,86,45,217,137,164,184,214,195,177,37,
+    191,106,71,9,34,55,173,133,6,7,138,119,146,104,243,149,
+    189,147,98,169,82,106,20,70,170,0,250,32,7,13,172,62,
+    12,16,253,144,218,117,129,184,223,242,161,63,160,31,143,196,
+    1,18,14,8,96,160,40,80,247,19,13,59,64,144,79,157,
+    217,35,143,164,68,63,2,180,199,211,220,222,238,236,236,236,
+    204,236,60,78,255,36,101,151,80,120,62,251,4,192,93,34,
+    19,153,139,147,4,55,195,37,248,25,158,195,119,62,238,152,
+    113,200,14,217,25,119,94,37,178,32,187,226,66,194,53,227,
+    130,49,183,236,137,187,19,158,25,15,107,123,227,222,132,111,
+    198,199,218,190,184,63,17,152,9,176,182,63,94,147,168,157,
+    169,229,8,79,46,16,57,112,155,200,53,138,239,75,7,33,
+    15,29,69,38,102,130,50,63,77,122,107,159,224,75,47,111,
+    58,39,99,81,205,116,94,137,169,218,212,19,196,234,229,76,
+    238,232,19,222,106,213,156,153,85,53,26,137,106,103,83,17,
+    42,63,225,172,222,64,177,119,34,69,21,120,223,87,124,127,
+    143,166,162,138,170,166,40,116,122,38,222,251,233,213,229,180,
+    162,66,219,55,29,75,164,227,10,162,71,203,37,226,42,74,
+    228,59,0,191,1,153,40,100,134,147,201,12,47,115,32,7,
+    94,113,42,130,226,82,220,141,246,132,57,190,212,150,29,138,
+    32,59,101,97,206,181,78,230,56,217,117,59,48,227,225,137,
+    226,133,29,3,159,15,57,27,207,173,248,25,158,83,246,220,
+    118,126,9,61,15,109,26,51,129,170,51,156,74,205,28,47,
+    123,247,96,215,190,0,219,165,4,203,121,148,125,123,102,134,
+    100,255,109,50,179,79,14,40,2,140,215,220,118,206,236,95,
+    39,55,185,153,58,212,133,89,55,253,113,76,139,46,68,102,
+    227,138,45,194,149,255,248,68,184,174,46,196,84,49,26,143,
+    168,0,35,73,113,86,17,23,85,69,22,181,148,168,42,218,
+    98,90,140,136,170,61,87,76,23,39,15,216,45,85,76,37,
+    197,8,35,165,46,171,154,146,128,249,177,228,188,88,210,136,
+    218,239,43,172,148,90,156,95,16,181,234,11,202,49,208,157,
+    22,95,254,145,24,211,68,192,152,85,84,120,38,23,20,26,
+    211,96,120,142,166,18,253,226,180,162,48,82,22,241,210,166,
+    192,20,196,185,20,21,129,158,114,51,130,99,98,106,142,173,
+    212,207,240,205,80,105,19,82,20,121,50,107,85,45,66,53,
+    224,180,240,238,162,176,93,154,156,138,218,150,92,176,31,124,
+    127,246,41,216,235,23,220,93,178,202,175,114,25,82,237,170,
+    212,199,18,71,235,180,50,74,50,183,202,255,1,206,223,61,
+    71,165,110,127,205,173,194,72,73,183,171,68,226,237,54,7,
+    111,54,13,205,91,70,205,113,27,48,175,219,152,147,187,86,
+    223,109,63,55,24,166,202,255,4,214,211,252,47,226,57,227,
+    34,85,174,242,117,100,161,196,105,198,93,13,187,146,226,95,
+    93,149,156,112,72,205,222,81,198,243,106,10,147,228,195,183,
+    126,1,235,175,57,214,156,90,93,57,87,171,142,85,103,165,
+    231,1,234,78,192,111,93,19,86,133,140,175,234,94,132,242,
+    221,44,113,187,185,219,104,219,56,169,29,42,225,203,110,148,
+    115,38,240,58,124,190,76,3,160,199,154,82,251,186,221,166,
+    135,192,7,123,226,181,137,224,154,11,125,234,170,171,146,10,
+    204,11,217,188,144,105,246,215,235,157,250,222,121,89,89,22,
+    87,126,140,231,39,153,210,240,8,205,165,22,147,50,28,23,
+    176,121,165,236,192,74,101,199,84,6,63,28,75,37,35,116,
+    185,63,106,115,6,151,19,254,80,178,207,134,9,70,141,5,
+    88,245,195,131,107,220,235,217,249,231,252,198,161,105,242,0,
+    157,182,123,94,209,164,152,26,121,192,155,124,255,113,211,201,
+    142,21,10,91,20,191,31,83,105,116,32,189,172,45,164,146,
+    3,243,74,98,104,32,154,74,164,83,73,37,169,169,101,158,
+    100,160,26,227,253,233,229,239,189,163,224,139,112,202,248,202,
+    64,21,79,214,47,73,177,100,76,147,164,254,209,120,42,26,
+    137,171,227,253,246,132,73,96,64,21,1,220,34,122,221,132,
+    117,103,180,205,201,187,87,62,191,114,103,234,183,83,118,231,
+    51,166,16,60,100,180,16,155,28,176,153,10,73,161,165,189,
+    137,146,26,7,112,25,236,229,46,202,170,225,117,101,245,1,
+    185,203,129,141,53,162,22,31,112,83,15,56,211,31,83,165,
+    27,75,9,230,129,104,3,114,106,201,139,54,193,3,118,61,
+    175,36,149,155,105,250,250,187,46,78,152,66,90,167,1,252,
+    27,126,183,72,158,240,162,143,129,157,35,221,235,147,219,129,
+    230,92,160,57,27,104,53,2,173,121,71,113,168,26,160,45,
+    150,40,132,203,75,137,15,222,233,221,103,58,111,40,203,224,
+    59,207,168,170,66,209,154,206,81,154,162,102,173,20,93,164,
+    20,180,89,240,165,251,164,61,238,214,17,87,146,166,160,46,
+    166,21,106,122,138,156,83,60,107,166,0,14,62,161,154,110,
+    80,89,68,211,40,248,106,48,36,139,128,34,75,169,69,205,
+    116,68,146,203,166,79,138,196,227,5,106,1,176,15,37,29,
+    161,10,138,207,244,37,134,250,83,179,215,33,124,168,180,3,
+    41,186,80,168,75,137,94,143,233,84,149,248,28,197,67,68,
+    247,225,136,51,25,73,40,166,23,169,72,113,72,73,232,97,
+    28,98,147,188,146,196,162,146,36,169,30,166,5,118,221,98,
+    186,160,125,0,86,154,95,166,133,65,20,249,239,193,92,190,
+    3,121,251,72,224,176,30,62,177,29,30,206,133,135,179,225,
+    147,70,248,164,238,199,251,155,253,98,158,231,246,13,110,126,
+    146,39,240,40,129,167,14,71,93,237,115,2,32,79,28,53,
+    181,64,161,109,224,254,39,70,235,248,186,211,240,52,237,132,
+    79,224,179,245,91,15,9,213,89,246,122,95,51,6,206,194,
+    51,91,55,97,0,12,78,26,193,201,127,112,185,224,37,189,
+    120,127,227,169,249,204,189,225,222,246,52,228,60,13,91,87,
+    141,150,227,143,246,25,45,111,110,183,140,228,90,70,178,45,
+    99,70,203,152,238,105,200,122,198,13,207,184,238,25,127,220,
+    118,196,104,27,218,110,27,201,181,141,100,219,198,140,182,177,
+    60,17,188,23,56,11,126,246,238,250,228,102,239,183,46,82,
+    83,191,57,185,213,145,241,102,3,71,141,192,81,61,112,116,
+    167,33,12,59,168,65,68,132,155,206,157,80,253,118,168,51,
+    23,234,204,200,143,58,140,55,206,233,93,231,178,161,243,70,
+    232,188,206,238,188,3,209,128,82,139,88,102,151,125,3,95,
+    157,254,203,233,108,223,168,209,55,202,108,242,41,118,63,39,
+    86,171,5,91,45,62,148,65,99,222,67,2,33,195,223,12,
+    114,242,182,239,4,122,244,202,251,241,225,182,173,206,223,117,
+    255,17,236,124,227,242,58,252,242,110,192,99,200,204,154,77,
+    97,22,83,205,168,29,6,10,46,144,133,249,14,14,93,32,
+    11,188,246,32,56,108,219,9,208,95,201,28,11,9,229,179,
+    95,112,220,119,135,132,53,94,43,11,153,171,124,101,136,128,
+    192,53,93,12,116,171,206,140,243,213,244,51,194,171,113,128,
+    170,119,77,144,249,85,65,178,131,251,134,111,21,74,128,21,
+    228,225,181,214,41,155,249,190,29,132,156,83,213,99,200,41,
+    130,2,156,255,65,126,241,171,131,171,220,29,126,163,113,154,
+    208,131,240,74,195,8,246,120,67,223,40,158,87,43,8,140,
+    85,59,136,177,36,156,234,116,138,70,180,242,232,81,242,141,
+    246,244,89,36,253,99,66,44,199,216,88,91,2,59,141,45,
+    143,228,237,225,243,185,225,243,217,225,139,198,240,69,176,68,
+    232,13,213,179,103,9,143,25,18,11,19,44,96,244,186,77,
+    151,196,172,138,158,192,190,227,4,221,137,146,92,76,40,200,
+    141,89,131,145,81,141,37,44,31,101,250,101,69,141,42,73,
+    57,2,209,207,12,40,75,224,55,63,2,39,34,43,55,123,
+    93,20,221,8,61,201,8,20,35,131,106,114,49,230,167,76,
+    7,80,80,93,164,232,156,152,96,204,3,85,55,190,210,251,
+    218,50,250,25,202,227,239,150,60,2,228,80,243,186,115,195,
+    255,216,31,100,71,204,235,61,149,119,217,226,9,119,254,185,
+    237,79,109,217,240,27,70,248,13,38,146,167,216,253,28,193,
+    250,37,56,209,205,157,153,107,217,166,1,163,105,0,157,216,
+    41,6,238,184,55,185,205,193,157,166,182,237,166,99,185,166,
+    99,214,240,118,211,72,174,105,36,219,52,102,52,141,161,251,
+    235,101,96,115,98,167,187,103,115,194,168,239,208,235,59,118,
+    6,135,190,230,254,118,110,211,185,29,106,207,133,218,179,161,
+    14,3,239,19,122,232,68,190,14,217,98,188,5,138,203,48,
+    149,236,137,214,236,80,31,101,54,169,149,141,149,31,233,202,
+    99,8,54,40,162,70,121,218,139,138,232,6,240,128,99,74,
+    81,17,167,32,114,166,80,80,175,165,158,149,112,53,81,87,
+    160,92,71,2,7,152,136,153,11,223,28,52,234,186,178,193,
+    110,35,216,173,123,186,247,242,206,21,121,15,49,222,129,95,
+    178,155,67,142,49,71,207,239,98,205,139,235,90,108,181,188,
+    136,45,54,156,198,137,126,198,210,227,96,157,17,108,215,61,
+    237,213,133,120,4,25,121,159,148,82,158,18,51,153,114,92,
+    251,218,227,131,124,232,10,206,129,231,248,165,3,146,32,254,
+    83,39,164,65,126,185,76,216,61,200,186,107,41,18,95,132,
+    114,158,183,14,1,166,163,229,30,128,29,171,149,214,170,49,
+    216,206,12,52,156,116,137,20,19,31,56,208,70,227,192,118,
+    227,112,174,113,56,219,120,210,104,60,9,134,230,13,51,176,
+    126,105,231,144,168,7,170,223,16,164,10,104,86,208,168,219,
+    149,208,72,144,7,85,132,16,111,81,99,30,126,175,181,201,
+    220,151,208,251,208,198,87,131,21,181,33,95,165,38,44,171,
+    83,50,229,21,233,11,132,188,167,222,116,172,114,80,111,58,
+    171,212,155,101,148,87,185,82,61,183,198,67,109,75,174,219,
+    1,193,170,25,105,37,167,194,110,106,229,213,228,238,144,86,
+    49,86,70,185,18,235,134,163,202,58,174,221,235,88,149,88,
+    137,198,158,224,234,144,61,128,193,239,233,119,106,118,181,69,
+    200,117,59,0,3,45,187,250,44,175,43,181,3,101,60,99,
+    133,89,161,183,74,174,42,199,56,252,54,64,36,155,195,66,
+    173,70,71,161,189,210,115,117,161,236,227,137,184,16,81,69,
+    171,112,83,146,98,153,79,150,251,105,61,162,15,225,7,16,
+    68,136,136,96,103,47,43,235,202,171,186,149,227,19,86,61,
+    168,126,28,73,139,133,140,92,100,199,66,132,169,11,140,72,
+    69,247,138,130,124,129,151,154,85,40,126,48,177,112,241,211,
+    15,82,128,101,11,108,176,213,33,113,22,129,111,173,52,35,
+    18,167,74,68,94,102,216,105,5,203,207,126,235,115,82,145,
+    251,120,60,245,49,108,234,101,229,230,252,15,42,55,239,176,
+    114,147,165,9,224,150,177,12,219,147,40,208,17,148,224,72,
+    53,55,97,9,80,210,82,47,207,15,62,71,138,24,200,89,
+    126,208,230,43,129,157,206,94,172,158,90,115,129,214,108,64,
+    52,208,77,84,140,239,245,159,255,171,221,210,119,255,63,123,
+    253,2,41,118,176,189,234,77,23,172,251,209,213,173,201,237,
+    230,254,92,115,127,182,249,184,209,124,220,30,176,170,65,191,
+    233,6,251,197,74,141,118,33,15,232,187,105,39,41,68,75,
+    22,55,77,62,49,100,250,44,22,38,210,139,42,59,4,166,
+    19,87,53,29,43,177,116,175,96,185,248,43,216,237,5,30,
+    45,84,179,174,188,140,44,100,76,102,200,30,47,244,168,2,
+    41,100,64,86,200,171,171,178,215,149,238,215,20,202,77,20,
+    192,101,14,5,240,175,224,193,77,109,235,231,217,96,151,17,
+    236,66,223,255,14,7,229,154,30,190,156,221,127,197,216,127,
+    69,15,92,121,236,111,205,200,70,215,232,118,215,153,92,215,
+    153,108,215,132,209,53,161,251,241,46,214,117,250,161,163,175,
+    40,236,2,228,64,163,81,127,84,239,27,55,234,79,175,123,
+    243,46,18,56,176,229,52,26,250,114,254,62,221,223,7,132,
+    118,66,103,159,58,120,156,196,227,36,190,166,22,114,134,64,
+    112,125,249,179,241,141,241,123,211,153,122,35,60,152,109,25,
+    50,90,134,114,254,33,221,63,84,88,123,100,79,9,105,155,
+    237,177,19,198,177,183,153,173,62,197,247,231,8,116,79,19,
+    172,221,124,145,3,197,126,125,13,64,182,233,130,1,106,246,
+    52,64,34,231,245,111,212,236,4,66,27,151,239,213,223,139,
+    234,237,67,250,91,23,178,173,23,141,214,139,217,198,75,70,
+    227,37,96,207,139,84,188,72,31,0,20,171,61,172,78,213,
+    217,109,217,73,61,214,249,88,110,75,18,212,238,82,34,37,
+    47,198,177,29,144,164,143,22,35,241,194,136,91,146,228,84,
+    84,146,40,186,127,211,1,21,57,197,51,67,209,107,179,170,
+    219,244,166,150,20,74,99,144,52,83,12,40,20,253,54,157,
+    100,216,177,164,70,47,224,43,126,237,163,24,246,89,146,64,
+    175,225,104,77,161,158,143,42,144,28,72,144,47,189,69,10,
+    169,210,219,214,225,9,22,1,46,163,158,181,74,247,226,47,
+    207,187,4,79,158,32,8,133,133,246,199,135,91,183,212,204,
+    228,253,195,70,199,160,222,54,104,28,30,202,11,208,13,18,
+    108,108,206,187,177,229,33,190,218,188,23,91,228,69,224,60,
+    71,92,193,91,215,244,160,152,21,194,134,16,206,243,33,225,
+    212,125,72,128,225,241,245,85,246,40,129,167,14,226,106,47,
+    34,229,59,118,207,116,8,61,91,42,232,89,232,41,129,210,
+    20,236,241,237,158,194,9,71,182,6,51,1,163,233,24,24,
+    166,112,164,4,74,243,176,199,197,67,139,216,192,211,41,244,
+    60,130,149,58,113,145,87,2,171,50,66,161,246,134,76,151,
+    182,156,142,37,231,153,106,45,173,98,22,105,214,46,106,177,
+    184,218,95,84,171,121,128,149,78,106,127,164,240,79,158,66,
+    41,229,97,74,180,59,217,55,50,212,179,185,223,238,179,79,
+    49,179,12,211,27,77,47,74,26,254,75,136,226,39,91,211,
+    175,178,127,19,88,83,107,108,149,51,127,202,248,100,133,165,
+    103,212,50,205,113,26,35,86,230,173,126,3,0,50,64,142,
+    203,159,116,112,60,200,246,149,192,71,56,223,45,47,254,30,
+    147,54,189,120,239,144,19,122,229,189,67,186,245,202,187,26,
+    78,137,66,145,206,17,189,242,206,187,40,199,129,200,171,67,
+    253,112,223,83,214,120,254,2,4,182,253,255,2,180,244,166,
+    156,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/switchable_processor.py",
+    "gem5.components.processors.switchable_processor",
+    embedded_module_data,
+    3297,
+    7228);
+
+} // anonymous namespace
+} // namespace gem5
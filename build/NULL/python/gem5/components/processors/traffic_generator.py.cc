@@ -0,0 +1,92 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,85,75,107,220,86,20,62,87,26,105,164,241,140,
+    31,211,212,177,19,112,229,7,52,3,201,76,90,218,80,90,
+    99,82,250,240,166,120,81,103,83,65,17,170,116,199,22,104,
+    164,233,189,154,182,54,41,120,49,180,46,164,139,46,74,186,
+    232,194,139,98,8,78,255,203,56,24,98,180,50,116,149,157,
+    140,29,8,89,245,222,171,209,204,200,118,171,17,231,62,206,
+    125,124,231,59,223,209,252,3,35,143,210,111,207,190,100,230,
+    49,184,224,34,31,90,200,68,8,92,201,149,125,169,37,155,
+    50,235,23,92,197,47,180,20,83,17,125,213,87,91,69,179,
+    136,64,130,85,112,139,93,112,53,172,236,203,0,7,114,118,
+    176,169,185,250,58,212,74,47,248,160,134,226,194,23,30,141,
+    94,200,233,64,15,191,195,132,120,46,166,47,80,58,51,245,
+    241,55,52,34,182,19,173,226,0,19,59,10,201,19,20,95,
+    123,64,236,102,211,115,6,115,159,132,4,59,87,194,255,137,
+    153,159,89,0,24,76,228,130,41,185,8,203,184,48,59,88,
+    200,131,105,22,118,161,137,220,66,183,108,42,151,253,108,172,
+    14,199,77,22,112,183,96,22,37,192,26,214,247,25,202,3,
+    52,88,91,116,213,110,97,159,245,14,6,235,205,210,46,252,
+    128,204,49,22,178,22,79,94,196,29,79,58,97,208,244,54,
+    172,166,231,99,203,103,76,196,42,193,81,135,4,107,142,116,
+    33,28,78,209,89,196,204,239,232,49,68,104,232,204,95,184,
+    55,226,25,62,15,97,79,186,114,30,61,69,249,32,158,74,
+    249,49,203,43,48,240,242,90,13,145,114,154,19,197,97,116,
+    211,154,28,43,180,211,198,36,214,44,203,11,188,200,178,226,
+    138,229,16,108,71,216,202,86,20,40,246,155,98,95,172,91,
+    150,227,219,148,90,22,229,161,24,198,206,235,15,41,113,26,
+    237,173,104,51,12,26,27,184,245,126,195,9,91,237,48,192,
+    65,68,27,109,18,58,152,210,144,208,70,148,178,102,109,100,
+    180,213,219,91,100,138,157,177,61,123,145,208,122,6,101,145,
+    185,233,103,204,188,218,129,151,26,232,227,191,20,31,21,159,
+    107,51,207,180,153,227,234,244,243,234,210,179,234,82,239,222,
+    231,189,234,210,97,117,245,168,186,154,200,160,207,158,130,164,
+    151,206,185,73,132,81,53,189,156,0,51,103,156,137,92,70,
+    164,44,35,55,64,212,7,234,50,46,63,189,144,11,198,155,
+    180,253,107,201,232,63,15,54,177,177,137,125,70,153,209,236,
+    4,78,228,133,129,17,133,70,74,153,17,49,175,160,205,104,
+    134,68,140,6,241,222,54,188,200,248,222,243,125,163,67,241,
+    224,56,190,132,218,45,108,120,65,187,19,81,195,166,253,51,
+    2,86,49,29,135,237,27,92,83,31,108,114,70,229,193,101,
+    245,6,15,226,182,8,98,131,201,228,235,169,31,209,168,184,
+    30,94,144,199,111,210,163,234,58,60,1,162,113,45,72,177,
+    84,191,27,143,141,136,152,74,34,183,228,77,214,188,46,45,
+    115,73,243,164,174,108,191,123,57,85,163,90,169,47,251,161,
+    99,251,116,165,62,220,243,17,207,225,93,102,118,32,1,121,
+    178,52,52,39,147,55,95,202,80,153,223,187,121,88,190,115,
+    84,190,147,200,57,55,153,102,155,200,172,64,72,120,128,66,
+    129,163,208,72,149,203,103,238,255,49,189,199,55,45,166,247,
+    143,15,174,126,171,145,40,172,61,229,131,243,254,149,122,122,
+    101,142,92,148,41,68,77,21,194,213,128,214,82,84,72,160,
+    162,124,73,138,39,174,208,200,38,145,213,151,250,21,200,114,
+    254,251,124,119,81,32,59,209,202,187,5,113,59,139,181,194,
+    154,181,90,153,87,100,192,148,193,42,178,100,89,173,208,237,
+    248,188,95,182,172,111,59,182,159,122,8,199,22,203,76,42,
+    162,148,136,158,177,66,184,42,8,63,156,204,9,100,253,186,
+    117,176,239,91,22,131,126,45,131,126,63,165,114,44,51,11,
+    220,241,119,90,115,217,47,145,38,148,242,201,141,185,63,232,
+    159,181,68,97,253,68,133,210,120,82,228,61,248,47,179,80,
+    82,74,199,198,210,222,250,95,122,34,179,254,137,94,233,141,
+    47,28,233,139,137,194,70,9,228,205,12,168,19,59,95,245,
+    38,140,67,101,254,72,153,79,36,164,84,18,200,204,169,12,
+    234,194,229,233,161,73,197,50,38,152,211,99,53,218,106,123,
+    193,70,202,206,120,39,242,124,90,207,254,148,4,51,113,213,
+    238,255,35,13,191,71,130,173,120,250,210,119,74,200,40,101,
+    118,44,83,100,122,157,40,15,109,57,77,205,10,185,213,215,
+    11,237,50,147,200,8,161,228,30,160,153,30,92,31,125,79,
+    224,237,94,254,61,134,119,122,249,247,24,62,232,229,223,68,
+    53,16,139,244,178,233,93,191,117,202,219,243,43,124,2,229,
+    191,249,143,233,157,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/traffic_generator.py",
+    "gem5.components.processors.traffic_generator",
+    embedded_module_data,
+    1077,
+    2065);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,88 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,84,203,107,27,71,24,159,217,135,180,146,29,167,
+    15,135,218,206,131,161,46,105,117,145,91,104,32,24,247,133,
+    11,161,23,55,37,166,208,189,12,235,157,89,107,195,106,87,
+    157,25,53,181,241,193,135,64,92,200,181,4,122,242,201,180,
+    184,135,254,41,114,49,180,44,20,10,61,249,166,224,22,74,
+    78,253,102,180,187,146,82,135,172,86,223,60,126,223,252,190,
+    231,206,95,104,226,113,139,241,252,75,16,79,16,67,12,39,
+    168,139,125,220,181,124,11,35,102,49,59,177,187,142,239,192,
+    220,97,110,226,118,107,126,205,204,107,73,189,235,249,30,70,
+    22,186,131,88,253,33,98,30,247,142,108,132,142,237,146,220,
+    111,176,198,61,212,106,158,233,69,203,202,157,187,153,80,121,
+    115,83,4,81,20,135,119,120,122,166,85,91,56,111,100,223,
+    112,33,98,198,229,25,30,237,204,126,178,37,149,8,66,181,
+    158,9,14,235,43,229,26,78,113,17,168,76,104,32,188,48,
+    20,31,196,35,8,134,35,31,51,228,91,12,251,54,179,184,
+    19,89,7,40,194,204,126,56,235,187,22,226,53,94,63,2,
+    107,199,184,36,96,14,247,152,203,106,145,3,225,56,71,176,
+    115,92,145,251,141,3,244,45,246,155,16,142,151,207,143,35,
+    24,251,18,124,1,68,155,29,78,212,8,36,219,37,74,66,
+    128,73,156,42,46,162,32,228,237,102,147,192,179,217,137,37,
+    9,147,64,74,194,120,20,167,92,18,213,153,80,35,17,156,
+    12,158,103,81,157,64,145,7,113,146,144,16,76,42,110,168,
+    2,192,186,189,172,159,178,202,184,236,241,48,142,98,206,200,
+    214,142,225,237,5,34,232,114,224,150,100,139,39,217,131,54,
+    249,76,145,190,228,114,228,76,21,16,81,89,65,109,142,21,
+    124,133,207,171,134,5,172,165,81,188,77,163,56,225,171,228,
+    110,160,58,250,144,214,30,1,125,240,55,206,82,162,241,194,
+    145,157,56,221,214,26,134,229,162,167,23,40,240,45,37,89,
+    52,54,169,247,243,153,9,99,161,53,81,110,187,248,159,11,
+    16,223,227,39,72,225,49,56,93,188,195,9,228,69,58,24,
+    41,119,140,237,225,159,241,116,115,236,33,90,245,53,179,160,
+    13,236,221,141,42,154,245,81,194,130,201,60,222,139,187,159,
+    111,221,231,161,34,129,44,146,3,245,211,241,153,194,235,130,
+    165,60,85,237,138,164,133,197,44,144,111,180,156,220,149,253,
+    30,23,185,71,105,156,198,138,82,225,0,144,55,170,94,104,
+    217,185,35,121,18,153,3,121,131,82,211,71,148,74,237,34,
+    33,251,207,62,146,34,92,233,237,168,78,150,174,108,243,238,
+    173,149,202,158,92,233,137,44,228,82,102,66,174,20,169,166,
+    21,49,213,78,182,123,59,226,50,16,237,94,191,168,207,219,
+    165,83,239,129,138,212,226,223,125,244,143,135,26,115,223,213,
+    31,215,127,243,22,126,245,22,78,188,165,83,111,105,224,45,
+    253,177,184,252,203,204,96,113,237,100,113,237,116,113,237,192,
+    121,60,119,0,191,115,157,196,220,233,233,219,160,38,184,234,
+    139,116,99,170,182,86,89,219,27,72,223,74,123,120,15,221,
+    175,64,58,254,96,17,212,1,111,180,44,241,10,172,196,21,
+    164,111,25,241,106,57,151,150,201,134,120,93,91,155,131,62,
+    74,161,26,148,133,65,216,225,187,203,23,198,54,173,116,91,
+    147,188,6,98,31,253,121,227,77,237,253,169,119,117,96,94,
+    49,175,141,205,232,18,165,240,93,81,154,55,41,237,102,172,
+    159,232,249,44,165,95,247,131,164,64,234,148,178,44,132,137,
+    13,87,152,201,172,168,105,225,105,161,195,20,11,218,195,75,
+    69,25,67,158,36,148,66,55,104,203,82,7,251,177,9,65,
+    204,148,226,166,6,30,141,50,95,254,134,150,231,122,67,164,
+    197,188,235,126,112,184,62,68,48,188,88,204,161,218,229,253,
+    175,14,246,78,220,107,167,238,181,161,133,221,229,195,247,135,
+    8,134,31,63,53,195,88,60,181,81,237,122,169,244,28,102,
+    132,73,134,241,108,163,213,204,155,221,91,237,204,116,190,28,
+    69,103,154,119,174,175,226,68,182,203,139,222,100,32,191,20,
+    20,183,186,233,59,147,144,252,141,106,111,186,43,69,163,52,
+    242,19,26,25,212,73,121,230,173,141,178,254,161,120,203,124,
+    197,144,153,31,64,12,109,140,241,240,182,141,173,33,122,185,
+    104,34,252,206,0,189,61,249,254,62,189,52,59,171,131,233,
+    119,88,155,199,144,129,255,139,193,213,119,159,234,241,239,11,
+    48,227,251,127,158,212,239,117,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/components/processors/traffic_generator_core.py",
+    "gem5.components.processors.traffic_generator_core",
+    embedded_module_data,
+    1016,
+    1924);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,116 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,86,219,111,20,85,24,63,115,219,43,104,113,67,
+    139,84,241,208,11,176,6,6,33,17,72,185,36,164,52,166,
+    10,72,186,114,201,26,50,157,206,57,109,135,206,206,172,231,
+    156,109,105,109,147,198,240,80,77,19,141,47,54,1,13,15,
+    66,52,60,250,127,152,98,120,216,76,226,147,241,193,183,37,
+    224,11,79,126,231,204,206,118,91,195,204,217,239,220,190,243,
+    221,206,247,253,102,255,66,93,143,213,238,95,132,64,126,64,
+    4,85,17,209,136,30,104,85,13,122,35,208,107,70,213,208,
+    228,154,25,152,53,171,106,105,72,71,31,33,98,221,67,36,
+    67,141,199,6,66,79,140,84,88,53,67,178,212,162,217,183,
+    59,226,167,117,146,187,103,86,115,36,79,179,176,151,153,54,
+    73,1,230,121,162,87,80,185,184,180,175,80,169,83,207,159,
+    246,41,199,98,150,226,241,202,69,76,195,70,173,240,143,60,
+    124,181,172,197,230,24,76,161,55,42,84,120,221,134,107,169,
+    225,182,50,156,34,48,24,85,117,162,85,13,162,87,77,98,
+    84,45,98,130,65,86,53,75,50,96,64,22,148,230,170,5,
+    146,7,197,133,216,0,77,238,101,144,81,192,240,124,214,86,
+    45,117,113,188,48,235,123,179,184,230,46,226,41,138,27,156,
+    18,236,135,202,186,25,90,251,16,115,65,2,127,10,139,8,
+    115,101,250,162,60,201,237,66,42,200,103,120,222,13,26,116,
+    155,0,224,22,204,13,121,224,10,218,113,84,138,16,204,15,
+    103,56,118,67,130,189,168,86,119,25,197,238,140,235,135,92,
+    40,121,126,88,111,136,100,155,134,243,62,139,194,26,13,5,
+    40,96,190,59,21,208,84,237,152,61,99,31,149,242,188,89,
+    234,205,97,127,90,233,184,117,230,148,210,227,115,37,219,15,
+    40,25,73,248,109,27,86,8,61,54,21,68,222,220,72,123,
+    49,125,224,244,84,195,15,200,88,56,255,249,244,192,245,202,
+    152,243,37,72,177,65,154,173,28,91,113,96,58,112,123,164,
+    115,200,182,219,102,196,198,221,51,167,98,139,249,220,155,143,
+    13,151,213,98,179,230,215,121,108,213,163,5,202,98,139,131,
+    127,94,108,134,141,32,184,90,46,198,57,199,9,221,26,117,
+    156,184,224,56,181,136,52,2,57,222,229,56,95,52,220,160,
+    189,147,117,28,18,121,48,48,110,73,209,19,227,149,209,27,
+    177,113,113,226,74,108,94,25,191,86,137,173,107,159,222,28,
+    155,136,173,202,181,139,19,163,177,121,245,250,229,203,191,162,
+    23,50,47,94,245,113,230,29,175,47,138,217,40,60,46,111,
+    238,184,207,93,110,215,23,89,6,118,21,25,130,31,63,15,
+    100,181,243,182,244,221,86,174,133,36,57,128,138,61,171,163,
+    205,93,165,213,177,102,225,77,24,21,247,172,94,74,166,138,
+    200,169,124,217,254,84,94,156,97,84,52,88,184,45,79,117,
+    248,201,2,121,49,148,20,152,118,15,137,174,237,75,232,49,
+    208,39,157,57,100,167,190,116,82,133,115,66,9,131,219,199,
+    156,10,28,77,99,55,8,58,201,227,242,52,121,108,197,236,
+    105,93,66,165,190,146,212,249,142,210,57,139,150,209,237,252,
+    138,182,172,221,233,176,124,175,175,23,42,136,201,74,133,234,
+    178,212,205,150,245,88,183,63,136,13,25,40,105,54,198,172,
+    95,70,50,127,14,12,144,41,116,97,105,112,134,10,71,238,
+    59,160,221,129,101,251,28,228,144,27,240,11,118,135,233,162,
+    12,235,126,21,214,205,226,112,210,54,6,215,70,215,199,59,
+    83,21,179,178,150,92,133,180,33,9,162,212,22,247,236,84,
+    193,6,97,89,94,19,223,167,132,182,114,104,215,33,16,242,
+    168,4,228,105,113,248,25,136,52,19,145,177,165,42,102,91,
+    48,50,233,5,252,174,130,177,61,248,183,7,33,44,232,97,
+    55,127,231,217,126,49,16,60,61,29,207,169,17,51,151,53,
+    79,215,224,202,214,135,136,182,162,139,236,235,206,130,158,189,
+    43,198,178,46,114,91,28,119,82,228,69,247,209,178,113,31,
+    253,168,47,237,70,104,69,95,239,21,187,183,184,136,190,12,
+    251,4,206,2,135,249,24,236,124,210,177,245,43,173,108,186,
+    235,41,134,221,244,33,59,146,252,83,73,226,69,140,81,79,
+    40,56,197,51,254,60,77,150,85,124,218,169,99,3,94,1,
+    56,64,171,185,2,160,131,224,40,84,178,36,163,60,119,152,
+    39,88,102,183,17,102,0,234,123,0,47,116,105,74,145,1,
+    36,177,104,65,34,21,166,119,61,90,23,126,20,2,146,116,
+    164,117,171,149,10,253,16,4,251,164,13,28,147,147,59,239,
+    252,72,121,114,18,123,32,173,11,65,9,21,148,213,252,48,
+    65,80,117,126,171,6,218,240,155,184,51,29,49,12,88,195,
+    165,50,65,239,138,20,71,197,172,43,186,97,27,11,151,129,
+    230,244,248,8,156,113,107,9,243,72,231,163,0,154,19,103,
+    143,202,162,115,59,177,27,117,57,61,6,72,77,67,238,11,
+    136,111,82,135,49,90,202,222,80,248,127,120,233,196,97,76,
+    34,248,178,133,145,72,174,131,215,163,80,185,226,226,185,48,
+    90,72,194,135,63,73,135,124,164,156,77,128,196,10,36,98,
+    178,247,100,150,201,236,143,245,136,199,217,0,124,231,180,30,
+    231,199,210,16,151,77,38,97,133,29,148,60,37,21,146,173,
+    48,6,62,23,113,22,166,114,198,77,85,208,237,146,238,20,
+    153,51,205,162,154,220,103,199,84,158,66,145,253,164,138,236,
+    223,125,168,167,212,66,186,213,167,200,154,209,44,246,124,123,
+    246,155,179,95,159,95,63,191,49,250,96,252,15,85,199,205,
+    82,239,218,199,242,109,25,80,147,173,12,234,127,119,211,236,
+    251,179,52,248,180,52,252,172,52,220,66,154,117,70,145,181,
+    108,51,215,255,104,224,231,247,55,223,59,253,203,12,16,104,
+    79,115,167,55,115,253,208,254,46,148,90,186,150,63,248,157,
+    60,144,63,168,72,179,120,160,101,164,147,231,134,81,204,188,
+    68,64,90,200,176,50,9,122,20,216,30,233,250,17,233,142,
+    41,179,149,201,42,143,51,98,177,14,247,195,164,191,73,48,
+    13,233,158,140,162,242,113,7,220,188,202,157,75,62,61,23,
+    216,9,148,252,171,224,191,1,1,229,154,214,58,165,107,38,
+    248,15,36,135,180,194,106,94,190,77,180,119,115,123,107,162,
+    222,205,237,173,149,233,213,222,106,161,255,147,181,161,231,178,
+    123,185,181,122,210,212,14,109,12,110,120,15,142,180,16,12,
+    119,146,55,250,180,204,198,104,11,65,247,48,233,94,75,148,
+    83,255,1,19,83,142,85,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/isas.py",
+    "gem5.isas",
+    embedded_module_data,
+    1463,
+    2525);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,130 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,86,205,111,220,198,21,31,46,247,91,187,146,229,
+    88,145,21,167,240,32,1,28,175,27,237,90,86,163,186,66,
+    209,86,150,84,89,128,237,166,150,156,4,123,25,113,201,145,
+    197,104,72,110,102,200,200,107,56,64,14,1,170,2,69,81,
+    20,45,114,233,161,39,161,133,212,123,255,12,53,13,208,5,
+    1,1,5,122,18,208,195,26,182,129,34,167,188,55,220,93,
+    83,177,106,36,220,225,219,199,55,111,222,188,249,189,15,242,
+    63,36,117,229,250,255,79,126,11,228,115,226,16,199,16,196,
+    51,154,134,65,156,140,99,138,140,103,54,77,205,103,69,214,
+    203,53,115,154,207,137,188,87,104,22,52,159,23,69,175,212,
+    44,105,190,32,202,222,72,115,68,243,69,81,241,170,205,170,
+    230,75,98,212,27,107,142,105,190,44,206,120,227,205,113,131,
+    100,200,10,113,70,62,35,78,133,231,246,76,66,246,205,129,
+    83,205,179,78,117,141,212,70,143,241,161,102,196,217,29,75,
+    250,199,102,242,48,190,24,108,113,201,125,155,191,43,131,48,
+    176,3,1,194,226,7,215,231,110,4,150,116,128,127,237,246,
+    242,218,234,250,78,112,139,127,204,197,162,101,111,241,155,46,
+    151,150,180,183,58,48,251,234,154,235,223,23,124,113,203,242,
+    125,46,150,150,238,206,178,153,185,171,87,209,198,226,187,247,
+    214,59,109,174,128,31,91,115,189,182,192,29,108,174,84,32,
+    65,100,174,174,45,160,150,228,31,69,174,228,202,78,195,152,
+    25,192,248,6,144,95,1,144,156,52,13,135,52,51,142,209,
+    52,119,201,166,225,100,62,43,54,179,187,228,129,209,204,193,
+    209,204,184,2,30,47,113,47,208,94,91,243,112,184,50,133,
+    107,125,203,85,180,45,121,43,114,69,72,65,135,182,80,129,
+    130,52,82,220,161,155,129,164,14,44,243,85,40,173,208,13,
+    124,218,142,100,59,80,92,213,233,106,72,149,235,69,194,10,
+    185,210,198,44,95,91,152,93,185,249,144,126,20,89,206,180,
+    29,72,78,85,71,133,220,163,59,110,184,69,45,122,109,229,
+    6,29,162,64,61,48,45,59,125,149,58,93,208,102,16,79,
+    6,128,50,141,40,181,17,82,186,53,192,20,93,83,60,236,
+    219,243,169,152,161,142,21,90,192,130,215,232,102,100,163,159,
+    218,146,94,250,54,229,240,71,103,175,109,223,24,46,178,0,
+    100,219,133,3,125,236,134,29,26,108,210,235,111,107,3,22,
+    156,8,195,69,91,150,191,77,197,181,254,230,193,166,54,55,
+    115,251,37,22,102,230,234,101,173,117,229,202,210,234,218,226,
+    173,133,213,219,203,119,175,92,153,79,32,30,162,170,2,193,
+    69,231,165,184,62,95,160,237,193,131,31,132,116,219,15,118,
+    124,26,6,180,197,169,228,16,50,197,253,16,247,71,247,192,
+    163,14,72,45,49,189,19,72,225,12,48,135,77,218,50,112,
+    34,155,107,75,146,11,215,106,193,233,20,46,84,161,107,91,
+    2,132,42,18,161,234,59,191,252,192,194,68,212,252,116,114,
+    37,19,11,62,229,201,28,110,23,33,76,52,4,104,210,105,
+    5,104,249,232,222,102,16,233,96,232,133,27,27,118,224,111,
+    186,247,85,163,191,190,113,159,123,239,48,225,182,32,158,157,
+    198,131,235,115,211,81,43,242,195,104,90,70,126,189,221,217,
+    216,232,187,178,30,80,144,204,39,15,245,58,181,3,135,79,
+    183,68,96,111,207,247,133,120,41,176,14,104,65,250,58,13,
+    240,69,27,175,7,237,144,78,127,184,225,195,225,237,141,161,
+    106,189,113,138,218,119,115,46,217,215,54,82,165,88,130,27,
+    91,197,147,187,32,253,163,241,57,9,83,179,97,230,57,255,
+    225,144,15,243,41,105,118,192,29,24,123,160,177,63,212,50,
+    72,56,242,92,207,201,236,129,221,125,35,53,91,77,205,154,
+    7,217,147,243,159,24,225,88,202,143,51,169,29,75,47,247,
+    206,201,29,228,79,246,199,79,50,225,68,106,175,130,83,212,
+    119,201,41,59,35,7,149,189,2,232,22,134,186,102,56,249,
+    92,119,15,238,253,225,211,159,43,228,148,203,169,62,202,60,
+    50,30,153,7,163,123,128,197,254,16,15,232,222,4,90,215,
+    216,157,90,38,174,184,202,98,253,78,232,196,23,236,65,75,
+    102,237,126,79,30,78,62,252,253,250,55,179,242,187,86,221,
+    105,21,247,237,139,174,78,239,41,158,180,9,219,138,112,147,
+    122,108,66,215,195,247,138,114,31,242,99,60,32,52,228,162,
+    221,142,88,8,253,63,54,225,112,113,201,143,60,134,253,82,
+    197,89,108,85,199,69,80,139,77,104,57,199,24,187,99,12,
+    108,173,16,23,197,140,195,208,76,92,66,78,119,33,20,186,
+    67,161,219,23,22,196,181,68,86,4,38,17,85,112,15,120,
+    194,230,134,219,64,159,174,101,193,17,177,205,54,1,191,184,
+    212,30,188,127,226,124,210,153,227,49,221,0,217,176,251,214,
+    170,18,131,40,71,180,119,0,179,196,55,122,60,154,244,236,
+    247,127,193,110,45,191,183,124,75,98,234,72,60,129,44,35,
+    193,140,139,243,235,171,183,87,239,172,72,76,149,56,167,162,
+    54,151,113,145,49,215,119,67,198,106,57,64,135,139,77,249,
+    22,234,95,66,114,25,245,74,140,217,2,188,103,76,225,70,
+    88,125,159,126,213,80,210,110,180,59,225,86,224,235,122,109,
+    12,94,96,13,12,46,86,45,67,134,233,104,66,213,202,105,
+    88,250,112,34,157,20,245,193,198,75,48,165,254,9,228,127,
+    159,146,163,226,153,163,169,215,255,52,121,116,249,71,95,94,
+    190,217,203,153,165,242,99,2,228,41,146,30,146,103,101,82,
+    170,246,50,153,234,236,99,51,139,19,89,156,0,242,172,66,
+    206,94,254,203,189,195,241,217,127,140,207,126,57,62,187,155,
+    63,58,247,230,209,196,247,254,192,254,246,230,193,91,127,255,
+    101,207,204,76,128,49,32,79,145,236,150,158,229,201,133,119,
+    186,19,23,186,175,78,246,233,185,169,238,196,100,119,234,181,
+    222,88,241,2,168,2,121,138,100,119,236,217,57,82,26,253,
+    117,225,55,133,127,21,207,127,81,60,175,213,47,118,95,153,
+    234,190,254,253,94,137,148,166,30,147,28,186,146,67,87,78,
+    144,39,88,70,181,60,162,236,91,30,103,44,46,51,230,193,
+    251,64,32,95,97,12,94,210,162,63,83,96,204,9,108,198,
+    52,86,113,181,15,187,205,133,128,224,24,178,129,48,97,14,
+    254,76,94,197,224,140,14,72,13,39,110,36,248,13,126,189,
+    204,249,92,177,71,144,252,224,98,14,124,249,118,68,206,12,
+    140,222,169,189,18,23,160,65,67,249,8,157,75,241,217,23,
+    75,62,201,60,232,5,94,59,240,161,44,85,93,199,91,213,
+    49,254,154,149,216,103,227,159,166,52,116,54,15,146,217,133,
+    178,151,81,171,83,247,184,114,89,8,31,28,2,63,56,216,
+    55,82,62,73,88,154,178,146,212,70,61,249,84,96,118,242,
+    105,167,211,61,190,152,82,27,86,19,236,219,175,117,149,148,
+    194,165,211,181,148,254,8,100,67,137,46,158,56,11,237,65,
+    37,5,55,138,128,128,211,253,79,194,164,20,17,176,191,146,
+    4,60,140,205,87,197,31,39,49,254,137,92,208,109,20,2,
+    244,95,32,61,211,48,140,222,28,49,166,14,201,249,244,248,
+    55,153,61,60,57,186,47,72,32,231,141,76,143,252,63,146,
+    39,198,138,113,72,126,158,30,93,242,195,195,147,163,75,150,
+    15,79,142,46,153,60,60,57,186,228,210,225,201,209,203,207,
+    27,144,32,47,146,223,93,127,140,127,79,79,153,210,104,124,
+    13,203,37,124,251,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/prebuilt/demo/x86_demo_board.py",
+    "gem5.prebuilt.demo.x86_demo_board",
+    embedded_module_data,
+    1685,
+    3193);
+
+} // anonymous namespace
+} // namespace gem5
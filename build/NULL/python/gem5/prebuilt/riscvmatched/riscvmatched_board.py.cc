@@ -0,0 +1,732 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,213,125,109,108,27,73,150,88,243,83,77,170,41,126,
+    74,34,245,73,234,203,162,173,239,111,201,146,109,201,146,44,
+    217,150,237,25,207,238,222,106,103,142,67,179,219,22,109,126,
+    104,154,45,207,152,161,114,131,96,146,227,110,12,172,103,227,
+    203,104,239,60,57,102,49,59,167,185,245,229,124,200,6,112,
+    144,59,196,73,238,71,128,228,71,55,209,11,17,13,24,240,
+    37,240,143,65,130,128,206,206,0,193,254,8,82,175,154,31,
+    205,47,75,246,122,131,132,166,159,170,171,94,189,170,122,239,
+    213,171,87,213,85,197,255,74,40,62,117,185,191,191,158,80,
+    17,196,103,4,77,208,170,16,177,41,255,85,109,170,208,95,
+    117,72,29,214,108,106,194,218,77,173,74,142,215,109,234,208,
+    95,77,72,31,174,219,172,11,147,155,100,216,176,105,8,27,
+    55,141,225,250,205,250,48,181,73,133,77,155,166,112,195,102,
+    67,216,188,105,14,91,54,45,97,235,166,53,108,219,180,133,
+    237,155,246,176,99,211,17,110,220,108,12,55,109,54,97,122,
+    218,80,115,216,185,233,12,187,54,93,225,150,205,150,112,235,
+    102,107,184,109,179,45,220,190,217,142,211,117,161,142,112,231,
+    102,39,14,235,67,238,176,103,211,131,195,117,161,174,112,247,
+    102,55,14,147,161,158,112,239,102,47,14,27,66,125,225,99,
+    155,199,112,216,24,234,15,123,55,189,56,92,31,58,30,62,
+    177,121,2,135,169,208,64,120,112,115,16,133,77,116,67,104,
+    40,60,188,57,140,195,230,208,72,120,116,115,20,133,45,159,
+    16,155,99,106,226,28,65,91,63,33,104,27,211,201,120,152,
+    238,47,117,4,241,11,93,158,117,155,227,180,234,42,225,181,
+    127,13,15,151,188,106,73,123,49,24,227,36,242,242,54,23,
+    140,70,252,33,175,69,50,44,210,52,251,182,63,114,131,145,
+    234,150,252,52,60,73,250,37,54,72,163,8,234,108,244,195,
+    229,96,236,214,122,216,143,158,12,171,44,243,193,14,19,9,
+    220,145,244,107,193,213,224,109,70,50,174,159,187,182,226,99,
+    70,71,70,70,36,253,250,229,223,91,242,179,146,241,202,198,
+    226,217,45,38,112,139,97,37,237,149,40,203,73,212,219,126,
+    5,153,246,183,131,177,192,237,165,104,148,11,69,253,52,195,
+    94,96,216,8,19,250,94,148,189,5,207,146,25,39,111,132,
+    131,209,239,6,89,110,253,178,68,226,136,183,223,57,43,213,
+    203,49,75,161,104,224,150,100,144,31,222,142,220,240,234,37,
+    205,42,205,73,117,8,92,138,210,140,84,143,2,87,216,232,
+    54,195,114,119,36,155,226,225,42,199,6,35,55,98,146,69,
+    17,135,10,166,99,18,137,98,174,114,126,142,241,170,36,251,
+    226,181,24,199,250,3,220,213,59,49,142,9,47,69,253,44,
+    141,162,109,114,69,161,33,249,202,162,88,203,213,149,165,96,
+    196,207,222,81,196,53,93,69,165,132,152,179,91,254,8,100,
+    88,126,123,194,55,54,49,50,130,82,52,235,87,23,33,83,
+    190,132,183,153,88,116,135,13,64,169,134,232,109,134,69,108,
+    103,98,232,129,4,78,7,89,38,246,53,82,121,2,69,180,
+    188,189,126,245,236,119,55,252,92,96,139,161,207,250,17,92,
+    11,50,172,159,13,108,221,65,169,212,119,166,39,80,123,2,
+    76,44,22,101,3,229,125,71,3,125,231,39,4,244,29,78,
+    85,76,162,85,95,162,167,95,20,98,118,137,4,145,82,17,
+    85,62,156,78,145,75,141,176,52,213,176,190,68,255,127,81,
+    120,122,168,249,82,141,158,213,249,231,27,101,165,169,80,105,
+    72,51,181,241,191,49,186,209,103,131,9,71,217,59,238,235,
+    81,214,205,109,49,110,212,30,247,53,224,251,144,17,39,3,
+    15,221,87,119,174,197,176,68,220,31,6,185,45,247,232,212,
+    185,37,119,244,186,59,140,179,230,16,145,12,89,46,230,246,
+    115,238,145,143,102,70,228,79,158,6,195,249,131,33,72,155,
+    115,95,101,2,208,1,220,99,227,3,238,109,164,148,238,209,
+    217,73,160,5,101,211,126,206,31,219,98,24,46,151,111,142,
+    101,184,29,54,50,231,206,201,147,161,229,202,226,68,73,11,
+    213,248,239,121,134,168,137,175,212,146,46,6,149,144,180,177,
+    96,156,241,106,217,14,20,47,89,98,12,231,147,107,234,99,
+    161,179,177,192,83,137,188,129,162,49,158,74,210,203,201,49,
+    96,145,251,55,39,99,108,96,120,251,14,183,21,141,12,223,
+    96,194,147,195,219,44,115,109,39,24,226,134,89,232,14,97,
+    89,19,74,30,124,50,199,182,239,72,6,196,63,185,146,236,
+    8,162,118,17,253,143,109,32,240,49,241,173,147,104,232,73,
+    173,10,166,19,162,233,196,199,171,25,173,241,64,219,154,214,
+    182,62,53,216,246,90,246,251,254,114,248,207,135,133,227,39,
+    197,227,39,121,195,188,96,152,23,13,243,60,185,240,66,163,
+    214,233,191,33,16,200,98,160,39,40,219,199,27,191,134,6,
+    151,40,155,45,111,168,157,136,31,127,136,212,141,33,192,60,
+    111,170,105,213,166,198,64,192,63,186,135,214,49,90,90,143,
+    254,215,49,58,154,164,13,215,201,36,113,93,69,27,63,49,
+    109,234,213,4,83,199,144,165,138,66,247,210,245,159,104,75,
+    149,107,211,128,98,169,79,180,155,70,244,215,132,254,214,87,
+    205,73,50,186,235,106,186,161,34,55,85,3,219,196,52,184,
+    10,88,40,167,185,34,167,249,37,229,88,42,176,45,53,176,
+    173,8,219,90,129,109,123,9,109,91,5,182,189,6,118,3,
+    194,182,87,96,59,170,98,59,62,41,235,180,155,141,85,241,
+    26,43,240,154,232,38,36,65,144,158,150,110,70,252,111,198,
+    249,156,101,249,156,21,249,92,85,241,92,76,11,170,117,75,
+    69,173,91,171,98,131,156,180,37,114,106,173,200,217,86,45,
+    167,161,240,143,238,163,219,153,22,40,151,238,96,80,168,72,
+    141,238,68,207,10,234,180,187,236,217,131,158,75,202,87,164,
+    117,229,52,218,66,119,127,162,43,171,81,71,146,248,72,181,
+    217,137,76,222,49,201,170,52,230,120,120,241,159,65,134,18,
+    27,148,69,217,238,185,3,254,109,255,181,16,3,70,233,250,
+    78,40,228,206,89,190,88,48,188,19,242,99,219,5,182,18,
+    8,13,126,87,182,83,139,156,219,239,222,10,222,216,26,12,
+    49,183,153,208,0,50,102,193,152,27,125,175,249,99,12,237,
+    70,57,192,186,201,3,183,251,59,145,156,209,200,21,119,157,
+    141,134,221,87,113,218,16,166,182,148,207,52,231,126,255,253,
+    114,91,20,136,134,183,163,17,38,194,197,134,113,246,152,108,
+    135,10,6,232,253,247,229,42,189,3,53,144,11,240,199,98,
+    59,97,38,134,234,128,108,243,157,232,14,178,225,168,85,215,
+    24,148,28,229,208,112,233,190,24,140,236,124,132,27,5,237,
+    205,53,151,201,183,118,40,79,144,65,85,205,121,33,121,131,
+    141,92,131,194,192,145,203,135,138,69,6,215,205,69,221,163,
+    27,107,241,161,18,251,31,240,71,160,220,235,209,157,8,110,
+    32,182,255,211,211,3,40,135,60,40,76,15,141,214,26,11,
+    150,243,207,184,192,96,4,91,100,68,129,245,135,203,8,111,
+    49,44,51,135,243,108,113,220,118,108,110,120,56,22,188,14,
+    220,13,208,145,161,109,196,174,112,48,48,20,140,230,98,135,
+    71,253,51,99,204,212,200,200,224,232,245,217,241,193,137,235,
+    19,163,131,215,198,232,153,193,153,41,134,158,185,54,58,229,
+    15,92,243,251,174,239,76,79,140,12,6,208,144,54,24,246,
+    71,118,252,161,193,219,163,219,83,67,219,244,117,92,208,111,
+    244,163,67,99,231,214,226,146,118,108,35,184,180,42,145,129,
+    208,45,31,112,75,170,11,141,225,81,70,210,5,99,190,235,
+    49,73,47,15,105,151,2,90,162,248,209,19,57,87,33,139,
+    192,31,169,74,157,5,78,93,12,223,44,132,31,86,14,234,
+    154,4,225,43,184,7,156,161,152,43,161,126,168,46,115,56,
+    180,92,125,49,189,180,191,236,234,56,147,34,175,6,185,19,
+    165,121,245,156,185,86,222,20,73,84,249,36,84,9,125,66,
+    151,208,62,212,126,137,90,253,139,66,203,145,35,173,67,189,
+    82,239,55,32,226,178,148,241,168,143,133,234,206,179,112,14,
+    171,94,0,60,207,74,5,148,149,110,160,144,151,102,174,251,
+    119,66,200,205,144,229,81,78,51,39,12,153,36,132,242,116,
+    46,142,33,29,66,157,178,10,165,177,141,165,114,50,88,148,
+    115,238,239,109,49,40,111,185,246,251,75,172,6,210,213,72,
+    148,171,66,118,213,31,138,49,238,254,171,43,238,13,228,56,
+    123,139,205,7,167,50,24,243,251,114,126,40,242,106,217,105,
+    2,60,81,118,6,254,104,217,41,244,71,50,108,231,157,78,
+    118,8,158,205,184,250,190,173,188,107,122,201,107,96,187,80,
+    2,219,9,169,58,108,246,36,13,170,54,219,3,177,224,155,
+    176,189,56,41,182,131,156,113,137,244,249,130,145,32,231,243,
+    121,73,228,62,49,161,235,184,24,92,50,46,151,93,0,0,
+    69,177,243,184,124,159,47,16,66,150,197,231,139,129,204,115,
+    117,255,152,29,6,140,69,4,226,45,21,166,118,40,95,198,
+    7,40,61,246,7,8,252,47,228,22,185,9,131,245,243,192,
+    131,32,79,246,11,100,191,72,246,163,64,198,238,76,106,239,
+    146,207,91,38,30,127,143,111,89,17,90,86,196,150,149,164,
+    249,185,181,229,211,214,251,173,73,253,115,135,59,181,195,59,
+    6,5,199,160,232,24,76,26,158,146,166,31,214,221,173,59,
+    32,157,105,210,153,105,108,207,52,117,102,236,174,76,219,137,
+    44,26,115,92,47,8,157,193,248,13,128,108,41,96,71,81,
+    29,2,74,199,187,208,19,127,95,3,78,123,130,184,89,72,
+    186,167,98,191,224,20,238,119,169,230,163,190,87,232,155,92,
+    221,75,176,180,197,240,205,130,115,159,210,87,235,55,165,121,
+    105,85,92,135,115,21,40,220,44,148,227,43,244,59,101,122,
+    74,97,3,106,81,85,189,114,61,74,106,96,44,212,160,96,
+    79,184,226,176,76,112,173,197,48,93,102,131,202,237,138,146,
+    174,175,161,106,105,133,216,155,230,170,233,197,218,20,210,57,
+    79,237,118,248,172,5,172,222,218,88,55,11,88,62,123,181,
+    216,155,133,216,155,142,170,185,26,11,165,12,22,75,225,134,
+    107,149,72,107,105,29,173,127,88,87,106,43,81,109,157,85,
+    233,140,191,148,14,89,133,78,139,162,150,85,120,87,93,195,
+    110,160,201,167,175,181,42,78,155,34,214,169,8,23,202,185,
+    1,35,83,123,161,94,104,242,9,255,189,134,75,95,67,151,
+    145,244,163,35,35,200,85,128,137,120,193,190,127,13,10,29,
+    36,44,0,62,38,44,94,173,164,185,29,140,34,195,24,225,
+    208,84,125,103,155,243,5,105,137,220,14,70,229,193,21,135,
+    252,52,205,6,137,109,132,221,193,158,70,217,89,11,80,39,
+    63,204,173,14,176,70,252,184,141,188,26,228,65,132,101,51,
+    102,130,89,96,100,39,236,11,68,209,148,95,210,110,135,130,
+    1,201,24,65,143,168,160,143,184,152,100,244,115,28,178,172,
+    87,32,94,23,8,161,242,165,122,192,231,182,88,198,79,199,
+    88,152,120,177,208,207,36,13,203,5,164,58,132,224,219,14,
+    70,88,10,162,116,193,232,181,157,24,11,157,74,178,94,243,
+    211,80,67,100,215,99,200,131,163,145,205,213,160,90,75,117,
+    185,17,129,5,133,97,65,151,36,45,29,140,221,98,29,50,
+    209,200,13,201,226,139,162,26,109,5,183,125,52,115,59,24,
+    128,122,238,192,52,215,234,139,94,191,94,146,240,149,138,93,
+    66,217,228,137,44,182,197,18,229,67,238,216,206,182,236,32,
+    198,59,170,24,101,69,250,61,200,28,86,193,116,245,89,189,
+    249,238,204,11,226,132,193,250,180,109,86,104,59,41,182,157,
+    76,46,223,221,248,86,79,180,119,255,116,237,193,26,60,60,
+    27,24,121,120,233,96,96,45,61,176,38,12,156,23,7,206,
+    255,199,183,132,129,75,144,34,82,29,34,229,205,80,150,187,
+    27,7,84,79,154,234,17,168,62,145,234,227,169,190,204,208,
+    216,195,200,193,208,249,244,208,121,97,232,162,56,116,81,70,
+    239,20,169,19,136,182,199,251,180,165,59,181,38,180,12,138,
+    45,131,89,141,218,211,240,130,64,224,27,0,50,98,59,154,
+    3,159,24,126,56,40,194,92,249,108,33,243,49,148,185,197,
+    253,83,231,3,39,138,58,255,244,196,216,87,179,15,103,33,
+    40,82,253,25,79,239,23,45,162,103,65,244,44,202,49,29,
+    8,217,213,255,212,209,249,233,198,253,141,76,187,59,227,106,
+    207,184,186,179,6,157,11,21,135,192,55,0,16,234,250,183,
+    22,194,121,236,169,163,253,211,11,247,47,40,241,156,128,231,
+    4,60,39,224,173,101,109,68,223,241,47,222,19,123,103,30,
+    247,252,245,160,56,119,145,239,217,72,46,139,148,39,131,162,
+    195,98,31,68,123,159,188,243,183,191,199,247,94,130,248,46,
+    30,127,81,83,76,214,228,114,229,48,84,88,59,154,215,86,
+    12,67,106,214,142,158,11,216,69,151,16,197,22,134,39,133,
+    41,45,24,119,165,91,71,171,240,63,53,173,70,102,184,100,
+    221,18,117,213,186,98,184,26,197,68,173,129,167,122,157,138,
+    184,186,170,184,134,170,184,10,115,148,82,184,170,197,79,153,
+    227,73,29,142,195,246,162,18,10,60,72,40,134,147,56,250,
+    191,76,188,103,223,85,213,104,133,170,88,247,187,14,186,225,
+    42,161,164,116,244,156,202,50,81,174,65,200,117,164,214,153,
+    15,199,41,41,105,72,57,236,209,218,135,186,242,161,182,56,
+    244,213,148,69,113,0,179,21,99,223,88,109,171,14,171,180,
+    254,147,50,206,190,36,87,213,193,182,56,4,167,10,195,174,
+    242,163,28,58,233,58,52,60,26,74,215,74,43,87,74,95,
+    147,182,145,174,255,157,209,166,104,211,97,180,65,71,225,191,
+    215,28,31,59,27,141,68,208,252,26,79,83,214,135,47,187,
+    115,99,5,76,209,243,81,104,148,66,83,106,247,234,85,119,
+    24,77,70,134,88,160,203,118,35,224,213,73,117,219,129,160,
+    15,33,200,1,148,25,141,161,40,112,125,39,18,144,76,235,
+    249,241,248,98,48,194,72,84,225,241,74,48,34,105,71,71,
+    34,176,162,174,163,153,144,255,78,133,155,13,82,255,245,50,
+    1,246,237,6,226,197,123,237,187,42,229,180,55,161,42,234,
+    37,10,23,39,190,68,105,203,63,85,223,237,184,74,124,165,
+    66,67,223,9,244,248,149,6,47,239,178,176,240,202,94,128,
+    8,181,164,30,26,145,52,168,226,49,200,228,150,199,197,223,
+    24,231,67,193,24,7,203,41,167,226,211,53,71,69,228,86,
+    228,216,53,52,143,102,160,104,206,118,106,168,152,241,239,16,
+    161,216,44,1,195,101,150,208,244,217,138,224,153,179,245,91,
+    13,209,216,177,23,120,16,122,100,255,101,27,239,56,37,56,
+    78,137,142,83,89,77,9,30,54,253,240,138,104,24,150,179,
+    55,150,216,80,238,121,68,210,141,77,162,8,8,159,145,116,
+    147,163,104,26,122,201,219,44,59,54,223,67,64,106,8,51,
+    97,228,253,208,140,111,59,202,114,49,246,18,129,221,27,36,
+    154,173,104,140,99,191,15,136,245,56,14,207,82,35,12,39,
+    105,33,69,106,8,108,239,40,50,34,214,132,253,146,29,28,
+    161,178,57,36,242,102,98,62,118,231,218,29,214,7,196,222,
+    3,98,214,27,242,106,122,145,0,11,70,91,210,95,147,223,
+    91,153,74,210,36,83,73,89,146,30,47,192,199,36,189,127,
+    123,155,137,208,88,84,94,53,246,89,36,125,142,209,10,33,
+    33,15,167,92,12,241,238,35,200,234,223,130,92,108,106,133,
+    27,211,111,184,172,122,230,29,124,216,34,122,151,100,159,161,
+    11,185,35,224,204,28,203,56,93,240,117,181,100,58,58,51,
+    237,29,217,122,125,59,26,221,17,248,6,0,32,103,45,68,
+    87,223,23,237,162,103,58,231,218,100,220,61,95,24,69,247,
+    108,206,35,41,123,124,102,182,31,152,143,165,205,199,4,179,
+    87,52,123,15,204,163,105,243,168,96,30,23,205,227,89,162,
+    217,116,89,149,233,232,18,59,38,30,113,226,244,69,161,227,
+    98,150,80,89,79,98,112,111,53,231,169,204,221,91,189,127,
+    254,222,249,172,38,159,146,37,137,206,110,148,167,54,46,166,
+    57,14,73,87,84,50,196,24,7,158,217,180,103,86,240,156,
+    20,61,39,15,60,27,105,207,134,224,185,44,122,46,203,153,
+    158,119,244,236,79,241,29,99,66,199,152,216,49,118,79,123,
+    191,62,131,60,58,228,200,173,64,88,180,120,159,57,156,7,
+    142,129,180,99,64,112,12,137,142,161,3,199,153,180,227,140,
+    224,88,18,29,75,89,13,97,109,196,72,89,125,65,235,81,
+    37,59,39,179,58,20,124,1,207,223,0,144,73,117,101,169,
+    28,126,215,129,197,155,182,120,255,194,251,232,252,147,239,242,
+    199,47,10,199,47,138,8,90,54,68,203,6,111,217,200,88,
+    28,229,88,223,227,143,111,8,199,55,68,4,45,151,68,203,
+    37,222,114,233,104,88,242,55,251,150,10,196,159,197,74,240,
+    146,41,255,35,249,29,183,234,147,18,127,75,57,62,202,126,
+    66,217,114,153,42,161,74,41,150,232,138,31,229,50,0,242,
+    180,52,15,181,135,140,7,71,161,3,83,195,55,65,7,198,
+    190,195,232,16,41,45,81,229,83,54,218,235,14,199,65,190,
+    142,119,87,93,178,172,168,66,35,88,169,79,162,78,213,17,
+    85,62,165,148,138,254,230,221,227,180,17,141,111,245,113,247,
+    85,70,30,219,174,108,44,22,198,182,104,196,205,32,99,230,
+    134,105,221,239,118,228,97,111,161,32,27,6,16,65,64,105,
+    190,88,88,231,138,143,212,52,88,219,97,127,181,81,229,127,
+    16,202,81,165,221,88,4,207,44,118,52,170,152,154,238,5,
+    238,135,246,237,15,219,120,106,74,160,166,68,106,10,141,42,
+    74,60,172,228,44,11,32,6,0,6,21,150,3,176,3,224,
+    54,128,15,9,252,118,187,30,13,227,96,245,225,141,7,172,
+    25,130,145,151,205,253,63,4,128,95,149,226,73,114,97,189,
+    81,50,224,161,2,230,203,44,72,84,170,195,67,66,120,71,
+    170,71,13,66,211,81,188,255,192,171,145,173,186,85,65,95,
+    126,253,42,105,208,152,16,211,96,54,229,204,188,177,200,144,
+    120,219,203,216,245,223,128,53,95,203,172,209,23,184,210,220,
+    42,54,15,236,115,226,240,138,208,188,130,172,79,187,241,5,
+    196,127,3,128,39,93,200,242,24,90,14,72,119,154,116,255,
+    220,181,63,247,120,149,247,156,21,60,103,69,4,201,101,145,
+    92,230,201,229,12,233,82,32,156,227,61,203,130,103,89,68,
+    144,92,17,201,21,158,92,57,20,1,77,229,144,173,180,247,
+    166,237,189,130,253,152,104,63,118,96,31,77,219,71,5,251,
+    184,104,71,102,89,99,104,192,32,121,246,105,255,88,166,13,
+    166,182,94,152,218,122,97,106,235,69,209,63,190,240,163,11,
+    63,220,128,241,163,151,167,122,145,60,115,25,42,237,21,132,
+    177,189,210,19,178,189,66,189,64,125,105,245,43,130,125,159,
+    40,157,250,155,182,252,49,31,26,220,229,113,62,222,89,201,
+    217,18,132,255,13,217,235,48,115,159,153,29,201,157,202,162,
+    53,249,162,221,196,97,91,26,254,129,10,85,42,190,134,139,
+    196,101,185,233,40,234,151,145,40,231,222,242,223,102,220,203,
+    168,179,194,14,149,216,144,251,59,49,198,253,126,73,77,250,
+    189,239,131,119,138,85,9,191,75,27,130,189,33,151,162,220,
+    122,120,59,196,132,25,228,101,210,43,44,27,101,43,155,12,
+    186,248,210,38,151,32,168,81,214,152,11,55,249,121,131,39,
+    171,86,153,198,95,104,52,102,80,29,51,40,87,181,37,226,
+    2,255,45,68,249,220,28,252,208,75,200,17,197,78,90,121,
+    213,140,208,68,228,163,32,87,186,154,146,23,83,225,109,200,
+    175,13,57,57,216,239,126,148,52,191,68,18,243,21,149,96,
+    235,148,67,214,213,210,45,36,85,165,180,42,191,153,172,38,
+    38,127,196,189,142,167,7,10,49,201,181,172,34,35,77,209,
+    59,101,255,105,85,22,0,243,107,179,160,152,106,2,185,156,
+    32,10,14,92,150,208,27,26,50,246,230,251,115,60,213,254,
+    220,214,139,36,101,157,64,146,178,163,238,131,0,146,148,233,
+    101,61,165,154,164,216,159,66,13,255,184,90,53,205,208,202,
+    64,20,222,35,70,160,70,113,79,117,113,41,80,154,81,118,
+    246,1,16,171,45,170,213,74,81,81,213,87,13,174,150,142,
+    213,85,133,118,225,101,66,187,131,103,117,219,197,254,85,86,
+    221,114,201,105,21,146,251,168,166,248,218,75,124,127,5,57,
+    220,153,226,195,213,37,90,51,67,43,8,121,168,154,144,69,
+    251,0,79,13,228,228,220,113,168,156,181,121,14,115,170,10,
+    14,255,160,214,206,170,163,122,113,101,120,234,82,201,224,87,
+    171,101,187,173,74,94,242,168,170,251,71,202,5,244,138,185,
+    187,230,106,205,253,96,229,181,86,214,230,104,45,40,45,237,
+    205,212,214,171,141,255,184,240,254,18,239,3,131,109,5,120,
+    180,47,108,15,88,94,126,59,183,95,12,94,146,86,108,17,
+    59,116,155,192,216,200,104,113,159,192,216,248,208,216,208,120,
+    173,173,2,240,97,251,81,237,88,47,1,123,47,245,88,187,
+    101,235,35,87,129,133,229,20,217,185,49,130,126,202,211,82,
+    118,0,69,228,28,23,249,173,42,41,43,111,156,41,245,87,
+    28,57,143,68,185,171,44,22,239,171,233,185,148,224,245,130,
+    218,239,19,216,135,177,16,148,5,20,223,104,152,204,52,186,
+    62,243,253,196,39,52,246,137,141,125,201,213,76,115,251,103,
+    127,240,147,63,16,154,251,197,230,254,228,218,211,206,254,253,
+    248,19,146,239,92,23,58,215,197,206,117,190,227,60,154,109,
+    94,206,80,182,3,170,59,77,117,167,150,191,184,44,80,19,
+    34,53,193,231,191,207,74,9,162,185,174,219,187,223,244,151,
+    157,127,222,41,120,231,68,239,156,208,121,82,236,60,201,119,
+    204,31,70,232,37,38,205,81,217,225,66,202,119,164,9,133,
+    81,43,219,75,164,186,133,85,138,157,167,85,202,101,230,146,
+    247,163,234,34,118,241,165,98,9,118,65,93,97,115,164,34,
+    190,240,30,147,214,148,196,23,186,75,196,89,86,238,161,57,
+    18,53,118,55,148,191,79,197,239,182,180,151,240,26,90,72,
+    166,115,134,80,19,88,33,145,131,141,85,81,19,98,34,82,
+    189,239,90,97,39,46,11,123,4,37,115,49,2,191,205,146,
+    236,138,136,235,65,148,201,31,102,164,250,91,120,55,172,140,
+    81,143,12,42,82,173,237,40,188,153,50,195,123,43,88,235,
+    243,33,179,30,185,17,171,176,224,22,228,198,51,190,96,36,
+    198,249,35,92,208,207,49,241,174,42,74,91,134,51,11,10,
+    251,143,8,133,157,54,26,166,159,154,109,247,38,68,123,183,
+    96,238,17,205,61,169,15,210,230,126,222,220,159,25,25,71,
+    211,125,147,104,25,204,76,204,136,19,203,79,222,18,39,206,
+    201,49,163,153,129,41,57,228,125,230,232,144,87,15,224,129,
+    183,120,179,36,49,56,146,75,83,96,145,212,1,217,150,38,
+    219,4,178,67,36,59,248,252,23,171,163,164,143,238,112,116,
+    144,13,40,45,30,172,118,97,181,252,23,157,149,238,41,188,
+    237,120,168,249,18,165,255,162,32,92,100,205,21,202,74,107,
+    203,54,186,104,18,154,234,22,21,205,85,143,176,15,183,114,
+    131,78,77,106,71,152,103,87,161,86,213,86,211,186,106,251,
+    125,111,22,212,27,205,197,255,195,174,182,164,221,37,27,122,
+    18,218,155,5,53,47,235,178,117,127,162,253,188,124,35,145,
+    46,161,171,177,218,96,47,134,97,107,30,170,213,203,87,27,
+    106,209,81,172,135,211,70,196,171,170,111,32,106,215,26,229,
+    168,250,110,40,161,77,153,170,197,191,140,235,176,254,115,72,
+    43,106,201,88,87,142,121,247,111,75,100,80,95,193,215,170,
+    219,29,118,245,71,226,55,149,208,191,54,191,149,116,76,116,
+    195,161,116,142,220,226,146,246,154,203,218,91,87,210,91,213,
+    180,229,161,181,180,220,93,50,81,87,163,36,242,181,122,99,
+    109,106,175,211,27,107,80,43,209,94,27,109,63,140,155,202,
+    247,118,104,192,177,18,85,62,101,235,111,182,195,113,74,75,
+    89,38,238,169,223,59,253,46,170,195,174,97,215,88,34,21,
+    71,194,240,39,196,107,247,241,198,55,212,195,237,213,176,18,
+    101,235,133,111,64,187,155,232,230,55,64,197,73,187,222,0,
+    149,22,186,245,208,183,133,133,119,132,55,11,28,163,45,69,
+    199,232,102,83,62,180,91,127,36,94,183,37,234,15,173,121,
+    245,49,166,189,202,24,163,78,53,87,197,197,58,69,119,124,
+    94,190,141,148,66,212,157,181,115,148,107,97,153,253,232,44,
+    163,102,42,181,31,15,221,101,233,13,137,134,87,174,159,169,
+    134,133,104,72,185,170,197,31,98,33,106,80,227,38,107,183,
+    170,10,141,234,242,240,28,185,52,165,252,187,18,212,235,142,
+    18,9,211,145,237,105,197,56,112,79,125,119,177,230,168,81,
+    247,82,169,119,151,201,200,92,238,227,85,140,26,150,132,185,
+    70,73,150,215,26,53,106,83,123,157,81,163,6,181,18,157,
+    232,57,68,39,204,53,116,162,183,170,31,88,216,194,87,220,
+    182,183,107,77,88,83,237,229,249,229,86,209,125,9,235,205,
+    142,194,179,245,102,103,161,30,37,219,10,119,109,220,98,49,
+    95,217,42,133,253,255,206,168,246,30,155,31,211,144,52,94,
+    173,175,59,18,246,26,114,117,84,240,176,6,38,125,236,168,
+    152,175,64,179,191,194,107,140,37,108,71,232,217,222,132,253,
+    144,126,109,171,161,53,199,171,104,77,45,157,183,189,84,191,
+    10,50,223,109,76,52,214,212,175,19,137,70,133,126,53,214,
+    212,175,166,146,158,110,65,22,126,160,172,167,55,36,154,106,
+    218,235,215,233,233,181,169,189,142,245,175,49,250,36,26,43,
+    52,177,70,185,101,150,219,113,168,229,62,10,157,65,196,241,
+    174,194,147,58,110,196,167,69,95,238,161,254,191,212,207,95,
+    213,231,120,19,253,124,232,119,208,207,135,171,244,243,163,200,
+    239,240,126,94,139,202,171,120,29,77,53,108,197,200,43,216,
+    138,166,10,61,82,246,231,99,185,189,168,163,101,189,190,185,
+    100,244,31,43,147,166,179,100,221,66,105,123,186,11,161,158,
+    234,173,162,199,111,225,122,178,77,9,103,141,214,77,148,215,
+    56,114,241,183,40,111,242,208,242,166,42,202,115,112,23,138,
+    233,55,251,10,152,211,21,92,119,30,105,126,54,118,168,205,
+    168,65,39,209,252,90,22,180,54,181,215,241,149,106,83,123,
+    29,123,92,139,99,165,115,81,75,141,213,166,234,178,63,86,
+    189,52,68,165,250,10,84,117,42,253,213,169,28,190,246,116,
+    131,216,117,37,92,213,169,166,188,213,106,128,215,89,102,74,
+    169,198,77,132,76,231,213,218,126,188,70,173,243,212,154,171,
+    243,128,158,173,129,255,42,173,80,189,177,86,156,120,205,86,
+    204,85,197,63,138,142,245,36,14,91,61,56,170,231,208,82,
+    163,77,3,5,140,86,164,33,109,220,15,20,53,57,220,158,
+    13,85,175,87,197,152,124,113,215,144,104,123,21,169,37,12,
+    72,106,39,75,219,94,82,159,178,245,30,228,157,64,108,75,
+    9,78,107,89,79,51,0,206,13,13,64,44,131,182,187,27,
+    71,146,194,124,162,237,16,175,231,181,57,181,219,158,64,255,
+    100,223,42,142,98,89,51,183,161,40,121,225,165,62,244,97,
+    60,204,209,173,228,36,109,185,161,2,46,236,118,28,169,253,
+    167,18,29,135,174,62,85,107,115,225,16,27,219,85,179,28,
+    165,167,113,250,208,185,108,117,27,239,124,105,125,70,242,161,
+    221,206,68,103,205,153,198,153,68,167,98,166,209,89,115,166,
+    225,78,184,143,192,177,197,146,26,140,230,67,135,142,176,71,
+    161,221,70,47,189,17,58,103,107,205,131,203,109,199,161,101,
+    85,247,88,150,233,149,27,21,171,116,53,101,232,174,34,195,
+    177,252,211,174,39,225,169,41,185,213,132,71,33,57,79,77,
+    201,117,37,186,142,36,57,207,205,194,161,201,67,249,124,20,
+    138,111,138,207,93,53,248,124,238,21,252,236,174,42,92,158,
+    200,63,237,118,39,186,95,194,229,110,5,151,187,107,114,185,
+    39,209,115,36,46,119,191,2,151,143,66,241,77,113,185,231,
+    13,112,185,167,2,179,214,122,166,185,98,36,185,85,76,45,
+    155,63,247,38,122,83,83,85,169,104,42,202,235,77,77,87,
+    195,228,182,139,225,155,179,249,80,106,174,42,85,21,189,118,
+    8,175,122,83,39,223,64,41,235,135,156,85,58,127,149,240,
+    94,136,255,213,89,150,241,115,248,158,18,198,253,254,251,52,
+    119,237,253,247,221,254,8,141,195,49,20,134,13,16,49,197,
+    22,159,2,254,135,81,57,13,142,48,65,102,121,107,0,220,
+    158,34,111,7,31,42,161,149,143,138,229,175,74,81,92,236,
+    144,207,185,28,100,153,0,7,123,149,184,40,68,110,239,200,
+    91,204,113,49,197,61,70,43,68,254,152,148,70,50,226,195,
+    189,1,38,20,138,73,70,216,50,148,11,27,224,4,12,14,
+    254,70,53,28,167,240,109,45,131,183,131,44,23,140,198,235,
+    228,141,65,103,36,213,71,82,189,92,49,31,119,103,155,145,
+    55,31,105,88,230,134,164,15,108,69,99,76,68,34,97,39,
+    136,159,189,17,139,215,199,56,26,85,105,112,219,207,109,197,
+    27,134,225,36,240,153,209,220,102,42,73,11,123,171,241,214,
+    19,175,154,253,151,80,189,95,34,16,183,113,193,48,3,151,
+    209,12,22,78,88,7,137,191,251,86,23,7,252,51,44,28,
+    251,141,147,225,240,206,32,148,30,55,226,74,14,196,110,79,
+    204,72,250,24,231,231,118,98,146,54,122,203,127,39,110,144,
+    83,130,49,191,100,100,111,79,77,4,195,254,235,116,32,110,
+    198,183,115,20,105,75,58,140,23,55,14,193,113,104,160,192,
+    196,29,133,163,219,131,112,184,154,141,134,66,12,235,85,73,
+    230,226,145,110,204,165,120,131,92,6,170,216,32,74,10,72,
+    117,219,91,72,114,33,70,210,196,162,1,246,19,168,42,226,
+    47,108,4,30,132,195,213,87,81,196,215,48,59,253,26,118,
+    234,196,237,5,114,177,65,230,35,142,137,208,12,157,227,250,
+    0,62,190,61,194,94,81,112,231,223,97,114,114,50,66,189,
+    253,53,204,22,190,134,205,183,241,122,57,22,78,132,143,120,
+    181,69,102,178,255,42,159,81,210,108,7,130,236,26,32,59,
+    80,104,16,78,87,13,6,252,225,193,27,76,132,97,131,129,
+    175,97,178,16,111,44,36,49,138,180,248,228,165,168,27,182,
+    251,251,185,224,181,96,40,200,221,113,199,240,21,121,197,251,
+    116,24,14,33,68,174,231,14,53,249,62,12,210,220,150,23,
+    238,56,219,246,7,24,73,43,31,119,71,253,7,239,231,71,
+    13,130,45,58,236,127,130,34,77,69,94,135,253,219,241,254,
+    43,103,215,221,133,40,68,116,39,194,185,99,91,209,157,16,
+    13,251,236,182,163,31,50,44,236,165,27,139,219,74,50,162,
+    255,177,91,113,138,14,251,7,243,123,55,217,223,135,118,27,
+    139,76,14,18,103,102,136,184,165,152,15,117,36,132,39,233,
+    35,177,153,177,201,17,137,140,196,70,167,38,39,71,252,82,
+    189,172,244,190,112,24,105,126,238,97,0,63,24,139,125,242,
+    55,197,240,181,75,222,121,22,238,16,96,225,189,38,62,142,
+    32,89,161,209,103,65,77,10,151,12,90,161,175,149,70,89,
+    228,211,101,103,115,220,69,122,246,115,44,45,84,73,22,230,
+    169,44,188,118,100,97,213,64,50,20,8,74,134,2,33,124,
+    144,80,222,145,69,33,17,133,145,250,249,66,112,190,209,192,
+    68,118,194,12,139,212,153,253,199,128,114,23,163,156,189,242,
+    157,197,2,21,35,92,91,67,71,195,254,96,4,238,11,64,
+    221,130,61,7,168,255,30,80,77,114,197,174,228,20,186,169,
+    192,181,146,250,179,48,202,225,227,124,88,185,165,22,172,50,
+    168,208,37,127,44,24,184,18,140,46,99,22,193,125,139,197,
+    99,142,146,22,206,143,96,221,150,116,17,95,140,13,176,119,
+    32,108,81,170,208,181,32,23,147,212,225,73,73,119,221,207,
+    249,67,200,54,65,34,216,133,92,16,95,166,96,68,10,187,
+    74,115,248,58,74,10,206,19,194,229,10,24,9,63,193,150,
+    72,252,68,66,231,198,33,157,124,176,195,0,17,88,187,36,
+    19,222,99,95,170,53,245,96,170,124,128,19,164,89,152,133,
+    178,231,1,188,11,160,17,115,18,9,195,199,34,59,23,129,
+    171,36,169,15,217,32,199,44,115,177,85,100,116,37,117,20,
+    110,103,64,38,79,210,222,140,34,222,230,83,175,65,170,183,
+    79,222,179,249,87,184,245,216,222,72,90,32,36,25,10,187,
+    59,37,45,80,101,255,13,150,58,88,73,31,46,197,136,131,
+    114,22,85,16,217,207,40,139,80,241,213,77,245,248,46,135,
+    156,172,112,99,113,14,67,193,166,73,36,178,72,185,72,8,
+    225,72,89,102,70,108,107,228,52,184,180,194,151,183,69,88,
+    17,100,49,25,192,180,228,178,3,99,115,52,33,136,171,250,
+    9,102,26,70,146,43,193,194,201,23,246,63,3,128,131,48,
+    248,178,9,232,162,50,123,13,152,189,56,231,15,240,51,220,
+    34,33,63,3,139,37,146,141,220,144,75,211,92,71,61,13,
+    150,19,221,71,250,228,246,188,230,181,48,175,76,28,203,48,
+    213,246,188,86,195,91,71,195,125,236,159,55,224,107,16,45,
+    132,213,149,90,124,228,121,252,1,111,89,20,44,139,162,101,
+    49,169,123,106,110,186,23,251,97,226,110,34,169,205,144,212,
+    143,235,127,84,127,111,229,192,113,34,237,56,33,95,241,35,
+    144,67,34,57,196,147,67,135,166,30,144,237,105,178,125,239,
+    239,243,29,67,2,57,44,146,195,60,57,252,204,213,254,160,
+    19,182,45,118,96,144,92,127,106,111,225,91,23,126,126,117,
+    223,245,176,83,232,157,21,123,103,209,163,252,21,236,167,68,
+    251,169,228,114,134,178,192,153,156,95,57,143,239,47,60,158,
+    121,124,92,112,174,136,206,21,129,90,21,169,85,158,90,205,
+    37,63,181,184,51,14,23,250,126,118,249,39,151,83,235,95,
+    92,22,28,19,162,99,34,211,212,250,89,244,39,209,84,240,
+    207,34,63,139,8,125,83,98,223,148,208,52,45,54,77,191,
+    208,168,26,103,94,232,180,86,219,55,4,2,47,52,122,19,
+    156,51,53,53,100,49,104,32,76,86,32,187,167,21,168,118,
+    145,106,231,241,247,57,98,206,29,193,236,17,205,30,196,30,
+    123,243,253,5,209,62,152,36,115,172,248,149,163,47,21,127,
+    180,246,104,78,62,96,44,144,167,69,242,52,79,158,86,36,
+    239,242,211,231,248,169,53,193,177,46,58,214,5,242,188,72,
+    158,231,201,243,121,86,46,11,164,75,36,93,60,233,250,86,
+    79,52,182,237,173,126,122,249,254,229,164,225,105,99,251,190,
+    245,209,7,124,227,172,208,56,43,54,206,38,141,25,210,42,
+    223,176,180,215,114,224,154,76,187,38,5,215,180,232,154,22,
+    200,25,145,156,225,201,153,195,210,179,122,194,96,147,49,126,
+    229,242,242,199,79,61,113,61,169,23,92,23,69,215,69,129,
+    220,16,201,13,158,220,120,222,236,78,57,14,60,227,105,207,
+    184,224,153,20,61,147,7,158,211,105,207,105,193,179,40,122,
+    22,133,230,37,177,121,41,75,52,25,186,95,0,248,225,185,
+    228,98,146,67,194,220,155,75,121,246,230,246,230,4,123,159,
+    104,239,43,19,94,175,224,60,35,58,207,8,212,162,72,45,
+    242,212,98,33,177,127,191,241,145,238,96,100,41,61,178,244,
+    100,84,24,89,17,71,86,4,231,170,232,92,21,168,115,34,
+    117,142,167,206,41,232,204,61,74,8,206,101,209,185,44,80,
+    43,34,181,194,83,43,138,196,153,71,223,21,156,243,162,115,
+    94,160,22,68,106,129,167,22,20,137,39,31,83,229,202,131,
+    100,120,90,180,247,239,91,69,251,9,209,62,169,168,112,63,
+    239,157,123,188,44,56,23,69,231,162,64,45,137,212,18,79,
+    45,161,212,3,202,147,166,60,169,233,148,87,160,6,68,10,
+    206,71,100,90,58,255,116,240,143,7,249,254,249,253,15,16,
+    144,191,66,203,130,216,178,144,188,128,179,116,164,169,142,189,
+    120,202,191,23,223,139,11,212,113,145,58,206,83,199,159,55,
+    119,240,157,147,66,243,148,216,60,149,92,123,234,116,63,178,
+    242,206,113,193,57,46,58,199,147,235,153,150,238,131,150,19,
+    233,150,19,252,192,153,71,163,8,200,95,161,101,81,108,89,
+    4,178,142,31,95,254,209,229,189,245,131,182,249,116,219,188,
+    208,118,74,108,59,37,80,167,69,234,52,79,157,206,165,126,
+    126,129,239,63,37,180,157,22,219,78,11,212,25,145,58,195,
+    83,103,80,210,1,213,155,166,122,121,212,21,168,105,145,154,
+    230,169,233,28,254,175,218,6,246,191,255,184,245,177,73,104,
+    91,21,219,138,220,127,38,51,101,143,20,40,143,72,121,120,
+    202,147,161,26,15,168,182,52,213,182,247,142,0,39,184,225,
+    18,21,20,120,150,211,228,245,194,86,225,231,72,39,38,63,
+    61,117,255,84,146,124,234,104,219,87,61,242,243,142,25,193,
+    49,35,58,102,146,134,12,105,249,177,249,71,230,61,195,129,
+    115,60,13,77,159,20,157,147,2,57,37,146,83,60,57,117,
+    164,212,207,235,83,107,130,115,80,116,42,109,143,229,128,244,
+    164,73,79,106,62,133,76,207,168,72,142,242,228,40,210,121,
+    121,163,115,119,82,151,105,108,57,104,156,76,55,78,162,102,
+    220,251,48,165,251,162,225,145,238,151,13,47,52,234,38,227,
+    55,4,2,73,35,234,128,206,182,79,111,223,191,157,164,158,
+    30,165,35,232,12,189,24,200,29,33,211,212,121,208,116,44,
+    221,116,172,76,37,154,22,196,166,133,36,82,102,231,1,213,
+    153,166,58,83,117,2,213,47,82,253,60,213,95,140,211,8,
+    84,143,72,245,240,84,207,81,241,0,149,68,253,217,149,38,
+    93,79,169,54,190,125,236,209,69,185,147,161,38,193,133,107,
+    106,184,102,13,0,234,247,246,3,178,59,77,118,167,126,159,
+    239,153,16,200,73,145,156,228,201,201,60,171,141,2,217,45,
+    146,221,60,217,141,80,45,142,187,187,178,165,131,195,231,227,
+    105,199,56,176,235,246,30,247,96,119,159,126,24,70,180,27,
+    129,118,163,49,105,248,150,36,144,145,82,61,30,229,29,11,
+    130,99,65,116,44,128,112,243,70,200,117,224,154,72,187,38,
+    4,215,148,232,154,18,200,105,145,156,230,201,233,146,244,217,
+    180,107,86,112,157,20,93,39,5,114,94,36,231,121,114,254,
+    153,173,245,192,214,157,182,117,167,150,5,155,87,180,121,147,
+    117,133,44,200,106,237,123,31,221,120,244,125,193,117,90,116,
+    157,22,200,51,34,121,134,39,207,148,32,12,60,118,252,117,
+    203,19,255,191,238,224,103,214,4,215,186,232,42,90,220,231,
+    205,173,191,133,112,91,63,11,255,36,204,247,204,236,143,34,
+    32,127,133,166,89,177,105,246,119,34,218,103,138,54,241,199,
+    79,63,105,19,92,151,68,215,37,129,188,44,146,151,121,242,
+    114,161,205,159,183,242,189,39,5,215,188,232,154,23,200,5,
+    145,92,224,201,5,156,216,149,38,187,82,27,41,196,166,113,
+    145,28,231,201,241,103,249,158,37,144,93,34,217,197,147,93,
+    48,224,180,103,154,157,169,183,30,121,158,188,149,5,209,190,
+    32,20,242,213,19,142,214,124,63,126,94,223,144,228,64,53,
+    122,69,243,148,80,63,45,214,79,63,30,77,215,207,243,245,
+    243,10,227,82,180,192,232,251,212,100,185,231,184,223,46,90,
+    143,137,214,25,193,52,43,154,102,31,191,157,54,157,230,77,
+    167,21,89,22,4,234,148,72,157,226,241,247,57,213,112,119,
+    141,111,68,138,188,33,82,27,60,181,145,171,180,60,148,76,
+    62,62,38,56,151,68,231,146,64,158,21,201,179,60,121,22,
+    116,219,250,219,90,19,72,157,73,59,103,4,231,156,232,156,
+    19,200,147,34,121,146,39,79,230,138,70,125,43,99,105,204,
+    88,92,7,150,238,180,5,78,232,108,136,61,115,98,207,178,
+    96,89,17,45,43,25,80,216,222,180,173,55,69,195,85,83,
+    243,98,223,170,96,59,39,218,206,33,95,195,186,166,66,206,
+    6,184,24,8,32,103,3,122,165,30,122,37,128,22,194,230,
+    72,234,159,145,13,247,122,238,15,138,182,254,3,219,120,218,
+    54,254,216,243,196,195,219,198,5,219,178,104,67,158,193,114,
+    82,159,65,24,222,178,34,214,5,219,121,209,118,30,105,118,
+    105,250,13,193,54,36,218,144,249,27,74,194,101,213,6,243,
+    27,164,125,83,176,141,138,182,81,100,90,33,62,39,149,254,
+    125,231,163,169,50,190,161,130,155,221,178,37,220,215,10,77,
+    131,98,211,96,178,62,231,55,121,69,251,88,146,124,214,216,
+    156,52,62,183,54,253,81,108,111,226,193,130,216,58,42,182,
+    158,20,154,231,197,230,121,193,186,32,90,23,224,232,175,12,
+    146,200,93,104,218,235,121,48,40,182,140,28,180,156,76,183,
+    156,68,234,186,247,65,86,67,180,206,35,85,109,133,243,219,
+    173,13,207,173,142,123,111,125,218,116,191,105,207,243,105,203,
+    222,15,254,162,123,127,235,171,193,135,131,143,61,194,241,147,
+    188,101,254,133,78,221,186,128,176,77,11,201,243,201,243,89,
+    50,167,50,80,251,206,130,103,73,174,138,228,42,79,174,62,
+    119,52,239,105,31,152,68,231,144,136,52,194,49,43,58,102,
+    145,85,171,119,236,25,82,139,63,53,9,245,125,89,66,101,
+    56,245,148,178,242,182,162,178,63,179,53,41,248,156,177,183,
+    237,125,240,233,66,10,170,105,159,64,5,219,161,71,217,141,
+    207,76,150,228,10,170,140,221,150,172,43,40,46,246,57,22,
+    30,127,40,56,207,137,206,115,2,185,38,146,107,60,185,6,
+    71,125,22,196,122,143,88,63,12,5,206,22,198,246,253,6,
+    161,109,90,108,155,22,168,25,145,154,225,169,153,124,183,38,
+    5,210,35,146,30,158,244,188,154,21,87,184,133,72,213,247,
+    222,221,95,126,184,33,14,172,240,39,114,158,64,149,209,68,
+    233,69,158,124,188,245,120,83,112,173,137,174,53,129,92,23,
+    201,117,158,92,47,24,39,60,46,13,63,114,29,140,46,165,
+    71,151,158,76,8,163,107,226,232,154,64,173,139,212,122,117,
+    186,216,106,173,237,223,228,187,103,5,114,78,36,231,120,114,
+    46,83,97,184,228,22,222,41,107,222,46,232,240,163,119,126,
+    249,94,141,230,229,134,7,113,246,60,63,115,161,204,241,253,
+    109,171,172,52,180,85,235,107,182,223,221,74,106,50,246,38,
+    249,102,2,185,190,129,47,66,143,206,254,242,34,162,235,0,
+    186,14,99,146,84,42,198,126,219,99,141,56,179,198,79,175,
+    11,206,243,162,19,245,201,11,34,121,129,39,47,100,10,166,
+    233,85,234,106,205,57,72,11,169,97,129,28,19,201,49,158,
+    28,203,84,104,79,222,155,67,226,108,23,201,118,158,108,127,
+    222,96,253,33,115,151,65,181,39,235,115,131,183,163,224,234,
+    21,226,62,183,61,104,254,211,182,63,110,75,93,223,15,149,
+    13,234,71,193,145,191,71,189,111,33,78,14,163,249,237,240,
+    109,218,207,254,19,162,218,25,114,124,207,0,204,192,229,105,
+    112,181,51,228,101,40,211,106,197,253,11,174,100,92,62,232,
+    102,196,24,65,248,253,142,146,195,110,186,124,181,254,86,85,
+    126,216,173,100,211,148,170,252,238,231,202,139,104,118,213,71,
+    59,58,156,80,87,61,167,169,86,222,32,91,60,104,246,234,
+    39,39,19,71,188,177,150,134,195,81,85,110,158,77,212,184,
+    6,144,107,41,134,171,29,170,170,120,69,227,86,224,23,54,
+    49,86,223,170,120,24,109,90,95,202,235,146,154,23,47,190,
+    131,51,163,117,151,222,129,59,80,225,94,81,95,52,18,186,
+    179,10,139,189,129,173,96,136,102,109,170,194,89,210,39,102,
+    53,193,242,40,224,117,176,192,85,22,138,146,26,64,151,240,
+    85,50,62,88,36,99,237,42,188,76,11,90,131,15,142,202,
+    235,109,235,4,190,148,20,98,217,63,132,136,79,137,252,66,
+    39,73,115,215,240,137,82,22,238,94,96,255,11,196,213,69,
+    241,111,213,196,240,186,26,11,119,147,179,47,0,252,79,72,
+    164,32,67,254,76,106,254,208,180,5,242,54,193,98,79,201,
+    121,105,27,80,150,85,157,139,230,110,34,237,169,114,240,180,
+    2,235,36,116,137,191,33,240,253,28,150,182,167,182,142,125,
+    7,143,188,11,236,99,60,238,69,254,162,21,252,69,43,152,
+    25,171,49,169,67,54,166,107,224,192,51,151,246,204,9,158,
+    121,209,51,159,212,221,173,71,86,34,211,209,157,212,222,53,
+    220,53,137,100,107,214,72,24,76,7,100,71,154,236,16,72,
+    183,72,186,121,210,13,43,33,200,6,21,214,65,48,29,148,
+    3,225,119,224,99,168,96,181,126,222,245,197,113,177,107,92,
+    32,39,68,114,130,39,39,158,246,30,251,226,123,127,246,238,
+    207,222,125,138,92,198,243,34,213,190,151,64,38,175,15,234,
+    210,103,148,51,131,229,69,223,74,155,2,234,128,59,47,232,
+    2,220,66,68,171,126,38,219,21,175,54,110,10,32,158,71,
+    67,204,2,199,221,185,58,18,183,194,66,230,194,223,3,232,
+    187,237,15,237,48,187,113,151,194,106,44,252,61,197,195,174,
+    164,102,63,172,110,144,154,177,181,145,239,154,245,229,79,16,
+    195,251,36,111,13,195,84,137,250,22,72,163,9,75,35,171,
+    213,89,224,14,237,34,200,93,149,242,142,164,151,115,72,198,
+    226,217,101,248,81,29,63,13,202,34,89,243,33,249,138,221,
+    8,23,43,158,103,70,69,72,54,230,163,32,7,247,221,194,
+    181,189,190,32,199,132,99,1,165,241,48,230,57,71,19,229,
+    102,175,226,122,231,66,154,242,10,148,162,9,75,192,197,244,
+    234,132,38,161,77,232,18,250,68,221,67,213,151,168,164,95,
+    20,74,203,29,229,86,95,250,138,148,181,187,67,149,87,241,
+    78,0,110,0,30,0,93,0,186,85,248,118,118,75,190,75,
+    177,112,192,66,114,194,175,207,228,26,136,5,85,184,142,24,
+    223,3,160,184,59,61,119,103,84,31,138,142,31,175,148,73,
+    45,58,155,234,226,47,204,52,17,104,162,235,156,22,157,211,
+    160,127,79,201,22,228,14,100,172,141,112,21,122,179,7,190,
+    104,178,213,49,156,113,118,103,58,71,179,86,131,1,117,30,
+    3,140,209,6,24,163,75,0,150,37,234,213,176,117,128,133,
+    29,60,200,24,177,240,166,247,146,87,119,9,125,222,241,186,
+    225,202,120,232,251,62,159,100,244,249,194,81,122,39,4,97,
+    202,231,251,96,199,31,202,165,212,249,124,116,52,128,2,154,
+    24,199,74,90,164,18,33,124,59,60,235,1,0,27,104,88,
+    63,128,162,53,186,15,0,100,196,130,53,101,63,3,240,39,
+    0,192,180,179,255,12,64,10,192,207,0,252,25,128,71,0,
+    176,213,106,195,246,16,203,6,66,45,16,106,7,160,205,115,
+    86,50,229,238,173,135,119,141,62,159,87,197,158,205,247,147,
+    51,50,255,199,243,0,46,193,138,253,141,6,95,82,159,255,
+    151,213,155,116,100,150,0,208,69,184,16,75,219,209,180,60,
+    107,104,215,33,174,33,240,204,214,152,213,193,131,158,64,161,
+    58,8,145,200,79,148,17,140,132,177,33,91,159,71,173,10,
+    78,17,122,243,199,223,231,205,93,130,174,91,212,117,103,213,
+    3,58,107,150,200,131,23,26,66,223,83,136,126,87,117,92,
+    7,151,218,85,192,223,83,89,117,13,89,162,20,244,149,83,
+    86,233,26,247,56,228,216,235,26,139,160,88,0,196,232,203,
+    179,104,117,198,61,46,181,252,32,158,37,180,80,227,60,40,
+    102,131,24,170,178,36,231,222,50,208,119,22,129,178,36,103,
+    101,73,117,186,134,189,213,44,81,7,181,207,131,98,22,136,
+    177,85,41,37,229,120,229,82,246,185,87,43,197,170,155,4,
+    126,78,22,209,32,166,130,185,38,93,39,40,73,103,17,13,
+    98,58,66,26,221,194,254,120,150,128,191,143,38,228,191,85,
+    224,187,117,57,122,30,65,215,37,234,186,160,250,45,208,160,
+    22,160,215,93,136,209,151,163,217,117,70,126,16,81,177,131,
+    96,242,160,152,7,98,142,151,231,209,235,140,251,142,253,192,
+    67,87,150,208,67,142,60,40,102,131,24,75,89,54,35,49,
+    54,149,233,234,203,156,24,134,111,247,177,172,213,1,249,16,
+    120,102,113,103,117,14,220,5,26,123,179,117,14,220,5,26,
+    219,249,246,65,209,49,148,53,56,112,71,176,183,238,141,223,
+    31,204,214,59,176,190,180,245,164,206,62,88,200,154,224,169,
+    129,104,234,216,163,83,227,15,130,98,99,127,214,236,192,101,
+    183,123,100,250,54,232,65,246,124,73,24,20,171,89,18,93,
+    4,242,85,120,208,159,189,19,216,133,65,35,36,35,233,185,
+    59,219,193,200,13,217,206,96,227,128,29,30,99,120,114,40,
+    122,237,38,19,224,98,242,45,178,224,204,226,251,77,101,87,
+    11,188,83,124,141,60,190,88,85,182,72,166,130,169,2,71,
+    76,54,255,248,42,119,124,51,60,120,120,242,77,238,86,68,
+    123,135,11,134,134,174,211,220,22,19,218,102,88,252,210,83,
+    126,185,141,223,248,22,222,74,227,183,222,210,0,252,222,207,
+    80,241,247,126,134,228,223,251,25,242,231,126,192,206,39,255,
+    194,136,236,40,97,83,42,157,168,145,165,234,248,131,135,39,
+    111,141,28,49,120,89,12,191,173,87,196,135,125,99,82,83,
+    57,126,238,62,29,252,75,107,6,156,24,140,249,99,242,175,
+    142,52,227,103,54,247,67,123,177,66,8,91,103,184,113,54,
+    199,146,216,80,254,7,248,240,176,80,146,146,255,53,62,252,
+    99,38,146,173,228,71,215,240,197,130,248,247,76,164,166,146,
+    132,226,111,163,192,239,58,200,63,118,130,237,58,246,140,176,
+    70,224,59,128,201,121,121,216,58,197,206,171,228,137,94,236,
+    7,104,56,205,106,84,42,85,118,134,80,25,63,54,192,191,
+    12,97,144,3,89,181,70,165,206,18,135,3,99,33,47,178,
+    16,16,249,255,23,232,169,131,208,155,3,54,66,181,161,226,
+    137,139,202,111,134,56,207,151,126,51,196,42,95,250,205,16,
+    179,124,233,55,67,184,248,210,111,134,152,224,75,191,25,194,
+    203,151,126,51,68,63,95,250,125,70,204,241,165,223,12,49,
+    194,151,126,179,122,139,202,150,37,10,160,239,10,169,66,70,
+    165,58,204,104,155,121,215,9,100,126,95,104,224,241,155,26,
+    104,88,249,254,15,242,231,211,141,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/prebuilt/riscvmatched/riscvmatched_board.py",
+    "gem5.prebuilt.riscvmatched.riscvmatched_board",
+    embedded_module_data,
+    11321,
+    30051);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,244 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,197,25,75,108,27,199,117,150,228,146,75,106,37,82,
+    18,245,177,190,43,89,178,76,71,166,108,249,147,72,241,71,
+    146,21,39,170,109,181,141,221,34,37,146,110,214,220,181,68,
+    121,249,201,236,202,174,28,185,112,1,3,181,1,7,112,128,
+    20,241,193,7,29,12,195,134,117,240,33,5,114,204,161,135,
+    30,73,97,1,177,11,4,48,80,248,160,27,13,219,69,145,
+    83,223,204,114,151,164,72,73,110,18,32,212,234,237,155,153,
+    247,222,188,121,243,230,205,155,217,127,163,178,159,183,248,126,
+    249,15,0,95,35,25,201,140,138,146,76,140,97,8,238,82,
+    93,73,119,204,157,244,196,60,73,54,198,38,189,49,111,210,
+    23,243,37,185,24,71,219,221,170,63,25,136,5,40,238,81,
+    235,146,124,140,167,56,171,214,39,27,98,13,20,247,170,193,
+    100,40,22,162,184,79,109,76,54,197,154,40,206,169,205,201,
+    112,44,76,113,191,218,146,108,141,181,82,60,160,182,37,219,
+    99,237,20,175,83,119,37,59,98,29,20,231,213,206,11,200,
+    133,222,71,114,253,77,36,55,40,33,165,225,161,7,161,39,
+    30,123,40,177,46,57,120,30,69,66,27,164,16,97,76,207,
+    133,165,140,18,241,154,190,41,73,158,148,101,108,114,83,146,
+    166,124,52,37,97,147,61,37,197,231,21,211,123,118,148,22,
+    61,191,73,99,221,12,156,95,210,116,37,73,106,128,187,126,
+    242,162,166,99,41,174,79,165,37,44,67,69,171,93,65,121,
+    63,72,40,88,194,241,249,37,104,233,177,91,46,92,77,159,
+    85,174,40,106,21,69,183,195,171,74,154,150,136,87,17,112,
+    103,15,78,211,74,11,159,177,113,223,217,81,138,62,134,234,
+    115,231,126,103,87,187,103,206,79,194,139,217,23,47,159,75,
+    214,158,203,239,232,92,42,40,198,200,40,230,146,153,152,91,
+    118,41,30,217,45,123,46,121,100,246,166,39,198,186,144,226,
+    85,124,15,25,176,31,99,179,203,110,133,187,228,146,189,55,
+    61,15,161,244,196,17,27,243,111,67,237,171,162,14,80,234,
+    186,77,212,156,194,23,251,247,87,113,212,151,181,6,64,187,
+    6,217,3,243,88,103,118,124,56,115,254,212,239,207,73,58,
+    12,90,174,52,153,244,47,16,29,8,8,240,155,20,226,164,
+    73,208,20,125,49,35,92,157,87,176,34,40,80,35,196,211,
+    128,205,75,154,32,9,25,156,184,34,233,138,112,246,160,48,
+    45,233,146,32,165,100,97,38,5,83,178,24,215,19,233,148,
+    64,133,15,83,113,164,73,18,180,121,9,43,178,112,118,212,
+    18,30,181,186,186,0,221,124,144,56,157,184,162,8,23,137,
+    87,216,210,37,172,39,36,85,93,18,18,169,184,186,168,145,
+    118,75,167,121,91,223,97,97,94,73,197,21,65,159,79,104,
+    165,90,1,10,241,249,180,166,164,202,58,144,21,93,74,168,
+    154,144,190,4,212,85,130,4,208,11,186,17,46,72,23,85,
+    69,120,123,24,58,159,83,132,67,71,109,114,25,134,167,205,
+    43,138,94,148,184,159,140,185,106,168,227,180,205,106,63,52,
+    42,156,73,76,9,135,247,95,149,150,136,17,5,240,208,116,
+    60,33,233,48,140,146,8,106,54,202,91,205,250,206,118,172,
+    163,85,92,163,194,57,96,58,120,180,38,23,165,51,125,234,
+    168,168,37,174,193,10,197,48,171,56,53,27,119,149,249,185,
+    31,254,221,196,207,255,67,253,92,103,74,77,11,14,190,140,
+    86,153,74,31,100,144,206,214,166,148,93,224,125,46,217,179,
+    204,200,236,170,247,161,15,184,124,101,92,190,18,151,236,91,
+    229,42,165,46,35,209,137,64,122,93,137,178,210,199,151,209,
+    130,67,37,122,107,213,46,56,181,11,190,154,92,156,163,131,
+    31,86,71,224,218,25,199,164,227,224,128,82,82,40,218,108,
+    156,122,17,193,108,159,176,231,64,216,171,68,231,162,195,66,
+    255,232,145,163,151,167,250,35,81,71,2,132,23,143,166,168,
+    151,76,246,208,40,204,232,6,233,117,131,116,184,17,2,0,
+    49,148,83,15,38,172,25,241,19,140,206,24,169,148,157,74,
+    217,170,196,109,192,0,45,163,86,113,99,2,209,88,204,94,
+    77,200,250,252,108,196,143,235,105,187,40,38,82,9,93,20,
+    49,15,69,76,38,212,244,38,149,228,197,69,13,147,190,205,
+    198,139,146,44,65,204,22,177,162,101,210,41,89,193,166,59,
+    147,72,155,62,89,185,36,45,170,122,196,133,59,9,39,233,
+    77,35,190,33,8,63,188,171,225,248,72,102,73,159,79,167,
+    70,230,148,228,145,145,12,86,46,46,38,84,125,4,39,180,
+    248,149,164,21,71,42,10,162,181,186,51,75,120,8,100,92,
+    219,189,117,192,137,218,26,159,35,61,254,5,192,13,244,186,
+    1,249,247,24,92,244,233,116,150,27,203,113,99,6,55,6,
+    200,247,28,212,141,228,249,80,190,165,43,223,218,86,132,225,
+    206,124,75,91,33,200,249,3,47,16,128,87,4,20,8,120,
+    29,70,109,125,43,56,219,186,47,215,186,207,104,221,119,203,
+    115,167,238,251,189,35,143,253,171,126,130,26,220,96,190,167,
+    255,254,101,163,231,93,163,231,164,85,211,153,165,207,75,226,
+    12,241,50,231,71,4,167,11,163,3,145,133,1,238,83,195,
+    221,207,163,199,204,44,216,111,47,177,115,3,24,29,166,80,
+    86,196,12,108,129,26,38,140,26,33,21,240,48,157,135,57,
+    69,23,43,104,174,13,111,99,164,42,106,178,63,189,172,167,
+    214,122,22,108,190,243,185,17,140,100,185,8,222,255,35,53,
+    199,35,196,157,108,221,227,153,197,29,117,175,160,217,81,247,
+    10,234,57,226,96,163,4,16,117,77,150,134,252,138,64,228,
+    181,181,222,7,75,246,175,68,111,102,5,213,250,221,46,27,
+    197,130,35,97,115,120,2,110,119,45,238,202,80,178,226,217,
+    153,102,26,125,210,124,221,85,209,171,19,250,150,93,165,0,
+    116,39,124,11,93,98,100,230,38,167,7,75,178,64,15,14,
+    213,248,109,210,195,191,51,77,229,8,167,55,181,222,70,98,
+    192,198,169,30,174,95,76,15,39,112,235,187,182,146,1,84,
+    245,14,85,55,42,171,95,8,150,225,33,27,151,221,171,158,
+    135,48,159,79,220,101,18,26,157,86,246,38,250,133,198,218,
+    228,232,224,253,197,116,104,46,235,51,188,179,60,220,114,27,
+    173,180,212,162,91,174,222,228,247,151,183,190,209,136,218,118,
+    166,217,60,162,187,204,39,169,143,97,37,95,119,95,247,44,
+    123,86,218,107,73,0,111,112,252,123,217,93,114,172,5,7,
+    173,138,0,158,149,142,45,36,57,30,250,102,146,128,195,241,
+    214,82,196,217,74,35,177,179,140,162,54,95,205,254,223,128,
+    175,233,71,242,53,111,207,7,150,234,66,53,126,91,245,88,
+    178,212,86,178,203,108,9,122,60,113,116,97,222,212,139,186,
+    119,166,209,143,149,90,22,122,109,236,50,237,11,31,168,29,
+    175,175,179,181,119,143,235,94,176,129,80,171,207,101,118,217,
+    187,121,12,119,153,59,177,173,232,43,117,164,180,25,232,211,
+    137,85,21,182,115,102,75,100,203,106,75,180,229,51,235,104,
+    45,58,154,200,176,139,71,124,179,21,155,63,217,142,200,148,
+    188,60,13,224,111,204,215,104,14,18,128,79,186,175,51,229,
+    153,253,109,87,73,28,224,142,192,213,77,211,245,165,235,78,
+    15,116,193,68,92,144,210,146,220,148,165,137,104,196,141,73,
+    164,51,253,162,147,201,6,68,39,149,125,236,54,93,209,3,
+    38,147,160,89,165,70,34,182,32,220,160,105,196,15,129,99,
+    106,66,211,227,233,100,230,196,181,137,109,242,7,56,251,165,
+    49,228,13,112,206,44,166,149,199,212,116,92,82,181,19,209,
+    146,4,141,136,31,7,240,223,27,168,128,220,29,129,18,120,
+    22,106,124,237,70,245,45,247,6,238,71,159,122,190,9,102,
+    249,137,28,63,97,240,19,5,119,5,93,117,242,228,179,237,
+    247,65,185,253,122,222,204,126,50,57,39,85,108,83,96,193,
+    94,176,160,107,131,132,10,176,219,24,188,48,209,217,12,89,
+    217,184,166,136,42,140,50,21,95,130,214,6,219,170,114,201,
+    170,246,89,224,248,102,99,226,9,0,63,221,138,87,137,220,
+    247,108,43,178,196,48,14,224,80,99,211,107,31,216,49,223,
+    178,235,171,63,62,58,188,122,242,159,31,22,220,174,250,134,
+    23,8,192,43,2,10,238,10,22,106,208,141,240,230,193,242,
+    228,40,109,15,180,194,222,172,109,239,40,34,201,42,181,118,
+    83,165,181,229,170,211,39,88,181,25,82,111,240,202,195,112,
+    194,138,48,86,79,100,221,60,118,225,19,164,67,70,44,158,
+    100,126,78,83,221,36,122,30,66,36,1,7,239,233,10,148,
+    128,227,111,123,178,124,95,142,239,51,248,62,240,180,114,138,
+    106,79,251,9,35,199,51,246,120,241,25,228,28,218,126,206,
+    161,222,38,162,200,241,140,234,29,233,51,155,227,233,84,74,
+    137,235,162,70,47,246,104,82,79,143,14,248,48,177,119,160,
+    120,90,73,227,37,179,181,132,139,192,165,227,180,170,42,88,
+    195,7,8,161,135,48,154,44,150,82,115,138,89,79,40,51,
+    56,29,87,192,197,177,85,76,45,38,69,114,219,164,209,211,
+    49,85,144,162,178,133,98,178,64,77,86,29,37,199,91,146,
+    31,194,249,215,190,224,240,139,246,81,153,92,122,80,122,179,
+    46,145,209,175,138,69,49,117,114,89,33,56,47,105,208,19,
+    185,227,74,233,34,156,135,131,34,189,246,2,212,34,49,253,
+    10,40,163,16,67,153,126,122,162,161,106,53,216,150,176,148,
+    51,57,251,160,83,106,145,139,45,246,241,205,12,219,45,87,
+    37,245,178,130,173,67,150,233,35,66,19,154,132,137,27,152,
+    238,143,222,57,106,54,58,194,83,186,130,241,98,70,143,248,
+    172,211,249,81,106,189,56,152,19,159,164,228,208,173,201,3,
+    25,28,235,63,163,2,205,122,171,164,101,44,249,196,82,159,
+    90,119,18,197,67,92,213,212,111,123,136,171,162,190,76,124,
+    109,218,109,133,10,47,242,55,172,115,125,107,92,223,202,192,
+    131,183,140,254,99,57,238,184,193,29,207,114,199,159,133,119,
+    173,135,7,214,194,3,185,240,30,35,188,103,61,124,124,45,
+    124,60,23,62,105,132,79,22,16,227,63,68,193,173,233,124,
+    123,215,253,58,163,125,244,214,244,157,153,91,51,5,79,69,
+    96,166,224,121,75,199,189,35,235,157,209,181,206,104,174,243,
+    128,209,121,96,189,243,196,90,231,137,92,231,132,209,57,145,
+    107,153,52,90,38,11,44,208,189,32,196,175,8,128,51,125,
+    67,129,171,12,98,4,188,230,80,107,231,142,178,252,44,145,
+    197,18,89,172,37,235,53,143,90,187,190,252,232,171,143,160,
+    16,120,222,214,147,111,108,249,170,123,69,126,144,250,110,20,
+    226,96,59,80,3,120,69,0,16,240,133,128,189,218,223,76,
+    243,46,162,121,23,209,188,11,248,13,174,253,103,16,128,248,
+    198,245,58,97,173,78,200,213,245,27,117,253,196,214,123,243,
+    124,104,157,23,214,120,97,165,37,199,15,25,252,80,150,31,
+    122,222,218,187,194,174,11,135,214,132,67,57,225,136,33,28,
+    89,23,78,174,9,39,115,194,164,33,76,230,90,167,140,214,
+    169,2,106,242,239,125,65,192,237,211,183,38,111,105,121,62,
+    184,206,247,172,241,61,247,244,251,127,126,36,25,189,7,140,
+    222,177,28,63,110,240,227,89,126,124,251,214,103,145,253,171,
+    29,70,100,10,38,123,246,222,65,131,239,54,248,61,249,90,
+    117,111,141,172,142,27,111,77,223,154,54,248,174,123,191,53,
+    248,94,131,223,91,179,242,25,233,111,96,141,31,200,135,194,
+    70,72,88,105,52,66,187,141,208,240,35,217,136,158,248,246,
+    51,35,58,105,68,127,245,194,237,108,83,20,112,40,212,178,
+    30,236,95,11,246,231,130,3,70,112,96,61,56,188,22,28,
+    206,5,163,70,48,250,247,221,223,12,173,5,199,178,193,177,
+    124,239,238,251,159,131,242,119,249,188,48,240,160,206,16,198,
+    239,214,231,67,205,235,161,193,181,208,224,138,250,244,92,46,
+    52,101,132,166,178,161,41,64,158,217,13,185,208,144,17,26,
+    202,134,134,0,121,54,176,247,193,89,99,96,140,120,141,193,
+    245,229,7,35,15,62,54,6,199,173,27,167,254,44,125,172,
+    13,161,252,6,132,164,8,244,6,228,41,218,124,21,43,195,
+    121,158,254,185,101,143,204,46,51,165,244,99,213,251,16,242,
+    233,39,78,78,189,92,150,31,46,163,5,39,17,41,93,126,
+    46,151,229,189,165,188,19,242,114,231,38,163,252,87,117,245,
+    90,226,117,174,86,101,31,164,56,220,181,225,83,88,33,31,
+    6,164,226,61,251,165,52,22,236,248,42,204,140,252,90,40,
+    198,182,4,100,61,81,220,3,140,27,244,70,232,52,13,103,
+    7,47,79,109,144,11,204,8,103,165,12,117,186,52,103,103,
+    12,248,125,66,119,138,70,254,164,54,15,123,9,217,240,205,
+    122,125,78,215,196,12,196,83,82,105,214,89,151,156,100,103,
+    209,102,65,140,151,110,76,36,6,91,117,166,47,145,166,154,
+    149,246,45,172,16,154,238,138,171,182,178,45,193,218,229,200,
+    189,155,125,71,74,162,112,197,118,43,2,184,182,111,187,187,
+    206,202,77,229,17,17,240,41,34,57,196,243,182,174,124,83,
+    115,190,189,35,191,171,51,223,221,155,111,10,231,27,91,243,
+    29,93,249,246,110,163,125,111,161,209,79,226,139,159,196,23,
+    127,49,190,132,81,223,32,117,72,82,50,184,238,188,48,184,
+    46,156,90,19,78,229,132,247,12,225,189,98,109,150,62,214,
+    198,29,36,215,195,41,41,169,136,34,100,147,98,50,45,47,
+    170,4,231,69,241,179,69,73,45,182,248,68,81,78,199,1,
+    113,107,176,189,144,235,91,211,159,190,2,251,15,216,67,163,
+    183,204,152,56,24,62,72,192,17,2,200,9,22,19,135,197,
+    41,219,10,143,173,92,193,50,75,171,13,222,33,227,109,97,
+    200,120,237,191,130,55,196,114,5,68,192,64,152,157,96,158,
+    53,134,11,44,65,96,79,9,52,20,124,20,69,85,112,24,
+    121,131,55,254,144,133,245,202,238,55,216,253,5,23,195,238,
+    91,57,12,1,142,221,87,2,47,220,200,27,181,91,65,222,
+    143,102,25,204,177,123,12,118,79,193,53,206,190,187,114,189,
+    128,224,245,109,152,190,74,128,112,14,217,68,133,63,49,245,
+    236,105,102,229,147,2,34,239,167,186,245,222,30,90,22,35,
+    118,154,141,116,155,94,125,41,147,72,205,97,183,229,184,71,
+    162,233,139,11,176,94,172,107,124,76,150,42,245,105,154,2,
+    89,19,66,47,251,7,201,5,125,148,164,109,233,20,248,173,
+    22,165,151,171,90,84,42,126,39,21,105,153,206,150,57,182,
+    153,150,58,165,253,69,44,161,148,113,209,22,209,249,88,70,
+    167,220,60,245,230,252,250,213,180,168,146,47,184,85,146,200,
+    50,55,103,118,148,20,183,190,239,150,105,100,85,84,201,163,
+    159,65,222,121,99,121,86,254,23,181,83,74,235,212,245,35,
+    216,173,252,207,58,10,191,253,127,179,91,249,169,149,194,238,
+    60,43,155,184,147,201,69,203,10,184,137,46,86,202,15,153,
+    164,102,165,146,205,180,188,168,39,84,45,106,175,99,107,73,
+    222,64,168,108,153,254,192,29,179,34,194,9,252,5,178,62,
+    28,104,95,0,44,184,25,134,41,28,69,76,123,22,181,149,
+    63,5,143,143,113,21,208,207,7,154,16,51,193,100,209,201,
+    242,167,224,114,145,230,173,128,247,167,180,34,102,22,186,59,
+    87,254,228,43,139,180,230,76,182,242,201,163,217,108,229,147,
+    71,187,178,149,79,30,245,101,237,167,224,189,206,48,100,145,
+    111,253,202,123,250,178,187,39,95,184,105,225,213,54,132,116,
+    186,254,7,158,54,253,214,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/prebuilt/riscvmatched/riscvmatched_cache.py",
+    "gem5.prebuilt.riscvmatched.riscvmatched_cache",
+    embedded_module_data,
+    3511,
+    8808);
+
+} // anonymous namespace
+} // namespace gem5
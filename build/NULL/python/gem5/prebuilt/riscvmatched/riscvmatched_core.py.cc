@@ -0,0 +1,238 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,89,77,108,220,198,21,38,247,79,220,63,105,245,
+    175,149,100,137,250,177,162,77,236,181,45,203,142,163,180,141,
+    245,99,37,106,45,89,209,79,210,46,80,108,40,114,36,209,
+    230,146,235,33,87,142,146,0,213,33,69,101,64,7,7,72,
+    145,94,10,228,100,212,176,15,65,207,233,181,231,85,33,160,
+    11,158,2,20,40,96,160,7,25,118,129,34,167,190,25,146,
+    187,36,119,149,90,110,43,113,223,12,223,247,230,189,249,121,
+    51,243,102,248,55,198,245,23,182,211,231,127,103,25,230,43,
+    70,98,36,86,97,10,108,142,101,73,62,160,4,10,193,92,
+    176,16,202,133,10,225,92,184,16,201,69,40,63,168,52,173,
+    145,52,164,112,133,104,46,74,121,97,37,86,136,231,226,52,
+    31,81,18,133,100,46,73,243,77,74,115,161,37,215,66,243,
+    156,146,42,180,230,90,105,62,170,180,21,218,115,237,44,19,
+    96,222,101,164,216,231,140,20,71,29,15,131,12,243,56,232,
+    84,46,215,73,177,4,96,73,212,229,195,186,41,214,12,88,
+    11,234,241,97,105,138,165,0,107,69,189,62,172,143,98,109,
+    128,181,163,126,31,118,134,98,29,128,117,162,1,31,54,72,
+    177,46,192,186,235,48,158,98,61,128,165,209,144,15,27,166,
+    88,47,96,125,104,196,135,141,82,172,31,176,51,232,172,15,
+    27,163,216,0,96,131,232,53,31,54,78,49,30,176,33,20,
+    245,97,25,138,13,3,54,130,226,62,236,117,105,116,149,201,
+    156,125,74,94,50,172,201,221,42,26,178,166,10,74,38,100,
+    54,205,8,58,154,93,94,183,50,139,139,235,102,104,89,195,
+    134,217,180,140,53,17,233,58,136,179,175,3,73,174,200,186,
+    184,179,40,171,26,6,105,96,196,237,130,179,26,70,68,39,
+    100,215,118,139,136,20,8,46,172,78,67,18,213,118,16,198,
+    178,68,121,28,70,119,75,50,70,186,232,118,67,214,113,195,
+    54,134,184,33,98,114,172,196,228,2,18,155,11,74,1,168,
+    114,208,228,214,223,156,92,80,141,249,245,167,68,118,233,81,
+    200,228,242,121,85,40,160,124,222,140,229,243,5,77,42,41,
+    36,159,200,231,239,150,4,197,70,194,90,241,166,96,60,98,
+    158,19,229,223,79,233,88,188,80,220,53,182,53,245,194,22,
+    42,92,185,80,196,104,163,36,43,198,5,76,26,85,16,12,
+    113,27,73,158,151,188,8,205,202,22,119,113,10,20,80,114,
+    158,84,179,29,200,94,245,191,146,72,238,221,32,255,184,199,
+    145,58,101,235,226,86,235,22,75,10,52,144,140,215,18,38,
+    178,184,155,16,170,52,77,72,191,67,46,145,76,111,21,236,
+    127,101,139,115,242,14,88,140,156,104,113,208,33,87,188,22,
+    7,79,180,216,236,179,8,214,2,102,51,88,155,87,52,193,
+    88,149,11,210,252,250,210,163,32,38,93,136,59,8,233,108,
+    96,119,216,33,111,17,157,45,222,238,14,113,123,115,150,236,
+    240,233,170,17,133,106,44,99,68,106,128,71,26,88,29,115,
+    200,143,73,102,180,10,142,249,205,132,28,51,231,60,102,2,
+    12,10,74,172,20,216,10,60,132,138,60,118,42,195,228,66,
+    82,48,23,150,66,80,137,176,153,128,74,44,162,194,10,18,
+    160,30,102,147,157,53,19,180,127,236,183,167,1,50,34,143,
+    34,190,94,50,219,11,100,226,45,10,119,208,173,226,172,34,
+    232,250,42,50,96,126,89,121,164,227,174,6,141,26,119,200,
+    52,252,244,113,111,87,166,70,202,169,145,175,127,241,77,115,
+    121,244,157,195,212,245,163,212,245,189,5,159,59,143,255,47,
+    27,159,180,26,255,33,150,13,4,173,231,156,188,153,116,154,
+    79,95,241,27,212,35,207,53,104,206,69,135,204,159,216,156,
+    220,55,131,229,209,233,195,212,204,81,106,166,174,57,23,79,
+    239,50,139,176,32,156,228,50,147,14,249,153,215,101,38,79,
+    103,134,44,111,31,160,19,173,92,117,200,45,175,149,171,126,
+    43,113,199,202,159,235,198,230,33,112,30,87,5,27,114,66,
+    117,156,112,29,39,82,199,105,170,227,112,117,156,104,29,39,
+    86,199,137,123,57,91,177,92,194,53,8,243,235,203,154,166,
+    44,101,146,254,149,131,174,204,116,101,164,139,21,93,57,232,
+    68,166,142,79,221,101,210,233,43,51,186,89,82,197,117,85,
+    54,116,127,23,95,115,200,42,252,244,187,140,219,175,190,227,
+    82,251,220,253,216,65,172,82,203,180,239,199,239,39,15,146,
+    174,76,215,126,243,33,215,115,196,245,84,184,214,253,232,253,
+    248,65,188,194,117,236,39,238,55,31,52,87,184,206,253,228,
+    253,150,131,22,23,100,107,58,238,140,183,70,246,22,200,191,
+    85,155,107,254,49,117,246,239,231,159,213,141,169,196,62,169,
+    155,109,100,212,164,96,29,63,34,133,114,77,82,56,199,193,
+    47,10,191,152,20,201,197,225,151,128,95,18,202,52,123,123,
+    63,215,34,53,161,150,124,202,121,151,56,24,137,168,25,134,
+    145,152,89,126,202,51,52,128,136,169,165,194,13,213,192,50,
+    210,159,38,128,37,51,41,66,174,51,204,83,178,72,60,37,
+    165,151,50,173,254,85,44,10,187,64,81,65,51,107,51,102,
+    112,195,216,48,91,86,144,81,194,234,180,36,225,85,67,16,
+    239,152,65,44,232,102,167,162,137,130,242,158,172,27,26,222,
+    93,19,54,20,180,42,127,130,204,54,202,38,171,184,44,2,
+    66,121,237,91,138,182,81,199,20,183,53,89,68,94,102,130,
+    150,158,53,240,12,184,128,153,180,202,85,95,173,18,206,107,
+    183,85,205,5,85,130,120,69,52,170,138,204,54,217,102,205,
+    96,65,21,183,9,96,38,28,30,172,200,117,190,245,182,67,
+    54,136,111,233,30,223,170,196,218,247,51,191,195,229,216,240,
+    97,108,248,40,54,188,55,91,137,165,247,47,124,189,82,142,
+    141,31,198,198,143,98,227,192,233,231,203,161,116,37,61,80,
+    14,117,85,122,7,203,161,110,155,182,119,236,221,172,116,116,
+    238,45,90,36,125,177,156,190,120,152,158,56,74,79,16,201,
+    177,113,160,71,161,145,50,125,172,250,188,237,247,174,128,227,
+    93,127,100,234,67,5,123,237,14,218,222,19,2,239,9,130,
+    247,132,192,123,66,224,61,97,203,123,32,223,12,105,11,188,
+    167,32,109,133,180,13,210,118,224,119,64,218,9,105,151,212,
+    148,235,134,180,7,222,211,144,246,66,218,39,113,185,126,72,
+    207,128,252,128,20,205,13,66,202,67,58,4,222,56,236,243,
+    198,17,224,141,250,120,103,165,24,248,100,220,140,128,79,66,
+    212,41,124,0,135,153,24,15,127,107,219,136,223,68,16,191,
+    157,227,37,36,106,18,58,199,11,170,196,163,143,145,88,50,
+    16,175,27,194,22,226,139,2,134,24,17,182,26,157,223,196,
+    90,129,55,160,208,244,202,34,255,222,242,2,15,218,108,69,
+    178,206,203,234,166,134,33,28,132,72,153,23,54,180,146,65,
+    69,65,132,23,5,149,223,0,83,90,9,180,3,90,36,122,
+    47,93,225,181,77,90,250,35,18,99,230,177,126,39,79,50,
+    231,39,46,101,39,178,69,105,243,35,94,48,248,109,195,40,
+    234,83,23,46,108,201,198,118,105,35,43,106,133,11,2,46,
+    156,47,169,50,196,202,186,108,236,210,87,90,14,20,196,170,
+    205,114,213,218,216,6,61,2,70,188,184,45,168,91,72,34,
+    249,41,42,120,30,48,12,81,196,178,166,200,226,174,197,171,
+    53,135,180,72,54,100,65,129,249,32,241,134,198,15,175,202,
+    234,150,130,214,104,25,36,13,103,109,37,86,223,173,105,55,
+    172,126,155,215,240,61,1,75,115,72,17,26,232,116,42,65,
+    251,242,18,81,59,65,136,176,163,201,80,51,126,121,113,150,
+    23,96,126,195,73,130,223,20,74,138,225,24,161,227,116,105,
+    77,155,39,233,196,12,204,254,83,25,185,72,200,6,50,160,
+    71,120,26,178,243,219,80,252,30,233,150,34,194,116,224,84,
+    17,121,140,77,44,168,197,146,49,83,218,220,68,116,77,248,
+    15,102,104,51,46,157,202,140,213,113,167,51,115,185,218,101,
+    167,52,243,42,227,243,10,109,178,39,207,233,26,245,38,49,
+    49,249,42,118,22,133,143,167,69,114,238,68,250,130,10,81,
+    33,108,1,255,183,54,221,92,125,127,21,150,117,244,210,205,
+    186,66,172,92,126,21,83,214,134,113,186,41,244,242,54,84,
+    178,73,46,72,10,76,231,147,181,131,198,121,65,209,209,75,
+    170,166,122,204,102,239,18,129,201,166,129,91,129,172,209,72,
+    29,191,67,200,25,32,243,75,153,49,255,118,223,148,207,75,
+    154,72,206,230,238,101,201,108,183,166,254,77,89,69,171,170,
+    80,252,80,150,140,109,179,165,198,180,24,41,139,65,151,135,
+    155,114,65,54,204,94,239,146,225,118,123,179,239,7,150,19,
+    179,179,225,244,183,245,77,172,105,115,116,62,121,244,89,214,
+    39,102,119,69,197,114,125,179,179,225,228,54,251,126,96,50,
+    154,41,87,25,187,85,22,199,165,183,213,61,193,44,33,135,
+    213,72,74,215,75,200,234,142,110,103,198,208,73,226,2,218,
+    156,226,90,1,94,45,94,143,71,216,141,116,53,158,224,102,
+    239,201,19,210,28,171,77,32,128,221,115,136,100,245,101,132,
+    105,213,205,190,154,220,10,186,91,66,186,161,191,95,66,37,
+    43,158,235,175,129,107,48,59,116,40,238,66,211,39,206,209,
+    106,251,92,115,170,106,9,130,48,80,38,162,53,185,128,110,
+    169,86,59,171,77,241,130,180,199,170,181,152,86,20,237,222,
+    13,1,43,187,174,254,52,19,238,169,69,3,116,51,101,23,
+    152,175,158,39,72,100,101,198,54,170,33,161,63,8,92,118,
+    72,145,4,129,255,240,4,129,199,129,51,97,238,152,33,228,
+    39,76,199,232,222,205,227,8,211,215,79,34,188,174,238,189,
+    91,149,238,158,114,168,163,50,52,92,14,13,84,134,33,150,
+    27,4,248,204,0,9,9,45,94,119,31,224,85,30,149,176,
+    203,56,72,186,183,28,234,172,244,244,83,154,38,116,0,2,
+    200,190,10,225,119,85,6,33,188,236,175,144,210,189,182,198,
+    243,217,114,232,117,91,211,200,104,57,196,87,248,161,114,232,
+    140,45,63,60,70,248,67,99,68,114,228,53,130,182,247,208,
+    58,247,12,61,216,253,226,211,47,63,37,166,91,187,30,116,
+    126,209,253,101,247,222,79,201,191,213,17,203,39,70,159,228,
+    216,246,27,95,252,185,207,108,178,82,224,115,46,23,218,103,
+    62,102,115,97,122,113,213,68,162,61,240,4,225,215,65,59,
+    220,179,25,124,1,102,148,162,211,232,140,220,218,65,24,70,
+    243,239,201,243,16,84,241,235,170,125,165,199,111,104,48,51,
+    179,213,144,138,202,110,11,58,68,41,58,93,229,236,232,169,
+    38,161,8,6,82,69,56,228,56,42,201,33,210,186,57,229,
+    75,100,236,105,24,166,35,131,172,169,59,130,2,30,110,7,
+    133,178,202,211,147,11,127,173,26,31,78,94,204,218,107,243,
+    121,158,94,104,78,193,90,47,146,121,226,102,211,155,192,41,
+    216,100,40,162,187,33,122,101,55,197,95,181,33,126,124,233,
+    214,218,141,41,187,146,187,100,169,223,17,176,76,172,158,227,
+    55,32,90,5,134,93,53,167,72,166,170,174,122,15,53,5,
+    123,141,207,84,237,154,198,7,146,46,177,220,156,47,58,103,
+    34,98,69,224,215,52,56,198,65,124,170,26,51,203,96,92,
+    208,17,141,139,87,17,237,45,126,18,2,224,43,213,142,184,
+    124,173,214,17,112,20,180,207,145,208,230,9,216,201,104,190,
+    10,175,76,175,210,109,153,191,84,143,45,184,206,93,32,112,
+    149,52,182,134,214,31,22,137,204,229,107,147,85,137,6,71,
+    71,191,72,131,131,164,95,196,125,172,156,226,253,218,27,0,
+    158,163,166,27,104,120,234,5,129,139,111,93,229,103,172,237,
+    56,155,229,85,205,64,83,83,49,215,46,143,60,189,15,193,
+    225,142,12,30,225,58,220,8,162,81,2,135,157,89,206,122,
+    99,3,81,83,55,229,173,18,182,78,56,246,230,111,77,163,
+    13,88,170,137,15,99,88,92,41,10,78,68,248,78,168,96,
+    105,18,3,174,9,29,182,47,44,158,63,1,242,91,246,43,
+    198,96,107,160,247,0,247,181,11,169,253,25,225,90,254,51,
+    246,9,235,189,198,48,34,53,244,182,115,17,201,60,9,60,
+    132,58,60,174,214,131,101,164,224,103,204,237,170,166,219,213,
+    82,82,40,93,45,159,111,170,114,25,114,57,185,148,97,205,
+    136,88,44,229,101,41,19,48,67,100,93,48,131,178,46,204,
+    211,112,39,195,153,97,189,4,221,67,62,60,144,19,84,62,
+    111,45,233,228,226,195,12,175,44,172,206,126,128,239,17,198,
+    199,132,17,179,182,140,60,222,217,129,69,43,164,35,101,211,
+    108,34,42,65,187,25,205,231,69,114,99,155,207,235,164,175,
+    120,126,207,218,34,62,1,242,73,202,94,207,178,142,153,10,
+    112,117,114,219,249,175,61,230,159,28,19,109,190,223,116,208,
+    244,87,174,231,47,92,207,239,55,255,240,110,121,96,242,112,
+    96,242,104,96,242,79,35,223,102,202,92,207,33,55,119,196,
+    205,149,185,185,202,216,27,251,161,131,232,65,242,129,112,68,
+    238,165,70,202,244,161,43,113,198,127,181,140,87,156,10,152,
+    73,187,118,34,82,148,124,62,195,226,95,145,10,144,33,184,
+    110,85,211,112,200,183,4,152,177,106,86,219,202,210,100,43,
+    35,228,106,56,124,238,152,121,57,98,237,15,68,233,82,230,
+    13,51,98,236,22,201,86,27,164,93,89,184,146,213,54,110,
+    195,28,215,49,25,114,76,198,21,147,33,197,100,4,205,238,
+    26,158,165,31,175,236,143,83,102,187,11,160,159,173,128,137,
+    163,164,200,56,57,89,147,83,119,81,83,97,190,232,217,162,
+    245,149,75,195,122,150,44,91,121,226,6,100,180,112,140,136,
+    143,254,128,56,145,52,200,7,47,76,238,94,205,40,21,5,
+    175,209,45,199,104,167,239,37,67,86,244,172,243,29,12,39,
+    253,136,243,81,12,147,203,97,179,149,182,96,14,209,131,50,
+    221,35,232,37,167,217,225,227,211,77,130,94,125,214,65,116,
+    147,160,23,162,102,183,27,114,125,132,161,55,165,102,155,27,
+    181,190,141,208,219,83,111,37,96,47,0,126,245,66,213,91,
+    202,186,30,167,151,172,222,82,244,66,219,186,119,141,83,190,
+    117,135,107,5,80,9,247,114,101,221,144,45,87,157,203,27,
+    58,125,207,253,200,250,190,247,19,252,37,99,221,164,235,73,
+    112,141,227,32,203,178,199,87,25,182,191,204,244,185,159,227,
+    80,152,13,128,91,189,18,73,48,236,88,153,57,107,61,21,
+    230,124,217,251,124,199,92,47,123,159,10,243,86,217,251,84,
+    152,116,217,251,84,152,76,217,251,84,152,241,178,247,57,142,
+    176,108,243,49,83,79,202,45,252,51,146,190,168,177,185,147,
+    68,219,198,254,59,209,40,201,249,73,185,243,28,17,141,190,
+    168,177,79,20,77,13,215,137,6,136,254,122,82,110,31,125,
+    70,210,23,53,118,236,36,209,142,179,117,162,167,168,192,73,
+    162,86,191,122,68,19,108,228,152,169,39,15,226,207,72,242,
+    162,198,29,136,179,153,99,166,158,236,223,124,70,146,23,53,
+    110,255,2,203,166,143,153,198,116,255,151,207,104,250,194,141,
+    252,60,48,196,194,178,88,79,246,239,60,35,201,139,6,16,
+    157,46,255,6,178,66,233,153,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/prebuilt/riscvmatched/riscvmatched_core.py",
+    "gem5.prebuilt.riscvmatched.riscvmatched_core",
+    embedded_module_data,
+    3416,
+    8668);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,94 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,85,223,75,28,71,28,159,217,31,183,123,167,167,
+    166,146,246,244,161,30,166,9,28,77,215,198,38,141,22,127,
+    52,166,165,88,208,134,182,121,89,40,195,186,51,103,174,236,
+    143,203,204,158,173,162,224,131,80,11,190,20,26,210,135,62,
+    248,36,4,83,200,115,255,138,53,8,57,22,10,66,159,124,
+    187,98,2,37,79,157,217,189,61,111,173,150,174,115,223,249,
+    206,119,230,59,223,31,159,239,124,253,19,116,125,106,123,62,
+    89,225,228,49,192,0,67,7,184,208,132,80,240,146,35,185,
+    178,41,199,188,236,40,174,106,170,49,175,56,57,87,51,181,
+    152,87,29,221,205,155,249,152,207,57,5,183,199,236,225,188,
+    134,117,167,215,45,154,69,8,36,240,25,192,249,45,128,11,
+    68,219,147,1,216,151,83,227,102,31,238,249,10,84,122,143,
+    197,162,2,35,229,59,139,122,124,46,222,89,98,1,181,236,
+    96,206,183,40,230,2,109,129,184,11,62,38,156,29,152,179,
+    24,185,123,239,254,61,234,219,132,49,159,114,153,206,215,95,
+    175,214,9,227,124,222,95,33,148,214,48,97,199,144,223,250,
+    132,43,223,191,125,243,174,79,137,221,29,183,146,198,61,193,
+    201,15,60,114,2,76,136,129,41,97,104,202,88,34,10,150,
+    177,82,85,182,65,21,98,117,171,215,84,133,172,42,225,220,
+    150,98,230,182,193,247,208,212,184,231,90,212,203,47,239,184,
+    178,54,91,40,243,239,78,185,91,88,182,125,47,176,106,30,
+    43,91,101,175,225,46,17,90,246,171,92,72,9,19,76,219,
+    57,35,214,140,212,26,67,85,22,229,40,9,26,212,91,180,
+    165,51,80,137,212,157,252,204,201,35,248,24,4,93,155,223,
+    194,148,91,7,168,163,21,104,167,39,246,248,111,191,179,218,
+    85,192,57,223,58,216,85,207,149,195,61,126,255,126,199,198,
+    211,51,107,1,62,79,135,180,200,1,80,227,208,42,57,42,
+    108,71,234,194,252,226,23,95,70,121,100,215,27,40,224,24,
+    69,42,107,212,9,141,116,132,106,94,45,64,40,42,34,155,
+    18,43,32,40,81,148,35,133,17,167,74,251,132,122,30,33,
+    219,177,24,67,136,137,208,203,229,205,215,179,140,218,99,245,
+    213,224,129,239,141,45,19,247,214,88,157,146,165,70,205,9,
+    198,104,141,217,43,174,21,216,15,8,206,44,80,61,5,195,
+    168,175,210,203,252,162,181,203,221,16,25,169,47,239,242,45,
+    54,205,201,223,155,224,149,14,134,71,127,125,123,91,217,233,
+    251,67,47,254,168,237,104,47,244,210,115,189,244,75,240,98,
+    228,198,243,145,27,207,174,30,140,76,28,142,76,132,122,233,
+    64,159,60,212,39,195,116,156,136,148,100,160,83,82,232,230,
+    128,120,101,235,144,202,24,110,72,158,132,165,13,9,203,91,
+    32,128,167,135,215,165,108,114,63,57,3,29,79,180,178,120,
+    44,174,164,121,97,168,75,53,174,145,65,97,200,136,13,45,
+    115,68,191,121,99,3,102,174,135,79,65,214,192,79,210,206,
+    32,191,20,138,135,38,48,64,53,76,11,92,94,145,34,201,
+    120,63,130,53,38,197,185,167,67,124,122,93,152,114,106,44,
+    176,125,183,62,179,102,100,179,216,141,163,49,229,248,182,229,
+    176,25,227,244,252,109,145,222,43,156,108,130,176,127,58,25,
+    187,15,31,105,187,48,28,24,61,24,24,61,28,24,237,200,
+    233,48,136,123,130,74,45,111,153,84,100,250,150,8,56,41,
+    10,254,140,18,35,237,162,72,60,163,111,10,96,135,47,118,
+    105,92,152,31,143,205,55,123,6,90,64,206,15,55,75,67,
+    219,243,219,243,71,98,106,198,118,127,251,244,89,229,224,250,
+    212,225,245,41,190,56,232,159,62,228,82,189,237,141,46,170,
+    214,179,92,194,171,182,128,144,235,227,134,35,248,94,132,30,
+    54,44,167,189,163,33,132,125,155,51,202,146,239,59,113,185,
+    197,174,241,66,79,138,217,38,142,131,80,5,210,146,112,72,
+    192,240,113,18,64,49,37,215,196,70,144,212,97,250,215,146,
+    36,85,111,1,65,116,85,253,232,168,127,176,165,242,185,149,
+    3,133,190,150,38,56,112,17,233,83,213,153,221,155,130,159,
+    249,31,36,142,53,118,99,177,210,31,105,238,45,163,17,212,
+    28,42,82,29,93,21,47,206,16,96,250,30,241,2,102,44,
+    137,14,205,12,171,221,176,81,188,166,162,56,163,145,11,206,
+    186,196,21,169,35,84,20,107,244,222,217,83,157,183,202,21,
+    120,171,143,27,71,71,70,115,66,231,157,255,208,73,251,12,
+    75,250,207,96,124,84,4,192,140,244,63,3,213,197,206,165,
+    76,135,16,5,66,123,210,192,159,128,36,9,113,193,235,83,
+    9,208,51,116,60,110,117,28,154,223,57,105,201,16,194,214,
+    135,0,14,133,160,212,61,142,192,108,152,29,77,240,65,152,
+    29,77,240,121,152,29,77,48,25,102,71,19,84,194,236,56,
+    2,215,194,236,104,229,46,65,142,218,191,73,56,120,229,47,
+    49,191,60,103,47,142,237,31,27,188,16,214,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/prebuilt/riscvmatched/riscvmatched_processor.py",
+    "gem5.prebuilt.riscvmatched.riscvmatched_processor",
+    embedded_module_data,
+    1116,
+    2054);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,31 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,123,204,128,4,24,161,244,103,54,32,49,157,33,133,
+    33,152,65,147,209,111,37,67,17,19,72,16,36,243,75,181,
+    184,40,89,191,160,178,36,35,63,79,63,61,53,215,84,191,
+    40,181,56,191,180,40,57,181,88,63,62,62,51,47,179,36,
+    62,94,175,160,242,23,135,77,110,126,74,105,78,170,93,17,
+    43,212,220,98,126,32,241,129,153,145,145,241,3,3,140,40,
+    98,6,138,1,0,20,89,29,86,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/resources/__init__.py",
+    "gem5.resources",
+    embedded_module_data,
+    105,
+    130);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,189 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,205,24,93,108,219,230,241,35,169,127,81,178,36,219,
+    177,29,103,53,235,164,142,101,59,202,230,53,237,236,214,201,
+    28,199,246,154,172,78,144,159,13,213,30,100,90,164,28,186,
+    148,168,146,148,93,27,78,17,12,25,224,12,1,154,14,30,
+    154,109,41,102,12,73,144,34,9,208,199,62,13,232,219,30,
+    41,131,128,5,2,6,12,12,121,232,203,192,160,41,80,244,
+    105,247,145,250,161,100,217,105,134,62,76,250,116,34,239,187,
+    239,238,120,119,223,221,125,252,55,114,124,2,229,255,111,78,
+    19,8,125,138,56,196,17,34,74,218,255,68,146,128,127,82,
+    36,179,84,146,34,48,142,18,93,89,119,210,157,245,36,61,
+    89,111,210,107,225,92,162,47,235,79,250,179,129,100,192,186,
+    119,139,193,44,157,164,173,107,143,24,202,134,147,97,184,246,
+    114,62,177,37,27,73,70,224,218,207,83,92,128,119,103,92,
+    92,240,134,43,25,229,8,54,198,209,55,80,178,149,35,120,
+    122,161,173,162,90,134,228,66,188,151,247,240,237,93,85,117,
+    107,87,92,24,230,28,51,152,35,223,94,79,157,33,29,215,
+    30,174,229,134,59,121,128,35,26,164,80,92,164,129,211,75,
+    74,205,248,184,40,112,238,224,136,75,40,30,251,26,163,103,
+    226,132,225,186,192,170,87,227,148,225,58,35,164,85,195,245,
+    107,65,81,13,223,249,188,42,72,57,86,140,147,134,71,200,
+    101,36,57,107,184,150,88,57,135,233,211,146,204,195,191,39,
+    45,229,50,194,252,215,224,15,4,183,161,9,81,224,115,234,
+    111,101,54,159,231,101,195,159,17,68,62,149,7,214,134,71,
+    230,213,130,156,75,19,14,119,122,224,71,97,119,254,11,97,
+    119,174,162,13,212,236,243,0,126,143,170,119,242,152,74,213,
+    230,86,209,3,224,248,168,202,245,4,186,70,168,238,218,252,
+    66,149,118,149,168,167,76,147,216,184,28,241,128,4,44,89,
+    193,18,232,18,58,140,126,134,20,215,18,249,33,245,30,90,
+    34,8,244,30,96,33,16,192,96,170,191,198,153,35,87,209,
+    223,208,103,100,61,215,223,19,113,106,229,86,128,129,207,52,
+    175,50,234,85,158,1,11,169,96,19,70,202,88,183,216,36,
+    12,107,79,205,11,139,124,142,193,246,73,4,172,53,163,121,
+    86,102,179,76,213,108,163,204,101,32,195,87,206,229,21,98,
+    219,164,54,77,19,41,9,139,106,102,37,54,133,69,230,36,
+    149,201,72,133,28,135,133,199,221,134,135,255,16,156,172,24,
+    46,41,207,231,12,215,130,34,1,20,37,150,51,252,147,31,
+    166,121,203,245,113,82,14,193,67,25,46,204,78,193,70,98,
+    152,239,15,43,114,250,120,126,89,189,42,229,142,207,243,217,
+    19,199,101,94,145,10,114,154,87,142,167,45,239,39,242,203,
+    70,120,158,87,177,216,9,91,45,185,3,214,254,20,126,202,
+    231,0,174,35,51,130,124,209,45,111,199,166,183,163,232,237,
+    210,189,93,38,114,185,71,183,67,209,219,241,155,169,91,41,
+    19,17,254,195,27,174,237,214,142,245,145,59,151,63,57,181,
+    126,202,164,0,99,161,107,224,25,6,207,209,238,137,6,240,
+    221,119,223,237,79,240,173,7,181,116,106,157,191,120,248,30,
+    0,24,197,240,136,30,30,209,124,35,74,20,180,189,215,54,
+    238,166,190,114,187,198,253,222,175,104,2,96,218,25,156,238,
+    74,12,239,184,112,12,171,142,169,219,228,245,89,142,80,201,
+    26,102,161,122,189,136,228,159,112,228,158,115,45,170,215,17,
+    105,84,99,140,9,232,26,218,135,243,189,230,51,28,225,72,
+    5,46,206,125,151,188,6,241,191,74,8,196,42,36,191,183,
+    49,214,187,39,207,104,93,236,251,234,53,34,208,109,34,183,
+    172,6,107,20,245,123,118,195,131,154,124,26,104,188,47,166,
+    225,252,43,32,99,195,247,98,202,6,125,3,77,244,125,181,
+    142,34,216,132,34,178,143,61,102,157,79,187,135,189,189,53,
+    123,215,115,191,70,170,173,181,21,171,13,57,228,26,82,219,
+    29,154,209,141,154,213,205,134,94,44,123,119,150,34,80,238,
+    31,255,87,222,154,220,71,155,31,44,233,165,172,26,90,37,
+    155,218,229,128,122,160,70,213,176,38,220,72,189,207,14,190,
+    188,135,95,200,221,123,16,239,190,26,118,131,110,246,188,80,
+    109,96,159,238,27,9,45,47,150,216,236,137,213,238,218,170,
+    198,106,202,214,229,51,104,24,34,51,70,108,122,242,221,19,
+    169,139,147,151,206,95,185,56,49,153,58,123,233,252,140,209,
+    181,27,151,26,191,112,97,114,230,204,202,239,78,75,80,188,
+    118,207,51,44,84,162,61,151,49,172,204,51,10,175,38,152,
+    11,34,207,42,214,53,35,229,196,101,0,124,185,198,101,19,
+    83,208,152,80,5,89,52,188,130,242,174,148,155,151,12,111,
+    185,18,25,65,139,245,196,249,153,169,119,166,87,254,80,211,
+    193,198,236,33,188,42,53,224,164,93,18,68,145,153,227,25,
+    97,62,7,61,15,199,8,57,38,195,46,74,114,165,212,54,
+    225,195,231,22,5,89,202,101,113,65,94,100,101,129,157,131,
+    106,188,18,193,213,242,152,221,48,37,112,189,93,249,216,82,
+    172,17,253,66,237,118,45,248,209,84,92,106,66,41,40,14,
+    169,28,159,97,11,162,90,150,254,227,9,30,188,162,8,185,
+    121,166,204,214,234,145,148,60,159,22,50,2,112,157,91,102,
+    142,56,253,217,190,155,24,122,154,149,54,27,93,86,177,60,
+    189,210,53,14,173,104,142,195,51,213,70,133,201,200,82,150,
+    137,135,141,144,221,177,44,149,251,85,82,82,12,111,89,65,
+    25,55,221,50,78,94,50,174,239,6,149,94,226,12,47,102,
+    33,46,242,114,4,227,113,83,35,227,244,36,227,131,137,225,
+    41,228,57,86,229,101,188,129,161,149,14,98,131,165,108,45,
+    140,32,246,83,202,22,111,68,108,100,170,218,230,41,88,2,
+    244,106,50,206,61,70,44,5,205,83,170,78,51,185,31,38,
+    78,195,79,185,73,226,254,233,169,183,173,232,61,180,67,51,
+    247,79,223,59,171,209,9,24,165,200,224,19,249,241,138,22,
+    25,129,241,52,214,93,138,100,159,81,100,107,248,57,2,96,
+    34,50,20,54,61,168,163,107,45,184,19,236,185,63,124,111,
+    84,11,30,131,241,180,163,107,125,69,235,125,67,239,120,179,
+    212,205,152,110,170,27,104,1,172,157,51,125,232,232,91,95,
+    158,211,94,251,213,218,185,59,254,34,221,91,106,57,116,159,
+    188,23,208,90,6,96,108,71,218,76,146,104,23,137,103,20,
+    21,141,61,71,0,76,12,158,97,240,173,15,181,118,124,210,
+    183,222,247,233,192,159,6,62,25,90,31,218,138,245,109,198,
+    250,138,177,126,61,214,175,13,142,21,99,99,91,209,201,205,
+    232,100,49,58,173,71,167,77,228,15,197,202,12,63,104,206,
+    48,128,162,237,120,90,109,58,109,6,80,184,251,179,185,187,
+    11,90,168,31,198,118,207,97,108,150,135,215,244,35,99,197,
+    158,147,122,207,73,141,62,180,125,176,95,139,143,20,15,142,
+    234,7,71,215,206,109,211,49,173,245,151,69,122,92,167,199,
+    53,122,220,186,157,122,50,252,120,244,139,172,62,120,6,174,
+    97,20,233,105,157,158,214,172,241,52,28,187,153,185,149,249,
+    120,225,143,11,55,197,91,226,86,184,119,51,220,91,12,31,
+    209,195,71,180,163,35,208,47,110,133,198,55,67,227,197,208,
+    132,30,154,48,145,215,63,8,74,252,101,241,238,226,223,63,
+    250,235,71,197,158,227,122,207,113,109,248,76,177,231,76,115,
+    77,198,180,193,183,48,108,29,43,210,39,117,26,244,197,3,
+    218,210,238,87,203,20,241,34,61,160,211,3,26,61,0,94,
+    164,143,62,233,125,60,160,5,95,135,81,118,224,152,222,113,
+    114,183,3,67,157,119,252,58,221,187,69,199,55,233,120,41,
+    58,244,240,125,45,50,10,81,17,194,81,17,178,163,2,164,
+    132,90,75,145,43,79,78,63,62,171,189,121,81,31,186,164,
+    69,174,192,104,36,243,161,174,190,141,247,139,157,195,122,231,
+    240,90,104,59,216,169,185,58,191,193,101,193,240,218,161,170,
+    24,180,21,241,176,59,20,56,59,164,29,213,8,65,111,108,
+    119,201,83,200,234,146,29,167,192,134,106,239,60,31,58,234,
+    210,106,195,57,13,106,17,193,150,128,216,58,227,224,227,42,
+    195,66,42,194,57,167,182,203,217,69,86,16,113,126,169,59,
+    92,149,181,181,143,77,34,94,9,201,170,140,100,84,137,249,
+    160,192,203,203,206,5,206,167,178,87,97,12,83,198,84,82,
+    93,69,44,102,49,143,43,215,233,229,74,42,26,178,184,53,
+    253,8,42,206,175,234,30,60,211,5,89,198,121,114,174,32,
+    136,92,130,121,39,99,213,65,85,218,155,223,236,236,12,84,
+    200,217,217,33,204,217,202,206,246,33,209,178,142,83,132,210,
+    168,119,162,254,76,57,206,92,176,142,120,12,126,33,192,44,
+    93,229,161,248,96,242,247,249,229,138,198,213,39,22,56,171,
+    100,97,220,34,43,22,0,161,212,107,200,86,237,92,113,146,
+    82,200,231,37,89,133,228,94,229,82,81,204,86,4,142,158,
+    56,231,25,97,188,50,85,245,41,160,7,112,194,29,196,185,
+    208,62,144,90,73,83,62,86,1,55,240,12,131,112,150,252,
+    246,16,162,95,41,6,123,244,96,207,86,48,177,25,76,60,
+    92,250,146,46,6,39,245,224,164,230,154,148,227,152,127,164,
+    194,186,26,183,46,71,224,85,223,80,156,253,159,227,118,149,
+    92,165,30,0,207,71,85,190,86,236,254,167,18,187,149,215,
+    4,85,59,88,21,93,154,91,224,193,238,86,157,178,34,161,
+    28,159,229,122,80,255,186,160,250,8,2,103,199,167,195,51,
+    137,166,132,117,209,220,232,129,196,75,239,150,196,15,223,46,
+    214,34,40,124,80,39,27,118,235,28,244,121,28,244,119,123,
+    7,119,90,202,66,181,20,230,4,81,80,151,235,54,216,254,
+    251,104,31,142,187,54,88,109,3,217,74,226,190,161,162,89,
+    189,2,251,108,106,197,122,219,2,126,194,239,204,120,174,62,
+    162,95,197,213,189,234,9,171,47,0,111,167,176,171,203,69,
+    63,238,50,130,14,159,202,9,28,219,181,176,119,217,205,66,
+    185,91,104,111,202,78,30,134,185,63,99,234,33,123,43,28,
+    113,108,133,241,205,224,120,201,215,170,181,191,182,177,244,5,
+    13,137,158,246,64,162,167,61,144,232,221,30,107,91,196,59,
+    229,24,150,199,88,249,29,183,40,162,48,103,247,65,30,117,
+    57,15,70,145,177,22,50,126,251,33,123,44,162,236,137,68,
+    65,21,68,187,31,194,109,147,65,165,178,39,100,124,198,54,
+    58,177,83,18,86,96,148,61,86,238,139,236,198,169,203,126,
+    236,20,155,23,18,229,203,74,223,131,123,41,187,207,234,193,
+    192,50,160,213,88,253,198,246,176,65,41,170,108,111,126,252,
+    196,159,35,75,125,203,50,223,251,222,206,74,92,65,228,79,
+    202,248,221,6,222,160,202,63,1,154,20,65,16,230,27,136,
+    160,175,7,241,183,132,252,215,173,111,9,117,106,245,195,36,
+    93,4,105,162,151,1,52,133,175,94,12,2,136,104,215,80,
+    155,115,236,160,65,173,126,236,160,215,181,250,97,122,104,98,
+    244,14,103,34,248,219,80,173,191,70,240,10,244,74,215,67,
+    166,231,20,209,101,162,42,152,34,209,145,254,82,111,159,222,
+    59,108,186,195,196,20,97,34,12,75,161,246,219,220,157,159,
+    175,11,122,136,49,41,140,217,137,29,132,251,99,101,34,15,
+    242,4,214,14,175,169,183,39,110,45,175,37,116,119,151,233,
+    173,45,174,131,125,232,232,96,233,240,209,178,8,127,27,1,
+    225,4,96,231,192,43,119,148,245,172,233,198,8,15,10,31,
+    168,137,243,98,20,180,138,221,150,60,107,69,0,196,153,193,
+    202,218,102,192,242,239,127,1,81,250,186,27,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/resources/client.py",
+    "gem5.resources.client",
+    embedded_module_data,
+    2636,
+    6165);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,147 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,23,207,111,219,214,249,241,135,40,74,254,217,74,
+    110,146,58,94,232,36,181,39,213,150,147,56,153,13,109,216,
+    224,58,75,23,52,80,135,36,27,80,97,29,77,139,79,22,
+    19,138,212,248,40,59,14,236,97,40,140,33,135,28,124,8,
+    176,28,122,208,161,8,60,100,135,30,86,160,135,29,178,255,
+    64,14,4,196,32,80,32,192,128,1,189,177,72,11,24,61,
+    237,123,164,72,81,138,237,100,161,132,143,239,189,239,123,223,
+    239,239,123,143,255,65,145,39,214,126,191,184,14,224,111,72,
+    69,42,163,163,34,3,111,86,103,171,92,145,171,242,69,158,
+    161,235,156,30,171,10,69,161,26,47,198,171,98,81,172,38,
+    138,9,6,177,232,67,164,242,91,72,141,97,238,17,135,208,
+    99,46,96,92,76,170,204,13,148,17,190,165,147,66,134,117,
+    184,133,15,22,157,65,101,153,216,150,82,178,171,216,174,152,
+    106,134,135,101,99,221,225,47,107,37,219,225,175,105,196,118,
+    196,143,107,182,102,26,138,94,138,234,57,16,232,249,14,67,
+    245,196,158,142,69,86,101,48,167,178,152,47,243,42,183,197,
+    23,99,88,72,32,250,83,251,65,163,56,230,78,132,12,84,
+    161,103,30,239,153,179,88,196,9,204,225,100,153,237,172,118,
+    70,101,81,21,183,98,143,96,244,56,92,43,246,129,164,1,
+    53,113,244,206,255,91,146,160,38,183,98,69,106,1,247,74,
+    90,94,237,3,187,7,84,30,124,61,232,12,46,180,221,187,
+    168,107,216,176,29,174,110,233,142,96,97,187,110,25,37,54,
+    226,78,26,118,26,170,23,15,188,176,39,144,29,65,222,98,
+    130,81,35,186,39,124,54,152,71,64,241,56,164,218,100,237,
+    120,4,203,222,226,35,227,88,100,44,4,227,21,174,155,195,
+    13,116,6,49,232,19,68,83,230,14,247,9,90,99,50,236,
+    221,70,82,106,63,191,87,116,77,85,108,76,36,187,130,165,
+    154,101,174,106,42,86,165,223,93,191,150,75,134,68,249,154,
+    98,41,85,9,44,206,75,55,129,12,176,146,109,74,203,88,
+    90,109,111,87,163,212,190,83,242,210,210,210,77,171,142,151,
+    150,36,173,236,113,167,219,52,226,239,153,2,236,21,69,39,
+    20,109,2,210,90,211,8,206,133,60,174,100,226,142,0,242,
+    116,109,217,137,129,116,130,29,17,166,254,136,83,116,112,61,
+    41,85,112,21,59,130,129,109,221,44,57,124,77,177,43,25,
+    206,225,9,214,203,86,31,88,78,163,67,234,186,77,104,52,
+    128,231,143,115,196,42,205,212,214,161,58,140,153,21,92,189,
+    52,3,120,179,110,149,48,153,41,121,65,149,149,154,54,19,
+    148,145,236,175,229,106,235,206,160,12,178,229,182,173,166,117,
+    119,172,59,23,114,221,232,12,136,35,31,2,248,11,114,135,
+    249,196,137,111,70,70,31,252,225,217,72,246,233,72,118,103,
+    118,119,100,166,53,50,115,239,202,55,169,119,30,10,159,15,
+    52,86,191,216,252,178,252,207,219,205,99,31,236,166,22,91,
+    169,197,102,255,226,190,203,50,137,19,123,169,227,219,151,182,
+    47,237,239,239,19,106,204,103,191,90,96,209,191,89,118,33,
+    206,21,156,190,64,113,89,83,157,225,112,178,138,45,2,229,
+    237,244,83,227,130,89,41,204,24,120,152,32,55,135,189,220,
+    140,102,230,103,76,134,81,214,33,41,123,163,30,145,229,71,
+    255,234,101,201,244,3,122,189,141,202,73,65,99,153,162,177,
+    54,76,91,34,216,158,146,32,78,33,183,131,158,208,255,210,
+    154,166,235,52,159,252,212,161,233,116,152,22,109,179,124,85,
+    218,147,64,159,165,64,161,165,110,141,142,84,194,123,162,42,
+    135,178,2,246,71,169,119,232,83,48,109,156,151,174,150,33,
+    207,35,30,164,197,64,58,210,236,138,70,94,205,202,243,0,
+    182,177,21,234,161,173,24,166,117,128,151,162,129,127,201,67,
+    20,249,166,145,122,29,87,132,117,191,32,233,112,218,80,145,
+    212,155,209,68,161,219,237,138,183,180,162,173,98,3,114,169,
+    179,63,195,56,41,240,218,213,106,77,135,194,54,160,169,252,
+    218,178,160,156,120,107,4,242,211,162,157,217,122,151,130,81,
+    90,96,188,95,212,146,117,140,150,250,192,10,182,229,48,157,
+    238,158,236,41,208,46,236,28,221,158,244,234,243,135,179,104,
+    232,116,83,28,127,65,43,192,73,133,36,178,109,202,101,77,
+    7,151,151,184,72,141,132,173,253,175,94,249,108,176,132,221,
+    128,182,186,130,54,185,13,230,50,250,116,110,147,223,224,85,
+    166,115,134,192,218,212,102,108,131,109,28,212,235,209,70,172,
+    187,85,91,35,27,92,131,57,144,146,239,166,100,208,253,233,
+    251,243,27,28,156,76,172,242,95,46,82,180,215,189,24,16,
+    73,145,124,253,161,151,123,193,232,148,218,178,66,96,17,82,
+    130,230,67,16,215,112,127,201,172,66,35,213,150,53,93,179,
+    215,35,77,157,62,185,28,77,24,156,207,119,47,223,132,36,
+    150,202,117,163,68,19,75,82,8,169,87,65,76,187,231,87,
+    53,200,84,143,171,105,64,36,188,164,8,149,153,236,78,254,
+    104,246,134,101,82,195,37,173,172,97,117,202,99,23,150,38,
+    160,3,85,117,236,103,85,111,14,251,162,195,196,109,247,8,
+    2,165,36,85,149,91,29,84,143,149,215,180,219,152,30,70,
+    237,2,145,42,166,61,93,214,238,68,108,0,217,17,181,52,
+    111,193,55,91,5,17,138,221,197,238,53,180,14,69,28,164,
+    235,225,38,69,244,206,74,147,23,206,229,206,79,74,107,102,
+    93,87,105,121,246,138,241,130,237,17,193,239,220,164,164,24,
+    106,123,122,1,166,185,46,78,231,115,151,114,23,94,205,203,
+    35,235,240,10,166,221,188,46,228,102,97,245,98,192,205,52,
+    244,245,35,88,6,212,47,223,61,14,40,77,191,193,5,173,
+    166,147,224,112,51,241,9,94,163,61,70,107,64,210,12,105,
+    173,162,149,252,254,20,150,79,200,248,232,6,73,42,47,187,
+    43,231,247,255,2,164,205,210,210,20,77,38,159,171,102,172,
+    120,125,244,104,142,192,74,133,157,17,95,208,54,215,177,128,
+    192,205,63,73,108,197,178,9,245,161,35,40,181,26,54,212,
+    140,224,247,75,41,104,149,206,219,129,45,157,30,232,136,193,
+    208,137,7,236,132,118,71,13,122,234,152,191,77,214,140,142,
+    69,145,30,59,213,211,99,143,164,254,136,246,92,226,223,137,
+    242,104,248,164,139,152,196,228,94,106,162,217,63,241,124,236,
+    84,83,124,119,239,248,251,46,226,18,243,30,184,247,155,189,
+    209,51,141,143,91,163,23,93,196,14,204,123,96,59,190,151,
+    58,245,44,149,125,154,202,238,204,237,166,102,91,169,89,96,
+    242,214,252,94,122,226,89,122,250,105,122,122,167,178,155,158,
+    107,165,231,154,233,185,125,55,70,183,9,104,152,54,119,235,
+    20,200,237,186,162,115,65,31,207,249,125,28,29,210,159,153,
+    127,48,189,151,105,184,60,255,249,77,110,72,7,92,143,223,
+    248,152,244,142,66,120,253,132,190,216,206,233,72,88,47,130,
+    126,244,82,93,103,158,188,188,14,218,221,61,125,212,185,232,
+    211,88,148,209,168,31,169,126,52,156,126,54,52,254,116,104,
+    124,231,118,115,104,124,119,40,223,26,202,55,197,188,231,209,
+    12,87,40,20,50,76,1,190,141,68,89,54,160,85,201,178,
+    147,148,229,170,169,214,117,58,238,151,229,63,213,21,189,141,
+    225,64,176,195,47,155,166,110,29,167,10,211,243,219,18,41,
+    160,31,56,22,77,62,139,158,175,158,85,214,79,41,200,2,
+    248,59,242,132,121,54,89,201,0,80,52,153,102,168,146,193,
+    207,101,251,99,39,26,103,92,4,175,157,179,222,171,23,156,
+    68,66,26,146,98,34,187,151,205,237,77,100,221,196,91,177,
+    211,46,2,240,124,100,236,97,233,193,167,110,140,46,8,8,
+    114,111,246,243,105,55,78,103,34,58,118,234,33,121,80,245,
+    137,147,40,57,120,79,221,158,125,200,109,207,223,55,90,137,
+    49,183,47,224,225,129,239,56,16,177,245,71,151,165,11,83,
+    104,242,125,55,254,30,69,1,120,62,54,222,56,219,32,59,
+    139,141,59,95,228,90,99,231,221,216,123,158,176,54,123,143,
+    78,124,137,125,34,216,30,1,5,70,136,253,124,135,184,8,
+    94,95,218,95,95,126,146,122,82,122,114,252,95,133,214,220,
+    71,222,218,161,192,247,36,245,95,166,207,233,247,191,174,114,
+    222,39,149,53,72,83,134,83,150,75,22,23,4,199,17,236,
+    245,26,116,42,63,42,66,24,41,49,140,196,57,10,194,232,
+    252,40,254,194,15,253,47,173,139,200,255,212,32,95,1,112,
+    57,134,97,220,159,33,38,221,68,41,255,239,178,28,195,66,
+    165,191,18,136,49,58,122,51,48,252,91,134,1,187,15,134,
+    219,55,190,243,222,223,31,130,247,204,250,31,112,126,154,25,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/resources/client_api/abstract_client.py",
+    "gem5.resources.client_api.abstract_client",
+    embedded_module_data,
+    1968,
+    4558);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,254 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,89,221,111,219,216,149,191,20,73,137,164,36,75,
+    254,144,63,99,155,147,56,31,114,106,107,210,124,77,220,206,
+    180,158,100,58,73,155,122,166,73,6,221,106,183,16,104,145,
+    138,153,72,164,74,82,227,68,144,167,211,34,64,53,64,30,
+    252,144,197,122,183,30,172,209,135,108,138,228,161,251,182,175,
+    131,254,3,114,96,32,2,129,0,1,138,62,204,83,25,76,
+    166,24,204,211,158,67,138,20,37,187,45,10,180,140,124,120,
+    207,253,56,247,242,156,123,127,231,156,155,63,144,208,195,118,
+    222,95,252,6,200,127,16,153,200,84,153,228,189,55,149,167,
+    220,119,36,31,129,119,164,76,87,152,60,83,97,243,108,37,
+    154,143,86,98,249,88,133,203,115,21,62,207,87,132,188,64,
+    225,24,186,28,175,36,242,137,74,50,159,116,121,166,60,80,
+    73,229,83,80,102,229,104,57,93,25,204,15,82,36,66,222,
+    37,114,236,30,145,57,101,232,33,77,200,99,218,95,76,126,
+    216,109,227,161,77,80,6,251,218,70,100,234,58,201,198,63,
+    71,102,37,27,179,233,101,237,174,205,92,82,139,150,205,92,
+    85,77,203,230,222,171,90,170,174,73,101,155,189,81,171,150,
+    21,155,185,113,183,170,216,236,7,26,212,102,35,54,91,149,
+    12,83,177,99,134,242,179,154,98,90,89,202,102,214,37,67,
+    251,156,2,129,192,12,44,175,154,150,33,21,173,139,101,85,
+    209,172,98,88,75,49,95,75,151,129,252,10,244,164,16,212,
+    13,232,133,146,35,50,173,208,10,163,176,165,200,68,48,64,
+    102,148,168,194,116,249,82,180,73,74,148,204,222,75,228,99,
+    77,114,135,202,115,240,45,81,123,118,217,42,75,166,55,225,
+    101,203,170,126,223,212,181,107,222,242,222,49,12,221,176,163,
+    69,183,205,142,135,58,218,140,44,89,146,61,84,173,25,85,
+    221,84,10,122,169,208,249,164,34,19,90,115,18,254,80,123,
+    95,236,1,249,119,10,108,75,53,168,91,65,243,175,193,162,
+    192,83,33,158,6,62,18,226,25,224,233,16,207,90,124,87,
+    252,45,127,231,144,70,68,142,62,137,61,132,145,143,195,163,
+    185,79,227,27,76,131,54,248,6,35,243,13,218,173,161,235,
+    176,170,13,198,74,118,229,60,132,191,199,1,183,19,35,7,
+    60,13,230,33,172,243,113,176,86,216,79,2,238,133,250,159,
+    150,53,81,185,83,84,92,195,139,134,164,154,138,44,174,175,
+    41,154,40,105,226,229,27,55,222,23,59,154,17,45,93,116,
+    85,40,254,80,215,110,234,151,222,22,75,146,90,54,23,5,
+    177,243,44,193,230,144,42,162,167,238,37,241,198,154,34,134,
+    84,46,170,154,105,73,90,81,17,173,53,201,242,39,178,160,
+    83,48,251,62,81,251,205,179,36,46,139,176,197,84,237,166,
+    40,43,102,209,80,87,177,136,82,58,125,69,189,132,108,32,
+    169,51,174,43,186,126,10,119,137,120,237,175,125,148,34,47,
+    10,94,237,7,215,174,46,137,245,184,176,92,179,214,2,230,
+    18,236,157,85,201,84,128,73,10,23,245,114,89,41,226,242,
+    129,29,16,220,70,209,68,13,8,194,231,140,119,46,162,170,
+    38,67,77,61,34,8,245,145,247,187,11,189,230,127,212,74,
+    150,179,233,154,81,182,99,18,76,244,1,20,56,185,51,137,
+    45,20,131,25,108,230,22,236,110,155,149,107,149,170,105,179,
+    102,173,170,24,54,87,40,168,154,106,21,10,112,24,24,83,
+    41,151,140,65,152,213,24,70,50,2,196,230,21,60,7,5,
+    80,155,205,23,10,69,248,44,179,80,48,163,208,228,42,228,
+    227,175,79,155,70,49,87,189,107,173,233,90,238,166,82,57,
+    155,51,20,83,175,25,69,197,204,121,198,44,72,85,53,39,
+    161,66,60,126,177,122,215,152,133,241,245,19,127,227,240,45,
+    250,107,251,38,244,54,255,23,200,87,31,19,103,156,77,190,
+    217,158,20,183,231,29,26,74,14,1,242,98,98,118,123,198,
+    97,125,214,137,18,104,159,117,98,65,5,71,14,29,222,155,
+    250,134,195,251,53,95,10,100,230,240,118,254,17,243,187,229,
+    214,244,185,221,233,115,123,211,231,156,120,208,223,37,52,225,
+    135,156,33,146,152,113,8,197,95,161,218,137,76,107,226,114,
+    235,245,183,145,186,191,221,196,229,230,149,231,92,242,147,216,
+    253,216,51,110,252,41,55,190,53,177,203,29,217,227,142,180,
+    252,223,23,120,90,178,60,170,89,147,42,74,161,96,11,133,
+    66,69,151,107,101,44,39,10,133,159,213,164,178,215,98,160,
+    185,109,26,20,109,224,153,55,80,197,174,158,236,100,71,239,
+    69,165,92,6,67,81,198,97,212,7,30,198,239,26,71,176,
+    87,218,39,167,176,65,241,20,229,255,115,34,163,236,220,139,
+    244,180,195,194,27,84,147,26,222,60,189,69,111,190,113,95,
+    115,98,88,195,145,233,163,59,215,183,127,232,240,200,145,191,
+    131,24,115,254,188,61,88,61,216,121,127,241,103,66,122,144,
+    218,69,105,38,140,210,165,136,28,185,199,228,89,153,190,71,
+    242,81,158,240,68,30,150,1,183,229,152,219,55,214,131,232,
+    220,254,241,50,175,112,97,148,7,175,197,203,113,248,75,236,
+    31,95,26,144,147,247,216,188,128,179,192,60,35,114,170,111,
+    108,186,143,31,236,227,19,74,124,191,212,144,124,78,30,2,
+    249,9,121,0,144,49,99,12,161,229,162,69,93,43,169,55,
+    139,1,44,195,131,101,215,45,120,14,191,65,201,84,87,72,
+    131,20,186,101,112,109,61,45,84,168,133,238,105,137,132,90,
+    152,158,22,58,212,194,246,180,48,161,150,104,79,75,224,88,
+    228,24,124,10,39,165,97,226,0,1,175,192,137,84,165,178,
+    90,87,76,81,18,225,251,52,15,93,16,11,165,0,7,61,
+    252,243,81,104,81,232,199,230,154,161,122,24,255,193,181,43,
+    98,73,55,2,65,136,199,186,11,201,190,40,83,49,62,84,
+    140,125,232,46,175,122,2,240,240,116,96,59,152,15,69,116,
+    4,66,113,191,143,9,129,110,191,136,110,155,184,174,90,107,
+    170,214,35,184,43,202,142,2,170,253,64,185,107,140,131,158,
+    140,41,36,147,104,113,1,187,94,119,241,207,64,165,174,100,
+    163,198,2,182,246,246,51,22,145,96,135,108,196,16,177,124,
+    18,136,137,118,4,175,227,30,106,23,34,71,66,16,25,192,
+    225,85,236,250,30,16,56,220,105,50,54,189,245,47,123,163,
+    199,154,204,253,120,123,120,98,235,232,131,55,161,200,1,66,
+    238,28,218,155,92,132,114,170,61,62,179,85,223,27,159,135,
+    114,178,167,30,134,170,123,99,39,160,156,104,194,63,247,60,
+    23,131,93,6,79,212,223,171,255,230,237,85,178,67,14,122,
+    26,164,27,198,64,144,67,186,65,140,234,134,103,64,153,39,
+    236,67,216,113,143,131,93,23,222,115,176,203,98,43,54,125,
+    91,185,251,117,226,162,174,89,240,177,11,24,58,126,157,150,
+    170,213,178,90,148,208,30,57,244,94,245,233,119,21,75,92,
+    46,130,119,49,197,27,250,109,197,51,147,184,252,254,21,17,
+    134,255,150,182,121,52,64,193,245,116,177,53,69,146,21,195,
+    244,28,89,66,114,71,21,44,28,149,165,237,145,130,235,147,
+    10,107,224,121,220,254,24,37,184,38,113,13,6,48,139,118,
+    113,97,214,179,136,205,223,84,44,111,120,61,19,182,75,80,
+    253,175,56,224,146,107,152,118,106,248,89,234,196,211,212,137,
+    118,34,125,255,106,123,236,208,150,188,125,187,53,58,223,206,
+    28,105,29,61,223,26,121,163,61,251,150,195,147,116,246,37,
+    97,211,194,43,36,142,64,226,19,175,226,108,122,18,252,15,
+    63,233,161,235,40,144,207,35,193,6,58,131,228,44,241,157,
+    243,112,69,186,83,240,98,14,248,26,75,169,84,45,211,30,
+    49,148,78,185,80,149,106,16,0,185,129,64,212,80,172,154,
+    161,21,195,241,93,16,161,142,68,208,188,86,200,244,93,131,
+    54,34,189,177,223,78,24,204,130,71,166,122,123,109,196,172,
+    208,76,183,66,96,211,136,53,232,39,145,222,220,98,131,179,
+    226,161,222,209,64,42,253,164,47,242,188,68,126,218,216,224,
+    121,210,35,61,40,55,184,190,85,64,86,164,201,71,136,149,
+    238,246,158,35,198,143,55,226,13,190,193,222,118,129,206,24,
+    178,134,187,173,13,248,222,6,110,214,158,245,253,146,106,68,
+    27,124,157,3,137,9,43,19,250,106,168,133,184,58,214,96,
+    48,186,110,196,129,242,141,4,80,225,83,190,63,98,182,198,
+    66,43,78,4,243,37,250,251,253,132,200,241,141,248,71,241,
+    251,53,239,189,78,173,147,59,244,79,200,58,213,99,159,32,
+    130,111,8,59,3,228,128,167,47,174,79,29,212,167,223,106,
+    189,28,28,203,132,180,13,74,184,174,104,50,162,253,247,175,
+    191,183,34,234,171,183,16,87,117,0,101,47,194,119,129,255,
+    166,250,33,156,197,222,96,216,67,110,200,4,228,80,64,141,
+    155,208,116,65,21,226,196,170,174,1,168,2,8,171,166,88,
+    170,105,62,238,150,203,98,103,7,163,112,67,233,98,121,79,
+    116,222,145,175,250,200,29,184,34,55,181,16,49,144,182,68,
+    173,86,89,133,78,8,239,106,5,124,214,170,2,238,70,113,
+    51,8,116,54,146,22,136,11,101,18,251,221,85,217,119,87,
+    87,113,21,122,85,209,250,38,221,239,160,124,28,242,70,134,
+    117,7,18,32,198,151,247,13,233,224,149,55,160,195,248,157,
+    61,156,243,244,214,151,148,252,227,243,29,207,34,240,211,59,
+    25,253,162,120,197,58,110,138,53,55,235,210,93,107,227,183,
+    91,202,29,223,42,216,230,218,226,32,141,162,40,47,103,219,
+    183,234,3,16,204,251,126,104,80,43,181,202,62,3,226,118,
+    211,252,253,17,72,131,164,176,34,221,118,45,26,164,156,230,
+    154,94,43,203,96,113,81,214,53,197,183,188,181,102,232,235,
+    158,233,255,74,242,120,16,134,122,235,114,3,140,78,180,160,
+    220,129,29,12,46,0,2,34,168,47,222,214,75,37,113,97,
+    161,71,165,184,104,152,218,90,87,96,203,40,82,113,205,95,
+    122,104,151,205,207,255,88,50,52,88,211,252,252,82,223,97,
+    128,176,191,86,81,130,195,23,156,153,110,70,202,214,172,210,
+    194,27,16,70,184,57,155,235,27,16,27,32,113,100,33,101,
+    54,172,44,221,151,210,213,185,229,206,225,170,159,198,15,241,
+    14,173,123,148,253,188,214,79,99,15,202,54,235,147,176,242,
+    239,185,29,188,61,249,142,175,196,37,161,62,40,8,215,20,
+    203,184,235,234,183,100,129,221,234,113,216,190,176,85,100,115,
+    113,113,113,37,155,54,14,225,58,166,9,70,199,138,86,212,
+    97,143,35,244,219,177,206,4,54,175,194,48,75,215,203,144,
+    163,22,245,154,102,217,49,56,126,120,226,108,62,152,202,75,
+    121,16,69,109,6,53,12,223,90,86,148,170,205,150,117,73,
+    54,109,6,204,39,219,81,89,65,249,217,164,23,97,29,224,
+    64,141,37,36,223,242,213,99,211,176,117,32,139,246,212,99,
+    115,190,182,109,74,193,203,43,216,7,38,170,86,12,63,94,
+    176,118,30,245,42,246,4,107,7,68,23,152,38,153,107,20,
+    198,7,95,158,35,233,145,251,245,173,236,110,106,110,47,53,
+    247,44,117,242,105,234,228,163,119,119,83,103,246,82,103,154,
+    204,31,7,50,247,245,118,34,213,30,204,180,71,166,156,24,
+    147,18,94,18,32,175,144,52,233,47,19,100,252,181,7,63,
+    127,244,163,214,88,110,119,44,183,55,150,115,200,16,127,216,
+    37,205,119,157,200,96,242,240,243,169,195,219,223,121,116,122,
+    119,42,183,55,149,219,228,218,233,204,38,251,213,243,225,67,
+    14,25,72,30,238,146,246,240,100,107,230,212,211,225,83,173,
+    225,83,207,39,47,180,103,143,180,167,143,181,79,190,9,83,
+    78,141,194,148,83,163,175,144,56,132,201,140,66,128,50,177,
+    240,232,230,238,248,217,77,246,121,122,196,137,208,153,11,91,
+    235,14,129,151,75,112,24,237,51,47,114,175,59,172,207,64,
+    218,121,252,27,78,44,96,145,188,164,217,193,33,8,124,6,
+    135,28,36,240,73,131,153,7,194,214,217,221,244,107,123,233,
+    215,90,251,126,95,193,227,76,195,146,225,253,165,232,105,239,
+    196,127,47,252,215,194,127,230,182,115,207,38,95,127,58,249,
+    250,239,198,118,39,47,236,77,94,216,77,45,237,165,150,90,
+    220,146,137,225,220,103,99,35,203,11,145,207,22,132,139,3,
+    236,103,231,151,147,23,121,246,247,60,11,204,138,29,247,239,
+    42,10,170,108,167,3,6,188,138,137,23,38,9,188,207,240,
+    185,158,187,189,32,48,30,160,188,192,184,231,94,143,250,52,
+    178,193,132,131,226,112,72,12,229,32,174,144,35,219,244,6,
+    171,146,141,104,131,50,18,16,27,69,101,250,219,216,39,242,
+    11,22,226,144,168,204,184,92,212,96,33,254,96,101,22,57,
+    136,57,200,78,120,45,127,193,227,255,154,124,26,145,99,50,
+    183,29,217,136,193,8,246,160,17,13,166,193,54,98,50,255,
+    68,232,11,206,227,221,224,124,131,131,209,209,3,71,115,16,
+    201,37,122,239,29,33,102,72,174,212,19,57,201,133,175,92,
+    73,213,100,0,32,55,219,233,38,73,17,85,54,222,199,66,
+    180,164,150,225,180,215,99,111,43,146,1,96,97,224,77,79,
+    54,98,39,241,198,76,55,212,186,27,249,27,120,173,81,79,
+    98,228,127,205,191,91,50,78,227,120,94,214,139,0,143,154,
+    101,194,160,225,224,226,9,162,241,130,39,217,248,17,10,140,
+    121,103,191,119,21,198,27,164,115,112,237,105,175,51,164,87,
+    69,189,82,133,57,87,203,74,33,144,150,229,61,252,192,140,
+    203,93,182,43,212,19,233,130,234,13,210,193,20,155,15,6,
+    153,120,83,219,11,18,118,18,19,133,160,71,125,162,63,135,
+    8,154,182,161,183,249,71,226,38,120,9,50,52,250,96,188,
+    53,112,220,251,53,233,23,147,51,219,185,182,75,198,15,109,
+    39,225,160,66,234,64,128,52,25,56,160,67,35,205,104,59,
+    14,231,149,230,223,106,79,29,107,126,111,243,204,39,87,219,
+    169,217,86,234,100,123,225,205,205,104,107,44,187,155,158,127,
+    17,31,196,75,173,185,246,244,145,230,165,205,241,79,86,224,
+    128,206,44,237,88,255,243,209,111,62,218,61,126,126,239,248,
+    249,214,244,5,248,181,15,45,194,33,30,6,249,64,154,49,
+    144,159,153,120,54,178,240,116,100,1,177,105,116,18,176,169,
+    61,187,8,121,76,102,17,242,152,12,230,49,25,55,143,25,
+    133,60,38,51,214,228,157,33,56,168,207,82,167,158,166,78,
+    181,197,236,255,37,28,154,164,191,249,146,68,48,229,137,224,
+    186,35,188,224,38,58,224,191,48,213,49,46,96,153,94,89,
+    89,1,212,62,138,21,199,144,28,71,130,187,211,56,65,58,
+    169,177,103,190,224,166,204,166,85,205,114,173,105,224,78,55,
+    242,64,126,75,188,28,202,69,232,33,159,252,0,149,123,210,
+    5,225,238,21,89,146,205,110,89,59,23,31,13,239,92,222,
+    254,200,33,192,246,147,153,40,11,121,89,64,14,145,185,163,
+    237,185,163,78,234,60,251,45,135,0,121,145,76,59,44,50,
+    81,50,50,190,69,111,93,223,226,30,188,229,196,176,134,3,
+    19,110,22,183,78,111,174,61,152,113,120,172,17,252,59,183,
+    56,114,9,50,243,154,147,196,210,0,153,61,236,137,76,19,
+    97,160,89,220,60,221,92,187,63,227,12,250,147,132,200,135,
+    20,57,54,223,158,95,108,31,155,119,248,163,44,168,18,200,
+    139,204,244,86,241,193,79,29,22,43,162,100,234,200,206,233,
+    237,5,39,134,28,71,198,102,183,204,7,21,175,179,128,226,
+    101,255,34,112,143,159,118,226,190,140,131,136,167,71,212,94,
+    54,99,44,99,217,245,226,239,184,103,216,186,91,5,119,239,
+    153,130,9,12,224,94,95,98,98,102,112,72,120,183,43,56,
+    242,178,186,106,8,88,227,121,253,202,217,197,154,165,150,61,
+    87,158,146,58,255,3,84,240,110,138,13,76,108,12,76,168,
+    61,127,239,218,16,175,34,186,118,253,154,251,182,119,157,250,
+    150,33,17,76,159,192,184,103,129,58,52,69,81,206,57,66,
+    13,182,72,218,251,181,73,252,99,247,95,80,112,34,28,21,
+    113,200,63,131,12,209,88,250,219,68,32,212,68,139,140,135,
+    127,47,200,201,86,239,207,137,142,81,115,14,217,79,118,212,
+    151,248,122,213,173,61,243,33,69,129,205,14,166,155,112,74,
+    241,253,234,47,180,187,106,253,127,127,6,31,80,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/resources/client_api/atlasclient.py",
+    "gem5.resources.client_api.atlasclient",
+    embedded_module_data,
+    3677,
+    7326);
+
+} // anonymous namespace
+} // namespace gem5
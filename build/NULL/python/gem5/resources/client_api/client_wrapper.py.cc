@@ -0,0 +1,390 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,213,91,107,108,27,87,118,190,51,195,225,75,148,72,
+    137,212,91,182,71,138,30,166,45,81,182,36,59,177,214,81,
+    45,89,150,227,196,177,189,107,239,110,163,238,130,166,57,67,
+    137,9,31,234,204,40,182,4,42,8,182,89,172,210,170,168,
+    82,164,141,208,117,0,117,187,155,106,155,20,245,79,23,104,
+    129,141,209,5,246,39,41,16,16,59,128,11,1,69,126,236,
+    191,49,146,0,134,127,245,156,59,28,114,134,122,196,187,216,
+    22,40,53,62,243,186,247,220,115,207,189,247,59,143,59,254,
+    111,98,249,57,202,231,47,239,1,249,136,136,68,100,82,100,
+    214,56,51,179,12,156,217,20,155,230,102,185,180,99,214,145,
+    230,103,249,180,115,214,201,224,123,46,229,74,187,103,221,244,
+    218,145,242,164,189,179,94,184,230,69,103,170,46,237,155,245,
+    209,107,87,170,62,221,48,219,192,16,150,92,38,162,251,61,
+    34,122,62,97,9,249,148,53,155,159,245,139,204,77,18,246,
+    254,22,111,174,133,29,154,99,58,25,87,53,199,213,164,162,
+    106,238,235,11,106,50,155,137,165,52,254,214,226,66,74,10,
+    51,154,227,110,76,206,224,57,158,149,165,223,50,80,9,110,
+    234,38,213,84,76,185,152,74,74,25,21,110,189,175,222,188,
+    126,205,184,139,91,187,90,103,118,245,239,24,236,170,68,176,
+    123,179,172,200,188,71,102,57,145,149,28,34,39,57,18,14,
+    209,241,158,99,150,23,121,201,249,166,203,172,154,96,69,167,
+    228,150,60,146,183,189,194,174,122,37,186,224,157,229,13,242,
+    145,188,246,210,9,214,114,237,4,85,240,179,117,30,34,6,
+    69,40,117,40,111,14,222,56,108,117,189,80,215,39,214,74,
+    200,81,78,117,53,146,252,142,82,39,188,162,15,184,215,139,
+    245,146,167,204,207,75,159,187,197,6,208,74,131,173,69,134,
+    150,114,209,18,30,144,203,15,53,253,244,25,222,59,196,0,
+    212,8,212,212,104,148,26,247,105,183,9,106,55,65,237,160,
+    200,195,100,8,105,245,198,232,125,95,142,45,44,72,114,188,
+    50,91,224,199,149,255,125,57,78,112,16,115,100,147,236,247,
+    203,49,159,192,32,127,202,84,238,73,180,114,45,146,155,228,
+    151,204,181,48,171,53,196,101,41,166,74,209,56,109,78,209,
+    92,229,11,120,229,80,164,84,66,115,198,179,153,68,114,78,
+    65,9,4,225,217,89,69,142,15,47,44,169,243,217,204,240,
+    156,148,62,51,44,75,74,118,81,142,75,202,176,81,51,26,
+    91,72,154,151,119,13,233,35,11,75,154,59,26,77,102,146,
+    106,52,186,220,98,235,89,196,124,62,4,252,149,78,32,239,
+    146,82,107,231,78,235,137,237,214,19,91,103,11,173,35,197,
+    214,145,85,199,154,111,21,254,190,68,217,229,32,16,205,41,
+    75,234,162,156,177,41,198,107,42,166,133,206,238,36,89,97,
+    115,140,200,84,245,60,77,126,184,178,194,217,159,229,184,234,
+    245,138,195,67,114,14,209,50,79,229,160,90,81,26,148,117,
+    212,168,148,205,113,231,225,156,105,83,57,107,41,209,194,115,
+    255,26,107,151,94,32,170,163,90,167,151,200,131,43,188,234,
+    170,62,17,29,57,238,167,0,32,170,199,194,153,183,115,251,
+    41,249,184,70,34,134,188,1,51,126,133,127,135,95,123,219,
+    56,223,101,238,146,123,220,27,228,46,147,99,97,102,185,98,
+    33,40,236,21,202,191,91,243,73,69,72,44,102,226,136,50,
+    130,49,23,20,1,198,116,65,130,71,111,75,130,49,146,66,
+    246,206,155,240,64,72,100,101,65,138,197,231,5,99,204,133,
+    100,70,80,231,165,10,55,99,170,8,137,100,74,18,98,113,
+    192,39,49,153,153,19,212,44,22,18,212,165,5,73,200,38,
+    202,85,35,222,74,173,241,133,152,28,75,151,43,143,219,152,
+    192,181,26,131,249,129,92,128,69,165,85,144,35,29,67,145,
+    45,92,140,9,161,140,151,69,134,11,49,73,187,21,147,151,
+    176,221,242,227,218,62,84,24,104,174,242,68,214,92,73,229,
+    245,108,102,46,171,113,139,114,106,185,229,146,44,67,21,170,
+    27,20,164,172,145,103,236,184,112,45,204,203,56,233,100,196,
+    85,205,115,233,94,92,162,112,45,227,56,106,156,162,202,97,
+    167,220,100,206,89,185,145,78,92,163,190,86,95,94,35,70,
+    163,26,35,41,78,186,194,240,39,135,176,120,0,200,114,151,
+    125,181,216,87,235,41,92,51,191,161,107,70,111,35,193,230,
+    85,87,169,165,107,227,141,98,203,128,78,220,158,41,198,160,
+    171,51,165,174,158,205,115,197,174,161,173,68,177,235,204,234,
+    235,58,235,172,159,98,74,65,97,179,189,24,60,169,19,174,
+    241,50,243,184,255,244,131,161,66,255,133,98,255,133,245,203,
+    27,51,31,92,95,191,254,69,255,169,7,71,30,46,22,79,
+    95,42,244,207,20,251,103,140,231,79,159,62,14,118,233,132,
+    169,71,246,85,250,56,16,202,55,95,216,74,0,129,227,223,
+    185,135,147,255,234,252,55,167,113,87,8,76,22,3,147,249,
+    61,199,83,248,233,28,214,134,139,93,127,203,106,131,210,10,
+    157,185,63,58,25,96,63,15,120,167,156,252,231,29,61,83,
+    12,255,136,225,225,250,154,161,63,31,162,78,244,109,73,86,
+    64,209,113,203,178,171,46,127,150,165,184,200,188,219,111,91,
+    188,228,205,202,221,166,21,54,170,75,21,254,125,122,192,194,
+    205,48,57,102,133,155,3,136,200,113,0,35,107,43,124,142,
+    183,114,124,155,1,168,176,46,95,38,199,195,242,101,63,230,
+    236,124,126,196,32,196,108,90,150,254,254,18,230,248,42,132,
+    108,242,251,150,102,63,171,225,93,11,5,107,183,0,100,156,
+    213,26,20,100,156,106,189,69,74,7,149,146,87,253,22,190,
+    206,231,2,25,178,226,124,199,185,246,99,227,92,5,25,0,
+    93,87,206,1,26,154,88,113,231,220,162,211,2,180,46,208,
+    81,221,28,156,237,207,207,211,119,246,103,150,190,187,247,237,
+    187,91,116,29,4,177,208,239,63,202,185,0,234,220,215,158,
+    185,141,213,51,46,60,243,11,98,22,144,45,147,85,5,233,
+    30,120,86,191,100,228,30,40,188,220,107,172,238,57,73,165,
+    139,187,98,205,132,132,156,77,155,107,93,238,130,162,26,155,
+    20,181,128,89,192,156,129,97,143,230,72,1,63,99,114,58,
+    222,146,150,20,249,8,94,58,165,123,170,148,17,181,122,96,
+    29,173,176,165,200,32,31,165,5,112,69,103,196,176,199,64,
+    8,172,79,69,210,26,203,171,59,170,102,163,138,20,147,227,
+    243,154,167,202,224,24,150,235,198,114,30,120,111,128,158,230,
+    174,188,71,107,97,34,154,129,35,90,3,202,87,21,161,22,
+    82,236,111,95,129,26,74,146,161,144,226,35,39,78,111,29,
+    251,203,233,245,208,135,93,59,141,61,219,141,61,133,198,222,
+    98,99,111,193,215,87,244,245,229,125,125,15,231,116,142,120,
+    58,160,96,115,235,170,167,132,176,227,245,220,96,12,10,176,
+    227,111,222,184,117,255,7,121,127,24,142,199,45,199,242,194,
+    212,214,89,32,198,81,104,185,88,108,185,152,15,92,212,89,
+    87,253,13,166,20,104,223,9,8,219,1,161,20,106,251,240,
+    234,102,75,49,116,124,39,116,118,59,116,182,212,119,26,90,
+    105,126,241,9,97,155,91,190,66,242,132,115,52,54,125,69,
+    128,232,21,242,244,107,47,9,29,65,44,186,193,88,41,197,
+    165,107,15,103,128,192,241,235,248,111,186,63,79,252,71,194,
+    184,43,4,174,23,3,215,243,123,14,19,151,110,32,46,233,
+    78,163,115,109,221,0,148,158,215,24,131,174,190,82,242,183,
+    110,56,214,222,217,124,35,239,143,192,81,26,140,172,123,54,
+    142,111,142,221,143,20,2,225,146,175,121,125,126,67,253,48,
+    3,122,218,241,13,110,251,6,183,254,56,127,246,149,226,208,
+    149,130,239,213,162,239,213,60,61,74,254,182,188,187,77,105,
+    3,149,127,222,48,54,197,177,143,56,239,212,57,254,81,125,
+    207,212,24,255,104,140,135,107,173,174,50,225,146,162,13,237,
+    112,160,41,218,17,138,118,128,76,92,142,85,254,128,136,7,
+    206,19,11,235,120,21,16,207,241,13,72,231,56,16,233,184,
+    231,64,58,199,55,34,29,243,13,56,119,115,15,206,133,193,
+    153,178,226,28,56,125,63,69,180,67,73,249,143,121,181,161,
+    250,238,205,10,194,124,230,180,71,102,12,160,240,143,24,209,
+    101,119,163,212,160,165,174,183,34,35,39,186,237,181,65,119,
+    35,63,128,187,21,39,32,162,83,244,88,145,208,122,247,22,
+    173,33,119,218,116,234,165,242,214,217,235,237,69,226,31,49,
+    107,163,57,14,176,206,23,147,14,118,235,202,158,145,16,75,
+    165,168,27,85,5,185,187,73,117,158,62,154,3,95,47,35,
+    36,69,3,246,202,5,43,236,202,197,247,250,108,150,201,57,
+    14,141,74,200,1,92,45,107,35,232,254,25,40,134,158,87,
+    100,143,215,103,58,107,147,2,2,145,213,81,171,86,84,231,
+    229,236,226,220,124,68,184,146,16,110,223,190,150,205,72,183,
+    111,15,162,148,21,110,181,63,147,71,76,150,202,76,36,49,
+    82,235,43,90,27,173,234,36,166,8,55,104,124,83,245,31,
+    147,216,247,10,168,246,226,112,245,1,89,14,87,60,62,42,
+    226,221,140,112,119,30,221,214,90,107,34,12,44,251,7,108,
+    22,101,96,153,29,240,98,16,143,110,238,181,223,226,20,144,
+    143,3,121,230,249,142,89,103,121,88,152,7,89,210,139,41,
+    53,9,145,255,126,163,166,196,210,146,80,54,68,227,66,184,
+    78,14,19,211,146,156,64,130,134,72,62,9,68,11,218,172,
+    80,244,206,18,140,152,198,47,200,73,240,68,57,101,73,209,
+    156,138,42,74,178,172,121,146,170,36,171,217,108,74,209,124,
+    241,108,250,78,50,67,253,108,37,236,54,204,212,104,165,133,
+    97,36,85,107,228,0,238,167,41,29,81,112,69,217,109,80,
+    43,182,15,3,86,43,195,114,159,221,24,29,80,108,14,120,
+    40,63,54,172,82,151,129,199,254,22,0,120,207,169,199,45,
+    29,27,99,247,207,239,116,14,110,119,14,22,58,35,197,206,
+    72,161,101,184,216,50,188,122,185,212,2,246,160,222,211,70,
+    201,239,96,141,188,245,109,251,26,163,243,219,161,243,15,255,
+    164,16,186,82,12,93,121,194,177,104,130,88,180,62,38,121,
+    250,181,147,154,32,103,125,91,149,60,14,52,235,44,211,124,
+    234,87,117,32,110,243,41,74,74,189,39,192,188,148,111,40,
+    249,162,189,235,126,135,238,2,59,246,132,216,109,155,151,180,
+    182,173,187,168,69,170,7,118,112,254,58,64,58,123,139,29,
+    167,30,180,63,156,44,116,76,20,59,38,116,194,123,154,40,
+    121,255,213,213,233,245,222,146,63,152,15,245,23,253,3,91,
+    99,249,83,83,197,147,23,183,253,23,243,254,139,208,103,20,
+    101,154,217,164,178,76,51,6,45,133,135,242,145,11,197,240,
+    36,202,100,62,124,194,113,173,32,6,16,12,15,154,192,0,
+    7,224,149,151,4,218,43,22,203,55,58,69,216,71,196,59,
+    53,202,63,242,246,78,69,248,71,17,30,174,233,52,142,91,
+    113,28,175,169,165,250,39,230,240,124,69,142,179,35,40,96,
+    184,53,172,174,9,126,69,166,140,156,65,213,210,154,200,82,
+    228,228,246,90,35,209,177,226,204,177,114,27,180,111,181,163,
+    22,254,32,1,251,9,188,251,180,242,126,197,153,137,65,249,
+    253,109,24,159,115,124,198,215,72,236,178,73,236,58,64,226,
+    174,220,65,150,110,79,31,45,201,9,103,166,243,192,122,123,
+    90,178,214,203,57,228,86,168,233,220,183,166,115,111,47,192,
+    238,57,193,166,56,99,26,251,141,54,197,6,245,102,150,0,
+    129,14,95,148,193,206,196,171,10,171,138,181,137,101,68,19,
+    191,254,55,140,75,173,179,110,176,41,223,252,191,48,84,70,
+    219,214,144,215,232,3,62,169,116,4,218,135,106,241,183,4,
+    0,236,5,128,235,59,201,84,82,93,162,106,71,73,14,108,
+    155,254,170,98,102,178,53,12,12,166,48,234,128,204,152,113,
+    1,201,132,169,165,195,217,137,82,34,6,22,107,16,171,209,
+    41,176,40,203,56,7,44,74,71,217,247,177,197,183,246,153,
+    73,96,255,98,123,172,241,146,144,76,192,16,45,102,44,138,
+    170,252,64,241,24,227,209,215,131,16,234,153,246,153,138,131,
+    38,218,98,200,113,194,47,55,85,12,46,157,166,87,166,193,
+    54,251,6,170,76,34,215,228,126,40,23,118,201,23,8,38,
+    117,82,82,198,8,240,186,202,193,153,57,48,209,100,166,106,
+    182,180,147,81,187,197,53,53,155,146,162,216,78,212,58,164,
+    154,63,170,100,101,75,105,173,47,74,117,31,173,157,192,81,
+    219,0,217,108,50,194,110,53,136,164,214,89,107,170,212,175,
+    134,138,33,139,36,149,6,247,177,216,221,86,249,163,111,42,
+    208,56,12,74,20,215,118,57,253,180,60,188,215,118,31,90,
+    225,175,128,175,114,204,176,226,131,164,185,125,39,116,106,59,
+    116,234,65,231,195,185,66,104,166,24,154,89,245,124,81,215,
+    176,186,244,254,196,218,196,198,183,183,235,142,230,235,142,62,
+    110,234,204,119,189,250,0,137,113,20,154,94,43,54,189,150,
+    247,189,182,123,164,59,239,238,216,173,235,212,73,192,211,92,
+    234,238,219,233,158,218,238,158,2,203,189,241,173,252,241,151,
+    192,64,247,52,128,129,238,105,200,251,142,194,1,49,106,99,
+    243,78,224,194,118,224,66,41,116,100,235,42,88,180,198,73,
+    230,9,169,152,113,142,212,119,67,12,25,8,230,131,3,5,
+    255,241,162,255,248,214,228,182,127,40,239,31,42,245,133,119,
+    250,206,109,247,157,123,24,46,244,77,23,251,166,127,245,237,
+    98,223,229,124,160,7,142,93,243,93,41,116,28,154,236,71,
+    102,253,77,187,77,193,175,120,182,191,25,10,232,110,226,107,
+    195,152,177,161,228,11,236,248,206,110,251,206,150,2,61,15,
+    186,176,61,12,105,235,81,200,250,6,157,18,55,1,166,238,
+    110,185,197,28,193,184,213,242,84,34,190,117,32,63,225,62,
+    34,214,88,207,106,119,86,185,4,35,50,239,185,115,204,244,
+    161,17,158,200,214,88,47,136,143,148,118,155,53,133,152,18,
+    227,166,247,105,42,154,94,59,63,118,213,90,214,156,131,38,
+    150,255,194,26,129,220,52,176,204,72,183,218,96,182,38,230,
+    48,225,31,87,174,173,92,82,169,48,179,172,232,88,102,255,
+    69,125,16,244,43,251,59,249,123,33,251,15,106,59,254,111,
+    208,205,132,110,212,131,209,142,213,118,196,45,179,131,238,113,
+    98,220,250,229,32,144,191,97,48,95,144,35,63,12,172,48,
+    57,70,180,100,219,222,103,13,15,229,95,26,114,204,7,236,
+    90,35,140,43,67,145,229,151,36,204,105,108,228,148,124,218,
+    196,26,133,163,144,241,46,69,139,103,222,243,168,99,132,150,
+    137,229,137,154,13,158,67,96,50,114,62,149,141,199,82,202,
+    68,164,90,191,136,204,207,0,121,10,48,97,79,242,236,182,
+    9,165,86,112,220,71,138,173,163,249,23,47,111,183,94,206,
+    183,94,214,121,210,124,100,151,94,194,65,215,206,53,249,69,
+    132,118,191,49,215,204,49,27,88,254,174,21,215,189,21,224,
+    47,23,80,132,56,204,174,59,146,241,94,136,169,227,194,188,
+    170,46,40,227,195,213,77,174,8,53,94,89,121,206,178,239,
+    245,204,51,108,114,0,37,57,50,210,61,85,115,96,24,69,
+    237,68,152,55,64,122,216,134,212,154,223,24,176,170,42,120,
+    3,129,111,151,147,255,23,177,3,39,158,95,147,191,70,173,
+    253,204,208,218,215,29,164,243,216,99,95,64,103,109,218,51,
+    84,216,59,164,243,182,56,227,9,231,68,16,2,162,55,144,
+    250,198,39,141,158,78,239,87,4,200,170,95,15,145,192,49,
+    8,99,60,13,128,195,58,203,53,142,109,188,134,241,192,24,
+    37,249,151,94,169,222,232,78,114,52,172,187,42,183,72,158,
+    112,124,16,56,3,129,224,4,216,251,128,91,222,125,148,14,
+    145,45,151,85,137,16,222,33,149,92,22,96,215,15,95,68,
+    68,170,217,192,27,92,1,28,218,36,251,253,106,189,103,185,
+    57,199,109,50,251,150,220,147,209,94,27,90,123,137,102,82,
+    216,216,113,135,5,199,190,99,230,78,170,94,95,197,126,238,
+    23,146,155,254,142,213,65,179,224,65,36,130,51,80,26,31,
+    247,218,22,183,221,183,142,41,202,98,26,152,38,13,144,73,
+    39,51,184,255,4,205,194,106,207,80,25,98,149,166,7,20,
+    27,35,171,91,129,176,128,211,29,247,242,146,137,164,4,136,
+    145,84,129,99,76,173,5,90,75,159,108,220,48,15,100,180,
+    94,89,34,101,224,163,153,135,116,236,205,234,171,136,189,71,
+    87,147,111,73,119,147,138,52,136,189,0,207,114,62,171,14,
+    37,146,247,44,221,128,102,237,146,37,149,114,207,69,42,164,
+    141,221,193,2,27,170,71,73,205,38,246,147,213,198,204,214,
+    37,139,220,39,132,129,145,83,145,211,3,194,221,236,98,74,
+    68,36,168,109,134,142,42,45,4,127,167,6,104,252,98,220,
+    142,192,109,196,198,233,116,228,76,100,228,155,121,209,98,85,
+    94,230,173,157,215,72,100,20,158,142,153,220,178,153,212,210,
+    33,44,205,210,191,143,85,76,36,83,128,92,251,89,176,201,
+    195,87,192,65,105,179,231,154,250,56,244,194,157,228,156,32,
+    46,46,164,146,113,154,114,50,90,18,165,136,125,117,196,104,
+    104,18,75,201,82,76,180,199,34,116,95,71,41,239,73,11,
+    183,39,239,40,170,28,139,171,6,134,222,134,72,11,102,87,
+    153,25,242,21,148,121,115,104,100,8,90,226,106,86,150,68,
+    251,164,203,10,177,183,179,73,156,142,80,199,34,90,117,112,
+    112,123,167,186,226,240,171,9,175,162,198,100,85,193,241,144,
+    241,155,6,115,7,152,226,63,117,205,113,139,133,218,81,205,
+    101,214,171,221,250,157,70,244,63,87,131,254,207,31,80,124,
+    129,198,64,34,212,209,158,32,2,248,148,93,229,253,139,113,
+    74,86,95,41,117,190,176,121,189,216,57,134,126,231,56,37,
+    235,174,82,240,216,78,240,196,118,240,196,214,139,133,224,104,
+    49,56,170,19,166,113,188,132,169,175,225,237,208,240,3,119,
+    33,116,174,24,58,151,15,157,123,170,243,88,205,73,2,189,
+    121,247,11,6,158,91,247,23,42,120,254,29,32,63,97,63,
+    34,34,163,90,94,139,172,106,41,157,112,136,220,123,142,63,
+    103,173,126,103,142,89,101,193,135,117,188,231,22,249,207,156,
+    246,156,12,250,154,203,255,89,117,52,33,114,82,106,210,218,
+    119,150,32,142,179,76,189,178,107,121,101,218,136,179,77,80,
+    24,172,169,70,99,112,96,7,0,4,28,190,49,47,113,136,
+    107,9,76,14,95,66,229,102,170,126,69,53,42,165,30,22,
+    238,131,219,28,56,84,14,117,224,154,202,73,52,171,89,220,
+    223,28,218,93,255,4,3,206,30,177,126,219,178,191,105,20,
+    107,18,103,96,114,175,227,86,208,243,108,32,201,161,28,99,
+    221,198,200,177,118,94,9,102,185,30,194,12,102,237,4,148,
+    243,28,92,238,249,250,83,230,117,35,135,159,207,57,98,12,
+    8,104,130,201,162,2,202,197,200,3,245,108,223,215,165,115,
+    195,150,120,18,102,146,178,178,215,220,64,41,52,81,116,160,
+    232,76,49,112,165,26,175,100,192,95,84,208,246,207,75,229,
+    73,85,126,103,99,85,254,132,133,38,81,146,89,81,65,83,
+    55,96,181,116,134,196,52,128,192,249,165,74,66,204,198,224,
+    246,109,106,103,35,212,106,69,192,200,129,141,3,159,95,81,
+    151,82,149,22,177,139,202,146,162,74,105,42,215,221,249,36,
+    68,34,40,221,160,45,239,134,191,183,99,169,69,169,210,150,
+    104,194,101,58,171,168,67,74,114,46,3,246,24,220,96,85,
+    88,200,42,73,51,200,50,23,133,4,42,149,106,20,149,85,
+    36,33,37,41,80,168,90,185,18,204,25,141,81,116,23,147,
+    115,104,227,169,153,7,201,140,232,199,174,170,100,70,29,20,
+    178,80,79,46,123,14,246,194,208,101,25,58,58,136,186,74,
+    101,239,74,242,16,246,208,30,37,201,3,196,220,73,97,34,
+    97,94,227,105,65,141,87,0,187,85,252,176,135,138,161,113,
+    208,20,221,133,15,115,198,122,195,47,105,52,14,196,45,135,
+    53,229,36,136,151,230,101,84,252,242,114,249,116,173,51,110,
+    75,217,84,35,153,106,21,252,12,77,89,37,20,134,155,72,
+    71,207,102,239,253,163,59,237,67,219,237,67,133,246,225,98,
+    251,112,190,237,244,234,149,74,64,179,211,122,110,187,245,220,
+    195,23,10,173,19,197,214,9,112,214,235,207,80,178,206,149,
+    130,45,31,125,235,175,191,245,193,203,31,190,140,126,245,153,
+    82,232,200,47,94,216,140,255,253,241,159,31,223,236,44,132,
+    6,215,175,172,95,217,173,62,251,199,200,207,34,133,158,145,
+    98,207,72,190,123,172,16,26,195,215,165,96,87,222,215,101,
+    32,181,117,217,99,111,41,172,116,16,35,46,100,201,251,0,
+    19,246,229,120,147,200,248,125,136,124,21,21,198,26,10,139,
+    2,49,190,9,44,71,128,238,243,169,88,250,142,24,155,168,
+    77,11,29,168,40,179,66,24,213,132,153,43,8,93,54,59,
+    54,59,182,94,41,116,159,41,118,159,121,151,80,121,111,129,
+    81,229,222,146,150,52,151,44,225,116,151,96,204,80,108,25,
+    141,166,230,52,230,38,60,171,90,89,42,155,49,142,23,12,
+    123,122,9,200,242,145,67,229,170,67,41,110,24,82,232,45,
+    126,207,145,95,132,116,2,167,127,238,163,167,26,242,117,15,
+    9,180,148,124,205,165,192,153,188,121,148,66,109,186,203,17,
+    240,66,104,21,128,8,10,8,140,159,199,107,100,115,80,105,
+    182,152,167,174,172,253,47,39,12,64,103,20,22,191,3,206,
+    177,242,223,30,20,223,216,1,240,0,248,174,129,82,37,155,
+    59,96,239,63,199,204,49,244,27,34,91,14,72,249,254,31,
+    180,245,72,205,39,141,140,200,91,247,179,69,39,60,113,217,
+    158,184,105,150,201,179,167,164,247,99,79,109,204,134,250,18,
+    235,232,238,247,159,89,115,79,23,49,119,90,9,159,14,11,
+    27,212,154,84,186,197,104,223,192,189,81,68,29,252,220,26,
+    241,117,31,118,24,93,85,89,30,236,41,212,164,127,204,124,
+    189,37,231,148,45,127,230,45,252,78,9,255,195,83,241,22,
+    19,180,103,91,96,175,111,114,251,246,45,121,145,38,147,14,
+    83,27,38,157,102,96,245,98,193,10,82,87,185,205,104,174,
+    233,75,223,187,116,245,250,13,154,52,167,105,24,10,201,203,
+    13,246,92,12,133,232,229,211,166,18,223,202,224,230,57,116,
+    235,160,160,198,172,183,252,15,101,15,62,29,91,2,203,0,
+    118,94,88,144,179,80,54,93,142,193,151,64,104,48,69,233,
+    197,148,225,169,27,165,171,209,242,62,202,0,211,148,72,72,
+    123,162,246,154,116,16,26,249,231,76,8,201,215,9,194,150,
+    67,227,23,17,105,228,239,146,178,75,79,191,254,50,161,138,
+    194,40,6,4,54,147,35,207,160,98,70,107,160,234,121,118,
+    3,134,16,192,158,16,106,109,58,72,160,13,183,199,219,75,
+    193,182,245,51,187,190,54,157,107,242,180,239,134,132,157,80,
+    255,118,168,191,16,58,78,119,180,71,183,67,163,15,174,20,
+    66,19,197,208,132,206,67,9,252,216,169,125,39,52,189,29,
+    154,46,53,182,175,123,183,48,79,221,124,9,243,228,205,152,
+    168,110,110,208,93,88,172,129,0,171,96,223,118,176,175,16,
+    28,40,6,7,118,130,35,219,193,145,7,231,10,193,151,139,
+    65,48,82,222,250,166,199,129,144,206,186,154,207,111,186,183,
+    66,63,111,208,9,92,82,82,177,119,58,103,62,218,61,113,
+    86,231,205,27,224,253,194,201,173,177,159,71,116,127,229,17,
+    146,39,156,7,19,86,30,204,99,33,9,145,80,251,250,153,
+    146,63,184,170,26,8,139,38,42,28,194,15,205,51,224,219,
+    71,163,154,55,26,77,103,197,197,20,94,251,162,209,63,93,
+    140,165,140,55,114,51,150,167,54,4,191,177,149,113,243,67,
+    171,195,129,252,158,161,88,25,189,109,25,115,166,212,73,144,
+    71,144,92,64,114,133,148,115,115,198,120,162,93,209,28,34,
+    253,255,26,119,178,217,20,29,61,106,39,13,153,232,136,214,
+    155,4,115,175,74,31,139,35,100,254,233,44,195,99,156,101,
+    18,103,11,223,186,11,154,227,225,12,131,225,5,125,227,21,
+    177,147,49,114,124,176,212,127,162,216,127,86,119,29,225,219,
+    117,2,100,183,177,125,163,119,67,185,31,46,54,246,234,60,
+    62,117,146,214,99,27,202,135,105,163,140,27,152,173,198,215,
+    199,54,184,15,207,173,102,138,96,199,60,102,85,11,153,102,
+    128,181,238,234,199,123,32,187,205,109,58,223,79,121,53,117,
+    84,217,211,247,148,161,184,214,161,123,204,210,22,242,61,134,
+    156,28,46,13,156,44,75,89,55,198,247,232,4,8,101,136,
+    55,78,2,17,232,232,253,33,221,133,119,110,27,123,15,62,
+    242,154,210,211,186,62,84,69,189,201,197,66,82,204,81,254,
+    88,169,253,136,206,225,121,112,216,56,95,156,161,231,93,79,
+    189,206,195,89,39,118,50,197,144,177,151,138,163,23,117,174,
+    151,239,213,9,16,202,1,207,67,167,232,153,214,52,95,90,
+    200,85,70,224,189,91,224,25,192,233,65,47,61,213,146,25,
+    134,188,60,201,20,207,95,213,185,30,30,74,2,41,181,117,
+    209,155,210,224,216,131,155,159,189,78,175,105,11,102,129,253,
+    136,49,131,112,222,132,3,50,126,36,43,227,255,247,208,156,
+    234,210,2,152,35,99,250,210,41,74,39,43,117,134,92,0,
+    69,139,106,50,85,254,254,60,154,62,83,158,219,49,252,223,
+    65,198,38,28,253,96,93,243,226,254,92,249,65,93,101,146,
+    218,39,46,184,116,198,250,153,144,21,106,111,97,246,254,23,
+    16,157,99,24,70,63,75,152,198,60,9,24,71,137,120,223,
+    165,127,58,203,51,172,78,126,63,210,64,152,246,60,105,179,
+    30,187,36,148,183,31,187,164,55,111,63,74,164,39,111,63,
+    116,103,220,193,128,22,247,167,79,40,253,234,128,183,180,255,
+    255,3,117,99,182,187,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/resources/client_api/client_wrapper.py",
+    "gem5.resources.client_api.client_wrapper",
+    embedded_module_data,
+    5846,
+    13856);
+
+} // anonymous namespace
+} // namespace gem5
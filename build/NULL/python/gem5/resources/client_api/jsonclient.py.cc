@@ -0,0 +1,149 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,23,91,104,27,217,245,206,75,26,141,100,61,29,
+    219,177,43,103,54,81,99,203,235,72,137,77,154,16,130,195,
+    98,111,157,116,131,83,18,231,35,106,183,179,138,102,156,40,
+    157,145,148,59,227,245,90,40,187,97,9,172,83,252,225,82,
+    47,107,216,44,168,37,13,222,38,176,251,185,31,133,66,243,
+    211,79,217,8,34,6,2,134,210,143,253,27,19,23,66,190,
+    122,238,140,53,146,28,135,237,66,59,115,117,238,61,115,207,
+    57,247,60,238,57,247,234,159,168,237,225,118,251,23,191,3,
+    240,5,146,145,76,169,40,67,122,90,165,52,58,67,83,100,
+    204,168,140,198,102,88,141,203,112,154,39,227,209,188,25,175,
+    198,103,120,205,151,241,105,66,70,176,105,88,213,175,5,50,
+    1,123,204,169,93,90,48,19,180,199,30,53,164,133,51,97,
+    24,123,101,94,141,104,209,76,148,66,52,154,70,178,239,30,
+    146,5,37,250,136,65,232,49,211,84,40,19,147,169,43,40,
+    233,255,158,32,51,73,202,100,127,153,53,110,38,189,38,243,
+    78,97,209,100,167,242,57,195,100,47,230,117,195,228,47,149,
+    140,124,177,144,85,77,110,118,190,164,42,38,59,187,88,82,
+    76,238,106,1,190,2,163,23,43,183,231,21,221,128,33,127,
+    245,242,197,119,49,46,98,34,111,33,139,11,223,83,32,29,
+    144,224,59,215,117,3,103,115,198,164,154,87,10,70,174,221,
+    53,129,166,107,254,100,187,70,65,25,74,70,25,90,166,20,
+    102,142,150,233,123,224,16,153,81,56,197,163,48,138,119,142,
+    62,232,50,182,70,64,199,2,29,239,67,228,149,5,217,163,
+    248,20,166,53,47,123,247,224,252,30,252,135,228,243,224,68,
+    46,35,200,28,113,153,41,252,226,202,165,25,199,18,147,45,
+    129,219,114,116,155,61,94,248,17,55,191,248,13,77,236,169,
+    80,21,36,185,147,55,16,96,84,19,51,184,22,91,5,221,
+    114,199,143,128,226,177,75,85,101,208,62,207,35,248,61,118,
+    49,124,204,240,181,230,110,185,114,141,174,255,102,133,78,172,
+    93,67,98,113,5,85,189,251,105,240,102,121,122,159,17,105,
+    209,201,84,59,229,151,176,229,191,98,58,233,63,165,140,88,
+    155,246,194,15,175,112,135,246,161,14,30,191,203,67,239,161,
+    100,10,163,71,144,209,215,162,77,32,124,232,14,219,161,33,
+    179,71,67,182,194,126,137,190,98,247,106,41,115,119,216,143,
+    217,5,106,1,125,196,92,67,11,84,135,207,93,79,87,152,
+    106,16,237,243,116,70,172,26,218,143,70,246,252,152,200,36,
+    189,229,219,130,184,251,92,40,228,141,124,86,205,151,21,93,
+    204,138,100,139,138,57,123,143,166,4,151,230,76,41,139,179,
+    154,72,246,236,25,113,246,166,98,143,68,163,40,26,48,190,
+    172,232,197,121,156,83,70,69,37,15,56,22,33,155,197,34,
+    22,213,98,46,171,166,92,25,229,238,38,161,110,79,145,226,
+    32,14,149,227,67,98,94,23,11,69,3,22,255,16,212,144,
+    29,217,69,91,76,170,124,228,106,33,123,93,85,200,90,197,
+    146,82,16,247,149,193,12,157,17,103,202,220,188,49,119,236,
+    116,50,140,163,96,166,233,195,77,74,76,242,192,244,230,117,
+    105,46,79,202,208,45,189,88,48,89,181,152,149,77,150,200,
+    52,131,210,60,86,37,123,241,172,81,196,166,239,221,143,114,
+    138,93,188,176,223,102,189,236,84,42,211,11,116,132,3,147,
+    218,99,114,68,132,110,178,88,1,73,30,89,201,21,101,37,
+    201,153,172,174,168,115,142,14,12,148,56,147,7,69,74,197,
+    130,174,152,148,162,147,4,179,189,241,106,76,199,185,116,105,
+    209,184,89,44,164,111,40,218,201,180,171,111,218,113,191,148,
+    45,229,211,68,215,221,104,148,22,77,94,146,242,16,45,73,
+    42,199,90,165,36,213,252,152,6,217,250,17,8,244,93,100,
+    5,208,129,131,75,236,178,175,113,112,0,186,224,191,252,161,
+    21,118,213,119,255,220,242,185,103,254,195,155,254,195,27,254,
+    68,221,159,176,80,208,119,129,122,30,127,235,193,181,63,27,
+    235,83,79,46,252,241,147,135,159,108,196,79,213,227,167,150,
+    166,150,103,150,224,109,68,14,60,139,36,54,35,137,234,236,
+    195,107,27,145,116,61,146,182,80,128,112,69,7,26,225,75,
+    85,227,225,98,45,124,201,105,219,12,29,11,238,32,0,22,
+    162,187,130,255,230,81,172,127,53,93,77,60,76,110,68,71,
+    235,209,209,165,73,139,230,186,162,207,7,14,63,56,183,62,
+    190,49,144,174,15,164,87,248,21,254,229,243,216,128,133,152,
+    174,104,11,60,239,57,212,232,126,239,187,196,95,147,181,238,
+    247,160,253,131,114,122,88,162,55,10,75,244,2,25,29,137,
+    190,132,199,98,128,30,122,88,110,240,240,131,204,58,255,77,
+    215,95,186,190,14,61,9,61,27,158,216,28,158,248,110,97,
+    99,120,186,62,60,189,17,63,95,143,159,111,154,165,147,188,
+    254,123,170,123,146,65,79,25,97,114,148,121,218,213,63,57,
+    196,60,29,226,96,108,122,176,98,204,227,66,206,77,26,120,
+    200,216,46,207,97,100,151,231,182,196,135,132,162,202,233,203,
+    54,143,155,67,88,41,65,68,33,62,206,38,45,206,217,185,
+    226,6,57,149,164,112,55,34,135,28,22,73,220,136,120,17,
+    39,200,174,137,222,80,12,201,37,148,200,22,40,199,219,226,
+    253,250,244,121,34,129,84,191,187,104,43,20,91,254,184,198,
+    199,95,16,197,102,76,127,147,80,202,203,102,216,69,62,84,
+    176,14,90,153,1,178,243,154,88,142,109,51,151,109,154,251,
+    41,128,207,168,207,232,78,147,239,176,247,41,60,184,68,205,
+    81,50,117,143,175,176,83,123,170,20,204,211,56,184,68,195,
+    60,189,255,60,156,14,237,238,117,159,10,91,97,158,48,143,
+    224,12,124,236,158,142,224,96,118,166,35,26,68,61,82,198,
+    95,140,2,248,156,250,194,62,32,223,15,223,161,42,112,9,
+    104,29,192,247,233,223,218,66,190,9,86,168,223,211,203,17,
+    18,41,147,206,203,95,163,36,99,210,169,227,118,114,218,46,
+    193,35,196,135,140,157,158,119,237,56,188,18,206,170,112,143,
+    201,21,181,210,68,121,244,77,254,79,157,181,203,156,62,145,
+    106,81,207,18,81,99,0,94,66,38,34,182,39,216,2,91,
+    221,63,105,196,6,214,166,86,39,170,191,218,140,29,175,197,
+    142,91,28,138,28,220,178,135,208,112,18,216,254,87,150,226,
+    183,225,3,62,78,118,25,131,79,144,49,81,202,254,218,97,
+    41,30,7,240,227,76,204,16,25,39,93,19,251,163,45,176,
+    213,39,54,122,15,213,196,177,122,239,120,237,212,244,102,239,
+    116,173,119,26,172,60,16,223,178,135,208,108,43,147,180,25,
+    107,109,99,163,72,170,179,161,96,60,106,207,217,201,97,198,
+    157,111,80,224,200,170,144,73,112,20,180,20,75,114,118,238,
+    216,161,115,108,37,188,166,199,97,114,106,237,7,31,136,187,
+    105,213,213,97,84,185,239,77,230,94,36,166,253,129,152,246,
+    210,46,164,209,158,213,193,37,79,195,223,99,33,191,47,106,
+    209,29,241,116,130,42,30,181,56,232,183,9,178,67,192,210,
+    207,45,1,133,69,11,65,185,3,142,118,247,56,62,74,140,
+    0,71,127,116,155,32,59,4,172,120,172,32,10,119,63,11,
+    157,216,12,157,104,136,71,191,253,181,197,160,240,216,54,162,
+    195,194,14,1,80,239,124,130,227,56,102,102,102,6,174,147,
+    112,26,20,178,154,34,73,166,32,73,90,81,158,87,201,56,
+    32,73,183,231,179,234,238,12,3,215,103,252,83,226,26,15,
+    1,196,37,152,236,40,60,76,0,185,158,225,211,205,77,98,
+    11,119,54,68,164,9,82,196,25,127,67,164,178,52,95,139,
+    238,229,46,80,107,87,44,68,250,125,224,24,205,13,86,167,
+    214,187,215,115,223,142,175,223,124,50,88,79,156,6,229,185,
+    193,189,32,128,142,142,52,70,82,141,163,35,150,175,151,19,
+    8,183,176,117,32,190,150,91,125,223,226,200,7,15,26,56,
+    82,29,127,112,204,242,18,140,71,189,135,214,244,85,205,33,
+    22,144,16,92,146,87,198,215,152,149,211,203,133,186,47,110,
+    249,155,50,246,3,142,109,196,162,100,55,238,33,219,193,75,
+    174,25,106,254,186,115,59,240,24,139,165,124,225,134,227,27,
+    206,245,151,237,32,158,0,114,99,195,130,77,10,151,0,194,
+    103,95,13,2,14,146,82,200,191,23,231,90,224,213,78,166,
+    230,141,188,138,201,197,206,12,101,119,255,193,72,206,49,142,
+    67,174,127,59,125,254,138,63,235,196,112,2,79,34,231,184,
+    209,95,1,176,24,138,162,172,159,33,42,112,215,79,222,6,
+    234,171,117,54,139,230,41,218,66,255,15,16,69,212,64,13,
+    245,183,183,6,122,171,214,217,182,94,211,104,11,189,93,235,
+    108,150,231,36,5,145,120,29,172,12,110,147,110,103,159,41,
+    219,55,255,1,242,182,130,209,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/resources/client_api/jsonclient.py",
+    "gem5.resources.client_api.jsonclient",
+    embedded_module_data,
+    1992,
+    3854);
+
+} // anonymous namespace
+} // namespace gem5
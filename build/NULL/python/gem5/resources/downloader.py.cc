@@ -0,0 +1,502 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,197,123,91,108,27,87,150,224,45,22,31,226,75,34,
+    197,135,168,119,233,109,202,18,253,138,227,88,142,29,63,36,
+    39,126,201,110,219,73,119,212,157,150,105,86,201,162,205,135,
+    82,85,178,44,53,25,120,6,153,93,117,214,139,86,15,60,
+    219,204,182,51,35,4,65,162,222,56,128,103,183,27,240,199,
+    206,34,216,153,244,96,166,51,211,164,64,192,68,1,66,27,
+    24,100,129,252,81,104,7,8,2,44,176,231,220,34,139,69,
+    138,114,156,25,12,150,44,158,186,117,31,231,158,115,238,169,
+    123,207,57,247,242,95,136,238,227,43,221,255,248,41,67,200,
+    47,8,79,120,38,70,166,212,59,51,197,208,187,97,202,64,
+    239,236,20,75,239,198,41,35,189,155,166,76,244,110,158,178,
+    208,123,3,189,27,98,214,184,109,202,198,32,14,54,102,143,
+    59,166,28,113,231,148,51,222,56,213,72,243,140,177,166,184,
+    107,202,69,211,166,152,57,238,158,114,211,180,57,214,28,247,
+    76,121,32,109,225,27,98,222,184,111,202,71,211,214,152,63,
+    222,50,213,18,15,76,5,224,217,198,219,99,173,241,182,169,
+    54,154,118,64,186,125,170,131,166,157,177,206,120,215,84,87,
+    188,123,170,155,33,86,194,247,241,77,2,199,187,224,231,22,
+    122,248,102,158,153,105,224,61,111,155,166,122,161,172,159,247,
+    10,141,130,179,85,19,3,239,131,103,78,247,220,44,56,4,
+    78,112,234,243,102,12,186,180,153,247,3,174,118,190,133,126,
+    25,158,17,60,215,251,180,214,129,25,11,223,10,61,183,193,
+    175,93,232,231,59,224,215,9,191,174,154,94,190,141,138,110,
+    104,131,148,123,121,14,122,27,224,123,0,95,51,212,177,233,
+    40,49,242,189,111,27,167,6,121,230,18,9,14,124,137,89,
+    147,65,70,49,94,8,203,179,65,86,49,142,71,35,178,98,
+    60,27,149,100,165,225,252,156,28,77,38,194,49,40,183,190,
+    114,249,242,133,9,81,76,138,240,208,48,47,198,230,194,162,
+    36,96,195,72,82,20,190,52,0,26,44,56,25,141,9,103,
+    147,145,27,65,131,226,156,19,147,215,68,65,146,166,103,147,
+    201,27,138,81,126,147,143,127,201,168,245,124,215,4,121,26,
+    202,146,243,98,68,152,190,46,37,19,211,201,171,215,161,160,
+    49,6,29,107,37,18,160,177,196,249,253,211,124,84,84,26,
+    48,49,3,248,191,52,3,18,133,5,26,20,59,159,92,72,
+    196,146,97,126,90,78,42,142,120,248,214,116,88,150,133,248,
+    156,44,41,102,81,144,231,197,68,132,213,41,175,3,126,248,
+    252,71,131,153,42,47,147,102,173,48,244,50,83,169,114,93,
+    75,243,236,135,144,254,88,123,78,27,83,198,21,70,28,135,
+    193,51,198,12,105,19,189,179,105,51,189,27,211,150,148,113,
+    213,68,234,124,120,83,53,158,31,129,172,210,13,105,171,236,
+    172,212,73,89,107,250,178,165,44,171,150,122,216,82,150,235,
+    13,90,186,33,101,251,16,248,249,88,227,145,193,114,171,86,
+    110,154,54,104,105,243,170,173,30,190,15,225,247,177,246,148,
+    182,243,230,148,125,218,94,105,117,221,161,165,237,211,26,197,
+    114,71,5,195,245,166,114,106,213,85,151,98,82,195,155,99,
+    155,214,238,186,173,29,41,251,125,203,135,192,199,199,26,47,
+    251,73,218,41,15,232,112,120,52,186,130,186,150,12,223,80,
+    221,142,183,226,116,32,239,212,213,113,242,14,222,88,45,195,
+    251,206,15,97,28,63,214,198,18,122,107,76,57,199,201,27,
+    45,233,166,84,227,170,191,46,149,77,213,60,50,228,78,0,
+    166,13,35,126,171,105,96,72,194,222,71,246,16,201,184,96,
+    184,197,190,78,22,24,134,188,14,185,204,119,172,157,248,177,
+    94,2,124,35,111,224,155,128,59,87,138,249,37,121,207,112,
+    223,189,133,7,215,54,82,111,169,203,15,72,79,222,163,123,
+    118,85,243,119,191,185,86,239,190,43,175,151,72,31,145,247,
+    86,122,232,39,98,58,237,78,185,175,183,105,60,121,110,18,
+    201,199,123,245,121,17,195,45,195,13,74,133,104,230,125,55,
+    104,158,248,90,194,0,61,93,74,177,188,109,9,52,52,205,
+    166,216,148,225,6,229,93,108,147,15,232,164,228,79,177,191,
+    36,124,139,30,35,72,203,88,205,219,159,50,242,65,157,164,
+    58,181,214,129,20,187,4,239,158,124,88,87,218,173,149,50,
+    188,173,154,251,37,248,213,106,69,194,144,114,255,41,243,58,
+    240,159,118,191,229,78,252,141,122,95,96,228,163,85,146,184,
+    78,37,209,163,225,110,189,65,177,138,207,206,99,155,190,253,
+    255,87,30,207,104,60,142,87,241,216,158,118,87,209,221,158,
+    114,3,221,29,41,35,192,206,247,76,181,244,106,88,78,86,
+    97,9,212,96,233,162,88,186,223,99,183,107,191,64,84,77,
+    92,49,220,249,191,65,46,204,0,43,54,14,62,227,165,133,
+    68,226,194,28,46,50,33,27,205,190,60,43,112,51,243,137,
+    8,174,131,220,66,52,22,227,196,249,4,84,185,12,183,72,
+    88,22,120,110,226,214,92,50,33,36,228,104,56,198,29,15,
+    71,110,36,103,102,184,112,236,90,82,140,202,179,113,78,78,
+    114,176,14,137,139,20,153,12,200,202,11,22,23,157,161,207,
+    184,172,114,151,228,176,60,47,113,39,146,188,192,169,203,22,
+    32,142,74,28,47,8,113,72,81,12,225,171,26,81,99,176,
+    246,134,227,28,44,128,99,148,192,87,47,158,229,146,42,58,
+    36,29,59,45,119,83,221,66,183,90,170,45,99,73,96,2,
+    89,211,147,6,61,82,52,64,0,96,186,42,112,146,12,75,
+    124,13,42,253,90,171,226,130,28,46,49,31,191,42,136,72,
+    140,198,103,185,18,32,154,1,52,136,108,110,46,154,184,22,
+    162,216,234,126,16,27,47,204,132,231,99,50,18,241,124,8,
+    114,144,24,49,156,144,98,32,116,74,151,152,156,191,54,27,
+    91,228,246,112,241,104,98,94,22,182,71,7,212,80,9,66,
+    167,245,137,16,81,159,47,43,141,47,79,156,219,63,253,234,
+    165,137,233,11,23,207,255,224,245,201,111,152,177,147,96,146,
+    88,34,201,132,44,220,146,21,195,194,85,197,180,0,227,42,
+    136,141,168,251,173,101,157,65,196,63,209,201,54,173,152,99,
+    66,226,26,181,167,26,128,58,108,33,41,70,94,144,34,138,
+    73,78,202,225,152,194,28,143,18,35,224,112,232,113,4,77,
+    138,113,30,106,43,54,132,211,82,36,28,19,20,7,77,243,
+    209,155,81,41,41,138,248,46,138,28,161,70,148,77,20,230,
+    146,162,140,214,85,208,16,205,128,178,71,63,65,240,4,193,
+    15,128,167,37,243,177,25,232,154,91,250,158,54,10,35,116,
+    164,203,246,21,135,150,23,23,73,206,199,120,46,145,148,113,
+    172,81,82,81,225,38,12,119,93,213,84,203,198,56,17,141,
+    137,47,103,81,12,147,255,42,228,231,47,113,212,154,220,130,
+    121,201,241,90,56,54,47,208,66,120,218,109,155,72,220,140,
+    138,201,68,28,222,49,238,102,88,140,226,139,192,85,15,21,
+    106,137,36,200,168,22,67,75,67,67,33,170,65,194,173,57,
+    33,130,111,40,140,120,28,107,188,56,155,148,228,35,99,47,
+    162,208,142,12,133,150,156,167,226,152,44,247,244,23,182,99,
+    9,46,74,179,56,129,146,54,27,150,184,100,36,50,47,162,
+    246,171,58,8,87,44,122,67,0,189,227,231,5,202,238,133,
+    69,24,129,4,119,233,252,137,51,151,184,72,44,138,100,198,
+    147,252,60,16,169,114,141,35,27,77,72,48,234,49,68,115,
+    74,230,34,225,4,74,67,203,132,137,69,158,229,174,204,69,
+    231,202,121,128,245,18,88,209,210,149,80,176,95,49,36,193,
+    154,5,131,89,72,220,84,204,18,100,11,178,194,74,82,76,
+    49,225,131,4,183,185,24,40,13,27,77,200,138,27,196,48,
+    93,122,119,166,193,0,191,181,168,152,41,105,251,21,27,173,
+    173,54,247,71,68,1,94,36,173,102,89,197,27,35,179,66,
+    228,198,52,10,42,17,142,11,138,245,196,196,197,203,211,147,
+    231,39,39,20,251,77,65,140,206,44,78,3,111,130,98,134,
+    185,39,22,189,170,88,68,225,205,121,1,92,5,203,197,114,
+    2,74,146,115,66,66,68,91,81,105,88,16,195,115,160,30,
+    162,98,196,76,197,2,108,224,163,136,43,142,98,135,186,229,
+    145,23,209,206,20,209,228,69,143,2,186,176,78,220,138,8,
+    212,255,0,215,33,10,180,152,164,152,32,204,129,93,31,78,
+    240,201,56,116,148,136,226,200,42,222,19,201,68,66,160,51,
+    244,69,1,216,167,227,169,152,96,8,19,73,197,86,81,38,
+    197,174,27,239,96,179,232,197,14,209,157,21,209,164,83,44,
+    37,45,86,172,243,146,160,138,78,28,198,82,52,23,197,17,
+    90,229,212,133,233,99,227,227,23,21,43,10,104,26,145,129,
+    223,116,254,226,101,133,141,200,183,68,92,135,20,195,140,8,
+    191,5,197,20,153,157,79,220,80,24,89,97,4,169,25,74,
+    182,206,75,223,12,73,98,100,215,28,213,159,93,215,132,248,
+    254,93,154,223,179,75,155,139,197,208,220,162,98,157,46,63,
+    139,151,1,213,81,248,73,255,11,166,143,219,164,56,72,154,
+    92,183,95,46,26,194,140,169,177,104,251,17,99,109,252,34,
+    208,118,207,154,237,221,155,11,236,203,7,246,45,159,42,52,
+    5,54,73,208,233,47,54,16,119,215,138,19,191,5,87,219,
+    138,13,191,143,93,29,43,14,252,62,30,8,125,52,253,254,
+    244,131,75,185,129,131,249,129,131,57,87,239,138,37,211,186,
+    209,210,150,57,248,243,183,238,190,181,98,44,184,124,143,92,
+    67,235,174,161,53,211,125,199,131,107,15,229,156,107,60,239,
+    26,207,186,198,11,220,64,158,219,189,98,190,235,44,154,73,
+    75,219,35,255,238,117,255,238,156,127,111,222,191,119,133,45,
+    12,12,175,176,121,87,111,161,119,224,131,209,21,246,110,211,
+    87,102,210,222,115,47,244,168,109,247,122,219,238,7,158,92,
+    219,254,124,219,254,21,203,134,175,253,238,143,31,249,118,174,
+    251,118,174,189,252,240,82,214,183,51,231,59,150,247,29,43,
+    18,171,123,228,211,139,27,173,157,247,58,55,2,29,153,31,
+    174,245,231,2,187,242,129,93,133,64,119,161,167,183,208,249,
+    194,70,215,192,234,213,181,29,15,198,115,93,7,243,93,7,
+    139,118,115,155,127,147,0,120,130,160,72,26,124,35,69,7,
+    105,235,40,12,12,21,9,211,58,66,65,102,162,208,209,245,
+    87,175,252,215,87,86,95,125,247,252,189,243,25,248,22,89,
+    44,108,194,234,164,12,54,17,60,33,85,121,245,192,215,95,
+    127,93,183,140,5,226,41,7,20,108,34,120,66,170,242,234,
+    1,138,173,78,246,87,126,226,111,43,180,118,20,186,251,10,
+    61,3,133,206,174,66,235,254,53,123,182,117,63,92,192,182,
+    191,25,216,246,55,63,65,128,13,252,192,182,191,101,195,219,
+    118,119,242,145,55,180,238,13,21,2,237,153,31,254,230,141,
+    79,247,228,246,79,228,247,79,20,89,226,219,181,73,12,62,
+    144,20,128,34,5,77,216,142,148,1,82,236,127,66,170,242,
+    234,129,18,197,91,202,188,196,233,89,62,249,245,70,83,160,
+    72,154,172,122,96,35,46,247,157,155,153,182,108,83,31,92,
+    171,210,90,248,254,76,118,104,12,174,117,10,31,72,234,93,
+    187,10,174,150,204,158,159,59,86,44,5,79,91,38,182,238,
+    25,206,122,134,55,218,250,138,6,67,107,255,106,11,16,223,
+    218,79,193,227,246,142,123,207,23,77,229,199,77,214,216,14,
+    28,0,40,18,163,207,255,149,141,184,125,119,109,153,99,153,
+    133,119,79,127,50,120,63,244,208,253,240,88,110,248,72,126,
+    248,72,174,253,72,206,245,82,222,245,82,150,94,143,253,45,
+    43,150,162,137,184,143,50,217,114,30,92,192,233,215,160,194,
+    174,254,186,12,45,100,250,222,121,107,249,173,167,208,58,160,
+    210,58,64,1,210,122,0,105,85,31,255,189,104,109,43,18,
+    179,181,177,2,54,154,219,139,6,214,221,155,121,179,72,224,
+    70,193,99,111,103,209,84,126,160,96,147,53,121,26,159,16,
+    0,69,98,114,54,82,100,14,226,106,47,18,11,226,41,3,
+    138,204,232,14,174,50,64,180,59,88,1,155,172,25,219,155,
+    177,189,89,109,95,100,161,1,220,55,231,233,116,37,253,55,
+    152,199,254,236,68,235,203,132,252,109,215,129,9,47,251,119,
+    190,246,241,195,166,191,219,227,192,244,97,227,4,99,253,140,
+    97,33,253,153,145,193,180,137,166,27,28,80,255,51,175,113,
+    34,96,249,44,192,98,186,157,193,116,71,59,166,15,236,62,
+    185,143,253,237,16,214,249,237,62,227,201,3,150,223,30,192,
+    58,191,29,99,48,125,8,211,127,79,108,103,94,100,255,222,
+    118,108,223,41,3,251,15,6,39,60,252,67,211,49,238,244,
+    115,236,63,62,135,15,191,99,252,103,90,216,223,181,208,116,
+    191,231,204,1,246,119,7,76,144,6,67,144,174,238,146,226,
+    192,201,122,26,214,44,9,214,156,136,230,12,193,7,230,100,
+    53,192,212,79,48,192,164,15,44,161,75,125,159,169,118,159,
+    46,145,160,33,220,198,150,92,16,140,185,129,251,1,171,127,
+    248,102,56,26,163,118,142,182,34,132,184,139,212,49,64,255,
+    132,143,210,213,46,44,46,114,11,179,130,168,218,33,55,132,
+    69,106,177,207,170,150,112,148,47,187,4,26,10,14,22,78,
+    154,115,19,215,68,172,28,230,48,220,166,86,12,203,90,205,
+    33,137,43,49,39,85,27,253,37,1,140,113,199,180,134,165,
+    44,52,189,96,221,68,122,18,180,12,173,30,29,241,167,102,
+    184,43,87,38,193,81,186,114,101,164,174,165,142,108,151,113,
+    81,63,11,12,36,64,8,6,83,185,29,119,117,177,236,21,
+    84,83,165,31,13,213,21,193,156,50,11,72,217,194,108,52,
+    50,75,187,168,8,67,154,165,150,233,213,167,56,14,145,100,
+    28,140,151,40,142,3,90,104,213,92,104,165,81,48,190,22,
+    85,39,163,132,123,123,140,32,115,52,10,193,220,146,162,176,
+    182,131,233,135,99,82,77,88,153,251,178,35,88,98,54,20,
+    194,166,194,216,152,77,67,79,45,82,205,59,133,52,85,6,
+    48,138,184,152,112,45,28,89,4,20,97,9,7,145,10,229,
+    202,149,234,216,234,149,43,26,162,138,135,139,22,175,24,189,
+    22,77,0,77,139,37,199,143,162,5,230,19,80,4,68,171,
+    62,109,60,28,5,35,22,252,221,133,176,200,87,56,174,136,
+    12,157,1,61,121,148,173,8,178,42,83,98,212,193,158,174,
+    165,73,107,80,98,251,87,6,241,85,52,192,94,83,125,30,
+    95,221,102,226,15,208,34,50,80,43,75,188,132,213,93,101,
+    240,16,75,48,198,117,155,124,53,76,28,61,107,45,15,83,
+    89,251,217,156,253,108,222,126,54,107,60,251,71,124,15,47,
+    159,84,156,90,52,154,26,190,22,57,57,13,140,204,42,166,
+    249,196,82,116,14,111,114,88,84,124,154,151,135,193,232,120,
+    84,138,135,229,200,172,226,210,26,151,148,78,49,189,57,31,
+    21,228,136,181,242,254,19,91,121,110,24,105,32,228,63,182,
+    212,204,14,204,47,9,207,188,103,224,13,247,217,218,96,39,
+    67,100,93,16,27,230,17,83,202,156,178,220,55,126,8,179,
+    205,199,198,114,126,218,42,27,43,181,174,107,45,86,117,185,
+    250,254,170,3,36,226,31,182,105,93,55,164,189,165,117,167,
+    62,152,45,55,109,95,179,54,204,157,232,144,221,255,186,150,
+    41,91,202,202,155,42,251,26,165,16,89,163,149,240,102,252,
+    214,134,34,121,243,37,146,50,138,167,254,77,124,250,100,93,
+    61,93,160,157,217,18,4,59,32,251,116,53,237,79,169,217,
+    43,87,152,32,188,101,85,39,201,237,41,169,13,111,165,152,
+    180,157,111,72,59,120,107,202,122,147,136,111,203,157,186,182,
+    86,222,90,233,66,238,170,148,84,203,72,236,73,25,146,157,
+    213,181,235,135,244,171,55,13,120,155,42,251,180,35,241,202,
+    83,250,237,221,182,95,59,244,107,169,174,13,184,170,229,98,
+    223,70,46,228,91,228,194,38,237,188,3,101,66,123,112,232,
+    122,112,242,78,12,236,139,166,148,61,213,72,131,170,118,190,
+    49,221,148,114,208,156,38,53,71,31,100,135,246,77,149,246,
+    53,250,232,74,185,196,197,148,171,254,219,86,45,47,201,83,
+    197,25,180,132,119,223,189,53,100,41,15,233,106,53,111,199,
+    127,213,150,199,83,40,172,232,122,202,94,29,188,175,213,200,
+    42,205,213,210,41,23,180,171,13,239,159,76,53,72,254,42,
+    58,61,41,2,220,120,83,118,128,190,218,48,46,83,67,97,
+    218,45,143,234,168,119,167,236,247,253,181,125,64,15,158,170,
+    30,90,104,15,129,90,121,65,77,135,248,217,22,122,90,105,
+    237,54,74,79,123,29,122,236,188,89,222,165,163,161,102,35,
+    199,78,254,76,183,139,155,110,214,111,138,92,215,10,0,75,
+    199,150,45,42,143,188,79,135,183,153,239,220,82,195,91,37,
+    105,109,75,34,229,73,121,183,206,94,245,230,180,109,183,87,
+    190,83,237,109,230,52,251,22,89,53,167,237,91,70,163,107,
+    219,209,112,138,63,221,50,26,221,186,209,224,158,97,52,26,
+    159,58,26,62,125,232,95,63,26,213,173,112,44,248,158,183,
+    201,59,45,176,54,12,240,13,124,223,61,102,185,101,134,225,
+    251,223,182,167,253,6,146,242,131,196,125,255,54,137,63,171,
+    12,183,95,155,182,27,73,240,17,6,195,135,27,74,62,194,
+    249,171,50,24,94,104,185,83,27,87,139,181,162,25,89,178,
+    214,162,52,14,26,230,164,57,33,18,157,137,66,78,57,202,
+    79,13,216,178,131,80,41,214,144,160,71,16,3,155,145,95,
+    228,192,27,144,117,251,3,35,96,123,114,97,205,206,148,195,
+    55,132,68,181,17,94,101,62,169,86,184,134,87,221,69,72,
+    82,210,107,247,17,74,118,86,205,118,68,52,81,217,205,144,
+    22,37,89,136,87,135,150,203,91,19,117,45,237,210,118,133,
+    186,119,3,24,144,162,138,185,15,184,35,177,121,190,150,14,
+    106,230,141,169,22,254,101,113,158,90,248,215,32,107,78,39,
+    32,157,103,146,40,21,205,137,209,36,181,136,165,240,77,112,
+    121,234,208,3,101,87,174,148,184,188,114,37,164,161,223,214,
+    157,161,150,102,13,37,144,3,226,159,197,64,105,69,8,21,
+    98,230,192,14,215,17,83,135,10,149,188,239,78,76,93,123,
+    151,18,23,174,26,141,57,120,192,200,55,141,100,135,113,0,
+    35,73,81,20,34,242,246,190,144,246,153,13,75,179,220,14,
+    33,116,45,52,130,77,147,243,50,79,119,214,202,14,92,141,
+    31,251,12,24,43,4,5,71,128,71,253,97,19,224,149,202,
+    141,23,98,130,44,80,31,229,25,16,162,98,198,170,223,54,
+    81,24,173,236,229,201,234,118,30,246,139,98,3,204,226,179,
+    145,89,30,128,103,24,138,90,31,67,125,101,182,17,82,237,
+    59,7,35,246,116,130,42,126,45,125,239,113,151,77,222,22,
+    121,197,203,123,58,82,170,13,216,114,33,41,222,64,253,227,
+    163,168,19,73,113,113,72,170,118,210,203,186,92,153,36,158,
+    137,218,109,133,245,140,145,10,181,59,250,102,232,248,219,86,
+    90,21,33,253,187,134,43,190,141,188,237,101,115,92,235,83,
+    29,71,221,0,210,78,212,221,40,36,20,149,79,37,248,242,
+    83,95,129,82,53,156,91,226,97,49,26,91,164,241,5,212,
+    14,196,52,55,47,206,37,37,161,38,76,68,125,223,154,25,
+    12,214,15,120,177,231,230,101,77,92,128,49,129,175,57,48,
+    140,164,98,76,36,9,211,253,142,171,208,77,221,153,84,40,
+    111,8,73,65,20,243,201,112,76,170,47,103,49,28,5,154,
+    56,109,3,9,180,32,81,105,173,70,201,68,120,119,241,165,
+    13,107,123,221,229,165,175,60,149,133,183,157,187,116,83,40,
+    119,21,56,130,215,159,79,10,106,104,103,54,124,83,40,241,
+    67,231,63,14,38,78,78,154,143,135,128,134,237,240,85,72,
+    163,178,1,190,232,203,91,38,82,13,249,149,94,28,221,220,
+    182,29,58,88,187,245,147,60,173,182,100,10,193,28,118,35,
+    250,54,75,195,40,22,220,81,131,241,8,178,226,21,176,64,
+    42,33,22,197,12,244,2,185,147,75,199,47,211,104,146,102,
+    16,168,114,170,8,135,27,250,73,122,168,196,190,68,185,212,
+    194,138,209,4,36,163,124,232,164,98,141,74,211,234,74,169,
+    24,101,208,132,165,132,222,48,8,209,29,98,64,39,170,90,
+    69,49,226,166,107,184,132,139,170,26,52,24,210,208,12,1,
+    25,2,172,227,106,68,15,195,105,2,204,49,130,136,246,142,
+    140,122,195,37,49,125,53,9,170,20,78,132,148,70,104,9,
+    139,231,116,88,132,213,243,166,176,100,12,193,211,18,27,186,
+    182,68,247,255,150,58,79,104,251,211,51,209,68,233,224,3,
+    48,135,178,227,134,190,97,134,150,246,94,44,207,122,148,188,
+    168,84,122,137,34,201,57,52,158,102,196,100,92,45,193,205,
+    103,184,135,66,161,37,91,165,205,82,112,136,70,213,104,15,
+    201,249,132,106,141,197,98,139,33,78,191,245,79,119,174,141,
+    216,56,104,168,236,76,46,117,159,132,215,95,154,133,126,120,
+    93,101,177,130,221,48,20,90,10,140,11,56,33,227,81,203,
+    154,82,227,16,183,99,104,201,52,20,4,188,138,65,188,42,
+    226,17,176,165,158,10,210,237,26,118,188,74,109,138,242,204,
+    83,53,249,99,167,193,45,81,111,60,130,247,199,207,9,141,
+    122,235,138,42,199,41,87,245,45,42,22,126,173,31,109,248,
+    78,173,107,162,34,105,118,155,214,44,169,243,73,25,82,236,
+    53,195,214,67,158,41,131,26,207,0,203,155,153,12,26,197,
+    29,4,55,165,105,52,208,18,190,42,209,132,3,4,23,79,
+    38,64,118,51,209,91,65,147,98,213,94,80,197,12,26,6,
+    22,135,226,132,186,211,149,108,27,62,150,138,204,106,59,9,
+    157,6,250,202,210,160,165,226,1,101,197,37,51,154,168,180,
+    91,10,234,173,151,208,139,84,123,164,35,161,58,85,111,3,
+    23,210,57,130,161,206,141,254,193,15,94,254,232,252,251,231,
+    31,156,202,245,31,201,247,31,89,57,183,209,211,247,65,203,
+    71,221,239,119,63,240,231,122,94,200,247,188,176,114,250,139,
+    206,238,123,223,127,212,185,103,189,115,207,131,195,159,14,103,
+    247,158,203,117,78,230,59,39,87,78,62,110,239,89,125,99,
+    189,125,111,214,187,87,156,2,140,223,48,161,95,49,138,51,
+    49,31,23,196,104,100,26,116,81,16,181,147,181,40,60,228,
+    132,170,192,255,1,240,23,204,47,96,96,87,235,201,188,38,
+    20,50,78,222,56,158,54,202,186,193,189,174,165,183,25,52,
+    38,101,188,174,5,89,170,29,169,180,201,64,126,106,134,26,
+    166,234,124,169,73,182,87,48,240,76,109,160,229,206,9,160,
+    214,188,77,111,160,36,247,13,91,78,59,162,114,176,147,75,
+    253,199,212,67,3,240,46,225,249,105,238,178,24,198,37,23,
+    108,69,240,96,46,131,209,142,231,161,197,121,104,19,180,40,
+    54,24,201,184,128,7,164,36,170,83,34,158,95,84,140,215,
+    147,209,132,98,68,39,69,124,9,51,108,194,45,89,4,95,
+    11,38,9,104,196,130,202,168,21,45,229,182,55,9,157,167,
+    233,147,98,87,239,116,178,23,37,100,22,207,80,168,11,193,
+    109,85,173,28,82,120,70,152,46,97,93,234,173,175,79,250,
+    58,203,168,72,111,67,211,175,111,147,162,153,244,13,126,20,
+    122,63,148,235,221,155,239,221,91,36,38,95,23,5,25,243,
+    198,224,142,15,174,125,20,123,63,246,224,185,135,254,255,217,
+    158,27,156,200,15,78,100,236,133,238,189,217,238,189,144,215,
+    158,235,158,200,119,79,20,9,219,218,181,209,187,179,192,157,
+    220,100,13,125,93,79,8,128,34,49,116,118,21,89,40,41,
+    218,136,47,240,139,201,63,159,92,125,110,173,229,83,231,202,
+    100,206,59,153,247,78,102,203,23,213,63,152,20,241,205,158,
+    12,118,136,56,146,34,198,137,117,50,52,11,183,112,239,76,
+    49,71,37,156,192,69,60,111,33,226,112,137,110,90,44,10,
+    241,228,77,65,49,75,179,243,114,52,6,207,113,89,20,74,
+    226,54,227,33,146,176,172,216,162,18,61,124,147,136,8,10,
+    11,107,137,98,138,37,23,64,192,70,92,75,20,55,61,121,
+    62,61,47,70,167,181,157,1,106,192,136,13,68,61,178,50,
+    183,72,207,102,40,44,56,156,138,17,93,71,241,16,62,219,
+    177,8,27,39,175,94,135,117,55,44,98,58,24,16,127,136,
+    228,253,8,193,27,8,126,140,96,26,193,21,162,95,144,197,
+    48,34,169,236,78,224,146,169,176,176,220,42,78,205,55,227,
+    241,224,141,85,156,79,76,171,155,21,77,152,196,85,175,52,
+    158,138,179,244,32,36,232,230,132,19,42,233,31,53,214,168,
+    18,225,234,163,52,80,76,120,170,158,153,81,152,164,98,85,
+    157,76,200,16,111,35,85,84,211,2,154,166,109,249,28,45,
+    169,158,94,217,196,191,132,172,44,54,252,207,102,170,91,95,
+    201,12,177,53,175,124,63,219,220,167,94,107,151,178,214,61,
+    57,235,158,188,117,79,145,156,49,152,6,84,184,17,24,45,
+    56,90,11,157,163,5,111,123,161,117,160,104,53,181,218,54,
+    9,128,39,8,150,157,95,53,18,71,227,157,3,63,59,242,
+    206,145,204,80,206,222,155,183,247,22,137,199,218,188,209,228,
+    190,179,240,179,183,222,121,43,115,45,215,52,152,111,26,4,
+    85,116,142,110,248,187,222,147,87,95,126,55,125,47,157,243,
+    143,230,253,163,43,236,10,251,133,191,243,61,126,245,192,187,
+    241,123,241,156,127,36,239,31,89,97,31,55,53,175,196,87,
+    95,129,10,235,77,163,217,166,81,120,19,220,45,197,190,10,
+    89,42,220,164,240,9,169,205,47,193,126,210,60,84,36,86,
+    103,243,134,199,119,247,192,47,142,252,249,145,213,161,156,103,
+    56,239,25,198,93,246,157,27,94,255,221,83,64,158,119,48,
+    239,29,204,210,235,11,111,219,221,115,80,201,59,156,247,14,
+    103,233,245,133,191,187,104,96,124,187,255,176,251,249,255,110,
+    126,176,240,215,77,191,110,218,52,177,45,205,79,8,0,196,
+    211,12,111,81,43,183,236,44,58,136,175,109,217,90,176,251,
+    51,163,89,251,16,92,27,77,173,153,209,53,123,190,237,185,
+    223,68,114,77,99,249,166,177,34,113,56,155,31,123,91,179,
+    222,211,153,248,218,153,124,215,11,143,186,142,172,119,29,201,
+    117,29,205,119,29,253,244,228,122,215,233,34,75,220,109,43,
+    214,175,204,164,185,35,115,110,109,103,190,227,249,191,49,230,
+    220,135,243,238,195,69,210,224,108,46,116,244,100,59,142,174,
+    198,31,156,201,15,30,93,177,174,88,75,4,94,96,254,112,
+    225,181,245,11,175,21,2,3,240,170,127,143,193,147,37,0,
+    55,77,38,164,213,132,180,154,128,86,23,113,66,202,224,220,
+    93,112,113,171,231,178,174,61,69,22,30,30,187,58,179,93,
+    161,188,107,87,209,66,172,1,224,164,181,123,217,89,176,183,
+    21,9,99,221,9,227,159,121,35,231,24,94,62,247,56,208,
+    137,217,222,154,236,47,2,193,181,209,135,38,60,28,17,120,
+    41,31,120,9,235,4,138,164,205,122,134,41,120,184,71,158,
+    161,117,15,200,61,152,247,4,81,9,154,55,252,221,5,239,
+    248,131,115,89,239,184,122,1,189,72,163,1,105,52,184,155,
+    129,117,96,211,53,254,200,117,102,221,117,166,224,237,217,240,
+    118,100,222,88,219,159,239,220,147,243,238,205,227,117,0,114,
+    55,45,70,55,180,2,176,201,154,157,120,220,193,169,30,119,
+    0,149,116,122,238,156,201,56,87,211,57,199,254,188,99,127,
+    150,94,160,67,222,214,34,49,2,1,46,31,74,236,208,106,
+    39,48,226,59,68,65,97,232,185,34,91,126,160,96,147,101,
+    17,63,14,48,5,14,226,225,86,77,249,230,193,229,19,95,
+    56,124,153,190,181,195,89,199,193,156,227,96,222,113,16,18,
+    5,15,112,204,56,207,48,128,60,235,63,245,208,9,64,189,
+    114,174,211,121,215,233,172,235,244,99,20,156,211,122,142,161,
+    117,43,116,132,214,210,216,97,136,130,66,235,32,210,17,170,
+    228,212,210,209,64,2,3,217,129,177,79,216,181,115,185,29,
+    99,249,29,244,144,206,192,88,190,229,208,242,43,27,110,223,
+    221,214,204,225,181,254,156,123,87,222,189,11,7,122,244,193,
+    158,13,95,107,102,199,234,120,206,23,204,251,96,8,24,247,
+    232,218,247,54,188,109,160,245,171,111,174,245,228,188,35,121,
+    239,72,214,59,2,253,186,71,105,49,5,155,8,158,144,170,
+    188,122,128,30,64,170,83,6,122,53,74,9,160,96,19,193,
+    19,82,149,87,15,80,108,91,179,81,39,154,238,156,90,137,
+    231,28,253,121,71,127,214,209,95,232,232,95,62,87,146,250,
+    57,85,234,103,30,142,2,80,175,156,235,108,222,117,54,235,
+    58,251,24,181,184,203,58,80,35,244,157,15,14,163,116,119,
+    82,80,18,250,206,74,206,86,161,183,14,102,7,15,125,226,
+    89,123,35,23,60,148,15,30,202,238,56,4,207,249,192,139,
+    203,167,54,220,129,187,29,153,120,206,61,146,199,227,98,126,
+    231,206,7,76,209,104,118,239,3,109,44,131,102,50,178,187,
+    200,218,220,231,153,194,241,151,213,68,145,60,3,12,16,119,
+    231,138,35,243,189,85,107,206,53,156,119,13,103,93,195,197,
+    81,232,129,118,67,193,38,130,39,164,42,175,30,160,130,221,
+    154,253,85,168,86,176,197,239,27,191,227,60,187,13,164,61,
+    126,123,53,233,63,192,178,244,95,142,7,46,88,217,255,125,
+    232,149,231,225,246,187,61,238,179,135,76,159,27,252,103,251,
+    45,159,7,28,152,238,55,158,221,97,255,124,7,139,233,157,
+    12,166,71,104,122,151,3,234,127,126,200,120,246,37,235,231,
+    47,177,144,254,39,3,3,233,127,98,143,61,7,15,255,124,
+    160,237,124,167,233,247,110,172,244,251,78,227,249,30,235,239,
+    123,176,210,239,251,25,76,15,180,64,58,107,53,94,112,90,
+    178,46,6,32,254,177,45,26,209,29,13,32,104,97,168,7,
+    7,152,173,135,138,106,54,249,42,255,94,99,74,27,226,63,
+    121,106,253,202,127,163,74,78,143,20,120,198,250,108,9,127,
+    223,83,235,107,54,115,154,145,117,135,33,106,29,183,75,164,
+    202,66,55,210,109,34,211,179,81,2,53,205,117,254,47,98,
+    1,11,189,33,124,156,41,109,156,168,59,31,220,171,23,79,
+    97,60,139,158,147,162,198,57,39,69,102,133,184,64,227,207,
+    24,43,70,91,104,108,215,46,60,224,187,75,13,160,4,177,
+    174,26,187,9,171,86,62,88,114,24,217,41,71,39,212,224,
+    48,141,24,68,37,237,216,206,8,151,196,192,196,66,84,18,
+    180,152,224,246,71,121,206,39,48,178,6,125,75,106,68,129,
+    226,68,34,184,176,40,112,115,130,24,143,130,167,193,135,182,
+    139,100,105,125,213,254,69,36,58,166,237,131,80,230,229,36,
+    70,218,192,73,169,68,203,212,115,101,106,61,202,69,41,34,
+    167,254,13,6,235,40,70,76,43,68,177,106,116,45,217,78,
+    150,81,14,45,53,15,105,219,73,18,71,169,30,90,234,30,
+    10,169,92,85,88,193,208,149,198,201,100,208,172,218,206,102,
+    117,4,20,115,66,144,161,46,181,232,85,227,29,237,115,176,
+    252,255,10,107,217,40,26,106,161,86,29,244,249,79,101,128,
+    255,127,144,176,42,216,149,29,164,193,181,194,254,73,250,237,
+    116,222,210,158,185,185,110,25,200,90,6,54,236,158,149,19,
+    63,61,124,231,112,222,222,189,186,119,221,62,144,181,15,124,
+    18,120,208,247,171,206,251,157,249,224,225,79,219,215,131,103,
+    179,193,179,27,173,61,171,125,239,118,222,235,204,183,238,92,
+    62,189,225,105,201,216,114,158,190,188,167,47,235,232,219,104,
+    108,129,121,219,185,51,227,193,25,127,39,5,191,105,120,232,
+    249,107,231,175,157,249,221,227,149,76,10,96,254,110,2,19,
+    21,0,204,223,86,27,204,223,14,215,242,115,170,63,195,136,
+    30,202,220,228,100,112,72,252,25,41,123,51,199,17,160,231,
+    37,254,28,193,81,228,220,161,158,181,15,209,63,220,138,207,
+    99,86,99,41,75,59,125,143,98,129,12,42,54,197,44,47,
+    226,127,91,68,244,146,69,116,204,69,179,30,15,253,111,3,
+    61,105,175,202,159,157,142,239,23,173,42,90,240,142,164,16,
+    142,53,6,11,169,171,165,52,171,153,218,159,121,175,130,63,
+    74,207,234,211,3,254,102,53,8,174,58,100,244,208,213,235,
+    152,109,197,237,34,218,144,122,96,170,67,182,140,32,132,128,
+    58,74,118,140,72,191,166,6,168,197,119,48,251,47,203,99,
+    249,43,66,165,68,71,248,155,134,23,213,191,83,28,17,255,
+    7,81,131,13,82,14,52,0,22,75,134,41,62,79,24,199,
+    109,59,126,11,196,122,155,126,11,196,121,155,126,117,137,198,
+    219,244,91,32,246,114,101,79,182,124,21,136,47,91,190,10,
+    36,144,173,190,138,6,35,99,128,69,251,59,0,27,97,250,
+    178,164,87,127,21,72,79,182,250,122,76,188,217,234,235,49,
+    25,200,86,95,69,3,139,56,191,29,52,16,102,56,75,130,
+    250,171,64,14,101,171,175,103,198,102,99,25,99,209,49,207,
+    48,96,202,34,92,217,167,222,87,47,169,247,135,172,122,255,
+    116,92,189,215,129,160,136,39,152,151,153,34,235,99,206,129,
+    25,129,176,224,244,173,240,119,126,172,102,21,246,142,61,220,
+    247,235,81,245,225,177,201,186,220,183,44,175,156,184,179,184,
+    28,202,155,90,139,166,74,171,42,248,60,241,180,20,154,253,
+    133,222,193,194,224,112,161,171,23,18,249,222,189,133,230,150,
+    162,103,130,101,96,41,71,88,240,248,139,44,38,30,59,93,
+    69,19,205,55,195,139,87,180,208,36,190,131,69,43,77,218,
+    72,7,87,180,211,164,131,180,116,103,164,187,241,162,147,62,
+    54,146,70,63,165,181,137,62,186,136,167,61,179,239,238,104,
+    209,77,31,155,17,133,218,161,151,152,109,69,95,165,239,42,
+    120,193,236,103,92,25,144,29,220,86,95,88,27,255,224,8,
+    77,110,11,168,202,255,63,249,190,147,232,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/resources/downloader.py",
+    "gem5.resources.downloader",
+    embedded_module_data,
+    7643,
+    16748);
+
+} // anonymous namespace
+} // namespace gem5
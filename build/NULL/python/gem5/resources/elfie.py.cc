@@ -0,0 +1,107 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,85,205,111,19,71,20,159,253,240,183,129,4,28,
+    8,45,65,67,11,9,86,193,70,169,64,212,165,149,16,244,
+    11,133,40,106,162,74,181,212,174,54,59,99,103,195,126,184,
+    179,179,32,162,32,245,192,129,3,199,74,229,80,85,57,33,
+    16,151,30,251,103,56,145,165,68,43,85,66,234,169,55,87,
+    233,137,83,223,204,174,55,198,113,213,241,250,205,215,155,55,
+    239,227,247,222,252,137,134,154,158,244,251,183,129,252,140,8,
+    34,138,131,92,165,169,40,98,172,58,170,171,53,53,57,214,
+    28,221,205,52,51,10,82,209,23,136,232,143,17,201,60,87,
+    17,122,165,14,68,53,179,36,187,140,170,185,191,196,164,170,
+    68,250,130,29,112,232,167,150,172,91,126,232,241,21,102,90,
+    247,40,187,107,122,102,155,50,216,40,37,27,75,166,205,172,
+    177,74,125,35,149,162,168,169,16,212,84,137,210,212,136,74,
+    117,162,81,189,165,131,10,122,51,83,64,241,143,148,73,1,
+    230,89,146,163,57,170,159,78,69,181,84,82,132,245,60,172,
+    23,96,92,130,113,145,228,65,205,35,81,225,179,133,207,109,
+    250,149,215,242,55,252,101,238,51,26,96,27,38,204,53,185,
+    237,123,152,251,216,241,77,82,103,161,135,37,103,80,43,22,
+    49,180,101,74,241,26,231,157,160,81,175,183,109,190,22,174,
+    214,44,223,173,219,30,167,78,189,99,123,171,166,227,204,83,
+    167,133,65,22,118,65,238,176,216,154,20,17,101,2,110,50,
+    30,105,212,35,150,54,100,185,112,166,152,239,63,150,150,111,
+    42,155,200,72,55,55,85,152,41,131,25,207,28,28,123,14,
+    255,87,7,124,200,208,14,198,91,58,26,211,70,79,172,167,
+    39,140,84,46,65,224,39,101,177,154,141,178,70,172,175,110,
+    128,194,76,8,140,242,134,27,7,50,42,181,41,55,96,27,
+    186,32,202,37,131,170,22,233,1,56,129,229,129,153,21,128,
+    4,226,6,176,253,205,123,1,179,234,157,135,124,205,247,234,
+    109,234,94,173,131,231,253,144,89,52,168,195,1,155,214,58,
+    15,65,186,97,123,54,55,140,141,227,105,148,106,131,181,57,
+    33,237,35,32,63,162,189,147,239,62,209,159,150,246,42,167,
+    160,43,252,49,125,121,123,186,222,155,174,195,228,200,30,62,
+    191,139,175,236,224,43,219,120,190,135,231,197,82,47,63,211,
+    149,223,190,48,47,42,116,152,15,183,6,62,139,38,111,174,
+    6,28,240,201,151,210,165,44,163,60,100,222,162,149,2,28,
+    90,118,16,159,23,73,124,182,198,57,119,196,187,183,209,119,
+    55,30,169,155,234,150,50,142,23,34,164,142,91,31,141,208,
+    150,246,255,92,111,39,164,130,158,126,66,20,136,161,106,234,
+    112,181,68,158,104,55,113,43,244,44,9,114,59,192,97,64,
+    137,0,123,0,230,118,176,137,151,110,97,30,103,42,224,22,
+    3,150,49,95,163,216,146,249,97,122,36,149,98,249,158,71,
+    45,158,114,12,14,129,40,49,29,18,147,0,69,236,116,40,
+    19,169,144,10,113,67,135,67,10,49,106,146,244,132,237,181,
+    147,76,19,173,209,49,153,233,226,52,84,13,188,2,210,211,
+    105,172,62,40,42,238,12,108,144,23,103,47,104,215,178,219,
+    33,27,74,58,209,22,171,122,84,16,120,149,246,68,21,147,
+    16,163,99,25,137,166,6,136,93,165,236,168,0,135,68,117,
+    162,121,85,99,19,2,198,21,177,161,203,163,9,152,217,164,
+    88,58,38,125,103,164,74,109,156,62,0,237,200,214,101,129,
+    221,239,37,118,251,39,209,212,217,221,202,220,78,101,110,187,
+    82,237,85,170,125,164,20,22,149,152,62,185,189,87,158,216,
+    45,95,216,41,95,216,34,187,179,215,118,102,175,109,207,94,
+    239,205,94,255,253,252,110,227,206,78,227,206,118,99,161,215,
+    88,216,46,223,237,149,239,118,229,215,215,14,142,179,19,112,
+    133,53,140,183,180,178,156,141,145,139,214,135,176,181,158,114,
+    182,85,145,243,27,191,126,45,193,31,36,177,119,59,14,229,
+    20,59,80,208,177,223,194,73,142,227,161,250,29,212,32,46,
+    38,7,64,93,18,103,82,135,15,179,96,106,90,107,152,209,
+    182,8,144,44,40,1,126,0,209,199,38,244,20,96,100,198,
+    247,49,234,208,251,166,199,241,3,147,185,97,39,149,37,42,
+    44,187,111,58,65,173,170,178,146,8,72,25,200,75,69,6,
+    39,16,38,196,241,144,1,220,152,58,136,193,80,129,250,88,
+    176,158,136,253,159,71,147,83,63,149,158,173,252,242,109,247,
+    216,92,55,63,119,216,105,202,192,105,19,135,156,38,221,244,
+    229,176,155,198,62,115,242,17,224,107,144,103,82,29,76,76,
+    110,166,6,65,201,9,45,16,64,107,85,133,29,17,154,159,
+    29,177,228,157,49,150,36,160,188,41,88,203,177,37,89,52,
+    81,121,250,168,155,63,35,77,168,234,18,169,108,74,144,147,
+    64,22,171,37,81,81,61,211,165,134,17,21,13,195,245,73,
+    232,136,113,217,48,126,8,77,39,217,201,25,6,241,45,195,
+    96,226,9,96,199,5,57,35,136,54,112,170,44,253,82,169,
+    151,72,94,21,107,153,27,144,115,66,167,23,82,167,193,175,
+    175,106,153,124,31,9,82,212,51,31,62,187,215,71,208,253,
+    86,146,221,40,41,151,51,139,202,235,19,179,253,140,24,128,
+    89,197,163,253,156,28,162,67,244,140,158,185,248,108,101,235,
+    131,222,76,77,28,190,56,74,202,90,102,166,59,51,47,174,
+    158,249,79,18,27,145,147,62,202,69,89,254,16,222,239,182,
+    180,55,42,186,87,107,254,234,58,148,184,32,126,241,10,176,
+    32,139,81,16,251,71,90,125,94,144,212,19,111,242,55,98,
+    215,126,202,46,38,240,9,124,32,144,154,138,210,191,134,148,
+    233,46,58,53,252,189,70,151,186,111,127,123,232,92,247,237,
+    175,159,125,95,1,109,15,147,191,5,249,103,204,134,84,232,
+    95,157,95,105,253,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/resources/elfie.py",
+    "gem5.resources.elfie",
+    embedded_module_data,
+    1317,
+    2535);
+
+} // anonymous namespace
+} // namespace gem5
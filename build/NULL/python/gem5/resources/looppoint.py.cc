@@ -0,0 +1,645 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,221,125,127,112,27,215,157,223,46,128,5,22,224,146,
+    32,9,144,4,72,130,132,248,83,16,73,80,18,37,75,214,
+    79,83,164,36,74,166,40,157,101,199,99,166,14,4,97,87,
+    34,100,16,160,23,160,100,243,168,171,239,38,109,104,159,122,
+    161,60,110,13,187,186,6,78,53,9,157,40,115,108,38,115,
+    167,116,146,86,185,203,76,147,254,133,197,108,75,12,102,52,
+    163,233,213,55,163,78,219,129,106,169,147,186,255,244,125,223,
+    254,192,238,98,65,83,178,51,237,21,132,190,187,216,247,251,
+    125,191,239,251,190,159,239,123,111,245,183,132,230,67,201,215,
+    207,59,73,130,248,144,96,9,150,76,16,179,210,149,156,37,
+    241,213,50,107,65,87,75,194,58,111,155,181,145,16,102,77,
+    80,243,246,89,251,188,99,214,49,79,207,210,243,206,89,39,
+    41,165,113,205,186,208,213,150,168,155,103,102,25,252,140,74,
+    212,207,55,204,54,144,132,133,56,73,176,246,111,19,172,227,
+    7,22,130,248,177,69,169,194,172,27,135,208,40,196,105,8,
+    105,196,33,46,20,82,103,8,105,194,33,12,10,169,55,132,
+    52,227,144,6,20,226,54,132,120,112,72,35,10,105,226,60,
+    63,176,162,48,171,26,230,197,97,205,40,204,83,21,214,194,
+    146,231,137,144,247,33,252,152,9,145,37,219,185,104,102,46,
+    100,43,217,38,227,177,76,201,54,29,79,103,74,244,217,133,
+    76,60,149,140,38,74,212,43,73,116,131,162,181,156,139,77,
+    164,22,147,153,151,249,104,236,13,142,63,19,77,70,47,115,
+    60,10,168,147,3,206,69,227,124,76,203,12,90,97,198,45,
+    2,152,193,17,192,0,212,249,228,172,149,117,179,86,206,198,
+    218,208,63,138,163,56,155,95,77,116,201,142,58,149,154,181,
+    179,14,206,118,201,130,186,209,54,235,144,239,157,232,158,70,
+    247,250,248,22,212,161,182,89,39,122,238,66,247,117,232,190,
+    142,101,56,134,117,176,150,75,54,182,30,253,174,71,97,13,
+    156,27,242,208,165,107,64,97,141,172,5,117,70,99,169,105,
+    58,149,90,88,72,197,147,153,151,184,203,168,193,231,38,162,
+    118,36,66,227,65,54,154,137,6,211,25,126,49,150,89,228,
+    185,224,165,20,143,126,165,248,120,242,114,48,51,199,5,213,
+    100,65,30,167,27,76,7,207,77,4,227,73,20,111,62,10,
+    93,24,118,185,130,232,19,14,7,147,169,12,119,224,128,244,
+    19,62,47,207,197,211,65,244,69,207,81,130,12,151,100,57,
+    54,152,73,5,47,114,193,104,112,49,205,241,35,151,162,49,
+    40,39,150,136,166,211,97,20,159,147,110,185,180,154,135,90,
+    252,233,116,42,57,157,138,178,28,31,140,38,217,202,243,137,
+    243,223,144,31,199,162,73,200,26,101,140,75,73,160,167,106,
+    54,144,132,231,160,93,92,240,124,124,94,106,16,180,60,140,
+    163,204,148,44,11,177,18,117,57,145,186,152,40,209,60,151,
+    64,45,187,202,197,108,26,94,131,88,130,136,125,190,19,243,
+    122,153,92,38,34,106,224,178,5,253,34,213,95,86,244,75,
+    21,99,44,140,150,165,95,171,117,57,176,16,229,163,243,193,
+    133,216,1,220,226,115,124,234,50,252,198,34,134,154,113,53,
+    154,88,228,130,169,75,168,247,81,223,73,157,30,54,38,198,
+    53,149,210,195,109,52,177,181,100,74,203,164,148,202,175,224,
+    130,92,133,152,182,10,225,160,50,68,42,217,204,132,172,37,
+    107,4,117,149,35,34,21,91,114,70,148,92,96,128,165,185,
+    196,37,158,65,141,230,235,129,52,32,146,134,78,132,180,95,
+    12,164,249,216,232,194,219,153,185,84,114,244,50,55,191,119,
+    20,49,36,181,200,199,184,244,104,66,225,102,120,225,237,18,
+    29,137,196,147,241,76,36,178,212,94,37,179,97,37,108,47,
+    100,29,64,228,29,162,204,16,222,214,21,219,13,186,216,214,
+    137,46,76,209,191,13,93,26,86,208,223,231,192,128,146,157,
+    231,144,104,39,99,42,131,208,135,84,216,217,40,177,147,184,
+    162,6,33,118,145,75,61,47,225,52,105,60,6,206,153,246,
+    79,136,228,33,241,167,36,239,129,202,64,142,65,222,139,11,
+    188,204,101,80,47,45,249,170,235,47,133,28,133,4,78,92,
+    251,7,110,207,141,183,86,220,124,43,250,245,84,53,244,107,
+    107,168,21,2,168,88,19,116,191,223,80,45,23,20,46,197,
+    92,234,52,175,154,20,58,1,197,186,212,234,45,231,233,142,
+    167,175,223,107,167,46,5,211,11,92,44,126,41,206,177,195,
+    65,94,83,91,85,240,76,59,118,56,152,66,145,248,107,241,
+    52,167,10,158,146,122,38,149,196,237,107,54,107,31,3,45,
+    80,242,94,234,50,111,161,18,126,18,18,51,146,0,217,137,
+    70,239,141,63,202,211,129,234,86,82,74,43,175,224,86,102,
+    52,97,203,68,78,27,83,253,252,0,253,251,177,54,150,229,
+    203,99,233,103,62,220,127,187,116,18,88,153,129,176,134,198,
+    131,92,106,23,168,99,153,239,86,30,100,138,111,7,210,105,
+    214,67,77,146,248,69,112,127,71,22,80,110,75,189,181,100,
+    84,19,105,26,178,233,195,125,245,153,187,61,187,231,123,7,
+    63,62,248,209,225,91,135,215,250,254,98,244,71,163,194,142,
+    131,226,142,131,130,251,144,232,62,148,167,15,225,62,44,57,
+    230,165,233,51,166,109,188,67,233,204,239,63,107,103,146,230,
+    157,137,82,91,205,158,27,58,25,149,240,99,181,148,37,151,
+    241,9,210,218,170,198,151,181,118,199,43,11,104,150,224,12,
+    98,139,123,38,60,19,162,74,86,212,111,184,171,241,224,146,
+    185,36,49,0,68,244,83,11,214,13,124,15,116,32,212,60,
+    40,51,162,101,17,231,171,74,163,212,217,75,131,213,204,48,
+    141,120,14,242,59,42,49,196,223,89,100,26,191,123,246,189,
+    179,2,19,16,153,64,206,177,17,220,93,8,238,94,223,243,
+    87,7,127,122,240,95,29,254,217,97,33,56,46,6,199,5,
+    102,252,145,213,210,238,122,76,32,162,232,199,106,121,183,42,
+    44,250,128,144,70,117,206,172,95,171,101,124,11,204,99,201,
+    91,150,235,104,218,188,162,178,144,111,219,26,227,150,73,214,
+    114,8,95,17,83,172,95,92,174,140,12,52,10,176,197,128,
+    236,11,100,83,156,62,127,118,70,99,202,92,155,139,199,230,
+    176,89,128,184,135,109,3,100,115,196,163,137,248,18,167,183,
+    12,80,215,34,229,115,145,83,76,4,54,120,137,79,205,135,
+    67,22,60,151,33,117,142,181,34,158,206,66,54,205,240,194,
+    90,168,187,194,231,146,51,147,138,200,170,74,203,109,7,122,
+    124,5,217,47,75,254,106,254,202,65,223,0,142,158,195,28,
+    45,211,132,167,237,195,161,247,135,110,142,124,48,82,108,109,
+    255,48,245,126,74,104,29,20,91,7,203,148,181,197,85,38,
+    16,89,113,162,88,76,227,141,35,101,130,116,238,47,246,109,
+    223,232,219,91,232,219,43,244,237,19,251,246,173,156,90,189,
+    34,48,219,30,184,125,121,218,135,89,252,41,57,19,106,130,
+    137,53,25,157,231,34,145,146,43,18,153,79,177,139,9,184,
+    103,34,145,55,23,163,9,57,196,17,137,176,169,88,36,194,
+    195,112,231,237,64,90,8,157,78,129,246,74,122,102,27,16,
+    176,129,249,65,32,48,118,74,86,212,253,252,8,20,73,224,
+    146,113,7,240,117,10,25,130,102,130,221,249,142,250,87,182,
+    56,40,186,76,0,105,166,169,158,50,129,72,118,12,95,114,
+    105,124,89,159,187,155,254,217,60,190,53,18,175,133,242,101,
+    173,101,2,93,140,132,182,80,157,217,9,184,239,52,18,218,
+    74,117,101,231,114,233,91,40,83,116,107,36,46,11,117,56,
+    119,16,162,30,54,18,218,70,185,242,35,199,202,4,186,222,
+    203,224,139,145,48,46,202,159,245,102,99,185,177,236,220,45,
+    148,35,250,89,147,72,93,4,29,163,195,21,118,249,250,249,
+    31,17,85,184,194,130,16,5,66,22,200,242,183,33,235,158,
+    66,232,2,144,131,29,221,219,229,123,7,70,20,20,71,27,
+    80,4,141,81,4,197,185,184,58,252,143,209,163,5,93,92,
+    39,70,21,46,52,220,234,74,45,6,161,125,53,202,207,47,
+    46,68,201,47,67,15,81,51,236,112,13,39,150,77,239,191,
+    127,192,225,156,1,56,148,168,116,38,202,103,74,86,84,199,
+    152,86,147,169,112,161,135,248,50,184,32,79,53,156,209,88,
+    199,57,75,150,58,190,133,6,107,236,128,42,227,30,85,65,
+    138,141,110,106,198,157,249,212,82,178,71,164,74,219,34,40,
+    230,167,86,105,138,218,7,100,63,12,79,43,214,92,146,234,
+    194,131,191,202,148,146,36,64,181,197,231,161,157,173,146,238,
+    114,17,216,8,175,43,122,219,208,197,185,130,254,36,33,111,
+    35,158,210,126,60,184,185,253,35,119,138,132,120,56,89,192,
+    100,241,10,35,155,252,32,97,98,255,56,193,180,193,233,150,
+    186,205,219,164,70,88,36,116,54,240,31,230,233,246,167,183,
+    129,159,255,178,54,32,6,212,108,193,33,179,22,56,160,130,
+    40,213,82,160,118,253,81,240,219,250,218,191,173,76,4,230,
+    115,253,75,196,215,61,215,95,182,224,246,135,180,237,151,248,
+    5,3,10,90,141,172,86,108,202,4,193,192,76,195,92,59,
+    14,237,61,110,214,232,230,42,139,52,189,180,189,118,251,245,
+    49,175,67,102,221,82,87,52,122,63,108,120,191,65,104,12,
+    138,141,193,92,223,15,135,191,63,252,73,248,118,56,239,222,
+    149,167,119,85,247,143,77,233,159,252,83,244,207,21,141,57,
+    185,165,248,26,71,193,45,203,214,236,33,93,25,91,137,175,
+    43,131,181,220,2,238,88,151,166,159,213,142,82,181,73,197,
+    158,82,141,37,10,119,61,50,136,84,133,130,76,38,204,90,
+    236,23,56,77,212,96,50,54,26,106,73,181,108,36,253,49,
+    36,225,8,69,209,116,124,152,124,63,41,180,14,136,240,13,
+    21,253,129,239,117,125,220,37,248,67,34,124,71,145,177,212,
+    218,128,38,116,68,112,220,196,251,137,155,201,15,146,200,140,
+    130,152,157,31,119,126,212,117,171,75,244,143,160,120,94,136,
+    135,72,157,179,17,77,226,18,113,186,176,64,204,132,26,248,
+    81,168,30,184,125,248,93,64,118,19,138,1,132,45,163,138,
+    216,2,86,228,167,8,217,20,226,199,128,244,41,77,227,247,
+    0,169,152,68,207,41,4,102,254,244,223,16,181,76,34,59,
+    50,112,222,40,19,232,178,94,135,47,70,210,104,161,58,178,
+    216,90,233,48,18,100,2,249,179,248,222,111,36,40,104,119,
+    110,114,173,67,236,219,11,15,118,27,9,205,80,46,108,197,
+    236,89,179,174,157,95,163,111,31,201,119,237,18,253,40,148,
+    1,67,167,6,145,218,167,180,74,253,56,228,235,231,87,137,
+    175,100,207,56,171,236,25,151,147,96,221,44,178,102,88,100,
+    207,176,20,203,92,178,179,245,223,166,144,237,66,113,13,178,
+    7,212,205,50,216,3,234,81,101,11,77,228,139,9,236,188,
+    140,210,102,86,12,50,2,164,25,31,171,45,53,178,162,162,
+    245,138,76,113,181,253,253,51,102,140,94,208,202,144,253,138,
+    166,12,191,21,83,166,26,10,125,153,65,131,83,212,72,50,
+    195,31,128,202,31,38,76,13,152,78,19,214,171,230,203,199,
+    16,237,136,58,58,159,218,80,121,174,106,146,51,109,158,65,
+    200,194,252,11,102,90,112,92,175,5,53,213,85,45,19,112,
+    158,240,199,148,250,62,85,85,247,104,171,170,237,213,77,43,
+    58,105,86,81,208,120,75,29,181,42,138,242,134,41,136,63,
+    97,90,77,213,240,248,152,216,250,196,250,245,57,219,158,194,
+    128,121,81,103,192,233,76,22,131,29,42,171,3,221,144,213,
+    246,106,26,220,115,120,174,216,166,116,95,85,159,194,220,177,
+    52,80,171,79,245,102,205,143,32,45,72,45,118,24,212,55,
+    125,119,230,189,25,129,233,20,153,206,13,38,92,96,194,2,
+    179,83,100,118,130,107,104,250,189,233,119,103,110,204,108,48,
+    195,5,102,88,96,194,34,19,70,115,30,76,114,86,121,146,
+    59,129,29,84,165,250,120,50,150,88,100,57,73,204,102,116,
+    74,64,101,25,148,139,88,102,225,183,127,21,182,45,147,119,
+    72,189,243,141,252,74,204,51,203,143,149,172,156,125,181,93,
+    120,233,138,47,181,74,203,131,5,14,189,50,163,176,109,80,
+    97,91,200,90,113,234,241,96,58,235,20,78,169,205,224,177,
+    75,75,92,75,47,13,153,49,182,70,228,159,66,182,175,40,
+    220,101,208,164,109,115,78,146,85,140,222,93,96,118,223,221,
+    151,103,118,11,204,132,200,76,228,153,137,7,52,243,93,230,
+    61,230,221,134,27,13,27,244,112,129,30,94,127,53,79,15,
+    11,244,97,145,62,156,87,190,155,140,72,105,37,243,255,197,
+    17,9,166,43,204,46,124,8,250,253,69,137,17,152,51,216,
+    188,170,109,83,154,42,41,217,162,252,55,144,0,150,59,112,
+    63,183,182,127,248,173,247,191,37,180,244,139,45,253,27,45,
+    35,133,150,17,161,101,84,108,25,45,122,218,62,60,244,254,
+    161,155,71,62,56,178,225,9,21,60,33,193,51,36,122,134,
+    148,81,164,29,74,33,242,68,168,209,212,98,196,62,48,51,
+    139,17,155,146,216,108,4,95,90,201,118,49,149,74,240,192,
+    123,201,140,52,51,30,207,40,100,21,234,255,223,136,77,140,
+    199,124,215,40,182,19,243,207,157,172,105,62,230,59,134,107,
+    218,143,121,255,14,115,3,210,78,185,84,3,210,14,246,159,
+    158,52,19,199,201,211,100,217,234,162,142,128,171,235,72,177,
+    109,24,255,40,30,30,199,215,7,206,250,50,165,4,106,136,
+    207,14,134,167,105,150,42,145,122,2,218,111,190,28,15,130,
+    163,55,51,145,153,216,40,47,200,131,137,105,231,28,85,11,
+    242,180,102,65,30,22,219,41,217,13,230,66,247,250,248,210,
+    130,124,29,122,206,112,245,186,231,176,56,223,192,50,156,91,
+    179,56,223,136,226,213,203,166,104,19,186,111,70,247,110,116,
+    239,193,250,169,169,228,54,76,192,75,95,212,182,71,141,14,
+    181,191,239,235,240,70,119,218,76,201,85,81,196,37,23,186,
+    203,196,23,18,113,142,47,217,37,191,200,215,185,36,31,237,
+    67,193,85,150,170,90,188,108,174,86,230,5,77,95,87,230,
+    13,104,63,110,133,154,145,201,167,198,106,124,165,121,82,89,
+    149,223,38,249,215,202,68,234,23,41,3,217,185,186,121,69,
+    171,50,50,124,204,87,253,235,34,26,198,212,69,52,156,113,
+    68,164,98,17,204,199,211,226,44,144,111,2,249,7,132,102,
+    249,95,99,141,27,151,197,85,75,92,32,84,87,77,185,157,
+    232,28,88,177,137,180,175,216,209,47,93,219,2,176,186,191,
+    130,254,158,209,80,223,161,51,212,171,96,157,118,44,133,72,
+    254,91,132,137,39,170,1,91,225,106,210,42,207,104,88,31,
+    254,159,160,54,117,132,236,134,19,221,221,121,186,251,233,173,
+    246,54,109,189,43,61,15,149,140,212,172,100,37,158,121,37,
+    43,225,127,7,121,128,34,125,250,154,29,131,53,126,46,163,
+    95,221,151,165,208,164,87,131,103,149,133,253,224,133,11,176,
+    148,127,225,2,52,226,130,89,35,240,102,5,41,171,170,125,
+    32,225,74,216,127,129,180,1,211,202,171,238,187,255,74,124,
+    189,54,13,44,98,110,197,170,225,159,95,38,205,221,115,95,
+    159,85,84,101,68,147,152,49,123,191,20,183,152,169,4,52,
+    132,47,18,138,49,114,153,128,165,79,238,45,152,47,66,242,
+    250,102,131,30,131,104,23,57,37,240,210,99,198,41,125,162,
+    255,142,226,165,161,24,52,38,252,129,13,255,112,193,63,44,
+    248,195,162,63,188,225,31,47,248,199,5,255,132,232,159,88,
+    105,40,214,185,191,123,244,189,163,66,93,167,88,215,9,203,
+    156,167,201,34,211,190,193,108,43,48,219,114,125,63,28,253,
+    254,168,208,51,38,246,140,109,244,156,40,244,156,16,122,166,
+    196,158,41,129,57,37,50,167,242,204,169,162,59,160,108,231,
+    192,118,186,249,54,132,127,70,124,85,193,88,38,51,148,230,
+    215,51,108,67,64,184,69,183,247,67,197,45,123,107,226,22,
+    54,173,238,243,170,102,161,165,130,75,102,20,126,98,99,242,
+    85,133,169,252,0,161,223,141,128,195,171,246,30,212,130,38,
+    79,32,245,180,196,63,154,217,160,59,10,116,135,64,7,68,
+    58,176,65,239,45,208,123,139,222,142,159,236,89,183,253,149,
+    251,167,110,97,231,184,184,115,92,24,58,38,14,29,43,91,
+    9,231,115,143,8,139,19,118,32,56,145,29,167,35,213,163,
+    87,157,220,255,238,41,152,196,15,124,125,163,252,252,215,56,
+    74,183,34,22,213,254,134,88,138,231,185,88,198,116,245,111,
+    51,11,164,50,154,49,187,49,220,192,114,128,61,15,166,30,
+    39,227,198,132,138,183,233,127,67,116,152,201,241,62,41,166,
+    81,63,38,119,1,52,58,250,254,81,193,211,39,122,250,54,
+    60,225,130,39,44,120,118,138,158,157,121,102,103,209,237,217,
+    112,247,20,220,61,130,187,79,116,247,109,184,195,5,119,88,
+    112,239,20,221,59,55,220,199,10,238,99,130,123,82,116,79,
+    230,233,201,77,0,233,255,36,254,111,0,82,101,175,202,86,
+    24,199,135,182,22,111,107,27,156,180,59,93,48,212,253,212,
+    98,48,169,148,81,141,129,33,172,134,72,108,198,91,43,180,
+    163,26,131,223,54,35,99,101,224,107,65,149,73,103,8,25,
+    248,118,116,111,180,143,20,218,71,132,246,81,177,125,116,163,
+    125,95,161,125,159,208,254,188,216,254,124,177,189,75,27,84,
+    181,3,69,47,14,71,138,61,3,90,205,124,176,208,115,80,
+    232,57,44,246,28,94,57,181,58,39,48,221,197,202,158,20,
+    62,12,109,241,154,98,101,128,118,37,234,18,130,14,25,105,
+    15,10,94,45,193,224,249,162,190,213,38,8,90,82,119,88,
+    234,107,2,232,215,20,242,239,160,215,246,212,218,144,210,78,
+    140,237,43,59,221,176,49,4,145,7,222,193,50,5,63,236,
+    68,75,123,217,1,119,52,209,132,16,114,88,108,28,173,68,
+    211,144,30,11,21,204,7,199,0,49,7,141,4,129,235,96,
+    142,170,21,212,153,157,202,247,31,16,59,15,154,111,96,161,
+    168,46,21,124,83,80,154,158,52,192,54,149,209,73,188,33,
+    229,55,94,243,109,42,20,117,156,132,117,35,184,154,208,6,
+    39,108,99,41,19,78,0,252,53,136,212,161,208,141,58,28,
+    238,148,175,159,255,53,105,182,220,195,97,252,173,221,112,194,
+    209,134,237,39,86,140,193,77,98,178,20,107,71,184,218,129,
+    113,57,197,213,201,120,157,129,165,34,20,27,33,245,77,243,
+    197,219,90,156,132,244,199,250,88,6,227,117,63,198,233,110,
+    148,71,99,117,137,85,27,234,155,80,188,10,134,135,114,155,
+    171,75,54,148,219,136,226,122,81,220,22,174,89,247,188,9,
+    61,111,173,81,119,227,102,254,102,20,183,141,245,112,190,43,
+    234,227,92,59,97,242,225,58,174,116,42,247,87,2,106,207,
+    121,245,118,6,202,177,133,115,176,173,28,94,102,227,28,134,
+    242,236,108,219,183,169,217,46,214,142,244,80,123,201,169,106,
+    145,165,231,207,3,120,79,7,163,137,132,122,62,64,178,64,
+    140,176,51,26,132,93,222,193,107,41,254,13,240,1,132,75,
+    14,105,98,74,235,140,49,117,158,151,214,6,245,32,62,163,
+    81,171,70,53,94,129,243,91,220,68,168,89,6,175,218,231,
+    185,92,189,83,30,87,245,64,112,60,200,198,99,24,17,243,
+    111,7,231,163,11,11,202,193,136,11,23,164,56,145,56,155,
+    190,112,33,120,45,158,153,131,231,53,253,0,106,71,73,138,
+    56,173,197,215,84,137,142,200,37,74,78,64,58,34,239,159,
+    45,213,193,76,140,38,98,116,73,151,28,242,141,108,143,243,
+    60,97,208,249,24,95,55,171,220,82,145,117,19,168,123,208,
+    129,120,229,220,31,68,72,186,254,190,111,68,240,141,138,190,
+    81,248,81,12,246,109,4,119,22,130,59,133,224,110,49,184,
+    27,30,33,139,46,79,171,102,116,201,169,54,23,35,239,25,
+    29,23,213,109,210,191,64,228,59,228,135,196,187,164,22,44,
+    94,37,121,143,150,151,44,249,46,249,207,145,161,251,231,86,
+    189,49,252,39,228,10,121,137,68,195,159,214,166,158,52,226,
+    47,203,178,101,146,120,221,117,221,170,141,181,108,61,76,220,
+    168,219,218,244,142,210,169,181,209,200,130,13,201,2,181,244,
+    151,47,35,144,202,5,163,60,246,97,141,196,162,105,36,238,
+    215,240,179,107,128,110,145,168,103,82,193,212,197,76,20,111,
+    150,168,12,0,240,99,85,182,70,168,222,187,88,42,9,81,
+    165,45,113,105,116,73,112,65,137,143,10,70,190,26,143,6,
+    227,153,116,240,212,100,88,114,214,93,90,76,98,153,83,115,
+    187,22,71,195,141,231,230,83,8,2,192,200,139,35,203,48,
+    193,93,141,170,134,127,58,188,84,39,239,7,63,53,25,28,
+    92,106,30,4,63,28,120,252,46,194,174,60,4,26,194,85,
+    224,24,68,232,115,80,21,255,20,49,236,50,234,148,215,105,
+    100,243,144,239,90,22,201,191,176,47,147,55,45,55,156,231,
+    229,153,19,72,200,90,178,132,119,150,172,60,146,128,183,8,
+    117,217,227,29,44,121,95,184,14,37,226,233,76,44,53,191,
+    112,100,105,119,69,0,211,170,244,70,84,249,9,31,74,164,
+    98,209,68,250,72,184,146,166,7,4,180,23,101,244,187,119,
+    136,188,247,180,244,205,158,95,63,127,207,153,223,123,10,125,
+    87,207,75,87,244,149,55,102,80,124,6,203,229,241,183,98,
+    28,246,89,241,160,66,120,216,184,197,95,35,176,157,132,7,
+    201,91,132,186,51,23,250,143,95,38,20,183,212,5,101,205,
+    198,107,86,77,141,223,196,180,25,237,80,229,127,40,85,25,
+    13,42,166,37,59,121,235,76,190,46,132,190,247,155,59,242,
+    157,39,215,66,136,72,95,161,121,74,108,158,202,51,83,15,
+    148,182,161,111,110,242,246,25,116,17,188,167,69,239,233,21,
+    103,209,131,109,168,94,76,86,38,138,141,222,15,234,179,177,
+    124,99,15,250,62,248,178,225,249,84,110,155,105,147,109,105,
+    250,83,111,102,78,2,115,241,6,7,14,238,114,163,3,7,
+    43,46,89,139,45,85,246,144,134,53,143,183,147,134,51,24,
+    215,243,116,231,211,55,71,183,0,47,15,7,125,3,42,59,
+    29,244,21,207,212,172,184,156,141,177,226,242,227,17,168,120,
+    101,123,157,90,237,146,115,129,79,197,184,116,58,197,151,154,
+    198,47,162,178,162,177,204,57,229,145,78,99,218,149,70,173,
+    73,141,34,115,85,58,11,62,122,189,133,180,222,33,208,126,
+    53,156,17,91,212,125,91,114,82,24,156,18,55,14,203,78,
+    115,155,214,105,62,174,106,42,88,95,80,60,254,104,176,44,
+    46,32,93,119,110,34,152,145,164,10,111,43,147,13,134,152,
+    100,62,104,150,202,145,130,76,2,206,85,98,40,137,80,86,
+    178,251,74,121,34,203,13,132,44,112,60,152,27,106,38,216,
+    159,153,153,227,185,40,171,166,64,186,54,236,50,206,236,42,
+    135,36,159,185,250,83,170,126,60,105,244,14,163,218,93,138,
+    95,94,228,229,69,150,202,164,109,147,182,147,226,246,148,188,
+    81,150,5,71,151,92,211,8,202,246,34,39,41,164,63,33,
+    42,107,198,255,8,132,196,134,147,232,22,141,221,184,207,34,
+    106,101,52,128,60,108,8,218,5,178,247,45,44,123,229,86,
+    162,165,107,195,59,88,240,14,10,222,144,232,13,129,234,152,
+    33,37,186,50,89,100,26,55,152,254,2,211,159,99,55,6,
+    158,43,12,60,39,12,236,23,7,246,223,237,219,56,112,186,
+    112,224,180,112,96,90,60,48,45,48,103,68,230,76,30,127,
+    203,214,74,242,77,252,169,255,131,216,58,36,199,32,122,43,
+    62,85,11,178,252,44,87,9,254,244,50,186,171,24,162,48,
+    199,111,73,170,173,149,52,53,125,174,54,179,231,250,124,204,
+    183,17,200,46,185,247,84,238,215,222,83,128,21,143,178,196,
+    181,152,70,226,42,45,168,37,185,107,134,152,250,201,29,78,
+    167,72,103,79,226,176,34,33,79,238,122,149,165,177,25,249,
+    151,9,60,7,150,26,177,12,46,34,123,64,118,176,150,218,
+    52,179,20,118,225,160,185,10,105,220,5,254,219,132,2,142,
+    177,72,74,211,99,137,209,37,110,212,37,132,84,120,170,215,
+    175,226,96,127,225,182,138,132,214,240,20,30,5,73,253,39,
+    132,108,116,250,58,55,218,134,11,109,195,66,91,88,108,11,
+    175,48,197,142,238,141,142,125,133,142,125,66,199,243,98,199,
+    243,121,218,87,172,107,203,119,12,229,235,224,91,244,109,95,
+    235,20,125,207,173,156,194,82,220,89,96,58,5,166,75,100,
+    186,178,111,139,76,104,131,25,47,48,227,69,148,165,111,123,
+    193,183,93,240,237,16,125,59,202,86,162,254,24,249,136,176,
+    212,55,60,6,82,54,16,138,96,134,81,206,155,184,26,147,
+    196,239,81,176,105,189,96,159,87,160,199,70,245,236,21,140,
+    35,41,144,118,133,203,204,1,149,54,161,250,240,33,48,29,
+    191,156,140,95,138,35,35,175,34,72,219,185,240,229,48,146,
+    164,203,241,36,54,55,229,157,229,177,57,46,246,6,230,84,
+    72,115,182,114,24,153,156,234,186,141,178,28,131,52,171,154,
+    91,60,137,144,15,226,235,102,245,144,22,149,53,117,209,42,
+    72,11,15,204,231,255,140,168,232,191,239,2,193,155,22,116,
+    234,175,89,43,196,82,31,104,246,236,133,171,67,167,201,202,
+    190,141,167,22,45,79,111,110,90,244,236,202,51,187,138,110,
+    207,74,102,19,129,152,121,10,129,216,154,79,25,153,43,59,
+    117,38,190,110,233,204,180,151,193,167,15,3,182,212,130,250,
+    97,66,138,161,241,4,87,57,116,161,211,53,75,102,97,163,
+    130,120,21,250,46,72,200,198,203,134,187,187,224,238,22,220,
+    219,68,247,182,13,247,190,130,123,159,224,126,94,116,163,78,
+    123,126,147,211,176,210,202,73,92,26,5,91,232,28,100,184,
+    236,2,195,101,121,139,241,151,53,190,136,173,116,44,248,76,
+    111,236,150,23,191,110,155,110,200,212,116,89,26,3,121,201,
+    88,81,29,237,233,133,148,180,33,82,146,48,85,142,79,77,
+    166,195,234,22,138,104,112,142,75,44,128,125,172,176,15,212,
+    253,155,139,241,216,27,170,115,0,141,58,93,89,154,33,197,
+    43,8,13,31,120,192,250,24,252,148,202,232,0,56,47,193,
+    19,221,22,86,24,64,90,117,91,67,191,127,19,248,122,158,
+    144,199,132,167,101,197,81,244,180,109,120,122,11,158,94,193,
+    211,47,122,250,97,98,63,138,9,66,23,7,143,172,156,92,
+    157,220,240,246,21,188,125,130,119,64,244,14,228,210,162,119,
+    104,195,187,183,224,221,43,120,247,137,222,125,2,179,63,207,
+    236,127,224,110,53,59,40,170,138,194,95,98,81,184,252,52,
+    162,48,14,74,177,166,13,187,133,60,116,226,177,149,227,213,
+    134,57,253,198,49,89,84,254,92,191,222,50,191,144,224,144,
+    194,3,84,138,149,167,132,210,181,220,4,81,136,102,144,40,
+    12,235,156,61,58,134,115,209,216,156,110,175,120,90,242,14,
+    69,209,149,67,83,125,84,181,27,164,73,94,90,201,214,232,
+    221,12,178,28,17,62,134,29,163,88,70,226,132,236,223,86,
+    4,5,224,173,137,160,128,185,105,68,44,178,199,232,18,8,
+    199,235,132,114,190,212,92,56,78,145,18,69,226,193,120,96,
+    159,97,118,207,70,199,80,161,99,72,232,24,17,59,70,214,
+    98,98,199,238,141,142,227,133,142,227,66,199,73,177,227,164,
+    192,76,137,12,160,90,0,182,230,98,162,26,141,207,168,49,
+    126,47,218,2,102,100,157,198,72,232,78,194,128,209,53,82,
+    241,223,68,97,216,107,156,128,248,140,163,124,240,69,130,8,
+    87,227,21,96,44,185,6,83,139,153,133,197,12,94,105,137,
+    92,138,39,96,102,85,52,134,58,242,71,52,12,29,38,100,
+    71,133,158,161,120,9,167,242,230,22,101,241,102,1,152,249,
+    13,66,198,205,45,109,43,206,34,172,164,135,10,254,144,224,
+    31,18,253,67,192,198,23,73,137,34,11,170,119,112,163,119,
+    172,208,59,38,244,238,21,123,247,174,199,197,222,23,54,122,
+    167,10,189,83,66,239,105,177,247,244,202,169,213,184,192,4,
+    243,76,80,179,60,243,16,56,183,212,80,121,51,7,20,92,
+    98,226,73,104,23,50,13,208,108,82,162,161,105,11,209,204,
+    156,110,171,176,138,108,165,173,194,186,83,254,22,214,176,220,
+    189,23,89,248,90,207,224,149,167,245,234,90,151,201,59,22,
+    253,11,128,144,205,110,133,191,170,133,117,235,121,162,151,216,
+    133,172,217,107,150,183,172,175,17,215,72,146,120,13,61,151,
+    66,66,182,165,130,126,203,156,25,182,149,24,43,115,89,199,
+    95,212,71,41,36,40,240,40,8,143,170,145,167,182,239,36,
+    240,41,221,107,223,221,194,105,51,48,164,87,122,91,6,174,
+    232,78,73,35,215,202,36,105,137,188,22,34,75,118,169,32,
+    192,172,182,212,2,151,44,217,48,55,109,236,226,252,130,36,
+    135,178,175,236,35,32,176,43,191,100,131,124,244,118,127,169,
+    209,40,214,90,51,195,24,246,22,8,233,15,177,144,62,105,
+    37,26,154,87,183,103,39,132,250,160,88,31,4,185,28,39,
+    115,147,247,153,198,27,167,86,89,229,100,86,142,93,63,148,
+    103,94,16,152,23,68,230,5,116,3,104,116,156,148,34,75,
+    244,17,166,143,9,227,243,205,233,239,126,247,187,173,68,75,
+    195,59,83,110,238,24,167,173,191,162,109,227,140,227,87,110,
+    18,81,212,49,128,217,249,127,76,200,59,206,192,172,149,174,
+    221,166,75,151,120,201,17,118,152,104,206,127,225,213,70,188,
+    122,249,14,161,44,82,130,69,39,233,129,63,37,20,88,134,
+    151,58,223,39,148,21,77,213,122,150,86,57,175,42,26,161,
+    100,73,165,75,54,224,63,226,35,234,251,146,101,126,111,201,
+    145,194,62,208,116,201,142,24,193,34,179,16,31,19,49,44,
+    123,190,169,144,6,96,78,167,69,187,236,89,180,77,228,109,
+    19,101,155,131,26,203,217,114,175,172,141,173,91,215,246,223,
+    142,172,167,242,253,199,197,224,9,88,16,29,51,146,102,134,
+    26,91,227,214,39,238,122,214,167,238,164,224,8,216,216,189,
+    62,124,49,146,78,43,21,200,7,118,195,1,251,128,145,184,
+    44,84,32,251,114,174,95,62,105,54,186,126,52,223,115,76,
+    12,224,179,251,1,35,161,25,106,134,124,224,25,40,83,112,
+    131,212,159,171,161,236,192,183,68,21,237,172,163,16,246,211,
+    147,118,39,229,205,77,173,189,178,62,118,215,186,190,255,78,
+    68,236,59,12,107,153,94,35,105,181,80,7,114,67,80,230,
+    1,35,161,157,84,219,154,119,237,141,187,123,239,121,238,197,
+    238,249,126,113,52,31,62,45,134,94,132,132,109,70,210,74,
+    83,109,168,113,67,98,32,12,175,44,104,51,18,175,29,191,
+    46,128,203,77,172,121,114,83,183,82,107,153,124,215,152,232,
+    223,3,27,157,253,70,226,37,2,93,69,95,251,45,199,247,
+    152,143,153,220,75,183,103,197,254,231,242,251,167,4,223,41,
+    209,119,10,186,97,28,55,125,156,124,208,234,135,14,26,135,
+    14,242,180,202,33,52,234,171,149,216,234,158,149,248,141,238,
+    178,179,18,185,22,149,4,7,196,197,124,155,53,108,70,248,
+    78,245,70,107,59,108,180,134,133,84,221,194,45,94,98,228,
+    236,250,37,89,205,130,163,109,133,184,68,178,212,183,235,103,
+    157,43,196,91,228,44,188,123,192,81,170,44,101,77,164,175,
+    74,251,139,151,174,188,92,57,174,138,93,39,49,158,3,152,
+    106,92,138,209,190,150,128,79,205,75,207,184,183,176,79,86,
+    126,1,8,126,174,77,135,12,120,92,90,90,82,163,51,165,
+    6,245,9,86,106,120,142,214,205,118,224,5,198,179,221,5,
+    74,90,72,65,38,142,21,253,179,233,230,61,50,163,177,82,
+    245,243,18,143,108,225,100,131,118,14,92,54,248,160,174,83,
+    186,77,102,20,11,51,158,113,22,181,103,28,149,56,87,84,
+    79,215,50,226,6,107,187,67,233,103,200,235,142,101,199,36,
+    177,74,190,254,31,175,211,153,58,77,222,180,190,100,214,254,
+    6,206,105,149,228,255,237,50,205,106,54,193,179,244,27,184,
+    116,254,115,244,92,115,46,51,103,39,76,62,172,203,208,34,
+    103,198,173,41,213,201,214,85,114,48,196,116,101,154,42,49,
+    13,169,24,77,125,12,175,21,52,196,108,168,149,63,235,190,
+    211,104,232,155,186,77,74,108,218,114,137,205,181,74,52,196,
+    243,212,138,87,85,47,38,227,209,164,172,91,102,238,24,150,
+    244,175,215,103,90,116,121,183,212,236,213,134,76,155,38,102,
+    253,114,195,157,86,67,94,238,101,55,178,173,92,96,38,175,
+    146,55,90,13,220,111,147,185,255,51,244,156,249,202,220,119,
+    108,194,253,74,208,239,129,251,134,54,55,110,82,218,215,192,
+    121,67,105,77,153,14,77,186,198,229,166,42,126,54,47,55,
+    47,219,84,30,20,241,89,103,183,241,53,153,36,145,172,51,
+    183,106,151,109,8,68,109,191,238,90,118,45,91,175,146,188,
+    59,19,168,148,199,250,140,43,239,80,82,165,230,192,251,202,
+    175,136,218,194,27,161,204,182,74,46,6,15,152,102,220,104,
+    90,102,189,227,175,218,165,108,225,125,200,190,111,54,141,111,
+    185,211,94,229,131,119,159,199,255,66,29,209,215,170,15,109,
+    164,131,122,37,45,219,199,58,85,14,94,117,233,61,6,96,
+    47,227,169,32,158,150,14,193,108,118,114,3,127,184,183,22,
+    56,152,50,140,6,185,242,154,197,72,156,61,16,84,118,194,
+    227,25,41,149,76,188,141,15,190,72,46,40,229,45,120,138,
+    83,160,114,224,165,198,231,108,197,73,27,197,11,255,234,86,
+    122,168,53,100,140,106,19,60,37,195,146,107,115,92,114,179,
+    220,164,213,8,188,111,5,16,202,2,56,196,98,139,137,40,
+    95,117,20,164,132,192,112,201,145,228,174,37,226,73,238,11,
+    50,248,5,185,28,178,148,156,44,151,136,207,199,51,28,95,
+    114,190,185,152,202,112,177,185,40,255,16,216,195,131,20,150,
+    28,177,196,98,26,133,242,89,244,235,11,114,248,33,60,125,
+    8,138,235,33,172,216,62,4,165,48,243,169,213,240,98,200,
+    135,48,95,61,132,233,243,33,62,26,7,39,250,30,66,0,
+    15,110,248,146,93,122,245,195,210,145,87,117,199,9,96,115,
+    195,31,242,113,246,250,96,144,77,113,146,251,121,46,10,187,
+    34,76,189,120,112,138,19,188,106,232,2,51,119,200,83,114,
+    197,211,241,100,58,19,77,198,56,30,170,200,255,11,40,205,
+    26,75,95,133,247,68,130,129,81,178,38,16,66,162,210,11,
+    137,120,70,178,223,113,253,240,153,187,20,161,152,243,216,66,
+    199,219,18,225,37,77,248,12,3,74,179,184,128,186,65,181,
+    244,67,94,9,85,193,16,193,229,227,186,148,28,146,195,39,
+    93,162,34,216,136,119,160,194,177,113,241,107,92,21,62,117,
+    173,100,3,6,96,15,79,137,209,186,250,74,46,249,23,151,
+    100,43,219,66,161,230,240,180,114,128,31,111,20,45,57,35,
+    17,108,38,69,34,105,48,255,77,68,227,29,205,182,161,142,
+    106,91,75,221,63,244,167,128,23,40,171,180,215,161,93,242,
+    31,53,123,87,28,79,104,162,177,61,27,254,73,159,224,30,
+    21,221,163,101,171,165,126,96,101,102,101,230,179,166,150,213,
+    164,208,212,47,54,245,151,29,132,179,225,73,35,32,192,254,
+    92,115,190,190,79,168,239,19,235,17,74,24,113,134,215,28,
+    247,91,124,31,204,230,28,235,99,247,122,243,45,39,132,150,
+    19,98,203,137,149,19,197,54,100,237,15,213,135,31,1,89,
+    181,222,247,180,174,166,111,238,255,96,127,54,250,254,161,155,
+    135,138,109,237,217,93,31,92,205,249,11,109,59,242,109,59,
+    30,116,247,228,118,221,186,250,189,229,143,151,215,38,132,238,
+    157,98,247,206,172,237,179,174,109,185,190,220,155,183,7,63,
+    74,220,74,100,173,159,13,238,191,143,162,237,89,35,111,239,
+    91,59,38,116,143,138,221,163,247,123,250,115,236,218,174,219,
+    151,63,25,190,61,92,118,17,3,59,202,110,122,123,251,35,
+    2,145,199,64,178,204,19,47,49,176,175,70,194,221,183,231,
+    62,25,185,61,114,191,127,59,194,2,23,239,248,62,121,253,
+    246,235,101,135,109,0,101,128,200,99,32,89,215,19,134,24,
+    120,190,216,19,94,63,141,186,6,130,44,16,100,193,65,52,
+    49,48,180,182,103,221,114,103,255,39,145,219,145,172,235,179,
+    109,59,139,131,187,238,94,65,49,123,32,102,15,196,236,105,
+    207,218,145,225,190,61,156,117,228,172,31,49,31,49,15,252,
+    157,217,63,184,213,154,219,95,240,15,229,253,67,69,179,198,
+    223,215,55,254,126,112,232,39,19,235,182,245,63,248,153,227,
+    110,179,48,124,72,28,62,244,203,216,189,190,123,111,254,122,
+    240,231,137,95,36,132,224,139,98,240,197,44,117,191,43,244,
+    147,222,53,118,125,215,157,203,235,188,176,227,128,184,227,192,
+    47,39,238,217,238,189,244,107,250,231,103,126,113,70,232,58,
+    45,118,157,70,93,185,237,185,187,175,252,198,154,223,54,45,
+    108,155,22,183,77,103,237,197,193,17,169,118,255,171,252,42,
+    137,24,86,166,16,107,49,127,49,121,4,228,49,161,123,102,
+    70,48,78,55,9,251,22,73,120,59,16,254,113,238,196,100,
+    101,162,232,110,206,14,230,221,219,208,247,126,107,119,217,66,
+    182,12,63,178,90,219,154,31,19,136,32,72,217,212,140,122,
+    172,111,104,109,236,246,161,149,147,171,19,55,166,69,236,220,
+    250,140,174,127,215,113,195,177,65,251,10,180,47,215,150,167,
+    125,2,29,18,233,80,158,14,61,168,243,130,19,224,160,186,
+    98,190,238,204,51,253,2,115,64,100,14,228,149,47,248,35,
+    14,226,104,105,152,184,126,121,114,247,212,33,235,111,14,217,
+    78,17,142,223,90,73,68,165,29,205,117,166,110,1,236,17,
+    192,250,6,187,5,48,210,239,83,134,94,169,94,30,168,49,
+    46,145,136,68,144,178,130,55,14,225,53,157,23,164,1,250,
+    35,133,124,7,6,34,56,35,126,167,221,176,76,82,219,81,
+    197,16,97,136,157,123,202,142,151,72,10,85,20,232,3,95,
+    32,203,230,38,178,113,209,183,189,76,225,231,118,194,219,153,
+    61,158,235,205,165,115,219,111,157,21,61,195,218,248,79,75,
+    37,136,8,21,51,135,136,160,22,77,32,162,99,19,136,72,
+    213,130,136,44,197,90,46,217,49,76,180,235,96,34,173,121,
+    181,75,229,120,234,210,66,77,156,120,153,67,202,117,171,144,
+    209,37,153,0,50,108,172,134,140,21,167,27,66,139,170,187,
+    180,130,22,165,115,138,90,200,168,158,63,250,51,25,50,126,
+    141,80,81,130,158,90,184,104,216,98,185,23,224,164,57,84,
+    164,12,121,217,151,237,8,36,90,94,239,190,238,208,129,68,
+    251,178,22,10,104,214,180,89,45,55,173,53,141,122,250,25,
+    114,179,213,204,205,201,82,91,203,227,42,193,15,62,67,201,
+    84,173,146,147,72,14,17,64,169,215,228,72,47,59,151,93,
+    119,28,85,128,114,107,165,210,91,234,61,230,25,114,171,221,
+    123,245,155,246,30,253,76,189,71,111,185,247,26,116,189,199,
+    96,32,106,236,61,183,14,94,213,45,187,239,56,171,96,155,
+    6,120,24,234,229,170,217,242,38,84,126,51,91,167,143,143,
+    90,121,83,7,179,245,185,213,213,144,17,13,183,182,152,66,
+    3,94,13,173,169,219,98,249,53,164,101,139,41,106,151,239,
+    214,57,17,204,250,187,89,231,60,64,192,117,185,249,78,189,
+    158,107,8,76,58,48,108,181,220,216,134,93,130,232,111,171,
+    176,85,11,194,13,0,83,35,45,154,26,216,238,52,212,0,
+    152,13,166,241,45,119,220,85,0,211,126,30,255,11,53,70,
+    175,84,3,204,160,94,173,195,161,0,85,235,171,147,9,27,
+    188,248,182,116,226,33,3,43,196,115,81,245,140,196,151,1,
+    76,195,28,164,123,167,195,255,239,136,83,2,49,24,183,96,
+    120,184,131,144,225,225,12,255,175,9,5,204,0,52,172,156,
+    127,195,239,16,12,89,13,167,226,248,123,64,126,5,65,110,
+    254,175,9,197,218,2,116,199,127,143,128,5,45,104,132,41,
+    158,171,64,57,140,236,224,72,88,53,134,251,15,132,130,225,
+    126,75,40,91,53,62,129,124,235,241,138,23,108,242,231,146,
+    153,180,132,217,104,105,95,198,66,172,84,39,221,73,255,179,
+    68,131,244,67,217,39,135,155,93,178,35,40,7,49,157,112,
+    149,226,49,112,171,198,194,93,96,104,44,182,15,183,128,233,
+    58,77,12,35,21,212,253,103,176,37,103,36,80,247,164,107,
+    107,64,14,89,152,0,254,238,215,55,173,246,191,251,205,27,
+    223,44,19,59,157,205,217,201,251,157,193,91,167,114,236,71,
+    103,111,157,93,57,83,108,67,232,46,92,223,252,8,8,66,
+    111,29,93,217,235,107,231,197,238,93,235,195,98,247,209,123,
+    14,177,123,234,55,94,177,123,70,232,56,43,118,156,93,165,
+    17,92,41,122,183,229,122,97,15,202,178,232,221,179,254,170,
+    232,61,124,119,78,244,158,124,100,181,116,35,179,30,145,213,
+    58,216,231,213,147,123,125,125,76,236,223,119,151,17,251,143,
+    223,187,44,246,207,228,219,224,251,196,74,180,248,178,245,185,
+    152,232,219,177,118,72,244,237,191,219,38,250,198,239,237,16,
+    125,103,4,239,140,232,157,201,123,103,30,248,3,168,5,77,
+    221,79,92,132,127,71,177,173,187,216,222,95,12,12,33,196,
+    230,71,21,69,228,49,144,85,10,33,182,246,64,246,245,181,
+    49,49,48,186,206,136,129,195,119,57,49,48,121,239,101,49,
+    112,90,240,191,40,250,95,92,181,223,239,236,214,215,247,21,
+    209,123,240,238,148,232,61,142,234,27,128,250,6,154,87,157,
+    213,245,229,196,254,233,124,27,124,171,235,219,34,250,142,222,
+    115,137,190,23,5,239,180,232,157,206,123,167,229,250,6,80,
+    125,219,182,35,64,92,108,239,45,6,66,168,190,109,80,95,
+    64,59,136,172,90,81,112,215,174,245,69,4,159,3,39,132,
+    192,9,49,112,98,213,117,63,208,147,59,188,238,129,181,254,
+    132,216,59,33,4,38,81,19,86,93,69,127,96,213,94,244,
+    116,200,220,200,123,224,123,191,115,176,232,235,151,106,178,95,
+    244,65,231,251,14,223,101,69,223,132,201,227,203,162,239,196,
+    35,202,26,104,69,80,43,208,186,122,28,97,216,142,1,125,
+    188,87,68,223,193,187,147,168,247,77,30,159,20,125,147,40,
+    121,7,36,239,104,93,157,64,201,187,198,238,182,220,155,200,
+    7,166,132,192,148,24,152,90,61,241,89,119,184,216,29,90,
+    191,242,155,86,36,131,65,212,84,68,30,3,89,117,100,173,
+    55,153,155,76,249,53,18,137,85,153,66,114,135,133,15,147,
+    71,64,30,19,186,103,102,4,99,204,234,199,79,88,18,201,
+    118,45,116,88,124,6,116,248,243,169,253,167,142,88,127,123,
+    196,118,218,226,248,247,20,137,232,151,162,195,49,85,105,233,
+    209,33,15,175,69,225,11,132,30,17,138,10,121,0,163,248,
+    38,81,133,8,71,0,17,142,200,136,112,10,35,182,41,25,
+    17,198,114,123,100,68,56,85,3,17,226,231,176,94,88,118,
+    86,146,62,45,149,192,33,212,49,212,202,255,141,162,136,249,
+    127,9,90,207,1,158,175,68,252,34,110,112,201,158,121,27,
+    182,206,73,139,231,148,218,5,184,91,192,4,40,185,230,247,
+    134,83,23,175,112,177,140,124,64,206,137,30,72,83,162,164,
+    190,235,84,29,126,70,85,228,120,181,251,71,106,103,233,215,
+    194,191,160,15,73,175,192,63,194,255,45,33,157,49,73,63,
+    65,20,241,145,36,203,207,17,100,221,59,46,248,43,18,117,
+    239,224,191,34,225,124,7,255,21,9,95,94,255,45,91,40,
+    210,82,38,158,141,52,16,164,75,201,120,56,175,255,22,137,
+    109,121,253,183,108,223,75,250,203,68,53,121,4,228,113,229,
+    217,2,185,131,116,149,137,106,242,8,200,227,202,179,89,114,
+    15,220,86,147,71,64,30,87,158,37,201,73,18,114,55,167,
+    143,48,125,172,125,62,99,185,74,146,176,152,92,251,242,72,
+    186,60,214,135,241,214,111,144,36,18,34,115,154,69,101,193,
+    245,177,54,132,183,76,227,31,230,52,27,122,132,175,143,107,
+    132,99,177,248,63,10,95,205,156,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/resources/looppoint.py",
+    "gem5.resources.looppoint",
+    embedded_module_data,
+    9929,
+    28008);
+
+} // anonymous namespace
+} // namespace gem5
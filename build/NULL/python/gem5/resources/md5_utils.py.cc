@@ -0,0 +1,159 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,213,87,255,111,219,198,21,63,138,164,68,137,178,165,
+    216,242,151,198,115,66,199,153,29,183,174,210,36,206,48,100,
+    169,209,33,238,82,219,93,176,33,1,182,166,8,28,90,164,
+    45,57,146,168,29,233,56,86,229,214,13,2,68,54,92,216,
+    3,90,196,195,26,64,45,138,44,69,178,97,63,174,67,135,
+    1,237,63,32,5,220,34,16,8,16,96,24,176,252,166,34,
+    29,16,244,167,189,71,74,178,40,171,109,218,223,70,157,222,
+    221,241,222,123,247,238,222,123,159,59,254,139,52,60,190,106,
+    253,248,159,64,110,16,133,40,76,146,156,199,218,147,100,82,
+    158,243,30,6,219,108,146,77,113,231,57,104,115,170,71,225,
+    85,78,37,11,124,77,197,51,117,101,138,247,235,70,230,188,
+    138,239,26,119,222,171,8,223,91,222,15,242,62,37,0,242,
+    94,85,152,227,20,17,250,188,109,143,211,15,66,223,111,235,
+    119,250,109,208,15,40,204,89,50,210,254,8,85,156,25,97,
+    44,238,23,178,17,199,250,220,114,70,181,132,185,68,82,77,
+    203,41,213,226,226,178,30,183,188,84,53,22,105,58,230,105,
+    216,31,1,254,44,238,207,103,12,33,215,249,27,36,71,10,
+    164,213,115,11,254,119,234,61,221,51,69,174,50,192,203,124,
+    59,239,66,125,62,133,185,100,215,116,143,226,113,246,124,5,
+    246,223,67,114,30,183,196,10,155,246,2,7,7,28,252,10,
+    203,144,28,91,240,182,154,199,8,53,180,247,236,180,115,228,
+    22,216,117,167,110,155,194,223,2,27,238,236,216,1,222,82,
+    132,28,249,61,185,233,249,174,107,184,235,191,5,254,187,83,
+    247,225,113,178,206,27,157,59,114,121,126,142,81,2,215,4,
+    69,116,207,57,65,46,244,172,112,57,166,16,104,53,91,142,
+    115,91,204,144,141,94,63,70,38,252,220,122,24,146,22,7,
+    201,17,162,115,75,158,43,236,107,100,137,97,200,107,240,22,
+    118,9,99,33,120,38,65,200,75,222,71,200,15,129,32,252,
+    76,190,164,158,251,229,196,207,49,40,140,223,40,41,203,67,
+    103,45,142,170,178,242,8,39,203,70,78,105,169,204,162,145,
+    72,207,75,41,229,184,190,152,146,180,180,52,194,90,66,42,
+    145,78,24,42,213,45,78,81,245,152,197,27,154,33,39,99,
+    141,54,99,216,224,194,31,71,129,188,199,220,32,107,95,19,
+    58,10,227,94,28,152,233,1,51,195,104,33,109,115,12,101,
+    230,116,28,95,253,106,72,167,177,195,153,101,35,174,165,15,
+    207,171,169,227,135,169,170,107,139,52,166,234,135,193,192,25,
+    48,53,169,71,51,203,95,9,39,147,114,106,86,145,199,179,
+    195,51,246,64,70,145,13,117,102,142,106,169,25,140,251,232,
+    201,164,22,147,147,250,120,180,198,120,28,244,235,24,37,79,
+    86,73,97,224,15,67,31,14,221,142,124,48,250,209,232,42,
+    121,140,86,209,110,180,68,180,124,9,221,86,96,113,186,33,
+    27,150,79,55,102,244,68,86,181,58,170,83,83,109,30,76,
+    210,103,102,101,74,209,151,84,4,98,9,75,84,206,200,134,
+    65,45,78,203,168,105,139,213,177,137,59,104,121,29,211,70,
+    188,20,131,134,98,36,55,8,242,177,248,98,250,18,197,141,
+    212,113,72,194,231,37,26,193,177,174,150,43,163,3,48,134,
+    127,125,154,177,23,83,241,146,96,228,190,216,119,79,236,43,
+    137,253,166,216,95,228,170,229,161,47,116,125,229,234,202,219,
+    111,93,123,203,244,237,43,14,28,189,231,59,90,244,29,45,
+    11,71,138,238,2,42,194,189,249,43,107,217,141,108,158,203,
+    115,15,133,231,139,238,242,208,223,182,217,191,222,255,64,8,
+    190,115,118,171,119,237,194,198,133,237,137,146,48,96,10,3,
+    101,161,189,188,167,163,220,22,45,188,82,108,139,66,41,183,
+    119,111,166,214,83,107,218,134,102,182,255,176,34,146,64,207,
+    23,196,27,240,126,137,164,66,4,126,127,37,72,2,226,131,
+    174,103,138,123,163,245,242,103,182,212,53,102,118,141,85,8,
+    227,223,111,147,252,203,229,96,120,115,122,125,122,155,47,5,
+    247,153,193,125,69,187,84,88,100,8,161,26,82,35,95,32,
+    249,146,184,222,181,34,79,158,60,105,57,214,65,130,225,213,
+    105,189,3,54,245,179,190,209,83,17,246,243,8,119,170,215,
+    247,121,31,3,212,242,43,9,170,198,12,141,46,187,160,147,
+    175,230,192,227,5,6,143,150,239,2,156,6,219,144,250,164,
+    224,217,45,213,44,167,48,215,200,93,207,46,72,89,90,241,
+    0,164,176,173,228,115,158,5,174,214,46,240,173,56,220,51,
+    52,3,80,206,211,26,116,221,82,116,79,35,8,231,192,26,
+    183,141,43,204,198,89,208,212,74,81,179,166,176,11,194,91,
+    105,186,98,67,28,123,38,214,136,216,117,24,154,32,232,6,
+    163,97,172,249,28,120,26,164,135,9,152,51,35,30,218,79,
+    48,57,147,218,146,74,17,158,50,54,60,73,118,94,210,46,
+    32,217,161,93,201,9,97,178,27,117,198,129,87,71,169,85,
+    242,183,193,191,200,159,12,125,58,244,247,209,191,142,126,18,
+    253,52,186,90,197,28,198,98,47,169,203,35,126,203,11,208,
+    3,74,44,175,174,81,67,85,0,138,0,63,224,5,221,143,
+    198,112,246,81,238,85,211,49,77,81,105,15,26,130,40,96,
+    69,90,25,50,194,210,3,164,138,54,22,7,200,20,215,113,
+    163,0,91,156,37,60,95,35,39,208,190,63,217,246,33,142,
+    116,181,196,145,7,225,238,173,229,251,61,135,238,245,28,42,
+    245,60,107,246,60,91,124,225,21,44,225,201,82,120,210,12,
+    79,86,8,207,143,217,36,207,149,133,224,166,184,46,110,77,
+    188,59,121,63,114,240,94,228,96,41,50,100,70,134,74,194,
+    176,41,12,23,133,225,178,24,218,60,185,126,114,109,124,99,
+    188,66,88,255,216,131,206,67,183,35,183,141,82,231,152,217,
+    57,150,159,200,79,148,219,246,108,190,190,254,58,98,12,226,
+    0,48,12,223,230,110,43,165,206,99,102,231,177,252,196,19,
+    80,176,58,109,239,28,197,147,199,21,12,245,156,252,15,121,
+    250,156,164,63,104,204,71,163,33,87,154,3,168,249,28,3,
+    253,45,115,111,151,126,255,247,211,111,136,59,188,10,131,23,
+    22,197,115,147,117,115,93,101,70,88,57,12,221,0,158,28,
+    167,85,67,151,140,184,138,167,185,116,89,78,46,170,146,54,
+    39,201,18,30,28,146,70,165,58,148,69,165,139,23,49,110,
+    112,224,226,69,41,161,75,139,186,170,72,137,57,91,26,3,
+    198,214,7,239,171,194,114,90,169,138,128,142,214,18,14,119,
+    195,20,63,77,75,234,149,152,154,49,18,90,186,166,206,185,
+    132,238,22,76,107,6,8,131,201,9,165,133,181,1,91,252,
+    68,70,166,114,202,22,57,33,157,171,9,27,154,52,175,26,
+    245,85,107,115,81,155,57,235,197,219,176,52,156,29,28,254,
+    118,253,112,58,99,70,193,189,167,186,39,20,29,75,15,225,
+    59,95,117,209,150,255,229,218,98,224,226,130,177,215,0,10,
+    22,11,92,244,24,180,78,227,64,156,216,25,21,38,66,240,
+    122,238,106,238,237,55,175,189,137,249,241,42,243,32,212,115,
+    147,219,62,247,187,192,251,129,82,104,208,12,13,22,133,193,
+    50,28,174,125,235,125,107,253,27,253,144,18,54,83,247,123,
+    198,246,196,111,179,239,102,75,161,3,102,232,64,81,56,240,
+    239,246,158,98,239,84,33,2,196,41,165,246,105,179,125,186,
+    40,56,185,224,74,3,252,234,177,211,224,42,105,198,68,247,
+    209,211,24,140,11,245,145,166,131,193,5,195,5,142,180,120,
+    190,233,40,65,68,205,206,57,209,153,184,172,238,132,39,126,
+    148,236,68,103,205,197,181,143,22,199,193,182,167,18,105,105,
+    41,158,136,197,235,146,224,78,112,250,172,42,1,214,198,22,
+    147,0,124,138,227,243,17,222,6,110,7,24,125,56,65,50,
+    49,107,123,197,242,199,213,43,74,98,94,213,13,112,30,239,
+    118,30,125,161,70,126,133,3,135,109,231,253,55,72,130,161,
+    127,132,14,22,126,253,199,165,187,111,124,188,114,119,165,20,
+    122,209,12,189,120,63,116,250,94,232,116,41,52,105,134,38,
+    75,226,148,41,78,21,185,169,255,3,31,200,221,117,144,112,
+    185,161,1,37,154,243,237,92,28,118,26,147,58,22,79,168,
+    151,33,103,103,151,49,213,236,207,133,93,94,76,38,109,111,
+    233,232,46,28,108,86,22,141,98,14,170,39,78,56,93,71,
+    127,53,133,65,222,145,149,41,32,77,82,215,108,181,48,33,
+    180,118,242,218,173,86,138,197,229,52,248,179,174,13,0,69,
+    77,101,140,229,6,85,137,116,44,185,168,128,30,72,246,90,
+    96,57,35,142,112,83,216,216,167,34,126,39,216,33,67,127,
+    68,236,79,148,3,77,193,114,164,70,46,54,4,75,183,29,
+    44,131,133,201,167,13,150,17,209,158,201,242,225,6,96,148,
+    162,235,45,175,177,156,129,221,165,92,221,136,129,186,97,253,
+    245,72,197,201,63,118,110,15,182,73,240,53,148,210,148,197,
+    164,58,78,127,66,240,242,6,118,141,2,133,187,50,195,84,
+    126,76,152,208,106,59,254,202,164,183,232,46,101,210,83,116,
+    151,138,183,155,9,151,219,59,42,44,214,123,247,109,47,189,
+    255,134,185,247,57,187,251,144,247,231,135,55,158,51,249,238,
+    10,15,221,10,113,147,163,1,144,8,117,86,88,172,251,246,
+    23,124,31,137,102,223,168,221,109,148,12,32,191,155,236,109,
+    99,94,101,242,74,133,96,189,165,59,117,11,42,121,153,105,
+    102,203,168,16,172,11,172,83,183,160,29,98,149,79,172,242,
+    137,246,216,55,81,123,55,255,7,114,205,237,68,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/resources/md5_utils.py",
+    "gem5.resources.md5_utils",
+    embedded_module_data,
+    2157,
+    4668);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,1116 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,237,125,11,112,28,199,149,216,204,254,255,187,0,22,
+    88,252,49,248,99,241,37,248,23,68,243,35,128,18,41,139,
+    148,34,210,150,13,89,183,88,96,6,192,138,251,129,103,22,
+    164,184,94,232,88,137,226,192,62,214,9,190,163,35,228,44,
+    231,246,18,90,71,69,186,43,230,114,169,184,146,74,85,46,
+    114,42,117,87,169,100,23,217,43,110,182,194,132,169,196,169,
+    187,202,93,101,17,81,21,197,249,84,250,117,207,127,102,65,
+    128,103,39,206,103,177,120,59,61,253,153,238,158,238,247,94,
+    191,126,239,245,191,165,84,159,6,241,247,211,223,177,82,212,
+    123,20,75,177,116,146,154,39,191,244,60,141,126,45,73,75,
+    202,58,111,165,225,158,53,105,75,217,231,237,248,218,150,116,
+    164,156,243,78,124,109,79,186,82,238,121,119,202,51,239,73,
+    121,231,189,41,223,188,47,229,159,247,167,2,243,129,84,112,
+    62,152,10,205,135,82,13,243,13,56,173,35,217,152,106,154,
+    111,74,133,231,195,56,236,76,54,167,90,230,91,208,181,139,
+    117,39,35,169,214,249,214,84,219,124,27,10,123,88,111,178,
+    61,213,49,223,129,175,125,201,206,84,215,124,23,190,246,39,
+    187,83,61,243,61,41,102,158,161,41,55,101,161,94,160,216,
+    192,59,20,27,252,192,66,81,31,89,164,198,205,247,226,152,
+    16,138,105,224,122,63,64,45,252,200,42,199,245,225,184,70,
+    20,215,100,136,235,199,113,97,20,215,204,245,233,226,6,112,
+    92,11,138,139,24,226,6,113,92,43,138,107,227,6,117,113,
+    67,56,174,29,197,117,112,253,186,184,97,28,215,137,226,186,
+    12,249,70,112,92,55,138,235,49,228,139,226,56,6,197,245,
+    26,218,48,138,227,250,80,92,63,215,199,245,124,96,67,177,
+    54,57,118,12,199,14,160,216,65,20,203,232,98,199,113,236,
+    16,138,29,230,70,117,229,78,224,184,17,20,23,53,60,115,
+    18,199,141,162,184,49,67,220,20,142,27,71,113,19,134,184,
+    67,44,205,78,162,127,154,107,121,115,90,186,139,194,83,203,
+    78,246,16,119,152,157,230,252,220,225,54,121,208,178,135,185,
+    35,236,17,221,189,163,40,236,83,133,143,233,226,143,163,60,
+    39,184,222,229,16,123,242,29,251,252,81,116,125,120,217,194,
+    62,243,142,109,254,24,174,217,12,170,217,179,134,154,29,199,
+    113,167,80,220,23,184,1,93,220,9,55,69,254,216,179,7,
+    171,165,250,142,42,14,106,231,99,79,163,218,157,228,6,184,
+    65,110,132,139,114,195,220,16,122,63,253,220,40,55,193,157,
+    228,198,184,113,110,146,59,196,158,121,63,56,255,12,75,95,
+    161,162,231,254,24,178,94,142,210,85,231,185,231,102,47,113,
+    217,56,92,174,197,249,108,34,158,68,151,182,87,226,217,213,
+    168,187,106,61,151,190,89,181,205,37,150,178,85,247,11,92,
+    154,227,227,217,12,95,181,189,148,16,178,85,215,203,107,217,
+    68,38,29,79,86,173,87,184,108,213,126,117,125,45,201,85,
+    109,87,111,174,113,85,251,151,210,40,42,106,169,218,151,227,
+    89,148,194,118,35,206,167,161,220,165,12,207,253,49,204,52,
+    20,103,189,120,229,92,53,180,194,101,99,9,33,30,91,230,
+    51,169,152,144,229,255,152,134,88,186,218,12,17,60,39,100,
+    214,249,37,46,246,166,144,73,199,50,139,111,162,8,159,58,
+    2,21,211,248,82,38,179,182,150,73,164,179,179,194,245,151,
+    50,113,150,227,171,77,242,189,23,81,70,114,115,137,82,125,
+    2,226,239,167,255,131,2,4,198,81,128,180,230,45,44,61,
+    111,229,108,243,118,233,21,225,215,212,200,90,57,7,231,84,
+    117,185,77,23,182,235,194,14,93,216,169,11,187,80,216,165,
+    132,209,235,115,163,215,231,102,61,156,19,13,46,47,26,92,
+    30,241,218,135,174,189,172,255,29,106,222,39,222,9,160,59,
+    126,116,173,41,17,221,15,162,251,1,147,251,33,116,63,104,
+    114,191,1,221,15,177,22,52,24,154,170,161,115,139,168,231,
+    227,75,217,87,197,110,205,205,121,24,244,57,151,102,226,98,
+    12,179,148,140,11,2,115,99,53,177,180,202,196,147,73,70,
+    74,74,34,56,129,73,164,87,57,62,145,101,224,69,78,226,
+    236,151,171,150,4,91,13,201,47,241,58,199,11,104,88,84,
+    61,201,204,82,60,25,91,67,99,172,234,101,57,97,137,79,
+    224,161,84,117,144,132,85,15,155,185,145,78,146,183,230,84,
+    189,53,24,56,48,145,62,157,199,111,45,79,231,169,152,28,
+    153,183,162,16,45,135,108,40,36,163,244,188,29,133,228,41,
+    152,183,160,144,140,182,242,14,20,178,203,239,6,166,135,37,
+    222,131,18,227,54,192,103,6,77,140,120,138,81,106,61,195,
+    92,93,229,24,184,98,50,105,38,139,174,87,51,66,150,17,
+    110,10,89,46,133,250,136,227,57,116,55,33,48,82,211,153,
+    132,32,151,102,242,129,146,179,28,59,169,127,162,170,111,102,
+    152,57,37,32,70,44,38,210,43,218,231,76,50,151,51,89,
+    38,190,215,179,80,218,175,175,39,120,142,101,240,51,184,44,
+    199,79,50,207,221,68,69,46,199,215,147,89,84,83,102,97,
+    225,114,38,205,45,44,24,234,67,30,66,90,47,54,108,36,
+    14,111,158,233,147,6,67,134,229,250,162,204,114,134,215,87,
+    236,234,106,253,62,64,67,12,154,34,172,102,214,147,44,147,
+    142,95,79,172,160,254,96,214,5,52,96,152,108,70,238,81,
+    249,169,82,249,245,10,148,251,61,21,191,201,44,66,250,245,
+    52,43,118,206,19,58,160,94,145,123,245,139,126,132,207,48,
+    95,38,23,76,102,25,87,91,25,7,89,129,75,46,27,95,
+    180,60,222,103,152,115,140,136,135,153,229,245,244,18,126,221,
+    100,214,161,26,160,30,97,161,67,164,244,80,184,92,150,210,
+    215,23,151,25,129,203,142,147,87,128,190,104,220,38,81,198,
+    132,190,50,2,147,70,61,178,134,110,112,105,212,51,89,77,
+    113,194,26,183,148,88,78,160,124,11,202,200,87,181,253,114,
+    212,81,181,198,208,4,247,198,84,243,217,23,83,79,104,103,
+    76,156,209,46,121,242,123,99,74,99,163,206,170,13,250,131,
+    239,68,51,143,239,2,208,13,160,7,0,3,160,23,1,1,
+    80,128,248,208,159,12,10,252,210,212,218,205,236,106,38,61,
+    181,194,165,142,77,73,173,17,228,171,201,181,155,232,121,177,
+    68,58,145,141,197,114,109,122,220,54,41,69,189,1,101,159,
+    64,224,22,85,59,68,133,91,54,109,183,93,149,142,193,77,
+    91,217,213,90,233,28,134,223,182,74,164,11,221,246,85,90,
+    71,208,143,95,138,45,226,239,167,128,47,170,14,158,203,174,
+    243,233,37,25,243,160,15,45,225,169,16,193,83,212,155,114,
+    20,194,46,116,174,231,85,156,71,192,175,227,226,156,126,148,
+    76,126,72,243,253,40,45,250,137,66,29,161,56,134,31,197,
+    79,195,228,146,205,69,12,173,34,17,121,120,170,27,183,233,
+    81,176,233,246,91,155,65,126,28,133,246,170,93,86,21,245,
+    231,233,15,105,224,10,154,208,76,185,152,66,244,60,133,6,
+    6,199,158,231,249,12,255,33,93,181,46,37,5,117,109,26,
+    224,161,128,186,86,50,252,205,88,26,77,166,92,159,105,197,
+    52,105,110,65,155,92,184,142,15,3,189,69,87,175,177,138,
+    110,169,138,188,216,129,5,202,236,243,1,250,255,72,14,125,
+    15,33,111,212,213,180,42,140,16,253,155,22,85,216,170,139,
+    183,105,227,191,239,222,160,243,64,0,236,151,127,66,143,228,
+    44,227,76,238,197,168,231,121,132,108,82,136,111,65,120,14,
+    225,157,84,28,70,246,56,131,58,39,46,112,204,245,132,128,
+    104,222,106,54,187,38,204,76,41,131,113,18,198,230,100,134,
+    95,81,141,207,156,251,140,56,9,190,16,181,242,39,97,120,
+    195,91,230,135,41,96,135,240,171,174,58,83,156,32,196,87,
+    56,193,130,199,60,233,102,103,12,24,35,52,150,91,77,198,
+    50,142,249,11,208,165,75,210,107,127,16,28,220,9,14,150,
+    130,195,229,224,112,141,178,250,9,184,55,240,241,136,18,186,
+    207,254,110,74,9,61,58,122,242,119,47,212,236,82,176,230,
+    160,90,59,239,108,212,156,242,13,43,229,14,213,124,84,40,
+    178,25,120,226,128,50,12,247,1,245,112,191,110,142,25,39,
+    163,52,238,8,254,144,110,196,135,53,124,160,152,59,55,104,
+    58,204,244,201,110,67,89,30,121,54,108,20,93,157,198,218,
+    219,165,218,255,19,67,237,249,240,254,70,30,77,169,199,21,
+    127,42,107,83,82,190,41,179,29,5,213,93,229,163,206,249,
+    1,186,250,72,14,9,173,89,175,146,206,56,182,191,111,213,
+    166,255,243,154,20,168,231,173,185,135,234,158,199,88,90,228,
+    90,116,157,239,145,177,58,144,14,25,241,67,154,5,5,93,
+    47,24,41,147,66,92,84,84,73,46,76,75,109,150,17,245,
+    211,211,28,52,181,214,215,38,178,153,9,22,8,62,161,64,
+    74,5,228,130,204,41,80,110,224,37,165,73,74,173,129,57,
+    144,158,58,206,12,231,26,135,199,81,213,56,242,96,238,45,
+    180,118,153,140,58,248,17,120,83,3,48,194,44,25,161,106,
+    195,196,203,129,99,133,170,251,252,91,75,28,166,96,134,225,
+    24,128,113,166,212,38,215,99,58,16,149,4,91,144,63,71,
+    97,34,19,160,124,161,178,183,163,70,209,238,158,138,47,244,
+    192,215,185,227,235,44,249,186,203,190,238,162,175,187,226,13,
+    226,72,155,59,240,131,231,238,190,240,155,151,255,218,229,251,
+    71,203,71,102,75,3,115,229,129,57,124,255,97,99,71,205,
+    66,55,244,221,207,150,79,188,128,138,105,232,83,192,174,213,
+    218,20,120,76,33,0,51,54,80,115,81,161,112,57,216,83,
+    116,245,28,124,194,30,150,134,141,138,150,51,136,203,207,44,
+    37,128,79,101,110,36,80,135,107,249,59,52,125,7,41,147,
+    233,27,132,238,80,21,147,99,76,59,76,149,162,0,37,120,
+    41,113,210,150,131,76,209,197,28,188,9,175,75,77,80,33,
+    109,212,132,61,185,73,61,219,40,15,52,194,62,202,65,212,
+    214,33,179,182,122,160,37,226,2,170,195,180,153,228,242,46,
+    228,243,145,49,1,175,233,118,190,232,234,192,77,252,208,113,
+    25,127,162,13,192,193,0,177,140,197,170,158,88,44,149,97,
+    215,147,112,237,139,197,190,190,30,79,138,49,136,48,176,153,
+    165,88,140,135,158,168,250,81,58,180,146,199,235,49,116,15,
+    240,94,213,138,42,193,3,222,225,199,0,128,148,132,80,158,
+    83,0,78,3,152,3,240,60,128,11,80,3,10,87,4,55,
+    136,239,144,192,151,161,198,139,52,212,88,250,171,89,44,118,
+    87,141,2,224,162,154,59,111,93,66,63,93,189,149,209,201,
+    202,192,72,101,48,90,97,6,42,35,227,181,96,151,125,168,
+    70,33,240,200,23,222,186,114,251,82,205,14,55,28,84,71,
+    127,225,200,251,19,53,39,132,80,246,174,237,43,119,46,213,
+    220,16,242,80,45,221,219,75,119,222,168,121,33,228,163,26,
+    218,182,155,238,248,107,126,8,5,32,229,107,229,240,160,82,
+    174,10,156,182,216,91,183,173,80,165,86,61,112,209,246,190,
+    66,63,154,39,246,62,61,112,56,237,145,26,37,131,70,139,
+    189,171,176,4,185,186,244,192,21,176,51,5,215,189,166,187,
+    254,26,133,46,245,128,177,216,123,11,173,247,250,239,226,228,
+    189,122,224,178,217,59,183,47,20,174,188,127,9,77,101,123,
+    103,93,64,186,31,58,221,92,96,241,49,2,127,73,39,178,
+    80,9,43,252,172,149,179,177,54,206,206,217,52,2,10,109,
+    216,161,11,59,117,97,23,10,59,212,2,138,77,106,153,102,
+    221,239,248,231,157,172,135,179,137,66,10,23,186,214,228,91,
+    182,224,116,190,119,124,243,238,77,234,45,122,222,131,230,98,
+    160,234,123,62,145,228,100,209,194,240,57,101,158,45,101,210,
+    2,194,184,176,248,67,36,41,206,8,232,42,137,38,36,74,
+    63,121,153,172,5,148,165,129,118,85,160,17,12,0,55,9,
+    40,227,83,24,168,223,165,17,83,171,194,21,90,90,93,80,
+    99,17,249,147,167,243,150,188,45,111,207,91,243,142,143,233,
+    15,28,40,135,67,138,3,121,243,21,234,67,203,229,15,29,
+    170,42,41,181,233,146,170,244,161,165,106,23,214,215,56,30,
+    79,182,15,221,152,165,219,187,21,85,199,181,27,113,126,5,
+    145,156,88,76,156,184,2,48,191,18,170,185,69,38,34,148,
+    151,107,86,119,163,188,138,249,109,104,246,115,8,124,126,139,
+    250,44,76,185,3,223,114,222,118,62,112,181,238,160,69,76,
+    164,183,18,108,168,180,246,87,154,218,42,93,19,40,88,243,
+    83,238,182,93,202,233,246,60,6,80,211,2,50,244,38,168,
+    122,168,22,122,228,61,81,66,114,153,127,21,18,191,2,224,
+    56,165,193,131,24,193,228,186,53,181,53,44,2,126,143,18,
+    23,118,183,168,74,176,107,243,237,61,248,178,127,250,148,239,
+    84,155,6,56,123,33,152,181,43,241,44,173,231,159,178,14,
+    37,246,77,153,91,43,168,242,40,159,188,46,183,208,164,41,
+    219,146,167,97,189,97,194,163,65,247,217,46,231,24,117,255,
+    16,22,6,248,19,153,141,153,212,246,160,142,201,1,190,166,
+    1,241,53,34,59,21,39,83,6,177,53,175,81,18,74,159,
+    5,112,22,192,57,10,6,90,66,128,52,104,229,129,23,26,
+    110,8,96,14,133,7,97,154,0,61,45,15,55,200,159,235,
+    48,188,64,133,171,249,17,100,73,83,120,208,253,56,220,246,
+    157,23,238,188,240,32,60,186,19,30,45,133,199,203,225,241,
+    77,247,163,96,43,176,57,103,105,196,178,20,59,79,151,26,
+    207,148,27,207,20,125,103,126,28,108,184,125,227,221,183,191,
+    253,246,118,162,20,28,41,7,97,69,130,249,154,74,232,210,
+    253,182,98,232,18,249,238,90,45,192,204,88,128,153,177,32,
+    102,198,65,133,218,208,138,155,208,72,59,38,145,31,122,249,
+    23,161,174,95,4,240,18,128,75,0,94,6,0,164,79,69,
+    245,78,74,109,2,18,137,103,217,18,151,76,198,98,104,125,
+    141,219,14,111,231,44,105,249,171,18,128,129,35,252,9,105,
+    161,244,87,177,77,23,109,211,136,66,17,58,167,16,185,6,
+    59,154,64,8,60,10,71,106,118,8,56,40,127,51,38,119,
+    78,8,185,36,114,231,134,144,66,224,32,164,16,56,8,169,
+    8,156,84,166,41,24,162,237,221,132,158,117,235,129,195,107,
+    111,147,168,20,186,60,16,32,8,0,154,255,127,13,237,105,
+    152,75,240,220,82,22,161,29,153,0,13,238,65,128,88,41,
+    245,207,27,249,225,175,194,147,161,124,254,43,48,52,235,17,
+    137,118,67,123,101,74,241,135,144,232,117,0,7,194,243,28,
+    181,39,158,239,55,62,208,128,236,255,8,74,37,18,159,74,
+    176,175,24,236,251,127,14,219,15,26,122,201,20,229,247,213,
+    73,166,194,251,185,102,21,214,87,134,235,94,168,223,158,16,
+    80,66,9,243,187,208,245,158,136,159,49,127,163,10,246,255,
+    15,144,111,157,34,216,191,169,245,59,39,238,156,120,208,20,
+    221,105,138,150,154,198,202,77,99,155,174,71,193,8,96,255,
+    243,4,251,207,150,26,231,202,141,115,69,223,28,193,254,27,
+    223,222,216,254,74,41,56,84,14,14,169,87,181,93,247,191,
+    2,11,217,46,5,152,44,105,91,69,129,38,191,0,32,14,
+    0,80,149,26,133,115,18,216,161,204,80,248,84,209,54,245,
+    115,130,194,251,9,10,55,0,135,207,222,42,161,112,31,44,
+    97,14,0,72,239,64,243,53,40,60,36,254,126,250,119,169,
+    189,80,56,66,226,129,159,5,18,103,221,58,100,29,192,200,
+    218,131,145,186,87,143,200,241,174,167,11,221,7,100,239,71,
+    215,10,66,15,2,66,23,174,93,76,197,87,148,21,69,203,
+    57,6,110,50,248,174,34,146,120,2,6,175,6,248,76,38,
+    27,195,34,45,144,14,44,185,84,253,37,99,116,150,250,89,
+    96,244,188,83,189,59,41,227,119,52,69,241,36,6,76,94,
+    13,198,180,245,139,122,246,177,158,224,129,41,227,191,10,0,
+    207,110,224,132,152,58,116,66,215,141,50,157,248,239,144,17,
+    100,1,176,162,104,121,154,21,69,136,98,38,97,163,164,179,
+    136,191,79,162,55,117,68,56,95,16,69,56,227,32,58,140,
+    175,173,37,19,75,241,197,36,55,142,69,55,175,162,190,97,
+    94,145,250,70,18,104,178,48,12,18,208,42,16,72,173,81,
+    38,66,154,70,44,40,214,244,108,110,192,216,25,198,84,141,
+    180,86,46,213,95,116,245,239,33,151,210,18,209,20,245,36,
+    34,106,86,1,13,17,109,65,153,248,85,74,34,223,23,97,
+    188,236,159,7,230,165,103,241,139,148,9,210,76,73,224,39,
+    16,241,41,165,67,154,76,209,198,24,144,38,224,205,134,38,
+    251,100,141,66,0,227,77,8,40,120,19,66,10,222,132,144,
+    130,55,33,164,224,77,8,169,240,38,4,67,84,91,111,161,
+    233,125,191,242,4,83,48,106,177,15,20,46,220,187,114,247,
+    18,72,89,6,244,192,85,31,201,154,0,210,177,208,11,26,
+    220,217,40,254,126,250,7,212,255,54,220,233,228,92,128,13,
+    205,20,128,84,184,212,45,226,76,31,214,32,1,188,234,210,
+    224,85,192,165,94,140,75,125,24,151,6,158,75,164,227,42,
+    206,184,241,28,179,136,239,236,31,137,250,226,252,210,106,34,
+    139,248,133,117,196,52,152,162,80,80,177,249,89,48,197,26,
+    5,15,39,127,49,171,98,201,243,206,172,170,46,90,253,62,
+    190,69,189,175,146,119,106,121,54,61,98,214,149,234,171,91,
+    170,215,136,212,165,127,130,220,157,42,228,238,143,169,251,173,
+    234,73,8,137,180,144,141,167,151,56,50,123,195,0,154,16,
+    248,112,95,88,255,58,181,63,172,31,209,190,112,25,229,119,
+    1,110,131,119,242,212,40,191,145,234,238,3,148,223,94,241,
+    70,128,171,59,252,48,216,182,61,254,91,214,82,112,188,28,
+    28,7,254,237,240,195,193,99,247,147,165,193,217,242,224,236,
+    150,173,28,234,43,226,239,195,134,142,237,151,126,171,191,212,
+    48,89,110,64,147,154,246,31,174,12,78,171,226,107,110,84,
+    24,46,177,230,64,145,56,197,193,22,48,192,169,238,129,123,
+    25,93,159,24,16,239,73,90,181,122,233,41,6,159,98,67,
+    101,76,179,225,127,229,28,217,110,16,231,26,236,161,101,82,
+    107,9,178,139,6,132,235,45,202,132,112,97,77,57,245,168,
+    201,245,152,212,92,157,224,89,29,197,146,247,218,9,241,240,
+    239,135,120,4,164,129,168,18,165,188,77,213,35,35,235,18,
+    104,135,71,255,55,74,71,70,58,139,182,78,35,25,57,124,
+    188,214,208,102,71,111,22,1,76,70,32,160,144,17,8,41,
+    100,4,66,10,25,129,144,66,70,32,164,34,35,16,12,81,
+    145,158,237,245,194,149,123,253,133,175,188,255,139,229,150,41,
+    229,81,166,224,56,109,103,8,193,96,244,192,97,177,247,21,
+    70,238,29,185,59,1,180,165,111,31,128,244,53,116,135,57,
+    61,249,29,234,9,244,228,103,34,80,121,90,122,130,233,134,
+    23,11,85,26,159,67,156,17,217,19,86,51,225,139,242,221,
+    125,211,15,140,185,52,100,3,4,27,152,108,128,152,227,207,
+    64,54,156,50,225,64,8,252,35,25,137,19,105,10,66,11,
+    8,29,235,132,249,215,229,154,201,18,125,34,112,129,237,219,
+    250,56,181,195,216,25,50,94,157,133,105,112,158,218,27,175,
+    182,13,42,168,53,136,81,171,11,80,171,11,80,171,6,28,
+    12,237,221,162,246,68,123,3,38,213,54,160,190,175,168,81,
+    95,127,49,216,175,160,143,15,125,79,139,62,76,49,199,45,
+    9,156,133,46,123,72,237,139,1,5,204,209,4,11,234,38,
+    113,225,222,164,89,184,55,105,22,238,77,154,133,123,147,102,
+    225,222,164,93,184,67,208,4,115,72,143,50,5,163,52,226,
+    68,49,230,24,216,7,32,253,8,237,53,151,180,130,218,192,
+    30,146,86,223,255,74,73,43,158,248,110,52,168,252,85,239,
+    11,9,69,71,56,120,142,89,73,100,247,61,213,127,94,37,
+    166,97,85,155,228,137,11,138,196,79,33,43,253,38,181,231,
+    156,235,82,63,202,48,217,120,90,181,37,214,185,185,161,8,
+    186,16,19,120,160,189,14,211,25,246,77,9,124,13,158,243,
+    9,165,155,97,109,69,91,219,207,137,92,172,139,204,163,174,
+    125,0,210,71,208,170,255,203,72,108,224,139,28,159,230,146,
+    234,165,217,53,124,231,231,128,180,218,17,113,61,24,105,101,
+    164,250,28,140,180,70,180,157,32,207,206,155,251,33,171,136,
+    166,34,202,250,83,39,171,191,68,237,189,154,208,85,217,48,
+    203,127,25,48,11,168,233,42,164,148,127,135,50,153,175,191,
+    36,129,235,166,20,177,62,47,253,115,68,17,235,241,210,38,
+    128,116,7,180,247,255,40,138,216,56,187,202,45,93,195,166,
+    70,242,92,221,58,199,44,201,119,53,38,16,160,107,150,76,
+    102,110,192,126,163,188,119,3,230,15,235,120,193,6,75,65,
+    238,173,53,116,155,99,103,136,78,230,41,101,219,229,244,140,
+    164,129,54,129,88,237,56,207,78,174,173,222,20,82,92,106,
+    82,64,197,112,135,38,215,208,181,146,36,117,108,114,105,141,
+    152,51,252,31,74,153,59,140,125,43,163,128,95,123,58,2,
+    253,46,181,55,83,108,242,68,195,12,254,45,120,244,95,144,
+    31,189,0,224,91,148,201,12,126,87,2,191,2,51,248,31,
+    83,154,25,92,179,216,65,127,14,64,248,231,130,234,30,152,
+    123,133,150,105,230,106,171,248,251,233,38,189,55,213,85,205,
+    219,118,52,103,209,172,213,26,211,161,121,234,212,208,83,39,
+    80,83,173,1,29,162,177,218,124,30,93,216,171,11,251,116,
+    97,63,10,187,85,225,128,54,126,185,5,207,253,32,154,251,
+    30,54,164,173,143,104,62,231,53,185,223,136,238,251,208,125,
+    7,186,110,194,166,122,33,109,221,209,253,48,54,213,35,105,
+    154,177,121,158,177,156,22,108,158,23,210,213,201,194,70,208,
+    253,6,147,244,173,232,126,35,186,111,71,215,109,232,186,9,
+    227,168,48,26,245,29,213,208,149,68,74,51,166,227,65,244,
+    130,206,49,232,246,43,6,20,165,86,131,197,120,69,192,230,
+    126,106,53,90,217,128,42,155,193,232,101,141,227,33,146,137,
+    43,37,46,241,156,168,114,155,102,161,60,40,104,146,185,152,
+    5,133,139,108,60,33,74,194,164,228,227,178,225,145,92,0,
+    250,231,248,235,241,36,217,237,185,193,37,86,86,179,88,81,
+    151,139,47,173,106,51,50,203,235,168,130,55,226,124,106,125,
+    141,73,114,233,149,236,234,56,46,12,158,141,115,171,163,140,
+    133,136,198,138,60,136,110,49,122,172,54,8,98,135,197,164,
+    106,84,253,242,173,36,24,191,122,73,141,72,32,72,30,32,
+    39,198,136,182,234,191,145,225,175,193,2,155,48,247,58,230,
+    12,16,242,146,74,152,172,224,93,152,60,223,165,255,146,229,
+    41,48,175,55,239,200,187,242,110,132,129,61,38,123,142,90,
+    139,72,171,218,34,242,91,90,139,72,187,218,34,18,139,181,
+    229,114,178,65,229,121,155,22,52,65,44,239,184,242,84,65,
+    205,102,214,169,243,156,46,108,16,187,187,149,235,55,21,123,
+    76,235,53,92,75,190,3,61,197,243,228,167,160,114,100,225,
+    62,107,187,130,242,175,208,89,101,166,64,217,126,243,26,228,
+    236,198,220,81,123,252,95,89,140,150,160,134,225,65,76,34,
+    13,131,215,104,64,169,30,68,186,76,112,203,144,65,53,204,
+    72,114,113,38,152,39,214,14,67,49,3,25,252,114,149,152,
+    57,209,208,51,155,97,114,28,159,97,70,226,12,186,191,174,
+    104,187,215,251,100,150,73,134,20,23,71,243,151,91,94,70,
+    124,74,226,58,151,188,73,180,88,184,108,212,88,35,245,20,
+    152,145,219,138,80,10,104,224,223,92,75,128,241,200,77,131,
+    105,193,222,6,172,12,49,67,89,90,79,198,121,249,9,12,
+    187,206,65,147,208,124,79,240,12,203,173,113,105,150,75,47,
+    221,100,50,233,39,20,182,180,154,17,184,52,234,160,181,245,
+    172,98,18,42,76,62,33,27,198,148,203,9,46,201,50,171,
+    92,114,77,96,22,227,75,215,64,227,255,26,169,70,60,171,
+    54,125,121,66,97,18,70,21,17,176,104,8,203,115,73,176,
+    138,65,197,197,149,118,246,65,87,246,61,161,60,82,175,4,
+    177,77,94,88,144,241,59,152,209,47,44,16,101,81,197,110,
+    244,75,148,142,121,130,25,119,4,253,127,218,71,1,46,250,
+    34,194,30,176,169,241,6,54,143,251,150,5,102,202,151,169,
+    247,104,154,186,237,193,252,220,81,74,228,170,162,214,170,101,
+    242,80,213,6,155,89,252,29,74,167,94,244,19,247,169,21,
+    46,141,24,92,254,116,110,92,79,147,100,206,110,146,176,188,
+    194,233,73,57,245,191,3,254,105,6,149,240,249,31,81,127,
+    4,188,19,101,25,245,96,80,137,78,108,206,21,155,6,74,
+    190,129,154,85,186,105,6,8,203,2,232,239,114,52,160,218,
+    136,243,197,212,152,60,16,211,162,249,198,152,145,18,132,98,
+    186,121,134,114,105,198,121,213,134,243,98,227,72,109,113,205,
+    74,88,200,162,49,28,131,126,18,80,137,104,242,72,165,226,
+    132,62,77,200,138,40,87,181,85,83,156,42,59,106,14,222,
+    33,196,140,61,244,57,255,93,0,127,25,192,123,148,196,246,
+    111,83,70,1,1,94,20,40,187,134,1,252,170,22,148,81,
+    164,230,197,219,234,190,175,31,194,203,217,133,151,3,171,241,
+    153,167,219,60,236,26,33,230,182,221,99,240,219,81,233,59,
+    2,191,61,21,102,10,126,187,164,251,63,30,140,154,189,220,
+    202,244,177,7,211,47,236,76,191,80,154,190,88,158,190,136,
+    71,194,46,68,60,166,200,213,16,92,13,121,160,140,62,196,
+    61,131,25,22,83,56,183,227,29,44,122,7,17,207,253,128,
+    57,182,195,28,43,49,39,202,204,137,205,185,178,175,171,136,
+    191,143,122,251,10,214,31,44,221,27,40,143,190,80,26,186,
+    80,30,186,80,98,46,168,226,159,82,175,229,156,122,51,48,
+    142,81,185,196,22,193,186,16,184,45,53,115,36,136,246,73,
+    156,140,3,96,139,240,215,225,209,186,45,66,30,12,139,114,
+    125,134,55,101,24,136,127,10,98,125,213,198,96,95,209,101,
+    162,146,249,164,118,252,129,212,14,212,134,189,155,192,224,225,
+    10,49,24,49,136,198,131,50,2,90,171,211,76,130,12,111,
+    196,177,141,33,160,123,32,16,139,55,153,20,34,95,137,181,
+    228,77,226,254,64,33,92,242,227,68,251,52,19,138,12,198,
+    95,105,176,67,132,82,87,136,71,19,14,119,232,15,204,58,
+    244,67,232,208,232,222,29,170,154,138,187,48,21,252,148,108,
+    216,85,14,70,139,174,232,193,123,246,184,122,132,144,46,35,
+    230,150,34,11,43,106,59,233,73,59,106,197,111,152,180,162,
+    218,180,162,160,23,41,113,110,192,180,85,186,84,255,89,183,
+    131,60,80,116,13,28,184,57,113,72,160,49,68,133,17,143,
+    41,164,102,53,80,143,201,199,130,19,249,37,103,120,216,95,
+    148,122,0,103,17,24,180,48,89,90,229,4,82,168,24,135,
+    159,66,140,243,241,176,81,140,73,23,12,19,98,36,186,176,
+    128,150,39,147,104,141,66,98,85,68,97,36,250,250,145,55,
+    16,209,76,232,107,105,28,119,166,37,227,220,240,110,254,170,
+    217,187,9,234,158,150,99,204,223,139,146,226,191,194,228,21,
+    7,153,7,15,178,167,179,144,212,88,101,27,39,10,230,9,
+    161,218,5,179,106,55,107,26,42,15,170,161,189,167,138,148,
+    206,98,209,14,171,161,162,107,232,224,195,170,87,55,172,140,
+    168,116,223,139,63,248,156,135,219,218,212,152,129,66,239,93,
+    44,151,71,124,212,90,38,205,10,34,163,169,244,154,100,184,
+    140,168,191,92,94,2,49,160,111,65,17,123,142,183,113,105,
+    192,41,244,30,13,153,163,202,128,147,203,51,54,228,9,227,
+    238,168,56,238,126,179,254,184,83,30,90,111,220,41,41,28,
+    232,165,241,127,147,18,197,94,7,26,106,51,228,53,105,176,
+    59,3,172,18,233,94,101,240,9,250,165,0,212,255,175,153,
+    213,31,115,87,26,182,171,14,225,211,164,241,67,27,62,50,
+    109,131,77,106,131,141,134,54,172,80,27,180,122,253,157,223,
+    151,217,129,118,69,57,71,189,241,250,215,208,19,55,44,27,
+    86,88,111,23,44,79,46,33,135,214,184,27,182,188,141,165,
+    175,225,48,143,114,110,216,210,225,253,229,70,57,233,130,213,
+    44,93,222,166,173,27,13,18,0,27,60,45,175,50,126,200,
+    91,192,46,248,246,215,242,196,11,210,81,245,218,151,44,120,
+    36,195,255,117,129,19,196,213,133,142,102,44,44,140,163,5,
+    6,66,202,9,140,77,50,154,65,188,176,96,70,55,33,11,
+    8,107,50,235,89,180,8,19,164,153,140,16,185,76,226,244,
+    52,80,113,253,99,50,165,85,117,230,234,23,33,58,47,144,
+    24,139,117,65,66,25,18,183,162,154,202,74,94,108,38,36,
+    143,88,212,188,84,34,189,94,183,43,100,25,20,90,142,238,
+    81,34,166,87,113,212,100,133,230,93,148,220,37,36,57,1,
+    19,182,52,115,8,139,187,210,42,180,102,90,158,210,58,72,
+    184,18,95,99,22,185,236,13,78,204,168,99,197,148,70,25,
+    201,153,182,238,79,174,179,178,162,196,30,222,236,85,55,151,
+    94,79,97,22,11,115,82,60,216,170,86,29,241,53,88,156,
+    99,134,43,106,39,54,41,94,245,114,199,142,49,103,213,163,
+    12,16,57,30,143,22,144,13,145,199,96,30,13,102,64,174,
+    215,184,60,209,173,169,26,128,230,124,143,194,100,179,149,138,
+    180,109,122,31,246,142,222,59,250,96,236,194,206,216,133,210,
+    216,139,229,177,23,75,189,95,44,247,126,177,70,185,221,23,
+    105,2,75,190,174,205,243,91,51,149,246,129,66,246,193,240,
+    153,157,225,51,165,225,115,229,225,115,165,246,115,155,95,172,
+    4,219,183,255,220,183,127,113,243,23,43,221,35,91,222,45,
+    239,163,238,190,7,221,199,119,186,143,151,186,79,150,187,79,
+    110,121,43,190,200,3,95,247,142,175,123,251,27,37,223,88,
+    217,55,86,244,141,213,28,212,244,179,63,124,189,116,8,47,
+    36,134,10,235,37,223,68,209,55,129,202,42,186,218,247,173,
+    78,254,171,212,158,219,24,230,152,80,179,137,49,106,81,105,
+    246,244,22,131,68,49,48,234,5,211,74,178,76,38,142,8,
+    154,77,53,15,176,210,1,168,31,84,173,232,41,60,72,238,
+    170,246,101,132,102,179,42,85,4,88,141,40,239,157,191,15,
+    224,111,1,248,219,0,254,142,244,238,246,80,89,248,85,9,
+    252,77,224,67,187,45,186,13,20,27,108,160,0,8,81,99,
+    83,149,222,193,74,255,48,124,123,152,74,39,83,25,30,83,
+    118,69,7,70,106,109,71,236,240,82,1,62,106,239,195,155,
+    39,118,124,203,65,117,246,212,156,248,210,69,181,118,110,207,
+    222,185,89,115,227,160,135,106,105,223,30,188,243,122,205,139,
+    131,62,170,189,171,230,199,151,1,105,55,38,136,131,33,170,
+    149,41,88,239,108,212,26,112,176,81,218,143,105,194,193,176,
+    180,33,211,140,131,45,242,142,76,4,135,91,37,239,7,170,
+    26,214,133,111,210,22,123,127,225,232,61,235,221,103,64,195,
+    176,95,15,92,54,251,232,189,129,123,194,199,81,232,152,81,
+    61,240,89,236,131,133,43,144,116,80,15,92,118,123,111,33,
+    92,224,238,118,192,158,84,175,30,4,44,246,225,130,0,73,
+    135,245,64,204,185,116,183,173,94,206,254,194,201,123,179,119,
+    191,96,94,227,136,189,163,48,80,16,238,162,26,163,75,61,
+    56,92,223,113,131,9,32,11,114,24,48,230,123,200,223,164,
+    244,206,30,127,246,59,200,216,181,163,214,114,213,130,119,142,
+    195,106,191,149,242,222,241,60,38,179,16,165,221,154,145,93,
+    191,225,157,21,96,118,77,210,128,235,69,17,145,175,37,210,
+    226,178,122,246,202,151,15,238,80,65,86,21,249,29,74,239,
+    35,172,206,222,131,126,223,87,167,26,162,54,151,84,156,20,
+    229,181,234,245,117,92,36,237,197,99,125,108,209,170,225,139,
+    74,40,214,203,88,170,25,165,171,1,185,39,98,216,254,221,
+    78,108,188,49,134,130,13,75,30,42,134,13,31,163,174,253,
+    168,218,131,188,12,123,47,147,137,157,34,36,235,50,123,165,
+    178,160,236,176,69,52,155,36,142,26,154,31,184,186,118,92,
+    93,21,95,200,68,74,22,164,220,221,58,133,149,207,26,41,
+    119,71,217,213,143,50,252,32,92,96,31,12,61,179,51,244,
+    76,105,232,217,242,208,179,165,222,83,229,222,83,53,171,197,
+    13,194,46,200,100,129,76,26,112,176,125,114,48,240,223,131,
+    192,12,153,54,212,64,100,46,90,100,79,111,149,224,96,49,
+    56,168,236,152,71,221,7,83,105,195,117,81,60,211,252,72,
+    2,147,240,136,223,161,180,158,105,104,64,31,0,124,134,157,
+    245,102,216,241,110,22,119,214,155,53,59,235,205,154,157,245,
+    102,205,206,122,179,102,103,189,89,187,179,46,149,169,2,147,
+    180,125,136,224,173,161,186,128,52,7,26,97,110,170,121,151,
+    82,99,43,205,174,185,143,181,112,86,192,87,156,85,227,150,
+    86,27,182,195,238,49,103,133,125,102,83,207,193,14,93,122,
+    167,46,236,66,97,181,211,216,0,198,101,96,121,111,21,113,
+    153,27,143,23,127,181,89,227,111,87,26,16,122,132,83,117,
+    243,220,10,226,30,99,9,86,143,123,76,213,212,126,141,58,
+    16,238,177,231,29,8,247,56,247,143,123,16,190,49,93,43,
+    233,118,20,109,8,199,104,92,56,235,112,140,165,26,72,74,
+    205,199,56,134,7,67,177,168,77,133,104,160,19,9,142,49,
+    119,10,3,25,76,17,141,90,53,70,141,105,186,77,59,92,
+    70,53,151,97,86,100,40,140,106,90,158,14,213,116,150,93,
+    3,40,67,33,252,160,247,232,78,239,209,82,239,241,114,239,
+    241,127,16,253,105,34,153,223,167,246,68,50,195,230,109,52,
+    96,153,101,53,150,25,42,6,135,84,54,46,6,197,89,5,
+    193,96,213,244,223,163,158,136,106,126,95,2,151,224,57,255,
+    144,210,160,26,201,231,213,212,17,5,199,52,180,0,22,104,
+    17,113,76,139,6,199,180,104,112,76,11,198,49,225,206,237,
+    243,133,254,130,80,24,121,255,229,114,211,120,205,219,130,145,
+    141,136,122,252,45,24,217,136,168,39,216,130,21,241,36,212,
+    35,63,74,5,14,209,136,85,195,168,103,184,46,32,205,131,
+    70,153,43,240,128,201,222,158,106,179,97,145,89,178,1,146,
+    1,166,8,24,33,236,215,90,205,12,185,117,97,143,46,236,
+    213,133,125,186,176,95,231,181,154,168,228,4,222,241,35,36,
+    20,228,220,162,119,107,143,120,77,84,114,130,156,143,243,171,
+    149,102,180,33,53,42,20,213,117,2,40,143,77,84,215,9,
+    98,181,153,16,26,159,205,85,121,203,203,232,66,228,151,84,
+    202,51,160,199,135,213,248,116,90,52,114,2,217,149,67,92,
+    16,208,114,88,145,234,97,111,131,96,243,167,243,61,162,217,
+    74,81,202,1,212,130,215,228,113,89,8,173,176,117,42,5,
+    21,184,43,43,168,96,124,132,119,5,149,189,64,140,114,76,
+    54,4,53,250,40,32,97,198,88,248,135,20,209,3,196,94,
+    179,229,104,157,183,109,90,163,91,178,47,188,138,37,99,254,
+    141,64,214,93,47,69,29,87,28,182,188,63,31,64,216,222,
+    133,158,234,200,187,243,158,188,23,99,125,84,219,143,100,237,
+    13,132,163,129,205,182,198,161,146,117,213,48,160,119,116,106,
+    24,184,79,165,221,253,36,86,201,148,197,81,123,239,186,203,
+    27,118,227,68,30,5,238,49,17,255,157,185,145,70,249,211,
+    68,253,73,220,217,79,197,215,246,46,107,26,124,98,78,75,
+    114,102,105,155,67,187,111,175,85,17,49,105,138,38,219,211,
+    52,73,44,160,78,123,20,127,136,94,211,125,103,60,194,204,
+    20,193,123,165,65,8,46,164,85,91,238,120,224,202,27,242,
+    120,228,98,7,157,3,49,101,11,68,136,161,25,32,103,17,
+    200,177,1,56,169,188,167,31,13,169,104,108,17,64,9,192,
+    62,39,1,217,16,87,154,130,183,198,129,39,211,245,141,122,
+    115,188,175,46,166,144,41,114,26,136,7,104,137,126,142,168,
+    198,56,213,51,78,246,185,69,55,211,8,221,119,14,97,215,
+    210,136,58,248,27,30,248,142,237,248,142,149,124,39,202,190,
+    19,187,78,171,219,83,241,181,85,124,145,207,28,218,205,245,
+    238,169,74,251,48,208,242,206,49,184,80,147,118,116,221,53,
+    81,139,224,189,118,31,208,106,31,80,104,13,168,67,171,101,
+    71,60,160,164,171,213,65,211,202,195,235,185,173,85,187,84,
+    206,121,245,177,120,63,160,91,181,31,32,143,86,112,55,134,
+    189,221,76,70,173,100,81,6,47,159,255,231,0,76,165,255,
+    154,113,147,27,171,255,14,12,137,127,29,94,6,248,94,190,
+    69,253,56,216,244,221,185,237,112,185,45,90,10,143,150,195,
+    163,247,174,150,39,206,150,194,103,75,193,115,229,224,185,162,
+    235,220,30,174,138,126,134,61,212,165,222,216,122,141,96,251,
+    58,29,84,54,235,32,245,182,34,238,158,232,222,221,163,74,
+    250,215,247,238,156,211,165,240,233,82,240,76,57,120,166,232,
+    58,99,236,28,151,212,57,255,210,242,211,218,70,57,70,109,
+    88,116,101,236,99,43,196,80,6,98,96,242,150,253,16,38,
+    216,126,17,232,244,187,106,194,148,183,153,19,35,214,194,90,
+    181,2,8,86,197,192,104,235,176,97,207,91,247,253,252,96,
+    214,175,196,179,118,253,230,141,90,13,243,167,82,55,71,158,
+    54,87,226,132,101,213,178,69,255,252,219,31,32,38,208,1,
+    127,122,241,75,218,219,79,77,83,130,237,134,229,45,235,87,
+    169,27,52,77,125,21,221,165,15,152,26,213,198,173,175,9,
+    110,129,243,29,234,99,151,190,54,104,148,57,209,63,98,8,
+    230,168,55,166,48,99,225,70,45,114,213,105,145,219,176,21,
+    230,172,147,210,97,104,247,33,196,118,56,151,129,181,112,231,
+    98,87,197,243,21,226,88,5,144,227,149,237,49,68,184,185,
+    183,200,193,41,106,2,14,220,155,74,175,7,209,46,141,175,
+    108,152,126,42,197,195,171,63,161,25,190,25,61,23,11,228,
+    115,77,216,127,117,122,37,179,190,178,42,149,120,89,51,249,
+    32,25,24,219,126,10,246,111,176,15,203,210,202,11,39,107,
+    46,172,228,140,85,245,232,170,53,179,248,166,10,105,252,196,
+    117,42,25,79,45,178,241,211,185,87,246,32,104,251,160,197,
+    42,21,62,177,196,191,103,145,61,177,223,239,191,31,255,221,
+    161,91,100,137,5,181,184,198,221,140,122,170,182,204,26,151,
+    230,31,64,245,254,5,5,110,202,120,46,206,2,159,129,215,
+    104,85,187,176,150,76,100,121,24,246,60,172,193,120,112,100,
+    85,181,9,25,62,43,58,70,170,134,101,28,47,98,179,181,
+    120,130,87,24,0,80,203,75,115,85,151,172,182,231,32,201,
+    8,153,255,46,126,166,220,22,141,73,154,184,40,5,255,121,
+    185,211,127,182,158,249,77,232,135,17,11,222,133,242,81,76,
+    95,209,213,249,208,223,176,53,240,160,113,100,167,113,164,212,
+    56,90,110,28,45,249,199,202,254,49,160,209,103,233,123,27,
+    127,159,197,174,194,153,29,31,83,242,245,149,125,125,187,86,
+    203,25,88,124,159,241,144,36,143,252,173,53,139,219,127,150,
+    174,68,6,30,68,38,118,34,19,165,200,84,57,50,181,101,
+    171,68,64,12,214,208,94,9,183,61,236,232,222,206,254,122,
+    238,215,114,247,250,239,125,189,212,51,93,238,153,190,223,91,
+    238,57,90,234,56,86,238,56,182,229,170,68,250,30,68,198,
+    118,34,99,165,200,68,57,50,33,231,157,126,24,110,43,182,
+    79,149,194,135,202,225,67,197,240,161,135,109,117,202,105,59,
+    86,110,59,182,229,168,132,6,30,132,198,118,66,99,247,190,
+    114,255,122,113,252,116,41,116,166,28,58,83,12,157,169,53,
+    65,21,209,74,184,185,189,230,135,106,147,202,19,184,139,225,
+    99,74,127,191,30,252,252,243,207,247,147,236,167,95,120,59,
+    229,238,122,224,234,221,113,245,22,135,78,194,215,213,91,114,
+    61,83,118,61,83,116,61,131,218,6,187,138,149,214,246,77,
+    127,133,57,10,242,144,97,12,74,190,206,205,11,91,203,136,
+    135,35,175,177,208,90,242,141,150,125,163,69,223,168,178,67,
+    120,189,228,27,42,251,134,138,248,91,9,118,110,95,43,98,
+    229,49,1,68,35,119,251,230,26,173,191,231,120,110,100,246,
+    89,251,39,83,62,20,248,228,89,219,236,25,247,39,103,172,
+    232,250,71,22,26,93,255,200,138,175,27,109,115,45,206,31,
+    181,209,8,238,71,4,243,207,36,116,96,46,130,121,2,83,
+    165,17,195,252,35,181,24,102,180,24,28,85,137,97,26,234,
+    11,123,177,4,70,39,241,197,204,141,140,10,120,88,150,226,
+    61,70,60,5,247,216,47,252,103,18,0,254,74,248,58,173,
+    219,47,164,237,151,105,16,127,92,166,101,147,43,213,46,97,
+    173,109,10,68,40,83,162,220,102,10,203,109,90,59,106,206,
+    41,44,179,105,105,171,185,167,176,188,166,179,167,230,157,194,
+    34,26,216,16,156,194,226,25,105,63,112,10,139,103,68,249,
+    78,3,132,26,165,205,193,38,8,133,37,177,78,51,132,90,
+    36,177,78,4,66,173,178,88,71,174,137,41,88,164,45,246,
+    231,232,2,140,48,244,107,2,93,22,251,89,186,16,134,208,
+    89,218,4,186,58,237,163,143,220,129,205,236,214,236,237,155,
+    219,3,219,194,251,209,98,176,191,236,30,168,217,59,97,171,
+    80,11,78,209,246,49,34,79,26,219,7,32,47,29,222,129,
+    70,178,36,49,51,159,254,123,202,40,89,74,0,171,130,255,
+    150,237,242,38,156,195,92,102,195,218,117,166,97,102,166,98,
+    14,141,16,91,27,118,163,167,248,100,243,107,23,235,230,220,
+    172,215,224,125,208,131,207,92,243,130,4,75,60,115,205,199,
+    6,193,232,140,165,150,109,88,234,228,199,70,222,70,163,176,
+    0,150,32,5,209,244,106,172,250,175,172,39,178,178,75,183,
+    248,121,73,20,113,142,17,32,162,174,221,149,234,164,39,226,
+    249,243,38,248,70,199,89,64,39,70,212,104,18,36,251,43,
+    126,61,13,139,243,184,104,21,170,49,179,82,169,210,168,178,
+    65,150,113,38,158,204,164,87,100,101,217,4,81,104,188,56,
+    71,216,20,241,8,21,65,212,166,33,218,113,146,238,86,34,
+    45,87,72,85,87,121,107,114,225,53,49,161,212,244,5,6,
+    177,26,8,129,16,222,230,234,42,39,112,226,29,98,10,130,
+    237,195,196,98,113,125,161,6,75,241,52,156,221,133,30,130,
+    149,116,153,12,170,146,116,176,156,91,110,77,53,164,127,152,
+    126,219,14,47,247,241,58,87,229,240,149,130,107,44,223,250,
+    54,37,202,183,246,127,154,156,69,109,59,117,96,249,21,236,
+    144,218,242,150,143,105,237,241,153,178,196,234,93,19,139,35,
+    185,185,112,62,152,244,70,23,140,253,44,117,244,94,199,205,
+    145,215,196,146,221,98,162,183,36,107,201,9,11,11,170,99,
+    209,254,255,9,120,63,189,19,240,234,213,8,181,5,206,138,
+    154,80,142,142,250,57,60,166,46,106,51,59,244,0,196,119,
+    30,101,232,144,3,96,224,100,148,106,131,225,40,38,149,120,
+    78,220,102,255,19,169,24,253,84,85,44,82,84,219,236,106,
+    113,91,139,6,173,202,34,182,127,14,68,31,242,129,136,109,
+    148,234,24,216,180,221,14,234,15,114,235,157,134,96,247,143,
+    93,126,149,32,77,181,35,86,115,99,153,153,29,100,102,118,
+    144,148,105,0,89,179,88,249,63,133,214,27,215,94,32,53,
+    249,20,60,167,74,22,83,138,30,236,126,196,30,231,17,91,
+    246,13,235,151,169,247,44,223,180,209,34,139,150,251,13,249,
+    37,40,230,22,43,210,81,172,68,225,93,196,144,2,198,144,
+    26,37,91,65,178,1,195,184,90,165,24,57,115,19,44,196,
+    48,54,121,234,194,164,178,46,71,45,252,127,132,183,110,67,
+    43,57,193,32,138,130,163,248,80,153,177,152,201,123,195,247,
+    31,195,123,3,19,50,209,184,203,71,133,91,239,156,121,208,
+    52,188,211,52,92,106,138,150,155,128,15,174,247,53,74,160,
+    172,226,255,167,240,244,247,246,41,146,195,66,183,183,12,93,
+    13,173,77,175,167,22,137,197,193,147,123,149,152,27,8,4,
+    63,60,57,163,60,189,44,252,61,24,221,208,139,134,254,115,
+    198,98,73,46,141,186,175,89,223,125,248,246,127,131,222,3,
+    119,145,183,168,207,124,84,168,105,235,232,157,51,37,196,205,
+    29,204,63,45,184,244,222,99,29,208,163,125,180,129,247,183,
+    89,85,174,139,186,55,127,17,63,183,234,197,54,149,177,21,
+    62,179,190,182,164,22,217,57,165,74,48,180,116,142,107,193,
+    108,122,232,230,199,117,154,31,206,170,4,104,44,141,221,174,
+    91,246,123,60,224,247,109,122,247,236,9,106,67,115,68,224,
+    126,196,115,115,212,27,1,44,98,178,130,182,117,222,118,29,
+    173,87,128,158,231,173,88,119,58,168,17,27,170,44,153,209,
+    181,67,117,237,84,93,203,194,39,196,21,88,63,64,57,62,
+    146,115,129,251,248,220,63,209,99,114,85,199,146,177,70,172,
+    87,241,13,224,196,150,19,201,172,97,246,46,222,156,52,25,
+    169,231,152,52,119,131,209,188,95,145,135,32,156,97,38,157,
+    188,169,43,8,227,9,196,244,153,208,32,205,241,109,234,90,
+    169,78,109,243,93,84,85,54,119,8,91,15,227,19,182,96,
+    118,92,33,51,227,220,245,120,34,9,222,158,213,101,16,94,
+    49,106,39,59,59,58,210,1,228,36,234,22,207,147,86,186,
+    71,32,206,240,49,126,178,163,162,83,2,25,235,88,116,94,
+    3,32,83,45,81,25,153,255,207,144,182,145,116,33,199,42,
+    244,173,234,146,46,171,62,245,19,116,10,201,213,16,244,155,
+    186,14,185,110,237,244,209,199,59,97,246,192,185,7,228,140,
+    184,200,54,251,160,251,200,78,247,145,82,247,177,114,247,177,
+    162,23,190,162,147,252,11,244,246,55,64,46,115,129,38,176,
+    50,121,248,193,228,236,206,228,108,105,242,124,121,242,124,205,
+    170,68,233,189,231,123,168,110,166,232,106,127,52,52,122,55,
+    243,96,232,217,157,161,103,75,67,95,40,15,129,90,166,251,
+    20,6,37,95,223,230,133,173,36,232,53,39,139,120,9,95,
+    153,122,182,24,234,43,156,44,133,198,63,255,113,176,179,18,
+    233,40,71,134,43,93,189,229,174,35,149,214,206,114,107,180,
+    210,20,185,115,170,210,50,82,243,58,66,158,93,10,129,199,
+    0,106,148,67,36,150,230,168,25,104,36,32,159,119,14,76,
+    35,245,94,4,48,141,124,205,116,92,11,28,230,146,137,247,
+    10,213,32,194,203,149,69,253,160,86,150,52,202,80,53,24,
+    136,96,225,106,39,174,252,170,108,16,141,16,130,13,161,17,
+    203,175,88,111,219,111,123,174,136,120,148,152,67,243,160,113,
+    206,255,119,105,88,137,230,208,140,100,14,141,170,8,174,95,
+    79,231,166,141,8,86,61,196,84,2,85,41,203,16,12,154,
+    51,100,208,80,54,232,114,9,60,10,117,86,122,198,106,78,
+    249,166,131,106,232,172,217,41,127,107,205,170,73,136,1,97,
+    105,68,10,238,192,86,95,6,26,206,255,23,10,116,142,246,
+    174,99,31,84,104,154,84,200,37,215,133,25,184,27,124,192,
+    28,223,97,142,151,152,147,101,230,100,205,110,131,129,98,131,
+    129,66,18,73,92,85,200,84,70,4,104,146,135,117,154,74,
+    115,7,203,136,0,103,242,224,168,156,255,140,146,132,66,255,
+    67,170,171,185,120,232,63,72,224,247,129,102,206,234,197,67,
+    78,80,39,7,208,66,61,243,172,162,53,216,201,212,252,61,
+    32,123,65,224,81,83,164,216,58,122,111,246,190,245,227,11,
+    197,214,163,229,166,99,53,123,15,22,20,73,7,218,245,16,
+    97,17,17,242,184,123,176,192,72,20,242,120,123,176,208,72,
+    20,21,225,50,67,148,39,80,107,144,74,55,5,207,209,14,
+    251,232,118,180,56,240,92,185,125,22,205,43,16,203,104,65,
+    200,1,110,121,100,16,162,237,61,68,94,211,163,7,142,54,
+    187,231,222,44,120,186,245,220,127,25,255,232,193,113,151,221,
+    83,232,47,44,221,29,169,81,46,184,249,68,64,4,62,208,
+    171,26,129,143,68,234,62,5,179,125,189,192,135,181,112,54,
+    73,208,179,236,192,194,24,251,59,190,121,114,229,120,199,53,
+    239,196,66,20,23,154,220,206,106,224,202,106,156,205,220,144,
+    165,40,183,44,224,187,6,19,153,184,226,13,79,115,62,61,
+    203,37,227,55,69,155,156,204,34,8,66,228,245,200,2,62,
+    175,20,203,72,18,2,113,19,67,102,62,151,22,184,113,102,
+    53,158,92,198,135,2,97,75,23,112,200,240,50,208,63,108,
+    53,28,87,182,119,16,179,28,207,102,209,250,115,157,72,64,
+    200,25,168,184,52,249,172,110,56,164,133,67,152,30,209,225,
+    5,114,56,243,2,228,91,48,59,168,118,129,28,80,138,23,
+    140,184,33,184,40,240,107,115,83,169,141,184,42,3,212,5,
+    207,147,172,149,244,45,140,65,164,124,84,171,88,16,169,183,
+    200,170,142,142,162,21,38,55,51,58,74,196,78,164,231,200,
+    54,86,124,233,26,241,83,150,96,57,212,187,66,38,185,46,
+    237,103,225,202,221,192,234,43,139,156,36,122,226,210,152,72,
+    67,61,22,17,5,7,23,214,164,58,226,137,74,242,170,86,
+    226,124,97,173,203,92,201,198,211,108,156,103,153,151,18,139,
+    124,156,23,249,146,47,9,156,180,16,149,171,196,38,132,37,
+    84,64,124,5,21,12,50,33,233,136,120,196,50,160,74,136,
+    110,62,208,51,211,232,141,10,130,232,196,68,58,141,121,5,
+    245,254,250,226,36,66,151,228,168,112,12,18,144,76,152,58,
+    126,244,40,182,144,2,135,29,82,79,38,164,19,175,227,162,
+    141,147,232,69,8,145,16,196,10,164,227,224,237,132,84,85,
+    165,211,26,54,235,254,37,181,30,187,108,89,8,148,238,105,
+    61,170,125,76,27,245,220,235,251,243,145,28,49,90,148,138,
+    162,37,188,226,245,194,45,115,53,213,230,152,89,3,36,94,
+    72,81,149,177,211,210,170,92,98,119,52,158,26,181,147,84,
+    94,147,63,11,68,1,56,176,207,241,242,68,163,190,130,86,
+    221,104,189,109,199,235,109,43,172,183,173,176,202,6,224,162,
+    142,207,160,213,122,160,50,248,12,118,217,80,116,41,30,10,
+    212,235,8,185,103,127,155,146,100,120,44,141,248,241,78,141,
+    78,134,138,167,215,105,246,234,250,244,138,70,51,67,104,219,
+    167,126,176,234,45,232,22,155,202,219,49,60,41,106,137,159,
+    64,137,19,203,104,70,100,179,242,8,100,25,213,225,197,146,
+    12,118,156,185,193,49,215,56,110,13,167,17,153,115,50,159,
+    100,86,165,79,88,69,253,15,214,125,89,174,79,117,196,173,
+    17,255,201,72,108,53,46,136,19,9,33,55,130,193,20,214,
+    231,53,192,120,250,83,207,9,78,227,88,194,63,73,72,40,
+    142,10,1,44,39,99,68,92,95,136,213,108,110,239,81,19,
+    60,179,65,4,44,73,161,176,24,78,244,94,35,15,85,149,
+    64,235,52,222,198,198,167,217,158,198,99,187,234,68,221,8,
+    21,32,131,220,9,131,213,69,99,14,12,239,13,219,112,156,
+    225,192,171,170,55,22,19,51,162,5,118,187,97,16,203,113,
+    23,96,28,95,37,227,24,209,112,95,168,216,36,49,230,77,
+    237,223,63,246,87,78,188,127,162,48,39,10,43,124,209,74,
+    176,233,246,219,112,2,214,12,226,149,31,116,157,216,233,58,
+    81,234,122,166,220,245,204,230,220,237,203,15,131,45,91,217,
+    59,111,23,178,228,104,132,162,107,156,240,63,123,24,68,40,
+    59,99,62,186,30,115,3,102,203,24,76,64,85,243,148,142,
+    185,241,2,115,3,160,221,107,159,121,228,11,214,236,232,23,
+    248,150,238,154,19,174,92,84,207,80,205,13,87,84,61,208,
+    238,177,79,212,168,253,1,194,21,64,117,204,253,242,194,209,
+    0,70,174,64,249,75,80,203,206,159,154,61,150,86,37,217,
+    14,74,198,156,243,137,158,121,93,42,207,188,110,213,97,84,
+    30,162,182,172,45,65,220,36,2,245,99,27,120,231,99,189,
+    172,101,217,129,55,132,124,98,94,80,53,246,99,190,38,128,
+    166,127,19,150,33,230,126,251,156,178,169,114,160,221,32,57,
+    23,217,204,193,51,163,222,30,16,241,145,167,104,166,192,212,
+    148,141,123,21,143,87,16,181,6,116,87,164,237,120,153,175,
+    176,14,88,212,87,117,73,55,76,45,164,176,38,178,71,41,
+    82,99,215,1,172,60,222,113,129,243,35,158,138,14,58,36,
+    11,51,68,13,53,82,18,154,236,201,168,240,173,154,26,98,
+    15,118,50,69,38,187,44,185,77,189,76,69,106,24,17,168,
+    24,250,75,220,230,32,221,171,207,171,180,88,218,24,49,233,
+    84,205,123,80,9,255,236,117,79,21,190,140,226,100,162,205,
+    131,116,185,106,143,65,9,85,103,12,63,66,144,14,5,11,
+    208,148,185,205,26,46,26,220,61,238,231,120,152,54,253,126,
+    146,76,199,95,7,164,2,75,90,160,227,204,94,62,158,106,
+    94,76,208,29,64,208,29,110,34,9,64,235,156,112,11,34,
+    232,174,74,51,72,225,61,40,11,8,227,55,209,223,83,250,
+    80,234,209,28,168,50,39,251,131,145,92,7,241,83,148,81,
+    148,138,9,70,46,98,104,36,225,206,111,160,231,241,135,33,
+    217,129,253,91,252,87,115,193,49,56,184,208,85,76,51,174,
+    16,7,139,166,174,198,93,129,218,197,130,188,174,96,174,39,
+    226,184,20,233,76,249,231,96,16,14,195,78,143,160,242,112,
+    177,176,160,248,68,144,70,153,126,52,170,246,252,160,213,74,
+    204,130,154,28,243,28,30,179,226,138,6,227,2,145,255,55,
+    25,190,52,223,64,155,136,173,177,32,78,74,30,67,245,206,
+    245,154,118,188,58,201,55,96,148,129,182,7,162,88,33,42,
+    20,190,157,43,186,218,14,254,58,254,216,100,203,132,77,224,
+    167,192,121,59,169,248,218,154,236,29,70,122,47,218,25,75,
+    188,8,18,97,136,214,157,132,160,233,78,165,167,244,243,91,
+    37,5,53,184,30,82,55,25,245,251,126,223,174,73,231,127,
+    72,243,141,102,157,31,208,190,220,92,143,105,215,43,9,254,
+    162,170,227,3,208,241,249,162,171,131,8,241,221,114,170,170,
+    29,119,200,146,154,39,150,37,122,237,228,85,88,212,47,35,
+    79,131,68,92,220,199,250,161,92,233,47,73,196,12,228,115,
+    60,222,103,226,209,114,83,77,212,228,103,122,234,98,90,29,
+    162,149,38,154,122,126,161,7,24,48,53,110,2,201,139,47,
+    165,138,136,175,207,100,239,251,50,31,81,24,73,190,13,186,
+    27,159,110,164,22,229,85,253,130,186,63,115,221,134,254,214,
+    196,255,50,116,119,139,212,221,253,35,128,12,183,190,90,114,
+    245,20,241,119,223,187,54,192,66,236,229,6,194,244,173,107,
+    54,110,222,3,164,247,15,36,164,23,13,62,193,40,23,75,
+    227,160,14,132,34,97,6,188,25,122,164,21,211,31,154,218,
+    75,59,235,79,37,240,37,104,62,167,23,191,89,129,67,5,
+    16,160,218,186,192,131,131,44,129,27,24,169,76,77,215,26,
+    218,193,202,31,129,71,141,205,53,59,4,20,179,58,8,41,
+    102,117,16,82,76,119,33,164,152,238,66,40,32,185,92,8,
+    66,8,91,211,93,21,13,240,126,161,28,30,87,158,100,10,
+    78,90,236,173,219,86,80,165,106,213,3,151,203,222,14,162,
+    55,244,163,7,97,167,189,179,96,35,206,243,239,6,64,206,
+    216,169,7,141,78,251,8,248,88,64,63,247,143,224,159,31,
+    30,197,63,122,208,248,20,78,17,160,223,175,62,95,245,202,
+    171,252,4,91,109,148,3,178,233,89,181,25,45,128,210,216,
+    95,82,138,61,22,75,37,4,236,90,141,136,58,156,75,201,
+    4,151,206,10,85,103,54,131,181,64,170,246,175,175,39,184,
+    44,33,223,106,86,47,40,141,87,159,195,184,7,139,213,95,
+    236,122,245,151,13,23,107,217,112,179,214,188,235,58,181,69,
+    243,179,121,23,171,178,69,70,119,102,242,14,225,55,209,2,
+    223,114,13,179,121,124,175,122,97,175,44,181,89,155,218,165,
+    128,206,38,64,179,8,223,160,179,42,97,194,65,79,128,230,
+    207,213,201,237,160,76,62,134,243,163,251,212,26,252,172,189,
+    142,254,185,46,151,225,4,107,243,26,152,106,206,3,75,172,
+    107,191,3,245,168,229,69,84,142,155,202,54,171,82,234,180,
+    222,223,148,141,234,10,106,3,65,165,246,14,214,241,177,211,
+    160,217,255,124,63,149,13,40,169,6,40,254,153,13,79,182,
+    67,149,207,181,191,167,190,41,151,242,61,180,126,203,59,16,
+    244,228,61,223,163,190,111,208,206,255,42,98,238,55,60,111,
+    123,210,46,242,123,131,190,65,17,187,130,108,143,242,164,44,
+    163,122,42,89,84,88,201,169,38,31,123,63,64,239,225,35,
+    249,93,108,184,209,40,244,41,163,112,195,155,247,178,126,113,
+    252,77,176,1,24,171,124,43,74,19,80,165,241,101,251,85,
+    109,236,68,229,251,242,110,54,248,62,26,217,119,233,95,70,
+    152,59,59,168,110,117,222,253,113,200,32,134,242,102,135,148,
+    52,215,41,242,150,212,247,242,42,149,197,13,63,170,85,131,
+    88,171,36,170,77,163,42,46,144,160,54,130,249,192,28,245,
+    198,252,70,40,27,85,149,16,98,155,234,89,131,228,131,217,
+    49,77,202,112,155,58,212,172,132,52,253,58,190,191,60,176,
+    105,142,230,127,139,214,65,249,199,17,173,145,61,222,76,127,
+    61,31,132,246,156,194,45,102,91,197,54,238,160,54,53,176,
+    109,184,247,243,40,190,77,41,187,16,161,76,62,134,13,252,
+    248,70,99,118,90,85,219,198,236,97,85,106,205,219,32,125,
+    175,125,74,94,221,195,77,154,146,154,178,71,247,46,41,59,
+    161,78,173,233,165,38,211,94,210,44,116,243,13,121,220,27,
+    183,23,217,118,220,254,23,80,205,218,15,220,254,241,167,104,
+    127,123,189,246,231,155,228,90,77,160,43,23,219,1,215,22,
+    42,239,199,163,223,205,134,222,183,72,99,63,218,21,127,223,
+    37,170,55,106,87,59,107,124,34,21,231,19,201,155,136,29,
+    227,175,195,169,3,192,182,47,199,137,69,244,178,74,44,42,
+    96,233,198,141,68,50,41,186,247,244,72,34,70,236,162,113,
+    41,43,115,210,178,66,131,78,178,191,24,23,240,166,129,70,
+    233,141,8,246,185,175,35,150,31,107,34,122,84,92,163,76,
+    40,137,31,243,171,186,213,29,222,212,144,229,53,113,236,250,
+    14,188,156,197,209,18,97,61,205,18,77,140,61,84,18,251,
+    18,108,223,254,125,118,235,235,36,19,111,82,49,172,74,169,
+    57,19,91,50,43,71,101,147,221,169,189,107,195,144,142,80,
+    164,79,100,169,74,116,116,177,99,58,188,20,84,88,239,4,
+    150,35,63,169,68,196,1,143,99,207,187,240,226,84,44,55,
+    151,190,158,224,51,105,120,59,136,37,231,19,176,161,244,164,
+    178,22,22,94,56,127,233,88,236,213,243,87,94,254,210,171,
+    179,231,99,115,23,95,197,14,53,151,13,37,146,186,193,243,
+    158,84,166,84,53,86,241,143,191,176,240,246,212,228,82,124,
+    105,149,195,123,71,224,147,115,153,137,75,170,41,227,79,42,
+    17,139,197,111,36,4,34,214,158,125,109,110,146,193,59,111,
+    163,51,100,236,199,249,149,117,169,146,137,149,52,116,239,19,
+    43,185,44,14,15,145,3,83,171,235,66,49,242,170,83,51,
+    84,76,121,186,25,169,187,212,175,122,13,5,56,56,87,99,
+    113,61,75,246,36,161,247,86,227,215,159,124,60,128,118,10,
+    162,39,145,5,214,184,246,25,184,139,23,247,83,26,203,37,
+    185,172,184,237,199,115,19,82,27,64,173,72,28,129,100,1,
+    135,53,94,175,242,235,26,141,215,250,159,151,229,151,18,79,
+    51,220,91,75,28,209,39,22,235,133,10,230,209,131,38,229,
+    34,213,171,247,189,234,138,199,140,249,252,60,176,182,173,233,
+    167,190,82,176,164,239,11,123,50,102,21,17,185,118,181,230,
+    184,120,139,44,126,225,200,96,217,249,182,34,132,22,231,185,
+    105,173,244,115,95,59,185,165,25,36,22,13,210,83,241,129,
+    154,122,193,148,82,58,231,170,132,71,197,59,80,183,117,129,
+    83,105,179,37,210,160,248,130,112,219,158,8,66,191,121,38,
+    104,116,187,85,120,103,105,29,141,84,52,249,224,161,245,139,
+    19,75,193,221,65,250,121,92,148,132,225,74,97,191,152,164,
+    11,196,83,112,116,83,79,156,167,42,125,121,244,120,25,11,
+    155,160,89,101,156,195,51,77,43,38,189,112,243,169,165,42,
+    65,106,170,156,68,166,5,166,229,202,110,211,129,214,76,41,
+    116,3,147,58,52,240,226,73,169,64,69,226,42,143,23,211,
+    18,137,166,193,40,66,120,95,18,226,43,34,189,212,208,14,
+    92,105,89,4,84,143,48,41,228,80,161,118,70,75,5,177,
+    203,241,154,20,99,55,105,18,143,51,194,250,26,160,54,65,
+    116,49,11,147,230,249,120,82,48,155,53,81,171,120,72,33,
+    13,199,67,168,7,233,229,170,117,157,79,86,27,12,180,39,
+    119,74,203,1,200,117,28,103,134,191,177,49,60,78,60,189,
+    8,24,169,138,163,69,229,238,229,106,212,82,117,162,170,227,
+    165,181,11,39,141,101,174,229,6,95,229,208,16,21,18,215,
+    57,229,52,37,3,73,31,206,141,12,35,38,9,206,14,159,
+    100,60,175,112,252,106,124,77,16,37,89,232,101,202,228,96,
+    28,167,28,199,148,38,45,226,232,51,158,231,113,70,242,222,
+    207,75,168,112,198,19,117,86,253,26,142,135,239,3,201,14,
+    40,235,42,93,195,15,2,232,135,78,114,73,34,37,48,218,
+    21,109,112,210,20,150,153,225,237,135,52,206,67,97,53,179,
+    110,233,186,106,199,202,118,196,12,0,116,227,52,170,10,100,
+    23,131,86,63,11,149,166,211,70,128,77,68,240,41,38,178,
+    133,213,134,56,203,38,176,148,55,41,110,143,144,157,15,172,
+    138,215,193,131,192,141,63,11,121,28,43,104,208,164,175,87,
+    219,176,201,174,248,246,99,234,33,198,159,131,196,207,1,0,
+    121,38,86,34,173,58,200,70,120,213,246,102,38,145,198,70,
+    138,85,7,121,111,85,123,234,26,228,130,53,125,213,21,95,
+    196,122,51,28,217,183,5,142,156,79,65,68,96,118,29,49,
+    81,41,137,43,173,118,196,52,186,64,192,232,197,178,55,215,
+    184,88,42,190,86,181,34,84,133,55,80,171,65,221,198,57,
+    255,159,160,196,155,148,40,153,171,218,64,182,29,13,243,221,
+    180,212,103,102,111,170,79,126,93,126,205,19,201,203,160,57,
+    69,26,36,200,34,66,252,230,170,1,69,51,4,212,114,240,
+    27,83,78,183,18,98,153,197,55,201,171,112,136,157,254,175,
+    41,73,70,10,122,233,166,72,26,11,4,103,104,17,124,15,
+    4,130,47,216,176,14,251,60,77,53,143,86,92,77,149,182,
+    104,37,20,169,52,247,214,220,246,102,199,46,133,192,99,0,
+    183,46,213,26,169,193,232,173,23,107,14,202,229,223,242,23,
+    157,93,37,103,87,97,226,190,189,220,119,28,93,193,193,11,
+    145,26,213,236,158,3,15,174,161,190,194,213,157,96,180,24,
+    140,62,28,28,190,251,213,74,120,248,15,163,207,149,162,115,
+    229,232,220,174,213,50,212,8,199,130,52,22,67,125,159,161,
+    164,141,183,111,188,251,246,183,223,46,118,31,42,5,167,203,
+    193,233,26,229,244,183,60,140,180,221,185,241,222,198,175,108,
+    20,7,79,148,34,39,203,145,147,53,202,209,208,242,176,189,
+    191,102,161,219,78,255,235,211,115,127,119,185,210,57,9,70,
+    217,237,96,148,221,190,107,183,119,180,160,154,118,180,212,80,
+    117,91,62,11,81,168,132,149,247,146,191,146,44,246,31,187,
+    255,141,82,203,108,185,101,118,243,133,71,193,150,205,0,252,
+    213,194,46,119,224,161,47,180,21,249,214,165,219,151,202,62,
+    230,129,111,104,199,55,116,47,251,67,182,232,27,42,249,102,
+    203,190,217,34,254,126,254,48,216,10,219,105,1,5,60,244,
+    53,212,44,214,134,169,135,225,214,237,200,119,46,221,185,84,
+    14,143,148,195,211,53,43,186,87,163,16,120,116,232,68,205,
+    46,5,80,143,141,79,212,156,82,112,215,106,247,7,80,77,
+    253,168,172,189,192,231,96,17,109,69,79,67,191,159,53,82,
+    45,93,15,125,173,149,246,193,74,184,163,210,119,2,156,200,
+    161,139,182,193,74,99,164,214,224,110,241,236,82,8,60,6,
+    176,233,169,181,83,237,195,133,92,185,237,112,209,214,242,200,
+    217,182,61,191,227,28,46,58,135,225,8,150,206,237,141,162,
+    119,28,125,31,117,141,22,199,158,45,119,157,218,188,252,176,
+    105,0,61,49,28,168,116,244,85,122,38,42,29,131,53,39,
+    10,225,91,40,75,19,131,134,130,20,132,138,129,189,67,247,
+    189,200,15,231,139,193,11,165,224,133,114,240,66,209,117,225,
+    145,183,235,15,123,79,21,189,202,247,97,243,161,226,244,108,
+    185,121,238,214,101,168,195,107,59,206,129,162,115,160,18,238,
+    45,140,149,195,147,155,110,98,177,221,218,91,163,2,238,9,
+    12,54,47,124,214,73,53,132,183,46,108,191,81,14,143,149,
+    66,227,229,208,120,173,131,242,183,63,12,117,87,34,61,5,
+    219,157,183,43,131,19,197,201,179,229,193,115,15,163,135,30,
+    182,14,87,90,153,66,248,253,64,37,58,93,60,140,6,215,
+    249,202,216,23,42,204,112,101,112,186,230,119,142,182,236,82,
+    8,60,6,80,115,122,27,26,119,41,4,30,3,216,181,250,
+    161,147,1,116,82,67,71,54,253,91,215,74,174,62,109,79,
+    53,134,55,29,21,111,203,246,68,209,59,140,190,149,200,64,
+    225,245,114,100,250,65,228,248,78,228,184,52,36,189,254,70,
+    12,182,172,15,35,189,133,254,31,8,165,200,88,57,50,86,
+    12,137,223,74,235,96,225,90,185,245,240,253,35,229,214,19,
+    91,246,31,163,68,131,191,21,46,69,38,203,145,201,98,72,
+    252,62,236,70,239,178,109,123,224,206,23,43,131,232,157,124,
+    161,60,120,186,50,252,76,165,179,191,210,59,81,243,58,122,
+    80,197,17,120,12,96,203,177,37,124,199,187,229,5,125,245,
+    158,2,170,218,20,250,162,170,21,7,81,125,158,121,16,57,
+    189,19,57,93,138,156,45,71,206,130,242,249,0,6,123,212,
+    173,56,244,76,185,117,230,135,168,114,103,182,236,149,238,126,
+    169,248,202,208,56,234,147,100,201,213,15,67,166,125,243,116,
+    141,178,248,28,149,166,246,66,174,102,69,87,36,120,236,57,
+    37,0,130,120,135,0,142,236,62,105,140,206,158,162,62,57,
+    229,153,59,99,253,145,99,106,110,198,250,163,25,59,186,214,
+    40,164,200,190,124,254,128,214,251,154,84,76,133,204,221,205,
+    168,197,204,138,240,85,43,106,97,105,86,231,59,242,169,159,
+    32,139,128,116,79,208,185,120,89,177,108,80,121,16,241,100,
+    54,232,58,207,218,151,128,154,31,168,147,219,73,153,124,12,
+    185,109,121,122,201,66,83,87,168,219,231,221,26,241,191,202,
+    214,133,102,109,31,219,245,98,99,41,95,63,149,109,84,114,
+    13,80,188,21,196,187,183,147,178,64,87,37,58,102,29,122,
+    193,120,212,153,251,19,204,204,189,140,73,39,97,154,196,37,
+    128,134,85,19,84,188,148,209,144,149,104,226,104,84,104,9,
+    195,42,26,201,225,213,34,120,99,1,237,225,4,86,132,69,
+    107,122,46,11,82,159,108,2,146,33,86,26,206,11,65,236,
+    58,86,167,33,26,194,136,114,10,102,79,19,69,78,26,35,
+    178,39,213,154,240,172,57,7,17,83,84,109,144,142,159,68,
+    93,241,124,148,230,163,232,55,119,120,54,158,198,38,54,9,
+    236,58,16,45,154,19,172,34,36,66,12,189,180,94,80,138,
+    143,122,49,159,68,152,160,35,64,165,49,179,99,91,205,164,
+    184,170,117,233,6,171,112,70,85,87,42,126,141,67,213,17,
+    170,206,151,175,156,231,121,196,91,2,179,132,120,90,119,150,
+    19,200,97,36,184,32,1,222,178,68,250,167,105,17,124,21,
+    205,28,225,95,81,146,83,100,239,109,231,187,190,111,251,190,
+    123,245,206,87,191,243,250,157,215,11,35,247,158,47,185,142,
+    148,93,71,126,236,242,200,81,95,249,206,252,157,249,66,71,
+    201,53,81,118,77,32,154,208,224,184,117,17,92,100,182,215,
+    40,183,189,13,131,77,219,67,175,255,246,137,119,79,127,251,
+    244,246,64,201,219,83,246,246,128,103,211,182,135,193,6,68,
+    229,55,190,189,177,125,181,20,236,43,7,97,139,204,15,118,
+    45,224,192,31,161,51,43,10,213,28,54,127,219,195,80,227,
+    29,239,246,220,189,99,197,208,116,41,52,93,14,77,163,11,
+    57,221,231,15,155,218,33,103,155,2,42,161,214,45,23,228,
+    111,3,50,233,160,188,225,98,248,66,201,115,177,236,185,88,
+    180,93,20,96,48,255,195,241,200,172,195,242,137,195,51,219,
+    100,255,164,145,70,208,128,139,224,243,41,236,230,27,125,36,
+    192,89,155,88,109,222,190,108,195,74,106,182,119,252,160,50,
+    255,22,61,239,132,147,42,121,208,39,141,95,85,124,12,44,
+    97,110,83,59,114,68,221,50,209,180,94,82,43,227,210,75,
+    104,217,128,207,193,192,50,6,113,25,179,198,103,174,163,85,
+    25,17,74,45,222,196,134,167,168,44,148,139,7,33,39,56,
+    103,21,11,128,241,45,203,197,240,122,66,173,238,45,143,43,
+    81,196,138,178,37,200,216,197,55,38,39,225,52,11,208,24,
+    159,153,209,233,194,40,122,224,28,90,190,97,19,113,44,15,
+    146,150,186,60,151,66,107,71,44,53,93,94,199,39,104,243,
+    92,146,139,195,217,36,153,101,252,112,101,93,250,10,142,32,
+    50,133,189,100,197,194,250,162,248,216,52,154,149,113,113,57,
+    79,84,219,92,104,181,25,103,227,217,184,185,18,4,160,102,
+    189,98,27,75,27,124,119,169,242,230,117,158,181,248,160,38,
+    175,193,239,150,218,149,177,78,101,206,252,216,23,250,99,171,
+    190,12,114,176,105,238,223,236,207,186,95,39,171,50,67,91,
+    186,114,164,62,154,97,206,177,172,28,146,37,76,226,176,84,
+    70,228,232,232,107,226,235,31,29,173,47,136,57,135,95,233,
+    245,195,135,39,167,39,167,199,205,69,208,120,64,171,44,13,
+    191,6,205,88,208,174,186,22,204,6,213,164,122,116,160,185,
+    177,160,31,21,11,198,97,145,91,196,146,88,169,125,106,65,
+    44,28,46,7,146,38,73,179,199,88,5,201,166,35,195,139,
+    51,210,188,41,8,135,195,184,187,252,161,141,15,97,12,188,
+    152,201,36,85,166,244,54,149,167,203,23,101,5,125,27,70,
+    180,90,253,124,109,13,100,189,190,111,2,250,93,166,100,253,
+    124,63,90,213,248,143,236,90,53,250,248,159,193,137,137,91,
+    174,111,157,190,125,26,236,181,96,181,2,182,136,207,162,100,
+    176,128,0,227,66,0,40,153,90,47,176,240,98,209,213,90,
+    114,77,149,93,83,69,233,75,180,76,92,245,181,76,156,82,
+    141,205,85,72,0,197,97,144,131,122,199,40,157,10,137,27,
+    84,72,220,216,130,107,230,84,141,10,218,15,97,80,56,130,
+    127,238,15,40,183,246,11,136,242,196,9,189,30,179,180,195,
+    142,93,64,154,233,49,35,116,109,221,167,254,178,99,217,133,
+    209,185,19,161,115,197,238,201,85,21,95,217,92,66,184,118,
+    49,21,95,81,220,200,76,27,80,60,139,210,48,9,72,164,
+    199,246,160,6,172,197,245,138,10,49,201,76,118,49,240,220,
+    87,149,243,191,21,53,27,154,204,104,103,158,174,2,41,14,
+    149,172,72,52,227,204,13,30,54,223,120,140,113,18,242,241,
+    222,138,209,112,90,154,46,75,106,77,15,121,41,240,55,168,
+    3,99,113,219,207,26,139,231,173,216,52,92,239,134,158,28,
+    81,253,58,109,116,24,179,23,50,87,13,151,125,160,115,62,
+    147,193,170,107,217,132,162,29,13,247,72,49,114,132,40,175,
+    223,131,26,92,210,83,2,115,18,32,98,250,61,142,56,238,
+    59,16,21,248,51,111,199,192,153,44,50,14,55,140,205,39,
+    211,147,5,147,60,50,17,185,118,80,34,98,86,129,253,82,
+    19,181,60,22,235,151,243,47,129,96,213,161,162,34,218,9,
+    66,232,9,44,24,113,79,168,41,10,83,167,58,50,105,185,
+    11,40,26,164,148,64,90,58,69,210,50,182,23,105,177,139,
+    164,197,210,208,186,107,181,1,105,177,1,105,65,224,51,143,
+    65,229,188,35,10,202,230,78,172,108,110,131,34,109,110,98,
+    77,172,128,39,218,213,40,58,141,245,73,206,203,180,8,182,
+    161,61,127,145,170,71,114,58,225,12,170,145,241,74,91,71,
+    205,219,9,182,177,157,162,35,185,78,141,125,112,39,182,15,
+    110,235,45,52,189,239,175,185,59,177,125,112,83,68,201,178,
+    95,64,8,211,203,122,36,38,123,214,32,22,246,7,64,97,
+    228,12,13,43,62,237,66,239,129,194,26,255,59,180,169,210,
+    6,62,155,87,116,39,5,71,225,161,181,54,94,111,195,89,
+    232,136,112,160,149,175,180,101,151,72,38,178,68,141,227,250,
+    97,52,117,39,15,137,182,149,44,40,126,96,229,14,45,113,
+    16,77,216,22,148,81,126,3,43,132,224,201,38,82,167,139,
+    4,121,97,135,158,28,236,175,136,121,101,95,74,146,149,112,
+    34,135,23,187,227,226,222,185,202,91,150,98,108,11,214,112,
+    216,18,142,229,209,194,6,239,190,145,57,138,215,59,68,213,
+    59,206,94,79,136,100,84,162,85,11,6,179,182,5,157,188,
+    0,239,245,169,180,85,14,162,169,50,105,210,231,35,8,239,
+    174,172,227,122,40,61,18,197,68,79,48,83,210,207,189,170,
+    234,68,165,149,230,184,234,9,134,122,18,218,250,208,94,119,
+    183,33,106,193,172,42,17,238,191,74,171,236,69,37,127,64,
+    178,159,182,43,40,246,19,155,104,32,138,144,68,31,194,0,
+    8,73,184,59,17,146,176,59,16,146,176,59,64,35,216,129,
+    102,191,175,163,18,238,169,116,76,84,186,143,144,141,129,154,
+    215,225,115,236,82,8,60,6,0,166,239,14,81,135,57,231,
+    1,202,52,129,9,92,213,177,152,0,165,255,170,227,26,199,
+    167,185,100,213,179,180,202,45,93,195,62,45,171,214,149,68,
+    182,234,65,44,117,22,111,151,242,85,27,246,64,239,150,133,
+    43,252,31,1,166,107,148,252,184,78,40,17,227,192,131,182,
+    200,199,190,76,72,135,76,77,44,9,215,115,202,113,48,19,
+    120,135,101,66,218,172,138,218,46,95,189,124,57,58,83,181,
+    225,251,103,161,59,172,241,197,37,30,38,98,213,141,187,25,
+    49,248,2,222,56,130,61,193,236,106,50,177,40,238,52,101,
+    111,130,213,2,209,190,198,56,11,123,64,112,203,120,12,59,
+    73,192,174,50,193,217,34,62,222,164,234,68,92,214,122,54,
+    145,36,126,115,241,18,194,26,75,29,227,27,224,202,150,16,
+    226,2,15,46,45,248,48,126,2,217,164,39,251,100,176,43,
+    132,183,174,170,110,185,53,228,188,44,124,150,13,168,113,146,
+    243,109,56,74,220,222,226,225,104,43,254,22,0,56,103,141,
+    255,37,0,239,2,192,199,248,225,19,155,240,89,42,216,75,
+    39,246,197,128,109,22,65,51,185,234,133,121,43,18,100,130,
+    155,47,73,155,67,68,86,116,66,66,195,120,212,240,39,165,
+    125,61,229,160,150,159,184,78,165,50,236,122,146,59,205,47,
+    211,68,101,94,232,64,189,85,179,210,52,93,59,78,209,190,
+    91,94,248,171,80,238,91,248,175,66,69,138,218,111,133,234,
+    42,106,191,21,170,181,168,253,214,44,30,218,82,163,254,87,
+    129,86,43,92,61,25,120,40,186,185,72,133,213,223,154,109,
+    159,121,93,20,61,90,164,162,234,111,133,26,40,106,191,53,
+    203,126,107,210,76,219,106,135,94,165,233,206,26,101,14,119,
+    49,124,172,190,255,166,101,128,110,171,81,70,80,108,234,223,
+    133,223,199,202,237,203,244,32,221,90,163,140,160,216,58,178,
+    11,191,143,149,219,175,208,93,116,127,141,50,130,109,223,46,
+    252,60,86,238,158,165,251,233,190,26,101,4,91,95,219,133,
+    159,199,202,221,151,232,54,26,45,38,141,96,187,123,23,126,
+    30,43,119,79,70,232,174,26,101,4,197,70,212,46,244,251,
+    88,185,125,180,141,102,32,147,30,108,253,2,20,202,60,86,
+    238,158,236,132,226,141,160,216,54,186,11,191,143,149,219,167,
+    115,52,212,218,28,22,35,195,187,248,226,177,58,42,103,237,
+    164,135,32,183,30,108,159,42,70,159,133,7,12,61,86,34,
+    78,183,211,195,53,202,8,182,95,42,142,126,97,23,174,30,
+    43,17,51,95,163,233,177,26,101,14,139,204,161,93,124,241,
+    88,29,245,182,37,78,211,136,231,49,135,197,240,192,46,190,
+    120,172,142,186,96,29,164,39,96,0,232,65,177,121,16,70,
+    200,196,99,229,246,43,244,44,110,186,57,196,61,52,139,123,
+    72,21,245,138,133,138,78,84,250,134,42,67,163,149,238,190,
+    74,67,115,185,161,183,210,213,139,183,64,191,97,161,17,53,
+    2,88,105,8,215,172,112,241,168,149,193,236,158,29,199,57,
+    168,78,166,230,196,151,46,42,210,179,45,220,73,213,220,56,
+    232,161,2,45,91,236,237,95,168,121,113,48,0,193,165,219,
+    111,212,130,56,24,66,156,178,88,124,35,229,104,169,53,41,
+    79,210,192,188,189,157,126,145,6,153,7,252,154,192,231,232,
+    14,250,80,141,50,2,220,59,232,247,177,114,251,212,8,116,
+    170,17,20,187,167,118,225,247,177,114,123,158,86,58,165,127,
+    24,113,180,80,163,78,177,27,58,85,189,208,41,119,66,167,
+    166,15,58,229,46,216,62,114,39,81,246,51,164,12,31,52,
+    214,47,149,166,2,103,105,170,105,160,18,232,132,111,227,64,
+    197,219,2,208,215,90,105,232,171,132,152,74,251,145,74,168,
+    181,210,125,184,210,50,86,241,183,163,59,181,158,80,15,66,
+    81,8,20,169,14,242,197,196,227,127,2,141,192,88,96,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/resources/resource.py",
+    "gem5.resources.resource",
+    embedded_module_data,
+    17471,
+    51929);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,102 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,197,85,205,111,27,69,20,159,253,244,122,215,118,156,
+    164,206,7,41,237,52,208,10,71,137,163,82,181,66,133,32,
+    149,18,84,36,4,136,86,128,124,32,222,236,142,227,13,251,
+    97,205,174,27,57,242,129,67,143,28,144,168,68,36,64,202,
+    41,162,74,15,61,150,255,34,160,30,172,61,69,226,212,219,
+    70,109,47,61,49,111,109,175,63,148,16,202,133,141,243,219,
+    121,239,205,188,55,239,205,252,222,254,133,6,158,76,247,253,
+    236,79,6,63,33,19,153,156,141,28,174,204,57,124,153,119,
+    132,178,224,136,101,145,3,61,111,75,142,92,150,227,177,96,
+    167,28,165,172,176,177,104,74,118,218,81,203,106,60,150,109,
+    205,201,148,51,78,182,156,101,114,138,228,76,133,240,36,71,
+    184,42,63,155,132,172,138,102,250,158,88,30,51,85,248,35,
+    202,102,126,192,162,177,53,25,34,146,92,127,190,153,29,145,
+    115,76,22,6,228,177,97,123,85,53,243,247,164,242,184,169,
+    222,70,197,241,167,160,42,138,161,112,195,109,134,226,135,150,
+    17,132,226,39,150,31,132,202,103,245,192,242,92,221,46,114,
+    161,184,165,83,23,222,134,71,201,83,14,86,112,97,97,131,
+    4,107,148,248,94,131,26,100,109,211,247,220,53,111,125,179,
+    200,135,249,175,60,250,173,237,233,230,23,93,99,56,230,173,
+    7,186,229,38,179,67,165,218,112,13,112,31,170,117,157,234,
+    14,9,8,245,13,126,160,240,34,251,23,160,240,31,196,133,
+    15,184,190,201,228,246,152,180,159,104,56,20,8,125,107,11,
+    181,184,135,252,30,243,181,159,248,99,137,10,250,46,91,160,
+    98,246,220,192,70,195,15,60,7,111,117,247,137,55,136,115,
+    21,247,54,87,194,31,7,216,208,93,188,78,112,195,39,38,
+    14,60,236,215,137,97,85,155,88,239,46,93,140,29,217,158,
+    161,219,137,151,146,26,43,75,37,12,213,178,220,141,235,215,
+    59,26,120,238,212,44,31,87,42,55,227,213,189,250,84,42,
+    216,176,117,223,199,204,102,146,58,37,134,30,16,51,142,191,
+    101,217,54,108,128,18,199,187,203,246,96,185,88,79,156,85,
+    27,65,131,130,205,38,186,79,176,87,141,19,40,225,207,59,
+    50,219,52,14,106,36,153,94,169,196,230,94,126,126,50,42,
+    141,30,84,127,67,174,31,144,36,165,59,53,210,213,215,116,
+    159,237,138,184,24,204,118,80,179,236,38,54,60,247,46,161,
+    65,167,80,58,238,157,44,222,170,89,70,13,111,81,189,238,
+    39,219,169,84,78,10,89,138,237,219,20,98,141,150,233,248,
+    42,13,103,139,255,125,146,35,57,62,224,105,150,221,17,154,
+    131,107,205,211,20,140,53,0,224,157,15,119,8,227,151,23,
+    125,106,44,215,155,65,205,115,151,33,208,114,18,104,57,57,
+    255,122,51,204,13,239,156,78,176,213,75,224,230,50,131,239,
+    208,139,179,72,74,71,60,151,190,197,29,9,130,36,63,71,
+    12,34,128,23,10,202,156,221,253,250,241,194,129,182,250,135,
+    182,250,68,91,61,16,87,159,193,221,253,52,204,246,34,172,
+    185,140,41,225,68,194,57,211,98,197,8,60,218,12,243,137,
+    142,29,133,15,188,74,25,182,69,220,192,15,51,176,221,158,
+    218,144,6,40,150,237,81,172,118,12,197,90,232,103,214,211,
+    90,28,67,161,37,50,20,91,2,67,169,197,51,148,127,213,
+    78,163,96,139,205,111,241,15,83,123,44,226,126,18,149,17,
+    81,209,223,237,17,241,36,170,144,129,123,242,138,28,233,114,
+    35,113,118,10,71,94,137,27,137,211,255,153,35,191,247,139,
+    211,15,246,79,204,24,233,190,149,126,252,110,14,172,250,21,
+    150,95,149,178,166,120,66,61,176,229,212,61,26,224,17,95,
+    106,210,67,87,70,77,111,169,157,3,232,94,76,203,92,153,
+    223,158,155,95,28,214,38,87,152,25,11,93,227,224,133,101,
+    234,177,174,186,123,161,87,182,167,71,124,244,166,110,167,22,
+    213,34,36,82,20,105,1,8,60,3,48,13,48,53,192,109,
+    248,164,23,37,122,6,198,133,158,177,51,13,22,248,82,204,
+    120,8,48,206,70,161,146,144,249,53,38,194,215,200,255,177,
+    67,230,249,152,204,90,58,23,169,232,245,133,72,131,17,2,
+    200,160,55,175,69,217,68,204,161,115,11,209,88,34,230,209,
+    204,249,104,60,17,39,208,133,203,209,100,34,2,28,9,89,
+    232,13,89,232,13,12,88,215,200,204,181,149,66,123,110,169,
+    93,184,208,206,79,183,103,139,145,38,103,228,35,196,224,57,
+    64,132,100,73,166,147,144,217,68,40,7,205,58,227,20,5,
+    70,82,248,142,82,72,137,202,144,77,138,29,110,35,176,236,
+    184,20,161,176,230,92,165,10,140,228,78,117,169,26,167,220,
+    43,109,167,15,102,226,169,126,64,227,118,22,106,112,62,95,
+    118,106,30,215,228,1,138,35,199,229,122,169,188,231,120,102,
+    195,38,239,211,55,226,190,192,202,117,147,97,36,112,28,23,
+    93,147,56,62,66,255,13,114,136,155,61,64,51,131,191,67,
+    116,230,96,248,119,136,138,7,195,191,136,23,192,195,233,144,
+    153,224,62,226,118,110,71,8,222,191,153,143,174,60,22,30,
+    189,243,208,237,200,199,96,9,21,151,218,151,22,218,231,230,
+    219,243,151,158,204,191,29,105,23,57,118,14,12,218,147,83,
+    145,192,222,135,51,120,119,242,151,108,36,129,65,70,211,231,
+    119,252,251,78,148,2,73,65,185,169,31,204,239,191,137,210,
+    32,169,104,114,110,231,202,253,165,190,139,227,32,46,242,223,
+    91,37,229,187,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/resources/workload.py",
+    "gem5.resources.workload",
+    embedded_module_data,
+    1236,
+    2717);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,122 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,21,223,111,211,70,248,28,59,137,227,132,166,16,
+    160,109,178,81,51,13,70,69,73,1,81,198,16,218,22,90,
+    67,59,146,182,234,143,109,138,54,89,38,190,54,102,254,17,
+    157,47,133,102,69,67,211,30,246,176,135,77,98,27,219,64,
+    235,19,210,132,38,241,50,137,63,35,65,70,84,39,69,66,
+    154,120,224,45,19,155,52,237,105,119,78,218,36,44,176,205,
+    58,127,254,126,249,190,239,190,95,247,43,232,120,248,214,247,
+    41,162,224,91,160,131,60,208,57,61,96,114,86,32,31,224,
+    24,206,155,188,37,228,5,31,23,204,160,21,202,135,40,30,
+    212,67,102,216,18,243,162,143,135,205,136,37,229,37,43,154,
+    143,90,177,124,140,242,68,24,128,210,208,182,153,229,128,30,
+    249,76,200,239,160,124,145,226,18,197,251,244,232,2,24,137,
+    85,38,164,197,162,225,202,203,134,9,229,130,99,99,205,176,
+    41,85,182,11,216,112,40,134,29,25,94,193,72,43,96,121,
+    5,90,227,50,42,219,216,176,160,108,216,203,14,178,52,166,
+    148,150,158,48,27,35,28,225,23,32,166,31,241,98,217,48,
+    117,197,94,165,184,112,89,67,246,19,174,41,223,57,225,20,
+    33,130,118,1,206,33,7,59,5,199,28,225,9,63,189,144,
+    33,253,43,16,171,134,171,169,203,200,177,84,23,163,109,142,
+    203,40,213,133,152,132,16,196,101,100,23,58,227,23,106,197,
+    240,233,55,28,139,31,230,218,162,219,244,189,179,77,93,5,
+    56,208,150,233,92,59,54,238,14,44,180,37,151,182,50,2,
+    138,220,2,208,3,152,239,144,109,235,117,239,189,10,208,145,
+    117,176,17,4,61,30,188,163,3,239,244,32,208,246,224,54,
+    245,250,14,215,155,226,0,142,63,239,76,147,224,195,217,171,
+    92,151,135,226,246,254,252,58,183,17,233,229,81,247,30,63,
+    0,93,184,197,235,193,219,212,183,59,219,254,161,87,254,203,
+    121,214,185,23,123,254,197,220,58,160,53,22,170,92,144,100,
+    250,204,251,233,163,37,85,132,50,205,167,236,44,203,154,105,
+    250,36,45,1,151,86,159,85,162,85,168,211,218,162,85,199,
+    216,133,50,162,213,130,229,139,134,173,161,181,180,191,11,137,
+    156,93,154,206,78,170,172,106,164,197,204,252,121,101,209,199,
+    133,165,5,69,37,2,195,207,141,72,132,167,22,16,203,23,
+    98,33,33,194,204,82,54,75,132,143,224,154,75,120,77,215,
+    17,11,13,146,152,136,167,133,70,130,229,82,9,162,145,0,
+    233,115,41,230,32,12,117,191,248,8,207,126,97,113,145,229,
+    191,146,46,42,140,149,214,112,209,177,199,88,51,140,181,154,
+    33,93,90,35,187,88,185,118,255,139,146,244,183,81,250,186,
+    247,40,184,6,254,16,193,222,161,175,150,174,47,93,155,121,
+    28,77,124,121,193,139,202,13,192,5,147,245,254,196,117,241,
+    243,74,85,28,122,20,78,124,125,229,250,213,175,62,185,254,
+    73,53,124,144,174,77,113,239,67,49,121,95,76,62,72,29,
+    254,121,234,238,7,222,232,217,90,106,194,75,77,212,196,73,
+    79,156,172,138,147,143,227,195,181,248,126,47,190,191,1,2,
+    193,147,62,248,156,175,71,19,95,156,169,14,30,189,225,254,
+    184,246,253,218,119,31,223,252,152,18,205,117,247,64,45,122,
+    202,139,158,162,150,35,39,55,99,201,135,177,125,247,99,251,
+    30,12,143,221,229,107,195,39,188,225,19,181,216,184,23,27,
+    175,198,198,255,124,20,29,170,10,67,79,89,46,187,122,46,
+    10,90,61,119,175,217,115,29,162,75,219,217,239,226,6,122,
+    114,249,158,92,161,39,55,216,147,27,234,201,13,247,228,138,
+    61,185,145,158,92,105,11,211,185,155,18,157,28,3,109,25,
+    30,108,227,207,239,225,141,142,46,105,63,207,76,36,110,157,
+    163,93,214,247,239,154,171,28,146,241,112,135,93,254,121,94,
+    84,24,45,84,254,225,207,167,212,210,122,199,204,163,93,25,
+    172,84,206,67,220,236,198,130,86,96,112,107,56,203,165,214,
+    116,78,75,126,203,249,23,68,65,179,229,139,254,220,135,180,
+    41,117,89,195,91,119,65,75,235,116,115,60,187,167,169,254,
+    139,182,100,186,180,65,37,203,80,225,21,205,42,153,144,196,
+    44,7,186,134,90,212,44,11,34,178,115,133,94,25,172,155,
+    176,102,235,154,233,216,144,196,155,10,5,171,164,98,231,35,
+    104,147,62,139,209,248,178,163,154,112,21,154,148,246,21,52,
+    75,87,47,106,46,36,187,155,242,34,130,176,169,161,22,177,
+    69,250,159,229,146,200,74,169,172,174,26,180,247,9,95,40,
+    26,68,156,155,159,93,156,157,152,205,86,164,173,43,74,126,
+    173,178,243,53,217,118,232,121,97,193,89,177,141,10,212,211,
+    35,253,136,149,25,145,114,211,170,242,126,38,55,151,85,72,
+    127,102,62,167,230,102,149,133,105,117,42,147,203,41,243,100,
+    231,249,204,252,12,157,79,11,139,153,153,201,76,118,118,70,
+    33,241,166,194,68,110,78,93,156,189,160,204,144,190,28,163,
+    23,223,155,85,179,202,187,74,150,210,190,66,38,55,169,158,
+    205,44,40,100,119,83,62,53,175,40,77,13,117,106,49,71,
+    250,159,229,146,200,249,185,37,245,221,233,57,106,150,159,152,
+    154,166,3,16,35,127,0,146,160,233,92,166,57,75,48,60,
+    49,227,224,105,22,115,139,206,85,168,43,8,57,108,234,197,
+    182,210,163,90,90,169,131,162,123,180,134,31,98,197,67,246,
+    177,41,215,74,187,186,157,92,117,75,31,189,78,149,222,162,
+    175,251,11,240,39,94,63,24,56,228,237,61,94,31,28,241,
+    6,79,215,95,78,123,47,191,93,79,141,122,169,51,245,228,
+    97,47,121,186,5,229,99,158,124,174,254,210,17,239,165,55,
+    235,123,14,122,123,142,214,227,178,23,127,181,177,39,186,59,
+    212,0,20,92,203,254,145,4,187,7,190,190,178,33,121,3,
+    135,107,137,81,47,49,250,48,113,252,126,226,120,45,113,194,
+    75,156,184,150,221,12,39,110,156,121,152,26,189,159,26,173,
+    165,210,94,42,93,13,179,85,239,219,191,25,27,188,117,106,
+    227,29,47,53,86,139,141,85,143,43,181,152,242,27,31,136,
+    75,191,3,10,232,188,140,72,13,17,196,6,111,196,188,232,
+    129,170,112,0,165,168,231,51,35,113,18,86,85,221,41,168,
+    42,9,225,181,146,97,175,32,222,207,183,53,158,214,225,178,
+    97,67,183,25,220,48,101,148,177,97,34,54,161,200,174,30,
+    49,241,235,68,240,47,4,54,131,218,55,143,127,63,248,33,
+    251,9,248,102,253,24,255,37,158,177,28,189,108,194,55,17,
+    139,36,107,97,183,74,65,131,231,56,174,113,50,192,9,212,
+    105,10,68,192,13,84,193,222,206,245,8,12,87,187,215,38,
+    24,172,118,175,71,224,88,181,123,53,2,2,23,104,128,255,
+    3,250,250,185,228,141,137,13,254,230,84,3,80,244,89,112,
+    48,201,29,172,30,122,163,1,232,247,185,192,63,241,223,4,
+    1,158,163,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/runtime.py",
+    "gem5.runtime",
+    embedded_module_data,
+    1555,
+    2828);
+
+} // anonymous namespace
+} // namespace gem5
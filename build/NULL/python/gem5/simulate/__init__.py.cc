@@ -0,0 +1,31 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,123,204,128,4,24,161,244,103,54,32,49,157,33,133,
+    33,152,65,147,209,111,37,67,17,19,72,16,36,243,75,165,
+    184,40,89,191,160,178,36,35,63,79,63,61,53,215,84,191,
+    56,51,183,52,39,177,36,85,63,62,62,51,47,179,36,62,
+    94,175,160,242,23,135,77,110,126,74,105,78,170,93,17,43,
+    212,216,98,126,32,241,129,153,145,145,241,3,3,140,40,98,
+    6,138,1,0,233,71,28,222,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/simulate/__init__.py",
+    "gem5.simulate",
+    embedded_module_data,
+    104,
+    129);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,154 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,86,205,111,219,216,17,127,148,72,89,95,182,36,
+    219,242,71,18,219,244,71,62,148,164,242,198,221,108,154,100,
+    179,187,137,173,36,90,103,21,195,114,176,91,182,133,64,243,
+    61,219,172,37,82,37,169,36,38,178,129,91,228,16,44,122,
+    8,208,67,3,180,5,124,216,13,210,38,135,28,251,103,40,
+    11,1,43,16,40,16,160,232,161,232,133,65,182,151,156,58,
+    67,125,209,169,183,165,229,225,251,205,27,206,204,123,51,243,
+    230,253,157,248,30,161,253,126,243,136,35,228,247,132,18,202,
+    149,73,133,147,56,142,4,200,53,66,3,15,8,13,50,238,
+    73,144,144,103,193,206,71,82,64,37,148,103,129,95,118,57,
+    191,227,168,240,14,14,1,230,125,184,239,29,28,6,44,248,
+    112,228,29,28,5,28,242,225,24,224,62,31,142,3,14,251,
+    112,63,224,136,15,15,0,142,250,112,2,112,204,135,147,128,
+    227,62,156,2,220,239,195,131,128,7,124,120,8,112,194,135,
+    135,1,39,123,24,80,170,131,96,60,232,27,15,117,198,52,
+    253,199,224,55,156,52,76,71,252,107,221,8,208,209,253,120,
+    35,32,165,233,88,145,100,198,255,137,140,12,231,240,57,173,
+    86,81,136,239,233,6,238,54,193,192,49,34,113,20,2,67,
+    57,41,72,3,18,79,131,146,64,121,41,68,5,169,143,134,
+    164,48,237,147,34,52,44,69,105,68,138,209,168,20,167,49,
+    169,159,198,165,1,218,47,37,232,128,148,164,9,41,69,147,
+    210,32,77,73,67,116,80,26,102,105,88,240,8,29,166,100,
+    131,167,233,7,252,19,176,242,172,107,92,26,165,35,224,222,
+    168,19,201,221,85,173,220,109,166,89,246,191,162,34,60,151,
+    53,145,129,171,162,82,150,77,83,220,210,203,84,213,54,69,
+    185,92,22,173,45,38,154,181,106,85,55,44,70,69,83,173,
+    212,202,178,165,27,34,3,13,34,67,21,102,54,234,233,88,
+    67,201,238,252,29,21,62,246,132,84,77,84,152,97,201,248,
+    214,53,170,90,170,174,153,89,191,56,19,171,178,178,45,111,
+    50,113,75,54,61,93,235,140,105,34,101,166,186,169,129,85,
+    75,23,21,144,218,212,13,213,102,232,145,201,64,43,112,77,
+    166,153,234,122,25,20,89,48,111,138,250,134,103,242,180,88,
+    86,77,112,183,173,170,172,223,201,122,67,135,199,89,39,114,
+    71,55,182,215,217,166,170,57,125,56,100,26,117,34,230,29,
+    213,82,182,148,106,205,225,55,100,181,236,68,149,45,166,108,
+    87,117,176,99,15,153,0,104,173,140,174,168,202,182,103,195,
+    14,87,228,187,30,180,251,107,38,51,208,33,102,212,170,150,
+    157,128,85,121,223,137,158,13,211,158,132,157,93,7,9,240,
+    14,160,101,212,20,111,11,68,131,201,168,247,237,225,42,51,
+    54,116,163,34,107,10,131,45,170,161,34,8,135,12,11,163,
+    111,143,28,52,73,85,179,53,59,126,208,172,1,251,99,189,
+    157,56,104,202,115,210,243,82,220,102,134,198,202,176,243,154,
+    170,96,140,58,177,128,32,239,192,230,85,236,169,182,132,174,
+    87,205,131,4,156,24,238,67,9,22,4,185,226,132,12,102,
+    213,12,77,9,188,147,236,120,182,188,121,225,37,187,229,155,
+    218,227,200,1,207,61,238,9,240,159,117,231,190,12,220,11,
+    252,26,254,139,196,226,123,82,75,228,23,147,63,7,59,95,
+    6,97,158,219,11,30,168,41,184,95,147,193,223,11,40,1,
+    142,20,201,111,167,172,72,79,142,130,134,63,192,89,249,167,
+    119,228,127,195,101,120,249,19,128,94,226,180,210,91,53,197,
+    141,154,230,5,175,149,222,150,33,107,166,151,191,138,94,169,
+    0,215,203,247,214,134,152,152,181,144,170,170,1,147,134,193,
+    20,171,171,169,91,124,189,172,150,81,105,187,142,240,201,102,
+    69,77,183,216,133,11,61,150,87,166,150,88,197,232,106,144,
+    226,119,152,72,117,148,18,55,107,50,56,98,49,44,13,240,
+    17,115,95,132,55,248,84,45,51,139,157,22,219,69,213,121,
+    192,43,131,137,50,252,107,186,184,14,153,65,161,114,96,73,
+    91,114,199,121,177,34,239,64,246,138,173,152,66,196,215,119,
+    90,7,65,167,188,247,233,219,84,97,49,162,172,249,206,132,
+    108,87,160,96,199,115,93,182,120,220,78,29,247,124,86,209,
+    183,10,176,24,205,8,78,188,228,165,146,34,67,37,153,78,
+    112,147,89,206,176,143,85,50,107,27,27,234,93,152,10,67,
+    173,98,165,110,57,67,5,221,202,247,148,228,12,67,55,50,
+    188,19,84,202,166,129,231,187,19,245,190,247,204,58,161,150,
+    2,19,147,8,157,122,123,204,52,148,249,234,142,181,165,107,
+    243,155,172,114,118,190,147,220,243,189,175,178,213,29,39,221,
+    13,113,169,157,236,178,85,51,237,169,110,8,179,7,10,92,
+    4,59,230,125,32,187,228,223,135,200,200,204,119,233,163,223,
+    166,143,238,109,191,76,47,52,210,11,15,163,205,88,186,30,
+    155,110,14,77,212,227,19,127,155,249,192,37,129,200,140,71,
+    94,198,39,31,94,125,244,105,51,113,232,187,196,236,183,137,
+    217,189,171,47,19,167,26,137,83,46,225,250,103,154,163,211,
+    245,100,251,231,6,129,241,143,129,233,102,252,252,227,139,245,
+    248,249,214,239,117,48,144,136,126,79,128,160,182,232,27,204,
+    228,66,102,204,9,151,74,154,92,97,165,146,19,45,149,42,
+    58,30,101,48,142,151,74,191,170,201,229,246,76,95,169,68,
+    117,5,6,124,238,139,252,154,19,249,252,230,234,242,149,220,
+    181,124,193,233,195,97,174,176,228,68,138,159,231,215,22,175,
+    47,174,220,114,248,171,151,243,55,156,232,226,245,220,226,242,
+    202,205,124,97,205,25,40,2,88,186,117,35,183,84,90,203,
+    47,46,59,225,207,46,127,209,26,13,220,42,230,86,75,32,
+    147,91,93,189,181,130,146,249,207,188,111,74,45,253,17,148,
+    204,23,138,107,69,103,104,37,183,122,181,180,120,243,22,10,
+    151,114,133,203,87,110,228,156,225,125,204,165,124,209,227,14,
+    238,227,174,230,138,185,53,103,100,31,175,103,49,190,156,91,
+    45,228,110,148,86,46,23,242,139,78,172,141,110,222,92,41,
+    58,49,175,229,85,24,164,2,117,130,144,254,198,17,216,180,
+    63,19,99,2,79,141,195,72,132,14,153,196,176,254,197,11,
+    107,231,207,13,132,132,176,75,144,36,73,124,112,119,169,153,
+    60,188,155,111,14,140,238,94,107,141,98,41,224,165,38,118,
+    63,109,166,79,238,22,154,137,241,221,235,175,194,163,110,144,
+    8,67,110,136,140,28,7,94,242,61,144,59,116,174,206,143,
+    54,15,159,175,243,99,205,241,247,235,252,72,115,226,195,58,
+    127,168,57,116,118,247,70,115,240,199,187,203,175,132,164,27,
+    24,22,162,47,130,46,129,215,95,99,222,171,71,94,7,73,
+    40,245,224,103,158,76,143,219,90,6,58,111,207,85,206,150,
+    186,157,207,223,137,160,215,180,251,3,163,6,222,213,236,153,
+    182,40,84,219,15,10,226,37,206,158,2,193,118,147,63,80,
+    202,62,142,179,120,162,96,209,138,176,213,150,40,131,212,109,
+    60,171,160,255,81,188,18,88,236,174,101,143,117,42,240,68,
+    6,78,176,10,168,108,183,71,59,181,214,233,185,29,150,17,
+    233,216,198,86,253,131,30,226,181,209,30,237,53,103,236,123,
+    160,66,97,96,158,218,19,221,54,13,53,107,120,62,182,224,
+    6,158,136,246,73,185,227,97,219,168,119,0,98,207,247,155,
+    243,140,25,120,31,53,240,18,106,224,205,51,19,52,240,194,
+    105,79,47,255,159,14,155,181,197,229,255,221,98,179,246,84,
+    171,209,48,163,162,106,216,104,124,167,176,215,49,236,105,236,
+    74,170,166,154,232,98,173,74,101,111,37,158,175,172,162,27,
+    59,217,104,33,51,2,23,31,184,131,24,193,110,54,207,34,
+    153,67,50,131,36,131,228,4,146,163,72,142,33,57,142,228,
+    36,146,83,72,78,35,249,17,146,44,146,121,36,239,33,57,
+    131,100,1,9,94,152,141,52,146,179,72,186,5,244,54,252,
+    97,235,204,249,200,56,7,16,123,172,249,21,80,56,195,56,
+    206,253,128,112,35,117,146,246,255,220,208,2,7,233,251,223,
+    228,17,255,26,95,223,247,184,101,46,157,12,52,249,147,79,
+    243,141,211,31,187,65,0,175,248,196,163,241,70,106,206,21,
+    0,64,137,9,153,167,153,198,201,139,110,31,194,48,17,6,
+    30,238,52,18,162,27,65,24,37,194,177,189,157,175,239,187,
+    49,68,113,34,100,159,238,60,191,239,246,35,26,32,194,212,
+    94,164,33,46,184,9,132,73,34,140,61,30,111,140,159,113,
+    83,8,7,137,144,108,153,25,66,56,220,81,148,70,52,66,
+    132,212,163,76,99,240,152,59,138,112,140,8,147,143,119,26,
+    83,231,220,113,132,135,136,48,183,247,211,198,209,75,238,97,
+    132,71,136,112,230,69,166,177,144,115,39,16,78,18,97,102,
+    239,124,99,246,19,119,10,161,72,132,217,189,124,99,238,138,
+    59,141,112,134,8,226,222,120,99,250,146,59,139,112,142,28,
+    155,111,28,205,53,51,11,141,204,199,205,19,103,26,39,46,
+    185,25,156,32,29,178,27,119,223,39,161,19,79,199,159,79,
+    214,249,159,188,130,205,56,255,252,163,58,127,193,141,8,99,
+    129,58,25,110,253,188,88,253,7,59,161,17,79,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/simulate/exit_event.py",
+    "gem5.simulate.exit_event",
+    embedded_module_data,
+    2077,
+    3681);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,237 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,205,89,91,111,27,215,17,222,11,47,43,138,186,81,
+    20,69,81,182,179,113,108,199,116,108,42,242,37,105,12,87,
+    141,236,198,113,37,75,114,99,181,13,244,66,173,184,135,210,
+    90,188,117,119,105,89,42,21,168,64,208,200,129,209,186,15,
+    65,12,164,1,244,80,164,9,210,2,46,144,0,126,236,15,
+    104,1,82,101,33,98,1,23,6,218,160,241,75,193,34,45,
+    16,228,165,157,57,187,220,93,210,180,172,135,222,200,195,217,
+    221,115,153,61,103,102,206,55,51,135,127,98,92,159,14,235,
+    250,197,95,129,188,203,200,140,204,102,152,44,59,199,178,120,
+    207,101,184,44,63,199,103,61,115,30,250,204,103,188,115,62,
+    184,122,50,254,172,48,39,208,58,111,166,35,27,152,11,192,
+    189,79,246,103,58,179,193,185,32,189,23,50,93,217,238,185,
+    110,122,223,145,233,201,246,206,245,178,240,58,57,64,120,185,
+    147,244,201,65,210,151,246,201,93,111,122,230,66,114,247,155,
+    204,92,191,220,67,130,105,78,238,133,154,176,220,7,53,3,
+    242,1,57,68,60,132,29,178,167,11,237,253,111,122,231,34,
+    114,24,218,7,229,1,160,81,57,2,116,8,122,178,242,32,
+    233,77,123,228,40,112,136,117,224,187,158,162,181,49,18,144,
+    135,201,176,188,143,12,167,5,121,63,140,223,39,243,87,153,
+    184,248,16,89,198,89,195,115,69,210,151,226,156,209,241,42,
+    201,17,85,210,243,170,33,204,20,116,37,159,147,50,211,31,
+    65,251,138,164,230,160,95,199,229,124,190,80,200,43,57,253,
+    33,103,142,236,27,95,208,116,85,74,233,87,212,124,138,104,
+    90,94,133,202,254,171,43,138,158,90,146,22,50,196,93,221,
+    123,85,201,210,193,175,17,45,95,84,83,196,224,23,73,206,
+    240,232,171,5,98,248,72,58,77,82,122,138,119,233,134,183,
+    126,95,196,128,188,197,188,197,190,197,189,203,108,114,155,204,
+    38,155,230,101,246,77,97,157,47,225,58,184,181,228,184,40,
+    147,84,94,213,113,238,98,26,126,139,141,149,104,226,202,146,
+    146,90,18,87,148,76,70,44,168,240,122,81,18,113,61,74,
+    110,81,212,151,36,93,84,160,104,162,20,16,225,35,147,180,
+    84,204,232,206,240,4,173,78,185,77,198,15,191,111,224,180,
+    102,129,188,195,79,50,44,24,142,206,58,29,100,246,166,231,
+    61,48,158,155,28,80,254,125,239,7,208,246,177,221,206,50,
+    28,115,147,47,49,10,83,98,127,206,254,152,125,5,140,232,
+    7,252,119,153,119,185,31,81,35,131,5,121,166,215,14,77,
+    231,197,5,178,36,93,87,96,49,43,146,38,106,68,23,23,
+    86,97,198,68,44,106,196,92,228,90,36,33,126,211,154,177,
+    221,25,214,242,21,155,80,125,168,32,175,225,145,212,69,205,
+    240,47,175,36,241,70,237,129,90,181,11,73,55,16,205,11,
+    68,20,55,54,54,190,26,213,212,212,72,97,85,95,202,231,
+    70,22,73,246,204,136,166,100,139,25,73,39,35,228,134,162,
+    39,201,117,146,211,147,142,80,19,133,85,163,111,69,149,10,
+    5,34,59,213,107,163,40,216,164,37,196,36,85,9,21,226,
+    185,76,62,37,101,180,177,196,35,67,78,227,52,150,129,124,
+    249,57,243,57,179,193,220,23,130,117,142,237,74,220,61,93,
+    103,224,66,73,237,208,177,58,223,120,160,228,111,60,223,17,
+    248,59,3,164,78,137,192,132,7,111,159,186,227,41,247,31,
+    221,242,3,193,34,60,182,124,129,106,248,8,196,236,72,194,
+    20,76,4,39,227,1,50,63,63,47,170,3,112,99,68,218,
+    175,72,197,45,57,130,221,159,199,185,127,249,229,6,83,15,
+    120,189,241,58,179,43,233,102,130,251,203,158,125,234,32,12,
+    106,178,41,180,142,103,208,166,66,64,76,139,130,237,203,130,
+    85,0,16,221,242,130,137,255,144,26,226,248,163,22,74,45,
+    65,202,137,168,39,145,234,41,33,126,75,55,237,93,37,122,
+    81,205,137,243,243,179,106,145,204,207,31,23,149,156,172,164,
+    36,189,97,251,148,39,154,212,85,83,219,192,73,45,230,196,
+    12,108,115,81,91,202,23,51,50,101,107,110,130,89,53,138,
+    66,162,4,23,96,10,168,155,218,135,61,27,117,24,42,199,
+    80,48,40,33,83,167,245,0,235,237,175,117,135,54,3,248,
+    5,85,122,251,41,3,163,163,208,128,135,148,107,251,48,158,
+    134,48,114,182,48,220,219,171,196,232,156,243,244,1,220,127,
+    108,63,175,179,29,176,173,212,193,18,179,229,234,227,234,13,
+    191,143,237,39,83,188,57,143,204,89,130,62,16,231,215,126,
+    177,187,160,69,141,130,91,179,184,211,84,136,246,106,28,60,
+    105,131,132,199,161,47,180,59,108,169,166,44,174,32,107,113,
+    6,120,169,43,138,70,196,92,30,186,130,170,176,7,101,183,
+    132,187,39,103,169,227,98,156,55,2,138,166,228,52,93,202,
+    165,136,218,137,34,245,153,140,226,156,186,15,31,187,20,45,
+    169,217,115,208,56,186,223,77,197,245,154,245,46,213,61,13,
+    213,175,162,234,166,109,213,253,35,200,12,60,117,103,245,15,
+    199,190,94,9,143,85,195,99,27,83,117,206,227,141,214,58,
+    163,184,241,162,181,208,240,78,232,224,118,232,96,37,116,168,
+    26,58,84,14,58,229,65,104,112,115,18,191,245,14,24,240,
+    168,197,115,13,37,191,237,178,120,221,213,225,154,173,242,189,
+    168,146,125,220,88,183,67,121,236,88,219,0,198,193,0,254,
+    98,25,64,179,226,229,60,106,2,68,173,107,186,146,18,229,
+    98,182,0,187,78,134,45,6,200,236,222,113,8,212,104,13,
+    22,128,130,19,165,252,112,164,130,67,53,58,12,122,228,76,
+    38,78,63,87,159,68,192,212,177,179,53,177,221,222,155,244,
+    85,169,124,14,54,114,145,136,82,90,7,135,64,110,144,84,
+    209,218,217,196,113,7,121,106,155,148,91,139,83,3,3,242,
+    24,92,246,140,225,165,171,50,60,56,29,195,75,87,208,186,
+    203,195,216,150,164,77,46,131,121,22,154,190,131,6,115,214,
+    54,152,122,47,239,13,223,23,2,183,132,159,116,189,221,117,
+    179,231,86,207,102,143,249,216,253,118,119,69,136,86,133,104,
+    89,136,214,186,251,55,59,241,91,247,67,119,19,12,186,83,
+    75,36,181,76,3,132,164,172,52,35,130,208,48,150,63,218,
+    198,82,98,180,152,204,66,132,6,209,218,58,168,78,247,58,
+    221,75,236,53,91,237,205,206,119,29,141,204,197,249,154,199,
+    30,3,81,157,222,233,180,52,245,242,181,55,156,102,222,239,
+    49,239,115,107,192,97,203,255,100,147,107,13,9,100,175,101,
+    128,51,113,223,218,159,219,26,160,46,45,163,114,37,209,145,
+    147,99,118,208,72,154,154,160,90,95,178,53,175,228,10,69,
+    93,44,64,148,215,48,62,49,85,84,85,0,47,183,249,129,
+    155,80,82,203,218,252,252,127,195,250,84,43,130,244,231,105,
+    160,169,205,174,121,82,5,61,113,49,46,168,168,105,245,24,
+    18,212,162,225,203,23,117,48,8,35,224,172,206,224,33,234,
+    52,252,176,6,156,177,33,72,90,178,144,215,148,27,0,123,
+    71,27,131,155,192,110,72,147,174,147,164,203,194,28,35,70,
+    7,142,200,164,149,92,70,204,4,99,0,112,222,68,77,56,
+    80,110,46,159,13,237,191,179,248,179,92,101,232,68,117,232,
+    196,102,119,157,227,76,123,239,186,253,70,249,232,249,95,105,
+    159,158,252,228,236,175,207,125,114,174,50,242,114,117,228,101,
+    168,130,82,25,60,191,19,185,188,29,185,92,137,76,87,35,
+    211,21,97,166,42,204,148,133,25,103,27,120,57,107,27,180,
+    199,200,105,230,223,131,145,54,206,61,3,56,119,195,82,114,
+    147,51,162,91,92,51,1,12,81,1,93,156,10,97,167,146,
+    37,86,160,12,129,92,134,200,212,244,228,60,209,208,73,81,
+    32,179,99,9,115,220,2,1,163,37,38,191,134,93,100,29,
+    207,101,42,249,16,146,35,204,163,81,197,128,9,53,148,149,
+    75,87,39,161,13,215,175,61,231,232,42,192,53,0,167,61,
+    194,252,47,68,59,222,78,180,40,164,189,72,182,157,140,14,
+    183,145,145,137,201,173,34,194,128,250,13,20,209,81,71,68,
+    2,247,8,38,63,73,62,237,3,82,206,14,72,249,181,98,
+    219,53,90,22,97,134,45,232,227,0,56,112,201,174,112,201,
+    1,23,23,246,180,195,148,230,56,169,33,151,246,81,168,182,
+    172,20,92,82,120,129,193,140,177,57,10,13,178,222,176,179,
+    108,136,66,45,199,35,104,86,94,154,114,43,218,219,16,192,
+    54,107,187,28,118,171,157,37,180,152,194,58,39,179,235,188,
+    204,173,123,192,160,92,209,199,53,155,59,186,154,18,111,187,
+    139,61,68,40,173,238,162,196,149,120,231,80,96,29,184,201,
+    222,53,72,102,48,33,214,59,28,46,37,174,121,228,50,165,
+    170,92,242,52,115,88,166,115,83,95,255,63,157,111,176,253,
+    124,239,190,190,167,209,94,217,103,7,250,188,101,192,191,139,
+    251,165,75,208,113,55,79,11,182,169,43,133,12,113,121,85,
+    141,182,131,79,188,66,159,28,255,139,238,197,246,116,238,254,
+    138,105,254,243,243,205,209,13,228,151,212,27,55,188,180,195,
+    243,89,204,209,200,141,196,127,210,3,139,69,24,153,17,37,
+    12,28,220,239,118,102,219,216,18,201,12,196,163,48,217,37,
+    73,163,49,70,206,202,107,92,49,136,227,205,31,254,19,62,
+    179,107,65,244,227,13,158,15,81,27,23,227,94,35,186,136,
+    120,222,96,11,168,165,234,73,76,93,52,19,229,142,35,193,
+    132,218,224,51,36,23,247,154,126,252,69,172,232,106,154,140,
+    225,77,229,97,250,70,32,35,105,22,31,235,24,67,108,56,
+    251,103,26,3,32,247,121,172,219,127,25,122,254,20,126,90,
+    148,181,17,34,204,12,236,223,9,159,217,14,159,169,132,95,
+    172,134,95,220,152,170,5,187,54,94,169,245,245,111,76,212,
+    185,176,119,208,118,244,99,119,139,64,160,84,6,199,118,34,
+    151,182,35,151,42,145,137,106,100,162,34,76,86,133,201,178,
+    48,89,27,56,184,117,166,58,16,223,12,212,132,174,219,125,
+    55,3,155,94,200,254,187,66,239,92,184,211,85,9,31,169,
+    134,143,108,7,143,148,131,71,62,60,123,111,255,111,138,213,
+    151,166,182,159,155,42,63,55,245,89,176,251,214,212,157,177,
+    242,241,243,247,206,0,129,82,25,62,191,19,187,188,29,187,
+    92,137,77,87,99,211,149,224,76,53,56,83,14,206,212,134,
+    142,108,21,49,4,153,168,5,251,110,127,251,230,196,230,43,
+    245,142,39,191,0,143,32,250,222,57,117,123,189,210,127,184,
+    218,127,120,187,243,112,185,243,112,173,145,171,109,78,62,8,
+    69,54,39,240,91,143,195,122,41,64,206,26,29,153,198,185,
+    159,209,91,44,200,146,78,32,21,64,155,188,78,52,163,135,
+    30,0,32,214,39,73,182,160,175,166,60,206,142,116,80,244,
+    107,14,138,242,234,193,166,116,158,221,114,135,250,123,66,148,
+    117,79,14,81,214,83,130,212,125,153,226,145,186,8,124,246,
+    224,168,215,189,37,175,122,190,196,169,97,232,191,167,220,208,
+    141,48,215,236,36,3,48,145,47,121,109,76,244,49,109,62,
+    79,192,68,143,236,89,27,196,181,52,130,127,103,53,119,23,
+    27,152,37,251,175,50,113,65,186,199,239,142,85,77,161,63,
+    214,227,73,237,149,230,28,225,73,24,213,140,80,45,248,244,
+    26,89,68,4,82,100,203,125,31,85,18,36,33,30,196,173,
+    110,54,141,62,31,199,55,229,115,153,85,138,20,90,243,156,
+    148,116,83,214,113,229,130,120,1,183,49,229,85,144,20,243,
+    200,4,2,130,197,156,146,86,82,146,171,139,120,5,154,19,
+    102,160,1,69,38,0,118,89,37,71,228,198,188,237,165,82,
+    102,217,188,92,204,144,68,107,124,65,97,179,129,152,154,13,
+    153,138,5,152,205,129,6,101,116,182,32,169,82,182,69,42,
+    103,197,239,45,17,8,107,245,188,45,78,183,40,19,238,145,
+    248,74,172,61,75,231,98,207,82,204,47,92,35,41,29,79,
+    113,237,37,192,196,210,202,98,81,181,142,1,82,170,82,208,
+    221,172,90,54,221,217,198,137,147,99,11,214,105,157,217,145,
+    182,53,58,139,41,91,208,143,251,40,57,48,153,172,249,114,
+    107,70,144,115,97,202,120,77,131,170,180,146,33,199,205,19,
+    11,8,226,204,55,237,202,111,129,216,71,142,212,252,168,218,
+    204,211,52,240,35,118,147,123,133,45,32,242,248,21,210,64,
+    82,111,163,92,37,189,235,156,208,217,129,73,193,219,96,54,
+    75,168,187,5,130,71,48,138,150,202,67,32,78,228,214,21,
+    66,251,174,12,247,188,66,245,37,196,39,196,166,181,128,179,
+    95,84,60,51,185,56,59,29,247,171,231,224,206,232,68,255,
+    8,222,12,46,154,17,194,7,107,175,128,214,177,191,49,216,
+    138,188,73,170,216,86,255,25,247,153,174,115,28,201,121,36,
+    23,40,123,61,175,75,153,36,110,53,205,240,153,44,53,68,
+    45,115,49,150,227,180,113,126,23,199,57,1,61,63,133,159,
+    246,91,198,118,156,9,70,24,196,124,121,232,126,100,232,78,
+    124,39,54,178,29,27,169,196,70,171,177,209,74,228,100,53,
+    114,18,35,238,7,145,40,132,221,62,166,51,114,167,111,59,
+    16,43,7,98,181,190,216,78,223,137,237,190,19,149,190,145,
+    106,223,200,166,175,30,96,130,33,60,88,156,97,107,61,79,
+    225,73,255,233,90,239,208,78,239,232,118,239,104,165,247,84,
+    181,247,84,185,247,212,253,134,139,28,191,23,1,2,165,50,
+    60,190,19,155,220,142,77,86,98,83,213,216,84,37,56,93,
+    13,78,151,131,211,53,161,255,246,247,33,35,220,236,116,194,
+    254,65,215,251,235,49,166,179,103,99,162,241,165,206,46,206,
+    78,199,185,217,217,248,126,195,143,0,152,81,22,172,67,8,
+    125,181,0,80,161,162,115,83,209,11,24,66,246,76,130,38,
+    95,84,1,134,31,30,33,252,202,168,120,250,131,209,14,60,
+    171,214,31,93,90,194,22,172,138,71,89,198,209,84,30,34,
+    148,28,65,200,176,79,141,181,132,100,253,153,150,180,235,212,
+    0,118,63,214,190,187,115,176,235,26,64,79,129,67,206,155,
+    27,119,106,16,103,126,2,9,198,209,244,156,158,158,248,210,
+    83,60,122,10,66,211,107,154,64,210,252,137,134,72,134,103,
+    33,159,207,80,165,183,228,92,95,9,231,76,172,29,83,103,
+    25,51,97,212,126,15,20,50,43,150,173,191,192,176,67,101,
+    38,234,46,117,142,103,57,208,238,19,73,128,97,123,55,122,
+    240,91,107,230,0,229,1,147,40,55,151,7,204,165,114,115,
+    169,49,151,203,205,165,198,140,150,155,75,221,195,177,158,122,
+    32,200,238,223,234,168,51,112,185,219,79,47,247,82,244,210,
+    74,14,248,88,104,183,73,168,147,141,150,197,209,58,3,215,
+    86,178,175,147,13,227,157,69,246,117,227,29,144,15,151,238,
+    234,191,204,209,219,86,114,208,143,119,54,9,251,240,206,38,
+    161,150,214,167,217,193,90,56,90,231,241,122,232,52,189,214,
+    153,102,50,205,50,7,14,214,246,137,245,142,99,108,79,157,
+    1,66,71,192,245,65,79,180,238,197,74,31,51,56,92,247,
+    227,157,192,68,98,78,199,118,132,42,253,95,202,24,34,186,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/simulate/exit_event_generators.py",
+    "gem5.simulate.exit_event_generators",
+    embedded_module_data,
+    3408,
+    7991);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,474 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,173,59,91,108,27,87,118,51,124,14,201,145,72,73,
+    148,245,162,165,145,44,217,162,44,83,242,67,126,202,113,28,
+    203,246,58,137,101,39,82,178,129,214,41,69,115,70,22,109,
+    62,148,153,161,109,113,149,117,118,55,69,149,172,208,85,22,
+    90,132,187,171,109,216,194,187,80,186,73,235,143,22,240,103,
+    209,143,126,22,164,48,133,9,2,46,92,20,139,52,237,71,
+    153,38,219,2,249,104,123,206,157,225,112,134,164,28,47,90,
+    138,58,115,231,190,239,185,231,158,115,238,57,135,255,76,25,
+    62,54,237,249,229,175,1,124,72,241,212,28,197,211,188,37,
+    78,207,209,240,180,198,45,9,235,156,149,198,60,91,220,150,
+    176,207,217,19,142,57,71,194,57,231,76,48,115,76,194,53,
+    231,162,213,250,238,57,15,60,237,113,54,209,52,215,4,121,
+    14,222,25,111,78,120,231,188,36,205,196,125,137,150,185,22,
+    72,187,120,119,188,53,209,54,215,70,83,22,234,34,197,123,
+    222,165,120,246,215,22,138,250,141,165,50,165,57,63,41,105,
+    130,146,230,154,146,118,222,50,67,5,189,145,5,200,114,95,
+    21,196,88,138,143,69,185,225,153,203,103,95,157,157,57,32,
+    201,203,113,33,200,73,145,196,82,60,150,188,193,45,164,68,
+    78,94,20,56,73,230,227,177,235,220,76,44,145,142,71,228,
+    148,24,114,187,103,33,251,78,74,188,21,79,69,120,46,38,
+    113,146,90,38,240,92,68,226,34,156,40,44,9,17,25,251,
+    144,132,183,210,66,50,42,112,169,5,110,105,49,34,9,210,
+    40,39,68,162,139,110,49,157,76,98,133,8,151,76,39,174,
+    11,34,86,136,37,37,89,76,71,229,88,42,41,113,169,36,
+    148,73,130,140,5,209,148,40,72,152,136,184,103,238,196,228,
+    232,98,228,122,92,184,42,166,162,130,36,165,196,147,110,55,
+    199,29,12,113,11,17,73,62,0,147,190,19,17,121,110,88,
+    8,221,8,141,114,47,189,126,153,131,101,192,180,19,176,82,
+    181,31,232,97,49,149,150,57,168,151,128,41,4,71,161,249,
+    33,104,158,78,146,161,35,241,74,73,165,147,186,214,92,20,
+    150,32,72,164,229,225,16,199,11,114,36,22,135,197,235,237,
+    16,109,122,46,105,55,202,37,83,50,151,16,34,82,90,20,
+    120,210,242,136,161,165,86,144,16,146,242,40,119,103,49,22,
+    93,228,150,99,66,156,71,60,8,234,150,8,128,247,153,202,
+    222,72,114,106,9,230,178,40,36,201,22,69,83,201,133,24,
+    79,16,29,75,202,130,120,27,22,1,232,34,187,71,218,226,
+    8,178,8,139,136,73,110,92,65,76,109,39,71,196,27,128,
+    98,81,128,205,139,221,22,56,65,20,83,226,104,181,223,68,
+    228,46,236,108,194,176,71,106,119,18,246,35,226,70,10,252,
+    40,34,88,111,161,83,133,144,228,165,144,251,115,164,187,233,
+    32,93,114,79,167,196,68,36,62,21,147,228,160,189,196,156,
+    139,196,227,184,137,37,219,84,44,42,151,92,23,133,164,32,
+    34,113,149,152,43,75,234,46,148,236,179,105,24,10,218,58,
+    98,73,216,214,196,231,72,200,240,218,116,246,58,208,73,36,
+    42,191,144,130,157,134,140,182,6,68,241,57,173,86,118,157,
+    191,27,147,207,223,6,188,70,27,158,219,13,114,110,5,10,
+    206,43,53,103,225,233,57,43,239,227,173,130,109,193,194,219,
+    222,133,243,202,219,5,27,158,198,5,27,207,188,107,155,115,
+    240,14,193,9,101,46,72,51,144,198,122,110,72,187,180,180,
+    7,210,110,45,205,66,218,3,105,86,176,225,123,151,62,56,
+    148,53,65,89,147,86,175,25,210,205,144,246,66,218,11,105,
+    31,239,132,83,218,82,242,145,221,22,102,100,216,27,73,142,
+    69,165,140,8,84,195,113,175,106,71,71,210,11,200,209,168,
+    217,233,81,149,82,225,124,17,196,31,136,44,45,137,41,216,
+    205,8,98,151,244,179,3,209,196,100,9,201,49,25,34,149,
+    62,251,254,79,207,253,40,254,217,191,159,41,185,171,245,163,
+    150,26,84,90,17,149,219,42,11,164,87,232,168,229,174,229,
+    22,41,20,29,188,150,146,90,146,52,77,201,116,181,33,111,
+    253,53,188,253,70,207,249,1,180,92,161,194,250,187,108,175,
+    214,69,246,250,27,253,45,103,165,26,124,120,203,10,157,193,
+    167,45,227,129,22,166,190,161,223,202,150,83,55,240,77,239,
+    155,183,195,155,195,244,230,212,223,28,176,17,206,204,71,4,
+    19,248,57,185,20,17,35,9,3,230,78,114,179,230,227,23,
+    23,110,11,250,217,211,209,170,49,146,241,208,137,19,199,244,
+    206,26,124,84,150,43,10,200,116,35,73,30,25,25,47,220,
+    142,145,61,3,22,2,204,21,14,174,202,174,131,33,189,35,
+    17,183,67,108,2,144,217,215,112,58,137,180,36,115,215,113,
+    62,220,240,248,40,119,48,24,18,221,80,251,179,202,58,167,
+    131,76,201,253,122,36,158,22,206,35,3,16,91,177,63,196,
+    113,201,25,75,222,14,71,249,133,146,37,156,41,57,181,195,
+    95,178,135,145,64,74,214,112,226,80,208,82,178,73,66,124,
+    129,180,145,112,34,28,247,245,160,36,70,199,150,150,129,205,
+    38,199,110,8,137,137,177,138,124,24,171,8,151,208,210,114,
+    137,9,135,99,201,152,28,14,103,186,106,41,61,84,41,154,
+    194,94,101,0,239,80,101,55,229,107,89,63,153,247,246,195,
+    119,155,192,28,173,62,213,239,227,214,64,126,247,133,66,235,
+    69,165,245,98,158,189,88,236,30,92,181,173,121,33,247,131,
+    209,141,209,71,173,123,183,91,247,110,209,91,47,126,220,252,
+    176,191,176,239,84,161,117,82,105,157,132,26,206,98,71,23,
+    60,216,39,237,157,240,112,23,219,118,193,131,89,133,191,47,
+    17,55,37,251,109,68,76,201,33,10,114,90,76,78,155,104,
+    223,81,161,253,191,39,180,191,66,221,172,210,168,129,210,171,
+    159,21,218,76,151,52,133,52,127,83,239,51,3,251,242,182,
+    101,133,186,75,87,243,86,44,178,211,208,131,97,12,115,95,
+    72,245,25,160,130,168,37,92,109,139,61,233,148,191,98,169,
+    31,45,99,215,91,233,245,120,106,134,250,152,158,14,218,197,
+    78,196,128,3,120,7,176,115,17,57,88,201,26,23,146,98,
+    55,164,130,86,177,7,233,164,143,32,137,23,226,114,68,178,
+    146,253,231,196,0,169,25,225,249,140,191,110,107,33,247,85,
+    220,213,40,217,213,34,195,174,177,143,152,158,109,166,39,123,
+    190,192,12,40,204,64,158,25,40,250,218,179,182,77,119,193,
+    55,176,106,135,26,171,238,53,247,186,240,203,104,110,240,254,
+    104,161,119,76,233,29,43,236,26,43,48,99,152,143,197,204,
+    26,179,126,62,251,90,110,246,254,92,97,247,88,193,63,94,
+    96,198,49,19,55,81,236,133,113,162,198,205,176,86,54,109,
+    132,108,154,145,37,1,114,244,55,51,114,103,40,113,0,23,
+    109,17,7,113,209,136,151,143,105,130,0,9,235,104,75,118,
+    134,195,128,30,160,232,206,6,20,77,74,222,192,22,173,100,
+    233,143,189,173,235,71,54,38,11,94,78,241,114,121,134,171,
+    159,41,93,153,169,143,170,37,175,202,124,104,178,43,226,112,
+    205,68,108,120,64,51,237,117,179,192,236,239,96,93,183,138,
+    125,111,219,90,38,207,116,213,15,173,83,246,39,191,7,146,
+    120,90,227,250,172,108,171,214,191,169,115,235,25,19,79,55,
+    208,37,117,83,207,127,198,145,44,132,118,235,248,60,240,107,
+    107,166,119,86,215,123,26,240,81,149,247,17,118,25,116,84,
+    119,19,80,22,145,23,75,214,36,48,54,155,244,150,40,19,
+    34,175,67,172,29,180,97,225,118,102,87,29,102,73,254,31,
+    96,237,41,130,218,223,122,154,87,229,181,149,130,39,160,120,
+    2,217,183,182,61,92,222,195,61,110,235,216,56,190,122,229,
+    49,160,125,57,235,223,236,252,213,204,150,255,147,64,97,232,
+    168,50,116,244,97,75,97,232,100,161,235,84,193,59,169,120,
+    39,243,204,228,83,54,101,149,170,165,135,149,29,24,142,89,
+    112,226,97,55,109,129,190,53,178,203,132,118,189,142,25,189,
+    245,12,7,16,78,103,142,126,43,18,87,37,222,157,24,15,
+    74,135,38,254,158,162,149,18,5,3,208,223,129,56,30,71,
+    112,0,193,24,2,125,75,234,144,239,94,132,113,194,100,140,
+    76,79,221,14,84,11,121,108,55,78,182,225,9,160,250,78,
+    214,255,81,247,207,187,127,22,216,12,20,188,67,159,218,62,
+    113,253,245,158,7,252,95,197,11,135,206,41,135,206,21,134,
+    167,148,225,169,130,119,42,207,76,61,133,89,188,170,161,60,
+    215,8,203,53,104,126,155,54,82,46,104,37,110,51,45,171,
+    122,202,130,165,202,84,14,225,114,187,212,52,225,170,152,161,
+    137,83,117,237,109,85,108,134,43,216,204,12,214,33,161,65,
+    173,69,236,106,132,96,163,216,222,245,97,248,39,225,66,251,
+    94,165,125,239,170,187,232,243,111,184,179,115,5,223,62,32,
+    195,238,7,55,11,193,231,243,222,179,121,230,108,61,30,116,
+    45,239,63,169,255,79,126,176,98,224,2,160,41,18,201,36,
+    14,0,150,13,68,186,19,150,107,122,213,117,184,36,92,188,
+    177,231,103,233,67,246,154,214,161,247,215,144,208,109,153,69,
+    228,44,72,103,223,76,232,250,157,74,78,233,20,63,170,171,
+    108,211,145,105,85,63,95,16,238,8,168,243,69,224,250,116,
+    39,85,185,94,105,60,138,232,117,126,0,65,198,112,42,200,
+    73,9,81,26,193,16,74,41,89,225,138,4,2,247,186,84,
+    119,102,154,43,19,9,147,203,93,166,175,142,100,204,21,226,
+    148,46,155,127,231,160,88,239,142,76,172,232,241,174,157,204,
+    182,188,127,102,245,76,177,111,207,71,247,126,126,175,208,55,
+    174,244,141,231,219,78,252,244,200,198,241,245,227,15,162,121,
+    246,4,72,152,31,223,123,255,158,42,228,126,117,56,39,223,
+    207,252,233,153,251,103,10,222,67,121,230,80,61,153,161,162,
+    67,200,236,239,168,103,63,110,215,44,120,228,222,182,200,134,
+    107,129,81,205,169,189,10,84,9,16,250,55,144,208,78,253,
+    27,249,33,40,80,150,27,160,160,229,28,223,220,142,167,55,
+    241,2,97,153,6,70,71,118,110,63,85,225,118,68,195,62,
+    130,224,56,128,160,83,77,87,247,184,203,92,147,84,82,245,
+    45,80,192,82,119,74,182,197,216,141,69,179,186,229,148,83,
+    225,155,82,42,217,64,247,208,74,210,80,77,66,17,5,140,
+    192,223,249,200,63,186,237,31,45,248,67,138,63,244,158,107,
+    213,186,58,251,219,142,238,236,145,205,201,66,199,176,210,49,
+    12,53,54,94,68,126,49,247,147,185,15,174,109,92,43,118,
+    247,110,142,21,7,129,83,228,78,21,123,7,30,245,30,220,
+    238,61,88,232,61,172,244,30,46,55,57,125,238,50,165,2,
+    151,155,236,42,40,38,45,248,104,65,53,63,25,73,8,225,
+    112,201,29,14,39,82,124,58,142,105,54,28,126,43,29,137,
+    107,37,160,55,241,169,40,36,236,11,241,84,68,22,119,227,
+    162,247,82,42,97,203,98,208,140,60,194,44,25,19,6,69,
+    220,32,113,18,192,199,20,25,159,224,68,244,85,192,115,184,
+    244,113,26,151,94,249,43,91,172,118,166,76,33,112,179,246,
+    142,50,5,32,55,65,30,181,32,96,179,31,204,182,151,41,
+    120,228,142,144,71,45,96,105,123,127,182,173,76,193,163,22,
+    56,104,123,247,186,128,233,238,90,224,176,217,79,175,167,177,
+    135,211,181,128,181,216,207,211,217,243,101,10,159,13,32,99,
+    177,191,64,231,94,219,154,120,48,180,53,169,12,29,199,236,
+    23,232,6,144,113,218,15,231,236,176,49,246,195,181,160,213,
+    101,119,103,253,101,10,30,59,2,21,153,136,66,147,253,164,
+    98,204,248,50,78,215,218,79,92,84,237,31,63,192,51,130,
+    141,119,9,118,129,88,79,170,150,16,222,45,48,245,185,134,
+    114,207,55,148,179,130,147,111,130,58,174,27,148,224,222,161,
+    78,51,148,187,13,239,94,193,205,251,160,93,11,228,59,13,
+    249,173,130,135,111,227,45,11,157,188,255,93,251,28,203,183,
+    9,77,66,51,90,101,76,150,155,118,98,161,217,195,119,194,
+    179,5,234,120,32,175,11,210,173,144,246,66,15,22,232,193,
+    106,106,209,13,165,109,90,205,30,72,251,249,128,224,224,119,
+    107,163,57,248,94,200,107,215,223,109,124,31,188,239,226,7,
+    121,14,158,29,208,14,214,197,247,67,186,147,88,111,135,74,
+    222,138,229,86,61,231,98,100,13,136,159,72,150,41,17,216,
+    184,196,45,85,44,187,186,41,151,216,135,116,211,156,188,40,
+    166,210,55,22,185,249,249,203,103,223,8,95,154,158,153,157,
+    153,159,231,132,187,49,153,244,34,160,181,76,10,185,201,203,
+    249,187,100,16,146,62,160,126,212,130,80,8,196,30,47,28,
+    184,30,79,69,111,157,60,233,214,69,219,82,197,4,199,157,
+    70,155,49,114,162,122,243,220,176,201,10,2,74,186,136,230,
+    226,48,154,74,195,242,242,146,112,250,220,213,215,102,225,41,
+    133,94,122,253,242,168,185,50,233,173,81,213,43,135,205,53,
+    147,233,4,169,38,157,62,88,45,8,234,169,80,168,106,66,
+    81,229,46,78,185,6,185,230,137,94,71,139,227,105,2,205,
+    67,161,237,57,172,217,158,79,15,15,144,5,13,140,114,7,
+    199,195,227,227,228,63,104,174,175,217,123,177,42,89,14,169,
+    219,168,98,197,66,28,70,219,114,122,233,180,218,163,185,142,
+    106,197,85,197,247,233,241,208,248,225,70,171,149,42,230,123,
+    117,91,212,244,176,113,65,92,42,25,70,34,8,19,2,56,
+    173,161,36,100,202,29,14,6,107,113,22,34,139,29,214,251,
+    111,48,100,72,76,39,135,131,6,10,1,166,62,108,104,94,
+    35,167,112,16,82,25,181,45,213,107,192,69,68,129,187,1,
+    212,157,68,35,216,252,252,48,238,43,119,75,88,30,53,121,
+    13,130,243,243,196,122,13,101,168,115,65,57,122,39,34,164,
+    51,124,209,244,181,6,4,185,79,82,237,244,33,117,80,157,
+    134,137,233,140,172,16,61,18,208,88,51,157,106,14,9,236,
+    109,33,38,66,29,50,207,170,205,53,121,32,35,136,41,14,
+    238,252,55,228,197,16,119,85,93,133,144,228,85,83,121,36,
+    185,76,58,66,99,31,156,200,138,30,153,22,69,64,178,214,
+    189,106,95,151,176,36,38,106,61,141,114,18,170,147,49,52,
+    192,19,93,51,201,11,60,233,9,77,135,18,156,161,184,112,
+    64,237,20,253,17,218,137,87,77,135,100,110,176,245,87,83,
+    177,234,249,126,97,25,72,108,33,146,142,203,163,154,154,74,
+    220,4,6,131,50,142,132,37,151,174,158,107,60,79,62,13,
+    251,121,67,91,142,96,118,101,84,28,30,104,122,36,84,198,
+    69,145,95,112,209,229,40,170,185,220,217,36,108,10,180,18,
+    43,3,71,65,17,190,94,65,114,98,41,141,62,165,235,203,
+    48,153,138,123,6,106,196,209,202,29,145,201,104,136,81,152,
+    21,162,202,56,114,197,226,186,32,166,18,164,179,249,249,170,
+    255,10,15,11,208,38,18,158,52,28,75,70,213,38,145,248,
+    233,89,49,45,16,18,2,108,145,82,66,118,176,70,65,214,
+    198,35,125,105,228,80,63,170,102,147,157,38,138,251,103,15,
+    123,255,240,223,94,121,248,39,103,136,34,244,57,202,209,11,
+    37,59,65,66,201,169,53,42,177,70,198,81,114,168,135,188,
+    228,173,57,245,37,135,138,157,18,107,60,234,68,53,44,121,
+    18,177,100,184,98,152,245,36,34,119,245,23,55,159,78,44,
+    133,201,58,68,14,5,56,107,16,224,186,41,225,95,137,0,
+    95,161,115,84,163,79,205,189,150,53,169,216,166,251,151,217,
+    213,40,121,141,54,75,158,110,104,233,175,218,127,88,147,69,
+    222,242,46,197,91,87,172,232,130,89,65,7,137,125,197,194,
+    59,170,34,117,197,190,96,129,92,231,10,192,5,219,84,157,
+    178,94,181,230,175,24,110,133,60,99,16,245,134,222,120,231,
+    45,178,38,209,107,188,11,242,174,186,25,59,150,28,208,31,
+    99,24,71,55,153,172,56,225,205,93,121,147,59,12,56,114,
+    241,110,51,102,160,166,190,15,43,110,120,107,210,223,60,240,
+    214,172,247,210,103,232,133,169,243,102,248,170,107,129,183,22,
+    211,91,171,254,134,61,182,85,223,64,125,96,35,239,87,180,
+    5,252,104,14,13,66,149,170,47,67,147,5,119,22,83,82,
+    29,31,188,46,104,188,180,254,211,128,165,134,106,71,209,136,
+    94,29,199,236,30,5,134,200,147,243,220,216,27,188,163,207,
+    68,231,47,160,243,232,110,210,154,97,141,71,172,226,175,249,
+    230,33,225,222,254,52,79,13,103,118,55,95,23,228,59,2,
+    240,245,202,253,189,118,14,234,57,254,127,25,189,234,167,142,
+    47,147,126,43,188,78,115,74,195,92,22,80,56,18,230,180,
+    3,74,106,248,139,58,175,29,102,2,178,219,40,250,158,246,
+    169,217,83,227,68,140,82,225,27,251,145,83,234,194,84,201,
+    151,136,69,197,212,129,136,24,93,140,201,66,84,78,139,145,
+    56,225,206,245,203,82,185,228,73,238,108,85,90,168,94,27,
+    212,129,119,144,110,40,142,119,154,80,67,81,163,249,71,43,
+    171,81,21,6,20,142,215,151,119,234,71,147,176,117,243,53,
+    114,243,147,220,140,156,90,2,76,71,85,221,229,105,86,166,
+    167,35,240,169,38,40,162,15,201,92,34,37,201,68,143,8,
+    61,189,175,249,249,233,84,82,128,219,1,116,145,4,13,80,
+    36,145,7,176,165,98,124,185,110,57,191,175,91,180,126,255,
+    170,162,76,237,1,50,118,136,63,208,104,11,103,179,84,209,
+    62,118,250,52,158,173,65,84,106,184,143,44,200,196,22,7,
+    40,74,128,130,86,25,11,84,204,5,140,68,169,63,69,186,
+    124,61,201,77,65,90,139,150,33,122,131,89,59,1,196,45,
+    155,136,70,239,42,115,240,106,221,109,77,20,222,74,199,8,
+    143,104,200,86,235,92,2,200,225,53,251,52,250,182,223,28,
+    172,24,196,86,44,127,1,82,146,167,13,210,206,114,139,72,
+    221,191,108,67,67,22,111,184,218,154,235,45,88,63,176,172,
+    13,161,55,101,154,120,74,84,83,228,57,10,205,80,37,75,
+    104,188,100,67,203,77,201,174,106,231,70,59,212,215,238,201,
+    56,168,243,168,188,61,151,25,173,185,77,233,126,221,208,36,
+    168,129,145,184,244,92,168,90,187,8,173,165,75,20,241,245,
+    82,174,78,119,21,252,147,175,103,221,182,46,148,89,202,215,
+    158,247,114,185,215,182,14,222,127,227,1,253,103,215,114,215,
+    202,94,170,185,117,125,34,219,178,113,60,251,90,238,224,230,
+    27,121,118,111,185,153,218,123,40,7,133,196,120,145,97,141,
+    156,90,124,9,179,188,166,144,157,244,146,186,60,28,251,243,
+    255,129,79,102,239,172,89,145,85,197,31,114,66,35,107,84,
+    173,180,211,65,127,169,9,143,177,46,44,75,238,152,132,245,
+    34,64,249,34,10,251,146,11,47,168,196,183,94,114,132,85,
+    21,208,109,168,239,12,171,120,20,219,177,178,45,28,91,138,
+    66,158,166,243,53,133,141,108,162,100,5,186,45,177,97,163,
+    214,7,111,6,181,207,19,54,232,125,168,38,148,220,213,43,
+    22,12,79,134,130,90,68,139,13,67,230,45,24,130,104,229,
+    97,213,112,16,108,82,93,16,223,170,224,68,124,17,1,34,
+    78,124,25,193,101,4,211,84,197,56,121,5,193,85,4,175,
+    144,181,234,235,146,154,84,186,168,126,84,171,28,90,247,50,
+    157,59,145,198,159,35,25,236,35,166,186,242,203,52,213,222,
+    253,200,191,111,219,191,175,224,15,42,254,224,170,235,177,183,
+    43,27,252,135,161,227,5,239,9,197,123,162,76,89,93,205,
+    143,91,123,138,190,115,95,88,45,109,205,95,81,0,202,148,
+    165,169,185,204,80,29,129,85,219,154,167,216,189,7,227,0,
+    202,22,157,164,28,84,43,151,11,228,125,161,98,75,87,246,
+    104,222,55,80,108,25,200,125,123,235,149,251,115,15,250,242,
+    131,103,243,190,23,138,45,221,217,139,121,223,96,217,101,231,
+    154,203,118,104,244,5,182,252,10,1,198,10,148,253,20,235,
+    91,155,204,90,20,79,79,246,172,226,233,205,5,183,61,251,
+    243,158,253,36,6,225,124,161,245,130,210,122,33,207,94,120,
+    210,177,59,223,49,146,243,223,39,17,6,197,221,193,85,155,
+    194,116,63,14,244,229,60,91,175,20,2,99,74,96,12,115,
+    186,138,129,125,234,179,103,8,159,157,143,187,71,182,78,22,
+    186,143,42,221,71,113,238,79,118,117,144,149,244,4,72,105,
+    113,119,63,233,39,79,190,79,241,89,189,64,120,130,108,40,
+    50,248,160,168,156,49,146,65,255,152,181,233,24,77,28,124,
+    127,172,243,43,60,24,104,14,80,173,68,32,165,146,60,108,
+    30,234,43,220,82,68,146,42,162,166,122,217,226,174,144,235,
+    93,181,141,222,149,222,54,17,89,38,170,37,143,119,86,173,
+    3,85,110,195,59,80,8,209,118,68,3,7,15,90,197,102,
+    66,106,186,253,170,228,39,103,0,79,157,20,190,81,9,38,
+    171,115,134,52,153,140,25,153,221,181,52,104,42,46,99,227,
+    94,194,143,126,231,166,90,186,21,223,158,220,236,163,161,231,
+    182,135,158,43,12,61,175,12,25,125,101,37,151,110,236,40,
+    185,244,197,55,142,147,234,165,181,56,41,42,92,229,190,59,
+    197,139,24,220,24,102,62,110,224,220,116,213,161,97,190,107,
+    96,116,73,99,7,199,142,253,26,76,151,117,145,42,59,181,
+    49,166,109,154,15,47,176,147,255,205,52,219,154,17,120,251,
+    12,249,15,58,50,49,125,179,103,48,200,48,29,23,140,2,
+    181,198,236,18,226,46,107,215,19,77,99,83,181,3,189,139,
+    249,249,26,83,212,252,124,163,232,41,213,233,134,28,15,61,
+    54,55,40,100,157,97,205,220,8,77,209,115,2,172,82,229,
+    236,114,12,195,93,75,173,146,54,187,42,249,149,90,195,215,
+    133,27,192,158,141,134,1,205,171,155,162,106,188,186,118,194,
+    133,51,237,181,132,72,178,255,11,107,255,17,165,5,63,117,
+    116,18,30,192,176,63,246,190,239,205,218,54,217,220,43,155,
+    222,45,90,233,28,217,186,164,140,158,43,48,83,10,131,62,
+    236,34,211,242,136,25,220,102,6,115,179,247,175,61,232,191,
+    31,126,240,138,50,116,172,192,28,87,152,227,121,230,56,186,
+    237,38,179,244,218,153,236,65,197,179,59,215,181,237,25,201,
+    123,70,138,172,239,17,187,103,155,221,147,187,164,12,158,42,
+    176,147,10,59,153,175,124,203,86,138,5,230,54,242,20,78,
+    243,143,84,109,64,130,216,247,204,238,56,189,214,45,66,49,
+    34,104,34,51,38,55,29,111,73,211,169,231,158,185,63,157,
+    226,213,254,82,253,198,218,207,226,21,54,142,125,139,244,76,
+    226,74,142,124,123,81,32,204,76,215,212,128,248,52,51,29,
+    79,238,5,21,117,20,85,95,62,70,162,77,102,145,150,48,
+    32,65,245,238,45,32,136,32,64,127,138,234,187,170,11,222,
+    225,65,231,206,248,107,105,2,115,45,80,77,146,40,18,217,
+    224,241,42,158,64,153,162,93,157,191,106,131,189,14,23,250,
+    39,148,254,137,135,126,229,196,139,219,253,47,230,251,95,44,
+    182,117,172,31,121,194,250,20,182,55,199,231,217,17,148,139,
+    23,233,199,190,182,245,169,141,43,5,223,160,226,27,220,178,
+    41,195,39,182,125,39,202,86,44,122,226,243,111,120,31,249,
+    66,219,190,80,193,55,174,248,198,31,76,41,71,46,108,251,
+    46,148,157,54,205,175,103,218,126,68,234,30,248,255,242,40,
+    128,151,224,0,127,72,185,158,209,103,251,58,245,33,77,83,
+    107,29,90,20,19,28,52,56,218,170,110,82,139,15,49,1,
+    32,51,88,167,47,52,96,248,44,162,7,253,134,255,2,127,
+    232,226,163,93,131,197,214,93,31,142,253,100,172,208,186,71,
+    105,221,147,103,181,111,217,10,69,245,43,66,147,14,33,232,
+    31,88,234,35,108,170,194,179,49,243,123,155,94,161,245,32,
+    134,31,62,155,128,69,182,218,56,156,181,38,216,225,59,198,
+    8,29,222,42,123,170,111,70,51,151,249,48,252,2,24,178,
+    177,52,103,48,202,237,52,210,47,72,16,172,161,13,243,76,
+    109,28,191,116,214,177,115,231,140,9,107,60,131,97,47,53,
+    51,175,246,104,14,185,112,16,51,87,67,54,209,120,39,174,
+    89,213,75,207,219,86,192,168,1,87,134,209,44,188,179,78,
+    64,82,55,117,195,93,206,211,168,149,121,165,83,212,155,157,
+    111,219,86,108,57,182,81,221,21,107,253,8,107,93,6,170,
+    104,135,185,53,53,106,201,215,99,207,5,76,199,61,93,189,
+    154,104,177,148,200,94,144,21,104,215,213,140,151,211,111,177,
+    228,130,159,105,25,173,9,232,231,190,166,67,179,68,194,93,
+    8,54,19,49,166,10,55,31,57,115,6,49,37,222,197,50,
+    196,157,129,89,17,191,59,225,83,34,130,55,177,165,11,239,
+    35,196,200,83,234,10,195,213,152,156,195,48,114,191,48,92,
+    156,195,170,3,66,196,120,131,160,93,149,124,175,97,51,235,
+    45,97,185,100,87,165,164,141,52,71,102,108,184,25,32,125,
+    100,186,235,78,186,206,26,124,120,190,175,210,149,208,197,149,
+    236,212,230,75,138,119,120,171,69,241,238,95,181,129,104,91,
+    63,177,237,9,228,61,1,34,207,250,183,217,254,2,187,71,
+    33,7,30,3,81,150,223,95,126,239,187,107,223,45,83,142,
+    166,192,99,223,174,178,197,210,126,234,211,195,91,242,39,247,
+    10,251,207,40,251,207,0,131,108,63,69,64,49,192,109,94,
+    121,20,24,223,14,140,23,2,135,148,192,33,96,144,90,209,
+    147,142,158,141,123,143,58,38,182,59,38,10,29,199,148,142,
+    99,101,123,165,136,128,47,172,182,150,214,175,40,0,101,2,
+    220,84,103,96,93,198,86,223,205,189,242,193,189,79,247,108,
+    241,159,196,11,35,167,148,145,83,133,93,167,84,189,190,111,
+    115,114,203,246,137,71,233,57,82,96,64,204,175,70,215,39,
+    42,130,222,154,157,173,134,197,250,59,55,174,60,242,31,216,
+    246,31,40,248,199,20,255,24,114,255,227,4,172,78,145,37,
+    143,108,179,35,91,19,15,6,11,236,49,133,61,150,39,223,
+    90,180,16,49,63,85,96,131,10,27,204,179,193,162,215,191,
+    154,86,221,252,239,224,38,177,70,5,39,106,100,77,184,89,
+    132,57,254,45,245,108,209,206,117,82,85,79,27,162,155,13,
+    12,84,59,36,22,140,63,94,177,72,109,102,31,194,10,13,
+    108,198,242,203,250,95,13,24,231,209,88,219,173,139,186,230,
+    137,68,159,206,244,127,131,183,143,219,151,97,246,105,158,65,
+    32,101,36,126,241,123,136,165,22,77,49,68,211,140,122,18,
+    212,203,123,155,174,47,86,239,247,149,72,105,68,175,248,67,
+    0,38,131,9,57,86,13,136,94,239,104,8,137,126,137,34,
+    50,31,110,157,87,30,177,67,219,236,80,129,221,167,176,251,
+    240,20,220,83,188,227,15,218,20,239,196,127,88,233,166,163,
+    64,13,0,28,84,83,219,234,133,162,183,7,137,227,42,77,
+    174,165,211,127,211,6,64,253,22,90,175,40,173,87,242,236,
+    21,140,191,246,62,98,246,111,51,251,183,64,135,28,87,152,
+    241,124,229,171,138,71,163,16,179,84,40,224,182,74,1,180,
+    216,219,248,118,249,108,162,207,24,69,104,184,21,80,53,254,
+    28,83,92,186,170,48,216,75,150,196,4,209,158,129,149,216,
+    137,135,174,228,140,166,197,217,88,244,150,136,1,143,21,141,
+    155,160,219,160,113,19,166,148,25,168,195,118,157,202,62,70,
+    87,99,72,61,29,136,198,221,143,217,230,181,111,253,120,250,
+    253,233,2,27,80,216,64,158,13,60,238,217,189,121,242,103,
+    147,155,147,228,94,158,39,223,167,196,78,170,177,212,207,240,
+    43,129,103,194,95,131,251,153,142,67,145,147,13,98,187,26,
+    190,246,44,97,107,234,233,168,226,218,169,202,1,84,171,196,
+    121,4,2,2,12,65,22,223,163,136,186,154,78,44,213,41,
+    109,111,3,200,212,70,83,132,106,37,206,4,98,25,13,77,
+    234,47,1,188,218,47,1,166,62,122,249,231,47,255,108,122,
+    115,186,192,236,87,152,253,121,102,127,17,181,93,66,205,1,
+    117,27,46,191,127,249,189,43,107,87,86,201,31,106,115,68,
+    21,14,52,86,82,9,246,255,155,170,197,254,59,33,163,42,
+    81,229,73,134,155,135,129,59,61,91,168,160,241,78,127,211,
+    224,211,108,124,199,126,155,150,13,234,192,77,157,223,213,113,
+    78,125,55,181,88,98,189,12,99,83,209,210,43,218,209,162,
+    139,111,73,143,172,123,0,41,131,122,131,17,172,154,58,129,
+    191,66,32,183,221,160,71,140,97,250,26,133,151,221,104,252,
+    86,152,79,37,34,177,100,201,78,44,130,37,6,4,61,249,
+    97,144,170,54,144,77,255,17,2,60,99,213,72,212,10,135,
+    251,62,118,227,80,157,251,102,38,135,104,169,191,210,160,165,
+    243,36,146,0,170,248,64,2,184,201,187,243,158,161,98,255,
+    208,253,30,165,255,152,210,127,250,97,68,233,127,254,81,255,
+    165,237,254,75,133,254,151,148,254,151,86,167,224,62,131,55,
+    21,54,251,170,226,227,114,45,138,111,207,170,253,113,171,127,
+    99,4,127,232,147,243,43,253,7,11,173,7,31,204,42,19,
+    23,11,45,23,87,29,197,254,125,121,239,196,106,122,253,246,
+    123,223,91,253,222,167,179,159,188,145,103,38,212,32,69,215,
+    180,138,144,105,241,2,78,18,221,168,226,69,124,191,16,180,
+    145,203,186,136,124,151,120,207,167,129,163,168,207,46,241,52,
+    102,98,72,161,120,6,193,243,8,80,119,36,65,137,37,171,
+    36,139,34,154,222,68,220,78,17,169,70,60,139,5,182,235,
+    169,84,92,141,109,36,225,138,104,195,18,241,64,138,73,4,
+    200,83,85,13,12,177,65,116,33,85,229,66,150,69,206,19,
+    193,34,177,194,27,98,28,207,87,0,34,95,26,177,152,99,
+    28,247,98,140,35,130,55,104,234,240,177,226,232,120,177,143,
+    43,142,31,41,14,143,22,3,253,197,158,221,197,161,96,177,
+    135,43,119,77,209,246,129,50,133,240,137,55,80,182,147,87,
+    7,213,218,177,46,101,207,173,223,221,232,43,59,73,22,67,
+    117,244,101,211,185,153,173,61,185,55,54,239,41,187,198,202,
+    46,146,239,166,90,186,178,237,89,41,119,46,123,119,179,79,
+    241,5,203,30,146,207,82,221,187,203,77,36,217,140,85,58,
+    115,3,57,33,23,84,186,70,21,223,129,178,151,20,248,72,
+    159,27,169,114,11,121,109,165,218,187,203,109,36,233,167,118,
+    117,149,219,73,114,23,181,171,55,27,221,120,179,220,65,94,
+    59,169,246,46,109,210,221,148,187,185,220,83,157,191,9,190,
+    108,177,219,95,160,179,114,238,210,214,114,126,240,184,210,119,
+    162,76,217,73,112,100,29,108,118,97,236,165,25,236,98,236,
+    238,117,190,76,49,24,13,105,6,126,139,125,48,23,123,96,
+    123,192,63,156,202,143,63,175,236,61,139,1,151,131,181,128,
+    105,179,183,103,167,202,20,60,106,193,8,99,63,152,141,98,
+    111,7,31,248,201,227,225,32,121,212,2,191,205,62,188,37,
+    99,92,232,240,67,27,121,212,2,214,106,15,96,40,171,17,
+    184,29,246,163,24,119,10,143,29,129,74,70,72,60,193,93,
+    42,25,147,35,77,248,61,249,253,159,67,94,70,123,134,74,
+    196,118,157,94,157,58,177,51,137,137,144,234,106,64,222,80,
+    114,194,107,90,142,197,201,37,162,68,66,120,224,170,130,225,
+    70,196,235,33,133,34,218,111,119,85,47,8,57,53,165,17,
+    67,181,170,243,32,100,80,176,244,92,213,157,226,174,26,105,
+    213,67,228,211,15,130,249,112,124,205,76,170,17,199,207,137,
+    191,160,212,223,83,73,135,0,130,188,160,233,242,81,47,13,
+    232,68,48,64,209,236,59,30,252,43,82,253,121,243,183,108,
+    113,208,22,192,214,255,17,248,40,218,247,142,23,255,138,84,
+    119,222,252,125,66,77,230,205,223,34,245,114,222,252,109,48,
+    49,199,243,52,13,212,216,24,126,65,224,87,198,252,11,150,
+    123,22,26,54,190,49,252,130,192,175,118,40,37,56,253,95,
+    250,178,95,139,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/simulate/sampling.py",
+    "gem5.simulate.sampling",
+    embedded_module_data,
+    7188,
+    16635);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,1070 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,237,189,105,112,27,103,150,32,152,137,131,4,72,144,
+    0,73,240,190,146,55,193,3,212,73,201,180,37,89,214,109,
+    89,148,199,146,203,101,86,185,65,144,153,148,32,225,96,101,
+    130,146,200,2,187,221,61,158,29,186,87,187,75,87,171,199,
+    236,46,123,155,181,107,215,210,85,174,105,246,108,79,140,122,
+    182,103,162,162,187,250,152,152,216,13,128,145,213,68,99,130,
+    19,234,217,240,238,212,63,104,109,207,42,188,19,179,251,222,
+    247,229,241,37,0,30,174,158,137,141,157,88,16,252,144,199,
+    151,239,187,222,247,190,247,222,247,222,203,255,149,99,62,46,
+    237,247,243,127,195,115,220,251,156,200,137,124,148,155,162,191,
+    252,20,79,126,109,83,54,242,107,159,178,147,95,199,148,131,
+    252,58,167,156,240,107,139,150,197,202,167,202,121,124,198,30,
+    117,197,220,83,110,114,236,136,86,196,42,167,42,99,158,41,
+    79,172,106,170,42,86,61,85,29,243,78,121,99,190,41,95,
+    172,102,170,134,167,101,212,78,213,146,223,58,242,235,140,250,
+    99,245,83,245,228,94,89,180,33,214,56,213,72,142,203,163,
+    77,177,230,169,102,114,236,138,182,196,90,167,90,201,177,59,
+    218,22,107,159,106,135,227,10,177,50,218,17,235,156,234,36,
+    199,158,168,16,235,154,234,130,227,42,177,58,218,29,235,153,
+    234,137,245,78,245,146,115,111,180,47,214,63,213,31,27,152,
+    26,136,13,78,13,198,2,83,129,216,208,212,80,108,120,106,
+    152,231,108,156,52,34,245,252,16,250,226,199,188,222,69,83,
+    163,162,239,29,188,19,148,70,173,119,206,115,63,132,244,199,
+    70,103,78,141,137,53,225,67,98,139,88,247,142,99,234,176,
+    141,187,196,137,254,119,56,177,254,135,54,200,101,51,114,29,
+    17,27,164,163,98,173,228,149,142,54,27,207,206,57,196,70,
+    120,234,152,216,36,121,164,163,146,79,58,14,127,214,28,118,
+    230,216,102,30,3,164,106,200,127,84,58,202,94,181,64,110,
+    6,200,227,34,127,131,11,180,254,2,47,77,6,248,156,83,
+    148,190,179,32,193,129,227,213,112,242,118,160,60,231,58,23,
+    142,70,195,51,81,41,231,56,31,153,77,230,220,151,164,184,
+    36,135,147,9,57,231,120,37,162,36,115,174,235,243,201,72,
+    34,30,142,230,156,55,23,230,33,159,243,245,56,156,3,136,
+    242,27,145,216,141,100,56,137,208,94,75,36,240,183,58,44,
+    138,120,233,27,17,37,2,32,240,206,253,176,140,153,29,179,
+    9,89,250,5,118,7,156,84,157,157,81,146,114,120,54,249,
+    82,34,44,139,112,161,238,198,253,72,114,246,54,214,227,85,
+    57,49,43,41,74,66,254,5,246,120,192,150,115,95,120,16,
+    73,94,184,39,197,147,57,79,72,130,227,208,108,120,65,145,
+    148,64,89,206,47,46,196,230,67,10,20,168,132,110,25,245,
+    174,38,153,204,243,122,89,82,164,100,81,182,102,37,124,79,
+    10,205,222,150,102,239,206,39,34,113,246,9,159,66,170,195,
+    92,105,192,102,132,68,105,46,188,16,77,194,47,180,6,175,
+    207,26,88,1,31,7,252,219,113,86,181,112,56,171,34,92,
+    138,123,203,245,109,104,242,50,191,108,75,217,82,252,111,217,
+    30,186,111,112,159,112,114,7,182,204,158,179,5,15,229,248,
+    72,174,130,212,87,194,22,42,248,188,32,8,95,245,41,242,
+    236,216,252,98,242,118,34,62,118,75,138,29,31,83,34,177,
+    133,104,56,41,233,7,9,57,56,191,248,85,197,11,34,12,
+    218,108,34,54,127,90,238,129,71,47,193,191,130,208,223,230,
+    210,181,147,244,251,131,183,214,255,206,70,197,234,196,218,119,
+    140,75,159,99,117,47,230,202,100,41,185,32,199,103,89,210,
+    80,166,55,226,191,38,141,72,50,183,148,83,73,187,121,118,
+    199,64,109,235,116,56,207,189,213,71,26,13,205,78,150,51,
+    249,29,250,81,138,75,86,152,215,83,188,137,180,214,41,195,
+    115,15,251,69,62,12,196,230,6,249,15,216,151,98,175,73,
+    183,0,41,37,89,72,222,150,132,187,241,196,253,184,128,189,
+    39,16,148,16,0,169,34,241,91,138,0,163,119,155,228,48,
+    58,75,80,18,112,33,156,172,128,206,37,79,40,130,44,205,
+    39,228,36,201,118,229,188,144,152,195,163,136,76,193,145,193,
+    8,222,156,4,28,107,100,113,46,36,107,229,75,162,220,0,
+    85,204,57,35,73,41,166,228,108,177,227,185,26,253,30,226,
+    235,57,204,158,243,134,204,161,13,69,68,5,176,217,73,0,
+    201,93,216,159,54,50,216,114,55,2,170,55,64,179,229,201,
+    163,112,239,42,230,253,54,25,212,47,93,156,167,39,207,217,
+    157,3,59,93,163,106,215,209,76,215,113,181,235,120,158,227,
+    221,23,120,154,102,60,237,43,23,86,39,118,60,213,170,71,
+    88,175,255,137,247,113,133,58,120,46,227,57,175,122,206,167,
+    201,55,219,221,159,118,117,210,111,190,28,64,17,120,114,47,
+    20,96,193,132,58,237,247,243,127,103,67,76,144,56,92,24,
+    96,81,224,97,65,176,137,246,8,63,229,112,115,236,159,120,
+    76,44,147,156,98,185,84,38,149,51,132,202,5,231,46,201,
+    45,85,72,149,5,119,28,162,131,37,111,64,2,171,152,179,
+    170,221,72,31,3,193,13,16,61,146,187,228,189,10,184,87,
+    205,156,99,233,94,230,220,179,199,179,85,146,87,172,134,218,
+    213,138,222,119,156,83,62,209,7,57,217,103,241,158,67,172,
+    1,2,91,131,36,93,59,199,5,160,86,172,150,92,115,54,
+    88,2,28,83,117,226,113,32,250,229,112,197,79,8,189,115,
+    170,30,8,125,131,150,27,201,115,35,115,222,2,231,77,144,
+    183,1,158,110,133,227,102,56,246,194,113,27,28,183,192,177,
+    71,106,133,94,244,238,66,238,109,98,59,228,107,59,64,190,
+    14,200,215,78,242,121,45,215,59,225,122,135,56,46,10,240,
+    219,41,9,119,186,140,123,188,216,101,180,177,27,90,209,45,
+    246,192,121,175,118,173,76,236,131,39,122,200,181,106,235,8,
+    67,254,126,184,215,43,14,72,213,218,243,131,112,222,7,35,
+    31,16,135,44,101,56,196,97,192,146,6,169,74,228,110,241,
+    144,211,182,203,178,55,82,48,138,163,208,127,65,232,99,82,
+    67,2,193,101,121,214,35,142,65,141,251,197,67,144,239,112,
+    41,232,226,17,22,2,220,243,136,71,161,142,3,162,3,40,
+    206,137,156,251,134,78,66,194,159,2,177,39,244,227,230,237,
+    136,34,24,215,133,217,104,88,81,4,184,4,51,86,20,146,
+    9,33,22,142,135,111,73,132,178,72,15,164,217,5,92,63,
+    145,192,132,5,36,229,58,81,130,139,193,10,2,239,194,131,
+    112,12,86,86,114,60,74,63,150,27,8,25,232,26,1,88,
+    88,236,108,56,46,204,72,194,92,98,33,46,10,240,47,201,
+    228,201,233,233,217,68,124,46,114,75,25,147,40,12,178,138,
+    132,162,145,25,57,44,47,78,79,107,37,223,4,136,177,132,
+    146,20,102,194,74,100,86,144,23,226,194,253,196,66,84,68,
+    144,97,5,160,70,163,137,251,202,4,205,28,12,10,179,9,
+    81,26,157,137,38,102,239,78,104,23,245,143,73,105,79,153,
+    117,28,156,193,245,253,20,73,3,150,236,102,254,32,20,58,
+    24,168,168,48,123,246,126,36,26,37,85,9,51,93,37,132,
+    161,125,180,55,37,65,91,135,161,150,183,195,247,34,80,230,
+    92,130,37,220,74,144,0,91,170,134,133,49,6,189,76,57,
+    24,101,233,38,54,55,65,79,132,121,57,113,47,34,194,128,
+    205,44,10,3,90,142,1,33,44,75,66,60,1,235,9,44,
+    169,80,46,240,35,230,98,66,7,47,9,21,129,230,8,90,
+    87,6,39,127,129,11,127,206,73,26,153,171,156,91,136,70,
+    67,202,34,16,242,88,174,42,17,103,22,128,92,147,244,96,
+    94,154,77,74,98,200,192,138,80,66,134,17,203,121,25,46,
+    4,138,189,157,171,75,70,102,239,2,199,146,152,191,31,70,
+    70,68,137,44,73,57,104,78,24,144,97,86,34,64,149,92,
+    93,44,252,32,164,95,19,233,69,185,15,80,122,214,205,153,
+    159,86,78,91,208,203,96,105,255,251,5,75,250,29,131,127,
+    73,58,205,171,214,5,221,146,223,96,0,108,92,146,41,133,
+    93,208,69,94,180,253,16,242,253,216,200,187,7,188,178,175,
+    89,190,193,80,20,148,239,99,202,183,139,14,107,249,41,126,
+    157,237,145,93,202,249,212,105,229,243,45,229,26,237,43,40,
+    183,129,41,183,76,44,63,112,187,61,187,192,107,97,224,185,
+    68,247,129,225,85,27,87,15,214,143,222,175,153,223,247,53,
+    243,215,232,71,123,244,87,197,215,232,175,218,93,224,57,204,
+    99,177,82,244,28,24,94,157,113,245,96,237,241,239,159,63,
+    82,245,46,23,170,215,207,82,118,249,113,132,131,43,13,230,
+    149,245,70,174,196,167,136,125,254,62,97,159,221,203,21,201,
+    195,102,174,84,69,242,8,243,140,133,81,150,43,83,21,239,
+    114,119,204,146,220,47,64,250,176,175,224,249,99,187,62,95,
+    47,86,189,3,57,10,37,219,18,48,175,23,192,28,223,21,
+    166,32,86,179,119,129,193,240,190,227,88,174,180,113,41,168,
+    237,167,62,235,92,43,81,210,59,201,231,204,167,197,154,148,
+    251,78,187,126,246,125,144,126,63,180,91,33,252,6,31,247,
+    0,20,163,255,217,158,23,235,224,172,195,128,207,195,89,167,
+    113,102,131,51,193,56,115,192,153,193,148,36,47,48,109,45,
+    251,212,95,88,231,80,143,113,183,124,158,191,133,87,122,141,
+    43,46,56,235,211,207,200,189,126,253,108,5,89,170,250,119,
+    92,201,73,19,126,113,223,135,6,141,250,55,192,89,192,56,
+    107,132,179,33,163,28,167,236,77,190,97,194,17,155,172,181,
+    228,33,7,228,31,49,97,1,91,211,28,110,238,210,120,25,
+    252,76,204,135,229,112,76,32,43,216,4,225,9,200,33,178,
+    50,51,134,12,37,137,193,194,7,152,181,110,66,120,227,182,
+    4,139,164,140,15,145,181,91,129,229,27,51,140,210,12,236,
+    82,14,139,53,172,177,65,43,67,80,240,33,156,0,124,19,
+    154,246,129,172,255,58,131,149,184,39,201,50,44,222,58,35,
+    176,39,36,157,73,8,10,87,230,200,218,174,72,201,17,225,
+    190,86,93,90,23,189,214,145,184,112,241,198,158,208,98,192,
+    1,81,14,101,6,139,7,121,45,22,137,67,173,238,69,194,
+    132,73,32,61,55,160,236,9,99,122,58,162,132,176,111,104,
+    215,12,6,166,167,161,171,226,179,148,37,44,232,100,11,15,
+    49,33,156,141,155,93,18,11,207,99,197,21,224,42,34,115,
+    139,208,164,48,105,136,206,37,37,226,123,214,2,228,224,240,
+    236,109,86,222,197,161,7,254,7,121,160,228,109,89,146,132,
+    249,132,162,68,102,34,209,72,50,2,76,40,222,156,216,7,
+    36,178,184,154,206,100,4,78,162,32,209,34,231,171,183,78,
+    25,193,14,71,190,46,126,11,88,43,179,209,251,128,53,62,
+    135,131,130,161,160,162,168,106,148,7,221,177,40,44,70,36,
+    224,94,195,48,12,137,168,4,172,49,54,241,160,176,5,33,
+    25,137,81,182,29,56,235,196,108,4,145,158,233,31,68,71,
+    41,62,11,156,54,81,0,32,62,29,28,244,244,244,77,121,
+    65,130,129,182,170,37,8,38,145,34,152,235,56,71,162,137,
+    196,252,190,221,114,36,40,188,82,216,195,19,194,5,28,86,
+    253,92,136,45,32,123,47,129,160,64,245,124,251,86,153,240,
+    187,113,34,197,136,88,199,69,64,136,91,11,49,228,171,201,
+    36,164,74,35,179,143,247,5,168,225,39,74,48,145,57,86,
+    136,193,234,41,183,137,188,161,119,193,254,192,10,186,72,120,
+    125,62,17,47,196,100,82,8,193,61,236,223,125,97,206,39,
+    230,105,247,39,195,114,82,211,4,209,199,89,161,35,146,36,
+    20,68,191,183,47,84,196,150,216,124,114,145,60,81,82,98,
+    65,133,20,91,235,3,85,118,70,23,42,145,32,239,147,251,
+    104,16,186,218,50,211,232,156,217,21,57,200,224,239,91,133,
+    175,129,28,204,224,239,223,97,123,34,135,182,104,208,133,193,
+    104,64,100,111,74,139,31,189,183,40,146,124,189,41,94,72,
+    140,11,228,52,43,57,38,89,112,69,96,49,158,12,126,68,
+    6,185,15,59,43,177,63,197,192,7,204,98,144,158,71,226,
+    40,116,38,177,174,194,156,156,136,5,113,173,141,147,140,88,
+    137,131,32,226,244,244,100,34,14,212,103,4,199,142,129,174,
+    47,100,209,68,88,68,138,246,210,162,142,169,35,7,170,40,
+    150,207,194,15,10,67,67,100,128,204,190,128,19,81,154,135,
+    14,176,178,16,187,125,94,5,172,65,77,174,148,44,236,137,
+    251,216,104,184,158,212,187,245,32,75,45,126,238,39,228,187,
+    216,192,161,161,162,241,44,33,102,211,25,18,95,136,205,32,
+    119,48,199,170,21,132,187,210,124,18,245,5,88,58,62,122,
+    32,242,111,128,23,6,21,88,83,167,167,111,73,201,144,181,
+    96,228,0,2,251,247,13,126,174,71,69,168,151,86,31,92,
+    169,69,57,49,63,143,99,103,142,241,65,232,40,126,244,161,
+    134,118,73,243,10,2,5,20,165,172,64,17,226,91,84,15,
+    176,198,48,189,114,255,118,4,26,135,117,49,148,17,26,138,
+    66,125,14,128,242,80,93,69,210,148,242,128,45,49,100,207,
+    10,86,195,217,4,224,127,124,65,218,119,176,145,126,37,22,
+    146,26,29,34,152,146,16,94,37,251,40,2,76,234,8,242,
+    145,9,100,252,246,173,212,226,188,100,12,63,173,21,146,160,
+    233,233,18,74,151,233,233,253,160,209,198,97,23,1,10,196,
+    9,163,101,118,22,115,23,106,182,239,122,42,227,230,19,42,
+    174,6,35,113,3,19,25,44,67,50,124,255,0,112,200,212,
+    210,231,146,174,154,98,21,150,168,154,10,32,184,3,12,160,
+    112,27,242,69,181,25,67,232,172,214,127,214,86,238,7,9,
+    58,26,217,240,68,124,86,210,86,72,88,146,110,195,74,34,
+    204,96,219,72,199,237,219,174,130,126,213,215,243,48,81,115,
+    38,41,170,238,223,201,136,63,84,59,72,103,108,193,152,227,
+    148,165,139,209,1,218,20,131,149,48,73,26,68,166,216,156,
+    140,155,176,241,164,86,65,104,160,178,111,133,180,254,5,98,
+    154,136,15,36,133,184,68,37,33,34,106,37,77,52,216,127,
+    182,105,179,28,209,122,80,10,222,10,142,104,8,133,152,240,
+    218,245,43,4,140,18,40,34,0,37,208,158,82,74,184,1,
+    243,52,86,64,49,21,173,194,216,129,7,162,69,72,42,232,
+    24,155,76,205,244,180,69,248,1,230,121,65,65,197,58,204,
+    96,134,18,140,238,254,49,65,189,129,76,173,33,57,152,15,
+    159,178,126,204,7,176,105,197,229,23,46,241,40,22,133,117,
+    250,98,74,34,68,29,205,74,30,172,144,53,29,151,30,36,
+    7,95,48,114,159,14,76,235,120,111,114,40,225,120,161,96,
+    102,192,218,83,224,209,88,84,128,119,47,28,93,144,40,242,
+    195,153,206,142,145,181,154,74,34,6,64,235,182,2,214,3,
+    57,107,83,52,1,153,13,41,230,253,8,131,165,123,61,163,
+    19,107,147,150,24,140,179,89,247,219,97,115,16,230,34,241,
+    136,114,155,80,180,160,20,132,198,76,79,223,0,114,118,37,
+    137,121,225,113,232,120,233,193,172,52,175,113,124,40,156,226,
+    198,175,133,200,77,151,232,86,210,175,58,251,23,32,139,74,
+    124,111,110,188,196,128,105,99,195,160,229,89,133,14,15,217,
+    87,65,41,23,55,116,201,96,232,146,56,221,73,54,54,167,
+    41,28,96,93,22,230,65,116,184,11,139,64,130,217,61,217,
+    115,91,5,106,10,235,86,4,200,5,131,136,131,129,98,49,
+    124,94,55,155,8,82,219,133,193,64,81,22,138,42,23,195,
+    209,18,212,38,118,60,72,236,35,130,104,81,241,53,159,165,
+    247,16,169,14,178,37,84,244,56,179,71,84,116,207,50,255,
+    0,204,119,75,210,18,195,64,36,72,216,146,137,82,61,86,
+    204,207,46,91,47,233,91,80,248,49,183,161,116,225,111,122,
+    186,184,131,53,97,126,46,34,195,202,82,60,107,89,217,132,
+    145,41,70,40,96,236,103,99,71,41,9,242,100,100,86,161,
+    92,15,80,99,88,193,191,6,60,178,224,35,76,170,140,66,
+    49,97,151,233,73,150,137,219,17,153,130,15,22,144,199,18,
+    234,154,221,232,100,9,130,121,54,10,197,67,225,145,123,82,
+    116,113,132,8,45,82,88,68,104,243,32,106,225,234,194,232,
+    134,132,121,137,221,176,99,84,69,38,81,208,235,64,102,214,
+    140,68,192,32,103,89,66,189,145,12,223,149,118,145,74,13,
+    120,140,116,138,168,170,75,155,38,146,34,97,73,208,74,133,
+    231,144,196,207,72,88,107,20,141,45,162,246,89,99,238,127,
+    157,73,140,252,89,200,228,104,7,3,194,232,105,66,149,139,
+    167,50,83,203,18,112,168,101,210,236,252,130,178,23,140,3,
+    144,3,173,24,58,167,139,202,153,151,81,200,189,45,69,163,
+    9,90,14,10,23,197,229,244,8,151,81,101,120,95,210,248,
+    18,224,35,163,145,217,72,50,186,88,164,10,24,17,102,22,
+    146,214,62,47,1,46,41,75,97,100,134,73,121,6,12,133,
+    86,19,6,95,190,149,40,212,18,16,212,134,209,3,182,160,
+    20,64,125,82,148,16,62,73,35,7,187,47,99,43,187,89,
+    2,128,159,175,79,190,138,105,204,47,73,191,190,181,43,203,
+    196,12,203,238,18,58,131,35,187,103,58,24,36,43,214,150,
+    204,247,214,215,34,173,166,186,110,122,250,194,55,175,220,68,
+    34,138,162,194,110,202,59,115,166,147,29,5,32,235,11,146,
+    9,221,216,155,135,122,154,57,89,13,222,60,145,142,89,69,
+    158,168,233,185,97,205,151,144,78,49,60,13,97,23,180,101,
+    221,36,237,187,86,148,114,59,196,242,12,215,7,163,63,89,
+    222,42,193,42,236,40,173,102,168,252,65,64,179,210,252,244,
+    52,51,182,204,174,129,38,10,80,193,146,82,248,162,229,171,
+    84,245,194,183,194,17,180,31,193,190,64,54,12,104,29,208,
+    238,4,229,146,224,98,242,118,137,74,49,74,74,168,143,21,
+    67,160,78,84,29,64,242,226,205,66,81,30,134,49,162,203,
+    231,200,140,146,137,109,24,164,224,71,91,140,244,182,237,202,
+    171,235,215,207,22,110,39,232,70,49,250,138,113,37,78,199,
+    118,22,53,75,140,252,67,91,69,176,133,97,253,200,80,88,
+    122,143,232,105,13,224,20,0,89,64,173,202,84,77,91,201,
+    146,161,240,44,178,173,48,234,139,204,218,100,8,17,251,170,
+    76,181,69,202,0,87,160,252,54,244,163,0,133,46,89,84,
+    87,97,234,135,141,46,250,165,214,172,162,53,96,183,181,198,
+    66,69,11,111,91,214,25,246,198,255,139,4,150,105,217,1,
+    136,151,126,136,163,29,158,73,220,211,208,131,0,17,180,118,
+    11,6,102,192,156,134,66,244,57,77,10,164,101,163,224,192,
+    142,166,129,56,250,100,32,93,84,164,251,50,5,43,220,168,
+    196,177,166,243,147,233,77,221,234,201,172,170,89,172,46,236,
+    236,201,203,49,15,22,236,164,220,38,100,183,72,96,138,224,
+    86,42,44,208,128,109,186,36,44,106,154,81,3,20,138,69,
+    100,138,40,116,79,177,200,160,76,255,12,177,3,4,244,112,
+    66,147,191,118,89,120,216,236,231,46,95,56,119,245,213,235,
+    87,38,225,33,194,5,134,25,149,241,174,79,93,60,123,229,
+    21,192,130,131,22,114,227,141,43,55,207,93,62,247,234,235,
+    19,132,250,25,84,24,198,88,35,149,6,187,181,43,140,55,
+    174,191,118,245,165,11,151,174,76,78,8,196,28,157,176,253,
+    202,158,217,47,76,158,63,120,29,95,191,113,225,181,16,116,
+    195,133,215,94,123,253,213,155,7,127,238,218,217,111,134,110,
+    94,57,119,245,107,244,6,244,249,249,215,95,185,112,254,235,
+    62,119,229,26,25,168,208,215,232,6,172,221,149,201,27,55,
+    111,20,23,195,206,74,133,209,44,20,152,68,106,58,210,233,
+    105,198,18,219,200,27,156,95,132,49,140,37,196,133,40,43,
+    13,229,42,76,28,90,234,157,69,142,148,202,47,204,110,4,
+    82,110,77,209,1,247,150,42,40,70,8,128,36,75,227,244,
+    88,87,173,194,37,67,27,106,193,149,2,24,1,62,231,54,
+    238,45,85,224,174,5,52,227,86,36,190,212,77,186,202,216,
+    247,32,93,86,88,1,23,201,15,212,97,137,136,150,123,230,
+    173,134,110,164,173,160,240,125,177,240,3,34,176,201,11,84,
+    228,90,106,192,222,50,96,24,157,110,113,119,64,51,171,163,
+    240,255,57,218,162,92,229,120,238,125,116,120,168,94,230,109,
+    92,138,183,26,179,124,131,123,159,231,185,135,94,145,187,193,
+    125,194,79,82,255,7,155,140,70,56,57,7,146,65,214,20,
+    254,43,55,81,226,60,152,151,79,47,245,25,235,66,48,20,
+    138,196,97,4,67,193,23,96,185,2,66,121,58,104,100,83,
+    160,90,10,90,203,252,91,248,123,155,75,143,93,129,239,227,
+    99,155,142,77,199,31,148,253,97,25,61,103,191,196,216,93,
+    62,13,137,165,69,54,189,69,221,70,139,220,112,49,197,149,
+    108,77,149,124,10,161,96,91,62,225,9,48,172,7,167,217,
+    243,215,234,212,221,196,182,165,224,94,173,41,206,255,0,155,
+    213,105,52,43,111,227,155,3,217,238,254,245,222,31,244,127,
+    212,191,246,10,254,229,237,112,141,182,230,44,36,75,245,5,
+    26,75,162,216,26,88,26,29,48,117,89,184,136,132,77,85,
+    40,110,106,160,13,193,183,116,63,160,183,130,23,1,19,203,
+    0,37,162,146,117,192,209,107,12,237,230,62,191,7,201,111,
+    243,239,115,183,112,192,143,47,243,239,218,238,24,153,214,217,
+    39,140,79,10,243,216,246,203,99,181,92,178,218,147,189,103,
+    123,56,126,195,240,156,169,14,89,77,107,237,183,164,100,174,
+    222,240,207,209,111,162,115,76,192,78,240,140,120,92,228,28,
+    138,20,157,211,156,108,222,166,216,86,241,2,202,9,196,133,
+    102,169,127,79,116,51,242,173,226,192,220,132,135,159,193,168,
+    112,206,206,10,38,113,113,53,173,249,114,174,170,70,245,116,
+    110,123,122,182,60,61,89,95,203,218,121,181,109,124,187,109,
+    98,171,109,226,241,68,166,237,162,218,118,241,169,221,86,85,
+    253,5,7,73,222,110,129,64,70,115,82,198,134,135,15,67,
+    65,55,152,153,207,208,31,178,243,170,27,29,49,70,225,9,
+    109,26,39,10,118,94,77,45,209,12,138,213,49,224,98,8,
+    113,156,91,0,222,3,175,144,125,87,178,91,130,90,169,160,
+    117,35,86,83,186,46,220,50,203,12,207,3,177,2,22,8,
+    213,77,250,14,171,201,210,16,77,238,136,48,77,28,175,164,
+    208,12,136,22,242,98,72,207,55,77,182,210,240,222,93,73,
+    142,75,81,24,40,229,174,121,55,64,244,197,51,137,228,109,
+    109,203,140,202,132,197,165,144,59,176,234,163,53,183,52,43,
+    137,128,176,82,48,48,42,215,147,177,70,86,66,110,194,195,
+    10,147,77,144,219,16,25,90,72,6,100,3,114,110,99,117,
+    151,209,84,58,87,133,155,61,6,29,206,185,141,133,91,70,
+    159,129,92,185,182,50,203,104,203,153,171,182,46,187,57,151,
+    190,156,230,170,173,203,36,156,91,150,191,156,219,88,218,114,
+    158,171,23,94,155,188,240,74,232,213,179,147,87,206,229,42,
+    181,179,235,215,95,189,33,163,63,151,140,86,136,242,32,105,
+    71,68,161,198,0,179,146,140,150,208,50,78,73,25,45,82,
+    209,75,78,211,144,231,156,68,245,159,171,10,49,134,3,98,
+    174,44,68,45,212,61,33,214,68,189,57,180,155,81,186,140,
+    179,36,231,45,216,169,134,11,5,86,232,254,80,137,173,161,
+    156,175,232,138,135,153,175,10,76,96,114,166,239,106,65,126,
+    220,159,99,167,116,13,235,59,69,180,157,50,26,45,35,100,
+    171,17,70,192,35,95,198,110,64,195,84,25,109,100,101,164,
+    225,50,90,187,202,199,49,65,43,84,249,4,38,39,17,128,
+    253,174,180,40,79,225,233,75,72,179,209,18,123,154,97,63,
+    40,249,118,233,243,127,169,182,152,38,160,101,176,34,218,201,
+    252,255,114,186,140,171,106,120,56,249,225,100,166,109,68,109,
+    27,217,241,212,171,30,33,207,57,122,170,127,222,125,114,199,
+    23,200,250,218,178,190,241,167,229,112,225,11,188,250,20,18,
+    31,30,249,190,172,40,126,178,19,158,236,174,254,121,215,137,
+    29,159,64,158,188,12,79,118,227,147,221,213,64,91,154,59,
+    182,155,134,183,154,134,51,77,163,106,211,104,222,237,232,30,
+    3,120,221,99,120,127,140,192,179,128,232,35,32,142,153,32,
+    48,51,22,222,237,211,50,183,67,102,161,250,231,157,199,119,
+    124,189,64,168,178,190,35,144,89,192,204,2,102,22,48,179,
+    160,103,238,253,56,158,233,31,87,251,199,73,85,59,62,174,
+    206,8,135,84,225,16,57,179,222,235,5,176,3,213,63,239,
+    127,129,212,65,160,117,24,64,176,3,8,118,0,193,14,248,
+    138,43,220,145,245,117,103,125,131,123,84,184,251,227,201,76,
+    239,49,181,247,24,41,167,235,227,211,153,158,163,106,207,209,
+    252,85,190,191,191,98,197,161,186,186,243,175,242,156,167,57,
+    207,53,185,79,101,187,123,87,206,67,1,217,142,225,237,142,
+    195,91,29,135,51,29,71,213,142,163,121,206,95,213,64,146,
+    247,42,86,237,171,175,239,212,181,175,73,31,191,153,169,27,
+    83,235,198,242,92,93,77,67,118,236,216,234,121,213,63,176,
+    97,207,248,71,210,254,145,157,250,206,117,231,199,201,76,253,
+    136,90,63,146,231,106,106,26,242,101,220,161,151,121,224,37,
+    126,122,28,146,204,216,21,117,236,74,137,71,30,100,234,15,
+    169,245,135,242,176,32,52,228,93,182,250,192,63,110,202,115,
+    240,83,152,184,184,67,47,1,180,179,63,93,72,143,93,203,
+    140,93,83,199,174,89,160,125,214,210,131,235,255,169,77,251,
+    31,186,243,28,28,152,201,83,187,189,181,225,11,14,146,60,
+    103,175,111,200,247,96,227,70,184,158,1,181,251,5,210,250,
+    39,237,221,216,49,45,217,134,214,21,199,195,202,108,219,0,
+    158,54,103,3,103,241,183,127,167,179,55,61,114,38,221,249,
+    98,166,243,69,181,243,69,188,214,150,237,28,77,119,30,221,
+    172,165,39,189,39,240,183,43,43,16,56,237,121,151,117,201,
+    195,228,75,23,215,57,156,119,195,209,83,60,253,2,19,204,
+    220,154,175,230,186,250,200,99,217,46,242,120,199,147,202,150,
+    60,231,114,87,239,120,124,121,155,179,230,240,83,123,57,174,
+    132,144,228,73,82,203,117,29,34,15,164,201,151,172,135,57,
+    191,206,178,134,136,145,30,33,109,202,172,193,29,112,140,247,
+    109,3,241,105,79,113,251,241,36,86,166,110,221,182,127,30,
+    145,191,75,252,13,100,47,235,216,42,218,138,44,174,191,110,
+    217,142,253,243,136,140,51,228,186,179,68,118,224,159,82,140,
+    63,77,161,43,45,113,103,115,134,79,243,140,221,247,13,160,
+    164,40,250,224,126,171,101,117,34,27,174,134,129,143,69,99,
+    132,126,208,192,142,20,170,139,128,72,190,138,195,3,12,68,
+    60,186,72,150,106,170,156,69,37,1,186,126,51,226,149,102,
+    81,80,106,68,39,132,179,198,38,148,105,80,192,138,38,7,
+    50,38,136,196,129,243,11,179,2,147,76,78,40,235,116,0,
+    35,60,252,104,140,21,109,150,169,74,147,209,21,100,169,107,
+    223,6,19,14,110,50,80,46,163,231,174,140,150,254,148,181,
+    128,102,133,240,190,66,151,51,55,181,45,129,243,156,135,48,
+    75,90,175,200,223,226,136,140,68,150,54,68,39,139,183,112,
+    141,162,13,157,145,127,169,213,92,167,138,110,34,130,42,191,
+    206,161,7,113,190,137,243,248,30,62,191,93,217,187,85,217,
+    155,169,236,87,43,251,183,43,143,109,85,30,203,84,142,171,
+    149,227,143,107,182,42,39,210,149,19,48,57,211,53,199,50,
+    158,227,170,231,120,218,115,60,235,242,60,172,220,118,117,109,
+    185,186,50,174,30,213,213,179,237,26,221,114,141,102,92,99,
+    170,107,108,147,87,93,71,182,93,103,182,92,103,178,30,97,
+    189,87,237,62,6,220,173,27,136,0,36,121,107,66,103,179,
+    3,71,212,50,123,17,163,25,183,243,255,20,179,247,60,247,
+    86,211,178,13,196,57,155,233,197,70,230,140,49,251,138,220,
+    207,155,73,244,4,219,210,63,47,158,50,104,164,96,176,112,
+    150,249,66,13,21,81,229,139,70,244,97,194,101,227,25,14,
+    178,137,69,184,5,34,209,29,223,91,17,120,108,23,116,47,
+    158,54,198,60,41,253,128,110,20,148,76,152,40,59,25,112,
+    154,88,40,199,112,4,154,67,136,108,248,32,225,237,66,80,
+    193,16,173,46,69,60,59,69,188,121,76,208,247,75,15,76,
+    160,9,183,6,134,33,239,71,106,180,212,86,2,255,140,187,
+    143,17,1,191,65,17,176,154,171,111,126,116,117,219,63,186,
+    229,31,205,248,199,84,255,216,182,255,185,45,255,115,25,255,
+    243,170,255,121,214,151,125,229,124,214,51,132,75,216,208,198,
+    177,77,191,122,216,226,198,14,162,175,145,145,58,175,23,138,
+    242,4,159,38,53,124,90,47,133,32,133,88,116,0,76,3,
+    124,224,195,151,88,42,122,125,38,25,214,180,76,179,11,178,
+    76,76,61,24,19,102,115,119,159,104,82,49,200,6,154,11,
+    203,139,35,40,172,129,124,30,99,109,163,97,244,194,194,203,
+    55,174,79,142,42,201,69,64,51,236,202,88,152,197,2,57,
+    28,65,57,205,96,247,39,168,114,159,49,143,33,57,68,186,
+    119,96,181,149,214,54,179,247,34,127,218,94,208,244,52,113,
+    203,165,54,110,186,63,144,110,45,142,92,112,36,28,141,44,
+    29,8,84,130,244,15,146,95,179,47,76,220,12,216,114,158,
+    91,148,238,17,93,85,174,60,153,8,221,81,18,241,79,120,
+    130,130,172,78,133,208,74,146,107,169,206,196,54,227,226,159,
+    32,146,117,83,36,243,115,62,255,182,87,216,242,10,25,111,
+    183,234,237,222,246,14,109,121,135,50,222,17,213,59,146,118,
+    141,16,132,185,152,171,140,196,103,65,22,134,33,11,71,75,
+    51,19,239,112,133,228,72,241,178,81,48,68,190,208,13,141,
+    117,73,52,9,141,73,100,118,89,188,153,165,59,197,127,106,
+    179,146,34,140,125,17,254,35,91,17,210,81,250,49,173,197,
+    97,153,214,53,140,197,104,88,138,140,24,45,159,16,94,147,
+    180,141,70,77,95,152,68,231,159,153,133,72,148,88,59,135,
+    81,186,190,23,73,44,236,189,248,50,16,9,158,141,208,149,
+    81,150,230,96,113,35,218,80,52,11,36,178,169,114,48,223,
+    175,216,194,236,109,212,121,132,209,90,132,154,127,83,117,166,
+    140,56,168,80,185,117,79,72,186,165,37,212,67,51,118,36,
+    196,152,165,214,134,186,173,132,137,144,5,155,53,227,5,195,
+    50,84,235,117,226,248,63,47,18,29,11,0,159,143,134,103,
+    165,253,140,30,209,157,78,46,234,48,229,63,227,105,190,244,
+    194,185,112,28,85,143,52,219,46,20,114,94,198,189,37,226,
+    242,160,21,77,177,55,192,203,139,48,13,128,153,194,197,73,
+    126,19,19,244,135,204,57,41,205,112,163,202,138,30,86,50,
+    196,36,231,12,201,24,151,72,227,162,16,4,203,69,201,11,
+    144,44,53,20,80,18,141,14,253,47,72,76,174,83,98,34,
+    0,49,81,189,93,32,94,129,212,82,219,154,245,77,2,127,
+    83,135,218,187,58,144,89,108,85,213,32,253,248,106,31,62,
+    128,60,219,222,209,45,239,104,22,88,172,151,215,175,230,237,
+    156,47,248,148,179,249,144,21,242,89,24,32,84,92,148,102,
+    128,238,16,241,37,201,44,69,133,138,81,12,38,100,58,238,
+    47,219,83,246,131,176,63,242,220,46,209,120,236,201,50,230,
+    186,65,157,10,220,121,47,165,108,235,76,190,93,75,185,8,
+    249,14,80,27,165,115,151,218,216,14,82,27,165,46,233,53,
+    115,137,124,138,255,62,136,97,197,46,193,201,26,51,87,97,
+    47,130,72,100,7,186,234,8,191,204,46,230,133,222,69,134,
+    203,41,170,26,129,112,36,22,146,243,64,8,80,39,76,114,
+    16,195,81,233,129,182,143,101,113,9,52,246,69,71,10,105,
+    23,110,208,72,196,14,100,209,80,201,106,128,147,9,58,155,
+    245,2,76,75,2,100,30,72,73,115,17,52,117,136,68,37,
+    74,204,68,49,162,91,128,32,151,73,76,117,105,89,3,133,
+    181,85,138,235,86,188,48,80,191,166,155,104,242,64,189,123,
+    226,154,69,7,53,136,65,158,228,182,30,34,196,168,52,51,
+    209,187,111,24,251,193,102,199,232,57,9,196,129,175,170,6,
+    176,107,35,113,88,12,34,98,112,242,19,183,140,8,144,43,
+    131,26,160,234,175,44,162,132,196,136,156,179,37,148,92,25,
+    154,80,40,74,206,241,70,232,250,213,92,25,16,110,96,39,
+    41,5,192,152,7,159,56,232,220,254,53,124,222,141,224,137,
+    78,80,254,187,136,37,8,20,235,164,69,88,130,174,10,97,
+    149,180,72,96,180,74,75,157,230,252,47,153,225,127,71,66,
+    240,63,113,36,250,82,45,176,174,107,254,247,94,126,244,242,
+    138,59,91,211,162,214,116,173,148,229,203,184,154,198,247,171,
+    190,87,245,158,247,145,55,111,175,112,87,127,86,87,255,232,
+    185,181,111,124,252,218,71,111,100,234,70,213,186,209,188,19,
+    174,226,206,64,203,182,79,216,242,9,25,95,183,234,235,206,
+    187,241,106,5,215,208,185,93,223,183,85,223,151,169,31,80,
+    235,7,242,149,112,245,203,10,238,208,145,79,23,31,55,255,
+    217,75,63,187,148,25,123,69,29,123,133,94,247,113,117,168,
+    19,220,188,153,246,93,166,223,66,74,84,198,185,27,87,147,
+    25,87,155,234,106,75,235,95,202,31,151,36,55,243,255,63,
+    185,217,183,54,191,12,185,17,237,152,235,195,34,221,144,166,
+    135,57,241,183,37,58,40,35,144,109,18,147,204,152,86,113,
+    191,52,185,161,100,6,97,155,86,42,191,20,165,249,165,41,
+    12,150,125,112,10,131,130,66,41,10,35,163,178,99,169,28,
+    111,79,140,141,77,202,191,129,184,242,46,87,154,38,96,174,
+    61,105,66,81,6,20,47,149,159,113,132,38,248,254,191,65,
+    19,210,141,3,235,126,72,224,155,113,13,170,174,193,180,254,
+    221,67,120,198,61,148,175,175,140,65,17,121,233,152,49,94,
+    175,105,214,77,134,19,22,195,124,19,11,71,86,24,148,37,
+    28,22,23,112,98,36,130,158,124,159,179,138,128,205,200,163,
+    21,108,21,209,88,121,75,61,86,70,174,100,166,38,28,184,
+    102,50,112,208,247,200,213,245,82,142,45,227,29,83,189,99,
+    105,215,216,30,189,49,200,21,146,74,147,44,150,232,129,225,
+    146,61,160,203,102,184,173,102,105,56,225,103,203,225,246,77,
+    184,83,212,110,31,81,19,210,103,201,150,220,82,139,181,185,
+    236,189,14,108,165,143,211,2,6,2,103,186,244,110,234,97,
+    42,237,106,45,110,156,93,111,220,80,81,227,82,108,243,44,
+    84,140,52,239,111,138,154,103,250,15,36,49,80,168,50,162,
+    77,107,234,213,132,151,88,211,70,139,20,102,177,210,215,157,
+    217,20,234,217,22,54,188,160,128,218,77,79,151,112,217,165,
+    142,62,36,172,7,138,156,140,65,175,134,113,187,61,197,250,
+    246,34,165,68,255,94,139,106,194,129,45,146,67,208,230,162,
+    17,169,45,118,227,101,117,96,197,119,123,113,84,234,233,168,
+    120,0,247,112,127,103,48,227,13,168,222,64,218,21,40,30,
+    26,94,31,26,31,87,56,11,201,0,236,148,196,47,182,73,
+    166,39,100,36,158,76,20,122,65,106,14,122,35,22,15,207,
+    130,190,151,168,193,44,42,192,137,128,104,209,114,146,177,141,
+    139,116,105,161,64,13,56,250,254,255,244,174,83,145,248,60,
+    235,6,41,32,10,71,23,68,214,98,21,68,190,153,82,221,
+    94,87,194,23,115,169,189,96,46,88,111,143,96,199,87,209,
+    73,239,161,147,62,237,234,45,238,112,131,39,250,111,73,135,
+    139,252,50,127,11,185,31,166,227,207,115,111,189,72,162,51,
+    217,151,29,192,201,48,156,135,105,221,114,151,28,201,246,148,
+    99,153,127,216,84,144,203,94,144,171,9,248,151,146,187,63,
+    41,71,138,95,170,40,156,121,60,247,240,108,202,70,116,210,
+    63,216,107,254,233,238,160,100,223,92,161,254,136,196,56,21,
+    61,60,25,231,33,97,208,88,167,173,146,6,6,35,165,150,
+    244,104,34,12,43,113,242,190,132,90,109,225,141,132,124,151,
+    88,141,145,169,138,103,82,156,141,160,192,120,142,146,29,144,
+    128,147,78,31,68,124,25,229,105,249,85,28,198,178,240,252,
+    60,60,8,119,145,125,39,114,188,156,204,185,147,137,16,213,
+    175,104,230,58,4,21,113,92,4,115,205,38,187,40,114,34,
+    66,166,151,178,212,104,29,123,227,198,49,28,245,91,116,212,
+    43,184,154,218,21,103,214,223,0,75,180,208,171,10,199,242,
+    156,195,61,70,146,140,167,109,229,229,53,71,214,219,252,225,
+    155,106,251,161,45,239,161,180,247,80,182,169,109,213,185,234,
+    204,214,180,126,184,168,118,30,218,170,57,148,174,57,148,245,
+    53,211,165,122,221,191,225,252,65,91,198,23,84,125,193,180,
+    47,248,236,137,183,41,237,106,218,3,159,130,246,194,9,188,
+    202,43,15,89,250,122,16,30,150,231,88,30,150,221,183,248,
+    245,114,246,44,222,100,129,92,82,221,104,133,204,230,47,84,
+    61,46,243,184,71,18,42,43,149,215,140,198,183,108,179,242,
+    190,239,0,103,125,144,152,123,133,81,175,172,216,174,188,152,
+    172,55,159,4,94,157,137,30,87,32,47,196,44,229,59,72,
+    249,30,174,196,231,235,148,47,191,196,198,227,51,99,236,173,
+    51,210,192,110,144,121,110,151,103,125,92,137,143,88,16,123,
+    48,197,135,140,246,88,122,220,136,131,39,31,78,182,50,240,
+    235,246,206,189,238,231,74,124,246,106,59,207,197,155,119,45,
+    161,126,183,103,196,50,192,21,142,201,105,226,33,51,118,187,
+    213,0,158,231,111,144,255,64,249,82,214,42,30,197,164,228,
+    237,132,102,193,198,6,68,49,2,129,80,35,215,176,140,81,
+    86,22,208,65,30,213,6,97,217,228,6,102,18,32,201,200,
+    243,168,123,213,137,26,81,92,34,4,19,34,209,72,162,222,
+    57,172,24,193,70,22,230,5,212,35,90,22,74,139,65,110,
+    36,22,250,206,2,60,191,16,131,133,111,14,247,223,136,34,
+    20,136,228,213,111,92,35,33,195,2,236,110,156,141,154,41,
+    161,193,82,105,139,90,228,187,13,139,218,58,106,81,123,103,
+    151,78,211,172,81,253,104,91,75,44,82,63,225,115,149,17,
+    37,116,247,30,221,103,254,132,218,217,210,93,60,86,251,121,
+    6,146,165,0,99,221,196,116,107,9,35,91,92,224,148,32,
+    103,24,217,214,94,134,239,70,111,186,174,103,245,152,90,215,
+    147,169,235,83,235,250,232,85,246,91,154,229,252,219,183,82,
+    254,1,38,255,253,223,178,81,209,130,70,53,78,194,119,35,
+    153,110,26,92,115,168,77,131,153,166,33,181,105,136,94,101,
+    191,164,81,183,254,253,39,79,183,174,205,188,122,230,102,160,
+    145,234,165,113,143,53,231,11,205,203,18,91,172,140,172,135,
+    252,22,222,171,178,196,125,147,127,21,111,60,143,55,236,32,
+    80,147,141,89,249,155,152,224,92,203,85,132,194,209,168,102,
+    42,64,149,221,100,93,203,213,206,69,30,92,138,38,102,194,
+    209,139,116,119,99,118,49,87,137,113,129,110,16,159,50,37,
+    87,201,224,99,174,146,49,151,195,253,46,163,90,57,87,88,
+    9,205,39,148,200,3,25,87,201,92,13,158,36,217,138,107,
+    155,192,57,7,34,63,169,167,117,23,216,195,102,102,245,232,
+    236,245,115,216,195,239,240,218,206,47,209,163,63,229,142,184,
+    71,64,68,174,170,121,120,117,219,51,184,229,25,204,120,134,
+    84,207,80,218,51,244,89,93,227,147,186,70,181,14,208,234,
+    80,222,206,181,119,169,109,163,233,182,209,39,245,205,143,190,
+    181,93,31,220,170,15,82,123,170,108,67,203,163,187,121,183,
+    211,95,253,148,131,228,11,76,86,206,231,107,185,150,142,149,
+    243,15,95,206,119,115,205,237,31,84,170,77,163,43,87,118,
+    188,181,20,19,55,3,219,71,46,108,29,185,144,57,114,73,
+    61,114,9,46,100,106,47,171,144,122,47,171,222,203,121,206,
+    89,117,102,199,215,178,246,220,207,251,159,203,248,38,84,223,
+    68,222,14,151,62,243,55,210,33,223,92,220,62,113,117,235,
+    196,213,204,137,107,234,137,107,112,33,211,56,169,66,234,159,
+    84,253,147,121,39,100,5,81,171,166,238,145,107,219,55,188,
+    229,27,206,248,70,85,223,104,218,55,186,211,211,247,209,201,
+    237,158,19,91,61,39,30,59,51,61,167,213,158,211,171,14,
+    213,39,0,79,226,243,63,252,174,234,237,207,115,246,170,241,
+    29,95,237,163,234,181,228,7,223,85,59,199,183,59,207,108,
+    117,158,201,116,158,85,59,207,102,124,47,169,190,151,210,228,
+    251,25,205,163,118,30,203,248,142,171,190,227,105,223,241,108,
+    87,31,238,143,119,128,48,75,123,51,176,229,9,100,60,195,
+    170,103,56,173,127,243,18,143,253,141,157,78,55,31,220,184,
+    45,79,112,201,162,18,116,105,115,243,243,191,42,98,87,14,
+    34,245,3,107,124,8,85,133,165,247,63,239,113,178,192,6,
+    110,21,249,148,13,149,104,108,41,41,38,42,247,247,185,15,
+    29,133,234,181,135,135,83,7,98,103,96,233,173,218,227,30,
+    179,120,223,209,95,132,66,89,22,238,142,81,195,66,198,32,
+    197,132,0,46,52,19,113,91,97,86,26,207,20,40,82,97,
+    105,244,152,199,102,8,224,117,166,182,187,213,27,213,174,162,
+    243,46,57,150,47,67,63,84,31,224,25,71,178,195,188,151,
+    236,50,143,205,240,188,169,130,94,54,71,96,217,110,105,85,
+    173,249,68,202,94,100,92,86,182,236,100,123,79,254,47,44,
+    207,26,172,67,65,253,202,196,114,232,245,178,226,190,14,25,
+    236,10,222,125,171,149,136,92,229,203,46,104,55,195,16,154,
+    159,84,121,202,85,100,188,211,150,28,49,115,148,14,189,43,
+    186,74,149,95,248,186,151,183,58,151,203,161,4,251,93,130,
+    205,114,35,212,162,169,116,45,10,216,71,155,232,88,118,62,
+    20,118,173,181,29,238,52,151,186,83,80,159,130,150,237,90,
+    190,189,84,249,41,39,252,186,111,128,200,241,240,102,160,34,
+    252,213,238,138,103,205,101,151,196,64,148,205,40,46,214,40,
+    9,36,224,16,112,90,84,123,96,13,234,164,107,82,102,181,
+    120,66,209,197,98,229,175,65,123,118,139,30,68,181,15,76,
+    24,83,220,252,223,199,5,93,147,55,23,152,240,55,52,80,
+    23,1,54,61,173,5,195,209,131,139,233,182,91,104,152,191,
+    103,236,174,130,40,48,192,82,70,238,161,198,4,120,60,45,
+    140,24,187,145,189,79,128,43,3,78,76,74,22,72,232,20,
+    58,176,148,65,195,246,97,239,24,110,67,67,187,117,156,181,
+    183,176,79,216,176,119,75,117,100,155,63,28,71,3,6,234,
+    247,38,12,44,93,25,32,110,158,51,40,225,27,154,24,221,
+    1,68,76,16,13,13,53,16,33,187,118,194,98,98,129,45,
+    68,9,10,175,65,86,180,81,40,122,31,14,241,23,162,138,
+    83,226,45,228,93,230,217,184,218,236,203,95,222,179,61,244,
+    233,30,62,188,60,204,25,46,98,69,47,75,145,175,112,154,
+    9,166,249,10,129,82,126,58,107,200,123,224,27,84,208,77,
+    199,142,246,197,122,242,196,223,241,165,157,171,17,214,43,84,
+    223,112,222,110,185,71,22,201,155,68,121,113,177,116,123,142,
+    152,237,241,235,239,247,217,173,85,41,219,156,13,90,86,111,
+    182,12,95,178,162,57,37,229,60,166,170,42,34,202,31,114,
+    5,44,214,65,27,250,7,216,208,113,189,161,129,90,51,249,
+    155,166,161,53,207,186,8,141,109,232,94,31,81,235,199,54,
+    253,105,255,56,180,152,205,180,7,143,46,112,12,143,238,54,
+    94,102,196,107,252,120,133,201,143,119,152,205,146,255,9,182,
+    141,15,89,219,66,88,115,97,183,182,232,28,249,63,193,166,
+    160,179,134,230,244,198,217,142,212,146,228,175,251,142,173,127,
+    123,243,240,234,43,121,187,126,169,84,66,221,167,2,45,57,
+    111,136,162,121,136,162,185,146,115,220,149,22,149,156,29,120,
+    239,92,185,118,141,238,35,255,35,76,16,77,40,155,93,3,
+    243,240,156,62,44,23,200,75,21,166,241,102,24,111,186,244,
+    104,216,116,163,162,66,223,168,184,34,202,171,152,9,209,150,
+    186,31,213,39,229,112,92,193,172,84,245,137,251,71,11,138,
+    140,122,246,92,45,58,45,21,148,49,67,240,33,68,131,177,
+    145,71,114,14,244,95,203,185,144,183,39,117,247,104,254,50,
+    228,174,252,91,216,225,110,186,253,253,63,226,195,85,150,6,
+    231,92,68,205,138,120,53,66,202,36,181,72,196,67,136,49,
+    81,137,120,10,185,13,244,35,67,70,17,208,205,105,234,54,
+    65,31,186,156,29,198,106,169,202,50,116,191,138,227,116,219,
+    70,80,174,133,235,232,86,219,15,111,183,143,111,181,143,103,
+    218,79,170,237,39,243,92,153,187,150,36,43,215,178,222,182,
+    143,237,31,85,166,189,195,240,221,105,232,204,219,108,245,23,
+    248,141,81,244,124,64,11,78,76,159,116,246,168,157,71,55,
+    175,169,157,47,229,157,230,229,167,118,71,99,237,23,28,36,
+    121,206,81,83,139,6,53,35,121,31,231,174,218,118,53,111,
+    185,154,51,174,86,213,213,154,118,181,126,230,106,207,184,58,
+    85,242,78,163,29,87,133,234,106,203,219,140,185,222,221,175,
+    118,143,231,157,112,248,20,207,191,32,51,221,69,92,244,250,
+    158,86,150,161,161,114,25,154,39,99,82,219,231,110,220,233,
+    237,255,232,234,166,59,211,59,161,246,78,32,123,221,149,109,
+    108,85,27,71,182,27,79,108,53,158,200,52,62,167,54,62,
+    183,114,57,235,109,92,235,250,205,212,74,10,36,153,230,246,
+    237,166,241,173,166,241,76,211,73,181,233,228,170,115,167,117,
+    104,199,223,174,250,143,110,94,200,248,39,84,255,196,23,118,
+    91,91,237,170,235,203,50,16,17,84,95,239,250,235,27,151,
+    13,30,254,73,87,127,218,211,145,245,214,169,222,158,60,231,
+    173,26,135,92,237,157,106,219,225,76,219,81,181,237,232,170,
+    27,154,162,77,212,39,193,19,208,142,64,237,83,60,249,2,
+    19,148,37,250,160,49,195,199,242,28,95,51,65,146,140,191,
+    127,245,149,245,222,172,191,105,219,223,183,229,239,91,143,110,
+    158,207,248,159,83,253,207,165,201,119,167,119,240,127,184,246,
+    223,93,51,231,76,246,228,89,50,169,158,226,201,23,28,61,
+    234,195,163,62,200,224,172,25,39,9,204,188,50,174,169,119,
+    253,193,86,227,88,186,113,44,219,218,185,221,58,178,213,58,
+    178,241,237,76,235,132,218,138,101,55,143,103,15,31,79,183,
+    5,159,61,241,248,182,61,237,91,158,246,181,219,27,142,237,
+    193,83,91,131,167,50,131,103,212,193,51,25,207,139,170,231,
+    197,180,231,69,104,47,181,207,92,111,202,120,135,84,239,16,
+    60,94,53,148,237,11,164,125,221,184,53,215,141,231,141,89,
+    95,195,106,217,211,171,60,140,10,245,114,253,75,29,77,103,
+    25,35,76,174,92,35,89,159,255,31,92,225,75,203,88,90,
+    12,76,52,163,145,146,199,217,179,20,163,193,103,158,0,102,
+    55,229,88,224,65,120,97,61,62,248,148,195,212,183,18,49,
+    198,110,57,183,127,232,44,20,94,82,140,117,65,105,203,6,
+    40,9,214,138,98,95,146,7,188,89,51,209,177,84,133,150,
+    28,33,243,138,243,6,23,40,91,250,35,102,55,0,9,72,
+    97,232,176,82,145,66,71,216,16,160,104,200,104,114,47,0,
+    2,248,145,121,84,39,8,218,206,209,110,17,66,133,193,176,
+    162,44,196,40,20,180,61,68,152,108,172,50,81,194,208,39,
+    70,120,8,18,22,130,81,135,45,121,46,232,144,195,192,139,
+    248,7,216,122,163,209,37,94,109,183,92,189,31,182,70,105,
+    38,46,25,232,106,129,75,171,252,43,152,204,113,186,157,32,
+    241,244,35,91,16,191,203,145,237,8,66,48,13,60,202,185,
+    233,198,20,240,81,185,42,211,23,18,78,11,246,29,228,63,
+    229,172,214,130,44,169,254,11,164,134,127,192,105,123,123,245,
+    93,235,77,170,127,104,197,157,173,244,170,149,1,244,118,170,
+    205,182,9,106,219,68,214,231,87,125,253,64,13,218,171,87,
+    174,193,116,242,53,175,87,165,189,163,240,37,116,145,175,191,
+    196,175,159,82,123,96,194,225,33,77,179,77,93,31,120,243,
+    118,243,2,77,159,218,237,72,26,237,72,26,237,64,26,43,
+    128,42,2,221,219,118,245,108,185,122,214,223,220,116,164,123,
+    143,103,92,227,170,107,60,237,26,207,186,60,105,87,135,234,
+    234,88,71,255,13,122,152,38,223,98,211,32,227,13,128,67,
+    69,142,84,150,201,4,178,254,219,45,172,45,52,43,249,91,
+    222,234,87,48,21,220,214,141,12,91,225,230,114,15,151,116,
+    153,247,123,57,121,146,223,21,54,72,169,149,230,29,50,17,
+    141,201,69,38,162,189,132,115,150,81,122,202,110,109,143,181,
+    173,248,26,146,189,106,58,107,123,19,106,123,159,123,96,127,
+    147,187,207,7,28,75,166,112,242,218,66,188,48,42,174,117,
+    66,50,129,127,244,55,81,88,67,45,24,160,44,129,126,0,
+    0,163,72,94,154,120,29,230,210,168,25,128,197,176,101,30,
+    51,132,58,178,37,168,135,210,53,43,48,176,20,160,76,63,
+    217,192,13,10,175,27,47,24,211,67,189,152,65,50,2,46,
+    89,228,144,247,185,42,45,94,144,101,32,13,56,207,114,14,
+    12,184,153,171,178,68,234,36,62,77,116,202,161,235,114,192,
+    97,206,182,92,185,214,25,242,255,204,21,218,225,200,127,206,
+    21,204,45,134,209,249,87,56,183,254,41,167,109,228,213,53,
+    170,181,125,235,183,213,218,177,149,242,108,101,237,202,153,157,
+    218,150,15,95,216,112,169,173,135,51,181,71,212,218,35,105,
+    207,145,188,163,202,221,181,83,215,184,86,254,222,169,71,167,
+    210,30,225,217,142,183,45,207,85,186,187,204,4,22,217,230,
+    190,245,111,170,77,193,149,43,196,19,209,86,211,158,109,238,
+    254,160,19,86,194,154,118,88,22,181,4,56,16,100,25,28,
+    200,76,96,82,193,1,47,208,112,104,179,89,109,120,126,229,
+    82,118,228,40,113,177,92,119,101,60,1,182,68,250,205,55,
+    66,73,207,158,61,35,198,24,63,174,158,224,254,233,217,250,
+    151,106,237,127,82,195,67,154,171,102,28,153,197,136,92,218,
+    62,15,251,111,55,163,19,246,93,68,69,209,19,10,119,102,
+    136,39,83,248,239,237,39,254,135,239,73,37,66,208,19,220,
+    52,208,204,136,103,111,226,34,9,247,109,9,144,2,203,140,
+    44,209,120,250,24,86,66,20,6,167,167,71,71,205,12,163,
+    36,195,244,116,192,26,175,60,38,197,48,70,86,36,22,190,
+    37,25,177,155,217,184,43,50,190,177,238,30,181,143,163,30,
+    11,88,14,134,86,55,96,128,236,127,60,8,75,84,52,200,
+    244,176,94,92,177,74,194,58,12,84,47,65,204,200,180,18,
+    204,240,253,247,201,251,81,172,53,218,207,151,80,183,184,195,
+    158,21,217,93,32,59,17,55,228,9,156,27,118,37,41,235,
+    102,234,42,87,224,236,231,45,120,81,237,82,51,227,106,101,
+    189,245,185,205,112,129,249,210,207,185,43,31,86,253,246,236,
+    90,48,211,16,80,27,2,25,215,144,234,26,74,235,95,66,
+    248,151,234,250,6,169,209,109,64,25,235,27,140,135,99,82,
+    64,185,153,43,167,219,255,74,174,18,149,40,232,219,136,62,
+    250,101,64,157,18,11,201,92,37,243,62,221,89,150,149,113,
+    235,72,251,239,97,118,255,253,154,247,201,171,224,162,92,140,
+    95,46,3,186,203,159,231,222,26,67,77,154,104,191,199,41,
+    13,162,35,85,14,191,181,165,245,197,228,158,67,116,226,175,
+    92,103,209,28,151,165,202,129,178,151,23,155,95,62,60,116,
+    96,253,48,59,157,202,74,231,82,234,44,185,202,75,231,2,
+    88,172,141,185,109,222,207,78,74,83,35,106,125,106,158,23,
+    93,98,129,198,114,217,102,217,236,230,215,153,117,109,183,150,
+    20,24,234,186,34,220,178,59,194,253,102,77,202,165,216,83,
+    238,85,94,254,73,202,37,255,117,146,209,49,166,220,5,58,
+    105,155,166,83,254,243,148,171,180,30,186,208,195,73,211,197,
+    86,88,198,109,159,173,241,84,153,249,2,57,209,77,198,175,
+    226,195,2,45,242,114,165,165,191,77,13,181,125,189,150,43,
+    241,17,43,83,229,187,220,241,136,85,86,216,5,103,214,94,
+    243,164,60,34,175,153,227,52,3,6,213,113,37,62,169,242,
+    84,69,170,50,229,72,57,127,8,227,251,99,99,140,121,188,
+    83,153,12,48,57,61,86,248,115,48,18,41,15,242,18,48,
+    22,117,7,25,139,205,63,79,14,239,158,11,102,209,31,147,
+    49,240,44,87,165,220,165,199,172,176,14,223,182,147,49,171,
+    92,174,78,85,255,186,21,67,205,215,174,85,23,46,25,192,
+    167,141,49,48,43,173,247,143,115,203,94,246,101,112,119,140,
+    150,165,188,5,61,236,19,241,237,175,213,133,122,236,120,101,
+    15,119,24,102,249,125,27,229,160,120,238,77,184,202,91,150,
+    181,59,134,17,69,97,249,240,124,43,112,138,204,43,230,88,
+    174,113,206,6,124,35,190,158,222,43,250,34,252,178,239,77,
+    46,238,208,57,53,11,252,54,3,126,85,193,104,248,196,26,
+    50,106,190,119,107,82,229,228,149,116,255,44,229,90,229,55,
+    127,132,51,107,243,39,43,53,115,188,88,251,142,11,233,90,
+    145,245,103,93,248,188,155,117,180,215,148,70,130,130,86,88,
+    225,168,102,94,165,144,215,185,88,93,246,146,152,45,49,87,
+    192,13,154,182,221,196,152,50,66,215,218,8,176,132,90,164,
+    26,100,241,238,194,162,168,1,196,23,167,197,37,77,155,44,
+    75,196,41,77,193,80,57,196,242,210,20,243,204,117,149,188,
+    158,246,126,88,142,73,226,232,194,188,86,15,202,165,226,202,
+    73,221,247,232,139,25,80,197,76,27,16,44,136,27,72,171,
+    68,124,217,4,250,138,109,98,69,198,176,24,36,92,43,26,
+    107,26,27,10,154,95,94,210,12,196,168,187,15,83,150,53,
+    46,234,221,161,65,35,64,166,167,139,157,140,209,162,144,188,
+    95,140,133,69,195,178,89,226,174,1,199,33,47,104,230,146,
+    140,170,92,131,171,57,196,89,140,61,232,171,194,105,155,52,
+    71,31,202,36,144,49,163,111,79,1,1,154,188,73,151,110,
+    60,104,107,38,192,33,125,34,51,145,234,117,235,16,38,40,
+    155,196,96,2,237,249,72,82,31,209,136,246,58,12,12,60,
+    72,59,34,102,154,234,201,36,238,50,27,92,129,125,151,48,
+    126,138,222,132,112,176,183,248,210,183,242,98,252,100,34,202,
+    232,172,22,243,126,44,29,133,137,255,57,202,225,74,178,56,
+    130,40,205,52,72,30,156,192,124,35,66,84,138,223,66,251,
+    127,56,41,17,198,158,132,184,198,64,249,131,70,85,38,76,
+    157,241,30,129,168,173,181,47,129,28,180,220,226,240,164,180,
+    79,138,29,82,53,233,140,84,198,218,48,104,42,198,211,20,
+    78,49,5,226,96,133,180,46,41,14,97,250,221,185,110,122,
+    239,187,145,229,238,9,189,87,134,160,61,40,153,69,0,31,
+    113,152,81,233,128,114,148,52,168,1,10,44,23,187,164,50,
+    200,117,234,228,174,145,74,97,144,241,37,25,133,195,123,17,
+    30,68,212,67,187,17,96,106,21,35,76,50,202,122,138,49,
+    21,105,196,236,40,141,27,120,233,252,75,1,26,198,216,58,
+    186,17,133,176,245,100,38,44,82,76,212,46,81,69,15,35,
+    90,20,179,220,90,3,11,222,70,198,216,91,17,50,71,115,
+    141,32,60,109,238,35,131,186,187,239,240,36,220,165,134,220,
+    196,129,6,163,155,161,191,26,62,164,140,8,74,130,186,192,
+    16,247,214,82,177,194,245,15,78,74,244,81,37,50,128,34,
+    97,141,49,174,100,201,87,162,104,67,177,219,102,166,62,249,
+    205,73,79,105,232,126,254,207,236,11,168,110,35,85,57,247,
+    234,235,10,246,131,38,157,23,213,133,178,230,180,26,154,39,
+    12,251,214,49,218,159,164,54,65,225,134,180,235,214,34,145,
+    156,16,151,145,4,62,15,167,186,76,64,77,236,25,42,188,
+    231,72,92,39,10,13,140,109,0,237,213,229,70,89,123,1,
+    210,194,140,146,140,36,201,27,217,118,119,147,182,84,164,168,
+    181,140,0,130,206,235,122,128,56,205,229,41,105,37,86,12,
+    42,149,28,66,102,55,218,186,105,76,195,71,35,238,155,171,
+    66,36,206,118,37,235,175,77,141,176,41,28,74,33,10,10,
+    47,194,99,186,102,210,188,37,250,225,118,34,42,106,14,254,
+    211,48,164,48,156,211,166,135,63,22,63,66,214,35,45,178,
+    41,210,116,92,254,96,202,150,242,99,143,88,150,80,109,11,
+    8,183,178,41,124,108,50,93,243,12,120,184,121,84,114,115,
+    156,104,138,21,26,116,26,3,172,146,58,144,174,7,8,131,
+    97,69,51,250,39,87,136,145,63,93,147,75,238,103,67,97,
+    168,80,194,142,133,5,47,28,65,234,129,235,112,129,17,249,
+    39,124,174,92,123,111,123,192,158,227,190,226,131,75,182,96,
+    240,43,126,236,43,158,91,170,191,66,253,72,217,190,21,6,
+    190,226,7,136,90,88,126,2,201,146,39,168,33,0,186,114,
+    45,185,116,172,254,138,239,91,178,245,245,77,230,156,164,26,
+    75,93,70,223,194,236,33,145,188,181,165,159,88,196,227,56,
+    105,234,98,236,237,34,91,111,178,55,140,194,55,198,198,140,
+    224,134,105,37,90,79,191,107,99,21,150,191,101,123,232,209,
+    246,130,217,45,211,156,3,107,132,130,55,89,91,44,33,42,
+    101,124,205,240,210,208,141,146,139,13,179,133,138,187,133,100,
+    59,248,59,118,45,112,232,179,183,185,180,247,36,253,110,56,
+    86,29,171,183,214,196,71,49,227,18,81,1,4,218,169,30,
+    226,95,99,242,247,56,162,140,144,230,115,21,223,64,147,9,
+    170,238,195,13,210,92,141,177,78,156,215,232,124,174,78,163,
+    248,103,163,209,87,244,155,57,59,76,161,156,123,118,126,65,
+    11,218,247,219,156,30,189,208,14,75,112,206,62,159,152,167,
+    222,186,142,59,192,120,230,202,40,106,231,28,216,40,108,63,
+    225,85,115,181,33,152,113,33,202,2,105,77,205,85,134,18,
+    243,82,60,52,31,17,231,196,92,117,232,126,24,7,66,35,
+    176,57,231,108,52,161,72,57,7,102,1,208,48,204,57,7,
+    6,139,204,149,209,96,151,185,242,235,55,72,107,114,13,248,
+    32,221,141,13,37,19,68,197,136,195,25,168,165,234,151,44,
+    38,127,141,73,14,147,127,197,105,219,171,180,131,254,45,214,
+    188,28,93,23,128,154,67,117,41,89,207,57,9,155,64,52,
+    35,24,127,20,87,14,104,105,4,74,167,5,229,156,180,214,
+    252,28,214,7,243,200,191,0,72,74,45,199,236,181,234,159,
+    23,53,243,74,118,152,89,229,40,123,253,255,70,133,207,16,
+    13,69,152,95,2,153,173,51,173,107,246,233,247,137,191,53,
+    207,149,187,95,226,105,186,114,254,137,207,191,230,77,251,6,
+    224,155,173,107,88,235,93,125,126,245,249,157,186,250,71,227,
+    107,55,87,79,175,158,206,214,53,174,29,91,125,97,245,133,
+    207,26,132,116,215,139,143,253,144,208,111,166,225,172,218,112,
+    54,237,59,155,119,114,126,33,239,42,222,133,221,241,214,168,
+    222,158,140,183,79,245,246,97,96,158,190,29,79,181,234,233,
+    206,120,122,85,79,111,218,211,251,89,67,243,218,112,186,229,
+    133,159,212,126,218,246,73,199,167,29,112,248,248,240,227,112,
+    166,225,69,181,225,197,149,202,157,218,134,213,251,239,47,127,
+    111,249,189,95,123,244,107,153,218,1,181,118,96,165,60,95,
+    198,213,213,175,148,103,107,253,43,229,79,170,235,243,92,187,
+    123,96,173,241,41,254,100,107,155,243,92,85,213,5,254,195,
+    217,245,129,223,137,126,16,221,248,214,86,199,201,116,199,201,
+    108,71,223,239,221,253,221,187,27,93,191,19,255,32,254,94,
+    37,224,189,180,211,33,124,112,235,247,162,191,27,205,250,91,
+    31,77,166,123,39,54,28,144,208,239,83,187,173,19,55,59,
+    59,107,87,43,191,116,113,141,205,143,110,101,253,45,239,79,
+    126,111,114,125,98,35,249,251,169,31,165,30,159,251,169,63,
+    51,118,81,29,187,152,241,95,82,253,151,224,9,220,123,129,
+    100,213,14,21,244,55,174,117,125,239,228,234,73,178,227,58,
+    188,229,31,206,54,181,173,73,235,223,218,28,126,188,8,89,
+    235,27,32,107,125,67,158,36,101,92,87,223,250,221,127,252,
+    252,99,37,115,244,156,122,244,92,186,243,252,106,249,154,253,
+    61,79,190,149,171,107,41,221,158,47,187,57,33,184,113,43,
+    211,57,174,118,142,231,185,202,170,1,146,64,203,236,171,223,
+    200,14,31,249,253,231,127,244,252,166,146,25,126,94,29,126,
+    62,227,27,132,246,222,93,63,158,173,107,74,215,245,238,248,
+    27,30,93,94,123,253,189,235,143,174,175,94,199,112,123,175,
+    240,59,205,237,107,119,51,205,67,106,51,238,185,214,7,55,
+    194,59,93,125,31,53,111,28,254,65,219,71,109,107,101,184,
+    211,20,36,55,72,242,20,147,47,56,203,181,82,201,179,103,
+    207,74,93,254,12,202,191,2,197,249,135,84,255,80,154,124,
+    159,237,52,117,126,220,146,110,28,193,205,234,87,120,54,133,
+    129,75,15,188,156,110,191,186,122,17,255,160,42,112,17,32,
+    127,214,63,168,246,159,249,105,89,166,255,146,218,127,105,181,
+    108,245,187,25,95,79,86,232,135,158,115,188,87,181,90,149,
+    127,158,243,54,60,101,80,35,127,154,243,61,103,208,185,205,
+    114,72,50,222,147,42,156,185,78,18,67,153,191,232,246,94,
+    62,98,251,139,195,245,151,107,157,127,89,230,129,227,191,172,
+    117,92,110,112,255,101,131,29,143,155,121,60,110,105,196,227,
+    35,245,87,42,156,255,194,205,67,74,166,191,108,227,209,189,
+    11,18,139,242,211,216,54,235,117,80,239,49,83,245,41,218,
+    83,101,230,30,110,132,95,46,23,249,101,151,155,75,57,228,
+    14,118,175,218,84,127,30,36,34,32,143,161,169,109,169,34,
+    77,255,110,74,208,148,179,68,206,3,248,216,167,202,69,7,
+    81,132,112,235,229,7,202,237,212,114,187,14,148,187,12,115,
+    199,47,247,112,73,70,153,215,203,201,207,47,187,89,133,168,
+    105,86,91,164,128,221,67,165,118,199,80,143,161,202,56,229,
+    254,62,247,161,29,202,116,97,153,162,123,217,245,38,39,86,
+    44,187,127,213,29,119,209,223,251,188,174,36,114,115,201,118,
+    6,174,93,172,180,170,175,142,115,203,21,201,78,166,126,134,
+    130,19,85,133,69,6,178,21,248,119,80,5,88,188,15,122,
+    163,219,210,27,77,208,206,3,245,6,109,21,163,236,234,99,
+    158,218,197,16,23,96,15,50,185,140,114,14,230,179,99,121,
+    214,48,179,61,224,179,165,21,136,174,162,221,171,10,178,45,
+    252,159,69,91,140,13,99,207,210,223,181,108,24,27,94,151,
+    68,189,167,169,127,40,55,26,142,155,175,72,215,153,255,162,
+    87,221,154,78,188,84,93,67,162,64,17,17,114,122,218,162,
+    159,176,136,84,132,193,150,119,48,249,156,211,141,34,42,76,
+    25,64,254,46,92,88,178,77,8,242,103,120,155,152,90,228,
+    248,251,129,22,134,109,36,15,98,190,156,147,136,102,242,191,
+    196,11,104,160,70,173,226,30,224,173,170,151,194,138,100,70,
+    169,118,39,101,96,244,102,194,179,119,241,181,7,184,249,38,
+    61,152,205,57,240,77,9,24,125,25,217,225,80,72,254,10,
+    31,255,191,240,113,7,134,177,144,255,3,167,185,50,229,170,
+    196,4,26,206,157,195,87,230,44,204,203,127,140,215,128,219,
+    18,113,135,202,57,23,93,80,110,147,83,96,236,41,87,235,
+    36,156,94,160,146,114,121,86,66,94,200,229,185,240,218,255,
+    134,79,241,18,106,145,57,5,231,27,195,162,81,190,252,223,
+    97,207,180,177,22,33,133,60,43,242,241,202,164,77,11,188,
+    89,204,156,213,182,172,93,250,96,50,93,51,188,82,150,245,
+    215,175,184,243,182,74,119,75,214,219,130,198,79,93,232,19,
+    226,122,191,250,123,213,25,159,160,250,132,180,79,200,122,106,
+    86,46,172,246,190,123,245,225,213,149,171,89,143,239,191,185,
+    252,155,151,87,223,204,120,58,85,79,103,218,211,153,109,239,
+    218,110,63,178,213,126,36,211,126,76,109,63,182,114,113,117,
+    252,221,201,108,207,192,118,207,217,173,158,179,153,158,115,106,
+    207,57,184,248,66,198,35,100,59,186,127,47,254,187,241,76,
+    71,80,237,8,194,181,19,239,94,95,185,78,183,201,237,238,
+    22,51,161,65,169,51,158,46,213,211,149,246,116,1,167,176,
+    30,254,65,227,71,141,106,215,225,52,225,77,54,255,14,253,
+    165,48,178,77,205,43,87,204,191,103,200,21,148,3,24,252,
+    173,240,184,133,157,154,122,224,77,142,102,106,6,212,154,1,
+    108,100,223,198,225,29,159,255,145,123,173,127,189,43,227,235,
+    85,125,189,105,95,47,172,251,85,125,228,46,73,158,98,242,
+    5,103,185,86,42,161,44,72,137,203,159,121,145,249,194,22,
+    233,73,65,179,140,106,231,157,54,82,217,47,61,196,60,176,
+    3,122,74,37,59,249,59,30,239,195,151,183,61,109,91,158,
+    182,140,167,3,238,164,61,29,165,175,85,63,100,135,132,126,
+    159,125,89,254,31,15,30,218,19,160,199,214,111,189,228,124,
+    169,153,251,147,230,138,115,29,246,63,233,57,124,174,217,254,
+    167,205,78,56,254,211,110,223,121,129,251,211,35,13,231,253,
+    246,159,185,60,112,252,51,191,227,124,83,249,207,154,236,120,
+    220,202,227,113,27,57,238,228,47,14,113,63,19,58,47,216,
+    236,63,59,99,131,227,63,227,121,56,254,51,155,29,142,255,
+    124,232,108,223,101,175,61,80,62,73,62,242,33,14,205,151,
+    47,126,98,147,145,12,79,6,6,229,90,158,184,169,105,6,
+    167,161,80,206,19,66,191,179,40,157,187,185,242,80,72,76,
+    204,194,36,70,227,13,25,87,119,217,77,102,50,190,70,74,
+    70,206,131,122,133,227,220,42,8,103,79,227,65,217,49,14,
+    110,4,79,19,152,40,58,41,145,209,117,134,68,111,147,255,
+    10,147,255,18,147,255,202,160,54,132,238,160,183,142,252,15,
+    48,89,195,4,93,250,169,161,47,141,179,113,45,252,128,196,
+    217,32,132,10,45,187,136,9,138,188,77,42,201,107,115,155,
+    74,233,196,238,144,204,247,49,61,121,29,254,149,75,14,156,
+    214,250,95,222,86,235,116,229,57,76,142,113,110,16,76,248,
+    214,227,121,187,189,177,236,237,235,121,31,55,48,156,247,3,
+    6,100,79,191,148,29,10,102,71,15,103,143,157,132,121,153,
+    239,155,119,56,15,229,57,76,159,192,212,115,146,211,50,174,
+    161,3,196,244,95,201,151,147,83,23,215,4,243,222,151,245,
+    53,103,125,245,89,127,251,218,237,245,228,7,241,13,113,243,
+    60,204,58,213,255,28,8,29,107,77,143,38,179,254,54,52,
+    156,237,248,194,78,236,100,157,53,117,95,144,184,218,118,119,
+    83,69,222,77,32,181,113,61,195,27,199,54,221,159,158,81,
+    187,159,207,183,147,107,29,92,75,247,122,239,7,29,249,78,
+    114,42,112,29,253,235,179,31,188,149,239,34,167,221,92,115,
+    215,186,127,61,242,81,167,218,116,56,223,67,174,245,114,29,
+    93,90,197,251,185,138,234,252,128,217,6,75,42,186,125,206,
+    138,77,241,241,209,63,140,228,57,56,252,233,121,242,83,152,
+    244,186,156,23,248,117,37,207,225,239,70,146,254,150,72,253,
+    21,206,209,181,99,121,14,126,10,147,166,70,4,6,201,134,
+    131,252,60,110,36,63,133,201,145,70,103,251,70,15,30,183,
+    111,246,146,159,194,228,72,131,51,128,57,224,7,115,192,79,
+    97,114,8,90,182,113,52,207,145,102,90,19,143,195,217,182,
+    222,131,199,109,133,137,167,204,57,180,126,126,163,126,99,241,
+    113,207,198,175,170,129,211,106,239,153,60,7,23,11,19,95,
+    153,179,111,253,230,70,223,166,251,241,209,205,106,117,232,140,
+    218,247,34,222,233,43,76,124,85,206,230,181,228,250,185,15,
+    22,65,98,116,54,23,38,29,207,57,65,186,178,38,247,120,
+    174,183,255,163,137,60,119,137,119,54,210,116,237,6,253,197,
+    198,154,87,45,233,107,128,214,189,235,55,16,177,123,55,237,
+    228,231,177,131,252,20,38,131,13,206,46,204,8,63,27,223,
+    220,20,63,253,21,114,88,152,28,170,112,14,111,136,56,110,
+    195,155,73,242,83,152,116,112,253,67,217,134,225,108,155,144,
+    109,110,253,160,37,95,37,243,206,231,242,28,166,79,96,245,
+    152,93,59,185,254,173,245,107,155,199,210,189,39,212,214,147,
+    233,134,147,106,205,115,121,39,201,68,102,206,236,163,183,242,
+    229,228,212,197,213,248,243,110,114,88,193,53,180,228,43,201,
+    161,7,196,117,13,104,53,224,239,202,236,234,177,149,200,195,
+    206,188,215,44,199,146,222,182,7,156,194,147,234,154,188,19,
+    126,209,100,179,105,173,117,173,106,61,153,110,26,86,189,35,
+    249,114,188,234,226,26,154,243,110,60,162,5,225,17,45,7,
+    143,176,152,188,23,143,184,93,18,74,99,8,121,113,240,5,
+    174,24,70,40,90,244,46,198,23,18,149,182,5,43,148,3,
+    9,191,204,72,145,108,156,51,178,57,238,64,105,3,173,194,
+    12,126,212,182,244,157,179,116,199,68,148,148,89,57,50,143,
+    219,179,52,204,203,140,52,155,192,189,21,12,16,141,26,63,
+    26,98,204,212,150,210,56,43,66,132,70,63,36,150,143,184,
+    107,161,44,204,235,27,167,194,224,43,145,248,194,3,225,120,
+    240,40,225,102,137,15,69,32,56,25,112,80,246,172,130,40,
+    200,136,134,47,87,125,54,9,116,127,102,33,169,233,31,255,
+    3,89,121,72,215,48,161,96,228,255,83,79,126,15,185,44,
+    124,1,19,144,225,50,187,211,191,227,173,121,184,188,118,35,
+    227,237,82,189,93,105,87,215,179,29,79,203,135,151,210,149,
+    128,169,188,211,111,38,89,111,221,74,114,37,9,236,134,211,
+    143,171,42,46,43,191,81,215,192,253,131,154,97,251,143,248,
+    97,123,206,165,171,23,75,199,245,24,225,233,136,220,194,40,
+    25,104,152,113,106,217,182,203,232,88,252,131,238,236,98,152,
+    98,70,150,145,27,83,252,58,107,225,110,124,64,226,119,20,
+    91,137,63,60,157,226,101,91,10,163,39,216,208,145,245,32,
+    250,131,66,179,133,101,167,104,79,57,239,193,162,204,154,212,
+    154,230,81,162,163,200,0,163,193,226,230,105,154,213,58,111,
+    65,159,252,16,234,255,99,187,153,251,225,163,128,115,233,93,
+    130,32,111,132,1,33,22,226,201,72,20,119,19,208,207,44,
+    73,226,230,107,187,27,52,32,186,177,119,166,33,23,53,70,
+    8,207,27,91,9,70,6,45,20,17,100,195,253,72,38,26,
+    82,68,22,94,189,114,158,190,250,8,139,164,202,88,42,251,
+    220,44,173,191,71,123,19,205,183,203,69,204,102,120,226,240,
+    132,62,92,238,18,122,123,249,143,48,41,227,75,58,110,117,
+    91,117,212,165,60,183,30,35,234,34,188,183,185,116,205,41,
+    250,253,157,171,107,103,215,190,179,222,183,218,103,92,162,94,
+    77,183,190,235,255,135,151,254,102,233,157,51,1,23,157,52,
+    229,8,31,213,204,229,111,76,94,191,124,118,242,18,177,113,
+    207,149,209,32,203,24,62,39,38,229,156,74,84,146,230,65,
+    24,146,162,210,108,50,80,38,247,34,219,86,70,187,139,76,
+    170,156,139,212,19,0,201,78,114,143,204,69,69,41,227,116,
+    161,135,54,234,153,158,108,216,13,115,247,124,117,149,115,40,
+    91,83,7,2,76,93,43,138,12,163,36,89,57,183,211,217,
+    245,193,210,70,207,79,228,79,151,50,157,19,106,231,4,70,
+    218,185,188,58,151,245,54,34,91,62,154,245,53,96,132,188,
+    53,101,253,226,90,44,227,27,81,125,35,105,223,200,179,108,
+    101,13,170,142,91,178,117,205,43,215,158,144,198,111,156,252,
+    253,51,63,58,147,25,126,65,29,126,1,78,51,53,167,212,
+    154,83,80,94,165,119,117,124,229,244,202,233,29,140,182,187,
+    154,4,248,170,167,45,77,190,159,121,106,31,94,3,153,162,
+    123,125,38,227,9,168,158,64,218,19,200,183,66,77,41,165,
+    109,129,86,6,78,16,185,146,116,164,140,51,153,136,144,50,
+    26,189,203,94,236,133,202,217,68,20,123,12,197,56,250,50,
+    164,114,212,235,71,35,51,90,180,82,16,85,65,234,166,252,
+    42,225,102,77,30,22,249,92,202,130,18,230,150,240,156,174,
+    216,241,32,141,224,208,0,71,210,131,100,112,126,145,26,147,
+    104,49,135,9,91,155,171,128,155,137,153,59,80,176,66,34,
+    71,144,231,72,62,18,240,52,87,174,217,182,210,215,71,216,
+    67,177,227,84,30,38,155,122,48,137,48,86,23,9,136,162,
+    4,195,51,10,10,217,73,250,230,39,194,129,231,134,152,108,
+    134,69,140,162,189,37,28,73,187,249,238,43,18,134,130,56,
+    95,82,62,29,181,32,185,250,82,239,81,84,200,219,176,200,
+    187,182,200,91,178,200,251,181,200,235,180,200,235,182,114,78,
+    18,253,141,154,141,187,13,51,7,234,44,55,128,9,241,190,
+    35,235,95,39,175,83,246,191,50,80,206,202,134,127,229,122,
+    129,10,28,167,101,124,155,9,206,98,229,143,129,114,2,25,
+    231,249,252,56,199,123,222,174,196,191,44,231,126,155,252,101,
+    185,170,183,201,95,150,171,120,155,252,101,185,74,61,143,47,
+    173,127,179,92,123,218,250,205,114,77,105,235,55,111,115,241,
+    54,224,72,255,19,36,126,142,175,208,235,235,125,155,252,101,
+    185,161,180,245,155,229,90,211,214,111,150,235,73,91,191,197,
+    181,126,194,249,211,214,239,19,238,133,180,245,155,229,94,73,
+    91,191,121,155,29,235,182,127,226,42,199,163,255,120,137,159,
+    243,213,175,44,128,208,235,237,84,189,157,111,123,178,181,147,
+    233,218,201,205,200,102,228,167,158,204,248,53,117,252,26,156,
+    102,106,39,213,218,73,232,163,150,206,52,215,152,47,43,231,
+    7,240,105,54,241,95,170,226,129,191,42,157,62,37,233,23,
+    236,245,155,45,101,188,127,21,88,88,248,89,251,38,17,131,
+    240,176,48,169,245,243,67,217,234,218,213,163,107,206,181,217,
+    245,163,27,174,205,186,79,171,210,29,199,213,166,241,116,221,
+    184,90,125,34,111,135,28,79,156,238,149,190,85,251,234,141,
+    85,215,195,49,213,217,146,119,194,197,60,183,75,66,176,251,
+    255,1,134,223,199,42,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/simulate/simulator.py",
+    "gem5.simulate.simulator",
+    embedded_module_data,
+    16726,
+    42915);
+
+} // anonymous namespace
+} // namespace gem5
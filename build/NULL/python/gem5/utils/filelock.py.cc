@@ -0,0 +1,177 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,88,221,111,20,215,21,191,51,251,229,93,198,223,
+    31,216,11,132,193,32,220,37,238,18,33,162,52,20,220,58,
+    96,19,26,226,84,216,42,177,137,180,140,103,174,189,131,119,
+    103,54,119,102,177,189,177,145,27,229,193,137,44,5,36,43,
+    165,9,168,142,68,144,40,47,72,165,111,237,67,164,254,1,
+    54,66,205,106,36,158,250,80,229,109,17,68,69,121,234,57,
+    119,118,102,103,189,166,205,204,238,153,185,31,115,238,185,191,
+    123,238,239,156,153,127,145,192,17,169,94,159,77,128,248,3,
+    209,136,38,228,200,148,123,21,166,4,126,21,167,68,145,156,
+    37,154,248,9,209,66,52,116,55,68,200,253,144,167,96,42,
+    204,219,194,208,22,185,43,66,139,232,183,68,52,97,156,164,
+    162,223,99,97,76,13,142,42,120,163,182,240,81,41,193,145,
+    166,68,222,95,116,218,71,245,28,61,111,170,115,35,11,42,
+    45,216,186,105,140,165,66,78,83,38,99,40,121,154,201,56,
+    137,76,38,111,106,197,28,222,75,153,204,135,69,37,231,182,
+    220,35,207,80,235,143,7,44,166,30,45,44,218,89,211,56,
+    58,75,243,175,31,45,218,122,206,58,58,3,106,115,160,54,
+    93,88,100,97,232,199,197,126,248,91,173,32,86,252,179,28,
+    110,90,57,195,226,94,143,58,203,189,217,61,251,197,54,203,
+    167,66,218,46,64,65,152,10,107,145,79,112,238,81,144,81,
+    45,6,50,166,53,129,108,210,226,32,227,90,2,230,40,57,
+    77,222,28,75,223,13,203,104,152,140,150,233,198,172,156,167,
+    106,86,49,116,43,47,219,89,197,150,179,138,37,171,166,97,
+    211,5,251,231,121,197,80,102,41,147,173,98,161,96,50,91,
+    182,204,132,12,199,162,89,148,85,197,144,139,22,149,117,91,
+    214,13,89,145,231,117,59,43,91,182,98,211,60,53,236,180,
+    60,145,213,45,217,202,154,197,156,38,79,83,153,209,156,98,
+    235,87,105,110,81,86,153,105,89,92,143,106,230,11,80,59,
+    13,198,192,160,160,73,51,169,101,12,216,216,123,81,54,13,
+    249,242,229,188,117,85,101,246,229,203,178,201,160,52,163,26,
+    118,14,10,51,80,178,179,254,20,210,92,219,247,9,64,232,
+    223,95,254,17,143,123,191,82,195,219,156,14,29,232,217,63,
+    57,136,75,226,239,219,151,66,43,173,182,80,235,162,137,119,
+    161,116,223,175,249,88,208,66,75,36,227,151,237,128,190,43,
+    190,51,110,4,71,241,15,59,18,232,235,223,223,133,255,125,
+    191,126,73,248,10,156,248,182,88,239,194,48,98,180,214,3,
+    74,49,191,36,66,169,201,47,161,109,113,223,118,116,227,72,
+    233,198,111,25,45,40,140,114,104,252,37,166,44,45,143,23,
+    168,170,207,44,214,26,108,147,183,201,138,161,201,38,247,120,
+    37,151,91,228,48,226,129,253,242,202,130,158,47,130,83,232,
+    121,106,22,109,222,21,235,53,88,201,69,88,82,123,158,82,
+    67,166,138,154,149,21,27,86,189,96,123,90,211,190,158,177,
+    210,241,115,51,190,6,112,8,195,180,229,49,211,160,131,168,
+    202,168,234,202,23,45,155,183,128,159,96,99,122,180,20,73,
+    163,162,84,194,73,252,78,201,21,233,8,99,38,115,226,186,
+    149,225,51,210,28,209,180,156,48,248,78,214,9,95,49,117,
+    195,137,206,82,91,157,215,156,38,108,199,25,58,113,148,124,
+    3,59,177,170,1,78,132,143,151,10,59,97,139,230,102,216,
+    110,128,142,245,162,232,3,97,225,82,162,209,12,253,8,119,
+    191,110,232,118,38,83,242,217,33,237,85,165,176,251,28,193,
+    45,92,105,34,82,231,230,174,87,54,94,223,56,245,164,99,
+    111,185,109,244,105,72,236,108,121,78,64,84,136,216,220,82,
+    137,146,228,254,213,240,90,203,147,222,228,173,216,159,164,47,
+    165,111,46,220,153,252,250,210,157,75,15,38,55,143,141,184,
+    191,173,222,209,199,189,163,208,171,185,220,215,143,157,203,187,
+    95,129,139,84,238,78,194,37,177,10,39,167,7,53,224,176,
+    36,230,57,245,219,34,58,117,208,153,175,248,119,245,78,183,
+    44,196,73,156,216,161,64,207,128,235,213,220,218,22,3,61,
+    194,59,214,250,110,93,138,109,107,137,6,91,26,220,219,119,
+    104,77,8,58,180,22,26,39,7,137,221,81,211,115,136,176,
+    191,44,139,75,226,149,132,63,126,87,96,148,93,222,221,28,
+    183,154,9,31,195,22,222,144,200,14,71,112,102,245,155,124,
+    25,182,209,149,102,175,180,242,51,123,95,237,41,45,252,82,
+    109,173,254,125,168,126,126,219,41,228,167,172,201,146,80,74,
+    112,173,190,29,115,28,91,214,81,103,77,100,41,244,21,185,
+    221,64,82,117,35,180,5,108,108,223,217,38,129,76,2,214,
+    203,226,53,209,104,114,175,243,194,60,89,8,77,146,121,225,
+    186,176,214,154,138,150,94,12,171,31,22,245,42,141,224,126,
+    26,148,245,25,185,0,164,141,76,157,150,113,71,87,91,112,
+    75,235,60,14,12,34,125,171,89,138,156,50,171,232,134,79,
+    1,244,42,101,139,64,221,243,138,142,52,110,81,136,45,154,
+    5,90,92,182,7,85,160,163,104,64,188,68,13,20,162,8,
+    196,27,216,205,86,109,16,147,213,180,65,128,166,154,5,250,
+    170,123,26,84,26,197,252,52,60,99,206,120,202,7,209,166,
+    249,172,14,204,164,42,110,136,178,179,204,156,183,124,53,16,
+    187,168,23,234,107,108,53,81,250,154,71,45,248,229,244,57,
+    12,65,90,145,83,37,90,66,23,116,203,166,134,74,113,32,
+    223,52,78,166,3,31,45,15,120,176,48,58,128,44,39,155,
+    124,30,5,102,170,212,178,234,251,15,250,241,19,194,107,17,
+    121,23,121,144,218,116,155,90,36,92,70,89,209,224,245,150,
+    202,244,130,157,30,43,201,167,121,76,69,190,84,170,11,229,
+    162,100,200,31,45,167,225,95,106,159,168,18,174,169,170,69,
+    70,181,180,156,234,112,194,8,24,195,253,229,132,205,2,53,
+    88,15,222,198,222,203,156,190,48,50,60,225,68,223,203,140,
+    188,127,250,60,94,47,156,185,120,193,17,103,52,214,238,246,
+    24,119,217,55,66,25,51,76,39,58,50,242,254,185,113,120,
+    0,98,112,94,177,93,254,228,201,13,210,169,19,177,114,148,
+    22,56,161,166,194,44,137,85,9,200,10,152,157,193,241,29,
+    129,58,109,150,153,43,34,240,153,60,64,3,233,197,54,226,
+    141,85,103,85,106,243,121,183,90,243,6,52,91,199,5,164,
+    221,31,36,210,147,92,159,188,113,105,253,210,106,162,34,38,
+    227,3,21,177,175,121,224,73,114,239,173,129,114,87,239,250,
+    187,223,28,187,115,226,175,226,195,248,214,193,55,255,254,214,
+    223,206,109,29,28,1,94,222,211,1,188,188,167,227,122,120,
+    61,6,180,220,127,24,110,90,202,109,221,215,35,47,158,116,
+    38,43,164,179,121,160,38,202,157,93,235,111,220,166,183,114,
+    143,58,143,108,118,30,41,119,245,85,194,161,238,212,127,162,
+    228,200,107,127,238,121,16,126,216,188,149,26,122,156,26,170,
+    196,73,251,129,138,68,96,208,147,155,157,96,193,171,229,222,
+    19,223,245,14,63,234,29,46,239,149,111,141,109,14,158,132,
+    145,251,146,48,114,95,242,105,40,188,167,231,57,1,81,33,
+    225,238,158,31,18,164,187,111,253,220,141,119,214,223,217,56,
+    178,213,53,248,160,235,225,222,71,157,167,54,59,79,113,53,
+    67,240,236,38,200,222,33,180,189,7,109,135,231,68,120,46,
+    74,218,187,215,19,55,143,223,58,177,213,118,248,113,219,225,
+    205,134,223,11,56,42,3,48,15,184,62,109,5,124,44,92,
+    146,47,134,19,195,253,228,219,254,196,153,253,161,111,7,223,
+    74,157,73,134,254,145,140,64,161,46,176,132,170,255,103,159,
+    17,158,45,5,168,139,253,242,255,7,143,237,132,83,247,68,
+    56,240,68,228,101,79,240,208,80,163,62,113,156,255,83,161,
+    210,205,179,20,146,67,93,171,219,131,211,213,253,131,185,172,
+    87,137,27,40,157,240,119,246,69,76,54,230,77,198,243,93,
+    158,174,2,33,1,213,32,33,121,41,235,160,75,69,156,122,
+    148,162,109,130,115,235,106,93,86,132,37,170,65,182,227,18,
+    130,161,213,168,99,116,44,21,229,251,197,221,97,17,53,103,
+    90,148,245,227,125,180,104,228,116,99,142,239,183,123,2,223,
+    18,22,206,213,115,119,200,117,41,176,84,192,221,171,53,31,
+    96,207,179,132,103,25,18,145,218,214,134,42,36,20,63,248,
+    68,106,89,123,251,250,196,250,197,45,105,223,99,105,223,166,
+    180,15,107,206,93,215,214,243,91,210,161,199,210,161,77,233,
+    80,121,95,255,234,153,181,177,85,56,43,49,120,134,63,216,
+    152,65,136,222,66,159,108,88,104,171,107,137,108,4,251,250,
+    71,125,244,18,224,41,88,26,161,116,109,88,133,252,30,176,
+    212,128,122,41,143,9,26,66,141,80,109,123,55,168,173,203,
+    184,251,126,80,7,183,207,106,138,187,188,192,191,144,23,54,
+    168,155,174,207,52,83,162,11,255,171,40,142,110,195,56,158,
+    201,192,184,148,65,50,215,17,72,230,170,117,179,216,91,118,
+    113,78,144,182,174,181,107,21,34,196,247,148,165,182,207,207,
+    127,118,254,211,49,196,177,220,218,185,186,203,5,48,152,241,
+    251,0,254,186,1,64,214,243,83,1,196,236,221,125,17,45,
+    217,53,16,107,94,230,57,251,75,81,132,80,90,143,96,213,
+    129,2,113,7,2,56,190,168,241,151,43,55,133,14,36,233,
+    30,118,175,145,26,105,135,237,197,2,117,34,87,49,251,118,
+    226,54,83,84,58,173,168,115,141,73,50,196,197,237,73,178,
+    91,85,64,88,83,30,172,174,251,110,135,149,59,104,8,106,
+    121,211,255,112,208,116,21,223,141,157,0,221,17,81,64,243,
+    131,119,149,57,8,156,69,158,202,84,241,244,204,4,95,2,
+    40,49,156,123,239,156,0,217,85,207,233,144,62,124,124,114,
+    139,200,26,10,51,139,70,29,106,2,7,172,193,217,98,153,
+    12,208,17,64,210,22,128,132,215,44,96,207,110,82,125,109,
+    136,55,127,46,125,38,125,218,178,214,178,202,79,62,123,92,
+    11,204,3,25,126,167,72,37,24,82,36,195,132,154,197,60,
+    221,166,154,201,176,61,190,175,115,27,142,161,192,240,200,222,
+    68,129,89,181,251,57,1,45,98,146,39,14,162,1,215,72,
+    240,211,67,69,12,69,154,128,30,64,36,164,8,172,67,189,
+    216,123,32,2,225,208,23,191,17,226,17,32,19,95,244,196,
+    34,93,21,226,139,142,40,62,231,139,182,112,100,55,196,185,
+    6,225,154,134,6,1,105,30,34,85,210,100,251,248,86,245,
+    63,193,184,73,133,212,56,159,31,155,78,186,95,99,134,216,
+    73,226,126,218,177,86,65,128,35,9,66,229,56,17,154,87,
+    36,60,203,36,190,194,207,50,217,181,194,207,74,84,16,226,
+    224,106,13,226,102,252,41,94,158,215,106,155,38,5,1,172,
+    221,89,62,229,242,249,75,90,185,165,255,5,30,190,124,192,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/utils/filelock.py",
+    "gem5.utils.filelock",
+    embedded_module_data,
+    2448,
+    4852);
+
+} // anonymous namespace
+} // namespace gem5
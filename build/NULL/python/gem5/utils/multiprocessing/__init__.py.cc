@@ -0,0 +1,40 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,123,204,128,4,152,160,244,103,27,32,49,157,33,133,
+    33,133,49,135,33,151,49,138,49,151,41,138,137,17,40,157,
+    202,180,12,40,179,26,174,33,139,25,198,138,98,78,97,74,
+    97,78,103,138,98,73,97,9,102,208,100,125,201,8,20,212,
+    100,186,197,30,80,148,159,156,90,92,124,139,59,61,53,215,
+    212,57,63,175,36,181,162,164,8,164,237,22,75,64,126,126,
+    142,159,38,235,45,246,100,36,225,34,22,16,193,10,82,192,
+    30,31,159,152,147,19,31,191,146,225,51,200,138,95,134,197,
+    69,201,250,5,149,37,25,249,121,250,32,211,244,75,75,50,
+    115,138,245,115,75,115,74,50,11,32,214,100,230,165,235,199,
+    199,103,230,101,150,196,199,235,21,84,254,226,176,201,205,79,
+    41,205,73,181,43,226,6,154,0,114,83,177,55,144,248,192,
+    204,200,200,248,193,140,153,145,233,3,3,97,130,139,129,67,
+    184,161,186,177,182,165,246,10,187,100,3,203,3,110,145,9,
+    105,23,184,100,27,216,65,176,136,19,104,30,0,109,238,79,
+    82,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/utils/multiprocessing/__init__.py",
+    "gem5.utils.multiprocessing",
+    embedded_module_data,
+    241,
+    326);
+
+} // anonymous namespace
+} // namespace gem5
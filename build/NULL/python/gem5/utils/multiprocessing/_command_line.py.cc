@@ -0,0 +1,145 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,165,87,221,111,27,199,17,223,251,32,121,60,74,36,
+    29,201,177,100,185,206,53,146,27,51,18,41,195,105,82,41,
+    145,12,84,149,235,180,9,132,32,54,250,32,164,56,28,121,
+    43,234,108,242,238,186,183,140,37,130,66,212,194,15,74,225,
+    162,106,17,64,10,90,3,108,16,56,9,156,135,180,40,208,
+    127,131,12,24,68,88,64,64,129,190,180,111,12,156,188,248,
+    169,179,119,252,56,210,74,107,180,199,187,185,217,217,157,185,
+    157,223,238,206,12,255,129,66,151,216,121,63,204,1,57,64,
+    38,90,71,166,96,138,37,97,93,128,183,84,18,203,210,186,
+    84,150,215,101,1,153,242,29,180,30,49,35,64,163,166,120,
+    29,101,162,70,78,64,72,189,177,105,121,218,134,85,194,90,
+    193,177,169,97,217,158,134,183,40,182,61,203,1,214,217,208,
+    232,38,214,202,149,18,181,92,226,20,176,231,89,118,81,43,
+    59,102,5,52,168,163,229,177,86,241,176,169,221,182,232,166,
+    86,196,229,23,115,234,117,23,23,172,13,171,96,148,74,219,
+    115,154,69,251,134,185,169,130,99,250,138,96,205,172,20,112,
+    71,86,46,27,182,169,149,44,27,107,27,14,209,60,215,184,
+    109,131,213,206,39,177,7,86,157,114,71,25,44,185,22,129,
+    222,252,182,175,253,198,54,221,116,108,205,163,96,194,32,220,
+    74,158,24,100,91,179,202,110,9,151,49,124,155,130,47,29,
+    87,212,111,113,229,162,149,195,185,57,173,224,250,198,230,95,
+    183,242,243,67,35,231,51,57,245,95,28,236,181,140,200,34,
+    254,12,153,92,161,86,169,32,132,86,100,20,30,137,175,72,
+    93,244,87,132,175,6,42,11,59,130,128,106,194,205,238,122,
+    113,94,10,241,114,136,143,132,248,104,136,143,133,120,37,196,
+    199,67,188,26,226,19,33,126,36,196,143,134,248,100,151,47,
+    142,238,136,244,153,190,27,53,241,62,120,245,160,231,25,153,
+    160,223,237,247,154,18,125,182,223,250,3,236,173,123,210,224,
+    248,95,9,102,4,236,63,21,26,19,173,1,189,39,155,49,
+    144,143,245,229,247,68,83,1,201,248,128,36,14,146,211,97,
+    73,81,222,145,64,246,116,111,62,167,107,82,253,12,58,225,
+    50,213,193,153,248,184,79,60,129,94,226,4,189,201,39,208,
+    27,57,65,239,108,79,239,210,183,234,141,154,201,250,212,73,
+    61,97,253,65,219,28,137,19,190,118,238,9,102,153,122,76,
+    79,130,24,144,94,35,124,75,102,4,22,115,92,126,74,188,
+    234,236,170,229,193,201,117,110,195,1,11,100,254,137,28,58,
+    12,57,237,58,198,90,117,212,239,51,49,28,239,146,151,171,
+    198,179,89,167,66,77,139,44,63,18,230,171,201,108,214,163,
+    38,8,178,60,188,44,119,218,152,144,78,123,148,183,13,234,
+    117,154,167,178,89,56,212,112,176,11,180,163,55,44,2,85,
+    46,242,96,184,77,123,61,213,88,54,235,26,116,19,190,249,
+    50,231,127,81,177,48,205,124,135,137,229,23,9,63,63,76,
+    205,87,172,146,169,91,246,134,195,226,5,199,221,38,86,113,
+    147,178,40,193,134,89,198,44,97,217,20,19,163,64,173,183,
+    49,147,92,51,207,98,111,99,146,119,60,232,50,113,190,82,
+    212,243,48,242,22,83,131,198,38,46,185,221,142,141,146,81,
+    244,186,13,240,133,80,22,15,26,216,54,217,72,192,90,69,
+    219,33,152,165,75,150,71,117,207,42,235,78,254,38,76,219,
+    99,146,97,111,179,248,213,173,2,246,97,102,138,174,115,36,
+    116,157,69,3,20,89,34,192,193,23,251,13,64,32,104,168,
+    62,114,1,159,234,34,161,7,195,89,212,112,93,62,129,129,
+    14,80,101,169,0,58,189,43,103,50,7,142,201,55,29,203,
+    102,145,0,56,153,201,182,81,198,29,232,204,222,102,96,113,
+    131,20,43,60,156,122,30,15,87,26,92,143,94,242,72,97,
+    190,19,50,121,240,159,231,241,208,123,44,114,234,157,0,175,
+    243,0,159,115,183,217,121,157,143,214,193,34,248,224,16,125,
+    72,129,100,248,166,132,199,251,16,118,236,46,58,146,207,54,
+    6,239,182,130,226,233,150,114,246,72,73,181,148,73,160,119,
+    147,62,59,197,217,4,39,169,94,187,59,108,42,68,39,125,
+    122,206,167,90,123,42,249,84,116,247,167,223,156,71,74,98,
+    239,229,95,190,115,231,157,54,146,35,234,113,242,76,91,20,
+    70,103,143,199,166,218,18,188,219,168,75,190,146,164,148,250,
+    53,2,210,70,82,92,109,143,163,248,220,254,181,247,214,26,
+    202,44,220,245,27,193,251,72,201,29,158,105,77,206,53,148,
+    28,220,195,173,185,195,88,107,226,249,134,2,130,185,118,60,
+    114,42,186,251,147,246,8,130,249,196,206,195,55,34,48,226,
+    212,151,202,196,231,202,68,99,114,174,169,100,91,74,182,161,
+    100,143,98,201,255,183,255,78,141,119,47,135,186,95,169,191,
+    240,209,194,7,11,31,95,251,244,245,230,244,98,107,122,17,
+    68,112,55,149,165,150,178,212,80,150,184,210,14,87,154,233,
+    41,29,78,54,149,233,150,50,221,80,166,255,158,24,111,200,
+    227,15,121,80,25,72,132,124,255,240,20,244,240,143,2,79,
+    132,52,212,71,197,62,207,19,228,125,72,133,15,122,233,144,
+    100,195,253,253,148,105,74,69,145,23,49,53,161,46,161,19,
+    174,251,240,60,232,181,86,135,218,85,120,174,35,51,178,35,
+    214,68,51,90,151,31,83,231,95,136,253,175,214,7,131,107,
+    21,210,27,164,211,68,95,187,159,200,7,245,32,169,73,245,
+    24,58,225,162,167,250,124,109,200,254,112,40,167,99,253,177,
+    253,18,96,232,75,114,77,46,10,53,137,227,0,9,87,4,
+    52,165,0,147,76,188,250,154,202,79,243,155,152,86,8,84,
+    105,46,193,27,214,22,175,151,6,234,50,191,204,235,21,103,
+    188,116,50,180,194,38,68,214,110,149,150,243,173,176,232,6,
+    113,170,216,254,113,245,233,108,118,232,92,103,65,253,214,192,
+    46,225,235,192,103,255,144,103,232,3,84,4,95,127,30,219,
+    17,76,88,135,42,96,246,59,241,174,2,51,20,30,69,46,
+    120,203,23,200,39,232,19,145,137,185,75,76,182,40,46,123,
+    124,107,104,26,185,8,175,71,234,18,143,175,48,97,247,74,
+    117,166,136,233,96,200,89,42,57,80,142,122,87,114,253,81,
+    58,104,121,60,198,236,162,54,18,151,213,62,57,122,102,122,
+    239,218,190,249,238,90,91,26,144,147,231,249,218,46,129,123,
+    229,199,210,161,143,9,175,56,29,66,3,128,244,50,148,188,
+    175,132,248,139,23,188,76,85,132,18,51,236,63,223,107,47,
+    112,255,53,32,175,193,90,30,112,4,226,125,4,126,134,14,
+    160,116,188,171,154,2,224,32,18,94,231,175,145,121,196,43,
+    11,238,64,24,130,248,82,17,219,120,203,37,87,170,211,255,
+    1,129,238,32,147,235,127,15,200,63,225,183,139,26,147,43,
+    112,127,124,227,240,185,250,234,251,185,160,21,190,3,239,197,
+    108,33,147,96,49,48,111,80,74,152,228,109,123,76,197,91,
+    184,80,161,70,30,114,81,196,95,24,50,205,39,200,215,150,
+    157,235,4,121,0,77,247,19,45,236,46,160,157,212,25,245,
+    255,106,152,126,188,39,28,11,150,228,51,239,27,204,68,200,
+    5,46,150,111,221,54,61,72,87,196,41,50,25,202,18,200,
+    158,48,200,139,160,32,17,5,8,176,244,176,219,228,135,32,
+    94,231,142,126,233,175,244,55,10,68,216,223,120,251,175,30,
+    226,102,108,166,21,155,105,35,53,114,85,56,78,143,189,151,
+    108,104,11,141,212,98,104,27,60,55,251,81,245,131,234,159,
+    106,31,214,252,141,240,21,23,126,141,2,46,205,199,64,228,
+    87,80,122,77,216,147,143,148,145,125,249,32,254,251,120,128,
+    213,103,55,254,182,254,151,245,63,191,245,215,183,160,209,156,
+    92,105,1,77,175,180,210,43,77,101,101,79,62,78,141,181,
+    82,151,154,169,203,173,212,101,95,245,183,137,95,39,190,24,
+    191,252,217,247,155,227,11,173,241,133,166,178,216,82,22,27,
+    202,226,113,114,172,149,124,182,153,156,105,37,103,246,164,163,
+    244,216,94,101,159,190,91,59,164,144,97,102,127,212,56,191,
+    218,76,173,54,148,85,127,101,50,49,22,211,117,211,41,232,
+    58,249,1,199,34,53,156,83,165,238,154,4,104,115,100,130,
+    141,196,213,131,29,164,44,5,255,134,174,144,85,63,176,0,
+    110,46,16,200,126,130,208,126,41,34,200,109,196,73,18,9,
+    137,93,149,255,218,162,36,136,144,3,255,43,25,201,9,167,
+    219,168,71,242,66,82,184,42,180,209,201,212,159,209,191,1,
+    68,140,197,197,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/utils/multiprocessing/_command_line.py",
+    "gem5.utils.multiprocessing._command_line",
+    embedded_module_data,
+    1924,
+    3816);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,105 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,173,84,223,75,35,71,28,159,217,205,38,235,38,102,
+    99,180,53,109,109,220,120,119,244,196,107,44,215,122,165,32,
+    62,152,30,199,213,51,8,150,131,166,7,203,186,51,234,218,
+    236,110,186,187,169,167,228,64,138,148,60,250,80,218,66,41,
+    88,40,194,113,47,125,188,63,161,143,81,2,202,130,32,148,
+    62,220,91,68,31,228,158,58,179,187,249,101,244,250,210,100,
+    243,201,204,124,191,251,153,249,126,63,223,249,254,13,58,62,
+    92,240,127,118,64,224,103,128,64,1,32,136,152,34,212,153,
+    2,163,179,5,22,210,57,91,12,233,92,129,131,128,1,15,
+    0,10,109,3,196,97,118,45,220,36,217,99,1,120,193,54,
+    103,133,136,231,21,38,94,145,55,120,241,158,23,79,188,250,
+    48,179,214,119,141,151,128,4,6,96,97,143,140,95,180,14,
+    173,193,66,148,172,114,56,138,132,119,90,171,123,144,248,192,
+    214,155,49,20,93,4,227,177,205,67,225,203,85,205,150,150,
+    181,34,150,84,211,112,20,205,176,37,252,212,193,134,173,153,
+    100,104,46,75,206,42,150,244,114,209,209,74,150,169,98,219,
+    214,140,21,73,55,81,153,188,225,152,210,18,150,202,54,70,
+    210,186,230,172,74,43,88,159,18,22,77,157,114,33,44,17,
+    174,146,102,17,227,210,134,199,178,176,225,172,154,134,100,59,
+    138,129,20,11,73,69,109,201,82,172,13,73,211,75,69,172,
+    99,178,187,67,54,13,246,20,174,217,243,182,150,197,217,59,
+    146,90,242,200,38,31,105,75,147,151,60,39,199,179,194,43,
+    26,229,56,227,70,104,80,36,30,55,18,216,199,161,27,255,
+    28,47,43,228,149,156,111,82,59,21,103,154,138,223,246,20,
+    199,160,0,137,234,12,130,5,22,135,16,179,13,186,115,93,
+    224,16,36,121,100,221,129,197,146,178,110,200,52,1,11,254,
+    70,121,21,118,240,178,193,239,236,166,95,73,180,138,128,14,
+    159,65,90,53,21,88,185,164,15,229,204,191,162,83,114,94,
+    110,193,44,97,131,4,147,40,209,129,108,183,182,178,4,63,
+    202,104,16,156,108,46,173,121,107,54,141,67,146,94,127,100,
+    91,234,100,144,41,250,194,100,217,209,138,118,79,194,130,36,
+    101,75,27,110,88,246,118,219,76,245,4,148,245,45,147,148,
+    158,70,177,5,78,248,137,90,247,115,34,14,85,203,59,95,
+    239,139,153,186,152,169,241,153,51,26,204,243,176,203,203,178,
+    161,232,88,150,93,65,150,125,33,201,56,38,203,223,150,149,
+    98,96,233,151,73,97,88,142,172,99,114,92,228,198,108,90,
+    14,170,63,179,226,148,7,88,34,249,179,250,41,68,154,112,
+    135,158,231,174,119,158,230,247,104,40,181,53,127,194,13,52,
+    24,150,27,107,0,2,167,44,8,39,183,159,180,23,60,240,
+    233,40,201,255,82,3,145,55,43,143,60,54,167,195,180,219,
+    233,215,250,116,179,175,49,45,111,246,42,239,222,202,121,14,
+    243,227,33,55,33,35,191,202,229,230,13,136,174,224,214,196,
+    74,209,200,227,94,125,89,49,154,65,74,32,249,169,165,203,
+    155,241,110,213,63,163,62,183,188,44,255,35,142,30,138,19,
+    7,226,196,190,248,97,157,62,83,135,226,244,129,56,253,146,
+    200,254,176,46,62,172,241,15,253,196,38,40,188,77,161,45,
+    91,170,9,247,40,225,167,215,200,6,185,47,96,3,80,108,
+    9,215,94,242,209,231,76,93,171,93,250,10,237,136,82,33,
+    196,110,195,66,24,49,68,49,142,166,68,159,10,218,128,43,
+    180,239,85,94,101,58,56,185,166,130,63,121,156,21,184,197,
+    84,72,158,251,186,180,172,192,118,175,125,198,24,153,27,192,
+    233,224,184,9,172,33,8,28,174,189,130,96,5,254,202,252,
+    198,116,171,135,192,247,204,58,120,202,126,5,214,97,133,185,
+    90,241,238,250,128,160,66,99,97,242,155,41,85,49,12,211,
+    33,189,220,64,82,160,179,180,108,90,18,169,134,36,21,94,
+    181,176,131,155,21,96,187,252,28,222,184,111,89,166,229,10,
+    143,149,98,25,251,227,132,172,174,98,245,27,89,249,78,209,
+    138,202,82,17,147,194,14,217,184,184,236,134,131,139,201,170,
+    206,83,155,158,76,146,130,130,25,161,5,51,220,145,203,108,
+    71,169,205,82,161,117,79,232,163,232,64,117,230,104,112,184,
+    58,71,46,98,95,30,30,39,111,238,62,174,39,239,84,115,
+    213,220,197,177,56,76,148,37,171,157,120,156,28,169,189,63,
+    251,50,76,128,60,251,201,92,61,153,251,107,168,22,155,111,
+    176,212,124,113,113,113,194,71,15,249,145,3,126,100,159,79,
+    215,249,116,141,79,31,137,201,170,96,243,100,199,31,250,135,
+    192,143,233,187,172,245,46,45,244,136,53,64,15,155,164,48,
+    72,192,229,188,158,228,119,146,84,51,142,203,5,155,110,194,
+    12,232,237,51,177,212,214,253,163,248,232,214,131,70,136,231,
+    6,27,224,26,240,233,60,166,81,2,249,241,126,55,34,203,
+    200,84,73,215,19,47,245,98,139,102,214,10,209,243,13,95,
+    50,101,155,151,151,150,145,27,157,85,108,28,92,210,118,12,
+    254,114,32,131,191,101,134,194,123,189,161,189,230,167,253,78,
+    60,99,101,189,66,34,241,245,17,36,169,133,176,113,47,4,
+    67,13,64,33,198,66,134,180,203,255,4,30,192,143,107,224,
+    110,231,211,136,71,32,105,181,189,240,75,164,158,154,56,165,
+    163,243,182,97,136,131,244,118,95,141,213,149,122,60,115,234,
+    13,207,59,141,137,24,36,73,238,133,157,15,234,201,91,167,
+    116,116,222,54,164,193,240,141,221,185,221,185,223,231,255,152,
+    175,189,69,78,152,60,25,204,236,204,212,198,62,249,243,73,
+    125,108,118,127,48,87,31,204,213,64,194,127,188,84,253,11,
+    241,103,90,204,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/utils/multiprocessing/context.py",
+    "gem5.utils.multiprocessing.context",
+    embedded_module_data,
+    1284,
+    2576);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,149 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,221,23,91,108,219,214,245,242,37,146,50,165,216,137,
+    20,219,137,237,48,177,21,91,145,99,39,155,155,173,104,23,
+    52,89,225,58,131,231,21,107,129,45,66,10,130,22,41,155,
+    30,41,106,36,85,217,153,4,120,64,128,169,128,63,188,161,
+    69,188,161,192,84,160,8,92,36,159,27,176,207,61,176,96,
+    159,82,192,34,2,1,1,1,134,126,244,79,65,130,193,232,
+    215,206,165,30,150,252,104,183,175,1,227,227,240,220,123,207,
+    61,175,123,238,57,151,255,68,93,23,211,250,190,120,31,192,
+    125,164,160,36,82,8,133,212,137,36,225,127,201,36,9,95,
+    74,167,12,58,73,27,76,146,49,2,201,0,129,105,104,157,
+    53,184,36,103,240,73,30,218,140,18,208,131,70,95,178,15,
+    112,118,133,72,10,36,122,11,41,220,61,104,169,244,90,168,
+    45,238,1,133,208,67,170,221,74,134,20,242,29,20,231,229,
+    115,4,66,193,119,87,53,91,76,107,186,42,166,204,140,35,
+    107,25,91,84,215,29,53,99,107,38,160,102,90,116,86,85,
+    209,200,233,142,150,181,204,148,106,219,90,102,69,52,76,37,
+    7,51,28,83,92,86,197,156,173,42,98,94,115,86,197,21,
+    213,120,101,38,248,78,86,77,105,105,45,37,235,250,198,180,
+    168,57,251,140,49,171,148,169,248,19,237,172,156,207,136,178,
+    152,81,243,254,60,177,197,190,201,233,109,51,171,102,128,149,
+    105,180,102,96,37,45,211,240,89,188,189,225,172,154,25,209,
+    118,228,140,34,91,138,168,107,203,150,108,109,136,154,145,213,
+    85,67,5,97,14,40,223,210,61,120,140,238,83,218,140,58,
+    51,45,166,178,62,179,217,69,109,121,246,0,229,108,124,38,
+    248,37,118,216,82,156,242,6,178,88,35,201,215,90,202,154,
+    182,182,238,49,126,195,163,115,142,166,199,73,143,183,84,37,
+    151,194,146,189,147,182,234,52,73,129,141,228,207,252,18,124,
+    141,226,132,215,191,2,67,41,211,48,64,119,73,215,50,170,
+    199,248,182,166,186,195,131,108,135,199,20,128,95,65,128,168,
+    8,2,3,225,160,72,82,37,148,134,16,185,199,37,105,133,
+    186,135,146,76,9,173,19,201,0,44,40,109,5,129,220,11,
+    54,117,196,62,77,145,93,76,169,214,251,226,7,0,62,34,
+    238,35,135,216,31,124,0,239,195,78,171,220,53,178,127,21,
+    136,7,208,255,176,51,6,49,135,64,44,177,4,198,51,118,
+    46,171,90,30,39,73,90,70,115,36,9,60,70,219,170,158,
+    246,250,90,254,148,204,229,53,143,151,164,148,46,67,67,178,
+    177,38,162,184,249,213,171,182,149,154,109,173,1,86,121,22,
+    123,211,62,180,20,221,222,247,163,44,187,97,157,0,22,119,
+    195,205,72,105,203,189,6,125,246,121,0,123,155,168,206,133,
+    62,96,183,216,167,220,208,19,110,104,231,108,149,139,185,92,
+    172,210,126,94,96,19,122,28,196,182,29,244,47,218,223,148,
+    120,35,34,131,40,146,4,42,144,229,110,202,99,220,86,164,
+    10,104,173,179,205,202,244,145,78,164,14,58,209,233,219,31,
+    93,11,236,59,123,141,237,72,233,153,81,164,157,129,174,25,
+    252,49,186,48,78,180,75,42,58,40,149,71,206,96,23,23,
+    161,67,73,23,152,7,96,235,67,114,159,246,24,74,226,8,
+    202,46,153,202,33,153,153,200,248,55,80,228,209,58,117,27,
+    229,33,214,215,137,98,0,94,22,94,174,200,131,182,103,187,
+    116,8,31,109,243,29,208,164,24,40,178,255,49,45,112,118,
+    206,117,121,137,42,112,224,247,254,118,251,17,213,155,56,139,
+    193,158,245,237,90,133,46,30,92,129,93,33,15,173,113,172,
+    75,163,83,109,172,103,229,35,71,235,89,232,145,217,171,79,
+    1,73,29,111,22,2,208,58,221,225,60,219,165,17,175,208,
+    10,243,40,208,59,247,21,84,236,43,244,149,135,142,180,129,
+    41,15,31,213,223,171,217,225,100,128,239,131,17,145,233,27,
+    71,87,145,77,231,201,230,202,18,232,54,244,18,104,5,21,
+    5,208,153,79,147,111,162,247,134,139,161,66,232,151,209,130,
+    112,204,158,9,29,148,181,117,166,199,163,103,246,61,226,76,
+    116,245,119,226,160,32,28,242,220,72,7,135,21,243,181,24,
+    242,181,136,244,68,207,232,215,232,48,140,211,223,248,255,133,
+    37,237,125,23,103,151,44,188,120,184,80,89,170,109,230,172,
+    148,42,57,150,156,250,153,106,65,74,15,182,80,41,173,64,
+    98,215,178,170,180,10,101,76,87,61,58,35,27,170,71,230,
+    151,231,97,38,155,210,77,91,77,43,241,49,239,196,129,60,
+    110,225,8,245,24,168,129,192,129,6,54,182,23,144,179,144,
+    192,21,11,251,203,139,224,234,152,181,212,172,108,249,53,92,
+    82,100,71,246,24,169,201,94,51,61,246,230,134,163,218,183,
+    126,100,225,228,104,225,108,233,209,74,206,200,122,164,105,123,
+    52,86,201,194,9,209,194,241,235,5,252,131,140,98,225,211,
+    150,23,246,139,199,251,82,22,234,15,150,27,198,162,212,117,
+    53,149,115,228,101,48,129,202,106,138,199,217,112,122,128,162,
+    172,123,52,46,43,30,147,183,52,71,245,120,160,93,206,165,
+    211,184,194,205,107,25,89,215,238,66,167,111,166,111,3,159,
+    110,117,90,30,227,247,198,195,22,206,34,22,78,17,190,205,
+    22,78,161,30,143,77,107,218,68,166,179,30,7,102,130,60,
+    201,2,151,173,106,186,34,229,219,136,213,25,203,123,84,202,
+    80,60,34,237,9,32,73,114,76,201,23,0,243,21,27,167,
+    54,177,231,178,112,110,241,88,73,151,115,153,212,234,221,80,
+    171,56,54,155,175,193,152,253,57,44,239,38,170,113,115,149,
+    222,231,89,52,246,52,154,120,18,77,84,163,151,221,232,229,
+    82,176,198,9,91,124,171,118,158,169,114,19,46,55,81,225,
+    38,234,145,97,55,50,179,251,11,119,246,141,106,228,134,27,
+    185,81,226,235,161,19,91,201,15,238,108,221,41,145,117,238,
+    204,206,92,149,19,93,78,172,112,98,131,164,249,88,93,136,
+    110,45,237,188,90,94,174,10,113,87,136,87,132,120,179,231,
+    181,93,178,42,36,92,33,81,17,18,95,8,99,59,78,85,
+    152,112,133,137,138,255,236,125,126,168,103,111,239,217,183,174,
+    85,184,107,37,14,192,246,119,0,236,252,164,188,222,32,135,
+    249,243,117,241,194,167,236,39,252,167,124,85,24,45,45,108,
+    175,244,180,223,218,254,233,23,39,47,212,206,198,106,35,227,
+    181,168,232,70,99,13,150,62,21,126,142,0,188,196,160,244,
+    253,70,16,133,6,182,110,61,21,70,158,8,35,59,43,229,
+    124,101,116,182,42,92,113,133,43,21,225,74,125,240,172,59,
+    120,169,222,31,117,251,39,170,253,23,221,254,139,187,212,238,
+    187,143,110,63,167,200,33,96,0,160,244,230,214,66,35,128,
+    70,99,128,252,176,62,16,221,94,45,211,187,106,101,96,174,
+    58,48,231,14,204,53,16,17,154,250,19,81,235,31,184,207,
+    254,134,221,33,127,47,252,78,248,109,248,227,112,181,127,210,
+    237,159,172,244,79,54,40,32,240,169,124,240,28,131,151,168,
+    167,239,40,0,30,57,114,44,128,70,198,74,139,181,193,115,
+    229,161,202,233,75,13,68,134,166,125,176,77,214,78,69,183,
+    175,215,34,226,211,200,228,147,200,36,248,63,146,112,35,137,
+    74,36,177,87,31,61,255,241,123,187,115,127,140,252,97,236,
+    207,35,213,209,37,119,116,9,140,89,122,54,56,86,102,43,
+    167,167,240,252,243,62,104,49,169,71,78,127,184,176,243,227,
+    95,47,126,184,184,189,184,215,96,218,195,123,141,208,255,70,
+    58,56,195,190,14,225,253,151,171,151,110,38,208,95,19,3,
+    55,95,167,254,198,221,140,47,68,208,223,175,78,205,199,168,
+    199,195,2,224,143,99,244,124,156,125,28,167,48,62,77,96,
+    252,50,198,255,17,185,49,113,235,187,84,156,197,7,88,156,
+    107,36,201,11,74,82,243,79,1,112,65,146,126,158,147,245,
+    214,72,192,80,225,184,170,248,231,79,235,123,120,195,133,90,
+    231,218,148,170,235,112,246,37,172,147,120,171,225,12,251,134,
+    191,35,253,131,185,15,190,141,7,22,145,127,62,109,223,181,
+    208,240,230,124,131,38,152,139,176,130,135,65,112,138,1,243,
+    191,14,88,248,236,16,15,195,190,151,20,51,37,73,214,5,
+    44,14,151,21,11,215,6,11,23,11,63,191,54,51,225,224,
+    129,164,60,131,255,207,32,85,250,233,212,79,172,96,80,247,
+    47,138,159,82,49,119,25,155,231,219,241,25,242,133,250,214,
+    125,197,189,222,244,212,117,107,193,175,39,96,98,5,0,4,
+    54,65,52,174,49,4,221,64,24,132,17,17,220,228,241,93,
+    67,124,19,129,20,65,144,13,244,223,128,32,133,177,111,6,
+    65,68,76,87,80,162,251,121,214,119,178,20,223,100,27,129,
+    43,4,56,238,48,168,8,163,174,48,254,28,163,47,143,24,
+    246,45,254,55,72,93,181,6,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/utils/multiprocessing/popen_spawn_gem5.py",
+    "gem5.utils.multiprocessing.popen_spawn_gem5",
+    embedded_module_data,
+    1992,
+    4039);
+
+} // anonymous namespace
+} // namespace gem5
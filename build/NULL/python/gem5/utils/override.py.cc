@@ -0,0 +1,79 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,84,223,107,28,69,28,159,217,221,187,220,93,210,
+    94,46,41,21,226,33,99,211,86,15,194,173,49,53,13,177,
+    196,138,166,160,208,84,176,79,121,57,55,187,115,205,234,238,
+    206,49,51,215,152,35,193,34,1,19,232,67,95,164,74,27,
+    232,139,165,165,253,35,20,244,61,133,62,148,133,64,65,124,
+    223,82,45,146,39,191,51,247,107,47,74,112,217,251,222,204,
+    247,243,249,254,156,239,236,239,40,245,224,206,255,203,17,16,
+    183,145,135,182,208,50,242,240,231,168,98,184,56,197,51,224,
+    103,42,222,24,136,239,128,185,141,234,216,195,91,185,77,188,
+    161,217,173,223,10,4,158,75,205,200,149,62,139,8,187,78,
+    57,247,61,74,156,40,98,210,81,186,170,102,124,196,56,11,
+    2,135,175,19,201,200,69,103,197,173,58,43,66,114,199,149,
+    33,149,171,204,35,107,171,148,83,34,87,105,223,135,47,8,
+    56,33,172,14,222,180,147,65,147,106,65,43,47,51,207,175,
+    251,212,35,117,206,66,96,138,53,202,201,170,148,13,49,111,
+    219,66,58,238,87,202,97,61,96,107,85,151,133,182,99,207,
+    205,76,207,188,115,238,93,251,220,249,233,153,243,179,218,199,
+    64,209,170,39,227,170,232,79,65,251,61,190,141,54,208,151,
+    61,80,154,125,226,142,121,31,24,143,122,182,215,49,159,144,
+    153,62,238,225,180,229,29,228,25,59,230,29,180,107,13,90,
+    125,139,61,115,11,109,98,57,148,246,156,182,188,15,199,240,
+    200,232,238,54,13,153,239,51,55,140,65,111,3,24,30,196,
+    154,152,191,127,100,126,214,81,158,1,207,168,252,189,236,81,
+    49,0,31,218,205,31,174,112,3,193,176,228,150,90,249,122,
+    119,80,90,139,234,120,157,136,92,236,30,247,20,89,105,74,
+    24,0,71,146,30,171,51,1,126,216,8,104,72,35,9,167,
+    236,71,100,197,17,148,184,129,35,4,113,81,234,81,1,245,
+    193,101,81,123,170,33,40,94,122,136,184,170,249,165,98,28,
+    188,41,184,107,55,214,97,124,34,251,26,13,223,179,155,210,
+    15,132,221,205,161,218,88,143,45,21,189,53,221,85,137,234,
+    133,128,185,78,32,22,96,124,162,186,207,195,90,143,221,67,
+    148,201,20,248,23,234,12,111,160,103,35,163,219,31,115,149,
+    69,107,58,93,230,96,149,0,164,11,115,4,145,235,13,74,
+    90,197,67,53,182,202,83,132,126,221,160,174,46,63,101,161,
+    233,7,184,90,201,196,185,90,45,114,66,90,171,197,166,231,
+    243,120,124,137,201,79,250,204,69,206,25,143,135,174,81,184,
+    145,146,199,150,50,172,88,113,182,125,143,120,14,18,141,45,
+    13,21,125,224,243,186,227,210,154,14,46,44,192,224,130,220,
+    224,170,178,120,244,112,11,90,147,255,163,79,103,84,103,94,
+    129,248,27,90,51,92,186,249,193,79,147,247,216,147,83,179,
+    79,79,205,238,13,171,119,127,236,76,98,224,210,103,248,135,
+    75,119,175,36,72,173,218,242,217,194,229,196,236,111,95,152,
+    230,248,241,63,17,136,4,153,199,142,39,5,156,47,1,210,
+    17,127,101,209,232,107,183,190,121,144,125,92,124,82,156,123,
+    90,156,219,182,246,135,139,183,172,157,249,155,243,187,87,239,
+    157,254,113,249,238,242,222,240,91,240,234,120,70,233,74,39,
+    158,90,181,229,254,219,83,15,174,62,44,60,46,36,102,95,
+    249,252,196,100,146,233,111,255,248,112,241,103,239,151,137,95,
+    39,210,202,182,124,97,90,42,63,75,229,103,169,252,208,232,
+    201,237,99,122,16,244,12,86,12,94,82,107,245,53,21,234,
+    66,127,65,218,125,205,247,186,200,213,0,151,21,126,186,221,
+    176,100,172,148,57,153,160,255,16,103,209,72,121,207,122,93,
+    187,95,170,96,109,169,195,180,3,42,199,7,185,11,33,243,
+    154,1,93,224,39,58,23,68,188,1,2,154,138,113,50,87,
+    198,229,4,253,91,104,251,127,0,220,203,136,36,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/utils/override.py",
+    "gem5.utils.override",
+    embedded_module_data,
+    877,
+    1584);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,102 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,84,205,107,27,71,20,159,217,47,173,108,199,138,
+    252,17,59,164,105,183,249,106,20,27,185,31,9,53,33,164,
+    95,137,157,26,42,40,246,165,186,172,87,154,137,165,122,165,
+    85,102,215,177,45,20,208,193,16,57,4,82,74,75,92,122,
+    241,161,132,4,255,51,50,228,32,22,10,134,158,124,83,73,
+    15,38,151,246,189,149,86,150,212,38,116,119,249,237,238,155,
+    55,243,126,239,55,239,205,31,164,235,82,218,239,87,2,224,
+    41,145,200,60,97,100,139,48,250,76,34,100,79,10,221,210,
+    36,74,152,196,100,155,22,164,180,68,9,83,210,114,113,226,
+    60,225,202,5,34,98,20,230,113,242,12,252,246,58,11,167,
+    37,166,166,229,239,72,81,89,39,27,240,94,167,76,219,34,
+    105,149,75,92,229,100,69,78,107,44,178,72,18,122,182,155,
+    13,13,217,92,9,216,112,146,166,12,87,162,105,153,73,48,
+    91,97,50,174,193,20,64,141,169,128,17,166,193,42,17,95,
+    159,179,86,249,210,183,183,190,41,243,165,92,222,53,224,177,
+    140,187,96,51,214,133,85,42,113,97,184,142,225,229,44,15,
+    128,27,203,203,222,61,86,88,94,54,178,150,109,187,198,186,
+    35,86,141,245,28,135,33,97,56,194,40,58,158,145,247,6,
+    12,184,114,150,107,100,56,47,26,249,162,235,129,51,103,201,
+    192,222,67,27,69,140,33,237,47,3,218,21,34,244,10,72,
+    120,186,227,176,72,42,116,151,252,215,5,162,146,94,169,23,
+    201,11,57,117,136,95,190,158,247,184,176,50,54,127,65,125,
+    121,133,123,9,201,87,44,177,226,250,218,234,58,190,93,156,
+    100,24,175,47,186,34,59,83,218,244,114,78,113,102,133,23,
+    174,205,172,121,121,219,157,41,9,103,69,112,215,53,51,150,
+    72,150,54,125,221,52,49,95,211,44,199,67,181,146,161,233,
+    125,164,255,1,64,149,52,6,99,77,66,163,103,26,163,19,
+    59,244,167,79,107,169,70,108,252,73,249,81,121,231,202,46,
+    219,143,77,189,140,77,213,245,169,87,72,48,75,187,50,233,
+    23,129,130,8,180,79,4,233,255,139,32,84,120,9,29,32,
+    33,251,138,203,237,187,98,0,45,131,0,174,28,228,109,136,
+    161,64,37,220,97,203,243,68,87,90,161,233,18,78,25,70,
+    136,245,243,197,111,92,231,149,22,240,101,40,60,77,189,32,
+    9,42,226,24,3,199,219,17,162,166,201,139,176,21,160,220,
+    72,151,114,109,219,20,46,18,105,73,167,15,213,148,86,40,
+    229,237,161,196,24,146,26,199,244,148,32,158,175,243,141,172,
+    233,109,150,184,31,193,175,251,150,237,107,129,41,227,42,173,
+    116,195,124,33,242,70,222,235,219,198,150,41,137,171,78,132,
+    249,166,18,58,122,23,173,2,55,77,127,192,52,11,14,91,
+    179,241,123,200,52,239,173,89,118,123,36,98,154,204,201,154,
+    166,56,129,51,71,16,78,33,188,19,114,12,86,11,162,11,
+    57,4,28,116,211,65,218,225,221,148,36,85,111,18,4,93,
+    86,167,155,164,3,3,125,191,84,61,1,53,22,130,214,251,
+    219,129,86,216,32,34,42,151,160,190,130,125,187,52,215,179,
+    145,114,168,238,199,0,15,201,67,233,41,241,186,134,93,153,
+    209,45,80,156,73,43,244,17,28,74,53,169,70,238,74,112,
+    132,68,31,208,10,133,195,67,75,101,229,190,205,26,125,227,
+    102,201,62,181,124,154,241,105,182,167,8,95,235,55,108,171,
+    144,97,214,205,242,123,157,182,203,57,206,106,242,134,237,64,
+    135,185,55,147,161,195,103,200,73,11,116,219,241,170,109,105,
+    241,255,16,35,247,80,81,67,42,223,3,252,12,121,85,224,
+    40,188,79,69,164,34,109,171,102,199,109,91,221,237,214,163,
+    115,85,200,182,194,164,227,6,44,67,3,85,104,25,86,125,
+    6,254,123,157,57,15,228,150,231,13,156,35,131,34,114,42,
+    33,165,14,255,134,171,165,187,228,171,158,227,97,65,174,149,
+    152,229,241,132,38,46,98,37,170,25,55,95,230,48,24,188,
+    162,44,239,150,108,107,147,51,95,179,45,215,51,65,37,47,
+    200,20,107,183,90,109,247,82,107,9,211,115,202,198,27,148,
+    234,120,124,133,82,225,113,114,132,167,210,201,157,129,250,224,
+    57,120,26,167,206,212,190,120,60,223,24,27,127,122,231,199,
+    59,59,214,238,165,231,241,223,18,191,20,158,175,237,159,189,
+    186,63,118,237,229,216,181,90,20,70,107,90,237,222,118,180,
+    17,155,172,235,147,129,204,9,89,92,70,181,47,7,189,65,
+    161,35,114,214,125,8,4,53,5,67,31,225,16,214,144,248,
+    144,180,207,152,101,227,243,22,235,19,61,84,197,85,176,161,
+    90,238,60,146,3,118,191,15,142,99,221,95,56,136,157,175,
+    195,163,159,63,24,142,213,22,171,115,77,69,85,79,55,201,
+    91,97,152,12,141,215,149,177,118,199,70,130,122,247,163,72,
+    42,105,173,121,142,192,163,89,124,130,198,193,175,11,37,71,
+    120,183,133,112,68,192,1,59,55,56,190,251,186,20,202,177,
+    213,234,55,197,108,187,164,221,95,1,154,50,165,180,57,59,
+    74,161,191,254,13,127,34,252,117,108,155,214,232,68,67,121,
+    183,222,251,28,196,199,171,11,213,133,163,70,100,4,82,166,
+    19,199,208,24,28,173,205,110,95,127,124,189,122,171,17,63,
+    133,78,213,133,166,10,3,71,71,71,205,161,97,10,18,117,
+    224,28,25,58,249,195,217,93,189,62,144,168,70,240,118,145,
+    247,19,125,146,236,196,167,229,61,58,45,255,3,48,168,245,
+    32,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/utils/progress_bar.py",
+    "gem5.utils.progress_bar",
+    embedded_module_data,
+    1233,
+    2215);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,137 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,86,91,111,27,199,21,158,189,112,185,164,40,50,
+    149,168,139,45,199,94,38,110,100,218,22,233,70,142,219,218,
+    130,19,85,113,210,64,149,82,216,134,91,176,48,136,213,238,
+    72,162,188,23,122,102,169,68,44,9,169,133,30,88,64,40,
+    252,224,34,2,2,3,66,81,24,41,236,2,253,1,237,127,
+    160,140,45,64,44,96,52,64,95,154,55,186,182,31,234,167,
+    158,89,146,75,82,182,226,102,118,247,204,237,92,102,207,249,
+    102,206,252,11,245,148,72,187,126,250,123,32,95,32,29,233,
+    156,129,114,173,154,203,113,80,243,6,111,10,57,129,67,186,
+    160,139,134,104,134,114,33,191,29,50,36,51,156,11,251,109,
+    201,144,205,72,46,98,70,115,81,232,135,241,192,50,175,203,
+    219,98,46,22,65,236,209,19,122,20,11,56,124,36,48,171,
+    15,64,63,212,211,143,225,65,125,80,231,150,101,61,190,29,
+    202,197,117,238,26,74,191,241,13,155,90,76,115,158,252,105,
+    209,41,216,150,106,124,195,195,8,12,124,111,206,94,197,4,
+    91,26,254,57,177,29,91,179,13,24,20,62,185,54,155,230,
+    189,227,43,216,201,147,146,229,20,76,156,215,58,124,249,98,
+    155,209,27,98,243,180,84,44,218,196,193,122,190,64,85,234,
+    9,38,93,209,184,30,191,136,240,9,204,47,47,124,191,56,
+    61,115,107,65,251,62,124,15,186,255,192,117,255,103,141,15,
+    70,249,91,126,155,156,248,206,58,132,78,171,202,89,211,223,
+    89,90,12,90,161,96,94,232,153,151,130,86,184,107,71,23,
+    43,220,151,72,15,85,208,151,232,158,8,49,144,22,9,83,
+    84,150,103,76,91,47,25,248,178,39,82,108,44,191,224,126,
+    85,230,111,42,105,217,11,23,44,90,196,154,227,133,168,163,
+    106,183,60,121,185,100,105,44,88,208,42,24,216,82,77,236,
+    133,150,9,171,228,229,188,97,107,170,65,189,72,62,175,25,
+    42,165,249,188,39,231,243,140,39,159,79,243,132,129,209,19,
+    89,151,50,159,41,202,139,20,37,90,182,184,225,172,218,86,
+    118,5,155,239,101,75,78,193,160,89,130,111,151,10,4,211,
+    76,113,195,27,202,179,120,226,207,53,236,99,36,79,29,66,
+    198,64,122,18,62,106,2,217,66,207,227,72,78,108,87,127,
+    179,185,189,121,231,182,27,62,226,134,223,218,91,123,20,62,
+    87,15,159,123,46,161,55,198,118,170,191,219,220,217,220,189,
+    237,38,82,110,226,116,77,172,137,207,229,131,195,147,110,226,
+    220,95,71,221,196,143,220,196,79,220,196,124,77,108,12,28,
+    171,57,245,129,99,240,222,161,173,186,46,30,123,202,252,248,
+    145,23,3,84,229,219,171,212,189,137,151,81,216,157,140,221,
+    90,55,187,61,137,96,167,68,44,45,136,61,20,25,181,177,
+    56,195,31,196,98,127,252,171,130,35,28,58,39,58,161,238,
+    92,23,91,58,231,136,61,227,65,187,111,52,144,44,3,86,
+    30,242,247,97,29,15,2,132,87,1,45,186,112,203,215,72,
+    126,89,233,65,150,46,110,163,138,240,225,129,149,172,115,228,
+    10,67,88,23,119,128,56,233,158,80,149,24,239,205,163,213,
+    112,69,234,179,46,119,249,42,225,94,169,123,124,121,16,236,
+    75,59,19,206,112,151,223,25,233,182,43,210,195,240,125,240,
+    215,131,238,142,233,235,253,150,171,112,193,218,231,43,92,119,
+    237,21,177,219,110,207,95,58,204,138,46,239,13,160,87,20,
+    208,17,172,22,116,7,237,126,255,189,118,133,60,57,81,9,
+    209,19,135,90,143,188,78,131,46,92,67,236,75,71,213,159,
+    130,217,168,2,229,138,69,75,176,131,20,103,21,43,112,110,
+    102,131,3,85,233,64,52,59,127,99,65,105,3,211,196,150,
+    67,21,149,96,197,196,78,70,153,181,148,96,195,249,218,62,
+    43,24,134,178,132,21,162,22,40,86,10,203,76,237,134,207,
+    111,217,78,38,234,243,92,44,170,112,12,40,189,59,227,162,
+    114,189,101,254,20,77,43,108,127,43,102,137,58,76,145,102,
+    155,69,56,62,116,197,177,51,189,210,223,178,147,90,202,180,
+    151,254,163,79,177,175,235,255,41,135,45,160,119,183,182,44,
+    174,218,160,153,110,80,7,155,45,43,171,234,58,246,253,58,
+    143,137,133,141,169,37,149,130,158,27,5,226,148,84,227,240,
+    5,44,168,218,106,193,194,138,186,174,22,12,117,201,192,109,
+    187,190,79,169,114,165,227,240,139,202,213,214,136,218,19,133,
+    182,207,59,241,210,153,83,21,155,116,221,113,152,221,192,75,
+    186,205,98,165,152,170,163,173,130,42,213,81,236,150,74,173,
+    68,64,131,211,114,227,82,193,82,201,70,107,101,101,57,171,
+    227,245,44,120,4,146,175,8,249,1,47,246,229,80,134,240,
+    105,248,158,158,4,50,143,56,56,187,42,232,230,64,21,246,
+    220,90,192,116,3,125,193,113,104,39,166,35,192,39,199,146,
+    125,104,93,53,74,24,18,57,159,57,231,9,44,61,183,146,
+    1,25,133,234,69,100,102,5,91,248,243,34,185,92,158,8,
+    210,192,76,43,175,92,206,4,147,58,240,210,247,128,252,27,
+    158,45,212,68,252,37,201,39,141,209,35,53,97,39,210,20,
+    58,3,175,34,100,28,36,203,35,215,15,58,180,64,149,201,
+    242,240,100,70,185,214,185,62,176,97,122,81,73,115,126,242,
+    42,95,184,222,227,176,87,64,145,41,248,117,21,20,92,13,
+    32,196,250,229,31,176,189,6,147,129,181,165,146,195,250,37,
+    43,64,131,2,65,118,86,97,172,5,181,116,140,176,115,145,
+    176,67,197,227,109,234,73,170,166,97,74,61,241,106,254,211,
+    121,79,252,5,80,162,48,14,118,84,120,97,3,160,69,113,
+    209,139,4,56,242,179,164,39,45,219,4,98,158,150,9,187,
+    27,144,163,140,76,176,137,248,129,43,210,209,111,185,82,13,
+    178,93,17,172,212,119,5,121,139,69,64,246,35,215,42,126,
+    252,60,185,19,52,146,129,238,143,25,211,38,231,39,233,147,
+    104,244,212,254,72,218,29,73,111,45,62,78,189,191,159,154,
+    117,83,179,117,241,248,227,228,232,221,79,118,215,254,66,30,
+    126,246,247,161,191,141,237,103,63,168,39,103,247,147,179,110,
+    114,118,107,161,153,65,114,242,142,243,40,60,81,15,79,236,
+    197,92,229,221,158,80,191,121,198,15,243,19,214,121,214,30,
+    78,181,137,132,18,11,220,158,225,190,243,195,122,252,103,173,
+    183,38,52,134,83,77,196,69,166,124,82,155,107,196,18,127,
+    88,186,187,86,31,62,187,247,246,159,78,65,5,239,126,236,
+    108,109,174,54,247,56,62,246,143,241,211,95,209,250,248,244,
+    254,248,180,11,52,126,222,141,159,175,203,231,65,115,228,228,
+    158,243,72,62,83,151,207,52,98,147,110,108,170,49,240,125,
+    119,224,204,127,4,110,240,44,104,30,60,11,151,142,196,248,
+    227,216,241,38,207,141,76,254,115,114,234,143,235,141,100,198,
+    77,78,55,146,89,55,121,254,73,72,56,53,244,12,1,105,
+    134,164,193,248,19,4,228,25,35,79,4,57,17,125,6,87,
+    153,104,19,201,145,104,51,9,191,222,68,161,80,116,119,193,
+    175,96,77,160,180,145,252,24,254,154,201,241,76,142,181,4,
+    145,201,137,76,78,4,57,1,120,125,129,46,241,1,159,22,
+    22,23,63,74,39,200,32,11,223,73,31,28,206,70,177,96,
+    173,16,150,255,188,161,151,3,79,216,197,192,19,25,62,136,
+    228,195,172,13,18,31,150,62,64,61,161,115,33,243,196,37,
+    27,68,88,216,255,140,124,131,173,29,29,92,45,201,5,232,
+    178,3,132,254,23,72,83,224,56,174,121,1,113,137,173,56,
+    123,26,40,178,229,63,13,52,81,239,127,191,70,239,214,251,
+    223,6,26,173,247,191,77,94,224,248,38,122,61,137,37,184,
+    55,119,231,154,8,170,131,228,29,244,246,100,227,253,185,198,
+    145,227,205,240,199,28,7,174,99,180,49,116,116,119,250,238,
+    84,83,96,157,175,83,233,250,233,75,110,106,166,25,242,57,
+    36,52,60,214,102,150,145,20,109,70,186,114,135,81,223,53,
+    255,3,165,86,81,249,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/utils/requires.py",
+    "gem5.utils.requires",
+    embedded_module_data,
+    1798,
+    3493);
+
+} // anonymous namespace
+} // namespace gem5
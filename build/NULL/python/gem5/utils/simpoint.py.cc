@@ -0,0 +1,248 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,173,56,107,111,27,215,149,119,102,56,228,240,37,82,
+    178,108,234,97,139,67,75,178,77,219,162,100,91,114,19,199,
+    16,92,91,142,157,166,113,210,38,216,221,40,13,168,49,103,
+    40,49,38,135,234,204,48,142,184,52,226,0,94,172,18,4,
+    168,80,116,97,97,177,64,213,34,27,40,155,126,200,151,5,
+    178,69,11,20,240,31,32,5,2,34,8,24,48,176,95,154,
+    47,193,24,118,0,35,159,122,206,29,62,102,72,42,118,210,
+    14,57,103,238,227,220,115,207,61,247,220,243,184,255,79,108,
+    143,171,241,125,244,47,0,238,18,153,200,76,150,228,152,69,
+    134,193,50,155,101,115,220,34,151,115,45,186,104,157,203,242,
+    57,247,162,59,231,89,244,208,186,43,43,228,188,139,94,134,
+    176,228,10,145,249,59,68,118,127,202,18,242,57,219,36,191,
+    232,147,61,175,147,184,240,21,86,226,76,221,245,154,100,172,
+    196,217,186,235,167,25,221,168,243,111,20,86,179,10,84,249,
+    180,100,72,217,186,235,166,164,169,128,21,126,61,147,91,205,
+    103,84,227,231,138,158,47,104,41,37,101,103,185,191,201,114,
+    31,131,44,43,100,145,145,201,34,43,51,139,156,151,216,127,
+    242,126,217,165,184,100,94,225,101,183,226,150,61,240,10,138,
+    71,225,135,91,164,100,111,71,221,7,184,126,153,77,135,229,
+    192,29,126,81,144,131,48,166,15,94,191,210,129,233,172,165,
+    89,91,217,45,135,238,184,96,225,148,86,7,158,75,14,67,
+    159,191,171,157,149,251,161,61,64,219,131,142,246,1,104,239,
+    131,118,30,202,251,160,28,234,49,118,16,218,195,50,11,130,
+    62,80,23,64,118,175,161,236,138,105,159,8,207,27,43,25,
+    93,108,182,137,169,172,164,235,34,180,20,116,69,22,141,188,
+    152,147,84,105,89,17,141,21,69,204,168,233,188,150,147,140,
+    76,94,21,85,69,145,1,1,26,90,99,117,74,46,163,138,
+    55,243,218,141,108,94,146,19,62,218,114,77,195,221,174,247,
+    235,141,61,75,106,141,77,179,53,193,171,104,239,194,14,15,
+    180,154,210,153,172,146,92,5,109,168,135,111,42,153,229,21,
+    123,75,176,133,149,69,53,241,55,16,104,37,4,58,146,43,
+    172,182,73,186,53,197,40,104,106,74,232,208,106,14,85,228,
+    127,128,183,127,103,239,18,131,105,119,202,204,167,80,251,188,
+    213,194,144,18,243,193,93,131,107,99,148,152,45,150,244,120,
+    62,133,247,243,118,205,65,229,150,80,18,182,184,167,143,186,
+    197,1,117,215,51,224,185,0,143,127,58,222,150,187,23,142,
+    204,57,185,251,136,253,187,168,185,58,214,234,249,144,45,145,
+    164,167,89,47,113,31,176,37,215,237,243,37,30,190,238,219,
+    97,163,223,54,150,239,148,182,250,178,177,175,221,191,206,166,
+    25,217,125,71,40,241,11,223,41,95,152,207,215,42,187,161,
+    230,111,214,212,241,18,217,10,244,226,187,196,149,92,78,123,
+    244,11,182,131,146,141,78,201,35,123,110,208,29,212,14,2,
+    197,96,79,138,158,46,174,250,90,43,133,3,40,123,150,25,
+    35,106,195,39,239,180,230,114,142,44,242,221,163,227,130,180,
+    0,170,65,143,21,62,231,86,37,77,202,137,93,199,232,28,
+    156,106,69,204,42,234,178,177,34,230,211,162,34,165,86,218,
+    231,84,108,162,37,246,36,212,58,106,22,37,44,161,49,64,
+    43,208,38,3,231,184,144,53,68,196,109,17,250,142,103,89,
+    81,21,77,50,192,106,92,95,19,155,6,252,76,226,180,8,
+    54,100,89,201,205,117,113,211,121,236,187,121,177,48,236,140,
+    180,103,121,22,150,172,103,47,118,246,148,14,218,153,115,226,
+    143,69,252,162,120,219,34,209,13,73,51,50,234,50,136,88,
+    55,180,66,10,109,165,190,215,194,246,38,99,33,244,24,232,
+    52,109,56,88,45,228,174,43,26,14,183,79,73,13,51,98,
+    35,47,133,85,241,186,2,13,79,223,37,16,164,145,215,112,
+    140,100,227,38,181,162,164,110,208,149,219,100,146,72,136,106,
+    222,80,206,157,243,57,168,94,83,44,183,177,74,221,136,74,
+    119,9,119,76,71,177,98,5,23,107,177,231,84,38,73,149,
+    177,37,163,57,200,53,5,33,190,148,182,145,146,52,133,78,
+    0,83,101,212,147,192,135,40,53,150,125,51,147,205,194,98,
+    69,57,175,42,13,37,113,208,195,217,19,78,142,255,121,69,
+    81,41,53,107,219,196,165,37,199,62,47,45,81,214,150,150,
+    108,155,182,180,116,210,62,66,207,107,168,213,116,101,14,210,
+    199,26,61,150,130,181,14,159,40,233,41,69,149,113,116,94,
+    147,21,45,142,254,22,246,46,175,46,103,215,68,189,176,188,
+    12,219,160,200,9,7,45,84,125,96,194,82,128,6,99,121,
+    21,240,209,219,194,30,229,53,77,73,25,88,207,192,249,104,
+    76,220,181,150,54,205,226,215,189,28,255,138,164,131,248,64,
+    32,178,178,10,244,232,105,5,134,211,210,187,121,170,99,75,
+    157,129,87,67,58,205,230,133,12,114,145,215,214,150,196,166,
+    151,23,111,174,100,192,250,228,164,53,220,152,116,190,160,82,
+    146,75,244,140,53,145,244,86,105,41,33,190,150,85,36,93,
+    17,11,70,38,155,41,210,208,67,87,18,61,227,148,230,118,
+    107,74,46,255,110,131,213,2,56,123,108,161,68,116,100,154,
+    206,116,77,67,15,160,161,227,41,94,108,204,208,84,82,106,
+    56,90,90,218,214,208,235,121,20,101,99,105,150,138,54,21,
+    50,101,139,23,104,36,113,6,222,71,135,1,252,7,243,50,
+    248,176,187,96,187,223,246,222,98,74,204,135,44,90,242,127,
+    34,119,25,134,124,236,147,201,235,228,51,230,218,103,36,206,
+    213,217,196,76,221,69,79,45,178,166,35,21,81,188,253,109,
+    76,215,82,211,171,107,198,74,94,157,70,214,167,81,16,250,
+    116,147,143,196,234,218,183,222,243,104,230,222,91,213,230,139,
+    19,77,145,36,146,96,23,50,70,50,153,56,159,205,167,164,
+    172,62,159,104,97,169,72,255,28,128,39,127,37,127,37,183,
+    137,73,216,211,3,20,212,78,205,109,44,148,71,79,86,6,
+    79,154,92,179,177,23,120,68,253,30,250,201,120,88,67,199,
+    94,231,128,241,122,223,178,2,186,133,243,89,145,89,63,214,
+    29,110,164,30,194,38,155,45,175,7,176,33,167,24,146,12,
+    65,125,157,131,90,125,32,217,229,195,52,140,52,234,46,26,
+    211,237,111,119,83,11,155,68,169,233,245,64,210,30,248,141,
+    183,231,209,147,176,87,173,49,122,50,173,229,115,214,220,131,
+    58,34,57,205,40,37,212,62,88,117,14,28,103,220,91,119,
+    233,74,54,173,161,247,183,84,7,253,189,134,238,88,11,33,
+    8,55,213,201,22,179,202,77,245,215,189,116,51,151,26,102,
+    21,131,241,186,208,220,160,98,127,215,158,205,224,6,125,6,
+    58,245,228,54,249,230,34,67,188,65,147,229,130,47,49,15,
+    57,222,235,123,76,0,152,20,132,73,224,80,217,127,236,126,
+    108,162,60,121,118,119,242,242,206,228,229,202,228,149,234,228,
+    149,74,236,106,53,118,181,28,24,123,16,59,179,27,187,188,
+    19,187,92,137,93,169,198,174,64,75,45,58,179,27,189,176,
+    19,189,80,137,94,172,70,47,150,3,7,107,226,169,93,113,
+    126,71,156,175,136,23,170,226,133,93,113,97,71,92,168,133,
+    199,31,114,108,172,239,49,1,80,14,28,50,221,4,6,142,
+    157,223,25,59,95,25,155,175,142,205,239,142,93,220,25,187,
+    88,11,199,0,45,138,104,209,190,245,87,77,129,140,207,174,
+    187,170,66,244,129,31,56,155,44,199,159,47,199,127,92,11,
+    29,44,135,38,182,253,229,99,47,220,15,239,55,89,102,63,
+    208,230,250,7,30,19,0,102,11,124,227,35,137,211,189,148,
+    173,246,252,139,84,27,31,98,229,49,177,74,9,44,37,6,
+    54,92,213,240,113,96,110,114,6,75,177,114,56,102,246,145,
+    254,253,187,225,231,118,194,207,213,194,135,203,19,179,192,96,
+    63,50,216,223,247,208,195,5,251,106,225,65,24,66,97,204,
+    244,145,192,232,166,180,227,143,150,253,209,154,56,177,43,62,
+    191,35,62,255,229,116,69,252,73,85,252,201,250,66,21,228,
+    75,255,15,98,135,183,184,255,78,109,79,84,143,47,84,142,
+    92,174,30,185,92,17,47,219,250,181,81,220,211,118,34,66,
+    181,191,153,136,96,37,101,143,245,133,134,149,120,244,9,139,
+    41,233,50,68,249,246,140,163,212,145,113,204,65,116,239,232,
+    103,187,250,121,47,41,185,182,236,86,168,245,116,228,9,238,
+    146,91,103,212,95,25,182,232,190,228,238,157,137,200,44,228,
+    5,142,120,88,118,181,19,201,206,24,191,196,63,243,252,33,
+    195,107,155,165,43,226,55,252,237,222,127,8,111,66,137,235,
+    157,169,148,60,37,33,205,118,206,255,241,167,94,34,187,241,
+    231,156,1,114,17,255,56,57,69,116,215,77,246,61,238,77,
+    114,19,108,248,155,208,202,124,79,108,224,198,211,201,9,93,
+    129,231,14,249,131,208,201,13,104,135,23,94,95,137,91,32,
+    111,255,8,51,146,91,126,88,145,119,143,21,249,33,135,104,
+    229,182,232,107,186,178,87,223,30,35,187,102,254,248,185,146,
+    183,228,75,99,166,225,45,254,155,175,29,123,128,235,77,23,
+    84,26,100,137,134,116,67,233,116,155,232,26,243,5,99,181,
+    128,110,178,59,160,109,81,178,197,168,86,172,108,13,109,15,
+    233,138,124,223,248,150,17,191,66,22,169,239,41,238,131,160,
+    83,132,188,38,95,88,94,105,34,95,115,56,99,68,195,244,
+    241,209,0,33,212,13,203,76,91,77,96,97,172,117,31,161,
+    29,32,244,194,137,203,95,127,71,199,241,150,149,254,86,56,
+    159,149,114,215,101,105,190,56,223,178,210,207,224,88,108,78,
+    183,49,126,19,168,233,152,219,221,38,91,169,237,216,39,233,
+    219,132,218,12,156,243,134,178,134,14,38,191,170,168,117,65,
+    83,36,57,155,81,149,58,7,36,235,188,190,154,205,24,150,
+    243,227,211,217,188,100,212,221,210,42,32,202,224,144,32,170,
+    211,48,198,136,7,180,227,184,134,41,4,9,68,21,154,60,
+    217,76,18,117,120,126,187,231,117,209,121,132,246,213,136,213,
+    9,94,177,135,123,165,30,14,248,161,219,132,30,208,145,41,
+    160,176,180,35,184,37,39,191,143,156,62,64,169,124,205,160,
+    84,204,1,50,120,96,93,184,31,236,223,152,170,4,197,106,
+    80,52,73,192,59,187,245,202,255,206,214,2,17,176,225,179,
+    224,249,0,208,214,7,193,33,147,245,6,103,107,145,137,221,
+    200,212,78,100,170,18,153,174,70,166,55,92,181,200,168,73,
+    152,254,145,218,224,240,253,209,177,77,227,183,197,255,44,110,
+    143,111,255,178,18,61,85,141,158,250,34,86,141,206,86,70,
+    231,170,163,115,27,66,45,114,120,55,114,98,39,114,162,18,
+    153,170,70,166,90,99,79,221,31,28,46,143,76,87,6,103,
+    170,131,51,229,193,153,251,195,123,208,25,158,171,14,207,109,
+    184,107,225,161,187,161,95,135,182,134,182,207,150,197,211,149,
+    240,153,106,248,76,57,124,198,220,7,252,129,99,218,63,98,
+    6,129,99,202,54,5,15,17,60,38,142,182,94,224,201,147,
+    39,223,141,240,15,161,54,66,188,253,191,10,126,20,44,143,
+    156,132,255,122,176,34,76,85,133,169,178,48,245,32,26,43,
+    11,7,107,7,134,214,253,181,67,147,224,135,189,71,41,248,
+    240,149,245,203,27,103,107,1,113,55,112,116,39,112,116,155,
+    255,194,85,157,185,82,57,118,165,18,184,90,13,64,204,113,
+    21,182,107,55,48,182,19,24,219,124,183,18,56,82,13,28,
+    41,211,127,45,52,190,245,86,57,52,83,22,102,244,57,216,
+    247,95,135,47,37,184,223,95,60,118,41,194,223,243,7,160,
+    124,47,226,186,52,234,189,55,202,97,121,140,193,114,148,150,
+    19,174,75,167,61,247,230,24,128,41,251,69,91,235,218,238,
+    247,164,225,70,89,135,155,36,239,180,106,78,211,214,50,164,
+    220,45,87,201,85,98,138,112,48,111,241,37,94,102,110,208,
+    126,141,43,185,110,241,42,91,98,160,149,237,125,185,87,234,
+    114,91,64,137,71,74,246,121,75,220,121,128,96,72,209,136,
+    178,210,89,214,118,93,211,203,142,26,246,188,174,121,48,49,
+    193,76,103,48,89,52,240,178,198,153,199,46,45,245,140,134,
+    113,76,111,51,108,17,119,216,94,235,106,168,109,151,49,219,
+    113,92,18,217,146,100,204,60,247,36,129,169,43,216,189,84,
+    33,75,115,197,2,205,137,113,77,205,155,144,158,166,31,152,
+    106,95,48,208,91,230,140,90,216,83,22,205,187,1,209,74,
+    154,247,162,72,111,23,36,88,114,107,13,120,107,128,18,212,
+    129,89,29,201,75,170,56,115,18,17,173,139,9,107,166,158,
+    244,218,171,67,196,101,9,175,80,140,155,74,99,96,175,107,
+    30,186,168,22,173,214,226,156,188,63,157,231,22,5,43,215,
+    226,234,94,69,45,228,232,149,150,54,129,154,250,2,54,187,
+    45,251,79,211,15,191,61,119,225,51,170,172,188,87,247,181,
+    21,163,213,79,181,196,221,178,227,150,5,63,138,22,252,80,
+    107,246,94,217,209,239,208,100,23,169,35,51,135,72,100,120,
+    221,127,63,118,124,123,182,122,2,82,140,23,171,177,23,77,
+    226,245,190,196,88,176,18,56,4,198,226,92,109,100,98,235,
+    253,202,200,217,245,151,107,161,145,205,159,125,244,254,250,251,
+    181,177,99,27,254,13,255,131,177,169,13,127,219,94,252,107,
+    37,112,162,26,56,81,14,156,0,195,121,234,133,47,223,170,
+    204,92,197,32,251,200,86,161,18,152,42,7,166,96,124,89,
+    24,161,142,211,225,229,153,166,37,8,55,188,252,59,54,31,
+    175,237,167,126,150,202,235,51,134,138,202,230,226,235,67,142,
+    28,213,118,132,138,49,135,43,235,133,242,71,164,229,167,194,
+    168,133,246,85,67,241,178,16,255,129,220,77,162,252,127,218,
+    193,155,61,89,198,13,45,14,245,240,174,180,231,207,72,223,
+    198,137,88,22,196,31,200,201,225,94,156,236,119,136,160,169,
+    13,197,177,222,34,106,246,255,165,67,62,71,202,194,145,31,
+    200,213,177,189,229,211,86,248,78,249,180,123,238,225,240,215,
+    16,208,168,203,115,141,62,214,169,234,199,100,92,149,114,74,
+    50,89,247,37,147,185,188,92,200,98,57,144,76,254,178,32,
+    101,27,61,158,100,82,206,167,146,73,13,163,107,237,57,4,
+    200,180,134,94,72,59,137,0,83,42,26,4,209,115,164,189,
+    130,0,175,89,180,87,17,252,28,193,27,164,17,107,82,54,
+    172,67,231,107,130,56,174,110,139,70,67,205,159,201,186,120,
+    193,36,8,194,100,250,76,45,54,89,27,63,218,134,81,209,
+    236,127,149,225,95,132,243,70,63,15,70,79,152,188,213,224,
+    38,7,163,166,199,42,11,228,80,204,244,90,101,31,25,141,
+    154,126,171,28,32,67,7,55,47,253,102,205,12,90,245,62,
+    114,96,100,115,252,55,111,154,33,171,30,38,35,135,154,19,
+    12,16,95,159,185,207,62,89,199,231,58,59,198,159,122,0,
+    49,20,15,95,152,254,192,136,233,193,146,64,124,161,117,99,
+    227,210,199,107,155,19,155,250,127,197,203,161,241,170,119,194,
+    244,98,31,113,130,11,76,132,31,253,226,146,73,224,243,229,
+    194,95,246,253,233,37,90,236,4,167,25,254,248,246,196,182,
+    254,135,56,196,107,252,241,78,224,102,248,216,214,224,150,242,
+    9,134,115,124,172,19,64,247,209,45,29,203,71,59,65,99,
+    100,234,147,225,158,35,91,192,218,60,220,178,107,113,127,221,
+    131,73,79,54,115,157,170,67,221,109,172,173,130,105,183,212,
+    2,53,162,238,201,205,37,240,210,142,70,241,214,101,89,100,
+    143,235,78,75,183,124,221,74,2,137,136,165,150,243,218,219,
+    141,19,163,255,31,0,147,99,24,198,60,75,152,225,50,25,
+    178,255,77,150,99,88,147,60,29,248,158,21,143,48,115,101,
+    50,107,255,155,238,183,88,6,36,210,27,62,164,240,241,30,
+    189,116,105,127,3,94,19,54,218,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5/utils/simpoint.py",
+    "gem5.utils.simpoint",
+    embedded_module_data,
+    3577,
+    8283);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,51 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,93,81,81,111,211,48,16,78,22,150,100,1,149,73,
+    72,108,218,158,64,154,80,31,90,67,80,181,110,170,38,216,
+    64,163,154,202,64,221,164,177,151,41,141,221,196,109,98,91,
+    182,83,154,62,241,47,120,225,15,240,143,34,191,242,7,34,
+    237,109,79,216,101,21,8,159,252,249,238,124,223,249,238,252,
+    203,250,103,5,247,231,237,115,13,223,45,104,65,27,174,105,
+    113,224,3,184,14,93,232,65,255,135,135,109,108,95,91,112,
+    99,104,53,3,229,9,90,240,24,137,69,35,65,121,167,197,
+    209,202,126,184,180,103,88,96,74,212,198,95,127,47,149,146,
+    137,67,0,96,36,163,118,78,73,66,225,168,21,49,220,142,
+    105,14,34,198,150,23,45,52,73,39,99,128,8,100,20,19,
+    185,244,129,217,171,197,229,138,205,81,148,229,43,250,61,21,
+    131,56,195,72,71,207,194,246,203,255,83,69,133,76,1,227,
+    116,134,33,226,194,68,183,166,168,4,25,77,48,81,111,206,
+    251,184,51,122,251,105,127,62,239,159,158,237,119,67,217,189,
+    166,248,93,120,60,61,62,125,191,24,192,171,215,5,59,73,
+    199,7,11,120,50,255,48,36,3,138,47,200,164,31,134,95,
+    190,118,166,231,195,164,60,184,104,122,42,48,175,13,151,109,
+    42,223,232,163,72,32,21,196,52,203,80,44,205,24,156,130,
+    103,202,51,149,92,106,197,213,53,156,161,82,121,88,12,76,
+    31,31,155,182,114,99,74,198,56,249,105,221,154,111,184,123,
+    38,120,12,88,41,83,74,128,153,231,13,68,227,168,200,228,
+    205,159,176,54,43,239,252,94,78,97,145,161,35,190,169,25,
+    182,222,162,167,161,118,108,219,174,187,214,122,163,242,183,171,
+    157,23,213,246,94,181,179,87,61,249,92,109,145,234,233,85,
+    181,181,91,63,246,119,131,218,50,224,4,155,110,237,60,10,
+    214,190,185,70,120,67,39,248,13,103,152,175,194,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/gem5_default_config.py",
+    "gem5.gem5_default_config",
+    embedded_module_data,
+    429,
+    536);
+
+} // anonymous namespace
+} // namespace gem5
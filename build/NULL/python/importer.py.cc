@@ -0,0 +1,256 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,57,109,108,19,87,182,119,62,61,142,191,147,152,
+    216,33,41,33,36,128,129,6,218,66,74,88,88,202,87,19,
+    120,37,236,66,91,30,81,89,203,241,76,192,224,216,102,102,
+    2,36,235,176,116,197,211,115,87,145,54,173,82,225,118,131,
+    234,39,181,85,170,178,18,127,86,203,207,109,247,171,63,237,
+    104,164,88,35,229,41,210,83,165,215,127,142,74,37,212,63,
+    187,231,222,241,216,51,142,233,110,61,227,227,59,247,220,57,
+    247,158,207,123,206,245,255,33,203,135,171,254,126,155,7,112,
+    31,137,72,164,146,104,204,248,165,170,191,116,245,151,25,99,
+    200,47,59,198,210,104,24,137,244,61,36,50,18,186,102,210,
+    64,215,120,179,245,41,131,208,231,140,249,52,230,32,227,89,
+    24,207,125,74,3,134,174,97,4,130,225,1,227,104,192,56,
+    69,225,30,26,107,17,169,11,40,226,252,6,119,141,198,173,
+    43,55,71,126,187,11,192,127,195,218,37,52,70,137,104,140,
+    206,161,9,74,164,238,9,176,90,88,225,24,43,50,0,185,
+    28,186,77,141,241,64,139,213,189,199,167,85,233,68,90,148,
+    94,75,199,68,73,142,211,13,84,241,186,191,125,19,192,251,
+    212,125,164,82,117,228,167,240,253,188,246,84,176,96,158,53,
+    134,66,89,42,139,162,181,25,68,116,1,125,70,141,70,24,
+    157,83,166,50,146,172,11,209,104,34,149,80,163,81,157,141,
+    195,138,0,193,42,82,114,66,118,194,96,221,25,141,198,147,
+    49,69,137,70,21,188,166,158,158,187,223,111,82,228,248,222,
+    204,180,122,53,157,218,155,152,204,164,101,85,146,7,50,211,
+    178,0,248,153,14,59,99,3,38,237,109,128,84,250,0,60,
+    189,139,86,5,207,59,142,57,199,138,16,90,22,66,37,161,
+    83,19,58,139,66,103,185,61,148,99,231,156,57,184,190,197,
+    235,180,201,132,53,101,114,136,216,136,85,34,89,116,173,246,
+    148,165,174,213,222,178,235,146,34,124,203,216,58,48,131,210,
+    109,41,110,48,8,220,139,137,56,172,48,66,203,45,184,131,
+    159,76,139,83,73,73,161,9,187,178,27,247,185,240,248,168,
+    129,152,233,108,96,209,130,219,129,185,236,2,128,153,116,231,
+    94,159,187,148,231,23,125,37,97,167,38,236,44,154,183,236,
+    105,228,142,50,185,243,19,238,128,163,26,202,92,51,69,86,
+    107,174,145,138,218,150,39,92,145,212,40,214,221,6,241,155,
+    8,108,160,74,11,89,88,217,215,54,55,93,20,66,100,25,
+    17,7,22,64,42,54,41,129,250,91,162,85,54,160,237,142,
+    70,111,76,197,146,6,134,168,86,110,197,32,136,231,243,84,
+    141,34,46,37,147,32,56,74,118,97,242,152,139,87,200,130,
+    100,214,4,189,24,241,166,161,118,243,170,208,52,23,174,160,
+    38,64,160,184,72,5,213,0,79,97,196,15,1,194,3,153,
+    168,185,95,14,18,121,154,94,9,30,137,198,24,137,197,62,
+    105,247,145,49,142,120,40,143,227,195,152,67,228,192,71,121,
+    221,99,202,242,68,44,126,85,138,83,13,19,16,133,245,146,
+    9,68,236,96,53,36,121,170,141,38,238,70,143,202,52,81,
+    159,206,94,77,168,10,216,88,66,81,36,5,36,215,98,74,
+    206,80,165,225,68,155,108,51,215,124,232,37,60,182,221,80,
+    98,123,16,59,75,121,83,7,252,184,114,112,25,86,101,93,
+    36,103,46,242,255,201,34,85,11,170,238,49,117,127,17,169,
+    2,131,154,124,68,90,100,236,190,52,3,95,213,89,31,145,
+    181,196,223,79,129,242,231,117,230,217,25,104,255,24,186,89,
+    75,4,255,241,111,131,222,56,67,212,223,96,163,208,249,100,
+    66,85,147,82,18,147,248,199,175,254,241,43,6,27,188,211,
+    8,90,201,196,184,206,78,169,137,164,238,62,123,108,248,244,
+    137,232,232,27,103,143,159,58,175,11,106,58,58,14,242,87,
+    116,38,145,82,117,65,81,163,147,106,98,82,210,29,208,82,
+    18,51,82,132,210,105,69,181,40,77,119,68,175,74,216,221,
+    102,130,13,138,51,186,95,134,49,74,6,97,189,125,199,35,
+    207,166,185,81,205,189,163,236,243,255,54,249,155,100,254,133,
+    252,213,146,119,135,230,221,177,206,80,158,157,95,251,90,231,
+    95,92,248,73,201,183,69,243,109,41,236,42,249,246,172,120,
+    7,151,189,131,143,110,60,222,89,242,158,208,188,39,214,57,
+    218,115,146,170,240,200,223,58,55,147,63,83,242,109,95,241,
+    238,91,246,238,123,20,120,52,82,242,30,209,188,71,214,29,
+    140,231,167,21,134,115,182,108,140,52,14,84,181,137,12,219,
+    24,71,173,81,212,174,197,89,58,139,10,86,42,117,205,211,
+    13,35,25,39,82,249,58,254,26,107,182,10,28,106,242,217,
+    48,19,155,106,221,134,84,119,125,68,31,146,57,28,187,103,
+    217,75,40,197,222,66,183,153,75,232,22,149,101,223,254,35,
+    204,228,179,80,98,69,202,110,15,7,208,44,151,229,10,66,
+    179,121,237,222,63,203,139,56,187,216,176,99,164,92,219,208,
+    11,72,97,111,209,198,172,20,186,4,189,176,159,194,120,181,
+    205,50,55,99,231,226,191,232,176,5,119,157,80,148,127,162,
+    6,45,114,113,213,240,252,15,81,18,109,180,26,100,229,200,
+    66,62,113,173,38,43,145,158,241,96,109,71,107,61,89,199,
+    5,148,218,6,242,236,172,207,160,118,89,218,207,89,218,61,
+    245,246,4,11,82,103,48,183,22,137,227,185,2,27,230,170,
+    245,216,116,209,160,85,172,9,181,223,130,255,183,180,146,165,
+    192,195,109,57,220,172,227,71,234,137,125,251,47,89,246,119,
+    16,71,108,118,94,147,183,125,190,223,161,7,204,172,224,180,
+    251,68,123,141,63,203,58,175,213,52,89,216,212,140,143,44,
+    219,160,69,238,33,223,184,102,155,188,132,198,204,179,106,187,
+    29,77,169,51,54,75,10,213,250,29,246,89,113,60,180,247,
+    80,232,199,201,207,38,137,154,25,102,5,224,175,145,130,223,
+    110,101,77,236,7,108,49,34,140,234,180,60,254,13,38,43,
+    99,254,191,167,6,94,135,104,42,72,183,19,16,91,211,215,
+    117,250,214,120,164,83,167,211,10,164,160,106,76,149,119,227,
+    145,56,117,148,113,234,168,7,226,56,172,70,39,228,244,100,
+    84,73,79,201,113,73,111,27,77,171,167,39,51,73,105,82,
+    74,169,146,120,74,150,211,178,206,166,51,82,74,103,101,136,
+    190,58,147,132,166,99,50,38,43,87,99,73,157,75,66,94,
+    164,200,216,240,117,199,185,11,198,240,150,55,99,201,41,201,
+    104,11,167,206,189,106,180,156,175,79,103,140,78,121,11,25,
+    30,79,79,102,18,73,73,231,33,169,202,36,68,93,152,140,
+    93,151,196,132,12,139,205,196,212,171,186,3,218,56,95,210,
+    185,91,114,66,133,31,113,106,50,163,232,14,89,202,36,99,
+    113,41,226,52,114,55,71,108,92,193,227,101,156,147,233,188,
+    177,69,232,45,6,107,132,16,53,161,179,98,76,141,85,19,
+    84,117,50,67,250,21,252,216,99,126,140,157,135,197,252,204,
+    180,218,183,29,220,247,10,96,149,111,104,146,137,122,124,115,
+    23,231,47,150,60,221,154,167,59,71,151,3,193,251,93,239,
+    117,229,199,75,129,173,90,96,107,142,175,208,140,243,185,213,
+    112,239,226,115,43,225,161,229,240,208,227,29,165,240,113,45,
+    124,60,119,38,119,230,233,170,175,23,50,45,231,115,117,80,
+    14,119,99,76,238,76,133,129,167,167,79,159,194,94,228,222,
+    84,116,109,173,208,130,39,184,26,12,231,119,21,196,82,112,
+    183,22,220,13,227,3,125,75,55,202,155,187,62,26,252,112,
+    240,131,131,139,7,231,79,194,91,129,62,130,32,96,29,131,
+    39,200,214,215,12,224,121,154,116,175,181,117,228,61,15,182,
+    229,39,62,216,189,184,59,239,209,218,182,47,109,95,110,219,
+    87,108,219,183,186,185,119,241,200,82,251,239,227,143,182,127,
+    118,253,225,245,165,201,165,73,45,114,184,180,249,136,182,249,
+    200,252,73,40,54,230,79,47,156,46,4,222,29,197,191,229,
+    205,91,230,255,163,226,64,237,47,60,253,78,64,193,174,7,
+    99,191,15,253,97,168,216,118,4,38,241,4,235,160,236,111,
+    159,103,129,3,79,208,224,219,233,201,185,230,92,243,55,74,
+    66,8,55,86,61,129,249,29,239,92,158,187,140,5,53,152,
+    143,173,182,117,230,95,48,89,47,92,92,154,40,181,29,208,
+    218,14,228,176,16,156,131,100,16,1,235,24,60,65,182,190,
+    102,192,16,194,70,92,139,161,128,114,103,95,177,99,63,220,
+    159,200,31,79,255,207,47,63,254,165,241,148,27,169,208,60,
+    104,198,223,186,224,122,112,124,113,248,163,115,31,158,91,58,
+    83,234,122,89,235,122,249,79,125,69,255,112,201,63,172,249,
+    135,161,129,149,183,179,112,178,20,140,104,65,156,131,7,14,
+    45,253,28,50,205,251,195,239,13,231,95,253,228,226,199,151,
+    31,237,47,245,31,212,250,15,150,186,14,150,218,135,180,246,
+    161,98,251,16,86,232,33,50,152,0,172,208,67,79,144,173,
+    175,25,168,42,180,177,251,107,88,101,75,254,96,97,172,228,
+    223,167,249,247,21,201,253,20,4,249,67,154,88,243,181,229,
+    92,202,187,96,242,159,111,57,230,66,95,184,220,199,58,153,
+    47,194,20,134,61,254,19,47,161,47,246,5,143,7,152,47,
+    57,55,180,191,12,176,199,131,142,47,131,12,110,135,40,220,
+    14,31,11,193,195,159,95,234,62,217,198,252,165,149,194,240,
+    64,223,169,126,230,175,253,236,169,136,227,175,123,40,128,127,
+    115,29,99,70,182,163,191,123,119,143,112,204,223,135,220,208,
+    254,138,99,71,156,142,175,156,184,255,43,55,133,219,158,16,
+    110,111,111,25,121,137,249,234,69,10,160,45,35,175,101,95,
+    111,33,163,108,16,81,18,205,82,170,37,195,21,33,215,170,
+    231,228,176,119,49,240,204,88,158,217,7,28,84,185,181,188,
+    234,33,215,172,206,141,240,70,22,60,179,253,236,129,232,185,
+    55,79,157,63,127,250,228,169,232,207,46,69,47,156,123,227,
+    252,137,83,61,56,191,197,101,97,15,137,58,135,122,102,28,
+    61,184,46,217,131,27,102,105,162,179,19,16,237,34,156,206,
+    40,211,138,206,101,100,200,134,73,224,52,194,33,175,168,16,
+    183,228,106,69,42,255,12,199,27,107,77,202,67,216,131,44,
+    123,166,221,30,155,140,94,17,143,190,132,72,37,35,180,230,
+    90,240,245,181,224,169,208,148,103,144,212,167,88,179,216,184,
+    225,113,107,255,199,155,235,143,4,172,5,218,23,58,43,14,
+    214,217,178,142,0,60,193,160,98,7,36,245,29,141,8,50,
+    222,161,101,188,145,202,120,167,36,245,149,238,198,155,75,34,
+    62,41,169,87,211,162,177,201,156,197,224,2,128,207,144,81,
+    84,146,106,108,179,9,94,196,11,190,76,22,108,45,99,67,
+    184,110,173,2,1,241,173,224,104,28,204,15,96,157,129,199,
+    123,111,25,29,254,94,174,189,130,106,96,132,114,224,81,27,
+    129,49,51,158,175,121,57,107,84,155,246,114,182,122,192,196,
+    65,233,74,225,50,150,148,174,110,44,240,211,213,179,25,155,
+    9,214,14,82,190,36,180,18,200,90,185,170,150,36,191,110,
+    132,207,40,192,40,145,182,155,222,44,149,165,10,108,179,177,
+    246,68,75,100,110,226,89,107,5,129,181,124,148,189,170,231,
+    89,239,165,128,107,120,207,81,163,131,13,157,29,213,131,77,
+    109,92,231,38,98,73,69,194,37,183,42,79,73,58,51,13,
+    70,45,64,38,96,156,238,200,88,163,186,67,74,221,76,200,
+    233,148,206,192,158,142,147,131,91,248,60,44,125,19,12,59,
+    1,214,141,53,161,115,196,71,204,147,23,183,137,140,222,132,
+    148,194,98,240,70,229,30,180,10,190,86,184,203,128,82,126,
+    142,136,185,119,132,161,98,119,175,118,132,23,102,238,223,121,
+    239,78,113,251,145,199,183,74,29,195,90,199,112,206,93,14,
+    245,173,132,118,45,135,118,149,66,123,180,208,158,71,190,98,
+    232,40,140,246,148,119,238,121,232,41,6,143,190,127,249,221,
+    232,66,116,62,250,120,63,244,18,167,49,42,60,171,208,107,
+    10,126,157,40,56,75,91,79,147,110,34,185,213,26,109,178,
+    52,68,20,234,65,67,21,247,107,80,100,150,153,176,189,153,
+    165,15,155,34,167,71,103,58,123,98,73,156,93,77,247,76,
+    164,167,82,98,79,34,213,99,158,4,130,160,176,159,232,222,
+    99,170,42,39,198,167,84,35,135,138,176,70,156,24,38,98,
+    7,37,144,20,8,103,52,10,139,140,180,198,136,27,45,49,
+    81,52,79,218,58,108,210,172,35,110,227,215,14,27,242,116,
+    181,206,139,11,201,162,171,23,238,213,214,158,194,112,113,107,
+    245,46,181,142,104,173,35,69,247,200,218,214,157,75,125,5,
+    31,150,59,164,65,66,119,145,220,70,132,176,201,142,55,101,
+    183,72,17,217,81,54,217,81,50,141,249,183,73,133,170,87,
+    103,111,209,184,126,133,188,221,82,73,203,67,170,133,126,61,
+    142,55,119,147,198,186,65,238,180,186,70,129,255,119,222,129,
+    74,171,249,140,14,212,228,179,161,82,161,140,106,117,150,87,
+    253,22,42,181,179,158,66,75,83,42,148,106,169,84,178,156,
+    157,102,150,127,72,55,214,113,86,25,22,44,213,126,253,211,
+    80,11,58,162,158,122,27,108,144,25,157,113,153,222,53,144,
+    153,198,71,186,36,245,230,147,105,35,157,78,40,144,51,199,
+    175,199,174,72,17,47,49,72,57,134,1,246,122,249,56,194,
+    251,19,41,58,20,121,28,85,163,191,46,140,199,20,9,83,
+    177,84,28,126,37,35,197,141,130,195,160,76,14,27,117,246,
+    186,4,123,162,219,232,138,226,221,68,130,173,134,4,8,97,
+    98,42,73,142,77,171,211,64,26,15,177,133,216,61,49,119,
+    249,58,33,128,233,42,56,100,216,243,121,231,68,34,37,70,
+    49,114,102,147,205,248,107,253,119,96,152,242,24,25,182,223,
+    150,223,191,120,184,232,218,1,119,185,173,99,126,255,90,168,
+    107,209,93,248,79,45,52,240,142,39,231,152,111,95,115,249,
+    230,112,14,235,220,243,224,252,226,197,143,126,241,225,47,150,
+    134,75,221,251,181,238,253,164,19,222,89,56,116,255,232,123,
+    71,11,47,151,218,118,107,109,187,115,39,191,14,118,44,92,
+    92,9,246,47,7,251,11,87,74,193,1,45,56,240,232,249,
+    229,224,209,92,203,170,47,52,119,103,197,55,176,236,27,40,
+    7,194,159,12,60,106,47,245,14,106,189,131,127,58,84,97,
+    144,127,239,58,162,253,176,19,3,200,177,176,23,118,111,93,
+    124,109,165,235,249,229,174,231,75,93,123,181,174,189,57,86,
+    19,194,36,79,51,54,57,114,168,205,55,219,157,229,43,24,
+    224,122,91,126,3,131,250,110,124,209,4,55,176,12,78,35,
+    251,110,204,114,175,80,176,245,215,161,155,229,246,225,102,21,
+    184,253,120,255,125,6,48,102,193,180,109,59,111,45,152,254,
+    47,106,60,46,107,56,66,178,253,13,17,163,72,106,71,227,
+    29,241,95,57,61,62,45,110,76,225,108,59,226,54,66,139,
+    159,165,179,244,51,156,24,93,171,29,167,212,93,181,177,244,
+    183,30,26,52,254,65,68,254,26,233,134,102,196,101,8,153,
+    168,0,167,116,186,19,146,164,152,81,150,242,137,148,34,201,
+    42,113,36,157,7,147,191,157,80,117,65,150,174,128,31,129,
+    99,16,71,194,25,148,222,106,56,102,44,153,140,74,147,227,
+    146,40,74,34,56,168,96,238,16,132,176,76,98,184,241,151,
+    146,121,138,10,244,85,120,73,206,194,211,2,70,43,136,212,
+    175,190,205,239,220,153,187,115,119,100,45,16,214,2,125,119,
+    207,148,89,239,221,51,248,90,99,29,247,206,174,176,161,101,
+    54,148,15,228,71,74,108,191,198,246,23,217,254,53,135,79,
+    115,64,90,198,112,123,203,66,48,231,193,215,154,224,253,173,
+    239,55,190,188,176,232,213,66,207,151,132,1,77,24,40,10,
+    3,223,241,136,235,40,177,33,141,13,21,205,219,248,103,196,
+    69,194,128,238,169,157,22,15,196,198,227,186,183,254,136,207,
+    142,229,33,84,141,42,58,131,209,252,107,245,40,97,100,143,
+    68,158,152,163,6,107,254,94,56,108,108,102,63,149,223,70,
+    198,95,64,202,10,0,72,117,41,170,50,8,181,80,17,249,
+    141,187,140,218,139,230,93,70,193,162,121,151,145,247,46,185,
+    202,200,121,151,92,21,222,73,133,43,104,35,152,191,180,112,
+    25,106,186,117,220,126,82,71,245,12,81,144,121,110,4,235,
+    24,60,169,247,221,161,186,41,112,148,141,96,29,131,39,245,
+    190,87,41,47,166,189,17,16,198,255,9,112,97,74,202,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/importer.py",
+    "importer",
+    embedded_module_data,
+    3711,
+    7671);
+
+} // anonymous namespace
+} // namespace gem5
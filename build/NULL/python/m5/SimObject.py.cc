@@ -0,0 +1,1569 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,188,189,107,116,27,215,153,32,88,133,103,1,40,60,
+    136,7,9,190,65,18,124,128,79,81,18,45,137,122,216,50,
+    41,89,146,101,202,137,100,39,102,226,48,16,11,148,32,147,
+    0,83,0,101,137,6,29,37,237,238,64,62,236,14,172,86,
+    90,112,34,77,144,140,156,208,29,121,90,61,155,204,40,189,
+    233,211,78,186,103,166,103,166,119,23,133,169,28,226,96,150,
+    123,52,59,71,179,211,189,127,168,118,60,71,235,253,177,123,
+    191,123,11,133,170,2,72,51,238,158,161,74,23,245,184,85,
+    247,214,173,239,126,239,239,187,255,153,82,252,25,165,223,143,
+    198,117,20,117,139,226,40,142,158,167,166,201,47,61,77,163,
+    95,221,188,110,65,63,173,167,225,156,126,222,176,96,156,54,
+    46,152,166,77,11,230,105,51,77,234,49,211,12,250,53,204,
+    91,22,172,211,86,124,206,56,111,91,96,167,89,188,111,154,
+    183,159,131,95,243,188,125,193,49,237,88,112,78,59,23,92,
+    211,174,133,186,233,186,5,247,180,91,170,227,193,117,152,121,
+    207,130,119,218,43,157,243,157,35,191,245,231,168,40,21,110,
+    64,255,253,156,37,220,200,81,225,38,244,219,28,165,166,91,
+    56,235,91,212,116,43,218,107,227,108,104,175,29,237,5,56,
+    22,237,117,112,118,84,118,234,168,231,40,206,241,22,197,57,
+    127,132,222,239,39,186,242,107,79,119,113,46,116,61,136,175,
+    215,161,235,238,72,247,143,244,168,134,94,174,209,195,121,80,
+    141,94,206,139,202,62,92,207,135,234,213,107,158,19,194,87,
+    26,208,21,127,164,95,243,132,1,124,173,17,93,107,210,220,
+    53,136,175,52,163,43,45,145,158,123,173,154,251,134,184,54,
+    212,230,48,215,142,202,17,46,128,202,93,92,7,42,71,185,
+    78,84,238,230,186,80,185,135,11,162,114,47,215,141,251,216,
+    131,202,49,174,23,149,79,37,135,43,31,55,183,143,170,241,
+    247,35,244,255,39,242,209,244,254,228,174,223,242,142,3,92,
+    31,106,105,252,2,197,133,126,72,79,31,228,232,179,84,168,
+    255,111,225,210,84,136,46,25,95,231,195,139,137,144,190,196,
+    30,95,138,205,38,163,241,216,185,171,139,145,146,245,133,72,
+    242,98,156,147,246,227,220,210,124,4,246,209,13,142,11,145,
+    133,177,153,217,104,50,12,149,19,240,136,197,171,115,92,18,
+    237,208,253,33,99,201,242,98,152,15,47,76,70,18,179,37,
+    195,139,113,62,89,114,158,141,46,156,57,127,41,50,155,124,
+    25,253,143,243,37,39,249,173,212,179,71,19,83,75,243,243,
+    47,198,163,177,100,132,71,15,50,71,19,139,124,252,202,213,
+    227,179,58,197,123,233,165,255,31,193,11,126,139,190,69,165,
+    168,235,244,156,110,69,151,84,84,202,209,181,134,36,165,251,
+    17,58,255,19,249,218,138,62,165,191,54,146,166,231,104,142,
+    126,139,73,81,151,228,118,114,250,90,247,171,135,116,82,115,
+    12,79,83,246,33,165,59,4,165,30,13,180,110,106,86,217,
+    33,19,250,239,129,87,152,68,197,119,208,43,92,64,47,241,
+    106,203,151,81,243,43,52,122,17,90,249,144,75,242,209,117,
+    189,26,34,255,164,41,69,191,163,91,109,61,75,189,143,154,
+    40,89,163,137,196,210,249,217,249,112,34,129,62,70,18,190,
+    147,161,164,27,222,133,14,98,225,133,8,250,225,208,48,243,
+    94,116,103,194,128,138,64,32,112,237,147,166,4,63,59,178,
+    120,21,125,229,216,200,194,216,136,252,145,134,23,175,126,98,
+    61,52,31,77,36,103,227,11,139,71,150,187,102,22,225,67,
+    37,102,226,115,51,240,232,225,67,243,241,217,240,124,226,200,
+    112,165,210,239,195,147,159,70,197,147,107,212,38,101,168,179,
+    86,138,255,228,106,201,24,51,75,27,206,198,108,247,237,129,
+    220,146,224,28,18,157,67,155,102,116,169,200,214,109,234,85,
+    149,63,130,151,67,125,247,105,218,156,153,13,207,94,140,148,
+    244,23,34,201,146,89,186,86,50,70,147,145,133,4,170,173,
+    159,157,79,224,151,43,233,95,139,92,45,25,225,157,19,228,
+    69,191,26,8,240,126,184,226,212,60,145,239,132,97,133,110,
+    207,147,110,23,109,142,140,49,61,120,109,98,131,237,88,103,
+    187,11,108,119,110,86,96,251,69,182,255,218,177,162,153,189,
+    182,178,169,83,117,21,23,15,3,93,119,109,235,129,209,66,
+    96,84,8,236,17,3,123,54,141,232,236,99,184,244,27,40,
+    210,198,77,43,213,51,240,107,166,53,59,43,48,157,69,155,
+    235,218,105,190,9,53,168,2,10,232,41,134,235,63,160,0,
+    169,239,0,154,41,13,52,211,41,250,90,95,210,88,169,129,
+    160,26,213,186,36,195,178,22,98,171,239,87,193,47,133,225,
+    151,174,134,95,104,98,79,25,126,159,167,104,10,38,225,171,
+    205,43,180,10,114,233,164,98,218,106,32,183,33,69,191,76,
+    221,162,105,106,181,133,163,16,252,210,83,4,128,163,177,68,
+    50,28,155,141,148,236,8,243,132,101,104,12,233,120,31,124,
+    63,195,249,112,34,146,128,199,72,95,244,19,203,161,11,145,
+    88,228,202,34,127,100,185,99,38,17,93,136,227,250,51,11,
+    124,92,1,161,229,42,255,4,190,244,49,84,252,87,244,15,
+    96,84,231,181,226,162,232,107,252,224,212,253,228,159,191,42,
+    12,62,47,14,62,191,169,135,115,172,11,255,86,106,105,10,
+    252,9,17,224,121,213,237,18,40,229,91,160,191,198,228,210,
+    226,124,4,1,43,190,48,131,94,163,29,78,235,209,145,242,
+    45,74,14,245,35,120,32,7,223,131,206,190,130,138,107,212,
+    134,181,109,221,218,89,176,118,230,246,8,214,94,209,218,123,
+    109,162,104,182,94,123,99,195,225,81,188,67,107,224,246,151,
+    112,143,31,195,225,111,40,178,231,132,61,167,53,173,223,52,
+    81,221,125,191,102,90,178,103,5,166,3,193,249,181,83,213,
+    48,40,227,214,44,245,15,128,193,33,9,238,254,97,216,116,
+    199,208,40,99,211,36,238,52,198,165,99,159,134,75,147,6,
+    69,71,212,176,217,142,26,54,215,190,75,253,178,115,58,132,
+    125,159,58,75,241,110,10,0,129,239,65,63,24,3,241,189,
+    80,192,71,12,233,49,224,242,245,80,52,160,34,1,67,17,
+    144,190,59,223,136,138,229,110,197,199,39,232,169,22,114,253,
+    0,110,126,129,162,48,220,26,220,214,74,161,198,173,239,173,
+    8,206,49,209,57,134,112,171,219,90,180,187,191,51,149,27,
+    187,123,80,240,142,136,222,145,60,187,11,161,90,229,189,101,
+    24,110,168,234,131,2,140,249,86,40,218,160,166,4,192,38,
+    82,71,5,195,117,85,143,224,1,71,252,49,244,251,139,184,
+    223,27,246,224,186,189,175,96,239,91,243,8,246,33,209,62,
+    116,237,120,209,108,191,246,38,194,169,82,119,106,97,82,55,
+    96,82,55,96,82,183,53,109,66,152,180,111,248,215,76,123,
+    78,47,48,193,162,173,238,218,11,159,138,73,83,212,55,218,
+    84,96,160,249,140,9,103,82,191,245,85,94,199,233,206,82,
+    74,172,154,162,146,166,173,128,135,103,57,61,192,190,22,154,
+    207,162,115,115,0,187,134,229,201,115,23,35,1,50,78,137,
+    64,56,32,227,184,33,32,72,92,0,15,93,224,114,120,126,
+    41,18,152,141,199,146,124,244,252,82,50,146,8,36,227,129,
+    185,104,140,155,9,207,207,247,133,134,167,48,204,85,33,101,
+    60,13,118,81,242,52,240,104,81,178,250,221,238,215,97,6,
+    194,91,6,97,154,119,144,143,140,145,45,125,89,249,125,9,
+    172,118,146,79,59,179,16,78,34,232,168,9,168,255,51,12,
+    105,55,254,224,121,231,1,178,101,194,31,216,239,135,133,190,
+    253,98,223,126,56,164,229,43,18,0,242,78,104,2,90,199,
+    179,168,100,128,199,189,143,152,74,60,16,9,232,177,140,42,
+    85,61,224,199,209,201,127,1,77,158,193,77,62,4,34,125,
+    199,156,51,190,235,184,237,184,182,242,193,208,3,163,208,127,
+    68,236,63,114,109,165,232,172,75,243,27,230,186,76,247,29,
+    175,96,110,19,205,109,155,20,109,28,47,226,126,100,199,80,
+    33,56,15,136,232,136,57,128,120,146,244,254,107,103,8,104,
+    41,198,152,42,127,232,143,122,240,32,71,40,144,182,166,117,
+    28,61,173,231,116,136,191,54,112,102,206,240,22,61,109,228,
+    140,232,200,196,153,208,39,103,208,212,56,187,116,62,201,71,
+    48,243,124,50,198,69,174,132,157,232,149,148,128,80,249,182,
+    120,55,17,56,31,153,143,191,174,132,143,65,116,97,30,1,
+    200,249,171,129,200,229,8,127,213,138,176,72,229,106,0,243,
+    125,129,228,197,200,213,64,152,143,4,250,226,60,186,33,206,
+    43,225,41,49,136,47,113,17,84,151,71,79,10,39,66,129,
+    112,12,63,167,76,119,3,241,185,225,64,224,24,154,250,82,
+    207,2,209,68,128,143,204,69,248,8,92,157,141,47,33,222,
+    156,11,32,58,141,142,162,201,192,66,248,42,234,41,170,129,
+    238,8,159,159,143,224,135,157,143,39,47,162,135,163,206,207,
+    94,140,206,163,118,98,208,22,244,77,130,235,248,92,32,30,
+    67,63,124,96,33,142,58,36,33,61,21,151,111,165,164,57,
+    188,74,107,41,81,138,154,145,33,56,10,71,58,213,145,60,
+    151,83,116,78,129,228,43,127,90,186,243,234,205,21,93,74,
+    151,162,151,104,126,52,69,229,140,181,238,73,218,21,251,78,
+    69,95,52,18,133,250,40,165,155,163,213,248,129,166,146,117,
+    159,229,73,168,151,207,96,146,166,95,49,108,213,199,148,33,
+    233,81,62,239,146,181,188,159,179,213,172,175,223,174,69,109,
+    191,87,143,174,126,7,88,53,30,166,118,136,45,185,102,0,
+    160,103,128,181,226,177,12,88,178,42,246,153,25,9,176,17,
+    239,147,64,226,95,132,43,217,64,250,136,196,184,112,12,157,
+    213,135,57,14,19,200,146,1,243,225,64,41,240,84,70,245,
+    9,172,98,202,131,4,73,67,34,50,63,87,50,240,241,120,
+    178,164,71,15,197,164,180,100,64,44,126,34,1,195,0,0,
+    39,161,6,102,102,38,26,139,38,103,102,150,155,170,38,220,
+    112,249,218,191,66,53,19,127,73,97,122,212,212,159,54,172,
+    58,139,254,38,244,99,47,54,52,162,31,182,232,105,88,247,
+    116,21,60,93,130,167,91,244,116,35,178,100,121,142,38,101,
+    122,162,232,116,103,131,233,175,167,191,94,116,121,111,49,55,
+    152,59,109,31,24,214,206,190,111,185,103,17,26,119,139,141,
+    187,239,159,189,127,92,112,29,20,93,7,243,174,131,27,237,
+    187,126,230,189,63,251,167,141,63,109,20,218,15,138,237,7,
+    17,186,177,195,179,160,124,199,134,104,118,82,122,76,214,123,
+    231,205,181,217,123,175,253,73,252,143,227,15,34,194,240,164,
+    56,60,41,180,31,19,219,143,9,174,227,162,235,120,30,111,
+    155,122,124,187,185,210,33,140,159,254,22,62,217,172,18,210,
+    129,58,225,185,243,191,82,152,254,209,8,122,194,0,55,151,
+    228,42,91,112,115,134,168,230,187,175,24,83,58,116,119,207,
+    138,41,101,204,233,106,222,99,226,52,48,158,210,47,195,157,
+    230,148,153,55,165,204,41,99,202,4,156,219,106,23,236,29,
+    166,86,123,149,18,73,237,25,154,50,112,213,240,119,30,11,
+    10,186,41,94,135,1,131,127,6,62,185,53,17,73,114,145,
+    185,240,210,124,146,176,42,71,225,172,126,49,190,24,98,248,
+    227,112,226,36,6,23,4,56,72,84,196,232,139,15,96,48,
+    147,224,147,63,1,71,116,44,193,148,97,73,102,206,38,80,
+    177,236,171,134,36,4,186,255,27,0,81,6,3,17,130,151,
+    77,138,177,244,225,2,65,72,125,211,205,133,245,250,225,66,
+    253,240,90,226,254,179,66,253,62,177,126,95,250,185,98,67,
+    243,38,101,180,119,227,34,163,47,122,155,111,61,127,227,249,
+    156,62,247,57,193,219,43,122,123,215,186,17,135,150,161,139,
+    30,239,38,165,175,235,46,118,5,51,207,101,39,222,57,157,
+    57,253,208,143,120,157,44,155,101,145,60,178,122,122,157,109,
+    41,176,136,133,207,5,5,182,87,100,123,243,120,219,172,43,
+    119,128,80,44,229,135,146,129,225,87,4,24,62,29,8,52,
+    76,2,32,199,107,99,106,6,72,241,1,183,120,134,22,40,
+    128,58,222,211,232,47,48,218,85,244,39,69,3,160,36,45,
+    138,231,104,144,34,48,80,53,88,31,120,34,102,125,250,165,
+    119,204,213,234,84,21,75,134,81,25,98,50,12,139,225,228,
+    69,80,92,197,21,140,198,39,204,161,249,240,194,121,46,124,
+    100,185,175,26,6,128,70,43,153,31,82,243,33,186,47,1,
+    76,204,53,234,193,209,191,56,254,103,199,127,126,226,23,39,
+    174,81,132,199,161,49,224,33,192,5,16,37,226,161,137,160,
+    70,12,202,60,40,241,144,184,128,129,22,171,49,140,115,8,
+    92,57,149,192,80,50,64,195,203,245,181,59,84,130,230,47,
+    224,230,17,98,185,201,174,187,2,5,87,32,231,19,92,189,
+    162,171,55,109,44,218,92,233,195,31,155,40,95,51,92,182,
+    175,187,58,10,174,142,92,247,154,91,112,13,138,174,193,252,
+    238,73,180,33,9,210,231,64,114,163,207,241,27,40,210,199,
+    144,220,216,213,151,158,92,61,157,245,9,108,251,134,211,147,
+    57,118,253,141,213,55,242,76,19,126,175,41,244,98,207,67,
+    215,205,128,127,65,233,50,51,83,178,34,129,23,107,11,209,
+    62,59,51,243,181,165,240,188,116,5,137,194,92,124,118,102,
+    134,63,69,73,83,140,255,50,20,240,77,241,243,200,220,59,
+    84,46,254,2,222,233,44,126,167,242,191,77,157,222,248,52,
+    154,38,168,176,50,70,192,133,138,210,107,49,162,153,160,46,
+    234,45,198,102,216,211,22,164,61,104,69,53,99,0,19,224,
+    25,147,222,22,154,56,205,60,89,28,82,137,17,180,82,194,
+    84,10,12,73,70,177,111,85,236,179,149,253,57,163,122,166,
+    96,161,183,68,207,160,65,182,34,70,141,79,38,94,143,38,
+    47,18,129,19,154,225,97,118,242,208,72,201,134,25,193,5,
+    172,183,229,65,63,131,216,121,0,60,254,0,140,164,82,96,
+    99,23,151,206,207,71,103,9,189,229,35,232,212,127,129,42,
+    251,8,0,217,28,223,62,242,246,145,108,151,96,107,19,109,
+    136,83,214,177,166,247,250,139,140,253,59,236,157,75,31,244,
+    255,236,181,127,181,55,239,60,241,88,175,235,50,33,56,233,
+    50,161,10,70,83,53,191,92,102,60,62,250,103,168,248,150,
+    130,99,142,232,35,134,242,63,29,21,49,106,71,115,78,23,
+    49,145,127,156,238,182,117,218,204,233,35,76,148,158,182,164,
+    145,24,133,56,108,102,218,138,247,140,104,207,198,153,16,175,
+    205,114,102,84,218,57,6,149,14,206,130,74,39,182,51,184,
+    176,141,161,14,219,23,220,216,190,224,1,219,194,180,151,115,
+    162,210,135,45,10,245,96,77,152,110,224,220,168,244,167,169,
+    43,244,116,35,26,113,15,22,227,167,66,214,18,19,62,159,
+    72,242,225,217,100,201,50,123,229,202,12,81,177,50,176,155,
+    196,154,113,216,187,24,9,115,17,30,143,56,185,4,170,170,
+    146,19,246,34,87,208,205,248,56,129,62,15,62,177,136,38,
+    126,162,84,7,7,68,156,41,159,242,224,167,70,22,22,231,
+    195,201,136,172,227,68,146,206,236,107,42,26,15,10,10,12,
+    164,128,252,64,133,172,214,150,92,166,19,142,83,8,68,83,
+    244,247,16,234,189,163,87,163,190,111,210,81,106,5,209,250,
+    21,227,5,10,81,118,125,109,36,94,197,39,191,132,57,80,
+    243,10,99,65,84,191,54,55,160,82,156,48,156,6,225,171,
+    63,49,77,197,92,93,170,233,16,164,120,61,77,189,66,197,
+    12,175,83,87,244,175,80,175,211,73,5,231,138,120,9,70,
+    35,109,155,82,76,202,144,50,99,254,226,69,180,111,148,246,
+    95,230,12,41,227,101,154,71,98,88,202,200,25,224,28,103,
+    34,103,144,92,108,228,48,71,194,153,241,25,83,10,93,225,
+    240,125,49,23,236,93,209,93,209,53,86,90,53,45,35,222,
+    127,86,63,139,181,249,28,163,120,10,131,207,88,20,103,44,
+    88,71,101,68,252,139,21,147,50,133,212,160,30,205,156,98,
+    156,20,111,136,190,34,34,137,134,31,161,47,253,19,249,107,
+    175,88,56,27,106,131,226,173,41,139,74,14,194,228,50,101,
+    65,160,202,78,45,91,43,162,224,178,43,16,158,71,34,25,
+    119,53,176,200,71,18,145,88,18,80,243,226,213,243,136,70,
+    240,64,31,142,243,160,238,230,23,160,136,65,17,167,0,115,
+    16,76,48,195,69,103,147,4,115,48,37,43,18,73,39,0,
+    220,17,67,14,10,160,146,41,188,184,136,152,248,146,249,66,
+    36,25,78,38,249,146,227,104,82,210,81,28,227,249,56,143,
+    241,72,201,152,88,66,76,61,32,251,88,228,245,153,153,144,
+    173,100,88,152,157,79,148,12,196,16,65,166,130,1,26,66,
+    115,101,62,129,155,44,89,21,205,227,174,5,224,81,122,116,
+    150,40,157,44,51,100,230,205,204,36,0,42,2,242,223,53,
+    66,51,174,82,192,175,169,244,198,195,82,7,76,52,240,107,
+    52,81,241,59,61,119,198,243,206,110,105,235,61,117,127,18,
+    21,100,19,156,221,34,62,189,105,165,188,245,105,166,232,107,
+    72,91,139,245,254,180,173,232,111,249,190,245,187,214,119,217,
+    219,236,38,101,181,244,224,226,250,137,244,68,198,131,232,145,
+    221,87,116,53,175,187,58,11,174,206,247,246,173,237,185,111,
+    21,186,14,138,93,7,5,215,33,209,117,40,143,183,39,27,
+    158,14,96,253,125,149,2,81,225,140,1,184,122,223,147,39,
+    79,16,93,118,181,100,39,114,30,210,7,196,224,219,123,138,
+    129,174,12,147,245,188,99,207,216,129,10,247,100,172,217,61,
+    239,56,51,206,162,205,151,157,206,219,122,209,86,236,238,79,
+    159,202,44,11,108,103,209,214,146,59,149,183,13,163,173,56,
+    56,156,62,149,111,232,19,216,80,209,230,207,89,243,182,126,
+    180,21,251,246,160,170,43,2,219,157,103,187,31,178,245,153,
+    149,60,222,21,217,238,181,102,129,221,75,142,208,229,162,173,
+    45,119,41,111,219,133,182,226,240,46,120,82,191,192,14,20,
+    109,129,53,244,164,221,104,43,238,218,13,103,7,5,118,168,
+    216,57,152,102,50,173,2,211,190,225,240,92,191,176,122,225,
+    219,241,183,227,89,46,55,185,214,125,223,47,56,198,69,199,
+    120,90,95,180,213,101,80,127,219,209,86,108,239,252,253,83,
+    153,164,192,182,32,89,42,109,77,128,52,252,243,174,163,173,
+    186,95,182,90,143,246,27,127,25,162,81,89,27,211,237,54,
+    17,76,167,212,104,105,102,213,22,204,40,154,83,122,181,185,
+    150,86,105,244,212,79,81,234,16,182,173,101,216,81,45,227,
+    142,106,153,118,84,203,188,163,90,204,142,106,201,108,54,162,
+    18,212,140,85,117,36,99,221,164,159,82,222,35,227,51,78,
+    135,228,73,144,12,71,87,140,201,86,69,29,99,178,77,209,
+    166,26,91,3,94,212,3,54,69,247,162,189,215,240,248,241,
+    206,100,71,229,14,206,160,166,17,223,164,87,119,39,187,20,
+    207,215,8,4,156,78,122,10,147,210,113,10,172,29,51,37,
+    131,149,187,86,76,170,62,154,182,233,227,239,33,106,64,205,
+    120,42,117,43,162,142,82,236,153,241,42,106,24,20,53,12,
+    53,107,24,21,53,140,53,107,152,20,53,76,53,107,152,21,
+    53,204,53,107,48,138,26,76,205,26,22,69,13,75,117,13,
+    68,45,77,21,72,136,153,57,74,57,22,136,130,82,151,124,
+    229,35,68,143,62,135,40,168,242,12,205,251,148,199,156,73,
+    65,69,149,231,49,173,85,159,169,212,68,252,10,115,71,167,
+    186,138,169,42,103,213,180,229,230,140,225,250,228,136,124,35,
+    133,168,100,149,182,77,121,79,78,1,203,149,191,42,46,231,
+    81,153,203,81,193,12,147,220,173,184,71,13,51,13,72,68,
+    104,170,245,236,106,142,133,166,86,71,53,207,125,106,219,231,
+    182,236,248,185,175,106,158,59,190,229,115,159,66,207,85,204,
+    0,229,93,151,218,229,123,84,243,12,143,137,101,197,10,45,
+    207,4,228,250,22,116,212,81,185,91,9,221,18,39,182,150,
+    2,24,233,44,159,69,80,211,133,90,87,204,104,245,91,41,
+    235,166,20,80,161,197,222,171,98,242,164,226,78,50,34,218,
+    58,255,5,52,70,136,55,58,142,85,70,88,74,93,30,150,
+    121,131,68,128,139,7,98,241,100,0,241,42,192,123,7,22,
+    150,230,147,209,197,249,72,32,26,187,24,225,163,88,31,126,
+    14,51,66,252,69,184,85,23,232,231,163,112,4,26,139,229,
+    254,169,120,128,240,252,88,47,31,72,44,70,102,163,115,209,
+    8,135,181,238,114,43,227,129,238,68,168,155,191,2,247,129,
+    200,91,178,224,102,48,147,3,223,171,100,154,33,140,191,123,
+    134,139,32,110,109,22,177,253,92,217,126,6,166,106,36,75,
+    95,228,37,157,40,98,129,176,70,157,143,196,208,105,184,111,
+    134,143,204,37,74,246,25,162,191,79,70,225,110,36,113,99,
+    85,231,44,226,221,34,28,111,38,15,145,93,117,136,212,216,
+    139,251,2,250,3,204,182,149,244,243,232,153,38,162,20,43,
+    25,137,240,2,86,62,196,60,242,9,168,107,139,197,39,174,
+    92,57,129,223,184,100,120,61,204,199,48,67,200,91,201,227,
+    129,205,194,189,230,109,248,201,228,4,118,252,153,148,223,11,
+    251,250,148,60,51,136,119,148,196,158,243,87,201,171,149,24,
+    84,159,92,54,199,231,185,41,96,19,205,232,20,222,177,227,
+    215,121,45,114,245,245,56,207,37,208,235,37,34,242,97,201,
+    156,32,140,104,136,197,92,34,255,6,20,41,40,86,240,240,
+    158,63,23,79,134,231,75,244,44,223,71,73,60,37,127,13,
+    174,64,139,88,95,129,27,130,110,240,223,64,231,19,32,134,
+    7,170,152,75,248,118,203,245,90,230,146,168,148,135,128,187,
+    52,235,49,119,137,216,56,139,227,186,121,213,188,206,248,11,
+    140,63,235,205,46,229,56,129,25,16,153,129,60,51,240,177,
+    149,106,8,188,243,218,205,215,210,250,85,219,134,175,237,157,
+    47,221,252,18,218,181,126,204,82,157,3,63,104,190,219,156,
+    214,139,76,27,122,134,162,86,99,231,187,205,183,209,133,85,
+    199,134,191,227,93,219,109,27,218,181,43,206,22,91,58,224,
+    174,198,98,115,0,126,253,143,26,123,225,52,226,96,221,158,
+    180,169,88,87,191,73,153,44,110,92,164,143,130,145,184,227,
+    206,171,130,115,64,116,14,0,19,218,82,116,213,103,59,222,
+    177,101,76,69,167,47,75,191,189,156,94,222,168,111,47,122,
+    39,145,104,223,224,70,162,125,3,186,85,87,231,222,212,83,
+    174,166,143,93,84,75,123,118,233,221,241,219,227,107,244,119,
+    143,100,143,164,151,50,159,91,189,146,190,242,193,229,180,1,
+    189,3,226,41,185,59,47,8,182,126,209,214,191,73,177,150,
+    86,196,53,167,39,86,79,22,59,186,239,194,206,243,34,219,
+    86,12,4,239,218,208,254,41,145,109,45,14,238,18,7,39,
+    210,19,34,219,41,34,86,85,89,43,216,119,247,12,218,159,
+    18,217,142,98,87,239,221,35,104,255,5,145,13,40,207,63,
+    236,232,78,79,162,186,121,182,237,33,105,7,49,201,172,59,
+    115,246,230,76,222,22,68,91,209,217,148,235,186,59,146,119,
+    142,162,173,56,178,251,222,215,31,92,22,71,142,103,244,55,
+    157,57,155,224,26,124,56,180,235,222,204,131,47,137,67,39,
+    243,253,47,144,13,61,229,76,246,148,192,246,62,116,54,231,
+    246,220,125,58,239,220,141,182,135,109,157,25,219,134,203,155,
+    247,29,253,112,175,224,58,33,186,78,228,93,39,54,221,84,
+    99,203,109,231,186,127,168,224,31,18,252,35,162,127,100,147,
+    242,91,122,113,65,68,131,71,104,184,187,238,92,21,156,33,
+    209,25,218,164,234,237,189,69,151,231,150,227,134,35,155,200,
+    77,8,174,62,209,213,151,199,27,250,228,110,196,253,191,231,
+    21,234,122,196,58,36,93,184,73,85,251,13,123,118,54,183,
+    135,104,240,242,120,43,87,109,23,234,70,197,186,209,77,202,
+    129,170,6,123,215,131,7,11,193,131,15,38,126,113,90,8,
+    158,20,131,39,5,87,7,146,29,122,209,144,180,119,162,55,
+    182,21,219,122,240,207,240,104,70,47,186,122,114,9,193,53,
+    144,119,13,160,235,110,95,86,47,250,67,249,58,216,80,163,
+    146,218,208,147,155,93,219,35,14,28,122,112,86,28,56,42,
+    184,158,21,93,207,230,241,246,49,67,213,249,179,250,236,217,
+    92,151,224,234,65,207,202,227,109,115,180,252,238,68,13,164,
+    228,225,129,215,192,60,252,223,83,216,154,167,114,202,72,105,
+    180,4,137,30,165,34,173,172,195,80,41,160,53,92,32,186,
+    174,79,233,81,105,184,99,214,242,143,234,182,182,177,220,59,
+    183,83,60,175,232,148,234,188,45,236,111,88,210,208,82,33,
+    76,131,140,83,203,140,132,176,2,203,142,192,197,112,34,112,
+    62,204,5,64,123,20,88,102,3,125,145,43,136,122,36,163,
+    177,11,129,79,232,80,200,68,80,244,42,20,152,252,96,21,
+    31,71,97,25,125,70,194,119,72,170,54,16,185,216,44,61,
+    153,160,53,211,107,175,195,99,203,30,126,146,45,3,156,137,
+    150,155,52,232,75,129,70,179,128,194,192,17,238,26,5,40,
+    162,43,123,89,112,246,136,78,4,136,122,139,99,195,221,92,
+    116,125,62,187,47,239,250,60,218,126,22,188,159,248,211,208,
+    79,67,228,232,175,235,201,47,218,16,198,240,128,210,216,227,
+    64,24,195,238,64,112,138,240,193,236,157,67,130,173,79,180,
+    245,33,100,99,233,218,112,131,11,156,187,83,116,119,166,39,
+    54,24,86,66,146,158,236,5,4,143,101,36,73,54,2,68,
+    74,199,33,24,116,12,68,44,93,13,68,90,123,3,175,59,
+    133,62,62,124,144,138,177,24,91,27,42,102,42,98,109,80,
+    0,196,78,204,197,180,74,103,187,195,59,212,61,213,105,122,
+    218,134,24,34,19,85,227,15,122,175,96,251,107,130,22,6,
+    47,253,20,38,123,37,179,100,10,11,49,37,51,130,49,0,
+    19,66,15,177,3,79,51,84,49,206,206,71,194,60,63,74,
+    97,170,157,40,19,98,254,199,20,182,62,84,72,104,181,179,
+    210,31,162,98,217,175,129,33,153,238,255,160,2,65,143,60,
+    77,217,177,92,143,224,9,137,158,80,158,145,182,162,175,49,
+    109,92,181,98,114,181,106,203,76,10,76,227,6,211,186,206,
+    116,21,152,46,129,233,22,153,238,60,211,189,193,180,175,51,
+    221,5,166,91,96,122,69,166,55,207,244,110,216,220,153,177,
+    108,72,176,5,69,91,16,128,104,95,145,117,126,123,234,237,
+    169,236,222,156,239,110,235,125,163,192,62,37,178,79,229,203,
+    219,166,30,85,193,245,182,65,67,247,48,4,165,244,74,219,
+    211,107,248,139,36,48,220,88,208,104,35,33,117,11,197,104,
+    53,114,136,13,119,169,60,202,130,20,223,177,98,76,25,191,
+    135,197,233,138,216,8,136,12,163,51,125,74,135,209,21,179,
+    98,74,153,230,232,148,177,162,76,248,38,250,166,43,198,55,
+    141,175,211,101,37,40,134,219,10,99,77,107,85,139,218,254,
+    240,253,41,93,109,5,163,26,50,19,245,8,242,152,90,245,
+    48,34,211,58,46,108,211,98,98,64,237,122,144,244,86,142,
+    46,201,202,132,75,178,133,67,131,240,29,41,48,78,203,207,
+    39,111,88,134,238,50,2,245,89,49,167,26,64,48,139,49,
+    37,113,108,249,132,30,94,54,128,115,212,39,180,53,228,144,
+    166,193,108,60,118,57,130,88,79,203,177,43,179,145,69,224,
+    122,249,87,225,130,33,204,95,144,184,106,79,52,33,67,241,
+    25,94,114,73,183,162,73,51,67,152,222,146,99,38,204,113,
+    51,160,156,36,44,55,118,75,210,45,140,149,140,216,39,189,
+    100,121,22,177,200,47,194,46,255,123,20,152,191,20,115,7,
+    76,45,168,30,102,103,153,50,247,94,162,35,37,253,66,226,
+    66,2,190,140,202,208,12,46,114,85,19,75,158,154,48,202,
+    137,32,141,141,50,78,239,234,114,246,92,193,217,145,47,111,
+    155,58,198,226,46,54,180,164,79,20,189,141,183,94,184,241,
+    66,174,91,240,246,137,222,190,244,177,244,177,39,27,78,255,
+    38,101,4,238,175,92,60,244,120,243,174,41,180,173,77,220,
+    59,77,246,30,236,37,191,31,190,68,126,209,134,184,61,187,
+    11,177,6,13,77,153,151,211,71,87,143,23,217,186,39,232,
+    111,211,134,158,0,191,44,213,218,41,207,98,64,244,136,43,
+    20,108,221,162,173,27,102,222,224,90,100,125,248,72,97,248,
+    136,48,252,140,56,252,12,62,133,38,237,58,219,86,96,219,
+    178,201,220,75,2,59,32,178,3,121,118,0,177,18,246,64,
+    14,77,225,30,145,237,217,212,235,45,131,27,253,123,239,191,
+    244,231,207,254,226,132,120,104,74,232,63,35,246,159,193,167,
+    81,95,130,131,192,247,101,247,10,108,32,143,183,77,51,92,
+    160,84,69,2,0,239,219,13,189,212,143,173,71,221,250,63,
+    109,57,106,215,255,210,110,68,187,42,74,34,59,8,130,92,
+    135,240,128,46,87,107,18,96,130,94,53,11,148,54,62,237,
+    44,96,107,81,152,50,12,19,199,25,61,118,89,144,128,140,
+    56,188,125,139,82,163,94,48,247,32,136,83,35,223,255,9,
+    96,164,69,3,35,42,8,253,21,192,9,88,143,175,81,232,
+    251,88,28,50,109,69,226,71,151,200,116,229,153,174,13,103,
+    75,246,37,193,217,37,58,187,224,163,244,21,59,123,129,175,
+    206,6,5,182,61,143,55,192,158,152,84,247,85,211,95,121,
+    212,78,83,255,120,244,151,35,182,77,252,226,104,16,214,228,
+    57,244,150,118,84,12,88,78,86,13,202,77,24,148,134,90,
+    20,9,85,253,27,24,143,81,170,76,144,246,230,234,5,79,
+    159,232,233,203,51,210,86,244,250,211,134,85,75,177,185,29,
+    68,176,204,94,129,241,231,241,86,237,68,33,251,69,223,160,
+    62,187,19,69,162,95,253,250,21,237,70,109,255,232,42,223,
+    234,154,238,18,41,93,217,145,193,192,131,193,154,184,193,192,
+    232,149,204,11,225,215,34,159,143,204,73,195,136,208,31,24,
+    108,244,160,50,80,57,21,212,97,32,194,66,185,164,82,88,
+    110,215,12,170,182,194,127,128,193,61,141,7,119,147,161,156,
+    238,213,216,186,35,80,112,4,114,94,193,209,35,58,122,210,
+    250,162,19,4,71,75,111,209,237,187,217,159,61,135,56,190,
+    117,119,127,193,221,191,182,71,112,143,136,238,145,244,68,177,
+    171,71,158,209,216,24,80,61,238,50,203,247,230,14,199,189,
+    74,155,87,135,53,87,58,136,205,41,147,120,222,4,50,199,
+    156,110,86,71,35,224,91,117,171,35,38,100,139,169,70,142,
+    8,233,151,31,63,23,189,28,137,5,194,49,201,55,114,144,
+    184,51,14,6,248,72,114,137,143,97,7,71,80,40,96,135,
+    199,138,183,227,28,31,95,128,67,107,89,165,128,227,155,98,
+    225,249,0,56,185,130,51,36,198,243,17,116,82,242,211,28,
+    14,156,156,67,119,68,19,101,63,224,112,172,55,9,126,150,
+    216,35,4,181,23,142,38,42,143,11,7,248,165,88,50,138,
+    218,141,0,129,28,14,156,131,59,95,143,206,207,35,90,25,
+    230,103,47,18,135,76,232,208,236,18,15,120,167,236,219,9,
+    253,140,38,19,242,147,8,86,74,12,203,39,150,235,39,194,
+    49,208,145,129,123,137,162,155,203,110,244,18,138,99,120,17,
+    4,101,160,40,34,102,66,246,243,164,75,152,100,75,130,10,
+    33,139,244,107,60,104,60,53,242,201,31,161,98,185,67,3,
+    116,213,106,162,13,0,187,105,74,194,113,62,255,205,51,235,
+    222,80,193,27,18,188,3,162,119,0,224,173,5,23,215,39,
+    211,71,211,95,43,58,93,153,99,160,209,40,54,248,179,29,
+    153,100,198,6,255,176,38,227,145,163,41,223,252,194,253,99,
+    168,32,155,224,152,18,29,83,121,102,170,26,239,201,6,168,
+    180,174,10,239,85,241,73,124,155,50,234,101,11,151,185,45,
+    5,197,148,138,91,188,76,241,193,212,86,46,114,132,43,84,
+    56,187,110,173,44,149,159,44,3,250,101,224,17,183,148,58,
+    212,160,191,133,169,90,167,53,230,67,43,74,231,214,42,174,
+    180,83,105,116,224,155,147,190,74,93,60,237,104,14,222,72,
+    230,22,209,177,254,142,81,59,13,83,10,46,50,167,224,72,
+    183,238,63,76,125,190,17,189,173,163,118,237,90,198,193,79,
+    125,151,110,244,60,39,85,227,47,69,43,205,89,85,78,189,
+    26,110,2,183,163,80,134,115,6,213,8,128,65,6,208,145,
+    169,122,28,66,230,169,101,192,11,88,129,29,73,42,28,193,
+    43,179,178,119,217,221,27,8,207,161,93,60,161,137,135,248,
+    114,144,168,31,34,8,147,41,181,198,224,141,93,14,31,140,
+    112,159,152,38,72,109,15,174,29,139,43,31,251,9,221,27,
+    114,99,67,63,81,79,252,83,10,212,169,101,253,44,214,53,
+    96,2,196,131,175,45,230,198,99,160,85,246,169,88,238,179,
+    145,175,45,129,79,57,15,50,35,255,111,160,0,30,157,136,
+    170,152,134,1,91,140,249,158,82,195,108,60,194,207,70,170,
+    24,118,254,117,10,7,15,96,236,2,62,189,24,197,240,255,
+    146,170,194,47,208,197,229,70,173,250,86,86,165,252,29,224,
+    149,121,204,99,63,178,53,100,13,217,72,89,222,212,89,60,
+    27,172,171,226,118,185,134,152,213,97,145,29,206,179,195,69,
+    214,157,62,254,208,230,204,236,185,121,72,50,110,3,147,139,
+    107,158,203,141,173,117,221,27,188,159,20,251,15,9,236,97,
+    145,61,156,103,15,43,110,24,207,219,90,209,134,111,232,40,
+    176,29,101,127,206,117,118,164,192,142,40,132,90,124,207,35,
+    27,120,241,217,122,69,91,47,48,241,142,181,9,113,240,48,
+    222,219,112,183,101,128,57,246,250,51,123,51,123,179,158,219,
+    45,89,244,111,211,168,171,235,125,172,55,128,58,198,0,234,
+    24,131,221,177,233,160,234,188,55,109,183,156,55,156,57,131,
+    224,234,22,93,221,216,35,16,191,162,66,164,214,190,160,170,
+    109,189,197,243,176,194,200,255,186,251,208,131,151,132,238,9,
+    177,123,66,96,39,69,118,50,207,78,226,123,144,68,224,108,
+    205,183,78,229,102,239,206,163,31,180,125,152,36,191,104,19,
+    28,103,68,199,153,60,115,166,154,220,203,158,119,191,34,242,
+    57,205,149,73,118,211,167,147,126,174,202,87,20,221,175,151,
+    238,183,43,89,47,206,80,193,149,184,150,81,170,229,84,213,
+    66,245,126,87,167,169,105,42,247,135,51,111,197,180,85,158,
+    80,221,31,165,129,248,50,233,85,197,120,76,171,219,210,224,
+    107,187,90,7,160,172,107,81,203,230,91,96,108,141,3,0,
+    173,245,48,236,162,146,174,74,237,32,154,132,234,96,5,142,
+    81,226,239,239,129,227,19,224,38,107,53,110,42,235,45,66,
+    182,169,146,67,118,152,155,1,47,219,101,221,248,184,242,28,
+    176,75,127,251,255,161,63,114,18,199,236,46,134,103,35,137,
+    18,75,252,149,202,206,118,51,19,103,78,159,153,58,59,243,
+    9,35,241,46,189,159,120,123,203,184,41,92,118,65,10,244,
+    242,255,30,117,33,100,197,22,187,146,49,177,56,31,77,242,
+    2,236,27,46,197,163,49,44,251,99,129,139,191,12,39,173,
+    136,197,152,152,192,168,14,227,18,140,130,164,32,55,140,80,
+    84,14,147,182,153,153,11,101,140,81,141,76,228,75,118,116,
+    79,194,75,4,118,155,51,239,233,42,216,186,242,182,174,162,
+    167,254,230,225,117,79,79,193,211,147,75,10,158,65,209,51,
+    152,103,7,31,170,107,136,158,238,220,121,208,154,177,161,26,
+    87,102,115,124,110,86,244,244,231,217,126,64,35,71,10,182,
+    142,188,173,163,232,105,189,245,244,141,167,115,123,196,174,49,
+    193,243,148,232,1,188,65,208,204,193,188,173,13,109,208,244,
+    193,108,82,244,4,243,108,144,92,57,156,183,5,208,134,59,
+    149,243,138,158,158,60,18,192,13,128,81,144,172,180,231,251,
+    71,190,123,68,104,30,16,155,7,214,206,9,158,221,162,103,
+    119,158,221,253,100,195,217,138,245,193,149,98,195,29,40,186,
+    38,179,123,110,31,202,187,38,209,246,224,28,249,69,155,70,
+    27,12,82,188,227,201,147,39,216,188,246,171,250,142,103,247,
+    83,191,218,223,51,209,166,87,57,114,195,62,70,0,0,137,
+    106,126,191,44,64,211,228,27,209,248,27,41,3,195,204,8,
+    159,227,47,83,229,2,134,79,247,194,87,1,213,45,168,81,
+    220,171,169,60,211,188,77,228,224,9,220,62,71,115,212,60,
+    181,66,171,29,123,43,19,92,229,27,34,79,100,237,196,226,
+    33,106,51,100,44,185,23,198,134,203,172,255,176,100,225,197,
+    80,200,148,207,242,224,99,192,255,90,1,131,63,213,192,32,
+    255,31,169,106,93,81,5,136,251,225,37,123,240,75,62,100,
+    58,242,229,237,145,179,62,195,223,124,67,108,8,129,69,231,
+    160,224,60,36,58,15,229,153,67,219,8,186,45,120,0,116,
+    196,147,191,6,167,135,100,246,229,198,174,104,108,118,126,137,
+    139,4,58,201,235,140,4,145,156,56,124,241,98,39,118,231,
+    126,95,10,22,53,204,198,185,136,218,243,24,251,189,242,17,
+    136,68,75,104,205,18,202,107,163,240,62,141,228,163,49,108,
+    218,144,183,247,9,76,72,100,42,90,229,127,224,43,180,85,
+    94,33,248,198,27,208,251,138,47,239,202,10,121,15,254,63,
+    107,17,129,83,194,77,242,43,180,170,95,65,115,121,111,213,
+    91,12,9,204,176,200,12,231,203,27,137,16,104,34,28,208,
+    87,160,152,193,35,119,62,30,159,47,233,17,252,18,70,11,
+    92,179,249,239,82,101,139,208,223,80,146,215,35,113,166,199,
+    124,23,40,233,43,156,19,214,144,96,54,12,75,88,152,13,
+    226,255,119,40,254,143,50,48,241,143,160,248,191,160,57,187,
+    228,96,57,27,153,159,159,153,121,159,38,246,112,24,181,103,
+    8,240,245,150,139,77,184,112,129,248,83,202,110,249,38,202,
+    215,88,244,249,139,222,134,98,125,99,209,229,65,251,217,32,
+    250,151,124,183,255,118,127,222,219,93,108,110,47,54,52,23,
+    91,59,138,237,93,155,62,155,207,180,73,161,226,218,11,155,
+    77,96,79,108,201,59,123,174,157,216,116,4,141,158,77,170,
+    70,49,69,71,105,35,98,65,182,40,95,214,155,141,131,155,
+    148,92,184,25,227,62,8,9,144,10,175,15,46,200,197,48,
+    3,177,1,114,225,53,24,3,136,73,42,23,14,6,26,149,
+    11,175,197,120,134,134,128,1,185,108,234,48,190,136,246,21,
+    229,113,218,111,68,136,78,46,246,210,198,22,136,46,149,10,
+    147,193,120,24,158,45,21,14,218,216,15,23,164,194,68,27,
+    71,96,111,235,130,68,42,192,200,215,70,151,38,138,160,43,
+    28,32,117,156,64,237,126,74,133,31,249,63,45,23,71,0,
+    28,205,4,28,109,174,244,88,181,215,62,60,19,164,155,143,
+    238,81,36,197,74,57,69,138,38,158,158,170,114,198,35,220,
+    145,14,148,82,219,214,44,243,101,126,101,173,235,244,22,207,
+    51,234,176,238,240,15,64,90,82,154,134,171,156,5,67,198,
+    229,129,201,200,108,156,15,35,233,0,172,2,196,173,62,48,
+    49,48,16,152,147,18,219,224,80,234,23,113,198,19,213,96,
+    194,136,224,32,162,107,216,163,254,91,212,183,108,223,98,111,
+    81,215,21,52,232,109,219,117,251,22,204,39,173,53,235,173,
+    208,91,214,213,95,183,105,3,161,182,172,91,21,9,183,162,
+    223,178,174,81,219,135,183,217,11,212,138,65,169,223,170,80,
+    172,235,90,237,162,49,101,172,208,176,218,22,238,42,237,218,
+    203,96,190,146,153,98,122,213,162,124,70,74,225,255,7,209,
+    128,10,31,71,115,197,172,185,68,241,245,41,195,22,102,40,
+    147,22,111,175,142,111,93,87,217,194,92,149,122,98,245,11,
+    74,19,149,246,237,211,182,52,59,167,227,204,111,49,154,44,
+    20,204,182,119,65,8,10,83,117,15,98,140,209,20,176,196,
+    232,20,179,98,85,170,57,174,219,192,187,63,165,191,206,222,
+    179,252,8,141,240,79,42,12,189,181,226,115,155,178,34,218,
+    100,157,42,49,241,203,17,158,143,114,145,227,36,160,4,251,
+    42,121,136,174,81,114,213,95,140,207,71,103,175,150,76,9,
+    240,237,154,197,177,99,85,57,1,128,6,127,4,226,248,119,
+    116,8,154,141,188,119,103,225,113,49,79,106,71,58,214,21,
+    189,78,157,29,65,127,221,160,137,7,165,163,104,250,222,165,
+    255,128,150,141,32,152,242,148,108,152,113,33,52,19,115,66,
+    33,19,9,127,187,79,17,71,6,48,215,149,140,179,179,16,
+    246,139,141,2,144,25,40,1,31,25,123,102,93,147,194,126,
+    177,56,17,158,159,95,30,66,123,36,99,85,37,54,143,35,
+    232,64,145,176,168,92,29,52,195,137,231,40,76,196,30,134,
+    70,242,222,231,50,147,183,206,220,56,35,120,187,69,111,55,
+    34,88,247,207,173,143,29,43,140,29,19,198,158,19,199,158,
+    75,31,43,122,122,191,179,47,59,134,100,117,79,175,232,233,
+    93,243,230,61,251,239,215,163,2,54,118,127,53,59,41,15,
+    63,176,34,224,186,174,163,174,235,83,212,5,58,69,255,144,
+    254,60,165,25,150,114,26,17,121,8,248,255,70,225,144,63,
+    132,184,228,132,77,18,175,187,120,149,188,241,224,142,222,88,
+    170,29,134,23,238,146,94,216,211,144,217,155,53,228,61,195,
+    217,36,42,200,150,187,44,237,178,195,229,188,12,143,229,206,
+    252,125,249,3,132,88,194,167,224,16,70,115,52,6,158,143,
+    201,146,37,17,189,16,11,35,216,140,148,172,178,174,40,129,
+    195,111,177,115,65,201,24,89,88,76,94,229,151,224,4,96,
+    161,18,251,226,213,103,17,155,68,186,207,243,240,100,7,255,
+    9,92,6,246,130,180,252,247,50,56,232,209,243,165,39,227,
+    153,128,181,60,252,19,40,254,95,184,78,207,85,64,4,15,
+    28,14,196,252,106,197,145,239,153,103,202,240,82,30,160,229,
+    230,109,70,239,24,12,214,155,192,226,160,63,28,53,178,186,
+    146,54,20,61,141,183,198,111,140,103,47,173,117,11,158,93,
+    162,103,87,154,169,156,66,112,49,34,122,70,208,169,182,224,
+    247,47,125,247,82,62,116,228,67,131,208,118,76,108,59,134,
+    164,141,98,93,195,173,166,27,77,217,19,185,136,80,55,40,
+    214,13,166,77,155,44,229,114,167,13,27,14,159,232,104,207,
+    25,4,71,183,232,232,78,235,139,77,173,183,135,215,155,134,
+    10,77,67,66,211,136,216,52,2,161,189,7,112,145,62,85,
+    116,54,102,95,46,56,187,242,206,174,135,46,96,182,110,78,
+    229,198,69,239,48,2,79,167,119,117,37,103,188,107,203,59,
+    7,208,6,177,229,182,27,182,236,41,165,243,216,67,233,228,
+    244,154,239,94,107,190,101,159,224,218,47,186,246,231,241,246,
+    200,226,72,39,175,55,175,54,111,234,116,208,92,117,241,88,
+    79,89,125,210,245,143,25,202,234,44,215,167,45,192,167,40,
+    11,185,42,156,48,81,254,64,158,29,74,63,151,126,46,247,
+    197,52,189,225,235,40,178,174,162,175,181,88,231,43,6,246,
+    160,1,220,180,153,234,173,143,41,84,252,6,138,52,189,106,
+    221,116,81,174,186,52,67,56,159,138,255,238,158,51,177,72,
+    0,225,133,165,5,176,99,128,1,3,201,255,4,83,12,130,
+    10,51,30,155,191,42,29,7,136,87,85,132,67,194,20,164,
+    38,195,14,85,8,247,200,83,139,55,208,101,31,151,175,74,
+    156,189,69,134,8,222,136,46,62,11,64,176,64,102,204,166,
+    41,100,172,219,164,170,139,143,95,166,41,198,150,222,251,141,
+    171,111,93,205,28,253,230,155,215,222,44,58,27,210,206,13,
+    11,155,62,119,189,113,181,49,19,126,187,45,221,118,103,34,
+    103,122,247,249,219,207,175,141,22,90,6,243,45,131,80,231,
+    74,214,155,254,122,158,105,123,228,104,200,251,181,38,8,37,
+    202,45,35,149,143,224,138,50,237,200,91,148,156,120,4,242,
+    204,25,164,188,123,39,99,115,241,89,165,22,8,6,80,105,
+    241,134,32,143,10,202,214,41,83,106,164,244,202,148,26,224,
+    153,161,72,169,97,84,134,189,224,80,9,25,245,227,192,17,
+    153,0,75,193,250,231,66,102,18,18,105,128,236,15,37,6,
+    167,113,67,242,76,201,22,185,18,94,88,156,151,14,36,191,
+    37,160,106,37,107,120,118,54,146,72,224,11,230,89,62,2,
+    202,105,244,20,140,21,177,20,100,69,93,229,109,52,32,31,
+    233,33,188,29,78,57,104,137,175,85,57,87,96,199,93,183,
+    60,42,178,211,110,10,62,237,65,10,115,193,146,33,88,250,
+    241,7,112,58,136,230,206,180,65,100,252,197,230,30,252,187,
+    201,80,205,221,56,93,68,67,51,228,137,72,163,127,213,182,
+    34,89,248,36,73,120,176,247,143,124,241,50,205,179,181,76,
+    184,178,151,139,110,138,135,188,48,33,26,226,245,192,69,124,
+    102,166,28,17,46,251,149,168,45,224,88,175,237,83,190,157,
+    172,211,126,27,94,48,68,94,208,233,207,78,222,126,33,239,
+    12,161,13,140,254,147,26,163,63,229,234,71,87,164,120,110,
+    163,70,12,37,210,37,22,29,53,81,218,102,90,42,222,128,
+    182,118,83,234,40,109,43,72,63,114,209,162,3,105,171,186,
+    32,143,131,135,212,78,180,3,230,68,101,224,48,230,185,144,
+    40,50,173,199,129,186,6,24,182,82,139,44,123,79,204,71,
+    191,192,67,140,34,47,251,254,212,214,14,192,75,125,182,104,
+    178,90,186,4,194,215,232,42,126,254,210,119,43,153,33,9,
+    97,248,66,132,200,210,228,219,41,93,202,187,183,235,185,12,
+    172,25,24,95,176,43,33,60,180,193,216,21,254,229,13,2,
+    211,33,42,84,61,132,110,215,254,132,127,7,197,255,77,169,
+    101,122,80,84,226,226,219,208,198,126,74,45,211,235,104,99,
+    39,72,160,59,41,200,151,244,106,191,164,140,187,200,148,168,
+    145,50,73,143,74,35,103,192,9,147,32,109,146,25,7,116,
+    51,156,25,39,79,242,212,24,161,48,96,110,108,212,146,78,
+    148,211,31,197,3,124,4,33,14,52,117,2,241,69,41,25,
+    13,100,30,10,203,169,138,184,120,140,152,206,203,102,249,192,
+    108,124,97,1,8,201,124,20,114,18,197,42,166,180,196,176,
+    21,215,60,3,52,165,194,211,148,159,132,102,218,32,166,64,
+    152,230,148,3,51,202,87,9,22,139,112,210,51,206,34,70,
+    29,188,214,16,27,22,127,61,129,99,68,228,120,147,68,20,
+    118,195,177,72,124,41,17,64,175,129,24,41,76,221,226,115,
+    1,156,220,50,16,37,73,154,32,103,18,112,250,17,184,74,
+    140,244,181,97,123,47,85,109,168,214,100,38,162,42,73,237,
+    56,165,35,14,68,87,68,23,202,217,123,16,68,99,157,147,
+    155,198,208,141,33,218,166,184,174,82,77,98,120,174,53,19,
+    101,48,254,62,128,24,176,141,8,138,251,6,215,190,36,244,
+    29,16,251,14,0,182,205,196,4,236,255,137,182,106,141,158,
+    172,149,5,244,255,45,205,156,85,100,111,149,207,110,159,231,
+    178,58,131,32,60,28,231,179,4,20,246,29,90,206,104,89,
+    7,73,8,43,216,250,186,194,26,36,101,175,116,203,147,255,
+    125,186,236,200,133,147,167,89,43,163,132,99,78,212,83,31,
+    208,242,242,238,218,67,37,219,17,106,36,176,252,167,48,128,
+    240,181,158,200,25,44,187,172,184,40,246,239,77,159,18,217,
+    64,206,35,178,221,155,250,242,233,90,5,65,17,58,222,15,
+    51,191,137,198,138,90,76,99,112,63,241,23,253,42,233,38,
+    104,10,151,219,63,165,155,63,132,62,29,161,8,110,114,118,
+    214,106,177,184,255,144,184,255,36,238,213,99,56,134,140,17,
+    176,231,130,61,23,212,177,88,171,105,169,156,185,70,164,180,
+    198,128,73,234,213,153,21,61,226,98,244,149,143,126,153,226,
+    39,148,199,42,7,171,154,126,24,106,32,225,221,170,228,5,
+    250,90,62,26,171,135,148,65,2,224,181,0,169,142,170,66,
+    14,148,117,116,181,235,72,126,219,203,131,8,89,69,56,64,
+    92,96,197,71,88,97,41,6,14,174,144,75,45,174,177,231,
+    143,7,150,199,180,181,9,150,65,60,112,108,40,114,37,154,
+    72,34,196,80,125,27,34,7,240,153,73,188,89,93,52,49,
+    177,192,157,70,184,238,172,212,14,127,155,146,240,118,89,248,
+    4,64,192,209,4,124,59,93,219,148,190,5,80,200,204,199,
+    143,1,40,32,137,40,98,62,154,218,196,166,1,8,7,114,
+    227,2,68,24,119,230,146,88,223,151,119,194,86,244,180,98,
+    219,150,232,233,95,247,28,42,120,14,9,158,35,162,231,200,
+    38,101,172,171,223,240,54,103,79,173,233,215,206,10,222,81,
+    209,59,154,199,219,163,166,167,138,254,227,127,237,17,252,167,
+    31,235,117,205,245,8,134,154,235,17,12,249,234,145,76,210,
+    176,7,209,44,95,168,56,48,252,88,79,251,144,24,162,135,
+    40,38,61,68,49,233,235,220,155,158,114,47,182,49,62,247,
+    161,179,223,50,66,6,69,141,186,115,155,132,182,124,15,206,
+    178,213,137,128,82,183,165,211,143,190,2,144,21,61,92,149,
+    158,170,43,246,175,53,173,42,244,93,154,86,189,170,252,24,
+    52,88,58,150,171,106,173,24,98,123,53,79,84,164,154,209,
+    184,98,183,43,115,210,113,58,149,19,140,134,134,212,2,107,
+    117,182,225,87,195,111,27,119,218,50,31,82,191,75,78,49,
+    137,42,127,42,109,154,198,240,172,62,250,3,136,50,223,226,
+    91,164,141,136,102,232,17,205,48,108,79,41,32,235,88,178,
+    65,209,171,26,233,168,150,83,178,183,220,177,43,104,254,113,
+    36,209,33,120,196,245,133,208,52,93,0,7,155,89,204,154,
+    32,92,30,39,12,64,0,231,5,78,12,202,183,2,63,32,
+    9,51,146,115,222,151,70,7,3,123,94,69,15,152,199,177,
+    170,132,17,24,197,252,198,158,138,131,30,17,138,189,209,24,
+    146,156,162,28,98,20,184,200,21,28,86,52,30,168,77,225,
+    32,8,82,65,225,216,21,250,186,78,137,41,37,186,102,151,
+    233,26,209,74,73,84,141,142,18,140,240,219,16,51,232,121,
+    77,98,246,111,1,71,128,77,67,34,102,249,166,3,104,91,
+    251,92,118,60,23,190,125,152,28,41,55,66,183,88,18,28,
+    53,0,221,49,69,240,136,99,236,86,210,71,99,201,146,145,
+    15,199,46,68,74,198,4,98,183,34,24,167,149,12,124,100,
+    145,7,61,21,18,168,34,9,162,9,0,210,39,41,27,209,
+    125,220,149,146,62,190,148,44,209,201,146,105,6,63,128,188,
+    101,89,209,24,120,70,105,255,39,239,179,13,89,36,21,254,
+    5,188,93,39,49,145,109,90,41,103,93,90,191,97,243,101,
+    102,239,140,9,182,14,209,214,177,73,217,45,227,69,159,31,
+    130,48,71,113,145,161,33,226,207,122,195,154,221,155,163,111,
+    239,19,155,71,4,215,46,209,181,43,143,55,200,19,50,10,
+    73,66,154,178,93,119,18,101,39,110,163,221,189,209,216,6,
+    209,132,107,29,63,120,78,104,28,20,27,7,51,166,140,105,
+    195,215,158,211,191,247,146,224,27,16,125,8,247,234,81,181,
+    250,221,69,111,255,7,231,238,119,189,255,202,189,87,4,239,
+    83,218,0,79,19,213,222,37,182,141,64,229,113,92,100,172,
+    27,158,214,236,236,123,99,36,144,7,245,177,238,89,122,163,
+    181,51,55,241,227,231,127,248,252,207,244,247,79,253,169,243,
+    167,78,33,248,140,24,124,38,223,122,52,115,92,234,190,242,
+    155,221,239,65,133,208,116,64,68,165,235,128,232,58,144,199,
+    27,226,19,114,123,4,103,175,232,132,16,159,109,242,80,147,
+    132,110,106,83,210,86,233,152,101,41,172,100,64,159,128,39,
+    172,13,141,63,178,210,79,0,178,68,162,203,232,19,110,197,
+    171,226,171,127,3,223,15,116,255,192,213,120,50,147,162,183,
+    155,132,196,229,153,30,73,80,182,104,165,172,175,82,101,81,
+    11,219,88,177,200,188,11,40,239,94,186,90,120,198,236,23,
+    20,55,161,165,40,165,22,158,25,35,3,214,71,102,211,75,
+    27,199,113,158,90,82,152,244,70,43,228,62,147,10,171,221,
+    136,62,159,92,180,121,65,170,150,139,65,108,31,173,46,164,
+    94,104,37,181,50,198,253,232,132,78,37,169,129,142,9,73,
+    218,156,14,73,105,250,105,211,5,138,51,252,144,158,54,71,
+    152,218,56,58,98,173,184,48,114,154,68,102,211,54,29,21,
+    97,57,141,93,7,159,51,215,56,199,212,56,103,169,113,206,
+    90,227,156,173,198,57,86,125,238,130,121,218,142,206,59,56,
+    187,230,60,61,237,140,184,32,77,152,102,17,141,186,40,197,
+    57,57,231,156,158,115,189,69,79,187,113,218,48,15,78,27,
+    230,197,11,143,248,240,194,35,245,176,232,200,116,3,87,15,
+    233,196,96,153,145,233,70,206,143,202,38,88,86,100,186,153,
+    107,122,11,22,65,105,134,69,80,184,150,183,96,25,148,86,
+    88,6,5,47,32,18,192,11,136,116,224,5,68,58,241,2,
+    34,93,120,1,145,32,94,64,164,27,47,32,210,163,88,64,
+    164,15,47,32,18,194,139,123,244,115,33,84,14,112,253,168,
+    28,228,6,222,130,69,73,6,241,162,36,67,120,81,146,97,
+    188,40,201,8,94,148,100,23,94,148,100,20,47,74,178,27,
+    47,74,178,7,150,35,65,163,225,226,246,222,27,211,24,98,
+    159,170,26,137,167,184,125,168,254,62,110,63,42,247,115,7,
+    222,130,5,70,198,97,129,17,238,32,42,15,114,135,80,121,
+    136,59,140,40,228,145,146,69,158,103,231,150,235,144,92,52,
+    82,145,141,134,47,94,92,118,194,82,34,227,227,149,100,255,
+    250,146,101,146,15,71,99,192,156,150,216,179,17,62,138,136,
+    219,50,28,161,219,193,210,149,0,138,58,62,254,28,31,95,
+    90,92,174,59,118,25,132,229,207,45,69,150,34,1,156,12,
+    17,205,127,36,110,150,44,80,158,5,121,185,100,95,136,44,
+    156,36,52,18,14,89,116,248,5,30,205,243,243,225,217,215,
+    74,14,62,114,225,69,62,126,62,130,87,30,73,148,234,202,
+    199,167,49,67,141,36,254,146,25,39,221,91,90,196,106,56,
+    21,215,8,99,164,49,193,135,116,203,61,167,227,97,78,225,
+    147,139,165,118,162,113,128,164,200,145,217,215,22,161,45,146,
+    202,178,44,88,235,102,23,85,94,38,150,121,244,16,220,255,
+    229,138,14,100,88,62,249,119,128,54,96,2,98,215,11,139,
+    61,109,192,211,186,164,14,121,180,149,251,119,83,95,141,73,
+    171,130,118,234,84,230,245,42,27,106,134,142,253,136,83,171,
+    135,213,252,222,73,156,101,182,162,46,86,56,90,66,38,217,
+    148,1,103,134,53,33,225,138,236,153,85,49,215,26,126,46,
+    97,77,153,184,242,29,102,105,207,156,50,110,17,125,77,131,
+    5,88,45,176,173,208,171,167,148,249,116,118,226,24,57,137,
+    222,242,213,61,56,106,196,176,194,164,152,218,214,102,245,61,
+    25,154,247,115,198,21,75,106,11,140,168,177,152,90,57,106,
+    197,166,228,100,83,76,178,94,81,91,253,77,236,156,41,197,
+    84,156,222,191,71,221,209,65,75,43,182,152,83,125,30,206,
+    86,130,40,87,108,56,168,82,118,122,71,226,241,239,224,51,
+    78,197,153,101,85,47,20,215,148,95,46,25,168,212,185,36,
+    203,3,151,220,181,251,155,120,81,254,206,172,252,157,237,201,
+    94,69,59,54,229,55,81,182,116,169,146,171,200,146,178,162,
+    209,84,244,78,213,79,249,173,148,119,107,52,92,246,31,161,
+    54,126,82,105,135,78,177,56,35,205,166,102,92,104,126,92,
+    51,46,144,7,252,31,233,29,56,227,86,253,200,208,171,99,
+    120,53,11,51,232,220,176,180,126,44,182,180,16,225,150,59,
+    38,174,206,206,67,154,246,36,182,94,5,34,112,26,84,153,
+    229,160,215,196,57,30,28,115,248,9,108,3,33,174,240,51,
+    161,122,28,60,7,225,169,8,179,240,199,104,201,209,21,4,
+    254,170,165,151,202,143,140,188,72,220,16,229,5,30,120,224,
+    88,121,8,176,39,108,54,128,83,201,178,88,54,219,144,213,
+    45,32,222,149,120,210,130,123,34,255,51,40,32,5,63,177,
+    7,128,121,166,196,46,242,145,100,242,234,12,238,76,200,65,
+    16,156,117,110,62,124,65,74,246,199,206,46,112,51,160,113,
+    197,143,5,211,13,49,21,255,57,84,116,33,1,33,57,131,
+    106,148,43,148,156,248,140,194,50,100,146,178,132,99,59,16,
+    146,3,228,222,149,204,240,100,108,60,66,213,97,7,27,130,
+    3,170,63,194,129,157,164,33,40,160,130,90,53,163,242,17,
+    32,216,3,58,204,1,218,220,153,189,217,182,114,38,131,167,
+    45,77,27,108,93,222,61,38,187,233,163,157,135,129,32,164,
+    35,105,125,232,111,185,237,216,68,8,217,141,139,140,161,8,
+    39,114,73,209,63,152,49,22,187,70,238,7,133,174,167,242,
+    174,64,177,115,112,45,41,116,238,201,56,55,26,250,214,124,
+    66,195,136,216,48,2,172,248,161,98,239,190,7,93,66,239,
+    225,188,55,88,236,25,123,160,23,122,14,102,206,20,91,59,
+    215,91,119,23,90,17,23,223,150,15,236,186,63,130,248,247,
+    54,224,223,219,220,25,107,6,204,165,29,221,119,217,245,192,
+    238,66,96,183,16,216,43,6,246,110,82,3,246,166,199,80,
+    188,195,102,12,153,185,162,167,113,221,51,80,240,12,8,158,
+    33,209,51,244,152,234,175,107,42,182,119,100,78,20,91,187,
+    214,91,71,10,173,35,66,235,168,216,58,138,24,249,150,64,
+    230,216,70,67,71,174,231,131,17,161,97,92,108,64,204,167,
+    209,55,84,236,122,122,237,101,113,232,112,190,235,105,180,101,
+    153,98,160,39,107,204,26,31,246,12,138,61,79,229,187,246,
+    227,51,119,217,172,17,209,163,198,214,156,225,174,51,239,31,
+    65,27,122,92,110,242,238,233,124,203,46,180,109,4,250,209,
+    241,237,211,107,94,177,101,248,103,186,159,50,226,174,103,209,
+    171,116,52,161,87,233,104,218,212,83,173,163,72,92,66,195,
+    228,21,58,199,178,230,242,40,101,205,27,195,251,138,45,29,
+    149,123,197,150,61,197,150,96,177,165,19,109,235,45,35,133,
+    150,145,251,134,159,58,63,52,136,187,142,9,45,199,197,22,
+    244,22,93,143,237,230,17,244,96,84,100,173,185,125,130,127,
+    32,239,31,216,116,83,173,29,168,63,103,242,45,123,208,86,
+    12,4,215,12,247,216,124,96,47,218,32,203,226,111,213,114,
+    91,173,70,254,31,212,132,171,41,207,52,86,11,54,128,6,
+    128,36,127,116,67,79,236,176,185,90,24,174,42,183,240,138,
+    110,203,154,181,150,52,211,71,209,111,204,156,210,241,70,80,
+    59,73,11,145,233,18,102,165,240,180,162,131,44,4,21,82,
+    206,169,18,31,114,170,4,135,156,42,145,33,71,169,45,189,
+    202,196,132,156,42,1,33,167,78,52,104,80,178,14,152,145,
+    144,115,105,224,165,27,42,46,80,186,138,8,145,83,168,140,
+    42,127,85,174,104,7,37,146,13,190,130,198,148,254,158,134,
+    153,0,71,181,218,241,98,53,114,34,212,142,20,51,164,76,
+    85,73,215,14,37,219,21,53,116,151,228,8,10,173,185,101,
+    70,190,162,185,163,110,203,59,234,20,181,228,187,119,56,26,
+    253,229,209,72,118,43,90,211,142,137,49,101,252,134,183,246,
+    120,33,72,145,219,76,225,4,186,171,3,81,85,58,64,212,
+    43,121,127,135,189,234,42,247,10,49,113,222,90,119,0,180,
+    106,156,199,168,74,43,82,63,130,104,46,236,172,189,122,121,
+    20,6,84,109,24,208,72,104,53,251,13,88,35,111,154,42,
+    89,102,32,241,91,2,232,164,113,6,9,10,241,115,199,67,
+    52,255,50,104,140,234,73,96,26,152,114,113,216,26,89,133,
+    14,178,69,24,137,119,158,101,102,118,150,16,19,188,75,232,
+    8,78,237,38,47,125,33,45,98,103,69,173,92,157,193,250,
+    58,216,159,159,39,251,252,219,148,68,183,9,57,254,231,208,
+    138,5,199,249,99,251,226,239,80,101,210,11,68,184,84,159,
+    228,175,30,173,78,100,129,3,193,33,213,75,60,70,180,251,
+    101,255,9,236,80,198,200,239,103,129,215,35,9,119,3,148,
+    164,242,47,153,98,145,215,17,113,221,202,147,162,58,253,217,
+    17,52,140,137,79,104,178,24,2,241,133,122,77,240,244,139,
+    158,254,52,83,244,54,221,58,117,227,84,246,117,178,204,65,
+    218,82,180,121,243,182,150,135,254,166,244,201,244,201,34,36,
+    194,213,89,122,31,118,246,164,79,102,46,10,108,251,67,103,
+    3,184,15,245,20,27,154,111,190,153,62,81,236,232,78,51,
+    34,211,6,30,68,45,120,117,14,31,44,210,97,45,54,182,
+    162,31,71,249,167,19,187,104,180,23,155,218,176,131,134,244,
+    211,138,29,56,154,16,222,134,223,198,77,150,106,106,193,213,
+    253,1,209,223,191,238,223,85,240,239,18,252,187,69,255,238,
+    74,254,8,146,182,171,232,243,103,206,102,175,230,125,33,193,
+    23,18,125,161,244,113,76,59,131,5,79,80,240,244,136,158,
+    30,208,215,13,130,131,21,73,229,117,92,112,13,136,56,157,
+    214,147,143,173,148,191,35,231,23,59,70,133,134,221,98,195,
+    110,232,244,70,83,87,238,132,24,220,39,52,237,23,155,246,
+    67,223,30,66,23,250,214,253,195,5,255,176,224,223,37,250,
+    119,65,235,7,112,65,186,176,225,134,85,178,220,67,162,123,
+    8,47,59,146,254,122,49,216,155,155,88,139,230,131,251,133,
+    224,126,49,184,63,99,184,201,102,207,10,174,142,39,224,154,
+    210,74,86,50,65,143,29,88,247,143,22,252,163,130,127,143,
+    232,223,3,131,121,4,23,210,155,117,245,252,248,192,15,15,
+    172,157,187,127,64,232,58,44,118,29,78,79,174,158,201,78,
+    144,156,26,15,253,109,223,103,191,203,194,202,73,112,11,206,
+    182,19,148,186,195,122,50,147,217,174,108,66,96,187,68,182,
+    43,143,55,72,22,65,42,213,118,125,196,114,39,100,247,87,
+    27,239,18,65,165,148,185,213,194,18,85,25,190,232,59,186,
+    42,35,154,14,140,104,203,175,188,148,140,206,71,147,87,101,
+    23,111,80,182,99,41,27,118,32,9,66,32,177,196,71,136,
+    27,64,24,194,226,203,113,174,137,0,248,69,202,218,244,50,
+    68,87,226,223,251,96,253,163,133,104,34,129,109,247,184,54,
+    182,190,65,122,235,190,144,60,5,250,66,83,33,3,153,187,
+    56,146,245,111,101,52,177,135,86,107,31,109,51,184,99,248,
+    190,101,159,50,195,130,124,122,73,47,249,165,226,220,10,46,
+    175,232,132,184,4,28,235,185,225,169,207,36,111,190,41,3,
+    97,93,95,165,120,172,215,67,192,149,30,2,174,244,16,112,
+    101,128,32,45,84,84,127,28,152,218,152,11,249,51,234,183,
+    228,66,116,215,250,149,60,4,223,172,74,158,160,75,225,168,
+    109,101,13,116,108,168,142,16,140,146,100,22,52,113,61,136,
+    177,8,39,235,46,227,36,190,41,74,25,217,168,83,129,4,
+    103,66,226,20,21,165,83,52,241,154,69,162,19,198,203,203,
+    254,112,18,82,230,39,241,119,159,199,75,75,73,153,208,187,
+    113,134,79,244,217,193,38,3,107,8,129,83,69,56,0,107,
+    103,4,250,8,238,14,28,14,240,63,132,119,121,169,172,164,
+    69,159,18,227,249,47,208,229,239,9,159,178,236,137,133,61,
+    7,207,211,26,79,44,80,43,3,116,204,204,168,81,36,57,
+    247,22,124,210,63,164,136,179,89,77,140,136,48,156,203,187,
+    154,34,26,253,250,206,204,60,70,121,153,100,38,153,61,119,
+    251,203,89,244,111,211,168,243,13,60,214,27,64,105,111,0,
+    165,189,161,206,141,112,90,99,51,194,163,109,189,233,227,153,
+    125,215,207,164,207,20,237,117,153,87,242,246,54,180,61,244,
+    180,100,207,221,124,58,207,118,22,157,173,233,228,234,155,121,
+    231,62,180,173,25,80,113,223,68,14,242,204,190,109,34,168,
+    190,75,125,246,108,39,28,37,69,5,252,247,205,122,194,255,
+    82,241,105,112,8,248,95,81,218,79,99,87,231,54,105,208,
+    166,152,144,46,220,210,87,86,88,100,40,167,103,53,190,238,
+    232,40,56,32,54,219,209,43,58,122,33,143,185,35,19,124,
+    251,96,250,96,209,93,127,115,32,203,137,238,174,117,247,64,
+    193,61,176,54,41,184,71,69,247,40,66,213,193,94,140,82,
+    39,5,182,227,211,146,154,236,214,237,124,181,26,154,68,4,
+    43,189,29,62,175,60,86,14,44,12,217,86,70,232,218,33,
+    139,149,200,226,109,179,126,81,91,181,88,9,231,208,6,63,
+    226,94,203,242,0,234,181,15,189,111,77,37,153,22,136,164,
+    123,173,138,123,237,202,227,26,241,210,54,77,93,219,22,117,
+    21,57,36,248,254,100,179,242,13,43,87,180,17,210,188,79,
+    61,22,91,215,60,75,252,62,107,140,110,37,255,219,29,227,
+    138,94,249,140,4,226,193,57,3,78,142,174,87,37,114,174,
+    78,68,99,156,226,215,161,63,69,40,32,220,121,249,12,34,
+    88,125,16,227,84,89,179,15,208,222,213,72,18,150,144,76,
+    36,249,37,80,36,13,6,18,241,192,235,216,204,197,225,136,
+    40,178,72,76,2,47,10,184,20,11,95,14,71,231,65,201,
+    62,28,10,57,249,8,224,190,223,165,136,42,39,26,75,126,
+    33,204,199,16,13,228,191,72,151,41,27,182,125,65,212,6,
+    255,46,20,56,225,67,148,46,179,167,152,133,125,5,14,113,
+    74,39,41,81,131,60,75,75,22,46,178,72,180,94,37,107,
+    132,231,65,79,131,30,175,113,53,193,254,71,74,34,89,241,
+    58,250,1,76,214,195,180,52,89,45,118,226,14,41,48,77,
+    136,227,203,51,77,16,228,188,23,34,165,201,202,7,254,22,
+    209,63,114,223,32,250,199,16,178,100,125,235,108,103,129,237,
+    204,237,189,59,190,150,188,247,166,56,114,92,96,159,19,217,
+    231,242,236,115,27,56,83,148,87,236,216,255,0,21,71,196,
+    142,227,130,231,57,209,3,151,240,35,43,17,213,13,235,158,
+    238,130,167,59,199,9,158,1,209,3,201,204,72,133,114,42,
+    8,79,195,205,67,57,131,232,193,139,45,224,43,71,242,82,
+    184,118,195,205,35,185,160,232,193,43,119,89,41,214,181,138,
+    57,180,209,59,23,114,220,221,216,125,78,104,59,40,182,29,
+    196,167,112,119,110,31,89,219,75,130,13,96,253,86,19,101,
+    63,77,3,19,32,54,12,231,217,231,209,246,225,36,249,69,
+    219,166,158,178,120,48,211,176,250,38,166,253,69,182,126,83,
+    71,215,29,66,204,129,221,145,62,133,184,83,103,107,118,90,
+    112,244,137,14,72,129,181,77,178,155,7,134,223,134,53,248,
+    71,78,123,115,118,171,212,54,160,222,216,34,33,14,165,202,
+    178,47,171,39,182,66,77,234,228,6,41,106,171,22,21,57,
+    243,53,125,175,129,160,32,169,78,237,181,22,181,73,117,106,
+    10,176,181,147,234,40,83,35,110,149,196,70,67,51,13,41,
+    67,134,230,159,194,105,44,141,41,195,22,169,106,170,211,88,
+    30,238,82,105,251,131,20,191,107,197,196,233,114,117,53,110,
+    199,238,255,181,198,25,127,101,245,10,54,230,148,121,142,78,
+    153,102,100,155,1,78,114,105,122,211,84,73,114,153,236,169,
+    60,153,31,65,227,88,91,65,64,171,50,250,239,104,52,170,
+    97,46,165,90,95,64,226,40,224,201,178,21,6,82,47,41,
+    215,22,168,74,0,4,100,172,230,122,2,213,254,225,201,61,
+    219,60,7,82,117,214,92,59,160,134,90,170,185,86,189,154,
+    169,58,183,105,49,17,74,30,80,94,85,174,19,112,73,94,
+    21,64,177,14,128,218,186,99,133,16,144,75,129,74,235,101,
+    223,225,228,196,54,111,233,255,109,122,143,159,118,172,82,7,
+    11,20,53,224,12,18,168,2,49,189,83,35,12,120,138,63,
+    143,246,150,187,222,88,169,153,53,244,141,149,225,55,86,64,
+    90,64,215,249,127,7,53,221,213,121,142,66,93,60,184,71,
+    240,176,138,52,241,229,0,122,200,191,6,68,77,67,6,177,
+    7,165,134,12,254,47,20,165,204,102,4,11,160,241,127,66,
+    129,130,101,46,206,47,132,147,36,172,205,131,151,16,35,202,
+    159,72,98,230,252,82,116,62,89,242,206,44,45,130,161,90,
+    117,77,65,87,1,236,97,161,183,72,152,151,244,66,56,184,
+    27,148,69,252,87,100,219,141,198,56,131,173,54,176,34,40,
+    33,198,140,130,101,198,89,147,32,253,17,9,170,123,0,197,
+    207,161,0,249,176,198,202,152,36,234,164,102,38,165,127,11,
+    116,249,45,108,52,65,84,239,219,79,191,253,116,118,143,96,
+    107,23,109,237,82,46,37,183,156,6,244,220,218,152,192,142,
+    138,236,104,158,29,149,83,35,253,227,16,237,191,54,10,158,
+    41,209,51,149,103,167,84,100,251,33,164,114,34,205,11,108,
+    80,100,131,235,236,96,129,29,92,123,73,96,247,136,236,158,
+    60,187,135,116,68,177,122,162,151,228,56,199,185,146,30,83,
+    157,136,188,234,108,246,250,98,115,32,195,20,253,173,223,183,
+    127,215,158,139,8,254,65,108,221,201,24,159,108,120,90,54,
+    41,198,94,95,41,138,245,135,215,235,39,11,245,147,69,175,
+    175,232,245,223,156,18,189,3,232,183,232,109,124,108,49,130,
+    48,135,138,140,30,73,114,205,109,217,250,12,125,211,84,116,
+    249,112,178,213,58,116,51,44,12,229,166,92,144,174,211,126,
+    134,46,186,188,235,174,80,193,21,90,11,222,55,252,148,93,
+    223,245,76,97,215,51,31,122,133,93,199,197,93,240,206,174,
+    41,17,167,111,45,118,244,224,5,27,189,2,219,134,185,1,
+    224,23,200,122,87,149,5,177,209,1,126,158,242,45,243,174,
+    30,112,49,235,202,141,149,83,214,211,246,193,251,221,235,187,
+    159,45,236,126,86,216,61,41,238,158,84,169,190,32,151,107,
+    89,245,133,120,139,186,96,238,152,224,234,23,93,253,155,122,
+    131,125,244,145,167,53,27,121,239,243,119,191,40,118,239,19,
+    60,251,69,207,254,77,35,58,141,122,20,26,205,24,110,146,
+    60,84,15,165,132,81,108,71,37,205,20,206,72,229,42,103,
+    164,146,87,58,173,228,150,42,178,199,51,231,110,126,69,244,
+    13,230,217,227,104,251,208,64,126,31,235,117,78,240,41,119,
+    18,159,242,4,64,235,95,118,52,76,28,160,254,242,128,117,
+    114,143,254,175,244,3,147,195,250,191,26,54,162,253,218,50,
+    25,4,192,168,50,79,33,82,161,206,101,32,115,240,213,156,
+    185,129,44,78,187,236,154,138,199,134,150,35,124,92,114,200,
+    236,93,118,244,2,182,169,184,184,208,37,43,118,85,33,107,
+    166,5,104,77,150,23,112,26,171,98,124,137,95,161,21,81,
+    213,4,184,197,225,53,26,51,29,111,239,79,239,71,44,101,
+    250,249,13,135,63,223,248,244,218,4,42,200,38,56,158,17,
+    29,207,228,153,103,170,21,64,53,188,86,96,101,93,112,38,
+    37,110,106,90,181,149,121,102,102,62,18,155,153,89,174,83,
+    118,10,159,114,27,42,233,36,156,174,244,215,170,5,94,57,
+    248,240,8,165,213,39,164,232,37,41,229,54,54,21,201,231,
+    149,220,36,71,131,88,20,198,46,243,252,101,26,59,204,96,
+    213,12,60,174,236,60,99,141,207,115,146,50,94,147,106,6,
+    99,73,114,101,185,94,145,102,70,113,190,30,94,97,8,191,
+    194,67,36,247,167,178,203,36,84,78,10,152,35,1,127,27,
+    140,63,123,84,96,90,243,234,52,177,74,230,89,126,209,167,
+    168,79,139,178,84,102,11,151,94,80,87,121,65,61,121,193,
+    47,202,111,41,41,56,96,201,97,236,131,164,142,2,252,5,
+    0,157,183,242,110,149,12,195,173,6,41,112,12,189,89,67,
+    171,66,131,190,197,219,212,4,146,45,147,49,189,79,147,126,
+    106,161,197,122,65,238,128,178,91,149,179,61,6,69,50,38,
+    207,22,201,152,62,189,253,16,77,134,72,219,62,3,45,129,
+    65,70,169,139,43,159,235,87,183,189,92,211,78,43,127,73,
+    111,85,219,28,181,36,71,236,175,212,104,29,147,97,229,107,
+    87,146,138,15,67,211,206,202,107,231,246,230,21,14,176,53,
+    85,112,211,85,237,87,105,122,106,171,228,170,92,217,213,207,
+    56,172,10,91,196,92,197,50,170,252,190,50,220,20,124,49,
+    212,128,198,107,240,146,130,5,217,99,144,67,64,97,117,97,
+    68,27,68,87,16,81,77,6,137,230,77,5,6,81,104,129,
+    9,136,76,32,207,4,96,37,107,132,217,243,229,68,222,213,
+    19,73,246,90,131,62,105,83,77,87,235,7,119,146,167,130,
+    63,161,182,52,124,79,206,245,75,208,185,42,248,71,51,120,
+    21,85,14,226,54,205,85,252,189,82,5,110,72,233,84,234,
+    30,186,22,135,170,144,122,101,190,86,82,141,213,78,182,90,
+    45,83,108,147,156,52,209,137,70,164,182,138,173,70,66,115,
+    44,11,41,188,147,84,1,201,136,143,6,79,163,229,81,121,
+    65,81,224,146,37,189,57,168,152,96,121,81,153,177,198,81,
+    137,150,169,120,50,50,30,88,110,40,107,161,194,10,150,58,
+    62,23,88,246,247,189,200,71,46,71,227,75,137,249,171,1,
+    200,143,133,110,228,2,232,177,33,43,15,235,170,19,54,22,
+    18,109,147,112,111,204,96,99,52,131,161,20,64,144,228,77,
+    7,172,199,255,142,86,17,143,25,96,165,195,164,108,60,61,
+    0,16,106,194,42,163,13,87,239,26,98,151,134,69,215,48,
+    102,236,214,109,205,5,91,179,96,107,21,109,173,176,82,18,
+    228,252,196,11,187,211,117,83,52,41,179,65,229,81,177,25,
+    82,165,203,135,27,251,15,61,56,247,115,235,47,172,226,254,
+    231,149,231,177,218,229,55,216,28,3,5,164,187,175,203,215,
+    61,187,118,236,222,11,232,7,109,15,38,201,175,192,78,136,
+    236,68,158,157,192,60,78,81,169,47,218,180,162,155,202,105,
+    69,5,88,41,169,51,207,118,170,82,185,235,44,161,34,43,
+    215,201,237,21,216,62,145,237,203,179,125,69,188,114,183,42,
+    105,190,17,85,198,119,212,118,78,193,179,238,56,253,25,179,
+    109,255,30,54,184,211,43,219,174,214,147,232,83,205,53,173,
+    172,216,184,253,58,60,53,151,140,183,109,125,7,127,16,205,
+    134,154,137,142,53,18,118,175,42,242,137,198,115,69,171,55,
+    248,45,150,203,88,253,86,57,199,92,111,119,34,16,230,226,
+    139,120,154,196,249,197,139,225,152,54,93,111,0,213,233,13,
+    89,136,136,135,13,255,39,104,205,34,21,114,190,92,208,28,
+    41,228,61,60,81,190,66,87,120,132,0,37,89,242,53,73,
+    222,113,23,206,224,230,137,95,194,114,179,114,146,104,46,126,
+    14,38,11,180,130,208,185,191,229,54,187,238,239,47,248,251,
+    137,160,3,153,72,66,184,144,140,195,158,96,238,108,57,72,
+    196,96,239,251,245,240,209,15,187,132,225,227,226,240,113,124,
+    12,235,153,245,228,102,133,250,126,177,190,63,163,47,6,123,
+    101,219,181,34,16,4,210,68,134,238,235,255,165,227,159,59,
+    132,93,207,136,187,158,193,39,240,170,91,71,62,52,124,56,
+    43,184,78,137,174,83,121,215,169,138,221,189,178,132,22,72,
+    75,82,159,182,201,234,248,95,169,42,91,180,141,83,153,85,
+    72,238,247,179,90,171,180,188,191,205,250,81,94,21,220,110,
+    19,165,162,154,87,59,200,179,5,65,200,114,194,52,179,18,
+    91,227,148,180,216,59,85,121,118,25,95,193,107,78,29,146,
+    192,237,19,250,8,15,22,101,140,205,67,102,130,78,177,250,
+    66,94,12,144,216,172,191,64,73,108,103,153,175,54,46,66,
+    218,86,149,112,2,117,150,29,138,108,135,168,194,151,1,92,
+    32,249,129,196,217,128,39,67,111,209,51,146,229,110,199,242,
+    158,17,105,99,71,54,236,13,89,195,109,246,189,5,193,190,
+    87,180,239,5,37,119,175,202,168,157,103,123,36,233,187,163,
+    224,234,16,92,93,162,171,11,163,232,204,241,183,159,78,63,
+    13,202,243,241,60,219,90,116,122,51,137,235,111,100,207,221,
+    158,22,182,136,33,146,89,184,47,82,218,175,142,83,145,87,
+    190,193,14,112,155,210,134,121,129,38,35,124,161,178,168,7,
+    30,208,146,5,70,98,6,34,255,106,178,165,252,170,134,50,
+    201,213,47,192,232,237,162,164,140,177,171,135,64,117,95,143,
+    45,8,235,158,80,193,19,34,38,134,181,228,189,229,181,121,
+    193,131,222,127,28,82,62,215,167,79,110,243,214,253,212,206,
+    141,139,101,118,246,101,170,70,175,33,83,164,90,236,195,249,
+    84,99,6,137,51,199,95,252,219,87,223,190,122,253,141,213,
+    55,242,76,211,255,128,62,33,169,46,30,155,139,94,32,89,
+    208,84,82,157,226,252,215,12,160,188,131,15,241,63,160,71,
+    230,104,44,10,3,163,28,41,233,84,82,221,15,165,245,66,
+    86,59,124,183,138,226,170,216,124,131,42,3,173,161,2,139,
+    91,227,163,4,22,39,85,56,201,176,85,106,234,21,227,118,
+    20,116,197,164,186,170,81,123,172,32,140,180,194,168,76,163,
+    154,168,45,254,43,41,166,162,181,93,177,164,44,223,56,156,
+    178,84,140,194,73,119,229,94,9,203,13,165,44,57,197,50,
+    107,138,103,27,83,38,174,154,46,111,93,219,92,197,239,50,
+    21,179,240,246,253,190,255,101,101,98,158,255,64,225,224,83,
+    172,208,197,72,19,187,194,99,204,57,12,5,168,209,75,54,
+    5,193,230,95,133,79,254,52,37,137,240,60,232,199,49,158,
+    64,124,46,38,212,96,108,40,89,64,111,65,214,135,178,72,
+    203,144,46,69,240,226,107,216,31,190,196,192,245,248,249,75,
+    9,178,94,41,222,51,196,226,92,164,100,196,186,37,44,201,
+    106,29,219,191,6,136,166,77,49,101,107,168,147,175,2,206,
+    1,59,50,145,215,216,236,75,24,211,194,234,127,221,183,7,
+    222,91,17,156,99,162,115,12,16,180,7,243,164,27,206,214,
+    108,228,246,107,130,179,95,116,246,167,13,27,158,142,92,136,
+    100,177,78,51,170,3,132,13,32,165,89,99,54,40,56,218,
+    69,71,59,228,169,15,128,226,243,12,78,81,150,119,6,114,
+    47,137,221,99,191,62,112,178,208,125,50,223,125,178,232,242,
+    221,178,220,176,100,131,57,102,173,83,112,13,137,174,161,188,
+    107,72,113,86,112,133,68,87,40,239,10,97,140,152,158,252,
+    216,70,57,155,84,79,175,85,84,203,212,50,123,123,165,106,
+    178,1,91,249,141,58,88,197,72,17,246,162,184,247,53,12,
+    108,252,239,130,95,181,146,20,212,118,97,169,98,139,95,65,
+    19,88,53,17,53,19,228,132,114,130,169,64,82,83,83,125,
+    132,158,60,176,98,76,233,183,16,26,141,23,52,40,97,11,
+    230,181,74,56,93,29,92,157,86,190,61,44,150,67,24,111,
+    165,54,75,185,220,250,86,30,29,156,94,235,25,81,214,145,
+    86,116,141,104,58,124,185,172,231,34,34,222,139,112,120,147,
+    46,207,44,44,5,78,65,129,115,7,130,53,165,156,40,18,
+    207,65,192,157,37,243,249,171,24,188,177,210,130,228,6,151,
+    195,183,43,203,28,73,57,122,102,226,115,184,178,146,3,174,
+    186,152,134,9,242,43,170,60,65,156,152,11,73,31,206,30,
+    203,117,220,62,241,235,190,253,133,150,253,249,150,253,197,122,
+    127,250,185,98,99,235,237,182,245,198,225,66,227,176,208,184,
+    75,108,4,111,78,251,179,52,41,51,198,13,79,91,118,73,
+    240,116,139,158,110,136,239,120,150,222,104,31,250,128,187,63,
+    246,254,107,247,94,19,218,199,197,118,136,237,245,65,125,40,
+    179,250,162,191,157,176,219,107,123,238,235,136,31,231,186,127,
+    188,224,31,127,48,38,248,143,138,254,163,121,188,61,217,240,
+    117,231,94,207,123,71,208,188,106,235,2,175,35,224,138,62,
+    183,122,229,219,169,183,83,168,155,187,213,241,202,170,185,32,
+    155,249,255,170,90,193,82,237,249,98,128,80,193,57,29,32,
+    67,4,7,59,116,2,67,208,121,118,69,207,233,212,9,104,
+    83,122,45,76,240,46,117,222,21,237,117,48,102,39,134,176,
+    67,25,153,133,221,16,209,32,237,183,171,114,173,168,149,47,
+    52,135,230,134,242,184,218,80,152,210,175,232,86,207,41,103,
+    156,82,8,212,170,129,180,227,130,222,240,208,138,81,233,223,
+    148,50,42,136,182,73,213,103,93,202,180,163,62,155,82,166,
+    79,233,179,9,245,249,112,74,87,121,58,124,153,144,121,234,
+    220,241,18,51,115,57,154,136,38,35,220,114,167,164,143,9,
+    199,174,6,22,194,201,217,139,17,46,176,16,39,78,176,49,
+    200,36,53,142,132,130,192,178,17,39,148,64,146,39,38,105,
+    119,96,206,97,127,29,236,215,131,87,68,192,18,65,39,85,
+    158,135,32,161,150,189,201,113,184,149,5,175,73,5,132,137,
+    196,110,153,165,30,72,228,13,183,141,201,150,214,159,188,196,
+    192,162,82,224,6,175,212,210,150,207,221,132,217,183,151,40,
+    107,108,190,12,151,61,38,216,58,69,27,100,26,179,128,247,
+    77,214,155,1,57,224,161,215,159,182,20,125,141,235,190,129,
+    130,111,96,237,152,224,219,45,250,118,111,82,54,75,39,46,
+    208,212,168,111,78,63,183,225,172,207,44,101,47,85,140,90,
+    99,27,77,29,185,238,181,38,161,105,175,216,180,55,99,126,
+    232,105,218,164,76,246,206,162,167,37,103,40,120,130,121,79,
+    112,205,119,63,84,8,29,204,135,14,110,52,245,101,135,31,
+    54,7,111,31,201,162,127,107,99,247,198,215,198,55,245,116,
+    227,190,199,122,61,164,159,209,67,250,25,189,175,126,147,161,
+    90,59,51,150,39,143,124,193,247,206,173,5,127,48,125,119,
+    250,190,79,240,237,19,125,251,54,41,51,244,200,140,123,4,
+    242,52,162,129,254,129,244,73,156,153,175,224,12,0,85,124,
+    5,181,215,125,48,223,125,112,163,62,152,137,61,108,8,220,
+    124,51,131,254,229,174,222,125,51,247,38,106,207,183,79,155,
+    205,134,161,26,59,177,31,61,122,74,40,151,44,52,65,222,
+    79,121,237,220,154,250,228,234,5,236,48,237,115,33,40,172,
+    105,155,144,96,214,191,157,122,84,75,27,56,58,12,169,87,
+    182,8,211,213,132,150,99,188,194,91,104,140,212,53,44,19,
+    232,118,248,69,56,7,94,228,101,5,135,140,244,53,14,184,
+    4,116,230,231,171,193,105,126,254,190,65,246,237,124,168,66,
+    230,98,203,224,175,119,61,83,104,121,38,223,242,204,134,23,
+    220,185,240,82,98,21,148,218,137,68,210,118,132,88,191,189,
+    252,246,114,182,91,112,6,68,244,169,130,249,45,240,170,108,
+    179,48,73,227,172,202,162,34,229,217,130,28,44,42,35,149,
+    121,41,134,23,21,85,10,15,210,169,159,43,173,107,158,180,
+    173,90,150,145,23,181,29,214,125,86,173,221,10,253,233,76,
+    205,22,62,190,4,60,184,237,116,118,252,75,224,135,180,213,
+    154,217,85,62,72,67,93,26,183,83,89,79,191,163,248,237,
+    90,218,246,111,150,125,140,212,30,95,181,18,124,125,75,181,
+    144,173,194,187,107,39,99,89,29,138,87,219,27,172,202,181,
+    87,143,190,194,62,28,59,95,89,220,172,246,87,48,104,37,
+    183,148,81,254,10,190,45,99,227,171,243,26,237,47,39,32,
+    107,38,254,49,209,88,64,130,184,138,151,76,239,178,177,23,
+    84,246,33,59,17,123,112,128,46,86,81,98,143,22,160,148,
+    252,26,204,206,231,232,50,161,192,142,48,56,101,32,94,129,
+    210,144,136,243,73,28,141,84,230,216,176,131,9,94,8,208,
+    138,253,174,241,138,63,37,139,188,207,255,5,85,131,117,179,
+    75,125,147,20,151,13,85,211,132,92,248,133,161,178,84,174,
+    175,241,230,151,215,125,61,5,95,143,224,235,19,125,125,155,
+    148,21,98,124,80,129,230,54,146,70,78,175,123,131,5,111,
+    48,247,146,60,225,157,222,172,225,237,149,244,202,123,13,107,
+    190,31,180,221,109,75,175,108,234,76,117,77,197,150,142,239,
+    191,240,221,23,214,130,66,203,136,216,50,146,57,150,57,246,
+    100,83,103,168,107,218,240,54,22,253,103,238,71,242,254,51,
+    104,251,48,248,111,66,191,10,253,114,224,175,6,200,241,99,
+    189,206,7,169,201,124,36,53,25,172,142,209,244,228,201,147,
+    13,23,94,94,76,225,55,241,228,99,134,170,71,242,204,237,
+    129,245,166,254,66,83,191,208,52,40,54,13,10,190,33,209,
+    55,148,182,22,25,247,183,157,111,59,5,166,81,100,26,243,
+    76,99,177,177,11,116,107,164,64,152,31,137,68,79,75,139,
+    10,93,21,60,163,162,103,52,61,137,16,69,38,249,118,42,
+    157,2,77,41,123,131,205,158,19,92,157,162,171,51,239,234,
+    124,2,139,230,146,155,241,74,60,191,100,125,71,59,117,191,
+    236,236,127,150,53,170,16,25,192,61,198,42,37,61,201,191,
+    170,114,129,160,175,239,104,62,128,158,140,211,97,253,36,125,
+    79,175,149,196,175,171,8,205,206,158,136,181,253,10,44,112,
+    29,22,129,80,179,147,141,170,158,26,175,171,173,119,186,90,
+    61,81,138,95,215,127,203,124,17,26,92,247,5,85,235,38,
+    206,92,91,232,42,175,28,160,94,93,224,31,210,242,246,153,
+    204,150,77,181,191,129,166,253,10,182,251,12,237,191,250,210,
+    138,238,58,245,105,129,187,85,218,37,132,37,101,12,182,71,
+    109,233,133,69,198,148,79,76,41,69,206,29,4,243,162,239,
+    173,175,245,214,171,47,107,222,91,246,35,253,76,239,253,252,
+    138,225,186,34,127,196,22,239,93,189,146,135,18,119,247,169,
+    222,220,128,151,87,51,254,131,222,241,180,58,243,222,61,189,
+    150,6,96,10,96,157,250,132,254,210,39,244,171,33,186,100,
+    152,139,206,71,48,151,191,108,4,1,248,240,178,173,44,19,
+    31,238,78,240,48,61,107,231,148,3,133,168,34,167,92,23,
+    228,148,171,173,200,220,201,20,151,50,208,5,171,252,19,174,
+    209,114,34,58,254,44,20,56,179,87,117,42,186,30,133,134,
+    29,66,23,32,168,174,70,250,185,13,32,22,16,211,42,231,
+    82,213,55,187,113,241,208,223,184,169,167,16,1,153,202,141,
+    138,222,238,117,239,112,193,59,44,120,119,137,222,93,155,250,
+    114,165,90,5,102,206,62,161,15,135,92,21,146,88,98,201,
+    42,155,179,145,73,136,179,197,210,21,150,164,112,34,58,252,
+    98,152,174,150,160,0,111,15,66,107,43,100,246,6,45,81,
+    83,37,29,133,53,195,162,51,248,131,201,20,149,191,7,53,
+    101,250,249,85,5,253,180,200,3,161,178,63,148,79,22,48,
+    147,169,43,167,151,78,207,102,38,111,157,188,113,242,157,231,
+    111,62,47,56,218,115,93,130,163,123,237,68,158,25,19,152,
+    49,145,25,67,59,15,131,125,191,207,102,206,221,122,229,198,
+    43,239,124,233,230,151,4,166,227,17,206,144,81,47,216,2,
+    162,45,0,66,218,83,56,67,70,55,162,107,33,244,131,54,
+    244,4,118,76,96,199,68,118,12,237,60,178,57,32,36,109,
+    221,217,89,112,118,10,206,160,232,12,150,23,144,103,44,14,
+    116,111,209,213,90,116,251,110,245,221,232,171,53,210,143,90,
+    187,114,147,119,167,214,131,251,10,193,125,66,240,128,24,60,
+    32,180,142,139,173,227,155,70,116,245,49,84,1,185,12,246,
+    60,176,231,113,63,214,67,188,156,149,170,111,219,180,155,237,
+    142,199,148,25,44,243,102,176,204,163,226,99,55,85,223,146,
+    157,188,125,122,189,101,168,208,50,68,72,189,224,219,37,250,
+    118,129,63,128,27,23,159,198,56,108,184,124,197,134,150,188,
+    247,8,218,178,201,219,169,181,99,98,251,238,245,246,241,66,
+    251,184,208,126,72,108,63,68,46,21,27,59,80,47,235,160,
+    111,117,208,183,58,34,205,65,232,112,83,32,103,184,107,91,
+    15,236,42,4,118,9,129,221,98,96,183,208,184,71,108,220,
+    3,4,251,56,77,74,13,209,191,31,20,60,251,68,207,62,
+    5,217,71,253,200,54,230,235,199,208,150,59,247,227,47,255,
+    240,203,63,248,202,221,175,144,227,7,39,242,174,99,130,235,
+    152,232,58,134,118,158,60,98,236,153,253,121,166,69,96,90,
+    68,166,37,95,222,182,9,231,117,87,165,145,210,26,43,85,
+    166,138,234,20,83,172,58,28,176,146,15,66,115,159,118,93,
+    101,86,29,160,161,88,147,96,139,21,146,181,235,93,86,242,
+    87,108,181,242,113,213,29,114,45,181,86,168,162,239,217,73,
+    186,167,42,114,113,0,116,104,10,82,91,59,96,100,59,50,
+    217,128,4,139,29,100,64,0,1,7,103,76,24,215,244,191,
+    18,78,242,89,250,223,131,5,21,249,25,154,36,95,198,218,
+    65,25,85,61,35,185,28,122,53,61,171,16,209,207,210,179,
+    241,21,147,50,111,197,22,35,107,170,34,196,230,148,89,49,
+    182,230,29,190,129,9,191,193,65,156,196,73,63,69,144,58,
+    44,175,17,170,43,49,224,12,207,169,241,61,92,194,52,140,
+    56,215,97,113,169,130,239,53,178,85,134,150,136,67,201,13,
+    126,139,146,89,51,76,146,39,41,168,1,241,226,47,209,156,
+    130,12,96,218,136,213,224,21,130,80,237,195,255,115,90,149,
+    173,125,184,186,153,255,6,84,97,142,168,224,88,239,245,83,
+    171,167,210,244,134,22,205,183,131,160,245,74,250,232,234,113,
+    114,169,185,140,197,105,75,168,216,212,118,123,24,93,122,30,
+    9,63,238,250,91,173,55,90,223,105,191,217,158,166,87,77,
+    197,58,223,173,198,27,141,239,52,223,108,134,195,71,190,230,
+    173,112,175,222,66,138,79,195,189,197,230,192,122,243,80,161,
+    121,72,104,30,17,155,71,50,116,166,251,29,230,201,163,58,
+    112,55,112,172,251,7,10,254,1,193,63,36,250,135,132,186,
+    97,177,110,24,76,68,164,72,31,197,78,249,152,210,167,143,
+    109,50,148,87,149,37,41,125,52,29,190,62,153,158,124,212,
+    216,190,21,106,54,66,226,6,84,124,58,98,70,227,16,8,
+    174,183,63,85,104,127,74,104,223,47,182,239,71,221,12,189,
+    195,62,121,232,116,73,43,221,168,144,174,156,145,250,109,67,
+    149,7,131,89,237,14,139,87,42,165,17,242,85,170,218,233,
+    10,194,84,172,202,166,9,71,189,163,93,183,78,7,139,237,
+    105,215,248,82,135,190,106,212,226,250,74,250,31,181,134,165,
+    18,59,87,219,62,187,173,246,196,144,50,236,80,123,98,192,
+    57,251,90,177,42,254,211,22,135,175,145,22,232,90,151,50,
+    224,22,162,141,106,199,203,105,16,64,85,10,153,148,41,231,
+    250,244,251,86,76,202,5,223,149,99,164,52,30,36,131,138,
+    251,213,132,240,143,84,247,155,148,139,54,107,61,0,192,175,
+    94,109,124,73,25,181,168,79,149,213,78,227,219,202,147,39,
+    40,219,51,111,221,30,223,158,12,169,219,82,65,131,38,231,
+    107,149,230,237,255,76,153,16,10,239,94,97,182,239,241,22,
+    57,1,153,42,13,87,79,134,94,101,181,61,66,189,208,180,
+    139,106,181,107,160,86,142,2,252,12,80,107,73,89,118,8,
+    181,22,244,182,167,87,172,168,61,57,195,248,22,48,107,173,
+    34,88,182,148,77,38,88,46,117,94,66,77,127,216,152,142,
+    163,87,52,227,192,25,82,86,172,155,49,98,221,12,91,245,
+    45,94,192,139,64,85,238,80,225,154,144,137,152,112,75,38,
+    73,29,215,219,157,24,238,78,4,94,143,38,47,198,151,146,
+    1,105,49,39,188,152,65,34,130,67,239,2,196,195,193,136,
+    213,124,96,136,141,199,98,17,156,170,5,237,46,197,146,33,
+    63,63,13,180,234,33,85,182,61,253,39,40,240,114,200,152,
+    120,98,231,52,76,55,177,114,177,66,50,255,152,86,210,205,
+    146,113,46,156,12,207,19,193,11,162,0,94,198,238,20,114,
+    42,67,34,116,97,37,37,182,37,87,8,169,157,168,39,33,
+    102,174,228,154,157,37,161,233,56,213,224,18,36,115,146,207,
+    148,108,149,37,232,18,10,109,166,254,114,100,150,135,176,15,
+    30,6,191,66,121,37,53,39,126,203,4,116,161,58,15,161,
+    180,14,162,52,152,62,21,73,46,159,174,71,115,34,49,173,
+    43,123,136,225,128,241,78,28,73,158,103,59,32,253,107,103,
+    101,177,231,230,206,220,238,187,7,197,174,177,7,193,95,132,
+    242,251,158,39,155,208,124,90,108,62,157,103,252,69,111,48,
+    239,13,10,222,30,209,219,147,182,108,52,182,100,207,189,219,
+    120,187,49,109,89,117,60,170,135,112,243,67,235,205,131,133,
+    230,65,161,121,88,108,30,22,234,71,196,250,145,180,173,200,
+    120,52,33,246,69,31,98,0,26,44,163,143,161,216,154,60,
+    19,177,200,123,24,93,47,203,148,16,250,102,54,128,236,3,
+    34,153,148,199,196,215,116,107,234,198,148,224,13,138,222,96,
+    250,24,184,161,4,111,15,230,150,196,166,161,15,190,46,56,
+    159,22,157,79,111,82,118,251,40,100,37,236,254,192,43,52,
+    12,67,252,187,75,218,54,234,91,179,209,53,31,233,108,70,
+    191,209,220,150,77,188,187,255,246,254,188,171,139,108,31,35,
+    186,222,150,157,125,111,175,224,233,19,61,125,208,232,33,88,
+    92,226,100,110,73,182,196,123,199,69,239,120,30,111,15,91,
+    193,208,232,59,132,139,44,189,225,111,207,89,214,198,4,255,
+    168,232,31,93,247,239,47,248,247,63,168,19,252,7,69,255,
+    193,60,222,96,173,137,67,31,155,96,29,99,75,110,108,173,
+    91,78,220,142,118,30,249,26,127,43,229,174,21,210,246,160,
+    98,7,114,94,107,32,231,125,247,149,219,175,64,2,200,135,
+    173,109,25,235,6,235,41,186,26,139,174,134,108,72,64,239,
+    221,3,73,215,139,174,38,52,218,32,236,26,64,216,149,11,
+    36,109,118,225,116,88,78,207,234,155,121,166,117,27,191,217,
+    35,85,14,51,137,176,210,195,53,209,166,246,151,213,248,123,
+    59,149,26,91,109,230,0,200,226,164,193,53,50,175,146,24,
+    74,237,216,67,118,71,34,157,162,157,216,136,42,168,167,188,
+    212,112,80,109,232,220,153,197,137,211,87,231,166,210,224,76,
+    195,212,114,231,209,74,150,34,162,19,74,70,33,45,180,228,
+    163,11,78,93,216,203,108,57,52,30,32,41,96,177,105,29,
+    76,51,132,49,95,34,235,89,5,46,70,35,124,152,159,189,
+    120,117,24,241,255,56,199,6,118,63,53,69,19,159,143,199,
+    147,36,99,209,5,40,254,53,62,77,214,208,195,56,177,108,
+    129,4,196,170,242,233,253,152,82,7,246,40,86,102,61,3,
+    168,231,61,170,236,218,251,38,44,92,224,120,8,174,88,96,
+    72,63,73,127,96,90,75,190,207,222,99,201,209,70,125,103,
+    190,235,57,161,254,132,88,127,34,239,58,129,80,83,91,0,
+    66,16,0,150,15,131,71,247,104,177,177,117,189,49,84,104,
+    12,9,141,3,98,227,64,198,84,236,232,253,113,235,15,91,
+    127,208,126,183,61,99,184,233,120,82,180,215,173,126,37,203,
+    23,236,29,121,123,199,134,27,172,253,183,14,220,56,240,206,
+    193,155,7,243,174,147,100,123,172,215,65,178,43,29,36,187,
+    210,33,96,198,217,147,182,134,98,224,96,62,250,39,168,40,
+    43,41,137,146,113,171,117,5,118,178,92,80,149,240,217,94,
+    142,125,72,233,118,226,22,118,140,226,168,55,244,168,31,186,
+    223,51,32,138,27,168,168,59,13,68,44,172,36,1,124,22,
+    138,234,64,151,103,53,223,76,145,100,240,171,240,205,94,67,
+    215,137,106,179,232,112,167,173,240,15,161,193,150,206,92,240,
+    238,240,122,231,83,133,206,167,132,206,253,98,231,126,161,249,
+    128,216,124,0,40,202,0,46,174,63,159,158,204,116,23,27,
+    90,214,27,250,10,13,125,66,67,191,216,208,159,103,107,111,
+    144,3,142,220,182,141,210,232,46,85,229,116,128,102,236,55,
+    234,32,204,118,91,135,187,17,229,57,53,142,217,201,24,171,
+    191,209,156,14,90,85,225,26,90,233,196,70,196,120,217,57,
+    13,125,135,47,209,101,79,132,129,242,128,203,126,241,56,141,
+    163,202,138,239,158,227,227,203,145,152,50,217,163,82,192,174,
+    190,10,130,152,228,148,80,116,121,69,87,111,109,23,179,13,
+    95,247,123,75,107,231,214,135,14,23,134,14,11,67,79,139,
+    67,79,11,189,207,136,189,207,228,189,71,17,137,237,25,128,
+    180,195,93,146,239,87,218,185,205,119,248,103,85,223,129,239,
+    86,101,124,71,163,179,19,216,39,81,18,213,1,134,59,249,
+    38,244,14,21,118,146,125,66,63,181,220,63,17,142,65,32,
+    153,18,103,34,124,25,62,143,152,179,240,108,82,17,75,211,
+    135,19,185,133,140,4,251,253,133,108,149,6,60,136,81,92,
+    149,219,182,131,32,199,50,174,91,246,43,92,201,85,87,120,
+    248,86,175,80,101,6,236,48,128,252,25,26,235,184,95,120,
+    144,252,139,171,127,118,245,231,111,252,226,13,116,64,54,129,
+    157,18,89,72,63,80,100,88,45,223,84,117,134,108,255,184,
+    94,234,33,186,230,11,243,31,210,234,36,158,101,30,249,10,
+    188,159,151,146,176,252,186,179,189,224,108,23,156,29,162,83,
+    94,84,178,100,225,35,115,17,30,98,144,208,195,97,97,102,
+    85,200,166,198,243,165,106,253,32,60,107,204,209,57,98,229,
+    31,172,114,223,49,163,158,188,136,88,101,165,15,140,116,234,
+    13,163,236,3,243,144,97,165,117,14,106,115,42,191,71,109,
+    183,94,204,103,194,235,141,191,29,94,71,184,188,169,10,151,
+    131,136,129,113,57,72,18,19,68,248,81,38,173,43,153,65,
+    74,248,124,100,78,61,38,172,36,39,193,32,36,52,97,14,
+    242,249,111,192,232,156,198,163,131,56,208,182,32,164,182,94,
+    15,30,40,4,15,8,193,131,98,240,160,208,122,72,108,5,
+    90,109,193,10,187,192,245,23,16,122,239,45,178,158,117,182,
+    181,192,182,10,108,187,88,89,8,182,92,169,182,103,19,38,
+    163,32,19,19,50,202,213,242,110,42,25,241,98,23,106,204,
+    8,54,55,72,172,62,25,185,28,157,141,156,227,35,17,181,
+    234,81,123,245,58,188,19,136,209,18,253,98,28,105,83,237,
+    68,122,184,75,223,164,42,148,253,183,246,126,234,132,47,139,
+    126,91,177,191,78,237,204,85,26,158,85,67,187,219,86,187,
+    56,69,44,80,197,135,249,63,210,149,172,103,37,90,210,202,
+    226,213,137,22,212,153,206,96,205,145,217,37,62,161,28,32,
+    133,111,114,213,197,223,135,241,185,84,25,31,95,227,205,175,
+    172,251,250,11,190,126,193,55,40,250,6,33,192,115,28,23,
+    224,110,216,10,172,217,56,46,50,134,98,115,251,122,243,238,
+    66,243,238,251,99,132,240,231,93,181,55,88,112,106,124,83,
+    95,126,208,167,160,39,112,17,41,47,205,123,93,181,82,163,
+    22,61,105,23,223,4,253,23,88,227,63,250,42,69,86,228,
+    133,52,211,175,246,3,173,86,206,99,37,157,186,174,171,157,
+    81,114,59,103,249,63,212,173,14,156,149,177,17,94,124,105,
+    119,89,201,46,47,218,137,237,221,4,67,85,25,151,63,177,
+    30,2,173,248,108,124,97,241,200,242,94,133,227,120,120,113,
+    113,254,106,89,119,14,106,116,168,166,48,56,203,119,253,17,
+    124,53,8,3,121,130,173,205,176,240,101,185,120,232,130,212,
+    247,246,134,95,251,7,62,152,188,239,253,105,219,135,86,113,
+    244,121,97,240,180,56,120,90,240,191,32,250,95,216,212,171,
+    110,32,75,56,181,209,74,20,79,86,237,44,213,215,238,209,
+    114,224,211,250,252,29,163,20,134,6,253,211,169,154,35,157,
+    108,235,188,29,219,52,162,189,199,112,248,27,233,130,101,187,
+    28,151,229,224,187,28,85,235,79,35,198,233,240,34,138,238,
+    21,189,202,22,168,175,17,92,235,33,11,237,132,225,19,202,
+    217,122,35,87,34,179,129,48,94,122,15,220,214,94,188,154,
+    188,24,7,217,137,131,101,115,113,122,65,16,164,146,225,104,
+    44,130,165,42,162,209,145,22,232,133,191,115,23,35,100,49,
+    223,200,149,197,120,2,85,186,48,31,63,143,62,34,72,108,
+    232,89,137,202,115,194,216,147,58,66,86,253,149,239,175,172,
+    28,12,237,39,47,226,8,120,46,162,106,1,157,147,211,20,
+    71,97,105,95,88,193,142,172,233,73,150,6,4,157,25,110,
+    113,33,206,69,231,174,86,30,42,63,228,255,239,237,218,98,
+    227,184,202,240,57,187,59,187,227,157,241,94,188,23,175,29,
+    199,206,38,190,100,19,59,14,36,139,106,59,169,32,105,82,
+    59,137,210,64,105,164,136,75,228,196,155,18,201,246,134,217,
+    117,192,17,105,231,1,21,131,34,225,242,130,165,10,201,15,
+    32,53,136,136,32,85,85,5,15,125,224,129,188,64,103,195,
+    20,86,43,140,44,33,33,132,132,24,131,169,16,240,192,249,
+    206,153,153,157,189,196,78,85,132,102,244,237,156,51,179,51,
+    231,156,255,220,254,255,156,255,255,61,174,136,219,59,49,134,
+    36,206,201,190,235,48,184,84,247,26,120,145,245,213,127,0,
+    111,24,64,145,57,61,20,151,182,253,148,218,155,244,154,58,
+    40,213,91,99,188,67,145,55,254,13,84,160,147,132,27,101,
+    76,114,173,245,145,199,234,72,69,205,153,106,110,133,86,83,
+    123,48,182,8,88,57,179,161,198,86,83,107,244,155,23,239,
+    93,92,97,7,198,30,113,107,7,7,192,231,62,84,109,106,
+    168,69,45,42,218,172,254,208,59,239,186,101,242,124,193,182,
+    13,125,115,193,54,163,233,250,141,46,95,255,18,171,86,47,
+    223,188,93,88,180,43,64,83,157,17,6,189,64,78,144,162,
+    196,136,3,123,6,252,223,165,165,91,24,218,25,129,175,121,
+    72,233,241,55,87,127,211,164,216,117,201,18,192,190,127,21,
+    202,161,147,251,78,47,105,220,214,130,112,32,197,42,197,181,
+    2,171,50,117,74,214,9,121,123,118,222,153,101,41,158,87,
+    112,130,54,206,42,184,117,22,241,72,179,117,22,17,123,31,
+    100,28,18,100,140,181,144,17,222,240,206,175,199,133,237,1,
+    67,62,96,59,195,59,217,236,12,143,203,109,249,68,28,163,
+    129,88,254,156,199,247,37,46,210,172,5,95,154,89,44,31,
+    251,56,151,34,195,132,190,90,128,31,175,47,219,118,240,49,
+    223,208,22,240,120,228,210,242,41,22,119,73,131,67,239,242,
+    178,182,136,23,73,184,125,10,0,39,46,194,231,30,55,89,
+    250,50,128,219,95,107,114,193,247,21,0,204,137,8,187,17,
+    175,80,103,53,150,107,209,115,171,18,220,116,218,55,92,174,
+    1,234,186,92,251,85,172,198,242,125,56,208,172,19,106,18,
+    223,7,96,136,17,91,96,31,0,222,166,246,194,170,135,227,
+    224,204,251,47,17,124,143,218,243,111,205,4,84,157,25,130,
+    246,123,0,200,168,253,17,240,103,74,90,156,5,126,130,218,
+    240,107,86,127,75,111,248,27,156,5,6,137,218,173,67,44,
+    168,79,111,198,7,245,115,213,88,86,159,169,166,167,13,126,
+    234,47,84,19,153,239,158,248,206,137,245,160,185,239,152,145,
+    159,174,36,102,204,196,140,126,1,98,227,212,138,186,122,89,
+    236,254,168,202,73,22,248,156,240,39,47,2,87,43,242,144,
+    41,15,137,192,23,43,242,160,41,15,242,128,145,26,170,200,
+    195,166,60,108,135,14,86,228,156,41,231,196,131,87,42,242,
+    128,41,15,88,81,57,17,212,207,179,142,160,247,224,90,255,
+    155,193,74,207,184,217,51,110,100,142,26,129,212,166,20,177,
+    124,62,169,147,205,44,164,206,45,63,9,70,191,126,69,68,
+    196,200,161,209,119,246,63,234,178,200,41,42,245,182,193,203,
+    190,188,52,104,17,23,22,169,204,94,70,92,232,143,75,207,
+    88,196,133,97,89,74,224,134,13,201,65,41,103,17,23,46,
+    209,147,240,164,232,194,41,159,95,250,20,246,217,212,49,70,
+    165,56,156,38,218,32,7,164,126,139,184,16,105,12,118,81,
+    169,15,207,217,32,243,100,187,192,130,48,213,238,64,216,47,
+    101,241,17,27,212,56,82,229,194,209,14,92,185,144,238,192,
+    223,92,72,75,82,218,34,46,68,168,132,190,211,129,224,142,
+    193,112,167,180,15,238,34,109,232,15,195,43,164,11,153,94,
+    137,77,31,93,120,38,132,27,46,176,12,38,241,22,27,130,
+    73,233,0,92,77,218,48,58,32,177,185,166,11,211,180,31,
+    197,230,194,39,233,113,20,148,11,26,141,226,210,133,253,65,
+    233,176,69,92,72,74,82,6,217,179,33,22,64,6,92,80,
+    169,4,25,189,3,65,86,135,244,43,235,83,134,52,94,145,
+    198,77,105,220,242,81,212,47,42,234,215,81,55,38,28,64,
+    198,93,136,249,80,113,92,144,253,112,180,233,2,251,102,24,
+    207,217,160,170,248,186,11,125,29,168,132,173,32,218,45,90,
+    107,142,194,199,70,121,150,123,27,104,63,121,126,142,15,105,
+    101,207,45,175,9,124,46,217,126,10,62,166,190,85,242,45,
+    167,231,97,215,124,193,108,154,52,105,155,196,180,66,169,56,
+    127,187,80,215,84,254,27,251,207,219,232,244,251,120,167,191,
+    17,78,175,150,205,112,159,126,186,170,68,96,194,177,162,244,
+    153,74,159,17,104,179,49,204,29,154,71,73,43,231,253,100,
+    127,217,245,244,14,187,221,27,76,239,121,69,21,92,3,20,
+    240,51,9,27,207,136,163,11,86,248,222,21,97,40,208,8,
+    180,49,251,240,145,19,148,120,82,130,106,49,143,118,247,105,
+    80,84,251,128,221,125,151,165,78,219,166,164,141,153,129,255,
+    77,225,112,131,47,205,133,3,251,48,28,126,14,186,121,11,
+    231,106,69,25,51,149,49,35,48,182,131,36,240,173,93,18,
+    228,221,153,127,163,121,43,94,98,39,101,176,186,225,68,120,
+    231,248,26,119,251,115,151,54,232,7,53,113,211,165,174,70,
+    207,223,77,119,253,148,224,77,247,6,231,252,117,245,225,179,
+    159,205,5,69,233,240,245,96,46,158,229,107,187,220,50,20,
+    42,13,43,61,190,27,74,39,77,75,29,175,81,27,126,129,
+    146,187,225,41,185,185,31,156,89,251,66,69,57,108,42,144,
+    104,75,169,7,165,135,249,251,119,126,116,231,157,79,255,240,
+    213,55,95,197,90,230,210,102,52,137,142,162,135,195,138,31,
+    86,152,94,20,98,50,76,93,123,30,28,126,120,189,114,104,
+    210,60,52,201,131,108,224,93,205,175,230,255,185,169,68,87,
+    142,239,224,229,248,217,54,212,104,44,133,91,145,198,237,145,
+    79,240,124,44,218,204,107,237,90,211,175,28,120,140,108,247,
+    219,217,78,175,46,9,171,87,134,50,245,126,246,248,195,151,
+    42,217,41,51,59,101,4,166,118,77,238,28,157,243,205,147,
+    5,122,151,66,164,91,76,65,161,234,105,4,108,75,30,65,
+    59,118,157,99,205,42,231,175,133,23,242,71,236,121,183,246,
+    111,106,175,138,207,216,91,167,89,206,208,141,241,27,13,196,
+    124,68,109,248,141,195,187,234,164,26,24,48,26,207,77,37,
+    98,40,163,171,199,214,6,189,171,176,70,98,212,8,140,254,
+    255,200,50,221,142,44,63,113,224,119,79,32,203,196,251,89,
+    136,106,178,19,102,118,194,8,76,236,144,220,185,93,147,107,
+    27,51,221,33,201,90,116,167,149,220,23,137,87,206,197,147,
+    206,235,90,219,30,10,182,46,57,108,34,103,147,34,103,161,
+    222,181,124,37,148,53,67,89,222,194,208,166,212,166,200,225,
+    141,40,212,229,163,67,102,116,200,96,147,207,93,218,206,217,
+    93,115,125,151,197,232,209,198,117,142,214,213,90,97,171,107,
+    168,190,152,80,212,234,252,154,112,171,5,177,0,119,201,201,
+    40,202,115,119,175,93,190,223,115,224,79,200,247,65,145,111,
+    117,255,122,94,48,80,250,153,106,72,213,239,110,68,186,141,
+    76,221,68,107,85,137,233,23,68,46,61,153,172,207,18,22,
+    73,243,44,225,105,102,5,179,62,175,125,152,167,250,71,96,
+    142,206,74,156,202,127,33,208,54,168,41,215,102,75,133,211,
+    194,91,82,45,112,189,120,107,89,67,50,106,157,136,119,218,
+    103,73,76,59,94,39,173,156,203,125,7,254,142,226,24,39,
+    182,156,186,107,239,111,227,217,199,241,108,37,126,192,140,31,
+    208,207,109,36,246,9,135,10,149,196,136,153,24,209,47,84,
+    187,186,245,243,56,248,187,114,1,49,36,115,190,143,243,134,
+    127,69,31,127,66,251,15,210,226,47,45,151,106,29,92,172,
+    82,44,206,151,52,20,89,141,235,176,148,52,12,100,88,188,
+    33,26,138,66,108,240,81,89,95,115,253,102,153,175,166,151,
+    180,144,19,85,248,106,249,200,173,229,27,115,101,13,59,47,
+    217,204,45,127,68,136,136,52,200,188,53,12,82,162,170,243,
+    173,68,220,8,183,140,103,160,128,200,181,33,107,33,22,92,
+    42,223,156,175,69,236,11,246,190,107,140,121,229,69,230,41,
+    35,190,166,200,21,155,97,21,93,168,215,67,138,42,12,94,
+    124,12,0,205,26,110,84,70,104,65,23,0,156,165,230,38,
+    103,120,219,227,133,193,125,174,194,174,184,150,196,85,198,97,
+    20,249,164,78,116,60,31,184,189,15,111,173,124,36,120,228,
+    180,78,81,95,253,62,244,14,128,128,207,166,23,108,254,114,
+    231,69,77,20,253,151,124,98,161,56,183,52,95,120,86,139,
+    250,196,186,64,233,199,172,196,45,63,165,212,250,12,37,52,
+    170,71,112,84,73,88,231,71,149,236,49,26,79,203,23,160,
+    62,54,167,254,16,160,18,26,214,59,112,84,201,136,209,120,
+    90,50,161,3,6,233,247,158,86,132,208,140,65,186,197,105,
+    249,130,120,209,71,5,246,78,246,182,180,56,171,164,207,104,
+    60,171,36,101,56,167,247,174,117,153,146,72,76,15,99,155,
+    66,151,174,178,159,104,82,87,176,215,152,61,25,99,191,221,
+    236,41,248,237,232,97,133,147,178,130,97,202,56,38,23,250,
+    73,166,215,32,140,217,10,209,40,227,194,28,200,144,61,123,
+    145,179,96,7,133,167,89,7,50,65,154,68,98,109,232,26,
+    164,140,91,105,133,45,192,118,61,238,34,245,211,32,99,122,
+    28,72,158,145,232,184,69,218,227,234,115,91,252,119,219,123,
+    231,243,97,138,20,187,32,31,163,47,48,38,218,131,26,141,
+    83,198,191,182,194,22,96,187,30,119,208,71,25,91,215,10,
+    235,19,91,248,217,174,199,134,39,40,227,76,91,97,11,176,
+    93,143,123,133,94,85,40,227,206,218,227,218,152,248,221,226,
+    184,237,189,127,182,219,71,247,226,91,54,176,76,130,125,119,
+    64,110,9,30,193,149,13,178,76,99,22,113,33,77,41,214,
+    225,28,144,253,116,12,133,109,131,74,41,102,141,14,200,18,
+    254,230,66,44,128,114,117,224,31,17,18,237,249,118,241,91,
+    69,97,4,73,87,54,98,125,94,139,121,122,167,21,148,40,
+    24,103,7,210,68,121,158,26,225,179,236,212,67,56,120,131,
+    254,47,72,1,115,149,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/SimObject.py",
+    "m5.SimObject",
+    embedded_module_data,
+    24710,
+    58966);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,59 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,173,81,189,111,211,64,20,191,179,207,190,115,156,143,
+    230,131,143,148,162,10,129,64,97,104,166,108,168,12,40,4,
+    6,232,144,48,244,22,43,141,15,112,240,217,209,217,105,201,
+    22,33,254,5,4,19,59,255,10,147,135,12,150,167,74,76,
+    221,44,117,137,58,113,103,53,64,118,236,159,127,239,247,222,
+    221,123,207,239,238,23,248,231,65,215,246,242,167,164,175,192,
+    2,46,112,161,15,40,100,112,170,109,54,77,245,141,130,192,
+    213,40,10,42,247,1,51,30,0,97,72,95,167,232,24,4,
+    232,12,124,212,143,193,25,100,72,60,117,145,107,248,38,199,
+    20,115,141,106,156,80,194,45,106,241,18,45,113,155,218,16,
+    48,50,45,111,42,186,102,251,207,207,136,178,204,196,50,179,
+    66,43,178,50,114,137,212,85,90,45,180,37,117,141,214,10,
+    93,242,119,70,202,218,126,157,215,105,253,58,214,144,49,56,
+    44,190,78,249,66,21,124,61,122,126,1,165,237,152,153,53,
+    244,248,209,201,148,77,226,12,77,66,193,50,236,178,183,94,
+    192,162,12,135,69,56,202,204,217,88,140,121,148,25,81,60,
+    150,174,253,102,216,119,134,199,195,81,255,213,179,14,204,112,
+    180,136,98,198,39,82,234,177,207,165,65,243,216,243,165,133,
+    143,149,195,199,94,208,105,102,196,225,189,131,162,129,46,149,
+    48,100,247,12,79,230,98,228,77,62,100,216,11,156,119,140,
+    247,50,251,37,159,133,34,238,11,17,138,12,8,117,11,194,
+    84,132,21,17,69,150,202,36,39,115,207,119,251,193,169,176,
+    139,243,81,84,81,11,6,59,101,65,44,106,197,166,200,227,
+    115,127,28,179,31,224,82,77,125,213,142,196,164,59,91,196,
+    239,195,160,203,123,93,199,241,2,47,118,156,131,217,226,138,
+    60,225,161,59,247,217,161,216,43,174,19,128,232,145,228,92,
+    135,16,230,135,22,108,157,163,230,242,72,189,185,9,12,242,
+    249,197,10,181,18,212,74,171,141,229,96,57,88,167,184,145,
+    3,13,182,254,210,121,181,169,86,150,131,220,144,222,122,189,
+    206,9,64,118,14,118,224,94,174,97,195,204,193,255,163,6,
+    32,181,21,190,245,173,178,194,15,101,115,99,55,37,119,147,
+    109,164,164,157,108,35,69,55,147,109,164,232,118,178,65,138,
+    118,147,109,164,232,78,178,141,252,158,26,70,77,20,169,11,
+    248,212,184,1,190,224,125,253,59,220,215,127,3,180,144,212,
+    200,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/__init__.py",
+    "m5",
+    embedded_module_data,
+    545,
+    844);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,206 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,88,205,111,27,199,21,223,229,151,36,74,162,108,
+    43,77,34,1,78,198,169,227,132,174,68,125,56,138,27,53,
+    46,162,175,72,254,82,84,81,141,107,33,133,50,228,140,184,
+    35,238,238,16,179,187,162,41,145,128,80,164,128,98,164,136,
+    81,164,136,122,211,41,72,235,30,124,232,193,199,52,127,129,
+    20,16,136,64,32,64,128,158,114,83,145,22,48,124,105,223,
+    236,74,20,169,104,148,46,201,217,225,204,155,55,111,222,188,
+    223,123,111,230,159,90,195,19,61,120,127,255,62,20,159,106,
+    68,35,186,169,89,250,162,174,203,122,200,12,89,225,197,176,
+    95,15,155,145,197,40,137,208,48,137,246,212,135,147,24,141,
+    45,71,72,203,7,145,197,22,146,32,109,240,110,37,93,36,
+    78,99,164,157,182,65,79,199,7,209,197,56,233,92,108,39,
+    225,180,150,60,243,157,28,148,212,107,145,57,236,26,242,189,
+    80,42,208,217,90,187,195,172,37,158,89,89,202,154,78,173,
+    45,205,172,119,50,43,52,235,214,90,179,204,197,46,227,118,
+    54,212,32,115,248,224,247,253,37,95,230,178,118,79,95,169,
+    119,150,245,181,78,77,203,134,150,142,100,212,97,230,16,222,
+    215,53,109,140,16,132,209,33,83,228,114,248,87,159,13,101,
+    77,236,56,169,120,28,193,51,90,192,2,91,168,65,174,81,
+    180,96,208,227,212,62,11,96,234,66,87,3,219,84,35,143,
+    195,246,128,65,211,228,132,164,80,218,224,158,73,80,134,162,
+    12,203,184,244,30,202,114,171,0,36,25,147,250,92,126,240,
+    80,219,21,37,196,133,95,97,212,9,4,94,48,152,131,150,
+    61,59,235,51,47,50,211,132,254,44,39,180,89,54,102,195,
+    188,238,9,11,193,54,65,204,245,89,249,131,65,30,102,103,
+    77,143,80,104,183,155,152,56,135,13,220,115,11,158,139,8,
+    19,192,135,131,80,69,131,250,61,62,155,163,25,64,50,207,
+    161,176,214,235,203,168,196,61,100,224,85,138,44,207,116,89,
+    193,108,96,219,39,135,218,62,133,19,40,229,64,2,159,29,
+    183,15,198,152,12,106,14,44,221,206,129,168,174,129,48,136,
+    203,151,155,69,12,118,96,22,76,44,190,84,111,76,134,132,
+    180,119,209,2,133,35,45,10,161,167,189,142,200,14,20,74,
+    174,193,237,1,107,100,224,136,65,161,84,235,128,13,170,143,
+    22,237,48,224,130,28,249,2,20,27,218,126,175,22,61,179,
+    19,233,173,70,122,183,140,221,200,165,160,186,227,127,191,151,
+    118,87,139,8,206,221,172,222,96,185,177,67,203,181,117,105,
+    185,76,171,232,101,109,91,59,233,249,12,126,15,235,255,38,
+    181,223,166,42,33,162,87,194,229,48,209,243,62,106,197,69,
+    55,124,68,95,14,173,212,49,82,14,127,6,245,135,245,255,
+    239,1,93,37,82,137,194,232,104,89,47,71,222,244,105,14,
+    249,60,186,248,209,128,219,114,196,201,109,107,168,199,143,234,
+    43,177,122,173,78,253,25,172,227,97,125,133,36,180,6,74,
+    34,199,102,31,209,42,177,114,108,187,245,164,85,150,245,237,
+    182,147,218,155,87,223,60,11,120,163,136,252,52,207,34,91,
+    211,218,79,181,33,205,137,20,67,247,194,119,181,34,248,176,
+    187,208,30,244,36,163,107,127,29,199,96,133,136,7,198,43,
+    55,231,200,70,251,80,17,155,249,192,170,3,163,53,24,21,
+    88,100,141,146,15,141,28,248,43,42,164,169,5,198,120,204,
+    220,0,205,57,26,80,216,36,48,227,2,24,168,43,171,150,
+    132,250,145,93,1,202,15,240,19,112,58,134,161,192,112,133,
+    92,215,90,103,211,168,154,94,156,77,198,107,237,132,58,89,
+    106,19,108,187,78,173,123,9,166,93,178,233,61,119,41,79,
+    75,75,190,107,16,82,163,181,8,47,80,91,72,3,169,133,
+    172,145,90,11,47,248,140,106,49,152,16,38,171,197,139,130,
+    185,84,98,9,218,86,177,233,81,39,217,34,58,37,125,91,
+    125,218,90,24,148,81,11,155,60,91,11,3,255,90,4,122,
+    168,207,2,100,118,164,21,28,248,36,33,237,164,118,38,208,
+    210,17,224,132,132,202,16,252,28,136,33,18,51,29,218,217,
+    238,141,235,123,93,221,95,119,189,248,85,215,139,187,93,23,
+    170,93,23,246,181,104,244,37,191,216,12,239,37,186,100,113,
+    246,193,175,238,27,155,198,55,231,7,31,117,255,253,133,47,
+    186,119,207,79,85,207,79,125,56,187,57,241,224,153,7,206,
+    183,231,47,108,94,127,144,253,112,118,191,69,235,58,23,144,
+    62,249,79,92,139,39,254,64,254,52,252,201,104,181,251,226,
+    110,226,229,106,226,229,207,187,118,19,87,31,119,239,182,93,
+    171,182,93,219,215,244,104,234,139,103,247,90,19,95,183,246,
+    124,213,218,179,149,252,186,247,242,87,189,151,119,123,251,170,
+    189,125,187,173,253,213,214,254,157,214,254,253,48,144,249,180,
+    126,241,47,89,252,91,107,106,83,22,79,158,60,57,157,192,
+    57,7,202,248,199,200,171,227,151,195,95,94,142,140,167,90,
+    190,28,210,161,20,207,67,179,232,213,100,224,106,64,129,132,
+    167,239,46,158,213,131,64,183,125,18,86,32,192,149,245,102,
+    48,84,66,74,218,80,57,116,140,54,172,164,13,31,119,36,
+    149,200,41,50,132,72,100,13,106,199,70,68,203,81,18,205,
+    251,255,197,185,38,135,117,12,214,21,160,171,196,236,80,25,
+    202,50,184,167,114,228,247,161,158,6,234,50,244,52,181,196,
+    150,101,74,17,91,27,159,167,174,39,2,80,131,145,246,53,
+    33,179,239,16,144,16,13,201,113,216,34,48,108,191,242,84,
+    127,235,169,190,254,84,239,251,78,138,243,221,127,225,73,134,
+    106,145,101,102,19,176,126,106,39,27,118,168,22,117,92,44,
+    220,90,155,4,92,80,109,9,176,7,180,178,136,72,56,254,
+    0,28,226,236,97,49,1,63,231,19,205,199,67,76,235,124,
+    246,227,217,251,179,91,87,182,195,187,29,23,171,29,23,55,
+    166,246,206,244,124,154,248,99,98,203,217,158,218,61,115,185,
+    122,230,50,0,38,241,220,199,246,125,123,43,189,157,220,77,
+    244,85,19,125,27,211,123,241,238,143,83,247,83,91,221,91,
+    116,27,255,153,237,198,95,173,198,95,221,152,216,107,137,111,
+    102,126,87,218,40,125,3,24,74,126,104,127,100,3,156,186,
+    206,110,70,54,35,223,118,157,131,162,253,153,7,119,183,138,
+    59,63,185,84,109,127,229,243,158,71,35,143,187,31,189,81,
+    77,94,123,236,238,180,79,236,68,38,68,7,8,134,121,151,
+    166,189,5,43,99,89,147,174,143,51,59,79,133,59,58,60,
+    56,52,52,154,163,214,72,31,184,40,236,65,196,20,7,11,
+    188,134,214,103,1,249,216,70,183,82,232,128,92,234,253,132,
+    252,101,92,96,178,204,5,65,183,129,146,102,243,22,182,109,
+    5,233,52,206,64,122,99,162,113,19,103,243,10,154,180,75,
+    87,193,215,222,76,161,121,202,108,3,11,162,154,120,204,100,
+    104,26,178,45,204,8,83,145,136,60,46,8,188,138,17,4,
+    10,79,65,116,131,131,72,51,212,113,193,113,58,10,154,73,
+    42,104,30,205,240,98,16,15,78,160,88,240,28,16,22,221,
+    20,204,49,108,172,90,28,183,112,137,26,32,179,32,216,49,
+    92,149,220,243,160,123,182,194,32,154,81,149,46,111,114,65,
+    75,208,95,164,144,43,157,76,114,219,51,176,101,97,34,19,
+    82,12,49,10,246,17,148,230,226,101,5,253,44,51,113,9,
+    189,139,97,5,42,142,88,228,209,100,10,205,48,229,164,147,
+    120,149,17,52,150,66,119,56,39,21,105,88,46,115,33,39,
+    60,120,192,176,100,206,44,141,78,166,226,158,137,33,68,250,
+    100,43,28,32,143,205,58,217,122,250,250,244,216,252,196,76,
+    5,77,64,250,236,185,41,216,205,172,193,224,61,75,139,142,
+    63,100,149,155,158,69,143,56,95,121,195,111,182,61,43,67,
+    27,44,121,216,111,45,224,28,117,26,196,24,234,239,191,234,
+    119,148,40,62,36,14,200,1,21,126,135,39,76,212,216,97,
+    184,110,193,25,29,24,32,156,165,184,200,13,12,13,166,134,
+    134,94,27,25,24,30,28,126,237,234,208,235,169,224,253,115,
+    127,44,208,52,141,85,209,198,43,241,58,44,111,129,121,245,
+    207,73,27,3,100,14,15,250,200,236,31,30,60,9,156,55,
+    176,3,206,78,14,88,239,175,204,157,98,150,99,25,226,153,
+    96,9,46,6,213,142,25,210,26,20,132,37,188,134,198,242,
+    242,120,163,216,123,126,96,77,128,59,172,178,202,121,150,229,
+    104,204,114,32,11,201,41,101,186,141,93,151,2,153,77,4,
+    229,107,107,74,240,18,193,214,223,123,127,29,87,42,176,245,
+    22,93,193,89,149,93,130,229,58,104,204,177,60,199,81,2,
+    38,45,88,30,50,44,52,14,48,197,164,136,87,212,78,138,
+    158,234,161,166,41,193,66,146,112,174,210,213,56,207,100,74,
+    104,30,28,162,240,178,84,137,20,91,58,195,121,14,235,204,
+    65,178,134,38,176,128,180,205,224,42,63,69,197,250,43,235,
+    188,82,177,153,197,129,88,30,152,76,243,160,73,49,230,22,
+    91,131,99,80,14,77,24,74,189,204,194,150,193,121,81,186,
+    56,207,98,57,187,164,118,204,5,25,16,38,225,128,10,105,
+    38,152,163,163,242,204,119,32,104,150,208,148,233,192,49,244,
+    20,43,16,43,192,238,109,44,88,134,139,53,149,17,88,204,
+    167,177,176,193,108,38,107,24,132,80,153,204,28,247,74,24,
+    189,205,93,238,25,74,223,90,130,89,167,177,149,145,49,75,
+    161,105,92,178,41,108,205,52,116,43,249,76,178,12,206,131,
+    231,152,134,180,92,21,19,12,240,247,14,154,22,88,25,88,
+    198,113,206,115,208,12,44,73,78,229,170,246,222,199,10,246,
+    9,29,137,124,197,22,21,113,193,102,16,204,64,167,170,16,
+    52,230,57,46,168,20,72,32,82,169,228,6,3,115,225,152,
+    52,3,193,74,69,35,209,9,138,156,161,66,192,169,234,20,
+    164,27,180,8,129,83,56,182,58,80,165,75,212,119,43,16,
+    247,214,48,104,127,89,168,3,35,104,41,47,105,114,46,46,
+    40,136,64,73,70,145,1,13,24,190,130,13,101,38,68,207,
+    27,180,132,11,216,83,137,117,168,6,72,108,110,112,91,169,
+    9,127,145,12,54,231,134,167,156,48,237,101,32,222,163,155,
+    144,27,113,87,229,197,102,176,197,96,155,65,5,55,13,108,
+    210,156,177,134,9,85,17,223,245,168,11,41,205,77,78,176,
+    165,82,255,255,149,147,44,112,240,234,14,151,120,100,114,143,
+    84,170,159,48,128,141,43,247,252,54,181,177,18,59,129,165,
+    66,180,176,201,41,204,22,24,206,193,148,235,47,173,123,149,
+    138,210,211,190,99,129,244,179,120,69,197,37,88,24,56,27,
+    48,64,153,174,194,132,170,85,206,112,32,201,121,165,83,220,
+    96,158,59,126,105,82,53,50,110,193,210,209,84,10,189,99,
+    170,81,8,138,204,162,52,208,8,149,235,131,68,204,64,115,
+    134,50,212,206,225,140,201,209,28,228,202,74,135,176,32,216,
+    42,243,163,245,60,37,68,229,179,199,76,154,133,0,67,205,
+    188,202,69,221,198,70,9,148,156,6,35,82,122,213,67,231,
+    147,134,110,72,172,84,54,126,3,50,63,240,246,105,16,26,
+    51,149,114,198,185,84,110,26,156,121,14,11,190,250,35,126,
+    3,82,205,180,188,49,196,76,157,118,131,65,46,168,118,125,
+    30,27,128,238,5,3,231,61,21,131,105,134,179,28,226,233,
+    130,60,38,228,76,166,212,194,109,150,53,48,4,133,95,23,
+    92,229,214,255,120,6,125,221,148,158,226,93,238,229,24,247,
+    242,88,101,103,139,16,175,115,66,70,238,59,106,47,54,203,
+    69,70,158,203,238,80,67,37,208,17,104,239,80,165,81,55,
+    165,236,74,252,216,57,136,44,119,185,114,237,144,136,76,85,
+    42,4,44,224,237,20,90,244,100,146,120,122,250,159,62,76,
+    255,71,209,187,84,56,242,244,62,60,152,26,252,217,137,167,
+    129,9,62,63,127,98,206,143,51,14,36,213,131,87,83,131,
+    87,134,70,134,21,9,253,240,224,169,9,61,22,247,216,170,
+    159,210,159,192,141,250,215,126,110,169,64,15,103,20,191,97,
+    171,13,93,141,19,213,71,66,94,159,12,249,151,111,66,94,
+    178,38,117,255,254,47,217,81,107,41,128,163,50,89,38,184,
+    200,139,1,95,128,130,136,200,63,113,107,36,117,112,169,39,
+    186,101,67,24,82,60,255,146,218,191,117,171,133,97,50,255,
+    190,161,150,144,10,60,186,148,251,139,230,31,242,253,91,137,
+    167,173,111,90,28,114,126,250,75,113,69,147,151,168,154,230,
+    252,13,138,253,176,174,235,251,175,107,122,207,142,246,124,227,
+    119,79,123,110,167,249,251,173,118,118,231,240,187,31,235,212,
+    95,217,34,219,191,168,190,48,176,175,65,253,241,21,255,117,
+    188,64,93,122,106,95,107,46,46,118,234,147,186,236,158,212,
+    183,175,4,239,207,211,193,251,132,18,153,250,185,200,70,66,
+    126,252,213,252,15,184,133,174,189,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/citations.py",
+    "m5.citations",
+    embedded_module_data,
+    2905,
+    6869);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,36 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,123,204,128,4,152,160,244,103,57,32,49,157,33,133,
+    33,133,49,135,33,151,49,138,145,17,196,102,202,97,202,101,
+    142,98,6,178,153,131,25,52,89,94,130,84,106,50,222,226,
+    41,78,45,241,47,45,41,40,45,113,201,44,130,242,61,243,
+    74,82,139,10,128,124,63,77,150,91,28,241,185,166,122,201,
+    249,69,169,69,204,64,29,183,184,64,220,156,252,196,148,212,
+    162,34,22,160,192,74,134,207,32,147,126,137,22,23,37,235,
+    23,84,150,100,228,231,233,231,154,234,131,52,232,21,84,254,
+    226,176,201,205,79,41,205,73,181,43,226,2,170,98,4,226,
+    98,35,32,241,129,153,145,145,241,131,31,35,3,163,210,5,
+    6,69,100,116,131,65,249,2,54,84,196,1,212,6,0,12,
+    247,60,213,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/core.py",
+    "m5.core",
+    embedded_module_data,
+    179,
+    239);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,159 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,205,87,223,79,27,201,29,159,253,97,123,109,47,108,
+    192,192,113,62,18,12,164,186,56,16,39,71,2,138,34,226,
+    42,7,13,106,154,163,82,146,171,174,86,210,173,241,110,136,
+    97,109,115,187,11,21,62,163,208,138,7,19,89,58,170,75,
+    213,180,201,169,180,106,83,161,220,195,169,202,3,15,249,35,
+    214,200,82,172,149,144,34,85,247,144,55,34,174,47,121,105,
+    231,59,107,175,189,24,184,112,173,170,236,142,191,158,157,249,
+    206,206,231,243,253,126,103,230,187,255,68,117,151,171,242,191,
+    51,139,197,239,145,132,36,74,65,41,42,70,81,80,167,21,
+    58,197,196,24,82,103,20,54,230,194,255,172,194,166,220,49,
+    119,202,19,243,164,184,24,135,251,92,203,40,230,165,209,56,
+    146,220,203,72,242,200,212,99,6,161,39,76,117,138,152,143,
+    70,178,239,49,174,61,177,167,141,249,37,230,58,10,115,47,
+    225,33,76,153,158,143,226,179,179,201,244,20,174,122,103,213,
+    100,90,191,154,212,244,137,48,99,242,163,153,212,108,102,46,
+    45,93,86,226,83,166,239,122,50,53,171,200,86,93,75,220,
+    145,165,15,85,57,62,147,168,103,228,193,63,152,123,231,31,
+    52,48,210,169,90,151,78,215,234,107,52,218,227,114,162,148,
+    168,101,244,21,253,24,107,62,177,181,23,145,238,169,233,75,
+    204,99,252,254,39,246,28,20,210,189,117,189,236,50,202,33,
+    231,248,49,116,171,251,38,126,90,164,22,105,199,155,92,57,
+    234,33,182,96,142,158,174,250,4,61,68,95,178,187,223,95,
+    8,213,143,114,226,165,156,216,60,7,98,227,246,196,54,249,
+    223,96,203,81,146,119,134,248,93,141,232,77,117,227,125,120,
+    46,122,173,238,141,251,49,24,219,237,1,255,87,188,19,35,
+    182,192,117,7,182,166,6,11,37,222,216,66,205,7,90,72,
+    248,127,123,79,66,120,77,28,153,72,212,133,44,130,169,3,
+    248,183,211,138,32,156,115,56,40,223,181,59,177,58,61,161,
+    130,202,58,90,167,76,122,102,94,131,177,161,215,29,154,154,
+    56,61,187,160,223,201,164,79,167,134,78,75,242,228,220,84,
+    100,118,225,53,55,162,196,83,147,82,60,154,237,184,35,43,
+    179,145,17,37,147,136,43,90,52,82,109,63,129,135,107,62,
+    44,150,208,6,189,241,193,51,215,18,218,129,153,240,194,100,
+    102,228,133,172,255,195,184,38,135,96,1,106,23,28,56,217,
+    42,206,27,104,247,178,115,98,174,95,132,78,227,102,154,156,
+    154,211,118,15,143,153,174,211,19,47,225,165,235,140,233,75,
+    106,201,180,166,199,211,9,89,117,227,38,147,75,106,151,51,
+    106,42,174,171,126,192,79,108,160,66,0,170,205,88,236,199,
+    117,0,116,123,9,215,223,93,120,48,185,214,242,72,254,91,
+    172,24,56,83,10,156,49,2,227,27,173,27,151,158,181,63,
+    59,102,12,141,47,33,85,128,247,176,33,124,101,233,11,161,
+    172,80,221,150,14,52,197,249,239,109,138,235,72,5,127,135,
+    105,181,29,88,64,76,29,138,218,89,208,109,115,82,187,89,
+    12,12,150,2,131,21,50,38,115,73,81,28,176,153,42,236,
+    46,2,123,10,131,189,229,93,164,114,212,180,173,242,91,186,
+    224,195,208,32,62,112,64,176,233,120,74,14,211,38,29,57,
+    99,82,9,13,192,135,44,108,175,125,35,10,222,192,19,216,
+    72,209,108,231,110,136,213,30,48,143,22,36,32,141,142,179,
+    86,89,235,89,253,244,254,188,253,72,160,190,228,172,249,220,
+    201,180,36,167,245,108,71,168,114,97,6,161,90,60,102,91,
+    172,24,208,241,57,114,160,91,174,125,111,183,100,248,253,34,
+    180,226,48,181,237,176,158,138,130,110,55,218,59,8,71,191,
+    190,182,65,61,253,248,233,47,42,78,11,115,166,91,203,168,
+    186,44,153,174,219,192,208,116,37,117,57,133,255,200,161,105,
+    186,111,39,21,93,86,77,86,146,181,132,10,132,77,118,38,
+    41,105,112,144,90,227,68,50,76,13,146,46,82,103,136,219,
+    44,164,38,11,32,213,147,184,250,62,224,250,130,2,92,91,
+    129,119,191,252,193,159,250,255,216,255,135,83,143,78,25,167,
+    46,66,9,68,139,129,104,41,16,93,186,250,13,235,205,159,
+    42,178,157,37,182,211,96,59,183,58,186,202,220,184,193,141,
+    151,185,182,87,46,230,29,247,183,8,139,109,196,186,78,18,
+    177,226,203,179,121,233,95,28,242,54,27,205,39,86,111,96,
+    129,203,131,27,143,126,110,213,138,92,184,196,133,13,82,182,
+    88,239,175,199,151,199,151,198,113,197,240,189,87,100,187,74,
+    108,151,193,118,145,57,6,13,110,240,235,171,175,24,26,166,
+    160,97,10,206,53,64,68,101,10,247,119,78,241,194,47,172,
+    14,221,187,152,191,184,197,183,87,162,79,255,251,194,95,22,
+    254,252,217,95,63,195,15,197,142,179,165,142,179,27,151,12,
+    62,90,228,163,37,62,106,144,242,13,223,98,180,158,44,242,
+    253,37,190,223,32,197,137,243,104,145,61,86,98,143,25,236,
+    49,130,115,212,224,70,255,151,182,128,155,196,130,35,233,169,
+    198,242,206,24,137,109,25,197,40,9,197,104,72,96,98,140,
+    68,99,201,74,12,150,46,72,73,98,110,146,178,121,32,93,
+    139,113,146,7,210,55,72,7,98,62,201,187,12,169,25,94,
+    227,97,191,201,225,229,69,150,81,195,121,68,210,171,94,50,
+    147,68,229,144,104,119,38,241,74,18,109,109,201,58,159,94,
+    254,27,95,120,155,224,196,121,89,213,146,153,180,233,18,165,
+    100,66,199,7,22,171,201,202,237,186,149,130,117,196,100,58,
+    169,139,98,182,165,58,123,164,218,116,25,217,123,90,185,51,
+    152,103,11,77,229,246,119,240,159,47,143,111,203,36,187,151,
+    59,1,218,69,145,229,94,215,53,109,235,189,73,22,136,183,
+    64,52,109,103,179,57,106,134,140,81,105,160,135,123,88,251,
+    93,46,180,199,213,144,127,236,141,195,253,221,99,223,44,127,
+    186,37,144,252,132,94,100,114,76,61,186,28,61,130,101,225,
+    72,14,28,102,179,1,14,235,212,4,222,87,24,49,53,100,
+    186,72,162,96,182,78,201,122,213,252,63,179,124,166,158,6,
+    206,103,176,48,93,9,69,142,171,38,23,175,104,168,125,184,
+    53,204,170,131,208,41,36,230,84,21,111,210,85,95,147,157,
+    70,13,99,161,1,148,144,189,211,120,196,185,89,41,174,203,
+    217,35,53,71,91,45,87,64,249,55,136,236,60,193,163,143,
+    194,207,131,195,155,193,225,98,240,124,41,120,62,47,148,253,
+    66,225,226,131,159,110,250,251,13,127,127,153,111,205,95,126,
+    193,241,5,223,115,174,115,147,235,44,114,193,18,23,52,184,
+    96,101,224,192,102,112,160,24,140,148,130,145,231,193,115,155,
+    193,115,197,224,112,41,56,188,141,40,239,113,34,86,174,228,
+    199,86,143,151,187,251,242,99,133,43,171,122,145,239,50,248,
+    174,114,231,251,16,92,121,124,91,81,85,31,35,118,248,131,
+    53,33,29,91,219,203,41,13,94,7,171,215,188,61,15,199,
+    197,16,174,172,211,234,72,213,174,184,78,44,200,146,29,189,
+    238,48,53,121,81,76,100,210,122,28,231,60,120,97,180,215,
+    45,140,90,51,100,93,90,23,49,90,153,227,63,231,239,241,
+    43,205,133,230,124,115,89,8,172,234,247,179,134,208,99,112,
+    61,7,208,25,59,28,157,58,50,57,71,62,74,104,169,112,
+    168,169,63,4,72,245,60,252,162,136,3,11,232,97,26,109,
+    117,52,236,214,79,246,103,81,200,62,56,94,18,186,13,174,
+    187,113,169,51,85,22,215,14,197,66,103,106,125,185,186,179,
+    220,153,180,87,56,133,25,226,42,226,30,149,56,76,253,0,
+    57,142,121,178,121,225,206,221,155,23,105,186,137,236,99,222,
+    193,108,11,251,103,236,254,149,162,208,253,54,144,99,20,57,
+    189,55,55,143,40,226,62,76,173,110,185,90,45,191,4,205,
+    163,123,49,107,93,61,119,255,194,202,221,194,93,131,59,214,
+    200,203,14,189,155,135,226,149,59,228,238,237,100,104,237,96,
+    44,254,146,209,118,83,84,127,130,69,182,201,166,7,58,18,
+    168,244,52,114,35,241,248,249,221,123,119,139,66,168,36,132,
+    12,46,244,86,241,115,207,199,149,57,185,145,225,71,192,80,
+    176,25,90,90,119,64,169,111,31,142,207,133,208,166,16,42,
+    10,189,37,161,215,224,122,223,38,150,228,216,105,160,8,141,
+    217,102,155,34,217,75,149,131,25,118,111,10,221,69,161,167,
+    84,219,34,39,194,60,44,102,248,188,17,69,211,39,138,169,
+    140,52,167,64,29,111,197,159,206,197,21,171,71,133,175,44,
+    11,208,37,16,163,32,32,75,81,127,140,42,241,68,76,110,
+    33,133,143,38,242,118,11,232,64,85,252,8,208,61,36,232,
+    170,247,54,77,187,58,183,145,45,56,206,117,2,82,219,138,
+    104,163,93,189,208,81,17,28,237,10,65,173,34,26,31,187,
+    161,86,17,248,177,7,106,21,129,31,251,160,86,17,156,243,
+    205,182,176,112,3,90,108,25,33,145,81,20,57,161,227,211,
+    93,139,196,39,19,42,248,223,244,164,134,34,115,122,82,177,
+    190,58,188,56,155,136,144,100,66,29,70,213,15,88,200,113,
+    84,72,98,200,7,134,101,129,222,70,211,188,230,70,44,123,
+    71,213,143,145,149,218,106,79,177,216,102,40,138,218,30,70,
+    212,113,3,245,213,151,23,232,168,225,44,47,208,17,163,90,
+    182,105,150,162,113,190,125,8,209,252,30,197,111,35,91,140,
+    132,41,108,134,70,145,255,213,43,248,251,182,214,250,9,133,
+    188,45,121,110,197,87,240,45,185,224,38,172,254,3,70,11,
+    31,173,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/debug.py",
+    "m5.debug",
+    embedded_module_data,
+    2146,
+    5489);
+
+} // anonymous namespace
+} // namespace gem5
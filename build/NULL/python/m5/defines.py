@@ -0,0 +1,7 @@
+#
+# DO NOT EDIT THIS FILE!
+# File automatically generated by
+#   /root/package/src/SConscript:620
+#
+
+buildEnv = {'HAVE_SYSTEMC': True, 'KVM_ISA': 'x86', 'HAVE_PROTOBUF': True, 'HAVE_TUNTAP': True, 'HAVE_ZSTD': False, 'HAVE_CAPSTONE': False, 'HAVE_KVM': True, 'HAVE_PERF_ATTR_EXCLUDE_HOST': 1, 'HAVE_FENV': True, 'HAVE_PNG': True, 'HAVE_POSIX_CLOCK': True, 'HAVE_VALGRIND': False, 'HAVE_DEPRECATED_NAMESPACE': True, 'HAVE_HDF5': True, 'BATCH': False, 'BATCH_CMD': '', 'M5_BUILD_CACHE': '', 'USE_EFENCE': False, 'USE_POSIX_CLOCK': False, 'RUBY': True, 'PROTOCOL': 'MI_example', 'NEED_PARTIAL_FUNC_READS': False, 'SLICC_HTML': False, 'NUMBER_BITS_PER_SET': 64, 'RUBY_PROTOCOL_GPU_VIPER': False, 'RUBY_PROTOCOL_MOESI_AMD_BASE': False, 'RUBY_PROTOCOL_MESI_TWO_LEVEL': False, 'RUBY_PROTOCOL_MESI_THREE_LEVEL': False, 'RUBY_PROTOCOL_MESI_THREE_LEVEL_HTM': False, 'RUBY_PROTOCOL_MI_EXAMPLE': True, 'RUBY_PROTOCOL_MOESI_CMP_DIRECTORY': False, 'RUBY_PROTOCOL_MOESI_CMP_TOKEN': False, 'RUBY_PROTOCOL_MOESI_HAMMER': False, 'RUBY_PROTOCOL_GARNET_STANDALONE': False, 'RUBY_PROTOCOL_CHI': False, 'RUBY_PROTOCOL_MSI': False, 'TARGET_GPU_ISA': '', 'GCN3_GPU_ISA': False, 'VEGA_GPU_ISA': False, 'BUILD_ISA': False, 'USE_ARM_ISA': False, 'USE_ARM_FASTMODEL': False, 'PVLIB_HOME': '', 'PVLIB_FLAVOR': '', 'MAXCORE_HOME': '', 'ARMLMD_LICENSE_FILE': '', 'ARMLMD_LICENSE_COUNT': 0, 'SIMGEN': '', 'USE_MIPS_ISA': False, 'USE_POWER_ISA': False, 'USE_RISCV_ISA': False, 'USE_SPARC_ISA': False, 'USE_X86_ISA': False, 'USE_KVM': True, 'USE_CAPSTONE': False, 'USE_SYSTEMC': True, 'BUILD_GPU': False}
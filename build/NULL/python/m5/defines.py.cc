@@ -0,0 +1,106 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,148,185,119,27,69,28,199,87,247,125,203,206,77,
+    72,56,205,17,67,130,67,128,132,231,209,238,72,218,120,15,
+    121,47,203,198,241,196,176,54,118,108,217,142,108,97,43,135,
+    67,73,79,1,5,5,77,222,131,142,63,129,146,50,245,180,
+    84,233,242,94,186,84,204,111,86,217,73,76,64,122,250,254,
+    126,223,207,252,230,216,153,89,253,45,189,240,73,143,226,83,
+    47,34,73,63,73,235,146,47,249,145,31,35,126,212,143,49,
+    141,243,60,193,53,233,167,152,166,185,102,56,201,250,57,166,
+    121,158,23,184,22,185,150,120,77,153,231,21,174,85,78,106,
+    126,157,233,24,40,155,103,156,179,99,92,143,243,170,19,254,
+    73,166,167,56,57,205,245,140,255,26,211,179,60,127,157,235,
+    57,174,231,185,190,193,245,77,222,247,45,158,191,205,245,29,
+    174,239,130,62,132,153,38,184,127,143,235,251,124,13,31,240,
+    252,67,174,23,184,78,114,253,136,235,199,188,230,34,215,75,
+    92,63,225,58,229,95,102,250,41,207,175,240,202,207,184,126,
+    30,204,228,167,216,55,50,250,125,241,75,242,97,100,65,242,
+    175,218,210,196,53,154,111,35,15,19,123,222,118,176,46,59,
+    52,53,227,233,68,181,17,141,29,92,185,76,11,188,177,99,
+    153,142,217,112,155,52,199,173,227,26,14,234,208,12,55,11,
+    182,163,52,71,117,50,234,216,142,105,96,154,230,150,141,68,
+    79,5,3,96,171,73,144,227,88,4,119,101,205,85,48,105,
+    155,182,243,152,29,171,52,26,166,137,13,111,212,173,99,180,
+    104,57,200,76,91,237,18,89,51,229,153,209,12,30,210,90,
+    150,106,40,244,4,183,10,238,88,88,70,14,86,136,129,116,
+    108,119,144,140,71,3,182,149,230,20,77,52,144,35,183,105,
+    134,7,34,235,10,149,104,81,159,34,13,87,213,20,182,92,
+    185,141,105,214,181,49,193,108,126,214,181,4,249,139,179,198,
+    45,183,49,79,211,124,3,100,83,163,89,93,37,43,7,203,
+    189,157,205,21,122,204,192,108,222,14,178,28,21,105,164,233,
+    26,50,177,48,82,108,154,181,53,85,150,73,219,209,53,90,
+    51,92,189,129,45,210,80,29,27,182,129,216,216,121,60,13,
+    207,125,12,134,38,207,71,38,173,142,75,60,149,85,208,211,
+    47,55,232,38,182,85,130,116,133,52,144,141,255,213,10,141,
+    206,156,73,52,236,97,141,190,246,170,214,182,133,241,168,253,
+    252,255,183,195,154,233,241,35,53,42,59,52,164,119,52,76,
+    207,189,106,101,178,222,33,138,202,142,193,49,173,121,122,230,
+    191,74,28,115,6,27,244,228,171,154,219,72,215,217,115,159,
+    61,178,33,200,50,176,67,108,7,25,10,210,224,86,85,94,
+    46,144,219,234,81,164,219,42,45,58,200,106,177,142,176,161,
+    112,143,243,45,217,184,36,156,135,91,40,116,153,224,34,64,
+    154,131,163,71,86,112,247,43,207,77,19,217,142,110,42,108,
+    231,178,29,79,83,27,236,222,234,152,230,131,188,169,33,207,
+    180,104,94,71,93,217,180,112,208,86,99,221,52,118,88,236,
+    10,96,131,141,210,84,217,198,213,143,64,217,100,175,208,99,
+    248,111,163,73,91,213,91,108,103,242,48,165,174,118,108,190,
+    128,66,112,17,231,216,133,9,173,165,218,178,7,118,34,25,
+    0,118,221,45,89,44,190,123,229,50,55,41,48,240,238,241,
+    33,195,119,146,215,140,94,243,231,15,206,246,193,152,136,208,
+    244,215,131,245,77,31,111,125,247,187,244,20,22,245,236,44,
+    7,147,134,171,105,147,59,195,189,181,237,173,201,222,212,164,
+    191,178,186,190,181,178,123,97,103,248,44,125,181,183,237,15,
+    54,87,190,236,99,86,15,239,241,238,197,184,36,61,137,69,
+    34,145,39,69,41,127,56,254,131,241,179,242,68,130,236,215,
+    137,223,220,32,251,195,252,211,9,178,191,174,61,90,88,10,
+    210,71,55,55,30,245,250,65,206,116,16,81,162,44,52,163,
+    51,209,144,233,209,57,48,243,209,27,130,145,232,61,48,135,
+    209,7,130,161,152,22,99,193,136,89,177,144,57,177,37,48,
+    55,99,190,96,171,177,3,48,119,98,135,130,77,199,205,56,
+    11,179,113,47,30,178,110,124,23,204,32,62,20,236,110,188,
+    153,96,161,157,208,18,33,51,18,46,152,185,196,162,96,75,
+    137,117,48,27,137,158,96,219,137,7,96,80,82,78,134,44,
+    80,156,156,5,100,39,187,162,101,33,185,1,166,151,236,11,
+    182,151,188,3,230,94,114,58,21,178,70,74,3,99,164,22,
+    4,91,76,13,192,236,167,238,9,118,152,186,158,102,65,75,
+    207,166,67,102,167,215,192,220,74,111,10,182,149,110,101,88,
+    80,51,70,38,100,157,204,22,152,157,204,64,176,253,140,155,
+    133,167,206,46,102,197,83,103,15,193,76,231,112,46,100,173,
+    220,6,152,94,174,47,216,94,206,200,195,176,121,39,31,50,
+    47,63,4,115,55,63,93,16,207,86,88,6,243,77,97,77,
+    176,91,133,102,17,78,160,168,23,67,102,22,119,192,244,139,
+    251,130,189,168,195,162,86,130,61,42,217,165,144,185,165,53,
+    48,183,74,219,130,221,46,161,50,11,114,25,151,197,250,203,
+    46,152,185,242,162,96,75,229,77,48,91,229,93,193,6,229,
+    233,10,44,185,210,170,132,76,173,120,96,186,149,27,130,145,
+    74,31,204,94,101,40,216,221,74,171,10,229,213,153,170,184,
+    245,213,175,192,220,168,18,193,150,171,219,96,110,87,119,5,
+    27,84,175,215,224,92,107,70,77,156,87,109,21,204,90,109,
+    93,176,141,218,46,152,65,109,95,176,97,173,85,135,121,235,
+    70,93,244,173,19,48,203,245,85,193,214,234,251,96,134,245,
+    67,193,2,157,29,243,198,88,248,118,108,19,194,112,236,62,
+    4,115,220,129,182,149,241,117,8,7,227,247,143,158,7,211,
+    239,211,240,237,203,236,191,227,31,79,184,210,203,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/build/NULL/python/m5/defines.py",
+    "m5.defines",
+    embedded_module_data,
+    1309,
+    2550);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,123 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,86,219,107,20,87,24,63,103,46,187,179,183,36,
+    222,98,92,173,78,213,170,91,37,38,214,88,106,173,22,211,
+    152,96,37,120,235,133,165,48,76,118,38,113,147,189,196,51,
+    179,213,44,65,67,9,52,150,244,6,182,70,84,136,18,5,
+    73,31,124,232,115,255,134,141,4,12,3,66,161,180,208,183,
+    21,21,138,79,253,190,51,153,201,236,38,233,101,231,228,59,
+    151,239,228,156,239,242,59,191,115,126,35,129,159,188,88,63,
+    255,17,196,13,98,16,131,230,72,218,173,105,90,128,90,200,
+    209,188,152,150,40,142,137,208,150,211,33,222,150,160,29,78,
+    135,243,74,90,129,62,77,71,4,210,77,12,121,156,24,33,
+    51,244,64,36,100,86,244,54,73,71,185,46,12,58,101,153,
+    46,102,134,6,227,94,175,159,26,145,113,154,78,12,16,35,
+    122,143,166,27,12,122,142,164,98,127,162,170,55,69,157,230,
+    238,92,177,79,207,157,203,230,79,21,139,195,93,151,179,118,
+    215,231,102,193,6,77,248,244,136,219,20,156,196,128,233,14,
+    159,41,153,37,211,73,88,193,110,38,232,188,224,57,223,10,
+    226,75,112,223,36,105,106,16,112,155,166,197,9,52,70,24,
+    87,210,146,33,142,147,180,108,72,32,67,19,228,50,77,135,
+    193,40,217,137,243,85,63,97,250,240,176,201,202,71,122,204,
+    28,212,106,38,167,91,150,106,23,213,75,160,80,51,122,46,
+    167,247,229,76,181,216,55,104,102,108,75,205,22,84,189,160,
+    242,255,84,251,116,203,116,231,103,132,128,85,33,248,139,161,
+    85,15,64,252,64,111,128,153,54,93,82,227,232,172,223,27,
+    244,53,134,152,37,163,194,12,253,134,82,98,203,75,243,71,
+    233,3,152,51,235,207,3,227,194,75,90,131,218,145,213,231,
+    222,130,244,223,17,107,199,190,160,163,116,148,104,254,14,6,
+    129,104,72,189,229,120,167,94,216,109,187,110,239,46,111,218,
+    189,111,209,103,53,107,169,133,162,237,135,226,33,73,133,28,
+    217,42,65,176,28,69,211,178,133,172,173,105,142,226,169,157,
+    248,217,82,193,206,230,205,46,198,138,204,17,45,155,57,178,
+    214,95,42,100,82,146,35,89,102,174,223,145,176,231,132,134,
+    46,233,108,192,114,34,154,198,99,168,105,150,4,230,168,170,
+    58,246,170,217,98,153,253,195,35,246,133,98,97,127,190,99,
+    191,137,225,110,29,30,97,136,179,242,134,96,222,90,61,11,
+    222,193,208,232,32,254,26,35,11,74,203,215,242,181,240,100,
+    120,94,105,169,40,219,161,76,29,114,107,40,191,55,110,156,
+    146,174,93,153,188,82,37,98,164,225,233,218,173,11,77,157,
+    119,172,233,131,55,71,110,143,84,154,58,221,242,76,20,214,
+    53,188,32,32,170,68,72,52,84,21,210,156,156,144,38,163,
+    19,240,61,199,168,101,2,25,229,56,20,61,28,222,32,163,
+    100,154,172,244,171,205,60,229,145,127,72,225,92,176,38,232,
+    63,164,108,13,250,128,11,171,108,3,72,12,47,134,85,211,
+    150,249,236,14,119,226,252,117,32,208,229,248,183,209,175,162,
+    215,226,147,241,9,254,177,230,122,43,37,207,202,3,220,74,
+    64,78,64,59,26,64,226,74,24,2,140,136,189,229,68,208,
+    140,61,175,104,42,37,176,70,152,195,29,96,155,234,204,15,
+    67,74,109,6,214,175,175,179,158,143,158,192,217,155,93,227,
+    27,219,49,3,51,135,111,94,189,125,181,210,216,190,88,148,
+    118,238,68,74,193,64,20,244,188,9,56,139,106,90,190,104,
+    148,114,216,142,107,218,197,146,158,91,212,192,110,70,49,163,
+    105,28,36,44,137,226,53,180,34,177,136,175,140,137,33,131,
+    40,175,247,204,124,159,155,201,20,79,28,66,197,103,46,132,
+    188,111,65,58,81,145,78,84,37,69,78,86,201,10,98,61,
+    149,55,84,137,47,66,84,62,128,173,213,5,119,137,111,183,
+    50,149,237,36,181,84,198,105,140,2,141,137,64,102,36,45,
+    113,2,147,49,29,78,226,52,43,14,48,211,178,120,120,51,
+    98,96,57,217,203,245,31,196,229,160,213,25,104,58,136,145,
+    85,230,212,49,146,80,139,16,96,19,127,111,206,45,82,0,
+    85,126,123,58,176,66,96,45,98,39,150,122,131,62,179,213,
+    238,15,235,248,59,148,81,11,225,154,245,57,215,61,73,172,
+    133,32,86,24,82,47,199,128,35,102,11,182,19,2,200,101,
+    139,134,19,226,36,114,209,81,172,204,5,19,1,228,8,249,
+    14,39,156,41,177,243,217,204,80,74,226,135,143,165,80,236,
+    65,193,81,226,17,146,11,20,206,62,205,53,65,247,233,231,
+    67,156,254,41,225,216,121,170,36,144,124,158,40,45,143,149,
+    150,57,37,57,175,36,43,74,242,105,243,166,169,93,223,15,
+    93,31,2,30,137,45,52,111,225,149,18,159,140,61,81,182,
+    60,86,182,76,157,191,127,96,230,240,221,35,51,71,30,237,
+    252,121,239,220,142,247,230,148,163,243,202,209,138,87,150,159,
+    103,63,199,191,16,60,207,193,12,195,217,14,160,97,208,143,
+    84,109,84,13,161,28,195,123,231,150,100,72,245,183,4,173,
+    137,249,180,159,197,186,220,253,135,93,96,29,63,243,171,229,
+    46,37,247,150,215,121,129,125,93,61,15,215,7,220,57,151,
+    212,1,152,113,239,122,50,127,220,161,253,14,181,240,226,25,
+    102,144,85,182,23,243,177,207,207,216,155,126,218,234,56,136,
+    243,192,242,156,185,244,121,6,231,126,68,144,129,32,101,149,
+    134,238,251,199,103,78,222,61,53,115,234,209,177,185,157,199,
+    161,239,151,57,165,103,94,233,169,40,61,255,55,97,169,16,
+    219,138,102,108,67,161,122,32,114,217,105,59,138,29,164,150,
+    140,222,240,196,73,84,116,147,26,50,170,10,146,124,172,74,
+    86,16,113,1,91,255,36,92,222,193,149,107,30,43,254,165,
+    128,188,83,11,162,81,56,204,63,209,218,116,65,170,132,242,
+    182,78,102,234,182,185,244,16,234,103,197,188,170,171,120,173,
+    219,217,98,1,158,115,10,164,169,200,178,246,8,92,110,200,
+    117,112,79,172,197,253,241,234,177,112,53,117,241,142,8,101,
+    248,90,236,45,232,124,140,202,141,60,31,47,67,36,222,50,
+    37,77,95,174,196,218,230,98,109,243,177,182,138,212,182,24,
+    81,71,230,187,186,188,141,14,57,97,120,80,226,99,210,145,
+    243,122,182,112,145,47,150,106,228,32,129,231,69,190,163,149,
+    159,125,71,132,38,67,103,89,7,10,116,157,29,68,129,248,
+    100,248,108,99,120,5,4,22,142,125,96,246,235,165,156,173,
+    157,102,89,190,42,222,50,28,59,44,138,147,120,76,209,143,
+    87,202,17,247,90,58,202,222,229,168,6,79,94,130,168,138,
+    148,210,234,89,74,104,116,44,130,223,175,164,169,226,149,5,
+    242,118,165,182,44,144,93,149,218,82,21,68,42,192,75,229,
+    95,69,148,68,18,99,114,53,180,134,194,61,179,92,124,215,
+    241,12,171,23,75,163,123,34,20,144,177,92,124,215,245,12,
+    171,23,75,163,45,100,179,58,159,220,139,251,180,215,139,120,
+    56,6,6,120,98,44,140,31,15,203,223,222,61,182,96,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/event.py",
+    "m5.event",
+    embedded_module_data,
+    1583,
+    3238);
+
+} // anonymous namespace
+} // namespace gem5
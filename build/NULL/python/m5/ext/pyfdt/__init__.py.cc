@@ -0,0 +1,31 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,123,204,128,4,24,161,244,103,54,32,49,157,33,133,
+    33,152,65,147,209,111,37,67,17,19,72,16,36,243,75,185,
+    184,40,89,191,160,178,36,35,63,79,63,215,84,63,181,162,
+    4,200,75,75,41,209,143,143,207,204,203,44,137,143,215,43,
+    168,252,197,97,147,155,159,82,154,147,106,87,196,10,53,181,
+    152,31,72,124,96,102,100,100,252,192,0,35,138,152,129,98,
+    0,185,102,28,84,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/ext/pyfdt/__init__.py",
+    "m5.ext.pyfdt",
+    embedded_module_data,
+    101,
+    128);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,1420 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,237,189,11,116,27,87,122,38,88,5,20,128,34,0,
+    18,79,190,95,16,73,241,33,190,36,138,18,37,234,97,61,
+    72,234,77,217,22,221,110,171,237,102,83,44,72,130,77,145,
+    116,1,212,3,13,186,213,137,103,2,105,56,49,236,168,215,
+    176,35,109,195,61,114,135,74,203,9,59,113,103,148,108,103,
+    162,100,59,59,143,157,157,69,241,84,66,4,103,52,209,153,
+    25,159,76,159,217,217,64,211,246,30,143,118,231,244,222,255,
+    222,170,66,85,161,64,82,178,51,157,201,25,170,244,163,30,
+    183,110,221,231,127,255,255,187,255,253,239,191,163,84,127,22,
+    233,247,103,179,52,69,189,75,113,212,105,138,163,57,211,20,
+    125,193,116,218,68,195,185,25,157,155,79,155,241,57,51,197,
+    156,102,240,175,229,180,5,255,90,79,91,209,175,101,202,118,
+    129,61,205,94,176,157,182,225,112,214,169,146,11,246,211,246,
+    11,142,211,142,11,206,211,78,116,207,118,186,148,99,79,151,
+    113,37,167,93,156,253,180,155,115,156,246,112,206,211,94,174,
+    244,180,143,43,59,237,55,81,135,40,206,245,38,197,185,131,
+    229,223,55,83,212,15,204,114,2,79,87,224,103,30,244,204,
+    27,172,208,61,171,196,207,124,232,153,191,224,89,21,126,86,
+    142,158,85,20,60,171,198,207,42,209,179,170,130,239,213,224,
+    103,213,232,89,77,193,179,90,252,172,22,61,171,43,120,86,
+    199,213,191,73,157,174,231,26,16,109,224,26,17,109,196,161,
+    3,40,244,134,130,208,1,142,57,69,117,52,77,252,145,137,
+    162,236,67,193,139,161,201,96,96,140,15,6,3,7,166,102,
+    206,4,158,157,224,195,65,222,110,15,4,2,7,103,102,175,
+    240,161,115,231,35,129,190,205,91,250,3,129,209,96,104,42,
+    208,22,158,155,13,242,211,19,109,129,253,252,133,112,132,159,
+    153,62,23,216,45,221,219,137,254,246,157,187,48,17,154,234,
+    153,156,185,176,23,71,114,28,69,63,29,14,114,129,185,105,
+    46,200,7,34,231,131,129,253,179,19,147,232,71,122,210,21,
+    248,74,144,15,135,102,166,3,125,61,155,3,237,16,160,73,
+    122,212,212,177,11,162,184,50,51,23,184,48,113,37,48,61,
+    19,9,204,133,131,40,142,80,56,112,54,52,21,12,4,47,
+    79,6,103,35,129,208,116,0,125,111,118,42,52,49,141,242,
+    114,41,20,57,143,191,35,197,210,3,113,188,36,197,49,115,
+    38,50,129,130,79,160,23,102,209,213,89,117,192,192,68,4,
+    39,57,16,56,31,137,204,14,246,246,94,186,116,169,103,2,
+    39,182,103,134,63,215,59,69,130,133,123,143,31,57,56,60,
+    122,106,184,27,37,24,191,240,194,244,84,48,28,14,240,193,
+    215,231,66,60,202,234,153,43,129,137,89,148,156,201,137,51,
+    40,145,83,19,151,2,51,124,96,226,28,42,99,46,16,153,
+    129,228,94,226,67,145,208,244,185,174,64,120,230,108,228,210,
+    4,31,132,104,184,16,42,207,208,153,185,136,166,180,228,196,
+    161,60,171,3,160,242,154,152,14,52,237,63,21,56,114,170,
+    41,112,96,255,169,35,167,186,32,146,23,143,140,29,62,249,
+    194,88,224,197,253,207,63,191,127,116,236,200,240,169,192,201,
+    231,3,7,79,142,14,29,25,59,114,114,20,93,141,4,246,
+    143,190,20,56,118,100,116,168,43,16,68,101,133,190,19,188,
+    60,203,67,14,80,50,67,80,142,65,14,23,218,169,96,80,
+    147,132,179,51,36,73,225,217,224,100,232,108,104,18,101,109,
+    250,220,220,196,185,96,224,220,204,69,212,0,80,142,2,168,
+    33,92,8,133,161,62,195,40,129,28,68,51,21,186,16,138,
+    76,68,240,173,130,124,245,216,237,251,38,230,34,231,103,248,
+    193,39,111,96,63,133,6,221,65,103,203,102,249,208,116,100,
+    252,236,220,244,36,124,6,221,113,77,156,9,207,76,161,146,
+    26,71,25,154,225,35,163,29,166,44,203,5,131,179,80,239,
+    89,6,104,135,57,107,61,21,225,231,38,35,89,235,220,52,
+    170,230,215,178,12,208,41,232,42,255,233,141,218,128,153,250,
+    41,226,76,212,79,77,64,224,230,79,25,32,37,136,68,25,
+    104,38,63,245,160,211,73,53,79,51,201,60,237,127,162,128,
+    167,5,169,211,52,226,107,38,142,62,109,14,50,156,233,77,
+    234,251,232,254,15,148,224,136,147,153,81,111,181,114,12,162,
+    54,206,130,40,203,121,57,219,155,244,233,18,206,199,149,160,
+    95,59,186,182,163,95,7,231,64,79,157,156,19,209,82,174,
+    20,209,50,174,12,81,23,138,215,85,16,175,27,221,117,23,
+    220,245,112,30,212,243,253,89,199,8,23,121,150,159,65,69,
+    26,185,18,173,15,60,31,132,218,15,78,71,160,198,2,193,
+    11,179,145,43,129,89,233,241,36,173,202,29,100,31,202,225,
+    103,219,113,238,34,170,103,28,253,38,21,163,134,116,95,252,
+    62,10,241,3,37,148,147,66,95,55,61,174,58,120,62,56,
+    249,90,24,55,130,233,137,11,193,192,197,137,169,16,23,50,
+    248,150,15,190,213,131,191,117,14,197,254,138,119,158,142,209,
+    17,85,160,87,149,55,46,210,191,237,230,168,183,77,11,190,
+    83,212,29,122,236,142,41,107,133,190,50,125,46,91,130,219,
+    6,244,68,116,211,212,179,25,85,254,121,196,227,160,166,2,
+    129,199,129,48,63,217,59,123,5,181,191,233,222,11,219,122,
+    131,151,35,232,234,44,39,209,158,217,43,143,237,187,167,80,
+    183,3,254,178,55,218,167,42,184,158,241,113,156,240,9,212,
+    198,184,200,56,228,164,103,247,212,204,228,196,84,120,111,79,
+    254,157,45,144,135,141,136,92,165,210,149,163,228,72,249,151,
+    252,127,248,21,113,207,137,244,22,56,146,12,249,69,199,207,
+    32,47,119,232,172,121,98,250,10,250,97,32,214,48,100,50,
+    192,215,33,154,245,22,126,52,218,176,70,162,32,1,45,56,
+    1,159,89,41,127,37,73,194,162,31,17,161,114,84,68,212,
+    119,82,244,157,76,187,78,166,217,147,124,35,180,104,147,170,
+    136,45,114,157,255,18,174,135,24,29,163,198,149,135,17,85,
+    200,148,250,45,229,47,70,189,90,164,53,132,171,34,54,117,
+    251,81,135,252,117,138,51,221,50,107,195,255,18,146,7,80,
+    251,97,162,101,71,166,67,17,194,229,33,127,143,209,53,206,
+    51,105,76,109,143,233,182,209,14,134,111,70,175,240,208,63,
+    179,13,227,170,2,42,44,159,108,201,48,30,69,16,223,64,
+    13,132,9,7,167,206,226,151,165,22,66,202,157,29,31,15,
+    161,175,142,143,71,253,218,210,38,119,183,66,248,67,184,140,
+    31,250,171,226,204,66,201,3,87,205,138,171,123,217,213,189,
+    200,221,13,9,174,29,162,107,71,142,162,75,118,61,240,214,
+    166,235,118,46,142,221,125,9,253,144,67,240,14,138,222,193,
+    180,115,48,103,70,1,112,40,82,13,234,238,64,203,213,224,
+    38,213,160,42,44,104,240,81,207,161,96,68,233,180,184,36,
+    248,38,220,148,248,46,72,155,170,9,177,231,130,82,195,209,
+    100,69,190,187,19,62,98,39,89,113,249,22,174,164,217,170,
+    194,212,152,229,212,84,225,212,24,85,30,170,42,243,227,242,
+    83,184,15,162,145,81,226,48,120,20,120,92,34,127,181,253,
+    49,221,129,211,201,111,214,165,210,54,62,142,250,47,42,111,
+    159,182,188,241,205,61,16,184,92,74,99,91,178,255,230,206,
+    180,171,77,58,216,54,156,92,30,106,79,211,144,77,114,154,
+    187,112,154,213,108,36,70,71,45,184,169,42,121,140,226,38,
+    25,197,165,139,88,86,61,148,46,135,248,99,216,48,63,244,
+    46,52,186,88,209,128,58,60,58,134,219,206,29,19,46,246,
+    172,133,67,13,235,188,166,37,149,162,104,198,149,247,163,213,
+    234,236,105,30,237,199,125,4,103,242,19,87,121,210,114,237,
+    141,20,115,187,68,112,117,44,30,20,92,189,105,182,151,228,
+    211,5,249,100,84,153,177,202,249,252,39,164,165,208,41,202,
+    232,79,157,91,146,83,109,119,155,103,98,104,192,122,13,159,
+    243,117,17,139,234,77,186,32,36,93,24,91,180,20,61,161,
+    99,38,206,140,207,76,154,206,206,68,88,213,149,41,198,124,
+    31,229,224,7,74,46,80,124,166,179,208,130,44,143,43,161,
+    228,207,128,96,170,47,115,82,197,63,117,34,242,152,217,123,
+    228,200,145,14,75,150,57,27,154,230,112,13,100,205,83,193,
+    105,30,134,234,44,59,50,52,54,254,236,243,39,159,237,176,
+    144,90,113,146,90,68,109,105,134,15,102,205,179,51,225,172,
+    237,34,145,65,241,168,129,110,132,45,184,202,2,170,90,59,
+    83,188,214,84,143,134,161,214,66,184,214,114,86,202,219,176,
+    226,105,90,246,52,165,250,111,239,92,140,8,205,91,5,79,
+    191,232,233,143,91,51,14,79,98,255,245,193,248,224,131,242,
+    170,100,157,80,222,42,150,183,198,71,50,206,170,228,208,205,
+    35,139,140,80,215,37,56,187,226,199,51,172,35,206,95,43,
+    137,155,31,184,253,137,175,220,250,106,234,245,197,86,193,189,
+    69,116,111,89,218,125,223,151,118,13,167,217,225,66,150,173,
+    244,206,65,74,63,76,231,107,9,213,152,242,142,182,62,81,
+    255,165,111,153,112,187,183,159,156,155,157,139,4,142,158,58,
+    57,26,181,14,6,166,231,166,166,144,212,196,188,26,70,37,
+    101,225,230,46,204,134,9,159,221,77,233,248,101,25,4,81,
+    21,88,141,186,192,180,207,78,194,187,245,184,196,62,241,86,
+    220,216,148,28,187,249,146,224,109,19,189,168,59,247,74,135,
+    212,216,141,57,162,149,34,60,8,167,184,241,249,96,100,142,
+    159,14,60,191,255,69,144,43,230,130,186,118,147,165,238,20,
+    50,27,107,100,102,156,159,184,20,245,170,83,73,238,157,130,
+    47,216,40,194,106,60,113,190,176,180,13,211,17,117,147,116,
+    132,3,163,51,129,35,145,224,133,240,40,63,134,158,119,200,
+    140,1,167,77,83,100,142,241,113,196,131,67,40,44,226,122,
+    149,90,174,167,60,120,81,157,28,95,60,178,74,229,19,185,
+    41,70,165,40,163,63,125,39,198,178,25,29,109,194,178,89,
+    126,32,9,77,35,157,6,13,152,145,43,68,49,66,127,72,
+    44,177,142,143,7,95,31,31,151,185,28,51,61,195,105,243,
+    130,2,76,7,81,54,188,218,108,192,189,175,65,217,87,203,
+    29,196,95,245,238,174,119,118,37,35,130,175,69,244,181,164,
+    93,45,105,182,165,48,79,138,220,185,80,208,160,145,60,168,
+    10,249,125,116,254,3,229,58,236,82,179,45,142,214,203,19,
+    168,11,40,90,49,98,147,106,38,154,143,145,82,203,179,175,
+    225,240,188,137,67,221,131,72,35,143,79,145,18,131,34,8,
+    20,148,21,250,155,84,23,104,40,136,68,108,158,40,85,97,
+    144,86,218,195,146,0,140,26,67,135,242,218,99,159,44,210,
+    204,156,121,53,56,25,9,68,174,204,6,71,198,16,131,179,
+    135,194,161,233,112,4,244,92,44,220,240,155,128,224,62,8,
+    130,38,255,117,74,219,17,249,87,16,209,87,3,212,221,55,
+    32,224,16,174,134,207,88,202,93,147,108,249,208,33,184,186,
+    68,87,23,8,32,91,177,152,178,69,240,246,137,222,190,180,
+    179,47,227,112,45,236,76,50,223,45,125,191,244,61,215,77,
+    215,178,163,45,237,104,203,248,170,18,219,50,249,86,104,168,
+    41,44,19,108,135,158,167,209,127,147,166,230,244,3,142,121,
+    181,167,97,92,230,37,208,158,213,223,201,215,174,78,90,156,
+    167,166,61,205,84,68,85,167,45,20,207,208,212,75,20,196,
+    115,137,186,108,126,137,186,132,90,0,199,84,231,227,176,168,
+    235,23,13,66,102,105,248,251,251,49,148,118,213,245,120,12,
+    61,53,120,239,148,246,126,196,154,255,250,171,74,74,46,82,
+    252,51,186,247,173,23,105,126,91,140,230,108,210,160,153,255,
+    210,166,34,95,106,88,231,151,236,133,95,90,218,102,28,103,
+    216,10,195,238,107,38,117,9,20,166,104,233,239,115,44,106,
+    247,37,209,179,58,78,33,73,70,178,46,167,238,2,207,98,
+    245,42,32,13,177,0,186,204,69,66,83,227,161,240,184,162,
+    154,141,75,175,159,229,103,46,32,65,107,82,121,29,15,242,
+    163,89,203,68,120,50,20,250,233,207,209,31,15,130,209,29,
+    211,99,186,244,49,109,231,65,82,69,29,131,135,113,55,107,
+    229,130,147,168,31,102,237,95,129,14,53,204,243,51,60,95,
+    9,217,1,49,10,233,4,95,133,243,195,16,146,65,99,124,
+    40,107,14,78,115,97,40,174,252,64,239,31,31,199,61,118,
+    28,50,38,165,42,28,13,104,59,80,97,8,144,126,195,251,
+    104,204,213,236,148,203,29,55,103,16,97,30,148,121,18,27,
+    175,189,186,240,106,220,252,137,203,155,216,118,45,186,16,133,
+    254,85,149,241,85,38,250,115,118,51,58,243,87,191,123,252,
+    157,227,169,74,193,223,33,250,59,226,195,241,225,207,31,184,
+    170,113,168,60,193,225,209,27,72,67,168,250,252,243,207,209,
+    55,156,158,132,23,250,228,178,163,46,237,168,195,207,31,162,
+    175,29,188,30,138,135,50,190,138,248,208,67,183,47,49,249,
+    78,73,162,4,125,33,217,124,227,104,170,101,217,223,154,246,
+    183,74,151,31,182,138,77,125,105,63,28,114,128,41,114,9,
+    47,190,254,54,155,48,231,28,148,199,255,116,113,228,16,79,
+    41,79,156,90,136,38,199,150,93,27,210,174,13,169,83,139,
+    67,223,251,90,234,107,153,202,218,68,36,227,116,37,182,92,
+    59,28,63,152,171,166,80,177,224,52,231,234,40,183,63,30,
+    9,131,60,251,253,242,221,212,143,237,251,237,230,63,46,161,
+    17,53,30,11,98,180,94,140,55,230,12,250,145,142,175,85,
+    115,133,148,217,240,29,120,75,51,150,156,162,34,37,171,196,
+    185,101,181,167,72,32,182,130,152,43,245,173,218,136,253,75,
+    255,254,166,85,159,214,70,156,79,245,197,85,248,49,168,119,
+    209,246,35,120,44,138,132,144,58,157,231,4,88,51,71,162,
+    147,36,127,193,216,197,151,82,146,74,214,97,35,74,121,64,
+    171,148,23,246,168,172,122,208,58,37,221,99,177,186,141,226,
+    38,253,221,173,10,242,226,12,207,133,53,119,14,92,137,160,
+    65,213,68,212,129,18,244,210,120,161,208,229,158,14,94,130,
+    248,198,229,212,71,235,212,93,93,255,244,215,208,59,225,69,
+    74,194,82,156,149,43,142,206,101,71,231,226,17,193,177,93,
+    116,108,207,81,182,146,141,15,124,27,87,124,61,203,190,158,
+    197,200,210,75,130,239,25,209,247,76,218,249,204,131,82,119,
+    162,250,218,215,23,190,158,163,44,37,27,63,52,167,142,124,
+    80,118,187,108,201,35,4,250,150,38,150,3,3,233,192,192,
+    3,95,243,138,175,107,217,215,181,56,182,180,83,240,237,17,
+    125,123,210,206,61,170,23,205,249,23,241,133,241,11,159,248,
+    26,20,113,202,73,100,169,209,59,52,46,123,36,175,193,15,
+    86,25,59,188,128,105,128,194,63,62,158,181,143,143,95,152,
+    225,230,166,224,220,57,62,14,82,140,244,4,169,225,220,204,
+    36,220,14,131,252,60,121,33,136,88,57,199,119,64,52,221,
+    148,44,117,12,0,217,11,228,24,144,103,129,188,0,228,37,
+    32,223,160,36,57,132,127,29,200,37,32,32,11,19,253,21,
+    75,41,30,153,116,66,1,87,96,62,42,255,203,48,109,105,
+    166,237,161,197,147,51,153,44,207,210,57,10,232,35,51,101,
+    245,190,249,178,116,139,101,44,187,114,148,66,156,38,75,53,
+    4,147,8,107,178,180,195,153,68,208,229,102,56,83,19,150,
+    181,140,160,152,11,168,223,40,172,201,226,133,51,137,160,75,
+    63,156,73,132,53,91,54,162,218,145,137,157,133,7,10,241,
+    163,84,231,76,173,112,137,136,146,9,184,241,44,141,159,149,
+    192,155,136,40,207,228,27,152,144,34,43,142,58,131,226,189,
+    126,212,25,61,99,10,158,217,56,55,103,125,147,62,205,114,
+    30,142,197,56,180,91,194,161,237,232,157,162,40,52,231,66,
+    28,193,203,243,40,138,104,195,179,26,86,32,117,232,192,68,
+    152,112,4,99,118,126,150,34,130,226,155,69,17,11,206,164,
+    101,65,235,19,4,245,144,52,134,16,27,134,47,71,248,9,
+    36,88,203,105,195,114,135,194,34,52,162,44,168,16,24,136,
+    222,76,41,64,180,111,158,214,42,33,218,111,254,182,39,70,
+    191,109,90,240,159,34,13,189,131,198,236,10,177,162,26,244,
+    147,53,133,35,26,17,29,116,223,232,158,66,110,7,146,58,
+    73,166,134,49,26,129,204,144,197,48,240,185,171,84,218,117,
+    148,28,9,254,79,155,239,159,249,227,182,159,180,193,133,73,
+    185,79,218,16,20,55,150,164,80,170,64,178,203,90,194,179,
+    72,117,233,48,101,205,147,83,97,44,41,105,24,101,133,113,
+    98,162,29,235,78,247,63,130,40,183,82,146,226,231,62,70,
+    163,180,36,95,248,238,203,239,191,188,216,38,212,247,137,245,
+    125,43,245,59,150,235,119,220,243,11,245,123,197,250,189,232,
+    177,224,58,42,162,52,179,36,205,147,234,129,75,129,165,237,
+    235,21,3,10,6,56,154,138,153,214,84,17,77,67,212,43,
+    199,145,106,162,66,175,98,186,22,166,12,236,107,196,165,30,
+    162,161,3,198,204,171,79,151,232,226,99,244,241,45,156,136,
+    153,98,212,184,18,134,179,160,182,109,141,122,242,240,184,92,
+    73,46,89,157,148,110,16,112,212,112,182,133,204,236,224,70,
+    94,177,218,108,75,152,65,218,1,210,48,126,219,207,65,83,
+    175,4,208,131,63,143,30,141,241,21,144,118,208,47,10,91,
+    121,175,97,107,33,24,186,81,187,254,33,196,2,40,22,106,
+    51,20,227,241,230,201,195,170,58,36,74,126,184,93,108,222,
+    154,174,132,99,41,114,47,150,30,56,134,142,156,133,42,175,
+    126,136,79,209,129,155,78,180,74,46,1,60,247,3,51,176,
+    82,81,140,118,88,201,232,131,71,51,172,77,67,95,229,55,
+    80,0,66,75,129,144,234,0,64,7,209,179,227,240,132,129,
+    39,90,213,1,199,16,173,93,37,135,32,56,132,63,194,185,
+    249,132,245,173,176,117,203,108,93,114,44,213,47,176,237,34,
+    219,158,102,219,51,174,10,144,246,123,177,246,221,45,120,123,
+    68,111,79,218,217,147,241,215,230,40,123,201,110,76,226,67,
+    15,144,200,220,127,237,202,194,149,228,254,235,111,196,223,120,
+    80,209,152,14,108,17,42,250,196,138,190,180,187,15,61,205,
+    153,148,82,10,180,228,44,232,247,17,92,124,10,228,145,217,
+    234,46,251,148,66,4,73,43,165,187,63,43,163,42,3,233,
+    192,160,80,177,75,172,216,149,118,239,202,185,208,221,156,155,
+    170,106,140,51,11,206,56,250,87,216,247,20,132,121,31,110,
+    44,38,220,183,138,2,77,58,174,173,23,50,59,232,199,165,
+    184,197,202,44,184,131,206,118,140,23,150,162,49,83,185,99,
+    230,223,84,106,230,34,148,175,153,212,9,169,146,112,177,42,
+    145,229,200,63,128,87,200,228,24,48,37,95,60,156,232,79,
+    250,86,170,183,46,87,111,93,58,34,84,239,21,171,247,10,
+    174,103,68,215,51,105,246,153,34,19,11,202,16,118,158,122,
+    146,137,5,206,84,116,198,76,41,108,109,209,225,183,204,210,
+    164,4,195,195,76,77,148,9,236,9,52,61,102,154,186,2,
+    77,81,83,211,46,116,123,151,92,30,89,230,213,153,208,52,
+    110,175,5,0,45,150,214,52,106,173,92,50,154,57,136,63,
+    162,242,40,145,149,42,245,37,94,184,54,154,41,243,46,132,
+    30,153,233,210,170,135,101,254,71,22,83,105,57,42,57,87,
+    249,91,175,93,127,45,217,114,179,75,40,107,19,203,218,30,
+    217,204,165,72,212,162,92,190,71,37,76,169,47,103,182,150,
+    216,139,204,87,216,228,226,107,55,21,78,42,23,204,52,168,
+    138,18,113,230,206,121,75,140,137,89,140,11,82,47,47,104,
+    98,54,35,126,170,105,137,202,156,5,179,208,165,225,246,58,
+    190,59,111,141,153,57,139,4,207,116,198,76,156,21,87,139,
+    13,171,120,140,4,207,52,174,254,45,206,166,125,47,138,20,
+    66,220,80,152,40,201,165,149,99,225,62,95,23,99,214,136,
+    137,149,195,202,113,144,60,20,131,51,81,249,229,199,139,18,
+    131,89,31,91,204,134,114,65,114,87,167,41,7,125,93,216,
+    240,172,143,46,54,2,23,105,210,108,87,43,159,49,107,204,
+    166,155,235,145,243,108,90,173,212,201,28,82,140,81,102,134,
+    28,252,62,72,34,192,243,88,150,201,210,103,200,124,16,204,
+    143,242,7,224,12,166,152,136,226,9,114,14,127,144,194,218,
+    39,12,194,132,135,91,131,211,128,22,17,126,15,141,156,112,
+    145,17,8,199,18,134,15,83,186,24,48,226,143,192,27,12,
+    76,68,101,45,120,12,201,178,112,49,14,179,76,71,209,179,
+    48,124,77,1,173,112,23,3,93,168,72,23,83,77,24,253,
+    115,120,121,11,45,117,49,183,63,113,224,218,229,133,203,113,
+    38,83,94,125,227,101,24,13,118,98,18,31,206,56,221,137,
+    97,53,84,244,209,208,146,111,105,226,206,241,187,199,5,255,
+    14,193,185,35,62,132,198,6,95,69,34,242,246,206,27,59,
+    227,108,198,225,77,60,127,125,119,124,119,242,84,170,239,189,
+    175,46,122,222,27,93,156,88,174,235,77,215,245,62,240,85,
+    38,205,201,231,222,222,125,99,119,106,203,162,111,145,191,83,
+    181,244,220,157,50,161,121,64,240,237,184,215,143,180,214,248,
+    80,198,225,75,76,92,219,13,31,223,129,62,253,157,161,164,
+    47,57,241,246,241,27,199,83,251,23,171,150,246,223,169,19,
+    90,182,11,254,1,193,57,128,194,122,234,191,216,60,215,3,
+    151,47,49,114,235,112,234,252,146,85,112,13,136,174,129,123,
+    45,130,107,47,42,4,214,241,15,195,100,176,19,216,170,184,
+    57,131,202,103,42,117,48,237,130,209,114,21,91,5,98,125,
+    243,116,19,95,168,153,153,16,111,54,68,73,176,216,166,66,
+    88,87,23,224,164,70,107,226,24,249,12,166,52,249,19,240,
+    168,108,48,240,181,38,105,16,67,204,59,106,234,10,24,107,
+    29,90,129,172,72,150,116,125,147,8,100,242,132,211,40,52,
+    198,147,148,162,128,240,215,40,35,217,108,155,65,75,213,206,
+    212,25,73,104,127,9,113,193,12,62,210,60,234,14,145,99,
+    169,229,214,216,205,211,168,118,235,187,197,250,110,229,54,174,
+    175,199,244,43,168,8,148,36,145,46,151,160,164,62,137,134,
+    115,220,239,96,130,63,107,69,95,157,155,138,104,71,116,192,
+    22,162,27,214,76,234,191,134,100,61,135,147,245,137,191,234,
+    198,209,100,228,230,21,210,107,210,158,157,228,64,141,147,45,
+    75,180,188,219,241,78,7,73,223,189,150,31,119,161,31,161,
+    238,144,136,168,247,176,232,61,44,176,135,73,176,230,107,165,
+    232,196,85,30,47,93,101,174,227,40,69,84,216,148,81,211,
+    161,64,15,215,14,95,171,181,29,192,215,248,231,41,137,197,
+    25,203,234,85,249,166,97,3,89,157,195,131,24,170,124,64,
+    232,105,194,245,198,84,245,254,174,97,189,119,27,20,38,153,
+    251,52,170,239,79,32,142,58,82,223,149,207,144,99,177,60,
+    105,73,49,239,57,149,27,184,140,208,87,149,122,213,207,184,
+    98,116,72,51,139,174,253,242,191,131,224,196,104,234,161,203,
+    243,214,165,235,151,72,196,75,45,31,119,161,31,161,242,25,
+    17,81,215,62,209,181,47,205,238,43,172,18,133,17,180,83,
+    198,246,41,234,138,64,215,230,91,22,44,82,245,67,218,182,
+    65,218,74,186,164,20,13,242,219,73,102,20,225,191,32,51,
+    0,127,105,102,184,243,130,63,54,87,249,43,8,223,40,229,
+    102,47,49,87,65,234,237,222,197,200,221,24,57,131,131,221,
+    91,200,208,20,155,149,58,74,111,245,163,158,194,193,83,183,
+    216,70,69,226,40,93,1,94,154,126,158,144,110,161,246,128,
+    59,152,60,255,28,154,230,130,151,53,141,1,176,58,141,45,
+    89,62,23,202,244,243,127,132,180,184,40,217,56,40,150,28,
+    22,93,77,105,182,105,21,11,161,77,84,193,148,173,170,236,
+    245,141,94,182,100,146,113,153,201,153,185,233,8,42,252,225,
+    98,133,15,8,37,26,131,199,199,139,84,0,126,246,215,144,
+    16,47,69,76,105,144,242,116,99,183,224,10,136,174,64,154,
+    13,172,50,217,252,244,200,66,216,4,86,0,177,34,38,113,
+    218,110,191,154,140,165,76,71,210,58,248,127,93,49,235,113,
+    176,87,234,230,77,106,137,45,102,202,183,32,144,171,242,87,
+    210,119,177,225,253,41,106,161,30,38,3,17,107,62,131,110,
+    142,140,201,10,51,70,116,127,131,146,20,230,172,133,159,152,
+    62,23,212,112,113,176,19,228,49,236,163,97,225,120,74,218,
+    168,239,147,153,105,48,129,12,255,61,74,158,153,174,93,113,
+    109,88,118,109,72,181,160,241,196,213,45,186,186,65,34,169,
+    38,115,207,14,215,91,187,175,239,190,182,119,97,239,173,83,
+    41,255,123,47,221,124,105,217,209,154,118,180,226,167,15,202,
+    107,146,253,223,221,253,254,238,247,246,222,220,43,148,111,18,
+    203,55,229,40,83,73,61,38,72,156,82,218,111,138,91,220,
+    118,251,181,101,215,150,180,107,75,166,178,46,49,151,152,203,
+    153,41,119,95,222,192,98,148,191,12,9,191,130,72,135,155,
+    7,38,203,127,19,72,12,200,60,228,222,49,57,53,17,14,
+    75,232,56,88,41,16,60,1,244,79,67,96,28,35,230,47,
+    41,37,136,203,82,135,137,243,50,73,65,129,252,39,74,139,
+    137,183,167,153,246,135,22,55,0,224,199,48,38,126,12,99,
+    226,158,55,191,38,221,98,221,150,198,28,165,144,22,244,12,
+    158,236,195,129,247,169,3,163,91,44,107,177,3,66,173,38,
+    126,143,165,35,71,105,73,171,197,82,145,163,180,164,204,100,
+    217,143,35,85,40,107,178,60,3,167,18,65,151,205,112,38,
+    17,116,185,1,206,36,194,58,0,13,47,36,164,36,32,255,
+    198,80,55,71,233,161,110,24,96,79,51,65,12,110,235,64,
+    109,43,231,226,44,111,210,24,220,182,97,112,219,37,129,219,
+    37,232,157,85,160,109,196,89,61,60,176,128,104,157,22,212,
+    190,4,211,77,121,72,219,16,154,92,166,190,8,52,137,58,
+    108,243,188,25,13,93,230,73,211,101,211,107,248,77,222,202,
+    73,103,97,255,52,77,83,26,128,208,28,51,131,34,88,0,
+    19,182,104,88,140,78,41,14,175,1,50,98,136,81,145,119,
+    37,136,209,149,135,24,113,57,96,205,11,155,205,255,252,91,
+    63,255,150,153,138,238,148,225,54,120,44,205,3,110,228,186,
+    228,21,18,225,192,230,192,238,61,129,233,185,11,103,130,60,
+    156,245,247,237,236,223,185,125,160,111,231,182,104,169,252,42,
+    158,208,27,69,194,162,1,60,151,181,224,239,106,112,185,37,
+    184,207,224,251,6,184,92,181,126,170,80,65,229,24,148,219,
+    240,119,168,85,80,57,127,53,234,17,37,94,76,144,178,227,
+    243,39,153,180,111,19,58,150,49,77,217,201,47,57,30,84,
+    52,230,24,186,122,123,206,74,85,214,62,42,97,202,107,31,
+    153,173,149,222,79,41,68,114,168,207,121,17,111,241,119,126,
+    230,166,220,190,188,61,64,247,3,111,109,242,164,224,237,18,
+    189,93,105,103,87,166,188,38,206,44,216,227,232,95,33,250,
+    166,224,37,128,93,253,138,73,59,182,94,51,173,58,245,188,
+    61,110,58,75,163,254,193,70,84,49,114,166,213,99,208,46,
+    31,210,139,173,243,102,9,255,51,23,76,31,175,218,176,80,
+    197,254,3,74,86,208,11,240,104,24,236,176,140,11,34,240,
+    119,104,73,202,109,214,65,11,40,177,49,144,123,49,158,246,
+    247,84,3,152,14,36,81,61,65,210,113,11,54,77,54,237,
+    61,162,154,149,166,121,208,223,145,200,141,103,104,232,144,26,
+    75,188,90,68,88,38,205,72,70,18,141,132,229,42,104,90,
+    208,94,63,7,252,218,92,94,150,39,15,253,229,159,153,41,
+    79,101,34,146,124,41,245,250,226,150,197,215,239,108,75,93,
+    17,235,183,8,238,62,209,221,183,180,69,116,111,203,153,53,
+    175,16,36,219,35,247,15,152,97,199,73,64,169,198,226,17,
+    212,9,238,34,168,91,104,65,81,220,55,164,94,241,13,53,
+    52,90,216,43,228,236,248,33,233,151,73,210,97,170,219,21,
+    191,2,227,108,114,191,224,168,79,121,150,29,77,105,71,83,
+    206,164,73,31,38,159,84,55,36,95,255,176,57,21,250,160,
+    231,118,207,210,6,161,186,95,172,238,207,89,208,147,71,240,
+    248,83,32,241,225,28,75,249,43,19,91,81,230,95,16,124,
+    205,162,175,57,237,108,254,4,64,239,94,193,187,89,244,110,
+    78,59,55,23,1,91,21,230,10,99,239,23,7,91,37,133,
+    190,104,235,54,0,96,25,9,128,181,228,1,216,221,143,233,
+    34,218,123,13,165,168,104,236,60,26,169,160,177,254,58,115,
+    203,132,154,97,9,146,169,76,89,211,230,203,89,243,230,29,
+    151,241,232,127,71,82,212,240,180,71,129,162,214,87,80,89,
+    26,172,214,168,1,182,66,45,6,40,173,182,54,148,116,37,
+    199,208,127,244,79,171,177,69,77,123,53,0,50,209,223,160,
+    237,20,193,143,27,86,79,81,0,190,62,70,173,3,61,246,
+    190,117,254,250,121,73,197,27,250,248,104,94,197,43,219,39,
+    150,237,3,48,25,196,138,39,66,147,95,165,127,241,214,239,
+    26,155,119,179,218,230,93,19,163,74,38,215,241,94,134,160,
+    194,90,196,84,19,171,69,55,39,174,50,4,84,133,178,190,
+    169,249,202,218,173,124,222,18,51,105,210,104,49,132,182,44,
+    10,30,107,35,120,44,198,28,176,145,9,192,173,132,193,22,
+    0,24,144,70,131,165,93,90,214,174,23,137,228,165,93,252,
+    199,20,94,214,130,113,220,31,83,235,237,40,103,86,239,40,
+    91,233,60,140,229,218,65,142,212,216,119,152,196,88,178,95,
+    112,7,68,119,64,185,77,192,13,155,10,49,198,220,23,167,
+    7,176,99,210,97,160,235,220,177,26,161,200,24,46,230,1,
+    161,12,91,41,25,51,86,33,198,70,157,74,149,250,77,144,
+    210,123,212,151,180,192,64,2,94,63,156,92,108,185,187,233,
+    131,153,219,51,247,104,161,117,231,189,237,130,235,128,232,58,
+    240,167,99,25,103,217,35,179,105,132,182,127,74,1,253,43,
+    123,217,245,22,82,12,139,99,119,79,163,31,178,180,73,176,
+    239,20,237,59,81,119,118,15,198,25,148,172,18,231,223,81,
+    216,182,20,96,91,44,99,194,140,27,255,22,101,0,60,173,
+    131,241,243,191,79,201,10,159,113,19,222,90,208,8,214,134,
+    98,7,85,204,190,97,132,28,75,253,201,111,165,134,146,223,
+    130,127,202,77,2,196,154,154,138,33,177,184,1,223,164,244,
+    122,59,134,94,27,215,72,216,0,93,28,120,221,65,14,130,
+    168,182,190,219,249,78,39,73,207,189,254,31,15,162,31,161,
+    97,68,68,212,123,72,244,30,18,216,67,18,62,123,173,236,
+    111,13,240,250,5,248,22,15,51,169,252,253,226,21,222,89,
+    80,174,197,49,88,176,51,254,153,196,172,42,247,145,99,113,
+    236,22,131,181,150,170,118,177,170,93,185,173,65,98,113,189,
+    26,34,177,149,69,190,190,151,86,22,175,42,56,44,68,187,
+    52,246,241,105,244,35,84,238,19,17,117,237,23,93,251,211,
+    236,254,191,9,28,214,214,133,211,163,69,97,13,51,130,81,
+    216,42,3,53,15,99,176,7,32,39,50,6,59,72,48,216,
+    65,116,16,54,54,40,29,236,224,23,195,96,55,0,118,137,
+    217,131,26,129,197,74,112,104,58,18,60,23,228,145,166,129,
+    83,255,61,125,43,192,240,107,157,65,242,21,240,117,132,214,
+    128,175,209,228,70,53,132,249,37,128,175,40,3,46,37,3,
+    90,232,213,176,196,127,163,88,137,99,208,245,40,45,173,86,
+    149,65,215,193,107,223,90,248,86,154,109,248,31,144,171,244,
+    229,181,32,87,254,55,209,45,99,184,149,40,123,184,86,238,
+    82,134,0,107,97,151,38,240,234,40,84,203,127,27,120,149,
+    180,208,212,208,98,249,237,99,203,120,33,159,10,94,221,108,
+    8,175,222,113,25,193,171,4,253,1,203,169,47,132,168,70,
+    100,66,195,32,245,175,40,45,162,218,154,102,90,115,76,153,
+    165,54,71,41,36,128,81,211,18,203,22,176,190,221,162,96,
+    166,112,163,194,8,50,117,0,80,170,37,53,198,144,233,1,
+    12,150,42,148,53,129,241,178,66,244,24,169,9,96,92,133,
+    172,14,153,66,6,127,225,144,233,28,52,193,102,157,29,112,
+    232,220,52,118,142,18,9,174,133,156,222,163,254,118,32,167,
+    5,6,162,198,248,168,146,135,66,124,20,231,54,116,245,231,
+    63,255,249,79,191,5,101,162,32,163,4,20,5,143,42,16,
+    68,139,142,118,111,233,219,161,5,72,183,244,13,228,145,81,
+    188,176,1,124,28,104,145,209,172,5,127,76,13,138,146,91,
+    209,44,131,159,172,1,139,226,104,21,88,116,28,250,200,91,
+    212,19,192,162,149,201,254,180,175,21,29,203,152,166,182,146,
+    95,114,72,176,232,174,85,97,209,182,156,155,114,151,63,41,
+    32,90,34,183,154,175,80,121,115,68,173,25,153,26,238,212,
+    35,224,88,197,54,105,91,81,129,145,162,137,128,149,239,80,
+    88,8,193,150,69,152,13,255,67,202,208,228,176,176,88,101,
+    92,109,6,138,181,147,210,24,28,222,170,72,153,145,6,214,
+    241,193,244,237,105,33,208,191,20,18,170,247,137,213,58,185,
+    234,191,19,40,236,107,252,63,166,116,210,8,140,182,88,108,
+    222,65,41,98,115,37,182,45,214,8,206,156,174,39,71,105,
+    72,235,175,51,72,128,174,2,161,60,203,158,149,254,120,88,
+    134,147,53,111,238,187,12,158,82,144,96,37,227,102,43,212,
+    90,112,0,169,140,53,113,179,111,66,45,117,227,90,74,187,
+    143,147,227,158,63,49,116,107,107,50,186,216,39,212,246,136,
+    181,61,130,191,39,237,233,135,67,14,33,129,104,175,24,128,
+    104,127,70,173,11,68,51,72,30,20,82,248,69,106,189,32,
+    90,6,167,228,190,255,39,53,232,71,112,31,23,221,199,145,
+    2,239,42,67,250,187,171,236,145,205,82,90,150,115,2,142,
+    86,106,5,28,141,93,27,71,251,55,127,7,112,52,61,130,
+    54,111,137,89,180,254,40,214,133,162,89,158,8,69,131,148,
+    91,86,195,208,56,43,182,241,236,208,165,197,198,233,152,17,
+    103,93,59,22,141,245,231,147,98,119,172,33,118,247,229,194,
+    118,81,211,222,51,68,255,197,22,99,235,234,164,107,96,118,
+    113,21,102,215,112,136,28,75,67,183,34,72,224,108,17,26,
+    123,197,198,94,229,54,105,228,24,141,196,44,124,21,244,14,
+    247,84,220,103,255,152,90,15,68,103,144,216,171,144,176,127,
+    75,253,77,65,116,75,23,5,215,94,145,152,71,58,191,195,
+    36,158,127,155,189,193,190,91,250,78,41,201,235,189,161,31,
+    31,69,63,66,195,33,17,81,247,97,209,141,205,216,152,7,
+    142,178,120,228,218,206,133,157,137,215,175,237,193,54,165,58,
+    179,206,143,124,139,99,119,170,239,86,47,61,119,167,94,104,
+    25,144,141,74,255,238,218,96,98,48,15,75,70,198,96,158,
+    98,104,87,145,111,240,86,98,104,135,135,37,27,54,179,3,
+    83,67,162,105,24,183,236,173,5,141,101,109,40,239,109,58,
+    111,101,215,48,68,142,37,127,170,37,57,159,156,87,110,144,
+    70,253,19,104,207,198,56,30,110,202,235,192,241,140,82,245,
+    171,79,136,227,65,130,238,249,127,92,131,126,132,134,33,17,
+    81,239,176,232,29,22,216,225,191,91,56,30,116,235,213,248,
+    88,103,65,185,22,199,241,222,69,31,228,255,41,37,233,168,
+    50,74,135,107,109,77,148,78,29,247,119,32,158,127,38,199,
+    243,165,3,112,248,83,90,0,206,48,141,5,0,156,172,80,
+    96,0,238,61,72,228,191,80,18,249,180,8,91,53,246,7,
+    5,17,171,17,54,184,129,186,34,78,214,218,200,154,156,46,
+    5,89,187,5,105,251,151,134,5,248,148,80,26,255,125,82,
+    90,195,69,75,171,0,60,147,83,133,193,179,15,32,69,255,
+    202,176,180,254,7,88,246,116,96,25,174,133,117,128,101,114,
+    61,0,88,246,33,84,67,154,146,170,65,133,83,241,2,85,
+    136,47,205,201,228,101,96,158,16,66,141,47,117,167,153,110,
+    99,124,41,143,3,169,172,242,0,20,178,3,176,164,37,85,
+    78,0,150,180,164,238,191,53,196,4,121,52,134,152,128,111,
+    24,65,76,120,193,185,5,187,57,181,114,118,188,192,220,198,
+    57,48,160,196,114,37,168,103,59,179,86,84,7,163,51,179,
+    209,42,68,2,147,231,67,83,156,206,117,215,218,222,191,212,
+    107,95,167,103,34,231,67,211,231,136,219,173,130,222,135,193,
+    15,23,249,162,2,121,252,30,45,9,124,164,202,214,233,114,
+    44,234,144,92,142,129,203,132,34,159,219,162,254,156,236,105,
+    241,247,161,113,157,166,140,184,142,225,135,8,83,62,165,52,
+    60,67,254,91,166,228,9,115,221,63,132,111,124,69,105,166,
+    5,24,130,142,245,22,98,8,121,39,136,68,199,103,123,123,
+    3,95,27,61,249,236,43,136,221,98,29,215,88,169,245,75,
+    201,208,168,178,127,12,229,235,161,212,30,13,237,130,107,83,
+    154,221,84,68,9,85,88,221,110,156,58,36,197,209,146,51,
+    65,245,80,109,42,238,1,76,81,113,204,68,197,193,26,0,
+    24,16,160,236,96,223,128,54,240,13,136,178,35,131,102,218,
+    169,122,29,98,118,76,155,51,149,196,255,167,180,122,25,105,
+    137,51,254,250,53,150,56,237,27,187,53,32,184,155,69,119,
+    115,234,229,165,173,105,215,64,154,29,40,48,41,46,41,142,
+    121,27,185,215,208,113,157,255,75,38,191,11,137,152,161,180,
+    92,167,41,205,52,229,24,218,18,64,18,191,76,172,58,151,
+    21,5,14,45,58,225,76,77,88,198,178,3,124,107,24,18,
+    146,22,72,129,49,79,184,79,61,181,43,100,43,162,37,156,
+    13,3,206,44,6,156,75,48,224,108,199,128,115,35,231,68,
+    252,163,140,11,112,101,232,215,133,174,93,232,215,13,142,143,
+    193,213,49,162,94,206,139,168,15,220,180,159,246,115,126,68,
+    203,193,45,251,233,10,110,3,87,137,194,86,114,85,232,170,
+    10,92,174,159,174,230,106,16,173,1,23,235,167,107,185,186,
+    55,85,110,213,193,93,58,106,42,80,241,92,48,234,3,186,
+    26,111,82,154,237,23,113,147,204,131,132,250,101,121,68,230,
+    193,89,234,106,11,243,123,164,204,173,211,169,49,120,117,227,
+    27,148,118,24,0,2,154,184,154,29,65,119,192,139,50,138,
+    196,251,127,66,28,27,229,56,140,117,200,255,153,42,244,57,
+    12,249,30,87,193,68,232,74,121,87,237,7,173,232,2,216,
+    34,197,30,174,138,56,242,225,176,100,172,92,97,201,184,208,
+    31,49,141,157,137,248,240,160,131,29,0,42,78,137,71,249,
+    54,200,25,72,221,72,38,193,80,188,45,60,119,6,229,127,
+    34,107,157,157,224,81,187,225,63,133,187,53,227,82,9,21,
+    22,16,49,119,238,212,215,23,30,186,220,249,114,37,99,151,
+    8,157,31,180,4,197,3,113,166,178,26,150,240,103,42,0,
+    58,119,60,112,85,172,184,58,150,93,29,139,45,119,59,4,
+    87,191,232,234,255,155,243,71,204,247,202,13,194,120,36,84,
+    82,47,15,133,255,26,218,66,31,181,106,91,136,22,124,8,
+    137,140,125,104,44,208,96,251,106,223,94,58,161,183,54,86,
+    4,81,208,118,198,24,45,25,75,203,226,229,86,16,47,59,
+    204,146,111,204,112,32,116,150,120,154,14,133,241,142,4,120,
+    55,1,84,183,208,0,198,70,208,64,242,57,188,12,115,109,
+    132,53,67,142,59,204,170,57,25,6,90,129,70,8,5,239,
+    42,196,3,22,118,187,196,205,225,189,3,34,196,181,183,84,
+    205,70,207,31,210,202,242,124,84,233,55,142,195,220,107,29,
+    38,176,18,184,62,201,125,56,34,248,58,69,31,226,226,116,
+    105,221,18,243,143,75,127,167,244,135,174,143,93,247,251,151,
+    55,31,74,111,62,132,157,177,37,34,159,103,92,254,248,220,
+    42,174,68,55,83,79,226,74,148,150,5,163,166,253,28,71,
+    36,185,174,0,7,236,18,210,204,225,45,28,38,102,103,131,
+    211,92,123,199,104,7,157,181,146,139,2,223,149,89,199,4,
+    199,141,75,37,139,253,64,227,162,80,221,252,43,200,127,13,
+    201,63,235,124,203,113,221,145,24,18,216,106,145,173,78,203,
+    199,42,222,43,206,172,154,171,117,184,54,167,11,166,141,140,
+    203,97,211,193,153,233,48,222,104,0,181,20,48,219,158,136,
+    72,219,56,192,14,9,1,148,33,216,21,2,23,212,40,106,
+    41,208,183,136,26,115,73,215,116,10,61,92,100,61,80,28,
+    224,184,72,137,19,79,62,41,37,165,121,244,31,161,188,54,
+    169,203,235,59,199,86,252,155,151,253,155,151,252,75,87,4,
+    255,126,209,191,95,96,15,136,236,129,180,124,172,162,127,126,
+    131,148,31,253,237,150,167,116,200,106,42,152,76,165,53,147,
+    169,52,238,118,155,78,129,103,115,204,50,49,147,237,10,140,
+    206,76,147,146,147,50,26,152,152,4,7,238,65,110,148,7,
+    9,4,117,65,220,251,128,191,18,30,250,95,128,20,52,47,
+    87,24,113,31,18,241,56,110,98,149,114,193,233,30,252,53,
+    20,219,22,82,108,14,87,218,81,251,225,209,197,200,143,94,
+    20,90,246,136,45,123,208,165,222,89,42,225,184,113,244,239,
+    9,249,166,108,128,163,202,45,18,179,113,234,245,203,30,93,
+    231,138,37,94,247,224,51,72,124,222,159,251,55,211,108,205,
+    83,251,115,199,26,72,212,2,159,105,199,120,144,49,143,199,
+    138,136,43,207,186,176,38,242,95,104,149,207,246,230,68,228,
+    198,149,180,171,89,58,216,230,181,92,171,0,56,243,43,116,
+    113,108,48,78,159,165,145,76,201,174,31,31,156,215,206,145,
+    232,87,189,152,95,195,3,9,111,81,41,29,42,225,226,154,
+    60,193,170,12,55,249,9,209,152,9,104,97,104,28,194,34,
+    169,83,86,172,78,241,175,234,107,66,193,38,247,81,170,133,
+    47,53,32,230,25,231,252,154,137,44,251,46,240,0,80,139,
+    173,165,161,230,209,15,104,15,119,164,213,45,102,196,61,241,
+    10,123,131,245,45,29,114,173,173,57,69,10,242,61,158,200,
+    254,252,42,149,118,30,32,199,226,100,252,212,74,105,195,114,
+    105,67,114,46,245,250,123,87,132,210,14,177,180,67,121,156,
+    175,229,168,57,240,77,123,212,52,191,171,195,66,80,79,60,
+    104,98,176,38,63,115,154,135,174,191,161,214,45,203,13,211,
+    248,95,161,125,93,35,233,121,232,173,120,183,246,157,218,140,
+    252,93,116,44,141,125,252,50,250,17,156,7,68,231,129,71,
+    102,147,23,44,154,189,246,184,149,44,110,185,120,109,215,194,
+    174,164,231,250,51,241,103,50,78,111,130,187,54,26,31,249,
+    4,157,20,247,119,3,139,18,202,63,99,209,89,98,238,218,
+    52,172,75,168,7,207,175,190,71,14,11,204,172,218,138,206,
+    172,42,227,207,118,19,225,159,224,213,198,184,110,181,237,151,
+    147,5,147,74,221,234,45,85,236,156,89,187,90,107,222,50,
+    253,172,38,52,83,92,64,130,89,209,245,165,164,200,196,140,
+    110,158,81,243,93,43,103,46,226,111,199,162,65,14,245,179,
+    155,54,101,142,116,213,216,56,219,218,177,20,204,145,174,242,
+    134,52,89,164,153,237,125,165,105,222,26,179,26,207,13,199,
+    152,152,41,166,43,251,151,205,224,37,103,158,193,115,173,196,
+    145,178,101,161,25,241,19,155,60,3,171,171,153,178,252,149,
+    174,172,74,165,218,97,228,25,219,232,251,69,246,69,208,248,
+    93,158,8,43,59,86,192,94,7,176,81,211,132,124,39,76,
+    182,63,232,10,204,206,132,177,25,210,228,28,175,140,58,40,
+    204,4,31,81,199,5,195,173,236,192,25,197,33,7,230,34,
+    103,228,219,121,239,229,116,239,99,243,222,35,71,200,92,50,
+    160,45,196,219,32,204,188,98,4,166,131,37,184,6,70,96,
+    202,0,129,57,48,124,232,200,232,248,232,201,161,97,30,86,
+    98,18,70,128,89,2,32,30,89,39,132,25,30,29,194,33,
+    36,223,60,217,82,77,62,84,235,43,176,155,0,152,125,228,
+    203,64,146,250,175,84,113,239,60,42,86,162,66,115,74,129,
+    181,85,210,24,205,113,82,190,64,220,6,166,144,123,174,239,
+    185,246,204,194,51,201,201,101,199,134,180,99,3,248,208,177,
+    220,122,99,241,117,193,183,69,244,109,1,231,59,159,160,91,
+    204,173,105,193,215,45,250,186,227,67,224,176,103,232,221,19,
+    239,156,120,251,228,141,147,43,254,77,203,254,77,139,3,130,
+    127,171,232,223,250,35,238,222,214,251,244,15,167,62,158,18,
+    252,192,147,144,184,254,101,205,206,250,42,111,236,6,21,160,
+    26,147,248,193,76,115,235,74,115,255,114,115,255,210,139,247,
+    38,239,15,8,205,199,196,230,99,130,51,16,31,75,12,36,
+    15,226,52,94,59,14,169,135,189,38,48,108,69,102,149,199,
+    110,237,22,220,237,162,187,93,96,219,227,12,76,250,158,75,
+    134,85,131,181,241,56,205,211,242,56,173,6,37,174,161,177,
+    25,247,119,105,20,52,158,167,192,99,184,25,143,225,74,220,
+    107,142,225,171,44,109,230,24,105,12,175,210,192,154,166,252,
+    56,172,77,163,156,58,232,247,235,217,12,128,179,74,252,216,
+    135,184,143,97,76,210,183,88,50,230,171,225,133,87,21,46,
+    130,114,171,228,65,151,254,146,226,105,212,198,220,97,39,224,
+    172,169,139,56,68,55,150,40,64,214,80,36,138,94,189,7,
+    211,226,82,251,82,37,146,61,12,53,160,162,178,199,230,83,
+    20,239,160,177,242,146,87,132,177,173,110,41,109,40,119,108,
+    146,59,226,218,115,227,173,208,59,161,247,226,69,181,76,105,
+    89,158,60,244,87,62,168,220,144,106,254,240,162,80,217,35,
+    86,246,228,108,232,102,198,237,91,113,55,45,187,155,82,219,
+    22,183,124,176,83,112,119,139,238,238,156,89,243,98,94,48,
+    193,18,25,239,166,161,52,191,105,127,76,207,71,153,65,36,
+    170,32,166,131,229,18,157,172,130,217,152,110,234,189,80,106,
+    193,19,238,21,198,57,108,54,73,182,34,88,108,169,188,213,
+    154,26,94,220,255,193,17,161,166,71,240,246,172,120,250,151,
+    61,253,57,147,38,173,36,167,181,141,55,119,231,44,232,236,
+    17,92,126,10,228,145,217,10,82,141,21,75,53,101,58,169,
+    230,65,121,109,242,236,219,227,169,136,80,222,249,209,217,165,
+    185,59,211,66,249,238,248,136,1,99,203,248,170,110,109,79,
+    189,32,212,118,10,190,206,197,179,130,175,127,41,44,248,0,
+    15,66,162,146,167,252,134,29,22,79,8,238,141,162,123,99,
+    198,91,141,4,35,79,205,39,222,170,228,176,224,109,66,210,
+    145,167,25,73,71,190,106,36,29,121,170,115,44,229,171,64,
+    146,145,167,34,103,182,74,133,252,212,19,191,59,176,91,24,
+    162,247,171,230,126,165,13,12,39,2,163,88,53,156,8,40,
+    54,199,51,228,238,44,210,160,112,133,25,207,11,251,242,106,
+    138,50,29,188,19,133,226,111,83,50,26,101,8,30,124,157,
+    94,45,197,198,12,78,135,51,153,214,19,74,154,234,220,93,
+    108,74,117,125,177,232,28,203,150,107,216,38,182,185,137,153,
+    176,154,87,96,223,172,17,146,76,106,207,245,106,183,126,106,
+    209,229,172,185,64,233,215,152,239,25,89,80,171,75,17,230,
+    122,240,14,165,150,232,56,168,254,88,30,153,0,156,141,11,
+    94,134,138,159,157,154,152,196,59,77,242,193,139,161,153,185,
+    176,220,42,186,212,242,202,133,185,112,4,195,115,103,208,203,
+    1,5,49,195,200,93,94,82,49,7,6,3,143,43,229,8,
+    2,19,83,124,112,130,187,18,8,94,70,204,38,140,193,132,
+    81,212,243,113,243,129,174,78,182,146,35,104,173,17,30,71,
+    208,134,60,248,128,65,28,224,125,178,71,28,112,134,131,129,
+    96,220,138,53,64,142,3,233,201,202,246,63,170,86,169,220,
+    220,3,156,2,164,41,196,246,88,202,233,94,216,157,113,122,
+    62,53,155,156,246,191,178,123,175,183,95,219,180,176,41,105,
+    91,169,106,95,174,106,23,170,54,137,85,155,254,179,197,228,
+    132,249,27,103,231,195,222,173,43,189,71,151,123,143,102,156,
+    190,21,103,221,178,179,78,112,54,136,206,6,164,7,109,6,
+    61,104,179,61,7,97,63,179,83,190,186,100,36,93,119,24,
+    29,139,54,242,139,14,193,123,68,244,30,73,59,143,60,112,
+    85,39,219,62,60,244,209,215,254,176,53,221,188,159,172,17,
+    53,220,46,166,97,35,64,207,137,23,4,182,54,141,143,191,
+    25,195,10,92,49,134,134,21,42,244,1,219,83,28,131,46,
+    13,254,119,191,236,13,147,254,137,106,251,31,131,205,146,208,
+    95,168,39,216,3,88,177,92,235,154,13,128,186,0,62,150,
+    120,216,12,207,5,121,189,204,253,100,27,7,161,191,49,20,
+    130,76,81,194,71,131,151,39,167,230,184,32,71,188,235,194,
+    219,184,221,230,183,87,121,153,50,128,198,176,203,126,105,42,
+    25,151,33,108,220,116,18,218,159,180,113,147,115,157,27,55,
+    229,39,114,232,191,61,27,55,105,166,121,136,49,161,34,141,
+    173,41,111,170,223,101,192,87,253,26,111,152,65,47,212,108,
+    27,101,89,253,139,72,207,220,129,253,183,170,152,102,254,47,
+    198,172,39,183,186,52,88,176,223,84,139,161,253,12,74,209,
+    194,78,206,10,43,248,163,63,94,99,43,171,191,221,45,25,
+    184,245,136,177,228,251,13,74,153,48,237,252,50,228,94,109,
+    105,35,121,183,75,242,182,121,199,172,155,248,145,87,38,52,
+    208,70,179,174,77,249,30,6,214,70,70,210,238,25,244,210,
+    207,200,20,79,129,176,91,11,194,110,219,71,219,133,202,62,
+    177,178,79,18,118,43,87,220,129,101,119,64,112,55,137,238,
+    38,35,49,247,23,92,68,124,11,158,247,125,218,242,8,1,
+    35,7,183,38,171,228,101,119,62,47,213,79,150,23,148,206,
+    154,188,227,212,124,85,62,117,114,95,7,166,185,67,174,190,
+    42,123,158,60,116,87,194,20,221,57,164,171,248,122,68,31,
+    232,42,85,118,52,62,163,42,83,7,195,217,28,67,66,136,
+    110,74,163,89,110,97,89,51,146,16,200,72,8,210,69,135,
+    53,239,123,47,203,78,34,25,25,118,16,70,103,23,102,241,
+    25,110,137,196,41,159,222,180,29,91,194,149,105,243,244,34,
+    164,223,143,161,144,207,156,100,155,56,155,224,106,23,93,237,
+    79,182,77,220,3,95,69,94,141,121,216,216,124,51,86,168,
+    188,248,65,121,241,219,227,44,82,94,252,149,154,224,171,4,
+    206,33,77,199,159,184,188,236,104,76,59,26,241,183,208,155,
+    114,25,75,90,82,149,253,17,92,126,74,74,213,6,139,84,
+    17,137,31,202,217,169,242,234,119,143,190,115,52,121,105,165,
+    177,119,185,177,87,104,220,34,54,110,17,252,125,162,191,15,
+    214,176,86,36,91,146,115,55,59,151,93,27,211,174,141,170,
+    197,171,173,69,54,95,84,212,3,63,189,186,44,241,84,66,
+    187,102,173,11,22,218,233,34,66,187,198,102,83,179,94,166,
+    136,0,111,32,180,107,22,72,26,140,192,202,55,82,170,248,
+    213,223,45,152,13,37,66,125,243,126,60,221,171,72,237,100,
+    20,152,8,7,84,19,187,124,13,180,210,90,32,68,8,47,
+    225,235,104,89,223,46,38,100,147,78,0,51,108,210,46,155,
+    133,92,23,30,230,155,56,153,119,254,38,52,113,192,12,241,
+    236,222,138,163,117,217,209,154,186,180,210,54,176,220,54,32,
+    180,237,20,219,118,10,142,65,209,49,8,13,254,40,13,235,
+    18,191,12,9,153,117,46,56,87,216,218,101,182,54,121,72,
+    96,91,68,22,4,40,114,16,48,226,28,85,76,78,37,86,
+    69,106,165,105,125,27,159,97,121,117,219,243,193,11,51,23,
+    201,244,169,172,67,43,234,143,162,100,113,193,179,19,115,83,
+    17,60,204,78,77,132,193,13,0,20,46,236,149,59,91,168,
+    72,247,64,169,58,228,82,69,65,126,25,138,148,108,93,140,
+    221,196,174,184,26,151,93,141,41,139,224,106,21,93,173,105,
+    182,117,21,197,186,98,245,158,243,116,234,110,97,207,41,166,
+    238,106,240,196,95,84,207,209,219,21,40,125,103,231,145,233,
+    48,146,161,148,26,59,19,60,59,195,7,229,90,91,77,231,
+    125,250,30,149,181,134,240,71,249,250,60,116,39,85,252,102,
+    77,119,34,193,126,5,234,254,58,245,139,235,78,195,169,1,
+    129,237,20,217,206,180,124,172,194,167,255,13,85,104,161,167,
+    49,40,42,186,80,73,91,67,72,106,63,162,67,163,85,111,
+    170,109,215,213,109,74,215,114,218,240,10,72,195,183,82,170,
+    54,165,122,159,210,232,56,4,141,102,98,166,73,19,141,122,
+    251,194,81,201,112,169,124,4,53,16,201,102,105,90,145,222,
+    201,206,154,72,94,192,214,241,121,125,186,184,229,18,255,35,
+    74,111,126,98,25,135,29,183,163,165,138,212,0,151,111,65,
+    19,32,123,96,127,226,169,72,188,126,171,57,201,221,156,18,
+    106,58,197,154,78,193,211,37,122,186,96,23,188,106,76,226,
+    251,63,241,55,36,35,55,99,139,251,111,126,235,71,86,193,
+    63,32,250,7,64,108,173,126,232,135,133,112,199,23,61,55,
+    79,174,212,245,47,215,245,11,117,219,197,186,237,203,254,237,
+    105,255,246,135,149,85,9,22,254,125,158,89,99,27,228,95,
+    162,158,68,171,135,5,98,87,93,218,249,85,131,30,172,124,
+    169,200,102,138,166,2,206,107,142,62,39,113,94,185,239,98,
+    91,65,96,176,26,72,10,253,61,63,17,10,35,37,41,191,
+    135,169,108,105,38,65,198,74,216,209,199,142,209,252,237,14,
+    134,239,131,30,61,165,212,36,240,229,59,234,250,251,71,5,
+    245,103,229,113,162,242,157,152,92,191,7,53,184,151,146,176,
+    38,79,249,187,246,119,236,178,35,180,184,37,227,112,199,247,
+    60,240,214,37,95,17,188,157,162,183,51,237,236,204,172,194,
+    230,13,171,229,249,47,191,90,72,99,255,186,188,241,54,236,
+    240,26,145,246,155,253,18,203,156,239,39,2,70,190,172,183,
+    21,240,69,40,231,124,159,192,220,249,123,38,101,69,249,122,
+    75,212,47,239,189,100,136,168,252,63,95,42,162,130,215,214,
+    21,96,25,136,171,253,83,60,27,86,164,149,63,5,22,97,
+    142,153,175,158,84,163,40,250,190,50,175,217,241,38,182,138,
+    113,63,95,30,99,138,204,198,23,88,226,161,60,20,193,83,
+    244,33,23,162,235,254,254,6,196,9,20,110,30,51,171,184,
+    181,10,52,87,199,85,240,173,165,72,121,241,231,218,216,65,
+    169,93,248,103,100,211,241,104,240,68,144,63,23,12,68,46,
+    205,4,36,36,38,47,80,135,53,237,26,163,229,65,101,190,
+    94,5,194,40,125,225,92,232,98,112,90,245,68,121,63,90,
+    127,112,2,117,159,233,169,43,129,11,248,123,248,149,9,217,
+    236,206,216,201,3,89,195,137,149,239,192,106,202,183,218,14,
+    229,172,78,222,249,237,6,172,138,111,144,85,113,179,78,56,
+    145,119,82,52,207,156,121,181,80,45,223,32,119,60,156,104,
+    195,109,229,160,51,66,129,130,86,110,2,157,80,38,25,127,
+    229,135,131,139,147,63,58,244,135,95,75,111,61,34,52,31,
+    21,155,143,230,204,240,192,233,194,191,249,160,100,25,71,135,
+    67,175,153,247,41,98,149,5,19,90,210,59,136,48,101,193,
+    137,226,161,217,118,88,84,110,242,21,181,60,107,70,130,91,
+    216,66,73,186,57,201,215,46,90,205,80,112,20,80,90,97,
+    150,86,111,224,174,210,204,247,96,1,105,151,224,221,45,122,
+    119,167,157,187,115,38,37,135,181,141,56,35,143,224,226,83,
+    146,27,103,73,63,38,72,35,182,174,161,17,251,227,243,15,
+    42,26,146,151,132,138,54,177,162,45,97,38,24,198,37,193,
+    215,43,250,122,209,151,61,61,168,8,87,252,109,203,254,182,
+    69,70,240,119,139,254,238,180,191,59,227,246,191,235,120,199,
+    145,60,40,249,210,196,199,3,15,210,125,62,124,81,240,116,
+    139,158,238,28,101,46,237,71,193,110,56,147,47,136,238,230,
+    21,119,199,178,187,99,177,141,120,67,78,227,227,147,214,77,
+    139,3,31,92,184,125,33,193,64,40,193,221,156,118,55,231,
+    170,229,196,23,2,66,208,38,97,220,251,217,93,84,86,199,
+    80,29,192,128,67,54,162,63,135,56,17,250,207,148,80,186,
+    222,174,150,253,232,53,36,190,191,210,249,119,208,96,172,106,
+    251,63,181,204,167,111,235,252,94,206,204,153,141,229,59,61,
+    110,107,204,237,180,252,246,156,129,23,142,104,65,234,206,154,
+    190,66,189,75,107,221,32,21,79,191,46,197,175,106,75,73,
+    253,150,78,243,122,33,102,46,194,119,209,91,196,90,242,108,
+    1,87,68,92,189,232,59,79,86,22,5,49,107,98,32,45,
+    129,179,204,163,46,58,77,47,252,7,148,34,250,53,92,30,
+    252,30,77,14,117,58,28,223,133,114,101,168,185,105,191,254,
+    178,9,190,1,187,150,173,39,52,74,131,9,112,248,4,189,
+    112,180,195,22,157,126,113,98,234,53,112,26,56,163,130,219,
+    17,147,191,18,10,78,113,129,217,137,200,121,114,141,56,96,
+    112,50,162,227,249,146,90,31,148,150,66,182,67,112,201,236,
+    171,139,192,251,228,181,60,220,142,149,129,49,108,247,128,45,
+    72,48,252,0,74,98,94,57,208,233,135,216,18,2,179,57,
+    204,220,64,214,212,96,143,22,108,66,150,101,206,35,166,155,
+    181,161,241,7,18,97,8,60,102,153,75,40,175,81,167,204,
+    222,224,234,143,128,187,5,81,156,255,1,253,195,34,147,219,
+    15,86,72,30,36,43,185,60,232,204,235,143,219,114,140,191,
+    164,230,65,117,67,114,14,156,99,124,16,186,29,18,170,55,
+    139,213,155,115,84,105,105,3,38,9,11,94,6,145,218,118,
+    243,181,143,14,253,232,107,233,206,253,130,239,128,232,59,0,
+    155,99,86,60,172,170,77,78,126,247,252,251,231,83,151,150,
+    90,150,230,62,238,92,233,27,89,238,27,17,250,14,139,125,
+    135,211,91,142,8,109,71,132,134,163,98,195,81,161,234,104,
+    166,170,46,249,194,77,71,206,98,174,173,0,63,231,42,130,
+    184,47,210,96,200,55,6,4,223,86,209,183,53,71,217,60,
+    13,15,42,107,146,253,41,203,205,93,66,101,155,88,217,150,
+    163,172,229,13,40,154,239,58,222,119,164,198,22,183,45,109,
+    185,179,51,221,178,77,168,218,46,86,109,79,87,109,207,84,
+    53,126,183,236,253,178,84,100,113,248,246,55,87,218,118,45,
+    183,237,18,218,246,136,109,123,132,170,189,98,213,222,116,213,
+    222,76,99,115,106,248,230,55,147,76,38,176,33,105,201,4,
+    154,16,169,170,79,90,96,249,70,146,190,30,141,71,149,221,
+    223,32,127,53,153,150,246,223,56,252,189,195,31,28,189,125,
+    244,237,19,137,177,228,182,140,191,246,221,99,239,28,123,251,
+    196,141,19,9,244,239,161,191,58,49,252,168,3,149,97,193,
+    138,68,26,215,127,71,131,225,194,196,55,128,60,6,146,95,
+    162,136,177,4,154,38,147,74,210,160,103,3,98,180,53,56,
+    246,210,215,72,75,115,181,170,253,193,149,150,132,145,5,50,
+    146,110,151,7,70,60,8,242,251,129,232,86,64,126,42,147,
+    127,9,146,248,239,209,218,21,144,245,105,166,126,245,221,195,
+    173,176,38,90,33,110,221,238,225,22,75,57,44,169,150,72,
+    153,201,82,3,15,36,194,154,44,7,113,164,10,101,25,88,
+    220,173,16,167,9,206,20,130,194,183,192,153,68,216,50,88,
+    215,173,37,1,63,60,213,146,46,191,165,12,206,212,164,75,
+    183,173,138,211,210,10,203,193,37,82,167,91,222,109,133,29,
+    196,21,226,110,130,197,159,10,57,76,235,30,155,44,109,240,
+    158,154,160,24,186,224,169,68,220,186,141,205,109,16,78,33,
+    94,27,148,151,66,188,94,11,26,163,21,210,94,15,197,87,
+    72,72,149,66,69,26,47,36,5,255,60,186,197,229,101,216,
+    71,33,195,185,176,143,66,11,94,36,106,197,139,68,109,120,
+    145,40,139,61,20,150,96,15,133,118,236,161,208,129,39,59,
+    221,89,51,98,55,209,150,145,169,137,72,36,8,110,9,135,
+    130,23,67,72,80,30,227,131,250,181,157,216,132,27,251,28,
+    35,11,20,212,74,15,40,50,88,29,155,162,244,235,167,57,
+    154,252,3,56,47,102,198,231,166,155,118,205,218,69,179,122,
+    237,34,190,50,107,174,24,205,85,126,171,77,162,4,116,225,
+    117,135,35,67,99,18,55,39,204,94,49,210,69,131,195,153,
+    25,164,193,146,153,85,178,205,133,29,201,159,19,231,66,147,
+    217,146,200,76,4,9,197,161,104,48,91,58,115,246,44,44,
+    57,36,43,148,178,101,249,75,176,174,37,215,23,130,23,198,
+    249,240,197,11,19,179,100,35,76,15,128,194,227,32,75,143,
+    75,223,203,186,224,99,227,147,179,115,33,110,124,246,252,149,
+    112,214,5,177,107,98,82,221,64,95,26,237,176,102,75,192,
+    176,247,196,254,67,71,14,102,173,231,131,19,92,144,207,178,
+    60,138,7,198,168,172,13,85,194,244,204,108,56,203,34,85,
+    62,130,207,92,80,45,252,197,224,56,172,159,12,229,125,29,
+    18,191,234,192,26,142,209,5,203,182,241,130,73,24,93,148,
+    197,146,255,214,164,44,150,252,204,74,85,52,102,170,107,50,
+    245,13,153,134,70,56,42,27,50,27,250,50,141,61,153,198,
+    0,186,204,149,59,42,81,199,68,4,214,244,228,170,168,234,
+    122,116,82,154,169,172,197,139,43,171,234,240,85,99,115,156,
+    17,217,186,52,62,8,55,213,52,19,197,208,77,90,73,167,
+    89,208,138,93,72,230,181,62,109,163,32,43,200,74,97,37,
+    29,20,12,30,189,97,145,216,179,144,217,231,128,60,79,227,
+    37,79,184,28,180,119,181,229,144,117,226,245,96,82,233,226,
+    53,152,61,234,59,159,65,161,212,226,66,121,88,21,32,153,
+    108,32,153,196,87,241,82,35,223,61,52,181,250,122,166,82,
+    48,219,83,82,142,6,22,156,68,253,106,38,39,44,90,210,
+    38,77,125,231,255,53,105,214,48,205,203,133,108,108,76,232,
+    55,40,99,169,28,71,113,57,146,54,196,5,164,70,4,115,
+    79,160,26,2,80,196,133,164,126,164,22,168,218,80,49,161,
+    151,194,109,184,83,181,65,51,110,11,188,22,188,18,30,69,
+    249,57,165,154,111,58,165,155,111,202,250,112,1,107,219,44,
+    94,169,213,99,240,224,231,144,75,178,75,29,82,195,2,189,
+    250,38,101,236,216,135,51,145,21,91,216,47,149,198,148,142,
+    83,33,18,120,253,3,246,165,135,66,49,154,80,22,195,80,
+    69,226,225,172,146,132,92,142,226,177,105,66,177,170,80,37,
+    191,206,112,246,91,102,229,139,118,37,86,37,15,223,62,174,
+    219,203,121,8,73,202,52,231,148,66,154,184,210,124,124,188,
+    11,61,41,211,222,203,167,117,218,130,158,186,148,247,220,186,
+    247,60,218,123,186,247,188,74,26,125,228,108,97,88,141,239,
+    34,89,31,165,190,200,122,23,255,155,212,250,109,213,13,202,
+    66,225,16,223,174,139,105,174,215,131,246,43,177,40,122,16,
+    73,107,254,59,69,82,93,254,36,22,79,114,108,168,247,84,
+    68,187,135,47,207,206,240,17,88,172,58,52,118,74,55,74,
+    226,169,5,178,214,228,236,12,127,97,34,18,181,247,114,145,
+    112,247,197,45,189,187,236,81,119,111,175,60,50,13,150,148,
+    108,228,236,152,101,71,171,209,237,130,161,100,16,63,199,220,
+    28,134,215,104,5,10,164,27,92,6,75,54,95,198,172,62,
+    75,95,198,22,219,163,209,210,94,52,72,73,61,170,55,144,
+    181,73,125,54,202,108,108,190,28,136,154,54,7,178,12,116,
+    220,168,25,93,103,233,205,81,211,46,187,177,119,5,237,134,
+    187,197,150,221,21,216,183,200,27,238,242,78,90,49,251,201,
+    154,97,212,42,0,168,96,85,55,184,238,66,197,99,132,78,
+    213,155,21,103,34,233,192,9,114,220,243,165,124,43,27,250,
+    150,55,244,9,27,250,197,13,253,202,3,99,111,106,95,90,
+    70,248,111,232,167,208,215,147,131,102,117,14,70,201,81,152,
+    3,233,129,188,159,202,73,90,226,160,100,0,195,250,37,30,
+    44,176,246,128,71,57,105,46,227,22,20,173,5,184,230,21,
+    221,108,6,73,82,212,158,79,30,3,73,121,31,171,4,15,
+    61,13,216,23,93,218,219,182,216,114,183,115,41,36,110,218,
+    39,120,247,9,236,62,124,59,227,236,88,28,186,123,44,189,
+    227,152,216,117,92,112,130,219,212,18,123,220,138,88,177,211,
+    189,176,43,113,69,116,108,72,61,39,57,64,119,122,51,238,
+    81,136,36,189,253,144,184,233,112,218,61,170,28,232,181,210,
+    178,248,8,184,129,113,73,94,239,28,46,17,172,83,58,51,
+    213,245,98,117,119,142,178,151,6,48,73,88,50,238,138,100,
+    175,224,238,72,88,51,190,170,100,181,232,67,194,188,217,211,
+    156,241,215,36,207,166,230,22,95,18,219,6,132,134,1,193,
+    63,144,24,73,140,60,68,119,185,183,71,19,35,16,182,226,
+    198,30,8,218,4,65,131,169,224,226,200,237,11,66,195,86,
+    193,191,85,14,57,137,116,190,17,136,127,227,219,174,132,53,
+    1,169,88,192,11,131,106,241,2,199,119,67,239,132,72,11,
+    186,207,252,196,137,126,132,192,9,17,209,138,81,177,98,84,
+    112,142,130,35,74,105,29,36,188,185,39,237,104,193,55,110,
+    92,88,169,216,178,92,177,69,168,216,42,86,108,21,156,91,
+    165,231,16,243,179,116,254,157,252,55,160,142,209,55,74,209,
+    143,16,24,21,17,173,56,41,86,156,20,156,39,81,48,99,
+    135,128,138,84,253,171,86,189,80,113,149,56,27,91,101,38,
+    104,94,51,65,247,237,77,90,22,253,74,19,12,51,154,247,
+    205,224,29,82,229,106,204,164,30,18,181,75,250,164,33,162,
+    89,31,3,103,229,172,70,33,57,219,188,89,109,172,170,29,
+    36,165,161,212,130,180,3,194,182,139,135,117,60,65,88,103,
+    97,216,85,203,139,65,225,74,241,54,129,86,201,48,180,83,
+    19,190,12,229,77,3,0,114,165,242,27,242,146,74,136,67,
+    179,82,128,49,24,70,204,186,48,116,33,72,57,111,209,152,
+    181,24,14,131,28,44,167,44,146,119,131,5,152,214,121,219,
+    60,171,30,240,190,221,191,90,105,24,67,143,156,235,73,6,
+    205,152,21,231,197,170,158,192,249,118,127,204,250,20,223,117,
+    191,169,153,6,90,199,96,109,213,125,199,19,241,230,175,12,
+    150,149,90,53,117,98,43,152,130,202,151,179,23,102,76,52,
+    161,173,171,132,246,65,232,152,182,149,250,241,61,109,237,149,
+    147,123,171,197,27,213,199,93,177,190,119,86,203,89,65,156,
+    149,56,119,234,146,171,210,60,175,86,113,8,205,123,69,238,
+    151,23,185,95,81,228,190,191,200,125,182,200,253,26,85,171,
+    71,237,227,7,74,27,153,47,89,147,227,52,196,74,180,109,
+    68,243,70,109,177,125,52,113,123,41,30,187,99,93,177,123,
+    159,50,118,231,186,98,247,173,17,123,73,140,184,104,192,147,
+    36,164,159,198,108,41,149,105,151,42,230,186,194,22,131,196,
+    224,250,104,121,94,12,62,0,11,176,137,184,59,138,61,243,
+    61,54,239,125,238,57,30,252,63,242,175,208,18,96,244,83,
+    44,55,97,136,2,6,54,226,132,14,44,200,8,176,116,3,
+    8,172,141,54,222,72,12,108,191,37,41,174,190,184,20,199,
+    233,215,142,170,22,163,33,153,174,1,246,154,36,174,3,33,
+    69,119,104,130,198,174,37,220,157,49,18,238,134,204,202,14,
+    6,105,255,8,57,150,154,19,167,86,202,91,151,203,91,83,
+    60,217,11,102,113,139,88,222,173,60,55,214,95,191,212,252,
+    241,33,40,239,87,215,35,179,26,102,235,168,42,91,238,131,
+    228,88,156,76,248,36,231,221,125,130,167,85,244,180,166,94,
+    23,61,29,202,115,2,88,226,21,238,199,225,195,39,128,28,
+    1,114,8,200,97,32,176,107,211,99,118,239,17,242,199,15,
+    211,106,164,10,47,140,239,112,16,57,23,251,32,199,2,48,
+    22,133,241,164,11,174,166,188,60,12,82,48,241,89,56,60,
+    58,132,151,202,119,216,201,106,120,63,248,2,208,35,10,60,
+    20,121,214,65,144,181,113,130,246,73,23,19,220,171,115,225,
+    72,150,197,112,28,76,212,216,112,4,92,36,235,196,39,50,
+    104,103,69,1,102,103,194,89,7,190,75,94,198,80,76,30,
+    30,81,203,222,103,84,178,247,153,86,40,210,5,179,100,10,
+    8,50,100,32,227,171,76,244,63,104,108,78,29,120,239,242,
+    205,203,105,182,174,64,56,54,151,122,49,1,225,184,229,35,
+    38,227,175,78,110,75,85,139,181,157,139,47,44,109,191,251,
+    10,18,175,59,188,159,82,136,60,162,76,30,111,218,221,130,
+    14,16,182,235,63,100,82,47,44,238,95,124,93,8,108,17,
+    3,91,4,118,11,196,94,81,27,119,128,124,170,151,223,43,
+    147,91,4,103,93,252,216,58,159,61,47,153,178,43,207,30,
+    84,213,37,159,127,143,189,201,198,75,51,142,138,164,231,218,
+    51,201,9,98,130,254,160,46,144,242,165,38,222,59,126,243,
+    248,226,254,165,218,123,175,255,176,81,232,218,47,212,29,136,
+    159,64,175,223,218,154,156,23,106,187,197,218,110,193,217,141,
+    62,225,107,248,208,151,222,184,83,216,48,40,110,24,20,124,
+    131,113,246,225,166,158,187,221,43,155,134,151,55,13,103,156,
+    101,9,54,217,114,179,51,21,18,107,54,163,156,119,194,132,
+    125,167,93,96,219,226,149,137,174,148,164,155,236,78,59,154,
+    63,113,251,243,126,224,51,184,207,221,243,255,184,14,253,8,
+    254,17,209,63,130,94,246,64,177,121,188,176,60,183,6,150,
+    231,214,228,204,84,169,63,231,132,40,136,120,239,251,78,36,
+    121,224,237,203,55,46,191,59,255,206,124,6,183,240,165,177,
+    143,95,65,63,130,251,160,232,62,136,34,169,130,141,36,170,
+    202,80,217,35,37,7,172,5,74,220,223,233,79,50,183,206,
+    9,190,86,209,215,42,176,173,113,219,131,142,174,197,151,133,
+    142,65,177,99,16,48,211,180,127,35,186,253,160,189,115,241,
+    208,29,231,93,39,185,213,34,176,27,51,237,91,85,23,109,
+    189,112,145,56,41,176,45,153,246,205,63,218,186,116,233,135,
+    187,63,222,45,180,63,163,10,211,220,249,209,228,82,219,157,
+    169,187,83,66,243,224,31,158,186,95,39,236,25,21,247,140,
+    10,205,163,248,221,99,2,27,120,80,81,147,113,86,100,80,
+    158,142,37,109,162,51,64,206,28,162,179,133,156,185,68,103,
+    59,62,75,87,181,139,206,14,253,105,178,68,116,54,73,55,
+    59,69,103,215,35,79,73,37,42,116,68,226,142,156,223,72,
+    19,172,188,213,159,98,82,220,237,215,210,125,7,197,214,33,
+    161,118,88,172,29,22,156,195,69,218,214,122,66,231,91,91,
+    62,244,1,177,245,160,80,59,36,214,14,9,206,161,248,177,
+    135,206,202,76,89,45,120,165,169,123,88,6,235,174,75,97,
+    221,181,171,2,188,210,84,192,78,185,181,43,101,27,150,203,
+    54,164,218,132,178,77,98,217,38,240,79,211,153,223,55,87,
+    195,138,21,224,148,204,175,20,106,91,107,155,154,107,165,82,
+    236,190,18,60,236,143,162,95,204,218,240,180,159,30,244,181,
+    33,46,1,139,225,177,233,120,143,116,1,26,72,184,153,42,
+    224,25,96,96,56,191,226,234,92,118,117,146,125,202,210,108,
+    247,106,155,15,208,69,178,82,100,229,133,94,28,39,30,178,
+    87,219,175,68,241,16,213,136,226,52,70,218,116,113,242,118,
+    216,4,148,99,212,27,149,19,212,86,178,220,213,224,169,218,
+    98,199,216,168,153,163,213,239,26,91,223,233,191,138,145,85,
+    244,230,60,163,181,186,83,219,176,235,108,5,37,199,135,120,
+    35,173,6,164,146,153,99,22,99,245,164,136,253,177,101,158,
+    193,22,21,141,49,230,170,28,23,51,111,90,24,38,155,47,
+    68,95,126,62,24,158,153,186,24,196,102,12,129,169,208,107,
+    193,0,128,119,51,252,149,94,62,120,78,181,52,33,191,186,
+    95,178,13,208,44,241,38,183,213,235,253,193,49,220,168,206,
+    136,161,131,197,77,48,107,199,195,92,24,176,125,60,180,102,
+    217,224,52,71,46,127,153,210,152,55,96,179,103,98,202,144,
+    101,32,137,216,124,129,76,73,133,231,206,224,59,150,179,51,
+    115,211,28,182,116,40,48,103,112,242,36,123,227,16,146,76,
+    102,168,239,188,14,45,28,166,207,49,204,79,152,175,210,198,
+    223,250,214,245,111,37,195,130,171,89,116,53,131,29,87,21,
+    25,48,243,206,97,174,239,137,239,73,142,125,247,149,247,95,
+    89,220,42,212,247,138,245,189,241,61,176,245,150,57,233,77,
+    154,111,236,140,15,33,62,146,216,122,125,87,124,23,120,130,
+    217,147,70,28,208,91,113,163,59,110,203,84,214,38,247,39,
+    15,36,15,32,246,254,198,59,111,164,38,133,202,77,98,229,
+    166,28,101,7,151,145,136,196,15,101,252,85,241,97,189,65,
+    87,105,157,228,37,50,83,213,8,3,115,13,38,9,38,227,
+    171,73,114,223,189,240,254,133,247,102,110,206,44,251,186,211,
+    190,238,76,93,32,49,156,1,171,130,156,133,242,247,192,254,
+    86,229,241,121,249,117,52,20,31,66,223,112,85,196,201,58,
+    196,14,179,110,98,181,195,52,58,218,225,44,238,11,249,5,
+    168,215,23,129,188,4,132,3,114,17,200,101,32,87,13,12,
+    3,14,210,18,249,75,152,90,249,128,210,26,6,244,164,153,
+    158,28,227,129,57,118,45,105,101,96,218,92,75,156,38,11,
+    108,109,40,19,214,108,65,133,163,16,123,0,252,174,43,100,
+    136,62,72,195,116,190,138,30,53,49,150,30,136,74,34,206,
+    74,75,101,142,42,36,36,245,144,102,13,99,131,230,140,25,
+    219,251,230,213,182,99,210,155,239,38,232,87,62,198,102,72,
+    38,45,6,20,51,23,119,3,198,31,93,205,169,14,108,232,
+    84,204,179,174,129,209,109,17,179,54,125,200,72,169,250,105,
+    204,172,95,254,178,16,212,165,190,168,171,172,4,205,155,35,
+    30,117,88,189,226,32,109,70,229,141,248,242,161,56,19,44,
+    8,186,85,104,83,110,214,76,126,49,18,139,219,129,23,113,
+    3,234,103,83,51,100,61,58,3,104,150,113,9,104,205,126,
+    99,150,213,221,136,46,252,123,93,58,88,41,29,59,193,210,
+    97,29,233,176,22,77,71,165,38,29,214,213,211,145,160,23,
+    58,116,41,177,75,41,25,40,250,133,124,96,64,86,29,235,
+    73,239,154,169,152,90,95,221,93,109,41,154,170,90,117,170,
+    116,102,158,133,223,187,173,249,158,211,248,123,28,108,7,84,
+    26,221,248,236,204,236,220,20,44,187,146,189,147,98,179,140,
+    163,167,78,142,146,217,101,240,230,17,38,51,91,30,121,71,
+    71,60,253,12,78,216,136,15,34,216,215,245,73,119,172,129,
+    93,137,140,183,222,34,28,246,1,16,227,189,167,219,199,97,
+    54,26,251,37,66,82,216,89,14,207,185,27,110,88,131,58,
+    225,207,2,20,214,145,171,246,144,99,177,255,150,47,57,150,
+    234,123,175,254,102,189,114,147,112,49,96,90,163,120,223,141,
+    47,43,51,252,47,211,114,86,140,183,223,89,119,86,128,143,
+    242,111,210,242,112,17,215,39,210,44,39,210,155,79,36,3,
+    210,26,74,136,69,158,33,147,214,137,227,169,62,58,252,5,
+    82,115,203,172,44,152,76,247,31,37,199,189,45,75,207,41,
+    23,100,107,65,111,225,230,161,29,101,89,11,105,81,32,192,
+    100,25,104,98,68,140,81,12,207,179,126,163,100,100,25,248,
+    58,65,25,176,221,58,222,29,23,111,97,194,3,193,118,246,
+    54,98,203,9,98,15,188,158,53,191,22,188,194,127,21,30,
+    99,123,117,188,255,240,159,67,69,216,40,5,17,32,249,191,
+    78,75,228,31,64,214,254,146,76,192,85,53,202,75,195,115,
+    84,133,101,199,35,32,215,156,113,95,60,248,192,81,158,8,
+    222,26,19,28,77,162,163,41,71,149,151,236,120,80,81,159,
+    156,124,123,234,198,20,146,25,192,107,77,243,178,179,57,133,
+    148,159,14,164,170,165,177,182,246,214,177,235,72,199,19,156,
+    1,164,230,33,57,231,129,51,144,170,92,220,40,56,55,139,
+    206,205,105,124,60,40,5,31,125,17,161,180,69,44,109,121,
+    68,185,81,172,46,111,98,219,181,232,66,52,185,255,250,27,
+    241,55,30,84,52,166,3,59,151,14,34,130,14,161,98,80,
+    172,24,76,187,7,51,46,127,226,185,133,203,201,129,101,87,
+    83,218,213,148,193,109,122,105,219,61,207,61,239,61,239,199,
+    59,209,133,80,181,71,172,218,3,24,5,54,108,255,179,186,
+    174,197,83,75,27,133,186,29,98,221,14,193,189,83,116,239,
+    76,227,35,3,235,223,110,84,37,95,92,246,180,164,61,45,
+    79,27,147,144,143,233,165,101,79,107,218,211,170,4,239,89,
+    12,147,38,114,223,114,127,226,254,153,251,103,126,82,130,46,
+    132,254,163,34,162,117,199,196,186,99,100,23,72,178,29,228,
+    39,69,50,92,234,141,191,34,21,233,45,71,234,32,217,69,
+    94,41,108,116,242,9,172,39,216,190,228,67,4,29,130,119,
+    64,244,14,164,157,3,185,238,10,216,5,162,66,218,5,194,
+    120,27,132,223,161,86,219,9,78,63,123,183,218,66,37,189,
+    195,191,194,221,127,213,152,191,110,20,52,199,138,153,217,23,
+    154,160,155,177,185,208,27,71,46,96,164,23,108,236,176,219,
+    17,204,197,181,118,15,93,129,112,48,136,31,16,11,66,48,
+    32,236,185,192,65,231,148,149,21,98,239,54,199,147,85,215,
+    193,233,201,25,46,52,125,78,126,42,155,107,79,76,195,136,
+    33,217,242,225,135,88,147,65,154,8,56,152,203,90,166,102,
+    38,184,48,233,218,215,101,185,22,203,196,29,76,214,124,102,
+    238,108,150,137,160,79,103,25,48,154,202,154,207,194,220,55,
+    165,49,255,66,177,31,69,157,248,217,9,62,28,228,111,208,
+    100,182,44,60,138,185,206,103,118,208,68,6,19,147,224,9,
+    238,234,208,39,14,111,98,235,181,221,11,187,209,41,83,149,
+    244,39,35,2,211,34,50,45,105,166,229,19,123,233,181,141,
+    11,27,175,30,204,48,182,21,198,191,204,248,19,99,2,83,
+    35,50,53,105,166,38,227,40,187,122,180,176,37,176,114,75,
+    184,111,42,92,110,91,56,123,91,68,69,167,11,212,105,52,
+    246,115,102,141,58,141,55,187,10,209,90,231,206,42,103,65,
+    133,155,78,253,12,207,18,154,231,25,172,232,174,107,73,219,
+    69,154,119,105,29,1,25,248,52,83,73,73,72,254,178,160,
+    47,69,230,109,26,57,215,76,246,214,137,217,136,67,74,109,
+    75,222,70,205,179,49,118,61,106,247,124,9,42,5,147,126,
+    211,80,164,128,59,154,169,45,84,152,185,100,186,108,126,137,
+    186,68,211,212,75,232,46,234,33,238,124,76,69,22,170,217,
+    98,37,58,215,192,246,152,213,120,150,36,102,47,144,86,231,
+    98,12,202,237,200,188,67,51,162,59,116,245,236,44,26,163,
+    179,160,55,58,83,14,195,144,214,194,144,196,214,22,151,171,
+    3,40,94,54,119,104,225,83,181,28,170,43,191,210,88,105,
+    74,85,47,170,248,11,92,88,196,74,241,254,222,191,134,251,
+    80,128,35,38,195,208,237,2,103,67,83,193,240,149,48,26,
+    137,213,248,5,70,40,2,161,233,112,100,98,122,82,89,112,
+    122,234,252,204,220,20,7,171,244,123,103,249,153,201,94,18,
+    79,55,142,7,44,119,165,136,187,0,210,128,5,122,103,231,
+    194,193,11,51,115,211,145,158,89,197,31,19,190,14,204,206,
+    132,208,221,60,179,24,197,144,71,180,116,38,140,87,81,4,
+    130,176,148,53,107,226,207,116,148,17,206,1,27,27,103,77,
+    51,97,108,71,159,101,192,136,145,236,29,206,204,204,6,167,
+    17,243,8,78,112,249,189,7,136,69,191,69,203,109,202,248,
+    24,156,191,3,17,88,200,74,242,55,104,121,127,147,16,31,
+    206,90,112,89,100,205,147,115,124,150,62,155,117,78,206,76,
+    71,192,27,61,220,206,218,164,171,44,3,11,14,179,86,242,
+    18,17,39,126,13,230,109,64,179,11,104,254,8,251,130,121,
+    133,145,48,97,94,183,81,192,223,3,230,245,35,90,102,94,
+    62,153,95,61,180,57,126,101,254,151,230,19,167,4,91,181,
+    104,171,134,29,143,170,51,46,95,226,96,226,249,196,193,133,
+    43,113,230,97,169,39,209,31,63,126,117,248,147,230,141,183,
+    7,22,251,63,216,115,123,79,142,42,5,227,116,68,4,182,
+    49,110,75,84,38,55,102,28,222,228,198,239,110,122,127,211,
+    123,93,55,187,210,24,190,213,237,73,94,230,75,28,90,152,
+    142,155,209,200,140,116,250,146,38,76,226,251,31,120,202,19,
+    231,82,230,183,47,164,38,132,138,182,69,191,224,233,17,61,
+    61,128,164,244,44,117,101,106,90,87,106,58,151,107,58,133,
+    154,110,177,166,59,97,203,153,209,125,252,16,147,71,64,62,
+    165,52,247,140,200,231,159,127,110,116,251,19,95,195,138,175,
+    119,217,215,187,68,47,13,8,190,93,162,111,23,248,33,118,
+    189,117,242,250,201,36,18,158,54,136,206,13,105,124,100,42,
+    234,33,189,253,152,196,71,64,218,58,251,246,204,141,25,144,
+    182,72,240,67,130,179,69,116,182,164,1,57,151,229,175,131,
+    130,179,93,116,182,167,157,237,153,174,173,241,225,68,91,242,
+    224,219,221,169,86,193,11,178,2,18,20,114,37,40,182,207,
+    156,148,163,108,141,49,2,219,185,254,137,191,252,192,54,219,
+    159,108,99,14,236,116,252,201,110,26,81,141,221,191,204,29,
+    126,6,235,82,244,155,202,193,150,114,176,161,220,105,43,103,
+    57,109,227,172,167,89,206,118,186,36,104,231,216,160,131,43,
+    9,58,57,123,176,148,115,4,203,56,103,200,114,218,133,45,
+    255,221,92,25,222,24,202,133,55,134,114,227,141,161,60,120,
+    99,40,47,222,24,202,135,55,134,130,77,162,42,241,38,81,
+    85,92,5,234,237,149,120,224,132,137,94,220,246,162,229,164,
+    239,99,113,0,90,52,234,221,179,115,17,126,138,198,226,242,
+    176,60,229,167,154,1,196,19,130,121,11,245,179,52,86,26,
+    242,115,196,120,254,208,131,49,74,232,78,227,103,130,231,66,
+    211,89,22,159,195,190,40,223,131,64,19,64,166,169,98,3,
+    235,111,22,12,172,197,157,40,234,118,58,45,92,106,191,182,
+    127,3,58,111,171,170,95,223,173,30,24,53,195,157,202,239,
+    73,140,46,226,249,68,7,214,172,6,4,144,157,197,85,80,
+    132,89,94,187,183,30,255,12,197,211,143,68,128,117,165,77,
+    99,50,198,112,150,221,228,87,157,34,235,47,52,69,54,131,
+    20,177,191,208,20,149,144,20,129,191,234,168,119,248,114,132,
+    159,152,140,4,134,198,14,4,200,180,50,233,8,121,59,9,
+    12,133,224,89,114,108,44,129,103,216,49,98,12,211,236,29,
+    37,60,52,167,108,96,92,221,59,199,65,187,149,102,169,199,
+    137,93,6,184,175,129,126,202,191,175,116,184,107,208,215,204,
+    209,208,108,182,177,248,219,196,111,154,99,110,122,118,98,242,
+    181,113,232,238,242,122,109,152,157,207,58,165,96,216,10,21,
+    251,152,199,102,169,186,133,219,72,245,30,15,146,140,170,226,
+    198,43,212,149,175,246,24,5,121,4,163,219,86,154,184,80,
+    169,76,50,98,213,102,193,179,69,244,108,137,91,31,84,214,
+    39,185,183,99,55,98,113,39,76,138,125,83,242,186,97,189,
+    237,16,92,93,162,171,43,206,160,17,232,59,147,201,22,177,
+    102,203,210,246,149,173,195,203,91,135,239,115,194,214,99,226,
+    214,99,66,197,113,177,226,184,224,57,33,122,78,144,13,200,
+    59,68,71,93,138,150,61,63,87,222,216,181,226,107,94,246,
+    53,167,142,139,45,219,4,223,118,209,183,29,13,32,237,253,
+    43,237,251,150,219,247,221,247,11,237,35,98,251,200,253,215,
+    197,246,35,241,145,180,175,69,112,110,252,146,99,49,45,59,
+    154,210,142,166,162,177,180,109,93,105,123,102,185,237,153,251,
+    140,208,54,44,182,13,223,159,16,219,14,67,44,205,104,188,
+    42,98,79,170,176,201,95,162,159,132,77,158,91,31,51,84,
+    25,238,171,205,82,244,178,99,137,102,177,64,17,77,148,206,
+    219,24,22,48,86,87,62,156,6,225,166,94,85,164,120,196,
+    88,141,101,234,39,101,172,70,168,119,25,176,57,131,251,120,
+    79,117,196,18,140,101,244,66,7,27,111,34,9,186,81,238,
+    254,202,98,28,50,1,40,175,201,193,131,230,24,25,36,49,
+    31,128,142,219,225,36,125,190,205,160,215,170,45,95,174,72,
+    93,159,255,1,22,114,145,126,254,90,214,158,239,91,58,78,
+    192,223,133,80,173,107,198,73,220,39,254,150,140,170,105,184,
+    129,77,78,118,81,70,80,175,237,229,250,53,65,155,86,225,
+    8,186,176,38,212,218,194,127,64,169,88,195,128,224,217,33,
+    226,253,216,97,85,52,248,194,114,172,176,85,203,44,82,220,
+    111,54,166,59,118,138,213,131,2,187,75,100,119,165,217,93,
+    57,147,173,164,89,221,185,70,110,31,19,124,155,69,223,230,
+    248,208,131,242,234,7,110,95,98,72,244,247,45,141,172,244,
+    143,44,247,143,220,143,8,253,199,197,254,227,130,251,132,232,
+    62,241,200,108,170,0,3,144,10,98,224,238,174,72,132,68,
+    87,32,181,159,248,71,92,108,93,170,184,219,115,111,255,242,
+    166,61,233,77,123,50,149,13,137,50,36,57,190,53,122,125,
+    52,185,93,112,54,137,206,166,180,179,41,231,66,223,95,5,
+    43,26,164,149,229,76,79,104,117,48,111,42,209,90,42,152,
+    12,94,41,112,200,134,250,149,26,81,42,24,192,164,54,78,
+    79,87,199,232,152,185,200,148,187,209,230,49,244,194,161,152,
+    198,93,176,145,189,51,103,198,150,194,208,227,176,45,34,103,
+    139,210,248,90,157,143,34,27,206,20,58,55,192,27,195,120,
+    228,158,133,215,249,99,215,111,96,247,55,70,102,196,113,95,
+    194,187,177,192,152,250,211,255,239,231,63,255,57,146,90,73,
+    63,137,4,167,166,112,223,200,154,103,120,142,135,121,50,2,
+    15,255,174,170,185,227,6,142,247,90,89,65,36,91,50,49,
+    21,58,55,13,22,98,250,6,95,161,109,196,144,26,72,76,
+    180,121,149,150,46,7,114,51,202,116,237,67,188,218,191,204,
+    187,240,218,74,89,195,114,89,131,80,22,16,203,2,113,115,
+    206,196,148,116,168,219,241,126,98,129,132,90,177,203,75,246,
+    67,33,16,111,198,93,78,54,98,57,246,206,177,148,77,240,
+    183,139,126,164,172,180,199,135,64,87,233,0,15,160,85,224,
+    159,236,189,142,155,29,111,159,68,42,155,191,45,94,146,169,
+    104,76,29,18,202,187,150,236,130,127,16,93,170,122,84,181,
+    192,54,139,44,236,130,2,142,199,28,171,108,133,242,172,220,
+    146,77,79,220,146,205,107,183,99,141,213,171,102,163,244,66,
+    247,31,210,216,147,143,209,184,21,51,250,113,64,211,122,117,
+    79,57,139,170,103,152,138,57,98,226,244,86,217,120,227,35,
+    212,51,214,206,159,185,160,125,155,176,147,106,101,228,144,23,
+    155,129,34,38,157,207,206,204,76,17,43,215,195,116,97,147,
+    151,26,58,255,7,180,212,166,249,143,129,224,209,224,127,1,
+    2,45,94,106,231,89,23,192,19,146,21,36,52,111,93,195,
+    95,67,206,35,239,173,42,231,145,32,13,107,183,116,67,126,
+    126,111,92,168,62,46,176,39,68,246,68,154,61,241,229,117,
+    134,146,82,229,91,62,129,173,23,217,250,52,91,175,106,233,
+    234,214,171,248,114,107,127,34,229,115,109,137,74,207,215,53,
+    111,24,219,30,208,249,141,186,10,148,21,186,8,7,213,181,
+    48,108,39,1,40,176,73,29,155,178,146,67,25,37,212,50,
+    30,103,146,172,9,64,54,146,21,80,54,102,37,174,109,56,
+    11,230,230,86,77,250,141,21,167,66,36,115,237,60,235,251,
+    171,237,137,75,150,141,177,154,113,135,93,71,74,89,3,43,
+    15,99,20,89,55,42,198,108,103,77,120,132,114,203,61,88,
+    114,57,118,133,232,124,120,150,26,140,225,127,10,69,29,250,
+    28,13,77,68,241,251,125,26,155,57,99,209,111,131,129,152,
+    6,22,202,208,89,85,66,31,233,227,121,57,239,183,148,222,
+    14,253,190,32,150,194,126,137,212,75,60,220,97,236,5,247,
+    122,232,255,217,18,194,21,66,209,32,255,71,16,145,93,226,
+    18,19,124,132,76,139,254,24,221,13,67,113,232,208,75,175,
+    246,35,240,90,180,113,21,238,0,1,58,129,55,48,68,7,
+    116,149,39,56,177,162,87,112,109,22,93,155,141,217,132,74,
+    23,100,110,151,8,174,77,162,107,19,10,217,214,73,124,175,
+    222,99,36,119,50,108,75,188,58,113,242,97,121,21,236,227,
+    243,246,120,220,14,150,167,207,36,119,138,142,141,139,72,249,
+    218,148,118,108,90,188,114,111,255,111,190,177,248,70,166,118,
+    227,98,155,80,211,183,244,170,80,189,47,126,244,161,138,19,
+    213,40,78,139,193,105,151,131,56,157,79,85,11,238,78,209,
+    221,25,183,192,118,196,199,86,252,45,203,254,22,193,223,42,
+    250,91,215,57,168,62,116,251,37,215,95,189,130,123,80,116,
+    15,222,27,78,187,242,251,208,26,138,140,231,205,127,55,148,
+    58,61,67,82,191,39,177,25,83,130,158,222,189,94,244,236,
+    101,89,148,84,186,103,17,229,144,41,216,77,145,185,72,241,
+    251,81,199,54,84,233,244,70,78,154,60,232,119,94,148,197,
+    4,19,103,5,214,154,82,89,157,170,83,16,179,20,250,1,
+    155,254,211,167,74,187,13,165,189,170,248,151,56,179,193,151,
+    18,79,245,37,246,41,190,244,202,83,125,169,228,34,172,238,
+    167,140,167,169,10,140,189,138,151,178,213,32,69,222,72,125,
+    62,12,103,143,49,176,176,211,192,8,106,14,11,96,142,168,
+    83,102,223,145,137,115,97,12,115,143,17,153,235,55,20,101,
+    29,207,91,155,248,69,90,13,92,99,94,26,45,123,97,250,
+    181,233,153,75,211,129,177,137,115,129,141,92,135,107,85,190,
+    62,137,84,18,13,95,215,137,109,152,185,99,29,5,56,60,
+    217,158,169,48,22,148,80,172,189,103,205,231,130,145,108,243,
+    42,204,95,86,64,136,221,140,30,29,212,51,232,172,101,22,
+    141,21,17,36,87,18,91,97,72,45,82,163,160,88,240,104,
+    97,70,167,100,203,119,22,130,227,109,223,245,134,50,89,183,
+    54,94,46,18,173,95,101,92,224,34,207,192,168,240,91,198,
+    163,2,150,32,181,226,226,98,163,88,189,83,96,7,69,118,
+    48,205,14,230,76,254,146,30,181,160,56,116,251,8,217,126,
+    66,45,42,162,113,97,217,5,123,250,252,5,18,23,125,149,
+    114,80,193,215,33,250,58,174,13,197,15,62,116,249,68,215,
+    198,21,87,199,178,171,99,177,121,145,23,92,125,162,171,111,
+    105,10,88,181,235,64,166,178,118,165,178,111,185,178,79,168,
+    236,23,43,251,19,140,226,150,44,69,191,179,55,177,55,83,
+    219,144,24,146,61,66,158,74,181,36,143,145,141,38,211,248,
+    200,120,202,69,79,219,138,167,115,217,211,185,120,112,201,43,
+    120,250,69,79,127,122,199,177,180,7,142,252,123,77,201,35,
+    130,187,85,116,183,166,241,97,252,222,61,75,218,179,7,29,
+    198,175,129,56,108,252,154,53,237,217,139,142,76,109,227,74,
+    109,223,114,109,159,80,219,47,214,246,39,216,124,60,237,201,
+    147,130,187,75,116,119,165,241,241,137,187,60,93,209,186,232,
+    19,42,186,200,14,131,105,119,55,248,86,235,201,109,2,215,
+    117,6,138,162,178,86,225,127,163,13,124,2,173,111,11,57,
+    149,167,32,245,56,164,30,177,212,126,28,165,229,221,46,181,
+    145,204,234,254,173,213,64,160,218,3,190,180,246,161,94,19,
+    19,83,236,205,66,142,162,251,138,197,248,43,72,56,181,23,
+    249,150,173,216,251,198,223,90,143,183,72,84,154,249,25,170,
+    34,226,111,193,27,74,154,56,22,113,199,146,168,31,59,229,
+    194,38,159,170,217,65,152,22,140,150,202,214,123,39,192,5,
+    23,113,128,162,88,244,125,69,114,219,181,145,35,179,132,80,
+    10,209,38,197,62,116,34,28,9,128,165,224,68,36,116,6,
+    197,154,15,61,138,36,227,31,172,37,211,202,243,43,16,241,
+    40,45,25,252,101,93,196,249,214,87,199,191,50,252,252,169,
+    35,39,71,179,155,86,137,66,7,66,102,125,70,55,235,87,
+    137,128,139,100,29,121,126,28,150,93,38,65,218,53,134,147,
+    216,91,87,185,142,5,18,183,93,95,3,214,7,230,134,72,
+    89,174,0,199,91,142,76,77,195,74,205,214,229,154,173,66,
+    205,54,177,102,27,186,229,34,210,236,128,232,104,254,240,202,
+    178,99,115,218,177,89,55,109,175,72,187,31,185,150,29,3,
+    105,199,0,118,149,187,121,169,255,227,103,238,239,20,183,158,
+    16,234,78,8,222,81,209,59,154,118,142,226,192,233,218,30,
+    209,209,251,163,222,251,251,133,190,225,101,199,112,218,49,140,
+    94,201,184,251,97,101,69,111,186,105,155,232,221,14,219,96,
+    14,60,50,155,125,101,159,82,136,192,26,137,178,28,75,181,
+    180,175,52,15,47,55,15,11,205,135,196,230,67,224,208,41,
+    128,89,202,230,229,218,205,66,109,159,88,219,7,247,170,210,
+    248,48,222,209,8,179,136,132,153,24,161,18,241,149,163,201,
+    130,30,53,138,130,109,253,127,136,253,39,40,49,20,65,86,
+    44,218,105,83,3,209,239,176,6,19,181,112,69,29,188,34,
+    97,195,124,213,20,179,34,45,155,249,246,166,162,43,3,10,
+    181,91,235,122,87,6,160,184,153,133,233,47,156,43,43,202,
+    85,37,74,163,191,24,82,165,19,162,152,133,197,47,252,77,
+    16,68,167,208,55,155,138,149,139,90,112,94,221,113,237,194,
+    95,199,204,223,110,46,54,237,186,254,120,144,24,231,47,166,
+    62,60,81,44,3,95,184,116,64,120,238,67,165,211,131,74,
+    167,8,126,160,153,109,82,99,156,218,39,234,214,169,179,129,
+    67,41,93,248,194,41,5,225,27,41,94,11,63,68,255,127,
+    23,102,1,164,77,216,237,209,95,127,94,54,5,13,32,214,
+    6,126,228,176,193,191,110,183,59,197,252,211,200,73,239,68,
+    222,77,47,152,122,161,232,186,49,112,63,58,51,27,238,194,
+    183,158,7,231,121,6,139,223,208,71,240,27,51,225,72,254,
+    149,30,37,204,40,17,197,243,146,57,6,67,243,34,249,247,
+    100,185,28,13,32,89,56,255,23,64,254,119,32,216,82,44,
+    111,250,133,253,184,226,13,65,176,127,86,112,240,42,137,188,
+    121,87,131,100,153,231,60,16,1,70,35,219,116,240,18,182,
+    13,43,144,119,237,227,96,132,142,159,97,79,120,106,54,47,
+    63,128,17,63,188,130,101,220,156,157,242,149,199,109,25,68,
+    88,36,139,34,226,173,128,203,74,236,43,169,178,164,250,17,
+    144,248,193,140,86,36,157,184,219,186,212,36,184,182,137,174,
+    109,247,234,210,174,97,116,60,168,217,144,106,78,77,220,110,
+    125,175,247,102,111,2,69,81,155,246,53,103,26,91,19,135,
+    51,190,154,180,175,53,227,175,149,252,150,219,4,255,102,209,
+    191,57,237,223,140,239,117,46,251,59,23,15,9,254,126,209,
+    223,159,246,247,103,106,54,36,108,232,125,173,224,72,223,29,
+    89,58,32,120,6,68,207,192,189,193,180,103,24,29,82,180,
+    13,27,87,26,182,45,55,108,19,26,6,196,134,129,196,161,
+    207,87,121,115,91,218,179,15,29,186,4,125,100,189,195,222,
+    101,5,255,22,209,191,37,141,143,76,121,125,186,188,35,227,
+    175,123,247,228,59,39,63,28,249,224,240,237,195,138,175,117,
+    116,242,208,95,251,238,232,59,163,31,110,255,96,199,237,29,
+    130,191,75,244,119,165,253,93,232,100,149,79,111,79,123,246,
+    163,67,245,233,238,101,127,247,226,228,210,134,187,103,151,158,
+    187,27,186,231,187,247,220,143,43,238,211,63,174,22,252,7,
+    69,255,193,180,255,224,127,89,59,39,127,225,174,122,100,166,
+    188,251,233,135,238,202,100,85,106,71,218,213,149,102,187,86,
+    113,103,216,69,235,23,238,234,240,86,130,177,150,21,115,80,
+    56,79,79,155,56,102,94,191,137,143,97,108,197,220,32,198,
+    232,187,58,111,78,120,19,12,67,222,161,115,249,157,183,37,
+    54,21,1,150,24,88,78,123,215,166,141,159,46,186,153,6,
+    74,99,17,100,91,154,17,97,163,123,14,242,65,88,111,52,
+    129,153,144,202,126,188,144,215,140,20,6,80,25,220,28,83,
+    20,120,16,65,59,204,58,183,170,72,100,203,59,28,181,18,
+    105,18,204,66,179,149,58,177,79,238,198,100,197,38,94,172,
+    153,161,243,238,193,241,103,192,214,147,68,247,172,28,103,193,
+    66,90,43,89,173,130,119,67,206,179,9,114,243,87,129,69,
+    124,72,229,119,67,150,16,76,15,65,48,51,13,77,55,103,
+    210,61,207,136,13,251,226,39,227,39,31,54,52,198,79,62,
+    40,243,100,252,85,55,78,166,142,136,254,30,41,192,126,177,
+    225,64,166,174,51,103,99,92,176,71,160,11,246,8,116,217,
+    227,102,196,118,58,186,127,219,245,155,46,161,125,167,216,142,
+    20,232,141,241,202,68,123,242,112,134,149,117,235,170,197,129,
+    123,95,69,82,155,192,142,136,236,72,154,29,193,143,26,151,
+    217,198,20,35,6,118,8,236,78,145,221,153,102,119,102,92,
+    222,184,188,87,68,181,225,226,214,223,132,2,248,8,200,239,
+    0,1,155,86,254,159,3,249,95,129,120,129,248,128,192,242,
+    124,254,63,3,185,160,240,235,63,3,2,156,146,7,223,215,
+    252,79,128,252,31,64,254,130,150,100,105,30,214,222,240,15,
+    129,232,86,199,66,115,194,228,207,193,216,232,255,166,180,171,
+    99,27,211,76,227,195,154,150,52,83,153,51,177,53,214,52,
+    83,145,243,83,77,109,105,166,33,19,216,10,46,181,107,81,
+    136,170,76,109,0,209,135,108,69,210,153,97,253,137,87,51,
+    172,59,209,154,97,93,137,114,76,114,14,107,53,122,181,60,
+    231,118,193,218,88,133,52,57,193,109,181,66,234,156,224,71,
+    90,33,117,14,56,83,72,141,23,123,215,86,209,246,26,120,
+    166,144,29,101,150,173,224,59,91,34,129,13,150,238,28,165,
+    144,17,218,109,241,229,168,66,66,138,2,10,160,99,3,174,
+    9,24,155,206,206,193,72,61,62,206,67,223,228,161,75,242,
+    176,70,146,127,23,235,78,112,6,173,20,111,237,145,181,146,
+    145,29,35,88,60,200,84,196,133,203,232,170,213,182,11,206,
+    254,28,186,141,149,244,68,98,110,141,215,92,229,151,96,225,
+    225,22,143,195,216,240,26,47,248,128,37,27,216,244,153,212,
+    156,182,54,31,179,187,47,204,112,115,83,193,189,252,191,167,
+    137,91,222,240,69,212,151,115,102,154,166,115,140,151,102,80,
+    217,33,210,78,209,173,105,106,163,250,200,80,232,142,230,120,
+    72,149,94,197,255,50,84,201,85,252,47,67,57,174,226,127,
+    25,170,49,109,116,100,168,182,116,241,227,161,179,2,197,225,
+    241,95,45,67,221,225,170,19,76,128,217,140,189,244,170,13,
+    147,135,37,238,171,214,135,94,255,85,87,206,138,228,142,141,
+    57,202,152,38,90,31,225,223,79,213,79,94,53,127,157,166,
+    81,67,48,166,201,218,71,248,247,83,245,147,3,230,175,226,
+    11,99,154,248,230,35,252,251,169,250,201,69,211,24,190,48,
+    166,240,202,24,126,69,245,100,218,84,65,195,210,168,2,18,
+    255,202,35,248,249,52,127,183,239,89,134,174,201,81,198,52,
+    126,246,17,254,253,84,253,228,44,27,50,209,149,57,202,152,
+    198,81,65,193,239,167,234,39,95,181,84,193,247,20,178,189,
+    148,118,229,40,133,4,234,225,76,33,251,232,195,102,26,245,
+    19,99,154,216,254,8,255,126,90,228,57,110,151,255,63,45,
+    228,187,67,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/ext/pyfdt/pyfdt.py",
+    "m5.ext.pyfdt.pyfdt",
+    embedded_module_data,
+    22323,
+    62957);
+
+} // anonymous namespace
+} // namespace gem5
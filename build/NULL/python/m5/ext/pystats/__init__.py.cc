@@ -0,0 +1,62 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,82,77,111,211,64,16,221,205,151,29,59,113,210,
+    82,74,41,21,170,170,22,8,7,114,130,19,66,170,138,132,
+    64,21,151,84,66,218,139,229,218,86,187,104,215,142,214,155,
+    170,229,196,191,224,206,141,11,191,197,71,107,175,156,184,69,
+    234,173,39,118,38,41,196,2,137,228,233,249,205,120,103,103,
+    230,201,63,200,202,175,177,124,94,127,183,244,133,36,36,161,
+    130,72,202,40,5,221,16,13,217,100,77,217,98,45,140,155,
+    162,45,59,172,131,186,37,28,233,50,23,117,91,116,165,199,
+    60,212,29,225,203,30,235,161,118,68,95,6,44,64,237,138,
+    129,28,178,33,234,174,88,147,235,108,29,181,39,238,200,13,
+    182,129,218,23,119,229,38,219,68,221,19,247,228,22,219,66,
+    221,23,247,229,54,219,166,228,140,36,193,87,202,30,36,131,
+    9,25,13,127,82,59,244,136,154,222,225,105,161,85,20,235,
+    137,142,244,168,97,6,71,185,152,201,44,82,135,42,62,231,
+    23,169,9,110,19,31,20,215,169,178,37,3,56,90,28,229,
+    114,26,41,94,228,153,77,181,223,168,124,54,181,194,123,103,
+    19,199,121,148,44,78,30,219,27,22,167,5,79,51,109,83,
+    195,73,170,120,36,248,167,232,84,224,43,155,115,38,92,46,
+    101,23,158,111,179,36,189,188,13,120,161,121,108,3,127,162,
+    115,21,157,165,39,87,211,20,66,236,31,235,215,51,9,125,
+    131,19,46,211,163,60,187,72,85,193,237,72,129,106,218,253,
+    148,3,228,3,245,129,134,64,1,144,7,228,2,181,128,218,
+    64,61,160,1,80,7,168,107,233,253,104,199,244,163,165,67,
+    97,97,199,193,123,141,27,47,77,249,83,110,156,24,29,73,
+    177,218,180,207,192,17,28,192,120,31,173,41,2,77,193,158,
+    166,43,172,47,112,91,129,93,204,90,177,98,202,162,141,135,
+    87,22,92,98,228,99,21,72,14,222,224,168,203,24,236,193,
+    237,140,95,44,28,210,214,33,220,210,244,236,224,105,36,151,
+    173,97,53,19,104,107,84,252,219,40,180,196,56,97,24,9,
+    17,134,223,200,53,124,208,55,7,133,138,199,211,43,125,158,
+    103,99,249,124,156,94,106,27,225,188,227,48,228,25,215,97,
+    248,108,122,117,227,190,148,121,50,19,233,43,181,103,171,224,
+    131,42,30,90,158,55,41,165,243,23,132,62,41,201,227,85,
+    204,27,77,218,152,147,255,147,75,232,65,73,246,87,81,145,
+    173,178,142,138,236,149,117,84,228,81,89,71,69,198,101,29,
+    21,217,41,235,168,200,110,89,199,191,50,251,127,205,99,39,
+    172,161,34,79,203,58,230,173,129,111,55,186,165,207,14,252,
+    213,174,245,233,23,131,120,50,169,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/ext/pystats/__init__.py",
+    "m5.ext.pystats",
+    embedded_module_data,
+    601,
+    1096);
+
+} // anonymous namespace
+} // namespace gem5
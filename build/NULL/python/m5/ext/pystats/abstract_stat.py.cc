@@ -0,0 +1,205 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,88,219,111,27,85,26,63,115,181,199,118,28,167,
+    185,208,52,205,118,146,54,77,156,77,156,182,20,86,132,16,
+    209,37,180,4,117,83,68,202,34,25,42,103,236,57,78,220,
+    142,61,230,204,184,109,34,7,120,232,10,23,85,162,43,237,
+    46,217,21,104,141,196,162,160,46,162,143,251,136,246,47,136,
+    43,75,141,70,170,4,90,237,3,210,62,184,106,145,86,188,
+    236,126,231,140,47,227,52,233,194,74,76,226,111,206,229,59,
+    183,239,242,251,190,51,255,64,158,199,87,127,63,248,3,144,
+    15,145,142,116,206,64,89,46,206,101,249,56,159,21,226,66,
+    86,140,139,89,41,46,101,229,184,156,245,197,125,28,210,121,
+    93,48,252,89,37,174,176,178,104,4,178,193,120,48,27,138,
+    135,178,29,241,142,108,56,30,134,118,73,151,117,31,22,176,
+    140,59,117,57,205,247,55,23,108,149,210,162,238,191,38,198,
+    35,60,58,131,116,229,26,210,101,172,124,38,32,116,75,104,
+    112,196,187,244,192,34,138,6,191,165,149,168,207,17,78,229,
+    86,29,255,11,154,97,104,73,3,59,226,217,140,101,59,254,
+    115,121,59,99,230,52,195,241,189,162,217,54,38,57,71,58,
+    95,200,67,191,244,90,14,58,190,229,232,96,206,137,44,98,
+    146,209,140,204,26,29,187,104,107,118,84,116,20,250,158,207,
+    233,248,170,211,145,50,179,249,140,129,19,4,47,67,85,89,
+    198,118,34,195,122,66,54,193,56,145,90,209,114,203,88,119,
+    68,11,134,56,161,83,73,203,38,90,202,166,19,56,50,193,
+    118,129,228,82,156,71,176,66,253,247,224,37,87,176,220,53,
+    84,68,23,155,221,101,47,111,243,249,12,126,183,154,181,185,
+    29,117,16,5,191,208,182,136,12,191,110,186,200,105,182,200,
+    50,44,113,225,103,111,242,8,173,115,235,188,237,225,44,242,
+    54,239,89,6,202,183,154,245,47,15,20,185,34,159,230,127,
+    203,223,56,180,136,62,135,69,156,64,198,202,228,224,160,185,
+    20,38,93,84,124,130,195,199,142,57,34,200,151,56,130,153,
+    188,104,209,163,169,170,250,253,184,69,82,83,249,85,123,197,
+    204,77,101,159,154,194,87,109,168,81,17,89,83,90,93,68,
+    9,90,141,229,87,191,15,204,24,160,48,42,231,217,53,21,
+    4,154,49,116,214,103,197,102,12,51,165,25,214,108,172,197,
+    49,5,11,88,207,3,121,23,213,144,24,146,91,228,155,80,
+    111,105,238,230,225,123,193,222,155,169,143,103,42,193,177,106,
+    112,172,230,131,142,109,165,163,100,149,130,53,161,141,253,1,
+    51,30,222,241,39,18,122,6,118,147,112,164,140,141,179,86,
+    148,35,17,186,6,149,146,74,14,0,117,66,222,77,145,67,
+    208,20,163,28,199,221,93,240,141,25,191,238,31,252,104,240,
+    110,255,196,157,254,137,74,127,172,218,31,171,73,208,122,159,
+    118,61,172,47,43,201,228,32,140,74,121,149,235,175,191,31,
+    124,5,228,61,80,23,70,113,78,71,113,94,231,226,130,206,
+    99,81,23,176,164,139,186,148,150,75,40,205,233,242,181,80,
+    92,102,237,180,77,100,109,62,104,243,41,72,65,122,167,174,
+    96,63,86,176,184,204,225,192,238,14,166,7,112,64,23,113,
+    80,247,58,157,172,7,175,73,241,144,30,194,29,88,196,97,
+    239,200,71,120,69,189,3,28,180,19,218,35,105,94,15,67,
+    185,171,132,174,114,241,125,96,137,17,102,24,107,201,0,88,
+    129,122,42,167,54,180,173,166,12,205,178,212,43,43,153,212,
+    138,10,158,170,190,178,74,125,196,82,51,185,21,112,64,91,
+    77,19,51,27,11,184,195,60,221,26,193,234,203,150,153,243,
+    122,105,140,113,57,98,78,203,130,55,95,214,140,2,38,251,
+    96,213,133,84,19,34,224,145,80,221,211,254,5,228,247,220,
+    135,232,135,26,190,53,217,198,137,46,54,123,202,222,249,91,
+    28,220,103,192,127,171,57,102,239,153,73,216,86,60,125,200,
+    235,197,28,178,131,123,245,149,229,221,215,45,242,237,243,3,
+    192,2,26,124,206,45,68,125,164,143,174,71,117,65,6,129,
+    56,2,0,23,233,164,37,201,42,228,49,113,130,137,132,133,
+    109,234,185,137,4,64,158,104,97,35,77,134,40,255,48,229,
+    82,18,9,166,49,224,18,17,243,233,119,153,51,144,81,32,
+    107,251,189,56,23,243,204,244,28,149,95,26,200,191,223,69,
+    212,19,241,199,111,86,130,227,213,224,120,13,9,202,192,23,
+    23,183,67,145,27,191,186,27,26,188,19,26,220,208,43,161,
+    195,213,208,225,191,188,121,95,224,167,2,15,17,16,198,245,
+    157,140,58,250,175,47,220,88,40,45,220,243,119,92,247,221,
+    240,221,245,15,220,241,15,108,204,149,71,42,254,177,170,127,
+    108,171,241,239,122,147,71,222,45,173,127,133,118,209,58,186,
+    216,172,149,189,163,60,50,221,161,75,143,228,127,90,93,182,
+    175,235,106,146,28,65,52,192,185,186,164,106,36,35,168,161,
+    85,170,75,114,20,8,213,164,142,141,186,38,5,50,70,59,
+    152,34,163,64,234,136,92,87,222,207,209,46,202,107,14,158,
+    163,252,103,81,83,121,250,239,178,119,251,70,239,244,141,110,
+    138,149,190,201,106,223,228,23,197,74,112,166,26,156,169,33,
+    78,25,184,23,218,191,171,146,42,254,161,170,127,104,171,241,
+    207,84,116,218,81,242,4,3,206,106,54,118,20,130,83,5,
+    98,101,46,227,54,127,165,114,97,154,59,13,82,120,15,52,
+    87,228,173,129,18,7,232,198,93,243,183,107,177,93,86,143,
+    198,195,101,180,46,60,110,4,164,39,144,172,252,70,104,97,
+    218,186,88,20,73,186,40,254,144,248,203,2,169,180,46,95,
+    231,72,144,71,215,185,162,212,62,59,233,45,10,123,88,151,
+    188,83,203,176,226,174,152,210,182,123,249,127,237,254,209,89,
+    111,167,139,2,160,177,168,253,26,54,50,15,217,15,8,94,
+    181,87,136,89,88,118,225,215,76,67,21,171,44,176,17,156,
+    155,80,205,122,186,100,172,170,87,50,54,48,169,77,141,185,
+    168,76,159,88,76,77,153,58,158,76,66,96,190,52,61,221,
+    234,160,207,236,236,172,106,65,144,199,217,88,99,218,49,67,
+    203,38,117,77,77,80,168,158,86,71,83,249,194,40,32,190,
+    74,171,209,182,193,111,64,215,177,9,21,232,113,70,79,92,
+    8,180,102,159,206,107,68,203,182,54,52,173,54,146,187,152,
+    250,162,6,1,133,173,55,106,177,121,213,140,165,230,1,185,
+    176,174,218,38,28,18,170,233,66,46,69,249,99,109,75,182,
+    63,243,105,21,162,144,155,177,89,234,210,210,121,82,192,75,
+    75,19,84,74,185,150,168,232,228,171,25,108,232,88,127,220,
+    100,231,96,0,185,146,177,240,68,251,80,235,82,38,159,135,
+    161,116,181,156,105,195,137,204,203,25,157,238,20,86,121,204,
+    124,84,99,13,153,178,144,232,238,147,110,98,167,144,154,206,
+    229,21,210,41,195,50,235,99,218,212,14,34,107,90,192,99,
+    150,215,113,30,44,34,157,33,150,221,58,117,91,198,73,97,
+    151,101,156,39,145,11,187,44,231,236,105,228,156,215,5,230,
+    42,194,78,152,251,114,95,145,230,151,189,0,117,189,204,115,
+    128,68,69,242,4,45,239,167,132,218,56,153,0,178,35,10,
+    13,0,89,139,182,1,89,227,32,187,101,141,75,116,134,23,
+    17,67,54,72,195,122,194,45,242,77,207,224,205,185,141,195,
+    219,79,168,144,44,66,155,140,70,98,229,249,77,253,147,115,
+    159,158,99,45,219,145,110,72,29,189,67,24,164,45,124,251,
+    31,120,96,179,52,31,116,132,188,153,119,100,13,148,155,211,
+    29,25,210,93,120,3,112,143,53,182,79,38,41,151,98,155,
+    9,87,11,16,133,109,45,117,169,117,72,139,222,184,212,37,
+    38,89,55,235,244,55,14,180,214,187,235,57,231,233,40,167,
+    126,166,9,20,233,175,33,73,9,67,58,234,221,42,35,255,
+    28,154,220,212,43,67,79,86,135,158,132,148,180,39,124,159,
+    54,62,172,119,119,132,107,17,212,251,68,73,185,23,57,184,
+    113,190,18,25,174,70,134,203,39,225,239,213,242,201,106,100,
+    172,36,109,135,187,129,77,57,177,189,127,240,207,202,159,148,
+    63,6,63,10,94,159,167,153,246,118,247,65,8,4,29,71,
+    203,74,89,217,60,242,73,231,167,157,172,186,29,233,191,27,
+    81,239,68,212,114,119,37,50,82,141,140,108,69,70,182,67,
+    93,31,156,125,255,236,199,7,203,169,74,255,120,181,127,124,
+    243,36,252,189,186,121,178,218,127,172,18,58,94,13,29,223,
+    10,29,175,41,168,179,135,45,85,11,192,113,182,252,251,153,
+    160,29,137,93,189,218,162,60,53,6,22,43,74,136,94,112,
+    218,208,146,123,76,254,21,177,37,47,103,187,49,174,243,57,
+    190,8,198,90,220,43,207,227,47,138,77,12,230,254,186,35,
+    247,2,180,21,180,247,97,178,211,112,61,100,14,203,174,11,
+    224,110,154,173,102,53,27,80,138,122,30,69,168,137,150,147,
+    2,218,122,81,25,56,154,254,181,152,201,178,20,56,246,227,
+    225,55,13,91,24,163,96,251,198,177,201,103,46,140,254,8,
+    164,133,21,0,151,240,206,185,207,195,206,181,164,121,25,67,
+    108,128,109,82,232,114,143,180,180,4,51,36,76,10,119,75,
+    75,187,129,17,104,110,154,13,135,98,193,208,136,138,175,2,
+    140,91,22,0,147,90,168,99,180,133,53,146,90,137,169,47,
+    104,57,53,9,11,61,130,68,48,162,126,13,215,221,41,85,
+    147,64,128,2,167,200,228,150,105,60,113,27,211,38,129,93,
+    181,16,234,60,220,229,168,223,69,37,150,65,57,2,12,32,
+    29,212,14,158,102,118,197,142,208,200,152,126,65,155,124,121,
+    247,83,65,227,30,235,122,162,72,229,185,214,213,230,133,180,
+    233,45,234,129,191,68,244,22,248,221,48,10,245,65,182,187,
+    88,9,14,85,131,67,52,143,61,120,175,239,112,249,197,74,
+    223,120,181,111,188,116,166,116,230,235,190,129,210,153,237,206,
+    238,15,214,223,95,223,120,253,163,11,183,245,210,122,165,243,
+    217,106,231,179,91,254,103,221,68,118,215,15,5,234,163,38,
+    190,35,224,131,233,113,218,223,161,250,106,61,122,129,28,217,
+    55,10,26,229,235,102,85,183,198,36,54,204,43,110,80,52,
+    115,88,77,174,170,186,9,39,214,33,98,218,43,173,16,144,
+    44,100,12,27,56,92,204,167,138,154,160,210,85,211,26,212,
+    240,85,16,194,132,186,108,152,201,137,186,228,53,48,121,80,
+    82,58,115,85,53,76,243,82,33,255,163,172,214,221,235,115,
+    170,149,201,178,111,2,172,62,22,221,157,47,6,23,153,177,
+    225,164,169,17,61,6,225,51,5,182,100,146,88,202,4,163,
+    58,198,94,177,76,62,53,252,232,96,122,201,31,171,207,0,
+    59,223,99,138,113,207,20,209,214,78,169,1,187,187,4,193,
+    17,220,20,15,243,104,64,123,53,69,197,172,165,193,118,234,
+    130,166,65,90,211,117,215,192,77,210,156,137,224,44,184,145,
+    206,174,187,108,56,253,138,212,50,89,176,216,48,181,88,142,
+    25,165,247,35,132,196,214,95,219,215,102,133,172,141,98,160,
+    21,113,205,240,0,0,231,70,207,245,119,110,188,179,229,255,
+    25,51,170,40,191,112,58,218,77,63,115,80,232,73,36,156,
+    64,34,145,53,245,130,65,203,161,68,226,173,130,102,212,123,
+    124,112,23,48,83,137,4,121,134,58,4,53,62,118,219,99,
+    183,6,66,211,115,34,50,119,72,154,166,65,164,134,31,17,
+    122,13,34,52,124,145,25,74,66,148,204,82,198,142,250,29,
+    50,133,13,3,174,38,156,123,33,161,103,122,222,141,226,93,
+    13,66,231,177,142,114,44,150,53,254,32,146,73,126,250,205,
+    196,95,11,73,82,180,44,64,124,147,162,155,47,176,215,237,
+    57,246,218,155,132,5,105,152,14,129,215,166,200,94,123,147,
+    48,122,122,122,251,192,161,154,239,168,4,65,20,200,215,221,
+    3,27,47,149,83,229,215,54,231,202,111,84,15,30,175,118,
+    159,168,73,180,83,70,61,251,93,54,63,10,132,75,185,170,
+    50,88,83,26,163,60,228,21,174,87,154,217,24,41,11,229,
+    215,203,161,234,129,201,26,130,250,237,35,183,223,174,158,56,
+    205,202,59,73,172,67,58,116,115,181,134,224,245,3,136,155,
+    128,68,247,57,178,189,154,7,8,116,117,69,149,227,170,69,
+    110,106,196,223,80,144,211,101,121,190,160,176,79,89,132,222,
+    81,29,133,22,153,29,185,154,99,248,72,109,208,189,97,50,
+    83,56,212,84,22,203,210,232,234,76,129,223,251,103,92,83,
+    154,37,244,115,38,213,172,117,8,104,77,224,56,174,246,180,
+    159,227,107,232,167,32,61,136,59,182,133,166,188,255,53,94,
+    162,189,255,31,137,72,156,124,243,109,90,150,55,143,108,22,
+    110,47,254,45,182,245,212,75,213,169,249,234,248,203,172,117,
+    39,137,36,56,14,84,177,59,221,234,62,124,159,21,30,238,
+    193,192,4,248,95,30,109,111,158,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/ext/pystats/abstract_stat.py",
+    "m5.ext.pystats.abstract_stat",
+    embedded_module_data,
+    2889,
+    5999);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,525 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,123,107,108,27,215,185,224,12,201,33,135,228,80,
+    15,138,162,94,126,140,100,201,22,109,153,170,109,73,182,229,
+    87,109,73,118,237,216,114,54,118,218,70,73,43,81,154,161,
+    77,155,175,204,12,109,75,151,186,245,222,117,81,218,16,96,
+    198,171,192,76,106,111,121,123,147,94,5,77,176,250,177,197,
+    250,207,46,218,230,246,207,238,31,210,24,32,4,1,1,94,
+    44,10,108,129,11,44,189,113,128,108,119,177,216,239,59,195,
+    199,112,68,101,27,236,189,34,245,13,231,204,121,124,231,59,
+    231,124,239,249,175,148,238,207,86,190,126,249,143,0,30,83,
+    2,53,67,9,180,96,10,211,51,52,185,154,102,76,228,106,
+    158,49,147,171,101,198,66,174,204,12,3,87,115,216,26,177,
+    206,88,105,108,99,9,219,34,236,12,27,177,207,216,35,142,
+    25,71,196,57,227,140,112,51,92,196,53,227,138,52,205,52,
+    69,154,103,154,161,30,51,211,34,88,103,90,5,219,140,91,
+    96,103,218,196,102,209,35,182,139,46,237,26,52,117,85,17,
+    171,253,10,154,107,191,103,188,130,93,180,10,14,209,26,180,
+    8,206,123,150,153,14,19,117,142,18,184,123,148,224,250,149,
+    137,162,126,109,170,214,236,36,79,154,224,73,179,225,73,151,
+    96,186,66,249,90,2,130,153,162,28,167,249,133,88,56,17,
+    137,6,36,62,32,45,92,15,221,18,249,88,144,151,149,128,
+    194,11,137,72,92,30,226,5,81,14,93,139,138,2,47,199,
+    120,229,58,148,7,162,129,240,162,28,146,121,121,65,10,197,
+    21,153,95,8,68,249,120,34,28,118,4,248,235,129,168,16,
+    76,132,177,15,37,20,17,121,89,148,66,162,204,199,18,10,
+    22,5,248,112,44,122,141,151,18,81,254,118,72,185,142,165,
+    241,128,36,135,160,76,185,46,242,146,40,43,126,135,227,116,
+    180,138,10,12,18,224,133,144,36,46,40,49,105,145,191,30,
+    11,11,80,121,220,225,216,203,207,205,201,11,215,197,72,192,
+    127,67,142,69,231,230,198,73,15,149,118,183,68,232,53,22,
+    29,34,133,209,68,100,94,148,112,252,91,129,112,2,176,9,
+    69,121,49,176,112,157,151,98,183,97,50,194,144,131,231,131,
+    49,137,23,161,213,98,153,28,67,124,8,38,22,13,68,196,
+    33,94,190,30,136,195,37,22,12,202,162,66,16,135,14,2,
+    149,214,240,191,200,71,68,37,32,4,148,0,244,52,40,250,
+    175,249,201,184,114,98,30,59,144,181,153,223,34,115,240,249,
+    9,234,88,215,63,31,170,226,13,125,201,85,186,151,177,12,
+    200,124,56,164,40,97,113,191,24,21,66,64,226,96,56,22,
+    80,198,70,134,248,107,82,44,17,135,5,9,69,97,188,249,
+    112,108,225,38,105,156,136,243,74,12,58,39,37,179,216,229,
+    220,28,233,217,207,79,225,116,73,57,146,84,6,68,160,185,
+    54,211,253,145,192,141,152,4,179,140,65,103,136,75,121,120,
+    232,48,22,21,203,149,248,192,130,20,147,101,242,92,235,38,
+    32,225,179,168,18,186,150,136,37,100,109,86,26,42,250,121,
+    213,72,79,102,88,33,60,169,56,180,121,134,137,80,84,57,
+    116,16,182,0,193,183,60,52,46,186,76,112,33,212,137,67,
+    127,72,250,193,144,95,244,147,59,220,167,62,63,127,101,33,
+    16,134,205,4,91,16,54,0,89,51,199,220,220,160,111,110,
+    110,168,76,123,25,80,28,140,14,65,9,89,55,33,36,43,
+    82,104,62,161,192,70,225,231,19,11,55,69,133,212,0,244,
+    101,172,228,231,175,194,12,110,75,33,5,103,16,13,47,58,
+    162,162,40,104,52,0,76,162,66,64,18,0,255,121,41,32,
+    45,30,43,239,223,128,128,216,137,239,38,96,203,202,252,116,
+    34,242,250,162,223,241,39,60,117,211,62,186,200,4,36,41,
+    176,232,99,139,150,201,208,130,82,180,92,4,12,138,182,75,
+    129,120,28,54,117,145,189,28,71,84,2,225,162,237,245,128,
+    2,131,70,139,236,21,232,74,140,46,136,69,230,106,34,30,
+    134,203,155,81,168,242,39,26,58,92,114,234,246,255,18,91,
+    217,81,75,142,218,42,20,173,218,90,22,173,146,168,36,164,
+    232,2,173,227,124,22,248,55,35,231,187,67,56,159,162,123,
+    116,163,90,79,160,111,98,29,74,242,41,76,237,121,146,186,
+    97,174,253,174,231,46,203,80,146,181,80,13,254,126,5,255,
+    191,174,222,209,80,15,184,144,105,186,104,213,246,128,143,41,
+    154,229,69,185,104,159,95,84,196,152,4,132,148,112,144,34,
+    171,44,198,197,133,152,32,22,89,124,34,223,14,196,125,180,
+    228,130,71,50,162,201,255,121,64,150,22,134,227,139,192,78,
+    162,195,145,209,97,241,142,2,119,184,85,228,225,10,107,243,
+    199,23,139,77,179,218,56,179,218,94,147,188,208,248,123,216,
+    203,40,128,187,212,134,205,113,111,57,195,62,183,241,57,27,
+    191,209,234,77,223,90,253,201,154,53,223,58,172,182,14,167,
+    172,5,182,233,97,243,131,230,60,219,165,178,93,57,182,171,
+    224,108,189,123,233,75,156,199,130,126,138,108,249,250,165,74,
+    104,42,82,32,69,40,148,32,32,61,218,4,139,104,17,24,
+    145,17,172,192,189,173,130,237,30,51,99,19,88,145,21,237,
+    162,5,254,25,193,174,231,255,91,200,2,147,224,0,174,239,
+    16,156,162,19,90,113,250,90,2,39,58,65,42,184,224,185,
+    203,78,9,158,45,234,52,145,210,230,198,253,11,205,66,19,
+    224,214,114,15,229,84,187,208,10,125,181,194,213,13,87,183,
+    208,4,235,229,45,54,77,148,137,250,3,114,50,150,226,192,
+    54,120,254,116,60,14,116,149,27,50,50,96,74,129,77,82,
+    70,59,93,90,169,76,184,73,48,116,71,20,72,103,243,139,
+    228,56,5,67,146,172,144,179,142,135,80,17,163,126,242,244,
+    79,45,128,232,217,162,37,30,80,174,23,29,53,102,87,180,
+    6,8,18,11,250,221,135,242,157,236,242,255,99,194,21,73,
+    194,90,220,36,15,164,102,69,119,26,4,211,175,224,238,215,
+    213,146,191,161,147,116,146,154,173,222,39,77,112,87,221,227,
+    130,25,238,170,39,64,176,192,93,117,204,107,176,175,103,171,
+    103,69,113,213,198,184,81,209,53,168,36,45,48,159,90,235,
+    207,13,77,41,156,174,110,117,228,44,75,53,248,75,210,138,
+    187,118,103,56,129,150,164,89,250,151,91,244,230,104,216,155,
+    165,126,246,210,188,210,177,245,211,81,106,153,81,106,91,134,
+    186,81,157,99,146,169,175,185,108,21,204,248,49,206,52,234,
+    220,69,29,160,100,203,109,211,29,243,91,212,109,154,166,222,
+    130,82,228,8,217,166,70,248,193,89,161,146,86,129,173,13,
+    58,105,224,38,245,227,130,158,101,190,66,233,41,164,236,208,
+    253,230,107,191,131,230,73,234,71,239,46,219,190,13,181,190,
+    221,58,37,109,245,179,55,80,250,96,221,14,105,253,231,24,
+    131,166,86,36,164,135,207,30,248,24,10,201,25,194,191,113,
+    80,189,2,17,30,143,209,56,57,140,21,229,169,170,111,249,
+    249,243,10,234,11,11,32,216,20,212,55,130,60,138,64,81,
+    0,9,109,232,165,118,12,181,190,12,130,127,62,17,12,138,
+    168,115,204,139,160,105,193,80,85,101,164,218,81,131,191,242,
+    177,71,237,209,207,191,30,144,148,80,32,28,94,4,190,16,
+    14,99,87,154,226,131,172,163,92,241,155,250,2,158,50,55,
+    23,12,39,228,235,131,21,5,96,110,110,33,28,147,69,188,
+    223,60,33,141,151,140,151,25,155,54,11,100,100,160,193,220,
+    1,177,141,42,107,153,94,67,252,237,235,208,77,133,151,109,
+    133,68,36,1,204,44,18,80,22,174,131,110,25,149,21,208,
+    21,8,121,196,120,56,176,128,221,133,20,127,181,173,132,235,
+    191,180,189,70,85,173,249,60,80,78,225,195,98,0,126,31,
+    152,150,112,193,175,130,94,193,18,148,102,99,55,235,4,60,
+    178,155,54,248,255,18,165,220,99,194,152,126,180,115,25,24,
+    155,160,99,248,122,38,8,79,232,218,147,250,77,20,52,189,
+    103,90,225,81,96,23,45,168,212,22,25,162,97,161,82,163,
+    160,102,242,137,169,104,242,127,167,104,45,19,1,49,131,89,
+    180,195,229,207,142,227,97,192,110,33,22,137,159,92,218,87,
+    47,60,252,179,179,161,104,72,153,157,245,31,135,153,6,194,
+    242,73,127,173,114,28,26,203,39,40,20,206,37,202,220,234,
+    174,129,23,157,59,74,102,202,187,45,115,118,245,199,31,191,
+    185,54,182,190,231,211,83,249,129,99,234,192,177,156,231,120,
+    201,92,87,87,66,78,86,180,149,241,242,185,139,142,239,163,
+    84,154,146,164,152,36,245,224,17,220,134,21,216,217,114,141,
+    162,19,233,61,27,22,163,215,64,188,48,154,100,49,197,228,
+    34,27,9,220,20,225,104,200,69,203,141,24,232,86,206,43,
+    19,223,155,186,116,122,246,236,249,139,83,69,43,89,1,120,
+    20,131,221,2,21,64,37,43,90,64,93,23,138,220,44,24,
+    13,213,206,237,147,167,175,150,155,56,207,92,188,60,241,218,
+    149,114,123,73,140,196,110,137,168,26,202,98,56,88,67,76,
+    218,142,216,149,85,189,89,34,242,232,96,209,170,221,75,189,
+    72,34,150,208,186,188,111,218,181,201,148,201,186,212,177,5,
+    189,223,196,134,89,154,208,182,147,226,188,25,250,193,201,212,
+    201,13,247,182,220,246,227,121,247,9,213,125,34,199,157,120,
+    225,233,76,89,86,236,133,238,126,184,52,23,58,183,193,197,
+    85,232,129,139,202,118,22,218,59,224,214,241,71,214,177,226,
+    76,79,102,71,114,236,96,158,29,84,217,65,248,177,225,237,
+    92,189,246,56,252,40,156,29,249,172,39,239,29,85,189,163,
+    41,39,168,76,37,138,179,31,121,127,30,158,69,31,69,179,
+    111,231,189,7,84,239,1,82,184,209,218,158,190,153,111,237,
+    83,91,251,74,20,237,218,157,13,108,116,109,127,210,149,61,
+    240,193,182,39,219,210,214,146,25,202,200,3,2,94,34,120,
+    69,213,149,53,2,95,127,253,117,163,226,23,92,203,23,220,
+    246,231,220,246,146,169,186,163,250,6,215,186,212,190,67,37,
+    6,110,94,98,201,43,4,47,205,140,171,233,21,5,160,84,
+    15,190,106,162,186,7,62,14,253,166,39,215,121,162,68,153,
+    92,71,8,72,91,54,218,218,87,15,63,62,249,232,228,199,
+    125,31,237,249,251,161,95,14,173,41,235,87,243,125,227,106,
+    223,120,190,237,152,218,118,12,16,104,61,178,225,241,174,158,
+    127,58,255,228,218,47,194,31,134,215,70,214,61,249,29,99,
+    234,142,177,188,231,176,234,57,156,243,28,254,186,196,84,186,
+    148,81,136,253,190,191,125,130,49,127,206,88,38,236,182,207,
+    57,26,160,52,8,197,254,133,42,199,167,116,154,206,106,245,
+    184,207,86,31,10,244,178,41,73,131,172,27,121,7,218,44,
+    155,151,45,130,105,153,73,90,160,196,182,108,77,50,73,235,
+    18,12,180,204,172,176,160,219,87,91,101,245,236,164,198,38,
+    204,73,11,232,67,76,208,98,148,51,88,186,4,242,108,217,
+    180,50,106,208,152,80,215,55,107,28,139,240,54,159,89,218,
+    91,217,222,210,62,44,176,73,71,241,55,78,172,104,213,108,
+    109,178,191,165,62,44,177,200,161,37,177,104,22,66,17,217,
+    86,219,239,100,187,75,168,192,47,245,24,119,186,238,216,45,
+    225,110,191,67,56,73,161,179,155,236,226,86,55,40,245,61,
+    176,217,24,123,15,1,247,95,75,77,166,7,10,109,158,212,
+    100,161,99,27,238,19,13,164,205,133,22,79,198,252,158,51,
+    109,73,91,10,92,203,202,165,47,56,254,57,199,103,251,215,
+    152,181,91,235,74,174,247,120,158,59,161,114,120,96,10,156,
+    59,45,220,159,78,157,77,157,45,244,244,146,99,146,35,95,
+    141,9,153,129,151,0,27,41,187,10,22,170,10,164,126,241,
+    238,1,133,126,102,194,229,91,54,39,233,108,35,250,27,84,
+    31,88,194,11,100,81,45,160,150,233,250,76,50,138,78,17,
+    86,172,181,223,65,83,189,186,32,129,82,28,109,86,236,250,
+    182,6,238,79,195,38,49,103,117,38,160,174,174,37,105,13,
+    154,54,169,28,175,129,50,103,109,88,223,108,172,171,232,148,
+    62,216,126,85,37,39,101,10,210,130,233,30,110,201,42,110,
+    70,197,79,48,63,49,131,250,230,169,245,112,195,89,249,149,
+    213,41,81,117,35,84,107,40,221,181,242,159,131,34,255,212,
+    64,153,101,86,217,174,107,201,10,76,253,115,80,133,237,202,
+    78,221,216,45,213,186,182,164,221,168,246,10,228,243,151,42,
+    195,74,187,174,223,170,98,152,100,255,41,230,106,80,23,55,
+    225,9,135,213,58,253,9,85,167,78,224,18,16,117,2,249,
+    195,251,116,89,161,24,126,7,54,217,50,112,23,228,41,96,
+    149,232,213,9,195,166,72,154,239,51,91,112,20,58,100,64,
+    66,160,158,88,64,225,248,14,32,66,251,44,53,62,32,157,
+    66,48,1,0,21,17,84,21,138,230,107,162,226,179,74,3,
+    248,160,190,94,145,158,37,85,101,220,135,132,95,220,213,24,
+    198,30,0,75,223,49,50,12,226,233,153,45,59,85,26,232,
+    35,15,177,171,25,0,95,163,66,194,118,54,213,192,203,38,
+    170,125,95,122,50,51,144,245,174,181,150,156,212,246,222,141,
+    237,189,217,129,15,222,126,242,118,97,71,127,129,31,252,123,
+    238,151,220,218,213,245,131,121,126,76,229,199,74,118,6,229,
+    14,2,115,93,63,132,79,248,204,69,91,217,127,89,116,212,
+    116,17,194,25,151,44,126,37,18,47,210,183,65,145,97,0,
+    221,136,92,116,132,100,84,39,3,232,37,50,135,162,74,145,
+    33,126,194,162,25,154,105,236,21,249,99,177,233,236,229,55,
+    46,157,190,58,251,253,169,55,174,156,191,60,77,120,174,198,
+    130,247,35,32,10,199,48,130,239,32,56,136,224,16,182,179,
+    160,119,173,104,211,212,84,209,231,208,184,244,153,202,50,16,
+    172,8,221,139,12,49,247,53,242,31,167,136,231,38,18,39,
+    42,139,116,12,73,231,32,171,48,87,167,169,184,234,168,190,
+    180,237,155,214,228,167,216,73,130,38,244,47,184,61,41,91,
+    161,103,199,47,142,126,120,244,131,99,79,64,172,154,236,123,
+    9,208,248,248,70,119,127,246,205,207,174,252,102,96,237,98,
+    190,251,168,218,125,52,231,185,152,62,147,62,243,7,243,111,
+    167,126,231,248,7,199,179,229,212,84,129,107,123,56,253,96,
+    58,51,153,29,200,156,200,115,62,149,243,229,200,183,192,114,
+    95,176,93,207,217,174,204,158,60,219,167,178,125,57,182,239,
+    43,43,213,185,187,208,189,67,237,222,91,50,213,173,153,6,
+    154,168,225,67,159,70,74,205,184,25,176,224,21,41,181,113,
+    110,7,232,55,110,71,202,250,85,55,5,82,255,240,227,227,
+    143,142,103,45,31,217,63,187,153,219,119,74,251,230,219,190,
+    171,182,125,55,197,110,184,90,211,131,153,137,188,139,87,93,
+    60,200,30,123,111,246,244,6,8,156,243,233,96,38,144,231,
+    120,149,227,115,28,15,170,144,189,151,60,37,224,37,130,87,
+    84,93,89,35,160,169,66,155,138,81,125,115,164,143,60,125,
+    227,201,15,126,241,206,135,239,172,245,127,234,251,205,219,249,
+    237,167,213,237,167,243,236,25,149,61,147,171,124,137,34,242,
+    185,215,59,113,196,252,249,17,203,196,113,219,231,167,104,128,
+    211,18,50,239,58,89,134,140,130,200,178,127,212,92,46,58,
+    133,226,110,103,114,43,165,130,78,154,226,155,216,0,112,65,
+    189,219,145,174,103,40,6,151,100,245,119,125,173,178,3,115,
+    68,177,213,106,11,166,111,234,23,36,129,249,47,235,251,231,
+    212,83,139,209,113,164,151,163,130,225,41,200,116,93,95,32,
+    185,31,19,246,9,146,123,217,186,108,179,35,21,44,53,11,
+    108,153,141,246,238,162,20,157,19,162,159,146,60,64,19,253,
+    76,64,137,3,124,173,79,205,70,60,110,83,154,60,73,50,
+    210,116,221,108,88,3,91,182,149,41,52,80,215,175,141,244,
+    203,126,83,75,120,110,79,218,128,6,214,77,206,51,243,22,
+    178,159,221,164,39,252,13,212,181,253,133,117,51,122,237,96,
+    139,86,155,181,139,250,149,172,182,55,80,65,167,99,220,36,
+    45,36,111,114,11,7,144,209,145,45,208,87,200,191,207,17,
+    152,213,59,88,202,174,3,18,41,218,236,96,128,194,113,254,
+    82,32,46,107,33,145,114,176,3,109,107,205,97,90,241,160,
+    72,240,91,46,135,1,248,88,176,161,123,65,171,139,113,30,
+    18,194,66,151,41,241,23,144,80,8,137,87,96,183,101,109,
+    120,136,132,176,176,184,97,95,164,42,49,238,101,18,161,169,
+    122,98,55,79,161,162,202,142,243,175,139,210,254,242,12,42,
+    133,56,11,73,92,136,73,24,167,210,144,208,68,43,127,25,
+    99,41,91,120,73,120,62,33,139,2,9,199,213,185,128,107,
+    174,145,233,37,246,13,152,223,117,64,109,201,91,155,83,197,
+    121,133,229,69,90,88,234,192,74,33,153,143,132,100,18,95,
+    44,99,183,231,207,244,158,37,118,162,124,179,100,221,163,117,
+    228,46,251,170,135,120,241,78,92,92,64,103,151,207,169,137,
+    199,31,32,248,23,8,124,8,180,152,196,107,226,34,241,32,
+    160,225,175,192,34,107,130,118,136,170,184,19,24,226,105,242,
+    217,141,210,18,157,125,70,109,230,187,8,136,65,142,59,176,
+    74,7,77,64,50,68,2,46,121,12,130,145,148,254,27,108,
+    243,31,52,35,158,167,64,82,156,200,57,249,2,26,183,59,
+    158,115,59,50,114,246,123,217,233,117,83,158,59,164,114,135,
+    114,220,161,63,58,155,82,242,253,35,43,71,222,151,51,35,
+    79,78,228,59,124,106,135,239,185,211,151,115,250,192,240,47,
+    153,232,214,193,167,135,50,242,7,71,158,28,65,43,117,144,
+    128,141,54,111,90,89,93,206,183,13,168,109,3,32,123,202,
+    197,47,205,230,54,144,113,0,192,124,6,115,216,65,185,59,
+    210,242,123,221,171,221,96,86,249,246,127,186,189,68,185,236,
+    3,4,228,185,1,148,200,25,111,214,3,246,182,107,146,46,
+    116,246,100,38,159,216,211,76,154,249,122,163,173,7,173,172,
+    73,90,15,55,188,124,174,247,204,179,17,0,218,55,239,157,
+    80,189,19,185,150,9,244,3,76,210,32,203,94,52,123,64,
+    238,186,6,16,189,196,123,227,171,227,89,207,243,182,129,92,
+    27,10,126,152,73,215,190,236,8,244,213,181,143,128,207,228,
+    245,209,79,150,62,93,170,149,20,250,7,161,171,242,13,204,
+    165,199,11,115,233,241,194,92,218,189,37,150,106,237,120,236,
+    122,228,202,136,249,150,126,181,165,63,71,190,47,90,188,13,
+    10,89,110,197,81,214,21,118,231,217,94,149,237,205,177,189,
+    27,64,104,101,101,233,254,169,149,83,25,225,73,236,185,115,
+    127,206,185,31,214,229,225,133,7,23,238,95,92,185,152,34,
+    159,146,153,226,252,240,64,70,205,253,247,29,236,25,222,244,
+    123,126,199,153,147,204,38,39,30,17,166,255,105,147,48,149,
+    77,200,116,234,76,190,45,5,213,50,173,103,131,32,254,244,
+    172,30,12,205,37,134,180,174,26,140,120,95,223,131,193,48,
+    50,41,206,90,15,91,143,11,34,206,85,241,56,16,175,129,
+    89,160,147,244,79,205,168,31,174,52,213,251,40,244,158,112,
+    189,73,168,99,249,58,209,90,55,122,181,134,222,56,50,88,
+    20,150,77,166,27,83,23,229,48,88,43,91,24,84,204,166,
+    72,3,230,137,208,127,177,81,247,79,49,199,45,13,185,255,
+    215,28,235,246,0,147,164,175,209,223,20,55,248,255,163,0,
+    238,205,198,52,32,162,210,186,180,135,176,50,146,25,130,25,
+    20,213,8,1,241,118,7,228,74,136,192,63,45,189,5,29,
+    254,9,167,95,52,5,230,139,244,121,95,147,198,105,9,83,
+    38,252,152,33,145,97,98,211,20,237,34,72,67,81,10,0,
+    155,36,86,140,193,188,25,67,128,177,223,162,85,137,5,67,
+    97,81,58,12,55,96,64,30,37,29,69,137,191,151,33,67,
+    131,133,21,21,196,59,26,251,38,38,76,213,144,44,123,158,
+    126,4,96,19,111,38,172,255,63,99,245,127,175,241,102,43,
+    213,226,89,65,238,99,111,43,112,238,212,89,176,37,90,61,
+    233,201,213,11,239,53,175,54,167,152,141,150,246,244,194,211,
+    209,108,107,246,205,191,237,90,187,170,238,63,145,239,61,145,
+    239,57,169,246,156,204,183,156,82,91,78,65,149,238,93,217,
+    201,143,46,228,187,135,213,238,97,236,104,55,1,247,47,164,
+    166,210,135,10,125,3,112,25,72,15,101,218,211,67,121,110,
+    103,142,219,89,113,206,186,90,223,239,91,221,243,120,232,209,
+    80,70,121,178,248,153,47,239,30,81,221,35,235,66,222,117,
+    76,117,161,47,210,62,244,236,221,13,174,59,51,154,231,122,
+    85,174,247,11,110,240,57,55,184,214,154,231,246,169,220,190,
+    28,183,15,173,141,33,82,143,0,180,54,134,94,81,117,101,
+    141,64,217,218,48,22,27,241,217,151,119,143,169,238,177,103,
+    150,188,235,132,234,58,129,117,198,127,219,10,248,0,53,218,
+    178,137,236,181,124,143,95,237,241,231,185,97,149,27,254,130,
+    27,123,206,141,173,191,155,231,142,170,220,209,28,119,20,113,
+    27,39,109,8,64,220,198,95,81,117,101,91,130,50,130,91,
+    87,144,251,97,1,127,191,103,215,132,215,252,185,215,50,209,
+    109,251,124,59,13,240,31,186,14,78,117,154,255,208,105,153,
+    218,102,251,195,78,26,96,29,183,198,253,79,184,181,159,210,
+    184,117,182,209,17,218,172,64,82,87,168,79,232,105,31,77,
+    54,212,39,52,217,139,90,118,67,89,11,32,129,170,77,59,
+    141,148,110,96,93,116,204,128,85,204,114,15,29,15,28,247,
+    185,21,46,69,62,154,63,193,36,33,199,56,43,221,208,110,
+    144,237,76,251,218,48,74,128,218,230,236,108,209,49,59,27,
+    137,9,137,48,254,230,102,103,223,77,4,194,229,39,182,217,
+    89,33,182,0,63,204,178,34,73,151,17,23,203,124,44,22,
+    150,48,46,35,33,59,145,80,69,38,46,6,201,74,80,37,
+    225,21,77,107,66,33,35,161,76,145,126,92,57,45,82,24,
+    193,20,2,196,77,59,70,93,21,128,3,200,123,201,169,169,
+    124,64,103,96,88,16,204,0,28,187,24,208,76,0,100,174,
+    144,203,218,2,185,252,214,66,46,70,112,129,182,51,125,217,
+    201,181,246,53,121,125,234,217,174,103,242,179,193,127,119,57,
+    55,60,161,250,38,213,254,169,18,5,79,141,192,219,193,76,
+    208,217,142,181,182,53,113,173,91,237,5,21,2,11,126,107,
+    211,174,13,224,17,234,224,88,201,182,143,233,42,81,0,94,
+    184,60,233,43,153,129,244,12,218,239,12,150,90,169,182,158,
+    204,225,236,161,53,75,246,168,218,179,95,117,251,181,218,44,
+    229,104,42,217,43,237,116,96,134,110,97,96,3,214,131,126,
+    154,105,135,77,217,24,104,100,68,226,213,101,162,84,204,175,
+    47,127,73,109,202,68,49,137,150,160,73,48,223,179,204,48,
+    130,69,180,194,111,6,126,219,68,86,192,60,20,75,93,182,
+    137,245,158,165,126,183,206,56,4,155,104,129,154,152,107,194,
+    66,59,78,187,23,236,112,143,185,41,46,193,41,54,25,51,
+    76,176,190,104,49,100,184,88,4,14,234,183,8,46,144,7,
+    77,197,230,202,230,62,173,105,242,129,159,85,108,169,55,196,
+    128,32,111,153,66,66,108,13,100,228,68,219,23,35,49,105,
+    113,127,4,163,183,2,230,180,241,96,56,73,139,36,90,75,
+    250,42,155,1,152,206,69,210,181,100,45,165,81,43,222,35,
+    87,82,86,130,82,44,162,75,85,43,155,62,126,63,143,137,
+    72,251,73,217,248,120,205,30,34,213,35,163,126,48,6,252,
+    229,220,35,127,21,219,80,36,30,147,20,222,48,189,90,227,
+    138,229,114,194,88,101,176,47,50,10,226,113,184,218,95,159,
+    175,54,34,24,72,229,236,68,45,195,50,84,77,154,244,7,
+    65,108,13,246,205,199,2,146,224,143,75,177,5,81,150,99,
+    146,127,175,63,20,95,232,243,249,137,215,112,208,55,94,103,
+    129,197,165,80,84,25,212,119,232,143,136,129,232,160,79,27,
+    145,200,207,186,104,147,181,194,233,254,183,153,228,205,194,238,
+    10,83,24,99,210,103,205,232,245,13,125,0,66,151,209,208,
+    48,83,44,73,235,157,30,223,164,163,128,134,99,222,34,199,
+    198,224,8,88,182,124,59,247,123,210,34,232,246,170,82,117,
+    236,87,29,74,157,74,91,173,12,116,232,186,250,63,167,158,
+    110,206,40,130,83,82,171,1,116,170,206,17,206,31,142,103,
+    221,58,191,5,106,215,28,249,223,142,146,157,181,59,131,14,
+    207,108,209,147,142,158,186,158,12,122,159,212,153,52,53,206,
+    214,73,50,130,237,83,214,48,150,53,218,1,245,155,27,213,
+    135,189,211,160,254,183,156,37,95,187,51,244,100,251,86,179,
+    180,213,207,82,176,47,161,245,194,18,75,165,26,132,17,232,
+    101,123,210,154,117,55,234,97,83,112,110,116,217,145,180,39,
+    29,160,193,87,215,27,173,43,140,73,46,59,147,206,36,123,
+    147,204,73,50,193,94,220,153,212,133,122,178,186,253,165,195,
+    16,250,218,28,110,75,58,151,237,43,99,73,187,212,13,84,
+    246,52,108,103,19,28,130,51,105,15,210,159,114,191,130,17,
+    127,93,165,100,212,251,13,43,227,48,174,12,208,161,26,152,
+    34,129,34,87,57,170,123,1,39,182,235,205,168,156,136,35,
+    191,171,230,23,3,7,36,12,172,146,147,205,75,175,65,205,
+    77,169,168,36,180,196,83,200,76,66,24,88,114,26,51,85,
+    146,244,191,54,173,112,24,16,210,28,40,68,135,64,45,205,
+    144,108,34,132,22,202,201,38,67,6,126,218,40,219,164,90,
+    251,127,97,79,104,64,96,112,199,212,229,168,129,194,158,253,
+    169,179,233,177,149,233,204,217,146,185,238,137,38,123,73,92,
+    198,124,60,49,130,201,48,2,102,171,74,115,90,81,240,72,
+    145,150,124,102,105,145,66,189,9,84,44,45,58,226,243,130,
+    157,145,136,196,23,53,179,164,102,165,212,226,47,24,122,145,
+    70,16,188,65,85,60,79,181,136,13,90,44,69,219,53,81,
+    33,65,113,22,165,15,10,192,34,179,36,74,49,153,152,56,
+    160,185,105,249,81,104,230,96,8,75,75,36,177,130,128,4,
+    225,88,100,102,81,108,250,56,205,63,133,104,20,77,209,56,
+    49,114,180,216,141,83,107,173,133,111,136,75,203,142,45,180,
+    12,20,123,224,86,32,20,14,204,227,144,176,182,146,82,180,
+    16,179,201,140,41,160,28,165,115,98,85,45,37,212,23,151,
+    58,183,90,144,255,142,196,247,153,52,29,182,59,87,249,150,
+    19,80,54,244,102,195,199,111,231,221,7,84,247,129,188,235,
+    160,234,58,136,186,122,223,122,96,163,189,107,245,173,204,187,
+    239,189,179,250,78,234,44,218,5,125,228,1,1,104,23,244,
+    189,162,234,202,26,129,178,73,96,44,126,225,108,77,251,84,
+    231,182,143,155,158,59,253,57,167,127,195,189,173,208,114,126,
+    61,248,236,45,117,236,92,174,229,60,124,95,154,77,232,12,
+    51,161,51,204,228,106,2,237,110,91,95,118,72,237,25,38,
+    25,0,37,83,117,35,29,56,252,204,174,30,56,67,118,209,
+    75,44,121,133,0,243,17,190,98,169,142,174,205,57,51,27,
+    78,215,202,225,135,167,30,156,202,28,203,59,247,168,206,61,
+    160,8,219,15,22,186,122,126,209,243,97,79,246,237,103,76,
+    166,39,223,117,82,237,58,153,186,144,186,240,2,138,59,63,
+    236,204,246,174,141,102,58,243,93,7,212,174,3,169,11,127,
+    244,120,87,207,61,190,248,232,98,214,243,241,98,222,115,64,
+    245,28,72,217,181,194,203,143,46,103,207,231,61,126,213,227,
+    95,239,205,123,14,165,236,133,142,46,64,134,43,180,180,166,
+    152,130,103,199,23,158,129,231,158,129,188,103,143,234,217,131,
+    57,18,157,4,164,38,11,238,142,76,127,214,163,246,30,200,
+    119,31,128,213,72,77,20,154,221,233,183,30,252,36,245,147,
+    2,216,178,12,102,73,92,252,130,219,249,156,219,153,109,7,
+    213,215,149,231,252,42,231,207,113,254,130,167,35,53,149,154,
+    2,10,181,180,3,21,92,123,83,103,30,158,127,112,62,29,
+    202,38,214,15,61,75,60,187,158,58,159,231,206,169,220,185,
+    28,119,238,69,107,219,227,206,71,157,153,222,236,104,186,51,
+    223,234,83,91,125,37,27,101,119,173,56,82,240,145,145,77,
+    254,199,246,211,59,205,191,219,105,57,189,203,246,187,221,52,
+    64,45,24,213,48,203,253,36,97,45,117,57,191,244,61,244,
+    171,232,124,85,223,148,83,138,169,111,75,123,27,164,54,14,
+    146,215,100,124,21,39,119,69,9,171,195,2,49,56,84,97,
+    112,175,1,191,70,219,240,71,118,226,25,195,204,28,211,247,
+    169,199,160,121,172,56,144,163,18,59,141,176,55,96,29,36,
+    172,125,30,193,125,60,35,102,237,112,105,188,206,126,252,154,
+    24,21,239,196,165,147,75,123,55,159,172,176,24,173,227,116,
+    149,186,93,128,152,188,27,218,255,55,248,220,165,114,238,17,
+    248,126,112,46,115,58,163,164,71,180,59,253,183,108,66,130,
+    1,152,136,72,119,17,17,204,159,214,27,167,182,242,88,181,
+    100,51,3,18,29,56,98,47,97,173,127,108,118,107,221,102,
+    149,143,146,112,209,28,18,249,230,17,181,121,36,199,106,131,
+    109,162,28,89,191,189,155,214,79,191,118,198,181,170,216,186,
+    231,170,60,211,136,53,67,94,205,89,106,55,226,76,138,123,
+    16,99,119,25,227,182,244,228,234,165,124,115,159,218,140,129,
+    96,141,231,227,108,234,244,225,170,229,63,72,25,253,180,73,
+    93,82,165,62,193,146,188,253,160,229,50,208,4,71,192,247,
+    104,165,115,189,80,35,117,54,51,207,74,160,101,39,34,235,
+    33,200,22,154,219,86,150,51,87,1,211,236,184,218,236,207,
+    177,126,130,238,146,139,136,27,63,190,178,34,5,22,27,167,
+    141,253,15,186,172,200,155,136,34,175,35,174,126,2,203,245,
+    145,81,179,96,222,42,99,20,211,208,245,10,239,50,35,48,
+    203,214,114,202,153,45,105,77,218,72,202,153,117,5,148,171,
+    101,86,255,74,9,212,152,37,71,195,190,236,208,59,165,65,
+    245,209,20,169,42,6,21,69,234,167,58,213,27,149,170,45,
+    162,143,186,150,73,135,65,77,4,69,108,139,136,162,51,201,
+    144,4,57,195,56,91,69,18,225,24,207,37,89,9,149,170,
+    198,174,92,67,92,115,153,35,170,113,195,72,163,64,111,206,
+    173,90,230,146,92,227,249,213,185,179,57,99,6,87,210,178,
+    180,9,87,226,136,13,84,45,193,55,200,91,66,134,151,192,
+    2,213,87,192,100,204,126,38,59,136,188,225,65,222,176,170,
+    52,157,155,27,68,110,56,228,227,247,105,79,48,167,186,170,
+    2,32,153,167,117,33,47,146,1,200,73,73,170,114,58,119,
+    33,184,139,224,95,81,101,85,7,115,78,72,79,154,230,66,
+    95,45,58,23,98,209,133,128,34,70,209,183,251,19,170,236,
+    1,246,185,106,167,70,186,135,0,153,155,49,190,118,26,251,
+    96,226,160,171,200,82,138,42,179,83,233,26,85,142,201,201,
+    8,234,194,144,218,201,195,174,150,188,198,147,167,17,164,15,
+    207,93,151,230,226,229,40,123,79,77,109,105,109,95,221,158,
+    81,212,214,254,148,21,157,187,193,204,15,86,99,249,150,221,
+    106,203,110,144,171,173,29,25,86,109,237,77,89,11,205,45,
+    41,75,161,173,19,213,12,13,128,32,229,90,210,19,152,194,
+    146,154,124,209,226,134,218,61,59,159,28,71,161,63,78,0,
+    60,153,74,143,20,60,157,171,23,50,137,108,98,77,89,23,
+    212,177,179,249,225,179,249,61,103,115,59,207,170,158,115,169,
+    169,130,167,235,241,165,71,151,178,253,106,223,193,245,201,188,
+    231,168,234,57,138,201,46,173,15,47,62,184,152,105,207,220,
+    90,179,174,123,62,113,229,118,142,170,93,99,106,215,145,170,
+    63,21,190,47,156,45,56,142,175,208,222,241,248,199,143,126,
+    156,157,202,183,239,85,219,247,98,66,227,11,40,250,225,163,
+    31,102,222,205,246,103,66,249,246,65,181,125,48,117,182,208,
+    220,254,240,175,31,252,245,83,57,59,246,193,95,61,249,171,
+    76,116,45,145,223,1,236,124,84,109,30,205,177,163,229,220,
+    235,184,246,54,91,29,219,193,131,72,216,206,71,0,126,70,
+    253,140,174,231,237,247,105,69,87,219,144,174,184,91,207,130,
+    106,108,67,159,120,81,59,232,247,13,201,29,245,119,15,232,
+    20,157,66,63,23,125,143,189,79,221,168,30,43,163,46,64,
+    164,255,163,70,7,165,242,6,147,246,14,128,246,190,39,201,
+    242,135,131,115,45,28,155,223,47,43,139,97,145,47,211,64,
+    123,59,84,119,106,250,228,69,89,17,35,254,133,120,66,115,
+    208,204,205,249,180,152,63,90,37,33,124,207,65,18,175,37,
+    194,96,69,161,244,22,101,52,161,106,29,212,201,74,196,158,
+    152,81,65,0,239,155,202,134,212,254,101,250,190,41,75,53,
+    250,51,38,190,252,219,142,36,125,223,188,85,130,78,125,93,
+    48,198,252,87,202,106,138,169,104,15,38,194,97,50,109,114,
+    100,124,22,93,62,94,6,1,241,104,35,39,231,249,187,229,
+    44,60,76,200,93,26,52,158,45,116,94,53,178,207,166,240,
+    180,161,229,72,178,239,44,45,142,26,120,209,226,41,52,123,
+    191,104,230,159,55,243,89,79,190,121,183,218,188,187,100,131,
+    7,120,154,250,31,239,123,180,47,35,228,221,187,84,247,174,
+    146,185,174,161,166,219,216,164,105,68,231,93,10,141,32,73,
+    196,119,5,8,229,139,182,96,148,76,169,104,87,164,64,84,
+    14,35,219,209,203,105,156,24,145,211,115,115,154,78,97,65,
+    228,107,94,122,253,148,78,32,250,2,162,15,248,127,197,81,
+    156,55,125,237,169,156,119,238,82,157,187,240,236,159,192,156,
+    249,27,31,119,168,189,7,215,15,231,123,143,169,189,199,242,
+    222,227,170,247,120,234,92,201,84,135,180,110,222,157,219,158,
+    184,74,12,252,122,137,183,175,202,15,236,218,188,166,125,173,
+    82,4,209,140,34,136,33,136,87,230,169,185,239,209,219,46,
+    97,86,99,145,141,75,49,96,180,202,162,230,210,127,143,170,
+    248,237,73,210,2,225,167,232,126,146,80,228,73,184,151,140,
+    30,252,68,5,252,23,164,201,255,164,234,61,248,78,244,224,
+    35,232,222,205,56,208,121,15,23,35,120,157,54,49,163,153,
+    54,48,148,152,81,35,96,41,107,83,201,68,51,187,210,74,
+    102,98,117,17,253,222,187,106,224,165,25,30,223,251,33,169,
+    80,178,210,204,48,142,0,151,236,85,114,49,2,107,23,51,
+    150,57,84,162,224,146,61,69,46,70,48,198,1,150,83,217,
+    93,217,219,96,197,109,131,102,112,191,62,249,172,237,89,44,
+    119,244,146,58,50,77,10,182,4,26,85,144,22,190,110,141,
+    226,152,167,161,89,244,196,202,127,130,0,205,23,45,118,105,
+    85,22,241,245,95,141,222,132,252,120,142,181,216,9,161,55,
+    178,53,45,202,66,214,128,56,4,136,147,128,132,50,209,23,
+    32,189,94,93,78,153,42,135,55,181,160,74,98,243,90,253,
+    153,61,174,5,123,78,74,127,71,161,186,130,185,241,0,193,
+    108,166,233,210,88,43,109,41,81,8,118,83,116,243,221,38,
+    252,20,40,231,93,242,41,80,246,187,228,163,251,225,184,75,
+    62,5,170,35,87,255,45,153,236,180,169,68,253,243,2,47,
+    229,110,187,219,244,162,169,7,144,227,188,128,79,83,247,93,
+    231,11,214,149,18,211,87,50,131,217,209,181,246,117,243,90,
+    183,186,107,68,237,30,205,53,141,170,236,216,93,166,100,181,
+    208,238,12,108,45,184,100,223,36,23,35,104,186,108,162,219,
+    75,84,99,248,146,192,87,250,114,193,114,157,166,97,249,27,
+    195,151,4,190,218,226,41,89,153,255,11,156,223,178,58,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/ext/pystats/columnar.py",
+    "m5.ext.pystats.columnar",
+    embedded_module_data,
+    8015,
+    17044);
+
+} // anonymous namespace
+} // namespace gem5
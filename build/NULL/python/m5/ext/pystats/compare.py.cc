@@ -0,0 +1,698 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,124,11,108,27,87,182,216,124,249,255,73,36,245,
+    151,69,75,178,37,90,18,253,137,108,199,242,87,254,199,142,
+    229,108,172,100,55,218,4,18,173,25,217,180,41,82,25,82,
+    177,197,80,187,202,194,219,165,243,212,183,74,170,52,204,70,
+    110,185,11,111,86,105,28,60,45,144,45,242,208,109,155,93,
+    44,218,197,67,91,144,194,60,132,37,42,192,15,197,182,111,
+    139,87,128,126,241,22,129,129,162,61,231,14,57,28,126,100,
+    59,197,171,56,58,115,63,231,254,206,61,247,222,115,206,189,
+    119,254,43,165,249,51,20,222,95,173,211,20,245,62,37,80,
+    99,148,64,11,76,144,30,163,201,155,25,99,200,155,29,99,
+    201,155,27,227,200,155,31,227,225,205,6,117,211,250,49,253,
+    180,97,204,64,99,58,46,104,156,54,141,153,166,205,99,230,
+    105,203,152,101,218,58,102,157,182,141,217,166,237,99,246,105,
+    199,152,3,112,120,65,23,172,155,174,31,171,39,110,125,208,
+    57,237,26,115,77,187,199,220,196,111,8,54,76,55,142,53,
+    130,219,56,214,196,80,103,40,193,116,139,18,204,31,49,20,
+    245,9,83,172,242,88,179,96,17,91,4,171,104,18,91,154,
+    213,134,76,113,130,237,22,55,214,106,164,132,86,193,94,30,
+    39,56,68,155,104,214,134,104,226,172,162,69,116,105,242,209,
+    9,117,183,248,177,54,82,122,61,148,238,172,40,189,93,112,
+    65,110,91,202,114,104,129,210,221,80,122,135,208,64,106,230,
+    16,91,196,45,226,150,41,182,172,126,141,128,225,129,218,53,
+    65,122,251,166,181,217,10,152,205,80,131,78,177,75,104,185,
+    78,202,149,90,24,74,228,175,117,23,177,192,215,249,17,188,
+    63,81,211,125,4,189,247,9,93,244,1,253,152,75,228,223,
+    219,230,159,99,41,202,116,34,60,61,227,151,196,136,39,122,
+    85,244,68,162,254,104,196,19,158,242,68,111,132,61,210,108,
+    40,210,239,17,125,87,124,158,104,216,51,121,85,156,188,14,
+    72,254,168,199,15,30,127,232,138,136,193,36,85,96,122,54,
+    232,143,134,37,147,16,134,140,66,225,104,17,33,0,185,65,
+    222,179,65,120,95,22,231,194,33,193,19,9,79,99,194,160,
+    40,249,67,147,162,207,115,137,20,9,53,240,248,131,129,43,
+    33,81,240,92,158,51,205,248,163,87,251,61,194,236,244,12,
+    248,200,187,223,227,135,196,147,74,101,5,207,141,64,244,170,
+    199,127,57,18,14,206,70,69,18,37,137,80,133,192,27,154,
+    188,35,158,27,87,3,147,87,77,147,254,16,20,238,137,136,
+    81,207,140,40,145,54,250,60,163,80,239,160,95,186,34,70,
+    162,30,1,146,129,139,36,193,138,72,226,76,88,138,138,130,
+    207,100,66,180,64,104,102,22,170,56,237,159,195,108,162,226,
+    205,168,167,119,98,130,144,202,23,189,25,157,152,240,122,194,
+    146,231,220,165,139,35,5,250,77,5,130,34,80,46,60,19,
+    13,132,67,254,96,112,206,116,37,22,152,25,192,202,3,49,
+    34,162,160,52,70,41,202,47,120,194,33,81,105,43,161,109,
+    52,48,13,100,185,24,10,206,149,34,176,71,160,38,83,1,
+    41,18,53,65,191,120,2,17,207,85,49,40,64,221,60,211,
+    226,116,88,154,235,71,39,33,207,36,100,34,73,254,57,168,
+    1,180,63,40,42,93,36,78,34,241,33,105,15,182,36,58,
+    121,53,16,186,98,34,121,67,86,145,40,212,99,26,200,234,
+    191,226,15,132,128,34,129,40,180,221,231,131,12,5,113,224,
+    114,48,60,121,125,104,200,100,242,192,223,148,20,158,246,76,
+    239,245,1,21,124,51,115,10,17,10,189,226,9,76,35,221,
+    148,30,85,216,42,16,9,135,148,116,147,170,223,115,184,18,
+    163,23,250,110,28,186,237,240,110,113,96,31,52,228,74,40,
+    44,137,135,191,219,185,195,119,53,28,137,94,34,85,143,116,
+    190,230,173,200,168,88,238,56,161,119,111,103,56,40,236,84,
+    123,165,179,223,211,25,18,111,104,2,148,228,83,208,85,165,
+    254,86,137,166,100,24,13,207,244,122,135,8,30,254,205,72,
+    129,80,180,183,132,237,53,153,158,3,214,6,118,242,7,35,
+    97,100,134,89,232,76,133,36,72,100,200,105,26,59,54,24,
+    8,137,253,64,114,209,51,49,49,27,13,4,119,22,42,58,
+    160,84,102,102,110,98,194,103,250,35,14,199,17,47,147,227,
+    39,195,179,161,104,206,12,44,50,30,12,135,144,35,189,250,
+    28,243,220,197,156,225,185,40,112,242,229,160,88,112,193,8,
+    203,113,207,7,34,209,156,225,98,129,183,114,134,75,226,235,
+    179,88,185,28,63,58,59,19,20,255,136,67,221,75,231,44,
+    88,38,208,101,252,74,48,124,25,74,49,159,80,120,227,36,
+    116,121,206,20,12,251,133,113,236,253,8,160,218,137,15,249,
+    186,24,20,211,237,64,202,239,152,212,174,7,198,226,122,240,
+    54,133,235,129,72,193,58,64,225,26,0,243,63,3,115,63,
+    43,242,2,39,234,4,94,212,139,6,205,188,165,43,247,79,
+    25,4,61,204,118,70,209,36,24,68,195,20,35,24,111,113,
+    229,51,214,152,89,141,51,85,197,89,32,70,7,49,102,200,
+    195,42,88,96,30,179,230,76,39,213,46,138,13,15,147,65,
+    8,172,31,142,136,158,55,252,193,89,24,212,66,96,106,10,
+    70,254,101,49,122,67,20,67,234,228,134,115,11,140,29,28,
+    33,164,79,131,225,27,48,232,63,230,114,28,210,33,199,225,
+    44,148,227,130,226,84,52,199,75,129,43,87,163,146,11,167,
+    92,55,130,6,4,141,0,38,121,13,141,112,78,102,145,70,
+    71,8,141,226,116,156,26,87,35,227,12,248,212,153,56,206,
+    130,79,93,59,226,28,248,88,149,102,212,37,234,99,122,68,
+    114,98,95,242,57,46,34,6,167,106,149,29,193,178,9,171,
+    62,234,142,72,147,59,103,230,162,87,195,161,157,211,123,119,
+    66,103,238,44,12,207,34,247,1,223,229,12,227,227,129,80,
+    32,58,62,30,115,150,104,230,43,6,190,132,89,226,82,178,
+    64,229,109,148,187,57,193,45,26,179,174,38,124,221,87,94,
+    89,119,11,188,76,9,248,125,133,21,205,233,36,49,58,43,
+    133,38,213,102,193,31,87,36,66,72,33,2,117,77,141,122,
+    75,15,62,21,119,193,18,229,74,201,174,169,205,191,68,69,
+    141,165,112,109,122,109,234,152,169,114,113,187,68,73,205,132,
+    98,37,10,229,184,105,236,68,54,16,154,202,177,176,94,124,
+    76,75,45,216,74,76,227,145,90,17,195,0,193,227,200,33,
+    101,52,41,6,94,70,236,157,132,38,247,205,246,197,3,105,
+    115,91,138,187,107,74,123,246,108,56,27,151,159,77,92,220,
+    176,215,47,13,46,31,72,70,87,98,25,167,55,99,223,33,
+    219,119,164,13,59,164,118,228,13,45,89,116,69,178,252,125,
+    21,89,230,233,40,91,66,188,86,226,10,186,188,129,17,87,
+    25,30,187,25,158,100,137,50,26,60,149,200,64,88,115,41,
+    60,106,45,35,178,190,232,46,207,171,2,203,80,27,171,92,
+    18,154,103,226,140,196,3,247,51,49,40,47,4,242,34,140,
+    83,102,228,191,23,227,189,70,9,217,76,242,0,200,241,129,
+    8,246,14,188,66,254,144,180,21,131,216,105,255,77,169,147,
+    210,178,186,151,37,29,7,67,19,58,37,199,71,38,253,48,
+    231,35,1,128,249,11,253,136,171,72,85,63,22,3,175,34,
+    249,68,138,244,163,221,185,56,159,224,54,160,59,135,150,132,
+    140,185,85,54,183,230,41,218,216,118,7,250,112,181,59,211,
+    177,83,238,216,73,2,138,93,236,112,190,119,34,201,173,24,
+    223,25,89,30,249,249,137,85,238,158,233,167,23,239,94,204,
+    56,6,101,199,96,130,207,118,116,167,237,3,137,232,146,120,
+    59,158,136,175,118,165,13,3,213,189,143,12,77,122,255,44,
+    69,164,105,90,219,255,31,130,68,166,101,237,15,25,1,102,
+    135,18,31,64,60,204,15,165,254,6,63,127,199,8,52,213,
+    141,196,28,165,198,246,226,180,117,56,166,239,247,224,204,69,
+    28,56,121,29,142,25,250,61,100,254,58,252,136,246,146,73,
+    69,234,162,42,6,193,248,56,72,61,82,213,196,160,4,206,
+    32,246,121,66,188,60,71,91,247,2,179,207,1,129,172,123,
+    9,88,115,125,214,92,242,193,132,177,252,92,158,85,189,61,
+    125,119,99,37,175,2,88,214,104,34,36,26,241,218,176,232,
+    16,8,31,227,227,57,211,248,248,116,88,152,13,162,219,50,
+    62,254,250,172,63,88,136,209,143,143,11,225,73,112,24,199,
+    199,35,193,112,52,2,78,24,211,209,28,11,162,139,100,36,
+    108,52,5,203,88,84,106,35,173,153,145,194,32,234,69,231,
+    20,54,235,71,128,99,248,99,138,148,74,154,44,213,23,193,
+    11,216,186,191,34,173,43,254,178,220,249,52,119,254,190,99,
+    247,194,115,121,206,204,183,222,183,213,229,121,120,231,117,148,
+    189,62,175,71,151,129,178,55,46,205,46,134,243,70,244,153,
+    40,71,83,146,95,252,126,222,140,62,170,28,180,80,58,91,
+    158,97,249,190,228,182,60,5,175,18,120,192,66,212,173,239,
+    144,72,200,3,209,120,222,135,104,240,42,1,21,13,3,108,
+    28,111,74,118,229,41,120,109,10,148,102,146,22,146,21,99,
+    75,37,59,170,115,116,148,82,38,163,20,85,235,79,168,156,
+    88,220,155,76,84,192,192,229,83,0,76,53,154,133,49,94,
+    53,83,123,217,216,193,139,51,34,44,194,126,79,239,76,56,
+    18,9,92,6,129,183,66,78,246,106,4,106,20,213,136,236,
+    13,44,34,250,98,172,239,74,44,199,72,81,47,155,51,136,
+    32,30,162,66,144,227,48,125,142,131,190,15,121,105,210,114,
+    45,143,155,48,124,156,228,40,29,133,128,27,24,63,72,250,
+    253,190,222,252,163,249,31,204,47,189,148,209,183,202,122,156,
+    13,248,109,27,48,77,204,37,93,201,104,198,222,45,219,187,
+    211,134,110,152,49,150,184,219,67,139,67,105,206,77,40,156,
+    51,145,220,136,0,154,227,113,208,69,38,53,19,111,137,202,
+    2,84,227,71,212,143,184,247,169,219,79,73,233,183,185,219,
+    92,138,174,133,89,46,16,73,222,127,232,28,215,188,183,57,
+    129,121,131,146,122,81,209,77,112,9,10,196,45,246,150,65,
+    224,42,39,121,109,15,51,32,222,148,231,3,139,82,5,71,
+    8,124,84,87,74,17,53,148,220,26,241,144,41,148,168,187,
+    101,153,103,181,203,21,148,192,62,169,4,175,62,118,157,136,
+    239,175,4,64,59,82,116,90,34,211,34,247,248,21,254,169,
+    214,213,64,211,20,163,226,100,20,84,34,69,205,10,75,32,
+    53,148,212,157,0,193,3,213,11,213,90,9,132,104,81,242,
+    145,88,201,2,165,198,152,55,191,91,38,40,23,169,242,213,
+    46,0,239,49,37,81,25,218,5,75,225,45,3,8,204,122,
+    16,151,57,16,151,249,41,46,65,67,40,127,203,58,166,19,
+    116,208,2,195,163,78,34,143,43,156,69,42,239,59,4,26,
+    24,168,28,71,124,227,47,138,55,64,91,16,202,198,50,182,
+    31,39,245,175,112,177,124,143,6,30,43,19,59,5,85,46,
+    162,115,122,24,1,2,52,211,203,40,171,41,79,154,21,193,
+    28,60,11,202,180,136,19,104,172,239,201,85,80,165,198,127,
+    12,9,34,54,0,95,195,188,217,209,189,196,45,91,150,224,
+    71,6,200,31,255,15,252,129,252,26,136,137,202,28,84,57,
+    58,72,189,95,44,212,91,187,36,10,244,36,51,207,148,139,
+    207,183,217,218,252,91,41,254,196,20,94,96,70,114,0,164,
+    211,216,80,14,21,109,47,71,90,45,61,135,0,131,165,99,
+    88,119,172,7,116,102,161,253,207,99,6,61,79,209,126,204,
+    113,9,211,239,40,180,189,183,255,158,101,237,114,218,177,109,
+    73,159,116,173,180,101,27,183,164,90,126,209,241,179,142,53,
+    87,102,235,62,121,235,190,76,227,190,180,99,95,97,221,163,
+    37,20,4,188,122,9,153,68,218,141,96,79,145,252,210,94,
+    4,251,138,181,249,152,145,206,168,149,69,2,46,44,20,23,
+    237,66,93,164,147,224,93,196,232,113,165,46,197,95,158,161,
+    173,219,112,205,173,2,58,198,186,63,79,1,72,57,201,107,
+    117,146,188,158,2,40,107,203,8,85,92,86,180,61,129,147,
+    221,51,216,165,35,132,245,207,83,52,133,83,222,109,58,85,
+    171,223,42,38,30,236,182,151,169,247,105,26,240,79,1,219,
+    190,201,130,143,249,71,28,93,198,194,6,164,59,106,216,210,
+    133,74,122,216,113,17,24,39,44,61,142,24,49,239,230,221,
+    88,129,250,79,49,175,227,72,188,191,165,254,22,5,0,155,
+    115,233,218,151,13,222,245,6,111,166,161,79,110,232,203,216,
+    250,210,134,194,147,117,182,167,13,155,62,132,62,94,29,233,
+    186,156,62,16,137,128,218,45,74,118,164,151,94,237,87,7,
+    69,244,20,236,82,105,88,165,231,183,16,96,95,19,197,110,
+    2,152,242,152,210,50,71,101,67,164,75,16,252,61,196,252,
+    59,172,52,116,121,222,65,89,27,127,124,241,237,139,201,225,
+    140,101,139,108,217,178,112,42,107,178,255,120,224,237,129,219,
+    59,23,81,156,229,187,178,142,150,247,237,239,218,83,116,198,
+    209,41,59,58,19,124,158,165,204,142,50,20,16,112,12,214,
+    37,110,97,126,97,62,207,233,140,208,227,79,4,15,16,60,
+    84,189,127,114,80,142,150,100,111,178,247,131,29,43,59,82,
+    98,198,222,47,219,251,211,134,254,60,199,240,91,238,124,231,
+    231,147,43,175,1,27,241,91,30,15,254,100,160,44,173,201,
+    163,201,163,153,214,126,185,181,127,85,204,152,7,101,243,96,
+    154,27,84,68,107,45,23,21,21,148,175,254,142,174,54,76,
+    192,143,204,180,2,63,5,243,171,200,11,122,248,55,136,196,
+    40,33,242,48,255,178,53,141,173,70,192,208,26,49,76,162,
+    81,48,139,134,41,139,96,185,197,143,153,4,43,166,23,108,
+    83,140,6,199,46,154,69,11,132,99,174,76,173,92,203,76,
+    190,14,98,192,168,131,92,236,143,79,5,184,245,128,107,19,
+    156,162,93,176,11,174,130,65,217,33,214,9,13,208,150,70,
+    248,47,182,203,46,214,79,153,132,166,42,163,137,19,48,93,
+    128,233,34,233,117,66,51,164,119,67,88,131,214,188,13,241,
+    229,126,5,183,5,112,27,141,148,208,37,180,66,93,219,224,
+    191,29,234,219,160,165,78,69,26,131,176,5,104,212,36,54,
+    147,250,48,66,71,85,125,90,8,173,236,218,85,95,240,160,
+    137,94,108,187,214,174,134,209,194,86,113,75,89,47,40,173,
+    239,132,220,59,4,23,204,240,221,57,123,133,41,49,246,27,
+    178,48,171,70,109,98,230,33,6,161,203,115,69,203,239,141,
+    112,209,46,52,49,225,159,152,32,182,216,137,137,203,224,34,
+    134,81,79,96,138,228,1,145,151,35,189,126,207,128,231,178,
+    215,115,232,48,68,222,236,69,171,64,52,28,236,247,20,44,
+    150,158,29,197,224,94,191,183,31,13,210,189,151,189,94,239,
+    196,4,184,35,196,72,93,200,10,173,16,190,64,100,50,24,
+    142,136,19,19,7,61,35,254,145,130,29,214,35,250,1,132,
+    65,238,40,10,21,219,161,169,210,1,0,127,68,147,15,209,
+    107,137,101,59,167,47,20,159,211,23,138,207,153,74,198,238,
+    156,78,177,155,230,216,104,120,38,167,143,132,165,232,248,229,
+    185,73,85,171,167,20,193,132,136,163,167,201,64,137,235,4,
+    250,13,90,114,70,53,139,42,232,161,58,208,46,217,59,108,
+    249,146,250,3,154,216,178,74,214,43,70,107,189,18,184,91,
+    32,156,157,172,152,207,203,44,90,60,96,112,53,48,84,219,
+    68,156,7,159,42,80,198,117,224,83,133,69,1,125,250,50,
+    159,161,204,103,44,243,153,202,124,170,8,121,5,203,179,20,
+    125,209,214,82,171,171,106,101,43,186,3,232,179,151,249,28,
+    106,238,122,20,215,252,43,64,6,213,100,60,4,108,231,159,
+    246,20,58,106,136,108,51,8,226,148,127,54,24,45,109,87,
+    148,118,63,76,149,9,11,29,91,158,176,122,107,163,58,97,
+    137,17,134,128,221,122,65,23,1,41,53,212,239,169,228,88,
+    224,77,79,24,20,124,41,32,192,0,64,107,56,112,158,154,
+    89,141,63,69,76,86,204,169,68,195,41,176,45,10,202,104,
+    91,30,136,68,231,130,36,10,11,244,61,46,171,209,226,22,
+    134,186,3,81,76,134,155,16,104,75,175,110,151,194,212,67,
+    158,51,85,69,145,125,42,165,118,184,227,132,91,84,5,67,
+    167,231,248,220,102,213,40,144,180,95,179,211,5,149,66,99,
+    183,167,151,236,116,77,76,104,246,28,38,38,188,181,40,61,
+    163,116,79,104,118,250,178,40,97,30,181,54,146,160,62,215,
+    69,113,166,58,125,97,100,14,121,94,244,135,174,151,37,129,
+    41,10,106,19,144,160,18,157,197,62,239,196,254,146,54,165,
+    42,96,22,217,10,49,21,67,55,177,221,168,73,64,124,252,
+    54,85,176,115,18,196,88,219,9,127,8,73,134,53,169,172,
+    64,207,35,186,167,76,187,192,33,73,164,116,148,49,223,39,
+    131,232,181,246,87,89,52,90,206,51,160,161,105,112,43,229,
+    240,107,218,233,130,157,98,223,97,22,183,92,82,166,54,168,
+    20,46,219,57,227,212,108,48,72,184,193,203,229,24,223,46,
+    208,80,148,222,205,241,132,115,115,60,225,219,162,140,174,104,
+    242,143,76,135,130,129,72,20,187,251,72,172,191,98,5,80,
+    245,146,146,172,87,194,254,29,164,142,28,163,136,33,139,98,
+    219,76,37,240,55,68,108,119,167,248,63,177,148,173,37,217,
+    147,177,118,202,248,128,232,177,246,82,218,114,48,207,150,161,
+    87,27,248,84,58,237,43,209,169,97,158,126,58,250,0,101,
+    26,11,148,145,80,182,1,181,5,109,149,210,20,85,16,113,
+    11,45,151,2,0,190,89,147,127,143,89,116,145,38,167,27,
+    71,148,231,243,51,119,44,169,111,103,154,6,100,124,246,171,
+    225,138,104,143,229,141,120,235,114,166,151,113,149,60,37,73,
+    97,73,250,14,70,188,130,61,102,30,215,172,57,250,241,194,
+    162,195,195,168,24,15,73,175,33,6,79,36,212,156,161,184,
+    89,155,51,22,121,44,154,211,79,131,64,12,3,63,103,45,
+    56,20,113,54,199,65,174,51,18,46,23,57,221,120,88,18,
+    68,41,103,5,193,124,26,84,239,241,73,88,32,69,240,146,
+    93,205,66,32,40,78,68,149,83,235,37,141,33,248,46,130,
+    87,17,96,77,34,250,2,215,20,25,71,81,110,155,54,35,
+    223,93,76,243,31,21,238,216,71,89,156,233,150,61,105,51,
+    62,27,245,109,233,246,211,159,159,1,160,60,153,250,51,114,
+    253,153,180,229,204,253,198,45,9,110,209,146,85,94,121,166,
+    200,31,247,189,207,228,121,120,63,64,207,67,4,9,78,54,
+    52,229,13,84,211,69,26,40,253,197,27,0,50,141,35,114,
+    227,8,73,239,198,237,21,83,33,155,251,238,6,226,107,194,
+    29,24,107,182,25,247,92,108,217,198,38,130,217,190,5,115,
+    106,201,186,16,199,184,209,208,250,206,149,229,43,224,52,131,
+    232,190,197,163,196,181,119,144,119,154,60,138,165,138,71,75,
+    106,196,87,173,133,171,66,193,127,160,208,70,133,234,90,73,
+    11,175,173,111,151,89,246,42,120,186,220,135,27,1,111,213,
+    199,65,10,111,214,164,152,165,36,3,132,105,36,239,75,20,
+    177,141,112,183,12,113,186,82,72,152,103,65,244,96,167,24,
+    109,189,30,87,131,67,24,198,194,210,204,199,142,224,52,93,
+    37,180,121,113,202,38,82,23,46,2,253,104,16,26,193,157,
+    246,192,148,39,16,197,149,72,225,105,193,55,66,134,2,49,
+    242,212,30,234,67,148,98,184,32,131,189,113,158,190,205,164,
+    106,209,171,170,138,48,220,155,10,195,29,52,90,157,194,211,
+    94,150,140,249,28,135,61,165,236,82,41,251,27,11,154,161,
+    223,87,197,187,202,120,168,53,242,255,6,179,216,70,17,131,
+    64,186,110,159,242,172,114,75,221,239,247,189,219,151,20,50,
+    245,93,114,125,151,26,161,168,173,172,244,6,214,129,189,34,
+    70,115,76,64,181,152,220,196,64,157,82,20,238,249,145,19,
+    29,56,39,79,20,135,22,76,5,74,116,172,113,147,42,102,
+    177,58,81,165,58,121,19,85,223,32,215,117,125,89,215,179,
+    94,215,243,41,179,186,247,99,227,61,99,166,110,143,92,183,
+    39,161,203,154,235,210,230,246,212,246,213,186,187,222,213,217,
+    116,231,32,60,89,103,115,114,235,242,129,180,165,237,126,177,
+    198,240,172,241,0,50,117,251,228,186,125,144,204,235,91,211,
+    173,218,9,235,223,217,147,20,63,56,176,114,32,99,216,150,
+    181,187,19,86,101,102,139,83,53,76,80,132,249,127,6,224,
+    71,208,147,218,233,154,24,230,104,96,73,205,68,93,201,156,
+    21,230,113,6,45,21,218,157,155,147,192,23,100,177,132,165,
+    114,158,67,35,233,237,74,147,186,46,206,198,185,41,102,146,
+    161,33,237,98,147,118,159,39,174,217,187,155,98,136,73,171,
+    202,138,79,204,45,62,194,136,138,185,5,88,209,62,79,67,
+    81,192,142,229,69,41,198,149,69,135,106,78,81,56,176,192,
+    119,60,89,134,9,141,202,24,239,145,241,16,76,221,226,205,
+    25,233,72,204,91,187,111,53,220,87,68,253,111,152,77,31,
+    165,26,84,210,182,189,240,36,103,19,240,91,26,189,253,230,
+    226,155,74,136,246,81,88,144,207,177,254,208,156,52,141,245,
+    11,82,218,57,222,203,43,220,136,85,148,110,33,184,130,128,
+    108,237,145,157,112,149,27,165,55,113,176,52,212,174,237,31,
+    16,63,174,48,226,134,217,166,173,193,42,119,207,2,175,140,
+    109,175,12,208,188,87,54,227,142,149,177,41,235,108,92,26,
+    204,118,245,200,93,207,228,41,198,216,77,64,198,210,145,56,
+    181,180,55,9,28,230,42,54,10,141,107,221,217,198,182,164,
+    184,20,79,59,186,148,7,183,191,186,113,215,49,158,28,93,
+    121,53,109,247,166,13,222,194,254,65,73,250,26,169,205,152,
+    255,70,81,213,168,155,180,214,54,26,179,34,35,107,108,163,
+    26,22,21,152,235,116,109,102,20,216,194,161,49,123,156,214,
+    110,30,107,153,108,158,9,217,180,33,90,76,140,213,90,228,
+    137,218,199,60,126,72,224,10,240,116,27,205,102,40,107,138,
+    5,137,178,174,12,219,88,27,91,219,226,235,4,74,109,81,
+    119,41,229,53,179,6,83,205,35,206,150,239,24,40,166,69,
+    60,138,81,194,209,174,85,215,185,26,57,171,42,228,147,115,
+    198,127,47,63,66,150,16,101,49,65,81,188,246,24,70,1,
+    70,29,193,219,203,37,71,141,36,93,189,213,175,201,172,212,
+    215,33,80,216,11,227,189,167,100,62,101,201,150,187,212,139,
+    0,119,218,11,114,102,142,190,94,38,101,254,16,64,108,71,
+    213,232,145,64,43,146,132,26,131,253,127,1,126,4,141,214,
+    133,177,238,60,14,207,231,117,63,231,238,154,86,119,255,212,
+    122,215,154,118,13,190,119,114,249,236,210,217,181,221,74,164,
+    246,81,134,189,85,122,29,139,198,51,35,68,120,83,118,109,
+    113,255,22,132,75,60,217,4,11,163,120,51,42,205,98,8,
+    27,20,67,82,148,196,93,21,253,51,175,231,12,248,154,153,
+    141,92,205,153,209,37,137,51,65,255,164,88,92,190,126,68,
+    210,92,23,231,114,60,8,161,210,92,185,58,1,75,151,210,
+    178,26,75,151,18,241,63,177,125,120,96,107,129,202,26,44,
+    9,219,162,45,185,53,99,104,69,71,22,79,17,36,235,222,
+    62,154,56,154,181,212,39,78,163,255,80,114,104,221,188,45,
+    109,222,150,117,182,203,206,237,171,38,185,247,96,186,254,80,
+    226,68,226,196,253,138,144,63,216,156,5,106,77,2,200,56,
+    143,203,0,109,199,101,219,241,4,155,173,115,189,23,77,158,
+    92,57,159,105,236,149,27,123,211,13,189,171,59,210,142,189,
+    9,30,38,173,68,116,113,238,246,145,197,35,16,125,110,221,
+    188,61,109,222,190,97,169,91,28,73,14,174,28,72,137,25,
+    75,191,108,233,79,23,159,172,181,126,105,116,249,149,228,235,
+    203,175,174,91,183,166,173,91,1,85,182,180,39,133,149,192,
+    170,59,99,217,41,91,118,166,139,79,30,180,159,78,64,81,
+    214,203,210,33,39,205,57,29,10,71,22,153,155,94,46,204,
+    77,113,186,48,175,48,120,208,99,19,190,165,170,142,178,60,
+    29,127,123,159,46,191,176,243,233,242,179,84,237,76,199,233,
+    234,147,68,243,92,156,139,106,76,103,168,191,106,253,143,219,
+    219,126,172,116,92,54,71,196,248,202,16,101,190,33,11,253,
+    105,96,94,15,85,28,172,228,48,140,151,42,63,220,164,209,
+    126,112,15,170,116,26,172,184,61,164,152,3,34,53,52,158,
+    66,204,255,198,100,63,161,136,198,99,160,44,142,165,189,111,
+    31,78,28,206,58,155,150,246,86,29,143,57,70,147,243,49,
+    219,50,29,187,228,142,93,74,200,70,83,219,138,41,53,152,
+    105,234,149,155,122,211,77,71,62,29,189,55,246,57,159,25,
+    56,34,15,28,73,59,143,166,45,71,201,241,168,228,182,119,
+    14,101,236,30,217,14,250,73,214,238,124,111,50,217,147,218,
+    255,233,165,95,57,215,70,127,217,252,89,243,191,62,241,5,
+    255,151,231,126,125,46,51,112,70,30,56,147,233,58,147,105,
+    56,43,55,156,93,183,159,77,27,206,42,154,182,230,212,1,
+    177,247,19,254,187,175,171,58,72,197,126,147,149,18,122,153,
+    46,205,152,243,188,118,173,155,215,105,207,160,105,87,61,192,
+    82,13,147,143,213,125,244,113,42,165,53,191,150,114,96,54,
+    203,97,222,80,182,250,105,240,192,93,58,109,97,248,8,234,
+    249,137,90,87,16,50,87,136,144,105,156,55,205,155,227,230,
+    5,122,209,200,160,9,213,88,145,187,37,110,89,216,71,40,
+    84,90,237,138,20,42,173,100,84,74,53,160,106,255,162,141,
+    154,154,177,113,163,192,196,77,31,1,191,126,162,206,13,149,
+    71,205,23,159,23,232,184,62,110,33,26,25,150,170,174,156,
+    106,169,106,8,131,71,32,249,184,69,163,39,154,174,48,113,
+    243,207,232,23,169,63,167,164,190,167,173,85,101,30,79,168,
+    225,157,77,251,104,211,94,158,183,106,77,199,155,227,65,175,
+    188,240,42,131,84,159,55,34,21,74,181,138,156,136,91,181,
+    254,183,14,254,67,245,73,121,235,5,230,9,173,255,22,212,
+    94,53,117,167,84,51,183,246,175,194,52,206,124,51,252,152,
+    30,233,176,68,191,246,19,160,129,17,198,158,106,60,127,131,
+    150,218,161,85,117,181,242,168,228,91,109,186,184,241,80,85,
+    72,169,197,5,238,63,80,214,174,250,218,101,8,21,18,219,
+    188,173,172,117,79,155,202,30,237,41,197,71,189,26,183,118,
+    206,176,85,172,17,218,56,251,227,214,136,42,158,250,106,222,
+    17,55,146,3,129,14,114,12,144,155,175,139,59,30,87,214,
+    117,178,30,69,156,21,88,246,90,88,82,240,31,136,19,159,
+    84,39,2,37,67,220,22,119,148,122,47,68,195,156,242,248,
+    90,22,211,217,43,211,61,129,211,87,158,106,254,41,171,77,
+    121,25,154,185,104,247,83,211,224,49,249,61,161,190,15,151,
+    232,197,21,114,77,71,23,235,42,187,162,131,66,176,122,41,
+    132,88,177,164,217,144,143,104,24,35,68,159,127,68,127,247,
+    17,253,154,215,45,133,145,84,239,81,104,185,81,246,59,115,
+    134,153,112,36,128,23,7,114,198,203,115,81,145,24,84,37,
+    60,191,67,12,60,210,91,136,203,198,2,51,146,132,222,127,
+    66,21,207,16,226,249,207,156,81,12,205,78,227,45,4,49,
+    167,83,46,152,228,56,16,169,35,18,158,163,35,10,183,52,
+    143,120,188,132,87,127,20,97,165,94,145,191,75,18,11,217,
+    209,212,23,164,143,156,25,143,167,142,43,149,147,80,12,193,
+    163,238,98,40,103,33,167,85,11,118,35,162,238,231,120,130,
+    37,125,159,184,3,33,65,188,89,72,93,48,74,153,136,135,
+    212,43,103,86,146,43,30,58,160,28,4,196,134,84,239,159,
+    40,146,146,181,120,147,132,24,163,99,237,149,226,82,89,180,
+    1,250,41,242,33,75,100,38,29,229,112,45,198,64,168,1,
+    173,192,180,104,90,242,223,182,227,59,91,223,176,60,144,208,
+    67,116,99,235,242,245,132,57,235,108,92,62,156,48,108,216,
+    155,238,56,147,163,43,99,31,116,172,116,100,236,94,217,238,
+    133,164,141,173,239,199,223,141,167,78,221,5,57,127,151,220,
+    184,43,97,217,232,218,158,5,105,254,124,210,189,210,150,138,
+    63,96,153,110,211,67,10,64,158,178,26,95,160,21,136,198,
+    135,147,75,219,146,13,88,135,134,196,247,178,142,166,172,171,
+    109,233,108,114,20,15,41,39,78,161,77,98,62,235,112,45,
+    89,150,45,120,224,99,43,58,192,255,190,229,93,203,157,177,
+    85,110,85,88,59,249,249,182,76,251,49,185,253,88,198,49,
+    44,59,134,211,142,97,204,164,165,21,242,117,223,62,159,181,
+    56,18,23,22,47,36,191,149,177,108,65,71,214,222,144,184,
+    177,244,102,106,175,220,232,93,221,155,182,15,173,237,3,160,
+    60,104,245,120,129,46,207,253,252,23,188,60,120,250,247,124,
+    166,125,68,110,31,201,56,46,202,142,139,105,199,197,175,239,
+    55,180,188,31,124,55,152,26,188,59,148,105,240,201,13,190,
+    132,121,163,181,59,53,122,119,44,211,186,75,110,5,193,146,
+    53,94,164,21,120,251,124,226,212,210,32,80,47,201,47,31,
+    196,195,71,23,233,212,193,213,89,185,107,111,186,107,248,241,
+    141,43,20,207,101,218,47,200,237,23,50,142,17,217,49,146,
+    118,140,124,13,228,114,55,47,159,255,210,213,189,238,234,206,
+    184,182,203,174,237,171,238,123,109,95,122,135,214,189,67,25,
+    239,33,217,123,40,227,58,148,167,154,141,13,15,16,36,78,
+    130,192,154,28,148,91,7,210,118,124,178,125,59,255,226,224,
+    191,56,184,22,205,244,29,146,251,14,45,113,178,163,19,4,
+    96,71,111,214,221,44,187,123,86,57,217,61,0,90,160,221,
+    173,116,73,115,251,74,235,63,239,248,73,199,170,107,85,202,
+    52,239,145,155,247,36,206,101,91,58,86,250,191,108,217,177,
+    222,178,99,117,112,173,62,211,50,40,183,12,38,206,111,184,
+    91,238,60,115,39,146,26,250,224,251,43,223,255,21,187,118,
+    62,179,235,152,188,235,88,166,117,88,110,29,206,184,143,203,
+    238,227,121,170,206,218,64,192,18,157,109,217,178,244,189,165,
+    239,165,234,16,194,143,203,58,93,119,216,228,185,15,236,43,
+    246,117,103,79,218,217,179,186,187,148,203,122,223,177,116,223,
+    177,172,171,105,233,249,229,231,83,195,25,215,54,116,128,255,
+    253,231,223,125,126,163,169,51,219,230,193,103,192,7,50,249,
+    216,47,59,62,235,88,31,56,150,30,56,150,60,151,122,125,
+    229,66,242,194,23,66,214,183,243,87,93,107,215,51,123,142,
+    203,123,142,175,251,142,167,125,199,147,231,87,233,149,145,228,
+    200,239,185,7,70,190,185,229,33,5,224,1,171,119,55,60,
+    164,0,228,9,112,80,238,118,236,40,235,178,53,85,151,113,
+    116,162,35,235,108,89,218,159,28,74,249,87,14,175,246,173,
+    249,239,249,80,253,221,167,154,3,160,235,235,26,74,53,75,
+    13,2,237,98,159,111,189,55,255,249,245,223,111,253,117,40,
+    211,116,65,110,186,0,131,2,203,97,176,28,0,95,63,232,
+    64,202,212,65,135,145,174,171,86,26,212,109,142,4,133,74,
+    67,249,182,92,188,226,240,50,44,179,187,136,232,198,130,138,
+    192,190,197,196,185,133,58,178,128,104,140,108,133,5,68,13,
+    89,108,129,101,65,107,194,211,46,5,92,165,113,104,113,55,
+    185,19,193,198,250,75,147,123,225,86,82,79,225,196,234,140,
+    63,32,221,8,68,68,114,179,143,108,137,249,20,67,146,151,
+    149,112,225,144,34,8,80,214,42,218,69,75,183,94,140,100,
+    54,36,183,152,76,202,100,72,242,172,80,16,237,197,121,77,
+    185,255,23,137,117,108,54,241,21,16,78,225,212,135,54,215,
+    5,234,79,54,106,251,238,53,215,218,108,102,219,97,121,219,
+    225,60,197,25,135,8,200,88,182,38,158,91,138,101,237,77,
+    105,187,39,117,46,221,189,15,250,63,77,14,156,165,252,25,
+    71,143,226,4,120,223,225,250,210,209,185,14,193,7,86,175,
+    101,28,7,100,199,129,52,121,242,198,98,94,138,145,84,105,
+    12,185,140,85,104,12,186,201,177,185,50,187,132,122,197,98,
+    135,98,151,96,223,178,151,117,115,197,145,150,121,86,123,150,
+    189,82,83,223,11,218,97,89,60,83,21,207,111,214,225,101,
+    150,3,174,210,50,88,22,203,87,198,86,89,17,241,178,53,
+    93,25,26,50,119,81,187,169,8,119,131,185,201,190,66,221,
+    160,105,234,21,8,221,12,27,89,109,51,124,180,53,196,110,
+    170,135,5,202,184,81,115,155,181,250,24,3,57,11,50,228,
+    41,94,68,172,113,22,68,61,94,161,228,163,57,160,161,230,
+    53,226,229,114,28,110,88,145,3,249,210,95,32,192,147,141,
+    94,157,194,209,107,8,126,73,21,15,73,150,46,190,161,206,
+    85,115,5,39,181,221,124,5,39,209,47,34,27,187,105,178,
+    130,55,81,150,186,180,185,109,195,213,148,116,191,115,126,25,
+    22,156,13,107,99,210,168,108,255,227,42,100,75,9,159,158,
+    91,139,101,250,143,203,253,199,73,192,23,34,172,141,95,90,
+    60,235,22,207,134,195,147,114,165,102,51,142,1,217,49,240,
+    215,59,143,126,193,127,49,155,217,121,65,222,137,19,148,213,
+    6,19,148,213,150,39,128,133,132,36,53,1,15,16,60,164,
+    202,194,106,129,175,191,254,250,241,8,223,40,183,167,203,146,
+    92,137,248,169,227,184,129,253,229,51,195,187,248,223,116,91,
+    192,249,155,93,220,240,160,241,55,131,44,186,247,211,232,126,
+    22,221,191,53,112,199,45,250,223,218,105,128,85,135,210,201,
+    96,196,173,169,202,163,221,138,185,48,108,42,219,182,40,132,
+    18,227,23,177,149,123,25,197,36,76,230,185,202,11,75,186,
+    25,63,222,16,169,222,227,81,194,69,236,98,220,237,87,174,
+    123,193,50,185,110,239,76,219,143,164,162,114,207,129,207,191,
+    181,222,115,36,109,56,82,251,16,7,169,245,113,74,185,165,
+    117,171,124,165,40,219,102,185,199,86,174,26,229,202,47,180,
+    132,139,245,108,114,209,188,95,13,36,39,162,124,85,123,2,
+    100,131,121,11,165,158,37,49,205,211,113,90,208,156,181,124,
+    135,89,52,67,17,244,31,201,190,194,1,170,116,106,228,93,
+    170,214,169,145,158,74,74,69,195,51,181,182,141,175,151,72,
+    151,182,159,86,158,228,75,75,252,146,127,217,160,6,16,210,
+    141,226,141,2,73,132,54,69,68,47,147,211,69,200,173,121,
+    98,151,175,236,47,114,40,35,230,172,81,133,0,93,216,165,
+    198,158,194,172,127,62,181,58,122,239,149,47,184,244,246,83,
+    153,237,167,228,237,167,32,44,99,63,45,67,164,65,41,55,
+    199,134,103,163,101,219,101,142,98,191,189,205,40,247,110,83,
+    84,173,63,114,235,78,37,116,225,214,157,246,150,29,91,113,
+    203,142,211,238,192,42,183,238,42,85,53,192,80,13,190,82,
+    251,102,37,107,177,32,31,221,29,166,58,159,148,174,86,202,
+    138,195,16,76,156,137,144,141,189,168,198,252,34,232,159,98,
+    35,142,221,148,42,6,193,248,33,39,152,4,179,96,137,179,
+    31,82,119,24,226,179,10,54,242,182,23,222,14,161,142,188,
+    235,5,39,188,93,119,44,85,45,128,26,188,118,11,141,170,
+    155,208,128,43,221,30,85,74,132,144,146,169,65,83,182,118,
+    187,13,112,84,131,64,121,137,74,189,42,112,45,223,0,215,
+    186,9,110,93,13,92,219,38,184,155,208,98,241,135,100,235,
+    207,61,18,51,158,40,126,179,34,102,46,158,59,6,129,46,
+    102,34,98,94,111,196,59,228,137,185,213,153,1,143,163,76,
+    41,223,173,240,196,90,201,39,34,10,7,165,148,171,72,120,
+    78,5,245,125,83,172,163,152,126,19,132,218,155,140,120,47,
+    93,221,100,108,170,60,158,86,26,27,53,15,14,52,151,54,
+    18,25,197,108,224,166,52,123,136,66,245,30,98,213,121,1,
+    229,211,26,53,182,16,111,210,133,155,52,197,45,196,1,120,
+    82,195,239,157,72,210,43,58,92,152,149,16,237,163,236,81,
+    161,69,33,198,28,25,140,49,30,79,142,67,81,227,17,125,
+    136,72,10,49,246,200,238,65,34,46,196,240,236,35,57,28,
+    137,97,123,98,120,164,90,245,238,122,68,155,188,246,28,127,
+    67,10,128,212,130,166,14,197,114,66,214,30,98,8,33,11,
+    16,57,85,230,45,150,72,90,158,211,143,43,87,197,52,6,
+    14,245,194,105,81,40,255,117,49,49,148,16,16,64,110,253,
+    183,84,245,86,141,78,161,75,245,106,166,132,79,35,113,234,
+    24,101,255,209,252,99,227,219,198,60,195,88,183,39,185,21,
+    43,74,23,219,9,88,235,254,108,71,201,151,197,85,47,207,
+    170,222,193,103,63,123,190,228,37,224,1,203,25,77,15,65,
+    206,198,59,163,0,76,148,197,33,155,219,113,103,231,34,157,
+    181,216,127,252,220,219,207,37,93,114,115,95,186,225,130,242,
+    100,44,35,178,101,36,109,25,201,218,234,127,124,245,237,171,
+    183,175,45,94,75,176,89,123,61,166,113,146,253,207,13,135,
+    83,233,157,85,124,103,156,3,50,64,34,30,37,248,66,221,
+    65,57,78,91,158,71,155,193,32,1,201,211,228,149,122,137,
+    188,202,162,86,223,40,243,126,254,237,50,111,214,222,156,182,
+    60,131,167,43,10,254,173,125,101,126,2,30,224,101,99,20,
+    142,240,96,30,0,3,85,239,206,83,60,10,59,0,18,195,
+    133,134,130,246,188,188,47,237,56,7,148,169,219,73,64,138,
+    190,171,35,142,85,55,121,149,69,254,106,255,231,187,127,189,
+    239,151,71,63,59,90,22,188,225,108,73,238,94,217,159,113,
+    118,201,206,174,180,227,52,80,188,24,211,183,103,109,247,103,
+    67,153,190,35,114,223,145,178,152,63,144,52,67,25,231,118,
+    217,185,61,237,240,229,249,98,12,1,208,75,40,72,114,40,
+    72,170,128,45,214,95,25,3,100,72,122,42,175,146,225,128,
+    207,153,206,94,188,52,58,126,105,116,120,244,146,180,31,67,
+    209,114,41,225,140,170,92,68,34,87,205,200,165,51,156,155,
+    201,85,106,98,7,84,12,122,196,250,135,118,192,156,5,71,
+    86,96,114,90,140,94,13,11,57,238,114,56,28,36,182,69,
+    9,39,70,162,133,74,184,124,41,34,252,103,8,158,69,240,
+    47,85,238,103,35,115,17,16,17,162,2,172,221,18,178,191,
+    244,239,168,130,220,162,185,148,253,82,17,220,193,81,114,143,
+    209,94,202,206,51,28,111,192,235,205,134,188,131,106,105,207,
+    54,183,101,15,28,204,122,118,100,157,238,108,227,214,188,125,
+    15,239,201,83,0,238,215,53,228,121,244,232,168,250,198,188,
+    30,93,6,202,221,158,124,41,245,204,42,191,58,155,238,26,
+    148,219,247,202,174,125,121,35,70,153,168,186,230,164,115,217,
+    154,55,163,207,66,217,234,242,86,116,217,144,79,212,60,53,
+    224,42,109,230,27,178,238,150,228,51,41,54,249,236,242,120,
+    158,5,255,125,163,53,113,117,105,22,202,56,149,124,85,110,
+    220,33,219,250,100,99,63,222,25,111,192,59,224,90,208,162,
+    227,119,36,159,201,83,240,74,61,187,122,106,109,219,231,238,
+    181,126,185,255,168,220,117,140,4,86,2,135,141,223,149,2,
+    55,188,214,92,228,85,9,60,148,174,62,207,24,248,231,232,
+    172,205,153,103,137,163,109,107,193,209,191,187,224,56,52,172,
+    56,160,170,121,30,29,121,170,4,241,134,121,253,173,87,149,
+    92,242,174,131,124,67,170,47,79,193,107,237,58,121,125,33,
+    144,87,37,136,1,45,134,238,219,26,150,222,148,109,93,216,
+    218,33,52,71,54,37,205,178,189,27,175,201,15,1,229,77,
+    54,188,34,63,132,141,215,130,78,106,135,47,111,172,227,129,
+    143,1,220,119,66,159,161,71,71,185,155,242,122,116,25,48,
+    35,67,202,185,98,149,237,219,21,76,19,102,102,46,166,209,
+    128,237,228,234,60,205,31,77,114,120,141,237,104,9,168,87,
+    231,49,64,199,240,103,232,165,209,228,14,217,189,13,175,153,
+    157,161,107,64,3,181,173,247,46,140,105,55,102,14,32,217,
+    153,188,180,210,67,156,107,131,165,224,90,64,97,100,194,195,
+    63,167,42,84,11,85,33,194,49,133,203,239,2,57,45,129,
+    55,231,63,228,208,20,52,242,136,30,136,177,190,125,87,10,
+    231,66,73,22,90,17,250,119,69,240,67,92,14,112,201,129,
+    229,64,111,89,152,135,9,56,17,129,174,79,28,73,28,73,
+    115,205,138,140,204,225,101,231,218,31,32,249,45,169,129,241,
+    49,183,254,43,111,243,151,206,251,199,233,199,89,69,202,226,
+    42,236,45,83,44,90,33,180,95,124,233,134,153,139,46,179,
+    135,148,132,109,20,197,81,0,175,190,136,116,131,82,108,24,
+    94,30,40,54,36,253,37,82,197,79,225,177,248,30,60,188,
+    139,23,27,138,159,203,130,197,217,243,194,240,232,232,169,23,
+    71,134,134,143,95,26,31,189,248,252,208,139,167,158,199,183,
+    151,135,69,55,50,19,12,68,149,105,17,119,150,114,6,80,
+    201,96,229,141,136,185,186,97,233,202,236,52,200,99,163,115,
+    51,202,17,120,47,39,253,39,68,196,35,249,165,131,23,21,
+    39,137,76,165,195,241,146,12,1,127,134,61,117,147,244,84,
+    158,209,241,166,108,119,239,47,206,255,236,252,26,187,246,173,
+    76,247,126,185,123,127,198,176,53,161,95,106,76,246,100,237,
+    13,119,248,228,149,15,108,43,182,79,249,213,43,31,219,238,
+    217,210,246,125,105,195,190,175,55,204,110,252,86,132,169,4,
+    54,108,13,178,173,55,107,57,190,196,165,45,199,149,231,1,
+    203,216,113,151,192,110,194,179,137,166,60,11,120,160,234,71,
+    112,66,255,193,179,7,169,127,213,53,188,133,205,113,208,192,
+    55,202,152,194,84,100,138,119,217,74,187,168,86,55,191,87,
+    209,209,168,140,214,54,126,9,172,192,221,227,43,77,80,155,
+    98,235,190,17,182,94,251,1,1,212,91,238,85,108,240,63,
+    38,173,185,34,173,229,27,164,181,106,63,86,32,216,174,224,
+    85,68,199,189,186,143,32,199,79,116,79,145,190,158,164,113,
+    10,46,193,157,226,107,97,68,45,37,119,57,165,97,16,52,
+    220,97,239,53,126,4,233,62,81,211,62,166,172,38,193,38,
+    96,89,205,223,32,77,75,212,166,241,181,10,109,223,128,54,
+    237,194,22,161,67,240,220,219,90,35,133,161,86,138,202,3,
+    83,243,76,212,169,137,101,174,153,52,110,179,198,93,186,187,
+    167,161,86,217,97,12,102,51,61,45,166,196,218,53,152,234,
+    1,130,123,157,229,253,8,147,28,187,201,193,4,230,90,189,
+    198,237,212,184,93,106,185,101,71,115,128,10,108,74,163,73,
+    150,254,202,117,117,196,187,214,80,244,73,140,208,21,162,133,
+    110,88,22,182,141,196,174,22,52,200,234,47,52,94,17,167,
+    247,146,61,3,159,231,69,242,29,174,136,103,23,94,99,0,
+    196,185,194,53,61,188,131,138,95,78,193,219,122,160,99,134,
+    180,159,71,196,139,175,187,149,171,167,184,209,224,243,210,57,
+    179,32,70,38,165,0,49,234,42,74,84,243,240,102,159,205,
+    0,116,238,170,24,156,81,84,44,227,192,0,40,89,3,144,
+    61,185,192,26,235,123,252,213,71,79,111,33,110,200,179,203,
+    235,133,153,41,10,19,109,78,95,8,148,178,133,44,65,81,
+    195,44,203,115,171,190,15,89,150,91,204,60,48,160,198,228,
+    116,254,25,252,232,69,172,113,147,133,32,22,198,172,53,84,
+    41,51,90,171,23,21,253,181,46,59,122,46,40,223,132,4,
+    45,77,244,71,69,225,96,233,43,141,155,95,113,4,197,240,
+    63,83,168,243,249,39,9,149,115,232,209,131,96,237,127,195,
+    47,41,13,55,12,12,20,238,85,233,11,181,142,93,58,25,
+    86,62,172,89,197,11,143,173,162,114,15,89,12,6,241,173,
+    94,117,84,18,246,62,162,61,49,167,183,170,21,62,88,234,
+    254,11,114,33,214,76,218,64,64,106,165,31,80,62,96,24,
+    187,72,62,78,137,159,36,208,126,148,243,255,153,106,190,24,
+    143,29,54,35,189,140,165,28,120,170,171,149,138,94,172,233,
+    246,61,208,239,192,47,104,130,28,184,60,39,225,129,63,114,
+    214,58,214,119,54,124,131,164,168,188,109,89,74,91,228,39,
+    228,67,253,228,213,112,0,162,149,198,99,187,189,186,199,223,
+    50,43,93,18,242,54,74,235,216,153,182,162,240,240,2,202,
+    18,82,206,226,23,132,113,127,33,76,17,55,80,56,200,113,
+    215,194,129,144,244,239,169,130,26,150,51,17,217,3,49,35,
+    138,16,89,186,117,103,44,201,21,127,86,163,10,68,225,42,
+    109,255,241,202,71,142,136,130,133,26,24,116,232,95,83,138,
+    209,156,84,8,197,128,72,206,84,250,242,101,133,24,195,77,
+    251,161,98,255,131,194,75,37,248,229,47,162,134,109,88,221,
+    178,181,27,4,105,247,97,144,46,108,186,7,20,128,135,8,
+    22,78,131,208,204,155,191,228,26,215,185,198,164,46,189,237,
+    88,154,107,204,112,195,50,55,156,230,134,179,156,169,16,163,
+    79,111,31,38,49,199,101,238,120,154,59,174,198,100,13,206,
+    13,107,125,214,225,204,90,135,242,70,138,111,122,64,241,60,
+    228,13,32,79,128,69,205,254,27,161,186,55,172,141,89,123,
+    99,214,1,9,188,80,115,219,209,188,149,36,49,96,18,3,
+    38,65,80,175,73,82,95,196,111,70,252,11,116,182,107,251,
+    47,158,253,217,179,159,158,203,116,237,151,187,246,231,89,12,
+    4,205,162,4,205,36,71,61,230,168,199,28,17,56,52,57,
+    214,145,28,93,133,28,187,159,136,111,223,176,58,176,6,214,
+    179,79,38,69,214,209,155,117,180,108,78,10,75,253,151,230,
+    182,117,115,91,114,52,99,238,148,205,157,11,39,255,80,231,
+    129,202,144,211,18,0,156,141,203,71,54,236,205,119,78,165,
+    186,239,246,101,218,124,114,155,47,99,247,101,45,142,197,179,
+    4,33,111,213,215,67,71,3,120,136,96,225,28,214,212,254,
+    37,215,182,206,65,158,43,175,224,167,240,214,78,126,118,46,
+    195,29,149,185,163,105,238,104,150,179,125,201,185,215,57,119,
+    134,107,148,185,70,232,109,168,159,236,216,154,54,247,38,118,
+    39,118,167,94,79,115,189,138,126,98,24,31,71,46,27,31,
+    87,172,23,219,136,185,130,140,31,233,48,130,63,71,224,65,
+    240,87,100,0,160,113,46,26,14,7,35,228,150,40,217,1,
+    207,233,96,209,128,105,70,49,39,16,243,3,249,194,74,201,
+    146,161,26,59,114,70,98,191,192,115,67,202,197,99,139,178,
+    165,141,147,152,40,41,70,12,59,25,131,184,216,21,66,81,
+    66,80,134,39,177,131,16,123,9,217,167,196,45,74,101,132,
+    146,193,252,187,226,136,86,172,41,56,110,136,45,38,199,137,
+    55,65,191,40,55,113,60,50,28,82,62,114,119,68,250,123,
+    178,240,195,0,251,103,48,192,128,179,104,58,191,207,77,131,
+    6,139,192,71,209,142,5,59,254,178,148,121,129,252,178,148,
+    101,129,252,52,33,166,5,242,203,51,44,205,128,114,240,68,
+    96,48,160,235,255,7,112,81,116,119,154,234,210,62,79,95,
+    43,138,238,77,83,61,218,39,175,163,108,205,208,48,93,55,
+    13,42,77,53,120,128,224,97,41,108,132,230,232,134,165,75,
+    121,10,94,201,23,83,236,202,183,137,179,18,56,168,131,71,
+    243,108,27,189,55,79,1,128,113,182,244,204,178,158,4,100,
+    61,189,171,77,107,93,247,218,101,207,126,18,112,159,183,38,
+    174,203,124,75,158,47,162,107,192,17,17,102,130,60,85,27,
+    62,32,240,161,54,252,5,61,75,183,44,61,155,60,181,124,
+    20,155,220,146,138,144,87,37,176,232,105,19,54,2,94,229,
+    246,42,18,84,9,92,39,105,218,155,167,16,38,110,150,108,
+    37,36,96,173,75,121,215,128,35,12,197,89,18,177,117,182,
+    57,205,54,103,57,203,194,137,91,103,19,163,137,209,219,47,
+    47,190,156,225,92,50,231,74,23,159,60,75,113,45,128,69,
+    248,247,255,2,250,34,87,171,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/ext/pystats/compare.py",
+    "m5.ext.pystats.compare",
+    embedded_module_data,
+    10776,
+    24095);
+
+} // anonymous namespace
+} // namespace gem5
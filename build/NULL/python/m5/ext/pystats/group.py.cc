@@ -0,0 +1,123 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,165,86,221,107,29,69,20,159,217,239,123,115,243,81,
+    74,76,90,171,93,141,95,87,211,27,197,214,150,90,69,105,
+    36,106,99,20,106,125,88,149,101,179,51,73,214,238,199,117,
+    118,111,219,212,20,138,20,188,66,148,188,136,81,10,230,161,
+    72,197,15,124,236,163,127,66,10,121,8,11,66,193,39,223,
+    174,164,15,234,147,231,204,222,175,216,66,5,247,238,253,205,
+    204,57,103,207,158,115,102,230,55,251,27,233,187,244,118,187,
+    243,49,192,151,132,17,70,67,18,81,135,70,138,163,68,170,
+    163,70,154,163,69,186,163,83,194,20,166,134,70,100,58,166,
+    236,107,161,21,149,156,82,84,118,202,114,172,135,3,81,197,
+    169,80,162,144,25,194,140,43,132,153,220,252,86,37,228,123,
+    181,243,50,103,80,234,44,208,149,248,224,191,116,67,172,124,
+    154,84,7,126,199,65,85,207,181,233,192,207,114,109,54,72,
+    179,220,124,195,171,215,131,120,49,183,222,172,103,65,18,123,
+    97,174,159,137,161,243,59,69,99,154,87,94,158,79,51,225,
+    249,217,233,204,203,170,74,110,156,246,189,208,19,121,9,199,
+    224,33,240,193,104,232,237,32,226,39,147,248,28,23,41,60,
+    235,247,151,97,168,83,134,159,100,25,56,113,40,35,142,114,
+    6,202,225,168,92,227,250,190,174,41,55,152,114,2,91,141,
+    155,187,164,42,74,75,240,99,22,83,118,63,195,212,221,214,
+    76,231,22,215,121,137,17,94,230,3,140,244,249,25,96,70,
+    111,180,160,245,245,149,190,190,193,204,43,186,83,97,26,148,
+    172,148,235,51,34,105,212,47,94,43,219,112,157,73,57,179,
+    179,196,246,5,247,50,110,103,75,220,94,226,129,240,132,191,
+    20,64,85,236,20,74,146,2,138,134,159,53,4,175,217,47,
+    219,242,113,59,153,255,128,251,153,237,39,113,230,5,113,106,
+    123,210,93,228,129,102,193,14,189,121,30,130,227,194,54,157,
+    180,187,149,133,62,78,82,138,86,29,101,34,164,12,69,61,
+    187,154,244,151,107,217,114,157,231,195,25,76,134,235,119,103,
+    99,46,55,206,158,247,196,98,42,6,32,63,191,187,44,224,
+    50,224,143,194,157,85,57,55,43,244,178,197,232,10,113,187,
+    6,177,185,178,107,188,162,192,136,118,71,234,134,66,238,114,
+    125,11,255,239,187,163,105,242,254,125,239,129,221,37,237,146,
+    158,153,61,171,21,178,162,173,232,187,151,42,37,171,99,140,
+    64,229,149,57,129,11,167,170,137,97,104,196,8,64,174,7,
+    25,143,210,220,76,57,36,158,137,170,145,107,41,15,23,122,
+    22,98,15,154,169,103,249,114,174,159,243,194,6,79,49,65,
+    91,94,127,63,156,10,127,170,190,156,45,37,241,84,116,100,
+    138,95,200,96,36,103,108,106,17,107,91,171,47,231,150,235,
+    6,113,144,185,238,197,33,89,239,90,103,124,24,252,164,239,
+    2,92,38,173,17,82,25,105,158,216,30,63,216,156,94,125,
+    173,249,218,173,241,3,216,185,117,176,214,212,182,172,3,183,
+    246,219,223,76,126,61,249,85,237,106,173,69,104,233,49,9,
+    159,190,222,60,185,54,250,107,101,239,218,244,250,196,122,227,
+    102,229,209,173,202,163,155,242,110,169,29,163,29,44,0,36,
+    62,87,29,196,64,98,15,102,209,205,203,174,27,37,172,17,
+    98,191,226,186,31,54,188,176,173,49,93,151,37,190,235,10,
+    67,102,13,203,46,31,118,93,47,142,19,92,23,73,156,130,
+    170,130,85,193,234,10,44,188,92,0,66,67,192,5,255,29,
+    17,251,177,63,142,48,212,129,167,48,213,31,101,170,189,95,
+    75,81,117,171,69,16,202,100,96,239,218,179,171,135,54,181,
+    49,184,111,106,99,219,163,15,172,199,91,163,32,192,251,166,
+    118,168,101,145,131,19,219,135,143,181,204,17,29,82,3,184,
+    53,116,223,90,186,26,181,116,20,24,100,255,195,27,181,173,
+    125,207,20,122,139,236,29,219,174,12,175,141,174,157,223,40,
+    93,63,252,179,249,195,11,55,30,185,241,209,214,241,83,155,
+    99,167,182,246,204,110,86,102,111,171,202,222,114,171,212,241,
+    118,55,40,50,193,248,119,145,143,214,110,119,166,1,62,233,
+    163,31,36,159,130,74,184,177,107,251,43,77,178,64,153,122,
+    165,226,152,12,180,11,192,190,87,52,199,106,146,11,212,41,
+    193,194,52,114,227,29,216,203,137,240,102,96,31,200,125,247,
+    54,240,64,33,179,253,208,75,83,59,72,237,70,155,42,82,
+    144,114,251,92,161,13,226,133,68,68,114,114,106,246,171,201,
+    121,14,59,116,18,164,246,34,143,142,72,87,133,155,84,10,
+    235,200,186,65,202,39,237,165,36,100,253,15,3,243,120,25,
+    190,37,66,231,97,112,150,219,158,205,128,212,145,192,197,50,
+    112,131,116,86,48,181,253,142,220,9,53,8,19,158,40,2,
+    140,188,101,219,95,242,226,69,112,238,197,76,142,231,185,29,
+    113,177,200,241,77,16,120,65,92,65,44,61,121,190,159,8,
+    230,197,62,199,156,24,247,3,36,22,244,195,56,134,42,120,
+    216,14,44,145,246,75,89,86,79,143,79,77,97,94,53,47,
+    195,119,6,94,92,139,121,54,53,47,146,243,41,159,154,121,
+    229,141,35,135,142,61,119,180,205,92,229,84,198,234,2,37,
+    250,253,148,130,75,27,151,239,206,75,0,95,208,47,225,4,
+    204,104,79,189,155,104,62,232,106,152,202,96,150,153,114,85,
+    89,161,215,232,231,20,78,81,36,21,109,78,76,200,61,214,
+    71,25,15,73,65,174,167,141,58,23,114,91,84,85,49,138,
+    154,71,112,91,149,92,87,150,204,117,83,85,114,201,229,98,
+    187,160,225,197,225,98,186,186,44,241,22,110,157,67,0,127,
+    94,38,219,214,248,103,250,167,230,170,185,101,141,111,90,167,
+    214,151,110,104,208,192,253,75,185,104,187,183,92,186,185,33,
+    56,156,25,177,223,151,29,161,157,236,177,12,240,5,65,11,
+    98,156,232,198,77,101,164,41,218,217,50,46,160,11,193,235,
+    66,146,199,197,61,157,240,186,162,211,104,109,202,189,189,61,
+    60,214,188,32,95,93,45,139,251,209,227,1,132,7,16,30,
+    68,192,207,23,113,16,161,220,73,88,60,137,175,24,108,151,
+    196,231,97,232,186,16,195,227,157,24,94,42,106,51,209,129,
+    25,84,44,23,245,232,49,137,129,76,130,48,66,245,89,186,
+    113,244,250,179,63,27,215,159,223,154,56,10,44,8,130,123,
+    160,65,245,241,245,147,56,24,255,15,80,208,2,198,50,87,
+    29,206,13,56,31,225,91,167,32,68,173,155,164,209,225,199,
+    124,208,107,127,236,184,120,48,136,146,92,1,105,231,152,45,
+    10,129,28,154,15,225,25,219,59,98,11,158,29,234,38,143,
+    147,211,227,214,191,173,19,5,133,191,40,158,110,207,106,250,
+    23,0,80,63,165,173,231,12,170,64,61,254,39,140,16,250,
+    196,38,121,188,255,6,206,70,237,189,193,34,244,169,77,242,
+    100,255,221,50,246,81,32,214,59,161,57,251,7,54,183,123,
+    210,99,131,20,106,125,39,52,207,252,129,205,237,187,168,100,
+    105,254,1,188,118,172,35,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/ext/pystats/group.py",
+    "m5.ext.pystats.group",
+    embedded_module_data,
+    1575,
+    2860);
+
+} // anonymous namespace
+} // namespace gem5
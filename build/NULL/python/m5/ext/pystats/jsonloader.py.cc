@@ -0,0 +1,126 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,22,93,107,219,86,244,94,89,178,229,143,212,118,
+    154,207,54,221,212,164,109,98,146,58,48,218,142,180,233,104,
+    211,148,110,93,73,41,161,221,166,23,69,145,228,68,169,100,
+    185,87,114,86,167,25,132,81,88,11,101,120,35,163,134,49,
+    200,195,8,29,217,160,15,123,232,227,126,130,18,2,11,130,
+    194,96,79,125,115,105,11,163,79,187,87,178,108,57,77,88,
+    150,107,249,220,143,115,238,185,247,124,222,243,55,8,52,166,
+    214,191,90,198,224,49,144,129,12,53,192,147,158,210,160,78,
+    241,20,36,227,144,22,210,105,158,214,25,158,193,115,90,102,
+    180,176,30,225,35,58,203,179,238,60,172,69,245,24,31,115,
+    199,17,45,174,39,248,132,222,194,183,232,7,248,3,122,146,
+    79,66,64,129,43,64,102,239,3,57,170,128,185,148,127,248,
+    106,8,128,181,144,63,227,211,114,76,161,229,184,18,203,209,
+    114,226,62,205,183,202,112,18,100,90,94,16,228,68,6,58,
+    201,171,147,215,39,198,21,201,144,149,203,8,25,40,67,57,
+    212,39,215,29,230,102,94,53,242,47,32,166,194,43,204,21,
+    100,20,11,78,248,150,34,89,152,4,58,145,73,85,159,180,
+    68,43,67,59,241,139,146,84,212,139,154,136,49,78,98,92,
+    53,45,164,78,23,45,188,219,9,79,74,162,38,34,39,74,
+    72,49,66,149,164,160,154,34,190,154,198,49,248,6,43,74,
+    1,60,148,1,79,201,144,15,61,0,57,40,83,247,89,158,
+    150,67,10,35,211,74,88,137,40,172,18,205,133,186,235,12,
+    176,72,12,22,41,246,0,220,133,124,28,139,21,118,98,87,
+    77,35,127,205,16,101,5,137,99,248,246,49,14,183,201,226,
+    180,164,137,166,201,25,57,174,33,46,226,172,89,209,226,140,
+    121,5,33,85,86,76,110,106,202,152,158,195,18,10,179,134,
+    113,123,106,42,203,93,50,242,24,105,153,238,38,206,67,186,
+    12,213,188,101,112,34,87,83,66,13,147,141,185,184,155,166,
+    56,163,184,163,147,164,121,139,217,44,71,142,60,57,173,25,
+    210,237,179,103,189,197,122,203,33,67,231,244,211,89,229,174,
+    149,45,148,76,204,210,204,206,97,57,52,87,14,78,213,11,
+    6,178,184,134,100,219,182,127,169,90,179,156,81,80,242,3,
+    5,209,154,205,112,162,201,229,206,54,147,248,205,84,117,194,
+    94,240,110,204,157,231,200,49,89,114,206,64,110,136,147,52,
+    243,124,227,148,140,119,140,4,3,38,163,241,159,248,214,171,
+    207,49,248,1,62,6,86,0,187,138,255,107,245,217,74,112,
+    95,189,45,226,223,28,229,207,126,133,171,120,188,86,159,147,
+    184,192,102,164,136,99,198,3,198,200,132,28,198,44,22,20,
+    228,176,130,160,230,85,75,16,156,30,161,113,85,65,32,114,
+    8,150,33,212,4,196,62,75,155,138,150,115,162,130,224,154,
+    94,16,76,114,10,183,244,182,223,68,210,112,161,100,205,26,
+    249,97,253,244,48,214,249,112,77,231,195,13,157,99,51,160,
+    131,152,126,225,96,227,144,172,127,244,5,140,48,51,24,252,
+    179,4,158,179,45,15,35,143,34,127,178,93,27,108,87,165,
+    237,201,169,205,193,139,54,219,181,206,142,109,178,99,182,255,
+    189,34,194,57,80,118,194,72,177,138,40,47,81,1,149,48,
+    190,78,79,80,110,182,128,139,112,30,148,33,194,189,12,27,
+    206,46,83,183,221,93,168,119,17,174,236,164,90,188,83,6,
+    219,245,105,133,2,248,168,10,22,225,207,240,91,156,1,182,
+    241,14,237,139,55,19,192,239,206,155,222,23,239,72,0,191,
+    59,111,166,198,59,97,69,247,68,31,174,209,159,251,63,119,
+    217,149,54,178,195,189,227,13,252,34,92,197,49,176,86,143,
+    131,73,96,181,4,118,179,205,119,251,17,252,68,53,211,127,
+    13,173,228,206,82,101,98,19,14,109,149,112,64,36,136,52,
+    228,76,20,35,128,104,13,177,24,56,73,75,213,21,65,114,
+    51,152,137,147,241,194,182,108,197,205,226,52,161,230,231,69,
+    77,149,57,194,138,251,5,100,88,39,84,48,10,187,51,141,
+    221,18,181,162,247,78,32,162,240,12,133,218,9,146,72,225,
+    197,23,135,58,9,97,250,157,136,92,232,105,138,164,109,216,
+    75,132,193,56,150,124,9,108,197,211,229,27,15,206,61,60,
+    183,149,76,149,59,30,149,42,31,111,36,143,217,201,99,91,
+    169,244,99,230,123,166,156,171,200,235,169,190,205,84,159,157,
+    234,123,222,121,164,124,175,124,111,5,18,104,167,122,255,74,
+    183,150,207,44,119,87,242,27,233,33,59,61,180,243,150,62,
+    187,115,0,127,43,162,215,219,169,1,127,155,190,145,30,180,
+    211,131,59,111,235,181,59,251,241,183,114,195,235,237,84,191,
+    191,109,102,35,125,220,78,31,127,222,217,83,94,40,47,84,
+    238,16,104,167,142,250,232,217,141,244,9,59,125,98,39,174,
+    181,53,187,163,255,73,219,122,42,187,153,202,218,169,44,22,
+    170,34,126,87,90,46,217,41,238,77,24,116,30,221,106,27,
+    123,122,231,89,199,239,37,187,109,12,127,47,67,84,103,235,
+    107,128,65,21,80,233,214,55,44,104,59,92,30,45,143,86,
+    110,16,104,39,222,71,93,196,52,9,146,43,243,34,118,2,
+    193,137,9,130,110,200,69,141,140,19,130,112,167,40,106,53,
+    76,68,16,100,67,18,4,55,219,57,180,172,74,22,34,97,
+    237,154,23,181,212,205,223,70,208,45,181,100,42,41,154,38,
+    8,25,136,58,136,217,136,191,94,112,205,142,146,62,24,38,
+    136,34,112,83,164,255,171,82,7,24,182,10,8,224,32,115,
+    9,86,193,46,48,124,152,225,86,78,85,1,238,158,92,126,
+    218,255,108,228,15,197,254,224,211,205,161,107,238,210,30,128,
+    171,0,247,30,78,212,117,180,156,170,41,232,16,158,239,252,
+    152,141,2,146,120,131,79,217,92,125,188,8,44,186,177,190,
+    253,193,250,10,39,105,242,96,137,17,191,214,248,12,137,5,
+    28,151,92,174,152,151,72,17,228,21,25,5,100,204,187,53,
+    134,136,31,89,69,204,147,87,61,111,41,40,39,74,10,151,
+    51,16,87,52,213,252,12,166,245,42,135,70,168,112,174,194,
+    247,93,90,212,74,135,230,218,130,20,8,181,97,51,245,222,
+    10,137,119,43,148,90,1,81,43,24,240,219,29,194,149,4,
+    126,179,105,66,226,208,4,235,90,3,167,139,1,98,148,3,
+    205,101,72,48,115,160,33,31,136,196,133,222,3,36,37,188,
+    233,5,29,135,150,191,168,148,126,155,179,219,71,214,219,71,
+    54,219,71,150,38,182,226,221,54,221,237,57,251,65,52,72,
+    24,39,220,114,70,246,202,59,68,108,235,132,113,110,195,170,
+    69,196,136,174,103,59,204,12,41,102,3,89,45,82,187,142,
+    235,243,78,212,244,139,85,47,251,185,121,48,225,71,131,19,
+    15,20,144,158,191,187,55,38,23,245,220,142,72,241,150,29,
+    245,226,237,35,116,10,144,103,1,139,210,131,97,53,4,33,
+    172,158,1,48,177,20,39,191,45,48,96,55,127,85,42,4,
+    169,42,248,111,16,219,35,29,11,224,17,27,244,4,191,42,
+    197,16,236,254,64,106,24,226,32,123,23,148,219,54,211,71,
+    95,146,209,235,6,66,134,173,240,80,121,172,10,112,87,249,
+    208,237,118,5,174,246,254,5,214,195,32,194,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/ext/pystats/jsonloader.py",
+    "m5.ext.pystats.jsonloader",
+    embedded_module_data,
+    1628,
+    3399);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,424 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,165,58,91,108,27,87,118,119,200,25,114,248,16,31,
+    122,81,146,245,24,189,108,209,15,41,137,31,113,188,73,108,
+    197,182,108,39,182,210,68,74,178,171,181,75,211,156,145,68,
+    155,34,153,153,161,31,10,149,10,109,22,80,12,161,102,2,
+    165,230,46,146,86,45,146,212,193,102,81,127,180,192,126,180,
+    64,179,63,237,71,63,72,149,11,19,3,8,48,208,6,221,
+    253,41,24,36,5,130,253,234,57,119,134,228,112,68,37,41,
+    74,74,103,46,239,189,115,31,231,125,206,189,255,65,76,31,
+    183,241,252,58,205,16,114,159,136,100,142,136,140,104,75,48,
+    115,12,125,218,230,108,244,105,159,179,211,39,59,199,210,39,
+    55,199,193,211,158,112,44,57,230,28,12,190,195,38,156,75,
+    252,28,191,228,154,115,45,185,231,220,75,158,57,207,146,119,
+    206,11,109,220,92,139,232,152,243,137,206,57,191,141,72,236,
+    245,64,117,114,145,255,20,102,253,37,83,253,61,23,180,180,
+    187,44,237,173,208,222,38,217,68,183,200,124,106,135,22,123,
+    173,165,93,244,72,29,162,87,114,204,179,98,203,59,236,92,
+    167,232,147,188,82,168,187,182,81,104,235,128,54,63,180,117,
+    137,1,169,91,12,194,127,43,252,183,73,14,218,230,22,219,
+    161,173,199,70,206,17,177,227,29,34,118,126,106,131,25,108,
+    181,25,246,208,150,16,180,116,89,90,122,105,75,55,180,244,
+    88,90,250,104,203,30,104,233,181,180,244,139,182,25,18,238,
+    139,190,194,2,13,102,23,37,33,45,167,212,84,44,149,16,
+    82,243,130,10,191,19,241,155,146,160,168,81,85,17,148,84,
+    236,134,164,10,99,87,175,102,146,241,219,39,38,38,174,94,
+    53,90,82,25,53,157,81,149,240,65,33,154,20,133,168,59,
+    150,136,75,73,85,152,79,201,66,92,29,23,112,92,37,190,
+    148,73,68,85,168,73,196,21,85,74,194,75,73,33,42,188,
+    6,35,9,98,106,41,26,79,86,199,135,33,96,28,85,144,
+    162,177,69,183,62,190,152,89,74,31,20,20,41,41,42,130,
+    116,83,146,239,8,177,84,50,41,197,84,73,20,140,185,162,
+    130,146,140,166,149,197,148,90,93,185,34,37,244,30,116,140,
+    113,183,251,44,125,115,73,82,148,232,130,36,196,21,120,103,
+    81,138,138,146,12,11,77,36,82,183,160,235,181,59,80,153,
+    142,222,73,164,162,226,9,183,123,191,209,225,4,29,112,41,
+    186,16,143,9,87,175,94,27,58,119,244,226,204,208,213,171,
+    176,204,218,112,234,157,180,36,140,101,226,73,245,56,160,65,
+    93,148,37,73,144,37,69,146,111,74,162,91,128,129,85,73,
+    161,216,193,145,140,25,132,132,148,92,80,23,245,215,14,63,
+    21,30,135,9,175,94,157,57,125,254,236,165,73,192,109,117,
+    29,250,110,96,19,66,50,10,211,29,20,94,155,157,58,116,
+    92,144,146,177,148,8,107,198,65,21,41,29,149,163,42,221,
+    1,204,150,148,110,37,226,73,73,25,23,46,168,184,81,5,
+    49,116,107,81,66,140,27,248,50,16,168,175,9,155,16,175,
+    116,38,58,9,12,18,91,140,38,23,164,31,209,186,155,209,
+    68,6,214,15,152,5,26,66,191,42,174,225,117,25,80,153,
+    132,78,48,77,74,6,92,25,155,152,158,252,163,153,243,47,
+    207,90,183,129,148,20,146,153,165,107,146,124,80,223,151,206,
+    23,184,114,105,1,6,194,229,72,136,166,120,236,6,174,130,
+    226,230,216,17,202,13,20,177,176,137,84,82,18,230,97,76,
+    172,79,227,106,0,55,64,223,201,68,2,150,162,74,11,146,
+    172,111,139,246,209,151,152,136,171,106,66,58,4,35,199,163,
+    201,113,97,178,138,134,91,139,241,216,34,48,32,108,46,9,
+    172,115,67,146,210,66,38,237,94,138,43,10,84,213,183,57,
+    118,51,174,196,175,37,36,33,170,8,11,80,169,239,185,97,
+    63,74,88,0,18,44,82,44,70,129,155,129,163,226,201,5,
+    183,152,186,149,52,239,52,158,74,194,90,199,199,5,164,222,
+    161,107,9,96,250,19,192,106,2,124,230,229,212,146,176,116,
+    116,92,186,173,142,167,239,232,108,139,242,167,11,65,124,41,
+    157,146,85,225,34,84,204,96,197,105,186,3,253,205,91,113,
+    96,35,75,203,216,208,132,186,148,158,88,144,150,142,30,210,
+    199,66,1,27,10,227,22,244,221,159,160,239,210,153,83,117,
+    154,226,214,172,237,248,73,203,128,220,177,106,175,113,67,38,
+    171,63,117,14,249,233,16,236,242,66,82,81,149,161,43,97,
+    247,239,81,197,76,135,25,141,139,202,114,244,78,152,211,216,
+    51,241,152,170,241,23,128,135,80,23,104,236,69,80,6,26,
+    255,114,26,209,18,77,104,252,140,244,102,6,24,91,82,64,
+    31,17,20,179,223,163,214,253,61,42,172,101,231,179,71,148,
+    23,14,223,190,176,204,62,251,202,43,175,104,222,75,51,231,
+    34,211,47,207,92,56,55,61,121,81,99,197,168,26,213,28,
+    178,164,102,228,100,172,166,170,225,99,55,254,191,254,11,130,
+    166,69,53,181,129,250,110,80,236,43,76,150,217,52,191,91,
+    251,100,73,99,79,134,168,108,189,245,122,205,0,136,182,27,
+    180,44,183,195,72,44,105,242,249,20,254,127,89,251,197,144,
+    44,3,10,216,62,173,49,162,230,208,185,52,204,201,56,134,
+    230,66,126,160,138,67,179,43,119,20,205,133,101,42,99,26,
+    79,171,111,69,211,97,155,236,197,190,14,29,255,10,34,74,
+    16,254,176,87,145,99,19,233,59,234,98,42,57,177,116,116,
+    2,24,106,194,96,168,137,26,67,1,139,105,124,68,76,101,
+    128,173,21,57,4,47,190,12,255,202,105,0,171,100,187,165,
+    53,119,248,221,185,245,185,213,169,50,235,126,196,182,111,177,
+    237,185,217,34,219,83,98,123,10,108,207,182,211,253,206,74,
+    158,223,114,10,5,167,80,230,125,247,252,119,253,69,190,187,
+    196,119,23,248,238,178,39,184,122,233,107,220,157,198,81,101,
+    210,64,14,103,149,28,255,72,201,33,50,155,205,176,180,3,
+    225,205,201,210,136,204,21,198,76,148,77,251,206,254,132,168,
+    188,169,236,54,149,91,76,115,91,216,162,209,198,103,153,101,
+    128,64,52,219,244,31,24,119,216,169,177,215,83,241,164,230,
+    208,245,177,230,140,156,63,59,121,230,236,171,26,155,142,198,
+    110,104,220,165,201,115,23,78,107,14,93,171,107,118,80,249,
+    64,51,244,7,52,167,161,25,13,162,201,157,88,217,162,15,
+    19,81,98,139,210,82,84,30,129,186,55,224,95,57,69,144,
+    44,101,95,235,189,248,221,120,158,43,250,250,75,190,254,71,
+    190,209,45,223,104,209,183,175,228,219,183,122,110,219,211,122,
+    239,217,187,207,126,196,125,116,243,19,229,193,211,127,157,253,
+    56,91,244,28,41,121,142,60,188,85,244,60,95,96,159,151,
+    187,112,6,22,37,87,115,83,117,27,81,227,75,146,198,131,
+    90,164,37,185,3,58,196,204,108,91,163,214,179,212,47,83,
+    77,77,215,107,248,17,25,131,233,71,84,174,222,46,218,178,
+    246,70,111,99,197,158,181,55,167,138,85,40,204,84,218,228,
+    118,246,71,254,200,50,89,91,35,101,86,216,44,11,51,56,
+    190,127,134,229,22,236,173,250,190,111,22,53,96,42,183,154,
+    202,29,166,149,176,223,201,45,172,193,45,246,105,25,7,147,
+    253,0,194,30,25,7,147,219,16,96,87,185,29,128,22,136,
+    84,205,166,193,67,242,0,86,59,213,20,21,119,185,31,123,
+    10,88,197,87,59,202,67,56,28,39,143,98,211,94,4,251,
+    16,224,242,228,97,0,10,110,139,170,111,157,189,252,85,246,
+    50,244,182,124,16,106,47,99,199,44,65,6,251,31,7,225,
+    61,117,209,222,14,118,230,148,252,84,49,56,92,10,14,175,
+    57,172,146,190,141,44,56,188,229,27,222,60,243,96,255,195,
+    197,162,239,100,201,119,114,245,92,153,245,172,221,188,247,246,
+    221,183,139,254,129,146,127,160,200,14,152,153,243,246,175,218,
+    30,188,241,89,239,231,189,69,207,177,146,231,216,175,67,69,
+    207,169,2,123,138,50,103,204,140,252,42,223,124,61,70,144,
+    247,36,2,177,0,193,56,0,98,0,27,248,231,53,62,157,
+    183,137,118,240,153,57,145,5,60,115,32,129,186,1,12,219,
+    53,135,238,83,130,168,161,229,79,46,104,78,81,78,165,211,
+    146,168,177,216,18,179,89,166,163,172,126,158,78,7,236,69,
+    34,117,130,155,216,182,145,149,160,87,109,20,17,223,169,219,
+    2,93,73,200,216,28,102,229,9,196,63,213,225,212,26,202,
+    79,32,141,158,196,54,27,172,70,74,204,203,79,33,29,204,
+    202,128,143,68,226,201,184,26,137,44,7,140,61,141,87,107,
+    174,99,223,1,74,179,114,103,207,26,187,238,217,14,9,239,
+    189,181,241,22,20,189,229,80,23,62,214,224,75,209,58,29,
+    118,224,88,168,140,35,17,205,29,137,44,165,196,76,2,203,
+    222,72,228,205,76,52,97,180,184,34,17,112,91,84,37,18,
+    161,171,149,143,1,248,140,208,33,232,130,228,241,42,88,192,
+    233,143,209,233,171,223,114,224,137,213,11,21,214,206,117,231,
+    95,255,240,74,133,64,97,87,160,15,57,110,165,184,183,74,
+    241,245,157,20,111,19,237,18,43,178,18,7,209,19,247,14,
+    55,231,144,156,162,3,126,217,68,231,59,108,35,73,230,120,
+    177,93,116,1,71,184,68,183,228,134,94,30,120,199,3,191,
+    189,16,97,181,72,172,41,26,107,145,56,136,208,56,209,15,
+    255,1,201,39,58,68,126,222,43,6,161,175,31,198,104,133,
+    103,64,228,129,140,29,154,191,230,94,205,160,83,47,71,195,
+    32,241,212,65,186,248,253,1,141,144,6,43,27,87,22,27,
+    124,74,53,69,253,194,90,40,67,7,211,61,47,221,115,215,
+    125,114,234,34,42,39,208,169,175,246,5,103,73,119,107,163,
+    177,152,148,134,87,245,192,11,92,167,12,56,210,232,9,209,
+    177,208,237,63,88,245,251,235,238,157,82,91,141,216,224,9,
+    167,20,73,31,2,187,36,82,224,252,235,174,44,29,235,234,
+    213,165,232,237,200,181,204,252,188,36,131,83,175,199,51,59,
+    220,228,76,82,141,131,19,14,225,69,84,141,225,110,51,233,
+    113,250,58,184,130,1,130,38,81,93,212,220,245,145,98,102,
+    107,192,85,5,240,63,153,157,2,152,181,193,175,186,197,249,
+    14,177,91,192,182,154,110,112,17,213,83,159,226,122,205,54,
+    168,126,83,109,77,247,91,45,255,245,154,29,106,172,151,219,
+    27,222,119,237,246,62,67,146,129,97,162,182,215,251,142,128,
+    194,103,200,79,72,146,189,69,110,219,127,66,110,49,106,200,
+    52,82,109,173,106,167,169,214,219,180,182,230,177,52,90,89,
+    216,189,175,94,190,94,43,111,154,86,92,255,136,54,235,138,
+    27,222,9,52,123,103,231,46,27,222,9,54,123,199,106,225,
+    69,195,38,162,34,152,10,183,202,39,225,41,159,34,232,202,
+    82,61,165,128,26,215,125,32,208,92,134,80,128,154,4,249,
+    3,227,23,185,48,51,243,242,233,151,52,91,10,186,41,42,
+    170,51,73,115,100,146,16,244,222,208,130,83,241,132,52,157,
+    82,167,82,153,164,120,86,150,83,178,174,122,157,147,83,145,
+    215,166,47,252,88,243,224,187,145,153,217,87,207,78,94,194,
+    89,116,19,225,81,36,149,138,26,154,9,246,90,60,73,253,
+    113,148,236,176,93,62,138,171,171,45,81,65,94,171,154,84,
+    170,36,151,187,44,218,161,166,167,111,99,255,127,39,84,79,
+    183,163,86,118,149,123,70,224,225,47,79,28,70,173,93,14,
+    245,80,141,189,47,12,143,150,138,131,117,5,183,253,109,235,
+    43,31,189,250,225,27,155,179,63,191,242,225,149,82,223,83,
+    69,255,225,146,255,112,133,48,45,194,118,160,117,195,149,31,
+    121,207,191,225,207,249,191,253,118,219,47,64,181,43,88,7,
+    101,111,96,237,76,197,14,165,111,191,253,246,203,80,223,198,
+    202,39,175,127,252,199,255,240,122,233,232,185,98,232,124,41,
+    116,158,78,199,123,215,189,143,120,97,139,23,54,59,138,252,
+    190,18,191,175,192,239,51,106,187,183,248,238,252,72,145,31,
+    40,241,3,5,126,192,168,221,179,197,239,41,242,125,37,190,
+    175,80,253,83,144,210,159,156,156,28,37,95,140,186,39,159,
+    178,127,241,36,3,80,70,190,108,30,129,237,39,214,8,44,
+    107,114,35,27,153,106,134,124,198,76,131,171,140,14,142,124,
+    6,192,103,12,37,131,130,61,12,251,232,52,24,99,57,100,
+    69,191,209,112,23,95,104,165,216,255,210,223,154,59,178,241,
+    92,209,63,88,242,15,22,248,65,221,48,54,172,147,173,174,
+    179,139,42,32,23,124,97,125,181,230,31,18,130,92,182,97,
+    24,178,98,75,118,13,55,68,136,170,201,41,157,183,129,18,
+    96,81,9,160,16,84,213,192,110,241,226,78,1,53,43,52,
+    171,40,162,139,125,155,169,171,57,88,191,179,90,70,167,55,
+    102,139,152,219,106,234,109,179,166,194,204,31,112,224,45,115,
+    175,223,5,161,157,157,10,187,229,75,4,101,85,55,64,154,
+    255,5,67,114,46,188,76,37,78,11,92,72,66,140,47,103,
+    208,56,233,50,56,77,170,254,3,117,124,48,204,164,100,133,
+    49,210,232,157,129,135,68,165,12,157,32,141,137,104,14,131,
+    132,136,148,186,255,234,140,232,51,238,164,184,209,240,231,208,
+    75,249,57,65,138,87,108,188,43,92,177,217,91,66,229,158,
+    254,15,15,62,234,57,180,213,115,168,216,51,81,234,153,120,
+    207,153,99,115,209,92,244,219,237,246,225,223,142,30,45,180,
+    29,67,225,10,213,65,57,208,153,115,228,28,32,71,45,33,
+    144,163,199,222,192,35,111,239,150,183,55,255,90,209,59,92,
+    242,14,23,188,195,219,29,189,249,217,247,174,108,92,89,155,
+    42,123,91,215,166,215,167,243,226,135,137,162,119,63,22,65,
+    10,215,47,61,242,10,91,94,97,179,179,232,29,43,121,199,
+    10,222,177,74,16,86,164,160,54,255,179,94,1,20,229,81,
+    251,223,51,71,237,242,79,9,18,198,132,247,26,35,254,27,
+    209,45,97,157,9,229,203,46,252,93,143,139,205,239,153,216,
+    162,254,134,153,245,44,241,152,45,57,50,188,107,68,108,98,
+    83,102,134,168,222,122,75,173,222,102,102,223,250,140,162,61,
+    107,251,153,237,185,134,85,60,188,140,163,132,217,229,203,51,
+    52,141,27,5,239,33,19,91,52,251,44,88,151,78,41,52,
+    207,54,46,188,74,51,57,138,48,21,77,128,95,18,167,57,
+    221,90,62,202,240,89,22,225,13,49,174,212,60,168,241,217,
+    169,233,176,83,103,48,170,243,89,204,25,107,158,200,204,217,
+    233,51,145,169,139,147,231,102,100,140,166,229,31,83,94,122,
+    121,134,178,102,85,191,255,180,250,134,218,160,224,53,46,130,
+    163,44,119,236,224,56,172,70,86,83,114,58,191,57,136,191,
+    99,61,89,33,78,215,222,138,141,107,233,43,163,246,125,20,
+    10,111,133,194,15,246,126,62,254,79,7,138,161,169,82,104,
+    10,88,143,109,100,188,222,58,40,135,246,228,212,156,186,221,
+    214,131,63,251,234,160,28,234,205,101,114,25,228,200,62,228,
+    200,64,231,134,47,159,217,100,243,153,66,96,180,226,55,77,
+    29,32,129,246,53,85,193,24,240,221,209,9,242,119,193,201,
+    128,253,11,187,11,161,159,1,72,179,15,205,34,198,152,57,
+    114,118,84,121,240,9,91,213,27,171,83,211,136,247,79,236,
+    30,36,89,21,147,217,95,203,154,18,102,103,200,149,208,138,
+    35,235,0,165,197,154,218,107,125,13,165,85,107,91,239,202,
+    238,18,171,239,200,33,152,51,58,182,172,61,203,102,185,79,
+    97,156,95,214,198,90,113,46,144,21,222,178,154,159,195,106,
+    200,166,147,52,249,100,29,141,123,82,122,178,142,239,83,161,
+    214,85,173,63,217,144,59,112,212,119,109,197,87,221,23,188,
+    65,251,200,65,138,165,154,28,138,140,129,155,90,77,114,212,
+    130,71,167,21,123,63,116,103,224,209,241,155,45,63,172,231,
+    250,47,178,124,67,216,139,39,74,246,229,103,94,65,201,86,
+    204,145,7,102,153,141,227,27,227,208,134,30,93,160,58,184,
+    181,24,85,245,184,33,57,46,35,34,167,195,62,249,5,220,
+    53,102,192,234,214,66,151,109,76,88,208,204,133,124,141,84,
+    69,157,139,37,32,128,209,221,133,83,196,8,173,229,159,0,
+    8,187,116,249,222,141,237,117,193,119,26,39,57,154,171,166,
+    78,20,92,72,45,255,109,24,32,35,118,218,105,128,140,6,
+    36,184,210,203,80,133,208,78,188,193,220,153,141,151,182,60,
+    3,5,207,64,185,103,96,237,204,250,75,219,123,198,30,116,
+    20,247,76,148,246,76,192,207,139,104,155,14,161,132,79,80,
+    144,115,160,233,241,109,248,54,71,62,62,88,12,140,99,49,
+    231,3,31,236,158,247,174,247,93,223,186,111,205,247,101,235,
+    224,230,200,3,247,195,243,191,158,47,182,158,45,181,158,93,
+    115,150,219,59,215,92,229,206,158,141,165,10,241,184,70,41,
+    88,155,2,133,212,222,117,255,196,251,39,242,243,197,182,209,
+    82,27,212,219,90,186,97,252,141,150,71,129,225,173,192,112,
+    49,48,90,10,140,130,254,40,7,186,182,193,63,58,182,241,
+    124,209,63,84,242,15,109,206,126,28,217,242,31,41,248,143,
+    84,87,51,88,12,12,235,107,121,108,212,236,43,6,194,88,
+    40,7,218,239,187,223,119,231,143,21,3,67,165,192,80,33,
+    48,84,246,118,24,214,242,245,162,119,164,228,29,41,208,191,
+    114,215,32,250,184,107,240,213,147,61,77,125,47,175,30,252,
+    153,148,13,8,229,19,43,160,104,118,201,204,239,12,70,152,
+    186,250,248,97,233,198,245,39,105,208,88,31,147,212,133,232,
+    135,141,176,91,152,105,246,191,172,235,68,131,56,220,144,98,
+    52,27,220,170,97,13,219,150,143,207,212,101,4,4,68,184,
+    38,25,39,122,113,117,49,149,81,133,106,216,66,229,169,110,
+    15,149,241,105,96,125,42,53,53,49,145,69,4,232,187,201,
+    231,16,92,32,213,192,230,69,130,153,168,186,37,52,39,162,
+    232,91,59,13,32,149,184,127,193,190,121,98,24,192,208,30,
+    100,65,155,107,136,2,244,140,2,247,94,188,251,98,238,102,
+    209,219,95,242,246,23,188,253,224,43,161,103,52,176,229,29,
+    40,122,7,75,222,193,2,253,43,119,97,28,212,98,4,27,
+    61,91,124,79,145,239,45,241,189,5,190,23,92,56,8,138,
+    188,190,245,11,57,113,35,94,244,10,37,175,80,168,254,237,
+    22,1,213,99,32,234,255,127,209,211,61,121,148,124,113,212,
+    253,130,221,254,27,27,3,48,204,200,207,67,195,103,54,26,
+    175,76,135,131,242,211,184,211,227,8,158,33,212,213,140,136,
+    169,88,36,162,217,21,85,214,236,241,164,74,67,61,141,79,
+    203,169,180,36,171,119,228,89,82,213,69,232,215,66,208,152,
+    74,37,116,84,163,81,208,19,187,11,53,164,255,8,65,61,
+    149,246,92,21,164,17,129,46,198,156,74,3,239,129,227,43,
+    4,129,47,192,245,87,8,128,252,12,125,60,136,209,135,21,
+    140,16,135,175,98,99,184,161,124,27,224,128,27,170,131,175,
+    236,208,244,206,143,105,99,197,225,226,194,21,210,8,58,61,
+    92,123,254,28,168,12,174,253,1,75,31,86,208,51,192,13,
+    61,246,135,242,246,245,149,10,55,128,195,16,127,107,197,137,
+    37,158,116,116,85,92,88,114,147,182,206,138,7,75,94,18,
+    236,172,180,96,201,71,220,190,138,31,75,164,17,188,192,120,
+    184,32,14,222,20,232,88,66,220,52,100,7,107,119,68,78,
+    144,102,249,96,35,63,200,138,156,196,73,14,201,57,111,171,
+    231,249,230,121,209,241,14,59,199,139,78,176,77,188,198,207,
+    24,38,105,249,208,108,195,233,246,206,123,3,120,19,1,207,
+    155,241,208,100,156,90,15,173,189,118,102,29,49,29,162,180,
+    214,107,27,143,83,204,206,74,45,199,252,60,249,190,20,23,
+    56,44,102,151,137,181,102,150,229,87,9,77,43,83,131,246,
+    38,2,153,24,6,45,204,233,98,220,164,201,114,30,160,39,
+    47,130,85,116,212,178,22,101,236,186,87,23,106,31,233,232,
+    166,121,139,145,227,107,108,137,31,44,15,29,193,231,64,185,
+    179,23,19,24,107,240,53,146,204,46,139,8,201,168,195,229,
+    4,2,84,167,242,13,196,30,71,79,229,233,196,86,145,72,
+    87,193,111,113,250,43,164,33,187,204,62,93,96,159,174,176,
+    110,174,239,177,47,88,225,224,9,108,56,48,84,113,98,137,
+    39,125,66,197,133,37,55,9,118,228,102,242,163,185,185,82,
+    64,168,120,176,138,236,2,244,153,211,86,54,171,234,238,175,
+    55,118,178,153,175,154,132,150,28,38,230,210,19,210,152,142,
+    6,6,131,54,87,67,27,15,140,231,166,245,30,83,189,141,
+    38,168,189,80,223,98,169,119,67,189,79,244,211,132,181,95,
+    12,136,94,154,132,246,211,235,68,65,234,92,5,77,201,104,
+    253,88,96,249,153,211,213,251,28,106,10,92,174,157,183,118,
+    208,52,220,137,75,9,176,35,113,213,148,178,29,159,166,234,
+    95,115,34,195,130,49,105,200,200,214,140,114,153,88,19,55,
+    166,248,210,244,66,61,46,109,168,173,177,241,142,76,101,253,
+    156,204,228,133,55,79,132,100,155,101,42,235,239,52,63,37,
+    220,225,28,80,67,95,51,207,117,65,114,234,230,241,37,4,
+    23,137,97,35,53,183,34,169,6,98,52,167,97,86,169,91,
+    218,144,19,188,69,190,39,39,104,57,187,249,29,246,127,133,
+    208,115,246,239,78,208,13,108,241,3,155,206,34,63,86,226,
+    199,10,252,152,81,219,187,197,247,230,103,139,252,80,137,31,
+    42,240,67,229,193,225,6,65,132,24,54,190,44,233,105,184,
+    166,89,133,223,16,164,38,196,62,182,44,35,159,251,254,20,
+    87,179,36,147,98,67,220,101,109,187,228,31,118,36,142,178,
+    140,234,220,189,125,57,164,95,190,120,120,78,220,37,13,102,
+    165,190,126,180,134,219,5,109,71,105,197,202,82,236,38,117,
+    248,245,32,160,151,80,253,72,201,244,22,118,112,196,22,51,
+    201,27,10,68,10,244,217,152,88,226,34,178,20,53,7,249,
+    85,154,97,245,127,35,193,222,164,4,43,7,219,214,28,101,
+    95,43,88,103,215,64,185,189,107,227,226,163,246,209,173,246,
+    209,77,177,216,126,160,212,126,96,237,108,185,173,171,30,201,
+    131,183,115,239,210,221,75,249,209,154,219,2,222,201,7,167,
+    243,220,123,47,110,188,8,62,17,184,41,30,226,111,163,163,
+    129,225,12,180,221,187,125,247,118,222,161,31,156,22,248,129,
+    157,142,178,167,74,197,171,54,61,73,9,142,113,51,132,17,
+    213,68,25,147,4,238,184,240,178,106,67,165,98,238,221,220,
+    229,181,114,193,101,59,102,144,86,236,43,108,214,102,206,33,
+    25,185,1,191,217,33,22,45,244,254,83,102,183,85,91,79,
+    211,87,184,44,167,175,48,107,55,231,160,110,208,245,202,79,
+    102,57,121,95,150,107,30,213,54,58,233,155,124,179,62,162,
+    101,190,36,67,53,68,45,150,79,102,97,94,211,249,141,49,
+    239,155,230,147,152,77,211,186,76,59,225,154,224,203,177,226,
+    92,225,213,61,230,94,13,103,58,245,51,45,219,207,76,254,
+    139,5,39,46,181,207,52,130,35,235,204,242,234,64,189,70,
+    29,52,181,154,79,167,92,141,250,215,114,111,161,33,55,50,
+    67,114,204,250,120,152,91,190,252,70,20,13,6,198,238,244,
+    118,160,116,91,173,223,250,170,101,233,166,209,71,74,37,99,
+    146,229,170,155,41,99,151,194,163,66,211,129,39,94,132,155,
+    157,94,238,157,78,225,237,77,188,166,214,96,182,84,16,188,
+    37,25,49,5,174,249,42,226,156,94,127,208,37,57,147,196,
+    203,53,250,93,8,247,235,232,190,233,73,230,65,218,42,74,
+    244,38,14,167,164,19,113,93,93,203,7,16,132,177,213,163,
+    191,27,193,203,85,244,214,19,245,0,52,86,196,155,105,246,
+    229,120,58,236,166,58,67,115,232,119,63,53,142,222,251,212,
+    216,27,250,145,16,189,178,73,239,86,232,222,32,71,125,64,
+    205,14,78,159,238,97,161,155,42,88,179,6,160,155,36,216,
+    156,41,107,96,232,23,163,225,91,124,179,75,207,26,240,173,
+    174,214,114,71,247,253,185,247,231,62,113,126,236,45,118,28,
+    42,117,28,130,80,202,223,177,246,54,85,42,219,67,225,191,
+    29,255,155,241,135,157,197,161,227,165,161,227,69,239,192,218,
+    217,220,145,124,103,217,223,254,17,119,247,237,181,183,183,59,
+    133,194,224,201,98,231,169,82,231,169,66,224,84,185,179,231,
+    254,245,247,175,111,118,22,59,199,74,157,99,107,231,202,254,
+    206,181,63,161,67,61,246,183,125,112,19,95,41,63,127,182,
+    208,127,41,191,240,87,201,95,36,139,253,227,165,254,241,71,
+    253,71,182,250,143,60,156,45,246,159,40,245,159,40,244,159,
+    248,215,167,114,236,134,39,231,41,7,59,62,234,218,10,14,
+    22,130,131,219,195,135,31,13,159,220,26,62,249,207,206,226,
+    240,249,210,240,249,98,64,200,177,57,41,63,179,221,61,184,
+    185,239,183,251,79,148,246,159,44,236,159,132,191,210,208,11,
+    197,238,211,165,238,211,57,199,118,8,53,103,126,116,179,237,
+    19,241,87,135,31,168,159,191,245,235,169,226,129,211,165,3,
+    167,139,123,207,148,246,158,249,202,110,235,106,253,134,0,128,
+    40,50,216,250,213,32,32,100,167,34,68,54,70,50,124,141,
+    4,126,9,76,204,119,41,67,235,69,49,170,246,208,128,49,
+    175,147,251,12,67,214,251,116,55,128,145,239,145,90,28,172,
+    241,53,55,201,122,43,67,149,228,72,164,169,133,167,45,1,
+    88,168,130,9,168,223,193,23,227,57,214,181,7,240,125,63,
+    251,126,246,189,183,55,222,94,59,95,246,135,10,254,1,122,
+    202,80,110,237,89,155,198,111,197,5,189,154,239,147,42,124,
+    244,171,239,255,159,79,164,24,147,147,99,211,35,127,26,142,
+    206,144,134,179,52,107,136,111,108,136,138,109,8,119,131,230,
+    20,204,95,147,248,92,255,219,185,112,166,186,112,135,177,112,
+    99,25,186,219,111,153,31,239,158,72,73,29,173,221,59,209,
+    106,52,245,224,74,156,250,74,252,109,134,191,179,3,91,216,
+    225,235,113,99,210,31,194,15,102,28,49,20,19,85,14,96,
+    163,242,130,98,165,190,116,155,222,201,105,66,125,189,165,15,
+    87,217,86,197,215,61,247,93,247,187,94,253,54,142,113,31,
+    71,71,67,92,159,7,253,52,249,38,150,91,155,198,79,24,
+    53,201,184,37,25,125,106,61,112,194,152,10,52,15,189,21,
+    182,74,170,161,19,178,174,140,126,176,252,126,141,204,31,32,
+    200,215,176,94,15,182,110,86,193,151,72,136,255,34,141,193,
+    214,233,2,123,186,194,178,220,72,133,0,192,220,3,60,30,
+    28,127,120,246,243,147,180,104,5,94,158,19,242,195,21,2,
+    143,205,177,7,71,63,158,160,69,43,104,239,228,90,243,93,
+    155,99,165,238,3,21,2,101,43,120,130,227,246,228,199,54,
+    143,151,122,14,98,246,99,143,21,248,24,12,221,26,129,131,
+    193,52,69,35,128,186,14,44,53,5,58,14,40,194,7,116,
+    12,211,76,24,117,255,207,34,94,29,96,123,50,224,231,211,
+    43,122,244,38,174,67,189,147,142,39,23,244,40,150,34,216,
+    81,35,10,77,245,8,8,208,248,80,67,163,57,102,244,17,
+    168,197,162,86,199,185,32,1,163,168,178,140,225,190,140,135,
+    70,186,237,161,196,29,169,146,84,207,105,211,67,210,231,106,
+    84,189,185,147,120,127,224,159,213,111,112,61,47,255,165,33,
+    104,74,31,48,105,197,206,48,76,229,88,15,195,86,8,130,
+    227,132,113,175,186,240,91,38,45,171,244,91,38,158,85,250,
+    53,213,184,87,233,183,76,66,133,198,191,138,205,193,216,42,
+    228,255,11,2,196,21,88,229,202,46,247,170,163,236,241,174,
+    242,143,221,161,181,189,235,135,242,174,162,123,168,228,30,90,
+    117,150,219,132,220,177,141,231,192,64,181,141,149,218,198,10,
+    36,240,216,215,177,182,144,155,207,39,31,68,139,190,39,74,
+    190,39,86,61,21,7,199,180,230,142,2,39,48,173,249,215,
+    232,195,10,2,54,230,36,240,215,240,135,192,27,80,124,112,
+    148,62,172,192,205,51,147,76,217,221,82,177,211,194,158,126,
+    163,176,255,144,81,120,250,89,189,240,152,115,87,56,44,0,
+    247,90,97,167,131,233,198,221,89,193,87,8,190,169,215,181,
+    94,99,152,96,133,52,135,95,81,248,141,185,254,69,123,11,
+    3,171,223,9,190,66,240,77,189,78,120,134,1,126,222,9,
+    190,66,240,77,147,6,202,62,255,11,19,225,160,2,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/ext/pystats/livestats.py",
+    "m5.ext.pystats.livestats",
+    embedded_module_data,
+    6398,
+    13685);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,167 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,205,88,221,111,27,199,17,223,59,222,241,67,162,44,
+    215,164,108,70,136,227,173,109,213,34,108,81,82,91,127,201,
+    150,227,192,106,10,7,129,220,64,206,67,137,164,212,137,183,
+    148,206,190,15,118,239,104,89,42,13,184,64,128,202,128,81,
+    200,129,11,171,133,139,234,161,49,84,184,5,92,160,15,249,
+    15,250,74,26,44,44,28,16,32,64,208,7,191,177,112,3,
+    20,126,234,236,46,121,252,16,85,39,104,11,228,116,156,219,
+    189,157,157,157,217,153,249,237,156,190,64,109,151,210,120,190,
+    248,0,200,3,164,35,93,50,81,150,61,101,83,178,164,172,
+    36,177,118,200,148,173,80,54,100,41,89,197,82,179,170,21,
+    206,134,173,72,54,2,99,138,174,154,81,43,150,141,73,72,
+    70,63,68,122,248,35,164,71,30,201,8,61,150,155,75,100,
+    251,116,105,14,165,163,207,89,103,54,45,249,81,93,243,136,
+    103,88,36,173,250,242,229,43,126,232,45,123,197,87,102,140,
+    188,231,43,239,26,174,231,171,239,219,134,99,63,151,128,31,
+    216,251,231,60,135,106,139,228,234,74,145,228,219,117,239,107,
+    234,110,115,221,9,202,74,58,202,202,186,148,13,233,50,81,
+    10,178,30,250,72,201,170,186,66,194,208,143,144,40,137,145,
+    62,162,144,126,93,45,132,95,11,196,20,20,208,90,201,198,
+    129,39,10,115,34,208,30,208,163,100,15,137,182,120,116,25,
+    230,40,122,12,198,6,117,21,172,233,243,247,206,17,106,104,
+    166,177,170,45,152,100,206,211,60,109,31,40,220,135,225,186,
+    100,106,174,75,92,188,188,100,228,151,176,97,47,1,167,135,
+    11,212,177,112,247,36,156,215,108,188,64,176,219,120,79,116,
+    172,185,248,157,185,43,179,92,146,83,242,138,37,47,211,199,
+    59,239,187,176,11,188,53,198,46,241,50,147,193,121,71,39,
+    99,11,166,147,191,62,53,37,94,54,47,195,42,58,212,195,
+    214,201,76,113,197,133,213,220,204,34,177,78,242,22,91,38,
+    232,116,206,114,13,139,189,197,211,45,6,152,231,229,26,239,
+    71,169,227,120,233,142,25,69,106,216,222,104,99,60,163,151,
+    172,162,59,154,78,11,169,126,152,18,175,68,237,188,212,21,
+    118,33,230,186,50,119,157,129,110,73,101,116,45,24,222,108,
+    231,13,174,71,240,123,28,244,102,208,135,135,62,128,32,187,
+    37,223,10,149,209,166,220,107,70,57,244,8,36,61,14,164,
+    221,82,202,74,89,42,203,231,161,125,23,151,89,88,74,171,
+    78,96,202,85,170,217,174,9,193,233,98,111,137,224,124,137,
+    82,98,123,216,89,184,70,242,30,248,209,115,176,198,125,131,
+    117,8,86,8,81,141,174,100,90,123,55,37,12,117,167,240,
+    85,152,189,131,175,201,150,14,249,209,92,142,141,228,114,190,
+    106,120,196,114,253,145,92,119,96,228,114,69,234,228,137,235,
+    230,174,185,142,157,187,161,153,37,150,47,138,75,204,130,31,
+    179,192,229,102,78,135,140,9,93,39,43,190,202,135,253,152,
+    77,150,5,167,171,130,133,124,181,151,25,151,230,199,139,43,
+    222,146,99,143,91,39,199,201,77,111,188,17,12,227,110,219,
+    154,57,238,186,226,138,31,241,28,190,228,106,170,91,165,76,
+    99,228,44,200,118,103,129,220,70,245,61,104,232,192,90,108,
+    123,248,141,135,99,207,134,199,158,14,143,85,135,199,107,195,
+    227,117,36,199,142,113,114,231,157,181,75,235,67,219,169,215,
+    159,165,38,159,166,38,159,140,84,83,103,106,169,51,107,151,
+    183,15,126,103,237,242,122,254,206,236,218,236,246,96,170,18,
+    77,189,96,30,162,67,12,36,242,237,222,12,55,99,229,47,
+    224,199,95,64,180,120,109,209,81,150,188,54,222,78,224,161,
+    201,178,212,59,46,58,35,105,174,91,98,184,213,243,162,109,
+    237,190,86,187,16,234,90,75,102,209,212,37,39,190,171,102,
+    163,160,89,164,151,102,186,244,71,185,51,102,55,163,189,248,
+    94,97,193,190,93,87,222,179,134,10,18,0,99,180,44,205,
+    188,74,74,114,87,41,73,47,210,206,121,173,63,224,235,208,
+    125,14,14,8,200,49,117,245,203,157,57,134,69,160,54,211,
+    138,247,26,136,217,192,196,37,205,214,77,0,196,133,21,158,
+    142,63,226,49,140,93,79,55,141,133,64,30,79,179,162,150,
+    191,14,216,216,158,139,69,141,106,150,144,42,242,81,44,0,
+    107,129,100,175,169,132,222,51,125,223,250,186,218,116,105,209,
+    148,72,217,134,177,19,204,50,242,212,113,73,222,177,245,14,
+    24,100,89,154,128,223,139,41,32,191,146,30,160,69,84,70,
+    31,30,184,37,221,145,55,123,121,29,182,186,115,131,239,201,
+    119,83,115,232,15,176,8,253,22,91,43,228,203,153,9,95,
+    186,65,89,0,184,44,107,48,190,77,15,192,243,101,223,121,
+    19,206,214,188,99,21,47,172,158,221,145,218,189,224,38,115,
+    30,206,20,205,116,47,100,90,83,127,204,228,30,3,242,175,
+    219,168,146,184,40,238,39,239,173,207,60,75,142,61,77,142,
+    109,105,213,228,68,45,57,17,12,81,118,134,206,166,227,126,
+    159,225,26,54,96,140,157,39,148,229,5,77,1,241,67,174,
+    71,253,16,132,128,175,22,76,71,243,40,83,217,143,80,82,
+    52,181,60,0,154,225,58,5,135,90,26,84,6,76,5,202,
+    50,208,87,108,13,106,7,153,219,200,241,194,101,251,60,143,
+    185,157,126,178,151,41,171,35,95,201,226,183,153,176,191,10,
+    235,190,76,161,248,254,117,242,183,131,99,213,254,76,173,63,
+    83,71,177,216,145,237,68,234,193,244,199,211,247,222,188,255,
+    102,37,126,248,179,129,3,27,234,39,161,79,230,254,52,82,
+    57,52,81,29,152,172,13,76,214,81,132,179,173,189,203,71,
+    127,123,179,58,48,90,27,24,173,35,53,152,189,245,222,250,
+    116,53,49,94,75,140,63,75,156,125,154,56,91,77,156,171,
+    37,206,85,226,231,196,12,175,58,112,180,54,112,180,142,66,
+    108,198,197,96,43,63,29,1,82,77,92,172,65,47,126,81,
+    240,254,172,58,112,188,54,112,188,142,164,216,145,207,18,251,
+    215,75,247,87,27,186,125,62,152,88,243,248,238,119,68,28,
+    131,54,150,172,47,126,130,120,189,39,149,165,27,18,85,117,
+    128,47,93,98,199,98,59,4,92,11,218,80,231,237,122,200,
+    118,130,136,1,18,127,47,253,146,29,173,170,246,133,220,168,
+    136,120,230,47,25,46,46,148,108,126,34,98,203,160,212,161,
+    238,110,185,4,7,92,201,36,216,34,48,162,7,34,230,231,
+    153,175,68,129,49,63,159,193,151,225,84,118,113,201,133,180,
+    132,196,118,22,60,205,176,185,68,86,184,96,118,162,65,208,
+    24,121,183,81,71,49,38,173,19,57,32,166,12,123,113,39,
+    112,176,26,71,224,6,107,97,167,192,197,66,133,83,2,216,
+    0,253,119,206,184,190,172,209,69,6,30,186,110,240,51,223,
+    196,124,128,120,132,153,201,113,167,200,234,66,174,43,147,214,
+    105,77,195,214,93,0,73,232,217,212,131,155,55,215,50,15,
+    172,110,20,38,34,91,64,72,32,133,87,141,248,7,55,53,
+    171,104,146,224,237,88,251,213,98,254,198,86,147,134,173,67,
+    41,54,125,138,85,149,109,17,69,176,182,224,220,0,164,54,
+    76,83,204,235,242,83,43,8,58,252,205,166,6,98,132,108,
+    193,206,5,129,167,78,225,81,0,122,157,20,180,146,41,100,
+    182,115,65,208,125,63,221,194,121,63,44,6,159,43,28,211,
+    160,94,164,7,5,26,43,204,195,190,202,109,224,136,215,128,
+    45,63,44,194,133,35,23,22,200,69,199,129,172,238,223,1,
+    84,124,114,142,33,19,203,79,168,185,166,80,60,185,113,170,
+    210,255,109,184,183,15,225,181,183,215,207,84,227,175,255,125,
+    48,113,119,181,50,120,26,238,13,253,119,230,111,204,95,219,
+    15,109,232,60,9,139,151,149,232,105,14,7,190,92,40,238,
+    168,175,56,36,232,77,72,144,27,144,32,255,71,72,80,191,
+    26,32,0,176,132,30,130,44,6,10,146,168,7,194,90,237,
+    255,7,12,12,23,118,207,91,230,58,145,133,39,48,28,232,
+    124,148,203,53,220,64,88,11,44,248,92,248,234,52,10,70,
+    103,169,32,82,190,80,20,16,113,21,138,106,124,249,10,11,
+    46,2,175,25,20,53,68,52,165,123,206,255,24,48,122,225,
+    69,235,251,48,200,240,111,88,102,47,27,222,18,118,138,196,
+    30,61,12,31,89,94,134,153,115,56,205,150,40,76,117,48,
+    182,137,231,230,142,22,138,211,133,19,56,64,129,221,65,128,
+    113,243,205,98,178,187,92,121,44,88,244,24,46,24,38,121,
+    53,12,64,252,124,45,36,160,199,89,34,159,16,137,62,198,
+    218,147,64,102,27,112,64,51,44,255,20,166,162,0,131,144,
+    168,97,24,15,157,64,65,197,214,192,131,239,49,60,24,234,
+    137,7,63,103,204,51,2,14,78,245,134,131,104,252,110,172,
+    18,61,181,174,63,48,63,54,239,217,247,237,173,125,208,133,
+    123,235,134,120,6,55,135,133,244,94,246,85,202,42,43,248,
+    42,237,203,229,68,158,65,59,158,203,253,180,164,153,141,145,
+    8,124,185,58,249,92,142,50,212,224,70,80,86,196,82,246,
+    145,66,15,51,114,132,145,163,140,176,79,4,94,150,114,100,
+    163,74,211,38,190,27,124,81,97,103,188,73,70,153,85,127,
+    230,86,53,255,234,242,30,53,90,71,140,224,126,245,181,141,
+    100,29,193,163,155,12,31,80,147,219,67,169,122,8,158,159,
+    199,246,172,185,235,151,54,134,54,149,77,125,107,166,50,56,
+    81,139,77,214,85,24,169,163,78,242,93,172,158,217,76,212,
+    17,60,186,201,140,244,134,122,122,157,110,28,185,191,92,71,
+    208,220,186,202,31,187,18,97,13,179,33,221,207,189,44,10,
+    217,176,183,82,132,227,70,152,206,247,41,28,108,12,219,49,
+    191,223,21,255,219,2,62,194,139,91,177,25,157,27,244,50,
+    122,94,120,227,2,101,223,9,12,129,221,79,129,212,67,146,
+    36,129,251,165,248,237,126,246,183,141,14,86,58,239,186,28,
+    150,228,58,250,111,201,94,36,141,84,208,209,246,187,30,94,
+    150,36,176,189,55,253,7,167,255,220,101,148,91,246,111,63,
+    47,60,186,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/ext/pystats/serializable_stat.py",
+    "m5.ext.pystats.serializable_stat",
+    embedded_module_data,
+    2275,
+    5254);
+
+} // anonymous namespace
+} // namespace gem5
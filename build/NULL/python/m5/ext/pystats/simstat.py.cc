@@ -0,0 +1,94 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,84,205,111,220,68,20,31,219,99,175,247,59,77,
+    26,146,44,249,112,211,46,97,105,179,161,36,41,161,10,165,
+    85,83,21,1,10,135,144,139,5,88,238,122,54,181,106,123,
+    131,237,13,36,218,74,28,56,4,137,67,14,72,4,132,196,
+    158,170,69,189,228,192,129,63,195,17,62,88,150,144,42,113,
+    234,205,168,156,122,98,158,247,27,34,64,140,159,223,188,175,
+    25,219,191,223,243,252,134,6,6,223,153,159,237,81,245,13,
+    210,144,198,24,200,68,50,98,192,102,13,198,100,101,214,228,
+    100,206,196,50,54,121,153,167,113,78,195,134,96,38,228,68,
+    108,243,134,104,38,229,100,108,11,70,202,76,203,233,216,78,
+    24,25,51,43,103,25,196,162,187,72,19,191,64,90,146,36,
+    30,113,8,61,230,186,15,151,115,90,106,11,149,210,79,193,
+    41,49,161,168,169,46,113,117,147,148,112,136,55,244,138,27,
+    226,247,116,199,13,197,247,119,93,189,102,169,70,200,111,91,
+    212,120,202,180,235,51,183,238,57,174,173,86,220,45,87,117,
+    169,207,223,181,107,245,93,106,36,33,64,87,234,21,234,228,
+    62,160,59,222,174,89,123,196,118,232,226,202,224,231,159,235,
+    126,254,171,12,124,62,65,50,163,33,153,221,166,48,200,28,
+    193,132,159,234,149,18,65,99,215,97,198,36,49,20,229,58,
+    81,145,36,73,170,202,246,115,67,85,248,63,85,241,80,149,
+    236,92,90,82,99,135,223,65,227,134,159,174,225,127,222,81,
+    227,255,37,159,32,105,146,161,21,89,146,35,121,146,237,103,
+    170,220,128,61,176,182,154,162,84,242,242,136,38,80,226,82,
+    97,98,75,55,1,235,131,55,83,18,29,20,101,87,213,45,
+    71,82,13,67,114,239,19,201,233,242,224,72,213,154,45,169,
+    210,142,190,71,44,201,209,205,186,161,2,167,229,120,93,152,
+    173,216,36,246,21,160,63,204,131,86,42,61,206,194,243,157,
+    21,68,83,238,145,29,189,83,54,218,143,18,75,139,99,155,
+    161,240,224,83,213,222,113,42,60,234,15,129,222,105,160,249,
+    107,4,52,55,152,6,82,122,201,6,75,61,166,231,113,212,
+    99,123,30,166,94,175,95,27,124,19,163,51,198,35,122,63,
+    238,121,27,232,163,23,62,164,59,60,20,30,38,220,116,191,
+    170,129,26,66,227,47,127,0,131,190,154,208,16,133,146,217,
+    44,9,118,158,70,236,17,80,208,151,246,40,85,33,175,187,
+    196,116,194,132,67,40,148,174,93,18,67,236,16,163,122,86,
+    173,61,6,11,184,7,100,63,228,247,84,163,78,28,145,6,
+    164,206,120,126,201,177,43,75,187,251,238,253,154,181,100,174,
+    46,145,207,92,234,1,65,206,18,197,17,140,242,238,126,40,
+    42,138,110,233,174,162,28,140,116,184,45,119,35,203,116,55,
+    231,99,170,62,71,209,8,154,189,124,136,125,177,16,204,149,
+    97,158,14,46,173,193,124,33,152,95,129,121,238,73,65,250,
+    225,202,119,87,190,45,127,95,142,16,147,124,41,86,95,190,
+    115,120,251,104,252,215,204,216,209,198,241,197,227,250,105,166,
+    232,103,138,94,44,17,215,45,122,6,192,148,240,38,29,165,
+    115,240,62,150,74,155,65,9,83,138,98,214,180,186,1,118,
+    70,81,62,169,171,70,39,147,80,20,173,86,81,20,27,120,
+    182,1,220,48,175,40,170,101,213,220,184,169,28,154,202,64,
+    42,17,3,164,91,110,200,87,141,154,234,218,56,14,208,67,
+    196,78,65,30,216,178,161,113,236,23,169,250,17,217,211,96,
+    23,64,229,186,170,4,40,228,25,64,161,127,69,44,203,139,
+    17,2,37,162,243,211,199,111,251,99,69,15,131,156,226,98,
+    48,62,115,108,249,227,139,30,6,57,197,139,65,97,190,185,
+    218,26,107,145,86,193,191,184,226,23,86,61,12,114,138,87,
+    131,73,169,57,222,116,90,119,154,7,254,133,215,252,201,101,
+    15,131,156,226,101,186,239,226,213,96,101,45,88,191,25,92,
+    191,17,165,115,60,69,139,170,39,19,115,77,209,159,40,69,
+    60,68,4,68,183,46,251,83,87,163,4,184,34,154,91,104,
+    214,91,91,39,197,150,236,47,172,249,179,111,68,73,136,167,
+    208,76,177,185,221,90,62,225,91,215,253,226,53,127,250,245,
+    246,134,25,52,54,113,228,28,223,105,22,91,83,39,27,63,
+    143,255,244,174,55,255,150,63,125,211,155,184,233,143,222,138,
+    178,221,135,158,165,218,88,1,66,155,165,124,155,4,193,221,
+    223,213,173,157,24,229,54,172,66,143,133,172,218,57,187,21,
+    232,60,59,25,247,250,14,156,223,49,21,97,178,119,116,196,
+    172,132,57,248,187,251,39,66,155,207,152,148,34,168,30,81,
+    207,197,245,118,151,220,176,47,199,63,24,101,235,23,170,104,
+    127,49,76,116,13,49,179,30,154,25,148,136,229,25,54,66,
+    255,79,229,16,243,178,135,22,6,37,64,147,222,176,4,72,
+    242,134,37,64,175,120,195,18,9,147,12,197,241,239,234,208,
+    248,29,166,63,206,72,197,31,253,39,186,163,217,34,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/ext/pystats/simstat.py",
+    "m5.ext.pystats.simstat",
+    embedded_module_data,
+    1118,
+    1998);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,273 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,57,253,111,27,199,149,179,203,93,126,83,36,37,
+    138,250,176,100,173,36,203,182,84,153,146,63,234,200,142,227,
+    196,177,18,219,181,163,228,234,164,185,240,156,35,87,220,165,
+    68,103,249,209,217,149,109,201,84,163,22,57,84,14,116,8,
+    27,56,48,239,154,244,120,64,154,83,209,2,245,1,57,160,
+    127,6,25,236,93,136,197,25,200,225,80,224,242,27,131,52,
+    64,145,95,238,222,204,114,201,37,37,55,65,128,163,86,111,
+    119,102,222,204,190,121,223,111,246,191,145,237,199,55,239,95,
+    158,96,16,122,128,36,36,49,10,138,155,119,38,206,208,59,
+    27,103,225,206,42,142,44,23,231,24,50,230,80,248,172,51,
+    238,164,207,156,226,202,186,227,238,172,39,238,201,122,227,222,
+    172,47,238,203,250,227,254,108,32,30,200,246,196,123,178,193,
+    120,144,65,178,27,59,37,94,114,42,161,108,56,30,102,16,
+    139,100,167,228,250,157,251,35,120,235,111,25,139,24,201,35,
+    247,74,94,57,144,230,36,223,91,220,71,208,243,219,22,161,
+    241,190,111,156,227,223,51,39,194,162,75,72,10,188,133,164,
+    158,143,88,24,97,91,35,253,176,26,123,51,106,181,187,230,
+    13,72,72,28,148,34,82,240,45,46,62,36,133,164,48,188,
+    161,31,222,208,11,237,97,169,95,234,131,251,1,137,185,142,
+    166,163,159,147,9,75,211,140,225,91,206,168,114,74,75,40,
+    114,90,131,166,71,193,107,137,148,152,90,149,167,221,70,224,
+    229,215,94,122,46,113,241,242,115,23,175,94,89,186,100,112,
+    139,153,148,102,184,175,104,50,22,181,60,54,184,107,25,21,
+    218,47,22,180,76,62,39,42,134,235,37,81,131,177,156,193,
+    191,188,86,80,100,131,127,37,7,3,159,147,61,255,134,49,
+    252,23,150,85,13,139,41,237,186,38,106,159,35,232,133,215,
+    185,178,226,29,53,179,33,27,174,66,115,174,19,203,218,26,
+    206,165,90,156,106,74,219,65,164,189,132,136,180,53,219,216,
+    205,214,179,198,219,122,29,214,83,17,117,242,189,179,5,156,
+    96,54,126,234,21,224,119,49,159,45,100,20,89,16,133,21,
+    37,191,124,76,213,214,161,209,36,74,56,154,76,206,36,147,
+    179,66,50,249,116,50,41,136,57,9,158,254,38,22,139,189,
+    158,76,78,11,153,156,150,135,105,88,94,89,83,68,76,23,
+    147,239,20,176,172,170,176,123,225,246,106,38,181,42,100,69,
+    13,88,170,66,43,15,203,170,192,1,178,246,170,26,163,232,
+    211,156,193,98,224,65,202,164,193,112,165,115,116,130,225,1,
+    134,229,84,69,212,228,223,48,184,23,8,86,9,233,194,215,
+    135,85,156,154,43,172,107,171,249,220,92,246,251,115,242,29,
+    13,90,100,85,117,142,192,76,78,146,239,196,10,235,134,191,
+    185,98,130,236,9,31,128,185,115,100,145,49,0,91,232,43,
+    63,242,247,236,156,125,111,69,143,30,217,117,213,162,243,122,
+    116,190,230,59,174,251,142,87,185,227,95,18,246,116,8,193,
+    97,9,97,230,47,8,161,155,221,215,65,242,75,211,44,238,
+    135,103,76,212,22,15,181,118,129,135,1,26,1,139,68,224,
+    159,124,7,19,210,22,8,74,47,165,241,143,190,192,206,217,
+    210,74,205,119,80,247,29,172,114,7,241,8,33,203,70,21,
+    114,55,239,95,94,163,158,64,70,196,250,193,242,153,184,67,
+    234,147,56,208,120,78,226,101,62,205,74,78,120,6,75,148,
+    93,208,118,131,85,184,161,237,129,103,175,236,131,62,71,154,
+    29,106,45,218,126,130,121,30,192,243,91,120,20,211,241,24,
+    76,47,96,6,60,8,44,144,224,249,229,30,201,134,9,43,
+    116,180,211,78,176,112,62,30,148,122,40,69,127,153,10,142,
+    218,116,8,112,195,64,67,175,29,235,91,204,13,193,220,62,
+    41,252,173,222,67,124,69,68,242,129,101,244,27,30,98,170,
+    87,136,50,137,255,2,220,165,186,122,65,72,43,196,42,114,
+    178,36,80,61,19,242,105,65,91,53,149,90,21,150,101,37,
+    127,27,44,68,176,91,251,172,240,134,188,14,248,203,235,4,
+    51,99,218,136,148,135,85,36,211,12,192,120,96,209,204,45,
+    89,0,83,202,104,194,81,57,182,18,3,27,91,206,139,88,
+    138,21,112,62,5,214,148,199,177,84,30,204,106,158,222,98,
+    153,66,10,172,207,52,160,231,114,26,206,128,121,137,88,6,
+    162,40,57,121,44,201,152,52,76,3,76,38,237,4,197,82,
+    171,25,69,194,114,14,172,249,86,70,205,0,225,48,39,27,
+    243,210,213,94,94,149,155,91,3,107,149,232,144,160,97,89,
+    62,162,10,234,170,88,144,97,73,57,71,200,188,45,194,134,
+    215,50,138,246,164,112,75,84,214,128,128,172,184,46,164,86,
+    197,220,138,76,87,90,94,211,154,124,17,37,9,54,155,199,
+    176,211,108,254,22,60,138,105,240,44,183,97,123,38,213,249,
+    156,178,14,99,105,5,124,113,139,83,38,21,116,165,46,250,
+    233,192,209,105,32,223,116,151,170,144,3,39,96,50,195,224,
+    112,62,175,225,32,177,148,86,228,128,159,19,89,6,12,189,
+    63,247,65,212,100,32,58,162,44,243,182,143,65,43,96,186,
+    137,22,182,228,40,50,105,118,133,217,100,139,44,254,184,200,
+    86,28,104,159,95,103,244,185,1,179,55,29,155,220,182,47,
+    205,128,221,185,139,220,77,206,26,171,240,223,60,127,177,171,
+    189,201,107,129,54,110,145,239,116,44,139,232,245,113,250,70,
+    231,166,11,232,115,237,183,126,209,241,75,84,116,254,18,44,
+    228,3,71,209,149,102,59,87,96,208,206,68,209,129,47,22,
+    29,144,13,56,255,206,102,15,155,238,162,187,226,222,111,69,
+    200,5,152,206,136,44,57,109,243,156,69,116,179,53,242,24,
+    154,220,69,103,145,75,59,186,105,41,178,15,63,206,16,25,
+    120,90,152,182,181,232,110,29,132,178,77,207,166,23,70,90,
+    88,21,239,99,222,226,237,164,147,236,86,27,176,97,216,214,
+    232,164,5,104,240,183,118,71,34,164,107,9,19,65,224,30,
+    0,70,103,76,32,42,213,7,255,95,158,7,240,30,243,128,
+    170,209,235,67,84,48,160,60,246,24,81,100,239,57,58,73,
+    250,125,127,145,41,178,105,246,23,236,206,48,196,9,146,14,
+    120,193,22,115,96,48,185,148,76,98,98,108,222,224,114,98,
+    22,50,9,106,94,84,165,85,162,84,160,229,91,52,124,124,
+    237,61,167,64,18,66,98,200,249,141,195,45,119,21,75,36,
+    50,185,140,150,72,196,206,41,249,148,168,168,231,99,109,188,
+    191,34,171,92,0,240,231,45,212,64,220,96,79,27,252,87,
+    100,172,180,88,158,122,212,55,90,150,43,55,106,125,39,244,
+    190,19,13,23,12,212,195,253,165,181,82,160,225,232,64,167,
+    209,232,107,38,246,249,255,194,111,58,96,4,196,166,141,38,
+    136,209,83,114,13,119,66,54,157,147,225,40,228,11,208,76,
+    72,144,69,37,18,6,159,209,228,172,106,184,177,124,75,198,
+    170,44,25,78,177,80,144,115,112,199,106,65,201,104,134,51,
+    65,125,163,225,85,101,77,146,211,226,154,2,125,224,5,193,
+    63,24,129,132,249,96,162,76,251,13,78,149,149,52,158,32,
+    111,228,225,229,169,55,12,39,164,32,233,204,29,224,96,94,
+    146,13,183,229,241,240,52,145,37,137,225,6,71,38,27,76,
+    2,38,91,228,170,126,147,187,214,239,25,51,72,187,45,126,
+    110,244,238,229,241,101,50,47,205,80,126,214,221,115,213,206,
+    171,225,68,207,48,207,50,219,220,78,224,179,222,72,73,42,
+    13,151,252,219,124,189,167,175,129,252,158,51,245,3,194,63,
+    157,249,199,51,255,240,228,251,79,222,187,182,253,124,105,177,
+    193,118,112,152,130,207,38,143,124,248,212,167,147,167,63,153,
+    60,93,155,92,208,39,23,26,60,244,126,65,134,254,68,192,
+    246,229,175,188,72,56,186,235,174,141,29,215,199,142,55,16,
+    19,56,75,193,47,124,37,174,36,215,67,253,15,252,239,250,
+    43,209,234,193,249,221,8,0,243,122,56,85,29,93,168,133,
+    206,232,161,51,85,122,213,131,253,13,228,8,156,169,15,140,
+    150,83,101,92,78,221,191,91,226,234,3,7,30,220,125,247,
+    110,229,228,46,83,27,152,209,7,102,118,79,232,3,49,232,
+    15,69,238,7,62,13,29,250,36,116,168,34,237,46,62,60,
+    84,157,122,162,22,90,208,67,11,213,208,66,99,8,5,35,
+    116,127,141,17,116,226,20,236,221,87,31,29,127,255,117,32,
+    202,51,71,193,189,23,182,23,75,227,165,151,235,254,208,206,
+    213,79,253,19,159,248,39,42,167,118,35,53,127,76,247,199,
+    170,244,122,52,58,89,89,252,240,106,109,116,94,31,157,223,
+    230,116,247,112,149,94,84,233,48,177,186,111,155,158,21,109,
+    9,90,119,122,134,15,194,109,154,53,28,10,168,6,73,14,
+    33,209,60,139,58,83,52,87,2,170,131,28,8,63,108,23,
+    62,237,90,70,173,84,237,81,176,183,116,234,254,83,181,224,
+    184,30,28,175,186,199,77,58,159,70,93,81,136,181,232,140,
+    80,58,193,5,160,155,173,193,91,45,138,24,124,154,18,70,
+    137,161,171,168,44,85,77,147,36,127,34,145,202,231,52,17,
+    188,5,208,21,181,211,213,238,151,201,172,32,37,174,30,236,
+    43,105,247,239,86,131,19,85,247,132,153,68,218,153,71,124,
+    202,36,33,234,4,128,171,224,44,31,32,59,89,224,126,253,
+    212,253,130,79,219,132,208,88,132,244,233,71,232,1,3,78,
+    53,32,217,72,38,252,155,230,218,36,227,103,8,184,96,243,
+    90,66,219,158,32,252,239,177,39,218,183,74,240,201,26,255,
+    3,127,64,186,165,57,163,20,180,52,167,55,90,230,74,51,
+    85,255,72,235,106,56,44,164,189,59,252,142,234,1,229,209,
+    169,215,50,178,149,5,29,37,30,99,86,32,62,121,150,38,
+    54,211,36,251,35,14,108,221,204,85,32,117,33,221,49,208,
+    40,142,236,134,178,4,63,215,173,80,77,151,104,87,168,102,
+    151,210,86,168,63,130,204,22,239,191,80,11,78,232,109,177,
+    45,25,174,166,47,76,217,115,18,206,218,222,130,169,85,54,
+    225,85,236,108,104,111,26,66,79,103,56,162,155,157,250,97,
+    51,157,178,50,90,1,46,72,127,83,26,164,103,201,36,217,
+    126,50,9,187,163,218,105,56,86,100,109,218,97,147,55,169,
+    79,85,135,41,106,186,85,252,18,128,141,64,123,155,48,163,
+    64,144,134,233,22,27,110,20,138,236,220,125,231,205,183,223,
+    44,107,149,87,107,193,99,122,240,88,213,125,204,180,29,194,
+    134,14,219,105,213,193,207,55,119,89,217,111,107,72,179,113,
+    166,200,124,99,253,251,159,94,203,219,239,149,116,91,198,34,
+    36,209,148,33,80,194,170,180,50,110,87,181,246,154,185,181,
+    88,179,118,158,21,154,185,252,196,190,201,252,76,43,153,159,
+    0,198,10,23,160,68,206,104,171,173,69,146,201,102,41,108,
+    86,223,51,164,250,86,212,124,251,205,41,156,87,85,24,137,
+    193,136,42,23,68,122,50,209,44,171,105,105,205,26,188,89,
+    89,146,234,215,242,39,180,148,182,251,19,142,108,96,163,199,
+    38,39,104,223,34,88,7,77,65,249,65,80,239,108,188,189,
+    241,193,108,229,118,109,120,78,31,158,171,5,231,245,224,124,
+    213,61,111,26,155,93,78,45,119,242,43,100,185,147,14,131,
+    99,52,27,118,167,22,226,160,253,28,163,91,122,155,76,145,
+    105,159,109,64,118,142,218,57,54,56,169,1,234,164,32,7,
+    223,228,89,72,184,138,93,89,38,118,22,29,69,190,229,186,
+    6,233,73,16,187,145,253,46,242,55,15,50,58,181,160,181,
+    78,243,40,196,118,12,210,22,200,210,52,143,143,16,150,59,
+    32,85,162,229,190,225,73,175,41,10,93,197,244,160,206,182,
+    144,240,143,208,94,95,234,68,86,142,98,218,216,15,1,108,
+    4,219,178,163,242,254,9,193,252,49,178,188,232,87,61,200,
+    31,45,173,124,160,214,124,147,186,111,146,120,201,99,143,162,
+    147,149,75,181,232,172,30,157,221,190,84,143,28,208,35,83,
+    219,158,166,187,101,61,227,20,180,220,109,112,112,123,189,28,
+    185,247,230,206,155,36,181,24,175,71,135,203,139,165,155,213,
+    144,96,94,127,110,240,214,20,211,120,207,117,43,133,211,82,
+    138,255,64,251,197,24,200,150,109,102,219,161,4,108,177,171,
+    232,208,92,246,209,46,3,239,192,4,165,56,9,17,11,84,
+    193,86,166,112,69,174,194,161,125,126,221,234,166,58,24,68,
+    148,164,200,1,165,45,138,138,156,253,208,163,169,76,167,154,
+    202,116,251,59,59,19,104,99,109,143,249,155,73,44,177,126,
+    40,229,205,156,215,68,167,245,189,93,173,156,248,12,81,38,
+    30,147,234,27,19,94,226,69,210,225,53,23,38,235,154,57,
+    5,111,170,215,57,138,109,166,216,76,198,76,49,120,75,179,
+    76,197,34,40,27,161,182,98,153,196,236,16,204,159,181,52,
+    171,225,69,225,126,61,52,177,205,63,10,71,223,187,91,249,
+    254,238,225,218,192,113,125,224,248,191,157,124,184,246,175,103,
+    63,62,91,11,159,215,195,231,33,147,245,204,80,176,125,161,
+    222,55,88,14,223,95,216,94,172,247,13,60,120,250,221,167,
+    43,167,107,125,51,122,223,12,209,172,40,164,171,37,190,196,
+    211,248,254,190,175,178,168,15,78,87,123,167,171,254,246,213,
+    240,88,75,81,85,3,167,70,242,126,154,191,155,153,72,63,
+    73,48,72,144,134,50,195,155,72,100,243,210,154,66,158,33,
+    107,250,241,154,168,52,71,32,173,147,242,169,68,2,63,75,
+    56,225,200,64,0,38,113,5,191,66,154,220,114,62,175,96,
+    146,218,99,162,108,216,71,192,15,8,120,129,0,82,59,210,
+    216,134,175,19,64,170,6,76,42,81,106,139,148,111,248,48,
+    1,212,20,40,47,199,45,240,20,97,223,135,12,241,170,214,
+    95,131,117,243,238,6,34,32,50,200,67,2,223,9,78,49,
+    252,68,25,234,5,184,117,3,39,195,79,86,232,208,228,110,
+    132,222,186,129,147,229,71,203,71,65,42,125,187,185,234,244,
+    57,125,242,41,125,24,132,1,189,221,192,205,242,147,229,193,
+    202,212,174,99,247,250,195,88,245,232,51,250,196,5,125,232,
+    89,50,56,217,13,188,232,252,179,12,84,131,124,12,228,192,
+    199,234,145,1,218,168,79,204,236,158,215,39,206,210,198,103,
+    158,112,41,166,131,83,224,45,52,27,240,59,249,227,229,139,
+    13,4,183,202,229,221,87,30,158,252,67,79,245,228,243,250,
+    177,75,250,161,203,180,183,27,132,252,252,120,125,96,164,124,
+    189,114,164,124,3,234,144,134,3,58,200,43,166,202,142,242,
+    223,86,7,191,167,247,206,234,158,99,13,30,186,161,244,232,
+    0,35,94,126,166,124,189,129,224,86,249,235,93,249,225,197,
+    63,28,172,158,186,164,199,46,235,83,87,104,239,99,129,41,
+    64,34,182,142,67,215,86,18,79,68,11,193,205,54,36,49,
+    27,1,132,68,243,232,128,53,143,14,160,178,15,37,200,9,
+    90,98,69,206,145,143,7,16,17,186,244,195,240,211,113,243,
+    236,76,194,18,116,85,136,162,144,58,7,82,65,46,82,102,
+    106,220,80,149,139,152,151,57,241,130,165,246,123,146,121,74,
+    220,239,246,16,247,152,92,16,237,141,178,63,13,23,25,201,
+    118,38,164,217,28,230,27,212,81,99,193,222,215,225,146,187,
+    214,75,179,100,69,59,29,69,68,76,4,222,96,115,203,192,
+    46,110,227,85,123,254,217,58,94,77,38,137,179,36,78,144,
+    156,54,74,153,220,10,57,125,204,231,132,116,6,171,154,176,
+    6,46,148,124,147,160,71,138,212,35,90,39,150,205,179,72,
+    41,182,132,137,200,76,97,112,224,29,204,100,93,53,77,152,
+    136,150,202,24,60,9,97,169,225,164,31,128,164,142,12,201,
+    3,153,171,57,13,147,2,229,215,68,56,215,168,112,190,114,
+    162,158,232,59,55,222,190,81,62,84,11,140,233,129,177,173,
+    231,235,174,192,214,79,202,209,10,243,254,208,191,31,62,253,
+    201,208,233,234,208,233,71,189,19,191,190,178,43,253,243,139,
+    31,190,88,13,159,218,118,214,135,198,254,222,93,138,220,235,
+    169,251,194,165,241,157,51,150,84,247,151,229,185,111,45,203,
+    238,19,58,51,132,65,104,26,91,204,168,41,122,224,186,47,
+    115,99,228,59,69,154,176,98,30,209,106,142,230,26,182,170,
+    197,151,82,100,17,55,121,64,2,247,239,9,194,8,50,21,
+    212,255,243,107,63,187,86,138,148,180,26,55,162,115,35,85,
+    235,178,92,52,81,228,37,40,14,91,58,219,236,25,193,228,
+    84,142,126,32,49,92,183,101,241,13,136,49,134,211,252,40,
+    71,163,24,73,143,114,41,13,220,177,138,57,42,29,109,189,
+    0,42,128,73,176,194,36,171,48,61,52,57,176,52,253,50,
+    117,196,212,97,83,191,28,107,189,145,120,118,154,7,211,188,
+    139,138,220,8,191,10,239,188,42,175,147,111,123,228,51,30,
+    94,55,153,64,149,130,152,33,21,55,221,111,151,201,126,237,
+    62,103,70,150,243,184,64,249,12,220,120,4,16,202,80,134,
+    105,156,70,76,112,171,135,252,213,145,103,139,254,213,81,143,
+    213,115,176,218,121,213,209,88,181,243,106,176,30,134,109,160,
+    255,95,16,69,92,24,194,4,51,91,231,190,87,237,188,26,
+    78,196,250,182,134,74,39,171,204,64,141,25,208,153,129,6,
+    203,51,39,202,16,0,224,86,57,66,111,109,240,133,3,177,
+    131,22,82,35,180,119,46,195,140,149,79,146,119,141,85,158,
+    160,183,54,104,207,37,61,238,215,24,6,156,239,254,240,11,
+    10,255,100,239,223,96,145,127,106,251,9,221,119,168,230,59,
+    172,251,14,111,185,129,244,72,127,21,133,32,246,49,195,16,
+    175,58,128,215,197,244,151,150,26,8,110,149,117,122,235,6,
+    17,150,33,17,113,127,64,197,255,127,83,178,46,60,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/ext/pystats/statindex.py",
+    "m5.ext.pystats.statindex",
+    embedded_module_data,
+    3982,
+    8075);
+
+} // anonymous namespace
+} // namespace gem5
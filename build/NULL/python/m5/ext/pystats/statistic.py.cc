@@ -0,0 +1,228 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,173,89,235,111,219,214,21,191,148,72,138,212,219,242,
+    251,17,155,177,211,164,178,91,103,91,154,98,117,211,174,105,
+    27,116,77,91,119,168,211,1,211,90,40,180,72,39,74,245,
+    240,72,42,109,84,23,117,135,0,115,11,127,208,128,12,211,
+    135,98,40,48,52,64,144,254,21,3,246,181,147,11,1,19,
+    8,20,8,208,15,67,191,49,72,6,12,5,6,236,156,203,
+    135,72,137,78,95,163,175,15,121,206,229,189,188,175,115,126,
+    191,123,245,21,241,93,188,115,191,215,5,241,103,162,16,133,
+    169,144,42,83,96,24,124,142,84,34,213,104,33,90,101,11,
+    108,149,43,112,85,190,192,87,99,133,24,228,69,21,182,34,
+    84,197,130,72,159,185,74,188,154,40,36,24,18,33,47,16,
+    133,191,78,148,152,202,168,226,77,150,144,219,172,251,169,66,
+    146,230,10,144,43,170,201,155,81,200,139,122,121,41,154,23,
+    135,188,196,80,94,154,230,37,33,47,165,166,7,242,50,52,
+    47,13,121,153,161,188,172,146,221,32,249,145,175,81,201,51,
+    102,244,236,179,207,229,57,184,213,174,153,194,139,134,170,201,
+    155,21,213,100,95,46,235,134,41,188,186,109,148,235,53,185,
+    98,114,175,215,224,225,107,198,46,147,60,187,169,27,154,92,
+    50,54,12,217,0,61,177,97,212,53,249,146,122,225,218,182,
+    90,242,143,99,210,29,199,47,232,56,170,164,192,40,164,16,
+    121,29,198,179,16,85,89,149,83,34,103,32,71,229,213,216,
+    180,87,8,172,209,80,43,27,106,229,28,171,16,176,242,104,
+    21,157,63,37,174,68,84,86,137,6,203,42,236,128,206,13,
+    232,124,176,214,173,56,204,18,87,16,21,241,58,41,196,149,
+    24,140,98,194,20,113,8,96,172,202,165,230,153,184,4,215,
+    133,203,170,36,59,195,35,109,202,186,42,149,42,178,174,75,
+    91,117,77,146,43,21,233,87,215,140,203,245,154,164,187,197,
+    244,85,90,204,228,174,202,149,6,12,188,1,99,104,178,141,
+    90,217,48,19,138,170,151,180,50,157,3,83,80,100,40,2,
+    153,235,37,158,244,175,8,252,227,220,222,123,153,142,240,14,
+    179,67,138,94,230,78,4,52,198,211,162,160,69,60,141,5,
+    205,91,21,59,28,104,222,154,84,200,6,185,197,172,223,226,
+    180,52,104,90,6,69,22,197,8,138,28,46,2,222,100,117,
+    181,178,117,232,11,58,54,82,162,215,55,199,117,173,116,114,
+    155,246,251,100,245,244,73,245,29,3,52,28,0,253,164,55,
+    12,171,219,176,252,138,197,50,244,187,88,108,230,188,81,93,
+    117,109,167,176,210,71,64,236,18,43,75,38,102,247,216,253,
+    120,111,108,10,110,162,123,155,61,190,199,118,133,169,222,148,
+    4,106,106,15,254,238,97,111,74,222,8,56,99,69,199,107,
+    153,142,151,225,203,219,33,87,60,237,38,60,221,246,180,13,
+    162,141,97,167,35,102,20,38,150,246,249,22,163,77,96,139,
+    240,29,73,155,4,137,205,215,212,109,109,176,249,182,237,44,
+    190,156,165,205,255,50,147,107,61,118,99,237,195,247,247,223,
+    239,8,243,26,46,176,91,236,58,92,176,156,160,142,154,92,
+    85,139,69,51,94,44,86,235,74,163,130,207,201,98,241,119,
+    13,185,226,228,196,138,69,165,94,130,138,113,190,204,76,177,
+    40,215,106,117,252,96,189,166,131,53,134,83,48,139,34,129,
+    98,10,197,17,252,6,161,159,162,109,213,82,174,120,24,219,
+    245,21,109,87,255,207,138,68,56,193,34,40,4,146,204,236,
+    158,223,61,255,193,249,94,60,215,58,181,255,104,135,157,132,
+    116,192,78,14,233,35,211,237,165,27,71,58,236,60,164,3,
+    118,190,151,158,104,189,219,77,47,117,88,76,7,236,146,21,
+    39,11,75,189,249,197,222,67,249,222,242,170,149,74,114,71,
+    45,2,226,78,38,103,113,168,240,36,51,217,210,247,171,86,
+    12,53,193,213,68,212,226,100,98,190,93,186,241,166,149,64,
+    45,73,70,103,219,79,118,115,39,250,181,248,196,28,195,45,
+    88,100,88,216,253,199,94,7,130,84,220,185,223,219,1,241,
+    135,208,48,165,242,91,17,95,120,137,217,97,203,9,46,2,
+    4,23,1,130,137,168,198,3,193,36,168,243,160,39,124,193,
+    68,216,35,91,140,18,187,158,42,36,247,200,59,76,33,5,
+    225,68,52,249,141,146,92,145,181,102,158,6,133,179,146,78,
+    213,161,160,33,97,32,176,3,7,93,141,235,3,222,87,226,
+    124,253,139,185,75,254,2,136,63,49,193,69,127,19,254,111,
+    123,218,39,126,87,241,174,29,70,97,32,148,68,119,216,207,
+    34,55,161,230,219,94,237,12,13,21,249,232,186,118,28,63,
+    61,110,59,9,167,55,182,85,141,174,188,60,79,221,196,14,
+    19,193,54,154,98,177,72,67,99,177,216,15,22,187,246,242,
+    196,162,205,140,61,22,94,4,192,8,167,255,2,196,127,118,
+    201,191,211,68,76,127,24,219,143,253,83,152,250,2,92,62,
+    135,203,175,55,50,222,155,90,234,141,31,177,18,68,156,190,
+    75,120,49,126,31,133,21,20,116,25,64,155,193,225,210,218,
+    2,126,78,66,113,20,197,34,10,1,91,199,109,85,234,178,
+    97,70,203,53,67,91,66,43,122,91,152,115,153,41,167,31,
+    37,181,82,41,22,33,48,228,137,19,24,158,177,123,115,220,
+    21,231,48,227,175,118,15,14,243,182,145,214,120,59,218,154,
+    233,38,230,58,44,166,3,118,206,118,28,219,107,18,41,14,
+    122,1,130,122,13,42,125,175,65,77,112,253,68,68,45,238,
+    249,137,87,238,187,10,219,89,176,213,225,136,254,57,57,220,
+    89,212,152,223,93,124,142,35,248,29,7,92,39,9,174,35,
+    62,168,4,184,85,220,239,54,224,86,65,157,31,208,99,160,
+    39,253,152,77,221,76,0,55,75,1,191,130,175,0,155,98,
+    11,105,231,57,1,207,25,234,126,200,137,82,102,246,89,0,
+    108,123,217,253,90,45,1,169,105,190,102,59,98,237,80,76,
+    167,79,170,46,149,234,53,67,134,133,90,187,36,201,210,85,
+    90,88,170,111,73,118,101,18,5,119,61,224,177,33,160,25,
+    64,118,207,109,107,228,135,185,173,225,11,2,59,76,16,209,
+    108,119,222,225,62,99,66,29,58,178,110,251,114,84,67,124,
+    176,151,57,91,129,208,147,143,249,252,57,164,7,246,218,199,
+    166,75,67,254,60,61,56,184,158,103,227,10,211,209,57,208,
+    179,179,1,207,254,50,55,209,106,252,113,229,198,10,58,247,
+    247,240,111,147,215,84,163,161,213,2,224,207,186,67,186,75,
+    40,89,34,87,250,11,135,121,139,146,33,61,114,158,252,158,
+    49,162,253,66,254,183,12,182,111,191,9,84,234,182,71,167,
+    236,114,74,68,137,86,96,99,240,30,131,164,31,201,88,191,
+    236,32,165,200,179,205,43,113,201,185,94,163,141,213,37,3,
+    216,99,85,149,107,184,116,240,153,174,27,103,57,173,198,189,
+    215,215,236,206,233,107,148,110,210,2,246,155,114,73,171,195,
+    194,68,162,185,89,174,57,11,14,175,117,13,155,10,92,157,
+    197,183,243,54,179,51,227,101,29,222,50,228,90,73,213,120,
+    106,232,243,82,237,49,44,16,161,243,109,102,250,246,34,86,
+    160,71,232,20,219,179,139,47,54,199,135,102,151,190,135,67,
+    179,65,40,107,75,146,236,216,126,179,125,225,139,204,209,142,
+    155,190,204,76,183,143,125,188,252,169,114,144,89,233,102,86,
+    58,130,147,238,8,143,119,130,233,78,102,126,239,253,182,241,
+    113,243,32,179,220,205,44,119,132,101,58,207,225,228,238,249,
+    31,56,191,67,115,20,105,110,133,206,81,169,222,168,25,254,
+    209,70,163,61,226,135,76,146,222,168,226,164,58,51,19,8,
+    8,116,126,96,164,233,148,68,225,69,109,142,4,169,37,71,
+    191,215,156,24,26,99,106,199,213,172,63,244,160,65,30,34,
+    156,218,60,78,238,72,40,252,225,66,160,24,168,173,160,64,
+    162,108,35,32,70,137,80,122,137,11,64,91,67,129,4,93,
+    123,148,4,241,239,164,43,222,192,140,255,146,7,226,95,182,
+    197,181,74,237,211,173,43,221,236,209,110,98,177,195,98,58,
+    96,23,7,217,99,26,113,42,141,56,56,217,230,218,165,79,
+    78,183,175,116,167,242,176,50,44,46,29,64,197,52,69,69,
+    151,75,166,41,42,186,92,18,53,31,151,116,235,12,21,82,
+    130,91,105,169,22,129,219,160,152,137,113,11,173,134,69,98,
+    72,52,191,85,216,19,128,227,17,64,214,57,231,126,239,115,
+    230,251,209,208,208,28,111,7,237,236,154,195,222,177,119,206,
+    130,202,7,172,124,168,53,22,106,21,66,173,162,99,229,2,
+    214,184,31,249,61,6,48,162,36,129,1,248,202,227,78,125,
+    176,173,74,72,239,113,247,14,108,96,216,206,7,219,3,140,
+    32,168,11,3,186,56,160,199,131,45,87,82,160,251,137,124,
+    122,64,207,128,238,39,246,51,148,113,100,3,196,62,103,38,
+    159,135,232,169,149,55,27,244,64,101,5,166,216,101,248,1,
+    78,15,113,68,54,192,86,215,128,82,148,107,64,48,170,116,
+    99,39,105,106,5,30,128,92,24,117,73,241,85,165,175,74,
+    231,228,210,101,90,153,223,46,93,150,33,48,73,181,70,117,
+    83,165,68,4,131,147,244,240,211,79,253,212,222,90,108,170,
+    198,219,170,90,131,239,149,117,73,147,107,151,212,85,26,166,
+    236,184,4,241,77,131,22,108,215,107,10,126,176,143,68,80,
+    145,10,159,195,218,236,216,117,110,245,210,234,35,210,197,139,
+    52,251,183,167,222,188,120,81,42,235,193,2,168,60,102,56,
+    101,104,161,23,13,124,9,120,83,163,170,42,78,133,141,210,
+    91,42,53,227,39,112,183,43,233,229,166,179,199,49,163,213,
+    114,13,132,252,142,41,64,143,138,216,23,83,0,89,196,119,
+    180,39,96,216,205,4,84,86,212,161,160,166,42,166,216,168,
+    41,170,6,12,254,109,83,168,95,117,158,216,74,253,146,190,
+    30,182,21,41,165,73,255,242,120,23,207,252,136,237,82,98,
+    39,185,147,26,222,46,209,19,153,254,25,76,52,112,6,195,
+    250,207,96,232,137,140,87,114,135,7,205,99,135,59,2,104,
+    49,79,19,65,19,60,45,14,154,232,105,49,208,226,158,70,
+    174,120,53,42,209,183,232,179,13,136,144,211,63,253,97,253,
+    57,148,15,114,235,26,122,47,37,133,148,72,104,248,133,124,
+    162,79,15,181,167,80,60,141,2,183,104,218,51,40,112,98,
+    180,103,81,60,135,2,81,89,195,131,144,124,198,199,34,15,
+    45,120,54,164,116,24,219,68,26,42,5,46,63,235,28,247,
+    59,158,199,56,255,130,5,63,37,54,227,148,134,247,146,11,
+    15,230,154,89,50,54,185,199,238,11,189,209,9,122,179,79,
+    156,220,155,99,156,94,132,91,218,53,6,207,168,0,159,0,
+    167,223,251,132,241,227,116,47,51,58,104,178,147,189,99,21,
+    214,157,235,1,219,86,27,173,41,110,83,200,166,104,77,113,
+    123,0,178,67,129,250,140,43,62,194,140,191,49,67,64,29,
+    67,160,70,145,35,241,204,94,163,85,218,107,118,197,153,14,
+    139,233,128,157,233,137,233,16,99,122,100,247,149,221,87,62,
+    120,165,151,30,109,157,107,159,106,157,239,166,23,58,44,166,
+    3,118,161,39,142,180,150,246,143,116,216,9,72,7,236,196,
+    208,41,18,192,123,116,255,61,111,47,140,167,74,0,228,29,
+    118,22,210,1,59,139,167,80,167,247,79,118,216,105,72,7,
+    236,52,180,204,230,8,75,39,122,139,199,123,210,177,62,101,
+    56,114,140,91,180,8,136,59,118,157,22,135,6,158,64,179,
+    78,183,151,90,107,221,212,188,21,67,147,16,48,137,104,130,
+    141,244,132,149,192,39,160,11,83,64,56,244,118,188,155,91,
+    178,82,104,74,19,104,84,105,255,77,43,131,90,214,101,23,
+    35,168,229,200,216,92,251,185,27,79,89,163,168,141,33,215,
+    56,117,227,81,107,28,181,9,100,37,141,253,186,53,137,218,
+    148,203,81,166,81,155,113,107,153,69,109,206,227,40,94,39,
+    190,171,176,217,6,78,106,128,109,228,156,251,189,185,67,217,
+    134,119,54,207,6,119,231,190,243,249,225,28,214,193,126,118,
+    248,140,222,195,252,12,96,178,56,92,58,128,209,246,105,253,
+    192,27,244,196,126,208,198,5,191,70,241,60,62,128,231,126,
+    61,49,128,215,89,138,215,73,196,107,192,122,118,43,162,164,
+    175,179,133,20,197,238,52,196,190,172,153,56,91,42,53,170,
+    13,0,224,186,214,124,98,16,183,1,169,40,114,227,57,175,
+    170,171,53,138,210,176,33,147,251,133,28,20,227,139,148,174,
+    251,34,30,134,56,7,145,40,125,30,128,37,47,140,19,31,
+    44,237,147,31,1,75,60,0,130,240,255,131,37,247,244,239,
+    5,226,158,254,241,62,72,248,37,9,132,119,26,249,227,190,
+    200,191,54,156,31,26,224,17,191,66,99,251,152,111,98,188,
+    208,254,15,44,82,32,118,104,159,24,14,237,243,223,22,218,
+    39,231,32,82,39,220,40,238,220,156,184,221,161,201,246,169,
+    159,145,129,237,39,227,78,17,118,34,184,253,116,127,65,96,
+    236,65,25,216,223,209,145,104,142,248,123,67,87,202,191,220,
+    222,239,18,196,134,119,59,194,140,111,247,150,9,69,129,126,
+    236,239,227,193,161,40,112,248,158,237,5,87,252,29,51,158,
+    28,134,2,223,158,45,149,221,125,105,247,165,15,94,194,240,
+    175,183,206,13,99,194,176,113,32,202,195,168,31,95,238,71,
+    234,209,9,238,132,69,64,132,108,238,48,11,192,115,212,138,
+    225,19,13,213,167,218,156,19,170,209,20,15,152,18,104,74,
+    186,193,52,133,90,218,13,180,25,212,250,225,26,181,156,23,
+    104,189,54,132,138,159,48,220,108,75,199,95,21,102,191,131,
+    176,39,13,71,115,61,63,98,70,229,205,146,134,235,196,228,
+    33,112,64,180,176,143,150,233,252,240,222,116,209,67,232,148,
+    123,234,88,196,112,163,225,82,0,162,107,255,216,138,65,199,
+    158,74,250,99,14,61,100,166,59,237,51,222,252,29,67,225,
+    253,232,243,141,112,198,254,69,233,105,237,85,103,181,234,151,
+    64,90,81,134,97,172,199,9,51,214,33,163,254,100,69,120,
+    38,2,94,241,35,69,150,48,15,119,200,9,127,234,145,99,
+    157,96,178,248,25,6,182,199,195,162,21,109,189,113,23,31,
+    238,247,237,107,99,12,120,235,176,216,251,205,93,188,221,239,
+    91,87,87,176,204,176,104,93,187,139,183,251,125,235,27,204,
+    207,25,64,204,97,209,25,93,186,139,247,251,125,243,85,102,
+    137,129,153,29,22,157,220,226,93,188,223,15,201,163,19,241,
+    63,232,204,190,122,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/ext/pystats/statistic.py",
+    "m5.ext.pystats.statistic",
+    embedded_module_data,
+    3253,
+    8294);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,59 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,173,82,61,111,19,49,24,182,239,43,159,80,164,38,
+    192,134,7,164,38,42,74,164,54,100,128,10,9,149,138,173,
+    75,97,185,197,50,177,147,156,116,31,193,246,81,194,128,58,
+    48,48,178,241,15,144,16,127,133,33,108,213,173,76,108,135,
+    194,196,196,107,167,65,161,48,226,243,61,126,31,191,159,126,
+    237,175,104,99,248,23,235,242,30,192,123,196,17,199,49,74,
+    112,136,177,145,157,216,73,220,208,197,200,65,143,17,119,223,
+    32,238,9,252,193,69,232,147,187,14,16,122,220,63,65,221,
+    224,155,33,93,92,120,71,105,158,152,245,81,52,210,163,205,
+    84,107,151,229,212,166,18,40,196,28,133,206,83,72,25,186,
+    220,9,61,225,139,128,59,7,160,229,110,88,177,204,181,204,
+    11,171,150,121,150,249,97,205,50,223,178,32,172,91,22,88,
+    86,9,27,150,85,44,171,66,97,181,162,113,162,51,201,38,
+    226,201,124,38,94,125,174,19,24,15,83,34,160,76,146,43,
+    193,137,206,8,23,163,152,73,65,78,167,76,147,195,221,93,
+    194,153,102,68,131,3,57,101,234,183,153,130,64,130,48,242,
+    130,197,185,232,217,72,251,123,36,147,100,56,32,207,34,173,
+    238,19,21,77,82,176,141,82,45,38,66,146,142,234,222,33,
+    121,122,121,55,135,93,240,26,199,25,164,235,140,187,189,186,
+    141,117,212,155,244,200,142,26,14,118,192,148,71,35,166,133,
+    130,108,171,224,151,66,91,135,194,205,247,247,0,134,131,194,
+    85,70,82,70,26,27,105,60,28,28,119,155,69,149,210,148,
+    37,130,210,162,78,105,146,241,60,54,114,147,210,231,57,139,
+    47,52,21,74,121,54,162,84,86,160,103,16,67,203,98,139,
+    82,150,166,153,102,58,202,82,5,170,42,168,100,205,64,221,
+    64,195,64,19,224,35,90,154,43,253,217,81,114,212,159,205,
+    245,52,75,251,201,221,190,120,169,129,41,240,87,125,181,234,
+    190,105,102,111,54,151,129,113,53,112,11,126,245,26,224,108,
+    227,43,29,223,175,150,200,192,85,116,173,125,118,248,118,123,
+    225,181,96,126,241,90,231,91,173,255,202,87,130,108,173,11,
+    58,238,250,133,103,158,133,52,47,181,8,160,226,40,157,72,
+    111,173,151,219,6,172,121,219,156,185,122,176,106,232,3,121,
+    19,40,54,199,161,0,165,139,49,46,135,8,95,95,160,246,
+    230,60,71,55,22,127,206,50,184,130,219,37,250,27,222,221,
+    254,110,150,31,255,80,217,2,126,1,101,62,245,76,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/ext/pystats/storagetype.py",
+    "m5.ext.pystats.storagetype",
+    embedded_module_data,
+    558,
+    963);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,661 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,197,124,121,108,27,119,186,216,12,201,225,77,145,34,
+    169,139,178,36,234,180,40,203,180,29,219,137,45,201,242,161,
+    35,81,236,200,73,164,100,55,178,189,50,205,25,217,140,121,
+    104,135,84,108,209,84,226,230,229,189,165,93,189,134,214,42,
+    53,237,245,34,124,91,111,86,57,182,43,188,230,21,222,69,
+    138,245,43,182,64,129,7,20,164,202,214,4,81,163,70,219,
+    160,221,255,24,36,91,24,254,171,223,247,27,30,195,17,105,
+    43,111,91,84,34,190,153,223,49,191,243,187,127,199,127,167,
+    68,127,218,252,243,219,176,140,162,110,82,44,53,67,177,52,
+    43,243,210,51,52,60,229,94,153,79,54,35,163,49,78,225,
+    149,251,20,51,10,31,51,195,248,148,51,74,18,199,120,85,
+    62,245,140,218,167,153,209,248,180,51,90,159,110,70,231,211,
+    207,232,125,134,25,131,175,102,166,198,103,156,49,66,62,37,
+    171,242,154,124,181,51,181,52,37,163,56,250,109,115,161,114,
+    86,253,9,77,81,159,211,133,240,140,69,146,174,145,164,91,
+    37,233,90,73,122,157,36,93,7,161,250,66,232,19,232,225,
+    231,178,98,222,6,73,94,253,83,242,54,74,242,26,36,245,
+    54,177,53,51,54,200,195,124,2,161,207,139,131,59,211,204,
+    26,89,19,43,131,148,109,108,109,249,55,36,206,92,33,206,
+    82,30,199,90,239,40,103,90,216,186,153,86,25,245,34,197,
+    214,127,64,177,13,146,214,181,145,148,70,72,105,146,164,216,
+    73,138,13,82,154,37,41,237,26,74,67,177,157,108,11,167,
+    230,58,154,138,45,102,91,57,3,167,21,199,136,210,218,184,
+    78,214,206,233,184,182,82,220,156,154,109,255,128,153,233,130,
+    178,186,190,87,89,118,174,109,78,201,118,192,183,221,172,108,
+    138,114,116,187,126,8,141,211,30,181,7,67,60,231,242,121,
+    252,231,237,222,128,139,229,120,251,92,128,183,123,93,252,121,
+    14,146,92,161,160,253,229,169,147,147,246,57,143,151,11,58,
+    237,111,248,189,158,139,156,253,236,217,183,131,1,191,144,255,
+    236,217,126,251,165,11,30,247,5,237,185,5,143,151,13,218,
+    93,246,87,23,67,23,2,126,123,224,220,219,156,59,68,202,
+    227,222,225,248,69,82,94,191,221,19,178,207,187,248,32,23,
+    180,135,46,112,164,96,187,199,239,230,57,31,231,15,185,188,
+    222,197,126,45,20,189,104,191,200,113,243,66,22,161,25,151,
+    46,4,130,28,124,25,186,0,239,28,207,217,121,238,199,11,
+    92,48,196,177,118,151,159,133,76,1,94,40,210,195,219,223,
+    113,121,33,9,138,213,206,121,93,33,187,139,231,93,139,208,
+    250,113,236,132,253,66,192,203,98,119,131,216,40,151,215,206,
+    46,248,160,162,94,151,208,81,146,215,30,152,19,162,251,237,
+    208,120,242,166,189,196,123,66,33,14,122,229,231,236,174,185,
+    16,12,148,203,31,128,234,120,7,124,131,173,113,177,36,13,
+    115,219,177,82,123,200,227,227,156,90,173,211,105,119,7,88,
+    110,231,57,111,192,125,113,96,64,171,181,195,223,28,31,240,
+    217,125,251,157,220,229,144,115,126,145,244,208,41,204,68,126,
+    22,60,190,249,0,31,34,115,50,43,52,128,124,119,201,19,
+    186,96,15,204,115,254,222,14,223,254,192,66,104,151,240,41,
+    78,71,7,52,36,104,159,27,32,249,72,29,249,182,195,56,
+    136,202,233,157,235,23,70,241,208,169,142,115,1,23,207,58,
+    231,249,128,155,11,6,3,188,179,207,233,153,119,119,156,113,
+    148,202,192,191,121,222,227,15,245,226,199,206,160,199,183,0,
+    35,202,177,179,156,159,157,197,14,246,147,42,156,115,30,63,
+    219,219,33,124,239,112,104,255,136,56,55,233,160,179,12,25,
+    79,135,60,107,196,209,29,229,112,36,198,120,62,192,103,117,
+    165,8,62,171,13,186,93,126,232,63,204,139,67,157,149,77,
+    156,204,42,70,61,238,80,86,61,1,3,237,58,231,229,242,
+    111,48,201,89,197,9,79,16,82,78,206,135,60,1,191,203,
+    155,101,166,23,230,33,3,243,134,31,194,127,68,58,134,122,
+    245,238,128,111,30,166,123,246,188,55,112,46,124,162,119,231,
+    225,222,195,3,187,35,167,246,236,60,120,230,52,219,231,128,
+    208,105,231,105,118,135,3,227,79,113,99,103,78,237,220,113,
+    230,48,137,136,236,60,60,225,135,254,120,66,139,145,73,215,
+    100,36,196,47,112,145,57,151,55,200,69,252,11,94,175,35,
+    92,115,234,71,253,3,87,150,78,159,58,125,230,116,240,76,
+    95,88,123,202,126,58,116,218,127,154,135,247,198,142,83,63,
+    234,56,125,250,76,31,86,112,218,153,15,56,250,58,194,88,
+    37,4,133,239,206,236,136,84,203,232,232,11,119,157,190,114,
+    58,216,215,17,90,156,231,58,224,101,0,3,144,237,69,62,
+    176,48,31,121,19,104,42,192,59,58,254,120,4,122,58,61,
+    158,149,251,93,254,172,220,227,159,11,43,118,2,116,40,179,
+    10,108,113,150,33,77,206,42,176,205,89,57,116,4,134,48,
+    223,173,176,102,103,225,213,33,203,50,164,220,172,82,40,216,
+    77,137,254,106,242,207,111,223,165,81,88,113,20,8,41,106,
+    70,198,210,51,114,100,103,192,132,234,89,57,167,224,24,86,
+    49,39,19,49,27,134,83,178,74,78,197,193,179,44,94,5,
+    12,139,17,133,213,16,214,136,194,154,242,240,156,158,213,2,
+    195,210,130,88,97,64,92,168,57,157,40,77,193,26,62,80,
+    204,232,33,94,55,39,99,107,224,221,144,207,87,3,105,70,
+    8,27,243,97,19,167,41,111,7,164,155,32,189,22,218,223,
+    64,242,212,74,218,129,117,109,250,74,244,189,146,53,67,187,
+    204,144,207,130,189,175,80,67,229,239,100,172,5,234,181,178,
+    86,210,46,213,179,190,132,118,214,65,254,58,194,176,27,179,
+    186,17,192,105,151,59,52,10,4,23,254,175,132,68,167,139,
+    236,17,56,150,203,30,4,250,241,10,44,200,105,159,92,240,
+    157,227,120,224,108,64,91,192,207,129,151,33,159,68,134,234,
+    95,240,113,188,199,13,188,151,67,134,29,152,35,101,17,102,
+    38,148,214,111,231,156,231,157,192,230,135,88,15,82,229,185,
+    5,164,181,97,39,136,137,179,103,5,126,71,248,45,139,172,
+    133,48,196,60,215,36,5,177,129,5,160,216,224,32,112,88,
+    224,208,126,224,45,246,94,82,158,184,48,251,185,5,247,69,
+    46,20,116,96,17,46,127,190,4,206,229,190,224,36,133,76,
+    102,25,191,203,7,50,39,171,20,184,121,86,41,176,241,172,
+    1,100,133,11,139,32,252,39,107,45,241,164,115,220,121,79,
+    62,214,188,153,83,185,85,34,204,70,193,44,71,204,190,64,
+    33,102,71,232,8,53,91,76,140,200,32,84,84,8,34,114,
+    8,21,5,121,68,1,33,121,49,196,64,72,81,12,41,33,
+    196,20,177,136,130,144,178,20,154,162,62,165,39,29,42,190,
+    5,66,124,43,130,54,4,118,4,237,8,58,0,100,181,179,
+    243,129,160,7,187,23,116,168,178,138,32,231,157,123,250,23,
+    65,236,86,158,83,63,113,4,121,247,174,121,34,126,119,249,
+    246,239,2,233,178,43,47,93,118,137,165,11,136,156,172,122,
+    118,22,57,192,236,108,216,42,194,43,103,33,214,133,69,15,
+    1,184,74,229,204,84,125,115,84,177,172,205,212,111,131,135,
+    174,240,104,233,139,42,210,106,91,166,235,0,62,219,51,29,
+    251,240,217,150,177,181,66,178,49,10,255,223,98,207,129,5,
+    193,68,102,149,60,23,90,224,253,238,226,72,194,159,162,48,
+    11,215,133,89,160,222,46,38,93,237,100,101,31,80,33,121,
+    41,51,164,22,191,45,87,217,70,169,114,53,176,108,46,69,
+    101,38,68,165,137,202,165,203,75,3,90,147,135,135,145,178,
+    64,166,113,151,5,202,242,19,98,66,92,61,123,150,224,229,
+    217,179,132,156,206,158,21,176,19,181,32,207,28,136,74,46,
+    8,106,140,115,210,77,139,106,192,110,90,176,155,54,210,77,
+    15,52,234,140,250,52,116,102,137,94,146,1,178,209,63,149,
+    45,107,0,61,40,222,9,25,64,88,202,156,187,179,180,135,
+    239,195,57,144,11,211,203,111,135,231,19,45,16,164,59,132,
+    178,109,56,220,43,158,182,2,210,56,135,64,203,0,198,63,
+    236,44,229,92,192,98,90,201,84,38,91,79,8,191,79,95,
+    88,219,179,198,198,67,137,215,138,81,188,3,43,87,240,221,
+    56,103,26,142,48,9,32,32,130,125,89,249,121,46,244,169,
+    140,239,65,172,35,205,146,145,102,145,86,101,213,133,218,203,
+    81,169,16,203,99,254,195,164,254,71,58,227,242,225,164,174,
+    35,67,106,252,59,207,125,197,31,180,169,231,143,167,159,63,
+    14,193,84,235,137,116,235,137,232,232,242,201,140,209,178,252,
+    222,3,99,199,134,177,35,177,47,101,236,77,27,123,147,234,
+    94,210,192,77,3,75,240,103,154,12,108,72,148,6,243,94,
+    12,149,207,175,36,87,21,156,10,19,76,224,187,132,9,145,
+    123,57,191,64,134,72,129,159,210,100,32,130,152,57,63,4,
+    170,217,89,200,2,196,100,41,39,38,18,121,25,51,183,145,
+    1,120,104,52,199,246,173,14,92,123,111,249,189,95,90,18,
+    211,119,79,165,218,247,164,219,247,164,140,123,146,234,61,66,
+    7,197,4,34,47,116,240,24,85,96,83,37,116,126,135,154,
+    175,143,80,9,241,128,148,58,38,65,106,150,90,160,11,221,
+    145,9,108,100,63,130,125,210,185,212,207,206,186,3,160,136,
+    123,252,65,232,77,99,121,111,74,41,87,240,187,110,210,37,
+    152,172,88,104,245,74,210,216,145,52,142,37,216,95,249,126,
+    225,91,31,77,245,28,76,247,28,188,111,77,246,140,37,213,
+    99,79,233,216,106,197,142,241,6,113,56,66,151,100,226,20,
+    181,213,46,35,105,93,53,134,152,234,57,222,199,90,75,188,
+    92,38,174,69,24,42,69,105,168,178,234,227,220,34,81,93,
+    9,43,118,200,75,196,64,210,203,8,53,171,155,157,5,138,
+    241,132,56,31,140,98,67,249,40,22,19,222,197,207,78,8,
+    131,168,51,2,94,12,38,117,173,240,203,88,26,86,7,227,
+    161,180,165,43,169,239,130,192,205,67,43,135,18,214,148,165,
+    39,109,233,137,170,51,58,75,82,215,252,208,108,139,239,187,
+    225,92,117,38,245,118,36,151,43,241,3,105,99,87,82,221,
+    69,198,58,171,98,185,57,215,130,55,228,22,179,188,34,185,
+    28,32,131,174,129,161,44,31,218,78,42,36,202,222,69,241,
+    12,13,195,226,150,189,5,105,151,168,203,242,183,168,75,180,
+    48,48,52,127,72,58,8,135,165,131,192,239,5,16,54,138,
+    59,15,93,255,43,204,182,159,116,58,167,148,107,154,161,127,
+    113,197,234,64,82,223,242,248,161,177,33,71,209,154,230,18,
+    200,88,108,209,73,252,207,201,33,244,248,241,227,160,30,231,
+    77,165,165,174,235,155,228,113,186,73,190,137,31,116,98,7,
+    163,0,142,83,244,83,120,66,25,229,151,153,234,99,64,44,
+    87,228,111,82,55,101,127,165,160,41,49,134,36,20,84,133,
+    191,114,217,83,254,53,91,196,36,38,43,15,123,230,37,162,
+    60,203,32,34,4,121,156,15,17,55,225,71,112,224,106,197,
+    3,71,242,253,51,204,246,67,0,255,11,254,129,151,88,234,
+    129,240,194,137,125,119,7,83,150,93,105,203,174,164,186,194,
+    143,32,211,3,75,215,134,165,75,192,160,164,186,234,47,143,
+    59,96,30,2,223,247,87,38,88,47,128,159,200,36,3,43,
+    33,172,210,48,95,151,69,101,115,52,75,127,160,6,178,21,
+    151,87,101,248,164,162,28,132,177,44,60,240,58,81,29,4,
+    111,64,222,182,23,220,1,68,20,219,125,174,144,251,2,8,
+    105,180,245,118,6,67,139,94,226,39,192,46,56,203,208,3,
+    89,1,145,195,207,1,248,136,206,75,98,75,65,18,203,168,
+    107,114,105,79,126,99,2,214,36,3,249,108,157,18,164,179,
+    32,162,21,252,46,42,143,247,89,134,180,40,203,144,86,4,
+    17,69,128,0,174,10,19,185,7,39,178,75,60,145,104,40,
+    87,18,210,31,225,220,246,3,120,12,82,218,120,92,248,253,
+    141,46,161,72,112,247,22,238,45,220,159,254,237,149,175,128,
+    199,30,143,41,98,92,49,93,16,217,114,222,132,237,208,204,
+    129,165,71,26,65,240,167,64,155,163,8,94,162,138,180,121,
+    68,96,80,10,108,72,216,36,109,218,10,149,167,78,104,198,
+    215,166,109,241,31,164,76,221,105,252,237,138,50,153,66,181,
+    240,91,11,253,38,252,89,248,211,200,23,17,8,164,140,199,
+    211,16,171,46,180,103,114,114,82,64,250,122,212,50,113,142,
+    102,103,65,177,157,245,5,216,5,47,190,131,144,249,241,130,
+    203,155,79,1,217,201,6,220,179,179,188,1,27,38,7,69,
+    149,199,166,242,106,4,122,50,196,115,160,183,134,248,94,146,
+    238,241,135,4,217,117,144,244,227,92,32,224,229,7,49,140,
+    214,42,63,76,229,25,15,175,45,80,18,255,114,97,222,72,
+    251,132,153,217,86,0,51,216,227,175,105,228,71,133,255,156,
+    76,193,168,115,20,130,122,170,183,63,179,123,95,198,249,92,
+    206,104,100,218,114,20,128,71,70,107,108,42,222,25,251,225,
+    242,123,57,6,35,149,84,109,125,78,133,111,106,170,182,14,
+    210,186,99,51,105,147,61,167,193,40,45,213,104,79,200,87,
+    151,114,58,12,233,169,182,237,137,133,59,129,156,1,67,53,
+    84,75,119,226,141,59,39,75,101,139,64,135,130,113,196,167,
+    176,25,142,196,15,215,220,119,207,144,87,41,208,211,204,115,
+    113,11,48,75,230,57,41,80,210,204,56,157,32,105,227,244,
+    154,85,120,86,128,74,37,211,157,144,231,40,120,172,49,107,
+    220,250,27,107,222,116,239,32,9,75,129,153,218,127,48,39,
+    87,50,205,24,108,206,88,27,72,32,211,209,183,182,255,238,
+    46,242,254,72,83,27,235,142,51,241,133,184,62,109,238,78,
+    107,122,114,76,33,187,8,152,100,204,246,216,229,4,147,112,
+    175,237,95,175,187,199,172,111,75,239,24,78,246,12,167,237,
+    135,211,13,71,114,20,36,75,129,90,206,156,160,227,35,57,
+    10,159,137,209,53,11,180,116,236,222,254,245,19,105,231,209,
+    164,227,104,186,235,152,144,244,116,40,96,0,206,123,153,163,
+    163,192,216,191,125,147,146,58,58,88,25,49,241,149,85,12,
+    122,57,24,232,42,86,193,41,89,134,83,131,193,174,132,176,
+    70,20,86,65,88,203,170,129,143,105,64,41,120,149,15,160,
+    79,20,85,229,221,163,156,219,195,18,78,230,1,238,53,239,
+    226,5,43,190,224,241,180,131,189,198,17,83,155,120,75,89,
+    103,150,33,110,187,50,174,140,36,66,184,178,140,22,212,168,
+    171,26,182,204,252,65,1,116,190,44,134,132,74,98,144,30,
+    165,206,156,3,85,73,108,38,85,228,211,33,145,249,28,145,
+    73,248,125,81,48,150,199,211,101,34,183,74,185,186,210,251,
+    219,37,115,25,184,46,43,251,4,250,246,121,81,252,178,242,
+    210,200,75,235,89,118,99,79,29,138,201,176,242,84,223,225,
+    211,167,206,240,70,136,231,177,70,48,163,213,121,113,16,132,
+    55,158,155,243,92,38,238,132,249,121,206,207,18,222,201,79,
+    0,200,202,120,224,226,193,121,175,39,84,224,157,111,96,180,
+    130,12,123,153,98,131,140,40,108,21,205,102,209,108,254,25,
+    164,4,255,41,37,168,116,166,232,161,204,54,59,24,52,175,
+    100,244,230,232,120,166,209,6,134,177,161,240,176,54,1,98,
+    107,142,209,2,140,142,102,244,166,229,87,30,232,237,27,122,
+    251,47,183,173,177,169,246,189,105,252,29,74,233,135,211,250,
+    225,164,126,88,156,193,124,183,113,205,177,62,125,111,79,170,
+    253,16,228,185,231,74,183,31,73,233,143,166,245,71,147,228,
+    151,99,74,69,11,56,127,26,193,14,74,162,135,23,85,66,
+    68,252,159,208,18,27,92,134,158,39,177,13,30,165,65,152,
+    203,81,152,151,114,73,69,246,38,107,90,17,222,245,131,11,
+    28,241,46,21,144,187,55,232,64,31,249,217,179,56,182,96,
+    74,151,59,244,157,147,211,155,212,58,100,233,223,34,15,255,
+    136,22,20,59,144,220,198,37,90,6,24,124,77,130,141,160,
+    124,209,128,17,166,162,242,149,55,171,5,153,253,82,97,48,
+    242,83,42,72,234,39,154,161,243,156,159,187,60,207,15,135,
+    123,196,19,27,228,188,240,22,20,137,236,66,190,79,177,12,
+    28,208,199,130,58,150,52,15,192,47,177,63,6,255,113,235,
+    141,65,208,230,73,140,248,39,8,72,25,255,3,68,44,185,
+    203,191,232,200,219,212,164,65,196,14,59,155,55,40,243,21,
+    135,45,21,90,243,75,170,36,165,209,164,62,148,212,217,65,
+    207,139,237,3,243,82,92,221,218,232,23,175,192,35,101,30,
+    72,3,52,14,164,141,3,73,245,192,102,107,172,136,5,168,
+    156,87,194,1,49,25,3,195,216,133,182,85,101,114,150,42,
+    80,193,186,8,93,37,167,100,218,120,57,232,203,80,215,242,
+    110,86,78,176,230,133,2,214,192,56,137,86,123,8,115,244,
+    185,22,237,231,56,196,161,0,15,47,222,192,165,34,50,1,
+    246,140,195,100,227,16,243,168,44,103,181,240,5,48,87,92,
+    58,41,16,54,14,119,86,41,240,2,137,225,6,37,23,236,
+    220,112,131,120,236,69,9,136,236,65,84,28,36,195,159,169,
+    183,173,250,144,232,182,17,0,36,111,172,123,96,180,111,24,
+    237,96,190,25,123,210,198,30,16,185,134,109,107,93,191,217,
+    245,217,174,123,61,169,190,163,233,190,163,36,42,211,208,28,
+    11,197,66,96,230,24,182,129,126,17,93,32,147,52,233,208,
+    241,199,177,189,104,36,242,175,32,152,164,242,74,17,175,65,
+    112,146,202,179,35,254,117,4,232,181,227,57,106,179,186,51,
+    93,0,113,108,250,79,40,177,186,147,81,12,36,21,3,57,
+    133,154,57,70,199,47,36,46,175,203,239,46,165,91,247,231,
+    40,140,168,0,173,10,102,16,5,49,60,18,163,228,33,5,
+    122,21,83,135,26,5,60,214,20,228,81,21,8,109,196,150,
+    149,9,100,67,254,249,45,47,89,121,224,228,156,66,228,169,
+    151,113,12,43,231,148,115,74,86,65,4,49,10,93,89,94,
+    8,171,56,5,132,181,32,132,213,16,214,193,187,2,210,52,
+    100,213,64,139,105,172,14,210,244,100,229,64,72,195,21,133,
+    26,120,55,114,74,206,196,169,49,189,76,216,227,42,67,45,
+    164,155,225,29,87,24,44,108,43,89,73,176,194,179,150,120,
+    234,133,250,205,240,94,159,207,135,30,255,6,214,10,245,213,
+    65,137,245,92,99,89,251,27,184,38,182,145,179,129,138,209,
+    36,89,65,177,205,233,217,38,248,182,153,219,70,190,182,113,
+    182,173,127,13,45,215,179,205,31,40,36,203,227,45,80,110,
+    43,180,105,27,148,219,6,239,118,174,181,172,127,45,16,223,
+    206,234,128,250,218,64,43,127,21,245,14,62,43,155,155,207,
+    106,231,139,116,144,213,186,47,44,248,47,206,6,61,97,206,
+    45,54,136,159,238,82,151,139,181,14,150,22,187,212,89,153,
+    216,165,206,202,203,92,234,178,50,151,186,66,234,82,119,48,
+    147,89,65,204,143,11,92,94,149,149,207,66,131,117,179,165,
+    86,102,21,179,231,22,230,0,206,7,130,0,185,192,28,36,
+    139,58,164,36,38,74,16,140,58,194,27,176,249,188,7,1,
+    114,193,130,65,39,150,252,166,252,208,20,165,254,191,198,140,
+    104,142,0,49,89,234,64,186,171,51,205,221,232,12,111,204,
+    88,235,33,168,201,88,235,132,71,19,121,20,18,235,27,209,
+    145,30,133,127,129,12,136,120,22,75,190,162,213,253,183,148,
+    148,49,243,64,12,83,91,208,175,196,14,12,137,131,140,142,
+    208,65,13,25,253,98,238,124,153,10,209,215,165,209,151,255,
+    165,8,201,34,116,152,164,151,230,138,204,78,41,55,46,90,
+    49,225,189,175,115,46,220,20,32,172,149,219,201,172,244,227,
+    74,144,219,197,147,101,120,84,9,128,173,6,23,124,100,57,
+    105,126,33,228,28,159,158,20,52,55,37,255,99,236,169,143,
+    66,53,12,87,216,121,63,134,3,8,230,41,34,73,123,72,
+    26,235,10,185,202,220,152,204,236,156,199,235,13,27,138,51,
+    133,193,223,227,52,157,165,10,108,251,32,186,152,154,50,150,
+    198,216,126,244,160,93,254,112,233,250,82,124,58,221,178,51,
+    101,116,166,141,206,168,2,98,145,143,55,101,26,183,129,18,
+    55,33,228,180,54,174,78,196,217,59,158,248,197,248,197,180,
+    181,111,109,58,101,221,35,158,98,163,37,26,18,252,40,114,
+    95,240,124,153,152,101,168,50,255,91,185,7,165,170,115,170,
+    76,7,46,186,164,121,69,165,145,224,137,171,89,60,16,202,
+    89,14,125,150,225,154,226,72,144,240,63,96,190,70,74,112,
+    73,183,198,131,137,209,187,19,107,161,47,22,83,198,131,105,
+    227,193,164,250,224,83,156,237,106,90,240,30,138,125,133,85,
+    92,178,162,126,148,225,97,153,195,109,43,110,181,178,69,55,
+    81,73,98,235,161,186,51,255,34,129,188,185,90,123,36,238,
+    229,34,135,169,222,158,32,81,139,150,223,119,200,195,67,83,
+    23,61,243,196,140,11,113,193,121,151,155,35,11,67,188,200,
+    101,5,250,98,8,48,223,197,187,220,184,111,164,183,163,3,
+    21,151,177,147,227,14,231,52,143,254,52,224,90,53,179,63,
+    120,105,98,122,108,234,213,163,35,99,179,175,143,9,106,106,
+    113,122,179,114,52,85,94,192,224,37,4,18,135,33,160,251,
+    60,199,93,20,161,59,6,255,3,102,194,226,175,82,57,5,
+    163,177,61,108,236,121,208,216,191,209,216,191,54,253,197,91,
+    247,20,95,105,82,141,199,210,141,199,30,52,142,111,52,142,
+    167,26,95,74,55,190,68,208,28,104,97,241,231,123,227,161,
+    59,139,183,134,239,12,111,24,29,73,163,3,244,147,213,197,
+    132,245,110,83,186,97,71,210,180,3,157,210,3,43,3,55,
+    134,86,135,80,125,177,101,26,154,98,124,78,7,149,8,168,
+    175,192,222,78,86,70,126,244,205,34,43,75,84,26,101,233,
+    180,211,23,201,36,241,77,213,188,254,32,74,232,159,1,179,
+    249,185,124,179,111,255,50,93,154,110,86,30,54,160,214,43,
+    18,59,121,131,81,55,118,121,30,37,1,240,162,237,79,232,
+    237,196,112,4,250,66,231,60,31,46,76,64,97,237,235,61,
+    74,66,95,170,89,142,124,30,54,150,8,140,68,60,192,156,
+    227,84,222,185,255,225,192,245,129,107,67,203,67,241,125,27,
+    186,182,164,174,45,99,174,191,185,99,101,71,178,117,239,218,
+    40,0,225,151,50,239,75,155,247,37,245,251,50,106,125,84,
+    179,172,137,189,118,173,6,159,81,248,223,76,143,197,1,77,
+    80,2,61,106,182,228,236,102,101,216,169,114,10,20,60,160,
+    101,203,220,52,89,13,16,81,66,23,197,55,162,61,191,21,
+    106,13,210,239,83,111,81,126,69,97,205,96,121,210,33,159,
+    156,22,70,150,225,177,80,17,106,107,223,68,255,169,176,178,
+    114,73,52,212,47,110,30,106,97,135,144,104,168,133,136,255,
+    66,149,16,93,166,212,216,114,50,198,96,123,216,185,115,141,
+    253,194,115,207,250,85,211,253,215,126,219,146,234,124,49,221,
+    249,98,202,100,143,49,177,208,234,98,166,97,91,76,255,248,
+    161,165,5,24,188,193,86,2,128,231,55,195,43,225,27,145,
+    213,8,32,118,173,13,173,116,57,60,73,32,39,135,28,143,
+    31,63,206,105,160,146,32,246,230,47,122,250,168,207,218,142,
+    234,229,127,175,163,1,86,230,151,255,237,255,3,191,68,217,
+    254,125,120,99,208,186,69,190,71,251,233,101,174,90,59,35,
+    180,88,67,88,146,133,106,138,1,42,161,174,84,186,212,8,
+    4,115,145,74,104,42,229,100,101,155,8,156,46,147,10,178,
+    144,181,148,27,151,16,197,225,242,197,61,208,49,101,239,80,
+    65,53,104,44,248,4,83,0,159,188,49,212,80,189,101,83,
+    84,168,233,105,169,14,229,228,116,216,88,226,37,100,85,224,
+    9,237,204,210,92,150,30,115,24,178,154,217,233,147,199,199,
+    38,55,51,119,126,9,65,145,185,103,181,179,83,35,71,79,
+    28,125,29,115,162,99,138,112,33,136,29,57,57,57,53,125,
+    116,114,122,138,127,21,99,95,163,74,78,126,44,33,203,132,
+    2,23,57,127,185,57,11,52,67,118,255,136,105,134,68,124,
+    141,131,253,144,42,44,195,213,63,52,55,223,220,181,178,43,
+    209,117,215,129,226,33,101,126,33,109,126,225,129,121,112,195,
+    60,152,50,31,74,155,15,69,71,50,70,243,71,83,113,235,
+    157,166,27,63,90,253,209,134,177,51,105,236,92,219,247,155,
+    129,207,6,62,29,250,98,8,2,25,83,93,78,5,69,17,
+    47,248,170,38,222,117,199,145,112,199,119,165,77,125,81,230,
+    161,177,233,129,177,19,62,74,140,165,140,125,105,99,31,234,
+    94,123,138,92,112,87,202,188,59,109,222,157,212,239,206,88,
+    27,136,26,165,51,125,244,178,176,26,10,68,26,231,242,107,
+    161,186,154,88,119,116,40,58,20,223,155,232,142,15,197,135,
+    214,246,174,119,175,13,173,13,61,180,52,198,235,80,26,37,
+    245,109,184,196,190,255,90,120,57,156,84,55,61,69,139,241,
+    203,183,46,134,144,154,88,250,34,193,121,222,90,77,20,73,
+    87,174,224,27,89,254,155,47,158,37,140,206,227,114,245,150,
+    218,194,42,242,101,154,159,85,102,4,52,20,13,192,42,219,
+    94,182,196,71,54,251,115,183,210,198,165,103,10,95,24,155,
+    66,63,100,216,78,8,43,243,162,30,57,128,104,209,190,244,
+    199,170,164,28,96,57,0,223,169,243,229,124,245,172,58,61,
+    91,31,99,77,190,45,87,183,54,215,75,242,106,220,83,186,
+    99,126,171,18,20,236,94,57,238,190,218,98,123,149,249,49,
+    48,61,115,220,191,87,255,215,175,110,5,199,160,76,241,214,
+    186,42,101,2,135,212,133,27,94,21,118,126,187,4,246,136,
+    251,169,112,213,210,249,132,238,120,66,159,34,10,194,19,250,
+    204,244,19,186,63,220,32,82,203,250,183,219,89,206,235,241,
+    129,134,205,63,161,175,60,161,151,158,208,3,14,181,160,163,
+    161,51,75,224,163,111,81,196,224,33,69,11,170,219,95,32,
+    136,81,100,197,182,168,191,145,245,247,172,252,34,183,40,49,
+    238,111,1,16,25,74,164,156,255,13,113,193,159,146,229,193,
+    71,70,203,135,225,235,225,107,145,229,8,216,134,58,99,108,
+    239,245,193,232,32,170,194,67,43,67,55,134,87,135,147,250,
+    246,82,180,222,20,157,88,158,136,215,94,155,196,103,166,174,
+    1,189,129,197,2,226,193,13,220,47,211,145,49,89,99,26,
+    224,149,175,221,168,193,103,166,161,37,102,200,201,84,134,163,
+    116,198,84,127,211,176,98,136,179,31,95,188,125,241,150,239,
+    142,47,101,234,79,155,250,147,166,126,145,142,18,83,72,11,
+    176,52,196,247,174,12,198,6,51,205,237,177,87,74,33,91,
+    235,199,59,110,239,72,246,28,78,217,142,164,109,71,146,214,
+    35,57,35,214,146,51,81,122,211,83,90,12,12,186,111,165,
+    239,70,255,106,127,162,115,195,220,157,52,119,103,234,109,55,
+    189,43,222,27,254,85,127,76,14,181,223,212,175,232,227,83,
+    41,83,123,218,212,158,52,181,103,90,59,10,13,142,41,99,
+    193,27,58,145,169,144,216,187,97,233,73,90,122,192,134,142,
+    77,172,78,36,106,111,76,226,51,167,163,32,143,164,154,156,
+    158,50,212,150,181,199,210,20,125,5,71,48,114,61,114,237,
+    221,229,119,147,234,150,167,112,247,35,178,239,203,221,223,161,
+    249,61,34,142,93,183,53,202,167,41,191,117,107,59,27,104,
+    10,221,218,172,98,73,166,41,211,171,43,115,3,177,223,37,
+    34,90,23,147,104,130,91,160,59,177,199,76,92,82,168,182,
+    114,109,18,237,144,212,21,172,175,214,30,177,43,54,63,114,
+    125,213,52,56,137,38,137,35,172,173,148,143,85,110,226,243,
+    183,159,93,127,94,230,148,188,131,170,60,175,42,245,30,103,
+    153,226,149,17,153,144,182,36,243,27,200,123,131,176,89,172,
+    36,145,112,166,150,255,163,67,29,238,16,108,251,2,187,194,
+    37,132,192,66,200,78,78,186,32,103,242,132,156,97,217,149,
+    83,60,110,155,16,124,86,211,97,243,27,126,96,83,62,143,
+    31,119,31,11,31,10,150,143,142,240,171,172,126,54,8,133,
+    230,77,23,194,156,178,234,217,169,227,19,175,62,83,51,36,
+    60,173,160,242,33,39,203,50,44,55,47,89,156,204,50,164,
+    124,145,47,0,131,245,52,234,248,149,217,88,40,169,107,134,
+    31,238,227,11,94,191,18,189,2,68,253,192,212,190,97,106,
+    79,153,58,211,166,206,36,249,61,18,40,253,70,205,106,77,
+    172,134,44,103,62,50,213,70,153,156,204,168,105,254,186,209,
+    254,113,205,237,154,68,232,238,226,122,215,151,142,84,227,80,
+    186,113,232,65,227,145,141,198,35,130,139,161,228,86,24,73,
+    40,238,106,110,77,222,153,220,48,246,37,141,125,196,66,83,
+    124,165,73,59,143,221,119,111,56,39,146,206,137,71,229,22,
+    216,80,145,117,13,164,108,131,105,219,96,210,58,152,49,53,
+    226,174,166,131,241,233,59,111,165,45,219,201,210,105,25,171,
+    192,29,137,209,72,52,2,26,105,188,246,134,22,76,62,230,
+    81,225,53,3,170,226,209,149,129,216,64,198,106,139,141,231,
+    218,160,253,79,225,35,104,90,254,223,180,221,144,215,240,205,
+    17,250,251,250,188,88,193,51,85,81,47,170,64,87,149,117,
+    145,77,22,212,178,23,237,242,176,165,12,99,243,199,112,84,
+    104,135,76,191,62,49,249,98,53,188,44,161,100,222,98,39,
+    187,140,68,22,59,127,135,18,214,201,69,136,152,199,251,231,
+    16,31,89,170,96,178,31,124,104,109,125,96,237,218,176,118,
+    37,166,239,190,181,174,248,82,147,178,14,164,173,3,209,177,
+    140,209,138,134,121,67,102,91,251,199,19,183,39,110,29,191,
+    115,60,166,0,57,103,170,143,41,37,94,168,131,40,154,46,
+    174,92,76,118,188,144,170,63,144,174,63,144,52,29,200,25,
+    160,240,167,204,239,243,244,214,55,14,139,103,56,12,156,75,
+    204,197,243,30,198,201,173,105,119,252,64,117,95,205,247,174,
+    211,186,181,58,215,7,66,34,110,91,25,67,182,182,65,146,
+    165,113,47,177,67,22,62,34,94,214,207,159,246,195,141,43,
+    232,209,95,224,121,206,31,178,23,246,128,219,61,200,69,201,
+    73,35,92,177,21,206,26,57,241,56,4,225,110,34,111,208,
+    236,137,147,39,143,31,125,105,236,232,168,96,13,27,208,238,
+    157,62,58,49,57,246,122,17,17,165,238,79,195,172,39,88,
+    88,155,5,205,175,174,136,113,226,232,65,68,57,164,227,171,
+    212,215,53,181,177,174,85,199,53,255,178,31,221,156,169,154,
+    222,95,15,108,212,236,79,214,236,191,215,245,251,190,223,245,
+    253,182,255,171,126,8,0,91,249,147,156,2,115,114,11,121,
+    191,54,110,43,108,88,191,123,16,217,90,202,120,32,109,60,
+    112,95,145,52,142,38,213,163,79,65,193,117,170,232,190,19,
+    37,255,57,76,166,232,206,19,57,102,136,59,79,228,130,41,
+    186,243,182,194,82,164,238,188,55,29,116,248,128,112,118,15,
+    167,181,55,232,115,121,189,142,114,157,94,56,170,136,184,48,
+    34,156,172,100,133,179,126,78,135,18,228,221,232,216,200,201,
+    209,177,215,179,90,222,117,105,54,159,82,98,47,100,109,131,
+    176,23,178,91,184,220,9,40,228,22,57,52,132,136,163,56,
+    189,126,74,240,118,151,156,128,59,30,116,62,191,209,249,252,
+    122,232,203,197,251,93,127,112,164,58,79,164,59,79,108,114,
+    3,118,252,153,110,64,231,115,212,223,182,29,181,202,255,222,
+    66,3,20,182,23,168,133,205,26,28,43,217,244,235,22,147,
+    158,170,128,5,43,114,233,2,223,146,18,12,86,85,117,191,
+    119,5,195,114,11,106,40,168,105,4,43,98,52,255,94,164,
+    202,137,24,137,122,172,174,218,6,249,63,174,13,75,154,136,
+    166,232,78,249,61,8,68,21,241,225,43,34,234,159,81,63,
+    151,251,233,136,122,73,27,145,205,91,35,202,42,202,177,196,
+    168,94,210,109,13,143,249,241,136,14,196,163,178,10,243,147,
+    148,202,219,170,25,182,17,109,68,23,145,71,20,17,230,19,
+    168,245,243,98,205,96,12,172,70,170,56,58,55,153,13,239,
+    69,116,124,127,53,85,25,106,168,162,28,75,84,132,202,173,
+    120,109,203,173,24,130,209,175,137,200,248,46,152,17,70,192,
+    140,160,50,162,46,58,20,26,161,36,221,179,75,138,168,34,
+    106,116,87,16,99,104,75,53,111,17,91,85,101,142,13,125,
+    49,94,157,87,238,139,49,223,23,251,215,223,123,102,137,42,
+    220,180,25,190,83,60,11,253,106,233,212,122,73,216,21,118,
+    29,245,219,121,96,67,165,37,109,225,84,102,129,5,228,183,
+    40,121,66,197,194,74,107,132,130,29,17,180,7,46,249,237,
+    189,254,128,127,167,80,184,163,112,60,211,51,135,71,230,47,
+    185,74,165,57,139,165,240,255,28,7,231,38,2,220,216,195,
+    95,67,128,198,72,86,129,167,135,121,220,85,46,24,31,6,
+    30,143,97,9,14,145,146,219,132,236,23,194,221,100,100,211,
+    16,48,87,161,110,254,99,12,105,102,93,44,59,139,29,225,
+    113,175,27,113,143,8,139,205,250,210,46,42,254,51,4,146,
+    19,138,184,123,34,171,20,218,207,223,166,138,214,138,251,2,
+    216,77,217,26,242,152,45,244,134,28,233,16,159,55,23,116,
+    199,95,83,120,120,164,200,228,133,134,29,71,38,255,159,137,
+    25,147,179,81,245,182,116,93,119,84,155,169,181,68,149,25,
+    181,254,67,253,117,125,108,42,165,110,74,171,155,146,234,166,
+    76,141,249,195,183,175,191,125,205,187,236,141,187,55,106,218,
+    83,53,237,232,206,232,95,233,199,99,51,209,17,144,238,31,
+    158,184,126,34,110,73,233,91,210,250,150,164,190,69,164,79,
+    130,77,81,52,135,118,236,74,54,30,136,239,139,27,227,198,
+    68,39,194,184,113,125,10,12,137,118,71,178,125,124,109,230,
+    193,206,195,27,59,15,223,103,82,59,199,211,59,199,193,56,
+    178,52,60,176,116,111,88,186,83,150,237,96,157,228,40,125,
+    109,123,166,161,59,71,49,117,221,107,182,7,142,195,27,14,
+    204,237,24,79,59,198,73,100,166,113,219,199,250,219,122,208,
+    112,19,195,235,251,239,245,220,239,249,70,46,107,178,125,71,
+    1,200,149,128,154,106,106,249,88,123,91,123,75,127,71,31,
+    135,255,76,93,39,124,14,101,91,27,111,78,174,76,102,26,
+    91,226,161,143,35,183,35,183,222,189,243,238,218,194,250,220,
+    189,57,40,166,174,30,138,169,171,207,149,128,154,170,107,186,
+    249,242,202,203,55,78,172,158,136,193,127,166,174,41,71,201,
+    13,45,241,11,228,177,54,186,62,242,217,241,181,227,247,246,
+    222,239,249,221,161,123,135,54,249,115,98,58,52,5,181,43,
+    218,27,250,85,125,76,255,108,159,86,110,47,5,121,36,51,
+    145,219,71,105,12,226,53,206,140,177,46,106,16,118,193,252,
+    6,128,91,204,206,145,93,19,33,121,55,191,203,57,81,137,
+    210,55,137,196,37,38,194,252,19,77,132,9,137,24,195,59,
+    104,221,19,223,252,214,78,163,156,137,19,101,74,9,130,88,
+    89,244,112,200,34,148,95,25,161,126,134,235,72,74,20,89,
+    75,234,178,221,209,42,177,162,85,174,154,241,86,241,170,28,
+    136,60,85,121,58,176,115,194,72,151,15,73,74,212,151,66,
+    226,85,181,57,153,164,252,195,146,239,76,213,90,18,236,139,
+    200,170,8,31,245,38,177,46,175,146,83,181,105,31,246,173,
+    252,174,44,254,11,42,191,134,75,152,82,150,102,29,90,114,
+    46,35,107,18,41,244,211,111,189,58,54,69,14,105,100,181,
+    158,160,199,15,204,198,239,230,178,10,47,158,20,39,135,64,
+    112,149,75,88,239,34,27,28,209,197,235,208,8,156,7,241,
+    68,122,160,74,131,236,106,150,240,190,219,197,6,144,3,171,
+    216,1,9,139,249,151,20,30,179,42,178,152,2,183,187,140,
+    76,6,215,199,128,201,152,168,186,102,164,150,248,59,41,107,
+    79,218,218,19,213,100,116,214,164,110,91,66,243,159,118,30,
+    74,218,241,39,236,237,182,217,63,238,191,221,127,203,121,199,
+    153,163,212,154,110,2,174,189,28,29,137,213,101,154,91,19,
+    219,111,15,199,135,99,251,98,251,214,187,214,222,91,123,239,
+    158,5,97,116,244,161,177,41,222,253,203,226,214,80,165,161,
+    251,97,91,87,98,106,173,59,213,182,59,221,182,27,8,46,
+    116,3,104,236,97,109,115,124,236,151,35,191,174,75,12,165,
+    106,119,167,107,119,231,40,133,161,251,223,216,50,166,186,143,
+    66,64,228,3,53,64,228,3,53,36,150,28,70,33,62,217,
+    233,148,169,35,109,234,72,154,58,10,174,100,46,101,234,74,
+    155,186,146,166,174,199,185,218,66,35,55,91,38,168,119,16,
+    114,27,39,228,118,30,108,9,177,177,186,137,204,100,30,97,
+    1,164,178,142,40,3,34,161,113,57,163,92,75,89,82,60,
+    237,100,230,18,89,220,45,217,55,121,194,83,137,227,150,36,
+    11,192,33,17,138,10,53,70,20,85,22,146,20,18,35,187,
+    90,62,102,139,249,36,14,203,47,84,159,0,203,250,188,168,
+    101,2,65,168,39,249,127,133,61,192,93,10,227,146,19,252,
+    14,229,211,79,248,67,58,33,5,148,136,89,38,132,183,157,
+    240,65,140,32,103,152,144,166,28,140,32,144,37,197,32,129,
+    4,177,197,37,156,207,50,228,22,24,145,119,16,131,127,141,
+    24,255,43,138,236,85,49,153,163,204,195,218,122,96,245,182,
+    85,27,200,85,34,92,107,235,110,110,91,217,22,63,151,232,
+    94,171,91,87,222,83,166,106,15,167,107,15,71,149,127,66,
+    108,139,113,40,10,162,76,70,103,138,141,174,30,207,111,112,
+    177,54,174,30,143,142,101,200,205,1,186,175,141,182,140,185,
+    33,99,105,194,31,144,74,223,237,190,196,108,202,182,63,109,
+    219,159,105,223,254,43,219,47,108,201,254,99,169,246,145,116,
+    251,72,166,173,251,227,240,237,112,178,111,56,213,118,56,221,
+    118,56,103,80,153,180,223,80,0,190,67,144,163,84,26,237,
+    102,156,197,1,34,39,63,147,116,225,228,167,230,251,184,255,
+    139,172,93,16,14,172,60,31,110,216,218,50,128,112,228,192,
+    255,153,104,89,243,67,201,210,25,243,143,92,138,43,44,139,
+    190,249,125,90,178,197,178,85,85,150,13,255,204,182,174,191,
+    249,172,242,252,117,213,108,79,233,21,101,239,211,203,255,195,
+    161,153,20,246,201,9,234,238,79,169,188,82,203,227,225,113,
+    162,227,134,235,75,171,133,174,188,238,141,136,237,80,8,202,
+    238,239,168,130,107,129,44,11,190,79,73,188,10,12,185,26,
+    169,68,21,36,248,11,164,138,255,73,21,142,219,230,100,53,
+    154,161,77,42,34,127,61,28,13,11,222,200,162,194,88,111,
+    187,249,246,202,219,55,188,171,222,36,225,191,194,15,136,40,
+    110,89,105,142,53,75,151,236,74,217,19,238,141,122,71,178,
+    222,129,62,111,32,145,91,253,119,250,147,214,30,225,39,114,
+    73,36,130,27,13,125,201,134,62,80,28,227,154,59,154,196,
+    107,183,106,240,153,83,81,144,71,82,148,112,36,81,84,93,
+    76,243,168,224,38,29,72,213,15,166,235,7,147,166,193,92,
+    11,244,173,112,56,5,119,33,79,58,58,164,39,15,80,175,
+    16,206,27,144,195,4,68,48,151,78,30,16,111,141,162,56,
+    194,100,212,137,177,65,236,12,114,52,147,72,113,178,222,161,
+    204,155,25,196,162,64,91,131,120,138,5,67,132,152,26,168,
+    35,137,14,129,18,206,167,199,105,245,184,125,92,232,66,128,
+    37,178,91,96,128,100,110,201,97,207,175,16,72,14,62,156,
+    47,128,191,195,57,199,75,247,196,231,60,85,76,83,252,185,
+    184,251,206,11,120,22,161,105,93,71,30,255,222,66,30,82,
+    96,214,50,214,88,40,71,193,67,10,26,105,102,32,222,137,
+    199,41,7,18,187,200,67,10,148,42,198,22,11,98,65,54,
+    41,48,203,153,6,225,92,99,3,30,167,128,135,20,104,33,
+    91,220,82,249,99,35,36,213,197,131,137,177,181,125,235,214,
+    100,219,254,116,211,243,120,124,212,38,5,29,173,76,107,92,
+    153,163,224,33,5,71,104,27,158,203,44,7,7,84,204,65,
+    172,66,12,204,10,102,140,142,135,240,140,199,24,93,1,234,
+    213,208,152,122,60,37,98,147,2,235,14,166,254,81,77,109,
+    142,129,39,168,40,150,134,156,10,223,212,20,208,194,200,242,
+    98,78,131,33,45,158,163,213,225,155,190,236,28,173,1,163,
+    106,40,109,77,206,136,111,84,57,152,161,41,165,57,39,51,
+    51,221,25,168,64,14,79,48,80,114,12,60,161,162,124,241,
+    42,12,169,177,120,13,190,105,203,138,215,97,148,30,139,55,
+    224,27,85,0,223,200,161,224,15,78,147,162,115,189,22,70,
+    27,187,146,163,224,33,5,125,70,102,40,118,57,161,75,55,
+    244,227,88,15,85,5,2,90,34,50,254,145,162,76,160,172,
+    226,181,109,184,51,157,35,39,13,201,121,3,225,12,128,152,
+    53,22,173,159,115,212,230,181,138,178,11,114,36,74,84,68,
+    114,126,114,43,22,15,168,42,180,11,249,52,113,49,188,37,
+    120,32,208,159,33,220,146,135,119,53,73,175,5,20,46,128,
+    18,93,120,135,95,14,204,187,120,151,207,94,236,224,0,185,
+    170,10,223,250,201,245,117,194,213,81,33,220,24,237,11,176,
+    156,211,62,33,156,233,202,123,235,139,119,89,149,93,68,87,
+    250,195,214,244,219,43,94,217,135,203,11,229,87,251,21,111,
+    236,171,82,88,254,108,66,121,203,201,161,79,161,213,108,32,
+    132,46,28,225,234,65,209,9,93,24,152,0,185,88,47,127,
+    1,162,184,3,21,170,18,221,78,112,201,227,101,241,252,67,
+    208,105,159,34,94,16,65,110,157,39,203,35,249,51,126,162,
+    59,19,43,20,86,240,39,57,237,99,152,45,116,1,75,224,
+    188,65,14,23,90,112,157,109,30,90,92,92,174,230,32,181,
+    66,33,130,227,156,117,218,143,45,218,243,247,133,216,93,94,
+    111,190,115,120,244,152,92,23,197,150,143,76,233,96,141,48,
+    60,249,171,145,96,96,138,91,220,131,194,117,136,228,146,195,
+    226,37,143,120,86,15,140,59,193,121,229,144,11,156,121,186,
+    192,183,33,226,62,190,23,9,161,124,81,91,91,186,192,144,
+    255,183,16,241,37,202,102,180,235,174,82,127,234,165,244,150,
+    216,193,159,95,4,179,169,117,119,186,117,247,122,95,74,119,
+    40,173,59,244,64,55,178,161,27,73,233,198,210,186,177,164,
+    162,194,37,52,197,37,152,19,21,40,11,168,169,204,94,30,
+    165,206,48,184,75,192,45,163,169,242,67,177,82,131,232,125,
+    218,33,11,15,159,8,184,216,194,21,151,124,48,84,188,137,
+    113,19,253,32,14,224,149,154,165,30,158,61,235,12,23,233,
+    165,128,81,65,187,63,32,210,108,130,32,168,113,32,248,191,
+    148,12,94,86,65,146,203,70,79,79,202,118,11,119,61,240,
+    255,14,162,254,129,46,222,194,242,39,224,134,205,241,131,9,
+    78,216,96,132,242,138,220,21,96,37,7,96,162,228,120,210,
+    67,173,53,89,247,66,74,123,32,173,61,144,84,28,200,107,
+    10,147,60,158,168,17,14,164,244,8,39,19,241,80,36,17,
+    220,89,61,210,190,51,191,180,35,104,6,104,138,144,221,223,
+    89,37,88,232,184,251,129,232,20,68,196,147,211,140,68,138,
+    19,217,79,78,56,226,33,64,162,58,8,102,61,185,142,75,
+    184,235,66,149,191,222,145,255,107,204,178,140,32,66,202,29,
+    61,57,125,244,196,9,254,111,48,230,231,8,238,34,248,23,
+    8,208,190,17,116,16,188,71,133,255,146,42,40,16,4,7,
+    9,54,18,237,134,40,54,100,104,113,160,36,250,196,19,245,
+    144,112,139,197,48,57,66,131,115,30,204,0,142,228,228,52,
+    77,231,158,175,161,21,57,10,129,157,162,181,87,53,248,159,
+    161,26,146,229,191,156,76,65,203,64,100,126,15,160,213,224,
+    219,255,91,80,79,209,93,73,170,83,252,3,1,90,211,24,
+    125,125,121,38,39,163,153,166,111,228,242,26,217,119,20,128,
+    171,90,16,166,134,134,232,177,229,151,147,13,189,41,189,35,
+    173,119,64,79,107,155,99,230,85,91,252,149,84,109,95,186,
+    182,239,106,77,6,178,192,199,201,198,189,235,175,127,249,86,
+    202,112,56,109,56,124,85,251,72,87,23,125,110,121,32,89,
+    127,236,254,177,63,76,164,116,147,105,221,228,85,117,198,100,
+    139,201,86,181,201,230,99,41,211,72,218,52,114,213,240,200,
+    96,188,170,205,232,234,163,131,215,14,45,31,186,170,126,164,
+    55,101,12,230,12,64,157,41,186,63,86,135,199,41,50,166,
+    186,24,35,216,159,25,48,68,235,98,239,220,104,89,109,1,
+    147,177,6,58,165,34,13,181,82,214,237,73,202,148,83,14,
+    210,120,9,68,101,248,13,129,223,137,227,35,180,141,174,3,
+    93,104,19,248,6,193,119,165,184,129,136,156,6,249,94,25,
+    126,67,224,119,226,248,99,106,170,167,47,83,223,146,83,89,
+    105,188,131,3,97,198,88,27,235,92,190,148,147,99,224,145,
+    206,18,123,41,62,181,250,74,90,215,145,99,72,38,48,179,
+    173,249,252,106,74,89,19,189,152,6,157,74,83,250,190,12,
+    238,166,6,134,115,114,21,141,90,27,125,176,88,52,190,183,
+    109,95,83,175,91,190,48,164,219,158,39,17,143,24,83,142,
+    41,228,172,4,8,230,255,31,188,247,132,161,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/ext/pystats/streamloader.py",
+    "m5.ext.pystats.streamloader",
+    embedded_module_data,
+    10188,
+    23233);
+
+} // anonymous namespace
+} // namespace gem5
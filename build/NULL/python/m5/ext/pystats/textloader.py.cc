@@ -0,0 +1,185 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,87,221,111,19,87,22,191,51,158,177,199,99,59,
+    182,137,3,33,155,148,105,8,193,134,224,20,117,161,173,27,
+    194,66,146,165,124,20,86,77,90,169,94,33,103,240,92,39,
+    110,102,108,235,206,4,72,100,171,238,10,105,13,138,150,20,
+    169,34,72,84,202,74,187,136,21,125,96,223,144,246,149,63,
+    192,94,249,193,26,109,164,104,87,43,149,125,242,10,173,132,
+    250,180,231,94,39,254,2,94,58,153,28,223,185,115,238,189,
+    231,254,238,57,191,115,230,95,168,237,146,118,126,95,254,19,
+    196,125,164,161,56,210,56,141,215,57,131,139,115,28,109,59,
+    116,222,112,196,29,134,16,23,12,49,46,26,206,184,19,250,
+    5,77,212,93,134,20,151,88,219,169,187,13,57,46,67,219,
+    21,247,104,82,220,171,185,227,62,55,210,130,154,7,59,112,
+    207,254,230,114,154,23,59,177,208,222,211,246,206,135,69,44,
+    183,158,83,78,173,231,150,24,247,67,191,156,226,53,255,45,
+    33,30,248,25,115,202,48,79,0,230,9,106,242,44,138,236,
+    81,207,241,8,201,103,20,211,34,88,53,210,153,5,69,207,
+    170,26,38,74,42,75,148,5,108,156,56,108,42,22,190,105,
+    129,130,106,153,74,118,217,202,45,91,74,120,126,158,61,71,
+    173,155,214,252,124,100,76,89,73,99,93,131,209,50,86,147,
+    139,138,182,108,228,20,213,84,84,101,126,126,42,107,228,212,
+    164,53,13,93,243,243,81,101,22,134,41,25,213,192,240,150,
+    96,101,9,231,44,170,105,45,226,21,69,205,229,176,74,148,
+    116,134,62,202,169,180,142,199,20,28,93,136,194,44,215,178,
+    42,209,162,57,146,77,98,211,204,146,104,50,75,176,201,100,
+    52,157,75,206,207,43,89,34,131,77,43,166,133,141,168,129,
+    141,68,210,34,122,20,182,164,253,102,201,154,77,175,226,88,
+    236,228,47,233,250,87,50,250,10,157,94,73,165,137,105,41,
+    215,85,125,25,43,217,140,194,236,214,211,25,172,164,77,153,
+    90,245,49,211,202,97,146,196,25,75,93,0,123,115,36,157,
+    177,176,198,144,185,142,147,22,252,168,25,77,209,210,128,93,
+    250,218,178,149,166,211,100,160,189,179,183,76,214,138,202,114,
+    52,170,36,179,26,62,118,77,207,38,151,98,49,89,86,224,
+    74,145,172,161,24,39,162,0,108,52,183,178,3,37,60,236,
+    96,159,54,114,89,98,177,147,72,208,238,4,5,212,108,12,
+    189,145,182,22,149,108,14,103,194,195,198,9,56,142,241,230,
+    65,12,71,40,146,169,24,83,99,171,128,133,236,40,0,209,
+    174,185,194,169,49,37,167,90,139,230,169,223,14,31,161,16,
+    14,95,141,180,6,210,139,237,54,76,149,163,102,218,88,214,
+    85,216,122,2,103,96,146,180,1,231,194,94,164,210,25,45,
+    188,51,62,18,145,95,80,23,139,112,182,168,18,162,174,68,
+    4,155,63,127,197,150,206,91,152,168,215,116,188,211,2,216,
+    108,233,74,142,162,165,234,47,184,198,8,111,18,188,4,206,
+    59,177,160,103,175,193,179,167,205,107,86,71,143,53,47,229,
+    44,94,128,205,204,54,12,162,128,83,127,130,3,72,39,205,
+    213,145,54,189,25,56,152,55,106,69,120,219,13,102,171,250,
+    92,58,185,100,75,176,53,218,48,47,219,110,6,14,117,58,
+    91,100,200,216,78,130,173,101,146,73,242,109,252,32,194,255,
+    65,202,15,207,160,247,247,238,139,136,163,44,193,21,248,60,
+    247,141,87,227,111,161,60,55,141,30,129,194,147,230,144,2,
+    175,57,10,14,208,17,224,95,204,163,105,180,206,93,157,40,
+    56,243,206,77,244,166,75,19,30,1,42,79,184,221,103,114,
+    253,109,154,86,155,101,93,99,246,44,160,130,96,137,109,179,
+    138,157,26,5,49,115,254,173,243,58,223,58,239,120,94,248,
+    230,152,229,110,189,207,119,89,91,16,242,66,222,177,196,44,
+    35,124,222,65,159,11,14,203,211,62,34,47,62,130,247,79,
+    154,214,127,129,238,51,110,45,8,107,127,200,11,69,110,237,
+    91,176,172,205,134,182,93,112,154,179,115,108,193,101,249,219,
+    230,118,117,90,163,57,151,26,118,115,107,127,203,187,52,87,
+    139,9,239,184,243,252,55,135,110,187,173,64,107,244,117,142,
+    12,90,189,173,231,146,59,197,105,210,45,41,207,119,159,105,
+    231,42,38,183,246,31,55,178,250,218,237,208,220,251,223,162,
+    93,144,50,193,131,200,218,219,210,30,65,68,224,208,151,224,
+    23,107,61,55,208,77,199,151,232,6,151,23,54,189,111,66,
+    224,182,187,115,54,14,229,197,55,107,230,165,110,77,152,127,
+    82,227,128,245,229,213,23,44,214,191,164,172,205,200,151,197,
+    179,73,137,66,109,167,123,26,14,192,142,88,1,210,134,23,
+    16,249,209,6,11,197,114,42,81,13,165,25,51,49,101,142,
+    113,42,165,108,74,78,64,147,148,198,233,76,6,176,95,231,
+    40,22,94,49,229,28,196,250,49,211,90,129,37,160,7,184,
+    33,3,249,37,197,172,49,91,89,194,202,50,238,138,42,103,
+    87,58,248,169,113,105,56,165,46,235,96,156,174,239,152,76,
+    153,151,209,168,22,101,250,151,147,92,27,40,52,34,232,9,
+    191,60,137,104,126,95,64,121,116,117,111,129,179,218,116,242,
+    92,39,110,95,53,91,223,242,107,251,102,209,95,80,132,39,
+    52,2,128,72,150,117,221,80,173,228,34,176,10,31,125,207,
+    22,216,206,168,111,42,202,79,135,77,146,28,207,173,88,139,
+    217,204,184,113,98,28,160,24,223,161,250,241,22,213,3,251,
+    255,36,79,232,192,77,148,1,39,87,15,118,241,116,116,2,
+    210,134,170,155,147,209,150,210,5,234,114,148,132,138,168,220,
+    59,213,184,159,206,125,119,105,51,84,9,141,86,233,253,94,
+    179,255,37,181,155,236,1,177,42,183,232,209,230,180,23,212,
+    74,66,69,7,62,2,252,191,79,241,137,130,248,142,107,240,
+    27,96,228,47,112,60,32,115,155,239,196,166,17,185,107,1,
+    13,1,46,220,101,182,80,196,65,66,20,29,145,33,99,11,
+    236,24,29,12,147,34,161,94,255,147,123,98,1,60,228,102,
+    142,76,174,14,191,125,191,187,58,11,116,187,71,65,188,250,
+    17,253,72,247,188,47,6,247,99,113,131,254,105,15,60,15,
+    61,141,158,246,155,244,211,221,209,98,46,226,179,101,0,157,
+    88,38,77,156,182,247,236,204,185,243,151,19,159,158,249,236,
+    226,204,103,132,90,101,203,51,151,167,119,58,108,209,90,206,
+    65,2,144,19,134,186,132,153,69,182,104,230,244,180,101,59,
+    116,156,177,229,185,243,159,206,36,102,231,206,204,205,218,14,
+    53,179,98,139,41,176,223,178,229,47,104,25,49,67,8,228,
+    54,39,173,98,50,90,68,38,62,106,67,15,93,66,98,80,
+    96,98,218,94,115,17,28,84,75,48,80,108,177,241,227,100,
+    85,136,105,11,180,254,176,157,41,22,149,182,200,122,201,59,
+    116,251,50,131,111,231,250,21,67,209,246,119,65,71,232,185,
+    77,80,237,191,114,77,176,234,253,40,16,42,126,82,115,121,
+    203,174,254,26,115,137,103,159,131,168,244,78,85,123,167,74,
+    210,118,111,95,241,82,205,27,40,206,212,124,193,226,175,107,
+    129,253,117,164,136,67,255,165,162,36,212,60,254,187,167,239,
+    156,222,152,168,120,194,85,79,184,142,188,238,190,154,191,247,
+    238,215,119,190,254,62,95,241,143,85,253,99,117,36,251,134,
+    106,253,3,235,226,214,254,119,54,204,7,3,15,7,214,157,
+    235,206,90,176,239,254,129,123,7,254,60,80,9,142,85,131,
+    160,229,242,13,61,237,43,31,63,251,239,254,161,13,252,192,
+    251,208,187,46,214,122,251,55,46,253,189,55,92,238,13,215,
+    6,195,235,51,181,3,35,235,222,173,189,202,102,223,99,103,
+    101,239,120,117,239,120,57,176,115,215,250,7,65,223,27,218,
+    246,4,74,167,224,151,78,63,112,111,96,99,122,243,221,74,
+    112,164,26,28,41,57,183,60,61,165,235,183,63,94,251,120,
+    35,120,231,116,233,52,85,242,247,173,171,107,43,37,97,219,
+    27,42,123,149,90,32,244,253,133,114,96,20,238,173,208,190,
+    118,111,121,218,15,162,178,47,86,5,25,138,85,67,177,186,
+    3,5,15,215,157,200,215,87,231,29,238,190,173,208,254,141,
+    209,205,224,195,72,37,52,82,13,141,148,102,74,51,175,182,
+    252,128,20,231,238,107,9,88,241,246,39,117,7,180,94,189,
+    122,181,45,249,238,122,239,120,215,231,42,210,64,85,26,40,
+    75,3,53,169,231,174,239,142,111,29,87,164,193,170,52,88,
+    150,6,161,81,63,195,1,208,12,114,147,198,206,115,87,223,
+    244,16,255,124,72,158,62,42,62,63,194,129,124,173,250,160,
+    62,251,242,31,140,189,58,88,11,162,51,141,126,224,30,193,
+    251,39,142,221,94,168,75,248,205,246,248,110,94,90,87,36,
+    23,28,111,213,116,188,150,225,29,80,3,180,213,22,249,46,
+    141,60,159,104,90,0,245,194,190,78,221,188,176,42,119,231,
+    68,24,33,180,218,144,161,132,203,64,35,148,131,200,56,245,
+    117,39,171,40,77,66,203,8,66,179,93,68,36,52,38,108,
+    199,2,134,216,132,74,213,222,243,122,149,106,135,90,125,215,
+    104,225,200,122,97,104,107,98,129,197,184,204,42,66,120,11,
+    37,161,27,198,176,150,105,138,187,81,199,2,142,140,52,5,
+    13,50,29,81,2,222,242,236,221,248,252,241,201,103,195,101,
+    207,169,138,231,84,213,115,170,56,77,157,179,255,94,255,198,
+    209,74,112,180,26,28,45,94,0,207,187,47,221,147,54,6,
+    42,129,145,106,96,164,120,190,230,10,150,93,67,91,195,135,
+    54,191,250,227,248,159,198,75,66,85,58,80,243,132,202,30,
+    101,43,124,244,241,133,103,251,43,99,103,43,225,169,106,120,
+    170,52,93,245,30,130,48,44,94,100,148,214,225,13,194,174,
+    55,92,122,163,55,116,214,73,211,232,170,72,189,33,201,115,
+    192,213,150,163,165,171,117,229,187,223,113,17,126,117,234,18,
+    144,139,217,246,161,180,251,29,241,90,121,0,159,116,24,195,
+    23,90,23,27,193,183,214,106,179,38,128,47,32,248,134,74,
+    67,126,207,100,119,134,50,37,72,164,148,180,200,17,196,210,
+    70,147,48,73,140,34,220,200,25,13,240,109,119,115,126,50,
+    73,157,144,42,156,96,71,240,63,25,5,149,77,247,227,19,
+    149,192,241,106,224,56,196,162,24,98,2,248,203,223,91,242,
+    208,191,45,57,84,238,251,160,34,127,88,149,63,44,11,31,
+    54,210,195,32,93,117,143,237,74,36,180,108,50,145,104,100,
+    3,167,181,146,131,239,88,66,193,37,212,1,8,45,68,137,
+    139,217,64,77,135,79,30,124,179,145,255,189,141,143,230,70,
+    38,103,254,72,222,165,98,152,138,195,204,61,65,163,177,69,
+    230,55,212,114,150,35,27,6,176,100,40,77,64,129,180,172,
+    227,73,50,141,104,145,6,251,154,1,9,68,194,113,245,147,
+    61,156,80,71,84,40,136,235,47,163,125,237,119,157,23,57,
+    190,142,126,158,232,65,220,72,25,29,108,191,107,232,80,185,
+    243,222,246,127,80,244,214,124,239,23,229,109,223,104,81,174,
+    75,40,54,89,119,188,207,1,99,129,168,249,131,235,7,215,
+    110,176,142,218,129,195,143,165,167,189,63,248,170,7,78,178,
+    142,109,209,87,90,170,138,3,117,113,87,189,77,232,156,196,
+    5,54,127,81,71,240,211,45,250,217,26,46,238,35,200,25,
+    220,71,205,53,104,187,99,13,232,216,22,3,117,113,87,243,
+    77,130,193,252,127,51,41,119,29,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/ext/pystats/textloader.py",
+    "m5.ext.pystats.textloader",
+    embedded_module_data,
+    2569,
+    4576);
+
+} // anonymous namespace
+} // namespace gem5
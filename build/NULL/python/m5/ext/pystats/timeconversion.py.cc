@@ -0,0 +1,62 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,82,191,111,19,49,20,182,239,71,146,54,1,132,
+    16,74,170,182,209,137,74,180,17,40,153,96,170,144,16,3,
+    3,82,145,40,93,178,88,150,237,148,19,119,190,96,59,136,
+    84,25,144,232,192,31,128,4,35,19,82,197,63,192,192,192,
+    159,144,74,12,213,173,76,108,135,194,212,137,103,167,73,83,
+    1,62,235,243,123,126,231,247,125,254,238,126,160,133,17,156,
+    173,147,219,0,239,17,71,28,39,40,197,93,140,145,135,30,
+    34,238,29,34,238,127,242,16,250,236,205,142,116,61,30,236,
+    162,86,248,211,38,45,156,87,30,247,77,156,73,154,176,197,
+    198,165,89,227,39,174,177,64,93,204,225,232,30,16,116,125,
+    17,136,144,123,219,80,17,37,81,94,153,31,130,93,223,238,
+    242,18,247,68,192,253,139,213,94,192,195,195,176,91,113,244,
+    229,252,242,211,56,21,15,50,249,82,40,13,252,7,111,150,
+    35,24,247,35,150,80,173,163,94,166,34,221,23,44,238,13,
+    99,185,31,209,72,51,154,136,168,71,153,129,138,20,76,104,
+    77,213,48,50,89,100,20,149,58,161,70,216,183,226,116,0,
+    33,244,115,221,12,80,68,169,160,122,160,68,42,164,137,182,
+    68,123,191,13,219,236,185,110,69,177,132,211,90,176,76,114,
+    221,118,239,231,53,71,67,166,52,121,149,11,205,84,236,252,
+    217,97,254,130,61,214,77,155,79,110,56,123,70,120,132,200,
+    188,56,242,32,195,179,140,163,93,116,132,119,90,158,178,158,
+    170,178,117,221,207,3,45,146,222,249,142,182,205,64,192,233,
+    45,173,88,167,63,52,207,50,217,73,239,116,196,43,3,153,
+    54,212,232,142,189,12,155,251,213,238,15,243,10,33,177,140,
+    13,33,7,245,139,102,182,103,133,77,219,187,1,240,26,157,
+    172,109,189,13,190,87,86,78,86,111,218,181,49,118,115,98,
+    37,170,37,43,106,201,246,147,52,21,132,228,203,132,164,25,
+    31,36,54,174,17,242,98,64,147,179,74,153,16,158,49,8,
+    194,94,146,81,147,95,33,132,74,153,25,103,186,38,68,217,
+    155,228,190,54,74,213,32,58,66,234,146,101,168,90,8,103,
+    208,180,178,98,39,235,252,41,60,63,172,20,200,194,50,186,
+    214,24,7,117,152,199,65,253,228,234,202,135,141,119,235,227,
+    160,9,243,56,104,22,129,23,110,22,8,224,227,158,91,190,
+    52,190,109,124,93,119,225,127,97,170,194,114,239,128,251,37,
+    51,236,195,111,229,180,78,85,93,183,48,87,122,90,217,158,
+    94,255,158,170,67,106,191,165,126,4,80,248,24,227,226,46,
+    194,107,99,180,186,56,139,82,21,3,209,223,240,203,194,239,
+    127,20,28,217,31,171,149,238,211,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/ext/pystats/timeconversion.py",
+    "m5.ext.pystats.timeconversion",
+    embedded_module_data,
+    601,
+    972);
+
+} // anonymous namespace
+} // namespace gem5
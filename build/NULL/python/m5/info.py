@@ -0,0 +1,9 @@
+#
+# DO NOT EDIT THIS FILE!
+# File automatically generated by
+#   build_tools/infopy.py:63
+#
+
+COPYING = 'Please see individual files for details of the license on each file.\nThe preferred license can be found in LICENSE.\n\nAll files in this distribution (other than in the ext directory) have\nlicenses based on the BSD or MIT licenses.  Some files in the ext\ndirectory are GNU LGPL.  No other licenses are found in this\ndistribution.\n\nBeyond the BSD license, some files include the following clarification\nof the license as required by the copyright holder:\n\n    The license below extends only to copyright in the software and\n    shall not be construed as granting a license to any other\n    intellectual property including but not limited to intellectual\n    property relating to a hardware implementation of the\n    functionality of the software licensed hereunder.  You may use the\n    software subject to the license terms below provided that you\n    ensure that this notice is replicated unmodified and in its\n    entirety in all distributions of the software, modified or\n    unmodified, in source code or in binary form.\n\nThe copyright holders include (not counting the ext directory):\n\nCopyright (c) 2000-2011 The Regents of The University of Michigan\nCopyright (c) 1990,1993-1995,2007-2010 The Hewlett-Packard Development Company\nCopyright (c) 1999-2009,2011 Mark D. Hill and David A. Wood\nCopyright (c) 2009-2011 ARM Limited\nCopyright (c) 2008-2009 Princeton University\nCopyright (c) 2007 MIPS Technologies, Inc.\nCopyright (c) 2009-2011 Advanced Micro Devices, Inc.\nCopyright (c) 2009 The University of Edinburgh\nCopyright (c) 2007-2008 The Florida State University\nCopyright (c) 2010 Massachusetts Institute of Technology\nCopyright (c) 1990-1993 The Regents of the University of California\nCopyright (c) 2006-2009 Nathan Binkert\nCopyright (c) 2001 The NetBSD Foundation, Inc.\nCopyright (c) 2010-2011 Gabe Black\nCopyright (c) 1994 Adam Glass\nCopyright (c) 1990-1992 MIPS Computer Systems, Inc.\nCopyright (c) 2004 Richard J. Wagner\nCopyright (c) 2000 Computer Engineering and Communication Networks Lab\nCopyright (c) 2001 Eric Jackson\nCopyright (c) 1990 Hewlett-Packard Development Company\nCopyright (c) 1994-1996 Carnegie-Mellon University.\nCopyright (c) 1993-1994 Christopher G. Demetriou\nCopyright (c) 1997-2002 Makoto Matsumoto and Takuji Nishimura\nCopyright (c) 1998,2001 Manuel Bouyer.\nCopyright (c) 2016-2017 Google Inc.\n'
+LICENSE = 'Copyright (c) <date> <copyright holder>\nAll rights reserved.\n\nRedistribution and use in source and binary forms, with or without\nmodification, are permitted provided that the following conditions are\nmet: redistributions of source code must retain the above copyright\nnotice, this list of conditions and the following disclaimer;\nredistributions in binary form must reproduce the above copyright\nnotice, this list of conditions and the following disclaimer in the\ndocumentation and/or other materials provided with the distribution;\nneither the name of the copyright holders nor the names of its\ncontributors may be used to endorse or promote products derived from\nthis software without specific prior written permission.\n\nTHIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS\n"AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT\nLIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR\nA PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT\nOWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,\nSPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT\nLIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,\nDATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY\nTHEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT\n(INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE\nOF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.\n'
+README_md = "# The gem5 Simulator\n\nThis is the repository for the gem5 simulator. It contains the full source code\nfor the simulator and all tests and regressions.\n\nThe gem5 simulator is a modular platform for computer-system architecture\nresearch, encompassing system-level architecture as well as processor\nmicroarchitecture. It is primarily used to evaluate new hardware designs,\nsystem software changes, and compile-time and run-time system optimizations.\n\nThe main website can be found at <http://www.gem5.org>.\n\n## Testing status\n\n**Note**: These regard tests run on the develop branch of gem5:\n<https://github.com/gem5/gem5/tree/develop>.\n\n[![Daily Tests](https://github.com/gem5/gem5/actions/workflows/daily-tests.yaml/badge.svg)](https://github.com/gem5/gem5/actions/workflows/daily-tests.yaml)\n[![Weekly Tests](https://github.com/gem5/gem5/actions/workflows/weekly-tests.yaml/badge.svg)](https://github.com/gem5/gem5/actions/workflows/weekly-tests.yaml)\n[![Compiler Tests](https://github.com/gem5/gem5/actions/workflows/compiler-tests.yaml/badge.svg)](https://github.com/gem5/gem5/actions/workflows/compiler-tests.yaml)\n\n## Getting started\n\nA good starting point is <http://www.gem5.org/about>, and for\nmore information about building the simulator and getting started\nplease see <http://www.gem5.org/documentation> and\n<http://www.gem5.org/documentation/learning_gem5/introduction>.\n\n## Building gem5\n\nTo build gem5, you will need the following software: g++ or clang,\nPython (gem5 links in the Python interpreter), SCons, zlib, m4, and lastly\nprotobuf if you want trace capture and playback support. Please see\n<http://www.gem5.org/documentation/general_docs/building> for more details\nconcerning the minimum versions of these tools.\n\nOnce you have all dependencies resolved, execute\n`scons build/ALL/gem5.opt` to build an optimized version of the gem5 binary\n(`gem5.opt`) containing all gem5 ISAs. If you only wish to compile gem5 to\ninclude a single ISA, you can replace `ALL` with the name of the ISA. Valid\noptions include `ARM`, `NULL`, `MIPS`, `POWER`, `RISCV`, `SPARC`, and `X86`\nThe complete list of options can be found in the build_opts directory.\n\nSee https://www.gem5.org/documentation/general_docs/building for more\ninformation on building gem5.\n\n## The Source Tree\n\nThe main source tree includes these subdirectories:\n\n* build_opts: pre-made default configurations for gem5\n* build_tools: tools used internally by gem5's build process.\n* configs: example simulation configuration scripts\n* ext: less-common external packages needed to build gem5\n* include: include files for use in other programs\n* site_scons: modular components of the build system\n* src: source code of the gem5 simulator. The C++ source, Python wrappers, and Python standard library are found in this directory.\n* system: source for some optional system software for simulated systems\n* tests: regression tests\n* util: useful utility programs and files\n\n## gem5 Resources\n\nTo run full-system simulations, you may need compiled system firmware, kernel\nbinaries and one or more disk images, depending on gem5's configuration and\nwhat type of workload you're trying to run. Many of these resources can be\nobtained from <https://resources.gem5.org>.\n\nMore information on gem5 Resources can be found at\n<https://www.gem5.org/documentation/general_docs/gem5_resources/>.\n\n## Getting Help, Reporting bugs, and Requesting Features\n\nWe provide a variety of channels for users and developers to get help, report\nbugs, requests features, or engage in community discussions. Below\nare a few of the most common we recommend using.\n\n* **GitHub Discussions**: A GitHub Discussions page. This can be used to start\ndiscussions or ask questions. Available at\n<https://github.com/orgs/gem5/discussions>.\n* **GitHub Issues**: A GitHub Issues page for reporting bugs or requesting\nfeatures. Available at <https://github.com/gem5/gem5/issues>.\n* **Jira Issue Tracker**: A Jira Issue Tracker for reporting bugs or requesting\nfeatures. Available at <https://gem5.atlassian.net/>.\n* **Slack**: A Slack server with a variety of channels for the gem5 community\nto engage in a variety of discussions. Please visit\n<https://www.gem5.org/join-slack> to join.\n* **gem5-users@gem5.org**: A mailing list for users of gem5 to ask questions\nor start discussions. To join the mailing list please visit\n<https://www.gem5.org/mailing_lists>.\n* **gem5-dev@gem5.org**: A mailing list for developers of gem5 to ask questions\nor start discussions. To join the mailing list please visit\n<https://www.gem5.org/mailing_lists>.\n\n## Contributing to gem5\n\nWe hope you enjoy using gem5. When appropriate we advise charing your\ncontributions to the project. <https://www.gem5.org/contributing> can help you\nget started. Additional information can be found in the CONTRIBUTING.md file.\n"
@@ -0,0 +1,255 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,197,90,205,114,27,199,17,166,236,36,182,215,149,28,
+    114,201,197,135,137,93,41,139,50,8,72,182,108,75,180,138,
+    21,16,88,145,235,194,15,131,5,69,211,174,148,56,192,14,
+    128,21,247,7,158,221,37,4,159,252,22,121,134,188,72,30,
+    32,71,95,243,2,174,242,45,167,124,221,51,11,44,8,74,
+    114,28,85,69,118,145,192,98,250,103,186,123,190,254,166,193,
+    127,237,84,254,221,178,191,127,250,61,126,252,109,39,216,249,
+    122,39,184,245,245,173,224,141,175,223,8,222,244,119,118,127,
+    37,223,123,103,103,231,36,82,50,83,34,83,74,132,73,16,
+    94,133,65,33,35,49,9,35,149,137,73,170,69,160,114,25,
+    70,153,72,39,34,159,41,17,133,99,149,96,125,154,8,37,
+    199,51,94,88,119,134,248,100,174,213,68,105,173,130,213,154,
+    177,76,196,72,65,75,145,4,80,46,58,94,203,237,249,110,
+    221,113,154,81,105,2,143,243,89,152,137,32,204,114,29,142,
+    138,60,132,230,219,41,76,105,124,0,5,188,64,9,245,60,
+    199,26,173,198,121,170,151,187,98,38,175,148,99,237,100,98,
+    132,29,4,228,18,173,60,244,219,2,126,119,189,97,233,72,
+    86,23,194,79,99,85,53,201,26,157,149,70,33,181,18,71,
+    189,83,209,57,58,233,96,121,47,21,198,135,149,13,90,176,
+    218,9,185,236,84,93,198,158,14,213,50,197,167,165,11,86,
+    176,38,178,170,229,113,84,4,138,215,76,210,40,74,23,97,
+    50,21,227,72,234,112,18,142,37,41,114,174,197,89,102,66,
+    171,111,139,144,226,58,90,242,71,227,116,190,212,225,116,150,
+    139,89,26,5,74,239,59,142,192,191,97,69,106,164,160,155,
+    118,168,146,0,169,75,34,72,166,21,65,27,130,44,157,228,
+    11,218,152,76,2,214,145,205,36,50,147,164,57,229,109,156,
+    38,216,96,1,195,112,98,170,101,146,147,183,114,101,4,26,
+    101,178,52,113,98,233,48,201,85,20,33,160,84,65,115,157,
+    206,149,206,151,118,211,36,138,80,177,238,40,140,195,28,106,
+    161,160,42,194,58,86,98,90,69,146,13,146,25,228,91,7,
+    236,105,24,207,35,21,171,36,231,104,217,170,100,201,73,145,
+    140,233,153,140,66,136,219,48,174,118,104,157,14,4,156,85,
+    200,162,210,200,242,121,90,136,88,46,69,145,169,149,154,149,
+    68,86,140,158,193,49,178,95,77,72,174,116,156,217,0,195,
+    89,156,23,218,201,76,230,98,153,22,172,1,203,10,173,204,
+    51,174,109,236,25,194,34,164,84,206,35,74,52,68,138,36,
+    78,3,164,157,194,107,138,42,204,51,43,159,35,221,28,57,
+    65,233,168,214,89,118,125,99,53,177,82,147,154,44,172,21,
+    215,72,67,150,22,122,76,201,68,221,225,88,224,201,40,76,
+    36,42,30,135,59,70,217,14,111,168,168,117,165,222,166,124,
+    141,81,246,38,21,91,7,17,181,215,90,9,223,30,239,138,
+    143,239,222,189,187,247,241,221,123,247,184,30,7,106,138,221,
+    176,211,244,246,52,9,175,160,221,230,167,27,142,103,225,84,
+    38,215,52,220,123,248,240,110,13,63,62,217,195,143,79,107,
+    80,248,57,41,188,203,26,142,213,34,82,121,190,119,34,199,
+    151,40,9,209,86,87,200,196,156,10,66,180,210,120,142,130,
+    220,86,247,16,242,119,31,214,216,171,174,212,151,162,93,23,
+    199,33,34,75,129,111,75,164,80,52,235,226,44,77,131,237,
+    205,60,52,155,105,14,186,162,99,202,118,123,205,3,214,47,
+    78,52,162,166,114,84,229,122,159,219,139,63,7,50,157,248,
+    98,168,198,179,36,141,210,105,168,178,154,240,146,113,253,197,
+    182,131,43,9,197,1,5,76,167,180,101,84,211,139,133,110,
+    136,180,139,227,55,42,244,116,118,131,59,228,251,3,150,121,
+    28,165,58,12,164,240,113,182,212,203,246,128,92,116,101,150,
+    1,254,113,112,114,164,215,3,80,132,121,1,41,74,116,185,
+    179,27,50,113,151,114,250,201,245,210,200,183,28,110,225,16,
+    163,62,147,80,110,123,252,153,137,118,79,114,123,56,12,147,
+    75,224,197,246,50,83,128,61,149,19,24,63,38,224,102,196,
+    120,65,216,238,217,162,61,146,0,190,195,8,213,181,237,252,
+    125,100,66,198,226,40,194,222,95,176,181,143,77,114,169,18,
+    17,13,45,252,101,150,171,248,133,185,186,47,6,56,3,84,
+    199,95,162,254,228,52,1,144,110,31,167,181,58,55,153,134,
+    137,82,154,113,24,181,139,15,226,34,177,157,131,246,186,72,
+    245,101,38,58,114,116,83,60,92,29,142,197,151,216,90,150,
+    222,116,230,126,217,217,186,79,219,254,12,9,211,137,66,45,
+    239,117,1,231,27,39,224,250,182,203,147,125,95,180,102,26,
+    200,150,206,169,205,30,213,97,46,86,192,57,128,232,150,0,
+    23,41,98,43,47,83,160,113,87,230,89,17,167,220,126,2,
+    49,148,151,197,179,80,244,194,108,22,198,133,190,94,48,144,
+    126,80,227,237,119,101,82,168,72,28,166,197,18,224,191,93,
+    1,84,87,247,62,23,71,105,58,141,148,73,152,252,199,175,
+    119,118,54,23,62,66,25,169,3,241,232,58,100,30,48,167,
+    225,39,4,243,153,210,87,42,0,188,14,212,6,179,33,143,
+    169,219,172,129,153,158,84,16,25,181,178,8,243,25,65,53,
+    253,78,139,220,49,112,62,182,229,75,173,9,29,18,80,68,
+    93,100,179,3,93,227,21,160,35,161,105,26,16,114,16,221,
+    125,120,182,213,77,170,13,34,46,178,28,107,192,248,12,65,
+    144,163,244,170,210,30,28,211,201,106,166,173,69,208,68,10,
+    170,118,44,1,90,59,1,115,224,55,97,172,244,23,206,117,
+    227,155,189,168,52,142,45,5,197,88,189,118,251,150,244,56,
+    65,58,46,214,4,2,18,13,196,218,144,189,24,185,213,161,
+    4,219,93,197,149,147,65,42,171,174,127,225,36,42,180,20,
+    85,137,68,198,170,132,177,237,78,154,164,235,85,28,111,106,
+    243,112,217,40,75,177,130,24,8,80,167,200,12,37,2,101,
+    195,83,110,214,240,2,117,78,212,154,66,130,194,130,70,156,
+    171,64,76,240,129,195,65,88,209,21,91,45,34,155,171,49,
+    149,11,132,66,42,34,77,133,146,152,146,201,50,67,85,135,
+    199,158,47,252,254,227,225,89,115,224,10,188,62,25,244,159,
+    120,109,183,45,14,207,197,240,216,21,173,254,201,249,192,59,
+    58,30,138,227,126,167,237,14,124,209,236,181,241,180,55,28,
+    120,135,167,195,254,192,119,222,111,250,144,124,159,63,104,246,
+    206,133,251,213,201,192,245,125,209,31,8,175,123,210,241,160,
+    12,218,7,205,222,208,115,125,0,96,175,213,57,109,123,189,
+    163,154,128,2,209,235,15,157,142,7,142,142,101,195,126,141,
+    141,110,139,137,254,99,209,117,7,173,99,188,109,30,122,29,
+    111,120,206,246,30,123,195,30,217,122,220,31,56,77,113,210,
+    28,12,189,214,105,167,57,16,39,167,131,147,190,239,10,218,
+    86,219,243,91,157,166,215,117,209,237,189,30,44,10,247,137,
+    219,27,10,255,184,217,233,108,238,210,233,159,245,220,1,185,
+    94,221,162,56,116,113,101,105,30,118,92,50,196,155,108,123,
+    3,183,53,164,221,172,95,181,16,56,184,215,169,57,254,137,
+    219,242,240,2,177,112,177,151,230,224,188,102,117,250,238,95,
+    78,177,8,31,138,118,179,219,60,194,214,110,191,34,34,72,
+    73,235,116,224,118,201,101,132,193,63,61,244,135,222,240,116,
+    232,138,163,126,191,205,113,246,221,193,19,92,169,252,47,68,
+    167,239,115,176,78,125,183,230,180,155,195,38,27,134,10,68,
+    10,31,227,245,225,169,239,113,204,188,222,208,29,12,78,79,
+    134,94,191,183,139,244,158,33,42,240,177,9,209,54,7,183,
+    223,163,173,162,70,220,254,224,156,148,82,12,56,246,53,113,
+    118,236,226,249,128,226,201,145,106,82,8,124,68,172,53,172,
+    46,131,61,4,112,232,172,247,40,122,238,81,199,59,114,123,
+    45,151,62,237,147,150,51,207,119,119,145,42,207,167,5,30,
+    155,69,242,97,243,148,183,76,41,130,87,14,191,172,20,108,
+    141,19,41,188,199,162,217,126,226,145,219,118,49,82,239,123,
+    182,76,56,100,173,99,27,110,64,249,63,113,11,254,128,57,
+    193,84,197,159,10,31,205,2,23,12,112,102,48,96,156,35,
+    252,79,167,20,240,147,162,107,165,6,147,248,17,47,207,202,
+    229,168,37,34,196,9,65,164,17,153,20,0,254,10,136,58,
+    165,224,74,134,97,137,152,124,174,178,220,128,148,86,83,52,
+    9,58,142,153,229,224,155,102,200,31,73,212,30,111,129,3,
+    120,198,16,73,170,199,150,13,236,101,76,46,128,237,160,209,
+    57,93,161,0,242,212,121,232,65,13,48,66,11,65,85,8,
+    5,205,210,189,136,58,250,134,0,93,237,22,138,168,48,99,
+    30,120,101,134,144,196,68,52,171,203,120,215,33,45,9,99,
+    92,86,163,229,26,173,174,100,84,16,95,76,212,98,125,75,
+    11,84,22,78,147,172,230,88,31,87,40,5,182,147,76,137,
+    188,82,16,200,65,220,139,247,114,192,179,137,74,145,152,55,
+    86,44,157,227,93,248,29,35,117,25,167,152,122,211,66,141,
+    144,165,107,19,6,52,192,71,179,60,159,239,55,26,139,197,
+    162,78,1,173,167,122,122,0,193,15,144,121,196,158,67,1,
+    224,47,50,199,185,115,167,7,104,189,115,103,159,106,34,163,
+    204,79,137,244,152,20,193,145,114,156,16,24,22,36,70,184,
+    0,143,103,4,224,164,120,223,97,83,25,108,77,1,188,197,
+    168,142,205,52,232,19,243,35,215,74,53,172,40,57,240,205,
+    31,191,105,75,138,27,185,145,253,245,246,75,133,37,223,99,
+    179,6,177,185,9,250,88,214,8,72,118,143,125,171,47,101,
+    28,53,70,50,152,170,122,118,53,221,253,159,117,237,146,115,
+    103,74,93,254,98,239,22,44,252,154,220,219,82,198,254,181,
+    76,169,232,95,232,161,173,52,253,154,124,188,65,221,46,23,
+    217,17,248,179,45,50,77,87,69,116,167,41,174,149,230,61,
+    125,48,79,195,132,79,210,77,149,218,0,221,41,242,3,115,
+    56,38,116,14,83,154,120,36,116,244,45,91,161,5,98,84,
+    132,81,80,222,199,55,81,102,122,205,129,249,122,186,119,163,
+    197,13,50,116,192,115,160,87,175,107,64,41,238,102,201,244,
+    41,199,7,59,50,252,132,84,152,195,118,88,122,72,11,112,
+    110,83,227,51,191,173,209,160,4,116,133,6,77,74,93,231,
+    107,37,82,236,139,233,71,31,17,7,2,123,75,166,53,231,
+    100,9,122,147,136,219,12,147,17,46,125,171,57,158,253,132,
+    38,73,122,14,238,170,244,46,122,82,11,25,171,137,239,162,
+    112,84,19,241,125,19,82,92,220,242,104,233,0,231,242,116,
+    84,128,137,77,140,43,18,41,201,181,36,252,150,115,131,138,
+    88,13,208,93,142,112,21,18,89,49,159,167,58,175,139,245,
+    168,244,231,4,9,215,91,165,101,244,20,79,179,70,153,178,
+    3,134,112,206,171,29,172,18,23,28,43,14,39,111,39,14,
+    19,100,52,22,124,125,90,15,124,120,222,150,70,132,130,125,
+    172,103,199,105,8,106,38,68,106,14,214,8,196,15,21,95,
+    62,210,232,138,166,63,234,185,26,163,83,56,23,25,141,242,
+    76,10,26,32,63,13,227,241,60,191,32,4,55,153,1,144,
+    90,180,69,74,172,237,146,212,114,204,13,83,119,110,95,172,
+    132,119,203,62,200,215,81,184,193,235,60,191,153,161,93,152,
+    208,242,228,113,129,171,153,25,63,242,169,49,203,242,212,41,
+    103,76,82,80,143,162,59,151,223,52,197,65,176,78,163,50,
+    74,201,5,28,190,88,211,240,42,217,198,250,186,120,34,163,
+    48,112,200,119,115,165,48,58,47,154,131,238,69,77,92,244,
+    78,33,141,223,116,45,167,223,39,224,59,3,122,1,214,209,
+    122,66,47,124,208,199,214,133,41,144,139,175,30,124,118,97,
+    39,98,52,103,204,213,234,146,81,26,184,62,211,38,63,56,
+    130,79,177,34,91,79,198,144,39,31,135,174,4,150,255,182,
+    78,86,101,226,84,143,63,254,31,85,79,150,237,108,112,193,
+    55,252,99,136,182,83,105,147,150,149,80,51,42,35,147,217,
+    98,202,138,81,233,43,138,102,31,253,176,178,141,125,26,230,
+    239,197,50,160,42,157,200,34,98,202,51,9,167,184,95,155,
+    48,144,123,124,182,75,49,46,206,125,83,163,134,28,240,129,
+    76,80,23,75,26,92,211,226,15,109,13,150,76,163,14,105,
+    163,23,146,234,185,164,144,151,120,70,219,221,176,41,178,177,
+    14,225,27,100,212,115,220,100,35,40,216,67,154,98,250,38,
+    226,185,49,37,230,52,186,0,191,96,100,49,4,101,13,60,
+    144,180,65,216,95,213,201,250,123,14,123,43,55,23,65,56,
+    56,213,50,38,99,196,51,158,242,1,218,95,241,49,170,142,
+    52,169,142,175,140,21,67,91,72,72,143,247,55,39,175,147,
+    27,185,36,101,170,5,156,51,75,107,37,150,45,180,156,227,
+    194,102,105,146,125,8,72,79,2,162,40,192,52,45,237,87,
+    22,27,223,72,84,171,239,142,117,102,229,6,237,145,191,138,
+    48,149,140,96,93,231,102,188,194,248,166,202,189,80,4,184,
+    201,237,87,40,171,121,130,79,112,25,142,246,41,114,224,192,
+    252,134,198,119,101,236,76,23,163,248,114,149,242,214,7,202,
+    120,147,113,79,32,150,69,236,185,100,178,235,212,103,6,7,
+    232,102,204,61,194,66,71,233,21,212,234,216,76,191,47,145,
+    120,21,57,140,78,132,126,100,20,169,17,43,148,13,179,75,
+    1,210,202,164,211,224,36,157,30,108,194,86,228,102,145,81,
+    3,92,240,40,101,57,231,172,81,211,143,82,25,144,63,31,
+    210,84,95,47,237,151,18,240,190,78,67,165,229,26,161,117,
+    185,61,11,19,78,58,34,124,180,23,118,177,162,140,171,117,
+    27,36,181,123,189,219,91,39,215,81,187,206,119,215,36,244,
+    231,226,11,173,121,186,50,223,176,237,186,164,45,199,42,154,
+    215,96,142,218,157,249,194,102,106,107,112,160,190,45,44,129,
+    126,172,36,245,72,164,240,76,149,115,18,96,248,21,197,223,
+    76,111,137,228,35,41,171,115,165,77,90,44,29,166,183,8,
+    31,152,138,152,177,61,205,246,28,99,76,27,67,144,181,102,
+    106,148,74,149,76,145,65,170,243,177,25,121,194,16,77,118,
+    10,123,133,18,135,244,125,140,195,95,101,65,114,81,158,183,
+    56,205,114,97,65,98,65,249,161,215,138,103,112,216,74,157,
+    80,239,206,157,163,48,63,46,70,162,189,214,71,183,130,166,
+    216,126,14,124,1,101,20,124,97,180,169,40,239,65,76,184,
+    156,138,79,228,182,68,237,153,184,177,147,205,43,52,124,57,
+    2,200,85,83,87,225,156,72,158,73,81,163,162,232,160,94,
+    245,210,203,50,40,220,112,208,60,98,223,56,226,122,35,127,
+    130,159,148,217,115,202,176,110,122,35,94,126,155,9,217,130,
+    117,228,203,80,75,99,19,237,6,120,171,180,241,102,251,249,
+    107,240,134,74,90,230,52,113,15,101,82,79,84,222,176,94,
+    248,52,163,55,134,249,165,224,137,171,25,154,190,164,26,87,
+    32,188,170,35,135,71,110,101,121,109,72,110,84,152,37,127,
+    87,33,26,194,11,206,221,51,144,251,189,140,188,57,160,146,
+    160,183,198,89,90,177,199,7,225,207,229,98,227,58,186,116,
+    68,161,97,150,177,62,45,246,146,201,95,125,86,75,200,33,
+    132,166,66,219,116,109,104,108,153,138,175,106,156,191,218,103,
+    187,254,41,173,47,51,204,238,226,180,190,202,217,202,129,254,
+    63,122,76,0,214,42,231,169,22,155,205,181,3,248,52,131,
+    123,220,74,84,242,44,93,154,99,111,168,147,56,155,41,228,
+    123,78,95,56,235,144,38,24,0,8,25,192,50,79,41,248,
+    59,22,8,234,245,172,150,79,181,253,54,24,82,244,229,112,
+    93,220,236,227,184,226,207,1,67,5,65,29,127,67,76,184,
+    103,111,103,168,250,192,76,174,209,141,171,192,127,19,201,92,
+    77,38,189,222,81,61,14,236,31,94,244,118,223,252,225,45,
+    154,99,226,233,15,111,217,63,176,248,225,157,129,219,108,119,
+    221,167,113,240,247,157,159,232,79,64,254,253,158,33,255,68,
+    135,27,115,230,19,13,190,185,77,210,250,124,249,239,183,31,
+    49,179,81,7,250,109,251,119,35,217,251,248,241,227,155,183,
+    110,221,250,241,119,59,239,158,255,233,251,183,126,124,99,231,
+    221,232,15,252,251,183,237,238,173,239,223,161,255,244,111,176,
+    236,63,154,117,194,137,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/build/NULL/python/m5/info.py",
+    "m5.info",
+    embedded_module_data,
+    3686,
+    8821);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,55 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,80,189,111,211,64,20,127,231,207,184,118,99,90,
+    138,154,49,18,25,218,136,216,3,170,196,80,53,25,10,17,
+    12,101,160,75,45,80,100,226,107,27,20,127,232,236,42,109,
+    167,76,40,32,16,27,68,66,72,76,168,192,192,202,31,193,
+    208,72,30,34,15,40,18,19,219,73,93,172,78,156,29,34,
+    136,4,239,221,253,238,222,199,253,222,123,247,3,254,18,233,
+    247,121,241,157,193,27,112,192,65,93,176,64,153,222,144,133,
+    28,206,226,188,197,235,128,249,10,16,17,129,195,91,220,30,
+    120,66,15,142,249,61,232,33,204,145,251,28,96,120,34,204,
+    40,49,250,128,0,62,163,153,189,13,143,26,15,57,0,75,
+    180,36,44,190,151,225,31,226,8,243,111,194,107,255,205,20,
+    231,51,137,206,170,23,28,198,252,22,28,249,29,63,31,69,
+    240,162,238,160,7,144,237,245,194,207,204,181,179,123,39,145,
+    2,155,216,110,43,17,177,119,228,182,78,149,125,226,187,229,
+    150,187,97,156,42,229,142,27,248,36,42,87,215,149,68,238,
+    120,97,128,219,81,194,179,88,102,181,14,48,187,168,119,243,
+    148,219,132,248,36,89,56,192,145,139,221,199,152,132,137,224,
+    217,46,78,36,215,119,142,186,56,89,8,35,155,68,97,175,
+    19,29,38,2,62,198,237,143,112,145,53,112,89,14,73,219,
+    12,78,162,67,223,51,221,13,179,227,69,152,120,118,215,204,
+    155,10,141,224,228,178,176,57,229,216,34,75,249,16,236,67,
+    190,49,160,60,66,136,238,32,64,122,191,152,41,21,100,180,
+    50,17,138,253,123,153,78,138,203,253,102,191,153,142,229,101,
+    10,28,90,249,3,147,226,213,44,210,111,82,145,89,105,154,
+    210,2,8,42,5,30,25,227,82,117,40,199,165,234,217,205,
+    81,201,140,75,38,203,23,141,28,158,105,3,97,176,63,86,
+    245,87,245,231,245,225,173,145,90,137,213,10,5,164,24,103,
+    194,23,253,147,254,85,30,173,53,226,181,70,238,26,107,87,
+    6,219,231,75,55,134,187,12,166,107,164,213,98,173,118,174,
+    213,82,42,179,66,121,53,202,205,216,67,141,13,244,84,90,
+    132,151,242,42,255,26,173,242,191,0,217,174,167,39,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/internal/params.py",
+    "m5.internal.params",
+    embedded_module_data,
+    494,
+    663);
+
+} // anonymous namespace
+} // namespace gem5
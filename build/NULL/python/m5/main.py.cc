@@ -0,0 +1,698 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,197,124,91,108,27,87,150,96,145,44,146,69,145,148,
+    40,138,122,191,202,146,101,137,182,40,219,178,229,183,157,200,
+    122,89,177,44,57,126,36,29,39,110,54,197,162,36,202,124,
+    165,170,232,7,67,118,148,110,247,52,237,81,79,148,64,141,
+    40,221,246,54,167,39,29,120,16,55,198,3,116,47,230,163,
+    103,209,131,221,89,44,176,63,164,80,128,136,2,180,16,48,
+    104,44,242,177,187,202,38,189,8,242,177,216,115,110,241,81,
+    148,40,217,233,110,96,197,210,101,221,58,231,158,123,238,185,
+    231,158,123,238,173,123,248,111,148,234,79,155,251,254,146,131,
+    228,35,138,163,56,77,128,186,161,124,107,110,104,200,183,246,
+    134,150,124,235,110,232,200,55,125,131,38,223,250,27,250,89,
+    138,211,254,82,115,195,192,233,110,24,57,250,6,195,233,239,
+    83,55,76,156,1,210,10,206,8,169,153,99,32,181,112,38,
+    72,173,156,230,42,229,172,248,28,235,155,116,234,100,99,56,
+    34,250,195,33,65,54,121,248,217,104,208,23,18,5,153,14,
+    122,252,161,216,193,174,8,31,158,101,223,156,245,5,7,216,
+    28,214,77,86,240,242,254,136,216,23,185,199,190,169,220,22,
+    64,177,17,130,233,23,88,111,56,114,143,247,207,206,137,62,
+    142,21,194,51,226,29,15,239,59,205,70,5,31,43,206,249,
+    88,151,171,0,207,149,101,103,194,60,203,249,68,143,63,32,
+    244,121,105,149,100,116,185,255,47,27,52,68,50,32,139,0,
+    149,160,69,93,17,133,211,126,10,176,207,52,249,188,134,42,
+    129,234,118,133,210,187,65,63,133,255,207,168,29,74,234,191,
+    77,201,56,61,159,239,99,42,165,194,219,165,46,83,17,54,
+    175,47,212,170,217,90,43,71,65,111,26,38,121,36,31,59,
+    62,200,10,162,71,100,103,252,1,31,235,245,132,88,159,31,
+    4,206,179,211,62,86,136,248,188,254,25,63,116,136,71,96,
+    61,236,245,43,227,44,200,220,195,70,2,216,213,167,35,30,
+    113,174,143,125,125,206,23,218,138,137,144,94,150,244,44,116,
+    160,64,122,144,243,205,120,162,1,145,21,125,119,69,54,102,
+    132,222,11,122,196,190,152,243,26,192,102,194,129,64,248,142,
+    63,52,155,99,133,192,128,16,15,60,68,35,145,48,15,74,
+    113,202,105,144,181,193,1,89,31,225,253,33,81,214,35,166,
+    32,215,146,220,85,184,127,205,47,248,197,48,127,237,94,196,
+    39,200,58,225,30,104,164,239,174,95,116,234,101,131,162,48,
+    178,14,190,101,253,109,79,32,234,147,13,17,15,47,248,120,
+    222,8,34,16,80,84,44,254,125,83,43,240,222,131,145,123,
+    226,92,56,116,48,56,112,16,85,26,180,86,54,187,73,109,
+    238,57,95,32,194,219,1,251,24,22,75,64,178,64,101,105,
+    235,194,56,126,254,64,155,210,21,67,25,122,88,162,135,211,
+    244,240,58,102,199,50,244,5,137,190,144,166,47,64,54,233,
+    204,208,14,137,118,164,105,7,228,222,27,187,63,182,48,70,
+    176,6,50,244,49,137,62,150,166,143,21,158,103,105,195,253,
+    11,107,116,199,42,221,145,161,247,74,244,222,52,189,119,157,
+    54,222,191,144,124,245,189,139,247,47,46,144,207,151,216,157,
+    94,181,70,160,2,16,213,167,13,57,213,215,6,168,160,38,
+    1,157,174,165,226,148,168,26,38,162,161,120,255,84,247,41,
+    232,194,103,5,117,75,104,226,154,249,2,110,66,11,185,130,
+    58,37,116,28,157,160,129,154,150,211,115,6,206,200,49,156,
+    233,105,197,167,0,255,172,128,67,106,211,114,102,206,66,224,
+    214,29,224,149,92,21,129,219,118,128,87,115,118,174,134,115,
+    112,181,79,235,202,194,235,185,6,82,190,113,135,242,77,92,
+    51,129,183,236,0,111,37,208,54,128,66,91,63,163,183,64,
+    219,57,150,219,195,117,64,221,229,160,157,0,221,203,117,237,
+    0,221,199,117,199,105,174,135,115,62,221,95,182,230,3,164,
+    230,222,29,106,118,113,125,4,126,112,7,190,15,17,232,225,
+    29,74,247,115,71,184,163,220,0,119,140,59,254,244,196,167,
+    208,203,159,25,182,96,156,228,78,113,167,185,51,220,217,29,
+    232,159,227,94,34,240,151,183,195,185,193,251,84,66,79,176,
+    206,139,150,162,6,113,67,220,48,55,194,141,198,245,79,199,
+    62,133,65,245,153,113,11,205,11,37,216,227,128,253,202,46,
+    216,23,73,11,39,118,104,225,37,128,78,62,157,250,20,52,
+    253,51,93,9,76,199,93,222,106,236,72,137,87,161,183,174,
+    112,87,119,232,173,107,220,168,88,169,226,238,250,211,215,202,
+    224,233,184,215,203,210,254,14,208,126,131,187,177,3,237,55,
+    1,250,22,119,115,7,232,119,1,234,230,190,183,3,212,3,
+    80,138,155,46,11,213,113,222,178,220,112,156,15,250,126,134,
+    155,133,190,47,215,183,115,32,59,127,89,217,105,185,121,238,
+    22,41,27,216,161,108,144,11,113,97,46,242,244,237,178,220,
+    242,4,42,236,0,21,161,45,81,238,246,14,45,189,195,221,
+    37,53,223,219,161,230,24,247,14,209,232,248,14,240,4,212,
+    252,125,238,221,167,11,101,169,191,71,228,248,131,29,234,254,
+    33,216,24,138,187,191,3,244,71,220,95,1,244,199,59,64,
+    147,220,3,238,33,247,215,179,90,238,175,185,197,29,198,250,
+    79,128,55,13,247,55,101,121,211,113,239,151,237,197,37,162,
+    255,31,108,215,255,184,38,197,80,101,254,74,93,129,132,33,
+    174,137,27,102,180,48,205,127,56,249,57,18,119,106,100,203,
+    20,153,6,47,147,137,207,169,149,245,81,193,51,235,147,205,
+    156,79,241,201,0,6,174,157,150,76,148,51,51,50,237,137,
+    138,225,152,214,117,62,102,113,185,166,163,254,0,231,242,135,
+    102,194,114,133,0,179,172,207,45,242,81,223,104,172,238,234,
+    92,248,14,75,160,44,66,113,222,86,232,24,60,94,50,233,
+    26,115,243,190,76,227,228,9,244,134,98,102,149,51,23,107,
+    39,20,102,162,129,64,209,3,84,147,130,18,87,98,140,203,
+    197,251,60,92,208,23,171,34,232,232,79,228,30,104,93,28,
+    130,195,81,145,243,243,178,110,120,252,138,172,15,14,64,54,
+    118,228,170,79,36,152,144,137,68,69,22,224,62,47,240,126,
+    143,21,195,44,224,177,111,14,43,172,157,98,187,114,76,222,
+    68,223,54,8,62,229,109,15,207,183,129,216,248,118,72,160,
+    14,62,86,141,44,40,36,92,130,200,97,5,125,87,114,15,
+    88,229,1,219,179,15,239,192,171,232,101,239,128,19,133,143,
+    92,62,39,86,135,206,21,144,241,109,37,3,184,177,122,53,
+    25,120,80,192,7,92,1,190,67,98,161,72,236,236,85,112,
+    135,120,159,32,176,196,239,65,143,201,195,6,33,15,61,201,
+    222,65,79,44,143,170,56,83,132,45,240,217,114,85,89,93,
+    57,222,93,88,129,76,143,142,79,140,196,42,4,127,16,30,
+    245,137,119,197,216,193,81,172,208,19,244,17,239,218,197,23,
+    201,129,195,93,70,94,57,138,64,155,80,36,180,32,83,142,
+    150,239,185,180,170,92,174,128,95,16,125,33,31,239,10,134,
+    57,95,204,250,78,56,212,11,186,216,139,170,152,224,155,177,
+    47,110,92,6,111,144,237,241,245,205,246,129,135,201,77,59,
+    217,124,25,22,203,176,61,136,123,138,29,9,121,166,193,159,
+    245,207,176,124,52,20,66,97,128,184,124,60,42,229,109,95,
+    224,158,179,108,231,211,124,7,84,33,27,189,115,97,191,215,
+    39,168,52,160,201,229,242,160,139,10,61,17,12,139,62,208,
+    223,80,72,105,137,144,227,40,207,133,0,93,15,186,236,241,
+    122,125,176,204,81,225,177,51,124,56,200,122,66,247,160,155,
+    192,175,237,57,212,71,62,206,62,54,199,9,46,130,194,161,
+    192,61,54,16,246,122,2,115,97,1,188,99,173,203,143,34,
+    86,241,30,59,61,30,186,29,190,165,172,138,84,207,149,123,
+    208,13,72,89,207,12,166,249,150,35,166,50,196,99,122,151,
+    43,194,77,199,142,170,104,40,222,46,184,231,211,209,217,89,
+    226,247,67,119,249,202,21,214,186,34,49,3,16,0,231,62,
+    102,190,60,120,237,194,155,167,48,189,9,99,61,18,241,133,
+    184,111,52,167,98,39,46,243,62,188,103,17,130,154,76,202,
+    223,3,217,4,201,170,64,81,82,63,86,95,74,61,39,124,
+    190,21,123,64,47,68,2,126,49,63,248,222,142,25,93,174,
+    183,163,126,31,120,239,222,112,52,36,42,11,23,27,140,155,
+    168,215,199,222,246,241,211,97,240,253,239,1,234,237,152,201,
+    229,82,30,248,98,246,241,144,23,172,132,160,66,41,89,39,
+    162,91,84,3,255,95,242,20,58,203,113,221,124,1,4,38,
+    159,250,145,182,177,104,80,233,237,208,179,37,171,55,128,23,
+    220,231,56,53,95,128,196,181,113,122,70,187,117,186,37,43,
+    48,205,164,147,150,245,60,44,161,5,217,40,128,213,17,69,
+    94,54,144,245,9,44,94,192,44,195,226,133,183,18,141,132,
+    149,11,44,65,120,190,10,69,100,195,71,21,176,140,226,61,
+    110,44,92,92,191,240,213,8,178,120,97,57,5,90,71,128,
+    177,78,178,210,113,231,22,220,125,103,136,118,9,231,250,212,
+    72,255,30,138,9,47,81,100,57,83,219,188,252,86,106,15,
+    126,150,221,201,138,172,197,190,56,177,82,141,159,228,212,58,
+    83,181,100,88,182,174,220,126,244,206,147,235,207,94,73,247,
+    190,148,97,94,150,152,151,211,249,139,175,81,122,44,24,59,
+    14,250,3,99,98,26,90,119,15,7,102,20,6,35,89,26,
+    230,214,255,61,160,160,65,127,200,35,194,234,48,183,158,199,
+    17,228,148,41,89,7,232,50,3,76,6,166,61,222,91,176,
+    234,163,69,88,211,17,101,80,70,100,65,79,248,35,144,124,
+    163,117,121,99,71,113,215,129,247,160,142,9,130,15,231,34,
+    172,13,36,134,74,182,99,93,58,111,144,3,110,47,199,174,
+    15,135,67,221,34,216,84,69,119,139,90,89,58,105,108,209,
+    229,62,246,146,63,232,247,10,236,101,101,8,29,233,22,216,
+    239,185,46,127,47,87,9,142,94,33,22,24,31,155,156,186,
+    50,50,220,171,140,109,52,133,222,112,16,138,251,167,253,160,
+    227,247,200,76,145,27,132,125,44,135,124,120,56,14,151,205,
+    96,181,253,162,175,148,3,168,189,15,171,62,205,66,31,134,
+    217,203,111,92,187,48,53,57,57,117,253,234,200,149,171,227,
+    215,70,156,90,69,46,100,224,216,113,85,12,237,68,14,149,
+    169,95,192,169,156,172,100,21,107,109,34,247,196,88,31,135,
+    201,82,80,207,150,100,59,96,134,76,29,5,42,229,140,118,
+    129,34,153,222,15,15,251,97,232,122,238,65,67,188,100,95,
+    200,83,216,170,129,57,213,31,32,70,153,172,241,111,43,203,
+    117,193,169,43,118,165,194,119,237,80,56,52,227,159,141,242,
+    74,217,60,235,96,6,185,104,48,130,166,23,160,177,10,229,
+    187,207,31,242,199,250,135,1,192,122,75,138,169,155,177,195,
+    196,53,47,132,67,121,114,230,28,57,124,22,59,61,4,102,
+    3,68,255,202,213,169,201,60,161,240,12,145,78,105,37,59,
+    8,132,11,139,91,217,132,71,177,193,28,217,225,169,107,236,
+    62,54,194,205,228,104,11,47,78,188,90,33,206,221,158,17,
+    242,53,140,62,143,234,240,107,163,87,95,132,244,48,153,1,
+    112,192,168,69,142,15,93,211,80,197,173,152,249,218,248,208,
+    197,55,123,49,189,249,141,166,55,54,150,171,153,64,35,97,
+    152,128,122,4,39,11,125,139,24,120,219,115,11,166,66,116,
+    85,194,94,116,89,96,50,14,133,139,19,13,152,59,143,119,
+    206,199,57,137,200,72,61,68,135,26,47,163,107,195,226,61,
+    155,159,152,216,153,128,103,86,197,144,146,53,143,78,12,142,
+    189,217,139,233,77,149,6,19,96,110,123,16,203,230,122,176,
+    199,133,136,48,158,4,212,66,180,69,136,232,44,18,5,189,
+    228,193,79,69,238,101,29,176,16,107,186,138,79,74,169,228,
+    154,7,106,75,204,208,209,130,218,154,243,100,192,130,196,26,
+    70,192,140,148,43,87,108,171,226,129,121,209,145,228,119,28,
+    124,4,181,143,29,36,243,43,219,221,55,27,235,206,27,162,
+    130,103,229,23,241,209,180,143,216,21,244,13,113,23,14,156,
+    32,244,159,209,138,222,43,219,221,182,60,31,196,125,128,110,
+    140,153,71,190,115,249,202,155,189,152,222,140,53,14,230,30,
+    179,152,7,75,20,100,195,211,243,96,136,132,88,101,190,164,
+    127,54,4,158,130,76,35,70,172,126,156,228,182,163,19,143,
+    151,56,77,224,173,185,112,47,207,255,29,240,228,98,71,175,
+    144,167,232,195,177,211,56,73,71,136,99,39,248,72,115,14,
+    97,146,235,170,156,111,5,154,233,4,177,31,45,204,3,68,
+    236,213,46,165,223,162,17,23,232,25,49,107,143,175,248,188,
+    97,94,49,227,34,248,163,184,59,25,194,69,5,235,3,133,
+    99,35,115,88,27,12,14,82,206,21,141,244,178,209,72,94,
+    170,51,126,94,16,145,255,104,192,131,59,209,32,194,91,189,
+    56,151,16,91,0,36,208,101,6,47,142,108,116,14,205,129,
+    75,7,117,128,11,230,99,125,183,113,27,188,128,66,204,186,
+    135,237,35,64,98,86,88,33,58,51,227,191,27,179,195,242,
+    103,206,231,85,70,140,139,172,166,98,127,127,209,231,139,16,
+    6,130,32,21,176,245,254,32,120,244,69,195,80,192,7,53,
+    241,220,34,30,84,110,83,149,139,130,171,228,37,188,122,231,
+    162,161,91,44,33,136,112,92,226,32,163,184,80,82,188,197,
+    2,77,208,18,196,226,74,8,19,255,212,79,186,0,216,24,
+    232,139,138,254,64,95,17,193,77,138,144,225,2,90,119,203,
+    5,19,20,184,85,50,253,202,212,249,171,177,79,174,68,67,
+    42,19,150,159,61,195,33,16,140,34,92,15,234,234,45,150,
+    144,34,108,145,172,7,56,192,181,35,204,239,236,124,120,90,
+    225,149,48,130,100,123,177,20,14,5,96,153,200,63,224,15,
+    97,3,120,54,26,242,223,37,206,167,50,181,176,215,33,207,
+    10,97,239,45,223,22,254,177,22,183,194,170,51,86,83,194,
+    186,139,240,18,219,247,142,226,241,130,147,13,10,1,107,42,
+    144,101,47,113,160,213,79,18,49,251,118,180,88,245,54,188,
+    216,209,215,137,123,79,116,9,91,168,212,69,238,5,108,98,
+    249,89,180,182,148,179,59,112,15,75,137,216,224,100,52,56,
+    13,165,161,253,164,40,58,85,158,156,88,167,239,109,171,164,
+    236,116,116,1,237,104,222,162,219,149,37,22,172,43,131,174,
+    252,0,61,59,1,79,192,159,8,144,117,188,8,173,97,175,
+    250,131,83,10,180,23,43,241,243,224,239,128,119,37,144,142,
+    203,111,228,43,142,170,211,196,163,95,203,215,97,82,143,238,
+    103,213,52,239,247,205,184,11,171,121,185,2,28,154,156,255,
+    41,155,96,124,187,103,249,112,52,34,235,208,161,181,19,95,
+    86,113,81,209,19,117,26,21,74,132,38,241,125,245,10,118,
+    101,126,129,229,198,101,158,192,31,66,4,244,230,5,99,222,
+    251,205,251,191,214,18,143,151,31,134,103,67,136,120,210,168,
+    236,215,119,165,75,175,141,202,166,100,224,87,181,191,157,74,
+    87,14,103,42,135,165,202,225,133,177,172,213,33,89,219,23,
+    70,179,150,26,201,210,186,48,178,81,187,127,97,114,211,64,
+    233,205,240,140,177,100,153,186,108,85,115,214,86,155,181,118,
+    109,154,13,122,195,23,20,36,95,97,178,73,146,202,34,102,
+    109,30,179,239,121,152,246,60,102,91,89,76,187,26,19,208,
+    108,245,89,235,249,231,209,108,206,211,60,251,194,152,251,118,
+    197,44,160,77,108,154,244,136,166,71,52,61,162,97,98,201,
+    161,213,103,109,117,89,91,75,214,122,238,47,129,214,152,181,
+    181,103,109,109,128,188,169,213,84,186,54,205,70,196,53,34,
+    174,17,113,49,177,229,112,247,42,12,34,98,215,166,105,247,
+    54,215,231,27,243,202,174,109,174,202,163,13,237,202,37,16,
+    180,101,109,173,217,170,250,108,101,117,214,58,182,105,221,145,
+    205,228,209,165,198,212,241,103,131,233,51,147,105,122,42,67,
+    79,73,244,20,220,100,233,10,66,40,121,43,213,253,236,112,
+    250,244,212,166,78,139,36,180,72,66,139,36,48,177,232,244,
+    131,154,77,74,149,86,228,57,88,183,218,178,214,209,172,141,
+    40,72,85,99,182,186,117,179,138,65,10,12,82,96,144,2,
+    38,142,18,252,161,23,199,47,202,214,89,86,182,54,21,34,
+    98,141,104,54,141,101,36,6,104,21,11,35,233,138,182,12,
+    221,46,209,237,105,186,61,215,242,58,162,15,205,208,134,93,
+    37,13,163,175,113,189,26,212,230,229,178,104,121,242,123,50,
+    116,135,68,119,164,233,142,28,249,130,186,13,190,128,86,182,
+    162,90,236,206,69,142,218,229,93,209,154,9,154,3,197,177,
+    167,172,208,236,57,118,91,51,116,155,68,183,165,233,182,34,
+    187,57,109,194,194,253,187,170,125,221,74,60,221,127,169,172,
+    190,24,138,205,42,40,231,232,174,10,79,4,96,181,103,173,
+    206,93,91,86,155,71,235,126,1,57,145,161,123,110,215,17,
+    217,164,98,176,103,87,6,27,144,100,14,243,121,246,10,24,
+    180,57,118,26,187,149,91,59,73,91,217,187,105,218,69,206,
+    45,196,244,18,196,179,187,34,214,23,41,30,219,21,177,53,
+    107,59,145,173,238,74,119,159,74,219,78,103,109,157,200,234,
+    110,45,106,39,45,34,42,209,182,139,62,37,251,50,116,163,
+    68,55,166,233,198,156,58,181,236,110,186,43,169,234,134,53,
+    91,199,170,173,35,99,219,43,217,246,46,140,103,205,246,165,
+    241,180,185,53,77,183,146,173,29,111,225,61,5,252,225,174,
+    19,121,215,220,155,59,102,145,208,112,84,66,203,105,19,58,
+    78,151,160,77,20,71,147,131,23,122,248,214,7,52,65,109,
+    194,160,193,103,134,128,46,72,39,140,228,77,135,97,203,123,
+    11,38,174,139,51,197,119,205,238,194,155,203,56,93,242,188,
+    240,190,16,104,24,227,76,156,138,107,158,26,75,55,217,18,
+    218,144,173,147,18,109,69,134,247,130,91,161,161,222,160,66,
+    244,29,234,174,238,13,234,142,38,174,229,45,248,190,101,235,
+    65,10,220,158,35,220,155,18,38,177,182,72,97,222,92,224,
+    135,42,125,111,147,82,189,221,44,254,197,203,31,189,96,38,
+    99,13,228,112,196,184,106,255,118,8,124,149,48,110,202,16,
+    200,91,157,231,216,194,237,41,150,236,120,58,53,178,65,217,
+    27,129,187,90,85,217,171,176,86,14,140,128,167,200,225,139,
+    23,197,5,151,141,184,133,228,14,9,178,113,218,19,2,191,
+    233,176,211,42,27,199,149,173,42,40,173,220,244,229,182,39,
+    2,97,15,110,226,143,162,251,84,151,135,229,182,205,2,125,
+    62,36,205,143,17,223,234,50,56,231,17,241,146,39,4,107,
+    9,94,54,251,67,110,209,23,140,224,98,73,182,192,234,181,
+    152,51,143,7,113,69,55,194,243,97,94,102,208,177,71,239,
+    29,87,188,156,79,182,171,184,207,53,92,102,242,187,217,206,
+    10,89,47,128,251,232,147,13,10,235,178,209,31,17,176,141,
+    224,41,146,234,221,254,208,225,194,61,212,202,95,68,111,16,
+    185,87,184,212,121,103,102,249,43,232,243,85,20,157,195,188,
+    127,200,95,207,39,247,160,99,132,175,40,226,21,90,187,23,
+    70,55,42,237,224,249,85,183,46,188,66,146,77,218,162,183,
+    130,245,74,86,226,39,203,28,74,151,94,89,213,206,167,114,
+    109,84,58,146,51,15,230,22,231,146,186,108,79,127,82,39,
+    49,141,18,211,149,117,30,201,221,238,203,218,187,211,246,238,
+    108,77,93,74,255,228,54,216,234,154,10,176,213,53,21,95,
+    97,146,52,38,141,95,255,209,64,89,234,55,41,141,222,90,
+    76,208,31,160,55,117,112,247,245,215,95,131,49,103,170,208,
+    126,156,0,183,36,105,124,96,90,52,37,201,103,147,161,76,
+    13,201,42,252,252,129,177,72,76,123,74,159,97,246,65,157,
+    107,204,193,85,230,224,51,67,134,57,46,49,199,211,249,75,
+    64,215,251,225,32,53,104,166,254,197,92,49,216,160,251,151,
+    122,13,164,37,199,73,10,39,169,38,40,213,73,42,138,211,
+    114,58,50,160,53,154,146,189,238,226,145,17,94,139,138,14,
+    67,75,179,253,180,20,25,2,122,229,244,17,95,171,232,181,
+    126,198,35,122,2,177,67,215,160,255,201,203,26,129,13,133,
+    69,214,71,222,226,112,125,44,140,142,96,4,87,130,100,89,
+    125,237,202,224,208,248,228,152,123,106,210,169,151,25,55,172,
+    245,188,100,35,2,87,124,252,77,84,0,154,60,168,80,33,
+    106,101,29,32,18,168,160,37,74,161,44,22,42,221,100,137,
+    235,22,149,154,121,108,255,10,234,197,168,162,23,116,205,194,
+    20,126,54,232,230,116,233,181,97,172,184,127,87,50,54,97,
+    31,85,101,153,202,164,97,131,54,225,52,126,38,67,159,149,
+    232,179,233,252,165,152,78,181,92,11,199,116,12,45,37,114,
+    197,227,58,57,185,146,103,58,48,167,58,142,14,208,65,125,
+    66,23,52,36,232,160,49,161,15,50,9,67,208,148,48,6,
+    43,18,76,208,156,48,1,174,14,12,172,37,104,77,84,4,
+    43,19,230,96,85,194,162,161,196,61,197,234,74,205,219,91,
+    208,252,132,53,81,25,183,198,41,119,117,193,84,25,82,246,
+    114,38,108,235,233,177,184,193,93,163,42,227,40,87,38,110,
+    152,47,224,108,59,241,182,191,136,55,95,151,191,75,213,151,
+    165,99,157,111,40,79,71,104,20,15,168,232,52,62,191,132,
+    6,97,77,249,28,63,4,50,51,128,204,154,18,85,0,169,
+    74,53,151,171,127,7,94,91,158,199,171,186,166,210,131,85,
+    47,40,141,23,169,161,181,124,13,9,219,159,65,179,109,7,
+    154,213,0,107,207,231,132,75,144,99,243,57,190,1,114,5,
+    93,19,170,197,145,34,117,206,24,183,149,82,210,80,161,190,
+    146,210,182,18,124,102,59,190,154,250,22,108,83,188,186,12,
+    118,145,246,47,75,116,164,179,208,206,82,9,237,205,223,149,
+    60,237,202,223,197,140,91,32,251,212,144,45,114,178,151,212,
+    216,93,168,209,46,94,86,61,119,230,239,82,42,186,197,191,
+    210,209,186,155,60,132,195,47,84,95,1,231,207,173,143,159,
+    223,65,162,213,255,159,37,250,103,181,144,171,72,212,64,43,
+    123,11,173,252,175,156,57,81,83,162,105,150,109,227,86,5,
+    221,118,10,87,93,210,26,215,207,187,242,185,159,83,143,183,
+    159,59,86,99,87,2,118,223,11,99,87,109,131,186,139,80,
+    160,116,40,127,159,58,76,149,249,219,34,149,18,90,9,71,
+    220,145,234,127,126,41,208,15,199,48,117,115,111,162,86,93,
+    95,188,86,245,230,188,174,132,103,91,188,246,231,20,87,29,
+    175,131,214,109,243,12,22,187,118,147,43,244,209,145,124,142,
+    223,187,181,143,226,198,249,163,229,219,178,123,111,1,213,129,
+    2,213,193,109,61,111,255,83,123,30,248,57,246,39,242,115,
+    124,75,43,223,222,5,155,78,157,164,202,252,149,161,122,42,
+    159,91,210,240,143,97,246,171,1,175,226,116,162,62,120,38,
+    209,0,99,0,234,137,55,164,206,190,8,173,18,249,56,182,
+    181,45,81,132,198,235,231,95,202,223,255,9,58,216,136,254,
+    227,150,5,98,83,188,113,24,90,112,243,76,162,89,77,61,
+    222,172,210,184,150,146,126,104,74,189,92,174,102,241,135,42,
+    156,150,210,154,201,129,227,221,231,109,245,72,107,153,63,255,
+    103,180,178,53,222,250,130,35,173,21,70,218,179,68,155,186,
+    190,120,155,170,221,237,226,143,85,92,181,227,241,232,45,75,
+    98,246,69,36,19,111,227,26,159,215,254,56,203,247,127,107,
+    41,179,91,164,220,196,53,63,109,41,229,112,183,145,178,35,
+    191,237,243,195,5,154,173,223,142,230,86,25,47,254,227,110,
+    208,37,205,226,185,120,13,239,16,95,45,226,204,23,240,183,
+    199,89,192,168,27,45,66,111,145,213,17,207,194,211,177,109,
+    79,107,227,214,212,133,114,173,227,218,118,163,170,166,21,131,
+    181,110,98,79,124,15,208,36,27,37,48,206,79,151,140,213,
+    246,221,36,33,126,168,106,247,159,62,219,105,139,155,52,223,
+    98,222,99,75,202,189,248,12,184,71,92,46,230,230,95,201,
+    223,165,46,82,101,254,74,57,79,77,148,195,225,58,74,235,
+    123,46,7,157,226,207,85,28,76,150,175,171,196,135,153,42,
+    143,51,163,141,25,182,75,158,219,43,254,64,85,91,151,58,
+    55,67,115,251,238,211,137,142,18,126,186,185,158,242,158,190,
+    248,183,197,251,120,71,137,247,84,208,230,221,198,252,86,175,
+    233,57,115,216,149,124,78,248,33,228,174,22,114,241,120,37,
+    223,181,195,10,229,90,57,190,227,149,156,166,104,227,182,172,
+    2,175,3,181,115,127,49,106,141,37,146,116,150,226,130,215,
+    178,255,241,182,184,176,111,49,106,117,169,235,101,57,218,125,
+    197,90,104,79,73,143,21,158,114,26,78,243,35,237,25,164,
+    195,164,94,219,129,254,235,187,208,255,78,129,210,129,91,164,
+    119,193,18,81,169,55,202,81,218,218,203,161,107,37,229,123,
+    115,229,247,195,172,109,46,197,21,218,225,89,5,231,218,86,
+    255,139,214,212,94,82,83,95,174,38,77,168,6,232,90,184,
+    131,106,104,185,17,11,240,27,5,94,28,80,235,155,47,82,
+    43,148,122,43,159,227,89,240,152,14,5,44,193,183,18,157,
+    0,233,44,191,95,160,46,81,134,135,155,5,106,47,3,181,
+    195,64,237,102,98,239,139,75,33,190,119,199,90,111,170,238,
+    191,171,186,47,120,41,91,207,159,2,236,123,249,28,241,223,
+    187,192,147,244,148,163,46,254,171,170,166,174,45,54,97,155,
+    255,14,116,11,27,93,252,239,118,243,92,103,169,196,62,248,
+    239,86,151,0,78,126,153,232,129,245,152,51,222,147,226,202,
+    113,195,245,151,214,201,91,226,61,32,203,210,179,186,61,224,
+    205,2,133,56,61,239,203,63,187,173,225,143,148,140,238,35,
+    241,30,24,209,71,31,235,202,175,35,159,14,108,179,119,229,
+    231,252,237,22,193,9,51,188,170,230,120,79,145,179,212,76,
+    185,54,109,243,65,126,184,99,249,178,253,191,173,252,223,129,
+    76,103,243,121,254,218,174,235,7,67,106,174,28,205,184,105,
+    190,80,87,220,48,239,207,223,207,23,14,65,111,89,167,239,
+    87,239,249,165,110,149,165,185,95,205,215,182,125,33,71,220,
+    244,98,237,3,42,129,66,235,174,254,137,173,43,244,196,95,
+    180,117,5,190,182,237,162,152,82,193,178,165,172,243,161,66,
+    153,237,22,35,156,207,193,200,232,74,28,216,181,173,166,84,
+    164,108,13,7,182,141,210,125,64,185,64,137,80,238,125,14,
+    101,190,44,229,222,50,148,43,213,227,201,93,24,51,91,118,
+    91,133,114,244,184,99,101,36,80,240,28,248,113,117,78,61,
+    51,207,106,74,32,186,34,36,70,149,206,155,69,126,196,207,
+    139,79,231,163,133,22,237,80,3,9,164,220,210,163,75,218,
+    144,89,237,231,240,231,212,57,117,233,132,75,252,31,197,218,
+    226,46,12,191,220,178,46,235,227,78,147,86,20,203,191,80,
+    43,184,51,220,113,191,38,113,48,244,175,80,246,78,254,169,
+    48,182,131,71,116,151,42,243,87,222,19,220,217,75,154,213,
+    148,247,68,182,113,89,222,115,41,91,67,226,144,56,86,196,
+    137,31,226,206,150,74,123,128,74,28,142,31,78,221,43,199,
+    255,22,175,62,86,14,135,59,183,101,205,237,226,72,12,199,
+    54,27,100,238,164,14,83,2,125,71,171,188,30,198,151,197,
+    26,180,253,37,253,7,252,109,235,63,120,118,156,123,233,145,
+    54,129,190,200,59,249,231,252,231,228,45,206,59,137,126,242,
+    29,79,28,137,247,167,84,251,35,59,181,34,209,111,162,0,
+    243,251,229,48,227,125,241,131,219,248,254,207,157,148,248,127,
+    139,56,123,41,254,212,150,117,202,203,92,207,211,193,221,124,
+    248,146,249,109,161,60,95,106,173,220,58,86,223,160,66,63,
+    132,17,123,36,245,222,243,219,183,133,183,243,219,86,88,47,
+    194,139,122,231,227,104,252,232,124,97,101,244,158,83,157,3,
+    88,127,74,181,11,81,252,3,172,251,197,251,109,22,91,69,
+    227,215,78,104,157,67,209,137,37,141,104,86,209,40,211,27,
+    160,1,127,149,207,241,118,192,175,82,225,31,44,247,54,148,
+    188,17,29,154,204,191,228,175,190,150,123,241,62,74,130,32,
+    69,31,175,188,38,53,242,223,163,240,64,36,57,125,77,2,
+    43,241,56,172,172,39,39,143,101,154,4,77,154,8,6,57,
+    116,140,103,1,148,64,74,217,234,23,84,47,220,101,125,196,
+    19,242,123,161,166,170,220,209,105,119,254,232,52,123,101,123,
+    248,32,158,249,44,68,38,198,106,203,96,148,121,172,96,143,
+    94,139,217,207,111,13,14,61,21,179,146,115,13,183,125,188,
+    128,193,8,49,147,87,121,185,203,177,177,74,37,148,52,119,
+    116,243,84,140,198,183,246,49,29,123,150,141,25,175,144,128,
+    207,83,78,173,108,42,156,79,149,141,249,83,172,230,226,153,
+    213,83,159,211,138,32,161,249,28,136,70,57,45,142,59,115,
+    159,99,236,108,204,196,229,143,201,126,78,228,170,149,245,1,
+    207,180,47,192,227,52,23,51,96,60,44,128,72,140,89,47,
+    225,244,170,114,28,60,204,179,87,73,244,79,31,203,206,137,
+    98,68,56,117,240,224,157,59,119,250,16,167,47,204,207,198,
+    42,9,118,177,53,74,59,137,140,49,107,238,154,102,187,124,
+    108,215,27,108,215,119,98,45,4,230,187,235,243,70,137,204,
+    64,16,93,66,47,27,241,115,108,23,39,235,60,252,172,108,
+    224,125,98,148,15,149,28,186,193,150,145,152,53,60,182,240,
+    17,37,170,64,243,197,157,53,77,110,133,116,185,4,94,208,
+    81,78,155,131,191,28,223,225,151,69,240,173,243,22,31,136,
+    18,85,129,199,41,125,217,82,122,117,144,127,105,121,158,225,
+    116,113,50,75,112,186,24,161,23,71,205,55,112,198,128,17,
+    127,110,162,124,88,243,214,99,54,120,120,38,246,15,175,70,
+    195,34,9,224,200,5,120,225,25,240,66,60,44,134,126,177,
+    228,180,72,31,59,14,247,28,231,39,49,47,98,152,156,18,
+    239,173,96,85,127,226,156,95,192,195,6,208,231,254,217,16,
+    158,247,15,179,115,160,240,129,92,108,36,31,158,14,248,72,
+    32,5,251,58,40,83,248,142,192,122,61,248,139,38,36,136,
+    179,132,84,183,48,23,240,221,237,123,27,121,235,102,185,176,
+    79,192,144,50,60,201,45,107,67,226,55,154,183,190,209,116,
+    196,180,111,225,191,64,70,250,164,211,36,107,195,130,76,99,
+    36,135,172,19,124,17,217,200,251,34,1,24,186,178,150,247,
+    201,6,193,231,225,189,115,50,77,2,4,245,132,188,172,39,
+    244,157,90,30,167,123,30,237,151,250,52,3,255,35,72,98,
+    53,228,103,75,10,129,126,164,196,57,192,18,208,157,92,160,
+    254,88,65,217,236,139,119,86,246,62,124,55,249,238,175,250,
+    63,57,246,228,218,47,207,165,206,109,212,53,126,116,235,195,
+    91,169,206,84,52,83,231,146,234,92,75,186,245,154,218,143,
+    78,126,120,114,229,250,175,134,51,53,78,169,198,185,73,105,
+    171,247,111,52,181,166,116,31,59,83,222,143,15,46,13,101,
+    235,155,150,42,178,150,134,228,4,126,54,106,26,62,58,253,
+    225,233,21,33,83,211,41,213,116,166,45,157,74,68,160,21,
+    198,68,16,237,8,30,1,58,245,141,6,70,243,85,37,66,
+    32,86,65,14,122,204,132,163,33,142,199,151,230,74,148,239,
+    177,171,34,160,123,120,52,28,24,16,147,59,15,226,97,243,
+    103,146,122,115,193,33,216,227,133,208,219,62,30,231,132,88,
+    227,245,144,210,135,92,105,108,240,41,22,108,130,109,91,68,
+    131,70,54,171,162,4,190,209,184,98,14,127,232,182,39,224,
+    231,84,177,71,108,247,55,154,110,64,165,137,153,180,150,132,
+    57,200,102,183,59,56,224,70,169,187,221,128,195,240,209,144,
+    27,59,53,198,156,81,52,244,28,254,22,141,207,203,227,155,
+    38,153,113,19,160,219,13,189,60,29,211,71,197,25,215,9,
+    176,65,240,24,105,187,221,252,251,216,136,67,215,20,253,35,
+    81,141,248,67,54,208,154,219,126,15,137,0,196,108,143,179,
+    143,29,129,111,18,77,23,21,72,219,116,24,122,212,127,61,
+    228,245,68,49,138,222,119,23,99,144,49,18,145,29,65,235,
+    143,178,138,132,5,17,132,193,99,12,35,151,15,248,114,38,
+    201,239,224,200,77,249,168,137,188,148,221,51,133,25,8,23,
+    164,60,238,45,16,67,74,102,34,30,23,81,60,174,232,120,
+    92,102,241,184,142,34,19,16,143,235,40,30,55,31,120,92,
+    43,241,184,44,226,113,253,67,206,226,147,179,253,50,216,70,
+    113,4,39,174,87,163,190,40,76,73,40,189,183,101,171,160,
+    126,202,163,175,36,211,24,240,40,235,253,2,6,248,27,114,
+    129,254,76,208,115,11,103,28,129,199,245,147,108,80,78,10,
+    201,244,60,116,172,108,86,230,37,34,79,146,1,254,149,76,
+    149,18,80,239,206,135,162,203,85,249,59,183,82,166,244,1,
+    148,227,25,194,67,56,226,11,201,204,148,251,245,43,83,147,
+    19,111,200,198,41,247,208,149,145,193,107,120,115,237,202,245,
+    201,33,153,230,162,145,126,222,76,152,201,145,50,96,149,161,
+    48,201,3,37,185,130,76,110,110,242,43,10,102,52,255,175,
+    41,51,160,108,206,77,25,195,120,110,142,70,157,149,25,130,
+    59,18,186,45,211,183,124,248,91,70,2,244,153,108,42,6,
+    85,24,135,166,46,191,49,62,57,134,179,4,206,139,178,1,
+    248,25,190,52,34,87,144,110,85,126,170,8,119,86,72,152,
+    148,108,67,170,110,193,31,116,231,38,76,30,141,1,31,33,
+    10,137,167,255,220,158,64,0,56,37,63,181,36,87,64,102,
+    40,128,161,180,130,108,85,116,192,173,132,166,241,47,99,9,
+    163,91,137,7,145,141,179,185,176,101,154,252,138,132,133,0,
+    115,241,215,104,171,252,62,145,4,133,240,103,73,69,28,52,
+    16,35,178,100,93,40,124,71,102,96,112,204,144,172,65,9,
+    221,65,169,136,24,248,78,44,162,1,50,48,29,202,186,160,
+    39,66,140,224,109,89,227,149,53,65,152,214,5,210,153,22,
+    80,150,41,194,213,48,104,68,37,88,122,213,239,64,225,239,
+    84,224,79,54,17,76,107,73,240,136,92,147,11,44,27,12,
+    4,38,242,182,67,110,32,1,254,110,37,86,205,173,10,220,
+    151,107,11,6,102,34,28,142,96,80,242,84,40,112,143,199,
+    151,109,124,18,219,85,173,178,31,110,98,90,228,26,245,163,
+    92,56,15,254,212,6,118,13,137,151,4,254,48,248,241,60,
+    222,243,248,14,55,15,37,209,139,132,123,94,20,240,184,155,
+    172,87,30,25,115,92,231,17,149,112,69,131,151,4,97,202,
+    122,50,108,100,27,137,226,116,43,63,127,224,190,204,251,65,
+    202,88,79,20,202,153,148,114,96,36,200,48,2,185,229,149,
+    133,8,169,82,185,207,199,3,202,76,225,206,162,64,114,241,
+    126,134,220,183,126,218,7,198,67,214,131,181,139,220,147,43,
+    208,232,41,129,222,178,49,167,207,178,230,50,114,205,147,238,
+    164,81,79,101,240,174,200,1,80,93,132,155,150,77,196,79,
+    69,129,202,186,203,144,215,1,13,185,66,241,177,208,182,201,
+    12,152,48,101,188,152,200,252,238,134,188,108,20,167,221,33,
+    223,93,17,15,159,230,124,90,24,67,12,60,157,1,157,244,
+    241,127,67,132,169,250,105,4,114,214,211,57,64,108,156,98,
+    199,166,95,208,132,109,177,94,36,40,9,61,48,98,116,248,
+    199,152,252,59,162,216,196,104,184,103,56,24,7,97,80,148,
+    127,192,135,58,24,184,178,14,38,18,213,80,211,163,40,4,
+    217,94,198,192,126,159,148,129,209,73,126,155,12,7,151,62,
+    66,4,167,39,89,197,137,253,15,249,73,94,165,125,52,254,
+    164,130,204,132,67,57,213,49,133,103,102,114,183,52,126,145,
+    105,85,214,248,248,127,195,34,127,32,252,98,135,195,96,244,
+    40,119,216,35,252,107,5,0,169,85,59,195,241,255,19,11,
+    252,47,82,90,20,6,40,245,73,218,111,241,167,120,38,250,
+    124,242,119,120,184,242,131,202,146,159,78,203,210,103,210,165,
+    215,70,254,220,229,38,93,8,66,249,75,39,118,26,239,190,
+    69,242,71,11,213,212,253,113,251,163,246,12,93,183,48,150,
+    124,99,163,186,97,225,252,253,87,54,13,84,77,195,154,189,
+    107,213,222,149,242,100,236,61,146,189,103,97,228,254,197,44,
+    109,90,163,235,87,233,250,21,253,35,115,225,71,220,254,96,
+    182,46,30,127,255,236,195,179,43,245,143,218,50,230,30,201,
+    220,131,7,72,247,174,51,21,139,230,165,177,229,201,12,211,
+    41,49,157,105,166,115,195,88,41,25,219,240,104,126,69,150,
+    113,166,75,175,13,166,126,141,105,91,101,218,214,45,149,139,
+    99,239,79,60,156,64,122,79,234,37,231,203,25,203,160,100,
+    25,252,66,167,53,225,185,98,83,197,38,38,224,244,213,212,
+    46,119,127,212,251,97,239,202,157,71,223,127,114,71,58,120,
+    62,99,31,146,236,67,11,23,215,237,142,29,32,27,102,187,
+    100,238,64,105,157,201,223,26,76,103,158,28,151,14,156,39,
+    119,235,150,234,180,253,232,179,91,25,203,121,201,114,62,77,
+    174,141,170,58,169,106,31,180,201,122,102,221,86,155,174,115,
+    61,121,39,99,59,45,217,78,99,112,195,46,48,114,176,153,
+    52,152,214,31,1,207,115,249,248,202,233,95,107,159,154,127,
+    59,253,155,249,76,207,203,255,218,255,159,78,101,122,46,101,
+    106,38,165,154,201,36,131,226,50,46,49,143,59,31,237,95,
+    107,58,176,218,116,32,211,228,146,154,92,25,166,79,98,250,
+    210,76,95,161,38,211,17,34,161,165,11,143,189,143,230,215,
+    218,14,174,182,29,204,180,29,150,218,14,103,44,253,146,165,
+    63,109,233,207,203,89,171,63,248,103,87,187,97,182,45,12,
+    19,130,141,155,148,69,111,203,86,213,36,233,117,198,154,174,
+    236,40,244,43,100,31,24,23,141,73,35,121,126,100,101,22,
+    152,129,111,184,50,204,81,137,57,154,102,142,18,200,193,149,
+    110,32,13,223,112,101,152,67,18,57,115,78,32,109,25,166,
+    93,98,218,211,76,251,122,85,205,210,152,228,216,187,230,112,
+    174,58,156,25,199,1,201,113,32,83,213,43,85,245,38,233,
+    44,99,121,223,244,208,244,192,188,104,78,154,179,53,245,168,
+    7,61,36,73,14,101,237,141,146,189,35,117,68,178,119,39,
+    135,72,47,238,91,169,129,4,174,84,238,59,99,233,150,44,
+    221,105,114,21,88,38,77,107,192,160,179,66,211,146,220,98,
+    32,195,52,75,76,115,154,105,86,35,222,255,62,234,110,17,
+    207,159,97,26,36,166,33,205,52,168,37,0,197,111,101,152,
+    38,137,105,74,51,77,165,245,52,98,61,181,185,242,117,133,
+    210,89,198,250,126,197,195,138,7,150,69,75,210,66,16,219,
+    191,160,88,189,99,83,171,67,101,127,126,2,235,31,7,138,
+    167,106,141,105,88,101,26,212,181,39,131,25,166,69,98,90,
+    210,76,203,186,173,110,233,158,84,127,96,173,254,208,106,253,
+    161,76,125,191,84,223,159,177,29,145,108,71,146,250,108,107,
+    95,186,181,47,211,122,72,106,133,78,105,202,58,128,213,90,
+    147,227,11,76,146,195,89,123,179,4,114,20,37,123,111,78,
+    184,123,215,236,253,171,246,254,223,30,121,38,252,227,137,223,
+    156,248,253,96,218,222,159,177,143,74,246,209,140,101,76,178,
+    140,165,45,99,235,181,141,43,157,143,14,172,53,237,95,109,
+    218,159,105,234,149,154,122,51,181,46,169,214,149,28,205,90,
+    236,239,95,124,120,241,193,165,197,75,201,75,217,198,246,77,
+    170,202,218,64,146,37,125,182,161,249,145,57,53,34,53,236,
+    95,210,175,55,237,73,117,61,105,124,118,62,211,116,92,106,
+    58,190,100,36,99,172,103,173,238,216,106,221,177,103,209,223,
+    191,154,174,59,150,169,27,147,234,198,50,182,11,146,237,66,
+    218,118,33,91,211,4,157,84,93,183,238,104,204,54,236,95,
+    107,56,177,218,112,98,189,165,61,101,252,120,226,209,196,51,
+    243,239,207,111,234,168,198,147,95,80,218,198,166,175,48,249,
+    66,71,215,214,125,69,65,178,137,9,88,149,234,186,172,99,
+    223,154,227,232,170,227,104,182,161,245,81,197,147,158,127,234,
+    135,66,181,3,80,8,81,33,129,66,213,118,40,84,109,223,
+    196,132,20,250,192,184,108,92,130,15,136,231,193,216,226,88,
+    114,236,193,216,134,209,140,150,208,177,206,152,23,153,165,106,
+    69,111,137,85,184,255,238,74,245,170,177,41,109,108,2,11,
+    149,120,242,246,106,251,161,116,251,33,232,192,247,173,15,173,
+    75,158,130,102,108,84,214,46,134,83,198,79,172,153,74,215,
+    194,88,214,88,185,180,231,7,241,247,226,100,204,156,201,48,
+    103,37,230,108,154,57,11,217,159,132,51,76,155,196,180,165,
+    193,126,230,85,238,15,136,117,116,197,251,104,78,106,235,135,
+    59,184,50,204,128,196,12,164,153,1,66,97,96,69,120,116,
+    87,106,135,129,58,0,87,134,57,38,49,199,210,204,49,40,
+    151,181,92,122,124,65,106,113,173,181,28,94,109,57,156,105,
+    57,34,181,28,89,107,57,179,218,114,230,159,110,102,90,46,
+    74,45,23,211,150,75,112,109,181,201,6,202,84,153,181,236,
+    95,175,170,149,170,246,100,170,58,165,170,206,95,93,249,228,
+    141,191,125,243,147,55,211,149,135,191,208,105,172,253,95,232,
+    116,88,164,168,187,149,166,189,63,21,54,41,248,122,172,124,
+    109,73,254,200,2,209,100,120,69,248,197,221,159,221,253,181,
+    238,201,200,111,143,252,230,68,166,231,140,212,115,38,211,126,
+    86,106,63,155,97,206,73,204,185,52,115,174,208,114,144,177,
+    213,177,56,142,177,99,141,48,139,52,146,155,172,165,118,83,
+    7,223,235,173,237,143,94,255,197,119,127,246,221,39,227,207,
+    60,79,39,50,173,39,165,214,147,4,2,197,0,7,44,236,
+    177,199,87,202,160,32,64,153,31,86,198,83,158,71,19,112,
+    163,92,25,203,128,100,25,72,91,6,54,182,117,32,70,42,
+    194,164,89,187,74,215,46,205,46,135,50,116,151,68,34,180,
+    225,121,109,203,242,196,143,134,240,247,79,147,111,39,175,190,
+    119,9,81,43,214,232,134,85,186,97,165,94,106,60,144,161,
+    123,37,186,55,77,247,110,50,100,30,105,73,233,87,141,93,
+    105,99,87,150,169,80,102,202,12,195,74,12,155,38,87,214,
+    100,147,76,109,169,125,171,166,158,180,169,39,91,213,146,76,
+    60,120,119,241,93,236,150,46,24,110,201,209,116,205,197,140,
+    101,66,178,76,164,45,19,89,75,229,154,165,99,213,210,145,
+    177,236,149,44,123,211,150,189,95,231,202,239,93,53,237,75,
+    155,246,129,165,221,0,219,161,79,87,14,62,233,150,246,191,
+    4,223,112,101,152,243,18,115,62,205,156,39,83,231,1,212,
+    237,78,194,12,187,202,176,25,166,67,98,58,210,76,135,98,
+    192,208,210,157,202,50,251,211,165,215,6,211,176,198,180,175,
+    50,48,32,37,246,68,134,57,41,49,39,211,204,73,82,6,
+    6,174,9,61,131,174,116,233,5,130,49,153,183,180,56,203,
+    212,172,49,77,171,96,169,48,156,189,157,164,93,36,237,254,
+    194,72,163,130,209,168,96,152,88,168,234,6,201,214,73,124,
+    18,146,160,165,180,42,150,242,113,205,202,181,143,27,31,53,
+    22,166,178,188,151,2,188,216,245,7,212,70,122,163,166,54,
+    201,100,29,117,73,83,214,209,44,57,186,55,41,171,233,0,
+    73,208,62,214,195,12,84,85,243,254,187,15,223,93,17,20,
+    189,7,201,91,155,179,245,205,43,131,43,231,87,206,47,223,
+    93,162,179,117,77,75,186,141,170,154,149,129,71,167,211,85,
+    251,224,34,230,236,232,147,107,144,40,215,63,31,249,221,169,
+    180,109,52,99,27,149,108,163,112,179,110,171,89,102,86,170,
+    63,48,47,155,151,204,27,85,96,110,116,214,3,89,91,237,
+    178,121,101,88,178,237,89,179,57,87,109,206,140,237,128,100,
+    59,144,38,215,134,10,214,179,106,235,201,216,246,75,182,253,
+    105,114,229,27,166,215,215,151,204,62,150,106,226,109,213,62,
+    106,73,69,63,121,71,234,30,202,88,134,37,203,112,82,3,
+    98,90,4,193,183,172,50,45,43,175,98,135,21,231,115,184,
+    64,65,222,183,60,180,60,168,92,172,76,86,22,167,209,35,
+    229,105,183,62,209,63,53,75,61,195,25,203,136,100,25,41,
+    67,251,112,134,233,151,152,254,52,211,191,65,155,126,60,241,
+    131,137,165,122,169,186,179,224,101,110,160,208,247,163,79,179,
+    135,36,232,185,148,206,160,149,15,43,151,238,170,135,196,6,
+    186,4,251,16,187,149,36,73,195,214,34,192,254,210,107,133,
+    249,17,174,141,170,6,28,146,56,20,247,109,253,77,5,186,
+    102,141,110,92,165,27,87,14,102,232,253,18,189,63,77,163,
+    68,239,223,219,164,122,245,29,160,19,203,227,43,158,229,137,
+    165,115,169,177,79,198,159,120,62,153,200,212,28,250,137,110,
+    17,216,180,66,133,104,133,82,135,31,181,60,179,130,157,42,
+    24,44,184,129,161,180,8,166,197,102,26,213,100,235,219,150,
+    239,165,170,151,227,201,11,235,245,109,43,119,159,52,61,123,
+    45,83,127,70,170,63,147,188,144,109,104,89,186,13,19,129,
+    233,201,158,79,44,153,250,222,159,12,45,94,200,214,182,167,
+    90,211,142,131,201,145,228,8,184,0,192,1,218,40,235,136,
+    102,189,165,237,209,216,47,166,126,54,245,235,161,167,23,158,
+    189,250,244,98,166,229,132,212,114,34,221,124,242,159,135,126,
+    119,33,211,60,252,83,221,50,179,94,223,180,124,55,165,89,
+    126,7,106,171,174,93,154,75,209,153,234,46,169,186,11,245,
+    118,224,137,125,163,185,245,23,199,127,118,252,227,147,143,78,
+    174,53,31,88,109,62,240,100,44,211,124,84,106,62,186,196,
+    108,234,1,131,160,145,228,11,76,190,162,74,158,149,75,48,
+    212,175,204,99,152,51,26,218,161,177,13,207,142,101,234,79,
+    73,245,167,160,177,123,156,207,18,105,199,8,92,208,50,134,
+    178,212,44,158,222,164,28,166,142,172,165,46,249,10,126,178,
+    150,150,116,254,218,176,215,126,212,253,97,247,7,206,101,103,
+    114,104,83,107,181,30,201,218,106,62,50,126,104,92,97,82,
+    93,25,91,143,100,235,73,147,235,235,245,26,80,4,218,234,
+    44,38,48,0,179,142,209,255,50,180,169,211,86,219,161,33,
+    56,171,107,113,86,135,4,24,171,174,251,169,119,57,240,65,
+    104,57,148,122,85,170,235,86,19,131,107,83,107,192,186,26,
+    215,108,157,171,182,206,140,173,75,178,117,165,109,93,100,80,
+    191,146,177,93,148,108,23,211,182,139,235,142,250,229,137,15,
+    38,151,39,83,135,37,71,215,146,38,91,87,191,236,79,215,
+    29,200,54,52,62,50,45,13,102,29,245,31,77,125,56,149,
+    26,252,228,149,103,154,140,163,95,114,244,167,29,253,155,122,
+    170,190,129,160,125,141,127,255,135,161,172,213,75,13,43,3,
+    25,203,30,201,178,39,109,217,147,91,91,144,80,189,134,255,
+    198,216,150,106,31,84,45,86,41,193,146,24,88,217,64,0,
+    2,6,162,252,111,123,143,96,208,125,105,160,133,10,227,151,
+    86,13,164,95,153,235,196,14,234,171,142,65,205,29,135,238,
+    143,93,131,46,248,114,86,242,120,82,128,255,61,38,184,75,
+    201,255,119,76,254,35,38,102,101,135,12,55,212,220,238,226,
+    238,23,249,169,19,101,3,148,4,160,122,243,11,226,191,167,
+    200,38,57,89,38,127,195,156,81,246,80,206,241,85,26,124,
+    61,8,107,229,223,64,2,76,106,52,155,147,26,74,99,89,
+    48,227,39,75,85,45,144,79,150,50,45,144,79,150,178,44,
+    144,79,150,178,46,144,79,150,170,88,32,159,141,138,253,105,
+    114,45,24,55,152,147,11,250,13,250,34,184,104,26,219,102,
+    69,5,36,84,33,105,18,104,13,44,132,84,105,192,212,162,
+    57,177,73,21,146,115,140,230,28,44,7,243,73,221,176,94,
+    3,178,43,159,146,86,253,63,245,148,39,111,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/main.py",
+    "m5.main",
+    embedded_module_data,
+    10780,
+    24755);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,7 @@
+#
+# DO NOT EDIT THIS FILE!
+# File automatically generated by
+#   /root/package/src/SConscript:633
+#
+
+index = {'A9SCU': 'm5.objects.RealView', 'AMPMPrefetcher': 'm5.objects.Prefetcher', 'AbstractMemory': 'm5.objects.AbstractMemory', 'AbstractNVM': 'm5.objects.AbstractNVM', 'AccessMapPatternMatching': 'm5.objects.Prefetcher', 'AddrMap': 'm5.objects.MemInterface', 'AddrMapper': 'm5.objects.AddrMapper', 'AmbaDmaDevice': 'm5.objects.RealView', 'AmbaFake': 'm5.objects.RealView', 'AmbaIntDevice': 'm5.objects.RealView', 'AmbaPioDevice': 'm5.objects.RealView', 'Ap2ScpDoorbell': 'm5.objects.MHU', 'ArmDecoder': 'm5.objects.ArmDecoder', 'ArmEmuFreebsd': 'm5.objects.ArmSeWorkload', 'ArmEmuLinux': 'm5.objects.ArmSeWorkload', 'ArmExtension': 'm5.objects.ArmSystem', 'ArmFsFreebsd': 'm5.objects.ArmFsWorkload', 'ArmFsLinux': 'm5.objects.ArmFsWorkload', 'ArmFsWorkload': 'm5.objects.ArmFsWorkload', 'ArmISA': 'm5.objects.ArmISA', 'ArmInterruptPin': 'm5.objects.Gic', 'ArmInterruptType': 'm5.objects.Gic', 'ArmInterrupts': 'm5.objects.ArmInterrupts', 'ArmKvmCPU': 'm5.objects.ArmKvmCPU', 'ArmLookupLevel': 'm5.objects.ArmTLB', 'ArmMMU': 'm5.objects.ArmMMU', 'ArmMachineType': 'm5.objects.ArmFsWorkload', 'ArmNativeTrace': 'm5.objects.ArmNativeTrace', 'ArmPMU': 'm5.objects.ArmPMU', 'ArmPPI': 'm5.objects.Gic', 'ArmPciIntRouting': 'm5.objects.RealView', 'ArmRelease': 'm5.objects.ArmSystem', 'ArmSEWorkload': 'm5.objects.ArmSeWorkload', 'ArmSPI': 'm5.objects.Gic', 'ArmSemihosting': 'm5.objects.ArmSemihosting', 'ArmSigInterruptPin': 'm5.objects.Gic', 'ArmSystem': 'm5.objects.ArmSystem', 'ArmTLB': 'm5.objects.ArmTLB', 'ArmTableWalker': 'm5.objects.ArmMMU', 'ArmV8KvmCPU': 'm5.objects.ArmV8KvmCPU', 'BIPRP': 'm5.objects.ReplacementPolicies', 'BOPPrefetcher': 'm5.objects.Prefetcher', 'BRRIPRP': 'm5.objects.ReplacementPolicies', 'BadDevice': 'm5.objects.BadDevice', 'Base16Delta8': 'm5.objects.Compressors', 'Base32Delta16': 'm5.objects.Compressors', 'Base32Delta8': 'm5.objects.Compressors', 'Base64Delta16': 'm5.objects.Compressors', 'Base64Delta32': 'm5.objects.Compressors', 'Base64Delta8': 'm5.objects.Compressors', 'BaseArmKvmCPU': 'm5.objects.BaseArmKvmCPU', 'BaseCPU': 'm5.objects.BaseCPU', 'BaseCache': 'm5.objects.Cache', 'BaseCacheCompressor': 'm5.objects.Compressors', 'BaseDictionaryCompressor': 'm5.objects.Compressors', 'BaseGic': 'm5.objects.Gic', 'BaseISA': 'm5.objects.BaseISA', 'BaseIndexingPolicy': 'm5.objects.IndexingPolicies', 'BaseInterrupts': 'm5.objects.BaseInterrupts', 'BaseKvmCPU': 'm5.objects.BaseKvmCPU', 'BaseMMU': 'm5.objects.BaseMMU', 'BaseMemProbe': 'm5.objects.BaseMemProbe', 'BasePrefetcher': 'm5.objects.Prefetcher', 'BaseReplacementPolicy': 'm5.objects.ReplacementPolicies', 'BaseRoutingUnit': 'm5.objects.SimpleNetwork', 'BaseSetAssoc': 'm5.objects.Tags', 'BaseTLB': 'm5.objects.BaseTLB', 'BaseTags': 'm5.objects.Tags', 'BaseTrafficGen': 'm5.objects.BaseTrafficGen', 'BaseXBar': 'm5.objects.XBar', 'BasicExtLink': 'm5.objects.BasicLink', 'BasicIntLink': 'm5.objects.BasicLink', 'BasicLink': 'm5.objects.BasicLink', 'BasicPioDevice': 'm5.objects.Device', 'BasicRouter': 'm5.objects.BasicRouter', 'BiModeBP': 'm5.objects.BranchPredictor', 'BloomFilterBase': 'm5.objects.BloomFilters', 'BloomFilterBlock': 'm5.objects.BloomFilters', 'BloomFilterBulk': 'm5.objects.BloomFilters', 'BloomFilterH3': 'm5.objects.BloomFilters', 'BloomFilterMulti': 'm5.objects.BloomFilters', 'BloomFilterMultiBitSel': 'm5.objects.BloomFilters', 'BloomFilterPerfect': 'm5.objects.BloomFilters', 'BranchPredictor': 'm5.objects.BranchPredictor', 'BranchTargetBuffer': 'm5.objects.BranchPredictor', 'BranchType': 'm5.objects.BranchPredictor', 'Bridge': 'm5.objects.Bridge', 'ByteOrder': 'm5.objects.SimObject', 'CDCType': 'm5.objects.GarnetLink', 'CPack': 'm5.objects.Compressors', 'Cache': 'm5.objects.Cache', 'CfiMemory': 'm5.objects.CfiMemory', 'Characteristic': 'm5.objects.SMBios', 'CheckerCPU': 'm5.objects.CheckerCPU', 'Clint': 'm5.objects.Clint', 'ClockDomain': 'm5.objects.ClockDomain', 'ClockedObject': 'm5.objects.ClockedObject', 'Clusivity': 'm5.objects.Cache', 'Cmos': 'm5.objects.Cmos', 'CoherentXBar': 'm5.objects.XBar', 'CommMonitor': 'm5.objects.CommMonitor', 'CompressedTags': 'm5.objects.Tags', 'CopyEngine': 'm5.objects.CopyEngine', 'CowDiskImage': 'm5.objects.DiskImage', 'CpuCluster': 'm5.objects.CpuCluster', 'CpuLocalTimer': 'm5.objects.RealView', 'CreditLink': 'm5.objects.GarnetLink', 'CustomNoMaliGpu': 'm5.objects.NoMali', 'DCPTPrefetcher': 'm5.objects.Prefetcher', 'DMASequencer': 'm5.objects.Sequencer', 'DMA_Controller': 'm5.objects.DMA_Controller', 'DRAMInterface': 'm5.objects.DRAMInterface', 'DVFSHandler': 'm5.objects.DVFSHandler', 'DataDistribution': 'm5.objects.FlashDevice', 'DecoderFlavor': 'm5.objects.ArmISA', 'DeltaCorrelatingPredictionTables': 'm5.objects.Prefetcher', 'DerivedClockDomain': 'm5.objects.ClockDomain', 'DirectedGenerator': 'm5.objects.RubyDirectedTester', 'Directory_Controller': 'm5.objects.Directory_Controller', 'DiskImage': 'm5.objects.DiskImage', 'Display': 'm5.objects.Display', 'DistEtherLink': 'm5.objects.Ethernet', 'DmaDevice': 'm5.objects.Device', 'DmaVirtDevice': 'm5.objects.Device', 'Doorbell': 'm5.objects.Doorbell', 'DuelingRP': 'm5.objects.ReplacementPolicies', 'DumbTOD': 'm5.objects.T1000', 'DummyChecker': 'm5.objects.DummyChecker', 'EmulatedDriver': 'm5.objects.Process', 'EnergyCtrl': 'm5.objects.EnergyCtrl', 'EtherBus': 'm5.objects.Ethernet', 'EtherDevBase': 'm5.objects.Ethernet', 'EtherDevice': 'm5.objects.Ethernet', 'EtherDump': 'm5.objects.Ethernet', 'EtherLink': 'm5.objects.Ethernet', 'EtherSwitch': 'm5.objects.Ethernet', 'EtherTap': 'm5.objects.Ethernet', 'EtherTapBase': 'm5.objects.Ethernet', 'EtherTapStub': 'm5.objects.Ethernet', 'ExeTracer': 'm5.objects.CPUTracers', 'ExtCharacteristic': 'm5.objects.SMBios', 'ExternalMaster': 'm5.objects.ExternalMaster', 'ExternalSlave': 'm5.objects.ExternalSlave', 'FALRU': 'm5.objects.Tags', 'FIFORP': 'm5.objects.ReplacementPolicies', 'FPC': 'm5.objects.Compressors', 'FPCD': 'm5.objects.Compressors', 'FUDesc': 'm5.objects.FuncUnit', 'FVPBasePwrCtrl': 'm5.objects.RealView', 'FaultModel': 'm5.objects.FaultModel', 'FlashDevice': 'm5.objects.FlashDevice', 'FrequentValuesCompressor': 'm5.objects.Compressors', 'GUPSGen': 'm5.objects.GUPSGen', 'GarnetExtLink': 'm5.objects.GarnetLink', 'GarnetIntLink': 'm5.objects.GarnetLink', 'GarnetNetwork': 'm5.objects.GarnetNetwork', 'GarnetNetworkInterface': 'm5.objects.GarnetNetwork', 'GarnetRouter': 'm5.objects.GarnetNetwork', 'GarnetSyntheticTraffic': 'm5.objects.GarnetSyntheticTraffic', 'Gem5ToTlmBridge128': 'm5.objects.TlmBridge', 'Gem5ToTlmBridge256': 'm5.objects.TlmBridge', 'Gem5ToTlmBridge32': 'm5.objects.TlmBridge', 'Gem5ToTlmBridge512': 'm5.objects.TlmBridge', 'Gem5ToTlmBridge64': 'm5.objects.TlmBridge', 'Gem5ToTlmBridgeBase': 'm5.objects.TlmBridge', 'GenericArmPciHost': 'm5.objects.RealView', 'GenericPciHost': 'm5.objects.PciHost', 'GenericRiscvPciHost': 'm5.objects.HiFive', 'GenericTimer': 'm5.objects.GenericTimer', 'GenericTimerFrame': 'm5.objects.GenericTimer', 'GenericTimerMem': 'm5.objects.GenericTimer', 'GenericWatchdog': 'm5.objects.RealView', 'GicV2': 'm5.objects.Gic', 'Gicv2m': 'm5.objects.Gic', 'Gicv2mFrame': 'm5.objects.Gic', 'Gicv3': 'm5.objects.Gic', 'Gicv3Its': 'm5.objects.Gic', 'GoodbyeObject': 'm5.objects.HelloObject', 'HBMCtrl': 'm5.objects.HBMCtrl', 'HDLcd': 'm5.objects.RealView', 'HMCController': 'm5.objects.HMCController', 'HelloObject': 'm5.objects.HelloObject', 'HeteroMemCtrl': 'm5.objects.HeteroMemCtrl', 'HiFiveBase': 'm5.objects.HiFive', 'I2CBus': 'm5.objects.I2C', 'I2CDevice': 'm5.objects.I2C', 'I8042': 'm5.objects.I8042', 'I82094AA': 'm5.objects.I82094AA', 'I8237': 'm5.objects.I8237', 'I8254': 'm5.objects.I8254', 'I8259': 'm5.objects.I8259', 'IGbE': 'm5.objects.Ethernet', 'IdeController': 'm5.objects.Ide', 'IdeDisk': 'm5.objects.Ide', 'IdeID': 'm5.objects.Ide', 'ImageFormat': 'm5.objects.Graphics', 'IndirectMemoryPrefetcher': 'm5.objects.Prefetcher', 'IndirectPredictor': 'm5.objects.BranchPredictor', 'InstDecoder': 'm5.objects.InstDecoder', 'InstDisassembler': 'm5.objects.InstTracer', 'InstPBTrace': 'm5.objects.InstPBTrace', 'InstTracer': 'm5.objects.InstTracer', 'IntelTrace': 'm5.objects.CPUTracers', 'InvalidateGenerator': 'm5.objects.RubyDirectedTester', 'Iob': 'm5.objects.T1000', 'IrregularStreamBufferPrefetcher': 'm5.objects.Prefetcher', 'IsaFake': 'm5.objects.Device', 'KernelPanicOopsBehaviour': 'm5.objects.Workload', 'KernelWorkload': 'm5.objects.Workload', 'KvmVM': 'm5.objects.KvmVM', 'L1Cache_Controller': 'm5.objects.L1Cache_Controller', 'LFURP': 'm5.objects.ReplacementPolicies', 'LRURP': 'm5.objects.ReplacementPolicies', 'LTAGE': 'm5.objects.BranchPredictor', 'LocalBP': 'm5.objects.BranchPredictor', 'LoopPredictor': 'm5.objects.BranchPredictor', 'LupV': 'm5.objects.LupV', 'LupioBLK': 'm5.objects.LupioBLK', 'LupioIPI': 'm5.objects.LupioIPI', 'LupioPIC': 'm5.objects.LupioPIC', 'LupioRNG': 'm5.objects.LupioRNG', 'LupioRTC': 'm5.objects.LupioRTC', 'LupioSYS': 'm5.objects.LupioSYS', 'LupioTMR': 'm5.objects.LupioTMR', 'LupioTTY': 'm5.objects.LupioTTY', 'MHU': 'm5.objects.MHU', 'MPP_LoopPredictor': 'm5.objects.BranchPredictor', 'MPP_LoopPredictor_8KB': 'm5.objects.BranchPredictor', 'MPP_StatisticalCorrector': 'm5.objects.BranchPredictor', 'MPP_StatisticalCorrector_64KB': 'm5.objects.BranchPredictor', 'MPP_StatisticalCorrector_8KB': 'm5.objects.BranchPredictor', 'MPP_TAGE': 'm5.objects.BranchPredictor', 'MPP_TAGE_8KB': 'm5.objects.BranchPredictor', 'MRURP': 'm5.objects.ReplacementPolicies', 'Malta': 'm5.objects.Malta', 'MaltaCChip': 'm5.objects.Malta', 'MaltaIO': 'm5.objects.Malta', 'MathExprPowerModel': 'm5.objects.MathExprPowerModel', 'MemChecker': 'm5.objects.MemChecker', 'MemCheckerMonitor': 'm5.objects.MemChecker', 'MemCtrl': 'm5.objects.MemCtrl', 'MemDelay': 'm5.objects.MemDelay', 'MemFootprintProbe': 'm5.objects.MemFootprintProbe', 'MemInterface': 'm5.objects.MemInterface', 'MemSched': 'm5.objects.MemCtrl', 'MemTest': 'm5.objects.MemTest', 'MemTraceProbe': 'm5.objects.MemTraceProbe', 'MemoryMode': 'm5.objects.System', 'MessageBuffer': 'm5.objects.MessageBuffer', 'MessageRandomization': 'm5.objects.MessageBuffer', 'MhuDoorbell': 'm5.objects.MHU', 'MipsDecoder': 'm5.objects.MipsDecoder', 'MipsEmuLinux': 'm5.objects.MipsSeWorkload', 'MipsISA': 'm5.objects.MipsISA', 'MipsInterrupts': 'm5.objects.MipsInterrupts', 'MipsMMU': 'm5.objects.MipsMMU', 'MipsSEWorkload': 'm5.objects.MipsSeWorkload', 'MipsTLB': 'm5.objects.MipsTLB', 'MmDisk': 'm5.objects.T1000', 'MmioVirtIO': 'm5.objects.VirtIOMMIO', 'MultiCompressor': 'm5.objects.Compressors', 'MultiPrefetcher': 'm5.objects.Prefetcher', 'MultiperspectivePerceptron': 'm5.objects.BranchPredictor', 'MultiperspectivePerceptron64KB': 'm5.objects.BranchPredictor', 'MultiperspectivePerceptron8KB': 'm5.objects.BranchPredictor', 'MultiperspectivePerceptronTAGE': 'm5.objects.BranchPredictor', 'MultiperspectivePerceptronTAGE64KB': 'm5.objects.BranchPredictor', 'MultiperspectivePerceptronTAGE8KB': 'm5.objects.BranchPredictor', 'MuxingKvmGicV2': 'm5.objects.KvmGic', 'MuxingKvmGicV3': 'm5.objects.KvmGic', 'NSGigE': 'm5.objects.Ethernet', 'NVMInterface': 'm5.objects.NVMInterface', 'NativeTrace': 'm5.objects.CPUTracers', 'NetworkBridge': 'm5.objects.GarnetLink', 'NetworkLink': 'm5.objects.GarnetLink', 'NoMaliGpu': 'm5.objects.NoMali', 'NoMaliGpuType': 'm5.objects.NoMali', 'NoncoherentCache': 'm5.objects.Cache', 'NoncoherentXBar': 'm5.objects.XBar', 'OpClass': 'm5.objects.FuncUnit', 'OpDesc': 'm5.objects.FuncUnit', 'OutgoingRequestBridge': 'm5.objects.OutgoingRequestBridge', 'PIFPrefetcher': 'm5.objects.Prefetcher', 'PL031': 'm5.objects.RealView', 'PMAChecker': 'm5.objects.PMAChecker', 'PMP': 'm5.objects.PMP', 'PMType': 'm5.objects.PowerModel', 'PS2Device': 'm5.objects.PS2', 'PS2Keyboard': 'm5.objects.PS2', 'PS2Mouse': 'm5.objects.PS2', 'PS2TouchKit': 'm5.objects.PS2', 'PageManage': 'm5.objects.DRAMInterface', 'Pc': 'm5.objects.Pc', 'PcCountTracker': 'm5.objects.PcCountTracker', 'PcCountTrackerManager': 'm5.objects.PcCountTracker', 'PcSpeaker': 'm5.objects.PcSpeaker', 'PciBar': 'm5.objects.PciDevice', 'PciBarNone': 'm5.objects.PciDevice', 'PciDevice': 'm5.objects.PciDevice', 'PciHost': 'm5.objects.PciHost', 'PciIoBar': 'm5.objects.PciDevice', 'PciLegacyIoBar': 'm5.objects.PciDevice', 'PciMemBar': 'm5.objects.PciDevice', 'PciMemUpperBar': 'm5.objects.PciDevice', 'PciVirtIO': 'm5.objects.VirtIO', 'PerfectCompressor': 'm5.objects.Compressors', 'PioDevice': 'm5.objects.Device', 'Pl011': 'm5.objects.RealView', 'Pl050': 'm5.objects.RealView', 'Pl111': 'm5.objects.RealView', 'Platform': 'm5.objects.Platform', 'Plic': 'm5.objects.Plic', 'PlicBase': 'm5.objects.Plic', 'PlicIntDevice': 'm5.objects.PlicDevice', 'PortTerminator': 'm5.objects.PortTerminator', 'PowerDecoder': 'm5.objects.PowerDecoder', 'PowerDomain': 'm5.objects.PowerDomain', 'PowerEmuLinux': 'm5.objects.PowerSeWorkload', 'PowerISA': 'm5.objects.PowerISA', 'PowerInterrupts': 'm5.objects.PowerInterrupts', 'PowerMMU': 'm5.objects.PowerMMU', 'PowerModel': 'm5.objects.PowerModel', 'PowerModelState': 'm5.objects.PowerModelState', 'PowerSEWorkload': 'm5.objects.PowerSeWorkload', 'PowerState': 'm5.objects.PowerState', 'PowerTLB': 'm5.objects.PowerTLB', 'PrivilegeModeSet': 'm5.objects.RiscvISA', 'ProbeListenerObject': 'm5.objects.Probe', 'Process': 'm5.objects.Process', 'PwrState': 'm5.objects.PowerState', 'PyTrafficGen': 'm5.objects.PyTrafficGen', 'QemuFwCfg': 'm5.objects.QemuFwCfg', 'QemuFwCfgIo': 'm5.objects.QemuFwCfg', 'QemuFwCfgItem': 'm5.objects.QemuFwCfg', 'QemuFwCfgItemBytes': 'm5.objects.QemuFwCfg', 'QemuFwCfgItemE820': 'm5.objects.X86QemuFwCfg', 'QemuFwCfgItemFile': 'm5.objects.QemuFwCfg', 'QemuFwCfgItemString': 'm5.objects.QemuFwCfg', 'QemuFwCfgMmio': 'm5.objects.QemuFwCfg', 'QoSFixedPriorityPolicy': 'm5.objects.QoSPolicy', 'QoSMemCtrl': 'm5.objects.QoSMemCtrl', 'QoSMemSinkCtrl': 'm5.objects.QoSMemSinkCtrl', 'QoSMemSinkInterface': 'm5.objects.QoSMemSinkInterface', 'QoSPolicy': 'm5.objects.QoSPolicy', 'QoSPropFairPolicy': 'm5.objects.QoSPolicy', 'QoSQPolicy': 'm5.objects.QoSMemCtrl', 'QoSTurnaroundPolicy': 'm5.objects.QoSTurnaround', 'QoSTurnaroundPolicyIdeal': 'm5.objects.QoSTurnaround', 'QueuedPrefetcher': 'm5.objects.Prefetcher', 'RandomRP': 'm5.objects.ReplacementPolicies', 'RangeAddrMapper': 'm5.objects.AddrMapper', 'RawDiskImage': 'm5.objects.DiskImage', 'RealView': 'm5.objects.RealView', 'RealViewCtrl': 'm5.objects.RealView', 'RealViewOsc': 'm5.objects.RealView', 'RealViewTemperatureSensor': 'm5.objects.RealView', 'RedirectPath': 'm5.objects.RedirectPath', 'RepeatedQwordsCompressor': 'm5.objects.Compressors', 'ReturnAddrStack': 'm5.objects.BranchPredictor', 'RiscvBareMetal': 'm5.objects.RiscvFsWorkload', 'RiscvBootloaderKernelWorkload': 'm5.objects.RiscvFsWorkload', 'RiscvDecoder': 'm5.objects.RiscvDecoder', 'RiscvEmuLinux': 'm5.objects.RiscvSeWorkload', 'RiscvISA': 'm5.objects.RiscvISA', 'RiscvInterrupts': 'm5.objects.RiscvInterrupts', 'RiscvLinux': 'm5.objects.RiscvFsWorkload', 'RiscvMMU': 'm5.objects.RiscvMMU', 'RiscvMmioVirtIO': 'm5.objects.RiscvVirtIOMMIO', 'RiscvPagetableWalker': 'm5.objects.RiscvTLB', 'RiscvRTC': 'm5.objects.RTC', 'RiscvSEWorkload': 'm5.objects.RiscvSeWorkload', 'RiscvTLB': 'm5.objects.RiscvTLB', 'RiscvType': 'm5.objects.RiscvISA', 'Root': 'm5.objects.Root', 'RubyCache': 'm5.objects.RubyCache', 'RubyController': 'm5.objects.Controller', 'RubyDirectedTester': 'm5.objects.RubyDirectedTester', 'RubyDirectoryMemory': 'm5.objects.DirectoryMemory', 'RubyHTMSequencer': 'm5.objects.Sequencer', 'RubyNetwork': 'm5.objects.Network', 'RubyPort': 'm5.objects.Sequencer', 'RubyPortProxy': 'm5.objects.Sequencer', 'RubyPrefetcher': 'm5.objects.RubyPrefetcher', 'RubySequencer': 'm5.objects.Sequencer', 'RubySystem': 'm5.objects.RubySystem', 'RubyTester': 'm5.objects.RubyTester', 'RubyWireBuffer': 'm5.objects.WireBuffer', 'SBOOEPrefetcher': 'm5.objects.Prefetcher', 'SEWorkload': 'm5.objects.Workload', 'SHiPMemRP': 'm5.objects.ReplacementPolicies', 'SHiPPCRP': 'm5.objects.ReplacementPolicies', 'SHiPRP': 'm5.objects.ReplacementPolicies', 'SMMUv3': 'm5.objects.SMMUv3', 'SMMUv3DeviceInterface': 'm5.objects.SMMUv3', 'STeMSPrefetcher': 'm5.objects.Prefetcher', 'ScmiAgentChannel': 'm5.objects.Scmi', 'ScmiChannel': 'm5.objects.Scmi', 'ScmiCommunication': 'm5.objects.Scmi', 'ScmiPlatform': 'm5.objects.Scmi', 'ScmiPlatformChannel': 'm5.objects.Scmi', 'Scp': 'm5.objects.Scp', 'Scp2ApDoorbell': 'm5.objects.MHU', 'SecondChanceRP': 'm5.objects.ReplacementPolicies', 'SectorTags': 'm5.objects.Tags', 'SerialDevice': 'm5.objects.Serial', 'SerialLink': 'm5.objects.SerialLink', 'SerialNullDevice': 'm5.objects.Serial', 'SeriesRequestGenerator': 'm5.objects.RubyDirectedTester', 'SetAssociative': 'm5.objects.IndexingPolicies', 'SharedMemoryServer': 'm5.objects.SharedMemoryServer', 'SignaturePathPrefetcher': 'm5.objects.Prefetcher', 'SignaturePathPrefetcherV2': 'm5.objects.Prefetcher', 'SimObject': 'm5.objects.SimObject', 'SimpleBTB': 'm5.objects.BranchPredictor', 'SimpleCache': 'm5.objects.SimpleCache', 'SimpleDisk': 'm5.objects.SimpleDisk', 'SimpleExtLink': 'm5.objects.SimpleLink', 'SimpleIndirectPredictor': 'm5.objects.BranchPredictor', 'SimpleIntLink': 'm5.objects.SimpleLink', 'SimpleMemDelay': 'm5.objects.MemDelay', 'SimpleMemobj': 'm5.objects.SimpleMemobj', 'SimpleMemory': 'm5.objects.SimpleMemory', 'SimpleNetwork': 'm5.objects.SimpleNetwork', 'SimpleObject': 'm5.objects.SimpleObject', 'SimpleUart': 'm5.objects.Uart', 'Sinic': 'm5.objects.Ethernet', 'SkewedAssociative': 'm5.objects.IndexingPolicies', 'SlimAMPMPrefetcher': 'm5.objects.Prefetcher', 'SnoopFilter': 'm5.objects.XBar', 'SouthBridge': 'm5.objects.SouthBridge', 'Sp804': 'm5.objects.RealView', 'Sp805': 'm5.objects.RealView', 'SparcDecoder': 'm5.objects.SparcDecoder', 'SparcEmuLinux': 'm5.objects.SparcSeWorkload', 'SparcFsWorkload': 'm5.objects.SparcFsWorkload', 'SparcISA': 'm5.objects.SparcISA', 'SparcInterrupts': 'm5.objects.SparcInterrupts', 'SparcMMU': 'm5.objects.SparcMMU', 'SparcNativeTrace': 'm5.objects.SparcNativeTrace', 'SparcSEWorkload': 'm5.objects.SparcSeWorkload', 'SparcTLB': 'm5.objects.SparcTLB', 'SrcClockDomain': 'm5.objects.ClockDomain', 'StackDistProbe': 'm5.objects.StackDistProbe', 'StaticInstFlags': 'm5.objects.StaticInstFlags', 'StatisticalCorrector': 'm5.objects.BranchPredictor', 'StreamGenType': 'm5.objects.BaseTrafficGen', 'StridePrefetcher': 'm5.objects.Prefetcher', 'StridePrefetcherHashedSetAssociative': 'm5.objects.Prefetcher', 'StubWorkload': 'm5.objects.Workload', 'SubSystem': 'm5.objects.SubSystem', 'Switch': 'm5.objects.SimpleNetwork', 'SysBridge': 'm5.objects.SysBridge', 'SysSecCtrl': 'm5.objects.RealView', 'System': 'm5.objects.System', 'SystemC_Kernel': 'm5.objects.SystemC', 'SystemC_ScModule': 'm5.objects.SystemC', 'SystemC_ScObject': 'm5.objects.SystemC', 'SystemCounter': 'm5.objects.GenericTimer', 'T1000': 'm5.objects.T1000', 'TAGE': 'm5.objects.BranchPredictor', 'TAGEBase': 'm5.objects.BranchPredictor', 'TAGE_SC_L': 'm5.objects.BranchPredictor', 'TAGE_SC_L_64KB': 'm5.objects.BranchPredictor', 'TAGE_SC_L_64KB_StatisticalCorrector': 'm5.objects.BranchPredictor', 'TAGE_SC_L_8KB': 'm5.objects.BranchPredictor', 'TAGE_SC_L_8KB_StatisticalCorrector': 'm5.objects.BranchPredictor', 'TAGE_SC_L_LoopPredictor': 'm5.objects.BranchPredictor', 'TAGE_SC_L_TAGE': 'm5.objects.BranchPredictor', 'TAGE_SC_L_TAGE_64KB': 'm5.objects.BranchPredictor', 'TAGE_SC_L_TAGE_8KB': 'm5.objects.BranchPredictor', 'TaggedPrefetcher': 'm5.objects.Prefetcher', 'TargetProvider': 'm5.objects.BranchPredictor', 'TarmacDump': 'm5.objects.TarmacTrace', 'TarmacParser': 'm5.objects.TarmacTrace', 'TarmacTracer': 'm5.objects.TarmacTrace', 'Terminal': 'm5.objects.Terminal', 'TerminalDump': 'm5.objects.Terminal', 'ThermalCapacitor': 'm5.objects.ThermalModel', 'ThermalDomain': 'm5.objects.ThermalDomain', 'ThermalModel': 'm5.objects.ThermalModel', 'ThermalNode': 'm5.objects.ThermalModel', 'ThermalReference': 'm5.objects.ThermalModel', 'ThermalResistor': 'm5.objects.ThermalModel', 'ThreadBridge': 'm5.objects.ThreadBridge', 'TickedObject': 'm5.objects.TickedObject', 'TimingExpr': 'm5.objects.TimingExpr', 'TimingExprBin': 'm5.objects.TimingExpr', 'TimingExprIf': 'm5.objects.TimingExpr', 'TimingExprLet': 'm5.objects.TimingExpr', 'TimingExprLiteral': 'm5.objects.TimingExpr', 'TimingExprOp': 'm5.objects.TimingExpr', 'TimingExprRef': 'm5.objects.TimingExpr', 'TimingExprSrcReg': 'm5.objects.TimingExpr', 'TimingExprUn': 'm5.objects.TimingExpr', 'TlmToGem5Bridge128': 'm5.objects.TlmBridge', 'TlmToGem5Bridge256': 'm5.objects.TlmBridge', 'TlmToGem5Bridge32': 'm5.objects.TlmBridge', 'TlmToGem5Bridge512': 'm5.objects.TlmBridge', 'TlmToGem5Bridge64': 'm5.objects.TlmBridge', 'TlmToGem5BridgeBase': 'm5.objects.TlmBridge', 'TournamentBP': 'm5.objects.BranchPredictor', 'TraceCPU': 'm5.objects.TraceCPU', 'TrafficGen': 'm5.objects.TrafficGen', 'TreePLRURP': 'm5.objects.ReplacementPolicies', 'TypeTLB': 'm5.objects.BaseTLB', 'UFSHostDevice': 'm5.objects.UFSHostDevice', 'Uart': 'm5.objects.Uart', 'Uart8250': 'm5.objects.Uart', 'VGic': 'm5.objects.Gic', 'VirtIO9PBase': 'm5.objects.VirtIO9P', 'VirtIO9PDiod': 'm5.objects.VirtIO9P', 'VirtIO9PProxy': 'm5.objects.VirtIO9P', 'VirtIO9PSocket': 'm5.objects.VirtIO9P', 'VirtIOBlock': 'm5.objects.VirtIOBlock', 'VirtIOConsole': 'm5.objects.VirtIOConsole', 'VirtIODeviceBase': 'm5.objects.VirtIO', 'VirtIODummyDevice': 'm5.objects.VirtIO', 'VirtIORng': 'm5.objects.VirtIORng', 'VncInput': 'm5.objects.Vnc', 'VncServer': 'm5.objects.Vnc', 'VoltageDomain': 'm5.objects.VoltageDomain', 'WeightBased': 'm5.objects.SimpleNetwork', 'WeightedLRURP': 'm5.objects.ReplacementPolicies', 'Workload': 'm5.objects.Workload', 'WriteAllocator': 'm5.objects.Cache', 'X86ACPIMadt': 'm5.objects.ACPI', 'X86ACPIMadtIOAPIC': 'm5.objects.ACPI', 'X86ACPIMadtIntSourceOverride': 'm5.objects.ACPI', 'X86ACPIMadtLAPIC': 'm5.objects.ACPI', 'X86ACPIMadtLAPICOverride': 'm5.objects.ACPI', 'X86ACPIMadtNMI': 'm5.objects.ACPI', 'X86ACPIMadtRecord': 'm5.objects.ACPI', 'X86ACPIRSDP': 'm5.objects.ACPI', 'X86ACPIRSDT': 'm5.objects.ACPI', 'X86ACPISysDescTable': 'm5.objects.ACPI', 'X86ACPIXSDT': 'm5.objects.ACPI', 'X86BareMetalWorkload': 'm5.objects.X86FsWorkload', 'X86Decoder': 'm5.objects.X86Decoder', 'X86E820Entry': 'm5.objects.E820', 'X86E820Table': 'm5.objects.E820', 'X86EmuLinux': 'm5.objects.X86SeWorkload', 'X86FsLinux': 'm5.objects.X86FsWorkload', 'X86FsWorkload': 'm5.objects.X86FsWorkload', 'X86I8259CascadeMode': 'm5.objects.I8259', 'X86ISA': 'm5.objects.X86ISA', 'X86IdeController': 'm5.objects.X86Ide', 'X86IntelMPAddrSpaceMapping': 'm5.objects.IntelMP', 'X86IntelMPAddressType': 'm5.objects.IntelMP', 'X86IntelMPBaseConfigEntry': 'm5.objects.IntelMP', 'X86IntelMPBus': 'm5.objects.IntelMP', 'X86IntelMPBusHierarchy': 'm5.objects.IntelMP', 'X86IntelMPCompatAddrSpaceMod': 'm5.objects.IntelMP', 'X86IntelMPConfigTable': 'm5.objects.IntelMP', 'X86IntelMPExtConfigEntry': 'm5.objects.IntelMP', 'X86IntelMPFloatingPointer': 'm5.objects.IntelMP', 'X86IntelMPIOAPIC': 'm5.objects.IntelMP', 'X86IntelMPIOIntAssignment': 'm5.objects.IntelMP', 'X86IntelMPInterruptType': 'm5.objects.IntelMP', 'X86IntelMPLocalIntAssignment': 'm5.objects.IntelMP', 'X86IntelMPPolarity': 'm5.objects.IntelMP', 'X86IntelMPProcessor': 'm5.objects.IntelMP', 'X86IntelMPRangeList': 'm5.objects.IntelMP', 'X86IntelMPTriggerMode': 'm5.objects.IntelMP', 'X86KvmCPU': 'm5.objects.X86KvmCPU', 'X86LocalApic': 'm5.objects.X86LocalApic', 'X86MMU': 'm5.objects.X86MMU', 'X86NativeTrace': 'm5.objects.X86NativeTrace', 'X86PagetableWalker': 'm5.objects.X86TLB', 'X86SMBiosBiosInformation': 'm5.objects.SMBios', 'X86SMBiosSMBiosStructure': 'm5.objects.SMBios', 'X86SMBiosSMBiosTable': 'm5.objects.SMBios', 'X86TLB': 'm5.objects.X86TLB', 'ZeroCompressor': 'm5.objects.Compressors'}
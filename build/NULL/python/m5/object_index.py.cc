@@ -0,0 +1,864 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,124,5,156,35,201,117,254,54,45,204,236,204,210,
+    45,29,147,15,125,119,11,183,123,123,190,243,121,4,35,26,
+    105,164,17,141,70,163,129,150,186,37,245,8,90,76,67,118,
+    208,225,75,156,196,1,135,227,36,14,147,131,255,48,179,195,
+    73,135,227,48,56,78,28,116,232,255,234,117,171,245,90,179,
+    155,219,223,171,122,223,251,170,170,11,95,85,87,107,238,195,
+    199,200,127,243,86,252,177,143,156,63,118,236,189,199,180,99,
+    202,49,133,123,15,167,240,138,0,161,168,72,16,30,87,78,
+    64,120,18,45,167,148,25,8,103,149,211,16,206,97,202,121,
+    12,207,96,120,22,195,115,202,121,8,47,40,247,65,120,81,
+    185,4,225,101,12,175,40,87,33,188,95,121,224,61,28,60,
+    231,65,22,43,15,97,248,176,242,8,132,143,42,143,65,248,
+    56,134,79,40,79,66,248,22,229,41,8,159,86,158,129,240,
+    89,229,57,8,159,199,244,111,85,94,128,240,69,229,37,8,
+    175,97,250,235,248,228,27,248,132,155,248,180,151,153,253,253,
+    236,73,183,148,219,128,95,193,116,119,48,197,171,88,226,219,
+    176,196,215,148,215,33,124,187,242,6,132,239,192,54,46,160,
+    238,82,220,16,122,20,47,132,139,24,250,48,244,99,24,192,
+    48,136,97,72,89,178,158,20,86,34,128,151,149,40,132,49,
+    228,86,48,140,227,179,19,74,18,194,148,146,134,112,85,201,
+    64,184,166,100,33,92,87,114,16,110,40,155,16,110,97,13,
+    182,177,6,178,146,135,176,160,40,16,170,74,17,194,18,211,
+    241,73,101,69,3,188,163,84,32,172,42,53,8,235,24,234,
+    24,54,148,38,132,45,165,13,97,71,233,66,216,83,250,16,
+    14,48,28,98,56,194,112,23,195,61,12,247,49,60,192,244,
+    135,44,196,39,189,19,241,187,148,79,128,240,19,149,79,130,
+    240,147,149,79,129,240,83,177,101,239,198,182,126,154,242,233,
+    16,126,134,242,153,16,126,150,242,217,16,126,142,242,38,132,
+    159,171,124,30,132,239,81,62,31,194,47,192,148,95,168,188,
+    23,194,47,194,122,127,177,242,37,16,126,169,221,166,247,41,
+    95,6,248,203,149,175,128,240,43,149,175,130,240,171,113,84,
+    191,6,159,247,181,202,251,33,252,58,236,159,175,87,190,1,
+    194,15,40,223,8,225,55,41,223,12,225,183,40,223,10,225,
+    183,41,223,14,225,119,224,108,250,78,76,249,93,88,131,239,
+    86,62,8,225,247,40,223,107,61,233,251,240,25,223,175,252,
+    0,132,63,168,252,63,8,127,8,123,236,135,49,252,17,229,
+    71,33,252,49,28,131,31,87,126,2,194,159,84,126,10,194,
+    159,86,126,6,194,159,85,126,14,194,159,199,92,191,128,225,
+    47,98,248,75,24,254,50,134,191,194,66,124,210,135,16,255,
+    42,134,191,134,225,175,43,191,1,225,111,98,95,253,150,242,
+    219,16,254,142,242,187,16,26,56,206,191,135,79,253,125,236,
+    219,63,192,240,15,149,63,130,240,143,177,39,254,68,249,83,
+    8,63,140,173,252,51,100,255,92,249,11,235,73,127,137,189,
+    244,87,24,254,181,242,55,16,254,45,134,127,135,225,223,43,
+    31,129,240,31,148,143,66,248,143,24,254,19,134,31,195,240,
+    159,49,252,23,12,255,21,159,244,111,202,191,67,248,31,202,
+    199,33,252,79,229,191,32,252,111,22,226,147,254,7,241,255,
+    178,116,111,114,224,47,30,195,152,179,98,222,138,5,43,22,
+    173,88,2,57,142,218,9,144,147,168,157,178,202,152,1,153,
+    69,237,180,157,106,14,100,30,181,51,172,22,16,159,5,57,
+    135,218,121,91,187,0,114,159,89,47,208,46,130,92,66,251,
+    101,144,43,168,93,5,185,31,181,7,64,30,68,237,33,54,
+    18,16,63,12,242,8,106,143,218,218,99,182,246,56,200,19,
+    168,61,201,230,210,155,204,31,117,49,126,10,228,105,212,158,
+    1,121,22,181,231,64,158,71,237,173,182,237,5,54,214,111,
+    50,79,245,65,187,142,47,177,25,245,38,243,91,102,153,215,
+    217,156,131,248,6,200,77,212,94,182,181,91,32,183,81,123,
+    5,228,14,106,175,178,25,242,38,243,94,102,252,154,85,167,
+    215,173,248,237,86,252,6,200,59,80,91,0,113,161,230,6,
+    241,160,230,5,89,68,205,7,226,183,107,23,0,9,162,61,
+    4,178,132,90,24,36,130,218,50,72,20,181,24,243,241,111,
+    50,255,102,62,45,110,197,9,43,78,90,113,202,138,211,86,
+    188,106,197,25,171,246,107,32,89,212,214,109,45,103,107,27,
+    32,155,118,221,182,64,182,209,46,219,90,30,164,128,154,2,
+    162,162,86,4,41,161,86,102,187,21,196,154,157,106,7,164,
+    130,90,21,164,134,90,29,68,71,173,1,98,142,70,203,214,
+    218,86,75,59,32,102,221,123,32,125,212,6,32,67,212,70,
+    32,187,118,77,247,64,246,209,126,96,167,61,4,121,39,106,
+    239,178,102,192,39,128,124,34,106,159,196,214,242,155,204,179,
+    154,115,226,83,172,39,125,170,21,191,219,138,63,205,138,63,
+    221,138,63,195,138,63,19,228,179,80,251,108,91,251,28,107,
+    142,191,9,242,185,118,205,62,207,154,145,239,97,126,2,226,
+    207,183,226,47,96,222,245,77,230,159,205,248,189,214,56,127,
+    145,213,91,95,204,188,16,196,95,98,197,95,10,242,62,212,
+    190,204,170,243,151,91,107,249,43,64,190,18,181,175,2,249,
+    106,212,190,6,228,107,81,123,63,200,215,161,246,245,166,102,
+    213,235,27,108,251,7,108,237,27,153,103,135,248,155,64,76,
+    237,91,64,190,21,181,111,179,181,111,7,249,14,212,190,19,
+    228,187,80,251,110,91,251,160,173,125,15,243,104,16,127,175,
+    109,249,62,91,251,126,91,251,1,91,251,65,16,179,7,127,
+    136,141,142,85,207,31,182,102,197,143,88,173,253,81,43,254,
+    49,43,254,113,16,115,116,127,18,228,167,80,251,105,91,251,
+    25,144,159,69,237,231,64,126,30,181,95,0,249,69,212,126,
+    9,228,151,81,251,21,144,15,161,246,171,32,191,134,218,175,
+    131,152,99,247,155,32,191,133,218,111,219,253,250,59,32,191,
+    107,215,210,176,243,255,30,200,239,163,246,7,32,127,136,218,
+    31,129,252,49,106,127,2,242,167,168,125,152,237,109,16,255,
+    153,157,254,207,65,254,2,181,191,4,249,43,212,254,218,214,
+    254,198,214,254,214,214,254,14,228,239,81,251,136,109,251,7,
+    91,251,168,173,253,35,200,63,217,117,253,24,200,63,163,253,
+    95,64,254,21,181,127,3,49,71,235,63,204,180,16,126,220,
+    214,254,211,206,241,95,32,255,141,218,255,216,218,255,226,124,
+    228,97,95,122,3,99,142,157,85,33,230,217,158,15,177,128,
+    35,197,195,190,100,198,146,21,31,183,226,19,32,39,173,218,
+    241,176,67,121,209,58,131,43,141,87,102,65,204,242,230,108,
+    109,30,228,12,106,103,65,206,161,118,222,234,99,30,118,40,
+    158,237,80,16,94,180,115,92,2,185,140,218,21,144,171,168,
+    221,15,242,0,106,15,130,60,132,218,195,118,121,143,216,236,
+    163,118,201,143,129,60,110,215,244,9,144,39,209,254,22,144,
+    167,80,123,154,237,59,16,63,3,242,44,106,207,177,147,19,
+    196,207,131,188,21,181,23,44,203,139,86,252,18,200,53,212,
+    174,91,150,27,32,55,81,123,25,228,22,106,183,65,94,65,
+    237,142,213,223,175,190,201,89,169,222,102,245,252,107,44,182,
+    106,247,186,101,123,59,136,169,189,195,214,22,172,18,92,32,
+    110,212,60,182,230,181,181,69,91,243,217,154,31,36,128,90,
+    16,189,52,15,103,113,179,204,37,118,154,130,56,12,18,65,
+    109,25,36,138,90,204,182,173,216,251,50,15,59,88,26,109,
+    9,144,36,106,41,171,94,105,43,94,101,167,95,136,51,214,
+    92,88,3,201,162,182,14,146,67,109,3,100,19,181,45,43,
+    213,182,109,97,187,150,138,90,30,164,128,154,2,98,218,138,
+    236,180,15,113,9,164,140,154,6,178,99,215,175,130,222,136,
+    135,211,190,89,207,154,85,171,58,122,104,94,209,65,26,168,
+    53,173,153,220,178,226,54,72,7,181,46,72,15,181,62,200,
+    0,181,33,200,8,181,93,144,61,212,246,65,14,80,59,4,
+    121,39,106,239,178,243,126,2,200,39,162,246,73,236,116,109,
+    213,239,147,65,62,5,173,159,10,242,110,212,62,205,234,131,
+    79,103,111,43,16,127,134,85,231,207,180,226,207,178,231,204,
+    103,131,124,14,106,111,90,253,240,185,32,159,135,218,123,172,
+    118,124,254,155,230,62,205,43,95,0,242,133,168,189,215,214,
+    190,200,214,190,152,157,79,33,254,18,230,137,173,218,125,169,
+    85,147,247,89,241,151,89,241,151,91,241,87,88,241,87,90,
+    241,87,89,241,87,91,241,215,88,241,215,90,241,251,173,248,
+    235,172,150,124,189,133,191,1,228,3,168,125,163,173,125,147,
+    173,125,51,200,183,216,117,250,86,19,65,248,109,32,223,142,
+    218,119,128,124,39,106,223,101,219,190,219,214,62,104,107,223,
+    99,107,223,11,242,125,168,125,63,200,15,160,246,131,32,230,
+    108,249,33,91,251,97,91,251,17,91,251,81,91,251,49,91,
+    251,113,91,251,9,83,179,106,251,147,182,253,167,216,123,2,
+    196,63,109,197,63,99,197,63,107,197,63,103,197,63,111,197,
+    191,96,245,205,47,130,252,18,106,191,12,242,43,168,125,200,
+    90,175,191,202,222,111,33,254,53,144,95,71,237,55,204,217,
+    15,225,111,218,218,111,225,187,4,15,251,30,175,252,142,93,
+    179,223,53,17,132,134,173,253,158,173,253,62,200,31,160,246,
+    135,32,127,132,218,31,91,123,59,143,59,160,169,253,41,200,
+    135,81,251,51,144,63,71,237,47,108,237,47,65,254,10,181,
+    191,182,230,231,223,88,53,255,91,123,14,255,157,229,95,254,
+    30,228,35,168,253,131,169,89,245,252,168,109,255,71,91,251,
+    39,91,251,152,173,253,179,173,253,139,173,253,171,173,253,155,
+    173,253,187,173,253,7,200,199,81,251,79,16,115,246,255,55,
+    200,255,160,246,191,150,38,40,199,222,52,119,63,65,225,173,
+    28,130,34,216,154,248,38,190,31,97,109,5,120,95,19,240,
+    77,76,128,29,81,192,247,53,65,57,5,50,131,218,172,173,
+    157,182,181,57,91,155,183,181,51,182,118,214,214,206,217,218,
+    121,91,187,96,107,247,217,218,69,91,187,100,107,151,109,237,
+    138,169,189,159,233,51,150,92,5,185,31,228,1,144,7,65,
+    30,2,79,3,255,80,243,66,248,240,251,78,191,159,203,178,
+    214,61,146,56,246,204,163,194,177,99,134,228,122,53,225,73,
+    141,46,212,110,189,168,231,119,212,66,167,253,98,92,149,171,
+    105,77,237,27,243,174,72,44,18,107,169,69,181,83,40,171,
+    173,209,69,146,104,98,134,100,249,118,167,37,23,58,17,181,
+    166,183,134,163,171,36,153,147,50,102,199,120,57,29,25,93,
+    186,75,58,176,27,87,92,133,130,218,110,71,228,70,76,238,
+    116,212,86,61,34,195,131,180,122,201,56,225,82,148,22,216,
+    71,151,73,86,40,58,88,135,100,69,185,160,26,51,86,138,
+    198,84,117,39,102,99,206,85,203,203,222,154,236,85,123,26,
+    228,56,201,160,79,174,168,38,1,69,89,4,194,152,166,91,
+    112,222,213,184,145,40,52,188,186,222,202,171,213,234,104,158,
+    86,33,144,130,39,183,106,94,181,160,43,211,79,182,205,80,
+    98,171,182,88,235,250,90,170,154,111,43,163,43,206,84,9,
+    117,85,111,85,170,186,172,64,55,97,194,176,86,239,14,140,
+    211,12,12,58,106,189,173,233,245,209,125,83,153,134,237,142,
+    90,195,52,190,246,61,10,246,181,237,130,103,16,154,229,206,
+    57,169,227,0,131,9,215,232,156,51,51,152,140,51,44,102,
+    93,220,234,54,58,49,173,238,104,187,95,43,24,103,105,130,
+    228,176,161,98,225,182,165,61,93,163,9,99,156,2,184,212,
+    171,121,98,169,233,166,153,86,232,247,86,45,172,235,149,110,
+    35,172,246,212,234,116,253,146,97,55,86,61,18,73,77,83,
+    96,194,220,17,153,205,30,21,235,197,240,178,220,209,122,106,
+    18,166,155,234,156,171,14,10,75,141,29,45,21,76,38,21,
+    11,98,187,99,5,13,154,19,215,187,29,54,67,89,7,199,
+    213,170,42,183,205,62,72,44,58,58,56,1,153,230,113,172,
+    107,90,89,111,179,44,211,85,32,148,113,158,97,173,68,251,
+    30,59,204,26,245,227,86,251,89,137,73,57,95,85,87,229,
+    106,5,230,25,155,62,233,59,86,175,94,114,22,63,182,27,
+    146,59,24,139,199,70,15,59,22,126,163,10,45,175,169,245,
+    78,76,175,106,5,77,109,27,115,238,104,140,172,245,19,238,
+    120,156,229,51,78,185,101,197,92,25,142,113,179,173,198,105,
+    55,244,193,245,219,94,181,218,145,239,56,106,225,209,107,141,
+    22,44,112,189,197,138,135,84,55,111,96,170,235,183,205,76,
+    22,188,99,146,183,95,30,147,20,222,188,97,166,181,160,149,
+    118,50,151,174,56,234,68,24,104,1,64,150,228,252,84,18,
+    70,158,66,5,230,139,58,58,75,107,204,44,198,5,155,156,
+    180,192,184,194,140,94,173,208,129,197,41,183,134,132,193,7,
+    177,213,129,10,91,90,211,79,100,107,235,60,42,117,69,29,
+    192,128,99,175,15,71,15,144,116,14,138,13,200,188,153,193,
+    94,90,87,167,11,157,172,173,25,134,173,14,185,56,149,140,
+    246,6,91,59,211,117,99,139,7,123,24,220,107,172,165,231,
+    85,135,207,165,132,89,35,50,71,46,50,60,61,151,134,198,
+    25,52,155,235,36,85,215,58,142,49,74,104,181,70,85,93,
+    86,59,125,88,46,230,131,19,106,199,5,29,89,24,157,33,
+    233,146,114,169,109,86,26,38,254,145,74,179,197,112,18,21,
+    150,12,235,5,107,185,88,212,10,126,181,126,164,167,38,148,
+    153,41,227,150,91,142,135,49,3,214,69,43,128,3,6,175,
+    89,153,154,235,64,48,171,149,6,122,30,209,169,9,49,143,
+    170,189,137,56,124,137,181,78,102,49,9,235,23,216,56,46,
+    77,23,111,218,161,126,90,4,182,16,119,108,116,63,77,209,
+    146,235,133,50,244,188,2,243,15,102,220,25,119,85,215,107,
+    62,173,10,89,88,131,156,67,54,225,218,198,89,154,178,170,
+    23,42,206,188,221,106,5,22,212,196,16,184,233,200,17,233,
+    86,59,154,113,105,218,226,214,58,9,181,10,51,122,98,143,
+    193,182,12,79,135,210,167,170,122,222,52,36,229,86,73,237,
+    184,187,197,34,52,114,198,178,49,63,125,220,221,210,148,146,
+    179,195,76,19,116,239,176,163,70,91,108,159,189,207,57,131,
+    162,168,26,39,60,94,15,43,196,49,231,253,114,171,174,154,
+    227,35,121,98,114,129,69,184,170,79,121,138,154,117,112,161,
+    197,217,86,99,222,83,150,217,209,68,109,105,224,149,11,142,
+    42,37,34,110,77,135,133,230,41,171,5,240,188,211,11,109,
+    98,134,167,85,181,122,199,233,85,152,197,152,245,176,254,247,
+    234,53,25,54,86,135,155,156,216,141,57,4,170,98,182,208,
+    177,114,28,12,180,166,218,109,107,61,173,51,52,68,79,77,
+    111,59,230,51,51,24,167,61,58,44,82,88,150,56,187,103,
+    193,97,213,34,58,44,71,189,53,237,164,199,118,232,1,203,
+    171,169,10,46,172,25,143,222,24,46,214,75,176,169,58,155,
+    107,155,217,83,250,94,173,93,9,214,228,146,115,135,176,173,
+    80,76,163,203,170,219,153,58,49,77,204,208,238,70,55,172,
+    23,228,106,82,171,177,25,226,97,19,200,28,197,51,30,72,
+    162,215,150,245,136,92,213,252,141,174,99,92,76,171,49,239,
+    245,196,146,196,51,157,246,70,92,9,181,217,85,235,133,233,
+    217,51,182,66,158,136,107,203,163,215,59,45,189,90,133,84,
+    212,107,56,41,99,206,27,119,69,236,179,167,99,84,28,140,
+    49,235,77,251,18,1,185,174,84,167,214,56,177,27,103,189,
+    114,71,134,222,233,180,180,124,151,109,39,142,148,190,170,220,
+    46,143,79,166,214,129,18,108,61,24,158,71,113,11,244,232,
+    173,150,90,149,153,119,181,150,25,20,129,167,130,182,113,222,
+    11,147,183,167,42,116,74,157,243,106,45,40,89,85,192,255,
+    169,45,153,141,255,67,244,44,208,205,15,199,41,146,42,14,
+    198,125,38,134,53,65,251,231,17,199,216,30,77,96,156,154,
+    140,248,9,80,97,91,24,58,28,183,101,131,86,65,219,23,
+    59,48,78,232,105,233,27,9,90,97,249,66,89,246,185,125,
+    14,212,180,214,26,159,214,79,218,7,115,154,113,108,132,140,
+    93,21,150,91,9,78,46,39,188,221,90,62,25,245,58,214,
+    98,242,250,181,107,215,96,126,116,107,181,161,181,106,29,222,
+    147,18,198,60,156,205,161,167,85,197,203,122,181,229,104,13,
+    108,137,236,229,197,152,89,132,94,45,13,61,157,86,213,49,
+    185,39,102,227,36,54,203,221,133,53,137,26,180,132,121,109,
+    99,118,140,88,187,78,153,160,91,107,88,42,78,126,51,73,
+    162,175,193,188,182,202,73,202,13,171,28,208,176,28,27,37,
+    58,221,60,228,30,152,7,219,169,197,22,75,153,214,182,113,
+    14,54,57,167,175,131,150,14,216,11,152,92,141,200,184,76,
+    233,98,112,82,198,220,24,39,96,86,58,23,131,131,49,36,
+    159,43,28,135,51,180,47,232,139,194,112,8,190,152,199,16,
+    33,240,130,41,229,85,219,5,199,8,250,186,245,2,59,45,
+    24,243,190,116,12,15,26,253,22,246,222,140,79,134,77,135,
+    237,138,206,14,158,152,141,89,186,104,174,192,219,17,91,227,
+    157,180,92,237,170,109,122,80,243,167,98,9,118,64,160,227,
+    104,217,140,57,115,227,176,246,255,49,28,111,245,22,180,206,
+    45,142,70,59,24,227,146,3,78,60,195,105,211,110,109,243,
+    86,170,196,176,14,35,7,253,111,157,80,70,143,29,41,119,
+    58,137,113,222,175,214,110,37,245,100,181,102,110,147,215,111,
+    220,113,56,56,155,56,146,242,198,173,219,198,185,41,27,28,
+    175,167,147,221,186,126,227,72,178,219,47,27,23,166,76,56,
+    243,206,161,79,209,10,230,235,81,0,222,102,140,121,203,100,
+    97,231,154,177,210,92,176,210,196,181,118,161,55,78,72,221,
+    122,64,243,193,130,131,78,51,211,225,166,224,88,166,148,176,
+    107,129,200,215,146,107,170,113,134,154,96,127,183,13,171,236,
+    138,65,209,75,134,4,39,246,244,13,227,56,68,189,27,53,
+    99,214,140,205,220,140,235,221,52,78,98,20,132,3,246,156,
+    95,215,149,252,80,181,182,101,234,175,3,224,117,244,241,129,
+    36,224,142,160,35,160,141,182,108,134,20,240,134,11,138,49,
+    23,136,120,136,87,165,51,201,193,24,179,180,228,185,128,10,
+    243,70,135,150,96,249,142,92,148,49,102,204,174,195,209,57,
+    30,188,225,1,175,227,120,139,7,147,113,10,2,107,177,72,
+    193,59,215,94,190,225,240,144,104,49,78,6,239,220,184,246,
+    234,203,46,151,99,145,142,141,44,223,141,155,175,76,229,3,
+    11,18,183,94,158,38,110,189,108,18,175,30,33,94,53,196,
+    160,63,191,104,204,5,21,149,116,139,163,202,10,108,40,16,
+    176,237,5,138,81,212,160,215,152,197,125,198,167,183,106,114,
+    199,81,67,127,75,110,148,181,66,219,184,2,47,84,184,75,
+    153,167,59,114,56,56,55,102,38,167,212,217,96,189,221,25,
+    95,234,208,209,37,118,227,44,2,173,45,195,249,168,150,175,
+    78,249,87,70,154,14,214,44,45,230,54,47,30,166,75,179,
+    236,198,12,201,48,195,252,68,213,180,95,8,214,123,112,164,
+    81,96,219,177,55,108,67,8,234,121,227,145,32,108,252,37,
+    216,144,90,137,78,75,149,107,230,105,154,190,179,7,219,230,
+    5,215,149,37,182,139,86,99,114,93,43,68,245,70,219,173,
+    150,229,158,166,119,91,142,174,178,47,44,230,205,228,54,150,
+    224,157,49,29,113,12,21,90,140,243,225,235,120,150,166,199,
+    2,122,150,56,74,27,82,216,151,2,231,47,193,78,128,81,
+    210,229,95,52,78,224,81,207,29,51,230,194,186,222,152,12,
+    131,24,238,54,210,142,147,44,51,24,39,33,212,116,119,120,
+    201,81,253,177,209,162,131,177,224,81,26,140,22,29,11,122,
+    142,210,96,180,232,248,178,255,40,13,198,49,157,188,75,110,
+    48,90,116,98,45,113,148,6,163,69,39,35,241,163,52,24,
+    199,116,114,237,46,116,114,205,16,216,117,227,185,72,44,182,
+    229,236,166,139,71,76,91,119,150,220,198,21,102,78,116,224,
+    100,200,182,116,185,138,7,69,204,240,208,189,152,173,219,47,
+    67,198,7,239,73,179,98,79,50,22,135,237,244,88,67,187,
+    20,49,135,20,14,224,29,217,49,89,208,98,204,96,228,241,
+    148,181,134,113,2,245,96,212,56,31,145,59,229,197,65,163,
+    21,211,251,224,152,113,83,127,200,145,117,154,134,114,192,181,
+    89,39,53,186,224,38,102,232,35,91,31,191,202,156,24,187,
+    202,243,83,89,240,64,6,10,156,165,225,124,122,193,201,162,
+    17,139,243,233,122,167,209,130,247,54,243,78,228,65,103,58,
+    39,11,29,67,175,166,89,233,9,88,6,10,86,130,157,169,
+    167,43,193,108,198,28,83,216,146,55,159,112,101,42,137,205,
+    96,7,128,7,99,189,225,124,39,53,47,7,161,156,118,27,
+    156,161,233,14,166,202,33,140,113,159,5,227,240,30,162,215,
+    180,145,204,94,28,140,217,72,185,107,159,158,103,35,90,163,
+    125,55,63,72,236,208,90,0,227,91,107,199,73,145,17,228,
+    118,251,4,195,211,247,97,150,205,152,71,229,238,215,91,78,
+    202,44,103,250,238,202,178,153,229,144,219,87,76,60,125,103,
+    100,217,140,227,145,26,238,34,51,145,154,166,179,151,138,96,
+    212,49,167,76,83,36,2,51,245,12,94,117,144,211,163,105,
+    32,238,246,126,52,52,224,68,221,128,204,176,233,198,212,86,
+    65,109,128,231,171,27,15,223,155,195,37,247,208,189,121,182,
+    182,254,143,236,184,18,31,255,191,121,124,196,99,255,119,26,
+    246,152,249,72,151,93,57,130,115,199,195,144,99,118,153,198,
+    169,36,55,141,227,203,9,191,86,2,95,176,156,38,111,196,
+    244,104,70,9,99,150,94,180,207,89,167,98,235,124,58,107,
+    65,243,46,205,126,191,135,100,99,21,111,136,206,46,235,245,
+    130,117,149,97,222,228,156,33,22,188,220,56,17,109,120,224,
+    13,160,109,28,143,54,216,139,133,113,49,218,237,148,116,246,
+    26,200,94,5,218,29,235,146,233,81,82,205,187,166,48,230,
+    98,65,31,25,98,41,22,190,118,243,186,49,19,139,184,238,
+    230,130,38,102,67,136,69,98,142,83,11,96,227,120,44,114,
+    228,126,138,120,182,83,177,196,13,235,190,208,145,51,113,195,
+    152,133,96,73,29,230,117,185,165,24,39,1,68,244,46,123,
+    99,4,45,169,119,11,229,37,120,81,154,137,193,98,142,200,
+    117,246,194,205,199,10,163,57,199,73,219,152,143,21,60,122,
+    183,142,103,140,202,212,43,157,147,50,46,58,177,89,38,188,
+    208,199,10,137,134,42,87,166,174,80,108,43,180,175,160,177,
+    187,84,39,171,89,103,203,25,147,133,193,82,89,81,99,243,
+    137,241,91,192,73,246,69,69,103,227,7,85,213,194,106,73,
+    46,12,77,204,82,131,211,27,83,160,166,216,23,189,49,101,
+    45,220,115,71,22,174,113,206,186,135,36,203,246,212,228,203,
+    158,20,171,94,187,126,29,163,91,215,88,116,29,208,201,24,
+    188,225,23,225,32,233,216,11,198,70,67,140,85,53,231,205,
+    52,51,176,92,90,1,15,217,115,76,179,63,38,58,135,26,
+    152,241,71,197,152,222,234,36,213,86,77,171,227,13,140,99,
+    48,28,148,113,26,103,200,216,9,95,158,158,58,99,47,60,
+    107,162,163,215,137,196,14,149,99,192,246,213,247,79,39,35,
+    206,250,36,26,152,183,190,48,157,10,63,13,154,218,196,95,
+    31,41,139,56,108,179,44,230,177,143,148,197,92,246,12,89,
+    3,103,38,58,59,129,168,71,203,157,112,86,98,226,236,205,
+    146,204,140,71,22,153,153,199,172,11,219,16,142,212,133,237,
+    8,103,99,45,173,167,85,85,88,73,240,156,132,234,124,155,
+    192,23,84,214,252,11,184,21,135,225,128,196,206,228,214,107,
+    32,61,243,152,91,245,137,241,173,208,201,88,223,122,254,233,
+    216,144,124,154,112,12,39,33,140,83,43,106,173,235,235,123,
+    138,37,199,106,178,173,198,172,173,6,117,99,110,2,216,17,
+    224,188,3,178,107,243,182,113,206,97,91,132,23,55,199,195,
+    51,119,110,79,202,118,166,245,65,119,24,23,28,38,120,225,
+    96,159,41,39,143,101,251,167,113,105,69,79,248,180,129,170,
+    64,31,234,45,173,51,180,62,107,57,26,160,39,172,207,66,
+    51,160,142,15,101,23,157,41,198,231,178,121,83,79,192,134,
+    128,201,174,30,73,54,166,160,126,54,158,108,67,15,223,53,
+    253,100,55,58,53,169,205,57,166,182,244,134,79,214,90,164,
+    130,43,150,206,138,79,118,91,117,185,5,126,81,177,218,117,
+    197,89,252,132,55,174,220,37,57,188,168,202,85,227,236,74,
+    87,237,178,30,178,247,148,147,230,249,11,142,206,103,64,43,
+    169,228,23,11,167,227,242,228,50,29,18,142,127,159,113,122,
+    172,97,211,103,199,40,10,59,221,213,49,72,170,181,6,123,
+    91,236,182,96,22,215,153,231,131,92,214,123,46,28,170,29,
+    131,79,9,227,74,92,5,119,222,81,149,21,216,140,21,122,
+    95,118,38,174,66,113,117,86,65,152,203,133,138,49,143,235,
+    1,220,176,26,81,59,114,213,177,86,145,34,63,51,120,200,
+    76,11,7,101,6,213,214,212,59,230,105,164,239,230,229,40,
+    97,204,33,186,171,3,67,134,58,48,123,177,158,49,181,187,
+    251,170,41,206,152,65,131,249,75,9,179,136,105,191,53,54,
+    90,229,146,163,227,145,114,201,249,241,62,243,114,11,6,178,
+    51,249,98,127,180,92,252,146,137,26,123,199,164,199,0,246,
+    122,105,62,145,56,188,147,118,166,83,166,198,78,72,98,28,
+    122,217,177,71,49,3,164,232,230,135,230,55,110,186,34,109,
+    43,12,39,83,39,175,242,206,79,60,246,43,252,249,187,124,
+    34,184,48,177,177,87,19,243,179,26,237,142,41,206,56,203,
+    50,4,146,145,201,247,151,89,102,25,95,168,210,195,250,248,
+    42,245,36,75,192,54,71,152,5,150,6,43,118,48,52,235,
+    77,126,174,116,117,170,117,100,177,97,206,201,51,103,16,226,
+    123,147,163,181,19,179,153,196,108,229,145,36,86,227,241,249,
+    171,208,64,235,149,139,38,155,152,141,51,9,119,52,186,72,
+    42,51,67,6,242,84,34,160,197,160,111,192,13,156,100,106,
+    204,3,218,113,166,97,12,211,173,119,115,234,11,36,51,25,
+    23,205,216,60,86,76,60,219,153,68,82,141,36,200,179,206,
+    38,10,53,205,85,98,103,230,178,92,135,149,231,152,31,140,
+    52,102,89,104,177,198,57,4,122,173,214,173,107,5,243,205,
+    240,52,51,217,7,161,11,20,141,115,9,137,66,195,49,105,
+    1,27,243,16,220,112,217,63,160,2,12,139,185,174,176,60,
+    5,21,90,55,147,192,153,129,95,24,79,39,212,150,38,87,
+    239,242,213,220,36,88,98,22,227,151,162,139,71,104,124,117,
+    56,107,234,203,221,170,85,142,113,137,89,212,182,117,180,159,
+    92,163,205,143,127,106,160,225,91,137,113,62,81,6,95,166,
+    152,83,20,242,244,166,238,179,142,210,198,229,132,86,170,163,
+    151,101,206,147,116,248,213,123,16,233,27,48,214,246,39,235,
+    83,230,239,31,220,73,55,116,63,170,230,2,165,7,56,98,
+    135,230,35,96,155,130,179,249,182,217,152,51,245,241,15,23,
+    142,166,194,78,186,108,234,71,175,62,231,198,132,249,161,99,
+    222,132,246,93,200,105,27,67,161,14,63,77,9,154,12,28,
+    193,221,147,129,23,152,155,250,249,135,9,173,227,212,209,92,
+    86,167,89,157,144,146,91,78,47,199,12,134,4,91,60,28,
+    200,207,37,42,106,95,85,156,163,91,213,106,206,95,54,66,
+    167,215,117,216,244,241,55,11,0,244,110,167,108,189,27,58,
+    70,96,98,135,242,27,119,174,189,108,70,183,160,198,13,185,
+    85,184,219,182,69,9,104,39,67,119,221,182,144,33,219,214,
+    25,52,76,54,206,163,137,201,166,122,18,13,211,135,244,177,
+    209,42,235,30,27,223,20,103,149,53,189,217,141,141,176,170,
+    152,70,127,66,247,192,116,50,250,110,111,62,154,238,84,104,
+    152,62,119,143,141,48,207,90,5,250,149,122,30,79,24,236,
+    203,176,121,29,70,125,186,147,130,71,177,171,202,2,187,63,
+    247,85,193,137,56,91,233,228,140,251,238,122,33,58,103,222,
+    160,131,103,48,175,24,216,249,86,161,63,109,122,114,218,18,
+    144,219,101,85,153,242,31,167,217,7,87,226,210,187,121,107,
+    111,113,252,226,96,108,5,183,110,126,199,61,5,216,154,117,
+    142,132,99,43,76,248,97,27,156,36,158,246,142,91,153,231,
+    205,216,179,101,30,164,28,59,166,69,65,59,172,52,137,2,
+    188,205,116,171,42,181,140,191,36,89,22,246,190,207,110,56,
+    204,15,226,34,94,43,157,100,33,190,213,158,194,107,222,132,
+    103,43,108,204,219,170,121,91,252,132,19,223,253,198,121,110,
+    146,136,93,52,61,238,128,119,207,114,121,146,198,121,221,77,
+    42,128,181,188,224,196,102,173,206,79,25,217,83,207,194,22,
+    83,114,156,189,231,205,223,33,193,60,234,105,108,157,206,0,
+    174,201,5,246,213,221,225,0,76,179,57,179,79,155,32,38,
+    183,218,236,136,78,40,56,203,91,239,237,206,31,35,140,141,
+    144,216,210,240,179,254,217,36,84,161,6,77,150,27,114,1,
+    127,135,67,253,135,69,154,111,197,115,22,178,94,239,175,28,
+    77,103,45,155,211,142,108,179,22,90,6,100,63,46,14,173,
+    111,177,227,143,113,198,182,180,161,247,217,27,66,178,12,203,
+    64,177,230,162,179,54,19,2,146,105,228,55,73,142,100,132,
+    128,206,212,160,177,37,118,125,239,216,133,38,102,104,151,173,
+    187,177,246,54,12,22,41,25,86,59,198,57,2,53,152,170,
+    216,159,182,41,218,160,233,161,141,208,94,27,130,111,137,171,
+    37,154,60,85,135,25,82,173,37,117,246,21,219,254,112,126,
+    196,134,159,200,167,108,236,19,249,148,9,63,145,79,217,216,
+    39,242,41,147,249,227,140,164,206,94,12,217,239,35,221,112,
+    214,195,137,195,126,62,230,152,48,150,17,186,112,114,85,112,
+    209,153,96,124,81,0,73,84,53,102,126,78,59,193,188,23,
+    243,166,115,41,95,130,221,169,89,231,40,58,95,28,140,33,
+    226,158,121,146,133,119,110,220,130,117,159,102,151,188,167,205,
+    247,150,87,241,119,23,142,154,141,137,73,18,175,166,43,198,
+    220,24,89,7,242,49,76,176,159,168,117,140,89,19,227,15,
+    14,29,235,138,216,199,101,192,139,70,91,175,58,235,236,96,
+    140,179,38,52,91,96,254,236,192,178,176,223,234,140,127,62,
+    99,154,226,117,231,253,137,109,53,78,166,235,176,45,52,186,
+    29,199,121,21,140,144,181,94,176,78,119,115,105,189,218,129,
+    87,182,187,172,59,7,99,204,174,170,90,169,220,97,181,129,
+    222,48,129,170,152,163,114,114,242,97,117,181,5,51,215,85,
+    133,246,226,249,115,54,115,231,182,203,19,11,70,100,197,121,
+    146,97,70,227,28,97,131,81,23,251,56,249,32,53,213,59,
+    112,46,105,21,212,40,212,148,109,78,198,89,194,134,49,253,
+    149,105,139,157,118,158,48,203,17,231,195,226,112,106,105,41,
+    118,237,226,9,111,140,130,164,113,193,2,176,117,176,235,117,
+    252,177,153,157,34,195,82,220,7,192,190,23,176,143,50,180,
+    255,32,1,253,251,4,128,119,251,35,138,137,217,56,13,58,
+    187,182,90,132,23,209,161,163,183,152,213,166,39,149,177,143,
+    91,83,143,37,135,173,25,172,133,245,103,17,206,26,177,54,
+    226,15,18,60,114,187,32,43,120,29,104,28,103,198,169,191,
+    149,48,77,216,249,206,223,44,76,39,130,252,247,179,152,125,
+    219,143,196,240,22,5,28,191,202,238,122,216,159,3,208,13,
+    220,74,99,92,116,166,87,219,109,60,159,92,157,152,241,167,
+    233,122,189,168,149,176,95,176,21,99,170,219,54,46,57,96,
+    64,3,183,217,42,148,135,56,145,44,59,187,224,145,59,147,
+    234,192,114,190,72,89,86,182,217,169,87,38,102,246,139,49,
+    242,84,82,33,31,244,30,254,22,81,215,240,64,113,118,66,
+    89,147,248,42,181,128,2,39,40,120,85,98,14,209,184,76,
+    40,199,159,149,144,250,226,111,5,156,217,206,79,216,152,94,
+    149,217,213,163,57,126,150,205,188,132,213,157,31,38,128,183,
+    126,34,63,117,15,138,15,112,53,166,126,241,11,4,59,27,
+    95,117,154,232,121,120,42,53,248,225,103,79,211,106,224,237,
+    30,187,50,166,253,155,108,105,112,38,193,75,109,227,148,93,
+    37,156,205,118,61,112,218,225,183,77,231,19,177,221,83,55,
+    74,56,72,230,175,147,153,4,235,69,252,77,12,123,127,159,
+    48,86,216,105,117,11,236,5,21,87,43,101,204,225,62,110,
+    54,194,152,207,170,45,125,114,13,184,252,44,103,72,26,251,
+    235,132,15,28,251,24,251,95,40,125,252,201,124,87,171,42,
+    47,45,167,194,225,151,26,195,78,89,175,191,84,187,245,146,
+    217,21,91,152,242,197,198,240,227,39,95,175,225,25,244,141,
+    150,135,63,118,140,131,140,237,214,43,199,142,125,84,224,56,
+    238,163,243,199,78,197,218,210,187,47,127,232,252,211,31,61,
+    134,250,135,158,125,245,67,175,197,199,32,169,128,86,226,220,
+    188,101,128,200,203,175,48,148,224,43,196,88,227,253,2,68,
+    65,97,91,152,24,243,66,133,161,154,224,19,39,198,128,152,
+    100,40,45,214,136,81,23,15,24,90,144,82,210,196,184,42,
+    201,44,42,72,3,98,28,73,193,227,16,45,29,223,62,78,
+    30,116,188,201,80,251,120,224,196,196,24,58,145,101,40,119,
+    162,74,140,245,19,35,134,246,78,36,78,78,140,169,147,10,
+    67,197,147,11,167,38,70,247,169,40,67,43,167,42,196,88,
+    59,181,203,208,254,169,196,12,201,62,83,96,72,157,57,36,
+    70,43,114,205,70,102,33,138,206,106,179,19,99,101,118,196,
+    208,222,108,250,244,196,152,57,189,205,80,254,116,151,24,251,
+    167,3,115,172,41,115,217,185,137,49,55,87,103,168,49,183,
+    48,79,170,59,191,194,80,98,190,70,140,250,252,136,161,189,
+    249,248,153,137,49,121,70,97,168,120,102,72,140,187,103,60,
+    103,33,90,60,155,57,59,49,102,207,238,48,84,61,235,59,
+    71,198,239,92,134,161,236,185,46,49,246,207,29,50,228,58,
+    159,60,63,49,166,207,111,50,180,125,190,65,140,173,243,222,
+    11,16,249,46,172,95,152,24,55,46,104,12,85,46,184,238,
+    155,24,61,247,197,25,74,222,87,39,198,198,125,3,134,70,
+    247,133,46,30,233,107,43,10,95,204,49,110,243,226,144,36,
+    217,189,24,189,196,70,243,146,124,105,98,44,92,170,51,212,
+    184,228,187,76,218,119,57,198,80,252,178,74,140,165,203,125,
+    134,134,151,195,87,38,198,229,43,235,12,109,92,233,18,99,
+    255,202,1,67,11,87,183,175,146,249,121,181,201,80,251,106,
+    232,126,82,207,251,83,12,173,222,223,39,198,225,253,222,7,
+    88,247,60,144,123,96,98,220,124,160,202,80,253,1,223,131,
+    164,158,15,174,50,180,246,96,147,24,219,15,186,30,98,93,
+    247,208,250,67,164,119,31,170,50,84,127,200,247,48,201,254,
+    240,42,67,107,15,55,137,177,253,176,235,17,150,253,145,245,
+    71,72,246,71,170,12,213,31,9,60,122,175,46,15,61,154,
+    96,92,234,81,141,36,169,60,218,99,104,240,104,232,49,210,
+    232,199,100,134,10,143,237,18,227,254,99,171,143,179,186,60,
+    222,124,156,212,229,241,61,134,14,30,95,126,98,98,140,61,
+    177,198,208,250,19,58,49,54,159,88,124,18,34,255,147,202,
+    147,19,99,241,201,30,67,131,39,19,111,153,24,83,111,145,
+    25,42,188,101,68,140,123,111,89,124,138,101,127,106,253,41,
+    210,232,167,42,12,213,158,242,61,61,49,6,158,206,48,148,
+    125,186,73,140,237,167,67,207,176,134,61,83,125,102,98,172,
+    63,115,200,144,235,217,245,103,73,153,207,86,24,170,61,123,
+    64,140,11,207,5,159,131,104,233,185,173,231,38,70,249,185,
+    10,67,181,231,14,136,209,25,45,60,31,123,158,77,211,231,
+    107,207,79,140,250,243,67,134,118,159,15,191,149,76,211,183,
+    230,24,218,124,107,135,24,123,111,245,190,192,230,217,11,185,
+    23,200,60,123,65,99,168,242,130,235,197,137,209,243,98,130,
+    161,212,139,101,98,220,121,177,207,208,240,197,149,151,38,198,
+    196,75,27,12,109,189,180,75,140,251,47,45,95,99,3,119,
+    77,187,70,166,198,181,125,134,14,175,101,174,79,140,217,235,
+    21,134,106,215,125,55,72,151,223,88,101,104,237,70,139,24,
+    59,55,124,55,25,119,83,190,57,49,22,110,238,50,180,127,
+    51,253,242,196,152,121,185,202,80,253,101,255,173,137,49,120,
+    43,203,80,238,214,128,24,71,183,150,111,179,122,222,174,222,
+    190,87,151,215,111,143,24,183,119,59,243,10,169,245,43,121,
+    134,148,87,250,196,56,124,197,123,135,245,238,157,220,29,210,
+    187,119,74,12,105,119,22,94,157,24,221,175,6,25,90,122,
+    181,64,140,234,171,85,134,234,175,46,188,141,164,124,91,132,
+    161,232,219,84,98,44,189,173,207,208,240,109,225,215,200,128,
+    191,150,101,40,247,90,155,24,187,175,237,49,116,240,90,236,
+    245,137,49,254,250,22,67,242,235,67,98,220,125,61,244,118,
+    54,161,223,94,124,251,196,88,126,123,155,161,238,219,253,111,
+    144,142,124,35,202,208,202,27,121,98,84,222,104,49,212,121,
+    99,241,29,19,163,255,29,73,134,210,239,168,19,99,227,29,
+    11,11,28,107,217,2,151,64,229,174,189,158,90,224,100,100,
+    11,11,220,136,38,219,91,224,66,46,134,195,46,46,239,34,
+    132,226,226,26,136,91,46,46,232,38,196,146,155,203,34,206,
+    185,185,38,37,218,110,238,16,177,203,195,101,60,132,200,122,
+    184,10,226,154,135,91,240,18,194,237,229,226,136,147,94,174,
+    66,137,154,151,219,69,188,239,229,18,139,132,72,45,114,42,
+    226,210,34,231,246,17,194,235,227,18,136,83,62,78,167,68,
+    211,199,29,32,94,240,115,25,63,173,149,159,171,34,174,251,
+    57,95,128,16,129,0,183,138,120,45,192,85,41,81,15,112,
+    177,32,195,241,32,167,5,9,81,9,114,135,136,93,33,110,
+    45,68,136,245,16,87,71,220,8,113,209,37,66,172,44,113,
+    37,196,218,18,23,10,223,115,216,194,97,110,21,217,181,48,
+    167,211,100,205,48,55,66,188,23,230,98,17,66,196,35,156,
+    140,184,16,225,6,148,24,69,184,197,101,134,253,203,92,118,
+    153,16,185,101,174,130,184,182,204,45,68,233,232,68,185,48,
+    226,229,40,87,160,132,26,229,26,136,91,81,46,30,35,68,
+    50,198,109,32,222,138,113,77,74,180,99,156,107,133,97,207,
+    10,151,91,33,196,230,10,87,71,220,88,225,188,113,66,248,
+    226,92,28,113,50,206,85,40,81,139,115,125,196,195,56,183,
+    156,32,68,44,193,109,34,222,78,112,93,74,244,19,156,55,
+    201,176,47,201,173,39,9,177,145,228,202,136,119,146,220,33,
+    37,92,41,46,156,194,150,167,184,66,138,182,60,197,181,16,
+    119,82,92,48,125,207,97,91,74,115,41,100,87,211,92,149,
+    38,171,167,185,61,196,7,105,46,177,74,231,245,42,87,64,
+    172,174,114,35,74,236,173,114,254,12,195,193,12,183,157,33,
+    68,62,195,117,17,247,51,92,104,141,16,225,53,46,135,120,
+    115,141,27,82,98,119,141,11,101,113,169,103,185,98,150,16,
+    229,44,167,35,110,102,57,247,58,93,84,235,92,24,241,242,
+    58,87,167,68,99,157,235,34,238,175,115,209,28,157,215,57,
+    110,21,241,90,142,107,82,162,157,227,118,17,239,231,184,248,
+    6,157,51,27,156,130,184,184,193,237,82,98,127,131,11,110,
+    50,188,180,201,229,55,169,103,218,228,154,136,219,155,220,210,
+    22,33,34,91,92,9,177,182,197,185,182,9,225,217,230,194,
+    136,151,183,185,60,37,156,145,178,205,181,145,237,66,122,153,
+    36,91,150,185,13,196,91,50,215,163,196,64,230,252,121,28,
+    157,60,87,200,211,137,146,231,246,17,31,230,185,181,2,245,
+    8,5,78,67,92,41,112,139,10,33,252,10,183,133,88,86,
+    56,175,74,87,130,202,101,17,231,84,174,69,137,142,202,5,
+    138,12,135,138,220,118,145,78,141,34,215,69,220,47,114,145,
+    18,33,162,37,174,128,88,45,113,187,148,216,47,113,177,50,
+    122,182,50,87,46,19,98,167,204,29,34,118,105,220,170,70,
+    136,53,141,171,34,174,107,156,103,135,16,139,59,92,10,241,
+    234,14,87,161,68,109,135,115,87,24,246,86,184,213,10,45,
+    170,194,149,16,107,21,206,93,165,211,175,202,173,34,94,171,
+    114,45,74,56,163,78,149,91,172,161,103,171,113,219,53,218,
+    15,53,174,141,184,91,227,66,245,49,241,143,176,0,234,92,
+    2,113,170,206,169,148,40,213,57,29,113,179,206,185,116,66,
+    120,116,46,134,56,174,115,121,74,40,58,87,65,92,211,185,
+    125,74,28,234,92,176,129,211,183,193,173,55,8,177,209,224,
+    170,13,14,148,122,131,243,53,9,17,104,114,43,77,70,36,
+    154,92,137,18,90,147,107,32,110,53,57,127,139,16,193,22,
+    151,105,177,28,217,22,215,161,68,175,197,121,218,140,88,108,
+    115,27,109,66,108,181,185,58,18,141,54,23,234,208,46,233,
+    112,25,196,217,14,87,163,132,222,225,250,29,150,99,216,225,
+    130,93,66,44,117,185,116,151,17,153,46,87,166,196,78,151,
+    107,34,209,238,114,139,189,187,15,27,176,254,30,183,210,195,
+    230,246,184,114,143,230,239,113,77,36,218,61,110,177,79,8,
+    127,159,91,238,51,34,214,231,242,148,80,250,92,5,137,90,
+    159,59,164,132,107,192,249,7,184,62,7,220,230,128,16,219,
+    3,78,31,176,28,205,1,231,26,210,129,30,114,225,33,35,
+    150,135,220,38,37,182,135,92,9,9,109,200,13,41,177,59,
+    228,2,35,70,132,70,220,214,136,16,242,136,219,69,188,63,
+    226,146,187,132,72,239,114,26,226,202,46,231,223,163,227,185,
+    199,165,247,176,75,247,184,6,37,90,123,156,119,159,17,190,
+    125,110,99,159,142,231,62,87,69,162,190,207,249,14,232,100,
+    58,224,146,7,140,72,31,112,53,74,232,7,220,46,226,125,
+    72,113,72,107,117,200,85,16,215,14,185,240,2,127,175,97,
+    91,94,224,19,200,166,22,248,146,157,140,245,203,2,31,114,
+    49,28,118,241,5,23,33,84,23,95,71,220,112,241,30,55,
+    33,22,221,252,150,155,103,61,229,230,123,148,24,184,249,128,
+    135,17,33,15,191,229,33,132,236,225,203,72,236,120,248,61,
+    74,28,120,248,184,151,17,73,47,223,246,18,162,235,229,247,
+    16,31,120,249,205,69,66,108,47,242,37,196,218,34,31,244,
+    17,98,201,199,199,17,39,125,124,131,18,45,31,191,139,120,
+    223,199,175,249,9,177,238,231,119,16,87,253,124,32,64,136,
+    80,128,143,5,88,173,226,1,190,64,9,53,192,235,72,52,
+    3,188,47,72,136,64,144,143,7,177,29,65,94,163,68,37,
+    200,119,145,232,7,249,112,136,16,203,33,62,19,98,68,54,
+    196,235,161,123,14,91,51,196,239,98,178,253,16,31,95,34,
+    249,147,75,252,230,18,35,182,151,248,46,37,250,75,188,43,
+    204,8,79,152,207,132,9,145,13,243,10,18,197,48,191,75,
+    137,253,48,239,142,48,236,141,240,201,8,33,210,17,94,67,
+    92,137,240,254,101,66,4,151,249,109,196,249,101,254,128,18,
+    11,81,62,27,101,56,23,229,7,81,66,140,162,252,90,140,
+    225,245,24,223,143,17,98,24,227,87,241,74,117,109,133,239,
+    174,208,118,172,240,174,56,195,158,56,191,21,167,147,41,206,
+    235,136,155,113,62,146,32,68,52,193,167,17,103,18,252,128,
+    18,163,4,239,74,98,151,36,249,84,146,16,171,73,190,128,
+    132,154,228,251,148,24,38,121,119,138,17,222,20,159,78,17,
+    34,147,226,171,72,212,83,124,36,125,207,97,139,166,249,245,
+    52,75,182,145,230,59,105,146,191,151,230,131,171,140,88,90,
+    229,243,171,132,80,86,249,26,18,250,42,239,201,208,213,150,
+    225,163,25,70,172,100,248,34,37,202,25,126,23,137,253,12,
+    191,190,70,136,141,53,190,130,184,182,198,251,178,116,150,102,
+    249,120,22,103,105,150,47,83,98,39,203,183,145,232,102,249,
+    224,58,93,84,235,124,118,157,17,185,117,190,71,137,193,58,
+    239,205,49,194,151,227,215,114,116,81,229,248,29,36,170,57,
+    222,183,65,31,190,193,111,110,224,132,221,224,71,148,216,219,
+    224,131,155,12,47,109,242,235,155,180,29,155,252,206,38,22,
+    181,201,123,183,8,225,219,226,147,91,140,72,111,241,77,74,
+    180,183,248,61,36,14,182,248,248,54,93,45,219,188,178,141,
+    115,127,155,119,201,247,28,54,143,204,135,101,150,108,89,230,
+    243,50,29,29,153,239,32,209,147,249,149,60,33,18,121,62,
+    151,103,196,102,158,111,81,162,147,231,247,16,31,228,249,88,
+    129,16,241,2,191,89,192,126,40,240,125,74,12,11,124,72,
+    65,71,172,240,138,66,136,162,194,247,17,15,21,62,166,210,
+    162,84,190,142,184,161,242,225,34,117,46,69,190,142,184,81,
+    228,195,37,74,148,248,26,98,189,196,47,149,9,17,41,243,
+    53,196,122,153,95,210,40,161,241,77,196,109,141,143,238,16,
+    98,101,135,239,32,238,237,240,241,10,237,235,10,175,84,176,
+    175,43,252,144,18,187,21,126,169,202,136,72,149,223,174,18,
+    34,95,229,119,16,87,171,188,171,70,8,79,141,95,169,177,
+    28,137,26,95,173,221,115,216,234,53,126,23,217,253,26,159,
+    172,83,7,86,231,85,196,165,58,127,64,137,5,157,143,232,
+    12,71,117,190,168,211,69,165,243,109,196,93,157,15,52,232,
+    158,208,224,215,16,175,55,248,58,37,26,13,222,221,68,239,
+    217,228,211,77,234,42,154,188,134,184,210,228,247,40,113,208,
+    228,253,45,134,131,45,126,179,69,247,182,22,95,70,188,211,
+    226,15,41,225,106,243,153,54,110,22,109,126,175,77,139,106,
+    243,145,14,182,163,195,23,59,180,29,29,94,71,220,236,240,
+    190,46,93,134,93,62,217,197,181,211,229,107,148,208,187,124,
+    7,137,94,151,247,245,104,142,30,31,235,225,110,216,227,53,
+    74,84,122,124,15,137,65,143,15,244,105,95,245,249,213,62,
+    35,214,250,188,214,191,231,176,85,250,124,23,147,245,251,188,
+    127,64,183,151,1,159,30,48,34,51,224,203,148,216,25,240,
+    61,196,131,1,31,31,210,57,55,228,51,67,236,160,33,175,
+    81,162,50,228,119,145,216,135,20,35,186,27,142,248,230,136,
+    17,237,17,191,188,75,136,216,46,191,190,139,174,123,151,111,
+    83,162,187,203,239,35,113,184,203,167,246,232,46,178,199,23,
+    246,112,23,217,227,119,41,177,191,199,7,246,241,60,180,207,
+    111,239,211,9,191,207,87,16,215,246,121,215,1,157,240,7,
+    124,228,128,229,136,30,240,42,37,74,7,124,31,137,225,1,
+    31,61,164,203,240,144,207,29,162,3,58,228,59,148,232,29,
+    242,190,5,129,141,223,130,176,185,32,144,89,182,32,84,144,
+    168,45,8,11,46,66,184,93,66,10,241,170,75,208,93,194,
+    189,134,173,233,18,246,144,61,112,9,43,110,146,63,225,22,
+    178,136,115,110,161,73,137,182,91,24,33,222,115,11,43,30,
+    154,195,35,100,17,231,60,66,147,18,109,143,176,239,97,117,
+    60,244,8,73,47,33,210,94,33,231,101,196,166,87,208,41,
+    209,244,10,187,72,236,123,133,229,69,66,196,22,133,173,69,
+    70,200,139,194,128,18,163,69,33,228,99,68,216,39,148,124,
+    132,208,124,66,31,137,161,79,136,251,9,145,244,11,178,159,
+    17,5,191,176,75,137,125,191,16,14,48,98,57,32,236,4,
+    8,81,13,8,61,36,6,1,33,18,36,68,52,40,108,7,
+    25,145,15,10,7,148,88,8,9,161,16,214,42,36,200,33,
+    66,20,66,130,142,68,51,36,4,150,8,17,90,18,214,151,
+    24,177,177,36,12,151,238,57,108,187,75,66,56,140,117,12,
+    11,59,97,90,199,176,48,64,98,20,22,86,34,116,116,34,
+    194,70,132,17,91,17,161,67,137,94,68,8,44,51,34,180,
+    44,108,45,19,66,94,22,122,72,12,150,133,80,148,16,225,
+    168,144,66,188,26,21,42,148,168,69,133,126,20,251,58,42,
+    196,98,132,136,199,132,237,24,118,80,76,216,165,196,126,76,
+    8,172,224,195,87,132,237,21,66,228,87,4,29,137,230,138,
+    224,143,19,34,24,23,50,113,70,100,227,66,131,18,173,184,
+    224,75,224,18,73,8,155,9,186,68,18,66,27,137,110,66,
+    88,78,210,201,148,20,10,73,70,168,73,97,151,18,251,73,
+    33,158,98,68,50,37,236,164,104,239,166,132,93,36,246,83,
+    66,34,77,136,84,90,168,165,25,161,167,133,197,213,123,14,
+    155,127,85,72,172,178,100,169,85,161,186,74,242,215,87,133,
+    3,36,22,50,194,122,134,16,27,25,161,149,97,68,39,35,
+    36,215,232,218,89,19,228,53,156,190,107,194,144,18,187,107,
+    194,114,150,17,177,172,80,204,18,162,156,21,58,72,244,178,
+    66,100,157,78,223,117,65,89,103,68,113,93,88,200,81,31,
+    146,19,114,57,92,159,57,97,64,137,81,78,8,111,48,188,
+    188,33,168,27,132,40,109,8,77,196,237,13,33,177,73,59,
+    104,83,40,34,46,111,10,135,148,112,109,9,209,45,134,87,
+    182,132,210,22,93,184,91,66,27,113,119,75,8,109,211,233,
+    183,45,100,17,231,182,133,38,37,218,219,194,130,204,176,91,
+    22,86,101,66,172,201,66,7,113,79,22,150,242,132,136,228,
+    133,245,60,174,182,188,208,203,223,115,216,6,121,33,94,96,
+    108,178,32,84,11,116,216,10,194,33,98,151,34,108,40,132,
+    216,82,4,93,193,233,171,8,17,149,246,181,42,212,85,70,
+    52,84,33,92,36,196,114,81,200,21,177,175,139,66,159,18,
+    195,162,16,40,225,18,41,9,197,18,29,207,146,208,66,162,
+    83,18,130,101,66,44,149,133,92,25,139,42,11,35,74,236,
+    149,133,128,134,69,105,66,81,163,69,105,66,11,137,142,38,
+    4,119,104,81,59,66,110,7,139,218,17,70,148,216,219,17,
+    226,21,92,34,21,65,171,16,162,82,17,186,72,244,43,130,
+    191,74,23,110,85,200,86,25,145,171,10,3,74,140,170,130,
+    183,198,8,95,77,88,175,209,185,95,19,202,72,236,212,132,
+    67,74,184,234,130,191,206,136,96,93,200,214,239,57,108,185,
+    186,80,194,100,90,93,56,172,211,252,186,176,162,51,34,161,
+    11,59,58,93,223,186,176,208,192,25,212,16,228,6,245,215,
+    13,97,208,64,183,218,16,210,77,66,100,154,194,14,226,106,
+    83,112,183,8,225,109,9,43,45,124,70,75,40,81,66,107,
+    9,109,196,221,150,176,212,166,147,177,45,228,16,111,182,133,
+    14,37,122,109,193,215,65,207,214,17,10,29,66,168,29,161,
+    131,184,215,17,194,93,58,153,186,66,182,139,125,221,21,218,
+    148,232,118,5,87,143,17,158,158,144,237,17,34,215,19,170,
+    72,212,123,194,98,159,16,254,190,144,65,156,237,11,77,74,
+    180,251,194,97,159,229,112,13,132,244,128,118,201,64,40,32,
+    86,7,194,226,144,22,53,20,86,16,39,134,66,123,120,207,
+    97,235,14,133,125,100,15,135,194,214,136,110,72,35,65,27,
+    177,39,86,70,194,1,37,22,118,133,213,93,70,172,237,10,
+    213,93,186,62,119,133,67,196,174,61,33,179,71,136,236,158,
+    80,221,195,230,238,9,135,148,112,237,11,203,251,232,61,247,
+    5,121,159,206,128,125,161,135,196,96,95,8,30,208,37,114,
+    32,172,29,48,98,253,64,168,82,162,126,32,120,14,25,177,
+    120,40,164,15,105,7,29,10,27,72,108,29,10,58,37,154,
+    135,130,107,129,253,122,204,179,32,38,22,196,9,145,90,16,
+    85,196,165,5,209,239,34,68,208,37,166,16,175,186,196,50,
+    37,118,92,226,192,37,178,9,235,18,35,110,66,68,221,226,
+    186,155,17,27,110,177,67,137,158,91,12,120,24,17,242,136,
+    27,30,66,108,121,196,62,226,161,71,204,120,197,123,13,91,
+    214,43,238,32,91,245,138,193,69,146,127,105,81,220,90,100,
+    5,203,139,226,130,143,16,110,159,184,142,120,195,39,118,40,
+    209,243,137,43,126,134,19,126,113,199,79,136,170,95,236,35,
+    30,250,197,104,128,16,43,1,49,135,120,51,32,142,40,177,
+    23,16,131,65,246,240,165,160,88,8,18,66,13,138,77,36,
+    218,65,49,20,34,68,56,36,174,135,176,131,66,98,135,18,
+    189,144,24,93,98,120,101,73,172,45,17,66,95,18,15,150,
+    88,142,133,176,184,26,38,196,90,88,212,194,140,168,132,197,
+    133,8,109,121,68,140,69,24,17,143,136,21,74,212,34,226,
+    46,18,251,17,49,189,76,136,204,178,88,66,172,45,139,158,
+    40,33,22,163,98,34,202,114,164,162,98,157,18,141,168,184,
+    135,196,65,84,140,198,238,57,108,43,49,49,131,108,54,38,
+    234,49,146,191,25,19,189,43,12,251,86,196,194,10,237,185,
+    21,113,136,120,119,69,140,199,9,145,140,139,50,226,66,92,
+    236,80,162,23,23,61,9,86,149,197,132,184,145,160,83,43,
+    33,22,17,151,19,226,62,37,14,19,162,15,127,92,25,72,
+    138,27,73,154,35,41,214,146,172,40,61,41,6,82,132,8,
+    165,196,181,20,35,214,83,98,159,18,195,148,24,74,51,34,
+    156,22,203,105,186,68,210,98,7,137,94,90,92,90,37,68,
+    100,85,220,92,101,196,246,170,184,71,137,131,85,49,144,193,
+    37,146,17,183,50,132,144,51,98,27,137,110,70,140,175,209,
+    46,89,19,213,53,70,148,214,68,79,150,14,91,86,140,102,
+    25,177,146,21,139,148,40,103,197,1,226,81,86,140,175,223,
+    115,216,146,235,162,178,206,242,23,215,69,87,142,228,247,228,
+    196,100,142,17,233,156,216,162,68,39,39,134,54,24,14,111,
+    136,229,13,218,15,27,226,16,241,238,134,152,222,164,115,110,
+    83,220,65,92,221,20,61,91,180,242,91,98,5,113,109,75,
+    244,110,19,194,183,45,38,183,241,225,219,98,133,18,181,109,
+    113,128,196,104,91,140,201,132,136,203,98,22,113,78,22,123,
+    148,24,200,162,39,143,115,38,47,174,231,9,177,145,23,53,
+    196,149,188,184,80,160,139,170,32,134,10,56,208,5,113,139,
+    18,114,65,108,34,209,46,136,126,133,122,79,69,92,87,112,
+    169,43,98,147,18,109,69,92,84,25,225,87,197,117,149,62,
+    92,21,171,136,235,170,232,47,210,162,138,98,12,113,188,40,
+    42,197,123,14,91,177,40,86,145,173,23,197,80,137,122,157,
+    146,152,70,156,41,137,29,74,244,74,162,171,140,123,66,89,
+    220,42,211,86,149,197,38,226,118,89,140,106,212,23,106,98,
+    15,241,64,19,147,59,132,72,239,136,42,226,210,142,232,169,
+    208,241,172,136,26,226,74,69,244,87,105,171,170,98,30,177,
+    82,21,23,106,180,175,107,98,28,113,178,38,54,40,209,170,
+    137,254,58,195,193,186,168,214,9,81,170,139,187,136,247,235,
+    226,154,78,136,117,93,172,33,214,117,209,215,32,68,160,33,
+    102,16,103,27,98,143,18,131,134,232,109,178,209,241,53,197,
+    205,38,33,182,155,98,29,137,70,83,12,180,168,115,104,137,
+    153,22,35,178,45,177,69,137,78,75,60,64,98,161,45,166,
+    218,247,28,182,213,182,168,182,113,25,183,197,189,54,201,127,
+    208,22,99,29,116,228,29,177,210,161,19,190,35,238,33,113,
+    208,17,51,93,66,100,187,98,185,203,136,157,174,232,233,209,
+    65,232,137,241,30,35,146,61,177,70,9,189,39,186,250,140,
+    240,244,197,92,159,16,155,125,81,71,162,217,23,67,3,58,
+    153,6,98,118,192,136,220,64,236,82,162,63,16,23,135,56,
+    175,135,226,246,144,16,249,161,88,71,162,49,20,253,35,58,
+    3,70,98,102,132,61,55,18,155,148,104,143,68,215,46,214,
+    106,87,204,238,18,34,183,43,86,144,168,237,138,222,61,234,
+    28,246,196,181,61,244,208,123,98,139,18,157,61,209,189,207,
+    8,239,190,184,190,79,87,219,190,88,69,162,190,47,46,30,
+    16,194,127,32,174,29,96,81,7,98,235,224,158,195,214,57,
+    16,221,135,88,240,161,184,126,72,11,62,20,155,136,219,135,
+    98,112,129,228,88,90,144,182,16,203,11,82,159,18,195,5,
+    41,236,194,159,161,184,36,197,69,87,180,75,26,33,222,115,
+    73,113,55,245,208,110,169,132,88,115,75,135,148,112,121,164,
+    180,135,225,140,71,170,123,8,209,240,72,7,136,23,188,82,
+    206,75,136,77,175,84,246,162,171,246,74,135,148,112,45,74,
+    145,69,60,213,45,74,197,69,66,148,23,165,14,226,222,162,
+    148,246,17,34,227,147,100,196,5,159,212,167,196,208,39,5,
+    252,184,86,252,146,226,167,13,244,75,85,36,234,126,233,144,
+    18,174,128,180,20,192,253,50,32,109,6,8,177,29,144,138,
+    136,203,1,105,64,137,81,64,10,4,241,25,65,105,43,120,
+    244,71,36,99,207,22,148,116,76,214,12,74,190,16,33,2,
+    33,105,53,132,7,171,144,84,167,68,35,36,45,44,161,95,
+    90,146,86,151,8,177,182,36,21,145,40,47,73,11,97,66,
+    184,195,210,74,152,41,137,176,84,163,132,30,150,92,17,220,
+    72,35,82,58,66,123,46,34,85,34,230,25,77,90,88,166,
+    69,45,75,145,101,28,132,101,73,165,68,105,89,106,34,209,
+    94,150,60,81,66,44,70,165,88,20,119,191,168,148,167,132,
+    18,149,218,72,116,163,82,52,230,56,165,73,155,136,183,99,
+    210,136,18,123,49,105,105,5,127,119,181,34,213,86,104,59,
+    86,164,225,10,83,118,87,164,88,156,16,241,184,148,71,172,
+    196,165,30,37,6,113,105,49,129,171,43,33,101,18,244,100,
+    159,144,106,72,232,9,105,33,121,207,97,115,39,165,237,36,
+    58,147,164,212,78,18,162,155,148,252,41,116,38,41,41,155,
+    34,68,46,37,245,144,24,164,164,96,154,46,195,180,180,158,
+    198,133,154,150,234,148,104,164,37,207,42,118,225,170,148,94,
+    165,163,179,42,169,72,148,86,165,1,37,70,171,146,63,131,
+    15,207,72,217,12,125,120,70,106,34,209,206,72,222,53,66,
+    248,214,164,196,26,83,82,107,82,145,18,229,53,233,0,137,
+    133,172,148,205,210,162,178,82,57,139,235,51,43,185,214,233,
+    39,200,117,105,101,29,103,217,186,164,80,162,184,46,117,144,
+    232,173,75,254,28,33,130,57,41,157,195,6,229,164,22,37,
+    58,57,105,97,3,187,121,67,202,109,80,231,176,33,213,144,
+    208,55,164,224,38,237,196,77,105,123,19,199,99,83,234,108,
+    222,115,216,122,155,210,1,38,91,216,146,18,91,132,72,109,
+    73,165,45,166,104,91,210,30,37,14,182,164,236,54,182,123,
+    91,106,108,19,162,181,45,5,101,124,180,44,109,201,116,69,
+    203,210,30,18,7,178,20,207,83,39,153,151,10,121,166,168,
+    121,105,72,137,221,188,148,40,96,45,10,146,86,160,223,153,
+    10,82,80,193,103,40,210,150,66,159,161,72,3,36,70,138,
+    180,172,18,34,166,74,59,42,83,170,170,180,80,164,19,182,
+    40,109,20,153,178,85,148,218,148,232,22,37,127,9,71,163,
+    36,109,148,8,177,85,146,70,72,236,149,164,88,153,46,170,
+    178,84,41,163,115,40,75,46,141,206,0,77,146,53,166,20,
+    52,169,79,137,161,38,69,118,208,107,236,72,133,29,66,168,
+    59,210,8,137,189,29,41,86,57,58,94,90,69,218,175,224,
+    12,169,74,213,42,246,85,85,90,169,225,51,106,210,30,42,
+    129,186,180,94,199,57,81,151,66,58,206,1,93,234,234,172,
+    148,68,67,42,54,152,226,109,74,171,77,166,52,155,146,183,
+    133,29,213,146,10,45,102,233,183,164,40,62,235,232,132,121,
+    167,244,46,144,150,139,63,118,236,255,3,107,206,3,213,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/build/NULL/python/m5/object_index.py",
+    "m5.object_index",
+    embedded_module_data,
+    13439,
+    33037);
+
+} // anonymous namespace
+} // namespace gem5
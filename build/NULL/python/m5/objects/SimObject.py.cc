@@ -0,0 +1,35 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,123,204,128,4,152,160,244,103,41,32,49,157,33,133,
+    33,133,49,135,33,151,49,138,145,17,196,102,202,97,10,97,
+    72,97,14,102,208,100,121,9,82,165,201,120,139,211,169,178,
+    36,213,191,40,37,181,8,200,97,212,242,211,100,190,197,153,
+    107,170,87,144,88,148,152,91,92,196,12,84,116,139,7,200,
+    15,206,204,245,79,202,74,77,46,89,201,240,25,164,243,151,
+    82,113,81,178,126,65,101,73,70,126,158,126,174,169,126,62,
+    88,178,88,31,174,78,175,160,242,23,135,77,110,126,74,105,
+    78,170,93,17,23,80,11,35,16,23,107,3,137,15,204,140,
+    140,140,31,44,24,24,21,46,48,200,35,163,27,12,82,23,
+    80,81,17,7,80,61,0,19,112,57,147,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/objects/SimObject.py",
+    "m5.objects.SimObject",
+    embedded_module_data,
+    171,
+    225);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,175 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,87,235,111,19,217,21,191,51,227,241,140,29,219,
+    113,156,151,243,2,47,1,130,183,34,201,194,166,144,77,150,
+    236,22,18,150,64,130,180,164,168,27,21,141,140,103,2,206,
+    250,145,222,153,132,36,235,20,131,82,225,84,145,26,164,32,
+    82,109,35,165,18,66,160,237,10,62,85,124,169,212,63,160,
+    31,198,200,18,238,72,150,34,85,43,181,223,140,0,169,202,
+    167,158,123,199,227,71,66,86,171,38,199,231,222,185,143,51,
+    247,158,199,239,156,249,23,170,248,227,139,237,155,17,6,161,
+    135,72,70,50,19,69,147,12,109,217,73,142,182,182,73,158,
+    182,246,73,1,90,54,42,198,28,147,78,6,201,220,50,82,
+    106,166,93,150,168,115,232,49,240,239,74,162,39,221,44,82,
+    60,138,251,49,72,254,142,41,141,214,202,182,144,151,69,231,
+    145,204,47,35,217,174,8,211,117,214,220,99,14,86,114,165,
+    149,62,197,167,240,211,245,214,179,210,208,82,146,45,53,90,
+    61,89,88,70,147,77,178,8,188,89,118,0,247,203,78,224,
+    45,10,55,221,106,173,217,106,67,239,249,147,107,100,215,99,
+    22,222,200,150,214,181,191,111,93,245,173,100,247,28,194,46,
+    184,89,83,245,56,232,131,185,66,127,65,207,127,200,192,120,
+    144,49,248,72,92,86,230,195,76,133,52,162,112,114,197,55,
+    131,136,40,252,6,74,162,107,45,75,76,146,217,122,223,187,
+    193,32,213,234,123,214,156,100,238,179,171,173,240,26,102,177,
+    38,214,215,157,184,62,173,132,53,181,251,41,99,56,85,45,
+    132,53,245,86,68,187,25,100,13,182,187,215,176,199,18,242,
+    108,84,81,201,13,3,129,157,15,84,28,238,153,89,208,110,
+    38,226,61,177,190,158,226,214,30,73,138,196,35,154,36,117,
+    207,44,236,56,7,163,17,85,11,39,98,51,103,176,19,118,
+    125,8,63,149,28,53,133,10,200,230,98,203,108,91,244,228,
+    4,247,43,193,255,82,240,111,116,100,132,174,172,208,85,16,
+    96,34,103,115,22,184,170,165,111,200,201,71,194,149,247,178,
+    116,254,230,0,176,123,160,8,133,122,221,36,155,70,83,140,
+    204,44,139,147,92,26,205,51,147,54,184,40,107,120,164,203,
+    230,89,199,232,125,194,92,133,164,146,66,255,1,236,1,243,
+    16,105,21,234,78,178,26,91,126,154,46,245,171,237,142,143,
+    38,217,233,146,204,36,42,247,191,5,139,38,153,111,209,38,
+    247,53,93,141,235,52,71,165,244,36,147,100,171,189,118,137,
+    213,106,202,43,170,125,100,203,190,215,192,32,133,200,168,58,
+    15,248,18,34,247,30,223,97,186,131,130,225,140,168,145,56,
+    216,54,30,86,12,187,164,45,204,40,170,225,52,53,49,1,
+    15,134,40,73,241,80,76,145,36,67,184,161,104,33,77,195,
+    6,175,206,206,40,216,168,145,36,213,28,145,164,160,205,176,
+    169,74,116,202,176,145,197,6,63,23,138,206,42,134,67,146,
+    194,209,144,170,194,66,27,34,78,18,72,97,114,67,220,4,
+    108,177,181,90,239,221,21,226,62,134,121,245,38,176,255,166,
+    208,59,39,114,55,175,205,110,78,101,15,244,100,92,189,89,
+    87,47,56,128,163,119,219,219,184,238,217,154,120,116,77,63,
+    52,0,244,124,194,108,95,122,7,116,239,192,15,13,109,27,
+    195,91,31,63,105,204,52,244,100,27,122,210,195,121,209,189,
+    34,172,10,175,196,182,151,98,219,198,185,173,35,25,241,88,
+    86,60,166,91,132,137,90,131,60,38,120,96,56,37,201,116,
+    109,184,180,75,146,126,51,27,138,154,42,160,231,54,220,197,
+    91,133,149,104,20,110,206,96,2,5,42,241,139,207,204,219,
+    185,45,118,146,76,156,54,175,97,253,23,88,7,31,44,160,
+    159,198,232,177,168,168,42,255,182,91,94,57,131,72,152,107,
+    21,83,152,165,72,193,134,80,165,111,158,67,215,14,45,33,
+    141,47,143,200,92,146,248,159,109,147,211,132,253,60,106,183,
+    223,172,118,82,4,226,23,7,46,196,102,18,88,11,40,115,
+    10,94,8,40,177,235,138,44,43,114,224,74,36,102,90,52,
+    96,170,47,16,137,107,137,128,118,51,162,6,136,254,212,153,
+    80,88,233,30,159,88,228,167,112,34,22,88,116,4,34,166,
+    152,15,193,123,106,164,16,104,51,154,8,129,32,240,185,34,
+    180,24,54,101,94,9,131,231,69,19,215,67,81,21,116,45,
+    90,186,14,80,93,27,34,217,66,246,226,78,120,60,75,102,
+    191,68,4,80,222,217,145,88,95,64,12,95,155,19,61,105,
+    123,206,215,148,186,152,247,181,146,145,147,148,165,237,121,209,
+    165,187,143,174,93,5,102,210,247,194,83,199,95,28,25,241,
+    68,86,60,161,83,42,112,214,114,106,138,42,43,112,150,21,
+    78,80,43,0,174,84,161,67,181,46,119,231,47,26,129,123,
+    176,155,184,223,155,47,80,9,187,15,254,116,236,86,197,36,
+    64,219,215,20,42,158,117,80,28,15,80,120,99,36,170,26,
+    76,228,7,89,76,172,141,253,100,131,137,219,166,203,18,52,
+    94,236,144,148,121,98,16,69,238,30,140,38,194,160,240,51,
+    221,101,196,30,39,123,206,34,11,172,237,101,182,237,242,230,
+    106,235,255,112,251,247,183,55,212,76,109,103,182,182,147,64,
+    181,189,96,71,193,227,207,157,47,143,125,162,31,251,164,192,
+    35,135,123,155,118,129,204,112,99,240,33,104,158,34,211,203,
+    169,57,29,165,35,224,99,240,60,70,222,217,101,190,147,181,
+    94,7,193,125,255,194,250,133,2,15,253,215,100,224,109,241,
+    36,188,221,52,82,165,86,5,203,72,227,44,209,106,18,204,
+    84,4,219,246,253,141,197,32,141,219,111,238,10,200,216,170,
+    8,173,10,139,176,213,22,193,109,149,161,37,115,154,88,126,
+    34,161,71,3,144,223,228,171,119,221,101,42,33,126,186,4,
+    234,201,93,246,38,158,161,121,202,43,161,112,232,212,234,202,
+    207,90,125,185,63,237,44,73,97,170,165,36,119,5,249,18,
+    27,191,35,219,1,46,62,90,226,246,145,192,237,58,7,0,
+    73,146,155,46,157,25,206,225,171,60,71,146,219,251,14,6,
+    197,199,87,79,252,152,254,147,72,107,217,111,118,142,249,191,
+    53,187,175,204,36,42,79,93,33,137,253,71,86,146,130,37,
+    201,66,108,9,227,134,32,81,220,146,12,86,146,22,197,34,
+    236,117,45,54,116,5,110,134,0,245,18,1,146,207,34,215,
+    103,53,24,221,97,186,130,220,162,3,202,170,153,16,14,197,
+    84,88,15,93,156,152,95,88,116,65,175,132,158,65,183,25,
+    176,36,0,48,177,191,225,249,220,146,50,140,113,2,155,89,
+    202,46,209,250,207,224,32,45,147,184,41,162,48,110,64,52,
+    133,153,216,26,141,92,55,220,102,183,136,169,152,20,93,52,
+    240,130,54,138,3,20,82,113,11,21,169,38,102,113,88,177,
+    146,117,17,98,33,207,223,176,18,51,38,153,249,151,240,83,
+    251,25,18,149,57,161,38,189,0,53,154,46,248,243,162,119,
+    197,185,234,76,59,243,181,254,149,111,86,191,209,197,86,152,
+    189,119,251,238,237,53,45,35,180,103,133,118,130,163,151,153,
+    188,167,93,239,24,251,94,4,6,244,119,217,108,129,50,158,
+    241,172,103,92,23,199,127,112,215,175,78,110,216,50,238,142,
+    172,187,35,53,2,133,224,131,22,93,104,5,202,123,155,55,
+    157,89,127,239,243,166,140,255,116,214,127,250,197,225,140,119,
+    40,235,29,74,243,105,190,32,162,230,207,152,2,170,113,116,
+    82,150,30,201,55,30,204,54,30,127,50,149,105,236,203,54,
+    246,165,71,0,164,214,230,214,127,171,215,30,1,202,251,15,
+    110,217,159,216,50,254,227,89,255,241,53,62,231,109,92,227,
+    1,164,188,71,223,137,200,221,184,50,186,58,154,30,133,13,
+    155,167,254,216,255,167,126,189,246,48,80,190,233,112,174,225,
+    220,230,188,222,112,14,232,197,132,217,2,189,230,216,102,223,
+    91,4,172,128,216,58,31,164,30,128,168,254,245,254,141,137,
+    245,33,221,117,104,187,169,237,119,231,239,92,88,190,144,150,
+    239,92,206,213,120,83,151,246,38,147,82,161,249,87,68,83,
+    122,69,108,236,143,69,187,34,113,127,100,34,169,169,34,98,
+    166,109,239,151,183,59,73,85,203,7,84,172,64,166,221,120,
+    180,55,161,145,99,147,10,136,230,199,139,176,157,192,239,53,
+    223,175,89,2,94,75,44,4,89,197,226,57,244,204,147,100,
+    174,162,135,12,212,25,245,180,66,101,224,35,7,247,194,92,
+    144,43,103,45,179,0,32,162,45,255,220,113,12,222,80,226,
+    144,54,240,25,40,41,37,57,2,110,90,145,191,172,185,89,
+    178,175,31,216,191,225,159,164,48,182,206,78,217,63,235,58,
+    214,26,214,230,158,255,252,111,95,233,39,71,128,210,54,179,
+    53,169,192,89,11,205,164,101,55,56,40,83,105,112,26,246,
+    217,25,57,164,41,184,155,60,240,17,77,137,169,36,134,72,
+    250,34,223,103,180,232,169,44,86,132,226,241,240,167,228,48,
+    228,247,21,34,81,148,119,213,62,112,220,175,89,175,201,184,
+    218,179,174,246,212,112,206,230,184,119,233,238,165,242,33,243,
+    31,116,61,106,255,243,129,71,7,232,113,94,147,161,183,200,
+    236,241,164,199,147,101,188,29,60,207,229,91,59,178,242,233,
+    234,167,186,205,79,15,108,120,199,250,164,225,207,207,15,127,
+    41,93,254,197,232,240,217,137,43,6,63,5,170,81,160,52,
+    176,105,24,170,116,110,65,81,131,29,134,163,132,24,248,35,
+    178,143,77,168,6,39,17,166,46,64,33,38,17,206,211,239,
+    3,76,224,221,168,45,125,31,154,64,132,137,81,76,85,192,
+    55,131,58,163,132,73,249,76,43,58,44,193,7,6,232,41,
+    64,86,144,122,152,154,21,31,36,204,135,138,21,174,33,20,
+    139,62,10,111,180,168,174,192,65,130,59,84,109,134,160,196,
+    231,34,56,17,199,61,84,235,209,196,45,5,99,82,35,148,
+    203,136,29,113,208,148,117,6,143,83,199,5,77,15,0,135,
+    106,142,97,10,35,12,98,14,234,232,128,73,57,228,213,45,
+    202,33,159,110,81,14,53,233,22,109,163,159,233,213,84,176,
+    149,190,84,125,173,89,95,23,41,70,88,82,140,176,164,24,
+    97,83,98,1,190,90,188,233,179,107,226,202,216,234,88,202,
+    145,243,212,167,106,10,118,39,3,117,253,94,182,118,53,219,
+    120,244,53,233,189,45,79,180,162,195,39,82,182,101,87,250,
+    87,89,212,148,69,129,130,93,96,160,20,45,177,6,158,1,
+    163,151,152,183,141,169,43,160,18,27,228,153,22,50,81,100,
+    94,100,19,150,7,238,13,221,29,210,235,143,108,221,202,112,
+    61,89,174,231,21,215,247,146,235,203,112,167,178,220,169,23,
+    67,58,55,10,148,179,185,82,95,220,25,93,30,77,209,255,
+    2,135,108,23,25,24,167,202,253,31,208,158,200,226,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/objects/__init__.py",
+    "m5.objects",
+    embedded_module_data,
+    2414,
+    4573);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,207 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,165,88,77,108,27,199,21,158,253,229,146,92,137,250,
+    143,36,75,38,253,163,202,180,44,217,86,93,59,81,156,58,
+    64,36,217,176,19,197,173,212,34,16,154,176,180,118,37,209,
+    166,73,101,119,229,31,117,213,168,128,139,174,13,33,102,2,
+    21,17,80,23,96,80,199,80,224,28,12,244,226,99,208,99,
+    79,164,64,212,196,2,2,4,20,61,20,232,129,134,93,32,
+    200,169,239,205,114,151,164,68,59,72,74,14,223,14,103,230,
+    205,206,188,247,189,159,153,127,146,170,143,80,126,62,75,1,
+    249,140,40,68,97,146,100,218,121,50,211,12,60,217,36,153,
+    34,44,57,75,20,238,22,81,248,7,44,33,15,89,151,125,
+    154,165,61,2,244,136,59,122,56,218,227,131,30,73,229,31,
+    112,208,199,121,125,130,194,76,146,168,255,223,248,103,34,202,
+    216,204,225,153,234,69,49,238,162,26,233,162,84,130,11,153,
+    102,41,19,107,251,83,105,69,157,141,47,38,141,137,40,103,
+    75,177,88,42,126,85,141,197,236,64,44,118,53,173,44,38,
+    177,46,199,98,31,46,198,147,78,207,151,228,25,206,246,109,
+    167,174,205,28,93,184,105,204,167,83,71,175,254,228,104,122,
+    193,72,164,83,250,208,194,77,13,165,64,73,4,126,122,8,
+    200,138,247,45,242,210,202,168,22,112,71,212,95,104,247,142,
+    133,222,130,253,43,44,80,94,225,96,209,188,45,233,11,201,
+    132,97,168,218,12,91,197,143,117,148,202,179,54,202,111,50,
+    38,137,121,157,10,153,36,95,50,40,30,129,50,195,214,121,
+    93,77,206,106,77,184,72,100,141,68,180,32,60,80,6,137,
+    84,194,136,197,150,154,221,215,12,185,77,125,56,184,129,238,
+    168,216,222,109,241,171,1,11,190,116,63,51,66,213,82,4,
+    119,41,255,112,150,194,101,73,189,143,73,46,123,245,7,176,
+    253,135,174,8,200,178,96,112,85,227,248,203,222,70,77,230,
+    178,215,83,11,146,101,209,20,87,122,13,255,119,243,153,66,
+    45,132,24,42,30,83,204,86,239,129,84,141,174,89,155,51,
+    90,67,197,70,69,42,63,219,55,167,26,113,195,208,108,241,
+    90,60,185,168,234,54,175,168,186,97,251,116,183,89,189,97,
+    168,41,37,234,211,154,113,184,232,160,197,246,193,51,166,67,
+    191,64,217,108,113,33,174,233,170,166,181,195,32,173,3,101,
+    237,35,168,24,250,241,180,51,19,79,38,119,104,199,105,58,
+    132,28,113,66,181,211,220,241,217,158,79,247,172,79,221,155,
+    206,55,31,42,52,31,178,196,173,80,71,230,218,218,114,118,
+    246,254,149,124,104,184,16,26,182,248,98,48,100,157,222,146,
+    91,51,227,107,239,100,79,222,127,253,145,152,151,79,21,228,
+    83,57,183,108,203,77,119,47,220,185,176,14,237,225,130,28,
+    206,185,133,106,124,34,42,104,34,174,20,23,169,73,72,90,
+    144,244,34,65,45,56,56,199,101,107,13,46,57,136,107,28,
+    38,213,54,81,98,25,97,79,137,120,68,20,133,72,137,236,
+    38,206,116,56,73,141,217,184,26,126,54,5,228,15,47,52,
+    156,91,232,40,120,160,34,58,152,105,159,69,102,25,69,188,
+    37,77,75,180,230,131,154,95,145,160,39,160,4,149,192,45,
+    102,58,104,145,27,204,180,12,6,39,219,242,187,84,97,23,
+    169,122,102,152,170,183,35,98,16,9,207,138,132,34,157,205,
+    214,131,16,56,192,106,60,87,80,249,0,126,15,189,246,90,
+    60,51,164,134,167,130,94,38,1,239,185,207,124,140,6,206,
+    123,173,228,178,87,175,143,227,218,119,49,4,102,33,49,177,
+    30,63,180,251,188,149,19,244,147,19,182,127,54,173,93,141,
+    35,222,162,146,29,0,96,151,221,166,45,1,136,41,110,237,
+    214,169,132,145,84,149,115,106,114,97,220,29,172,133,97,14,
+    219,31,243,6,117,41,9,61,126,9,252,106,34,5,221,250,
+    2,252,84,37,22,215,230,116,192,54,192,24,6,234,182,24,
+    155,211,210,139,11,95,114,142,189,240,180,91,188,114,29,159,
+    58,10,194,181,7,138,184,165,246,106,245,120,206,10,81,166,
+    95,34,212,28,164,198,39,82,215,166,212,181,62,240,197,141,
+    66,255,91,249,254,177,66,255,88,94,26,47,72,227,57,105,
+    124,171,107,95,161,107,232,17,159,235,58,243,88,4,2,5,
+    124,91,99,81,146,87,129,239,216,166,116,44,47,13,23,164,
+    225,156,52,188,221,137,110,175,161,36,146,87,246,172,165,160,
+    26,180,224,235,120,192,186,184,248,17,65,92,176,53,190,238,
+    178,55,178,162,75,215,163,176,26,58,89,91,6,9,199,202,
+    34,214,181,40,110,165,102,223,131,184,239,174,154,125,87,115,
+    156,70,134,30,103,239,161,195,150,177,250,219,66,232,240,198,
+    104,46,244,250,163,113,32,88,164,215,95,178,234,247,136,19,
+    66,244,38,147,213,27,171,215,14,216,240,56,48,134,238,216,
+    89,149,191,173,66,105,13,71,148,93,234,129,181,70,140,121,
+    53,50,179,168,105,106,202,136,56,14,49,66,181,14,129,152,
+    202,64,67,127,102,55,197,21,37,230,116,59,160,216,45,12,
+    219,143,91,167,157,75,29,187,68,66,219,207,32,207,25,42,
+    143,237,80,107,137,112,254,11,204,250,184,243,44,118,239,189,
+    55,100,141,174,94,176,224,187,221,253,218,250,193,123,67,133,
+    238,215,30,159,200,117,159,255,250,36,16,40,110,247,75,68,
+    38,50,47,119,0,10,91,107,222,10,119,133,214,181,17,133,
+    55,217,107,68,59,9,188,76,93,94,126,71,112,228,230,224,
+    61,138,128,74,86,68,168,249,104,77,130,26,131,53,163,202,
+    252,77,174,150,23,198,72,56,134,170,205,115,41,85,166,239,
+    169,109,153,135,240,233,205,180,44,152,2,112,120,238,226,26,
+    163,5,76,190,186,197,164,235,49,121,204,197,150,222,0,173,
+    69,226,41,87,175,70,250,133,218,62,18,73,107,145,185,100,
+    250,82,60,25,73,165,83,106,4,116,102,139,241,25,28,49,
+    1,149,133,5,8,156,229,40,235,186,28,17,98,102,34,53,
+    103,243,198,205,5,213,150,48,250,93,138,207,92,137,250,108,
+    14,2,177,205,45,164,23,156,136,67,17,20,168,32,136,6,
+    85,173,159,208,200,141,174,69,59,140,100,0,9,190,66,235,
+    34,110,228,21,137,27,121,29,131,27,1,178,244,74,13,186,
+    42,243,142,35,199,95,8,194,171,36,19,185,229,238,200,157,
+    145,204,124,150,207,7,251,10,193,190,141,206,205,224,241,92,
+    240,248,163,185,175,59,114,39,207,66,41,182,117,127,118,254,
+    211,243,235,215,243,109,253,133,182,126,107,172,24,217,111,141,
+    103,94,203,203,189,197,222,62,168,157,188,61,81,12,71,161,
+    242,106,94,238,217,218,23,221,232,251,60,124,63,12,255,71,
+    242,242,222,237,230,254,76,219,218,158,66,115,255,70,91,174,
+    249,213,71,29,64,160,88,98,49,212,190,250,27,26,214,51,
+    198,218,114,46,120,16,74,113,255,33,0,239,59,235,7,33,
+    132,111,135,218,173,6,7,194,158,194,225,131,91,165,217,218,
+    127,8,77,219,25,147,249,19,249,51,187,204,43,108,185,38,
+    152,76,182,30,50,1,196,59,147,120,200,194,88,45,100,84,
+    37,166,21,159,176,236,51,185,101,41,213,8,212,247,130,17,
+    146,73,178,85,81,175,242,49,121,69,48,89,211,247,149,248,
+    0,214,254,208,91,255,178,255,133,28,130,226,51,69,83,250,
+    74,218,193,17,48,253,102,96,150,165,64,157,167,64,141,92,
+    74,167,147,106,5,175,136,40,85,137,12,14,98,206,15,56,
+    166,213,52,253,55,20,40,231,99,145,209,4,100,96,241,155,
+    145,121,136,119,17,69,69,156,2,40,35,192,126,125,62,49,
+    51,31,73,232,20,244,101,208,46,177,131,131,75,2,157,230,
+    91,102,208,102,224,136,161,27,105,77,141,25,218,162,10,30,
+    15,163,149,118,130,96,180,195,9,237,160,211,59,27,79,234,
+    94,55,69,47,122,49,56,3,248,52,21,222,62,163,106,7,
+    144,167,97,242,23,23,47,254,124,108,114,50,118,110,236,237,
+    139,20,172,209,96,57,120,226,170,233,204,148,213,22,12,108,
+    176,133,89,218,222,225,52,209,87,10,179,244,193,27,32,5,
+    155,159,197,72,140,208,143,84,62,142,187,13,162,180,202,200,
+    95,234,172,49,137,170,158,105,24,170,127,78,168,77,72,164,
+    185,39,51,149,9,102,130,150,80,108,218,187,206,103,26,51,
+    141,80,13,181,222,53,239,152,235,111,101,91,243,161,190,66,
+    168,15,177,219,82,34,130,127,96,171,173,167,208,118,24,12,
+    163,173,211,26,179,198,182,241,225,182,129,7,191,251,209,157,
+    143,138,114,243,250,145,71,190,199,106,137,35,77,225,167,132,
+    109,10,60,71,98,241,16,157,155,218,220,33,131,27,202,227,
+    246,221,67,36,24,146,153,178,150,114,82,151,99,17,213,71,
+    41,174,252,123,246,119,32,127,100,48,18,102,235,65,12,108,
+    165,214,189,106,251,170,115,182,218,140,43,91,253,134,10,74,
+    119,204,48,73,15,110,16,14,192,18,76,166,139,84,218,255,
+    255,153,33,143,211,222,128,26,156,116,1,124,113,205,208,175,
+    39,140,121,56,17,46,66,26,102,55,197,98,229,99,76,226,
+    210,162,1,71,221,168,151,126,225,25,198,15,199,140,100,92,
+    215,99,177,114,240,93,41,163,193,99,131,67,73,231,142,76,
+    204,235,249,16,134,234,8,137,111,32,35,9,134,238,158,185,
+    115,102,253,199,249,96,184,16,12,67,214,239,31,222,106,237,
+    252,228,212,218,169,39,173,3,155,173,3,27,163,249,214,227,
+    133,214,227,57,249,248,54,248,178,19,214,105,235,116,177,245,
+    149,117,126,109,36,39,247,254,43,212,118,251,250,234,245,39,
+    161,254,205,80,255,6,159,15,13,22,66,131,57,105,208,81,
+    99,181,43,240,142,161,50,243,61,213,120,240,251,11,219,100,
+    119,166,239,74,89,153,149,56,11,106,221,139,35,19,204,50,
+    199,214,164,220,10,11,113,151,195,184,203,184,0,240,129,187,
+    131,58,141,237,48,147,242,131,32,80,127,85,81,206,1,2,
+    61,166,193,49,238,109,172,191,67,28,109,234,174,206,104,160,
+    164,153,38,12,161,209,242,93,36,123,112,156,228,229,166,23,
+    225,175,78,175,59,34,46,38,180,73,32,187,176,224,205,187,
+    132,28,95,144,250,88,144,252,131,91,114,243,237,179,171,103,
+    159,200,225,77,57,156,229,179,106,94,62,82,144,143,228,220,
+    82,108,104,206,76,173,189,159,107,216,15,165,216,217,179,174,
+    102,150,173,115,69,185,215,26,45,200,189,57,57,10,37,43,
+    57,79,40,224,101,50,134,101,90,102,177,119,127,134,207,76,
+    125,18,200,192,23,61,66,143,101,254,87,36,13,45,47,125,
+    219,238,148,15,149,70,97,245,41,161,41,95,85,254,91,63,
+    129,171,85,213,175,64,25,203,204,50,196,214,74,220,171,31,
+    193,106,249,70,201,251,77,148,151,195,212,108,133,55,57,19,
+    211,48,1,211,48,147,67,152,172,54,155,172,123,142,224,157,
+    115,68,128,158,186,220,243,85,76,73,204,192,201,200,22,18,
+    134,122,85,47,107,213,230,209,211,211,76,200,230,174,168,55,
+    109,238,26,4,29,87,163,229,244,231,151,100,87,250,83,153,
+    249,247,168,80,28,129,215,66,93,107,31,60,105,31,218,108,
+    31,202,183,31,43,180,31,187,13,206,214,82,182,59,123,238,
+    53,60,233,28,216,236,28,200,119,14,22,58,7,75,132,245,
+    71,40,185,125,206,122,43,211,90,12,181,88,31,101,15,108,
+    76,101,143,102,143,22,123,194,160,168,201,79,252,223,128,171,
+    47,159,174,38,234,59,232,249,31,164,2,180,177,223,117,84,
+    231,201,213,199,235,122,215,61,149,43,31,79,176,144,130,26,
+    49,26,49,57,253,166,110,243,234,13,188,86,115,68,42,225,
+    159,153,180,162,214,92,173,9,139,122,124,78,93,106,169,17,
+    35,109,251,24,37,56,226,72,208,57,117,238,219,148,246,229,
+    165,3,5,233,64,78,58,80,12,182,230,130,225,45,57,180,
+    122,46,243,30,100,128,5,121,111,206,45,0,100,57,2,189,
+    206,245,8,93,98,67,221,123,25,52,100,237,24,41,231,178,
+    218,121,36,63,35,101,107,165,10,214,240,242,200,110,40,59,
+    250,25,21,47,149,162,140,99,225,40,143,55,29,44,132,93,
+    114,28,59,254,70,168,33,87,110,115,36,161,15,204,216,37,
+    109,140,112,26,239,117,202,68,20,132,11,12,68,248,10,109,
+    108,17,58,74,196,35,135,218,133,238,18,241,200,144,79,24,
+    42,145,58,164,197,47,0,136,234,144,14,159,208,134,67,202,
+    164,133,19,192,171,124,39,113,164,135,155,130,147,1,166,84,
+    218,7,164,124,73,75,143,18,54,143,166,227,108,189,246,110,
+    235,91,233,180,115,83,252,83,77,33,206,45,174,254,87,32,
+    37,142,97,152,210,73,194,52,173,132,240,91,36,129,21,250,
+    45,146,142,156,91,74,34,195,248,65,50,187,200,83,36,207,
+    43,109,82,128,1,115,217,77,158,34,121,94,105,235,254,53,
+    195,192,142,234,211,204,137,167,244,249,252,5,253,116,83,255,
+    3,191,232,44,175,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/options.py",
+    "m5.options",
+    embedded_module_data,
+    2917,
+    6098);
+
+} // anonymous namespace
+} // namespace gem5
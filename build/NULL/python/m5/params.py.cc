@@ -0,0 +1,2369 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,236,189,11,116,28,199,117,32,218,61,63,244,124,128,
+    25,96,0,12,6,223,193,143,192,128,32,64,144,0,63,0,
+    255,4,191,162,32,201,164,36,11,150,4,15,49,77,18,36,
+    48,128,122,6,36,49,2,44,90,86,236,33,3,71,160,76,
+    69,35,9,140,70,14,229,128,142,188,70,178,242,11,55,79,
+    201,202,201,254,55,155,157,198,182,151,216,201,67,194,115,118,
+    149,93,39,57,39,208,147,157,163,199,151,183,126,117,171,186,
+    123,250,55,67,136,148,180,206,158,16,205,59,221,117,171,187,
+    126,183,170,238,189,117,235,214,127,165,20,255,108,226,239,199,
+    119,25,138,122,141,10,83,97,122,148,26,36,191,244,32,141,
+    127,77,131,38,252,107,30,52,227,95,203,160,5,255,90,7,
+    173,97,83,216,60,106,27,43,24,44,24,99,6,25,154,66,
+    207,150,81,251,9,42,108,125,137,26,116,132,109,8,58,195,
+    5,8,186,70,168,80,161,137,58,68,133,153,151,168,176,157,
+    45,250,158,153,162,126,219,44,101,99,208,141,113,14,132,115,
+    178,238,119,93,26,172,7,99,11,17,182,232,123,38,132,49,
+    201,152,98,140,113,35,140,135,45,193,111,90,16,222,34,227,
+    189,24,95,140,240,37,172,87,243,213,82,140,243,34,92,41,
+    91,172,193,149,97,92,25,194,149,107,82,44,55,81,108,57,
+    138,79,163,80,90,14,245,225,208,50,77,104,5,254,138,15,
+    125,165,130,245,176,126,77,222,42,49,214,143,176,149,172,71,
+    147,126,21,198,85,33,92,53,235,214,224,170,49,174,6,225,
+    106,217,42,182,90,87,230,26,140,175,67,248,0,91,163,121,
+    183,22,227,234,17,174,65,135,171,195,184,70,132,107,210,225,
+    2,24,215,140,112,235,116,184,122,140,107,65,184,86,29,174,
+    1,227,130,8,215,166,195,53,98,220,122,132,107,215,225,154,
+    48,110,3,194,117,232,112,205,24,215,137,112,27,117,184,117,
+    24,215,133,112,155,116,184,22,140,219,140,112,221,58,92,43,
+    198,245,32,220,22,29,46,136,113,91,17,110,155,14,215,134,
+    113,219,17,174,87,135,91,143,113,125,8,183,67,135,107,199,
+    184,157,8,183,75,135,219,128,113,187,17,110,15,162,154,14,
+    77,235,118,98,236,94,132,221,167,123,115,35,198,237,71,184,
+    126,29,174,11,227,14,32,220,65,29,110,19,198,29,66,184,
+    195,58,74,220,140,113,71,16,238,168,14,215,141,113,15,33,
+    220,49,29,174,7,227,30,70,184,1,29,110,75,56,25,126,
+    228,37,122,112,107,248,209,208,182,240,99,104,124,216,142,99,
+    127,9,197,62,174,139,221,139,113,39,16,238,113,29,174,15,
+    227,158,64,184,39,217,62,13,110,7,198,125,25,225,158,210,
+    225,118,158,166,194,131,223,165,7,119,133,191,130,82,223,141,
+    99,62,141,98,62,163,75,97,15,26,185,246,98,252,179,8,
+    63,164,235,141,251,48,238,171,8,23,66,173,181,79,215,27,
+    247,99,252,73,132,31,102,247,107,222,237,199,184,48,194,177,
+    108,191,6,119,32,124,106,240,32,198,159,70,248,51,108,149,
+    6,127,8,227,70,16,238,44,123,72,131,59,140,113,231,16,
+    110,84,135,59,130,113,99,8,23,209,225,142,98,220,56,194,
+    77,176,157,26,220,67,24,247,28,194,113,58,220,49,140,139,
+    34,92,76,135,123,24,227,38,17,238,188,174,110,7,48,238,
+    2,194,93,100,59,16,86,93,115,143,96,236,20,194,198,13,
+    176,143,98,236,243,8,59,205,62,166,155,49,190,132,198,227,
+    47,125,15,221,253,54,37,135,29,15,207,160,182,62,193,110,
+    58,251,184,28,246,4,27,84,60,61,137,222,234,14,83,236,
+    19,154,49,255,203,56,173,175,161,180,94,208,96,158,194,152,
+    75,8,243,117,246,41,77,30,6,49,238,69,132,251,134,230,
+    173,175,96,204,75,8,243,43,26,204,211,236,211,169,103,40,
+    131,127,225,111,134,191,165,142,75,83,248,43,9,244,149,203,
+    236,211,154,180,159,197,184,43,8,247,171,58,220,16,198,205,
+    34,220,183,117,184,175,98,220,175,33,220,203,236,87,53,184,
+    16,198,205,33,220,85,29,238,36,251,236,224,48,59,52,24,
+    102,67,131,44,123,114,240,20,142,251,10,138,251,29,131,214,
+    57,141,177,215,16,246,85,77,249,207,196,94,204,150,57,101,
+    84,17,148,166,85,71,98,149,159,242,141,179,225,95,71,116,
+    112,14,141,0,175,161,17,96,52,76,31,167,130,175,255,20,
+    80,3,63,133,185,59,104,202,88,39,184,241,139,83,25,107,
+    108,100,248,92,52,72,103,232,182,97,229,7,173,232,191,27,
+    253,255,184,149,194,92,19,29,54,141,82,99,244,140,9,218,
+    100,218,116,86,46,207,52,53,66,77,211,55,232,95,67,105,
+    220,52,15,112,80,5,55,233,140,253,248,200,216,35,39,207,
+    178,195,177,160,57,67,113,14,20,154,113,142,68,229,208,155,
+    230,140,37,196,157,142,102,108,231,46,192,47,142,17,133,151,
+    3,129,192,93,95,148,27,238,156,152,138,157,25,143,116,142,
+    245,116,78,132,184,208,88,180,99,98,138,115,161,8,24,28,
+    130,232,237,8,92,162,150,45,85,105,245,117,199,25,72,108,
+    23,156,129,84,83,218,217,181,176,14,1,184,44,93,31,67,
+    134,31,188,152,28,3,85,104,230,156,144,25,92,50,175,162,
+    100,199,217,231,38,217,200,48,203,21,42,74,196,121,32,174,
+    87,2,15,231,207,125,43,228,190,117,1,229,126,251,34,202,
+    253,118,184,44,219,185,226,207,41,247,30,69,238,247,143,134,
+    162,81,131,172,151,73,224,120,254,172,55,67,214,155,83,177,
+    180,115,203,194,121,4,224,178,108,209,103,93,202,218,199,181,
+    8,124,11,101,158,165,128,23,31,52,37,168,83,116,152,126,
+    137,25,52,39,168,139,244,160,229,56,16,107,209,195,108,44,
+    244,40,80,193,19,161,209,73,118,216,162,248,18,240,247,144,
+    213,143,223,64,224,85,250,53,42,70,103,145,234,126,145,82,
+    96,178,255,166,81,213,76,155,166,205,234,209,119,198,50,77,
+    199,20,233,156,167,184,146,88,129,226,45,250,77,148,207,235,
+    38,53,63,76,83,211,22,229,91,211,244,14,128,184,20,3,
+    241,39,3,161,81,142,13,133,167,2,236,197,145,104,44,26,
+    24,137,160,144,209,71,9,121,7,78,156,25,137,6,198,66,
+    83,129,147,108,96,56,52,25,101,195,129,147,83,129,216,25,
+    54,240,40,238,10,129,77,29,91,3,195,227,99,19,161,216,
+    200,201,145,209,145,216,84,96,52,52,197,114,29,65,75,198,
+    26,157,156,96,185,76,193,208,80,132,189,48,52,148,177,203,
+    223,205,88,80,7,139,4,109,25,203,216,240,40,122,138,132,
+    198,216,140,245,100,40,202,70,51,230,240,112,44,99,134,96,
+    251,208,208,48,52,253,208,80,212,70,218,61,16,184,68,154,
+    30,6,159,120,185,186,5,58,196,116,96,32,143,62,137,192,
+    39,151,168,149,34,239,229,211,179,167,95,30,191,50,158,12,
+    167,250,23,154,23,189,124,81,143,80,212,147,48,47,59,221,
+    175,34,42,174,70,215,138,203,115,167,103,251,226,137,197,19,
+    171,102,186,120,199,71,102,115,97,209,207,40,4,86,49,96,
+    168,170,218,111,219,231,154,46,187,151,221,37,9,7,38,156,
+    160,53,195,160,244,80,190,81,193,28,67,67,99,227,225,201,
+    81,184,119,13,13,61,55,25,26,37,24,156,207,76,161,88,
+    142,97,118,116,116,104,232,38,205,53,64,14,161,125,246,144,
+    210,248,36,240,52,32,182,145,172,75,127,171,38,198,234,93,
+    165,214,6,112,222,240,167,140,41,27,134,249,44,93,135,233,
+    65,51,107,9,155,94,210,142,213,86,20,106,214,133,218,194,
+    22,52,130,23,96,41,147,65,49,108,186,24,118,20,90,160,
+    11,117,128,244,137,36,82,59,72,164,97,7,162,59,103,198,
+    145,109,183,131,195,242,152,128,169,85,236,58,54,138,136,198,
+    104,8,167,7,110,82,55,77,92,61,84,166,101,120,60,204,
+    70,77,152,30,112,237,101,92,195,23,47,14,77,112,108,152,
+    69,68,19,247,41,8,66,137,152,128,111,66,95,185,68,221,
+    97,92,9,11,233,254,202,148,205,82,202,27,113,202,211,57,
+    166,181,105,90,219,189,32,143,220,122,32,10,154,235,132,250,
+    223,0,205,168,204,162,123,98,234,228,72,36,156,205,101,165,
+    34,151,26,92,12,94,174,22,51,234,188,205,84,44,49,21,
+    201,82,158,169,21,152,218,180,116,145,220,43,135,14,57,247,
+    1,156,123,229,128,51,77,169,115,44,230,22,205,136,230,104,
+    140,67,63,150,40,59,122,10,19,164,152,223,130,145,200,200,
+    16,194,197,75,20,249,148,194,32,145,34,156,191,21,119,201,
+    92,247,229,169,217,169,52,83,241,89,228,136,235,6,176,133,
+    18,123,135,220,190,227,145,83,35,167,135,206,67,46,212,237,
+    171,64,92,130,87,183,3,208,53,172,1,73,145,228,218,13,
+    27,203,3,100,3,133,149,91,171,74,67,83,74,228,75,240,
+    141,141,114,186,86,69,186,22,41,221,195,56,93,52,253,161,
+    209,121,154,58,43,71,120,147,210,143,213,16,107,218,242,38,
+    21,54,233,113,144,243,160,121,32,238,239,236,12,60,30,57,
+    19,138,32,65,35,28,192,156,72,32,54,53,193,246,6,238,
+    22,4,78,133,70,163,108,31,26,101,26,161,141,173,184,215,
+    112,29,80,48,51,226,96,50,22,212,123,208,248,202,177,177,
+    168,149,18,7,85,82,238,66,185,104,33,46,202,198,43,140,
+    10,13,152,43,80,97,219,41,185,39,165,11,183,46,120,223,
+    173,70,63,232,226,153,109,2,179,45,205,108,91,6,212,156,
+    57,49,4,127,60,83,35,48,53,105,233,186,103,19,77,171,
+    154,8,117,253,173,144,65,11,158,32,148,77,85,48,25,193,
+    44,163,138,78,197,176,171,148,220,225,151,221,222,132,51,79,
+    135,55,32,80,58,55,129,74,217,177,98,186,83,15,69,136,
+    42,98,177,41,68,28,35,145,152,138,84,149,136,87,161,2,
+    179,61,168,231,114,124,54,158,102,252,56,131,3,193,66,220,
+    112,92,19,128,102,248,104,241,240,88,120,104,116,36,194,14,
+    69,209,55,66,39,71,217,140,19,207,39,99,44,154,129,195,
+    100,200,217,4,0,102,14,174,15,192,78,0,7,0,28,1,
+    48,32,83,59,158,31,240,164,19,148,0,208,99,244,143,112,
+    118,164,191,229,138,154,180,165,108,213,65,217,138,87,77,180,
+    181,112,149,66,224,35,51,122,124,233,43,36,192,38,162,234,
+    0,85,167,64,213,173,58,104,171,31,66,69,224,82,63,50,
+    185,191,73,146,51,89,107,87,41,4,100,20,4,160,143,148,
+    194,11,34,96,104,107,37,220,105,1,41,30,20,10,73,15,
+    118,84,63,33,50,241,42,26,157,146,218,244,227,126,74,61,
+    23,162,217,201,12,115,225,32,158,251,6,173,120,182,179,225,
+    217,174,0,235,84,25,172,83,181,227,217,204,129,103,51,167,
+    56,155,217,113,75,247,179,209,225,97,179,34,41,24,0,48,
+    47,252,55,52,166,106,212,249,135,178,36,102,10,83,231,112,
+    108,174,0,177,122,212,144,76,108,211,102,238,217,152,98,32,
+    65,108,160,138,24,195,244,57,76,198,92,209,52,202,176,63,
+    27,143,26,146,83,143,236,204,251,5,179,248,133,42,221,23,
+    44,217,119,194,116,142,111,187,99,206,236,183,195,22,245,183,
+    95,164,195,214,105,11,98,77,27,98,133,138,28,80,97,171,
+    90,232,228,76,71,81,220,105,75,216,106,156,10,96,118,82,
+    97,155,225,183,108,57,190,101,203,81,22,132,217,137,32,98,
+    151,149,57,47,128,129,86,59,204,190,72,231,207,119,84,93,
+    122,70,87,122,24,164,237,68,232,228,224,173,159,2,136,151,
+    196,198,199,17,35,29,153,10,32,209,114,114,140,141,196,162,
+    120,44,30,206,20,132,217,83,161,201,209,88,188,140,189,24,
+    227,66,129,201,200,185,200,248,133,72,128,8,161,129,120,57,
+    196,10,132,98,49,110,228,228,100,140,13,140,141,68,163,35,
+    145,211,193,130,140,125,2,70,125,152,148,145,232,12,183,25,
+    243,40,27,225,158,128,148,129,1,206,216,79,160,192,3,28,
+    55,142,184,240,51,161,40,124,35,104,197,163,23,247,101,0,
+    79,1,128,145,136,3,50,213,78,8,136,193,69,131,126,108,
+    104,72,28,94,129,190,59,164,176,55,225,133,102,26,15,175,
+    254,134,132,101,182,232,142,211,51,215,127,101,103,98,231,178,
+    191,54,209,63,123,244,142,211,189,74,21,216,183,200,92,66,
+    114,239,149,175,37,190,182,92,29,72,21,207,31,154,179,92,
+    179,207,217,87,138,75,231,78,92,245,95,243,39,67,175,212,
+    206,213,46,215,53,166,246,206,95,64,56,151,42,218,135,229,
+    117,233,64,55,95,222,35,148,247,164,61,61,119,156,197,115,
+    79,164,157,85,232,90,241,213,38,99,169,39,120,95,187,224,
+    107,79,187,196,107,185,162,54,121,126,190,8,229,226,200,178,
+    167,124,238,252,28,202,92,105,210,150,118,214,162,139,188,242,
+    20,239,235,20,124,157,105,151,120,45,87,213,167,130,66,85,
+    59,122,231,24,188,51,149,246,212,163,116,208,176,98,223,181,
+    82,82,149,174,222,177,120,16,1,116,241,37,59,133,146,157,
+    105,215,206,15,221,229,115,177,228,19,188,187,73,112,55,65,
+    196,45,56,98,55,95,210,35,148,244,164,93,61,72,154,176,
+    111,193,8,253,228,3,51,19,158,124,170,197,177,65,238,213,
+    67,120,121,71,148,153,149,18,115,74,57,182,40,40,244,172,
+    76,231,106,90,156,49,79,155,47,213,134,45,97,106,212,58,
+    99,81,81,181,229,108,129,225,251,42,74,159,49,199,138,21,
+    239,104,198,144,40,233,115,102,212,207,236,217,56,199,169,88,
+    153,162,119,88,99,62,101,78,213,95,56,235,146,238,222,132,
+    126,78,35,104,189,110,213,246,167,96,193,0,161,83,220,161,
+    32,41,220,171,238,210,45,119,171,90,2,227,88,67,16,64,
+    196,29,136,140,43,58,73,11,154,71,179,218,4,7,146,60,
+    177,22,1,228,203,211,108,12,83,127,198,49,214,211,65,222,
+    143,102,10,80,40,188,157,41,16,67,136,118,1,18,206,20,
+    237,149,62,75,186,146,5,186,26,158,165,197,206,148,177,192,
+    171,56,41,242,134,105,172,71,219,153,156,67,67,98,18,168,
+    63,149,41,251,147,28,252,251,80,171,239,82,184,75,57,221,
+    115,91,175,236,78,236,94,118,53,166,213,215,157,210,26,161,
+    180,245,118,105,251,82,105,251,194,137,119,159,229,75,119,8,
+    165,59,18,7,150,221,165,137,25,52,47,23,55,32,202,37,
+    215,135,21,117,41,211,13,199,66,255,187,3,124,69,159,80,
+    209,55,103,93,241,54,166,14,240,222,54,193,219,150,118,137,
+    151,216,95,151,189,21,137,99,31,22,85,47,187,14,189,106,
+    65,189,210,113,205,33,120,80,138,135,208,245,129,133,252,162,
+    235,35,179,201,237,248,25,133,0,154,166,237,14,61,223,47,
+    179,189,95,162,244,124,255,89,197,44,166,25,195,93,74,108,
+    150,234,143,195,91,230,236,83,208,52,144,177,177,23,97,212,
+    11,90,184,167,165,58,231,70,41,105,84,211,10,16,78,246,
+    98,104,108,98,20,15,148,202,170,87,4,255,7,120,37,136,
+    171,126,197,137,134,171,107,189,201,139,188,179,85,112,182,174,
+    82,102,123,195,178,215,119,173,87,240,54,165,93,77,119,208,
+    237,174,180,171,62,79,185,15,127,70,229,14,155,48,187,207,
+    61,130,158,14,6,205,138,178,62,98,84,204,226,145,232,254,
+    177,240,49,196,40,30,23,249,68,81,112,193,133,213,33,5,
+    120,189,69,89,228,116,221,38,222,185,89,112,110,134,50,251,
+    197,50,195,216,120,199,91,49,215,163,31,194,228,2,247,210,
+    122,254,57,166,136,153,45,148,166,232,190,105,58,215,160,166,
+    211,97,209,168,66,104,229,96,117,158,230,138,149,83,177,150,
+    103,231,76,240,142,58,87,232,125,105,237,93,155,23,18,59,
+    223,247,202,99,110,101,14,21,95,50,72,119,154,74,217,40,
+    131,127,122,201,2,17,52,110,213,32,147,113,140,160,153,61,
+    26,11,129,170,22,202,153,177,239,67,34,207,163,88,43,94,
+    132,184,255,33,44,235,13,97,182,1,205,206,225,145,97,52,
+    19,103,10,71,162,3,147,163,163,143,142,35,217,130,229,8,
+    133,224,209,235,24,165,17,109,11,144,196,124,158,229,98,241,
+    226,44,97,136,65,25,136,251,93,138,144,67,217,28,123,253,
+    241,249,33,222,185,65,112,110,128,110,238,95,118,21,223,118,
+    5,150,92,129,84,41,239,90,39,184,214,165,93,235,240,128,
+    177,236,44,73,54,205,111,72,59,91,208,245,131,135,111,53,
+    243,237,123,132,246,61,232,1,141,69,165,254,196,49,252,181,
+    228,137,249,65,169,63,209,64,91,21,128,168,72,150,241,206,
+    58,193,89,135,3,127,210,212,189,120,226,189,65,190,105,143,
+    208,180,39,27,13,9,111,47,199,175,196,147,205,188,59,32,
+    184,3,105,38,144,135,18,211,212,125,82,162,91,173,71,213,
+    182,81,204,158,27,203,21,196,28,89,236,218,91,62,85,176,
+    150,88,146,106,137,225,158,131,180,160,164,28,7,160,7,192,
+    36,5,179,207,192,227,199,142,145,102,199,130,158,182,217,113,
+    104,188,60,219,228,74,97,244,127,80,162,182,212,160,221,105,
+    123,237,138,183,124,110,242,106,47,26,28,92,53,154,6,171,
+    88,241,250,18,15,105,154,231,182,123,195,146,123,195,2,203,
+    187,187,5,119,119,154,233,206,35,118,63,74,101,213,34,186,
+    238,174,80,147,228,80,145,27,234,225,64,165,93,210,56,18,
+    25,30,157,12,179,129,29,195,209,88,24,177,215,187,144,204,
+    142,235,7,100,101,81,126,199,58,17,85,53,117,106,170,73,
+    169,62,252,91,136,220,137,171,105,153,40,61,234,121,166,65,
+    96,26,210,76,3,10,152,117,220,102,234,150,152,186,148,133,
+    103,154,5,166,57,45,93,121,138,223,75,17,85,199,253,21,
+    148,168,240,196,98,97,233,255,121,109,121,32,52,238,87,52,
+    187,90,209,8,43,79,209,90,169,72,80,130,134,37,166,33,
+    213,205,51,173,2,211,154,150,174,60,37,168,206,211,128,82,
+    99,180,54,61,255,60,168,23,59,176,128,130,235,20,110,102,
+    102,2,18,2,84,229,51,51,125,68,63,161,45,68,134,129,
+    55,32,191,74,33,68,10,251,59,136,237,87,182,74,86,1,
+    69,46,81,169,226,210,40,85,56,88,36,224,160,230,185,49,
+    0,227,0,206,83,82,15,202,170,84,94,160,244,154,147,227,
+    18,128,213,157,232,155,148,82,115,178,106,170,177,34,150,95,
+    6,187,138,173,136,79,146,193,58,139,181,97,149,146,65,145,
+    5,212,34,50,112,185,172,245,171,148,12,170,173,214,158,85,
+    74,6,69,38,235,58,208,140,136,128,161,173,65,80,122,136,
+    192,70,91,183,195,157,22,144,124,67,110,141,181,32,237,212,
+    167,209,130,160,54,45,200,120,158,64,12,242,56,167,88,251,
+    82,206,225,12,149,147,253,67,243,55,48,249,166,152,34,190,
+    78,40,144,41,13,197,52,27,136,3,150,129,184,119,96,60,
+    6,139,84,227,23,216,112,32,54,30,64,51,99,32,110,13,
+    140,71,2,45,28,40,88,16,175,116,10,74,125,26,64,35,
+    9,192,93,254,12,0,188,208,169,92,72,4,222,60,42,243,
+    230,213,218,210,117,40,176,80,111,209,205,184,197,87,128,83,
+    222,159,66,60,225,126,116,253,224,196,98,211,205,193,119,7,
+    133,13,123,72,0,186,238,201,41,155,164,170,170,164,200,90,
+    233,75,168,58,250,53,203,39,184,27,233,24,77,88,177,253,
+    120,11,126,237,52,122,233,153,242,25,84,183,41,202,232,159,
+    250,115,87,77,179,190,227,132,164,131,52,86,22,222,52,101,
+    76,29,27,51,244,121,101,191,187,235,216,49,58,18,141,193,
+    202,222,174,120,151,174,74,148,154,247,142,29,163,227,195,161,
+    209,232,174,142,236,43,54,168,167,6,92,79,105,119,39,185,
+    82,143,205,209,175,21,189,82,196,123,2,130,39,32,7,19,
+    2,197,93,76,195,209,226,220,197,107,242,38,110,133,132,202,
+    41,162,229,133,207,45,52,33,192,187,59,5,244,196,116,230,
+    225,210,247,136,117,110,92,105,208,5,244,109,161,99,221,204,
+    3,119,233,192,231,210,56,55,105,162,206,253,38,165,25,213,
+    47,67,165,180,235,42,69,92,157,49,106,12,59,212,81,128,
+    52,70,197,102,114,45,20,39,139,223,242,191,225,127,189,106,
+    190,74,14,196,181,5,235,65,103,17,43,169,107,13,200,78,
+    188,34,87,194,12,36,210,40,54,68,201,203,23,175,92,20,
+    19,10,35,192,87,108,22,16,84,243,4,191,68,61,1,149,
+    153,65,98,56,46,80,142,26,223,160,43,184,244,130,81,149,
+    187,20,85,238,94,79,174,84,49,162,127,199,43,142,171,174,
+    107,46,57,48,15,245,127,7,146,245,231,76,214,169,164,124,
+    252,253,48,2,188,123,189,128,158,152,245,121,152,228,247,17,
+    248,22,157,127,69,78,214,70,245,169,7,107,165,182,88,105,
+    84,144,149,208,53,140,117,149,250,157,148,210,76,66,254,119,
+    89,199,244,38,232,83,52,154,128,24,67,42,176,40,180,171,
+    42,122,0,157,11,166,7,224,173,192,238,2,83,132,47,55,
+    69,92,214,40,127,17,77,84,100,59,32,172,157,160,169,227,
+    91,144,86,2,0,72,246,226,212,113,41,111,111,20,215,160,
+    140,72,163,84,234,40,159,32,218,240,110,34,215,2,61,183,
+    247,181,35,175,28,73,134,175,62,114,237,17,57,88,52,53,
+    224,6,33,41,13,255,143,23,118,176,201,17,166,213,175,146,
+    252,64,168,65,39,21,243,83,4,105,127,153,164,189,226,44,
+    74,196,46,111,159,221,158,164,175,236,74,236,186,126,118,161,
+    116,33,244,174,239,71,205,239,117,242,181,251,132,218,125,137,
+    93,32,193,85,36,233,107,91,95,219,253,202,110,196,24,122,
+    91,5,111,107,218,213,122,71,202,31,228,252,4,2,188,119,
+    147,128,158,92,155,68,118,139,209,178,91,223,160,164,149,41,
+    60,168,125,71,46,128,134,181,250,186,4,126,1,5,131,185,
+    92,201,90,153,129,141,146,129,131,182,110,4,22,71,4,136,
+    1,234,129,59,17,160,199,118,184,19,129,205,102,221,188,74,
+    233,1,73,27,82,84,177,71,18,53,127,12,186,244,111,221,
+    215,50,17,54,26,98,94,98,6,29,35,84,216,30,182,159,
+    50,135,29,47,209,131,78,108,66,228,194,203,70,110,217,196,
+    137,52,152,110,108,115,74,180,172,237,174,184,123,208,70,221,
+    195,64,187,160,250,108,129,212,69,2,202,46,226,152,161,49,
+    27,79,141,160,46,1,54,89,168,35,56,143,3,135,208,46,
+    181,146,170,35,184,115,116,4,77,129,16,235,132,200,127,116,
+    104,200,168,35,84,2,49,54,139,29,161,174,151,92,139,116,
+    10,254,156,232,239,32,64,25,65,186,2,205,37,225,71,148,
+    224,220,26,234,7,157,8,73,47,94,145,43,39,126,72,117,
+    157,216,5,220,181,242,247,33,237,19,8,240,117,189,2,130,
+    238,62,193,221,151,102,250,242,105,189,40,34,191,245,195,8,
+    99,154,54,165,40,163,127,122,233,109,182,66,97,48,146,113,
+    13,143,178,33,14,20,59,108,36,38,242,169,25,199,248,104,
+    88,12,194,245,173,182,123,187,14,85,93,173,45,160,242,59,
+    176,166,16,221,136,123,207,114,113,25,8,235,45,24,36,246,
+    46,187,10,95,30,184,50,144,236,149,181,56,232,130,117,10,
+    18,129,20,87,201,206,219,165,226,198,244,74,190,92,115,70,
+    173,102,204,207,33,214,78,155,180,166,181,80,49,202,117,75,
+    165,82,38,171,248,83,133,202,177,243,229,76,253,100,252,126,
+    88,179,190,17,119,106,223,211,174,174,168,215,9,213,88,68,
+    20,245,79,155,192,100,111,198,58,109,205,85,3,97,11,24,
+    249,77,91,78,153,227,54,237,204,137,8,165,1,11,209,86,
+    229,90,34,104,154,226,182,230,104,243,198,182,112,176,0,79,
+    12,25,135,168,25,68,13,159,49,143,32,96,25,11,197,206,
+    100,44,195,236,200,104,198,60,58,126,58,99,103,35,147,99,
+    44,23,138,177,65,27,161,48,155,72,93,32,255,103,172,23,
+    70,194,232,5,122,132,16,155,108,108,39,210,219,219,144,102,
+    165,150,222,178,137,6,128,218,126,72,17,21,146,106,82,89,
+    118,121,230,138,103,15,221,118,213,46,185,106,147,231,83,49,
+    222,213,46,184,178,235,116,31,150,250,174,91,230,237,239,52,
+    221,104,253,193,230,133,216,205,237,239,110,231,27,122,132,134,
+    158,63,176,188,207,124,80,242,207,92,239,187,248,134,126,190,
+    226,128,80,113,128,47,61,40,148,30,76,28,88,169,168,79,
+    53,189,238,158,119,35,130,45,220,71,19,120,213,50,71,207,
+    117,45,123,138,95,115,189,226,74,62,145,250,242,98,233,226,
+    228,173,80,122,227,30,190,121,15,239,217,43,120,246,166,241,
+    133,72,93,126,41,143,112,0,118,30,90,217,117,77,2,129,
+    102,180,149,25,146,19,148,204,160,54,207,208,249,76,77,22,
+    139,17,179,98,72,47,58,246,117,157,36,200,153,136,34,208,
+    113,38,20,149,70,18,19,30,173,51,52,171,103,101,59,180,
+    77,153,125,205,104,156,14,66,243,110,192,205,155,246,30,33,
+    87,234,185,63,40,252,32,196,111,59,44,108,59,140,30,17,
+    243,114,236,149,99,87,7,174,13,200,49,196,241,58,99,14,
+    69,166,116,172,237,187,134,20,149,205,70,43,36,89,71,137,
+    22,50,228,131,11,253,8,240,222,35,2,130,238,163,130,251,
+    104,154,57,250,249,139,119,220,175,106,83,48,75,77,90,157,
+    109,82,59,112,152,89,61,30,106,26,71,86,178,176,98,51,
+    209,92,130,156,182,18,16,123,143,227,27,181,196,6,168,150,
+    74,210,18,21,157,228,74,61,150,44,158,247,201,143,132,159,
+    249,53,202,96,125,136,145,62,173,159,28,37,76,187,129,16,
+    7,95,69,66,117,69,39,95,209,41,32,232,222,40,184,55,
+    166,153,141,198,6,127,240,50,94,0,123,8,13,96,226,236,
+    88,189,86,137,236,0,154,0,158,55,63,65,189,102,250,166,
+    5,13,127,53,202,121,210,9,139,30,108,36,28,138,196,162,
+    210,252,159,208,86,233,143,160,74,171,180,165,83,188,185,25,
+    10,184,15,197,250,31,232,79,63,57,250,42,94,155,121,101,
+    230,234,11,215,94,72,75,115,163,230,210,78,149,218,206,142,
+    105,239,164,72,25,168,220,80,254,32,226,14,114,148,31,113,
+    13,107,232,234,58,14,162,13,86,152,72,205,152,50,182,208,
+    196,4,42,94,166,4,90,81,212,141,160,158,4,139,67,18,
+    63,65,135,12,216,136,91,80,89,13,70,164,160,254,200,86,
+    168,179,29,132,40,92,69,9,90,172,52,188,62,176,129,112,
+    20,135,175,28,158,123,236,118,89,112,169,44,200,151,173,23,
+    202,214,43,199,249,101,183,39,193,232,25,11,185,182,58,104,
+    194,136,130,205,123,150,105,152,49,231,226,168,212,117,195,181,
+    42,5,212,48,98,42,82,38,253,59,218,183,176,125,165,57,
+    108,142,27,212,46,250,130,241,154,164,217,88,120,85,127,121,
+    218,156,101,41,180,19,186,146,97,208,236,2,200,177,22,100,
+    204,34,129,14,212,33,55,92,32,94,38,219,240,131,29,68,
+    40,64,6,209,120,103,32,118,38,20,11,140,68,3,39,217,
+    145,200,233,192,248,121,150,187,192,141,196,98,108,4,140,248,
+    67,1,77,219,35,177,13,6,102,14,6,54,238,159,82,226,
+    204,159,113,156,150,103,122,238,119,33,20,26,73,212,153,142,
+    196,216,177,161,33,201,12,194,124,142,157,194,234,213,140,249,
+    60,202,17,54,115,151,204,32,68,49,1,116,15,250,30,170,
+    248,214,62,160,182,215,40,204,159,47,23,149,204,109,158,29,
+    1,91,125,207,109,103,213,146,179,138,119,214,8,206,154,85,
+    202,98,47,90,113,121,150,61,253,201,199,223,122,246,141,103,
+    249,154,13,66,205,134,180,167,159,92,203,37,251,63,50,211,
+    197,253,180,222,146,223,94,36,90,84,123,223,170,125,163,150,
+    247,7,5,127,112,97,51,98,59,152,30,129,233,73,51,61,
+    43,76,225,229,130,217,130,219,76,213,18,83,149,220,159,42,
+    227,153,22,129,105,73,75,23,25,96,65,48,83,237,248,144,
+    181,222,80,131,90,54,89,183,228,95,170,162,89,36,59,96,
+    93,183,89,75,137,145,206,176,101,198,130,199,144,54,204,70,
+    26,82,54,80,9,152,220,1,11,25,199,20,8,70,115,210,
+    147,122,15,216,12,24,201,21,64,248,140,101,118,61,140,34,
+    65,102,32,227,34,235,202,7,128,73,12,199,155,247,79,33,
+    89,34,16,102,99,168,113,216,112,64,226,29,129,132,200,174,
+    167,0,162,170,184,105,119,61,102,73,227,230,230,112,71,220,
+    250,149,230,240,51,29,152,81,21,45,21,96,55,23,48,163,
+    110,153,247,36,123,63,36,14,212,113,106,52,116,154,140,48,
+    72,8,146,77,92,99,92,198,17,26,30,102,163,81,124,79,
+    95,204,88,16,45,69,117,76,41,24,172,198,235,180,132,164,
+    73,235,17,32,38,176,87,22,109,28,146,181,210,34,180,203,
+    94,185,226,42,78,151,28,189,213,142,0,185,120,215,67,130,
+    235,161,52,190,238,120,138,209,208,86,81,189,74,49,133,149,
+    24,204,89,86,109,84,109,195,237,154,174,165,154,174,229,210,
+    218,229,210,64,170,103,161,235,237,237,124,105,59,122,76,249,
+    208,125,21,186,255,168,192,82,91,242,51,10,129,57,199,170,
+    131,42,43,79,210,87,15,32,238,148,190,227,246,75,86,190,
+    58,35,95,14,86,145,176,96,135,251,28,233,135,184,11,194,
+    148,134,135,106,220,117,112,177,57,16,95,57,48,221,80,110,
+    34,73,74,192,7,133,254,23,148,122,19,137,133,182,238,0,
+    77,136,8,108,38,107,11,44,35,137,128,177,89,129,41,86,
+    64,15,109,125,8,216,228,44,100,104,107,23,220,138,160,72,
+    243,5,139,181,24,22,177,68,80,206,88,91,97,67,138,14,
+    84,82,109,237,183,26,254,77,201,42,229,6,155,221,123,2,
+    210,221,160,88,198,27,90,96,46,215,235,103,176,238,197,244,
+    18,115,111,29,205,69,122,16,76,120,153,140,91,161,51,195,
+    134,188,202,190,38,207,85,208,67,191,149,215,194,64,169,20,
+    61,101,210,90,25,72,59,201,166,105,45,239,57,99,138,76,
+    105,190,170,176,34,208,124,231,176,84,64,196,87,24,206,73,
+    90,97,54,71,44,141,233,110,202,106,24,203,170,21,109,117,
+    57,175,142,185,178,241,141,231,178,203,32,232,168,74,113,154,
+    158,49,169,12,12,53,186,88,206,29,243,230,198,170,13,13,
+    245,216,160,77,45,137,65,101,98,182,253,32,165,208,123,213,
+    32,89,76,17,201,152,25,187,108,210,102,29,49,248,181,199,
+    229,205,9,120,61,24,22,143,111,42,85,100,48,200,25,168,
+    200,214,107,232,76,178,191,49,226,247,79,163,236,124,12,86,
+    105,160,33,243,237,35,215,226,115,215,237,183,43,130,75,21,
+    193,133,166,69,154,175,216,36,84,108,146,145,122,166,244,243,
+    42,55,247,39,0,254,195,131,23,18,108,223,62,222,78,10,
+    137,102,233,138,162,44,184,83,90,246,115,51,85,92,121,219,
+    83,191,228,65,82,255,2,205,123,218,4,79,219,170,89,21,
+    13,23,250,46,253,149,187,244,51,119,233,246,160,19,107,202,
+    51,22,72,33,99,141,77,78,140,178,216,88,38,99,69,19,
+    202,200,4,250,153,24,29,137,101,91,141,108,129,197,195,231,
+    215,73,35,98,225,2,243,49,76,108,108,98,8,62,132,11,
+    249,85,105,242,129,215,226,190,28,133,12,195,248,251,231,148,
+    168,100,7,147,154,240,59,7,146,207,240,206,245,130,115,253,
+    42,229,180,111,187,35,53,23,186,110,29,64,128,247,237,19,
+    124,251,18,135,19,135,87,10,125,73,235,245,40,95,216,40,
+    20,54,162,33,211,190,109,213,162,42,44,169,24,127,237,91,
+    85,111,84,165,142,19,6,230,182,191,115,201,223,185,104,230,
+    253,221,130,191,251,182,191,119,201,223,123,107,51,239,223,45,
+    248,119,175,90,81,252,143,224,165,159,1,128,52,126,238,162,
+    252,13,50,9,89,249,138,45,66,197,150,180,111,107,226,240,
+    135,206,90,165,221,99,199,138,183,33,181,141,247,182,11,94,
+    172,173,241,54,166,14,243,222,13,130,119,67,218,181,33,207,
+    34,94,152,186,191,93,175,154,113,5,118,75,209,192,171,132,
+    77,152,175,33,247,152,103,7,125,43,89,8,226,161,61,254,
+    19,180,135,173,61,208,209,209,241,12,18,14,129,65,197,118,
+    29,65,139,40,255,68,51,204,25,118,116,2,88,10,194,150,
+    90,48,205,74,68,11,113,227,85,218,246,84,154,141,66,155,
+    118,139,109,234,42,190,124,8,148,90,117,75,174,58,222,85,
+    47,184,234,145,80,228,45,79,22,95,221,154,60,126,117,103,
+    170,139,247,54,165,46,242,222,206,4,179,236,246,37,220,122,
+    29,178,60,159,88,62,207,249,228,248,154,231,147,134,79,59,
+    159,24,206,1,10,43,56,99,11,56,227,57,64,108,201,47,
+    116,180,198,86,62,57,6,175,141,90,58,80,154,203,25,141,
+    96,47,210,162,241,48,30,166,15,145,235,214,94,24,166,59,
+    150,42,58,22,98,139,143,241,21,91,133,138,173,50,242,11,
+    28,166,255,226,179,44,233,75,80,210,45,148,56,86,155,96,
+    52,146,192,114,119,207,171,246,219,158,117,75,158,117,169,216,
+    194,99,188,167,83,240,116,174,154,85,113,8,51,7,157,53,
+    88,64,150,51,193,8,153,251,9,0,108,206,120,155,146,204,
+    171,112,3,45,75,217,254,170,202,146,177,58,95,182,47,209,
+    162,77,150,241,232,91,96,223,185,44,181,2,186,62,40,67,
+    128,247,29,18,124,135,12,70,95,171,125,231,170,73,85,2,
+    82,212,237,187,254,121,213,239,87,125,112,156,223,126,68,216,
+    126,4,23,242,35,64,252,12,0,30,97,25,60,194,138,173,
+    255,56,49,190,79,251,118,36,14,223,185,199,128,112,246,31,
+    25,204,47,140,193,252,226,152,196,188,204,82,187,150,156,243,
+    45,154,206,161,196,185,63,165,196,69,243,127,96,153,255,14,
+    100,62,45,101,158,76,221,75,148,52,36,216,13,135,132,255,
+    76,169,198,5,204,176,97,43,1,253,224,0,189,94,101,251,
+    160,202,208,183,97,96,248,128,250,7,201,150,185,235,82,12,
+    239,14,10,238,96,154,9,126,193,22,213,55,77,3,119,139,
+    179,22,213,231,113,245,238,194,110,0,244,38,199,216,132,90,
+    55,62,43,13,169,175,211,90,67,234,0,207,212,11,76,125,
+    154,169,191,79,67,234,207,163,212,220,135,80,156,25,195,66,
+    98,187,234,58,221,36,164,182,174,126,251,222,229,252,60,204,
+    173,183,70,99,225,222,94,210,72,59,2,57,109,175,119,173,
+    205,250,26,155,63,235,187,148,100,126,253,14,173,53,191,62,
+    200,51,135,4,230,80,90,186,136,182,203,169,213,118,225,94,
+    140,13,175,241,60,255,166,68,58,10,155,107,67,29,215,191,
+    149,64,8,82,126,157,82,235,184,108,197,214,14,48,179,22,
+    65,187,217,90,1,150,66,58,224,114,192,157,12,42,139,172,
+    109,171,148,12,2,26,51,107,19,88,88,203,128,161,173,135,
+    177,70,236,94,144,12,113,144,87,99,197,85,3,165,178,187,
+    182,162,201,150,30,52,99,117,149,5,171,171,172,216,67,150,
+    45,227,194,245,126,48,4,77,48,53,160,90,66,145,5,46,
+    242,49,237,254,114,229,158,242,236,82,154,41,227,201,238,34,
+    34,142,105,240,182,57,201,70,250,111,0,64,128,122,181,8,
+    12,230,197,205,115,98,94,228,173,192,223,135,198,40,35,100,
+    16,216,152,176,8,76,141,184,37,56,129,254,242,88,208,144,
+    69,113,101,23,229,10,149,79,97,58,43,247,161,105,76,101,
+    136,168,112,36,165,153,186,200,144,69,119,160,2,225,237,128,
+    127,37,149,74,218,248,113,70,75,229,103,49,149,107,202,38,
+    111,203,252,39,116,214,152,198,233,158,221,5,235,94,157,176,
+    59,110,87,106,63,239,109,89,104,226,189,29,137,254,21,119,
+    85,178,95,168,238,90,236,230,221,219,4,183,188,247,64,183,
+    66,136,29,2,76,83,196,19,201,140,217,78,41,167,103,229,
+    86,64,229,90,88,196,211,168,98,252,154,40,206,76,83,79,
+    81,17,203,5,234,162,249,41,234,2,152,111,41,140,48,149,
+    223,153,54,159,70,211,251,119,233,47,129,195,45,147,232,112,
+    11,147,130,133,171,146,26,59,195,60,196,78,225,237,173,184,
+    170,68,193,57,187,55,28,239,51,145,164,102,229,124,171,37,
+    9,50,217,190,7,117,198,146,58,243,148,38,172,171,38,171,
+    189,120,165,180,38,25,158,143,8,165,27,18,7,18,7,62,
+    89,113,251,64,201,80,172,0,54,170,176,56,209,191,90,128,
+    238,63,249,228,147,85,134,242,52,39,98,130,187,41,117,226,
+    198,179,139,143,167,221,199,110,157,64,128,92,31,60,33,222,
+    50,199,162,192,28,190,84,226,163,94,115,52,153,127,147,110,
+    50,147,226,217,114,111,250,192,35,142,198,246,240,175,36,112,
+    19,50,255,16,165,182,61,52,89,27,97,4,80,2,198,12,
+    123,44,100,224,98,172,15,211,160,229,54,130,36,29,248,186,
+    241,112,48,64,105,29,51,133,77,131,22,214,154,219,13,19,
+    194,89,117,56,6,107,183,237,225,2,172,211,182,29,143,33,
+    145,232,116,220,137,39,133,40,126,56,113,255,115,139,130,11,
+    32,223,218,149,99,214,192,92,128,151,36,174,154,252,255,51,
+    232,250,200,132,113,71,59,41,146,43,143,107,24,7,69,6,
+    185,25,74,94,253,38,233,235,246,187,97,194,116,139,233,75,
+    36,153,129,86,117,17,146,116,151,38,44,0,92,122,167,61,
+    178,235,182,126,185,70,166,205,111,226,133,101,188,104,108,209,
+    214,142,236,176,199,156,195,97,143,101,224,174,57,176,51,112,
+    151,238,187,107,11,196,184,73,150,76,182,55,173,217,109,104,
+    28,44,99,112,251,1,64,178,154,189,227,216,145,75,188,84,
+    81,159,178,47,158,63,135,66,237,206,86,232,28,170,210,58,
+    116,37,189,228,23,93,60,19,16,24,216,54,41,121,228,121,
+    22,254,120,166,90,96,170,211,210,165,31,170,228,106,55,242,
+    200,99,108,171,46,213,184,100,161,254,95,129,221,63,74,137,
+    157,108,32,232,208,122,182,97,36,142,132,108,104,126,84,162,
+    29,210,61,15,72,31,214,118,212,159,73,96,9,74,255,28,
+    165,242,92,227,174,190,116,120,185,162,58,109,41,187,99,245,
+    128,95,153,6,152,143,27,20,142,102,26,96,245,171,12,186,
+    176,8,24,209,239,76,13,60,214,40,252,206,212,192,116,175,
+    244,59,35,3,146,27,200,131,113,119,126,143,82,118,103,214,
+    12,203,82,154,174,138,253,174,13,226,14,174,246,172,70,186,
+    48,107,31,116,224,69,42,39,246,55,227,194,254,102,10,193,
+    87,247,96,81,216,137,160,59,236,66,208,3,254,185,7,139,
+    195,69,8,150,128,71,238,65,111,216,131,96,41,120,223,30,
+    44,99,203,195,37,186,148,125,40,212,171,11,173,8,151,34,
+    98,45,203,20,15,192,18,234,200,176,98,123,151,161,129,213,
+    46,74,191,208,173,212,83,104,52,10,5,202,41,59,66,203,
+    244,132,102,105,44,246,1,193,97,157,123,144,38,182,42,10,
+    203,37,219,100,228,2,23,154,136,87,232,178,214,65,48,127,
+    77,203,91,25,63,172,108,74,61,246,147,214,237,124,101,175,
+    80,217,155,118,239,77,60,55,123,33,113,225,3,58,205,236,
+    205,227,163,172,205,160,52,217,41,212,216,127,154,137,72,168,
+    144,105,157,177,85,193,16,168,141,135,134,226,126,125,158,69,
+    212,223,194,96,232,161,100,71,106,215,122,47,191,48,251,66,
+    126,231,110,247,149,205,140,245,212,232,120,40,102,156,81,251,
+    208,16,198,162,172,86,25,101,85,68,254,223,144,217,18,49,
+    179,165,115,39,174,13,106,182,99,127,134,181,250,221,124,181,
+    58,18,137,229,170,85,140,250,57,208,17,108,63,187,231,144,
+    22,206,59,164,101,108,67,195,103,216,225,115,70,68,71,48,
+    255,15,16,157,232,96,140,41,74,216,242,104,245,22,168,188,
+    30,5,181,150,197,166,105,211,69,58,91,79,74,198,47,135,
+    105,146,102,206,142,151,64,78,20,30,165,76,107,49,93,2,
+    211,39,169,21,172,120,153,132,180,2,238,154,38,0,30,90,
+    94,31,203,88,199,99,103,88,46,99,139,176,23,198,79,158,
+    85,111,168,68,237,52,54,57,154,171,157,48,234,239,105,113,
+    142,197,86,120,175,213,190,82,139,68,254,226,102,161,184,57,
+    97,131,234,116,205,186,126,82,17,188,93,177,113,169,98,227,
+    98,25,209,159,243,204,86,8,71,232,151,11,175,20,94,118,
+    207,186,19,238,101,119,89,162,240,151,169,234,43,30,176,234,
+    185,18,168,105,47,109,176,73,21,152,135,240,200,121,84,175,
+    53,70,245,42,163,45,168,38,56,159,220,7,126,57,234,197,
+    253,57,213,139,11,143,81,227,28,169,152,218,28,99,152,136,
+    119,160,186,136,222,131,234,252,109,183,253,93,75,254,174,197,
+    102,222,191,77,240,111,227,153,109,191,252,84,87,248,57,213,
+    46,234,201,161,112,56,87,79,198,40,207,47,35,181,249,62,
+    191,250,136,78,158,204,57,175,3,170,124,13,245,241,53,177,
+    62,46,42,172,198,149,204,83,46,75,63,195,86,207,226,115,
+    212,142,174,148,242,100,107,49,28,225,69,61,9,222,169,168,
+    242,197,128,230,88,66,13,149,134,243,47,198,85,163,55,62,
+    38,91,228,65,226,112,204,58,126,82,222,114,187,188,99,169,
+    188,99,97,146,184,112,227,153,30,8,71,232,151,157,87,156,
+    151,11,103,11,19,133,57,124,116,126,214,53,230,123,192,26,
+    227,234,161,150,26,140,106,134,208,133,113,205,96,92,61,16,
+    70,211,23,66,24,37,159,95,49,201,196,110,92,76,140,91,
+    247,197,21,179,226,243,41,38,154,82,70,178,115,173,225,148,
+    146,197,175,255,226,138,235,254,124,138,91,136,138,163,152,66,
+    235,12,203,155,141,176,209,36,251,192,144,58,184,175,245,182,
+    175,115,201,215,185,104,229,125,91,4,223,22,158,217,178,214,
+    14,46,203,147,135,41,173,50,248,211,215,208,57,12,179,146,
+    165,102,112,211,149,220,54,52,52,10,226,132,17,143,143,49,
+    61,166,172,143,28,183,119,54,254,147,234,13,183,171,187,151,
+    170,187,23,31,231,171,251,132,234,190,37,197,46,81,67,89,
+    195,163,43,150,236,126,219,80,198,33,78,47,12,104,78,233,
+    245,98,155,73,212,135,137,217,146,236,138,31,192,237,53,118,
+    25,28,111,48,72,87,227,240,186,15,210,182,227,180,193,158,
+    190,80,114,165,174,84,162,201,214,240,29,148,172,68,179,100,
+    149,104,88,161,102,190,110,203,161,46,139,59,3,177,241,161,
+    200,228,216,73,150,107,189,107,106,15,220,53,5,197,5,170,
+    191,167,114,104,199,12,136,86,165,40,235,135,134,236,162,178,
+    138,50,115,186,176,19,93,41,233,55,70,126,209,197,51,27,
+    5,6,118,56,145,75,84,94,249,181,202,43,87,52,22,138,
+    141,12,139,78,152,49,125,129,51,18,206,1,160,72,154,75,
+    185,114,154,140,155,28,30,27,57,216,126,204,85,1,168,1,
+    80,7,160,17,192,58,0,176,239,141,107,3,0,59,177,56,
+    216,25,67,118,205,63,42,181,16,209,138,105,20,98,152,194,
+    1,252,21,16,248,51,180,74,33,102,197,238,150,241,158,71,
+    4,65,187,85,242,210,211,98,144,77,114,224,76,0,122,172,
+    135,59,17,104,176,12,109,133,61,151,18,176,89,172,229,96,
+    236,45,2,23,229,241,93,58,188,106,209,132,126,170,71,51,
+    104,215,100,224,120,144,71,141,185,187,218,85,52,113,94,109,
+    6,31,212,102,133,15,106,8,240,136,238,169,137,149,187,66,
+    107,168,176,125,39,53,15,245,109,172,252,91,219,241,33,251,
+    65,135,192,134,143,68,98,224,164,87,181,153,68,158,55,126,
+    157,190,207,227,67,200,225,33,170,173,31,180,210,199,172,73,
+    187,211,26,118,108,107,52,118,30,13,222,172,241,131,60,173,
+    193,91,238,241,190,214,143,178,71,185,15,27,252,191,106,183,
+    58,41,157,61,114,85,225,130,105,106,40,187,91,155,81,58,
+    96,140,163,1,39,108,143,59,176,215,103,249,171,80,70,117,
+    60,18,7,98,59,169,220,95,203,198,202,241,77,24,166,28,
+    3,25,71,182,9,51,230,177,145,8,2,161,139,25,75,116,
+    36,206,102,152,201,72,116,228,116,132,13,199,159,204,198,10,
+    32,54,16,47,184,6,154,163,129,177,201,104,44,16,102,79,
+    141,68,216,0,59,2,186,20,7,140,105,45,232,67,45,129,
+    80,36,140,238,66,23,91,2,227,92,160,5,190,40,134,73,
+    159,109,113,224,205,55,28,156,162,69,118,221,48,196,236,21,
+    175,113,137,251,111,66,145,145,97,110,15,12,14,59,1,236,
+    6,176,139,198,30,69,234,33,26,16,42,7,219,108,51,22,
+    216,134,99,184,97,11,175,251,250,212,196,42,175,252,62,4,
+    163,42,104,193,193,166,70,218,56,69,14,172,72,78,166,194,
+    60,179,94,96,192,25,205,170,131,114,121,230,118,44,57,235,
+    210,206,186,101,87,73,226,224,135,30,95,210,156,124,156,247,
+    52,10,158,70,216,142,211,253,131,130,69,51,154,85,91,251,
+    132,214,62,28,176,82,10,251,175,202,249,210,86,161,180,117,
+    149,178,22,150,252,224,201,197,227,183,218,248,13,7,132,13,
+    7,112,192,138,167,12,245,205,178,3,244,157,210,138,143,10,
+    44,197,176,239,166,184,100,21,3,7,229,241,206,78,67,180,
+    238,229,202,170,57,243,181,2,244,147,60,62,255,229,215,215,
+    47,208,175,119,66,192,28,250,187,83,93,147,106,188,209,186,
+    240,216,219,237,124,117,103,186,114,35,142,89,85,157,242,222,
+    168,88,216,251,118,53,95,213,177,88,207,87,110,150,226,175,
+    250,81,214,112,254,136,183,36,171,225,34,163,161,245,2,184,
+    73,197,224,40,84,155,238,152,151,50,43,250,238,218,0,25,
+    129,122,115,142,64,96,1,166,93,77,52,246,88,194,50,70,
+    199,184,224,133,7,71,152,1,79,230,220,14,148,204,9,157,
+    165,25,30,159,174,80,90,230,70,169,223,29,54,93,52,157,
+    195,79,156,83,169,253,39,97,209,117,17,154,86,249,98,80,
+    31,142,161,90,194,86,188,45,250,74,80,177,14,162,215,117,
+    112,55,136,72,148,61,205,114,226,169,24,227,147,177,192,248,
+    169,192,201,241,201,72,24,245,186,112,96,135,4,130,22,210,
+    41,48,15,6,157,130,251,10,101,192,141,193,28,30,47,206,
+    146,191,168,251,133,236,68,97,73,156,48,96,23,147,221,243,
+    189,105,119,23,186,150,48,92,40,125,183,130,220,145,107,165,
+    164,106,217,211,11,70,3,219,192,21,42,160,211,37,155,96,
+    147,226,230,143,204,102,47,24,129,121,197,61,138,102,202,179,
+    9,189,161,231,231,228,90,127,148,206,239,228,84,51,14,7,
+    62,189,250,68,233,59,63,242,180,38,37,133,153,183,210,42,
+    51,86,148,189,63,165,153,43,184,178,124,142,117,85,169,53,
+    43,45,54,195,180,106,11,144,230,189,179,114,78,200,118,94,
+    45,77,32,249,72,145,106,246,159,86,62,18,143,85,185,91,
+    179,63,20,105,137,5,196,109,28,146,107,113,68,62,176,68,
+    25,136,23,129,171,193,44,37,4,93,100,225,10,175,1,129,
+    65,83,198,30,27,23,169,143,80,21,94,199,176,75,188,25,
+    161,47,217,37,33,225,14,117,75,215,120,184,245,42,233,77,
+    28,106,159,3,138,155,163,178,126,90,143,243,206,122,193,89,
+    15,38,205,69,43,254,192,109,127,219,146,191,109,161,135,247,
+    119,9,254,46,240,231,157,56,138,173,22,223,49,191,243,248,
+    79,218,119,166,235,118,241,133,187,133,194,221,96,214,140,94,
+    168,78,62,254,122,229,124,37,137,248,33,144,231,137,31,89,
+    22,31,255,29,231,123,78,97,99,127,218,115,130,92,31,153,
+    77,64,157,38,160,78,19,162,78,27,226,248,179,50,29,252,
+    125,134,7,41,201,235,250,72,54,194,195,168,241,202,190,186,
+    122,200,234,254,180,73,182,44,0,169,179,240,74,225,28,43,
+    175,113,43,150,250,149,195,216,131,44,83,113,133,180,241,98,
+    218,72,36,204,94,68,34,101,169,166,13,113,232,37,147,106,
+    113,234,190,44,49,192,184,169,66,182,196,104,128,51,113,58,
+    129,64,163,29,103,206,52,228,144,237,176,65,134,98,18,87,
+    25,101,124,3,40,171,10,87,29,110,94,48,203,104,49,180,
+    74,252,92,43,143,216,16,40,219,86,178,35,72,168,106,109,
+    64,111,78,136,173,7,112,127,122,70,34,18,238,97,154,82,
+    90,20,24,217,17,192,196,134,193,105,168,129,75,148,74,108,
+    194,38,4,171,22,171,181,8,188,175,138,160,200,14,178,138,
+    12,202,53,118,4,26,105,74,52,43,32,150,131,10,179,130,
+    160,54,166,12,72,230,118,104,231,117,169,254,68,239,136,90,
+    43,161,176,25,230,116,240,20,148,49,163,122,195,227,206,79,
+    3,8,28,28,184,169,179,129,250,159,148,196,9,98,198,80,
+    235,218,150,22,193,44,84,73,141,186,74,220,165,151,14,47,
+    59,11,47,245,227,59,248,19,157,203,222,127,126,153,199,69,
+    126,150,228,230,4,176,26,3,220,227,6,57,123,146,22,193,
+    43,208,211,181,57,243,203,57,243,42,115,246,228,253,231,204,
+    130,106,114,91,198,54,130,224,80,236,167,12,174,77,195,140,
+    13,210,34,72,26,85,153,15,50,230,210,85,217,224,253,103,
+    204,250,56,206,89,193,36,201,26,247,116,238,58,123,150,22,
+    193,111,24,101,173,66,206,154,170,206,158,125,128,172,161,156,
+    117,109,129,211,227,208,15,170,53,79,238,90,3,3,94,12,
+    110,24,53,103,133,49,161,133,238,63,107,182,199,73,222,152,
+    73,49,115,216,217,94,142,122,59,69,139,224,251,48,242,124,
+    89,26,121,112,208,3,84,205,230,77,184,106,54,111,66,169,
+    3,165,231,168,154,17,90,4,139,144,122,88,78,125,228,1,
+    75,143,146,199,165,151,211,207,81,250,81,90,4,255,135,186,
+    244,163,15,86,250,45,221,184,244,91,186,17,97,236,201,77,
+    24,227,180,8,222,87,151,126,252,1,75,143,146,199,165,135,
+    244,185,231,114,151,30,102,36,12,254,72,93,250,232,90,211,
+    7,247,144,52,88,119,129,109,23,232,51,51,5,251,145,248,
+    1,39,51,228,73,246,60,45,130,127,147,179,171,234,135,183,
+    243,247,159,39,203,137,145,225,115,249,50,116,145,22,193,159,
+    26,101,168,204,56,67,23,239,191,145,10,78,12,79,60,58,
+    206,197,56,216,244,158,175,115,194,86,92,12,4,117,3,197,
+    31,32,237,199,195,107,75,123,154,22,65,70,157,246,244,3,
+    164,253,40,203,13,179,226,172,77,124,252,193,246,233,1,189,
+    245,50,158,185,177,204,186,203,32,107,95,163,69,112,39,215,
+    204,237,112,94,218,191,236,40,188,180,31,254,200,155,95,211,
+    230,91,214,32,28,203,67,64,160,61,96,11,64,139,160,181,
+    62,102,11,12,108,146,237,162,219,120,27,246,43,19,37,68,
+    103,204,75,146,229,2,249,204,104,90,180,174,85,30,219,161,
+    225,39,193,69,27,32,131,52,247,117,26,214,124,50,204,208,
+    88,79,199,240,56,199,226,0,98,82,40,46,104,67,128,138,
+    47,38,102,171,36,95,50,187,249,215,38,209,67,40,136,18,
+    141,105,245,117,199,93,150,56,63,23,190,118,150,119,215,11,
+    238,123,88,44,127,138,133,23,159,152,9,237,106,203,42,16,
+    218,102,89,98,80,46,178,200,90,98,162,133,49,150,24,112,
+    104,78,7,67,24,107,104,209,28,182,226,69,26,155,241,59,
+    120,49,167,32,135,189,51,51,16,119,75,35,109,96,40,198,
+    142,77,244,221,45,63,57,62,62,26,24,226,216,88,96,167,
+    114,113,199,222,78,98,4,251,238,218,71,78,5,90,33,70,
+    240,174,5,244,143,241,98,20,149,212,74,171,20,199,134,63,
+    33,174,5,237,165,114,89,74,107,235,18,22,128,254,14,90,
+    245,2,165,48,61,175,229,153,58,129,169,75,51,117,226,230,
+    165,238,212,48,2,228,146,253,65,97,92,226,43,60,227,23,
+    24,240,223,35,198,93,63,215,143,0,185,120,166,93,96,218,
+    211,76,251,61,45,172,245,54,208,90,126,28,203,41,249,87,
+    123,48,89,3,248,75,40,210,25,202,128,225,148,70,230,85,
+    139,25,236,159,101,224,200,189,240,65,80,86,48,130,182,42,
+    140,160,165,0,12,68,103,201,57,7,141,65,202,120,176,51,
+    118,193,195,218,141,206,138,102,241,249,154,154,80,103,216,14,
+    42,247,140,245,32,88,163,102,108,225,241,201,147,163,172,122,
+    43,131,188,230,40,80,249,213,99,74,117,152,114,11,116,140,
+    81,220,43,148,92,167,180,7,87,150,171,22,54,244,202,172,
+    236,66,2,44,178,40,206,140,10,211,170,237,200,90,117,150,
+    124,198,144,177,58,11,134,186,67,232,57,110,7,69,20,174,
+    9,68,78,88,7,165,209,52,205,2,200,218,38,107,20,79,
+    198,58,167,34,252,65,89,221,100,70,85,25,133,246,148,212,
+    77,195,239,244,252,164,173,239,15,30,255,151,251,211,53,135,
+    121,231,17,193,121,68,212,36,213,38,39,95,175,158,175,38,
+    154,36,81,151,244,136,74,151,244,8,185,52,186,164,207,67,
+    113,196,29,165,141,74,248,166,170,132,68,99,228,68,41,113,
+    15,201,35,171,225,124,116,63,186,13,56,8,193,88,183,33,
+    102,64,154,103,220,144,1,167,97,6,52,51,200,61,54,95,
+    96,139,129,18,242,113,165,149,64,9,36,32,239,191,184,127,
+    109,147,226,60,165,104,52,198,177,161,177,93,249,166,178,114,
+    49,39,154,153,172,204,172,221,251,147,61,65,137,92,159,169,
+    29,193,77,203,64,188,44,208,138,119,62,141,144,237,74,36,
+    239,173,113,107,48,176,107,87,32,206,4,59,216,241,83,173,
+    247,52,45,240,106,202,3,179,137,31,10,163,49,39,216,135,
+    174,133,70,242,187,216,79,126,209,197,51,251,5,102,127,90,
+    186,114,29,72,132,231,1,172,200,202,234,176,190,35,181,238,
+    61,102,132,89,169,211,255,2,102,132,95,167,244,51,130,168,
+    205,178,129,34,75,6,30,157,250,74,179,250,175,220,245,34,
+    29,248,220,8,143,141,138,133,241,70,25,213,143,109,12,250,
+    105,5,82,10,34,144,100,121,54,39,179,220,68,229,102,150,
+    53,103,16,57,30,102,199,198,185,169,227,35,113,150,131,254,
+    153,177,245,116,109,122,120,100,159,200,93,26,90,24,45,82,
+    159,106,221,164,112,154,86,108,50,165,134,228,251,72,157,114,
+    218,48,54,44,53,152,22,20,223,50,246,131,97,180,46,65,
+    212,225,54,50,204,191,33,49,180,100,189,193,21,27,87,212,
+    66,190,245,132,108,52,121,128,111,2,10,6,98,146,6,248,
+    193,172,223,167,158,101,127,237,124,149,184,52,0,75,11,27,
+    150,252,112,166,27,246,99,128,143,10,85,26,118,201,139,0,
+    3,55,117,231,62,96,170,198,39,115,102,89,28,76,223,26,
+    10,198,37,3,80,11,217,218,74,233,181,123,133,101,151,14,
+    42,25,27,43,40,97,245,128,124,243,141,207,130,196,92,217,
+    90,219,188,137,27,131,28,190,9,224,196,255,134,20,198,93,
+    207,77,61,101,202,122,144,233,103,19,76,46,111,73,179,215,
+    0,151,50,144,73,127,147,22,65,59,68,126,91,22,151,127,
+    51,103,243,104,78,35,211,137,157,234,125,114,184,153,44,123,
+    195,97,206,160,219,203,203,165,96,84,245,153,52,202,87,236,
+    212,131,53,75,164,183,145,202,181,124,122,202,212,132,141,192,
+    148,252,98,62,110,49,76,191,171,49,216,81,166,164,220,25,
+    142,136,65,113,122,165,162,220,148,225,50,40,22,167,111,210,
+    248,172,27,137,191,252,158,106,224,225,126,131,22,185,202,140,
+    3,115,50,100,223,56,102,66,49,215,153,103,40,42,132,214,
+    146,137,104,183,89,179,168,121,130,119,54,8,78,36,173,20,
+    170,6,161,85,139,163,176,231,231,46,170,182,153,184,95,93,
+    108,230,107,182,9,53,219,230,44,215,28,115,142,79,86,74,
+    107,174,199,211,222,54,88,64,239,201,130,159,219,168,218,250,
+    119,188,169,199,223,174,188,81,185,88,159,174,233,230,107,186,
+    133,154,110,242,214,156,99,181,0,69,130,125,230,14,221,162,
+    102,20,106,254,70,221,94,11,245,99,75,247,222,62,243,143,
+    123,105,4,141,59,253,179,212,167,162,47,183,218,119,65,246,
+    30,188,28,28,215,120,54,32,97,170,141,146,217,182,208,154,
+    179,98,147,194,184,75,172,97,108,140,255,152,89,246,93,160,
+    169,96,179,125,29,62,225,55,101,189,225,228,189,235,211,174,
+    245,119,200,35,239,109,78,187,12,220,173,200,229,253,13,92,
+    94,181,223,130,181,185,86,153,49,69,234,116,126,12,74,212,
+    70,32,250,119,148,180,140,36,40,101,92,141,2,34,108,122,
+    211,114,157,28,154,156,49,109,188,200,253,43,10,123,50,80,
+    211,44,166,83,165,147,71,238,15,41,173,179,11,236,102,172,
+    24,87,164,210,183,216,147,80,155,207,224,218,68,66,179,189,
+    102,165,196,127,187,100,221,82,201,186,212,36,95,178,65,40,
+    217,144,216,159,216,255,201,138,187,2,92,68,212,100,193,74,
+    9,170,250,171,109,215,218,0,159,216,15,62,228,107,16,221,
+    221,113,7,94,221,159,52,95,61,124,237,112,218,29,16,47,
+    38,128,55,169,191,88,89,67,93,247,111,55,223,162,183,155,
+    7,130,246,123,104,13,158,145,90,159,248,83,209,12,195,152,
+    98,0,244,66,254,31,165,242,168,114,87,45,30,152,72,101,
+    208,100,1,63,40,50,112,89,129,59,212,3,146,216,247,114,
+    42,6,70,41,227,97,61,223,6,104,201,6,9,182,64,179,
+    120,251,179,70,41,80,136,66,29,186,208,162,48,156,91,228,
+    202,56,31,29,198,106,247,71,67,35,220,137,7,246,154,2,
+    103,36,78,12,103,172,195,240,73,201,171,190,121,8,5,217,
+    134,112,152,129,179,148,82,69,14,228,17,143,133,38,40,197,
+    77,176,92,82,150,176,204,22,44,151,85,161,31,71,2,253,
+    221,143,25,121,144,230,126,215,64,226,204,216,176,215,246,225,
+    120,137,50,23,36,108,4,242,64,44,184,193,120,233,130,228,
+    163,229,83,39,252,79,141,18,182,147,19,4,80,146,241,50,
+    109,218,56,120,20,152,129,46,67,185,87,30,99,200,217,74,
+    249,20,193,211,57,143,156,83,41,133,127,8,74,97,11,106,
+    165,177,158,142,137,97,252,72,234,11,242,46,233,133,127,104,
+    168,23,46,213,228,30,79,117,227,80,119,109,20,17,252,214,
+    165,213,215,29,119,101,226,249,100,247,252,214,84,255,141,163,
+    121,206,160,148,165,239,38,177,152,185,236,222,78,153,192,214,
+    141,88,182,21,180,54,143,180,55,143,4,185,223,49,82,48,
+    128,233,121,220,171,166,56,188,203,124,18,50,44,29,19,88,
+    145,236,159,63,148,58,113,99,48,93,181,145,87,156,226,97,
+    168,26,56,175,107,249,181,29,76,67,76,140,199,171,213,51,
+    217,90,182,170,144,55,179,222,105,112,67,253,158,212,90,220,
+    63,163,13,38,61,216,195,193,62,55,52,164,38,116,18,118,
+    17,202,190,129,146,9,61,217,252,86,251,27,237,175,119,204,
+    119,44,185,91,211,238,99,11,39,222,29,188,213,243,207,119,
+    255,254,110,190,239,152,208,119,108,105,3,120,147,49,246,172,
+    135,171,132,140,99,202,169,62,151,83,34,205,137,83,234,88,
+    102,227,88,167,116,254,9,197,138,200,88,206,132,162,103,8,
+    131,37,19,175,254,124,151,161,33,136,6,182,71,234,170,32,
+    161,207,67,101,52,83,100,7,191,247,213,227,201,210,121,223,
+    213,167,175,61,253,206,230,84,236,70,252,237,221,55,118,167,
+    75,181,71,116,222,175,202,40,190,46,107,160,52,60,49,217,
+    57,193,141,159,100,163,157,19,195,100,4,24,154,128,140,221,
+    195,92,169,66,89,8,165,189,210,215,116,138,164,30,158,217,
+    34,48,91,210,210,245,0,153,231,254,88,150,99,116,217,194,
+    126,223,170,148,217,210,248,124,123,17,70,182,127,33,203,68,
+    65,247,61,148,60,191,39,83,53,214,244,224,237,35,127,8,
+    224,199,52,165,52,94,194,94,209,52,147,58,30,201,0,12,
+    65,187,254,49,165,156,212,87,109,148,167,38,171,245,49,89,
+    171,65,195,35,2,134,182,250,64,29,35,2,237,214,8,11,
+    156,167,40,3,151,218,233,63,138,252,48,214,229,200,80,123,
+    234,162,168,10,218,10,143,91,21,138,160,173,249,80,148,4,
+    72,249,126,152,147,143,72,80,122,62,226,37,141,43,149,79,
+    179,50,201,22,24,88,63,59,80,168,126,97,66,227,134,5,
+    159,223,104,7,14,241,75,161,200,105,181,139,20,224,80,177,
+    151,175,243,102,105,120,207,50,24,248,73,142,125,90,37,181,
+    65,49,102,204,249,184,97,121,3,71,79,76,33,211,77,155,
+    114,56,86,213,172,33,228,94,169,64,29,194,60,77,233,79,
+    155,153,163,35,205,121,243,99,17,243,243,127,78,155,184,22,
+    85,158,80,7,203,122,48,251,244,41,71,126,170,148,132,213,
+    95,139,121,178,152,88,73,246,94,231,14,119,111,238,28,173,
+    45,119,121,222,183,228,121,95,150,241,35,223,84,126,65,59,
+    228,172,45,165,60,95,127,50,111,219,88,13,105,101,141,237,
+    162,121,103,109,165,117,199,124,138,210,106,244,242,47,210,136,
+    70,186,84,49,10,212,238,121,83,10,125,72,246,95,190,179,
+    176,222,164,180,139,208,226,86,0,134,112,128,58,141,16,118,
+    144,251,93,169,95,210,231,225,252,40,149,228,110,204,225,104,
+    91,46,143,142,103,127,216,132,191,187,81,57,209,175,41,13,
+    83,190,52,226,218,116,220,42,202,210,173,22,134,45,56,23,
+    45,106,195,251,28,41,91,214,58,78,132,173,248,171,199,96,
+    216,84,247,207,28,95,182,230,251,178,214,209,51,74,73,94,
+    131,85,25,254,83,103,229,240,220,212,135,183,102,21,224,252,
+    253,249,154,74,93,112,143,82,103,191,204,156,6,22,93,126,
+    142,91,213,121,13,219,81,170,52,167,110,17,135,182,69,214,
+    148,39,123,222,35,71,77,97,102,198,28,118,226,50,54,172,
+    233,123,206,123,28,97,170,236,141,140,178,140,234,145,180,159,
+    122,102,203,12,28,86,106,129,13,113,51,214,176,107,218,26,
+    71,212,61,99,155,54,135,153,115,152,206,185,66,56,202,20,
+    227,11,166,109,40,70,1,196,136,151,226,88,54,101,27,42,
+    211,33,111,132,93,0,225,144,185,217,30,121,139,93,225,64,
+    198,204,70,194,88,207,17,111,58,128,247,200,5,80,0,236,
+    137,131,45,113,100,11,221,73,54,16,157,96,135,71,78,141,
+    176,225,140,99,4,201,151,231,31,14,197,134,207,100,172,99,
+    161,232,185,168,241,113,156,68,207,140,29,100,23,231,63,142,
+    243,170,105,182,36,123,34,56,214,29,145,163,53,177,118,73,
+    127,160,227,78,153,39,144,101,254,172,43,236,51,161,72,120,
+    148,29,58,119,33,196,157,142,26,121,200,6,41,73,220,111,
+    158,174,57,76,174,133,226,235,195,169,250,215,79,205,159,146,
+    131,48,159,148,177,227,194,238,27,137,69,241,88,151,113,225,
+    231,195,35,167,207,160,176,120,245,192,120,96,4,204,14,71,
+    217,208,121,54,112,18,69,83,86,212,197,113,78,140,73,182,
+    15,186,176,250,38,99,158,24,159,224,254,29,77,78,75,9,
+    113,177,172,202,140,251,247,192,113,98,239,220,127,2,119,248,
+    76,242,52,142,201,65,113,131,76,246,80,230,76,17,206,202,
+    208,25,148,194,16,74,57,227,66,201,201,79,220,77,136,98,
+    65,119,93,112,84,109,244,28,190,223,20,101,40,113,241,85,
+    246,182,82,168,170,176,120,112,205,117,59,7,245,8,94,225,
+    240,38,117,79,89,210,150,120,33,241,194,74,85,93,202,246,
+    91,142,239,58,22,122,248,64,151,16,232,226,171,54,9,85,
+    155,230,44,215,152,57,102,185,216,151,220,146,46,174,71,215,
+    114,85,221,124,239,15,44,11,79,252,112,240,251,131,183,108,
+    252,134,221,194,134,221,124,235,30,161,117,15,95,181,135,68,
+    255,176,188,46,29,56,200,151,31,18,202,15,165,61,135,128,
+    229,174,78,158,79,187,155,209,181,210,208,156,58,245,91,103,
+    191,123,118,177,154,95,183,75,88,183,139,111,216,45,52,236,
+    70,47,186,239,184,203,147,235,136,170,111,25,55,229,15,194,
+    139,91,126,175,247,119,123,111,157,230,55,31,20,54,31,228,
+    59,14,9,29,135,192,198,162,230,176,80,115,24,116,213,43,
+    245,224,0,117,240,237,186,27,117,232,177,104,14,253,221,241,
+    214,166,214,165,189,173,232,90,105,110,93,40,255,97,229,247,
+    43,23,31,226,131,123,132,224,30,190,121,175,208,188,119,174,
+    255,218,192,114,67,99,202,139,164,187,175,241,245,61,232,249,
+    232,178,175,121,225,137,180,111,51,186,86,106,91,210,173,7,
+    249,218,67,66,237,161,116,197,161,236,71,6,248,224,126,33,
+    184,159,111,238,23,154,251,231,6,150,27,155,230,142,45,251,
+    26,83,231,211,190,13,232,90,105,105,91,216,242,195,222,239,
+    247,46,142,242,235,247,11,235,247,243,45,253,66,75,127,210,
+    181,82,211,144,234,74,133,111,68,248,154,30,161,6,137,3,
+    182,50,124,152,24,130,73,122,185,110,195,34,205,215,117,37,
+    45,203,117,129,84,255,235,83,232,166,170,101,161,107,169,170,
+    61,93,213,190,220,216,185,88,207,55,110,78,246,47,87,7,
+    82,123,23,74,223,62,194,87,111,64,79,59,247,38,45,243,
+    142,84,247,141,93,139,123,249,198,158,91,52,223,184,157,175,
+    232,77,87,244,174,214,81,165,65,84,248,213,146,108,50,68,
+    120,16,128,54,129,162,241,214,216,187,213,39,198,199,3,99,
+    161,200,84,0,145,197,228,24,27,81,246,130,187,94,25,123,
+    142,157,186,48,206,133,163,189,129,96,33,166,106,66,238,89,
+    74,199,74,212,255,68,75,41,104,92,213,67,143,33,43,34,
+    22,244,165,168,222,125,238,159,209,58,247,185,88,73,88,162,
+    39,233,43,120,81,4,211,238,29,127,37,184,81,94,174,4,
+    21,161,123,185,204,7,154,194,85,75,131,29,202,156,133,63,
+    63,76,83,46,183,242,224,229,21,127,77,242,212,91,103,223,
+    56,187,224,227,107,187,132,218,46,222,191,73,240,111,194,107,
+    183,46,127,226,225,100,83,202,198,187,90,4,87,75,218,213,
+    130,110,62,44,244,204,149,94,126,106,246,169,100,253,149,103,
+    19,207,46,187,203,224,204,187,224,74,77,125,170,41,245,220,
+    141,150,215,159,153,127,6,72,113,217,83,51,87,152,12,167,
+    14,242,158,245,130,103,125,26,95,43,197,85,201,254,84,241,
+    252,161,119,194,63,56,144,122,134,47,222,44,20,111,134,141,
+    183,217,247,23,234,111,180,145,67,26,49,65,163,126,104,73,
+    61,118,163,96,129,190,225,224,171,214,11,85,235,197,78,133,
+    226,215,191,254,228,252,147,170,88,175,239,156,223,41,226,213,
+    217,132,82,134,83,93,243,167,95,175,153,175,129,178,173,248,
+    196,156,92,157,185,54,131,2,14,39,14,127,88,82,149,174,
+    238,229,75,250,132,146,190,180,171,239,142,179,24,84,242,71,
+    232,21,8,63,244,163,166,197,243,191,247,252,239,62,255,59,
+    51,239,205,240,155,14,8,155,14,160,64,116,241,37,135,133,
+    146,195,105,215,97,208,213,31,161,201,43,122,197,144,124,56,
+    250,95,82,107,55,20,146,101,184,98,165,194,8,219,179,40,
+    56,70,196,217,154,209,60,152,227,204,209,92,154,208,105,229,
+    129,230,38,227,83,120,64,60,86,230,46,255,41,200,223,67,
+    233,255,182,156,7,114,28,57,36,125,151,238,141,59,159,159,
+    233,149,46,157,30,23,60,196,224,115,180,165,147,128,159,241,
+    230,159,105,159,160,94,163,105,106,182,52,187,40,13,111,203,
+    7,89,143,41,231,218,187,246,29,167,217,8,123,113,130,219,
+    21,111,82,118,33,172,243,84,204,172,82,44,1,58,85,43,
+    37,29,252,155,174,232,70,87,106,239,117,111,242,177,215,203,
+    231,203,201,179,242,34,158,235,201,9,235,100,24,192,253,30,
+    79,141,182,83,227,220,88,40,70,134,136,151,169,92,234,216,
+    98,93,198,254,4,114,1,235,102,226,73,233,179,241,203,187,
+    103,119,39,67,226,198,248,242,202,107,103,211,222,13,232,66,
+    99,222,54,114,151,118,109,184,227,13,220,246,182,44,121,91,
+    150,61,165,208,5,75,175,49,0,220,203,30,239,107,204,43,
+    12,201,239,66,233,187,149,232,135,175,232,22,16,244,116,11,
+    158,238,143,236,214,210,162,159,81,8,64,103,52,80,242,203,
+    234,118,176,56,95,43,249,106,98,229,208,120,18,191,9,89,
+    194,140,219,149,138,93,204,79,252,59,185,82,241,120,171,173,
+    66,204,245,21,101,171,16,56,190,219,80,127,77,184,254,62,
+    244,120,209,148,118,248,106,225,181,194,119,204,160,111,127,219,
+    125,195,205,123,58,23,251,223,27,224,221,251,210,204,190,123,
+    158,24,241,233,23,48,233,123,168,61,107,52,251,50,67,40,
+    247,67,152,59,2,109,39,34,101,60,139,96,157,158,177,210,
+    179,60,91,94,165,202,243,207,178,138,236,15,25,215,109,198,
+    191,196,248,147,77,90,251,229,118,158,217,32,48,27,210,210,
+    245,5,87,0,247,223,105,220,93,113,25,55,25,150,17,107,
+    80,253,217,50,106,244,167,119,52,197,172,94,98,170,147,39,
+    100,43,193,79,95,76,226,83,42,159,101,188,97,168,206,230,
+    93,116,76,196,93,131,162,193,88,207,193,30,252,124,70,144,
+    149,234,134,84,26,66,126,8,165,236,163,12,13,33,141,142,
+    10,201,189,31,87,169,244,147,203,220,110,250,108,202,156,111,
+    111,128,97,168,206,12,19,135,22,24,134,50,134,161,118,195,
+    80,135,97,168,211,48,212,101,24,90,104,24,90,100,24,234,
+    54,12,245,24,134,22,27,134,150,24,134,122,13,67,75,13,
+    67,203,12,67,203,13,67,125,134,161,21,134,161,126,67,186,
+    174,28,136,23,171,182,103,128,139,250,120,75,118,11,7,22,
+    4,219,3,67,72,244,70,48,43,97,163,184,27,251,226,126,
+    229,137,51,64,245,187,2,67,88,242,238,139,59,134,207,132,
+    56,244,62,59,209,23,111,212,91,226,194,151,177,69,110,211,
+    243,81,110,120,38,216,23,47,17,67,192,62,151,36,155,13,
+    131,37,216,86,248,22,138,231,21,179,10,143,129,157,59,3,
+    45,189,45,125,113,143,242,101,148,215,190,120,43,108,41,169,
+    151,222,63,21,26,25,109,13,6,214,173,11,200,65,216,254,
+    55,24,120,62,94,14,108,185,65,66,181,56,156,36,6,16,
+    189,172,74,179,74,241,30,78,55,91,59,125,241,78,64,94,
+    56,51,50,202,174,49,23,149,146,244,107,144,147,6,25,151,
+    59,55,37,82,28,104,134,0,52,66,95,188,66,243,77,200,
+    37,193,212,201,24,220,92,29,19,147,81,36,158,135,134,207,
+    181,194,51,74,210,10,200,153,187,244,76,124,163,84,223,98,
+    170,6,165,81,21,166,143,75,192,236,221,139,222,111,122,62,
+    204,70,99,51,232,101,121,68,108,213,80,20,78,94,69,89,
+    40,113,87,211,243,40,177,153,53,109,248,241,25,12,182,96,
+    165,253,215,48,210,126,143,86,140,180,186,129,117,11,207,108,
+    21,152,173,105,102,171,24,208,202,51,65,129,129,115,182,200,
+    206,159,167,121,166,82,96,42,211,76,165,24,97,19,207,108,
+    22,152,205,105,102,243,114,142,209,91,23,208,192,51,141,2,
+    222,62,38,6,104,14,101,72,23,110,229,153,109,2,3,135,
+    198,136,1,205,60,179,78,192,70,5,98,192,6,158,233,16,
+    152,142,52,211,33,6,180,201,222,149,196,128,93,60,179,91,
+    96,118,167,153,221,98,64,144,103,218,4,166,45,205,180,137,
+    1,93,60,179,73,96,54,165,153,77,185,114,154,157,103,196,
+    128,14,158,233,20,24,48,99,32,213,241,164,232,204,17,63,
+    28,191,108,159,181,39,236,98,212,221,60,179,71,96,246,164,
+    153,61,57,246,76,29,225,153,163,2,115,52,205,28,37,17,
+    238,125,8,133,108,255,159,162,140,236,65,212,14,198,114,45,
+    171,107,98,89,140,99,41,37,39,205,27,54,227,55,116,146,
+    81,214,234,228,95,3,39,84,144,177,131,213,9,102,255,112,
+    8,97,123,101,49,130,72,21,255,158,206,218,161,64,36,189,
+    29,138,66,69,32,89,161,20,160,100,163,96,187,6,132,221,
+    146,86,95,119,220,21,137,169,21,151,27,100,232,203,143,204,
+    62,114,253,120,170,244,70,5,72,240,11,253,239,30,253,3,
+    243,173,254,247,31,225,183,29,19,182,29,251,200,108,242,56,
+    126,70,33,176,74,153,236,142,60,54,127,228,60,11,37,235,
+    15,11,175,250,67,38,181,250,234,233,53,157,244,155,195,185,
+    167,134,81,153,49,171,210,55,161,244,205,249,211,199,109,162,
+    147,120,176,2,120,11,37,43,128,203,103,232,105,58,101,148,
+    3,205,199,175,154,102,125,210,153,136,175,80,178,34,56,67,
+    115,122,53,112,115,182,209,216,139,88,36,48,82,247,122,160,
+    29,3,20,86,247,214,238,32,215,34,157,124,238,173,248,27,
+    241,215,167,231,167,229,64,125,215,40,144,74,114,62,91,146,
+    45,90,1,123,45,149,143,98,25,86,191,166,98,85,203,1,
+    168,38,182,138,53,17,52,19,218,206,146,245,170,150,138,63,
+    69,133,120,161,66,54,145,10,41,125,136,92,139,207,189,250,
+    20,170,146,11,111,92,120,125,106,126,106,161,254,135,205,223,
+    111,190,217,242,110,11,95,182,73,40,219,36,71,35,2,187,
+    153,40,229,160,227,100,10,196,132,164,83,160,109,184,43,70,
+    51,69,162,216,33,162,229,103,81,118,211,168,233,62,214,136,
+    242,226,91,110,200,233,19,56,167,43,254,26,177,233,158,64,
+    128,175,221,33,32,232,223,41,248,119,38,138,150,253,53,111,
+    213,188,81,243,122,221,124,221,109,255,198,37,255,198,197,90,
+    222,191,71,240,239,73,20,125,232,246,146,156,223,26,64,128,
+    47,125,72,64,208,125,76,112,203,70,72,3,193,34,67,11,
+    18,108,60,130,173,69,176,9,168,198,80,36,187,77,232,59,
+    82,254,181,198,35,184,197,0,124,11,102,200,191,160,212,22,
+    161,149,96,7,186,135,182,130,222,75,245,211,111,178,195,222,
+    33,25,148,155,172,251,105,176,42,145,161,116,148,78,7,60,
+    119,40,124,222,116,220,27,101,6,79,57,102,133,167,28,8,
+    32,219,82,253,176,1,213,175,216,150,10,1,91,108,86,7,
+    108,100,18,129,199,130,173,82,140,33,41,59,148,216,216,176,
+    100,130,250,52,59,87,177,105,42,57,161,7,155,167,98,163,
+    16,23,91,104,100,142,138,66,157,186,80,119,216,5,235,91,
+    25,203,62,196,119,103,44,192,125,231,216,81,50,71,221,175,
+    177,181,202,176,4,13,133,141,170,205,11,77,20,87,65,107,
+    22,249,115,191,255,20,254,130,100,132,77,180,56,86,178,9,
+    201,22,27,135,66,40,118,154,194,185,40,185,172,255,33,170,
+    172,232,174,129,46,116,140,146,204,169,155,87,252,129,183,106,
+    223,168,93,176,242,254,14,193,223,33,109,40,149,12,170,155,
+    179,0,20,191,236,235,85,210,246,0,248,3,69,109,243,39,
+    159,124,18,5,117,251,139,117,141,212,111,214,238,181,154,127,
+    108,161,17,252,2,55,153,74,37,36,123,76,27,81,9,63,
+    135,61,166,104,226,193,149,108,232,63,250,59,217,108,72,236,
+    66,139,69,113,120,15,168,205,142,242,238,58,193,13,170,163,
+    207,120,243,43,156,103,111,172,12,117,137,21,131,245,160,109,
+    80,47,182,207,188,94,184,255,105,144,60,216,69,66,7,27,
+    26,146,27,135,60,118,66,38,126,97,152,9,90,202,68,5,
+    165,59,161,210,4,231,114,134,197,93,6,22,16,150,51,214,
+    83,104,26,99,185,141,70,133,7,55,159,98,225,65,46,65,
+    197,239,177,100,45,114,157,238,217,94,160,232,202,101,175,127,
+    110,203,178,187,60,113,225,126,108,177,141,147,198,251,130,139,
+    113,210,202,109,193,189,80,238,172,253,245,131,122,174,40,35,
+    9,104,148,92,59,33,17,99,191,21,15,232,28,28,118,191,
+    227,22,108,229,122,112,169,229,249,45,167,124,88,162,206,34,
+    136,134,251,45,122,127,224,27,208,149,28,38,191,169,19,228,
+    87,41,120,145,75,156,153,61,107,222,192,139,39,106,147,137,
+    28,225,19,25,143,196,89,110,124,104,8,19,198,90,54,247,
+    126,66,139,192,15,89,254,151,148,126,247,134,104,230,105,177,
+    54,195,100,39,2,151,110,115,111,0,76,44,69,160,113,237,
+    237,80,99,25,202,91,117,233,33,112,30,1,39,116,74,192,
+    177,102,39,218,14,209,212,179,19,98,118,42,76,61,73,0,
+    6,164,132,159,228,156,145,57,74,59,35,179,216,204,83,51,
+    147,222,99,251,8,122,199,192,155,4,10,213,111,39,113,137,
+    70,157,142,195,227,209,216,241,241,225,115,108,44,83,114,12,
+    49,166,108,132,60,237,199,125,232,254,109,162,253,154,197,129,
+    40,254,234,61,189,54,102,179,163,90,18,120,200,162,181,130,
+    206,106,46,200,149,71,156,35,142,58,214,188,101,173,40,215,
+    150,72,40,26,222,63,163,10,81,109,87,115,154,164,137,42,
+    199,222,100,69,249,36,198,224,17,160,244,118,202,112,111,114,
+    157,98,91,96,226,232,29,127,173,116,171,31,55,101,7,57,
+    196,97,110,86,123,48,102,154,49,141,153,103,204,99,150,25,
+    52,97,169,236,168,20,210,190,210,161,173,166,66,158,86,185,
+    11,87,90,133,154,197,181,221,10,98,215,170,136,101,9,83,
+    191,98,202,101,69,121,92,101,211,154,245,4,146,82,236,22,
+    53,206,165,250,59,79,155,192,58,107,198,134,82,183,76,91,
+    167,109,218,157,49,234,124,139,121,117,0,221,170,123,195,113,
+    160,101,83,238,116,178,235,192,65,75,198,55,170,232,37,7,
+    198,38,98,83,164,171,100,202,149,136,35,17,169,11,101,106,
+    149,225,143,71,70,46,238,61,137,230,197,208,176,132,175,212,
+    226,15,142,140,178,4,119,151,222,67,236,149,80,71,5,237,
+    10,233,68,92,9,80,153,23,64,41,128,50,0,152,252,48,
+    229,193,166,212,140,105,60,154,177,76,132,98,103,184,219,20,
+    94,217,197,42,23,131,23,51,116,56,67,159,194,39,251,41,
+    141,145,68,255,164,10,114,149,216,171,199,129,92,255,11,69,
+    248,88,171,221,1,126,81,238,3,252,188,136,114,149,131,107,
+    169,119,26,121,231,58,193,185,110,149,114,216,123,241,249,30,
+    201,250,217,153,148,121,201,221,152,118,55,46,251,122,210,190,
+    158,197,240,123,103,63,40,254,160,228,131,146,247,34,188,239,
+    128,224,59,144,246,28,248,208,231,191,118,225,181,153,87,102,
+    192,92,136,247,109,20,124,27,175,90,230,232,185,174,101,95,
+    87,218,215,181,88,191,248,24,239,219,42,248,182,166,61,91,
+    239,224,239,62,118,229,133,196,11,203,190,142,180,175,131,196,
+    79,123,54,222,193,134,62,11,225,119,207,242,190,237,130,111,
+    123,218,179,253,139,118,213,162,30,20,8,47,61,146,155,151,
+    150,199,53,50,105,228,226,25,149,27,79,13,78,39,85,16,
+    119,88,171,90,204,193,119,146,237,185,65,56,110,188,241,166,
+    89,67,113,198,124,112,137,170,104,152,27,30,203,242,34,48,
+    220,169,40,192,108,15,226,109,186,105,87,205,29,111,249,117,
+    47,120,15,7,101,2,239,109,77,187,12,220,242,202,85,177,
+    112,191,85,209,160,140,167,26,219,76,226,120,161,173,44,179,
+    242,153,84,73,216,242,169,42,80,28,75,184,114,220,253,30,
+    229,106,161,47,214,153,114,177,211,202,58,20,153,106,80,218,
+    68,31,49,174,67,27,170,67,125,47,170,186,22,79,123,234,
+    239,248,42,161,74,121,95,75,218,211,146,179,134,239,111,43,
+    81,145,41,63,231,92,165,153,218,149,252,243,52,80,187,219,
+    244,57,240,207,181,1,61,83,211,219,139,153,226,35,145,145,
+    181,51,213,21,70,185,135,175,92,50,96,173,177,79,156,205,
+    228,247,86,211,61,124,227,20,26,178,214,89,45,23,230,175,
+    49,107,141,153,108,204,95,111,147,106,213,144,135,198,76,8,
+    128,195,144,183,91,148,154,135,110,188,116,88,60,43,186,13,
+    88,211,54,5,195,218,6,27,162,234,128,163,22,129,171,196,
+    138,4,54,25,180,106,184,108,11,232,176,100,224,42,128,59,
+    25,148,136,108,177,81,42,159,206,133,14,20,197,216,217,197,
+    30,145,213,121,41,231,144,172,93,255,215,170,208,225,240,197,
+    176,249,162,233,162,130,89,153,166,241,81,131,230,97,19,152,
+    104,135,45,253,212,51,125,51,102,213,174,70,68,119,138,161,
+    66,227,50,13,179,37,244,140,101,26,76,200,205,59,240,23,
+    195,54,233,44,26,154,138,148,66,120,184,0,172,134,242,165,
+    60,187,3,229,205,166,72,135,57,135,203,17,53,29,133,45,
+    15,38,99,77,182,234,140,9,196,248,107,55,27,233,88,27,
+    199,128,110,251,39,86,181,147,14,135,85,237,37,90,85,123,
+    88,175,34,247,30,135,181,32,248,20,247,167,0,254,163,161,
+    98,188,241,72,100,248,0,152,182,35,254,8,123,28,48,80,
+    139,127,83,177,78,224,234,34,87,114,239,183,143,207,21,207,
+    237,187,60,56,59,40,7,18,242,184,131,18,250,41,244,217,
+    160,149,131,211,248,126,10,163,253,79,101,163,88,204,64,253,
+    148,194,98,169,252,248,11,74,51,147,152,164,82,59,40,50,
+    195,135,233,55,241,209,69,3,25,243,198,77,23,137,242,159,
+    38,86,240,217,1,250,46,179,99,52,52,118,50,28,218,21,
+    175,207,83,48,18,229,101,40,22,57,198,44,245,88,170,45,
+    213,118,137,116,218,160,5,243,104,25,91,120,228,252,216,120,
+    24,155,216,193,225,58,19,224,151,27,108,170,176,203,134,140,
+    245,228,84,140,141,18,107,114,51,199,142,105,134,169,140,91,
+    147,1,110,51,42,211,175,64,154,127,136,211,92,198,85,150,
+    42,253,173,202,239,86,46,236,7,243,106,244,200,187,186,4,
+    87,215,165,3,203,22,123,162,30,60,219,190,116,120,206,252,
+    245,71,224,238,235,135,151,11,171,193,223,1,1,9,122,197,
+    235,79,54,167,232,249,214,212,126,52,91,8,222,214,203,76,
+    194,156,56,190,236,45,79,88,19,161,203,204,178,179,104,174,
+    254,202,182,196,182,101,87,113,226,192,50,83,152,8,205,213,
+    95,102,19,46,56,79,54,105,230,153,42,184,189,140,254,47,
+    59,61,115,197,179,219,230,162,87,118,39,240,31,122,245,229,
+    109,87,182,189,186,63,93,209,142,174,5,150,47,237,22,74,
+    187,121,103,143,224,236,73,91,122,112,61,221,45,222,184,177,
+    119,251,198,222,141,242,213,165,18,166,101,102,64,60,171,93,
+    129,154,81,237,73,86,98,194,154,115,152,66,216,253,28,106,
+    118,194,119,155,50,197,67,3,236,197,152,174,98,177,14,74,
+    169,119,243,232,162,109,69,209,94,133,250,175,195,245,255,115,
+    27,85,88,123,233,192,74,69,203,79,90,183,223,234,226,43,
+    118,10,21,59,211,150,50,84,25,151,196,93,216,202,210,200,
+    170,129,179,84,46,31,78,172,205,96,239,103,78,175,18,68,
+    109,15,74,251,193,66,244,166,94,77,95,36,170,233,93,202,
+    82,196,189,232,230,194,56,119,110,36,130,230,77,132,193,69,
+    235,54,105,253,15,125,42,221,128,79,163,27,24,137,220,91,
+    51,224,87,117,46,165,110,224,187,58,221,192,58,158,105,17,
+    20,107,196,121,78,151,57,73,19,175,24,74,154,16,71,106,
+    251,52,173,245,142,161,118,133,169,92,97,208,156,246,229,206,
+    183,17,242,69,88,129,53,222,194,170,93,4,54,197,10,21,
+    41,106,29,192,152,197,173,72,37,170,212,44,211,180,209,70,
+    193,105,19,154,199,54,205,152,195,86,213,86,54,115,216,246,
+    110,129,58,247,138,147,140,108,242,156,83,138,207,47,90,67,
+    58,179,155,245,245,22,180,15,196,59,217,139,19,236,112,140,
+    13,7,66,145,0,43,54,102,0,198,55,54,26,197,199,125,
+    133,71,194,112,34,13,18,52,3,227,17,150,140,235,80,197,
+    113,255,72,228,124,104,116,36,172,127,141,12,233,120,210,89,
+    0,208,102,194,103,131,109,149,213,48,88,72,193,242,9,94,
+    173,129,129,150,24,57,131,117,130,180,113,1,199,236,50,225,
+    109,58,48,200,26,236,92,40,83,145,159,164,186,249,94,86,
+    22,70,221,248,39,165,77,75,206,166,180,179,105,153,232,105,
+    200,209,95,110,52,106,190,227,229,221,205,130,27,47,231,60,
+    66,140,241,31,230,75,6,132,146,129,180,107,224,142,167,236,
+    53,231,43,206,228,126,222,19,16,60,129,132,21,140,165,39,
+    47,247,206,246,38,139,97,128,196,209,119,223,178,34,128,46,
+    190,100,143,80,178,39,237,218,115,167,212,15,118,12,7,104,
+    2,19,253,203,222,210,235,230,100,127,138,75,87,180,241,21,
+    109,66,69,91,218,187,9,93,75,24,46,132,201,47,185,86,
+    96,63,207,254,91,7,16,64,23,95,222,47,148,247,167,61,
+    253,171,102,170,116,51,98,207,202,53,78,90,190,56,89,88,
+    91,207,68,26,190,165,150,134,13,181,124,103,168,124,39,170,
+    138,125,186,94,45,168,25,103,61,191,145,197,180,66,231,135,
+    9,7,19,219,118,0,135,180,69,58,2,69,42,85,21,105,
+    50,50,193,141,95,156,122,31,40,103,61,37,47,139,252,196,
+    31,92,114,6,211,206,224,138,183,46,101,129,93,91,111,187,
+    110,184,120,239,6,1,27,197,43,142,147,53,92,62,122,16,
+    87,226,153,2,113,88,15,154,51,5,160,101,66,89,229,246,
+    75,61,72,178,214,129,0,189,181,142,186,185,36,21,209,143,
+    45,121,125,138,151,39,46,204,197,174,197,121,119,131,224,206,
+    122,66,253,44,214,128,176,206,161,84,67,66,88,235,240,175,
+    212,203,64,159,69,98,219,244,141,43,138,231,255,86,157,152,
+    114,168,151,39,158,126,74,22,103,205,89,113,246,186,161,9,
+    50,22,120,205,57,28,144,35,33,215,23,216,25,48,152,166,
+    91,137,96,251,255,82,146,136,152,211,233,107,165,110,114,149,
+    229,219,63,129,182,220,77,101,229,91,11,113,25,190,112,60,
+    135,247,240,252,30,193,141,157,132,96,159,153,120,53,73,35,
+    247,190,41,245,34,197,226,210,54,41,219,90,185,119,187,212,
+    17,175,67,158,127,151,82,203,189,77,224,86,51,112,233,32,
+    89,64,18,69,224,86,144,51,91,21,242,103,235,170,205,99,
+    173,2,119,96,34,104,210,200,188,186,131,88,27,225,78,4,
+    218,69,35,163,53,36,19,88,119,152,20,214,29,82,0,6,
+    164,56,80,8,99,110,48,151,211,241,7,225,6,129,23,148,
+    185,63,251,145,137,189,100,114,141,151,41,105,42,27,108,239,
+    218,180,181,99,35,250,235,186,79,22,144,235,203,173,42,34,
+    251,66,228,196,84,140,222,127,129,110,181,67,214,18,25,206,
+    2,127,79,125,70,238,47,15,60,176,251,203,38,181,251,203,
+    38,138,243,33,14,170,112,109,111,107,92,90,42,100,122,69,
+    89,40,202,216,191,41,226,128,48,223,115,4,88,26,211,200,
+    4,177,93,113,198,198,229,122,205,110,116,206,48,231,89,110,
+    228,212,212,145,137,28,75,86,37,217,198,144,216,158,21,232,
+    95,23,169,236,138,213,83,188,179,69,112,182,128,242,177,121,
+    185,188,234,218,25,196,254,28,74,28,90,181,152,11,155,87,
+    42,235,111,87,110,88,170,4,151,186,149,221,66,37,56,164,
+    44,152,43,248,100,197,139,4,75,186,176,57,11,86,42,193,
+    206,165,109,190,141,196,152,43,88,53,163,80,112,29,72,206,
+    184,187,236,158,117,39,240,159,210,97,101,237,222,102,243,143,
+    155,104,4,191,64,54,69,85,41,132,71,249,239,107,208,216,
+    195,160,15,103,37,75,103,36,135,77,58,125,20,29,54,231,
+    219,54,40,122,72,179,228,48,244,4,51,18,56,66,25,107,
+    109,220,51,244,101,147,210,159,25,108,75,11,83,112,116,204,
+    85,211,172,7,235,107,48,195,76,115,199,76,216,75,36,222,
+    233,15,26,6,60,231,139,94,254,46,41,237,26,149,229,214,
+    238,62,148,21,56,127,99,17,55,174,125,114,137,74,23,237,
+    36,215,66,49,52,107,178,235,170,43,101,225,221,77,114,184,
+    168,3,249,41,24,159,16,78,254,105,73,87,19,119,54,135,
+    59,164,11,229,18,54,31,139,252,72,198,28,155,156,192,237,
+    242,85,213,38,68,93,254,254,218,34,238,178,66,121,89,150,
+    210,132,236,68,16,224,139,118,10,69,59,19,230,101,119,245,
+    245,201,212,241,215,227,243,136,43,185,199,106,242,127,163,62,
+    213,8,227,201,229,0,85,114,255,166,249,82,78,153,146,107,
+    183,171,118,32,42,15,112,48,150,38,181,180,35,165,216,136,
+    168,252,41,10,12,123,164,241,69,153,67,41,22,18,212,15,
+    6,109,217,129,4,211,72,246,252,79,238,97,120,212,57,101,
+    5,135,94,113,143,178,21,192,53,221,223,66,35,192,114,149,
+    110,192,96,236,77,176,226,179,53,201,206,159,89,242,174,75,
+    187,214,225,99,60,175,71,249,194,70,161,176,17,70,148,166,
+    85,147,185,176,6,150,48,46,188,211,114,187,161,103,169,161,
+    103,145,229,27,118,8,13,59,150,124,59,210,158,29,159,160,
+    137,27,34,84,207,77,206,77,194,112,65,62,184,228,109,76,
+    187,26,163,176,222,253,126,195,222,58,234,199,117,166,189,77,
+    234,65,194,68,105,88,63,169,248,46,181,45,144,145,27,190,
+    8,59,52,164,46,41,132,220,133,146,186,113,73,151,75,43,
+    146,7,94,121,56,157,131,199,149,9,234,171,148,150,237,12,
+    211,231,240,111,212,169,10,53,157,195,205,204,249,148,202,44,
+    188,30,37,63,229,60,44,216,66,184,253,81,233,77,11,21,
+    175,144,164,234,145,9,89,158,110,110,220,184,237,34,234,98,
+    184,173,13,143,8,30,48,169,135,63,105,246,248,255,160,224,
+    196,149,57,8,52,91,231,30,187,210,151,232,75,54,205,183,
+    164,78,47,85,118,164,43,59,176,28,187,229,86,233,251,62,
+    190,122,15,95,178,87,40,217,155,118,237,69,34,103,85,39,
+    194,126,78,194,13,38,93,36,169,245,155,148,100,44,9,53,
+    71,12,133,26,69,233,36,137,134,182,42,36,154,230,180,250,
+    194,91,16,192,193,160,250,148,164,251,99,118,179,110,241,190,
+    108,18,171,219,240,56,207,35,82,129,4,168,248,155,148,154,
+    217,93,7,204,110,197,26,152,93,198,90,129,58,161,4,74,
+    53,204,174,9,86,111,100,192,216,173,77,96,10,45,130,114,
+    233,120,4,2,108,38,235,62,108,24,45,67,70,125,28,143,
+    12,72,41,142,228,228,113,193,197,244,183,238,155,203,197,115,
+    107,193,75,140,17,167,155,160,46,210,131,69,196,155,221,145,
+    137,1,54,6,155,177,180,124,174,20,236,146,248,220,141,157,
+    155,186,63,71,86,87,76,79,197,234,186,173,42,86,87,217,
+    45,100,127,123,119,77,184,91,56,16,35,65,207,228,101,26,
+    228,181,236,106,201,255,92,216,252,61,148,255,223,150,199,17,
+    90,246,76,23,182,104,49,115,116,132,202,251,117,201,243,218,
+    226,180,137,219,131,198,35,211,121,154,243,134,45,248,215,173,
+    26,171,116,62,210,178,249,129,173,186,10,123,33,139,114,183,
+    145,50,119,249,227,69,126,91,173,162,85,198,205,51,181,54,
+    171,99,102,119,77,41,15,235,214,196,177,42,226,200,247,145,
+    115,74,47,247,198,108,187,166,4,170,26,129,165,67,85,154,
+    202,111,239,204,219,10,5,98,43,84,169,191,175,41,129,85,
+    133,201,126,91,221,78,140,94,121,204,117,169,98,216,53,190,
+    236,214,224,115,255,222,190,236,166,115,88,128,25,250,238,119,
+    14,12,43,101,50,121,135,208,13,10,79,167,196,45,221,58,
+    181,73,8,132,230,216,79,160,117,71,167,233,4,216,246,207,
+    204,121,117,223,211,117,36,237,58,1,81,237,232,11,11,11,
+    33,197,3,227,1,108,165,28,136,178,177,192,169,113,46,112,
+    211,156,41,64,247,161,88,140,35,254,119,96,18,190,105,201,
+    58,155,226,254,128,194,155,125,70,163,44,154,153,212,170,234,
+    140,75,233,22,42,222,154,29,91,242,59,144,42,181,138,94,
+    49,96,234,40,153,59,149,152,73,204,172,120,124,73,75,114,
+    56,181,229,183,122,191,219,187,48,12,30,115,121,207,102,193,
+    179,57,45,93,203,197,21,112,240,64,159,20,115,171,210,75,
+    14,186,176,207,168,237,139,251,17,64,23,95,222,43,148,247,
+    166,61,189,100,244,199,122,123,152,138,51,5,17,146,71,188,
+    224,118,183,248,136,200,148,200,14,140,200,34,238,255,5,117,
+    177,2,0,11,184,78,162,196,199,28,10,230,80,159,150,57,
+    84,56,222,90,33,240,138,53,64,54,74,253,57,13,188,27,
+    97,89,110,234,188,22,177,166,28,94,139,244,245,232,5,126,
+    224,101,154,24,193,217,236,125,192,167,42,192,207,61,26,15,
+    69,203,174,138,196,177,100,105,242,124,42,198,187,218,5,87,
+    123,218,213,158,13,155,34,203,176,100,61,214,200,57,145,189,
+    240,16,141,24,224,228,249,185,175,205,125,109,97,228,214,150,
+    116,199,94,116,173,84,54,166,155,182,242,149,219,132,202,109,
+    233,210,109,203,158,234,57,87,242,68,106,203,66,247,98,233,
+    98,232,61,31,239,217,46,120,192,162,45,139,217,190,24,190,
+    213,245,222,105,222,179,75,240,236,74,227,43,235,208,232,41,
+    190,184,83,40,238,92,165,44,144,94,101,109,242,185,249,22,
+    34,141,47,215,53,166,246,206,95,152,127,1,61,184,230,92,
+    31,182,117,221,110,219,185,212,182,243,86,248,131,174,247,79,
+    243,109,7,133,182,131,188,167,101,174,244,154,15,177,124,237,
+    201,118,109,41,202,43,147,93,215,78,131,90,96,185,170,46,
+    69,207,111,69,183,199,18,199,30,208,95,209,29,195,147,121,
+    190,88,61,64,150,52,136,30,96,171,53,167,30,64,206,203,
+    151,41,34,166,135,85,102,21,154,109,162,134,227,148,214,133,
+    100,150,7,86,122,79,183,54,71,59,145,196,108,230,96,180,
+    39,44,37,116,139,155,34,219,219,32,151,229,146,90,118,206,
+    150,5,203,206,125,64,229,192,194,130,236,236,46,191,222,252,
+    122,203,124,203,91,157,111,116,242,149,235,133,202,245,11,39,
+    222,125,58,237,239,229,221,189,105,166,55,143,196,76,209,159,
+    74,98,14,228,151,152,199,221,42,23,80,116,246,62,135,68,
+    173,144,147,53,41,109,86,75,212,202,239,158,50,41,117,119,
+    198,174,165,214,42,95,195,29,247,132,9,155,225,26,13,86,
+    89,153,122,36,175,76,157,109,29,144,169,119,65,227,188,64,
+    25,202,212,126,149,76,237,61,188,208,253,238,142,91,61,239,
+    239,92,90,15,189,70,39,97,251,137,132,93,81,61,95,144,
+    42,189,81,157,246,117,252,168,229,246,166,3,75,155,14,124,
+    192,242,155,142,9,155,142,45,249,142,165,61,199,244,130,118,
+    197,92,207,199,192,240,252,216,21,220,187,133,250,241,22,19,
+    156,27,99,40,229,18,103,214,107,91,114,163,41,181,85,166,
+    66,26,86,242,180,120,250,71,210,176,114,178,53,43,9,235,
+    94,210,48,62,220,42,94,34,201,193,226,68,20,192,61,103,
+    64,110,30,67,49,24,168,70,217,38,162,24,12,109,210,79,
+    17,49,81,161,179,4,137,120,71,178,126,201,89,149,118,86,
+    37,99,243,211,11,39,151,234,54,166,235,54,226,113,110,227,
+    143,182,242,138,65,16,73,196,129,46,132,251,34,14,140,0,
+    74,12,90,136,116,172,166,74,73,68,126,58,151,136,44,149,
+    92,18,145,7,172,242,89,17,121,68,228,84,211,141,118,245,
+    89,17,55,31,76,74,62,43,11,200,32,158,115,45,82,59,
+    237,33,185,125,90,42,153,3,178,247,3,10,143,101,26,57,
+    185,106,13,114,114,3,156,17,35,131,195,180,110,191,81,31,
+    188,164,3,54,187,213,15,210,178,8,202,205,214,29,32,2,
+    139,192,97,6,207,243,249,0,97,150,158,254,95,43,42,59,
+    142,76,60,57,18,59,3,103,134,199,203,213,178,178,28,46,
+    11,203,93,189,219,54,126,94,194,178,47,155,160,74,90,254,
+    202,63,74,203,255,40,45,107,191,253,143,210,50,254,247,191,
+    137,180,204,125,21,186,119,8,192,176,94,76,3,201,45,30,
+    84,140,14,249,229,221,175,194,120,113,74,26,47,20,178,168,
+    101,2,189,76,252,233,158,1,244,154,68,207,73,121,222,156,
+    146,69,79,23,136,158,82,110,178,178,39,153,173,206,229,144,
+    51,189,6,5,24,250,76,5,205,243,188,171,67,112,117,164,
+    93,29,232,198,88,208,60,160,16,52,79,221,178,165,59,118,
+    161,235,62,4,205,45,139,221,183,232,247,182,242,158,62,193,
+    211,151,198,87,86,208,28,228,139,55,10,197,112,234,10,164,
+    167,18,52,171,3,16,99,254,24,122,176,207,217,63,108,233,
+    184,221,210,183,212,210,119,171,255,131,226,247,15,17,247,203,
+    188,167,73,20,52,131,201,96,30,65,179,162,58,249,216,124,
+    1,186,61,146,56,242,15,93,208,84,211,6,145,52,191,241,
+    203,33,105,246,106,36,77,220,11,34,38,35,17,179,68,85,
+    10,44,99,126,235,158,50,230,83,105,255,86,222,13,78,203,
+    254,81,198,92,187,140,169,25,149,178,50,102,60,183,140,89,
+    172,106,30,16,50,175,104,133,76,121,111,178,78,200,220,135,
+    132,204,237,183,172,239,59,150,214,239,75,187,246,221,67,200,
+    244,167,125,235,127,112,225,118,231,254,165,206,253,31,28,224,
+    59,143,10,157,71,151,124,71,211,158,163,134,66,38,55,97,
+    202,37,11,125,81,130,165,106,219,223,61,4,203,145,95,252,
+    2,69,114,75,130,37,204,42,10,169,114,42,191,84,169,108,
+    5,34,86,190,154,71,172,220,62,247,220,149,157,137,157,201,
+    254,249,35,11,182,165,234,142,116,53,89,104,221,176,104,121,
+    207,206,87,111,231,75,122,133,146,222,180,171,23,137,149,53,
+    157,8,251,69,136,149,147,10,177,82,77,136,146,88,57,105,
+    40,86,42,71,57,73,174,124,67,41,87,234,207,32,244,39,
+    226,120,145,185,251,198,118,222,189,65,112,203,62,114,177,155,
+    50,157,60,56,41,101,233,9,67,121,176,229,51,147,7,183,
+    193,75,58,160,151,7,251,64,206,19,1,146,7,59,224,46,
+    55,32,37,195,213,235,140,251,154,67,129,230,147,136,176,2,
+    205,135,123,155,31,238,109,62,30,104,30,12,52,63,21,47,
+    53,64,60,21,47,110,126,170,179,121,172,83,17,26,47,82,
+    7,197,25,233,25,69,134,159,206,230,167,148,145,85,65,40,
+    178,248,44,71,158,210,71,158,210,68,158,50,246,89,240,62,
+    173,241,89,64,205,152,104,120,54,143,202,190,11,198,172,51,
+    214,49,211,140,77,99,68,71,77,107,182,223,113,38,48,209,
+    86,199,201,227,221,192,73,164,37,157,135,2,117,26,136,21,
+    214,157,183,85,138,6,29,197,192,175,72,129,82,123,23,208,
+    228,69,113,134,151,230,139,71,166,169,176,5,49,226,53,40,
+    79,182,108,79,195,79,114,172,252,230,233,177,210,236,215,251,
+    169,103,2,51,5,118,10,251,71,160,166,117,219,60,104,226,
+    40,171,60,251,70,19,197,153,97,98,153,173,145,140,15,85,
+    103,230,88,167,193,115,191,237,186,238,252,165,96,129,216,247,
+    77,25,75,56,20,99,51,12,192,216,200,24,11,199,145,158,
+    30,131,187,12,131,38,252,9,124,231,68,119,147,195,177,33,
+    252,96,193,209,76,25,243,192,248,133,140,245,196,120,56,52,
+    21,47,222,63,62,57,26,14,68,198,99,1,108,133,28,104,
+    137,59,91,2,161,104,32,20,192,177,93,220,139,208,145,191,
+    14,224,155,0,190,1,224,37,0,191,98,146,24,243,239,82,
+    112,108,12,196,143,77,78,140,178,196,49,130,11,158,135,136,
+    75,251,40,119,147,198,214,146,216,142,31,127,236,69,131,143,
+    225,4,254,27,204,152,250,51,91,28,56,123,184,32,220,175,
+    162,120,63,132,97,229,148,200,175,155,173,54,232,181,247,2,
+    140,21,238,238,11,252,188,136,98,74,230,154,147,85,124,65,
+    179,80,0,102,148,214,178,101,119,105,194,245,97,65,241,92,
+    243,117,47,95,80,35,20,192,177,204,214,26,196,223,39,206,
+    207,177,151,103,102,103,210,76,53,198,39,91,83,253,105,127,
+    144,47,104,19,10,240,54,221,122,244,238,203,47,92,121,129,
+    119,7,4,124,58,179,230,51,140,21,182,171,165,75,97,147,
+    11,236,115,241,214,206,117,95,235,75,78,37,99,243,83,175,
+    63,63,255,60,239,93,47,224,211,181,63,44,111,64,204,189,
+    189,12,131,196,65,152,250,203,150,125,117,115,23,83,86,36,
+    132,248,58,4,95,71,218,35,94,159,172,120,33,135,133,101,
+    89,176,236,41,157,179,128,245,103,25,98,0,126,110,163,156,
+    101,233,178,190,5,0,228,226,29,59,4,199,142,180,101,71,
+    20,250,210,31,109,112,238,235,51,253,81,159,99,63,99,253,
+    227,2,26,65,99,101,25,88,172,62,184,147,29,241,140,102,
+    67,167,58,40,84,239,20,175,80,60,163,217,114,2,168,221,
+    20,27,187,255,141,115,197,242,198,185,29,64,113,29,103,118,
+    229,83,151,21,67,130,42,69,153,0,18,195,223,81,148,129,
+    5,181,198,218,42,159,242,196,240,204,104,52,177,3,253,231,
+    115,126,83,136,243,35,73,182,203,208,83,202,40,204,90,150,
+    213,165,172,124,217,58,161,108,221,255,170,125,71,82,222,136,
+    100,245,103,185,37,43,121,202,34,78,20,209,20,69,141,130,
+    213,46,76,93,216,213,14,13,10,30,133,242,71,153,181,156,
+    199,155,200,156,102,190,3,204,84,44,214,175,1,15,96,203,
+    48,40,195,108,36,28,226,184,111,64,118,127,77,26,190,50,
+    54,32,144,211,99,100,15,143,120,254,251,53,147,24,69,125,
+    126,247,119,178,21,32,49,93,127,1,141,179,147,34,76,151,
+    143,24,93,223,193,167,47,40,175,59,238,226,151,167,174,76,
+    37,43,222,170,123,163,14,142,228,224,253,221,130,191,155,119,
+    247,8,110,216,15,146,71,46,237,166,180,84,118,86,65,95,
+    185,45,251,164,157,87,48,38,103,10,66,209,97,60,242,26,
+    186,6,36,142,248,196,118,197,178,230,95,66,169,200,113,228,
+    43,110,239,236,52,98,154,143,242,238,22,193,157,221,36,106,
+    152,217,128,46,179,122,126,33,123,134,75,14,167,120,56,35,
+    226,6,33,216,174,206,109,167,242,74,238,155,40,237,46,102,
+    178,239,95,125,186,178,113,253,152,56,171,44,244,105,115,3,
+    254,32,226,62,169,181,135,68,95,121,161,232,80,120,100,56,
+    246,55,80,67,62,177,134,74,97,191,118,194,181,226,46,153,
+    235,190,60,53,59,149,102,42,30,196,65,200,92,110,237,62,
+    113,173,39,15,87,74,215,32,171,234,33,203,240,16,136,207,
+    248,224,139,248,6,236,201,191,141,108,128,18,157,193,75,188,
+    75,171,228,191,191,99,24,90,178,53,216,30,111,5,118,160,
+    193,136,231,110,104,15,172,107,21,125,194,7,131,125,241,160,
+    228,230,61,251,229,117,235,212,9,237,12,180,60,189,177,229,
+    94,62,224,75,212,117,5,175,255,204,170,61,104,99,7,207,
+    236,20,152,157,105,102,103,46,191,235,219,121,166,87,96,96,
+    249,158,92,121,253,240,26,173,195,105,118,101,221,146,26,211,
+    112,127,214,183,77,34,224,33,171,127,68,169,77,86,189,178,
+    95,146,6,96,69,26,20,242,86,3,236,164,106,129,80,17,
+    216,52,226,150,213,186,5,216,33,17,20,73,34,27,1,232,
+    93,63,220,137,0,189,11,27,103,37,192,136,190,72,140,18,
+    21,125,254,17,233,76,225,243,79,33,179,145,226,125,59,231,
+    2,29,28,194,164,92,160,147,118,126,12,154,241,157,9,221,
+    89,240,82,155,21,70,247,12,243,48,27,11,29,136,76,142,
+    169,180,245,242,166,65,176,209,2,109,222,167,213,229,129,97,
+    59,214,190,171,22,128,192,67,137,210,53,210,52,141,125,149,
+    88,178,163,44,86,234,85,82,176,75,8,205,139,144,175,104,
+    208,198,213,64,40,28,219,200,129,103,3,110,31,52,127,61,
+    220,53,0,185,218,36,114,21,21,127,240,122,220,35,149,11,
+    155,201,95,24,26,42,178,137,78,239,144,248,189,82,228,189,
+    124,122,246,244,203,227,87,198,147,225,84,255,66,243,98,41,
+    95,180,69,40,218,146,48,47,251,171,255,255,246,190,4,58,
+    138,51,61,176,170,171,187,85,173,62,37,181,238,171,17,18,
+    66,70,8,132,193,54,194,128,1,9,115,10,198,8,103,134,
+    177,45,26,117,1,109,183,186,153,234,22,24,25,60,26,63,
+    239,184,97,52,113,227,200,113,143,13,59,154,4,207,194,196,
+    243,134,76,60,137,147,117,102,157,157,205,57,57,186,53,53,
+    65,233,93,18,111,18,231,222,172,244,34,191,231,56,217,236,
+    254,223,255,215,241,215,209,45,129,177,189,179,111,165,122,95,
+    85,215,249,159,223,253,127,223,87,249,76,240,130,111,214,95,
+    169,48,5,116,203,168,212,24,180,249,68,207,121,142,67,2,
+    84,252,246,67,65,37,253,186,200,41,38,11,132,46,122,48,
+    245,70,235,181,23,165,132,52,58,197,44,29,116,110,105,171,
+    188,226,39,35,28,174,227,97,67,29,181,80,126,69,181,145,
+    134,58,218,141,117,140,234,120,59,157,209,170,104,112,60,36,
+    100,250,113,196,27,251,121,7,136,153,20,29,119,224,40,54,
+    129,184,254,171,14,179,33,75,11,1,8,81,23,94,211,167,
+    89,110,59,199,77,83,65,11,169,55,57,35,6,145,22,82,
+    175,190,6,169,93,33,50,1,71,191,37,165,89,242,140,51,
+    134,18,206,169,250,178,197,172,85,93,174,65,113,13,232,233,
+    238,135,241,188,58,34,136,209,211,66,36,52,18,11,67,24,
+    131,84,74,140,30,27,75,33,129,117,52,124,170,83,205,217,
+    154,56,30,74,157,61,37,132,128,198,138,191,141,222,53,254,
+    64,233,167,79,135,99,73,243,227,176,194,202,242,73,124,99,
+    68,56,30,141,11,166,50,36,68,249,117,5,207,25,49,124,
+    234,148,32,14,199,195,72,18,113,8,48,159,63,180,245,245,
+    33,132,143,5,102,168,22,153,206,88,59,169,153,173,160,196,
+    5,123,18,108,89,208,120,5,62,154,28,198,31,38,148,225,
+    24,0,140,43,128,50,32,121,26,99,3,21,67,64,234,86,
+    196,241,67,221,11,92,52,242,180,28,207,38,57,146,64,101,
+    193,56,131,146,171,39,40,129,161,130,194,26,178,223,37,160,
+    13,96,204,63,192,17,23,50,187,115,238,102,180,33,9,50,
+    59,114,249,196,235,169,124,85,183,84,213,13,118,165,202,91,
+    53,173,8,141,87,175,154,231,184,218,202,5,6,1,132,176,
+    43,42,223,47,103,234,154,178,59,46,63,252,245,125,175,238,
+    251,218,224,229,193,124,237,42,169,118,85,122,199,228,174,89,
+    143,127,114,215,139,251,47,238,135,60,18,105,244,63,235,173,
+    202,156,205,121,67,104,35,95,56,249,109,59,89,146,95,234,
+    11,115,229,76,109,61,122,223,195,183,154,58,166,71,174,158,
+    204,55,173,145,154,32,12,44,232,193,17,184,196,103,184,204,
+    161,217,214,182,12,55,85,150,229,46,121,50,30,16,117,151,
+    35,57,183,170,105,54,176,103,158,179,85,249,22,24,4,16,
+    133,242,250,16,133,66,229,122,16,36,233,158,217,150,182,236,
+    70,244,234,125,233,125,239,6,155,95,217,255,210,254,233,158,
+    27,157,249,96,159,20,236,75,15,204,182,44,207,53,174,70,
+    219,116,138,236,225,206,91,188,247,66,217,100,217,77,190,110,
+    134,175,203,6,179,99,211,209,60,191,86,226,215,230,148,141,
+    44,192,115,26,105,126,131,210,13,214,142,53,87,108,50,240,
+    66,151,124,134,209,41,82,129,72,86,1,125,52,129,242,22,
+    71,239,28,179,52,64,104,235,149,162,180,85,31,25,231,4,
+    115,132,67,50,61,146,232,65,130,71,242,59,135,164,119,59,
+    146,221,29,88,118,119,226,0,185,110,144,225,77,82,187,219,
+    34,108,174,23,59,195,248,176,51,140,63,98,199,142,48,118,
+    24,139,67,226,207,161,18,236,28,212,113,193,128,223,48,29,
+    122,140,33,241,100,232,69,89,167,89,177,81,231,14,192,2,
+    126,194,9,48,213,119,224,5,254,102,204,8,145,84,212,39,
+    21,246,180,1,138,1,122,177,240,104,232,68,2,33,136,112,
+    68,246,34,239,28,47,239,12,173,4,173,89,52,30,250,144,
+    237,234,178,147,57,141,167,51,76,226,146,226,185,110,166,245,
+    67,183,238,100,228,208,38,89,251,101,62,231,14,161,237,86,
+    101,35,26,163,215,14,231,2,96,172,121,43,242,118,148,28,
+    229,204,3,247,211,140,35,162,84,134,200,243,123,157,204,162,
+    241,67,86,50,154,16,65,247,158,158,194,200,52,192,54,56,
+    94,163,5,49,194,136,116,77,251,90,28,195,232,33,166,184,
+    66,6,23,138,86,200,28,128,86,110,102,40,166,189,99,58,
+    121,245,92,158,95,47,241,235,115,202,102,22,125,212,84,172,
+    47,177,197,69,31,186,22,75,177,241,34,74,126,238,188,131,
+    8,76,56,28,5,119,206,129,160,221,56,46,217,37,102,81,
+    97,117,230,162,137,50,58,29,81,220,73,95,195,33,124,73,
+    32,12,7,173,13,17,109,231,156,113,54,2,52,189,12,151,
+    133,55,71,122,84,3,100,184,204,1,50,80,57,45,173,170,
+    198,114,78,158,47,149,123,15,191,221,99,84,122,23,203,182,
+    135,199,135,111,112,220,3,233,216,112,168,124,72,118,230,62,
+    31,130,37,27,33,56,57,238,0,49,175,109,220,222,134,174,
+    136,255,12,245,4,148,34,254,60,128,15,225,39,132,236,24,
+    231,229,71,158,17,47,192,200,133,24,28,226,223,179,216,194,
+    139,39,53,89,204,16,141,71,132,120,170,224,130,49,136,233,
+    58,193,227,175,99,29,80,68,128,139,232,1,76,144,65,179,
+    39,110,7,176,3,0,24,20,209,115,49,65,126,14,232,181,
+    57,14,48,17,55,213,129,171,138,155,135,96,228,58,89,117,
+    228,82,1,63,16,211,126,185,246,235,77,175,54,125,173,229,
+    114,11,152,126,27,48,72,239,158,245,4,210,253,185,138,190,
+    105,14,1,180,93,235,34,123,180,229,61,155,36,15,120,102,
+    160,123,94,220,123,113,239,133,253,147,251,211,251,103,151,175,
+    184,186,57,183,252,129,204,189,83,15,102,30,124,107,228,237,
+    209,116,63,126,73,6,189,102,16,109,211,135,174,62,150,107,
+    222,146,29,202,14,221,56,67,78,189,211,69,246,104,203,123,
+    14,72,158,3,57,207,1,242,204,142,76,11,252,231,61,33,
+    201,19,202,121,66,186,79,161,143,225,106,28,201,243,117,18,
+    95,151,227,235,148,236,148,153,29,132,5,48,229,83,83,50,
+    130,193,127,9,69,225,79,51,180,162,80,167,190,161,28,15,
+    180,201,128,9,131,58,81,180,201,128,221,162,244,236,174,205,
+    24,183,26,29,171,172,118,241,232,219,138,26,145,176,128,195,
+    93,124,161,114,116,67,79,52,158,18,196,120,56,214,131,41,
+    75,82,4,97,19,113,122,242,217,130,83,62,13,12,27,25,
+    99,107,20,125,175,162,95,140,2,0,155,170,149,126,17,15,
+    33,69,191,24,134,209,3,113,93,64,191,8,13,74,182,247,
+    60,85,153,237,83,123,165,224,138,220,202,221,55,236,111,250,
+    164,181,15,163,35,180,229,61,123,36,207,158,52,59,235,15,
+    164,191,144,9,78,213,101,219,47,223,35,85,116,228,253,43,
+    36,63,88,130,239,114,16,33,143,76,63,176,222,240,4,144,
+    15,53,158,143,57,25,2,166,172,216,87,249,27,48,237,42,
+    20,54,27,113,201,196,208,133,167,163,248,139,54,157,238,68,
+    211,167,104,233,139,176,42,197,160,54,249,150,77,6,27,160,
+    209,222,96,116,106,19,183,119,162,95,78,137,224,100,130,141,
+    19,251,208,174,190,5,108,215,254,224,196,46,244,163,162,122,
+    98,247,156,221,1,225,108,84,224,51,168,79,100,21,200,6,
+    80,129,108,160,84,32,27,100,21,136,219,129,56,91,4,212,
+    75,112,162,193,14,218,24,21,120,244,177,110,84,64,42,242,
+    45,35,19,167,116,212,63,173,96,74,50,113,44,98,226,108,
+    136,137,131,12,36,246,66,249,33,144,25,34,152,13,27,220,
+    217,229,42,221,17,226,175,217,100,76,72,154,222,208,174,111,
+    219,100,16,131,118,189,175,84,187,214,105,237,138,246,1,173,
+    101,225,159,188,242,237,162,108,106,3,99,52,59,69,108,17,
+    238,4,120,105,3,91,233,40,184,182,159,77,9,7,68,36,
+    209,141,111,192,172,157,40,32,254,32,137,48,119,52,126,34,
+    4,17,53,18,113,244,163,51,25,130,232,116,72,158,67,119,
+    134,86,10,241,72,52,28,143,11,201,100,87,129,59,22,61,
+    81,112,198,162,169,84,76,24,236,114,24,154,165,80,54,60,
+    28,73,140,12,15,147,246,49,52,195,247,109,50,56,15,205,
+    208,162,111,6,251,214,156,125,235,187,158,138,204,3,57,119,
+    211,68,63,252,147,71,225,129,19,255,122,125,126,102,255,177,
+    131,91,173,235,125,210,162,222,75,245,76,71,119,152,25,245,
+    114,116,214,34,191,69,196,5,65,108,11,190,161,232,200,83,
+    7,1,71,97,12,35,62,13,228,209,222,187,127,215,248,157,
+    186,163,31,80,39,163,53,59,215,168,255,162,142,177,155,132,
+    198,212,5,165,180,78,106,252,201,113,196,181,134,210,42,188,
+    113,70,207,27,91,218,34,238,36,59,145,215,10,183,254,140,
+    85,73,20,162,48,5,37,209,242,36,221,89,167,253,76,241,
+    78,195,86,134,86,139,78,163,237,13,175,64,33,94,86,11,
+    97,105,111,88,172,16,32,30,180,201,170,254,84,98,24,77,
+    233,99,130,40,219,13,186,149,28,177,93,155,22,9,202,214,
+    84,172,164,192,126,93,49,141,47,45,221,41,217,100,93,190,
+    103,201,171,107,52,133,126,81,13,254,15,108,50,120,1,62,
+    127,137,49,103,231,241,86,25,156,167,186,128,10,116,81,68,
+    165,203,164,189,215,103,231,81,130,131,147,176,18,212,131,203,
+    213,76,59,247,194,165,123,169,75,228,4,6,164,180,63,40,
+    74,111,72,42,76,61,86,66,24,103,145,236,119,17,30,20,
+    127,133,178,125,225,148,16,31,57,91,112,244,174,93,27,79,
+    234,134,168,202,239,253,44,91,218,21,149,86,65,155,124,138,
+    26,104,103,83,90,248,71,231,45,215,89,68,204,206,168,148,
+    83,169,225,237,205,197,222,14,42,9,237,253,227,110,243,55,
+    138,137,82,70,69,185,216,1,174,146,218,155,117,193,102,81,
+    155,71,236,197,243,194,24,191,9,194,32,245,38,42,103,140,
+    245,10,10,11,71,5,221,251,174,59,7,255,154,252,154,219,
+    90,96,83,67,127,251,191,209,223,206,174,114,162,253,252,33,
+    240,110,142,29,177,196,200,83,34,116,38,102,109,11,174,157,
+    162,240,133,49,220,233,60,34,185,201,51,209,212,73,146,218,
+    22,59,250,187,82,9,121,76,20,209,170,4,228,203,170,98,
+    229,117,152,58,55,24,205,165,246,196,235,99,185,230,213,121,
+    119,143,228,238,65,108,150,107,157,154,243,71,151,252,135,56,
+    212,158,205,123,187,36,111,23,248,223,210,247,53,101,199,46,
+    63,147,175,191,71,185,121,214,91,249,226,19,23,159,200,238,
+    200,123,67,146,55,4,25,87,208,237,205,112,249,22,186,249,
+    240,244,189,211,219,167,239,37,169,31,12,217,133,110,213,135,
+    110,214,223,51,83,127,207,181,13,249,250,94,169,190,87,159,
+    114,232,147,35,88,84,203,17,74,245,75,197,181,56,234,228,
+    123,130,148,4,33,230,211,178,35,32,104,51,228,197,62,254,
+    210,38,124,67,88,37,22,235,62,204,174,110,142,193,235,182,
+    66,89,76,198,4,78,196,232,71,19,145,130,235,184,50,78,
+    198,151,201,5,15,37,142,61,41,140,164,66,39,195,201,80,
+    60,65,235,229,197,97,6,91,233,127,4,248,244,56,20,109,
+    206,216,4,32,172,140,87,105,77,112,130,4,133,24,30,254,
+    21,167,230,12,236,246,231,170,86,230,220,176,205,86,213,166,
+    247,162,19,153,77,51,238,150,156,187,229,86,85,83,118,232,
+    210,214,169,173,57,79,219,45,95,83,174,121,215,59,65,4,
+    200,150,247,237,150,124,187,115,252,238,18,52,255,203,140,81,
+    106,50,248,73,43,9,149,120,250,236,121,54,94,175,243,234,
+    80,123,169,56,199,128,132,98,202,62,100,28,45,36,26,59,
+    188,230,186,157,154,151,238,227,98,98,244,144,48,146,64,115,
+    146,204,71,211,40,194,204,134,58,138,20,46,227,251,78,205,
+    181,133,36,36,228,92,235,178,193,203,13,211,95,120,181,53,
+    219,58,27,172,155,218,147,30,72,15,188,23,172,151,130,29,
+    211,145,171,79,230,131,189,82,176,55,61,0,142,16,27,46,
+    140,79,142,231,248,122,115,195,217,24,29,179,180,52,135,116,
+    101,26,64,130,101,235,140,134,65,165,252,116,82,195,223,116,
+    202,98,45,54,156,191,120,254,226,249,11,95,156,252,98,142,
+    111,41,209,159,100,142,130,110,115,41,5,35,43,60,192,231,
+    204,214,17,177,46,30,118,107,241,43,197,83,66,223,66,201,
+    170,149,146,101,34,175,140,190,52,122,41,49,149,200,251,97,
+    25,48,225,73,174,151,27,121,18,204,142,104,146,241,147,74,
+    239,145,140,129,216,181,192,192,137,0,178,198,224,231,160,59,
+    79,51,58,78,196,27,156,216,57,103,247,56,214,205,49,42,
+    104,50,185,12,236,97,65,26,86,161,207,1,18,171,10,124,
+    122,174,4,49,41,43,224,200,8,72,145,126,248,177,176,27,
+    24,61,32,17,230,225,93,227,214,200,110,215,71,225,52,214,
+    210,188,128,54,153,35,58,147,67,220,31,177,209,247,201,156,
+    193,221,229,74,238,136,231,193,92,134,122,102,41,235,72,77,
+    188,129,209,176,66,22,2,254,17,88,119,148,8,170,120,152,
+    205,168,126,141,24,253,96,164,173,4,152,81,185,131,98,209,
+    83,213,27,84,6,32,7,35,22,102,84,49,6,96,253,172,
+    63,56,249,76,54,60,227,111,205,249,91,103,155,91,32,183,
+    125,166,252,221,230,208,244,134,171,155,242,205,61,240,187,20,
+    111,224,64,175,176,228,33,104,18,223,61,83,223,125,237,112,
+    190,254,94,169,254,222,79,139,196,235,90,135,16,249,63,189,
+    45,34,175,36,213,81,8,253,233,187,68,228,175,59,6,197,
+    255,10,253,60,11,150,254,229,106,49,23,39,233,63,92,132,
+    164,87,211,85,86,137,250,159,235,136,186,66,195,21,154,174,
+    18,249,91,85,13,217,245,151,54,79,109,206,121,66,152,168,
+    239,121,103,61,2,100,203,251,246,74,190,189,57,126,111,137,
+    21,62,147,204,29,18,245,38,107,162,142,117,213,234,21,192,
+    14,183,73,218,57,106,214,137,183,108,69,201,56,53,82,20,
+    66,254,119,208,102,219,25,29,33,127,160,56,33,31,185,214,
+    255,198,158,252,138,251,242,193,251,165,224,253,159,18,53,175,
+    209,170,65,211,243,121,24,244,239,218,74,234,96,238,132,126,
+    139,127,110,43,86,28,76,189,43,180,226,200,244,123,1,74,
+    242,23,74,73,6,197,191,180,80,156,98,4,8,224,15,172,
+    104,111,21,161,189,235,129,236,202,192,76,123,247,97,170,171,
+    194,64,73,218,235,44,73,123,127,84,148,246,62,192,232,105,
+    239,243,204,109,81,95,64,251,255,95,194,255,201,146,240,197,
+    63,68,77,65,11,244,132,120,171,98,3,25,187,18,0,77,
+    134,247,132,227,103,135,22,17,227,125,88,47,160,210,240,127,
+    89,76,136,223,176,68,33,126,195,237,9,241,27,110,71,136,
+    95,61,83,15,65,215,177,79,254,167,69,225,213,118,35,212,
+    221,85,182,184,178,185,141,89,204,219,254,53,213,209,157,37,
+    157,108,105,194,243,42,159,198,54,60,47,250,50,14,27,143,
+    122,172,178,62,219,126,105,245,212,234,156,22,172,215,122,162,
+    147,21,67,20,163,177,8,115,161,178,32,37,125,244,13,235,
+    138,139,176,32,226,223,219,176,101,245,71,138,164,83,138,171,
+    168,80,234,170,114,20,1,168,239,94,198,192,81,208,90,129,
+    187,193,88,168,100,146,172,231,184,93,143,19,109,189,66,193,
+    166,136,124,150,38,3,121,24,41,164,191,22,42,87,195,200,
+    82,230,228,51,55,253,203,103,252,203,73,142,37,69,204,252,
+    24,203,185,201,170,156,152,190,87,146,114,210,180,189,193,84,
+    214,206,25,127,103,222,223,37,81,145,230,63,190,178,62,96,
+    85,86,76,252,229,249,33,19,254,102,83,49,219,102,252,109,
+    121,127,187,228,111,207,241,237,178,53,193,36,185,27,66,114,
+    45,65,114,159,81,176,242,135,128,67,39,24,154,123,152,179,
+    121,192,10,173,2,35,227,160,184,233,19,224,52,241,17,62,
+    61,147,224,84,178,143,18,128,126,226,21,146,70,64,10,55,
+    83,212,128,11,21,48,6,217,162,189,247,209,17,135,142,28,
+    216,143,223,137,13,213,101,143,38,98,169,240,9,161,96,235,
+    125,212,218,221,236,28,35,187,242,83,23,139,56,239,179,38,
+    158,154,66,32,6,103,102,235,133,103,240,14,29,159,160,12,
+    18,187,170,197,150,11,172,185,252,95,231,136,215,16,38,155,
+    128,147,245,233,32,176,91,191,95,126,74,241,234,111,47,147,
+    23,16,130,87,127,160,246,102,96,217,76,96,217,116,71,62,
+    176,82,10,172,76,59,110,249,131,23,206,76,158,129,21,166,
+    217,228,244,64,222,127,143,228,191,39,199,223,83,130,40,61,
+    251,73,54,147,181,69,145,106,40,241,95,97,240,170,158,206,
+    215,57,42,127,156,185,137,136,254,95,107,34,194,58,172,44,
+    147,167,118,145,54,210,249,235,86,231,249,86,137,90,113,71,
+    34,230,149,89,234,207,22,113,216,253,103,155,12,150,193,76,
+    127,148,209,71,62,240,86,0,219,110,115,172,130,153,102,2,
+    188,205,17,130,163,165,0,50,155,254,249,174,206,166,29,99,
+    162,8,94,110,92,239,232,182,159,140,233,36,151,88,155,78,
+    226,255,178,89,79,33,249,78,101,10,173,5,14,233,223,84,
+    81,240,39,97,82,148,113,244,164,16,161,140,86,19,65,171,
+    40,153,8,235,161,166,44,167,16,7,27,103,49,104,237,156,
+    12,86,195,172,49,13,218,202,187,59,104,225,67,119,109,208,
+    58,7,226,130,120,226,44,26,179,167,246,252,4,140,89,62,
+    149,32,5,94,124,200,250,200,141,202,136,125,16,240,9,141,
+    244,67,51,129,208,116,117,62,208,41,5,58,255,95,64,250,
+    190,37,141,111,191,218,42,100,120,63,4,205,66,227,121,67,
+    179,44,142,231,173,167,132,155,147,193,70,152,63,46,117,254,
+    184,139,14,222,113,70,167,7,209,185,216,149,138,116,96,185,
+    46,2,86,75,152,35,31,120,209,89,115,228,3,159,28,249,
+    192,61,36,140,158,18,196,112,106,76,20,134,16,75,180,195,
+    186,219,251,25,227,138,231,165,117,58,157,55,77,235,60,142,
+    140,107,111,42,65,125,189,212,250,135,32,117,159,218,139,123,
+    160,23,27,25,18,165,160,233,102,245,61,51,213,96,24,175,
+    238,149,170,123,63,173,181,13,134,130,18,201,122,255,18,36,
+    235,59,113,227,178,179,197,228,235,42,125,49,176,148,253,25,
+    40,133,179,116,41,182,51,198,40,83,197,150,19,232,162,77,
+    21,209,28,119,177,98,5,135,231,42,14,128,0,199,196,54,
+    60,252,148,16,59,29,141,235,146,152,194,85,179,110,89,215,
+    158,138,136,57,84,70,133,157,210,188,246,200,246,174,191,225,
+    166,127,197,140,127,197,116,234,234,120,222,191,78,242,171,30,
+    87,119,197,5,25,203,146,117,116,177,104,137,242,115,208,200,
+    90,122,81,203,129,183,20,23,181,22,67,26,238,20,245,189,
+    69,178,113,235,203,70,249,61,62,86,102,244,75,91,157,231,
+    123,36,190,39,167,108,230,66,171,173,228,36,35,67,159,123,
+    203,218,141,175,201,88,0,218,135,239,40,52,208,189,106,3,
+    209,62,124,170,106,231,98,137,6,162,151,192,20,89,246,97,
+    153,167,53,226,192,75,88,76,241,145,168,69,42,101,69,178,
+    184,242,131,227,222,72,98,236,88,76,8,13,67,63,108,18,
+    191,12,229,127,1,64,26,0,172,1,25,175,9,109,14,81,
+    21,95,137,111,237,218,36,94,100,153,197,82,188,214,91,54,
+    24,184,18,30,47,83,181,248,100,37,199,112,158,111,150,248,
+    230,28,223,44,47,129,88,63,61,82,36,217,107,250,243,121,
+    190,94,226,235,115,124,189,124,239,218,76,63,2,100,203,243,
+    189,18,223,155,227,123,239,56,49,44,118,81,52,120,7,96,
+    69,131,166,99,208,28,24,139,186,45,86,112,50,24,128,170,
+    190,195,232,221,22,155,38,118,17,143,69,89,8,98,193,101,
+    64,5,139,56,43,114,224,118,168,2,99,254,87,217,95,17,
+    22,127,58,214,80,254,138,107,212,216,2,94,120,208,75,197,
+    22,240,202,94,142,14,72,8,235,160,210,196,42,39,48,32,
+    149,171,40,74,242,129,136,22,139,11,142,185,85,59,226,86,
+    45,77,31,56,196,145,11,135,56,242,88,5,51,66,103,221,
+    102,66,143,249,94,63,38,246,129,65,18,33,124,123,56,30,
+    57,19,141,164,78,138,46,22,28,235,122,31,62,118,42,57,
+    116,215,57,97,219,29,112,194,182,146,156,112,101,42,97,170,
+    130,166,21,177,83,90,17,88,199,76,228,126,168,137,33,228,
+    65,157,241,37,10,191,156,162,248,229,247,124,213,55,125,43,
+    103,124,43,175,85,231,125,107,36,223,154,52,167,231,151,119,
+    228,253,43,37,191,230,47,126,183,232,58,162,136,27,212,42,
+    88,146,119,171,242,99,26,127,22,202,79,156,143,112,104,152,
+    169,7,228,152,98,37,200,81,132,185,51,214,238,188,13,241,
+    78,214,188,129,197,98,63,61,235,39,46,227,20,188,241,109,
+    214,184,38,9,51,82,245,22,85,36,220,212,185,50,57,60,
+    5,68,167,48,117,145,28,132,51,51,146,231,27,36,190,33,
+    199,55,224,152,107,37,236,238,49,134,240,60,165,204,7,96,
+    147,211,175,15,163,67,212,154,228,28,250,77,86,46,115,39,
+    200,113,232,161,235,28,158,129,196,8,246,167,197,77,236,230,
+    214,80,120,161,47,41,35,22,81,136,64,213,203,66,182,255,
+    210,83,83,79,229,3,203,210,142,247,2,213,146,65,197,151,
+    57,124,225,220,228,185,28,223,88,66,181,77,130,140,45,205,
+    148,29,97,95,179,99,87,52,177,177,180,53,219,60,98,101,
+    221,118,26,148,7,178,110,187,178,230,149,213,47,173,190,180,
+    102,106,77,206,223,145,91,204,92,112,251,229,20,87,114,197,
+    10,137,185,186,102,83,33,105,214,238,43,192,185,116,41,50,
+    221,199,180,4,98,153,185,8,6,6,234,167,161,24,214,139,
+    32,120,125,211,168,140,141,156,192,30,51,64,156,121,149,46,
+    46,216,43,139,179,41,45,197,203,6,188,202,75,80,176,172,
+    82,48,243,74,60,195,226,6,172,197,192,252,130,182,184,225,
+    1,165,43,8,231,160,49,13,150,90,211,22,78,6,9,152,
+    3,57,198,16,47,182,6,150,60,4,149,37,15,115,118,14,
+    214,59,88,0,196,24,144,40,140,4,32,182,161,26,46,200,
+    160,220,225,104,2,178,46,3,179,21,67,247,179,248,250,8,
+    229,82,63,11,215,250,89,234,162,114,202,12,9,43,209,82,
+    148,149,136,51,31,133,149,176,212,22,120,44,181,5,116,202,
+    17,255,126,97,52,33,158,213,243,16,227,206,222,135,163,219,
+    215,252,68,48,17,21,169,132,177,10,154,94,173,141,179,102,
+    25,106,13,143,40,28,195,101,35,199,208,57,227,235,188,230,
+    200,251,122,36,95,207,98,28,195,255,61,244,120,237,98,244,
+    184,206,92,127,66,142,191,97,32,199,250,250,223,62,57,38,
+    75,178,75,17,227,243,236,57,86,172,252,68,9,54,241,129,
+    91,193,21,37,208,166,230,81,232,243,55,161,121,182,225,230,
+    65,244,56,19,185,228,158,114,167,29,179,238,0,228,56,88,
+    49,27,172,189,210,49,109,255,218,170,203,171,242,193,142,244,
+    192,39,70,178,75,144,66,76,175,77,195,93,38,215,223,209,
+    19,193,79,136,48,55,25,75,67,211,229,239,126,18,116,57,
+    100,42,129,129,44,127,239,83,35,203,205,69,139,6,84,249,
+    87,245,84,121,177,132,94,24,7,222,41,65,238,225,100,240,
+    10,12,250,223,96,172,8,114,245,18,8,178,129,2,151,1,
+    241,85,65,229,167,64,129,123,138,82,96,18,83,200,98,13,
+    65,0,81,93,246,136,3,83,93,188,96,26,81,96,30,83,
+    96,23,166,192,229,88,152,119,227,212,94,30,156,218,203,11,
+    169,189,34,62,28,217,200,143,35,27,113,8,247,84,20,188,
+    131,99,177,216,161,232,232,1,236,222,92,176,195,79,107,77,
+    38,209,209,157,211,233,232,186,88,44,20,211,83,10,227,243,
+    26,221,91,85,108,254,123,101,114,160,17,156,110,86,214,159,
+    15,138,16,227,109,132,43,254,77,189,94,80,137,57,241,31,
+    0,212,219,12,244,164,224,65,163,51,153,10,199,83,209,112,
+    74,24,111,48,20,132,186,246,7,32,27,200,133,1,45,85,
+    9,37,174,92,12,150,96,235,141,156,50,107,44,145,91,181,
+    254,147,50,106,203,209,85,175,78,159,94,84,25,170,111,104,
+    241,97,198,128,56,118,91,124,107,44,126,74,76,60,125,246,
+    71,48,43,247,48,10,182,88,114,203,94,167,91,22,7,133,
+    209,181,44,159,20,82,104,218,167,78,26,187,87,57,255,199,
+    240,221,205,220,109,127,87,220,198,25,185,130,111,48,88,172,
+    179,248,12,88,146,255,68,255,161,37,171,148,21,107,192,191,
+    55,54,230,21,248,156,97,172,140,196,132,176,40,127,240,191,
+    233,63,104,28,36,128,245,254,9,92,115,247,162,159,166,218,
+    25,71,201,247,24,44,115,235,62,22,17,146,35,16,205,57,
+    158,74,254,25,140,20,152,18,127,131,254,97,108,250,210,206,
+    69,199,102,180,244,39,113,232,223,144,254,147,230,24,192,127,
+    65,143,209,10,171,208,54,75,48,107,252,162,213,247,177,94,
+    169,218,136,20,72,104,102,189,77,163,212,252,43,93,199,77,
+    86,125,72,81,242,191,165,230,187,191,42,157,250,168,223,195,
+    156,89,141,169,77,49,95,246,15,80,169,221,202,120,1,13,
+    6,116,168,89,106,253,46,163,16,196,7,57,133,32,194,196,
+    22,183,115,242,36,192,67,19,15,25,18,99,23,203,180,155,
+    148,239,27,245,221,15,112,50,248,109,232,202,25,70,167,239,
+    246,84,78,12,128,146,187,10,136,143,12,16,129,243,194,17,
+    13,208,185,26,56,146,1,250,25,132,35,25,56,77,55,151,
+    250,105,131,15,169,128,103,33,158,140,10,156,6,165,185,233,
+    67,244,79,21,144,234,66,37,173,89,252,110,198,204,226,23,
+    79,8,165,105,69,191,160,54,32,88,230,232,158,30,83,192,
+    2,180,106,37,163,57,127,63,158,119,175,146,220,171,114,246,
+    85,100,52,81,229,209,86,35,28,100,238,116,53,130,166,146,
+    199,20,29,43,224,17,21,247,32,58,228,45,148,65,178,156,
+    71,132,227,214,145,42,174,153,91,193,192,155,38,43,244,17,
+    169,12,87,113,200,113,28,134,80,19,109,108,186,85,11,186,
+    117,120,16,0,86,203,147,24,209,133,186,197,43,11,213,213,
+    64,176,114,104,152,215,238,196,22,221,157,98,30,156,158,93,
+    34,44,231,19,97,25,105,193,153,140,142,38,142,61,137,9,
+    81,193,46,38,98,66,193,5,113,149,18,99,226,136,80,176,
+    159,18,4,177,224,30,25,217,145,136,199,209,212,19,34,5,
+    7,68,68,123,250,186,131,224,248,131,156,76,196,196,207,192,
+    209,35,156,153,193,37,222,73,114,51,170,134,255,114,84,182,
+    228,17,210,201,254,134,236,125,121,127,155,228,111,203,241,91,
+    126,188,226,190,27,167,243,43,182,72,43,182,160,95,100,155,
+    173,105,74,219,39,221,179,193,58,180,115,41,187,250,54,180,
+    243,41,191,26,67,105,187,196,215,205,86,215,234,253,6,44,
+    53,250,237,140,17,177,98,94,158,210,234,67,128,91,52,106,
+    255,145,193,105,189,181,106,90,226,92,191,86,59,140,109,131,
+    80,185,6,70,86,136,78,173,202,249,97,155,182,95,117,145,
+    163,28,191,170,132,244,188,206,60,168,232,37,100,204,83,120,
+    112,20,51,59,224,117,23,135,56,115,81,33,76,81,76,136,
+    15,15,211,197,197,39,106,121,213,168,252,190,147,9,84,101,
+    214,79,109,156,182,207,84,181,151,240,248,190,27,198,17,171,
+    82,202,203,158,149,18,42,222,211,188,193,38,178,241,194,179,
+    147,207,230,248,230,18,113,225,142,154,250,88,191,108,160,88,
+    18,4,195,93,69,60,36,34,236,101,14,51,170,136,157,195,
+    67,255,144,50,254,187,236,228,132,86,197,71,172,234,137,153,
+    133,6,165,158,102,54,97,25,175,25,5,130,117,83,187,111,
+    5,107,179,246,203,174,75,131,83,131,176,58,101,232,242,19,
+    249,250,110,169,190,123,174,204,30,40,159,99,8,112,89,56,
+    203,168,177,83,143,51,134,213,22,30,186,113,158,164,122,73,
+    183,130,194,70,55,130,182,196,233,53,101,109,133,205,28,87,
+    181,203,62,88,40,3,212,129,8,54,94,184,41,66,103,116,
+    57,72,115,224,201,132,23,91,128,109,143,16,235,34,241,25,
+    180,129,170,46,188,88,9,237,50,192,40,11,47,54,206,184,
+    155,114,238,166,119,171,106,167,54,74,85,203,115,158,229,183,
+    124,77,179,158,189,25,251,148,79,10,116,230,60,123,209,246,
+    78,63,217,163,109,158,179,249,203,23,24,4,16,177,44,217,
+    92,187,108,183,149,242,48,184,180,160,157,231,89,186,57,197,
+    181,116,216,115,58,139,111,177,113,151,172,165,179,93,1,206,
+    210,167,82,52,230,32,214,135,184,45,242,53,3,85,18,151,
+    163,186,88,174,242,166,67,150,151,10,193,206,90,173,170,43,
+    154,151,43,89,147,170,166,234,100,195,195,138,195,185,176,76,
+    193,81,159,99,233,124,90,211,212,186,116,234,91,38,103,204,
+    100,179,174,213,28,231,72,8,97,245,220,57,86,59,254,38,
+    106,151,95,80,219,134,101,244,43,254,198,88,177,22,181,14,
+    149,239,140,254,174,85,43,96,218,235,28,28,191,239,32,78,
+    83,152,12,69,147,161,112,76,20,194,145,179,161,17,133,172,
+    134,82,9,116,169,59,52,18,142,67,120,97,249,60,58,85,
+    62,222,18,78,38,163,39,226,16,171,46,158,136,175,198,201,
+    14,69,225,184,128,36,166,17,33,212,249,161,187,19,30,198,
+    167,201,42,233,241,77,240,165,36,124,42,28,143,192,14,130,
+    234,132,128,182,39,67,157,29,201,78,124,154,28,136,66,136,
+    124,111,20,137,150,209,99,49,161,203,143,89,180,130,247,81,
+    244,253,132,40,79,192,130,11,38,224,112,92,120,58,69,230,
+    48,140,176,66,89,52,137,37,225,130,227,120,56,133,170,148,
+    196,15,194,35,56,172,86,63,146,182,196,65,184,27,226,35,
+    23,236,112,1,51,23,228,107,24,75,22,202,228,170,154,83,
+    102,70,57,154,16,200,183,173,135,217,255,16,107,226,13,97,
+    50,175,120,55,88,255,202,129,151,14,228,131,29,18,40,98,
+    113,250,70,8,141,234,187,114,248,242,227,144,62,51,223,188,
+    65,106,222,128,79,221,242,84,204,6,118,207,6,130,104,155,
+    114,205,6,170,231,93,14,175,111,129,65,96,14,3,15,83,
+    221,0,140,197,123,238,192,228,230,108,117,222,221,42,185,91,
+    241,163,179,158,138,155,158,208,140,39,244,122,243,55,90,175,
+    182,230,61,189,146,167,55,231,233,69,172,127,122,39,36,225,
+    29,120,253,254,124,197,42,169,98,21,44,153,246,145,136,206,
+    55,170,73,16,231,119,214,23,139,231,252,62,207,4,130,47,
+    62,123,241,217,108,68,113,227,133,21,140,80,210,57,27,91,
+    209,241,46,148,181,90,41,238,84,249,188,183,12,10,92,6,
+    5,6,80,201,120,42,38,251,178,67,57,247,50,180,161,66,
+    66,168,245,108,123,222,211,42,121,90,115,202,54,199,49,158,
+    54,116,221,172,60,0,217,9,35,190,105,155,145,112,138,245,
+    69,180,240,116,28,103,61,10,9,232,114,18,160,201,102,140,
+    243,172,203,247,80,106,201,109,181,238,78,91,241,59,147,245,
+    186,73,174,160,17,80,208,218,49,50,113,92,41,179,200,141,
+    160,62,113,158,163,211,24,90,167,30,68,236,184,1,181,136,
+    27,151,240,148,201,156,37,182,64,60,230,97,221,123,169,95,
+    192,188,235,158,214,126,97,196,186,148,114,26,191,184,180,114,
+    26,107,215,2,121,26,116,229,164,202,130,137,139,238,105,67,
+    57,233,49,224,196,164,74,237,75,244,38,142,250,5,203,167,
+    181,95,182,115,54,237,215,55,209,209,47,168,191,100,135,190,
+    178,193,241,117,10,66,165,48,166,16,81,113,104,242,84,44,
+    138,16,100,52,30,138,11,103,66,192,141,0,50,61,4,103,
+    173,113,41,66,142,227,92,103,119,167,24,6,156,133,49,233,
+    30,5,147,174,236,72,118,201,216,20,31,162,111,116,226,212,
+    17,42,230,60,43,127,48,66,176,173,233,145,174,114,13,115,
+    138,17,56,18,0,96,121,88,69,146,226,9,56,58,201,201,
+    242,20,98,37,65,202,42,56,192,76,217,75,118,235,10,124,
+    34,22,25,198,245,145,109,156,50,127,239,36,5,24,247,41,
+    56,147,252,62,2,40,83,96,149,149,135,103,193,104,117,128,
+    189,50,112,121,255,181,246,55,186,242,77,235,165,166,245,228,
+    28,194,52,185,202,135,127,39,152,247,12,74,158,193,156,103,
+    240,61,127,125,182,227,245,90,178,152,18,35,179,239,53,188,
+    53,240,155,247,231,123,247,74,189,123,53,236,54,4,216,109,
+    8,109,111,109,32,251,223,25,34,123,180,153,211,45,32,110,
+    118,99,154,127,207,237,127,113,203,197,45,217,149,8,217,185,
+    239,145,220,8,217,213,184,124,223,78,125,231,217,111,61,251,
+    86,68,201,89,140,79,206,54,45,75,239,154,220,63,91,191,
+    44,61,48,185,103,182,14,150,104,239,134,149,218,3,202,170,
+    239,10,188,144,123,215,180,144,247,118,75,222,238,57,166,2,
+    21,53,248,43,45,223,109,121,199,254,142,144,239,221,39,245,
+    238,195,39,23,123,213,123,4,217,182,191,171,18,134,58,180,
+    77,121,49,230,69,72,87,217,207,87,187,1,249,186,1,249,
+    234,128,25,175,170,114,29,68,76,125,5,207,230,211,16,0,
+    4,205,113,109,25,191,158,89,210,112,146,201,110,202,193,12,
+    60,199,60,72,230,12,71,101,147,161,120,118,52,179,138,72,
+    96,178,194,129,102,65,79,221,54,11,250,83,244,181,34,134,
+    109,219,27,70,11,173,93,247,148,117,54,110,187,17,107,161,
+    26,106,204,43,29,8,129,211,222,69,135,53,48,166,170,197,
+    181,37,130,90,23,91,112,12,143,10,163,137,46,87,193,62,
+    146,56,117,150,8,34,88,21,162,159,153,5,199,72,44,17,
+    23,200,220,60,198,97,201,69,213,118,20,236,240,142,130,19,
+    205,69,52,199,196,97,11,141,135,8,156,139,87,229,92,224,
+    93,231,97,18,130,210,150,72,45,235,211,15,166,31,156,173,
+    66,18,221,84,95,206,211,124,171,162,122,170,62,187,254,82,
+    235,84,107,218,57,91,221,152,182,167,135,46,148,207,214,181,
+    164,157,147,94,172,30,185,188,89,93,209,76,54,153,185,225,
+    92,91,140,204,13,58,53,91,211,48,21,189,89,179,98,166,
+    102,197,181,161,92,205,138,124,205,58,169,102,93,250,225,217,
+    134,150,203,93,144,252,253,90,231,141,245,249,134,7,164,134,
+    7,210,59,39,247,222,170,93,54,189,226,234,170,111,159,207,
+    215,110,150,106,55,231,60,242,6,38,20,175,89,66,82,109,
+    161,221,172,57,25,199,152,69,26,189,34,249,173,245,12,67,
+    194,165,187,58,77,197,248,160,186,189,40,195,113,222,22,191,
+    31,146,182,167,168,84,70,88,163,163,14,52,57,37,136,122,
+    117,41,233,160,94,99,174,152,60,209,159,147,51,247,22,203,
+    78,108,246,212,80,165,0,14,146,139,136,98,66,4,170,36,
+    155,145,128,22,17,230,125,220,209,9,153,136,186,92,100,96,
+    106,132,2,143,78,172,176,6,123,44,209,67,129,73,14,179,
+    200,138,161,14,143,77,30,137,21,177,131,64,26,116,118,30,
+    108,197,82,89,105,249,195,23,97,72,146,112,231,168,163,179,
+    193,203,141,57,127,187,186,221,194,108,111,240,114,125,222,189,
+    92,114,47,7,78,116,249,156,205,233,173,153,109,108,189,188,
+    241,102,99,247,76,99,247,181,161,55,62,159,111,220,40,53,
+    110,204,240,25,254,131,57,155,221,91,115,11,33,200,224,225,
+    27,193,55,235,115,193,195,104,123,39,248,95,26,111,110,251,
+    204,204,182,207,228,183,29,146,182,29,34,103,17,81,168,168,
+    68,68,161,162,114,14,3,39,83,81,243,193,7,31,64,198,
+    128,125,23,247,101,235,242,158,54,9,177,169,202,54,87,1,
+    95,135,34,96,147,205,55,91,183,57,153,223,112,174,223,214,
+    199,89,107,208,236,172,137,131,181,225,16,44,186,160,75,244,
+    175,164,114,93,29,170,197,28,147,232,32,50,84,94,81,29,
+    222,57,111,163,83,15,20,91,24,71,189,137,45,250,38,132,
+    237,139,224,74,115,122,69,29,55,38,175,66,25,234,42,19,
+    135,212,65,132,7,73,25,18,229,96,44,144,129,116,24,227,
+    180,99,209,120,68,230,54,200,157,144,76,190,224,2,46,99,
+    24,70,167,129,213,112,169,26,225,241,10,21,207,41,167,94,
+    129,129,5,107,12,49,174,147,220,141,192,93,84,97,233,232,
+    93,96,64,210,118,149,15,209,206,202,1,17,32,207,252,181,
+    200,27,79,230,253,27,37,255,70,116,39,98,22,246,222,12,
+    118,206,4,59,175,217,223,112,221,88,255,102,95,62,184,69,
+    10,110,73,187,192,45,201,117,209,149,233,82,23,60,188,219,
+    216,138,117,192,57,188,21,75,182,136,61,164,176,129,231,136,
+    106,13,194,70,31,28,92,1,166,148,24,231,100,44,78,102,
+    221,51,170,41,90,179,1,97,150,13,128,11,106,251,31,25,
+    125,152,5,222,81,7,217,156,101,16,100,29,221,96,84,145,
+    129,147,3,79,7,21,120,88,71,11,92,144,1,239,112,148,
+    131,159,162,12,124,78,56,82,65,93,8,86,212,170,96,31,
+    187,204,129,248,14,21,236,100,221,96,80,82,65,67,57,120,
+    81,168,160,193,3,15,154,1,169,215,160,209,67,66,181,173,
+    24,67,236,211,182,21,188,24,55,168,105,11,6,98,194,168,
+    16,199,38,19,122,220,170,106,53,98,167,89,130,107,156,156,
+    35,238,156,221,164,144,113,20,91,145,136,59,229,113,101,84,
+    119,57,139,218,40,240,117,45,149,34,109,169,104,182,170,138,
+    106,182,184,14,189,221,133,123,251,22,239,87,179,126,157,158,
+    78,93,27,186,177,81,75,8,138,117,7,69,172,16,42,154,
+    210,66,142,209,12,159,117,162,222,227,28,9,57,6,11,203,
+    92,29,201,158,142,228,231,59,34,143,163,58,107,181,59,108,
+    165,102,198,246,137,166,34,117,194,198,138,111,83,198,10,196,
+    106,68,46,63,5,220,196,141,200,155,79,230,154,183,229,253,
+    219,114,252,54,121,42,25,19,31,80,83,201,48,59,206,115,
+    50,184,6,47,191,223,48,59,108,144,40,67,5,60,235,216,
+    142,61,117,172,32,121,231,249,162,35,243,209,18,35,243,206,
+    172,126,216,119,199,11,57,134,48,235,103,109,247,35,113,254,
+    62,45,187,223,9,189,221,79,157,0,101,154,93,207,106,208,
+    23,120,129,116,126,82,124,180,152,157,174,70,167,246,83,135,
+    253,155,188,26,237,232,35,90,235,234,96,98,120,211,94,133,
+    177,180,156,24,36,105,73,105,243,92,196,118,197,78,150,169,
+    254,79,40,56,247,249,190,199,197,207,22,157,1,213,198,122,
+    225,161,255,54,84,139,164,7,147,237,116,61,104,35,118,186,
+    30,121,83,86,84,222,45,227,215,117,155,8,102,79,241,57,
+    171,178,2,69,50,151,21,27,233,254,19,148,149,36,215,86,
+    140,116,72,38,88,38,81,49,182,44,219,114,15,67,144,204,
+    52,99,245,7,115,133,46,114,127,73,181,62,105,239,175,88,
+    125,171,138,81,163,241,194,240,124,188,6,60,124,173,191,169,
+    255,194,37,219,100,237,33,25,129,124,149,180,207,11,104,87,
+    176,9,49,157,58,248,2,2,227,93,250,166,145,173,131,61,
+    15,198,18,35,225,88,114,11,58,136,38,83,160,146,217,242,
+    91,208,92,33,220,92,185,186,45,100,187,214,150,173,252,122,
+    195,171,13,95,107,186,220,164,158,36,62,149,54,241,197,162,
+    157,66,252,205,44,191,252,155,240,149,14,70,118,181,123,241,
+    233,139,79,147,151,222,176,191,233,69,187,124,221,22,9,65,
+    255,86,201,191,53,199,111,45,97,172,60,194,24,71,60,224,
+    178,82,61,163,147,247,139,155,41,109,216,76,201,13,126,124,
+    29,38,166,57,131,230,30,119,213,122,125,131,153,13,156,86,
+    189,246,251,84,175,5,251,200,54,125,44,243,200,43,71,94,
+    58,114,233,177,169,199,212,147,132,46,60,78,153,91,159,83,
+    109,174,197,205,173,161,197,202,244,187,240,125,146,170,8,27,
+    93,103,241,199,174,245,191,177,31,237,72,30,208,219,51,190,
+    170,169,165,65,86,126,225,54,236,137,73,191,206,8,203,154,
+    20,215,186,200,175,23,40,177,68,127,231,83,248,45,226,94,
+    37,154,10,45,31,47,237,13,144,201,125,220,84,62,227,112,
+    60,111,163,223,80,68,100,49,73,198,244,51,231,88,90,29,
+    214,101,31,252,144,234,174,16,246,58,81,19,246,66,214,180,
+    19,130,168,27,212,160,197,194,131,26,194,23,195,66,21,60,
+    172,187,244,43,3,46,216,180,25,133,142,109,212,49,71,29,
+    83,133,210,115,159,104,240,223,35,15,126,196,14,157,231,172,
+    41,173,248,136,41,178,11,158,19,171,141,152,29,141,192,104,
+    74,24,29,30,182,154,12,63,134,193,184,139,193,30,216,72,
+    24,0,5,170,10,120,166,186,230,253,50,166,162,3,11,72,
+    211,193,171,245,104,144,238,190,145,122,243,217,119,190,64,9,
+    215,156,238,41,50,105,160,88,136,85,192,202,45,236,44,130,
+    21,207,26,77,250,49,11,186,100,225,233,148,128,68,66,89,
+    185,240,235,8,20,56,116,14,87,234,168,34,6,186,169,26,
+    140,215,23,173,92,14,42,242,13,82,145,91,254,250,236,242,
+    43,201,188,127,185,228,7,7,111,215,67,236,173,202,198,92,
+    211,150,124,229,86,169,114,107,206,179,117,214,237,123,121,121,
+    38,50,53,154,175,108,151,42,219,103,220,237,57,119,251,156,
+    93,95,127,0,239,243,76,67,235,149,36,18,25,55,231,91,
+    123,165,214,222,27,247,190,85,241,139,247,231,235,55,73,245,
+    155,230,92,232,142,121,184,109,1,64,122,199,156,135,241,86,
+    76,238,39,150,187,233,170,188,167,67,242,116,228,60,29,32,
+    139,158,207,30,90,148,142,18,84,121,110,137,196,158,30,202,
+    196,187,241,223,89,97,37,80,20,143,215,26,26,78,177,180,
+    254,41,52,91,45,35,43,238,95,222,145,181,95,246,230,131,
+    43,36,180,249,59,115,124,103,9,85,243,243,204,237,248,46,
+    44,138,107,116,115,179,136,58,195,58,238,130,109,80,252,42,
+    65,210,134,241,70,171,174,96,116,225,21,223,122,173,213,219,
+    12,120,240,154,24,55,101,84,253,119,104,158,237,12,225,73,
+    23,29,84,188,39,125,104,210,117,147,175,159,225,235,179,29,
+    121,62,36,241,161,156,178,149,8,81,250,55,139,180,100,201,
+    88,196,61,231,216,126,64,65,176,170,203,178,213,12,107,225,
+    172,117,158,166,150,157,188,135,40,171,62,194,59,75,68,101,
+    114,144,174,194,217,201,127,204,200,131,84,215,95,65,192,16,
+    156,40,28,215,247,87,212,130,121,149,205,114,127,5,125,5,
+    68,68,49,219,71,94,31,200,170,166,123,222,213,141,16,90,
+    29,44,222,244,246,96,144,225,102,3,193,87,124,47,249,242,
+    129,144,20,8,221,12,172,156,9,172,188,86,149,15,172,150,
+    2,171,115,120,131,156,222,228,102,244,172,183,226,197,193,139,
+    131,121,79,147,228,105,186,233,105,159,241,180,79,31,206,123,
+    86,73,158,85,57,101,51,207,22,149,139,127,7,129,23,216,
+    23,108,48,189,47,96,227,204,133,59,54,206,92,144,141,51,
+    23,238,216,56,147,182,165,217,227,32,202,242,52,91,103,164,
+    183,180,97,68,54,112,232,240,22,16,96,76,13,161,48,47,
+    219,100,106,88,87,156,201,187,128,138,174,31,190,136,214,213,
+    31,82,87,160,136,100,26,3,111,46,94,128,17,145,84,136,
+    159,172,27,156,160,41,93,167,97,24,128,13,196,138,198,125,
+    0,3,3,214,32,33,210,144,107,216,67,182,27,199,178,235,
+    190,254,192,171,15,76,239,188,214,159,111,236,149,26,123,213,
+    75,132,91,71,216,68,165,188,88,228,125,78,51,150,146,179,
+    184,112,41,181,112,71,143,210,166,153,42,139,194,205,67,65,
+    18,80,144,15,238,154,137,70,41,52,217,222,234,127,123,63,
+    218,229,27,246,72,13,123,208,83,254,34,230,21,221,26,188,
+    23,16,31,131,134,3,43,15,7,245,38,227,112,80,209,173,
+    73,188,192,131,160,143,161,88,162,218,18,131,192,128,107,208,
+    16,168,83,120,253,159,101,48,6,208,6,0,238,123,51,147,
+    99,144,209,100,107,131,85,231,255,171,34,61,65,231,43,201,
+    184,167,109,233,202,23,27,46,54,100,118,230,93,141,146,171,
+    81,159,165,251,58,139,251,250,186,77,235,107,34,122,28,165,
+    215,235,88,150,224,95,168,175,205,82,217,191,167,35,87,71,
+    209,206,50,39,56,221,152,106,191,144,76,230,178,124,118,155,
+    61,114,183,36,47,52,33,177,86,218,90,246,90,101,24,224,
+    138,102,222,170,19,254,55,37,114,241,107,201,150,221,142,250,
+    160,233,98,211,133,150,201,22,245,36,225,30,95,181,98,99,
+    158,177,96,99,212,143,254,27,124,128,228,61,157,197,47,154,
+    110,191,186,26,237,242,252,90,73,121,183,242,122,139,56,69,
+    69,213,245,151,56,133,54,1,163,64,20,247,165,117,246,160,
+    207,195,224,151,160,72,63,100,244,90,73,39,40,36,85,16,
+    80,194,10,17,224,228,32,42,178,10,60,172,227,33,172,161,
+    84,161,81,109,239,129,91,85,208,196,58,86,194,141,50,64,
+    111,91,6,47,146,65,185,11,76,3,42,168,225,65,125,175,
+    130,160,146,57,152,0,39,235,232,133,35,35,32,245,60,102,
+    212,148,170,171,28,201,146,116,69,83,26,101,142,112,130,29,
+    198,176,33,74,128,3,157,181,153,206,58,35,238,136,253,121,
+    214,42,138,33,214,164,226,40,4,71,60,145,114,8,81,132,
+    157,88,116,148,86,229,166,254,145,89,90,200,237,115,37,226,
+    76,234,137,212,82,185,209,37,124,179,68,148,130,37,125,179,
+    84,164,203,130,71,246,122,196,106,134,66,57,226,98,35,194,
+    241,240,88,44,85,224,208,113,129,11,71,64,216,90,198,40,
+    98,228,33,206,192,14,23,156,228,5,227,110,152,97,61,228,
+    71,57,18,122,147,32,239,66,108,49,183,196,215,221,228,151,
+    207,240,203,167,251,191,189,252,122,199,27,29,100,138,221,228,
+    215,207,240,235,111,12,229,249,62,137,239,203,241,125,179,75,
+    191,149,108,102,222,73,213,107,192,34,63,236,3,96,59,110,
+    67,188,238,42,224,129,40,143,123,138,176,105,194,246,105,86,
+    172,49,184,7,82,207,156,227,190,137,222,252,11,234,215,16,
+    191,219,125,142,93,236,157,231,108,218,29,26,231,118,90,182,
+    152,44,63,28,23,133,145,196,137,120,116,92,136,96,79,88,
+    226,255,122,60,33,18,227,123,71,178,92,81,36,97,23,44,
+    232,98,236,160,213,69,2,82,21,56,196,35,20,56,136,157,
+    2,150,81,189,57,20,59,108,17,183,171,30,213,189,213,15,
+    93,51,68,186,38,88,155,173,202,236,2,31,213,3,44,129,
+    233,254,89,240,88,127,221,46,133,122,115,85,176,221,10,84,
+    231,106,30,124,43,242,118,244,119,130,249,192,160,20,24,204,
+    5,6,63,152,245,87,78,62,125,101,189,212,216,125,237,208,
+    27,159,149,26,239,203,249,239,203,241,247,225,14,217,57,66,
+    243,246,42,121,146,99,98,234,93,8,193,210,160,105,116,184,
+    98,6,52,48,167,104,106,12,133,163,194,39,240,165,71,56,
+    83,221,177,217,0,59,187,168,214,130,26,168,58,9,234,105,
+    105,4,72,163,255,18,170,178,126,198,44,114,21,51,139,233,
+    52,159,58,215,119,45,96,200,160,133,130,230,53,3,221,44,
+    148,141,134,159,18,16,221,26,247,224,170,200,191,154,161,38,
+    77,12,145,49,107,50,167,179,169,203,103,193,107,238,198,208,
+    155,79,228,253,253,146,191,63,199,247,151,144,44,136,121,106,
+    169,241,73,139,225,165,226,120,197,38,126,203,40,156,97,246,
+    247,101,35,246,32,194,153,71,70,29,152,46,183,65,221,86,
+    50,242,202,236,23,61,23,61,153,71,137,41,253,38,223,62,
+    195,183,79,31,202,243,93,18,175,241,179,183,27,89,242,25,
+    134,177,8,109,89,65,202,64,197,180,236,68,5,41,178,206,
+    88,85,104,60,200,44,221,106,108,244,52,166,155,107,153,82,
+    14,115,233,96,217,213,120,16,151,238,212,89,240,135,80,11,
+    120,143,75,229,96,110,241,110,213,232,155,202,243,237,18,15,
+    217,27,200,246,17,195,133,174,27,139,131,159,63,194,79,209,
+    120,10,99,165,225,246,103,158,73,10,177,227,61,241,240,168,
+    112,254,252,176,220,113,209,68,28,29,142,197,83,155,138,180,
+    243,23,25,117,74,66,59,67,29,214,186,212,37,94,114,32,
+    201,109,121,126,187,196,111,207,41,155,204,127,177,59,187,188,
+    70,22,12,35,67,28,60,226,42,39,99,59,194,150,169,131,
+    143,52,233,58,229,227,70,198,235,132,130,87,29,80,140,95,
+    102,116,140,151,147,9,214,76,236,195,233,172,109,142,77,96,
+    19,222,164,134,117,128,19,60,142,249,96,119,220,63,199,32,
+    160,94,130,19,30,14,60,27,244,192,199,58,6,48,83,166,
+    194,114,125,154,138,114,211,90,90,58,97,5,226,236,118,224,
+    7,173,32,169,18,84,228,67,223,195,3,251,55,132,30,25,
+    248,204,225,129,67,67,7,30,81,127,31,58,120,96,176,127,
+    224,17,107,30,12,198,16,29,235,9,43,229,145,100,7,193,
+    206,159,102,143,128,61,211,86,112,63,2,57,195,146,216,69,
+    199,90,39,5,93,129,35,49,81,83,192,160,245,177,156,28,
+    144,163,42,98,123,195,68,95,113,238,102,251,160,248,29,116,
+    110,8,73,22,143,16,9,203,148,135,1,147,0,88,179,101,
+    17,158,59,72,149,90,37,4,27,81,119,255,19,120,75,128,
+    226,151,14,200,157,171,239,186,182,254,45,36,103,213,229,249,
+    135,36,254,161,156,178,145,22,222,1,236,190,49,50,201,119,
+    57,25,220,15,111,221,198,232,34,147,192,138,235,109,184,151,
+    110,7,146,175,125,183,40,207,188,164,254,242,60,34,36,79,
+    37,226,73,193,212,97,42,246,218,247,17,58,204,10,155,193,
+    82,247,27,208,28,223,3,240,203,38,57,28,247,72,53,93,
+    46,181,75,182,186,228,229,175,150,93,98,37,147,89,247,198,
+    175,113,50,216,236,146,83,193,25,122,195,82,72,41,46,184,
+    252,154,177,19,84,23,15,176,121,155,93,60,192,168,89,40,
+    215,68,206,79,134,149,56,182,4,86,2,99,197,241,74,173,
+    104,10,51,177,147,102,38,154,178,143,78,15,93,253,220,13,
+    251,155,174,183,214,191,189,37,239,223,35,249,247,228,248,61,
+    50,26,182,27,113,240,183,44,228,217,119,56,25,12,104,164,
+    92,147,103,89,199,94,60,204,173,32,121,201,59,31,109,224,
+    87,144,42,126,42,232,74,124,115,177,225,223,96,42,157,58,
+    7,246,1,195,241,43,10,195,97,61,190,127,192,201,96,15,
+    220,252,150,122,243,15,62,90,155,85,42,165,250,164,81,134,
+    248,246,98,13,214,104,46,154,218,98,143,64,35,252,122,233,
+    22,251,45,78,6,7,225,230,239,171,55,255,86,209,153,13,
+    11,57,245,129,151,4,251,17,7,153,219,226,113,133,103,24,
+    236,114,26,39,195,103,25,133,169,248,28,99,158,22,248,73,
+    0,71,97,90,212,49,186,240,28,129,154,137,221,179,158,192,
+    196,0,252,147,135,142,23,237,210,73,83,1,35,229,17,238,
+    121,212,153,2,246,44,51,106,73,4,231,147,90,0,6,135,
+    197,117,28,75,202,112,150,23,120,234,169,50,243,117,172,97,
+    113,69,92,36,114,99,191,128,216,210,145,112,74,136,224,69,
+    150,97,136,210,191,45,148,60,37,140,68,195,177,80,234,236,
+    41,1,75,181,17,245,182,208,41,184,79,72,9,98,232,116,
+    88,140,134,33,6,58,48,148,201,158,242,114,16,227,134,78,
+    10,162,128,87,130,166,162,232,108,232,204,73,33,30,58,131,
+    238,17,200,178,212,145,147,225,248,9,116,241,36,121,12,92,
+    212,213,55,118,135,142,141,165,208,165,104,18,191,234,152,40,
+    132,159,74,226,91,193,126,44,198,195,177,213,199,195,120,185,
+    213,169,179,169,147,137,120,104,219,193,221,161,177,36,230,113,
+    67,196,245,98,76,12,3,71,27,58,30,141,161,34,133,14,
+    39,209,221,248,101,240,214,80,27,84,168,13,215,40,76,85,
+    228,76,52,22,11,157,9,139,113,120,153,8,95,12,67,49,
+    132,179,184,30,99,240,14,92,138,68,44,130,223,5,5,39,
+    101,13,199,98,137,51,248,125,199,194,35,79,161,87,68,146,
+    234,26,174,104,44,154,58,43,183,202,225,100,248,4,212,34,
+    60,122,42,38,244,225,83,187,227,248,157,199,19,240,10,248,
+    130,124,181,27,159,62,10,173,119,148,42,35,42,61,105,58,
+    220,138,71,35,66,44,124,246,168,252,246,163,71,143,226,253,
+    72,44,156,76,134,14,37,70,133,126,225,116,116,68,88,169,
+    6,185,233,34,223,132,63,252,100,104,115,8,247,119,143,156,
+    71,115,101,103,111,60,217,217,29,234,68,221,135,59,14,62,
+    114,38,28,5,247,8,84,59,33,148,68,47,69,77,24,63,
+    209,217,165,190,9,223,183,57,100,24,66,43,241,7,208,171,
+    228,42,68,97,69,221,153,16,4,19,67,101,151,11,46,191,
+    69,41,184,57,154,152,170,127,216,194,44,166,127,136,232,252,
+    30,245,25,209,201,236,31,255,85,88,234,134,219,178,143,140,
+    60,88,194,103,30,199,184,223,201,16,72,158,76,140,197,34,
+    224,28,50,166,14,33,248,131,88,100,66,56,2,195,22,143,
+    40,243,91,122,212,123,209,240,135,110,239,11,133,227,161,196,
+    41,24,150,104,74,201,39,241,34,107,17,68,51,50,65,208,
+    224,83,70,25,20,64,125,7,110,153,65,200,170,37,63,88,
+    224,81,225,113,67,23,248,97,52,32,7,209,231,209,17,58,
+    9,71,178,216,94,112,169,21,22,127,223,36,188,99,252,92,
+    103,232,54,21,57,159,1,52,183,2,163,185,185,114,166,174,
+    53,109,159,244,204,214,45,3,63,203,57,15,83,223,8,7,
+    37,253,46,213,174,83,146,49,211,94,104,36,218,136,186,110,
+    76,189,130,72,202,94,14,27,100,254,16,240,173,41,216,136,
+    92,211,241,90,99,177,229,11,95,6,190,145,248,94,130,255,
+    255,249,105,219,140,191,45,167,108,216,43,195,50,230,185,206,
+    60,102,42,172,141,42,172,105,57,4,46,176,56,195,105,246,
+    35,28,126,141,230,221,126,4,188,91,177,34,127,5,138,28,
+    42,90,228,186,166,143,173,137,255,200,178,137,229,33,100,46,
+    175,124,33,3,132,88,178,84,172,124,228,86,252,19,0,127,
+    108,100,125,11,150,205,39,23,231,101,40,206,77,181,56,52,
+    242,80,87,7,196,76,197,73,186,149,32,155,87,56,186,40,
+    122,247,106,18,48,66,99,230,201,154,111,218,127,216,24,72,
+    2,177,69,14,8,204,48,254,159,119,39,147,99,136,0,82,
+    83,58,76,104,154,158,94,42,24,6,214,22,99,44,35,68,
+    100,108,174,160,153,112,124,68,24,134,91,251,66,201,148,216,
+    173,35,153,112,172,220,163,82,64,66,20,213,119,144,80,76,
+    165,222,160,146,7,76,232,213,7,199,237,135,4,33,52,94,
+    141,233,218,40,96,255,104,28,29,142,98,202,74,252,163,3,
+    128,214,53,166,160,39,52,136,48,15,96,26,17,36,18,60,
+    135,21,84,228,213,213,165,224,166,138,101,8,2,137,241,225,
+    79,145,102,27,111,50,118,59,125,245,85,192,81,7,240,212,
+    65,56,41,16,156,60,7,110,58,3,236,108,99,255,244,170,
+    92,99,63,217,210,253,147,251,110,241,158,140,55,231,221,143,
+    182,105,251,85,249,232,173,212,219,231,200,81,158,31,148,248,
+    193,156,178,41,90,43,18,249,205,148,62,245,55,108,50,246,
+    44,240,167,196,196,41,65,76,157,197,83,188,224,76,10,41,
+    68,3,240,128,21,255,204,66,182,250,61,78,6,130,133,202,
+    202,230,119,240,115,12,128,54,47,24,12,245,160,133,113,250,
+    64,117,213,12,186,44,156,96,196,247,252,103,201,9,158,113,
+    122,159,127,66,127,49,168,156,224,239,244,57,222,1,102,5,
+    107,72,170,244,123,86,44,46,158,112,79,50,75,83,172,234,
+    153,210,176,45,69,121,120,46,233,9,59,229,97,84,112,65,
+    66,164,129,248,216,104,146,120,114,124,29,86,155,149,195,73,
+    60,116,146,34,88,15,12,93,2,171,114,133,176,40,190,7,
+    40,81,35,121,224,12,95,15,97,51,242,254,86,201,223,58,
+    177,235,86,160,225,21,255,75,254,124,96,153,20,88,54,177,
+    27,254,137,215,200,198,130,131,144,97,183,44,155,99,106,251,
+    45,24,34,111,3,248,0,164,154,5,248,220,36,28,29,2,
+    240,83,216,240,12,224,9,0,97,0,199,1,68,1,196,0,
+    36,0,0,94,22,79,3,0,44,35,194,82,111,241,89,0,
+    227,0,206,1,216,8,223,216,13,224,49,0,99,0,94,133,
+    11,63,15,0,103,160,198,185,168,113,2,95,156,77,20,103,
+    103,196,249,232,112,134,29,28,43,31,199,231,253,109,112,192,
+    42,219,31,126,122,91,36,34,226,131,161,232,200,83,5,215,
+    182,88,140,4,18,22,191,10,207,223,15,0,114,108,19,89,
+    233,187,138,202,166,80,190,63,140,152,34,145,4,100,57,20,
+    11,159,198,210,30,209,39,252,64,17,227,10,1,210,76,212,
+    189,126,114,70,123,2,207,146,239,176,216,31,1,134,83,215,
+    40,233,207,231,224,203,63,15,157,102,19,133,2,151,60,155,
+    20,191,12,167,96,150,146,133,173,160,29,40,216,199,82,209,
+    24,241,224,1,167,8,178,114,5,119,61,100,215,16,193,247,
+    81,4,245,161,120,8,0,246,72,251,18,128,44,128,223,5,
+    240,119,0,254,10,62,249,215,0,176,255,55,238,66,144,50,
+    197,62,0,15,126,132,206,124,90,223,133,184,71,191,4,0,
+    103,252,192,195,68,235,66,220,243,208,24,184,127,200,112,114,
+    67,173,239,5,112,159,218,35,86,3,225,34,128,175,0,192,
+    61,7,243,65,188,2,64,27,158,223,135,57,82,117,92,4,
+    133,6,18,0,134,83,137,152,32,2,154,22,127,96,187,205,
+    1,132,58,29,225,228,152,144,66,212,1,199,98,196,131,4,
+    7,96,220,2,165,254,27,56,247,183,0,254,14,0,54,160,
+    97,95,231,99,138,80,78,44,1,234,136,50,12,29,241,239,
+    1,252,3,128,255,1,224,31,21,137,156,12,152,191,0,240,
+    151,0,96,46,67,92,58,28,183,216,48,223,63,228,31,28,
+    77,68,198,98,194,22,241,125,142,104,13,146,47,123,25,102,
+    142,99,89,118,78,100,25,214,51,225,134,255,89,198,63,129,
+    255,103,25,183,114,198,53,129,255,103,153,242,9,252,175,94,
+    154,179,115,172,109,142,89,28,240,12,27,204,49,85,100,155,
+    115,114,236,58,56,47,3,15,199,246,193,145,12,208,207,251,
+    225,72,6,30,198,235,159,112,205,57,93,108,213,28,99,6,
+    153,161,121,216,45,104,103,155,186,217,134,57,198,12,178,91,
+    240,110,30,192,130,118,233,40,251,56,203,110,156,99,172,225,
+    60,134,11,244,249,61,92,53,123,239,28,99,6,153,212,244,
+    179,248,96,30,192,130,118,113,237,195,44,124,205,26,230,106,
+    86,204,227,131,5,250,210,144,109,128,101,119,33,178,83,124,
+    151,137,206,147,131,5,253,213,131,182,42,118,63,250,101,13,
+    231,49,92,160,207,119,51,174,234,180,39,243,57,146,214,115,
+    194,49,235,107,72,199,178,91,243,190,85,146,111,21,234,228,
+    246,74,54,56,199,152,65,250,72,182,106,30,14,22,180,243,
+    107,31,99,217,222,57,198,26,102,203,231,241,126,129,190,242,
+    16,87,195,174,159,99,204,32,243,196,60,236,22,180,179,125,
+    109,108,235,28,99,6,185,138,182,107,113,124,52,15,96,65,
+    187,186,135,229,88,136,154,110,2,233,123,230,97,183,160,157,
+    69,195,46,8,71,70,144,30,135,59,131,11,218,89,79,177,
+    119,246,45,249,157,123,150,252,206,61,75,126,231,145,159,224,
+    119,90,223,249,228,146,239,236,251,24,222,105,117,167,15,142,
+    140,128,220,233,91,208,206,122,106,216,102,24,178,70,0,117,
+    71,187,5,237,236,186,38,22,34,235,91,195,244,158,172,99,
+    30,31,45,208,215,182,184,89,88,145,110,2,25,132,219,208,
+    110,65,59,219,84,236,206,62,211,157,109,236,50,152,50,70,
+    0,45,139,118,11,218,217,61,108,7,160,102,51,200,160,41,
+    133,118,11,218,217,131,236,62,27,70,51,197,119,25,132,18,
+    240,193,130,254,106,196,222,205,174,1,4,109,4,80,32,180,
+    91,208,206,62,193,246,225,182,177,134,208,40,125,184,5,169,
+    43,227,108,57,123,223,28,163,7,13,76,245,202,28,83,49,
+    231,116,176,21,115,140,10,2,235,160,175,204,0,218,112,29,
+    244,165,122,54,206,174,101,219,230,24,51,128,74,162,221,130,
+    118,54,198,34,44,191,22,227,122,11,152,113,97,138,176,118,
+    129,190,242,89,27,218,245,224,31,22,48,83,143,31,233,89,
+    160,175,12,217,60,1,68,128,21,48,225,153,107,105,101,55,
+    207,49,42,232,103,59,217,77,115,140,25,64,43,163,221,130,
+    118,246,20,203,120,124,19,252,28,223,14,152,219,12,210,207,
+    206,195,110,65,59,123,144,189,23,200,153,25,164,251,166,235,
+    240,193,60,128,5,237,98,156,245,1,246,48,131,76,112,30,
+    118,11,218,217,54,14,90,221,12,160,169,57,232,21,245,172,
+    143,169,109,194,76,71,29,144,99,51,200,85,35,250,91,7,
+    244,90,61,125,223,74,118,197,28,99,6,233,248,60,236,22,
+    180,179,143,178,69,110,205,248,140,183,30,97,219,217,14,104,
+    25,35,72,15,66,203,117,44,104,103,7,89,23,27,2,102,
+    198,8,210,2,48,59,161,5,237,108,221,71,191,243,176,233,
+    206,78,104,59,51,128,9,222,9,109,171,158,29,66,184,0,
+    38,149,53,204,140,101,159,156,199,71,11,244,181,131,168,33,
+    224,135,53,204,8,217,35,243,248,104,129,190,118,148,93,1,
+    104,216,12,178,81,188,155,7,176,160,93,26,98,25,190,122,
+    226,252,151,190,248,252,23,39,236,115,78,150,133,112,33,10,
+    40,103,220,254,201,149,19,101,179,229,62,188,243,84,167,119,
+    103,194,217,218,188,103,153,228,89,134,152,205,166,35,54,104,
+    12,107,56,143,225,2,125,254,89,187,147,133,32,11,214,48,
+    123,255,60,222,47,208,87,106,246,97,22,200,26,206,99,184,
+    64,159,143,216,186,89,240,156,177,134,243,24,46,208,231,145,
+    84,198,58,94,112,63,231,206,121,154,114,45,61,121,102,141,
+    196,172,201,49,224,125,205,130,203,134,53,204,180,207,227,253,
+    2,125,5,17,190,94,56,52,130,204,122,184,185,119,65,59,
+    27,176,177,96,21,183,134,48,139,97,191,64,95,41,47,85,
+    154,108,249,109,148,38,219,96,44,141,143,241,213,35,105,197,
+    83,135,100,151,170,246,28,19,152,173,108,159,240,207,121,108,
+    128,219,205,0,134,18,218,65,33,43,22,180,75,229,155,89,
+    208,255,88,195,121,12,23,168,51,239,63,100,99,188,213,16,
+    46,244,194,129,201,3,19,174,91,222,26,136,167,151,247,54,
+    75,222,230,137,242,57,167,29,136,128,10,124,125,110,132,157,
+    21,48,81,6,255,88,108,251,63,199,27,145,153,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/params.py",
+    "m5.params",
+    embedded_module_data,
+    37517,
+    119446);
+
+} // anonymous namespace
+} // namespace gem5
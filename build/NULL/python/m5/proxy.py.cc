@@ -0,0 +1,342 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,189,90,111,108,19,215,150,191,227,25,219,227,196,201,
+    56,254,151,224,4,98,146,128,49,165,252,45,255,182,133,22,
+    18,2,180,144,162,7,175,93,242,182,245,26,143,3,1,199,
+    78,199,19,32,174,67,243,186,125,90,131,34,213,116,121,91,
+    183,5,213,31,186,93,208,235,211,242,86,149,182,95,158,212,
+    247,109,181,159,60,104,36,44,75,145,144,86,149,246,125,51,
+    162,93,177,104,165,221,115,238,216,227,25,219,161,116,247,237,
+    198,206,241,220,123,207,220,63,231,254,206,185,231,156,153,127,
+    37,134,63,107,237,247,81,25,200,199,68,36,34,147,32,147,
+    196,66,14,19,209,242,1,17,217,47,45,132,252,198,82,103,
+    159,100,104,11,7,45,214,56,243,37,11,109,172,222,102,161,
+    109,54,104,179,183,180,177,180,141,135,54,71,75,27,39,118,
+    124,64,38,173,148,163,19,56,156,77,99,218,44,36,110,19,
+    187,196,238,175,132,166,22,59,109,233,22,187,90,90,120,209,
+    37,246,156,181,76,58,68,230,36,9,187,255,136,149,19,49,
+    227,202,235,227,63,170,0,249,107,88,123,28,86,39,194,42,
+    68,6,102,195,226,234,39,185,28,153,98,68,246,3,126,210,
+    138,107,174,205,196,250,1,249,146,129,209,152,198,60,226,246,
+    73,158,182,217,90,218,28,180,222,222,82,223,65,235,249,150,
+    250,78,90,239,104,169,119,82,41,117,161,132,38,187,69,39,
+    80,1,56,93,113,161,137,79,16,187,160,173,39,71,46,51,
+    147,110,88,123,119,197,113,48,154,142,159,144,82,151,231,99,
+    186,208,225,207,82,19,194,163,173,116,235,179,76,150,68,244,
+    198,172,5,74,122,167,103,9,148,116,225,138,228,36,185,195,
+    76,132,217,138,51,146,142,71,165,216,57,248,73,76,85,58,
+    234,165,185,217,10,23,73,205,166,239,176,21,142,182,116,26,
+    217,28,58,87,26,135,15,6,131,79,252,105,41,182,101,118,
+    94,62,151,74,110,153,217,185,101,22,231,186,121,118,190,194,
+    71,34,211,201,105,57,18,201,184,245,53,108,174,215,109,131,
+    155,211,3,64,22,73,121,32,148,227,84,126,85,57,48,156,
+    227,150,132,178,215,15,63,142,28,124,30,225,132,99,250,66,
+    106,75,166,203,190,162,45,155,156,215,155,164,14,40,233,188,
+    105,86,100,22,152,164,199,200,145,54,113,72,128,18,224,176,
+    136,236,2,147,101,68,46,131,130,35,69,93,80,198,191,47,
+    225,255,55,122,9,57,97,111,172,19,21,238,36,202,196,118,
+    34,42,197,147,114,165,107,52,149,156,154,75,199,69,186,212,
+    39,204,230,48,43,217,113,36,30,72,133,155,141,202,231,194,
+    22,169,19,11,76,58,109,161,226,147,186,177,104,143,68,210,
+    178,4,146,234,49,74,138,86,237,194,137,159,210,4,213,41,
+    168,157,3,85,98,117,4,139,167,190,136,208,139,178,203,159,
+    59,144,59,80,238,241,169,61,67,85,194,66,147,252,197,123,
+    244,162,236,234,195,166,7,174,65,104,23,92,249,29,87,47,
+    21,188,159,175,250,116,213,39,253,55,251,21,97,164,196,143,
+    72,46,20,176,17,87,214,186,128,111,2,249,53,131,200,42,
+    182,147,8,152,26,51,116,211,30,217,208,143,104,201,50,159,
+    129,1,186,197,154,185,222,103,100,107,131,203,44,214,162,113,
+    30,250,31,32,219,98,54,15,12,197,112,152,155,168,48,145,
+    140,63,22,77,38,83,114,48,29,151,131,81,89,150,166,207,
+    204,201,241,96,40,211,19,10,166,146,65,138,197,96,234,204,
+    249,120,76,14,115,149,142,180,28,149,228,244,165,105,249,92,
+    165,251,64,157,251,144,36,165,164,138,53,61,55,27,151,42,
+    157,32,246,184,140,61,69,34,97,78,219,44,14,139,21,235,
+    197,104,98,46,94,113,68,34,177,68,52,157,6,62,142,238,
+    96,112,145,238,161,180,6,145,225,51,237,95,189,163,151,81,
+    62,167,129,60,134,77,20,60,31,190,119,237,189,66,90,17,
+    134,85,97,24,119,170,123,217,13,155,245,202,109,111,201,245,
+    138,246,125,200,90,60,221,223,19,32,85,98,233,234,254,193,
+    70,28,221,87,237,75,246,251,124,255,61,190,191,48,86,92,
+    167,240,27,84,126,67,169,254,213,54,210,168,41,186,129,112,
+    19,205,66,82,107,200,124,192,35,218,65,124,150,137,152,17,
+    234,184,43,30,100,255,186,182,239,178,161,179,44,35,27,120,
+    101,174,113,61,213,180,55,233,53,178,221,120,95,19,70,4,
+    217,209,104,109,70,208,251,96,195,206,235,232,40,218,218,161,
+    225,42,224,10,198,52,221,199,128,218,210,5,101,118,157,208,
+    246,27,54,50,154,20,131,51,115,105,57,120,38,30,140,6,
+    99,169,36,108,125,82,14,166,36,40,105,168,144,83,120,25,
+    149,162,51,97,123,165,99,58,61,77,89,98,241,10,59,13,
+    186,108,157,74,164,162,114,197,62,157,166,220,21,199,169,249,
+    89,13,41,18,46,161,98,139,206,206,198,147,34,104,56,133,
+    136,189,54,102,197,65,47,228,105,24,80,179,143,26,58,42,
+    150,212,108,102,181,1,28,103,227,73,48,178,155,95,74,164,
+    98,209,68,122,255,230,212,236,97,20,80,68,3,201,178,119,
+    77,225,210,111,61,191,141,223,118,42,222,157,170,119,39,192,
+    164,203,253,251,222,111,123,149,189,71,213,189,71,105,113,217,
+    63,88,246,30,3,168,244,186,1,42,189,110,128,74,143,187,
+    106,35,93,61,75,71,239,59,7,238,57,7,10,211,183,123,
+    75,171,183,41,206,237,170,115,123,201,185,189,236,233,205,189,
+    70,161,114,7,228,37,61,135,176,221,132,195,226,254,253,165,
+    110,139,180,185,153,108,145,86,53,142,188,195,218,20,171,22,
+    155,163,175,74,218,16,23,113,185,115,14,13,145,70,136,233,
+    136,116,18,205,118,103,153,140,21,45,169,132,91,45,61,143,
+    211,178,212,4,152,20,35,209,198,229,25,163,177,124,194,191,
+    148,136,206,156,17,163,251,141,231,74,189,238,103,56,69,220,
+    146,69,114,119,239,55,243,202,142,35,139,228,217,166,210,105,
+    158,138,180,181,46,152,218,184,210,14,32,237,134,124,195,48,
+    228,252,183,123,149,221,199,158,117,72,203,255,116,200,55,27,
+    67,126,227,248,246,180,178,103,162,221,144,250,97,217,240,17,
+    138,237,148,170,249,120,107,72,226,14,83,225,207,198,229,55,
+    208,242,61,251,236,126,129,140,189,116,118,197,211,119,87,221,
+    223,54,122,111,219,168,178,237,144,186,237,144,178,238,208,159,
+    114,166,6,1,238,254,73,2,124,219,52,197,240,253,237,99,
+    247,182,143,41,219,199,213,237,227,202,186,241,250,20,219,30,
+    140,255,73,167,40,50,162,37,65,102,152,5,22,205,207,121,
+    125,49,99,228,173,153,191,128,210,2,183,96,53,153,66,171,
+    217,104,73,199,179,214,162,193,144,26,56,155,204,27,244,211,
+    105,236,39,203,158,215,77,99,147,241,21,100,161,193,41,182,
+    28,189,48,34,255,227,66,93,0,95,62,203,193,22,88,205,
+    189,47,48,75,73,122,114,112,19,127,196,78,1,27,54,106,
+    62,211,153,208,74,118,55,57,55,19,151,166,193,194,213,12,
+    173,163,66,164,125,184,122,180,161,82,136,160,185,153,75,82,
+    11,43,141,96,169,103,66,187,227,4,178,107,176,219,128,172,
+    123,128,132,109,154,173,181,73,241,244,92,66,174,112,103,96,
+    91,181,238,168,37,219,136,34,64,209,4,233,159,102,205,120,
+    48,91,177,115,241,216,5,147,19,90,171,195,144,34,253,25,
+    161,190,21,63,80,50,127,31,12,173,255,34,92,37,29,142,
+    173,148,40,206,53,185,163,249,75,223,9,254,252,37,69,24,
+    84,133,65,240,191,186,158,47,7,214,126,190,229,211,45,183,
+    71,148,192,22,53,176,37,111,255,174,119,109,49,116,123,151,
+    250,220,168,210,59,166,246,142,85,9,211,243,58,179,28,24,
+    46,141,28,87,2,19,106,96,162,228,157,128,187,238,7,54,
+    222,11,108,84,2,155,212,192,166,188,29,204,182,127,48,127,
+    186,112,177,120,73,241,109,81,125,91,114,227,185,241,7,130,
+    47,215,213,170,44,40,59,138,68,191,69,83,150,5,136,122,
+    22,88,147,47,220,7,10,100,244,6,86,68,87,13,171,172,
+    17,195,210,65,17,3,8,29,253,80,178,52,74,89,54,61,
+    146,181,156,215,177,187,0,173,105,38,25,248,201,35,178,255,
+    48,34,50,166,113,192,51,49,141,115,216,136,124,17,230,216,
+    222,41,48,227,247,51,240,229,97,53,186,238,157,231,13,45,
+    86,112,103,159,173,15,219,45,123,139,235,234,49,172,138,147,
+    189,134,187,77,154,34,109,4,253,33,23,104,89,18,228,94,
+    195,26,90,250,204,114,69,103,187,249,180,88,1,232,177,216,
+    213,150,19,116,213,60,62,232,40,63,49,126,42,227,27,141,
+    38,67,114,16,212,37,149,184,24,175,185,61,161,76,39,184,
+    198,83,65,25,252,25,40,240,161,224,148,148,154,9,134,158,
+    48,161,140,107,116,62,150,136,7,167,147,193,154,82,134,187,
+    105,0,83,225,166,166,147,162,22,198,240,145,139,224,43,201,
+    113,17,28,133,89,26,247,72,24,198,73,126,108,180,69,102,
+    197,120,58,86,113,204,98,247,24,192,80,181,150,16,44,21,
+    231,207,230,146,242,244,76,205,139,66,159,88,26,5,18,182,
+    82,181,150,14,34,15,11,190,122,133,19,83,201,184,116,0,
+    202,105,180,186,13,109,166,55,25,253,146,218,52,101,100,221,
+    192,80,61,238,118,231,216,178,224,205,113,15,106,209,18,227,
+    216,88,238,31,252,124,239,167,123,139,39,63,217,127,115,255,
+    213,99,185,241,252,24,180,46,189,92,37,78,199,16,168,222,
+    234,181,185,177,165,227,192,149,27,93,58,86,246,7,170,132,
+    235,218,92,246,175,186,113,33,207,150,123,3,168,194,129,178,
+    119,85,121,112,248,243,249,79,231,111,123,62,185,114,243,202,
+    117,103,222,86,224,170,14,210,219,79,217,171,78,178,122,136,
+    118,51,64,123,123,32,120,160,158,250,246,249,205,15,60,189,
+    31,239,253,104,239,245,23,111,188,152,135,79,145,251,162,83,
+    13,238,44,209,239,93,249,159,230,255,113,254,119,239,126,253,
+    238,93,248,84,89,166,103,140,121,200,178,232,255,179,232,255,
+    179,224,255,119,16,167,63,63,117,107,90,233,220,160,118,110,
+    192,152,33,92,22,124,5,239,181,43,185,43,203,254,161,210,
+    240,78,197,191,75,245,239,42,185,118,149,125,253,31,191,253,
+    209,219,197,81,197,183,65,245,109,64,43,226,249,112,225,218,
+    66,225,141,226,41,69,216,168,10,27,75,252,198,86,163,130,
+    59,68,141,202,159,19,205,168,136,117,0,91,208,187,118,80,
+    135,101,149,206,190,64,146,189,195,68,54,116,48,2,1,56,
+    131,247,49,23,168,10,75,204,251,228,52,73,114,151,200,101,
+    246,52,185,196,212,124,116,9,59,13,51,212,170,131,11,122,
+    12,55,221,10,224,138,95,54,5,196,232,117,208,90,163,217,
+    174,215,253,45,110,247,207,137,22,18,187,242,99,215,246,229,
+    246,149,61,254,220,171,85,11,231,240,151,221,190,124,252,198,
+    198,220,104,110,244,241,178,0,62,169,197,225,111,16,128,70,
+    129,185,150,201,101,202,46,95,149,37,174,64,46,83,101,161,
+    254,241,227,199,213,14,226,242,228,58,210,168,143,215,120,15,
+    249,155,158,16,28,161,33,182,189,27,231,37,173,121,23,177,
+    238,141,192,2,143,106,11,164,39,150,149,106,133,105,129,221,
+    16,28,70,232,161,24,193,182,76,95,99,153,230,150,191,199,
+    197,118,105,139,245,247,231,184,165,206,28,124,232,6,134,61,
+    152,99,73,70,103,226,145,72,165,35,18,153,73,137,115,9,
+    188,118,70,34,239,204,69,19,90,139,132,62,129,212,71,106,
+    33,170,180,153,104,9,135,153,185,4,176,66,7,146,118,5,
+    145,175,44,205,197,197,233,139,90,15,16,0,165,36,189,36,
+    53,218,186,160,212,104,164,58,172,105,243,9,170,229,16,69,
+    201,211,177,153,184,124,46,37,74,39,177,170,171,22,50,199,
+    226,9,24,232,14,35,173,197,53,161,105,123,69,83,107,174,
+    78,168,255,22,98,104,128,81,255,84,45,172,181,23,32,95,
+    39,29,118,235,186,42,209,137,219,106,133,83,186,13,233,118,
+    88,33,36,210,73,31,17,252,185,179,37,255,17,248,42,221,
+    71,213,238,163,139,135,203,130,127,241,8,232,191,39,144,15,
+    149,2,199,224,171,184,143,171,238,227,139,175,149,161,106,119,
+    169,127,2,190,138,231,117,213,243,250,226,49,224,243,246,231,
+    119,151,249,67,37,254,16,68,93,94,27,68,93,94,27,109,
+    240,13,228,15,151,249,241,18,63,14,13,62,108,240,217,22,
+    143,87,157,130,21,80,167,147,161,160,245,185,42,209,201,24,
+    211,97,5,27,161,147,62,226,26,200,101,11,71,20,97,157,
+    42,172,131,137,117,48,86,180,95,79,33,20,6,84,114,166,
+    236,104,29,176,143,254,140,152,179,163,245,28,192,36,75,175,
+    44,112,197,137,44,230,111,181,12,41,102,71,39,237,52,251,
+    200,131,186,218,42,14,204,146,104,217,71,163,179,170,91,139,
+    115,164,53,91,208,148,213,105,239,20,180,201,234,100,89,99,
+    158,146,102,45,27,174,129,174,89,156,180,26,215,44,80,189,
+    138,208,204,76,7,34,127,122,106,58,46,165,235,135,9,234,
+    176,132,90,35,13,34,161,128,171,159,37,181,124,13,246,144,
+    113,235,235,211,51,147,95,33,239,22,162,197,225,124,151,150,
+    118,233,187,199,247,21,250,139,211,10,191,85,229,183,150,248,
+    173,101,223,42,208,197,142,114,96,0,115,150,57,248,180,218,
+    84,123,93,74,107,152,159,150,75,147,134,140,185,180,38,121,
+    182,77,80,162,117,110,118,2,76,225,7,56,113,77,78,138,
+    223,148,139,1,217,127,70,192,113,194,172,157,245,150,181,197,
+    245,49,56,98,141,240,35,219,148,230,70,87,176,225,120,181,
+    15,54,154,115,66,176,239,22,132,218,132,20,192,89,161,217,
+    204,140,232,185,57,112,94,166,226,224,100,196,226,152,206,59,
+    147,154,131,240,66,243,99,54,72,62,96,125,194,132,195,14,
+    169,31,239,68,88,160,17,59,91,207,186,85,236,231,162,105,
+    188,164,14,74,133,139,165,48,41,45,198,227,179,120,37,137,
+    120,83,152,80,72,81,204,32,82,42,124,50,126,137,102,186,
+    53,204,152,83,124,103,113,114,62,35,100,244,193,126,135,220,
+    5,66,81,3,190,197,135,47,95,123,185,176,67,233,28,84,
+    59,7,209,5,217,177,236,233,187,190,251,198,238,251,158,245,
+    247,60,235,139,242,237,83,138,103,187,234,193,164,204,114,167,
+    59,255,66,161,79,233,28,82,59,135,26,233,192,35,223,140,
+    148,92,71,224,251,173,87,251,133,111,115,90,208,73,188,125,
+    55,246,21,189,138,103,189,234,89,159,227,203,188,75,229,251,
+    239,243,67,247,248,161,226,11,122,138,176,44,244,182,131,167,
+    174,196,255,70,240,40,91,57,225,215,18,101,26,82,184,173,
+    73,188,31,129,157,57,5,216,154,30,254,191,6,26,55,145,
+    25,62,97,72,11,3,194,222,153,155,6,31,25,220,94,57,
+    126,54,46,5,169,143,161,1,113,205,81,188,14,234,57,189,
+    38,16,2,244,168,123,187,14,9,141,83,209,30,106,254,240,
+    52,18,140,200,12,64,171,37,11,217,11,241,121,233,2,138,
+    178,246,8,69,115,9,52,236,130,107,61,19,137,180,160,76,
+    171,254,3,222,244,14,65,103,96,89,88,85,24,190,165,103,
+    145,25,199,40,179,236,238,47,13,28,80,220,7,85,247,193,
+    146,243,96,19,176,52,142,96,105,173,129,195,211,187,34,124,
+    118,40,124,72,229,67,37,62,180,2,124,244,132,72,144,134,
+    161,142,38,0,25,31,181,52,37,18,104,184,106,4,81,214,
+    210,2,19,151,169,183,150,118,12,31,37,139,200,54,89,185,
+    166,160,41,13,48,89,96,146,252,48,108,254,105,130,220,154,
+    47,250,180,123,36,8,110,87,72,204,48,205,32,124,90,63,
+    119,71,140,217,236,49,242,86,102,129,147,13,1,28,4,144,
+    221,141,82,211,234,123,204,171,207,114,205,18,76,14,54,245,
+    229,90,177,47,7,222,111,240,220,45,73,198,241,84,169,253,
+    233,36,176,244,46,236,156,117,74,179,239,227,18,102,184,33,
+    4,24,7,181,2,52,235,105,34,136,18,167,147,103,49,53,
+    95,211,192,83,97,71,197,94,179,172,18,58,54,154,90,97,
+    186,72,115,52,169,70,209,124,17,139,33,38,170,95,253,224,
+    167,1,5,123,49,154,168,216,235,113,42,51,211,28,70,98,
+    30,59,211,221,208,48,140,110,255,5,234,210,155,104,12,89,
+    181,184,28,131,203,110,208,175,130,124,51,163,184,55,170,110,
+    8,39,208,251,62,188,44,248,243,233,194,171,138,16,82,133,
+    16,232,84,215,142,229,192,218,226,112,49,163,4,182,171,129,
+    237,121,251,3,193,143,213,195,229,222,161,252,187,223,121,2,
+    133,29,215,95,186,241,18,70,136,129,42,79,122,3,121,22,
+    2,13,142,113,12,150,61,107,48,20,132,184,99,185,219,151,
+    143,93,77,44,37,80,71,135,33,124,249,248,185,143,158,43,
+    196,20,247,144,234,30,202,141,254,192,130,231,106,96,120,208,
+    227,187,1,103,10,239,8,81,146,59,128,150,96,237,173,147,
+    138,176,86,21,214,98,82,106,207,178,127,117,33,86,220,118,
+    61,117,35,149,103,243,236,114,79,127,225,0,152,138,158,97,
+    181,7,31,56,117,237,129,216,182,176,246,198,20,54,62,112,
+    237,166,75,189,190,233,198,38,156,121,8,218,62,190,240,209,
+    133,226,176,226,95,175,250,215,231,89,152,0,172,163,193,240,
+    248,129,224,206,143,229,230,75,124,95,26,97,247,254,222,3,
+    2,249,125,15,144,63,8,150,3,94,214,244,24,74,183,18,
+    69,210,252,192,118,193,100,35,64,67,246,3,158,76,86,65,
+    54,164,106,90,80,13,142,108,214,242,25,185,101,201,116,209,
+    228,100,176,233,94,254,169,247,130,101,200,64,239,181,123,247,
+    47,189,76,83,155,236,4,245,42,50,220,47,214,137,111,1,
+    164,98,38,180,73,104,121,53,180,213,44,57,51,43,209,220,
+    131,209,142,211,76,136,17,93,248,220,23,95,97,72,79,17,
+    26,197,57,93,75,175,230,152,178,182,141,54,199,30,74,218,
+    109,99,217,213,147,127,179,0,255,249,55,175,59,243,76,158,
+    105,179,145,192,242,70,33,122,125,242,186,128,12,176,153,101,
+    193,149,227,181,240,208,33,225,115,99,9,35,101,9,31,82,
+    104,145,32,58,49,82,178,174,6,116,182,18,166,195,37,140,
+    99,141,81,89,180,78,208,249,76,227,3,247,166,168,108,53,
+    6,100,45,164,163,203,10,65,119,27,18,180,227,149,78,220,
+    171,173,171,170,68,39,251,29,214,30,140,212,86,38,90,176,
+    131,19,50,5,59,117,4,61,10,80,132,181,123,17,4,45,
+    127,152,171,240,7,146,243,90,44,211,246,217,195,43,26,66,
+    87,240,209,141,88,109,164,74,205,22,175,30,163,176,21,30,
+    77,74,36,154,156,167,126,68,197,74,243,97,119,44,13,27,
+    101,122,74,65,237,81,87,125,118,212,28,253,59,206,104,149,
+    6,24,193,253,97,246,90,182,48,118,243,53,117,224,121,69,
+    216,172,10,155,75,252,230,214,71,190,76,125,37,54,162,61,
+    162,160,25,151,10,139,211,160,79,215,24,58,62,221,99,35,
+    86,27,35,35,84,255,3,123,176,215,70,246,230,230,232,56,
+    19,119,172,205,96,106,160,135,62,187,162,155,67,251,188,92,
+    39,63,96,79,219,105,79,13,216,48,214,45,24,186,214,136,
+    141,177,250,240,170,153,104,221,93,254,223,236,117,34,241,255,
+    187,215,137,4,221,107,233,93,36,217,21,182,184,54,41,186,
+    197,184,26,105,161,46,187,103,219,73,24,132,74,123,177,253,
+    62,214,187,199,125,100,177,251,95,214,187,159,144,222,111,179,
+    85,191,170,147,255,194,139,191,210,27,127,213,60,33,221,140,
+    127,77,76,79,191,24,134,152,204,46,49,154,236,44,211,120,
+    74,208,252,162,64,205,121,51,223,219,209,40,201,134,172,120,
+    203,189,189,89,60,46,188,112,92,24,158,119,181,184,49,32,
+    0,28,99,201,39,114,244,109,29,233,69,172,125,9,200,169,
+    241,48,47,237,199,18,125,122,100,72,81,31,146,207,197,165,
+    100,92,62,32,138,82,133,75,76,167,229,138,85,158,155,77,
+    196,169,247,1,102,255,88,253,174,10,115,209,108,246,67,117,
+    98,135,41,164,47,17,170,64,92,95,201,252,253,206,222,147,
+    31,190,229,40,238,82,135,119,149,122,119,43,246,61,170,125,
+    15,38,172,6,202,130,39,39,47,59,60,249,209,91,35,127,
+    103,45,172,86,28,33,21,207,120,22,154,122,188,152,188,28,
+    160,4,79,10,127,254,157,171,153,165,12,30,199,3,229,222,
+    254,188,156,151,171,44,92,63,232,116,229,118,106,112,50,108,
+    222,79,80,27,39,197,207,120,52,38,167,164,21,94,56,27,
+    34,63,246,194,153,158,172,1,131,215,72,196,224,230,154,37,
+    70,51,48,62,227,136,122,18,198,139,50,244,105,50,236,95,
+    143,175,135,245,149,87,13,229,184,165,238,28,124,158,18,140,
+    252,115,109,118,34,83,75,95,7,76,174,180,65,177,141,79,
+    188,154,83,39,232,32,212,238,31,50,61,25,107,118,157,159,
+    177,63,99,204,187,210,61,217,166,55,43,53,119,228,61,28,
+    245,42,161,14,46,53,172,13,129,82,229,197,227,176,150,102,
+    166,9,12,147,209,161,249,138,190,38,1,235,41,139,62,148,
+    241,25,82,123,179,44,191,19,211,232,203,158,254,194,152,58,
+    176,233,182,248,85,82,241,236,83,61,251,74,206,125,229,174,
+    158,252,207,175,189,149,123,11,32,186,116,5,65,183,179,236,
+    122,161,45,235,119,158,129,194,41,117,245,243,183,229,175,174,
+    124,35,43,158,49,213,51,86,114,142,105,38,40,220,114,134,
+    52,28,146,38,195,148,175,19,15,78,114,55,49,159,33,22,
+    43,120,63,58,225,121,235,33,6,124,225,182,84,235,19,123,
+    26,63,37,125,132,215,248,16,79,194,151,162,194,29,90,144,
+    206,213,229,168,9,152,138,53,164,79,66,103,199,156,121,20,
+    19,216,77,115,125,194,191,164,37,222,247,75,191,38,154,174,
+    165,15,2,5,133,100,152,234,36,67,24,231,98,39,126,170,
+    182,203,12,3,58,220,158,62,164,244,123,99,253,69,246,48,
+    195,128,239,211,158,230,29,15,233,239,247,198,150,83,22,43,
+    3,39,104,43,201,205,63,196,159,239,27,181,222,103,230,116,
+    57,176,127,157,244,117,49,40,221,246,244,33,165,223,27,235,
+    135,72,135,63,55,80,92,119,247,133,146,99,143,226,216,163,
+    58,246,44,218,202,118,207,98,182,200,221,181,150,236,187,20,
+    251,46,213,190,107,145,171,218,136,211,155,127,163,212,49,176,
+    104,199,15,149,241,127,3,190,48,53,222,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/proxy.py",
+    "m5.proxy",
+    embedded_module_data,
+    5083,
+    11505);
+
+} // anonymous namespace
+} // namespace gem5
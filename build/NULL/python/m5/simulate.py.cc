@@ -0,0 +1,635 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,205,124,91,112,220,216,149,24,208,141,102,163,223,77,
+    178,201,110,62,68,130,34,69,178,69,177,245,26,89,163,199,
+    60,40,82,15,234,65,141,71,178,199,67,219,75,181,26,160,
+    216,82,63,104,52,56,18,233,166,205,76,84,187,28,47,99,
+    211,142,182,134,91,150,18,238,198,118,52,246,56,81,54,201,
+    58,118,156,120,188,217,184,236,36,46,3,93,168,34,131,132,
+    41,109,109,169,42,78,126,168,242,76,101,50,85,121,156,115,
+    1,116,163,31,28,105,52,114,217,77,240,0,184,247,226,222,
+    115,206,61,231,222,115,206,189,192,223,82,150,159,211,56,255,
+    166,64,83,212,155,20,79,241,116,138,26,215,207,244,56,77,
+    206,182,113,27,156,109,41,123,154,25,103,210,142,113,7,141,
+    249,246,84,93,218,57,238,164,245,178,236,184,139,156,221,228,
+    204,164,60,105,239,184,15,242,28,124,93,202,159,14,140,7,
+    210,193,241,96,186,126,188,62,221,48,222,144,110,28,111,36,
+    121,206,84,40,221,52,222,68,174,217,84,115,58,60,30,78,
+    71,198,35,233,150,241,150,116,235,120,107,186,109,188,45,221,
+    62,222,14,249,174,241,109,130,235,106,135,137,246,213,78,243,
+    106,149,163,106,252,190,3,255,223,43,222,141,119,241,238,248,
+    118,126,39,239,185,73,143,119,243,222,120,15,239,187,73,141,
+    239,224,253,66,47,31,224,233,73,134,15,222,100,198,251,248,
+    128,208,59,105,227,235,225,186,223,184,110,128,235,168,139,226,
+    7,248,16,148,109,18,118,146,242,117,124,243,77,199,248,0,
+    73,247,151,165,135,33,125,23,31,129,251,22,163,238,58,190,
+    21,234,24,228,119,241,237,66,140,223,86,76,237,128,146,187,
+    161,149,24,180,210,9,37,246,240,28,224,212,193,119,1,220,
+    203,111,7,184,143,239,6,184,159,239,1,248,12,63,200,239,
+    0,236,15,240,189,112,247,9,158,138,31,228,99,124,63,164,
+    60,11,252,142,166,216,244,161,241,67,233,195,227,135,211,71,
+    198,143,164,143,142,31,5,158,209,23,168,232,238,95,35,3,
+    198,162,54,173,142,207,78,240,89,73,243,224,249,181,201,28,
+    222,68,105,114,43,206,92,158,53,110,189,51,211,124,92,18,
+    142,191,38,100,164,220,175,65,38,168,168,67,115,93,72,166,
+    207,95,190,42,36,36,205,153,37,231,156,86,55,29,23,227,
+    233,156,230,200,73,113,184,117,72,201,196,181,28,84,16,188,
+    18,151,166,4,113,34,145,132,244,100,54,147,139,214,105,108,
+    92,146,68,62,9,143,7,19,83,66,226,218,116,54,153,145,
+    38,114,82,86,20,52,199,100,92,138,167,52,207,100,86,188,
+    54,145,19,196,215,4,81,11,64,157,162,52,51,61,49,45,
+    102,39,147,41,65,99,174,199,197,76,202,1,216,252,191,47,
+    235,127,1,234,68,130,174,144,99,59,202,113,131,155,162,254,
+    200,13,146,76,131,196,82,105,122,158,166,41,137,41,21,20,
+    3,146,179,116,199,219,191,3,181,124,175,88,19,112,141,137,
+    219,36,182,84,226,170,163,40,105,117,143,150,180,121,91,222,
+    150,43,111,193,81,217,130,20,176,212,94,108,137,175,171,42,
+    215,104,41,231,46,150,115,86,149,11,91,202,121,107,227,85,
+    209,170,175,88,27,155,183,173,250,31,77,23,239,186,73,125,
+    7,248,251,61,123,169,70,120,50,240,232,39,231,237,91,180,
+    236,206,219,65,31,159,184,214,60,125,53,104,222,137,127,94,
+    214,70,125,177,13,111,57,175,14,32,31,118,148,74,74,189,
+    150,167,66,230,213,106,83,173,246,161,189,102,203,117,177,237,
+    239,216,160,5,91,177,69,95,249,253,60,35,237,182,212,97,
+    231,253,55,169,183,3,229,101,70,168,207,135,231,29,121,199,
+    106,164,102,187,76,101,127,47,69,242,204,106,75,173,178,149,
+    125,206,147,191,242,214,104,42,227,233,166,246,82,57,230,186,
+    237,134,253,85,234,58,232,199,171,144,74,35,85,173,102,41,
+    241,71,46,212,32,42,213,54,95,183,5,111,131,191,53,222,
+    22,177,120,4,111,157,32,43,237,143,230,195,60,155,175,91,
+    221,86,179,93,54,239,228,235,223,110,168,146,65,231,111,131,
+    191,153,96,55,37,29,45,213,214,67,137,118,204,203,48,215,
+    41,189,36,208,94,156,215,196,203,91,240,189,177,6,223,135,
+    44,52,217,42,184,89,172,177,146,74,105,248,73,158,250,104,
+    52,75,199,45,52,116,111,197,199,45,70,136,16,232,75,83,
+    245,8,177,69,233,102,40,29,126,236,210,17,40,221,242,136,
+    210,37,158,183,214,224,185,149,178,30,243,42,111,171,212,86,
+    144,81,139,86,148,126,31,79,150,182,160,170,13,168,106,127,
+    108,30,108,131,210,29,53,70,96,250,106,81,119,197,54,233,
+    124,233,217,42,41,41,150,123,76,62,118,62,130,143,253,79,
+    135,59,121,74,252,174,244,114,169,222,213,157,84,141,95,149,
+    20,190,98,193,100,87,145,74,170,18,231,121,215,22,212,113,
+    53,168,27,183,148,140,21,241,177,204,9,165,95,222,85,254,
+    252,87,220,79,69,38,186,242,246,69,247,36,13,22,37,251,
+    241,116,57,19,222,162,133,110,144,163,158,26,82,23,47,149,
+    174,226,181,181,215,247,110,89,74,176,112,167,74,179,182,176,
+    143,118,84,89,116,20,216,193,189,99,34,146,248,22,13,22,
+    236,52,177,75,231,58,210,7,98,201,12,152,154,25,41,9,
+    38,111,127,148,75,196,83,41,129,231,164,235,201,132,16,187,
+    56,119,112,76,192,187,44,103,41,197,189,156,205,74,80,244,
+    178,0,6,171,64,158,72,102,174,112,101,245,204,249,18,217,
+    204,100,242,10,151,75,136,201,105,105,174,65,47,60,104,41,
+    164,213,199,121,192,227,188,56,61,21,207,188,68,44,233,50,
+    115,22,113,69,242,126,131,146,251,38,8,225,42,85,235,87,
+    206,176,11,64,222,88,148,22,195,58,161,118,48,213,115,88,
+    41,247,65,75,78,76,236,158,158,149,166,178,153,221,233,3,
+    187,115,201,244,76,10,176,136,77,207,126,192,30,77,197,211,
+    151,249,248,243,115,219,44,248,197,142,166,178,64,91,238,249,
+    152,153,157,65,108,26,0,44,80,203,195,107,161,104,33,20,
+    85,66,3,106,104,96,129,250,13,54,174,249,102,50,96,174,
+    223,152,125,122,212,136,56,9,3,61,28,156,68,52,10,116,
+    106,68,156,243,69,156,208,31,129,242,117,124,68,71,249,94,
+    247,218,190,225,194,190,97,101,223,113,117,223,241,5,74,196,
+    249,13,124,159,153,244,244,132,222,89,26,125,253,41,226,172,
+    49,211,224,6,193,153,206,126,68,164,95,71,164,253,4,233,
+    127,85,255,147,230,31,53,255,48,242,227,136,129,48,212,103,
+    191,38,204,106,158,171,185,108,198,192,251,215,140,158,81,151,
+    204,240,224,179,105,110,240,227,76,146,252,9,81,128,70,134,
+    135,117,231,237,105,246,201,174,39,236,147,127,96,233,147,253,
+    107,251,143,23,246,31,87,246,159,84,247,159,52,251,196,11,
+    184,103,0,217,151,178,162,244,84,165,40,246,132,24,255,153,
+    5,227,198,181,189,67,133,189,67,202,222,97,117,239,176,137,
+    49,147,204,36,159,42,111,247,60,33,166,223,166,74,162,147,
+    248,201,212,143,166,126,120,245,199,87,77,44,89,81,184,114,
+    129,184,234,126,184,122,73,204,94,22,94,66,55,252,169,242,
+    120,255,19,98,126,175,196,99,28,92,122,11,161,94,37,212,
+    175,134,250,77,236,235,77,156,207,38,115,146,144,17,196,167,
+    138,246,129,39,68,251,7,88,14,99,82,4,201,57,47,9,
+    133,196,132,76,252,114,74,208,124,87,4,105,184,24,237,208,
+    92,169,108,156,199,14,16,202,48,183,155,152,163,120,254,9,
+    189,53,238,111,208,229,243,90,9,251,103,241,100,19,219,144,
+    79,12,52,39,229,144,29,220,194,99,147,241,75,164,28,145,
+    120,31,68,60,241,131,244,95,164,223,25,81,62,49,170,126,
+    98,212,100,191,11,69,188,26,249,143,201,246,35,79,200,118,
+    133,42,202,249,189,238,31,12,254,197,224,63,219,253,47,118,
+    27,168,206,213,199,39,37,65,180,206,181,209,253,154,45,125,
+    64,68,187,85,243,77,88,50,120,17,189,120,209,69,24,135,
+    243,186,230,129,62,27,37,5,18,130,136,242,168,217,133,12,
+    47,162,137,167,185,73,132,138,116,166,136,81,22,173,97,50,
+    121,227,100,42,123,57,158,58,33,10,95,152,17,50,137,89,
+    141,133,66,19,66,60,49,5,115,139,144,75,192,195,208,86,
+    14,138,138,217,57,33,51,97,73,19,183,99,29,14,152,255,
+    115,130,198,100,167,133,140,102,203,230,196,29,4,153,171,208,
+    138,86,151,157,145,248,164,168,213,229,96,40,20,120,205,53,
+    45,98,216,12,186,66,115,36,82,217,156,32,246,235,133,97,
+    50,208,26,0,115,99,216,159,136,231,38,72,176,141,193,233,
+    77,243,140,166,167,161,130,227,162,152,21,197,1,36,24,101,
+    78,196,176,150,232,193,10,188,164,115,147,105,125,116,104,152,
+    184,12,51,9,94,159,74,10,98,92,76,76,205,138,251,176,
+    88,0,39,22,18,56,212,155,17,113,226,209,234,12,105,247,
+    79,240,98,60,153,153,72,199,51,241,43,130,168,133,166,69,
+    161,36,253,47,11,36,216,39,162,253,168,121,68,253,110,2,
+    137,179,79,164,15,128,212,98,230,65,204,12,234,241,71,108,
+    95,143,65,106,193,9,18,13,60,41,102,103,166,71,128,160,
+    156,136,150,103,212,163,177,40,235,88,137,222,181,140,8,61,
+    40,162,93,169,177,64,209,4,6,14,137,82,136,231,137,8,
+    147,57,147,68,19,105,94,124,21,211,15,163,28,33,11,184,
+    226,239,69,34,132,154,199,34,37,98,130,8,45,74,169,147,
+    168,200,125,166,85,46,63,30,56,67,155,20,237,216,179,193,
+    250,100,127,76,97,119,171,236,110,153,221,125,63,20,89,56,
+    247,192,211,176,116,116,205,211,93,240,116,43,158,29,170,103,
+    199,194,200,125,79,0,139,143,210,164,252,73,133,61,165,178,
+    167,100,246,212,3,166,81,101,194,43,1,133,233,87,153,126,
+    153,233,127,175,142,114,4,85,104,162,109,183,194,236,81,153,
+    61,50,179,7,211,220,42,211,174,48,29,42,211,33,51,29,
+    239,177,148,35,4,9,235,108,219,58,235,93,99,35,5,54,
+    162,176,173,42,219,186,206,14,200,236,192,67,39,227,168,123,
+    151,2,176,73,64,144,106,12,175,53,68,11,13,81,165,97,
+    64,109,24,88,56,131,85,234,53,132,87,218,228,222,227,112,
+    60,180,219,240,33,27,62,132,128,173,122,232,190,211,175,58,
+    91,55,41,214,177,109,195,215,174,250,182,175,62,167,248,246,
+    170,190,189,155,148,211,181,141,128,141,112,219,70,176,225,150,
+    243,77,239,55,188,43,175,220,254,131,187,175,168,131,47,42,
+    193,33,53,56,244,206,126,104,33,226,135,22,34,254,197,83,
+    64,66,164,99,229,154,188,123,8,143,240,49,37,124,76,13,
+    31,3,30,249,250,9,88,182,175,7,27,223,244,125,195,183,
+    50,165,4,251,212,96,159,76,142,117,111,232,107,99,95,25,
+    83,188,237,170,183,93,246,182,111,6,204,150,9,120,136,224,
+    93,170,44,173,22,120,255,253,247,107,230,53,80,108,128,144,
+    232,117,212,111,218,60,174,250,117,111,120,241,12,254,61,168,
+    231,212,250,222,213,121,165,254,128,90,127,96,147,170,243,109,
+    39,96,163,157,219,8,53,223,58,249,230,217,111,156,93,13,
+    127,171,227,94,88,221,59,162,132,142,171,161,227,239,228,128,
+    224,109,13,64,240,182,134,101,215,102,29,213,212,178,22,26,
+    40,132,6,148,208,160,26,26,92,166,215,131,161,55,93,223,
+    112,173,116,173,188,122,247,11,203,46,37,184,87,13,238,149,
+    131,123,215,131,45,111,6,190,17,80,130,93,106,176,75,14,
+    118,109,250,204,214,8,120,136,224,93,170,44,173,22,32,68,
+    214,74,126,207,79,5,219,128,203,174,250,18,88,247,6,23,
+    71,54,237,112,133,143,213,17,62,180,108,82,118,199,49,218,
+    232,235,163,138,111,143,234,219,3,194,225,58,70,235,112,195,
+    219,176,252,204,74,248,118,199,221,176,26,61,162,120,143,170,
+    222,163,178,247,232,134,55,188,194,172,92,185,157,185,123,69,
+    141,189,168,120,135,84,239,144,236,29,218,116,148,158,212,225,
+    67,2,223,165,42,211,183,130,132,162,218,89,239,185,137,142,
+    52,43,76,68,101,34,50,19,41,73,120,100,101,64,238,59,
+    9,71,133,132,151,74,52,175,120,228,29,195,112,84,150,112,
+    235,37,86,62,189,250,89,121,223,41,56,20,102,84,101,70,
+    101,102,20,30,118,183,168,174,142,149,57,197,181,83,117,237,
+    196,242,17,2,64,195,85,150,91,13,41,108,175,202,246,202,
+    108,47,168,232,215,124,95,241,189,17,88,10,44,6,128,9,
+    70,57,2,30,34,120,151,42,75,171,5,116,202,171,146,77,
+    4,129,200,117,182,113,157,237,151,217,254,10,229,135,206,46,
+    141,21,141,181,199,7,93,236,59,112,132,26,134,17,170,113,
+    121,100,165,239,118,236,110,159,186,115,72,97,143,169,236,49,
+    153,61,86,36,248,75,138,43,166,186,98,88,56,76,0,16,
+    188,228,125,195,191,228,95,244,131,0,25,137,4,60,68,240,
+    46,85,150,86,11,16,234,106,228,177,20,27,220,164,124,14,
+    247,6,219,188,198,14,20,216,1,133,29,84,217,65,153,29,
+    4,116,252,29,170,47,122,183,95,241,237,87,125,251,55,41,
+    135,203,127,239,139,27,186,154,126,89,169,63,168,214,31,196,
+    145,228,8,1,27,225,214,91,55,214,194,131,133,240,224,221,
+    107,74,248,176,26,62,188,204,0,182,70,54,1,15,17,188,
+    75,149,165,213,2,58,182,85,201,15,188,109,170,183,103,61,
+    216,182,242,89,121,231,104,241,0,145,242,225,160,231,243,111,
+    18,224,4,60,9,178,4,60,68,240,46,85,150,86,11,144,
+    54,107,36,67,239,186,34,32,110,48,78,225,56,62,4,7,
+    52,232,114,163,78,185,81,51,220,239,121,41,71,147,194,52,
+    131,110,200,76,243,6,227,130,201,69,97,218,65,34,100,166,
+    253,1,19,90,190,168,48,173,170,62,167,49,1,50,243,196,
+    20,102,183,202,236,150,205,35,247,151,48,21,254,181,111,232,
+    224,137,160,253,103,65,230,68,200,249,179,48,141,176,59,50,
+    234,165,126,118,100,232,208,40,101,255,249,51,94,184,249,5,
+    197,140,50,206,95,48,118,188,118,210,120,205,146,107,175,123,
+    180,197,254,139,8,141,240,224,193,211,135,237,255,225,48,115,
+    250,121,231,127,164,105,128,255,105,111,244,92,175,253,151,189,
+    204,185,157,206,95,14,210,0,127,213,20,58,127,192,254,171,
+    3,204,249,67,206,95,29,165,1,202,187,155,94,230,236,10,
+    195,125,114,143,67,233,241,226,245,30,230,147,207,184,148,103,
+    236,120,125,144,198,235,103,219,225,186,192,49,47,247,56,11,
+    125,52,192,139,9,171,85,138,6,16,218,35,191,225,236,104,
+    188,74,150,172,92,64,178,151,238,120,186,42,242,100,93,79,
+    188,39,89,214,5,175,22,115,86,29,84,141,95,229,106,161,
+    228,43,229,93,45,174,26,242,182,188,109,149,165,106,252,42,
+    86,229,236,213,81,55,178,126,105,173,213,85,251,89,160,194,
+    178,22,115,213,99,94,73,150,85,168,82,140,175,138,3,181,
+    159,181,172,198,92,45,198,10,45,107,101,149,181,88,86,89,
+    74,113,212,42,60,123,74,165,86,45,49,191,210,175,252,9,
+    177,165,236,137,80,117,249,26,109,88,34,196,165,8,247,106,
+    152,170,241,251,208,103,139,220,123,204,103,45,235,82,87,139,
+    220,40,173,128,229,169,36,149,167,191,69,127,149,158,183,255,
+    174,112,204,219,47,80,81,199,216,220,129,170,120,105,122,38,
+    39,113,151,5,51,110,106,196,68,161,152,25,96,236,143,198,
+    52,167,177,152,255,52,61,71,140,11,215,246,28,91,139,177,
+    205,42,183,241,127,82,214,240,200,181,31,93,251,97,250,199,
+    105,195,109,60,17,109,19,159,199,74,80,86,53,111,70,16,
+    248,9,3,111,226,31,138,47,32,120,17,1,186,133,226,8,
+    130,19,88,214,113,93,76,74,130,86,7,77,222,72,74,36,
+    204,130,33,10,145,248,86,226,39,17,224,26,128,248,89,44,
+    236,227,179,199,161,212,112,74,136,103,102,166,53,7,120,66,
+    130,36,226,186,3,184,216,185,17,244,160,192,209,171,131,228,
+    153,180,160,217,115,179,57,240,254,36,30,28,65,205,49,153,
+    154,201,77,145,91,168,92,115,8,232,29,105,172,73,110,148,
+    209,152,184,120,5,202,95,187,142,103,113,2,43,117,66,246,
+    4,60,157,195,97,9,253,27,157,83,146,9,254,6,89,114,
+    146,70,150,128,13,238,109,193,153,246,164,238,150,28,87,216,
+    19,42,123,66,102,79,60,112,54,110,82,13,142,230,141,64,
+    243,82,126,45,208,87,8,244,41,129,168,26,136,46,50,27,
+    108,152,204,55,77,203,210,90,56,86,8,199,148,240,30,53,
+    188,71,222,119,6,142,138,185,7,236,200,200,182,69,47,204,
+    213,56,73,109,83,216,78,149,237,148,217,78,104,216,5,214,
+    208,29,199,109,183,194,118,171,108,183,204,118,99,33,76,179,
+    223,102,213,72,201,161,194,100,255,146,231,13,223,146,111,209,
+    247,192,217,180,230,236,44,56,59,21,103,151,234,236,66,212,
+    57,98,26,108,43,148,215,238,96,111,158,94,99,66,5,38,
+    100,153,249,156,213,105,254,250,165,164,234,231,86,123,100,255,
+    222,187,189,0,224,88,56,89,179,104,141,180,251,158,134,133,
+    49,35,32,136,123,97,176,23,165,25,49,83,21,237,33,187,
+    84,22,13,177,151,44,185,229,194,126,141,228,136,31,97,38,
+    186,90,44,185,106,73,45,253,242,212,219,85,107,40,60,234,
+    54,51,247,127,47,8,82,142,147,166,64,121,227,55,64,162,
+    210,28,146,64,18,12,1,75,102,51,144,55,203,137,51,25,
+    78,202,198,184,87,166,132,12,119,29,193,76,14,23,64,160,
+    168,27,5,12,196,51,149,188,108,62,149,21,185,116,150,159,
+    73,9,187,56,17,163,34,122,201,100,14,155,49,154,16,147,
+    87,174,8,98,142,139,147,199,47,161,122,16,199,63,118,110,
+    232,51,19,23,71,135,207,92,226,80,177,56,34,239,49,55,
+    41,117,152,236,61,34,21,28,174,198,186,63,126,57,151,77,
+    205,72,208,104,38,43,65,195,136,254,107,2,46,228,96,217,
+    196,140,40,66,85,164,108,52,70,234,155,59,122,206,196,39,
+    151,152,18,16,97,158,131,177,140,148,159,142,231,164,24,119,
+    17,177,190,158,76,165,72,157,48,230,25,136,11,124,236,45,
+    90,188,65,225,30,43,135,230,132,202,47,66,53,98,99,81,
+    239,115,40,17,110,80,115,104,130,100,125,177,98,216,154,55,
+    129,27,18,115,67,100,124,218,244,83,172,247,239,93,127,99,
+    118,105,182,224,140,200,78,240,35,188,178,239,140,194,158,85,
+    217,179,50,123,22,5,112,116,141,137,20,152,200,10,15,254,
+    141,194,116,171,76,183,108,30,68,12,203,140,29,155,41,120,
+    207,83,149,198,206,213,162,56,172,218,168,26,191,202,49,56,
+    74,207,117,189,76,68,59,87,198,79,107,31,196,162,118,43,
+    245,87,138,212,191,165,15,183,58,229,95,54,65,51,82,222,
+    76,40,127,224,241,47,29,90,243,116,22,60,157,138,167,75,
+    245,116,201,76,87,53,57,69,61,58,170,147,179,165,22,89,
+    181,167,60,103,206,109,16,115,164,22,49,153,153,244,101,65,
+    228,178,147,132,156,28,55,3,115,94,170,74,212,98,81,155,
+    78,68,30,193,2,69,89,168,211,130,64,53,146,156,251,20,
+    62,11,244,139,184,180,211,134,164,54,25,164,54,189,113,116,
+    233,232,157,190,63,141,222,142,42,158,98,199,125,80,143,143,
+    233,82,79,180,70,224,245,128,163,7,147,96,90,18,65,141,
+    18,214,190,114,152,236,56,81,197,142,252,135,177,0,243,233,
+    183,233,202,5,96,222,6,140,177,199,255,23,84,115,193,80,
+    7,208,79,93,63,74,186,200,77,138,217,116,149,70,197,184,
+    209,152,16,219,197,37,77,206,61,247,28,183,119,207,30,162,
+    102,18,14,23,241,140,181,14,162,81,160,77,37,181,139,235,
+    245,112,151,46,25,186,4,118,198,0,86,113,233,146,161,253,
+    23,161,73,94,152,140,207,164,36,40,101,225,201,165,75,220,
+    107,241,212,140,192,129,170,206,228,208,32,153,213,135,48,125,
+    76,186,80,49,38,193,128,64,234,227,133,68,42,14,118,11,
+    25,152,44,184,197,115,80,125,105,60,186,48,124,234,248,200,
+    167,206,30,31,209,71,165,75,213,99,81,238,48,193,205,50,
+    98,146,212,93,58,167,44,4,1,162,48,24,153,52,19,28,
+    177,93,55,87,245,51,70,61,75,67,22,122,245,230,8,198,
+    122,2,214,170,207,58,250,208,108,86,108,16,148,204,213,104,
+    65,255,149,70,51,82,228,45,27,25,210,196,155,148,190,119,
+    52,98,226,138,248,35,75,134,140,33,150,72,62,104,129,215,
+    44,173,175,61,232,67,155,214,86,249,216,9,96,196,176,46,
+    45,34,78,129,28,106,67,47,209,134,247,218,41,199,182,213,
+    29,223,239,123,43,250,118,84,217,190,255,157,54,153,57,167,
+    48,231,84,230,156,108,30,250,64,96,149,252,226,182,207,175,
+    82,191,131,9,149,6,71,13,180,133,183,127,7,52,240,123,
+    69,135,15,157,48,52,153,227,63,123,132,6,233,83,167,57,
+    93,233,210,82,161,64,79,172,63,240,208,239,187,190,232,242,
+    91,36,191,66,111,106,170,200,239,74,33,230,158,43,141,201,
+    79,96,34,144,189,39,39,192,66,208,103,138,10,235,128,140,
+    235,192,237,179,217,236,180,248,135,21,74,36,254,145,9,246,
+    162,178,156,32,202,178,217,90,203,62,56,171,176,231,84,246,
+    156,204,158,51,236,131,150,2,211,178,50,176,250,133,187,61,
+    247,232,123,7,20,230,144,202,28,146,205,67,183,85,29,137,
+    56,116,189,198,146,211,68,146,47,211,46,134,42,159,87,44,
+    89,143,178,26,242,160,29,85,243,10,110,72,183,197,61,240,
+    232,203,2,174,73,17,126,34,207,164,41,194,199,43,96,166,
+    101,56,130,138,217,129,36,15,100,62,153,145,4,224,37,55,
+    58,178,139,116,136,222,171,186,204,94,186,132,75,173,248,212,
+    40,79,6,87,156,182,203,5,134,59,94,106,137,212,15,215,
+    83,201,196,20,169,107,42,14,101,250,176,203,160,117,211,127,
+    131,170,49,157,84,52,58,194,13,238,45,151,95,82,137,69,
+    222,172,72,199,170,10,2,99,15,115,67,32,23,153,193,140,
+    112,69,55,71,71,71,244,114,99,101,182,82,189,217,62,241,
+    19,241,89,24,93,255,24,179,151,42,5,227,171,38,24,70,
+    193,216,78,4,227,189,32,186,59,208,245,157,5,166,115,213,
+    177,122,163,184,110,164,31,164,211,127,141,29,171,185,76,204,
+    114,154,11,140,154,137,203,113,41,49,85,219,172,184,252,145,
+    187,223,186,3,190,114,7,221,135,152,28,49,72,26,206,198,
+    83,184,76,250,97,194,49,58,2,227,228,133,210,120,145,200,
+    130,141,149,153,129,94,69,85,212,29,145,153,196,148,165,10,
+    112,130,13,153,65,169,50,38,228,82,152,226,210,165,93,134,
+    141,103,142,175,248,16,169,40,14,218,60,5,146,167,183,140,
+    190,139,32,113,160,248,151,46,21,185,118,233,146,209,18,145,
+    24,34,70,57,0,177,162,120,232,227,76,238,90,114,122,26,
+    119,148,145,129,2,156,41,28,69,203,5,89,138,95,19,76,
+    6,240,68,102,17,183,26,162,135,253,166,139,95,145,35,92,
+    63,52,10,117,84,73,16,86,17,53,71,239,234,95,194,104,
+    111,23,39,164,167,165,89,28,51,249,100,14,87,117,205,172,
+    74,153,46,18,174,99,96,154,196,37,163,217,228,70,134,79,
+    233,148,101,51,38,165,91,32,81,179,71,146,153,68,106,134,
+    55,220,75,189,91,146,102,55,230,138,150,202,50,234,193,215,
+    41,180,84,24,171,38,129,207,85,206,74,141,73,1,99,196,
+    191,95,169,72,183,76,48,134,138,52,160,43,82,179,69,145,
+    190,223,115,119,246,173,221,111,239,126,231,85,153,233,84,152,
+    243,42,115,94,54,143,223,182,175,245,69,171,123,114,233,82,
+    191,217,221,187,116,7,86,31,237,208,75,48,198,33,147,98,
+    115,50,79,153,10,129,65,58,236,219,106,38,131,52,243,130,
+    184,11,36,157,76,105,87,140,88,64,186,220,139,107,168,150,
+    205,10,151,71,124,211,4,159,67,70,70,116,70,214,81,222,
+    0,186,116,125,5,79,159,226,137,170,158,168,204,68,63,132,
+    107,171,132,107,60,125,147,154,47,227,221,170,53,144,178,5,
+    199,230,233,60,157,243,218,112,200,169,74,255,167,222,143,90,
+    91,206,125,26,6,166,242,180,215,105,35,100,114,151,68,235,
+    172,33,18,24,19,32,97,90,20,80,73,200,176,4,61,19,
+    231,74,111,60,225,168,145,22,210,89,113,22,45,42,35,94,
+    2,227,76,98,170,104,169,193,192,144,157,22,140,199,147,104,
+    51,102,178,131,217,105,98,13,150,183,4,121,41,240,14,249,
+    89,78,199,130,84,96,68,16,57,220,136,36,24,149,86,113,
+    153,196,93,223,165,42,101,243,113,56,34,218,112,14,255,40,
+    54,114,69,63,96,164,247,49,22,70,120,219,53,82,175,216,
+    43,185,182,42,243,81,235,186,215,171,247,220,216,197,57,255,
+    137,100,38,153,3,43,142,35,155,86,78,68,235,244,24,44,
+    43,137,179,132,133,37,177,39,97,82,141,53,13,140,40,173,
+    185,137,193,73,204,10,75,24,71,171,211,55,192,204,53,145,
+    83,41,250,172,39,103,81,33,176,42,61,208,218,186,230,217,
+    94,240,108,87,60,61,170,167,7,151,220,35,235,141,225,229,
+    103,32,171,185,229,214,171,107,77,125,133,166,62,165,41,170,
+    54,69,23,221,235,254,200,154,191,171,224,239,82,252,221,170,
+    191,91,238,59,88,240,31,148,253,7,55,90,186,254,180,245,
+    118,235,226,233,77,59,21,104,169,89,100,179,142,10,54,45,
+    206,232,27,163,34,186,192,18,209,192,145,53,155,201,145,189,
+    116,18,56,120,132,124,49,77,17,95,238,14,146,227,78,230,
+    116,204,5,190,204,165,115,144,68,241,31,194,245,101,164,233,
+    42,165,219,163,62,71,19,46,206,234,224,61,142,106,224,214,
+    234,163,133,250,168,82,63,160,214,15,44,156,6,42,48,66,
+    219,177,222,212,182,252,233,175,127,230,214,103,22,221,4,111,
+    146,136,99,68,171,117,143,140,204,12,225,209,55,164,48,67,
+    170,126,77,14,125,216,168,25,81,253,28,245,248,11,9,35,
+    212,231,155,113,72,120,28,145,167,169,165,48,95,92,122,176,
+    233,27,140,188,160,198,175,96,220,255,114,60,113,13,166,32,
+    12,182,147,189,70,101,243,202,159,153,224,15,145,83,71,9,
+    167,214,3,141,107,129,206,66,160,83,9,116,169,1,18,181,
+    110,35,96,209,190,206,122,172,187,119,100,114,224,34,186,94,
+    224,247,133,118,31,208,62,154,1,199,49,137,27,181,196,63,
+    175,164,250,91,38,248,227,15,165,186,157,0,131,234,150,2,
+    219,162,176,109,42,219,38,147,3,169,214,11,84,83,93,116,
+    74,190,68,127,188,233,117,158,46,179,82,233,218,53,149,91,
+    170,185,128,117,64,170,12,31,188,78,75,158,82,110,213,26,
+    156,101,85,54,95,29,120,168,249,86,40,134,23,222,182,87,
+    90,203,214,55,31,248,170,247,3,37,203,138,103,105,109,118,
+    213,75,213,248,85,218,230,240,116,155,229,105,255,214,229,200,
+    91,21,142,177,185,129,210,46,191,202,245,64,152,194,226,28,
+    238,202,227,244,151,134,99,23,97,248,100,97,248,204,73,19,
+    217,107,115,13,168,65,104,220,149,102,200,104,160,98,181,13,
+    199,161,164,177,33,83,115,93,156,157,22,244,125,140,56,254,
+    232,250,53,138,165,216,52,216,38,124,82,204,105,14,178,73,
+    210,178,228,230,205,9,98,18,132,117,78,24,74,165,244,13,
+    136,62,220,60,95,106,211,166,217,113,19,33,234,112,217,80,
+    231,46,149,17,255,9,36,44,163,60,255,35,10,229,121,163,
+    122,83,223,134,167,105,153,191,115,242,246,89,221,198,49,86,
+    210,252,97,57,114,92,241,159,80,253,100,37,141,113,253,157,
+    147,55,79,226,162,82,112,185,180,116,132,123,143,156,55,207,
+    44,219,49,150,223,93,140,229,67,105,217,221,161,48,157,42,
+    211,9,118,39,250,244,167,12,159,190,187,184,251,111,131,9,
+    169,204,246,213,253,10,211,167,50,125,178,121,84,71,202,144,
+    175,68,109,142,209,53,98,196,150,146,87,139,215,101,169,197,
+    121,126,210,86,161,18,135,203,85,194,170,2,149,98,243,77,
+    154,183,213,110,11,114,236,181,219,131,28,230,142,179,82,209,
+    242,143,245,58,118,158,54,236,136,48,148,119,214,42,95,173,
+    136,40,216,82,125,169,68,245,11,220,68,244,235,198,230,26,
+    201,171,46,130,100,44,20,128,112,114,125,115,245,125,49,142,
+    59,103,40,2,73,155,99,208,240,251,128,142,205,29,184,48,
+    11,51,110,186,204,114,139,163,189,77,236,193,24,119,174,100,
+    28,130,55,154,0,255,233,138,192,199,162,46,241,31,83,198,
+    62,101,162,25,90,157,94,143,120,151,34,171,141,208,8,217,
+    109,174,63,126,14,158,214,124,57,235,173,248,93,10,199,111,
+    173,46,71,158,211,24,108,161,76,214,235,39,244,214,44,207,
+    224,230,118,156,36,114,223,164,116,145,111,90,158,188,115,253,
+    118,254,251,175,188,253,7,114,199,81,197,243,156,234,121,14,
+    183,140,185,65,202,23,147,15,2,141,203,39,222,200,47,229,
+    23,225,239,206,43,183,63,183,2,127,223,63,248,246,243,119,
+    225,143,108,174,122,104,183,7,220,239,82,0,54,41,187,203,
+    141,27,186,252,107,206,182,130,179,77,113,110,83,157,219,86,
+    67,5,231,14,217,185,99,29,146,217,246,2,219,190,114,81,
+    97,183,171,236,118,217,60,30,148,47,76,235,135,46,234,150,
+    160,110,41,40,252,129,131,204,139,54,49,96,21,247,26,65,
+    95,203,211,48,15,88,12,217,170,209,223,250,102,191,173,74,
+    40,105,152,93,15,205,219,203,234,179,91,191,38,80,94,159,
+    216,88,166,44,21,223,34,224,237,134,240,150,183,202,84,182,
+    186,116,152,119,220,164,176,237,138,249,141,225,235,106,166,59,
+    202,102,162,138,250,230,235,242,14,222,89,218,152,83,91,109,
+    42,106,116,98,43,203,244,231,71,62,103,195,247,173,231,93,
+    101,28,96,165,96,233,206,178,31,169,156,183,13,214,61,69,
+    121,246,155,20,207,222,169,226,112,89,189,174,39,168,215,85,
+    187,222,188,43,95,247,26,246,135,149,211,46,130,133,251,142,
+    189,186,244,170,165,223,182,226,74,174,178,54,108,219,83,179,
+    182,154,115,243,35,106,67,220,188,53,107,123,140,30,203,59,
+    13,217,106,43,179,129,16,67,95,121,255,67,138,255,78,149,
+    204,229,217,199,225,64,5,63,3,164,254,96,13,156,217,39,
+    224,64,96,43,14,44,211,75,39,164,214,82,201,146,21,195,
+    215,151,232,154,119,187,192,27,206,187,243,21,83,203,99,125,
+    125,194,147,233,234,166,36,174,148,223,67,137,33,186,44,234,
+    201,55,228,157,128,95,99,53,126,230,219,254,82,119,169,116,
+    213,158,43,28,73,90,76,109,2,254,52,60,26,43,176,214,
+    91,243,143,181,67,46,239,49,122,255,124,222,131,60,224,67,
+    31,157,7,215,136,134,137,29,82,180,84,162,134,53,57,240,
+    161,185,131,214,220,188,167,210,206,37,92,104,45,114,193,85,
+    123,191,90,158,173,250,66,70,27,223,4,83,116,115,188,7,
+    23,224,72,132,133,27,126,233,83,57,156,112,227,156,62,9,
+    26,209,145,88,12,87,107,132,195,135,221,197,192,36,137,194,
+    192,180,62,149,229,201,150,23,61,68,163,47,254,91,38,104,
+    99,145,65,175,77,15,208,196,75,75,184,80,5,190,20,148,
+    20,75,145,56,196,32,198,141,74,164,210,120,42,151,229,200,
+    150,46,14,227,114,9,92,230,207,89,67,57,36,56,100,197,
+    116,72,188,50,147,198,160,195,97,183,53,151,27,28,52,35,
+    225,24,248,49,158,48,34,187,211,51,248,190,28,22,233,207,
+    166,248,9,184,223,197,101,132,235,120,17,229,164,153,233,148,
+    160,71,166,231,252,58,145,196,26,159,158,201,205,117,17,11,
+    102,58,158,195,16,20,70,77,245,221,51,64,213,36,24,38,
+    24,157,250,53,246,211,92,63,169,159,216,253,250,106,9,169,
+    19,121,131,13,2,197,187,160,57,56,69,171,92,56,18,133,
+    194,16,225,155,212,21,232,252,207,59,73,55,211,243,182,60,
+    253,117,219,18,123,193,216,79,129,224,45,187,102,139,237,209,
+    156,6,9,154,211,32,33,135,66,204,25,38,204,7,238,163,
+    136,103,34,155,158,126,126,174,67,39,103,24,202,88,247,1,
+    154,249,255,14,144,249,13,110,23,92,160,228,192,179,250,161,
+    180,239,90,57,185,250,202,178,179,152,82,219,245,220,26,111,
+    91,37,222,226,191,6,80,134,164,248,19,100,218,35,176,251,
+    107,104,82,124,135,50,35,171,132,207,97,20,40,92,86,52,
+    13,205,99,241,156,0,124,157,115,141,9,215,81,178,184,254,
+    185,109,81,44,100,196,36,73,159,65,97,224,153,46,120,115,
+    161,168,53,104,24,79,224,34,84,108,142,139,114,124,86,208,
+    235,206,205,76,147,85,57,172,14,99,247,217,215,4,49,54,
+    231,32,113,225,57,206,148,103,142,79,78,78,10,250,150,159,
+    146,58,64,3,174,243,122,91,128,138,223,64,197,104,69,115,
+    151,236,202,185,38,35,120,80,166,76,253,31,208,81,173,62,
+    46,101,211,201,196,68,38,155,73,232,155,197,198,162,17,98,
+    187,234,6,240,159,80,232,207,189,140,235,52,105,221,15,212,
+    28,68,224,52,123,74,200,104,118,176,121,53,143,94,235,4,
+    214,170,191,217,231,52,88,165,91,203,30,157,247,2,127,126,
+    70,210,234,13,138,39,48,180,61,129,228,138,248,29,1,141,
+    5,149,60,158,153,73,231,72,224,239,211,184,70,174,177,103,
+    132,217,146,239,169,185,244,122,160,22,241,159,83,166,47,74,
+    66,31,63,32,88,98,141,231,161,66,220,241,16,245,138,255,
+    146,96,98,232,163,230,132,140,203,89,124,239,47,137,230,56,
+    107,8,54,52,103,74,182,230,49,210,38,144,168,160,133,168,
+    137,12,184,28,226,191,193,150,254,45,130,191,66,240,11,20,
+    52,47,101,125,147,173,232,197,150,132,77,252,207,144,240,54,
+    154,244,127,105,39,81,187,118,138,13,24,251,38,193,176,238,
+    40,110,154,124,0,182,254,149,59,82,49,60,233,120,17,60,
+    217,86,185,237,121,197,255,130,234,127,65,102,95,88,15,134,
+    241,157,147,51,180,14,23,153,141,64,203,74,207,183,29,74,
+    160,87,13,244,98,68,243,12,253,253,238,187,60,110,230,184,
+    247,133,239,198,238,198,54,26,58,228,206,81,165,225,180,218,
+    112,90,246,98,208,114,224,16,198,39,15,129,166,221,67,165,
+    83,2,207,170,129,103,23,78,173,19,229,43,75,218,104,104,
+    90,158,250,250,224,173,193,133,51,235,225,206,85,250,214,23,
+    203,118,155,50,161,245,246,238,77,42,226,240,63,68,160,176,
+    145,69,231,114,24,49,234,251,246,193,111,189,160,4,246,171,
+    129,253,136,211,16,189,209,208,182,114,93,110,127,65,63,148,
+    134,23,213,134,23,101,239,139,31,165,236,186,167,97,249,154,
+    236,233,130,3,104,90,15,30,91,57,41,7,143,233,199,67,
+    187,173,17,223,239,104,52,222,239,0,250,194,107,129,237,133,
+    192,118,37,208,163,6,72,168,247,52,77,88,113,234,238,65,
+    0,250,161,52,140,170,13,163,178,119,116,61,208,188,22,232,
+    47,4,250,149,192,78,53,176,19,253,36,63,105,228,56,54,
+    114,92,63,170,27,241,54,174,121,58,10,158,14,197,195,169,
+    30,78,238,121,166,224,121,70,246,60,131,79,54,182,202,193,
+    49,56,86,35,119,187,190,213,166,95,195,241,168,58,16,209,
+    17,29,209,99,136,232,49,253,80,26,134,213,134,97,217,59,
+    252,36,136,130,255,231,242,191,231,166,26,34,183,58,87,219,
+    213,250,216,194,233,77,155,221,113,138,94,111,230,150,175,202,
+    93,123,149,230,125,106,243,190,181,230,35,133,230,35,74,243,
+    115,106,243,115,139,158,69,207,251,27,158,70,148,193,83,180,
+    21,18,121,60,33,239,31,70,72,14,197,127,82,245,159,148,
+    217,147,24,60,60,133,175,135,145,87,37,245,128,11,16,184,
+    173,167,20,118,52,68,100,157,13,212,136,61,86,249,165,112,
+    185,75,118,238,130,12,111,120,101,231,202,78,121,199,179,74,
+    235,33,181,245,208,90,235,177,66,235,49,165,117,68,109,29,
+    41,120,70,100,207,200,134,55,178,210,172,120,57,213,203,201,
+    94,110,195,219,178,210,171,120,187,84,111,151,236,237,122,192,
+    194,221,234,128,194,198,84,54,38,179,177,251,40,180,180,163,
+    151,0,43,70,196,247,125,69,97,119,168,236,14,153,28,72,
+    146,94,142,104,249,207,253,219,78,237,162,126,190,171,99,212,
+    109,255,61,136,8,187,97,242,72,78,206,158,200,138,215,170,
+    195,193,255,197,4,255,7,7,158,195,212,22,225,96,178,16,
+    208,66,194,193,95,243,127,5,117,88,101,35,50,57,144,120,
+    61,91,223,30,25,217,209,63,29,199,249,39,154,139,77,238,
+    232,55,62,28,248,133,104,178,140,21,197,205,11,123,108,250,
+    122,98,237,207,1,126,180,245,171,92,192,234,176,87,126,60,
+    16,220,83,223,86,79,86,180,90,116,20,30,231,53,31,154,
+    114,109,241,177,155,202,215,137,50,33,112,75,154,75,37,193,
+    45,113,206,219,243,246,215,105,158,153,183,127,201,126,189,232,
+    124,228,109,60,109,152,240,243,181,95,249,121,156,207,2,206,
+    51,82,103,41,175,250,83,117,214,15,229,205,59,192,196,119,
+    72,219,75,229,203,104,42,58,56,21,171,119,142,219,246,185,
+    58,12,203,76,20,107,218,162,255,106,58,62,101,159,234,171,
+    192,46,227,182,98,195,215,205,1,237,241,250,60,110,69,113,
+    198,255,59,48,7,37,186,124,221,213,186,80,107,90,194,184,
+    102,126,45,87,81,142,27,194,207,16,144,44,115,255,66,49,
+    115,151,185,155,143,3,35,7,108,166,105,49,155,16,192,210,
+    38,11,239,184,113,34,59,35,77,207,72,28,190,172,142,110,
+    4,15,86,87,66,210,63,69,20,71,251,221,40,160,239,198,
+    35,153,96,29,196,202,54,250,161,149,96,186,40,70,117,197,
+    146,104,155,17,132,176,76,60,87,196,70,215,170,210,142,155,
+    220,204,228,100,242,6,183,61,54,57,182,157,139,243,60,96,
+    112,125,10,44,63,110,204,172,1,201,211,151,177,245,15,32,
+    8,198,30,16,29,151,15,197,33,17,207,112,151,117,87,135,
+    24,94,73,168,223,242,50,1,114,11,247,236,92,19,102,175,
+    103,69,158,139,27,222,143,209,1,231,75,28,66,36,210,113,
+    137,172,36,224,103,15,160,71,226,226,172,233,36,25,52,129,
+    7,244,82,28,201,202,90,41,53,24,223,151,171,66,207,244,
+    160,204,193,5,43,32,210,80,73,168,217,12,216,179,216,198,
+    232,136,73,112,89,215,26,88,159,49,136,169,118,229,116,98,
+    161,6,52,231,45,27,33,171,241,34,79,232,123,66,56,98,
+    153,30,182,160,80,171,109,12,62,239,65,255,84,156,201,100,
+    244,111,85,149,10,233,248,19,31,67,196,48,217,220,238,97,
+    232,23,116,6,144,114,116,150,139,59,14,136,88,164,204,207,
+    175,112,250,119,31,248,177,168,157,124,10,150,188,140,100,114,
+    75,179,3,50,34,142,113,209,144,248,28,214,141,99,146,101,
+    81,166,190,88,207,136,190,211,136,23,255,61,102,146,101,29,
+    178,219,164,21,180,39,13,14,132,241,41,218,79,206,8,51,
+    194,197,41,244,93,114,250,146,15,131,141,105,206,243,23,116,
+    163,188,226,37,45,50,235,156,161,138,159,237,72,100,193,107,
+    208,234,64,195,0,51,92,19,146,116,9,26,73,138,209,58,
+    173,78,231,191,142,229,125,124,138,22,244,53,221,255,6,32,
+    135,11,13,22,147,90,252,91,19,56,108,248,222,2,77,108,
+    233,157,148,163,173,226,179,16,184,210,31,88,122,118,205,179,
+    163,224,217,161,120,250,84,79,31,78,99,99,186,241,114,86,
+    241,159,83,253,184,91,179,184,44,132,6,11,217,116,212,95,
+    96,250,21,102,167,202,236,148,153,157,155,140,221,17,220,240,
+    7,151,174,188,145,92,74,46,218,23,237,96,18,53,96,77,
+    193,18,88,247,7,22,157,239,227,155,193,48,91,6,141,215,
+    246,61,139,241,215,111,44,220,120,80,235,197,173,134,229,103,
+    138,147,236,253,250,200,173,142,197,186,245,150,206,245,230,246,
+    141,200,246,141,198,166,91,135,190,126,228,214,145,77,39,211,
+    237,222,164,0,60,164,152,86,247,162,115,9,13,56,151,119,
+    137,213,95,179,194,247,250,139,111,97,195,241,0,170,141,191,
+    17,88,116,223,247,248,23,78,147,29,64,63,237,106,28,58,
+    64,253,244,128,251,88,157,253,167,47,216,142,209,246,191,162,
+    29,112,29,101,200,94,88,173,209,216,107,54,148,74,21,191,
+    237,35,254,13,230,52,21,133,4,55,198,226,74,251,249,76,
+    106,214,124,5,240,239,234,167,175,145,211,69,184,250,175,120,
+    245,156,152,164,140,69,65,49,139,149,52,164,15,196,102,164,
+    100,42,134,95,47,33,175,234,137,250,247,79,200,215,75,194,
+    213,185,228,99,200,228,235,40,26,59,1,217,228,211,36,40,
+    185,154,11,111,201,246,7,253,146,124,237,71,68,225,16,209,
+    220,210,40,17,231,114,93,18,113,134,214,223,0,36,111,110,
+    184,138,95,67,38,31,47,209,24,108,84,196,9,150,172,72,
+    234,223,161,193,53,39,253,237,66,156,201,52,167,249,194,16,
+    241,55,189,100,247,198,57,227,235,42,172,185,38,170,111,220,
+    32,111,46,226,62,31,241,10,101,110,89,177,227,178,37,121,
+    183,136,188,161,242,58,73,203,73,34,217,119,175,111,42,38,
+    27,72,209,169,214,119,192,145,221,91,37,63,22,151,60,137,
+    51,75,220,70,93,163,30,20,197,159,236,99,254,31,8,176,
+    175,68,124,183,178,98,55,216,7,236,81,125,223,248,243,226,
+    255,38,211,45,232,10,190,172,12,2,74,211,155,47,209,20,
+    237,95,240,225,223,58,229,90,32,127,235,148,123,129,252,129,
+    196,211,54,240,41,30,9,88,138,222,35,83,187,173,199,125,
+    42,176,64,254,64,1,232,122,153,10,234,199,58,245,9,185,
+    252,216,100,234,176,154,143,11,252,20,221,47,83,125,214,99,
+    211,230,196,220,167,7,66,148,39,180,224,188,95,31,186,213,
+    162,214,247,173,213,239,41,212,239,81,234,247,169,245,251,22,
+    252,247,131,77,11,190,77,247,41,27,189,103,147,170,130,159,
+    102,168,96,104,193,187,89,215,75,131,19,85,4,47,211,46,
+    186,103,249,194,38,5,167,149,139,228,84,9,34,54,122,251,
+    242,48,56,110,244,246,74,224,182,193,83,221,120,221,83,9,
+    188,84,207,193,77,187,159,30,3,55,13,225,186,199,175,223,
+    174,111,227,244,139,251,14,215,166,163,84,160,12,246,80,221,
+    159,216,180,7,232,195,155,20,128,117,183,143,220,172,183,119,
+    146,51,121,210,204,180,128,30,150,222,187,2,180,192,233,238,
+    48,57,221,27,33,167,74,208,236,161,95,130,166,16,174,134,
+    244,243,189,110,253,252,142,113,95,3,182,219,233,157,43,35,
+    40,111,59,43,129,183,139,198,79,142,88,224,41,218,70,183,
+    33,43,12,0,172,106,199,43,3,184,125,116,255,38,85,4,
+    156,139,62,73,35,187,139,48,50,70,211,224,232,85,193,203,
+    54,27,221,130,117,24,192,77,249,3,160,39,117,7,232,192,
+    38,85,14,166,105,7,202,205,199,4,68,143,255,63,198,235,
+    111,72,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/simulate.py",
+    "m5.simulate",
+    embedded_module_data,
+    9762,
+    24618);
+
+} // anonymous namespace
+} // namespace gem5
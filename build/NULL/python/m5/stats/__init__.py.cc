@@ -0,0 +1,856 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,197,125,125,112,27,215,157,216,46,176,0,23,31,36,
+    65,18,252,38,197,149,40,137,132,68,145,146,108,201,182,62,
+    108,125,80,178,36,203,180,47,82,146,11,29,7,1,177,75,
+    18,18,8,208,187,75,73,228,129,57,94,70,173,65,13,83,
+    211,62,185,102,18,185,102,114,74,34,215,202,84,189,73,231,
+    124,55,237,93,46,119,211,235,180,157,27,128,69,42,20,45,
+    103,52,211,122,166,238,116,122,200,92,124,227,250,254,184,254,
+    126,191,183,187,88,124,72,86,46,55,83,113,245,8,188,125,
+    159,191,247,251,126,191,247,248,223,57,219,63,191,241,251,175,
+    127,223,193,113,239,112,50,39,243,113,110,156,253,230,199,121,
+    250,237,160,223,142,184,115,70,24,23,120,124,231,140,187,102,
+    220,227,110,250,44,196,235,102,196,113,113,198,51,238,225,89,
+    61,239,184,15,126,187,226,222,25,255,184,159,242,220,240,185,
+    126,188,1,62,215,201,98,188,113,38,48,30,152,105,26,111,
+    154,105,30,111,158,105,25,111,225,185,41,110,60,24,227,198,
+    91,225,119,155,252,140,236,189,206,143,183,59,56,165,125,138,
+    147,125,223,231,127,200,115,220,7,188,57,100,249,144,236,191,
+    206,255,16,62,125,96,77,99,188,3,75,203,245,83,60,252,
+    238,84,124,151,186,172,210,13,63,132,153,125,224,48,191,223,
+    109,44,255,238,169,241,35,31,150,131,85,61,116,83,15,173,
+    83,149,163,105,187,206,85,148,236,161,146,237,149,37,161,221,
+    35,114,103,85,187,189,84,186,171,170,221,163,114,79,85,217,
+    45,84,182,183,170,236,179,114,95,85,217,62,89,186,206,141,
+    75,242,86,72,183,202,219,32,221,38,247,67,218,47,63,39,
+    111,7,248,110,135,223,59,224,247,14,121,39,228,238,4,200,
+    15,192,10,12,78,113,145,144,60,0,57,187,228,65,72,119,
+    67,169,16,148,26,146,185,200,30,120,55,12,223,119,193,247,
+    17,121,55,188,221,43,15,65,186,207,193,61,207,201,123,174,
+    115,242,176,194,95,218,111,142,224,210,19,230,167,31,58,97,
+    100,78,107,100,79,66,95,7,228,230,200,65,104,107,4,218,
+    122,74,222,11,173,60,45,239,131,244,25,152,161,40,35,158,
+    236,151,187,229,39,228,39,229,3,242,65,249,41,249,233,91,
+    158,242,57,143,31,146,249,11,92,232,216,199,248,101,44,196,
+    23,132,47,36,147,58,252,174,143,105,99,115,241,248,203,201,
+    88,66,87,212,144,163,32,70,116,93,149,99,81,189,224,154,
+    140,232,145,56,148,9,204,42,106,44,9,121,23,244,136,62,
+    58,55,51,11,121,13,90,116,90,145,49,227,212,21,37,161,
+    127,140,61,133,132,66,235,201,100,124,110,38,17,81,95,154,
+    211,103,231,244,47,197,180,152,158,84,11,109,231,180,100,226,
+    124,44,161,104,229,249,1,204,183,178,168,228,249,216,21,5,
+    155,45,47,121,49,106,161,32,252,115,26,255,255,122,39,36,
+    175,115,175,243,175,59,129,24,121,32,58,110,134,191,225,228,
+    185,52,159,230,210,206,73,167,236,188,46,46,58,82,14,152,
+    186,16,249,59,104,226,203,106,100,86,138,72,179,241,72,44,
+    33,189,60,175,79,39,19,210,228,92,34,170,199,224,195,213,
+    152,62,45,125,241,11,231,165,217,136,170,197,18,83,210,180,
+    18,135,169,107,94,175,4,255,30,89,117,114,112,50,49,36,
+    237,218,117,249,106,68,157,210,66,146,158,148,148,107,179,74,
+    84,135,26,216,162,62,29,209,169,149,233,136,38,77,40,74,
+    66,210,102,227,49,93,154,163,126,230,212,56,118,169,12,195,
+    7,202,31,150,78,199,84,77,151,102,147,48,123,104,63,18,
+    151,160,221,185,25,128,52,181,18,211,164,136,166,193,119,25,
+    123,154,80,160,151,201,88,92,73,68,102,148,33,232,11,94,
+    195,19,85,149,136,14,37,160,71,125,90,145,162,201,68,20,
+    190,39,34,216,32,181,146,156,164,23,9,69,143,39,163,210,
+    224,55,166,147,154,142,77,132,164,72,66,6,32,0,52,96,
+    170,88,132,70,39,227,76,134,165,23,148,249,171,73,85,166,
+    22,204,65,193,112,84,69,146,1,77,174,64,177,73,53,57,
+    67,213,94,155,83,212,121,233,74,36,62,167,104,102,83,216,
+    6,3,232,113,179,242,33,250,138,255,16,169,102,20,237,144,
+    116,92,138,3,62,224,8,17,122,70,54,206,117,78,83,164,
+    201,164,202,38,105,130,223,104,208,24,89,105,84,165,134,97,
+    218,19,113,229,144,116,138,126,143,200,49,13,127,27,173,68,
+    162,128,97,243,195,210,197,249,217,88,52,18,143,207,99,47,
+    178,116,117,90,161,33,91,141,152,255,102,85,69,83,18,81,
+    5,135,23,41,225,128,172,204,42,9,89,147,224,163,150,156,
+    81,36,117,46,161,199,224,247,172,154,4,44,210,231,141,81,
+    158,134,209,43,215,34,51,179,48,30,171,233,171,128,92,179,
+    138,28,158,28,172,194,133,193,109,186,114,77,63,52,50,162,
+    33,85,12,235,215,244,231,100,69,139,30,61,29,137,107,202,
+    182,80,72,218,243,172,213,204,228,224,54,171,212,182,33,169,
+    84,46,196,250,86,145,138,128,122,93,216,159,22,229,109,52,
+    229,130,255,45,72,83,119,33,121,219,249,58,136,55,7,183,
+    236,90,230,202,25,73,154,155,228,101,254,186,88,206,62,23,
+    121,221,214,212,186,189,93,235,95,138,95,22,150,129,38,203,
+    219,227,185,101,97,148,123,181,27,169,84,23,74,165,175,240,
+    154,227,28,247,77,126,217,169,58,82,124,2,68,170,253,109,
+    202,113,4,210,149,158,20,50,53,199,88,237,137,156,135,220,
+    183,121,96,15,194,235,174,119,80,158,24,12,98,145,231,185,
+    68,91,127,89,131,219,57,21,229,49,79,114,155,74,124,133,
+    75,8,87,185,107,206,175,112,87,97,194,32,195,133,25,215,
+    13,144,231,14,156,8,119,201,109,214,148,133,187,174,114,25,
+    185,232,72,11,0,38,135,236,190,46,222,112,233,141,165,94,
+    210,46,0,94,221,117,49,229,88,23,107,129,168,28,168,163,
+    21,223,203,1,183,232,244,224,2,185,97,44,30,51,239,187,
+    28,124,243,150,190,189,235,152,228,99,92,202,121,155,255,39,
+    0,40,152,113,91,217,140,65,147,208,59,75,57,178,88,185,
+    52,95,1,109,228,2,103,66,33,228,25,51,241,71,36,20,
+    13,191,166,193,103,63,224,168,162,70,226,97,5,8,253,34,
+    100,52,93,86,148,217,240,68,60,146,184,28,102,180,95,198,
+    188,235,204,245,249,75,92,31,199,59,156,110,91,189,84,165,
+    172,230,47,83,93,173,251,145,165,28,172,148,186,47,5,107,
+    85,154,146,22,210,157,165,90,203,206,117,251,56,74,112,45,
+    131,242,119,65,95,75,97,42,188,43,84,194,3,161,241,57,
+    227,32,156,82,127,157,126,93,181,251,245,112,41,92,111,71,
+    249,12,203,75,78,58,104,149,45,220,164,85,222,7,171,252,
+    247,25,141,187,188,39,200,169,171,30,89,5,134,136,12,67,
+    84,196,200,5,231,33,105,96,161,125,64,146,147,138,150,24,
+    208,65,244,93,65,65,69,40,49,188,208,54,64,178,112,102,
+    46,174,199,128,21,26,82,98,120,193,113,72,90,232,5,241,
+    133,53,168,112,76,54,165,173,129,104,160,102,56,65,214,169,
+    56,205,130,123,74,209,129,83,22,188,95,194,250,167,84,53,
+    169,226,251,203,202,124,193,205,154,84,17,217,10,78,100,167,
+    184,56,146,180,180,244,89,159,166,70,71,102,169,213,145,153,
+    3,140,179,142,132,195,177,68,76,15,135,135,103,231,11,62,
+    134,224,212,194,194,169,48,84,14,155,98,226,8,8,75,96,
+    169,207,14,203,74,52,169,70,32,175,148,197,216,184,45,195,
+    214,140,6,157,107,1,128,221,167,75,220,102,75,219,234,149,
+    55,15,223,60,188,190,117,163,165,63,211,210,255,99,231,157,
+    211,239,251,238,250,238,189,182,49,248,116,102,240,233,159,182,
+    253,59,254,207,59,225,195,102,176,115,237,194,123,227,223,25,
+    255,246,87,111,125,53,211,117,14,158,59,81,246,27,158,108,
+    240,133,92,240,133,140,249,108,182,118,172,181,189,249,202,205,
+    87,214,247,189,21,94,13,87,212,61,11,15,214,61,203,158,
+    108,240,92,46,120,46,99,62,69,193,213,218,149,239,219,182,
+    126,126,253,252,189,182,15,249,159,116,102,183,31,206,109,63,
+    156,233,59,156,233,56,252,233,102,247,142,34,231,108,237,42,
+    37,155,29,189,80,252,189,133,239,44,124,59,117,43,149,233,
+    249,50,60,119,174,220,139,220,157,103,159,225,249,133,211,209,
+    217,245,75,14,146,98,173,196,9,173,124,250,233,167,90,51,
+    64,230,103,109,205,39,66,220,207,66,79,157,220,238,252,179,
+    126,30,210,50,166,142,107,77,76,99,152,67,166,254,14,152,
+    64,41,238,213,166,175,58,80,246,44,58,128,48,156,41,62,
+    229,40,103,196,111,58,86,154,47,112,239,115,106,31,71,202,
+    169,99,120,111,129,191,92,224,175,168,189,184,22,12,27,164,
+    37,181,7,62,124,230,61,130,26,71,52,57,51,251,236,194,
+    232,223,127,193,75,173,44,97,31,33,142,214,59,211,53,202,
+    158,127,25,188,215,116,239,248,218,225,181,195,235,175,221,217,
+    154,237,30,202,117,15,89,47,255,26,7,189,48,120,54,30,
+    87,166,64,227,67,172,148,174,48,253,23,53,48,208,204,0,
+    255,65,113,84,162,177,201,152,34,135,234,11,126,24,103,60,
+    54,193,208,76,69,56,22,124,103,103,102,147,170,78,148,80,
+    16,77,109,162,224,140,104,58,163,4,23,105,101,5,129,233,
+    248,64,82,51,90,193,205,116,192,130,128,74,95,193,3,138,
+    16,35,37,162,177,80,157,218,141,68,77,205,59,94,131,210,
+    76,203,165,230,8,148,5,1,149,32,13,57,251,215,1,162,
+    199,142,49,152,22,234,12,240,44,236,253,85,1,42,35,240,
+    118,35,177,192,191,37,174,40,8,245,195,249,192,190,76,213,
+    243,233,102,203,22,192,166,250,225,82,242,32,176,39,83,235,
+    41,186,224,37,52,87,116,115,245,161,140,127,208,254,60,104,
+    234,92,237,88,235,191,21,186,167,103,154,142,100,155,142,228,
+    154,142,164,79,20,253,190,122,192,213,135,36,159,116,113,109,
+    93,214,226,193,243,97,243,159,116,252,81,199,31,118,253,107,
+    204,205,118,141,230,32,109,61,149,107,61,149,62,93,20,156,
+    245,39,248,124,123,247,170,190,166,221,90,200,244,28,184,243,
+    196,221,167,225,23,62,237,199,224,249,176,141,253,206,4,142,
+    193,156,122,138,28,15,21,236,233,102,160,53,211,118,44,27,
+    56,158,11,28,207,216,158,162,19,223,34,29,109,1,160,253,
+    99,119,61,247,173,128,228,124,143,151,156,127,58,210,118,194,
+    205,253,204,221,121,162,223,249,179,109,60,164,33,103,161,30,
+    20,92,99,37,98,10,172,37,130,59,33,23,60,86,86,200,
+    173,238,195,133,221,79,236,149,169,222,5,55,83,160,11,117,
+    134,42,174,162,86,163,185,217,130,47,45,25,235,237,177,22,
+    116,161,239,115,86,60,138,245,191,133,212,1,203,155,247,52,
+    164,91,211,250,114,247,74,119,209,33,121,112,198,149,233,47,
+    156,156,183,213,124,253,201,40,207,121,218,238,139,61,27,98,
+    207,218,212,250,213,123,238,76,239,83,89,241,233,156,248,116,
+    70,124,58,223,214,11,120,224,57,66,73,250,116,190,165,243,
+    7,157,153,150,93,214,147,223,189,47,35,29,94,175,91,175,
+    187,167,127,235,236,234,100,214,223,155,241,247,230,27,219,210,
+    13,234,118,196,119,7,64,3,149,250,100,50,206,38,26,18,
+    212,167,17,36,79,97,242,12,38,141,38,3,249,250,215,165,
+    99,108,242,126,251,140,213,195,144,245,2,22,58,69,115,68,
+    28,30,226,92,82,70,232,179,63,69,97,208,213,94,228,30,
+    153,92,228,57,127,107,70,8,178,177,9,99,5,32,55,180,
+    8,128,232,192,228,139,218,68,59,169,190,100,23,143,114,232,
+    158,178,235,228,151,44,110,90,91,252,167,56,226,159,101,174,
+    7,208,173,249,200,15,160,34,51,197,137,33,49,59,14,186,
+    71,43,108,38,162,27,70,205,69,204,33,134,133,131,210,208,
+    216,212,209,78,78,38,20,150,13,52,13,242,27,190,145,145,
+    29,129,55,179,204,176,165,234,104,168,168,49,202,1,51,108,
+    90,177,103,160,41,203,176,79,150,38,230,225,205,100,4,116,
+    134,33,105,2,70,20,133,134,38,152,129,102,152,116,84,70,
+    83,116,29,237,106,221,104,201,198,61,193,132,36,131,200,24,
+    247,203,230,11,203,86,220,197,106,12,78,192,234,135,14,73,
+    182,169,219,7,165,73,131,198,64,14,73,23,213,57,176,175,
+    204,218,218,108,36,10,0,168,168,15,106,204,84,2,109,82,
+    235,125,69,117,170,127,170,220,44,124,132,221,119,152,53,195,
+    190,176,202,64,219,206,240,204,129,130,139,202,23,68,84,102,
+    112,89,32,223,49,153,0,126,15,149,129,158,169,158,230,100,
+    178,207,196,92,236,233,180,129,185,167,33,107,21,49,23,217,
+    201,18,247,201,54,206,223,184,242,204,125,95,239,134,175,119,
+    109,98,125,251,29,119,214,55,146,243,141,100,132,17,66,201,
+    130,99,250,0,235,237,204,232,233,3,239,243,68,37,31,123,
+    73,44,76,45,196,102,79,147,248,141,250,108,200,214,96,226,
+    233,255,100,120,106,87,169,69,221,134,159,229,242,92,117,166,
+    196,41,126,81,44,43,239,121,100,121,15,148,247,216,13,189,
+    75,22,118,175,219,114,43,233,32,229,76,9,41,87,202,157,
+    170,211,109,227,78,85,24,72,101,239,42,28,110,41,239,15,
+    225,237,7,86,9,162,165,131,222,106,90,66,160,85,208,18,
+    96,45,203,5,82,50,94,145,199,7,42,169,115,81,80,119,
+    17,203,99,137,136,58,111,47,50,44,157,69,29,91,163,54,
+    16,243,45,213,122,66,73,40,147,49,232,46,121,5,41,64,
+    141,200,166,83,73,47,39,219,67,94,11,141,79,77,78,198,
+    162,49,66,88,192,138,200,20,57,59,200,157,1,138,70,12,
+    17,216,106,158,209,198,220,204,172,86,162,130,211,160,110,72,
+    241,100,242,242,220,44,86,164,217,90,47,95,6,237,93,159,
+    199,124,229,26,104,75,68,169,64,45,248,123,80,25,158,26,
+    30,42,41,252,19,106,132,122,67,135,212,20,168,6,211,232,
+    160,177,220,29,87,98,202,85,32,93,91,183,54,136,49,222,
+    192,92,57,64,245,56,13,120,135,228,14,172,99,114,18,234,
+    65,54,88,15,211,0,19,100,74,86,171,9,172,207,212,47,
+    173,180,36,80,25,125,92,228,217,145,213,200,213,137,72,244,
+    50,242,185,25,224,45,172,7,198,109,136,170,237,28,178,196,
+    88,206,131,214,68,224,82,117,0,75,52,9,32,26,68,255,
+    159,29,134,82,28,11,161,127,43,98,240,89,229,181,185,24,
+    24,16,0,178,210,60,47,88,32,103,131,138,39,175,218,235,
+    176,65,159,72,2,167,181,13,149,193,3,6,59,23,101,108,
+    50,153,136,207,75,87,213,152,197,43,25,82,194,186,144,51,
+    88,209,152,179,113,48,150,136,198,231,100,101,68,185,70,191,
+    153,123,16,217,108,108,193,172,25,157,158,75,92,214,76,40,
+    36,230,102,38,96,60,208,16,141,145,181,66,69,160,252,209,
+    189,67,22,243,199,254,81,30,176,169,0,219,54,91,96,206,
+    83,24,166,213,20,99,242,132,101,195,210,73,214,29,206,93,
+    71,47,29,140,132,173,193,116,50,46,75,145,137,36,80,216,
+    193,39,165,23,98,39,36,37,18,157,54,86,145,160,134,26,
+    46,171,9,107,131,62,108,41,50,5,146,10,214,66,155,86,
+    226,241,61,154,62,15,235,49,21,79,78,96,81,0,67,66,
+    27,66,87,32,84,24,216,53,192,188,158,113,45,105,212,214,
+    192,186,213,161,0,162,173,52,160,205,107,160,78,15,71,103,
+    231,118,13,199,102,163,3,195,210,113,182,178,64,189,8,103,
+    29,134,26,3,232,50,184,154,45,68,18,243,146,1,98,179,
+    75,105,144,92,156,38,210,37,64,140,50,168,39,208,175,76,
+    69,169,9,163,184,49,191,47,35,40,152,62,7,112,30,34,
+    64,18,131,128,238,97,53,201,93,12,202,215,180,133,42,234,
+    28,185,132,229,67,150,155,147,45,68,76,39,64,194,160,129,
+    222,166,165,171,56,14,61,114,89,65,4,154,76,50,160,67,
+    203,232,161,38,156,37,71,50,118,50,151,48,220,194,138,116,
+    89,153,213,105,200,241,8,202,93,152,1,131,186,170,204,198,
+    65,4,201,40,231,153,159,122,70,137,36,136,88,176,62,67,
+    22,196,189,164,106,186,146,35,128,94,74,244,242,44,238,81,
+    152,227,152,167,49,64,5,114,173,3,116,147,186,98,77,216,
+    244,7,39,146,87,145,137,204,196,116,114,122,219,100,252,40,
+    240,29,53,6,42,4,201,114,28,230,52,238,63,0,139,153,
+    1,74,153,83,85,32,55,244,3,39,180,185,89,52,167,96,
+    188,86,221,49,96,38,44,151,6,13,255,17,173,161,207,135,
+    106,20,38,234,75,131,208,32,40,2,96,187,29,146,198,44,
+    34,97,108,85,87,102,137,128,102,85,101,15,80,70,18,87,
+    102,72,218,11,89,37,247,56,160,185,157,220,34,115,122,18,
+    176,200,112,90,151,84,138,125,123,75,172,226,215,211,102,144,
+    133,205,197,35,85,250,140,233,234,103,28,227,97,181,145,59,
+    194,82,106,168,197,13,2,192,161,254,0,226,242,192,144,52,
+    128,170,193,128,4,240,27,136,47,76,14,72,131,42,242,57,
+    85,97,123,21,40,254,172,89,159,31,63,141,171,138,88,52,
+    27,159,155,138,37,66,182,14,89,59,165,46,227,202,21,37,
+    94,6,103,44,80,54,18,163,72,9,90,54,229,109,26,36,
+    3,16,140,57,219,11,198,119,28,211,196,188,174,104,230,158,
+    137,177,167,193,200,193,26,169,213,11,227,138,51,67,6,1,
+    205,105,115,180,66,51,128,187,52,193,25,171,40,52,129,36,
+    108,53,81,26,150,225,183,183,214,145,40,211,62,177,83,85,
+    60,146,21,26,178,109,95,48,22,93,26,96,13,188,65,28,
+    3,166,4,47,136,92,74,3,176,33,145,201,158,112,17,113,
+    205,208,201,129,224,49,25,170,197,42,17,129,145,211,41,182,
+    118,160,147,82,75,6,247,122,140,150,18,73,221,106,205,170,
+    206,184,155,181,62,95,32,174,134,230,132,165,73,16,195,171,
+    130,98,45,245,122,250,128,165,92,79,31,176,235,214,150,164,
+    218,183,119,239,97,147,2,12,85,187,86,213,146,100,59,108,
+    195,179,163,132,216,135,13,208,29,125,197,46,29,6,94,173,
+    217,16,97,230,209,39,15,27,104,120,20,169,201,80,238,221,
+    5,111,76,67,49,21,73,68,149,130,19,160,167,30,67,21,
+    247,56,38,103,72,217,38,80,250,212,147,248,69,52,199,164,
+    142,210,87,115,22,5,159,109,132,5,23,117,8,70,61,235,
+    175,224,34,252,41,212,25,99,46,212,25,171,165,62,9,141,
+    104,168,203,74,165,127,166,237,48,45,79,30,48,109,135,223,
+    132,172,219,88,246,27,28,217,14,23,29,156,216,188,58,240,
+    238,19,217,186,190,92,93,95,145,227,93,61,249,150,174,213,
+    80,186,110,179,174,169,246,139,143,124,13,166,185,145,23,189,
+    121,49,144,23,253,148,182,228,197,250,188,216,8,233,166,232,
+    79,127,121,185,126,165,244,33,47,54,252,162,221,239,119,255,
+    146,131,164,200,249,93,110,102,155,8,151,180,100,162,204,147,
+    104,237,29,75,92,149,237,81,225,78,71,157,125,225,76,165,
+    194,126,238,194,75,99,229,10,123,5,94,97,151,214,170,226,
+    23,99,9,121,21,195,71,224,23,174,144,134,189,88,48,196,
+    82,38,12,95,129,44,7,188,37,183,40,192,176,153,243,247,
+    172,157,200,250,250,114,62,116,25,176,121,185,176,70,188,32,
+    70,38,180,100,124,78,87,162,46,219,20,235,204,41,238,170,
+    49,69,211,188,185,203,255,16,234,124,96,213,195,141,180,72,
+    82,168,48,80,128,243,211,124,209,116,7,198,98,41,23,100,
+    216,171,232,204,145,201,180,71,196,49,161,1,10,23,83,11,
+    88,105,50,92,152,150,75,218,114,84,103,77,26,181,13,133,
+    143,196,182,244,18,104,164,212,8,235,157,113,207,40,232,42,
+    83,40,107,98,184,231,74,219,209,170,114,37,150,156,211,140,
+    110,64,171,48,180,43,28,97,4,229,50,168,13,150,29,196,
+    20,21,163,187,65,148,245,128,245,96,59,93,86,230,201,28,
+    216,3,92,135,189,29,66,70,8,90,104,200,232,153,148,32,
+    106,135,213,192,81,25,122,11,238,113,105,146,25,24,97,112,
+    103,80,83,48,70,0,55,207,113,139,88,189,2,220,158,213,
+    180,193,231,108,194,176,20,226,122,68,154,73,202,32,228,81,
+    71,53,7,200,20,47,38,228,113,222,136,114,165,222,25,16,
+    172,169,149,1,98,136,122,70,59,15,148,60,133,150,69,139,
+    33,213,163,140,208,160,245,4,76,208,166,255,177,72,2,40,
+    206,118,100,200,238,52,86,157,116,78,132,25,0,99,8,108,
+    30,187,204,131,65,144,134,14,125,49,97,200,52,54,208,196,
+    200,20,209,99,241,184,20,185,18,137,197,105,135,157,12,58,
+    156,131,229,197,24,66,182,79,90,63,78,254,232,192,4,152,
+    41,3,161,71,248,99,106,104,17,99,128,126,101,58,196,130,
+    166,203,21,74,132,37,244,22,144,105,202,17,128,45,116,56,
+    23,87,236,234,3,54,84,18,78,38,70,160,201,131,82,233,
+    203,36,201,64,126,25,112,41,199,27,83,218,162,138,70,182,
+    148,213,163,156,68,152,177,48,133,50,69,185,166,112,173,144,
+    105,199,217,87,104,243,243,197,154,217,4,66,210,210,176,76,
+    158,128,90,22,97,25,3,17,193,217,174,57,89,229,106,139,
+    71,226,48,101,124,44,62,60,181,240,92,153,132,163,5,56,
+    108,2,4,229,101,69,101,50,36,1,113,140,6,158,99,75,
+    206,70,101,176,69,65,253,2,137,40,179,21,18,54,5,1,
+    75,2,175,68,161,19,114,17,203,164,114,106,24,19,44,162,
+    126,29,217,168,203,20,74,140,149,54,17,43,165,72,35,147,
+    159,70,32,191,1,249,233,46,198,79,143,112,254,109,40,88,
+    130,125,249,166,206,124,99,107,190,190,169,232,115,251,221,191,
+    224,220,40,63,220,40,63,220,166,252,16,163,70,60,211,199,
+    1,248,90,219,217,250,213,135,112,89,224,176,101,238,212,69,
+    167,125,31,246,146,229,166,74,57,75,78,169,202,253,213,148,
+    147,248,242,81,71,5,95,70,236,144,204,177,1,225,69,167,
+    65,29,175,226,207,201,171,149,204,25,105,220,40,205,92,74,
+    50,144,11,193,137,24,15,214,36,102,68,188,38,162,89,157,
+    152,6,248,100,60,25,209,193,178,102,188,128,88,67,12,58,
+    188,18,147,231,208,157,100,243,15,25,238,134,25,101,6,26,
+    223,51,67,225,45,204,56,4,228,86,149,136,76,60,0,13,
+    117,51,218,138,12,58,48,252,200,145,101,121,43,140,130,204,
+    98,62,48,172,92,211,135,103,231,25,78,154,243,31,54,131,
+    206,142,27,51,43,241,1,48,178,94,158,127,20,115,153,0,
+    67,235,114,24,32,165,153,68,63,86,174,77,27,206,34,244,
+    152,48,219,119,66,177,107,212,166,89,111,136,49,19,182,54,
+    235,226,224,175,72,233,213,77,60,66,135,53,65,96,209,41,
+    100,60,87,154,211,209,131,79,26,84,230,40,120,75,217,68,
+    63,64,120,228,164,117,131,124,184,22,211,11,162,170,76,193,
+    16,20,181,224,138,198,147,208,161,192,168,78,49,9,174,224,
+    78,18,10,154,27,167,6,201,5,194,230,32,76,138,187,4,
+    217,7,144,226,70,24,197,237,228,26,250,215,247,223,219,245,
+    211,47,101,234,207,103,235,207,231,234,207,47,157,222,20,188,
+    215,95,90,61,125,243,124,86,216,154,19,182,102,132,173,121,
+    95,211,210,139,134,218,54,151,136,93,251,152,227,2,255,255,
+    72,238,119,161,240,5,29,240,111,166,68,114,51,201,4,110,
+    198,226,42,69,227,49,138,123,35,151,106,68,250,34,140,23,
+    216,254,12,238,121,104,0,102,197,212,13,207,35,72,19,20,
+    20,70,30,54,122,103,202,208,41,88,231,4,51,123,34,40,
+    156,33,91,49,181,39,160,45,166,60,121,217,58,51,205,201,
+    112,251,106,137,200,172,54,157,212,77,115,84,83,226,204,20,
+    180,134,202,68,21,200,252,4,189,96,141,208,152,135,165,147,
+    198,216,153,146,51,137,242,109,66,153,6,58,150,102,98,96,
+    145,154,141,107,85,202,2,180,30,143,91,206,66,166,91,208,
+    150,205,5,69,169,36,206,56,204,141,141,198,144,131,204,97,
+    165,38,245,36,224,11,113,129,136,233,231,53,6,246,112,42,
+    53,220,12,134,177,248,124,60,57,97,248,233,44,107,209,4,
+    132,57,127,4,94,13,163,218,146,229,54,217,25,185,22,102,
+    52,110,114,128,19,100,233,191,54,167,204,41,76,187,101,227,
+    51,25,64,76,39,56,41,154,213,126,9,98,54,186,151,94,
+    140,157,168,77,180,136,220,64,176,35,250,204,236,200,148,50,
+    115,96,15,131,24,226,198,115,244,17,141,197,216,204,89,176,
+    246,180,129,161,1,230,75,124,213,36,100,50,249,10,222,210,
+    176,129,80,235,145,70,39,49,153,194,100,154,145,55,145,47,
+    25,136,9,76,98,92,41,232,193,18,151,113,51,220,214,36,
+    222,36,228,191,104,35,222,93,92,195,246,245,19,119,148,159,
+    122,51,245,47,100,235,95,200,213,191,240,104,226,173,10,198,
+    35,138,189,200,85,238,72,214,142,18,212,109,134,76,165,61,
+    86,21,22,69,209,127,145,85,200,58,46,203,180,63,98,139,
+    152,176,226,36,140,32,91,22,136,139,110,63,96,223,37,127,
+    176,81,220,112,164,87,212,129,26,22,233,78,38,227,241,228,
+    85,210,197,108,126,125,227,243,200,8,82,241,43,207,209,70,
+    227,81,146,142,175,28,182,125,121,245,85,155,252,181,148,99,
+    86,153,117,141,184,13,253,26,81,178,214,110,60,229,15,75,
+    167,205,239,150,127,21,125,55,10,147,141,70,136,46,114,17,
+    205,166,113,218,130,135,75,251,159,72,119,22,49,90,148,102,
+    120,108,43,194,103,135,75,180,104,42,255,51,115,26,210,1,
+    139,203,98,228,90,22,155,101,110,152,140,133,156,5,47,19,
+    23,200,1,153,252,104,14,179,144,100,132,187,17,215,13,26,
+    30,198,150,216,173,225,134,136,44,219,74,168,24,55,53,133,
+    8,57,192,16,178,139,115,53,222,23,90,55,132,214,159,183,
+    13,222,105,201,182,237,201,181,237,201,10,195,57,97,56,99,
+    62,213,136,232,54,17,177,141,71,68,252,117,162,65,49,2,
+    180,18,53,23,29,30,78,183,197,116,166,28,151,44,68,46,
+    197,208,45,58,19,131,208,147,191,84,14,122,234,230,57,123,
+    140,168,236,180,215,165,56,196,170,144,89,251,104,82,206,165,
+    142,178,250,238,138,250,117,213,245,97,6,208,75,149,179,67,
+    92,56,114,146,22,168,146,148,12,47,124,137,126,192,214,0,
+    142,95,190,80,33,43,56,212,140,92,94,232,40,11,101,34,
+    19,70,159,159,85,192,92,243,15,148,104,109,120,108,193,71,
+    164,104,188,235,26,40,109,230,227,62,30,136,62,170,9,202,
+    101,72,84,119,64,39,234,28,38,24,252,175,34,82,168,7,
+    48,57,136,200,35,190,160,204,219,34,151,4,22,185,132,197,
+    11,110,22,196,94,168,51,66,52,202,89,161,170,154,201,85,
+    196,181,255,65,184,86,116,11,174,157,121,49,148,169,122,62,
+    221,244,181,21,57,135,107,103,41,121,32,238,200,212,122,138,
+    46,120,137,97,71,34,215,208,150,254,205,213,232,242,171,43,
+    175,46,97,68,144,235,52,191,217,220,189,118,250,214,139,185,
+    230,93,233,186,116,29,180,218,130,174,176,211,188,61,221,20,
+    235,51,13,163,119,218,238,246,194,47,246,100,197,83,57,241,
+    84,198,124,138,78,44,199,66,155,196,198,165,223,166,26,167,
+    176,97,248,197,158,172,120,58,39,158,206,136,167,31,248,154,
+    211,79,173,30,92,126,110,229,185,140,208,165,33,124,190,233,
+    246,112,203,129,30,231,119,249,30,231,7,205,207,114,127,188,
+    237,120,191,243,79,183,241,144,70,109,36,196,121,76,26,250,
+    223,28,157,126,34,10,90,4,140,189,206,45,242,178,112,157,
+    179,111,197,87,70,47,99,128,247,40,247,234,111,126,213,137,
+    116,176,40,44,186,236,172,94,118,173,219,21,61,235,159,238,
+    177,149,113,95,231,82,66,249,22,127,57,14,19,182,59,106,
+    96,59,208,235,186,221,67,102,253,75,57,31,45,98,86,190,
+    34,59,136,50,158,68,54,102,99,221,90,185,236,96,92,53,
+    6,182,86,50,74,204,147,20,35,162,136,135,68,167,235,4,
+    67,24,87,173,97,85,69,130,191,26,92,228,237,170,172,204,
+    167,120,140,239,174,26,111,171,189,84,121,43,44,142,56,228,
+    24,91,112,164,200,32,32,34,37,207,94,193,53,171,162,238,
+    227,40,56,101,12,3,164,76,28,188,169,40,120,232,125,24,
+    94,46,12,210,71,27,225,99,180,160,102,11,121,53,75,190,
+    133,132,244,28,135,132,148,15,182,191,51,246,214,88,54,184,
+    61,23,220,14,88,237,233,163,36,61,186,233,111,90,221,189,
+    170,195,255,221,89,255,150,156,127,75,134,30,64,224,229,186,
+    149,186,52,253,84,51,115,193,4,226,54,2,34,197,130,250,
+    23,1,36,178,141,217,254,11,111,138,127,211,177,82,143,94,
+    220,143,41,42,153,194,64,29,170,132,19,226,175,217,231,167,
+    246,67,178,16,250,156,153,149,98,59,223,193,169,109,165,169,
+    101,218,159,97,207,90,228,222,241,123,145,159,140,226,71,222,
+    202,165,193,47,56,134,164,178,9,56,204,9,120,13,44,144,
+    185,57,80,102,222,231,199,216,32,121,245,155,92,153,84,252,
+    76,60,18,143,204,76,200,145,103,23,6,62,119,148,172,224,
+    183,113,140,94,26,227,157,227,247,46,222,121,113,137,163,193,
+    124,198,31,10,185,209,199,143,12,88,87,241,216,153,154,226,
+    200,87,158,140,37,10,110,182,213,70,129,213,176,136,33,183,
+    250,58,150,248,109,44,17,48,226,176,194,38,226,171,215,240,
+    221,211,4,208,48,133,3,74,54,103,76,107,205,145,170,24,
+    245,247,45,28,220,109,142,49,89,206,213,178,52,134,63,200,
+    19,3,69,206,74,188,92,199,33,128,225,15,142,66,146,109,
+    127,38,7,16,21,130,249,190,145,34,39,184,118,83,146,21,
+    187,211,117,171,237,107,91,1,99,86,131,239,116,190,213,249,
+    238,193,204,182,103,224,249,240,169,108,247,201,92,247,201,108,
+    211,104,174,9,120,230,243,236,201,138,103,114,226,153,140,120,
+    6,186,245,52,167,61,171,3,239,12,191,53,188,222,158,109,
+    14,229,154,67,89,113,87,78,220,149,161,167,232,49,59,97,
+    8,200,85,172,31,113,194,111,112,191,106,160,93,37,77,62,
+    164,110,77,110,88,139,158,213,235,28,9,186,99,156,161,236,
+    23,252,24,139,117,33,54,67,106,125,161,219,52,235,153,162,
+    70,153,103,128,95,197,65,237,35,100,163,217,49,42,120,195,
+    76,222,195,229,217,75,203,179,41,212,93,63,123,95,232,218,
+    16,186,178,66,79,78,232,201,8,61,70,94,104,67,8,101,
+    133,221,57,97,119,198,124,24,168,236,19,183,44,128,63,34,
+    80,165,248,165,22,187,221,94,154,114,229,137,162,20,255,56,
+    0,124,28,64,1,251,220,130,49,226,41,174,82,233,225,203,
+    4,12,190,191,203,151,11,24,96,169,125,6,219,124,159,47,
+    8,42,158,154,116,169,216,105,193,7,20,114,214,220,145,171,
+    135,47,8,219,231,213,228,220,172,166,226,129,218,66,61,163,
+    147,240,20,229,129,70,92,103,208,141,250,187,248,218,197,242,
+    237,161,120,234,63,53,147,219,184,2,49,90,129,124,157,111,
+    41,181,217,216,146,107,236,203,54,110,205,53,110,77,11,249,
+    166,214,251,77,253,27,77,253,217,166,29,185,166,29,247,155,
+    134,54,154,134,178,77,195,185,38,12,129,70,180,133,36,237,
+    202,139,141,64,29,174,229,134,149,134,116,195,166,216,186,58,
+    181,14,234,194,174,50,44,119,153,197,171,151,78,48,151,14,
+    181,119,60,16,102,30,254,90,116,148,185,94,28,41,254,174,
+    163,18,108,4,52,231,67,132,223,24,199,162,248,31,91,252,
+    53,44,242,116,248,5,143,220,84,174,79,99,137,12,64,249,
+    52,214,1,193,205,79,21,4,148,211,234,59,240,206,128,179,
+    17,169,92,15,166,87,24,125,45,97,44,176,208,111,172,20,
+    51,196,45,86,90,86,232,199,184,34,24,252,139,1,203,193,
+    214,119,206,189,117,238,205,243,55,207,163,32,235,165,36,61,
+    154,247,183,164,159,95,61,190,170,103,253,61,57,127,79,134,
+    30,80,206,140,2,140,210,222,162,129,210,34,135,156,52,52,
+    66,7,245,159,153,131,252,122,105,111,213,54,42,245,61,200,
+    186,139,99,120,138,141,161,232,112,184,48,208,185,42,249,68,
+    228,92,205,171,123,214,101,160,199,154,228,89,211,64,143,211,
+    26,227,65,218,180,147,78,175,193,58,223,112,46,115,151,172,
+    162,181,13,246,170,165,250,156,67,25,176,96,205,6,65,85,
+    241,9,194,141,93,142,207,63,22,166,58,232,40,150,173,126,
+    201,183,87,155,35,84,181,48,86,70,249,15,57,118,166,6,
+    97,18,2,98,157,236,176,29,186,170,129,234,101,177,160,21,
+    173,1,80,90,9,40,14,194,98,1,143,121,165,28,168,190,
+    213,192,230,54,106,173,222,222,218,122,93,173,25,149,3,94,
+    15,216,96,97,205,172,116,24,176,34,50,246,194,178,107,209,
+    153,114,170,47,233,237,182,158,156,178,179,162,92,40,229,92,
+    183,153,171,182,178,143,57,174,202,249,37,218,160,197,250,207,
+    175,135,163,187,247,146,222,107,235,145,175,117,44,46,36,140,
+    209,105,51,82,181,11,126,195,36,37,46,28,106,84,145,131,
+    21,28,51,7,10,30,144,135,47,77,92,2,133,167,208,20,
+    211,172,47,95,162,189,15,21,143,69,22,60,74,2,52,119,
+    220,58,85,95,228,12,246,126,242,36,43,103,147,174,46,106,
+    187,80,55,29,209,240,164,188,250,125,204,244,66,217,48,6,
+    130,38,244,66,115,120,34,150,160,81,156,137,65,115,106,116,
+    122,30,244,45,1,15,86,23,156,201,137,75,5,103,76,190,
+    70,214,40,150,246,80,233,48,228,19,23,176,116,40,227,72,
+    133,122,15,146,133,29,213,77,150,152,148,213,192,191,34,161,
+    109,28,48,243,117,172,181,100,125,189,57,31,177,158,150,188,
+    191,57,125,122,211,87,191,114,228,190,47,180,225,11,221,233,
+    207,250,134,115,62,144,22,65,207,246,205,198,230,213,39,150,
+    175,173,92,91,219,119,99,49,189,152,15,116,174,122,214,182,
+    175,59,215,143,223,118,103,3,3,185,192,64,198,124,62,146,
+    160,234,247,26,110,55,64,171,77,79,80,242,230,153,213,147,
+    107,45,249,96,239,234,217,245,224,90,98,93,91,75,172,37,
+    238,68,179,193,253,185,224,254,12,61,192,2,141,194,159,4,
+    184,64,215,90,255,123,35,223,25,201,118,237,206,117,237,254,
+    241,133,187,95,185,27,206,54,30,205,53,30,45,114,238,250,
+    125,249,206,222,85,119,190,173,7,52,175,166,125,155,237,91,
+    214,174,172,127,35,219,126,48,215,126,16,152,91,235,150,124,
+    199,150,251,29,187,55,58,118,223,25,189,215,255,7,35,191,
+    63,146,221,127,50,183,255,100,182,99,52,215,49,154,233,24,
+    205,119,244,230,123,251,239,247,14,111,244,14,103,123,247,230,
+    122,247,174,158,46,122,184,246,94,106,239,19,63,87,223,183,
+    166,101,253,253,57,127,127,198,124,172,83,31,225,232,116,44,
+    46,195,186,168,187,57,82,170,136,49,227,129,104,245,199,230,
+    98,176,83,31,146,113,234,67,253,192,76,126,130,208,199,99,
+    75,116,214,195,209,238,2,59,231,97,201,126,174,173,235,230,
+    215,238,183,134,54,90,67,217,214,221,185,214,221,104,233,247,
+    82,178,236,73,11,233,104,94,108,2,221,116,251,154,51,43,
+    246,228,196,158,12,61,104,230,179,66,213,26,169,197,199,191,
+    195,51,219,28,108,242,50,22,250,171,48,203,71,157,59,142,
+    8,118,63,151,41,154,193,130,169,197,204,26,237,101,107,91,
+    224,232,61,184,91,117,174,180,162,143,29,168,14,218,253,102,
+    41,254,146,197,124,142,208,247,199,57,81,13,35,218,169,183,
+    216,90,169,178,247,237,111,101,215,245,234,247,181,161,248,88,
+    125,147,39,193,189,240,231,236,14,2,107,187,2,183,253,162,
+    154,52,27,137,94,142,76,41,195,146,116,162,20,99,91,253,
+    94,138,25,1,41,204,18,27,178,118,52,140,98,166,131,214,
+    186,252,1,67,66,192,30,136,69,226,20,35,141,223,147,101,
+    33,36,86,187,165,54,19,184,213,165,150,117,111,236,199,26,
+    205,14,215,22,221,255,153,99,42,254,122,45,112,84,192,67,
+    13,66,185,199,208,40,180,238,50,63,17,224,65,105,235,14,
+    62,91,94,219,242,141,63,30,223,89,245,116,111,169,133,210,
+    201,253,5,164,216,38,196,219,82,43,11,110,108,53,108,181,
+    131,34,198,208,100,23,206,89,224,144,6,118,104,3,210,224,
+    14,57,36,93,141,176,72,69,118,201,67,124,190,12,216,19,
+    243,82,68,2,251,139,20,210,193,144,117,85,132,119,193,27,
+    14,99,230,142,189,7,229,80,93,193,69,241,205,5,207,68,
+    68,83,78,226,71,242,94,18,227,41,56,98,114,193,53,25,
+    143,76,105,133,58,57,166,205,198,35,243,33,135,186,134,239,
+    223,69,240,216,189,52,94,106,135,169,180,93,108,53,75,114,
+    162,244,238,191,225,196,209,173,14,138,108,99,203,27,11,55,
+    22,150,83,43,41,224,190,158,134,245,39,127,244,236,247,159,
+    205,246,63,145,235,127,130,50,54,253,77,69,7,223,180,231,
+    65,32,120,211,147,135,164,238,23,30,87,125,195,47,57,72,
+    138,148,52,112,77,173,55,189,239,126,241,214,171,217,192,46,
+    20,54,35,249,142,237,235,250,237,171,217,142,225,244,232,202,
+    217,52,252,160,14,60,66,239,136,115,141,85,69,228,17,250,
+    160,7,23,109,130,207,83,57,101,190,202,117,237,24,251,140,
+    31,6,184,16,200,92,228,216,2,99,128,215,108,46,20,245,
+    31,225,250,118,84,130,197,116,151,252,21,2,37,72,64,89,
+    223,122,123,231,143,134,190,63,116,71,203,110,123,34,183,237,
+    9,195,113,2,74,59,234,128,101,168,111,57,114,88,168,221,
+    227,161,190,97,173,168,103,33,121,223,161,222,194,207,255,166,
+    98,45,63,103,180,127,131,163,109,160,209,174,69,222,155,254,
+    206,244,183,47,221,186,100,142,211,171,190,132,45,28,227,76,
+    157,197,67,22,4,122,48,11,94,250,24,70,79,22,24,71,
+    73,213,202,193,227,192,76,212,209,41,71,180,54,0,158,127,
+    88,11,207,88,9,76,238,227,48,50,52,140,162,215,235,130,
+    37,54,147,79,122,184,230,182,183,163,55,99,247,219,66,27,
+    109,161,108,219,238,92,219,238,108,211,80,174,105,104,233,220,
+    71,129,46,20,99,20,246,217,7,214,172,216,156,246,174,62,
+    185,22,204,138,91,114,226,150,12,61,31,9,13,175,191,244,
+    205,151,50,29,79,192,179,244,82,86,120,50,39,60,153,17,
+    158,220,196,186,14,23,121,223,219,160,174,180,253,91,80,247,
+    230,51,89,177,55,47,250,223,240,221,240,97,60,104,26,126,
+    62,113,115,174,166,85,187,215,34,144,105,26,132,39,43,132,
+    114,66,40,35,132,62,98,126,140,224,134,16,204,10,109,57,
+    161,45,99,62,213,2,214,138,27,157,224,42,93,62,32,160,
+    218,22,209,150,125,12,118,6,34,168,189,156,161,85,11,25,
+    18,20,206,133,87,94,86,21,212,18,109,1,104,184,149,46,
+    71,244,136,20,137,226,41,190,97,137,5,35,154,76,95,198,
+    168,31,91,76,58,198,17,208,214,103,66,166,176,28,100,75,
+    108,199,254,31,12,137,223,231,11,117,179,108,156,234,159,212,
+    196,225,78,227,117,53,18,11,14,59,18,199,190,19,251,246,
+    229,91,151,13,36,30,3,219,248,79,177,141,191,176,176,145,
+    103,136,104,163,232,191,48,147,191,69,60,60,66,45,125,226,
+    229,154,186,17,177,218,41,65,236,242,191,225,191,225,103,78,
+    144,116,3,97,69,166,41,4,79,86,216,149,19,118,101,204,
+    231,17,190,171,20,79,198,177,11,140,99,151,101,28,187,82,
+    188,122,37,197,195,234,191,134,155,27,143,3,52,40,219,190,
+    8,70,245,67,110,200,169,218,168,91,233,192,59,120,106,120,
+    173,236,187,228,143,213,115,149,69,218,70,227,120,44,55,227,
+    74,251,138,138,66,16,199,98,183,154,75,2,246,81,125,241,
+    101,27,158,4,1,33,37,212,182,29,43,111,27,66,8,152,
+    206,130,154,27,0,18,207,156,5,143,237,72,106,39,199,98,
+    77,240,47,187,170,59,79,61,150,23,247,49,157,144,207,24,
+    78,0,231,178,235,33,135,79,107,236,93,45,11,213,104,1,
+    245,107,234,210,85,11,119,168,228,26,115,171,223,229,80,54,
+    146,75,73,125,27,62,147,145,83,240,78,40,83,177,4,51,
+    106,69,37,33,51,211,217,93,210,48,10,124,130,68,84,193,
+    139,236,132,57,51,153,71,173,210,86,253,75,72,22,182,135,
+    169,152,158,52,55,9,108,135,255,173,250,30,164,124,108,148,
+    124,105,157,229,123,67,18,37,232,77,11,188,113,238,198,185,
+    213,171,89,127,95,206,223,151,161,7,74,223,15,14,108,4,
+    7,178,193,80,46,24,186,31,28,217,8,142,100,131,251,114,
+    193,125,69,206,137,251,74,144,44,143,166,143,167,95,203,251,
+    91,238,251,183,108,248,183,172,189,150,245,111,205,249,183,102,
+    252,91,243,254,182,244,185,213,215,150,95,92,121,49,253,34,
+    21,232,217,240,247,216,183,158,138,117,102,43,76,152,138,5,
+    15,134,86,144,196,84,255,3,194,65,84,49,184,74,83,100,
+    245,63,226,172,113,237,213,155,152,16,191,250,247,12,216,239,
+    16,176,209,93,172,49,111,47,63,75,208,36,32,153,23,39,
+    152,86,100,33,80,9,52,245,63,65,118,29,66,201,199,27,
+    38,165,224,70,129,249,176,36,192,137,245,69,174,193,37,61,
+    8,118,130,94,230,233,167,4,128,216,218,249,206,215,222,250,
+    90,182,117,71,174,117,7,94,36,177,147,146,85,62,31,104,
+    191,31,216,182,17,216,182,190,47,27,216,145,11,236,200,208,
+    195,0,84,114,96,110,182,246,174,201,239,37,190,147,200,110,
+    25,206,109,25,206,182,142,228,90,81,147,171,239,167,196,104,
+    71,218,8,72,217,192,182,92,96,91,134,30,188,147,162,191,
+    232,49,135,1,163,243,180,164,189,111,63,153,107,233,207,182,
+    236,200,181,236,200,138,59,115,226,206,140,184,19,216,113,107,
+    223,231,174,58,234,143,172,64,237,205,64,98,210,255,156,103,
+    155,129,64,225,220,239,180,62,76,138,85,219,124,15,43,89,
+    118,176,252,17,12,216,22,74,88,70,127,139,142,242,136,144,
+    203,84,159,93,107,86,241,134,90,88,116,166,28,17,160,118,
+    77,72,241,154,3,131,155,82,78,245,139,181,109,151,199,113,
+    189,193,40,155,108,117,61,181,75,33,51,6,91,76,88,183,
+    245,243,136,22,219,31,241,206,118,151,152,222,85,250,92,237,
+    23,96,129,91,11,251,71,233,248,70,185,1,75,234,141,17,
+    77,107,110,93,129,41,101,132,158,142,133,26,10,110,229,154,
+    142,87,150,52,225,33,221,72,156,145,14,163,180,223,227,240,
+    214,153,232,156,122,49,6,246,148,24,143,104,116,95,165,77,
+    21,14,128,161,134,170,19,102,255,6,70,248,149,232,183,224,
+    7,77,5,243,201,92,35,189,194,70,152,198,0,212,215,56,
+    10,72,207,226,91,15,222,165,66,61,23,156,137,228,213,130,
+    152,80,174,82,133,130,168,197,102,216,155,138,0,117,1,95,
+    171,15,224,227,0,82,247,127,225,140,45,208,166,150,165,179,
+    249,58,127,166,174,35,47,54,221,23,59,54,196,142,181,214,
+    172,216,151,19,251,50,98,223,3,161,158,169,169,63,111,221,
+    153,21,6,114,194,64,70,24,248,200,235,95,217,181,60,180,
+    50,180,116,242,35,95,203,170,118,227,185,52,253,108,54,182,
+    175,61,113,227,183,151,206,228,27,155,151,206,20,69,206,31,
+    68,85,168,113,237,44,253,202,139,13,105,55,6,138,4,144,
+    115,52,111,138,190,21,207,125,113,219,134,184,45,43,110,207,
+    137,219,51,226,246,143,90,218,45,74,77,139,121,10,74,241,
+    108,207,251,131,247,253,91,55,252,91,45,247,217,166,216,184,
+    236,89,241,164,61,31,9,193,183,199,215,59,31,127,51,240,
+    11,60,51,245,64,42,254,94,229,110,210,35,46,116,120,14,
+    40,99,0,20,158,154,50,89,183,209,132,205,47,192,61,74,
+    53,89,57,246,176,214,170,221,205,43,95,130,178,143,33,119,
+    213,103,160,156,251,243,203,149,199,125,209,46,90,21,165,60,
+    222,77,129,48,182,219,134,154,4,90,50,162,102,200,67,78,
+    108,58,113,70,216,102,67,115,23,5,239,21,92,36,248,73,
+    208,20,156,64,79,184,63,105,34,57,54,193,226,69,203,118,
+    39,255,171,153,60,143,184,251,35,142,60,8,205,157,104,240,
+    245,82,146,118,111,250,90,87,39,127,14,130,130,238,8,41,
+    114,30,79,111,190,165,3,228,105,125,127,62,208,246,142,239,
+    45,223,187,163,185,158,161,108,207,112,174,103,56,27,24,201,
+    5,70,50,244,60,96,111,215,78,217,229,200,131,198,214,55,
+    82,55,82,203,223,88,249,6,54,209,139,77,248,223,242,191,
+    217,112,179,97,181,97,51,32,173,183,221,153,203,4,14,100,
+    3,7,114,129,3,240,1,223,123,223,242,190,233,191,233,95,
+    245,127,90,108,53,199,245,136,125,175,223,231,44,76,188,64,
+    186,97,45,112,87,193,251,241,124,87,164,102,59,30,134,97,
+    53,12,67,27,6,163,97,88,107,95,117,229,162,140,1,234,
+    194,194,30,211,60,44,187,185,161,20,86,174,205,77,232,170,
+    130,71,150,19,241,249,127,56,131,79,253,183,152,212,54,245,
+    182,134,13,91,207,216,242,174,54,249,190,90,50,249,214,183,
+    254,40,244,253,208,247,118,223,222,109,152,124,180,51,58,22,
+    18,212,2,126,65,109,213,102,252,57,25,78,146,67,158,204,
+    192,178,27,108,26,43,58,86,241,98,153,47,98,95,73,206,
+    100,176,109,24,203,113,136,18,50,10,239,139,157,27,98,103,
+    86,236,206,137,221,25,177,59,31,236,120,231,197,183,94,124,
+    243,165,155,47,33,183,235,166,132,169,35,231,111,156,95,30,
+    91,25,75,195,207,166,24,204,180,238,129,231,222,104,70,124,
+    38,43,62,147,19,159,201,208,131,225,34,172,245,218,225,34,
+    248,207,218,72,87,56,188,36,124,28,132,252,184,147,54,213,
+    29,215,197,113,1,93,225,227,46,12,164,27,119,163,243,121,
+    188,46,205,93,227,199,69,116,27,23,154,72,49,39,241,132,
+    183,86,204,197,149,72,35,160,224,203,198,9,68,58,95,206,
+    14,172,148,225,67,4,241,0,47,214,176,5,200,75,136,23,
+    70,160,46,158,184,180,213,152,80,226,201,171,236,187,209,203,
+    128,38,145,28,163,16,97,3,202,204,141,76,170,170,34,15,
+    177,163,1,73,73,155,129,65,12,73,147,120,248,134,93,159,
+    128,227,193,67,9,38,38,202,73,230,43,141,204,51,79,134,
+    225,158,192,238,174,78,39,227,204,105,49,109,109,113,73,70,
+    52,170,57,20,205,184,60,74,150,171,96,49,24,98,247,51,
+    148,157,131,181,92,54,15,56,22,110,96,151,51,21,22,92,
+    77,106,174,125,113,80,73,182,148,12,224,187,85,210,2,99,
+    14,195,150,20,40,231,244,21,87,5,113,97,139,199,167,156,
+    240,205,83,179,150,80,85,203,210,216,44,222,95,16,103,1,
+    29,212,152,62,31,242,21,92,218,220,172,162,22,68,243,94,
+    75,166,29,185,20,188,175,187,224,162,107,187,11,13,168,235,
+    132,233,115,248,101,53,198,212,26,103,12,222,184,217,217,86,
+    245,35,170,68,151,214,224,54,166,166,196,39,25,41,226,109,
+    133,244,86,253,37,22,241,132,195,81,208,183,180,176,45,14,
+    204,176,11,255,15,36,11,93,85,107,54,108,14,108,10,9,
+    245,55,56,182,113,201,34,255,152,6,244,131,109,183,7,111,
+    15,231,182,61,151,17,59,178,226,177,156,120,44,35,30,203,
+    183,118,165,133,21,239,102,91,231,218,206,55,47,223,188,12,
+    95,124,249,246,45,240,203,143,247,95,182,190,57,126,115,28,
+    11,164,225,231,17,124,191,139,255,181,35,183,108,220,58,101,
+    215,56,42,109,5,95,89,57,119,205,58,21,92,94,111,176,
+    141,203,194,142,146,14,95,91,91,79,149,97,204,37,171,223,
+    242,145,67,191,150,67,102,161,70,223,37,159,65,189,237,142,
+    1,212,84,137,173,178,213,39,85,128,86,31,177,74,253,43,
+    14,177,4,143,63,189,6,186,175,177,192,234,125,206,192,147,
+    247,121,245,19,174,60,204,31,208,18,153,86,56,92,27,51,
+    216,187,4,98,6,30,105,65,196,168,214,83,55,197,246,53,
+    225,150,55,43,246,231,196,254,140,8,250,104,199,90,240,86,
+    207,186,126,123,33,43,238,207,137,251,51,226,254,77,209,187,
+    34,174,52,220,23,251,54,196,190,117,225,7,19,183,47,125,
+    47,126,59,126,239,226,79,94,201,238,60,150,21,143,231,196,
+    227,25,243,121,132,117,249,41,87,185,57,65,123,146,53,143,
+    151,149,195,251,50,165,234,193,199,41,155,226,23,188,180,66,
+    86,89,92,33,185,58,151,60,73,116,150,223,158,11,216,189,
+    80,79,215,113,219,247,41,107,240,171,218,250,105,173,240,42,
+    131,183,80,144,69,168,142,104,157,45,185,181,184,180,248,42,
+    194,71,253,191,28,137,106,92,235,130,128,23,144,20,220,116,
+    84,74,46,23,215,158,176,137,34,11,221,53,22,223,124,137,
+    147,208,240,232,210,18,247,160,177,101,101,1,196,182,175,241,
+    237,109,55,119,189,57,116,115,104,195,183,37,227,219,178,217,
+    214,113,243,210,155,241,155,241,245,139,217,182,208,157,209,187,
+    47,100,219,158,250,112,107,182,237,240,79,133,63,247,101,91,
+    95,72,159,6,9,190,122,122,237,226,173,87,178,193,193,172,
+    127,48,61,90,129,17,235,114,86,220,157,19,119,103,204,167,
+    26,9,44,65,242,83,142,33,129,157,109,92,225,212,174,199,
+    184,253,188,218,237,240,88,108,70,221,105,191,206,249,87,89,
+    202,90,167,165,12,195,123,219,5,61,57,91,38,126,109,210,
+    158,197,192,141,133,234,10,65,82,166,152,5,108,201,224,130,
+    91,85,102,146,87,148,130,199,204,146,75,44,128,176,160,224,
+    197,187,84,12,22,240,25,87,78,246,238,40,134,75,198,23,
+    58,170,215,157,189,73,225,162,127,141,51,180,54,127,224,231,
+    45,3,25,31,62,155,126,233,190,127,96,195,63,112,71,200,
+    250,247,228,252,123,50,254,61,128,15,111,60,123,227,217,172,
+    175,59,231,35,141,109,104,211,223,176,114,102,101,236,190,127,
+    199,134,127,7,44,173,127,119,206,191,59,99,62,232,71,26,
+    162,114,204,185,231,65,54,132,145,57,225,112,193,27,14,179,
+    251,1,224,179,63,28,126,109,46,18,55,222,212,133,49,156,
+    29,4,40,10,50,245,111,49,249,59,76,92,60,5,121,50,
+    185,7,67,7,134,5,230,215,223,152,51,54,34,68,254,151,
+    153,132,113,102,120,194,4,196,156,249,83,116,184,92,98,145,
+    195,164,193,229,146,240,83,85,210,32,184,240,22,84,91,234,
+    119,187,134,208,120,55,146,64,249,215,26,9,211,175,113,16,
+    81,187,227,217,58,20,245,67,102,142,243,50,207,156,84,106,
+    179,93,85,194,45,242,90,135,13,82,14,173,177,172,92,149,
+    163,218,206,242,82,15,83,167,74,238,179,202,219,27,185,41,
+    126,177,60,66,183,98,12,240,94,72,57,151,250,236,78,50,
+    181,173,204,57,103,81,71,21,163,133,52,1,44,124,209,105,
+    23,154,118,151,89,37,13,1,187,69,103,60,204,226,3,107,
+    38,139,46,189,185,84,227,33,98,185,106,99,161,108,188,193,
+    148,107,221,87,171,94,149,209,233,162,191,99,130,145,14,228,
+    57,43,83,244,233,98,66,43,176,173,116,53,9,26,6,198,
+    113,71,75,141,142,148,95,92,82,126,120,182,100,2,48,59,
+    178,212,38,211,244,99,9,246,135,46,152,138,143,38,70,2,
+    126,209,65,97,214,0,89,33,195,236,30,24,147,15,80,252,
+    8,93,0,31,51,46,130,196,187,166,216,40,88,76,10,121,
+    30,140,139,244,244,36,27,87,66,209,175,38,213,203,230,230,
+    103,68,101,97,41,201,73,93,73,24,1,44,208,108,212,12,
+    85,209,172,43,5,170,44,139,146,85,97,158,189,158,140,104,
+    230,189,91,24,243,247,136,195,199,100,254,224,159,36,177,32,
+    49,100,222,92,133,211,183,193,7,251,210,236,151,168,48,3,
+    200,106,201,152,175,113,204,248,98,217,77,137,122,12,47,105,
+    156,128,25,227,95,135,41,221,155,136,245,230,212,184,121,187,
+    199,241,242,147,121,120,36,175,214,89,60,11,132,122,210,188,
+    184,78,170,88,145,132,162,224,241,242,132,1,122,186,246,17,
+    81,233,106,130,174,3,52,61,174,216,178,82,58,74,109,90,
+    96,182,206,172,191,116,19,143,219,208,8,207,178,219,174,190,
+    49,167,66,134,132,29,2,56,111,19,1,107,222,148,130,123,
+    218,12,112,214,32,34,147,116,149,239,180,113,153,166,133,191,
+    214,137,116,90,32,86,42,1,200,28,43,221,83,67,182,170,
+    85,142,254,4,65,36,142,183,76,204,179,182,20,217,56,179,
+    253,5,252,187,2,9,102,77,87,201,42,115,165,153,200,26,
+    12,73,128,51,211,73,60,126,159,164,235,19,135,109,127,110,
+    101,97,152,252,201,18,9,83,54,57,3,15,204,109,123,118,
+    80,23,239,239,64,235,120,97,95,101,121,141,214,202,182,84,
+    184,234,108,206,49,21,23,44,228,103,1,67,228,242,35,97,
+    140,71,107,232,52,99,33,24,46,73,113,45,108,204,145,41,
+    111,36,153,40,84,132,7,222,196,46,85,65,193,22,114,219,
+    44,60,58,64,73,90,31,105,251,168,225,85,29,244,9,214,
+    50,201,213,122,104,244,6,202,188,159,115,36,205,135,57,177,
+    97,181,233,155,191,181,244,91,116,62,241,249,15,175,84,28,
+    201,121,224,195,176,82,215,73,118,226,241,120,86,60,145,19,
+    79,100,196,19,31,213,53,173,238,120,183,249,86,79,174,115,
+    36,91,183,55,87,183,23,139,117,228,155,218,86,235,210,174,
+    205,198,173,235,253,217,198,157,185,198,157,153,134,129,165,231,
+    243,117,254,165,197,205,208,209,76,224,236,219,142,155,228,11,
+    92,187,146,165,205,173,159,30,76,187,62,106,148,126,16,92,
+    87,190,215,125,187,251,206,228,189,169,15,231,178,141,167,114,
+    141,167,150,206,108,10,29,247,133,190,13,161,111,93,180,2,
+    68,54,235,40,148,160,55,47,6,238,139,93,27,98,151,21,
+    142,153,247,181,44,189,244,136,40,17,188,69,25,195,48,35,
+    21,135,34,141,72,145,199,116,8,26,145,32,178,9,83,198,
+    150,109,136,145,52,175,196,170,192,105,250,19,83,236,186,56,
+    61,22,49,47,128,160,203,175,144,93,219,238,211,52,175,218,
+    12,93,196,144,11,63,111,98,3,33,2,207,214,219,166,191,
+    5,24,10,89,171,173,169,232,133,250,9,46,243,211,108,153,
+    189,92,143,148,17,58,54,131,131,165,160,214,180,88,13,193,
+    207,9,104,181,32,153,225,42,239,250,120,232,153,33,128,44,
+    72,211,199,53,223,109,122,51,173,11,58,127,107,110,203,215,
+    112,212,254,26,155,114,134,14,190,243,11,120,185,86,229,238,
+    151,177,241,133,129,128,148,173,140,133,68,155,235,222,75,55,
+    114,177,253,41,220,109,46,184,40,195,182,191,213,100,236,111,
+    81,235,180,193,21,114,216,188,166,118,151,109,51,111,36,127,
+    236,48,66,151,151,184,79,68,80,185,65,151,102,161,227,75,
+    163,249,58,31,174,79,23,6,209,52,222,104,204,138,157,57,
+    177,51,35,118,126,226,54,162,108,90,41,97,81,54,222,27,
+    222,101,255,138,63,13,63,70,100,21,146,147,117,69,4,123,
+    152,42,250,59,144,124,44,97,130,67,255,120,9,19,128,13,
+    23,67,95,41,168,229,2,94,19,90,16,208,63,164,126,72,
+    19,213,147,122,36,94,112,206,202,147,5,103,20,18,65,198,
+    16,54,119,34,185,160,168,201,130,11,202,71,18,33,254,98,
+    200,113,241,98,200,171,158,131,58,23,47,170,120,3,63,89,
+    174,167,85,235,4,40,37,167,241,220,128,131,94,188,202,81,
+    164,91,148,114,193,208,197,131,48,204,253,113,152,93,169,65,
+    110,51,17,175,55,33,151,153,23,62,37,153,192,103,231,192,
+    60,144,65,87,41,104,236,188,65,29,124,159,211,99,113,21,
+    213,80,246,87,106,60,97,200,99,199,120,104,169,16,81,84,
+    145,86,148,228,49,115,198,121,240,50,16,86,10,241,139,238,
+    190,98,59,56,116,191,7,238,60,178,163,238,116,102,19,255,
+    194,0,93,214,174,190,111,174,62,221,191,72,23,8,210,173,
+    87,116,17,15,93,232,65,151,40,176,35,238,120,250,146,29,
+    244,163,179,102,232,92,167,248,117,0,97,4,255,176,195,159,
+    113,102,36,3,69,249,145,7,30,247,136,212,60,38,24,225,
+    203,246,147,200,1,68,254,32,50,252,138,156,41,80,136,123,
+    16,31,65,1,64,236,129,161,218,31,88,43,96,157,56,252,
+    76,60,194,108,174,103,213,65,30,137,3,16,241,51,0,42,
+    48,6,158,47,190,204,115,124,195,82,61,254,60,224,60,75,
+    244,147,231,26,151,232,39,207,117,103,202,159,60,215,159,41,
+    127,138,14,39,239,40,114,159,159,120,57,190,41,195,5,216,
+    3,102,39,63,144,225,118,218,159,60,183,63,83,254,20,5,
+    23,214,254,251,37,13,92,67,96,201,91,20,185,250,198,37,
+    15,252,106,106,89,170,47,186,79,240,60,144,83,85,122,206,
+    193,57,26,150,122,50,13,131,236,201,242,161,28,31,42,58,
+    2,60,200,65,51,249,133,147,115,236,178,178,119,82,141,180,
+    158,158,92,251,242,218,151,215,47,220,254,202,61,111,182,247,
+    112,174,247,112,134,63,146,229,143,228,248,35,48,203,134,64,
+    222,83,159,175,111,202,7,218,242,94,95,222,223,68,105,3,
+    62,190,64,177,125,156,231,221,69,174,148,98,23,71,177,166,
+    131,242,22,216,176,210,87,210,211,89,190,61,199,183,23,29,
+    34,15,38,43,36,88,178,195,202,105,99,229,174,166,99,89,
+    30,114,59,30,60,115,178,232,236,199,86,205,4,203,119,194,
+    155,162,3,115,206,243,172,194,66,58,158,229,187,115,124,119,
+    209,17,228,155,139,156,153,96,233,30,43,123,184,106,20,109,
+    88,206,76,74,67,193,156,253,245,252,72,145,179,18,169,5,
+    90,225,172,100,168,145,223,93,228,172,100,187,131,7,235,217,
+    74,188,46,124,81,158,4,92,248,182,60,9,116,243,32,211,
+    172,228,8,231,241,45,185,242,176,208,94,74,138,238,173,48,
+    26,206,74,206,240,30,108,205,74,58,58,16,136,229,201,65,
+    206,95,191,36,62,8,182,101,184,166,162,187,23,123,42,79,
+    142,241,62,236,207,74,122,234,248,67,69,206,74,130,253,88,
+    176,58,89,115,220,18,111,53,252,2,63,254,178,244,102,140,
+    231,58,186,50,92,48,223,222,3,105,209,61,192,7,139,92,
+    121,114,145,175,195,174,172,36,232,231,183,21,57,43,217,194,
+    121,154,210,226,3,64,43,120,90,58,243,77,237,120,207,30,
+    60,240,181,25,244,182,246,98,139,215,229,198,157,89,88,122,
+    191,199,241,75,14,146,37,23,254,16,111,248,127,182,211,79,
+    128,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/stats/__init__.py",
+    "m5.stats",
+    embedded_module_data,
+    13297,
+    30580);
+
+} // anonymous namespace
+} // namespace gem5
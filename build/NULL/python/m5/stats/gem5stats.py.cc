@@ -0,0 +1,1125 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,221,189,11,116,27,215,149,32,88,5,20,254,127,2,
+    4,255,36,72,145,162,32,81,212,95,182,100,69,178,108,74,
+    178,100,153,74,34,217,153,48,113,40,136,85,148,96,131,0,
+    83,0,101,145,1,29,38,235,30,131,94,238,4,242,48,109,
+    56,161,55,72,142,147,48,137,123,163,153,237,222,163,57,187,
+    179,199,61,59,219,155,51,103,207,14,192,83,189,194,98,151,
+    51,204,116,123,186,179,95,168,109,207,120,189,159,217,123,223,
+    171,47,0,202,76,186,251,236,57,3,22,111,253,222,123,245,
+    190,247,221,223,187,239,207,24,221,207,33,159,63,252,145,153,
+    97,222,98,120,102,130,225,89,222,148,96,39,88,114,54,77,
+    152,224,108,78,152,103,204,19,102,22,223,113,9,110,134,155,
+    224,200,181,37,97,153,177,78,88,103,108,19,182,25,251,132,
+    125,198,49,225,152,113,78,56,103,92,19,174,25,247,132,155,
+    132,177,38,60,51,222,9,47,185,182,37,124,215,240,108,79,
+    248,103,2,19,1,249,89,11,121,230,72,4,103,66,19,33,
+    249,89,235,53,122,14,147,179,51,209,54,211,62,209,62,211,
+    49,209,193,210,252,117,78,116,153,152,11,12,239,122,141,225,
+    221,63,49,49,204,47,76,74,145,38,186,201,27,15,188,241,
+    214,189,233,33,111,124,240,198,47,116,255,4,74,252,11,179,
+    250,174,151,188,11,192,187,150,134,119,125,228,93,16,222,133,
+    26,222,69,28,12,127,148,15,11,110,161,67,112,8,29,29,
+    106,213,78,155,180,107,190,77,232,231,219,5,187,208,47,216,
+    244,207,167,173,124,199,107,150,137,1,190,83,232,122,105,151,
+    242,244,165,65,67,188,174,198,120,124,59,111,154,182,243,221,
+    175,113,19,67,124,143,33,238,110,45,140,176,123,154,227,123,
+    33,204,240,182,233,183,11,78,97,143,46,63,28,223,7,225,
+    163,117,225,247,234,194,239,131,48,17,8,51,82,23,102,191,
+    46,204,40,132,233,135,48,7,234,194,28,212,133,57,4,97,
+    6,32,204,225,109,191,181,75,216,71,202,105,229,7,33,220,
+    145,109,191,55,36,140,202,225,118,67,184,163,219,126,115,24,
+    218,103,95,93,29,90,249,61,16,231,24,105,223,40,180,239,
+    222,186,30,115,124,219,218,221,39,56,248,17,248,199,90,182,
+    243,251,33,149,199,226,204,196,227,219,133,159,54,241,163,16,
+    230,132,3,134,28,127,236,51,251,203,33,225,36,127,24,254,
+    219,133,39,32,245,35,208,71,78,241,166,171,76,244,248,194,
+    45,231,181,91,241,116,36,45,136,183,133,116,36,150,142,100,
+    110,9,145,27,98,156,191,9,39,33,243,138,32,36,201,163,
+    155,194,204,177,72,58,19,203,196,211,153,248,84,58,34,220,
+    153,77,165,5,62,114,59,30,139,124,126,254,169,120,146,63,
+    116,40,18,75,242,78,12,252,249,249,204,173,84,50,114,21,
+    130,167,35,51,41,94,72,140,58,127,131,25,25,143,178,85,
+    75,76,20,99,243,112,97,231,99,25,33,19,159,17,162,182,
+    170,233,226,149,170,249,108,114,190,202,141,197,167,50,85,238,
+    50,124,166,106,191,50,155,137,167,146,177,68,213,114,109,110,
+    54,33,84,45,207,39,225,30,162,122,159,78,37,230,102,146,
+    49,241,75,98,60,35,136,240,132,221,11,192,119,57,126,91,
+    32,95,189,138,229,193,231,238,169,212,204,108,60,33,76,222,
+    76,164,110,68,77,85,238,139,169,84,166,234,184,26,159,185,
+    114,227,37,97,42,51,197,232,126,156,124,254,240,58,131,232,
+    75,96,0,109,49,19,166,231,1,73,76,152,5,78,176,240,
+    166,83,240,70,176,194,149,25,175,120,147,192,65,83,112,208,
+    20,54,222,2,3,203,33,56,181,106,23,92,134,70,176,242,
+    54,232,164,118,8,235,230,109,80,249,142,170,255,82,58,149,
+    188,50,151,153,157,203,188,0,5,78,137,11,223,118,70,224,
+    71,154,4,142,88,228,150,144,152,21,68,168,101,124,27,153,
+    74,196,210,233,200,28,214,123,38,21,137,39,167,18,115,188,
+    0,161,46,93,189,50,30,73,145,116,72,131,96,27,96,91,
+    165,73,106,103,63,127,49,178,231,250,245,180,56,117,96,150,
+    52,204,129,153,99,7,200,235,3,147,147,241,100,60,51,57,
+    57,58,59,127,253,122,116,148,4,175,114,211,80,95,85,199,
+    75,144,183,201,152,120,51,61,101,210,85,17,94,187,176,138,
+    6,72,21,101,217,44,51,169,190,204,154,224,142,85,11,204,
+    66,33,77,11,255,144,164,138,191,147,179,49,49,54,19,193,
+    228,79,66,25,5,37,203,248,32,146,72,77,197,176,181,161,
+    88,145,87,110,197,167,110,145,82,144,146,189,18,79,36,160,
+    51,70,248,185,153,89,129,31,117,214,39,248,242,43,152,205,
+    147,145,179,60,31,167,29,38,66,94,8,208,53,210,88,83,
+    16,119,22,106,142,86,27,38,123,253,58,150,110,20,19,76,
+    95,191,30,129,144,183,82,252,168,154,238,120,212,36,134,160,
+    4,98,43,128,168,185,202,165,133,196,52,121,82,181,210,143,
+    165,17,99,67,200,79,35,205,170,21,7,11,185,130,122,173,
+    218,149,74,94,232,168,111,238,81,229,213,121,72,45,29,6,
+    176,196,212,188,76,107,71,142,91,113,84,58,250,224,228,205,
+    193,223,135,88,157,85,139,8,93,55,93,181,138,66,102,78,
+    76,142,27,154,197,10,255,152,165,15,223,35,205,146,97,181,
+    87,89,230,37,93,147,24,17,210,49,102,209,148,177,232,194,
+    194,100,248,158,217,24,102,209,108,98,178,230,151,212,41,10,
+    250,49,151,53,197,161,225,95,82,198,11,243,46,251,247,88,
+    152,74,45,248,103,140,141,79,175,50,187,152,67,76,154,123,
+    197,116,199,252,101,230,21,8,249,101,120,78,223,68,109,177,
+    25,200,158,90,245,99,216,36,90,7,142,164,166,161,127,167,
+    227,51,115,9,218,59,176,14,34,123,96,44,36,160,6,241,
+    45,169,148,168,210,176,180,71,169,169,145,238,67,186,87,122,
+    86,152,138,79,199,161,11,196,41,66,211,218,34,50,149,74,
+    166,51,226,220,20,182,136,214,185,70,71,35,208,212,201,120,
+    242,230,201,147,218,83,117,120,98,223,1,124,153,158,155,17,
+    180,252,202,200,241,86,236,54,12,203,132,40,196,248,121,232,
+    124,128,66,103,69,1,186,164,192,27,210,153,134,98,96,204,
+    12,244,40,33,67,74,2,223,175,239,221,164,128,116,188,32,
+    238,26,137,64,172,203,250,194,143,192,120,1,92,44,87,24,
+    124,133,252,211,110,79,135,12,169,7,173,123,87,217,87,206,
+    35,42,196,216,85,143,156,181,73,18,189,106,154,158,29,255,
+    25,19,181,84,185,212,172,144,164,125,222,5,185,155,132,54,
+    192,16,85,14,147,164,3,131,19,219,112,144,116,35,64,116,
+    80,181,201,129,210,28,29,29,17,17,209,159,136,179,214,66,
+    107,67,231,199,132,62,143,29,127,157,116,252,143,187,25,111,
+    75,126,112,53,90,184,90,246,244,75,158,254,26,99,114,28,
+    46,126,113,51,220,95,156,187,127,174,20,126,170,28,126,74,
+    10,63,149,187,80,113,183,231,46,172,92,46,185,15,193,81,
+    120,10,64,113,240,221,81,122,11,71,205,2,241,72,100,2,
+    30,34,248,136,49,60,219,22,124,242,201,39,143,14,144,14,
+    64,102,127,127,247,89,135,249,143,29,220,89,143,237,143,253,
+    44,192,168,7,135,121,18,80,206,228,100,213,57,57,9,115,
+    222,92,2,175,221,147,147,95,159,139,37,228,55,182,201,73,
+    62,53,5,23,102,232,111,85,223,228,100,44,153,76,101,72,
+    199,78,79,78,138,54,172,172,78,4,136,97,69,59,2,252,
+    156,232,87,106,81,68,82,64,236,66,64,106,54,168,128,207,
+    97,61,126,147,212,163,246,87,51,153,45,246,26,131,192,201,
+    184,188,75,23,151,46,126,235,98,197,23,92,186,178,116,229,
+    91,87,106,156,221,18,41,92,173,49,112,170,7,33,191,229,
+    112,97,168,200,21,191,252,174,239,94,168,20,57,38,117,30,
+    175,49,240,240,254,81,114,218,22,208,188,97,142,12,19,171,
+    79,62,127,248,191,51,250,137,21,167,85,222,52,193,241,230,
+    215,152,9,11,207,193,196,106,211,77,152,22,1,39,76,43,
+    76,152,118,222,134,83,171,224,50,134,208,79,175,250,120,188,
+    29,226,57,200,68,235,20,60,16,203,107,152,136,45,130,15,
+    222,187,224,189,191,233,123,183,96,227,61,240,239,21,2,16,
+    214,41,216,26,195,52,62,153,54,235,174,157,192,21,112,19,
+    45,188,29,16,156,191,234,68,146,100,76,72,100,98,233,216,
+    94,147,140,236,158,6,186,100,46,35,227,142,169,91,177,36,
+    16,92,50,106,34,67,104,56,114,59,150,152,131,247,105,152,
+    231,5,242,28,70,234,237,120,106,142,226,158,17,66,109,97,
+    74,240,42,46,70,68,32,166,16,37,208,164,0,39,196,97,
+    78,2,228,38,10,105,33,147,1,44,166,37,61,74,144,137,
+    154,26,253,14,73,10,17,199,203,194,108,6,115,130,104,55,
+    121,19,80,231,52,160,222,8,33,218,48,125,62,53,119,35,
+    33,164,101,68,73,75,69,226,77,209,2,241,4,173,165,167,
+    98,137,152,8,168,233,182,128,104,53,34,36,132,25,33,137,
+    232,41,201,83,18,115,110,234,101,129,222,211,47,79,77,205,
+    17,36,143,9,196,133,4,79,80,63,15,152,66,140,223,152,
+    35,35,228,9,200,146,254,193,48,208,150,241,228,72,100,38,
+    118,71,77,134,38,11,57,95,160,88,16,134,215,104,228,172,
+    140,26,73,85,32,93,197,3,101,48,69,190,36,166,102,148,
+    122,17,9,70,133,27,146,144,220,6,242,204,131,148,3,16,
+    170,80,231,211,64,83,200,244,9,175,149,93,20,112,122,186,
+    45,40,211,16,249,18,69,184,148,8,166,49,98,179,179,66,
+    76,148,19,193,112,211,113,17,16,57,153,74,166,82,115,201,
+    12,205,208,130,32,166,104,100,192,195,102,152,97,170,46,0,
+    147,105,192,36,48,133,84,29,115,73,94,16,167,19,169,87,
+    170,246,212,109,249,138,75,164,128,82,211,77,251,132,82,35,
+    36,193,105,134,242,226,122,74,141,220,177,134,59,147,225,78,
+    155,238,153,171,204,207,216,241,40,7,216,43,17,155,135,46,
+    85,117,76,42,125,167,234,85,47,39,177,130,170,174,201,27,
+    194,205,120,146,220,252,140,37,243,67,26,63,35,207,4,136,
+    220,22,130,218,112,80,9,160,121,12,184,155,224,175,173,182,
+    46,160,123,220,149,142,30,36,127,42,189,3,57,78,178,119,
+    85,186,250,240,220,94,34,7,65,51,85,155,220,137,196,30,
+    196,55,122,114,136,83,202,254,56,67,169,212,37,19,82,163,
+    89,118,59,194,232,39,112,245,11,245,110,1,254,145,118,29,
+    255,13,62,130,169,210,156,16,146,213,224,216,197,171,215,190,
+    120,241,169,231,175,93,188,50,62,121,254,226,185,203,99,87,
+    129,80,36,115,32,50,3,105,204,129,60,231,85,45,147,216,
+    7,23,252,250,178,226,147,37,12,56,64,10,90,113,181,228,
+    206,84,130,161,252,161,138,47,252,78,176,112,77,234,57,86,
+    238,56,46,117,28,47,251,142,151,236,199,105,33,173,180,210,
+    141,228,158,67,41,95,137,37,229,99,94,82,95,125,235,65,
+    28,136,58,158,93,52,235,203,55,198,188,120,252,171,144,194,
+    34,183,104,201,50,69,125,90,90,125,88,140,181,176,104,205,
+    90,244,41,103,205,240,103,197,186,249,61,61,222,51,1,213,
+    207,157,162,239,173,11,30,36,24,87,30,203,216,180,116,121,
+    83,93,186,182,44,11,249,201,170,249,49,21,57,166,201,47,
+    203,213,197,179,103,237,223,218,147,181,243,172,246,245,172,229,
+    101,82,22,177,59,107,43,90,154,36,194,64,120,29,102,54,
+    166,200,50,43,99,219,197,203,120,116,37,224,118,90,103,11,
+    150,250,111,52,124,113,49,107,51,240,76,172,113,36,66,191,
+    179,140,139,248,177,42,203,139,56,118,127,131,132,64,212,38,
+    98,95,22,31,67,112,22,1,182,127,213,12,164,89,213,42,
+    220,201,8,73,190,106,185,49,15,19,74,212,65,187,228,83,
+    248,158,67,108,94,181,166,166,167,1,33,85,185,217,88,230,
+    22,233,171,192,210,64,103,172,218,213,129,108,78,1,202,197,
+    110,165,82,167,180,31,59,38,17,183,97,15,92,8,233,251,
+    178,242,244,247,32,80,26,138,133,228,134,149,113,251,87,78,
+    151,92,67,149,96,107,110,172,210,26,206,157,175,244,15,189,
+    219,13,36,136,167,143,128,187,158,60,151,191,89,105,235,122,
+    107,225,205,133,226,112,185,109,175,212,182,55,207,85,122,135,
+    138,153,119,95,189,55,125,255,246,175,184,127,180,88,58,126,
+    89,26,126,174,212,51,14,129,175,221,117,86,252,225,194,224,
+    93,111,222,154,183,126,208,214,93,184,122,119,97,117,33,247,
+    76,165,127,184,198,88,60,99,44,133,114,202,225,206,183,110,
+    189,121,171,144,185,155,92,77,230,205,149,96,56,127,166,152,
+    94,63,244,238,237,123,109,27,195,143,151,134,31,175,132,186,
+    223,186,242,230,149,226,211,235,236,187,231,203,161,125,82,104,
+    95,137,28,91,244,197,143,207,173,247,175,243,191,124,233,231,
+    47,221,111,43,143,158,149,70,207,150,247,158,45,15,62,37,
+    13,62,85,14,61,45,133,158,46,145,163,210,51,148,27,91,
+    25,175,180,33,146,114,231,224,79,30,173,116,50,53,12,86,
+    236,94,100,176,174,67,53,189,206,1,42,102,95,131,102,47,
+    54,235,79,204,79,224,255,23,234,221,88,221,253,34,14,54,
+    221,176,126,153,160,105,177,117,219,238,105,170,239,126,143,28,
+    152,102,200,85,211,161,88,159,171,23,147,111,112,25,151,246,
+    126,153,203,184,117,161,13,28,160,248,84,214,92,212,125,85,
+    31,235,81,67,115,187,88,57,110,154,229,185,215,236,80,15,
+    118,45,71,198,28,54,12,186,47,67,106,14,166,201,111,153,
+    107,8,155,202,154,201,32,52,204,166,152,21,36,107,63,156,
+    101,16,227,222,4,156,251,226,17,130,193,88,104,20,227,188,
+    98,202,232,26,163,174,50,90,13,236,182,137,103,182,171,128,
+    36,203,179,211,166,187,166,149,163,56,19,85,45,164,99,141,
+    71,205,85,103,28,232,50,32,79,128,42,4,102,44,62,149,
+    17,207,48,68,74,97,26,61,40,62,139,223,184,10,64,17,
+    80,144,81,252,169,243,20,178,203,72,161,157,94,24,214,15,
+    99,164,237,0,119,140,158,66,241,75,34,125,122,84,11,248,
+    125,76,229,11,12,25,217,140,185,197,169,129,95,251,187,96,
+    176,9,53,51,48,108,127,176,247,222,243,255,120,12,198,136,
+    180,247,108,41,248,236,119,143,228,231,10,95,90,125,181,28,
+    220,45,5,119,151,130,187,223,207,148,220,151,107,102,67,124,
+    202,36,140,41,89,53,212,51,102,251,8,214,243,30,0,223,
+    101,159,133,6,193,249,237,69,247,34,187,12,245,172,213,214,
+    11,204,91,44,52,150,7,49,166,120,156,145,121,163,168,89,
+    124,129,65,212,57,173,175,133,37,90,11,142,83,55,133,164,
+    112,103,86,60,189,176,251,209,149,160,132,195,94,149,30,6,
+    240,201,95,50,127,9,21,81,234,186,0,199,122,160,112,174,
+    216,191,246,12,189,211,31,164,100,81,103,213,18,207,8,51,
+    105,138,172,175,48,50,178,22,145,217,21,175,33,120,30,193,
+    5,4,79,98,110,173,72,24,38,249,168,133,98,110,18,142,
+    162,111,204,26,45,137,133,182,103,228,73,138,151,237,74,174,
+    141,228,148,252,240,123,24,227,127,196,124,19,46,80,174,247,
+    173,190,161,31,100,191,151,125,251,213,181,87,107,22,184,127,
+    136,15,63,66,144,179,214,236,140,187,37,127,109,245,171,27,
+    174,254,146,171,191,226,246,127,103,252,141,241,194,241,178,123,
+    64,114,15,148,220,3,31,248,66,249,171,203,11,43,11,57,
+    174,210,218,245,214,139,111,190,120,119,114,117,18,144,175,99,
+    23,1,185,115,155,190,142,194,208,143,67,101,223,110,201,183,
+    187,198,112,158,93,21,127,232,45,215,155,46,168,173,225,181,
+    241,178,127,159,228,223,87,242,239,147,159,234,235,109,157,151,
+    70,207,195,185,220,117,65,2,232,191,32,249,47,148,200,177,
+    165,36,81,246,15,72,254,129,18,57,128,135,205,185,40,194,
+    117,106,244,102,213,14,117,72,175,28,211,162,240,245,57,33,
+    57,53,63,165,159,220,85,178,137,3,248,186,247,117,223,235,
+    126,236,92,69,166,217,47,203,26,7,228,27,94,61,230,253,
+    150,139,96,98,117,96,203,152,248,132,17,191,102,116,56,135,
+    55,27,48,166,247,51,9,7,3,226,208,19,9,68,204,106,
+    213,222,104,185,122,195,7,119,234,27,32,173,204,89,203,130,
+    19,73,169,5,248,246,27,126,32,13,173,240,111,227,185,69,
+    196,159,106,94,1,163,111,17,100,230,88,116,102,157,75,123,
+    150,189,89,187,54,212,150,125,250,59,76,111,209,5,100,149,
+    133,16,123,246,172,75,244,101,93,89,107,214,129,132,197,178,
+    95,132,39,203,126,252,30,16,58,228,217,202,129,172,83,95,
+    118,61,230,110,36,188,23,221,57,111,206,55,109,2,198,223,
+    158,9,234,98,1,249,151,117,47,52,212,76,195,28,233,33,
+    225,72,222,50,173,186,248,30,227,183,196,105,222,150,245,240,
+    108,214,169,39,103,227,44,148,205,85,212,229,86,251,101,180,
+    96,134,50,100,61,89,39,207,234,83,49,230,176,97,102,211,
+    215,214,174,156,31,230,51,59,204,103,174,162,142,228,212,126,
+    143,166,8,212,58,254,53,180,153,190,143,152,13,125,196,164,
+    103,240,128,172,183,102,109,211,56,203,57,98,95,50,233,164,
+    175,95,20,166,82,34,79,101,18,178,248,129,8,96,101,129,
+    3,178,208,40,123,6,118,248,198,124,228,250,117,34,23,4,
+    236,51,73,195,94,191,222,40,155,215,134,39,21,97,102,226,
+    83,47,71,98,25,157,136,159,242,230,175,8,192,70,39,98,
+    233,140,194,59,215,39,164,140,109,93,50,148,93,39,153,107,
+    12,175,98,0,26,33,57,55,115,3,152,110,140,2,81,211,
+    17,212,170,104,204,125,26,202,157,52,104,22,104,65,211,219,
+    101,58,158,4,22,30,74,141,229,139,37,71,84,177,134,166,
+    117,49,254,104,76,42,155,225,33,199,34,10,100,226,25,20,
+    94,204,206,170,122,137,184,168,10,21,48,189,84,147,132,52,
+    97,79,58,178,167,89,33,162,163,145,49,189,212,4,191,208,
+    44,157,84,4,105,7,212,150,136,113,218,204,52,105,37,143,
+    84,8,67,229,72,244,85,147,84,20,41,78,60,9,189,129,
+    116,2,236,3,202,219,113,58,199,159,67,128,157,143,112,51,
+    134,217,30,145,51,161,170,14,3,248,174,73,166,171,130,245,
+    115,253,178,89,127,135,8,8,232,162,208,85,89,28,74,230,
+    125,78,158,247,227,85,219,212,156,40,10,201,140,248,28,60,
+    144,37,209,75,148,2,16,191,132,209,135,116,19,230,220,44,
+    42,33,155,145,63,21,140,141,148,8,78,161,140,169,205,171,
+    129,202,254,209,188,173,192,174,58,11,127,167,24,91,251,74,
+    217,191,167,102,54,4,160,4,78,3,109,163,150,246,18,150,
+    150,125,139,137,99,105,251,52,42,50,203,242,140,204,207,122,
+    115,102,64,11,44,160,5,83,253,144,79,114,89,211,178,25,
+    17,236,223,55,173,68,144,58,108,252,20,167,124,170,83,254,
+    20,169,88,219,34,124,98,217,132,81,161,2,237,134,10,84,
+    8,167,219,85,27,237,72,105,3,241,68,171,238,224,163,170,
+    14,251,19,169,58,93,45,254,25,214,98,15,173,197,82,247,
+    227,244,88,255,66,225,11,197,182,183,191,162,62,160,245,165,
+    111,71,243,203,194,60,41,149,24,215,90,81,161,227,156,218,
+    167,30,221,152,106,176,95,99,34,95,81,26,211,182,43,172,
+    129,135,110,166,103,184,240,116,177,181,230,98,58,186,183,250,
+    6,138,55,191,247,106,225,85,32,110,123,78,168,25,188,55,
+    4,160,220,253,184,68,238,182,250,119,175,183,253,176,175,230,
+    48,36,68,105,63,175,248,53,204,53,225,213,79,50,10,229,
+    247,12,2,36,211,197,19,140,194,196,63,201,16,157,30,142,
+    182,170,57,150,156,175,90,105,254,171,230,133,248,172,136,153,
+    141,6,116,244,32,74,12,196,235,8,98,24,209,171,96,32,
+    42,112,171,90,41,226,192,4,1,53,136,216,195,40,51,64,
+    184,125,11,121,43,94,198,107,155,60,194,69,1,95,63,167,
+    214,113,128,209,49,255,228,247,228,147,148,216,20,147,216,246,
+    129,134,154,198,46,153,254,183,208,237,62,249,4,235,117,148,
+    9,182,189,181,255,205,253,69,107,185,101,88,106,25,206,217,
+    42,46,31,202,3,250,139,19,247,142,74,71,158,222,24,122,
+    186,52,244,244,102,207,64,241,200,31,88,214,99,127,180,235,
+    222,205,127,48,242,135,35,229,209,211,229,61,103,164,61,103,
+    202,61,79,74,61,79,18,190,122,96,36,55,38,185,251,42,
+    193,182,213,211,57,123,165,163,71,234,24,201,121,43,193,174,
+    66,178,28,28,185,231,40,183,156,200,217,182,2,193,156,181,
+    226,111,201,89,42,129,22,184,234,233,95,251,106,141,233,114,
+    132,9,88,126,46,55,150,31,174,248,194,185,111,86,218,251,
+    138,214,53,223,250,158,123,199,165,189,39,203,237,39,243,22,
+    20,42,244,223,117,229,173,149,96,59,16,199,129,227,149,93,
+    123,242,231,11,71,239,94,174,180,245,214,24,182,245,120,101,
+    247,190,245,155,63,76,21,44,5,254,109,87,197,223,190,21,
+    236,124,231,106,49,36,245,159,40,247,156,148,122,78,150,131,
+    39,115,99,53,147,97,224,107,96,243,240,99,247,173,239,91,
+    127,21,250,99,79,249,240,184,116,120,156,160,136,135,248,234,
+    35,4,185,11,53,43,227,9,230,249,229,241,220,249,77,95,
+    75,254,177,229,236,74,182,198,184,61,225,74,71,164,56,188,
+    190,103,253,177,245,61,210,192,145,82,251,81,204,109,235,91,
+    238,55,221,242,247,239,63,246,254,99,239,63,254,254,227,210,
+    19,151,203,61,207,73,61,207,149,253,227,146,127,188,228,31,
+    175,244,13,230,173,249,204,93,119,37,216,89,99,236,129,112,
+    205,100,232,163,20,184,153,125,7,127,185,239,231,251,126,182,
+    255,189,253,53,15,142,1,124,252,17,130,252,185,194,224,221,
+    103,63,169,181,48,157,253,84,252,186,91,22,191,14,17,241,
+    107,197,215,83,184,93,156,43,249,70,74,246,17,218,227,131,
+    34,178,106,98,20,1,90,219,136,251,148,222,77,117,89,14,
+    50,158,161,187,82,177,21,209,106,57,17,140,48,10,119,68,
+    20,95,86,117,180,124,141,116,217,233,68,10,120,159,164,130,
+    25,116,90,175,3,10,64,29,83,122,63,203,24,116,94,78,
+    212,121,33,232,180,118,89,75,92,91,205,111,65,181,150,10,
+    188,102,203,99,128,184,167,214,94,68,213,216,99,235,105,114,
+    170,7,206,160,165,183,200,21,159,95,63,114,207,126,63,248,
+    135,158,210,190,207,73,67,167,165,200,153,26,3,111,222,31,
+    35,167,122,176,215,103,9,21,50,197,167,215,131,197,103,128,
+    199,98,224,246,222,16,57,213,131,129,167,88,203,126,224,109,
+    242,87,11,187,242,127,103,213,91,179,224,3,232,18,173,237,
+    53,27,185,180,51,193,112,205,65,46,157,76,168,163,230,34,
+    151,110,198,233,203,165,243,99,133,96,97,170,208,190,58,94,
+    28,91,15,174,79,173,183,191,59,94,242,29,150,28,71,106,
+    30,18,140,121,20,164,53,169,212,159,250,83,72,222,15,95,
+    5,240,122,19,45,29,218,26,17,123,35,63,111,19,44,188,
+    29,205,96,116,90,51,135,96,227,157,130,157,119,9,150,105,
+    103,142,129,217,203,253,154,103,194,193,123,136,222,206,173,215,
+    157,25,180,109,94,222,60,205,17,125,153,55,199,220,97,39,
+    124,48,163,5,170,97,84,23,95,142,39,133,180,170,51,142,
+    103,82,98,236,175,20,114,245,172,193,234,69,211,175,36,81,
+    115,148,164,234,168,216,84,134,134,18,9,93,75,137,62,66,
+    110,18,149,11,37,186,72,106,58,75,148,17,164,174,110,17,
+    5,77,44,25,65,5,203,43,98,60,67,233,53,149,26,138,
+    32,201,37,171,110,70,35,231,98,240,113,250,13,146,26,144,
+    92,240,137,84,134,80,101,240,189,8,202,93,211,26,145,71,
+    201,229,209,200,149,100,98,94,161,127,137,10,95,166,185,101,
+    12,77,21,81,205,213,127,68,237,132,25,3,110,127,36,34,
+    220,153,66,173,157,98,80,64,213,74,114,161,247,40,186,49,
+    1,138,130,84,59,76,173,211,104,29,115,253,250,254,140,146,
+    237,145,72,124,26,8,200,76,84,161,84,83,201,76,44,14,
+    212,35,141,132,121,68,61,26,90,52,8,148,16,196,120,178,
+    217,132,129,95,136,201,250,172,235,215,147,215,175,35,155,0,
+    141,146,152,199,234,19,101,230,226,250,245,131,163,163,248,50,
+    158,164,117,47,66,154,50,237,125,49,41,219,231,12,144,25,
+    107,0,66,33,41,12,247,55,82,153,91,120,139,230,100,64,
+    150,10,90,149,71,96,178,79,69,110,161,0,91,109,79,77,
+    161,74,2,146,70,216,174,38,247,232,190,22,37,159,139,163,
+    178,16,26,152,36,213,140,200,38,113,48,4,70,25,209,84,
+    159,143,82,186,54,104,3,249,56,143,250,73,37,175,216,160,
+    169,153,120,70,175,151,76,11,178,30,208,92,181,199,110,164,
+    83,137,57,52,105,66,244,200,97,125,80,61,193,121,17,181,
+    103,178,169,6,102,5,190,158,6,194,190,106,87,90,90,252,
+    42,137,130,85,55,165,242,132,140,78,50,253,43,150,82,137,
+    122,49,166,145,232,44,234,169,75,245,87,47,35,97,81,164,
+    201,222,102,197,160,94,204,201,155,178,166,239,51,188,249,29,
+    179,49,244,183,89,162,96,82,85,141,13,241,184,172,101,251,
+    120,147,170,164,58,107,225,45,178,252,197,171,151,51,212,145,
+    205,44,111,53,242,196,188,77,38,182,123,120,59,111,77,216,
+    22,173,89,107,209,206,52,249,213,241,220,204,164,42,215,33,
+    156,181,83,189,67,174,91,205,1,146,247,147,170,92,156,183,
+    195,157,202,225,103,185,116,52,211,163,125,1,234,193,167,134,
+    116,24,229,7,69,255,103,231,137,101,120,235,85,242,31,117,
+    198,254,157,158,167,223,145,213,93,35,255,172,235,72,39,97,
+    252,141,3,78,189,126,125,4,71,226,77,160,79,113,36,2,
+    178,129,187,133,116,134,135,59,3,18,140,196,155,241,192,218,
+    79,73,27,122,58,225,117,97,156,242,2,162,110,96,219,34,
+    152,124,100,70,160,236,186,24,193,244,31,153,24,233,225,35,
+    145,116,74,70,125,80,170,41,72,242,134,32,79,7,148,187,
+    198,97,141,216,235,145,73,17,236,142,162,117,62,38,98,172,
+    84,34,221,196,218,80,30,84,39,35,23,167,97,252,38,247,
+    163,186,126,132,224,98,65,135,46,155,160,219,237,191,77,12,
+    17,177,8,20,193,166,73,9,168,77,194,44,130,87,98,243,
+    80,58,49,53,119,19,38,57,82,198,198,124,209,210,158,140,
+    156,37,103,90,102,152,24,208,36,13,240,16,169,23,253,196,
+    6,152,59,137,109,79,230,181,198,212,16,87,96,187,15,40,
+    104,7,91,28,210,164,197,108,176,82,25,49,160,236,166,146,
+    11,172,95,37,178,42,103,160,146,14,42,206,216,6,63,55,
+    79,10,85,32,80,87,35,114,47,148,103,7,77,246,16,53,
+    143,87,57,236,74,85,14,123,208,194,238,231,147,47,39,83,
+    175,36,41,61,144,64,194,66,158,121,117,29,61,50,252,41,
+    59,188,208,183,109,80,172,148,200,48,65,183,227,226,18,35,
+    139,53,170,166,87,110,0,197,98,73,207,193,84,65,104,222,
+    170,243,5,172,149,115,162,152,18,171,150,231,174,140,157,187,
+    42,46,50,50,209,85,181,77,202,188,154,99,65,233,107,85,
+    239,4,100,242,105,57,39,24,105,18,115,45,126,3,35,101,
+    25,153,161,172,90,39,73,71,17,209,224,158,226,123,203,84,
+    2,232,134,168,157,50,138,196,102,85,139,131,88,159,126,247,
+    117,134,168,114,39,137,1,241,228,100,26,145,156,92,81,75,
+    58,203,140,190,230,68,151,106,165,97,2,20,156,246,177,132,
+    141,254,248,40,227,240,46,219,86,108,15,236,237,27,246,246,
+    66,168,108,239,149,236,189,37,123,111,197,21,46,245,30,45,
+    185,240,216,108,233,174,248,47,220,239,42,41,242,252,135,102,
+    83,16,57,160,32,178,73,30,47,209,25,231,51,171,11,37,
+    162,118,128,224,165,158,243,247,51,0,232,81,110,185,32,181,
+    92,40,185,47,84,66,237,196,40,118,120,223,250,194,198,240,
+    137,210,240,137,239,46,220,205,174,102,243,217,251,25,98,46,
+    226,10,23,118,111,184,34,37,87,100,203,221,93,82,142,173,
+    142,129,7,29,135,54,58,14,149,59,142,72,29,71,128,183,
+    188,84,233,218,77,89,153,246,8,68,244,84,58,186,8,163,
+    19,110,131,147,107,203,215,10,204,159,99,239,38,228,42,180,
+    218,81,24,43,187,251,37,119,255,3,247,240,134,123,184,236,
+    142,74,238,104,73,57,106,102,8,72,66,83,138,154,216,65,
+    54,152,162,96,85,147,57,118,0,230,43,212,55,24,84,133,
+    117,243,231,162,201,104,173,75,231,167,217,14,189,166,33,213,
+    162,15,163,127,179,96,213,226,160,249,199,29,86,151,150,9,
+    37,226,83,38,77,66,172,215,84,104,150,188,117,178,116,46,
+    203,53,55,143,224,235,230,100,131,214,97,187,56,220,182,113,
+    172,25,159,22,14,229,211,40,228,171,55,27,49,134,105,48,
+    14,97,12,165,117,18,217,184,61,19,208,197,169,203,51,111,
+    89,227,22,29,16,79,157,205,121,171,76,71,60,158,53,139,
+    230,172,105,209,153,28,134,247,234,252,254,134,159,72,235,109,
+    40,150,107,174,35,248,12,253,189,179,142,94,112,102,29,188,
+    157,24,207,48,47,169,148,194,183,158,209,223,53,215,10,64,
+    58,80,186,109,107,218,185,93,77,255,4,90,250,23,106,107,
+    127,213,140,186,156,69,247,162,39,235,130,156,184,72,78,220,
+    112,101,37,87,30,184,114,227,149,158,82,209,232,20,120,235,
+    121,175,110,81,20,239,67,13,205,78,40,150,69,212,167,169,
+    173,195,251,101,90,172,53,51,164,251,150,170,255,201,214,233,
+    203,22,189,201,33,67,252,128,28,191,19,158,134,148,167,69,
+    157,254,72,251,53,166,149,217,167,123,203,188,20,86,83,109,
+    105,176,151,247,101,125,197,182,157,164,10,20,153,3,255,26,
+    236,225,29,219,218,195,195,155,104,48,246,156,222,30,254,172,
+    204,210,198,20,210,10,249,28,3,99,241,153,38,242,106,90,
+    205,76,229,235,137,137,255,191,172,222,235,200,143,191,1,163,
+    119,141,22,208,148,15,85,199,116,60,25,75,92,139,79,189,
+    92,181,67,149,225,69,58,202,17,219,234,106,72,229,242,116,
+    70,140,213,22,237,169,170,94,230,166,231,18,9,194,135,53,
+    151,239,143,51,58,249,126,191,34,223,95,54,23,155,245,155,
+    134,73,32,107,162,72,232,151,189,89,54,107,250,251,166,149,
+    1,89,80,31,101,69,92,40,34,203,200,53,91,15,189,166,
+    67,153,207,95,6,176,112,96,155,249,156,72,45,154,136,201,
+    95,192,249,253,73,70,22,147,115,93,45,26,248,117,251,174,
+    2,87,16,42,109,125,111,101,223,204,22,199,202,109,81,169,
+    45,186,254,252,70,219,225,82,219,225,154,133,105,237,40,12,
+    109,145,27,56,168,110,222,66,26,103,156,44,11,56,47,10,
+    95,175,6,141,66,107,185,50,145,250,139,154,62,101,71,62,
+    101,79,70,217,170,51,141,157,38,6,249,76,127,202,58,69,
+    52,106,39,180,86,213,20,187,17,109,175,250,234,148,142,226,
+    27,140,66,239,32,210,33,139,21,46,42,246,49,46,32,167,
+    82,9,186,38,140,86,213,28,67,153,231,84,130,82,70,68,
+    80,143,194,118,241,239,50,178,164,187,202,225,226,160,170,133,
+    208,90,85,171,144,156,2,178,143,146,85,152,153,170,93,161,
+    24,197,101,124,166,35,198,8,125,171,72,237,9,57,64,68,
+    247,111,34,136,96,8,39,233,126,147,168,79,172,58,160,86,
+    200,85,90,147,237,227,226,30,28,229,98,6,159,160,169,145,
+    248,117,4,34,201,22,146,162,100,161,5,109,240,70,129,189,
+    98,29,66,87,92,116,61,162,245,15,99,75,47,154,40,37,
+    215,201,180,244,23,91,203,129,97,41,48,156,179,86,124,193,
+    149,111,20,98,27,190,62,160,208,252,206,138,219,191,242,92,
+    201,125,186,192,175,189,188,62,246,222,115,229,222,19,247,191,
+    176,209,123,186,102,102,28,30,32,223,28,158,156,107,197,149,
+    255,122,217,222,142,23,31,248,130,146,175,175,236,235,151,124,
+    253,104,41,210,241,160,117,104,163,117,168,248,114,185,245,176,
+    132,199,227,57,39,208,114,15,66,131,27,161,193,226,68,57,
+    116,80,194,227,120,206,177,217,218,94,232,44,198,203,29,7,
+    202,173,7,165,214,131,57,231,102,48,156,95,184,123,102,245,
+    76,206,190,21,106,95,125,182,216,127,247,74,101,112,180,50,
+    176,119,51,4,4,231,221,75,171,151,106,14,11,26,183,88,
+    136,9,139,23,237,15,79,20,108,27,174,190,146,171,15,202,
+    81,99,236,158,150,74,103,36,111,203,219,182,186,250,214,78,
+    231,237,53,147,161,91,19,176,53,188,255,167,217,31,101,127,
+    248,234,187,175,214,44,112,255,16,31,126,132,32,111,171,57,
+    153,222,65,162,146,232,29,202,157,207,63,182,124,101,203,229,
+    91,57,85,114,237,170,140,28,124,239,242,131,145,51,27,35,
+    103,42,254,112,197,223,89,241,183,87,252,161,7,254,200,134,
+    63,82,236,160,230,46,146,255,208,67,135,101,63,80,188,0,
+    128,126,204,141,23,206,23,207,213,220,204,254,39,114,231,75,
+    193,61,240,168,2,233,147,132,43,61,3,112,113,124,121,124,
+    211,31,90,117,22,142,175,191,84,242,159,40,251,79,72,254,
+    19,247,199,202,254,39,31,248,158,217,240,61,83,246,93,146,
+    124,151,114,28,100,67,114,117,21,110,111,184,134,74,174,161,
+    205,96,219,234,231,138,33,106,118,149,27,203,141,85,60,1,
+    201,211,83,12,111,120,134,75,158,97,212,163,156,124,16,220,
+    189,17,220,93,204,148,131,35,82,112,36,55,182,233,9,144,
+    229,54,215,202,158,1,201,51,128,148,108,87,241,70,197,237,
+    253,206,51,111,60,147,191,182,60,190,50,158,27,71,34,183,
+    139,188,34,224,33,130,143,24,195,179,109,1,89,76,243,168,
+    0,233,22,232,167,255,77,127,248,25,206,252,43,142,123,198,
+    110,251,149,139,5,24,229,244,130,173,168,191,169,130,1,13,
+    79,169,10,193,161,140,107,17,241,235,163,23,208,84,61,50,
+    19,52,37,36,18,147,147,63,99,197,21,70,54,81,151,135,
+    206,29,5,212,240,197,159,80,100,168,105,23,60,168,93,64,
+    208,203,120,246,46,157,131,238,177,123,111,165,189,163,210,214,
+    93,9,245,214,60,163,22,224,8,0,108,121,3,53,11,222,
+    88,153,112,111,97,106,245,197,154,13,239,168,80,31,175,156,
+    76,160,181,230,194,43,55,227,107,209,34,54,5,215,217,207,
+    89,186,26,215,227,192,67,92,143,3,167,29,0,202,163,96,
+    193,12,82,127,133,9,248,112,154,105,34,245,247,240,156,192,
+    241,22,193,194,91,5,235,180,149,72,245,109,175,121,38,108,
+    188,253,51,22,187,58,120,167,188,198,198,205,123,121,55,156,
+    61,68,186,239,5,18,199,87,109,85,214,239,26,133,251,191,
+    167,80,62,103,147,219,11,246,197,212,43,77,4,249,49,224,
+    227,105,146,64,8,76,221,138,223,166,194,219,61,105,1,165,
+    201,51,199,70,133,59,153,209,217,121,42,138,85,130,226,154,
+    87,42,183,34,18,27,92,7,13,217,144,165,82,114,130,40,
+    89,82,150,217,144,69,32,184,86,58,174,24,198,76,11,175,
+    40,98,4,42,115,66,234,135,138,111,99,145,68,10,165,222,
+    115,73,69,44,76,197,201,49,49,173,208,111,48,137,100,234,
+    205,53,144,140,105,204,133,158,236,147,45,49,100,219,139,17,
+    148,184,43,148,216,112,154,168,26,70,34,179,137,57,93,100,
+    82,93,115,51,51,49,113,158,218,117,68,246,8,163,55,41,
+    129,116,253,250,41,140,114,122,116,38,158,84,215,0,255,198,
+    79,134,31,153,213,156,55,128,80,120,121,18,170,61,77,36,
+    10,83,122,11,97,85,130,140,29,235,111,70,130,108,92,143,
+    10,124,142,249,61,214,232,36,193,176,60,5,151,177,155,99,
+    237,236,163,36,158,114,143,136,240,113,145,44,71,154,111,98,
+    167,164,22,178,222,94,136,202,230,110,204,77,79,11,216,40,
+    55,4,32,96,137,152,106,30,219,234,81,242,68,89,61,163,
+    16,220,114,46,126,91,201,157,146,121,189,240,14,232,234,68,
+    108,10,222,110,247,249,120,70,39,10,51,137,191,100,100,113,
+    208,56,16,143,255,129,138,37,145,199,172,218,38,95,161,139,
+    232,45,58,33,146,26,129,226,71,197,248,84,47,44,234,109,
+    58,134,85,89,81,22,41,140,211,20,125,126,28,222,78,86,
+    180,217,54,4,4,70,97,226,158,181,102,54,181,59,31,50,
+    0,62,66,96,48,171,215,68,43,198,101,48,54,165,247,85,
+    217,250,85,207,186,165,61,198,94,216,212,78,158,175,235,133,
+    154,78,98,209,244,215,72,213,180,109,170,102,236,215,68,70,
+    97,226,205,107,166,69,78,111,41,90,63,38,154,243,248,13,
+    54,249,159,39,140,134,101,209,170,95,186,146,181,102,188,186,
+    56,70,99,244,67,89,235,14,211,238,34,105,219,22,237,89,
+    27,207,201,156,182,21,229,15,89,11,177,62,12,208,235,239,
+    51,188,37,107,251,62,243,14,241,142,176,210,189,242,108,214,
+    170,134,249,130,222,102,178,185,53,126,253,146,31,170,213,136,
+    218,98,231,183,225,137,97,46,248,27,99,136,27,199,231,191,
+    151,204,240,223,195,182,251,14,131,235,218,196,60,94,223,101,
+    100,62,242,83,118,116,60,234,164,196,210,127,140,224,7,202,
+    27,241,29,70,97,147,52,251,245,127,128,224,199,152,144,67,
+    199,241,96,215,17,127,202,160,205,7,180,142,198,164,86,45,
+    100,230,169,186,200,73,102,222,26,23,28,81,214,165,179,57,
+    110,193,178,172,40,50,104,194,184,132,59,165,214,161,114,235,
+    176,212,58,252,160,245,200,70,235,145,123,207,150,91,159,148,
+    240,56,15,12,68,168,93,10,13,150,67,187,165,208,238,7,
+    161,195,27,161,195,247,78,150,67,167,37,60,198,114,142,173,
+    193,209,123,29,229,193,147,149,129,145,154,197,236,67,35,121,
+    159,51,103,254,216,206,116,239,91,63,86,238,58,36,117,29,
+    122,208,245,216,70,215,99,229,174,19,82,215,9,96,39,28,
+    3,4,44,63,155,27,203,15,213,25,188,219,60,3,149,189,
+    7,84,195,26,134,11,124,142,0,248,126,254,92,225,9,32,
+    17,139,182,141,182,225,82,219,112,101,240,64,193,92,24,123,
+    219,81,112,108,29,58,5,151,153,82,247,126,56,138,2,61,
+    151,219,71,75,237,163,53,7,166,224,102,122,6,242,230,252,
+    216,93,71,222,81,177,187,87,220,15,236,157,27,246,206,194,
+    145,178,189,79,178,247,149,148,131,32,202,230,11,64,229,69,
+    144,186,165,124,205,231,226,6,141,34,117,224,209,75,156,172,
+    164,145,34,131,137,105,94,155,10,201,204,56,138,206,50,72,
+    87,248,15,17,60,193,24,87,124,226,195,133,174,230,205,73,
+    116,23,63,135,192,31,98,207,89,98,182,180,226,149,237,221,
+    146,189,187,164,28,212,210,200,36,254,39,112,58,255,51,19,
+    157,10,162,190,166,140,1,225,9,118,200,14,208,60,255,28,
+    193,47,24,35,31,240,7,42,192,14,135,221,220,192,7,216,
+    144,15,64,208,226,181,64,199,1,128,75,233,225,180,62,69,
+    78,239,115,228,180,61,136,116,91,34,141,36,61,60,68,146,
+    190,27,141,149,140,224,148,201,210,3,12,249,103,1,58,95,
+    98,190,155,147,249,223,102,26,201,124,98,212,227,86,72,125,
+    193,42,112,77,151,213,91,5,155,142,5,176,243,200,0,88,
+    31,201,2,152,128,5,112,18,22,192,67,88,1,141,5,240,
+    86,195,170,175,30,35,15,144,216,142,7,72,203,56,255,70,
+    60,137,116,108,58,25,155,77,223,74,41,139,182,225,117,130,
+    174,233,166,72,80,103,219,51,149,136,147,165,231,83,169,100,
+    146,6,33,252,194,243,201,248,157,8,159,154,137,197,147,64,
+    226,147,101,227,168,181,69,110,128,154,187,163,58,118,46,153,
+    84,168,44,109,66,81,137,253,153,84,50,78,73,117,205,240,
+    35,166,145,233,122,17,107,122,52,114,85,16,100,138,187,142,
+    29,73,64,77,144,171,235,215,213,9,97,86,76,101,82,64,
+    190,19,253,104,76,46,3,166,145,228,149,12,37,81,195,76,
+    9,87,121,250,81,115,248,68,36,157,128,169,81,41,249,76,
+    60,157,86,43,44,173,232,78,233,156,48,254,27,134,241,203,
+    84,223,42,131,244,254,76,236,206,36,29,227,6,82,95,93,
+    83,253,207,152,191,37,82,31,9,253,250,69,47,26,209,111,
+    90,50,241,166,164,11,125,69,52,218,68,235,205,65,120,84,
+    177,88,12,119,170,250,3,87,242,78,218,180,119,184,208,47,
+    246,79,30,201,60,32,119,164,118,50,210,79,26,103,104,210,
+    122,39,35,23,18,169,27,251,211,153,249,4,137,5,52,117,
+    50,173,198,84,122,37,118,227,209,200,83,243,17,94,152,142,
+    205,37,50,35,219,144,240,177,68,66,55,159,167,73,235,55,
+    225,20,209,98,130,122,237,106,106,160,143,63,197,72,127,143,
+    194,234,125,229,20,125,116,250,69,197,224,73,246,184,160,113,
+    133,141,191,6,62,177,193,98,64,237,54,245,28,20,89,150,
+    44,143,226,153,24,146,67,145,175,207,9,115,178,171,136,216,
+    163,88,40,218,131,21,166,43,158,33,93,89,208,117,102,29,
+    155,195,138,255,152,65,14,161,169,72,30,87,8,202,86,240,
+    225,69,246,81,58,88,141,198,191,107,90,105,83,68,239,38,
+    17,213,94,85,7,74,254,103,98,153,169,91,240,132,88,170,
+    219,148,150,214,173,254,167,198,242,71,154,99,56,149,67,106,
+    182,234,224,159,227,100,131,31,92,98,74,129,11,244,184,119,
+    243,187,35,133,87,168,77,181,212,114,72,125,78,81,61,126,
+    54,106,215,49,117,94,146,171,73,226,209,77,172,58,38,73,
+    110,5,49,93,181,18,7,53,105,120,164,224,74,34,59,55,
+    240,125,136,1,72,53,110,207,247,245,125,70,177,238,99,17,
+    80,96,141,140,223,224,246,140,223,238,98,230,190,179,212,246,
+    116,185,237,105,169,237,105,228,247,106,86,198,223,154,91,172,
+    153,25,79,32,55,182,69,10,249,126,43,128,114,224,130,20,
+    184,80,179,49,14,207,138,183,230,100,136,135,8,151,226,33,
+    130,106,238,115,46,121,73,224,54,122,120,36,1,168,59,12,
+    92,251,199,188,238,66,245,204,27,174,71,245,132,157,80,73,
+    192,27,189,76,120,35,211,162,217,128,206,204,25,157,165,93,
+    29,223,117,57,107,222,97,218,154,211,6,78,209,236,139,253,
+    6,94,177,78,15,14,113,252,36,142,117,209,150,181,45,187,
+    136,229,157,41,107,37,118,116,28,229,213,86,70,178,22,249,
+    13,151,229,84,110,237,177,149,233,172,25,159,147,187,132,97,
+    181,162,171,209,21,195,178,78,171,44,107,205,135,241,169,134,
+    108,245,41,16,186,193,242,26,196,123,244,90,237,101,29,122,
+    214,235,238,53,29,125,221,84,227,100,154,252,120,107,221,152,
+    86,115,178,232,248,107,164,106,219,54,85,231,242,103,106,236,
+    151,117,235,45,225,90,229,202,51,125,90,152,172,35,235,108,
+    180,124,48,134,168,123,215,175,203,159,61,231,130,90,118,188,
+    102,95,54,172,237,172,171,111,227,218,68,232,179,191,80,251,
+    45,11,57,187,195,106,121,227,157,178,213,136,246,196,5,83,
+    166,59,246,164,126,202,188,74,40,179,223,213,103,155,154,140,
+    70,159,201,116,203,191,239,156,56,229,185,191,242,41,251,162,
+    248,159,50,77,116,201,100,29,124,130,65,106,235,117,109,37,
+    252,254,55,216,101,147,206,223,75,36,99,214,162,229,88,186,
+    106,76,31,226,209,3,238,151,209,101,86,94,75,63,202,83,
+    175,55,13,43,201,72,70,70,25,195,130,124,223,34,107,98,
+    112,53,153,49,57,57,41,127,243,101,249,22,50,25,85,57,
+    50,17,25,150,151,77,0,88,120,124,155,169,165,78,95,173,
+    172,206,215,174,254,13,206,57,200,253,41,235,244,195,103,224,
+    40,206,229,225,175,112,237,238,55,86,191,65,159,232,15,133,
+    167,252,175,240,243,51,90,38,197,255,22,1,241,92,68,114,
+    248,164,62,135,163,191,93,14,255,10,243,133,218,221,79,228,
+    140,213,24,203,46,47,1,91,161,118,178,186,169,20,140,110,
+    6,195,250,140,221,227,254,208,11,167,114,248,140,4,48,120,
+    70,10,158,129,41,49,180,183,102,97,2,173,91,193,104,73,
+    57,106,54,37,49,58,241,169,146,29,178,238,178,249,122,192,
+    8,163,91,15,232,172,95,104,9,20,143,171,201,170,64,90,
+    37,47,170,85,98,88,19,120,96,103,85,162,146,56,40,151,
+    80,151,4,182,157,166,71,49,83,224,10,215,214,156,234,3,
+    90,34,148,31,143,71,3,205,196,79,85,135,0,20,166,128,
+    198,3,85,75,6,221,195,138,255,20,223,253,215,140,194,224,
+    215,137,176,254,9,67,168,181,185,27,144,147,91,212,106,128,
+    72,9,176,68,81,183,78,130,165,217,85,252,17,130,255,12,
+    1,143,145,173,148,108,174,90,72,247,213,36,93,180,102,16,
+    253,95,215,240,137,65,19,255,136,42,250,83,236,34,255,138,
+    44,162,131,238,209,201,248,91,114,220,102,215,222,230,242,39,
+    7,58,91,0,208,84,254,100,247,236,50,200,159,44,129,211,
+    4,52,202,159,54,163,135,239,61,81,142,158,145,162,103,106,
+    12,219,113,146,128,183,47,22,206,22,110,87,142,156,40,140,
+    21,199,138,189,197,222,245,67,8,139,189,229,238,131,165,238,
+    131,53,51,6,180,50,71,78,23,184,34,87,234,25,133,163,
+    56,71,207,229,246,3,165,246,3,53,23,126,209,203,244,238,
+    162,126,123,242,206,143,173,76,32,156,231,239,186,86,93,57,
+    75,197,229,207,143,173,62,43,43,231,59,251,114,99,43,207,
+    110,246,12,104,35,66,55,54,186,251,107,22,56,63,196,155,
+    143,24,122,213,139,87,189,94,212,197,127,236,253,235,9,254,
+    100,57,90,247,134,189,27,205,27,198,17,60,187,233,246,229,
+    157,133,47,151,253,187,203,238,97,201,61,76,238,151,175,172,
+    92,217,116,7,242,187,212,142,9,199,122,230,189,87,225,84,
+    110,59,45,1,116,159,145,220,103,30,186,172,14,231,71,12,
+    128,26,1,222,122,187,8,149,60,253,91,17,209,29,0,206,
+    80,158,62,101,135,130,50,231,79,205,222,103,82,183,149,121,
+    145,50,176,40,179,195,241,240,8,153,93,247,54,125,150,8,
+    237,56,200,184,120,31,195,82,36,58,46,254,23,120,243,143,
+    240,230,17,82,57,162,169,183,171,35,79,19,205,237,88,42,
+    247,159,43,224,151,56,108,254,75,166,78,42,103,69,169,28,
+    130,48,170,229,59,251,107,142,46,75,123,141,1,64,20,242,
+    120,3,60,70,59,224,154,171,107,14,201,55,80,179,225,35,
+    59,174,186,83,67,54,5,39,247,91,58,26,165,117,240,16,
+    165,117,112,170,7,95,99,127,27,113,29,22,168,42,155,8,
+    89,129,58,153,142,223,105,100,96,84,101,215,159,3,120,221,
+    140,142,164,128,129,1,182,32,163,11,164,49,175,154,89,48,
+    111,210,179,34,188,153,231,166,173,57,115,14,29,87,91,94,
+    115,191,97,206,34,211,112,97,209,224,172,36,107,202,232,72,
+    224,58,246,197,99,194,21,249,48,113,212,155,54,174,12,42,
+    111,190,15,41,20,245,75,141,180,180,24,125,15,6,22,196,
+    250,142,185,33,157,103,150,57,162,246,249,185,66,102,126,17,
+    168,55,185,103,211,213,253,84,99,47,175,57,187,33,160,180,
+    43,22,81,189,122,71,246,100,230,103,227,48,243,36,230,73,
+    36,36,214,162,72,173,145,196,20,50,84,13,14,100,27,85,
+    13,67,240,120,146,72,7,137,211,75,213,67,194,60,174,250,
+    160,94,47,116,203,250,100,125,62,234,219,21,249,223,141,185,
+    56,213,70,145,204,92,37,203,230,174,82,95,152,184,42,176,
+    110,9,160,226,30,147,46,207,83,92,100,66,152,235,215,79,
+    209,55,48,113,166,231,110,224,124,131,164,38,46,147,185,115,
+    26,151,225,224,184,54,56,199,36,50,77,146,142,46,211,170,
+    83,7,42,223,25,85,229,89,152,153,12,113,101,129,196,42,
+    4,147,125,121,80,247,189,170,31,143,107,42,73,63,51,7,
+    85,166,16,209,132,162,54,80,210,178,231,112,203,77,49,53,
+    55,43,254,41,179,173,182,150,208,32,255,61,67,157,61,108,
+    231,121,167,129,11,14,66,231,212,17,185,216,193,150,109,70,
+    155,0,232,52,161,237,188,160,213,217,29,155,129,251,54,127,
+    118,56,248,110,88,225,190,161,91,163,51,68,236,214,192,47,
+    243,108,147,46,219,38,19,207,132,148,143,114,85,59,84,40,
+    65,159,85,255,228,100,140,231,117,54,139,85,143,252,238,2,
+    86,87,154,174,245,183,139,15,176,218,176,238,170,28,241,180,
+    108,189,73,95,35,241,85,181,76,221,130,158,85,117,96,74,
+    180,150,137,235,100,109,33,135,226,226,226,95,2,88,24,168,
+    51,146,212,232,48,53,126,59,146,97,72,5,1,2,173,132,
+    58,222,26,127,115,188,28,26,132,89,19,45,179,142,16,144,
+    27,219,116,119,23,174,21,143,175,31,47,187,15,75,238,195,
+    37,114,84,2,225,7,129,193,141,192,96,57,176,91,10,236,
+    206,89,43,93,253,63,56,245,189,83,111,159,94,59,141,241,
+    14,17,64,73,148,138,187,53,119,49,47,20,173,165,158,3,
+    235,64,53,28,160,71,217,125,80,114,31,44,145,3,45,204,
+    104,20,138,12,73,253,217,170,230,201,153,99,84,32,109,33,
+    213,68,103,16,66,254,17,59,79,172,95,34,208,138,90,8,
+    226,164,53,199,138,164,2,104,229,200,210,43,197,139,193,59,
+    10,112,96,209,209,194,65,38,185,188,254,165,243,53,206,98,
+    57,244,78,112,173,99,173,15,151,137,31,250,163,93,228,116,
+    127,144,156,62,3,120,25,47,90,18,90,142,17,144,99,55,
+    93,173,249,216,59,161,178,171,87,114,245,214,24,179,227,24,
+    173,135,88,33,92,118,71,36,119,164,68,142,45,249,225,249,
+    82,199,145,226,217,159,94,250,209,165,31,94,126,247,50,220,
+    208,163,236,62,42,185,143,150,200,81,113,5,150,158,163,86,
+    181,14,149,183,37,165,156,210,119,101,196,217,100,142,152,54,
+    41,222,249,53,138,130,56,87,50,27,6,18,147,209,73,248,
+    53,243,4,221,114,16,35,230,119,67,122,170,176,0,77,24,
+    200,38,8,208,241,119,148,170,182,8,193,152,234,179,134,133,
+    29,219,58,135,210,47,212,208,47,202,200,234,4,49,250,133,
+    19,112,237,209,93,123,117,215,62,221,181,186,84,129,103,215,
+    28,191,117,153,84,97,82,93,153,76,59,78,161,101,155,20,
+    174,100,117,203,31,22,185,76,84,159,150,214,10,13,226,191,
+    99,170,25,136,126,81,3,151,213,173,213,55,198,153,53,46,
+    127,168,95,88,99,203,90,177,86,136,24,81,51,237,56,138,
+    229,35,40,207,60,30,117,80,13,191,121,38,158,4,16,187,
+    83,181,223,136,39,137,187,91,17,247,75,17,15,33,64,23,
+    63,34,74,18,196,163,140,50,204,195,148,179,36,163,122,139,
+    81,53,80,116,198,188,152,156,78,209,132,237,168,248,192,91,
+    180,129,134,73,15,251,125,213,6,95,67,244,6,23,177,59,
+    228,194,69,249,51,237,195,85,27,245,153,156,174,251,120,213,
+    117,62,37,162,120,138,164,233,124,129,76,181,228,218,46,207,
+    182,105,241,191,99,100,170,21,48,51,82,92,116,86,35,246,
+    220,132,65,252,43,76,199,66,102,100,202,44,98,73,244,11,
+    235,100,98,186,170,128,97,196,58,79,177,138,167,212,150,252,
+    197,213,241,178,107,96,105,108,211,22,200,71,223,185,186,246,
+    101,169,231,80,217,118,88,178,29,174,49,173,150,253,149,182,
+    200,234,55,115,214,92,102,153,24,66,109,58,130,249,139,239,
+    164,215,230,165,190,67,101,199,97,9,253,209,7,45,251,63,
+    104,237,40,68,165,206,189,229,214,125,82,235,190,74,176,91,
+    10,14,202,176,189,95,106,223,15,215,171,159,171,116,13,74,
+    93,35,149,142,1,169,99,132,60,222,91,9,245,172,142,215,
+    130,206,118,224,87,0,104,159,249,56,204,56,67,202,135,142,
+    150,29,199,36,199,49,84,116,239,223,178,187,129,49,213,50,
+    113,164,236,56,42,57,142,34,198,219,79,62,56,148,179,111,
+    118,15,21,227,239,166,202,221,199,165,238,227,232,46,127,63,
+    1,203,151,115,231,242,199,208,154,251,78,209,178,250,205,114,
+    112,88,10,14,151,130,199,254,224,200,250,220,207,78,190,119,
+    50,55,86,25,30,201,157,207,243,165,224,46,56,10,215,232,
+    185,236,30,44,185,7,107,14,14,29,87,32,224,148,4,233,
+    68,129,243,101,131,204,140,96,191,255,151,65,236,23,103,22,
+    217,29,147,24,61,245,36,70,131,107,84,243,183,156,89,51,
+    26,36,106,148,53,25,9,189,240,141,29,144,19,59,116,172,
+    218,166,144,28,6,135,121,117,99,18,114,65,69,249,237,6,
+    47,197,166,56,188,193,173,56,136,73,228,101,101,17,248,53,
+    49,150,76,19,127,21,64,149,146,125,124,200,132,26,73,81,
+    82,89,38,120,229,61,123,40,185,167,15,128,126,31,232,75,
+    170,6,87,102,159,186,84,210,196,59,187,158,244,76,196,128,
+    46,7,82,249,170,26,131,134,5,58,244,108,114,158,36,70,
+    114,35,167,160,223,161,5,82,35,155,190,16,74,19,189,49,
+    16,250,148,144,83,123,162,170,79,8,3,21,37,47,175,158,
+    158,75,146,60,68,144,248,23,120,74,41,163,46,85,167,132,
+    85,234,131,143,236,33,123,232,164,209,188,82,175,167,149,83,
+    18,137,193,37,143,75,129,241,213,173,184,32,162,141,216,188,
+    162,252,148,133,194,132,156,162,66,97,82,30,32,92,70,169,
+    98,223,80,67,84,8,172,251,56,125,16,211,87,174,241,215,
+    172,45,174,233,248,26,165,150,72,42,228,211,42,71,163,228,
+    208,224,198,142,166,119,211,144,41,45,59,170,47,252,120,18,
+    141,22,116,77,35,27,10,80,137,160,77,252,31,224,132,155,
+    87,40,52,38,165,69,8,34,71,151,163,132,156,213,150,233,
+    164,101,114,245,215,24,217,74,6,109,213,73,95,16,231,181,
+    255,19,70,33,8,22,41,21,241,95,0,72,35,161,160,199,
+    161,255,70,1,79,35,14,197,57,2,112,104,55,211,18,90,
+    186,180,229,111,125,203,251,166,183,236,143,72,254,8,186,238,
+    25,37,0,80,85,104,87,113,172,28,138,74,161,104,206,81,
+    113,133,74,174,72,101,112,127,238,82,62,179,58,95,118,247,
+    127,178,21,238,122,16,142,110,132,163,229,240,62,41,188,239,
+    65,248,208,70,248,80,57,124,68,10,35,241,139,148,29,128,
+    101,39,48,202,207,111,118,70,215,135,202,157,7,165,206,131,
+    57,103,254,200,178,47,231,251,192,229,47,185,122,225,200,159,
+    164,231,18,215,219,40,222,81,77,38,254,105,131,125,42,144,
+    3,58,94,69,67,41,26,97,96,36,7,210,166,75,232,247,
+    98,71,104,132,221,217,151,52,18,194,72,120,248,12,246,163,
+    117,196,194,213,157,165,173,106,159,26,210,214,175,199,253,221,
+    210,214,116,118,198,180,217,228,232,142,226,171,132,99,67,222,
+    116,235,58,27,243,70,69,109,177,51,108,51,180,170,141,121,
+    36,35,234,80,107,61,2,28,193,161,63,43,166,166,132,116,
+    218,136,83,211,138,49,191,140,141,19,194,109,220,59,77,143,
+    109,212,176,116,76,235,63,215,12,195,52,126,189,41,106,168,
+    15,164,160,67,93,242,163,145,47,210,24,170,55,144,72,124,
+    186,14,107,233,115,51,69,54,183,49,230,72,198,36,81,119,
+    61,201,199,17,234,203,38,203,19,68,220,44,14,247,206,33,
+    72,4,208,157,32,138,255,51,62,106,161,143,244,146,15,17,
+    215,233,136,15,117,17,168,228,36,202,18,172,162,151,107,126,
+    172,128,175,33,26,121,159,33,54,164,97,198,29,206,199,127,
+    28,124,183,227,221,222,178,235,160,228,58,88,226,228,163,194,
+    121,30,112,173,27,92,107,153,107,147,184,182,18,215,246,65,
+    19,82,205,97,25,222,244,117,21,46,82,49,124,201,190,187,
+    25,165,102,195,64,253,197,104,217,55,34,17,223,105,186,64,
+    42,149,101,177,12,147,5,117,205,168,44,182,254,43,91,46,
+    95,238,104,35,202,81,55,2,67,189,161,81,162,140,212,144,
+    38,31,92,52,184,47,94,52,152,43,232,119,88,168,55,77,
+    71,94,32,203,189,103,50,46,36,39,124,64,213,60,125,252,
+    232,207,56,74,179,115,115,201,120,166,234,226,133,244,148,24,
+    39,251,248,145,13,255,98,153,249,89,100,217,9,201,204,178,
+    24,16,131,84,93,87,209,248,239,166,0,243,155,80,181,82,
+    6,0,130,145,137,65,13,43,162,3,10,209,204,234,44,83,
+    228,166,253,191,20,176,128,77,123,150,52,45,240,220,43,87,
+    150,206,1,238,95,57,189,52,86,105,233,90,29,93,122,246,
+    3,95,103,225,152,228,235,95,122,230,3,87,160,226,13,22,
+    6,215,159,125,31,253,119,186,173,15,25,0,31,33,64,209,
+    172,181,177,110,125,74,221,186,217,223,174,110,245,78,142,22,
+    57,253,198,105,184,27,135,134,136,235,76,247,205,13,156,152,
+    14,177,46,26,28,224,27,221,24,44,58,245,252,241,162,75,
+    207,33,47,186,51,237,218,55,12,45,237,201,116,233,191,78,
+    221,4,3,231,104,71,179,132,172,43,235,38,173,239,129,182,
+    135,92,254,66,205,41,105,123,241,223,193,85,212,67,219,234,
+    95,35,248,11,6,57,183,228,220,204,36,48,131,105,241,47,
+    241,217,182,220,160,177,117,163,94,250,128,99,21,150,11,247,
+    141,18,255,87,4,255,27,130,51,106,98,255,71,147,196,44,
+    216,173,220,122,99,57,72,240,207,141,159,33,249,252,75,67,
+    102,69,59,75,88,70,200,49,112,147,77,179,73,186,30,10,
+    18,140,104,143,246,193,255,91,1,127,23,251,224,207,24,186,
+    199,139,190,243,65,143,148,220,221,208,37,125,237,146,111,112,
+    233,153,138,51,40,57,187,150,158,86,206,232,7,242,24,250,
+    88,135,87,222,182,149,153,165,11,16,81,106,217,5,49,253,
+    29,146,127,215,210,69,18,19,58,175,156,174,190,55,183,65,
+    111,174,184,125,120,4,58,240,112,7,43,161,62,72,0,175,
+    61,1,60,224,54,208,81,235,242,98,95,247,98,95,247,98,
+    95,247,54,235,235,170,182,225,213,6,210,165,78,156,250,59,
+    247,252,58,151,224,154,116,168,94,162,145,90,68,9,132,85,
+    215,83,177,87,234,239,237,250,69,46,134,62,237,48,58,0,
+    209,199,170,115,7,30,222,105,200,69,103,210,72,198,88,235,
+    223,27,220,150,219,96,28,193,8,170,199,152,48,150,156,132,
+    135,155,53,56,41,103,223,51,215,19,30,184,28,22,71,151,
+    136,219,172,144,5,242,4,59,78,206,196,102,163,46,186,20,
+    131,244,102,34,145,64,1,6,34,212,52,237,235,56,11,16,
+    183,175,100,80,80,25,170,21,187,185,149,10,61,32,1,28,
+    24,85,107,38,133,66,106,58,216,48,33,209,195,42,227,229,
+    67,245,11,234,0,173,186,137,224,99,18,71,88,242,102,26,
+    27,178,97,56,252,63,10,248,41,14,7,100,15,150,152,77,
+    79,96,249,133,149,23,150,206,195,60,7,29,124,114,233,188,
+    218,161,235,58,118,32,156,159,95,125,149,74,152,107,76,0,
+    173,230,1,228,44,91,254,112,126,110,213,147,179,84,194,189,
+    133,185,213,84,206,245,65,16,46,136,248,225,99,39,227,246,
+    229,238,20,44,43,223,44,187,250,36,23,238,57,227,216,189,
+    217,213,91,184,179,110,89,251,102,185,235,128,212,117,32,119,
+    57,119,249,3,120,52,247,246,201,181,147,112,217,55,84,105,
+    105,43,240,247,92,239,223,130,89,32,130,75,208,34,184,4,
+    45,130,66,145,108,153,44,63,248,24,55,71,40,188,80,114,
+    13,150,93,131,146,107,176,196,13,202,219,189,208,166,104,216,
+    33,149,140,156,94,166,126,150,200,178,250,29,184,100,3,25,
+    32,84,176,114,163,38,138,162,2,108,221,78,82,254,201,73,
+    81,152,22,133,244,173,73,250,53,49,8,65,254,4,43,213,
+    71,42,21,69,60,103,150,206,191,118,121,9,254,104,190,220,
+    122,10,201,144,59,179,146,187,79,152,71,109,20,90,47,111,
+    208,57,143,215,141,104,120,206,233,158,91,116,207,245,219,19,
+    216,116,207,237,186,231,14,221,243,230,146,93,118,178,185,100,
+    151,157,108,46,229,101,39,155,75,124,89,157,1,155,90,239,
+    62,241,127,97,148,249,133,116,111,50,191,144,233,128,76,50,
+    100,78,32,19,143,54,119,145,233,166,201,204,160,180,94,168,
+    190,245,194,90,235,25,168,214,48,4,252,103,216,134,232,69,
+    4,200,80,43,211,217,91,136,75,189,163,229,142,3,82,199,
+    129,165,203,18,23,174,180,69,164,182,61,120,25,210,95,118,
+    15,73,221,135,240,178,3,69,132,139,244,97,223,30,169,239,
+    32,94,118,87,122,118,75,61,228,178,147,4,29,165,65,219,
+    251,215,188,120,213,90,34,135,188,131,154,188,79,95,243,205,
+    211,208,137,116,189,191,42,67,39,49,240,79,128,168,221,138,
+    37,44,160,79,157,167,41,221,38,45,80,79,41,165,190,163,
+    28,173,179,54,86,238,246,116,163,19,195,222,161,250,222,79,
+    233,122,177,3,66,86,176,230,142,171,53,215,83,248,18,145,
+    59,146,205,211,144,86,238,33,96,217,147,179,230,45,149,182,
+    238,156,21,23,147,214,204,202,11,58,221,233,138,204,40,93,
+    250,195,147,76,227,6,149,184,243,179,126,195,51,222,252,26,
+    55,97,69,159,145,100,223,103,59,111,35,91,84,90,232,158,
+    206,147,178,226,247,234,203,66,66,200,164,146,177,3,42,199,
+    168,49,118,138,36,74,16,100,107,73,65,111,67,136,90,100,
+    184,71,119,120,242,198,2,184,228,151,212,130,108,181,168,250,
+    161,109,166,14,79,201,94,79,231,210,2,85,249,226,119,134,
+    211,145,244,173,216,44,77,113,70,200,196,144,24,167,107,228,
+    137,192,123,36,130,4,59,106,194,53,138,93,222,135,0,72,
+    242,116,148,24,50,78,199,239,0,91,153,82,252,244,209,82,
+    160,144,142,174,72,71,149,176,144,140,221,32,130,183,52,112,
+    130,73,89,255,46,103,44,41,168,98,47,178,78,30,43,98,
+    238,70,154,108,212,144,33,18,59,217,158,159,24,98,53,183,
+    126,248,188,73,49,228,215,112,233,77,195,246,40,113,195,110,
+    134,184,215,92,158,125,209,189,104,210,59,60,203,154,50,58,
+    71,159,117,130,128,87,13,118,56,205,119,149,51,237,204,190,
+    97,186,97,3,46,136,215,116,91,171,58,105,241,14,220,144,
+    194,128,219,67,6,156,25,120,52,61,197,193,25,230,28,253,
+    128,173,91,70,175,81,106,84,235,181,18,93,249,253,186,90,
+    10,105,119,117,181,116,220,240,77,211,239,240,205,29,185,80,
+    163,155,155,232,183,94,225,89,3,159,82,87,195,168,229,228,
+    77,8,51,221,90,40,242,212,76,54,143,49,132,254,54,203,
+    83,10,235,83,187,98,57,242,105,79,84,145,69,199,211,196,
+    65,175,206,176,100,52,242,233,49,218,173,101,249,13,244,106,
+    189,25,9,174,103,81,237,75,116,111,70,97,182,217,100,144,
+    62,3,102,8,13,68,210,84,143,155,70,42,78,211,106,211,
+    37,247,40,96,213,137,82,91,38,137,85,137,65,154,74,12,
+    166,254,21,190,117,32,199,76,60,77,82,234,14,141,175,148,
+    37,29,196,156,17,183,96,160,178,85,148,189,214,51,206,100,
+    73,71,71,61,206,82,23,115,252,5,34,218,19,138,210,170,
+    173,131,248,72,108,239,212,57,78,220,10,132,107,76,139,163,
+    229,33,130,220,89,180,73,236,127,231,90,217,55,128,230,85,
+    76,192,211,2,241,2,173,171,174,7,254,129,13,255,64,241,
+    108,241,235,63,93,248,209,194,15,179,239,102,75,187,142,150,
+    253,199,36,255,177,146,255,88,101,96,215,79,15,252,232,64,
+    121,224,136,52,112,228,193,192,137,141,129,19,229,129,39,164,
+    129,39,208,55,127,152,128,187,151,242,79,23,90,55,247,158,
+    170,180,247,20,50,107,223,64,103,68,15,205,166,125,97,32,
+    214,246,133,243,99,171,227,197,35,229,208,112,41,52,92,51,
+    67,112,160,217,90,186,11,103,223,153,47,7,162,82,32,90,
+    99,28,158,150,205,3,103,43,161,214,124,102,245,27,197,177,
+    119,49,242,193,22,136,124,176,37,207,173,122,11,95,255,193,
+    194,247,22,222,206,174,101,203,254,145,146,127,4,226,183,69,
+    42,161,222,31,7,139,95,248,97,248,221,48,36,13,115,199,
+    190,129,135,12,219,58,176,57,56,242,208,204,182,238,175,153,
+    216,131,167,32,157,86,0,92,27,250,12,106,67,67,128,64,
+    75,173,7,106,131,212,11,213,85,81,107,152,166,178,97,236,
+    148,70,50,17,6,246,97,109,83,144,157,25,2,226,146,184,
+    23,195,196,182,101,7,54,48,104,175,178,114,68,155,149,205,
+    180,115,186,103,69,1,55,96,39,138,22,241,83,70,219,227,
+    155,216,166,144,197,65,40,175,175,219,223,27,3,46,180,55,
+    244,33,89,152,103,134,82,166,209,138,24,40,213,238,200,218,
+    179,72,148,19,202,188,143,234,5,43,238,192,3,119,239,134,
+    187,87,53,141,128,6,134,170,198,45,35,1,228,57,220,47,
+    204,253,166,251,174,119,213,155,135,63,152,198,225,149,69,73,
+    164,145,117,85,213,128,39,155,213,108,11,241,121,200,34,149,
+    98,146,197,89,13,182,60,65,61,113,30,97,213,106,168,218,
+    228,89,184,202,197,81,57,253,231,141,117,49,204,54,173,11,
+    57,158,3,235,226,4,173,139,61,35,239,121,208,236,101,136,
+    128,178,123,48,119,33,127,173,112,2,216,118,184,24,43,68,
+    225,137,68,52,160,168,4,53,43,225,104,119,34,134,150,142,
+    166,134,150,218,42,231,78,165,109,72,166,234,55,81,232,98,
+    101,240,47,113,136,11,140,113,19,5,11,26,82,34,240,118,
+    90,90,10,124,241,196,90,170,198,192,101,61,120,156,179,244,
+    161,114,86,15,220,38,203,16,74,208,154,2,154,3,242,113,
+    236,114,164,118,13,38,44,234,68,255,39,212,132,101,71,10,
+    92,178,115,101,211,113,146,133,169,173,113,18,142,163,48,194,
+    12,189,225,95,47,90,12,171,182,26,183,192,181,46,177,43,
+    33,234,197,66,99,124,136,79,76,195,42,44,189,185,164,38,
+    202,216,86,15,210,11,147,95,211,252,102,116,158,51,81,0,
+    55,109,174,207,251,202,87,118,244,229,237,180,36,219,127,89,
+    55,213,111,243,229,194,142,190,172,78,234,117,95,62,176,237,
+    151,117,2,73,252,242,78,246,65,107,146,187,191,128,190,226,
+    253,236,152,69,223,103,135,129,158,209,161,120,60,209,175,176,
+    202,218,17,99,212,145,52,92,214,70,136,148,206,204,46,45,
+    36,81,198,115,138,50,126,225,247,233,146,246,180,110,211,52,
+    121,42,71,107,206,27,232,89,33,65,220,127,211,45,18,8,
+    249,78,21,181,72,129,107,123,24,32,221,175,122,163,82,117,
+    221,116,105,173,194,33,164,137,198,92,54,48,157,38,254,177,
+    235,241,145,226,41,91,214,233,182,80,146,131,16,31,68,73,
+    210,196,42,135,232,100,136,232,129,168,98,8,3,75,212,46,
+    132,33,171,218,137,125,34,176,34,26,225,34,14,96,16,162,
+    247,117,208,9,68,29,241,52,197,127,203,200,243,73,189,254,
+    183,137,91,16,146,22,2,47,162,208,27,148,34,241,51,158,
+    22,220,166,178,236,238,166,114,85,206,249,250,115,223,126,46,
+    127,172,48,148,31,45,115,253,18,215,95,226,250,183,2,193,
+    165,75,21,127,43,238,10,115,153,165,176,153,126,184,187,226,
+    14,85,34,209,156,51,127,116,245,68,217,222,131,86,124,252,
+    59,79,175,93,148,186,15,150,93,135,36,23,90,251,57,46,
+    179,16,236,59,87,222,184,242,167,61,251,215,51,247,190,92,
+    234,62,83,118,63,41,185,159,44,145,99,211,211,86,224,222,
+    153,90,3,86,254,96,217,115,72,242,28,194,89,74,23,233,
+    200,189,107,247,79,148,186,207,149,221,231,37,247,249,18,57,
+    116,145,14,151,61,71,36,15,177,191,172,255,210,131,99,23,
+    54,142,93,40,31,187,40,29,187,88,234,190,84,118,63,43,
+    185,159,45,185,159,253,44,85,246,121,150,66,69,153,61,178,
+    254,252,189,243,247,159,41,119,158,147,58,207,253,142,10,237,
+    143,152,157,35,103,22,195,237,128,136,33,4,12,11,136,124,
+    135,4,204,223,168,221,77,0,248,67,189,60,186,97,202,88,
+    105,145,215,90,208,145,243,121,74,220,52,172,54,196,241,134,
+    203,122,128,196,87,148,157,86,113,136,85,168,122,50,29,147,
+    17,66,108,216,188,147,50,145,68,49,2,208,97,100,156,144,
+    49,65,70,2,93,110,37,143,129,17,86,6,135,112,12,44,
+    49,100,12,56,25,139,243,1,23,222,224,194,101,174,93,226,
+    218,75,92,123,157,77,4,107,105,35,32,199,85,236,238,239,
+    184,223,112,47,123,87,188,57,248,219,50,26,242,62,8,236,
+    223,8,236,47,7,14,72,129,3,24,161,151,128,156,101,211,
+    30,206,207,193,120,144,236,61,37,114,160,32,133,190,36,61,
+    228,218,121,17,81,100,213,21,79,78,137,196,134,61,150,48,
+    76,233,170,11,116,158,219,169,155,174,69,51,207,2,87,171,
+    155,154,117,134,17,59,104,223,6,215,91,154,142,205,242,215,
+    72,181,222,233,249,118,154,187,237,28,152,27,194,52,44,169,
+    102,197,94,189,30,227,179,156,101,53,178,0,226,119,12,186,
+    132,250,239,59,244,6,14,60,247,26,147,117,60,122,109,232,
+    162,83,63,53,111,227,136,188,206,213,56,110,159,186,212,97,
+    216,218,196,209,24,194,48,229,19,61,8,148,62,148,117,237,
+    100,114,198,13,84,119,182,37,74,214,165,217,231,46,186,147,
+    127,6,100,159,155,172,118,249,23,139,30,189,155,241,172,71,
+    111,155,91,71,182,124,30,114,230,203,12,235,67,55,200,116,
+    60,69,29,241,180,93,126,138,173,159,29,70,181,0,116,46,
+    122,51,251,117,223,172,115,46,158,117,203,218,163,246,149,155,
+    117,37,25,221,182,36,199,63,187,36,134,111,122,26,190,233,
+    41,234,218,109,187,50,144,124,253,195,204,17,237,61,111,201,
+    28,219,62,93,34,155,177,18,137,205,113,45,20,121,106,107,
+    38,177,201,156,208,165,236,64,107,4,116,133,207,219,215,184,
+    172,91,38,184,156,177,49,139,42,116,141,167,117,148,18,218,
+    203,81,203,23,130,185,101,186,72,177,89,33,254,72,244,75,
+    215,111,198,111,11,73,121,97,77,211,213,69,49,178,182,72,
+    123,71,86,25,53,89,97,68,5,177,202,246,185,74,122,250,
+    111,147,172,201,251,110,213,89,44,146,108,201,79,180,36,149,
+    192,58,145,112,156,150,106,0,229,200,3,35,145,6,235,70,
+    250,66,75,227,128,46,131,6,43,35,12,119,50,114,86,11,
+    185,77,177,70,84,187,73,173,206,166,83,77,60,209,40,54,
+    64,24,64,49,139,50,148,191,193,180,49,158,54,120,7,80,
+    127,218,151,134,211,117,149,79,61,225,40,102,145,169,27,164,
+    42,49,119,48,39,197,161,238,231,27,83,35,210,119,113,14,
+    211,210,205,226,216,2,184,31,205,205,68,125,23,49,86,147,
+    97,246,62,25,25,139,79,101,98,212,215,141,32,59,235,212,
+    187,2,160,146,111,101,205,20,92,196,155,213,148,86,101,169,
+    8,204,167,49,117,27,177,250,250,210,124,8,41,21,246,136,
+    196,174,95,191,38,210,221,121,245,249,215,205,216,100,59,35,
+    37,212,136,193,92,86,16,100,141,196,141,121,221,246,114,216,
+    84,219,126,80,241,166,64,199,15,246,166,61,233,40,54,233,
+    203,184,79,29,242,52,68,136,170,50,42,233,71,250,82,165,
+    219,141,146,229,119,104,70,38,82,85,193,136,204,247,196,113,
+    121,26,217,93,89,136,161,167,219,166,253,79,254,37,208,187,
+    131,222,149,23,29,151,116,165,21,201,151,177,23,52,237,129,
+    242,79,221,11,91,105,152,24,245,11,43,82,103,69,233,91,
+    49,197,51,24,177,66,222,65,233,70,228,226,233,154,69,214,
+    138,212,55,246,182,137,197,145,197,60,15,204,164,174,173,191,
+    104,176,244,147,51,123,197,96,231,167,170,145,212,154,145,35,
+    143,107,94,5,154,187,133,64,237,167,234,20,34,248,104,215,
+    74,178,115,136,144,78,188,86,53,197,121,217,149,18,145,84,
+    27,220,40,17,151,11,189,186,149,137,77,92,44,32,5,151,
+    70,65,152,236,249,129,120,70,40,196,190,251,84,254,235,119,
+    207,173,158,43,233,252,37,208,67,22,200,34,45,221,139,160,
+    143,200,247,170,30,58,214,82,242,174,4,62,132,147,128,97,
+    111,11,34,110,13,165,115,149,73,88,230,30,17,107,160,106,
+    78,166,94,105,234,109,128,44,112,222,98,100,86,183,234,151,
+    213,5,40,93,253,2,250,190,162,186,231,127,142,239,156,147,
+    105,153,45,79,147,253,29,168,116,76,19,220,245,179,10,51,
+    78,24,0,141,191,38,102,209,170,38,64,220,165,90,120,96,
+    117,84,109,114,75,71,125,116,125,28,210,232,34,110,150,42,
+    30,66,134,221,175,47,32,81,73,107,254,12,180,178,18,13,
+    2,50,230,85,187,146,73,154,31,162,85,32,10,5,31,211,
+    176,13,1,109,189,33,5,156,193,38,186,102,34,218,218,211,
+    76,107,207,234,229,187,227,171,227,75,207,85,218,186,74,92,
+    104,51,208,42,5,250,203,129,93,82,96,215,131,192,129,141,
+    192,129,123,174,114,224,148,132,199,83,75,151,54,253,33,224,
+    98,202,254,1,201,63,240,192,63,186,225,31,93,95,40,251,
+    79,74,120,60,185,116,17,173,59,22,214,47,150,251,142,149,
+    187,142,75,93,199,129,253,217,236,232,46,76,188,221,183,214,
+    87,226,194,91,182,16,50,42,67,155,118,215,138,227,129,125,
+    96,195,62,80,182,15,74,246,193,146,125,112,203,214,82,99,
+    122,45,45,240,5,116,87,176,234,4,86,199,27,164,157,164,
+    120,12,64,57,24,149,0,122,163,146,55,154,51,111,6,123,
+    222,58,253,230,233,226,46,217,201,190,189,226,10,150,92,93,
+    155,109,195,235,150,114,219,168,212,54,154,123,166,210,187,251,
+    63,186,148,79,47,95,169,184,218,145,133,239,3,14,254,129,
+    187,123,195,221,93,118,247,74,238,222,146,187,183,98,247,83,
+    103,88,101,123,167,100,239,44,217,59,43,161,110,41,180,59,
+    231,200,57,182,66,225,156,163,18,104,173,49,1,212,30,4,
+    154,40,84,252,68,161,18,234,135,212,3,187,55,67,3,197,
+    67,229,208,144,20,26,42,133,134,30,161,67,97,3,167,8,
+    144,117,40,67,71,239,61,95,30,122,66,26,122,34,127,177,
+    48,117,119,60,143,110,254,3,167,62,8,116,213,41,76,42,
+    193,72,147,15,109,238,61,113,191,191,188,247,148,180,247,84,
+    222,81,232,255,193,222,239,237,125,123,100,109,164,236,31,46,
+    249,135,63,8,247,253,206,90,147,143,221,140,59,88,99,172,
+    110,107,37,188,171,210,190,167,210,115,168,210,181,191,230,176,
+    162,153,26,2,39,227,10,213,92,234,45,99,149,77,215,162,
+    172,40,225,201,116,237,124,244,115,84,14,78,246,13,249,33,
+    2,100,241,232,104,181,34,221,150,188,41,34,219,70,247,27,
+    38,59,15,19,145,57,241,77,64,246,37,70,49,64,181,109,
+    27,151,241,212,103,118,168,238,45,153,63,170,237,219,249,117,
+    164,62,217,194,117,175,101,156,214,16,141,204,64,100,93,25,
+    113,57,215,244,53,78,80,213,206,134,55,196,132,22,245,245,
+    85,39,188,147,151,219,80,252,132,120,2,189,193,201,118,234,
+    20,55,161,6,151,110,167,76,182,61,32,238,78,137,139,5,
+    130,70,222,81,208,151,248,127,34,32,43,217,126,173,32,158,
+    170,67,181,25,167,50,67,34,31,68,219,50,106,140,75,132,
+    132,14,188,37,118,145,68,82,232,197,91,98,23,70,228,136,
+    68,132,216,161,232,33,168,136,239,152,34,227,160,222,91,143,
+    179,10,34,49,170,47,62,181,159,154,73,241,115,9,225,180,
+    56,198,34,227,130,138,24,104,86,232,199,44,91,59,110,102,
+    185,26,131,192,201,176,238,37,23,254,85,24,151,114,209,86,
+    50,30,21,166,167,100,60,106,38,59,107,170,49,127,27,32,
+    196,176,71,74,204,97,253,81,97,6,74,202,81,97,142,150,
+    140,71,133,25,44,41,71,133,57,84,50,30,21,102,119,73,
+    57,42,204,158,146,114,212,76,102,252,226,103,3,168,161,64,
+    137,241,211,163,102,221,197,30,174,49,141,224,33,130,143,180,
+    103,151,217,75,38,118,127,141,105,14,31,18,248,145,254,249,
+    4,247,77,150,237,170,49,205,97,169,7,226,224,197,71,250,
+    87,99,220,73,182,167,198,52,130,82,247,200,67,60,127,164,
+    61,94,96,191,196,226,117,115,72,210,199,139,143,244,175,110,
+    155,152,83,167,107,230,46,22,176,15,128,138,211,7,232,236,
+    104,209,177,118,166,228,223,43,57,247,145,87,149,99,143,147,
+    243,150,197,145,219,149,75,231,246,188,246,181,154,69,137,162,
+    3,167,58,216,253,21,95,203,202,252,202,171,53,51,94,15,
+    239,165,231,163,143,223,15,222,159,186,223,254,135,227,228,30,
+    210,169,89,58,176,94,140,224,241,118,182,175,112,100,237,196,
+    218,153,26,3,151,235,115,228,84,15,142,119,176,254,66,122,
+    109,30,119,23,135,203,123,123,238,159,144,14,159,35,215,245,
+    224,113,7,107,45,80,233,53,224,114,214,122,239,5,114,170,
+    7,237,189,172,181,184,235,221,168,52,112,20,102,67,214,122,
+    191,155,156,234,193,83,108,55,59,164,38,7,215,152,28,156,
+    234,193,105,150,221,85,52,191,235,144,34,184,104,129,221,117,
+    127,154,156,126,21,34,167,122,96,119,177,195,164,210,36,95,
+    127,205,140,55,135,62,71,206,164,150,224,92,99,140,160,155,
+    99,123,228,8,187,106,102,188,25,61,124,239,248,123,9,114,
+    77,34,113,216,188,70,224,29,193,220,53,130,135,8,62,210,
+    158,125,141,237,98,251,42,46,239,202,137,149,51,216,230,125,
+    149,193,61,244,124,148,244,129,190,45,139,19,219,190,15,91,
+    92,15,158,100,209,135,128,179,102,117,177,189,133,93,107,209,
+    181,3,152,219,222,122,16,97,186,250,80,183,109,187,194,98,
+    181,34,108,210,231,240,241,86,176,173,102,33,161,172,76,75,
+    88,142,96,103,172,158,154,67,139,187,29,36,88,242,255,3,
+    129,35,92,37,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/stats/gem5stats.py",
+    "m5.stats.gem5stats",
+    embedded_module_data,
+    17604,
+    42391);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,111 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,86,207,111,211,86,28,127,207,63,98,199,73,156,
+    134,164,20,65,87,188,117,37,77,153,40,211,198,180,193,212,
+    129,160,41,72,172,160,1,18,234,37,74,99,183,132,58,118,
+    121,126,129,54,106,165,8,113,232,129,67,111,219,180,85,170,
+    38,129,64,221,142,251,39,118,138,35,79,141,44,85,170,52,
+    245,176,155,17,59,161,29,246,158,243,203,9,133,217,207,95,
+    251,61,127,223,247,151,191,159,79,242,23,8,28,76,235,254,
+    250,34,17,223,3,21,168,80,7,115,205,59,156,131,228,206,
+    232,76,137,157,99,33,80,217,39,96,142,83,57,34,121,149,
+    159,11,169,33,242,36,44,2,85,248,5,206,137,42,188,5,
+    50,226,223,212,214,108,6,186,220,163,60,50,10,253,158,216,
+    128,39,98,91,7,235,96,13,220,135,109,149,109,6,28,114,
+    60,39,215,78,103,70,226,0,196,19,51,139,168,114,134,117,
+    197,92,233,220,153,130,137,52,151,243,101,98,161,184,114,89,
+    55,11,75,89,164,61,40,107,70,97,149,132,195,18,37,139,
+    250,81,222,28,181,80,97,114,121,21,223,51,141,201,210,185,
+    73,92,44,44,89,103,150,87,221,35,100,223,140,110,206,231,
+    245,206,70,36,145,29,31,145,203,26,35,162,10,26,92,178,
+    122,131,158,251,156,240,228,234,46,55,82,231,70,108,78,113,
+    56,165,214,30,175,105,140,5,24,8,63,212,206,123,5,182,
+    242,102,116,80,130,235,16,54,107,192,172,51,88,232,170,175,
+    1,44,6,114,39,73,238,116,170,130,216,53,176,206,26,203,
+    125,250,210,255,232,223,237,211,143,190,83,127,20,199,3,154,
+    112,59,16,73,208,194,115,146,201,78,39,199,222,25,241,167,
+    224,100,87,91,101,241,224,187,247,254,4,84,110,139,237,93,
+    123,12,215,152,251,145,246,108,59,16,109,247,192,225,128,77,
+    246,125,241,180,250,133,111,245,11,116,133,130,105,60,212,16,
+    174,68,31,33,211,88,84,240,234,178,166,164,43,169,180,178,
+    96,34,197,111,135,155,26,186,165,17,53,53,19,115,5,210,
+    93,101,92,212,81,140,22,136,39,194,149,138,86,209,176,112,
+    222,40,104,46,91,52,176,203,47,232,102,30,187,172,133,145,
+    203,35,179,108,168,174,156,55,86,111,155,157,78,114,195,183,
+    137,155,105,132,76,228,114,212,35,162,109,225,38,44,13,247,
+    245,42,231,202,189,49,52,29,211,47,225,178,120,217,178,56,
+    242,164,144,3,209,18,184,71,136,133,254,174,61,78,94,140,
+    147,203,250,3,52,187,246,100,173,119,236,183,251,248,64,72,
+    108,158,121,54,106,11,167,28,225,148,7,194,188,212,144,135,
+    55,216,13,118,47,156,220,156,125,54,109,135,39,156,240,132,
+    7,132,190,23,151,237,240,184,19,30,247,0,207,75,123,114,
+    114,115,102,55,53,81,79,77,188,152,178,83,231,157,212,121,
+    91,190,224,200,23,168,250,129,60,212,136,78,111,125,190,45,
+    219,39,38,157,19,147,181,232,116,115,188,98,153,184,244,15,
+    32,194,3,76,88,242,66,128,23,219,144,218,178,182,63,251,
+    113,229,231,21,155,27,119,184,241,90,123,32,218,19,139,255,
+    190,124,85,255,118,254,230,55,135,99,204,129,1,110,129,152,
+    13,118,30,230,186,179,222,190,183,148,32,66,84,166,167,187,
+    222,238,88,246,144,142,133,247,249,78,199,134,14,235,216,94,
+    22,179,226,65,164,169,220,91,246,72,14,75,126,124,136,161,
+    204,186,6,122,60,28,138,203,94,15,149,35,4,139,32,136,
+    196,32,14,187,248,234,207,239,29,120,75,5,246,198,58,30,
+    223,199,3,12,137,153,169,72,212,67,37,66,121,97,141,197,
+    195,93,43,75,254,215,64,9,124,178,187,166,242,116,207,115,
+    242,213,118,58,95,14,146,21,130,223,80,19,191,149,120,33,
+    111,164,177,210,194,48,193,173,156,86,176,217,4,49,197,77,
+    101,234,154,161,152,72,213,16,93,86,205,150,166,85,52,13,
+    235,19,5,223,211,148,69,31,45,202,66,27,46,74,169,108,
+    97,101,94,83,8,255,107,106,101,210,199,111,145,16,131,70,
+    209,170,76,17,59,186,134,40,216,37,10,187,177,5,197,215,
+    208,84,234,96,76,205,12,248,164,128,226,126,54,84,208,50,
+    163,163,84,248,24,79,22,122,0,158,165,94,92,249,18,198,
+    168,56,95,198,45,78,72,44,246,19,1,26,160,155,5,85,
+    43,20,75,121,221,21,174,180,30,18,216,204,17,206,209,22,
+    81,94,207,61,204,235,101,205,141,125,119,227,206,236,149,220,
+    213,75,215,179,185,59,55,221,100,39,181,92,39,116,68,235,
+    73,184,133,247,119,52,217,36,76,204,180,44,176,36,215,62,
+    98,137,44,32,179,212,100,32,11,165,201,202,20,185,44,6,
+    246,252,14,30,68,6,55,181,173,59,118,100,212,137,140,122,
+    0,242,51,112,79,30,170,29,155,254,237,227,23,229,151,167,
+    127,61,77,30,155,195,150,179,142,156,173,137,89,79,4,209,
+    248,211,47,119,35,233,122,36,109,71,50,78,36,227,1,150,
+    210,200,112,35,122,189,159,22,68,32,198,54,225,227,74,181,
+    210,136,15,108,60,160,52,33,109,220,122,122,119,55,150,174,
+    199,210,118,44,227,196,50,54,151,169,78,31,12,36,247,196,
+    248,211,248,15,188,45,142,56,226,200,174,120,182,46,158,253,
+    125,200,249,52,107,139,51,142,56,67,44,39,66,196,114,34,
+    84,189,70,204,68,19,155,95,217,145,225,109,222,150,198,170,
+    151,27,130,244,103,76,169,11,74,77,80,246,196,104,35,58,
+    213,136,38,26,209,193,87,2,23,38,225,16,225,249,66,2,
+    209,193,26,151,242,153,40,195,249,68,235,255,71,240,11,132,
+    70,233,106,24,209,134,38,191,5,171,22,146,233,42,219,81,
+    58,222,86,242,213,93,33,151,203,235,122,46,247,18,248,246,
+    252,178,191,17,191,46,153,106,89,215,166,208,105,191,249,73,
+    205,31,18,225,177,16,66,239,11,0,227,85,153,158,13,32,
+    85,253,115,31,28,171,245,14,79,100,225,135,164,164,109,17,
+    141,67,82,225,142,56,5,134,134,107,32,233,133,62,128,131,
+    30,232,136,139,144,143,48,132,207,91,162,42,208,211,143,235,
+    63,1,115,59,82,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/ticks.py",
+    "m5.ticks",
+    embedded_module_data,
+    1381,
+    2607);
+
+} // anonymous namespace
+} // namespace gem5
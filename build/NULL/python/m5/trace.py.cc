@@ -0,0 +1,36 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,123,204,128,4,152,160,244,103,37,32,49,157,33,133,
+    33,133,49,135,33,151,49,138,49,151,41,138,41,151,57,138,
+    57,151,37,138,37,151,53,138,149,145,33,133,41,152,65,147,
+    249,37,72,181,38,235,45,142,196,228,146,204,178,196,146,212,
+    91,236,41,153,197,137,73,57,169,183,216,82,243,32,116,102,
+    122,94,126,17,144,206,47,45,41,40,45,241,211,100,187,197,
+    25,159,107,170,87,82,148,152,156,90,196,12,212,95,196,2,
+    34,88,65,4,27,136,96,7,18,43,25,62,131,140,254,37,
+    86,92,148,172,95,80,89,146,145,159,167,159,107,170,15,214,
+    164,87,80,249,139,195,38,55,63,165,52,39,213,174,136,7,
+    168,140,17,136,139,67,129,196,7,102,70,70,198,15,22,108,
+    140,76,31,24,168,70,20,113,1,77,6,0,36,47,68,72,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/trace.py",
+    "m5.trace",
+    embedded_module_data,
+    192,
+    296);
+
+} // anonymous namespace
+} // namespace gem5
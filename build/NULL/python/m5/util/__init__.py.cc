@@ -0,0 +1,278 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,205,89,91,108,27,87,122,62,103,102,40,94,134,186,
+    95,109,73,214,200,183,88,78,150,114,19,123,237,248,174,141,
+    226,216,150,35,39,145,187,139,85,214,165,71,156,145,68,155,
+    23,229,204,208,182,8,170,81,178,10,76,26,220,134,70,19,
+    88,237,198,91,181,176,3,121,147,118,253,84,236,2,237,67,
+    209,151,246,141,12,8,132,24,64,128,129,190,52,111,92,184,
+    1,2,63,245,255,207,240,46,217,221,20,109,81,205,232,231,
+    57,115,254,249,207,127,206,249,206,127,57,243,111,164,230,207,
+    81,250,125,146,7,114,151,104,68,163,33,50,109,255,210,105,
+    202,127,133,105,1,126,133,144,24,150,166,37,74,52,81,147,
+    66,142,112,211,116,19,47,59,66,206,176,115,218,25,118,77,
+    187,194,238,105,55,127,214,20,242,132,61,211,30,40,59,87,
+    200,180,172,185,128,122,53,55,208,102,205,3,180,69,147,129,
+    182,106,84,111,158,21,52,239,10,157,110,19,200,27,68,107,
+    94,33,90,139,222,254,185,72,200,23,98,89,197,233,14,173,
+    21,184,59,181,54,160,93,90,59,208,110,173,3,104,143,214,
+    9,180,87,235,2,218,167,117,3,221,166,109,211,122,65,218,
+    118,173,15,106,253,26,157,34,35,219,191,65,33,147,35,212,
+    114,220,96,234,130,241,13,133,42,212,156,129,104,228,186,206,
+    204,17,209,114,169,166,201,180,96,192,180,154,195,177,144,25,
+    172,84,61,209,5,51,24,141,96,25,222,112,243,70,172,4,
+    104,195,20,58,113,10,67,124,10,205,154,54,141,38,72,130,
+    198,155,8,49,133,234,211,171,149,242,151,66,253,80,41,49,
+    197,26,190,74,89,19,63,7,169,95,208,42,159,70,96,104,
+    210,100,188,105,65,141,4,3,71,31,82,75,154,13,134,116,
+    38,65,235,67,201,114,44,176,96,196,180,68,99,209,176,154,
+    12,83,211,25,179,36,253,102,208,124,40,88,226,108,216,180,
+    36,149,205,25,6,42,162,40,79,119,24,44,48,186,176,104,
+    206,71,35,163,225,67,163,49,51,24,26,245,251,131,145,160,
+    233,247,251,22,22,65,26,118,194,122,128,251,85,28,168,15,
+    200,50,217,144,220,201,125,153,215,86,119,223,57,255,96,234,
+    254,116,86,58,144,147,14,228,165,3,80,216,144,156,43,103,
+    147,111,127,48,177,50,177,204,175,39,168,245,255,163,89,155,
+    85,77,53,116,148,201,240,148,79,25,107,70,210,1,164,52,
+    39,172,27,126,44,7,231,99,219,161,60,134,12,189,72,250,
+    158,57,148,241,255,129,161,112,21,197,201,184,227,134,202,34,
+    182,134,35,34,107,193,142,91,145,180,109,169,168,132,220,108,
+    0,138,231,80,145,93,149,5,122,33,243,202,106,215,157,163,
+    15,94,187,127,62,43,141,230,164,209,188,52,154,45,223,255,
+    87,67,9,70,102,163,155,135,194,129,25,141,153,155,71,211,
+    132,47,176,48,83,160,114,17,217,7,183,156,119,177,244,255,
+    100,18,200,45,114,139,214,43,156,34,245,203,159,36,73,10,
+    214,134,174,184,62,135,218,23,21,190,219,84,19,82,212,95,
+    225,75,161,213,16,227,151,199,245,64,148,169,102,148,41,230,
+    188,106,42,122,68,157,9,233,134,98,70,21,22,139,40,170,
+    50,23,188,174,71,148,217,88,36,128,54,66,137,70,66,139,
+    64,2,186,79,153,138,205,24,250,123,49,61,98,122,20,248,
+    11,168,161,144,161,168,76,87,180,160,17,80,153,166,107,190,
+    64,205,56,248,172,15,225,64,14,2,249,84,184,75,82,226,
+    213,74,163,1,102,50,37,250,43,117,129,164,132,4,9,194,
+    90,220,167,127,6,170,242,89,22,38,47,161,73,155,87,13,
+    63,40,55,34,177,46,62,143,215,110,224,54,7,211,0,74,
+    90,78,52,127,11,58,51,36,62,213,203,203,124,178,217,94,
+    32,241,109,168,227,69,84,254,120,40,10,101,227,164,175,196,
+    253,19,84,225,21,32,223,45,147,199,173,61,233,247,139,68,
+    112,143,20,118,236,76,190,145,190,88,232,236,205,28,92,237,
+    202,118,238,91,235,1,130,183,119,95,209,1,12,156,139,47,
+    217,153,17,129,225,42,49,4,37,148,247,148,59,229,75,126,
+    229,180,189,228,174,178,2,236,5,168,78,97,243,143,176,83,
+    232,245,91,23,105,146,147,7,63,120,119,229,221,162,32,58,
+    64,244,102,242,123,145,52,181,151,219,61,164,119,96,249,141,
+    149,139,5,185,99,121,210,134,77,13,98,137,80,134,77,79,
+    5,54,73,154,36,54,52,150,132,132,128,243,25,63,122,105,
+    62,104,40,90,5,3,184,193,96,241,231,117,37,102,232,76,
+    81,103,0,185,0,2,77,95,96,122,64,53,117,173,130,4,
+    95,29,72,113,178,59,177,183,171,124,109,161,63,88,95,179,
+    134,1,96,41,38,165,89,113,11,96,10,181,118,109,11,56,
+    11,160,179,208,248,214,18,77,112,0,79,110,130,24,87,227,
+    17,170,33,222,37,110,216,208,43,100,9,252,186,64,18,0,
+    169,122,225,191,4,227,121,79,92,162,41,137,117,36,168,38,
+    113,30,105,19,143,227,158,24,111,198,46,35,195,187,234,6,
+    181,155,176,46,48,0,66,74,168,145,228,70,73,41,169,246,
+    189,159,146,136,116,131,220,20,127,74,110,80,0,182,152,160,
+    91,154,236,166,201,186,57,21,202,131,65,24,221,5,213,170,
+    187,69,163,113,160,240,164,194,143,117,190,67,158,82,223,136,
+    96,121,252,254,112,84,139,133,116,191,223,242,250,253,239,197,
+    212,80,68,13,67,13,246,15,157,53,240,53,219,10,61,117,
+    29,15,169,225,25,77,61,25,63,95,93,229,234,254,168,64,
+    163,250,40,18,53,131,179,139,227,37,102,132,66,165,169,44,
+    107,30,36,27,184,57,151,201,154,122,63,244,104,42,183,247,
+    200,111,255,232,31,78,230,246,158,91,182,77,92,220,125,166,
+    108,82,226,173,10,199,96,165,243,184,75,121,139,233,179,128,
+    191,184,91,9,70,12,83,87,53,31,40,222,50,6,17,75,
+    112,38,102,234,175,51,22,101,35,14,203,141,104,244,227,200,
+    44,103,88,55,12,117,78,231,59,207,106,10,69,231,160,108,
+    201,76,95,8,169,1,61,12,86,202,64,116,160,69,176,77,
+    130,213,190,105,32,241,35,255,221,41,208,113,192,127,79,184,
+    253,40,74,174,230,49,90,24,56,151,29,56,151,113,23,182,
+    159,89,11,174,5,31,73,127,29,189,31,205,110,63,99,223,
+    25,103,161,115,71,145,208,246,11,180,208,213,159,29,154,88,
+    31,89,31,121,52,145,219,127,58,191,255,52,84,237,59,215,
+    53,145,121,227,187,239,54,58,135,97,251,131,204,90,90,216,
+    126,108,77,203,110,63,102,223,21,121,99,182,188,211,235,47,
+    2,177,239,92,215,105,148,82,116,226,107,223,65,193,69,154,
+    59,147,103,50,135,83,23,211,23,147,252,50,208,83,253,124,
+    239,126,242,235,254,49,151,248,79,78,10,116,107,219,189,143,
+    216,182,27,97,92,191,35,233,38,155,253,144,78,62,36,37,
+    43,205,118,35,225,86,241,135,56,87,91,88,103,223,31,56,
+    249,37,147,205,80,204,11,246,148,63,246,14,102,189,131,57,
+    239,80,222,59,148,245,14,109,105,176,57,236,192,50,227,43,
+    220,84,143,56,170,86,154,43,197,208,49,177,67,40,23,199,
+    123,69,57,93,134,138,187,162,70,124,240,185,90,106,248,114,
+    16,149,66,155,190,225,110,47,10,30,247,64,145,60,131,128,
+    65,247,116,164,251,56,211,183,125,196,211,154,52,83,253,233,
+    254,162,80,246,45,13,4,249,187,203,237,46,210,214,155,108,
+    225,195,98,24,176,66,212,113,168,50,138,163,168,8,142,242,
+    202,149,82,184,225,169,42,206,142,193,3,21,57,246,19,219,
+    251,20,155,58,29,189,69,242,44,178,159,120,187,179,82,151,
+    237,101,106,113,81,246,56,79,118,16,244,50,119,137,78,48,
+    157,154,22,192,211,80,180,245,211,98,146,220,164,211,18,218,
+    38,203,61,21,140,204,133,116,19,226,135,198,112,12,1,248,
+    36,129,224,106,136,111,18,96,236,62,135,110,190,168,56,55,
+    230,172,53,124,83,160,131,233,168,242,215,131,178,26,38,39,
+    40,0,83,64,96,38,72,53,10,170,151,4,230,211,114,251,
+    209,226,168,224,163,71,36,30,106,96,154,196,78,225,12,58,
+    140,24,224,206,114,249,253,232,198,193,150,74,150,24,8,25,
+    85,124,195,203,254,64,72,53,12,191,191,4,112,165,4,112,
+    244,242,241,142,202,240,125,101,17,75,164,28,2,0,90,228,
+    14,8,99,229,156,188,59,47,239,134,189,236,30,46,116,246,
+    124,114,34,235,85,30,247,237,187,231,248,11,231,103,206,124,
+    223,190,245,221,217,190,87,31,237,5,2,119,82,76,55,23,
+    90,59,210,75,89,215,128,141,111,7,170,103,155,122,246,3,
+    236,217,87,238,222,106,46,41,23,208,185,242,148,97,244,203,
+    93,129,29,157,176,19,101,130,235,96,28,177,181,42,95,69,
+    193,225,24,44,146,63,140,216,160,68,81,155,162,4,30,147,
+    156,161,60,238,174,105,170,46,195,90,109,20,83,3,131,122,
+    151,105,252,200,108,218,234,109,141,110,171,60,101,7,158,209,
+    131,180,85,15,255,181,60,208,161,14,136,75,207,26,65,13,
+    28,159,61,130,165,103,244,184,214,68,182,248,211,132,198,222,
+    241,8,2,243,188,248,175,192,89,46,232,17,173,20,170,107,
+    65,216,229,96,138,22,49,134,135,204,216,212,195,138,29,11,
+    40,134,174,178,192,188,178,160,154,243,62,69,249,137,174,132,
+    213,69,5,124,25,143,223,35,58,68,119,38,134,131,106,100,
+    49,28,133,56,62,56,171,220,208,33,174,143,40,134,201,98,
+    1,51,6,207,162,49,166,4,162,145,217,224,156,18,10,206,
+    48,21,186,225,188,161,224,53,93,81,185,160,183,120,138,13,
+    189,4,174,129,63,246,49,212,152,167,159,147,35,78,75,136,
+    66,160,142,10,88,142,160,161,206,24,118,142,36,93,141,6,
+    35,150,139,233,106,136,183,65,106,100,224,161,5,101,152,232,
+    213,132,43,150,91,213,180,75,209,183,128,137,97,62,244,17,
+    54,199,8,6,26,223,182,16,111,75,250,240,199,39,110,159,
+    88,237,202,201,59,242,50,58,68,199,232,131,87,238,31,89,
+    31,187,127,140,87,54,90,219,211,55,62,78,220,78,220,123,
+    237,179,179,107,111,127,54,177,222,149,107,245,229,91,125,73,
+    105,67,110,78,31,254,90,238,255,74,238,95,29,207,201,195,
+    121,121,120,121,252,219,38,226,112,173,156,189,117,241,195,139,
+    153,177,140,153,147,6,242,210,64,182,124,111,182,135,152,85,
+    114,132,255,11,249,190,8,255,95,227,173,69,89,5,249,245,
+    88,124,94,13,48,70,227,159,242,149,125,71,7,12,68,120,
+    122,0,75,135,43,165,68,103,121,117,78,15,31,82,0,134,
+    81,35,136,208,243,113,118,158,91,192,205,244,208,34,88,62,
+    72,27,57,239,108,52,20,138,222,192,7,21,88,29,245,240,
+    23,142,163,152,31,160,152,147,163,51,177,96,72,27,61,126,
+    110,106,236,228,40,62,246,189,27,93,48,95,210,244,153,216,
+    156,207,231,187,204,249,193,131,159,5,13,57,72,44,39,0,
+    31,13,159,141,40,143,126,83,15,196,76,76,102,185,115,180,
+    45,146,157,132,97,7,28,65,239,64,245,19,248,55,208,251,
+    87,17,116,234,246,169,123,47,127,118,248,175,78,253,229,169,
+    191,125,249,203,195,191,57,245,235,83,255,248,10,4,175,47,
+    158,207,191,120,62,215,63,145,239,159,200,201,23,242,242,133,
+    172,116,97,115,226,85,241,102,104,121,49,80,170,247,102,137,
+    6,111,150,16,192,47,137,118,192,196,208,230,98,134,59,167,
+    155,232,118,208,193,68,103,174,90,82,88,7,109,43,110,166,
+    236,91,74,91,66,134,112,40,180,248,38,176,68,53,158,200,
+    174,33,207,48,31,82,65,30,252,197,97,240,42,82,78,30,
+    204,203,131,171,102,86,246,173,93,7,130,183,228,123,142,246,
+    31,2,185,69,111,9,183,196,70,127,92,123,48,98,214,152,
+    210,89,161,126,100,70,187,233,172,125,47,69,231,32,83,250,
+    27,250,14,132,136,169,210,136,147,2,164,133,212,78,11,19,
+    100,188,193,123,115,143,92,231,65,80,32,207,137,94,38,118,
+    130,55,7,130,47,119,46,209,58,21,33,13,107,236,234,142,
+    144,238,154,42,197,73,148,207,18,184,74,193,119,192,162,209,
+    154,248,244,199,164,20,251,85,211,132,167,158,227,161,160,97,
+    6,162,225,133,147,241,29,124,170,47,178,55,213,133,218,164,
+    167,220,254,37,169,158,34,100,91,207,218,247,111,135,63,149,
+    87,199,96,230,219,14,65,192,222,118,200,190,215,103,75,197,
+    50,155,237,190,37,203,19,52,202,1,136,37,161,100,203,97,
+    198,22,66,246,17,5,180,187,0,16,23,217,148,254,30,87,
+    182,17,20,87,174,92,41,69,123,85,77,25,70,122,235,200,
+    242,51,82,14,76,229,238,204,252,131,174,7,177,181,230,156,
+    236,203,203,62,60,94,56,71,55,90,183,175,30,89,187,148,
+    109,61,182,62,14,196,190,31,157,41,21,93,199,30,151,149,
+    173,14,238,38,144,92,235,217,60,212,92,103,55,31,94,161,
+    237,193,19,145,39,127,7,100,2,124,86,35,152,234,109,141,
+    70,175,113,248,64,58,14,30,175,234,121,199,201,101,39,102,
+    252,179,244,199,228,46,165,36,237,194,132,121,19,207,110,192,
+    129,88,43,93,131,88,244,163,26,158,250,222,224,13,207,146,
+    128,82,19,2,230,207,37,217,114,122,79,233,76,207,62,52,
+    69,141,32,120,21,67,122,196,242,6,88,212,48,22,24,248,
+    211,0,158,169,59,130,224,94,13,139,6,45,122,149,135,219,
+    229,93,201,51,1,78,126,131,51,255,231,64,254,29,46,152,
+    122,167,39,121,232,131,248,74,60,243,246,135,239,47,191,95,
+    104,239,201,188,247,73,31,134,123,189,156,36,199,10,157,93,
+    153,221,201,243,246,85,20,203,13,197,38,210,209,107,243,10,
+    238,33,78,146,99,27,221,195,107,123,214,233,186,176,46,220,
+    31,201,117,191,148,239,126,9,152,155,135,56,201,208,66,111,
+    95,70,91,125,251,206,124,166,197,190,64,28,52,138,101,1,
+    91,31,141,242,5,203,84,22,44,65,216,88,130,27,149,205,
+    127,90,195,73,70,195,2,208,90,251,80,235,136,26,109,5,
+    115,37,40,95,46,250,145,112,28,234,17,41,81,90,234,4,
+    121,116,10,151,163,116,0,104,175,6,216,197,133,232,2,187,
+    140,111,254,9,18,63,95,35,134,105,184,37,241,53,169,61,
+    105,117,206,134,192,156,234,17,118,13,106,191,35,165,20,205,
+    94,143,130,167,21,67,214,222,66,107,215,199,139,183,23,87,
+    219,83,137,116,2,163,129,238,140,118,239,210,131,67,171,111,
+    230,228,253,121,121,63,236,16,119,111,97,219,96,242,245,204,
+    48,132,2,187,82,176,56,143,59,122,74,171,36,19,185,141,
+    139,217,138,108,158,229,74,32,140,142,231,121,246,181,97,150,
+    32,8,68,216,207,85,124,133,80,157,3,252,116,195,109,195,
+    5,48,26,181,33,147,43,172,94,211,241,33,139,64,245,159,
+    113,248,59,9,63,57,119,182,103,70,238,93,202,57,119,230,
+    157,59,49,60,218,86,104,237,203,186,250,10,222,238,228,177,
+    172,212,195,245,254,6,117,221,228,34,184,242,45,60,138,215,
+    96,95,198,225,217,146,240,188,157,13,123,45,250,51,144,178,
+    36,46,73,117,16,105,56,146,171,107,107,56,138,195,61,170,
+    9,215,56,164,88,87,109,210,215,40,133,214,104,149,16,235,
+    109,66,131,197,17,227,30,66,174,217,211,235,78,8,9,60,
+    184,147,238,9,252,224,78,72,191,139,79,236,242,243,251,75,
+    47,112,128,58,38,159,82,229,155,11,164,20,241,198,133,151,
+    20,176,18,110,61,18,131,192,4,82,111,134,209,34,255,56,
+    0,177,11,71,43,132,186,154,30,49,209,214,71,116,54,139,
+    205,120,206,87,242,66,21,39,239,230,159,186,248,42,94,135,
+    250,191,34,203,61,98,187,248,150,76,79,234,248,242,248,70,
+    231,192,234,31,231,58,119,229,59,119,21,137,219,209,199,73,
+    202,153,164,201,131,27,114,75,210,76,189,154,126,245,83,99,
+    245,224,157,197,79,22,115,178,178,246,242,87,242,158,172,188,
+    103,195,219,158,217,157,154,72,79,36,39,32,223,92,237,185,
+    115,60,57,254,88,246,254,194,200,28,74,197,211,241,213,177,
+    212,159,126,37,15,102,229,193,130,183,45,99,102,38,240,202,
+    121,135,146,227,192,6,79,198,83,23,146,227,53,50,146,19,
+    197,206,114,231,91,159,23,112,236,156,36,223,55,62,222,20,
+    26,208,248,235,175,205,235,129,107,152,167,96,92,105,4,195,
+    177,16,63,197,198,152,51,22,81,96,194,96,210,3,38,164,
+    69,248,209,2,158,227,7,141,25,213,132,28,72,143,92,15,
+    178,104,4,207,5,71,68,59,100,132,228,221,48,181,96,196,
+    239,135,69,193,180,127,177,49,114,108,14,26,231,170,50,25,
+    226,241,107,92,136,62,190,16,144,43,120,91,211,39,190,150,
+    135,190,146,135,236,4,34,43,13,219,126,157,178,40,254,12,
+    240,120,213,2,67,85,234,146,159,166,71,163,33,131,159,72,
+    89,132,225,178,51,52,148,12,67,29,230,226,176,68,130,199,
+    248,252,19,29,255,254,197,63,26,217,71,89,120,150,99,73,
+    230,226,130,110,39,240,152,22,241,200,150,71,12,220,249,219,
+    206,8,65,206,77,0,71,16,215,190,97,128,79,93,199,237,
+    76,241,36,123,159,163,26,198,246,59,160,224,53,40,45,190,
+    69,9,245,44,187,241,42,16,119,185,224,89,230,87,129,244,
+    103,235,239,199,164,59,91,127,23,5,137,10,69,242,125,136,
+    135,208,225,44,81,106,239,162,87,160,96,107,43,164,173,161,
+    74,233,1,176,101,101,226,173,175,186,100,218,89,36,21,50,
+    64,6,148,117,169,72,250,104,119,35,249,97,19,29,44,146,
+    205,36,35,253,30,127,254,163,250,180,195,139,165,10,217,225,
+    164,111,210,34,169,161,125,148,142,98,247,37,210,38,209,115,
+    20,135,87,161,45,78,58,132,188,37,210,213,68,123,81,116,
+    137,116,137,88,170,16,175,76,251,80,251,90,50,32,210,157,
+    216,218,72,248,210,254,39,187,25,42,169,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/util/__init__.py",
+    "m5.util",
+    embedded_module_data,
+    4059,
+    8458);
+
+} // anonymous namespace
+} // namespace gem5
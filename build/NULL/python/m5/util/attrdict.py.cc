@@ -0,0 +1,142 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,205,23,93,111,219,214,245,94,126,153,250,50,61,200,
+    118,99,47,109,24,203,117,44,204,137,187,216,73,214,45,11,
+    230,180,153,141,192,201,75,80,20,49,48,208,156,200,36,202,
+    244,225,93,82,113,44,120,168,188,9,152,92,24,171,2,164,
+    104,30,133,162,200,106,228,101,251,7,237,211,94,37,67,88,
+    4,2,6,10,12,125,200,155,130,228,193,232,211,238,33,69,
+    138,180,84,55,69,59,96,164,120,120,238,57,231,222,123,238,
+    249,164,254,131,124,23,223,121,191,120,196,32,244,9,186,141,
+    52,244,41,94,65,12,90,68,26,46,35,141,209,241,99,22,
+    161,39,172,59,97,133,177,121,44,229,113,58,115,136,199,218,
+    60,158,242,132,30,30,167,243,218,192,31,24,192,171,152,12,
+    51,136,74,80,252,137,167,202,138,160,137,186,160,12,184,99,
+    45,164,11,90,248,34,197,168,44,229,104,145,49,79,86,23,
+    238,122,114,143,233,154,79,24,119,132,93,233,112,64,58,116,
+    148,52,125,194,186,240,24,83,14,246,228,2,35,119,213,126,
+    212,224,41,48,2,77,127,77,225,106,232,199,95,27,104,26,
+    215,71,146,237,177,101,148,158,90,112,199,93,76,241,48,91,
+    194,179,162,226,89,232,219,181,9,88,253,59,248,62,139,247,
+    151,12,125,183,164,22,187,97,63,201,193,36,107,137,170,105,
+    18,45,157,50,173,88,182,144,49,211,222,48,156,95,51,211,
+    249,28,224,41,228,187,92,39,191,184,76,193,95,105,112,235,
+    104,5,107,52,128,53,188,194,86,208,45,172,49,101,113,133,
+    179,49,150,98,188,141,113,20,19,32,132,87,6,52,129,66,
+    177,130,238,227,149,16,85,98,128,192,138,197,75,239,19,117,
+    77,134,221,102,100,35,47,111,228,11,114,74,205,201,5,67,
+    151,65,165,244,239,11,38,197,82,41,221,48,100,51,47,223,
+    214,205,89,67,55,101,61,163,103,245,156,105,164,24,159,138,
+    108,231,121,113,159,130,143,241,39,104,19,111,162,123,136,140,
+    108,162,26,234,119,109,226,160,141,110,32,147,237,114,131,49,
+    80,243,239,116,196,10,187,248,58,53,111,68,81,168,170,105,
+    83,207,42,138,197,27,133,53,157,88,67,54,205,59,149,162,
+    236,178,22,103,232,153,91,22,7,68,43,164,40,169,140,106,
+    24,138,98,128,22,178,92,250,230,13,131,164,102,215,54,204,
+    59,249,220,108,246,220,108,193,76,103,102,93,79,157,89,219,
+    232,108,3,20,69,41,14,123,28,31,245,36,93,201,248,5,
+    5,7,37,212,138,72,213,249,202,197,202,197,86,252,181,167,
+    241,196,94,60,81,123,183,17,79,54,227,201,122,52,185,47,
+    13,111,175,239,172,63,149,78,237,73,167,62,231,26,210,233,
+    166,116,186,46,158,126,1,199,74,249,204,130,56,215,204,95,
+    120,102,54,177,207,36,135,2,239,30,50,70,54,113,205,39,
+    209,189,180,67,230,35,19,38,223,229,30,114,128,95,7,159,
+    3,54,153,96,17,186,65,53,168,113,175,42,187,203,92,183,
+    176,146,228,45,86,75,19,43,108,152,42,49,141,245,180,121,
+    135,64,30,129,129,13,215,148,157,129,227,212,36,71,162,160,
+    112,12,164,248,123,106,166,160,147,65,176,53,103,187,78,46,
+    17,9,216,175,81,16,112,140,183,218,20,8,191,231,57,230,
+    227,185,170,249,224,237,135,111,215,35,199,233,175,198,253,93,
+    250,84,250,7,219,144,231,155,242,60,37,236,199,143,61,184,
+    240,240,194,211,248,212,94,124,170,102,126,254,94,35,62,215,
+    140,207,213,163,115,45,41,254,84,58,177,39,157,168,113,53,
+    189,33,205,52,165,153,186,56,67,126,2,94,251,191,75,14,
+    2,5,205,73,15,77,207,56,150,244,12,77,41,142,105,72,
+    4,108,211,201,1,199,142,199,15,219,209,19,254,25,250,190,
+    1,62,177,39,77,212,230,27,210,116,83,154,174,139,211,142,
+    169,252,225,233,153,74,70,208,197,143,10,110,247,72,216,226,
+    64,177,36,182,163,194,0,190,108,107,110,69,237,100,164,113,
+    5,25,95,28,9,230,104,135,252,22,204,129,232,41,161,125,
+    41,94,125,119,187,184,83,172,139,99,71,56,241,45,91,179,
+    87,117,29,173,253,62,77,133,194,154,70,183,77,50,182,174,
+    180,58,129,18,6,99,155,219,211,217,232,175,115,151,60,7,
+    58,143,219,58,183,196,232,71,145,15,35,213,43,13,113,188,
+    41,142,215,221,159,173,127,50,108,137,138,146,83,179,116,142,
+    21,86,148,108,94,43,100,0,167,155,252,177,160,102,58,156,
+    1,234,210,124,138,250,126,8,117,210,198,246,57,57,1,32,
+    1,74,197,58,229,49,165,103,50,180,118,98,39,221,224,140,
+    191,113,98,132,113,193,27,192,248,155,19,18,238,221,226,150,
+    234,220,82,155,99,249,51,109,212,7,132,89,254,52,96,61,
+    128,50,146,128,245,128,48,230,199,219,200,3,2,230,127,10,
+    216,183,3,219,28,182,130,253,27,235,4,58,186,177,210,198,
+    201,211,198,201,18,136,128,226,239,236,198,233,186,6,122,167,
+    121,71,53,229,156,110,152,186,214,211,59,117,67,86,11,102,
+    62,171,154,233,148,154,201,108,200,41,162,83,55,134,105,165,
+    114,167,192,50,180,241,171,36,173,27,103,2,81,39,184,81,
+    247,111,228,148,142,80,32,39,14,149,130,190,133,190,183,20,
+    36,144,233,43,210,147,136,252,18,83,169,254,69,190,167,77,
+    224,63,35,51,212,229,7,53,248,19,99,70,124,59,59,101,
+    63,240,245,76,119,98,82,204,77,170,197,58,186,207,222,68,
+    235,152,196,41,57,41,216,181,200,14,65,107,112,193,53,225,
+    21,66,242,132,140,2,7,86,176,6,58,53,60,208,2,176,
+    214,175,252,195,74,197,177,192,7,150,191,57,255,10,102,220,
+    67,118,160,182,25,49,52,114,168,204,55,226,51,205,248,76,
+    61,58,115,176,47,189,222,70,66,104,164,11,104,221,255,232,
+    131,15,63,120,100,52,164,68,83,74,208,8,139,141,182,134,
+    70,190,30,122,253,129,244,80,170,44,236,71,105,33,121,52,
+    89,195,141,232,68,51,58,81,143,78,180,226,195,149,37,184,
+    219,49,58,255,224,224,192,0,245,254,34,79,162,207,22,240,
+    194,52,251,229,41,128,187,2,153,4,213,223,4,0,77,138,
+    156,114,79,66,166,1,36,81,48,237,88,23,92,0,198,101,
+    20,72,187,54,131,249,227,16,253,199,219,66,136,167,154,191,
+    26,112,82,5,22,253,129,169,2,238,40,94,190,150,215,210,
+    183,54,122,147,69,149,179,105,195,72,231,110,251,242,229,110,
+    193,48,101,162,155,5,146,51,228,213,213,235,249,156,190,186,
+    26,204,7,239,3,232,46,250,31,230,3,135,209,77,187,110,
+    123,49,234,52,207,110,140,146,25,0,189,205,210,142,186,209,
+    238,119,188,63,228,174,250,156,212,102,216,208,177,163,67,14,
+    135,142,117,1,237,170,213,249,234,124,155,165,56,132,79,212,
+    13,159,240,89,246,159,248,44,75,102,251,197,7,231,130,69,
+    96,92,66,135,202,242,114,157,91,110,115,28,79,183,120,53,
+    224,196,6,44,8,141,37,171,166,115,138,242,12,246,123,198,
+    216,137,88,180,240,198,51,176,209,245,100,4,218,138,10,237,
+    130,64,79,112,58,4,235,41,53,105,203,223,39,231,225,205,
+    175,145,116,206,36,231,128,49,66,193,46,114,54,130,51,124,
+    35,94,116,218,214,37,2,127,160,97,51,227,95,20,82,75,
+    96,220,62,143,34,231,235,225,115,244,87,26,104,11,163,152,
+    86,251,94,80,49,159,195,235,101,151,122,54,134,105,176,247,
+    130,234,210,115,120,189,236,82,229,1,76,143,222,11,170,199,
+    158,195,235,101,151,58,140,184,104,165,184,199,142,53,216,177,
+    150,56,84,17,183,195,59,225,210,66,43,28,41,45,148,223,
+    105,197,6,75,11,165,212,214,111,91,92,168,116,165,114,178,
+    242,206,206,84,245,228,195,68,131,27,109,114,163,117,110,244,
+    104,122,130,222,234,246,212,206,212,214,181,242,181,210,181,142,
+    240,214,82,121,169,180,244,21,12,182,22,203,139,165,197,175,
+    196,16,21,20,90,244,197,126,175,137,14,125,182,193,141,55,
+    185,241,58,55,222,18,71,42,177,109,105,71,162,7,24,148,
+    224,0,229,43,229,197,86,52,230,160,129,101,58,131,157,196,
+    214,213,242,213,210,85,111,184,243,230,214,114,121,185,180,220,
+    67,128,187,253,115,68,55,98,157,239,172,255,2,238,27,178,
+    4,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/util/attrdict.py",
+    "m5.util.attrdict",
+    embedded_module_data,
+    1873,
+    4552);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,428 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,189,59,109,108,19,103,154,51,158,25,123,252,145,216,
+    137,29,146,0,129,105,190,136,3,117,8,33,133,66,8,133,
+    124,176,180,37,237,18,218,109,3,212,24,207,36,24,18,219,
+    157,153,240,145,58,218,236,30,171,77,80,180,24,4,194,221,
+    45,183,238,30,219,166,183,221,219,232,110,87,199,159,147,88,
+    118,239,164,147,238,135,29,249,132,207,18,18,171,83,165,219,
+    95,103,84,42,33,126,221,243,188,227,175,113,156,150,222,173,
+    46,30,158,153,121,223,231,125,223,231,121,223,231,125,190,222,
+    225,63,169,146,63,115,238,254,229,81,154,162,110,81,34,53,
+    70,137,180,104,152,164,199,104,114,55,140,25,200,157,25,99,
+    200,157,29,99,225,206,76,114,83,198,49,227,148,105,204,52,
+    197,143,241,83,230,49,243,148,101,204,66,83,34,59,102,21,
+    185,49,155,104,28,171,18,77,99,213,6,74,98,207,218,243,
+    131,137,60,188,57,242,111,159,24,40,234,87,134,252,219,88,
+    141,129,58,68,137,230,203,148,104,145,106,63,97,160,142,41,
+    212,57,69,171,228,18,109,18,47,89,164,58,248,185,198,153,
+    198,2,11,197,167,113,86,172,186,204,142,173,35,216,213,223,
+    132,45,218,68,195,184,81,180,67,139,250,92,255,230,111,106,
+    163,27,203,1,45,27,8,213,53,64,117,109,25,63,141,162,
+    97,148,114,59,125,255,10,69,150,163,190,160,24,154,18,124,
+    126,191,164,40,130,26,18,212,51,146,160,72,126,53,16,10,
+    42,66,104,92,240,9,254,51,146,255,92,56,20,8,170,194,
+    120,96,82,18,58,166,122,61,254,176,234,246,8,19,210,84,
+    175,112,65,14,168,146,98,241,5,133,64,80,148,46,98,27,
+    93,31,65,233,162,138,29,7,212,124,75,79,64,188,232,222,
+    38,76,6,20,53,16,156,32,216,161,241,113,69,82,5,32,
+    198,50,41,5,39,212,51,216,141,228,243,159,201,247,3,157,
+    19,68,164,96,155,160,132,128,174,124,141,31,134,62,45,9,
+    178,228,19,133,11,1,245,76,104,90,181,132,125,178,146,239,
+    251,194,153,208,164,214,208,35,28,131,119,141,204,128,34,156,
+    158,14,76,2,81,48,40,97,66,149,130,219,132,192,184,16,
+    14,41,74,224,244,164,228,22,66,65,203,120,64,86,212,252,
+    244,140,135,228,146,217,80,242,163,1,30,208,132,221,200,146,
+    214,231,133,51,82,16,25,14,134,132,201,80,112,66,146,45,
+    83,62,21,90,42,37,60,72,158,9,143,224,27,87,37,25,
+    154,10,211,225,9,217,39,74,30,139,229,48,33,15,113,20,
+    65,81,125,178,74,134,1,126,79,157,194,249,126,17,38,240,
+    69,141,133,29,66,159,18,152,145,250,133,190,41,53,48,37,
+    245,159,58,5,115,138,164,96,3,11,89,4,168,38,132,77,
+    133,196,192,120,192,239,35,19,134,200,66,7,76,104,80,113,
+    227,60,107,171,178,13,216,155,156,12,93,144,68,225,244,37,
+    100,201,114,234,84,159,182,46,48,130,182,42,240,144,155,245,
+    252,96,66,24,232,207,175,196,25,88,2,120,45,89,42,143,
+    112,160,80,59,229,187,36,248,194,97,201,39,3,57,178,4,
+    56,192,119,40,232,151,246,148,11,140,162,2,17,129,160,165,
+    184,198,62,192,207,173,81,190,251,169,128,40,78,162,228,192,
+    68,123,44,127,70,209,30,113,115,25,118,48,224,87,51,252,
+    97,152,87,159,26,146,51,236,235,32,102,25,254,141,48,246,
+    227,155,204,112,199,166,195,147,210,140,81,99,122,134,69,97,
+    156,169,214,207,236,159,113,179,40,13,0,222,59,113,188,227,
+    248,123,39,78,158,8,158,236,116,159,56,121,92,56,161,158,
+    144,79,118,182,250,75,85,21,157,87,85,213,20,170,42,137,
+    2,21,69,161,122,130,109,102,200,184,6,10,18,67,150,118,
+    72,150,67,242,136,155,201,240,94,111,208,55,37,121,189,25,
+    139,215,11,11,52,61,137,207,54,175,247,253,105,223,164,86,
+    243,25,245,37,118,252,172,93,145,253,93,225,75,32,109,193,
+    174,169,222,174,105,53,48,217,85,20,68,47,33,218,19,190,
+    36,91,0,153,128,125,200,0,170,183,185,194,47,205,242,115,
+    131,178,61,143,145,97,195,62,245,76,198,40,75,234,180,28,
+    244,211,37,252,152,224,31,170,184,47,45,6,228,71,45,169,
+    139,128,18,214,171,147,94,106,150,86,153,34,198,217,66,77,
+    132,142,151,148,23,255,62,129,127,191,42,190,65,239,191,42,
+    140,112,150,205,63,205,26,34,6,165,122,130,242,27,68,242,
+    211,143,74,83,163,148,106,45,25,149,251,118,163,138,140,106,
+    41,105,109,204,63,125,206,234,21,60,112,199,136,220,101,74,
+    173,46,98,199,249,74,253,71,24,61,39,131,101,35,206,178,
+    149,249,8,90,91,168,110,74,97,47,24,46,50,239,82,23,
+    104,154,122,23,74,193,96,125,59,108,227,101,42,194,138,38,
+    209,240,35,67,209,20,148,211,16,49,76,208,51,72,11,39,
+    242,192,147,179,132,122,54,194,233,199,42,111,11,178,108,158,
+    241,141,162,178,93,109,18,80,49,6,64,33,230,247,176,71,
+    56,74,196,74,41,81,238,160,240,137,14,177,8,240,135,58,
+    9,69,188,92,205,123,50,6,249,244,136,140,84,184,233,140,
+    81,211,187,58,225,196,165,66,194,191,92,162,80,56,39,64,
+    36,79,190,49,75,195,178,87,90,149,242,9,160,227,116,37,
+    44,177,76,12,227,134,74,88,250,190,158,71,204,198,13,215,
+    12,139,111,194,212,209,127,198,190,221,108,134,35,42,61,195,
+    77,200,161,233,112,198,40,74,254,144,40,97,169,28,8,131,
+    178,48,120,182,103,56,98,43,20,36,65,16,100,244,74,158,
+    89,250,208,88,250,67,83,225,254,153,205,104,98,196,220,158,
+    239,155,12,249,125,147,74,191,167,136,112,24,26,40,223,163,
+    112,235,103,41,166,190,186,8,30,185,26,179,12,85,91,127,
+    107,195,245,13,215,154,110,52,197,185,79,173,191,176,46,29,
+    248,184,250,78,245,3,161,119,69,232,77,10,187,82,194,174,
+    7,194,190,21,97,95,82,216,159,18,246,39,28,175,100,25,
+    93,47,68,133,232,150,132,205,47,73,67,113,73,76,39,128,
+    254,89,26,118,49,13,83,192,143,82,50,238,32,2,220,140,
+    188,17,110,25,163,38,23,25,218,171,48,132,87,141,89,121,
+    19,128,111,228,242,8,114,185,145,112,153,176,110,215,174,107,
+    151,162,231,99,239,207,15,23,10,52,109,87,95,78,47,151,
+    167,183,179,72,175,3,233,205,211,60,203,68,232,8,252,155,
+    177,224,158,25,103,128,131,26,29,7,44,225,64,22,144,13,
+    22,229,56,195,72,65,81,97,53,54,190,13,31,35,200,199,
+    222,252,106,217,140,69,240,39,219,230,133,145,249,183,163,199,
+    98,3,176,106,22,71,212,25,61,127,109,99,76,77,240,173,
+    176,34,165,152,132,77,183,37,195,134,194,82,48,99,8,41,
+    25,110,28,196,76,205,24,113,115,6,67,25,147,162,122,209,
+    21,200,176,83,83,190,112,198,122,96,96,96,104,116,212,123,
+    116,232,192,96,198,228,253,14,220,134,142,102,248,113,32,18,
+    92,57,57,195,204,128,44,26,229,26,228,142,30,207,176,90,
+    83,209,167,250,50,38,205,196,43,25,22,249,85,140,57,134,
+    115,44,103,172,37,220,202,59,161,228,0,178,119,135,70,246,
+    190,50,82,150,234,121,49,58,152,52,55,166,204,141,89,138,
+    231,170,99,223,125,104,175,89,188,24,163,127,206,255,148,255,
+    208,242,145,37,105,111,73,225,181,117,158,77,219,157,89,138,
+    54,175,75,59,235,178,38,192,37,13,138,224,49,130,39,250,
+    178,175,120,170,186,118,241,221,232,251,183,46,94,191,120,109,
+    230,198,76,188,251,215,199,82,47,238,75,84,245,39,171,250,
+    83,85,253,89,138,53,87,223,107,205,26,242,194,252,69,83,
+    235,131,166,23,87,154,94,92,18,147,77,61,169,166,158,44,
+    7,165,143,177,234,9,130,249,67,89,6,154,144,118,4,60,
+    70,240,132,210,149,85,2,79,159,62,173,88,103,254,70,38,
+    42,1,210,91,133,186,90,202,214,13,114,30,63,180,116,96,
+    233,224,210,193,59,175,193,75,210,186,61,101,221,190,60,184,
+    252,82,210,250,242,220,32,240,154,19,147,47,90,218,227,23,
+    150,217,100,75,111,170,165,23,248,180,25,31,99,241,147,156,
+    28,113,70,34,135,215,186,6,120,230,247,85,61,0,239,83,
+    109,7,187,185,251,109,54,124,238,102,15,246,154,239,247,50,
+    248,188,155,198,231,151,241,249,15,60,59,96,51,253,193,78,
+    3,4,53,22,246,5,21,127,169,242,68,27,77,124,137,191,
+    167,203,125,137,179,133,231,72,153,250,5,173,65,253,140,82,
+    217,34,238,207,192,239,208,181,45,40,95,189,194,5,60,195,
+    109,110,150,81,205,69,220,8,35,50,171,124,22,54,194,198,
+    57,170,194,159,106,211,141,202,150,90,126,124,143,24,206,242,
+    101,239,230,146,119,238,54,175,231,133,6,163,51,72,157,108,
+    61,193,160,221,157,53,206,154,214,26,57,194,145,254,140,4,
+    154,72,95,198,242,190,22,219,204,96,235,241,247,188,158,129,
+    110,214,10,62,15,104,55,221,252,162,87,80,222,163,104,4,
+    195,101,154,217,254,61,12,240,136,33,47,4,120,171,61,128,
+    98,148,231,121,70,123,192,173,86,167,194,25,250,194,51,90,
+    120,70,91,70,220,86,185,157,66,93,73,212,146,237,240,200,
+    224,208,59,222,209,183,134,135,15,191,147,49,78,72,106,56,
+    32,202,109,136,192,145,104,50,99,244,30,57,112,232,240,0,
+    184,200,111,15,29,29,61,252,198,136,236,198,90,43,232,49,
+    18,234,120,131,74,198,36,75,225,73,159,95,114,243,68,83,
+    201,189,136,97,0,95,159,129,161,229,46,42,175,159,141,154,
+    219,33,183,192,139,130,75,39,8,58,149,69,70,204,169,172,
+    97,40,57,134,120,93,68,101,125,97,182,46,214,71,93,11,
+    77,139,77,115,7,211,85,53,9,75,207,205,62,0,112,253,
+    178,249,142,251,227,173,119,182,106,111,112,205,13,60,52,87,
+    205,251,163,61,11,155,22,55,225,118,234,137,117,167,121,243,
+    85,211,21,211,205,151,18,142,97,184,110,127,71,187,199,229,
+    59,51,218,211,242,193,223,142,104,79,112,37,249,67,41,254,
+    80,130,63,148,110,117,163,230,235,33,32,105,19,230,135,163,
+    195,177,193,180,173,234,234,161,43,135,162,231,19,174,110,184,
+    226,70,237,190,228,210,238,112,37,109,59,82,182,29,9,114,
+    101,25,236,128,3,50,8,45,4,60,70,240,132,210,149,85,
+    2,68,219,172,46,6,237,202,153,46,191,58,175,68,7,111,
+    247,37,93,91,146,108,71,138,237,72,228,47,5,77,234,239,
+    185,3,77,7,187,152,251,93,236,193,30,211,253,151,104,128,
+    58,211,139,243,79,212,193,39,36,180,48,151,5,23,106,137,
+    234,32,34,169,19,127,12,53,192,131,251,11,249,102,39,88,
+    84,52,179,204,44,59,203,149,170,139,146,80,162,92,45,25,
+    35,134,82,245,112,142,140,162,124,71,181,23,203,202,195,0,
+    213,177,10,127,187,14,159,213,227,71,140,69,117,146,195,111,
+    208,225,115,171,240,45,122,124,185,218,140,153,50,186,60,80,
+    131,13,13,1,233,4,5,10,8,21,146,111,150,143,240,241,
+    146,16,170,248,7,97,135,222,27,174,56,155,34,35,178,250,
+    17,136,138,51,207,90,102,173,17,83,220,86,169,141,142,19,
+    115,217,76,149,214,89,202,184,180,142,51,171,84,225,233,136,
+    201,111,168,204,233,40,181,70,152,68,99,141,186,190,132,162,
+    141,197,231,113,67,43,37,179,136,139,120,23,40,173,173,155,
+    155,153,58,138,185,165,175,215,128,197,144,103,36,20,148,48,
+    143,4,248,178,132,121,166,96,136,196,60,164,237,54,1,67,
+    37,204,89,8,98,72,194,58,85,32,254,126,49,101,50,34,
+    239,1,98,228,151,17,224,126,113,219,137,110,148,251,0,100,
+    120,76,115,97,226,5,141,237,100,64,37,122,85,70,195,45,
+    239,199,122,6,232,145,95,193,87,212,152,50,250,95,16,227,
+    147,240,2,194,169,48,56,136,98,198,244,198,40,73,66,100,
+    44,111,251,38,167,37,242,236,182,105,90,20,245,38,70,32,
+    19,1,127,198,116,30,60,61,8,202,228,237,90,33,106,94,
+    121,128,202,235,90,22,201,32,58,86,30,66,64,20,44,46,
+    187,80,242,167,41,89,11,82,157,211,177,163,80,224,69,212,
+    79,137,142,205,26,107,56,215,195,170,154,104,235,237,141,201,
+    218,182,100,85,123,170,170,61,75,85,155,27,151,94,72,119,
+    110,253,77,231,223,118,126,182,237,243,109,15,58,251,86,58,
+    251,146,157,253,169,206,254,164,109,203,252,80,116,87,108,48,
+    222,246,176,198,121,163,62,230,194,104,102,254,224,35,71,221,
+    237,117,215,237,81,251,67,231,186,232,133,107,125,55,250,126,
+    185,123,197,185,53,225,220,138,5,234,181,151,111,188,28,55,
+    220,177,172,56,59,19,206,78,44,154,190,182,231,198,158,120,
+    237,157,77,43,206,174,132,179,235,81,253,134,172,179,26,93,
+    211,60,120,140,224,9,165,43,211,128,139,170,171,159,31,74,
+    55,192,171,161,106,63,1,81,54,189,101,235,167,31,252,226,
+    131,229,157,201,45,187,83,91,118,63,216,210,191,178,165,255,
+    174,114,239,64,114,203,112,106,203,112,210,209,26,53,198,140,
+    113,54,237,168,187,101,187,110,187,237,143,183,127,120,238,163,
+    115,191,238,89,58,255,217,222,207,247,222,101,19,77,251,146,
+    142,254,148,163,63,65,174,180,179,33,219,180,122,240,181,169,
+    210,3,162,199,191,22,225,171,77,84,149,235,230,88,194,42,
+    128,173,225,92,69,0,206,247,188,58,175,130,21,225,92,208,
+    141,114,16,22,236,135,245,131,123,169,15,15,186,6,61,204,
+    253,23,173,240,124,127,207,129,45,240,242,199,23,108,240,242,
+    71,15,59,184,195,244,199,29,12,62,247,210,248,252,18,121,
+    222,91,51,228,96,254,217,78,3,212,101,205,242,106,235,203,
+    247,104,125,214,108,140,17,55,136,140,196,138,172,196,141,179,
+    34,119,153,27,3,127,71,50,73,188,100,150,44,240,99,191,
+    41,5,46,154,68,30,90,154,47,99,210,127,163,104,129,187,
+    77,180,94,166,198,170,68,27,192,106,17,251,98,75,82,230,
+    6,146,158,183,139,213,48,106,121,29,75,18,241,14,209,65,
+    234,144,162,26,120,175,33,239,181,146,69,116,194,63,147,84,
+    59,206,139,46,40,119,230,240,88,192,171,131,119,87,238,189,
+    14,104,103,161,212,176,70,202,126,29,57,30,208,112,235,203,
+    49,161,190,30,83,250,160,216,155,8,78,3,252,107,132,25,
+    97,75,121,214,191,3,61,235,97,230,26,69,136,189,221,155,
+    50,246,178,44,228,204,127,19,157,132,138,77,121,142,156,63,
+    248,79,161,233,137,51,36,201,163,197,178,22,210,222,227,17,
+    48,129,241,226,105,136,108,207,237,217,163,21,226,159,63,172,
+    10,251,132,178,65,59,154,167,122,67,211,106,23,158,1,116,
+    239,232,217,217,236,46,224,171,1,255,57,104,0,152,29,88,
+    11,62,97,71,243,161,201,208,105,8,151,155,183,9,205,254,
+    105,249,24,96,52,187,139,45,194,126,192,71,220,28,229,29,
+    205,202,37,69,149,166,60,254,240,180,231,162,223,179,189,217,
+    125,188,217,27,246,55,159,36,77,142,105,250,173,31,128,191,
+    212,158,161,181,39,30,73,187,22,160,148,84,21,3,148,202,
+    62,71,132,214,219,36,185,109,141,214,21,237,103,132,86,75,
+    18,137,122,11,134,126,78,132,242,22,237,31,4,68,222,130,
+    95,162,86,149,246,82,110,253,0,211,148,127,22,177,29,95,
+    172,137,151,248,57,197,63,181,110,109,158,202,173,46,57,59,
+    98,102,22,10,203,176,39,236,147,125,83,2,38,147,247,144,
+    227,149,18,209,17,3,50,172,77,72,190,164,89,61,144,29,
+    45,235,174,217,185,242,46,136,35,190,71,40,15,55,52,99,
+    121,198,71,78,167,78,75,218,169,77,177,177,236,162,48,241,
+    175,5,24,90,206,130,11,40,48,114,134,61,11,68,100,248,
+    129,55,143,121,135,15,191,62,4,65,5,25,33,23,104,120,
+    145,6,40,35,33,43,188,78,134,124,34,177,77,110,6,194,
+    20,105,114,188,40,47,186,244,20,166,237,3,193,128,234,245,
+    206,52,148,137,183,39,95,243,3,108,52,77,145,172,135,133,
+    178,85,47,238,186,186,239,202,190,152,43,105,221,148,178,110,
+    66,183,126,251,67,103,221,141,93,183,250,174,247,197,217,95,
+    158,73,58,187,82,206,174,249,193,180,171,97,158,93,52,167,
+    215,109,128,155,245,97,93,99,172,53,206,38,235,218,82,117,
+    109,80,96,73,175,91,143,229,105,222,118,213,114,197,114,115,
+    79,76,76,58,91,82,206,150,36,223,154,226,91,19,249,75,
+    203,122,161,137,150,107,113,110,116,241,120,65,220,171,137,184,
+    71,232,185,131,122,23,252,236,26,75,15,34,89,146,219,151,
+    183,128,235,110,170,220,46,178,202,29,11,58,192,233,42,17,
+    118,112,179,24,116,179,130,108,222,201,10,80,165,2,78,28,
+    212,151,136,59,73,28,244,72,137,83,30,55,82,21,254,34,
+    236,68,217,22,138,155,42,226,25,34,204,184,97,149,43,185,
+    75,4,151,241,51,122,4,98,73,204,90,105,75,63,134,0,
+    35,66,25,147,141,242,9,10,29,25,69,82,69,105,220,55,
+    61,169,202,175,67,129,155,147,223,163,242,179,45,80,58,87,
+    8,73,46,250,64,242,73,0,51,117,171,68,6,229,238,39,
+    136,254,15,20,202,75,218,234,152,223,247,208,181,57,206,222,
+    49,39,93,157,41,87,39,120,25,118,231,226,7,89,138,173,
+    106,204,26,152,154,198,92,237,82,111,210,213,157,202,199,126,
+    79,31,214,163,96,213,52,22,1,72,83,116,16,44,120,13,
+    58,2,143,214,53,16,217,209,66,203,97,90,131,37,193,165,
+    99,241,181,7,182,230,21,91,115,124,231,82,109,210,182,45,
+    101,219,246,192,214,179,98,235,89,126,251,238,219,137,157,131,
+    73,219,80,202,54,148,32,23,6,151,249,46,200,41,211,207,
+    235,122,169,223,89,14,24,152,223,211,52,64,93,200,135,43,
+    66,36,110,55,69,36,142,58,91,168,170,156,140,215,135,105,
+    160,114,96,109,100,31,78,182,65,62,142,139,192,249,39,67,
+    138,244,25,77,166,94,193,62,114,83,44,86,156,98,130,253,
+    83,170,144,47,134,253,179,104,121,192,55,172,240,13,73,126,
+    125,138,95,159,200,95,171,83,219,116,158,120,99,142,248,28,
+    41,90,46,88,210,143,159,49,123,189,82,16,52,12,232,134,
+    198,213,186,33,87,117,27,27,153,52,74,192,203,178,174,30,
+    20,103,12,17,190,244,228,6,141,87,154,166,175,153,39,154,
+    204,4,76,23,78,80,134,245,201,19,74,233,113,2,170,48,
+    233,226,90,42,76,171,193,33,73,68,79,230,11,245,205,130,
+    109,209,54,79,126,171,41,102,242,211,164,101,212,159,79,163,
+    224,177,200,204,78,52,25,152,65,87,202,63,28,216,150,63,
+    232,13,201,120,168,12,79,249,227,99,143,219,128,193,7,4,
+    53,39,42,173,2,159,239,97,53,119,249,154,191,193,38,181,
+    132,187,47,236,206,232,224,141,215,146,118,33,101,23,18,188,
+    64,152,203,152,192,158,193,106,5,117,186,179,32,201,200,229,
+    143,233,91,212,60,61,14,230,247,50,95,42,211,21,206,205,
+    12,51,59,214,228,82,11,254,240,83,5,159,48,1,254,142,
+    144,27,216,83,249,208,11,205,209,77,58,119,102,209,56,171,
+    207,137,22,231,156,94,40,59,57,252,77,61,57,135,89,159,
+    59,197,112,211,25,211,120,144,12,157,59,141,33,42,75,14,
+    82,5,107,55,87,114,136,209,81,62,143,120,84,80,233,52,
+    227,51,108,143,179,243,116,142,74,216,223,208,174,152,235,119,
+    166,223,218,239,177,247,38,146,219,71,82,219,71,160,40,202,
+    22,106,201,124,195,94,62,81,148,88,141,12,34,176,167,180,
+    37,101,113,192,153,242,147,116,66,198,167,136,187,89,27,242,
+    81,190,83,184,226,174,59,27,224,150,180,191,145,130,119,94,
+    27,135,112,89,121,77,93,148,102,15,75,215,242,124,97,187,
+    203,72,100,142,186,150,2,117,57,129,179,121,189,254,80,80,
+    245,5,130,10,108,169,141,171,183,84,177,22,229,34,119,46,
+    15,155,63,170,222,248,32,97,111,78,240,205,26,117,2,149,
+    51,32,254,146,212,108,241,56,190,131,126,62,5,26,89,101,
+    224,116,109,42,251,178,101,249,149,89,86,4,31,148,164,211,
+    153,231,201,166,205,114,17,54,206,86,194,43,207,88,41,27,
+    74,15,238,69,38,82,114,252,78,82,223,218,168,101,173,126,
+    72,71,216,175,203,131,137,84,233,193,55,108,58,110,228,25,
+    125,252,25,125,114,166,250,88,105,222,102,203,204,250,45,229,
+    153,151,252,71,38,199,193,252,19,3,3,254,159,116,46,195,
+    98,210,34,99,148,130,228,136,214,66,14,110,21,252,180,70,
+    251,204,130,184,154,204,164,20,116,27,139,114,81,226,3,116,
+    99,189,49,119,94,86,126,80,102,241,146,140,8,58,159,51,
+    235,87,9,76,161,238,239,112,190,110,81,5,171,117,213,126,
+    197,30,51,38,249,205,41,126,115,130,223,140,142,193,204,213,
+    239,95,249,126,236,124,210,222,158,178,183,207,179,233,154,141,
+    209,99,209,13,248,123,80,211,178,82,211,146,172,105,75,213,
+    180,205,27,1,183,20,51,75,49,230,234,135,181,237,105,199,
+    17,216,41,141,9,199,17,184,238,137,218,29,174,199,140,193,
+    89,253,132,2,128,185,141,234,172,145,114,184,110,14,196,140,
+    215,94,187,241,90,244,72,244,72,170,40,182,186,253,132,34,
+    64,132,21,181,254,143,137,150,92,160,23,74,247,20,45,219,
+    75,191,23,89,160,203,23,218,12,122,117,30,99,114,208,172,
+    165,45,23,232,181,191,108,152,53,4,191,215,162,59,209,0,
+    31,243,85,154,90,88,43,121,185,106,139,124,91,42,115,52,
+    50,223,134,198,82,143,87,92,107,187,148,39,95,43,158,21,
+    173,178,49,220,76,39,202,185,138,199,48,36,130,207,9,245,
+    182,194,71,106,24,126,105,210,232,89,245,181,15,177,45,131,
+    0,110,26,114,182,101,99,254,44,124,129,141,87,34,128,90,
+    192,51,114,131,254,107,25,176,48,77,57,11,3,26,125,14,
+    111,92,241,164,188,232,26,107,142,91,206,63,158,43,181,52,
+    93,229,123,65,246,93,240,230,191,13,169,96,112,254,9,9,
+    199,143,157,158,146,243,243,117,213,69,240,39,87,51,120,182,
+    195,89,134,170,169,187,101,191,110,143,179,241,241,165,241,164,
+    163,55,229,232,205,50,58,84,34,198,35,255,15,179,34,255,
+    21,130,203,127,41,238,255,5,91,254,8,129,61,15,64,25,
+    145,64,133,127,77,186,68,18,187,154,178,194,224,67,126,7,
+    1,230,190,193,230,23,52,86,198,232,63,51,29,60,167,16,
+    179,127,234,84,254,84,172,100,228,153,13,95,67,214,93,228,
+    229,41,46,0,218,95,171,157,152,52,107,51,92,15,107,215,
+    199,118,94,243,220,240,36,108,66,214,80,101,174,134,224,165,
+    116,210,139,224,81,123,231,157,115,203,173,169,246,93,89,14,
+    94,31,99,217,19,4,243,195,243,195,79,191,226,41,71,107,
+    150,226,241,4,61,15,30,217,28,87,95,189,242,106,84,77,
+    218,54,166,108,27,19,182,141,160,222,98,59,63,218,155,176,
+    183,195,245,112,221,166,152,122,45,120,35,152,112,180,254,239,
+    70,157,31,206,90,121,237,20,191,150,114,56,175,94,188,114,
+    17,244,174,125,115,202,190,249,129,189,125,197,222,158,180,119,
+    164,236,29,9,190,67,193,249,250,104,253,46,234,31,15,212,
+    28,180,50,247,45,52,192,85,42,17,103,250,203,78,16,176,
+    215,64,213,172,237,210,151,103,95,158,39,64,130,80,249,12,
+    126,44,247,60,231,98,136,39,91,34,160,90,75,18,135,134,
+    243,148,76,47,182,64,15,107,156,243,232,105,34,97,57,57,
+    53,139,176,114,103,132,121,158,113,35,220,243,96,141,27,222,
+    166,110,209,16,142,7,48,148,113,179,218,119,96,51,134,150,
+    189,207,232,125,110,86,94,160,72,4,142,199,30,120,244,160,
+    200,27,176,192,28,6,187,28,64,89,212,25,226,163,88,199,
+    156,147,46,101,24,69,10,103,184,243,120,212,177,202,14,115,
+    1,85,154,82,86,199,140,164,248,223,0,67,249,107,0,255,
+    5,63,176,192,174,134,7,174,214,21,87,107,252,152,22,153,
+    63,112,245,174,184,32,10,223,149,114,237,202,82,70,115,55,
+    1,243,131,105,103,253,173,61,215,247,224,1,4,121,129,64,
+    185,170,49,182,51,78,127,180,43,46,198,246,199,246,167,29,
+    13,233,77,205,63,15,254,52,184,52,154,220,212,157,218,212,
+    189,240,198,252,64,212,25,149,210,246,90,196,238,78,175,107,
+    188,21,184,30,184,118,238,198,185,120,239,167,123,127,177,247,
+    227,125,119,246,37,214,109,79,56,114,215,211,108,85,126,192,
+    213,70,184,144,228,193,236,69,121,56,182,134,207,248,181,121,
+    63,18,170,53,162,129,129,32,86,14,72,138,206,198,144,120,
+    76,12,248,85,249,26,206,60,38,190,116,254,177,41,175,72,
+    234,215,136,199,254,157,42,4,231,36,28,187,245,234,245,87,
+    99,106,210,213,154,114,181,38,237,109,41,123,91,130,111,211,
+    116,220,79,72,135,185,20,140,206,77,46,122,30,84,5,79,
+    158,150,13,17,102,244,185,217,95,195,73,134,62,244,113,21,
+    153,152,239,226,196,16,249,34,211,18,36,147,164,229,60,79,
+    229,40,61,85,118,32,40,40,211,69,199,179,144,203,132,6,
+    164,169,7,20,52,9,109,111,32,183,204,132,164,130,244,23,
+    69,27,231,64,190,137,115,166,255,224,12,29,197,25,103,249,
+    28,67,235,255,64,220,221,100,126,179,22,202,230,40,42,233,
+    180,115,253,252,8,186,134,145,43,145,216,96,210,254,66,202,
+    254,194,3,123,219,138,189,45,238,95,218,149,180,247,164,236,
+    61,9,190,71,51,45,244,49,8,208,72,74,81,75,51,172,
+    151,209,145,151,241,200,79,174,34,235,226,245,138,33,191,215,
+    11,91,78,149,51,236,233,80,104,82,198,163,62,25,183,157,
+    140,82,41,163,93,149,95,165,242,38,9,243,20,242,4,2,
+    92,43,121,10,129,130,224,60,246,199,157,190,164,194,54,159,
+    195,2,220,252,50,242,171,9,25,147,159,30,194,181,102,92,
+    137,128,144,153,120,43,15,176,27,197,105,40,253,14,58,107,
+    224,57,30,63,159,226,179,46,43,215,150,165,0,196,70,201,
+    109,201,69,110,229,96,189,133,27,166,99,187,227,131,75,117,
+    75,202,242,192,93,231,210,108,202,189,47,213,218,159,218,176,
+    63,75,97,229,189,65,237,94,1,54,208,220,6,60,82,43,
+    5,70,221,89,27,190,214,225,83,14,24,13,220,11,177,214,
+    152,242,145,27,92,111,238,133,114,192,27,184,55,233,216,0,
+    190,188,73,3,77,206,59,135,181,231,10,144,167,185,150,56,
+    126,70,199,181,44,145,193,90,202,129,145,231,90,98,10,78,
+    71,203,210,0,185,221,117,146,219,189,58,114,43,7,174,90,
+    206,29,103,178,20,220,150,180,91,57,232,48,113,221,49,192,
+    134,91,188,99,169,119,217,185,236,95,110,248,124,127,170,121,
+    47,41,43,7,181,6,174,93,227,166,29,153,89,242,47,53,
+    220,25,33,175,229,192,66,237,59,64,103,25,19,183,19,91,
+    238,76,187,234,201,75,122,211,11,218,125,219,206,229,209,207,
+    143,144,231,71,230,154,104,203,98,83,150,203,35,87,2,154,
+    188,188,165,73,114,12,159,223,71,128,233,11,237,107,37,131,
+    44,101,140,234,165,112,32,56,161,201,27,91,16,99,99,65,
+    150,223,165,114,71,243,228,252,157,28,189,103,76,232,157,225,
+    241,130,249,200,91,175,31,59,252,250,225,145,33,121,27,86,
+    152,135,46,250,37,242,63,17,52,183,236,195,194,110,32,105,
+    103,146,108,30,45,8,176,94,168,159,241,125,218,127,18,232,
+    151,63,166,180,204,164,242,27,128,89,134,166,233,236,75,54,
+    154,205,82,8,54,82,180,125,174,26,127,105,202,58,71,126,
+    105,202,60,71,126,133,135,172,193,72,27,192,122,252,31,129,
+    131,178,185,230,248,180,189,110,206,150,54,55,206,25,211,86,
+    219,28,255,200,226,154,111,94,236,76,212,117,47,239,248,109,
+    95,210,242,74,202,242,202,156,9,164,156,54,131,204,173,2,
+    177,151,31,227,237,73,177,148,119,208,198,168,63,75,193,45,
+    38,198,123,81,40,150,123,150,154,82,45,187,82,155,118,147,
+    226,114,208,206,211,110,108,1,183,120,107,124,122,105,116,185,
+    101,89,89,58,153,218,178,55,213,220,71,138,239,185,200,173,
+    28,172,115,209,174,40,108,126,184,197,222,137,139,154,184,222,
+    237,89,110,74,109,221,159,106,127,37,213,116,128,212,149,3,
+    207,89,154,6,33,170,12,31,19,248,100,141,90,178,160,255,
+    3,48,200,36,47,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/util/checkpoint_index.py",
+    "m5.util.checkpoint_index",
+    embedded_module_data,
+    6453,
+    14058);
+
+} // anonymous namespace
+} // namespace gem5
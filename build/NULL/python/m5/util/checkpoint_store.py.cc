@@ -0,0 +1,937 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,197,125,11,116,27,87,118,216,12,48,3,12,126,4,
+    64,2,252,139,132,40,146,34,40,146,250,203,18,173,143,41,
+    18,148,104,203,212,174,68,255,216,120,41,136,51,20,33,129,
+    0,61,0,245,97,160,181,118,171,173,33,149,169,33,135,174,
+    224,141,148,197,110,237,93,122,215,123,150,73,157,84,201,73,
+    206,174,63,155,179,57,105,27,64,103,114,140,160,135,141,210,
+    196,77,247,36,167,129,106,185,113,220,156,164,247,190,25,0,
+    51,0,40,219,221,156,83,98,120,231,205,155,247,222,188,121,
+    159,251,127,111,254,130,82,253,153,149,243,71,49,29,69,221,
+    164,120,106,146,226,105,94,23,164,39,105,114,214,77,234,200,
+    89,63,169,39,103,102,146,33,103,118,146,37,103,195,164,129,
+    156,141,147,70,114,230,38,57,114,54,77,154,200,217,60,105,
+    134,179,62,104,153,179,78,90,105,44,155,9,218,230,106,38,
+    107,72,152,13,218,231,28,147,14,18,54,4,157,115,181,147,
+    181,115,117,147,117,115,174,73,215,156,123,210,61,87,63,89,
+    15,247,140,60,23,108,152,107,156,108,132,176,105,178,137,55,
+    79,54,243,198,201,22,222,50,217,202,91,39,55,240,58,127,
+    155,142,58,66,241,182,171,20,95,35,180,127,87,79,81,63,
+    208,23,94,112,210,67,238,217,225,158,227,187,240,142,63,208,
+    21,239,108,36,119,156,112,167,182,236,78,7,63,192,187,132,
+    77,188,27,254,235,5,128,77,197,6,155,49,240,13,87,217,
+    201,78,190,145,220,171,155,97,248,166,171,204,100,23,185,110,
+    22,234,248,122,94,7,105,90,32,174,155,148,81,47,108,134,
+    52,173,112,221,99,162,248,173,124,155,176,145,196,183,11,155,
+    73,217,117,170,178,57,222,3,101,123,73,57,109,66,189,176,
+    81,117,143,225,55,66,25,189,80,198,54,146,191,236,62,191,
+    73,216,66,158,205,241,157,80,70,31,164,219,94,53,93,189,
+    176,5,234,215,5,105,250,139,105,186,171,165,35,101,109,134,
+    116,3,66,235,12,205,247,64,26,175,242,12,3,223,11,241,
+    91,201,187,233,248,45,80,47,185,78,120,143,225,251,224,122,
+    187,224,80,222,222,165,105,61,134,239,191,202,124,23,66,63,
+    40,198,77,238,224,117,39,41,239,14,255,12,11,227,113,200,
+    51,29,14,69,133,80,180,223,207,243,162,16,137,8,188,39,
+    18,13,139,130,103,38,44,122,162,179,130,103,78,152,11,139,
+    151,60,129,57,255,25,33,226,9,207,120,166,103,133,233,115,
+    243,225,64,40,26,241,244,8,33,255,233,32,228,185,16,136,
+    206,154,79,157,234,239,47,221,237,39,229,156,58,229,129,130,
+    78,157,146,19,246,120,79,157,242,14,120,134,85,69,64,137,
+    248,152,136,127,78,240,92,8,139,231,130,97,63,223,103,22,
+    6,206,12,120,252,81,15,31,152,153,17,68,168,159,231,100,
+    96,238,75,36,71,159,39,50,235,135,10,206,133,35,81,37,
+    119,64,244,204,207,94,138,4,166,253,65,165,190,3,158,177,
+    80,36,42,248,121,72,97,62,39,8,243,129,208,25,143,223,
+    51,179,16,12,66,101,122,7,230,33,25,84,237,204,98,96,
+    222,51,47,136,170,151,234,147,171,67,218,32,50,31,12,64,
+    21,5,255,244,172,220,0,158,64,200,60,19,184,40,240,253,
+    145,192,162,0,185,22,66,231,160,66,33,168,60,239,57,125,
+    137,100,61,121,116,168,127,199,238,61,165,170,41,45,220,231,
+    241,135,120,15,214,5,74,60,47,136,151,204,124,32,18,13,
+    132,166,163,114,57,158,112,104,90,24,48,99,151,20,43,3,
+    207,83,85,103,54,28,228,225,105,16,55,31,244,79,11,248,
+    4,82,181,83,167,246,99,13,14,42,111,5,15,50,107,162,
+    6,228,122,194,251,62,126,242,248,184,103,206,31,10,204,8,
+    208,120,65,242,252,51,228,9,114,146,66,111,144,151,29,240,
+    76,204,10,102,249,209,208,12,66,112,198,19,136,64,35,242,
+    1,81,152,142,226,160,192,10,21,10,88,12,6,78,247,79,
+    135,231,230,149,81,36,23,104,238,57,117,42,124,250,44,164,
+    143,108,221,191,195,51,43,92,132,236,103,160,180,131,91,247,
+    67,0,106,113,16,70,4,105,25,127,200,115,242,203,199,2,
+    81,108,100,94,184,136,57,73,96,32,242,2,244,130,128,201,
+    212,181,139,200,141,194,147,188,202,141,208,194,220,105,232,76,
+    184,146,147,152,69,129,140,158,105,172,36,105,42,82,43,24,
+    128,225,249,75,242,136,80,181,117,52,12,101,133,161,28,17,
+    94,12,154,7,67,194,12,190,125,56,20,188,100,14,9,2,
+    31,193,134,40,54,96,132,60,91,213,122,24,148,11,144,91,
+    141,15,67,53,161,72,207,172,255,188,224,185,36,68,161,123,
+    79,157,154,219,61,80,122,42,206,8,24,202,231,133,72,245,
+    217,230,247,132,132,11,101,181,132,132,230,194,196,35,15,26,
+    240,144,82,3,48,228,253,161,104,192,31,37,19,205,3,61,
+    129,119,161,165,22,224,213,53,239,58,35,134,231,96,152,68,
+    133,185,249,176,232,135,39,86,118,106,48,64,94,41,172,188,
+    96,41,107,32,40,148,222,92,174,176,89,169,176,40,156,94,
+    8,4,149,226,139,3,151,12,164,194,59,225,212,45,36,91,
+    8,169,6,76,207,133,217,192,244,172,25,199,17,36,240,67,
+    91,71,69,127,40,50,239,199,233,31,188,36,15,18,188,140,
+    8,128,2,176,90,48,26,225,64,60,16,188,228,57,29,94,
+    128,209,82,152,133,102,94,40,20,29,8,135,138,227,35,28,
+    234,95,20,196,176,210,95,3,30,223,69,101,10,168,145,26,
+    214,16,230,44,76,209,168,0,168,72,20,130,130,63,162,12,
+    180,51,126,241,52,226,129,233,112,48,8,237,165,96,62,104,
+    254,133,104,32,184,181,84,202,148,252,226,243,151,78,157,26,
+    48,255,28,241,238,184,151,206,177,188,240,194,130,0,129,218,
+    137,89,124,197,47,133,195,65,223,69,97,122,1,18,67,108,
+    13,193,20,23,163,48,190,224,25,162,151,205,113,135,3,33,
+    232,157,177,227,57,102,36,48,29,205,113,99,81,65,244,67,
+    234,28,115,12,106,158,227,142,207,71,225,253,252,193,159,211,
+    240,8,40,194,140,243,125,138,52,245,162,81,153,247,94,221,
+    34,75,240,192,162,73,70,7,167,131,231,2,20,69,83,63,
+    135,127,106,90,205,159,208,5,254,164,134,66,254,68,160,128,
+    47,161,144,39,1,138,161,203,217,135,177,188,147,248,102,62,
+    81,12,139,227,94,125,142,155,154,66,68,51,53,149,51,79,
+    77,205,133,249,133,32,134,173,83,83,47,44,248,131,242,157,
+    55,169,143,176,204,79,187,35,226,244,214,249,75,209,217,112,
+    104,235,220,238,173,235,181,152,104,135,196,4,60,13,255,17,
+    12,92,41,254,178,12,119,101,68,116,21,82,104,42,95,100,
+    174,78,208,234,202,11,132,149,154,209,243,122,129,225,25,129,
+    229,89,248,55,8,6,129,213,176,2,70,32,177,70,129,227,
+    57,193,116,214,92,140,215,241,166,10,2,106,225,55,242,102,
+    32,186,86,193,198,91,132,26,72,99,173,72,99,231,109,240,
+    52,78,96,128,4,215,64,90,7,111,135,167,202,215,14,184,
+    118,242,78,161,86,185,174,133,235,58,146,94,142,99,129,224,
+    215,65,156,75,41,163,22,210,184,224,218,205,119,0,129,175,
+    231,27,72,108,3,164,106,132,58,55,242,77,66,3,92,215,
+    64,170,102,72,213,68,238,233,8,75,212,172,132,145,29,106,
+    129,112,171,208,160,122,103,29,191,1,226,55,40,249,235,33,
+    127,27,92,183,145,235,118,120,14,71,88,15,15,196,181,19,
+    150,97,83,206,92,26,0,63,55,224,152,206,49,98,56,28,
+    205,153,201,64,155,66,154,152,99,131,64,220,130,57,99,148,
+    140,240,200,52,171,234,33,204,131,172,226,71,147,164,135,98,
+    48,176,206,145,33,39,218,163,116,41,25,175,251,46,92,253,
+    160,24,243,117,58,170,43,221,61,91,12,167,244,84,149,191,
+    24,173,205,29,163,166,152,98,88,7,87,197,26,197,244,112,
+    101,40,94,49,243,174,168,170,196,179,198,66,72,219,183,243,
+    192,96,67,62,174,88,91,6,174,76,133,171,0,62,175,56,
+    126,52,229,89,138,177,213,223,198,90,245,109,168,179,197,218,
+    243,172,150,113,230,13,111,25,181,49,192,178,51,208,83,156,
+    255,44,188,190,217,163,252,13,2,210,244,207,121,176,171,6,
+    9,42,46,33,251,2,247,37,163,233,177,40,34,212,105,232,
+    56,196,108,129,25,15,210,60,129,31,40,47,169,212,221,114,
+    121,132,25,82,138,82,72,33,82,45,21,198,39,156,20,16,
+    246,138,162,200,104,145,75,33,152,95,141,181,201,61,109,185,
+    21,249,149,97,38,151,80,162,255,74,52,16,222,200,44,224,
+    247,190,82,185,72,245,67,124,177,152,242,63,21,221,32,100,
+    129,188,76,15,47,204,248,23,130,208,122,225,144,64,248,197,
+    225,47,61,229,45,213,69,196,14,88,108,159,40,84,83,110,
+    144,185,5,96,34,78,67,250,112,36,16,13,0,57,193,1,
+    48,158,51,42,252,208,196,155,116,142,19,144,0,77,133,207,
+    121,109,57,243,211,254,224,130,140,88,115,186,112,36,199,204,
+    251,163,179,57,163,255,116,4,3,34,78,92,177,25,65,11,
+    128,156,105,122,126,97,106,26,104,94,84,108,197,107,253,20,
+    127,58,103,155,66,234,54,37,51,86,145,28,55,231,63,39,
+    64,95,67,89,103,1,197,2,61,97,144,139,43,43,138,228,
+    143,224,164,144,223,197,141,197,1,90,15,132,2,209,169,169,
+    197,186,210,156,31,40,68,254,11,204,241,10,133,136,57,223,
+    74,89,235,147,206,235,135,226,135,214,106,91,211,27,14,102,
+    106,15,73,181,135,210,214,67,107,174,250,229,35,55,143,191,
+    114,60,53,146,113,121,37,151,55,206,44,153,178,205,157,112,
+    178,103,221,205,112,50,103,27,218,210,13,187,223,232,120,189,
+    239,219,3,175,15,64,112,117,8,162,173,217,186,6,56,113,
+    217,13,237,113,70,226,154,63,228,204,75,150,87,15,67,97,
+    199,94,57,150,114,189,222,180,50,150,113,237,145,92,123,126,
+    226,74,115,163,25,110,84,226,70,211,133,131,208,134,156,65,
+    20,162,11,98,104,90,133,84,74,200,39,77,17,228,67,157,
+    45,222,186,242,156,102,162,22,167,83,212,160,138,45,78,195,
+    148,26,165,169,39,106,49,53,79,151,77,84,29,79,189,165,
+    215,74,202,128,38,212,121,139,225,84,17,237,168,255,120,70,
+    139,212,104,77,30,152,242,236,248,162,85,205,46,7,158,133,
+    167,3,205,54,70,3,115,66,120,33,154,179,7,34,225,160,
+    31,185,133,41,50,175,22,255,108,248,132,111,104,194,231,153,
+    24,58,124,204,231,25,27,245,140,31,159,240,248,158,29,59,
+    57,113,178,56,238,61,242,80,242,76,248,158,157,240,124,233,
+    196,216,147,67,39,158,243,60,225,123,174,175,192,124,143,141,
+    79,248,142,248,78,144,188,227,79,29,59,214,7,172,219,76,
+    164,34,218,235,121,102,108,226,232,241,167,38,60,39,142,63,
+    51,54,242,232,67,30,173,32,141,30,79,128,175,242,88,156,
+    10,114,116,233,137,100,178,85,60,241,81,47,39,118,67,219,
+    228,140,114,131,236,204,25,129,189,10,193,204,19,59,32,90,
+    220,132,192,139,0,167,67,206,38,16,62,76,136,76,139,129,
+    249,232,155,180,216,11,177,17,108,111,101,70,232,248,211,139,
+    54,213,92,224,79,71,49,69,128,34,179,192,64,89,29,75,
+    123,211,150,150,181,134,182,229,23,215,28,181,203,198,155,214,
+    87,172,201,137,91,207,173,212,100,28,143,72,142,71,178,141,
+    45,89,79,103,222,200,52,214,220,167,0,60,64,16,31,89,
+    58,154,55,83,54,231,210,209,15,172,29,119,173,29,121,157,
+    209,185,229,190,222,100,131,251,0,242,4,184,40,135,107,233,
+    98,220,78,6,183,102,80,227,16,35,131,250,89,170,124,80,
+    127,173,67,51,172,212,185,138,127,90,202,6,212,67,51,44,
+    121,24,88,248,255,38,61,238,213,201,141,201,78,7,195,17,
+    65,220,169,109,28,241,17,0,139,14,85,235,144,100,215,48,
+    213,86,210,64,89,139,29,155,167,61,11,205,116,244,229,241,
+    235,227,25,107,171,100,109,77,91,91,179,13,45,216,8,113,
+    248,229,89,202,234,129,68,242,28,54,9,23,167,131,11,17,
+    64,156,211,42,122,73,225,244,192,190,251,40,1,207,127,2,
+    234,124,147,82,243,14,95,136,83,80,211,214,138,41,171,189,
+    222,77,93,214,69,45,165,188,165,201,14,60,5,45,90,163,
+    102,213,189,226,20,14,89,52,241,69,158,161,156,106,155,160,
+    157,159,166,110,210,52,181,222,51,52,229,20,185,141,242,114,
+    66,157,155,126,193,18,46,80,23,245,207,81,23,104,172,17,
+    254,42,248,11,24,15,155,168,237,84,132,185,160,147,83,210,
+    212,115,16,47,223,241,234,129,37,12,134,167,207,229,104,191,
+    215,156,99,194,243,66,168,234,116,99,103,166,65,168,131,19,
+    73,108,60,118,124,248,137,41,223,179,74,224,228,81,37,240,
+    20,72,24,100,34,138,123,49,19,61,19,193,126,44,18,41,
+    118,10,115,107,198,29,137,249,55,112,51,242,55,0,254,7,
+    252,174,80,31,155,169,154,218,87,59,150,55,223,236,123,165,
+    47,25,189,117,105,165,59,83,187,93,170,221,190,186,51,99,
+    123,68,178,61,146,167,88,211,192,157,237,107,86,231,210,19,
+    73,122,101,44,221,114,244,246,238,91,7,146,7,126,127,247,
+    239,29,200,88,199,36,235,88,218,58,150,215,233,109,3,89,
+    135,59,193,226,239,67,135,123,217,146,28,186,189,112,235,114,
+    198,209,47,57,250,211,228,248,228,85,182,106,244,39,159,0,
+    204,91,224,57,228,97,4,220,71,240,128,210,196,173,11,160,
+    132,135,39,136,96,227,254,246,192,225,71,245,239,116,49,135,
+    77,186,119,188,30,8,191,107,218,120,184,151,125,183,87,143,
+    225,71,153,195,135,140,239,233,104,128,57,131,140,217,43,166,
+    22,65,38,167,40,68,38,81,213,173,179,197,41,150,82,231,
+    40,254,193,84,42,78,49,158,142,129,224,197,235,190,161,43,
+    9,27,192,148,195,84,251,65,113,186,145,161,34,182,65,232,
+    231,88,158,151,169,54,74,222,212,201,157,63,130,253,169,35,
+    61,47,119,188,34,111,32,49,88,116,171,177,78,49,250,155,
+    152,5,49,214,21,106,205,238,92,186,240,114,236,122,44,57,
+    114,107,44,117,105,181,251,78,237,157,141,119,106,223,238,189,
+    51,147,177,251,36,187,47,205,249,100,140,195,32,37,209,180,
+    8,91,104,145,59,84,57,122,173,142,80,203,133,143,203,186,
+    152,238,202,129,168,138,99,40,181,83,212,180,126,62,237,85,
+    117,142,67,139,188,241,73,234,250,197,232,253,8,65,112,19,
+    247,96,11,27,196,205,248,142,250,51,66,52,103,68,182,24,
+    184,237,156,33,50,235,223,177,123,79,142,61,125,9,72,95,
+    206,52,43,92,148,199,69,97,222,141,21,219,95,51,243,172,
+    106,70,115,177,65,61,1,85,55,110,99,190,47,145,78,200,
+    58,221,146,115,211,7,206,205,119,157,155,87,152,140,179,95,
+    114,246,199,13,89,139,51,126,112,205,221,186,252,149,55,124,
+    43,157,223,126,226,245,39,50,238,109,146,123,219,7,238,193,
+    187,238,193,140,123,191,228,222,31,31,205,110,238,143,143,72,
+    214,182,100,52,99,237,204,218,221,113,155,210,93,188,63,234,
+    215,116,151,190,208,93,227,164,187,212,116,161,52,128,203,155,
+    186,250,128,214,54,110,161,17,245,226,49,108,144,39,17,28,
+    199,8,101,132,126,153,42,27,161,236,20,54,177,22,53,97,
+    204,235,152,176,141,146,199,101,253,210,87,147,124,198,190,73,
+    178,111,250,192,222,127,215,222,159,177,111,149,236,91,211,220,
+    86,153,208,171,137,86,145,123,173,209,201,35,49,85,173,214,
+    149,227,79,111,162,170,243,182,49,189,54,101,105,92,34,130,
+    143,114,165,60,157,148,168,71,36,31,98,10,196,97,93,66,
+    168,22,154,53,132,227,50,163,169,69,177,116,13,185,46,206,
+    135,148,138,84,169,222,173,172,198,60,253,150,174,156,60,197,
+    244,191,70,241,250,234,98,183,182,75,33,29,115,155,185,204,
+    70,75,72,138,138,177,229,34,54,144,125,67,204,144,178,85,
+    173,79,5,79,94,157,100,134,44,213,9,166,166,150,53,165,
+    58,192,123,150,149,16,109,95,255,169,128,73,13,227,19,34,
+    166,248,148,30,248,148,25,136,206,205,231,116,23,78,123,29,
+    226,81,136,35,120,21,48,91,212,15,211,30,68,77,162,163,
+    113,142,6,130,194,120,56,58,138,58,83,89,226,100,80,250,
+    206,113,5,225,87,150,12,123,40,5,39,231,140,32,70,162,
+    54,47,103,0,252,49,31,224,69,68,46,57,246,130,8,156,
+    117,206,40,10,196,32,145,211,7,133,144,215,88,66,218,100,
+    94,200,5,152,75,154,222,156,30,170,40,30,134,216,8,142,
+    150,130,12,173,32,22,82,228,20,193,228,90,196,162,186,241,
+    61,204,219,79,19,196,98,175,123,249,197,235,47,38,207,103,
+    236,221,146,189,59,206,0,153,54,57,215,234,220,203,143,36,
+    119,221,56,176,124,64,170,235,73,91,123,62,89,179,123,242,
+    20,109,114,150,0,176,162,241,145,188,30,66,64,91,63,54,
+    80,245,205,203,207,167,118,173,184,222,106,206,184,119,73,238,
+    93,113,243,90,81,240,84,73,177,171,35,105,110,95,134,219,
+    39,113,251,32,0,120,45,93,227,133,227,182,238,150,233,53,
+    203,45,139,124,5,71,92,191,102,115,38,54,37,162,215,166,
+    150,166,240,129,158,20,157,181,218,94,62,114,253,72,226,241,
+    140,181,93,178,182,167,173,237,248,124,82,49,25,220,71,240,
+    128,210,196,85,3,132,27,168,140,70,73,217,156,216,153,100,
+    50,220,6,137,219,144,230,54,172,217,107,19,131,215,94,92,
+    122,49,205,181,17,188,115,179,113,27,181,106,62,160,255,61,
+    250,128,254,221,61,245,195,141,250,247,26,153,225,86,227,123,
+    237,52,64,13,54,197,73,74,80,78,43,209,214,153,52,248,
+    52,246,57,9,96,57,95,77,248,232,170,228,48,166,75,49,
+    84,149,63,237,180,213,150,62,173,171,62,229,30,198,163,2,
+    114,83,161,23,64,110,240,122,81,213,4,231,129,159,71,36,
+    162,70,102,4,89,176,229,90,201,2,58,4,225,59,167,19,
+    79,47,26,200,112,245,44,182,19,179,68,64,86,33,105,77,
+    33,104,188,219,252,41,189,25,132,83,156,65,242,20,69,117,
+    74,78,101,177,200,49,168,188,18,39,41,69,203,77,152,161,
+    2,69,38,243,138,76,30,13,69,54,99,22,101,218,168,89,
+    162,82,244,111,99,158,255,74,17,113,85,103,48,213,172,57,
+    221,9,254,102,248,149,112,106,38,83,223,47,213,247,175,68,
+    51,206,93,146,115,23,12,37,219,246,59,244,90,67,203,242,
+    139,169,23,190,119,254,59,231,191,125,241,245,139,153,134,109,
+    82,195,54,24,175,182,237,36,65,9,220,71,240,128,170,188,
+    81,6,228,65,251,176,4,31,226,36,213,155,106,74,96,173,
+    118,99,214,113,44,89,159,118,28,131,227,39,204,251,38,57,
+    4,199,125,189,174,14,132,100,0,121,74,7,66,178,30,146,
+    195,35,34,3,216,55,155,134,186,168,55,186,135,26,245,239,
+    88,172,16,124,167,145,25,106,53,190,211,170,199,112,59,141,
+    97,15,9,119,117,31,182,232,115,128,201,136,218,129,160,42,
+    13,217,69,226,65,230,192,42,140,205,151,236,55,169,51,64,
+    82,3,212,117,59,79,95,102,214,35,194,188,238,173,50,82,
+    181,187,12,221,199,84,132,184,60,229,101,214,132,79,49,68,
+    85,138,32,53,57,214,166,31,161,158,223,125,217,24,163,63,
+    91,41,85,198,24,112,49,46,162,3,226,84,15,228,173,170,
+    202,41,198,149,147,183,165,61,49,67,132,14,125,16,117,170,
+    82,177,41,83,213,220,84,201,138,18,51,104,231,103,89,77,
+    76,113,251,12,205,179,87,185,104,131,42,191,169,60,215,72,
+    57,195,107,214,164,55,63,164,38,86,85,42,115,117,98,94,
+    134,101,52,170,186,242,122,60,111,254,37,184,186,108,185,108,
+    141,89,175,217,99,22,156,201,75,150,152,62,85,67,85,249,
+    139,153,42,84,119,140,154,160,243,134,171,208,66,229,111,167,
+    205,179,104,35,44,212,70,85,169,6,109,10,245,8,57,71,
+    160,72,135,116,9,122,169,59,218,81,186,19,237,42,133,207,
+    214,85,127,247,179,174,226,51,168,179,238,98,152,81,143,165,
+    152,158,55,222,50,92,182,65,92,125,33,238,114,77,172,38,
+    165,234,17,213,27,86,140,36,19,5,105,27,171,166,53,93,
+    179,167,154,170,221,41,107,159,114,198,111,189,103,155,99,54,
+    222,162,18,68,117,49,102,166,130,193,90,55,183,181,188,230,
+    68,195,178,171,148,2,232,71,195,67,242,219,202,243,127,93,
+    173,97,169,193,223,231,101,23,191,88,234,152,13,24,67,187,
+    127,135,218,14,116,146,24,97,138,30,20,196,202,174,120,2,
+    120,78,19,67,51,49,238,123,100,3,5,146,170,130,131,139,
+    159,39,214,254,98,73,42,127,135,114,79,135,112,144,71,79,
+    7,98,45,47,184,95,8,30,127,176,96,200,153,27,48,151,
+    219,112,72,109,6,75,78,2,196,19,131,175,52,59,161,96,
+    63,232,121,6,221,50,84,111,1,84,19,158,141,175,209,71,
+    156,150,78,157,146,85,200,232,2,161,42,66,182,8,40,134,
+    162,162,11,140,198,223,69,107,207,25,125,147,38,106,167,9,
+    141,194,21,89,20,156,56,31,117,2,120,149,190,73,12,126,
+    207,91,9,66,160,65,6,167,175,233,207,211,63,50,197,232,
+    152,238,87,117,75,208,9,34,166,38,192,203,228,116,3,219,
+    74,140,49,72,223,68,137,30,193,50,225,169,87,8,37,255,
+    212,188,159,15,76,71,145,23,56,184,216,163,162,228,208,34,
+    178,97,127,96,127,48,60,237,15,70,14,14,148,82,254,41,
+    228,140,224,176,252,4,168,59,197,52,212,150,192,159,55,118,
+    38,13,41,38,219,176,33,245,116,186,97,11,28,121,150,114,
+    183,36,71,238,145,11,56,42,213,202,88,35,212,241,126,132,
+    69,202,74,86,120,203,186,203,180,134,5,44,99,245,100,5,
+    230,146,139,47,138,203,180,232,167,136,144,60,79,85,17,146,
+    63,53,237,63,35,132,132,139,243,226,193,197,205,159,241,162,
+    133,132,127,129,101,160,88,34,171,246,210,45,123,225,88,233,
+    188,61,156,98,94,27,187,53,38,95,171,15,242,110,94,67,
+    206,120,94,16,209,168,152,211,5,248,28,75,26,94,86,110,
+    52,147,158,144,7,244,167,246,195,190,35,99,227,158,177,39,
+    159,244,141,140,13,77,248,22,159,26,27,63,233,59,49,129,
+    230,133,227,133,81,255,244,208,177,167,124,39,61,61,135,250,
+    60,112,108,247,122,142,143,123,134,143,143,143,30,27,27,158,
+    232,81,212,39,158,145,227,158,167,190,52,130,70,142,147,190,
+    9,217,40,114,64,62,109,241,108,95,220,164,46,86,177,120,
+    104,139,61,228,21,207,147,154,13,31,127,242,201,177,137,28,
+    119,226,248,177,99,135,135,134,159,24,247,182,136,195,88,113,
+    236,35,217,246,199,138,254,208,25,16,205,166,14,15,77,12,
+    31,21,3,165,215,242,207,207,11,33,62,199,160,167,87,78,
+    63,231,159,23,79,98,188,126,49,48,47,242,36,197,121,52,
+    58,70,114,6,225,98,20,83,234,35,11,115,164,211,114,142,
+    39,135,198,199,70,125,39,39,166,158,246,157,56,57,118,124,
+    60,199,44,44,96,219,33,220,149,211,207,10,23,101,67,34,
+    14,145,156,81,49,159,228,44,74,0,102,216,37,224,170,32,
+    16,201,217,14,251,35,130,239,226,180,64,156,85,64,48,37,
+    140,108,144,82,9,151,196,96,73,58,36,199,204,135,195,193,
+    28,123,218,31,157,158,205,209,83,202,84,65,229,9,138,142,
+    33,225,2,153,65,57,3,200,154,103,162,179,104,228,148,231,
+    50,169,136,248,2,14,16,7,85,20,43,11,127,143,201,108,
+    178,169,56,184,22,93,213,134,220,143,49,251,6,189,60,143,
+    106,169,58,119,220,152,117,214,197,13,89,187,35,206,100,109,
+    206,151,39,175,79,166,186,226,147,25,91,143,100,235,201,83,
+    123,76,245,4,252,73,239,126,52,109,32,83,186,197,12,76,
+    233,22,51,137,190,103,115,230,117,13,182,230,108,99,115,130,
+    93,107,106,187,125,254,181,13,183,54,192,180,116,110,38,32,
+    49,148,109,241,124,107,240,155,131,41,254,245,112,166,101,143,
+    212,178,39,49,146,109,105,7,118,216,221,150,109,220,144,100,
+    179,174,38,217,236,153,113,117,75,174,238,52,57,178,13,173,
+    144,194,217,12,55,63,108,218,144,228,191,53,251,205,217,84,
+    244,245,197,213,221,153,182,125,82,219,190,76,211,160,212,52,
+    152,48,228,117,26,76,64,192,135,61,91,86,70,87,125,153,
+    158,65,169,103,48,207,66,204,125,140,126,128,32,161,255,216,
+    76,109,238,205,186,26,146,174,111,53,126,179,49,213,41,117,
+    236,92,61,121,103,211,143,123,127,183,247,119,250,126,175,47,
+    211,116,68,106,58,2,47,185,25,50,0,0,30,221,217,71,
+    192,141,241,196,104,114,52,111,160,186,251,32,176,7,46,199,
+    179,142,134,155,53,175,212,128,104,238,232,150,28,221,105,71,
+    119,214,225,186,173,151,231,229,106,23,128,76,203,94,9,96,
+    227,94,169,113,111,198,177,55,193,172,213,213,39,22,110,12,
+    46,15,190,97,184,91,215,157,174,235,134,55,188,191,21,26,
+    240,227,93,84,107,223,26,136,232,103,111,4,151,131,82,125,
+    119,182,105,195,173,166,108,99,107,182,173,227,86,56,219,188,
+    49,111,51,54,130,32,0,32,126,52,95,79,213,214,47,55,
+    196,15,103,173,53,47,63,126,253,241,116,67,79,198,234,149,
+    172,222,180,213,155,215,217,108,245,89,71,45,214,44,175,163,
+    221,187,239,185,154,177,129,111,140,47,143,223,55,50,78,108,
+    8,39,182,20,0,51,229,172,187,105,126,197,156,117,237,203,
+    186,161,153,151,191,146,154,88,217,149,118,109,187,207,234,49,
+    161,222,73,26,160,54,207,41,9,147,240,22,157,146,163,51,
+    77,142,79,214,234,60,40,154,212,151,0,62,24,211,13,170,
+    154,196,157,103,225,14,10,71,122,202,217,149,63,67,23,198,
+    20,1,247,17,60,160,52,113,213,0,17,174,62,51,213,47,
+    90,218,60,77,57,26,227,246,8,234,87,127,221,61,102,209,
+    255,123,223,142,163,187,216,63,232,30,106,61,170,103,126,166,
+    163,225,226,103,250,141,71,59,141,63,235,212,99,184,199,10,
+    137,126,182,139,57,186,215,244,179,189,122,12,63,74,99,120,
+    63,134,255,208,194,140,217,141,127,88,75,3,20,151,145,6,
+    85,85,63,44,209,229,186,119,212,117,87,87,63,240,116,21,
+    86,115,189,180,64,173,121,189,202,33,170,76,85,81,18,209,
+    34,13,235,150,81,169,3,100,79,226,19,171,26,28,121,3,
+    111,188,90,166,247,231,185,82,13,202,69,187,207,96,121,215,
+    171,83,133,192,65,152,86,173,210,163,225,33,249,43,222,169,
+    196,180,242,102,96,43,45,139,31,23,89,165,17,49,60,79,
+    88,168,34,175,39,187,173,134,74,172,28,186,204,22,28,46,
+    39,84,30,66,225,40,186,230,148,152,174,82,1,64,59,230,
+    144,171,148,125,69,209,59,150,248,117,158,58,117,102,90,230,
+    234,170,176,117,163,192,40,8,232,179,84,226,12,47,248,101,
+    158,84,227,68,221,131,174,229,125,80,41,188,93,197,13,200,
+    31,68,182,248,146,167,224,246,169,118,243,185,68,161,155,207,
+    136,239,152,15,232,250,232,137,227,79,22,104,247,51,71,125,
+    39,124,232,177,112,192,115,136,208,109,241,151,1,140,46,238,
+    80,120,0,229,149,203,89,129,126,207,118,37,171,226,103,1,
+    217,43,204,251,132,15,67,58,95,228,195,140,151,233,24,61,
+    67,43,252,22,87,228,183,100,46,83,225,182,202,141,102,34,
+    154,243,22,187,52,170,33,242,134,85,184,44,24,28,84,4,
+    25,92,133,203,114,12,193,145,60,159,232,78,52,201,97,245,
+    33,123,99,94,68,176,8,96,194,107,144,41,49,90,255,115,
+    156,24,190,32,123,41,93,199,75,125,68,136,138,75,84,73,
+    155,133,179,158,36,215,106,179,140,74,221,22,107,43,235,203,
+    98,229,254,59,69,244,88,14,170,166,118,233,153,184,46,203,
+    153,95,54,95,55,167,235,58,51,92,151,196,117,165,185,46,
+    64,244,166,218,108,157,251,230,224,43,131,89,199,246,213,163,
+    119,38,222,30,79,239,28,1,226,229,66,181,145,171,230,47,
+    107,234,129,254,217,54,0,209,82,208,183,10,45,55,180,38,
+    22,144,124,140,95,7,58,54,146,37,111,250,195,186,149,103,
+    87,103,165,254,67,25,239,99,146,247,49,136,201,56,134,36,
+    199,16,144,3,116,215,208,163,187,6,2,142,178,217,145,238,
+    36,46,102,172,30,201,234,73,147,227,147,53,59,80,109,157,
+    169,182,4,20,250,148,88,204,88,59,36,107,71,218,218,145,
+    181,58,129,28,152,106,17,1,27,40,135,43,30,141,212,194,
+    171,254,250,35,135,61,212,59,13,67,28,156,222,245,108,28,
+    166,245,154,97,82,52,220,14,200,203,138,232,203,52,143,194,
+    200,23,210,79,197,84,54,178,203,250,152,190,186,93,172,18,
+    57,0,130,93,47,109,153,198,180,58,82,44,211,234,48,49,
+    102,132,122,254,40,17,168,216,203,6,147,6,93,158,45,249,
+    110,82,41,3,85,229,47,198,62,204,144,10,168,208,1,168,
+    80,165,167,169,52,110,1,74,54,16,125,11,136,112,49,57,
+    164,91,26,91,247,29,141,21,218,157,245,82,86,104,65,8,
+    90,118,104,234,210,240,144,252,21,104,93,163,75,48,227,239,
+    115,107,7,224,221,120,203,45,244,234,181,46,118,159,32,40,
+    86,227,189,25,46,170,8,10,72,121,128,8,197,19,98,8,
+    160,140,8,183,159,4,68,56,60,161,224,174,162,75,24,193,
+    139,74,57,50,114,35,184,110,255,1,207,54,226,1,185,216,
+    161,70,160,235,36,68,76,66,112,40,122,30,17,220,130,44,
+    135,215,36,139,62,42,252,50,35,128,152,224,15,6,101,59,
+    151,97,33,132,203,22,100,181,58,209,159,19,100,35,155,164,
+    16,171,16,90,146,99,103,68,65,224,101,201,5,178,44,0,
+    154,151,197,114,34,61,84,24,165,116,103,166,53,174,95,103,
+    166,219,17,7,37,136,1,234,94,109,29,200,8,14,103,156,
+    45,136,7,157,40,30,108,150,108,192,226,215,34,227,4,32,
+    235,116,175,203,143,218,129,45,108,106,249,86,243,55,129,157,
+    71,214,186,25,89,235,230,218,191,170,109,126,165,231,70,239,
+    114,47,72,235,206,6,64,6,155,251,243,148,193,217,73,128,
+    194,109,235,244,238,13,107,141,205,183,76,169,206,239,109,253,
+    206,214,213,238,76,199,62,169,99,95,166,113,80,106,28,76,
+    147,227,147,181,150,62,148,38,54,148,0,112,205,73,38,175,
+    135,16,96,153,123,174,150,228,11,55,142,37,142,0,167,157,
+    124,250,198,241,132,47,225,83,184,212,116,203,161,140,227,49,
+    201,1,136,238,177,2,227,250,207,192,224,182,23,26,133,128,
+    251,8,30,80,154,184,106,128,112,164,85,238,117,83,45,29,
+    43,190,180,125,7,30,220,142,8,218,231,127,109,195,136,81,
+    255,59,3,195,245,186,119,122,54,31,118,48,239,218,105,8,
+    191,235,48,31,222,96,124,183,89,135,225,86,26,195,27,246,
+    66,248,61,55,13,201,223,171,223,56,252,8,251,222,35,122,
+    8,191,111,100,70,44,198,247,107,104,128,213,241,236,61,234,
+    243,185,131,148,179,163,159,199,215,160,168,74,250,236,210,117,
+    255,15,165,235,17,187,95,102,46,179,136,3,98,250,24,19,
+    99,99,140,200,162,94,116,17,166,103,8,88,98,158,185,101,
+    64,151,210,197,200,68,149,69,85,68,179,87,84,12,42,203,
+    128,212,30,224,202,218,171,34,67,117,198,143,11,147,42,146,
+    41,51,95,193,26,202,114,195,185,129,197,157,10,90,25,62,
+    254,212,248,68,79,175,183,15,66,67,199,124,39,135,125,61,
+    39,159,122,178,7,139,128,184,109,94,53,3,182,120,226,51,
+    50,145,135,144,108,101,119,138,40,71,85,166,92,179,51,133,
+    38,243,26,114,6,249,49,57,11,57,79,17,111,25,130,150,
+    114,86,185,104,57,42,103,147,145,137,108,112,139,160,98,38,
+    26,8,3,175,83,142,176,194,33,1,216,36,194,1,253,59,
+    140,53,6,195,103,112,245,162,140,234,16,11,137,41,0,17,
+    36,113,106,76,196,46,68,80,117,161,118,43,33,49,123,17,
+    31,161,219,27,113,69,109,105,191,181,249,91,91,191,185,53,
+    107,29,2,124,210,130,250,136,22,243,95,153,107,175,247,92,
+    235,93,234,189,207,82,166,198,184,33,97,132,148,29,221,175,
+    55,124,175,253,59,237,32,9,219,30,185,175,215,119,64,90,
+    0,127,103,160,44,117,74,106,35,101,106,135,212,134,164,1,
+    228,225,134,13,217,150,142,108,125,107,182,181,35,187,97,83,
+    214,187,53,237,222,155,120,6,36,124,119,87,218,221,181,122,
+    18,164,112,135,25,164,112,2,76,230,234,138,69,50,131,30,
+    167,100,78,229,234,231,153,69,186,135,11,70,196,153,172,194,
+    215,155,104,105,59,200,99,206,200,58,90,189,60,177,128,185,
+    33,67,159,167,110,233,111,16,29,173,151,134,62,34,108,59,
+    113,64,35,122,65,89,99,75,120,233,28,39,119,123,128,47,
+    221,47,40,109,61,5,165,45,170,216,100,165,173,154,199,150,
+    199,141,138,197,46,38,59,134,93,182,87,238,50,138,197,6,
+    43,128,63,119,116,38,184,100,103,10,112,52,229,106,77,77,
+    172,238,74,91,247,194,145,215,107,146,145,198,93,220,170,12,
+    252,0,47,59,71,43,238,208,106,225,228,248,137,17,223,9,
+    207,225,231,200,125,32,167,197,193,88,225,198,139,99,113,209,
+    89,81,253,39,176,170,123,228,170,234,10,143,191,215,211,247,
+    150,241,71,246,239,219,129,55,134,81,230,69,158,218,91,147,
+    103,225,214,125,188,255,64,169,104,97,20,168,113,83,113,20,
+    200,221,163,245,43,136,149,137,225,216,61,139,123,143,207,11,
+    33,149,104,71,86,70,22,181,248,126,92,150,26,137,130,224,
+    54,71,240,20,10,156,242,162,219,1,47,157,179,78,141,97,
+    158,19,32,214,9,98,193,99,11,5,15,173,79,33,250,170,
+    42,170,65,181,1,189,20,125,18,155,161,150,52,195,135,246,
+    150,228,72,170,39,99,223,34,217,183,164,57,89,131,158,211,
+    135,23,162,26,235,177,185,240,158,75,240,164,151,168,151,204,
+    47,89,94,178,222,68,161,159,46,9,253,56,28,121,149,171,
+    228,101,230,218,122,206,93,101,92,251,117,235,186,41,153,152,
+    126,209,128,107,149,42,242,88,52,118,104,141,2,164,204,115,
+    131,89,132,250,95,55,199,205,113,42,110,137,91,103,24,180,
+    209,2,221,208,125,30,58,163,181,95,95,83,121,90,87,216,
+    187,141,106,119,178,152,113,61,190,94,147,234,33,245,126,152,
+    173,25,36,139,189,132,190,114,151,77,49,211,21,122,137,131,
+    183,169,110,253,54,196,56,104,67,144,55,22,43,74,33,170,
+    19,174,106,174,10,30,125,105,159,9,213,62,240,251,220,188,
+    185,110,29,59,182,1,40,116,245,186,172,247,6,85,211,243,
+    72,219,141,139,119,139,4,250,25,116,172,90,119,110,161,45,
+    206,19,17,132,115,184,222,88,109,38,28,240,156,88,8,161,
+    178,167,88,144,106,105,173,188,232,235,92,96,126,30,104,59,
+    80,65,92,19,29,157,245,135,60,232,197,5,19,83,89,193,
+    43,92,34,9,131,194,12,78,226,98,65,179,97,92,98,28,
+    14,201,230,200,200,165,8,154,17,60,145,133,249,249,176,72,
+    150,235,202,203,128,229,165,200,42,253,12,89,211,68,176,55,
+    161,163,56,96,52,100,1,71,62,33,11,184,90,226,85,6,
+    57,184,34,183,69,76,119,231,72,255,136,186,107,108,136,190,
+    102,40,92,161,130,229,26,147,170,214,200,208,250,229,238,120,
+    5,211,23,82,53,175,49,199,160,13,36,199,146,181,57,178,
+    229,130,9,250,1,87,17,137,132,137,250,3,193,28,131,13,
+    87,16,59,174,192,159,140,145,24,220,10,97,177,83,133,139,
+    100,23,184,50,219,24,166,194,183,140,12,82,196,108,145,109,
+    245,92,123,50,238,75,236,201,218,221,169,174,149,93,223,233,
+    79,245,39,59,147,157,171,19,119,237,131,105,251,96,182,161,
+    37,17,205,214,53,220,60,244,202,161,212,158,76,93,175,84,
+    215,155,182,246,18,20,54,238,53,139,232,176,43,155,128,152,
+    168,0,130,85,201,206,100,18,128,23,196,245,199,130,120,133,
+    220,199,97,33,226,122,145,28,23,21,23,66,211,112,199,107,
+    83,41,118,126,147,42,44,52,35,157,242,187,152,146,141,68,
+    253,98,84,68,102,69,68,151,36,217,71,240,63,32,64,39,
+    107,241,119,0,68,208,69,227,84,201,118,243,152,98,189,177,
+    168,26,96,177,190,122,195,60,131,77,241,61,0,32,49,160,
+    17,199,74,213,183,37,131,146,123,75,220,156,181,55,36,13,
+    146,189,61,206,100,237,117,31,216,61,119,237,158,84,115,198,
+    222,39,217,251,212,81,174,21,115,102,227,142,244,198,199,86,
+    207,102,236,67,146,125,40,206,160,27,221,222,228,81,169,174,
+    75,118,51,92,113,102,236,189,113,38,207,48,166,45,121,234,
+    179,129,149,114,186,110,114,175,112,55,204,203,230,56,187,102,
+    107,79,49,175,91,51,182,126,201,214,143,140,146,103,213,181,
+    214,222,147,117,144,52,73,215,237,75,43,141,171,61,146,247,
+    209,76,251,126,169,125,127,198,113,64,114,28,0,26,235,65,
+    26,235,169,1,9,208,230,33,224,134,37,193,38,162,192,199,
+    185,26,19,251,179,174,214,172,163,142,148,224,78,185,87,154,
+    51,27,119,102,154,118,102,28,187,36,199,174,180,99,23,222,
+    51,189,98,74,118,222,176,47,219,19,240,203,219,176,24,189,
+    17,125,7,11,224,62,130,7,148,38,174,26,32,210,88,149,
+    123,14,202,100,125,217,122,221,154,120,42,57,113,227,151,50,
+    92,135,196,117,164,185,142,44,103,121,153,187,206,37,220,73,
+    215,141,214,12,215,38,113,109,233,194,17,193,9,249,174,117,
+    104,219,136,73,255,190,137,25,177,25,223,119,208,0,223,212,
+    137,125,56,34,223,164,69,244,103,241,122,68,212,148,136,232,
+    122,36,34,17,206,213,142,248,70,135,158,58,54,49,53,124,
+    244,169,241,39,166,78,142,77,250,114,122,152,88,57,125,32,
+    20,21,145,244,138,91,200,208,156,23,129,134,139,209,75,226,
+    54,188,52,15,203,171,192,2,225,144,204,9,225,218,37,145,
+    37,227,249,116,56,28,148,53,12,68,129,64,102,2,234,29,
+    136,213,148,24,76,201,172,22,145,66,137,56,95,197,87,17,
+    224,98,3,241,219,8,190,143,0,177,55,97,165,196,223,64,
+    240,19,74,225,38,101,69,41,97,180,26,10,0,117,20,145,
+    43,58,245,18,247,60,71,181,244,103,221,245,217,141,93,121,
+    75,3,123,132,206,83,8,239,213,56,243,44,185,52,80,238,
+    198,188,145,4,57,202,81,151,55,145,160,153,170,109,78,110,
+    90,222,160,206,163,129,59,40,67,77,94,87,203,54,38,142,
+    72,174,110,144,158,217,198,18,184,175,135,187,87,159,37,247,
+    243,61,122,182,53,79,105,129,153,50,184,242,58,19,59,144,
+    140,230,41,56,149,0,102,117,93,253,10,185,153,175,167,217,
+    81,58,85,151,167,240,188,162,156,171,64,3,203,214,99,50,
+    56,173,200,167,114,80,67,179,219,146,93,152,124,91,106,152,
+    156,202,129,193,198,182,167,118,230,41,56,173,8,228,116,71,
+    79,78,229,160,205,200,214,224,195,224,180,226,38,167,114,80,
+    59,66,99,67,32,76,94,148,207,43,17,249,124,103,68,62,
+    87,129,199,116,141,172,11,216,116,10,78,43,46,114,42,7,
+    187,26,216,157,137,17,236,129,157,229,96,135,147,53,195,228,
+    165,224,84,14,186,13,172,57,201,36,39,110,193,181,129,173,
+    0,14,29,219,151,218,149,167,224,180,114,148,156,202,1,215,
+    10,77,3,143,133,211,202,69,114,186,35,95,173,11,228,193,
+    137,67,82,179,167,66,65,223,250,209,4,165,221,16,66,208,
+    243,58,178,123,129,254,42,51,201,242,140,96,224,89,193,8,
+    215,6,184,230,248,26,220,71,65,137,49,93,101,39,205,188,
+    157,183,192,29,11,111,189,74,77,90,113,243,168,73,27,49,
+    38,57,196,85,124,242,133,2,209,208,48,208,69,65,225,31,
+    200,227,65,110,83,175,154,213,169,217,104,184,83,36,194,49,
+    122,157,85,74,58,53,163,93,177,77,128,190,122,58,245,6,
+    2,100,233,127,81,9,173,118,27,214,178,191,144,202,168,201,
+    83,90,241,80,87,202,19,163,75,78,146,21,181,41,178,187,
+    100,97,29,51,46,243,52,132,154,146,37,83,214,156,65,222,
+    51,35,103,84,244,13,4,97,229,88,178,4,39,103,153,82,
+    111,202,48,21,18,46,70,69,124,65,72,141,28,131,192,67,
+    32,60,51,131,6,25,149,39,201,20,58,95,20,140,51,197,
+    62,209,24,103,8,86,93,116,171,133,170,226,194,240,75,72,
+    124,209,177,3,216,144,250,150,56,179,100,201,54,180,167,56,
+    169,193,75,214,117,187,155,63,112,111,190,235,222,188,194,173,
+    182,74,61,7,51,238,67,146,251,16,89,8,222,178,41,117,
+    76,106,217,142,235,189,27,1,247,97,220,199,6,170,113,195,
+    141,11,203,23,72,214,134,70,60,173,65,94,246,45,91,198,
+    189,71,114,239,193,68,32,156,200,242,165,172,191,69,138,81,
+    125,69,16,90,191,228,1,84,210,54,40,252,157,235,243,121,
+    230,158,212,44,114,171,238,171,94,238,18,85,224,6,89,241,
+    63,81,5,90,242,159,17,252,17,85,160,37,71,168,138,165,
+    67,132,239,171,213,54,48,198,125,163,36,135,103,45,206,196,
+    196,242,228,93,75,123,218,210,190,86,215,152,116,73,77,222,
+    34,47,7,188,204,210,47,127,96,239,186,107,239,74,205,100,
+    236,253,146,189,63,205,245,147,118,250,249,63,193,31,97,199,
+    52,237,84,92,94,148,215,201,10,147,203,48,185,136,100,74,
+    203,222,164,17,99,12,174,228,112,130,22,191,172,110,199,200,
+    171,106,219,145,218,187,95,221,98,218,150,41,240,214,9,58,
+    180,69,157,74,93,146,166,84,149,188,133,82,205,55,52,18,
+    115,140,186,72,175,83,131,50,123,21,218,115,166,117,83,234,
+    103,20,211,126,182,15,245,58,146,150,106,65,19,60,239,33,
+    242,167,118,217,190,70,11,192,106,106,93,102,197,186,108,32,
+    61,65,82,136,45,26,20,98,208,120,90,211,216,54,32,183,
+    154,43,22,96,25,64,78,84,73,208,234,103,105,125,181,191,
+    177,46,138,68,219,148,246,121,248,28,98,33,131,248,135,213,
+    95,233,237,141,154,214,174,186,223,73,197,138,116,90,189,159,
+    74,200,136,207,159,82,189,47,95,28,147,171,143,171,71,232,
+    234,151,121,221,58,203,182,42,36,54,92,138,138,21,148,125,
+    5,107,68,220,32,66,252,99,74,17,131,196,255,136,224,50,
+    130,127,137,224,46,130,43,8,36,10,149,62,115,129,144,152,
+    193,203,175,226,165,113,62,60,143,226,44,89,197,90,88,11,
+    69,252,218,88,144,89,163,17,241,87,49,226,101,18,65,16,
+    116,78,47,132,248,10,155,19,113,226,91,116,106,112,0,250,
+    37,92,71,20,240,60,49,60,101,29,181,113,54,235,172,141,
+    27,178,53,181,137,47,95,159,141,207,38,187,83,187,190,217,
+    255,90,63,72,119,203,251,129,141,178,29,161,49,56,248,70,
+    93,106,226,245,95,2,161,70,218,184,227,110,221,142,116,221,
+    142,63,117,161,243,212,45,43,196,79,174,118,190,221,251,251,
+    231,51,59,124,233,46,159,212,56,154,96,65,16,73,128,160,
+    114,123,58,213,245,218,217,91,103,51,142,30,188,132,216,101,
+    235,7,142,77,119,29,155,82,35,175,63,254,189,241,239,140,
+    175,238,122,123,240,206,66,166,211,39,117,250,50,142,81,201,
+    49,154,118,140,222,115,53,46,31,75,57,151,143,199,125,107,
+    181,238,132,128,54,172,248,48,160,164,196,11,215,47,197,47,
+    173,213,55,37,55,37,163,183,98,43,124,166,125,199,234,211,
+    153,246,71,51,245,251,165,250,253,9,125,214,234,124,249,216,
+    245,99,73,55,185,61,157,110,223,46,53,237,200,88,119,74,
+    214,157,105,235,206,172,181,54,49,157,28,185,117,44,83,223,
+    147,177,246,196,71,179,246,218,87,167,147,93,55,206,46,159,
+    5,177,45,109,247,40,53,236,188,235,232,44,153,159,218,61,
+    9,102,217,154,176,222,107,239,192,64,190,139,130,154,64,107,
+    93,43,182,86,190,27,184,232,151,47,94,191,152,100,149,149,
+    82,178,44,92,125,163,5,84,217,126,30,211,79,229,214,10,
+    5,98,160,35,67,40,199,69,102,23,162,124,248,66,168,250,
+    110,10,90,252,79,246,83,248,14,118,62,210,105,232,124,206,
+    186,100,254,128,107,185,203,181,20,215,122,201,71,165,206,157,
+    46,84,221,160,84,93,237,46,82,254,240,156,105,106,74,8,
+    129,132,63,53,181,88,95,70,227,149,248,55,104,197,72,74,
+    86,223,197,45,213,119,165,192,4,31,13,80,15,91,172,186,
+    126,19,209,164,13,20,93,109,142,241,139,103,34,26,26,201,
+    65,101,46,146,237,105,202,249,16,57,122,5,171,88,87,104,
+    41,116,13,185,102,93,178,198,201,79,158,229,180,248,39,248,
+    246,239,80,100,198,107,69,75,89,60,35,242,29,242,58,226,
+    251,84,129,118,227,140,23,127,74,41,243,83,22,29,255,12,
+    193,127,43,182,103,73,200,91,45,128,243,88,155,223,160,52,
+    66,158,193,204,62,146,60,155,167,224,180,58,66,78,229,160,
+    81,15,194,214,48,74,95,3,41,31,57,149,3,115,61,50,
+    239,0,146,117,228,148,18,200,169,28,108,163,217,54,148,152,
+    212,192,64,163,132,82,4,112,233,198,80,57,144,223,134,188,
+    200,57,210,238,211,231,230,163,83,124,64,204,25,34,11,51,
+    51,129,139,149,28,87,145,147,248,10,128,151,104,173,118,63,
+    78,207,0,198,190,202,173,179,36,249,179,28,224,202,241,182,
+    110,188,194,60,75,188,165,190,78,161,111,126,209,95,106,31,
+    250,75,85,31,130,234,138,196,117,80,57,10,42,167,98,237,
+    30,94,5,237,213,143,118,199,10,62,89,131,242,142,121,21,
+    202,71,82,187,14,109,237,76,88,187,107,58,36,220,74,110,
+    115,153,71,151,94,182,66,209,17,241,47,169,34,51,126,69,
+    229,213,213,57,85,97,103,42,184,114,149,66,171,56,10,113,
+    15,128,79,20,175,174,182,97,56,86,252,201,23,82,123,94,
+    91,148,175,212,135,162,16,212,231,56,36,80,184,205,97,142,
+    141,46,0,113,203,217,167,198,158,28,58,226,155,58,249,212,
+    232,232,216,179,190,147,133,10,50,184,66,120,189,58,54,175,
+    95,199,31,98,205,102,74,53,203,83,76,173,129,128,123,86,
+    71,214,98,127,249,192,245,3,183,221,234,186,253,214,33,0,
+    153,182,97,9,96,211,176,212,52,156,177,140,72,150,145,188,
+    17,242,192,132,207,235,11,5,84,3,50,2,208,195,16,14,
+    227,14,143,178,231,136,17,13,115,48,176,1,231,224,26,3,
+    249,45,8,202,57,165,184,164,41,245,23,255,22,174,222,194,
+    26,251,40,162,111,93,179,56,171,61,229,67,87,253,242,227,
+    201,139,25,87,143,228,234,201,179,16,115,31,163,31,80,114,
+    200,138,33,43,38,101,229,10,201,107,15,213,3,166,232,0,
+    107,166,43,173,100,21,86,20,122,157,57,85,177,33,197,23,
+    91,164,190,174,43,107,89,185,154,245,103,36,135,232,85,91,
+    108,120,93,140,34,171,106,63,103,121,213,87,220,226,118,22,
+    94,118,92,92,192,242,209,64,191,184,121,51,238,241,134,254,
+    166,11,33,197,64,32,240,37,235,133,178,234,195,211,243,41,
+    237,245,26,228,85,235,204,217,72,56,68,148,209,226,19,8,
+    190,129,0,215,217,194,56,38,246,93,92,93,91,41,247,230,
+    108,100,45,109,113,185,1,110,106,249,54,142,3,20,237,96,
+    24,152,108,113,254,90,243,82,51,34,78,79,226,133,53,96,
+    188,246,37,191,124,99,255,242,254,56,151,215,67,28,185,65,
+    192,125,4,15,40,77,92,53,32,175,152,173,136,190,103,180,
+    191,20,251,122,44,49,150,49,182,73,198,182,63,233,216,113,
+    215,184,35,109,220,177,86,179,1,13,249,91,18,12,46,167,
+    221,66,64,214,209,72,54,162,122,46,227,216,44,57,54,227,
+    250,221,45,165,187,247,245,122,59,154,252,237,102,92,109,107,
+    206,115,148,213,117,229,120,4,57,243,132,123,187,254,55,152,
+    221,198,59,244,238,42,206,217,69,44,255,54,37,83,120,232,
+    47,250,182,238,178,78,51,74,117,85,118,81,210,175,55,78,
+    43,183,61,248,130,219,41,168,100,179,146,181,17,55,165,168,
+    182,135,17,242,252,184,191,104,142,190,0,210,57,89,139,253,
+    191,200,224,224,23,230,230,229,205,104,78,81,196,3,96,83,
+    97,52,136,211,133,193,161,53,254,3,62,148,237,15,197,161,
+    241,119,16,251,99,28,26,55,201,208,200,218,156,241,126,252,
+    93,25,198,81,50,157,216,121,173,109,137,16,226,246,228,246,
+    53,224,228,76,137,158,228,80,81,47,142,131,165,157,220,37,
+    0,7,75,251,3,74,19,87,13,40,131,165,60,250,67,198,
+    112,245,241,120,36,49,146,97,154,36,166,41,93,56,72,39,
+    255,219,250,189,250,59,204,126,227,143,233,253,198,234,155,229,
+    141,82,229,184,71,171,45,81,19,203,135,73,190,196,138,127,
+    232,153,89,65,49,5,86,221,234,88,181,203,176,95,94,43,
+    239,47,108,168,72,204,60,48,65,127,134,125,240,183,164,213,
+    139,11,148,100,58,244,38,77,48,183,134,151,13,68,100,21,
+    25,47,254,31,184,254,3,236,146,102,210,37,31,90,236,175,
+    26,147,220,27,91,51,142,29,146,99,71,198,178,83,178,236,
+    76,51,59,9,42,30,37,154,175,28,131,123,117,107,212,145,
+    69,140,252,155,180,162,37,209,63,108,65,220,8,245,252,251,
+    151,153,47,182,119,105,185,254,224,50,187,142,255,43,91,65,
+    1,12,235,250,196,26,214,169,67,117,109,70,185,7,173,182,
+    62,248,225,1,186,124,87,135,135,204,74,205,90,241,104,109,
+    233,138,104,42,42,246,47,141,233,34,218,93,88,75,178,62,
+    91,169,141,88,71,163,81,225,147,187,244,211,152,30,25,178,
+    197,127,32,198,226,39,11,238,174,218,49,216,83,218,25,190,
+    79,222,181,190,183,184,97,242,169,83,133,101,4,167,113,139,
+    49,65,222,65,116,38,44,206,249,163,222,138,209,43,27,205,
+    201,122,3,121,29,172,188,97,59,58,184,225,66,134,226,6,
+    226,202,74,6,101,125,43,142,183,65,207,19,0,213,219,156,
+    171,173,231,196,129,85,217,113,125,78,54,124,87,95,216,170,
+    221,201,93,177,145,143,123,173,100,234,148,239,181,133,152,64,
+    182,85,17,115,22,58,254,19,20,38,254,61,2,220,197,137,
+    232,54,188,156,172,17,38,252,17,42,228,115,166,226,227,196,
+    191,41,22,73,214,245,17,234,137,211,197,163,214,106,228,28,
+    164,77,166,74,45,37,254,19,68,255,17,206,75,7,81,106,
+    228,93,148,179,238,202,216,154,163,33,201,101,28,27,37,199,
+    70,52,208,108,34,0,205,176,133,173,188,142,166,120,217,249,
+    6,34,109,13,146,173,35,181,171,176,36,143,54,249,232,21,
+    95,182,161,245,230,139,175,188,152,90,248,225,233,183,206,252,
+    40,252,253,240,29,62,51,48,44,13,12,103,26,70,164,134,
+    145,248,81,220,121,197,71,203,201,101,120,159,192,7,84,121,
+    252,122,80,217,132,165,218,173,15,185,134,36,115,251,197,76,
+    227,192,42,87,218,43,198,142,246,48,83,235,154,181,102,105,
+    44,193,95,59,190,116,60,126,60,203,57,63,224,26,239,114,
+    141,201,198,162,185,20,45,166,22,87,154,113,17,111,163,119,
+    184,93,135,57,246,93,142,57,108,53,189,107,167,1,86,223,
+    162,12,229,45,212,112,127,77,23,3,225,67,189,121,219,215,
+    140,234,171,147,101,24,92,107,68,209,24,72,202,253,176,128,
+    102,146,17,128,56,20,24,101,162,196,110,144,195,132,64,226,
+    77,141,156,110,47,210,68,25,15,139,128,23,168,63,199,238,
+    222,65,17,202,104,180,166,141,141,89,187,43,110,93,51,218,
+    210,198,166,53,220,222,107,205,226,78,204,38,47,72,245,155,
+    87,26,87,251,36,239,161,140,229,49,201,242,88,154,121,76,
+    230,148,113,227,0,178,65,81,117,228,252,191,117,149,236,178,
+    26,1,150,111,231,144,160,159,247,3,34,87,17,178,207,84,
+    243,83,229,204,10,160,121,181,123,82,153,210,25,144,184,74,
+    21,25,99,203,93,220,0,117,51,60,29,181,151,210,104,234,
+    171,41,203,162,85,125,27,99,198,234,174,72,229,78,147,226,
+    104,204,176,142,99,81,37,41,225,162,238,210,253,210,14,90,
+    49,35,175,39,104,155,171,96,169,190,16,81,8,205,168,119,
+    221,58,107,43,47,159,103,98,186,183,88,237,38,28,88,171,
+    24,203,27,74,25,129,188,246,94,54,197,184,117,182,221,48,
+    164,236,85,227,77,15,147,225,129,84,108,49,125,193,183,209,
+    108,103,84,92,206,81,108,171,74,18,103,72,169,136,162,170,
+    102,21,4,78,83,114,145,116,86,238,59,150,160,151,166,137,
+    198,193,232,119,211,202,134,15,178,87,215,105,255,244,185,207,
+    230,182,250,10,180,77,166,103,178,99,214,5,65,148,55,124,
+    40,120,104,147,29,22,100,114,70,22,98,201,228,172,176,191,
+    81,64,249,232,133,150,164,145,40,101,147,240,226,55,76,180,
+    223,28,25,240,140,200,187,107,23,63,54,161,124,219,162,202,
+    226,60,82,70,159,71,192,165,126,74,98,185,88,242,113,143,
+    162,212,135,11,255,20,71,51,72,166,16,191,79,25,164,227,
+    132,233,23,159,161,200,215,18,108,133,29,151,200,142,200,196,
+    192,234,173,147,73,36,33,125,101,116,18,37,62,130,193,100,
+    187,0,126,214,65,38,155,132,128,254,132,66,158,17,191,40,
+    35,139,19,104,168,150,77,124,167,168,130,147,8,210,82,175,
+    89,166,160,4,147,146,109,214,74,180,19,177,104,193,201,92,
+    70,152,132,154,18,129,148,44,232,67,110,168,212,28,50,146,
+    117,10,23,81,236,85,83,85,35,84,18,63,9,17,249,107,
+    66,85,63,6,170,218,88,226,118,243,84,13,219,120,31,193,
+    122,36,181,206,147,114,101,234,186,165,186,238,56,183,86,223,
+    149,154,93,101,51,245,123,164,250,61,113,75,214,225,74,187,
+    251,110,235,111,31,207,52,246,73,141,125,233,134,62,184,150,
+    28,253,113,54,107,113,188,124,240,250,193,100,119,198,178,81,
+    178,0,229,54,152,246,103,157,173,202,174,143,92,198,185,93,
+    114,146,157,158,6,87,191,188,230,104,150,28,221,169,133,149,
+    243,223,254,234,234,11,25,199,62,201,177,47,237,216,135,242,
+    233,32,73,66,0,110,45,53,248,128,210,196,85,3,202,214,
+    82,21,209,31,27,112,37,120,83,114,119,106,207,107,7,87,
+    118,221,89,72,59,125,25,167,79,114,250,112,181,202,254,159,
+    57,179,109,221,169,139,82,27,122,148,56,247,19,144,24,205,
+    186,220,55,143,188,114,36,249,196,7,173,59,238,182,238,88,
+    221,147,105,29,148,90,7,51,174,71,37,215,163,105,114,64,
+    53,33,185,30,138,32,229,16,112,31,193,3,74,19,87,13,
+    144,186,86,70,67,85,77,150,37,115,98,119,114,207,141,131,
+    169,221,25,206,43,113,222,52,231,205,114,117,178,158,63,121,
+    180,184,182,17,55,166,51,37,58,175,217,151,236,113,251,53,
+    123,126,67,13,250,164,0,32,139,54,223,109,111,26,102,216,
+    247,24,102,152,51,189,103,161,17,246,238,26,217,194,190,191,
+    133,25,217,106,122,127,7,13,176,58,11,225,160,149,229,131,
+    186,207,79,61,159,159,251,255,75,59,63,159,16,131,11,92,
+    120,157,188,152,79,131,85,213,134,219,114,74,16,34,234,38,
+    253,226,191,38,8,228,68,9,235,125,150,236,122,58,188,64,
+    100,128,211,130,135,135,92,81,5,123,146,98,170,160,74,13,
+    7,95,177,220,166,176,16,89,70,99,178,161,18,219,203,107,
+    250,60,152,170,132,118,12,37,180,147,227,10,133,150,225,158,
+    138,5,39,181,74,66,53,114,65,117,36,3,213,136,124,141,
+    34,44,123,45,229,112,94,57,74,88,246,18,134,97,113,68,
+    178,159,19,195,88,154,147,123,83,79,101,44,91,36,203,150,
+    15,44,59,239,90,118,174,30,205,88,14,72,150,3,200,48,
+    55,103,173,174,36,125,237,201,248,81,205,184,143,219,179,150,
+    186,43,199,11,123,193,226,102,198,106,118,16,89,29,50,168,
+    143,233,255,121,52,24,48,204,171,107,152,42,172,22,192,80,
+    158,131,65,173,254,120,64,113,200,173,35,161,87,248,13,92,
+    102,209,135,255,60,37,62,80,179,133,149,126,1,26,249,218,
+    16,211,149,75,235,95,168,22,52,97,67,85,222,5,154,182,
+    121,8,27,90,246,84,14,152,178,170,91,184,86,48,165,62,
+    96,95,171,203,240,134,10,166,212,180,14,211,200,197,76,188,
+    254,45,70,203,46,126,81,150,116,233,191,68,55,168,158,206,
+    85,217,8,214,4,117,173,238,81,96,0,166,242,23,98,136,
+    129,129,107,209,140,174,98,159,175,211,127,170,85,195,170,122,
+    148,141,142,47,218,247,101,163,191,172,238,80,199,57,194,100,
+    26,22,147,4,21,141,6,240,99,122,56,241,78,201,95,193,
+    210,124,49,76,254,76,88,5,106,12,41,95,204,34,223,81,
+    147,191,29,134,101,61,244,251,97,192,158,14,8,3,218,130,
+    206,8,115,187,61,211,68,37,162,224,82,194,228,225,98,110,
+    52,68,225,2,59,58,199,78,135,121,97,90,230,246,156,226,
+    107,148,162,58,84,161,204,255,73,125,65,14,79,54,33,24,
+    35,151,230,200,66,99,164,183,5,134,206,66,23,184,186,127,
+    164,42,184,58,209,64,23,116,35,68,131,92,141,145,179,204,
+    161,107,125,192,31,12,44,10,34,210,226,6,196,178,255,40,
+    179,112,53,148,211,245,234,145,228,209,55,194,242,199,79,228,
+    143,74,160,170,164,118,185,184,46,55,79,217,217,163,244,125,
+    2,215,193,188,89,139,61,177,47,109,105,133,99,173,161,51,
+    53,145,105,232,149,26,122,1,183,54,123,87,122,86,125,153,
+    230,65,169,121,48,254,132,252,245,22,178,243,80,42,154,238,
+    27,254,97,228,183,14,101,182,14,75,91,135,211,3,195,112,
+    45,109,30,201,184,124,146,203,23,247,129,248,254,242,87,175,
+    127,53,57,147,177,119,73,246,174,60,101,180,237,203,27,168,
+    250,141,31,184,183,220,117,111,89,57,154,113,239,150,220,187,
+    145,187,26,166,239,56,215,92,109,146,171,119,101,247,234,198,
+    59,123,210,174,195,25,215,97,201,117,24,2,200,83,13,211,
+    114,42,25,222,39,240,1,85,30,191,30,148,185,192,234,183,
+    200,6,191,201,46,32,58,238,110,201,221,141,177,251,86,54,
+    102,93,237,31,184,182,220,117,65,37,87,253,25,215,94,201,
+    181,55,237,218,139,53,217,71,82,16,128,213,216,247,128,210,
+    196,85,3,202,227,203,163,255,30,30,109,179,47,61,254,170,
+    184,124,129,168,164,162,153,134,62,169,161,143,40,166,130,223,
+    15,222,217,245,19,87,102,96,84,26,24,205,88,143,72,214,
+    35,105,235,17,8,228,219,177,15,229,254,36,92,221,123,29,
+    141,35,6,246,125,3,51,98,54,189,111,163,17,118,52,248,
+    88,246,167,44,227,51,153,126,106,165,1,150,190,236,83,125,
+    185,29,110,136,255,89,203,237,252,180,108,187,94,252,21,178,
+    180,162,58,187,163,253,36,32,204,121,255,57,16,181,200,172,
+    13,133,47,224,202,29,89,160,44,201,143,24,113,10,191,64,
+    117,170,32,67,250,121,181,150,19,10,85,102,50,175,41,153,
+    148,25,136,14,224,62,0,196,45,3,149,78,16,46,190,169,
+    70,223,100,144,69,71,177,22,94,113,59,78,30,204,2,147,
+    135,163,106,26,147,76,242,108,198,230,149,108,222,43,163,248,
+    147,221,86,212,56,176,232,227,227,162,202,191,127,192,83,11,
+    116,201,57,133,40,190,180,222,30,57,163,34,181,138,46,120,
+    246,94,157,178,136,133,152,135,147,174,180,101,67,154,169,226,
+    154,83,236,153,195,21,79,252,90,131,154,77,81,223,169,98,
+    208,130,186,41,189,214,57,236,15,226,119,33,195,100,215,69,
+    205,167,68,139,50,49,105,76,242,14,168,125,21,63,165,180,
+    86,19,91,56,164,102,247,234,225,214,126,93,241,115,10,31,
+    202,122,58,174,241,118,125,170,49,195,245,74,92,111,186,112,
+    228,245,20,215,12,119,43,95,20,105,14,226,194,143,116,116,
+    181,175,182,148,243,80,17,67,76,113,134,32,175,166,227,245,
+    65,122,78,119,153,94,207,202,199,51,49,186,68,225,222,42,
+    163,221,151,117,38,141,171,118,140,42,231,147,208,238,160,124,
+    127,69,197,109,169,132,3,93,213,111,173,209,100,55,233,47,
+    144,163,184,99,52,183,248,199,100,110,104,191,198,6,164,83,
+    153,4,218,174,195,73,48,88,254,29,78,249,147,172,125,164,
+    152,133,16,16,219,136,138,168,170,191,189,70,204,104,165,15,
+    113,202,75,238,160,176,80,145,220,98,10,89,56,169,252,30,
+    104,95,113,7,38,152,213,232,93,85,34,206,202,231,42,11,
+    164,23,223,19,136,174,49,76,182,249,139,44,114,202,187,244,
+    123,117,57,195,188,40,204,4,46,230,244,80,238,4,106,94,
+    2,103,66,104,9,16,112,243,249,8,136,50,104,159,203,233,
+    230,118,139,141,52,89,78,6,21,65,14,34,103,156,59,199,
+    227,69,206,0,50,21,100,38,116,17,191,91,129,159,143,204,
+    25,196,185,168,40,8,94,189,76,129,49,47,33,195,90,195,
+    189,69,169,8,58,46,137,29,112,251,48,14,103,92,161,163,
+    124,32,166,134,178,186,19,207,102,44,109,146,165,13,23,80,
+    216,179,53,245,241,26,252,101,185,154,184,225,30,211,156,214,
+    30,31,90,234,36,75,75,106,112,245,145,183,15,166,45,135,
+    51,150,195,146,229,240,149,145,188,142,97,183,173,113,117,137,
+    163,73,62,195,109,146,184,77,105,110,83,182,166,54,78,252,
+    212,63,228,106,150,108,9,126,165,51,205,109,205,112,91,37,
+    14,191,244,32,31,159,252,138,161,234,45,220,207,26,217,227,
+    223,117,13,117,83,239,116,55,14,29,212,139,239,146,102,30,
+    245,234,198,101,69,56,193,73,59,115,198,169,41,62,60,61,
+    53,37,30,192,72,220,36,73,254,86,5,90,181,101,94,199,
+    131,113,184,6,74,220,128,161,127,133,33,178,245,184,69,249,
+    154,41,246,154,188,70,160,22,186,118,122,65,196,47,175,14,
+    204,44,128,116,42,68,200,42,1,220,198,159,244,121,48,112,
+    90,94,51,101,136,94,194,111,43,171,150,68,225,20,144,215,
+    64,145,53,88,232,55,38,179,79,132,235,250,107,170,224,113,
+    241,30,2,226,86,139,168,40,103,42,110,16,41,239,121,78,
+    144,61,241,60,35,238,119,132,111,35,236,25,177,76,17,51,
+    48,142,25,25,133,17,150,141,248,229,161,230,139,72,168,100,
+    160,16,66,64,48,50,65,99,164,243,203,16,247,167,220,126,
+    249,179,165,7,69,47,45,59,75,70,122,224,93,129,9,160,
+    233,252,158,6,154,201,83,8,118,80,180,237,138,21,127,89,
+    202,114,133,252,178,84,205,21,242,83,197,152,174,144,95,150,
+    178,93,33,63,85,26,251,21,242,83,37,46,6,54,164,181,
+    71,150,218,158,214,30,89,170,43,173,61,242,58,3,173,203,
+    83,191,40,112,80,116,83,154,106,84,31,247,106,91,160,154,
+    181,61,0,234,92,105,202,145,117,183,165,169,90,96,233,204,
+    182,43,134,123,38,0,121,3,77,155,128,187,169,0,137,192,
+    125,60,61,40,197,114,207,49,116,123,158,170,14,239,19,248,
+    64,29,127,145,219,73,187,243,84,37,184,143,224,65,41,46,
+    72,179,180,33,79,1,72,76,147,19,174,5,131,211,42,179,
+    122,242,109,19,9,150,3,7,71,187,146,250,60,5,39,92,
+    182,5,167,114,80,207,208,205,201,77,121,10,78,184,162,11,
+    78,171,157,228,84,14,106,116,244,46,44,10,78,88,20,156,
+    202,129,149,218,181,47,175,175,195,234,2,200,90,220,228,34,
+    187,177,83,62,247,109,35,231,123,172,41,222,121,117,50,207,
+    22,18,170,64,31,75,15,209,73,30,235,62,68,175,236,93,
+    125,92,218,114,72,190,168,2,107,41,31,61,74,231,245,141,
+    116,99,158,2,144,173,113,146,139,108,115,71,10,88,250,1,
+    249,226,224,16,57,195,83,243,108,33,165,10,236,165,118,236,
+    201,235,29,216,26,0,72,17,120,46,22,1,23,247,88,46,
+    207,22,82,168,64,15,117,0,106,161,111,160,145,107,69,72,
+    114,147,64,83,171,18,232,234,95,57,43,117,237,147,175,72,
+    29,74,201,53,112,23,229,125,20,219,185,151,128,68,29,57,
+    165,72,191,244,222,137,150,238,168,64,13,77,183,37,208,157,
+    149,110,43,7,156,158,222,66,60,105,233,45,184,40,14,78,
+    229,192,74,233,28,121,157,147,222,134,125,15,167,84,207,202,
+    206,215,251,73,176,4,238,235,33,213,213,54,146,174,20,75,
+    48,201,255,5,110,130,153,60,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/util/checkpoint_store.py",
+    "m5.util.checkpoint_store",
+    embedded_module_data,
+    14600,
+    33253);
+
+} // anonymous namespace
+} // namespace gem5
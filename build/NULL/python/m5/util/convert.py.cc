@@ -0,0 +1,362 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,229,90,123,108,27,201,121,223,229,238,242,181,20,41,
+    82,148,108,201,210,105,101,203,15,218,119,146,31,145,125,150,
+    101,201,47,217,150,31,202,221,201,118,239,132,4,62,90,187,
+    162,89,243,33,15,151,182,197,163,16,221,197,105,232,131,219,
+    200,169,13,243,112,185,86,73,147,171,28,167,61,247,145,214,
+    104,255,232,5,104,138,67,209,20,75,131,40,136,5,4,24,
+    40,210,212,13,10,240,112,61,244,96,4,72,191,111,150,143,
+    37,37,185,238,213,41,90,84,90,252,246,219,153,111,102,191,
+    157,249,230,55,223,204,240,31,25,211,95,67,233,254,201,119,
+    89,134,185,205,200,204,56,35,179,227,172,108,25,183,200,220,
+    56,39,243,227,188,44,140,11,178,117,220,42,219,198,109,178,
+    125,220,46,59,198,29,178,115,220,41,139,227,162,236,26,119,
+    41,46,217,149,18,24,102,188,65,105,40,73,110,197,93,146,
+    60,138,167,36,53,42,141,37,201,27,102,228,6,197,251,219,
+    172,236,86,68,64,143,210,8,216,168,56,1,189,138,7,208,
+    167,56,0,155,20,55,160,95,177,3,54,43,54,192,22,197,
+    5,184,74,177,2,174,86,26,0,91,21,1,176,77,225,1,
+    215,40,28,96,187,98,1,236,80,88,192,231,20,38,204,126,
+    143,29,247,41,94,248,7,11,20,176,71,1,235,20,176,85,
+    65,203,59,191,229,26,111,146,165,171,204,184,95,238,2,108,
+    150,215,2,182,200,235,228,238,16,51,201,201,235,175,178,227,
+    171,228,61,242,6,184,175,134,251,70,184,183,202,155,74,185,
+    1,120,106,147,7,228,205,112,95,3,247,45,112,111,151,159,
+    135,26,58,228,23,0,159,147,123,0,59,229,94,64,73,222,
+    10,216,37,111,3,92,43,111,7,92,39,239,0,236,150,191,
+    0,184,94,238,3,220,32,239,4,220,40,239,2,220,36,191,
+    8,24,144,119,3,110,150,251,1,183,200,221,99,76,96,111,
+    232,7,7,31,228,190,76,182,15,132,90,206,252,236,119,62,
+    224,30,12,132,188,255,242,194,155,239,220,190,184,55,116,235,
+    31,54,252,179,216,227,29,12,253,230,191,254,112,254,223,255,
+    230,222,96,232,23,119,62,126,112,242,220,75,67,33,218,205,
+    251,190,177,143,10,179,87,123,246,83,65,249,201,79,168,240,
+    157,155,109,209,3,32,124,97,195,167,23,92,7,67,204,71,
+    163,161,232,143,238,30,12,51,60,195,232,150,225,176,206,14,
+    235,150,151,224,246,146,110,57,5,183,83,186,229,8,220,142,
+    232,236,73,221,114,28,164,11,186,229,36,220,162,58,155,212,
+    217,152,206,78,233,236,164,206,6,3,46,98,129,234,9,135,
+    192,35,8,8,86,4,27,130,29,193,129,128,174,72,156,8,
+    34,130,11,96,130,53,185,42,150,193,106,62,153,98,208,85,
+    85,83,94,154,81,45,213,167,247,65,190,91,121,78,72,170,
+    80,205,147,89,213,102,46,247,62,212,114,183,82,211,187,140,
+    108,121,143,171,77,123,139,149,25,104,118,110,244,177,235,50,
+    137,199,66,146,58,61,165,72,27,31,123,54,74,137,243,241,
+    100,68,150,206,41,82,66,37,1,94,119,134,19,225,88,66,
+    13,198,38,20,157,131,36,221,113,10,116,135,9,137,19,157,
+    199,98,119,88,93,184,20,140,36,149,4,86,47,61,238,72,
+    144,137,222,169,105,245,124,60,214,27,237,235,77,170,225,72,
+    239,68,60,118,73,33,106,207,212,180,238,8,38,18,32,142,
+    169,132,60,135,182,227,215,236,199,222,99,22,197,230,57,229,
+    189,177,156,216,149,23,187,138,12,43,12,179,139,238,85,218,
+    234,131,223,83,23,134,191,253,198,119,223,0,209,184,114,238,
+    67,121,247,33,205,126,168,200,161,150,161,251,9,126,216,132,
+    169,201,170,141,251,29,128,175,67,243,102,152,73,86,102,175,
+    218,211,236,33,230,125,72,187,91,81,157,177,212,52,189,165,
+    182,185,100,203,5,42,39,44,199,160,233,210,22,178,225,26,
+    35,115,181,37,100,190,181,218,89,53,165,69,230,107,150,214,
+    21,52,39,45,49,14,234,18,38,45,208,29,214,96,59,20,
+    26,155,138,132,85,41,136,205,31,134,158,57,23,76,40,178,
+    20,143,97,74,114,114,50,124,69,154,36,241,40,60,69,194,
+    9,85,138,79,150,82,149,68,143,211,41,193,95,255,84,144,
+    4,163,18,237,145,126,105,204,168,132,62,73,106,92,82,21,
+    40,52,25,39,80,62,26,84,39,206,99,166,81,65,143,185,
+    116,185,206,126,233,96,60,166,6,195,49,133,152,95,85,174,
+    169,252,74,162,168,73,18,3,237,253,146,154,156,138,40,168,
+    187,137,190,243,249,82,153,64,143,52,102,88,31,134,210,231,
+    21,73,137,78,169,211,165,111,164,149,84,255,194,147,168,65,
+    20,84,141,197,13,59,75,111,170,25,59,56,2,154,176,123,
+    7,1,110,177,183,153,16,248,254,151,91,103,216,107,150,121,
+    102,185,191,52,91,219,49,31,172,74,179,55,44,215,219,198,
+    152,59,76,128,213,237,74,76,78,92,14,171,231,3,156,110,
+    233,217,10,222,62,121,133,180,99,183,163,19,73,210,44,233,
+    128,251,99,231,0,182,252,68,60,58,53,152,234,58,155,192,
+    222,58,91,106,194,129,72,124,34,24,73,12,246,84,85,18,
+    88,126,51,192,103,179,140,230,30,52,174,185,196,194,250,15,
+    122,190,223,115,191,41,183,121,111,126,243,94,72,202,36,42,
+    185,164,19,212,31,161,149,163,143,208,76,29,141,227,34,74,
+    44,192,81,115,116,123,185,31,116,27,109,28,37,65,45,124,
+    93,146,168,133,122,67,141,85,228,5,72,11,163,25,191,110,
+    152,81,244,51,158,161,202,219,178,231,1,114,238,193,188,123,
+    112,246,200,162,232,206,92,190,54,112,125,32,187,237,129,216,
+    174,149,175,135,59,247,106,226,104,102,88,243,117,223,26,203,
+    174,154,247,126,171,237,198,217,155,103,53,127,55,164,228,93,
+    235,231,47,47,92,252,110,74,19,183,195,245,225,240,71,219,
+    63,220,163,241,163,244,51,38,76,52,133,180,107,140,199,1,
+    22,199,227,215,217,175,243,181,148,119,173,110,228,176,76,134,
+    207,176,25,156,149,96,212,206,8,105,75,194,163,114,85,253,
+    250,49,28,219,100,166,197,180,69,181,154,116,107,8,148,240,
+    105,203,36,11,37,106,234,171,31,247,192,10,14,179,117,144,
+    95,83,203,151,64,154,177,206,216,210,54,34,153,53,211,214,
+    52,183,140,166,125,198,145,118,16,123,154,75,59,170,12,16,
+    131,184,100,198,25,179,166,173,50,135,210,140,99,198,110,97,
+    210,66,218,94,107,75,218,137,113,70,218,70,153,130,15,142,
+    64,133,7,13,86,173,114,69,50,65,49,22,86,19,82,48,
+    38,75,83,68,169,140,215,77,192,213,97,240,206,200,116,0,
+    10,76,70,226,65,96,15,66,71,85,56,166,42,33,133,148,
+    198,152,153,50,160,26,24,135,192,216,201,40,144,16,212,162,
+    132,113,104,226,236,16,148,98,193,11,144,24,13,134,224,125,
+    73,89,145,112,232,196,147,96,14,173,6,173,128,23,148,108,
+    120,94,42,113,142,89,25,18,168,22,154,26,140,73,241,41,
+    53,28,143,5,35,165,34,79,197,103,229,137,197,172,170,6,
+    73,72,81,207,226,220,212,47,225,100,5,150,70,21,202,122,
+    10,78,91,82,20,6,76,48,132,140,105,42,69,91,173,95,
+    58,141,6,109,50,218,51,128,70,151,105,22,94,25,150,13,
+    173,154,114,229,54,238,151,78,6,167,166,208,56,80,54,55,
+    124,52,25,81,195,48,30,21,82,91,176,100,186,66,250,165,
+    163,74,100,10,90,117,50,25,155,192,38,48,125,152,169,197,
+    32,49,22,84,195,151,148,58,186,44,255,225,247,46,33,228,
+    83,21,58,46,191,78,150,74,196,140,159,18,88,134,86,49,
+    148,160,180,122,14,224,22,119,155,113,48,22,230,26,91,31,
+    86,140,49,235,24,213,84,172,155,33,45,108,205,104,150,217,
+    107,28,6,31,215,44,239,50,239,241,245,1,200,101,230,10,
+    247,26,115,153,197,32,164,113,34,24,139,197,213,202,71,111,
+    76,9,27,241,123,129,247,156,103,208,90,26,110,64,48,194,
+    129,237,186,163,210,114,186,104,234,107,131,170,145,99,164,217,
+    89,131,171,117,91,73,53,213,162,198,71,147,209,42,65,151,
+    210,175,99,145,211,140,65,139,22,206,113,156,45,52,181,207,
+    237,206,142,221,24,188,57,168,185,186,62,91,244,180,66,116,
+    1,233,102,92,244,181,107,29,35,247,4,0,184,238,31,55,
+    238,57,223,177,188,239,152,230,58,6,65,9,40,125,246,217,
+    103,9,140,3,191,234,116,51,191,37,245,112,100,35,210,78,
+    0,32,32,208,200,71,23,232,92,73,86,97,250,106,4,36,
+    234,128,72,191,131,124,129,106,80,119,211,237,101,119,34,59,
+    48,171,15,179,26,43,142,113,214,200,213,121,84,214,29,149,
+    116,221,90,202,16,18,240,205,74,2,3,208,215,97,142,120,
+    221,112,23,163,129,4,218,46,4,103,208,105,108,139,159,99,
+    91,124,6,173,241,233,90,70,112,103,148,28,239,207,243,126,
+    141,247,23,121,94,192,239,127,10,108,100,92,222,34,35,8,
+    29,139,141,205,55,108,55,109,25,33,35,44,58,154,230,134,
+    223,219,145,115,116,230,29,157,69,134,19,58,10,222,150,57,
+    59,102,253,180,17,194,190,27,174,155,46,16,59,54,47,244,
+    221,91,159,235,120,49,223,241,98,142,111,131,247,206,201,69,
+    43,99,119,97,213,123,22,219,3,218,230,254,251,71,115,237,
+    195,249,246,225,156,189,53,227,152,219,89,232,222,172,53,110,
+    155,179,103,91,242,141,146,214,40,221,99,177,210,135,235,118,
+    220,123,229,190,55,219,55,183,51,227,120,40,250,50,187,230,
+    118,231,196,142,188,216,49,47,228,196,245,243,170,38,110,209,
+    248,45,116,142,210,5,202,134,163,19,124,221,40,160,115,21,
+    54,77,125,96,158,134,24,48,205,213,132,231,192,205,119,43,
+    115,143,204,86,249,29,130,11,203,40,217,132,93,107,161,237,
+    76,134,0,238,240,213,110,38,187,16,94,172,120,111,165,115,
+    108,106,252,48,90,70,14,194,211,239,99,62,38,99,160,220,
+    56,215,156,21,231,79,47,28,253,161,146,19,7,242,226,192,
+    253,151,243,226,144,198,15,25,147,174,105,74,171,6,193,91,
+    87,248,144,154,207,0,3,238,86,154,1,76,103,71,193,106,
+    124,189,238,137,42,64,138,19,103,203,190,120,135,171,251,130,
+    82,148,84,142,65,212,248,73,90,192,248,130,163,140,49,83,
+    127,210,82,250,2,223,92,95,118,203,124,242,15,226,57,113,
+    48,47,14,106,252,224,51,54,157,12,27,77,110,24,127,46,
+    28,11,146,233,138,241,228,200,114,6,31,160,74,134,193,39,
+    32,237,3,252,180,17,4,234,38,182,210,60,185,188,159,236,
+    92,193,198,52,198,46,245,254,97,49,251,7,48,96,13,1,
+    99,245,148,128,215,46,83,165,204,214,6,22,240,161,184,122,
+    194,8,17,204,131,27,123,197,88,135,25,193,170,125,32,18,
+    140,158,147,131,131,169,53,106,124,164,52,207,155,194,84,35,
+    243,79,177,53,220,180,103,126,204,125,184,255,195,139,63,114,
+    252,181,99,214,248,108,195,117,89,195,117,15,48,75,156,212,
+    81,169,151,140,193,243,159,160,70,23,83,231,166,218,206,17,
+    184,114,226,177,188,120,236,163,109,121,241,164,198,159,252,21,
+    245,55,26,65,14,35,44,237,99,79,217,41,203,22,35,245,
+    255,57,99,114,75,255,220,233,236,241,133,230,31,122,114,226,
+    190,188,184,79,227,247,253,42,205,60,190,162,153,134,43,150,
+    205,124,21,82,255,18,117,207,48,37,103,92,178,16,162,6,
+    253,198,50,6,213,71,212,105,102,222,92,182,106,40,83,19,
+    75,83,87,187,196,16,139,12,241,38,200,28,149,249,49,166,
+    102,227,65,72,227,246,130,117,233,246,66,192,54,26,16,116,
+    94,37,73,69,103,85,157,155,134,197,10,59,173,179,219,78,
+    65,178,48,9,222,167,16,31,126,171,37,22,39,141,40,176,
+    91,15,19,108,208,148,131,78,253,231,226,241,8,172,119,140,
+    137,50,18,191,12,173,176,13,63,126,13,182,86,213,193,117,
+    43,180,21,168,146,9,120,248,43,204,123,205,232,73,190,193,
+    52,121,61,116,121,191,113,252,237,227,215,78,94,63,57,59,
+    92,176,185,180,198,30,205,134,87,193,211,148,81,107,19,252,
+    153,228,162,211,175,53,191,184,32,0,24,87,206,185,59,239,
+    220,173,241,187,159,208,246,221,203,180,189,12,177,253,251,144,
+    123,183,226,62,116,180,235,142,73,162,92,76,42,177,137,105,
+    221,114,52,117,135,165,244,184,228,211,68,160,255,178,30,57,
+    15,41,127,139,10,126,227,251,196,213,217,230,121,113,225,84,
+    78,220,158,135,117,23,191,253,25,153,102,139,4,85,106,24,
+    155,32,161,229,172,130,241,126,194,80,33,17,120,254,123,124,
+    129,217,38,199,194,142,156,216,155,23,123,53,190,119,169,77,
+    21,186,204,175,96,147,121,236,168,38,162,253,1,87,75,161,
+    116,65,5,11,56,220,78,185,64,203,16,75,154,29,195,237,
+    21,161,244,188,209,1,174,153,102,83,98,41,88,53,45,6,
+    33,88,245,67,176,106,90,178,201,54,234,202,246,165,174,92,
+    14,84,107,180,29,84,219,185,140,227,139,169,222,234,186,172,
+    26,189,227,26,135,46,118,192,183,131,210,4,48,240,5,9,
+    98,214,112,92,238,33,184,46,191,99,33,147,104,244,5,134,
+    6,7,181,113,129,17,247,97,22,85,250,153,241,178,226,144,
+    49,96,188,116,192,152,171,124,204,110,124,188,113,163,20,83,
+    20,25,86,112,166,165,11,29,89,10,136,192,251,225,80,50,
+    158,76,244,220,17,12,106,167,148,137,161,137,238,29,87,72,
+    252,80,248,82,56,1,107,17,26,121,211,161,87,158,240,247,
+    32,244,51,245,164,229,10,198,166,79,85,92,227,50,36,61,
+    64,157,239,83,215,248,212,202,172,106,47,216,27,10,254,142,
+    130,187,117,209,43,45,250,86,21,69,235,42,235,199,12,192,
+    191,33,188,249,197,217,145,140,90,116,67,176,151,73,188,245,
+    198,236,27,5,207,106,205,190,186,224,104,152,243,191,221,158,
+    105,199,240,252,24,132,231,45,217,214,27,67,154,107,45,132,
+    230,18,134,227,199,88,51,210,208,252,40,134,230,71,141,43,
+    231,27,201,251,70,52,215,8,70,229,199,48,42,7,91,60,
+    173,90,235,241,236,105,0,227,202,185,79,228,221,39,52,251,
+    137,79,176,143,255,136,223,201,252,217,115,251,253,220,255,59,
+    207,221,254,180,158,91,225,175,30,162,160,193,113,132,169,178,
+    127,26,158,122,17,129,58,168,155,58,104,165,12,33,152,131,
+    27,99,4,23,144,228,210,18,95,114,83,95,170,146,95,170,
+    228,244,75,188,169,243,105,188,73,125,43,61,155,174,122,83,
+    211,219,107,50,107,208,155,142,44,227,77,71,88,51,82,111,
+    26,70,111,26,54,174,156,239,112,222,119,88,115,29,70,111,
+    58,242,159,121,19,185,194,60,3,74,78,121,99,138,122,57,
+    78,46,72,231,160,43,46,135,101,245,188,206,157,155,90,129,
+    158,125,176,160,51,212,15,148,181,201,12,100,252,2,245,154,
+    153,10,79,107,210,142,123,167,115,226,158,188,184,71,227,247,
+    60,155,201,35,213,24,85,162,113,50,93,53,52,197,29,232,
+    77,64,240,120,98,57,83,189,24,141,161,126,213,210,175,96,
+    93,108,189,165,219,239,13,231,196,254,188,216,175,241,253,207,
+    200,82,177,100,105,34,156,130,0,229,0,152,248,234,114,38,
+    186,202,38,142,129,30,121,11,146,120,214,52,7,183,101,251,
+    230,95,184,215,148,19,251,242,98,159,198,247,45,53,174,18,
+    43,186,44,255,179,231,59,16,230,153,151,41,213,186,234,52,
+    103,88,85,52,213,93,183,67,14,12,69,27,142,248,212,6,
+    83,29,52,236,123,207,178,228,157,236,33,230,203,91,103,44,
+    178,85,245,152,234,172,211,155,176,92,41,29,167,16,171,108,
+    43,29,172,248,99,44,176,218,83,188,227,250,182,154,186,89,
+    217,186,210,177,139,108,79,129,237,117,218,142,21,181,157,168,
+    157,178,45,41,33,174,88,194,181,66,137,134,21,75,88,203,
+    37,192,9,221,163,4,157,156,224,202,227,49,219,243,8,123,
+    43,213,20,142,25,147,117,120,74,10,202,50,81,18,9,137,
+    46,192,30,253,18,129,238,18,225,62,210,35,12,153,31,161,
+    187,60,194,61,166,71,216,73,1,187,105,43,9,77,32,109,
+    12,6,207,244,44,128,224,17,132,17,65,191,132,186,165,147,
+    4,225,220,180,10,145,57,79,111,53,20,12,193,231,200,212,
+    126,195,4,242,13,72,177,163,227,227,249,212,231,58,168,43,
+    69,224,89,46,231,106,207,187,218,103,135,23,109,206,76,223,
+    155,169,171,169,185,151,223,250,202,236,87,22,221,171,181,214,
+    157,11,73,0,184,114,238,93,121,247,46,205,190,235,97,99,
+    115,145,177,8,3,20,50,124,193,211,120,235,96,150,191,49,
+    114,115,68,243,172,135,235,1,197,121,191,113,55,46,74,218,
+    253,247,250,0,224,202,249,246,228,125,123,52,215,158,34,199,
+    52,110,248,212,206,56,27,50,167,231,182,93,127,245,90,199,
+    245,142,236,218,156,163,29,207,60,146,115,47,95,191,114,109,
+    239,245,189,217,3,57,241,185,143,129,220,165,159,214,36,239,
+    207,137,29,31,11,22,71,39,240,189,203,83,159,97,227,28,
+    157,69,78,16,172,79,32,128,171,255,75,9,160,28,142,60,
+    137,6,102,96,81,187,66,109,117,251,186,51,156,121,16,167,
+    235,222,85,9,112,134,62,55,69,120,77,239,182,167,45,203,
+    211,208,147,234,198,243,147,39,218,232,40,217,248,90,77,139,
+    212,159,12,241,105,94,182,150,52,121,164,33,172,87,182,206,
+    8,106,147,201,66,91,109,41,160,199,246,25,107,90,144,5,
+    217,153,182,166,156,48,226,145,16,96,58,153,17,210,66,186,
+    28,14,58,210,108,218,42,11,41,106,237,132,133,5,186,184,
+    222,241,52,95,254,52,58,1,177,134,120,122,201,85,166,68,
+    42,6,209,72,0,169,198,50,15,65,232,17,13,38,46,72,
+    228,107,152,135,222,29,112,46,71,51,4,119,210,41,79,24,
+    76,131,36,67,233,70,23,72,48,22,82,2,54,131,112,44,
+    225,41,221,86,170,84,119,149,132,151,130,68,77,232,206,210,
+    211,104,50,170,219,240,116,249,76,48,162,179,225,4,122,190,
+    100,222,179,166,212,52,106,40,147,119,33,5,89,41,113,233,
+    115,83,147,191,245,246,241,111,30,159,231,114,254,238,188,191,
+    251,205,147,179,175,100,86,45,58,252,115,175,92,235,188,222,
+    57,123,160,208,212,118,123,239,55,247,206,55,229,154,214,231,
+    155,214,207,158,64,234,26,200,217,86,231,109,171,179,251,31,
+    216,58,52,91,135,65,76,182,27,39,110,158,208,60,27,224,
+    122,64,113,254,128,113,55,46,74,76,187,239,217,0,224,202,
+    249,250,243,190,126,205,213,95,104,244,85,203,118,105,246,174,
+    69,135,43,243,165,156,163,45,239,104,203,6,31,56,58,53,
+    71,231,98,179,52,191,42,215,28,200,55,7,50,206,130,216,
+    156,245,190,61,148,25,42,248,91,178,236,220,174,204,104,193,
+    215,148,177,45,122,91,230,200,141,214,155,173,69,134,115,172,
+    163,144,217,95,112,53,205,93,204,190,50,223,245,206,153,27,
+    51,57,87,119,230,72,193,211,146,221,252,192,211,173,121,186,
+    11,171,219,178,251,231,217,119,134,231,222,208,26,215,26,23,
+    210,228,250,159,34,27,247,45,28,1,128,43,231,222,153,119,
+    239,212,236,59,87,72,126,2,233,189,200,254,95,38,61,153,
+    175,33,138,39,145,148,80,67,82,38,250,129,117,220,74,36,
+    245,132,186,233,33,175,173,102,160,246,211,225,25,254,37,4,
+    2,169,134,242,240,156,138,195,98,109,249,137,223,52,34,43,
+    131,177,52,237,147,91,0,58,143,133,235,214,240,56,178,126,
+    45,172,158,127,9,178,200,239,66,82,31,14,173,111,51,159,
+    119,104,121,91,110,175,249,230,154,236,88,206,219,149,247,118,
+    189,121,12,134,150,223,60,180,68,215,45,110,238,208,13,199,
+    77,135,38,174,131,235,1,197,236,25,227,110,92,52,52,232,
+    93,240,3,192,149,115,111,205,187,183,106,246,173,5,151,187,
+    92,54,51,164,241,109,207,106,255,235,82,60,162,6,67,176,
+    40,56,179,226,254,215,25,67,133,252,30,60,239,131,44,18,
+    101,158,184,45,251,95,122,255,68,146,16,37,166,234,236,254,
+    21,223,127,208,80,33,120,36,116,232,25,191,223,170,196,20,
+    18,154,214,217,99,203,191,222,174,198,135,169,6,193,205,226,
+    163,108,221,142,164,125,97,93,78,236,201,139,61,26,223,243,
+    132,221,191,127,90,193,162,255,198,30,10,151,102,103,184,88,
+    143,105,23,197,138,211,50,78,162,144,190,22,210,109,213,233,
+    21,214,6,12,78,245,184,195,2,185,77,102,166,129,169,25,
+    217,69,92,134,93,56,217,117,129,202,176,30,170,225,38,208,
+    111,88,102,140,115,24,231,167,246,44,249,157,134,241,243,133,
+    196,148,50,17,158,12,27,63,172,8,74,170,18,157,82,72,
+    80,77,226,47,159,98,210,113,37,114,41,28,131,201,174,154,
+    28,224,116,246,184,206,30,212,217,195,198,102,203,31,34,224,
+    41,85,104,18,255,124,23,247,145,123,248,212,249,181,159,191,
+    124,255,47,210,251,66,63,249,59,252,251,197,16,221,114,73,
+    117,213,111,9,154,95,137,91,60,61,148,99,82,109,248,203,
+    171,96,76,42,179,140,217,4,190,110,183,208,224,21,190,110,
+    107,80,183,94,160,230,215,157,21,53,168,241,83,213,186,200,
+    31,67,218,9,244,160,187,76,237,182,78,87,193,221,241,148,
+    155,132,222,182,140,53,99,173,236,235,192,115,246,76,206,187,
+    174,54,209,183,38,59,153,243,117,47,112,57,239,22,204,161,
+    19,217,48,110,217,12,27,87,206,125,56,239,62,172,217,15,
+    63,180,53,204,177,111,165,102,83,192,58,89,200,217,107,92,
+    198,239,163,52,251,224,67,209,59,107,156,92,5,44,244,251,
+    241,124,244,36,189,63,175,243,65,85,141,235,194,164,18,133,
+    27,63,21,158,0,140,5,99,144,20,13,79,16,122,139,68,
+    194,58,127,33,28,129,156,168,18,10,234,124,40,140,168,66,
+    147,64,9,69,13,234,156,114,37,136,42,231,194,168,130,24,
+    162,178,74,229,41,138,202,149,115,97,163,11,232,9,18,30,
+    146,208,31,15,24,125,131,39,158,198,137,2,221,118,161,39,
+    77,120,208,101,108,113,224,65,9,61,77,160,219,247,116,163,
+    150,238,175,209,93,34,186,1,67,247,57,140,153,3,163,43,
+    58,15,80,174,163,132,67,199,61,237,58,130,231,147,198,25,
+    97,233,172,49,26,151,147,17,101,144,252,152,161,187,56,76,
+    98,4,70,123,145,99,89,182,248,10,203,216,61,179,124,1,
+    64,40,216,220,32,217,26,240,209,13,143,8,15,109,46,76,
+    171,66,67,25,172,174,89,142,254,6,0,19,196,140,252,230,
+    27,79,39,20,249,166,38,75,129,183,103,186,139,28,72,15,
+    121,91,166,169,40,128,4,149,9,14,72,181,161,108,103,4,
+    123,198,95,116,160,236,52,210,69,148,93,70,122,3,202,110,
+    35,221,131,114,163,145,238,69,217,103,200,77,40,251,13,157,
+    102,148,91,140,244,85,40,175,54,210,91,81,110,195,244,230,
+    226,26,148,219,13,185,3,229,231,12,253,78,148,37,67,238,
+    66,121,173,161,179,14,229,110,35,125,61,202,12,192,172,167,
+    248,60,35,122,192,199,11,78,247,19,176,216,218,128,37,26,
+    104,9,201,194,226,175,101,77,232,108,96,191,8,178,9,165,
+    45,236,243,69,166,2,95,98,25,105,227,130,124,255,21,152,
+    241,217,125,236,50,104,103,217,33,20,205,176,108,26,179,118,
+    203,189,238,15,125,248,52,202,46,131,80,104,63,149,235,112,
+    197,116,59,219,95,100,42,208,194,178,59,48,167,4,80,106,
+    43,74,37,176,251,216,147,80,208,132,155,151,166,176,236,0,
+    106,151,0,106,216,131,82,9,224,113,39,74,37,176,123,89,
+    107,145,169,192,166,22,118,87,145,169,192,118,59,187,6,205,
+    42,65,75,157,49,75,30,123,81,42,129,189,133,245,97,45,
+    245,64,135,218,127,0,82,234,11,218,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/util/convert.py",
+    "m5.util.convert",
+    embedded_module_data,
+    5402,
+    12521);
+
+} // anonymous namespace
+} // namespace gem5
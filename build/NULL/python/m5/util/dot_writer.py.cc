@@ -0,0 +1,413 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,221,59,107,108,27,71,122,187,220,93,238,46,185,226,
+    75,164,68,201,146,76,189,44,81,118,228,151,98,59,142,101,
+    199,15,201,103,91,81,114,177,147,139,85,39,2,173,165,100,
+    218,20,169,219,93,249,161,82,23,221,193,197,49,134,15,167,
+    220,41,48,115,181,11,166,117,124,114,227,244,84,244,122,77,
+    95,104,154,187,182,215,3,90,112,213,45,204,46,160,66,64,
+    27,180,190,254,97,144,4,48,252,163,232,55,179,34,185,124,
+    248,113,65,219,31,71,45,63,206,227,155,111,102,103,230,123,
+    206,232,223,8,211,135,94,251,253,76,7,112,141,16,9,145,
+    140,18,35,198,47,57,66,226,95,203,136,5,126,45,81,106,
+    146,30,161,39,153,17,134,68,245,84,212,58,201,142,176,147,
+    220,8,135,243,116,148,159,180,141,216,72,130,55,90,219,71,
+    236,49,190,157,128,58,102,196,126,146,136,81,23,169,147,196,
+    5,82,180,94,38,70,4,145,5,88,35,114,0,29,34,15,
+    208,41,218,0,186,68,59,64,183,133,56,76,136,194,101,66,
+    172,185,101,33,136,247,45,249,193,142,120,68,7,212,215,138,
+    78,128,94,177,78,116,93,38,71,124,162,27,114,117,162,7,
+    96,189,88,47,214,66,153,95,244,66,174,65,244,1,108,20,
+    201,227,68,208,127,15,17,24,14,90,116,246,197,184,164,188,
+    20,30,215,107,34,242,240,116,52,250,98,60,18,83,194,18,
+    212,88,35,242,75,241,184,162,187,35,242,241,200,228,11,167,
+    207,134,199,148,87,224,27,151,130,164,78,95,8,73,177,193,
+    49,210,52,119,12,124,219,209,220,253,25,128,99,240,166,215,
+    136,4,113,182,80,157,54,227,22,62,183,224,251,126,33,119,
+    136,120,109,239,44,169,48,197,250,4,121,11,218,189,95,104,
+    43,145,87,61,10,251,136,250,134,4,9,84,124,179,150,18,
+    42,150,82,44,153,78,88,94,33,174,145,36,113,181,238,234,
+    238,4,185,150,222,39,18,199,137,219,228,112,144,214,249,209,
+    177,51,145,168,40,133,99,186,245,124,40,58,29,150,37,180,
+    55,36,43,128,32,165,179,114,100,114,56,46,134,117,6,163,
+    233,84,252,244,89,153,130,186,64,32,240,32,32,75,99,155,
+    167,46,41,103,226,177,205,147,79,111,158,86,34,209,205,98,
+    92,25,189,32,69,96,102,123,167,46,233,46,104,30,131,230,
+    133,78,36,23,180,29,66,35,187,10,224,63,225,111,142,200,
+    186,253,154,187,237,174,59,184,236,14,170,238,141,154,123,99,
+    142,224,24,63,6,73,102,197,238,79,249,84,251,122,205,190,
+    62,71,144,188,47,43,120,87,236,77,169,151,85,123,187,102,
+    111,207,17,12,239,207,214,55,229,8,75,77,11,6,243,212,
+    74,125,71,250,184,90,31,212,234,131,208,194,221,146,109,108,
+    158,63,130,254,238,231,24,132,197,17,181,254,228,49,227,47,
+    231,206,247,244,25,154,175,49,75,113,46,9,52,5,232,85,
+    63,107,177,32,30,81,76,235,154,32,202,86,131,18,201,89,
+    75,140,133,125,80,40,43,93,153,179,84,62,37,90,68,42,
+    65,164,105,162,202,167,116,151,220,130,54,239,23,218,205,82,
+    34,172,230,12,162,192,204,224,49,156,45,208,63,107,205,167,
+    112,61,61,99,244,239,52,143,56,65,193,238,40,165,72,3,
+    13,46,159,75,243,143,31,17,236,184,175,206,50,208,202,86,
+    104,101,175,214,42,193,136,68,41,15,207,90,19,86,145,56,
+    135,251,150,122,19,148,72,225,119,192,111,50,203,42,13,37,
+    35,101,19,76,217,72,185,4,157,174,169,218,19,87,186,18,
+    176,187,95,82,154,205,212,74,235,225,13,60,179,188,178,222,
+    132,193,39,232,210,177,2,141,218,4,153,118,85,237,143,46,
+    239,15,241,82,208,58,172,211,18,8,145,7,150,83,189,58,
+    57,250,128,108,123,192,4,78,197,118,7,130,110,9,173,146,
+    206,140,198,66,147,97,221,34,133,117,74,158,62,173,211,83,
+    33,229,12,112,223,232,88,52,36,203,163,163,58,55,138,49,
+    32,229,65,60,52,38,133,67,10,240,77,116,90,6,94,210,
+    173,163,83,32,190,100,157,62,23,190,36,235,54,156,27,149,
+    194,227,178,78,77,132,21,221,105,106,130,248,77,231,66,162,
+    136,83,152,225,116,87,89,189,172,11,8,1,6,50,33,133,
+    166,206,4,109,146,128,208,248,177,80,52,138,75,116,38,26,
+    58,29,142,234,252,56,136,202,81,60,86,54,63,22,30,119,
+    142,95,135,70,73,221,97,32,21,74,215,16,80,239,104,205,
+    100,180,89,2,133,143,132,118,165,212,153,7,39,17,70,7,
+    204,231,28,177,194,214,36,39,190,249,198,229,55,114,4,197,
+    180,100,93,117,73,38,201,172,186,234,23,106,64,12,184,60,
+    11,214,249,233,212,88,122,231,15,247,252,238,158,119,247,222,
+    220,171,186,182,105,174,109,115,71,86,5,231,124,231,155,199,
+    82,221,170,208,150,254,154,214,185,67,235,220,167,10,251,62,
+    106,87,133,129,185,129,47,172,132,179,53,93,191,24,92,122,
+    89,117,60,171,57,158,157,59,156,179,18,117,205,11,175,223,
+    245,117,47,251,186,85,95,143,230,235,1,57,194,116,99,144,
+    228,179,206,58,205,217,122,215,217,185,236,236,76,71,150,188,
+    170,115,135,230,220,145,164,179,118,231,124,223,149,61,201,61,
+    217,230,13,139,181,239,140,46,94,82,155,119,37,135,87,252,
+    93,139,236,82,203,71,13,170,255,152,230,63,150,60,146,21,
+    106,239,10,77,203,66,83,234,164,42,116,105,66,87,70,232,
+    186,15,195,240,180,165,187,84,119,143,230,134,222,72,38,136,
+    1,188,24,7,242,45,205,170,92,183,198,117,103,240,179,74,
+    215,220,165,27,151,233,198,212,78,149,110,215,232,246,76,254,
+    145,220,68,153,144,66,236,139,133,212,47,73,226,203,41,162,
+    159,204,90,160,85,129,102,154,170,214,42,97,169,96,104,10,
+    152,56,207,208,223,87,76,194,163,40,150,68,82,4,218,105,
+    43,81,229,243,72,81,71,39,104,17,139,58,67,224,205,50,
+    101,162,140,169,16,101,86,197,109,194,160,20,143,169,167,146,
+    113,75,141,9,170,40,190,36,143,82,95,66,153,4,218,212,
+    45,16,206,239,23,4,52,136,131,239,67,27,33,159,135,57,
+    91,55,203,38,216,199,80,97,43,168,52,93,253,19,101,157,
+    25,175,138,104,226,74,132,23,7,106,191,66,52,97,129,67,
+    13,75,94,212,179,15,64,208,41,33,121,38,5,16,104,69,
+    160,13,129,6,252,182,8,160,78,37,100,178,232,182,136,28,
+    137,201,74,40,54,22,150,208,228,1,7,135,129,165,5,36,
+    31,144,68,8,139,19,32,60,194,209,240,100,56,166,200,149,
+    194,3,213,203,65,30,139,11,169,11,129,141,8,108,66,32,
+    136,192,83,8,244,162,102,228,148,193,253,104,103,148,49,127,
+    95,30,76,35,132,6,204,252,89,95,83,57,75,214,48,67,
+    164,1,159,128,41,87,252,141,215,173,169,233,244,216,226,206,
+    31,237,249,253,61,183,247,222,217,171,250,119,107,254,221,192,
+    144,143,230,215,79,156,13,169,142,247,88,213,217,173,57,65,
+    6,88,107,134,200,108,109,253,194,51,200,120,56,70,174,120,
+    3,88,122,188,254,209,9,213,123,84,243,30,205,120,143,222,
+    95,109,104,190,222,12,230,134,27,13,16,193,249,253,217,122,
+    255,194,121,104,226,27,34,87,252,29,233,175,45,70,62,108,
+    249,185,219,232,35,227,63,118,191,82,2,108,196,32,47,1,
+    120,149,235,209,184,158,12,126,114,84,190,218,224,120,179,177,
+    80,48,75,218,12,142,167,138,28,63,75,43,38,238,45,242,
+    52,230,67,186,104,130,124,9,227,131,1,149,110,112,36,93,
+    228,111,204,155,160,216,19,150,115,56,47,29,22,193,72,17,
+    25,209,42,178,215,105,24,89,129,243,161,85,33,61,110,41,
+    106,123,80,253,38,206,46,26,35,9,11,80,101,239,112,21,
+    102,0,89,221,76,169,52,3,16,151,96,78,225,77,156,162,
+    211,167,227,72,149,141,199,37,176,235,69,200,134,198,206,233,
+    116,44,30,11,7,233,160,101,112,48,104,57,1,223,193,19,
+    240,123,2,172,127,74,140,72,160,28,183,18,102,118,210,173,
+    96,213,130,29,140,217,10,26,99,149,23,145,71,229,248,180,
+    52,6,150,242,212,37,96,24,157,30,192,172,148,103,170,18,
+    158,193,76,130,121,6,81,206,235,79,96,68,67,211,214,154,
+    242,5,165,202,193,80,70,149,75,83,160,116,49,19,86,97,
+    171,109,121,112,5,190,242,143,8,204,86,118,231,213,103,230,
+    14,173,248,234,23,94,73,13,164,183,47,210,119,236,119,187,
+    119,45,119,239,82,187,119,107,221,187,85,223,179,154,239,217,
+    185,225,108,99,247,226,118,181,177,119,201,251,227,6,181,113,
+    119,134,174,7,59,153,91,151,122,125,153,221,152,97,55,174,
+    54,181,101,215,117,100,215,181,102,27,3,57,158,241,218,64,
+    87,2,176,17,130,235,234,222,84,223,245,189,25,91,207,231,
+    118,198,187,41,201,125,33,16,46,223,213,153,84,111,166,167,
+    255,163,93,25,231,144,234,28,210,156,67,192,170,156,251,46,
+    215,184,204,53,166,250,84,46,160,113,129,76,254,201,185,9,
+    110,19,244,98,108,118,179,2,66,115,134,55,123,29,182,193,
+    39,64,237,148,218,225,69,123,59,109,86,139,133,79,217,166,
+    46,23,184,19,216,6,126,12,99,148,219,124,152,25,242,170,
+    111,32,65,165,153,106,173,20,147,189,90,78,65,36,215,44,
+    120,170,136,81,100,138,180,201,239,123,216,155,204,84,188,13,
+    168,134,51,162,37,205,85,105,10,66,162,236,13,172,34,5,
+    172,87,107,194,176,150,98,36,216,115,120,46,164,245,34,13,
+    108,7,182,123,162,20,191,140,225,102,64,25,254,150,137,177,
+    19,156,33,28,20,95,177,205,217,130,175,144,32,69,80,225,
+    34,136,14,236,175,24,144,21,185,82,63,160,108,206,120,209,
+    38,114,119,236,183,160,167,247,11,170,23,24,92,24,158,97,
+    54,180,239,216,250,236,140,117,67,251,214,45,207,158,138,252,
+    247,62,24,144,179,183,183,55,208,173,72,211,177,49,208,92,
+    98,80,167,78,199,47,74,117,208,230,129,187,77,138,79,199,
+    196,176,184,41,48,30,137,70,195,98,219,3,182,125,11,254,
+    232,204,126,41,18,138,234,150,173,125,65,94,103,228,51,161,
+    169,176,212,13,141,116,86,137,199,163,74,100,10,10,149,75,
+    81,228,17,199,163,113,176,134,17,5,35,201,141,199,99,138,
+    193,172,40,37,71,102,64,48,160,20,174,14,214,128,224,0,
+    118,14,139,58,11,124,46,133,38,101,172,177,33,183,230,120,
+    35,173,173,91,67,83,83,225,24,120,218,178,34,233,108,36,
+    22,25,69,9,250,108,60,18,211,169,40,120,208,251,112,155,
+    131,107,198,184,3,41,231,137,112,108,20,245,49,45,229,197,
+    12,214,197,120,216,246,53,18,145,216,132,12,178,9,245,171,
+    51,184,67,233,121,84,239,153,12,93,28,93,123,181,81,160,
+    63,129,220,146,194,172,85,19,51,45,121,112,29,190,114,27,
+    214,222,171,30,239,220,177,21,119,125,138,189,238,188,235,223,
+    180,236,223,164,250,123,53,127,175,234,222,172,185,55,131,82,
+    101,28,24,36,153,44,216,243,206,187,174,246,101,87,123,122,
+    64,117,245,104,174,30,40,180,187,230,15,93,233,79,246,175,
+    10,245,119,133,150,101,161,101,197,85,59,63,240,150,109,193,
+    150,250,154,234,234,72,95,184,249,198,210,180,214,213,127,183,
+    107,96,185,107,64,237,58,172,117,29,86,93,135,63,165,44,
+    53,142,207,193,237,119,32,223,223,113,63,39,16,78,255,119,
+    99,87,98,169,223,80,29,65,205,17,156,59,156,109,104,203,
+    208,117,43,172,45,185,243,155,137,203,137,76,93,247,50,219,
+    157,97,187,179,222,78,176,42,60,13,153,198,125,153,166,222,
+    63,174,93,58,249,135,45,63,110,81,155,246,65,129,230,121,
+    238,163,103,84,207,80,146,253,196,238,186,218,15,130,43,235,
+    168,69,15,12,106,226,173,154,52,165,186,218,179,142,214,172,
+    163,126,197,3,214,129,234,9,106,158,96,214,237,207,186,125,
+    89,207,186,156,207,46,88,63,37,0,124,142,64,142,176,51,
+    214,74,201,134,120,1,75,182,87,137,242,232,66,81,166,1,
+    159,144,192,39,22,145,42,137,242,128,135,95,106,22,98,149,
+    75,221,97,111,193,114,189,95,80,144,192,27,220,176,116,24,
+    45,215,87,16,56,2,224,132,116,20,37,143,1,184,205,73,
+    67,249,109,34,13,35,240,2,2,47,34,240,85,4,94,66,
+    224,56,129,2,65,198,174,163,81,40,72,122,205,40,41,221,
+    103,249,160,144,177,69,218,243,224,47,81,213,115,4,246,238,
+    96,42,119,23,167,178,56,125,139,29,170,103,179,230,217,92,
+    156,192,90,27,154,64,27,154,64,27,154,64,91,126,2,77,
+    243,71,228,39,233,179,13,120,2,195,4,10,91,142,88,68,
+    114,132,18,45,35,180,72,141,48,34,61,98,21,153,17,86,
+    180,142,112,34,139,166,67,231,208,43,156,0,53,42,161,201,
+    187,135,136,220,195,41,52,254,123,72,228,221,67,51,61,12,
+    140,132,12,113,112,181,71,39,227,226,116,20,57,230,194,232,
+    232,215,167,67,209,53,55,157,58,126,242,184,78,29,124,241,
+    101,157,126,245,192,254,151,116,234,249,129,231,117,234,208,192,
+    43,58,243,194,137,175,12,188,116,155,192,99,54,38,100,34,
+    15,254,17,77,200,38,60,33,249,191,172,205,62,119,208,0,
+    118,97,238,144,41,43,212,204,13,160,63,131,16,106,94,18,
+    136,164,243,91,168,175,74,128,74,49,169,195,162,37,88,84,
+    56,101,94,145,160,152,20,71,209,194,3,27,138,52,43,178,
+    234,84,75,5,245,121,112,10,158,104,44,5,53,247,200,177,
+    20,210,48,22,203,255,217,88,10,76,243,200,177,152,212,206,
+    19,81,45,40,188,71,82,45,120,150,79,72,181,48,7,143,
+    164,234,48,81,53,151,59,139,229,224,69,234,236,129,144,28,
+    70,187,152,127,49,18,63,20,62,31,25,11,7,93,210,22,
+    168,215,45,147,79,235,108,28,199,195,101,221,122,252,18,40,
+    156,73,99,39,199,17,120,22,129,11,8,76,33,112,17,1,
+    25,181,227,16,201,87,15,132,36,233,235,40,235,216,127,26,
+    244,79,104,76,121,62,60,25,151,46,73,18,66,84,0,4,
+    73,44,68,100,244,206,134,224,208,107,38,194,70,228,8,155,
+    186,210,55,160,44,139,80,254,153,48,2,68,238,249,174,27,
+    219,174,239,214,214,109,82,217,167,52,246,169,28,225,102,90,
+    86,156,245,87,19,25,110,93,206,74,216,106,223,30,187,209,
+    118,189,231,173,248,66,60,195,119,194,243,65,79,150,115,190,
+    237,89,104,212,220,237,160,46,54,130,76,1,0,21,224,143,
+    185,252,184,93,150,247,222,160,110,28,184,126,244,29,231,117,
+    103,134,239,130,231,131,163,133,86,157,208,234,41,212,234,41,
+    104,213,85,108,181,194,215,206,31,190,241,210,245,17,173,121,
+    139,202,111,213,248,173,40,126,132,7,51,155,225,154,76,213,
+    59,84,126,167,198,239,196,81,173,252,88,63,129,223,111,100,
+    184,102,67,174,153,185,26,173,39,230,234,127,37,140,136,142,
+    98,170,44,170,134,115,120,221,37,11,58,230,40,195,177,84,
+    224,88,42,112,168,10,28,170,2,135,174,192,161,43,112,152,
+    10,28,166,2,199,90,129,99,93,243,205,216,225,32,117,239,
+    223,161,236,222,127,32,240,95,104,83,80,247,254,28,165,255,
+    22,129,127,49,10,208,118,187,119,9,129,171,70,193,235,40,
+    141,34,135,247,94,53,10,254,14,165,127,136,192,247,141,2,
+    116,54,115,239,39,8,252,1,42,96,77,251,22,239,86,180,
+    51,141,157,136,182,236,218,118,212,185,216,154,118,48,239,73,
+    39,218,147,104,59,174,217,88,18,234,34,7,95,249,60,129,
+    93,44,214,249,246,174,133,61,203,236,250,12,187,62,235,108,
+    73,190,145,229,221,111,191,186,112,106,153,111,205,240,173,166,
+    146,215,150,249,182,12,223,86,13,103,93,50,241,176,86,175,
+    47,243,237,25,190,125,21,149,228,24,194,214,1,153,202,64,
+    96,33,44,240,11,24,250,183,249,71,159,87,224,144,95,241,
+    244,194,247,48,159,170,172,21,21,19,20,147,135,84,220,68,
+    179,20,56,236,212,218,242,142,139,228,21,190,228,36,132,78,
+    208,82,95,73,31,101,254,80,161,109,235,155,188,17,102,0,
+    10,116,25,133,218,39,161,176,212,106,14,69,86,248,61,140,
+    98,58,175,72,242,227,164,72,93,230,18,76,169,32,61,69,
+    33,207,101,150,157,229,98,190,18,106,150,74,63,176,136,155,
+    32,37,191,153,186,72,95,38,80,16,35,193,141,83,15,163,
+    95,226,35,98,220,210,128,7,176,8,51,140,45,21,233,12,
+    81,38,39,208,130,35,135,236,179,29,0,222,38,177,164,48,
+    213,139,228,155,36,76,165,221,112,205,196,178,33,204,48,152,
+    56,61,140,233,78,24,133,77,207,77,108,199,159,127,218,135,
+    98,31,224,24,4,45,58,121,81,103,196,240,148,114,70,70,
+    141,3,115,152,39,30,112,123,162,161,201,211,98,104,239,76,
+    160,212,1,233,221,19,141,143,133,162,242,222,222,60,70,35,
+    12,74,70,238,194,253,57,34,77,190,119,112,145,92,28,88,
+    58,120,251,216,109,231,135,181,106,71,191,214,209,175,6,250,
+    231,136,234,130,16,191,32,82,18,215,224,133,18,249,97,91,
+    134,39,126,240,14,250,220,219,39,161,16,34,40,146,107,68,
+    137,34,145,222,65,47,249,216,177,33,231,5,31,79,192,208,
+    168,116,232,93,118,109,28,32,47,144,234,49,28,181,112,76,
+    49,164,7,18,18,152,249,209,220,76,25,135,46,210,196,105,
+    240,158,70,207,40,147,209,252,41,138,53,34,163,179,102,157,
+    47,232,49,221,110,144,49,50,86,35,163,219,141,147,81,60,
+    52,157,132,103,66,39,79,75,41,162,252,196,228,57,227,141,
+    94,203,3,11,26,180,159,196,19,250,5,71,184,91,82,19,
+    170,107,131,230,218,48,119,36,203,58,140,211,147,206,149,186,
+    246,244,225,155,47,168,117,125,90,93,95,210,158,180,127,82,
+    215,178,16,75,218,115,54,130,115,207,31,51,132,213,170,203,
+    13,190,151,219,191,176,62,105,93,117,120,193,135,226,59,110,
+    52,167,207,171,13,189,90,67,239,210,198,229,134,254,76,67,
+    127,214,219,144,218,255,214,145,228,64,214,183,110,225,245,228,
+    32,200,32,167,239,33,184,160,30,235,55,164,207,169,117,219,
+    180,186,109,73,59,100,107,235,50,117,253,133,231,195,223,84,
+    61,199,52,207,177,55,217,36,153,220,154,12,37,67,159,212,
+    117,166,35,106,221,22,173,110,75,210,158,245,52,231,107,80,
+    248,201,129,66,160,125,43,30,95,166,174,11,158,197,214,197,
+    175,46,145,139,13,170,103,187,230,217,158,71,252,196,222,152,
+    218,154,10,165,221,198,137,112,225,148,196,236,108,21,132,227,
+    153,181,173,244,40,225,40,90,126,155,46,169,39,31,83,111,
+    169,172,191,65,99,235,234,1,217,174,83,91,182,93,68,236,
+    20,137,41,224,53,253,30,90,197,155,8,188,71,148,123,77,
+    55,242,160,11,173,240,211,132,17,191,219,254,29,121,126,235,
+    155,231,175,158,207,216,183,195,115,99,123,234,235,239,236,184,
+    190,195,200,189,39,47,110,125,247,252,205,181,58,244,208,219,
+    43,117,67,193,215,244,147,143,127,125,28,139,193,50,248,81,
+    147,128,177,200,181,115,230,234,65,103,74,124,228,52,149,133,
+    118,159,148,10,241,72,42,148,249,206,68,209,128,73,80,70,
+    188,9,197,152,112,28,137,189,99,175,240,149,133,97,28,29,
+    154,97,78,5,118,159,10,20,131,198,216,131,158,105,40,143,
+    25,109,10,136,33,249,76,88,108,195,126,245,12,223,190,127,
+    240,224,174,253,131,187,6,139,30,182,36,2,8,50,18,50,
+    82,76,199,49,200,151,150,78,161,42,90,103,198,70,197,56,
+    138,200,160,31,195,21,71,62,181,140,134,94,8,185,24,71,
+    194,40,148,60,22,61,135,16,67,145,152,244,1,84,60,133,
+    54,202,119,8,188,81,4,231,219,237,243,225,183,122,22,122,
+    84,161,41,117,81,21,186,62,104,95,12,223,238,185,3,249,
+    190,37,89,21,118,207,13,172,8,142,171,131,243,79,167,218,
+    111,200,233,167,223,153,185,62,163,10,61,154,208,3,21,249,
+    227,213,247,182,167,167,223,221,125,115,183,234,234,213,92,189,
+    115,71,86,74,3,32,142,32,120,237,192,165,79,224,171,87,
+    229,191,43,212,19,93,165,160,202,174,82,80,255,203,87,41,
+    104,145,78,80,191,194,85,10,170,236,252,17,90,87,156,143,
+    124,153,171,20,214,39,184,74,97,173,56,121,101,19,172,233,
+    42,5,189,118,149,2,7,81,103,203,66,168,9,46,97,45,
+    27,41,159,96,30,114,149,130,175,188,74,17,33,102,109,143,
+    185,78,113,107,214,206,19,9,123,218,73,84,249,136,101,97,
+    229,89,33,33,60,4,147,45,195,172,137,117,181,19,74,160,
+    136,209,1,236,67,130,24,249,85,104,156,36,98,244,5,194,
+    184,130,150,16,18,22,195,72,148,173,9,65,204,123,35,30,
+    165,221,244,126,246,202,179,101,152,7,25,218,218,206,147,82,
+    157,210,105,194,21,18,101,23,213,102,29,9,71,194,150,16,
+    246,64,58,198,161,148,233,164,203,81,214,143,35,33,84,244,
+    243,195,132,13,102,180,121,214,9,107,100,10,182,155,218,217,
+    18,206,34,205,138,245,106,73,144,15,105,199,84,189,182,194,
+    13,75,8,221,36,235,144,4,148,208,97,182,110,43,202,26,
+    221,113,62,30,85,66,19,225,181,124,208,139,47,181,72,126,
+    162,242,152,185,9,1,180,99,140,56,113,181,131,105,28,29,
+    236,64,0,159,47,219,71,193,70,83,66,138,34,141,142,234,
+    142,253,240,27,57,61,173,132,7,36,41,46,233,62,211,225,
+    179,120,126,92,54,174,175,96,225,39,161,192,95,208,85,60,
+    87,211,173,107,162,177,32,70,165,30,162,228,136,186,120,58,
+    45,96,98,6,190,140,15,170,37,196,155,210,157,98,101,254,
+    190,11,133,238,220,160,145,6,202,62,134,214,254,163,60,216,
+    139,237,50,203,175,251,77,22,232,211,91,55,55,84,118,156,
+    237,97,246,98,144,100,114,22,150,119,131,205,120,215,219,185,
+    236,237,76,71,85,239,118,205,187,29,172,199,124,81,102,195,
+    14,213,187,83,243,238,76,14,36,7,238,175,56,155,115,4,
+    205,187,139,96,213,219,88,29,59,43,184,146,135,114,60,160,
+    220,191,143,66,253,130,123,126,240,202,190,228,190,84,56,173,
+    252,96,50,53,185,34,180,166,59,23,235,151,54,168,194,51,
+    154,240,76,6,63,171,78,111,106,40,227,236,134,103,101,253,
+    214,165,206,15,125,234,250,125,218,250,125,243,66,118,195,182,
+    121,33,245,178,234,106,207,184,218,87,215,111,92,28,208,214,
+    67,137,65,165,105,105,90,21,250,53,161,63,131,159,85,231,
+    58,100,139,110,193,32,73,101,57,231,93,174,105,153,107,74,
+    157,90,108,215,154,123,85,110,179,198,109,206,224,231,225,183,
+    119,100,116,41,229,167,61,61,135,124,150,159,249,90,15,61,
+    195,252,108,23,9,176,68,83,34,190,194,154,242,119,176,169,
+    102,142,163,200,110,179,137,36,146,213,56,186,228,24,161,104,
+    68,129,158,188,67,151,223,223,41,185,94,138,92,229,178,155,
+    38,37,174,111,181,122,91,177,190,168,53,171,31,94,38,72,
+    144,170,165,253,131,14,125,200,97,101,197,21,59,208,47,212,
+    67,206,253,105,67,131,151,183,0,124,219,67,240,173,213,240,
+    209,220,161,75,203,37,51,204,86,94,12,60,137,49,13,125,
+    2,210,243,193,243,195,113,228,100,34,147,48,28,0,79,51,
+    44,161,83,179,222,192,139,209,112,72,14,7,240,93,155,104,
+    52,128,175,4,4,148,120,1,37,160,156,9,23,27,134,98,
+    98,96,74,28,239,213,89,49,130,175,223,61,160,182,246,110,
+    191,109,209,109,56,103,184,141,172,20,138,157,147,195,83,15,
+    232,94,249,252,4,64,104,241,160,115,60,4,4,196,18,210,
+    136,108,124,90,153,154,6,234,82,124,50,208,41,7,237,134,
+    205,137,150,70,167,14,197,21,227,250,29,186,129,163,91,226,
+    178,33,184,71,80,142,193,119,119,117,30,255,140,66,63,249,
+    36,116,6,134,44,82,22,186,21,136,139,17,73,183,67,71,
+    131,208,59,58,15,49,228,47,190,70,52,190,86,36,163,173,
+    92,148,147,72,56,131,188,85,164,95,64,102,10,137,202,95,
+    18,107,199,66,72,90,57,87,56,33,103,33,107,14,147,159,
+    82,20,111,251,156,0,144,195,128,35,120,103,210,250,133,141,
+    112,215,45,240,233,147,31,50,25,23,8,204,189,154,107,47,
+    88,167,180,119,254,68,234,25,149,238,212,232,206,12,221,89,
+    145,175,245,45,236,188,182,231,123,123,210,214,69,187,90,219,
+    167,213,246,205,13,101,233,154,111,191,240,173,23,230,135,84,
+    186,85,163,91,51,116,107,206,98,101,14,145,32,216,120,207,
+    93,110,221,50,183,46,53,180,184,67,109,218,170,114,219,52,
+    110,91,134,219,134,175,46,84,171,48,158,251,48,114,32,0,
+    175,144,169,233,91,138,170,220,65,141,59,152,49,61,32,175,
+    100,164,166,62,102,182,28,216,73,124,188,211,115,80,160,170,
+    179,125,230,75,177,61,255,107,202,248,177,250,10,166,172,48,
+    100,204,44,249,72,65,81,149,241,31,33,40,216,39,22,20,
+    220,99,4,5,63,44,253,41,148,74,40,40,45,161,232,182,
+    244,23,0,102,158,26,172,206,188,152,233,3,227,113,41,112,
+    232,149,193,227,129,188,145,242,87,168,225,71,8,252,53,0,
+    51,79,75,31,19,121,67,4,95,173,251,41,145,183,198,16,
+    83,75,63,67,224,111,16,64,65,245,53,54,150,80,200,92,
+    250,57,129,174,253,34,115,7,119,42,253,61,228,203,25,215,
+    142,24,215,176,150,20,233,31,160,228,77,196,189,78,242,87,
+    224,222,28,199,1,142,183,97,225,200,98,195,135,3,25,239,
+    1,213,123,64,243,30,72,242,43,92,115,74,76,31,81,185,
+    94,141,235,205,112,189,232,46,156,55,117,73,229,130,26,23,
+    204,112,193,149,250,134,133,11,215,18,223,75,164,7,23,143,
+    169,245,187,180,250,93,73,1,184,241,187,206,43,206,148,160,
+    114,157,26,215,153,193,15,240,160,5,143,35,83,179,71,229,
+    250,53,174,63,195,129,227,234,72,90,147,86,100,46,208,255,
+    15,44,142,236,225,31,236,223,120,192,74,124,108,117,31,104,
+    164,62,110,217,114,208,69,252,212,229,57,216,73,5,201,65,
+    9,237,204,224,58,99,121,176,217,124,9,79,255,228,211,189,
+    107,247,65,208,166,194,255,127,161,11,80,88,248,111,20,195,
+    218,70,156,166,179,80,142,254,209,194,88,119,188,3,144,105,
+    90,20,232,198,45,48,108,123,99,59,27,71,46,81,48,19,
+    71,46,141,40,34,14,52,125,80,216,51,72,34,227,133,197,
+    193,212,226,169,245,3,110,143,113,246,189,87,82,9,227,192,
+    93,254,24,96,142,34,73,50,7,50,156,180,205,241,232,47,
+    75,240,70,98,53,159,200,89,40,210,2,59,224,177,128,123,
+    82,60,130,108,200,16,126,243,147,163,41,210,147,165,93,115,
+    67,198,31,90,34,40,16,220,198,161,57,90,116,43,79,250,
+    115,68,1,52,250,201,142,28,81,0,187,60,228,70,48,90,
+    243,160,199,73,182,230,136,2,232,104,33,173,57,162,0,14,
+    144,118,148,44,128,54,43,137,174,180,84,128,79,17,248,188,
+    88,230,245,144,45,136,254,26,216,82,67,174,207,17,5,208,
+    209,134,6,83,10,142,194,236,246,129,161,153,7,130,3,245,
+    89,0,109,155,17,98,41,16,201,58,18,118,55,97,130,219,
+    26,113,186,58,148,145,252,189,73,7,137,219,244,102,234,127,
+    0,47,201,72,28,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/util/dot_writer.py",
+    "m5.util.dot_writer",
+    embedded_module_data,
+    6213,
+    13849);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,227 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,197,89,93,108,19,217,21,158,241,252,120,108,143,99,
+    199,73,128,216,236,226,252,177,152,64,66,72,178,180,75,54,
+    4,242,195,79,66,232,2,221,45,180,52,53,158,73,226,224,
+    216,222,59,19,32,193,217,141,86,187,218,236,42,82,67,5,
+    90,75,221,149,188,43,202,6,193,67,90,173,84,164,246,161,
+    237,75,95,250,224,177,166,178,53,106,36,164,106,43,241,230,
+    21,187,18,66,149,218,115,103,18,123,108,18,32,173,170,218,
+    227,51,119,238,61,247,222,115,190,123,206,185,231,142,255,78,
+    152,62,244,234,253,81,28,200,39,132,64,8,100,132,56,111,
+    220,201,243,36,220,45,17,203,36,117,158,34,9,155,81,75,
+    159,167,163,182,6,130,36,4,234,60,125,142,136,82,87,169,
+    115,196,21,82,160,223,39,206,51,2,3,148,21,88,160,86,
+    193,10,148,19,56,160,54,193,6,212,46,216,129,58,4,7,
+    80,94,32,207,16,1,254,33,158,123,56,64,106,244,149,32,
+    138,14,132,40,147,104,12,252,240,243,35,175,33,26,153,0,
+    97,126,73,39,72,157,90,48,253,140,134,65,168,225,39,100,
+    131,70,237,219,127,245,14,60,104,36,210,200,49,141,188,40,
+    225,190,126,191,255,73,147,132,66,173,241,105,121,60,22,109,
+    157,236,108,157,146,195,145,86,33,38,143,92,65,97,89,68,
+    35,104,234,226,116,75,124,90,115,143,224,74,52,118,113,68,
+    142,141,140,203,147,17,196,195,0,109,240,147,26,128,204,17,
+    57,71,227,252,219,105,71,35,92,139,65,227,158,124,195,184,
+    227,139,110,124,132,165,14,89,76,42,240,107,42,156,215,85,
+    144,201,98,211,68,161,156,192,170,129,82,2,37,51,197,118,
+    129,22,24,129,189,13,189,239,22,64,17,172,2,39,80,247,
+    108,183,109,80,107,91,171,5,8,236,195,154,245,36,18,67,
+    49,36,60,169,172,71,177,169,168,32,10,123,252,163,225,72,
+    68,20,234,159,88,27,246,233,159,135,127,1,246,135,255,192,
+    228,159,64,52,230,48,10,7,35,154,165,173,227,14,167,49,
+    210,120,48,46,106,76,36,120,81,140,192,147,60,29,129,167,
+    80,44,18,67,154,13,143,100,20,185,209,88,84,142,6,39,
+    69,163,36,133,103,68,104,134,146,222,124,135,210,152,248,52,
+    0,169,209,195,49,65,212,33,188,99,1,134,169,72,100,36,
+    30,148,199,81,45,6,212,162,47,13,114,96,33,182,234,184,
+    135,144,24,148,197,17,16,29,175,73,20,247,109,130,214,78,
+    12,222,17,29,254,21,135,123,225,181,28,87,153,171,216,154,
+    171,168,202,85,212,65,97,197,83,159,106,95,162,150,206,40,
+    158,54,213,211,150,171,220,150,171,172,201,121,124,249,42,59,
+    207,126,67,0,249,22,147,60,97,103,88,228,252,255,173,14,
+    114,65,9,185,49,169,196,232,127,141,201,239,49,73,227,186,
+    26,76,182,96,178,21,19,63,38,13,229,56,213,152,113,10,
+    201,40,98,160,212,12,109,189,184,195,78,76,158,210,209,186,
+    166,99,199,51,117,4,13,117,29,239,209,183,65,203,187,5,
+    77,65,122,102,120,204,40,63,56,52,3,134,212,177,95,232,
+    220,167,89,71,99,8,60,86,128,245,102,175,136,225,177,113,
+    25,249,176,144,148,16,70,119,44,168,14,151,233,126,97,76,
+    132,197,167,192,255,160,65,146,75,212,169,54,171,19,142,202,
+    35,34,112,163,87,161,233,13,172,249,75,197,53,95,12,37,
+    219,83,210,114,224,15,181,105,199,160,226,24,84,29,131,105,
+    122,240,127,170,106,30,171,218,254,189,182,206,253,175,106,244,
+    197,24,152,109,11,70,23,7,3,212,94,190,48,37,154,136,
+    87,87,53,249,62,52,253,112,35,77,182,164,29,199,20,199,
+    49,213,113,44,77,31,123,90,19,110,77,147,106,6,107,146,
+    32,38,10,77,125,196,133,67,179,150,4,153,50,105,87,252,
+    152,77,52,97,73,81,235,241,220,134,223,221,194,19,24,183,
+    101,98,109,19,32,102,88,104,7,73,238,22,164,185,13,243,
+    220,45,204,69,18,11,61,178,99,163,177,102,41,144,148,53,
+    73,250,183,89,58,65,79,88,215,106,94,68,158,4,117,153,
+    64,7,19,212,102,251,213,22,71,160,39,184,205,244,188,164,
+    235,138,200,133,31,1,170,182,245,248,229,154,98,121,211,250,
+    108,82,154,103,163,191,121,52,55,59,127,23,252,22,86,4,
+    203,251,216,234,10,43,221,87,190,210,140,64,61,135,131,149,
+    183,21,231,152,40,204,156,114,174,39,67,130,41,213,116,214,
+    186,169,222,108,105,111,1,127,233,15,168,162,77,204,114,56,
+    49,153,181,225,196,100,214,94,42,247,133,172,110,165,21,5,
+    94,135,133,72,216,224,103,79,56,94,8,99,107,233,154,37,
+    184,210,231,89,94,222,97,146,213,33,148,241,35,119,130,23,
+    184,132,99,194,189,86,51,131,117,176,97,58,227,196,253,55,
+    244,246,6,243,184,47,36,43,255,28,251,218,200,3,154,76,
+    51,153,176,122,65,15,168,218,12,255,115,226,79,78,48,182,
+    212,25,250,180,191,73,8,153,129,193,97,12,79,245,168,135,
+    192,97,115,12,12,244,130,111,22,118,239,98,248,92,31,200,
+    82,1,174,91,22,182,159,33,16,118,52,216,189,56,28,209,
+    241,78,171,209,56,127,129,26,75,203,62,141,142,132,163,151,
+    204,187,192,19,123,87,36,44,65,18,52,25,239,158,217,97,
+    218,17,90,186,34,177,80,48,34,117,183,20,25,34,208,65,
+    194,251,245,28,145,230,123,140,43,37,204,159,93,184,144,117,
+    238,200,56,119,40,206,58,213,89,87,104,50,54,8,179,228,
+    236,154,166,167,139,154,54,110,94,83,221,81,72,179,163,128,
+    238,77,0,175,101,248,225,191,224,131,112,52,64,135,136,210,
+    13,15,225,124,236,185,58,78,226,94,109,134,142,206,163,198,
+    181,116,118,94,88,152,204,86,248,51,21,126,165,162,94,173,
+    168,79,117,192,247,116,170,67,173,216,85,224,210,213,69,125,
+    68,217,166,88,208,249,29,194,216,20,83,235,41,8,38,92,
+    106,50,146,37,1,6,3,89,28,33,155,140,47,81,102,88,
+    37,109,101,35,204,216,9,226,3,75,17,163,51,196,29,114,
+    56,128,45,35,42,72,87,194,242,184,70,69,196,40,84,208,
+    50,216,138,198,74,83,163,163,225,171,37,41,130,67,146,81,
+    56,62,130,112,162,52,227,95,23,57,19,199,219,88,236,215,
+    117,232,114,174,170,159,207,126,60,155,124,83,113,53,170,174,
+    198,60,65,218,182,229,170,182,206,15,66,67,186,122,239,205,
+    80,178,241,122,248,70,248,87,13,169,209,207,155,111,53,43,
+    91,246,66,173,234,106,73,115,45,79,167,21,5,255,248,233,
+    127,132,224,179,48,18,202,16,66,3,112,3,72,236,146,28,
+    68,178,142,18,58,166,87,161,227,24,16,54,142,196,114,144,
+    236,6,4,17,113,84,222,192,186,138,12,151,177,92,251,10,
+    16,189,251,241,187,201,203,138,107,167,234,218,89,2,209,205,
+    222,36,123,125,240,198,224,226,201,197,147,170,171,62,205,213,
+    235,168,104,118,221,163,71,228,233,184,56,99,241,239,122,66,
+    6,2,213,154,213,56,124,72,26,23,20,132,226,17,4,117,
+    227,30,182,213,147,73,88,208,104,33,28,146,53,27,206,89,
+    245,40,160,113,144,224,26,33,130,131,44,119,181,132,199,40,
+    164,180,154,13,71,17,131,219,18,147,52,30,92,100,50,22,
+    53,64,64,120,169,53,235,120,80,10,202,50,66,63,192,115,
+    226,172,94,79,33,53,14,207,131,135,12,56,53,107,84,148,
+    175,196,208,37,205,6,120,68,198,80,48,62,142,56,125,248,
+    80,44,26,21,67,178,40,160,195,248,153,193,161,74,210,88,
+    100,220,173,120,34,60,211,9,60,236,32,38,167,48,27,141,
+    143,17,198,137,204,169,47,132,233,179,106,184,166,117,64,163,
+    80,115,14,51,191,99,209,129,119,86,47,140,228,9,138,177,
+    235,100,158,132,195,89,150,243,102,56,239,10,223,144,58,252,
+    229,192,23,3,159,31,187,117,108,105,116,249,237,175,174,41,
+    45,71,20,190,87,229,123,191,161,44,54,251,183,4,144,124,
+    129,124,103,39,42,107,174,179,55,216,185,227,57,247,86,213,
+    93,151,39,56,230,144,78,230,233,28,239,94,56,153,229,95,
+    206,240,47,43,188,95,229,253,169,227,105,126,47,92,57,190,
+    102,81,184,49,153,221,178,43,179,101,151,178,101,183,10,23,
+    223,188,36,223,155,205,182,30,206,180,30,86,90,123,213,214,
+    222,12,223,155,230,123,31,240,213,38,233,252,169,234,91,47,
+    101,235,218,51,117,237,74,93,167,90,215,185,44,127,53,155,
+    61,112,60,115,224,184,114,96,80,61,48,168,240,67,42,63,
+    84,46,42,75,52,183,222,219,155,221,221,149,217,221,165,236,
+    238,86,119,119,207,219,22,27,111,236,205,122,26,51,158,70,
+    197,179,83,245,236,84,184,87,210,220,43,192,234,60,76,66,
+    232,94,26,83,91,14,193,93,225,123,84,190,103,174,63,167,
+    71,184,229,183,212,206,1,184,43,206,163,170,243,232,220,192,
+    74,133,123,97,44,91,81,159,129,128,216,169,84,4,212,138,
+    192,220,209,21,167,107,225,173,172,179,46,227,172,75,237,84,
+    156,1,213,25,88,106,132,239,145,165,70,213,217,58,55,144,
+    167,41,166,21,35,191,74,236,20,211,128,75,171,4,32,221,
+    166,35,105,195,235,3,4,144,116,85,45,204,194,205,237,91,
+    116,36,79,36,79,164,228,47,167,191,152,254,252,218,173,107,
+    203,71,149,237,93,234,246,174,251,163,138,187,95,117,247,207,
+    51,43,14,207,98,71,114,187,226,216,169,58,116,159,218,159,
+    227,43,23,207,38,251,62,61,165,212,52,47,133,148,154,54,
+    133,111,155,239,47,160,250,87,223,190,229,234,223,214,254,166,
+    246,215,190,175,124,247,69,197,215,167,250,250,20,174,95,229,
+    250,211,92,255,131,255,26,124,157,184,214,148,49,130,219,186,
+    111,139,222,36,55,62,253,225,147,223,61,170,44,63,43,57,
+    216,195,249,176,172,157,36,100,182,216,94,60,43,165,76,189,
+    204,129,49,97,41,27,159,78,80,41,118,93,94,186,60,187,
+    177,193,236,41,235,250,188,2,173,231,133,204,61,182,92,62,
+    232,195,109,208,199,186,81,31,156,69,225,151,120,114,85,145,
+    31,178,80,186,156,239,156,206,105,188,226,11,216,134,53,70,
+    143,58,154,101,232,52,142,238,250,131,30,70,33,122,6,163,
+    151,224,244,63,67,183,72,151,199,52,38,10,33,35,134,95,
+    236,197,81,108,12,42,227,194,232,76,211,104,48,28,17,5,
+    191,28,243,143,137,81,17,65,80,241,67,124,241,67,104,141,
+    79,201,254,81,20,155,244,55,73,1,187,241,254,128,234,139,
+    201,122,204,65,63,38,214,194,48,61,17,11,71,53,70,127,
+    117,167,217,244,219,8,158,110,181,8,147,32,108,4,1,6,
+    141,96,118,22,70,6,153,52,7,204,50,0,83,227,247,86,
+    232,103,184,133,199,113,109,116,181,74,194,75,105,138,122,86,
+    136,122,56,240,33,188,205,124,8,63,233,119,132,126,136,119,
+    215,220,176,165,222,90,22,210,238,131,138,251,160,234,62,56,
+    119,124,133,118,45,90,147,181,10,221,160,210,13,105,186,97,
+    165,170,230,198,129,79,186,126,209,149,98,151,28,74,85,135,
+    90,213,49,55,148,163,157,31,158,122,239,212,226,144,66,215,
+    169,116,93,154,174,203,91,88,166,143,132,56,97,243,100,57,
+    95,134,243,37,135,150,94,85,182,183,221,183,166,57,159,194,
+    245,168,92,79,154,235,209,189,107,195,86,227,122,156,183,144,
+    48,212,10,199,167,157,29,203,17,133,235,85,185,222,180,233,
+    122,252,248,177,132,95,117,253,241,165,142,35,85,196,159,170,
+    60,71,118,81,37,174,83,120,113,114,2,76,241,67,182,212,
+    121,100,83,6,49,81,40,131,35,17,165,111,191,62,102,205,
+    110,130,44,31,177,146,5,155,206,60,59,10,78,247,62,7,
+    110,102,58,90,192,193,116,3,7,122,214,97,0,14,107,103,
+    192,157,44,235,187,147,64,9,112,144,91,223,125,74,71,93,
+    223,93,74,121,116,199,161,102,158,146,97,150,49,187,76,130,
+    6,135,103,74,145,128,67,202,89,193,120,157,164,57,78,79,
+    93,156,30,54,118,237,245,207,42,141,64,110,146,165,152,39,
+    136,143,200,210,89,215,50,42,82,179,135,165,112,20,178,170,
+    104,72,4,15,164,98,23,39,208,85,98,45,65,159,51,236,
+    215,21,150,244,215,218,35,171,249,194,76,35,216,179,94,1,
+    70,93,76,167,202,184,62,197,195,96,153,30,131,165,187,106,
+    147,13,201,107,138,171,89,117,53,167,185,102,61,222,130,23,
+    67,255,39,100,75,192,174,89,199,68,25,167,43,154,101,178,
+    83,179,130,20,144,125,72,134,223,178,224,86,144,45,128,211,
+    137,82,8,114,228,96,84,134,20,4,137,241,72,48,36,66,
+    204,16,229,145,120,16,137,81,89,119,105,221,199,2,86,141,
+    70,49,112,56,9,215,200,152,36,48,209,157,216,133,133,52,
+    59,176,174,47,94,102,35,83,233,89,77,85,76,58,34,236,
+    180,55,49,219,159,87,245,241,212,126,86,255,233,238,212,228,
+    242,89,197,243,154,234,121,109,110,240,107,135,27,246,53,198,
+    149,116,232,183,28,87,49,207,230,89,146,217,131,31,203,201,
+    119,44,81,237,77,182,46,117,100,155,15,102,154,15,42,205,
+    175,171,205,175,43,85,221,106,85,119,158,96,152,253,58,153,
+    183,62,240,54,101,189,123,51,94,200,77,60,139,189,201,87,
+    178,222,61,25,239,30,197,219,162,122,91,178,222,246,140,183,
+    93,241,118,170,222,78,165,186,243,62,171,84,119,195,38,231,
+    195,155,156,207,62,239,130,41,108,110,8,37,91,82,59,20,
+    174,77,229,218,210,250,149,119,172,13,175,175,65,192,105,68,
+    195,119,177,202,214,201,206,22,252,119,134,30,243,116,240,245,
+    23,238,70,218,170,167,144,56,249,212,243,72,35,144,98,172,
+    117,108,244,211,173,113,208,210,79,175,92,215,100,76,152,138,
+    136,221,232,35,221,130,1,57,13,72,158,34,73,50,63,68,
+    18,164,125,206,134,191,15,8,155,81,200,17,219,210,165,23,
+    228,35,164,39,71,187,231,134,140,47,142,75,80,193,87,206,
+    245,227,47,68,33,64,151,108,2,56,215,8,231,32,217,60,
+    81,32,219,203,30,73,114,136,196,140,5,202,145,228,113,189,
+    92,160,92,51,9,249,64,129,252,132,116,144,16,84,9,19,
+    221,238,34,1,189,167,137,132,67,192,34,93,67,220,164,125,
+    212,191,1,206,232,191,249,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/util/dot_writer_ruby.py",
+    "m5.util.dot_writer_ruby",
+    embedded_module_data,
+    3239,
+    6930);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,415 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,237,59,109,108,27,71,118,179,203,37,185,164,40,145,
+    250,178,44,89,145,86,150,100,91,177,69,127,196,142,29,219,
+    181,45,203,150,63,18,203,201,57,185,92,212,187,242,40,237,
+    74,162,77,145,202,238,210,178,9,249,226,246,130,30,149,211,
+    225,104,215,169,21,215,134,153,34,9,108,92,174,240,1,14,
+    16,180,63,122,185,31,69,127,244,7,105,108,27,129,87,23,
+    6,138,160,72,127,201,181,15,48,210,31,215,247,102,63,184,
+    75,145,142,131,58,104,81,148,162,30,135,51,111,102,223,188,
+    121,159,51,195,127,37,182,151,219,248,124,240,71,12,33,151,
+    137,72,68,38,78,70,244,79,102,132,129,79,54,206,78,185,
+    70,92,12,214,185,226,220,148,123,196,77,203,92,220,51,229,
+    29,241,50,132,37,135,136,232,126,155,136,30,201,117,146,55,
+    7,254,200,69,200,47,92,230,183,17,158,98,121,1,139,7,
+    44,95,21,44,31,197,242,1,150,31,176,252,85,176,252,20,
+    171,6,176,2,128,85,83,5,171,134,98,213,2,86,221,71,
+    44,180,176,86,75,128,182,4,161,37,4,253,107,171,244,175,
+    165,88,245,128,213,0,88,117,85,176,234,40,86,35,96,53,
+    1,86,176,10,86,80,100,78,144,190,230,47,241,203,112,31,
+    83,116,79,159,29,23,85,40,248,78,196,166,142,143,158,148,
+    198,240,139,123,60,170,70,227,99,246,229,97,204,229,105,32,
+    184,60,18,193,37,25,97,69,102,196,37,178,48,164,171,88,
+    51,36,170,47,203,201,105,73,86,207,166,187,6,101,41,170,
+    74,66,84,152,54,170,132,153,152,58,153,76,169,194,233,104,
+    60,37,41,225,225,155,92,145,143,68,18,209,41,41,18,41,
+    250,35,145,169,164,152,138,99,57,16,137,188,153,138,198,141,
+    22,111,36,34,38,199,34,145,155,228,1,62,255,171,78,69,
+    30,219,56,125,22,198,74,108,156,218,182,49,165,198,226,27,
+    97,10,147,82,28,30,19,158,62,43,123,1,139,130,48,252,
+    43,205,0,206,91,127,139,220,250,60,183,254,30,199,159,63,
+    32,215,153,120,142,121,154,139,243,96,53,128,159,148,205,52,
+    67,198,25,145,125,155,31,225,50,228,12,51,226,166,243,14,
+    217,230,253,122,82,22,149,244,182,202,147,23,102,160,85,88,
+    247,220,150,254,209,152,42,164,18,74,108,34,33,137,125,38,
+    67,198,92,54,50,56,248,199,239,15,174,0,120,151,185,76,
+    84,166,212,56,203,126,4,223,126,97,213,168,108,169,237,20,
+    29,69,118,205,178,19,204,57,32,250,109,192,62,64,62,130,
+    186,95,88,56,231,88,213,93,234,225,108,203,217,169,40,61,
+    145,129,103,58,100,23,53,15,166,207,14,143,217,8,35,30,
+    248,111,68,178,127,68,165,100,130,204,146,31,236,60,199,56,
+    136,103,30,67,60,45,203,245,118,242,102,129,251,31,51,206,
+    135,39,234,156,24,206,17,47,176,243,187,78,144,155,172,140,
+    248,32,205,220,104,84,145,96,161,56,245,236,180,84,116,41,
+    170,92,116,197,18,106,31,91,100,195,155,138,204,140,130,120,
+    130,32,163,206,124,229,223,29,143,41,234,88,114,106,122,79,
+    186,191,124,101,195,145,72,44,17,83,35,145,240,238,120,114,
+    44,26,87,246,132,75,232,187,161,187,178,147,160,184,229,67,
+    199,244,247,175,187,62,220,122,131,121,127,251,7,219,127,57,
+    246,151,123,114,123,222,109,204,190,178,240,74,182,227,66,199,
+    165,142,108,199,39,202,167,155,127,117,250,246,105,11,157,202,
+    228,77,78,94,1,31,69,14,71,46,186,149,20,60,31,53,
+    69,127,114,31,87,228,20,41,62,94,228,80,63,138,110,148,
+    41,165,232,139,68,198,226,81,69,137,68,20,142,78,70,56,
+    79,167,35,119,2,72,183,86,157,199,118,164,249,21,0,143,
+    206,147,187,53,193,172,123,110,215,252,174,107,61,119,106,58,
+    242,53,29,139,205,109,217,67,153,131,75,30,82,63,204,224,
+    100,82,0,10,161,99,90,232,88,198,125,151,175,157,243,206,
+    123,63,231,87,222,225,87,46,52,45,164,10,124,175,198,247,
+    230,205,183,62,21,143,140,6,86,70,251,41,163,121,148,3,
+    38,81,197,90,131,228,49,41,30,7,237,102,228,110,164,5,
+    23,113,159,78,122,189,9,182,98,195,30,157,200,146,34,239,
+    205,115,123,151,56,143,123,205,18,121,50,160,43,60,14,248,
+    223,84,248,6,27,59,79,168,114,44,49,161,164,123,171,168,
+    188,66,219,159,178,138,235,90,242,63,164,226,56,44,85,241,
+    13,196,82,241,250,199,171,56,40,100,195,9,34,163,127,235,
+    99,228,22,252,96,229,86,248,40,122,116,254,216,53,80,94,
+    5,32,189,113,57,143,31,171,124,67,208,73,89,79,80,249,
+    150,8,219,232,47,129,197,246,213,63,27,204,122,230,94,156,
+    127,113,201,229,104,161,2,209,167,107,27,165,74,238,32,134,
+    116,66,173,128,229,46,36,210,107,16,169,75,104,5,253,90,
+    245,24,98,7,177,207,31,18,75,195,188,115,127,48,255,7,
+    215,6,239,212,116,230,107,58,23,91,58,178,177,204,161,37,
+    214,34,118,77,63,37,242,62,126,121,136,32,227,253,157,135,
+    248,234,28,186,54,83,224,215,106,252,218,188,249,214,37,187,
+    7,193,26,226,84,162,117,38,216,71,42,41,209,198,60,183,
+    17,149,104,29,106,200,147,0,253,81,56,224,83,244,154,251,
+    207,170,82,117,175,9,166,90,154,144,100,97,221,14,234,55,
+    255,47,123,205,51,196,82,169,237,229,42,101,39,215,57,232,
+    83,240,151,59,64,61,155,160,8,11,227,143,41,177,132,162,
+    70,19,99,146,174,20,43,73,73,95,153,211,203,85,181,191,
+    124,37,31,171,168,175,66,23,229,48,49,20,181,193,95,2,
+    139,3,251,175,157,188,81,255,203,193,66,199,38,173,99,83,
+    62,176,27,244,150,89,96,50,195,115,195,243,195,153,225,79,
+    198,62,237,250,213,248,237,113,80,16,123,55,93,34,219,73,
+    153,210,122,116,249,168,170,179,173,85,169,62,78,156,26,235,
+    153,219,61,191,251,218,86,67,99,87,180,103,191,151,25,90,
+    242,88,84,15,189,68,9,186,143,95,30,34,200,120,150,107,
+    236,233,2,191,70,227,215,228,205,247,99,52,54,108,130,151,
+    72,117,183,199,187,215,46,145,39,3,250,163,112,192,202,26,
+    43,147,229,241,252,8,199,18,201,237,20,241,17,143,232,122,
+    155,140,120,69,14,32,143,105,214,136,79,244,0,244,99,50,
+    53,82,35,242,0,3,152,50,141,212,138,126,128,117,152,24,
+    65,194,17,0,24,194,244,103,164,94,172,3,216,32,6,65,
+    5,66,69,30,86,224,132,10,26,159,254,187,65,12,4,132,
+    241,164,44,76,69,65,221,225,31,157,166,130,141,194,204,100,
+    44,46,9,178,52,150,146,149,216,105,41,126,86,152,144,18,
+    146,28,85,17,37,42,140,199,163,170,10,21,162,31,22,88,
+    16,165,211,177,49,73,80,101,73,10,11,175,78,74,198,24,
+    170,28,29,59,165,8,81,81,148,37,69,217,0,54,36,13,
+    118,38,33,10,131,47,191,102,214,10,24,136,208,22,64,128,
+    54,58,158,73,14,244,21,196,216,152,26,75,38,162,242,89,
+    33,57,46,68,227,40,219,170,36,10,211,147,128,29,7,1,
+    162,241,166,67,177,81,238,48,236,121,240,47,148,201,179,76,
+    142,84,122,137,96,30,157,10,59,75,34,214,56,85,123,185,
+    42,244,98,191,182,23,87,161,151,235,107,123,185,43,244,226,
+    172,86,15,44,168,55,253,202,17,106,55,212,24,178,92,87,
+    63,228,148,58,25,83,244,117,176,47,201,88,52,33,36,19,
+    176,154,163,146,128,122,23,139,198,129,245,58,215,241,149,4,
+    251,19,46,250,113,113,34,184,50,10,229,110,209,143,11,164,
+    87,20,125,99,211,41,163,24,68,39,33,203,169,105,85,175,
+    24,238,115,23,93,211,201,105,25,3,92,121,7,130,23,16,
+    96,120,14,182,76,192,161,60,167,102,162,242,132,226,48,104,
+    212,52,212,155,130,105,153,132,81,168,86,126,72,168,209,226,
+    201,170,174,235,207,94,121,54,247,253,91,155,11,109,219,180,
+    182,109,25,110,62,184,216,38,84,168,108,237,188,222,118,165,
+    45,247,226,173,250,66,235,115,90,235,115,80,89,183,216,217,
+    123,61,125,37,157,127,118,215,167,175,20,58,247,106,157,123,
+    51,156,198,183,231,233,155,42,235,152,205,210,211,112,139,186,
+    180,239,211,109,145,39,246,9,207,216,45,190,234,181,247,114,
+    90,127,231,183,115,108,34,236,35,143,243,22,128,241,76,55,
+    81,249,18,70,15,145,67,12,81,125,165,26,177,172,207,159,
+    48,51,228,140,235,13,50,3,14,81,245,151,240,78,122,204,
+    210,105,70,110,182,183,156,97,78,90,52,139,108,186,22,185,
+    18,177,106,42,143,145,179,209,100,163,223,249,68,107,12,39,
+    191,48,38,73,23,191,35,169,41,57,1,186,158,74,196,222,
+    76,73,166,106,11,137,212,212,40,68,32,104,160,162,194,41,
+    233,172,46,200,80,160,98,60,138,49,139,181,125,82,146,96,
+    64,78,156,213,21,1,148,32,170,10,160,7,99,81,16,255,
+    81,24,82,77,66,39,61,176,12,11,71,80,75,74,143,19,
+    147,146,146,88,171,10,210,25,240,154,214,120,81,33,33,205,
+    128,94,72,116,28,26,43,137,27,132,36,116,148,103,98,138,
+    68,71,160,61,208,48,26,104,50,157,144,36,134,211,61,47,
+    27,131,3,213,138,48,149,82,84,164,219,78,14,16,243,37,
+    174,88,159,79,222,12,31,50,170,55,141,0,138,108,76,44,
+    250,191,139,243,56,40,203,73,89,222,134,149,188,105,247,138,
+    65,163,20,25,75,166,80,13,65,73,37,85,148,198,163,169,
+    184,218,231,210,149,205,149,28,61,89,116,225,179,81,152,5,
+    67,223,138,94,163,107,58,100,233,156,81,115,10,154,21,244,
+    62,231,201,239,252,36,176,34,59,118,237,133,66,77,175,86,
+    211,11,113,168,239,8,115,183,161,249,221,209,133,198,11,19,
+    151,38,46,108,184,180,33,51,152,25,92,226,92,181,208,176,
+    162,117,161,251,194,228,165,201,172,43,235,122,116,183,241,153,
+    37,194,64,181,29,222,93,33,228,187,14,21,86,28,214,86,
+    28,206,135,14,47,185,176,242,209,163,71,144,233,134,26,223,
+    157,212,86,172,205,7,241,125,55,208,148,15,244,104,129,158,
+    27,76,33,208,167,23,191,8,182,104,65,225,243,224,250,59,
+    193,245,55,6,63,89,169,109,62,82,8,30,213,130,71,243,
+    252,81,5,109,253,237,224,0,71,62,227,218,6,58,92,14,
+    95,128,162,70,21,121,152,208,253,77,70,181,53,150,172,125,
+    245,24,211,129,111,89,108,35,158,212,247,58,56,186,52,242,
+    126,100,45,135,254,74,30,128,34,228,214,184,6,52,200,48,
+    248,94,11,30,79,82,13,145,80,210,43,44,238,59,234,207,
+    97,175,118,186,6,139,221,61,63,227,53,94,184,219,46,188,
+    55,116,117,8,203,173,121,250,214,77,150,61,254,245,152,51,
+    189,10,224,39,101,81,248,92,153,105,120,135,153,99,68,48,
+    11,105,152,119,218,135,202,110,196,226,77,170,109,76,209,53,
+    7,56,227,108,218,83,110,176,24,146,97,32,189,224,222,230,
+    29,70,139,21,89,209,237,220,251,44,143,231,129,111,158,244,
+    143,15,211,125,67,97,60,149,160,222,29,117,124,167,25,97,
+    72,232,246,49,114,69,55,246,220,22,1,211,15,234,94,132,
+    113,57,57,5,218,141,185,201,6,75,65,83,10,68,3,168,
+    72,211,113,220,223,155,54,35,11,24,38,6,70,101,26,211,
+    26,153,58,71,115,172,201,84,226,148,18,254,18,87,135,46,
+    96,90,160,90,38,244,138,150,13,24,7,60,232,13,53,244,
+    201,149,243,6,76,197,49,221,161,153,67,232,28,51,199,138,
+    152,7,48,105,176,124,37,198,166,25,26,235,215,163,173,147,
+    49,186,148,49,186,140,35,131,126,255,214,239,223,114,25,25,
+    186,203,8,245,207,20,221,186,19,215,53,246,188,45,228,239,
+    179,228,5,24,16,81,147,186,211,173,20,238,207,161,8,161,
+    255,125,68,227,253,144,191,4,22,183,61,159,121,45,59,186,
+    48,144,99,222,59,120,33,94,168,93,157,59,89,8,108,130,
+    104,218,142,69,197,235,203,223,195,11,8,195,84,68,198,101,
+    46,186,229,104,98,66,50,172,139,124,156,86,81,34,116,106,
+    127,104,200,121,192,78,95,186,185,34,217,127,140,36,42,58,
+    137,16,185,215,55,101,15,94,240,95,242,103,220,247,2,245,
+    64,222,182,11,64,85,87,46,122,167,102,109,190,6,76,66,
+    125,190,97,235,167,238,79,83,183,126,84,104,56,88,8,12,
+    105,129,161,124,96,104,137,115,80,77,193,221,157,123,127,237,
+    254,245,155,127,191,186,176,243,152,182,243,24,157,216,125,108,
+    120,104,160,248,252,203,253,189,149,194,34,211,32,100,36,57,
+    82,233,5,169,37,57,89,242,225,229,190,140,73,127,103,40,
+    41,79,129,207,209,133,148,38,208,184,253,41,68,199,198,146,
+    178,136,46,2,36,21,93,134,33,164,58,47,12,111,101,68,
+    109,150,100,235,209,27,4,78,39,144,219,24,83,221,52,130,
+    40,14,187,219,67,168,162,15,107,6,41,191,27,44,126,91,
+    117,63,195,169,233,38,5,173,109,211,231,65,225,78,80,200,
+    53,229,212,15,222,42,4,183,107,193,237,121,126,251,183,199,
+    149,225,39,229,138,21,90,62,17,71,104,108,249,26,202,145,
+    157,19,1,200,46,6,44,102,148,132,207,94,125,145,88,38,
+    182,156,31,63,42,4,159,215,130,207,231,249,231,191,61,126,
+    28,127,82,126,148,194,238,39,98,8,146,101,198,217,28,205,
+    169,28,34,130,53,229,34,98,213,93,198,1,190,135,224,91,
+    155,246,171,79,58,237,178,180,66,159,123,41,194,115,36,55,
+    230,220,237,57,134,207,26,192,193,128,58,171,90,231,66,139,
+    221,48,217,26,208,129,42,207,44,147,142,214,27,7,180,13,
+    251,10,193,1,45,56,144,231,7,116,62,149,231,157,148,79,
+    250,30,173,221,255,138,143,231,13,155,222,107,6,193,9,161,
+    219,176,13,253,250,228,157,219,114,200,30,135,40,24,108,248,
+    170,206,217,13,88,65,119,242,105,38,118,132,56,227,144,122,
+    203,48,88,39,135,109,203,141,134,217,246,62,177,14,244,190,
+    8,118,230,133,77,183,122,110,111,44,4,247,107,193,253,121,
+    126,255,211,101,195,110,27,27,80,52,191,17,15,210,53,182,
+    62,38,3,118,84,100,128,37,246,21,24,176,172,237,67,236,
+    221,100,50,32,87,123,67,253,24,172,230,94,45,184,55,207,
+    239,125,186,243,127,237,235,197,0,211,33,176,147,66,34,41,
+    66,136,227,100,72,21,29,145,71,117,229,160,12,121,161,18,
+    67,66,96,29,157,252,104,181,27,78,71,211,77,236,219,66,
+    217,1,142,59,36,232,18,17,254,150,20,227,117,27,71,44,
+    53,125,10,60,73,135,202,135,51,25,180,179,18,131,86,56,
+    77,132,197,166,206,42,54,196,68,248,43,28,103,165,157,89,
+    91,110,29,208,182,30,46,4,143,104,193,35,121,254,8,229,
+    214,112,95,99,197,35,59,76,41,100,220,182,165,25,5,221,
+    39,145,241,204,69,62,138,128,218,189,215,17,140,32,248,1,
+    130,31,34,192,45,71,89,66,48,129,32,134,0,131,76,125,
+    83,146,6,148,219,76,128,93,149,255,36,246,227,250,37,150,
+    117,111,131,64,9,0,79,90,86,158,63,190,24,108,204,168,
+    115,167,231,79,159,63,188,196,121,221,251,32,161,179,193,134,
+    144,251,69,40,219,96,15,235,238,198,254,6,224,253,110,136,
+    187,44,176,210,229,222,177,68,44,224,119,185,183,99,201,0,
+    254,101,173,251,25,44,90,208,207,186,7,25,28,216,130,60,
+    75,137,177,65,126,121,47,151,251,40,45,87,130,58,95,144,
+    27,223,240,242,133,7,86,127,56,57,157,110,54,15,81,18,
+    130,52,53,13,2,137,130,24,30,150,249,10,156,63,101,130,
+    219,164,194,69,137,206,60,215,105,187,40,113,170,156,38,51,
+    175,122,128,231,222,142,35,31,175,113,224,227,51,142,126,92,
+    120,244,67,183,141,221,116,219,216,67,183,141,189,244,48,136,
+    7,234,249,162,151,82,47,74,195,142,60,210,101,42,235,219,
+    100,249,105,78,217,249,139,93,201,173,87,249,214,21,131,121,
+    33,99,228,151,45,16,61,176,21,123,177,229,189,240,206,12,
+    189,55,195,166,191,107,29,82,225,102,12,50,151,238,35,199,
+    166,166,36,17,83,187,248,89,1,18,104,199,110,142,105,27,
+    54,8,177,113,33,57,122,210,50,3,104,1,82,211,144,44,
+    74,226,48,100,50,214,225,99,177,22,114,69,41,33,26,105,
+    184,253,88,67,62,128,160,218,153,70,200,96,163,181,111,249,
+    55,136,120,136,152,169,141,243,80,162,192,119,104,124,71,158,
+    239,88,172,169,203,246,188,179,43,179,107,49,16,250,60,208,
+    113,39,208,177,160,20,2,221,90,160,59,111,190,151,92,36,
+    208,146,217,181,60,34,179,114,253,127,103,42,156,184,65,10,
+    234,52,164,138,107,150,153,96,206,49,179,204,1,242,131,223,
+    158,99,125,196,158,229,59,51,248,178,211,58,79,169,237,164,
+    181,243,92,54,250,38,88,83,219,24,246,209,74,219,132,101,
+    219,153,46,232,227,173,216,199,85,134,201,37,88,145,5,216,
+    208,77,212,80,9,175,7,82,82,144,17,104,121,131,36,56,
+    115,163,83,109,180,141,196,57,168,47,221,38,115,110,217,110,
+    118,244,97,159,168,79,203,44,151,171,33,21,94,203,165,120,
+    150,59,199,170,173,37,140,50,13,170,37,21,94,203,71,153,
+    255,103,221,226,164,139,131,147,152,130,83,81,31,149,38,163,
+    167,99,224,250,146,250,70,102,2,195,235,184,160,139,49,198,
+    210,201,211,224,145,98,160,44,160,2,81,93,109,208,55,90,
+    170,64,83,140,232,20,244,68,16,141,131,146,137,103,245,221,
+    76,5,55,82,167,36,121,130,118,166,163,35,142,209,70,149,
+    79,49,198,44,13,7,193,124,88,24,4,35,24,141,43,16,
+    201,71,79,73,182,157,28,37,53,74,221,243,6,125,87,86,
+    138,142,77,10,19,160,180,58,185,146,24,166,183,109,192,135,
+    70,34,195,125,117,69,239,100,84,137,170,170,140,39,163,208,
+    149,94,90,209,239,12,160,232,82,195,88,116,199,160,227,25,
+    93,69,119,33,216,71,23,20,193,20,109,167,19,160,42,94,
+    244,232,207,233,243,232,41,2,111,146,83,244,26,37,25,119,
+    250,138,28,80,48,165,171,58,10,2,157,151,161,236,167,1,
+    164,235,76,101,215,135,251,13,34,114,140,174,234,60,9,181,
+    100,207,228,218,10,193,13,90,112,195,18,97,124,171,23,87,
+    10,217,116,230,240,189,150,78,112,141,190,30,10,240,230,129,
+    183,182,253,110,75,215,135,61,185,153,247,251,63,232,255,164,
+    249,118,123,161,101,143,214,178,103,137,112,245,194,98,187,112,
+    253,232,149,163,185,153,15,102,11,237,91,181,246,173,217,131,
+    139,171,58,175,239,184,178,35,119,240,189,189,87,247,102,15,
+    100,15,220,91,213,153,61,240,200,220,104,109,47,129,197,150,
+    85,89,14,255,112,127,181,253,209,163,71,24,118,180,45,244,
+    124,232,254,160,182,16,12,107,193,48,60,163,182,243,147,157,
+    139,161,150,107,205,87,159,185,239,98,183,214,61,36,0,104,
+    61,94,59,106,190,236,191,232,95,216,94,8,117,107,161,238,
+    124,168,123,177,173,35,235,253,34,80,63,119,104,254,208,207,
+    135,223,25,134,38,155,157,90,234,50,39,166,160,159,188,50,
+    208,58,176,149,253,108,107,96,191,203,253,27,150,1,88,57,
+    151,196,40,11,207,230,192,34,181,156,99,171,230,148,203,53,
+    97,165,225,19,54,12,232,114,30,141,199,77,99,31,147,148,
+    141,122,8,24,75,232,137,36,136,19,110,180,135,135,251,24,
+    186,126,230,198,120,192,88,244,8,74,167,140,23,0,156,59,
+    228,126,125,121,95,130,86,154,44,219,150,28,235,126,139,29,
+    54,17,116,221,247,90,186,113,165,187,40,200,28,2,99,254,
+    243,23,223,121,113,193,91,8,8,90,64,200,211,55,44,133,
+    129,240,24,83,62,75,190,209,73,147,105,210,171,184,83,251,
+    217,19,196,216,101,14,97,153,171,213,141,203,49,147,165,2,
+    238,34,70,213,216,168,205,145,150,194,106,211,125,90,88,177,
+    120,76,61,107,219,147,208,239,226,20,253,165,81,134,193,157,
+    82,189,108,49,53,137,222,102,49,18,118,25,239,45,58,82,
+    245,144,206,235,65,107,128,244,74,231,42,148,90,238,97,223,
+    125,196,136,176,3,43,178,39,63,236,46,212,172,209,106,214,
+    32,199,215,44,182,245,44,180,103,142,46,242,129,159,215,188,
+    83,243,143,77,107,114,179,183,70,10,77,251,180,166,125,5,
+    126,64,227,49,99,209,223,143,89,155,171,203,214,70,100,240,
+    239,99,214,185,217,13,130,204,62,89,80,68,29,224,215,175,
+    156,107,214,53,241,117,107,199,193,218,185,211,175,91,107,87,
+    30,1,233,187,42,96,174,45,7,224,8,148,116,231,81,90,
+    61,115,113,147,244,92,45,76,119,171,65,109,202,142,116,49,
+    11,25,54,79,62,134,172,69,197,4,202,140,156,48,104,42,
+    186,105,182,69,49,204,216,201,56,244,77,2,160,219,115,182,
+    85,53,98,175,127,67,236,97,125,73,121,82,223,154,27,184,
+    213,245,233,155,249,208,64,33,52,160,133,6,50,238,123,13,
+    45,151,251,47,246,231,92,133,134,30,173,161,39,227,181,150,
+    183,39,247,198,173,150,91,190,66,211,78,173,105,103,129,223,
+    165,241,187,242,230,91,191,121,198,12,247,249,202,147,173,78,
+    107,2,168,133,242,91,38,125,114,47,169,112,87,100,202,4,
+    127,141,13,127,74,28,119,69,150,88,183,27,204,97,53,80,
+    215,130,165,10,96,139,203,221,133,217,136,1,252,110,154,187,
+    216,96,157,215,189,27,51,174,234,64,79,25,144,176,202,41,
+    195,22,82,126,75,12,18,2,151,232,49,210,5,159,51,93,
+    160,137,130,23,175,24,20,93,176,74,149,143,199,111,87,56,
+    30,183,165,243,101,71,216,79,136,231,122,220,65,184,252,211,
+    89,166,242,189,175,242,227,239,115,156,253,112,92,181,197,107,
+    179,92,89,148,27,40,181,157,180,74,101,6,119,125,213,136,
+    149,43,127,238,172,171,202,161,56,87,174,188,137,102,48,24,
+    79,136,251,56,174,220,250,41,140,227,35,21,94,229,241,52,
+    102,99,232,63,163,181,80,117,12,34,196,50,7,106,238,193,
+    142,74,19,177,4,189,16,132,193,158,25,45,153,173,82,162,
+    116,103,68,191,42,100,191,66,132,24,73,25,66,42,51,50,
+    53,187,135,133,3,175,238,23,198,1,31,15,201,223,76,197,
+    100,201,97,124,156,100,76,36,129,138,241,164,142,35,24,193,
+    227,104,74,207,243,94,62,11,66,105,157,215,225,22,114,42,
+    161,226,70,144,53,152,40,141,235,228,232,148,227,52,108,227,
+    227,217,160,32,67,101,114,74,167,85,191,72,212,231,215,213,
+    155,222,102,115,197,165,132,30,88,226,65,85,41,250,44,250,
+    148,164,76,237,150,162,91,141,20,246,116,27,27,239,248,184,
+    162,191,244,40,121,6,81,104,140,129,43,40,148,76,32,154,
+    142,116,45,204,35,108,141,247,31,136,246,183,196,56,128,95,
+    241,204,194,171,87,223,40,52,175,213,154,215,102,252,119,27,
+    219,22,182,94,125,161,208,216,171,53,246,102,248,47,234,234,
+    179,61,115,177,249,24,30,205,175,95,92,209,118,121,242,226,
+    228,194,155,23,78,93,58,149,57,116,55,216,122,173,103,97,
+    230,189,254,171,253,191,108,254,248,25,253,144,7,35,188,245,
+    16,205,93,15,95,9,223,104,41,180,109,214,218,54,103,189,
+    139,161,149,151,131,23,131,57,111,33,180,78,11,173,203,211,
+    247,189,80,219,231,161,174,59,161,174,220,218,66,232,89,45,
+    244,108,62,244,236,239,106,73,176,193,246,200,165,16,241,53,
+    26,121,237,202,2,191,90,227,87,231,249,213,247,130,214,249,
+    244,240,152,149,50,18,155,209,64,86,96,210,90,253,32,161,
+    76,161,24,123,186,90,150,64,85,222,76,96,102,89,16,124,
+    135,111,102,204,205,132,125,67,49,25,82,18,100,57,149,36,
+    219,237,181,13,2,230,45,152,158,216,36,37,42,75,166,28,
+    234,66,140,219,6,184,116,122,98,17,136,138,98,68,78,38,
+    85,108,52,133,128,55,43,138,222,105,89,74,36,167,149,34,
+    63,157,84,84,44,233,217,133,41,10,70,114,241,14,49,118,
+    18,194,246,225,60,192,3,229,121,66,29,204,189,198,150,203,
+    123,46,238,201,173,43,52,174,215,26,215,103,120,235,183,0,
+    237,119,248,246,133,239,229,102,110,241,5,254,5,141,127,33,
+    111,190,31,19,209,116,232,134,219,214,84,50,199,213,120,90,
+    190,42,190,178,27,78,229,219,14,219,244,120,136,35,21,94,
+    213,182,12,156,171,187,60,78,197,191,242,203,189,137,154,110,
+    178,25,194,139,25,86,223,4,96,200,27,80,11,134,14,214,
+    187,219,97,220,141,59,83,193,82,141,232,170,118,103,170,143,
+    75,63,55,152,76,64,10,189,76,76,208,56,161,33,67,147,
+    50,35,199,84,227,94,17,218,181,112,145,157,25,29,78,119,
+    12,69,225,139,158,132,67,96,67,177,147,41,117,58,165,82,
+    172,62,190,200,38,149,34,7,33,236,36,200,138,20,141,211,
+    18,135,184,69,55,29,178,232,81,147,17,81,29,45,122,143,
+    159,160,247,127,138,129,239,128,133,139,77,233,183,129,110,26,
+    137,12,143,195,209,223,164,48,227,206,20,38,64,135,57,160,
+    142,14,197,140,155,62,97,123,77,13,138,214,63,16,122,168,
+    209,216,124,105,251,231,141,221,119,26,187,115,135,11,141,253,
+    90,99,127,134,135,56,198,55,192,220,173,111,206,78,230,184,
+    66,125,175,86,223,139,249,229,218,27,245,139,161,250,203,222,
+    139,222,5,238,122,205,149,154,247,106,175,214,22,66,107,180,
+    208,154,124,104,13,166,156,107,41,22,5,247,17,60,36,142,
+    186,74,0,239,0,85,168,190,215,184,42,115,252,209,221,224,
+    10,140,227,7,24,59,188,219,208,145,239,220,91,104,216,167,
+    53,236,203,7,246,97,126,53,128,87,137,30,224,133,219,247,
+    67,3,91,200,175,214,13,244,186,62,107,13,64,241,179,94,
+    110,160,207,251,89,159,11,203,27,24,44,247,115,88,222,210,
+    182,63,224,250,127,245,40,141,254,84,213,227,68,69,245,144,
+    219,96,148,74,250,113,194,169,31,114,22,240,228,11,8,240,
+    176,94,254,51,4,151,8,110,228,80,189,80,228,63,199,26,
+    122,106,189,64,202,211,119,83,246,149,101,178,79,107,154,191,
+    129,236,187,10,245,61,90,125,143,46,251,204,255,98,217,151,
+    49,73,237,99,135,135,129,121,101,233,13,117,86,232,97,228,
+    191,64,112,157,84,203,108,126,108,130,251,216,128,226,239,200,
+    108,26,220,109,75,196,2,235,92,238,157,152,172,84,6,126,
+    222,141,20,219,96,211,178,154,42,80,207,99,144,140,190,16,
+    149,131,34,43,75,197,192,212,182,176,116,70,13,211,159,206,
+    234,97,24,86,89,55,64,233,205,201,162,23,170,240,199,169,
+    244,190,146,254,163,84,122,168,71,127,145,67,47,249,211,140,
+    149,30,194,76,89,83,118,30,209,124,197,239,214,127,21,187,
+    71,254,128,232,199,64,202,63,1,4,86,51,204,210,75,160,
+    59,254,243,62,252,91,36,62,189,112,143,116,228,157,239,69,
+    178,58,239,124,47,146,214,188,243,189,228,129,181,3,110,45,
+    3,217,94,173,161,251,62,150,30,150,26,2,62,102,205,18,
+    89,14,178,41,173,165,255,62,150,30,150,26,86,250,152,117,
+    88,42,7,11,205,90,235,102,68,94,247,176,212,176,178,134,
+    1,169,91,14,140,145,161,244,176,212,208,254,58,195,224,185,
+    89,245,143,251,250,199,67,103,155,202,86,153,108,230,181,249,
+    239,47,155,235,86,6,82,218,229,32,35,205,79,221,199,194,
+    195,82,125,130,1,155,14,143,169,12,51,189,243,125,247,105,
+    233,97,21,12,186,238,255,5,164,225,8,67,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/util/fdthelper.py",
+    "m5.util.fdthelper",
+    embedded_module_data,
+    6252,
+    16148);
+
+} // anonymous namespace
+} // namespace gem5
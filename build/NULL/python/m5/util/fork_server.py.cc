@@ -0,0 +1,585 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,124,105,112,27,87,154,88,55,208,184,27,4,72,
+    128,247,225,230,33,146,144,40,202,58,71,166,40,74,50,41,
+    234,176,68,121,71,178,119,70,137,22,132,216,77,9,20,8,
+    208,221,13,29,52,104,211,91,222,29,72,197,89,195,10,167,
+    4,219,84,13,38,37,207,210,25,79,134,147,120,18,103,51,
+    91,59,158,205,164,146,84,165,10,205,234,44,17,84,177,74,
+    169,148,43,59,249,69,151,61,21,71,191,242,125,175,129,70,
+    3,132,108,77,8,240,123,253,206,254,222,123,223,249,14,252,
+    79,202,240,103,43,132,95,214,208,20,245,128,226,169,203,20,
+    79,243,166,8,125,153,38,161,233,178,137,132,230,203,102,18,
+    50,151,25,18,90,46,91,72,104,189,108,133,208,28,177,205,
+    218,47,219,103,29,151,29,179,206,203,78,154,226,25,222,18,
+    113,205,178,151,217,89,247,101,55,196,173,151,107,120,83,200,
+    3,255,222,107,212,229,90,19,117,138,226,109,111,83,188,253,
+    167,38,138,250,153,169,136,206,229,58,146,227,128,28,103,69,
+    142,143,111,224,89,193,207,187,225,191,70,168,159,182,242,158,
+    183,45,151,27,120,175,208,56,109,226,107,223,102,46,55,145,
+    60,47,111,154,102,248,58,136,55,243,62,193,46,56,174,1,
+    158,211,166,102,189,203,133,18,126,40,209,2,181,157,130,163,
+    148,7,45,213,67,122,43,111,186,72,5,26,67,94,43,69,
+    57,199,99,226,141,221,146,32,222,20,68,110,54,198,11,92,
+    191,16,13,93,141,8,60,119,43,44,95,231,38,39,119,239,
+    158,46,21,153,156,12,12,114,151,174,11,220,84,44,58,29,
+    190,198,73,83,98,120,78,230,196,120,84,114,198,162,83,194,
+    0,23,159,227,228,24,23,226,176,18,55,23,11,71,101,46,
+    28,133,102,102,15,14,134,163,146,28,138,202,225,144,44,244,
+    7,38,39,7,185,113,49,54,203,201,215,5,17,234,65,192,
+    205,137,177,41,65,146,156,228,93,18,182,202,137,194,107,113,
+    65,146,37,174,127,38,118,85,10,112,87,239,144,150,195,209,
+    107,240,142,169,235,225,8,207,205,1,230,144,57,200,157,12,
+    77,93,215,210,156,128,158,28,142,66,77,210,110,57,178,211,
+    133,183,26,81,36,125,13,195,107,98,183,162,92,44,46,207,
+    197,101,39,31,22,133,41,57,38,222,25,224,164,24,247,242,
+    29,249,122,44,202,65,15,68,121,119,124,110,128,187,26,135,
+    23,33,30,165,55,196,197,144,28,134,66,161,40,207,245,95,
+    189,227,228,133,233,80,60,34,7,184,82,207,177,66,88,230,
+    66,162,192,197,162,145,59,220,92,40,204,115,56,114,131,78,
+    231,89,232,33,201,57,123,241,194,4,23,187,58,3,175,151,
+    6,32,87,32,125,140,132,163,48,78,162,16,226,181,46,132,
+    176,215,220,116,56,2,77,137,36,9,187,29,133,74,128,131,
+    164,205,194,43,209,240,109,192,126,234,134,32,115,253,147,147,
+    113,136,14,189,124,226,210,105,50,143,39,72,3,179,161,59,
+    220,245,88,132,31,114,58,57,110,39,23,13,205,10,67,164,
+    79,248,196,197,166,181,97,33,67,194,25,134,4,38,21,11,
+    105,100,209,87,44,1,77,112,198,82,56,174,144,3,221,132,
+    241,149,132,185,16,140,80,76,132,217,44,12,205,16,162,48,
+    60,49,18,56,66,94,30,18,175,221,28,130,46,206,69,66,
+    64,8,64,53,210,29,105,16,19,39,39,139,47,36,243,171,
+    149,22,162,80,24,64,88,140,69,103,5,152,197,155,33,49,
+    140,180,43,193,171,228,42,21,66,209,59,92,12,233,13,70,
+    77,136,240,3,72,1,164,12,142,195,245,88,236,134,132,253,
+    221,78,49,253,146,32,144,158,77,78,134,120,62,8,165,131,
+    88,26,137,56,64,38,123,114,114,42,46,138,128,2,230,17,
+    218,118,58,145,75,112,202,32,243,245,174,169,216,236,44,20,
+    236,26,226,186,164,235,113,153,7,50,235,90,128,78,73,114,
+    108,78,50,12,36,33,5,18,7,226,143,2,177,56,103,138,
+    68,193,3,29,224,156,137,130,4,3,199,133,37,238,150,24,
+    150,101,33,74,122,33,64,229,59,216,143,1,46,4,229,53,
+    18,210,40,70,142,57,39,39,13,60,60,56,35,1,233,149,
+    70,180,98,10,75,211,135,93,211,198,72,163,32,130,11,182,
+    87,28,162,2,173,33,65,79,33,177,32,13,14,114,103,100,
+    66,79,90,183,132,219,152,137,114,5,199,233,86,40,18,113,
+    202,97,141,174,138,3,143,25,4,143,2,107,113,164,0,84,
+    147,66,55,5,30,70,114,188,200,240,211,50,140,144,129,151,
+    224,213,132,137,34,2,144,40,25,168,169,235,161,232,53,129,
+    187,117,61,36,111,159,71,39,31,3,210,208,90,169,38,144,
+    64,244,13,94,27,28,0,236,111,113,145,24,114,118,140,147,
+    194,179,241,8,228,35,139,221,186,30,158,186,238,132,42,50,
+    225,46,62,62,59,167,77,63,204,213,110,130,52,230,17,89,
+    38,198,226,215,174,151,200,10,68,93,161,15,87,5,24,79,
+    193,89,222,137,254,10,41,187,155,8,165,163,90,217,221,6,
+    44,145,222,112,84,36,232,178,36,161,12,146,157,197,206,23,
+    8,184,48,2,72,234,200,109,179,2,244,22,4,88,28,68,
+    99,72,155,18,224,167,56,178,11,33,246,80,148,187,120,210,
+    121,11,222,29,137,133,96,176,127,143,122,98,34,96,206,219,
+    71,97,174,144,153,242,204,88,120,74,206,219,47,204,33,174,
+    161,200,239,65,149,82,1,83,222,26,142,2,122,179,121,230,
+    86,72,140,6,76,243,117,219,209,125,82,75,6,219,152,52,
+    101,84,207,150,162,122,238,161,80,61,11,20,168,101,10,85,
+    50,168,99,43,111,22,24,158,17,44,160,204,44,160,10,173,
+    68,105,217,242,76,16,196,228,71,214,60,35,205,9,83,121,
+    6,133,84,158,65,90,204,155,231,194,124,222,138,195,40,240,
+    121,7,134,65,156,148,9,209,13,173,139,53,0,166,24,195,
+    203,81,247,154,241,229,151,201,203,19,116,130,10,234,153,9,
+    19,196,104,61,102,134,152,174,171,121,10,98,102,61,134,245,
+    152,178,152,165,84,18,80,54,77,252,175,98,92,100,113,232,
+    24,192,93,136,76,151,208,18,61,0,36,108,3,101,204,147,
+    78,73,156,218,51,71,212,205,158,217,131,123,226,114,56,178,
+    135,244,166,192,190,115,119,242,246,96,48,28,13,203,193,224,
+    188,27,135,99,176,24,125,21,27,122,30,192,34,149,243,55,
+    37,153,37,71,69,224,107,132,192,158,107,104,134,192,149,107,
+    110,131,160,38,9,159,47,17,189,143,232,9,24,96,104,27,
+    7,53,24,204,59,131,65,176,8,226,17,124,102,131,193,215,
+    226,161,72,33,199,17,12,74,145,152,44,5,131,34,162,157,
+    55,75,178,40,54,98,19,148,216,132,61,106,64,224,42,130,
+    139,136,214,113,130,86,241,147,243,142,47,158,217,98,172,150,
+    246,45,10,64,250,18,9,86,125,36,120,42,208,26,199,38,
+    203,232,200,90,164,163,191,170,160,35,193,204,155,224,31,40,
+    9,12,42,6,76,31,11,239,231,173,144,98,227,145,174,236,
+    132,174,28,130,173,16,119,66,9,59,95,207,187,32,116,64,
+    200,66,232,4,179,203,85,200,175,129,56,11,134,25,117,217,
+    13,166,85,13,111,19,60,144,138,198,153,23,74,163,81,86,
+    11,105,54,48,179,124,240,92,199,91,96,250,27,242,68,126,
+    93,36,115,151,183,74,177,184,56,37,228,45,132,195,243,54,
+    100,60,65,148,202,8,211,82,36,204,125,196,104,77,152,100,
+    67,230,77,90,244,201,230,82,28,8,206,244,1,197,155,30,
+    154,127,10,165,127,166,147,236,159,211,132,160,117,162,37,4,
+    173,215,147,29,165,22,18,48,62,229,198,168,145,132,101,119,
+    169,228,76,209,156,166,126,10,255,63,163,12,229,237,197,231,
+    107,24,211,91,15,99,204,169,227,202,64,204,165,199,48,143,
+    45,139,185,203,234,213,232,121,22,136,121,202,90,241,234,49,
+    43,196,106,75,173,160,140,152,152,247,191,18,189,17,69,83,
+    206,96,226,245,61,161,251,68,164,20,17,59,58,46,250,1,
+    6,234,242,174,241,11,223,125,41,248,242,133,51,19,151,46,
+    230,157,175,134,34,113,225,164,40,198,196,188,45,168,205,149,
+    216,77,33,133,207,134,110,3,107,20,230,43,207,160,100,201,
+    179,96,150,77,7,167,98,241,168,140,115,27,36,26,12,74,
+    205,9,81,180,12,225,169,160,197,129,149,208,104,32,37,129,
+    121,128,253,137,134,133,199,72,88,2,21,14,181,237,193,171,
+    241,233,105,108,27,242,11,38,2,224,48,29,2,251,142,199,
+    182,81,25,6,24,177,30,123,208,133,0,241,18,81,114,234,
+    162,67,99,59,228,195,121,95,137,232,116,233,48,137,101,31,
+    80,68,58,184,188,15,93,89,87,55,124,55,235,218,178,237,
+    195,107,39,1,104,95,165,238,168,90,119,52,203,30,205,53,
+    182,131,124,96,115,245,45,16,56,55,155,90,211,167,50,127,
+    242,158,103,197,3,81,247,102,67,139,218,208,167,52,4,212,
+    134,0,17,38,77,88,202,93,12,90,90,33,240,228,154,177,
+    133,154,98,80,200,107,238,32,177,198,38,210,186,38,139,146,
+    240,33,220,61,145,103,208,108,201,91,69,65,142,139,209,41,
+    3,173,19,119,142,112,198,99,147,38,178,51,84,181,191,114,
+    234,92,0,78,16,235,161,44,93,173,44,79,151,243,141,104,
+    66,26,114,80,178,165,84,102,70,199,33,81,81,122,193,92,
+    206,73,178,179,20,43,231,41,201,99,228,36,222,84,201,173,
+    209,253,221,148,204,150,74,244,80,98,239,2,80,122,198,70,
+    85,249,75,152,120,51,240,1,243,1,245,208,20,166,203,223,
+    68,83,223,7,62,88,96,222,96,176,39,218,211,45,250,22,
+    117,219,252,125,234,22,157,48,103,236,213,90,228,45,229,24,
+    241,214,27,164,69,209,193,219,140,28,141,109,202,245,198,62,
+    63,165,61,59,239,72,80,51,58,183,35,166,229,120,86,140,
+    164,37,97,225,157,55,41,169,129,119,37,44,16,214,201,77,
+    165,214,102,244,177,35,121,12,207,98,40,238,255,198,241,113,
+    39,44,32,25,107,30,154,183,143,80,194,180,232,147,219,13,
+    216,122,138,101,203,177,162,73,127,19,212,109,186,212,19,222,
+    59,15,216,76,153,74,146,12,250,169,75,167,140,151,170,242,
+    39,119,27,112,51,39,44,9,211,79,129,166,126,166,211,85,
+    181,183,6,106,39,158,208,221,243,173,154,155,55,27,151,100,
+    48,30,139,150,189,230,28,230,45,2,138,170,121,247,153,232,
+    205,80,4,28,73,40,57,196,229,109,5,111,35,111,47,10,
+    146,75,196,206,200,155,33,31,76,59,234,9,61,56,111,26,
+    28,124,66,239,121,66,83,243,117,134,218,154,211,215,39,246,
+    66,241,249,254,139,55,194,115,115,69,23,23,115,137,155,140,
+    145,112,161,74,161,56,138,85,144,165,22,48,3,194,115,121,
+    39,145,131,18,22,206,51,232,108,228,45,104,92,74,121,103,
+    88,210,76,65,208,128,12,15,86,165,216,143,104,89,131,232,
+    241,221,201,155,175,9,178,120,16,82,196,14,4,123,49,207,
+    20,147,192,186,16,230,68,164,50,113,15,41,30,154,67,1,
+    75,204,128,128,85,19,136,135,169,130,25,69,172,170,60,45,
+    144,14,75,136,23,199,233,162,17,132,108,193,127,43,151,143,
+    133,196,215,176,202,47,104,34,31,61,190,119,230,239,205,223,
+    77,44,37,146,12,68,182,40,218,225,75,201,15,222,188,255,
+    102,70,82,26,119,169,141,187,72,82,142,173,75,142,111,153,
+    172,14,223,166,175,113,121,40,205,43,190,110,213,215,157,28,
+    219,244,181,167,249,15,199,20,95,64,245,5,160,168,251,56,
+    189,217,192,101,59,71,148,134,99,106,195,177,172,247,216,150,
+    25,19,191,254,220,211,188,69,153,28,190,18,200,177,222,119,
+    94,186,247,82,154,73,223,202,246,31,249,148,6,128,223,142,
+    97,133,61,170,178,68,48,227,91,139,159,175,225,111,203,2,
+    245,48,180,83,80,249,240,189,195,169,51,138,171,67,117,117,
+    100,118,174,187,6,178,174,129,92,123,103,114,108,105,130,84,
+    252,220,83,151,58,240,224,240,253,195,233,241,108,207,145,213,
+    158,143,247,64,0,95,197,55,172,250,134,21,207,81,213,115,
+    52,201,108,89,41,119,109,234,66,150,237,134,111,14,170,240,
+    201,215,147,175,111,122,106,151,110,166,253,201,55,146,111,192,
+    168,164,228,100,34,153,120,108,196,119,236,211,75,0,10,223,
+    142,147,10,59,174,178,227,89,118,28,74,39,19,155,94,127,
+    182,254,212,111,24,0,218,87,241,158,86,189,167,179,222,211,
+    4,177,156,157,77,122,150,60,233,189,138,189,13,31,32,190,
+    228,222,176,183,173,219,219,30,94,202,244,172,50,171,188,210,
+    190,95,109,223,175,216,15,168,246,3,217,226,87,66,141,247,
+    139,195,39,250,169,207,250,157,47,54,153,63,219,215,250,162,
+    207,252,91,159,5,158,81,143,160,191,92,166,71,116,11,235,
+    95,80,154,30,89,44,72,253,167,105,20,163,197,53,99,176,
+    169,202,249,54,99,166,170,252,149,107,35,158,158,127,10,191,
+    131,252,55,72,82,144,255,140,38,201,47,82,69,217,13,174,
+    196,151,88,201,25,176,228,109,18,176,0,120,104,226,56,210,
+    181,5,125,81,41,111,21,162,232,106,231,109,23,46,18,27,
+    38,96,214,184,131,48,198,159,32,117,155,53,134,208,12,133,
+    179,200,228,181,70,70,32,124,152,194,130,211,148,102,38,120,
+    146,195,5,26,55,59,106,145,50,207,221,59,247,208,191,210,
+    146,25,87,154,119,169,205,187,54,154,247,173,55,239,83,154,
+    15,168,205,7,214,226,74,115,137,72,181,239,215,155,158,6,
+    228,148,218,18,128,86,146,99,201,49,160,127,71,45,208,172,
+    132,214,219,95,14,159,96,168,207,24,231,137,58,243,103,181,
+    52,192,41,163,182,182,22,231,235,43,77,239,83,51,122,214,
+    179,105,245,20,45,214,24,107,25,181,123,101,89,158,250,11,
+    195,114,234,2,45,91,75,101,103,116,59,61,99,104,161,244,
+    87,105,31,136,126,217,160,159,102,172,79,43,71,83,178,199,
+    80,78,175,35,215,24,82,237,85,83,117,205,188,205,134,119,
+    150,158,103,244,231,140,139,170,242,183,29,159,178,58,108,181,
+    58,229,116,93,81,195,93,173,70,165,213,3,189,54,232,224,
+    146,14,221,230,93,120,75,207,51,250,115,70,183,250,203,122,
+    98,192,66,110,51,180,94,167,183,94,97,11,16,139,166,175,
+    172,5,253,185,28,223,131,212,130,41,97,26,163,174,52,46,
+    152,193,242,240,87,125,255,54,11,98,169,201,1,239,192,79,
+    229,155,163,174,110,106,47,88,51,183,76,26,127,35,191,211,
+    136,17,46,55,232,54,22,177,5,152,137,39,22,178,120,59,
+    126,41,208,32,6,32,89,60,73,161,70,143,8,81,241,28,
+    62,49,184,196,10,18,224,54,56,20,32,9,226,81,176,162,
+    111,160,191,137,43,119,121,219,137,241,224,43,19,103,190,151,
+    119,93,188,48,250,82,240,226,165,239,158,60,113,94,220,79,
+    42,94,13,131,169,96,213,28,145,188,75,18,228,171,17,168,
+    132,94,139,163,232,168,72,121,207,152,182,96,123,177,144,34,
+    238,195,186,118,81,184,134,245,196,188,243,228,171,39,39,46,
+    5,161,217,177,60,19,3,253,44,190,140,72,162,54,47,58,
+    45,255,4,107,208,211,68,87,151,187,44,121,75,16,171,204,
+    123,141,178,8,83,210,88,244,38,93,16,69,75,195,27,174,
+    174,117,87,87,230,59,138,107,151,234,218,245,5,85,227,232,
+    202,129,222,29,254,208,156,57,245,19,246,17,155,169,201,212,
+    168,190,61,160,126,65,79,221,122,231,141,123,111,128,70,246,
+    116,171,158,110,84,193,220,166,183,110,217,145,238,121,215,179,
+    236,73,121,54,219,187,87,174,252,252,208,199,35,127,123,72,
+    61,114,94,105,159,80,219,39,52,29,233,93,154,216,96,159,
+    91,103,159,203,48,10,187,67,101,119,100,217,29,133,212,206,
+    117,182,83,97,187,85,77,43,106,105,189,235,108,111,38,174,
+    176,187,85,118,119,150,221,189,217,222,171,182,31,82,218,15,
+    171,237,135,13,237,117,175,179,221,153,177,71,19,191,58,163,
+    30,56,173,176,103,84,246,76,182,248,253,188,182,62,197,47,
+    71,148,218,110,181,22,48,53,185,251,51,175,229,218,218,1,
+    231,218,126,2,82,99,57,127,211,131,243,247,207,103,122,20,
+    127,159,234,239,203,146,47,136,80,40,96,134,242,164,18,1,
+    95,32,248,138,42,75,171,6,208,90,168,150,103,165,58,186,
+    16,237,36,124,36,100,154,255,48,210,122,178,215,252,187,94,
+    230,228,78,219,239,118,211,0,203,100,51,78,36,145,205,19,
+    116,165,108,126,75,54,234,205,50,169,109,162,170,252,149,243,
+    253,179,104,211,114,94,3,206,108,69,111,239,219,164,116,165,
+    228,90,106,43,195,237,153,234,144,245,10,61,158,48,200,246,
+    183,186,140,177,63,162,53,189,142,230,183,93,164,68,84,67,
+    1,155,198,106,12,50,104,222,6,38,114,112,54,52,151,183,
+    222,196,149,10,41,111,195,253,31,240,6,242,150,169,72,76,
+    18,8,75,7,76,132,225,242,230,27,194,29,9,71,186,200,
+    102,214,32,41,84,174,243,73,210,71,144,45,173,80,200,104,
+    143,129,209,70,178,174,29,155,141,173,233,177,149,137,141,182,
+    125,235,109,251,148,182,3,106,219,129,141,182,35,235,109,71,
+    148,182,163,106,219,81,165,113,68,109,28,65,182,234,33,32,
+    101,206,121,125,203,174,13,111,231,186,183,83,241,118,171,222,
+    238,44,249,22,232,159,91,103,57,133,237,82,217,174,44,219,
+    85,52,71,11,175,250,134,34,72,134,91,22,138,237,133,98,
+    100,125,32,111,195,165,151,88,92,158,50,210,144,190,50,240,
+    61,128,63,176,61,139,141,80,169,243,198,192,74,184,178,244,
+    79,161,213,5,19,200,119,147,193,206,51,172,0,196,41,81,
+    114,148,165,100,140,107,119,79,153,97,108,245,158,109,193,28,
+    245,130,149,103,88,35,0,43,207,140,82,127,105,164,104,227,
+    221,181,101,172,219,91,219,110,165,0,205,152,18,6,75,225,
+    174,109,152,170,224,177,170,126,249,93,155,92,87,138,149,116,
+    101,165,110,90,250,129,113,4,238,217,28,80,179,186,237,192,
+    87,104,188,5,38,90,183,173,151,22,196,119,129,249,62,21,
+    101,244,149,8,70,18,202,240,173,106,101,220,181,85,177,76,
+    12,189,62,74,201,173,165,210,73,219,52,205,51,111,219,65,
+    59,215,80,85,254,202,103,101,236,27,165,137,228,135,30,123,
+    168,42,127,149,220,155,162,151,58,202,177,42,217,143,9,6,
+    237,253,234,171,2,149,107,46,184,6,82,221,170,169,180,136,
+    182,205,187,5,100,223,192,130,21,250,93,87,165,58,149,176,
+    102,124,85,49,176,126,92,49,190,48,222,149,148,176,27,250,
+    247,87,196,10,177,79,140,19,30,12,99,122,153,22,64,110,
+    64,209,243,229,78,0,63,162,95,130,124,228,193,43,110,34,
+    143,245,98,119,77,113,234,85,234,1,88,58,75,53,186,132,
+    251,136,38,14,74,192,156,55,13,62,47,30,163,138,27,34,
+    154,175,178,72,68,215,19,199,240,53,33,42,220,158,19,71,
+    230,119,25,165,215,92,44,18,9,106,70,142,52,56,12,134,
+    75,40,34,141,12,234,133,255,51,54,132,56,125,253,143,212,
+    63,130,112,203,182,140,193,119,205,156,222,191,114,56,35,103,
+    91,119,105,9,198,175,182,199,128,91,22,121,91,97,39,58,
+    64,131,97,133,14,149,20,240,107,210,216,170,89,70,98,12,
+    203,18,51,202,26,154,154,18,230,100,241,79,49,5,119,39,
+    196,3,8,208,143,18,121,4,215,176,20,35,10,83,55,243,
+    206,120,84,55,156,204,161,232,29,176,127,112,247,82,156,195,
+    34,22,105,46,18,150,243,230,185,216,28,177,161,242,86,94,
+    64,175,46,96,215,204,40,9,1,46,85,228,233,96,158,225,
+    67,114,40,111,193,21,83,169,180,8,34,217,169,226,186,7,
+    119,92,19,253,238,178,145,154,111,122,218,24,126,130,213,255,
+    1,166,246,107,48,185,26,90,150,163,27,13,187,214,27,118,
+    173,158,82,26,14,168,13,7,182,168,86,199,40,253,5,129,
+    119,199,147,163,169,218,156,167,110,233,245,52,191,18,205,122,
+    6,224,11,126,98,109,123,174,163,107,37,186,209,177,127,189,
+    99,191,210,113,80,237,56,248,238,169,212,88,186,51,221,249,
+    245,102,99,7,26,52,237,37,144,243,183,165,78,163,33,211,
+    14,22,201,99,175,127,195,203,173,123,185,76,189,226,237,83,
+    189,125,89,111,95,174,55,144,98,150,221,96,200,129,46,241,
+    250,151,107,54,188,125,235,222,190,85,230,231,97,117,240,69,
+    197,59,170,122,71,179,222,209,156,183,233,177,175,97,249,8,
+    56,150,38,179,187,53,215,216,250,224,206,253,59,153,70,165,
+    49,160,54,66,11,41,230,235,77,95,11,170,170,214,18,200,
+    53,182,96,78,138,193,197,152,86,68,192,215,184,69,89,221,
+    205,133,23,5,214,189,129,213,30,197,187,71,245,238,201,122,
+    247,128,17,182,12,38,24,88,94,159,55,182,24,105,102,77,
+    254,183,243,255,106,254,151,137,79,18,16,81,90,198,84,128,
+    141,99,106,227,24,118,177,19,109,183,179,247,207,190,123,110,
+    249,92,234,220,127,7,60,235,155,151,175,100,14,168,245,253,
+    171,7,148,250,61,27,254,67,235,254,67,224,60,251,143,170,
+    254,163,201,147,185,174,190,191,14,252,243,192,79,118,61,218,
+    5,26,240,124,186,71,97,159,203,53,225,104,185,71,105,13,
+    166,24,64,240,129,251,62,140,202,143,111,188,127,99,173,57,
+    125,67,233,56,162,118,28,249,244,146,226,125,81,245,190,152,
+    37,223,47,204,164,202,65,156,45,109,230,36,92,136,252,101,
+    219,137,26,211,103,53,206,19,173,150,207,90,104,128,191,221,
+    85,63,74,155,254,158,102,71,189,150,191,247,208,0,203,152,
+    27,133,1,214,251,242,42,128,34,107,151,152,250,36,24,43,
+    175,155,129,173,77,127,201,16,241,92,90,16,121,6,51,175,
+    188,118,201,236,49,147,197,62,17,55,51,197,40,38,208,132,
+    252,37,108,188,176,126,177,8,160,220,103,64,46,90,199,82,
+    232,18,105,28,143,254,193,209,172,157,219,254,37,57,27,190,
+    190,117,95,159,182,76,151,181,63,245,171,9,5,148,77,101,
+    102,135,190,48,113,214,76,206,151,225,153,49,48,31,100,67,
+    153,146,18,173,110,208,130,154,213,13,136,25,221,88,4,161,
+    169,155,1,229,2,121,193,92,182,84,160,43,249,138,77,15,
+    166,186,154,175,174,194,43,21,90,89,93,93,45,63,91,221,
+    132,97,177,158,55,23,54,17,118,38,76,213,21,114,194,92,
+    93,197,226,9,187,111,222,46,136,30,231,173,188,45,226,157,
+    173,93,176,210,229,11,116,250,155,42,198,4,183,24,232,2,
+    70,157,9,179,113,228,75,27,158,160,42,171,171,208,109,142,
+    189,161,181,217,178,247,235,170,182,250,220,242,246,143,29,219,
+    54,36,158,178,156,80,105,176,92,233,90,176,37,108,51,250,
+    226,192,91,205,198,88,166,225,219,219,0,213,219,13,111,107,
+    124,150,146,188,253,34,244,50,65,7,245,173,152,103,161,61,
+    40,223,92,122,158,41,61,51,243,78,146,219,82,202,5,106,
+    209,205,183,132,5,77,25,222,9,134,134,107,126,31,178,181,
+    126,196,15,207,32,133,180,67,126,223,37,219,130,18,119,73,
+    140,11,101,71,188,6,201,190,238,132,136,11,98,79,232,29,
+    243,166,29,59,126,143,41,160,188,153,169,152,40,92,130,7,
+    59,89,30,9,198,110,140,7,218,242,166,217,131,100,233,68,
+    91,152,96,102,98,225,104,222,22,35,167,92,164,188,21,60,
+    12,62,44,106,231,51,6,16,236,166,200,65,135,59,144,39,
+    201,60,100,231,45,211,145,184,116,157,68,193,58,208,246,137,
+    25,220,113,22,239,96,133,227,8,150,48,145,149,4,249,2,
+    57,92,53,22,22,243,246,217,208,13,1,218,150,136,0,211,
+    22,103,81,243,139,34,2,180,20,69,52,2,69,36,67,34,
+    255,138,154,159,152,70,120,196,65,124,151,34,134,2,110,179,
+    104,21,200,107,44,228,108,155,81,249,235,203,43,136,85,185,
+    168,196,148,127,128,76,233,53,178,188,242,216,94,155,116,224,
+    231,243,90,223,114,227,131,182,251,109,233,171,43,51,106,199,
+    158,53,223,39,77,74,237,144,90,59,148,180,110,122,253,106,
+    209,185,75,90,54,237,174,37,231,134,189,105,221,222,164,216,
+    91,84,123,75,214,222,82,45,13,189,188,161,108,243,64,97,
+    39,162,206,255,160,239,126,95,186,247,199,131,239,15,174,250,
+    86,121,165,101,191,218,178,95,169,59,160,214,29,72,142,38,
+    71,31,179,207,101,203,191,127,176,82,190,250,229,190,119,3,
+    203,129,228,40,110,69,132,238,221,78,222,206,245,236,76,153,
+    150,157,128,80,14,173,6,116,59,51,189,138,55,160,122,3,
+    89,111,224,177,171,38,213,121,239,112,242,240,38,91,179,244,
+    82,218,180,226,84,155,2,107,99,89,246,5,133,125,65,101,
+    95,128,135,92,115,251,143,91,222,111,121,175,109,165,13,151,
+    62,250,8,72,89,114,190,166,229,161,172,47,144,243,55,47,
+    159,221,240,247,172,251,123,20,127,175,234,239,205,250,123,191,
+    46,236,205,220,61,191,116,62,121,30,20,72,234,192,227,186,
+    250,164,121,201,182,89,223,172,214,247,42,245,253,160,213,33,
+    238,204,53,181,174,56,51,175,40,77,59,33,230,206,181,115,
+    184,243,157,154,130,65,201,121,252,201,56,209,39,101,74,22,
+    201,150,168,146,105,244,96,173,15,40,217,144,107,84,170,85,
+    188,214,247,22,232,167,239,88,203,6,255,180,36,142,202,5,
+    80,209,235,141,250,183,121,110,54,16,78,52,79,47,152,23,
+    76,101,222,155,73,23,126,244,210,139,101,74,191,170,255,90,
+    233,109,223,179,150,225,171,251,51,149,98,118,129,73,48,240,
+    38,210,31,209,75,118,98,117,177,195,155,10,59,177,122,202,
+    93,107,105,61,28,132,11,99,220,169,46,237,224,150,139,43,
+    168,163,171,56,34,160,12,10,12,242,116,101,242,180,116,172,
+    195,155,87,108,160,94,16,59,93,64,130,122,96,74,126,96,
+    1,83,143,161,181,111,89,201,150,119,24,112,47,169,148,202,
+    125,122,75,181,253,164,178,214,159,65,177,16,5,84,95,173,
+    28,244,84,87,42,9,75,165,218,50,230,190,117,169,172,44,
+    53,163,171,152,155,180,56,46,239,45,181,153,180,130,151,110,
+    37,94,122,105,128,158,138,219,183,120,233,205,198,183,102,116,
+    213,242,77,125,5,127,246,131,194,73,33,162,51,180,237,107,
+    155,38,235,113,220,242,14,60,182,26,36,123,105,12,158,89,
+    205,59,65,130,199,231,200,121,66,34,151,243,110,34,124,33,
+    137,156,203,17,51,20,42,29,103,117,159,24,29,65,131,79,
+    92,87,233,19,151,158,117,239,216,167,27,194,226,77,138,88,
+    195,183,240,249,125,170,160,6,202,156,99,241,54,128,249,238,
+    242,141,188,208,92,21,119,216,15,248,73,168,205,116,119,248,
+    28,124,215,132,244,193,149,161,85,223,199,77,217,214,189,90,
+    146,241,75,100,85,160,85,140,80,69,123,156,108,56,216,110,
+    133,194,50,30,185,180,253,233,196,133,211,39,38,78,229,107,
+    71,81,15,191,172,29,226,39,27,144,226,159,99,201,6,44,
+    137,71,99,227,82,80,142,5,113,108,113,104,197,67,84,241,
+    0,164,174,96,53,205,247,99,170,168,254,190,67,145,93,123,
+    109,15,87,202,91,240,200,179,64,246,60,197,87,16,44,83,
+    133,125,76,77,141,18,151,251,77,170,224,27,16,173,10,243,
+    90,175,207,171,29,49,9,146,115,162,26,62,226,67,170,176,
+    53,170,13,171,141,42,234,206,227,69,213,137,67,89,174,58,
+    49,229,255,96,233,95,105,126,50,232,39,127,83,154,89,113,
+    43,190,94,213,215,139,158,214,14,116,145,119,36,71,209,23,
+    221,185,217,189,227,209,208,234,212,175,246,125,50,164,116,143,
+    168,221,35,138,151,75,217,211,189,233,94,112,73,201,234,233,
+    206,18,200,117,247,174,210,233,222,148,29,63,232,150,238,68,
+    183,212,211,152,222,123,111,33,185,0,94,110,174,174,97,121,
+    247,70,93,247,122,93,119,102,84,169,235,87,235,250,147,163,
+    159,55,181,168,77,123,215,122,149,166,23,212,166,23,146,103,
+    114,158,166,244,137,123,184,75,239,245,167,216,101,54,67,43,
+    222,78,124,120,12,122,201,14,110,111,174,189,119,179,169,13,
+    116,162,210,180,75,109,218,181,58,245,241,140,210,116,24,29,
+    247,24,40,171,149,43,185,206,29,143,158,91,219,255,201,81,
+    165,243,248,150,199,222,80,179,69,1,72,142,111,213,81,238,
+    218,228,75,160,82,15,101,246,168,173,251,20,118,31,198,112,
+    5,247,188,182,105,242,33,243,200,185,122,72,225,246,169,220,
+    190,181,75,10,7,10,119,72,101,135,178,236,144,161,144,194,
+    118,170,108,103,150,237,44,30,118,48,175,216,65,123,179,1,
+    149,13,100,217,0,46,42,220,206,122,186,87,205,31,219,63,
+    101,126,237,206,246,159,132,239,38,58,221,37,186,252,84,254,
+    187,249,191,153,255,119,137,95,131,211,125,78,105,57,167,2,
+    108,60,167,54,158,67,167,123,71,206,223,184,124,250,193,196,
+    253,9,197,223,163,250,193,103,239,249,191,91,223,129,57,33,
+    179,35,33,181,188,223,117,212,244,183,53,39,106,44,159,185,
+    105,128,213,181,241,105,139,193,177,163,171,159,3,216,182,58,
+    167,151,210,244,73,233,120,176,108,112,161,112,151,175,164,143,
+    121,230,3,6,207,57,150,220,190,15,200,217,198,146,102,252,
+    128,122,104,221,182,127,106,208,28,127,140,195,7,242,71,215,
+    121,6,119,173,98,237,175,242,250,146,241,76,38,200,238,103,
+    90,27,53,106,34,178,7,175,99,44,217,18,134,93,89,241,
+    107,99,158,152,170,216,145,45,237,222,150,141,0,228,232,218,
+    237,134,86,83,50,182,83,93,167,85,174,165,47,152,18,79,
+    113,157,42,79,120,136,92,194,224,94,62,155,19,5,78,160,
+    238,62,225,89,50,67,47,219,255,127,123,185,134,189,212,117,
+    231,91,237,198,81,150,26,18,79,209,131,188,163,146,126,162,
+    254,50,138,214,93,49,222,185,221,162,200,24,118,211,191,161,
+    183,6,76,126,241,191,141,189,93,251,194,216,195,53,152,239,
+    140,97,247,255,27,91,212,121,32,211,81,181,95,174,138,89,
+    26,148,13,171,221,51,207,21,159,140,45,25,71,190,178,62,
+    111,50,158,0,169,98,91,253,145,20,80,198,245,44,212,231,
+    138,49,224,113,55,196,59,13,113,228,145,46,189,52,74,5,
+    207,195,109,123,32,242,184,161,127,61,58,54,6,139,241,27,
+    176,49,214,237,253,35,235,158,50,212,213,71,208,216,3,209,
+    196,123,163,116,181,221,42,60,209,56,191,64,116,40,185,171,
+    83,114,229,139,167,11,193,155,23,244,43,124,71,140,183,162,
+    192,124,16,34,211,206,162,87,139,22,132,164,93,149,10,147,
+    155,80,120,206,145,195,131,142,228,58,14,24,108,197,123,107,
+    229,183,167,180,21,2,109,241,187,216,52,222,167,187,83,184,
+    20,52,111,30,220,63,61,111,129,26,50,55,239,31,32,69,
+    240,248,35,105,133,220,185,155,175,221,118,145,42,79,135,174,
+    189,255,30,254,125,116,236,218,235,254,127,121,234,127,204,191,
+    125,76,252,62,188,105,190,206,248,34,196,96,136,155,183,113,
+    218,45,170,121,7,167,157,237,134,71,31,185,138,163,223,127,
+    210,76,74,98,148,246,107,254,126,201,62,26,164,138,246,17,
+    146,178,118,6,156,28,7,185,78,21,12,51,178,156,33,190,
+    131,0,79,114,145,181,2,241,175,17,160,157,169,157,175,44,
+    45,173,226,229,23,113,23,2,52,213,196,15,168,226,98,4,
+    185,157,130,123,29,226,15,40,178,216,16,17,132,57,17,137,
+    65,91,167,192,227,39,226,21,170,112,78,83,179,229,208,90,
+    19,239,35,248,103,84,209,56,251,17,214,102,112,198,138,167,
+    209,72,143,12,70,108,113,145,130,140,83,153,165,69,82,26,
+    209,102,253,192,132,139,20,91,86,202,81,87,88,166,104,233,
+    80,91,118,41,45,187,213,150,221,107,204,39,46,165,229,8,
+    30,56,223,180,215,108,153,104,247,72,70,126,244,102,150,61,
+    129,22,21,217,163,30,201,121,124,75,243,104,78,21,162,123,
+    246,127,156,40,69,191,48,155,29,206,175,40,0,91,8,254,
+    224,164,154,219,113,225,224,20,30,119,75,215,173,180,168,205,
+    59,179,3,199,20,246,184,202,30,255,77,247,23,102,83,51,
+    20,7,128,94,61,98,229,126,199,121,207,121,151,93,98,147,
+    44,218,103,131,91,148,211,209,156,25,123,116,158,60,172,93,
+    250,228,10,121,32,182,219,22,197,184,123,62,28,93,101,62,
+    118,43,61,135,212,158,67,159,250,127,221,190,222,51,158,237,
+    25,199,29,151,217,141,134,190,245,134,190,85,90,105,216,169,
+    54,236,76,153,115,190,198,7,67,247,135,210,83,239,30,91,
+    62,182,69,153,106,123,200,62,196,134,191,111,221,223,167,248,
+    3,170,63,144,245,7,114,173,29,43,135,83,23,182,28,148,
+    175,241,27,223,177,229,164,188,254,165,55,178,158,192,90,207,
+    39,131,16,144,229,147,174,117,111,87,230,128,226,237,87,189,
+    253,89,242,253,220,235,95,118,166,33,137,83,189,92,214,203,
+    161,165,118,246,222,217,187,231,150,206,37,207,109,213,227,107,
+    158,214,205,173,38,28,17,215,61,215,93,247,146,59,233,174,
+    114,116,7,15,2,30,192,17,62,131,7,95,62,220,159,185,
+    245,147,225,71,195,153,145,204,136,218,0,54,229,126,149,221,
+    159,101,247,23,14,128,182,174,219,91,21,123,187,106,111,207,
+    218,219,11,51,60,156,241,63,122,14,231,110,152,0,232,94,
+    91,41,150,107,108,93,126,61,203,30,193,9,30,46,37,87,
+    206,178,157,114,176,207,180,130,133,105,118,68,52,91,27,72,
+    213,166,106,97,110,236,59,85,251,206,108,241,171,109,15,144,
+    125,11,147,248,2,10,153,128,79,68,29,44,162,74,21,81,
+    115,146,51,205,121,115,56,42,147,11,26,218,241,40,52,255,
+    52,247,101,166,200,88,184,170,24,11,201,132,235,52,47,198,
+    69,56,232,106,44,22,209,216,147,240,224,26,2,212,108,134,
+    251,86,157,69,128,7,83,164,195,180,241,190,213,150,201,99,
+    105,73,75,91,20,4,171,251,73,240,169,143,4,149,160,171,
+    221,114,112,139,2,144,190,72,130,53,134,4,149,96,196,106,
+    169,205,28,192,91,89,181,171,99,36,168,4,94,143,165,11,
+    155,52,130,46,7,62,149,131,134,54,203,40,157,121,101,139,
+    194,112,85,214,194,42,112,216,100,1,23,73,7,246,231,44,
+    245,105,255,22,5,65,166,135,4,149,224,69,186,195,2,246,
+    126,57,56,78,239,176,236,74,193,91,32,120,42,208,6,149,
+    140,39,122,2,21,247,109,170,159,37,198,163,236,149,171,118,
+    9,186,242,164,127,8,116,35,94,10,156,127,187,164,9,53,
+    213,50,169,93,55,154,228,250,203,47,118,235,119,182,3,165,
+    203,193,218,181,86,162,15,139,55,240,81,115,226,149,105,114,
+    217,105,114,160,120,127,184,112,31,127,178,112,113,105,178,160,
+    17,101,237,206,249,4,144,43,246,18,47,59,17,145,11,50,
+    186,226,110,81,153,140,182,106,191,13,32,254,27,136,28,67,
+    185,140,36,15,14,176,157,242,52,167,27,50,245,171,54,165,
+    230,121,181,230,249,197,83,248,209,70,17,217,161,236,182,158,
+    126,241,210,175,141,152,33,139,167,226,116,113,3,144,22,127,
+    181,157,198,243,182,194,175,19,136,159,66,108,28,81,112,19,
+    20,54,93,117,233,158,172,171,35,203,116,108,95,91,213,207,
+    168,165,233,202,55,190,229,53,198,102,12,54,119,97,205,209,
+    132,243,101,44,179,0,51,24,194,147,226,207,176,185,25,50,
+    243,38,227,249,225,155,64,84,188,249,109,202,152,198,27,108,
+    205,202,181,46,227,137,112,195,157,60,67,237,167,156,22,98,
+    194,21,43,188,213,239,201,108,219,94,234,44,174,4,27,61,
+    203,202,53,217,234,158,102,194,132,219,55,75,93,178,193,147,
+    26,195,213,46,198,68,37,24,35,206,219,78,200,250,8,79,
+    88,230,111,227,157,99,129,199,31,121,168,188,157,141,36,75,
+    140,195,210,141,190,65,238,140,118,193,207,248,243,21,3,132,
+    41,228,235,97,73,187,26,46,22,108,76,227,78,81,241,119,
+    38,200,253,103,178,171,52,145,103,240,87,6,202,136,6,135,
+    27,221,136,47,209,248,122,64,46,54,94,169,93,160,203,24,
+    188,194,204,125,215,180,84,119,81,35,89,32,95,20,248,192,
+    95,184,112,151,55,67,243,198,163,120,79,156,195,120,158,111,
+    42,54,59,55,50,223,65,110,247,106,125,42,173,217,233,249,
+    175,34,149,99,99,139,84,214,119,80,251,102,124,63,26,77,
+    155,223,61,189,124,90,79,210,78,199,153,133,232,205,0,171,
+    177,14,97,98,84,20,121,6,119,198,53,203,236,111,16,188,
+    132,137,150,176,44,204,74,218,93,27,109,69,175,240,91,10,
+    133,219,138,228,62,121,192,162,237,107,89,181,49,214,14,158,
+    88,200,225,195,60,67,74,88,168,194,146,153,198,160,206,82,
+    103,196,255,8,9,103,17,251,127,79,21,196,132,221,179,248,
+    230,195,190,149,221,171,7,215,91,158,207,182,60,159,179,215,
+    36,173,159,187,253,139,227,185,154,186,197,83,57,87,237,59,
+    195,247,134,239,142,44,141,44,142,61,182,185,127,228,95,124,
+    99,241,141,28,233,223,207,153,213,87,63,102,225,65,241,29,
+    84,125,7,127,104,94,178,111,54,180,60,184,126,255,122,58,
+    158,185,170,93,68,220,104,216,179,222,176,71,105,216,171,54,
+    236,5,149,143,50,31,192,93,103,210,156,124,101,179,165,61,
+    45,188,183,115,101,231,15,77,75,206,212,254,187,158,164,103,
+    211,139,7,66,44,62,2,146,12,222,63,97,126,120,233,174,
+    115,201,153,132,15,88,15,133,44,77,254,252,142,162,182,31,
+    122,34,98,101,136,170,20,43,79,57,114,184,253,226,135,166,
+    12,238,34,225,115,147,56,158,147,165,75,86,219,124,162,1,
+    174,240,179,6,70,38,56,141,147,64,168,94,191,35,198,243,
+    200,68,228,58,126,229,15,157,20,126,226,160,144,89,201,101,
+    1,162,17,126,139,189,157,208,136,24,59,109,56,115,145,103,
+    141,63,128,33,254,39,72,186,82,34,207,63,88,41,139,103,
+    131,169,95,103,234,83,188,194,180,170,76,107,182,248,213,164,
+    178,113,52,232,226,240,121,183,13,31,12,10,61,127,252,82,
+    97,12,240,119,96,64,36,16,166,46,176,238,0,106,198,9,
+    252,101,148,240,52,23,141,201,133,31,156,41,74,2,109,67,
+    24,208,255,59,106,187,10,113,25,126,171,67,252,47,133,73,
+    37,43,191,139,212,231,46,207,226,75,218,130,183,73,83,253,
+    196,13,107,3,5,25,228,99,83,193,160,182,246,76,252,44,
+    114,170,235,207,168,162,203,51,64,216,68,190,131,23,230,68,
+    236,151,102,221,33,123,104,91,193,196,97,35,215,216,208,115,
+    214,88,148,224,71,198,155,92,150,39,22,7,97,200,95,34,
+    64,53,43,254,107,4,168,237,8,59,145,33,39,88,87,116,
+    235,137,125,88,187,172,63,34,254,215,194,224,74,255,13,32,
+    80,49,77,111,29,234,160,193,140,67,112,156,166,104,118,209,
+    133,159,28,229,88,36,159,28,229,205,22,191,57,202,189,72,
+    62,57,202,185,72,62,57,202,165,149,223,50,49,180,9,60,
+    139,63,2,176,102,124,250,118,224,164,60,67,139,174,199,206,
+    154,69,91,206,230,90,100,114,110,207,162,115,203,234,160,219,
+    193,70,220,6,190,64,240,85,41,173,233,138,153,6,195,173,
+    58,252,130,192,175,140,233,199,109,12,189,23,17,220,155,218,
+    79,2,52,140,33,248,141,22,171,4,53,52,253,92,10,44,
+    77,8,42,129,221,75,251,82,83,91,20,4,105,158,4,149,
+    160,215,76,183,165,110,103,252,25,235,42,147,97,213,198,221,
+    216,225,182,181,30,18,84,2,214,68,123,83,223,75,243,203,
+    127,6,54,46,237,125,42,32,211,254,255,0,115,135,75,124,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/util/fork_server.py",
+    "m5.util.fork_server",
+    embedded_module_data,
+    8976,
+    19178);
+
+} // anonymous namespace
+} // namespace gem5
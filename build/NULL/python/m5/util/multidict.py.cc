@@ -0,0 +1,217 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,88,95,108,219,230,17,255,248,79,162,100,218,146,
+    45,217,142,101,71,150,99,59,177,156,196,174,147,212,69,234,
+    38,93,17,39,67,147,192,29,230,118,88,211,181,130,34,50,
+    169,19,197,118,41,57,105,92,167,77,131,96,147,11,163,85,
+    11,119,81,50,23,49,182,174,104,208,61,244,177,15,29,134,
+    190,239,129,50,4,68,32,16,32,216,48,96,121,243,144,117,
+    40,250,180,187,143,226,31,81,242,159,173,155,72,29,63,30,
+    143,199,239,126,119,223,221,145,127,37,142,159,183,114,124,28,
+    227,9,185,69,100,114,158,57,67,88,242,99,34,51,55,225,
+    236,51,150,144,47,88,83,248,12,163,176,50,123,145,158,231,
+    25,245,95,44,81,152,207,96,252,133,165,238,12,135,60,133,
+    251,140,1,46,99,113,121,202,229,93,92,129,114,5,23,215,
+    35,115,10,39,243,207,192,88,22,96,228,161,35,47,140,68,
+    58,242,193,200,79,71,13,48,146,232,168,81,225,141,59,224,
+    232,57,66,228,38,56,82,105,212,116,4,184,171,94,82,231,
+    39,7,96,254,85,22,50,96,187,34,202,65,160,240,156,85,
+    127,189,187,170,45,174,158,125,93,109,205,84,27,255,191,209,
+    134,136,116,108,32,111,73,136,91,74,248,183,148,144,182,144,
+    0,196,183,148,216,106,30,252,150,243,224,55,155,7,96,218,
+    64,234,252,170,49,29,39,175,54,158,145,168,54,201,173,97,
+    9,34,101,181,177,158,14,185,69,14,185,241,223,80,214,35,
+    135,235,200,214,143,57,143,220,90,223,175,245,237,175,199,133,
+    127,147,251,202,6,114,129,173,228,206,19,185,237,183,176,10,
+    141,245,67,159,233,113,203,200,237,147,244,31,223,161,251,46,
+    205,165,179,83,242,84,42,155,114,90,101,26,243,120,158,96,
+    26,81,32,85,200,228,12,59,69,206,49,144,72,152,51,156,
+    204,222,132,52,32,115,64,225,81,55,113,153,11,64,189,178,
+    7,168,40,123,129,250,100,17,168,95,246,1,109,144,253,64,
+    37,185,1,104,163,44,1,109,146,27,129,6,228,144,28,0,
+    125,65,57,8,103,205,114,51,208,22,185,5,104,72,110,130,
+    9,134,85,156,73,138,117,76,77,128,63,70,201,227,113,58,
+    181,44,99,95,146,153,41,178,192,126,202,188,207,44,144,132,
+    197,95,192,51,75,3,72,144,4,103,221,65,224,33,236,196,
+    61,18,231,117,30,81,208,133,244,76,42,153,214,61,179,73,
+    85,153,206,234,94,89,73,43,89,69,142,115,58,159,81,210,
+    231,84,17,238,210,61,23,175,36,213,243,153,12,234,137,197,
+    98,223,119,103,212,212,240,236,213,236,235,51,211,195,151,158,
+    28,158,203,78,165,135,45,96,135,102,175,234,98,34,49,53,
+    61,149,77,36,230,91,108,190,201,235,6,45,153,126,32,215,
+    201,131,214,142,252,107,249,215,10,39,144,230,248,37,127,185,
+    173,11,14,13,229,246,14,56,72,57,216,30,227,188,83,14,
+    171,137,7,254,56,147,199,175,213,32,146,229,236,241,2,89,
+    117,226,104,253,54,205,88,85,103,147,228,30,51,1,72,112,
+    153,172,170,226,83,117,97,42,171,92,202,220,99,84,204,133,
+    25,20,140,169,18,94,240,38,18,32,4,246,54,59,237,165,
+    172,62,20,141,25,230,6,90,62,62,84,224,239,250,239,248,
+    111,75,43,82,49,212,95,10,245,23,3,187,75,129,221,154,
+    184,91,109,114,91,42,154,150,190,185,169,165,89,161,202,106,
+    199,149,255,198,106,55,6,106,16,14,24,47,170,50,91,129,
+    129,79,79,129,105,45,48,84,67,46,32,192,243,40,231,246,
+    188,193,219,131,194,3,21,40,66,31,143,127,18,46,200,119,
+    47,220,185,112,59,189,146,46,118,236,45,117,236,45,134,247,
+    149,194,251,138,129,253,165,192,126,77,220,111,64,226,116,35,
+    107,66,178,155,66,130,193,126,193,186,120,153,204,138,148,195,
+    216,28,211,0,86,197,124,70,227,249,30,75,253,167,115,23,
+    149,171,25,84,24,171,76,94,74,36,82,51,211,217,228,212,
+    116,6,12,104,115,26,96,243,7,209,136,78,106,68,57,208,
+    146,151,151,47,104,129,152,22,24,93,61,246,249,161,63,140,
+    105,125,163,154,56,90,59,111,222,156,247,251,116,222,62,226,
+    156,247,2,115,132,46,205,94,146,117,220,211,71,212,161,107,
+    44,181,199,226,94,38,106,131,140,28,206,190,23,19,223,116,
+    160,42,244,217,106,39,222,96,94,6,253,215,216,183,89,124,
+    138,49,186,194,92,33,111,114,47,147,43,12,36,132,23,227,
+    60,133,71,23,79,41,87,143,171,234,140,74,129,82,125,136,
+    22,71,209,82,209,100,157,81,204,36,96,32,214,144,72,64,
+    198,192,85,1,128,181,58,1,179,216,251,17,175,25,138,215,
+    58,235,241,237,42,7,195,203,254,194,193,124,0,183,239,30,
+    4,218,215,9,239,219,101,19,3,212,139,90,160,7,246,114,
+    223,64,158,95,150,10,147,197,96,143,22,236,249,91,91,180,
+    240,198,135,23,225,106,176,103,93,32,205,187,52,202,182,246,
+    239,224,183,46,128,18,56,102,48,62,111,136,18,89,242,63,
+    199,115,191,238,125,150,251,147,0,131,148,115,121,88,94,249,
+    137,17,77,14,159,172,58,23,162,195,83,114,77,203,181,192,
+    58,61,100,248,3,113,190,199,78,156,136,115,20,67,157,155,
+    157,153,165,8,87,161,41,92,78,166,231,106,17,205,40,217,
+    122,136,90,236,81,68,52,110,68,160,40,45,73,247,197,29,
+    107,226,142,66,168,160,20,197,190,146,216,167,137,125,229,72,
+    55,166,211,252,193,197,64,14,182,218,120,20,76,203,255,92,
+    55,30,237,166,165,78,84,158,188,86,101,113,253,132,83,139,
+    84,166,147,198,50,111,158,67,44,183,56,207,157,79,77,177,
+    102,196,78,146,205,35,219,29,205,106,47,176,227,130,177,218,
+    163,164,18,196,58,119,94,201,26,49,77,203,143,27,242,243,
+    245,33,183,216,79,227,77,215,137,29,196,161,246,229,167,11,
+    169,229,103,53,105,87,189,24,134,203,207,220,15,245,174,133,
+    122,33,45,180,22,67,195,165,208,240,58,225,26,119,125,121,
+    236,171,67,95,143,105,135,78,192,94,110,239,92,126,107,245,
+    96,169,125,143,22,116,239,206,72,167,81,237,171,68,117,12,
+    173,150,2,228,3,255,115,189,220,237,39,158,139,114,223,248,
+    24,24,126,19,8,224,56,42,192,184,170,136,88,49,254,34,
+    113,23,17,103,166,172,198,213,37,197,214,151,194,110,201,204,
+    175,80,38,211,202,180,157,100,107,42,3,148,72,16,112,151,
+    72,202,58,134,162,221,164,82,34,243,135,150,159,94,124,103,
+    233,157,223,135,86,95,252,244,149,98,207,72,169,103,164,24,
+    24,209,196,145,218,10,137,134,161,195,31,151,128,156,130,197,
+    184,157,69,92,211,95,55,252,2,12,188,198,208,100,203,158,
+    99,127,70,110,49,208,91,75,78,195,213,167,182,14,249,26,
+    189,221,14,189,206,50,197,168,1,215,82,96,84,79,213,179,
+    163,70,162,54,193,173,132,115,139,9,174,206,79,43,111,102,
+    105,100,171,216,73,85,197,179,58,140,174,105,178,81,70,217,
+    19,40,245,59,32,127,135,13,242,70,36,186,50,120,63,50,
+    184,22,25,44,70,246,149,34,251,214,9,227,219,73,201,226,
+    201,220,177,124,107,185,165,53,63,151,31,212,164,46,107,127,
+    216,16,88,26,131,32,246,245,151,163,187,86,46,222,143,14,
+    173,69,135,138,209,39,74,209,39,214,9,219,216,79,201,135,
+    254,60,151,127,169,28,106,43,200,43,23,180,208,0,236,159,
+    79,126,197,127,45,105,251,199,97,47,71,118,22,230,10,131,
+    90,184,207,216,191,91,247,130,62,170,116,157,53,117,108,82,
+    245,49,119,26,85,223,170,236,42,166,50,53,130,246,57,107,
+    185,247,245,100,38,1,5,222,25,110,21,214,11,40,43,17,
+    171,130,231,222,210,196,72,109,108,177,102,108,29,117,196,214,
+    106,61,199,187,60,127,28,60,247,22,7,158,100,127,201,51,
+    182,23,161,109,68,207,184,23,6,245,234,124,192,158,37,237,
+    49,127,138,66,251,108,127,133,218,111,29,254,232,240,135,99,
+    203,99,154,24,221,104,223,100,125,156,248,15,109,128,232,245,
+    217,209,91,137,74,191,101,139,122,176,110,232,233,60,182,84,
+    206,216,195,243,151,80,108,212,25,123,119,227,119,226,183,247,
+    174,236,197,128,107,163,196,138,186,220,243,198,182,206,153,151,
+    254,95,86,177,219,182,202,99,212,233,249,160,109,151,193,121,
+    121,83,203,118,80,98,90,214,158,59,101,108,104,153,113,137,
+    90,54,81,191,35,65,211,140,186,92,83,141,29,226,80,141,
+    165,107,220,2,91,169,151,220,219,220,100,229,232,168,136,52,
+    133,48,180,24,66,159,103,183,31,240,178,119,46,9,22,169,
+    49,52,131,55,44,174,4,37,182,23,243,141,182,189,80,9,
+    95,69,169,103,137,81,3,57,95,39,196,100,129,91,62,12,
+    153,193,168,128,140,175,211,38,229,80,36,55,97,111,180,132,
+    129,221,157,88,194,194,160,227,134,215,79,222,243,199,184,101,
+    166,147,251,152,137,113,191,17,98,213,173,153,213,160,220,216,
+    46,16,131,76,85,65,171,255,246,183,97,3,231,106,168,13,
+    72,39,73,117,91,193,219,29,133,138,239,117,52,45,199,29,
+    45,157,122,184,38,120,252,208,183,85,128,158,15,219,128,218,
+    92,252,18,145,249,121,5,87,161,22,87,14,33,53,73,89,
+    10,46,157,190,47,117,173,73,93,133,201,213,254,162,52,80,
+    146,6,52,105,160,28,237,207,141,47,157,204,103,22,95,176,
+    160,199,220,74,1,151,76,192,71,142,114,127,100,142,110,208,
+    31,124,69,106,63,48,184,63,165,44,192,210,169,234,199,152,
+    44,111,159,85,3,171,30,172,210,5,105,196,6,185,198,5,
+    140,93,12,183,255,132,47,71,204,50,25,231,38,28,89,39,
+    38,207,93,154,157,231,49,154,227,130,46,204,170,83,211,89,
+    221,63,149,129,247,183,108,114,58,165,208,175,44,118,171,18,
+    175,188,15,242,211,51,178,82,85,68,132,4,213,228,72,206,
+    148,113,17,61,54,69,61,246,64,108,212,154,162,69,177,187,
+    36,118,107,98,119,57,16,202,241,15,154,118,20,194,159,92,
+    45,54,197,75,77,113,168,104,190,238,7,82,115,126,119,161,
+    111,101,176,40,245,151,164,126,77,234,199,14,113,44,55,254,
+    173,64,2,29,46,225,122,100,147,23,202,191,80,183,157,39,
+    216,148,95,227,170,26,55,206,217,184,187,156,115,28,138,40,
+    87,245,98,25,91,96,55,104,229,57,231,235,205,198,223,51,
+    65,206,118,226,182,103,242,229,241,172,227,43,40,118,65,238,
+    224,176,251,32,143,138,181,216,118,159,238,73,206,206,42,211,
+    178,209,113,30,33,213,9,78,125,10,9,102,172,234,228,166,
+    139,134,23,161,57,104,113,123,86,185,170,162,252,101,66,187,
+    131,230,80,206,83,207,165,156,175,219,249,238,31,43,7,219,
+    110,53,126,212,136,61,207,231,161,149,153,98,112,168,20,28,
+    210,130,67,166,151,189,46,47,195,253,223,138,196,215,148,75,
+    229,71,139,98,164,36,70,52,115,167,158,54,172,13,227,215,
+    148,233,228,37,37,145,208,253,137,196,165,25,121,46,141,99,
+    41,145,120,99,46,153,54,174,168,248,73,87,197,148,170,238,
+    64,210,133,164,7,9,126,109,81,241,107,133,138,175,224,70,
+    239,49,66,204,54,242,73,11,32,76,245,234,24,146,31,33,
+    193,102,220,232,169,232,76,36,11,112,36,152,254,50,49,6,
+    193,49,183,114,52,6,6,9,17,55,241,51,194,30,40,5,
+    38,241,48,194,16,142,42,4,78,159,194,81,133,120,188,2,
+    188,57,89,164,133,21,64,169,69,68,215,85,70,56,128,183,
+    85,8,220,219,143,23,42,4,174,98,9,50,9,60,168,27,
+    71,21,226,97,133,54,84,90,33,34,43,236,192,81,133,136,
+    60,222,86,77,36,15,142,44,18,20,80,149,69,154,188,120,
+    161,150,80,240,208,127,151,146,83,240,134,163,123,179,74,38,
+    59,146,72,234,76,210,28,159,213,153,179,230,56,165,51,41,
+    115,44,235,140,108,142,21,90,155,141,179,3,137,164,57,0,
+    241,115,243,30,42,114,212,56,30,56,170,51,231,117,238,220,
+    204,140,206,157,77,170,58,127,54,157,124,61,206,63,194,21,
+    244,8,87,226,35,116,223,35,92,223,19,241,32,190,140,37,
+    211,105,136,30,234,89,252,180,172,11,84,157,113,56,96,28,
+    14,26,135,67,70,116,224,242,82,219,171,3,168,211,10,160,
+    54,36,251,106,99,231,123,241,25,35,112,143,170,73,186,154,
+    33,128,62,133,167,66,55,192,48,235,163,68,106,207,237,191,
+    238,93,247,188,194,48,128,92,125,250,15,74,255,233,228,47,
+    176,132,151,114,243,107,92,71,145,235,40,75,208,54,46,158,
+    90,58,117,253,56,29,230,149,162,212,85,146,186,182,58,125,
+    216,28,185,126,60,215,251,238,201,242,54,6,182,176,216,152,
+    75,229,252,101,215,249,67,222,119,159,15,175,241,225,252,100,
+    33,94,228,251,74,124,159,198,247,1,23,164,6,242,227,249,
+    241,66,235,221,206,59,157,183,119,174,236,44,134,247,148,194,
+    123,138,252,64,137,31,208,248,129,242,54,100,12,61,253,121,
+    110,105,176,200,183,150,248,86,141,111,45,255,0,94,61,125,
+    63,228,25,15,3,225,15,230,223,155,95,92,88,90,192,133,
+    22,162,36,199,33,54,66,46,181,232,95,242,231,252,20,163,
+    95,61,127,227,121,72,123,79,22,249,142,18,223,161,241,29,
+    245,120,101,7,150,187,139,124,79,137,239,209,248,158,202,115,
+    223,61,125,243,244,245,211,117,78,250,96,155,91,220,187,180,
+    183,200,183,149,248,54,141,111,51,44,234,133,77,89,28,116,
+    206,182,121,103,190,43,223,85,113,172,83,19,110,235,73,134,
+    240,17,141,235,160,81,252,111,235,172,18,46,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/util/multidict.py",
+    "m5.util.multidict",
+    embedded_module_data,
+    3084,
+    7792);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,590 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,123,105,108,27,87,154,224,171,139,103,241,38,117,
+    203,162,14,31,148,100,89,142,229,216,113,219,73,20,75,182,
+    20,95,157,216,113,38,66,50,50,205,42,89,180,36,82,93,
+    164,124,48,165,142,59,240,204,80,94,205,154,118,43,99,58,
+    109,111,184,131,76,70,233,78,99,220,131,238,89,55,208,11,
+    36,219,189,219,19,244,31,150,192,133,9,2,2,188,88,12,
+    176,1,22,88,10,113,128,70,254,236,126,239,21,143,226,33,
+    143,179,189,75,149,190,122,245,174,122,239,123,223,251,174,247,
+    213,127,71,154,159,173,112,255,250,167,20,66,119,144,128,38,
+    144,64,9,244,44,53,65,145,59,61,65,147,59,51,193,144,
+    59,59,193,146,59,55,193,193,157,153,213,205,233,39,244,20,
+    110,195,206,26,230,140,19,198,57,211,132,105,206,60,97,158,
+    227,39,248,57,203,132,5,202,184,9,171,160,155,176,9,250,
+    9,187,96,152,112,208,72,100,47,58,139,3,16,140,159,192,
+    155,127,70,21,159,39,92,85,229,166,170,114,55,244,229,17,
+    204,215,209,68,131,192,139,141,130,69,108,154,98,5,235,117,
+    118,162,153,70,71,145,96,187,142,4,251,39,52,180,161,75,
+    109,90,4,7,212,116,138,173,130,75,108,131,22,22,177,77,
+    108,157,162,155,75,104,152,50,8,110,232,161,93,240,8,148,
+    232,16,104,232,17,247,221,32,26,75,45,27,225,191,73,228,
+    197,214,114,43,232,169,117,202,42,52,95,231,38,182,20,198,
+    98,132,150,45,208,83,7,25,75,43,140,165,173,106,44,222,
+    194,27,24,161,29,90,108,121,106,239,102,177,81,51,70,94,
+    232,128,55,117,10,244,105,228,243,250,255,17,80,98,122,93,
+    244,11,17,175,63,36,120,47,75,193,168,24,241,70,167,69,
+    239,156,56,23,150,174,122,131,115,254,11,144,19,158,242,6,
+    166,197,192,204,124,56,24,138,70,250,189,193,16,169,20,9,
+    134,46,204,138,222,11,177,224,188,41,18,149,68,255,156,119,
+    42,44,205,249,163,222,176,84,172,115,126,54,28,152,17,133,
+    82,193,148,247,220,57,232,124,215,60,128,73,210,253,192,244,
+    244,185,115,3,222,87,212,138,166,194,43,253,146,232,13,44,
+    68,113,55,164,139,136,55,16,158,155,151,196,72,4,58,11,
+    134,4,113,94,4,16,138,206,94,245,238,184,28,140,78,123,
+    99,179,193,243,253,222,88,36,42,224,183,135,194,81,19,188,
+    206,63,59,235,235,47,143,35,226,189,60,29,12,76,147,206,
+    99,162,20,38,9,168,234,141,68,195,146,40,244,19,44,248,
+    67,164,255,43,94,104,143,91,194,123,76,48,108,156,156,10,
+    194,116,161,35,127,17,77,106,187,66,231,253,222,8,244,24,
+    186,234,157,247,75,100,166,184,39,60,27,111,0,82,231,69,
+    47,96,72,48,225,193,134,97,98,248,1,240,71,186,129,105,
+    69,7,212,177,75,226,15,22,130,82,161,251,115,231,32,15,
+    198,228,151,132,115,231,188,115,97,97,97,86,28,48,125,133,
+    87,242,164,143,202,57,207,76,227,94,190,31,14,207,142,94,
+    17,1,91,97,201,199,229,12,175,4,67,126,233,234,248,169,
+    156,97,60,42,74,126,200,205,177,199,131,145,104,206,112,106,
+    62,26,12,135,252,179,57,238,204,194,252,172,24,49,64,71,
+    23,196,185,189,120,49,190,194,219,195,199,228,216,80,56,36,
+    230,88,140,78,128,48,164,32,66,44,138,25,15,238,143,140,
+    143,191,6,191,24,119,240,181,215,198,199,3,90,22,192,194,
+    63,131,89,192,113,132,89,128,17,111,102,52,139,22,81,168,
+    189,27,69,233,114,197,30,36,217,41,20,229,202,57,2,93,
+    185,57,223,167,46,163,43,204,91,232,50,37,35,32,82,230,
+    164,132,155,199,118,17,236,84,146,101,1,87,4,85,37,68,
+    21,208,4,51,49,150,242,114,230,241,185,249,176,20,29,149,
+    36,64,6,255,250,66,40,26,156,19,201,147,143,146,172,208,
+    127,4,191,223,251,173,55,34,5,118,205,95,133,21,10,237,
+    154,219,187,107,33,26,156,213,82,234,252,213,28,55,137,7,
+    34,97,222,114,8,183,59,6,224,26,202,211,12,119,146,202,
+    26,154,210,154,235,143,235,230,134,60,162,160,64,11,215,173,
+    45,233,214,227,138,245,68,198,122,34,109,56,145,103,112,230,
+    31,255,248,199,199,102,119,154,117,147,37,121,159,213,163,191,
+    106,233,132,181,152,247,71,167,115,58,73,140,46,72,161,0,
+    85,70,26,210,21,17,254,79,4,225,81,77,153,12,200,175,
+    228,23,123,209,34,37,83,41,109,251,210,79,187,20,81,93,
+    57,93,185,40,149,79,218,122,51,228,45,1,90,32,127,149,
+    239,165,96,1,187,209,110,20,97,47,211,234,146,82,232,45,
+    200,5,126,142,249,15,19,219,247,230,180,8,139,39,121,253,
+    234,214,10,194,190,175,88,227,250,92,100,32,71,75,231,79,
+    250,216,28,27,6,46,144,99,241,38,200,49,179,144,228,78,
+    12,31,29,63,236,163,37,23,188,62,71,77,69,240,88,188,
+    94,201,129,31,45,193,200,100,121,49,165,54,200,27,197,75,
+    248,215,100,9,255,197,104,137,11,137,17,197,216,156,49,54,
+    227,165,234,75,190,150,181,217,111,94,186,113,233,131,192,253,
+    173,183,46,174,92,84,108,157,25,91,231,223,189,177,102,235,
+    197,203,214,71,106,149,193,6,6,79,80,109,65,21,128,197,
+    126,122,133,8,30,238,173,193,97,43,243,133,149,29,118,234,
+    191,240,80,0,43,54,156,161,112,255,250,127,146,245,23,17,
+    200,90,132,229,44,200,88,90,100,167,104,129,1,9,194,129,
+    44,210,193,93,39,232,65,214,233,5,3,64,3,200,35,86,
+    52,65,13,227,117,246,19,104,253,179,82,167,19,102,193,36,
+    154,72,41,11,210,145,157,224,11,207,22,44,203,224,217,170,
+    121,182,192,179,77,176,194,179,173,144,167,19,236,144,103,135,
+    205,223,0,18,207,33,154,52,114,136,21,157,162,75,52,65,
+    45,141,196,212,200,37,86,112,130,92,114,67,75,151,232,169,
+    110,13,165,110,40,109,16,56,160,154,198,156,241,251,176,136,
+    227,120,13,99,47,12,63,3,185,244,123,49,153,168,143,69,
+    182,59,64,40,36,160,225,76,72,143,10,91,138,101,48,74,
+    101,224,63,147,229,173,193,148,43,202,84,245,6,131,154,165,
+    180,118,115,164,88,84,231,39,163,139,165,218,41,174,94,13,
+    109,31,23,75,233,167,109,201,183,97,244,139,244,34,179,200,
+    194,88,244,154,113,149,90,47,114,139,58,153,142,218,203,61,
+    207,144,57,73,174,168,171,156,39,208,50,245,19,36,48,247,
+    153,106,174,44,51,81,119,77,91,79,69,91,150,180,229,100,
+    230,39,232,62,91,211,158,141,54,106,102,216,84,78,87,214,
+    156,225,234,140,74,237,89,87,59,42,109,63,50,91,38,25,
+    152,185,165,156,190,88,74,11,122,149,97,73,91,163,237,154,
+    17,32,237,54,72,217,80,157,95,101,29,232,223,170,233,191,
+    188,158,118,84,231,39,115,149,227,166,158,129,6,100,93,180,
+    171,252,84,166,130,24,87,141,177,69,178,177,181,181,83,78,
+    84,231,39,235,43,219,141,212,206,169,132,115,1,203,94,227,
+    73,169,1,210,223,82,219,99,141,219,49,115,198,170,82,37,
+    131,142,89,79,104,247,223,246,88,203,118,239,180,63,226,93,
+    8,69,22,230,177,200,133,109,119,73,148,34,160,118,120,99,
+    174,98,217,76,40,124,57,4,10,157,32,6,36,30,222,80,
+    35,218,240,56,190,238,65,120,31,6,97,92,239,88,222,134,
+    157,180,72,21,40,156,146,105,153,145,217,41,230,199,244,178,
+    245,52,250,20,73,120,238,160,250,208,3,131,57,142,108,254,
+    156,46,60,53,21,17,163,57,29,136,133,11,32,68,185,169,
+    89,255,133,72,4,163,218,139,127,68,36,124,107,58,40,4,
+    3,81,172,89,190,24,219,86,98,43,3,147,147,193,80,48,
+    58,57,57,112,16,43,123,179,145,23,7,202,245,64,29,66,
+    145,23,16,145,250,136,105,48,149,193,127,179,247,39,184,196,
+    165,228,165,212,66,158,65,22,103,226,72,242,72,106,52,237,
+    2,97,81,81,239,107,60,75,159,155,112,32,9,239,9,80,
+    42,176,248,203,233,39,199,70,135,71,70,95,207,233,22,66,
+    243,254,192,140,132,137,59,199,70,130,49,49,103,34,211,154,
+    196,105,169,5,103,155,206,250,103,23,84,29,38,167,63,59,
+    250,250,233,241,83,39,37,188,1,114,186,195,167,70,70,15,
+    159,206,113,42,130,49,45,228,236,19,160,181,140,136,69,29,
+    26,171,132,17,81,4,52,77,142,158,60,243,250,91,57,51,
+    104,254,210,164,250,218,28,71,244,95,159,1,215,153,157,82,
+    101,41,7,136,9,6,114,250,194,98,74,207,225,76,158,84,
+    156,44,162,90,85,131,115,172,224,143,250,137,34,227,45,252,
+    84,249,107,40,162,53,230,172,69,245,73,140,214,105,10,163,
+    53,235,110,138,179,203,198,117,79,115,178,39,197,42,158,173,
+    25,207,86,200,48,125,227,68,22,247,205,147,55,78,38,135,
+    238,29,248,232,165,15,95,250,249,190,207,14,42,173,251,51,
+    173,251,21,254,133,12,255,194,134,195,96,52,101,121,71,150,
+    119,17,104,95,62,133,193,120,150,111,202,242,206,199,102,251,
+    7,163,55,94,140,191,184,238,108,75,183,191,152,114,3,80,
+    47,197,249,82,198,249,82,154,127,41,107,118,126,112,97,205,
+    220,158,54,183,67,165,172,253,85,168,100,127,21,174,207,27,
+    213,251,6,67,187,172,79,16,128,60,162,45,214,188,14,241,
+    142,15,14,223,215,221,58,182,114,108,205,220,145,54,119,144,
+    206,143,174,10,0,212,75,113,142,101,156,99,105,126,108,221,
+    211,154,28,93,121,7,207,36,107,182,45,31,72,54,20,90,
+    52,111,185,219,120,175,241,81,243,238,181,230,221,74,243,158,
+    76,243,158,248,200,242,171,143,13,252,178,233,166,237,134,45,
+    201,43,134,173,25,195,214,180,97,107,214,230,90,142,221,124,
+    239,198,123,201,75,63,215,125,102,86,58,246,40,182,161,140,
+    109,40,206,230,217,34,117,253,203,224,243,143,6,95,89,27,
+    124,229,243,33,101,112,44,51,56,150,231,32,119,3,23,61,
+    193,0,191,63,14,127,146,15,147,31,102,233,39,43,182,31,
+    102,75,68,12,238,39,219,15,24,85,153,173,212,213,32,43,
+    153,8,69,88,199,167,212,73,80,194,122,9,225,4,102,195,
+    17,241,83,74,194,253,169,106,54,33,7,105,24,64,204,86,
+    166,4,82,47,132,43,181,145,221,149,197,8,120,100,104,90,
+    51,52,41,134,150,140,161,37,93,188,200,208,43,6,77,21,
+    7,173,43,12,250,52,146,94,198,47,193,140,65,122,165,242,
+    205,57,227,228,36,88,142,64,239,147,49,151,150,18,11,153,
+    63,192,29,233,213,49,216,92,113,115,237,235,48,142,112,133,
+    175,7,10,175,75,213,67,76,93,204,144,97,1,54,240,236,
+    63,165,9,82,114,172,95,2,214,164,85,85,97,171,136,87,
+    106,183,138,154,23,197,111,118,21,113,116,211,116,195,180,196,
+    47,243,113,242,87,127,172,4,53,61,53,235,105,198,79,165,
+    186,49,26,231,20,70,8,171,183,19,163,110,160,30,254,76,
+    161,133,185,73,117,179,199,220,229,241,149,115,47,227,6,13,
+    100,132,143,157,13,43,190,68,75,50,122,239,61,197,49,144,
+    182,237,74,27,118,169,164,135,199,83,161,128,149,108,26,213,
+    136,172,180,105,202,227,212,138,78,172,164,105,102,0,220,61,
+    102,2,188,87,40,103,197,25,49,57,102,46,24,82,103,180,
+    179,140,125,50,142,74,59,65,157,197,164,42,57,98,141,154,
+    21,208,22,188,139,219,117,145,73,174,219,156,137,161,149,151,
+    82,35,31,143,63,224,30,178,191,177,41,131,71,149,158,163,
+    138,109,44,99,27,75,27,198,212,85,169,59,215,231,168,234,
+    85,145,169,178,26,243,54,83,84,235,180,10,168,102,254,232,
+    98,41,191,190,178,89,37,226,25,153,254,4,90,252,172,212,
+    106,145,3,197,204,84,174,31,131,241,72,180,12,154,182,172,
+    81,58,4,170,160,54,185,163,26,229,232,98,209,10,169,81,
+    112,72,107,99,105,100,6,84,231,39,115,176,111,76,117,75,
+    168,202,222,62,163,171,87,20,187,5,204,144,242,81,57,219,
+    156,31,36,208,66,116,126,33,74,164,163,207,44,237,131,146,
+    28,29,142,228,184,121,172,238,171,124,72,135,69,108,40,156,
+    99,39,95,31,126,147,136,47,210,67,206,36,148,164,34,17,
+    149,210,107,184,95,93,153,54,164,173,24,108,195,96,59,6,
+    196,236,199,152,209,202,54,126,18,191,105,82,245,7,197,26,
+    52,36,163,201,255,33,110,249,55,136,108,92,111,207,199,166,
+    213,189,25,239,110,197,208,30,215,37,116,73,110,221,230,88,
+    190,146,100,239,153,30,53,249,214,154,124,74,83,95,166,169,
+    111,245,236,131,179,138,237,96,198,118,48,206,102,65,128,13,
+    45,29,4,19,209,216,148,117,53,198,143,85,138,17,87,35,
+    80,224,144,226,218,145,113,237,72,243,59,136,172,120,100,235,
+    89,179,245,128,16,76,245,60,234,26,90,235,26,122,240,134,
+    210,245,189,76,215,247,64,65,177,111,221,64,180,29,132,2,
+    0,144,102,70,83,45,149,150,76,162,199,136,120,118,41,153,
+    10,208,87,232,25,178,50,146,89,75,181,51,4,70,218,67,
+    96,227,107,105,181,104,80,104,119,45,60,179,247,185,26,3,
+    129,210,82,243,37,74,234,138,26,203,253,200,155,169,201,212,
+    211,204,34,76,135,41,221,179,180,3,154,226,98,207,99,95,
+    168,55,28,42,88,144,5,167,164,214,107,88,118,22,150,156,
+    136,145,1,213,67,165,35,149,189,49,30,107,202,216,195,23,
+    158,242,110,151,188,152,154,244,210,9,76,36,166,113,172,46,
+    17,149,77,85,254,8,161,114,231,175,70,197,8,33,59,233,
+    45,12,190,143,170,24,146,137,208,16,25,146,150,223,150,115,
+    151,112,139,235,132,176,30,219,236,137,209,180,173,15,174,53,
+    2,147,35,247,78,169,41,245,34,10,202,104,74,4,0,215,
+    67,247,111,154,213,20,92,138,243,72,198,121,36,205,31,1,
+    74,195,132,152,54,119,193,181,238,106,74,186,31,53,247,173,
+    53,247,173,142,42,205,207,101,154,159,83,92,123,50,174,61,
+    105,126,15,16,217,35,155,119,205,230,77,121,20,219,246,140,
+    109,123,218,176,93,229,238,100,211,96,54,27,208,16,67,153,
+    160,46,81,213,44,190,194,194,166,43,153,124,45,83,175,182,
+    192,23,233,168,190,220,190,146,233,45,50,132,180,74,236,17,
+    11,58,98,69,176,21,185,5,225,177,200,69,205,154,145,84,
+    89,156,50,173,18,186,116,2,88,233,102,164,85,101,251,2,
+    163,227,100,58,134,231,248,148,158,241,187,255,66,227,28,137,
+    89,200,200,89,129,38,41,86,160,158,109,100,15,78,104,89,
+    116,117,45,226,118,59,65,200,252,28,230,150,231,188,132,250,
+    176,175,251,156,170,198,159,235,135,13,48,123,181,194,63,173,
+    74,117,83,81,157,15,132,193,10,40,148,205,169,212,47,225,
+    173,10,22,3,3,220,88,58,133,10,107,159,51,226,222,253,
+    146,228,191,170,202,93,60,61,233,29,12,222,70,101,46,91,
+    162,149,28,3,251,134,48,93,48,61,102,130,243,213,108,150,
+    24,68,49,107,229,22,184,5,121,145,95,33,76,252,223,232,
+    144,221,245,193,158,68,52,121,230,222,91,171,13,74,251,46,
+    197,53,152,113,13,62,232,44,234,201,235,214,198,165,153,229,
+    153,56,147,181,55,36,123,238,237,82,236,190,56,151,181,121,
+    146,92,138,253,216,166,52,237,82,108,187,112,45,71,162,123,
+    105,122,121,58,233,190,17,142,135,179,188,45,49,116,231,165,
+    219,47,165,246,42,46,95,198,229,91,237,121,224,126,200,254,
+    162,245,63,70,62,223,243,235,43,191,185,162,236,62,154,238,
+    61,154,113,141,41,252,88,252,48,216,30,137,215,150,94,141,
+    143,102,93,238,248,200,55,122,4,218,129,166,183,111,12,200,
+    238,73,156,94,138,45,199,210,134,102,178,91,114,250,40,241,
+    228,71,42,184,47,150,154,221,8,43,181,176,124,199,64,127,
+    220,92,39,170,114,8,208,90,175,174,76,205,59,181,155,163,
+    76,242,149,219,164,178,143,189,64,124,21,228,6,38,247,38,
+    228,142,46,150,29,78,85,146,186,242,105,20,182,237,187,204,
+    89,116,135,254,75,150,156,247,213,56,210,112,238,166,62,99,
+    40,241,209,177,163,103,106,207,93,130,33,111,88,18,68,169,
+    223,91,22,230,184,248,170,215,239,157,15,135,103,129,21,151,
+    136,183,128,233,129,147,64,173,186,8,241,80,16,62,44,97,
+    254,35,157,193,171,97,12,204,47,76,6,194,11,161,104,142,
+    137,5,231,49,81,207,19,214,236,99,85,130,197,174,88,233,
+    32,174,202,226,238,35,24,163,101,93,192,162,142,174,168,33,
+    107,244,199,138,130,127,7,117,35,143,0,252,15,248,3,218,
+    53,33,103,19,230,186,138,163,59,227,232,142,235,214,45,29,
+    41,125,218,251,194,207,159,251,236,224,167,47,126,246,162,98,
+    57,144,177,28,192,210,127,140,122,40,172,55,182,36,159,79,
+    13,253,253,254,191,221,191,58,146,233,63,244,240,146,210,125,
+    36,211,125,68,105,60,154,105,60,154,230,235,92,121,6,55,
+    85,59,80,225,6,129,79,80,117,254,211,161,234,191,254,87,
+    171,17,47,246,175,7,135,159,103,190,120,158,29,62,160,255,
+    226,16,5,80,242,163,42,153,80,82,133,175,171,170,48,149,
+    170,71,101,181,60,157,248,58,235,155,164,50,93,237,233,122,
+    231,228,219,116,193,7,74,165,232,186,109,24,172,144,150,21,
+    16,34,15,80,245,182,160,240,248,234,123,117,117,117,106,62,
+    203,76,216,229,83,32,137,176,130,84,218,180,248,189,5,57,
+    179,239,41,227,173,106,33,168,114,242,25,199,91,125,238,6,
+    27,140,57,77,254,125,108,236,226,155,248,40,152,240,254,203,
+    211,97,124,50,67,220,123,209,48,108,40,236,55,242,159,135,
+    188,243,228,156,145,156,220,244,123,103,69,255,165,130,72,40,
+    109,181,154,51,87,173,246,20,241,226,142,65,121,194,146,227,
+    107,50,140,147,62,93,142,141,138,179,179,18,214,43,165,33,
+    84,48,64,115,28,57,153,38,34,2,116,41,178,5,49,25,
+    145,125,152,227,34,81,191,4,59,85,12,9,170,190,78,20,
+    116,204,146,42,189,79,164,143,201,104,88,107,82,23,243,254,
+    30,55,249,45,34,78,61,29,114,184,239,24,110,27,110,153,
+    86,76,32,27,172,46,16,22,173,29,143,90,119,174,181,238,
+    92,189,160,180,62,159,105,125,62,143,24,99,59,1,75,199,
+    226,163,137,33,144,16,55,199,110,140,37,222,72,190,145,58,
+    243,241,164,210,62,164,120,134,20,126,111,134,223,155,230,247,
+    226,210,241,27,227,9,97,233,212,242,169,248,169,172,211,115,
+    103,199,237,29,183,122,87,122,227,135,65,92,152,173,9,79,
+    210,125,175,89,113,116,173,17,141,235,113,169,55,16,99,138,
+    103,219,170,67,241,244,42,124,95,134,239,75,243,125,197,222,
+    68,133,111,203,240,109,233,226,149,215,35,190,27,90,19,137,
+    2,198,45,113,237,168,166,111,35,118,40,132,252,115,226,228,
+    100,206,52,57,169,158,144,66,154,159,156,252,193,130,127,182,
+    80,162,159,156,20,194,1,72,48,145,168,36,189,136,10,62,
+    26,105,4,131,87,9,14,231,165,240,188,40,69,175,230,152,
+    96,40,74,148,90,85,111,197,210,92,85,94,137,112,199,98,
+    90,194,43,32,97,2,149,176,32,83,151,20,83,162,132,253,
+    43,170,99,134,104,138,68,176,111,41,2,124,158,26,249,27,
+    226,7,44,254,101,217,195,105,246,112,158,221,194,153,146,167,
+    243,8,110,213,224,101,138,226,90,241,209,153,22,232,40,206,
+    141,83,5,0,143,30,156,42,0,29,210,89,243,52,197,13,
+    38,15,227,140,193,50,216,96,160,232,250,159,145,66,220,106,
+    156,74,237,193,5,227,212,106,225,94,7,234,140,156,41,213,
+    157,71,112,91,221,74,110,213,160,65,199,237,72,49,121,4,
+    183,85,142,220,170,129,221,204,181,36,225,21,112,75,5,200,
+    109,85,36,183,106,208,134,118,244,231,25,61,135,57,45,134,
+    217,198,142,20,179,178,168,102,61,54,58,18,91,147,76,242,
+    141,164,41,227,236,206,24,123,242,92,185,102,5,116,242,28,
+    208,48,128,228,24,185,173,94,121,200,124,182,72,146,155,2,
+    117,201,200,106,17,15,48,55,43,94,18,103,201,150,171,96,
+    234,165,128,128,105,149,169,211,169,122,60,8,171,241,149,39,
+    203,21,70,64,213,193,144,234,129,160,241,217,177,12,140,170,
+    240,220,164,213,117,202,236,27,244,21,106,158,18,216,42,51,
+    129,9,189,12,109,185,66,219,253,90,11,179,234,16,104,19,
+    107,19,250,212,125,86,117,144,146,98,234,214,173,26,63,188,
+    155,150,105,208,170,180,115,100,190,195,252,213,131,49,163,76,
+    71,249,114,173,41,140,13,70,160,240,221,103,80,131,37,124,
+    180,186,76,68,49,55,163,130,118,78,78,90,190,194,47,240,
+    81,18,150,23,62,61,62,34,0,45,71,85,203,137,55,196,
+    80,225,11,201,89,241,177,193,225,210,161,129,244,38,34,74,
+    16,241,158,224,46,200,194,231,76,101,157,171,74,21,50,78,
+    150,250,251,17,60,227,96,133,200,167,136,56,64,244,230,191,
+    138,189,31,75,116,254,104,241,250,226,125,38,57,114,215,120,
+    207,184,166,239,76,235,59,65,29,143,95,202,234,249,132,238,
+    253,247,174,189,183,238,105,94,121,39,53,180,234,89,109,1,
+    53,222,51,148,241,12,97,247,117,214,104,77,108,187,209,17,
+    239,88,247,180,220,122,115,229,205,71,158,190,53,79,223,131,
+    173,15,122,31,238,78,123,250,20,207,161,140,231,208,35,207,
+    145,53,207,145,207,163,138,231,120,198,115,28,55,123,236,105,
+    142,155,214,245,166,248,129,31,189,119,253,189,251,221,73,225,
+    174,239,158,111,77,223,157,214,119,131,49,251,193,153,56,86,
+    202,179,102,79,226,7,241,67,105,182,73,69,36,65,13,167,
+    134,13,16,59,6,11,158,128,86,27,198,38,23,161,119,154,
+    83,233,61,170,41,188,68,73,174,10,159,8,37,211,63,1,
+    1,92,231,144,149,155,119,215,167,231,74,234,4,42,100,22,
+    185,11,104,81,39,176,139,122,248,55,84,250,74,4,174,38,
+    2,196,88,161,205,115,53,218,190,73,75,85,101,141,126,209,
+    108,68,240,30,62,234,208,182,22,244,181,199,144,160,100,13,
+    46,90,64,221,208,140,68,211,166,202,40,94,180,202,214,8,
+    77,161,80,131,204,111,226,5,180,86,43,40,203,187,101,62,
+    66,133,254,151,108,74,153,235,181,136,150,173,103,205,145,111,
+    180,77,211,39,88,49,149,254,79,153,175,226,16,182,104,135,
+    166,62,47,219,42,203,97,150,63,38,170,164,149,64,251,162,
+    67,182,75,146,76,11,134,2,79,49,201,102,51,204,86,245,
+    166,195,157,195,56,148,141,155,28,12,155,107,212,53,99,202,
+    81,183,166,189,166,166,110,19,188,25,100,115,116,235,230,45,
+    101,199,20,91,211,215,83,91,16,7,132,89,54,8,12,73,
+    25,100,125,69,109,107,157,218,250,229,149,138,58,188,96,44,
+    47,78,213,120,216,130,170,75,133,232,4,181,188,239,59,224,
+    74,7,171,209,189,232,220,12,103,209,237,229,244,197,82,240,
+    130,236,252,183,53,74,242,114,207,102,111,21,106,113,181,217,
+    219,52,251,39,229,174,91,163,87,147,238,215,164,53,117,82,
+    154,32,137,242,175,90,22,128,193,160,175,90,179,42,243,227,
+    19,216,193,63,43,237,226,26,85,223,132,255,170,109,239,144,
+    121,19,203,251,59,213,150,245,32,137,204,254,87,224,117,196,
+    18,80,77,137,82,44,36,182,190,189,83,82,120,14,76,9,
+    141,5,225,13,159,191,40,6,162,155,4,124,153,72,79,7,
+    230,253,146,127,78,141,27,56,224,197,113,138,253,36,236,19,
+    7,124,226,168,188,1,109,45,162,152,28,240,98,111,65,81,
+    6,225,32,4,146,221,239,29,36,193,64,126,239,148,63,18,
+    245,10,226,148,127,97,54,90,209,188,224,38,80,59,8,45,
+    204,157,23,37,47,137,2,37,217,229,46,193,228,41,152,57,
+    59,10,221,28,192,14,228,146,13,164,253,129,234,236,61,252,
+    253,55,124,133,23,169,97,125,133,87,96,103,156,183,16,102,
+    170,6,27,146,74,177,182,55,10,209,18,21,113,78,4,5,
+    5,239,178,42,220,241,194,228,232,203,231,207,124,69,116,108,
+    204,25,190,250,223,240,59,233,107,146,118,227,156,93,168,224,
+    222,144,166,80,33,238,64,117,121,244,161,162,247,141,147,252,
+    33,144,112,36,234,64,231,159,199,17,182,210,52,126,48,78,
+    45,132,2,81,236,233,200,233,113,112,107,208,63,75,228,185,
+    116,1,21,237,52,124,112,171,234,17,123,17,241,139,224,248,
+    5,28,168,32,13,162,130,167,219,231,82,189,222,239,163,130,
+    246,168,170,16,37,129,170,186,97,200,177,35,177,227,136,137,
+    135,195,45,136,131,48,199,157,247,71,3,211,57,106,146,40,
+    29,210,53,50,74,213,154,36,7,51,57,78,4,85,230,106,
+    4,191,163,14,242,85,133,196,172,90,124,170,40,79,64,206,
+    239,224,63,210,202,16,203,175,11,25,44,31,28,73,235,91,
+    224,90,183,54,165,155,95,126,200,1,80,47,197,58,156,177,
+    14,167,13,195,89,171,39,109,237,191,239,188,215,118,119,203,
+    189,45,144,92,221,125,237,232,99,222,122,109,52,107,230,175,
+    141,100,121,203,181,209,245,202,96,194,94,108,185,252,215,174,
+    161,7,111,42,93,135,50,93,135,72,206,231,238,117,71,211,
+    74,91,92,151,167,155,140,13,89,119,67,124,20,116,153,228,
+    190,212,107,119,191,167,120,182,103,60,219,243,136,181,116,19,
+    144,0,29,191,237,78,236,118,44,213,171,52,238,204,52,238,
+    76,176,217,70,108,231,56,90,178,238,230,196,104,214,238,185,
+    195,223,230,147,103,20,123,87,198,222,149,38,87,214,213,4,
+    53,44,13,80,248,184,185,253,163,166,15,155,214,237,205,25,
+    123,231,223,249,86,223,120,48,170,216,15,100,236,7,30,142,
+    110,48,116,11,14,105,104,177,198,95,253,70,135,122,119,66,
+    225,171,138,239,165,140,239,37,48,92,44,93,4,40,246,173,
+    9,246,86,56,113,41,185,144,117,193,132,116,142,94,24,80,
+    74,119,251,189,196,123,217,158,222,212,190,213,139,74,247,254,
+    116,231,11,15,95,85,58,143,36,117,89,119,227,157,177,219,
+    99,201,179,138,187,39,227,238,73,187,123,112,206,248,237,241,
+    228,148,226,222,154,113,111,77,187,183,194,192,239,28,191,125,
+    60,181,117,181,225,87,174,7,103,127,209,250,203,214,135,98,
+    186,115,68,113,143,102,220,163,105,247,104,214,221,114,63,144,
+    218,118,119,230,222,140,226,246,37,142,192,60,146,142,91,166,
+    4,151,181,187,139,26,163,98,239,76,176,9,22,31,192,238,
+    77,58,87,94,88,250,225,242,15,83,166,53,91,111,218,214,
+    11,245,55,118,3,106,243,67,200,200,223,52,220,48,36,26,
+    20,67,83,134,196,230,102,61,45,216,75,213,71,64,124,180,
+    96,83,127,48,181,50,147,218,155,110,240,41,124,111,134,239,
+    77,147,43,107,48,147,198,142,37,243,178,57,110,198,143,198,
+    27,198,117,222,117,243,248,141,227,235,118,207,186,189,113,221,
+    222,64,208,255,134,98,239,206,216,187,179,246,22,24,98,214,
+    222,176,110,119,37,70,177,31,97,195,102,176,0,146,1,108,
+    48,38,163,233,9,2,144,39,96,152,234,197,22,98,17,108,
+    96,240,4,85,228,213,3,196,7,247,175,214,250,83,123,59,
+    75,33,222,126,237,88,4,111,204,47,76,246,241,33,230,139,
+    150,163,251,198,219,185,47,29,60,60,124,217,206,142,119,26,
+    191,236,100,112,186,135,194,233,173,36,61,196,142,239,215,127,
+    249,61,10,96,253,168,229,29,53,199,63,114,149,140,146,218,
+    180,26,115,133,63,251,169,129,144,167,145,214,215,189,105,44,
+    244,51,185,196,138,54,230,34,45,176,248,239,153,37,32,45,
+    121,180,218,182,198,42,173,25,79,200,246,244,241,146,115,201,
+    67,167,128,23,215,9,141,198,31,27,20,62,172,240,227,208,
+    233,194,71,24,32,70,130,81,44,163,66,81,96,137,3,36,
+    136,239,43,220,35,57,85,236,248,55,39,125,58,18,253,156,
+    179,78,22,190,186,192,7,66,162,164,218,245,68,50,168,145,
+    103,248,203,14,31,163,114,237,86,156,163,15,70,38,113,102,
+    4,207,168,196,84,77,56,190,182,192,83,241,241,182,9,48,
+    24,249,79,136,68,85,235,221,137,51,138,190,37,163,199,251,
+    141,219,181,110,107,191,31,92,101,239,134,239,133,21,219,64,
+    198,54,144,54,12,212,141,188,118,186,238,108,187,189,13,246,
+    187,111,197,151,124,119,205,217,27,215,87,197,92,255,137,225,
+    214,143,123,250,210,230,225,191,30,90,126,33,113,38,57,164,
+    152,189,25,179,55,109,246,254,202,253,64,120,56,162,236,30,
+    206,236,30,78,179,195,196,137,253,155,150,225,46,230,139,46,
+    118,120,155,254,11,31,5,176,34,20,187,72,154,95,191,140,
+    42,67,177,69,102,138,22,232,235,248,115,39,179,192,138,156,
+    192,137,186,41,86,208,93,231,38,244,2,47,24,160,196,32,
+    24,175,163,9,163,96,2,104,18,176,226,100,145,126,140,10,
+    50,178,226,48,168,20,198,211,133,106,163,147,5,252,84,38,
+    91,28,128,69,23,93,1,57,157,186,50,57,125,33,78,207,
+    87,136,123,121,31,85,30,51,19,143,95,172,177,146,36,74,
+    241,121,13,120,77,221,100,77,179,13,173,113,118,217,156,109,
+    196,97,122,229,168,35,233,47,81,81,124,187,171,71,207,21,
+    71,255,203,194,232,5,170,160,244,187,181,65,4,245,131,124,
+    200,169,44,85,17,136,86,223,225,82,113,102,92,125,62,44,
+    163,43,84,185,188,194,92,166,107,13,152,0,93,142,232,150,
+    233,211,72,186,139,145,201,73,31,150,230,248,19,84,116,116,
+    98,173,7,118,201,254,82,17,113,64,107,119,136,122,110,233,
+    170,66,45,214,36,91,48,90,191,175,162,213,108,75,116,222,
+    216,31,223,159,117,53,174,124,47,227,234,78,9,31,207,42,
+    174,231,226,35,56,148,227,221,71,182,142,53,91,71,138,253,
+    152,95,21,20,219,158,140,109,79,156,205,26,0,249,203,124,
+    73,24,26,58,241,99,57,104,237,255,67,100,95,49,58,140,
+    32,130,184,135,171,162,195,212,184,62,119,213,92,73,112,95,
+    39,85,17,220,103,126,100,104,94,51,52,43,134,214,140,161,
+    53,93,188,254,196,224,62,226,173,142,53,213,80,113,33,182,
+    175,7,106,74,248,171,143,255,247,65,125,210,81,12,198,80,
+    213,174,194,142,243,58,187,74,13,229,219,142,135,115,172,56,
+    28,31,165,238,33,9,167,205,82,4,167,177,109,40,45,160,
+    162,211,149,120,229,175,162,162,203,189,169,180,10,37,39,125,
+    181,103,253,199,69,224,198,216,143,35,173,103,61,207,210,92,
+    115,50,152,71,112,171,6,6,14,123,206,1,36,93,228,150,
+    18,201,173,26,88,41,174,13,243,83,45,120,186,231,189,4,
+    212,65,226,161,229,12,129,153,249,232,164,16,148,114,204,212,
+    92,52,160,245,189,154,138,171,255,83,29,209,25,52,69,101,
+    118,177,201,17,89,109,152,8,87,33,109,107,189,96,58,89,
+    247,44,113,116,139,250,250,223,59,109,166,17,4,137,215,100,
+    4,37,168,119,190,92,52,202,198,250,222,101,161,202,31,72,
+    162,255,76,139,230,69,94,230,235,159,189,87,141,138,151,205,
+    82,155,108,122,150,186,2,171,126,194,17,97,5,78,230,47,
+    81,18,181,124,234,187,225,182,198,115,102,169,8,60,177,84,
+    233,115,187,42,60,136,150,26,204,91,101,107,57,98,112,209,
+    246,221,240,27,162,5,221,162,77,182,201,197,56,69,106,249,
+    159,100,94,160,55,243,45,10,85,43,175,13,188,17,56,108,
+    150,46,218,65,72,233,138,103,14,178,61,196,202,118,65,79,
+    74,28,223,17,79,142,42,60,57,181,31,194,212,197,68,249,
+    205,98,133,79,179,172,71,58,5,3,57,242,53,202,244,60,
+    37,152,62,51,87,122,53,161,23,151,17,201,214,148,5,213,
+    249,85,159,58,44,186,101,119,132,10,53,200,174,148,181,110,
+    125,119,141,191,108,192,136,190,227,10,53,86,248,85,11,227,
+    151,173,197,143,57,62,1,154,253,153,174,220,207,119,235,93,
+    107,73,92,180,215,188,197,89,221,143,236,144,13,50,143,35,
+    56,18,212,242,31,100,67,132,190,80,109,57,112,5,12,91,
+    106,236,7,29,222,201,239,252,240,255,106,31,155,165,227,207,
+    188,63,85,10,24,122,182,189,47,27,46,129,136,16,172,120,
+    94,207,82,191,76,86,63,65,130,237,62,3,179,209,109,178,
+    250,198,154,213,127,239,187,174,254,38,235,83,192,177,204,213,
+    172,143,161,190,143,181,114,14,176,10,135,136,23,158,95,116,
+    200,188,236,40,124,148,246,92,197,219,74,159,66,253,105,220,
+    173,6,7,47,106,189,203,178,161,38,204,206,238,215,21,61,
+    160,135,195,161,75,162,20,173,255,97,189,95,243,105,61,9,
+    176,8,133,201,39,177,197,111,23,241,39,233,11,243,130,63,
+    170,250,20,161,44,40,169,30,83,124,108,31,193,102,32,54,
+    246,230,246,14,4,230,171,28,165,32,74,15,144,175,243,251,
+    177,135,52,58,93,244,27,22,220,140,85,159,230,239,168,112,
+    168,214,56,48,177,131,181,174,231,82,29,134,214,117,73,76,
+    79,60,99,177,224,146,141,233,212,225,157,252,150,58,148,51,
+    144,64,108,104,20,227,6,240,231,184,210,10,32,44,198,14,
+    156,159,157,1,24,157,155,151,112,36,235,87,152,134,125,84,
+    206,82,244,180,18,199,237,153,28,117,57,102,44,118,112,232,
+    91,202,228,115,171,78,77,242,145,18,123,17,176,168,126,82,
+    101,196,218,245,108,48,36,70,114,70,226,178,196,95,190,227,
+    88,17,41,56,79,140,223,242,33,182,234,119,196,134,43,25,
+    138,170,84,17,127,38,118,16,230,244,146,56,63,235,15,136,
+    57,46,24,21,231,34,248,227,44,232,119,38,199,206,6,35,
+    81,159,71,74,225,154,255,30,213,184,51,115,12,204,88,53,
+    155,57,117,32,208,19,30,182,128,155,134,196,28,51,35,94,
+    205,49,17,113,62,199,226,236,178,115,52,167,15,44,72,80,
+    55,154,99,207,251,35,98,206,16,18,47,147,240,13,53,133,
+    63,10,87,157,163,196,208,240,160,186,254,206,162,113,238,44,
+    172,197,100,153,204,164,223,64,65,31,86,7,239,178,36,108,
+    114,11,50,91,150,183,223,236,191,209,159,184,146,106,82,76,
+    189,25,83,239,181,195,216,137,25,88,106,94,38,54,249,150,
+    132,63,107,119,220,49,223,54,223,178,172,88,226,28,54,198,
+    183,144,2,2,176,49,190,229,9,170,200,171,7,10,198,120,
+    77,153,14,217,28,215,142,102,237,160,25,122,185,206,13,12,
+    192,188,105,110,255,104,203,135,91,86,25,165,185,63,211,220,
+    191,100,141,51,241,211,137,30,176,111,110,198,110,196,150,228,
+    101,25,234,216,156,216,135,231,73,4,238,4,111,7,111,205,
+    172,204,164,38,214,26,118,165,27,118,61,216,247,121,79,122,
+    207,17,184,178,188,27,7,215,95,190,41,223,144,147,99,41,
+    48,159,250,50,182,190,56,187,110,110,74,186,21,243,150,140,
+    25,70,193,26,219,215,29,45,201,161,91,29,43,29,216,109,
+    186,45,53,154,109,233,184,215,151,192,126,7,203,54,146,69,
+    192,6,6,79,80,69,94,61,160,78,181,54,27,230,218,216,
+    30,63,154,53,59,19,1,252,57,26,140,238,177,205,149,118,
+    251,18,194,157,139,183,47,166,26,149,6,95,166,193,7,25,
+    25,91,239,234,155,10,14,91,205,182,110,73,109,251,240,80,
+    242,80,98,40,49,180,42,60,56,251,233,92,220,176,238,242,
+    172,236,187,115,240,246,193,148,97,117,135,26,146,13,153,150,
+    198,36,171,88,218,51,150,246,60,178,24,157,41,15,96,40,
+    49,117,99,49,190,136,79,210,223,202,186,219,146,151,20,247,
+    214,84,244,225,222,135,7,62,31,206,51,116,131,115,3,1,
+    120,130,65,30,233,29,59,30,123,154,242,52,235,217,145,237,
+    232,249,40,246,97,108,181,87,233,216,155,233,216,155,100,179,
+    29,221,48,135,230,174,108,91,103,182,169,245,35,227,135,198,
+    84,207,93,219,61,91,210,150,55,66,125,152,89,123,87,222,
+    2,61,144,110,8,216,192,224,9,170,200,171,7,8,182,234,
+    100,127,227,68,142,182,210,160,23,86,3,15,246,62,236,253,
+    252,194,6,67,59,240,136,29,48,98,12,26,97,170,100,190,
+    4,108,96,240,4,85,228,213,3,228,165,181,217,223,180,33,
+    163,121,217,148,216,159,156,82,92,61,169,105,197,176,43,99,
+    192,31,46,101,155,188,113,125,130,93,178,44,89,30,155,49,
+    221,113,206,172,205,17,55,98,15,86,32,113,100,105,54,121,
+    88,49,122,51,70,47,182,141,90,82,195,89,119,51,38,172,
+    22,2,192,142,111,239,252,232,207,63,252,243,213,195,74,251,
+    96,166,125,112,233,100,252,112,194,149,16,84,18,182,28,74,
+    68,238,92,189,125,245,214,187,43,239,166,46,174,53,14,166,
+    27,7,31,156,249,15,19,255,56,241,139,183,127,249,246,231,
+    111,166,247,30,135,43,219,120,48,181,111,117,232,31,14,252,
+    244,192,167,7,63,59,152,233,222,159,110,60,168,94,9,54,
+    203,91,110,30,189,113,52,49,178,116,98,249,68,28,254,96,
+    85,224,229,12,135,3,135,138,96,3,131,39,168,34,175,30,
+    32,184,169,205,254,134,71,156,254,250,171,241,72,226,236,146,
+    156,60,173,176,157,25,182,51,205,118,62,110,233,252,104,231,
+    135,59,239,238,186,183,11,219,143,67,4,192,142,101,227,211,
+    216,177,177,127,205,220,154,54,183,174,243,214,229,241,15,206,
+    175,92,184,51,123,123,54,181,127,245,140,210,240,92,166,225,
+    57,133,223,147,225,241,247,4,127,92,135,186,250,165,67,203,
+    56,246,34,50,11,108,234,129,103,216,193,124,225,96,135,61,
+    250,47,154,40,128,191,221,105,24,161,184,223,81,236,8,103,
+    252,157,129,2,248,159,159,235,30,163,184,255,226,25,60,234,
+    212,255,94,199,67,250,247,78,246,104,131,249,247,13,12,78,
+    55,83,56,221,210,10,233,127,166,216,49,206,248,207,6,10,
+    224,151,244,43,244,49,7,243,7,7,123,204,163,255,67,19,
+    5,208,215,37,93,194,108,117,169,36,10,72,56,176,14,132,
+    198,66,32,170,70,129,96,118,90,224,206,3,83,11,32,6,
+    197,8,57,70,203,233,162,87,231,131,161,11,106,136,27,9,
+    123,195,18,76,141,130,35,1,112,229,195,176,221,164,163,145,
+    209,35,195,111,28,63,51,249,202,241,83,135,143,77,158,30,
+    159,24,205,233,78,171,111,34,71,114,248,28,141,4,220,168,
+    159,37,93,38,2,238,124,56,60,171,17,95,101,79,192,143,
+    138,242,74,21,100,196,234,199,108,190,202,29,240,173,225,160,
+    26,253,247,162,244,91,164,186,86,34,191,6,37,7,120,28,
+    69,229,159,215,83,44,108,59,0,78,68,57,210,200,174,94,
+    89,100,190,70,254,178,200,120,141,252,101,145,229,26,249,211,
+    20,237,78,87,94,121,90,71,209,121,244,167,2,59,50,186,
+    175,113,89,147,249,154,62,107,236,188,166,203,122,58,210,200,
+    9,172,198,220,20,223,182,188,51,105,86,76,61,25,83,15,
+    46,109,136,55,44,183,39,46,43,198,142,140,177,3,106,234,
+    13,215,216,188,142,163,64,168,148,128,157,161,250,146,76,30,
+    193,45,197,146,91,53,224,167,41,10,120,103,125,184,65,224,
+    19,109,254,89,198,76,53,39,78,231,17,220,82,46,114,91,
+    29,37,183,7,226,195,209,207,247,60,124,53,243,252,81,242,
+    92,13,186,144,179,41,235,112,102,27,118,0,103,200,91,14,
+    83,148,61,143,48,204,154,44,121,6,39,30,155,93,121,142,
+    228,235,16,111,203,235,73,210,128,147,70,146,52,33,135,59,
+    111,38,73,30,89,27,18,129,229,119,10,253,88,145,206,152,
+    183,149,187,172,128,199,105,61,245,10,133,199,140,239,201,63,
+    83,239,117,160,219,141,241,86,11,54,48,120,82,206,27,66,
+    78,87,97,26,230,17,10,207,15,195,172,213,145,103,112,226,
+    177,145,207,115,36,95,157,6,73,26,240,216,141,36,105,42,
+    142,93,109,204,35,157,41,222,125,253,173,188,165,220,215,102,
+    144,144,246,255,1,52,240,71,125,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/util/pmem_image.py",
+    "m5.util.pmem_image",
+    embedded_module_data,
+    9049,
+    19599);
+
+} // anonymous namespace
+} // namespace gem5
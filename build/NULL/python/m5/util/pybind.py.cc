@@ -0,0 +1,147 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,87,77,108,27,199,21,158,217,31,106,73,113,245,
+    71,201,118,44,169,102,104,198,210,58,42,101,187,137,27,219,
+    172,213,38,250,173,98,38,133,212,63,195,45,75,237,174,92,
+    6,43,146,217,93,166,22,77,22,65,33,32,116,224,3,13,
+    164,40,129,192,128,2,196,70,18,7,168,208,30,210,67,15,
+    57,231,180,44,8,148,88,192,64,128,162,135,222,40,216,135,
+    66,167,190,153,229,82,75,138,246,161,220,229,219,157,121,51,
+    111,230,125,239,103,222,254,11,121,126,124,235,249,68,1,242,
+    39,164,32,5,107,104,29,49,104,9,41,204,14,82,88,21,
+    127,201,61,100,17,122,196,186,83,174,51,148,203,3,215,167,
+    50,93,60,150,242,250,128,39,28,225,113,138,127,13,73,129,
+    255,144,134,132,109,124,86,246,238,132,113,119,18,165,59,81,
+    209,117,172,192,90,42,171,224,29,244,16,250,30,33,143,36,
+    6,36,177,118,240,237,237,215,211,25,101,225,86,46,171,155,
+    50,235,145,134,225,79,218,79,124,45,189,214,208,231,56,241,
+    57,153,196,25,170,182,105,115,114,86,81,109,94,206,164,182,
+    84,131,140,12,135,195,7,19,134,46,207,230,182,205,223,102,
+    51,179,91,175,206,230,205,180,6,205,13,88,34,150,219,182,
+    125,42,93,167,16,242,174,26,115,58,167,65,130,209,7,228,
+    125,244,173,16,44,115,79,200,38,18,18,111,11,201,36,89,
+    34,153,180,3,201,228,86,86,201,107,228,61,152,76,190,155,
+    79,105,45,206,64,106,195,48,245,148,108,110,169,176,180,162,
+    139,48,87,23,8,25,32,36,72,8,239,146,41,178,210,119,
+    233,74,238,213,224,67,77,6,243,98,19,1,217,103,145,111,
+    116,231,215,135,29,148,56,146,120,7,121,63,172,147,146,181,
+    148,97,244,182,192,68,135,5,20,94,97,119,240,117,86,225,
+    118,8,242,24,144,247,217,3,14,6,111,235,217,156,170,155,
+    219,137,117,153,235,146,68,209,127,141,74,42,226,34,74,182,
+    153,69,70,103,138,76,6,211,94,220,238,101,161,229,238,128,
+    218,75,39,112,18,123,17,148,108,65,190,117,43,233,188,253,
+    78,79,155,169,13,77,149,56,221,79,180,58,78,200,9,66,
+    94,32,216,112,142,49,195,20,55,130,127,58,147,54,147,201,
+    194,241,206,45,199,92,70,140,76,138,82,64,27,163,39,202,
+    220,93,127,35,58,99,157,184,88,21,170,194,94,20,218,98,
+    227,68,152,60,202,112,81,28,59,60,141,117,117,189,224,232,
+    138,222,105,179,116,70,193,25,172,48,37,136,138,34,86,216,
+    135,160,237,163,182,198,152,106,41,113,9,91,84,212,205,164,
+    174,166,20,162,153,106,7,221,102,54,163,109,23,174,196,162,
+    183,29,31,43,77,71,162,183,111,19,239,141,17,32,74,165,
+    200,76,248,76,244,54,117,225,210,229,203,46,207,5,170,84,
+    146,36,76,33,113,129,10,16,210,79,136,120,4,40,218,85,
+    24,235,194,200,89,248,123,100,180,228,32,20,157,254,244,154,
+    53,188,80,57,85,57,181,247,251,178,175,65,156,221,18,127,
+    92,19,86,235,194,170,229,222,20,38,137,73,172,75,188,62,
+    72,164,15,17,50,76,200,73,119,177,110,15,31,115,9,113,
+    110,35,222,225,225,77,134,229,95,108,162,78,18,96,248,55,
+    113,19,245,166,142,96,34,174,183,143,159,237,240,113,63,114,
+    46,197,215,225,235,144,227,174,243,212,227,251,220,92,115,141,
+    134,104,98,81,246,245,242,247,27,255,167,191,23,57,104,181,
+    189,170,200,187,158,3,189,237,184,162,222,194,38,236,0,113,
+    15,195,76,153,105,217,102,225,29,32,110,71,128,205,165,244,
+    155,134,29,210,85,51,175,103,146,239,165,180,188,154,204,101,
+    181,180,188,109,7,156,236,146,36,83,124,221,145,115,154,16,
+    18,4,182,207,17,109,248,90,222,225,250,199,73,143,127,56,
+    32,180,35,232,18,49,216,85,106,176,230,16,26,123,161,103,
+    12,181,66,235,244,197,50,87,23,194,141,179,231,172,147,87,
+    170,51,213,153,61,21,250,7,203,112,57,177,213,198,4,57,
+    167,19,197,245,75,138,171,137,15,89,69,108,122,70,62,132,
+    247,71,237,182,238,43,98,23,193,181,238,89,158,60,101,122,
+    108,184,201,116,201,24,52,253,222,121,157,177,11,82,251,15,
+    185,221,145,253,7,76,162,154,51,245,60,156,48,155,41,205,
+    80,11,47,253,52,99,228,115,36,152,84,37,236,128,24,6,
+    67,164,242,154,25,166,86,10,155,219,57,21,18,107,32,109,
+    164,51,96,130,140,172,218,220,70,54,171,129,4,45,155,50,
+    109,54,157,49,109,78,87,115,186,237,95,135,177,11,186,158,
+    213,37,134,26,210,230,169,12,131,161,54,115,18,159,63,41,
+    103,51,239,37,193,31,10,199,58,173,230,246,47,17,179,253,
+    140,154,237,113,255,88,69,189,191,94,235,143,212,251,35,77,
+    196,251,23,112,99,50,98,133,102,43,23,43,23,63,235,179,
+    130,179,143,197,227,85,254,1,255,192,168,22,107,226,76,93,
+    156,129,24,132,81,143,67,208,125,239,202,71,87,172,224,119,
+    254,61,50,110,77,188,81,27,153,175,143,204,91,193,249,163,
+    169,210,231,154,243,12,64,245,1,250,128,131,131,25,76,116,
+    19,18,228,29,111,218,28,43,178,187,30,163,61,27,104,140,
+    96,222,161,201,94,43,163,77,12,161,43,124,200,129,4,182,
+    151,4,175,81,203,28,140,230,119,4,175,140,249,174,82,163,
+    115,189,238,213,105,90,247,193,124,183,140,66,5,178,203,62,
+    74,133,93,111,138,104,255,138,93,58,208,177,254,66,15,233,
+    52,224,3,137,194,80,119,218,47,76,62,55,237,23,226,78,
+    205,114,254,252,229,203,61,18,193,225,148,30,204,82,73,246,
+    34,79,52,8,193,255,9,217,223,31,113,87,8,162,231,132,
+    96,184,136,110,64,171,132,75,16,136,69,252,49,148,147,119,
+    216,93,111,112,31,202,97,58,53,255,24,221,231,214,192,51,
+    138,240,166,176,247,89,122,72,22,252,57,216,57,120,237,116,
+    164,192,71,164,240,15,194,5,38,34,73,172,78,18,185,205,
+    155,249,156,166,234,231,17,57,236,108,22,134,209,220,102,247,
+    181,98,140,70,137,123,224,189,239,4,72,240,166,106,146,48,
+    128,132,40,107,5,169,35,70,156,115,47,22,215,178,50,132,
+    239,213,152,119,232,47,136,168,159,0,249,47,196,77,104,178,
+    42,63,120,181,22,146,234,33,169,137,184,225,217,70,116,234,
+    222,181,202,124,117,170,49,190,186,107,90,227,171,112,239,69,
+    191,138,253,37,246,245,241,218,133,149,250,133,21,167,207,26,
+    93,253,118,60,182,107,88,227,177,214,61,26,115,34,198,139,
+    63,239,226,127,166,133,255,77,64,253,87,98,9,51,232,14,
+    211,157,148,238,49,119,7,214,90,199,42,33,80,59,49,177,
+    115,54,78,233,223,39,91,118,138,92,71,249,131,64,92,75,
+    27,166,156,221,202,93,45,76,61,87,245,195,129,228,72,51,
+    94,116,20,183,34,139,206,189,247,238,110,124,55,190,135,63,
+    153,251,116,174,221,73,21,57,192,177,3,60,93,96,102,194,
+    7,88,146,250,90,167,75,42,151,83,51,10,61,111,72,65,
+    109,66,195,230,200,18,250,75,164,139,123,39,155,206,192,137,
+    214,89,175,216,126,0,63,191,165,102,76,195,209,133,224,242,
+    27,48,229,15,61,181,75,168,135,26,111,145,193,223,144,45,
+    195,158,27,99,83,150,180,108,141,174,148,253,141,254,193,122,
+    255,105,48,152,127,160,17,28,251,103,112,226,31,193,9,168,
+    152,135,207,237,179,172,56,240,20,1,105,82,34,160,224,208,
+    221,75,77,228,247,175,224,38,199,139,179,144,28,143,146,1,
+    36,30,115,132,220,95,111,131,0,247,223,230,255,190,2,143,
+    90,100,177,14,116,114,169,62,185,84,11,46,215,131,203,86,
+    112,153,86,78,229,181,202,43,31,205,213,196,200,238,90,77,
+    156,254,236,149,63,95,250,226,210,222,47,107,47,207,213,95,
+    134,222,185,175,79,215,196,133,154,176,88,23,22,45,247,118,
+    74,43,46,145,72,44,194,49,222,171,184,58,143,158,81,97,
+    157,114,9,41,203,13,82,171,120,42,44,1,141,28,107,136,
+    195,141,137,112,99,112,180,41,6,249,120,19,117,146,9,31,
+    191,0,213,149,135,14,13,243,75,240,222,155,58,11,147,229,
+    200,119,16,155,218,144,237,190,31,189,254,6,216,39,229,124,
+    205,140,181,247,212,185,207,3,33,238,124,40,93,213,23,145,
+    243,41,103,252,21,72,147,197,24,55,151,49,194,35,22,26,
+    118,238,166,143,197,240,133,115,148,84,127,78,31,251,132,60,
+    61,100,5,5,76,42,196,222,180,114,99,159,62,159,122,57,
+    199,166,49,209,168,55,173,196,247,233,243,233,51,248,84,169,
+    255,1,181,135,117,170,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/util/pybind.py",
+    "m5.util.pybind",
+    embedded_module_data,
+    1958,
+    3953);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,405 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,189,90,123,108,28,199,121,159,125,221,237,189,200,59,
+    30,121,124,74,220,232,65,241,100,234,40,91,148,99,75,180,
+    44,133,148,101,89,18,229,68,178,83,19,78,78,167,219,37,
+    121,54,239,145,221,165,68,178,100,202,164,106,115,86,136,154,
+    78,153,152,113,25,248,26,40,170,12,185,133,2,56,128,144,
+    62,16,199,249,171,237,31,119,194,1,58,44,74,64,64,107,
+    180,6,250,199,9,150,1,193,40,208,126,223,236,61,246,238,
+    72,217,65,139,114,143,223,204,206,124,51,59,143,239,251,230,
+    247,205,204,191,18,203,159,88,10,63,221,193,16,242,54,145,
+    201,56,145,25,153,157,102,198,25,26,178,227,44,13,185,113,
+    142,134,252,56,15,33,55,45,196,109,227,54,6,121,249,105,
+    123,92,28,23,227,142,113,71,220,57,238,140,187,198,93,113,
+    247,184,27,242,216,136,135,37,39,136,44,92,33,178,237,58,
+    75,200,77,182,252,217,241,38,154,99,135,28,177,46,167,89,
+    118,40,94,217,41,179,19,188,236,186,194,143,251,100,167,210,
+    50,193,202,110,136,251,229,14,217,3,97,171,98,147,59,229,
+    102,224,243,42,94,224,243,93,17,174,67,217,155,149,110,141,
+    183,209,92,179,150,22,40,17,176,188,251,225,189,157,190,183,
+    42,78,185,77,17,149,142,73,232,219,4,219,89,41,79,57,
+    69,57,0,156,157,240,205,118,8,187,100,246,28,9,118,69,
+    126,13,3,229,252,134,18,77,170,178,38,93,158,82,84,69,
+    186,28,153,158,150,244,88,92,145,38,147,138,38,93,84,244,
+    203,138,146,144,82,106,50,170,104,154,164,233,17,85,151,34,
+    9,89,210,167,20,105,34,166,106,186,164,197,226,51,211,17,
+    93,145,157,122,44,250,186,212,175,36,34,23,167,21,89,186,
+    28,211,167,164,11,23,246,237,163,133,102,82,251,160,146,137,
+    216,180,114,225,66,48,36,29,143,68,167,164,212,84,68,83,
+    36,181,212,128,152,174,85,63,63,224,28,121,241,37,179,33,
+    229,175,69,167,34,137,73,69,138,37,232,91,98,38,126,81,
+    81,165,228,132,4,69,146,81,252,190,244,226,156,62,149,76,
+    72,113,37,158,84,231,164,139,144,252,186,22,114,190,24,209,
+    52,232,74,242,18,176,99,201,115,177,248,217,139,175,41,81,
+    93,210,85,5,170,151,229,152,30,75,38,160,154,185,82,91,
+    144,45,166,74,209,36,244,46,5,165,42,37,156,250,92,74,
+    9,73,231,167,176,213,218,204,52,180,56,130,131,166,198,116,
+    29,70,41,2,175,210,11,231,206,142,73,218,76,60,30,129,
+    54,96,219,105,234,200,148,154,132,190,232,106,36,170,236,83,
+    46,41,9,221,137,99,1,163,30,131,129,136,70,18,48,212,
+    210,116,50,34,67,55,98,9,61,9,3,23,165,69,14,13,
+    14,98,161,88,98,242,194,5,41,169,74,47,42,234,132,162,
+    235,201,144,243,19,156,221,177,32,99,52,69,147,9,93,153,
+    213,227,145,68,100,82,81,131,130,33,142,64,111,112,22,12,
+    126,52,22,213,13,241,164,174,168,230,251,233,152,6,239,103,
+    83,102,151,163,86,5,98,202,10,212,65,80,129,20,2,138,
+    67,80,105,64,97,216,43,4,212,133,3,177,225,13,123,248,
+    92,36,158,154,86,130,156,193,227,132,25,92,52,53,99,216,
+    204,241,142,50,150,26,81,21,56,172,241,39,180,70,221,146,
+    247,90,37,94,43,238,11,36,92,81,160,26,126,110,75,126,
+    190,194,239,178,240,219,182,228,183,87,84,131,156,35,239,49,
+    99,65,209,224,81,210,12,55,76,246,68,56,154,156,129,225,
+    84,85,172,12,146,76,201,15,35,131,234,198,36,78,155,211,
+    140,150,73,69,175,8,158,217,115,213,3,185,48,29,188,166,
+    76,79,104,216,116,233,243,221,154,26,29,76,81,177,28,140,
+    31,28,156,209,99,211,131,37,117,8,151,212,33,148,154,51,
+    196,112,56,150,136,233,225,240,188,183,52,182,161,114,202,87,
+    161,30,237,73,32,75,100,163,181,35,223,186,59,215,186,39,
+    223,186,39,205,47,59,54,252,237,121,255,174,156,191,47,239,
+    239,131,119,113,35,208,153,15,12,228,2,161,124,32,4,239,
+    174,52,60,159,154,66,34,224,39,18,145,184,18,14,27,206,
+    112,56,158,148,103,166,49,238,14,135,191,51,19,153,46,229,
+    56,194,97,109,58,169,107,225,176,218,14,197,222,35,42,74,
+    130,26,64,226,44,147,33,108,80,63,109,80,249,41,120,131,
+    75,39,139,60,39,12,22,73,35,49,43,193,162,53,210,230,
+    41,133,159,254,27,169,149,54,133,3,19,201,130,153,226,29,
+    68,110,147,121,133,147,5,248,183,41,130,108,135,127,81,177,
+    41,118,139,121,115,40,246,9,183,236,188,34,140,131,145,163,
+    102,214,1,166,176,189,92,14,140,164,167,193,164,186,104,174,
+    67,198,220,38,40,225,174,242,211,84,155,220,12,245,121,104,
+    154,87,105,146,125,10,152,88,48,172,92,141,97,69,78,145,
+    154,100,31,180,162,197,218,42,232,129,159,26,249,128,220,138,
+    70,158,106,78,135,209,116,206,156,251,23,205,169,55,248,84,
+    68,159,138,86,228,157,88,52,70,165,163,178,192,128,188,86,
+    50,117,174,202,184,181,214,200,88,166,194,57,89,163,33,49,
+    124,19,42,156,44,188,85,244,4,181,33,200,141,253,123,249,
+    253,185,160,221,16,194,216,66,58,121,160,246,73,53,54,25,
+    75,96,100,98,66,83,116,136,80,11,174,1,91,50,165,36,
+    64,198,74,150,48,200,170,109,56,233,18,202,10,54,76,146,
+    76,41,66,177,154,111,175,29,133,138,168,31,65,238,33,42,
+    89,133,182,78,144,96,231,70,251,246,183,230,86,231,32,234,
+    190,215,222,133,65,161,189,147,6,109,237,152,95,232,216,6,
+    129,39,13,15,149,178,49,131,71,81,54,68,84,203,73,88,
+    4,12,129,106,155,193,41,9,217,224,35,234,164,102,216,84,
+    69,159,81,19,209,74,191,225,207,94,30,245,255,42,143,58,
+    187,192,189,102,25,221,170,181,170,166,206,59,105,78,101,220,
+    231,145,147,183,148,226,234,120,249,170,13,131,60,174,46,143,
+    183,228,241,214,60,153,89,183,45,218,22,4,181,109,193,150,
+    169,204,157,245,111,65,184,14,237,187,89,105,35,131,237,170,
+    244,47,99,223,180,140,173,161,140,13,230,159,29,123,207,166,
+    6,225,93,221,139,228,49,36,104,8,77,211,231,173,152,188,
+    176,105,243,130,162,153,187,11,201,238,50,31,181,132,134,109,
+    38,37,3,171,218,71,95,34,41,144,16,57,104,55,5,163,
+    238,11,3,72,246,33,159,96,74,20,54,89,50,255,168,224,
+    128,168,153,75,243,124,160,94,120,204,244,19,192,164,253,128,
+    160,236,20,91,72,91,103,161,67,42,180,117,173,142,103,118,
+    93,27,200,239,56,144,107,59,112,75,254,96,58,215,246,181,
+    66,107,251,234,243,107,51,235,243,185,214,96,193,31,88,253,
+    234,218,75,235,175,128,13,45,72,59,175,57,111,188,244,254,
+    171,57,233,233,162,199,238,115,22,9,144,180,80,244,18,183,
+    183,72,24,71,111,193,237,123,243,244,213,211,107,173,57,247,
+    246,188,123,123,214,189,189,32,186,151,221,119,197,238,59,98,
+    247,218,241,156,184,35,47,238,200,138,59,10,205,173,105,55,
+    21,199,154,181,208,65,74,50,246,207,44,149,49,139,36,85,
+    165,107,17,160,234,34,235,32,186,101,158,101,182,118,166,14,
+    146,69,110,129,203,88,108,65,245,175,214,42,100,248,205,120,
+    100,78,230,107,129,170,204,87,45,215,230,18,86,91,239,34,
+    2,103,120,106,107,97,72,194,181,147,60,78,52,254,50,59,
+    203,189,66,46,51,12,121,5,82,153,218,222,8,141,189,209,
+    61,213,252,47,217,179,47,209,74,217,86,237,85,237,55,23,
+    133,223,179,253,205,150,246,241,178,125,171,122,117,95,149,239,
+    53,71,165,29,98,45,215,60,104,204,162,77,111,179,212,41,
+    44,216,168,21,168,107,209,34,187,128,22,186,130,106,18,219,
+    118,18,189,163,90,78,239,178,196,123,170,241,9,110,23,81,
+    57,108,125,130,191,76,204,190,128,188,85,122,145,241,146,77,
+    254,96,61,115,202,46,248,34,83,35,155,149,62,201,238,245,
+    6,155,33,51,96,51,60,145,30,72,250,70,5,58,155,176,
+    93,3,125,215,1,213,78,36,1,33,99,106,9,239,168,0,
+    242,53,169,228,36,12,72,177,16,0,106,200,118,150,212,29,
+    209,175,162,166,192,72,3,39,53,222,251,102,82,21,31,32,
+    22,79,37,193,1,1,212,143,111,10,184,0,50,34,102,19,
+    207,104,82,66,81,240,245,226,92,165,182,248,193,80,60,18,
+    75,152,152,189,226,82,196,160,1,179,145,168,126,152,86,83,
+    245,121,32,61,153,0,55,32,114,41,18,163,248,25,94,43,
+    85,77,129,59,160,65,129,136,14,133,83,73,173,210,43,139,
+    103,100,214,146,144,6,49,57,84,41,58,54,223,76,83,6,
+    17,26,34,0,212,63,103,130,159,224,56,206,187,205,140,153,
+    20,5,152,56,245,159,248,129,24,206,115,35,225,145,211,167,
+    194,231,71,78,25,142,139,73,64,101,224,6,164,12,123,9,
+    61,170,59,128,73,221,15,36,216,98,90,95,106,160,121,186,
+    14,243,170,18,145,97,161,211,82,211,49,29,150,64,51,152,
+    0,247,2,86,66,24,95,131,77,106,80,211,156,6,142,195,
+    132,193,197,35,179,212,118,27,246,179,231,142,171,106,82,53,
+    156,47,71,166,103,148,82,252,100,66,86,102,105,156,154,114,
+    245,0,41,89,248,178,49,167,38,159,162,101,102,194,176,77,
+    196,148,105,89,67,235,79,49,181,217,96,69,110,52,233,94,
+    211,114,135,43,157,155,239,173,179,237,245,12,175,66,49,237,
+    14,67,141,188,155,52,251,151,167,243,77,219,211,92,161,217,
+    159,230,139,172,195,225,219,240,181,101,3,123,114,190,254,188,
+    175,31,108,182,103,248,198,177,66,103,215,187,129,119,2,63,
+    237,88,239,120,183,247,157,222,27,254,27,145,92,231,254,124,
+    231,254,91,190,124,231,129,187,157,79,223,233,124,58,215,121,
+    56,223,121,120,197,86,228,160,8,45,71,201,125,36,15,72,
+    77,218,102,228,225,195,135,155,37,127,236,107,91,73,228,124,
+    187,243,190,221,248,62,116,195,183,209,185,125,237,59,239,94,
+    122,231,210,79,103,215,103,223,253,238,59,223,205,245,14,230,
+    123,7,111,49,249,222,39,114,157,7,160,61,102,27,134,40,
+    63,37,216,134,161,7,164,38,109,51,82,106,67,125,242,199,
+    129,206,181,190,76,203,250,222,183,146,171,201,191,102,223,119,
+    222,26,206,245,31,205,247,31,205,5,142,166,79,108,248,3,
+    43,151,50,246,92,251,158,27,254,156,127,95,222,191,47,61,
+    90,232,238,77,143,46,159,78,159,126,184,225,109,255,89,215,
+    47,198,179,205,251,113,249,243,85,73,193,237,77,143,66,59,
+    29,62,252,170,141,56,60,229,85,240,94,199,206,66,207,238,
+    66,103,79,161,163,167,208,222,85,216,213,127,237,116,126,215,
+    87,97,61,245,52,193,122,234,105,186,207,57,28,206,7,4,
+    72,177,150,104,227,48,183,43,205,163,61,228,221,99,204,177,
+    1,238,67,201,13,241,15,7,248,99,251,237,31,238,231,48,
+    126,128,193,248,80,11,196,127,107,59,52,226,230,62,34,200,
+    243,145,155,31,241,218,63,242,34,207,71,126,6,227,173,199,
+    236,240,242,187,158,246,209,39,185,223,29,100,128,170,195,80,
+    125,212,186,176,160,121,222,9,255,159,254,35,144,83,96,202,
+    106,221,211,186,5,143,3,87,132,188,76,222,102,16,90,101,
+    172,203,122,229,207,4,141,91,215,113,29,22,227,155,149,5,
+    153,161,112,123,231,255,89,109,101,51,175,162,145,7,248,77,
+    221,181,131,64,222,227,55,67,92,26,95,210,70,19,150,35,
+    232,158,111,173,211,62,138,196,16,212,106,17,32,255,1,207,
+    18,249,216,219,254,150,99,213,1,176,136,229,28,135,1,17,
+    165,143,227,115,207,237,53,161,209,218,236,141,182,95,217,127,
+    233,248,192,145,115,31,202,187,15,101,203,191,135,233,209,71,
+    113,128,32,105,56,35,63,226,135,201,223,245,29,219,193,213,
+    56,69,92,233,255,211,39,72,253,54,66,189,27,84,133,82,
+    11,12,206,57,142,114,205,152,236,49,227,149,49,177,186,39,
+    134,112,81,1,7,167,97,36,104,234,247,145,25,23,95,112,
+    196,187,119,252,244,233,245,167,209,3,89,25,202,137,29,89,
+    250,51,33,159,85,198,42,110,197,50,169,135,124,91,205,186,
+    76,234,32,0,64,189,239,245,129,148,176,155,243,83,41,177,
+    0,252,47,150,185,234,136,240,116,48,12,46,149,76,81,81,
+    49,7,232,44,105,16,15,132,231,243,45,117,131,2,104,254,
+    79,144,245,4,29,146,130,183,117,213,249,118,211,143,154,214,
+    244,204,249,156,119,111,222,187,55,45,20,92,222,172,171,167,
+    240,133,194,81,228,136,123,27,112,210,17,52,236,73,186,215,
+    166,25,124,20,22,230,168,21,195,138,229,1,125,129,98,232,
+    24,32,209,71,40,173,176,192,142,146,111,253,26,176,214,214,
+    60,118,22,16,103,163,47,244,136,18,226,2,191,249,228,89,
+    81,110,125,141,175,89,252,113,153,249,121,61,206,115,44,56,
+    100,118,22,30,203,238,2,55,239,65,113,138,178,40,198,144,
+    207,213,230,47,136,22,143,209,94,235,49,214,149,228,27,74,
+    10,150,146,194,35,74,10,13,37,109,150,146,182,173,74,46,
+    255,173,108,187,82,135,154,51,34,217,228,175,14,177,219,175,
+    144,247,235,54,209,71,235,199,223,9,202,224,32,155,252,129,
+    242,56,22,132,173,103,78,118,46,56,99,204,117,232,239,205,
+    74,159,65,37,92,128,96,221,243,135,142,165,82,0,252,46,
+    160,200,93,144,244,164,164,92,82,212,57,201,20,197,129,210,
+    190,112,44,49,105,238,68,151,55,134,233,118,48,232,17,182,
+    214,68,100,148,176,21,242,20,144,79,40,168,67,1,168,241,
+    7,113,60,16,233,125,26,34,166,44,47,144,111,181,188,202,
+    162,15,248,42,143,216,127,145,91,228,65,134,169,138,47,240,
+    11,130,76,214,249,63,103,151,253,208,94,38,200,27,2,221,
+    167,172,58,231,234,227,72,182,1,9,218,12,54,180,223,112,
+    96,235,232,166,159,138,139,171,133,19,193,155,134,179,103,129,
+    99,159,59,135,229,88,84,143,38,227,169,35,243,143,213,233,
+    58,96,248,176,18,137,78,133,134,209,253,159,214,142,132,170,
+    204,239,96,101,103,8,5,101,196,137,126,115,153,220,111,34,
+    190,39,87,28,185,238,131,107,199,51,67,128,188,38,138,30,
+    226,9,20,58,183,151,225,193,222,162,67,232,0,100,128,132,
+    171,41,219,232,63,179,229,241,146,136,105,76,101,198,162,45,
+    150,184,139,208,125,12,58,246,230,120,48,6,31,211,149,184,
+    185,39,107,246,86,28,158,142,196,47,202,145,35,243,193,47,
+    238,107,137,245,231,216,83,47,237,233,173,209,219,190,15,78,
+    220,62,246,193,11,183,14,47,153,219,164,240,21,238,117,101,
+    206,112,197,18,0,121,19,122,44,162,43,134,128,115,160,141,
+    5,157,230,22,154,83,83,116,89,153,136,204,76,235,6,143,
+    89,106,103,227,204,24,54,45,137,136,217,16,104,163,169,105,
+    14,186,44,171,248,121,36,47,33,167,8,53,132,105,61,184,
+    168,27,28,136,171,97,51,93,46,67,136,76,128,11,101,240,
+    232,109,168,184,243,170,185,42,51,110,65,225,98,185,191,13,
+    219,114,229,140,171,88,246,132,137,186,69,210,26,72,139,27,
+    101,20,80,240,119,21,137,232,24,162,36,61,178,209,214,243,
+    214,43,171,175,164,159,163,8,113,197,255,198,201,229,147,233,
+    147,27,173,221,111,157,92,61,153,62,94,240,119,223,245,247,
+    221,241,247,253,66,191,49,242,151,115,215,230,242,123,158,206,
+    30,62,101,254,114,254,211,121,255,105,192,159,110,239,138,47,
+    125,34,125,98,249,196,202,119,222,56,141,177,55,78,88,19,
+    103,86,231,51,207,93,59,149,107,31,204,185,7,55,203,158,
+    203,60,121,237,80,174,125,95,206,189,111,179,236,133,204,196,
+    181,120,174,253,64,206,125,192,204,78,159,40,242,101,177,251,
+    172,137,28,58,202,20,188,29,184,148,229,188,82,222,43,101,
+    251,142,192,175,200,177,135,154,238,19,32,15,144,20,155,81,
+    190,177,196,3,36,128,135,2,0,131,223,116,95,117,175,156,
+    95,123,230,198,238,95,181,255,178,243,131,206,219,223,252,141,
+    146,29,62,157,19,207,228,197,51,217,242,175,81,180,113,214,
+    233,178,246,159,228,203,30,147,44,50,147,184,61,96,217,126,
+    132,165,238,101,68,11,86,85,88,98,150,193,161,223,124,67,
+    5,56,173,166,157,147,57,139,58,241,240,46,88,222,109,243,
+    2,229,97,26,210,24,217,14,233,98,77,77,14,235,233,227,
+    58,43,187,214,197,250,5,118,249,155,11,120,6,233,30,51,
+    133,191,130,78,13,230,15,168,44,79,210,230,95,9,29,51,
+    237,104,197,192,1,116,171,198,69,90,206,224,162,224,215,178,
+    169,41,131,5,208,192,201,51,42,64,154,152,108,112,122,76,
+    166,155,138,96,160,71,144,207,54,169,232,144,81,245,98,131,
+    37,108,172,211,92,122,42,167,81,44,92,139,127,12,79,152,
+    158,219,133,77,142,249,158,250,45,72,107,238,95,97,113,156,
+    43,128,137,77,222,229,216,27,175,47,191,14,46,170,207,159,
+    182,21,218,58,87,95,45,18,159,163,137,18,80,136,230,214,
+    149,151,151,23,179,205,187,64,226,10,238,150,55,207,92,61,
+    115,175,231,43,153,190,245,51,133,110,41,211,149,239,30,40,
+    116,109,43,116,245,102,236,235,161,27,7,114,93,33,76,14,
+    172,63,3,241,110,136,111,47,116,247,220,235,221,149,121,105,
+    125,161,48,240,120,246,137,209,252,192,241,162,192,109,11,20,
+    9,18,159,219,215,82,36,64,238,115,77,30,144,219,38,116,
+    194,42,100,59,241,6,74,219,230,53,194,136,235,2,21,198,
+    15,152,122,208,170,178,20,64,110,121,38,97,21,71,153,173,
+    93,199,15,130,200,90,129,106,21,177,200,28,148,171,172,200,
+    49,6,68,138,127,95,184,14,245,222,172,212,141,208,21,159,
+    47,189,99,231,182,124,169,242,213,205,49,136,181,213,181,98,
+    74,87,99,88,135,107,250,200,254,5,136,254,207,216,223,163,
+    127,246,173,16,75,173,74,99,207,235,251,183,121,175,77,215,
+    113,179,126,211,51,28,113,236,188,193,92,54,108,230,86,250,
+    39,216,16,88,156,108,177,132,12,2,58,239,10,81,113,13,
+    189,166,37,19,134,139,198,143,83,201,133,69,10,143,245,212,
+    103,144,160,107,108,240,148,135,151,103,226,41,83,105,80,141,
+    232,161,142,33,210,77,37,101,86,87,103,73,85,145,78,210,
+    82,106,50,169,27,76,184,78,137,4,60,27,82,26,124,43,
+    154,250,15,192,160,77,210,37,166,224,106,94,126,6,183,25,
+    252,160,16,176,146,116,244,224,9,207,199,30,223,202,174,213,
+    189,107,209,156,103,71,222,179,3,243,159,201,68,54,220,222,
+    229,147,43,179,153,214,107,61,217,64,232,22,115,251,43,89,
+    247,112,206,61,156,119,15,67,4,119,40,104,77,38,185,143,
+    228,1,169,73,219,140,152,59,41,13,201,159,217,136,191,109,
+    117,207,221,150,29,119,90,118,100,134,96,133,105,9,229,91,
+    66,111,216,211,124,58,178,1,205,59,159,109,233,51,127,55,
+    184,156,103,32,239,25,192,114,71,153,91,140,217,204,197,140,
+    124,183,239,169,59,125,79,229,250,14,229,251,14,101,3,135,
+    111,127,61,231,126,54,239,126,54,235,126,22,219,122,148,49,
+    11,152,244,62,165,15,72,125,250,163,105,169,241,95,196,166,
+    225,244,94,239,61,230,227,62,244,241,199,218,236,31,118,48,
+    64,127,27,216,59,226,225,62,242,240,35,62,251,71,173,12,
+    80,234,39,190,199,170,8,81,199,222,99,232,46,74,176,205,
+    4,45,184,247,172,118,19,122,32,174,171,244,100,207,116,32,
+    81,201,84,212,103,211,169,68,104,168,162,2,81,203,170,126,
+    157,148,207,123,208,208,168,40,35,134,205,132,217,106,28,83,
+    80,135,168,80,169,87,72,9,192,89,142,161,123,203,4,165,
+    84,251,57,99,61,134,46,178,118,97,251,218,185,34,129,160,
+    158,108,39,210,174,162,199,47,180,21,9,144,123,77,190,162,
+    128,47,48,169,129,162,29,99,34,241,182,23,29,24,115,146,
+    166,182,162,11,99,110,210,220,190,162,47,39,204,130,77,196,
+    9,235,126,185,10,11,217,219,35,0,122,168,37,195,196,214,
+    90,100,5,225,48,128,91,225,240,218,78,26,220,240,211,160,
+    74,238,115,192,118,229,219,38,99,19,35,236,70,70,8,50,
+    187,104,80,79,108,28,150,3,178,198,209,32,163,209,224,246,
+    16,13,234,137,179,91,24,99,10,173,237,69,142,70,118,236,
+    45,69,158,56,116,251,185,219,79,253,230,252,237,35,249,39,
+    94,48,211,238,57,60,69,1,35,69,210,64,15,181,9,1,
+    112,234,71,215,231,139,4,162,245,36,228,20,80,170,30,69,
+    205,233,235,45,219,14,42,77,53,75,78,101,127,231,111,72,
+    61,254,89,168,51,201,17,70,183,236,132,108,190,43,82,107,
+    86,97,49,216,114,127,132,49,111,136,241,139,96,122,55,63,
+    82,178,46,36,13,135,31,136,96,184,249,63,164,22,173,116,
+    188,129,46,34,30,86,80,179,70,157,197,242,69,33,188,211,
+    131,135,233,23,164,126,188,34,20,52,207,52,146,244,140,160,
+    148,65,111,76,69,164,11,22,11,125,65,210,102,38,38,98,
+    179,82,191,245,6,145,100,98,141,96,136,162,163,177,160,157,
+    142,174,33,150,239,148,80,165,51,188,229,215,176,121,108,162,
+    25,54,240,73,102,99,186,33,170,202,100,76,195,75,46,168,
+    99,128,169,232,188,224,46,85,205,118,152,205,60,165,81,255,
+    12,94,254,9,51,95,36,168,111,159,129,174,108,95,147,115,
+    205,59,243,205,59,151,158,223,224,221,119,249,109,119,248,109,
+    57,190,55,207,247,102,249,222,13,190,53,199,7,242,124,32,
+    203,7,238,241,190,165,51,248,220,227,157,63,56,251,253,179,
+    63,62,158,227,187,242,124,87,182,252,51,17,136,117,204,43,
+    119,32,90,77,113,176,100,201,100,134,41,111,95,49,42,122,
+    38,117,6,194,176,151,78,150,212,21,120,43,96,163,61,180,
+    209,27,46,255,218,80,214,133,205,107,252,34,95,254,98,10,
+    200,15,216,183,137,3,5,131,76,147,69,146,240,237,36,86,
+    145,219,5,54,11,87,91,92,105,45,103,107,21,142,234,78,
+    207,85,54,205,78,128,120,93,17,81,188,172,60,213,219,25,
+    165,59,23,116,26,107,182,60,209,56,82,111,119,1,200,143,
+    153,58,165,96,170,110,65,253,41,230,65,16,76,150,188,1,
+    174,193,255,17,154,96,199,0,58,80,249,1,57,161,38,28,
+    205,127,144,51,108,244,186,154,106,216,204,211,55,195,165,204,
+    42,209,210,213,34,13,123,40,73,75,230,156,248,240,36,72,
+    14,91,242,231,31,171,151,205,170,187,221,192,252,49,206,226,
+    15,129,60,132,105,244,180,172,60,185,250,108,230,249,156,103,
+    95,222,179,15,151,179,126,74,10,238,246,244,169,53,91,198,
+    150,115,239,201,187,247,100,221,123,112,77,237,175,50,224,130,
+    218,255,128,212,164,109,73,74,235,232,214,12,26,218,133,183,
+    61,143,115,191,228,15,218,111,51,7,237,65,222,16,205,174,
+    192,144,184,78,210,152,121,128,214,244,181,57,93,25,73,202,
+    202,105,58,94,234,79,232,240,169,107,56,148,111,35,193,132,
+    210,128,29,53,87,185,31,150,201,191,96,86,194,236,58,94,
+    176,106,46,136,237,233,102,243,121,184,225,10,224,186,208,92,
+    37,5,177,41,109,75,227,25,146,208,108,158,205,248,187,243,
+    45,193,124,203,193,165,83,69,158,21,160,237,155,16,145,60,
+    54,188,244,124,158,239,206,243,123,178,244,71,123,247,199,188,
+    72,210,206,0,247,99,38,96,158,159,84,189,180,6,81,165,
+    39,41,171,164,114,146,98,201,94,178,149,79,78,80,156,172,
+    57,91,236,129,55,8,238,65,42,138,229,58,126,127,17,46,
+    239,255,83,115,49,100,198,43,93,169,185,158,52,84,38,232,
+    136,107,184,179,85,58,246,176,55,103,237,237,5,209,147,22,
+    202,207,199,158,182,55,191,125,245,219,107,163,153,254,156,231,
+    177,188,231,49,20,139,22,74,42,199,34,40,129,45,213,116,
+    148,192,150,7,164,38,109,75,82,146,192,173,25,52,236,213,
+    77,225,25,238,239,249,99,140,253,67,158,1,186,249,170,122,
+    154,212,155,209,239,245,124,153,121,104,88,239,106,78,15,74,
+    227,137,120,14,144,33,61,74,169,238,175,153,48,15,201,103,
+    164,114,93,112,3,71,177,123,67,244,190,217,116,181,105,69,
+    207,137,61,121,177,39,91,254,21,57,2,161,189,187,209,35,
+    253,255,233,8,197,164,63,171,235,198,64,153,124,190,89,55,
+    232,118,79,78,236,202,139,93,217,242,175,166,27,213,173,186,
+    154,115,33,129,88,150,155,58,109,105,89,96,70,201,183,60,
+    139,28,75,112,227,183,97,223,164,9,175,92,124,57,45,90,
+    96,27,156,104,188,174,193,206,127,183,97,179,27,111,99,155,
+    32,60,36,125,115,202,188,240,109,162,153,1,9,140,114,210,
+    114,49,154,222,113,160,168,133,94,110,54,47,132,197,146,9,
+    205,188,149,17,211,164,84,68,211,164,139,106,242,117,168,71,
+    78,94,78,72,23,203,27,233,230,134,249,88,121,200,17,239,
+    131,235,88,187,169,169,198,72,195,1,84,188,76,254,27,243,
+    190,65,167,225,51,39,17,189,168,149,184,7,201,56,2,148,
+    164,71,106,182,30,211,39,81,5,205,44,112,224,28,190,187,
+    98,231,29,177,115,109,87,198,126,163,53,39,134,242,98,40,
+    91,254,61,2,135,188,208,48,77,223,235,254,226,41,104,128,
+    154,155,73,221,102,62,206,149,50,113,65,189,90,31,105,208,
+    157,156,216,145,47,159,58,194,175,86,228,240,80,78,253,83,
+    252,68,183,97,15,135,229,100,52,28,86,255,136,148,189,119,
+    4,21,42,110,98,27,206,210,181,241,233,216,69,234,159,25,
+    54,152,29,152,113,234,147,153,14,28,117,209,168,67,70,157,
+    58,218,98,234,227,81,48,143,215,237,40,54,52,248,139,201,
+    228,52,69,92,230,210,85,231,233,165,43,115,184,73,119,63,
+    23,135,205,101,254,136,250,11,98,94,66,215,186,96,232,97,
+    230,24,166,248,164,157,225,193,131,3,210,66,24,247,146,11,
+    159,2,113,44,209,167,64,156,75,244,41,16,87,57,107,119,
+    182,246,87,100,109,12,91,36,255,91,130,183,0,151,196,162,
+    205,198,12,98,66,61,185,143,228,65,53,173,229,20,203,160,
+    251,179,117,112,223,12,30,212,230,189,202,59,153,238,21,112,
+    19,33,88,107,165,65,61,233,98,24,105,5,178,32,168,39,
+    162,135,25,46,146,90,34,17,214,11,254,37,3,139,6,144,
+    21,142,6,107,26,13,170,4,28,81,214,123,101,187,201,232,
+    101,153,109,200,8,193,26,79,131,122,226,100,153,238,116,20,
+    227,221,43,50,13,234,137,211,193,12,22,156,158,34,135,97,
+    135,100,134,253,251,111,245,221,234,184,61,116,107,123,190,255,
+    40,77,186,39,56,138,130,3,71,173,150,116,176,76,39,86,
+    180,41,161,178,243,63,30,35,37,114,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/util/startup_profile.py",
+    "m5.util.startup_profile",
+    embedded_module_data,
+    6090,
+    13307);
+
+} // anonymous namespace
+} // namespace gem5
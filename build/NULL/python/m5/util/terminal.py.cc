@@ -0,0 +1,148 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,141,86,221,111,219,214,21,191,151,188,148,40,234,91,
+    162,101,203,249,40,157,216,75,229,204,118,230,56,232,214,196,
+    65,227,120,109,82,167,126,136,209,109,17,58,8,178,200,184,
+    178,245,225,146,84,58,27,50,160,7,63,40,128,49,248,97,
+    192,244,208,2,90,55,4,45,242,146,135,254,1,43,176,63,
+    64,52,8,88,32,32,192,216,214,135,97,47,52,220,1,65,
+    158,118,239,165,37,83,182,129,86,36,143,238,61,247,156,251,
+    187,231,147,252,23,112,253,248,227,255,163,127,67,0,254,12,
+    100,32,195,2,72,3,153,105,66,112,206,239,5,126,94,246,
+    102,105,70,102,101,36,115,178,71,246,202,188,236,147,133,47,
+    188,105,150,1,10,82,216,38,247,227,250,47,48,198,203,30,
+    78,218,35,251,183,65,218,235,115,78,193,167,121,188,19,191,
+    234,59,95,23,2,57,128,165,133,146,239,42,30,43,222,180,
+    240,4,148,216,63,176,79,192,231,144,1,31,0,57,184,13,
+    228,208,11,6,235,48,61,4,63,222,209,175,8,167,112,3,
+    148,235,61,197,13,42,96,53,212,157,53,195,63,110,141,202,
+    42,129,116,164,196,40,193,116,68,22,229,240,54,76,71,229,
+    8,62,99,76,137,203,209,53,122,10,245,46,198,18,229,88,
+    63,22,4,152,27,83,2,231,112,69,37,176,58,112,190,191,
+    156,117,57,126,238,94,193,211,92,25,46,209,39,53,240,31,
+    194,88,220,124,123,174,144,205,173,73,143,21,89,250,64,85,
+    148,146,244,68,41,20,202,159,75,115,133,138,34,125,148,93,
+    81,74,122,86,186,191,145,45,89,104,185,92,144,45,86,206,
+    23,45,110,185,144,47,173,89,72,43,86,10,22,171,42,207,
+    200,80,43,99,186,162,222,72,121,45,52,71,69,231,137,232,
+    28,21,245,125,92,146,21,21,15,21,203,251,88,121,166,168,
+    154,98,241,75,122,182,36,151,43,186,229,89,44,171,197,108,
+    33,231,78,54,50,246,226,231,200,3,104,74,146,67,51,139,
+    22,248,6,255,89,80,179,80,86,93,209,52,226,78,73,122,
+    115,89,83,115,83,235,27,250,167,229,210,84,241,214,84,69,
+    207,23,166,116,69,45,230,75,217,194,228,250,134,21,46,85,
+    10,133,76,46,187,158,209,116,53,95,90,81,7,177,222,125,
+    252,104,4,162,6,218,254,96,125,250,136,192,246,157,1,117,
+    207,80,165,103,208,93,107,171,189,113,245,84,64,182,152,42,
+    163,142,245,201,246,82,175,202,172,192,42,252,10,62,6,127,
+    4,77,246,108,42,1,108,103,255,110,56,92,12,182,156,93,
+    220,228,42,250,211,137,95,170,49,204,76,33,203,147,171,96,
+    31,106,22,175,231,87,20,29,91,101,113,250,122,86,45,90,
+    30,89,201,149,101,37,197,170,34,201,52,146,53,22,139,45,
+    215,88,234,42,73,77,16,142,224,242,197,91,152,241,136,248,
+    98,158,250,162,19,18,119,202,141,172,17,146,204,144,84,103,
+    219,254,144,13,88,95,162,19,79,254,233,78,147,109,197,175,
+    55,101,76,156,123,63,62,189,23,159,126,245,142,17,191,109,
+    198,111,183,2,183,15,226,3,187,211,234,16,113,164,219,170,
+    174,57,71,34,117,164,2,210,80,38,125,3,226,186,96,29,
+    3,173,192,253,114,161,172,46,209,51,105,57,198,165,77,106,
+    159,156,254,232,159,103,194,160,187,228,250,29,55,15,126,47,
+    125,194,144,112,108,177,186,171,11,85,65,21,247,166,42,148,
+    97,149,233,239,11,47,48,198,203,94,80,32,216,25,209,61,
+    39,122,77,116,94,184,250,107,31,99,190,69,49,209,22,119,
+    10,19,17,204,42,215,127,198,51,136,146,12,156,52,231,52,
+    69,207,62,77,113,150,79,41,85,138,138,154,213,21,203,159,
+    35,14,202,148,178,69,28,119,47,17,208,113,216,67,56,146,
+    217,229,124,33,175,111,100,138,217,117,139,203,235,74,81,75,
+    121,112,49,42,133,167,52,184,22,204,91,48,103,33,162,169,
+    94,38,145,38,118,73,244,231,164,3,159,201,228,75,121,61,
+    147,217,28,112,71,97,178,203,254,29,81,218,6,52,61,196,
+    75,95,174,25,226,184,41,142,219,0,250,110,81,242,124,190,
+    126,175,254,89,39,16,223,157,111,140,52,210,141,244,215,222,
+    87,81,227,210,77,243,210,77,35,48,99,6,102,90,244,238,
+    36,175,237,39,39,246,146,19,70,114,202,76,78,17,213,95,
+    80,242,252,97,125,126,247,170,163,63,218,20,154,194,215,55,
+    255,18,254,91,216,8,220,48,3,55,90,244,182,217,174,48,
+    77,175,69,92,3,248,212,196,164,76,198,18,50,153,98,89,
+    174,20,200,56,144,201,124,86,201,22,156,21,117,2,203,170,
+    113,66,136,22,181,86,29,233,146,223,18,179,174,82,179,186,
+    151,205,32,14,195,156,37,142,62,209,58,211,166,104,110,206,
+    208,220,172,2,213,171,187,150,151,48,167,230,117,103,233,18,
+    208,145,123,246,13,92,196,201,239,37,221,10,71,210,242,235,
+    56,142,221,137,80,42,119,199,41,104,9,21,77,201,208,28,
+    208,52,2,123,28,59,63,174,255,174,148,250,14,230,124,74,
+    172,26,161,86,181,189,81,27,120,184,225,78,56,81,15,181,
+    125,241,150,239,194,247,225,225,22,63,252,125,56,217,226,147,
+    78,161,186,205,241,116,205,73,211,15,1,183,41,56,185,191,
+    218,130,186,171,107,225,180,134,253,37,180,197,244,165,61,83,
+    133,155,84,110,181,167,69,230,167,95,74,58,127,162,131,81,
+    238,108,177,85,86,134,199,175,74,184,227,59,133,201,158,194,
+    68,125,152,168,202,80,76,150,80,217,25,255,164,83,236,204,
+    246,151,236,42,231,26,123,220,154,206,126,50,69,208,67,39,
+    58,63,9,229,175,180,196,209,162,26,193,243,55,80,218,12,
+    147,151,165,212,123,63,74,41,94,29,195,75,150,119,229,184,
+    194,185,117,92,140,58,149,183,34,174,106,167,141,64,21,136,
+    147,130,132,92,199,4,119,12,182,188,188,138,95,15,116,217,
+    226,114,164,203,91,62,178,145,195,225,233,16,51,53,98,159,
+    171,7,4,116,69,59,73,164,57,178,35,126,180,255,2,90,
+    245,177,75,54,8,115,2,37,117,79,39,50,216,96,27,191,
+    49,34,163,102,100,180,206,117,248,96,93,217,125,250,188,212,
+    208,190,216,52,66,41,131,31,55,249,241,22,63,222,73,166,
+    112,241,248,30,65,135,214,31,182,195,67,141,7,123,225,209,
+    86,120,180,29,25,234,12,94,110,104,205,135,198,224,164,57,
+    56,89,127,208,9,68,119,223,110,124,108,196,174,52,159,24,
+    177,201,87,113,35,54,243,234,153,17,155,253,59,251,15,193,
+    136,125,104,4,22,204,192,66,139,222,24,178,29,8,239,60,
+    104,135,162,59,197,67,22,6,47,30,132,196,67,142,9,14,
+    216,30,16,150,14,189,108,80,250,31,15,194,145,67,31,10,
+    70,108,1,132,99,59,171,135,126,46,152,60,100,189,62,225,
+    7,128,137,125,66,162,93,219,104,73,144,206,82,204,230,75,
+    184,31,14,206,206,206,74,199,78,145,148,82,118,185,128,191,
+    148,48,111,115,200,189,32,231,181,222,138,58,77,226,144,176,
+    88,109,67,195,125,124,29,199,138,6,84,189,70,118,70,133,
+    188,166,91,104,77,217,208,212,59,132,75,190,68,212,97,178,
+    228,195,45,189,178,78,182,164,93,219,105,83,55,9,185,69,
+    150,61,154,238,124,44,97,44,220,36,84,210,112,104,189,59,
+    177,154,36,228,54,33,36,81,78,181,188,55,252,29,167,63,
+    222,85,23,128,211,180,180,111,49,197,77,21,66,251,93,0,
+    253,53,129,92,246,48,8,255,106,63,116,119,47,116,215,8,
+    189,103,134,222,171,249,49,43,24,111,251,35,237,160,216,142,
+    14,182,195,98,59,146,104,135,68,59,204,199,24,27,96,82,
+    11,217,34,16,135,118,103,26,161,253,161,235,123,67,215,141,
+    161,9,115,104,194,136,79,154,241,201,22,136,216,30,8,241,
+    39,68,143,240,65,56,210,70,209,218,71,228,58,64,98,237,
+    125,19,137,6,74,152,40,209,66,9,27,113,92,194,6,125,
+    228,181,29,130,88,39,42,213,62,36,215,235,215,175,109,15,
+    7,113,91,62,75,14,9,249,225,132,23,1,254,193,250,207,
+    119,55,13,225,138,41,92,169,121,219,193,100,253,147,198,148,
+    17,28,55,131,227,53,225,128,245,108,191,187,207,138,123,172,
+    104,176,9,147,197,120,44,188,212,142,37,107,11,181,133,131,
+    216,197,218,130,237,241,194,97,156,35,125,68,140,64,156,45,
+    61,242,51,128,2,245,205,61,54,217,98,147,109,228,171,253,
+    186,37,92,53,208,168,137,70,91,104,180,141,34,181,71,187,
+    131,6,74,154,40,217,66,142,64,253,218,206,100,63,167,37,
+    140,26,104,204,68,99,45,52,230,168,12,27,232,162,137,46,
+    182,186,183,237,7,104,24,35,104,1,28,189,239,80,226,222,
+    5,240,221,5,116,111,132,253,63,254,185,15,8,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/util/terminal.py",
+    "m5.util.terminal",
+    embedded_module_data,
+    1981,
+    3530);
+
+} // anonymous namespace
+} // namespace gem5
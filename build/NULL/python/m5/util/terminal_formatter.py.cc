@@ -0,0 +1,174 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,181,88,221,111,219,214,21,231,167,190,34,57,178,45,
+    39,142,243,69,43,78,108,197,178,92,199,169,59,100,203,135,
+    219,196,141,145,32,217,80,3,222,220,102,42,69,210,22,19,
+    138,84,73,42,138,85,9,232,67,7,168,65,177,120,193,134,
+    12,67,129,105,67,151,169,200,30,252,24,236,41,127,130,101,
+    16,176,64,96,64,128,61,229,77,70,178,151,188,108,231,94,
+    90,148,100,203,107,49,96,36,117,248,113,207,253,157,115,238,
+    185,60,191,75,253,147,104,219,152,157,243,235,49,16,79,8,
+    145,16,73,133,88,34,40,226,67,66,164,190,36,68,250,41,
+    69,16,207,168,166,250,18,41,146,31,17,49,230,21,186,185,
+    37,180,35,53,117,94,199,49,146,132,116,137,37,74,12,0,
+    14,185,68,139,244,151,196,18,35,30,16,89,184,99,197,160,
+    232,131,179,71,244,3,90,200,238,93,144,244,140,172,242,202,
+    156,166,103,120,211,148,244,87,63,5,20,129,106,195,103,225,
+    71,35,252,79,49,190,73,182,154,138,100,145,168,180,221,183,
+    182,167,240,123,230,222,137,228,145,86,75,71,92,69,34,233,
+    94,139,4,248,68,221,210,209,131,24,109,211,224,152,61,156,
+    220,227,97,50,105,238,60,74,26,114,65,178,79,116,87,121,
+    96,38,243,178,104,166,99,148,205,24,146,178,108,251,51,252,
+    3,231,145,129,44,112,220,219,49,67,23,38,179,171,102,90,
+    83,39,51,239,78,230,76,89,153,116,177,151,155,96,137,236,
+    170,237,75,38,101,85,54,147,201,194,208,30,99,137,102,219,
+    73,64,53,38,64,124,65,252,203,67,28,231,42,254,234,249,
+    173,241,203,155,227,151,107,227,179,214,248,236,139,97,107,252,
+    106,237,216,53,235,216,181,50,99,249,142,108,224,227,53,10,
+    93,104,31,196,158,230,128,255,221,153,26,144,78,133,40,145,
+    248,76,150,40,124,166,74,116,145,170,208,221,134,94,164,138,
+    100,133,233,218,66,22,233,187,172,59,244,84,197,211,189,191,
+    72,58,251,83,208,125,230,234,63,5,107,207,92,139,157,105,
+    252,4,236,149,152,18,91,242,148,188,69,182,200,44,83,144,
+    74,218,73,165,205,92,135,45,230,181,217,101,65,53,21,219,
+    99,152,122,78,48,109,47,30,106,205,176,61,57,53,203,11,
+    247,108,86,214,4,104,15,44,204,223,254,224,195,197,249,91,
+    31,45,217,12,106,136,249,244,0,224,232,189,72,244,33,209,
+    143,96,201,180,77,230,109,42,157,181,169,124,214,240,225,148,
+    58,155,30,68,237,7,119,77,148,194,112,183,212,117,168,140,
+    160,12,230,112,6,235,190,72,57,136,246,186,111,160,28,66,
+    123,221,119,168,220,131,246,151,135,143,63,41,61,46,213,131,
+    125,245,96,239,163,27,15,111,212,195,189,107,239,89,253,167,
+    43,247,255,250,249,159,63,95,159,121,62,245,156,127,209,251,
+    98,182,54,58,103,141,206,109,211,84,168,231,13,1,98,155,
+    101,7,3,111,8,16,95,5,203,100,121,170,156,90,139,54,
+    130,4,244,30,46,155,229,3,58,74,252,156,208,158,84,79,
+    115,42,124,66,162,169,176,66,148,104,248,49,144,224,110,153,
+    219,245,214,93,37,238,240,37,182,200,254,144,55,180,228,41,
+    122,140,243,69,186,66,117,211,133,201,64,137,244,55,84,145,
+    106,189,199,221,39,95,145,121,10,214,158,185,22,59,239,72,
+    20,1,243,245,205,34,211,221,78,209,179,91,255,235,212,255,
+    223,167,34,141,42,43,127,9,58,7,154,83,104,33,45,27,
+    220,114,78,21,76,89,83,57,147,191,39,25,28,207,161,170,
+    194,241,170,200,233,146,153,211,85,244,72,145,13,147,211,150,
+    57,65,83,13,83,54,115,146,106,186,32,89,94,231,87,116,
+    62,155,54,226,156,40,45,67,149,80,87,160,139,251,152,227,
+    17,66,74,209,132,123,8,2,163,27,18,106,54,37,145,91,
+    214,181,140,11,165,153,105,73,119,52,82,171,184,19,175,222,
+    3,227,170,196,141,105,58,167,193,25,60,48,121,199,134,166,
+    42,171,92,62,45,155,146,1,47,144,20,75,112,243,0,159,
+    150,92,184,232,178,130,94,0,53,202,241,250,74,46,3,78,
+    115,16,175,33,153,156,169,113,240,122,74,113,142,87,20,7,
+    63,165,75,252,61,131,203,203,102,90,86,219,98,114,193,242,
+    50,168,166,36,24,148,140,118,95,18,19,1,183,229,90,98,
+    37,113,161,117,139,221,191,200,141,142,142,94,151,20,69,139,
+    131,75,96,85,54,246,14,24,167,230,50,41,8,120,170,13,
+    108,193,81,222,171,116,174,77,105,22,146,243,189,168,211,9,
+    183,13,124,105,117,78,38,87,36,51,217,138,112,12,57,28,
+    231,230,120,197,144,98,174,214,199,209,93,222,239,245,58,26,
+    231,162,255,197,221,104,220,5,195,201,104,119,58,187,219,213,
+    232,157,239,117,112,1,18,182,191,127,93,70,245,127,247,143,
+    235,230,95,83,241,45,25,120,75,114,49,106,110,33,198,216,
+    1,35,171,200,38,154,65,134,205,66,201,151,179,182,135,207,
+    102,37,85,180,153,187,154,172,198,188,184,170,219,12,138,193,
+    246,238,76,72,187,53,154,134,29,18,114,122,43,90,155,65,
+    96,182,15,99,101,37,209,240,18,110,201,119,42,126,120,247,
+    248,20,162,221,74,126,167,206,20,244,52,54,8,84,243,27,
+    63,34,14,13,150,3,245,193,161,114,232,101,100,240,201,237,
+    199,183,107,145,211,86,228,116,131,240,249,39,177,40,95,173,
+    31,62,250,164,240,184,240,155,226,111,139,229,235,245,254,163,
+    13,194,19,154,172,135,135,182,194,195,155,225,225,250,49,174,
+    74,111,68,226,112,84,23,173,200,187,91,145,11,155,145,11,
+    207,47,214,34,243,86,100,30,168,160,183,15,168,160,183,175,
+    129,133,135,24,62,181,22,90,11,189,12,31,223,10,143,108,
+    134,71,42,63,175,133,19,86,56,177,129,143,151,190,190,45,
+    223,145,77,223,145,122,100,176,66,111,4,71,224,168,44,90,
+    193,137,173,224,185,205,224,185,245,139,181,224,172,21,156,5,
+    84,63,208,10,136,6,22,62,34,60,4,11,11,76,39,54,
+    129,57,88,104,95,15,160,113,195,164,50,67,33,82,249,97,
+    100,98,80,104,1,186,223,114,175,8,197,184,115,69,80,98,
+    76,182,213,126,215,45,204,166,191,173,23,209,182,26,161,11,
+    48,29,118,47,123,255,182,171,116,151,88,145,237,64,160,205,
+    80,219,29,213,169,141,17,61,157,136,5,22,233,21,144,54,
+    91,241,118,141,133,17,61,109,203,213,14,196,246,22,132,177,
+    66,2,113,50,64,180,75,104,221,179,15,158,87,164,69,239,
+    175,168,125,49,119,181,2,218,241,146,175,232,169,248,186,161,
+    137,44,140,20,138,193,87,216,131,4,116,121,98,223,126,190,
+    61,186,31,139,190,138,191,155,110,209,35,122,69,255,254,30,
+    3,93,6,248,95,83,251,210,37,47,139,80,43,84,196,56,
+    220,206,50,26,179,210,50,167,229,204,108,206,52,18,220,98,
+    90,82,57,45,181,67,88,45,134,128,30,77,70,53,228,12,
+    104,220,149,4,147,203,75,192,159,134,172,75,88,193,1,105,
+    25,128,98,151,111,7,113,76,182,241,14,244,21,46,112,179,
+    162,168,75,134,129,24,46,195,27,64,158,26,47,34,183,82,
+    80,31,116,89,114,24,46,206,201,203,220,59,157,245,143,227,
+    140,85,195,148,50,28,159,51,181,9,129,87,132,28,20,43,
+    232,128,204,99,40,128,76,57,190,101,52,195,220,213,25,140,
+    66,197,130,145,185,15,172,138,121,60,47,27,18,39,67,144,
+    41,105,21,173,0,132,156,97,106,25,12,213,70,101,139,128,
+    6,13,120,241,1,193,130,13,94,16,180,28,80,53,50,132,
+    63,100,240,170,1,110,28,26,64,11,147,60,212,52,23,1,
+    233,235,40,70,101,53,129,224,128,199,52,7,83,148,161,58,
+    243,171,206,120,243,41,73,105,179,123,67,90,205,67,55,119,
+    101,96,236,102,240,137,137,9,72,56,78,137,0,165,216,89,
+    33,65,67,139,85,49,164,171,231,220,237,184,186,147,188,49,
+    9,150,6,92,212,201,76,52,214,234,42,171,34,90,141,52,
+    251,226,69,12,135,87,49,59,33,167,36,200,175,196,73,188,
+    144,198,235,147,86,87,125,28,230,230,194,43,52,77,99,164,
+    205,98,117,29,125,148,225,18,120,75,63,1,242,213,191,97,
+    139,5,244,97,184,182,163,221,190,28,59,217,193,246,161,200,
+    208,168,218,7,22,224,106,81,71,28,166,195,199,41,255,64,
+    71,47,143,77,43,192,90,12,210,208,163,200,214,41,100,222,
+    239,124,177,160,239,9,155,197,241,219,30,39,50,253,12,122,
+    230,205,239,224,68,154,159,153,98,187,81,191,123,173,163,191,
+    7,12,100,168,53,159,48,215,133,156,142,73,103,60,11,39,
+    247,18,93,135,194,167,8,230,18,137,89,110,140,8,71,30,
+    21,30,22,190,42,126,93,108,16,164,255,80,189,127,96,237,
+    92,35,64,28,26,218,26,56,187,57,112,182,122,126,61,82,
+    27,152,177,6,102,202,1,248,146,237,63,106,245,157,249,71,
+    223,192,154,105,29,30,171,206,212,14,79,173,207,214,250,102,
+    172,190,153,6,77,245,7,182,9,16,111,144,40,123,1,36,
+    20,254,221,169,181,251,127,161,43,215,254,20,248,54,80,59,
+    124,182,250,179,90,223,164,213,55,89,11,78,214,123,250,183,
+    105,50,20,121,217,51,240,72,121,168,252,254,66,133,255,230,
+    98,173,39,102,245,196,170,195,86,79,124,155,165,66,19,13,
+    154,225,2,27,190,99,128,53,52,210,32,104,127,2,139,242,
+    124,125,240,228,31,131,127,8,86,126,81,253,172,170,87,245,
+    111,239,212,6,167,173,193,233,245,217,245,247,215,223,183,6,
+    223,131,88,66,179,164,35,215,152,122,120,100,43,60,190,25,
+    30,175,126,176,126,230,187,155,207,207,215,226,151,107,225,43,
+    86,248,202,6,62,234,65,110,43,56,186,25,28,173,50,181,
+    224,4,144,234,6,62,128,147,97,116,86,31,174,110,28,153,
+    168,10,96,71,176,142,156,171,29,156,182,14,78,111,248,166,
+    49,167,222,138,145,58,139,39,217,92,140,194,147,206,249,203,
+    194,139,254,38,80,249,140,148,76,218,129,100,50,163,137,57,
+    5,93,7,147,201,207,114,188,226,180,232,136,175,116,84,162,
+    245,119,144,248,49,136,239,8,140,139,19,171,51,77,129,166,
+    171,33,18,40,101,205,189,65,209,236,28,68,184,71,6,14,
+    176,145,6,225,138,161,9,118,168,65,116,138,95,146,113,246,
+    124,131,216,71,56,14,32,179,16,210,148,235,199,101,36,92,
+    223,222,250,126,226,4,117,73,191,130,41,4,28,188,9,162,
+    65,147,36,217,152,33,200,240,23,7,209,222,240,168,36,9,
+    184,221,229,54,150,111,246,105,197,214,254,3,23,112,184,207,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/python/m5/util/terminal_formatter.py",
+    "m5.util.terminal_formatter",
+    embedded_module_data,
+    2400,
+    4906);
+
+} // anonymous namespace
+} // namespace gem5
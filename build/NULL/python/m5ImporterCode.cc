@@ -0,0 +1,378 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   /root/package/site_scons/gem5_scons/builders/blob.py:104
+ */
+
+#include "python/m5ImporterCode.hh"
+
+namespace gem5
+{
+namespace Blobs
+{
+
+const std::size_t m5ImporterCode_len = 5752;
+const std::uint8_t m5ImporterCode[] = {
+    35,32,67,111,112,121,114,105,103,104,116,32,40,99,41,32,
+    50,48,48,56,32,84,104,101,32,72,101,119,108,101,116,116,
+    45,80,97,99,107,97,114,100,32,68,101,118,101,108,111,112,
+    109,101,110,116,32,67,111,109,112,97,110,121,10,35,32,65,
+    108,108,32,114,105,103,104,116,115,32,114,101,115,101,114,118,
+    101,100,46,10,35,10,35,32,82,101,100,105,115,116,114,105,
+    98,117,116,105,111,110,32,97,110,100,32,117,115,101,32,105,
+    110,32,115,111,117,114,99,101,32,97,110,100,32,98,105,110,
+    97,114,121,32,102,111,114,109,115,44,32,119,105,116,104,32,
+    111,114,32,119,105,116,104,111,117,116,10,35,32,109,111,100,
+    105,102,105,99,97,116,105,111,110,44,32,97,114,101,32,112,
+    101,114,109,105,116,116,101,100,32,112,114,111,118,105,100,101,
+    100,32,116,104,97,116,32,116,104,101,32,102,111,108,108,111,
+    119,105,110,103,32,99,111,110,100,105,116,105,111,110,115,32,
+    97,114,101,10,35,32,109,101,116,58,32,114,101,100,105,115,
+    116,114,105,98,117,116,105,111,110,115,32,111,102,32,115,111,
+    117,114,99,101,32,99,111,100,101,32,109,117,115,116,32,114,
+    101,116,97,105,110,32,116,104,101,32,97,98,111,118,101,32,
+    99,111,112,121,114,105,103,104,116,10,35,32,110,111,116,105,
+    99,101,44,32,116,104,105,115,32,108,105,115,116,32,111,102,
+    32,99,111,110,100,105,116,105,111,110,115,32,97,110,100,32,
+    116,104,101,32,102,111,108,108,111,119,105,110,103,32,100,105,
+    115,99,108,97,105,109,101,114,59,10,35,32,114,101,100,105,
+    115,116,114,105,98,117,116,105,111,110,115,32,105,110,32,98,
+    105,110,97,114,121,32,102,111,114,109,32,109,117,115,116,32,
+    114,101,112,114,111,100,117,99,101,32,116,104,101,32,97,98,
+    111,118,101,32,99,111,112,121,114,105,103,104,116,10,35,32,
+    110,111,116,105,99,101,44,32,116,104,105,115,32,108,105,115,
+    116,32,111,102,32,99,111,110,100,105,116,105,111,110,115,32,
+    97,110,100,32,116,104,101,32,102,111,108,108,111,119,105,110,
+    103,32,100,105,115,99,108,97,105,109,101,114,32,105,110,32,
+    116,104,101,10,35,32,100,111,99,117,109,101,110,116,97,116,
+    105,111,110,32,97,110,100,47,111,114,32,111,116,104,101,114,
+    32,109,97,116,101,114,105,97,108,115,32,112,114,111,118,105,
+    100,101,100,32,119,105,116,104,32,116,104,101,32,100,105,115,
+    116,114,105,98,117,116,105,111,110,59,10,35,32,110,101,105,
+    116,104,101,114,32,116,104,101,32,110,97,109,101,32,111,102,
+    32,116,104,101,32,99,111,112,121,114,105,103,104,116,32,104,
+    111,108,100,101,114,115,32,110,111,114,32,116,104,101,32,110,
+    97,109,101,115,32,111,102,32,105,116,115,10,35,32,99,111,
+    110,116,114,105,98,117,116,111,114,115,32,109,97,121,32,98,
+    101,32,117,115,101,100,32,116,111,32,101,110,100,111,114,115,
+    101,32,111,114,32,112,114,111,109,111,116,101,32,112,114,111,
+    100,117,99,116,115,32,100,101,114,105,118,101,100,32,102,114,
+    111,109,10,35,32,116,104,105,115,32,115,111,102,116,119,97,
+    114,101,32,119,105,116,104,111,117,116,32,115,112,101,99,105,
+    102,105,99,32,112,114,105,111,114,32,119,114,105,116,116,101,
+    110,32,112,101,114,109,105,115,115,105,111,110,46,10,35,10,
+    35,32,84,72,73,83,32,83,79,70,84,87,65,82,69,32,
+    73,83,32,80,82,79,86,73,68,69,68,32,66,89,32,84,
+    72,69,32,67,79,80,89,82,73,71,72,84,32,72,79,76,
+    68,69,82,83,32,65,78,68,32,67,79,78,84,82,73,66,
+    85,84,79,82,83,10,35,32,34,65,83,32,73,83,34,32,
+    65,78,68,32,65,78,89,32,69,88,80,82,69,83,83,32,
+    79,82,32,73,77,80,76,73,69,68,32,87,65,82,82,65,
+    78,84,73,69,83,44,32,73,78,67,76,85,68,73,78,71,
+    44,32,66,85,84,32,78,79,84,10,35,32,76,73,77,73,
+    84,69,68,32,84,79,44,32,84,72,69,32,73,77,80,76,
+    73,69,68,32,87,65,82,82,65,78,84,73,69,83,32,79,
+    70,32,77,69,82,67,72,65,78,84,65,66,73,76,73,84,
+    89,32,65,78,68,32,70,73,84,78,69,83,83,32,70,79,
+    82,10,35,32,65,32,80,65,82,84,73,67,85,76,65,82,
+    32,80,85,82,80,79,83,69,32,65,82,69,32,68,73,83,
+    67,76,65,73,77,69,68,46,32,73,78,32,78,79,32,69,
+    86,69,78,84,32,83,72,65,76,76,32,84,72,69,32,67,
+    79,80,89,82,73,71,72,84,10,35,32,79,87,78,69,82,
+    32,79,82,32,67,79,78,84,82,73,66,85,84,79,82,83,
+    32,66,69,32,76,73,65,66,76,69,32,70,79,82,32,65,
+    78,89,32,68,73,82,69,67,84,44,32,73,78,68,73,82,
+    69,67,84,44,32,73,78,67,73,68,69,78,84,65,76,44,
+    10,35,32,83,80,69,67,73,65,76,44,32,69,88,69,77,
+    80,76,65,82,89,44,32,79,82,32,67,79,78,83,69,81,
+    85,69,78,84,73,65,76,32,68,65,77,65,71,69,83,32,
+    40,73,78,67,76,85,68,73,78,71,44,32,66,85,84,32,
+    78,79,84,10,35,32,76,73,77,73,84,69,68,32,84,79,
+    44,32,80,82,79,67,85,82,69,77,69,78,84,32,79,70,
+    32,83,85,66,83,84,73,84,85,84,69,32,71,79,79,68,
+    83,32,79,82,32,83,69,82,86,73,67,69,83,59,32,76,
+    79,83,83,32,79,70,32,85,83,69,44,10,35,32,68,65,
+    84,65,44,32,79,82,32,80,82,79,70,73,84,83,59,32,
+    79,82,32,66,85,83,73,78,69,83,83,32,73,78,84,69,
+    82,82,85,80,84,73,79,78,41,32,72,79,87,69,86,69,
+    82,32,67,65,85,83,69,68,32,65,78,68,32,79,78,32,
+    65,78,89,10,35,32,84,72,69,79,82,89,32,79,70,32,
+    76,73,65,66,73,76,73,84,89,44,32,87,72,69,84,72,
+    69,82,32,73,78,32,67,79,78,84,82,65,67,84,44,32,
+    83,84,82,73,67,84,32,76,73,65,66,73,76,73,84,89,
+    44,32,79,82,32,84,79,82,84,10,35,32,40,73,78,67,
+    76,85,68,73,78,71,32,78,69,71,76,73,71,69,78,67,
+    69,32,79,82,32,79,84,72,69,82,87,73,83,69,41,32,
+    65,82,73,83,73,78,71,32,73,78,32,65,78,89,32,87,
+    65,89,32,79,85,84,32,79,70,32,84,72,69,32,85,83,
+    69,10,35,32,79,70,32,84,72,73,83,32,83,79,70,84,
+    87,65,82,69,44,32,69,86,69,78,32,73,70,32,65,68,
+    86,73,83,69,68,32,79,70,32,84,72,69,32,80,79,83,
+    83,73,66,73,76,73,84,89,32,79,70,32,83,85,67,72,
+    32,68,65,77,65,71,69,46,10,10,105,109,112,111,114,116,
+    32,105,109,112,111,114,116,108,105,98,10,105,109,112,111,114,
+    116,32,105,109,112,111,114,116,108,105,98,46,97,98,99,10,
+    105,109,112,111,114,116,32,105,109,112,111,114,116,108,105,98,
+    46,117,116,105,108,10,105,109,112,111,114,116,32,109,97,114,
+    115,104,97,108,10,105,109,112,111,114,116,32,111,115,10,10,
+    10,99,108,97,115,115,32,66,121,116,101,67,111,100,101,76,
+    111,97,100,101,114,40,105,109,112,111,114,116,108,105,98,46,
+    97,98,99,46,76,111,97,100,101,114,41,58,10,32,32,32,
+    32,100,101,102,32,95,95,105,110,105,116,95,95,40,115,101,
+    108,102,44,32,99,111,100,101,41,58,10,32,32,32,32,32,
+    32,32,32,115,117,112,101,114,40,41,46,95,95,105,110,105,
+    116,95,95,40,41,10,32,32,32,32,32,32,32,32,115,101,
+    108,102,46,99,111,100,101,32,61,32,99,111,100,101,10,10,
+    32,32,32,32,100,101,102,32,101,120,101,99,95,109,111,100,
+    117,108,101,40,115,101,108,102,44,32,109,111,100,117,108,101,
+    41,58,10,32,32,32,32,32,32,32,32,101,120,101,99,40,
+    115,101,108,102,46,99,111,100,101,44,32,109,111,100,117,108,
+    101,46,95,95,100,105,99,116,95,95,41,10,10,32,32,32,
+    32,100,101,102,32,103,101,116,95,99,111,100,101,40,115,101,
+    108,102,44,32,95,41,58,10,32,32,32,32,32,32,32,32,
+    114,101,116,117,114,110,32,115,101,108,102,46,99,111,100,101,
+    10,10,10,35,32,79,110,45,100,105,115,107,32,99,97,99,
+    104,101,32,111,102,32,99,111,100,101,32,111,98,106,101,99,
+    116,115,32,99,111,109,112,105,108,101,100,32,102,114,111,109,
+    32,111,118,101,114,114,105,100,101,32,115,111,117,114,99,101,
+    115,46,32,32,69,110,116,114,105,101,115,10,35,32,117,115,
+    101,32,116,104,101,32,115,116,97,110,100,97,114,100,32,112,
+    121,99,32,108,97,121,111,117,116,32,40,109,97,103,105,99,
+    44,32,102,108,97,103,115,44,32,109,116,105,109,101,44,32,
+    115,105,122,101,44,32,109,97,114,115,104,97,108,108,101,100,
+    32,99,111,100,101,41,10,35,32,97,110,100,32,108,105,118,
+    101,32,105,110,32,116,104,101,32,117,115,117,97,108,32,95,
+    95,112,121,99,97,99,104,101,95,95,32,108,111,99,97,116,
+    105,111,110,32,110,101,120,116,32,116,111,32,116,104,101,32,
+    115,111,117,114,99,101,44,32,115,111,32,97,32,102,105,108,
+    101,10,35,32,105,115,32,111,110,108,121,32,114,101,99,111,
+    109,112,105,108,101,100,32,119,104,101,110,32,105,116,115,32,
+    109,111,100,105,102,105,99,97,116,105,111,110,32,116,105,109,
+    101,32,111,114,32,115,105,122,101,32,99,104,97,110,103,101,
+    115,46,10,99,108,97,115,115,32,66,121,116,101,67,111,100,
+    101,67,97,99,104,101,58,10,32,32,32,32,100,101,102,32,
+    95,95,105,110,105,116,95,95,40,115,101,108,102,41,58,10,
+    32,32,32,32,32,32,32,32,115,101,108,102,46,104,105,116,
+    115,32,61,32,48,10,32,32,32,32,32,32,32,32,115,101,
+    108,102,46,109,105,115,115,101,115,32,61,32,48,10,10,32,
+    32,32,32,64,115,116,97,116,105,99,109,101,116,104,111,100,
+    10,32,32,32,32,100,101,102,32,95,104,101,97,100,101,114,
+    40,115,116,41,58,10,32,32,32,32,32,32,32,32,114,101,
+    116,117,114,110,32,40,10,32,32,32,32,32,32,32,32,32,
+    32,32,32,105,109,112,111,114,116,108,105,98,46,117,116,105,
+    108,46,77,65,71,73,67,95,78,85,77,66,69,82,10,32,
+    32,32,32,32,32,32,32,32,32,32,32,43,32,40,48,41,
+    46,116,111,95,98,121,116,101,115,40,52,44,32,34,108,105,
+    116,116,108,101,34,41,10,32,32,32,32,32,32,32,32,32,
+    32,32,32,43,32,40,105,110,116,40,115,116,46,115,116,95,
+    109,116,105,109,101,41,32,38,32,48,120,70,70,70,70,70,
+    70,70,70,41,46,116,111,95,98,121,116,101,115,40,52,44,
+    32,34,108,105,116,116,108,101,34,41,10,32,32,32,32,32,
+    32,32,32,32,32,32,32,43,32,40,115,116,46,115,116,95,
+    115,105,122,101,32,38,32,48,120,70,70,70,70,70,70,70,
+    70,41,46,116,111,95,98,121,116,101,115,40,52,44,32,34,
+    108,105,116,116,108,101,34,41,10,32,32,32,32,32,32,32,
+    32,41,10,10,32,32,32,32,100,101,102,32,108,111,97,100,
+    40,115,101,108,102,44,32,97,98,115,112,97,116,104,41,58,
+    10,32,32,32,32,32,32,32,32,115,116,32,61,32,111,115,
+    46,115,116,97,116,40,97,98,115,112,97,116,104,41,10,32,
+    32,32,32,32,32,32,32,104,101,97,100,101,114,32,61,32,
+    115,101,108,102,46,95,104,101,97,100,101,114,40,115,116,41,
+    10,32,32,32,32,32,32,32,32,116,114,121,58,10,32,32,
+    32,32,32,32,32,32,32,32,32,32,99,97,99,104,101,95,
+    112,97,116,104,32,61,32,105,109,112,111,114,116,108,105,98,
+    46,117,116,105,108,46,99,97,99,104,101,95,102,114,111,109,
+    95,115,111,117,114,99,101,40,97,98,115,112,97,116,104,41,
+    10,32,32,32,32,32,32,32,32,101,120,99,101,112,116,32,
+    78,111,116,73,109,112,108,101,109,101,110,116,101,100,69,114,
+    114,111,114,58,10,32,32,32,32,32,32,32,32,32,32,32,
+    32,99,97,99,104,101,95,112,97,116,104,32,61,32,78,111,
+    110,101,10,10,32,32,32,32,32,32,32,32,105,102,32,99,
+    97,99,104,101,95,112,97,116,104,32,105,115,32,110,111,116,
+    32,78,111,110,101,58,10,32,32,32,32,32,32,32,32,32,
+    32,32,32,116,114,121,58,10,32,32,32,32,32,32,32,32,
+    32,32,32,32,32,32,32,32,119,105,116,104,32,111,112,101,
+    110,40,99,97,99,104,101,95,112,97,116,104,44,32,34,114,
+    98,34,41,32,97,115,32,102,58,10,32,32,32,32,32,32,
+    32,32,32,32,32,32,32,32,32,32,32,32,32,32,100,97,
+    116,97,32,61,32,102,46,114,101,97,100,40,41,10,32,32,
+    32,32,32,32,32,32,32,32,32,32,32,32,32,32,105,102,
+    32,100,97,116,97,91,58,32,108,101,110,40,104,101,97,100,
+    101,114,41,93,32,61,61,32,104,101,97,100,101,114,58,10,
+    32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,
+    32,32,32,32,99,111,100,101,32,61,32,109,97,114,115,104,
+    97,108,46,108,111,97,100,115,40,100,97,116,97,91,108,101,
+    110,40,104,101,97,100,101,114,41,32,58,93,41,10,32,32,
+    32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,
+    32,32,115,101,108,102,46,104,105,116,115,32,43,61,32,49,
+    10,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,
+    32,32,32,32,32,114,101,116,117,114,110,32,99,111,100,101,
+    10,32,32,32,32,32,32,32,32,32,32,32,32,101,120,99,
+    101,112,116,32,40,79,83,69,114,114,111,114,44,32,86,97,
+    108,117,101,69,114,114,111,114,44,32,69,79,70,69,114,114,
+    111,114,44,32,84,121,112,101,69,114,114,111,114,41,58,10,
+    32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,
+    112,97,115,115,10,10,32,32,32,32,32,32,32,32,115,101,
+    108,102,46,109,105,115,115,101,115,32,43,61,32,49,10,32,
+    32,32,32,32,32,32,32,119,105,116,104,32,111,112,101,110,
+    40,97,98,115,112,97,116,104,41,32,97,115,32,102,58,10,
+    32,32,32,32,32,32,32,32,32,32,32,32,99,111,100,101,
+    32,61,32,99,111,109,112,105,108,101,40,102,46,114,101,97,
+    100,40,41,44,32,97,98,115,112,97,116,104,44,32,34,101,
+    120,101,99,34,41,10,10,32,32,32,32,32,32,32,32,35,
+    32,87,114,105,116,101,32,116,104,101,32,99,97,99,104,101,
+    32,101,110,116,114,121,32,97,116,111,109,105,99,97,108,108,
+    121,59,32,97,110,32,117,110,119,114,105,116,97,98,108,101,
+    32,115,111,117,114,99,101,32,116,114,101,101,10,32,32,32,
+    32,32,32,32,32,35,32,115,105,109,112,108,121,32,109,101,
+    97,110,115,32,119,101,32,114,101,99,111,109,112,105,108,101,
+    32,110,101,120,116,32,116,105,109,101,46,10,32,32,32,32,
+    32,32,32,32,105,102,32,99,97,99,104,101,95,112,97,116,
+    104,32,105,115,32,110,111,116,32,78,111,110,101,58,10,32,
+    32,32,32,32,32,32,32,32,32,32,32,116,109,112,95,112,
+    97,116,104,32,61,32,102,34,123,99,97,99,104,101,95,112,
+    97,116,104,125,46,123,111,115,46,103,101,116,112,105,100,40,
+    41,125,34,10,32,32,32,32,32,32,32,32,32,32,32,32,
+    116,114,121,58,10,32,32,32,32,32,32,32,32,32,32,32,
+    32,32,32,32,32,111,115,46,109,97,107,101,100,105,114,115,
+    40,111,115,46,112,97,116,104,46,100,105,114,110,97,109,101,
+    40,99,97,99,104,101,95,112,97,116,104,41,44,32,101,120,
+    105,115,116,95,111,107,61,84,114,117,101,41,10,32,32,32,
+    32,32,32,32,32,32,32,32,32,32,32,32,32,119,105,116,
+    104,32,111,112,101,110,40,116,109,112,95,112,97,116,104,44,
+    32,34,119,98,34,41,32,97,115,32,102,58,10,32,32,32,
+    32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,
+    32,102,46,119,114,105,116,101,40,104,101,97,100,101,114,32,
+    43,32,109,97,114,115,104,97,108,46,100,117,109,112,115,40,
+    99,111,100,101,41,41,10,32,32,32,32,32,32,32,32,32,
+    32,32,32,32,32,32,32,111,115,46,114,101,112,108,97,99,
+    101,40,116,109,112,95,112,97,116,104,44,32,99,97,99,104,
+    101,95,112,97,116,104,41,10,32,32,32,32,32,32,32,32,
+    32,32,32,32,101,120,99,101,112,116,32,79,83,69,114,114,
+    111,114,58,10,32,32,32,32,32,32,32,32,32,32,32,32,
+    32,32,32,32,112,97,115,115,10,32,32,32,32,32,32,32,
+    32,114,101,116,117,114,110,32,99,111,100,101,10,10,32,32,
+    32,32,100,101,102,32,114,101,112,111,114,116,40,115,101,108,
+    102,41,58,10,32,32,32,32,32,32,32,32,105,109,112,111,
+    114,116,32,115,121,115,10,10,32,32,32,32,32,32,32,32,
+    112,114,105,110,116,40,10,32,32,32,32,32,32,32,32,32,
+    32,32,32,34,77,53,95,79,86,69,82,82,73,68,69,95,
+    80,89,95,83,79,85,82,67,69,32,98,121,116,101,99,111,
+    100,101,32,99,97,99,104,101,58,32,34,10,32,32,32,32,
+    32,32,32,32,32,32,32,32,102,34,123,115,101,108,102,46,
+    104,105,116,115,125,32,104,105,116,115,44,32,123,115,101,108,
+    102,46,109,105,115,115,101,115,125,32,109,105,115,115,101,115,
+    34,44,10,32,32,32,32,32,32,32,32,32,32,32,32,102,
+    105,108,101,61,115,121,115,46,115,116,100,101,114,114,44,10,
+    32,32,32,32,32,32,32,32,41,10,10,10,35,32,83,105,
+    109,112,108,101,32,105,109,112,111,114,116,101,114,32,116,104,
+    97,116,32,97,108,108,111,119,115,32,112,121,116,104,111,110,
+    32,116,111,32,105,109,112,111,114,116,32,100,97,116,97,32,
+    102,114,111,109,32,97,32,100,105,99,116,32,111,102,10,35,
+    32,99,111,100,101,32,111,98,106,101,99,116,115,46,32,32,
+    84,104,101,32,107,101,121,115,32,97,114,101,32,116,104,101,
+    32,109,111,100,117,108,101,32,112,97,116,104,44,32,97,110,
+    100,32,116,104,101,32,105,116,101,109,115,32,97,114,101,32,
+    116,104,101,10,35,32,102,105,108,101,110,97,109,101,32,97,
+    110,100,32,98,121,116,101,99,111,100,101,32,111,102,32,116,
+    104,101,32,102,105,108,101,46,10,99,108,97,115,115,32,67,
+    111,100,101,73,109,112,111,114,116,101,114,58,10,32,32,32,
+    32,100,101,102,32,95,95,105,110,105,116,95,95,40,115,101,
+    108,102,41,58,10,32,32,32,32,32,32,32,32,115,101,108,
+    102,46,109,111,100,117,108,101,115,32,61,32,123,125,10,32,
+    32,32,32,32,32,32,32,111,118,101,114,114,105,100,101,95,
+    118,97,114,32,61,32,111,115,46,101,110,118,105,114,111,110,
+    46,103,101,116,40,34,77,53,95,79,86,69,82,82,73,68,
+    69,95,80,89,95,83,79,85,82,67,69,34,44,32,34,102,
+    97,108,115,101,34,41,10,32,32,32,32,32,32,32,32,115,
+    101,108,102,46,111,118,101,114,114,105,100,101,32,61,32,111,
+    118,101,114,114,105,100,101,95,118,97,114,46,108,111,119,101,
+    114,40,41,32,105,110,32,40,34,116,114,117,101,34,44,32,
+    34,121,101,115,34,41,10,32,32,32,32,32,32,32,32,115,
+    101,108,102,46,99,97,99,104,101,32,61,32,66,121,116,101,
+    67,111,100,101,67,97,99,104,101,40,41,32,105,102,32,115,
+    101,108,102,46,111,118,101,114,114,105,100,101,32,101,108,115,
+    101,32,78,111,110,101,10,10,32,32,32,32,100,101,102,32,
+    97,100,100,95,109,111,100,117,108,101,40,115,101,108,102,44,
+    32,97,98,115,112,97,116,104,44,32,109,111,100,112,97,116,
+    104,44,32,99,111,100,101,41,58,10,32,32,32,32,32,32,
+    32,32,105,102,32,109,111,100,112,97,116,104,32,105,110,32,
+    115,101,108,102,46,109,111,100,117,108,101,115,58,10,32,32,
+    32,32,32,32,32,32,32,32,32,32,114,97,105,115,101,32,
+    65,116,116,114,105,98,117,116,101,69,114,114,111,114,40,102,
+    34,123,109,111,100,112,97,116,104,125,32,97,108,114,101,97,
+    100,121,32,102,111,117,110,100,32,105,110,32,105,109,112,111,
+    114,116,101,114,34,41,10,10,32,32,32,32,32,32,32,32,
+    115,101,108,102,46,109,111,100,117,108,101,115,91,109,111,100,
+    112,97,116,104,93,32,61,32,40,97,98,115,112,97,116,104,
+    44,32,99,111,100,101,41,10,10,32,32,32,32,100,101,102,
+    32,102,105,110,100,95,115,112,101,99,40,115,101,108,102,44,
+    32,102,117,108,108,110,97,109,101,44,32,112,97,116,104,44,
+    32,116,97,114,103,101,116,61,78,111,110,101,41,58,10,32,
+    32,32,32,32,32,32,32,105,102,32,102,117,108,108,110,97,
+    109,101,32,110,111,116,32,105,110,32,115,101,108,102,46,109,
+    111,100,117,108,101,115,58,10,32,32,32,32,32,32,32,32,
+    32,32,32,32,114,101,116,117,114,110,32,78,111,110,101,10,
+    10,32,32,32,32,32,32,32,32,97,98,115,112,97,116,104,
+    44,32,99,111,100,101,32,61,32,115,101,108,102,46,109,111,
+    100,117,108,101,115,91,102,117,108,108,110,97,109,101,93,10,
+    10,32,32,32,32,32,32,32,32,105,102,32,115,101,108,102,
+    46,111,118,101,114,114,105,100,101,32,97,110,100,32,111,115,
+    46,112,97,116,104,46,101,120,105,115,116,115,40,97,98,115,
+    112,97,116,104,41,58,10,32,32,32,32,32,32,32,32,32,
+    32,32,32,99,111,100,101,32,61,32,115,101,108,102,46,99,
+    97,99,104,101,46,108,111,97,100,40,97,98,115,112,97,116,
+    104,41,10,10,32,32,32,32,32,32,32,32,105,115,95,112,
+    97,99,107,97,103,101,32,61,32,111,115,46,112,97,116,104,
+    46,98,97,115,101,110,97,109,101,40,97,98,115,112,97,116,
+    104,41,32,61,61,32,34,95,95,105,110,105,116,95,95,46,
+    112,121,34,10,32,32,32,32,32,32,32,32,115,112,101,99,
+    32,61,32,105,109,112,111,114,116,108,105,98,46,117,116,105,
+    108,46,115,112,101,99,95,102,114,111,109,95,108,111,97,100,
+    101,114,40,10,32,32,32,32,32,32,32,32,32,32,32,32,
+    110,97,109,101,61,102,117,108,108,110,97,109,101,44,32,108,
+    111,97,100,101,114,61,66,121,116,101,67,111,100,101,76,111,
+    97,100,101,114,40,99,111,100,101,41,44,32,105,115,95,112,
+    97,99,107,97,103,101,61,105,115,95,112,97,99,107,97,103,
+    101,10,32,32,32,32,32,32,32,32,41,10,10,32,32,32,
+    32,32,32,32,32,115,112,101,99,46,108,111,97,100,101,114,
+    95,115,116,97,116,101,32,61,32,115,101,108,102,46,109,111,
+    100,117,108,101,115,46,107,101,121,115,40,41,10,10,32,32,
+    32,32,32,32,32,32,114,101,116,117,114,110,32,115,112,101,
+    99,10,10,10,35,32,67,114,101,97,116,101,32,97,110,32,
+    105,109,112,111,114,116,101,114,32,97,110,100,32,97,100,100,
+    32,105,116,32,116,111,32,116,104,101,32,109,101,116,97,95,
+    112,97,116,104,32,115,111,32,102,117,116,117,114,101,32,105,
+    109,112,111,114,116,115,32,99,97,110,10,35,32,117,115,101,
+    32,105,116,46,32,32,84,104,101,114,101,39,115,32,99,117,
+    114,114,101,110,116,108,121,32,110,111,116,104,105,110,103,32,
+    105,110,32,116,104,101,32,105,109,112,111,114,116,101,114,44,
+    32,98,117,116,32,99,97,108,108,115,32,116,111,10,35,32,
+    97,100,100,95,109,111,100,117,108,101,32,99,97,110,32,98,
+    101,32,117,115,101,100,32,116,111,32,97,100,100,32,99,111,
+    100,101,46,10,100,101,102,32,105,110,115,116,97,108,108,40,
+    41,58,10,32,32,32,32,105,109,112,111,114,116,101,114,32,
+    61,32,67,111,100,101,73,109,112,111,114,116,101,114,40,41,
+    10,32,32,32,32,103,108,111,98,97,108,32,97,100,100,95,
+    109,111,100,117,108,101,10,32,32,32,32,97,100,100,95,109,
+    111,100,117,108,101,32,61,32,105,109,112,111,114,116,101,114,
+    46,97,100,100,95,109,111,100,117,108,101,10,32,32,32,32,
+    105,109,112,111,114,116,32,115,121,115,10,10,32,32,32,32,
+    115,121,115,46,109,101,116,97,95,112,97,116,104,46,105,110,
+    115,101,114,116,40,48,44,32,105,109,112,111,114,116,101,114,
+    41,10,10,32,32,32,32,105,102,32,105,109,112,111,114,116,
+    101,114,46,111,118,101,114,114,105,100,101,58,10,32,32,32,
+    32,32,32,32,32,105,109,112,111,114,116,32,97,116,101,120,
+    105,116,10,10,32,32,32,32,32,32,32,32,97,116,101,120,
+    105,116,46,114,101,103,105,115,116,101,114,40,105,109,112,111,
+    114,116,101,114,46,99,97,99,104,101,46,114,101,112,111,114,
+    116,41,10,10,32,32,32,32,35,32,73,110,106,101,99,116,
+    101,100,32,105,110,116,111,32,116,104,105,115,32,109,111,100,
+    117,108,101,39,115,32,110,97,109,101,115,112,97,99,101,32,
+    98,121,32,116,104,101,32,99,43,43,32,99,111,100,101,32,
+    116,104,97,116,32,108,111,97,100,115,32,105,116,46,10,32,
+    32,32,32,95,105,110,105,116,95,97,108,108,95,101,109,98,
+    101,100,100,101,100,40,41,10,
+};
+} // namespace Blobs
+} // namespace gem5
@@ -0,0 +1,19 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   /root/package/site_scons/gem5_scons/builders/blob.py:80
+ */
+
+#include <cstddef>
+#include <cstdint>
+
+namespace gem5
+{
+namespace Blobs
+{
+
+extern const std::size_t m5ImporterCode_len;
+extern const std::uint8_t m5ImporterCode[];
+
+} // namespace Blobs
+} // namespace gem5
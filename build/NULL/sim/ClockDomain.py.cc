@@ -0,0 +1,82 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,173,84,191,111,219,70,20,62,138,63,68,137,178,44,
+    202,177,172,194,77,43,56,133,97,25,137,130,38,72,106,27,
+    69,129,58,78,27,181,128,82,192,73,6,117,32,24,222,197,
+    102,74,82,202,81,22,108,77,28,250,7,4,94,236,81,147,
+    129,34,255,69,135,206,146,33,192,194,77,5,58,101,163,17,
+    79,94,210,59,82,84,245,171,157,202,35,191,119,119,239,241,
+    238,227,123,31,239,47,48,114,137,3,251,161,73,225,4,64,
+    0,57,11,60,11,45,23,216,152,21,179,249,42,207,129,24,
+    248,30,64,254,87,0,5,196,159,241,0,188,227,163,69,170,
+    66,224,19,169,79,66,194,132,79,12,124,113,234,147,167,124,
+    18,76,236,130,98,242,61,27,20,57,194,173,83,72,236,154,
+    246,211,151,175,145,209,48,70,137,114,17,209,207,2,162,8,
+    84,57,8,170,49,250,240,144,171,10,48,86,21,33,79,23,
+    20,232,130,34,81,30,89,53,227,151,157,154,173,155,206,245,
+    130,107,218,119,13,54,161,193,96,166,180,191,223,82,247,144,
+    253,96,107,107,36,238,89,165,24,39,178,166,57,186,141,52,
+    141,36,53,205,174,193,3,139,245,83,154,246,230,64,183,6,
+    30,161,113,84,71,36,105,28,30,106,251,72,135,8,147,4,
+    235,27,150,238,186,68,214,95,186,13,172,27,141,223,192,7,
+    198,247,58,231,98,227,46,99,48,178,85,169,126,132,37,234,
+    12,96,157,62,238,10,5,111,216,250,74,222,219,233,171,171,
+    222,15,253,204,45,175,220,159,95,240,158,176,134,51,209,75,
+    99,185,17,162,220,252,241,175,185,65,82,59,14,102,92,144,
+    63,163,153,125,23,101,23,84,101,148,104,39,103,70,10,19,
+    145,10,141,76,205,140,20,161,116,22,163,177,177,97,236,28,
+    141,77,207,140,141,67,121,34,118,62,20,5,73,239,98,99,
+    36,103,152,241,111,221,8,203,54,238,106,165,130,65,161,142,
+    176,89,131,173,244,139,154,213,208,247,80,33,172,246,251,143,
+    244,106,37,194,65,193,132,152,109,213,250,164,236,152,13,83,
+    183,216,75,175,106,216,214,29,3,21,44,212,68,86,165,152,
+    193,50,203,115,130,1,203,5,86,24,176,111,197,115,20,136,
+    242,130,170,179,134,127,210,177,110,19,49,216,155,136,70,104,
+    194,201,185,1,133,144,31,73,55,195,225,64,127,68,44,59,
+    141,251,247,200,128,147,102,66,34,61,15,167,230,77,74,75,
+    99,156,180,128,12,158,103,187,6,101,87,25,44,68,112,159,
+    62,174,11,198,85,179,60,84,205,170,87,246,147,96,46,127,
+    145,186,121,158,186,121,234,116,83,119,122,169,59,222,99,95,
+    2,185,229,139,197,181,243,197,181,78,113,179,187,184,213,91,
+    220,242,42,126,26,168,185,19,229,88,57,221,110,43,221,204,
+    237,94,230,54,125,95,6,75,159,158,88,199,86,251,203,206,
+    234,183,221,220,118,47,183,237,61,101,45,228,195,88,204,150,
+    97,29,252,15,50,148,218,137,153,145,2,20,39,4,147,132,
+    18,21,76,156,100,119,104,253,155,8,78,137,38,31,138,102,
+    218,221,90,160,229,66,78,163,16,20,47,210,11,99,209,82,
+    191,195,232,205,1,114,140,163,2,52,155,38,253,203,43,69,
+    229,191,117,129,243,96,240,119,210,195,193,138,14,27,34,63,
+    119,92,115,207,65,144,40,193,108,184,218,100,97,11,17,84,
+    88,97,31,79,20,246,243,97,97,215,189,242,159,106,238,66,
+    93,57,87,87,58,183,54,186,234,102,79,221,164,142,236,210,
+    73,233,184,212,86,59,95,124,213,205,110,244,178,27,222,143,
+    172,133,59,4,235,210,12,37,236,7,165,58,19,40,61,167,
+    88,23,215,14,143,72,138,246,134,103,46,22,162,111,8,165,
+    22,208,26,167,122,45,127,29,30,140,223,224,53,16,30,204,
+    238,239,20,124,158,227,56,255,9,7,184,124,7,44,133,119,
+    31,228,58,209,221,7,43,157,241,219,151,5,238,134,15,166,
+    225,109,241,146,153,171,127,102,179,57,238,17,231,131,217,248,
+    246,231,203,192,94,141,122,30,74,220,166,15,166,225,116,249,
+    146,153,171,25,174,224,27,255,6,250,213,179,139,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/ClockDomain.py",
+    "m5.objects.ClockDomain",
+    embedded_module_data,
+    925,
+    1823);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,64 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,82,77,79,19,65,24,158,217,237,110,183,31,124,
+    116,27,4,77,36,164,198,132,18,45,23,241,208,52,98,34,
+    68,62,34,146,64,60,236,129,205,178,51,129,194,110,183,206,
+    150,8,61,109,140,63,192,155,215,154,24,130,225,194,15,240,
+    71,20,210,132,205,156,76,60,121,171,193,147,39,103,102,217,
+    74,73,157,121,231,253,158,153,231,125,103,126,128,27,67,185,
+    150,87,43,140,125,2,8,32,232,0,23,26,16,114,93,114,
+    164,205,72,202,66,202,78,194,85,12,5,2,9,188,4,40,
+    241,1,32,5,43,199,50,0,167,114,124,160,161,34,117,3,
+    20,147,63,185,81,132,52,189,238,189,195,100,163,97,53,48,
+    179,224,12,99,169,141,170,251,122,123,15,219,13,251,38,148,
+    68,12,229,155,128,130,129,1,17,48,36,182,100,4,141,4,
+    146,12,5,201,134,138,147,45,13,12,24,56,181,151,142,117,
+    148,56,150,24,40,169,7,42,141,51,173,236,160,93,59,172,
+    132,91,185,67,236,134,225,65,185,18,192,195,199,76,158,246,
+    60,72,189,181,119,4,37,89,241,26,29,122,225,120,246,62,
+    70,81,153,155,205,49,191,234,206,218,145,207,244,132,179,180,
+    187,219,204,239,96,119,174,92,238,75,110,102,133,57,133,60,
+    215,170,214,154,89,209,191,41,215,67,216,241,155,153,200,242,
+    121,59,215,138,163,84,51,205,154,229,98,211,164,105,211,100,
+    57,7,14,215,179,166,249,246,192,114,174,35,137,198,81,29,
+    83,205,218,246,27,196,178,27,52,109,31,30,154,187,216,66,
+    152,208,20,215,109,199,242,125,170,172,91,196,114,105,70,220,
+    190,32,46,167,42,243,225,26,223,226,236,155,17,32,154,121,
+    195,64,122,36,202,142,94,247,21,7,71,51,117,174,155,2,
+    41,225,255,33,246,8,180,95,193,21,239,208,159,9,159,216,
+    179,188,27,125,69,151,234,71,36,201,194,130,205,176,229,215,
+    24,11,122,51,204,220,11,22,194,145,124,176,20,230,166,131,
+    149,112,244,97,176,220,213,128,62,126,153,43,92,228,10,173,
+    167,157,7,79,206,106,231,185,197,78,110,49,88,233,170,32,
+    63,121,169,79,95,232,211,39,250,201,214,185,94,233,232,149,
+    96,245,59,75,215,11,23,122,161,85,110,149,63,87,190,84,
+    206,238,159,235,243,29,125,62,88,229,147,76,196,0,214,138,
+    73,58,230,206,149,162,135,242,75,255,190,112,84,87,138,197,
+    234,188,126,159,106,92,37,222,225,17,205,50,173,247,177,137,
+    18,159,69,198,57,19,71,223,229,245,107,149,232,153,158,145,
+    73,102,66,94,234,123,198,186,50,132,176,187,4,1,124,220,
+    6,143,110,82,8,198,219,49,133,224,78,59,166,16,20,218,
+    253,212,85,135,224,115,216,5,131,249,199,229,95,66,254,254,
+    79,92,96,252,11,176,41,17,199,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/ClockedObject.py",
+    "m5.objects.ClockedObject",
+    embedded_module_data,
+    633,
+    1052);
+
+} // anonymous namespace
+} // namespace gem5
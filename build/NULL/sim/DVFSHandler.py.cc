@@ -0,0 +1,68 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,83,205,79,19,65,20,159,253,236,182,133,45,133,
+    80,161,132,176,209,132,80,19,40,30,56,136,4,18,169,128,
+    134,160,73,13,135,94,54,203,206,148,46,236,71,157,89,176,
+    237,169,7,47,122,209,155,198,139,158,136,198,127,102,33,77,
+    104,230,234,201,91,9,158,60,57,219,109,73,197,206,190,121,
+    31,243,222,239,189,121,243,178,63,193,192,146,122,242,122,157,
+    177,143,0,2,200,217,224,101,36,185,174,228,109,222,17,74,
+    2,7,120,176,13,160,240,6,64,17,9,103,2,0,63,132,
+    126,146,146,8,165,34,200,201,191,66,35,199,81,238,62,99,
+    241,162,229,60,63,56,66,166,111,14,22,20,251,5,91,221,
+    130,8,148,56,8,74,60,219,2,228,88,34,190,36,33,249,
+    107,12,12,89,135,172,252,25,207,10,243,55,133,21,20,31,
+    30,139,18,71,201,190,14,197,91,168,17,134,26,29,134,130,
+    18,148,111,197,170,44,54,53,52,54,6,149,91,177,99,48,
+    206,158,33,65,147,133,253,173,226,142,225,66,27,225,198,4,
+    177,156,60,60,45,19,189,18,157,44,85,42,141,244,33,114,
+    86,86,87,7,227,82,182,69,124,205,43,107,208,115,12,203,
+    37,141,252,166,125,220,51,52,70,175,43,150,89,209,252,10,
+    210,122,121,52,139,176,115,226,27,174,111,25,62,130,91,141,
+    236,19,215,56,176,81,190,96,145,80,14,6,83,233,193,242,
+    242,9,105,204,151,173,26,130,154,205,0,174,89,215,202,30,
+    214,170,8,151,53,27,157,34,91,115,172,67,108,248,150,231,
+    238,229,210,84,209,117,215,112,144,174,211,132,174,59,30,60,
+    177,67,125,68,215,95,157,24,118,207,35,250,245,42,162,9,
+    179,86,211,43,200,128,172,78,60,212,77,219,32,132,38,247,
+    217,240,61,252,194,192,134,67,213,34,54,55,109,207,60,46,
+    116,59,162,177,94,155,84,138,252,50,19,200,245,89,46,251,
+    88,143,124,84,37,117,162,15,216,226,99,207,179,169,140,186,
+    93,210,216,110,212,4,29,247,177,225,18,43,188,183,222,107,
+    236,59,184,14,39,242,39,67,176,153,15,7,48,240,210,75,
+    213,58,150,153,179,203,22,217,38,111,25,107,222,124,237,228,
+    84,179,208,78,207,55,159,181,199,238,53,159,118,20,144,202,
+    94,170,11,23,234,194,183,241,96,113,253,92,221,104,169,27,
+    205,237,142,12,50,51,151,147,185,139,201,92,91,81,91,202,
+    116,48,179,123,37,240,25,249,55,96,172,185,199,112,234,196,
+    251,210,187,210,39,41,152,123,116,62,186,214,26,93,107,110,
+    117,198,64,118,238,203,236,231,217,182,146,10,210,15,25,32,
+    27,2,178,114,32,102,34,194,217,254,221,246,114,18,141,59,
+    43,75,213,240,129,8,85,66,21,123,181,58,29,97,218,205,
+    223,133,197,126,60,158,14,89,23,62,19,54,175,172,69,83,
+    91,199,115,204,228,194,78,203,140,117,4,142,227,58,59,28,
+    224,166,2,112,39,162,54,200,4,125,106,131,187,193,191,212,
+    81,167,56,185,3,254,103,31,114,87,161,248,61,196,213,189,
+    199,95,149,8,40,22,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/DVFSHandler.py",
+    "m5.objects.DVFSHandler",
+    embedded_module_data,
+    694,
+    1131);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,59 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,82,191,143,211,48,24,181,243,171,105,175,112,61,
+    10,106,169,168,132,16,75,64,186,194,112,12,21,98,58,1,
+    69,168,32,174,83,150,40,141,45,90,148,244,138,147,74,215,
+    78,25,238,15,184,141,149,169,18,186,127,166,32,36,34,79,
+    72,76,108,173,174,83,39,252,37,77,175,189,158,176,227,247,
+    217,126,246,231,151,103,255,65,107,69,93,198,139,15,2,190,
+    32,130,8,118,81,11,162,228,98,79,50,37,140,36,244,10,
+    17,249,20,17,133,74,99,25,161,115,57,221,108,202,49,167,
+    10,78,219,226,20,146,57,66,134,254,23,6,6,230,248,145,
+    128,236,81,215,123,215,254,68,157,192,89,23,129,83,17,149,
+    88,4,69,38,38,200,148,68,147,9,22,137,36,83,37,178,
+    72,166,240,66,163,231,7,135,93,223,246,125,234,181,93,202,
+    22,123,126,215,171,117,197,108,192,108,135,178,253,78,103,84,
+    253,72,189,131,122,61,158,168,215,175,238,104,26,26,215,45,
+    171,103,123,212,178,120,206,178,188,99,50,112,161,159,183,172,
+    207,3,219,93,50,74,48,236,83,158,115,78,78,172,14,181,
+    9,101,60,11,125,199,21,153,190,161,11,208,187,184,227,51,
+    167,6,2,224,144,86,34,160,63,100,154,224,98,120,44,154,
+    95,21,16,174,106,180,83,13,15,163,189,135,225,155,168,80,
+    11,27,80,217,110,186,126,195,21,37,117,197,252,143,43,166,
+    70,51,95,117,116,77,145,16,213,199,34,158,175,102,136,50,
+    150,196,88,90,93,81,150,168,194,85,141,231,46,229,179,140,
+    32,70,165,45,7,19,182,53,42,195,128,13,156,160,123,220,
+    187,191,105,107,142,129,14,150,5,200,1,236,0,228,1,110,
+    8,224,186,221,246,33,99,192,213,247,54,179,189,248,143,121,
+    158,172,37,97,55,97,117,108,71,1,224,86,10,79,193,200,
+    151,87,140,44,173,140,52,194,70,180,91,12,95,255,46,150,
+    127,21,141,31,69,35,210,203,19,189,252,93,175,252,212,43,
+    147,123,207,102,178,116,91,155,35,1,225,91,168,201,17,144,
+    184,105,168,60,235,29,236,247,65,145,207,243,162,187,122,163,
+    76,73,239,37,17,178,41,110,161,63,79,94,206,11,86,94,
+    190,97,255,84,192,84,198,24,79,155,24,225,242,4,149,146,
+    47,66,15,38,155,223,84,147,241,147,41,218,134,179,225,12,
+    194,252,114,54,175,99,109,138,182,225,236,238,12,194,252,26,
+    42,86,249,15,105,63,236,156,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/InstTracer.py",
+    "m5.objects.InstTracer",
+    embedded_module_data,
+    552,
+    1000);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,48 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,80,61,75,3,65,16,157,189,205,133,124,104,52,
+    4,63,16,172,20,225,130,36,85,154,32,169,2,98,138,32,
+    196,234,154,229,188,93,76,228,46,23,111,47,152,164,186,194,
+    31,96,231,63,16,196,63,147,50,108,37,88,217,69,98,101,
+    229,238,37,167,39,186,179,251,102,102,103,121,111,118,94,33,
+    177,244,149,95,52,36,60,0,5,138,28,48,149,215,28,228,
+    106,166,134,84,140,29,124,1,26,156,2,77,221,1,213,153,
+    246,136,1,158,113,76,98,166,40,234,128,145,126,83,73,219,
+    64,34,119,238,221,50,191,19,88,1,147,25,42,219,73,73,
+    20,75,238,69,146,12,76,68,193,212,228,193,20,73,42,205,
+    212,41,150,116,41,145,143,104,154,158,107,245,250,147,18,239,
+    185,213,129,186,32,52,186,169,116,187,147,226,21,115,107,245,
+    122,226,93,219,72,139,12,33,125,203,101,132,136,28,33,174,
+    71,135,142,138,215,8,185,25,90,206,170,146,10,198,3,38,
+    114,246,104,68,186,204,162,204,23,89,21,219,142,197,249,19,
+    44,84,131,159,219,220,183,171,74,54,193,95,25,140,253,180,
+    44,70,80,149,135,239,75,8,191,109,150,223,13,155,179,226,
+    81,216,154,109,30,132,103,202,252,66,252,222,208,5,230,99,
+    46,182,220,90,197,187,188,102,118,192,43,63,163,242,213,64,
+    69,86,214,6,150,111,185,124,169,179,174,32,98,216,80,61,
+    101,78,150,31,106,248,165,213,44,185,154,238,28,35,132,230,
+    45,4,40,31,230,148,189,192,241,244,247,158,193,206,52,222,
+    243,2,70,135,115,248,11,247,229,119,229,62,254,41,69,77,
+    124,1,85,66,146,114,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/PowerDomain.py",
+    "m5.objects.PowerDomain",
+    embedded_module_data,
+    374,
+    573);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,81 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,84,189,111,219,70,20,191,35,245,65,201,250,176,
+    45,217,138,3,180,32,212,20,169,60,36,78,208,116,112,155,
+    162,65,245,17,39,178,108,196,78,6,46,4,165,187,88,108,
+    37,74,229,73,177,172,73,67,135,142,69,22,119,52,58,4,
+    40,252,207,208,129,129,8,183,118,234,38,35,158,50,245,221,
+    49,178,37,85,41,121,124,247,241,126,124,252,189,223,187,227,
+    223,104,226,10,126,236,223,27,96,142,17,65,4,55,208,190,
+    223,99,217,43,13,165,169,26,42,70,10,42,33,162,254,138,
+    72,128,6,222,168,8,157,170,227,32,70,80,250,130,224,11,
+    81,117,198,23,34,225,61,148,211,254,17,147,28,230,120,29,
+    76,100,207,110,238,84,127,162,181,78,109,146,140,50,38,179,
+    42,201,80,100,96,130,12,229,0,200,252,137,13,149,40,16,
+    72,229,218,238,161,187,215,177,58,52,23,228,145,231,149,124,
+    161,184,85,41,228,185,178,83,225,145,31,203,79,205,210,163,
+    125,152,38,246,158,61,218,54,159,21,246,11,149,253,45,112,
+    169,59,197,98,37,23,224,154,105,58,86,147,154,38,143,154,
+    102,179,69,186,13,49,142,153,230,47,93,171,241,209,19,120,
+    101,53,216,95,232,189,224,242,97,133,185,181,187,204,110,222,
+    221,109,29,82,255,195,119,218,71,110,8,124,210,124,3,15,
+    91,3,51,184,186,135,11,121,79,182,129,188,221,165,49,118,
+    42,219,192,56,219,44,158,204,22,30,149,96,35,64,20,35,
+    72,67,39,97,52,231,34,42,9,188,1,181,78,199,138,33,
+    67,163,145,249,88,80,47,56,131,141,66,220,133,185,113,161,
+    88,51,216,216,39,177,26,137,204,96,227,128,77,204,197,70,
+    201,194,12,54,9,124,23,63,193,55,54,131,93,34,113,168,
+    124,130,71,175,75,208,95,22,37,105,139,185,201,100,77,234,
+    245,254,226,1,109,62,216,220,188,70,185,66,145,126,42,79,
+    95,90,221,70,71,151,14,221,127,63,235,79,228,187,76,239,
+    212,109,166,183,228,142,212,107,150,163,87,169,110,59,92,189,
+    231,176,254,103,219,182,163,195,134,232,82,189,245,18,128,84,
+    39,54,235,184,118,181,219,177,91,14,87,238,9,136,213,251,
+    63,200,253,141,190,254,133,94,181,29,6,81,245,90,227,103,
+    253,0,190,74,166,80,253,251,254,129,96,250,97,221,174,213,
+    117,226,218,175,168,140,213,190,38,234,135,191,162,90,201,45,
+    187,49,200,208,141,11,35,148,231,129,206,81,155,242,104,173,
+    215,51,235,212,34,212,229,17,49,174,53,44,198,120,112,215,
+    114,173,166,220,137,60,78,124,81,124,245,248,194,11,136,215,
+    114,37,128,39,219,45,198,236,42,156,12,95,30,30,46,67,
+    231,212,142,120,12,200,155,130,188,217,4,125,38,102,86,143,
+    107,207,29,102,31,56,148,240,248,213,186,200,217,77,139,239,
+    133,27,146,14,115,69,209,253,19,177,44,76,122,108,54,225,
+    97,167,104,250,28,101,6,249,225,210,151,131,39,195,197,236,
+    96,107,164,161,149,155,199,149,215,149,147,111,189,141,194,89,
+    186,120,158,46,14,182,97,53,147,125,183,186,254,118,117,125,
+    168,69,189,216,198,133,170,100,66,151,8,204,96,7,156,233,
+    181,227,135,175,31,158,172,120,95,149,206,82,143,207,83,143,
+    7,229,97,234,134,92,75,123,183,139,103,169,210,121,170,4,
+    107,128,19,161,191,246,114,79,207,210,229,243,116,89,134,78,
+    222,124,151,184,245,54,113,75,134,254,1,66,39,69,232,100,
+    104,80,18,183,159,135,96,95,201,133,121,164,249,224,78,91,
+    8,200,184,38,134,110,171,7,138,193,232,234,111,231,6,100,
+    141,10,78,215,175,130,159,253,180,34,31,180,239,252,223,210,
+    247,110,14,166,88,200,242,7,152,145,138,49,30,61,193,8,
+    223,240,80,198,111,67,180,234,141,219,16,101,189,233,54,250,
+    28,227,2,30,161,249,246,183,206,133,236,47,39,61,90,6,
+    135,70,232,191,230,247,181,11,209,93,206,113,73,230,255,2,
+    78,112,151,39,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/PowerState.py",
+    "m5.objects.PowerState",
+    embedded_module_data,
+    900,
+    1620);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,145 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,87,75,79,220,88,22,182,235,141,139,170,162,40,
+    30,129,64,48,143,16,42,205,163,71,10,73,186,59,105,133,
+    144,4,42,77,128,25,232,145,154,238,81,201,248,94,192,137,
+    31,53,215,174,10,88,89,212,130,69,139,13,76,107,164,176,
+    232,69,22,163,104,70,253,103,202,145,165,148,188,66,154,85,
+    239,136,146,85,107,22,115,174,93,230,225,80,24,215,241,245,
+    57,223,189,247,248,156,243,29,155,255,50,103,142,104,227,250,
+    113,29,196,107,6,49,136,149,25,133,93,99,89,58,14,201,
+    161,85,239,26,110,92,35,171,76,136,153,99,80,120,151,65,
+    17,28,125,27,102,152,223,194,254,98,107,49,215,22,5,91,
+    236,51,91,28,197,87,152,124,226,119,122,147,103,157,216,38,
+    54,196,151,8,70,236,77,241,172,71,17,223,163,255,133,169,
+    71,152,89,99,17,179,22,130,95,24,177,107,17,20,90,139,
+    226,24,186,142,34,187,236,91,128,253,198,156,238,128,19,111,
+    90,152,11,14,20,69,177,183,33,192,134,78,176,92,83,108,
+    28,37,2,216,100,83,108,11,226,2,216,86,192,166,46,194,
+    226,244,243,204,201,188,100,96,86,27,204,202,94,184,67,43,
+    74,5,176,237,151,96,211,1,108,14,176,29,23,98,51,168,
+    45,128,237,4,108,215,133,216,44,106,15,96,187,47,193,230,
+    2,216,43,151,96,59,2,216,158,75,176,157,1,108,239,37,
+    216,174,0,246,106,83,108,55,186,18,192,246,93,178,110,79,
+    0,219,223,180,50,122,209,213,0,246,26,30,104,130,237,123,
+    203,2,146,61,65,242,205,144,155,12,234,15,172,58,216,204,
+    131,16,131,135,206,243,3,93,11,204,29,134,185,35,23,122,
+    212,141,6,2,216,235,224,211,104,19,159,248,0,246,70,211,
+    168,12,162,161,0,118,12,231,209,240,46,19,96,242,77,52,
+    2,189,98,212,137,47,19,77,196,186,110,166,117,73,153,42,
+    121,55,147,91,91,102,106,19,43,211,95,127,221,48,63,17,
+    163,103,118,161,129,164,109,231,99,140,241,90,26,44,197,46,
+    254,135,201,71,157,136,142,229,13,39,90,17,16,34,78,180,
+    228,94,34,186,100,98,167,69,20,196,45,44,172,203,88,167,
+    107,241,244,248,163,93,39,226,20,221,185,177,207,100,105,199,
+    9,43,66,201,76,250,10,184,185,1,112,61,14,162,202,28,
+    37,90,127,142,124,164,62,56,97,81,82,205,246,13,73,198,
+    170,160,96,126,67,35,188,110,32,73,117,34,162,86,54,204,
+    92,208,2,74,48,97,66,62,55,81,101,175,190,163,27,88,
+    225,27,33,224,95,74,178,204,147,178,202,107,170,19,221,16,
+    100,29,155,138,34,72,170,1,63,94,80,121,73,157,80,176,
+    162,145,29,190,130,137,46,105,0,220,224,141,45,204,151,132,
+    77,204,95,114,24,52,4,188,183,136,64,196,45,201,192,162,
+    81,38,120,66,47,97,81,218,144,68,234,149,34,24,230,13,
+    73,149,12,73,144,33,120,222,194,13,207,168,211,223,85,148,
+    217,229,239,233,42,43,143,157,232,237,91,207,164,135,102,143,
+    34,108,75,74,89,225,105,184,125,111,116,67,16,95,252,142,
+    32,96,102,188,172,99,194,75,200,204,226,141,13,216,83,170,
+    96,222,87,37,54,137,86,46,209,81,251,169,241,68,199,249,
+    91,75,136,208,194,50,179,37,129,96,213,224,79,245,102,155,
+    63,246,103,57,140,57,130,183,177,88,246,30,120,76,131,56,
+    17,9,97,157,23,21,244,227,151,127,227,165,13,94,199,70,
+    222,28,19,53,136,172,138,120,89,82,1,119,102,78,73,46,
+    235,16,163,205,178,2,155,233,121,179,3,171,21,137,104,42,
+    189,165,115,13,73,221,212,205,30,177,76,92,111,94,106,228,
+    5,104,120,36,17,120,2,72,141,57,1,165,85,150,5,131,
+    166,167,164,65,242,120,1,96,91,146,184,197,27,26,141,13,
+    129,117,78,32,102,239,76,69,144,100,119,107,236,42,49,226,
+    17,145,104,130,205,232,244,228,159,38,191,52,123,23,36,181,
+    188,205,191,192,68,197,50,95,118,171,136,96,25,11,58,22,
+    67,103,40,18,246,41,210,231,82,36,196,188,98,17,123,190,
+    11,177,30,113,66,139,230,183,235,154,38,243,80,233,99,51,
+    192,23,222,37,207,56,239,142,75,222,152,186,174,155,227,188,
+    11,60,33,210,125,131,148,113,254,27,146,128,213,242,33,96,
+    132,172,211,234,135,24,135,92,134,145,52,37,74,26,111,151,
+    52,98,20,21,108,108,105,72,55,187,124,106,157,215,207,81,
+    150,245,156,178,172,150,122,102,37,22,237,196,98,205,63,73,
+    27,88,23,243,236,147,252,23,78,162,88,164,207,94,44,58,
+    92,177,168,104,168,44,211,113,107,177,248,247,178,32,55,44,
+    17,99,167,132,29,78,220,222,46,130,191,192,50,232,1,48,
+    22,101,65,215,221,225,51,119,103,66,223,218,78,116,89,32,
+    130,226,196,86,12,2,57,116,162,146,90,2,194,198,128,181,
+    238,21,106,135,18,56,182,226,178,212,137,45,187,5,232,132,
+    5,117,199,137,121,212,117,34,15,33,58,78,11,212,244,12,
+    240,106,121,213,137,191,168,40,5,21,24,194,61,115,169,186,
+    66,251,80,43,208,100,133,178,194,189,11,23,232,42,101,40,
+    215,8,166,50,188,233,14,169,12,151,232,176,228,73,170,224,
+    78,75,211,73,254,213,45,49,207,233,48,84,180,19,134,226,
+    36,97,175,51,189,68,78,236,123,88,249,246,45,39,1,245,
+    229,150,158,147,126,220,168,169,71,110,73,57,241,70,105,57,
+    241,70,1,57,73,55,52,94,62,200,85,88,202,205,172,27,
+    118,55,149,36,230,139,33,154,172,222,16,77,150,255,87,79,
+    118,84,31,213,179,131,213,167,245,182,129,106,225,40,154,62,
+    14,177,209,212,49,227,139,15,97,38,150,217,253,193,211,198,
+    152,84,251,254,194,222,194,97,103,141,191,101,181,78,219,173,
+    211,213,199,117,208,253,180,247,211,225,104,109,232,142,149,186,
+    107,167,238,86,159,92,170,251,245,102,109,244,161,149,154,181,
+    83,179,160,109,235,124,205,253,194,213,19,25,216,162,229,9,
+    251,33,26,201,198,62,49,32,170,133,99,142,201,116,236,63,
+    223,123,126,216,93,27,250,206,74,47,216,233,133,234,92,61,
+    119,229,125,110,248,93,110,248,205,92,109,98,222,202,21,236,
+    92,161,186,112,196,101,246,243,123,249,131,217,195,30,139,27,
+    182,185,225,234,108,61,217,182,255,213,222,87,7,43,181,222,
+    9,43,57,105,39,39,225,81,79,96,189,22,55,98,115,35,
+    231,96,147,86,114,202,78,78,157,133,245,89,220,168,205,141,
+    158,194,254,92,187,242,133,149,28,183,147,227,0,59,157,58,
+    110,37,39,236,228,68,245,209,81,182,235,117,223,47,125,135,
+    235,181,161,121,43,91,176,179,5,136,45,215,249,158,235,123,
+    199,245,213,250,231,44,110,222,230,230,97,61,95,119,248,151,
+    218,224,29,139,187,107,115,119,169,54,179,63,190,55,126,80,
+    57,168,252,99,251,159,219,181,193,123,22,119,223,230,238,131,
+    5,66,241,106,239,213,225,76,109,96,209,202,44,217,153,165,
+    234,124,61,221,243,62,61,246,46,61,246,239,246,218,68,193,
+    74,63,181,211,79,33,64,233,220,190,188,39,31,222,169,141,
+    60,176,210,51,118,122,166,58,119,20,109,163,41,92,98,105,
+    82,151,88,154,213,236,238,143,103,85,158,244,202,134,22,203,
+    185,143,127,255,223,133,143,243,76,179,143,127,20,94,139,225,
+    248,155,196,133,31,24,145,192,167,84,11,138,66,19,139,145,
+    7,244,189,208,78,95,229,180,117,22,189,218,166,31,18,29,
+    222,135,196,249,226,95,53,251,17,174,72,34,188,130,225,93,
+    204,187,109,116,172,172,66,143,224,167,192,144,95,204,115,132,
+    118,78,210,79,197,53,42,6,168,224,169,24,164,36,75,8,
+    235,186,65,4,209,32,195,84,55,226,234,252,23,123,144,55,
+    15,124,177,64,121,115,139,57,207,155,171,148,55,215,41,111,
+    70,171,133,122,38,7,217,240,50,84,235,251,198,202,220,179,
+    51,247,170,243,244,207,91,240,129,219,4,19,78,72,211,61,
+    186,183,40,211,147,37,218,7,116,39,65,135,68,219,222,129,
+    46,51,61,185,34,41,75,235,207,161,79,56,45,39,67,143,
+    194,15,62,231,246,31,137,123,94,27,253,150,44,52,62,177,
+    244,127,129,56,14,179,44,123,124,155,97,187,106,76,231,217,
+    243,136,233,174,249,103,157,1,107,227,172,51,189,53,255,60,
+    142,221,96,105,61,92,44,127,150,62,184,215,79,103,45,171,
+    108,148,189,127,204,124,46,14,126,248,64,47,159,46,48,185,
+    79,241,127,127,5,188,163,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/Process.py",
+    "m5.objects.Process",
+    embedded_module_data,
+    1927,
+    3829);
+
+} // anonymous namespace
+} // namespace gem5
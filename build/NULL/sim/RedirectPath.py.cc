@@ -0,0 +1,68 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,83,191,111,211,64,20,190,179,147,212,73,45,149,
+    160,210,162,170,195,65,145,162,240,35,157,138,68,133,186,0,
+    130,22,90,42,2,12,94,172,195,119,169,141,108,159,185,115,
+    170,36,234,144,129,137,5,54,24,59,85,66,252,51,41,170,
+    68,228,9,137,137,45,168,76,157,184,187,52,81,64,237,192,
+    249,252,221,59,191,119,223,251,222,179,253,3,76,140,252,233,
+    122,188,38,225,35,32,128,192,16,60,31,174,80,175,70,104,
+    68,166,99,66,96,128,135,128,152,111,1,201,81,243,192,4,
+    224,139,57,34,113,114,36,95,7,213,194,79,181,169,194,12,
+    94,151,80,172,7,209,211,87,175,169,151,122,147,9,115,163,
+    132,45,157,144,2,7,18,224,24,4,58,38,81,68,134,147,
+    39,166,83,160,83,251,22,56,99,16,153,234,192,144,201,141,
+    113,242,34,45,157,23,187,3,73,225,159,232,105,50,37,165,
+    90,153,253,140,146,128,75,117,219,56,245,113,13,2,80,79,
+    25,167,2,37,114,47,80,131,113,212,8,66,42,218,34,165,
+    17,226,167,193,1,139,17,105,242,32,222,65,210,227,225,48,
+    20,53,180,222,64,88,31,43,33,57,34,156,122,190,228,169,
+    224,36,81,220,149,155,40,245,105,172,96,116,6,5,98,204,
+    72,9,74,153,118,54,2,46,82,84,241,153,208,154,42,154,
+    77,106,75,145,199,226,20,7,177,208,97,49,139,111,177,93,
+    202,67,201,175,116,36,140,107,89,172,161,221,74,7,194,66,
+    42,218,197,97,64,116,17,74,162,102,83,17,156,34,204,21,
+    13,242,131,84,252,159,56,73,217,164,53,77,213,153,21,65,
+    180,60,10,116,85,218,154,239,119,46,238,208,104,101,117,117,
+    178,185,39,112,185,83,157,232,165,86,216,224,44,66,56,70,
+    178,136,138,236,57,229,34,81,237,221,165,157,69,21,58,12,
+    146,85,169,110,76,188,136,173,170,157,89,174,27,227,136,186,
+    110,86,114,221,136,145,102,168,108,219,117,223,52,113,120,234,
+    153,114,93,194,60,105,228,210,118,66,179,146,215,106,185,62,
+    197,132,242,172,168,108,47,196,66,100,249,109,204,113,148,21,
+    234,169,122,163,153,37,197,232,66,178,233,151,82,12,227,67,
+    119,73,105,208,207,197,103,112,172,62,162,147,121,193,189,101,
+    85,255,100,157,181,164,205,11,210,171,1,201,91,188,144,208,
+    29,95,3,35,151,183,6,64,129,13,236,133,238,253,126,185,
+    210,221,232,95,184,214,93,255,62,51,251,126,239,221,222,167,
+    123,189,43,79,14,103,54,143,102,54,187,143,250,229,197,111,
+    229,165,175,229,165,253,250,254,131,222,141,245,195,242,198,81,
+    121,163,171,47,126,105,148,103,171,154,207,138,209,74,45,81,
+    82,69,102,41,147,179,86,59,179,165,53,254,3,121,110,20,
+    207,103,21,232,227,115,170,18,235,238,176,131,107,124,65,110,
+    161,82,205,36,12,76,8,225,224,54,128,151,123,96,126,56,
+    251,96,174,55,154,125,112,181,247,247,28,20,108,248,24,14,
+    192,217,248,225,206,47,189,254,62,199,175,5,253,1,137,91,
+    79,137,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/RedirectPath.py",
+    "m5.objects.RedirectPath",
+    embedded_module_data,
+    690,
+    1176);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,96 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,85,205,79,27,71,20,159,93,239,174,63,137,63,
+    128,218,141,48,217,208,70,149,9,130,84,4,69,69,85,170,
+    2,106,149,208,154,182,228,228,30,86,155,157,49,222,176,31,
+    206,238,56,192,210,131,15,28,114,169,20,113,161,234,165,156,
+    80,43,254,153,181,228,131,53,18,82,165,42,135,222,140,72,
+    47,57,117,102,215,54,54,133,218,227,183,51,111,126,243,62,
+    126,239,205,250,47,48,244,17,123,207,139,21,42,142,0,4,
+    144,51,192,51,246,228,13,206,228,43,60,199,230,17,35,98,
+    10,21,129,3,60,248,26,64,225,0,64,17,241,39,17,0,
+    78,35,125,67,21,17,74,155,160,20,253,155,45,74,28,225,
+    102,169,136,111,234,230,198,243,23,72,195,116,33,86,85,172,
+    26,218,176,119,161,239,125,154,99,222,17,168,112,16,84,120,
+    200,85,34,144,63,0,21,1,137,48,114,0,78,40,228,116,
+    112,168,34,177,8,42,81,138,140,65,177,18,135,82,37,1,
+    163,149,36,74,29,143,129,107,62,48,10,99,39,60,181,192,
+    15,44,220,162,216,244,181,216,248,9,141,228,148,27,32,51,
+    55,34,19,48,121,197,106,150,98,115,215,98,83,112,236,10,
+    118,252,70,236,45,152,190,130,157,128,28,101,54,67,132,31,
+    108,27,151,53,110,8,205,232,79,210,223,197,27,192,8,196,
+    67,91,47,6,56,39,139,197,75,61,228,70,83,100,5,222,
+    4,56,58,116,178,95,22,240,19,24,197,14,219,87,174,213,
+    94,122,165,33,243,101,111,225,75,140,145,89,199,50,182,101,
+    213,48,108,77,197,72,54,27,6,214,235,6,146,117,203,197,
+    170,165,33,87,182,171,50,203,110,190,36,58,44,18,50,166,
+    224,26,82,250,251,14,139,223,97,97,145,168,162,88,104,71,
+    81,74,60,137,104,134,75,164,237,29,213,217,114,93,70,151,
+    44,191,79,187,142,182,224,234,230,66,96,173,190,231,36,168,
+    222,75,5,171,222,201,123,84,227,126,65,69,19,156,37,211,
+    237,100,177,11,248,120,225,44,149,245,115,171,173,212,90,59,
+    181,230,167,214,58,227,249,55,15,255,201,128,233,79,218,197,
+    249,223,221,86,113,177,93,92,252,89,104,199,110,159,165,199,
+    219,233,187,126,236,238,5,203,114,164,26,92,175,34,23,183,
+    255,167,26,148,23,174,92,226,131,52,157,56,96,151,197,97,
+    37,116,25,66,118,88,11,147,228,22,194,79,122,185,123,153,
+    32,248,33,205,34,67,39,131,4,222,246,131,113,110,221,24,
+    140,20,4,19,244,16,95,38,130,67,173,253,193,110,168,224,
+    34,163,58,236,85,168,171,184,230,197,67,230,232,244,17,243,
+    19,13,252,116,210,147,175,95,5,62,188,36,99,151,25,153,
+    175,213,188,196,22,50,151,150,151,217,17,135,85,192,203,209,
+    221,134,161,98,221,182,228,151,13,213,194,13,211,251,72,175,
+    202,184,166,187,50,29,170,92,109,24,134,236,238,185,180,45,
+    228,75,240,87,222,157,157,26,162,53,119,100,172,155,136,2,
+    44,77,183,182,216,17,100,169,207,13,4,137,248,233,131,7,
+    166,235,201,53,123,135,182,11,70,22,235,41,134,147,119,116,
+    92,147,29,164,26,193,217,0,216,112,189,251,212,160,37,27,
+    200,117,169,119,213,10,67,48,27,90,45,244,64,23,6,170,
+    226,57,217,173,235,86,105,146,196,104,123,168,38,82,20,146,
+    80,20,211,134,13,131,205,83,138,66,211,48,194,157,160,92,
+    65,71,145,164,102,168,174,107,210,136,109,232,100,152,122,50,
+    160,16,239,213,17,73,104,187,187,74,13,169,16,57,36,206,
+    230,1,152,164,208,43,100,225,151,180,171,33,218,37,226,119,
+    170,163,154,68,120,166,107,219,132,145,170,244,248,34,194,138,
+    109,27,36,201,136,82,66,162,72,134,133,172,176,100,149,144,
+    14,34,174,210,203,180,61,188,81,71,142,110,67,82,184,212,
+    176,204,232,61,114,144,91,179,13,232,140,179,48,89,13,131,
+    114,135,13,200,196,12,171,115,59,168,115,255,219,153,40,52,
+    191,237,10,41,113,166,11,6,98,10,72,217,46,207,177,37,
+    21,231,17,186,60,248,49,84,72,156,248,1,211,246,132,4,
+    82,185,230,90,39,59,221,124,218,201,76,53,159,116,99,96,
+    98,178,249,13,125,140,23,142,102,15,103,127,249,222,151,31,
+    182,114,75,237,220,82,115,253,207,92,158,233,252,226,74,43,
+    183,218,206,173,54,215,233,249,66,241,200,59,244,142,239,249,
+    165,167,173,252,122,59,191,238,11,19,157,252,212,209,254,225,
+    254,241,35,127,174,220,202,111,180,243,27,76,121,231,227,223,
+    246,127,221,239,196,210,126,246,241,121,132,151,165,119,128,10,
+    95,152,10,71,152,48,75,179,92,146,72,220,92,162,173,77,
+    121,167,213,160,211,193,223,83,239,221,66,85,13,172,27,225,
+    235,38,224,103,148,179,247,177,207,195,206,120,236,204,245,174,
+    152,187,77,69,55,194,113,92,119,25,112,5,31,228,195,209,
+    1,51,254,232,232,128,15,253,209,209,149,238,115,82,23,252,
+    87,188,254,236,156,61,222,93,179,21,4,243,47,236,168,216,
+    133,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/Root.py",
+    "m5.objects.Root",
+    embedded_module_data,
+    1137,
+    1987);
+
+} // anonymous namespace
+} // namespace gem5
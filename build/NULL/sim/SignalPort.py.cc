@@ -0,0 +1,96 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,205,87,205,79,27,71,20,159,217,29,27,27,54,212,
+    113,73,84,192,45,14,73,67,92,21,211,2,137,162,130,12,
+    168,66,46,130,56,40,166,149,226,30,86,214,238,82,185,93,
+    99,119,214,150,26,139,72,174,132,20,168,122,232,165,74,46,
+    145,122,41,194,162,135,30,251,103,216,21,82,171,149,56,245,
+    212,155,43,114,168,56,117,222,172,119,189,54,27,133,32,145,
+    212,31,191,157,125,207,51,243,126,239,99,222,250,47,228,122,
+    9,173,235,209,45,6,143,145,138,84,172,163,60,206,224,188,
+    144,17,48,82,133,140,168,138,25,162,146,45,148,241,169,62,
+    134,126,213,207,176,71,237,97,24,80,3,105,20,11,254,13,
+    43,196,4,147,172,22,104,201,236,253,76,83,74,5,10,227,
+    74,56,157,251,98,35,171,71,141,66,153,42,90,116,246,93,
+    35,81,9,217,178,220,198,87,92,162,96,151,65,62,246,21,
+    193,160,45,6,143,196,199,168,228,82,110,162,138,31,161,239,
+    196,146,208,45,123,136,75,190,182,236,75,209,30,237,136,155,
+    120,151,253,122,223,153,129,25,231,36,218,22,215,177,138,183,
+    2,170,80,34,237,121,187,108,222,190,51,247,161,176,41,48,
+    122,98,74,241,244,216,40,131,31,241,35,230,53,13,101,176,
+    138,50,194,54,218,198,235,2,44,155,17,183,209,55,56,67,
+    216,116,225,248,61,139,112,154,251,0,220,18,159,213,11,74,
+    86,55,18,241,110,141,226,34,198,93,241,38,236,180,10,59,
+    9,204,21,46,71,237,178,239,190,115,247,147,219,133,206,11,
+    200,171,248,23,161,147,22,139,42,74,163,154,152,90,139,97,
+    51,152,51,100,43,56,53,193,244,25,229,162,70,205,128,44,
+    231,54,114,37,89,174,17,147,24,154,190,110,18,85,51,20,
+    51,40,203,138,158,53,12,89,54,251,172,57,50,45,232,154,
+    1,14,140,70,171,213,227,75,6,85,38,140,92,126,194,162,
+    197,169,22,31,208,11,76,95,153,58,189,19,226,246,254,49,
+    32,127,131,193,191,85,116,40,93,220,73,126,159,252,67,138,
+    252,46,69,158,124,190,119,237,183,107,117,41,210,144,230,14,
+    164,185,186,253,57,2,126,53,31,48,216,200,230,53,102,104,
+    175,44,231,11,106,89,135,177,36,203,95,151,179,186,165,225,
+    86,153,23,90,148,20,77,215,25,95,129,94,100,82,26,102,
+    96,64,36,230,171,20,2,96,134,186,77,164,61,76,12,150,
+    29,125,2,230,49,251,236,119,83,192,193,121,220,68,103,65,
+    122,9,118,143,0,7,98,14,167,151,146,169,133,21,57,125,
+    247,211,123,31,47,202,247,238,174,44,202,107,139,119,86,87,
+    22,214,22,205,65,91,185,148,90,238,84,81,136,179,233,87,
+    10,249,98,182,20,35,102,127,233,65,81,147,13,176,191,84,
+    166,154,25,132,178,227,113,227,27,89,92,173,8,70,231,57,
+    91,75,14,112,21,116,133,150,255,195,227,191,246,55,194,137,
+    234,242,97,40,182,151,106,132,62,170,46,29,146,192,214,242,
+    15,125,79,238,55,200,216,1,25,171,147,177,38,17,124,192,
+    230,197,248,116,250,31,126,125,230,214,4,144,20,169,147,97,
+    238,135,215,124,42,4,92,165,118,46,167,194,45,235,152,124,
+    126,89,120,235,95,221,9,65,131,108,72,251,0,250,145,147,
+    36,85,171,36,172,162,158,59,27,7,167,192,111,194,74,3,
+    0,60,243,47,3,12,163,174,226,187,236,189,8,189,206,148,
+    211,48,227,109,103,1,168,200,154,143,142,192,56,10,0,148,
+    232,21,0,176,62,70,40,132,135,94,181,127,235,149,253,55,
+    108,152,64,231,151,253,63,15,121,103,255,104,157,92,57,83,
+    246,179,76,63,145,253,172,34,60,179,127,19,239,136,175,187,
+    39,94,111,133,147,29,70,158,205,160,37,239,200,118,48,138,
+    103,251,10,58,123,182,119,19,231,189,16,167,120,158,215,8,
+    125,131,93,104,8,128,119,2,126,2,122,36,254,196,233,204,
+    119,18,125,1,204,134,197,78,116,178,251,123,164,33,141,31,
+    72,227,117,251,211,174,5,187,31,113,43,220,37,209,223,185,
+    13,125,31,116,176,69,2,157,236,70,113,104,46,167,6,107,
+    247,73,128,119,80,187,100,194,142,212,229,18,187,100,38,109,
+    152,1,157,134,94,178,100,226,144,255,207,135,167,3,80,43,
+    241,103,109,41,43,148,161,58,25,252,63,20,202,185,183,137,
+    201,142,211,239,68,190,121,105,95,77,209,208,56,178,219,3,
+    63,41,61,170,100,230,229,109,119,42,230,14,172,242,1,234,
+    104,13,31,162,174,58,24,240,90,130,194,95,25,96,75,167,
+    156,233,183,1,224,113,178,35,159,185,212,35,159,111,219,144,
+    68,231,145,207,21,143,124,142,214,201,8,55,53,21,11,154,
+    193,252,205,120,49,75,179,121,195,106,96,96,157,171,169,241,
+    231,51,222,166,38,109,67,107,45,158,96,254,113,96,214,122,
+    228,77,208,25,30,45,198,225,91,6,77,17,99,220,156,22,
+    177,208,68,47,134,94,52,50,85,71,195,127,70,226,117,52,
+    216,244,7,113,164,137,28,120,43,136,71,97,212,2,118,59,
+    4,163,22,176,219,40,140,186,129,155,248,31,229,229,3,63,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/SignalPort.py",
+    "m5.objects.SignalPort",
+    embedded_module_data,
+    1152,
+    3710);
+
+} // anonymous namespace
+} // namespace gem5
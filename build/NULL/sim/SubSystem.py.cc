@@ -0,0 +1,55 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,81,49,111,19,49,20,182,239,46,33,73,211,148,
+    160,228,32,98,129,138,161,97,72,24,8,67,133,160,67,128,
+    130,170,128,148,32,161,91,44,231,252,212,164,58,167,193,190,
+    160,38,211,13,252,0,54,86,166,10,196,159,9,168,18,145,
+    39,36,38,182,67,101,98,226,124,151,156,130,168,253,238,123,
+    239,249,217,254,222,231,251,129,214,70,102,233,207,239,69,240,
+    30,49,196,176,135,122,218,27,30,230,134,99,96,100,160,39,
+    136,153,111,17,179,192,56,53,17,250,108,174,14,59,38,203,
+    116,81,61,251,83,39,117,172,240,237,8,242,221,33,127,222,
+    63,2,215,119,215,137,172,21,209,171,152,8,144,131,25,114,
+    12,166,47,193,142,197,12,39,195,76,39,11,151,62,228,208,
+    5,3,242,204,58,53,34,114,35,37,47,192,198,81,49,205,
+    54,147,86,34,250,73,191,59,149,62,240,89,89,14,121,83,
+    78,250,68,198,121,99,48,152,109,29,2,111,237,238,166,123,
+    30,207,74,189,1,8,78,189,27,236,152,211,225,168,83,47,
+    169,28,33,35,202,129,16,85,32,132,31,179,137,167,227,34,
+    33,175,39,212,91,86,44,127,58,6,85,112,79,78,200,0,
+    40,3,161,242,58,118,61,42,165,202,209,190,244,5,117,125,
+    149,121,65,5,229,106,115,73,210,142,57,148,213,121,121,112,
+    160,74,126,178,72,18,102,161,95,72,149,5,184,19,33,161,
+    13,111,134,46,244,4,128,186,114,8,35,16,212,95,91,251,
+    132,206,181,232,63,21,41,220,166,86,153,10,106,140,167,34,
+    27,149,98,184,19,125,242,81,4,65,58,23,27,118,208,94,
+    148,111,5,207,22,151,111,6,79,23,91,149,96,63,204,33,
+    251,250,183,234,206,215,234,206,199,202,188,249,240,75,117,239,
+    172,186,23,116,190,215,182,207,106,119,231,150,157,152,168,174,
+    238,237,212,45,149,231,173,198,88,139,147,170,24,133,233,79,
+    143,101,36,45,84,52,196,135,108,221,108,238,126,242,150,15,
+    68,45,74,177,238,205,137,32,52,49,198,225,62,70,248,218,
+    28,93,77,108,129,182,231,255,90,104,23,112,43,68,255,195,
+    187,252,47,237,126,95,80,138,185,255,2,127,164,197,190,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/SubSystem.py",
+    "m5.objects.SubSystem",
+    embedded_module_data,
+    495,
+    750);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,201 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,149,88,221,79,27,87,22,31,127,224,24,48,24,131,
+    249,254,186,36,132,214,9,118,178,109,200,38,180,36,33,16,
+    154,47,8,130,166,171,242,208,209,224,185,192,52,243,225,206,
+    140,67,60,138,42,63,236,67,85,173,212,44,170,54,89,180,
+    18,81,31,210,174,250,127,236,179,65,72,88,247,97,21,105,
+    159,242,230,168,125,234,203,238,57,119,108,48,19,155,106,241,
+    48,31,247,247,187,231,156,123,206,185,231,120,252,31,161,234,
+    175,161,124,253,197,132,211,115,65,22,100,159,42,124,234,94,
+    125,252,234,87,253,90,96,37,224,115,199,130,101,172,161,124,
+    13,125,42,248,133,79,4,57,240,103,65,14,210,83,175,2,
+    130,240,115,160,34,124,37,204,177,6,192,66,180,209,131,53,
+    201,167,150,133,68,248,13,62,36,124,204,119,14,78,145,101,
+    59,187,250,39,195,124,164,26,146,156,174,182,211,95,177,179,
+    139,219,73,133,21,159,44,172,248,215,193,134,31,124,43,1,
+    217,15,178,2,172,105,158,106,134,153,155,55,100,154,8,178,
+    83,138,254,88,82,21,153,133,36,219,208,148,52,11,217,138,
+    166,232,235,44,230,62,139,186,161,167,165,244,6,12,45,0,
+    61,44,138,186,164,81,81,100,77,162,168,25,114,86,197,251,
+    136,40,126,149,149,212,50,18,4,129,214,63,133,95,208,148,
+    223,98,150,153,190,96,41,218,133,229,156,101,83,45,149,201,
+    153,33,24,231,167,139,240,111,245,194,41,127,248,41,54,95,
+    47,240,35,63,139,31,179,173,194,61,182,208,96,101,161,255,
+    110,168,94,40,252,7,100,223,74,80,246,175,52,248,5,26,
+    146,3,175,124,224,78,223,161,59,79,193,104,88,14,30,31,
+    229,99,13,199,199,214,253,43,141,180,233,101,179,80,227,143,
+    70,190,108,169,220,203,161,87,224,244,159,43,142,23,86,90,
+    105,244,101,91,173,89,242,41,57,236,225,198,128,219,94,83,
+    67,135,220,232,225,198,193,154,206,90,92,8,110,147,135,219,
+    5,114,187,107,218,208,44,71,60,220,30,144,219,91,71,110,
+    139,135,219,119,2,183,213,195,237,7,27,6,106,218,16,149,
+    219,60,220,193,19,236,141,121,184,67,117,229,182,203,29,30,
+    238,48,112,73,77,110,92,238,244,112,71,128,123,186,38,183,
+    75,238,246,112,207,0,119,180,14,183,199,195,61,123,194,218,
+    122,61,220,177,186,114,251,228,126,15,247,61,136,197,251,181,
+    184,16,139,1,15,55,113,130,13,131,30,238,185,186,126,24,
+    146,135,61,220,243,117,185,68,30,241,112,199,79,144,123,218,
+    195,77,2,55,85,147,219,37,159,241,112,47,156,192,29,245,
+    112,47,158,192,61,235,225,254,225,4,238,152,135,251,193,9,
+    220,247,60,220,15,129,123,169,22,23,170,208,196,43,184,254,
+    124,52,251,125,207,220,203,48,247,143,117,244,36,60,220,43,
+    39,236,191,115,30,238,213,19,184,231,61,220,201,19,114,105,
+    220,195,253,8,214,244,241,241,53,173,76,193,252,107,117,214,
+    144,244,204,191,46,167,160,97,93,96,33,183,117,56,45,216,
+    70,44,183,141,108,108,56,145,117,170,77,76,78,150,193,102,
+    247,74,50,134,105,179,150,117,106,31,117,57,214,98,85,63,
+    58,125,211,170,74,52,124,86,168,69,20,157,216,27,148,184,
+    114,205,48,40,118,200,167,48,0,205,141,114,132,51,115,101,
+    2,81,112,134,211,2,12,83,147,84,206,82,157,137,105,146,
+    54,84,149,166,109,197,208,137,177,70,36,208,96,151,41,105,
+    67,203,24,58,213,109,143,174,212,156,147,212,52,41,195,135,
+    86,165,244,35,104,177,196,178,13,147,146,77,197,222,48,178,
+    54,49,169,69,205,199,124,124,83,202,56,167,151,36,125,29,
+    76,182,55,36,27,196,234,150,173,216,89,27,44,148,64,176,
+    107,166,67,202,28,46,145,202,100,53,71,36,98,109,72,178,
+    177,9,79,75,15,230,153,224,252,13,49,174,233,61,11,48,
+    152,73,44,186,174,129,137,100,77,81,41,182,241,113,146,181,
+    96,249,6,145,21,19,150,165,130,20,89,6,115,172,67,107,
+    93,75,215,76,67,35,146,110,224,98,201,134,97,217,201,7,
+    203,36,99,26,105,160,166,200,125,42,61,70,39,130,211,168,
+    150,177,115,40,48,171,67,52,184,148,249,233,69,113,249,246,
+    244,210,173,89,178,166,74,235,41,231,171,233,44,124,231,144,
+    108,37,13,254,203,193,234,53,227,177,27,131,119,141,36,89,
+    112,42,145,169,101,155,89,238,246,20,68,13,131,99,161,229,
+    50,49,116,144,160,172,225,210,77,42,139,71,22,3,1,190,
+    210,36,185,61,41,22,92,119,148,140,243,229,156,1,161,178,
+    49,114,85,17,87,52,105,221,77,144,244,6,77,63,202,24,
+    10,196,112,146,224,140,113,98,152,174,39,84,131,187,121,205,
+    21,128,177,70,47,193,8,198,144,56,170,178,58,78,28,203,
+    150,113,2,232,165,44,244,193,196,229,123,202,77,231,252,178,
+    226,208,138,70,46,198,194,167,138,192,99,54,152,184,41,156,
+    107,51,101,233,152,100,42,125,76,213,186,19,200,251,23,39,
+    33,238,107,146,101,131,143,214,164,172,106,39,156,47,22,178,
+    218,42,132,137,235,52,169,36,91,135,246,98,138,73,58,212,
+    109,90,61,82,95,52,44,132,100,202,17,47,11,75,56,95,
+    47,81,215,197,89,189,202,15,181,133,64,90,66,234,103,80,
+    11,172,95,35,135,9,60,14,54,101,114,160,128,108,154,138,
+    13,121,104,25,36,195,167,64,28,221,168,162,54,178,185,65,
+    117,72,4,19,245,27,89,8,144,252,230,6,58,169,103,6,
+    190,172,82,162,42,96,161,133,30,6,201,171,57,155,90,78,
+    108,81,130,136,64,50,240,140,6,31,90,206,220,173,39,138,
+    237,230,48,207,50,69,203,170,18,223,195,170,97,100,92,29,
+    20,22,147,213,109,106,162,173,155,240,181,155,40,88,7,36,
+    29,146,158,115,173,212,155,255,194,159,211,105,101,104,90,89,
+    83,210,85,44,69,126,131,223,6,157,211,71,174,151,21,216,
+    182,122,218,174,98,217,185,12,216,119,145,15,88,182,100,218,
+    60,127,201,161,60,69,30,135,220,217,36,20,173,61,50,210,
+    185,150,6,87,192,254,63,74,79,215,228,67,201,224,103,186,
+    142,249,139,43,32,240,181,60,203,243,31,102,161,195,156,143,
+    61,2,255,207,217,191,175,157,66,74,213,153,61,249,123,186,
+    79,152,123,165,142,102,9,194,10,5,35,157,201,214,155,57,
+    84,121,111,194,74,100,102,117,116,51,47,79,110,73,118,198,
+    244,172,6,145,134,250,83,158,107,99,246,89,88,4,224,174,
+    108,173,97,58,110,9,66,25,152,139,60,102,217,12,177,210,
+    166,146,113,243,201,25,168,48,214,203,213,206,202,105,171,134,
+    106,185,232,149,229,108,6,59,149,69,64,162,173,36,221,45,
+    4,97,159,89,124,104,93,39,119,180,12,172,197,130,138,134,
+    195,23,102,12,200,191,39,54,185,51,107,57,243,55,37,235,
+    176,108,92,190,4,149,132,44,78,19,19,139,190,91,248,160,
+    18,149,183,82,18,119,24,238,188,9,35,3,197,120,25,13,
+    49,200,69,183,170,91,210,170,74,83,11,137,27,38,190,228,
+    152,17,60,225,107,13,11,98,54,178,166,244,147,39,226,6,
+    218,100,178,70,188,79,171,224,6,214,188,68,191,202,194,46,
+    95,196,46,219,236,58,77,228,45,55,178,152,187,169,232,242,
+    60,133,206,37,179,102,156,66,159,240,37,178,230,207,96,191,
+    25,230,162,100,74,26,107,157,94,133,146,13,171,115,27,50,
+    11,46,83,117,141,5,160,224,179,112,165,39,179,6,206,229,
+    239,125,124,20,223,52,41,139,148,155,46,54,113,149,5,23,
+    30,222,191,207,90,202,93,150,51,84,214,184,172,104,15,86,
+    191,4,125,172,189,130,28,245,95,22,188,105,24,42,139,99,
+    215,21,179,88,226,224,237,214,237,177,148,53,78,67,131,227,
+    205,147,53,161,74,238,82,139,197,220,222,41,66,212,42,67,
+    161,101,27,139,1,107,243,246,22,54,32,65,3,19,179,58,
+    84,159,71,226,59,104,207,81,190,138,110,132,68,183,109,84,
+    94,201,177,35,176,129,119,89,188,132,138,88,205,88,224,142,
+    110,179,238,119,41,188,29,176,240,67,221,82,214,117,42,179,
+    222,119,41,229,154,207,186,222,133,208,33,44,138,175,249,84,
+    196,202,233,234,138,44,149,107,37,22,78,214,90,169,156,98,
+    6,30,45,214,142,27,88,52,116,17,247,172,200,247,44,139,
+    28,222,139,138,204,34,176,153,202,40,170,229,119,188,162,136,
+    176,67,97,76,68,9,236,212,140,91,94,89,103,53,225,81,
+    198,22,249,30,62,54,204,85,186,195,29,124,24,138,68,53,
+    247,104,176,138,25,231,131,160,210,170,166,134,43,149,192,12,
+    242,44,219,44,63,178,208,67,112,241,229,75,172,73,209,21,
+    92,43,38,109,24,61,135,27,154,53,185,219,152,223,71,248,
+    222,45,251,149,53,207,126,54,183,124,27,154,168,10,107,137,
+    200,143,215,44,113,163,252,20,196,212,130,172,194,125,8,249,
+    0,249,22,197,237,198,127,219,136,225,169,163,114,194,87,3,
+    107,43,112,252,23,145,142,252,108,49,70,242,119,139,109,67,
+    249,59,175,219,7,159,157,127,161,237,182,143,239,183,143,231,
+    239,149,66,66,99,231,55,145,103,226,110,248,236,126,248,108,
+    49,28,63,122,40,53,4,58,66,64,105,18,218,250,15,162,
+    137,189,104,162,24,142,252,37,92,104,79,189,13,248,219,66,
+    191,10,112,202,223,6,9,109,157,7,209,225,189,232,240,203,
+    112,225,220,253,221,232,252,126,116,62,127,251,117,188,247,32,
+    62,182,23,31,123,105,255,36,238,198,167,246,227,83,249,249,
+    98,239,232,65,111,106,175,55,85,12,55,21,34,51,32,167,
+    15,229,244,133,10,193,174,82,155,48,48,178,51,185,61,89,
+    12,183,20,162,215,0,27,64,108,0,176,158,82,171,208,62,
+    120,16,27,219,139,141,241,153,23,1,109,71,180,61,148,191,
+    11,6,130,216,158,228,94,79,146,131,104,94,47,130,189,48,
+    181,179,20,22,122,6,159,63,221,122,10,88,201,239,111,188,
+    250,182,161,161,7,80,56,21,130,241,82,68,24,77,252,56,
+    249,3,42,69,52,1,232,40,162,163,128,146,82,143,64,206,
+    238,60,221,134,185,173,37,191,175,241,210,219,134,32,1,20,
+    78,133,224,0,232,29,77,28,156,249,112,239,204,135,197,112,
+    91,161,253,58,232,197,185,126,119,110,72,24,30,221,81,182,
+    149,98,184,177,208,124,15,176,97,196,134,1,235,7,108,100,
+    236,199,214,31,90,1,67,185,231,64,238,8,202,29,1,116,
+    16,228,14,157,217,89,217,94,225,54,249,26,239,249,0,30,
+    66,120,8,224,62,48,185,123,224,185,190,165,191,92,42,36,
+    102,118,187,102,247,187,102,243,15,94,119,146,131,206,228,94,
+    103,242,167,213,194,7,183,118,59,231,246,59,231,242,11,175,
+    123,135,118,250,182,251,202,130,82,32,7,253,29,116,253,221,
+    36,196,123,159,95,221,186,250,98,169,48,114,101,183,227,234,
+    126,199,213,252,253,98,71,79,101,236,214,110,199,220,126,199,
+    28,140,13,158,222,249,124,251,115,238,92,140,11,218,226,119,
+    109,9,9,128,205,111,207,31,46,114,16,177,65,192,122,143,
+    99,119,188,88,63,217,73,110,39,15,177,126,196,250,1,235,
+    62,142,125,226,197,32,71,166,182,167,56,118,235,120,142,132,
+    33,17,191,251,250,219,175,95,168,47,212,191,235,255,208,11,
+    169,133,221,232,131,253,232,131,252,237,98,172,235,249,192,214,
+    192,11,169,48,114,103,55,118,119,63,118,23,182,67,52,254,
+    221,211,111,159,190,184,89,32,55,119,163,51,251,209,153,35,
+    222,106,225,244,141,221,216,244,126,108,58,127,247,53,120,100,
+    114,203,205,74,180,52,142,26,227,161,252,125,8,68,124,248,
+    217,71,127,157,250,126,10,30,194,66,123,247,243,190,173,190,
+    114,72,49,85,48,67,131,152,161,248,113,183,43,110,210,133,
+    68,51,235,210,38,82,6,111,52,86,170,122,227,119,87,141,
+    67,47,202,168,180,220,231,58,170,128,227,165,167,17,16,94,
+    102,44,232,117,112,107,26,79,114,80,91,38,82,71,189,44,
+    120,11,74,169,251,187,105,242,176,94,28,175,33,191,133,63,
+    118,127,142,189,102,126,1,143,248,75,166,245,47,56,149,2,
+    62,159,175,180,232,19,124,103,11,194,168,123,20,5,184,47,
+    31,69,97,188,112,252,40,10,221,133,202,81,20,186,10,149,
+    163,40,244,21,42,71,41,228,243,221,240,149,132,218,231,103,
+    241,183,252,250,107,53,18,158,241,251,66,37,161,246,249,155,
+    207,223,242,235,175,117,112,190,206,255,1,19,46,156,44,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/System.py",
+    "m5.objects.System",
+    embedded_module_data,
+    2831,
+    6036);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,46 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,123,204,128,4,88,161,244,103,61,32,49,157,33,133,
+    33,133,49,135,33,151,49,138,145,145,129,137,193,157,33,133,
+    169,133,33,133,57,149,113,25,51,3,195,106,102,152,166,40,
+    166,20,150,96,6,77,214,151,32,142,38,227,45,94,231,156,
+    252,228,236,212,20,255,164,172,212,228,146,100,100,243,25,97,
+    230,203,129,205,79,101,136,98,76,1,233,103,136,98,78,97,
+    140,98,73,97,138,98,77,97,142,98,131,152,119,139,39,36,
+    19,97,78,72,149,72,113,102,174,126,9,88,40,62,31,44,
+    166,151,145,81,37,148,158,154,107,106,101,133,172,212,79,147,
+    253,22,71,124,124,94,98,110,106,124,252,45,174,248,248,220,
+    252,148,210,28,16,155,39,62,190,176,52,49,7,42,195,82,
+    82,89,144,122,139,35,49,169,184,164,40,49,185,228,22,87,
+    114,69,69,124,70,106,98,74,106,209,45,78,16,59,57,39,
+    177,184,120,37,195,103,144,147,127,137,23,23,37,235,131,156,
+    128,108,149,94,65,101,17,40,208,192,132,58,16,23,43,1,
+    137,6,56,188,193,45,217,224,114,131,95,184,193,227,134,160,
+    122,131,215,13,1,149,6,79,16,44,226,131,105,242,211,100,
+    190,37,145,107,170,7,241,81,177,30,74,224,21,49,195,148,
+    21,241,130,8,176,46,126,144,107,56,108,32,158,178,43,18,
+    132,134,107,177,31,144,248,192,204,200,200,248,193,131,145,129,
+    209,248,2,131,17,50,250,192,198,194,168,250,129,1,147,152,
+    96,251,17,68,125,193,34,5,182,15,0,68,91,139,202,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/TickedObject.py",
+    "m5.objects.TickedObject",
+    embedded_module_data,
+    351,
+    545);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,52 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,81,189,79,27,49,20,127,246,93,190,8,132,47,
+    241,33,166,82,81,41,199,16,212,33,29,16,66,80,33,62,
+    58,0,18,85,134,91,44,247,108,145,160,115,46,245,133,10,
+    50,221,192,31,208,173,43,19,18,226,159,73,171,74,68,94,
+    153,216,174,162,83,39,236,203,37,34,18,125,182,127,239,217,
+    207,207,191,159,237,7,120,97,153,212,63,125,208,240,3,24,
+    48,228,195,103,227,177,143,4,118,49,2,12,123,192,172,43,
+    96,54,199,55,22,192,157,53,40,118,45,150,57,1,39,251,
+    104,38,14,82,104,85,67,225,164,33,142,190,156,113,175,237,
+    189,36,178,7,68,187,9,17,7,23,49,112,49,51,135,32,
+    215,102,216,205,240,236,117,14,94,49,102,49,251,6,107,98,
+    60,36,206,247,137,213,68,45,240,219,244,148,239,4,130,54,
+    154,157,185,176,33,214,190,245,151,8,75,214,42,245,122,103,
+    246,148,139,234,250,250,200,94,133,223,215,58,243,71,45,46,
+    105,187,17,52,169,255,38,173,43,135,206,161,83,80,121,66,
+    154,84,112,66,212,24,33,34,96,231,190,137,199,9,249,122,
+    78,253,52,99,183,47,91,92,141,121,23,23,164,206,41,227,
+    82,21,76,236,249,52,12,85,177,166,159,32,144,199,84,82,
+    161,114,41,183,202,165,44,183,240,100,46,242,111,49,148,222,
+    154,81,61,34,174,210,186,148,89,157,78,160,172,71,88,213,
+    16,13,91,175,184,20,237,244,166,203,209,167,222,212,187,232,
+    32,158,130,201,165,251,210,242,175,210,242,245,74,183,188,245,
+    179,180,253,187,180,29,237,153,38,103,6,231,28,58,182,42,
+    136,106,165,101,20,133,106,92,135,195,175,146,246,96,151,156,
+    54,144,20,205,26,129,249,141,254,229,55,229,188,158,34,163,
+    133,105,136,45,132,80,188,143,0,45,118,97,161,223,123,240,
+    182,59,218,227,108,17,125,68,49,188,142,223,15,254,36,254,
+    239,127,242,137,138,103,197,211,175,149,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/VoltageDomain.py",
+    "m5.objects.VoltageDomain",
+    embedded_module_data,
+    442,
+    686);
+
+} // anonymous namespace
+} // namespace gem5
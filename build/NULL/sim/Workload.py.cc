@@ -0,0 +1,218 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,173,24,107,111,219,214,245,82,164,36,74,214,203,146,
+    99,39,206,195,108,94,141,50,87,25,218,186,203,12,35,136,
+    243,178,227,36,118,1,187,77,235,5,97,105,145,182,88,83,
+    162,66,82,117,34,184,168,80,100,168,211,5,173,103,108,136,
+    177,47,53,134,33,104,209,125,232,79,216,79,144,13,1,22,
+    136,5,8,176,237,67,191,201,136,7,12,253,178,157,115,169,
+    183,229,166,40,70,74,135,228,61,231,158,123,239,121,223,251,
+    15,210,116,121,171,207,23,255,4,240,132,200,68,102,52,50,
+    227,60,25,250,116,105,174,52,59,203,166,185,89,142,33,46,
+    50,70,100,246,33,145,57,133,125,202,18,242,45,91,99,52,
+    235,166,56,55,224,60,138,187,13,231,161,56,47,224,120,197,
+    219,134,227,41,206,7,56,255,158,126,62,138,235,2,92,192,
+    69,20,196,51,128,103,106,248,54,234,46,74,29,4,234,144,
+    226,86,186,254,26,126,202,1,158,171,227,3,114,100,154,196,
+    187,191,199,143,56,99,51,103,227,46,219,55,173,166,167,230,
+    62,84,146,150,237,75,222,191,127,75,177,82,186,156,108,150,
+    80,173,255,139,199,84,66,10,153,101,100,50,235,130,63,43,
+    51,179,156,236,154,117,203,236,172,71,241,110,240,164,195,37,
+    115,178,251,169,11,230,225,106,172,10,104,253,29,105,61,178,
+    183,141,182,75,9,200,252,67,242,20,222,191,173,211,205,6,
+    101,31,172,196,111,243,183,117,99,81,211,37,249,135,176,169,
+    166,207,45,85,191,18,169,84,62,180,160,164,135,134,135,107,
+    4,51,215,242,194,109,73,181,132,121,221,16,36,193,80,210,
+    186,165,8,99,87,46,9,73,61,147,129,229,171,122,70,125,
+    239,48,33,249,215,175,40,243,82,78,179,132,172,110,88,231,
+    76,61,185,168,88,66,206,84,100,218,181,99,199,164,171,105,
+    17,168,29,212,201,11,143,99,81,12,204,212,149,159,51,149,
+    140,12,3,167,21,211,148,22,20,193,210,5,43,85,229,163,
+    169,74,198,242,11,213,107,212,88,48,135,235,95,120,213,250,
+    156,49,45,35,62,220,204,2,153,214,73,39,191,129,129,108,
+    206,84,180,121,219,91,37,50,113,102,130,240,67,204,52,146,
+    231,80,68,53,121,36,178,15,108,31,118,159,209,199,228,185,
+    124,180,222,94,111,251,53,244,52,125,0,10,164,18,32,190,
+    224,10,247,2,151,55,25,15,217,188,40,102,164,180,34,138,
+    182,95,20,211,186,156,211,240,61,32,138,247,114,146,86,197,
+    112,214,131,172,98,251,193,166,196,148,34,201,138,65,237,75,
+    76,106,146,105,218,188,52,7,107,145,192,232,220,111,75,134,
+    148,182,185,75,186,174,217,177,37,208,144,8,98,22,29,49,
+    139,11,242,156,237,31,215,77,107,154,170,193,14,55,218,69,
+    84,143,225,134,25,25,33,4,104,80,70,24,65,16,129,183,
+    6,18,184,12,147,46,163,118,151,187,14,20,174,148,187,143,
+    23,38,202,17,161,112,189,28,142,21,198,159,247,15,124,117,
+    246,79,103,55,222,41,14,78,110,246,79,149,250,167,138,92,
+    95,185,247,240,118,239,233,173,222,211,101,62,80,12,93,218,
+    97,93,125,158,93,2,160,48,85,225,137,39,92,113,185,221,
+    193,10,1,176,195,194,231,195,247,27,13,20,56,243,193,89,
+    116,246,40,99,95,143,82,60,27,94,210,225,146,89,153,107,
+    243,16,30,104,125,29,105,221,178,167,141,214,47,123,193,26,
+    121,59,48,109,229,230,106,42,55,208,111,243,81,199,95,90,
+    16,216,49,127,242,74,46,157,126,32,128,137,26,15,192,39,
+    212,140,227,67,86,74,53,133,186,195,217,30,77,181,44,77,
+    201,159,112,168,231,30,128,147,232,6,168,189,3,241,100,188,
+    203,136,160,100,186,17,68,17,196,16,244,32,56,128,160,15,
+    128,205,141,202,178,97,187,233,192,182,239,18,112,156,66,134,
+    182,31,153,139,148,121,187,214,143,214,192,37,212,250,68,155,
+    214,15,213,181,126,178,112,253,121,160,251,203,137,207,39,86,
+    239,21,251,47,110,6,70,75,129,209,194,213,114,119,239,147,
+    129,181,129,50,31,41,70,127,5,218,142,162,182,163,158,194,
+    4,222,206,48,71,219,149,89,19,238,139,254,86,101,50,179,
+    236,2,36,143,63,163,66,89,16,58,103,31,188,161,24,25,
+    69,123,91,202,168,201,41,61,107,94,82,82,210,71,170,158,
+    51,242,231,33,228,168,25,69,88,74,73,150,128,122,16,204,
+    148,158,211,100,65,214,5,105,222,82,48,98,57,157,5,218,
+    27,36,43,32,135,4,112,229,47,235,25,75,205,228,20,187,
+    7,68,159,189,2,142,191,48,154,145,235,173,145,230,214,171,
+    247,85,203,238,110,110,161,252,38,227,238,54,133,216,94,81,
+    148,245,36,250,241,71,146,102,182,203,249,100,13,220,66,57,
+    159,106,149,51,119,161,200,93,0,79,8,120,192,9,170,160,
+    112,5,111,135,195,201,125,253,1,179,219,255,193,31,124,157,
+    105,65,29,237,153,200,15,180,93,251,208,182,251,78,0,230,
+    16,236,56,7,175,204,183,209,134,128,54,220,145,214,39,251,
+    219,104,35,251,210,118,201,129,54,218,238,125,229,16,148,67,
+    109,180,81,160,141,117,164,13,203,145,54,218,158,31,161,237,
+    110,163,61,32,71,193,156,99,118,200,177,200,90,176,200,247,
+    98,122,89,164,109,98,115,34,238,113,2,75,43,181,77,242,
+    199,175,169,26,36,49,52,121,200,164,150,164,102,76,154,18,
+    29,22,208,38,43,249,1,8,1,42,102,88,73,19,116,90,
+    165,8,243,208,203,196,220,71,7,61,123,19,160,32,65,160,
+    128,124,7,237,52,187,119,238,51,147,191,184,148,130,242,6,
+    188,9,122,207,233,185,140,108,10,201,148,146,92,172,13,217,
+    96,115,70,86,77,105,14,166,135,252,230,36,200,58,138,37,
+    105,113,13,211,205,127,63,113,238,48,201,223,190,37,153,139,
+    200,77,202,102,181,7,248,210,206,41,33,92,159,23,242,138,
+    161,15,10,82,206,210,95,75,74,90,50,167,73,22,84,19,
+    56,9,133,174,56,13,9,14,10,11,200,136,42,148,19,31,
+    41,9,39,240,190,50,234,112,65,74,125,126,222,132,50,164,
+    73,62,75,170,149,178,25,41,15,43,209,97,133,154,180,64,
+    9,179,146,211,161,65,105,188,138,204,238,85,67,76,74,95,
+    106,137,48,115,24,132,148,122,148,185,9,49,227,126,75,172,
+    73,8,227,82,70,214,0,155,86,23,82,150,144,129,209,96,
+    222,106,58,171,129,84,50,86,181,46,146,52,88,181,145,76,
+    169,22,8,60,7,211,78,228,179,63,99,72,26,213,126,238,
+    136,147,241,222,159,146,87,60,211,32,232,204,130,221,229,88,
+    135,136,214,97,119,189,11,175,186,225,84,35,30,229,62,84,
+    39,166,49,128,228,1,231,67,68,157,154,198,65,108,242,227,
+    187,72,109,199,246,188,115,61,99,189,245,166,29,66,123,164,
+    68,98,26,172,194,142,52,190,29,229,217,129,164,158,78,195,
+    202,68,13,164,66,163,160,205,235,25,49,139,82,182,189,240,
+    166,195,226,219,35,237,96,13,220,134,191,201,50,173,25,237,
+    48,102,180,56,102,180,211,144,209,162,125,79,6,215,6,215,
+    141,226,137,177,205,232,120,41,58,94,184,81,14,30,220,14,
+    14,108,5,7,54,92,197,147,87,55,131,215,74,193,107,133,
+    107,229,216,177,237,216,137,173,216,137,50,239,47,6,206,67,
+    166,235,193,76,215,227,41,220,132,186,6,216,244,175,245,67,
+    201,83,230,39,118,220,44,38,65,22,147,32,160,122,15,63,
+    185,179,118,167,204,247,87,92,140,239,173,29,55,215,11,72,
+    0,133,201,138,159,28,60,250,100,121,109,121,99,180,248,234,
+    196,102,223,141,82,223,141,34,215,243,60,118,240,201,200,218,
+    200,6,91,60,53,182,25,27,47,197,198,11,55,159,135,123,
+    182,195,175,109,133,95,171,242,185,196,0,163,8,50,138,120,
+    10,227,80,107,2,62,52,184,21,26,108,198,135,17,31,246,
+    20,198,240,118,228,131,82,233,156,138,143,3,248,172,41,147,
+    44,64,38,89,33,243,140,204,60,228,103,185,21,114,159,153,
+    117,99,85,110,135,166,175,214,34,18,236,124,164,36,215,196,
+    13,203,119,90,199,127,1,224,143,204,19,98,49,13,100,235,
+    126,100,163,9,211,184,150,201,50,179,236,90,102,91,119,97,
+    31,115,86,211,40,31,214,119,111,27,28,233,112,45,115,173,
+    59,62,6,90,166,201,55,12,100,108,219,109,230,178,80,14,
+    65,166,206,40,75,162,104,140,160,69,245,129,91,136,166,82,
+    143,192,78,193,173,152,182,7,98,20,148,246,113,143,205,165,
+    147,154,105,115,88,167,219,238,57,9,145,172,12,165,56,139,
+    205,62,209,233,33,138,38,10,128,110,44,10,142,41,94,4,
+    144,239,109,149,88,162,58,248,39,104,157,195,0,254,83,32,
+    207,66,177,71,11,143,23,190,212,63,215,215,229,141,43,95,
+    159,250,46,182,25,26,42,133,134,86,216,103,124,111,137,79,
+    108,243,67,91,252,208,119,201,77,126,184,196,15,23,249,225,
+    114,56,186,226,167,74,141,123,218,61,120,180,54,180,29,172,
+    78,45,169,192,18,197,56,99,140,227,160,40,154,139,206,4,
+    71,106,96,25,17,23,156,217,212,157,229,152,80,228,14,87,
+    56,214,29,171,144,159,6,28,51,67,134,157,205,236,3,242,
+    227,27,98,153,219,179,113,133,237,63,30,17,180,181,194,134,
+    88,246,236,105,173,21,235,254,134,200,243,81,76,178,77,234,
+    197,4,27,169,86,238,117,170,153,151,239,71,39,175,209,64,
+    19,119,25,99,40,90,22,66,97,117,171,72,69,105,199,68,
+    213,20,33,94,101,37,75,133,60,40,98,182,201,31,107,12,
+    145,232,128,255,29,74,29,171,147,2,1,23,95,201,81,241,
+    181,76,165,238,82,107,0,62,227,112,50,178,75,35,105,230,
+    99,23,24,182,107,163,153,182,225,2,76,171,11,124,206,89,
+    77,37,144,213,180,245,89,225,192,197,217,135,188,213,116,184,
+    240,161,167,246,214,90,198,180,242,252,152,93,166,53,122,254,
+    252,77,213,116,210,236,244,213,250,134,5,202,132,250,74,105,
+    222,165,4,115,106,70,130,29,17,148,47,128,74,209,148,13,
+    54,249,75,92,115,115,56,192,245,98,22,122,129,27,81,12,
+    35,203,100,163,211,50,201,163,182,117,78,19,227,130,195,115,
+    146,106,202,102,151,52,217,160,5,55,213,148,227,149,63,240,
+    35,154,148,158,147,165,11,249,193,38,245,64,226,149,155,244,
+    147,24,209,116,40,61,204,11,137,26,245,58,242,193,156,8,
+    46,178,126,121,251,200,27,91,71,222,248,238,242,230,145,243,
+    165,35,231,11,78,2,138,123,109,86,76,15,209,37,217,158,
+    164,161,64,217,98,115,26,8,200,246,64,206,132,236,237,120,
+    28,122,40,108,32,168,33,113,84,22,180,135,87,207,98,21,
+    102,58,83,198,202,9,99,137,227,170,118,184,109,130,249,254,
+    253,39,255,37,246,23,157,169,66,14,242,157,44,242,39,154,
+    127,207,67,135,182,67,194,86,72,216,232,217,12,157,46,133,
+    78,67,156,137,246,62,11,68,203,145,243,197,218,239,89,228,
+    88,41,2,25,139,13,134,32,157,5,67,59,224,223,254,93,
+    2,96,197,91,9,145,72,223,74,104,175,189,226,164,177,241,
+    197,223,9,186,142,213,132,218,39,228,183,233,16,130,189,187,
+    9,219,22,204,101,102,145,6,125,35,220,108,209,178,171,149,
+    234,83,230,37,60,232,211,136,180,240,96,97,38,45,246,254,
+    41,227,130,190,50,119,168,193,201,165,146,101,246,47,204,23,
+    24,16,220,249,81,216,49,66,5,154,75,58,230,175,103,160,
+    160,109,242,129,159,224,2,223,227,164,242,231,110,233,6,45,
+    235,51,192,163,197,141,4,117,175,35,157,50,243,39,39,245,
+    151,83,57,238,197,25,55,112,169,239,163,5,177,154,146,177,
+    253,239,74,90,78,185,106,24,186,81,181,64,227,54,53,67,
+    201,88,128,148,183,184,132,79,227,189,102,3,172,6,184,176,
+    154,81,173,253,12,176,13,247,21,246,199,179,154,2,249,55,
+    79,98,71,183,163,131,91,209,193,175,103,54,163,175,151,162,
+    175,175,120,255,213,21,90,89,122,52,242,120,100,253,149,173,
+    174,195,197,174,195,207,162,71,138,71,39,55,163,83,165,232,
+    84,49,48,245,44,24,89,237,123,116,231,241,157,245,209,173,
+    224,209,98,240,40,197,95,254,27,48,152,40,69,39,138,129,
+    137,231,225,67,43,75,171,247,30,231,215,223,44,134,207,110,
+    188,5,0,127,252,89,106,147,47,63,47,233,197,37,117,209,
+    236,152,166,39,184,52,102,80,65,25,31,144,189,167,99,55,
+    106,224,183,184,180,37,210,90,85,246,97,85,121,10,171,202,
+    227,181,211,49,119,4,42,49,247,129,10,1,128,103,93,221,
+    15,127,227,52,120,224,189,226,10,186,251,42,4,64,29,133,
+    13,199,40,202,239,254,69,133,0,168,163,106,13,20,56,115,
+    194,153,196,25,219,135,187,44,186,136,201,120,208,238,75,15,
+    37,156,10,221,76,76,211,226,255,150,146,214,241,40,8,16,
+    89,172,211,77,59,0,175,245,3,108,3,157,201,57,17,164,
+    167,127,120,84,3,201,51,169,103,21,249,106,38,151,118,78,
+    45,6,235,226,27,169,75,162,85,58,16,82,157,51,205,11,
+    198,2,113,242,167,121,23,96,133,101,24,166,114,147,33,204,
+    233,34,57,229,252,202,164,175,88,251,85,92,44,227,130,194,
+    225,165,32,208,205,4,43,100,47,88,121,176,131,143,221,70,
+    235,25,158,241,84,200,94,176,122,126,7,31,187,141,214,94,
+    47,190,237,5,235,249,29,124,236,54,90,123,142,227,219,94,
+    176,250,222,14,62,118,27,173,19,140,135,129,74,104,47,88,
+    157,89,157,89,63,243,251,187,127,184,187,131,159,187,13,108,
+    244,20,3,138,221,11,86,15,110,220,165,47,59,8,118,59,
+    80,80,249,255,15,234,67,61,108,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/Workload.py",
+    "m5.objects.Workload",
+    embedded_module_data,
+    3097,
+    6555);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,58 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,125,82,191,111,211,64,20,126,231,31,105,236,70,80,
+    126,9,40,149,106,193,66,162,42,25,80,65,170,16,67,105,
+    26,64,106,169,20,36,36,47,150,235,59,26,35,59,9,119,
+    46,36,153,60,48,117,105,55,24,153,42,33,254,25,87,234,
+    96,221,202,196,22,84,38,38,238,220,58,13,77,192,119,247,
+    221,123,247,158,63,125,239,233,125,135,177,79,63,187,79,86,
+    5,124,2,12,24,5,16,34,27,33,105,43,129,242,74,222,
+    106,160,134,154,173,33,80,160,1,88,251,8,88,39,232,80,
+    5,248,166,230,68,182,142,11,77,40,207,252,144,78,25,241,
+    203,91,157,15,132,110,116,48,9,154,145,27,17,241,132,42,
+    2,140,166,31,190,220,126,75,188,200,27,215,161,229,58,104,
+    166,131,128,141,48,216,138,56,42,70,182,134,21,91,39,133,
+    47,51,48,229,195,42,214,14,21,161,69,25,105,41,254,39,
+    87,191,144,107,156,234,230,87,55,220,168,85,239,117,233,185,
+    240,129,197,252,176,214,149,126,45,20,81,34,162,78,230,134,
+    50,92,109,181,6,183,118,72,184,188,178,50,249,47,135,65,
+    89,190,16,198,252,78,219,122,211,161,150,32,176,112,191,237,
+    134,190,103,101,44,150,223,182,94,187,81,196,6,247,167,164,
+    50,209,182,137,204,205,178,201,139,142,35,72,136,227,112,211,
+    113,132,146,221,64,218,37,199,121,183,235,6,103,17,45,234,
+    119,9,55,189,94,207,105,17,23,19,202,13,105,123,129,203,
+    24,215,183,92,234,134,188,208,140,168,223,222,225,170,16,197,
+    21,22,125,133,19,217,145,223,247,24,245,106,231,149,79,214,
+    86,237,246,169,108,111,6,21,113,88,67,64,60,90,233,236,
+    98,188,150,94,121,16,191,72,231,42,241,243,97,9,102,231,
+    246,151,246,150,14,104,114,103,253,200,108,28,155,141,248,105,
+    106,92,218,95,216,91,56,216,78,230,215,142,140,250,177,81,
+    143,87,229,162,215,115,230,205,114,129,207,135,203,213,78,54,
+    46,172,122,97,162,168,156,61,110,136,132,174,44,135,241,146,
+    48,71,211,69,245,156,134,94,147,144,177,222,144,229,21,31,
+    159,246,236,9,189,45,92,36,229,191,23,48,84,17,66,195,
+    103,8,208,163,4,30,142,239,20,110,38,249,78,225,110,242,
+    247,30,22,77,180,142,134,48,29,63,47,254,204,238,95,255,
+    136,103,186,254,0,83,187,245,237,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/power/MathExprPowerModel.py",
+    "m5.objects.MathExprPowerModel",
+    embedded_module_data,
+    537,
+    914);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,78 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,84,207,111,219,54,20,38,37,89,150,108,207,118,
+    234,184,109,218,195,140,34,77,230,14,115,214,2,193,130,162,
+    24,208,212,69,183,166,201,130,218,232,0,93,4,197,228,18,
+    23,146,237,81,242,22,251,164,195,14,69,47,27,118,73,209,
+    203,140,161,8,54,228,159,177,11,3,53,120,221,105,55,21,
+    201,169,167,61,74,113,28,167,158,72,62,146,239,151,62,126,
+    143,210,63,232,220,19,59,157,143,13,16,7,136,32,130,109,
+    84,21,179,100,99,71,50,36,28,233,228,42,146,208,35,68,
+    228,95,16,81,168,114,40,35,116,36,143,147,24,177,208,22,
+    3,155,74,213,11,182,56,137,87,80,81,251,87,108,138,152,
+    227,91,32,212,109,139,209,134,87,59,143,68,26,35,185,28,
+    34,161,200,192,4,25,210,46,188,253,79,108,200,68,130,44,
+    50,68,110,86,59,45,10,43,249,190,109,115,181,226,89,94,
+    189,198,227,229,78,195,114,234,181,173,162,194,53,211,132,53,
+    53,77,158,48,77,167,73,218,182,88,167,76,243,199,182,101,
+    159,90,148,159,44,219,253,27,29,139,23,126,184,238,178,218,
+    138,91,119,86,90,205,159,41,91,217,22,114,179,73,168,93,
+    106,117,152,10,30,161,184,5,195,93,0,225,159,181,81,114,
+    185,31,118,191,44,26,203,140,125,167,14,166,140,15,134,240,
+    249,131,193,144,9,54,20,34,9,250,168,74,228,67,176,31,
+    225,9,31,160,83,166,117,187,146,17,167,90,79,71,51,30,
+    32,42,118,8,36,30,141,137,68,70,130,38,123,169,89,190,
+    244,147,231,233,241,154,168,23,162,50,16,149,157,21,69,226,
+    68,187,224,59,7,190,151,102,250,234,36,113,193,55,71,146,
+    80,194,20,79,76,8,238,94,157,208,30,74,81,47,224,125,
+    111,175,155,221,165,206,234,221,187,19,95,158,217,165,222,105,
+    153,67,45,79,131,34,170,127,184,239,126,250,164,238,122,133,
+    230,15,133,22,101,95,184,96,160,133,48,105,33,76,234,150,
+    184,238,182,119,220,142,235,81,135,197,1,81,55,39,174,82,
+    24,48,113,235,198,238,172,150,190,124,208,205,221,119,118,234,
+    112,71,11,224,13,249,44,175,205,232,86,113,158,37,32,144,
+    37,133,16,204,114,197,131,20,60,81,219,223,55,247,168,69,
+    0,149,46,214,53,219,114,93,158,218,238,172,215,27,100,147,
+    122,123,77,194,147,194,64,247,91,77,230,185,60,249,140,214,
+    188,38,131,239,192,114,120,102,114,74,113,30,202,165,150,195,
+    99,145,77,175,180,119,42,17,102,113,145,184,108,53,58,44,
+    143,78,47,26,143,183,28,51,132,144,172,78,112,242,148,21,
+    129,55,5,120,38,74,29,221,77,81,86,118,105,44,110,195,
+    112,255,64,211,55,250,138,95,30,205,125,238,63,30,101,111,
+    248,223,6,42,210,243,47,82,253,252,210,64,91,30,106,203,
+    35,109,94,236,110,14,180,165,161,182,20,196,228,156,234,111,
+    4,41,148,200,191,211,23,223,234,139,189,167,253,226,227,129,
+    190,49,212,55,252,245,64,67,115,151,15,50,191,103,122,234,
+    155,196,95,27,131,236,218,48,187,22,230,204,204,255,106,191,
+    180,95,173,246,111,124,53,72,175,13,211,107,254,35,208,206,
+    47,188,203,45,190,205,45,246,190,239,151,30,12,114,229,97,
+    174,236,63,17,45,194,46,16,111,21,53,174,59,171,165,150,
+    160,198,229,154,88,178,230,126,39,162,38,5,219,74,221,249,
+    110,231,57,112,203,149,135,141,182,19,145,164,159,105,163,195,
+    79,19,242,65,187,23,253,37,190,102,69,216,138,143,205,125,
+    13,34,144,49,198,193,55,24,225,171,125,116,37,234,35,116,
+    189,63,221,71,232,90,127,220,3,13,227,207,2,244,177,120,
+    81,125,47,166,147,137,54,157,199,15,113,128,102,203,223,22,
+    222,135,243,201,255,216,67,236,255,1,219,206,113,46,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/power/PowerModel.py",
+    "m5.objects.PowerModel",
+    embedded_module_data,
+    862,
+    1479);
+
+} // anonymous namespace
+} // namespace gem5
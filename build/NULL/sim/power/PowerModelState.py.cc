@@ -0,0 +1,53 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,81,61,79,220,48,24,126,157,47,28,56,245,10,
+    215,19,168,234,208,165,119,74,43,29,82,37,22,84,49,32,
+    36,40,21,20,233,110,202,98,133,216,186,75,149,112,105,28,
+    196,29,83,134,14,140,108,253,7,72,85,255,204,33,49,68,
+    94,59,117,75,69,167,78,181,147,11,165,180,177,243,188,31,
+    143,223,199,126,237,111,112,239,51,231,246,246,181,132,207,64,
+    129,162,16,6,149,69,3,208,96,23,168,246,9,168,206,180,
+    43,29,224,171,94,23,186,58,53,250,224,152,223,85,224,32,
+    129,94,250,247,117,141,90,119,191,212,101,224,34,10,174,70,
+    85,29,114,13,170,185,38,213,93,75,3,182,64,141,43,36,
+    149,81,93,90,230,204,191,115,67,205,197,212,146,251,45,136,
+    230,209,248,140,37,7,99,202,194,126,234,165,236,124,141,7,
+    209,122,172,146,21,146,72,113,189,209,232,188,61,100,209,198,
+    230,230,131,130,129,104,14,89,186,51,61,241,162,192,47,57,
+    241,72,38,20,55,143,15,29,91,96,66,228,2,70,136,88,
+    36,74,241,52,84,126,131,144,143,167,94,56,103,140,116,26,
+    51,177,232,79,38,100,196,60,42,133,108,229,251,161,199,185,
+    192,222,49,79,19,207,79,69,227,104,186,29,156,208,3,150,
+    142,198,84,44,169,37,108,18,143,147,148,127,129,91,213,221,
+    175,231,60,241,215,255,180,241,224,192,189,120,154,168,119,42,
+    193,145,63,223,149,144,221,141,124,233,89,182,147,47,191,202,
+    246,243,199,221,236,109,222,108,101,123,133,5,118,251,162,49,
+    107,119,174,113,247,6,119,115,252,68,69,47,174,113,231,6,
+    119,10,83,111,89,217,59,53,146,149,90,249,208,49,132,29,
+    109,244,98,47,241,34,46,26,210,237,7,209,251,227,15,76,
+    246,96,223,185,213,81,150,21,148,165,45,213,0,126,83,93,
+    209,86,178,42,67,245,108,124,32,161,208,17,66,197,30,2,
+    180,54,131,213,106,230,240,116,86,207,2,219,200,42,224,95,
+    184,12,126,40,243,243,63,84,185,235,111,234,111,189,142,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/power/PowerModelState.py",
+    "m5.objects.PowerModelState",
+    embedded_module_data,
+    463,
+    708);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,56 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,117,82,191,107,219,64,20,126,167,31,254,153,66,27,
+    21,18,20,104,179,116,144,13,118,9,120,9,33,67,26,72,
+    109,183,110,32,158,52,244,80,125,71,172,32,89,234,73,166,
+    182,39,13,253,3,178,117,205,100,90,250,207,56,37,80,115,
+    83,161,83,55,149,116,234,84,157,20,59,14,164,119,79,239,
+    189,227,221,251,238,251,78,247,19,86,134,122,19,175,119,18,
+    247,9,8,16,228,64,55,139,168,11,18,28,1,145,62,2,
+    145,169,52,149,1,190,202,139,70,83,38,202,9,24,234,47,
+    177,48,16,71,149,222,42,174,178,192,125,155,226,82,48,17,
+    1,83,34,162,15,153,10,145,76,85,2,154,35,242,20,37,
+    168,104,209,118,138,204,60,45,92,20,225,158,65,20,162,78,
+    165,100,183,180,228,80,34,185,132,67,158,63,232,246,41,115,
+    45,231,208,115,45,123,48,217,10,108,183,238,123,31,40,171,
+    135,89,1,147,180,82,235,247,39,218,41,117,27,187,187,119,
+    58,120,62,160,97,199,35,116,162,238,52,106,207,95,76,180,
+    230,192,14,109,203,217,14,169,235,83,102,133,67,70,59,70,
+    153,23,48,30,88,46,197,152,151,48,118,61,50,116,68,190,
+    134,241,251,161,229,220,84,148,112,236,83,94,234,141,70,184,
+    79,45,66,25,47,138,188,231,88,65,192,215,142,199,7,246,
+    128,188,166,97,223,35,188,44,10,116,228,123,44,12,184,122,
+    108,49,203,229,229,238,237,145,92,179,51,30,120,133,199,23,
+    184,22,226,255,62,9,88,175,126,171,244,142,160,154,63,102,
+    226,215,166,206,72,190,160,149,184,104,57,231,101,61,58,156,
+    63,170,69,173,249,195,103,81,243,135,246,244,124,239,162,120,
+    169,85,174,180,202,108,189,26,181,227,28,108,109,127,215,171,
+    223,244,234,231,163,89,163,117,169,183,175,244,246,76,217,200,
+    140,105,11,240,142,161,240,162,219,168,249,130,124,162,47,73,
+    79,108,247,205,187,51,218,11,121,113,153,102,108,214,133,75,
+    91,31,11,5,133,189,236,10,247,217,102,178,20,143,32,16,
+    207,37,150,17,66,241,75,4,104,115,6,27,153,205,65,159,
+    45,44,46,20,208,43,20,195,253,254,188,249,59,141,127,254,
+    83,79,207,255,7,164,149,206,202,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/power/ThermalDomain.py",
+    "m5.objects.ThermalDomain",
+    embedded_module_data,
+    505,
+    772);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,194 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,229,89,221,111,219,214,21,39,69,125,92,89,148,37,
+    75,78,98,59,182,37,215,159,178,93,39,141,93,55,254,138,
+    209,218,109,154,102,141,187,166,217,58,247,67,211,68,38,113,
+    38,89,26,169,180,137,230,0,126,232,131,155,26,136,81,20,
+    107,30,250,32,12,67,150,182,216,186,231,253,17,3,41,16,
+    144,64,96,64,134,61,12,123,83,150,60,12,197,30,118,206,
+    165,72,235,131,78,212,108,235,58,76,164,126,228,189,231,220,
+    175,243,187,151,231,240,242,207,76,205,207,85,189,62,248,61,
+    192,167,140,192,8,108,138,73,179,235,44,139,247,142,148,35,
+    205,173,115,244,158,75,57,223,48,174,174,55,24,7,115,154,
+    17,156,31,48,130,75,116,223,225,24,230,75,206,172,112,221,
+    67,101,110,144,121,154,100,132,202,8,200,188,77,50,47,149,
+    181,129,204,215,36,107,163,50,30,100,126,145,107,144,249,132,
+    246,243,76,44,240,87,76,196,88,221,255,198,101,81,74,39,
+    82,171,153,116,98,99,19,51,86,82,153,228,79,69,97,237,
+    39,87,196,100,14,50,216,241,100,173,5,88,211,2,61,212,
+    2,34,179,206,10,204,186,3,254,156,192,174,59,5,199,186,
+    75,224,160,5,167,238,171,86,125,46,35,136,249,110,121,35,
+    125,44,155,121,95,148,142,229,140,236,248,38,228,79,93,190,
+    156,239,184,36,166,159,157,159,175,209,62,23,115,235,36,30,
+    223,76,164,197,120,92,111,139,199,211,25,225,106,10,239,249,
+    120,252,103,87,19,169,170,196,153,187,158,21,245,182,228,181,
+    107,241,203,98,66,16,37,221,139,247,201,84,66,150,63,103,
+    30,96,55,191,238,147,165,228,177,253,198,171,173,188,10,173,
+    164,166,178,215,37,15,232,80,152,128,191,220,7,176,109,29,
+    101,95,215,246,106,185,99,114,251,149,114,112,112,251,12,30,
+    82,192,212,175,51,138,211,52,202,187,7,26,197,193,136,110,
+    129,187,3,230,251,210,52,33,115,137,93,247,136,164,224,101,
+    108,126,130,83,112,221,113,128,182,99,159,86,193,13,134,245,
+    232,129,234,32,94,23,229,13,57,151,145,190,238,105,54,110,
+    154,14,16,172,123,168,206,186,102,17,157,200,98,14,77,45,
+    255,197,168,188,178,156,63,94,213,137,74,84,41,177,153,20,
+    39,163,226,181,44,36,101,81,136,110,108,70,207,138,169,247,
+    224,146,21,165,232,15,19,185,220,185,152,79,34,104,15,28,
+    128,212,134,224,67,224,17,252,0,58,255,218,245,23,54,54,
+    133,87,197,220,229,140,160,251,144,28,168,48,35,229,100,221,
+    245,90,66,74,164,117,215,75,169,76,34,167,183,237,183,41,
+    181,99,113,106,231,32,66,200,132,19,200,208,203,13,12,245,
+    34,67,79,35,67,163,219,103,238,133,35,123,139,133,54,53,
+    60,161,133,39,148,208,228,246,217,123,29,135,63,61,250,241,
+    209,50,241,41,254,229,251,156,35,228,126,200,0,108,191,130,
+    135,209,72,232,191,75,102,176,106,245,149,68,54,145,220,0,
+    106,164,48,136,243,135,235,104,219,23,118,98,151,15,161,198,
+    180,73,87,210,16,218,240,245,74,6,86,141,76,249,50,168,
+    123,44,99,210,97,132,35,8,93,8,221,200,162,175,166,133,
+    70,118,122,77,88,182,99,167,207,98,103,204,150,157,208,145,
+    79,39,62,158,160,236,188,0,236,132,145,157,176,123,251,44,
+    30,70,35,189,223,13,118,94,23,47,138,146,136,227,183,97,
+    199,18,234,158,234,170,202,187,78,60,59,117,124,37,127,100,
+    13,108,159,200,109,100,54,129,167,156,152,166,169,171,146,248,
+    77,121,128,103,233,126,97,221,87,83,83,35,31,17,19,190,
+    135,124,156,126,60,31,94,53,60,174,133,199,149,208,196,246,
+    217,138,155,9,119,149,66,131,197,208,96,225,180,242,244,75,
+    106,232,180,22,58,93,75,71,164,145,14,98,210,241,183,111,
+    68,7,205,115,218,228,185,108,242,220,54,121,30,155,60,210,
+    64,185,251,17,148,123,133,182,38,202,125,31,160,123,4,183,
+    185,206,11,126,64,191,208,14,216,46,4,0,3,66,16,48,
+    40,116,0,118,8,33,192,144,16,134,41,210,169,243,181,46,
+    197,152,30,161,186,233,65,5,58,159,16,4,107,25,235,62,
+    72,89,207,98,158,38,204,57,228,133,148,225,141,117,15,220,
+    226,116,210,221,66,230,124,78,204,94,250,121,231,111,79,255,
+    41,255,193,114,126,250,252,70,250,106,138,206,172,168,12,146,
+    232,24,44,119,89,76,102,54,5,57,22,189,152,145,162,85,
+    71,16,149,45,197,36,91,99,0,92,70,24,20,60,168,80,
+    222,114,53,178,45,8,106,234,109,35,123,46,65,110,220,210,
+    105,208,118,216,106,59,14,208,230,108,181,185,3,180,157,182,
+    218,206,3,180,27,150,177,236,165,218,102,208,6,225,216,121,
+    250,143,185,207,233,190,120,210,100,67,134,16,67,170,146,33,
+    67,224,33,80,235,203,160,34,153,172,200,186,155,198,43,50,
+    68,38,158,203,9,25,188,159,36,77,66,149,210,211,8,83,
+    8,199,16,142,3,124,206,234,78,89,76,93,148,177,115,81,
+    186,46,117,146,205,100,145,7,49,127,168,62,4,169,102,95,
+    193,238,222,98,112,185,254,49,112,120,47,119,251,29,53,48,
+    161,5,38,42,12,235,125,170,28,25,216,89,213,248,94,67,
+    242,182,26,24,215,2,227,40,25,40,247,71,119,86,119,215,
+    12,193,186,26,24,211,2,99,40,136,148,123,251,65,240,234,
+    227,234,122,83,13,140,104,129,17,148,244,149,123,122,161,200,
+    217,29,56,42,28,164,105,38,93,246,117,51,199,109,206,156,
+    127,56,113,230,108,49,5,198,238,119,7,254,95,90,41,22,
+    244,174,88,181,172,50,239,188,255,54,176,116,131,189,225,216,
+    98,11,142,199,151,47,112,118,58,91,142,86,202,214,63,21,
+    176,39,45,181,232,180,211,105,173,183,141,45,238,94,131,209,
+    91,179,208,26,61,7,163,231,190,163,163,119,219,182,216,82,
+    111,109,71,239,49,211,48,250,143,222,134,241,220,112,222,112,
+    221,112,111,57,91,234,13,177,211,217,114,181,82,118,203,221,
+    82,159,235,158,27,45,91,201,214,183,180,54,166,38,43,237,
+    130,149,218,204,180,101,37,15,181,146,231,127,218,74,62,219,
+    126,181,52,38,91,43,241,102,26,172,180,0,107,168,181,94,
+    248,109,123,241,68,107,104,119,17,189,200,231,236,185,88,187,
+    52,195,84,31,253,186,239,146,152,91,89,49,222,155,165,40,
+    102,143,50,166,111,24,67,160,254,130,6,240,195,140,233,57,
+    70,152,170,211,144,98,0,49,34,77,99,85,28,56,30,221,
+    137,14,71,231,192,27,233,28,248,42,221,133,233,103,140,203,
+    9,84,145,101,100,60,90,253,25,126,198,185,177,185,145,203,
+    119,212,249,24,204,122,15,132,242,178,3,253,75,153,240,183,
+    252,55,253,31,6,118,3,59,129,123,221,125,90,119,172,194,
+    56,188,203,20,62,60,179,179,178,215,89,230,3,183,214,110,
+    174,169,124,159,198,247,149,248,225,34,63,92,16,74,35,179,
+    197,145,89,117,228,164,54,114,82,229,231,52,126,78,225,231,
+    202,124,176,196,247,22,249,94,149,239,215,248,254,18,63,81,
+    228,39,238,174,124,181,246,197,154,58,185,164,77,46,169,252,
+    41,141,63,165,208,19,26,251,172,15,155,89,164,240,47,183,
+    53,86,228,199,238,134,191,138,124,17,81,99,243,90,108,94,
+    229,23,52,126,65,161,231,189,129,97,109,224,153,10,227,196,
+    129,1,64,253,208,218,161,219,174,134,246,70,138,252,72,57,
+    120,168,20,28,40,6,7,212,224,160,22,28,44,92,40,13,
+    207,22,135,103,213,225,147,218,240,73,120,47,241,183,195,123,
+    137,191,189,66,193,205,248,59,190,193,144,7,134,127,21,193,
+    14,156,162,240,31,236,197,120,145,31,191,59,253,213,242,23,
+    203,234,196,162,54,177,168,242,75,26,191,164,208,243,94,103,
+    215,39,103,209,159,47,80,216,89,109,50,37,118,160,144,43,
+    141,62,87,28,125,78,29,157,211,70,231,84,126,94,227,231,
+    21,122,98,60,96,20,53,226,129,90,223,136,126,141,198,3,
+    69,230,73,227,1,251,53,184,197,110,129,127,188,200,53,123,
+    176,43,150,63,188,98,245,228,160,58,108,252,159,203,86,19,
+    218,106,124,190,225,42,151,102,225,54,230,54,214,57,174,96,
+    221,157,200,102,197,77,65,247,196,179,9,8,14,115,122,200,
+    220,116,73,102,210,217,204,38,100,65,20,89,13,221,229,152,
+    147,46,105,105,1,97,17,97,9,64,198,126,91,171,150,62,
+    15,242,221,117,139,182,246,117,97,15,75,252,152,105,90,188,
+    144,208,72,87,137,68,138,36,82,8,23,196,187,23,148,232,
+    180,74,102,52,50,163,144,25,144,238,130,124,180,68,166,138,
+    100,234,174,172,146,105,141,76,43,100,186,90,199,158,120,251,
+    130,74,6,53,50,168,152,231,255,55,187,244,129,252,60,194,
+    11,8,43,8,171,40,175,82,120,138,121,4,133,248,32,207,
+    119,53,82,104,190,227,253,2,11,196,25,59,6,119,3,37,
+    210,95,36,253,5,174,112,225,238,139,74,228,68,45,79,79,
+    70,96,109,184,104,189,232,253,129,249,247,19,120,209,241,109,
+    209,215,168,217,68,30,125,251,178,35,143,51,200,59,137,48,
+    7,32,99,255,44,218,208,69,55,175,60,235,109,252,51,44,
+    240,22,243,184,149,39,20,124,42,153,212,200,164,66,38,31,
+    203,154,160,146,163,26,57,170,152,231,35,56,195,133,255,109,
+    112,118,208,11,198,193,86,119,26,86,159,178,172,94,107,235,
+    121,123,91,99,16,148,63,220,104,107,99,175,227,151,168,253,
+    188,173,161,119,253,37,210,91,36,189,183,147,133,153,219,111,
+    169,36,166,145,152,66,98,143,54,103,227,94,7,190,127,60,
+    248,196,48,39,11,113,227,42,196,141,16,57,94,177,148,222,
+    99,165,185,218,116,161,182,134,71,152,4,202,88,166,222,159,
+    250,173,150,222,125,177,214,164,199,153,166,57,92,53,169,17,
+    245,201,54,70,69,187,55,236,41,152,174,231,215,168,252,166,
+    97,211,206,238,10,195,121,151,40,128,251,15,132,111,207,124,
+    182,160,4,70,224,44,7,59,63,241,149,130,79,21,131,79,
+    21,102,212,224,152,22,28,83,130,99,152,203,107,193,99,165,
+    224,108,49,56,251,187,156,26,92,212,130,139,74,112,241,239,
+    21,143,89,81,179,169,209,20,116,230,190,206,180,62,115,237,
+    141,213,56,187,247,13,229,144,158,195,145,143,35,208,143,2,
+    251,251,44,52,51,31,174,51,135,177,119,246,27,84,28,97,
+    170,19,172,68,186,138,164,75,37,61,26,233,41,145,129,34,
+    25,176,123,144,158,139,133,159,96,187,220,137,27,114,198,242,
+    192,77,113,35,216,167,113,62,125,31,24,51,89,51,6,208,
+    176,127,59,100,2,242,38,251,217,250,253,219,110,107,255,118,
+    104,251,12,196,128,222,67,59,252,222,187,42,25,210,200,80,
+    153,116,66,226,29,99,28,70,162,78,2,43,103,64,35,3,
+    70,226,71,42,137,104,36,98,36,222,84,73,191,70,250,43,
+    126,15,238,189,87,66,12,223,113,107,225,230,2,152,73,105,
+    95,129,192,147,199,109,121,222,189,189,90,33,109,46,136,223,
+    45,232,234,114,65,84,104,193,140,211,53,4,81,174,9,124,
+    83,178,23,239,170,192,115,120,103,65,155,211,181,132,130,42,
+    240,44,22,107,6,195,82,67,148,27,94,111,75,63,59,149,
+    161,239,91,178,132,179,78,239,218,207,152,170,251,142,41,225,
+    51,64,247,130,56,139,159,157,100,157,135,219,243,27,105,67,
+    170,123,173,91,227,131,32,253,230,68,63,109,68,44,82,234,
+    137,250,154,44,26,31,37,79,73,223,103,140,175,162,242,9,
+    64,136,148,89,182,242,50,203,176,195,10,51,84,123,150,153,
+    19,74,253,89,102,142,40,230,89,102,122,20,243,172,16,142,
+    133,225,54,195,94,236,62,94,30,238,231,182,123,89,119,133,
+    105,134,189,141,251,120,121,184,159,219,115,144,230,245,38,77,
+    194,190,204,86,24,123,68,117,188,62,172,149,116,253,128,197,
+    14,217,227,222,210,125,122,125,120,128,156,218,244,159,184,58,
+    43,175,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/power/ThermalModel.py",
+    "m5.objects.ThermalModel",
+    embedded_module_data,
+    2706,
+    8037);
+
+} // anonymous namespace
+} // namespace gem5
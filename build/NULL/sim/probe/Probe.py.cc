@@ -0,0 +1,53 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,81,49,79,219,64,20,126,231,179,77,18,162,8,
+    8,162,176,85,149,24,2,82,144,144,24,136,42,166,74,168,
+    136,210,72,116,242,114,58,124,7,73,228,179,195,57,72,9,
+    147,135,78,93,58,150,129,161,19,162,234,159,73,165,14,214,
+    77,149,58,117,11,162,83,167,222,217,56,80,53,119,239,190,
+    247,157,159,253,190,239,206,63,225,201,112,30,242,253,158,134,
+    79,192,128,161,0,222,229,25,101,217,10,44,129,61,140,192,
+    130,125,96,248,61,48,155,227,27,12,240,21,23,77,60,155,
+    57,199,208,112,127,153,77,3,41,180,161,161,124,220,21,111,
+    79,122,220,31,248,79,5,237,66,176,157,9,114,240,16,3,
+    207,210,11,51,164,27,89,158,195,221,207,115,48,99,240,82,
+    175,92,112,134,111,44,109,193,154,90,168,48,91,91,112,84,
+    189,45,163,19,126,216,141,7,60,228,50,55,112,185,20,119,
+    197,86,223,20,114,108,118,58,151,107,103,92,236,180,90,51,
+    94,87,213,236,225,27,26,210,51,46,143,26,243,170,68,72,
+    72,5,39,68,85,8,17,17,187,8,12,175,18,114,126,65,
+    131,135,138,61,24,245,185,170,248,195,33,233,112,202,184,84,
+    101,195,253,128,198,177,114,218,84,82,33,205,225,149,171,57,
+    15,7,10,211,112,164,230,68,174,242,5,238,205,49,254,172,
+    196,210,223,122,116,155,25,105,246,71,210,213,197,12,54,245,
+    138,183,53,36,211,153,206,63,79,94,165,139,235,201,65,186,
+    176,153,188,254,81,171,127,140,62,68,87,167,215,189,219,230,
+    183,218,238,247,218,110,178,111,166,172,23,77,142,244,69,149,
+    197,78,179,111,92,197,170,100,168,140,134,35,85,213,108,250,
+    223,50,187,185,242,146,129,236,243,101,227,178,244,50,191,132,
+    61,185,170,183,200,88,58,213,48,193,8,161,201,33,2,180,
+    58,134,103,121,164,176,50,46,34,133,23,227,127,99,226,58,
+    168,53,129,255,225,170,113,103,210,239,25,165,204,199,95,189,
+    4,182,191,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sim/probe/Probe.py",
+    "m5.objects.Probe",
+    embedded_module_data,
+    451,
+    709);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,39 @@
+// this file is auto-generated by util/cpt_upgrader.py
+#include <string>
+#include <set>
+
+namespace gem5
+{
+
+std::set<std::string> version_tags = {
+  "arm-ccregs",
+  "arm-contextidr-el2",
+  "arm-gem5-gic-ext",
+  "arm-gicv2-banked-regs",
+  "arm-hdlcd-upgrade",
+  "arm-miscreg-teehbr",
+  "arm-sve",
+  "arm-sysreg-mapping-ns",
+  "armv8",
+  "cpu-pid",
+  "dvfs-perflevel",
+  "etherswitch",
+  "globals-to-root",
+  "ide-dma-abort",
+  "isa-is-simobject",
+  "memory-per-range",
+  "mempool-sections",
+  "mempool-to-seworkload",
+  "multiple-event-queues",
+  "process-fdmap-rename",
+  "register-files",
+  "remove-arm-cpsr-mode-miscreg",
+  "riscv-dyn-vlen",
+  "riscv-pcstate",
+  "riscv-vext",
+  "ruby-block-size-bytes",
+  "smt-interrupts",
+  "x86-add-tlb",
+};
+
+} // namespace gem5
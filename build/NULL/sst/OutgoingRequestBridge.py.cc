@@ -0,0 +1,58 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,109,82,207,107,219,48,20,150,108,199,137,227,140,117,
+    63,74,50,10,105,232,165,113,97,41,163,180,135,80,6,27,
+    133,209,193,218,144,142,193,124,17,174,37,156,12,59,118,37,
+    135,37,57,229,176,67,143,187,45,199,157,2,99,255,76,58,
+    10,11,58,13,118,218,45,165,61,237,52,41,137,67,203,34,
+    203,223,211,211,123,207,223,247,36,255,6,183,70,106,110,175,
+    247,4,124,1,24,96,232,131,183,210,42,62,12,20,91,129,
+    64,1,175,0,86,63,1,172,17,101,168,2,240,93,77,138,
+    109,21,167,78,128,165,255,145,142,5,57,220,18,96,156,52,
+    131,227,211,15,196,141,221,219,68,122,66,68,167,68,4,216,
+    16,3,91,193,242,35,208,214,176,98,167,20,64,116,172,14,
+    161,160,128,11,138,52,201,124,53,192,146,33,178,13,33,41,
+    59,84,68,190,146,236,122,16,167,238,238,216,38,214,133,200,
+    52,95,61,110,199,94,216,108,121,117,114,214,38,44,126,73,
+    155,216,35,189,34,99,241,118,56,15,33,58,139,161,211,105,
+    176,210,104,244,214,60,18,236,86,171,203,139,239,213,9,139,
+    194,22,35,165,90,72,99,95,93,104,235,21,106,141,46,107,
+    186,142,95,114,48,166,132,177,18,117,90,30,97,149,35,43,
+    199,51,8,181,156,128,32,196,179,8,5,33,110,251,114,157,
+    67,232,172,237,248,243,136,22,119,35,194,179,110,167,131,26,
+    196,193,132,114,67,174,93,223,97,140,231,18,94,73,203,181,
+    72,162,249,78,156,121,72,107,14,117,2,110,188,16,172,117,
+    201,200,211,111,156,142,244,120,62,154,75,66,115,73,104,38,
+    233,27,184,150,162,255,150,24,117,183,229,105,44,237,181,18,
+    117,169,188,196,41,172,139,151,189,23,208,95,60,99,115,163,
+    127,48,126,240,172,255,122,188,242,180,127,248,203,204,159,239,
+    15,238,95,152,229,75,179,44,2,69,235,103,113,231,71,113,
+    103,108,60,60,127,242,185,58,248,120,97,108,94,26,155,163,
+    76,121,180,117,112,165,42,235,250,13,16,48,210,214,102,147,
+    62,78,184,142,44,141,27,193,110,37,146,141,137,214,197,114,
+    241,139,81,45,201,162,143,36,76,139,86,101,51,153,253,217,
+    185,62,167,5,225,194,68,239,68,133,16,78,246,0,44,140,
+    64,126,54,199,96,99,116,119,78,244,12,212,39,224,127,24,
+    28,94,73,115,179,36,52,165,254,7,166,87,228,244,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/sst/OutgoingRequestBridge.py",
+    "m5.objects.OutgoingRequestBridge",
+    embedded_module_data,
+    542,
+    859);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,87 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,221,85,221,107,35,85,20,63,119,62,146,73,147,176,
+    58,102,53,184,238,210,109,155,109,210,181,93,63,217,162,34,
+    46,90,74,101,77,165,59,43,152,151,33,204,204,106,116,102,
+    19,239,76,208,150,8,125,40,88,97,31,22,65,54,143,121,
+    42,132,250,32,62,248,119,36,18,88,25,232,147,248,224,91,
+    164,251,32,11,130,247,220,201,76,99,154,198,66,95,100,39,
+    153,223,220,185,231,220,115,127,231,99,206,253,13,134,46,121,
+    240,60,252,142,193,3,48,193,36,54,56,164,68,28,161,36,
+    16,48,133,29,40,137,166,200,80,18,96,21,76,105,7,76,
+    217,34,123,34,192,190,24,26,41,201,92,22,99,178,184,37,
+    140,200,98,92,166,48,89,226,216,186,56,151,77,49,89,242,
+    216,58,197,76,221,130,66,250,15,124,41,8,190,244,97,149,
+    122,254,212,71,150,225,85,41,142,13,50,228,134,192,110,92,
+    122,152,10,220,32,13,216,138,1,48,3,66,113,43,173,221,
+    252,96,90,187,177,177,186,162,77,231,204,54,180,137,47,127,
+    89,49,189,79,93,52,49,253,88,117,169,113,205,221,116,61,
+    203,49,174,105,182,179,84,219,244,207,177,53,122,176,70,223,
+    88,191,185,66,167,80,149,221,110,154,193,54,252,154,124,190,
+    121,187,155,156,233,72,51,135,72,224,244,108,158,66,54,107,
+    197,53,109,237,134,182,190,193,8,81,38,2,26,71,219,156,
+    15,77,48,244,85,36,16,169,5,28,112,235,185,97,14,23,
+    91,114,55,153,235,72,57,154,68,14,48,194,129,39,246,18,
+    131,111,24,11,11,74,196,132,146,176,11,119,136,73,118,148,
+    146,184,11,95,145,146,132,172,152,187,182,163,149,233,39,150,
+    119,171,106,124,110,121,134,56,100,74,10,221,249,137,193,247,
+    228,1,120,67,206,54,200,30,123,219,143,102,190,22,61,113,
+    130,84,242,228,35,233,103,145,102,67,108,72,123,140,242,126,
+    72,27,8,120,137,35,205,61,118,239,71,111,173,33,27,67,
+    123,137,13,97,212,134,201,130,222,38,197,118,140,231,143,7,
+    144,226,166,126,204,168,58,181,178,231,203,110,189,102,81,95,
+    209,245,202,221,138,167,235,237,152,47,185,150,125,135,42,168,
+    37,153,150,107,248,113,103,83,167,85,219,242,19,53,203,162,
+    131,161,174,27,118,217,117,117,221,197,244,77,227,181,205,51,
+    71,207,51,216,202,142,4,116,41,220,160,128,129,92,103,240,
+    215,54,28,168,151,91,185,174,154,239,169,249,221,248,65,230,
+    74,171,222,205,44,246,50,139,187,137,3,37,117,47,121,127,
+    181,249,113,87,153,239,41,243,29,101,254,119,37,253,109,252,
+    94,252,161,146,253,69,201,54,159,107,205,69,146,224,207,43,
+    160,45,163,39,119,203,142,165,235,254,148,174,59,85,179,110,
+    227,56,165,235,95,212,203,118,32,225,12,253,244,192,3,195,
+    178,109,230,55,161,23,96,80,129,239,4,126,156,11,33,143,
+    148,151,3,202,225,175,47,200,114,190,15,167,3,206,141,155,
+    58,67,137,158,15,62,253,39,184,80,233,211,24,38,21,225,
+    89,204,197,216,194,186,52,54,12,81,121,189,130,138,47,32,
+    240,152,95,68,152,129,127,39,54,23,194,203,56,152,141,148,
+    113,234,12,9,82,25,167,53,70,162,82,102,252,198,100,7,
+    99,193,179,243,51,252,223,179,99,146,31,70,142,163,65,43,
+    17,139,90,129,248,137,138,171,187,213,58,53,44,214,88,120,
+    79,225,221,5,149,233,51,8,25,24,164,107,66,34,47,28,
+    15,87,148,197,55,49,76,26,12,154,196,92,235,118,87,189,
+    218,83,175,98,147,152,109,173,116,51,11,189,204,194,169,154,
+    196,143,115,29,37,219,85,174,247,148,235,157,240,63,161,50,
+    242,33,188,1,227,63,249,101,252,158,79,3,193,38,104,234,
+    12,21,149,141,106,253,9,175,43,186,128,209,122,17,38,22,
+    204,229,147,162,17,149,205,123,168,187,8,19,63,254,151,66,
+    120,23,7,75,145,50,78,21,11,9,63,225,188,190,84,43,
+    211,178,227,6,245,140,61,117,232,240,228,135,2,111,32,249,
+    200,90,44,50,130,59,60,86,222,10,142,157,183,233,171,220,
+    65,182,255,223,12,250,34,33,164,255,154,72,132,62,252,55,
+    164,8,153,237,67,4,10,33,87,112,52,0,37,70,216,201,
+    114,28,238,155,127,226,227,209,209,172,122,130,102,243,253,49,
+    154,203,56,26,133,102,6,53,151,31,29,205,158,168,185,53,
+    170,25,1,15,207,63,155,156,33,161,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/systemc/Tlm.py",
+    "m5.objects.Tlm",
+    embedded_module_data,
+    1002,
+    2937);
+
+} // anonymous namespace
+} // namespace gem5
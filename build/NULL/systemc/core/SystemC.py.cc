@@ -0,0 +1,87 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,133,85,203,111,27,69,24,159,217,151,159,77,156,56,
+    42,40,33,16,210,72,149,161,56,57,208,75,26,229,0,21,
+    184,169,154,32,204,165,150,208,106,179,51,105,156,238,198,102,
+    118,141,108,171,72,11,178,4,135,30,42,113,224,218,83,68,
+    21,206,136,63,35,72,61,68,115,138,196,137,219,90,241,169,
+    39,230,155,245,250,25,210,93,239,111,30,223,60,126,223,247,
+    253,102,252,15,26,121,244,126,121,121,36,224,55,68,16,193,
+    14,114,113,5,187,74,69,193,72,65,95,34,162,116,16,81,
+    41,62,81,17,58,85,227,137,21,85,218,52,97,211,167,108,
+    154,180,25,194,150,160,218,132,77,39,201,50,42,164,254,133,
+    70,65,225,169,114,213,221,219,63,162,182,207,83,118,179,249,
+    136,250,135,53,98,143,82,196,49,197,69,73,145,162,10,38,
+    168,162,136,79,37,184,162,17,69,44,169,138,37,53,62,83,
+    110,121,62,117,63,55,31,82,118,76,157,246,172,103,155,79,
+    168,123,119,115,179,223,113,211,147,3,236,117,187,198,232,250,
+    83,217,89,60,60,220,45,24,60,105,154,199,150,75,77,147,
+    167,77,211,173,145,134,3,245,172,105,126,215,176,156,190,69,
+    243,91,117,42,105,154,182,99,121,30,79,67,245,144,90,132,
+    178,87,232,18,72,190,89,242,152,189,62,182,77,159,84,177,
+    222,98,134,24,33,225,150,248,188,101,1,193,224,61,207,44,
+    5,247,207,115,31,6,15,206,231,10,193,14,188,108,38,30,
+    63,22,16,45,14,72,251,154,128,84,12,162,85,18,10,162,
+    201,19,49,234,116,48,249,101,10,93,241,16,189,131,104,250,
+    40,19,183,239,163,241,89,39,34,9,167,113,34,68,70,136,
+    38,2,110,240,92,28,240,178,29,229,240,155,246,188,136,57,
+    184,189,185,41,42,53,217,217,94,142,227,65,155,126,20,147,
+    129,13,162,111,227,17,38,224,28,136,229,114,69,58,87,69,
+    207,208,183,153,31,240,51,124,52,36,139,58,232,87,229,121,
+    86,80,192,83,74,249,0,230,26,40,18,115,25,189,194,187,
+    236,70,164,52,108,113,252,212,83,68,99,101,133,205,66,174,
+    146,91,142,229,238,19,107,187,189,54,233,72,113,139,84,109,
+    223,174,185,245,237,98,60,106,11,146,102,200,164,253,190,22,
+    32,153,157,2,230,26,168,67,172,175,20,55,184,225,74,253,
+    142,237,146,30,46,213,94,186,102,159,123,176,252,134,92,62,
+    68,106,42,61,132,139,220,205,80,69,55,242,207,31,158,45,
+    22,197,47,84,199,204,17,145,44,75,128,90,146,0,144,99,
+    150,22,192,147,214,190,231,51,203,246,25,228,150,101,101,31,
+    168,118,223,242,40,55,156,154,109,57,30,55,26,117,98,249,
+    148,65,224,121,6,204,180,89,175,49,223,147,177,139,100,8,
+    190,176,185,24,238,0,89,103,66,192,203,66,192,179,249,160,
+    116,158,91,3,21,111,4,59,97,26,229,22,130,146,40,244,
+    76,240,197,143,165,78,233,231,189,159,246,66,101,224,217,226,
+    173,215,139,235,161,46,170,93,104,247,0,186,170,174,27,61,
+    36,32,28,135,136,200,220,255,158,135,157,107,207,131,56,11,
+    9,162,17,253,15,227,68,164,231,84,25,200,41,209,153,80,
+    123,37,25,221,81,163,250,126,36,175,132,9,125,71,247,196,
+    213,250,142,108,66,223,60,197,232,1,101,244,216,166,60,11,
+    215,145,184,147,252,175,68,116,133,102,242,140,250,13,118,108,
+    126,111,57,13,106,214,107,78,213,110,69,249,1,81,217,234,
+    136,151,56,62,24,67,113,179,5,136,135,148,183,202,53,143,
+    58,7,60,81,61,144,83,185,90,165,77,79,149,50,140,116,
+    200,19,253,109,219,239,78,122,85,236,91,74,144,212,132,76,
+    234,197,108,254,23,95,198,123,183,144,186,74,89,236,61,128,
+    129,168,24,36,129,125,28,243,25,145,204,106,12,159,193,234,
+    95,191,85,50,23,250,76,240,248,229,189,191,222,63,211,75,
+    127,235,165,215,122,41,84,176,190,16,34,1,93,21,25,15,
+    240,88,151,132,104,187,85,201,214,224,89,247,110,113,240,175,
+    34,53,29,177,51,6,10,94,157,230,41,46,131,40,99,219,
+    236,147,126,180,189,63,5,132,42,198,56,252,84,197,138,16,
+    236,91,97,94,197,31,65,109,18,94,60,238,66,209,27,246,
+    206,231,177,16,245,52,188,104,117,161,232,13,123,239,36,177,
+    240,114,26,206,222,185,221,133,178,119,133,77,250,245,31,102,
+    22,212,92,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/systemc/core/SystemC.py",
+    "m5.objects.SystemC",
+    embedded_module_data,
+    995,
+    2025);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,62 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,157,82,191,111,211,64,20,190,59,219,113,26,135,130,
+    154,86,13,3,96,81,150,8,53,145,10,108,8,9,53,136,
+    137,12,233,230,229,100,249,174,105,36,219,105,207,14,82,170,
+    12,29,58,116,96,71,98,100,168,132,250,207,36,82,42,85,
+    94,17,3,155,81,152,58,241,238,28,231,7,21,11,62,251,
+    59,223,189,123,223,251,238,189,247,29,45,61,250,108,158,182,
+    0,62,35,134,24,246,145,131,97,38,62,10,136,67,2,205,
+    209,2,221,209,3,195,49,48,34,232,61,98,218,57,98,250,
+    37,65,232,138,228,52,78,129,25,231,200,49,59,136,21,190,
+    98,167,200,240,1,170,153,63,165,169,85,211,19,51,242,104,
+    224,118,195,164,50,251,161,130,71,125,63,166,94,143,241,100,
+    227,175,205,40,22,202,35,238,6,220,91,22,139,115,177,155,
+    74,44,87,66,29,194,48,132,214,24,129,144,90,82,62,240,
+    62,0,87,91,81,121,218,146,183,20,43,215,211,167,202,123,
+    136,135,136,206,141,67,2,171,156,31,210,0,92,184,85,35,
+    137,174,20,154,1,143,34,183,195,129,95,143,184,127,40,74,
+    112,72,88,0,145,100,180,109,251,246,81,36,188,70,52,136,
+    98,30,120,141,227,65,124,212,11,243,101,253,120,144,20,41,
+    237,134,221,152,210,211,173,101,129,245,124,251,153,228,146,215,
+    58,67,55,155,213,11,253,211,218,205,246,99,152,202,23,48,
+    166,121,30,129,37,116,3,78,105,82,162,52,232,177,190,47,
+    255,203,148,158,244,93,63,179,136,117,56,251,13,137,251,82,
+    225,61,9,197,28,118,100,140,29,21,35,31,41,33,198,147,
+    20,221,133,204,95,122,173,84,192,200,115,216,86,57,140,241,
+    194,20,47,229,250,18,190,171,133,197,248,151,101,181,137,100,
+    206,79,247,218,60,22,93,254,145,219,110,200,108,193,227,190,
+    8,237,248,136,219,89,115,68,118,239,208,22,253,48,236,134,
+    29,123,214,55,53,45,187,163,236,101,33,99,137,138,132,121,
+    6,146,245,213,6,19,91,176,89,147,201,176,85,50,126,88,
+    219,215,213,231,227,234,238,164,186,123,221,120,59,110,236,79,
+    26,251,99,171,57,177,154,35,189,169,120,32,132,188,158,40,
+    72,80,238,107,137,69,131,87,245,89,137,19,13,22,217,145,
+    133,138,194,60,251,210,35,49,41,117,125,31,42,180,170,238,
+    182,248,58,171,228,27,241,16,101,61,30,125,1,72,53,140,
+    113,250,18,225,202,8,109,100,111,74,12,76,82,244,127,240,
+    64,195,80,218,187,240,75,194,239,197,94,153,224,119,24,122,
+    96,129,37,100,189,24,149,246,224,61,51,229,80,218,255,0,
+    93,253,239,70,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/systemc/python/systemc.py",
+    "m5.systemc",
+    embedded_module_data,
+    596,
+    1094);
+
+} // anonymous namespace
+} // namespace gem5
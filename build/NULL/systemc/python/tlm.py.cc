@@ -0,0 +1,43 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,123,204,128,4,152,160,244,103,53,32,49,157,33,133,
+    33,133,49,135,33,138,17,72,51,229,48,228,50,69,49,49,
+    50,164,48,183,48,68,49,167,176,164,51,70,177,164,48,6,
+    51,104,178,190,4,233,240,211,100,188,37,84,146,147,27,159,
+    158,147,159,148,152,19,95,88,154,152,87,82,154,155,140,110,
+    58,51,200,116,13,176,233,37,140,8,169,44,56,123,25,16,
+    175,134,139,3,205,103,244,211,100,42,2,105,187,197,145,153,
+    87,92,146,152,151,156,186,146,225,51,72,242,151,100,113,81,
+    178,126,113,101,113,73,106,110,178,126,65,101,73,70,126,158,
+    62,208,13,122,5,149,183,164,49,221,18,15,211,94,196,9,
+    212,44,7,196,197,130,64,162,129,225,46,183,236,21,110,181,
+    139,220,26,87,184,53,46,176,104,20,177,3,69,193,106,52,
+    89,111,113,199,231,154,234,65,173,184,197,12,228,128,157,2,
+    150,189,197,30,31,159,152,147,19,31,95,196,6,18,2,235,
+    226,0,57,139,195,38,55,63,165,52,39,213,174,136,23,200,
+    5,249,172,216,9,72,124,96,102,100,100,252,96,194,192,40,
+    124,129,65,8,130,110,48,104,93,64,69,31,216,24,25,53,
+    63,48,192,9,14,6,30,205,11,92,154,13,236,32,8,182,
+    3,0,167,144,98,70,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/systemc/python/tlm.py",
+    "m5.tlm",
+    embedded_module_data,
+    294,
+    433);
+
+} // anonymous namespace
+} // namespace gem5
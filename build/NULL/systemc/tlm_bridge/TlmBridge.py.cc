@@ -0,0 +1,117 @@
+/**
+ * DO NOT EDIT THIS FILE!
+ * File automatically generated by
+ *   build_tools/marshal.py:117
+ */
+
+#include "python/embedded.hh"
+
+namespace gem5
+{
+namespace
+{
+
+const std::uint8_t embedded_module_data[] = {
+    120,156,189,87,221,111,211,86,20,191,78,210,124,56,233,71,
+    18,104,11,180,52,208,141,146,82,26,154,132,210,150,170,2,
+    10,131,178,81,161,54,26,82,132,228,185,241,85,26,150,143,
+    98,187,19,237,94,162,137,7,52,105,218,219,198,195,30,120,
+    66,66,252,51,14,138,180,202,79,72,123,226,45,136,60,245,
+    105,231,220,196,249,112,220,48,38,53,113,252,243,245,249,93,
+    219,247,252,206,185,199,215,255,144,150,95,95,253,248,233,23,
+    142,144,63,137,68,36,46,75,114,92,146,227,176,109,203,218,
+    114,246,164,61,231,72,58,216,185,61,219,151,168,29,157,9,
+    98,35,119,137,228,120,78,164,62,202,189,182,19,242,214,110,
+    220,52,233,98,156,19,56,87,7,231,102,156,27,56,15,117,
+    153,56,15,227,120,224,188,29,28,207,56,31,112,253,29,156,
+    151,113,3,192,13,118,112,62,198,13,1,231,239,224,250,25,
+    23,0,46,72,221,38,110,128,113,39,128,59,217,193,13,50,
+    110,24,184,145,14,110,136,113,163,192,157,234,224,252,140,59,
+    13,220,153,14,46,32,141,109,146,240,248,7,60,9,115,250,
+    208,230,158,162,210,220,170,176,153,122,80,144,118,179,52,108,
+    211,3,137,108,110,45,159,81,51,162,90,144,55,11,169,31,
+    169,170,15,130,45,33,202,105,170,214,12,112,41,55,157,106,
+    13,177,195,8,241,31,4,67,76,73,146,147,72,210,6,187,
+    93,226,146,14,201,150,236,147,236,73,39,117,189,114,19,139,
+    31,245,60,225,141,182,228,120,109,131,65,219,90,133,167,62,
+    169,239,53,36,207,91,174,41,43,29,120,53,104,117,175,52,
+    36,133,233,14,67,146,11,220,118,235,193,187,52,119,53,81,
+    0,111,110,201,25,41,77,111,137,10,77,236,143,41,41,33,
+    13,196,210,146,5,125,120,78,97,26,165,34,106,54,39,108,
+    49,123,4,123,11,106,65,0,211,236,246,182,238,172,117,217,
+    15,160,61,36,83,101,167,144,87,104,104,167,32,171,251,23,
+    111,74,18,88,20,170,132,20,42,255,68,165,208,214,94,72,
+    221,206,40,140,158,82,66,137,239,30,132,148,140,68,215,195,
+    126,221,45,8,121,49,71,5,65,231,5,33,199,34,2,109,
+    159,32,60,221,21,179,117,198,161,238,237,80,221,45,110,41,
+    170,44,166,84,221,147,122,246,76,72,101,69,69,209,121,108,
+    110,83,81,162,178,222,247,80,148,197,156,238,172,69,88,119,
+    194,41,205,171,186,93,204,239,201,40,181,238,219,168,143,243,
+    33,140,67,119,224,208,117,239,247,52,5,81,175,93,234,193,
+    145,111,136,249,52,213,189,34,52,5,25,219,202,27,242,9,
+    53,61,156,84,228,84,196,66,155,134,122,179,59,123,50,6,
+    155,193,36,236,202,22,64,177,177,29,120,67,197,219,7,131,
+    193,226,189,131,161,217,226,218,129,63,94,188,255,190,63,240,
+    251,227,95,31,191,188,240,215,244,171,237,82,127,164,220,31,
+    41,126,243,222,59,242,98,89,27,157,41,121,47,151,189,151,
+    225,154,192,248,223,129,169,119,129,169,3,55,175,249,230,63,
+    218,109,65,103,149,0,20,191,197,77,30,51,30,106,157,161,
+    79,122,150,161,146,19,178,206,165,7,113,246,20,48,183,172,
+    179,206,130,182,204,58,108,66,210,225,69,144,117,44,138,251,
+    254,122,202,61,221,165,138,202,82,106,61,60,32,123,81,1,
+    31,66,63,194,0,2,206,21,121,8,193,143,16,64,8,34,
+    156,64,56,137,192,242,194,187,81,187,25,166,133,60,130,230,
+    51,8,76,212,113,132,9,3,230,48,166,119,255,111,76,135,
+    95,92,215,70,166,75,222,75,101,239,165,226,109,220,106,207,
+    152,56,50,112,11,22,129,75,183,132,14,130,224,146,28,16,
+    134,246,224,184,235,97,240,155,102,119,44,122,120,114,55,175,
+    100,210,121,152,148,153,188,26,186,181,150,120,180,118,59,113,
+    239,232,130,176,28,139,174,200,30,184,233,135,16,78,129,19,
+    56,119,51,70,173,12,41,172,54,174,191,241,88,233,175,7,
+    113,114,66,72,119,178,162,74,133,29,156,98,74,75,60,208,
+    75,221,14,33,54,203,61,105,192,50,106,176,104,146,251,44,
+    200,125,38,170,157,142,105,142,145,22,201,249,49,141,31,123,
+    185,161,157,187,86,226,23,202,252,66,113,21,183,218,93,39,
+    123,37,240,124,92,254,10,115,244,104,57,231,227,117,57,111,
+    224,192,46,0,172,203,83,22,41,55,99,192,29,108,76,55,
+    200,153,227,114,37,96,26,233,92,116,161,230,203,248,145,190,
+    64,151,186,51,197,238,206,68,12,88,183,10,232,68,91,64,
+    35,237,1,221,212,206,47,148,248,197,50,191,216,26,208,72,
+    175,84,136,94,157,255,156,10,208,165,174,2,225,186,170,16,
+    51,224,17,54,230,26,100,172,87,206,92,157,139,126,206,25,
+    232,98,56,99,235,234,204,188,1,63,180,59,51,127,92,206,
+    248,77,239,140,88,212,60,213,76,29,88,229,10,225,152,190,
+    6,56,244,99,229,82,217,138,174,123,217,146,47,146,182,215,
+    6,46,229,229,176,133,4,139,6,100,12,247,254,75,153,58,
+    245,34,242,242,188,118,118,174,196,71,203,124,180,53,169,23,
+    123,37,93,103,149,50,75,135,85,138,73,119,25,97,137,101,
+    193,117,11,9,86,26,128,251,114,131,92,57,182,148,54,141,
+    212,162,74,153,125,97,85,138,57,115,165,187,51,55,12,248,
+    217,42,158,71,85,41,140,231,164,54,17,45,241,177,50,31,
+    107,141,231,141,94,137,96,81,164,204,34,176,34,197,68,136,
+    119,23,97,213,128,231,216,184,217,32,87,123,229,140,69,145,
+    50,59,195,138,20,115,230,90,119,103,238,24,240,91,187,51,
+    104,90,15,7,245,0,44,43,11,91,79,224,11,64,153,173,
+    127,23,202,248,229,168,15,180,16,240,116,182,84,97,133,64,
+    247,0,83,91,201,232,110,108,202,133,103,245,53,63,91,36,
+    178,165,11,123,119,179,119,30,43,249,172,84,46,26,211,162,
+    150,102,171,141,225,181,15,249,208,189,92,251,8,90,145,239,
+    195,41,174,172,149,12,136,86,177,115,28,87,137,19,238,138,
+    70,34,173,255,138,205,206,217,42,228,243,224,38,220,168,70,
+    70,106,255,3,50,172,25,255,138,211,203,57,43,164,19,180,
+    211,211,31,241,88,109,154,199,220,220,76,133,116,2,235,10,
+    199,106,211,60,236,228,22,43,164,19,180,209,75,31,241,88,
+    109,154,3,95,212,117,9,91,102,208,78,205,96,215,165,106,
+    211,124,108,93,99,216,50,67,125,172,177,106,211,252,101,93,
+    227,216,50,67,125,0,241,106,211,124,60,93,27,192,82,241,
+    95,118,228,34,210,
+};
+EmbeddedPython embedded_module_info(
+    "/root/package/src/systemc/tlm_bridge/TlmBridge.py",
+    "m5.objects.TlmBridge",
+    embedded_module_data,
+    1477,
+    4811);
+
+} // anonymous namespace
+} // namespace gem5
@@ -0,0 +1,121 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Measure the write throughput of the HDF5 stats output.
+
+The script builds a system of memory testers (the number of testers
+scales the number of stats), simulates for a fixed interval between
+dumps and times every stat dump. Only the HDF5 output is attached, so
+the time spent in m5.stats.dump() is the cost of the HDF5 backend.
+
+Compare configurations by running the script once per set of output
+parameters, e.g.:
+
+    for p in "" "chunking=0" "chunking=0;shuffle=True" \\
+             "chunking=0;compression='lzf'" \\
+             "chunking=0;include=['system.tester*.numReads']"; do
+        build/ALL/gem5.opt configs/example/hdf5_stats_bench.py \\
+            --dumps 2000 --params "$p"
+    done
+"""
+
+import argparse
+import os
+import time
+
+import m5
+from m5.objects import *
+
+parser = argparse.ArgumentParser(
+    formatter_class=argparse.ArgumentDefaultsHelpFormatter
+)
+parser.add_argument(
+    "--testers", type=int, default=64, help="Number of memory testers"
+)
+parser.add_argument(
+    "--dumps", type=int, default=1000, help="Number of stat dumps"
+)
+parser.add_argument(
+    "--interval",
+    type=str,
+    default="1us",
+    help="Simulated time between stat dumps",
+)
+parser.add_argument(
+    "--file", type=str, default="stats.h5", help="HDF5 stats file name"
+)
+parser.add_argument(
+    "--params",
+    type=str,
+    default="",
+    help="HDF5 output parameters, e.g. \"chunking=0;compression='lzf'\"",
+)
+
+args = parser.parse_args()
+
+system = System(physmem=SimpleMemory(), membus=SystemXBar())
+system.voltage_domain = VoltageDomain(voltage="1V")
+system.clk_domain = SrcClockDomain(
+    clock="1GHz", voltage_domain=system.voltage_domain
+)
+system.tester = [
+    MemTest(max_loads=0, progress_interval=0) for _ in range(args.testers)
+]
+for tester in system.tester:
+    tester.port = system.membus.cpu_side_ports
+system.membus.mem_side_ports = system.physmem.port
+system.system_port = system.membus.cpu_side_ports
+
+root = Root(full_system=False, system=system)
+root.system.mem_mode = "timing"
+
+# Only time the HDF5 output; drop the default text output.
+m5.stats.outputList.clear()
+url = f"h5://{args.file}"
+if args.params:
+    url += f"?{args.params}"
+m5.stats.addStatVisitor(url)
+
+m5.instantiate()
+
+interval = m5.ticks.fromSeconds(m5.util.convert.anyToLatency(args.interval))
+dump_time = 0.0
+for _ in range(args.dumps):
+    m5.simulate(interval)
+    start = time.perf_counter()
+    m5.stats.dump()
+    dump_time += time.perf_counter() - start
+
+path = os.path.join(m5.options.outdir, args.file)
+size = os.path.getsize(path)
+
+print(f"Output:         {url}")
+print(f"Dumps:          {args.dumps}")
+print(f"Dump time:      {dump_time:.3f} s")
+print(f"Dumps/s:        {args.dumps / dump_time:.1f}")
+print(f"File size:      {size / (1 << 20):.2f} MiB")
+print(f"Bytes per dump: {size / args.dumps:.0f}")
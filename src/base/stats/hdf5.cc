@@ -37,10 +37,16 @@
 
 #include "base/stats/hdf5.hh"
 
+#include <fnmatch.h>
+
+#include <algorithm>
+#include <fstream>
+
 #include "base/logging.hh"
 #include "base/stats/info.hh"
 #include "base/trace.hh"
 #include "debug/Stats.hh"
+#include "sim/cur_tick.hh"
 
 namespace gem5
 {
@@ -62,16 +68,51 @@ bool emptyStrings(const T &labels)
 namespace statistics
 {
 
+namespace
+{
+
+/** Name of the data set holding the tick of each dump. */
+const char *dumpTickName = "dumpTick";
+
+/** Filter ID registered for LZF (provided by an HDF5 filter plugin). */
+const H5Z_filter_t lzfFilter = 32000;
+
+/** Target size of an automatically sized chunk. */
+const hsize_t autoChunkBytes = 64 * 1024;
+
+/** Largest automatic chunk (in dumps) if the dump count is unknown. */
+const hsize_t autoChunkMaxDumps = 1024;
+
+} // anonymous namespace
+
 Hdf5::Hdf5(const std::string &file, unsigned chunking,
-           bool desc, bool formulas)
+           bool desc, bool formulas,
+           const std::string &_compression, unsigned level,
+           bool shuffle, unsigned dumps,
+           const std::vector<std::string> &include,
+           const std::vector<std::string> &exclude,
+           bool append)
     : fname(file), timeChunk(chunking),
       enableDescriptions(desc), enableFormula(formulas),
+      compression(_compression), compressionLevel(level),
+      shuffleBytes(shuffle),
+      expectedDumps(dumps), includes(include), excludes(exclude),
+      appendFile(append), createdDataSet(false),
       dumpCount(0)
 {
     // Tell the library not to print exceptions by default. There are
     // cases where we rely on exceptions to determine if we need to
     // create a node or if we can just open it.
     H5::Exception::dontPrint();
+
+    fatal_if(compression != "none" && compression != "gzip" &&
+             compression != "lzf",
+             "Unknown HDF5 stat compression '%s'.\n", compression);
+    fatal_if(compression == "gzip" && compressionLevel > 9,
+             "Illegal HDF5 gzip compression level %d.\n", compressionLevel);
+    fatal_if(compression == "lzf" && H5Zfilter_avail(lzfFilter) <= 0,
+             "The HDF5 LZF filter is not available, make sure the plugin "
+             "can be found through HDF5_PLUGIN_PATH.\n");
 }
 
 Hdf5::~Hdf5()
@@ -82,10 +123,18 @@ Hdf5::~Hdf5()
 void
 Hdf5::begin()
 {
-    h5File = H5::H5File(fname,
-                        // Truncate the file if this is the first dump
-                        dumpCount > 0 ? H5F_ACC_RDWR : H5F_ACC_TRUNC);
-    path.push(h5File.openGroup("/"));
+    if (dumpCount > 0) {
+        h5File = H5::H5File(fname, H5F_ACC_RDWR);
+    } else if (appendFile && std::ifstream(fname).good()) {
+        resume();
+    } else {
+        // Truncate the file if this is the first dump
+        h5File = H5::H5File(fname, H5F_ACC_TRUNC);
+    }
+
+    path.clear();
+    groups.clear();
+    groups.push_back(h5File.openGroup("/"));
 }
 
 void
@@ -93,9 +142,69 @@ Hdf5::end()
 {
     assert(valid());
 
+    // Record the tick of every dump so that a resumed run can tell
+    // which of the dumps in the file precede it.
+    const uint64_t tick = curTick();
+    hsize_t dims[1] = { 0, };
+    H5::DataSet data_set;
+    try {
+        data_set = h5File.openDataSet(dumpTickName);
+        resizeDumps(data_set, 1, dims);
+    } catch (const H5::FileIException &e) {
+        hsize_t max_dims[1] = { H5S_UNLIMITED, };
+        hsize_t chunk_dims[1] = { autoChunkMaxDumps, };
+        H5::DSetCreatPropList props;
+        props.setChunk(1, chunk_dims);
+
+        dims[0] = dumpCount + 1;
+        H5::DataSpace fspace(1, dims, max_dims);
+        data_set = h5File.createDataSet(dumpTickName,
+            H5::PredType::NATIVE_UINT64, fspace, props);
+    }
+
+    hsize_t mdims[1] = { 1, };
+    hsize_t foffset[1] = { dumpCount, };
+    H5::DataSpace mspace(1, mdims);
+    H5::DataSpace fspace = data_set.getSpace();
+    fspace.selectHyperslab(H5S_SELECT_SET, mdims, foffset);
+    data_set.write(&tick, H5::PredType::NATIVE_UINT64, mspace, fspace);
+
+    groups.clear();
     dumpCount++;
 }
 
+void
+Hdf5::resume()
+{
+    h5File = H5::H5File(fname, H5F_ACC_RDWR);
+
+    H5::DataSet data_set;
+    try {
+        data_set = h5File.openDataSet(dumpTickName);
+    } catch (const H5::FileIException &e) {
+        warn("Can't resume HDF5 stat file %s without dump ticks, "
+             "truncating it.\n", fname);
+        h5File = H5::H5File(fname, H5F_ACC_TRUNC);
+        return;
+    }
+
+    hsize_t count = 0;
+    data_set.getSpace().getSimpleExtentDims(&count);
+    std::vector<uint64_t> ticks(count);
+    data_set.read(ticks.data(), H5::PredType::NATIVE_UINT64);
+
+    // Keep the dumps that were taken before this point in the
+    // simulation. Later ones (e.g., from a run which continued past
+    // the checkpoint we restored from) are overwritten by this run.
+    const uint64_t now = curTick();
+    dumpCount = std::find_if(ticks.begin(), ticks.end(),
+                             [now](uint64_t t) { return t >= now; }) -
+        ticks.begin();
+
+    DPRINTF(Stats, "Resuming %s after dump %d of %d\n",
+            fname, dumpCount, count);
+}
+
 bool
 Hdf5::valid() const
 {
@@ -106,32 +215,77 @@ Hdf5::valid() const
 void
 Hdf5::beginGroup(const char *name)
 {
-    auto base = path.top();
-
-    // Try to open an existing stat group corresponding to the
-    // name. Create it if it doesn't exist.
-    H5::Group group;
-    try {
-        group = base.openGroup(name);
-    } catch (const H5::FileIException& e) {
-        group = base.createGroup(name);
-    } catch (const H5::GroupIException& e) {
-        group = base.createGroup(name);
-    }
-
-    path.push(group);
+    path.push_back(name);
 }
 
 void
 Hdf5::endGroup()
 {
     assert(!path.empty());
-    path.pop();
+    path.pop_back();
+    if (groups.size() > path.size() + 1)
+        groups.pop_back();
+}
+
+H5::Group &
+Hdf5::currentGroup()
+{
+    while (groups.size() <= path.size()) {
+        const char *name = path[groups.size() - 1].c_str();
+        const H5::Group &base = groups.back();
+
+        // Try to open an existing stat group corresponding to the
+        // name. Create it if it doesn't exist.
+        H5::Group group;
+        try {
+            group = base.openGroup(name);
+        } catch (const H5::FileIException& e) {
+            group = base.createGroup(name);
+        } catch (const H5::GroupIException& e) {
+            group = base.createGroup(name);
+        }
+
+        groups.push_back(group);
+    }
+
+    return groups.back();
+}
+
+bool
+Hdf5::selected(const Info &info)
+{
+    if (includes.empty() && excludes.empty())
+        return true;
+
+    auto it = filterCache.find(info.id);
+    if (it != filterCache.end())
+        return it->second;
+
+    std::string name;
+    for (const auto &group : path)
+        name += group + ".";
+    name += info.name;
+
+    auto matches = [&name](const std::vector<std::string> &patterns) {
+        for (const auto &pattern : patterns) {
+            if (fnmatch(pattern.c_str(), name.c_str(), 0) == 0)
+                return true;
+        }
+        return false;
+    };
+
+    const bool select = (includes.empty() || matches(includes)) &&
+        !matches(excludes);
+    filterCache.emplace(info.id, select);
+    return select;
 }
 
 void
 Hdf5::visit(const ScalarInfo &info)
 {
+    if (!selected(info))
+        return;
+
     // Since this stat is a scalar, we need 1-dimensional value in the
     // stat file. The Hdf5::appendStat helper will populate the size
     // of the first dimension (time).
@@ -144,6 +298,9 @@ Hdf5::visit(const ScalarInfo &info)
 void
 Hdf5::visit(const VectorInfo &info)
 {
+    if (!selected(info))
+        return;
+
     appendVectorInfo(info);
 }
 
@@ -162,13 +319,16 @@ Hdf5::visit(const VectorDistInfo &info)
 void
 Hdf5::visit(const Vector2dInfo &info)
 {
+    if (!selected(info))
+        return;
+
     // Request a 3-dimensional stat, the first dimension will be
     // populated by the Hdf5::appendStat() helper. The remaining two
     // dimensions correspond to the stat instance.
     hsize_t fdims[3] = { 0, info.x, info.y };
     H5::DataSet data_set = appendStat(info, 3, fdims, info.cvec.data());
 
-    if (dumpCount == 0) {
+    if (createdDataSet) {
         if (!info.subnames.empty() && !emptyStrings(info.subnames))
             addMetaData(data_set, "subnames", info.subnames);
 
@@ -183,12 +343,12 @@ Hdf5::visit(const Vector2dInfo &info)
 void
 Hdf5::visit(const FormulaInfo &info)
 {
-    if (!enableFormula)
+    if (!enableFormula || !selected(info))
         return;
 
     H5::DataSet data_set = appendVectorInfo(info);
 
-    if (dumpCount == 0)
+    if (createdDataSet)
         addMetaData(data_set, "equation", info.str());
 }
 
@@ -208,7 +368,7 @@ Hdf5::appendVectorInfo(const VectorInfo &info)
     hsize_t fdims[2] = { 0, vr.size() };
     H5::DataSet data_set = appendStat(info, 2, fdims, vr.data());
 
-    if (dumpCount == 0) {
+    if (createdDataSet) {
         if (!info.subnames.empty() && !emptyStrings(info.subnames))
             addMetaData(data_set, "subnames", info.subnames);
 
@@ -222,20 +382,29 @@ Hdf5::appendVectorInfo(const VectorInfo &info)
 H5::DataSet
 Hdf5::appendStat(const Info &info, int rank, hsize_t *dims, const double *data)
 {
-    H5::Group group = path.top();
+    H5::Group &group = currentGroup();
     H5::DataSet data_set;
     H5::DataSpace fspace;
 
-    dims[0] = dumpCount + 1;
-
-    if (dumpCount > 0) {
+    createdDataSet = false;
+    if (dumpCount > 0 || appendFile) {
         // Get the existing stat if we have already dumped this stat
-        // before.
-        data_set = group.openDataSet(info.name);
-        data_set.extend(dims);
+        // before (possibly in the run we are resuming).
+        try {
+            data_set = group.openDataSet(info.name);
+        } catch (const H5::GroupIException &e) {
+            createdDataSet = true;
+        }
+    } else {
+        createdDataSet = true;
+    }
+
+    if (!createdDataSet) {
+        resizeDumps(data_set, rank, dims);
         fspace = data_set.getSpace();
     } else {
         // We don't have the stat already, create it.
+        dims[0] = dumpCount + 1;
 
         H5::DSetCreatPropList props;
 
@@ -247,11 +416,18 @@ Hdf5::appendStat(const Info &info, int rank, hsize_t *dims, const double *data)
         // Setup chunking
         std::vector<hsize_t> chunk_dims(rank);
         std::copy(dims, dims + rank, chunk_dims.begin());
-        chunk_dims[0] = timeChunk;
+        chunk_dims[0] = chunkDumps(rank, dims);
         props.setChunk(rank, chunk_dims.data());
 
-        // Enable compression
-        props.setDeflate(1);
+        // Enable compression. Shuffling the bytes of the doubles
+        // first groups their exponents, which compress well.
+        if (shuffleBytes && compression != "none")
+            props.setShuffle();
+        if (compression == "gzip") {
+            props.setDeflate(compressionLevel);
+        } else if (compression == "lzf") {
+            props.setFilter(lzfFilter, H5Z_FLAG_OPTIONAL);
+        }
 
         fspace = H5::DataSpace(rank, dims, max_dims.data());
         try {
@@ -283,6 +459,36 @@ Hdf5::appendStat(const Info &info, int rank, hsize_t *dims, const double *data)
     return data_set;
 }
 
+void
+Hdf5::resizeDumps(H5::DataSet &data_set, int rank, hsize_t *dims)
+{
+    std::vector<hsize_t> cur_dims(rank);
+    data_set.getSpace().getSimpleExtentDims(cur_dims.data());
+    dims[0] = dumpCount + 1;
+
+    // Unlike H5::DataSet::extend(), this may also shrink the data
+    // set, which drops dumps left behind by a resumed run.
+    if (dims[0] != cur_dims[0] && H5Dset_extent(data_set.getId(), dims) < 0)
+        throw H5::DataSetIException("Hdf5::resizeDumps", "H5Dset_extent");
+}
+
+hsize_t
+Hdf5::chunkDumps(int rank, const hsize_t *dims) const
+{
+    if (timeChunk > 0)
+        return timeChunk;
+
+    // Size the chunks so that each of them holds about
+    // autoChunkBytes, but not more dumps than we expect.
+    hsize_t dump_bytes = sizeof(double);
+    for (int i = 1; i < rank; ++i)
+        dump_bytes *= std::max<hsize_t>(dims[i], 1);
+
+    const hsize_t max_dumps =
+        expectedDumps > 0 ? expectedDumps : autoChunkMaxDumps;
+    return std::clamp<hsize_t>(autoChunkBytes / dump_bytes, 1, max_dumps);
+}
+
 void
 Hdf5::addMetaData(H5::DataSet &loc, const char *name,
                   const std::vector<const char *> &values)
@@ -329,10 +535,17 @@ Hdf5::addMetaData(H5::DataSet &loc, const char *name, double value)
 
 std::unique_ptr<Output>
 initHDF5(const std::string &filename, unsigned chunking,
-         bool desc, bool formulas)
+         bool desc, bool formulas,
+         const std::string &compression, unsigned level, bool shuffle,
+         unsigned dumps,
+         const std::vector<std::string> &include,
+         const std::vector<std::string> &exclude,
+         bool append)
 {
     return  std::unique_ptr<Output>(
-        new Hdf5(simout.resolve(filename), chunking, desc, formulas));
+        new Hdf5(simout.resolve(filename), chunking, desc, formulas,
+                 compression, level, shuffle, dumps, include, exclude,
+                 append));
 }
 
 }; // namespace statistics
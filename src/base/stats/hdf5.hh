@@ -41,8 +41,8 @@
 #include <H5Cpp.h>
 
 #include <memory>
-#include <stack>
 #include <string>
+#include <unordered_map>
 #include <vector>
 
 #include "base/compiler.hh"
@@ -59,7 +59,30 @@ namespace statistics
 class Hdf5 : public Output
 {
   public:
-    Hdf5(const std::string &file, unsigned chunking, bool desc, bool formulas);
+    /**
+     * @param file Name of the output file.
+     * @param chunking Number of dumps per chunk, 0 to size the chunks
+     *                 of each stat automatically.
+     * @param desc Output stat descriptions.
+     * @param formulas Output derived stats.
+     * @param compression Compression filter: "none", "gzip" or "lzf"
+     *                    (requires the LZF filter plugin).
+     * @param level Compression level (gzip only).
+     * @param shuffle Shuffle the bytes of the values before compressing
+     *                them.
+     * @param dumps Expected number of dumps used to size chunks
+     *              automatically, 0 if unknown.
+     * @param include Glob patterns of the stat paths to output, all
+     *                stats are output if empty.
+     * @param exclude Glob patterns of the stat paths not to output.
+     * @param append Resume an existing file instead of truncating it.
+     */
+    Hdf5(const std::string &file, unsigned chunking, bool desc, bool formulas,
+         const std::string &compression = "gzip", unsigned level = 1,
+         bool shuffle = false, unsigned dumps = 0,
+         const std::vector<std::string> &include = {},
+         const std::vector<std::string> &exclude = {},
+         bool append = false);
 
     ~Hdf5();
 
@@ -83,6 +106,33 @@ class Hdf5 : public Output
     void visit(const SparseHistInfo &info) override;
 
   protected:
+    /**
+     * Open (or create) the groups on the current path that have not
+     * been materialized yet and return the innermost one. Groups are
+     * created lazily so that stat subsetting doesn't leave empty
+     * groups behind.
+     */
+    H5::Group &currentGroup();
+
+    /**
+     * Check if a stat in the current group passes the include and
+     * exclude filters. The result is cached per stat.
+     */
+    bool selected(const Info &info);
+
+    /**
+     * Open an existing file and find the number of dumps to keep,
+     * dropping dumps taken at or after the current tick (e.g., dumps
+     * from a run that continued past the checkpoint we restored).
+     */
+    void resume();
+
+    /**
+     * Number of dumps stored in each chunk of a stat with the given
+     * per-dump shape.
+     */
+    hsize_t chunkDumps(int rank, const hsize_t *dims) const;
+
     /**
      * Helper function to append vector stats and set their metadata.
      */
@@ -102,6 +152,12 @@ class Hdf5 : public Output
     H5::DataSet appendStat(const Info &info, int rank, hsize_t *dims,
                            const double *data);
 
+    /**
+     * Resize the dump (time) dimension of a data set to hold the
+     * current dump, shrinking it if a resumed file held more dumps.
+     */
+    void resizeDumps(H5::DataSet &data_set, int rank, hsize_t *dims);
+
     /**
      * Helper function to add a string vector attribute to a stat.
      *
@@ -146,8 +202,24 @@ class Hdf5 : public Output
     const hsize_t timeChunk;
     const bool enableDescriptions;
     const bool enableFormula;
+    const std::string compression;
+    const unsigned compressionLevel;
+    const bool shuffleBytes;
+    const unsigned expectedDumps;
+    const std::vector<std::string> includes;
+    const std::vector<std::string> excludes;
+    const bool appendFile;
+
+    /** Names of the groups on the current path. */
+    std::vector<std::string> path;
+    /** Opened groups, starting at the root; at most path.size() + 1. */
+    std::vector<H5::Group> groups;
+
+    /** Filter decisions per stat ID. */
+    std::unordered_map<int, bool> filterCache;
 
-    std::stack<H5::Group> path;
+    /** Set by appendStat() if the last data set was created. */
+    bool createdDataSet;
 
     unsigned dumpCount;
     H5::H5File h5File;
@@ -155,7 +227,12 @@ class Hdf5 : public Output
 
 std::unique_ptr<Output> initHDF5(
     const std::string &filename,unsigned chunking = 10,
-    bool desc = true, bool formulas = true);
+    bool desc = true, bool formulas = true,
+    const std::string &compression = "gzip", unsigned level = 1,
+    bool shuffle = false, unsigned dumps = 0,
+    const std::vector<std::string> &include = {},
+    const std::vector<std::string> &exclude = {},
+    bool append = false);
 
 } // namespace statistics
 } // namespace gem5
@@ -83,7 +83,7 @@ PhysicalMemory::PhysicalMemory(const std::string& _name,
                                bool auto_unlink_shared_backstore) :
     _name(_name), size(0), mmapUsingNoReserve(mmap_using_noreserve),
     sharedBackstore(shared_backstore), sharedBackstoreSize(0),
-    pageSize(sysconf(_SC_PAGE_SIZE))
+    pageSize(sysconf(_SC_PAGE_SIZE)), blockedImages(false), mapImages(false)
 {
     // Register cleanup callback if requested.
     if (auto_unlink_shared_backstore && !sharedBackstore.empty()) {
@@ -329,6 +329,22 @@ PhysicalMemory::functionalAccess(PacketPtr pkt)
     m->second->functionalAccess(pkt);
 }
 
+void
+PhysicalMemory::setImageFormat(const std::string &format,
+                               const PmemImageOptions &options,
+                               bool map_images)
+{
+    blockedImages = format != "gzip";
+    imageOptions = options;
+    if (blockedImages) {
+        imageOptions.codec = parsePmemCodec(format);
+        fatal_if(!pmemCodecSupported(imageOptions.codec),
+                 "%s: checkpoint memory format '%s' is not supported by "
+                 "this build\n", name(), format);
+    }
+    mapImages = map_images;
+}
+
 void
 PhysicalMemory::serialize(CheckpointOut &cp) const
 {
@@ -366,7 +382,8 @@ PhysicalMemory::serializeStore(CheckpointOut &cp, unsigned int store_id,
     // we cannot use the address range for the name as the
     // memories that are not part of the address map can overlap
     std::string filename =
-        name() + ".store" + std::to_string(store_id) + ".pmem";
+        name() + ".store" + std::to_string(store_id) +
+        (blockedImages ? ".pmem.blk" : ".pmem");
     long range_size = range.size();
 
     DPRINTF(Checkpoint, "Serializing physical memory %s with size %d\n",
@@ -378,6 +395,11 @@ PhysicalMemory::serializeStore(CheckpointOut &cp, unsigned int store_id,
 
     // write memory file
     std::string filepath = CheckpointIn::dir() + "/" + filename.c_str();
+    if (blockedImages) {
+        writePmemImage(filepath, pmem, range.size(), imageOptions);
+        return;
+    }
+
     gzFile compressed_mem = gzopen(filepath.c_str(), "wb");
     if (compressed_mem == NULL)
         fatal("Can't open physical memory checkpoint file '%s'\n",
@@ -443,11 +465,6 @@ PhysicalMemory::unserializeStore(CheckpointIn &cp)
     UNSERIALIZE_SCALAR(filename);
     std::string filepath = cp.getCptDir() + "/" + filename;
 
-    // mmap memoryfile
-    gzFile compressed_mem = gzopen(filepath.c_str(), "rb");
-    if (compressed_mem == NULL)
-        fatal("Can't open physical memory checkpoint file '%s'", filename);
-
     // we've already got the actual backing store mapped
     uint8_t* pmem = backingStore[store_id].pmem;
     AddrRange range = backingStore[store_id].range;
@@ -462,6 +479,26 @@ PhysicalMemory::unserializeStore(CheckpointIn &cp)
         fatal("Memory range size has changed! Saw %lld, expected %lld\n",
               range_size, range.size());
 
+    // As for gzip images below, only the pages which are not zero are
+    // written to the (fresh) backing store
+    if (PmemImage::isPmemImage(filepath)) {
+        PmemImage image(filepath);
+        if (image.size() != range.size())
+            fatal("Memory image '%s' has size %lld, expected %lld\n",
+                  filename, image.size(), range.size());
+        // A private mapping would hide the memory from the other
+        // processes sharing the backing store
+        if (mapImages && sharedBackstore.empty() && image.mapAll(pmem))
+            return;
+        image.readAll(pmem, imageOptions.threads);
+        return;
+    }
+
+    // mmap memoryfile
+    gzFile compressed_mem = gzopen(filepath.c_str(), "rb");
+    if (compressed_mem == NULL)
+        fatal("Can't open physical memory checkpoint file '%s'", filename);
+
     uint64_t curr_size = 0;
     long* temp_page = new long[chunk_size];
     long* pmem_current;
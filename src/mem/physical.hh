@@ -45,6 +45,7 @@
 #include "base/addr_range.hh"
 #include "base/addr_range_map.hh"
 #include "mem/packet.hh"
+#include "mem/pmem_image.hh"
 #include "sim/serialize.hh"
 
 namespace gem5
@@ -162,6 +163,14 @@ class PhysicalMemory : public Serializable
     // system
     std::vector<BackingStoreEntry> backingStore;
 
+    // Write the memory images of checkpoints in the blocked format
+    // rather than as a single gzip stream
+    bool blockedImages;
+    PmemImageOptions imageOptions;
+
+    // Map uncompressed blocked memory images on restore
+    bool mapImages;
+
     // Prevent copying
     PhysicalMemory(const PhysicalMemory&);
 
@@ -198,6 +207,18 @@ class PhysicalMemory : public Serializable
      */
     ~PhysicalMemory();
 
+    /**
+     * Set the format the memory images of checkpoints are written in.
+     *
+     * @param format gzip, or the codec of the blocked format (none, zlib
+     *               or zstd, see mem/pmem_image.hh)
+     * @param options How to write and read blocked images
+     * @param map_images Map uncompressed blocked images on restore
+     *                   rather than reading them
+     */
+    void setImageFormat(const std::string &format,
+                        const PmemImageOptions &options, bool map_images);
+
     /**
      * Return the name for debugging and for creation of sections for
      * checkpointing.
@@ -0,0 +1,489 @@
+/*
+ * Copyright (c) 2026 The Regents of the University of California.
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+#include "mem/pmem_image.hh"
+
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <unistd.h>
+#include <zlib.h>
+
+#include <algorithm>
+#include <atomic>
+#include <cerrno>
+#include <condition_variable>
+#include <cstring>
+#include <mutex>
+#include <thread>
+
+#include "base/intmath.hh"
+#include "base/logging.hh"
+#include "config/have_zstd.hh"
+#include "sim/byteswap.hh"
+
+#if HAVE_ZSTD
+#include <zstd.h>
+
+#endif
+
+namespace gem5
+{
+
+namespace memory
+{
+
+namespace
+{
+
+/** Granularity at which zeros are skipped when restoring a block. */
+constexpr uint64_t ZeroPageSize = 4096;
+
+unsigned
+numThreads(unsigned threads)
+{
+    if (threads)
+        return threads;
+    return std::max(std::thread::hardware_concurrency(), 1U);
+}
+
+bool
+isZero(const uint8_t *data, uint64_t size)
+{
+    return size == 0 ||
+        (data[0] == 0 && std::memcmp(data, data + 1, size - 1) == 0);
+}
+
+void
+writeFully(int fd, const void *data, uint64_t size, uint64_t offset,
+           const std::string &path)
+{
+    auto *bytes = static_cast<const uint8_t *>(data);
+    while (size) {
+        ssize_t written = pwrite(fd, bytes, size, offset);
+        if (written < 0 && errno == EINTR)
+            continue;
+        fatal_if(written <= 0, "Write failed on memory image '%s': %s\n",
+                 path, strerror(errno));
+        bytes += written;
+        offset += written;
+        size -= written;
+    }
+}
+
+bool
+readFully(int fd, void *data, uint64_t size, uint64_t offset)
+{
+    auto *bytes = static_cast<uint8_t *>(data);
+    while (size) {
+        ssize_t read = pread(fd, bytes, size, offset);
+        if (read < 0 && errno == EINTR)
+            continue;
+        if (read <= 0)
+            return false;
+        bytes += read;
+        offset += read;
+        size -= read;
+    }
+    return true;
+}
+
+/**
+ * Compress a block in out. Returns the length of the compressed block,
+ * or of the block itself if it is to be stored uncompressed (in which
+ * case the Raw flag is set).
+ */
+uint64_t
+compressBlock(const PmemImageOptions &options, const uint8_t *data,
+              uint64_t size, std::vector<uint8_t> &out, uint32_t &flags)
+{
+    flags = PmemImageIndexEntry::Raw;
+    switch (options.codec) {
+      case PmemCodec::None:
+        return size;
+      case PmemCodec::Zlib:
+        {
+            uLongf length = compressBound(size);
+            out.resize(length);
+            int level = options.level ? options.level : Z_BEST_SPEED;
+            if (compress2(out.data(), &length, data, size, level) != Z_OK)
+                return size;
+            if (length >= size)
+                return size;
+            flags = 0;
+            return length;
+        }
+#if HAVE_ZSTD
+      case PmemCodec::Zstd:
+        {
+            out.resize(ZSTD_compressBound(size));
+            size_t length = ZSTD_compress(out.data(), out.size(), data,
+                                          size, options.level);
+            if (ZSTD_isError(length) || length >= size)
+                return size;
+            flags = 0;
+            return length;
+        }
+#endif
+      default:
+        panic("Unsupported memory image codec %d\n", int(options.codec));
+    }
+}
+
+} // anonymous namespace
+
+bool
+pmemCodecSupported(PmemCodec codec)
+{
+    switch (codec) {
+      case PmemCodec::None:
+      case PmemCodec::Zlib:
+        return true;
+      case PmemCodec::Zstd:
+        return HAVE_ZSTD;
+      default:
+        return false;
+    }
+}
+
+PmemCodec
+parsePmemCodec(const std::string &name)
+{
+    if (name == "none")
+        return PmemCodec::None;
+    if (name == "zlib")
+        return PmemCodec::Zlib;
+    if (name == "zstd")
+        return PmemCodec::Zstd;
+    fatal("Unknown memory image codec '%s'\n", name);
+}
+
+void
+writePmemImage(const std::string &path, const uint8_t *pmem, uint64_t size,
+               const PmemImageOptions &options)
+{
+    fatal_if(!pmemCodecSupported(options.codec),
+             "Memory image codec %d is not supported by this build\n",
+             int(options.codec));
+    const uint64_t block_size = options.blockSize;
+    fatal_if(block_size == 0 || block_size > UINT32_MAX,
+             "Invalid memory image block size %d\n", block_size);
+
+    int fd = open(path.c_str(), O_WRONLY | O_CREAT | O_TRUNC, 0664);
+    fatal_if(fd < 0, "Can't open memory image '%s': %s\n", path,
+             strerror(errno));
+
+    const unsigned threads = numThreads(options.threads);
+    const uint64_t num_blocks = divCeil(size, block_size);
+    const bool aligned = options.codec == PmemCodec::None;
+
+    // A pool of threads, started once, compresses the blocks while this
+    // thread writes them out in order. Block b is compressed into slot
+    // b % window once block b - window has been written out.
+    const uint64_t window = uint64_t(threads) * 4;
+    std::vector<std::vector<uint8_t>> out(window);
+    std::vector<uint64_t> lengths(window);
+    std::vector<uint32_t> flags(window);
+    std::vector<char> ready(window, 0);
+    uint64_t written = 0;
+    std::mutex mutex;
+    std::condition_variable compressed;
+    std::condition_variable slot_freed;
+
+    std::atomic<uint64_t> next(0);
+    auto work = [&]() {
+        for (uint64_t block = next++; block < num_blocks; block = next++) {
+            const uint64_t slot = block % window;
+            {
+                std::unique_lock<std::mutex> lock(mutex);
+                slot_freed.wait(lock,
+                                [&]() { return block < written + window; });
+            }
+
+            const uint64_t start = block * block_size;
+            const uint64_t length = std::min(block_size, size - start);
+            if (isZero(pmem + start, length))
+                lengths[slot] = 0;
+            else
+                lengths[slot] = compressBlock(options, pmem + start, length,
+                                              out[slot], flags[slot]);
+
+            {
+                std::lock_guard<std::mutex> lock(mutex);
+                ready[slot] = 1;
+            }
+            compressed.notify_one();
+        }
+    };
+
+    std::vector<std::thread> pool;
+    for (uint64_t t = 0; t < std::min<uint64_t>(threads, num_blocks); ++t)
+        pool.emplace_back(work);
+
+    std::vector<PmemImageIndexEntry> index;
+    uint64_t offset = sizeof(PmemImageHeader);
+    for (uint64_t block = 0; block < num_blocks; ++block) {
+        const uint64_t slot = block % window;
+        {
+            std::unique_lock<std::mutex> lock(mutex);
+            compressed.wait(lock, [&]() { return ready[slot] != 0; });
+            ready[slot] = 0;
+        }
+
+        if (lengths[slot]) {
+            if (aligned)
+                offset = divCeil(offset, block_size) * block_size;
+            const bool raw = flags[slot] & PmemImageIndexEntry::Raw;
+            writeFully(fd,
+                       raw ? pmem + block * block_size : out[slot].data(),
+                       lengths[slot], offset, path);
+            index.push_back({htole(block), htole(offset),
+                             htole(uint32_t(lengths[slot])),
+                             htole(flags[slot])});
+            offset += lengths[slot];
+        }
+
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            written = block + 1;
+        }
+        slot_freed.notify_all();
+    }
+    for (auto &thread : pool)
+        thread.join();
+
+    writeFully(fd, index.data(), index.size() * sizeof(index[0]), offset,
+               path);
+
+    PmemImageHeader header;
+    std::memcpy(header.magic, PmemImageHeader::Magic, sizeof(header.magic));
+    header.version = htole(PmemImageHeader::Version);
+    header.codec = htole(uint32_t(options.codec));
+    header.blockSize = htole(block_size);
+    header.size = htole(size);
+    header.indexOffset = htole(offset);
+    header.blocks = htole(uint64_t(index.size()));
+    writeFully(fd, &header, sizeof(header), 0, path);
+
+    fatal_if(close(fd), "Close failed on memory image '%s': %s\n", path,
+             strerror(errno));
+}
+
+bool
+PmemImage::isPmemImage(const std::string &path)
+{
+    int fd = open(path.c_str(), O_RDONLY);
+    if (fd < 0)
+        return false;
+    char magic[sizeof(PmemImageHeader::Magic)];
+    bool is_image = readFully(fd, magic, sizeof(magic), 0) &&
+        std::memcmp(magic, PmemImageHeader::Magic, sizeof(magic)) == 0;
+    close(fd);
+    return is_image;
+}
+
+PmemImage::PmemImage(const std::string &_path) : path(_path)
+{
+    fd = open(path.c_str(), O_RDONLY);
+    fatal_if(fd < 0, "Can't open memory image '%s': %s\n", path,
+             strerror(errno));
+
+    fatal_if(!readFully(fd, &header, sizeof(header), 0) ||
+             std::memcmp(header.magic, PmemImageHeader::Magic,
+                         sizeof(header.magic)) != 0,
+             "'%s' is not a memory image\n", path);
+    header.version = letoh(header.version);
+    header.codec = letoh(header.codec);
+    header.blockSize = letoh(header.blockSize);
+    header.size = letoh(header.size);
+    header.indexOffset = letoh(header.indexOffset);
+    header.blocks = letoh(header.blocks);
+
+    fatal_if(header.version != PmemImageHeader::Version,
+             "Memory image '%s' has unsupported version %d\n", path,
+             header.version);
+    fatal_if(!pmemCodecSupported(codec()),
+             "Memory image '%s' uses codec %d, which is not supported by "
+             "this build\n", path, header.codec);
+
+    index.resize(header.blocks);
+    fatal_if(!readFully(fd, index.data(), index.size() * sizeof(index[0]),
+                        header.indexOffset),
+             "Can't read the index of memory image '%s'\n", path);
+    for (auto &entry : index) {
+        entry.block = letoh(entry.block);
+        entry.offset = letoh(entry.offset);
+        entry.length = letoh(entry.length);
+        entry.flags = letoh(entry.flags);
+    }
+}
+
+PmemImage::~PmemImage()
+{
+    close(fd);
+}
+
+bool
+PmemImage::readEntry(const PmemImageIndexEntry &entry, uint8_t *dest,
+                     std::vector<uint8_t> &buf) const
+{
+    const uint64_t start = entry.block * header.blockSize;
+    const uint64_t size = std::min(header.blockSize, header.size - start);
+    if (entry.flags & PmemImageIndexEntry::Raw)
+        return entry.length == size &&
+            readFully(fd, dest, size, entry.offset);
+
+    buf.resize(entry.length);
+    if (!readFully(fd, buf.data(), entry.length, entry.offset))
+        return false;
+
+    switch (codec()) {
+      case PmemCodec::Zlib:
+        {
+            uLongf length = size;
+            return uncompress(dest, &length, buf.data(), entry.length) ==
+                Z_OK && length == size;
+        }
+#if HAVE_ZSTD
+      case PmemCodec::Zstd:
+        return ZSTD_decompress(dest, size, buf.data(), entry.length) ==
+            size;
+#endif
+      default:
+        return false;
+    }
+}
+
+void
+PmemImage::readBlock(uint64_t block, uint8_t *dest) const
+{
+    const uint64_t start = block * header.blockSize;
+    fatal_if(start >= header.size, "Block %d is out of memory image '%s'\n",
+             block, path);
+
+    auto entry = std::lower_bound(index.begin(), index.end(), block,
+        [](const PmemImageIndexEntry &e, uint64_t b) { return e.block < b; });
+    if (entry == index.end() || entry->block != block) {
+        std::memset(dest, 0,
+                    std::min(header.blockSize, header.size - start));
+        return;
+    }
+
+    std::vector<uint8_t> buf;
+    fatal_if(!readEntry(*entry, dest, buf),
+             "Can't read block %d of memory image '%s'\n", block, path);
+}
+
+void
+PmemImage::readAll(uint8_t *pmem, unsigned threads) const
+{
+    std::atomic<bool> failed(false);
+    const unsigned num_threads = numThreads(threads);
+    std::vector<std::vector<uint8_t>> blocks(num_threads);
+    std::vector<std::vector<uint8_t>> bufs(num_threads);
+
+    // Each thread decompresses in its own buffer and only copies the
+    // pages which are not zero, so the untouched pages of the backing
+    // store stay unallocated.
+    std::atomic<uint64_t> next(0);
+    auto work = [&](unsigned t) {
+        std::vector<uint8_t> &block = blocks[t];
+        std::vector<uint8_t> &buf = bufs[t];
+        block.resize(header.blockSize);
+        for (uint64_t i = next++; i < index.size() && !failed;
+             i = next++) {
+            const PmemImageIndexEntry &entry = index[i];
+            const uint64_t start = entry.block * header.blockSize;
+            if (start >= header.size ||
+                    !readEntry(entry, block.data(), buf)) {
+                failed = true;
+                break;
+            }
+            const uint64_t size = std::min(header.blockSize,
+                                           header.size - start);
+            for (uint64_t page = 0; page < size; page += ZeroPageSize) {
+                const uint64_t length = std::min(ZeroPageSize, size - page);
+                if (!isZero(block.data() + page, length))
+                    std::memcpy(pmem + start + page, block.data() + page,
+                                length);
+            }
+        }
+    };
+
+    std::vector<std::thread> pool;
+    for (uint64_t t = 1; t < std::min<uint64_t>(num_threads, index.size());
+         ++t) {
+        pool.emplace_back(work, t);
+    }
+    work(0);
+    for (auto &thread : pool)
+        thread.join();
+
+    fatal_if(failed, "Can't read memory image '%s'\n", path);
+}
+
+bool
+PmemImage::mapAll(uint8_t *pmem) const
+{
+    const uint64_t page_size = sysconf(_SC_PAGESIZE);
+    if (codec() != PmemCodec::None || header.blockSize % page_size ||
+            header.size % page_size ||
+            reinterpret_cast<uintptr_t>(pmem) % page_size) {
+        return false;
+    }
+    for (const auto &entry : index) {
+        if (entry.offset % page_size ||
+                !(entry.flags & PmemImageIndexEntry::Raw)) {
+            return false;
+        }
+    }
+
+    // Map runs of blocks which are contiguous in the file at once.
+    for (size_t first = 0; first < index.size();) {
+        size_t last = first + 1;
+        while (last < index.size() &&
+               index[last].block == index[last - 1].block + 1 &&
+               index[last].offset ==
+               index[last - 1].offset + index[last - 1].length) {
+            ++last;
+        }
+
+        const uint64_t start = index[first].block * header.blockSize;
+        const uint64_t length = index[last - 1].offset +
+            index[last - 1].length - index[first].offset;
+        void *mapped = mmap(pmem + start, length, PROT_READ | PROT_WRITE,
+                            MAP_PRIVATE | MAP_FIXED, fd,
+                            index[first].offset);
+        fatal_if(mapped == MAP_FAILED, "Can't map memory image '%s': %s\n",
+                 path, strerror(errno));
+        first = last;
+    }
+    return true;
+}
+
+} // namespace memory
+} // namespace gem5
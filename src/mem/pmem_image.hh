@@ -0,0 +1,187 @@
+/*
+ * Copyright (c) 2026 The Regents of the University of California.
+ * All rights reserved.
+ *
+ * Redistribution and use in source and binary forms, with or without
+ * modification, are permitted provided that the following conditions are
+ * met: redistributions of source code must retain the above copyright
+ * notice, this list of conditions and the following disclaimer;
+ * redistributions in binary form must reproduce the above copyright
+ * notice, this list of conditions and the following disclaimer in the
+ * documentation and/or other materials provided with the distribution;
+ * neither the name of the copyright holders nor the names of its
+ * contributors may be used to endorse or promote products derived from
+ * this software without specific prior written permission.
+ *
+ * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+ * "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+ * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+ * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+ * OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+ * SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+ * LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+ * DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+ * THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+ * (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+ * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+ */
+
+#ifndef __MEM_PMEM_IMAGE_HH__
+#define __MEM_PMEM_IMAGE_HH__
+
+/**
+ * @file
+ * A blocked format for the memory images of checkpoints. The image is cut
+ * in fixed-size blocks which are compressed independently, by a pool of
+ * threads, and blocks holding only zeros are not stored at all. An index
+ * of the stored blocks at the end of the file allows reading any block
+ * without reading the ones before it, and restoring an image with many
+ * threads.
+ *
+ * The file starts with a PmemImageHeader, followed by the stored blocks
+ * and by an array of PmemImageIndexEntry, sorted by block number. All the
+ * fields are little endian. Uncompressed images align their blocks in the
+ * file to the block size, so they can be mapped in memory.
+ */
+
+#include <cstdint>
+#include <string>
+#include <vector>
+
+namespace gem5
+{
+
+namespace memory
+{
+
+enum class PmemCodec : uint32_t
+{
+    None = 0,
+    Zlib = 1,
+    Zstd = 2,
+};
+
+struct PmemImageOptions
+{
+    PmemCodec codec = PmemCodec::Zlib;
+    /** Compression level, 0 for a fast default of the codec. */
+    int level = 0;
+    uint64_t blockSize = 256 * 1024;
+    /** Number of threads, 0 for one per host thread. */
+    unsigned threads = 0;
+};
+
+struct PmemImageHeader
+{
+    static constexpr char Magic[8] = {'g', 'e', 'm', '5', 'p', 'm', 'e', 'm'};
+    static constexpr uint32_t Version = 1;
+
+    char magic[8];
+    uint32_t version;
+    uint32_t codec;
+    uint64_t blockSize;
+    /** Size of the image. */
+    uint64_t size;
+    uint64_t indexOffset;
+    /** Number of stored blocks, i.e. of index entries. */
+    uint64_t blocks;
+};
+
+struct PmemImageIndexEntry
+{
+    /** The block is stored uncompressed, as it did not compress. */
+    static constexpr uint32_t Raw = 1;
+
+    uint64_t block;
+    uint64_t offset;
+    uint32_t length;
+    uint32_t flags;
+};
+
+/** Whether a codec is supported by this build. */
+bool pmemCodecSupported(PmemCodec codec);
+
+/** Parse a codec name (none, zlib or zstd). */
+PmemCodec parsePmemCodec(const std::string &name);
+
+/**
+ * Write a memory image in the blocked format.
+ *
+ * @param path The file to write
+ * @param pmem The image
+ * @param size The size of the image
+ * @param options How to write the image
+ */
+void writePmemImage(const std::string &path, const uint8_t *pmem,
+                    uint64_t size, const PmemImageOptions &options);
+
+/**
+ * A memory image in the blocked format, opened for reading.
+ */
+class PmemImage
+{
+  private:
+    std::string path;
+    int fd;
+    PmemImageHeader header;
+    std::vector<PmemImageIndexEntry> index;
+
+    /**
+     * Read a stored block in dest, using buf for its compressed data.
+     * Returns false on error.
+     */
+    bool readEntry(const PmemImageIndexEntry &entry, uint8_t *dest,
+                   std::vector<uint8_t> &buf) const;
+
+  public:
+    /** Check whether a file is a memory image in the blocked format. */
+    static bool isPmemImage(const std::string &path);
+
+    PmemImage(const std::string &path);
+    ~PmemImage();
+
+    PmemImage(const PmemImage &) = delete;
+    PmemImage &operator=(const PmemImage &) = delete;
+
+    uint64_t size() const { return header.size; }
+    uint64_t blockSize() const { return header.blockSize; }
+    PmemCodec codec() const { return PmemCodec(header.codec); }
+    uint64_t storedBlocks() const { return index.size(); }
+
+    /**
+     * Read one block of the image. Blocks which are not stored are
+     * zeros.
+     *
+     * @param block The block number
+     * @param dest Where to read the block, blockSize() bytes (less for
+     *             the last block)
+     */
+    void readBlock(uint64_t block, uint8_t *dest) const;
+
+    /**
+     * Read the whole image in memory which is known to be zero, with a
+     * pool of threads. Only the pages of the stored blocks which are not
+     * zero are written to.
+     *
+     * @param pmem Where to read the image, size() bytes
+     * @param threads Number of threads, 0 for one per host thread
+     */
+    void readAll(uint8_t *pmem, unsigned threads) const;
+
+    /**
+     * Map the stored blocks of an uncompressed image over memory which
+     * is known to be zero, privately (copy on write). The pages are then
+     * only read from the file when they are first touched.
+     *
+     * @param pmem Page-aligned memory to map the image in, size() bytes
+     * @return false if the image can't be mapped (it is compressed, or
+     *         its blocks are not page aligned), in which case nothing
+     *         was mapped.
+     */
+    bool mapAll(uint8_t *pmem) const;
+};
+
+} // namespace memory
+} // namespace gem5
+
+#endif //__MEM_PMEM_IMAGE_HH__
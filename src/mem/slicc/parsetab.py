@@ -0,0 +1,179 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "leftINCRDECRleftORleftANDleftEQNEleftLTGTLEGEleftRIGHTSHIFTLEFTSHIFTleftPLUSDASHleftSTARSLASHMODrightNOTUMINUSACTION AMP AND ASSIGN CHECK_ALLOCATE CHECK_NEXT_CYCLE CHECK_PROBE CHECK_STOP_SLOTS CONST DASH DECR DEFER_ENQUEUEING DOT DOUBLE_COLON ELSE ENQUEUE ENUM EQ EXTERN_TYPE FLOATNUMBER GE GLOBAL GT IDENT IF INCLUDE INCR IN_PORT IS_INVALID IS_VALID LE LEFTSHIFT LIT_BOOL LT MACHINE MOD NE NEW NOT NUMBER OOD OR OUT_PORT PEEK PLUS PROTOCOL RETURN RIGHTSHIFT SEMI SLASH STALL_AND_WAIT STAR STATE_DECL STATIC_CAST STRING STRUCT TRANS VOID WAKEUP_PORTfile : declsempty :decls : declsxdeclsx : decl declsxdeclsx : emptydecl : PROTOCOL STRING SEMIdecl : INCLUDE STRING SEMIdecl : MACHINE '(' enumeration ')' ':' obj_decls '{' decls '}'decl : MACHINE '(' enumeration pairs ')' ':' obj_decls '{' decls '}'decl : ACTION '(' ident pairs ')' statementsdecl : IN_PORT '(' ident ',' type ',' var pairs ')' statementsdecl : OUT_PORT '(' ident ',' type ',' var pairs ')' SEMIdecl : TRANS '(' idents ',' idents ',' ident_or_star ')' identsdecl : TRANS '(' idents ',' idents ')' identsdecl : TRANS '(' idents ',' idents ',' ident_or_star ')' idents identsdecl : TRANS '(' idents ',' idents ')' idents identsdecl : EXTERN_TYPE '(' type pairs ')' SEMIdecl : GLOBAL '(' type pairs ')' '{' type_members '}'decl : STRUCT '(' type pairs ')' '{' type_members '}'decl : ENUM '(' type pairs ')' '{' type_enums   '}'decl : STATE_DECL '(' type pairs ')' '{' type_states   '}'obj_decls : obj_decl obj_declsobj_decls : emptytype_members : type_member type_memberstype_members : emptytype_member : obj_decl\n        | func_decl\n        | func_defdecl : obj_declobj_decl : type ident pairs SEMIobj_decl : type STAR ident pairs SEMIobj_decl : type ident ASSIGN expr SEMIobj_decl : type STAR ident ASSIGN expr SEMIdecl : func_declfunc_decl :  void ident '(' params ')' pairs SEMI\n        | type ident '(' params ')' pairs SEMIfunc_decl :  void ident '(' types ')' pairs SEMI\n        | type ident '(' types ')' pairs SEMIdecl : func_deffunc_def : void ident '(' params ')' pairs statements\n        | type ident '(' params ')' pairs statementstype_enums : type_enum type_enumstype_enums : emptytype_enum : ident pairs SEMItype_states : type_state type_statestype_states : emptytype_state : ident ',' enumeration pairs SEMIparams : param ',' paramsparams : paramparams : emptyparam : type identparam : type STAR identparam : type AMP identparam : CONST type AMP identparam : type STAR ident ASSIGN STRINGparam : type ident ASSIGN NUMBERparam : type ident ASSIGN LIT_BOOLparam : type ident ASSIGN STRINGtypes : type ',' typestypes : typetypes : emptytypestr : typestr DOUBLE_COLON identtypestr : identtype : typestrvoid : VOIDidents : '{' identx '}'idents : identidentx : ident SEMI identx\n        | ident ',' identxidentx : ident identxidentx : emptyident : IDENTident_or_star : ident\n        | STARpairs : ',' pairsxpairs : emptypairsx : pair ',' pairsxpairsx : pairpair : ident '=' STRING\n        | ident '=' ident\n        | ident '=' NUMBERpair : STRINGstatements : '{' statements_inner '}'statements : '{' '}'statements_inner : statement statements_innerstatements_inner : statementexprs : expr ',' exprsexprs : exprexprs : emptystatement : expr SEMIstatement : expr ASSIGN expr SEMIstatement : ENQUEUE '(' var ',' type ')' statementsstatement : ENQUEUE '(' var ',' type ',' expr ')' statementsstatement : ENQUEUE '(' var ',' type ',' expr ',' expr ')' statementsstatement : DEFER_ENQUEUEING '(' var ',' type ')' statementsstatement : STALL_AND_WAIT '(' var ',' var ')' SEMIstatement : WAKEUP_PORT '(' var ',' var ')' SEMIstatement : PEEK '(' var ',' type pairs ')' statementsstatement : CHECK_ALLOCATE '(' var ')' SEMIstatement : CHECK_NEXT_CYCLE '(' ')' SEMIstatement : CHECK_STOP_SLOTS '(' var ',' STRING ',' STRING ')' SEMIstatement : CHECK_PROBE '(' var ',' var ')' SEMIstatement : RETURN expr SEMIstatement : if_statementif_statement : IF '(' expr ')' statementsif_statement : IF '(' expr ')' statements ELSE statementsif_statement : IF '(' expr ')' statements ELSE if_statementaexpr : STATIC_CAST '(' type ',' expr ')'aexpr : STATIC_CAST '(' type ',' STRING ',' expr ')'aexpr : varaexpr : type identaexpr : literalaexpr : enumerationaexpr : ident '(' exprs ')'aexpr : NEW typeaexpr : OODaexpr : aexpr DOT identaexpr : aexpr DOT ident '(' exprs ')'aexpr : aexpr '[' exprs ']'aexpr : type DOUBLE_COLON ident '(' exprs ')'expr : aexprexpr : expr STAR  expr\n        | expr SLASH expr\n        | expr MOD   expr\n        | expr PLUS  expr\n        | expr DASH  expr\n        | expr LT    expr\n        | expr GT    expr\n        | expr LE    expr\n        | expr GE    expr\n        | expr EQ    expr\n        | expr NE    expr\n        | expr AND   expr\n        | expr OR    expr\n        | expr RIGHTSHIFT expr\n        | expr LEFTSHIFT  exprexpr : NOT expr\n        | INCR expr\n        | DECR expr\n        | DASH expr %prec UMINUSaexpr : '(' expr ')'aexpr : IS_VALID '(' expr ')'aexpr : IS_INVALID '(' expr ')'literal : STRINGliteral : NUMBERliteral : FLOATNUMBERliteral : LIT_BOOLenumeration : ident ':' identvar : ident"
+    
+_lr_action_items = {'PROTOCOL':([0,4,20,21,22,26,44,45,59,72,126,163,167,183,227,233,240,245,274,275,276,282,298,299,300,302,303,327,328,330,331,334,337,357,360,372,374,375,],[6,6,-29,-34,-39,-72,-6,-7,-67,-30,-32,-31,-66,-10,-33,-17,6,-84,-36,-41,-38,-14,-35,-40,-37,6,-83,-16,-18,-19,-20,-21,-8,-13,-9,-11,-12,-15,]),'INCLUDE':([0,4,20,21,22,26,44,45,59,72,126,163,167,183,227,233,240,245,274,275,276,282,298,299,300,302,303,327,328,330,331,334,337,357,360,372,374,375,],[7,7,-29,-34,-39,-72,-6,-7,-67,-30,-32,-31,-66,-10,-33,-17,7,-84,-36,-41,-38,-14,-35,-40,-37,7,-83,-16,-18,-19,-20,-21,-8,-13,-9,-11,-12,-15,]),'MACHINE':([0,4,20,21,22,26,44,45,59,72,126,163,167,183,227,233,240,245,274,275,276,282,298,299,300,302,303,327,328,330,331,334,337,357,360,372,374,375,],[8,8,-29,-34,-39,-72,-6,-7,-67,-30,-32,-31,-66,-10,-33,-17,8,-84,-36,-41,-38,-14,-35,-40,-37,8,-83,-16,-18,-19,-20,-21,-8,-13,-9,-11,-12,-15,]),'ACTION':([0,4,20,21,22,26,44,45,59,72,126,163,167,183,227,233,240,245,274,275,276,282,298,299,300,302,303,327,328,330,331,334,337,357,360,372,374,375,],[9,9,-29,-34,-39,-72,-6,-7,-67,-30,-32,-31,-66,-10,-33,-17,9,-84,-36,-41,-38,-14,-35,-40,-37,9,-83,-16,-18,-19,-20,-21,-8,-13,-9,-11,-12,-15,]),'IN_PORT':([0,4,20,21,22,26,44,45,59,72,126,163,167,183,227,233,240,245,274,275,276,282,298,299,300,302,303,327,328,330,331,334,337,357,360,372,374,375,],[11,11,-29,-34,-39,-72,-6,-7,-67,-30,-32,-31,-66,-10,-33,-17,11,-84,-36,-41,-38,-14,-35,-40,-37,11,-83,-16,-18,-19,-20,-21,-8,-13,-9,-11,-12,-15,]),'OUT_PORT':([0,4,20,21,22,26,44,45,59,72,126,163,167,183,227,233,240,245,274,275,276,282,298,299,300,302,303,327,328,330,331,334,337,357,360,372,374,375,],[13,13,-29,-34,-39,-72,-6,-7,-67,-30,-32,-31,-66,-10,-33,-17,13,-84,-36,-41,-38,-14,-35,-40,-37,13,-83,-16,-18,-19,-20,-21,-8,-13,-9,-11,-12,-15,]),'TRANS':([0,4,20,21,22,26,44,45,59,72,126,163,167,183,227,233,240,245,274,275,276,282,298,299,300,302,303,327,328,330,331,334,337,357,360,372,374,375,],[14,14,-29,-34,-39,-72,-6,-7,-67,-30,-32,-31,-66,-10,-33,-17,14,-84,-36,-41,-38,-14,-35,-40,-37,14,-83,-16,-18,-19,-20,-21,-8,-13,-9,-11,-12,-15,]),'EXTERN_TYPE':([0,4,20,21,22,26,44,45,59,72,126,163,167,183,227,233,240,245,274,275,276,282,298,299,300,302,303,327,328,330,331,334,337,357,360,372,374,375,],[15,15,-29,-34,-39,-72,-6,-7,-67,-30,-32,-31,-66,-10,-33,-17,15,-84,-36,-41,-38,-14,-35,-40,-37,15,-83,-16,-18,-19,-20,-21,-8,-13,-9,-11,-12,-15,]),'GLOBAL':([0,4,20,21,22,26,44,45,59,72,126,163,167,183,227,233,240,245,274,275,276,282,298,299,300,302,303,327,328,330,331,334,337,357,360,372,374,375,],[16,16,-29,-34,-39,-72,-6,-7,-67,-30,-32,-31,-66,-10,-33,-17,16,-84,-36,-41,-38,-14,-35,-40,-37,16,-83,-16,-18,-19,-20,-21,-8,-13,-9,-11,-12,-15,]),'STRUCT':([0,4,20,21,22,26,44,45,59,72,126,163,167,183,227,233,240,245,274,275,276,282,298,299,300,302,303,327,328,330,331,334,337,357,360,372,374,375,],[17,17,-29,-34,-39,-72,-6,-7,-67,-30,-32,-31,-66,-10,-33,-17,17,-84,-36,-41,-38,-14,-35,-40,-37,17,-83,-16,-18,-19,-20,-21,-8,-13,-9,-11,-12,-15,]),'ENUM':([0,4,20,21,22,26,44,45,59,72,126,163,167,183,227,233,240,245,274,275,276,282,298,299,300,302,303,327,328,330,331,334,337,357,360,372,374,375,],[18,18,-29,-34,-39,-72,-6,-7,-67,-30,-32,-31,-66,-10,-33,-17,18,-84,-36,-41,-38,-14,-35,-40,-37,18,-83,-16,-18,-19,-20,-21,-8,-13,-9,-11,-12,-15,]),'STATE_DECL':([0,4,20,21,22,26,44,45,59,72,126,163,167,183,227,233,240,245,274,275,276,282,298,299,300,302,303,327,328,330,331,334,337,357,360,372,374,375,],[19,19,-29,-34,-39,-72,-6,-7,-67,-30,-32,-31,-66,-10,-33,-17,19,-84,-36,-41,-38,-14,-35,-40,-37,19,-83,-16,-18,-19,-20,-21,-8,-13,-9,-11,-12,-15,]),'$end':([0,1,2,3,4,5,20,21,22,26,27,44,45,59,72,126,163,167,183,227,233,245,274,275,276,282,298,299,300,303,327,328,330,331,334,337,357,360,372,374,375,],[-2,0,-1,-3,-2,-5,-29,-34,-39,-72,-4,-6,-7,-67,-30,-32,-31,-66,-10,-33,-17,-84,-36,-41,-38,-14,-35,-40,-37,-83,-16,-18,-19,-20,-21,-8,-13,-9,-11,-12,-15,]),'VOID':([0,4,20,21,22,26,44,45,59,72,126,163,167,183,227,233,234,235,240,245,274,275,276,282,284,286,287,288,298,299,300,302,303,327,328,330,331,334,337,357,360,372,374,375,],[25,25,-29,-34,-39,-72,-6,-7,-67,-30,-32,-31,-66,-10,-33,-17,25,25,25,-84,-36,-41,-38,-14,25,-26,-27,-28,-35,-40,-37,25,-83,-16,-18,-19,-20,-21,-8,-13,-9,-11,-12,-15,]),'IDENT':([0,4,10,12,20,21,22,23,24,25,26,30,31,32,34,35,36,37,38,39,40,41,43,44,45,51,52,53,58,59,65,66,69,71,72,73,74,77,78,79,80,82,87,94,99,105,106,107,109,118,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,148,151,152,153,155,156,159,161,162,163,167,168,170,179,181,182,183,184,185,221,222,227,228,229,230,233,234,235,236,237,240,245,246,257,258,262,264,265,267,274,275,276,282,284,286,287,288,291,295,298,299,300,302,303,305,306,307,308,309,310,311,312,314,315,317,326,327,328,330,331,334,336,337,349,355,357,358,360,361,362,363,364,365,366,368,370,372,374,375,382,385,387,388,398,399,400,401,404,405,406,407,409,412,413,415,],[26,26,-63,26,-29,-34,-39,26,-64,-65,-72,26,26,26,26,26,26,26,26,26,26,26,26,-6,-7,26,26,26,26,-67,26,-62,26,26,-30,26,-63,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,-32,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,-31,-66,26,26,26,26,26,-10,26,26,26,26,-33,26,26,26,-17,26,26,26,26,26,-84,26,26,-104,26,26,26,26,-36,-41,-38,26,26,-26,-27,-28,26,26,-35,-40,-37,26,-83,-90,26,26,26,26,26,26,26,26,26,26,26,-16,-18,-19,-20,-21,26,-8,-103,26,26,-44,-9,-91,26,26,26,26,26,-100,26,-11,-12,-15,-99,-105,-47,26,-92,-95,-96,-97,-102,-106,-107,26,-98,-93,-101,-94,]),'}':([3,4,5,20,21,22,26,27,44,45,58,59,72,108,109,110,126,163,167,168,169,170,183,184,227,231,232,233,234,235,236,237,240,244,245,246,258,274,275,276,282,283,284,285,286,287,288,289,290,291,292,294,295,296,298,299,300,301,302,303,304,305,327,328,329,330,331,332,334,335,337,338,349,357,358,360,361,368,372,374,375,382,385,387,398,399,400,401,404,405,406,409,412,413,415,],[-3,-2,-5,-29,-34,-39,-72,-4,-6,-7,-2,-67,-30,167,-2,-71,-32,-31,-66,-2,-70,-2,-10,245,-33,-68,-69,-17,-2,-2,-2,-2,-2,303,-84,-86,-104,-36,-41,-38,-14,328,-2,-25,-26,-27,-28,330,331,-2,-43,334,-2,-46,-35,-40,-37,337,-2,-83,-85,-90,-16,-18,-24,-19,-20,-42,-21,-45,-8,360,-103,-13,-44,-9,-91,-100,-11,-12,-15,-99,-105,-47,-92,-95,-96,-97,-102,-106,-107,-98,-93,-101,-94,]),'STRING':([6,7,51,53,77,78,79,80,82,105,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,151,152,161,162,184,214,245,246,257,258,262,264,265,267,273,303,305,306,317,349,355,361,368,369,382,385,388,394,398,399,400,401,404,405,406,407,409,412,413,415,],[28,29,83,103,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,103,225,83,272,-84,83,83,-104,83,83,83,323,324,-83,-90,83,83,-103,83,-91,-100,383,-99,-105,83,403,-92,-95,-96,-97,-102,-106,-107,83,-98,-93,-101,-94,]),'(':([8,9,11,13,14,15,16,17,18,19,26,33,42,51,74,77,78,79,80,81,82,89,90,105,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,151,152,184,186,205,245,246,248,249,250,251,252,253,254,255,256,257,258,259,262,264,265,267,303,305,306,317,349,355,361,368,382,385,388,398,399,400,401,404,405,406,407,409,412,413,415,],[30,31,32,35,36,37,38,39,40,41,-72,52,65,82,125,82,82,82,82,148,82,151,152,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,262,265,-84,82,307,308,309,310,311,312,313,314,315,82,-104,317,82,82,82,82,-83,-90,82,82,-103,82,-91,-100,-99,-105,82,-92,-95,-96,-97,-102,-106,-107,82,-98,-93,-101,-94,]),'DOUBLE_COLON':([10,24,26,66,73,74,],[-63,43,-72,-62,124,-63,]),'STAR':([10,12,24,26,66,74,75,76,83,84,85,86,88,91,92,93,94,120,123,144,145,146,147,149,150,164,181,188,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,208,209,210,221,229,247,263,266,268,269,316,322,323,339,350,352,353,354,373,386,397,411,],[-63,34,-64,-72,-62,-149,127,-121,-144,-110,-112,-113,-116,-145,-146,-147,155,-148,-111,-140,-137,127,127,127,-115,127,34,127,-122,-123,-124,127,127,127,127,127,127,127,127,127,127,127,127,-117,-141,127,127,155,281,127,-114,-119,-142,-143,127,127,-144,127,127,-120,-118,-108,127,-109,127,127,]),',':([10,24,26,33,46,48,49,55,56,57,59,60,61,62,63,64,66,74,76,83,84,85,86,88,91,92,93,94,97,101,103,109,120,122,123,144,145,146,147,150,154,157,158,165,166,167,176,177,188,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,207,208,211,215,216,224,225,226,242,260,261,263,266,268,269,270,271,272,277,278,293,297,323,324,340,341,342,343,344,347,348,352,353,354,359,377,381,383,386,397,],[-63,-64,-72,53,53,53,71,53,106,107,-67,53,53,53,53,53,-62,-149,-121,-144,-110,-112,-113,-116,-145,-146,-147,153,159,161,-82,170,-148,185,-111,-140,-137,-138,-139,-115,-51,53,53,228,229,-66,53,53,264,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-117,267,-141,153,-52,-53,-80,-79,-81,53,-149,53,-114,-119,-142,-143,-56,-57,-58,-54,53,53,336,355,-55,362,363,364,365,366,369,370,-120,-118,-108,53,388,53,394,-109,407,]),')':([10,24,26,46,48,52,54,59,60,61,62,63,64,65,66,68,70,74,76,83,84,85,86,88,91,92,93,94,95,96,97,98,100,101,103,111,112,113,114,115,116,117,120,123,125,144,145,146,147,149,150,153,154,159,166,167,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,208,209,210,211,212,213,215,216,219,220,223,224,225,226,260,261,262,263,264,265,266,268,269,270,271,272,277,278,279,280,281,313,318,319,320,321,322,323,324,325,345,350,352,353,354,373,377,378,379,380,381,384,386,393,397,403,411,],[-63,-64,-72,67,-2,-2,-76,-67,-2,-2,-2,-2,-2,-2,-62,119,121,-149,-121,-144,-110,-112,-113,-116,-145,-146,-147,-60,157,158,-49,-50,-75,-78,-82,171,172,173,174,175,176,177,-148,-111,-2,-140,-137,-138,-139,208,-115,-2,-51,-2,230,-66,263,-88,-89,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-117,-141,268,269,-60,-59,-61,-52,-53,-48,-50,-77,-80,-79,-81,-149,-2,-2,-114,-2,-2,-119,-142,-143,-56,-57,-58,-54,-2,326,-73,-74,346,351,352,-87,353,354,-144,-55,356,367,371,-120,-118,-108,386,389,390,391,392,-2,395,-109,402,408,410,414,]),'AMP':([10,24,26,66,94,160,221,],[-63,-64,-72,-62,156,222,156,]),'DOT':([10,24,26,66,74,76,83,84,85,86,88,91,92,93,120,123,150,205,208,263,266,268,269,323,352,353,354,386,],[-63,-64,-72,-62,-149,142,-144,-110,-112,-113,-116,-145,-146,-147,-148,-111,-115,-117,-141,-114,-119,-142,-143,-144,-120,-118,-108,-109,]),'[':([10,24,26,66,74,76,83,84,85,86,88,91,92,93,120,123,150,205,208,263,266,268,269,323,352,353,354,386,],[-63,-64,-72,-62,-149,143,-144,-110,-112,-113,-116,-145,-146,-147,-148,-111,-115,-117,-141,-114,-119,-142,-143,-144,-120,-118,-108,-109,]),'SEMI':([10,24,26,28,29,33,50,54,55,66,74,75,76,83,84,85,86,88,91,92,93,100,101,103,104,109,120,123,144,145,146,147,150,157,158,164,171,176,177,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,208,217,218,223,224,225,226,238,239,242,247,263,266,268,269,293,316,333,339,346,352,353,354,356,359,367,376,386,391,392,395,410,],[-63,-64,-72,44,45,-2,72,-76,-2,-62,-149,126,-121,-144,-110,-112,-113,-116,-145,-146,-147,-75,-78,-82,163,168,-148,-111,-140,-137,-138,-139,-115,-2,-2,227,233,-2,-2,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-117,-141,274,276,-77,-80,-79,-81,298,300,-2,305,-114,-119,-142,-143,-2,349,358,361,368,-120,-118,-108,374,-2,382,387,-109,400,401,404,413,]),'SLASH':([10,24,26,66,74,75,76,83,84,85,86,88,91,92,93,120,123,144,145,146,147,149,150,164,188,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,208,209,210,247,263,266,268,269,316,322,323,339,350,352,353,354,373,386,397,411,],[-63,-64,-72,-62,-149,128,-121,-144,-110,-112,-113,-116,-145,-146,-147,-148,-111,-140,-137,128,128,128,-115,128,128,-122,-123,-124,128,128,128,128,128,128,128,128,128,128,128,128,-117,-141,128,128,128,-114,-119,-142,-143,128,128,-144,128,128,-120,-118,-108,128,-109,128,128,]),'MOD':([10,24,26,66,74,75,76,83,84,85,86,88,91,92,93,120,123,144,145,146,147,149,150,164,188,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,208,209,210,247,263,266,268,269,316,322,323,339,350,352,353,354,373,386,397,411,],[-63,-64,-72,-62,-149,129,-121,-144,-110,-112,-113,-116,-145,-146,-147,-148,-111,-140,-137,129,129,129,-115,129,129,-122,-123,-124,129,129,129,129,129,129,129,129,129,129,129,129,-117,-141,129,129,129,-114,-119,-142,-143,129,129,-144,129,129,-120,-118,-108,129,-109,129,129,]),'PLUS':([10,24,26,66,74,75,76,83,84,85,86,88,91,92,93,120,123,144,145,146,147,149,150,164,188,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,208,209,210,247,263,266,268,269,316,322,323,339,350,352,353,354,373,386,397,411,],[-63,-64,-72,-62,-149,130,-121,-144,-110,-112,-113,-116,-145,-146,-147,-148,-111,-140,-137,130,130,130,-115,130,130,-122,-123,-124,-125,-126,130,130,130,130,130,130,130,130,130,130,-117,-141,130,130,130,-114,-119,-142,-143,130,130,-144,130,130,-120,-118,-108,130,-109,130,130,]),'DASH':([10,24,26,51,66,74,75,76,77,78,79,80,82,83,84,85,86,88,91,92,93,105,120,123,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,144,145,146,147,149,150,151,152,164,184,188,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,208,209,210,245,246,247,257,258,262,263,264,265,266,267,268,269,303,305,306,316,317,322,323,339,349,350,352,353,354,355,361,368,373,382,385,386,388,397,398,399,400,401,404,405,406,407,409,411,412,413,415,],[-63,-64,-72,77,-62,-149,131,-121,77,77,77,77,77,-144,-110,-112,-113,-116,-145,-146,-147,77,-148,-111,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,-140,-137,131,131,131,-115,77,77,131,77,131,-122,-123,-124,-125,-126,131,131,131,131,131,131,131,131,131,131,-117,-141,131,131,-84,77,131,77,-104,77,-114,77,77,-119,77,-142,-143,-83,-90,77,131,77,131,-144,131,-103,131,-120,-118,-108,77,-91,-100,131,-99,-105,-109,77,131,-92,-95,-96,-97,-102,-106,-107,77,-98,131,-93,-101,-94,]),'LT':([10,24,26,66,74,75,76,83,84,85,86,88,91,92,93,120,123,144,145,146,147,149,150,164,188,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,208,209,210,247,263,266,268,269,316,322,323,339,350,352,353,354,373,386,397,411,],[-63,-64,-72,-62,-149,132,-121,-144,-110,-112,-113,-116,-145,-146,-147,-148,-111,-140,-137,132,132,132,-115,132,132,-122,-123,-124,-125,-126,-127,-128,-129,-130,132,132,132,132,-135,-136,-117,-141,132,132,132,-114,-119,-142,-143,132,132,-144,132,132,-120,-118,-108,132,-109,132,132,]),'GT':([10,24,26,66,74,75,76,83,84,85,86,88,91,92,93,120,123,144,145,146,147,149,150,164,188,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,208,209,210,247,263,266,268,269,316,322,323,339,350,352,353,354,373,386,397,411,],[-63,-64,-72,-62,-149,133,-121,-144,-110,-112,-113,-116,-145,-146,-147,-148,-111,-140,-137,133,133,133,-115,133,133,-122,-123,-124,-125,-126,-127,-128,-129,-130,133,133,133,133,-135,-136,-117,-141,133,133,133,-114,-119,-142,-143,133,133,-144,133,133,-120,-118,-108,133,-109,133,133,]),'LE':([10,24,26,66,74,75,76,83,84,85,86,88,91,92,93,120,123,144,145,146,147,149,150,164,188,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,208,209,210,247,263,266,268,269,316,322,323,339,350,352,353,354,373,386,397,411,],[-63,-64,-72,-62,-149,134,-121,-144,-110,-112,-113,-116,-145,-146,-147,-148,-111,-140,-137,134,134,134,-115,134,134,-122,-123,-124,-125,-126,-127,-128,-129,-130,134,134,134,134,-135,-136,-117,-141,134,134,134,-114,-119,-142,-143,134,134,-144,134,134,-120,-118,-108,134,-109,134,134,]),'GE':([10,24,26,66,74,75,76,83,84,85,86,88,91,92,93,120,123,144,145,146,147,149,150,164,188,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,208,209,210,247,263,266,268,269,316,322,323,339,350,352,353,354,373,386,397,411,],[-63,-64,-72,-62,-149,135,-121,-144,-110,-112,-113,-116,-145,-146,-147,-148,-111,-140,-137,135,135,135,-115,135,135,-122,-123,-124,-125,-126,-127,-128,-129,-130,135,135,135,135,-135,-136,-117,-141,135,135,135,-114,-119,-142,-143,135,135,-144,135,135,-120,-118,-108,135,-109,135,135,]),'EQ':([10,24,26,66,74,75,76,83,84,85,86,88,91,92,93,120,123,144,145,146,147,149,150,164,188,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,208,209,210,247,263,266,268,269,316,322,323,339,350,352,353,354,373,386,397,411,],[-63,-64,-72,-62,-149,136,-121,-144,-110,-112,-113,-116,-145,-146,-147,-148,-111,-140,-137,136,136,136,-115,136,136,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,136,136,-135,-136,-117,-141,136,136,136,-114,-119,-142,-143,136,136,-144,136,136,-120,-118,-108,136,-109,136,136,]),'NE':([10,24,26,66,74,75,76,83,84,85,86,88,91,92,93,120,123,144,145,146,147,149,150,164,188,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,208,209,210,247,263,266,268,269,316,322,323,339,350,352,353,354,373,386,397,411,],[-63,-64,-72,-62,-149,137,-121,-144,-110,-112,-113,-116,-145,-146,-147,-148,-111,-140,-137,137,137,137,-115,137,137,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,137,137,-135,-136,-117,-141,137,137,137,-114,-119,-142,-143,137,137,-144,137,137,-120,-118,-108,137,-109,137,137,]),'AND':([10,24,26,66,74,75,76,83,84,85,86,88,91,92,93,120,123,144,145,146,147,149,150,164,188,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,208,209,210,247,263,266,268,269,316,322,323,339,350,352,353,354,373,386,397,411,],[-63,-64,-72,-62,-149,138,-121,-144,-110,-112,-113,-116,-145,-146,-147,-148,-111,-140,-137,138,138,138,-115,138,138,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,138,-135,-136,-117,-141,138,138,138,-114,-119,-142,-143,138,138,-144,138,138,-120,-118,-108,138,-109,138,138,]),'OR':([10,24,26,66,74,75,76,83,84,85,86,88,91,92,93,120,123,144,145,146,147,149,150,164,188,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,208,209,210,247,263,266,268,269,316,322,323,339,350,352,353,354,373,386,397,411,],[-63,-64,-72,-62,-149,139,-121,-144,-110,-112,-113,-116,-145,-146,-147,-148,-111,-140,-137,139,139,139,-115,139,139,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-117,-141,139,139,139,-114,-119,-142,-143,139,139,-144,139,139,-120,-118,-108,139,-109,139,139,]),'RIGHTSHIFT':([10,24,26,66,74,75,76,83,84,85,86,88,91,92,93,120,123,144,145,146,147,149,150,164,188,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,208,209,210,247,263,266,268,269,316,322,323,339,350,352,353,354,373,386,397,411,],[-63,-64,-72,-62,-149,140,-121,-144,-110,-112,-113,-116,-145,-146,-147,-148,-111,-140,-137,140,140,140,-115,140,140,-122,-123,-124,-125,-126,140,140,140,140,140,140,140,140,-135,-136,-117,-141,140,140,140,-114,-119,-142,-143,140,140,-144,140,140,-120,-118,-108,140,-109,140,140,]),'LEFTSHIFT':([10,24,26,66,74,75,76,83,84,85,86,88,91,92,93,120,123,144,145,146,147,149,150,164,188,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,208,209,210,247,263,266,268,269,316,322,323,339,350,352,353,354,373,386,397,411,],[-63,-64,-72,-62,-149,141,-121,-144,-110,-112,-113,-116,-145,-146,-147,-148,-111,-140,-137,141,141,141,-115,141,141,-122,-123,-124,-125,-126,141,141,141,141,141,141,141,141,-135,-136,-117,-141,141,141,141,-114,-119,-142,-143,141,141,-144,141,141,-120,-118,-108,141,-109,141,141,]),']':([10,24,26,66,74,76,83,84,85,86,88,91,92,93,120,123,143,144,145,146,147,150,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,208,263,264,266,268,269,320,352,353,354,386,],[-63,-64,-72,-62,-149,-121,-144,-110,-112,-113,-116,-145,-146,-147,-148,-111,-2,-140,-137,-138,-139,-115,-88,-89,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-117,266,-141,-114,-2,-119,-142,-143,-87,-120,-118,-108,-109,]),'ASSIGN':([10,24,26,33,55,66,74,76,83,84,85,86,88,91,92,93,120,123,144,145,146,147,150,154,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,208,215,242,247,263,266,268,269,352,353,354,386,],[-63,-64,-72,51,105,-62,-149,-121,-144,-110,-112,-113,-116,-145,-146,-147,-148,-111,-140,-137,-138,-139,-115,214,-122,-123,-124,-125,-126,-127,-128,-129,-130,-131,-132,-133,-134,-135,-136,-117,-141,273,51,306,-114,-119,-142,-143,-120,-118,-108,-109,]),':':([26,47,67,74,119,],[-72,69,118,69,182,]),'=':([26,102,],[-72,162,]),'{':([26,36,54,59,72,100,101,103,107,118,121,126,157,163,167,172,173,174,175,176,178,179,180,182,217,223,224,225,226,227,230,238,241,243,282,326,351,357,371,389,390,396,402,408,414,],[-72,58,-76,-67,-30,-75,-78,-82,58,-2,184,-32,-2,-31,-66,234,235,236,237,-2,240,-2,-23,-2,184,-77,-80,-79,-81,-33,58,184,-22,302,58,58,184,58,184,184,184,184,184,184,184,]),'NOT':([51,77,78,79,80,82,105,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,151,152,184,245,246,257,258,262,264,265,267,303,305,306,317,349,355,361,368,382,385,388,398,399,400,401,404,405,406,407,409,412,413,415,],[78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-84,78,78,-104,78,78,78,78,-83,-90,78,78,-103,78,-91,-100,-99,-105,78,-92,-95,-96,-97,-102,-106,-107,78,-98,-93,-101,-94,]),'INCR':([51,77,78,79,80,82,105,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,151,152,184,245,246,257,258,262,264,265,267,303,305,306,317,349,355,361,368,382,385,388,398,399,400,401,404,405,406,407,409,412,413,415,],[79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,-84,79,79,-104,79,79,79,79,-83,-90,79,79,-103,79,-91,-100,-99,-105,79,-92,-95,-96,-97,-102,-106,-107,79,-98,-93,-101,-94,]),'DECR':([51,77,78,79,80,82,105,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,151,152,184,245,246,257,258,262,264,265,267,303,305,306,317,349,355,361,368,382,385,388,398,399,400,401,404,405,406,407,409,412,413,415,],[80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,-84,80,80,-104,80,80,80,80,-83,-90,80,80,-103,80,-91,-100,-99,-105,80,-92,-95,-96,-97,-102,-106,-107,80,-98,-93,-101,-94,]),'STATIC_CAST':([51,77,78,79,80,82,105,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,151,152,184,245,246,257,258,262,264,265,267,303,305,306,317,349,355,361,368,382,385,388,398,399,400,401,404,405,406,407,409,412,413,415,],[81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,-84,81,81,-104,81,81,81,81,-83,-90,81,81,-103,81,-91,-100,-99,-105,81,-92,-95,-96,-97,-102,-106,-107,81,-98,-93,-101,-94,]),'NEW':([51,77,78,79,80,82,105,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,151,152,184,245,246,257,258,262,264,265,267,303,305,306,317,349,355,361,368,382,385,388,398,399,400,401,404,405,406,407,409,412,413,415,],[87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-84,87,87,-104,87,87,87,87,-83,-90,87,87,-103,87,-91,-100,-99,-105,87,-92,-95,-96,-97,-102,-106,-107,87,-98,-93,-101,-94,]),'OOD':([51,77,78,79,80,82,105,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,151,152,184,245,246,257,258,262,264,265,267,303,305,306,317,349,355,361,368,382,385,388,398,399,400,401,404,405,406,407,409,412,413,415,],[88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,-84,88,88,-104,88,88,88,88,-83,-90,88,88,-103,88,-91,-100,-99,-105,88,-92,-95,-96,-97,-102,-106,-107,88,-98,-93,-101,-94,]),'IS_VALID':([51,77,78,79,80,82,105,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,151,152,184,245,246,257,258,262,264,265,267,303,305,306,317,349,355,361,368,382,385,388,398,399,400,401,404,405,406,407,409,412,413,415,],[89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,-84,89,89,-104,89,89,89,89,-83,-90,89,89,-103,89,-91,-100,-99,-105,89,-92,-95,-96,-97,-102,-106,-107,89,-98,-93,-101,-94,]),'IS_INVALID':([51,77,78,79,80,82,105,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,151,152,184,245,246,257,258,262,264,265,267,303,305,306,317,349,355,361,368,382,385,388,398,399,400,401,404,405,406,407,409,412,413,415,],[90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,-84,90,90,-104,90,90,90,90,-83,-90,90,90,-103,90,-91,-100,-99,-105,90,-92,-95,-96,-97,-102,-106,-107,90,-98,-93,-101,-94,]),'NUMBER':([51,77,78,79,80,82,105,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,151,152,162,184,214,245,246,257,258,262,264,265,267,303,305,306,317,349,355,361,368,382,385,388,398,399,400,401,404,405,406,407,409,412,413,415,],[91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,91,226,91,270,-84,91,91,-104,91,91,91,91,-83,-90,91,91,-103,91,-91,-100,-99,-105,91,-92,-95,-96,-97,-102,-106,-107,91,-98,-93,-101,-94,]),'FLOATNUMBER':([51,77,78,79,80,82,105,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,151,152,184,245,246,257,258,262,264,265,267,303,305,306,317,349,355,361,368,382,385,388,398,399,400,401,404,405,406,407,409,412,413,415,],[92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,92,-84,92,92,-104,92,92,92,92,-83,-90,92,92,-103,92,-91,-100,-99,-105,92,-92,-95,-96,-97,-102,-106,-107,92,-98,-93,-101,-94,]),'LIT_BOOL':([51,77,78,79,80,82,105,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,151,152,184,214,245,246,257,258,262,264,265,267,303,305,306,317,349,355,361,368,382,385,388,398,399,400,401,404,405,406,407,409,412,413,415,],[93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,93,271,-84,93,93,-104,93,93,93,93,-83,-90,93,93,-103,93,-91,-100,-99,-105,93,-92,-95,-96,-97,-102,-106,-107,93,-98,-93,-101,-94,]),'CONST':([52,65,159,],[99,99,99,]),'ENQUEUE':([184,245,246,258,303,305,349,361,368,382,385,398,399,400,401,404,405,406,409,412,413,415,],[248,-84,248,-104,-83,-90,-103,-91,-100,-99,-105,-92,-95,-96,-97,-102,-106,-107,-98,-93,-101,-94,]),'DEFER_ENQUEUEING':([184,245,246,258,303,305,349,361,368,382,385,398,399,400,401,404,405,406,409,412,413,415,],[249,-84,249,-104,-83,-90,-103,-91,-100,-99,-105,-92,-95,-96,-97,-102,-106,-107,-98,-93,-101,-94,]),'STALL_AND_WAIT':([184,245,246,258,303,305,349,361,368,382,385,398,399,400,401,404,405,406,409,412,413,415,],[250,-84,250,-104,-83,-90,-103,-91,-100,-99,-105,-92,-95,-96,-97,-102,-106,-107,-98,-93,-101,-94,]),'WAKEUP_PORT':([184,245,246,258,303,305,349,361,368,382,385,398,399,400,401,404,405,406,409,412,413,415,],[251,-84,251,-104,-83,-90,-103,-91,-100,-99,-105,-92,-95,-96,-97,-102,-106,-107,-98,-93,-101,-94,]),'PEEK':([184,245,246,258,303,305,349,361,368,382,385,398,399,400,401,404,405,406,409,412,413,415,],[252,-84,252,-104,-83,-90,-103,-91,-100,-99,-105,-92,-95,-96,-97,-102,-106,-107,-98,-93,-101,-94,]),'CHECK_ALLOCATE':([184,245,246,258,303,305,349,361,368,382,385,398,399,400,401,404,405,406,409,412,413,415,],[253,-84,253,-104,-83,-90,-103,-91,-100,-99,-105,-92,-95,-96,-97,-102,-106,-107,-98,-93,-101,-94,]),'CHECK_NEXT_CYCLE':([184,245,246,258,303,305,349,361,368,382,385,398,399,400,401,404,405,406,409,412,413,415,],[254,-84,254,-104,-83,-90,-103,-91,-100,-99,-105,-92,-95,-96,-97,-102,-106,-107,-98,-93,-101,-94,]),'CHECK_STOP_SLOTS':([184,245,246,258,303,305,349,361,368,382,385,398,399,400,401,404,405,406,409,412,413,415,],[255,-84,255,-104,-83,-90,-103,-91,-100,-99,-105,-92,-95,-96,-97,-102,-106,-107,-98,-93,-101,-94,]),'CHECK_PROBE':([184,245,246,258,303,305,349,361,368,382,385,398,399,400,401,404,405,406,409,412,413,415,],[256,-84,256,-104,-83,-90,-103,-91,-100,-99,-105,-92,-95,-96,-97,-102,-106,-107,-98,-93,-101,-94,]),'RETURN':([184,245,246,258,303,305,349,361,368,382,385,398,399,400,401,404,405,406,409,412,413,415,],[257,-84,257,-104,-83,-90,-103,-91,-100,-99,-105,-92,-95,-96,-97,-102,-106,-107,-98,-93,-101,-94,]),'IF':([184,245,246,258,303,305,349,361,368,382,385,396,398,399,400,401,404,405,406,409,412,413,415,],[259,-84,259,-104,-83,-90,-103,-91,-100,-99,-105,259,-92,-95,-96,-97,-102,-106,-107,-98,-93,-101,-94,]),'ELSE':([245,303,385,],[-84,-83,396,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'file':([0,],[1,]),'decls':([0,240,302,],[2,301,338,]),'declsx':([0,4,240,302,],[3,27,3,3,]),'decl':([0,4,240,302,],[4,4,4,4,]),'empty':([0,4,33,46,48,52,55,58,60,61,62,63,64,65,109,118,125,143,153,157,158,159,168,170,176,177,179,182,234,235,236,237,240,242,261,262,264,265,278,284,291,293,295,302,359,381,],[5,5,54,54,54,98,54,110,54,54,54,54,54,98,110,180,189,189,213,54,54,220,110,110,54,54,180,180,285,285,292,296,5,54,54,189,189,189,54,285,292,54,296,5,54,54,]),'ident':([0,4,12,23,30,31,32,34,35,36,37,38,39,40,41,43,51,52,53,58,65,69,71,73,77,78,79,80,82,87,94,99,105,106,107,109,118,124,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,148,151,152,153,155,156,159,161,162,168,170,179,181,182,184,185,221,222,228,229,230,234,235,236,237,240,246,257,262,264,265,267,282,284,291,295,302,306,307,308,309,310,311,312,314,315,317,326,336,355,357,362,363,364,365,366,370,388,407,],[10,10,33,42,47,48,49,55,56,59,10,10,10,10,10,66,74,10,102,109,10,120,10,123,74,74,74,74,74,10,154,10,74,10,59,109,10,186,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,205,74,10,74,74,10,215,216,10,102,224,109,109,10,242,10,74,260,154,277,260,280,59,10,10,293,297,10,74,74,74,74,74,74,59,10,293,297,10,74,260,260,260,260,260,260,260,260,74,59,47,74,59,10,10,260,260,10,260,74,74,]),'type':([0,4,37,38,39,40,41,51,52,65,71,77,78,79,80,82,87,99,105,106,118,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,148,151,152,153,159,179,182,184,234,235,240,246,257,262,264,265,267,284,302,306,317,355,362,363,366,388,407,],[12,12,60,61,62,63,64,73,94,94,122,73,73,73,73,73,150,160,73,165,181,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,207,73,73,211,221,181,181,73,12,12,12,73,73,73,73,73,73,12,12,73,73,73,377,378,381,73,73,]),'obj_decl':([0,4,118,179,182,234,235,240,284,302,],[20,20,179,179,179,286,286,20,286,20,]),'func_decl':([0,4,234,235,240,284,302,],[21,21,287,287,21,287,21,]),'func_def':([0,4,234,235,240,284,302,],[22,22,288,288,22,288,22,]),'void':([0,4,234,235,240,284,302,],[23,23,23,23,23,23,23,]),'typestr':([0,4,37,38,39,40,41,51,52,65,71,77,78,79,80,82,87,99,105,106,118,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,148,151,152,153,159,179,182,184,234,235,240,246,257,262,264,265,267,284,302,306,317,355,362,363,366,388,407,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'enumeration':([30,51,77,78,79,80,82,105,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,151,152,184,246,257,262,264,265,267,306,317,336,355,388,407,],[46,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,359,86,86,86,]),'pairs':([33,46,48,55,60,61,62,63,64,157,158,176,177,242,261,278,293,359,381,],[50,68,70,104,111,112,113,114,115,217,218,238,239,50,318,325,333,376,393,]),'idents':([36,107,230,282,326,357,],[57,166,282,327,357,375,]),'expr':([51,77,78,79,80,82,105,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,151,152,184,246,257,262,264,265,267,306,317,355,388,407,],[75,144,145,146,147,149,164,188,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,188,209,210,247,247,316,188,188,188,322,339,350,373,397,411,]),'aexpr':([51,77,78,79,80,82,105,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,151,152,184,246,257,262,264,265,267,306,317,355,388,407,],[76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'var':([51,77,78,79,80,82,105,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,151,152,184,185,228,246,257,262,264,265,267,306,307,308,309,310,311,312,314,315,317,355,364,365,370,388,407,],[84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,261,278,84,84,84,84,84,84,84,340,341,342,343,344,345,347,348,84,84,379,380,384,84,84,]),'literal':([51,77,78,79,80,82,105,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,143,151,152,184,246,257,262,264,265,267,306,317,355,388,407,],[85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,]),'params':([52,65,159,],[95,116,219,]),'types':([52,65,153,],[96,117,212,]),'param':([52,65,159,],[97,97,97,]),'pairsx':([53,161,],[100,223,]),'pair':([53,161,],[101,101,]),'identx':([58,109,168,170,],[108,169,231,232,]),'obj_decls':([118,179,182,],[178,241,243,]),'statements':([121,217,238,351,371,389,390,396,402,408,414,],[183,275,299,372,385,398,399,405,409,412,415,]),'exprs':([125,143,262,264,265,],[187,206,319,320,321,]),'statements_inner':([184,246,],[244,304,]),'statement':([184,246,],[246,246,]),'if_statement':([184,246,396,],[258,258,406,]),'ident_or_star':([229,],[279,]),'type_members':([234,235,284,],[283,289,329,]),'type_member':([234,235,284,],[284,284,284,]),'type_enums':([236,291,],[290,332,]),'type_enum':([236,291,],[291,291,]),'type_states':([237,295,],[294,335,]),'type_state':([237,295,],[295,295,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> file","S'",1,None,None,None),
+  ('file -> decls','file',1,'p_file','parser.py',263),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',267),
+  ('decls -> declsx','decls',1,'p_decls','parser.py',270),
+  ('declsx -> decl declsx','declsx',2,'p_declsx__list','parser.py',274),
+  ('declsx -> empty','declsx',1,'p_declsx__none','parser.py',284),
+  ('decl -> PROTOCOL STRING SEMI','decl',3,'p_decl__protocol','parser.py',288),
+  ('decl -> INCLUDE STRING SEMI','decl',3,'p_decl__include','parser.py',299),
+  ('decl -> MACHINE ( enumeration ) : obj_decls { decls }','decl',9,'p_decl__machine0','parser.py',308),
+  ('decl -> MACHINE ( enumeration pairs ) : obj_decls { decls }','decl',10,'p_decl__machine1','parser.py',312),
+  ('decl -> ACTION ( ident pairs ) statements','decl',6,'p_decl__action','parser.py',316),
+  ('decl -> IN_PORT ( ident , type , var pairs ) statements','decl',10,'p_decl__in_port','parser.py',320),
+  ('decl -> OUT_PORT ( ident , type , var pairs ) SEMI','decl',10,'p_decl__out_port','parser.py',324),
+  ('decl -> TRANS ( idents , idents , ident_or_star ) idents','decl',9,'p_decl__trans0','parser.py',328),
+  ('decl -> TRANS ( idents , idents ) idents','decl',7,'p_decl__trans1','parser.py',332),
+  ('decl -> TRANS ( idents , idents , ident_or_star ) idents idents','decl',10,'p_decl__trans2','parser.py',336),
+  ('decl -> TRANS ( idents , idents ) idents idents','decl',8,'p_decl__trans3','parser.py',340),
+  ('decl -> EXTERN_TYPE ( type pairs ) SEMI','decl',6,'p_decl__extern0','parser.py',344),
+  ('decl -> GLOBAL ( type pairs ) { type_members }','decl',8,'p_decl__global','parser.py',349),
+  ('decl -> STRUCT ( type pairs ) { type_members }','decl',8,'p_decl__struct','parser.py',354),
+  ('decl -> ENUM ( type pairs ) { type_enums }','decl',8,'p_decl__enum','parser.py',358),
+  ('decl -> STATE_DECL ( type pairs ) { type_states }','decl',8,'p_decl__state_decl','parser.py',363),
+  ('obj_decls -> obj_decl obj_decls','obj_decls',2,'p_obj_decls__list','parser.py',370),
+  ('obj_decls -> empty','obj_decls',1,'p_obj_decls__empty','parser.py',374),
+  ('type_members -> type_member type_members','type_members',2,'p_type_members__list','parser.py',378),
+  ('type_members -> empty','type_members',1,'p_type_members__empty','parser.py',382),
+  ('type_member -> obj_decl','type_member',1,'p_type_member__0','parser.py',386),
+  ('type_member -> func_decl','type_member',1,'p_type_member__0','parser.py',387),
+  ('type_member -> func_def','type_member',1,'p_type_member__0','parser.py',388),
+  ('decl -> obj_decl','decl',1,'p_decl__obj_decl','parser.py',393),
+  ('obj_decl -> type ident pairs SEMI','obj_decl',4,'p_obj_decl__0','parser.py',397),
+  ('obj_decl -> type STAR ident pairs SEMI','obj_decl',5,'p_obj_decl__1','parser.py',401),
+  ('obj_decl -> type ident ASSIGN expr SEMI','obj_decl',5,'p_obj_decl__2','parser.py',405),
+  ('obj_decl -> type STAR ident ASSIGN expr SEMI','obj_decl',6,'p_obj_decl__3','parser.py',411),
+  ('decl -> func_decl','decl',1,'p_decl__func_decl','parser.py',418),
+  ('func_decl -> void ident ( params ) pairs SEMI','func_decl',7,'p_func_decl__0','parser.py',422),
+  ('func_decl -> type ident ( params ) pairs SEMI','func_decl',7,'p_func_decl__0','parser.py',423),
+  ('func_decl -> void ident ( types ) pairs SEMI','func_decl',7,'p_func_decl__1','parser.py',427),
+  ('func_decl -> type ident ( types ) pairs SEMI','func_decl',7,'p_func_decl__1','parser.py',428),
+  ('decl -> func_def','decl',1,'p_decl__func_def','parser.py',432),
+  ('func_def -> void ident ( params ) pairs statements','func_def',7,'p_func_def__0','parser.py',436),
+  ('func_def -> type ident ( params ) pairs statements','func_def',7,'p_func_def__0','parser.py',437),
+  ('type_enums -> type_enum type_enums','type_enums',2,'p_type_enums__list','parser.py',442),
+  ('type_enums -> empty','type_enums',1,'p_type_enums__empty','parser.py',446),
+  ('type_enum -> ident pairs SEMI','type_enum',3,'p_type_enum','parser.py',450),
+  ('type_states -> type_state type_states','type_states',2,'p_type_states__list','parser.py',455),
+  ('type_states -> empty','type_states',1,'p_type_states__empty','parser.py',459),
+  ('type_state -> ident , enumeration pairs SEMI','type_state',5,'p_type_state','parser.py',463),
+  ('params -> param , params','params',3,'p_params__many','parser.py',468),
+  ('params -> param','params',1,'p_params__one','parser.py',472),
+  ('params -> empty','params',1,'p_params__none','parser.py',476),
+  ('param -> type ident','param',2,'p_param','parser.py',480),
+  ('param -> type STAR ident','param',3,'p_param__pointer','parser.py',484),
+  ('param -> type AMP ident','param',3,'p_param__ref','parser.py',488),
+  ('param -> CONST type AMP ident','param',4,'p_param__const_ref','parser.py',492),
+  ('param -> type STAR ident ASSIGN STRING','param',5,'p_param__pointer_default','parser.py',496),
+  ('param -> type ident ASSIGN NUMBER','param',4,'p_param__default_number','parser.py',500),
+  ('param -> type ident ASSIGN LIT_BOOL','param',4,'p_param__default_bool','parser.py',504),
+  ('param -> type ident ASSIGN STRING','param',4,'p_param__default_string','parser.py',508),
+  ('types -> type , types','types',3,'p_types__multiple','parser.py',513),
+  ('types -> type','types',1,'p_types__one','parser.py',517),
+  ('types -> empty','types',1,'p_types__empty','parser.py',521),
+  ('typestr -> typestr DOUBLE_COLON ident','typestr',3,'p_typestr__multi','parser.py',525),
+  ('typestr -> ident','typestr',1,'p_typestr__single','parser.py',529),
+  ('type -> typestr','type',1,'p_type__one','parser.py',533),
+  ('void -> VOID','void',1,'p_void','parser.py',537),
+  ('idents -> { identx }','idents',3,'p_idents__braced','parser.py',542),
+  ('idents -> ident','idents',1,'p_idents__bare','parser.py',546),
+  ('identx -> ident SEMI identx','identx',3,'p_identx__multiple_1','parser.py',550),
+  ('identx -> ident , identx','identx',3,'p_identx__multiple_1','parser.py',551),
+  ('identx -> ident identx','identx',2,'p_identx__multiple_2','parser.py',555),
+  ('identx -> empty','identx',1,'p_identx__single','parser.py',559),
+  ('ident -> IDENT','ident',1,'p_ident','parser.py',563),
+  ('ident_or_star -> ident','ident_or_star',1,'p_ident_or_star','parser.py',567),
+  ('ident_or_star -> STAR','ident_or_star',1,'p_ident_or_star','parser.py',568),
+  ('pairs -> , pairsx','pairs',2,'p_pairs__list','parser.py',573),
+  ('pairs -> empty','pairs',1,'p_pairs__empty','parser.py',577),
+  ('pairsx -> pair , pairsx','pairsx',3,'p_pairsx__many','parser.py',581),
+  ('pairsx -> pair','pairsx',1,'p_pairsx__one','parser.py',586),
+  ('pair -> ident = STRING','pair',3,'p_pair__assign','parser.py',591),
+  ('pair -> ident = ident','pair',3,'p_pair__assign','parser.py',592),
+  ('pair -> ident = NUMBER','pair',3,'p_pair__assign','parser.py',593),
+  ('pair -> STRING','pair',1,'p_pair__literal','parser.py',597),
+  ('statements -> { statements_inner }','statements',3,'p_statements__inner','parser.py',602),
+  ('statements -> { }','statements',2,'p_statements__none','parser.py',606),
+  ('statements_inner -> statement statements_inner','statements_inner',2,'p_statements_inner__many','parser.py',610),
+  ('statements_inner -> statement','statements_inner',1,'p_statements_inner__one','parser.py',614),
+  ('exprs -> expr , exprs','exprs',3,'p_exprs__multiple','parser.py',618),
+  ('exprs -> expr','exprs',1,'p_exprs__one','parser.py',622),
+  ('exprs -> empty','exprs',1,'p_exprs__empty','parser.py',626),
+  ('statement -> expr SEMI','statement',2,'p_statement__expression','parser.py',630),
+  ('statement -> expr ASSIGN expr SEMI','statement',4,'p_statement__assign','parser.py',634),
+  ('statement -> ENQUEUE ( var , type ) statements','statement',7,'p_statement__enqueue','parser.py',638),
+  ('statement -> ENQUEUE ( var , type , expr ) statements','statement',9,'p_statement__enqueue_latency','parser.py',642),
+  ('statement -> ENQUEUE ( var , type , expr , expr ) statements','statement',11,'p_statement__enqueue_latency_bypass_strict_fifo','parser.py',646),
+  ('statement -> DEFER_ENQUEUEING ( var , type ) statements','statement',7,'p_statement__defer_enqueueing','parser.py',650),
+  ('statement -> STALL_AND_WAIT ( var , var ) SEMI','statement',7,'p_statement__stall_and_wait','parser.py',654),
+  ('statement -> WAKEUP_PORT ( var , var ) SEMI','statement',7,'p_statement__wakeup_port','parser.py',658),
+  ('statement -> PEEK ( var , type pairs ) statements','statement',8,'p_statement__peek','parser.py',662),
+  ('statement -> CHECK_ALLOCATE ( var ) SEMI','statement',5,'p_statement__check_allocate','parser.py',666),
+  ('statement -> CHECK_NEXT_CYCLE ( ) SEMI','statement',4,'p_statement__check_next_cycle','parser.py',670),
+  ('statement -> CHECK_STOP_SLOTS ( var , STRING , STRING ) SEMI','statement',9,'p_statement__check_stop','parser.py',674),
+  ('statement -> CHECK_PROBE ( var , var ) SEMI','statement',7,'p_statement__check_probe','parser.py',678),
+  ('statement -> RETURN expr SEMI','statement',3,'p_statement__return','parser.py',682),
+  ('statement -> if_statement','statement',1,'p_statement__if','parser.py',686),
+  ('if_statement -> IF ( expr ) statements','if_statement',5,'p_if_statement__if','parser.py',690),
+  ('if_statement -> IF ( expr ) statements ELSE statements','if_statement',7,'p_if_statement__if_else','parser.py',694),
+  ('if_statement -> IF ( expr ) statements ELSE if_statement','if_statement',7,'p_statement__if_else_if','parser.py',698),
+  ('aexpr -> STATIC_CAST ( type , expr )','aexpr',6,'p_expr__static_cast','parser.py',704),
+  ('aexpr -> STATIC_CAST ( type , STRING , expr )','aexpr',8,'p_expr__static_cast_ptr','parser.py',708),
+  ('aexpr -> var','aexpr',1,'p_expr__var','parser.py',712),
+  ('aexpr -> type ident','aexpr',2,'p_expr__localvar','parser.py',716),
+  ('aexpr -> literal','aexpr',1,'p_expr__literal','parser.py',720),
+  ('aexpr -> enumeration','aexpr',1,'p_expr__enumeration','parser.py',724),
+  ('aexpr -> ident ( exprs )','aexpr',4,'p_expr__func_call','parser.py',728),
+  ('aexpr -> NEW type','aexpr',2,'p_expr__new','parser.py',732),
+  ('aexpr -> OOD','aexpr',1,'p_expr__null','parser.py',736),
+  ('aexpr -> aexpr DOT ident','aexpr',3,'p_expr__member','parser.py',740),
+  ('aexpr -> aexpr DOT ident ( exprs )','aexpr',6,'p_expr__member_method_call','parser.py',744),
+  ('aexpr -> aexpr [ exprs ]','aexpr',4,'p_expr__member_method_call_lookup','parser.py',750),
+  ('aexpr -> type DOUBLE_COLON ident ( exprs )','aexpr',6,'p_expr__class_method_call','parser.py',756),
+  ('expr -> aexpr','expr',1,'p_expr__aexpr','parser.py',762),
+  ('expr -> expr STAR expr','expr',3,'p_expr__binary_op','parser.py',766),
+  ('expr -> expr SLASH expr','expr',3,'p_expr__binary_op','parser.py',767),
+  ('expr -> expr MOD expr','expr',3,'p_expr__binary_op','parser.py',768),
+  ('expr -> expr PLUS expr','expr',3,'p_expr__binary_op','parser.py',769),
+  ('expr -> expr DASH expr','expr',3,'p_expr__binary_op','parser.py',770),
+  ('expr -> expr LT expr','expr',3,'p_expr__binary_op','parser.py',771),
+  ('expr -> expr GT expr','expr',3,'p_expr__binary_op','parser.py',772),
+  ('expr -> expr LE expr','expr',3,'p_expr__binary_op','parser.py',773),
+  ('expr -> expr GE expr','expr',3,'p_expr__binary_op','parser.py',774),
+  ('expr -> expr EQ expr','expr',3,'p_expr__binary_op','parser.py',775),
+  ('expr -> expr NE expr','expr',3,'p_expr__binary_op','parser.py',776),
+  ('expr -> expr AND expr','expr',3,'p_expr__binary_op','parser.py',777),
+  ('expr -> expr OR expr','expr',3,'p_expr__binary_op','parser.py',778),
+  ('expr -> expr RIGHTSHIFT expr','expr',3,'p_expr__binary_op','parser.py',779),
+  ('expr -> expr LEFTSHIFT expr','expr',3,'p_expr__binary_op','parser.py',780),
+  ('expr -> NOT expr','expr',2,'p_expr__unary_op','parser.py',785),
+  ('expr -> INCR expr','expr',2,'p_expr__unary_op','parser.py',786),
+  ('expr -> DECR expr','expr',2,'p_expr__unary_op','parser.py',787),
+  ('expr -> DASH expr','expr',2,'p_expr__unary_op','parser.py',788),
+  ('aexpr -> ( expr )','aexpr',3,'p_expr__parens','parser.py',792),
+  ('aexpr -> IS_VALID ( expr )','aexpr',4,'p_expr__is_valid_ptr','parser.py',796),
+  ('aexpr -> IS_INVALID ( expr )','aexpr',4,'p_expr__is_invalid_ptr','parser.py',800),
+  ('literal -> STRING','literal',1,'p_literal__string','parser.py',804),
+  ('literal -> NUMBER','literal',1,'p_literal__number','parser.py',808),
+  ('literal -> FLOATNUMBER','literal',1,'p_literal__float','parser.py',812),
+  ('literal -> LIT_BOOL','literal',1,'p_literal__bool','parser.py',816),
+  ('enumeration -> ident : ident','enumeration',3,'p_enumeration','parser.py',820),
+  ('var -> ident','var',1,'p_var','parser.py',824),
+]
@@ -69,52 +69,45 @@ class ExitEvent(Enum):
             given an exit event.
         """
 
-        if exit_string == "m5_workbegin instruction encountered":
-            return ExitEvent.WORKBEGIN
-        elif exit_string == "workbegin":
-            return ExitEvent.WORKBEGIN
-        elif exit_string == "m5_workend instruction encountered":
-            return ExitEvent.WORKEND
-        elif exit_string == "workend":
-            return ExitEvent.WORKEND
-        elif exit_string == "m5_exit instruction encountered":
-            return ExitEvent.EXIT
-        elif exit_string == "exiting with last active thread context":
-            return ExitEvent.EXIT
-        elif exit_string == "simulate() limit reached":
-            return ExitEvent.MAX_TICK
-        elif exit_string == "Tick exit reached":
-            return ExitEvent.SCHEDULED_TICK
-        elif exit_string == "switchcpu":
-            return ExitEvent.SWITCHCPU
-        elif exit_string == "m5_fail instruction encountered":
-            return ExitEvent.FAIL
-        elif exit_string == "checkpoint":
-            return ExitEvent.CHECKPOINT
-        elif exit_string == "user interrupt received":
-            return ExitEvent.USER_INTERRUPT
-        elif exit_string == "simpoint starting point found":
-            return ExitEvent.SIMPOINT_BEGIN
-        elif exit_string == "a thread reached the max instruction count":
-            return ExitEvent.MAX_INSTS
-        elif exit_string == "performance counter enabled":
-            return ExitEvent.PERF_COUNTER_ENABLE
-        elif exit_string == "performance counter disabled":
-            return ExitEvent.PERF_COUNTER_DISABLE
-        elif exit_string == "performance counter reset":
-            return ExitEvent.PERF_COUNTER_RESET
-        elif exit_string == "performance counter interrupt":
-            return ExitEvent.PERF_COUNTER_INTERRUPT
-        elif exit_string == "Kernel panic in simulated system.":
-            return ExitEvent.KERNEL_PANIC
-        elif exit_string == "Kernel oops in simulated system.":
-            return ExitEvent.KERNEL_OOPS
-        elif exit_string.endswith("will terminate the simulation.\n"):
-            # This is for the traffic generator exit event
-            return ExitEvent.EXIT
-        elif exit_string.endswith("is finished updating the memory.\n"):
-            # This is for the gups generator exit event
-            return ExitEvent.EXIT
+        exit_event = _exit_causes.get(exit_string)
+        if exit_event is not None:
+            return exit_event
+        for suffix, exit_event in _exit_cause_suffixes:
+            if exit_string.endswith(suffix):
+                return exit_event
         raise NotImplementedError(
             f"Exit event '{exit_string}' not implemented"
         )
+
+
+# The exit event of each known exit cause string.
+_exit_causes = {
+    "m5_workbegin instruction encountered": ExitEvent.WORKBEGIN,
+    "workbegin": ExitEvent.WORKBEGIN,
+    "m5_workend instruction encountered": ExitEvent.WORKEND,
+    "workend": ExitEvent.WORKEND,
+    "m5_exit instruction encountered": ExitEvent.EXIT,
+    "exiting with last active thread context": ExitEvent.EXIT,
+    "simulate() limit reached": ExitEvent.MAX_TICK,
+    "Tick exit reached": ExitEvent.SCHEDULED_TICK,
+    "switchcpu": ExitEvent.SWITCHCPU,
+    "m5_fail instruction encountered": ExitEvent.FAIL,
+    "checkpoint": ExitEvent.CHECKPOINT,
+    "user interrupt received": ExitEvent.USER_INTERRUPT,
+    "simpoint starting point found": ExitEvent.SIMPOINT_BEGIN,
+    "a thread reached the max instruction count": ExitEvent.MAX_INSTS,
+    "performance counter enabled": ExitEvent.PERF_COUNTER_ENABLE,
+    "performance counter disabled": ExitEvent.PERF_COUNTER_DISABLE,
+    "performance counter reset": ExitEvent.PERF_COUNTER_RESET,
+    "performance counter interrupt": ExitEvent.PERF_COUNTER_INTERRUPT,
+    "Kernel panic in simulated system.": ExitEvent.KERNEL_PANIC,
+    "Kernel oops in simulated system.": ExitEvent.KERNEL_OOPS,
+}
+
+# Exit causes which vary, identified by their suffix.
+_exit_cause_suffixes = (
+    # This is for the traffic generator exit event
+    ("will terminate the simulation.\n", ExitEvent.EXIT),
+    # This is for the gups generator exit event
+    ("is finished updating the memory.\n", ExitEvent.EXIT),
+)
@@ -0,0 +1,320 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Periodic (SMARTS-style) sampling for the stdlib Simulator.
+
+The workload is simulated as a repeating sequence of phases, each
+running a number of instructions on a set of cores of a
+SwitchableProcessor:
+
+  1. fast-forward (e.g., KVM or atomic cores without warming),
+  2. functional warming (e.g., atomic cores with caches),
+  3. detailed warming (the detailed cores, not measured),
+  4. detailed measurement, which yields one sample.
+
+Sampling stops when the confidence interval of the sampled metric is
+within the target relative error, when the maximum number of samples is
+reached, or when the workload ends.
+"""
+
+import math
+from statistics import NormalDist
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Optional,
+    Tuple,
+)
+
+import m5.stats
+from m5.util import inform
+
+from ..components.boards.abstract_board import AbstractBoard
+from ..components.processors.switchable_processor import SwitchableProcessor
+from .exit_event import ExitEvent
+
+
+class SampleStatistics:
+    """
+    Running statistics of a sampled metric, with a normal-approximation
+    confidence interval of its mean.
+    """
+
+    def __init__(self, confidence: float = 0.997):
+        """
+        :param confidence: The confidence level of the interval (e.g., 0.997
+                           for three standard deviations, as in SMARTS).
+        """
+        if not 0 < confidence < 1:
+            raise ValueError("The confidence level must be in (0, 1).")
+        self.confidence = confidence
+        self._z = NormalDist().inv_cdf((1 + confidence) / 2)
+        self.samples = []
+        # Welford's running mean and sum of squared differences.
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float) -> None:
+        self.samples.append(value)
+        delta = value - self._mean
+        self._mean += delta / len(self.samples)
+        self._m2 += delta * (value - self._mean)
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def mean(self) -> float:
+        return self._mean
+
+    def stdev(self) -> float:
+        """The sample standard deviation."""
+        if len(self.samples) < 2:
+            return math.nan
+        return math.sqrt(self._m2 / (len(self.samples) - 1))
+
+    def half_width(self) -> float:
+        """Half the width of the confidence interval of the mean."""
+        return self._z * self.stdev() / math.sqrt(len(self.samples))
+
+    def confidence_interval(self) -> Tuple[float, float]:
+        half_width = self.half_width()
+        return (self._mean - half_width, self._mean + half_width)
+
+    def relative_error(self) -> float:
+        """The half width of the confidence interval relative to the mean,
+        NaN with fewer than two samples."""
+        if len(self.samples) < 2:
+            return math.nan
+        if self._mean == 0:
+            return math.inf if self.half_width() else 0.0
+        return self.half_width() / abs(self._mean)
+
+    def to_json(self) -> Dict:
+        low, high = self.confidence_interval()
+        return {
+            "samples": len(self.samples),
+            "mean": self._mean,
+            "stdev": self.stdev(),
+            "confidence": self.confidence,
+            "confidence_interval": [low, high],
+            "relative_error": self.relative_error(),
+        }
+
+
+class PeriodicSampler:
+    """
+    Drives periodic sampling of a workload through ``MAX_INSTS`` exit
+    events.
+
+    Example
+    -------
+
+    .. code-block::
+
+        processor = SimpleSwitchableProcessor(
+            starting_core_type=CPUTypes.KVM,
+            switch_core_type=CPUTypes.O3,
+            num_cores=1,
+        )
+        ...
+        sampler = PeriodicSampler(
+            board=board,
+            fast_forward=("start", 10_000_000),
+            measure=("switch", 100_000),
+            detailed_warmup=10_000,
+            target_error=0.03,
+        )
+        simulator = Simulator(board=board, on_exit_event=sampler.on_exit_event())
+        sampler.start(simulator)
+        simulator.run()
+        print(sampler.statistics.to_json())
+
+    The phases are given as ``(core key, instructions)``, where the key is a
+    key of the SwitchableProcessor's cores. The processor must start on the
+    cores of the first phase with a non-zero length. Phases end when any
+    thread of the current cores reaches their length, so this is intended
+    for single-threaded workloads, as with SimPoints.
+
+    By default, the metric of a sample is the IPC of the current cores during
+    the measurement, measured in board clock cycles. Any other metric can be
+    computed by a function called at the end of each measurement (e.g., from
+    ``Simulator.get_simstats(incremental=True)``, as stats are reset at the
+    start of each measurement).
+    """
+
+    def __init__(
+        self,
+        board: AbstractBoard,
+        measure: Tuple[str, int],
+        fast_forward: Optional[Tuple[str, int]] = None,
+        warmup: Optional[Tuple[str, int]] = None,
+        detailed_warmup: int = 0,
+        metric: Optional[Callable[[], float]] = None,
+        target_error: Optional[float] = 0.03,
+        confidence: float = 0.997,
+        min_samples: int = 30,
+        max_samples: Optional[int] = None,
+        dump_stats: bool = False,
+    ) -> None:
+        """
+        :param board: The board, whose processor must be a
+                      SwitchableProcessor.
+        :param measure: The detailed cores and the number of instructions
+                        measured per sample.
+        :param fast_forward: The cores and the number of instructions to
+                             fast-forward between samples.
+        :param warmup: The cores and the number of instructions to
+                       functionally warm (e.g., caches) before each sample.
+        :param detailed_warmup: The number of instructions run on the
+                                detailed cores before each measurement,
+                                to warm their micro-architectural state.
+        :param metric: A function returning the metric of a sample when
+                       called at the end of its measurement. The IPC by
+                       default.
+        :param target_error: Stop once the half width of the confidence
+                             interval relative to the mean is at most this.
+                             ``None`` to never stop early.
+        :param confidence: The confidence level of the interval.
+        :param min_samples: The minimum number of samples before stopping
+                            early.
+        :param max_samples: Stop after this many samples, if set.
+        :param dump_stats: Dump the stats at the end of every measurement.
+        """
+        processor = board.get_processor()
+        if not isinstance(processor, SwitchableProcessor):
+            raise TypeError(
+                "Periodic sampling requires a SwitchableProcessor."
+            )
+
+        self._board = board
+        self._processor = processor
+        self._phases = [
+            (name, phase[0], phase[1])
+            for name, phase in (
+                ("fast-forward", fast_forward),
+                ("warmup", warmup),
+                ("detailed warmup", (measure[0], detailed_warmup)),
+                ("measure", measure),
+            )
+            if phase is not None and phase[1] > 0
+        ]
+        if self._phases[-1][0] != "measure":
+            raise ValueError("The measurement must run instructions.")
+
+        self._metric = metric or self._ipc
+        self._target_error = target_error
+        self._min_samples = max(min_samples, 2)
+        self._max_samples = max_samples
+        self._dump_stats = dump_stats
+        self.statistics = SampleStatistics(confidence)
+
+        self._phase = 0
+        self._start_tick = 0
+        self._clock_period = None
+
+    def on_exit_event(self) -> Dict[ExitEvent, Generator]:
+        """
+        The exit event handlers to pass to the Simulator. Other exit event
+        handlers may be added to the returned dictionary.
+        """
+        return {ExitEvent.MAX_INSTS: self._max_insts_generator()}
+
+    def start(self, simulator: "Simulator") -> None:
+        """
+        Schedule the end of the first phase. Must be called before
+        ``simulator.run()``.
+        """
+        self._phase = 0
+        self._switch_to(self._phases[0][1], simulator._instantiated)
+        simulator.schedule_max_insts(self._phases[0][2])
+        if self._phases[0][0] == "measure":
+            self._begin_measurement(simulator._instantiated)
+
+    def done(self) -> bool:
+        """Whether sampling has reached its stopping condition."""
+        if self._max_samples and len(self.statistics) >= self._max_samples:
+            return True
+        return (
+            self._target_error is not None
+            and len(self.statistics) >= self._min_samples
+            and self.statistics.relative_error() <= self._target_error
+        )
+
+    def _max_insts_generator(self) -> Generator[bool, None, None]:
+        while True:
+            yield self._end_phase()
+
+    def _end_phase(self) -> bool:
+        name = self._phases[self._phase][0]
+        if name == "measure":
+            self._end_measurement()
+            if self.done():
+                inform(
+                    f"Sampling done after {len(self.statistics)} samples: "
+                    f"mean {self.statistics.mean()}, relative error "
+                    f"{self.statistics.relative_error()}."
+                )
+                return True
+
+        self._phase = (self._phase + 1) % len(self._phases)
+        name, key, insts = self._phases[self._phase]
+        self._switch_to(key, True)
+        for core in self._processor.get_cores():
+            core._set_inst_stop_any_thread(insts, True)
+        if name == "measure":
+            self._begin_measurement(True)
+        return False
+
+    def _switch_to(self, key: str, instantiated: bool) -> None:
+        if (
+            self._processor.get_cores()
+            == self._processor._switchable_cores[key]
+        ):
+            return
+        if not instantiated:
+            raise ValueError(f"The processor must start on the '{key}' cores.")
+        self._processor.switch_to_processor(key)
+
+    def _begin_measurement(self, instantiated: bool) -> None:
+        # The stats are reset anyway when the simulation starts.
+        if instantiated:
+            m5.stats.reset()
+        self._start_tick = m5.curTick()
+
+    def _end_measurement(self) -> None:
+        self.statistics.add(self._metric())
+        if self._dump_stats:
+            m5.stats.dump()
+
+    def _ipc(self) -> float:
+        if self._clock_period is None:
+            self._clock_period = self._board.clk_domain.clock[0].getValue()
+        # The measurement ends when a thread has run this many instructions.
+        insts = self._phases[-1][2]
+        cycles = (m5.curTick() - self._start_tick) / self._clock_period
+        return insts / cycles if cycles else math.nan
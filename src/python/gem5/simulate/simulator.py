@@ -24,8 +24,13 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import json
 import os
+import select
 import sys
+import time
+import traceback
+from collections import deque
 from pathlib import Path
 from typing import (
     Callable,
@@ -44,9 +49,14 @@ from m5.objects import Root
 from m5.stats import addStatVisitor
 from m5.util import warn
 
+from _m5 import core
+
 from ..components.boards.abstract_board import AbstractBoard
 from ..components.processors.switchable_processor import SwitchableProcessor
-from .exit_event import ExitEvent
+from .exit_event import (
+    ExitEvent,
+    _exit_causes,
+)
 from .exit_event_generators import (
     dump_stats_generator,
     exit_generator,
@@ -56,6 +66,21 @@ from .exit_event_generators import (
     warn_default_decorator,
 )
 
+# Exit events indexed by the cause IDs reported by the simulator.
+_exit_events = tuple(ExitEvent)
+_exit_event_ids = {exit_event: i for i, exit_event in enumerate(_exit_events)}
+_exit_causes_registered = False
+
+
+def _register_exit_causes() -> None:
+    """Register the known exit cause strings with the simulator so that
+    exits report the ID of their exit event."""
+    global _exit_causes_registered
+    if not _exit_causes_registered:
+        for cause, exit_event in _exit_causes.items():
+            m5.registerExitCause(cause, _exit_event_ids[exit_event])
+        _exit_causes_registered = True
+
 
 class Simulator:
     """
@@ -104,6 +129,9 @@ class Simulator:
         ] = None,
         expected_execution_order: Optional[List[ExitEvent]] = None,
         checkpoint_path: Optional[Path] = None,
+        tick_stopwatch_size: Optional[int] = None,
+        coalesce_exits: Optional[List[ExitEvent]] = None,
+        max_coalesced_exits: int = 1024,
     ) -> None:
         """
         :param board: The board to be simulated.
@@ -138,6 +166,26 @@ class Simulator:
                                 the path is ``None``. **This parameter is deprecated.
                                 Please set the checkpoint when setting the board's
                                 workload**.
+        :param tick_stopwatch_size: The number of exit events kept by the tick
+                                    stopwatch (see ``get_tick_stopwatch()``).
+                                    Older events are dropped. ``None``, the
+                                    default, keeps every event.
+        :param coalesce_exits: Exit events which are coalesced. When one of
+                               these exits is met, the simulation continues
+                               without returning to Python until another
+                               type of exit is met or ``max_coalesced_exits``
+                               exits are seen. The coalesced exits are then
+                               recorded (in the tick stopwatch and when
+                               checking the expected execution order) and
+                               the handler of each type of coalesced exit
+                               is run once for the whole batch. The
+                               coalesced exits of the last batch are
+                               returned by ``get_coalesced_exits()``. This
+                               is meant for very frequent exits whose
+                               handlers don't need to run at the tick of
+                               every exit (e.g., recording ROI ticks).
+        :param max_coalesced_exits: The maximum number of exits handled by
+                                    one batch.
 
         ``on_exit_event`` usage notes
         ---------------------------
@@ -342,7 +390,19 @@ class Simulator:
         self._board = board
         self._full_system = full_system
         self._expected_execution_order = expected_execution_order
-        self._tick_stopwatch = []
+        self._tick_stopwatch = deque(maxlen=tick_stopwatch_size)
+        self._coalesce_exits = coalesce_exits or []
+        self._max_coalesced_exits = max_coalesced_exits
+        self._coalesced_exits = []
+
+        # The handler of each exit event, indexed by exit event ID. Exit
+        # events without a handler are None.
+        self._exit_handlers = [
+            self._on_exit_event.get(
+                exit_event, self._default_on_exit_dict.get(exit_event)
+            )
+            for exit_event in _exit_events
+        ]
 
         self._last_exit_event = None
         self._exit_event_count = 0
@@ -399,10 +459,17 @@ class Simulator:
 
         return self.get_simstats().to_json()
 
-    def get_simstats(self) -> SimStat:
+    def get_simstats(self, incremental: bool = False) -> SimStat:
         """
         Obtains the `SimStat` of the current simulation.
 
+        :param incremental: Reuse the stats tree built by a previous
+                            incremental call, only refreshing its values.
+                            This is much cheaper when stats are inspected
+                            frequently (e.g., in an exit event generator),
+                            but the returned SimStat is updated in place by
+                            later incremental calls.
+
         :raises Exception: An exception is raised if this function is called
                            before ``run()``. The board must be initialized
                            before obtaining statistics.
@@ -413,7 +480,9 @@ class Simulator:
                 "Cannot obtain simulation statistics prior to initialization."
             )
 
-        return m5.stats.gem5stats.get_simstat(self._root)
+        return m5.stats.gem5stats.get_simstat(
+            self._root, incremental=incremental
+        )
 
     def add_text_stats_output(self, path: str) -> None:
         """
@@ -479,9 +548,18 @@ class Simulator:
     def get_tick_stopwatch(self) -> List[Tuple[ExitEvent, int]]:
         """
         Returns a list of tuples, which each tuple specifying an exit event
-        and the ticks at that event.
+        and the ticks at that event. If ``tick_stopwatch_size`` is set, only
+        the last ``tick_stopwatch_size`` exit events are kept.
         """
-        return self._tick_stopwatch
+        return list(self._tick_stopwatch)
+
+    def get_coalesced_exits(self) -> List[Tuple[ExitEvent, int]]:
+        """
+        Returns the exit events coalesced into the last batch handled, and
+        the ticks at these events. The exit event which ended the batch
+        (i.e., ``get_last_exit_event_cause()``) is not included.
+        """
+        return self._coalesced_exits
 
     def get_roi_ticks(self) -> List[int]:
         """
@@ -581,64 +659,298 @@ class Simulator:
         # We instantiate the board if it has not already been instantiated.
         self._instantiate()
 
+        _register_exit_causes()
+        m5.setCoalescedExits(
+            [
+                _exit_event_ids[exit_event]
+                for exit_event in self._coalesce_exits
+            ],
+            self._max_coalesced_exits,
+        )
+
         # This while loop will continue until an a generator yields True.
         while True:
             self._last_exit_event = m5.simulate(max_ticks)
-
-            # Translate the exit event cause to the exit event enum.
-            exit_enum = ExitEvent.translate_exit_status(
-                self.get_last_exit_event_cause()
-            )
-
-            # Check to see the run is corresponding to the expected execution
-            # order (assuming this check is demanded by the user).
-            if self._expected_execution_order:
-                expected_enum = self._expected_execution_order[
-                    self._exit_event_count
+            cause_id = self._last_exit_event.getCauseId()
+            if cause_id < 0:
+                # Translate the exit event cause to the exit event enum, and
+                # let the simulator report it by ID from now on.
+                cause = self.get_last_exit_event_cause()
+                cause_id = _exit_event_ids[
+                    ExitEvent.translate_exit_status(cause)
                 ]
-                if exit_enum.value != expected_enum.value:
-                    raise Exception(
-                        f"Expected a '{expected_enum.value}' exit event but a "
-                        f"'{exit_enum.value}' exit event was encountered."
-                    )
-
-            # Record the current tick and exit event enum.
-            self._tick_stopwatch.append((exit_enum, self.get_current_tick()))
-
-            try:
-                # If the user has specified their own generator for this exit
-                # event, use it.
-                exit_on_completion = next(self._on_exit_event[exit_enum])
-            except StopIteration:
-                # If the user's generator has ended, throw a warning and use
-                # the default generator for this exit event.
-                warn(
-                    "User-specified generator/function list for the exit "
-                    f"event'{exit_enum.value}' has ended. Using the default "
-                    "generator."
-                )
-                exit_on_completion = next(
-                    self._default_on_exit_dict[exit_enum]
-                )
-            except KeyError:
-                # If the user has not specified their own generator for this
-                # exit event, use the default.
-                exit_on_completion = next(
-                    self._default_on_exit_dict[exit_enum]
-                )
-
-            self._exit_event_count += 1
+                m5.registerExitCause(cause, cause_id)
+
+            exit_on_completion = False
+            if self._coalesce_exits:
+                # Run the handler of each type of exit in the batch once,
+                # before the handler of the exit which ended it.
+                coalesced = m5.takeCoalescedExits()
+                self._coalesced_exits = [
+                    (_exit_events[coalesced_id], tick)
+                    for coalesced_id, tick in coalesced
+                ]
+                for coalesced_id, tick in coalesced:
+                    self._record_exit(coalesced_id, tick)
+                for coalesced_id in dict.fromkeys(
+                    coalesced_id for coalesced_id, _ in coalesced
+                ):
+                    if coalesced_id != cause_id:
+                        if self._handle_exit(coalesced_id):
+                            exit_on_completion = True
+
+            self._record_exit(cause_id, self.get_current_tick())
+            if self._handle_exit(cause_id):
+                exit_on_completion = True
 
             # If the generator returned True we will return from the Simulator
             # run loop. In the case of a function: if it returned True.
             if exit_on_completion:
                 return
 
+    def _record_exit(self, cause_id: int, tick: int) -> None:
+        """
+        Record an exit event in the tick stopwatch, checking that it
+        corresponds to the expected execution order (assuming this check is
+        demanded by the user).
+        """
+        exit_enum = _exit_events[cause_id]
+        if self._expected_execution_order:
+            expected_enum = self._expected_execution_order[
+                self._exit_event_count
+            ]
+            if exit_enum is not expected_enum:
+                raise Exception(
+                    f"Expected a '{expected_enum.value}' exit event but a "
+                    f"'{exit_enum.value}' exit event was encountered."
+                )
+
+        self._tick_stopwatch.append((exit_enum, tick))
+        self._exit_event_count += 1
+
+    def _handle_exit(self, cause_id: int) -> Optional[bool]:
+        """
+        Run the handler of an exit event and return whether the simulation
+        loop should exit.
+        """
+        handler = self._exit_handlers[cause_id]
+        if handler is None:
+            raise KeyError(_exit_events[cause_id])
+
+        try:
+            return next(handler)
+        except StopIteration:
+            # If the user's generator has ended, throw a warning and use
+            # the default generator for this exit event from now on.
+            exit_enum = _exit_events[cause_id]
+            warn(
+                "User-specified generator/function list for the exit "
+                f"event'{exit_enum.value}' has ended. Using the default "
+                "generator."
+            )
+            handler = self._default_on_exit_dict[exit_enum]
+            self._exit_handlers[cause_id] = handler
+            return next(handler)
+
     def save_checkpoint(self, checkpoint_dir: Path) -> None:
         """
         This function will save the checkpoint to the specified directory.
+        When a checkpoint store is enabled (``--checkpoint-store``), the
+        memory images of the checkpoint are moved to the store (see
+        ``m5.util.checkpoint_store``).
 
         :param checkpoint_dir: The path to the directory where the checkpoint
                                will be saved.
         """
         m5.checkpoint(str(checkpoint_dir))
+
+    def fork_regions(
+        self,
+        regions: Dict[str, Callable[["Simulator"], None]],
+        max_workers: Optional[int] = None,
+        simout: str = "%(parent)s/%(name)s",
+        reset_stats: bool = True,
+        max_ticks: int = m5.MaxTick,
+    ) -> Dict[str, Dict]:
+        """
+        Simulate several regions from the current state of the simulation,
+        each in a child process forked from this one. This replaces taking a
+        checkpoint of a warmed-up state and restoring it once per region.
+
+        Each child calls its region function with this simulator (e.g., to
+        schedule the end of the region with ``schedule_max_insts()``, or to
+        switch the processor), runs the simulation with ``run()`` and
+        reports its stats. The parent keeps at most ``max_workers`` children
+        running and continues from the state it forked in once all of them
+        are done.
+
+        Example
+        -------
+
+        .. code-block::
+
+            simulator.run()  # Run to the start of the regions of interest
+
+            def region(start: int, length: int):
+                def setup(simulator: Simulator) -> None:
+                    simulator.schedule_max_insts(length)
+                    ...
+                return setup
+
+            results = simulator.fork_regions(
+                {f"region{i}": region(*r) for i, r in enumerate(regions)},
+                max_workers=8,
+            )
+
+        .. note::
+
+            Forking requires the listeners (e.g., terminals and GDB) to be
+            disabled. They are disabled by this function.
+
+        :param regions: The function setting up each region, by region name.
+                        Names are used in file names, so they must not
+                        contain path separators.
+        :param max_workers: The maximum number of children running at once.
+                            The number of host CPUs by default.
+        :param simout: The output directory of each child. See
+                       ``m5.fork()``; ``%(name)s`` is the region name.
+                       Other format specifiers are substituted by
+                       ``m5.fork()``.
+        :param reset_stats: Reset the stats at the start of each region.
+        :param max_ticks: The ``max_ticks`` passed to ``run()`` in each child.
+
+        :returns: The result of each region, by region name. Each result
+                  holds the ``outdir`` of the child, its ``exit_code``, and,
+                  if the region completed, the ``tick`` and ``exit_cause``
+                  at its end and its ``stats`` (as ``get_stats()``), or the
+                  ``error`` it failed with.
+        """
+        from m5 import options
+
+        for name in regions:
+            if (
+                name in ("", ".", "..")
+                or "/" in name
+                or os.sep in name
+                or "\0" in name
+            ):
+                raise ValueError(f"Invalid region name '{name}'")
+
+        self._instantiate()
+        if not m5.listenersDisabled():
+            m5.disableAllListeners()
+
+        max_workers = max(max_workers or os.cpu_count() or 1, 1)
+        pending = list(regions.items())
+        # The region name, result file and pidfd (if supported) of each
+        # running child, by PID.
+        running = {}
+        results = {}
+
+        while pending or running:
+            while pending and len(running) < max_workers:
+                name, setup = pending.pop(0)
+                result_path = os.path.join(
+                    options.outdir, f".{name}.region.json"
+                )
+                # m5.fork() formats simout with %, so escape the name.
+                pid = m5.fork(
+                    simout.replace("%(name)s", name.replace("%", "%%"))
+                )
+                if pid == 0:
+                    self._run_forked_region(
+                        name, setup, result_path, reset_stats, max_ticks
+                    )
+                running[pid] = (name, result_path, _open_pidfd(pid))
+
+            # Only reap our children: other children of this process (e.g.,
+            # subprocesses of the user's script) are left alone.
+            for pid, status in _wait_children(running):
+                name, result_path, pidfd = running.pop(pid)
+                if pidfd is not None:
+                    os.close(pidfd)
+                try:
+                    with open(result_path) as f:
+                        result = json.load(f)
+                    os.remove(result_path)
+                except (OSError, ValueError):
+                    result = {"error": "the child did not report a result"}
+                result["exit_code"] = os.waitstatus_to_exitcode(status)
+                results[name] = result
+
+        return {name: results[name] for name in regions}
+
+    def _run_forked_region(
+        self,
+        name: str,
+        setup: Callable[["Simulator"], None],
+        result_path: str,
+        reset_stats: bool,
+        max_ticks: int,
+    ) -> None:
+        """
+        Run a region in a forked child and exit the child, without returning
+        to the caller of ``fork_regions()``.
+        """
+        from m5 import options
+
+        result = {"outdir": options.outdir}
+        exit_code = 0
+        try:
+            if reset_stats:
+                m5.stats.reset()
+            setup(self)
+            self.run(max_ticks)
+            result["tick"] = self.get_current_tick()
+            result["exit_cause"] = self.get_last_exit_event_cause()
+            result["stats"] = self.get_stats()
+        except BaseException as e:
+            traceback.print_exc()
+            result["error"] = f"{type(e).__name__}: {e}"
+            exit_code = 1
+
+        try:
+            with open(result_path, "w") as f:
+                json.dump(result, f)
+        except OSError:
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            # Don't run the parent's Python exit handlers (e.g., its final
+            # stats dump) in the child, only the simulator's cleanup.
+            core.doExitCleanup()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(exit_code)
+
+
+def _open_pidfd(pid: int) -> Optional[int]:
+    """A file descriptor which becomes readable when the child exits, if
+    the host supports it (Linux 5.3 and later)."""
+    try:
+        return os.pidfd_open(pid)
+    except (AttributeError, OSError):
+        return None
+
+
+def _wait_children(
+    children: Dict[int, Tuple[str, str, Optional[int]]]
+) -> List[Tuple[int, int]]:
+    """
+    Wait until at least one of the given children exits, and reap the
+    children which exited. Returns their PID and wait status.
+    """
+    while True:
+        exited = []
+        for pid in children:
+            wait_pid, status = os.waitpid(pid, os.WNOHANG)
+            if wait_pid:
+                exited.append((pid, status))
+        if exited:
+            return exited
+
+        pidfds = [pidfd for _, _, pidfd in children.values()]
+        if None in pidfds:
+            time.sleep(0.01)
+        else:
+            select.select(pidfds, [], [])
@@ -27,6 +27,7 @@
 import importlib
 import importlib.abc
 import importlib.util
+import marshal
 import os
 
 
@@ -42,6 +43,70 @@ class ByteCodeLoader(importlib.abc.Loader):
         return self.code
 
 
+# On-disk cache of code objects compiled from override sources.  Entries
+# use the standard pyc layout (magic, flags, mtime, size, marshalled code)
+# and live in the usual __pycache__ location next to the source, so a file
+# is only recompiled when its modification time or size changes.
+class ByteCodeCache:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _header(st):
+        return (
+            importlib.util.MAGIC_NUMBER
+            + (0).to_bytes(4, "little")
+            + (int(st.st_mtime) & 0xFFFFFFFF).to_bytes(4, "little")
+            + (st.st_size & 0xFFFFFFFF).to_bytes(4, "little")
+        )
+
+    def load(self, abspath):
+        st = os.stat(abspath)
+        header = self._header(st)
+        try:
+            cache_path = importlib.util.cache_from_source(abspath)
+        except NotImplementedError:
+            cache_path = None
+
+        if cache_path is not None:
+            try:
+                with open(cache_path, "rb") as f:
+                    data = f.read()
+                if data[: len(header)] == header:
+                    code = marshal.loads(data[len(header) :])
+                    self.hits += 1
+                    return code
+            except (OSError, ValueError, EOFError, TypeError):
+                pass
+
+        self.misses += 1
+        with open(abspath) as f:
+            code = compile(f.read(), abspath, "exec")
+
+        # Write the cache entry atomically; an unwritable source tree
+        # simply means we recompile next time.
+        if cache_path is not None:
+            tmp_path = f"{cache_path}.{os.getpid()}"
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                with open(tmp_path, "wb") as f:
+                    f.write(header + marshal.dumps(code))
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass
+        return code
+
+    def report(self):
+        import sys
+
+        print(
+            "M5_OVERRIDE_PY_SOURCE bytecode cache: "
+            f"{self.hits} hits, {self.misses} misses",
+            file=sys.stderr,
+        )
+
+
 # Simple importer that allows python to import data from a dict of
 # code objects.  The keys are the module path, and the items are the
 # filename and bytecode of the file.
@@ -50,6 +115,7 @@ class CodeImporter:
         self.modules = {}
         override_var = os.environ.get("M5_OVERRIDE_PY_SOURCE", "false")
         self.override = override_var.lower() in ("true", "yes")
+        self.cache = ByteCodeCache() if self.override else None
 
     def add_module(self, abspath, modpath, code):
         if modpath in self.modules:
@@ -64,8 +130,7 @@ class CodeImporter:
         abspath, code = self.modules[fullname]
 
         if self.override and os.path.exists(abspath):
-            src = open(abspath).read()
-            code = compile(src, abspath, "exec")
+            code = self.cache.load(abspath)
 
         is_package = os.path.basename(abspath) == "__init__.py"
         spec = importlib.util.spec_from_loader(
@@ -88,5 +153,10 @@ def install():
 
     sys.meta_path.insert(0, importer)
 
+    if importer.override:
+        import atexit
+
+        atexit.register(importer.cache.report)
+
     # Injected into this module's namespace by the c++ code that loads it.
     _init_all_embedded()
@@ -121,6 +121,111 @@ instanceDict = {}
 # Did any of the SimObjects lack a header file?
 noCxxHeader = False
 
+# Bumped whenever a SimObject gains or loses a parent, so that cached
+# descendant orderings and type indexes know when they are stale.
+_tree_generation = 0
+
+# Set once any SimObject has built a find_all() index.  Until then param
+# assignments don't need to look for indexes to keep up to date.
+_type_indexes_built = False
+
+# (SimObject class, ptype) -> names of the class's params whose declared
+# type is ptype or a subclass of it.  Cleared whenever a param is added.
+_params_of_type_cache = {}
+
+
+def _params_of_type(cls, ptype):
+    key = (cls, ptype)
+    names = _params_of_type_cache.get(key)
+    if names is None:
+        names = [
+            pname
+            for pname, pdesc in cls._params.items()
+            if issubclass(pdesc.ptype, ptype)
+        ]
+        _params_of_type_cache[key] = names
+    return names
+
+
+# The SimObject classes an object of the given type is an instance of,
+# i.e. the keys it is filed under in a type index.
+_simobject_mro_cache = {}
+
+
+def _simobject_mro(cls):
+    mro = _simobject_mro_cache.get(cls)
+    if mro is None:
+        mro = tuple(
+            base for base in cls.__mro__ if isinstance(base, MetaSimObject)
+        )
+        _simobject_mro_cache[cls] = mro
+    return mro
+
+
+# SimObject class -> (name, index keys) of each of its SimObject-valued
+# params.  Cleared whenever a param is added.
+_simobject_params_cache = {}
+
+
+def _simobject_params(cls):
+    params = _simobject_params_cache.get(cls)
+    if params is None:
+        params = [
+            (pname, _simobject_mro(pdesc.ptype))
+            for pname, pdesc in cls._params.items()
+            if isinstance(pdesc.ptype, MetaSimObject)
+        ]
+        _simobject_params_cache[cls] = params
+    return params
+
+
+def _param_matches(value):
+    """The objects a SimObject-typed param value contributes to find_all()."""
+    if value is None or isproxy(value) or isNullPointer(value):
+        return ()
+    if isinstance(value, list):
+        return [v for v in value if not isNullPointer(v)]
+    return (value,)
+
+
+class _SubtreeTypeIndex:
+    """The objects find_all() finds below a SimObject, filed by every
+    SimObject class they are (or, for param values, are declared as) an
+    instance of.  Each object is reference counted since it may be reachable
+    both as a child and as the value of one or more params."""
+
+    def __init__(self, root):
+        self.generation = _tree_generation
+        self._objects = {}
+        self._sorted = {}
+        for obj in root.descendants():
+            if obj is not root:
+                self.add(_simobject_mro(type(obj)), (obj,))
+            for pname, keys in _simobject_params(type(obj)):
+                self.add(keys, _param_matches(obj._values.get(pname)))
+
+    def add(self, keys, objs, count=1):
+        for key in keys:
+            objects = self._objects.setdefault(key, {})
+            for obj in objs:
+                n = objects.get(obj, 0) + count
+                if n:
+                    objects[obj] = n
+                else:
+                    del objects[obj]
+            self._sorted.pop(key, None)
+
+    def find(self, ptype):
+        found = self._sorted.get(ptype)
+        if found is None:
+            # Sort based on the objects' path to ensure that the order is
+            # the same on all hosts
+            found = sorted(
+                self._objects.get(ptype, ()), key=lambda o: o.path()
+            )
+            self._sorted[ptype] = found
+        return list(found)
+
 
 def public_value(key, value):
     return key.startswith("_") or isinstance(
@@ -314,6 +419,8 @@ class MetaSimObject(type):
         assert not hasattr(pdesc, "name")
         pdesc.name = name
         cls._params[name] = pdesc
+        _params_of_type_cache.clear()
+        _simobject_params_cache.clear()
         if hasattr(pdesc, "default"):
             cls._set_param(name, pdesc.default, pdesc)
 
@@ -739,6 +846,9 @@ class SimObject(metaclass=MetaSimObject):
         self._name = None
         self._ccObject = None  # pointer to C++ object
         self._ccParams = None
+        self._descendants_cache = None
+        self._any_index = None
+        self._all_index = None
         self._instantiated = False  # really "cloned"
         self._init_called = True  # Checked so subclasses don't forget __init__
 
@@ -886,6 +996,8 @@ class SimObject(metaclass=MetaSimObject):
                 )
                 e.args = (msg,)
                 raise
+            if _type_indexes_built:
+                self._update_type_indexes(attr, self._values.get(attr), value)
             self._values[attr] = value
 
             # If we assign NULL to an attr that is a SimObject,
@@ -932,13 +1044,17 @@ class SimObject(metaclass=MetaSimObject):
 
     # Also implemented by SimObjectVector
     def clear_parent(self, old_parent):
+        global _tree_generation
         assert self._parent is old_parent
         self._parent = None
+        _tree_generation += 1
 
     # Also implemented by SimObjectVector
     def set_parent(self, parent, name):
+        global _tree_generation
         self._parent = parent
         self._name = name
+        _tree_generation += 1
 
     # Return parent object of this SimObject, not implemented by
     # SimObjectVector because the elements in a SimObjectVector may not share
@@ -1024,17 +1140,46 @@ class SimObject(metaclass=MetaSimObject):
     def ini_str(self):
         return self.path()
 
+    # Keep the find_all() indexes of this object and its ancestors in step
+    # with an assignment to one of its params.
+    def _update_type_indexes(self, pname, old_value, new_value):
+        pdesc = self._params[pname]
+        if not isinstance(pdesc.ptype, MetaSimObject):
+            return
+        keys = _simobject_mro(pdesc.ptype)
+        old_objs = _param_matches(old_value)
+        new_objs = _param_matches(new_value)
+        node = self
+        while isSimObject(node):
+            index = node._all_index
+            if index is not None and index.generation == _tree_generation:
+                index.add(keys, old_objs, -1)
+                index.add(keys, new_objs)
+            node = node._parent
+
+    def _children_of_type(self, ptype):
+        index = self._any_index
+        if index is None or index[0] != _tree_generation:
+            by_type = {}
+            for child in self._children.values():
+                if isSimObject(child):
+                    for cls in _simobject_mro(type(child)):
+                        by_type.setdefault(cls, []).append(child)
+            index = (_tree_generation, by_type)
+            self._any_index = index
+        return index[1].get(ptype, ())
+
     def find_any(self, ptype):
         if isinstance(self, ptype):
             return self, True
 
         found_obj = None
-        for child in self._children.values():
+        for child in self._children_of_type(ptype):
             visited = False
             if hasattr(child, "_visited"):
                 visited = getattr(child, "_visited")
 
-            if isinstance(child, ptype) and not visited:
+            if not visited:
                 if found_obj != None and child != found_obj:
                     raise AttributeError(
                         "parent.any matched more than one: %s %s"
@@ -1042,47 +1187,24 @@ class SimObject(metaclass=MetaSimObject):
                     )
                 found_obj = child
         # search param space
-        for pname, pdesc in self._params.items():
-            if issubclass(pdesc.ptype, ptype):
-                match_obj = self._values[pname]
-                if found_obj != None and found_obj != match_obj:
-                    raise AttributeError(
-                        "parent.any matched more than one: %s and %s"
-                        % (found_obj.path, match_obj.path)
-                    )
-                found_obj = match_obj
+        for pname in _params_of_type(type(self), ptype):
+            match_obj = self._values[pname]
+            if found_obj != None and found_obj != match_obj:
+                raise AttributeError(
+                    "parent.any matched more than one: %s and %s"
+                    % (found_obj.path, match_obj.path)
+                )
+            found_obj = match_obj
         return found_obj, found_obj != None
 
     def find_all(self, ptype):
-        all = {}
-        # search children
-        for child in self._children.values():
-            # a child could be a list, so ensure we visit each item
-            if isinstance(child, list):
-                children = child
-            else:
-                children = [child]
-
-            for child in children:
-                if (
-                    isinstance(child, ptype)
-                    and not isproxy(child)
-                    and not isNullPointer(child)
-                ):
-                    all[child] = True
-                if isSimObject(child):
-                    # also add results from the child itself
-                    child_all, done = child.find_all(ptype)
-                    all.update(dict(zip(child_all, [done] * len(child_all))))
-        # search param space
-        for pname, pdesc in self._params.items():
-            if issubclass(pdesc.ptype, ptype):
-                match_obj = self._values[pname]
-                if not isproxy(match_obj) and not isNullPointer(match_obj):
-                    all[match_obj] = True
-        # Also make sure to sort the keys based on the objects' path to
-        # ensure that the order is the same on all hosts
-        return sorted(all.keys(), key=lambda o: o.path()), True
+        global _type_indexes_built
+        index = self._all_index
+        if index is None or index.generation != _tree_generation:
+            index = _SubtreeTypeIndex(self)
+            self._all_index = index
+            _type_indexes_built = True
+        return index.find(ptype), True
 
     def unproxy(self, base):
         return self
@@ -1259,6 +1381,15 @@ class SimObject(metaclass=MetaSimObject):
         for name, child in sorted(self._children.items()):
             yield from child.descendants()
 
+    # Same order as descendants(), but computed once and returned as a
+    # tuple which is reused until the object tree is next modified.
+    def frozen_descendants(self):
+        cache = self._descendants_cache
+        if cache is None or cache[0] != _tree_generation:
+            cache = (_tree_generation, tuple(self.descendants()))
+            self._descendants_cache = cache
+        return cache[1]
+
     # Call C++ to create C++ object corresponding to this object
     def createCCObject(self):
         if self.abstract:
@@ -25,12 +25,20 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from .abstract_stat import AbstractStat
+from .columnar import (
+    ColumnarArchive,
+    ColumnarWriter,
+)
+from .compare import StatsComparison
 from .group import Group
 from .jsonloader import JsonLoader
+from .livestats import LiveStatsClient
 from .serializable_stat import SerializableStat
 from .simstat import SimStat
+from .statindex import StatIndex
 from .statistic import Statistic
 from .storagetype import StorageType
+from .streamloader import CompactDump
 from .timeconversion import TimeConversion
 
 __all__ = [
@@ -42,4 +50,10 @@ __all__ = [
     "StorageType",
     "SerializableStat",
     "JsonLoader",
+    "ColumnarArchive",
+    "ColumnarWriter",
+    "StatIndex",
+    "CompactDump",
+    "StatsComparison",
+    "LiveStatsClient",
 ]
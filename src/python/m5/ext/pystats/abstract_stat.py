@@ -24,16 +24,31 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import re
 from typing import (
+    Any,
     Callable,
     List,
     Optional,
     Pattern,
+    Tuple,
     Union,
 )
 
 from .serializable_stat import SerializableStat
+from .statindex import (
+    StatIndex,
+    compile_regex,
+    get_index,
+    tree_changed,
+)
+
+
+def _child_stats(stat: "AbstractStat") -> List[Tuple[str, "AbstractStat"]]:
+    return [
+        (attr, obj)
+        for attr, obj in stat.__dict__.items()
+        if isinstance(obj, AbstractStat)
+    ]
 
 
 class AbstractStat(SerializableStat):
@@ -43,6 +58,18 @@ class AbstractStat(SerializableStat):
     All PyStats are JsonSerializable.
     """
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if isinstance(value, AbstractStat) or isinstance(
+            self.__dict__.get(name), AbstractStat
+        ):
+            tree_changed()
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if isinstance(self.__dict__.get(name), AbstractStat):
+            tree_changed()
+        super().__delattr__(name)
+
     def children(
         self,
         predicate: Optional[Callable[[str], bool]] = None,
@@ -60,19 +87,27 @@ class AbstractStat(SerializableStat):
                           If it returns ``True``, then the child is yielded.
                           Otherwise, the child is skipped. If not provided then
                           all children are returned.
+
+        :param recursive: Optional. Also return the children's children,
+                          depth first.
         """
 
-        to_return = []
-        for attr in self.__dict__:
-            obj = getattr(self, attr)
-            if isinstance(obj, AbstractStat):
-                if (predicate and predicate(attr)) or not predicate:
-                    to_return.append(obj)
-                if recursive:
-                    to_return = to_return + obj.children(
-                        predicate=predicate, recursive=True
-                    )
+        if not recursive:
+            return [
+                obj
+                for attr, obj in _child_stats(self)
+                if not predicate or predicate(attr)
+            ]
 
+        # Walk the live tree depth first. Children are pushed in reverse so
+        # they are visited in order.
+        to_return = []
+        stack = _child_stats(self)[::-1]
+        while stack:
+            attr, obj = stack.pop()
+            if not predicate or predicate(attr):
+                to_return.append(obj)
+            stack.extend(_child_stats(obj)[::-1])
         return to_return
 
     def find(self, regex: Union[str, Pattern]) -> List["AbstractStat"]:
@@ -93,9 +128,22 @@ class AbstractStat(SerializableStat):
                 precompiled regex or a string in regex format.
         """
         if isinstance(regex, str):
-            pattern = re.compile(regex)
+            pattern = compile_regex(regex)
         else:
             pattern = regex
-        return self.children(
-            lambda _name: re.match(pattern, _name), recursive=True
-        )
+        return self.children(pattern.match, recursive=True)
+
+    def index(self) -> StatIndex:
+        """Returns an index of all the stats below this one by dotted path,
+        built on first use, for fast exact, glob, regex and prefix lookups.
+
+        .. code-block::
+
+            >>> index = simstat.index()
+            >>> index.get("board.processor.cores0.core.ipc")
+            >>> dict(index.glob("board.processor.cores*.core.ipc"))
+
+        The index is rebuilt on the next call after stats are added to or
+        removed from the tree.
+        """
+        return get_index(self)
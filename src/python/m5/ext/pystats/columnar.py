@@ -0,0 +1,329 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+A columnar archive of stat dumps, designed so that analysis scripts can pull
+a handful of time series out of a long run without parsing the rest.
+
+An archive is a directory holding:
+
+* ``schema.json``: the archive version, the number of values in each row and,
+  for every column, its name, shape, offset within a row and any metadata
+  (e.g. the subnames of a vector).
+* ``data.bin``: the rows of stat values as little-endian float64, grouped in
+  blocks of up to ``block_rows`` rows. Each block is stored column-major, so
+  the values of one column across the block are contiguous.
+* ``blocks.bin``: the number of rows in each block, as little-endian uint32.
+
+Each column holds one stat per row (i.e. per dump). Scalars have shape
+``()``, vectors ``(n,)`` and distribution buckets ``(bins,)``. The writer only
+needs the standard library; the reader requires NumPy.
+"""
+
+import fnmatch
+import json
+import os
+import re
+import sys
+from array import array
+from typing import (
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+FORMAT_VERSION = 1
+
+SCHEMA_FILE = "schema.json"
+DATA_FILE = "data.bin"
+BLOCKS_FILE = "blocks.bin"
+
+Value = Union[float, int, Sequence[Union[float, int]]]
+
+
+def _little_endian(values: array) -> array:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+class ColumnarWriter:
+    """
+    Appends rows of stat values to a columnar archive. The columns are fixed
+    by the first row written.
+    """
+
+    def __init__(self, path: str, block_rows: int = 16, append: bool = False):
+        """
+        :param path: The archive directory. It is created if needed.
+
+        :param block_rows: The number of rows buffered before a block is
+                           written out. Partially filled blocks are written
+                           by ``flush()`` and ``close()``.
+
+        :param append: Append rows to an existing archive, whose columns
+                       must match, instead of replacing it.
+        """
+
+        if block_rows < 1:
+            raise ValueError("block_rows must be at least 1")
+
+        self.path = path
+        self.block_rows = block_rows
+        self._columns = None
+        self._row_length = 0
+        self._rows = []
+
+        os.makedirs(path, exist_ok=True)
+        schema_path = os.path.join(path, SCHEMA_FILE)
+        if append and os.path.exists(schema_path):
+            with open(schema_path) as f:
+                schema = json.load(f)
+            self._set_columns(
+                [
+                    (column["name"], tuple(column["shape"]))
+                    for column in schema["columns"]
+                ]
+            )
+        else:
+            for name in (SCHEMA_FILE, DATA_FILE, BLOCKS_FILE):
+                if os.path.exists(os.path.join(path, name)):
+                    os.remove(os.path.join(path, name))
+
+    def _set_columns(self, columns: List[Tuple[str, Tuple[int, ...]]]):
+        self._columns = []
+        offset = 0
+        for name, shape in columns:
+            size = 1
+            for dim in shape:
+                size *= dim
+            self._columns.append((name, shape, offset, size))
+            offset += size
+        self._row_length = offset
+
+    def _write_schema(self, row: Mapping[str, Value], metadata: Mapping):
+        columns = []
+        for name, value in row.items():
+            shape = () if isinstance(value, (int, float)) else (len(value),)
+            columns.append((name, shape))
+        self._set_columns(columns)
+
+        schema = {
+            "version": FORMAT_VERSION,
+            "row_length": self._row_length,
+            "columns": [
+                {
+                    "name": name,
+                    "shape": list(shape),
+                    "offset": offset,
+                    "metadata": metadata.get(name, {}),
+                }
+                for name, shape, offset, _ in self._columns
+            ],
+        }
+        tmp_path = os.path.join(self.path, f"{SCHEMA_FILE}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(schema, f)
+        os.replace(tmp_path, os.path.join(self.path, SCHEMA_FILE))
+
+    def write(
+        self,
+        row: Mapping[str, Value],
+        metadata: Optional[Mapping[str, Dict]] = None,
+    ) -> None:
+        """
+        Append a row.
+
+        :param row: Maps each column name to a number or a sequence of
+                    numbers. Every row must have the same columns, with the
+                    same shapes, as the first.
+
+        :param metadata: Per-column metadata to record in the schema. Only
+                         used for the first row.
+        """
+
+        if self._columns is None:
+            self._write_schema(row, metadata or {})
+
+        if len(row) != len(self._columns):
+            raise ValueError(
+                f"Row has {len(row)} columns, archive has "
+                f"{len(self._columns)}"
+            )
+
+        values = array("d")
+        for name, shape, offset, size in self._columns:
+            try:
+                value = row[name]
+            except KeyError:
+                raise ValueError(f"Row is missing column '{name}'")
+            if shape:
+                if len(value) != size:
+                    raise ValueError(
+                        f"Column '{name}' has {len(value)} values, "
+                        f"expected {size}"
+                    )
+                values.extend(value)
+            else:
+                values.append(value)
+
+        self._rows.append(values)
+        if len(self._rows) >= self.block_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out any buffered rows as a block."""
+
+        if not self._rows:
+            return
+
+        # Transpose the buffered rows so each column is contiguous.
+        nrows = len(self._rows)
+        block = array("d", bytes(8 * nrows * self._row_length))
+        for index, row in enumerate(self._rows):
+            block[index::nrows] = row
+        self._rows = []
+
+        with open(os.path.join(self.path, DATA_FILE), "ab") as f:
+            _little_endian(block).tofile(f)
+        with open(os.path.join(self.path, BLOCKS_FILE), "ab") as f:
+            _little_endian(array("I", [nrows])).tofile(f)
+
+    def close(self) -> None:
+        self.flush()
+
+
+class ColumnarArchive:
+    """
+    Reads a columnar archive. The data file is memory-mapped, so querying a
+    column only reads that column's values from each block.
+
+    .. code-block::
+
+        from m5.ext.pystats.columnar import ColumnarArchive
+
+        archive = ColumnarArchive("m5out/stats.col")
+        for name, series in archive.find("board.processor.*.ipc").items():
+            print(name, series.mean())
+    """
+
+    def __init__(self, path: str):
+        import numpy as np
+
+        self.path = path
+        with open(os.path.join(path, SCHEMA_FILE)) as f:
+            schema = json.load(f)
+        if schema["version"] != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported columnar stats version {schema['version']}"
+            )
+
+        self._row_length = schema["row_length"]
+        self._columns = {
+            column["name"]: column for column in schema["columns"]
+        }
+
+        blocks_path = os.path.join(path, BLOCKS_FILE)
+        if os.path.getsize(blocks_path):
+            block_rows = np.fromfile(blocks_path, dtype="<u4")
+        else:
+            block_rows = np.zeros(0, dtype="<u4")
+
+        data_path = os.path.join(path, DATA_FILE)
+        # Ignore a trailing block which is only partially written.
+        available = os.path.getsize(data_path) // 8
+        self._blocks = []
+        start = 0
+        for rows in block_rows.tolist():
+            end = start + rows * self._row_length
+            if end > available:
+                break
+            self._blocks.append((start, rows))
+            start = end
+
+        self._data = (
+            np.memmap(data_path, dtype="<f8", mode="r", shape=(start,))
+            if start
+            else np.zeros(0, dtype="<f8")
+        )
+
+    def __len__(self) -> int:
+        """The number of rows (dumps) in the archive."""
+        return sum(rows for _, rows in self._blocks)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._columns)
+
+    def metadata(self, name: str) -> Dict:
+        return self._columns[name]["metadata"]
+
+    def column(self, name: str) -> "numpy.ndarray":
+        """
+        Return the values of a column as an array of shape
+        ``(rows,) + shape``.
+        """
+
+        import numpy as np
+
+        column = self._columns[name]
+        shape = tuple(column["shape"])
+        offset = column["offset"]
+        size = 1
+        for dim in shape:
+            size *= dim
+
+        parts = []
+        for start, rows in self._blocks:
+            block = self._data[start : start + rows * self._row_length]
+            block = block.reshape(self._row_length, rows)
+            parts.append(block[offset : offset + size].T)
+
+        if parts:
+            values = np.concatenate(parts)
+        else:
+            values = np.zeros((0, size))
+        return values.reshape((len(values),) + shape)
+
+    def find(self, pattern: Union[str, Pattern]) -> Dict[str, "numpy.ndarray"]:
+        """
+        Return the columns whose names match a glob-style pattern (e.g.
+        ``"system.cpu*.ipc"``) or a compiled regular expression.
+        """
+
+        if isinstance(pattern, str):
+            pattern = re.compile(fnmatch.translate(pattern))
+        return {
+            name: self.column(name)
+            for name in self._columns
+            if pattern.fullmatch(name)
+        }
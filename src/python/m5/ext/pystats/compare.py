@@ -0,0 +1,477 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Compares the stats of two runs, e.g. to check that a change to the simulator
+does not change its results beyond some tolerance. Stats are aligned by
+path, dump by dump, and compared with absolute and relative tolerances which
+can be set per stat. The largest divergences are reported.
+
+The inputs may be text (``stats.txt``) or JSON stats files, optionally
+gzip-compressed, and are read one dump at a time. Only one dump of the first
+run is held in memory, in compact arrays, while the second run's matching
+dump is streamed against it.
+
+.. code-block::
+
+    from m5.ext.pystats.compare import StatsComparison
+
+    comparison = StatsComparison(rel_tol=1e-6, ignore=["*.hostSeconds"])
+    comparison.compare_files("old/stats.txt", "new/stats.txt")
+    for divergence in comparison.top():
+        print(divergence)
+
+It can also be used from the command line, see ``util/compare-stats.py``.
+"""
+
+import argparse
+import gzip
+import heapq
+import math
+import sys
+from itertools import (
+    count,
+    zip_longest,
+)
+from typing import (
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .statindex import compile_glob
+from .streamloader import (
+    CompactDump,
+    load_dumps,
+)
+from .textloader import load_text_dumps
+
+# Stats which differ between identical runs.
+HOST_STATS = ("*host*",)
+
+
+class Divergence:
+    """A stat whose values differ between two runs by more than allowed."""
+
+    __slots__ = ("dump", "path", "left", "right")
+
+    def __init__(
+        self,
+        dump: int,
+        path: str,
+        left: Optional[float],
+        right: Optional[float],
+    ):
+        self.dump = dump
+        self.path = path
+        # None if the stat is missing from that run.
+        self.left = left
+        self.right = right
+
+    @property
+    def abs_diff(self) -> float:
+        if self.left is None or self.right is None:
+            return math.inf
+        return abs(self.left - self.right)
+
+    @property
+    def rel_diff(self) -> float:
+        diff = self.abs_diff
+        if math.isinf(diff) or math.isnan(diff):
+            return math.inf
+        scale = max(abs(self.left), abs(self.right))
+        return diff / scale if scale else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"Divergence(dump={self.dump}, path={self.path!r}, "
+            f"left={self.left}, right={self.right})"
+        )
+
+
+def open_stats(path: str) -> IO[str]:
+    """Opens a (possibly gzip-compressed) stats file in text mode."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt")
+    return open(path)
+
+
+def load_stats_dumps(
+    stats_file: IO[str], paths: Optional[Iterable[str]] = None
+) -> Iterator[CompactDump]:
+    """
+    Yields the dumps in a text or JSON stats file, detecting the format
+    from its first character.
+    """
+
+    first = stats_file.read(1)
+    while first.isspace():
+        first = stats_file.read(1)
+
+    if first in "{[":
+        # Hand the JSON loader the whole stream, including what was read.
+        class _Rewound:
+            def __init__(self):
+                self.pending = first
+
+            def read(self, size: int = -1) -> str:
+                pending, self.pending = self.pending, ""
+                return pending + stats_file.read(size)
+
+        return load_dumps(_Rewound(), paths)
+
+    def with_first_line() -> Iterator[str]:
+        yield first + stats_file.readline()
+        yield from stats_file
+
+    return load_text_dumps(with_first_line(), paths)
+
+
+class StatsComparison:
+    """
+    Compares runs stat by stat. Two values ``a`` and ``b`` match if
+    ``abs(a - b) <= max(abs_tol, rel_tol * max(abs(a), abs(b)))``, as with
+    ``math.isclose``; NaNs match each other.
+    """
+
+    def __init__(
+        self,
+        abs_tol: float = 0.0,
+        rel_tol: float = 0.0,
+        tolerances: Sequence[Tuple[str, float, float]] = (),
+        ignore: Sequence[str] = HOST_STATS,
+        top: int = 20,
+        sort_by: str = "relative",
+    ):
+        """
+        :param abs_tol: The default absolute tolerance.
+
+        :param rel_tol: The default relative tolerance.
+
+        :param tolerances: ``(pattern, abs_tol, rel_tol)`` overrides for the
+                           stats whose paths match the glob-style pattern.
+                           The first matching pattern is used.
+
+        :param ignore: Glob-style patterns of stats not to compare. By
+                       default, stats of the host (e.g. ``hostSeconds``).
+
+        :param top: The number of largest divergences to keep.
+
+        :param sort_by: Rank divergences by their ``"relative"`` or
+                        ``"absolute"`` difference.
+        """
+
+        if sort_by not in ("relative", "absolute"):
+            raise ValueError(f"Cannot sort divergences by '{sort_by}'")
+
+        self.abs_tol = abs_tol
+        self.rel_tol = rel_tol
+        self._tolerances = [
+            (compile_glob(pattern).fullmatch, abs_t, rel_t)
+            for pattern, abs_t, rel_t in tolerances
+        ]
+        self._ignore = [compile_glob(pattern).fullmatch for pattern in ignore]
+        self.top_n = top
+        self.sort_by = sort_by
+
+        self.dumps = 0
+        self.compared = 0
+        self.divergent = 0
+        self.missing = 0
+        self.missing_dumps = 0
+        self._top = []
+        self._order = count()
+        # Per-stat tolerances, for each tuple of names seen and for each
+        # sequence.
+        self._limits_cache = {}
+        self._array_limits = {}
+
+    def _limits(
+        self, names: Tuple[str, ...]
+    ) -> List[Optional[Tuple[float, float]]]:
+        """The (abs_tol, rel_tol) of each stat, or None if it is ignored."""
+
+        limits = self._limits_cache.get(id(names))
+        if limits is not None and limits[0] is names:
+            return limits[1]
+
+        result = [self._limit(name) for name in names]
+        self._limits_cache[id(names)] = (names, result)
+        return result
+
+    def _limit(self, name: str) -> Optional[Tuple[float, float]]:
+        if any(match(name) for match in self._ignore):
+            return None
+        for match, abs_t, rel_t in self._tolerances:
+            if match(name):
+                return abs_t, rel_t
+        return self.abs_tol, self.rel_tol
+
+    def _record(self, divergence: Divergence) -> None:
+        self.divergent += 1
+        if self.top_n <= 0:
+            return
+        if self.sort_by == "relative":
+            key = (divergence.rel_diff, divergence.abs_diff)
+        else:
+            key = (divergence.abs_diff, divergence.rel_diff)
+        # NaN keys would break the heap ordering.
+        key = tuple(math.inf if math.isnan(k) else k for k in key)
+        entry = (key, -next(self._order), divergence)
+        if len(self._top) < self.top_n:
+            heapq.heappush(self._top, entry)
+        elif entry > self._top[0]:
+            heapq.heapreplace(self._top, entry)
+
+    @staticmethod
+    def _differs(
+        left: float, right: float, abs_tol: float, rel_tol: float
+    ) -> bool:
+        if left == right:
+            return False
+        if math.isnan(left) or math.isnan(right):
+            return not (math.isnan(left) and math.isnan(right))
+        diff = abs(left - right)
+        return diff > max(abs_tol, rel_tol * max(abs(left), abs(right)))
+
+    def compare_dumps(self, left: CompactDump, right: CompactDump) -> None:
+        """Compares the next dump of each run."""
+
+        dump = self.dumps
+        self.dumps += 1
+        differs = self._differs
+
+        # Scalars are aligned by name through the left dump's index.
+        left_values = left.values
+        position = left.position
+        seen = bytearray(len(left.names))
+        right_limits = self._limits(right.names)
+        for name, value, limits in zip(
+            right.names, right.values, right_limits
+        ):
+            if limits is None:
+                continue
+            index = position(name)
+            if index is None:
+                self.missing += 1
+                self._record(Divergence(dump, name, None, value))
+                continue
+            seen[index] = 1
+            self.compared += 1
+            if differs(left_values[index], value, *limits):
+                self._record(Divergence(dump, name, left_values[index], value))
+
+        left_limits = self._limits(left.names)
+        for index, name in enumerate(left.names):
+            if not seen[index] and left_limits[index] is not None:
+                self.missing += 1
+                self._record(Divergence(dump, name, left_values[index], None))
+
+        # Sequences (e.g. distribution buckets) element by element.
+        for name in left.arrays.keys() | right.arrays.keys():
+            if name not in self._array_limits:
+                self._array_limits[name] = self._limit(name)
+            limits = self._array_limits[name]
+            if limits is None:
+                continue
+            left_array = left.arrays.get(name, ())
+            right_array = right.arrays.get(name, ())
+            for i in range(max(len(left_array), len(right_array))):
+                path = f"{name}[{i}]"
+                if i >= len(left_array) or i >= len(right_array):
+                    self.missing += 1
+                    self._record(
+                        Divergence(
+                            dump,
+                            path,
+                            left_array[i] if i < len(left_array) else None,
+                            right_array[i] if i < len(right_array) else None,
+                        )
+                    )
+                    continue
+                self.compared += 1
+                if differs(left_array[i], right_array[i], *limits):
+                    self._record(
+                        Divergence(dump, path, left_array[i], right_array[i])
+                    )
+
+    def compare_streams(
+        self,
+        left: Iterable[CompactDump],
+        right: Iterable[CompactDump],
+    ) -> None:
+        """Compares two runs' dumps pairwise, in order."""
+
+        for left_dump, right_dump in zip_longest(left, right):
+            if left_dump is None or right_dump is None:
+                self.missing_dumps += 1
+            else:
+                self.compare_dumps(left_dump, right_dump)
+
+    def compare_files(
+        self,
+        left_path: str,
+        right_path: str,
+        paths: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Compares two stats files.
+
+        :param paths: Optional glob-style patterns of the stats to compare.
+        """
+
+        if paths is not None:
+            paths = list(paths)
+        with open_stats(left_path) as left, open_stats(right_path) as right:
+            self.compare_streams(
+                load_stats_dumps(left, paths), load_stats_dumps(right, paths)
+            )
+
+    @property
+    def passed(self) -> bool:
+        return self.divergent == 0 and self.missing_dumps == 0
+
+    def top(self) -> List[Divergence]:
+        """The largest divergences, largest first."""
+        return [entry[2] for entry in sorted(self._top, reverse=True)]
+
+    def report(self, out: IO[str] = sys.stdout) -> None:
+        out.write(
+            f"Compared {self.compared} values in {self.dumps} dump(s): "
+            f"{self.divergent} divergent, of which {self.missing} are "
+            "missing from one run.\n"
+        )
+        if self.missing_dumps:
+            out.write(f"{self.missing_dumps} dump(s) missing from one run.\n")
+        top = self.top()
+        if not top:
+            return
+        width = max(len(d.path) for d in top)
+        out.write(
+            f"{'dump':>4}  {'stat':<{width}}  {'left':>14}  {'right':>14}  "
+            f"{'abs diff':>12}  {'rel diff':>10}\n"
+        )
+        for d in top:
+            out.write(
+                f"{d.dump:>4}  {d.path:<{width}}  {_format(d.left):>14}  "
+                f"{_format(d.right):>14}  {_format(d.abs_diff):>12}  "
+                f"{_format(d.rel_diff):>10}\n"
+            )
+
+
+def _format(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    return f"{value:.6g}"
+
+
+def _tolerance(text: str) -> Tuple[str, float, float]:
+    try:
+        pattern, abs_tol, rel_tol = text.rsplit(":", 2)
+        return pattern, float(abs_tol), float(rel_tol)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"'{text}' is not of the form PATTERN:ABS_TOL:REL_TOL"
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare the stats of two gem5 runs. Returns 0 if they "
+        "match within the given tolerances and 1 otherwise."
+    )
+    parser.add_argument("left", help="A text or JSON stats file")
+    parser.add_argument("right", help="A text or JSON stats file")
+    parser.add_argument(
+        "--abs-tol",
+        type=float,
+        default=0.0,
+        help="The default absolute tolerance (default: 0)",
+    )
+    parser.add_argument(
+        "--rel-tol",
+        type=float,
+        default=0.0,
+        help="The default relative tolerance (default: 0)",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=_tolerance,
+        action="append",
+        default=[],
+        metavar="PATTERN:ABS_TOL:REL_TOL",
+        help="The tolerances of the stats matching a glob-style pattern. "
+        "May be repeated; the first matching pattern is used.",
+    )
+    parser.add_argument(
+        "--ignore",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Do not compare the stats matching a glob-style pattern, as "
+        f"well as the host stats ({' '.join(HOST_STATS)}). May be repeated.",
+    )
+    parser.add_argument(
+        "--stats",
+        action="append",
+        default=None,
+        metavar="PATTERN",
+        help="Only load and compare the stats matching a glob-style "
+        "pattern. May be repeated.",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=20,
+        help="The number of largest divergences to report (default: 20)",
+    )
+    parser.add_argument(
+        "--sort-by",
+        choices=("relative", "absolute"),
+        default="relative",
+        help="How to rank divergences (default: relative)",
+    )
+    args = parser.parse_args(argv)
+
+    comparison = StatsComparison(
+        abs_tol=args.abs_tol,
+        rel_tol=args.rel_tol,
+        tolerances=args.tolerance,
+        ignore=HOST_STATS + tuple(args.ignore),
+        top=args.top,
+        sort_by=args.sort_by,
+    )
+    comparison.compare_files(args.left, args.right, args.stats)
+    comparison.report()
+    return 0 if comparison.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
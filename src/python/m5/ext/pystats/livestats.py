@@ -0,0 +1,286 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+The protocol of the live stats socket (``unix://`` stats outputs), and a
+client for it. The simulator listens on a Unix domain socket and, at each
+stats dump, sends every connected client a snapshot of the selected stats.
+
+Every message is a header followed by a payload:
+
+* header: the magic ``b"G5LS"``, a message type (uint8), three reserved
+  bytes and the payload length (uint32).
+* ``SCHEMA`` payload: the stat names, UTF-8 encoded and separated by
+  newlines. It is sent when a client connects and whenever the names
+  change; the values of later snapshots are in this order.
+* ``SNAPSHOT`` payload: the dump number, the simulated begin and end ticks
+  (uint64 each), then one float64 per stat.
+
+All integers and floats are little-endian. A client which does not keep up
+misses snapshots (visible as gaps in the dump numbers) rather than slowing
+down the simulation.
+
+.. code-block::
+
+    from m5.ext.pystats.livestats import LiveStatsClient
+
+    with LiveStatsClient("/tmp/gem5-stats.sock") as client:
+        for snapshot in client:
+            print(snapshot.dump, snapshot.values["simInsts"])
+"""
+
+import os
+import socket
+import stat
+import struct
+import sys
+from array import array
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
+
+MAGIC = b"G5LS"
+SCHEMA = 1
+SNAPSHOT = 2
+
+_HEADER = struct.Struct("<4sB3xI")
+_SNAPSHOT_HEADER = struct.Struct("<QQQ")
+# Report disconnected clients as errors rather than raising SIGPIPE.
+_SEND_FLAGS = getattr(socket, "MSG_NOSIGNAL", 0)
+
+
+def _doubles(data: bytes) -> array:
+    values = array("d")
+    values.frombytes(data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def encode_schema(names: Sequence[str]) -> bytes:
+    payload = "\n".join(names).encode()
+    return _HEADER.pack(MAGIC, SCHEMA, len(payload)) + payload
+
+
+def encode_snapshot(
+    dump: int, begin_time: int, end_time: int, values: array
+) -> bytes:
+    if sys.byteorder != "little":
+        values = array("d", values)
+        values.byteswap()
+    payload = _SNAPSHOT_HEADER.pack(dump, begin_time, end_time)
+    payload += values.tobytes()
+    return _HEADER.pack(MAGIC, SNAPSHOT, len(payload)) + payload
+
+
+class _Client:
+    __slots__ = ("socket", "pending", "dropped")
+
+    def __init__(self, sock: socket.socket):
+        self.socket = sock
+        self.pending = bytearray()
+        self.dropped = 0
+
+
+class LiveStatsServer:
+    """
+    Listens on a Unix domain socket and publishes snapshots to the connected
+    clients. It never blocks: new connections are accepted, and queued data
+    sent, when a snapshot is published. A client whose queue is longer than
+    ``max_buffer`` bytes misses snapshots until it catches up.
+    """
+
+    def __init__(self, path: str, max_buffer: int = 1 << 20):
+        self.path = path
+        self.max_buffer = max_buffer
+        self._names: Optional[Sequence[str]] = None
+        self._schema = b""
+        self._clients: List[_Client] = []
+
+        # Remove a socket left behind by a previous run.
+        try:
+            if stat.S_ISSOCK(os.stat(path).st_mode):
+                os.unlink(path)
+        except FileNotFoundError:
+            pass
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.setblocking(False)
+        self._socket.bind(path)
+        self._socket.listen()
+
+    @property
+    def clients(self) -> int:
+        return len(self._clients)
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                sock, _ = self._socket.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            sock.setblocking(False)
+            client = _Client(sock)
+            client.pending += self._schema
+            self._clients.append(client)
+
+    def _send(self, client: _Client) -> bool:
+        """Sends as much queued data as possible. Returns False if the
+        client has disconnected."""
+        while client.pending:
+            try:
+                sent = client.socket.send(client.pending, _SEND_FLAGS)
+            except (BlockingIOError, InterruptedError):
+                return True
+            except OSError:
+                return False
+            del client.pending[:sent]
+        return True
+
+    def publish(
+        self,
+        names: Sequence[str],
+        dump: int,
+        begin_time: int,
+        end_time: int,
+        values: array,
+    ) -> None:
+        """Queues a snapshot for every client and sends what it can."""
+
+        if names != self._names:
+            self._names = names
+            self._schema = encode_schema(names)
+            for client in self._clients:
+                client.pending += self._schema
+        self._accept()
+
+        message = encode_snapshot(dump, begin_time, end_time, values)
+        connected = []
+        for client in self._clients:
+            # Make room first, so the backlog is what the client has not
+            # read yet.
+            if not self._send(client):
+                client.socket.close()
+                continue
+            if len(client.pending) > self.max_buffer:
+                client.dropped += 1
+            else:
+                client.pending += message
+                self._send(client)
+            connected.append(client)
+        self._clients = connected
+
+    def close(self) -> None:
+        """Sends what can be sent without blocking and disconnects."""
+
+        for client in self._clients:
+            self._send(client)
+            client.socket.close()
+        self._clients = []
+        self._socket.close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class Snapshot:
+    """The values of the selected stats at one dump."""
+
+    def __init__(
+        self,
+        dump: int,
+        simulated_begin_time: int,
+        simulated_end_time: int,
+        values: Dict[str, float],
+    ):
+        self.dump = dump
+        self.simulated_begin_time = simulated_begin_time
+        self.simulated_end_time = simulated_end_time
+        self.values = values
+
+
+class LiveStatsClient:
+    """Connects to a live stats socket and yields its snapshots."""
+
+    def __init__(self, path: str, timeout: Optional[float] = None):
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        self._socket.connect(path)
+        self._names: List[str] = []
+
+    def _read(self, size: int) -> Optional[bytes]:
+        chunks = []
+        while size:
+            chunk = self._socket.recv(size)
+            if not chunk:
+                return None
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def receive(self) -> Optional[Snapshot]:
+        """Waits for the next snapshot. Returns None once the simulation
+        closes the connection."""
+
+        while True:
+            header = self._read(_HEADER.size)
+            if header is None:
+                return None
+            magic, kind, length = _HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError("Not a gem5 live stats stream")
+            payload = self._read(length)
+            if payload is None:
+                return None
+
+            if kind == SCHEMA:
+                self._names = payload.decode().split("\n") if payload else []
+            elif kind == SNAPSHOT:
+                dump, begin, end = _SNAPSHOT_HEADER.unpack_from(payload)
+                values = _doubles(payload[_SNAPSHOT_HEADER.size :])
+                return Snapshot(
+                    dump, begin, end, dict(zip(self._names, values))
+                )
+
+    def __iter__(self) -> Iterator[Snapshot]:
+        while True:
+            snapshot = self.receive()
+            if snapshot is None:
+                return
+            yield snapshot
+
+    def close(self) -> None:
+        self._socket.close()
+
+    def __enter__(self) -> "LiveStatsClient":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
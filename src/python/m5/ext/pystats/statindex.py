@@ -0,0 +1,177 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import fnmatch
+import re
+import weakref
+from bisect import bisect_left
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from .abstract_stat import AbstractStat
+
+
+@lru_cache(maxsize=256)
+def compile_glob(pattern: str) -> Pattern:
+    """
+    Compile a glob-style pattern (``*``, ``?`` and ``[...]``) into a regular
+    expression which matches whole stat paths.
+    """
+    return re.compile(fnmatch.translate(pattern))
+
+
+@lru_cache(maxsize=256)
+def compile_regex(pattern: str) -> Pattern:
+    return re.compile(pattern)
+
+
+class StatIndex:
+    """
+    A flattened index of the stats below an AbstractStat, keyed by their
+    dotted paths relative to it (e.g. ``board.processor.cores0.core.ipc``).
+    Entries are in the order in which ``AbstractStat.children`` visits them.
+
+    The index holds the tree's shape when it was built; values may change
+    but stats added or removed afterwards are only reflected by the index
+    ``AbstractStat.index()`` returns next.
+    """
+
+    def __init__(self, root: "AbstractStat"):
+        from .abstract_stat import AbstractStat
+
+        # (path, name, stat) in depth-first order.
+        self._entries: List[Tuple[str, str, "AbstractStat"]] = []
+        # Children are pushed in reverse so they are visited in order.
+        stack = [("", root)]
+        while stack:
+            prefix, node = stack.pop()
+            children = [
+                (name, value)
+                for name, value in node.__dict__.items()
+                if isinstance(value, AbstractStat)
+            ]
+            for name, value in reversed(children):
+                stack.append((f"{prefix}{name}.", value))
+            if prefix:
+                path = prefix[:-1]
+                name = path.rsplit(".", 1)[-1]
+                self._entries.append((path, name, node))
+
+        self._paths: Dict[str, "AbstractStat"] = {}
+        for path, _, stat in self._entries:
+            self._paths.setdefault(path, stat)
+        self._sorted_paths = sorted(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._paths
+
+    def __iter__(self) -> Iterator[Tuple[str, "AbstractStat"]]:
+        for path, _, stat in self._entries:
+            yield path, stat
+
+    def entries(self) -> Iterator[Tuple[str, str, "AbstractStat"]]:
+        """Yields the (path, name, stat) of every indexed stat."""
+        return iter(self._entries)
+
+    def get(
+        self, path: str, default: Optional["AbstractStat"] = None
+    ) -> Optional["AbstractStat"]:
+        """Returns the stat at exactly ``path``."""
+        return self._paths.get(path, default)
+
+    def glob(self, pattern: str) -> Iterator[Tuple[str, "AbstractStat"]]:
+        """
+        Yields the (path, stat) of each stat whose path matches a glob-style
+        pattern, e.g. ``"board.processor.cores*.core.ipc"``. As with
+        ``fnmatch``, ``*`` also matches across ``.`` separators.
+        """
+        return self.regex(compile_glob(pattern))
+
+    def regex(
+        self, pattern: Union[str, Pattern]
+    ) -> Iterator[Tuple[str, "AbstractStat"]]:
+        """
+        Yields the (path, stat) of each stat whose whole path matches a
+        regular expression.
+        """
+        if isinstance(pattern, str):
+            pattern = compile_regex(pattern)
+        fullmatch = pattern.fullmatch
+        for path, _, stat in self._entries:
+            if fullmatch(path):
+                yield path, stat
+
+    def prefix(self, prefix: str) -> Iterator[Tuple[str, "AbstractStat"]]:
+        """
+        Yields the (path, stat) of each stat whose path starts with
+        ``prefix``, in sorted path order.
+        """
+        paths = self._sorted_paths
+        for i in range(bisect_left(paths, prefix), len(paths)):
+            path = paths[i]
+            if not path.startswith(prefix):
+                break
+            yield path, self._paths[path]
+
+
+# Indexes are kept out of the stats' __dict__ so they are not serialized.
+_indexes = weakref.WeakKeyDictionary()
+# Bumped whenever a stat is added to or removed from any tree, which
+# invalidates every index.
+_tree_generation = 0
+
+
+def tree_changed() -> None:
+    global _tree_generation
+    _tree_generation += 1
+
+
+def get_index(stat: "AbstractStat") -> StatIndex:
+    """Returns the index of ``stat``, building it on first use and after
+    the tree changed."""
+    cached = _indexes.get(stat)
+    if cached is None or cached[0] != _tree_generation:
+        cached = (_tree_generation, StatIndex(stat))
+        _indexes[stat] = cached
+    return cached[1]
+
+
+def clear_index(stat: "AbstractStat") -> None:
+    """Discards the index of ``stat``."""
+    _indexes.pop(stat, None)
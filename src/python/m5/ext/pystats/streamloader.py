@@ -0,0 +1,466 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+A streaming loader for large stats JSON files. Unlike ``jsonloader``, which
+builds a Python object for every stat, it parses the file incrementally,
+only keeps the stats whose paths were requested and stores their values in
+flat arrays. Files holding several dumps (a JSON array of dumps, or dumps
+written one after another) are read one dump at a time.
+
+.. code-block::
+
+    from m5.ext.pystats.streamloader import load_dumps
+
+    with open("m5out/stats.json") as f:
+        for dump in load_dumps(f, paths=["board.processor.*.ipc"]):
+            print(dump.simulated_end_time, dump.find("*.ipc"))
+"""
+
+import re
+from array import array
+from json.decoder import (
+    JSONDecodeError,
+    JSONDecoder,
+    scanstring,
+)
+from typing import (
+    IO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .statindex import compile_glob
+
+# A number, or one of the non-standard constants written by Python's json.
+_SCALAR_RE = re.compile(
+    r"(-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?|-?Infinity|NaN"
+    r"|true|false|null)"
+)
+_TOKEN_RE = re.compile(r"[^,:{}\[\]\s]*")
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_STRING_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# Anything but brackets, with strings (which may contain brackets) whole.
+_SKIP_RE = re.compile(r'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+_CONTAINER_RE = re.compile(r'\{\s*"type"\s*:\s*"(?:Group|Vector)"')
+# Enough characters to identify a container with _CONTAINER_RE.
+_LOOKAHEAD = 64
+_DECODER = JSONDecoder()
+_CONSTANTS = {
+    "true": True,
+    "false": False,
+    "null": None,
+    "NaN": float("nan"),
+    "Infinity": float("inf"),
+    "-Infinity": float("-inf"),
+}
+
+# Stat types whose members are other stats rather than fields.
+_CONTAINER_TYPES = ("Group", "Vector")
+
+
+class CompactDump:
+    """
+    The stats of a single dump. Numbers (scalars, and the numeric fields of
+    other stats, e.g. ``<distribution>.min``) are stored in one array of
+    doubles; sequences (e.g. distribution buckets) in an array each.
+    """
+
+    def __init__(
+        self,
+        names: Tuple[str, ...],
+        values: array,
+        arrays: Dict[str, array],
+        creation_time: Optional[str] = None,
+        simulated_begin_time: Optional[float] = None,
+        simulated_end_time: Optional[float] = None,
+    ):
+        self.names = names
+        self.values = values
+        self.arrays = arrays
+        self.creation_time = creation_time
+        self.simulated_begin_time = simulated_begin_time
+        self.simulated_end_time = simulated_end_time
+        self._positions = None
+
+    def position(self, name: str) -> Optional[int]:
+        """The index of a number in ``names`` and ``values``, if present."""
+        if self._positions is None:
+            self._positions = {name: i for i, name in enumerate(self.names)}
+        return self._positions.get(name)
+
+    def __len__(self) -> int:
+        return len(self.names) + len(self.arrays)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.arrays or self.position(name) is not None
+
+    def __getitem__(self, name: str) -> Union[float, array]:
+        if name in self.arrays:
+            return self.arrays[name]
+        position = self.position(name)
+        if position is None:
+            raise KeyError(name)
+        return self.values[position]
+
+    def get(
+        self, name: str, default: Optional[float] = None
+    ) -> Optional[Union[float, array]]:
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def items(self) -> Iterator[Tuple[str, Union[float, array]]]:
+        yield from zip(self.names, self.values)
+        yield from self.arrays.items()
+
+    def find(self, pattern: str) -> Dict[str, Union[float, array]]:
+        """Returns the values whose names match a glob-style pattern."""
+        match = compile_glob(pattern).fullmatch
+        return {name: value for name, value in self.items() if match(name)}
+
+
+class _Projection:
+    """Decides which parts of the stat tree are parsed."""
+
+    def __init__(self, paths: Optional[Iterable[str]]):
+        if paths is None:
+            self.patterns = None
+            return
+        self.patterns = []
+        self.prefixes = []
+        for path in paths:
+            self.patterns.append(compile_glob(path).fullmatch)
+            self.prefixes.append(re.split(r"[*?\[]", path, 1)[0])
+
+    def selects(self, path: str) -> bool:
+        """Whether the stat(s) at ``path`` were requested."""
+        if self.patterns is None:
+            return True
+        return any(match(path) for match in self.patterns)
+
+    def may_contain(self, path: str) -> bool:
+        """Whether any requested stat may be at or below ``path``."""
+        if self.patterns is None:
+            return True
+        for prefix in self.prefixes:
+            if prefix.startswith(path) or path.startswith(prefix):
+                return True
+        return False
+
+
+class _Parser:
+    def __init__(self, fp: IO[str], projection: _Projection, chunk_size: int):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._projection = projection
+        self._names = ()
+
+    def _fill(self) -> bool:
+        """Reads another chunk, discarding the consumed input."""
+        if self._eof:
+            return False
+        data = self._fp.read(self._chunk_size)
+        if not data:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + data
+        self._pos = 0
+        return True
+
+    def _error(self, msg: str) -> JSONDecodeError:
+        return JSONDecodeError(msg, self._buf, self._pos)
+
+    def _peek(self) -> str:
+        """Skips whitespace and returns the next character ("" at EOF)."""
+        while True:
+            self._pos = _WHITESPACE_RE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise self._error(f"Expecting '{char}'")
+        self._pos += 1
+
+    def _string(self) -> str:
+        while True:
+            try:
+                value, self._pos = scanstring(self._buf, self._pos + 1)
+                return value
+            except ValueError:
+                if not self._fill():
+                    raise
+
+    def _scalar(self) -> Union[int, float, bool, None]:
+        # Find the whole token first, as a prefix of a number (e.g. "1" of
+        # "1.5") is also a valid number.
+        while True:
+            end = _TOKEN_RE.match(self._buf, self._pos).end()
+            if end < len(self._buf) or not self._fill():
+                break
+        token = self._buf[self._pos : end]
+        if not _SCALAR_RE.fullmatch(token):
+            raise self._error("Expecting value")
+        self._pos = end
+        if token in _CONSTANTS:
+            return _CONSTANTS[token]
+        if "." in token or "e" in token or "E" in token:
+            return float(token)
+        return int(token)
+
+    def _value(self) -> object:
+        """Parses a value in full."""
+        char = self._peek()
+        if char == '"':
+            return self._string()
+        if char == "[":
+            self._pos += 1
+            values = []
+            if self._peek() == "]":
+                self._pos += 1
+                return values
+            while True:
+                values.append(self._value())
+                char = self._peek()
+                self._pos += 1
+                if char == "]":
+                    return values
+                if char != ",":
+                    raise self._error("Expecting ',' delimiter")
+        if char == "{":
+            self._pos += 1
+            values = {}
+            while self._peek() != "}":
+                key = self._string()
+                self._expect(":")
+                values[key] = self._value()
+                if self._peek() == ",":
+                    self._pos += 1
+            self._pos += 1
+            return values
+        return self._scalar()
+
+    def _skip(self) -> None:
+        """Skips a value without building it."""
+        char = self._peek()
+        if char not in "{[":
+            if char == '"':
+                self._skip_string()
+            else:
+                self._scalar()
+            return
+
+        depth = 0
+        while True:
+            # Skip everything but brackets, including whole strings.
+            self._pos = _SKIP_RE.match(self._buf, self._pos).end()
+            if self._pos == len(self._buf) or self._buf[self._pos] == '"':
+                # Reached the end of the input, or a partial string.
+                if not self._fill():
+                    raise self._error("Unterminated value")
+                continue
+            char = self._buf[self._pos]
+            self._pos += 1
+            if char in "{[":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def _skip_string(self) -> None:
+        while True:
+            match = _STRING_RE.match(self._buf, self._pos)
+            if match:
+                self._pos = match.end()
+                return
+            if not self._fill():
+                raise self._error("Unterminated string")
+
+    def _is_container(self) -> bool:
+        """Whether the object at the current position is a Group or Vector."""
+        while len(self._buf) - self._pos < _LOOKAHEAD and self._fill():
+            pass
+        return _CONTAINER_RE.match(self._buf, self._pos) is not None
+
+    def _decode(self) -> object:
+        """Decodes a (small) value in full with the C JSON decoder."""
+        while True:
+            try:
+                value, self._pos = _DECODER.raw_decode(self._buf, self._pos)
+                return value
+            except JSONDecodeError:
+                if not self._fill():
+                    raise
+
+    def _object(
+        self,
+        path: str,
+        selected: bool,
+        names: List[str],
+        values: array,
+        arrays: Dict[str, array],
+    ) -> Dict:
+        """
+        Parses the object at ``path``, recording the stats selected below it
+        and returning its own (non-object) fields if it was selected.
+        """
+
+        projection = self._projection
+        fields = {}
+        self._expect("{")
+        while self._peek() != "}":
+            key = self._string()
+            self._expect(":")
+            char = self._peek()
+            if char == "{":
+                child = f"{path}.{key}" if path else key
+                child_selected = selected or projection.selects(child)
+                if self._is_container():
+                    if child_selected or projection.may_contain(child):
+                        self._object(
+                            child, child_selected, names, values, arrays
+                        )
+                    else:
+                        self._skip()
+                elif child_selected:
+                    self._add_stat(
+                        child, self._decode(), names, values, arrays
+                    )
+                else:
+                    self._skip()
+            elif not path or (selected and (char != '"' or key == "type")):
+                fields[key] = self._value()
+            else:
+                self._skip()
+            if self._peek() == ",":
+                self._pos += 1
+        self._pos += 1
+        return fields
+
+    @staticmethod
+    def _add_stat(
+        path: str,
+        fields: Dict,
+        names: List[str],
+        values: array,
+        arrays: Dict[str, array],
+    ) -> None:
+        stat_type = fields.get("type")
+        if stat_type is None or stat_type in _CONTAINER_TYPES:
+            return
+        for key, value in fields.items():
+            name = path if key == "value" else f"{path}.{key}"
+            if isinstance(value, list):
+                arrays[name] = array("d", value)
+            elif isinstance(value, (int, float)) and not isinstance(
+                value, bool
+            ):
+                names.append(name)
+                values.append(value)
+
+    def _dump(self) -> CompactDump:
+        names = []
+        values = array("d")
+        arrays = {}
+        fields = self._object("", False, names, values, arrays)
+
+        # Share the names between dumps with the same stats.
+        names = tuple(names)
+        if names == self._names:
+            names = self._names
+        self._names = names
+
+        return CompactDump(
+            names=names,
+            values=values,
+            arrays=arrays,
+            creation_time=fields.get("creation_time"),
+            simulated_begin_time=fields.get("simulated_begin_time"),
+            simulated_end_time=fields.get("simulated_end_time"),
+        )
+
+    def dumps(self) -> Iterator[CompactDump]:
+        while True:
+            char = self._peek()
+            if char == "":
+                return
+            if char == "{":
+                yield self._dump()
+            elif char == "[":
+                self._pos += 1
+                while self._peek() != "]":
+                    yield self._dump()
+                    if self._peek() == ",":
+                        self._pos += 1
+                self._pos += 1
+            else:
+                raise self._error("Expecting a stats dump")
+
+
+def load_dumps(
+    json_file: IO[str],
+    paths: Optional[Iterable[str]] = None,
+    chunk_size: int = 1 << 20,
+) -> Iterator[CompactDump]:
+    """
+    Yields the dumps in a stats JSON file one at a time.
+
+    :param json_file: The file, opened in text mode. It may contain a single
+                      dump, a JSON array of dumps or several dumps one after
+                      another.
+
+    :param paths: The dotted paths of the stats to load, which may contain
+                  glob-style wildcards. Selecting a group selects every stat
+                  below it. Everything else is skipped without being
+                  decoded. By default all stats are loaded.
+
+    :param chunk_size: The number of characters read from the file at once.
+    """
+
+    return _Parser(json_file, _Projection(paths), chunk_size).dumps()
+
+
+def load_compact(
+    json_file: IO[str], paths: Optional[Iterable[str]] = None
+) -> CompactDump:
+    """Loads the first dump in a stats JSON file. See ``load_dumps``."""
+
+    for dump in load_dumps(json_file, paths):
+        return dump
+    raise ValueError("The file contains no stats dumps")
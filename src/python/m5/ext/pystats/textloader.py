@@ -0,0 +1,132 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+A streaming loader for gem5's text stats output (``stats.txt``), yielding
+each dump as a ``CompactDump``. Stat names are kept as they appear in the
+file, e.g. ``board.processor.cores.core.ipc`` or
+``system.mem_ctrl.readPktSize::64``. Only the first value on each line is
+kept; the percentages printed for vector and distribution entries are not.
+
+.. code-block::
+
+    from m5.ext.pystats.textloader import load_text_dumps
+
+    with open("m5out/stats.txt") as f:
+        for dump in load_text_dumps(f, paths=["*.ipc"]):
+            print(dump.simulated_end_time, dump.find("*.ipc"))
+"""
+
+from array import array
+from typing import (
+    IO,
+    Iterable,
+    Iterator,
+    Optional,
+)
+
+from .statindex import compile_glob
+from .streamloader import CompactDump
+
+BEGIN_MARKER = "---------- Begin Simulation Statistics"
+END_MARKER = "---------- End Simulation Statistics"
+# Always loaded, for the dump's simulated begin and end times.
+TIME_STATS = ("finalTick", "simTicks")
+
+
+def load_text_dumps(
+    text_file: IO[str], paths: Optional[Iterable[str]] = None
+) -> Iterator[CompactDump]:
+    """
+    Yields the dumps in a text stats file one at a time.
+
+    :param text_file: The file, opened in text mode.
+
+    :param paths: Glob-style patterns of the stat names to load. By
+                  default all stats are loaded.
+    """
+
+    matchers = None
+    if paths is not None:
+        matchers = [compile_glob(path).fullmatch for path in paths]
+
+    shared_names = ()
+    names = None
+    values = None
+    for line in text_file:
+        if line.startswith("----------"):
+            if line.startswith(BEGIN_MARKER):
+                names = []
+                values = array("d")
+            elif line.startswith(END_MARKER) and names is not None:
+                # Share the names between dumps with the same stats.
+                names = tuple(names)
+                if names == shared_names:
+                    names = shared_names
+                shared_names = names
+                yield _make_dump(names, values)
+                names = None
+            continue
+
+        if names is None:
+            continue
+        fields = line.split(None, 2)
+        if len(fields) < 2:
+            continue
+        name = fields[0]
+        if (
+            matchers is not None
+            and name not in TIME_STATS
+            and not any(match(name) for match in matchers)
+        ):
+            continue
+        try:
+            value = float(fields[1])
+        except ValueError:
+            continue
+        names.append(name)
+        values.append(value)
+
+
+def _make_dump(names, values) -> CompactDump:
+    dump = CompactDump(names=names, values=values, arrays={})
+    final_tick = dump.get("finalTick")
+    sim_ticks = dump.get("simTicks")
+    if final_tick is not None:
+        dump.simulated_end_time = int(final_tick)
+        if sim_ticks is not None:
+            dump.simulated_begin_time = int(final_tick - sim_ticks)
+    return dump
+
+
+def load_text(
+    text_file: IO[str], paths: Optional[Iterable[str]] = None
+) -> CompactDump:
+    """Loads the first dump in a text stats file. See ``load_text_dumps``."""
+
+    for dump in load_text_dumps(text_file, paths):
+        return dump
+    raise ValueError("The file contains no stats dumps")
@@ -322,6 +322,45 @@ def parse_options():
         help="Remote gdb base port (set to 0 to disable listening)",
     )
 
+    option(
+        "--startup-profile",
+        metavar="FILE",
+        default=None,
+        help="Record the time spent in each phase of start-up, up to the "
+        "first simulated tick, as JSON in FILE and as Chrome trace events "
+        "in FILE with a .trace.json suffix",
+    )
+    option(
+        "--checkpoint-store",
+        metavar="DIR",
+        default=None,
+        help="Keep the memory images of the checkpoints taken in the "
+        "deduplicated chunk store in DIR and read the images of restored "
+        "checkpoints from it (see m5.util.checkpoint_store)",
+    )
+    option(
+        "--fork-server",
+        metavar="JOBS",
+        default=None,
+        help="Run the config script once up to a fork point and fork a "
+        "child per job read from JOBS, a file of JSON lines or unix:PATH "
+        "for a Unix socket (see m5.util.fork_server)",
+    )
+    option(
+        "--fork-server-point",
+        metavar="{before-instantiate,after-instantiate}",
+        choices=["before-instantiate", "after-instantiate"],
+        default="after-instantiate",
+        help="Where the fork server forks jobs [Default: %default]",
+    )
+    option(
+        "--fork-server-workers",
+        type="int",
+        default=1,
+        help="Number of jobs run at once by the fork server "
+        "[Default: %default]",
+    )
+
     # Help options
     group("Help Options")
     option(
@@ -409,6 +448,13 @@ def main():
     if not os.path.isdir(options.outdir):
         os.makedirs(options.outdir)
 
+    if options.startup_profile:
+        from .util import startup_profile
+
+        startup_profile.enable(
+            os.path.join(options.outdir, options.startup_profile)
+        )
+
     # These filenames are used only if the redirect_std* options are set
     stdout_file = os.path.join(options.outdir, options.stdout_file)
     stderr_file = os.path.join(options.outdir, options.stderr_file)
@@ -468,14 +514,17 @@ def main():
         debug.help()
 
     if options.list_sim_objects:
-        from . import SimObject
+        from . import (
+            SimObject,
+            objects,
+        )
 
         done = True
+        objects.load_all()
         print("SimObjects:")
-        objects = list(SimObject.allClasses.keys())
-        objects.sort()
+        names = sorted(SimObject.allClasses.keys())
         terminal_formatter = TerminalFormatter()
-        for name in objects:
+        for name in names:
             obj = SimObject.allClasses[name]
             print(terminal_formatter.format_output(str(obj), indent=4))
             params = list(obj._params.keys())
@@ -575,6 +624,22 @@ def main():
     if not options.allow_remote_connections:
         m5.listenersLoopbackOnly()
 
+    if options.checkpoint_store:
+        from .util import checkpoint_store
+
+        checkpoint_store.enable(options.checkpoint_store)
+
+    if options.fork_server:
+        from .util import fork_server
+
+        # Forking a simulator requires the listeners to be disabled.
+        m5.disableAllListeners()
+        fork_server.enable(
+            options.fork_server,
+            options.fork_server_point,
+            options.fork_server_workers,
+        )
+
     for when in options.debug_break:
         debug.schedBreak(int(when))
 
@@ -622,6 +687,11 @@ def main():
 
     sys.argv = arguments
 
+    # Ended by m5.instantiate(), so this covers building the configuration.
+    from .util import startup_profile
+
+    startup_profile.begin("config script")
+
     if options.m:
         sys.argv = [options.m[0]] + options.m[1]
         runpy.run_module(options.m[0], run_name="__m5_main__")
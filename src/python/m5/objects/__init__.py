@@ -24,6 +24,101 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-for module in __spec__.loader_state:
-    if module.startswith("m5.objects."):
-        exec(f"from {module} import *")
+# SimObject modules are imported on demand.  The first time a name is
+# looked up in this package, the module which defines it (according to the
+# build-time index in m5.object_index) is imported and the name is cached in
+# this module's namespace.  `from m5.objects import *` still works: looking
+# up __all__ imports every embedded SimObject module, exactly as if they had
+# all been star-imported at startup.  Setting M5_EAGER_OBJECTS=true in the
+# environment restores the old behaviour of importing everything up front.
+
+import importlib as _importlib
+import os as _os
+import sys as _sys
+import types as _types
+
+from m5.object_index import index as _index
+
+_modules = [
+    module
+    for module in __spec__.loader_state
+    if module.startswith("m5.objects.")
+]
+_embedded = set(_modules)
+_all_loaded = False
+
+
+class _ObjectsModule(_types.ModuleType):
+    def __setattr__(self, name, value):
+        # The import system binds each newly imported submodule as an
+        # attribute of this package.  Bind the SimObject it defines instead,
+        # which is what the star-import used to leave behind.
+        if (
+            isinstance(value, _types.ModuleType)
+            and value.__name__ == f"{self.__name__}.{name}"
+        ):
+            value = getattr(value, name, value)
+        super().__setattr__(name, value)
+
+
+_sys.modules[__name__].__class__ = _ObjectsModule
+
+
+def load_all():
+    """Import every embedded SimObject module into this namespace."""
+    global _all_loaded
+    if _all_loaded:
+        return
+    _all_loaded = True
+    for module in _modules:
+        exec(f"from {module} import *", globals())
+
+
+def _exported():
+    return [
+        name
+        for name in globals()
+        if not name.startswith("_") and name != "load_all"
+    ]
+
+
+def __getattr__(name):
+    if name == "__all__":
+        load_all()
+        return _exported()
+    if name.startswith("__"):
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    module = _index.get(name)
+    if module in _embedded:
+        value = getattr(_importlib.import_module(module), name)
+    else:
+        # Names which aren't SimObjects or enums (e.g. Param, Parent,
+        # AddrRange) are re-exported by the SimObject modules from these.
+        for source in ("m5.params", "m5.proxy", "m5.SimObject"):
+            source = _importlib.import_module(source)
+            if name in source.__all__:
+                value = getattr(source, name)
+                break
+        else:
+            load_all()
+            if name not in globals():
+                raise AttributeError(
+                    f"module '{__name__}' has no attribute '{name}'"
+                )
+            return globals()[name]
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    names = set(_exported())
+    names.update(
+        name for name, module in _index.items() if module in _embedded
+    )
+    return sorted(names)
+
+
+if _os.environ.get("M5_EAGER_OBJECTS", "false").lower() in ("true", "yes"):
+    load_all()
@@ -187,7 +187,13 @@ class ParamDesc:
         if attr == "ptype":
             from . import SimObject
 
-            ptype = SimObject.allClasses[self.ptype_str]
+            ptype = SimObject.allClasses.get(self.ptype_str)
+            if ptype is None:
+                # m5.objects imports SimObject modules on demand, so the
+                # class may not have been defined yet.
+                import m5.objects
+
+                ptype = getattr(m5.objects, self.ptype_str)
             assert isSimObjectClass(ptype)
             self.ptype = ptype
             return ptype
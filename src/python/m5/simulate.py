@@ -63,7 +63,10 @@ from . import (
 from .citations import gather_citations
 from .util import (
     attrdict,
+    checkpoint_store,
     fatal,
+    fork_server,
+    startup_profile,
     warn,
 )
 
@@ -91,66 +94,94 @@ def instantiate(ckpt_dir=None):
     if not root:
         fatal("Need to instantiate Root() before calling instantiate()")
 
+    startup_profile.end("config script")
+
+    # In fork-server mode, this only returns in the child of a job.
+    fork_server.fork_point("before-instantiate")
+
     # we need to fix the global frequency
     ticks.fixGlobalFrequency()
 
     # Make sure SimObject-valued params are in the configuration
     # hierarchy so we catch them with future descendants() walks
-    for obj in root.descendants():
-        obj.adoptOrphanParams()
+    startup_profile.for_each(
+        "adoptOrphanParams",
+        root.descendants(),
+        lambda obj: obj.adoptOrphanParams(),
+    )
+
+    # The hierarchy is now complete, so walk it once and reuse that order
+    # for every remaining pass.
+    descendants = root.frozen_descendants()
 
     # Unproxy in sorted order for determinism
-    for obj in root.descendants():
-        obj.unproxyParams()
+    startup_profile.for_each(
+        "unproxyParams", descendants, lambda obj: obj.unproxyParams()
+    )
+    # Unproxying may, rarely, add objects to the hierarchy.
+    descendants = root.frozen_descendants()
 
     if options.dump_config:
-        ini_file = open(os.path.join(options.outdir, options.dump_config), "w")
-        # Print ini sections in sorted order for easier diffing
-        for obj in sorted(root.descendants(), key=lambda o: o.path()):
-            obj.print_ini(ini_file)
-        ini_file.close()
+        with startup_profile.phase("dump_config"):
+            ini_file = open(
+                os.path.join(options.outdir, options.dump_config), "w"
+            )
+            # Print ini sections in sorted order for easier diffing
+            for obj in sorted(descendants, key=lambda o: o.path()):
+                obj.print_ini(ini_file)
+            ini_file.close()
 
     if options.json_config:
         try:
             import json
 
-            json_file = open(
-                os.path.join(options.outdir, options.json_config), "w"
-            )
-            d = root.get_config_as_dict()
-            json.dump(d, json_file, indent=4)
-            json_file.close()
+            with startup_profile.phase("json_config"):
+                json_file = open(
+                    os.path.join(options.outdir, options.json_config), "w"
+                )
+                d = root.get_config_as_dict()
+                json.dump(d, json_file, indent=4)
+                json_file.close()
         except ImportError:
             pass
 
     if options.dot_config:
-        do_dot(root, options.outdir, options.dot_config)
-        do_ruby_dot(root, options.outdir, options.dot_config)
+        with startup_profile.phase("dot_config"):
+            do_dot(root, options.outdir, options.dot_config)
+            do_ruby_dot(root, options.outdir, options.dot_config)
 
     # Initialize the global statistics
     stats.initSimStats()
 
     # Create the C++ sim objects and connect ports
-    for obj in root.descendants():
-        obj.createCCObject()
-    for obj in root.descendants():
-        obj.connectPorts()
+    startup_profile.for_each(
+        "createCCObject", descendants, lambda obj: obj.createCCObject()
+    )
+    startup_profile.for_each(
+        "connectPorts", descendants, lambda obj: obj.connectPorts()
+    )
 
     # Do a second pass to finish initializing the sim objects
-    for obj in root.descendants():
-        obj.init()
+    startup_profile.for_each("init", descendants, lambda obj: obj.init())
 
     # Do a third pass to initialize statistics
-    stats._bindStatHierarchy(root)
-    root.regStats()
+    with startup_profile.phase("regStats"):
+        stats._bindStatHierarchy(root)
+        root.regStats()
 
     # Do a fourth pass to initialize probe points
-    for obj in root.descendants():
-        obj.regProbePoints()
+    startup_profile.for_each(
+        "regProbePoints",
+        descendants,
+        lambda obj: obj.regProbePoints(),
+    )
 
     # Do a fifth pass to connect probe listeners
-    for obj in root.descendants():
-        obj.regProbeListeners()
+    startup_profile.for_each(
+        "regProbeListeners",
+        descendants,
+        lambda obj: obj.regProbeListeners(),
+    )
 
     # We want to generate the DVFS diagram for the system. This can only be
     # done once all of the CPP objects have been created and initialised so
@@ -159,24 +190,34 @@ def instantiate(ckpt_dir=None):
         do_dvfs_dot(root, options.outdir, options.dot_dvfs_config)
 
     # We're done registering statistics.  Enable the stats package now.
-    stats.enable()
+    with startup_profile.phase("stats.enable"):
+        stats.enable()
 
     # Restore checkpoint (if any)
     if ckpt_dir:
         _drain_manager.preCheckpointRestore()
-        ckpt = _m5.core.getCheckpoint(ckpt_dir)
-        for obj in root.descendants():
-            obj.loadState(ckpt)
+        # The memory images are read by loadState(), so a checkpoint in a
+        # chunk store is only needed in restorable form until then.
+        with checkpoint_store.restore_dir(ckpt_dir) as restore_dir:
+            with startup_profile.phase("getCheckpoint"):
+                ckpt = _m5.core.getCheckpoint(restore_dir)
+            startup_profile.for_each(
+                "loadState", descendants, lambda obj: obj.loadState(ckpt)
+            )
     else:
-        for obj in root.descendants():
-            obj.initState()
+        startup_profile.for_each(
+            "initState", descendants, lambda obj: obj.initState()
+        )
 
     # Check to see if any of the stat events are in the past after resuming from
     # a checkpoint, If so, this call will shift them to be at a valid time.
     updateStatEvents()
+    stats._startGroupDumps()
 
     gather_citations(root)
 
+    fork_server.fork_point("after-instantiate")
+
 
 need_startup = True
 
@@ -190,10 +231,14 @@ def simulate(*args, **kwargs):
 
     if need_startup:
         root = objects.Root.getInstance()
-        for obj in root.descendants():
-            obj.startup()
+        startup_profile.for_each(
+            "startup", root.frozen_descendants(), lambda obj: obj.startup()
+        )
         need_startup = False
 
+        # This is the last step before the first simulated tick.
+        startup_profile.write()
+
         # Python exit handlers happen in reverse order.
         # We want to dump stats last.
         atexit.register(stats.dump)
@@ -275,6 +320,37 @@ def scheduleTickExitAbsolute(
     _m5.event.exitSimLoop(exit_string, 0, tick, 0, False)
 
 
+def registerExitCause(cause: str, cause_id: int) -> None:
+    """Report exits with the given cause string with an integer ID,
+    returned by ``getCauseId()`` of the exit event. Exits with causes which
+    haven't been registered have the ID -1.
+
+    :param cause: The exit cause string.
+    :param cause_id: A non-negative ID.
+    """
+    _m5.event.registerExitCause(cause, cause_id)
+
+
+def setCoalescedExits(cause_ids: list, max_batch: int = 1024) -> None:
+    """Coalesce exits with the given cause IDs. Simulation continues past
+    such exits without returning from ``simulate()``, until an exit with
+    another cause is met or ``max_batch`` exits have been seen. The exits
+    skipped this way are returned by ``takeCoalescedExits()``.
+
+    :param cause_ids: The cause IDs (see ``registerExitCause()``) to
+                      coalesce, empty to disable coalescing.
+    :param max_batch: The maximum number of exits handled by one return
+                      from ``simulate()``, including the exit it returns.
+    """
+    _m5.event.setCoalescedExits(cause_ids=list(cause_ids), max_batch=max_batch)
+
+
+def takeCoalescedExits() -> list:
+    """Returns the ``(cause ID, tick)`` of each exit coalesced by the last
+    call to ``simulate()``, in order, and forgets them."""
+    return _m5.event.takeCoalescedExits()
+
+
 def drain():
     """Drain the simulator in preparation of a checkpoint or memory mode
     switch.
@@ -334,6 +410,7 @@ def checkpoint(dir):
 
     print("Writing checkpoint")
     _m5.core.serializeAll(dir)
+    checkpoint_store.on_checkpoint(dir)
 
 
 def _changeMemoryMode(system, mode):
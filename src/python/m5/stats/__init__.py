@@ -37,7 +37,10 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import atexit
+
 import m5
+import m5.event
 from m5.objects import Root
 from m5.params import isNullPointer
 from m5.util import (
@@ -51,7 +54,12 @@ import _m5.stats
 from _m5.stats import periodicStatDump
 from _m5.stats import schedStatEvent as schedEvent
 
-from .gem5stats import JsonOutputVistor
+from .gem5stats import (
+    ColumnarOutputVisitor,
+    JsonLinesOutputVisitor,
+    JsonOutputVistor,
+    LiveStatsOutputVisitor,
+)
 
 outputList = []
 
@@ -154,7 +162,19 @@ def _textFactory(fn, desc=True, spaces=True):
 
 
 @_url_factory(["h5"], enable=hasattr(_m5.stats, "initHDF5"))
-def _hdf5Factory(fn, chunking=10, desc=True, formulas=True):
+def _hdf5Factory(
+    fn,
+    chunking=10,
+    desc=True,
+    formulas=True,
+    compression="gzip",
+    level=1,
+    shuffle=False,
+    dumps=0,
+    include=(),
+    exclude=(),
+    append=False,
+):
     """Output stats in HDF5 format.
 
     The HDF5 file format is a structured binary file format. It has
@@ -171,6 +191,20 @@ def _hdf5Factory(fn, chunking=10, desc=True, formulas=True):
       * Large startup cost (single stat dump larger than text equivalent)
       * Stat dumps are slower than text
 
+    Both drawbacks can be reduced by only writing the stats of interest
+    (include/exclude) and by sizing the chunks to the number of dumps
+    (chunking=0, optionally with dumps set to the expected number of
+    dumps). Chunks are then sized to hold about 64 KiB each.
+
+    Stat paths are matched against shell-style glob patterns, where '*'
+    also matches dots, e.g. 'system.cpu*.ipc'. A stat is written if it
+    matches any include pattern (or there are none) and no exclude
+    pattern.
+
+    When appending, the file is resumed rather than truncated: the
+    dumps it holds which were taken before the first dump of this run
+    are kept and later ones are replaced. This is meant for runs
+    restored from a checkpoint taken by the run that wrote the file.
 
     Known limitations:
       * Distributions and histograms currently unsupported.
@@ -178,16 +212,47 @@ def _hdf5Factory(fn, chunking=10, desc=True, formulas=True):
 
 
     Parameters:
-      * chunking (unsigned): Number of time steps to pre-allocate (default: 10)
+      * chunking (unsigned): Number of time steps to pre-allocate, 0 to
+        size the chunks automatically (default: 10)
       * desc (bool): Output stat descriptions (default: True)
       * formulas (bool): Output derived stats (default: True)
+      * compression (str): 'none', 'gzip' or 'lzf' (requires the HDF5
+        LZF filter plugin) (default: 'gzip')
+      * level (unsigned): gzip compression level (default: 1)
+      * shuffle (bool): Shuffle the bytes of the values before
+        compressing them, which usually makes them compress better
+        (default: False)
+      * dumps (unsigned): Expected number of dumps, used when sizing
+        chunks automatically, 0 if unknown (default: 0)
+      * include (str or list): Stat path patterns to write (default: all)
+      * exclude (str or list): Stat path patterns not to write
+      * append (bool): Resume an existing file (default: False)
 
     Example:
       h5://stats.h5?desc=False;chunking=100;formulas=False
+      h5://stats.h5?chunking=0;compression='lzf';include=['system.cpu*']
+      h5://stats.h5?level=4;shuffle=True
 
     """
 
-    return _m5.stats.initHDF5(fn, chunking, desc, formulas)
+    if isinstance(include, str):
+        include = [include]
+    if isinstance(exclude, str):
+        exclude = [exclude]
+
+    return _m5.stats.initHDF5(
+        fn,
+        chunking,
+        desc,
+        formulas,
+        compression,
+        level,
+        shuffle,
+        dumps,
+        list(include),
+        list(exclude),
+        append,
+    )
 
 
 @_url_factory(["json"])
@@ -202,6 +267,95 @@ def _jsonFactory(fn):
     return JsonOutputVistor(fn)
 
 
+@_url_factory(["jsonl"])
+def _jsonLinesFactory(
+    fn, compression=None, keyframe=0, append=False, mode="absolute"
+):
+    """Output stats as JSON lines, appending one record per dump.
+
+    Each dump appends a single compact JSON record to the file. Only
+    stats which changed since the previous dump are written, apart from
+    the first record (and every keyframe-th record, if set) which holds
+    every stat. This keeps periodic dumps cheap and preserves every dump.
+
+    In the delta mode, each record holds the change in every stat since
+    the previous dump, and its rate per simulated second, rather than
+    its value. The stats are not reset, so the values at the end of the
+    run are still available (e.g. in stats.txt, or with mode='both').
+
+    Parameters:
+      * compression (str): None, 'gzip' or 'zstd' (requires the
+        zstandard module) (default: None)
+      * keyframe (int): Write all stats every keyframe dumps, 0 to only
+        do so for the first dump (default: 0)
+      * append (bool): Append to an existing file (default: False)
+      * mode (str): 'absolute', 'delta' or 'both' (default: 'absolute')
+
+    Example:
+      jsonl://stats.jsonl.gz?compression='gzip';keyframe=100
+      jsonl://intervals.jsonl?mode='delta'
+
+    """
+
+    return JsonLinesOutputVisitor(
+        fn,
+        compression=compression,
+        keyframe=keyframe,
+        append=append,
+        mode=mode,
+    )
+
+
+@_url_factory(["columnar"])
+def _columnarFactory(fn, block_rows=16, append=False):
+    """Output stats to a columnar archive, appending one row per dump.
+
+    The archive is a directory holding each stat as a column of
+    float64 values, so individual time series can be memory-mapped
+    and read without parsing the rest. It can be read with
+    m5.ext.pystats.columnar.ColumnarArchive (requires NumPy).
+
+    Parameters:
+      * block_rows (int): Number of dumps buffered before being
+        written to the archive (default: 16)
+      * append (bool): Append to an existing archive (default: False)
+
+    Example:
+      columnar://stats.col?block_rows=64
+
+    """
+
+    output = ColumnarOutputVisitor(fn, block_rows=block_rows, append=append)
+    atexit.register(output.close)
+    return output
+
+
+@_url_factory(["unix"])
+def _liveStatsFactory(fn, stats=None, max_buffer=1 << 20):
+    """Stream stats to monitoring clients over a Unix domain socket.
+
+    Listens on the socket at the given path and, at each dump, sends a
+    compact binary snapshot of the selected stats to every connected
+    client. Clients which fall behind miss snapshots rather than
+    stalling the simulation. See m5.ext.pystats.livestats for the
+    protocol and a Python client.
+
+    Parameters:
+      * stats (list): Glob-style patterns of the stats to send
+        (default: all stats)
+      * max_buffer (int): Bytes queued per client before it misses
+        snapshots (default: 1 MiB)
+
+    Example:
+      unix:///tmp/gem5-stats.sock?stats=['simInsts','*.ipc']
+
+    """
+
+    output = LiveStatsOutputVisitor(fn, stats=stats, max_buffer=max_buffer)
+    atexit.register(output.close)
+    return output
+
+
 def addStatVisitor(url):
     """Add a stat visitor specified using a URL string
 
@@ -215,6 +369,12 @@ def addStatVisitor(url):
 
     """
 
+    outputList.append(_createStatVisitor(url))
+
+
+def _createStatVisitor(url):
+    """Create a stat visitor from a URL string (see addStatVisitor)"""
+
     try:
         from urllib.parse import urlsplit
     except ImportError:
@@ -231,7 +391,7 @@ def addStatVisitor(url):
     if factory is None:
         fatal(f"Stat type '{parsed.scheme}' disabled at compile time")
 
-    outputList.append(factory(parsed))
+    return factory(parsed)
 
 
 def printStatVisitorTypes():
@@ -417,19 +577,128 @@ def dump(roots=None):
             sim_root.preDumpStats()
         prepare()
 
-    for output in outputList:
+    _dump_to_outputs(outputList, all_roots)
+
+
+def _dump_to_outputs(outputs, roots):
+    for output in outputs:
         if isinstance(output, JsonOutputVistor):
-            if not all_roots:
+            if not roots:
                 output.dump(Root.getInstance())
             else:
-                output.dump(all_roots)
+                output.dump(roots)
         else:
             if output.valid():
                 output.begin()
-                _dump_to_visitor(output, roots=all_roots)
+                _dump_to_visitor(output, roots=roots)
                 output.end()
 
 
+def _prepare_groups(roots):
+    """Prepare the stats of the given subtrees only."""
+
+    for root in roots:
+        root.preDumpStats()
+        for stat in root.getStats():
+            stat.prepare()
+        _visit_stats(lambda g, s: s.prepare(), root=root)
+
+
+class GroupDumpSchedule(m5.event.Event):
+    """Periodically dumps the stats of a subset of the stat tree.
+
+    Only the stats below the schedule's roots are prepared and visited,
+    so small, frequently dumped subtrees do not pay for dumping the whole
+    hierarchy. Create schedules with addGroupDumpSchedule().
+    """
+
+    def __init__(self, roots, period, outputs, start):
+        super().__init__(priority=m5.event.Event.Stat_Event_Pri)
+        self.roots = roots
+        self.period = int(period)
+        self.outputs = outputs
+        self.start = int(start)
+
+    def __call__(self):
+        _m5.stats.processDumpQueue()
+        _prepare_groups(self.roots)
+        _dump_to_outputs(self.outputs, self.roots)
+        m5.event.mainq.schedule(self, m5.curTick() + self.period)
+
+    def _schedule(self):
+        # The start may be in the past after restoring a checkpoint.
+        when = self.start
+        if when < m5.curTick():
+            missed = (m5.curTick() - when + self.period - 1) // self.period
+            when += missed * self.period
+        m5.event.mainq.schedule(self, when)
+
+    def cancel(self):
+        """Stop dumping the schedule's stats."""
+
+        if self in group_dump_schedules:
+            group_dump_schedules.remove(self)
+        if self.scheduled():
+            m5.event.mainq.deschedule(self)
+
+
+# List[GroupDumpSchedule].
+group_dump_schedules = []
+_group_dumps_started = False
+
+
+def addGroupDumpSchedule(roots, period, url, start=None):
+    """Dump the stats of some SimObjects periodically
+
+    Schedules a periodic dump of the stats below the given SimObjects,
+    independently of any other stats dumps. Each schedule can have its
+    own period and output, e.g. to dump network stats far more often
+    than core stats without dumping the whole hierarchy at the faster
+    rate.
+
+    Parameters:
+      * roots: A SimObject, or list of SimObjects, whose stats are dumped
+      * period (int): The number of ticks between dumps
+      * url (str): A stat visitor URL (see addStatVisitor) to dump to.
+        Each schedule needs an output of its own: the outputs added
+        with addStatVisitor expect all the stats at every dump.
+      * start (int): The tick of the first dump (default: one period
+        after the start of the simulation, or after now if the
+        simulation has already started)
+
+    Returns the GroupDumpSchedule, whose cancel() method stops it.
+
+    """
+
+    if period <= 0:
+        fatal(f"Stats group dump period must be positive, not {period}")
+
+    if not url:
+        fatal("Stats group dumps need an output URL of their own")
+
+    if isinstance(roots, m5.SimObject.SimObject):
+        roots = [roots]
+    outputs = [_createStatVisitor(url)]
+    if start is None:
+        start = m5.curTick() + period if _group_dumps_started else period
+
+    schedule = GroupDumpSchedule(list(roots), period, outputs, start)
+    group_dump_schedules.append(schedule)
+    if _group_dumps_started:
+        schedule._schedule()
+    return schedule
+
+
+def _startGroupDumps():
+    """Schedule the group dumps once the simulation has been instantiated
+    (and any checkpoint restored)"""
+
+    global _group_dumps_started
+    _group_dumps_started = True
+    for schedule in group_dump_schedules:
+        schedule._schedule()
+
+
 def reset():
     """Reset all statistics to the base state"""
 
@@ -29,18 +29,31 @@ This serves as the bridge between the gem5 statistics exposed via PyBind11 and
 the Python Stats model.
 """
 
+import gzip
+import json
+from array import array
 from datetime import datetime
 from typing import (
     IO,
+    Any,
+    Dict,
     List,
+    Optional,
+    Tuple,
     Union,
 )
 
+from m5.ext.pystats.columnar import ColumnarWriter
 from m5.ext.pystats.group import *
+from m5.ext.pystats.livestats import LiveStatsServer
 from m5.ext.pystats.simstat import *
+from m5.ext.pystats.statindex import compile_glob
 from m5.ext.pystats.statistic import *
 from m5.ext.pystats.storagetype import *
-from m5.objects import *
+from m5.objects import (
+    Root,
+    SimObject,
+)
 
 import _m5.stats
 
@@ -83,6 +96,486 @@ class JsonOutputVistor:
             simstat.dump(fp=fp, **self.json_args)
 
 
+class StatDeltas:
+    """
+    Computes the change in the stats' values since the previous dump, and
+    their rate of change, without resetting the stats. The previous values
+    are kept in a single flat array of doubles.
+
+    Deltas are computed for scalars, vector elements and the buckets and
+    accumulated fields of distributions; a distribution's min, max and
+    bucket size are not. A stats reset is detected from the start of the
+    stats' simulated time, after which deltas are relative to the reset.
+    Stats which appear after the first dump count from zero.
+    """
+
+    # The distribution fields which accumulate between dumps.
+    DISTRIBUTION_FIELDS = (
+        "sum",
+        "sum_squared",
+        "underflow",
+        "overflow",
+        "logs",
+    )
+
+    def __init__(self):
+        # (path, number of buckets, or None for a scalar) for each stat.
+        self._layout = None
+        self._previous = None
+        self._previous_time = None
+        self._begin_time = None
+
+    def _size(self, buckets: Optional[int]) -> int:
+        if buckets is None:
+            return 1
+        return buckets + len(self.DISTRIBUTION_FIELDS)
+
+    def _relayout(self, layout: List[Tuple[str, Optional[int]]]) -> None:
+        # Move the previous values of the stats which are still there to
+        # their new place. Stats which were added start from zero.
+        if self._previous is not None:
+            kept = {}
+            offset = 0
+            for path, buckets in self._layout:
+                size = self._size(buckets)
+                kept[path] = (buckets, self._previous[offset : offset + size])
+                offset += size
+
+            previous = array("d")
+            for path, buckets in layout:
+                old = kept.get(path)
+                if old is not None and old[0] == buckets:
+                    previous.extend(old[1])
+                else:
+                    previous.extend(bytes(8 * self._size(buckets)))
+            self._previous = previous
+        self._layout = layout
+
+    def _flatten(self, values: Dict[str, Any]) -> array:
+        layout = [
+            (path, len(value["value"]) if isinstance(value, dict) else None)
+            for path, value in values.items()
+        ]
+        if layout != self._layout:
+            self._relayout(layout)
+
+        flat = array("d")
+        for value in values.values():
+            if isinstance(value, dict):
+                flat.extend(value["value"])
+                flat.extend(value[f] for f in self.DISTRIBUTION_FIELDS)
+            else:
+                flat.append(value)
+        return flat
+
+    def update(
+        self,
+        values: Dict[str, Any],
+        begin_time: int,
+        end_time: int,
+        frequency: float,
+    ) -> Tuple[int, Dict[str, Any], Dict[str, Any]]:
+        """
+        Records the values of a dump, as returned by ``get_stat_values``.
+
+        :param begin_time: The tick at which the stats were last reset.
+
+        :param end_time: The tick of the dump.
+
+        :param frequency: The number of ticks per simulated second.
+
+        :returns: The tick at which the interval began, and the stats
+                  which changed during it, mapped to their deltas and to
+                  their rates (per simulated second). Distributions map
+                  to dictionaries of their changed fields, with their
+                  buckets in ``value``.
+        """
+
+        current = self._flatten(values)
+        if self._previous is None or begin_time != self._begin_time:
+            self._previous = array("d", bytes(8 * len(current)))
+            self._previous_time = begin_time
+        previous = self._previous
+        interval_begin = self._previous_time
+        seconds = (end_time - interval_begin) / frequency
+
+        deltas = {}
+        rates = {}
+        offset = 0
+        for path, buckets in self._layout:
+            if buckets is None:
+                delta = current[offset] - previous[offset]
+                offset += 1
+                if delta:
+                    deltas[path] = delta
+                    if seconds:
+                        rates[path] = delta / seconds
+                continue
+
+            size = buckets + len(self.DISTRIBUTION_FIELDS)
+            changed = [
+                current[i] - previous[i] for i in range(offset, offset + size)
+            ]
+            offset += size
+            if any(changed):
+                delta = {"value": changed[:buckets]}
+                delta.update(zip(self.DISTRIBUTION_FIELDS, changed[buckets:]))
+                deltas[path] = delta
+                if seconds:
+                    rates[path] = {
+                        key: (
+                            [v / seconds for v in value]
+                            if key == "value"
+                            else value / seconds
+                        )
+                        for key, value in delta.items()
+                    }
+
+        self._previous = current
+        self._previous_time = end_time
+        self._begin_time = begin_time
+        return interval_begin, deltas, rates
+
+
+class JsonLinesOutputVisitor(JsonOutputVistor):
+    """
+    A JSON output which appends one compact JSON record per stats dump to the
+    output file, rather than overwriting it with the latest dump. Each record
+    maps dotted stat paths to their values. Only stats whose values changed
+    since the previous dump are written, except for the first record (and
+    every ``keyframe``-th record, if set) which contains every stat. A reader
+    reconstructs the values at dump ``n`` by applying records ``0..n`` in
+    order.
+
+    In the ``"delta"`` and ``"both"`` modes, each record also holds the
+    change in each stat since the previous dump (``"delta"``) and its rate
+    per simulated second (``"rate"``), computed without resetting the stats.
+    Stats which did not change are omitted from these.
+    """
+
+    MODES = ("absolute", "delta", "both")
+
+    def __init__(
+        self,
+        file: str,
+        compression: Optional[str] = None,
+        keyframe: int = 0,
+        append: bool = False,
+        mode: str = "absolute",
+    ):
+        """
+        :param file: The output file location.
+
+        :param compression: ``None``, ``"gzip"`` or ``"zstd"``. Each record is
+                            compressed as an independent gzip member or zstd
+                            frame, so the file can be appended to and read
+                            with standard tools.
+
+        :param keyframe: If non-zero, write every stat every ``keyframe``
+                         dumps so readers can start part way through a file.
+
+        :param append: Append to an existing file rather than truncating it.
+
+        :param mode: ``"absolute"`` to write the stats' values, ``"delta"`` to
+                     write their changes and rates since the previous dump
+                     instead, or ``"both"``.
+        """
+
+        super().__init__(file)
+        if compression not in (None, "gzip", "zstd"):
+            raise ValueError(
+                f"Unknown JSON lines stats compression '{compression}'"
+            )
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown JSON lines stats mode '{mode}'")
+        self.mode = mode
+        self._deltas = StatDeltas() if mode != "absolute" else None
+        if compression == "zstd":
+            # Only required when zstd compression is requested.
+            import zstandard
+
+            self._zstd = zstandard.ZstdCompressor()
+        self.compression = compression
+        self.keyframe = keyframe
+        self._previous = {}
+        self._dumps = 0
+
+        if not append:
+            open(self.file, "wb").close()
+
+    def dump(self, roots: Union[List[SimObject], Root]) -> None:
+        """
+        Appends a record holding the stats of a simulation root (or list of
+        roots) to the output file.
+
+        .. warning::
+
+            This dump assumes the statistics have already been prepared
+            for the target root.
+
+        :param roots: The Root, or List of roots, whose stats are are to be dumped.
+        """
+
+        values = get_stat_values(roots)
+        full = self._dumps == 0 or (
+            self.keyframe and self._dumps % self.keyframe == 0
+        )
+        self._dumps += 1
+
+        root = Root.getInstance()
+        final_tick = root.resolveStat("finalTick").value
+        sim_ticks = root.resolveStat("simTicks").value
+        begin_time = int(final_tick - sim_ticks)
+        end_time = int(final_tick)
+        record = {
+            "dump": self._dumps - 1,
+            "simulated_begin_time": begin_time,
+            "simulated_end_time": end_time,
+            "full": bool(full),
+        }
+
+        if self.mode != "delta":
+            if full:
+                changed = values
+            else:
+                previous = self._previous
+                changed = {
+                    path: value
+                    for path, value in values.items()
+                    if previous.get(path) != value
+                }
+            self._previous = values
+            record["stats"] = changed
+
+        if self._deltas is not None:
+            interval_begin, deltas, rates = self._deltas.update(
+                values,
+                begin_time,
+                end_time,
+                root.resolveStat("simFreq").value,
+            )
+            record["interval_begin_time"] = interval_begin
+            record["delta"] = deltas
+            record["rate"] = rates
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode()
+
+        if self.compression == "gzip":
+            line = gzip.compress(line)
+        elif self.compression == "zstd":
+            line = self._zstd.compress(line)
+        with open(self.file, "ab") as fp:
+            fp.write(line)
+
+
+class ColumnarOutputVisitor(JsonOutputVistor):
+    """
+    An output which appends one row per stats dump to a columnar archive
+    (see ``m5.ext.pystats.columnar``). Each stat is stored as a column, so
+    the time series of a few stats can be read from a long run without
+    parsing the rest. Distributions are stored as a column holding their
+    buckets, at the stat's path, plus a column per summary field (e.g.
+    ``<path>.min``).
+    """
+
+    def __init__(self, file: str, block_rows: int = 16, append: bool = False):
+        """
+        :param file: The archive directory.
+
+        :param block_rows: The number of dumps buffered before they are
+                           written to the archive.
+
+        :param append: Append to an existing archive rather than replacing
+                       it.
+        """
+
+        super().__init__(file)
+        self._writer = ColumnarWriter(
+            file, block_rows=block_rows, append=append
+        )
+
+    def dump(self, roots: Union[List[SimObject], Root]) -> None:
+        """
+        Appends a row holding the stats of a simulation root (or list of
+        roots) to the archive.
+
+        .. warning::
+
+            This dump assumes the statistics have already been prepared
+            for the target root.
+
+        :param roots: The Root, or List of roots, whose stats are are to be dumped.
+        """
+
+        final_tick = Root.getInstance().resolveStat("finalTick").value
+        sim_ticks = Root.getInstance().resolveStat("simTicks").value
+        row = {
+            "simulated_begin_time": final_tick - sim_ticks,
+            "simulated_end_time": final_tick,
+        }
+        for path, value in get_stat_values(roots).items():
+            if isinstance(value, dict):
+                for field, field_value in value.items():
+                    if field == "value":
+                        row[path] = field_value
+                    else:
+                        row[f"{path}.{field}"] = field_value
+            else:
+                row[path] = value
+        self._writer.write(row)
+
+    def close(self) -> None:
+        """Writes out any buffered dumps."""
+        self._writer.close()
+
+
+class LiveStatsOutputVisitor(JsonOutputVistor):
+    """
+    An output which sends a binary snapshot of the selected stats to the
+    clients connected to a Unix domain socket at each dump, so running
+    simulations can be monitored without reading their output files. See
+    ``m5.ext.pystats.livestats`` for the protocol and a client. Sending
+    never blocks the simulation; slow clients miss snapshots instead.
+    """
+
+    def __init__(
+        self,
+        file: str,
+        stats: Optional[List[str]] = None,
+        max_buffer: int = 1 << 20,
+    ):
+        """
+        :param file: The path of the socket.
+
+        :param stats: Glob-style patterns of the stats to send. By default,
+                      all stats are sent. Distributions are sent as their
+                      buckets (``<path>[<bucket>]``) and fields (e.g.
+                      ``<path>.min``).
+
+        :param max_buffer: The number of bytes which may be queued for a
+                           client before it misses snapshots.
+        """
+
+        super().__init__(file)
+        self._server = LiveStatsServer(file, max_buffer=max_buffer)
+        self._matchers = (
+            None
+            if stats is None
+            else [compile_glob(pattern).fullmatch for pattern in stats]
+        )
+        self._names = None
+        self._selected = None
+        self._dumps = 0
+
+    def dump(self, roots: Union[List[SimObject], Root]) -> None:
+        """
+        Sends the stats of a simulation root (or list of roots) to the
+        connected clients.
+
+        .. warning::
+
+            This dump assumes the statistics have already been prepared
+            for the target root.
+
+        :param roots: The Root, or List of roots, whose stats are are to be dumped.
+        """
+
+        flat = {}
+        for path, value in get_stat_values(roots).items():
+            if isinstance(value, dict):
+                for field, field_value in value.items():
+                    if field == "value":
+                        for i, bucket in enumerate(field_value):
+                            flat[f"{path}[{i}]"] = bucket
+                    else:
+                        flat[f"{path}.{field}"] = field_value
+            else:
+                flat[path] = value
+
+        # The stats are fixed once enabled, so only select them once.
+        names = tuple(flat)
+        if names != self._names:
+            self._names = names
+            self._selected = tuple(
+                name
+                for name in names
+                if self._matchers is None
+                or any(match(name) for match in self._matchers)
+            )
+
+        final_tick = Root.getInstance().resolveStat("finalTick").value
+        sim_ticks = Root.getInstance().resolveStat("simTicks").value
+        self._server.publish(
+            self._selected,
+            self._dumps,
+            int(final_tick - sim_ticks),
+            int(final_tick),
+            array("d", [flat[name] for name in self._selected]),
+        )
+        self._dumps += 1
+
+    def close(self) -> None:
+        """Disconnects the clients and removes the socket."""
+        self._server.close()
+
+
+def get_stat_values(
+    root: Union[SimObject, List[SimObject]], prefix: str = ""
+) -> Dict[str, Any]:
+    """
+    Reads the current stat values below a SimObject (typically the Root), or
+    list of SimObjects, directly into a flat dictionary keyed by dotted stat
+    path, without building a SimStat. Scalars map to their value, vector
+    elements to ``<vector>.<subname or index>``, and distributions to a
+    dictionary of their fields. The paths match those of ``get_simstat``.
+
+    The stats must already have been prepared.
+    """
+
+    values = {}
+
+    def add_group(group: _m5.stats.Group, prefix: str) -> None:
+        for stat in group.getStats():
+            __add_stat_value(stat, prefix, values)
+        groups = group.getStatGroups()
+        for name, child in groups.items():
+            add_group(child, f"{prefix}{name}.")
+
+    for r in root:
+        if isinstance(r, Root):
+            add_group(r, prefix)
+        else:
+            add_group(r, f"{prefix}{r.get_name()}.")
+    return values
+
+
+def __add_stat_value(
+    statistic: _m5.stats.Info, prefix: str, values: Dict[str, Any]
+) -> None:
+    path = prefix + statistic.name
+    if isinstance(statistic, _m5.stats.ScalarInfo):
+        values[path] = statistic.value
+    elif isinstance(statistic, _m5.stats.DistInfo):
+        values[path] = {
+            "value": list(statistic.values),
+            "min": statistic.min_val,
+            "max": statistic.max_val,
+            "bin_size": statistic.bucket_size,
+            "sum": statistic.sum,
+            "sum_squared": statistic.squares,
+            "underflow": statistic.underflow,
+            "overflow": statistic.overflow,
+            "logs": statistic.logs,
+        }
+    elif isinstance(statistic, _m5.stats.FormulaInfo):
+        # Formulas are not output, as with get_simstat.
+        pass
+    elif isinstance(statistic, _m5.stats.VectorInfo):
+        subnames = statistic.subnames
+        for index, value in enumerate(statistic.value):
+            name = str(subnames[index]) or str(index)
+            values[f"{path}.{name}"] = value
+
+
 def get_stats_group(group: _m5.stats.Group) -> Group:
     """
     Translates a gem5 Group object into a Python stats Group object. A Python
@@ -104,8 +597,8 @@ def get_stats_group(group: _m5.stats.Group) -> Group:
         if statistic is not None:
             stats_dict[stat.name] = statistic
 
-    for key in group.getStatGroups():
-        stats_dict[key] = get_stats_group(group.getStatGroups()[key])
+    for key, child in group.getStatGroups().items():
+        stats_dict[key] = get_stats_group(child)
 
     return Group(**stats_dict)
 
@@ -186,19 +679,24 @@ def __get_distribution(statistic: _m5.stats.DistInfo) -> Distribution:
 def __get_vector(statistic: _m5.stats.VectorInfo) -> Vector:
     to_add = dict()
 
+    # Each of these is copied from C++ on access, so only fetch them once.
+    values = statistic.value
+    subnames = statistic.subnames
+    subdescs = statistic.subdescs
+    unit = statistic.unit
+
     for index in range(statistic.size):
         # All the values in a Vector are Scalar values
-        value = statistic.value[index]
-        unit = statistic.unit
-        description = statistic.subdescs[index]
+        value = values[index]
+        description = subdescs[index]
         # ScalarInfo uses the C++ `double`.
         datatype = StorageType["f64"]
 
         # Sometimes elements within a vector are defined by their name. Other
         # times they have no name. When a name is not available, we name the
         # stat the index value.
-        if str(statistic.subnames[index]):
-            index_string = str(statistic.subnames[index])
+        if str(subnames[index]):
+            index_string = str(subnames[index])
         else:
             index_string = str(index)
 
@@ -209,6 +707,113 @@ def __get_vector(statistic: _m5.stats.VectorInfo) -> Vector:
     return Vector(scalar_map=to_add)
 
 
+def __refresh_scalar(statistic: _m5.stats.ScalarInfo, scalar: Scalar) -> None:
+    scalar.value = statistic.value
+
+
+def __refresh_distribution(
+    statistic: _m5.stats.DistInfo, distribution: Distribution
+) -> None:
+    distribution.value = list(statistic.values)
+    distribution.min = statistic.min_val
+    distribution.max = statistic.max_val
+    distribution.bin_size = statistic.bucket_size
+    distribution.sum = statistic.sum
+    distribution.sum_squared = statistic.squares
+    distribution.underflow = statistic.underflow
+    distribution.overflow = statistic.overflow
+    distribution.logs = statistic.logs
+
+
+def __refresh_vector(
+    statistic: _m5.stats.VectorInfo, scalars: List[Scalar]
+) -> None:
+    for scalar, value in zip(scalars, statistic.value):
+        scalar.value = value
+
+
+class _SimStatSkeleton:
+    """
+    The Python stats tree of a set of roots, built once and then refreshed
+    with the current stat values on each use. The tree's shape and metadata
+    (names, units, descriptions and types) are fixed once the stats have
+    been enabled, so only the values need to be read on subsequent calls.
+    """
+
+    def __init__(self, roots: List[SimObject]):
+        # The stat groups in the order `_prepare_stats` visits them, with
+        # their stats.
+        self.groups = []
+        # (refresh function, Info, Python object(s)) for every stat.
+        self.bindings = []
+        self.stats_map = {}
+
+        for r in roots:
+            if isinstance(r, Root):
+                # The Root is a special case, we jump directly into adding
+                # its constituent Groups.
+                self.groups.append((r, r.getStats()))
+                for key, group in r.getStatGroups().items():
+                    self.stats_map[key] = _build_stats_group(
+                        group, self.groups, self.bindings
+                    )
+            elif isinstance(r, SimObject):
+                self.stats_map[r.get_name()] = _build_stats_group(
+                    r, self.groups, self.bindings
+                )
+            else:
+                raise TypeError(
+                    "Object (" + str(r) + ") passed is not a "
+                    "SimObject. " + __name__ + " only processes "
+                    "SimObjects, or a list of  SimObjects."
+                )
+
+    def prepare(self) -> None:
+        for group, stats in self.groups:
+            group.preDumpStats()
+            for stat in stats:
+                stat.prepare()
+
+    def refresh(self) -> None:
+        for refresh, info, statistic in self.bindings:
+            refresh(info, statistic)
+
+
+def _build_stats_group(
+    group: _m5.stats.Group, groups: List, bindings: List
+) -> Group:
+    """
+    As ``get_stats_group``, but also records each group and each stat with
+    the function which refreshes its value, for ``_SimStatSkeleton``.
+    """
+
+    stats = group.getStats()
+    groups.append((group, stats))
+
+    stats_dict = {}
+    for stat in stats:
+        statistic = __get_statistic(stat)
+        if statistic is None:
+            continue
+        stats_dict[stat.name] = statistic
+        if isinstance(stat, _m5.stats.ScalarInfo):
+            bindings.append((__refresh_scalar, stat, statistic))
+        elif isinstance(stat, _m5.stats.DistInfo):
+            bindings.append((__refresh_distribution, stat, statistic))
+        elif isinstance(stat, _m5.stats.VectorInfo):
+            bindings.append((__refresh_vector, stat, statistic.children()))
+
+    for key, child in group.getStatGroups().items():
+        stats_dict[key] = _build_stats_group(child, groups, bindings)
+
+    return Group(**stats_dict)
+
+
+# The skeletons built by `get_simstat(incremental=True)`, keyed by the ids
+# of their roots.
+_skeletons = {}
+
+
 def _prepare_stats(group: _m5.stats.Group):
     """
     Prepares the statistics for dumping.
@@ -224,7 +829,9 @@ def _prepare_stats(group: _m5.stats.Group):
 
 
 def get_simstat(
-    root: Union[SimObject, List[SimObject]], prepare_stats: bool = True
+    root: Union[SimObject, List[SimObject]],
+    prepare_stats: bool = True,
+    incremental: bool = False,
 ) -> SimStat:
     """
     This function will return the SimStat object for a simulation given a
@@ -241,10 +848,17 @@ def get_simstat(
                           to creating the SimStat object. By default this is
                           ``True``.
 
+    :param incremental: If ``True``, the stats tree built by the first call
+                        for the given root(s) is kept and only its values are
+                        updated by later calls, which is much cheaper for
+                        large simulations. The groups and statistics in the
+                        returned SimStat are therefore shared with, and
+                        updated by, later incremental calls. By default this
+                        is ``False``.
+
     :Returns: The SimStat Object of the current simulation.
 
     """
-    stats_map = {}
     creation_time = datetime.now()
     time_converstion = None  # TODO https://gem5.atlassian.net/browse/GEM5-846
     final_tick = Root.getInstance().resolveStat("finalTick").value
@@ -255,24 +869,37 @@ def get_simstat(
     if prepare_stats:
         _m5.stats.processDumpQueue()
 
-    for r in root:
-        if isinstance(r, Root):
-            # The Root is a special case, we jump directly into adding its
-            # constituent Groups.
-            if prepare_stats:
-                _prepare_stats(r)
-            for key in r.getStatGroups():
-                stats_map[key] = get_stats_group(r.getStatGroups()[key])
-        elif isinstance(r, SimObject):
-            if prepare_stats:
-                _prepare_stats(r)
-            stats_map[r.get_name()] = get_stats_group(r)
-        else:
-            raise TypeError(
-                "Object (" + str(r) + ") passed is not a "
-                "SimObject. " + __name__ + " only processes "
-                "SimObjects, or a list of  SimObjects."
-            )
+    if incremental:
+        roots = list(root)
+        key = tuple(id(r) for r in roots)
+        skeleton = _skeletons.get(key)
+        if skeleton is None:
+            skeleton = _SimStatSkeleton(roots)
+            _skeletons[key] = skeleton
+        if prepare_stats:
+            skeleton.prepare()
+        skeleton.refresh()
+        stats_map = skeleton.stats_map
+    else:
+        stats_map = {}
+        for r in root:
+            if isinstance(r, Root):
+                # The Root is a special case, we jump directly into adding
+                # its constituent Groups.
+                if prepare_stats:
+                    _prepare_stats(r)
+                for key, group in r.getStatGroups().items():
+                    stats_map[key] = get_stats_group(group)
+            elif isinstance(r, SimObject):
+                if prepare_stats:
+                    _prepare_stats(r)
+                stats_map[r.get_name()] = get_stats_group(r)
+            else:
+                raise TypeError(
+                    "Object (" + str(r) + ") passed is not a "
+                    "SimObject. " + __name__ + " only processes "
+                    "SimObjects, or a list of  SimObjects."
+                )
 
     return SimStat(
         creation_time=creation_time,
@@ -0,0 +1,224 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Random access to the sections of a checkpoint file (m5.cpt). gem5 writes
+an index of the sections next to it (m5.cpt.idx), listing the offset and
+length of each section in the file, so a section can be read without
+parsing the whole file. The index is built (and written, if possible) on
+first access for checkpoints without one, and rebuilt when it no longer
+matches the file, e.g. after an upgrade.
+
+Index files start with a ``gem5-cpt-index 2 <size> <mtime>`` line, with
+the size and modification time (in ns) of m5.cpt, followed by one
+``<offset> <length> <section>`` line per section header in the file. A section may appear more than once: the sections nested in
+a section are written in the middle of it.
+"""
+
+import fnmatch
+import mmap
+import os
+import re
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+CPT_FILE = "m5.cpt"
+INDEX_SUFFIX = ".idx"
+_MAGIC = "gem5-cpt-index"
+_VERSION = 2
+
+_HEADER = re.compile(rb"^\[([^\]\n]*)\][ \t\r]*$", re.MULTILINE)
+
+
+class CheckpointIndexError(Exception):
+    pass
+
+
+def build_index(path: str) -> List[Tuple[int, int, str]]:
+    """Scan a checkpoint file for its sections. Returns the offset, length
+    and name of each section."""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            headers = [
+                (match.start(), match.group(1).decode().strip())
+                for match in _HEADER.finditer(data)
+            ]
+    ends = [offset for offset, _ in headers[1:]] + [size]
+    return [
+        (offset, end - offset, name)
+        for (offset, name), end in zip(headers, ends)
+    ]
+
+
+def write_index(path: str, spans: List[Tuple[int, int, str]]) -> None:
+    """Write the index of a checkpoint file next to it."""
+    st = os.stat(path)
+    tmp = f"{path}{INDEX_SUFFIX}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(f"{_MAGIC} {_VERSION} {st.st_size} {st.st_mtime_ns}\n")
+        for offset, length, name in spans:
+            f.write(f"{offset} {length} {name}\n")
+    os.replace(tmp, path + INDEX_SUFFIX)
+
+
+def read_index(path: str) -> Optional[List[Tuple[int, int, str]]]:
+    """Read the index of a checkpoint file. Returns None if there is no
+    index, or if it does not match the file."""
+    try:
+        with open(path + INDEX_SUFFIX) as f:
+            magic, version, size, mtime = f.readline().split()
+            st = os.stat(path)
+            if (
+                magic != _MAGIC
+                or int(version) != _VERSION
+                or int(size) != st.st_size
+                or int(mtime) != st.st_mtime_ns
+            ):
+                return None
+            spans = []
+            for line in f:
+                offset, length, name = line.rstrip("\n").split(" ", 2)
+                spans.append((int(offset), int(length), name))
+            return spans
+    except (OSError, ValueError):
+        return None
+
+
+class CheckpointIndex:
+    """
+    Reads the sections of a checkpoint file through its index.
+
+    .. code-block::
+
+        cpt = CheckpointIndex("m5out/cpt.1234")
+        tick = int(cpt.get("Globals", "curTick"))
+        pc = cpt.section("system.cpu.xc.0")["_pc"]
+    """
+
+    def __init__(self, path: str, write: bool = True):
+        """
+        :param path: The checkpoint directory, or its m5.cpt file.
+        :param write: Write the index if it has to be built.
+        """
+        if os.path.isdir(path):
+            path = os.path.join(path, CPT_FILE)
+        self.path = path
+        self._write = write
+        self._file = open(path, "rb")
+        self._spans = None
+        self._load(read_index(path))
+
+    def _load(self, spans: Optional[List[Tuple[int, int, str]]]) -> None:
+        if spans is None:
+            spans = build_index(self.path)
+            if self._write:
+                try:
+                    write_index(self.path, spans)
+                except OSError:
+                    pass
+        self._spans = {}
+        for offset, length, name in spans:
+            self._spans.setdefault(name, []).append((offset, length))
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def sections(self) -> List[str]:
+        """The names of the sections, in the order they appear."""
+        return list(self._spans)
+
+    def find(self, pattern: str) -> List[str]:
+        """The names of the sections matching a glob pattern."""
+        return [name for name in self._spans if fnmatch.fnmatch(name, pattern)]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._spans
+
+    def _read_span(self, name: str, offset: int, length: int) -> bytes:
+        self._file.seek(offset)
+        data = self._file.read(length)
+        header = f"[{name}]".encode()
+        if not data.startswith(header):
+            raise CheckpointIndexError(
+                f"The index of '{self.path}' does not match section [{name}]"
+            )
+        return data[len(header) :]
+
+    def raw_section(self, name: str) -> str:
+        """The text of a section, without its header."""
+        if name not in self._spans:
+            raise KeyError(name)
+        try:
+            chunks = [
+                self._read_span(name, offset, length)
+                for offset, length in self._spans[name]
+            ]
+        except CheckpointIndexError:
+            # The file changed without changing size: rebuild the index.
+            self._load(None)
+            if name not in self._spans:
+                raise KeyError(name)
+            chunks = [
+                self._read_span(name, offset, length)
+                for offset, length in self._spans[name]
+            ]
+        return b"".join(chunks).decode()
+
+    def items(self, name: str) -> Iterator[Tuple[str, str]]:
+        for line in self.raw_section(name).splitlines():
+            line = line.strip()
+            if not line or line[0] in "#;":
+                continue
+            key, sep, value = line.partition("=")
+            if sep:
+                yield key.strip(), value.strip()
+
+    def section(self, name: str) -> Dict[str, str]:
+        """The entries of a section."""
+        return dict(self.items(name))
+
+    def get(
+        self, name: str, key: str, default: Optional[str] = None
+    ) -> Optional[str]:
+        """The value of an entry, or `default` if there is no such section
+        or entry."""
+        if name not in self._spans:
+            return default
+        return self.section(name).get(key, default)
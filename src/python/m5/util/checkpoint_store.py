@@ -0,0 +1,596 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+A content-addressed store for the memory images of checkpoints (enabled with
+``--checkpoint-store`` or ``enable()``). Checkpoints of the same workload,
+e.g. at different SimPoints, share most of their physical memory. Instead of
+keeping a full ``*.pmem`` gzip per checkpoint, the store splits each image in
+fixed-size chunks, named by the SHA-256 of their content, and keeps every
+distinct chunk once.
+
+A checkpoint in the store holds, in place of each ``<name>.pmem``, a
+``<name>.pmem.chunks`` JSON manifest listing the chunks of the image. The
+store itself is a directory holding the zlib-compressed chunks
+(``objects/<2 hex digits>/<digest>``) and an SQLite index
+(``index.sqlite``) of the images stored and of the number of images
+referencing each chunk. Copying a checkpoint to another host therefore only
+needs its manifests and the chunks the other store does not have yet.
+
+``m5.checkpoint()`` moves the memory images of a new checkpoint to the
+enabled store. ``m5.instantiate()`` restores such a checkpoint from a
+temporary directory holding links to the checkpoint files and the memory
+images rebuilt from the store. The images are rebuilt uncompressed (which
+zlib reads transparently) and sparse, so this is mostly bounded by the
+decompression of the non-zero chunks. Existing checkpoints are converted,
+released and garbage collected with ``util/checkpoint_store.py``.
+"""
+
+import fcntl
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import uuid
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import (
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+)
+
+from . import pmem_image
+
+MANIFEST_SUFFIX = ".chunks"
+_IMAGE_SUFFIXES = (".pmem", ".pmem.blk")
+MANIFEST_VERSION = 1
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Chunks hashed, compressed and written per batch.
+_BATCH = 256
+
+_store = None
+
+
+class ChunkStoreError(Exception):
+    pass
+
+
+class ChunkStore:
+    def __init__(
+        self,
+        root: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        level: int = 6,
+        threads: Optional[int] = None,
+    ):
+        """
+        :param root: The directory of the store. It is created if needed.
+        :param chunk_size: The size of the chunks new images are split in.
+        :param level: The zlib compression level of the chunks.
+        :param threads: The number of threads hashing, compressing and
+                        decompressing chunks (default: one per CPU).
+        """
+        if chunk_size <= 0:
+            raise ValueError("The chunk size must be positive")
+        self.root = os.path.abspath(root)
+        self.chunk_size = chunk_size
+        self.level = level
+        self.threads = threads or os.cpu_count() or 1
+        self._db = None
+        self._zero_digests = {}
+
+        os.makedirs(os.path.join(self.root, "objects"), exist_ok=True)
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        # Opened on first use, so stores can be created before forking.
+        if self._db is None:
+            self._db = sqlite3.connect(
+                os.path.join(self.root, "index.sqlite"),
+                timeout=600,
+                isolation_level=None,
+            )
+            self._db.executescript(
+                "CREATE TABLE IF NOT EXISTS chunks ("
+                " digest TEXT PRIMARY KEY,"
+                " stored INTEGER NOT NULL,"
+                " refs INTEGER NOT NULL) WITHOUT ROWID;"
+                "CREATE TABLE IF NOT EXISTS images ("
+                " id TEXT PRIMARY KEY,"
+                " path TEXT NOT NULL,"
+                " size INTEGER NOT NULL);"
+            )
+        return self._db
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    @contextmanager
+    def _lock(self, exclusive: bool):
+        # Adding images takes a shared lock and garbage collection an
+        # exclusive one, so a chunk an image is about to reference cannot be
+        # removed under it.
+        with open(os.path.join(self.root, "lock"), "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def chunk_path(self, digest: str) -> str:
+        return os.path.join(self.root, "objects", digest[:2], digest)
+
+    def _zero_digest(self, size: int) -> str:
+        digest = self._zero_digests.get(size)
+        if digest is None:
+            digest = hashlib.sha256(bytes(size)).hexdigest()
+            self._zero_digests[size] = digest
+        return digest
+
+    def _hash(self, data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def _write_chunk(self, digest: str, data: bytes) -> int:
+        path = self.chunk_path(digest)
+        try:
+            return os.stat(path).st_size
+        except FileNotFoundError:
+            pass
+
+        compressed = zlib.compress(data, self.level)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(compressed)
+        os.replace(tmp, path)
+        return len(compressed)
+
+    def read_chunk(self, digest: str) -> bytes:
+        try:
+            with open(self.chunk_path(digest), "rb") as f:
+                return zlib.decompress(f.read())
+        except FileNotFoundError:
+            raise ChunkStoreError(
+                f"Chunk {digest} is missing from the store in '{self.root}'"
+            )
+
+    def add_image(self, image: BinaryIO, path: str = "") -> Dict:
+        """
+        Split the image read from a binary file object in chunks, add the
+        chunks the store does not hold yet and reference all of them.
+
+        :param image: The image to add.
+        :param path: Where the image comes from, for ``images()``.
+        :returns: The manifest of the image.
+        """
+        digests = []
+        stored = {}
+        size = 0
+        with self._lock(exclusive=False), ThreadPoolExecutor(
+            self.threads
+        ) as pool:
+            while True:
+                batch = []
+                for _ in range(_BATCH):
+                    data = image.read(self.chunk_size)
+                    if not data:
+                        break
+                    batch.append(data)
+                if not batch:
+                    break
+
+                hashed = list(pool.map(self._hash, batch))
+                new = {
+                    digest: data
+                    for digest, data in zip(hashed, batch)
+                    if digest not in stored
+                }
+                for digest, length in zip(
+                    new, pool.map(self._write_chunk, new, new.values())
+                ):
+                    stored[digest] = length
+                digests.extend(hashed)
+                size += sum(len(data) for data in batch)
+                if len(batch) < _BATCH:
+                    break
+
+            manifest = {
+                "version": MANIFEST_VERSION,
+                "id": uuid.uuid4().hex,
+                "store": self.root,
+                "size": size,
+                "chunk_size": self.chunk_size,
+                "chunks": digests,
+            }
+
+            # Reference every distinct chunk once per image, in a single
+            # transaction so a failed import leaves no references behind.
+            db = self.db
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                db.executemany(
+                    "INSERT INTO chunks VALUES (?, ?, 1) ON CONFLICT(digest)"
+                    " DO UPDATE SET refs = refs + 1",
+                    stored.items(),
+                )
+                db.execute(
+                    "INSERT INTO images VALUES (?, ?, ?)",
+                    (manifest["id"], path, size),
+                )
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+
+        return manifest
+
+    def release(self, manifest: Dict) -> bool:
+        """
+        Drop the references of an image to its chunks. The chunks nothing
+        references anymore are removed by ``gc()``.
+
+        :returns: False if the image was not in the store (e.g., it was
+                  already released).
+        """
+        db = self.db
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            if not db.execute(
+                "DELETE FROM images WHERE id = ?", (manifest["id"],)
+            ).rowcount:
+                db.execute("ROLLBACK")
+                return False
+            db.executemany(
+                "UPDATE chunks SET refs = refs - 1 WHERE digest = ?",
+                ((digest,) for digest in set(manifest["chunks"])),
+            )
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        return True
+
+    def gc(self) -> Dict:
+        """Remove the chunks no image references."""
+        removed = 0
+        freed = 0
+        with self._lock(exclusive=True):
+            db = self.db
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                unused = db.execute(
+                    "SELECT digest, stored FROM chunks WHERE refs <= 0"
+                ).fetchall()
+                for digest, stored in unused:
+                    try:
+                        os.unlink(self.chunk_path(digest))
+                    except FileNotFoundError:
+                        pass
+                    removed += 1
+                    freed += stored
+                db.execute("DELETE FROM chunks WHERE refs <= 0")
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        return {"chunks": removed, "bytes": freed}
+
+    def usage(self) -> Dict:
+        """The number of images and chunks, and the size of the images
+        against the size of the chunks stored for them."""
+        images, logical = self.db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM images"
+        ).fetchone()
+        chunks, stored, unused = self.db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(stored), 0),"
+            " COALESCE(SUM(refs <= 0), 0) FROM chunks"
+        ).fetchone()
+        return {
+            "images": images,
+            "image_bytes": logical,
+            "chunks": chunks,
+            "stored_bytes": stored,
+            "unused_chunks": unused,
+            "ratio": logical / stored if stored else 0.0,
+        }
+
+    def images(self) -> List[Dict]:
+        return [
+            {"id": image_id, "path": path, "size": size}
+            for image_id, path, size in self.db.execute(
+                "SELECT id, path, size FROM images ORDER BY path"
+            )
+        ]
+
+    def open_image(self, manifest: Dict) -> BinaryIO:
+        """Open the image of a manifest as a stream of its content."""
+        return _ImageReader(self, manifest)
+
+    def write_image(self, manifest: Dict, out: BinaryIO) -> None:
+        """
+        Write the image of a manifest to a seekable binary file. Runs of
+        zero chunks are skipped rather than written, so they are left as
+        holes on file systems supporting sparse files.
+        """
+        chunk_size = manifest["chunk_size"]
+        size = manifest["size"]
+        zero = self._zero_digest(chunk_size)
+        tail = self._zero_digest(size % chunk_size or chunk_size)
+        last = len(manifest["chunks"]) - 1
+
+        def load(item):
+            index, digest = item
+            if digest == (tail if index == last else zero):
+                return None
+            return self.read_chunk(digest)
+
+        start = out.tell()
+        with ThreadPoolExecutor(self.threads) as pool:
+            for index, data in enumerate(
+                pool.map(load, enumerate(manifest["chunks"]))
+            ):
+                if data is None:
+                    continue
+                out.seek(start + index * chunk_size)
+                out.write(data)
+        out.truncate(start + size)
+        out.seek(start + size)
+
+
+class _ImageReader:
+    # A minimal sequential file object over the chunks of a manifest. The
+    # chunks are read ahead in batches by a pool of threads.
+    def __init__(self, store: ChunkStore, manifest: Dict):
+        self._store = store
+        self._chunks = manifest["chunks"]
+        self._zero = store._zero_digest(manifest["chunk_size"])
+        self._chunk_size = manifest["chunk_size"]
+        self._next = 0
+        # Chunks read ahead, and the offset of the first unread byte in
+        # the first of them.
+        self._loaded = deque()
+        self._offset = 0
+        self._pool = ThreadPoolExecutor(store.threads)
+
+    def _load(self, digest: str) -> bytes:
+        if digest == self._zero:
+            return bytes(self._chunk_size)
+        return self._store.read_chunk(digest)
+
+    def read(self, size: int = -1) -> bytes:
+        parts = []
+        length = 0
+        while size < 0 or length < size:
+            if not self._loaded:
+                if self._next == len(self._chunks):
+                    break
+                batch = self._chunks[self._next : self._next + _BATCH]
+                self._next += len(batch)
+                self._loaded.extend(self._pool.map(self._load, batch))
+
+            chunk = self._loaded[0]
+            end = len(chunk)
+            if size >= 0:
+                end = min(end, self._offset + size - length)
+            parts.append(chunk[self._offset : end])
+            length += end - self._offset
+            if end == len(chunk):
+                self._loaded.popleft()
+                self._offset = 0
+            else:
+                self._offset = end
+        return b"".join(parts)
+
+    def close(self) -> None:
+        self._pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _images(ckpt_dir: str, suffix: str = "") -> List[str]:
+    return sorted(
+        name
+        for name in os.listdir(ckpt_dir)
+        if name.endswith(tuple(s + suffix for s in _IMAGE_SUFFIXES))
+    )
+
+
+def read_manifest(path: str) -> Dict:
+    with open(path) as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ChunkStoreError(
+            f"'{path}' has an unsupported manifest version "
+            f"({manifest.get('version')})"
+        )
+    return manifest
+
+
+def _write_manifest(path: str, manifest: Dict) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f)
+    os.replace(tmp, path)
+
+
+def is_stored(ckpt_dir: str) -> bool:
+    """Whether the memory images of a checkpoint are in a chunk store."""
+    return bool(_images(ckpt_dir, MANIFEST_SUFFIX))
+
+
+def store_checkpoint(
+    store: ChunkStore, ckpt_dir: str, keep: bool = False
+) -> List[Dict]:
+    """
+    Move the memory images (``*.pmem``, or ``*.pmem.blk`` in the blocked
+    format) of a checkpoint to a store and replace them by manifests.
+
+    :param keep: Keep the images rather than removing them.
+    :returns: The manifests of the images.
+    """
+    manifests = []
+    for name in _images(ckpt_dir):
+        path = os.path.join(ckpt_dir, name)
+        with pmem_image.open_image(path) as image:
+            manifest = store.add_image(image, os.path.abspath(path))
+        _write_manifest(path + MANIFEST_SUFFIX, manifest)
+        if not keep:
+            os.unlink(path)
+        manifests.append(manifest)
+    return manifests
+
+
+def _manifest_store(manifest: Dict, store: Optional[ChunkStore]):
+    if store is not None:
+        return store
+    if _store is not None:
+        return _store
+    return ChunkStore(manifest["store"], manifest["chunk_size"])
+
+
+def export_checkpoint(
+    ckpt_dir: str, store: Optional[ChunkStore] = None, level: int = 6
+) -> None:
+    """
+    Write back the memory images of a checkpoint, in the format they were
+    stored from, and release them from their store.
+
+    :param store: The store holding the chunks. Defaults to the enabled
+                  store, else to the store each manifest was written to.
+    """
+    for name in _images(ckpt_dir, MANIFEST_SUFFIX):
+        path = os.path.join(ckpt_dir, name)
+        manifest = read_manifest(path)
+        image_store = _manifest_store(manifest, store)
+        image = path[: -len(MANIFEST_SUFFIX)]
+        if image.endswith(".blk"):
+            with image_store.open_image(manifest) as f:
+                pmem_image.write_image(image + ".tmp", f)
+        else:
+            with gzip.open(image + ".tmp", "wb", compresslevel=level) as f:
+                for digest in manifest["chunks"]:
+                    f.write(image_store.read_chunk(digest))
+        os.replace(image + ".tmp", image)
+        image_store.release(manifest)
+        os.unlink(path)
+
+
+def release_checkpoint(
+    ckpt_dir: str, store: Optional[ChunkStore] = None
+) -> int:
+    """
+    Release the memory images of a checkpoint about to be deleted from
+    their store.
+
+    :returns: The number of images released.
+    """
+    released = 0
+    for name in _images(ckpt_dir, MANIFEST_SUFFIX):
+        path = os.path.join(ckpt_dir, name)
+        manifest = read_manifest(path)
+        if _manifest_store(manifest, store).release(manifest):
+            released += 1
+        os.unlink(path)
+    return released
+
+
+def materialize(
+    ckpt_dir: str, dest: str, store: Optional[ChunkStore] = None
+) -> None:
+    """
+    Fill `dest` with links to the files of a checkpoint and with its memory
+    images rebuilt from the store, i.e. a checkpoint gem5 can restore.
+    """
+    manifests = set(_images(ckpt_dir, MANIFEST_SUFFIX))
+    for name in os.listdir(ckpt_dir):
+        path = os.path.join(ckpt_dir, name)
+        if name in manifests:
+            manifest = read_manifest(path)
+            image_store = _manifest_store(manifest, store)
+            image = os.path.join(dest, name[: -len(MANIFEST_SUFFIX)])
+            if image.endswith(".blk"):
+                # Uncompressed, the blocks can be read in parallel or
+                # mapped into memory on restore.
+                with image_store.open_image(manifest) as f:
+                    pmem_image.write_image(image, f, codec="none")
+            else:
+                with open(image, "wb") as f:
+                    image_store.write_image(manifest, f)
+        else:
+            os.symlink(os.path.abspath(path), os.path.join(dest, name))
+
+
+def enable(root: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+    """Store the memory images of the checkpoints taken from now on in the
+    store in `root`, and read the images of restored checkpoints from it."""
+    global _store
+    _store = ChunkStore(root, chunk_size)
+
+
+def enabled() -> bool:
+    return _store is not None
+
+
+def on_checkpoint(ckpt_dir: str) -> None:
+    """Called once a checkpoint is written."""
+    if _store is not None:
+        store_checkpoint(_store, ckpt_dir)
+
+
+@contextmanager
+def restore_dir(ckpt_dir: str) -> Iterator[str]:
+    """
+    The directory to restore a checkpoint from: the checkpoint itself,
+    unless its memory images are in a store. They are then rebuilt in a
+    temporary directory, removed on exit from the context.
+    """
+    if not is_stored(ckpt_dir):
+        yield ckpt_dir
+        return
+
+    from m5 import options
+
+    dest = tempfile.mkdtemp(prefix="restore-", dir=options.outdir)
+    try:
+        materialize(ckpt_dir, dest)
+        yield dest
+    finally:
+        shutil.rmtree(dest, ignore_errors=True)
@@ -0,0 +1,357 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Fork-server mode (enabled with ``--fork-server``). The config script runs
+once, up to a fork point in ``m5.instantiate()``. From there, the process
+serves run requests (jobs) by forking a child per job. Each child
+continues the config script from the fork point with its own output
+directory, so Python start-up, building the configuration and (by
+default) instantiating it are only paid once.
+
+Jobs are JSON objects, one per line, read from a job file or from
+connections to a Unix socket (``unix:PATH``). A job may hold:
+
+  * name: the name of its output directory, in the server's output
+    directory, without path separators (default: job<N>);
+  * argv: replaces ``sys.argv`` in the child;
+  * env: environment variables set in the child;
+  * any other field, for the job hooks of the config script (see
+    ``add_job_hook()``) and ``current_job()``.
+
+The line ``{"command": "shutdown"}`` stops the server once the running
+jobs are done. A result is written for every job, as a JSON line, to
+``fork-server.jsonl`` in the server's output directory and, for socket
+jobs, to the connection it came from. It holds the exit code and wall
+time of the job and the start-up time it saved.
+
+Forking after instantiation only lets jobs change what the config script
+does after ``m5.instantiate()`` (e.g., how long to simulate or which
+stats to dump) and run-time state, through job hooks. Forking before
+instantiation (``--fork-server-point=before-instantiate``) saves less, but
+lets job hooks change any parameter, such as the arguments of an SE
+workload.
+"""
+
+import json
+import os
+import selectors
+import socket
+import sys
+import time
+from typing import (
+    Callable,
+    Dict,
+    Optional,
+)
+
+from . import (
+    inform,
+    warn,
+)
+
+FORK_POINTS = ("before-instantiate", "after-instantiate")
+
+_server = None
+_job = None
+_job_hooks = []
+
+
+class _Job:
+    __slots__ = ("spec", "name", "conn", "pid", "forked", "fork_time")
+
+    def __init__(self, spec: Dict, name: str, conn=None):
+        self.spec = spec
+        self.name = name
+        self.conn = conn
+        self.pid = None
+        self.forked = 0.0
+        self.fork_time = 0.0
+
+
+class ForkServer:
+    def __init__(self, source: str, point: str, workers: int):
+        if point not in FORK_POINTS:
+            raise ValueError(f"Unknown fork point '{point}'")
+        self._source = source
+        self.point = point
+        self._workers = max(workers, 1)
+        self._start = time.perf_counter()
+        self._pending = []
+        self._running = {}
+        self._job_count = 0
+        self._selector = None
+        self._listener = None
+        self._buffers = {}
+        self._shutdown = False
+        self._failed = 0
+        self._saved = 0.0
+
+    def _add_job(self, line: str, conn=None) -> None:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            return
+        try:
+            spec = json.loads(line)
+            if not isinstance(spec, dict):
+                raise ValueError("a job must be a JSON object")
+        except ValueError as e:
+            self._reply(conn, {"error": f"Invalid job: {e}"})
+            return
+
+        if spec.get("command") == "shutdown":
+            self._shutdown = True
+            return
+
+        name = str(spec.get("name", f"job{self._job_count}"))
+        # The name is a directory in the server's output directory.
+        if (
+            name in ("", ".", "..")
+            or "/" in name
+            or os.sep in name
+            or "\0" in name
+        ):
+            self._reply(conn, {"error": f"Invalid job name '{name}'"})
+            if conn is None:
+                warn(f"Skipping the job with the invalid name '{name}'")
+            return
+        self._job_count += 1
+        self._pending.append(_Job(spec, name, conn))
+
+    def _reply(self, conn, result: Dict) -> None:
+        if conn is None:
+            return
+        try:
+            conn.sendall(json.dumps(result).encode() + b"\n")
+        except OSError:
+            pass
+
+    def _open(self) -> None:
+        if self._source.startswith("unix:"):
+            path = self._source[len("unix:") :]
+            if os.path.exists(path):
+                os.unlink(path)
+            self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._listener.bind(path)
+            self._listener.listen()
+            self._listener.setblocking(False)
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._listener, selectors.EVENT_READ)
+        else:
+            with open(self._source) as f:
+                for line in f:
+                    self._add_job(line)
+            self._shutdown = True
+
+    def _close(self) -> None:
+        # Release the sockets, in the server once done and in every child.
+        if self._selector is not None:
+            for key in list(self._selector.get_map().values()):
+                key.fileobj.close()
+            self._selector.close()
+            self._selector = None
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+
+    def _poll_sockets(self, timeout: float) -> None:
+        for key, _ in self._selector.select(timeout):
+            if key.fileobj is self._listener:
+                try:
+                    conn, _ = self._listener.accept()
+                except OSError:
+                    continue
+                conn.setblocking(False)
+                self._buffers[conn] = b""
+                self._selector.register(conn, selectors.EVENT_READ)
+                continue
+
+            conn = key.fileobj
+            try:
+                data = conn.recv(1 << 16)
+            except OSError:
+                data = b""
+            if not data:
+                self._selector.unregister(conn)
+                del self._buffers[conn]
+                # Keep the connection open for the results of its jobs.
+                if not any(job.conn is conn for job in self._jobs()):
+                    conn.close()
+                continue
+
+            lines = (self._buffers[conn] + data).split(b"\n")
+            self._buffers[conn] = lines.pop()
+            for line in lines:
+                self._add_job(line.decode(errors="replace"), conn)
+
+    def _jobs(self):
+        yield from self._pending
+        yield from self._running.values()
+
+    def _fork(self, job: _Job) -> bool:
+        """Fork a child for a job. Returns True in the child."""
+        import m5
+
+        outdir = os.path.join(m5.options.outdir, job.name)
+        start = time.perf_counter()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        if self.point == "after-instantiate":
+            pid = m5.fork(outdir.replace("%", "%%"))
+        else:
+            from .. import core
+
+            # There are no SimObjects to notify before instantiation.
+            pid = os.fork()
+            if pid == 0:
+                m5.options.outdir = outdir
+                core.setOutputDir(outdir)
+
+        if pid == 0:
+            os.makedirs(m5.options.outdir, exist_ok=True)
+            for other in self._jobs():
+                if other.conn is not None:
+                    other.conn.close()
+            self._close()
+            return True
+
+        job.pid = pid
+        job.forked = time.perf_counter()
+        job.fork_time = job.forked - start
+        self._running[pid] = job
+        return False
+
+    def _reap(self) -> None:
+        # Only reap the jobs: other children of this process are left to
+        # whoever started them.
+        for pid in list(self._running):
+            try:
+                wait_pid, status = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                wait_pid, status = pid, 0
+            if wait_pid == 0:
+                continue
+            job = self._running.pop(pid)
+
+            exit_code = os.waitstatus_to_exitcode(status)
+            if exit_code != 0:
+                self._failed += 1
+            result = {
+                "name": job.name,
+                "pid": pid,
+                "exit_code": exit_code,
+                "wall": time.perf_counter() - job.forked,
+                "setup_time": self.setup_time,
+                "fork_time": job.fork_time,
+                "startup_saved": self.setup_time - job.fork_time,
+            }
+            self._saved += result["startup_saved"]
+            self._results.write(json.dumps(result) + "\n")
+            self._results.flush()
+            self._reply(job.conn, result)
+            if job.conn is not None and job.conn not in self._buffers:
+                if not any(other.conn is job.conn for other in self._jobs()):
+                    job.conn.close()
+
+    def serve(self) -> Dict:
+        """Serve jobs. Returns the job in each child; the server itself
+        exits once it is shut down and all of its jobs are done."""
+        import m5
+
+        self.setup_time = time.perf_counter() - self._start
+        inform(
+            f"Fork server ready after {self.setup_time:.3f}s at "
+            f"{self.point}, serving jobs from {self._source}"
+        )
+
+        self._results = open(
+            os.path.join(m5.options.outdir, "fork-server.jsonl"), "a"
+        )
+        self._open()
+        while not self._shutdown or self._pending or self._running:
+            while self._pending and len(self._running) < self._workers:
+                job = self._pending.pop(0)
+                if self._fork(job):
+                    self._results.close()
+                    return job.spec
+            if self._selector is not None and not self._shutdown:
+                self._poll_sockets(0.05)
+            else:
+                time.sleep(0.01)
+            self._reap()
+
+        self._close()
+        if self._source.startswith("unix:"):
+            os.unlink(self._source[len("unix:") :])
+        self._results.close()
+        inform(
+            f"Fork server done: {self._job_count} jobs, {self._failed} "
+            f"failed, {self._saved:.3f}s of start-up saved"
+        )
+        sys.stdout.flush()
+        sys.stderr.flush()
+        sys.exit(1 if self._failed else 0)
+
+
+def enable(source: str, point: str = "after-instantiate", workers: int = 1):
+    """Serve jobs from `source` (a job file or unix:PATH) once the config
+    script reaches `point`, running up to `workers` jobs at once."""
+    global _server
+    _server = ForkServer(source, point, workers)
+
+
+def enabled() -> bool:
+    return _server is not None
+
+
+def fork_point(point: str) -> None:
+    """Called by m5.instantiate() at each fork point. In fork-server mode,
+    this only returns in the child process of a job."""
+    global _job, _server
+    if _server is None or _server.point != point:
+        return
+
+    server = _server
+    _server = None
+    _job = server.serve()
+
+    if "argv" in _job:
+        sys.argv = [str(arg) for arg in _job["argv"]]
+    for key, value in _job.get("env", {}).items():
+        os.environ[key] = str(value)
+    for hook in _job_hooks:
+        hook(_job)
+
+
+def add_job_hook(hook: Callable[[Dict], None]) -> None:
+    """Call `hook` with the job in each child, at the fork point. Hooks
+    must be added before the fork point (e.g., before m5.instantiate())."""
+    _job_hooks.append(hook)
+
+
+def current_job() -> Optional[Dict]:
+    """The job run by this process, or None if not a fork-server child."""
+    return _job
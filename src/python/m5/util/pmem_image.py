@@ -0,0 +1,367 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Reads and writes the memory images of checkpoints, in the single gzip
+stream format or in the blocked format of ``mem/pmem_image.hh``. Blocked
+images are cut in blocks compressed independently (with zlib, zstd or not
+at all), the blocks which are zero are not stored, and an index at the end
+of the file locates the stored blocks, so any part of an image can be read
+without reading the rest. zstd requires the ``zstandard`` module.
+"""
+
+import functools
+import gzip
+import os
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    BinaryIO,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+MAGIC = b"gem5pmem"
+VERSION = 1
+CODECS = ("none", "zlib", "zstd")
+DEFAULT_BLOCK_SIZE = 256 * 1024
+
+# See PmemImageHeader and PmemImageIndexEntry.
+_HEADER = struct.Struct("<8sIIQQQQ")
+_ENTRY = struct.Struct("<QQII")
+_RAW = 1
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError("zstd memory images require the zstandard module")
+    return zstandard
+
+
+def is_pmem_image(path: str) -> bool:
+    """Whether a file is a memory image in the blocked format."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class PmemImage:
+    """A memory image in the blocked format, opened for reading."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        (
+            magic,
+            version,
+            codec,
+            self.block_size,
+            self.size,
+            index_offset,
+            blocks,
+        ) = _HEADER.unpack(self._file.read(_HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"'{path}' is not a memory image")
+        if version != VERSION:
+            raise ValueError(
+                f"Memory image '{path}' has unsupported version {version}"
+            )
+        if codec >= len(CODECS):
+            raise ValueError(f"Memory image '{path}' has unknown codec")
+        self.codec = CODECS[codec]
+        if self.codec == "zstd":
+            self._zstd = _zstd().ZstdDecompressor()
+
+        self._file.seek(index_offset)
+        data = self._file.read(blocks * _ENTRY.size)
+        # Block number -> (offset, length, flags)
+        self.index = {
+            block: (offset, length, flags)
+            for block, offset, length, flags in _ENTRY.iter_unpack(data)
+        }
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def num_blocks(self) -> int:
+        return -(-self.size // self.block_size)
+
+    def _block_length(self, block: int) -> int:
+        return min(self.block_size, self.size - block * self.block_size)
+
+    def _read_stored(self, block: int) -> bytes:
+        offset, length, flags = self.index[block]
+        data = os.pread(self._file.fileno(), length, offset)
+        if flags & _RAW:
+            return data
+        if self.codec == "zlib":
+            return zlib.decompress(data)
+        return self._zstd.decompress(
+            data, max_output_size=self._block_length(block)
+        )
+
+    def read_block(self, block: int) -> bytes:
+        """Read one block. Blocks which are not stored are zeros."""
+        if not 0 <= block < self.num_blocks:
+            raise IndexError(f"Block {block} is out of '{self.path}'")
+        if block not in self.index:
+            return bytes(self._block_length(block))
+        return self._read_stored(block)
+
+    def read(self, offset: int, size: int) -> bytes:
+        """Read `size` bytes at `offset`, only reading the blocks
+        covering them."""
+        size = max(min(size, self.size - offset), 0)
+        out = bytearray()
+        block = offset // self.block_size
+        skip = offset - block * self.block_size
+        while len(out) < size:
+            out += self.read_block(block)[skip : skip + size - len(out)]
+            block += 1
+            skip = 0
+        return bytes(out)
+
+    def stored_blocks(
+        self, threads: Optional[int] = None
+    ) -> Iterator[Tuple[int, bytes]]:
+        """The stored blocks, in order, decompressed by a pool of
+        threads."""
+        blocks = sorted(self.index)
+        with ThreadPoolExecutor(threads or os.cpu_count()) as pool:
+            yield from zip(blocks, pool.map(self._read_stored, blocks))
+
+    def write_to(self, out: BinaryIO, threads: Optional[int] = None):
+        """Write the whole image to a seekable binary file, leaving the
+        blocks which are not stored as holes."""
+        start = out.tell()
+        end = start
+        for block, data in self.stored_blocks(threads):
+            out.seek(start + block * self.block_size)
+            out.write(data)
+            end = out.tell()
+        if end < start + self.size:
+            # Extend the file up to the end of the image.
+            out.seek(start + self.size - 1)
+            out.write(b"\0")
+
+
+def _compress(codec: str, level: int, data: bytes) -> Tuple[bytes, int]:
+    if data.count(0) == len(data):
+        return b"", 0
+    if codec == "zlib":
+        compressed = zlib.compress(data, level or 1)
+    elif codec == "zstd":
+        compressed = _zstd().ZstdCompressor(level=level or 3).compress(data)
+    else:
+        compressed = data
+    if len(compressed) >= len(data):
+        return data, _RAW
+    return compressed, 0
+
+
+def write_image(
+    path: str,
+    image: BinaryIO,
+    codec: str = "zlib",
+    level: int = 0,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    threads: Optional[int] = None,
+) -> int:
+    """
+    Write an image read from a binary file object in the blocked format.
+
+    :param codec: none, zlib or zstd.
+    :param level: The compression level, 0 for a fast default.
+    :param threads: The number of threads compressing blocks (default: one
+                    per CPU).
+    :returns: The size of the image.
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Unknown memory image codec '{codec}'")
+    threads = threads or os.cpu_count() or 1
+
+    index = []
+    size = 0
+    block = 0
+    with open(path, "wb") as out, ThreadPoolExecutor(threads) as pool:
+        offset = _HEADER.size
+        while True:
+            batch = []
+            for _ in range(threads * 4):
+                data = image.read(block_size)
+                if not data:
+                    break
+                batch.append(data)
+            if not batch:
+                break
+
+            compressed = pool.map(
+                functools.partial(_compress, codec, level), batch
+            )
+            for data, (stored, flags) in zip(batch, compressed):
+                if stored:
+                    if codec == "none":
+                        offset = -(-offset // block_size) * block_size
+                    out.seek(offset)
+                    out.write(stored)
+                    index.append((block, offset, len(stored), flags))
+                    offset += len(stored)
+                block += 1
+                size += len(data)
+            if len(batch[-1]) < block_size:
+                break
+
+        out.seek(offset)
+        for entry in index:
+            out.write(_ENTRY.pack(*entry))
+        out.seek(0)
+        out.write(
+            _HEADER.pack(
+                MAGIC,
+                VERSION,
+                CODECS.index(codec),
+                block_size,
+                size,
+                offset,
+                len(index),
+            )
+        )
+    return size
+
+
+def open_image(path: str) -> BinaryIO:
+    """Open a memory image in any format as a stream of its content."""
+    if is_pmem_image(path):
+        return _BlockedReader(PmemImage(path))
+    # Like gzread, read files which are not compressed as they are.
+    with open(path, "rb") as f:
+        is_gzip = f.read(2) == b"\x1f\x8b"
+    return gzip.open(path, "rb") if is_gzip else open(path, "rb")
+
+
+class _BlockedReader:
+    # A minimal sequential file object over a blocked image.
+    def __init__(self, image: PmemImage):
+        self._image = image
+        self._offset = 0
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0:
+            size = self._image.size - self._offset
+        data = self._image.read(self._offset, size)
+        self._offset += len(data)
+        return data
+
+    def close(self) -> None:
+        self._image.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def convert_checkpoint(
+    ckpt_dir: str,
+    fmt: str,
+    level: int = 0,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    threads: Optional[int] = None,
+) -> List[str]:
+    """
+    Convert the memory images of a checkpoint to another format, and update
+    their file names in its m5.cpt.
+
+    :param fmt: gzip, or the codec of the blocked format (none, zlib or
+                zstd).
+    :returns: The names of the images converted.
+    """
+    cpt = os.path.join(ckpt_dir, "m5.cpt")
+    with open(cpt) as f:
+        lines = f.readlines()
+
+    renamed = {}
+    for line in lines:
+        key, sep, name = line.partition("=")
+        name = name.strip()
+        if not sep or key.strip() != "filename" or ".pmem" not in name:
+            continue
+        path = os.path.join(ckpt_dir, name)
+        if is_pmem_image(path):
+            with PmemImage(path) as image:
+                current = image.codec
+        else:
+            current = "gzip"
+        if current == fmt:
+            continue
+
+        base = name[: name.index(".pmem")] + ".pmem"
+        new_name = base if fmt == "gzip" else base + ".blk"
+        new_path = os.path.join(ckpt_dir, new_name)
+        with open_image(path) as image:
+            if fmt == "gzip":
+                with gzip.open(
+                    new_path + ".tmp", "wb", compresslevel=level or 6
+                ) as out:
+                    while True:
+                        data = image.read(block_size)
+                        if not data:
+                            break
+                        out.write(data)
+            else:
+                write_image(
+                    new_path + ".tmp", image, fmt, level, block_size, threads
+                )
+        os.replace(new_path + ".tmp", new_path)
+        renamed[name] = new_name
+
+    if not renamed:
+        return []
+
+    with open(cpt + ".tmp", "w") as f:
+        for line in lines:
+            key, sep, name = line.partition("=")
+            if sep and key.strip() == "filename" and name.strip() in renamed:
+                line = f"filename={renamed[name.strip()]}\n"
+            f.write(line)
+    os.replace(cpt + ".tmp", cpt)
+
+    for name, new_name in renamed.items():
+        if name != new_name:
+            os.unlink(os.path.join(ckpt_dir, name))
+    return list(renamed)
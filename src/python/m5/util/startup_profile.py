@@ -0,0 +1,269 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Records where wall time goes between process start and the first simulated
+tick (enabled with ``--startup-profile``). Each phase records its wall time,
+CPU time and the change in the number of allocated Python memory blocks.
+Passes over the SimObject tree additionally record their cost per SimObject
+type. The results are written as a JSON summary and as a Chrome trace-event
+file which can be loaded into ``chrome://tracing`` or Perfetto.
+"""
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+)
+
+_profile = None
+
+
+class _Sample:
+    __slots__ = ("wall", "cpu", "blocks")
+
+    def __init__(self):
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        self.blocks = sys.getallocatedblocks()
+
+
+class StartupProfile:
+    def __init__(self, path: str):
+        self._path = path
+        self._origin = _Sample()
+        # Seconds between process start and the origin, if known.
+        self._offset = 0.0
+        self._phases = []
+        self._open = {}
+        self._written = False
+
+    def _record(
+        self,
+        name: str,
+        category: str,
+        start: _Sample,
+        end: _Sample,
+        args: Optional[Dict] = None,
+    ) -> Dict:
+        phase = {
+            "name": name,
+            "category": category,
+            "start": start.wall - self._origin.wall + self._offset,
+            "wall": end.wall - start.wall,
+            "cpu": end.cpu - start.cpu,
+            "allocated_blocks": end.blocks - start.blocks,
+        }
+        if args:
+            phase.update(args)
+        self._phases.append(phase)
+        return phase
+
+    def record_bootstrap(self) -> None:
+        """Record the time spent before the profiler was enabled, i.e. the
+        interpreter start-up and the import of the embedded modules needed by
+        m5.main. The CPU time is exact; the wall time is only available on
+        hosts that expose the process start time in /proc.
+        """
+        cpu = self._origin.cpu
+        wall = None
+        try:
+            with open("/proc/self/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            with open("/proc/uptime") as f:
+                uptime = float(f.read().split()[0])
+            started = int(fields[19]) / os.sysconf("SC_CLK_TCK")
+            wall = max(uptime - started, cpu)
+            self._offset = wall
+        except (OSError, ValueError, IndexError):
+            pass
+
+        self._phases.append(
+            {
+                "name": "bootstrap",
+                "category": "startup",
+                "start": 0.0,
+                "wall": wall,
+                "cpu": cpu,
+                "allocated_blocks": self._origin.blocks,
+            }
+        )
+
+    @contextmanager
+    def phase(self, name: str, category: str = "startup"):
+        start = _Sample()
+        try:
+            yield
+        finally:
+            self._record(name, category, start, _Sample())
+
+    def begin(self, name: str) -> None:
+        self._open[name] = _Sample()
+
+    def end(self, name: str, category: str = "startup") -> None:
+        start = self._open.pop(name, None)
+        if start is not None:
+            self._record(name, category, start, _Sample())
+
+    def for_each(
+        self, name: str, objects: Iterable, call: Callable[[object], None]
+    ) -> None:
+        """Apply `call` to every object, recording the cost per type."""
+        per_type = {}
+        start = _Sample()
+        for obj in objects:
+            before = _Sample()
+            call(obj)
+            after = _Sample()
+            stat = per_type.setdefault(type(obj).__name__, [0, 0.0, 0.0, 0])
+            stat[0] += 1
+            stat[1] += after.wall - before.wall
+            stat[2] += after.cpu - before.cpu
+            stat[3] += after.blocks - before.blocks
+
+        types = {
+            type_name: {
+                "count": count,
+                "wall": wall,
+                "cpu": cpu,
+                "allocated_blocks": blocks,
+            }
+            for type_name, (count, wall, cpu, blocks) in sorted(
+                per_type.items(), key=lambda item: -item[1][1]
+            )
+        }
+        self._record(name, "instantiate", start, _Sample(), {"types": types})
+
+    def _trace_events(self) -> List[Dict]:
+        pid = os.getpid()
+        events = []
+        for phase in self._phases:
+            if phase["wall"] is None:
+                continue
+            events.append(
+                {
+                    "name": phase["name"],
+                    "cat": phase["category"],
+                    "ph": "X",
+                    "ts": phase["start"] * 1e6,
+                    "dur": phase["wall"] * 1e6,
+                    "pid": pid,
+                    "tid": 0,
+                    "args": {
+                        "cpu": phase["cpu"],
+                        "allocated_blocks": phase["allocated_blocks"],
+                    },
+                }
+            )
+        return events
+
+    def write(self) -> None:
+        if self._written:
+            return
+        self._written = True
+
+        with open(self._path, "w") as f:
+            json.dump({"phases": self._phases}, f, indent=4)
+
+        root, _ = os.path.splitext(self._path)
+        with open(f"{root}.trace.json", "w") as f:
+            json.dump({"traceEvents": self._trace_events()}, f)
+
+
+def enable(path: str) -> None:
+    """Start profiling and write the results to `path` (JSON) and to
+    `path` with a `.trace.json` suffix (Chrome trace events)."""
+    global _profile
+    _profile = StartupProfile(path)
+    _profile.record_bootstrap()
+    _profile_imports()
+
+    import atexit
+
+    atexit.register(write)
+
+
+def enabled() -> bool:
+    return _profile is not None
+
+
+def _profile_imports() -> None:
+    # Time the execution of every module loaded from the embedded importer.
+    try:
+        import importer
+    except ImportError:
+        return
+
+    exec_module = importer.ByteCodeLoader.exec_module
+
+    def timed_exec_module(loader, module):
+        with phase(module.__name__, "import"):
+            exec_module(loader, module)
+
+    importer.ByteCodeLoader.exec_module = timed_exec_module
+
+
+@contextmanager
+def phase(name: str, category: str = "startup"):
+    if _profile is None:
+        yield
+    else:
+        with _profile.phase(name, category):
+            yield
+
+
+def begin(name: str) -> None:
+    if _profile is not None:
+        _profile.begin(name)
+
+
+def end(name: str) -> None:
+    if _profile is not None:
+        _profile.end(name)
+
+
+def for_each(
+    name: str, objects: Iterable, call: Callable[[object], None]
+) -> None:
+    """Apply `call` to each object. When profiling, also record the time
+    and allocations of this pass broken down by object type."""
+    if _profile is None:
+        for obj in objects:
+            call(obj)
+    else:
+        _profile.for_each(name, objects, call)
+
+
+def write() -> None:
+    if _profile is not None:
+        _profile.write()
@@ -109,6 +109,10 @@ pybind_init_event(py::module_ &m_native)
           py::arg("ticks") = MaxTick);
     m.def("setMaxTick", &set_max_tick, py::arg("tick"));
     m.def("getMaxTick", &get_max_tick, py::return_value_policy::copy);
+    m.def("registerExitCause", &registerExitCause);
+    m.def("setCoalescedExits", &set_coalesced_exits,
+          py::arg("cause_ids"), py::arg("max_batch"));
+    m.def("takeCoalescedExits", &take_coalesced_exits);
     m.def("terminateEventQueueThreads", &terminateEventQueueThreads);
     m.def("exitSimLoop", &exitSimLoop);
     m.def("getEventQueue", []() { return curEventQueue(); },
@@ -138,6 +142,7 @@ pybind_init_event(py::module_ &m_native)
                m, "GlobalSimLoopExitEvent")
         .def("getCause", &GlobalSimLoopExitEvent::getCause)
         .def("getCode", &GlobalSimLoopExitEvent::getCode)
+        .def("getCauseId", &GlobalSimLoopExitEvent::getCauseId)
         ;
 
     // Event base class. These should never be returned directly to
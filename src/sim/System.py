@@ -104,6 +104,33 @@ class System(SimObject):
         "shared_backstore is non-empty.",
     )
 
+    # Memory images are written as a single gzip stream by default. The
+    # blocked format (see mem/pmem_image.hh) compresses blocks in
+    # parallel, skips the blocks which are zero and can be read back in
+    # parallel or, uncompressed, mapped in memory. Both are read back
+    # whatever the format set here.
+    checkpoint_memory_format = Param.String(
+        "gzip",
+        "Format of the memory images in checkpoints: gzip, or the blocked "
+        "format compressed with zlib, zstd or none",
+    )
+    checkpoint_memory_block_size = Param.MemorySize(
+        "256KiB", "Size of the blocks of blocked memory images"
+    )
+    checkpoint_memory_level = Param.Int(
+        0, "Compression level of blocked memory images (0: a fast default)"
+    )
+    checkpoint_memory_threads = Param.Unsigned(
+        0,
+        "Number of threads compressing and decompressing blocked memory "
+        "images (0: one per host thread)",
+    )
+    checkpoint_memory_mmap = Param.Bool(
+        False,
+        "Restore uncompressed blocked memory images by mapping them in "
+        "memory, copy on write, so pages are only read when first touched",
+    )
+
     cache_line_size = Param.Unsigned(64, "Cache line size in bytes")
 
     redirect_paths = VectorParam.RedirectPath([], "Path redirections")
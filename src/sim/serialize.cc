@@ -49,6 +49,7 @@
 #include <cassert>
 #include <cerrno>
 
+#include "base/logging.hh"
 #include "base/trace.hh"
 #include "debug/Checkpoint.hh"
 
@@ -59,6 +60,8 @@ int ckptMaxCount = 0;
 int ckptCount = 0;
 int ckptPrevCount = -1;
 std::stack<std::string> Serializable::path;
+std::ostream *Serializable::indexedStream = nullptr;
+std::vector<std::pair<std::string, std::streamoff>> Serializable::sections;
 
 /////////////////////////////
 
@@ -98,6 +101,48 @@ Serializable::generateCheckpointOut(const std::string &cpt_dir,
     if (!outstream)
         fatal("Unable to open file %s for writing\n", cpt_file.c_str());
     outstream << "## checkpoint generated: " << ctime(&t);
+
+    indexedStream = &outstream;
+    sections.clear();
+}
+
+void
+Serializable::writeCheckpointIndex(std::ofstream &outstream)
+{
+    assert(indexedStream == &outstream);
+    indexedStream = nullptr;
+
+    std::streamoff size = outstream.tellp();
+    outstream.close();
+
+    std::string cpt_file = CheckpointIn::dir() + CheckpointIn::baseFilename;
+    std::string index_file = cpt_file + ".idx";
+    struct stat st;
+    std::ofstream index;
+    if (stat(cpt_file.c_str(), &st) == 0)
+        index.open(index_file.c_str());
+    if (!index) {
+        warn("Unable to write checkpoint index %s\n", index_file);
+        sections.clear();
+        return;
+    }
+
+#if defined(__APPLE__)
+    const struct timespec &mtime = st.st_mtimespec;
+#else
+    const struct timespec &mtime = st.st_mtim;
+#endif
+    // The size and modification time (in ns) of the cpt file let readers
+    // detect a stale index.
+    index << "gem5-cpt-index 2 " << size << " " <<
+        uint64_t(mtime.tv_sec) * 1000000000 + mtime.tv_nsec << "\n";
+    for (size_t i = 0; i < sections.size(); ++i) {
+        std::streamoff end = i + 1 < sections.size() ?
+            sections[i + 1].second : size;
+        index << sections[i].second << " " << end - sections[i].second <<
+            " " << sections[i].first << "\n";
+    }
+    sections.clear();
 }
 
 Serializable::ScopedCheckpointSection::~ScopedCheckpointSection()
@@ -123,6 +168,11 @@ Serializable::ScopedCheckpointSection::nameOut(CheckpointOut &cp)
 {
     DPRINTF(Checkpoint, "ScopedCheckpointSection::nameOut: %s\n",
             Serializable::currentSection());
+    if (&cp == indexedStream) {
+        // The header starts after the newline.
+        sections.emplace_back(Serializable::currentSection(),
+                              cp.tellp() + std::streamoff(1));
+    }
     cp << "\n[" << Serializable::currentSection() << "]\n";
 }
 
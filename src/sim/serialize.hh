@@ -54,6 +54,7 @@
 #include <string>
 #include <type_traits>
 #include <unordered_map>
+#include <utility>
 #include <vector>
 
 #include "base/inifile.hh"
@@ -311,8 +312,27 @@ class Serializable
     static void generateCheckpointOut(const std::string &cpt_dir,
         std::ofstream &outstream);
 
+    /**
+     * Write the index of the sections of a checkpoint file, next to it
+     * (m5.cpt.idx). The index lists, for each section header, the offset
+     * and length of the section in the file, so tools can read a section
+     * without parsing the whole file. The size and modification time of
+     * the cpt file are recorded so readers can detect a stale index, so
+     * the cpt file is closed first.
+     *
+     * @param outstream The cpt file made by generateCheckpointOut(), once
+     *                  all the sections are written to it.
+     * @ingroup api_serialize
+     */
+    static void writeCheckpointIndex(std::ofstream &outstream);
+
   private:
     static std::stack<std::string> path;
+
+    /** The cpt file whose sections are being indexed, if any. */
+    static std::ostream *indexedStream;
+    /** The name and offset of each section header in indexedStream. */
+    static std::vector<std::pair<std::string, std::streamoff>> sections;
 };
 
 /**
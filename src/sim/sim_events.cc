@@ -43,6 +43,7 @@
 #include "sim/sim_events.hh"
 
 #include <string>
+#include <unordered_map>
 
 #include "base/callback.hh"
 #include "sim/eventq.hh"
@@ -52,19 +53,56 @@
 namespace gem5
 {
 
+namespace
+{
+
+std::unordered_map<std::string, int> &
+exitCauseIds()
+{
+    static std::unordered_map<std::string, int> ids;
+    return ids;
+}
+
+} // anonymous namespace
+
+void
+registerExitCause(const std::string &cause, int id)
+{
+    assert(id >= 0);
+    exitCauseIds()[cause] = id;
+}
+
+int
+exitCauseId(const std::string &cause)
+{
+    const auto &ids = exitCauseIds();
+    auto it = ids.find(cause);
+    return it == ids.end() ? UnknownExitCause : it->second;
+}
+
 GlobalSimLoopExitEvent::GlobalSimLoopExitEvent(Tick when,
                                                const std::string &_cause,
                                                int c, Tick r)
     : GlobalEvent(when, Sim_Exit_Pri, IsExitEvent),
-      cause(_cause), code(c), repeat(r)
+      cause(_cause), code(c), repeat(r), causeId(exitCauseId(_cause))
 {
 }
 
 GlobalSimLoopExitEvent::GlobalSimLoopExitEvent(const std::string &_cause,
                                                int c, Tick r)
     : GlobalEvent(curTick(), Minimum_Pri, IsExitEvent),
-      cause(_cause), code(c), repeat(r)
+      cause(_cause), code(c), repeat(r), causeId(exitCauseId(_cause))
+{
+}
+
+int
+GlobalSimLoopExitEvent::getCauseId() const
 {
+    // Long-lived events (e.g., the simulate() limit) may have been
+    // created before their cause was registered.
+    if (causeId == UnknownExitCause)
+        causeId = exitCauseId(cause);
+    return causeId;
 }
 
 const char *
@@ -49,6 +49,26 @@
 namespace gem5
 {
 
+/** Cause ID of exit causes which haven't been registered. */
+constexpr int UnknownExitCause = -1;
+
+/**
+ * Map an exit cause string to an integer ID. This lets the Python
+ * simulation loop dispatch exits without translating their cause
+ * strings.
+ *
+ * @param cause Exit cause string.
+ * @param id Non-negative ID to report for exits with this cause.
+ */
+void registerExitCause(const std::string &cause, int id);
+
+/**
+ * Look up the ID of an exit cause.
+ *
+ * @return The registered ID, or UnknownExitCause.
+ */
+int exitCauseId(const std::string &cause);
+
 //
 // Event to terminate simulation at a particular cycle/instruction
 //
@@ -59,6 +79,8 @@ class GlobalSimLoopExitEvent : public GlobalEvent
     std::string cause;
     int code;
     Tick repeat;
+    // ID of the cause, looked up again while it is unknown
+    mutable int causeId;
 
   public:
     GlobalSimLoopExitEvent(Tick when, const std::string &_cause, int c,
@@ -67,6 +89,7 @@ class GlobalSimLoopExitEvent : public GlobalEvent
 
     const std::string getCause() const { return cause; }
     int getCode() const { return code; }
+    int getCauseId() const;
 
     virtual void process();// process event
     virtual void clean(){};//cleaning event
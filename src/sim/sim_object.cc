@@ -143,6 +143,8 @@ SimObject::serializeAll(const std::string &cpt_dir)
         // since we are at the top level.
         obj->serializeSection(cp, obj->name());
    }
+
+    Serializable::writeCheckpointIndex(cp);
 }
 
 SimObject *
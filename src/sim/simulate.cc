@@ -42,6 +42,7 @@
 
 #include "sim/simulate.hh"
 
+#include <algorithm>
 #include <atomic>
 #include <thread>
 
@@ -63,6 +64,10 @@ Event *doSimLoop(EventQueue *);
 
 GlobalSimLoopExitEvent *simulate_limit_event = nullptr;
 
+static std::vector<int> coalescedCauses;
+static unsigned maxCoalescedExits = 1;
+static std::vector<std::pair<int, Tick>> coalescedExits;
+
 class SimulatorThreads
 {
   public:
@@ -230,24 +235,55 @@ simulate(Tick num_cycles)
         inParallelMode = true;
     }
 
-    simulatorThreads->runUntilLocalExit();
-    Event *local_event = doSimLoop(mainEventQueue[0]);
-    assert(local_event);
+    coalescedExits.clear();
+    while (true) {
+        simulatorThreads->runUntilLocalExit();
+        Event *local_event = doSimLoop(mainEventQueue[0]);
+        assert(local_event);
+
+        // locate the global exit event and return it to Python
+        BaseGlobalEvent *global_event = local_event->globalEvent();
+        assert(global_event);
+
+        global_exit_event =
+            dynamic_cast<GlobalSimLoopExitEvent *>(global_event);
+        assert(global_exit_event);
+
+        // Keep simulating past exits which are coalesced, unless this
+        // one fills the batch.
+        if (coalescedExits.size() + 1 >= maxCoalescedExits ||
+            std::find(coalescedCauses.begin(), coalescedCauses.end(),
+                      global_exit_event->getCauseId()) ==
+                coalescedCauses.end()) {
+            break;
+        }
+
+        coalescedExits.emplace_back(global_exit_event->getCauseId(),
+                                    curTick());
+        global_exit_event->clean();
+    }
 
     // Restore normal ctrl-c operation as soon as the event queue is done
     restoreSigInt();
 
     inParallelMode = false;
 
-    // locate the global exit event and return it to Python
-    BaseGlobalEvent *global_event = local_event->globalEvent();
-    assert(global_event);
+    return global_exit_event;
+}
 
-    global_exit_event =
-        dynamic_cast<GlobalSimLoopExitEvent *>(global_event);
-    assert(global_exit_event);
+void
+set_coalesced_exits(const std::vector<int> &cause_ids, unsigned max_batch)
+{
+    coalescedCauses = cause_ids;
+    maxCoalescedExits = std::max(max_batch, 1u);
+}
 
-    return global_exit_event;
+std::vector<std::pair<int, Tick>>
+take_coalesced_exits()
+{
+    std::vector<std::pair<int, Tick>> exits;
+    exits.swap(coalescedExits);
+    return exits;
 }
 
 void set_max_tick(Tick tick)
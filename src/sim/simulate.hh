@@ -38,6 +38,9 @@
  * OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
  */
 
+#include <utility>
+#include <vector>
+
 #include "base/types.hh"
 
 namespace gem5
@@ -67,6 +70,30 @@ void set_max_tick(Tick tick);
  */
 Tick get_max_tick();
 
+/**
+ * @brief Coalesce exits with the given causes.
+ *
+ * An exit whose cause ID (see registerExitCause()) is in the set is
+ * recorded and simulation continues without returning to Python,
+ * until an exit with another cause is met or max_batch exits have
+ * been seen. The recorded exits are retrieved with
+ * take_coalesced_exits().
+ *
+ * @param cause_ids Cause IDs to coalesce, empty to disable.
+ * @param max_batch Maximum number of exits handled by one return from
+ *                  simulate(), including the one returned.
+ */
+void set_coalesced_exits(const std::vector<int> &cause_ids,
+                         unsigned max_batch);
+
+/**
+ * @brief Get and clear the exits coalesced by the last simulate().
+ *
+ * @returns (cause ID, tick) of every coalesced exit, in order. The
+ *          exit returned by simulate() isn't included.
+ */
+std::vector<std::pair<int, Tick>> take_coalesced_exits();
+
 /**
  * Terminate helper threads when running in parallel mode.
  *
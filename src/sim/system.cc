@@ -187,6 +187,13 @@ System::System(const Params &p)
             "(could use StubWorkload?).", name());
     workload->setSystem(this);
 
+    memory::PmemImageOptions image_options;
+    image_options.level = p.checkpoint_memory_level;
+    image_options.blockSize = p.checkpoint_memory_block_size;
+    image_options.threads = p.checkpoint_memory_threads;
+    physmem.setImageFormat(p.checkpoint_memory_format, image_options,
+                           p.checkpoint_memory_mmap);
+
     // add self to global system list
     systemList.push_back(this);
 
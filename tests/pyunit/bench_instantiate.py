@@ -0,0 +1,87 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Times m5.instantiate() on a synthetic tree of about 100k SimObjects. Run it
+with gem5, once as is and once with ``--legacy`` (which walks the hierarchy
+again on every pass, as instantiate() did before it froze the descendant
+order) to compare the two:
+
+```sh
+build/NULL/gem5.opt tests/pyunit/bench_instantiate.py
+build/NULL/gem5.opt tests/pyunit/bench_instantiate.py --legacy
+```
+
+m5.instantiate() can only run once per process, hence the two runs.
+"""
+
+import argparse
+import sys
+import time
+
+if __name__ == "__main__":
+    print("ERROR: This file must be run from gem5.", file=sys.stderr)
+    sys.exit(1)
+
+if __name__ == "__m5_main__":
+    import m5
+    from m5.objects import (
+        Root,
+        SimObject,
+        SubSystem,
+    )
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fanout", type=int, default=10)
+    parser.add_argument("--depth", type=int, default=5)
+    parser.add_argument(
+        "--legacy",
+        action="store_true",
+        help="Walk the hierarchy on every instantiate() pass",
+    )
+    args = parser.parse_args()
+
+    if args.legacy:
+        SimObject.frozen_descendants = lambda self: tuple(self.descendants())
+
+    root = Root(full_system=False)
+    level = [root]
+    for _ in range(args.depth):
+        next_level = []
+        for parent in level:
+            for i in range(args.fanout):
+                child = SubSystem()
+                setattr(parent, f"child{i}", child)
+                next_level.append(child)
+        level = next_level
+
+    start = time.perf_counter()
+    m5.instantiate()
+    elapsed = time.perf_counter() - start
+
+    count = sum(1 for _ in root.descendants())
+    mode = "legacy" if args.legacy else "frozen"
+    print(f"{count} SimObjects, {mode}: instantiate() took {elapsed:.3f}s")
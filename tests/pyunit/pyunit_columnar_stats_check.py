@@ -0,0 +1,106 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import tempfile
+import unittest
+
+from m5.ext.pystats.columnar import (
+    ColumnarArchive,
+    ColumnarWriter,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "NumPy is required to read the archive")
+class ColumnarStatsTestSuite(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "stats.col")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _row(self, dump):
+        return {
+            "system.cpu0.ipc": 1.0 + dump,
+            "system.cpu1.ipc": 2.0 * dump,
+            "system.cpu0.numCycles": 100 * dump,
+            "system.mem.hist": [dump, dump + 1, dump + 2],
+        }
+
+    def test_round_trip(self):
+        writer = ColumnarWriter(self.path, block_rows=3)
+        for dump in range(7):
+            writer.write(self._row(dump))
+        writer.close()
+
+        archive = ColumnarArchive(self.path)
+        self.assertEqual(7, len(archive))
+        self.assertEqual(
+            [1.0 + d for d in range(7)],
+            archive.column("system.cpu0.ipc").tolist(),
+        )
+        hist = archive.column("system.mem.hist")
+        self.assertEqual((7, 3), hist.shape)
+        self.assertEqual([6, 7, 8], hist[6].tolist())
+
+    def test_find(self):
+        writer = ColumnarWriter(self.path, block_rows=2)
+        for dump in range(3):
+            writer.write(self._row(dump))
+        writer.close()
+
+        found = ColumnarArchive(self.path).find("system.cpu*.ipc")
+        self.assertEqual(["system.cpu0.ipc", "system.cpu1.ipc"], sorted(found))
+        self.assertEqual([0.0, 2.0, 4.0], found["system.cpu1.ipc"].tolist())
+
+    def test_append(self):
+        writer = ColumnarWriter(self.path)
+        writer.write(self._row(0))
+        writer.close()
+        writer = ColumnarWriter(self.path, append=True)
+        writer.write(self._row(1))
+        writer.close()
+
+        self.assertEqual(
+            [0.0, 100.0],
+            ColumnarArchive(self.path)
+            .column("system.cpu0.numCycles")
+            .tolist(),
+        )
+
+    def test_mismatched_row(self):
+        writer = ColumnarWriter(self.path)
+        writer.write(self._row(0))
+        row = self._row(1)
+        row["system.mem.hist"] = [1, 2]
+        with self.assertRaises(ValueError):
+            writer.write(row)
@@ -0,0 +1,66 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+
+from m5.objects import SimObject
+
+
+def _build_tree(fanout, depth):
+    root = SimObject()
+    level = [root]
+    for _ in range(depth):
+        next_level = []
+        for parent in level:
+            for i in range(fanout):
+                child = SimObject()
+                setattr(parent, f"child{i}", child)
+                next_level.append(child)
+        level = next_level
+    return root
+
+
+class DescendantsTestSuite(unittest.TestCase):
+    def test_same_order(self):
+        root = _build_tree(3, 3)
+        self.assertEqual(
+            list(root.descendants()), list(root.frozen_descendants())
+        )
+
+    def test_cached(self):
+        root = _build_tree(3, 3)
+        self.assertIs(root.frozen_descendants(), root.frozen_descendants())
+
+    def test_invalidated_on_mutation(self):
+        root = _build_tree(3, 2)
+        before = root.frozen_descendants()
+        root.extra = SimObject()
+        after = root.frozen_descendants()
+        self.assertEqual(len(before) + 1, len(after))
+        self.assertIn(root.extra, after)
+
+        root.clear_child("extra")
+        self.assertEqual(before, root.frozen_descendants())
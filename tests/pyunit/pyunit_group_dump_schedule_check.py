@@ -0,0 +1,111 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import m5
+import m5.stats
+from m5.objects import SimObject
+from m5.stats.gem5stats import JsonLinesOutputVisitor
+
+
+class GroupDumpScheduleTestSuite(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.url = f"jsonl://{os.path.join(self._tmp.name, 'group.jsonl')}"
+        self.root = SimObject()
+        self.queue = mock.Mock()
+        patches = [
+            mock.patch.object(m5.event, "mainq", self.queue),
+            mock.patch.object(m5.stats, "_group_dumps_started", False),
+            mock.patch.object(m5.stats, "group_dump_schedules", []),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_needs_own_output(self):
+        with self.assertRaises(SystemExit):
+            m5.stats.addGroupDumpSchedule(self.root, 100, None)
+
+        schedule = m5.stats.addGroupDumpSchedule(self.root, 100, self.url)
+        self.assertEqual([self.root], schedule.roots)
+        self.assertEqual(1, len(schedule.outputs))
+        self.assertIsInstance(schedule.outputs[0], JsonLinesOutputVisitor)
+        self.assertNotIn(schedule.outputs[0], m5.stats.outputList)
+
+    def test_bad_period(self):
+        with self.assertRaises(SystemExit):
+            m5.stats.addGroupDumpSchedule(self.root, 0, self.url)
+
+    def test_scheduled_on_start(self):
+        schedule = m5.stats.addGroupDumpSchedule(self.root, 100, self.url)
+        self.queue.schedule.assert_not_called()
+
+        with mock.patch.object(m5, "curTick", return_value=0):
+            m5.stats._startGroupDumps()
+        self.queue.schedule.assert_called_once_with(schedule, 100)
+
+    def test_start_after_restore(self):
+        # Restored at tick 1050: the next dump of a schedule starting at
+        # tick 100 with a period of 100 is at tick 1100.
+        schedule = m5.stats.addGroupDumpSchedule(self.root, 100, self.url)
+        with mock.patch.object(m5, "curTick", return_value=1050):
+            m5.stats._startGroupDumps()
+            self.queue.schedule.assert_called_once_with(schedule, 1100)
+
+            # Schedules added later start one period from now.
+            self.queue.reset_mock()
+            later = m5.stats.addGroupDumpSchedule(self.root, 40, self.url)
+            self.queue.schedule.assert_called_once_with(later, 1090)
+
+    def test_dump_and_reschedule(self):
+        schedule = m5.stats.addGroupDumpSchedule(self.root, 100, self.url)
+        with mock.patch.object(
+            m5.stats, "_prepare_groups"
+        ) as prepare, mock.patch.object(
+            m5.stats, "_dump_to_outputs"
+        ) as dump, mock.patch.object(
+            m5, "curTick", return_value=200
+        ):
+            schedule()
+        prepare.assert_called_once_with([self.root])
+        dump.assert_called_once_with(schedule.outputs, [self.root])
+        self.queue.schedule.assert_called_once_with(schedule, 300)
+
+    def test_cancel(self):
+        schedule = m5.stats.addGroupDumpSchedule(self.root, 100, self.url)
+        schedule.cancel()
+        self.assertNotIn(schedule, m5.stats.group_dump_schedules)
+        with mock.patch.object(m5, "curTick", return_value=0):
+            m5.stats._startGroupDumps()
+        self.queue.schedule.assert_not_called()
@@ -0,0 +1,173 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from m5.stats import gem5stats
+from m5.stats.gem5stats import (
+    JsonLinesOutputVisitor,
+    StatDeltas,
+)
+
+# One tick per picosecond.
+FREQUENCY = 1e12
+
+
+def _dist(buckets, total):
+    return {
+        "value": buckets,
+        "sum": total,
+        "sum_squared": total * total,
+        "underflow": 0,
+        "overflow": 0,
+        "logs": 0,
+        "min": 0,
+        "max": 10,
+        "bucket_size": 1,
+    }
+
+
+class StatDeltasTestSuite(unittest.TestCase):
+    def test_first_dump(self):
+        deltas = StatDeltas()
+        begin, changed, rates = deltas.update(
+            {"a": 10, "b": 0}, 0, 1000, FREQUENCY
+        )
+        self.assertEqual(0, begin)
+        self.assertEqual({"a": 10}, changed)
+        self.assertAlmostEqual(1e10, rates["a"], delta=1)
+
+    def test_deltas(self):
+        deltas = StatDeltas()
+        deltas.update({"a": 10, "d": _dist([1, 2], 3)}, 0, 1000, FREQUENCY)
+        begin, changed, _ = deltas.update(
+            {"a": 15, "d": _dist([1, 4], 5)}, 0, 3000, FREQUENCY
+        )
+        self.assertEqual(1000, begin)
+        self.assertEqual(5, changed["a"])
+        self.assertEqual([0, 2], changed["d"]["value"])
+        self.assertEqual(2, changed["d"]["sum"])
+        self.assertNotIn("min", changed["d"])
+
+        # Nothing changed.
+        begin, changed, rates = deltas.update(
+            {"a": 15, "d": _dist([1, 4], 5)}, 0, 4000, FREQUENCY
+        )
+        self.assertEqual(3000, begin)
+        self.assertEqual({}, changed)
+        self.assertEqual({}, rates)
+
+    def test_stat_appears_later(self):
+        deltas = StatDeltas()
+        deltas.update({"a": 10}, 0, 1000, FREQUENCY)
+        _, changed, _ = deltas.update(
+            {"a": 12, "b": 7, "d": _dist([1, 1], 2)}, 0, 2000, FREQUENCY
+        )
+        self.assertEqual(2, changed["a"])
+        self.assertEqual(7, changed["b"])
+        self.assertEqual([1, 1], changed["d"]["value"])
+
+        # And disappears again.
+        _, changed, _ = deltas.update({"b": 9}, 0, 3000, FREQUENCY)
+        self.assertEqual({"b": 2}, changed)
+
+    def test_reset(self):
+        deltas = StatDeltas()
+        deltas.update({"a": 10}, 0, 1000, FREQUENCY)
+        # Reset at tick 1500: deltas are relative to the reset.
+        begin, changed, rates = deltas.update({"a": 4}, 1500, 2000, FREQUENCY)
+        self.assertEqual(1500, begin)
+        self.assertEqual({"a": 4}, changed)
+        self.assertAlmostEqual(8e9, rates["a"], delta=1)
+
+        begin, changed, _ = deltas.update({"a": 6}, 1500, 2500, FREQUENCY)
+        self.assertEqual(2000, begin)
+        self.assertEqual({"a": 2}, changed)
+
+
+class JsonLinesModesTestSuite(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "stats.jsonl")
+        self.ticks = {"finalTick": 0, "simTicks": 0, "simFreq": FREQUENCY}
+        root = mock.Mock()
+        root.resolveStat.side_effect = lambda name: mock.Mock(
+            value=self.ticks[name]
+        )
+        patch = mock.patch.object(gem5stats, "Root")
+        patch.start().getInstance.return_value = root
+        self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _dumps(self, mode, dumps):
+        output = JsonLinesOutputVisitor(self.path, mode=mode)
+        for tick, values in dumps:
+            self.ticks["finalTick"] = tick
+            self.ticks["simTicks"] = tick
+            with mock.patch.object(
+                gem5stats, "get_stat_values", return_value=values
+            ):
+                output.dump([])
+        with open(self.path) as f:
+            return [json.loads(line) for line in f]
+
+    DUMPS = [
+        (1000, {"a": 1, "b": 2}),
+        (2000, {"a": 1, "b": 5}),
+        (3000, {"a": 3, "b": 5, "c": 1}),
+    ]
+
+    def test_absolute(self):
+        records = self._dumps("absolute", self.DUMPS)
+        self.assertEqual(
+            [{"a": 1, "b": 2}, {"b": 5}, {"a": 3, "c": 1}],
+            [record["stats"] for record in records],
+        )
+        self.assertEqual([True, False, False], [r["full"] for r in records])
+        self.assertNotIn("delta", records[0])
+
+    def test_delta(self):
+        records = self._dumps("delta", self.DUMPS)
+        self.assertNotIn("stats", records[0])
+        self.assertEqual(
+            [{"a": 1, "b": 2}, {"b": 3}, {"a": 2, "c": 1}],
+            [record["delta"] for record in records],
+        )
+        self.assertEqual(
+            [0, 1000, 2000], [r["interval_begin_time"] for r in records]
+        )
+        self.assertAlmostEqual(3e9, records[1]["rate"]["b"], delta=1)
+
+    def test_both(self):
+        records = self._dumps("both", self.DUMPS)
+        self.assertEqual({"b": 5}, records[1]["stats"])
+        self.assertEqual({"b": 3}, records[1]["delta"])
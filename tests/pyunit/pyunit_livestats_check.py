@@ -0,0 +1,87 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import tempfile
+import unittest
+from array import array
+
+from m5.ext.pystats.livestats import (
+    LiveStatsClient,
+    LiveStatsServer,
+)
+
+
+class LiveStatsTestSuite(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "stats.sock")
+        self.server = LiveStatsServer(self.path, max_buffer=4096)
+
+    def tearDown(self):
+        self.server.close()
+        self.tmpdir.cleanup()
+
+    def test_snapshots(self):
+        with LiveStatsClient(self.path, timeout=5) as client:
+            names = ("simInsts", "board.cpu.ipc")
+            self.server.publish(names, 0, 0, 100, array("d", [10, 1.5]))
+            self.server.publish(names, 1, 0, 200, array("d", [20, 1.25]))
+
+            snapshot = client.receive()
+            self.assertEqual(0, snapshot.dump)
+            self.assertEqual(100, snapshot.simulated_end_time)
+            self.assertEqual(
+                {"simInsts": 10.0, "board.cpu.ipc": 1.5}, snapshot.values
+            )
+            self.assertEqual(20.0, client.receive().values["simInsts"])
+
+    def test_slow_client(self):
+        client = LiveStatsClient(self.path, timeout=5)
+        names = tuple(f"stat{i}" for i in range(1000))
+        values = array("d", range(1000))
+        # Far more than the socket and the client's queue can hold.
+        for dump in range(100):
+            self.server.publish(names, dump, 0, dump, values)
+
+        # Snapshots were dropped rather than blocking, and the stream is
+        # still intact.
+        dumps = [client.receive().dump for _ in range(2)]
+        self.assertEqual(0, dumps[0])
+        self.assertLess(dumps[0], dumps[1])
+        self.server.close()
+        remaining = [snapshot.dump for snapshot in client]
+        self.assertLess(len(remaining) + 2, 100)
+        client.close()
+
+    def test_disconnect(self):
+        client = LiveStatsClient(self.path)
+        self.server.publish(("a",), 0, 0, 0, array("d", [1]))
+        self.assertEqual(1, self.server.clients)
+        client.close()
+        for dump in range(1, 3):
+            self.server.publish(("a",), dump, 0, 0, array("d", [1]))
+        self.assertEqual(0, self.server.clients)
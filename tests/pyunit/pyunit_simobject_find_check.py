@@ -0,0 +1,60 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+
+import unittest
+
+from m5.objects import SimObject
+
+
+def _build_tree():
+    root = SimObject()
+    root.a = SimObject()
+    root.a.x = SimObject()
+    root.b = [SimObject(), SimObject()]
+    root.b[1].y = SimObject()
+    return root
+
+
+class SimObjectFindTestSuite(unittest.TestCase):
+    def test_find_all(self):
+        root = _build_tree()
+        found, done = root.find_all(SimObject)
+        self.assertTrue(done)
+        expected = [obj for obj in root.descendants() if obj is not root]
+        self.assertEqual(
+            sorted(expected, key=lambda o: o.path()),
+            found,
+        )
+
+    def test_find_all_after_add_and_clear(self):
+        root = _build_tree()
+        before, _ = root.find_all(SimObject)
+        root.a.z = SimObject()
+        after, _ = root.find_all(SimObject)
+        self.assertEqual(len(before) + 1, len(after))
+        self.assertIn(root.a.z, after)
+
+        root.a.clear_child("z")
+        self.assertEqual(before, root.find_all(SimObject)[0])
@@ -0,0 +1,115 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+
+from m5.ext.pystats.group import (
+    Group,
+    Vector,
+)
+from m5.ext.pystats.simstat import SimStat
+from m5.ext.pystats.statistic import Scalar
+
+
+class StatIndexTestSuite(unittest.TestCase):
+    def setUp(self):
+        self.simstat = SimStat(
+            board=Group(
+                cpu0=Group(ipc=Scalar(1.0)),
+                cpu1=Group(ipc=Scalar(2.0)),
+                cpu_other=Group(ipc=Scalar(3.0)),
+                mem=Vector({"reads": Scalar(4), "writes": Scalar(5)}),
+            )
+        )
+
+    def test_children(self):
+        board = self.simstat.board
+        self.assertEqual(4, len(board.children()))
+        self.assertEqual(
+            [board.cpu0, board.cpu1],
+            board.children(lambda name: name.startswith("cpu"))[:2],
+        )
+        self.assertEqual(
+            [board.cpu0, board.cpu0.ipc],
+            board.children(recursive=True)[:2],
+        )
+        self.assertEqual(10, len(self.simstat.children(recursive=True)))
+
+    def test_find(self):
+        self.assertEqual(
+            [1.0, 2.0, 3.0], [s.value for s in self.simstat.find("ipc")]
+        )
+        self.assertEqual(2, len(self.simstat.find("cpu[0-9]")))
+        self.assertIs(self.simstat.board.cpu0, self.simstat.find("cpu")[0])
+
+    def test_mutation(self):
+        board = self.simstat.board
+        index = self.simstat.index()
+        self.assertEqual(3, len(self.simstat.find("ipc")))
+
+        board.cpu2 = Group(ipc=Scalar(4.0))
+        self.assertEqual(4, len(self.simstat.find("ipc")))
+        self.assertIsNot(index, self.simstat.index())
+        self.assertEqual(4.0, self.simstat.index().get("board.cpu2.ipc").value)
+
+        del board.cpu0
+        self.assertEqual(3, len(self.simstat.find("ipc")))
+        self.assertNotIn("board.cpu0.ipc", self.simstat.index())
+
+        # Changing a value doesn't invalidate the index.
+        index = self.simstat.index()
+        board.cpu1.ipc.value = 5.0
+        self.assertIs(index, self.simstat.index())
+
+    def test_index(self):
+        index = self.simstat.index()
+        self.assertIs(index, self.simstat.index())
+        self.assertEqual(2.0, index.get("board.cpu1.ipc").value)
+        self.assertIsNone(index.get("board.cpu2.ipc"))
+        self.assertEqual(
+            ["board.cpu0.ipc", "board.cpu1.ipc"],
+            [path for path, _ in index.glob("board.cpu[0-9].ipc")],
+        )
+        self.assertEqual(
+            ["board.mem.reads"],
+            [path for path, _ in index.regex(r".*\.(reads|foo)")],
+        )
+        self.assertEqual(
+            ["board.mem", "board.mem.reads", "board.mem.writes"],
+            [path for path, _ in index.prefix("board.mem")],
+        )
+
+    def test_index_not_serialized(self):
+        self.simstat.index()
+        self.assertEqual(
+            ["board"],
+            [
+                key
+                for key in self.simstat.to_json()
+                if key not in ("creation_time", "time_conversion")
+                and not key.startswith("simulated")
+            ],
+        )
@@ -0,0 +1,110 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import io
+import json
+import math
+import unittest
+
+from m5.ext.pystats.group import (
+    Group,
+    Vector,
+)
+from m5.ext.pystats.simstat import SimStat
+from m5.ext.pystats.statistic import (
+    Distribution,
+    Scalar,
+)
+from m5.ext.pystats.streamloader import (
+    load_compact,
+    load_dumps,
+)
+
+
+def make_simstat(tick: int) -> SimStat:
+    return SimStat(
+        simulated_begin_time=0,
+        simulated_end_time=tick,
+        board=Group(
+            cpu0=Group(
+                ipc=Scalar(tick * 1.5, description='"quoted" {brackets}'),
+                numCycles=Scalar(tick * 100),
+            ),
+            cpu1=Group(ipc=Scalar(float("nan"))),
+            mem=Vector({"reads": Scalar(tick), "writes": Scalar(2)}),
+            latency=Distribution(
+                value=[1, 2, 3],
+                min=0,
+                max=3,
+                num_bins=3,
+                bin_size=1,
+                sum=6,
+            ),
+        ),
+    )
+
+
+class StreamLoaderTestSuite(unittest.TestCase):
+    def setUp(self):
+        # A single dump followed by an array of two dumps.
+        self.text = (
+            json.dumps(make_simstat(1).to_json(), indent=4)
+            + "\n"
+            + json.dumps(
+                [make_simstat(2).to_json(), make_simstat(3).to_json()]
+            )
+        )
+
+    def test_all_stats(self):
+        # Small chunks split tokens across reads.
+        for chunk_size in (1, 7, 1 << 20):
+            dumps = list(
+                load_dumps(io.StringIO(self.text), chunk_size=chunk_size)
+            )
+            self.assertEqual([1, 2, 3], [d.simulated_end_time for d in dumps])
+            self.assertEqual(4.5, dumps[2]["board.cpu0.ipc"])
+            self.assertTrue(math.isnan(dumps[0]["board.cpu1.ipc"]))
+            self.assertEqual(3.0, dumps[2]["board.mem.reads"])
+            self.assertEqual(0.0, dumps[0]["board.latency.min"])
+            self.assertEqual([1.0, 2.0, 3.0], list(dumps[0]["board.latency"]))
+            # Dumps with the same stats share their names.
+            self.assertIs(dumps[1].names, dumps[2].names)
+
+    def test_projection(self):
+        dump = load_compact(
+            io.StringIO(self.text), paths=["board.cpu*.ipc", "board.mem"]
+        )
+        self.assertEqual(
+            [
+                "board.cpu0.ipc",
+                "board.cpu1.ipc",
+                "board.mem.reads",
+                "board.mem.writes",
+            ],
+            [name for name, _ in dump.items()],
+        )
+        self.assertNotIn("board.cpu0.numCycles", dump)
+        self.assertEqual({"board.cpu0.ipc": 1.5}, dump.find("board.cpu0.*"))
@@ -0,0 +1,138 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import io
+import json
+import unittest
+
+from m5.ext.pystats.compare import (
+    StatsComparison,
+    load_stats_dumps,
+)
+
+
+def stats_txt(dumps) -> io.StringIO:
+    lines = []
+    for stats in dumps:
+        lines.append("")
+        lines.append("---------- Begin Simulation Statistics ----------")
+        for name, value in stats.items():
+            lines.append(f"{name}    {value}    # A stat (Count)")
+        lines.append("")
+        lines.append("---------- End Simulation Statistics   ----------")
+    return io.StringIO("\n".join(lines) + "\n")
+
+
+BASE = {
+    "finalTick": 1000,
+    "simTicks": 1000,
+    "hostSeconds": 1.5,
+    "board.cpu.numCycles": 1000,
+    "board.cpu.ipc": 1.25,
+    "board.mem.reads::total": 400,
+}
+
+
+class StatsComparisonTestSuite(unittest.TestCase):
+    def compare(self, left, right, **kwargs) -> StatsComparison:
+        comparison = StatsComparison(**kwargs)
+        comparison.compare_streams(
+            load_stats_dumps(stats_txt(left)),
+            load_stats_dumps(stats_txt(right)),
+        )
+        return comparison
+
+    def test_identical(self):
+        new = dict(BASE, hostSeconds=3.0)
+        comparison = self.compare([BASE, BASE], [new, new])
+        self.assertTrue(comparison.passed)
+        self.assertEqual(2, comparison.dumps)
+        self.assertEqual(10, comparison.compared)
+
+    def test_tolerances(self):
+        new = dict(BASE)
+        new["board.cpu.numCycles"] = 1010
+        new["board.cpu.ipc"] = 1.3
+        comparison = self.compare([BASE], [new], top=1)
+        self.assertEqual(2, comparison.divergent)
+        # The largest relative divergence is reported first.
+        self.assertEqual(["board.cpu.ipc"], [d.path for d in comparison.top()])
+
+        comparison = self.compare(
+            [BASE],
+            [new],
+            rel_tol=0.02,
+            tolerances=[("board.cpu.ipc", 0.1, 0.0)],
+        )
+        self.assertTrue(comparison.passed)
+
+        comparison = self.compare(
+            [BASE], [new], rel_tol=0.02, sort_by="absolute"
+        )
+        self.assertEqual(["board.cpu.ipc"], [d.path for d in comparison.top()])
+
+    def test_missing(self):
+        new = dict(BASE)
+        del new["board.mem.reads::total"]
+        new["board.mem.writes::total"] = 3
+        comparison = self.compare([BASE, BASE], [new])
+        self.assertEqual(2, comparison.missing)
+        self.assertEqual(1, comparison.missing_dumps)
+        self.assertFalse(comparison.passed)
+        self.assertEqual(
+            {
+                ("board.mem.reads::total", 400.0, None),
+                ("board.mem.writes::total", None, 3.0),
+            },
+            {(d.path, d.left, d.right) for d in comparison.top()},
+        )
+
+    def test_json(self):
+        def simstat(ipc, buckets):
+            return {
+                "simulated_end_time": 1000,
+                "board": {
+                    "type": "Group",
+                    "ipc": {"type": "Scalar", "value": ipc},
+                    "latency": {
+                        "type": "Distribution",
+                        "value": buckets,
+                        "min": 0,
+                        "max": 3,
+                    },
+                },
+            }
+
+        left = io.StringIO(json.dumps(simstat(1.0, [1, 2, 3])))
+        right = io.StringIO(json.dumps(simstat(1.0, [1, 5, 3])))
+        comparison = StatsComparison()
+        comparison.compare_streams(
+            load_stats_dumps(left), load_stats_dumps(right)
+        )
+        self.assertEqual(
+            [("board.latency[1]", 2.0, 5.0)],
+            [(d.path, d.left, d.right) for d in comparison.top()],
+        )
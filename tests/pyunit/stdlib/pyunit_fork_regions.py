@@ -0,0 +1,136 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import m5
+
+from gem5.simulate.simulator import Simulator
+
+
+class ForkRegionsTestSuite(unittest.TestCase):
+    """Tests the Simulator.fork_regions() pool, with m5.fork stubbed."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.outdir = self._tmp.name
+        # fork_regions() only needs the simulator to be instantiated.
+        self.simulator = Simulator.__new__(Simulator)
+        self.forks = []
+        patches = [
+            mock.patch.object(m5.options, "outdir", self.outdir),
+            mock.patch.object(m5, "fork", self._fork),
+            mock.patch.object(m5, "listenersDisabled", lambda: True),
+            mock.patch.object(Simulator, "_instantiate", lambda self: None),
+            mock.patch.object(
+                Simulator, "_run_forked_region", self._run_forked_region
+            ),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _fork(self, simout):
+        self.forks.append(simout)
+        pid = os.fork()
+        if pid == 0:
+            m5.options.outdir = simout % {
+                "parent": self.outdir,
+                "fork_seq": len(self.forks) - 1,
+                "pid": os.getpid(),
+            }
+        return pid
+
+    @staticmethod
+    def _run_forked_region(
+        simulator, name, setup, result_path, reset_stats, max_ticks
+    ):
+        # Never return to the test runner in the child.
+        exit_code = 1
+        try:
+            exit_code, delay = setup(simulator)
+            time.sleep(delay)
+            with open(result_path, "w") as f:
+                json.dump({"outdir": m5.options.outdir}, f)
+        finally:
+            os._exit(exit_code)
+
+    def test_results(self):
+        regions = {
+            "slow": lambda _: (0, 0.2),
+            "fails": lambda _: (3, 0),
+            "100%": lambda _: (0, 0),
+        }
+        results = self.simulator.fork_regions(regions, max_workers=2)
+
+        self.assertEqual(list(regions), list(results))
+        self.assertEqual(0, results["slow"]["exit_code"])
+        self.assertEqual(3, results["fails"]["exit_code"])
+        self.assertEqual(
+            os.path.join(self.outdir, "100%"), results["100%"]["outdir"]
+        )
+        self.assertEqual(
+            {".slow.region.json", ".fails.region.json", ".100%.region.json"}
+            & set(os.listdir(self.outdir)),
+            set(),
+        )
+
+    def test_missing_result(self):
+        def setup(_):
+            os._exit(5)
+
+        results = self.simulator.fork_regions({"crash": setup})
+        self.assertEqual(5, results["crash"]["exit_code"])
+        self.assertIn("error", results["crash"])
+
+    def test_other_children(self):
+        # A child which is not a region exits first; its status is left
+        # to its owner.
+        other = os.fork()
+        if other == 0:
+            os._exit(7)
+        results = self.simulator.fork_regions(
+            {f"region{i}": lambda _: (0, 0.1) for i in range(3)},
+            max_workers=1,
+        )
+        self.assertEqual(3, len(results))
+        pid, status = os.waitpid(other, 0)
+        self.assertEqual(other, pid)
+        self.assertEqual(7, os.waitstatus_to_exitcode(status))
+
+    def test_invalid_names(self):
+        for name in ("../x", "a/b", "", ".."):
+            with self.assertRaises(ValueError):
+                self.simulator.fork_regions({name: lambda _: (0, 0)})
+        self.assertEqual([], self.forks)
@@ -0,0 +1,66 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import math
+import statistics
+import unittest
+
+from gem5.simulate.sampling import SampleStatistics
+
+
+class SampleStatisticsTestSuite(unittest.TestCase):
+    """Tests the simulate.sampling.SampleStatistics class."""
+
+    def test_moments(self):
+        values = [1.5, 2.0, 2.5, 1.0, 3.0, 2.25]
+        stats = SampleStatistics(confidence=0.95)
+        for value in values:
+            stats.add(value)
+
+        self.assertEqual(len(values), len(stats))
+        self.assertAlmostEqual(statistics.mean(values), stats.mean())
+        self.assertAlmostEqual(statistics.stdev(values), stats.stdev())
+
+    def test_confidence_interval(self):
+        stats = SampleStatistics(confidence=0.95)
+        for value in (9.0, 11.0) * 8:
+            stats.add(value)
+
+        half_width = 1.959964 * statistics.stdev((9.0, 11.0) * 8) / 4
+        low, high = stats.confidence_interval()
+        self.assertAlmostEqual(10.0 - half_width, low, places=5)
+        self.assertAlmostEqual(10.0 + half_width, high, places=5)
+        self.assertAlmostEqual(half_width / 10.0, stats.relative_error())
+
+    def test_too_few_samples(self):
+        stats = SampleStatistics()
+        self.assertTrue(math.isnan(stats.relative_error()))
+        stats.add(1.0)
+        self.assertTrue(math.isnan(stats.relative_error()))
+
+    def test_invalid_confidence(self):
+        with self.assertRaises(ValueError):
+            SampleStatistics(confidence=1.0)
@@ -0,0 +1,128 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import contextlib
+import csv
+import importlib.util
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+_SCRIPT = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "..",
+    "..",
+    "util",
+    "aggregate-stats.py",
+)
+_spec = importlib.util.spec_from_file_location("aggregate_stats", _SCRIPT)
+aggregate_stats = importlib.util.module_from_spec(_spec)
+# The worker processes look the module up by name.
+sys.modules["aggregate_stats"] = aggregate_stats
+_spec.loader.exec_module(aggregate_stats)
+
+
+class AggregateStatsTestSuite(unittest.TestCase):
+    """Test cases for util/aggregate-stats.py"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        aggregate_stats.make_synthetic_corpus(
+            self.root, runs=3, stats=20, dumps=2
+        )
+        self.files = aggregate_stats.find_stats_files([self.root])
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _aggregate(self, stats, dump):
+        return list(aggregate_stats.aggregate(self.files, stats, dump, 1))
+
+    def test_dumps(self):
+        first = self._aggregate(["simInsts"], "first")
+        self.assertEqual(
+            [0.0, 1000.0, 2000.0], [row["simInsts"] for _, row, _ in first]
+        )
+        for dump in ("last", "-1", "1"):
+            last = self._aggregate(["simInsts"], dump)
+            self.assertEqual(
+                [1.0, 1001.0, 2001.0],
+                [row["simInsts"] for _, row, _ in last],
+            )
+        all_dumps = self._aggregate(["simSeconds"], "all")
+        self.assertEqual(
+            {"0:simSeconds": 0.001, "1:simSeconds": 0.002}, all_dumps[0][1]
+        )
+
+        missing = self._aggregate(["simInsts"], "2")
+        self.assertTrue(all(row is None for _, row, _ in missing))
+        self.assertIn("no dump 2", missing[0][2])
+
+    def test_patterns(self):
+        _, row, error = self._aggregate(
+            ["board.processor.cores0.core.*", "simInsts"], "first"
+        )[1]
+        self.assertIsNone(error)
+        self.assertEqual(1.5 - 1 / 6, row["board.processor.cores0.core.ipc"])
+        self.assertIn("board.processor.cores0.core.stat0", row)
+        self.assertNotIn("board.processor.cores1.core.stat1", row)
+        self.assertEqual(1000.0, row["simInsts"])
+
+    def test_invalid_dump(self):
+        with self.assertRaises(ValueError):
+            self._aggregate(["simInsts"], "penultimate")
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr), self.assertRaises(
+            SystemExit
+        ) as cm:
+            aggregate_stats.main(
+                [self.root, "-s", "simInsts", "--dump", "penultimate"]
+            )
+        self.assertEqual(2, cm.exception.code)
+        self.assertIn("invalid dump 'penultimate'", stderr.getvalue())
+
+    def test_csv(self):
+        output = os.path.join(self.root, "results.csv")
+        with contextlib.redirect_stderr(io.StringIO()):
+            status = aggregate_stats.main(
+                [self.root, "-s", "simInsts", "-j", "2", "-o", output]
+            )
+        self.assertEqual(0, status)
+        with open(output, newline="") as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(["run", "simInsts"], rows[0])
+        self.assertEqual(
+            [
+                ["m5out-00000", "1.0"],
+                ["m5out-00001", "1001.0"],
+                ["m5out-00002", "2001.0"],
+            ],
+            rows[1:],
+        )
@@ -0,0 +1,129 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import tempfile
+import unittest
+
+from m5.util import checkpoint_index
+
+CPT = """
+[Globals]
+curTick=1000
+version_tags=a b
+
+[system.cpu]
+instCnt=42
+
+[system.cpu.xc.0]
+_pc=0x400000
+regs=1 2 3
+
+[system.cpu]
+_status=1
+
+[system.mem_ctrl]
+lastStatsResetTick=0
+"""
+
+
+class CheckpointIndexTestSuite(unittest.TestCase):
+    """Test cases for the checkpoint section index"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.ckpt_dir = self._tmp.name
+        self.path = os.path.join(self.ckpt_dir, "m5.cpt")
+        with open(self.path, "w") as f:
+            f.write(CPT)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_build_on_first_access(self):
+        self.assertFalse(os.path.exists(self.path + ".idx"))
+        with checkpoint_index.CheckpointIndex(self.ckpt_dir) as cpt:
+            self.assertEqual(cpt.get("Globals", "curTick"), "1000")
+            self.assertEqual(
+                cpt.sections(),
+                [
+                    "Globals",
+                    "system.cpu",
+                    "system.cpu.xc.0",
+                    "system.mem_ctrl",
+                ],
+            )
+        spans = checkpoint_index.read_index(self.path)
+        self.assertEqual(spans, checkpoint_index.build_index(self.path))
+        with open(self.path, "rb") as f:
+            data = f.read()
+        for offset, length, name in spans:
+            self.assertTrue(data[offset:].startswith(f"[{name}]".encode()))
+        self.assertEqual(sum(length for _, length, _ in spans), len(data) - 1)
+
+    def test_split_section(self):
+        with checkpoint_index.CheckpointIndex(self.path) as cpt:
+            self.assertEqual(
+                cpt.section("system.cpu"), {"instCnt": "42", "_status": "1"}
+            )
+            self.assertEqual(cpt.find("system.cpu.xc.*"), ["system.cpu.xc.0"])
+            self.assertEqual(cpt.get("system.cpu.xc.0", "regs"), "1 2 3")
+            self.assertIsNone(cpt.get("system.cpu.xc.1", "regs"))
+            with self.assertRaises(KeyError):
+                cpt.section("system.cpu.xc.1")
+
+    def test_stale_index(self):
+        checkpoint_index.write_index(
+            self.path, checkpoint_index.build_index(self.path)
+        )
+        st = os.stat(self.path)
+        # Same size, new mtime: the index is ignored.
+        with open(self.path, "w") as f:
+            f.write(CPT.replace("curTick=1000", "curTick=9999"))
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+        self.assertIsNone(checkpoint_index.read_index(self.path))
+
+        # Same size and mtime, shifted sections: the header check catches
+        # it.
+        with open(self.path, "w") as f:
+            f.write(
+                CPT.replace("curTick=1000", "curTick=10").replace(
+                    "instCnt=42", "instCnt=4200"
+                )
+            )
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertIsNotNone(checkpoint_index.read_index(self.path))
+        with checkpoint_index.CheckpointIndex(self.path) as cpt:
+            self.assertEqual(cpt.get("system.cpu.xc.0", "_pc"), "0x400000")
+            self.assertEqual(cpt.get("system.cpu", "instCnt"), "4200")
+
+        # Different size: the index is ignored and rewritten.
+        with open(self.path, "a") as f:
+            f.write("\n[extra]\nx=1\n")
+        self.assertIsNone(checkpoint_index.read_index(self.path))
+        with checkpoint_index.CheckpointIndex(self.path) as cpt:
+            self.assertEqual(cpt.get("extra", "x"), "1")
+        self.assertIsNotNone(checkpoint_index.read_index(self.path))
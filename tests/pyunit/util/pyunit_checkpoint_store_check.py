@@ -0,0 +1,132 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import gzip
+import io
+import os
+import tempfile
+import unittest
+
+from m5.util import (
+    checkpoint_store,
+    pmem_image,
+)
+
+
+class CheckpointStoreTestSuite(unittest.TestCase):
+    """Test cases for the deduplicated checkpoint store"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        self.store = checkpoint_store.ChunkStore(
+            os.path.join(self.root, "store"), chunk_size=4096
+        )
+        self.shared = bytes(range(256)) * 64
+        self.images = {}
+        for name, tail in (("a", b"a" * 100), ("b", b"b" * 5000)):
+            image = self.shared + bytes(3 * 4096) + tail
+            ckpt_dir = os.path.join(self.root, name)
+            os.makedirs(ckpt_dir)
+            with open(os.path.join(ckpt_dir, "m5.cpt"), "w") as f:
+                f.write("[root]\n")
+            with gzip.open(
+                os.path.join(ckpt_dir, "system.physmem.store0.pmem"), "wb"
+            ) as f:
+                f.write(image)
+            self.images[name] = image
+
+    def tearDown(self):
+        self.store.close()
+        self._tmp.cleanup()
+
+    def _restore(self, name):
+        dest = os.path.join(self.root, f"{name}-restore")
+        os.makedirs(dest)
+        checkpoint_store.materialize(
+            os.path.join(self.root, name), dest, self.store
+        )
+        with open(os.path.join(dest, "system.physmem.store0.pmem"), "rb") as f:
+            return f.read()
+
+    def test_store_and_restore(self):
+        for name in self.images:
+            checkpoint_store.store_checkpoint(
+                self.store, os.path.join(self.root, name)
+            )
+            self.assertTrue(
+                checkpoint_store.is_stored(os.path.join(self.root, name))
+            )
+
+        # The shared and the zero chunks are only stored once.
+        usage = self.store.usage()
+        self.assertEqual(usage["images"], 2)
+        self.assertEqual(usage["chunks"], 5)
+        for name, image in self.images.items():
+            self.assertEqual(self._restore(name), image)
+
+    def test_release_and_gc(self):
+        for name in self.images:
+            checkpoint_store.store_checkpoint(
+                self.store, os.path.join(self.root, name)
+            )
+
+        a = os.path.join(self.root, "a")
+        self.assertEqual(checkpoint_store.release_checkpoint(a, self.store), 1)
+        self.assertEqual(self.store.gc()["chunks"], 1)
+        self.assertEqual(self._restore("b"), self.images["b"])
+
+        b = os.path.join(self.root, "b")
+        checkpoint_store.export_checkpoint(b, self.store)
+        self.assertFalse(checkpoint_store.is_stored(b))
+        with gzip.open(os.path.join(b, "system.physmem.store0.pmem")) as f:
+            self.assertEqual(f.read(), self.images["b"])
+        self.store.gc()
+        self.assertEqual(self.store.usage()["chunks"], 0)
+
+    def test_blocked_images(self):
+        ckpt_dir = os.path.join(self.root, "blocked")
+        os.makedirs(ckpt_dir)
+        image = self.images["b"]
+        name = "system.physmem.store0.pmem.blk"
+        pmem_image.write_image(
+            os.path.join(ckpt_dir, name), io.BytesIO(image), block_size=8192
+        )
+        checkpoint_store.store_checkpoint(self.store, ckpt_dir)
+
+        # Restored images are in the blocked format, uncompressed.
+        dest = os.path.join(self.root, "blocked-restore")
+        os.makedirs(dest)
+        checkpoint_store.materialize(ckpt_dir, dest, self.store)
+        restored = os.path.join(dest, name)
+        self.assertTrue(pmem_image.is_pmem_image(restored))
+        with pmem_image.PmemImage(restored) as f:
+            self.assertEqual("none", f.codec)
+            self.assertEqual(image, f.read(0, f.size))
+
+        checkpoint_store.export_checkpoint(ckpt_dir, self.store)
+        with pmem_image.open_image(os.path.join(ckpt_dir, name)) as f:
+            self.assertEqual(image, f.read())
@@ -0,0 +1,173 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import contextlib
+import io
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import m5
+from m5.util import fork_server
+
+
+class ForkServerTestSuite(unittest.TestCase):
+    """Test cases for the fork server, with m5.fork stubbed"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.outdir = os.path.join(self._tmp.name, "m5out")
+        os.makedirs(self.outdir)
+        patches = [
+            mock.patch.object(
+                m5,
+                "options",
+                SimpleNamespace(outdir=self.outdir),
+                create=True,
+            ),
+            mock.patch.object(m5, "fork", self._fork, create=True),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _fork(self, simout):
+        pid = os.fork()
+        if pid == 0:
+            m5.options.outdir = simout % {
+                "parent": self.outdir,
+                "fork_seq": 0,
+                "pid": os.getpid(),
+            }
+        return pid
+
+    def _serve(self, source, workers=1):
+        """Serve jobs. Returns the exit code of the server; the children
+        record their job and exit with its "exit" field."""
+        server = fork_server.ForkServer(source, "after-instantiate", workers)
+        try:
+            with contextlib.redirect_stdout(
+                io.StringIO()
+            ), contextlib.redirect_stderr(io.StringIO()):
+                job = server.serve()
+        except SystemExit as e:
+            return e.code
+
+        # Never return to the test runner in a child.
+        exit_code = 1
+        try:
+            with open(os.path.join(m5.options.outdir, "job.json"), "w") as f:
+                json.dump(job, f)
+            exit_code = job.get("exit", 0)
+        finally:
+            os._exit(exit_code)
+
+    def _results(self):
+        with open(os.path.join(self.outdir, "fork-server.jsonl")) as f:
+            return {r["name"]: r for r in map(json.loads, f)}
+
+    def _write_jobs(self, jobs):
+        path = os.path.join(self._tmp.name, "jobs.jsonl")
+        with open(path, "w") as f:
+            for job in jobs:
+                f.write(json.dumps(job) + "\n")
+        return path
+
+    def test_job_file(self):
+        jobs = self._write_jobs(
+            [
+                {"name": "a", "size": 1},
+                {"name": "b", "exit": 3},
+                {"size": 2},
+            ]
+        )
+        self.assertEqual(1, self._serve(jobs, workers=2))
+
+        results = self._results()
+        self.assertEqual({"a", "b", "job2"}, set(results))
+        self.assertEqual(0, results["a"]["exit_code"])
+        self.assertEqual(3, results["b"]["exit_code"])
+        with open(os.path.join(self.outdir, "job2", "job.json")) as f:
+            self.assertEqual({"size": 2}, json.load(f))
+
+    def test_invalid_names(self):
+        jobs = self._write_jobs(
+            [{"name": "../escape"}, {"name": "a/b"}, {"name": "ok"}]
+        )
+        self.assertEqual(0, self._serve(jobs))
+        self.assertEqual({"ok"}, set(self._results()))
+        self.assertFalse(
+            os.path.exists(os.path.join(self._tmp.name, "escape"))
+        )
+        self.assertFalse(os.path.exists(os.path.join(self.outdir, "a")))
+
+    def test_other_children(self):
+        # A child which is not a job; its status is left to its owner.
+        other = os.fork()
+        if other == 0:
+            os._exit(7)
+        time.sleep(0.1)
+        self.assertEqual(0, self._serve(self._write_jobs([{"name": "a"}])))
+        pid, status = os.waitpid(other, 0)
+        self.assertEqual(7, os.waitstatus_to_exitcode(status))
+
+    def test_socket(self):
+        path = os.path.join(self._tmp.name, "jobs.sock")
+        replies = []
+
+        def client():
+            for _ in range(500):
+                if os.path.exists(path):
+                    break
+                time.sleep(0.01)
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+                conn.connect(path)
+                conn.sendall(b'{"name": "../x"}\n{"name": "s", "exit": 2}\n')
+                reader = conn.makefile()
+                replies.append(json.loads(reader.readline()))
+                replies.append(json.loads(reader.readline()))
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+                conn.connect(path)
+                conn.sendall(b'{"command": "shutdown"}\n')
+
+        thread = threading.Thread(target=client)
+        thread.start()
+        self.assertEqual(1, self._serve(f"unix:{path}"))
+        thread.join()
+
+        self.assertIn("Invalid job name", replies[0]["error"])
+        self.assertEqual("s", replies[1]["name"])
+        self.assertEqual(2, replies[1]["exit_code"])
+        self.assertFalse(os.path.exists(path))
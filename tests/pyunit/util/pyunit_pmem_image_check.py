@@ -0,0 +1,97 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import gzip
+import io
+import os
+import tempfile
+import unittest
+
+from m5.util import pmem_image
+
+
+class PmemImageTestSuite(unittest.TestCase):
+    """Test cases for blocked checkpoint memory images"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        image = bytearray(64 * 4096)
+        image[100:5000] = bytes(range(256)) * 19 + bytes(36)
+        image[40 * 4096 : 41 * 4096] = os.urandom(4096)
+        self.image = bytes(image)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_write_and_read(self):
+        for codec in ("none", "zlib"):
+            path = os.path.join(self.root, codec)
+            pmem_image.write_image(
+                path, io.BytesIO(self.image), codec, block_size=8192
+            )
+            self.assertTrue(pmem_image.is_pmem_image(path))
+            with pmem_image.PmemImage(path) as image:
+                # Only the blocks which are not zero are stored.
+                self.assertEqual(sorted(image.index), [0, 20])
+                self.assertEqual(image.size, len(self.image))
+                self.assertEqual(
+                    image.read(4000, 200000), self.image[4000:204000]
+                )
+                self.assertEqual(image.read_block(3), bytes(8192))
+                out = io.BytesIO()
+                image.write_to(out)
+                self.assertEqual(out.getvalue(), self.image)
+
+    def test_convert_checkpoint(self):
+        with gzip.open(
+            os.path.join(self.root, "system.physmem.store0.pmem"), "wb"
+        ) as f:
+            f.write(self.image)
+        cpt = os.path.join(self.root, "m5.cpt")
+        with open(cpt, "w") as f:
+            f.write(
+                "[system.physmem.store0]\n"
+                "filename=system.physmem.store0.pmem\n"
+            )
+
+        pmem_image.convert_checkpoint(self.root, "zlib")
+        with open(cpt) as f:
+            self.assertIn("filename=system.physmem.store0.pmem.blk\n", f)
+        with pmem_image.open_image(
+            os.path.join(self.root, "system.physmem.store0.pmem.blk")
+        ) as f:
+            self.assertEqual(f.read(), self.image)
+
+        pmem_image.convert_checkpoint(self.root, "gzip")
+        self.assertEqual(
+            sorted(os.listdir(self.root)),
+            ["m5.cpt", "system.physmem.store0.pmem"],
+        )
+        with gzip.open(
+            os.path.join(self.root, "system.physmem.store0.pmem")
+        ) as f:
+            self.assertEqual(f.read(), self.image)
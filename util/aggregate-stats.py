@@ -0,0 +1,451 @@
+#! /usr/bin/env python3
+
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Aggregates selected stats from many gem5 output directories (e.g. the
+``m5out*`` directories of a sweep) into a single table, one row per run.
+
+Each ``stats.txt`` (or ``stats.txt.gz``) is parsed in a pool of worker
+processes. Only the selected dump of each file is tokenized: the dump
+boundaries are found first, and stats given by their exact names are then
+looked up directly rather than by parsing every line.
+
+Usage
+-----
+
+```sh
+util/aggregate-stats.py sweep/ -s simSeconds -s 'board.processor.*.ipc' \
+    --dump last -o results.csv
+util/aggregate-stats.py sweep/ -s simInsts --format columnar -o results.col
+util/aggregate-stats.py --benchmark 5000
+```
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import math
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import translate
+from typing import (
+    IO,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+BEGIN_MARKER = "---------- Begin Simulation Statistics"
+END_MARKER = "---------- End Simulation Statistics"
+STATS_FILES = ("stats.txt", "stats.txt.gz")
+_WILDCARDS = re.compile(r"[*?\[]")
+
+
+def find_stats_files(roots: Sequence[str]) -> List[str]:
+    """Returns the stats files in (or below) the given directories."""
+
+    found = []
+    for root in roots:
+        if os.path.isfile(root):
+            found.append(root)
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for name in STATS_FILES:
+                if name in filenames:
+                    found.append(os.path.join(dirpath, name))
+                    break
+    return found
+
+
+def read_stats_file(path: str) -> str:
+    if path.endswith(".gz"):
+        with gzip.open(path, "rt") as f:
+            return f.read()
+    with open(path) as f:
+        return f.read()
+
+
+def dump_sections(text: str) -> List[Tuple[int, int]]:
+    """Returns the (start, end) offsets of each dump in a stats file."""
+
+    sections = []
+    start = text.find(BEGIN_MARKER)
+    while start != -1:
+        end = text.find(END_MARKER, start)
+        if end == -1:
+            # An incomplete dump, e.g. from a run which is still going.
+            break
+        sections.append((start, end))
+        start = text.find(BEGIN_MARKER, end)
+    return sections
+
+
+def _value(token: str) -> float:
+    try:
+        return float(token)
+    except ValueError:
+        return math.nan
+
+
+def parse_section(
+    text: str, start: int, end: int, stats: Sequence[str]
+) -> Dict[str, float]:
+    """
+    Returns the values of the selected stats in one dump. Stats without
+    wildcards are found with a direct search; the dump's lines are only
+    tokenized if glob-style patterns are given.
+    """
+
+    exact = [stat for stat in stats if not _WILDCARDS.search(stat)]
+    patterns = [stat for stat in stats if _WILDCARDS.search(stat)]
+
+    values = {}
+    for stat in exact:
+        # Names are at the start of a line and followed by whitespace.
+        needle = f"\n{stat} "
+        pos = text.find(needle, start, end)
+        if pos == -1:
+            continue
+        fields = text[pos + len(needle) : text.find("\n", pos + 1)].split()
+        if fields:
+            values[stat] = _value(fields[0])
+
+    if patterns:
+        match = re.compile(
+            "|".join(f"(?:{translate(pattern)})" for pattern in patterns)
+        ).match
+        for line in text[start:end].splitlines():
+            fields = line.split(None, 2)
+            if len(fields) >= 2 and match(fields[0]):
+                values[fields[0]] = _value(fields[1])
+
+    return values
+
+
+def check_dump(dump: str) -> str:
+    """Checks a dump selector: 'first', 'last', 'all' or a dump index."""
+
+    if dump not in ("first", "last", "all"):
+        try:
+            int(dump)
+        except ValueError:
+            raise ValueError(
+                f"invalid dump '{dump}': expected 'first', 'last', 'all' "
+                "or an index"
+            ) from None
+    return dump
+
+
+def _dump_arg(dump: str) -> str:
+    try:
+        return check_dump(dump)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def aggregate_file(
+    args: Tuple[str, str, Sequence[str]]
+) -> Tuple[str, Optional[Dict[str, float]], Optional[str]]:
+    """
+    Returns the selected stats of the selected dump in a stats file, or an
+    error message. Runs in the worker processes.
+    """
+
+    path, dump, stats = args
+    try:
+        text = read_stats_file(path)
+    except (OSError, EOFError, UnicodeDecodeError) as e:
+        return path, None, str(e)
+
+    sections = dump_sections(text)
+    if dump == "all":
+        selected = sections
+    else:
+        index = {"first": 0, "last": -1}.get(dump)
+        if index is None:
+            index = int(dump)
+        try:
+            selected = [sections[index]]
+        except IndexError:
+            return path, None, f"no dump {dump} ({len(sections)} dumps)"
+
+    rows = {}
+    for number, (start, end) in enumerate(selected):
+        values = parse_section(text, start, end, stats)
+        if dump == "all":
+            values = {f"{number}:{k}": v for k, v in values.items()}
+        rows.update(values)
+    return path, rows, None
+
+
+def aggregate(
+    files: Sequence[str],
+    stats: Sequence[str],
+    dump: str = "last",
+    jobs: Optional[int] = None,
+) -> Iterator[Tuple[str, Optional[Dict[str, float]], Optional[str]]]:
+    """Yields (path, values, error) for each stats file, in order."""
+
+    check_dump(dump)
+    work = [(path, dump, stats) for path in files]
+    if jobs == 1:
+        yield from map(aggregate_file, work)
+        return
+
+    jobs = jobs or os.cpu_count()
+    chunksize = max(1, min(64, len(work) // (4 * jobs)))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(aggregate_file, work, chunksize=chunksize)
+
+
+def _run_name(path: str, roots: Sequence[str]) -> str:
+    """The name of a run: its directory, relative to the given root."""
+
+    run = os.path.dirname(os.path.abspath(path))
+    for root in roots:
+        root = os.path.abspath(root)
+        if os.path.isdir(root) and os.path.commonpath([root, run]) == root:
+            name = os.path.relpath(run, root)
+            return os.path.basename(run) if name == "." else name
+    return run
+
+
+def write_csv(
+    f: IO[str], runs: List[str], rows: List[Dict[str, float]], columns
+) -> None:
+    writer = csv.writer(f)
+    writer.writerow(["run"] + columns)
+    for run, row in zip(runs, rows):
+        writer.writerow(
+            [run] + [repr(row[c]) if c in row else "" for c in columns]
+        )
+
+
+def write_columnar(
+    output: str, runs: List[str], rows: List[Dict[str, float]], columns
+) -> None:
+    from m5.ext.pystats.columnar import ColumnarWriter
+
+    writer = ColumnarWriter(output, block_rows=1024)
+    for row in rows:
+        writer.write({c: row.get(c, math.nan) for c in columns})
+    writer.close()
+    with open(os.path.join(output, "runs.json"), "w") as f:
+        json.dump(runs, f)
+
+
+def make_synthetic_corpus(
+    directory: str, runs: int, stats: int = 2000, dumps: int = 2
+) -> None:
+    """Writes ``runs`` gzipped stats.txt files, of ``dumps`` dumps each."""
+
+    lines = []
+    for i in range(stats):
+        lines.append(
+            f"board.processor.cores{i % 8}.core.stat{i:<40} {{v{i % 7}}}"
+            "   # A synthetic stat (Count)"
+        )
+    template = "\n".join(lines)
+    for run in range(runs):
+        run_dir = os.path.join(directory, f"m5out-{run:05d}")
+        os.makedirs(run_dir)
+        with gzip.open(os.path.join(run_dir, "stats.txt.gz"), "wt") as f:
+            for dump in range(dumps):
+                f.write(f"\n{BEGIN_MARKER} ----------\n")
+                f.write(f"simSeconds    {0.001 * (dump + 1)}   # (Second)\n")
+                f.write(
+                    f"simInsts    {run * 1000 + dump}   # (Count)\n"
+                    f"board.processor.cores0.core.ipc   {1 + run / runs}"
+                    "   # (Count/Cycle)\n"
+                )
+                f.write(
+                    template.format(**{f"v{k}": run + k for k in range(7)})
+                )
+                f.write(f"\n\n{END_MARKER}   ----------\n")
+
+
+def benchmark(runs: int, jobs: Optional[int]) -> None:
+    directory = tempfile.mkdtemp(prefix="aggregate-stats-")
+    try:
+        start = time.perf_counter()
+        make_synthetic_corpus(directory, runs)
+        print(f"Generated {runs} runs in {time.perf_counter() - start:.1f}s")
+
+        files = find_stats_files([directory])
+        cases = [
+            ("exact names, last dump", ["simInsts", "simSeconds"], "last"),
+            (
+                "glob, first dump",
+                ["board.processor.cores*.core.ipc"],
+                "first",
+            ),
+        ]
+        # For reference, parse every line of every dump with a regular
+        # expression, as ad-hoc scripts commonly do.
+        line_re = re.compile(r"^(\S+)\s+(\S+)")
+        start = time.perf_counter()
+        for path in files:
+            values = {}
+            for line in read_stats_file(path).splitlines():
+                match = line_re.match(line)
+                if match and match.group(1) in ("simInsts", "simSeconds"):
+                    values[match.group(1)] = _value(match.group(2))
+        elapsed = time.perf_counter() - start
+        print(
+            f"line by line regex baseline, 1 job: {elapsed:.2f}s "
+            f"({len(files) / elapsed:.0f} runs/s)"
+        )
+
+        for name, stats, dump in cases:
+            for case_jobs in sorted({1, jobs or os.cpu_count()}):
+                start = time.perf_counter()
+                results = list(aggregate(files, stats, dump, case_jobs))
+                elapsed = time.perf_counter() - start
+                assert all(error is None for _, _, error in results)
+                print(
+                    f"{name}, {case_jobs} job(s): {elapsed:.2f}s "
+                    f"({len(files) / elapsed:.0f} runs/s)"
+                )
+    finally:
+        shutil.rmtree(directory)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Aggregate selected stats from many gem5 output "
+        "directories into one table."
+    )
+    parser.add_argument(
+        "roots",
+        nargs="*",
+        help="Output directories, directories containing them, or stats "
+        "files",
+    )
+    parser.add_argument(
+        "-s",
+        "--stat",
+        action="append",
+        default=[],
+        dest="stats",
+        help="A stat name, or glob-style pattern, to collect. May be "
+        "repeated.",
+    )
+    parser.add_argument(
+        "--dump",
+        type=_dump_arg,
+        default="last",
+        help="The dump to read from each file: 'first', 'last', 'all' or "
+        "its index (negative indices count from the end) (default: last)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="The output file, or directory for the columnar format "
+        "(default: CSV to stdout)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("csv", "columnar"),
+        default="csv",
+        help="The output format. Columnar archives can be read with "
+        "m5.ext.pystats.columnar.ColumnarArchive. (default: csv)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="The number of worker processes (default: the number of CPUs)",
+    )
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="RUNS",
+        help="Time the aggregation of a synthetic corpus of RUNS runs",
+    )
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark(args.benchmark, args.jobs)
+        return 0
+
+    if not args.roots or not args.stats:
+        parser.error("output directories and at least one --stat are needed")
+    if args.format == "columnar" and args.output == "-":
+        parser.error("the columnar format needs an --output directory")
+
+    files = find_stats_files(args.roots)
+    runs = []
+    rows = []
+    columns = {}
+    failed = 0
+    for path, values, error in aggregate(
+        files, args.stats, args.dump, args.jobs
+    ):
+        if error is not None:
+            print(f"{path}: {error}", file=sys.stderr)
+            failed += 1
+            continue
+        runs.append(_run_name(path, args.roots))
+        rows.append(values)
+        columns.update(dict.fromkeys(values))
+
+    columns = list(columns)
+    if args.format == "columnar":
+        write_columnar(args.output, runs, rows, columns)
+    elif args.output == "-":
+        write_csv(sys.stdout, runs, rows, columns)
+    else:
+        with open(args.output, "w", newline="") as f:
+            write_csv(f, runs, rows, columns)
+
+    print(
+        f"Aggregated {len(rows)} of {len(files)} stats files",
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.path.append(
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "..", "src", "python"
+        )
+    )
+    sys.exit(main())
@@ -1,3 +1,4 @@
+# Copyright (c) 2026 The Regents of the University of California
 # Copyright (c) 2009 The Regents of The University of Michigan
 # Copyright (c) 2011 Advanced Micro Devices, Inc.
 # Copyright (c) 2013 Mark D. Hill and David A. Wood
@@ -26,11 +27,54 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+"""
+Combines the checkpoints of single-process (SE, x86) runs into one
+checkpoint running all the processes: the CPU and workload sections of each
+checkpoint are renumbered (cpu -> cpu<i>), the physical pages used by each
+checkpoint are placed one after the other in the memory image and the
+physical addresses of the page tables are moved accordingly.
+
+The memory images are copied in large blocks, by one thread per input
+checkpoint (-j). Uncompressed output (-c) is written in place, skipping the
+blocks which are zero, so the padding up to --memory-size and the zero
+pages are holes in a sparse file. Compressed output is written as one gzip
+member per input, compressed in parallel and concatenated, which zlib (and
+so gem5) reads as a single stream. Input images may be gzip, uncompressed
+or in the blocked format (see ``m5.util.pmem_image``).
+"""
+
 import gzip
 import os
 import re
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
+
+sys.path.append(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "src", "python"
+    )
+)
+
+from m5.util import pmem_image
+
+PAGE_SIZE = 4096
+DEFAULT_BLOCK_SIZE = 4 * 1024 * 1024
+MEMORY_SECTION = "system.physmem.store0"
+IMAGE_NAME = MEMORY_SECTION + ".pmem"
+
+# A section of m5.cpt: its name and (key, value) items.
+Section = Tuple[str, List[Tuple[str, str]]]
+
+
+class AggregationError(Exception):
+    pass
 
 
 class myCP(ConfigParser):
@@ -41,114 +85,257 @@ class myCP(ConfigParser):
         return optionstr
 
 
-def aggregate(output_dir, cpts, no_compress, memory_size):
-    merged_config = None
-    page_ptr = 0
-
-    output_path = output_dir
-    if not os.path.isdir(output_path):
-        os.system("mkdir -p " + output_path)
+def read_config(cpt: str) -> myCP:
+    config = myCP()
+    with open(os.path.join(cpt, "m5.cpt")) as f:
+        config.read_file(f)
+    return config
 
-    agg_mem_file = open(output_path + "/system.physmem.store0.pmem", "wb+")
-    agg_config_file = open(output_path + "/m5.cpt", "wb+")
 
-    if not no_compress:
-        merged_mem = gzip.GzipFile(fileobj=agg_mem_file, mode="wb")
+def merge_configs(
+    cpts: List[str], configs: List[myCP]
+) -> Tuple[List[Section], List[int], List[int], int]:
+    """
+    Merge the configurations of the checkpoints.
 
+    :returns: The merged sections, as (name, items) in the order to write
+              them, the first page and the number of pages of each
+              checkpoint in the merged memory, and the number of pages
+              they use.
+    """
+    sections = []
+    owners = {}
+    first_pages = []
+    page_counts = []
+    page_ptr = 0
     max_curtick = 0
     num_digits = len(str(len(cpts) - 1))
 
-    for i, arg in enumerate(cpts):
-        print(arg)
-        merged_config = myCP()
-        config = myCP()
-        config.readfp(open(cpts[i] + "/m5.cpt"))
+    def add(name: str, items: List[Tuple[str, str]], owner: str) -> None:
+        if name in owners:
+            raise AggregationError(
+                f"Section [{name}] of {owner} collides with the same "
+                f"section of {owners[name]} after renumbering"
+            )
+        owners[name] = owner
+        sections.append((name, items))
+
+    for i, (cpt, config) in enumerate(zip(cpts, configs)):
+        try:
+            pages = config.getint("system", "pagePtr")
+        except Exception as e:
+            raise AggregationError(f"{cpt}: can't read system.pagePtr: {e}")
+        first_pages.append(page_ptr)
+        page_counts.append(pages)
 
         for sec in config.sections():
-            if re.compile("cpu").search(sec):
-                newsec = re.sub("cpu", "cpu" + str(i).zfill(num_digits), sec)
-                merged_config.add_section(newsec)
-
-                items = config.items(sec)
-                for item in items:
-                    if item[0] == "paddr":
-                        merged_config.set(
-                            newsec, item[0], int(item[1]) + (page_ptr << 12)
-                        )
-                        continue
-                    merged_config.set(newsec, item[0], item[1])
-
-                if re.compile("workload.FdMap256$").search(sec):
-                    merged_config.set(newsec, "M5_pid", i)
-
-            elif sec == "system":
-                pass
+            if "cpu" in sec:
+                newsec = sec.replace("cpu", "cpu" + str(i).zfill(num_digits))
+                items = []
+                for key, value in config.items(sec, raw=True):
+                    if key == "paddr":
+                        paddr = int(value)
+                        if paddr >= pages * PAGE_SIZE:
+                            raise AggregationError(
+                                f"{cpt}: [{sec}] paddr {paddr:#x} is beyond "
+                                f"the {pages} pages of the checkpoint"
+                            )
+                        value = str(paddr + page_ptr * PAGE_SIZE)
+                    items.append((key, value))
+                if re.search("workload.FdMap256$", sec):
+                    items = [(k, v) for k, v in items if k != "M5_pid"]
+                    items.append(("M5_pid", str(i)))
+                add(newsec, items, cpt)
             elif sec == "Globals":
-                tick = config.getint(sec, "curTick")
-                if tick > max_curtick:
-                    max_curtick = tick
-            else:
-                if i == len(cpts) - 1:
-                    merged_config.add_section(sec)
-                    for item in config.items(sec):
-                        merged_config.set(sec, item[0], item[1])
-
-        if i != len(cpts) - 1:
-            merged_config.write(agg_config_file)
-
-        ### memory stuff
-        pages = int(config.get("system", "pagePtr"))
-        page_ptr = page_ptr + pages
-        print("pages to be read: ", pages)
-
-        f = open(cpts[i] + "/system.physmem.store0.pmem", "rb")
-        gf = gzip.GzipFile(fileobj=f, mode="rb")
-
-        x = 0
-        while x < pages:
-            bytesRead = gf.read(1 << 12)
-            if not no_compress:
-                merged_mem.write(bytesRead)
-            else:
-                agg_mem_file.write(bytesRead)
-            x += 1
-
-        gf.close()
-        f.close()
-
-    merged_config.add_section("system")
-    merged_config.set("system", "pagePtr", page_ptr)
-    merged_config.set("system", "nextPID", len(cpts))
-
-    file_size = page_ptr * 4 * 1024
-    dummy_data = "".zfill(4096)
-    while file_size < memory_size:
-        if not no_compress:
-            merged_mem.write(dummy_data)
-        else:
-            agg_mem_file.write(dummy_data)
-        file_size += 4 * 1024
-        page_ptr += 1
+                max_curtick = max(max_curtick, config.getint(sec, "curTick"))
+            elif sec != "system" and i == len(cpts) - 1:
+                add(sec, config.items(sec, raw=True), cpt)
 
-    print("WARNING: ")
-    print(
-        "Make sure the simulation using this checkpoint has at least ", end=" "
+        page_ptr += pages
+
+    sections.append(
+        ("system", [("pagePtr", str(page_ptr)), ("nextPID", str(len(cpts)))])
     )
-    print(page_ptr, "x 4K of memory")
-    merged_config.set(
-        "system.physmem.store0", "range_size", page_ptr * 4 * 1024
+    sections.append(("Globals", [("curTick", str(max_curtick))]))
+    return sections, first_pages, page_counts, page_ptr
+
+
+def _image_path(cpt: str, config: myCP) -> str:
+    name = config.get(MEMORY_SECTION, "filename", fallback=IMAGE_NAME)
+    return os.path.join(cpt, name)
+
+
+def _blocks(path: str, size: int, block_size: int):
+    """The first `size` bytes of an image, in blocks."""
+    with pmem_image.open_image(path) as image:
+        left = size
+        while left:
+            data = image.read(min(block_size, left))
+            if not data:
+                raise AggregationError(
+                    f"'{path}' holds {size - left} bytes, "
+                    f"{size} are needed"
+                )
+            left -= len(data)
+            yield data
+
+
+_ZERO_PAGE = bytes(PAGE_SIZE)
+
+
+def _copy_raw(path: str, size: int, fd: int, offset: int, block_size: int):
+    # Only runs of pages which are not zero are written, the zero pages
+    # are left as holes.
+    for data in _blocks(path, size, block_size):
+        view = memoryview(data)
+        run = None
+        for page in range(0, len(data) + PAGE_SIZE, PAGE_SIZE):
+            zero = page >= len(data) or view[page : page + PAGE_SIZE] == (
+                _ZERO_PAGE[: len(data) - page]
+            )
+            if zero and run is not None:
+                os.pwrite(fd, view[run:page], offset + run)
+                run = None
+            elif not zero and run is None:
+                run = page
+        offset += len(data)
+
+
+def _copy_gzip(path: str, size: int, out: str, level: int, block_size: int):
+    # Compress an image as one gzip member.
+    with gzip.open(out, "wb", compresslevel=level) as f:
+        for data in _blocks(path, size, block_size):
+            f.write(data)
+
+
+def _write_padding(size: int, out: str, level: int, block_size: int):
+    # Padding is a series of gzip members of zeros, compressed only once.
+    member = gzip.compress(bytes(block_size), level)
+    with open(out, "wb") as f:
+        for _ in range(size // block_size):
+            f.write(member)
+        if size % block_size:
+            f.write(gzip.compress(bytes(size % block_size), level))
+
+
+def _append(path: str, out) -> None:
+    # Copy in the kernel where possible.
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        offset = 0
+        out.flush()
+        try:
+            while offset < size:
+                sent = os.sendfile(
+                    out.fileno(), f.fileno(), offset, size - offset
+                )
+                if not sent:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            if offset:
+                raise
+        if offset < size:
+            f.seek(offset)
+            shutil.copyfileobj(f, out, 1 << 20)
+
+
+def _write_config(path: str, sections: List[Section]) -> None:
+    with open(path, "w") as f:
+        for name, items in sections:
+            f.write(f"[{name}]\n")
+            for key, value in items:
+                f.write(f"{key}={value}\n")
+            f.write("\n")
+
+
+def aggregate(
+    output_dir: str,
+    cpts: List[str],
+    no_compress: bool,
+    memory_size: Optional[int],
+    jobs: Optional[int] = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    level: int = 6,
+) -> int:
+    """
+    Combine checkpoints into one in `output_dir`.
+
+    :param no_compress: Write the memory image uncompressed (and sparse).
+    :param memory_size: Pad the memory image up to this size, if given.
+    :param jobs: The number of threads copying images (default: one per
+                 checkpoint, up to the number of CPUs).
+    :param block_size: The size of the blocks the images are copied in.
+    :param level: The gzip compression level of the memory image.
+    :returns: The number of pages of the memory image.
+    """
+    configs = [read_config(cpt) for cpt in cpts]
+    sections, first_pages, page_counts, used_pages = merge_configs(
+        cpts, configs
     )
+    total_pages = used_pages
+    if memory_size:
+        total_pages = max(total_pages, -(-memory_size // PAGE_SIZE))
 
-    merged_config.add_section("Globals")
-    merged_config.set("Globals", "curTick", max_curtick)
+    for name, items in sections:
+        if name == MEMORY_SECTION:
+            items[:] = [
+                (key, value)
+                for key, value in items
+                if key not in ("range_size", "filename")
+            ]
+            items.append(("filename", IMAGE_NAME))
+            items.append(("range_size", str(total_pages * PAGE_SIZE)))
 
-    merged_config.write(agg_config_file)
+    os.makedirs(output_dir, exist_ok=True)
+    image_path = os.path.join(output_dir, IMAGE_NAME)
+    copies = [
+        (_image_path(cpt, config), pages * PAGE_SIZE, first * PAGE_SIZE)
+        for cpt, config, pages, first in zip(
+            cpts, configs, page_counts, first_pages
+        )
+    ]
+    jobs = jobs or min(len(copies), os.cpu_count() or 1)
+
+    with ThreadPoolExecutor(jobs) as pool:
+        if no_compress:
+            fd = os.open(image_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+            try:
+                os.ftruncate(fd, total_pages * PAGE_SIZE)
+                for future in [
+                    pool.submit(_copy_raw, path, size, fd, offset, block_size)
+                    for path, size, offset in copies
+                ]:
+                    future.result()
+            finally:
+                os.close(fd)
+        else:
+            members = [
+                (_copy_gzip, path, size, f"{image_path}.{i}.tmp")
+                for i, (path, size, _) in enumerate(copies)
+            ]
+            padding = (total_pages - used_pages) * PAGE_SIZE
+            if padding:
+                members.append(
+                    (_write_padding, padding, f"{image_path}.pad.tmp")
+                )
+            try:
+                futures = [
+                    pool.submit(*member, level, block_size)
+                    for member in members
+                ]
+                with open(image_path, "wb") as out:
+                    for future, member in zip(futures, members):
+                        future.result()
+                        _append(member[-1], out)
+                        os.unlink(member[-1])
+            finally:
+                for member in members:
+                    if os.path.exists(member[-1]):
+                        os.unlink(member[-1])
 
-    if not no_compress:
-        merged_mem.close()
-        agg_mem_file.close()
-    else:
-        agg_mem_file.close()
+    _write_config(os.path.join(output_dir, "m5.cpt"), sections)
+    return total_pages
 
 
 if __name__ == "__main__":
@@ -164,20 +351,44 @@ if __name__ == "__main__":
     parser.add_argument("-c", "--no-compress", action="store_true")
     parser.add_argument("--cpts", nargs="+")
     parser.add_argument("--memory-size", action="store", type=int)
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of checkpoint images copied at once "
+        "[Default: one per CPU]",
+    )
+    parser.add_argument(
+        "--block-size",
+        type=int,
+        default=DEFAULT_BLOCK_SIZE,
+        help="Size of the blocks images are copied in [Default: %(default)s]",
+    )
 
     # Assume x86 ISA.  Any other ISAs would need extra stuff in this script
     # to appropriately parse their page tables and understand page sizes.
     options = parser.parse_args()
-    print(options.cpts, len(options.cpts))
-    if len(options.cpts) <= 1:
+    if not options.cpts or len(options.cpts) <= 1:
         parser.error(
             "You must specify atleast two checkpoint files that "
             "need to be combined."
         )
 
-    aggregate(
-        options.output_dir,
-        options.cpts,
-        options.no_compress,
-        options.memory_size,
+    try:
+        pages = aggregate(
+            options.output_dir,
+            options.cpts,
+            options.no_compress,
+            options.memory_size,
+            options.jobs,
+            options.block_size,
+        )
+    except (AggregationError, OSError) as e:
+        sys.exit(f"Error: {e}")
+
+    print("WARNING: ")
+    print(
+        "Make sure the simulation using this checkpoint has at least ", end=" "
     )
+    print(pages, "x 4K of memory")
@@ -0,0 +1,188 @@
+#! /usr/bin/env python3
+
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Benchmarks util/checkpoint_aggregator.py against the previous
+implementation on synthetic checkpoints, and checks that both produce the
+same memory image.
+
+The previous implementation copied the memory images 4 KiB at a time
+through GzipFile and padded the output one page at a time. It no longer
+runs on Python 3 as it was (it wrote str to binary files, and readfp() was
+removed in Python 3.12), so its memory copy is reproduced here with those
+fixed. Its configuration merging is not timed as it is negligible.
+
+Usage
+-----
+
+```sh
+util/checkpoint_aggregator_bench.py --checkpoints 8 --pages 16384 \
+    --memory-size 1073741824
+```
+"""
+
+import argparse
+import gzip
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import checkpoint_aggregator
+
+
+def make_checkpoint(path: str, index: int, pages: int, rng) -> None:
+    os.makedirs(path)
+    with open(os.path.join(path, "m5.cpt"), "w") as f:
+        f.write(
+            f"[Globals]\ncurTick={1000 * (index + 1)}\n\n"
+            f"[system]\npagePtr={pages}\nnextPID=1\n\n"
+            f"[system.cpu.workload]\npaddr={(pages - 1) * 4096}\n\n"
+            "[system.cpu.workload.FdMap256]\nM5_pid=0\n\n"
+            "[system.physmem.store0]\nstore_id=0\n"
+            "filename=system.physmem.store0.pmem\n"
+            f"range_size={pages * 4096}\n\n"
+        )
+    # About half of the pages are zero, like a freshly loaded process.
+    page = bytes(rng.getrandbits(8) % 16 for _ in range(4096))
+    with gzip.open(
+        os.path.join(path, "system.physmem.store0.pmem"), "wb"
+    ) as f:
+        for _ in range(pages):
+            f.write(page if rng.random() < 0.5 else bytes(4096))
+
+
+def legacy_memory(output_dir, cpts, no_compress, memory_size) -> None:
+    agg_mem_file = open(output_dir + "/system.physmem.store0.pmem", "wb+")
+    if not no_compress:
+        merged_mem = gzip.GzipFile(fileobj=agg_mem_file, mode="wb")
+
+    page_ptr = 0
+    for cpt in cpts:
+        pages = checkpoint_aggregator.read_config(cpt).getint(
+            "system", "pagePtr"
+        )
+        page_ptr += pages
+        f = open(cpt + "/system.physmem.store0.pmem", "rb")
+        gf = gzip.GzipFile(fileobj=f, mode="rb")
+        x = 0
+        while x < pages:
+            bytesRead = gf.read(1 << 12)
+            if not no_compress:
+                merged_mem.write(bytesRead)
+            else:
+                agg_mem_file.write(bytesRead)
+            x += 1
+        gf.close()
+        f.close()
+
+    file_size = page_ptr * 4 * 1024
+    dummy_data = bytes(4096)
+    while file_size < memory_size:
+        if not no_compress:
+            merged_mem.write(dummy_data)
+        else:
+            agg_mem_file.write(dummy_data)
+        file_size += 4 * 1024
+
+    if not no_compress:
+        merged_mem.close()
+    agg_mem_file.close()
+
+
+def read_image(path: str, no_compress: bool) -> bytes:
+    opener = open if no_compress else gzip.open
+    with opener(path, "rb") as f:
+        return f.read()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[0].strip()
+    )
+    parser.add_argument("--checkpoints", type=int, default=8)
+    parser.add_argument(
+        "--pages", type=int, default=8192, help="Pages per checkpoint"
+    )
+    parser.add_argument(
+        "--memory-size",
+        type=int,
+        default=512 * 1024 * 1024,
+        help="Size the merged memory image is padded to",
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("--dir", default=None, help="Work directory")
+    args = parser.parse_args()
+
+    work = tempfile.mkdtemp(prefix="cpt-aggregator-", dir=args.dir)
+    try:
+        rng = random.Random(0)
+        cpts = [os.path.join(work, f"cpt{i}") for i in range(args.checkpoints)]
+        for i, cpt in enumerate(cpts):
+            make_checkpoint(cpt, i, args.pages, rng)
+
+        for no_compress in (False, True):
+            kind = "uncompressed" if no_compress else "gzip"
+            legacy = os.path.join(work, f"legacy-{kind}")
+            os.makedirs(legacy)
+            start = time.perf_counter()
+            legacy_memory(legacy, cpts, no_compress, args.memory_size)
+            legacy_time = time.perf_counter() - start
+
+            new = os.path.join(work, f"new-{kind}")
+            start = time.perf_counter()
+            checkpoint_aggregator.aggregate(
+                new, cpts, no_compress, args.memory_size, args.jobs
+            )
+            new_time = time.perf_counter() - start
+
+            image = "system.physmem.store0.pmem"
+            same = read_image(
+                os.path.join(legacy, image), no_compress
+            ) == read_image(os.path.join(new, image), no_compress)
+            disk = os.stat(os.path.join(new, image)).st_blocks * 512
+            print(
+                f"{kind}: previous {legacy_time:.2f} s, "
+                f"streaming {new_time:.2f} s "
+                f"({legacy_time / new_time:.1f}x), "
+                f"{disk / 2**20:.1f} MiB on disk, "
+                f"{'identical' if same else 'DIFFERENT'} images"
+            )
+            if not same:
+                return 1
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+#! /usr/bin/env python3
+
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Reads sections and entries of checkpoints through their section index
+(m5.cpt.idx, see ``m5.util.checkpoint_index``), building the index of the
+checkpoints which have none.
+
+Usage
+-----
+
+```sh
+# Print the tick of every checkpoint in a library.
+util/checkpoint_index.py -r -j 16 -s Globals -k curTick spec-cpts/
+
+# Print the sections of the thread contexts of a checkpoint.
+util/checkpoint_index.py -s 'system.cpu*.xc.*' m5out/cpt.1234
+
+# Only build the missing indices.
+util/checkpoint_index.py -r spec-cpts/
+```
+"""
+
+import argparse
+import os
+import sys
+
+
+def find_checkpoints(paths, recurse):
+    for path in paths:
+        if not recurse:
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            if "m5.cpt" in files:
+                yield root
+
+
+def _query(job):
+    ckpt_dir, section, key = job
+    try:
+        with checkpoint_index.CheckpointIndex(ckpt_dir) as cpt:
+            if section is None:
+                return ckpt_dir, [], None
+            results = []
+            for name in cpt.find(section):
+                if key is None:
+                    results.append(f"[{name}]{cpt.raw_section(name)}")
+                else:
+                    value = cpt.section(name).get(key)
+                    if value is not None:
+                        results.append(value)
+            return ckpt_dir, results, None
+    except Exception as e:
+        return ckpt_dir, [], f"{type(e).__name__}: {e}"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[0].strip()
+    )
+    parser.add_argument("checkpoints", nargs="+")
+    parser.add_argument(
+        "-s", "--section", help="The sections to read (a glob pattern)"
+    )
+    parser.add_argument(
+        "-k", "--key", help="The entry to print from each section"
+    )
+    parser.add_argument(
+        "-r",
+        "--recurse",
+        action="store_true",
+        help="Read every checkpoint in the given directories",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Checkpoints read at once (0: one per CPU)",
+    )
+    args = parser.parse_args()
+    if args.key and not args.section:
+        parser.error("--key requires --section")
+
+    tasks = [
+        (ckpt_dir, args.section, args.key)
+        for ckpt_dir in find_checkpoints(args.checkpoints, args.recurse)
+    ]
+    jobs = args.jobs or os.cpu_count()
+    if jobs == 1:
+        results = map(_query, tasks)
+    else:
+        from multiprocessing import Pool
+
+        pool = Pool(jobs)
+        results = pool.imap(_query, tasks, chunksize=16)
+
+    failed = 0
+    for ckpt_dir, values, error in results:
+        if error:
+            failed += 1
+            print(f"{ckpt_dir}: {error}", file=sys.stderr)
+        elif args.key:
+            for value in values:
+                print(f"{ckpt_dir}\t{value}")
+        else:
+            for text in values:
+                print(text)
+    if jobs != 1:
+        pool.close()
+        pool.join()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.path.append(
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "..", "src", "python"
+        )
+    )
+
+    from m5.util import checkpoint_index
+
+    sys.exit(main())
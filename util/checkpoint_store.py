@@ -0,0 +1,222 @@
+#! /usr/bin/env python3
+
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Manages checkpoints whose memory images are kept in a deduplicated chunk
+store (see ``m5.util.checkpoint_store``).
+
+Usage
+-----
+
+```sh
+# Move the memory images of a library of checkpoints to a store.
+util/checkpoint_store.py --store /data/cpt-store import -r -j 16 spec-cpts/
+
+# Report the deduplication achieved.
+util/checkpoint_store.py --store /data/cpt-store usage
+
+# Release the images of checkpoints about to be deleted, then remove the
+# chunks nothing references anymore.
+util/checkpoint_store.py --store /data/cpt-store release old-cpt/
+util/checkpoint_store.py --store /data/cpt-store gc
+
+# Turn checkpoints back into self-contained ones.
+util/checkpoint_store.py --store /data/cpt-store export -r spec-cpts/
+```
+"""
+
+import argparse
+import os
+import sys
+import time
+
+
+def find_checkpoints(paths, recurse):
+    for path in paths:
+        if not recurse:
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            if "m5.cpt" in files:
+                yield root
+
+
+_worker_store = None
+
+
+def _init_worker(root, chunk_size, level, threads):
+    global _worker_store
+    _worker_store = checkpoint_store.ChunkStore(
+        root, chunk_size, level, threads
+    )
+
+
+def _run(job):
+    command, ckpt_dir = job
+    try:
+        if command == "import":
+            if checkpoint_store.is_stored(ckpt_dir):
+                return ckpt_dir, 0, None
+            manifests = checkpoint_store.store_checkpoint(
+                _worker_store, ckpt_dir
+            )
+            return ckpt_dir, sum(m["size"] for m in manifests), None
+        elif command == "export":
+            checkpoint_store.export_checkpoint(ckpt_dir, _worker_store)
+        else:
+            checkpoint_store.release_checkpoint(ckpt_dir, _worker_store)
+        return ckpt_dir, 0, None
+    except Exception as e:
+        return ckpt_dir, 0, f"{type(e).__name__}: {e}"
+
+
+def run_batch(args):
+    from multiprocessing import Pool
+
+    ckpt_dirs = list(find_checkpoints(args.checkpoints, args.recurse))
+    jobs = args.jobs or os.cpu_count()
+    # Each process hashes and compresses with its own threads.
+    threads = max((os.cpu_count() or 1) // jobs, 1)
+    initargs = (args.store, args.chunk_size, args.level, threads)
+
+    start = time.perf_counter()
+    failed = 0
+    size = 0
+    tasks = [(args.command, ckpt_dir) for ckpt_dir in ckpt_dirs]
+    if jobs == 1:
+        _init_worker(*initargs)
+        results = map(_run, tasks)
+    else:
+        pool = Pool(jobs, _init_worker, initargs)
+        results = pool.imap_unordered(_run, tasks)
+
+    for ckpt_dir, image_size, error in results:
+        if error:
+            failed += 1
+            print(f"{ckpt_dir}: {error}", file=sys.stderr)
+        else:
+            size += image_size
+            if args.verbose:
+                print(f"{ckpt_dir}: done")
+
+    if jobs != 1:
+        pool.close()
+        pool.join()
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"{args.command}: {len(ckpt_dirs) - failed} checkpoint(s) in "
+        f"{elapsed:.1f} s, {failed} failed"
+        + (
+            f", {size / elapsed / 2**20:.0f} MiB/s of memory images"
+            if size and elapsed
+            else ""
+        )
+    )
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[0].strip()
+    )
+    parser.add_argument(
+        "--store", required=True, help="The directory of the chunk store"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    for command, text in (
+        ("import", "Move the memory images of checkpoints to the store"),
+        ("export", "Write back the memory images of checkpoints"),
+        ("release", "Release the memory images of checkpoints"),
+    ):
+        sub = commands.add_parser(command, help=text)
+        sub.add_argument("checkpoints", nargs="+")
+        sub.add_argument(
+            "-r",
+            "--recurse",
+            action="store_true",
+            help="Process every checkpoint in the given directories",
+        )
+        sub.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=1,
+            help="Checkpoints processed at once (0: one per CPU)",
+        )
+        sub.add_argument("-v", "--verbose", action="store_true")
+    commands.add_parser("gc", help="Remove the chunks no image references")
+    commands.add_parser("usage", help="Report the size of the store")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=checkpoint_store.DEFAULT_CHUNK_SIZE,
+        help="The size of the chunks new images are split in "
+        "[Default: %(default)s]",
+    )
+    parser.add_argument(
+        "--level",
+        type=int,
+        default=6,
+        help="The zlib compression level of new chunks and of exported "
+        "images [Default: %(default)s]",
+    )
+
+    args = parser.parse_args()
+    if args.command == "gc":
+        removed = checkpoint_store.ChunkStore(args.store).gc()
+        print(
+            f"Removed {removed['chunks']} chunk(s), "
+            f"{removed['bytes'] / 2**20:.1f} MiB"
+        )
+        return 0
+    if args.command == "usage":
+        usage = checkpoint_store.ChunkStore(args.store).usage()
+        print(
+            f"{usage['images']} image(s), "
+            f"{usage['image_bytes'] / 2**20:.1f} MiB in "
+            f"{usage['chunks']} chunk(s), "
+            f"{usage['stored_bytes'] / 2**20:.1f} MiB stored "
+            f"({usage['ratio']:.1f}x), "
+            f"{usage['unused_chunks']} unused chunk(s)"
+        )
+        return 0
+    return run_batch(args)
+
+
+if __name__ == "__main__":
+    sys.path.append(
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "..", "src", "python"
+        )
+    )
+
+    from m5.util import checkpoint_store
+
+    sys.exit(main())
@@ -68,17 +68,28 @@
 # upgrader. This can be especially valuable when maintaining private
 # upgraders in private branches.
 
+# Large libraries of checkpoints can be upgraded in parallel with -j. The
+# version tags of each checkpoint are first read without parsing the whole
+# file, so checkpoints which are already current are skipped cheaply, and
+# the order in which upgraders are applied is only resolved once for each
+# set of tags.
+
 
 import configparser
 import glob
 import os
 import os.path as osp
 import sys
+import time
 import types
 
 verbose_print = False
 
 
+class UpgradeError(Exception):
+    pass
+
+
 def verboseprint(*args):
     if not verbose_print:
         return
@@ -92,6 +103,7 @@ class Upgrader:
     untag_set = set()  # tags to remove by downgrading
     by_tag = {}
     legacy = {}
+    plans = {}  # upgrade order by (frozen) set of checkpoint tags
 
     def __init__(self, filename):
         self.filename = filename
@@ -161,6 +173,42 @@ class Upgrader:
     def get(tag):
         return Upgrader.by_tag[tag]
 
+    @staticmethod
+    def plan(tags):
+        """Return the tags to apply to a checkpoint with the given tags, in
+        an order which respects their dependences."""
+        tags = frozenset(tags)
+        if tags in Upgrader.plans:
+            return Upgrader.plans[tags]
+
+        # Apply migrations for tags not in checkpoint and tags present for
+        # which downgraders are present, respecting dependences
+        current = set(tags)
+        to_apply = (Upgrader.tag_set - current) | (
+            Upgrader.untag_set & current
+        )
+        order = []
+        while to_apply:
+            ready = {t for t in to_apply if Upgrader.get(t).ready(current)}
+            if not ready:
+                raise UpgradeError(
+                    "could not apply these upgrades: "
+                    + " ".join(to_apply)
+                    + "\nupdate dependences impossible to resolve; aborting"
+                )
+
+            for tag in sorted(ready):
+                order.append(tag)
+                if tag in Upgrader.tag_set:
+                    current.add(tag)
+                else:
+                    current.remove(tag)
+
+            to_apply -= ready
+
+        Upgrader.plans[tags] = order
+        return order
+
     @staticmethod
     def load_all():
         util_dir = osp.dirname(osp.abspath(__file__))
@@ -192,7 +240,53 @@ class Upgrader:
                     sys.exit(1)
 
 
-def process_file(path, **kwargs):
+def read_version_tags(path):
+    """Read the version tags of a checkpoint without parsing all of it.
+
+    The globals are serialized with the root object, at the start of the
+    checkpoint. Returns the set of tags, or None if the checkpoint has a
+    legacy version number or its tags aren't found in the root sections.
+    """
+    section = None
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line[0] in "#;":
+                continue
+            if line.startswith("["):
+                if section in ("Globals", "root.globals"):
+                    return None
+                section = line[1:-1].strip()
+                if section not in ("Globals", "root") and not (
+                    section.startswith("root.")
+                ):
+                    return None
+                continue
+
+            key, sep, value = line.partition("=")
+            if not sep:
+                continue
+            key = key.strip()
+            if section == "root" and key == "cpt_ver":
+                return None
+            if section in ("Globals", "root.globals") and (
+                key == "version_tags"
+            ):
+                return set(value.split())
+    return None
+
+
+def is_current(path):
+    """Check if a checkpoint needs no upgrades, only reading its tags."""
+    try:
+        tags = read_version_tags(path)
+    except (OSError, UnicodeDecodeError):
+        return False
+    return tags is not None and not Upgrader.plan(tags)
+
+
+def _upgrade_file(path, backup=True, **kwargs):
+    """Upgrade a checkpoint file. Returns True if it was changed."""
     if not osp.isfile(path):
         import errno
 
@@ -200,20 +294,14 @@ def process_file(path, **kwargs):
 
     verboseprint(f"Processing file {path}....")
 
-    if kwargs.get("backup", True):
-        import shutil
-
-        shutil.copyfile(path, path + ".bak")
-
     cpt = configparser.ConfigParser()
 
     # gem5 is case sensitive with paramaters
     cpt.optionxform = str
 
     # Read the current data
-    cpt_file = open(path)
-    cpt.read_file(cpt_file)
-    cpt_file.close()
+    with open(path) as cpt_file:
+        cpt.read_file(cpt_file)
 
     change = False
 
@@ -237,8 +325,7 @@ def process_file(path, **kwargs):
     elif cpt.has_option("root.globals", "version_tags"):
         tags = set(("".join(cpt.get("root.globals", "version_tags"))).split())
     else:
-        print("fatal: no version information in checkpoint")
-        exit(1)
+        raise UpgradeError("fatal: no version information in checkpoint")
 
     verboseprint("has tags", " ".join(tags))
     # If the current checkpoint has a tag we don't know about, we have
@@ -252,31 +339,110 @@ def process_file(path, **kwargs):
             " ".join(unknown_tags),
         )
 
-    # Apply migrations for tags not in checkpoint and tags present for which
-    # downgraders are present, respecting dependences
-    to_apply = (Upgrader.tag_set - tags) | (Upgrader.untag_set & tags)
-    while to_apply:
-        ready = {t for t in to_apply if Upgrader.get(t).ready(tags)}
-        if not ready:
-            print("could not apply these upgrades:", " ".join(to_apply))
-            print("update dependences impossible to resolve; aborting")
-            exit(1)
-
-        for tag in ready:
-            Upgrader.get(tag).update(cpt, tags)
-            change = True
-
-        to_apply -= ready
+    for tag in Upgrader.plan(tags):
+        Upgrader.get(tag).update(cpt, tags)
+        change = True
 
     if not change:
         verboseprint("...nothing to do")
-        return
+        return False
 
     cpt.set("root.globals", "version_tags", " ".join(tags))
 
-    # Write the old data back
+    if backup:
+        import shutil
+
+        shutil.copyfile(path, path + ".bak")
+
+    # Write the new data to a temporary file and move it over the old one,
+    # so that an interrupted upgrade never leaves a truncated checkpoint.
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    try:
+        with open(tmp_path, "w") as f:
+            cpt.write(f)
+        os.replace(tmp_path, path)
+        # The section index no longer matches the file.
+        if osp.exists(path + ".idx"):
+            os.remove(path + ".idx")
+    finally:
+        if osp.exists(tmp_path):
+            os.remove(tmp_path)
+
     verboseprint("...completed")
-    cpt.write(open(path, "w"))
+    return True
+
+
+def process_file(path, **kwargs):
+    try:
+        _upgrade_file(path, **kwargs)
+    except UpgradeError as e:
+        print(e)
+        exit(1)
+
+
+def _init_worker(verbose):
+    global verbose_print
+    verbose_print = verbose
+    # Upgraders are inherited when workers are forked.
+    if not Upgrader.by_tag:
+        Upgrader.load_all()
+
+
+def _batch_job(job):
+    """Upgrade a checkpoint in a batch. Returns the path, its size, its
+    status (current, upgraded, unchanged or failed) and an error message."""
+    path, kwargs = job
+    try:
+        size = osp.getsize(path)
+        if is_current(path):
+            return path, size, "current", None
+        if _upgrade_file(path, **kwargs):
+            return path, size, "upgraded", None
+        return path, size, "unchanged", None
+    except (UpgradeError, OSError, configparser.Error) as e:
+        return path, 0, "failed", str(e)
+    except Exception as e:
+        return path, 0, "failed", f"{type(e).__name__}: {e}"
+
+
+def process_batch(paths, jobs=None, **kwargs):
+    """Upgrade many checkpoint files in a pool of processes and print a
+    throughput summary. Returns the number of failed checkpoints."""
+    from multiprocessing import Pool
+
+    start = time.perf_counter()
+    counts = {"current": 0, "upgraded": 0, "unchanged": 0, "failed": 0}
+    total_bytes = 0
+    with Pool(jobs, _init_worker, (verbose_print,)) as pool:
+        results = pool.imap_unordered(
+            _batch_job, ((path, kwargs) for path in paths), chunksize=8
+        )
+        for path, size, status, error in results:
+            counts[status] += 1
+            total_bytes += size
+            if error is not None:
+                print(f"error: {path}: {error}")
+            else:
+                verboseprint(f"{path}: {status}")
+
+    elapsed = time.perf_counter() - start
+    files = sum(counts.values())
+    print(
+        f"{files} checkpoints in {elapsed:.2f}s "
+        f"({files / elapsed if elapsed else 0:.1f} checkpoints/s, "
+        f"{total_bytes / (1 << 20) / elapsed if elapsed else 0:.1f} MiB/s): "
+        f"{counts['upgraded']} upgraded, {counts['current']} already "
+        f"current, {counts['unchanged']} unchanged, {counts['failed']} "
+        "failed"
+    )
+    return counts["failed"]
+
+
+def find_checkpoints(path):
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        if "m5.cpt" in files:
+            yield osp.join(root, "m5.cpt")
 
 
 if __name__ == "__main__":
@@ -301,6 +467,14 @@ if __name__ == "__main__":
         default=True,
         help="Do no backup each checkpoint before modifying it",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Upgrade checkpoints in a pool of this many processes (requires "
+        "-r; 0 to use all host CPUs) and print a throughput summary",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -350,7 +524,14 @@ if __name__ == "__main__":
     # Process an entire directory
     elif osp.isdir(path):
         cpt_file = osp.join(path, "m5.cpt")
-        if args.recurse:
+        if args.recurse and args.jobs is not None:
+            failed = process_batch(
+                find_checkpoints(path),
+                jobs=args.jobs or None,
+                backup=args.backup,
+            )
+            sys.exit(1 if failed else 0)
+        elif args.recurse:
             # Visit very file and see if it matches
             for root, dirs, files in os.walk(path):
                 for name in files:
@@ -0,0 +1,152 @@
+#! /usr/bin/env python3
+
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Converts the memory images of checkpoints between the single gzip stream
+format and the blocked format (see ``m5.util.pmem_image``), which gem5
+writes with ``System.checkpoint_memory_format``. gem5 restores either
+format, whatever the format it writes.
+
+Usage
+-----
+
+```sh
+util/pmem_convert.py --format zlib -r -j 8 m5out/
+util/pmem_convert.py --format gzip m5out/cpt.1234
+```
+"""
+
+import argparse
+import os
+import sys
+import time
+
+
+def find_checkpoints(paths, recurse):
+    for path in paths:
+        if not recurse:
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            if "m5.cpt" in files:
+                yield root
+
+
+def _convert(job):
+    ckpt_dir, args, threads = job
+    try:
+        start = time.perf_counter()
+        converted = pmem_image.convert_checkpoint(
+            ckpt_dir, args.format, args.level, args.block_size, threads
+        )
+        return ckpt_dir, converted, time.perf_counter() - start, None
+    except Exception as e:
+        return ckpt_dir, [], 0.0, f"{type(e).__name__}: {e}"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[0].strip()
+    )
+    parser.add_argument("checkpoints", nargs="+")
+    parser.add_argument(
+        "--format",
+        choices=("gzip",) + pmem_image.CODECS,
+        default="zlib",
+        help="gzip, or the codec of the blocked format "
+        "[Default: %(default)s]",
+    )
+    parser.add_argument(
+        "--level",
+        type=int,
+        default=0,
+        help="The compression level (0: a fast default)",
+    )
+    parser.add_argument(
+        "--block-size",
+        type=int,
+        default=pmem_image.DEFAULT_BLOCK_SIZE,
+        help="The block size of blocked images [Default: %(default)s]",
+    )
+    parser.add_argument(
+        "-r",
+        "--recurse",
+        action="store_true",
+        help="Convert every checkpoint in the given directories",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Checkpoints converted at once (0: one per CPU). Each "
+        "checkpoint is also compressed by several threads.",
+    )
+    args = parser.parse_args()
+
+    from multiprocessing import Pool
+
+    jobs = args.jobs or os.cpu_count()
+    threads = max((os.cpu_count() or 1) // jobs, 1)
+    tasks = [
+        (ckpt_dir, args, threads)
+        for ckpt_dir in find_checkpoints(args.checkpoints, args.recurse)
+    ]
+
+    failed = 0
+    if jobs == 1:
+        results = map(_convert, tasks)
+    else:
+        pool = Pool(jobs)
+        results = pool.imap_unordered(_convert, tasks)
+    for ckpt_dir, converted, elapsed, error in results:
+        if error:
+            failed += 1
+            print(f"{ckpt_dir}: {error}", file=sys.stderr)
+        elif converted:
+            print(
+                f"{ckpt_dir}: converted {', '.join(converted)} in "
+                f"{elapsed:.1f} s"
+            )
+    if jobs != 1:
+        pool.close()
+        pool.join()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.path.append(
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "..", "src", "python"
+        )
+    )
+
+    from m5.util import pmem_image
+
+    sys.exit(main())